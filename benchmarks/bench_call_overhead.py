@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""短输入（1~4 个汉字）时 ``pinyin`` / ``lazy_pinyin`` 每次调用的开销
+
+对比每次调用都创建 ``Pinyin(_mixConverter(...))`` 的旧实现和共享实例的新实现::
+
+    $ python benchmarks/bench_call_overhead.py
+"""
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+from pypinyin import lazy_pinyin
+from pypinyin.converter import (
+    _mixConverter, _v2UConverter, _neutralToneWith5Converter,
+    _neutralToneWith5AndV2UConverter
+)
+from pypinyin.core import Pinyin
+
+
+def old_lazy_pinyin(hans, v_to_u=False, neutral_tone_with_five=False):
+    # 旧实现每次调用会创建 5 个对象
+    converter = _mixConverter(
+        v_to_u=v_to_u, neutral_tone_with_five=neutral_tone_with_five)
+    converter._v2uconverter = _v2UConverter()
+    converter._neutraltonewith5converter = _neutralToneWith5Converter()
+    converter._neutraltonewith5andv2uconverter = \
+        _neutralToneWith5AndV2UConverter()
+    return Pinyin(converter).lazy_pinyin(hans)
+
+
+INPUTS = ['张', '张三', '欧阳修', '司马相如']
+
+
+def main():
+    number = 20000
+    for hans in INPUTS:
+        assert old_lazy_pinyin(hans) == lazy_pinyin(hans)
+        old = timeit.timeit(lambda: old_lazy_pinyin(hans), number=number)
+        new = timeit.timeit(lambda: lazy_pinyin(hans), number=number)
+        print('{0} chars: old {1:.2f} us/call, new {2:.2f} us/call'.format(
+            len(hans), old / number * 1e6, new / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""跳过空钩子方法后每个拼音的转换耗时
+
+对比总是调用 ``pre_convert_style`` / ``post_convert_style`` 等钩子方法的旧实现
+和构造时根据覆盖了哪些钩子方法选择转换方法的新实现::
+
+    $ python benchmarks/bench_converter_hooks.py
+"""
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+from pypinyin.constants import Style
+from pypinyin.converter import (
+    DefaultConverter, _v2UConverter, _neutralToneWith5Converter
+)
+
+TEXT = '我们一起吃了一顿饭然后去公园散步看见绿色的树和女孩子'
+
+
+def with_all_hooks(converter):
+    """去掉构造时绑定的转换方法，恢复为总是调用所有钩子方法"""
+    converter.__dict__.pop('_convert', None)
+    converter.__dict__.pop('_handle_nopinyin', None)
+    return converter
+
+
+def per_syllable(converter, number):
+    def run():
+        for han in TEXT:
+            converter.convert(han, Style.TONE3, False, 'default', True)
+
+    total = min(timeit.repeat(run, number=number, repeat=5))
+    return total / number / len(TEXT) * 1e6
+
+
+def main():
+    number = 2000
+    for cls in (DefaultConverter, _v2UConverter, _neutralToneWith5Converter):
+        new = cls()
+        old = with_all_hooks(cls())
+        for han in TEXT:
+            assert (old.convert(han, Style.TONE3, False, 'default', True) ==
+                    new.convert(han, Style.TONE3, False, 'default', True))
+        old_time = per_syllable(old, number)
+        new_time = per_syllable(new, number)
+        print('{0}: old {1:.2f} us/syllable, new {2:.2f} us/syllable'.format(
+            cls.__name__, old_time, new_time))
+
+
+if __name__ == '__main__':
+    main()
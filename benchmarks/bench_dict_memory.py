@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""对比词语拼音库使用嵌套 list 和使用共享音节表时的内存占用
+
+使用 ``tracemalloc`` 分别统计构建两种形式的词语拼音库所需的内存
+（不包括共用的 key 和拼音字符串）::
+
+    $ python benchmarks/bench_dict_memory.py
+"""
+from __future__ import print_function, unicode_literals
+
+import tracemalloc
+
+from pypinyin.syllables import SyllableTable
+
+
+def measure(func):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    data = func()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(x.size_diff for x in after.compare_to(before, 'filename'))
+    return data, size
+
+
+def load_raw(source):
+    return {k: [list(x) for x in v] for k, v in source.items()}
+
+
+def load_interned(source):
+    table = SyllableTable()
+    return {k: table.phrase(v) for k, v in source.items()}
+
+
+def main():
+    from pypinyin import phrases_dict
+    source = phrases_dict.phrases_dict
+    raw, raw_size = measure(lambda: load_raw(source))
+    _, interned_size = measure(lambda: load_interned(source))
+    print('phrases: {0}'.format(len(raw)))
+    print('nested lists: {0:.2f} MB'.format(raw_size / 1024.0 / 1024))
+    print('interned:     {0:.2f} MB'.format(interned_size / 1024.0 / 1024))
+
+
+if __name__ == '__main__':
+    main()
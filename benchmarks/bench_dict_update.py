@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""多次载入自定义拼音库的耗时
+
+模拟启动时分多次调用 ``load_single_dict`` / ``load_phrases_dict`` 载入
+自定义拼音库，对比每次调用都使用整个词语库重新训练分词器的旧实现、
+只训练新增词语的新实现以及使用 ``dict_update()`` 事务时的耗时::
+
+    $ python benchmarks/bench_dict_update.py
+"""
+from __future__ import print_function, unicode_literals
+
+import time
+
+from pypinyin import core, dict_update, load_phrases_dict, load_single_dict
+from pypinyin.constants import PHRASES_DICT
+from pypinyin.seg import mmseg
+
+CALLS = 30
+PHRASES_PER_CALL = 20
+
+
+def make_dicts(offset):
+    phrases = sorted(PHRASES_DICT.keys())
+    dicts = []
+    for n in range(CALLS):
+        start = offset + n * PHRASES_PER_CALL
+        words = phrases[start:start + PHRASES_PER_CALL]
+        dicts.append({w: [['a']] * len(w) for w in words})
+    return dicts
+
+
+def load_all(dicts):
+    for n, phrases_dict in enumerate(dicts):
+        load_single_dict({0x4E00 + n: 'yī'})
+        load_phrases_dict(phrases_dict)
+
+
+def old_load_all(dicts):
+    """每次调用后都使用整个词语库重新训练分词器"""
+    for n, phrases_dict in enumerate(dicts):
+        load_single_dict({0x4E00 + n: 'yī'})
+        mmseg.retrain(mmseg.seg)
+        load_phrases_dict(phrases_dict)
+        mmseg.retrain(mmseg.seg)
+
+
+def timed(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def main():
+    core.preload()
+    old = timed(old_load_all, make_dicts(0))
+    new = timed(load_all, make_dicts(CALLS * PHRASES_PER_CALL))
+
+    def in_transaction(dicts):
+        with dict_update():
+            load_all(dicts)
+
+    tx = timed(in_transaction, make_dicts(2 * CALLS * PHRASES_PER_CALL))
+    print('{0} calls: full retrain {1:.3f}s, incremental {2:.3f}s, '
+          'dict_update() {3:.3f}s'.format(CALLS * 2, old, new, tx))
+
+
+if __name__ == '__main__':
+    main()
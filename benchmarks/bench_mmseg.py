@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""对比 ``PrefixSet`` 前缀树与原来保存所有前缀字符串的 set 的内存占用和分词速度，
+以及分词耗时与输入长度的关系（线性复杂度时长度增加到 4 倍耗时约为 4 倍）
+
+    $ python benchmarks/bench_mmseg.py
+"""
+from __future__ import print_function, unicode_literals
+
+import timeit
+import tracemalloc
+
+from pypinyin.phrases_dict import phrases_dict
+from pypinyin.seg.mmseg import PrefixSet, Seg
+
+
+class OldPrefixSet(object):
+    """原来的实现：把每个词语的每个前缀保存到 set 中"""
+
+    def __init__(self):
+        self._set = set()
+
+    def train(self, word_s):
+        for word in word_s:
+            for index in range(len(word)):
+                self._set.add(word[:index + 1])
+
+    def __contains__(self, key):
+        return key in self._set
+
+
+def old_cut(prefix_set, text):
+    """原来的 ``Seg.cut`` 实现（no_non_phrases=True）"""
+    remain = text
+    while remain:
+        matched = ''
+        for index in range(len(remain)):
+            word = remain[:index + 1]
+            if word in prefix_set:
+                matched = word
+            else:
+                if matched and matched in phrases_dict:
+                    yield matched
+                    remain = remain[index:]
+                else:
+                    yield word[0]
+                    remain = remain[index + 2 - len(word):]
+                break
+        else:
+            if remain not in phrases_dict:
+                for x in remain:
+                    yield x
+            else:
+                yield remain
+            break
+
+
+def measure(factory):
+    tracemalloc.start()
+    obj = factory()
+    obj.train(phrases_dict.keys())
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+TEXT = (
+    '该负责人表示银行保险机构具有外部性强财务杠杆率高信息不对称严重等特征'
+    '不同于一般工商企业对其股东股权必须从严管理总体上银保监会将坚持两个不变'
+)
+
+
+def adversarial_time(size):
+    """输入由一直能匹配前缀但是永远组不成词语的字符组成"""
+    prefix_set = PrefixSet()
+    prefix_set.train(['金融寡头', '融寡头目', '寡头政治'])
+    seg = Seg(prefix_set, no_non_phrases=True)
+    text = '金融寡' * size
+    return min(timeit.repeat(lambda: list(seg.cut(text)), number=1, repeat=3))
+
+
+def main():
+    old_set, old_size = measure(OldPrefixSet)
+    new_set, new_size = measure(PrefixSet)
+    seg = Seg(new_set, no_non_phrases=True)
+    assert list(old_cut(old_set, TEXT)) == list(seg.cut(TEXT))
+
+    number = 2000
+    old_time = timeit.timeit(
+        lambda: list(old_cut(old_set, TEXT)), number=number)
+    new_time = timeit.timeit(lambda: list(seg.cut(TEXT)), number=number)
+
+    print('words:           {0}'.format(len(phrases_dict)))
+    print('memory old set:  {0:.2f} MB'.format(old_size / 1024.0 / 1024))
+    print('memory new trie: {0:.2f} MB'.format(new_size / 1024.0 / 1024))
+    print('cut old set:     {0:.1f} us/text'.format(
+        old_time / number * 1e6))
+    print('cut new trie:    {0:.1f} us/text'.format(
+        new_time / number * 1e6))
+
+    small = adversarial_time(8000)
+    large = adversarial_time(32000)
+    print('adversarial cut: {0:.3f}s / {1:.3f}s (x{2:.1f} for 4x input)'
+          .format(small, large, large / small))
+
+
+if __name__ == '__main__':
+    main()
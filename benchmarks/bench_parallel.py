@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""使用 1/2/4/8 个 worker 进程批量转换时的吞吐量，
+需要在多核的机器上运行才能看到加速效果
+
+    $ python benchmarks/bench_parallel.py [count]
+"""
+from __future__ import print_function, unicode_literals
+
+import multiprocessing
+import random
+import sys
+import time
+
+from pypinyin import lazy_pinyin_batch
+from pypinyin.constants import PHRASES_DICT
+from pypinyin.parallel import lazy_pinyin_batch as parallel_lazy_pinyin_batch
+
+
+def make_data(count):
+    random.seed(42)
+    phrases = list(PHRASES_DICT.keys())
+    return [''.join(random.sample(phrases, 3)) for _ in range(count)]
+
+
+def run(func, data, **kwargs):
+    start = time.time()
+    for _ in func(data, **kwargs):
+        pass
+    return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    data = make_data(count)
+    print('cpus: {0}'.format(multiprocessing.cpu_count()))
+    serial = run(lazy_pinyin_batch, data)
+    print('serial:    {0:.2f}s  {1:.0f} rows/s'.format(serial, count / serial))
+    for workers in (1, 2, 4, 8):
+        elapsed = run(parallel_lazy_pinyin_batch, data, max_workers=workers)
+        print('{0} workers: {1:.2f}s  {2:.0f} rows/s  speedup {3:.2f}x'.format(
+            workers, elapsed, count / elapsed, serial / elapsed))
+
+
+if __name__ == '__main__':
+    main()
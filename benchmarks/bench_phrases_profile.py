@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+"""对比各个词语拼音库档位的内存占用、加载耗时和准确率::
+
+    $ python benchmarks/bench_phrases_profile.py [CORPUS]
+
+内存占用是在新的进程中统计的加载后的词语拼音库数据以及训练内置分词器新分配的内存，
+加载耗时包括执行词语拼音库模块（请先导入一次生成 ``.pyc`` 文件）。
+指定了文本文件 ``CORPUS`` 时，以完整词语拼音库的转换结果为准，
+统计每个档位转换这个文本时拼音（ ``TONE3`` 风格）不一致的汉字的比例。
+"""
+from __future__ import print_function, unicode_literals
+
+from importlib import import_module
+import io
+import os
+import subprocess
+import sys
+
+from pypinyin import Style
+from pypinyin.constants import PHRASES_PROFILES, _phrases_module
+from pypinyin.core import Pinyin
+from pypinyin.provider import DictProvider
+from pypinyin.seg.mmseg import PrefixSet, Seg
+from pypinyin.syllables import syllable_table
+
+PROFILES = ['none'] + sorted(
+    PHRASES_PROFILES, key=lambda x: PHRASES_PROFILES[x] or sys.maxsize)
+
+# 在 tracemalloc 下执行完整词语拼音库中的大字典耗时过长，
+# 加载后的词语拼音库使用 sys.getsizeof 统计，
+# 训练分词器新分配的内存使用 tracemalloc 统计
+MEASURE = '''
+import sys, time, tracemalloc
+from pypinyin.constants import PHRASES_DICT
+from pypinyin.seg import mmseg
+
+def deep_size(obj, seen):
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += deep_size(k, seen) + deep_size(v, seen)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            size += deep_size(item, seen)
+    return size
+
+start = time.time()
+size = deep_size(PHRASES_DICT.load(), set())
+if sys.argv[1] == 'memory':
+    tracemalloc.start()
+mmseg.seg.load()
+print(time.time() - start, size + tracemalloc.get_traced_memory()[0])
+'''
+
+
+def measure(profile, what):
+    env = dict(os.environ)
+    if profile == 'none':
+        env['PYPINYIN_NO_PHRASES'] = 'true'
+    else:
+        env['PYPINYIN_PHRASES_PROFILE'] = profile
+    output = subprocess.check_output(
+        [sys.executable, '-c', MEASURE, what], env=env)
+    elapsed, size = output.split()
+    return float(elapsed), int(size)
+
+
+def converter(profile):
+    if profile == 'none':
+        phrases = {}
+    else:
+        data = import_module(_phrases_module(profile)).phrases_dict
+        phrases = dict(
+            (k, syllable_table.phrase(v)) for k, v in data.items())
+    prefix_set = PrefixSet()
+    prefix_set.train(phrases)
+    seg = Seg(prefix_set, no_non_phrases=True)
+    return Pinyin(provider=DictProvider(phrases_dict=phrases, seg=seg))
+
+
+def error_rate(profile, text, expected):
+    result = converter(profile).lazy_pinyin(text, style=Style.TONE3)
+    errors = sum(1 for a, b in zip(result, expected) if a != b)
+    return errors * 100.0 / len(expected)
+
+
+def main():
+    text = None
+    if len(sys.argv) > 1:
+        with io.open(sys.argv[1], encoding='utf-8') as fp:
+            text = fp.read()
+        expected = converter('full').lazy_pinyin(text, style=Style.TONE3)
+
+    for profile in PROFILES:
+        elapsed, _ = measure(profile, 'time')
+        _, size = measure(profile, 'memory')
+        line = '{0:<8} memory: {1:6.2f} MB  preload: {2:.2f}s'.format(
+            profile, size / 1024.0 / 1024, elapsed)
+        if text is not None:
+            line += '  errors: {0:.3f}%'.format(
+                error_rate(profile, text, expected))
+        print(line)
+
+
+if __name__ == '__main__':
+    main()
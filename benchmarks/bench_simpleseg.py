@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""对比逐个字符使用正则判断的旧 ``simpleseg._seg`` 和一次 ``finditer``
+扫描整个字符串的新实现
+
+    $ python benchmarks/bench_simpleseg.py
+"""
+from __future__ import print_function, unicode_literals
+
+import timeit
+
+from pypinyin.constants import RE_HANS
+from pypinyin.seg.simpleseg import _seg
+
+
+def old_seg(chars):
+    s = ''
+    ret = []
+    flag = 0
+
+    for n, c in enumerate(chars):
+        if RE_HANS.match(c):
+            if n == 0:
+                flag = 0
+
+            if flag == 0:
+                s += c
+            else:
+                ret.append(s)
+                flag = 0
+                s = c
+
+        else:
+            if n == 0:
+                flag = 1
+
+            if flag == 1:
+                s += c
+            else:
+                ret.append(s)
+                flag = 1
+                s = c
+
+    ret.append(s)
+    return ret
+
+
+TEXTS = {
+    'mixed': '请访问 https://example.com/help 或拨打 400-123-4567 咨询，'
+             'iPhone 12 Pro 售价 8499 元。' * 10,
+    'hans': '你好，我是中国人，我爱我的祖国。' * 20,
+    'latin': 'The quick brown fox jumps over the lazy dog. ' * 10,
+}
+
+
+def main():
+    number = 2000
+    for name, text in sorted(TEXTS.items()):
+        assert old_seg(text) == _seg(text)
+        old = timeit.timeit(lambda: old_seg(text), number=number)
+        new = timeit.timeit(lambda: _seg(text), number=number)
+        print('{0}: old {1:.1f} us, new {2:.1f} us'.format(
+            name, old / number * 1e6, new / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""对比把大量自定义词语载入到内存中和保存在 SQLite 数据库中的内存占用和转换速度::
+
+    $ python benchmarks/bench_sqlite_dict.py [WORDS]
+
+随机生成 ``WORDS`` （默认 20 万）个 2 到 6 个字的词语，
+内存占用是使用 ``tracemalloc`` 统计的载入词语后新分配的内存（不包括生成的词语本身），
+SQLite 的内存占用还包括转换文本后 LRU 缓存中的数据。
+耗时也是在 ``tracemalloc`` 下统计的，只用于对比。
+"""
+from __future__ import print_function, unicode_literals
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pypinyin import core
+from pypinyin.compat import unichr
+from pypinyin.core import Pinyin
+from pypinyin.provider import DictProvider
+from pypinyin.sqlite_dict import SqlitePhrasesDict, create_provider
+
+TEXT = '你好，我是中国人，我爱我的祖国。朝阳区的金融行业发展迅速，' * 500
+
+
+def make_phrases(count, seed=1):
+    rnd = random.Random(seed)
+    phrases = {}
+    while len(phrases) < count:
+        word = ''.join(unichr(rnd.randint(0x4E00, 0x9FA5))
+                       for _ in range(rnd.randint(2, 6)))
+        phrases[word] = [['zhōng'] for _ in word]
+    return phrases
+
+
+def measure(name, build):
+    tracemalloc.start()
+    start = time.time()
+    provider, extra = build()
+    load_time = time.time() - start
+
+    pinyin = Pinyin(provider=provider)
+    start = time.time()
+    pinyin.lazy_pinyin(TEXT)
+    convert_time = time.time() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print('{0:<8} load: {1:6.2f}s  memory: {2:7.2f} MB  '
+          'convert {3} chars: {4:.3f}s{5}'.format(
+              name, load_time, size / 1024.0 / 1024, len(TEXT),
+              convert_time, extra))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    core.preload()
+    phrases = make_phrases(count)
+    tmp = tempfile.mkdtemp()
+    try:
+        def memory():
+            provider = DictProvider()
+            provider.load_phrases_dict(phrases)
+            return provider, ''
+
+        def sqlite():
+            path = os.path.join(tmp, 'phrases.db')
+            store = SqlitePhrasesDict(path)
+            store.load_phrases_dict(phrases)
+            return create_provider(store), '  db: {0:.1f} MB'.format(
+                os.path.getsize(path) / 1024.0 / 1024)
+
+        measure('memory', memory)
+        measure('sqlite', sqlite)
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
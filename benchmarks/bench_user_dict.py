@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""载入和重新载入 10 万行的拼音库文件的耗时::
+
+    $ python benchmarks/bench_user_dict.py
+"""
+from __future__ import print_function, unicode_literals
+
+import io
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from pypinyin import core, user_dict
+from pypinyin.compat import unichr
+from pypinyin.provider import DictProvider
+
+SINGLE_LINES = 20000
+PHRASE_LINES = 80000
+
+
+def make_lines(seed):
+    rnd = random.Random(seed)
+    lines = []
+    for n in range(SINGLE_LINES):
+        lines.append('U+{0:X}: zhōng,zhòng  # comment\n'.format(0x4E00 + n))
+    for n in range(PHRASE_LINES):
+        word = ''.join(unichr(rnd.randint(0x4E00, 0x9FA5)) for _ in range(3))
+        lines.append('{0}: zhōng guó rén\n'.format(word))
+    return lines
+
+
+def write(path, lines, mtime):
+    with io.open(path, 'w', encoding='utf-8') as fp:
+        fp.writelines(lines)
+    os.utime(path, (mtime, mtime))
+
+
+def timed(func):
+    start = time.time()
+    func()
+    return time.time() - start
+
+
+def main():
+    core.preload()
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'user.txt')
+        lines = make_lines(1)
+        write(path, lines, 1000)
+
+        for name, provider in (('global', None), ('provider', DictProvider())):
+            watcher = user_dict.DictWatcher([path], provider=provider)
+            initial = timed(watcher.check)
+            # 修改 100 行后重新载入
+            changed = lines[:-100] + [
+                line.replace('rén', 'rèn') for line in lines[-100:]]
+            write(path, changed, 2000)
+            reload_ = timed(watcher.check)
+            write(path, lines, 3000)
+            print('{0}: {1} lines, initial load {2:.3f}s, '
+                  'reload after changing 100 lines {3:.3f}s'.format(
+                      name, len(lines), initial, reload_))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == '__main__':
+    main()
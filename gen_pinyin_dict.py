@@ -1,14 +1,25 @@
 # -*- coding: utf-8 -*-
+import os
 import sys
 
+from pypinyin.block_dict import BLOCK_NAMES, block_of
 
-def main(in_fp, out_fp):
-    out_fp.write('''# -*- coding: utf-8 -*-
+HEADER = '''# -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
 # Warning: Auto-generated file, don't edit.
-pinyin_dict = {
-''')
+'''
+
+
+def main(in_fp, out_fp, block_dir=None):
+    """生成按区块拆分的单字拼音库 ``pinyin_dict_<区块名>.py`` ，
+    以及合并所有区块的 ``out_fp`` (``pinyin_dict.py``)
+
+    :param block_dir: 区块模块所在的目录，默认与 ``out_fp`` 相同
+    """
+    if block_dir is None:
+        block_dir = os.path.dirname(os.path.abspath(out_fp.name))
+    lines = dict((name, []) for name in BLOCK_NAMES)
     for line in in_fp.readlines():
         line = line.strip()
         if line.startswith('#') or not line:
@@ -23,8 +34,26 @@ pinyin_dict = {
             new_line = new_line.replace(': ', ": '")
             #     0x4E2D: 'zhōng,zhòng'\n
             new_line = "    {new_line}',\n".format(new_line=new_line)
-            out_fp.write(new_line)
-    out_fp.write('}\n')
+            code = int(new_line.split(':')[0], 16)
+            lines[block_of(code)].append(new_line)
+
+    for name in BLOCK_NAMES:
+        path = os.path.join(block_dir, 'pinyin_dict_{0}.py'.format(name))
+        with open(path, 'w') as fp:
+            fp.write(HEADER)
+            fp.write('pinyin_dict = {\n')
+            fp.writelines(lines[name])
+            fp.write('}\n')
+
+    out_fp.write(HEADER)
+    out_fp.write('''# 合并了 pinyin_dict_<区块名>.py 中的所有区块，详见 pypinyin.block_dict
+from importlib import import_module
+
+pinyin_dict = {}
+for _name in %r:
+    pinyin_dict.update(
+        import_module('pypinyin.pinyin_dict_' + _name).pinyin_dict)
+''' % (BLOCK_NAMES,))
 
 
 if __name__ == '__main__':
@@ -5,6 +5,13 @@
 
 from __future__ import unicode_literals
 
+# 需要在导入其他模块之前定义， pypinyin.state 在导入时会检查版本号
+__title__ = 'pypinyin'
+__version__ = '0.40.0'
+__author__ = 'mozillazg, 闲耘'
+__license__ = 'MIT'
+__copyright__ = 'Copyright (c) 2016 mozillazg, 闲耘'
+
 from pypinyin.compat import PY2
 from pypinyin.constants import (  # noqa
     Style,
@@ -24,17 +31,16 @@ from pypinyin.constants import (  # noqa
     STYLE_CYRILLIC_FIRST, CYRILLIC_FIRST
 )
 from pypinyin.core import (     # noqa
-    pinyin, lazy_pinyin, slug, load_single_dict, load_phrases_dict
+    pinyin, lazy_pinyin, slug, load_single_dict, load_phrases_dict,
+    dict_update, preload, warmup, set_phrases_profile,
+    pinyin_batch, lazy_pinyin_batch, slug_batch, iter_pinyin
 )
 
-__title__ = 'pypinyin'
-__version__ = '0.40.0'
-__author__ = 'mozillazg, 闲耘'
-__license__ = 'MIT'
-__copyright__ = 'Copyright (c) 2016 mozillazg, 闲耘'
 __all__ = [
     'pinyin', 'lazy_pinyin', 'slug',
-    'load_single_dict', 'load_phrases_dict',
+    'load_single_dict', 'load_phrases_dict', 'dict_update', 'preload',
+    'warmup', 'set_phrases_profile',
+    'pinyin_batch', 'lazy_pinyin_batch', 'slug_batch', 'iter_pinyin',
     'Style',
     'STYLE_NORMAL', 'NORMAL',
     'STYLE_TONE', 'TONE',
@@ -48,3 +48,11 @@ lazy_pinyin = core.lazy_pinyin
 slug = core.slug
 load_single_dict = core.load_single_dict
 load_phrases_dict = core.load_phrases_dict
+dict_update = core.dict_update
+preload = core.preload
+warmup = core.warmup
+set_phrases_profile = core.set_phrases_profile
+pinyin_batch = core.pinyin_batch
+lazy_pinyin_batch = core.lazy_pinyin_batch
+slug_batch = core.slug_batch
+iter_pinyin = core.iter_pinyin
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""用于 asyncio 的转换函数（需要 Python 3.6+ ，使用了异步生成器，
+Python 2.7 / 3.5 中不会安装这个模块）。
+
+转换是 CPU 密集型的操作，直接在事件循环中转换很长的文本会阻塞其他请求。
+这个模块中的函数：
+
+* 不超过 ``threshold`` 个字符的输入直接在事件循环中转换，避免额外的开销
+* 更长的输入分为多块（每块 ``chunk_size`` 个字符左右），
+  每块交给 ``executor`` 转换，默认使用事件循环的默认 executor（线程池），
+  也可以传入 ``ProcessPoolExecutor`` 等其他 executor；
+  ``executor`` 为 :py:data:`INLINE` 时在事件循环中转换，每转换完一块让出一次控制权
+* 切分文本（第一次切分时还需要训练分词器）也不在事件循环中进行，
+  ``executor`` 不是线程池时使用事件循环默认的 executor 切分
+* 每块之间都可以取消，取消后不会再转换剩下的块
+
+分块的位置不会影响结果，结果与同步版本的函数完全一致：
+
+.. code-block:: python
+
+    >>> from pypinyin import aio
+    >>> await aio.lazy_pinyin('中心')
+    ['zhong', 'xin']
+    >>> async for py in aio.iter_pinyin(long_text):
+    ...     pass
+"""
+from __future__ import unicode_literals
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+from pypinyin import core
+from pypinyin.compat import text_type
+from pypinyin.constants import Style
+
+#: 不超过这个长度的输入直接在事件循环中转换
+THRESHOLD = 200
+#: 较长的输入按这个长度（字符数）分块转换
+CHUNK_SIZE = 2000
+#: ``executor`` 参数为这个值时在事件循环中分块转换，每块之间让出控制权
+INLINE = 'inline'
+
+
+def _get_loop():
+    get_loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)
+    return get_loop()
+
+
+def _size(hans):
+    if isinstance(hans, text_type):
+        return len(hans)
+    return sum(len(x) for x in hans)
+
+
+def _split(hans, chunk_size):
+    """把分好词的列表分为多块，列表中的每一项都是独立转换的"""
+    for start in range(0, len(hans), chunk_size):
+        yield hans[start:start + chunk_size]
+
+
+async def _slices(hans, chunk_size):
+    """把字符串按 ``chunk_size`` 分块"""
+    for start in range(0, len(hans), chunk_size):
+        yield hans[start:start + chunk_size]
+
+
+async def _feed(buf, chunk, executor):
+    """把一块文本交给 ``buf`` 切分。
+
+    切分的耗时与这块文本的长度成正比，第一次切分时还需要训练分词器，
+    所以也不在事件循环中进行。切分会修改 ``buf`` ，
+    ``executor`` 不是线程池时使用事件循环默认的 executor 。
+    """
+    if executor == INLINE:
+        return buf.feed(chunk)
+    if not isinstance(executor, ThreadPoolExecutor):
+        executor = None
+    return await _get_loop().run_in_executor(executor, buf.feed, chunk)
+
+
+async def _iter_segments(chunks, executor):
+    """把逐块返回的文本分为可以独立转换的多块"""
+    buf = core._SegmentBuffer()
+    async for chunk in chunks:
+        segments = await _feed(buf, chunk, executor)
+        if segments:
+            yield segments
+    segments = buf.flush()
+    if segments:
+        yield segments
+
+
+def _convert(func_name, hans, kwargs):
+    return getattr(core, func_name)(hans, **kwargs)
+
+
+async def _run(func_name, hans, kwargs, executor):
+    if executor == INLINE:
+        result = _convert(func_name, hans, kwargs)
+        # 让出控制权，同时也是可以取消的位置
+        await asyncio.sleep(0)
+        return result
+    return await _get_loop().run_in_executor(
+        executor, _convert, func_name, hans, kwargs)
+
+
+async def _iter_chunks(func_name, hans, kwargs, executor, threshold,
+                       chunk_size):
+    """逐块返回转换结果"""
+    if not hasattr(hans, '__aiter__'):
+        if not isinstance(hans, text_type):
+            hans = list(hans)
+        if _size(hans) <= threshold:
+            yield _convert(func_name, hans, kwargs)
+            return
+        if not isinstance(hans, text_type):
+            for piece in _split(hans, chunk_size):
+                yield await _run(func_name, piece, kwargs, executor)
+            return
+        hans = _slices(hans, chunk_size)
+
+    async for segments in _iter_segments(hans, executor):
+        yield await _run(func_name, segments, kwargs, executor)
+
+
+async def pinyin(hans, style=Style.TONE, heteronym=False, errors='default',
+                 strict=True, v_to_u=False, neutral_tone_with_five=False,
+                 executor=None, threshold=THRESHOLD, chunk_size=CHUNK_SIZE):
+    """:py:func:`~pypinyin.pinyin` 的 asyncio 版本。
+
+    :param executor: 转换较长输入时使用的 executor ，
+                     默认使用事件循环的默认 executor ，
+                     为 :py:data:`INLINE` 时在事件循环中分块转换
+    :param threshold: 不超过这个长度的输入直接在事件循环中转换
+    :type threshold: int
+    :param chunk_size: 较长的输入按这个长度（字符数）分块转换
+    :type chunk_size: int
+
+    其他参数和返回值详见 :py:func:`~pypinyin.pinyin`
+    """
+    kwargs = dict(style=style, heteronym=heteronym, errors=errors,
+                  strict=strict, v_to_u=v_to_u,
+                  neutral_tone_with_five=neutral_tone_with_five)
+    pys = []
+    async for result in _iter_chunks('pinyin', hans, kwargs, executor,
+                                     threshold, chunk_size):
+        pys.extend(result)
+    return pys
+
+
+async def lazy_pinyin(hans, style=Style.NORMAL, errors='default',
+                      strict=True, v_to_u=False, neutral_tone_with_five=False,
+                      executor=None, threshold=THRESHOLD,
+                      chunk_size=CHUNK_SIZE):
+    """:py:func:`~pypinyin.lazy_pinyin` 的 asyncio 版本。
+
+    ``executor`` 、 ``threshold`` 和 ``chunk_size`` 参数详见
+    :py:func:`~pypinyin.aio.pinyin`
+    """
+    kwargs = dict(style=style, errors=errors, strict=strict, v_to_u=v_to_u,
+                  neutral_tone_with_five=neutral_tone_with_five)
+    pys = []
+    async for result in _iter_chunks('lazy_pinyin', hans, kwargs, executor,
+                                     threshold, chunk_size):
+        pys.extend(result)
+    return pys
+
+
+async def slug(hans, style=Style.NORMAL, heteronym=False, separator='-',
+               errors='default', strict=True,
+               executor=None, threshold=THRESHOLD, chunk_size=CHUNK_SIZE):
+    """:py:func:`~pypinyin.slug` 的 asyncio 版本。
+
+    ``executor`` 、 ``threshold`` 和 ``chunk_size`` 参数详见
+    :py:func:`~pypinyin.aio.pinyin`
+    """
+    pys = await pinyin(hans, style=style, heteronym=heteronym, errors=errors,
+                       strict=strict, executor=executor, threshold=threshold,
+                       chunk_size=chunk_size)
+    return separator.join(chain(*pys))
+
+
+async def iter_pinyin(hans, style=Style.TONE, heteronym=False,
+                      errors='default', strict=True, v_to_u=False,
+                      neutral_tone_with_five=False,
+                      executor=None, threshold=THRESHOLD,
+                      chunk_size=CHUNK_SIZE):
+    """逐个返回每个字的拼音列表的异步生成器，用于 ``async for`` 。
+
+    :param hans: 字符串、分好词的字符串列表或者逐块返回文本的异步可迭代对象
+                 （比如从网络中逐块读取并解码后的文本）。
+                 异步可迭代对象的每一块都会单独转换，
+                 只会暂存结尾还可能与后面的文本组成词语的字符。
+
+    其他参数详见 :py:func:`~pypinyin.aio.pinyin`
+    """
+    kwargs = dict(style=style, heteronym=heteronym, errors=errors,
+                  strict=strict, v_to_u=v_to_u,
+                  neutral_tone_with_five=neutral_tone_with_five)
+    async for result in _iter_chunks('pinyin', hans, kwargs, executor,
+                                     threshold, chunk_size):
+        for item in result:
+            yield item
@@ -0,0 +1,99 @@
+from concurrent.futures import Executor
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, Iterator, List, Optional,
+    Text, Union
+)
+
+from pypinyin.constants import Style
+from pypinyin.core import TErrors, TPinyinResult, _SegmentBuffer
+
+TStyle = Style
+THans = Union[List[Text], Text, AsyncIterable[Text]]
+TExecutor = Union[Executor, Text, None]
+
+THRESHOLD = ...  # type: int
+CHUNK_SIZE = ...  # type: int
+INLINE = ...  # type: Text
+
+
+def _get_loop() -> Any: ...
+
+
+def _size(hans: Union[List[Text], Text]) -> int: ...
+
+
+def _split(hans: List[Text], chunk_size: int) -> Iterator[List[Text]]: ...
+
+
+def _slices(hans: Text, chunk_size: int) -> AsyncIterator[Text]: ...
+
+
+async def _feed(buf: _SegmentBuffer, chunk: Text,
+                executor: TExecutor) -> List[Text]: ...
+
+
+def _iter_segments(chunks: AsyncIterable[Text],
+                   executor: TExecutor) -> AsyncIterator[List[Text]]: ...
+
+
+def _convert(func_name: str, hans: Union[List[Text], Text],
+             kwargs: Dict[str, Any]) -> Any: ...
+
+
+async def _run(func_name: str, hans: Union[List[Text], Text],
+               kwargs: Dict[str, Any], executor: TExecutor) -> Any: ...
+
+
+def _iter_chunks(func_name: str, hans: THans, kwargs: Dict[str, Any],
+                 executor: TExecutor, threshold: int,
+                 chunk_size: int) -> AsyncIterator[Any]: ...
+
+
+async def pinyin(hans: THans,
+                 style: TStyle = ...,
+                 heteronym: bool = ...,
+                 errors: TErrors = ...,
+                 strict: bool = ...,
+                 v_to_u: bool = ...,
+                 neutral_tone_with_five: bool = ...,
+                 executor: TExecutor = ...,
+                 threshold: int = ...,
+                 chunk_size: int = ...
+                 ) -> TPinyinResult: ...
+
+
+async def lazy_pinyin(hans: THans,
+                      style: TStyle = ...,
+                      errors: TErrors = ...,
+                      strict: bool = ...,
+                      v_to_u: bool = ...,
+                      neutral_tone_with_five: bool = ...,
+                      executor: TExecutor = ...,
+                      threshold: int = ...,
+                      chunk_size: int = ...
+                      ) -> List[Text]: ...
+
+
+async def slug(hans: THans,
+               style: TStyle = ...,
+               heteronym: bool = ...,
+               separator: Text = ...,
+               errors: TErrors = ...,
+               strict: bool = ...,
+               executor: TExecutor = ...,
+               threshold: int = ...,
+               chunk_size: int = ...
+               ) -> Text: ...
+
+
+def iter_pinyin(hans: THans,
+                style: TStyle = ...,
+                heteronym: bool = ...,
+                errors: TErrors = ...,
+                strict: bool = ...,
+                v_to_u: bool = ...,
+                neutral_tone_with_five: bool = ...,
+                executor: TExecutor = ...,
+                threshold: int = ...,
+                chunk_size: int = ...
+                ) -> AsyncIterator[List[Text]]: ...
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""按 Unicode 区块拆分、按需加载的单字拼音库。
+
+单字拼音库中有一半的字是很少用到的 CJK 扩展区块中的字。
+拼音库按区块保存在不同的模块中（ ``pinyin_dict_<区块名>.py`` ），
+启动时只加载 CJK 基本区块等常用的字（ :py:data:`BASIC` ），
+其他区块在第一次查询这个区块中的字时才会加载：
+
+.. code-block:: python
+
+    >>> from pypinyin.constants import PINYIN_DICT
+    >>> PINYIN_DICT.loaded_blocks
+    ['basic']
+    >>> PINYIN_DICT.get(0x3400)
+    'qiū'
+    >>> PINYIN_DICT.loaded_blocks
+    ['basic', 'ext_a']
+
+遍历、 ``len()`` 等需要完整数据的操作会加载所有区块。
+"""
+from __future__ import unicode_literals
+
+from bisect import bisect_right
+from importlib import import_module
+import threading
+
+#: 启动时就加载的区块，包括 CJK 基本区块以及不属于 :py:data:`BLOCKS` 的字
+BASIC = 'basic'
+
+#: 按需加载的区块: ``(区块名, 码位范围列表)``
+BLOCKS = (
+    ('ext_a', ((0x3400, 0x4DBF),)),                # CJK扩展A
+    ('compat', ((0xF900, 0xFAFF),                  # CJK兼容
+                (0x2F800, 0x2FA1F))),              # CJK兼容扩展
+    ('ext_b', ((0x20000, 0x2A6DF),)),              # CJK扩展B
+    ('ext_c', ((0x2A700, 0x2B73F),)),              # CJK扩展C
+    ('ext_d', ((0x2B740, 0x2B81F),)),              # CJK扩展D
+    ('ext_efg', ((0x2B820, 0x2F7FF),               # CJK扩展E、F
+                 (0x2FA20, 0x3FFFF))),             # CJK扩展G 等
+)
+
+#: 所有区块的名称
+BLOCK_NAMES = (BASIC,) + tuple(name for name, _ in BLOCKS)
+
+_missing = object()
+
+_RANGES = sorted(
+    (start, end, name) for name, ranges in BLOCKS for start, end in ranges)
+_STARTS = [start for start, _, _ in _RANGES]
+
+
+def block_of(code):
+    """返回码位 ``code`` 所在的区块的名称
+
+    :type code: int
+    :rtype: str
+    """
+    index = bisect_right(_STARTS, code) - 1
+    if index >= 0:
+        _, end, name = _RANGES[index]
+        if code <= end:
+            return name
+    return BASIC
+
+
+def module_name(block):
+    """返回保存区块 ``block`` 的拼音数据的模块名"""
+    return 'pypinyin.pinyin_dict_' + block
+
+
+def _import_block(block):
+    return import_module(module_name(block)).pinyin_dict
+
+
+def _loaded_values(pinyin_dict):
+    """返回单字拼音库中已经加载的值，不会加载 :py:class:`BlockPinyinDict`
+    中还没有加载的区块
+    """
+    loaded_values = getattr(pinyin_dict, 'loaded_values', None)
+    if loaded_values is not None:
+        return loaded_values()
+    return pinyin_dict.values()
+
+
+class BlockPinyinDict(dict):
+    """按区块按需加载的单字拼音库，可以直接当作 ``PINYIN_DICT`` 使用。
+
+    区块中的数据会被复制到这个 dict 中，修改不会影响保存区块数据的模块。
+    写入和删除一个字之前会先加载这个字所在的区块。
+
+    :param loader: 返回区块数据的函数，参数为区块名，
+                   默认导入 :py:func:`module_name` 对应的模块
+    """
+
+    def __init__(self, loader=None):
+        super(BlockPinyinDict, self).__init__()
+        self._loader = loader or _import_block
+        self._loaded = set()
+        self._lock = threading.Lock()
+        self._load(BASIC)
+
+    @property
+    def loaded_blocks(self):
+        """已经加载的区块的名称列表，可以用于监控"""
+        return [name for name in BLOCK_NAMES if name in self._loaded]
+
+    def _load(self, block):
+        """加载区块，返回这次调用是否加载了区块"""
+        if block in self._loaded:
+            return False
+        with self._lock:
+            if block in self._loaded:
+                return False
+            dict.update(self, self._loader(block))
+            # 数据写入后才标记为已加载，其他线程不会看到只加载了一半的区块
+            self._loaded.add(block)
+        return True
+
+    def _load_for(self, key):
+        """加载 ``key`` 所在的区块，返回这次调用是否加载了区块"""
+        if len(self._loaded) == len(BLOCK_NAMES):
+            return False
+        try:
+            block = block_of(key)
+        except TypeError:   # 不是码位
+            return False
+        return self._load(block)
+
+    def load_all(self):
+        """加载所有区块"""
+        for block in BLOCK_NAMES:
+            self._load(block)
+
+    def loaded_values(self):
+        """只返回已加载的区块中的值，不会加载其他区块"""
+        return dict.values(self)
+
+    def __missing__(self, key):
+        if self._load_for(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        value = dict.get(self, key, _missing)
+        if value is not _missing:
+            return value
+        if self._load_for(key):
+            return dict.get(self, key, default)
+        return default
+
+    def __contains__(self, key):
+        if dict.__contains__(self, key):
+            return True
+        return self._load_for(key) and dict.__contains__(self, key)
+
+    def __setitem__(self, key, value):
+        self._load_for(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._load_for(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *args):
+        self._load_for(key)
+        return dict.pop(self, key, *args)
+
+    def setdefault(self, key, default=None):
+        self._load_for(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        data = dict(*args, **kwargs)
+        for key in data:
+            self._load_for(key)
+        dict.update(self, data)
+
+    def clear(self):
+        with self._lock:
+            dict.clear(self)
+            # 清空后不再加载任何区块
+            self._loaded.update(BLOCK_NAMES)
+
+    def popitem(self):
+        self.load_all()
+        return dict.popitem(self)
+
+    def __iter__(self):
+        self.load_all()
+        return dict.__iter__(self)
+
+    def __len__(self):
+        self.load_all()
+        return dict.__len__(self)
+
+    def keys(self):
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+    def __eq__(self, other):
+        self.load_all()
+        if isinstance(other, BlockPinyinDict):
+            other.load_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def copy(self):
+        """返回一个副本，副本中未加载的区块在需要时再加载"""
+        new = self.__class__.__new__(self.__class__)
+        # 先复制已加载的区块列表，复制过程中加载的区块之后会重新加载一次
+        new._loaded = set(self._loaded)
+        new._loader = self._loader
+        new._lock = threading.Lock()
+        dict.update(new, dict.items(self))
+        return new
+
+    def __repr__(self):
+        return '<{0} (loaded blocks: {1})>'.format(
+            self.__class__.__name__, ', '.join(self.loaded_blocks))
@@ -0,0 +1,54 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Set
+from typing import Text
+from typing import Tuple
+from typing import ValuesView
+
+BASIC = ...  # type: Text
+BLOCKS = ...  # type: Tuple[Tuple[Text, Tuple[Tuple[int, int], ...]], ...]
+BLOCK_NAMES = ...  # type: Tuple[Text, ...]
+_RANGES = ...  # type: List[Tuple[int, int, Text]]
+_STARTS = ...  # type: List[int]
+
+
+def block_of(code: int) -> Text: ...
+
+
+def module_name(block: Text) -> Text: ...
+
+
+def _import_block(block: Text) -> Dict[int, Text]: ...
+
+
+def _loaded_values(pinyin_dict: Mapping[int, Text]) -> Iterable[Text]: ...
+
+
+class BlockPinyinDict(Dict[int, Text]):
+    _loader = ...  # type: Callable[[Text], Dict[int, Text]]
+    _loaded = ...  # type: Set[Text]
+
+    def __init__(self,
+                 loader: Callable[[Text], Dict[int, Text]] = ...) -> None: ...
+
+    @property
+    def loaded_blocks(self) -> List[Text]: ...
+
+    def _load(self, block: Text) -> bool: ...
+
+    def _load_for(self, key: Any) -> bool: ...
+
+    def load_all(self) -> None: ...
+
+    def loaded_values(self) -> ValuesView[Text]: ...
+
+    def __missing__(self, key: int) -> Text: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+    def copy(self) -> 'BlockPinyinDict': ...
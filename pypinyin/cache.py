@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""转换结果的 LRU 缓存"""
+from __future__ import unicode_literals
+
+from collections import namedtuple, OrderedDict
+import threading
+
+from pypinyin.compat import text_type
+
+#: 缓存的统计信息
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+_missing = object()
+# 拼音库或拼音风格发生变化时会增加这个值，所有缓存随之失效
+_generation = [0]
+
+
+def invalidate_all():
+    """让所有已缓存的结果失效。
+
+    :py:func:`~pypinyin.load_single_dict` 和
+    :py:func:`~pypinyin.load_phrases_dict` 修改拼音库后会自动调用这个函数。
+    """
+    _generation[0] += 1
+
+
+def make_key(hans, *options):
+    """生成缓存的 key，``hans`` 不是字符串或字符串列表时返回 ``None``
+    表示无法缓存（比如生成器）。
+    """
+    if isinstance(hans, text_type):
+        return (hans,) + options
+    if isinstance(hans, (list, tuple)) and all(
+            isinstance(x, text_type) for x in hans):
+        return (tuple(hans),) + options
+    return None
+
+
+class LRUCache(object):
+    """线程安全的 LRU 缓存，超过 ``maxsize`` 时淘汰最久没有使用的结果。
+
+    :param maxsize: 最多缓存多少个结果
+    :type maxsize: int
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = _generation[0]
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _check_generation(self):
+        if self._generation != _generation[0]:
+            self._data.clear()
+            self._generation = _generation[0]
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._check_generation()
+            value = self._data.pop(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+            # 重新插入到末尾，标记为最近使用过
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._check_generation()
+            data = self._data
+            data.pop(key, None)
+            data[key] = value
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """清空缓存和统计信息"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def info(self):
+        """返回缓存的统计信息
+
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            self._check_generation()
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             self.maxsize, len(self._data))
+
+    def __len__(self):
+        return len(self._data)
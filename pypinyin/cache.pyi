@@ -0,0 +1,36 @@
+from typing import Any
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+CacheInfo = NamedTuple('CacheInfo', [('hits', int), ('misses', int),
+                                     ('evictions', int), ('maxsize', int),
+                                     ('currsize', int)])
+
+
+def invalidate_all() -> None: ...
+
+
+def make_key(hans: Any, *options: Hashable) -> Optional[Tuple[Any, ...]]: ...
+
+
+class LRUCache(object):
+    maxsize = ...  # type: int
+    hits = ...  # type: int
+    misses = ...  # type: int
+    evictions = ...  # type: int
+
+    def __init__(self, maxsize: int) -> None: ...
+
+    def _check_generation(self) -> None: ...
+
+    def get(self, key: Hashable, default: Any = ...) -> Any: ...
+
+    def set(self, key: Hashable, value: Any) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def info(self) -> CacheInfo: ...
+
+    def __len__(self) -> int: ...
@@ -19,9 +19,11 @@ if subversion[0] in (
 if not PY2:
     text_type = str
     bytes_type = bytes
+    unichr = chr
 else:
     text_type = unicode  # noqa
     bytes_type = str
+    unichr = unichr  # noqa
 
 try:
     callable_check = callable  # noqa
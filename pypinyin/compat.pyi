@@ -11,4 +11,7 @@ text_type = ...  # type: Text
 bytes_type = ...  # type: ByteString
 
 
+def unichr(i: int) -> Text: ...
+
+
 def callable_check(obj: Any) -> bool: ...
@@ -3,55 +3,133 @@
 
 from __future__ import unicode_literals
 
+from importlib import import_module
 import os
 import re
+import sys
+import warnings
 
 from enum import IntEnum, unique
 
-from pypinyin import pinyin_dict
+from pypinyin import state
+from pypinyin.block_dict import BlockPinyinDict
 from pypinyin.compat import SUPPORT_UCS4
+from pypinyin.lazy_dict import LazyDict
+from pypinyin.mmap_dict import MmapPinyinDict
+from pypinyin.syllables import syllable_table
+
+# 利用环境变量控制不做copy操作(无自定义拼音库的情况), 以减少内存使用
+_NO_DICT_COPY = bool(os.environ.get('PYPINYIN_NO_DICT_COPY'))
+# 利用环境变量控制不使用词语拼音库
+_NO_PHRASES = bool(os.environ.get('PYPINYIN_NO_PHRASES'))
+
+#: 内置词语拼音库的档位: ``{档位: 词语的最大长度}`` ， ``None`` 表示不限制长度。
+#: 档位越小内存占用越少，多音字的准确率也越低，详见 :ref:`phrases_profile`
+PHRASES_PROFILES = {
+    'small': 2,
+    'medium': 3,
+    'full': None,
+}
+# 利用环境变量指定内置词语拼音库的档位
+_PHRASES_PROFILE = os.environ.get('PYPINYIN_PHRASES_PROFILE') or 'full'
+if _PHRASES_PROFILE not in PHRASES_PROFILES:
+    warnings.warn('unknown PYPINYIN_PHRASES_PROFILE {0!r}, use {1!r}'.format(
+        _PHRASES_PROFILE, 'full'))
+    _PHRASES_PROFILE = 'full'
 
-# 词语拼音库
-if os.environ.get('PYPINYIN_NO_PHRASES'):
-    PHRASES_DICT = {}
-else:
-    from pypinyin import phrases_dict
-    PHRASES_DICT = phrases_dict.phrases_dict
+
+def _phrases_module(profile):
+    """返回保存词语拼音库档位 ``profile`` 的数据的模块名"""
+    if PHRASES_PROFILES[profile] is None:
+        return 'pypinyin.phrases_dict'
+    return 'pypinyin.phrases_dict_' + profile
+
+
+# 利用环境变量指定启动时载入的状态文件（包括单字拼音库、词语拼音库和分词器），
+# 详见 :mod:`pypinyin.state` 。状态文件需要和当前档位的词语拼音库一致
+_STATE = None
+if os.environ.get('PYPINYIN_STATE_FILE'):
+    _STATE = state._boot(os.environ['PYPINYIN_STATE_FILE'])
 
 # 单字拼音库
-PINYIN_DICT = pinyin_dict.pinyin_dict
+# 利用环境变量指定使用 mmap 方式打开的二进制单字拼音库，
+# 多进程间可以共享内存，详见 :mod:`pypinyin.mmap_dict`
+if _STATE is not None:
+    PINYIN_DICT = _STATE[0]
+elif os.environ.get('PYPINYIN_PINYIN_DICT_MMAP'):
+    PINYIN_DICT = MmapPinyinDict(os.environ['PYPINYIN_PINYIN_DICT_MMAP'])
+elif _NO_DICT_COPY:
+    from pypinyin import pinyin_dict
+    PINYIN_DICT = pinyin_dict.pinyin_dict
+else:
+    # 启动时只加载常用的区块，CJK 扩展区块等在第一次用到时才加载，
+    # 详见 :mod:`pypinyin.block_dict`
+    PINYIN_DICT = BlockPinyinDict()
 
-# 利用环境变量控制不做copy操作(无自定义拼音库的情况), 以减少内存使用
-if not os.environ.get('PYPINYIN_NO_DICT_COPY'):
-    PINYIN_DICT = PINYIN_DICT.copy()
-    PHRASES_DICT = PHRASES_DICT.copy()
+
+def _read_phrases_data(name):
+    """返回词语拼音库模块 ``name`` 中的 ``phrases_dict`` ，不会修改模块中的数据。
+
+    模块还没有被导入时在一个临时的命名空间中执行模块的代码，不放入
+    ``sys.modules`` ，转换为 :py:func:`_load_phrases_dict` 的格式后原始的
+    嵌套 list 就会被释放。其他代码导入这个模块时会得到一份新的数据。
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module.phrases_dict
+    try:
+        from importlib.util import find_spec
+    except ImportError:  # pragma: no cover (Python 2)
+        return import_module(name).phrases_dict
+    spec = find_spec(name)
+    namespace = {'__name__': name, '__file__': spec.origin}
+    exec(spec.loader.get_code(name), namespace)
+    return namespace['phrases_dict']
+
+
+def _load_phrases_dict(profile=None):
+    """加载词语拼音库，值为共享音节表的不可变 tuple ，
+    比如 ``(('zhōng',), ('guó',))``
+    """
+    if _NO_PHRASES:
+        return {}
+    data = _read_phrases_data(_phrases_module(profile or _PHRASES_PROFILE))
+    phrase = syllable_table.phrase
+    return dict((key, phrase(value)) for key, value in data.items())
+
+
+# 词语拼音库，第一次使用时才会加载
+PHRASES_DICT = LazyDict(_load_phrases_dict)
+if _STATE is not None:
+    PHRASES_DICT.replace(_STATE[1])
+del _STATE
 
 # 匹配使用数字标识声调的字符的正则表达式
 RE_TONE2 = re.compile(r'([aeoiuvnm])([1-4])$')
 
 # 有拼音的汉字
 if SUPPORT_UCS4:
-    RE_HANS = re.compile(
-        r'^(?:['
-        r'\u3007'                  # 〇
-        r'\u3400-\u4dbf'           # CJK扩展A:[3400-4DBF]
-        r'\u4e00-\u9fff'           # CJK基本:[4E00-9FFF]
-        r'\uf900-\ufaff'           # CJK兼容:[F900-FAFF]
-        r'\U00020000-\U0002A6DF'   # CJK扩展B:[20000-2A6DF]
-        r'\U0002A703-\U0002B73F'   # CJK扩展C:[2A700-2B73F]
-        r'\U0002B740-\U0002B81D'   # CJK扩展D:[2B740-2B81D]
-        r'\U0002F80A-\U0002FA1F'   # CJK兼容扩展:[2F800-2FA1F]
-        r'])+$'
+    _HANS_CHARS = (
+        '\u3007'                  # 〇
+        '\u3400-\u4dbf'           # CJK扩展A:[3400-4DBF]
+        '\u4e00-\u9fff'           # CJK基本:[4E00-9FFF]
+        '\uf900-\ufaff'           # CJK兼容:[F900-FAFF]
+        '\U00020000-\U0002A6DF'   # CJK扩展B:[20000-2A6DF]
+        '\U0002A703-\U0002B73F'   # CJK扩展C:[2A700-2B73F]
+        '\U0002B740-\U0002B81D'   # CJK扩展D:[2B740-2B81D]
+        '\U0002F80A-\U0002FA1F'   # CJK兼容扩展:[2F800-2FA1F]
     )
 else:
-    RE_HANS = re.compile(  # pragma: no cover
-        r'^(?:['
-        r'\u3007'                  # 〇
-        r'\u3400-\u4dbf'           # CJK扩展A:[3400-4DBF]
-        r'\u4e00-\u9fff'           # CJK基本:[4E00-9FFF]
-        r'\uf900-\ufaff'           # CJK兼容:[F900-FAFF]
-        r'])+$'
+    _HANS_CHARS = (  # pragma: no cover
+        '\u3007'                  # 〇
+        '\u3400-\u4dbf'           # CJK扩展A:[3400-4DBF]
+        '\u4e00-\u9fff'           # CJK基本:[4E00-9FFF]
+        '\uf900-\ufaff'           # CJK兼容:[F900-FAFF]
     )
+RE_HANS = re.compile('^(?:[' + _HANS_CHARS + '])+$')
+# 把字符串分为连续的汉字和连续的非汉字，汉字时 group(1) 不为 None
+RE_HANS_TOKEN = re.compile(
+    '([' + _HANS_CHARS + ']+)|[^' + _HANS_CHARS + ']+')
 
 
 @unique
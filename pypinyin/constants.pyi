@@ -1,14 +1,35 @@
 from enum import IntEnum, unique
-from typing import Dict, List, Any, Text
+from typing import Dict, List, Any, MutableMapping, Optional, Sequence, Text
 
-PHRASES_DICT = ...  # type: Dict[Text, List[List[Text]]]
+from pypinyin.lazy_dict import LazyDict
 
-PINYIN_DICT = ...  # type: Dict[int, Text]
+PHRASES_DICT = ...  # type: LazyDict[Text, Sequence[Sequence[Text]]]
+
+PINYIN_DICT = ...  # type: MutableMapping[int, Text]
+
+PHRASES_PROFILES = ...  # type: Dict[Text, Optional[int]]
+
+_PHRASES_PROFILE = ...  # type: Text
+
+
+def _phrases_module(profile: Text) -> Text: ...
+
+
+def _read_phrases_data(name: Text) -> Dict[Text, List[List[Text]]]: ...
+
+
+def _load_phrases_dict(
+        profile: Optional[Text] = ...
+) -> Dict[Text, Sequence[Sequence[Text]]]: ...
 
 RE_TONE2 = ...  # type: Any
 
 RE_HANS = ...  # type: Any
 
+RE_HANS_TOKEN = ...  # type: Any
+
+_HANS_CHARS = ...  # type: Text
+
 
 @unique
 class Style(IntEnum):
@@ -2,14 +2,16 @@
 
 from __future__ import unicode_literals
 
-from copy import deepcopy
+import copy
 
+from pypinyin.block_dict import BlockPinyinDict
 from pypinyin.compat import text_type, callable_check
 from pypinyin.constants import (
     PHRASES_DICT, PINYIN_DICT,
     RE_HANS
 )
 from pypinyin.contrib.uv import V2UMixin
+from pypinyin.syllables import syllable_table
 from pypinyin.contrib.neutral_tone import NeutralToneWith5Mixin
 from pypinyin.utils import _remove_dup_items
 from pypinyin.style import auto_discover
@@ -17,6 +19,8 @@ from pypinyin.style import convert as convert_style
 
 auto_discover()
 
+_dict_get = dict.get
+
 
 class Converter(object):
 
@@ -25,9 +29,89 @@ class Converter(object):
         raise NotImplementedError  # pragma: no cover
 
 
+def _is_overridden(obj, name, base=None):
+    """``obj`` 是否覆盖了 ``base`` （默认为 :py:class:`DefaultConverter` ）
+    中的方法 ``name``
+    """
+    if name in getattr(obj, '__dict__', ()):
+        return True
+    method = getattr(type(obj), name)
+    default = getattr(base or DefaultConverter, name)
+    return (getattr(method, '__func__', method) is not
+            getattr(default, '__func__', default))
+
+
+def _nopinyin_result(py, heteronym):
+    """把处理没有拼音的字符串得到的结果转换为拼音结果 list"""
+    if not py:
+        return []
+    if isinstance(py, list):
+        # 包含多音字信息
+        if isinstance(py[0], list):
+            if heteronym:
+                return py
+            # [[a, b], [c, d]]
+            # [[a], [c]]
+            return [[x[0]] for x in py]
+
+        return [[i] for i in py]
+    else:
+        return [[py]]
+
+
 class DefaultConverter(Converter):
-    def __init__(self, **kwargs):
-        pass
+    """
+    :param provider: 转换时使用的拼音库，默认使用全局共享的拼音库。
+                     传入 :py:class:`~pypinyin.provider.SnapshotProvider`
+                     时使用创建转换器时的快照。
+    :type provider: pypinyin.provider.DictProvider
+    """
+    # 没有调用 ``DefaultConverter.__init__`` 的子类总是复制拼音数据
+    _post_pinyin_overridden = True
+    _pinyin_dict = PINYIN_DICT
+    _phrases_dict = PHRASES_DICT
+
+    def __init__(self, provider=None, **kwargs):
+        if provider is not None:
+            self._use_provider(provider.snapshot())
+        # 拼音库中的数据是共享的，只有 post_pinyin 可能修改数据时才需要复制
+        self._post_pinyin_overridden = _is_overridden(self, 'post_pinyin')
+        self._bind_hooks()
+
+    def _use_provider(self, provider):
+        self._pinyin_dict = provider.pinyin_dict
+        self._phrases_dict = provider.phrases_dict
+
+    def _with_provider(self, provider):
+        """返回使用 ``provider`` 中的拼音库的副本，不会修改当前转换器"""
+        converter = copy.copy(self)
+        converter._use_provider(provider)
+        if '_convert' in vars(self) or '_handle_nopinyin' in vars(self):
+            # 重新绑定到副本上
+            vars(converter).pop('_convert', None)
+            vars(converter).pop('_handle_nopinyin', None)
+            converter._bind_hooks()
+        return converter
+
+    def _bind_hooks(self):
+        """根据子类覆盖了哪些钩子方法，选择跳过空钩子方法的转换方法。
+
+        没有调用 ``DefaultConverter.__init__`` 的子类会使用
+        调用所有钩子方法的 :py:meth:`_convert` 和 :py:meth:`_handle_nopinyin` 。
+        """
+        def overridden(*names):
+            return any(_is_overridden(self, name) for name in names)
+
+        if not overridden('convert_style', '_convert_style',
+                          'pre_convert_style'):
+            if overridden('post_convert_style'):
+                self._convert = self._convert_with_post_hook
+            else:
+                self._convert = self._convert_without_hooks
+
+        if not overridden('handle_nopinyin', 'pre_handle_nopinyin',
+                          'post_handle_nopinyin'):
+            self._handle_nopinyin = self._handle_nopinyin_without_hooks
 
     def convert(self, words, style, heteronym, errors, strict, **kwargs):
         """根据参数把汉字转成相应风格的拼音结果。
@@ -44,18 +128,20 @@ class DefaultConverter(Converter):
         :rtype: list
 
         """
-        pys = []
         # 初步过滤没有拼音的字符
-        if RE_HANS.match(words):
-            pys = self._phrase_pinyin(words, style=style, heteronym=heteronym,
-                                      errors=errors, strict=strict)
-            return pys
+        return self._convert_token(words, bool(RE_HANS.match(words)),
+                                   style, heteronym, errors, strict)
 
-        py = self.handle_nopinyin(words, style=style, errors=errors,
-                                  heteronym=heteronym, strict=strict)
-        if py:
-            pys.extend(py)
-        return pys
+    def _convert_token(self, words, is_hans, style, heteronym, errors,
+                       strict):
+        """转换分词时已经判断过是否是汉字的字符串，参数详见 :py:meth:`convert`"""
+        if is_hans:
+            return self._phrase_pinyin(words, style=style, heteronym=heteronym,
+                                       errors=errors, strict=strict)
+
+        py = self._handle_nopinyin(words, style=style, errors=errors,
+                                   heteronym=heteronym, strict=strict)
+        return py or []
 
     def pre_convert_style(self, han, orig_pinyin, style, strict, **kwargs):
         """在把原始带声调的拼音按拼音风格转换前会调用 ``pre_convert_style`` 方法。
@@ -171,20 +257,7 @@ class DefaultConverter(Converter):
         if post_data is not None:
             py = post_data
 
-        if not py:
-            return []
-        if isinstance(py, list):
-            # 包含多音字信息
-            if isinstance(py[0], list):
-                if heteronym:
-                    return py
-                # [[a, b], [c, d]]
-                # [[a], [c]]
-                return [[x[0]] for x in py]
-
-            return [[i] for i in py]
-        else:
-            return [[py]]
+        return _nopinyin_result(py, heteronym)
 
     def post_handle_nopinyin(self, chars, style, heteronym,
                              errors, strict,
@@ -228,29 +301,26 @@ class DefaultConverter(Converter):
         :rtype: list
         """
         py = []
-        if phrase in PHRASES_DICT:
-            py = deepcopy(PHRASES_DICT[phrase])
-
-            post_data = self.post_pinyin(phrase, heteronym, py)
-            if post_data is not None:
-                py = post_data
-
-            for idx, item in enumerate(py):
-                han = phrase[idx]
+        phrases_dict = self._phrases_dict
+        # 内置词库中没有单字词语，未加载词库时单个汉字无需加载词库
+        if ((len(phrase) > 1 or phrases_dict.loaded) and
+                phrase in phrases_dict):
+            # 拼音库中保存的是共享的 tuple，只读不改
+            pys = phrases_dict[phrase]
+            if self._post_pinyin_overridden:
+                # post_pinyin 可能会修改传入的数据，传入一份副本
+                pys = [list(item) for item in pys]
+                post_data = self.post_pinyin(phrase, heteronym, pys)
+                if post_data is not None:
+                    pys = post_data
+
+            convert = self._convert
+            for han, item in zip(phrase, pys):
                 if heteronym:
-                    py[idx] = _remove_dup_items(
-                        [
-                            self.convert_style(
-                                han, orig_pinyin=x, style=style, strict=strict)
-                            for x in item
-                        ]
-                    )
+                    py.append(_remove_dup_items(
+                        [convert(han, x, style, strict) for x in item]))
                 else:
-                    orig_pinyin = item[0]
-                    py[idx] = [
-                        self.convert_style(
-                            han, orig_pinyin=orig_pinyin, style=style,
-                            strict=strict)]
+                    py.append([convert(han, item[0], style, strict)])
         else:
             for i in phrase:
                 single = self._single_pinyin(
@@ -270,23 +340,34 @@ class DefaultConverter(Converter):
         :return: 返回拼音列表，多音字会有多个拼音项
         :rtype: list
         """
-        num = ord(han)
+        code = ord(han)
+        pinyin_dict = self._pinyin_dict
+        if type(pinyin_dict) is BlockPinyinDict:
+            # 已加载的区块中的字直接用 dict.get 查询，
+            # 没有找到时才需要加载这个字所在的区块
+            value = _dict_get(pinyin_dict, code)
+            if value is None:
+                value = pinyin_dict.get(code)
+        else:
+            value = pinyin_dict.get(code)
         # 处理没有拼音的字符
-        if num not in PINYIN_DICT:
-            return self.handle_nopinyin(
+        if value is None:
+            return self._handle_nopinyin(
                 han, style=style, errors=errors,
                 heteronym=heteronym, strict=strict)
 
-        pys = PINYIN_DICT[num].split(',')  # 字的拼音列表
+        pys = syllable_table.split(value)  # 字的拼音列表，共享的 tuple
 
-        post_data = self.post_pinyin(han, heteronym, [pys])
-        if post_data is not None:
-            pys = post_data[0]
+        if self._post_pinyin_overridden:
+            data = [list(pys)]
+            post_data = self.post_pinyin(han, heteronym, data)
+            if post_data is not None:
+                data = post_data
+            pys = data[0]
 
+        convert = self._convert
         if not heteronym:
-            orig_pinyin = pys[0]
-            return [[self.convert_style(
-                han, orig_pinyin, style=style, strict=strict)]]
+            return [[convert(han, pys[0], style, strict)]]
 
         # 输出多音字的多个读音
         # 临时存储已存在的拼音，避免多音字拼音转换为非声调风格出现重复。
@@ -295,8 +376,7 @@ class DefaultConverter(Converter):
         py_cached = {}
         pinyins = []
         for orig_pinyin in pys:
-            py = self.convert_style(han, orig_pinyin, style=style,
-                                    strict=strict)
+            py = convert(han, orig_pinyin, style, strict)
             if py in py_cached:
                 continue
             py_cached[py] = py
@@ -307,6 +387,30 @@ class DefaultConverter(Converter):
                        **kwargs):
         return convert_style(pinyin, style, strict, default=default, **kwargs)
 
+    def _convert(self, han, pinyin, style, strict):
+        return self.convert_style(han, pinyin, style=style, strict=strict)
+
+    def _convert_without_hooks(self, han, pinyin, style, strict):
+        return convert_style(pinyin, style, strict, default=pinyin)
+
+    def _convert_with_post_hook(self, han, pinyin, style, strict):
+        converted_pinyin = convert_style(pinyin, style, strict, default=pinyin)
+        post_data = self.post_convert_style(
+            han, pinyin, converted_pinyin, style=style, strict=strict)
+        if post_data is None:
+            return converted_pinyin
+        return post_data
+
+    def _handle_nopinyin(self, chars, style, heteronym, errors, strict):
+        return self.handle_nopinyin(chars, style=style, errors=errors,
+                                    heteronym=heteronym, strict=strict)
+
+    def _handle_nopinyin_without_hooks(self, chars, style, heteronym, errors,
+                                       strict):
+        py = self._convert_nopinyin_chars(
+            chars, style, errors=errors, heteronym=heteronym, strict=strict)
+        return _nopinyin_result(py, heteronym)
+
     def _convert_nopinyin_chars(self, chars, style, heteronym, errors, strict):
         """转换没有拼音的字符。
 
@@ -338,16 +442,22 @@ class _neutralToneWith5AndV2UConverter(
     pass
 
 
+# 这几个转换器都没有状态，可以共享
+_v2uconverter = _v2UConverter()
+_neutraltonewith5converter = _neutralToneWith5Converter()
+_neutraltonewith5andv2uconverter = _neutralToneWith5AndV2UConverter()
+
+
 class _mixConverter(DefaultConverter):
     def __init__(self, v_to_u=False, neutral_tone_with_five=False, **kwargs):
         super(_mixConverter, self).__init__(**kwargs)
         self._v_to_u = v_to_u
         self._neutral_tone_with_five = neutral_tone_with_five
 
-        self._v2uconverter = _v2UConverter()
-        self._neutraltonewith5converter = _neutralToneWith5Converter()
+        self._v2uconverter = _v2uconverter
+        self._neutraltonewith5converter = _neutraltonewith5converter
         self._neutraltonewith5andv2uconverter = \
-            _neutralToneWith5AndV2UConverter()
+            _neutraltonewith5andv2uconverter
 
     def post_convert_style(self, han, orig_pinyin, converted_pinyin,
                            style, strict, **kwargs):
@@ -2,15 +2,20 @@ from typing import Any
 from typing import List
 from typing import Union
 from typing import Callable
+from typing import Mapping
 from typing import Optional
 from typing import Text
 
 from pypinyin.constants import Style
+from pypinyin.provider import DictProvider, SnapshotProvider
+
+_dict_get = ...  # type: Callable[..., Any]
 
 
 TStyle = Style
 TErrors = Union[Callable[[Text], Text], Text]
 TPinyinResult = List[List[Text]]
+TProvider = Union[DictProvider, SnapshotProvider]
 TErrorResult = Union[Text, List[Text], None]
 TNoPinyinResult = Union[TPinyinResult, List[Text], Text, None]
 
@@ -21,13 +26,36 @@ class Converter(object):
                 **kwargs: Any) -> TPinyinResult: ...
 
 
+def _is_overridden(obj: Any, name: str, base: Optional[type] = ...
+                   ) -> bool: ...
+
+
+def _nopinyin_result(py: TNoPinyinResult, heteronym: bool
+                     ) -> TPinyinResult: ...
+
+
 class DefaultConverter(Converter):
-    def __init__(self, **kwargs: Any) -> None: ...
+    _post_pinyin_overridden = ...  # type: bool
+    _pinyin_dict = ...  # type: Mapping[int, Text]
+    _phrases_dict = ...  # type: Mapping[Text, Any]
+
+    def __init__(self, provider: Optional[TProvider] = ...,
+                 **kwargs: Any) -> None: ...
+
+    def _use_provider(self, provider: DictProvider) -> None: ...
+
+    def _with_provider(self, provider: DictProvider) -> DefaultConverter: ...
+
+    def _bind_hooks(self) -> None: ...
 
     def convert(self, words: Text, style: TStyle, heteronym: bool,
                 errors: TErrors, strict: bool = ...,
                 **kwargs: Any) -> TPinyinResult: ...
 
+    def _convert_token(self, words: Text, is_hans: bool, style: TStyle,
+                       heteronym: bool, errors: TErrors, strict: bool
+                       ) -> TPinyinResult: ...
+
     def pre_convert_style(self, han: Text, orig_pinyin: Text, style: TStyle,
                           strict: bool, **kwargs: Any) -> Optional[Text]: ...
 
@@ -67,7 +95,43 @@ class DefaultConverter(Converter):
                        strict: bool, default: Text, **kwargs: Any
                        ) -> Text: ...
 
+    def _convert(self, han: Text, pinyin: Text, style: TStyle,
+                 strict: bool) -> Text: ...
+
+    def _convert_without_hooks(self, han: Text, pinyin: Text, style: TStyle,
+                               strict: bool) -> Text: ...
+
+    def _convert_with_post_hook(self, han: Text, pinyin: Text, style: TStyle,
+                                strict: bool) -> Text: ...
+
+    def _handle_nopinyin(self, chars: Text, style: TStyle, heteronym: bool,
+                         errors: TErrors, strict: bool
+                         ) -> TPinyinResult: ...
+
+    def _handle_nopinyin_without_hooks(self, chars: Text, style: TStyle,
+                                       heteronym: bool, errors: TErrors,
+                                       strict: bool) -> TPinyinResult: ...
+
     def _convert_nopinyin_chars(self, chars: Text, style: TStyle,
                                 heteronym: bool, errors: TErrors,
                                 strict: bool
                                 ) -> TNoPinyinResult: ...
+
+
+class _v2UConverter(DefaultConverter): ...
+
+
+class _neutralToneWith5Converter(DefaultConverter): ...
+
+
+class _neutralToneWith5AndV2UConverter(DefaultConverter): ...
+
+
+_v2uconverter = ...  # type: _v2UConverter
+_neutraltonewith5converter = ...  # type: _neutralToneWith5Converter
+_neutraltonewith5andv2uconverter = ...  # type: _neutralToneWith5AndV2UConverter
+
+
+class _mixConverter(DefaultConverter):
+    def __init__(self, v_to_u: bool = ..., neutral_tone_with_five: bool = ...,
+                 **kwargs: Any) -> None: ...
@@ -3,17 +3,28 @@
 
 from __future__ import unicode_literals
 
+from contextlib import contextmanager
+import gc
 from itertools import chain
+import threading
 
+from pypinyin import cache, constants
+from pypinyin.block_dict import _loaded_values
 from pypinyin.compat import text_type
 from pypinyin.constants import (
-    PHRASES_DICT, PINYIN_DICT, Style
+    PHRASES_DICT, PHRASES_PROFILES, PINYIN_DICT, Style, _load_phrases_dict
 )
-from pypinyin.converter import DefaultConverter, _mixConverter
+from pypinyin.converter import (
+    DefaultConverter, _is_overridden, _v2uconverter,
+    _neutraltonewith5converter, _neutraltonewith5andv2uconverter
+)
+from pypinyin.provider import _update_phrases_dict, _update_single_dict
 from pypinyin.seg import mmseg
-from pypinyin.seg.simpleseg import seg
-from pypinyin.utils import (
-    _replace_tone2_style_dict_to_default)
+from pypinyin.seg.simpleseg import seg, seg_tokens, simple_seg_tokens
+from pypinyin.style import (
+    _build_table as _build_style_table, _tables as _style_tables
+)
+from pypinyin.syllables import syllable_table
 
 
 def load_single_dict(pinyin_dict, style='default'):
@@ -23,14 +34,9 @@ def load_single_dict(pinyin_dict, style='default'):
     :param style: pinyin_dict 参数值的拼音库风格. 支持 'default', 'tone2'
     :type pinyin_dict: dict
     """
-    if style == 'tone2':
-        for k, v in pinyin_dict.items():
-            v = _replace_tone2_style_dict_to_default(v)
-            PINYIN_DICT[k] = v
-    else:
-        PINYIN_DICT.update(pinyin_dict)
-
-    mmseg.retrain(mmseg.seg)
+    _update_single_dict(PINYIN_DICT, pinyin_dict, style)
+    # 单字不影响分词，不需要训练分词器
+    _dict_changed(())
 
 
 def load_phrases_dict(phrases_dict, style='default'):
@@ -40,23 +46,202 @@ def load_phrases_dict(phrases_dict, style='default'):
     :param style: phrases_dict 参数值的拼音库风格. 支持 'default', 'tone2'
     :type phrases_dict: dict
     """
-    if style == 'tone2':
-        for k, value in phrases_dict.items():
-            v = [
-                list(map(_replace_tone2_style_dict_to_default, pys))
-                for pys in value
-            ]
-            PHRASES_DICT[k] = v
-    else:
-        PHRASES_DICT.update(phrases_dict)
+    _update_phrases_dict(PHRASES_DICT, phrases_dict, style)
+    _dict_changed(list(phrases_dict.keys()))
+
+
+# 每个线程各自的 dict_update() 事务，
+# pending_phrases 为事务中新增的词语，不在事务中时为 None
+_local = threading.local()
+
+
+def _dict_changed(phrases):
+    """修改拼音库后只使用新增的词语训练分词器，并让结果缓存失效。
+
+    在 :py:func:`dict_update` 事务中时推迟到事务结束时一起处理。
+    """
+    pending_phrases = getattr(_local, 'pending_phrases', None)
+    if pending_phrases is not None:
+        pending_phrases.extend(phrases)
+        return
+    if phrases:
+        mmseg.train_words(mmseg.seg, phrases)
+    cache.invalidate_all()
+
+
+@contextmanager
+def dict_update():
+    """修改拼音库的事务。
+
+    事务中的 :py:func:`~pypinyin.load_single_dict` 和
+    :py:func:`~pypinyin.load_phrases_dict` 会立即修改拼音库，
+    但训练分词器和让结果缓存失效会推迟到事务结束时一起处理，
+    并且只会使用新增的词语训练分词器。
+    适合在启动时多次调用这两个函数载入大量自定义拼音的场景。
+
+    嵌套的事务会合并到最外层的事务中。
+    事务只对当前线程生效，其他线程中的修改仍然会立即训练分词器。
+
+    Usage::
+
+      >>> from pypinyin import dict_update, load_phrases_dict
+      >>> with dict_update():
+      ...     load_phrases_dict({'桔子': [['jú'], ['zǐ']]})
+      ...     load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+    """
+    if getattr(_local, 'pending_phrases', None) is not None:
+        yield
+        return
+
+    _local.pending_phrases = []
+    try:
+        yield
+    finally:
+        # 出现异常时已经写入的数据也需要生效
+        phrases, _local.pending_phrases = _local.pending_phrases, None
+        _dict_changed(phrases)
+
+
+def preload():
+    """预先加载词语拼音库并训练内置分词器。
+
+    默认情况下词语拼音库会在第一次需要时才加载，
+    可以在服务启动时调用这个函数提前完成加载，避免第一次转换时耗时较长。
+    """
+    PHRASES_DICT.load()
+    mmseg.seg.load()
+
+
+def set_phrases_profile(profile):
+    """切换内置词语拼音库的档位，档位详见 :py:data:`~pypinyin.constants.PHRASES_PROFILES` 。
+
+    会使用这个档位的词语拼音库替换当前的词语拼音库
+    （之前载入的自定义词语也会被替换，需要重新载入），
+    内置分词器会在下一次分词时重新训练。
+    启动时就确定的档位建议使用环境变量 ``PYPINYIN_PHRASES_PROFILE`` 指定，
+    不需要先加载完整的词语拼音库。
+
+    :param profile: 档位，比如 ``'small'``
+    :raises ValueError: 未知的档位
+    """
+    if profile not in PHRASES_PROFILES:
+        raise ValueError('unknown phrases profile {0!r}, must be one of {1}'
+                         .format(profile, sorted(PHRASES_PROFILES)))
+    PHRASES_DICT.replace(_load_phrases_dict(profile))
+    # 之后保存的状态文件使用这个档位的词语拼音库计算 hash
+    constants._PHRASES_PROFILE = profile
+    mmseg.seg.reset()
+    cache.invalidate_all()
+
+
+def warmup(styles=None, freeze=True):
+    """在 fork 多进程（比如 gunicorn 和 uWSGI 的 pre-fork 模式）之前调用，
+    让 worker 进程尽量通过写时复制共享拼音库的内存。
+
+    会预先完成所有第一次使用时才进行的操作：
+
+    * 加载词语拼音库并训练内置分词器（同 :py:func:`preload` ）
+    * 把单字拼音库中已加载的区块中的所有值拆分为共享的读音列表
+      （不会加载还没有用到的 CJK 扩展区块，需要的话可以先调用
+      ``PINYIN_DICT.load_all()`` ）
+    * 为 ``styles`` 中的拼音风格生成转换表
+    * 使用每种拼音风格转换一次，编译用到的正则表达式
+
+    然后调用 ``gc.freeze()`` （Python 3.7+），
+    把已有的对象移出垃圾回收器的管理，
+    worker 中的垃圾回收不会再修改这些对象所在的内存页。
+
+    :param styles: 需要预先生成转换表的拼音风格，默认为所有内置拼音风格
+    :param freeze: 是否调用 ``gc.freeze()``
+    :type freeze: bool
+    """
+    preload()
+    for value in _loaded_values(PINYIN_DICT):
+        syllable_table.split(value)
+
+    if styles is None:
+        styles = Style
+    for style in styles:
+        for strict in (True, False):
+            if (style, strict) not in _style_tables:
+                _build_style_table(style, strict)
+            lazy_pinyin('中文', style=style, strict=strict)
+
+    if freeze and hasattr(gc, 'freeze'):
+        gc.freeze()
+
+
+_cache = None
 
-    mmseg.retrain(mmseg.seg)
+
+def enable_cache(maxsize=1024):
+    """为 :py:func:`~pypinyin.pinyin` 、 :py:func:`~pypinyin.lazy_pinyin`
+    和 :py:func:`~pypinyin.slug` 启用 LRU 结果缓存。
+
+    缓存的 key 包含输入和所有转换参数，通过
+    :py:func:`~pypinyin.load_single_dict` 或
+    :py:func:`~pypinyin.load_phrases_dict` 修改拼音库后缓存会自动失效。
+    只有字符串或字符串列表类型的输入会被缓存。
+
+    :param maxsize: 最多缓存多少个结果
+    :type maxsize: int
+    """
+    global _cache
+    _cache = cache.LRUCache(maxsize)
+
+
+def disable_cache():
+    """禁用 :py:func:`enable_cache` 启用的结果缓存"""
+    global _cache
+    _cache = None
+
+
+def cache_info():
+    """返回 :py:func:`enable_cache` 启用的结果缓存的统计信息，
+    未启用缓存时返回 ``None`` 。
+
+    :rtype: pypinyin.cache.CacheInfo
+    """
+    if _cache is None:
+        return None
+    return _cache.info()
 
 
 class Pinyin(object):
+    """
+    :param converter: 拼音转换器，默认为 ``DefaultConverter``
+    :param cache_size: 大于 0 时为 :py:meth:`pinyin` 和 :py:meth:`lazy_pinyin`
+                       启用 LRU 结果缓存，最多缓存 ``cache_size`` 个结果
+    :type cache_size: int
+    :param provider: 转换时使用的拼音库和分词器，
+                     默认使用全局共享的拼音库和分词器。
+                     每次转换开始时获取一次 provider 的快照，
+                     整个转换过程都使用同一个快照。
+    :type provider: pypinyin.provider.DictProvider or
+                    pypinyin.provider.SnapshotProvider
+    """
 
-    def __init__(self, converter=None, **kwargs):
-        self._converter = converter or DefaultConverter()
+    # 没有调用 ``Pinyin.__init__`` 的子类总是使用 seg 和 convert 方法
+    _use_tokens = False
+    _provider = None
+    # (快照, 使用快照的转换器, 分词函数, 转换函数)
+    _bound = None
+
+    def __init__(self, converter=None, cache_size=None, provider=None,
+                 **kwargs):
+        self._converter = converter or DefaultConverter(provider=provider)
+        self._provider = provider
+        # 当前线程正在进行的转换使用的快照，用于 get_seg
+        self._local = threading.local()
+        self._cache = cache.LRUCache(cache_size) if cache_size else None
+        # 没有自定义分词和转换方法时，直接把分词时得到的是否是汉字的分类
+        # 传给转换器，不需要再次判断
+        self._use_tokens = (
+            isinstance(self._converter, DefaultConverter) and
+            not _is_overridden(self._converter, 'convert') and
+            not any(_is_overridden(self, name, Pinyin) for name in
+                    ('seg', 'pre_seg', 'post_seg', 'get_seg'))
+        )
 
     def pinyin(self, hans, style=Style.TONE, heteronym=False,
                errors='default', strict=True, **kwargs):
@@ -83,17 +268,23 @@ class Pinyin(object):
         :rtype: list
 
         """
-        # 对字符串进行分词处理
-        if isinstance(hans, text_type):
-            han_list = self.seg(hans)
-        else:
-            han_list = chain(*(self.seg(x) for x in hans))
-
-        pys = []
-        for words in han_list:
-            pys.extend(
-                self._converter.convert(
-                    words, style, heteronym, errors, strict=strict))
+        key = None
+        if self._cache is not None:
+            # 快照更新或者 provider 的拼音库修改后，旧的转换结果不会再被使用
+            version = None
+            if self._provider is not None:
+                snapshot = self._provider.snapshot()
+                version = (snapshot.version, snapshot.generation)
+            key = cache.make_key(hans, style, heteronym, errors, strict,
+                                 version)
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                return [list(x) for x in cached]
+
+        pys = self._convert(hans, style, heteronym, errors, strict)
+
+        if key is not None:
+            self._cache.set(key, tuple(tuple(x) for x in pys))
         return pys
 
     def lazy_pinyin(self, hans, style=Style.NORMAL,
@@ -121,6 +312,80 @@ class Pinyin(object):
                     hans, style=style, heteronym=False,
                     errors=errors, strict=strict)))
 
+    def _convert(self, hans, style, heteronym, errors, strict):
+        pys = []
+        if self._use_tokens:
+            split, convert_token = self._bind_snapshot()
+            for words, is_hans in split(hans):
+                pys.extend(convert_token(
+                    words, is_hans, style, heteronym, errors, strict))
+            return pys
+
+        if self._provider is None:
+            return self._convert_words(self._converter, hans, style,
+                                       heteronym, errors, strict)
+
+        # 分词（get_seg）和转换都使用同一个快照
+        snapshot, converter = self._bind()[:2]
+        previous = getattr(self._local, 'snapshot', None)
+        self._local.snapshot = snapshot
+        try:
+            return self._convert_words(converter, hans, style, heteronym,
+                                       errors, strict)
+        finally:
+            self._local.snapshot = previous
+
+    def _convert_words(self, converter, hans, style, heteronym, errors,
+                       strict):
+        pys = []
+        # 对字符串进行分词处理
+        if isinstance(hans, text_type):
+            han_list = self.seg(hans)
+        else:
+            han_list = chain(*(self.seg(x) for x in hans))
+
+        for words in han_list:
+            pys.extend(
+                converter.convert(
+                    words, style, heteronym, errors, strict=strict))
+        return pys
+
+    def _bind(self):
+        """返回当前快照、使用这个快照的转换器、分词函数和转换函数，
+        一次转换只调用一次，保证整个转换过程使用同一个快照
+        """
+        snapshot = self._provider.snapshot()
+        bound = self._bound
+        if bound is None or bound[0] is not snapshot:
+            converter = self._converter
+            if isinstance(converter, DefaultConverter):
+                converter = converter._with_provider(snapshot)
+            # 替换整个 tuple ，其他线程不会看到不一致的数据
+            bound = self._bound = (
+                snapshot, converter, snapshot.seg_tokens,
+                getattr(converter, '_convert_token', None))
+        return bound
+
+    def _bind_snapshot(self):
+        """返回当前快照的分词函数和转换函数"""
+        if self._provider is None:
+            return seg_tokens, self._converter._convert_token
+        return self._bind()[2:]
+
+    def cache_info(self):
+        """返回结果缓存的统计信息，未启用缓存时返回 ``None``
+
+        :rtype: pypinyin.cache.CacheInfo
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def cache_clear(self):
+        """清空结果缓存"""
+        if self._cache is not None:
+            self._cache.clear()
+
     def pre_seg(self, hans, **kwargs):
         """对字符串进行分词前将调用 ``pre_seg`` 方法对未分词的字符串做预处理。
 
@@ -159,6 +424,11 @@ class Pinyin(object):
 
         :return: 分词函数
         """
+        if self._provider is not None:
+            snapshot = getattr(self._local, 'snapshot', None)
+            if snapshot is None:
+                snapshot = self._provider.snapshot()
+            return snapshot.seg
         return seg
 
     def post_seg(self, hans, seg_data, **kwargs):
@@ -179,6 +449,14 @@ class Pinyin(object):
 
 _default_convert = DefaultConverter()
 _default_pinyin = Pinyin(_default_convert)
+# pinyin 和 lazy_pinyin 按 (v_to_u, neutral_tone_with_five) 共享的实例，
+# 转换器都没有状态，避免每次调用都创建新的对象
+_mix_pinyins = {
+    (False, False): _default_pinyin,
+    (True, False): Pinyin(_v2uconverter),
+    (False, True): Pinyin(_neutraltonewith5converter),
+    (True, True): Pinyin(_neutraltonewith5andv2uconverter),
+}
 
 
 def to_fixed(pinyin, style, strict=True):
@@ -258,11 +536,22 @@ def pinyin(hans, style=Style.TONE, heteronym=False,
       >>> pinyin('衣裳', style=Style.TONE3, neutral_tone_with_five=True)
       [['yi1'], ['shang5']]
     """
-    _pinyin = Pinyin(_mixConverter(
-        v_to_u=v_to_u, neutral_tone_with_five=neutral_tone_with_five))
-    return _pinyin.pinyin(
+    key = None
+    if _cache is not None:
+        key = cache.make_key(hans, 'pinyin', style, heteronym, errors,
+                             strict, v_to_u, neutral_tone_with_five)
+        cached = _cache.get(key) if key is not None else None
+        if cached is not None:
+            return [list(x) for x in cached]
+
+    _pinyin = _mix_pinyins[bool(v_to_u), bool(neutral_tone_with_five)]
+    pys = _pinyin.pinyin(
         hans, style=style, heteronym=heteronym, errors=errors, strict=strict)
 
+    if key is not None:
+        _cache.set(key, tuple(tuple(x) for x in pys))
+    return pys
+
 
 def slug(hans, style=Style.NORMAL, heteronym=False, separator='-',
          errors='default', strict=True):
@@ -294,7 +583,15 @@ def slug(hans, style=Style.NORMAL, heteronym=False, separator='-',
       >>> pypinyin.slug('中国人', style=Style.CYRILLIC)
       'чжун1-го2-жэнь2'
     """
-    return separator.join(
+    key = None
+    if _cache is not None:
+        key = cache.make_key(hans, 'slug', style, heteronym, separator,
+                             errors, strict)
+        cached = _cache.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+
+    result = separator.join(
         chain(
             *_default_pinyin.pinyin(
                 hans, style=style, heteronym=heteronym,
@@ -303,6 +600,10 @@ def slug(hans, style=Style.NORMAL, heteronym=False, separator='-',
         )
     )
 
+    if key is not None:
+        _cache.set(key, result)
+    return result
+
 
 def lazy_pinyin(hans, style=Style.NORMAL, errors='default', strict=True,
                 v_to_u=False, neutral_tone_with_five=False):
@@ -347,7 +648,269 @@ def lazy_pinyin(hans, style=Style.NORMAL, errors='default', strict=True,
       >>> lazy_pinyin('衣裳', style=Style.TONE3, neutral_tone_with_five=True)
       ['yi1', 'shang5']
     """
-    _pinyin = Pinyin(_mixConverter(
-        v_to_u=v_to_u, neutral_tone_with_five=neutral_tone_with_five))
-    return _pinyin.lazy_pinyin(
+    key = None
+    if _cache is not None:
+        key = cache.make_key(hans, 'lazy_pinyin', style, errors, strict,
+                             v_to_u, neutral_tone_with_five)
+        cached = _cache.get(key) if key is not None else None
+        if cached is not None:
+            return list(cached)
+
+    _pinyin = _mix_pinyins[bool(v_to_u), bool(neutral_tone_with_five)]
+    pys = _pinyin.lazy_pinyin(
         hans, style=style, errors=errors, strict=strict)
+
+    if key is not None:
+        _cache.set(key, tuple(pys))
+    return pys
+
+
+def _batch_converter(_pinyin, style, heteronym, errors, strict):
+    """返回一个复用同一个分词器和转换器处理单个输入的函数"""
+    convert = _pinyin._convert
+
+    def convert_one(hans):
+        return convert(hans, style, heteronym, errors, strict)
+
+    return convert_one
+
+
+def _iter_batch(hans_list, convert, copy, dedup_size):
+    """按输入顺序逐个返回转换结果，重复的输入只转换一次。
+
+    最多记住 ``dedup_size`` 个不同输入的结果，超过后清空重新开始，
+    保证处理很大的输入时内存占用有上限。
+    """
+    results = {}
+    for hans in hans_list:
+        key = cache.make_key(hans)
+        if key is None:
+            yield copy(convert(hans))
+            continue
+        result = results.get(key)
+        if result is None:
+            if len(results) >= dedup_size:
+                results.clear()
+            result = results[key] = convert(hans)
+        yield copy(result)
+
+
+def pinyin_batch(hans_list, style=Style.TONE, heteronym=False,
+                 errors='default', strict=True,
+                 v_to_u=False, neutral_tone_with_five=False,
+                 dedup_size=10000):
+    """使用同一组参数批量转换多个字符串，
+    按输入顺序返回每个字符串的 :py:func:`~pypinyin.pinyin` 结果。
+
+    所有输入共用一个分词器和转换器，重复的输入只会转换一次。
+    ``hans_list`` 可以是生成器，结果也是逐个生成的，
+    处理很大的输入时内存占用有上限。
+
+    :param hans_list: 字符串（或字符串列表）组成的可迭代对象
+    :param dedup_size: 最多记住多少个不同输入的结果用于去重
+    :type dedup_size: int
+    :return: 逐个生成拼音列表的生成器
+    :rtype: generator
+
+    其他参数详见 :py:func:`~pypinyin.pinyin`
+
+    Usage::
+
+      >>> from pypinyin.core import pinyin_batch
+      >>> list(pinyin_batch(['中心', '重心', '中心']))
+      [[['zhōng'], ['xīn']], [['zhòng'], ['xīn']], [['zhōng'], ['xīn']]]
+    """
+    _pinyin = _mix_pinyins[bool(v_to_u), bool(neutral_tone_with_five)]
+    convert_one = _batch_converter(_pinyin, style, heteronym, errors, strict)
+
+    def convert(hans):
+        return tuple(tuple(x) for x in convert_one(hans))
+
+    def copy(result):
+        return [list(x) for x in result]
+
+    return _iter_batch(hans_list, convert, copy, dedup_size)
+
+
+def lazy_pinyin_batch(hans_list, style=Style.NORMAL, errors='default',
+                      strict=True, v_to_u=False, neutral_tone_with_five=False,
+                      dedup_size=10000):
+    """使用同一组参数批量转换多个字符串，
+    按输入顺序返回每个字符串的 :py:func:`~pypinyin.lazy_pinyin` 结果。
+
+    参数和返回值详见 :py:func:`~pypinyin.core.pinyin_batch`
+
+    Usage::
+
+      >>> from pypinyin.core import lazy_pinyin_batch
+      >>> list(lazy_pinyin_batch(['中心', '重心']))
+      [['zhong', 'xin'], ['zhong', 'xin']]
+    """
+    _pinyin = _mix_pinyins[bool(v_to_u), bool(neutral_tone_with_five)]
+    convert_one = _batch_converter(_pinyin, style, False, errors, strict)
+
+    def convert(hans):
+        return tuple(chain(*convert_one(hans)))
+
+    return _iter_batch(hans_list, convert, list, dedup_size)
+
+
+def slug_batch(hans_list, style=Style.NORMAL, heteronym=False, separator='-',
+               errors='default', strict=True, dedup_size=10000):
+    """使用同一组参数批量转换多个字符串，
+    按输入顺序返回每个字符串的 :py:func:`~pypinyin.slug` 结果。
+
+    参数和返回值详见 :py:func:`~pypinyin.core.pinyin_batch`
+
+    Usage::
+
+      >>> from pypinyin.core import slug_batch
+      >>> list(slug_batch(['中国人', '中心']))
+      ['zhong-guo-ren', 'zhong-xin']
+    """
+    convert_one = _batch_converter(
+        _default_pinyin, style, heteronym, errors, strict)
+
+    def convert(hans):
+        return separator.join(chain(*convert_one(hans)))
+
+    def copy(result):
+        return result
+
+    return _iter_batch(hans_list, convert, copy, dedup_size)
+
+
+def _split_final_words(hans):
+    """把结尾可能还没读完的一段汉字分为已经确定的词语和剩下的汉字。
+
+    在位置 ``pos`` 的分词结果只跟 ``hans[pos:pos + max_len]`` 有关，
+    所以起始位置与结尾的距离超过 ``max_len`` 的词语不会因为后面的文本而改变。
+    """
+    seg_instance = mmseg.seg
+    max_len = seg_instance.max_len
+    end = len(hans)
+    words = []
+    pos = 0
+    for word in seg_instance.cut(hans):
+        if pos + max_len >= end:
+            break
+        words.append(word)
+        pos += len(word)
+    return words, hans[pos:]
+
+
+class _SegmentBuffer(object):
+    """把逐块输入的文本分为可以独立转换、并且转换结果与转换整个文本时
+    一致的片段，只暂存结尾还可能与后面的文本组成词语的汉字，
+    以及结尾还没有结束的一段非汉字字符。
+
+    非汉字字符转换时会作为一个整体，所以结尾的非汉字字符需要等到
+    读到汉字时再返回，但最多只暂存 ``max_pending`` 个，
+    超过时会分为多段返回，避免很长的英文等文本占用大量内存。
+    """
+
+    #: 最多暂存的非汉字字符的个数
+    max_pending = 4096
+
+    def __init__(self):
+        self._buf = ''
+        self._is_hans = False
+        # 暂存的非汉字字符，分块保存，避免每次输入都重新拼接和扫描
+        self._pending = []
+        self._pending_size = 0
+
+    def feed(self, chunk):
+        """输入一块文本，返回已经确定的片段列表"""
+        if not chunk:
+            return []
+        tokens = simple_seg_tokens(chunk)
+        segments = []
+        first, is_hans = tokens[0]
+        if is_hans != self._is_hans:
+            segments.extend(self._take())
+        elif is_hans:
+            # 暂存的汉字与这一块开头的汉字是连续的，需要一起分词
+            tokens[0] = (self._buf + first, True)
+        elif len(tokens) > 1:
+            # 暂存的非汉字字符到这一块的开头一段为止
+            tokens[0] = (''.join(self._pending) + first, False)
+            self._pending = []
+            self._pending_size = 0
+
+        # 除了最后一段外，其他段都已经完整了
+        segments.extend(x for x, _ in tokens[:-1])
+        last, is_hans = tokens[-1]
+        self._is_hans = is_hans
+        if is_hans:
+            words, self._buf = _split_final_words(last)
+            segments.extend(words)
+        else:
+            self._buf = ''
+            self._pending.append(last)
+            self._pending_size += len(last)
+            if self._pending_size >= self.max_pending:
+                segments.extend(self._take())
+        return segments
+
+    def _take(self):
+        """取出暂存的字符"""
+        if self._is_hans:
+            buf, self._buf = self._buf, ''
+        else:
+            buf = ''.join(self._pending)
+            self._pending = []
+            self._pending_size = 0
+        return [buf] if buf else []
+
+    def flush(self):
+        """输入结束，返回暂存的片段列表"""
+        segments = self._take()
+        self._is_hans = False
+        return segments
+
+
+def _iter_segments(fp, chunk_size):
+    """逐块读取 ``fp`` ，返回可以独立转换且转换结果与转换整个文本时一致的片段"""
+    buf = _SegmentBuffer()
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        for segment in buf.feed(chunk):
+            yield segment
+    for segment in buf.flush():
+        yield segment
+
+
+def iter_pinyin(fp, chunk_size=8192, style=Style.TONE, heteronym=False,
+                errors='default', strict=True,
+                v_to_u=False, neutral_tone_with_five=False):
+    """从文件对象中逐块读取文本并转换为拼音，逐个返回每个字的拼音列表。
+
+    只会暂存结尾一段还可能与后面的文本组成词语的字符，
+    所以处理很大的文本时内存占用基本不变，并且结果与一次性转换整个文本
+    （ ``pinyin(fp.read(), ...)`` ）时的结果一致。
+    唯一的例外是超过 4096 个字符的连续的非汉字字符，
+    这样的一段文本会分为多段（多个拼音列表）返回。
+
+    :param fp: 文本模式的文件对象（比如 ``open(path, encoding='utf-8')``
+               或 ``io.StringIO`` ），只需要支持 ``read(size)``
+    :param chunk_size: 每次读取的字符数
+    :type chunk_size: int
+    :return: 逐个生成拼音列表（ ``pinyin`` 返回的 list 中的元素）的生成器
+    :rtype: generator
+
+    其他参数详见 :py:func:`~pypinyin.pinyin`
+
+    Usage::
+
+      >>> import io
+      >>> from pypinyin import iter_pinyin
+      >>> list(iter_pinyin(io.StringIO('中心，重心'), chunk_size=2))
+      [['zhōng'], ['xīn'], ['，'], ['zhòng'], ['xīn']]
+    """
+    _pinyin = _mix_pinyins[bool(v_to_u), bool(neutral_tone_with_five)]
+    convert_one = _batch_converter(_pinyin, style, heteronym, errors, strict)
+    for segment in _iter_segments(fp, chunk_size):
+        for item in convert_one(segment):
+            yield item
@@ -1,18 +1,36 @@
+import threading
+
 from typing import Any
 from typing import List
 from typing import Dict
 from typing import Union
 from typing import Callable
+from typing import ContextManager
+from typing import Hashable
+from typing import IO
+from typing import Iterable
+from typing import Iterator
 from typing import Optional
 from typing import Text
+from typing import Tuple
+from typing import TypeVar
 
+from pypinyin.cache import CacheInfo, LRUCache
 from pypinyin.constants import Style
 from pypinyin.converter import Converter
+from pypinyin.provider import DictProvider, SnapshotProvider
+from pypinyin.seg.simpleseg import TToken
 
 
 TStyle = Style
 TErrors = Union[Callable[[Text], Text], Text]
 TPinyinResult = List[List[Text]]
+THans = Union[List[Text], Text]
+TProvider = Union[DictProvider, SnapshotProvider]
+TBound = Tuple[DictProvider, Converter, Callable[[THans], List[TToken]],
+               Optional[Callable[..., TPinyinResult]]]
+T = TypeVar('T')
+R = TypeVar('R')
 
 
 def load_single_dict(pinyin_dict: Dict[int, Text],
@@ -24,6 +42,34 @@ def load_phrases_dict(phrases_dict: Dict[Text, List[List[Text]]],
                       ) -> None: ...
 
 
+_local = ...  # type: threading.local
+
+
+def _dict_changed(phrases: Iterable[Text]) -> None: ...
+
+
+def dict_update() -> ContextManager[None]: ...
+
+
+def preload() -> None: ...
+
+
+def set_phrases_profile(profile: Text) -> None: ...
+
+
+def warmup(styles: Optional[Iterable[Any]] = ...,
+           freeze: bool = ...) -> None: ...
+
+
+def enable_cache(maxsize: int = ...) -> None: ...
+
+
+def disable_cache() -> None: ...
+
+
+def cache_info() -> Optional[CacheInfo]: ...
+
+
 def to_fixed(pinyin: Text, style: TStyle,
              strict: bool = ...) -> Text: ...
 
@@ -86,10 +132,106 @@ def lazy_pinyin(hans: Union[List[Text], Text],
                 ) -> List[Text]: ...
 
 
+
+def _batch_converter(_pinyin: Pinyin, style: TStyle, heteronym: bool,
+                     errors: TErrors, strict: bool
+                     ) -> Callable[[THans], TPinyinResult]: ...
+
+
+def _iter_batch(hans_list: Iterable[THans],
+                convert: Callable[[THans], T],
+                copy: Callable[[T], R],
+                dedup_size: int) -> Iterator[R]: ...
+
+
+def pinyin_batch(hans_list: Iterable[THans],
+                 style: TStyle = ...,
+                 heteronym: bool = ...,
+                 errors: TErrors = ...,
+                 strict: bool = ...,
+                 v_to_u: bool = ...,
+                 neutral_tone_with_five: bool = ...,
+                 dedup_size: int = ...
+                 ) -> Iterator[TPinyinResult]: ...
+
+
+def lazy_pinyin_batch(hans_list: Iterable[THans],
+                      style: TStyle = ...,
+                      errors: TErrors = ...,
+                      strict: bool = ...,
+                      v_to_u: bool = ...,
+                      neutral_tone_with_five: bool = ...,
+                      dedup_size: int = ...
+                      ) -> Iterator[List[Text]]: ...
+
+
+def slug_batch(hans_list: Iterable[THans],
+               style: TStyle = ...,
+               heteronym: bool = ...,
+               separator: Text = ...,
+               errors: TErrors = ...,
+               strict: bool = ...,
+               dedup_size: int = ...
+               ) -> Iterator[Text]: ...
+
+
+def _split_final_words(hans: Text) -> Tuple[List[Text], Text]: ...
+
+
+class _SegmentBuffer(object):
+    max_pending = ...  # type: int
+    _buf = ...  # type: Text
+    _is_hans = ...  # type: bool
+    _pending = ...  # type: List[Text]
+    _pending_size = ...  # type: int
+
+    def __init__(self) -> None: ...
+
+    def feed(self, chunk: Text) -> List[Text]: ...
+
+    def _take(self) -> List[Text]: ...
+
+    def flush(self) -> List[Text]: ...
+
+
+def _iter_segments(fp: IO[Text], chunk_size: int) -> Iterator[Text]: ...
+
+
+def iter_pinyin(fp: IO[Text],
+                chunk_size: int = ...,
+                style: TStyle = ...,
+                heteronym: bool = ...,
+                errors: TErrors = ...,
+                strict: bool = ...,
+                v_to_u: bool = ...,
+                neutral_tone_with_five: bool = ...
+                ) -> Iterator[List[Text]]: ...
+
 class Pinyin(object):
 
-    def __init__(self, converter: Converter = ..., **kwargs: Any) -> None:
+    _use_tokens = ...  # type: bool
+    _provider = ...  # type: Optional[TProvider]
+    _bound = ...  # type: Optional[TBound]
+
+    def __init__(self, converter: Converter = ...,
+                 cache_size: Optional[int] = ...,
+                 provider: Optional[TProvider] = ...,
+                 **kwargs: Any) -> None:
         self._converter = ...  # type: Converter
+        self._local = ...  # type: threading.local
+        self._cache = ...  # type: Optional[LRUCache]
+
+    def _convert(self, hans: THans, style: TStyle, heteronym: bool,
+                 errors: TErrors, strict: bool) -> TPinyinResult: ...
+
+    def _convert_words(self, converter: Converter, hans: THans,
+                       style: TStyle, heteronym: bool, errors: TErrors,
+                       strict: bool) -> TPinyinResult: ...
+
+    def _bind(self) -> TBound: ...
+
+    def _bind_snapshot(self) -> Tuple[Callable[[THans], List[TToken]],
+                                      Callable[..., TPinyinResult]]: ...
 
     def pinyin(self, hans: Union[List[Text], Text],
                style: TStyle = ...,
@@ -106,6 +248,10 @@ class Pinyin(object):
                     **kwargs: Any
                     ) -> List[Text]: ...
 
+    def cache_info(self) -> Optional[CacheInfo]: ...
+
+    def cache_clear(self) -> None: ...
+
     def pre_seg(self, hans: Text,
                 **kwargs: Any) -> Optional[List[Text]]: ...
 
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""第一次使用时才加载数据的 dict"""
+from __future__ import unicode_literals
+
+import threading
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
+
+
+class LazyDict(MutableMapping):
+    """第一次访问时才调用 ``loader`` 加载数据的 dict。
+
+    加载过程是线程安全的，``loader`` 只会被调用一次。
+
+    :param loader: 返回 dict 的无参数函数
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._data = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """是否已经加载了数据"""
+        return self._data is not None
+
+    def load(self):
+        """加载数据并返回加载后的 dict"""
+        data = self._data
+        if data is not None:
+            return data
+        with self._lock:
+            if self._data is None:
+                self._data = self._loader()
+            return self._data
+
+    def replace(self, data):
+        """使用 ``data`` 替换数据，不会再调用 ``loader``"""
+        with self._lock:
+            self._data = data
+
+    def __getitem__(self, key):
+        return (self._data if self._data is not None else self.load())[key]
+
+    def get(self, key, default=None):
+        data = self._data if self._data is not None else self.load()
+        return data.get(key, default)
+
+    def __contains__(self, key):
+        return key in (self._data if self._data is not None else self.load())
+
+    def __setitem__(self, key, value):
+        self.load()[key] = value
+
+    def __delitem__(self, key):
+        del self.load()[key]
+
+    def __iter__(self):
+        return iter(self.load())
+
+    def __len__(self):
+        return len(self.load())
+
+    def keys(self):
+        return self.load().keys()
+
+    def items(self):
+        return self.load().items()
+
+    def values(self):
+        return self.load().values()
+
+    def update(self, *args, **kwargs):
+        self.load().update(*args, **kwargs)
+
+    def copy(self):
+        return self.load().copy()
+
+    def __repr__(self):
+        if self._data is None:
+            return '<{0} (not loaded)>'.format(self.__class__.__name__)
+        return '{0}({1!r})'.format(self.__class__.__name__, self._data)
@@ -0,0 +1,39 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterator
+from typing import MutableMapping
+from typing import Optional
+from typing import TypeVar
+
+K = TypeVar('K')
+V = TypeVar('V')
+
+
+class LazyDict(MutableMapping[K, V]):
+    _data = ...  # type: Optional[Dict[K, V]]
+
+    def __init__(self, loader: Callable[[], Dict[K, V]]) -> None: ...
+
+    @property
+    def loaded(self) -> bool: ...
+
+    def load(self) -> Dict[K, V]: ...
+
+    def replace(self, data: Dict[K, V]) -> None: ...
+
+    def __getitem__(self, key: K) -> V: ...
+
+    def get(self, key: K, default: Any = ...) -> Any: ...
+
+    def __contains__(self, key: object) -> bool: ...
+
+    def __setitem__(self, key: K, value: V) -> None: ...
+
+    def __delitem__(self, key: K) -> None: ...
+
+    def __iter__(self) -> Iterator[K]: ...
+
+    def __len__(self) -> int: ...
+
+    def copy(self) -> Dict[K, V]: ...
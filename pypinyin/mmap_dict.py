@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""单字拼音库的二进制存储格式，通过 ``mmap`` 只读打开。
+
+多个进程（比如 fork 出来的 worker）打开同一个文件时会共享相同的物理内存页，
+也不再需要在导入时执行 ``pinyin_dict.py`` 构建一个很大的 dict 对象。
+
+文件格式（小端序）::
+
+    header:  magic(8s) version(I) start(I) count(I) blob_size(I)
+    offsets: (count + 1) * uint32，第 i 项是码位 start + i 的拼音在 blob 中的起始位置
+    blob:    utf-8 编码的拼音数据，比如 ``zhōng,zhòng``
+
+码位 ``start + i`` 的拼音数据是 ``blob[offsets[i]:offsets[i + 1]]`` ，
+为空表示这个码位没有拼音。
+"""
+from __future__ import unicode_literals
+
+import mmap
+import struct
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
+
+MAGIC = b'PYPINYIN'
+VERSION = 1
+
+_HEADER = struct.Struct('<8sIIII')
+_OFFSET = struct.Struct('<I')
+_OFFSET_PAIR = struct.Struct('<II')
+
+
+def dump(path, pinyin_dict=None):
+    """把单字拼音库保存为可以被 :class:`MmapPinyinDict` 打开的二进制文件。
+
+    :param path: 保存的文件路径
+    :param pinyin_dict: 单字拼音库，默认使用内置的拼音库
+    :type pinyin_dict: dict
+    """
+    if pinyin_dict is None:
+        from pypinyin.pinyin_dict import pinyin_dict
+
+    codes = sorted(pinyin_dict)
+    start = codes[0] if codes else 0
+    count = (codes[-1] - start + 1) if codes else 0
+
+    offsets = [0] * (count + 1)
+    chunks = []
+    size = 0
+    for index in range(count):
+        offsets[index] = size
+        value = pinyin_dict.get(start + index)
+        if value:
+            data = value.encode('utf-8')
+            chunks.append(data)
+            size += len(data)
+    offsets[count] = size
+
+    with open(path, 'wb') as fp:
+        fp.write(_HEADER.pack(MAGIC, VERSION, start, count, size))
+        fp.write(struct.pack('<%dI' % (count + 1), *offsets))
+        fp.write(b''.join(chunks))
+
+
+class MmapPinyinDict(MutableMapping):
+    """以 ``mmap`` 方式打开 :func:`dump` 生成的单字拼音库文件。
+
+    可以直接当作 ``PINYIN_DICT`` 使用。文件内容是只读的，
+    写入（比如 :py:func:`~pypinyin.load_single_dict` ）的数据保存在
+    进程内的一个小 dict 中，不会修改文件。
+
+    :param path: 拼音库文件路径
+    """
+
+    def __init__(self, path):
+        with open(path, 'rb') as fp:
+            self._mm = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, start, count, size = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self._mm.close()
+            raise ValueError(
+                '{0!r} is not a pinyin dict file (version {1})'.format(
+                    path, VERSION))
+        self.path = path
+        self._start = start
+        self._count = count
+        self._offsets_pos = _HEADER.size
+        self._blob_pos = _HEADER.size + (count + 1) * _OFFSET.size
+        self._base_len = None
+        self._overlay = {}
+        self._deleted = set()
+
+    def _base_get(self, key):
+        if not isinstance(key, int):   # 不是码位，跟 dict 一样当作不存在
+            return None
+        index = key - self._start
+        if not 0 <= index < self._count:
+            return None
+        begin, end = _OFFSET_PAIR.unpack_from(
+            self._mm, self._offsets_pos + index * _OFFSET.size)
+        if begin == end:
+            return None
+        pos = self._blob_pos
+        return self._mm[pos + begin:pos + end].decode('utf-8')
+
+    def _base_keys(self):
+        start = self._start
+        offsets = struct.unpack_from(
+            '<%dI' % (self._count + 1), self._mm, self._offsets_pos)
+        for index in range(self._count):
+            if offsets[index] != offsets[index + 1]:
+                yield start + index
+
+    def __getitem__(self, key):
+        if key in self._overlay:
+            return self._overlay[key]
+        if key not in self._deleted:
+            value = self._base_get(key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        value = self._overlay.get(key)
+        if value is not None:
+            return value
+        if key in self._deleted or key in self._overlay:
+            return default
+        value = self._base_get(key)
+        if value is None:
+            return default
+        return value
+
+    def __contains__(self, key):
+        if key in self._overlay:
+            return True
+        if key in self._deleted:
+            return False
+        return self._base_get(key) is not None
+
+    def __setitem__(self, key, value):
+        self._deleted.discard(key)
+        self._overlay[key] = value
+
+    def __delitem__(self, key):
+        if key in self._overlay:
+            del self._overlay[key]
+            if self._base_get(key) is not None:
+                self._deleted.add(key)
+        elif key not in self._deleted and self._base_get(key) is not None:
+            self._deleted.add(key)
+        else:
+            raise KeyError(key)
+
+    def __iter__(self):
+        overlay = self._overlay
+        deleted = self._deleted
+        for key in self._base_keys():
+            if key not in deleted and key not in overlay:
+                yield key
+        for key in list(overlay):
+            yield key
+
+    def __len__(self):
+        if self._base_len is None:
+            self._base_len = sum(1 for _ in self._base_keys())
+        extra = sum(1 for k in self._overlay if self._base_get(k) is None)
+        return self._base_len - len(self._deleted) + extra
+
+    def copy(self):
+        """返回一个共享同一个文件映射的新对象，写入的数据互不影响。"""
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._overlay = self._overlay.copy()
+        new._deleted = set(self._deleted)
+        return new
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.path)
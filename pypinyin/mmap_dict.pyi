@@ -0,0 +1,41 @@
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import MutableMapping
+from typing import Optional
+from typing import Set
+from typing import Text
+
+MAGIC = ...  # type: bytes
+VERSION = ...  # type: int
+
+
+def dump(path: Text, pinyin_dict: Optional[Dict[int, Text]] = ...) -> None: ...
+
+
+class MmapPinyinDict(MutableMapping[int, Text]):
+    path = ...  # type: Text
+    _overlay = ...  # type: Dict[int, Text]
+    _deleted = ...  # type: Set[int]
+
+    def __init__(self, path: Text) -> None: ...
+
+    def _base_get(self, key: int) -> Optional[Text]: ...
+
+    def _base_keys(self) -> Iterator[int]: ...
+
+    def __getitem__(self, key: int) -> Text: ...
+
+    def get(self, key: int, default: Any = ...) -> Any: ...
+
+    def __contains__(self, key: object) -> bool: ...
+
+    def __setitem__(self, key: int, value: Text) -> None: ...
+
+    def __delitem__(self, key: int) -> None: ...
+
+    def __iter__(self) -> Iterator[int]: ...
+
+    def __len__(self) -> int: ...
+
+    def copy(self) -> 'MmapPinyinDict': ...
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""使用多进程批量转换大量字符串。
+
+基于 :py:class:`concurrent.futures.ProcessPoolExecutor` ，把输入按块分发给
+多个 worker 进程，按输入顺序返回结果：
+
+.. code-block:: python
+
+    >>> from pypinyin.parallel import lazy_pinyin_batch
+    >>> list(lazy_pinyin_batch(['张三', '李四'], max_workers=2))
+    [['zhang', 'san'], ['li', 'si']]
+
+支持 ``fork`` 的平台上默认使用 ``fork`` 方式启动 worker ，
+创建进程池前会先在主进程中加载好拼音库和分词器，
+worker 直接通过写时复制共享这些只读数据，不会重新导入
+``pinyin_dict.py`` / ``phrases_dict.py`` 。
+其他平台上 worker 会重新导入 pypinyin ，这时可以通过环境变量
+``PYPINYIN_PINYIN_DICT_MMAP`` 让所有 worker 以 ``mmap`` 方式共享同一份
+单字拼音库（详见 :mod:`pypinyin.mmap_dict` ）。
+
+``errors`` 等参数会被发送给 worker 进程，所以必须是可以被 ``pickle`` 的对象。
+
+Python 2 中没有 :mod:`concurrent.futures` ，使用这个模块前需要安装
+`futures <https://pypi.org/project/futures/>`__ 。
+"""
+from __future__ import unicode_literals
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import multiprocessing
+import os
+import sys
+import time
+
+from pypinyin import core
+
+#: 自动调整块大小时，每个块期望的处理时间（秒）
+TARGET_CHUNK_SECONDS = 0.05
+#: 自动调整块大小时块大小的范围
+MIN_CHUNK_SIZE = 16
+MAX_CHUNK_SIZE = 16384
+
+
+def _init_worker():
+    # fork 出来的 worker 已经有加载好的数据，这里什么也不用做；
+    # 其他方式启动的 worker 在这里一次性加载好，不用在第一个任务中加载
+    core.preload()
+
+
+def _convert_chunk(func_name, chunk, kwargs):
+    func = getattr(core, func_name)
+    start = time.time()
+    results = list(func(chunk, **kwargs))
+    return results, time.time() - start
+
+
+def _tune_chunk_size(chunk_size, elapsed):
+    """根据上一个块的处理时间调整块大小，让每个块的处理时间接近
+    :py:data:`TARGET_CHUNK_SECONDS` 。
+    """
+    if elapsed <= 0:
+        scale = 2.0
+    else:
+        scale = min(2.0, max(0.5, TARGET_CHUNK_SECONDS / elapsed))
+    return int(min(MAX_CHUNK_SIZE, max(MIN_CHUNK_SIZE, chunk_size * scale)))
+
+
+def _get_context(mp_context):
+    if mp_context is not None:
+        return mp_context
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def _new_executor(max_workers, mp_context):
+    kwargs = {}
+    if sys.version_info >= (3, 7):
+        kwargs['mp_context'] = _get_context(mp_context)
+        kwargs['initializer'] = _init_worker
+    return ProcessPoolExecutor(max_workers=max_workers, **kwargs)
+
+
+def _map(func_name, hans_list, kwargs, max_workers, chunk_size, mp_context):
+    max_workers = max_workers or os.cpu_count() or 1
+    auto_tune = not chunk_size
+    chunk_size = chunk_size or MIN_CHUNK_SIZE
+    # 在主进程中加载好数据，fork 出来的 worker 可以直接共享
+    core.preload()
+
+    hans_iter = iter(hans_list)
+    with _new_executor(max_workers, mp_context) as executor:
+        pending = deque()
+        exhausted = False
+        while True:
+            # 最多同时处理 max_workers * 2 个块，保证内存占用有上限
+            while not exhausted and len(pending) < max_workers * 2:
+                chunk = list(islice(hans_iter, chunk_size))
+                if not chunk:
+                    exhausted = True
+                    break
+                pending.append(executor.submit(
+                    _convert_chunk, func_name, chunk, kwargs))
+            if not pending:
+                break
+
+            results, elapsed = pending.popleft().result()
+            if auto_tune:
+                chunk_size = _tune_chunk_size(chunk_size, elapsed)
+            for result in results:
+                yield result
+
+
+def pinyin_batch(hans_list, max_workers=None, chunk_size=None,
+                 mp_context=None, **kwargs):
+    """使用多个进程执行 :py:func:`~pypinyin.pinyin_batch` 。
+
+    :param hans_list: 字符串（或字符串列表）组成的可迭代对象，可以是生成器
+    :param max_workers: worker 进程数，默认为 CPU 核数
+    :type max_workers: int
+    :param chunk_size: 每次发送给 worker 的输入个数，
+                       默认根据处理耗时自动调整
+    :type chunk_size: int
+    :param mp_context: 启动 worker 使用的 multiprocessing context，
+                       默认优先使用 ``fork``
+    :param kwargs: 传给 :py:func:`~pypinyin.pinyin_batch` 的其他参数
+    :return: 按输入顺序逐个生成拼音列表的生成器
+    :rtype: generator
+    """
+    return _map('pinyin_batch', hans_list, kwargs,
+                max_workers, chunk_size, mp_context)
+
+
+def lazy_pinyin_batch(hans_list, max_workers=None, chunk_size=None,
+                      mp_context=None, **kwargs):
+    """使用多个进程执行 :py:func:`~pypinyin.lazy_pinyin_batch` 。
+
+    参数和返回值详见 :py:func:`~pypinyin.parallel.pinyin_batch`
+    """
+    return _map('lazy_pinyin_batch', hans_list, kwargs,
+                max_workers, chunk_size, mp_context)
+
+
+def slug_batch(hans_list, max_workers=None, chunk_size=None,
+               mp_context=None, **kwargs):
+    """使用多个进程执行 :py:func:`~pypinyin.slug_batch` 。
+
+    参数和返回值详见 :py:func:`~pypinyin.parallel.pinyin_batch`
+    """
+    return _map('slug_batch', hans_list, kwargs,
+                max_workers, chunk_size, mp_context)
@@ -0,0 +1,52 @@
+from typing import Any, Iterable, Iterator, List, Optional, Text, Tuple, Union
+
+from concurrent.futures import ProcessPoolExecutor
+
+THans = Union[List[Text], Text]
+
+TARGET_CHUNK_SECONDS = ...  # type: float
+MIN_CHUNK_SIZE = ...  # type: int
+MAX_CHUNK_SIZE = ...  # type: int
+
+
+def _init_worker() -> None: ...
+
+
+def _convert_chunk(func_name: str, chunk: List[THans], kwargs: Any
+                   ) -> Tuple[List[Any], float]: ...
+
+
+def _tune_chunk_size(chunk_size: int, elapsed: float) -> int: ...
+
+
+def _get_context(mp_context: Any) -> Any: ...
+
+
+def _new_executor(max_workers: int, mp_context: Any
+                  ) -> ProcessPoolExecutor: ...
+
+
+def _map(func_name: str, hans_list: Iterable[THans], kwargs: Any,
+         max_workers: Optional[int], chunk_size: Optional[int],
+         mp_context: Any) -> Iterator[Any]: ...
+
+
+def pinyin_batch(hans_list: Iterable[THans],
+                 max_workers: Optional[int] = ...,
+                 chunk_size: Optional[int] = ...,
+                 mp_context: Any = ...,
+                 **kwargs: Any) -> Iterator[List[List[Text]]]: ...
+
+
+def lazy_pinyin_batch(hans_list: Iterable[THans],
+                      max_workers: Optional[int] = ...,
+                      chunk_size: Optional[int] = ...,
+                      mp_context: Any = ...,
+                      **kwargs: Any) -> Iterator[List[Text]]: ...
+
+
+def slug_batch(hans_list: Iterable[THans],
+               max_workers: Optional[int] = ...,
+               chunk_size: Optional[int] = ...,
+               mp_context: Any = ...,
+               **kwargs: Any) -> Iterator[Text]: ...
@@ -0,0 +1,3 @@
+from typing import Dict, List, Text
+
+phrases_dict = ...  # type: Dict[Text, List[List[Text]]]
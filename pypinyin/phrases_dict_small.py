@@ -0,0 +1,17887 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+phrases_dict = {
+    '一个': [['yí'], ['gè']],
+    '一了': [['yī'], ['liǎo']],
+    '一些': [['yī'], ['xiē']],
+    '一代': [['yí'], ['dài']],
+    '一任': [['yī'], ['rèn']],
+    '一份': [['yī'], ['fèn']],
+    '一会': [['yī'], ['huì']],
+    '一似': [['yī'], ['sì']],
+    '一体': [['yī'], ['tǐ']],
+    '一倍': [['yí'], ['bèi']],
+    '一共': [['yī'], ['gòng']],
+    '一分': [['yī'], ['fēn']],
+    '一切': [['yī'], ['qiè']],
+    '一副': [['yī'], ['fù']],
+    '一匹': [['yì'], ['pǐ']],
+    '一半': [['yí'], ['bàn']],
+    '一卷': [['yī'], ['juàn']],
+    '一发': [['yī'], ['fà']],
+    '一只': [['yī'], ['zhī']],
+    '一号': [['yī'], ['hào']],
+    '一同': [['yī'], ['tóng']],
+    '一向': [['yí'], ['xiàng']],
+    '一场': [['yī'], ['chǎng']],
+    '一头': [['yī'], ['tóu']],
+    '一定': [['yí'], ['dìng']],
+    '一家': [['yī'], ['jiā']],
+    '一宿': [['yī'], ['xiǔ']],
+    '一幕': [['yí'], ['mù']],
+    '一干': [['yī'], ['gān']],
+    '一并': [['yī'], ['bìng']],
+    '一应': [['yī'], ['yīng']],
+    '一度': [['yí'], ['dù']],
+    '一得': [['yī'], ['de']],
+    '一怔': [['yí'], ['zhèng']],
+    '一成': [['yì'], ['chéng']],
+    '一扎': [['yī'], ['zā']],
+    '一打': [['yī'], ['dǎ']],
+    '一撮': [['yī'], ['zuǒ']],
+    '一旦': [['yí'], ['dàn']],
+    '一晃': [['yī'], ['huǎng']],
+    '一月': [['yí'], ['yuè']],
+    '一服': [['yī'], ['fù']],
+    '一朝': [['yī'], ['zhāo']],
+    '一期': [['yī'], ['qī']],
+    '一条': [['yī'], ['tiáo']],
+    '一流': [['yì'], ['liú']],
+    '一点': [['yì'], ['diǎn']],
+    '一片': [['yī'], ['piàn']],
+    '一番': [['yī'], ['fān']],
+    '一百': [['yì'], ['bǎi']],
+    '一直': [['yì'], ['zhí']],
+    '一种': [['yī'], ['zhǒng']],
+    '一致': [['yí'], ['zhì']],
+    '一般': [['yì'], ['bān']],
+    '一行': [['yī'], ['xíng']],
+    '一觉': [['yī'], ['jiào']],
+    '一贯': [['yí'], ['guàn']],
+    '一起': [['yì'], ['qǐ']],
+    '一通': [['yí'], ['tòng']],
+    '一隅': [['yì'], ['yú']],
+    '一面': [['yí'], ['miàn']],
+    '一齐': [['yī'], ['qí']],
+    '丁丁': [['dīng'], ['dīng']],
+    '丁丑': [['dīng'], ['chǒu']],
+    '丁东': [['dīng'], ['dōng']],
+    '丁亥': [['dīng'], ['hài']],
+    '丁冬': [['dīng'], ['dōng']],
+    '丁卯': [['dīng'], ['mǎo']],
+    '丁坝': [['dīng'], ['bà']],
+    '丁字': [['dīng'], ['zì']],
+    '丁宁': [['dīng'], ['níng']],
+    '丁当': [['dīng'], ['dāng']],
+    '丁忧': [['dīng'], ['yōu']],
+    '丁未': [['dīng'], ['wèi']],
+    '丁艰': [['dīng'], ['jiān']],
+    '丁零': [['dīng'], ['líng']],
+    '丁香': [['dīng'], ['xiāng']],
+    '七大': [['qī'], ['dà']],
+    '万一': [['wàn'], ['yī']],
+    '万万': [['wàn'], ['wàn']],
+    '万丈': [['wàn'], ['zhàng']],
+    '万世': [['wàn'], ['shì']],
+    '万事': [['wàn'], ['shì']],
+    '万众': [['wàn'], ['zhòng']],
+    '万俟': [['mò'], ['qí']],
+    '万全': [['wàn'], ['quán']],
+    '万分': [['wàn'], ['fēn']],
+    '万千': [['wàn'], ['qiān']],
+    '万卷': [['wàn'], ['juàn']],
+    '万历': [['wàn'], ['lì']],
+    '万古': [['wàn'], ['gǔ']],
+    '万国': [['wàn'], ['guó']],
+    '万安': [['wàn'], ['ān']],
+    '万岁': [['wàn'], ['suì']],
+    '万年': [['wàn'], ['nián']],
+    '万幸': [['wàn'], ['xìng']],
+    '万恶': [['wàn'], ['è']],
+    '万方': [['wàn'], ['fāng']],
+    '万有': [['wàn'], ['yǒu']],
+    '万机': [['wàn'], ['jī']],
+    '万死': [['wàn'], ['sǐ']],
+    '万民': [['wàn'], ['mín']],
+    '万物': [['wàn'], ['wù']],
+    '万状': [['wàn'], ['zhuàng']],
+    '万福': [['wàn'], ['fú']],
+    '万端': [['wàn'], ['duān']],
+    '万籁': [['wàn'], ['lài']],
+    '万能': [['wàn'], ['néng']],
+    '万般': [['wàn'], ['bān']],
+    '万象': [['wàn'], ['xiàng']],
+    '万贯': [['wàn'], ['guàn']],
+    '万金': [['wàn'], ['jīn']],
+    '万难': [['wàn'], ['nán']],
+    '万顷': [['wàn'], ['qǐng']],
+    '丈夫': [['zhàng'], ['fū']],
+    '丈量': [['zhàng'], ['liáng']],
+    '三分': [['sān'], ['fēn']],
+    '三副': [['sān'], ['fù']],
+    '三北': [['sān'], ['běi']],
+    '三台': [['sān'], ['tái']],
+    '三号': [['sān'], ['hào']],
+    '三合': [['sān'], ['hé']],
+    '三好': [['sān'], ['hǎo']],
+    '三度': [['sān'], ['dù']],
+    '三思': [['sān'], ['sī']],
+    '三教': [['sān'], ['jiào']],
+    '三更': [['sān'], ['gēng']],
+    '三相': [['sān'], ['xiāng']],
+    '三节': [['sān'], ['jié']],
+    '三藏': [['sān'], ['zàng']],
+    '三行': [['sān'], ['xíng']],
+    '三角': [['sān'], ['jiǎo']],
+    '三重': [['sān'], ['chóng']],
+    '三鲜': [['sān'], ['xiān']],
+    '上上': [['shàng'], ['shàng']],
+    '上下': [['shàng'], ['xià']],
+    '上世': [['shàng'], ['shì']],
+    '上举': [['shàng'], ['jǔ']],
+    '上乘': [['shàng'], ['chéng']],
+    '上书': [['shàng'], ['shū']],
+    '上交': [['shàng'], ['jiāo']],
+    '上京': [['shàng'], ['jīng']],
+    '上人': [['shàng'], ['rén']],
+    '上代': [['shàng'], ['dài']],
+    '上任': [['shàng'], ['rèn']],
+    '上位': [['shàng'], ['wèi']],
+    '上体': [['shàng'], ['tǐ']],
+    '上供': [['shàng'], ['gòng']],
+    '上元': [['shàng'], ['yuán']],
+    '上兵': [['shàng'], ['bīng']],
+    '上冻': [['shàng'], ['dòng']],
+    '上刑': [['shàng'], ['xíng']],
+    '上列': [['shàng'], ['liè']],
+    '上劲': [['shàng'], ['jìn']],
+    '上升': [['shàng'], ['shēng']],
+    '上午': [['shàng'], ['wǔ']],
+    '上卷': [['shàng'], ['juǎn']],
+    '上去': [['shǎng'], ['qù']],
+    '上口': [['shàng'], ['kǒu']],
+    '上古': [['shàng'], ['gǔ']],
+    '上台': [['shàng'], ['tái']],
+    '上叶': [['shàng'], ['yè']],
+    '上司': [['shàng'], ['sī']],
+    '上吊': [['shàng'], ['diào']],
+    '上告': [['shàng'], ['gào']],
+    '上品': [['shàng'], ['pǐn']],
+    '上唇': [['shàng'], ['chún']],
+    '上回': [['shàng'], ['huí']],
+    '上场': [['shàng'], ['chǎng']],
+    '上坟': [['shàng'], ['fén']],
+    '上坡': [['shàng'], ['pō']],
+    '上堂': [['shàng'], ['táng']],
+    '上士': [['shàng'], ['shì']],
+    '上声': [['shǎng'], ['shēng']],
+    '上夜': [['shàng'], ['yè']],
+    '上天': [['shàng'], ['tiān']],
+    '上头': [['shàng'], ['tou']],
+    '上奏': [['shàng'], ['zòu']],
+    '上套': [['shàng'], ['tào']],
+    '上好': [['shàng'], ['hǎo']],
+    '上学': [['shàng'], ['xué']],
+    '上官': [['shàng'], ['guān']],
+    '上客': [['shàng'], ['kè']],
+    '上家': [['shàng'], ['jiā']],
+    '上宾': [['shàng'], ['bīn']],
+    '上寿': [['shàng'], ['shòu']],
+    '上将': [['shàng'], ['jiàng']],
+    '上尉': [['shàng'], ['wèi']],
+    '上层': [['shàng'], ['céng']],
+    '上届': [['shàng'], ['jiè']],
+    '上山': [['shàng'], ['shān']],
+    '上岸': [['shàng'], ['àn']],
+    '上峰': [['shàng'], ['fēng']],
+    '上工': [['shàng'], ['gōng']],
+    '上市': [['shàng'], ['shì']],
+    '上帝': [['shàng'], ['dì']],
+    '上年': [['shàng'], ['nián']],
+    '上床': [['shàng'], ['chuáng']],
+    '上座': [['shàng'], ['zuò']],
+    '上弦': [['shàng'], ['xián']],
+    '上当': [['shàng'], ['dàng']],
+    '上心': [['shàng'], ['xīn']],
+    '上情': [['shàng'], ['qíng']],
+    '上房': [['shàng'], ['fáng']],
+    '上手': [['shàng'], ['shǒu']],
+    '上报': [['shàng'], ['bào']],
+    '上操': [['shàng'], ['cāo']],
+    '上文': [['shàng'], ['wén']],
+    '上方': [['shàng'], ['fāng']],
+    '上旬': [['shàng'], ['xún']],
+    '上映': [['shàng'], ['yìng']],
+    '上月': [['shàng'], ['yuè']],
+    '上朝': [['shàng'], ['cháo']],
+    '上来': [['shàng'], ['lái']],
+    '上林': [['shàng'], ['lín']],
+    '上校': [['shàng'], ['xiào']],
+    '上梁': [['shàng'], ['liáng']],
+    '上次': [['shàng'], ['cì']],
+    '上款': [['shàng'], ['kuǎn']],
+    '上水': [['shàng'], ['shuǐ']],
+    '上流': [['shàng'], ['liú']],
+    '上浮': [['shàng'], ['fú']],
+    '上海': [['shàng'], ['hǎi']],
+    '上涨': [['shàng'], ['zhǎng']],
+    '上游': [['shàng'], ['yóu']],
+    '上溯': [['shàng'], ['sù']],
+    '上演': [['shàng'], ['yǎn']],
+    '上火': [['shàng'], ['huǒ']],
+    '上焦': [['shàng'], ['jiāo']],
+    '上班': [['shàng'], ['bān']],
+    '上界': [['shàng'], ['jiè']],
+    '上疏': [['shàng'], ['shū']],
+    '上瘾': [['shàng'], ['yǐn']],
+    '上相': [['shàng'], ['xiàng']],
+    '上税': [['shàng'], ['shuì']],
+    '上空': [['shàng'], ['kōng']],
+    '上端': [['shàng'], ['duān']],
+    '上等': [['shàng'], ['děng']],
+    '上策': [['shàng'], ['cè']],
+    '上算': [['shàng'], ['suàn']],
+    '上簇': [['shàng'], ['cù']],
+    '上粪': [['shàng'], ['fèn']],
+    '上紧': [['shàng'], ['jǐn']],
+    '上级': [['shàng'], ['jí']],
+    '上纲': [['shàng'], ['gāng']],
+    '上缴': [['shàng'], ['jiǎo']],
+    '上联': [['shàng'], ['lián']],
+    '上肢': [['shàng'], ['zhī']],
+    '上脸': [['shàng'], ['liǎn']],
+    '上膘': [['shàng'], ['biāo']],
+    '上膛': [['shàng'], ['táng']],
+    '上色': [['shàng'], ['sè']],
+    '上苍': [['shàng'], ['cāng']],
+    '上药': [['shàng'], ['yào']],
+    '上菜': [['shàng'], ['cài']],
+    '上行': [['shàng'], ['xíng']],
+    '上街': [['shàng'], ['jiē']],
+    '上衣': [['shàng'], ['yī']],
+    '上装': [['shàng'], ['zhuāng']],
+    '上计': [['shàng'], ['jì']],
+    '上访': [['shàng'], ['fǎng']],
+    '上诉': [['shàng'], ['sù']],
+    '上课': [['shàng'], ['kè']],
+    '上调': [['shàng'], ['diào']],
+    '上谕': [['shàng'], ['yù']],
+    '上账': [['shàng'], ['zhàng']],
+    '上货': [['shàng'], ['huò']],
+    '上路': [['shàng'], ['lù']],
+    '上身': [['shàng'], ['shēn']],
+    '上车': [['shàng'], ['chē']],
+    '上辈': [['shàng'], ['bèi']],
+    '上边': [['shàng'], ['biān']],
+    '上达': [['shàng'], ['dá']],
+    '上进': [['shàng'], ['jìn']],
+    '上述': [['shàng'], ['shù']],
+    '上选': [['shàng'], ['xuǎn']],
+    '上钩': [['shàng'], ['gōu']],
+    '上铺': [['shàng'], ['pù']],
+    '上锁': [['shàng'], ['suǒ']],
+    '上门': [['shàng'], ['mén']],
+    '上闩': [['shàng'], ['shuān']],
+    '上阵': [['shàng'], ['zhèn']],
+    '上限': [['shàng'], ['xiàn']],
+    '上院': [['shàng'], ['yuàn']],
+    '上面': [['shàng'], ['miàn']],
+    '上鞋': [['shàng'], ['xié']],
+    '上风': [['shàng'], ['fēng']],
+    '上首': [['shàng'], ['shǒu']],
+    '上马': [['shàng'], ['mǎ']],
+    '下乘': [['xià'], ['shèng']],
+    '下令': [['xià'], ['lìng']],
+    '下体': [['xià'], ['tǐ']],
+    '下劲': [['xià'], ['jìn']],
+    '下卷': [['xià'], ['juàn']],
+    '下发': [['xià'], ['fā']],
+    '下台': [['xià'], ['tái']],
+    '下同': [['xià'], ['tóng']],
+    '下咽': [['xià'], ['yàn']],
+    '下地': [['xià'], ['dì']],
+    '下场': [['xià'], ['chǎng']],
+    '下处': [['xià'], ['chǔ']],
+    '下头': [['xià'], ['tou']],
+    '下家': [['xià'], ['jiā']],
+    '下属': [['xià'], ['shǔ']],
+    '下帖': [['xià'], ['tiě']],
+    '下毒': [['xià'], ['dú']],
+    '下泄': [['xià'], ['xiè']],
+    '下种': [['xià'], ['zhǒng']],
+    '下落': [['xià'], ['luò']],
+    '下行': [['xià'], ['xíng']],
+    '下调': [['xià'], ['diào']],
+    '下车': [['xià'], ['chē']],
+    '下铺': [['xià'], ['pù']],
+    '下降': [['xià'], ['jiàng']],
+    '下雨': [['xià'], ['yǔ']],
+    '下颌': [['xià'], ['hé']],
+    '不一': [['bù'], ['yī']],
+    '不下': [['bù'], ['xià']],
+    '不中': [['bù'], ['zhōng']],
+    '不丹': [['bù'], ['dān']],
+    '不久': [['bù'], ['jiǔ']],
+    '不义': [['bú'], ['yì']],
+    '不乏': [['bù'], ['fá']],
+    '不了': [['bù'], ['liǎo']],
+    '不争': [['bù'], ['zhēng']],
+    '不二': [['bù'], ['èr']],
+    '不亦': [['bù'], ['yì']],
+    '不仁': [['bù'], ['rén']],
+    '不仅': [['bù'], ['jǐn']],
+    '不休': [['bù'], ['xiū']],
+    '不会': [['bú'], ['huì']],
+    '不但': [['bù'], ['dàn']],
+    '不住': [['bú'], ['zhù']],
+    '不佞': [['bù'], ['nìng']],
+    '不佳': [['bù'], ['jiā']],
+    '不依': [['bù'], ['yī']],
+    '不便': [['bù'], ['biàn']],
+    '不俗': [['bù'], ['sú']],
+    '不信': [['bù'], ['xìn']],
+    '不修': [['bù'], ['xiū']],
+    '不倦': [['bù'], ['juàn']],
+    '不值': [['bù'], ['zhí']],
+    '不假': [['bù'], ['jiǎ']],
+    '不像': [['bù'], ['xiàng']],
+    '不光': [['bù'], ['guāng']],
+    '不克': [['bù'], ['kè']],
+    '不免': [['bù'], ['miǎn']],
+    '不公': [['bù'], ['gōng']],
+    '不关': [['bù'], ['guān']],
+    '不兴': [['bù'], ['xīng']],
+    '不具': [['bù'], ['jù']],
+    '不再': [['bù'], ['zài']],
+    '不准': [['bù'], ['zhǔn']],
+    '不减': [['bù'], ['jiǎn']],
+    '不凡': [['bù'], ['fán']],
+    '不分': [['bù'], ['fēn']],
+    '不利': [['bù'], ['lì']],
+    '不到': [['bú'], ['dào']],
+    '不力': [['bù'], ['lì']],
+    '不单': [['bù'], ['dān']],
+    '不厌': [['bù'], ['yàn']],
+    '不及': [['bù'], ['jí']],
+    '不变': [['bù'], ['biàn']],
+    '不只': [['bù'], ['zhǐ']],
+    '不可': [['bù'], ['kě']],
+    '不吃': [['bù'], ['chī']],
+    '不合': [['bù'], ['hé']],
+    '不同': [['bù'], ['tóng']],
+    '不吝': [['bù'], ['lìn']],
+    '不听': [['bù'], ['tīng']],
+    '不周': [['bù'], ['zhōu']],
+    '不和': [['bù'], ['hé']],
+    '不啻': [['bù'], ['chì']],
+    '不善': [['bù'], ['shàn']],
+    '不图': [['bù'], ['tú']],
+    '不在': [['bù'], ['zài']],
+    '不均': [['bù'], ['jūn']],
+    '不堪': [['bù'], ['kān']],
+    '不备': [['bù'], ['bèi']],
+    '不外': [['bù'], ['wài']],
+    '不够': [['bù'], ['gòu']],
+    '不大': [['bù'], ['dà']],
+    '不好': [['bù'], ['hǎo']],
+    '不如': [['bù'], ['rú']],
+    '不妙': [['bù'], ['miào']],
+    '不妥': [['bù'], ['tuǒ']],
+    '不妨': [['bù'], ['fáng']],
+    '不孕': [['bù'], ['yùn']],
+    '不孝': [['bù'], ['xiào']],
+    '不宁': [['bù'], ['níng']],
+    '不安': [['bù'], ['ān']],
+    '不定': [['bù'], ['dìng']],
+    '不宜': [['bù'], ['yí']],
+    '不实': [['bù'], ['shí']],
+    '不容': [['bù'], ['róng']],
+    '不寐': [['bú'], ['mèi']],
+    '不对': [['bú'], ['duì']],
+    '不少': [['bù'], ['shǎo']],
+    '不尽': [['bù'], ['jìn']],
+    '不屈': [['bù'], ['qū']],
+    '不屑': [['bù'], ['xiè']],
+    '不巧': [['bù'], ['qiǎo']],
+    '不差': [['bù'], ['chà']],
+    '不已': [['bù'], ['yǐ']],
+    '不常': [['bù'], ['cháng']],
+    '不干': [['bù'], ['gàn']],
+    '不平': [['bù'], ['píng']],
+    '不幸': [['bù'], ['xìng']],
+    '不当': [['bù'], ['dàng']],
+    '不待': [['bù'], ['dài']],
+    '不得': [['bù'], ['dé']],
+    '不必': [['bù'], ['bì']],
+    '不忍': [['bù'], ['rěn']],
+    '不快': [['bù'], ['kuài']],
+    '不忿': [['bù'], ['fèn']],
+    '不怕': [['bù'], ['pà']],
+    '不恤': [['bù'], ['xù']],
+    '不恭': [['bù'], ['gōng']],
+    '不息': [['bù'], ['xī']],
+    '不悦': [['bú'], ['yuè']],
+    '不惑': [['bù'], ['huò']],
+    '不惜': [['bù'], ['xī']],
+    '不惟': [['bù'], ['wéi']],
+    '不想': [['bù'], ['xiǎng']],
+    '不意': [['bù'], ['yì']],
+    '不愧': [['bù'], ['kuì']],
+    '不慎': [['bù'], ['shèn']],
+    '不懈': [['bù'], ['xiè']],
+    '不成': [['bù'], ['chéng']],
+    '不才': [['bù'], ['cái']],
+    '不扬': [['bù'], ['yáng']],
+    '不报': [['bù'], ['bào']],
+    '不拘': [['bù'], ['jū']],
+    '不振': [['bù'], ['zhèn']],
+    '不支': [['bù'], ['zhī']],
+    '不敌': [['bù'], ['dí']],
+    '不敏': [['bù'], ['mǐn']],
+    '不敢': [['bù'], ['gǎn']],
+    '不敬': [['bù'], ['jìng']],
+    '不文': [['bù'], ['wén']],
+    '不料': [['bù'], ['liào']],
+    '不断': [['bù'], ['duàn']],
+    '不无': [['bù'], ['wú']],
+    '不日': [['bù'], ['rì']],
+    '不时': [['bù'], ['shí']],
+    '不明': [['bù'], ['míng']],
+    '不易': [['bù'], ['yì']],
+    '不是': [['bú'], ['shì']],
+    '不智': [['bù'], ['zhì']],
+    '不暇': [['bù'], ['xiá']],
+    '不曾': [['bù'], ['céng']],
+    '不服': [['bù'], ['fú']],
+    '不期': [['bù'], ['qī']],
+    '不朽': [['bù'], ['xiǔ']],
+    '不枉': [['bù'], ['wǎng']],
+    '不果': [['bù'], ['guǒ']],
+    '不检': [['bù'], ['jiǎn']],
+    '不止': [['bù'], ['zhǐ']],
+    '不正': [['bù'], ['zhèng']],
+    '不比': [['bù'], ['bǐ']],
+    '不毛': [['bù'], ['máo']],
+    '不治': [['bù'], ['zhì']],
+    '不法': [['bù'], ['fǎ']],
+    '不洁': [['bù'], ['jié']],
+    '不测': [['bù'], ['cè']],
+    '不济': [['bù'], ['jì']],
+    '不消': [['bù'], ['xiāo']],
+    '不满': [['bù'], ['mǎn']],
+    '不灵': [['bù'], ['líng']],
+    '不然': [['bù'], ['rán']],
+    '不熟': [['bù'], ['shú']],
+    '不爽': [['bù'], ['shuǎng']],
+    '不犯': [['bù'], ['fàn']],
+    '不独': [['bù'], ['dú']],
+    '不理': [['bù'], ['lǐ']],
+    '不甘': [['bù'], ['gān']],
+    '不甚': [['bù'], ['shèn']],
+    '不用': [['bù'], ['yòng']],
+    '不由': [['bù'], ['yóu']],
+    '不碍': [['bù'], ['ài']],
+    '不祥': [['bù'], ['xiáng']],
+    '不禁': [['bù'], ['jīn']],
+    '不稳': [['bù'], ['wěn']],
+    '不端': [['bù'], ['duān']],
+    '不符': [['bù'], ['fú']],
+    '不等': [['bù'], ['děng']],
+    '不算': [['bù'], ['suàn']],
+    '不管': [['bù'], ['guǎn']],
+    '不纯': [['bù'], ['chún']],
+    '不羁': [['bù'], ['jī']],
+    '不耐': [['bù'], ['nài']],
+    '不耻': [['bù'], ['chǐ']],
+    '不肖': [['bù'], ['xiào']],
+    '不肯': [['bù'], ['kěn']],
+    '不育': [['bù'], ['yù']],
+    '不胜': [['bù'], ['shèng']],
+    '不能': [['bù'], ['néng']],
+    '不致': [['bù'], ['zhì']],
+    '不舍': [['bù'], ['shě']],
+    '不良': [['bù'], ['liáng']],
+    '不苟': [['bù'], ['gǒu']],
+    '不若': [['bù'], ['ruò']],
+    '不虞': [['bù'], ['yú']],
+    '不行': [['bù'], ['xíng']],
+    '不衰': [['bù'], ['shuāi']],
+    '不要': [['bú'], ['yào']],
+    '不见': [['bú'], ['jiàn']],
+    '不觉': [['bù'], ['jué']],
+    '不解': [['bù'], ['jiě']],
+    '不计': [['bù'], ['jì']],
+    '不让': [['bù'], ['ràng']],
+    '不讳': [['bù'], ['huì']],
+    '不许': [['bù'], ['xǔ']],
+    '不论': [['bù'], ['lùn']],
+    '不该': [['bù'], ['gāi']],
+    '不详': [['bù'], ['xiáng']],
+    '不象': [['bù'], ['xiàng']],
+    '不赖': [['bù'], ['lài']],
+    '不起': [['bù'], ['qǐ']],
+    '不足': [['bù'], ['zú']],
+    '不轨': [['bù'], ['guǐ']],
+    '不辍': [['bù'], ['chuò']],
+    '不辞': [['bù'], ['cí']],
+    '不过': [['bù'], ['guò']],
+    '不迭': [['bù'], ['dié']],
+    '不适': [['bù'], ['shì']],
+    '不逊': [['bù'], ['xùn']],
+    '不通': [['bù'], ['tōng']],
+    '不逞': [['bù'], ['chěng']],
+    '不遂': [['bù'], ['suí']],
+    '不遇': [['bù'], ['yù']],
+    '不遑': [['bù'], ['huáng']],
+    '不避': [['bù'], ['bì']],
+    '不配': [['bù'], ['pèi']],
+    '不错': [['bù'], ['cuò']],
+    '不问': [['bù'], ['wèn']],
+    '不雅': [['bù'], ['yǎ']],
+    '不韪': [['bù'], ['wěi']],
+    '不须': [['bù'], ['xū']],
+    '不顾': [['bù'], ['gù']],
+    '不齐': [['bù'], ['qí']],
+    '不齿': [['bù'], ['chǐ']],
+    '与会': [['yù'], ['huì']],
+    '与共': [['yǔ'], ['gòng']],
+    '与其': [['yǔ'], ['qí']],
+    '与赛': [['yù'], ['sài']],
+    '与门': [['yǔ'], ['mén']],
+    '与闻': [['yù'], ['wén']],
+    '丑化': [['chǒu'], ['huà']],
+    '丑恶': [['chǒu'], ['è']],
+    '丑相': [['chǒu'], ['xiàng']],
+    '丑行': [['chǒu'], ['xíng']],
+    '丑角': [['chǒu'], ['jué']],
+    '专任': [['zhuān'], ['rèn']],
+    '专区': [['zhuān'], ['qū']],
+    '专号': [['zhuān'], ['hào']],
+    '专员': [['zhuān'], ['yuán']],
+    '专场': [['zhuān'], ['chǎng']],
+    '专家': [['zhuān'], ['jiā']],
+    '专差': [['zhuān'], ['chāi']],
+    '专有': [['zhuān'], ['yǒu']],
+    '专柜': [['zhuān'], ['guì']],
+    '专横': [['zhuān'], ['hèng']],
+    '专著': [['zhuān'], ['zhù']],
+    '专论': [['zhuān'], ['lùn']],
+    '专车': [['zhuān'], ['chē']],
+    '专长': [['zhuān'], ['cháng']],
+    '且慢': [['qiě'], ['màn']],
+    '且末': [['qiě'], ['mò']],
+    '且说': [['qiě'], ['shuō']],
+    '世上': [['shì'], ['shàng']],
+    '世亲': [['shì'], ['qīn']],
+    '世仇': [['shì'], ['chóu']],
+    '世传': [['shì'], ['chuán']],
+    '世伯': [['shì'], ['bó']],
+    '世家': [['shì'], ['jiā']],
+    '世系': [['shì'], ['xì']],
+    '世纪': [['shì'], ['jì']],
+    '世间': [['shì'], ['jiān']],
+    '丙丁': [['bǐng'], ['dīng']],
+    '丙纶': [['bǐng'], ['lún']],
+    '业大': [['yè'], ['dà']],
+    '东北': [['dōng'], ['běi']],
+    '东区': [['dōng'], ['qū']],
+    '东华': [['dōng'], ['huá']],
+    '东南': [['dōng'], ['nán']],
+    '东台': [['dōng'], ['tái']],
+    '东头': [['dōng'], ['tóu']],
+    '东家': [['dōng'], ['jiā']],
+    '东莞': [['dōng'], ['guǎn']],
+    '东阿': [['dōng'], ['ē']],
+    '丞相': [['chéng'], ['xiàng']],
+    '两个': [['liǎng'], ['gè']],
+    '两侧': [['liǎng'], ['cè']],
+    '两便': [['liǎng'], ['biàn']],
+    '两可': [['liǎng'], ['kě']],
+    '两地': [['liǎng'], ['dì']],
+    '两头': [['liǎng'], ['tóu']],
+    '两广': [['liǎng'], ['guǎng']],
+    '两当': [['liǎng'], ['dāng']],
+    '两旁': [['liǎng'], ['páng']],
+    '两栖': [['liǎng'], ['qī']],
+    '两难': [['liǎng'], ['nán']],
+    '严令': [['yán'], ['lìng']],
+    '严处': [['yán'], ['chǔ']],
+    '严查': [['yán'], ['chá']],
+    '严正': [['yán'], ['zhèng']],
+    '严父': [['yán'], ['fù']],
+    '严禁': [['yán'], ['jìn']],
+    '严苛': [['yán'], ['kē']],
+    '严重': [['yán'], ['zhòng']],
+    '丧乱': [['sāng'], ['luàn']],
+    '丧事': [['sāng'], ['shì']],
+    '丧亡': [['sàng'], ['wáng']],
+    '丧假': [['sāng'], ['jià']],
+    '丧偶': [['sàng'], ['ǒu']],
+    '丧命': [['sàng'], ['mìng']],
+    '丧失': [['sàng'], ['shī']],
+    '丧家': [['sàng'], ['jiā']],
+    '丧志': [['sàng'], ['zhì']],
+    '丧服': [['sāng'], ['fú']],
+    '丧权': [['sàng'], ['quán']],
+    '丧气': [['sàng'], ['qì']],
+    '丧生': [['sàng'], ['shēng']],
+    '丧礼': [['sāng'], ['lǐ']],
+    '丧胆': [['sàng'], ['dǎn']],
+    '丧葬': [['sāng'], ['zàng']],
+    '丧身': [['sàng'], ['shēn']],
+    '丧钟': [['sāng'], ['zhōng']],
+    '丧门': [['sàng'], ['mén']],
+    '个个': [['gè'], ['gè']],
+    '个中': [['gè'], ['zhōng']],
+    '个人': [['gè'], ['rén']],
+    '个位': [['gè'], ['wèi']],
+    '个体': [['gè'], ['tǐ']],
+    '个儿': [['gè'], ['ér']],
+    '个别': [['gè'], ['bié']],
+    '个头': [['gè'], ['tóu']],
+    '个子': [['gè'], ['zi']],
+    '个性': [['gè'], ['xìng']],
+    '个把': [['gè'], ['bǎ']],
+    '个旧': [['gè'], ['jiù']],
+    '个案': [['gè'], ['àn']],
+    '丫头': [['yā'], ['tou']],
+    '丫杈': [['yā'], ['chà']],
+    '中东': [['zhōng'], ['dōng']],
+    '中产': [['zhōng'], ['chǎn']],
+    '中伏': [['zhōng'], ['fú']],
+    '中伤': [['zhòng'], ['shāng']],
+    '中保': [['zhōng'], ['bǎo']],
+    '中共': [['zhōng'], ['gòng']],
+    '中分': [['zhōng'], ['fēn']],
+    '中华': [['zhōng'], ['huá']],
+    '中卷': [['zhōng'], ['juàn']],
+    '中古': [['zhōng'], ['gǔ']],
+    '中号': [['zhōng'], ['hào']],
+    '中和': [['zhōng'], ['hé']],
+    '中国': [['zhōng'], ['guó']],
+    '中场': [['zhōng'], ['chǎng']],
+    '中奖': [['zhòng'], ['jiǎng']],
+    '中封': [['zhōng'], ['fēng']],
+    '中将': [['zhōng'], ['jiàng']],
+    '中层': [['zhōng'], ['céng']],
+    '中常': [['zhōng'], ['cháng']],
+    '中幡': [['zhōng'], ['fān']],
+    '中府': [['zhōng'], ['fǔ']],
+    '中度': [['zhōng'], ['dù']],
+    '中弹': [['zhòng'], ['dàn']],
+    '中彩': [['zhòng'], ['cǎi']],
+    '中技': [['zhōng'], ['jì']],
+    '中招': [['zhòng'], ['zhāo']],
+    '中断': [['zhōng'], ['duàn']],
+    '中方': [['zhōng'], ['fāng']],
+    '中暑': [['zhòng'], ['shǔ']],
+    '中服': [['zhōng'], ['fú']],
+    '中极': [['zhōng'], ['jí']],
+    '中标': [['zhòng'], ['biāo']],
+    '中段': [['zhōng'], ['duàn']],
+    '中毒': [['zhòng'], ['dú']],
+    '中法': [['zhōng'], ['fǎ']],
+    '中波': [['zhōng'], ['bō']],
+    '中点': [['zhōng'], ['diǎn']],
+    '中牟': [['zhōng'], ['mù']],
+    '中班': [['zhōng'], ['bān']],
+    '中的': [['zhōng'], ['de']],
+    '中程': [['zhōng'], ['chéng']],
+    '中稻': [['zhōng'], ['dào']],
+    '中等': [['zhōng'], ['děng']],
+    '中策': [['zhōng'], ['cè']],
+    '中级': [['zhōng'], ['jí']],
+    '中缝': [['zhōng'], ['fèng']],
+    '中耕': [['zhōng'], ['gēng']],
+    '中耳': [['zhōng'], ['ěr']],
+    '中行': [['zhōng'], ['háng']],
+    '中表': [['zhōng'], ['biǎo']],
+    '中计': [['zhòng'], ['jì']],
+    '中词': [['zhōng'], ['cí']],
+    '中辍': [['zhōng'], ['chuò']],
+    '中道': [['zhōng'], ['dào']],
+    '中部': [['zhōng'], ['bù']],
+    '中都': [['zhōng'], ['dōu']],
+    '中锋': [['zhōng'], ['fēng']],
+    '中长': [['zhōng'], ['cháng']],
+    '中队': [['zhōng'], ['duì']],
+    '中非': [['zhōng'], ['fēi']],
+    '中靶': [['zhòng'], ['bǎ']],
+    '中风': [['zhòng'], ['fēng']],
+    '中餐': [['zhōng'], ['cān']],
+    '中饭': [['zhōng'], ['fàn']],
+    '中饱': [['zhōng'], ['bǎo']],
+    '中黄': [['zhōng'], ['huáng']],
+    '丰盛': [['fēng'], ['shèng']],
+    '丰采': [['fēng'], ['cǎi']],
+    '串供': [['chuàn'], ['gòng']],
+    '串戏': [['chuàn'], ['xì']],
+    '临了': [['lín'], ['le']],
+    '临别': [['lín'], ['bié']],
+    '临场': [['lín'], ['chǎng']],
+    '临头': [['lín'], ['tóu']],
+    '临帖': [['lín'], ['tiè']],
+    '临朝': [['lín'], ['cháo']],
+    '临行': [['lín'], ['xíng']],
+    '临难': [['lín'], ['nàn']],
+    '丸子': [['wán'], ['zi']],
+    '丹参': [['dān'], ['shēn']],
+    '丹毒': [['dān'], ['dú']],
+    '为主': [['wéi'], ['zhǔ']],
+    '为了': [['wèi'], ['le']],
+    '为人': [['wéi'], ['rén']],
+    '为伍': [['wéi'], ['wǔ']],
+    '为何': [['wèi'], ['hé']],
+    '为啥': [['wèi'], ['shá']],
+    '为害': [['wéi'], ['hài']],
+    '为患': [['wéi'], ['huàn']],
+    '为政': [['wéi'], ['zhèng']],
+    '为数': [['wéi'], ['shù']],
+    '为时': [['wéi'], ['shí']],
+    '为期': [['wéi'], ['qī']],
+    '为止': [['wéi'], ['zhǐ']],
+    '为此': [['wèi'], ['cǐ']],
+    '为生': [['wéi'], ['shēng']],
+    '为着': [['wéi'], ['zhe']],
+    '为限': [['wéi'], ['xiàn']],
+    '为难': [['wéi'], ['nán']],
+    '为首': [['wéi'], ['shǒu']],
+    '主上': [['zhǔ'], ['shàng']],
+    '主仆': [['zhǔ'], ['pú']],
+    '主从': [['zhǔ'], ['cóng']],
+    '主任': [['zhǔ'], ['rèn']],
+    '主体': [['zhǔ'], ['tǐ']],
+    '主句': [['zhǔ'], ['jù']],
+    '主家': [['zhǔ'], ['jiā']],
+    '主将': [['zhǔ'], ['jiàng']],
+    '主干': [['zhǔ'], ['gàn']],
+    '主教': [['zhǔ'], ['jiào']],
+    '主祭': [['zhǔ'], ['jì']],
+    '主要': [['zhǔ'], ['yào']],
+    '主见': [['zhǔ'], ['jiàn']],
+    '主观': [['zhǔ'], ['guān']],
+    '主角': [['zhǔ'], ['jué']],
+    '主语': [['zhǔ'], ['yǔ']],
+    '主调': [['zhǔ'], ['diào']],
+    '主轴': [['zhǔ'], ['zhóu']],
+    '主食': [['zhǔ'], ['shí']],
+    '丽人': [['lì'], ['rén']],
+    '丽日': [['lì'], ['rì']],
+    '丽水': [['lí'], ['shuǐ']],
+    '丽质': [['lì'], ['zhì']],
+    '丽都': [['lì'], ['dū']],
+    '举发': [['jǔ'], ['fā']],
+    '举家': [['jǔ'], ['jiā']],
+    '举行': [['jǔ'], ['xíng']],
+    '举要': [['jǔ'], ['yào']],
+    '举重': [['jǔ'], ['zhòng']],
+    '久仰': [['jiǔ'], ['yǎng']],
+    '久别': [['jiǔ'], ['bié']],
+    '久长': [['jiǔ'], ['cháng']],
+    '义女': [['yì'], ['nǚ']],
+    '义行': [['yì'], ['xíng']],
+    '乌头': [['wū'], ['tóu']],
+    '乌拉': [['wù'], ['la']],
+    '乌有': [['wū'], ['yǒu']],
+    '乌龟': [['wū'], ['guī']],
+    '乍看': [['zhà'], ['kàn']],
+    '乏累': [['fá'], ['lèi']],
+    '乐业': [['lè'], ['yè']],
+    '乐事': [['lè'], ['shì']],
+    '乐于': [['lè'], ['yú']],
+    '乐儿': [['lè'], ['ér']],
+    '乐句': [['lè'], ['jù']],
+    '乐器': [['yuè'], ['qì']],
+    '乐团': [['yuè'], ['tuán']],
+    '乐园': [['lè'], ['yuán']],
+    '乐土': [['lè'], ['tǔ']],
+    '乐坛': [['yuè'], ['tán']],
+    '乐天': [['lè'], ['tiān']],
+    '乐子': [['lè'], ['zǐ']],
+    '乐安': [['lè'], ['ān']],
+    '乐官': [['yuè'], ['guān']],
+    '乐山': [['lè'], ['shān']],
+    '乐工': [['yuè'], ['gōng']],
+    '乐师': [['yuè'], ['shī']],
+    '乐府': [['yuè'], ['fǔ']],
+    '乐律': [['yuè'], ['lǜ']],
+    '乐得': [['lè'], ['de']],
+    '乐意': [['lè'], ['yì']],
+    '乐感': [['yuè'], ['gǎn']],
+    '乐户': [['yuè'], ['hù']],
+    '乐手': [['lè'], ['shǒu']],
+    '乐曲': [['yuè'], ['qǔ']],
+    '乐果': [['lè'], ['guǒ']],
+    '乐歌': [['yuè'], ['gē']],
+    '乐毅': [['yuè'], ['yì']],
+    '乐池': [['yuè'], ['chí']],
+    '乐清': [['yuè'], ['qīng']],
+    '乐理': [['lè'], ['lǐ']],
+    '乐章': [['yuè'], ['zhāng']],
+    '乐舞': [['yuè'], ['wǔ']],
+    '乐观': [['lè'], ['guān']],
+    '乐谱': [['yuè'], ['pǔ']],
+    '乐趣': [['lè'], ['qù']],
+    '乐迷': [['yuè'], ['mí']],
+    '乐道': [['lè'], ['dào']],
+    '乐都': [['lè'], ['dōu']],
+    '乐队': [['yuè'], ['duì']],
+    '乐音': [['yuè'], ['yīn']],
+    '乖觉': [['guāi'], ['jué']],
+    '乘乘': [['chéng'], ['chéng']],
+    '乘便': [['chéng'], ['biàn']],
+    '乘兴': [['chéng'], ['xìng']],
+    '乘凉': [['chéng'], ['liáng']],
+    '乘势': [['chéng'], ['shì']],
+    '乘号': [['chéng'], ['hào']],
+    '乘坐': [['chéng'], ['zuò']],
+    '乘壶': [['shèng'], ['hú']],
+    '乘客': [['chéng'], ['kè']],
+    '乘幂': [['chéng'], ['mì']],
+    '乘数': [['chéng'], ['shù']],
+    '乘方': [['chéng'], ['fāng']],
+    '乘机': [['chéng'], ['jī']],
+    '乘法': [['chéng'], ['fǎ']],
+    '乘积': [['chéng'], ['jī']],
+    '乘胜': [['chéng'], ['shèng']],
+    '乘舆': [['shèng'], ['yú']],
+    '乘虚': [['chéng'], ['xū']],
+    '乘警': [['chéng'], ['jǐng']],
+    '乘车': [['chéng'], ['chē']],
+    '乘除': [['chéng'], ['chú']],
+    '乘隙': [['chéng'], ['xì']],
+    '乘风': [['chéng'], ['fēng']],
+    '乘马': [['chéng'], ['mǎ']],
+    '乜斜': [['miē'], ['xié']],
+    '九重': [['jiǔ'], ['zhòng']],
+    '乞和': [['qǐ'], ['hé']],
+    '乞降': [['qǐ'], ['xiáng']],
+    '乞食': [['qǐ'], ['shí']],
+    '也好': [['yě'], ['hǎo']],
+    '也罢': [['yě'], ['bà']],
+    '也许': [['yě'], ['xǔ']],
+    '习好': [['xí'], ['hǎo']],
+    '习服': [['xí'], ['fú']],
+    '习见': [['xí'], ['jiàn']],
+    '乡丁': [['xiāng'], ['dīng']],
+    '乡亲': [['xiāng'], ['qīn']],
+    '乡思': [['xiāng'], ['sī']],
+    '乡曲': [['xiāng'], ['qū']],
+    '乡约': [['xiāng'], ['yuē']],
+    '乡长': [['xiāng'], ['cháng']],
+    '乡间': [['xiāng'], ['jiān']],
+    '书价': [['shū'], ['jià']],
+    '书体': [['shū'], ['tǐ']],
+    '书信': [['shū'], ['xìn']],
+    '书僮': [['shū'], ['tóng']],
+    '书卷': [['shū'], ['juàn']],
+    '书号': [['shū'], ['hào']],
+    '书场': [['shū'], ['chǎng']],
+    '书契': [['shū'], ['qì']],
+    '书家': [['shū'], ['jiā']],
+    '书柜': [['shū'], ['guì']],
+    '书背': [['shū'], ['bèi']],
+    '书论': [['shū'], ['lùn']],
+    '买价': [['mǎi'], ['jià']],
+    '买好': [['mǎi'], ['hǎo']],
+    '买家': [['mǎi'], ['jiā']],
+    '乱发': [['luàn'], ['fā']],
+    '乱弹': [['luàn'], ['tán']],
+    '乱打': [['luàn'], ['dǎ']],
+    '乱说': [['luàn'], ['shuō']],
+    '乳化': [['rǔ'], ['huà']],
+    '乳头': [['rǔ'], ['tóu']],
+    '乳晕': [['rǔ'], ['yùn']],
+    '乳燕': [['rǔ'], ['yàn']],
+    '乳糜': [['rǔ'], ['mí']],
+    '乳臭': [['rǔ'], ['xiù']],
+    '了了': [['liǎo'], ['liǎo']],
+    '了事': [['liǎo'], ['shì']],
+    '了却': [['liǎo'], ['què']],
+    '了局': [['liǎo'], ['jú']],
+    '了当': [['liǎo'], ['dàng']],
+    '了得': [['liǎo'], ['de']],
+    '了悟': [['liǎo'], ['wù']],
+    '了断': [['liǎo'], ['duàn']],
+    '了无': [['liǎo'], ['wú']],
+    '了然': [['liǎo'], ['rán']],
+    '了结': [['liǎo'], ['jié']],
+    '了解': [['liǎo'], ['jiě']],
+    '了账': [['liǎo'], ['zhàng']],
+    '予以': [['yǔ'], ['yǐ']],
+    '争吵': [['zhēng'], ['chǎo']],
+    '争强': [['zhēng'], ['qiáng']],
+    '争得': [['zhēng'], ['de']],
+    '争抢': [['zhēng'], ['qiǎng']],
+    '争斗': [['zhēng'], ['dòu']],
+    '争论': [['zhēng'], ['lùn']],
+    '事体': [['shì'], ['tǐ']],
+    '事假': [['shì'], ['jià']],
+    '二价': [['èr'], ['jià']],
+    '二分': [['èr'], ['fēn']],
+    '二副': [['èr'], ['fù']],
+    '二重': [['èr'], ['chóng']],
+    '于思': [['yú'], ['sāi']],
+    '亏待': [['kuī'], ['dài']],
+    '亏得': [['kuī'], ['de']],
+    '亏折': [['kuī'], ['zhé']],
+    '亏空': [['kuī'], ['kōng']],
+    '亏累': [['kuī'], ['lèi']],
+    '云南': [['yún'], ['nán']],
+    '云和': [['yún'], ['hé']],
+    '云头': [['yún'], ['tóu']],
+    '云岭': [['yún'], ['lǐng']],
+    '云散': [['yún'], ['sàn']],
+    '云景': [['yún'], ['jǐng']],
+    '云梢': [['yún'], ['shāo']],
+    '云涌': [['yún'], ['yǒng']],
+    '云量': [['yún'], ['liàng']],
+    '云雀': [['yún'], ['què']],
+    '云雨': [['yún'], ['yǔ']],
+    '互助': [['hù'], ['zhù']],
+    '互济': [['hù'], ['jì']],
+    '互相': [['hù'], ['xiāng']],
+    '互见': [['hù'], ['xiàn']],
+    '五内': [['wǔ'], ['nèi']],
+    '五分': [['wǔ'], ['fēn']],
+    '五华': [['wǔ'], ['huá']],
+    '五台': [['wǔ'], ['tái']],
+    '五号': [['wǔ'], ['hào']],
+    '五岭': [['wǔ'], ['lǐng']],
+    '五更': [['wǔ'], ['gēng']],
+    '五服': [['wǔ'], ['fú']],
+    '五毒': [['wǔ'], ['dú']],
+    '五节': [['wǔ'], ['jié']],
+    '五行': [['wǔ'], ['xíng']],
+    '井台': [['jǐng'], ['tái']],
+    '井喷': [['jǐng'], ['pēn']],
+    '井场': [['jǐng'], ['chǎng']],
+    '井底': [['jǐng'], ['dǐ']],
+    '亚当': [['yà'], ['dāng']],
+    '些个': [['xiē'], ['gè']],
+    '些小': [['xiē'], ['xiǎo']],
+    '些微': [['xiē'], ['wēi']],
+    '些许': [['xiē'], ['xǔ']],
+    '些须': [['xiē'], ['xū']],
+    '亟亟': [['jí'], ['jí']],
+    '亡佚': [['wáng'], ['yì']],
+    '亡党': [['wáng'], ['dǎng']],
+    '亡友': [['wáng'], ['yǒu']],
+    '亡命': [['wáng'], ['mìng']],
+    '亡国': [['wáng'], ['guó']],
+    '亡失': [['wáng'], ['shī']],
+    '亡故': [['wáng'], ['gù']],
+    '亡灵': [['wáng'], ['líng']],
+    '亡魂': [['wáng'], ['hún']],
+    '交会': [['jiāo'], ['huì']],
+    '交卷': [['jiāo'], ['juàn']],
+    '交叉': [['jiāo'], ['chā']],
+    '交合': [['jiāo'], ['hé']],
+    '交好': [['jiāo'], ['hǎo']],
+    '交尾': [['jiāo'], ['wěi']],
+    '交差': [['jiāo'], ['chāi']],
+    '交并': [['jiāo'], ['bìng']],
+    '交底': [['jiāo'], ['dǐ']],
+    '交待': [['jiāo'], ['dài']],
+    '交恶': [['jiāo'], ['wù']],
+    '交椅': [['jiāo'], ['yǐ']],
+    '交相': [['jiāo'], ['xiāng']],
+    '交结': [['jiāo'], ['jié']],
+    '交给': [['jiāo'], ['gěi']],
+    '交臂': [['jiāo'], ['bì']],
+    '交行': [['jiāo'], ['háng']],
+    '交角': [['jiāo'], ['jiǎo']],
+    '交还': [['jiāo'], ['huán']],
+    '交迫': [['jiāo'], ['pò']],
+    '产假': [['chǎn'], ['jià']],
+    '产地': [['chǎn'], ['dì']],
+    '产期': [['chǎn'], ['qī']],
+    '产量': [['chǎn'], ['liàng']],
+    '亨通': [['hēng'], ['tōng']],
+    '享乐': [['xiǎng'], ['lè']],
+    '享有': [['xiǎng'], ['yǒu']],
+    '京华': [['jīng'], ['huá']],
+    '京戏': [['jīng'], ['xì']],
+    '京都': [['jīng'], ['dū']],
+    '亭子': [['tíng'], ['zi']],
+    '亭长': [['tíng'], ['zhǎng']],
+    '亮底': [['liàng'], ['dǐ']],
+    '亮度': [['liàng'], ['dù']],
+    '亮相': [['liàng'], ['xiàng']],
+    '亲丁': [['qīn'], ['dīng']],
+    '亲临': [['qīn'], ['lín']],
+    '亲为': [['qīn'], ['wéi']],
+    '亲事': [['qīn'], ['shì']],
+    '亲亲': [['qīn'], ['qīn']],
+    '亲人': [['qīn'], ['rén']],
+    '亲代': [['qīn'], ['dài']],
+    '亲信': [['qīn'], ['xìn']],
+    '亲兵': [['qīn'], ['bīng']],
+    '亲切': [['qīn'], ['qiè']],
+    '亲历': [['qīn'], ['lì']],
+    '亲友': [['qīn'], ['yǒu']],
+    '亲口': [['qīn'], ['kǒu']],
+    '亲吻': [['qīn'], ['wěn']],
+    '亲和': [['qīn'], ['hé']],
+    '亲善': [['qīn'], ['shàn']],
+    '亲嘴': [['qīn'], ['zuǐ']],
+    '亲娘': [['qīn'], ['niáng']],
+    '亲子': [['qīn'], ['zǐ']],
+    '亲家': [['qìng'], ['jia']],
+    '亲密': [['qīn'], ['mì']],
+    '亲属': [['qīn'], ['shǔ']],
+    '亲征': [['qīn'], ['zhēng']],
+    '亲情': [['qīn'], ['qíng']],
+    '亲戚': [['qīn'], ['qī']],
+    '亲手': [['qīn'], ['shǒu']],
+    '亲政': [['qīn'], ['zhèng']],
+    '亲故': [['qīn'], ['gù']],
+    '亲族': [['qīn'], ['zú']],
+    '亲昵': [['qīn'], ['nì']],
+    '亲朋': [['qīn'], ['péng']],
+    '亲本': [['qīn'], ['běn']],
+    '亲热': [['qīn'], ['rè']],
+    '亲爱': [['qīn'], ['ài']],
+    '亲王': [['qīn'], ['wáng']],
+    '亲生': [['qīn'], ['shēng']],
+    '亲疏': [['qīn'], ['shū']],
+    '亲眷': [['qīn'], ['juàn']],
+    '亲眼': [['qīn'], ['yǎn']],
+    '亲睦': [['qīn'], ['mù']],
+    '亲睹': [['qīn'], ['dǔ']],
+    '亲知': [['qīn'], ['zhī']],
+    '亲笔': [['qīn'], ['bǐ']],
+    '亲缘': [['qīn'], ['yuán']],
+    '亲自': [['qīn'], ['zì']],
+    '亲身': [['qīn'], ['shēn']],
+    '亲迎': [['qīn'], ['yíng']],
+    '亲近': [['qīn'], ['jìn']],
+    '亲随': [['qīn'], ['suí']],
+    '人丁': [['rén'], ['dīng']],
+    '人中': [['rén'], ['zhōng']],
+    '人为': [['rén'], ['wéi']],
+    '人们': [['rén'], ['men']],
+    '人体': [['rén'], ['tǐ']],
+    '人参': [['rén'], ['shēn']],
+    '人员': [['rén'], ['yuán']],
+    '人和': [['rén'], ['hé']],
+    '人大': [['rén'], ['dà']],
+    '人夫': [['rén'], ['fū']],
+    '人头': [['rén'], ['tóu']],
+    '人家': [['rén'], ['jiā']],
+    '人数': [['rén'], ['shù']],
+    '人氏': [['rén'], ['shì']],
+    '人种': [['rén'], ['zhǒng']],
+    '人称': [['rén'], ['chēng']],
+    '人间': [['rén'], ['jiān']],
+    '亿万': [['yì'], ['wàn']],
+    '什么': [['shén'], ['me']],
+    '什物': [['shí'], ['wù']],
+    '什锦': [['shí'], ['jǐn']],
+    '仁化': [['rén'], ['huà']],
+    '仁弟': [['rén'], ['dì']],
+    '仁术': [['rén'], ['shù']],
+    '仅仅': [['jǐn'], ['jǐn']],
+    '仅见': [['jǐn'], ['jiàn']],
+    '仆人': [['pú'], ['rén']],
+    '仆从': [['pú'], ['cóng']],
+    '仆妇': [['pú'], ['fù']],
+    '仆役': [['pú'], ['yì']],
+    '仇人': [['chóu'], ['rén']],
+    '仇外': [['chóu'], ['wài']],
+    '仇姓': [['qiú'], ['xìng']],
+    '仇家': [['chóu'], ['jiā']],
+    '仇怨': [['chóu'], ['yuàn']],
+    '仇恨': [['chóu'], ['hèn']],
+    '仇敌': [['chóu'], ['dí']],
+    '仇杀': [['chóu'], ['shā']],
+    '仇视': [['chóu'], ['shì']],
+    '仇隙': [['chóu'], ['xì']],
+    '今朝': [['jīn'], ['zhāo']],
+    '今番': [['jīn'], ['fān']],
+    '从不': [['cóng'], ['bù']],
+    '从业': [['cóng'], ['yè']],
+    '从中': [['cóng'], ['zhōng']],
+    '从事': [['cóng'], ['shì']],
+    '从今': [['cóng'], ['jīn']],
+    '从众': [['cóng'], ['zhòng']],
+    '从优': [['cóng'], ['yōu']],
+    '从俗': [['cóng'], ['sú']],
+    '从先': [['cóng'], ['xiān']],
+    '从军': [['cóng'], ['jūn']],
+    '从刑': [['cóng'], ['xíng']],
+    '从前': [['cóng'], ['qián']],
+    '从动': [['cóng'], ['dòng']],
+    '从化': [['cóng'], ['huà']],
+    '从句': [['cóng'], ['jù']],
+    '从命': [['cóng'], ['mìng']],
+    '从头': [['cóng'], ['tóu']],
+    '从实': [['cóng'], ['shí']],
+    '从容': [['cóng'], ['róng']],
+    '从小': [['cóng'], ['xiǎo']],
+    '从属': [['cóng'], ['shǔ']],
+    '从师': [['cóng'], ['shī']],
+    '从征': [['cóng'], ['zhēng']],
+    '从戎': [['cóng'], ['róng']],
+    '从政': [['cóng'], ['zhèng']],
+    '从教': [['cóng'], ['jiào']],
+    '从新': [['cóng'], ['xīn']],
+    '从权': [['cóng'], ['quán']],
+    '从来': [['cóng'], ['lái']],
+    '从此': [['cóng'], ['cǐ']],
+    '从犯': [['cóng'], ['fàn']],
+    '从略': [['cóng'], ['lüè']],
+    '从而': [['cóng'], ['ér']],
+    '从良': [['cóng'], ['liáng']],
+    '从速': [['cóng'], ['sù']],
+    '仓卒': [['cāng'], ['cù']],
+    '仓颉': [['cāng'], ['jié']],
+    '仔密': [['zǐ'], ['mì']],
+    '仔猪': [['zǐ'], ['zhū']],
+    '仔畜': [['zǐ'], ['chù']],
+    '仔细': [['zǐ'], ['xì']],
+    '仔肩': [['zī'], ['jiān']],
+    '仔鱼': [['zǐ'], ['yú']],
+    '仔鸡': [['zǐ'], ['jī']],
+    '仕女': [['shì'], ['nǚ']],
+    '他们': [['tā'], ['men']],
+    '他处': [['tā'], ['chǔ']],
+    '他家': [['tā'], ['jiā']],
+    '付与': [['fù'], ['yǔ']],
+    '仙乐': [['xiān'], ['lè']],
+    '仙台': [['xiān'], ['tái']],
+    '仙女': [['xiān'], ['nǚ']],
+    '仙术': [['xiān'], ['shù']],
+    '代为': [['dài'], ['wéi']],
+    '代价': [['dài'], ['jià']],
+    '代号': [['dài'], ['hào']],
+    '代数': [['dài'], ['shù']],
+    '代称': [['dài'], ['chēng']],
+    '代行': [['dài'], ['xíng']],
+    '令亲': [['lìng'], ['qīn']],
+    '令人': [['lìng'], ['rén']],
+    '令兄': [['lìng'], ['xiōng']],
+    '令堂': [['lìng'], ['táng']],
+    '令妹': [['lìng'], ['mèi']],
+    '令媛': [['lìng'], ['yuàn']],
+    '令嫒': [['lìng'], ['ài']],
+    '令尊': [['lìng'], ['zūn']],
+    '令弟': [['lìng'], ['dì']],
+    '令旗': [['lìng'], ['qí']],
+    '令爱': [['lìng'], ['ài']],
+    '令牌': [['lìng'], ['pái']],
+    '令状': [['lìng'], ['zhuàng']],
+    '令狐': [['líng'], ['hú']],
+    '令箭': [['lìng'], ['jiàn']],
+    '令节': [['lìng'], ['jié']],
+    '令誉': [['lìng'], ['yù']],
+    '令郎': [['lìng'], ['láng']],
+    '以上': [['yǐ'], ['shàng']],
+    '以为': [['yǐ'], ['wéi']],
+    '以便': [['yǐ'], ['biàn']],
+    '以内': [['yǐ'], ['nèi']],
+    '以期': [['yǐ'], ['qī']],
+    '以还': [['yǐ'], ['huán']],
+    '仪节': [['yí'], ['jié']],
+    '仰仗': [['yǎng'], ['zhàng']],
+    '仰光': [['yǎng'], ['guāng']],
+    '仰卧': [['yǎng'], ['wò']],
+    '仰天': [['yǎng'], ['tiān']],
+    '仰慕': [['yǎng'], ['mù']],
+    '仰承': [['yǎng'], ['chéng']],
+    '仰望': [['yǎng'], ['wàng']],
+    '仰泳': [['yǎng'], ['yǒng']],
+    '仰给': [['yǎng'], ['jǐ']],
+    '仰视': [['yǎng'], ['shì']],
+    '仰角': [['yǎng'], ['jiǎo']],
+    '仰赖': [['yǎng'], ['lài']],
+    '仰面': [['yǎng'], ['miàn']],
+    '仰首': [['yǎng'], ['shǒu']],
+    '仲家': [['zhòng'], ['jiā']],
+    '仳离': [['pǐ'], ['lí']],
+    '件头': [['jiàn'], ['tóu']],
+    '件数': [['jiàn'], ['shù']],
+    '价值': [['jià'], ['zhí']],
+    '价格': [['jià'], ['gé']],
+    '价目': [['jià'], ['mù']],
+    '价码': [['jià'], ['mǎ']],
+    '价钱': [['jià'], ['qián']],
+    '任丘': [['rén'], ['qiū']],
+    '任从': [['rèn'], ['cóng']],
+    '任何': [['rèn'], ['hé']],
+    '任便': [['rèn'], ['biàn']],
+    '任免': [['rèn'], ['miǎn']],
+    '任内': [['rèn'], ['nèi']],
+    '任凭': [['rèn'], ['píng']],
+    '任务': [['rèn'], ['wù']],
+    '任命': [['rèn'], ['mìng']],
+    '任姓': [['rén'], ['xìng']],
+    '任性': [['rèn'], ['xìng']],
+    '任情': [['rèn'], ['qíng']],
+    '任意': [['rèn'], ['yì']],
+    '任教': [['rèn'], ['jiào']],
+    '任期': [['rèn'], ['qī']],
+    '任用': [['rèn'], ['yòng']],
+    '任职': [['rèn'], ['zhí']],
+    '任脉': [['rèn'], ['mài']],
+    '任课': [['rèn'], ['kè']],
+    '任选': [['rèn'], ['xuǎn']],
+    '任随': [['rèn'], ['suí']],
+    '份儿': [['fèn'], ['ér']],
+    '份地': [['fèn'], ['dì']],
+    '份子': [['fèn'], ['zi']],
+    '份量': [['fèn'], ['liàng']],
+    '份额': [['fèn'], ['é']],
+    '仿佛': [['fǎng'], ['fú']],
+    '仿冒': [['fǎng'], ['mào']],
+    '仿单': [['fǎng'], ['dān']],
+    '仿行': [['fǎng'], ['xíng']],
+    '企划': [['qǐ'], ['huá']],
+    '企待': [['qǐ'], ['dài']],
+    '伊吾': [['yī'], ['wú']],
+    '伎俩': [['jì'], ['liǎng']],
+    '伏地': [['fú'], ['dì']],
+    '伏帖': [['fú'], ['tiē']],
+    '伏瘕': [['fú'], ['jiǎ']],
+    '休业': [['xiū'], ['yè']],
+    '休书': [['xiū'], ['shū']],
+    '休会': [['xiū'], ['huì']],
+    '休假': [['xiū'], ['jià']],
+    '休克': [['xiū'], ['kè']],
+    '休兵': [['xiū'], ['bīng']],
+    '休养': [['xiū'], ['yǎng']],
+    '休刊': [['xiū'], ['kān']],
+    '休学': [['xiū'], ['xué']],
+    '休宁': [['xiū'], ['níng']],
+    '休息': [['xiū'], ['xī']],
+    '休想': [['xiū'], ['xiǎng']],
+    '休憩': [['xiū'], ['qì']],
+    '休战': [['xiū'], ['zhàn']],
+    '休戚': [['xiū'], ['qī']],
+    '休整': [['xiū'], ['zhěng']],
+    '休止': [['xiū'], ['zhǐ']],
+    '休班': [['xiū'], ['bān']],
+    '休眠': [['xiū'], ['mián']],
+    '休耕': [['xiū'], ['gēng']],
+    '休闲': [['xiū'], ['xián']],
+    '众数': [['zhòng'], ['shù']],
+    '众说': [['zhòng'], ['shuō']],
+    '优价': [['yōu'], ['jià']],
+    '优化': [['yōu'], ['huà']],
+    '优待': [['yōu'], ['dài']],
+    '伙同': [['huǒ'], ['tóng']],
+    '伙夫': [['huǒ'], ['fū']],
+    '伙食': [['huǒ'], ['shí']],
+    '会上': [['huì'], ['shàng']],
+    '会众': [['huì'], ['zhòng']],
+    '会儿': [['huì'], ['er']],
+    '会元': [['huì'], ['yuán']],
+    '会党': [['huì'], ['dǎng']],
+    '会典': [['huì'], ['diǎn']],
+    '会刊': [['huì'], ['kān']],
+    '会剿': [['huì'], ['jiǎo']],
+    '会务': [['huì'], ['wù']],
+    '会厌': [['huì'], ['yàn']],
+    '会友': [['huì'], ['yǒu']],
+    '会合': [['huì'], ['hé']],
+    '会同': [['huì'], ['tóng']],
+    '会员': [['huì'], ['yuán']],
+    '会商': [['huì'], ['shāng']],
+    '会场': [['huì'], ['chǎng']],
+    '会址': [['huì'], ['zhǐ']],
+    '会堂': [['huì'], ['táng']],
+    '会宁': [['huì'], ['níng']],
+    '会审': [['huì'], ['shěn']],
+    '会客': [['huì'], ['kè']],
+    '会师': [['huì'], ['shī']],
+    '会徽': [['huì'], ['huī']],
+    '会心': [['huì'], ['xīn']],
+    '会意': [['huì'], ['yì']],
+    '会战': [['huì'], ['zhàn']],
+    '会所': [['huì'], ['suǒ']],
+    '会报': [['huì'], ['bào']],
+    '会操': [['huì'], ['cāo']],
+    '会昌': [['huì'], ['chāng']],
+    '会晤': [['huì'], ['wù']],
+    '会期': [['huì'], ['qī']],
+    '会标': [['huì'], ['biāo']],
+    '会水': [['huì'], ['shuǐ']],
+    '会演': [['huì'], ['yǎn']],
+    '会理': [['huì'], ['lǐ']],
+    '会社': [['huì'], ['shè']],
+    '会章': [['huì'], ['zhāng']],
+    '会签': [['huì'], ['qiān']],
+    '会籍': [['huì'], ['jí']],
+    '会考': [['huì'], ['kǎo']],
+    '会聚': [['huì'], ['jù']],
+    '会见': [['huì'], ['jiàn']],
+    '会计': [['kuài'], ['jì']],
+    '会议': [['huì'], ['yì']],
+    '会诊': [['huì'], ['zhěn']],
+    '会试': [['huì'], ['shì']],
+    '会话': [['huì'], ['huà']],
+    '会谈': [['huì'], ['tán']],
+    '会账': [['huì'], ['zhàng']],
+    '会费': [['huì'], ['fèi']],
+    '会车': [['huì'], ['chē']],
+    '会通': [['huì'], ['tōng']],
+    '会钞': [['huì'], ['chāo']],
+    '会长': [['huì'], ['zhǎng']],
+    '会阴': [['huì'], ['yīn']],
+    '会集': [['huì'], ['jí']],
+    '会面': [['huì'], ['miàn']],
+    '会风': [['huì'], ['fēng']],
+    '会餐': [['huì'], ['cān']],
+    '会馆': [['huì'], ['guǎn']],
+    '会首': [['huì'], ['shǒu']],
+    '会齐': [['huì'], ['qí']],
+    '伛偻': [['yǔ'], ['lǚ']],
+    '伞盖': [['sǎn'], ['gài']],
+    '伟大': [['wěi'], ['dà']],
+    '伟论': [['wěi'], ['lùn']],
+    '传世': [['chuán'], ['shì']],
+    '传习': [['chuán'], ['xí']],
+    '传人': [['chuán'], ['rén']],
+    '传代': [['chuán'], ['dài']],
+    '传令': [['chuán'], ['lìng']],
+    '传入': [['chuán'], ['rù']],
+    '传动': [['chuán'], ['dòng']],
+    '传单': [['chuán'], ['dān']],
+    '传名': [['chuán'], ['míng']],
+    '传告': [['chuán'], ['gào']],
+    '传呼': [['chuán'], ['hū']],
+    '传唤': [['chuán'], ['huàn']],
+    '传唱': [['chuán'], ['chàng']],
+    '传声': [['chuán'], ['shēng']],
+    '传奇': [['chuán'], ['qí']],
+    '传媒': [['chuán'], ['méi']],
+    '传家': [['chuán'], ['jiā']],
+    '传导': [['chuán'], ['dǎo']],
+    '传布': [['chuán'], ['bù']],
+    '传情': [['chuán'], ['qíng']],
+    '传感': [['chuán'], ['gǎn']],
+    '传扬': [['chuán'], ['yáng']],
+    '传承': [['chuán'], ['chéng']],
+    '传抄': [['chuán'], ['chāo']],
+    '传授': [['chuán'], ['shòu']],
+    '传播': [['chuán'], ['bō']],
+    '传教': [['chuán'], ['jiào']],
+    '传旨': [['chuán'], ['zhǐ']],
+    '传本': [['chuán'], ['běn']],
+    '传染': [['chuán'], ['rǎn']],
+    '传热': [['chuán'], ['rè']],
+    '传球': [['chuán'], ['qiú']],
+    '传略': [['zhuàn'], ['lüè']],
+    '传真': [['chuán'], ['zhēn']],
+    '传神': [['chuán'], ['shén']],
+    '传票': [['chuán'], ['piào']],
+    '传种': [['chuán'], ['zhǒng']],
+    '传粉': [['chuán'], ['fěn']],
+    '传经': [['chuán'], ['jīng']],
+    '传统': [['chuán'], ['tǒng']],
+    '传言': [['chuán'], ['yán']],
+    '传讯': [['chuán'], ['xùn']],
+    '传记': [['zhuàn'], ['jì']],
+    '传译': [['chuán'], ['yì']],
+    '传话': [['chuán'], ['huà']],
+    '传说': [['chuán'], ['shuō']],
+    '传诵': [['chuán'], ['sòng']],
+    '传质': [['chuán'], ['zhì']],
+    '传输': [['chuán'], ['shū']],
+    '传达': [['chuán'], ['dá']],
+    '传送': [['chuán'], ['sòng']],
+    '传递': [['chuán'], ['dì']],
+    '传道': [['chuán'], ['dào']],
+    '传问': [['chuán'], ['wèn']],
+    '传闻': [['chuán'], ['wén']],
+    '传阅': [['chuán'], ['yuè']],
+    '传颂': [['chuán'], ['sòng']],
+    '伤亡': [['shāng'], ['wáng']],
+    '伤号': [['shāng'], ['hào']],
+    '伤员': [['shāng'], ['yuán']],
+    '伦敦': [['lún'], ['dūn']],
+    '伧俗': [['cāng'], ['sú']],
+    '伯乐': [['bó'], ['lè']],
+    '伯仲': [['bó'], ['zhòng']],
+    '伯伯': [['bó'], ['bó']],
+    '伯公': [['bó'], ['gōng']],
+    '伯劳': [['bó'], ['láo']],
+    '伯婆': [['bó'], ['pó']],
+    '伯德': [['bó'], ['dé']],
+    '伯母': [['bó'], ['mǔ']],
+    '伯爵': [['bó'], ['jué']],
+    '伯父': [['bó'], ['fù']],
+    '伯祖': [['bó'], ['zǔ']],
+    '估产': [['gū'], ['chǎn']],
+    '估价': [['gū'], ['jià']],
+    '估摸': [['gū'], ['mō']],
+    '估算': [['gū'], ['suàn']],
+    '估衣': [['gù'], ['yī']],
+    '估计': [['gū'], ['jì']],
+    '估量': [['gū'], ['liáng']],
+    '伴同': [['bàn'], ['tóng']],
+    '伴读': [['bàn'], ['dú']],
+    '伴郎': [['bàn'], ['láng']],
+    '伸头': [['shēn'], ['tóu']],
+    '伸曲': [['shēn'], ['qū']],
+    '伸缩': [['shēn'], ['suō']],
+    '伸长': [['shēn'], ['cháng']],
+    '伺侯': [['cì'], ['hòu']],
+    '伺候': [['cì'], ['hòu']],
+    '伺机': [['sì'], ['jī']],
+    '伺隙': [['sì'], ['xì']],
+    '似乎': [['sì'], ['hū']],
+    '似曾': [['sì'], ['céng']],
+    '似的': [['shì'], ['de']],
+    '伽蓝': [['qié'], ['lán']],
+    '伽马': [['gā'], ['mǎ']],
+    '佃农': [['diàn'], ['nóng']],
+    '佃客': [['diàn'], ['kè']],
+    '佃户': [['diàn'], ['hù']],
+    '佃租': [['diàn'], ['zū']],
+    '位能': [['wèi'], ['néng']],
+    '低估': [['dī'], ['gū']],
+    '低凹': [['dī'], ['āo']],
+    '低压': [['dī'], ['yā']],
+    '低哑': [['dī'], ['yǎ']],
+    '低地': [['dī'], ['dì']],
+    '低头': [['dī'], ['tóu']],
+    '低空': [['dī'], ['kōng']],
+    '低能': [['dī'], ['néng']],
+    '低落': [['dī'], ['luò']],
+    '低语': [['dī'], ['yǔ']],
+    '低调': [['dī'], ['diào']],
+    '住地': [['zhù'], ['dì']],
+    '住处': [['zhù'], ['chù']],
+    '住家': [['zhù'], ['jiā']],
+    '住宿': [['zhù'], ['sù']],
+    '住校': [['zhù'], ['xiào']],
+    '住读': [['zhù'], ['dú']],
+    '佑助': [['yòu'], ['zhù']],
+    '体会': [['tǐ'], ['huì']],
+    '体位': [['tǐ'], ['wèi']],
+    '体例': [['tǐ'], ['lì']],
+    '体内': [['tǐ'], ['nèi']],
+    '体制': [['tǐ'], ['zhì']],
+    '体力': [['tǐ'], ['lì']],
+    '体味': [['tǐ'], ['wèi']],
+    '体坛': [['tǐ'], ['tán']],
+    '体型': [['tǐ'], ['xíng']],
+    '体察': [['tǐ'], ['chá']],
+    '体己': [['tī'], ['jǐ']],
+    '体式': [['tǐ'], ['shì']],
+    '体弱': [['tǐ'], ['ruò']],
+    '体形': [['tǐ'], ['xíng']],
+    '体念': [['tǐ'], ['niàn']],
+    '体态': [['tǐ'], ['tài']],
+    '体性': [['tǐ'], ['xìng']],
+    '体恤': [['tǐ'], ['xù']],
+    '体悟': [['tǐ'], ['wù']],
+    '体惜': [['tǐ'], ['xī']],
+    '体操': [['tǐ'], ['cāo']],
+    '体校': [['tǐ'], ['xiào']],
+    '体格': [['tǐ'], ['gé']],
+    '体检': [['tǐ'], ['jiǎn']],
+    '体液': [['tǐ'], ['yè']],
+    '体温': [['tǐ'], ['wēn']],
+    '体现': [['tǐ'], ['xiàn']],
+    '体用': [['tǐ'], ['yòng']],
+    '体癣': [['tǐ'], ['xuǎn']],
+    '体积': [['tǐ'], ['jī']],
+    '体系': [['tǐ'], ['xì']],
+    '体统': [['tǐ'], ['tǒng']],
+    '体罚': [['tǐ'], ['fá']],
+    '体肤': [['tǐ'], ['fū']],
+    '体育': [['tǐ'], ['yù']],
+    '体能': [['tǐ'], ['néng']],
+    '体腔': [['tǐ'], ['qiāng']],
+    '体表': [['tǐ'], ['biǎo']],
+    '体裁': [['tǐ'], ['cái']],
+    '体认': [['tǐ'], ['rèn']],
+    '体谅': [['tǐ'], ['liàng']],
+    '体貌': [['tǐ'], ['mào']],
+    '体质': [['tǐ'], ['zhì']],
+    '体贴': [['tǐ'], ['tiē']],
+    '体重': [['tǐ'], ['zhòng']],
+    '体量': [['tǐ'], ['liàng']],
+    '体面': [['tǐ'], ['miàn']],
+    '体验': [['tǐ'], ['yàn']],
+    '体魄': [['tǐ'], ['pò']],
+    '何不': [['hé'], ['bù']],
+    '何事': [['hé'], ['shì']],
+    '何以': [['hé'], ['yǐ']],
+    '何其': [['hé'], ['qí']],
+    '何况': [['hé'], ['kuàng']],
+    '何在': [['hé'], ['zài']],
+    '何处': [['hé'], ['chǔ']],
+    '何如': [['hé'], ['rú']],
+    '何妨': [['hé'], ['fáng']],
+    '何尝': [['hé'], ['cháng']],
+    '何干': [['hé'], ['gān']],
+    '何必': [['hé'], ['bì']],
+    '何故': [['hé'], ['gù']],
+    '何日': [['hé'], ['rì']],
+    '何时': [['hé'], ['shí']],
+    '何曾': [['hé'], ['zēng']],
+    '何止': [['hé'], ['zhǐ']],
+    '何物': [['hé'], ['wù']],
+    '何用': [['hé'], ['yòng']],
+    '何等': [['hé'], ['děng']],
+    '何者': [['hé'], ['zhě']],
+    '何苦': [['hé'], ['kǔ']],
+    '何许': [['hé'], ['xǔ']],
+    '何谓': [['hé'], ['wèi']],
+    '何须': [['hé'], ['xū']],
+    '余兴': [['yú'], ['xìng']],
+    '余切': [['yú'], ['qiē']],
+    '余地': [['yú'], ['dì']],
+    '余头': [['yú'], ['tóu']],
+    '余数': [['yú'], ['shù']],
+    '余毒': [['yú'], ['dú']],
+    '余角': [['yú'], ['jiǎo']],
+    '余量': [['yú'], ['liàng']],
+    '余风': [['yú'], ['fēng']],
+    '佚失': [['yì'], ['shī']],
+    '佚文': [['yì'], ['wén']],
+    '佛事': [['fó'], ['shì']],
+    '佛会': [['fó'], ['huì']],
+    '佛像': [['fó'], ['xiàng']],
+    '佛光': [['fó'], ['guāng']],
+    '佛典': [['fó'], ['diǎn']],
+    '佛号': [['fó'], ['hào']],
+    '佛堂': [['fó'], ['táng']],
+    '佛塔': [['fó'], ['tǎ']],
+    '佛学': [['fó'], ['xué']],
+    '佛家': [['fó'], ['jiā']],
+    '佛寺': [['fó'], ['sì']],
+    '佛山': [['fó'], ['shān']],
+    '佛性': [['fó'], ['xìng']],
+    '佛手': [['fó'], ['shǒu']],
+    '佛教': [['fó'], ['jiào']],
+    '佛殿': [['fó'], ['diàn']],
+    '佛法': [['fó'], ['fǎ']],
+    '佛爷': [['fó'], ['yé']],
+    '佛牙': [['fó'], ['yá']],
+    '佛珠': [['fó'], ['zhū']],
+    '佛祖': [['fó'], ['zǔ']],
+    '佛经': [['fó'], ['jīng']],
+    '佛门': [['fó'], ['mén']],
+    '佛陀': [['fó'], ['tuó']],
+    '佛龛': [['fó'], ['kān']],
+    '作为': [['zuò'], ['wéi']],
+    '作乐': [['zuò'], ['yuè']],
+    '作价': [['zuò'], ['jià']],
+    '作假': [['zuò'], ['jiǎ']],
+    '作兴': [['zuò'], ['xīng']],
+    '作别': [['zuò'], ['bié']],
+    '作呕': [['zuò'], ['ǒu']],
+    '作坊': [['zuō'], ['fāng']],
+    '作家': [['zuò'], ['jiā']],
+    '作弄': [['zuō'], ['nòng']],
+    '作恶': [['zuò'], ['è']],
+    '作数': [['zuò'], ['shù']],
+    '作曲': [['zuò'], ['qǔ']],
+    '作答': [['zuò'], ['dá']],
+    '作罢': [['zuò'], ['bà']],
+    '作难': [['zuò'], ['nán']],
+    '作风': [['zuò'], ['fēng']],
+    '佝偻': [['gōu'], ['lóu']],
+    '你们': [['nǐ'], ['men']],
+    '你好': [['nǐ'], ['hǎo']],
+    '佣人': [['yōng'], ['rén']],
+    '佣工': [['yōng'], ['gōng']],
+    '佣金': [['yòng'], ['jīn']],
+    '佣钱': [['yòng'], ['qián']],
+    '佩服': [['pèi'], ['fú']],
+    '佯称': [['yáng'], ['chēng']],
+    '佳丽': [['jiā'], ['lì']],
+    '佳句': [['jiā'], ['jù']],
+    '佳期': [['jiā'], ['qī']],
+    '佳节': [['jiā'], ['jié']],
+    '佻薄': [['tiāo'], ['bó']],
+    '使令': [['shǐ'], ['lìng']],
+    '使劲': [['shǐ'], ['jìn']],
+    '使坏': [['shǐ'], ['huài']],
+    '使女': [['shǐ'], ['nǚ']],
+    '使得': [['shǐ'], ['de']],
+    '使节': [['shǐ'], ['jié']],
+    '侄儿': [['zhí'], ['er']],
+    '侄女': [['zhí'], ['nǚ']],
+    '侄子': [['zhí'], ['zi']],
+    '侉子': [['kuǎ'], ['zi']],
+    '例会': [['lì'], ['huì']],
+    '例假': [['lì'], ['jià']],
+    '例句': [['lì'], ['jù']],
+    '例子': [['lì'], ['zi']],
+    '例行': [['lì'], ['xíng']],
+    '侍从': [['shì'], ['cóng']],
+    '侍女': [['shì'], ['nǚ']],
+    '侍弄': [['shì'], ['nòng']],
+    '侍郎': [['shì'], ['láng']],
+    '侗族': [['dòng'], ['zú']],
+    '供事': [['gòng'], ['shì']],
+    '供人': [['gōng'], ['rén']],
+    '供佛': [['gòng'], ['fó']],
+    '供养': [['gòng'], ['yǎng']],
+    '供品': [['gòng'], ['pǐn']],
+    '供奉': [['gòng'], ['fèng']],
+    '供应': [['gōng'], ['yìng']],
+    '供料': [['gōng'], ['liào']],
+    '供暖': [['gòng'], ['nuǎn']],
+    '供果': [['gòng'], ['guǒ']],
+    '供案': [['gòng'], ['àn']],
+    '供桌': [['gòng'], ['zhuō']],
+    '供气': [['gōng'], ['qì']],
+    '供水': [['gōng'], ['shuǐ']],
+    '供求': [['gōng'], ['qiú']],
+    '供状': [['gòng'], ['zhuàng']],
+    '供献': [['gòng'], ['xiàn']],
+    '供电': [['gōng'], ['diàn']],
+    '供称': [['gòng'], ['chēng']],
+    '供稿': [['gòng'], ['gǎo']],
+    '供给': [['gōng'], ['jǐ']],
+    '供职': [['gòng'], ['zhí']],
+    '供认': [['gòng'], ['rèn']],
+    '供词': [['gòng'], ['cí']],
+    '供销': [['gōng'], ['xiāo']],
+    '供需': [['gōng'], ['xū']],
+    '依从': [['yī'], ['cóng']],
+    '依据': [['yī'], ['jù']],
+    '依约': [['yī'], ['yuē']],
+    '侠女': [['xiá'], ['nǚ']],
+    '侠骨': [['xiá'], ['gǔ']],
+    '侥幸': [['jiǎo'], ['xìng']],
+    '侦查': [['zhēn'], ['chá']],
+    '侦缉': [['zhēn'], ['jī']],
+    '侧击': [['cè'], ['jī']],
+    '侧卧': [['cè'], ['wò']],
+    '侧向': [['cè'], ['xiàng']],
+    '侧室': [['cè'], ['shì']],
+    '侧影': [['cè'], ['yǐng']],
+    '侧枝': [['cè'], ['zhī']],
+    '侧柏': [['cè'], ['bǎi']],
+    '侧根': [['cè'], ['gēn']],
+    '侧歪': [['zhāi'], ['wāi']],
+    '侧泳': [['cè'], ['yǒng']],
+    '侧目': [['cè'], ['mù']],
+    '侧翼': [['cè'], ['yì']],
+    '侧耳': [['cè'], ['ěr']],
+    '侧芽': [['cè'], ['yá']],
+    '侧视': [['cè'], ['shì']],
+    '侧记': [['cè'], ['jì']],
+    '侧身': [['cè'], ['shēn']],
+    '侧边': [['cè'], ['biān']],
+    '侧近': [['cè'], ['jìn']],
+    '侧重': [['cè'], ['zhòng']],
+    '侧门': [['cè'], ['mén']],
+    '侧面': [['cè'], ['miàn']],
+    '侨属': [['qiáo'], ['shǔ']],
+    '侯爵': [['hóu'], ['jué']],
+    '侯门': [['hóu'], ['mén']],
+    '侵占': [['qīn'], ['zhàn']],
+    '便中': [['biàn'], ['zhōng']],
+    '便了': [['biàn'], ['liǎo']],
+    '便于': [['biàn'], ['yú']],
+    '便人': [['biàn'], ['rén']],
+    '便佞': [['pián'], ['nìng']],
+    '便函': [['biàn'], ['hán']],
+    '便利': [['biàn'], ['lì']],
+    '便士': [['biàn'], ['shì']],
+    '便壶': [['biàn'], ['hú']],
+    '便嬖': [['pián'], ['bì']],
+    '便安': [['biàn'], ['ān']],
+    '便官': [['biàn'], ['guān']],
+    '便宜': [['pián'], ['yí']],
+    '便宴': [['biàn'], ['yàn']],
+    '便帽': [['biàn'], ['mào']],
+    '便当': [['biàn'], ['dāng']],
+    '便所': [['biàn'], ['suǒ']],
+    '便捷': [['biàn'], ['jié']],
+    '便是': [['biàn'], ['shì']],
+    '便服': [['biàn'], ['fú']],
+    '便条': [['biàn'], ['tiáo']],
+    '便桥': [['biàn'], ['qiáo']],
+    '便桶': [['biàn'], ['tǒng']],
+    '便步': [['biàn'], ['bù']],
+    '便民': [['biàn'], ['mín']],
+    '便池': [['biàn'], ['chí']],
+    '便溺': [['biàn'], ['niào']],
+    '便盆': [['biàn'], ['pén']],
+    '便秘': [['biàn'], ['mì']],
+    '便笺': [['biàn'], ['jiān']],
+    '便签': [['biàn'], ['qiān']],
+    '便血': [['biàn'], ['xuè']],
+    '便衣': [['biàn'], ['yī']],
+    '便装': [['biàn'], ['zhuāng']],
+    '便览': [['biàn'], ['lǎn']],
+    '便路': [['biàn'], ['lù']],
+    '便车': [['biàn'], ['chē']],
+    '便道': [['biàn'], ['dào']],
+    '便门': [['biàn'], ['mén']],
+    '便鞋': [['biàn'], ['xié']],
+    '便餐': [['biàn'], ['cān']],
+    '便饭': [['biàn'], ['fàn']],
+    '俄语': [['é'], ['yǔ']],
+    '俊俏': [['jùn'], ['qiào']],
+    '俏丽': [['qiào'], ['lì']],
+    '俏头': [['qiào'], ['tou']],
+    '俏皮': [['qiào'], ['pí']],
+    '俏脸': [['qiào'], ['liǎn']],
+    '俏货': [['qiào'], ['huò']],
+    '俐落': [['lì'], ['luò']],
+    '俗体': [['sú'], ['tǐ']],
+    '俗家': [['sú'], ['jiā']],
+    '俗曲': [['sú'], ['qǔ']],
+    '俗称': [['sú'], ['chēng']],
+    '俗语': [['sú'], ['yǔ']],
+    '俚曲': [['lǐ'], ['qǔ']],
+    '俚语': [['lǐ'], ['yǔ']],
+    '保价': [['bǎo'], ['jià']],
+    '保单': [['bǎo'], ['dān']],
+    '保底': [['bǎo'], ['dǐ']],
+    '保有': [['bǎo'], ['yǒu']],
+    '保票': [['bǎo'], ['piào']],
+    '保藏': [['bǎo'], ['cáng']],
+    '保重': [['bǎo'], ['zhòng']],
+    '保长': [['bǎo'], ['zhǎng']],
+    '保鲜': [['bǎo'], ['xiān']],
+    '俞允': [['yú'], ['yǔn']],
+    '信义': [['xìn'], ['yì']],
+    '信从': [['xìn'], ['cóng']],
+    '信仰': [['xìn'], ['yǎng']],
+    '信件': [['xìn'], ['jiàn']],
+    '信任': [['xìn'], ['rèn']],
+    '信使': [['xìn'], ['shǐ']],
+    '信函': [['xìn'], ['hán']],
+    '信口': [['xìn'], ['kǒu']],
+    '信史': [['xìn'], ['shǐ']],
+    '信号': [['xìn'], ['hào']],
+    '信士': [['xìn'], ['shì']],
+    '信奉': [['xìn'], ['fèng']],
+    '信女': [['xìn'], ['nǚ']],
+    '信守': [['xìn'], ['shǒu']],
+    '信实': [['xìn'], ['shí']],
+    '信封': [['xìn'], ['fēng']],
+    '信差': [['xìn'], ['chāi']],
+    '信徒': [['xìn'], ['tú']],
+    '信心': [['xìn'], ['xīn']],
+    '信念': [['xìn'], ['niàn']],
+    '信息': [['xìn'], ['xī']],
+    '信手': [['xìn'], ['shǒu']],
+    '信托': [['xìn'], ['tuō']],
+    '信据': [['xìn'], ['jù']],
+    '信教': [['xìn'], ['jiào']],
+    '信服': [['xìn'], ['fú']],
+    '信札': [['xìn'], ['zhá']],
+    '信条': [['xìn'], ['tiáo']],
+    '信标': [['xìn'], ['biāo']],
+    '信步': [['xìn'], ['bù']],
+    '信汇': [['xìn'], ['huì']],
+    '信物': [['xìn'], ['wù']],
+    '信用': [['xìn'], ['yòng']],
+    '信石': [['xìn'], ['shí']],
+    '信笔': [['xìn'], ['bǐ']],
+    '信笺': [['xìn'], ['jiān']],
+    '信筒': [['xìn'], ['tǒng']],
+    '信箱': [['xìn'], ['xiāng']],
+    '信纸': [['xìn'], ['zhǐ']],
+    '信誉': [['xìn'], ['yù']],
+    '信访': [['xìn'], ['fǎng']],
+    '信贷': [['xìn'], ['dài']],
+    '信赖': [['xìn'], ['lài']],
+    '信道': [['xìn'], ['dào']],
+    '信邪': [['xìn'], ['xié']],
+    '信风': [['xìn'], ['fēng']],
+    '信鸽': [['xìn'], ['gē']],
+    '俩人': [['liǎ'], ['rén']],
+    '俭朴': [['jiǎn'], ['pǔ']],
+    '俭省': [['jiǎn'], ['shěng']],
+    '俭约': [['jiǎn'], ['yuē']],
+    '修女': [['xiū'], ['nǚ']],
+    '修好': [['xiū'], ['hǎo']],
+    '修枝': [['xiū'], ['zhī']],
+    '修正': [['xiū'], ['zhèng']],
+    '修盖': [['xiū'], ['gài']],
+    '修筑': [['xiū'], ['zhù']],
+    '修行': [['xiū'], ['xíng']],
+    '修长': [['xiū'], ['cháng']],
+    '俯仰': [['fǔ'], ['yǎng']],
+    '俯冲': [['fǔ'], ['chōng']],
+    '俯角': [['fǔ'], ['jiǎo']],
+    '俳句': [['pái'], ['jù']],
+    '俺们': [['ǎn'], ['men']],
+    '俺家': [['ǎn'], ['jiā']],
+    '倍数': [['bèi'], ['shù']],
+    '倍率': [['bèi'], ['lǜ']],
+    '倍频': [['bèi'], ['pín']],
+    '倏地': [['shū'], ['dì']],
+    '倒下': [['dǎo'], ['xià']],
+    '倒不': [['dào'], ['bù']],
+    '倒也': [['dào'], ['yě']],
+    '倒产': [['dào'], ['chǎn']],
+    '倒仓': [['dǎo'], ['cāng']],
+    '倒伏': [['dǎo'], ['fú']],
+    '倒休': [['dǎo'], ['xiū']],
+    '倒像': [['dào'], ['xiàng']],
+    '倒出': [['dào'], ['chū']],
+    '倒刺': [['dào'], ['cì']],
+    '倒剪': [['dào'], ['jiǎn']],
+    '倒包': [['dǎo'], ['bāo']],
+    '倒卖': [['dǎo'], ['mài']],
+    '倒卷': [['dào'], ['juǎn']],
+    '倒反': [['dǎo'], ['fǎn']],
+    '倒叙': [['dào'], ['xù']],
+    '倒台': [['dǎo'], ['tái']],
+    '倒吊': [['dào'], ['diào']],
+    '倒向': [['dào'], ['xiàng']],
+    '倒嗓': [['dǎo'], ['sǎng']],
+    '倒嚼': [['dǎo'], ['jiào']],
+    '倒圈': [['dǎo'], ['juàn']],
+    '倒地': [['dǎo'], ['dì']],
+    '倒坍': [['dǎo'], ['tān']],
+    '倒垂': [['dǎo'], ['chuí']],
+    '倒塌': [['dǎo'], ['tā']],
+    '倒头': [['dǎo'], ['tóu']],
+    '倒好': [['dào'], ['hǎo']],
+    '倒带': [['dào'], ['dài']],
+    '倒序': [['dǎo'], ['xù']],
+    '倒座': [['dǎo'], ['zuò']],
+    '倒弄': [['dǎo'], ['nòng']],
+    '倒彩': [['dào'], ['cǎi']],
+    '倒影': [['dào'], ['yǐng']],
+    '倒悬': [['dào'], ['xuán']],
+    '倒戈': [['dǎo'], ['gē']],
+    '倒手': [['dǎo'], ['shǒu']],
+    '倒找': [['dǎo'], ['zhǎo']],
+    '倒把': [['dǎo'], ['bǎ']],
+    '倒挂': [['dào'], ['guà']],
+    '倒换': [['dǎo'], ['huàn']],
+    '倒接': [['dào'], ['jiē']],
+    '倒插': [['dào'], ['chā']],
+    '倒放': [['dào'], ['fàng']],
+    '倒数': [['dào'], ['shǔ']],
+    '倒映': [['dào'], ['yìng']],
+    '倒是': [['dǎo'], ['shì']],
+    '倒替': [['dǎo'], ['tì']],
+    '倒板': [['dǎo'], ['bǎn']],
+    '倒档': [['dào'], ['dàng']],
+    '倒欠': [['dào'], ['qiàn']],
+    '倒毙': [['dǎo'], ['bì']],
+    '倒水': [['dào'], ['shuǐ']],
+    '倒流': [['dào'], ['liú']],
+    '倒灌': [['dào'], ['guàn']],
+    '倒灶': [['dǎo'], ['zào']],
+    '倒爷': [['dǎo'], ['yé']],
+    '倒片': [['dào'], ['piàn']],
+    '倒牙': [['dǎo'], ['yá']],
+    '倒班': [['dǎo'], ['bān']],
+    '倒睫': [['dào'], ['jié']],
+    '倒空': [['dào'], ['kōng']],
+    '倒立': [['dào'], ['lì']],
+    '倒算': [['dǎo'], ['suàn']],
+    '倒粪': [['dào'], ['fèn']],
+    '倒置': [['dào'], ['zhì']],
+    '倒腾': [['dǎo'], ['téng']],
+    '倒茬': [['dǎo'], ['chá']],
+    '倒茶': [['dào'], ['chá']],
+    '倒装': [['dào'], ['zhuāng']],
+    '倒许': [['dào'], ['xǔ']],
+    '倒账': [['dǎo'], ['zhàng']],
+    '倒贴': [['dào'], ['tiē']],
+    '倒赔': [['dào'], ['péi']],
+    '倒车': [['dào'], ['chē']],
+    '倒转': [['dào'], ['zhuǎn']],
+    '倒运': [['dǎo'], ['yùn']],
+    '倒退': [['dào'], ['tuì']],
+    '倒酒': [['dào'], ['jiǔ']],
+    '倒锁': [['dào'], ['suǒ']],
+    '倒错': [['dǎo'], ['cuò']],
+    '倒闭': [['dǎo'], ['bì']],
+    '倒阁': [['dǎo'], ['gé']],
+    '倒霉': [['dǎo'], ['méi']],
+    '倒风': [['dào'], ['fēng']],
+    '倒飞': [['dào'], ['fēi']],
+    '倔強': [['jué'], ['jiàng']],
+    '倔强': [['jué'], ['jiàng']],
+    '倔犟': [['juè'], ['jiàng']],
+    '倘佯': [['cháng'], ['yáng']],
+    '倘使': [['tǎng'], ['shǐ']],
+    '倘或': [['tǎng'], ['huò']],
+    '倘然': [['tǎng'], ['rán']],
+    '倘若': [['tǎng'], ['ruò']],
+    '候场': [['hòu'], ['chǎng']],
+    '候教': [['hòu'], ['jiào']],
+    '候车': [['hòu'], ['chē']],
+    '倚重': [['yǐ'], ['zhòng']],
+    '借助': [['jiè'], ['zhù']],
+    '借宿': [['jiè'], ['sù']],
+    '借据': [['jiè'], ['jù']],
+    '借读': [['jiè'], ['dú']],
+    '借调': [['jiè'], ['diào']],
+    '借重': [['jiè'], ['zhòng']],
+    '倡优': [['chàng'], ['yōu']],
+    '倡导': [['chàng'], ['dǎo']],
+    '倡言': [['chàng'], ['yán']],
+    '倡议': [['chàng'], ['yì']],
+    '倥侗': [['kōng'], ['tóng']],
+    '倭寇': [['wō'], ['kòu']],
+    '倭瓜': [['wō'], ['guā']],
+    '债券': [['zhài'], ['quàn']],
+    '值当': [['zhí'], ['dàng']],
+    '值得': [['zhí'], ['de']],
+    '倾侧': [['qīng'], ['cè']],
+    '倾倒': [['qīng'], ['dǎo']],
+    '倾吐': [['qīng'], ['tǔ']],
+    '倾囊': [['qīng'], ['náng']],
+    '倾家': [['qīng'], ['jiā']],
+    '倾泄': [['qīng'], ['xiè']],
+    '倾盖': [['qīng'], ['gài']],
+    '倾角': [['qīng'], ['jiǎo']],
+    '假日': [['jià'], ['rì']],
+    '假期': [['jià'], ['qī']],
+    '假条': [['jià'], ['tiáo']],
+    '假植': [['jiǎ'], ['zhí']],
+    '假言': [['jiǎ'], ['yán']],
+    '假话': [['jiǎ'], ['huà']],
+    '假道': [['jiǎ'], ['dào']],
+    '假面': [['jiǎ'], ['miàn']],
+    '假髻': [['jiǎ'], ['jì']],
+    '偈语': [['jì'], ['yǔ']],
+    '偌大': [['ruò'], ['dà']],
+    '偏信': [['piān'], ['xìn']],
+    '偏好': [['piān'], ['hǎo']],
+    '偏差': [['piān'], ['chā']],
+    '偏裨': [['piān'], ['pí']],
+    '偏要': [['piān'], ['yào']],
+    '偏重': [['piān'], ['zhòng']],
+    '偏食': [['piān'], ['shí']],
+    '偕行': [['xié'], ['xíng']],
+    '做亲': [['zuò'], ['qīn']],
+    '做假': [['zuò'], ['jiǎ']],
+    '停当': [['tíng'], ['dàng']],
+    '停泊': [['tíng'], ['bó']],
+    '停车': [['tíng'], ['chē']],
+    '停食': [['tíng'], ['shí']],
+    '健将': [['jiàn'], ['jiàng']],
+    '偶发': [['ǒu'], ['fā']],
+    '偶合': [['ǒu'], ['hé']],
+    '偷空': [['tōu'], ['kòng']],
+    '偿还': [['cháng'], ['huán']],
+    '傀儡': [['kuǐ'], ['lěi']],
+    '傧相': [['bīn'], ['xiàng']],
+    '储藏': [['chǔ'], ['cáng']],
+    '储量': [['chǔ'], ['liàng']],
+    '催化': [['cuī'], ['huà']],
+    '催发': [['cuī'], ['fā']],
+    '催迫': [['cuī'], ['pò']],
+    '傲骨': [['ào'], ['gǔ']],
+    '傻乐': [['shǎ'], ['lè']],
+    '像片': [['xiàng'], ['piàn']],
+    '僚属': [['liáo'], ['shǔ']],
+    '僬侥': [['jiāo'], ['yáo']],
+    '僮仆': [['tóng'], ['pú']],
+    '僵化': [['jiāng'], ['huà']],
+    '僻巷': [['pì'], ['xiàng']],
+    '儒家': [['rú'], ['jiā']],
+    '儒将': [['rú'], ['jiàng']],
+    '儒教': [['rú'], ['jiào']],
+    '儒术': [['rú'], ['shù']],
+    '儿化': [['ér'], ['huà']],
+    '儿女': [['ér'], ['nǚ']],
+    '儿子': [['ér'], ['zi']],
+    '儿孙': [['ér'], ['sūn']],
+    '儿戏': [['ér'], ['xì']],
+    '儿郎': [['ér'], ['láng']],
+    '兀秃': [['wū'], ['tū']],
+    '允当': [['yǔn'], ['dàng']],
+    '允许': [['yǔn'], ['xǔ']],
+    '元曲': [['yuán'], ['qǔ']],
+    '元朝': [['yuán'], ['cháo']],
+    '兄弟': [['xiōng'], ['dì']],
+    '兄长': [['xiōng'], ['zhǎng']],
+    '充任': [['chōng'], ['rèn']],
+    '充分': [['chōng'], ['fèn']],
+    '充塞': [['chōng'], ['sè']],
+    '充填': [['chōng'], ['tián']],
+    '充当': [['chōng'], ['dāng']],
+    '充数': [['chōng'], ['shù']],
+    '充血': [['chōng'], ['xuè']],
+    '兆头': [['zhào'], ['tou']],
+    '先令': [['xiān'], ['lìng']],
+    '先夫': [['xiān'], ['fū']],
+    '先头': [['xiān'], ['tóu']],
+    '先期': [['xiān'], ['qī']],
+    '先父': [['xiān'], ['fù']],
+    '先王': [['xiān'], ['wáng']],
+    '先知': [['xiān'], ['zhī']],
+    '先行': [['xiān'], ['xíng']],
+    '先见': [['xiān'], ['jiàn']],
+    '先觉': [['xiān'], ['jué']],
+    '光化': [['guāng'], ['huà']],
+    '光华': [['guāng'], ['huá']],
+    '光压': [['guāng'], ['yā']],
+    '光圈': [['guāng'], ['quān']],
+    '光大': [['guāng'], ['dà']],
+    '光头': [['guāng'], ['tóu']],
+    '光度': [['guāng'], ['dù']],
+    '光晕': [['guāng'], ['yùn']],
+    '光景': [['guāng'], ['jǐng']],
+    '光杆': [['guāng'], ['gǎn']],
+    '光栅': [['guāng'], ['shān']],
+    '光棍': [['guāng'], ['gùn']],
+    '光泽': [['guāng'], ['zé']],
+    '光溜': [['guāng'], ['liū']],
+    '光纤': [['guāng'], ['xiān']],
+    '光能': [['guāng'], ['néng']],
+    '光解': [['guāng'], ['jiě']],
+    '光鲜': [['guāng'], ['xiān']],
+    '克拉': [['kè'], ['lā']],
+    '克服': [['kè'], ['fú']],
+    '克期': [['kè'], ['qī']],
+    '克食': [['kè'], ['shí']],
+    '免冠': [['miǎn'], ['guān']],
+    '免得': [['miǎn'], ['de']],
+    '免服': [['wèn'], ['fú']],
+    '免票': [['miǎn'], ['piào']],
+    '免袒': [['wèn'], ['tǎn']],
+    '免麻': [['wèn'], ['má']],
+    '兑付': [['duì'], ['fù']],
+    '兑奖': [['duì'], ['jiǎng']],
+    '兑换': [['duì'], ['huàn']],
+    '兑款': [['duì'], ['kuǎn']],
+    '兑现': [['duì'], ['xiàn']],
+    '兔子': [['tù'], ['zi']],
+    '党参': [['dǎng'], ['shēn']],
+    '党员': [['dǎng'], ['yuán']],
+    '党委': [['dǎng'], ['wěi']],
+    '党校': [['dǎng'], ['xiào']],
+    '党棍': [['dǎng'], ['gùn']],
+    '党票': [['dǎng'], ['piào']],
+    '党禁': [['dǎng'], ['jìn']],
+    '党纪': [['dǎng'], ['jì']],
+    '兜肚': [['dōu'], ['dù']],
+    '入会': [['rù'], ['huì']],
+    '入内': [['rù'], ['nèi']],
+    '入场': [['rù'], ['chǎng']],
+    '入射': [['rù'], ['shè']],
+    '入戏': [['rù'], ['xì']],
+    '入港': [['rù'], ['gǎng']],
+    '入行': [['rù'], ['háng']],
+    '入邪': [['rù'], ['xié']],
+    '入骨': [['rù'], ['gǔ']],
+    '全价': [['quán'], ['jià']],
+    '全份': [['quán'], ['fèn']],
+    '全休': [['quán'], ['xiū']],
+    '全会': [['quán'], ['huì']],
+    '全体': [['quán'], ['tǐ']],
+    '全副': [['quán'], ['fù']],
+    '全员': [['quán'], ['yuán']],
+    '全场': [['quán'], ['chǎng']],
+    '全家': [['quán'], ['jiā']],
+    '全数': [['quán'], ['shù']],
+    '全景': [['quán'], ['jǐng']],
+    '全校': [['quán'], ['xiào']],
+    '全盛': [['quán'], ['shèng']],
+    '全票': [['quán'], ['piào']],
+    '全称': [['quán'], ['chēng']],
+    '全能': [['quán'], ['néng']],
+    '全都': [['quán'], ['dōu']],
+    '全食': [['quán'], ['shí']],
+    '八节': [['bā'], ['jié']],
+    '八角': [['bā'], ['jiǎo']],
+    '八邪': [['bā'], ['xié']],
+    '八风': [['bā'], ['fēng']],
+    '公了': [['gōng'], ['le']],
+    '公仆': [['gōng'], ['pú']],
+    '公休': [['gōng'], ['xiū']],
+    '公会': [['gōng'], ['huì']],
+    '公侯': [['gōng'], ['hóu']],
+    '公假': [['gōng'], ['jià']],
+    '公共': [['gōng'], ['gòng']],
+    '公分': [['gōng'], ['fēn']],
+    '公助': [['gōng'], ['zhù']],
+    '公地': [['gōng'], ['dì']],
+    '公家': [['gōng'], ['jiā']],
+    '公尺': [['gōng'], ['chǐ']],
+    '公差': [['gōng'], ['chāi']],
+    '公帑': [['gōng'], ['tǎng']],
+    '公干': [['gōng'], ['gàn']],
+    '公担': [['gōng'], ['dān']],
+    '公有': [['gōng'], ['yǒu']],
+    '公正': [['gōng'], ['zhèng']],
+    '公猫': [['gōng'], ['māo']],
+    '公畜': [['gōng'], ['chù']],
+    '公祭': [['gōng'], ['jì']],
+    '公称': [['gōng'], ['chēng']],
+    '公约': [['gōng'], ['yuē']],
+    '公论': [['gōng'], ['lùn']],
+    '公车': [['gōng'], ['chē']],
+    '公转': [['gōng'], ['zhuàn']],
+    '六一': [['liù'], ['yī']],
+    '六世': [['liù'], ['shì']],
+    '六书': [['liù'], ['shū']],
+    '六亲': [['liù'], ['qīn']],
+    '六号': [['liù'], ['hào']],
+    '六合': [['liù'], ['hé']],
+    '六大': [['liù'], ['dà']],
+    '六安': [['lù'], ['ān']],
+    '六师': [['liù'], ['shī']],
+    '六指': [['liù'], ['zhǐ']],
+    '六月': [['liù'], ['yuè']],
+    '六朝': [['liù'], ['cháo']],
+    '六根': [['liù'], ['gēn']],
+    '六欲': [['liù'], ['yù']],
+    '六甲': [['liù'], ['jiǎ']],
+    '六畜': [['liù'], ['chù']],
+    '六礼': [['liù'], ['lǐ']],
+    '六祖': [['liù'], ['zǔ']],
+    '六神': [['liù'], ['shén']],
+    '六经': [['liù'], ['jīng']],
+    '六腑': [['liù'], ['fǔ']],
+    '六艺': [['liù'], ['yì']],
+    '六角': [['liù'], ['jiǎo']],
+    '兰若': [['lán'], ['rě']],
+    '共事': [['gòng'], ['shì']],
+    '共享': [['gòng'], ['xiǎng']],
+    '共价': [['gòng'], ['jià']],
+    '共勉': [['gòng'], ['miǎn']],
+    '共同': [['gòng'], ['tóng']],
+    '共和': [['gòng'], ['hé']],
+    '共处': [['gòng'], ['chǔ']],
+    '共存': [['gòng'], ['cún']],
+    '共居': [['gòng'], ['jū']],
+    '共度': [['gòng'], ['dù']],
+    '共性': [['gòng'], ['xìng']],
+    '共总': [['gòng'], ['zǒng']],
+    '共振': [['gòng'], ['zhèn']],
+    '共有': [['gòng'], ['yǒu']],
+    '共栖': [['gòng'], ['qī']],
+    '共济': [['gòng'], ['jì']],
+    '共犯': [['gòng'], ['fàn']],
+    '共生': [['gòng'], ['shēng']],
+    '共用': [['gòng'], ['yòng']],
+    '共相': [['gòng'], ['xiāng']],
+    '共管': [['gòng'], ['guǎn']],
+    '共线': [['gòng'], ['xiàn']],
+    '共聚': [['gòng'], ['jù']],
+    '共计': [['gòng'], ['jì']],
+    '共议': [['gòng'], ['yì']],
+    '共识': [['gòng'], ['shí']],
+    '共话': [['gòng'], ['huà']],
+    '共谋': [['gòng'], ['móu']],
+    '共通': [['gòng'], ['tōng']],
+    '共餐': [['gòng'], ['cān']],
+    '共鸣': [['gòng'], ['míng']],
+    '关上': [['guān'], ['shàng']],
+    '关中': [['guān'], ['zhōng']],
+    '关内': [['guān'], ['nèi']],
+    '关切': [['guān'], ['qiè']],
+    '关卡': [['guān'], ['qiǎ']],
+    '关塞': [['guān'], ['sài']],
+    '关头': [['guān'], ['tóu']],
+    '关系': [['guān'], ['xì']],
+    '关节': [['guān'], ['jié']],
+    '兴业': [['xīng'], ['yè']],
+    '兴义': [['xīng'], ['yì']],
+    '兴亡': [['xīng'], ['wáng']],
+    '兴会': [['xìng'], ['huì']],
+    '兴修': [['xīng'], ['xiū']],
+    '兴兵': [['xīng'], ['bīng']],
+    '兴办': [['xīng'], ['bàn']],
+    '兴化': [['xīng'], ['huà']],
+    '兴叹': [['xīng'], ['tàn']],
+    '兴味': [['xìng'], ['wèi']],
+    '兴国': [['xīng'], ['guó']],
+    '兴城': [['xīng'], ['chéng']],
+    '兴头': [['xìng'], ['tou']],
+    '兴奋': [['xīng'], ['fèn']],
+    '兴学': [['xīng'], ['xué']],
+    '兴安': [['xīng'], ['ān']],
+    '兴工': [['xīng'], ['gōng']],
+    '兴师': [['xīng'], ['shī']],
+    '兴平': [['xīng'], ['píng']],
+    '兴废': [['xīng'], ['fèi']],
+    '兴建': [['xīng'], ['jiàn']],
+    '兴文': [['xīng'], ['wén']],
+    '兴旺': [['xīng'], ['wàng']],
+    '兴替': [['xīng'], ['tì']],
+    '兴盛': [['xīng'], ['shèng']],
+    '兴筑': [['xīng'], ['zhù']],
+    '兴致': [['xìng'], ['zhì']],
+    '兴衰': [['xīng'], ['shuāi']],
+    '兴许': [['xīng'], ['xǔ']],
+    '兴起': [['xīng'], ['qǐ']],
+    '兴趣': [['xìng'], ['qù']],
+    '兴邦': [['xīng'], ['bāng']],
+    '兴隆': [['xīng'], ['lóng']],
+    '兴革': [['xīng'], ['gé']],
+    '兵丁': [['bīng'], ['dīng']],
+    '兵卒': [['bīng'], ['zú']],
+    '兵员': [['bīng'], ['yuán']],
+    '兵家': [['bīng'], ['jiā']],
+    '兵差': [['bīng'], ['chāi']],
+    '兵种': [['bīng'], ['zhǒng']],
+    '兵车': [['bīng'], ['chē']],
+    '其中': [['qí'], ['zhōng']],
+    '其他': [['qí'], ['tā']],
+    '其余': [['qí'], ['yú']],
+    '其先': [['qí'], ['xiān']],
+    '其内': [['qí'], ['nèi']],
+    '其后': [['qí'], ['hòu']],
+    '其它': [['qí'], ['tā']],
+    '其实': [['qí'], ['shí']],
+    '其时': [['qí'], ['shí']],
+    '其次': [['qí'], ['cì']],
+    '其间': [['qí'], ['jiān']],
+    '具体': [['jù'], ['tǐ']],
+    '具有': [['jù'], ['yǒu']],
+    '具结': [['jù'], ['jié']],
+    '典当': [['diǎn'], ['dàng']],
+    '养分': [['yǎng'], ['fèn']],
+    '养女': [['yǎng'], ['nǚ']],
+    '养家': [['yǎng'], ['jiā']],
+    '养殖': [['yǎng'], ['zhí']],
+    '养父': [['yǎng'], ['fù']],
+    '养畜': [['yǎng'], ['chù']],
+    '兼任': [['jiān'], ['rèn']],
+    '兼差': [['jiān'], ['chāi']],
+    '兼并': [['jiān'], ['bìng']],
+    '内中': [['nèi'], ['zhōng']],
+    '内乡': [['nèi'], ['xiāng']],
+    '内乱': [['nèi'], ['luàn']],
+    '内争': [['nèi'], ['zhēng']],
+    '内亲': [['nèi'], ['qīn']],
+    '内人': [['nèi'], ['rén']],
+    '内传': [['nèi'], ['zhuàn']],
+    '内伤': [['nèi'], ['shāng']],
+    '内侄': [['nèi'], ['zhí']],
+    '内侍': [['nèi'], ['shì']],
+    '内侵': [['nèi'], ['qīn']],
+    '内债': [['nèi'], ['zhài']],
+    '内倾': [['nèi'], ['qīng']],
+    '内兄': [['nèi'], ['xiōng']],
+    '内关': [['nèi'], ['guān']],
+    '内力': [['nèi'], ['lì']],
+    '内功': [['nèi'], ['gōng']],
+    '内务': [['nèi'], ['wù']],
+    '内助': [['nèi'], ['zhù']],
+    '内勤': [['nèi'], ['qín']],
+    '内化': [['nèi'], ['huà']],
+    '内参': [['nèi'], ['cān']],
+    '内向': [['nèi'], ['xiàng']],
+    '内含': [['nèi'], ['hán']],
+    '内因': [['nèi'], ['yīn']],
+    '内在': [['nèi'], ['zài']],
+    '内地': [['nèi'], ['dì']],
+    '内外': [['nèi'], ['wài']],
+    '内奸': [['nèi'], ['jiān']],
+    '内子': [['nèi'], ['zǐ']],
+    '内宅': [['nèi'], ['zhái']],
+    '内定': [['nèi'], ['dìng']],
+    '内室': [['nèi'], ['shì']],
+    '内容': [['nèi'], ['róng']],
+    '内宾': [['nèi'], ['bīn']],
+    '内层': [['nèi'], ['céng']],
+    '内屋': [['nèi'], ['wū']],
+    '内幕': [['nèi'], ['mù']],
+    '内应': [['nèi'], ['yìng']],
+    '内府': [['nèi'], ['fǔ']],
+    '内庭': [['nèi'], ['tíng']],
+    '内廷': [['nèi'], ['tíng']],
+    '内弟': [['nèi'], ['dì']],
+    '内径': [['nèi'], ['jìng']],
+    '内心': [['nèi'], ['xīn']],
+    '内忧': [['nèi'], ['yōu']],
+    '内急': [['nèi'], ['jí']],
+    '内情': [['nèi'], ['qíng']],
+    '内战': [['nèi'], ['zhàn']],
+    '内政': [['nèi'], ['zhèng']],
+    '内景': [['nèi'], ['jǐng']],
+    '内服': [['nèi'], ['fú']],
+    '内核': [['nèi'], ['hé']],
+    '内河': [['nèi'], ['hé']],
+    '内海': [['nèi'], ['hǎi']],
+    '内涝': [['nèi'], ['lào']],
+    '内涵': [['nèi'], ['hán']],
+    '内港': [['nèi'], ['gǎng']],
+    '内热': [['nèi'], ['rè']],
+    '内焰': [['nèi'], ['yàn']],
+    '内犯': [['nèi'], ['fàn']],
+    '内瓤': [['nèi'], ['ráng']],
+    '内疚': [['nèi'], ['jiù']],
+    '内痔': [['nèi'], ['zhì']],
+    '内省': [['nèi'], ['xǐng']],
+    '内眷': [['nèi'], ['juàn']],
+    '内秀': [['nèi'], ['xiù']],
+    '内科': [['nèi'], ['kē']],
+    '内线': [['nèi'], ['xiàn']],
+    '内耗': [['nèi'], ['hào']],
+    '内耳': [['nèi'], ['ěr']],
+    '内胎': [['nèi'], ['tāi']],
+    '内脏': [['nèi'], ['zàng']],
+    '内臣': [['nèi'], ['chén']],
+    '内蕴': [['nèi'], ['yùn']],
+    '内藏': [['nèi'], ['cáng']],
+    '内行': [['nèi'], ['háng']],
+    '内衣': [['nèi'], ['yī']],
+    '内讧': [['nèi'], ['hòng']],
+    '内详': [['nèi'], ['xiáng']],
+    '内贸': [['nèi'], ['mào']],
+    '内资': [['nèi'], ['zī']],
+    '内迁': [['nèi'], ['qiān']],
+    '内道': [['nèi'], ['dào']],
+    '内部': [['nèi'], ['bù']],
+    '内里': [['nèi'], ['lǐ']],
+    '内销': [['nèi'], ['xiāo']],
+    '内阁': [['nèi'], ['gé']],
+    '内陆': [['nèi'], ['lù']],
+    '内院': [['nèi'], ['yuàn']],
+    '内陷': [['nèi'], ['xiàn']],
+    '内障': [['nèi'], ['zhàng']],
+    '内难': [['nèi'], ['nán']],
+    '内面': [['nèi'], ['miàn']],
+    '册子': [['cè'], ['zi']],
+    '再不': [['zài'], ['bù']],
+    '再会': [['zài'], ['huì']],
+    '再分': [['zài'], ['fēn']],
+    '再度': [['zài'], ['dù']],
+    '再行': [['zài'], ['xíng']],
+    '再见': [['zài'], ['jiàn']],
+    '再说': [['zài'], ['shuō']],
+    '冒充': [['mào'], ['chōng']],
+    '冒功': [['mào'], ['gōng']],
+    '冒号': [['mào'], ['hào']],
+    '冒名': [['mào'], ['míng']],
+    '冒失': [['mào'], ['shī']],
+    '冒头': [['mào'], ['tóu']],
+    '冒尖': [['mào'], ['jiān']],
+    '冒昧': [['mào'], ['mèi']],
+    '冒死': [['mào'], ['sǐ']],
+    '冒渎': [['mào'], ['dú']],
+    '冒火': [['mào'], ['huǒ']],
+    '冒烟': [['mào'], ['yān']],
+    '冒牌': [['mào'], ['pái']],
+    '冒犯': [['mào'], ['fàn']],
+    '冒着': [['mào'], ['zhe']],
+    '冒进': [['mào'], ['jìn']],
+    '冒险': [['mào'], ['xiǎn']],
+    '冒雨': [['mào'], ['yǔ']],
+    '冒顶': [['mào'], ['dǐng']],
+    '冒顿': [['mò'], ['dú']],
+    '冒领': [['mào'], ['lǐng']],
+    '冗员': [['rǒng'], ['yuán']],
+    '冗繁': [['rǒng'], ['fán']],
+    '冗长': [['rǒng'], ['cháng']],
+    '写信': [['xiě'], ['xìn']],
+    '写家': [['xiě'], ['jiā']],
+    '写景': [['xiě'], ['jǐng']],
+    '军乐': [['jūn'], ['yuè']],
+    '军令': [['jūn'], ['lìng']],
+    '军区': [['jūn'], ['qū']],
+    '军号': [['jūn'], ['hào']],
+    '军委': [['jūn'], ['wěi']],
+    '军属': [['jūn'], ['shǔ']],
+    '军帖': [['jūn'], ['tiě']],
+    '军服': [['jūn'], ['fú']],
+    '军校': [['jūn'], ['xiào']],
+    '军港': [['jūn'], ['gǎng']],
+    '军种': [['jūn'], ['zhǒng']],
+    '军纪': [['jūn'], ['jì']],
+    '军车': [['jūn'], ['chē']],
+    '军长': [['jūn'], ['zhǎng']],
+    '农会': [['nóng'], ['huì']],
+    '农场': [['nóng'], ['chǎng']],
+    '农夫': [['nóng'], ['fū']],
+    '农家': [['nóng'], ['jiā']],
+    '农校': [['nóng'], ['xiào']],
+    '农畜': [['nóng'], ['chù']],
+    '农舍': [['nóng'], ['shè']],
+    '农行': [['nóng'], ['háng']],
+    '冠冕': [['guān'], ['miǎn']],
+    '冠军': [['guàn'], ['jūn']],
+    '冠子': [['guàn'], ['zi']],
+    '冠玉': [['guān'], ['yù']],
+    '冠盖': [['guān'], ['gài']],
+    '冠礼': [['guàn'], ['lǐ']],
+    '冤仇': [['yuān'], ['chóu']],
+    '冤头': [['yuān'], ['tóu']],
+    '冤家': [['yuān'], ['jiā']],
+    '冥思': [['míng'], ['sī']],
+    '冬令': [['dōng'], ['lìng']],
+    '冬节': [['dōng'], ['jié']],
+    '冬藏': [['dōng'], ['cáng']],
+    '冯河': [['píng'], ['hé']],
+    '冰凉': [['bīng'], ['liáng']],
+    '冰场': [['bīng'], ['chǎng']],
+    '冰排': [['bīng'], ['pái']],
+    '冰斗': [['bīng'], ['dǒu']],
+    '冰期': [['bīng'], ['qī']],
+    '冰棍': [['bīng'], ['gùn']],
+    '冰溜': [['bīng'], ['liū']],
+    '冰片': [['bīng'], ['piàn']],
+    '冲克': [['chōng'], ['kè']],
+    '冲冲': [['chōng'], ['chōng']],
+    '冲决': [['chōng'], ['jué']],
+    '冲凉': [['chōng'], ['liáng']],
+    '冲击': [['chōng'], ['jī']],
+    '冲刷': [['chōng'], ['shuā']],
+    '冲刺': [['chōng'], ['cì']],
+    '冲剂': [['chōng'], ['jì']],
+    '冲力': [['chōng'], ['lì']],
+    '冲动': [['chōng'], ['dòng']],
+    '冲劲': [['chòng'], ['jìn']],
+    '冲压': [['chòng'], ['yā']],
+    '冲口': [['chōng'], ['kǒu']],
+    '冲喜': [['chōng'], ['xǐ']],
+    '冲塌': [['chōng'], ['tā']],
+    '冲天': [['chōng'], ['tiān']],
+    '冲子': [['chòng'], ['zi']],
+    '冲孔': [['chòng'], ['kǒng']],
+    '冲帐': [['chōng'], ['zhàng']],
+    '冲床': [['chòng'], ['chuáng']],
+    '冲扩': [['chōng'], ['kuò']],
+    '冲撞': [['chōng'], ['zhuàng']],
+    '冲散': [['chōng'], ['sàn']],
+    '冲服': [['chōng'], ['fú']],
+    '冲杀': [['chōng'], ['shā']],
+    '冲模': [['chòng'], ['mú']],
+    '冲水': [['chōng'], ['shuǐ']],
+    '冲洗': [['chōng'], ['xǐ']],
+    '冲浪': [['chōng'], ['làng']],
+    '冲淡': [['chōng'], ['dàn']],
+    '冲激': [['chōng'], ['jī']],
+    '冲犯': [['chōng'], ['fàn']],
+    '冲破': [['chōng'], ['pò']],
+    '冲积': [['chōng'], ['jī']],
+    '冲突': [['chōng'], ['tū']],
+    '冲脉': [['chōng'], ['mài']],
+    '冲腾': [['chōng'], ['téng']],
+    '冲要': [['chōng'], ['yào']],
+    '冲账': [['chōng'], ['zhàng']],
+    '冲量': [['chōng'], ['liàng']],
+    '冲销': [['chōng'], ['xiāo']],
+    '冲锋': [['chōng'], ['fēng']],
+    '冲阳': [['chōng'], ['yáng']],
+    '决不': [['jué'], ['bù']],
+    '决别': [['jué'], ['bié']],
+    '决斗': [['jué'], ['dòu']],
+    '决裂': [['jué'], ['liè']],
+    '况且': [['kuàng'], ['qiě']],
+    '冷嘲': [['lěng'], ['cháo']],
+    '冷场': [['lěng'], ['chǎng']],
+    '冷汗': [['lěng'], ['hàn']],
+    '冷落': [['lěng'], ['luò']],
+    '冷藏': [['lěng'], ['cáng']],
+    '冷血': [['lěng'], ['xuè']],
+    '冷语': [['lěng'], ['yǔ']],
+    '冷颤': [['lěng'], ['zhàn']],
+    '冷风': [['lěng'], ['fēng']],
+    '冷食': [['lěng'], ['shí']],
+    '冻结': [['dòng'], ['jié']],
+    '冻裂': [['dòng'], ['liè']],
+    '冻雨': [['dòng'], ['yǔ']],
+    '净价': [['jìng'], ['jià']],
+    '净余': [['jìng'], ['yú']],
+    '净利': [['jìng'], ['lì']],
+    '净化': [['jìng'], ['huà']],
+    '净口': [['jìng'], ['kǒu']],
+    '净土': [['jìng'], ['tǔ']],
+    '净室': [['jìng'], ['shì']],
+    '净尽': [['jìng'], ['jìn']],
+    '净得': [['jìng'], ['de']],
+    '净心': [['jìng'], ['xīn']],
+    '净手': [['jìng'], ['shǒu']],
+    '净桶': [['jìng'], ['tǒng']],
+    '净水': [['jìng'], ['shuǐ']],
+    '净空': [['jìng'], ['kōng']],
+    '净赚': [['jìng'], ['zhuàn']],
+    '净身': [['jìng'], ['shēn']],
+    '净重': [['jìng'], ['zhòng']],
+    '净高': [['jìng'], ['gāo']],
+    '凄凉': [['qī'], ['liáng']],
+    '凄切': [['qī'], ['qiè']],
+    '准予': [['zhǔn'], ['yǔ']],
+    '准信': [['zhǔn'], ['xìn']],
+    '准头': [['zhǔn'], ['tou']],
+    '准将': [['zhǔn'], ['jiàng']],
+    '准据': [['zhǔn'], ['jù']],
+    '准许': [['zhǔn'], ['xǔ']],
+    '凉亭': [['liáng'], ['tíng']],
+    '凉台': [['liáng'], ['tái']],
+    '凉席': [['liáng'], ['xí']],
+    '凉帽': [['liáng'], ['mào']],
+    '凉快': [['liáng'], ['kuài']],
+    '凉意': [['liáng'], ['yì']],
+    '凉拌': [['liáng'], ['bàn']],
+    '凉棚': [['liáng'], ['péng']],
+    '凉气': [['liáng'], ['qì']],
+    '凉水': [['liáng'], ['shuǐ']],
+    '凉爽': [['liáng'], ['shuǎng']],
+    '凉粉': [['liáng'], ['fěn']],
+    '凉药': [['liáng'], ['yào']],
+    '凉菜': [['liáng'], ['cài']],
+    '凉面': [['liáng'], ['miàn']],
+    '凉鞋': [['liáng'], ['xié']],
+    '凉风': [['liáng'], ['fēng']],
+    '凋落': [['diāo'], ['luò']],
+    '凌空': [['líng'], ['kōng']],
+    '减价': [['jiǎn'], ['jià']],
+    '减省': [['jiǎn'], ['shěng']],
+    '凑数': [['còu'], ['shù']],
+    '凑趣': [['còu'], ['qù']],
+    '凝华': [['níng'], ['huá']],
+    '凝合': [['níng'], ['hé']],
+    '凝思': [['níng'], ['sī']],
+    '凝结': [['níng'], ['jié']],
+    '凝重': [['níng'], ['zhòng']],
+    '几个': [['jǐ'], ['gè']],
+    '几乎': [['jī'], ['hū']],
+    '几何': [['jǐ'], ['hé']],
+    '几儿': [['jǐ'], ['ér']],
+    '几分': [['jǐ'], ['fēn']],
+    '几只': [['jǐ'], ['zhī']],
+    '几多': [['jǐ'], ['duō']],
+    '几希': [['jī'], ['xī']],
+    '几微': [['jī'], ['wēi']],
+    '几时': [['jǐ'], ['shí']],
+    '几曾': [['jǐ'], ['zēng']],
+    '几样': [['jǐ'], ['yàng']],
+    '几案': [['jī'], ['àn']],
+    '几率': [['jī'], ['lǜ']],
+    '几经': [['jǐ'], ['jīng']],
+    '几至': [['jī'], ['zhì']],
+    '几许': [['jǐ'], ['xǔ']],
+    '凡夫': [['fán'], ['fū']],
+    '凡间': [['fán'], ['jiān']],
+    '凤冠': [['fèng'], ['guān']],
+    '凤台': [['fèng'], ['tái']],
+    '凤尾': [['fèng'], ['wěi']],
+    '凤爪': [['fèng'], ['zhǎo']],
+    '凭信': [['píng'], ['xìn']],
+    '凭单': [['píng'], ['dān']],
+    '凭据': [['píng'], ['jù']],
+    '凭空': [['píng'], ['kōng']],
+    '凭藉': [['píng'], ['jiè']],
+    '凯旋': [['kǎi'], ['xuán']],
+    '凳子': [['dèng'], ['zi']],
+    '凶信': [['xiōng'], ['xìn']],
+    '凶恶': [['xiōng'], ['è']],
+    '凶暴': [['xiōng'], ['bào']],
+    '凶横': [['xiōng'], ['hèng']],
+    '凶煞': [['xiōng'], ['shà']],
+    '凶相': [['xiōng'], ['xiàng']],
+    '凸凹': [['tū'], ['āo']],
+    '凹凸': [['āo'], ['tū']],
+    '凹度': [['āo'], ['dù']],
+    '凹洞': [['āo'], ['dòng']],
+    '凹洼': [['āo'], ['wā']],
+    '凹版': [['āo'], ['bǎn']],
+    '凹镜': [['āo'], ['jìng']],
+    '凹陷': [['āo'], ['xiàn']],
+    '出丧': [['chū'], ['sāng']],
+    '出乘': [['chū'], ['chéng']],
+    '出亡': [['chū'], ['wáng']],
+    '出价': [['chū'], ['jià']],
+    '出任': [['chū'], ['rèn']],
+    '出厂': [['chū'], ['chǎng']],
+    '出发': [['chū'], ['fā']],
+    '出台': [['chū'], ['tái']],
+    '出圈': [['chū'], ['quān']],
+    '出场': [['chū'], ['chǎng']],
+    '出塞': [['chū'], ['sài']],
+    '出处': [['chū'], ['chù']],
+    '出头': [['chū'], ['tóu']],
+    '出奇': [['chū'], ['qí']],
+    '出奔': [['chū'], ['bēn']],
+    '出家': [['chū'], ['jiā']],
+    '出差': [['chū'], ['chāi']],
+    '出榜': [['chū'], ['bǎng']],
+    '出汗': [['chū'], ['hàn']],
+    '出没': [['chū'], ['mò']],
+    '出港': [['chū'], ['gǎng']],
+    '出溜': [['chū'], ['liū']],
+    '出笼': [['chū'], ['lóng']],
+    '出落': [['chū'], ['là']],
+    '出血': [['chū'], ['xuè']],
+    '出行': [['chū'], ['xíng']],
+    '出车': [['chū'], ['chē']],
+    '击中': [['jī'], ['zhòng']],
+    '击发': [['jī'], ['fā']],
+    '击打': [['jī'], ['dǎ']],
+    '击溃': [['jī'], ['kuì']],
+    '击节': [['jī'], ['jié']],
+    '击落': [['jī'], ['luò']],
+    '函大': [['hán'], ['dà']],
+    '函数': [['hán'], ['shù']],
+    '刀削': [['dāo'], ['xiāo']],
+    '刀叉': [['dāo'], ['chā']],
+    '刀头': [['dāo'], ['tóu']],
+    '刀把': [['dāo'], ['bà']],
+    '刀片': [['dāo'], ['piàn']],
+    '刀背': [['dāo'], ['bèi']],
+    '刀鞘': [['dāo'], ['qiào']],
+    '刁横': [['diāo'], ['hèng']],
+    '刁钻': [['diāo'], ['zuān']],
+    '刁难': [['diāo'], ['nàn']],
+    '分为': [['fēn'], ['wéi']],
+    '分享': [['fēn'], ['xiǎng']],
+    '分会': [['fēn'], ['huì']],
+    '分体': [['fēn'], ['tǐ']],
+    '分光': [['fēn'], ['guāng']],
+    '分兵': [['fēn'], ['bīng']],
+    '分内': [['fèn'], ['nèi']],
+    '分册': [['fēn'], ['cè']],
+    '分分': [['fēn'], ['fēn']],
+    '分列': [['fēn'], ['liè']],
+    '分利': [['fēn'], ['lì']],
+    '分别': [['fēn'], ['bié']],
+    '分割': [['fēn'], ['gē']],
+    '分力': [['fēn'], ['lì']],
+    '分化': [['fēn'], ['huà']],
+    '分区': [['fēn'], ['qū']],
+    '分厘': [['fēn'], ['lí']],
+    '分叉': [['fēn'], ['chà']],
+    '分发': [['fēn'], ['fā']],
+    '分号': [['fēn'], ['hào']],
+    '分合': [['fēn'], ['hé']],
+    '分地': [['fēn'], ['dì']],
+    '分外': [['fèn'], ['wài']],
+    '分头': [['fēn'], ['tóu']],
+    '分娩': [['fēn'], ['miǎn']],
+    '分子': [['fèn'], ['zǐ']],
+    '分宜': [['fēn'], ['yí']],
+    '分家': [['fēn'], ['jiā']],
+    '分寸': [['fēn'], ['cùn']],
+    '分封': [['fēn'], ['fēng']],
+    '分局': [['fēn'], ['jú']],
+    '分居': [['fēn'], ['jū']],
+    '分岐': [['fēn'], ['qí']],
+    '分岔': [['fēn'], ['chà']],
+    '分工': [['fēn'], ['gōng']],
+    '分布': [['fēn'], ['bù']],
+    '分店': [['fēn'], ['diàn']],
+    '分开': [['fēn'], ['kāi']],
+    '分式': [['fēn'], ['shì']],
+    '分当': [['fèn'], ['dāng']],
+    '分得': [['fēn'], ['de']],
+    '分心': [['fēn'], ['xīn']],
+    '分忧': [['fēn'], ['yōu']],
+    '分成': [['fēn'], ['chéng']],
+    '分房': [['fēn'], ['fáng']],
+    '分手': [['fēn'], ['shǒu']],
+    '分批': [['fēn'], ['pī']],
+    '分担': [['fēn'], ['dān']],
+    '分拣': [['fēn'], ['jiǎn']],
+    '分拨': [['fēn'], ['bō']],
+    '分摊': [['fēn'], ['tān']],
+    '分支': [['fēn'], ['zhī']],
+    '分散': [['fēn'], ['sǎn']],
+    '分数': [['fēn'], ['shù']],
+    '分文': [['fēn'], ['wén']],
+    '分时': [['fēn'], ['shí']],
+    '分明': [['fēn'], ['míng']],
+    '分晓': [['fēn'], ['xiǎo']],
+    '分期': [['fēn'], ['qī']],
+    '分机': [['fēn'], ['jī']],
+    '分权': [['fēn'], ['quán']],
+    '分析': [['fēn'], ['xī']],
+    '分枝': [['fēn'], ['zhī']],
+    '分校': [['fēn'], ['xiào']],
+    '分档': [['fēn'], ['dàng']],
+    '分歧': [['fēn'], ['qí']],
+    '分段': [['fēn'], ['duàn']],
+    '分母': [['fēn'], ['mǔ']],
+    '分毫': [['fēn'], ['háo']],
+    '分水': [['fēn'], ['shuǐ']],
+    '分治': [['fēn'], ['zhì']],
+    '分泌': [['fēn'], ['mì']],
+    '分洪': [['fēn'], ['hóng']],
+    '分派': [['fēn'], ['pài']],
+    '分流': [['fēn'], ['liú']],
+    '分润': [['fēn'], ['rùn']],
+    '分清': [['fēn'], ['qīng']],
+    '分爨': [['fēn'], ['cuàn']],
+    '分片': [['fēn'], ['piàn']],
+    '分理': [['fēn'], ['lǐ']],
+    '分界': [['fēn'], ['jiè']],
+    '分神': [['fēn'], ['shén']],
+    '分离': [['fēn'], ['lí']],
+    '分科': [['fēn'], ['kē']],
+    '分秒': [['fēn'], ['miǎo']],
+    '分立': [['fēn'], ['lì']],
+    '分管': [['fēn'], ['guǎn']],
+    '分米': [['fēn'], ['mǐ']],
+    '分类': [['fēn'], ['lèi']],
+    '分红': [['fēn'], ['hóng']],
+    '分级': [['fēn'], ['jí']],
+    '分组': [['fēn'], ['zǔ']],
+    '分给': [['fēn'], ['gěi']],
+    '分肥': [['fēn'], ['féi']],
+    '分色': [['fēn'], ['sè']],
+    '分节': [['fēn'], ['jié']],
+    '分蘖': [['fēn'], ['niè']],
+    '分行': [['fēn'], ['háng']],
+    '分裂': [['fēn'], ['liè']],
+    '分装': [['fēn'], ['zhuāng']],
+    '分解': [['fēn'], ['jiě']],
+    '分设': [['fēn'], ['shè']],
+    '分词': [['fēn'], ['cí']],
+    '分说': [['fēn'], ['shuō']],
+    '分贝': [['fēn'], ['bèi']],
+    '分账': [['fēn'], ['zhàng']],
+    '分赃': [['fēn'], ['zāng']],
+    '分赴': [['fēn'], ['fù']],
+    '分路': [['fēn'], ['lù']],
+    '分身': [['fēn'], ['shēn']],
+    '分辨': [['fēn'], ['biàn']],
+    '分辩': [['fēn'], ['biàn']],
+    '分送': [['fēn'], ['sòng']],
+    '分道': [['fēn'], ['dào']],
+    '分部': [['fēn'], ['bù']],
+    '分配': [['fēn'], ['pèi']],
+    '分野': [['fēn'], ['yě']],
+    '分量': [['fèn'], ['liàng']],
+    '分针': [['fēn'], ['zhēn']],
+    '分队': [['fēn'], ['duì']],
+    '分阴': [['fēn'], ['yīn']],
+    '分际': [['fèn'], ['jì']],
+    '分隔': [['fēn'], ['gé']],
+    '分频': [['fēn'], ['pín']],
+    '分飞': [['fēn'], ['fēi']],
+    '分餐': [['fēn'], ['cān']],
+    '分馏': [['fēn'], ['liú']],
+    '切不': [['qiè'], ['bù']],
+    '切中': [['qiè'], ['zhòng']],
+    '切入': [['qiē'], ['rù']],
+    '切切': [['qiē'], ['qiē']],
+    '切削': [['qiē'], ['xiāo']],
+    '切割': [['qiē'], ['gē']],
+    '切勿': [['qiē'], ['wù']],
+    '切变': [['qiē'], ['biàn']],
+    '切口': [['qiē'], ['kǒu']],
+    '切合': [['qiè'], ['hé']],
+    '切嘱': [['qiè'], ['zhǔ']],
+    '切实': [['qiè'], ['shí']],
+    '切屑': [['qiē'], ['xiè']],
+    '切己': [['qiè'], ['jǐ']],
+    '切当': [['qiē'], ['dāng']],
+    '切忌': [['qiè'], ['jì']],
+    '切断': [['qiē'], ['duàn']],
+    '切望': [['qiè'], ['wàng']],
+    '切末': [['qiè'], ['mò']],
+    '切激': [['qiè'], ['jī']],
+    '切点': [['qiē'], ['diǎn']],
+    '切片': [['qiē'], ['piàn']],
+    '切盼': [['qiè'], ['pàn']],
+    '切磋': [['qiē'], ['cuō']],
+    '切糕': [['qiē'], ['gāo']],
+    '切结': [['qiē'], ['jié']],
+    '切脉': [['qiè'], ['mài']],
+    '切花': [['qiē'], ['huā']],
+    '切莫': [['qiè'], ['mò']],
+    '切要': [['qiè'], ['yào']],
+    '切记': [['qiè'], ['jì']],
+    '切诊': [['qiè'], ['zhěn']],
+    '切谏': [['qiè'], ['jiàn']],
+    '切责': [['qiè'], ['zé']],
+    '切贴': [['qiè'], ['tiē']],
+    '切身': [['qiè'], ['shēn']],
+    '切近': [['qiè'], ['jìn']],
+    '切迫': [['qiè'], ['pò']],
+    '切除': [['qiē'], ['chú']],
+    '切面': [['qiē'], ['miàn']],
+    '切音': [['qiè'], ['yīn']],
+    '切题': [['qiè'], ['tí']],
+    '切骨': [['qiè'], ['gǔ']],
+    '切齿': [['qiè'], ['chǐ']],
+    '刊发': [['kān'], ['fā']],
+    '刊头': [['kān'], ['tóu']],
+    '刊行': [['kān'], ['xíng']],
+    '刊载': [['kān'], ['zǎi']],
+    '刎颈': [['wěn'], ['jǐng']],
+    '刑场': [['xíng'], ['chǎng']],
+    '刑期': [['xíng'], ['qī']],
+    '刑种': [['xíng'], ['zhǒng']],
+    '划一': [['huà'], ['yī']],
+    '划价': [['huà'], ['jià']],
+    '划分': [['huà'], ['fēn']],
+    '划划': [['huá'], ['huá']],
+    '划子': [['huá'], ['zǐ']],
+    '划定': [['huà'], ['dìng']],
+    '划归': [['huà'], ['guī']],
+    '划拉': [['huá'], ['lā']],
+    '划拨': [['huà'], ['bō']],
+    '划拳': [['huá'], ['quán']],
+    '划桨': [['huá'], ['jiǎng']],
+    '划清': [['huà'], ['qīng']],
+    '划界': [['huà'], ['jiè']],
+    '划算': [['huá'], ['suàn']],
+    '划线': [['huà'], ['xiàn']],
+    '划船': [['huá'], ['chuán']],
+    '划艇': [['huá'], ['tǐng']],
+    '划行': [['huá'], ['xíng']],
+    '划过': [['huá'], ['guò']],
+    '列传': [['liè'], ['zhuàn']],
+    '列强': [['liè'], ['qiáng']],
+    '列车': [['liè'], ['chē']],
+    '则甚': [['zé'], ['shèn']],
+    '刚体': [['gāng'], ['tǐ']],
+    '刚劲': [['gāng'], ['jìng']],
+    '刚好': [['gāng'], ['hǎo']],
+    '刚度': [['gāng'], ['dù']],
+    '刚强': [['gāng'], ['qiáng']],
+    '刚正': [['gāng'], ['zhèng']],
+    '刚石': [['gāng'], ['shí']],
+    '创业': [['chuàng'], ['yè']],
+    '创举': [['chuàng'], ['jǔ']],
+    '创优': [['chuàng'], ['yōu']],
+    '创伤': [['chuāng'], ['shāng']],
+    '创作': [['chuàng'], ['zuò']],
+    '创出': [['chuàng'], ['chū']],
+    '创刊': [['chuàng'], ['kān']],
+    '创利': [['chuàng'], ['lì']],
+    '创制': [['chuàng'], ['zhì']],
+    '创办': [['chuàng'], ['bàn']],
+    '创口': [['chuāng'], ['kǒu']],
+    '创始': [['chuàng'], ['shǐ']],
+    '创建': [['chuàng'], ['jiàn']],
+    '创意': [['chuàng'], ['yì']],
+    '创收': [['chuàng'], ['shōu']],
+    '创新': [['chuàng'], ['xīn']],
+    '创汇': [['chuàng'], ['huì']],
+    '创痕': [['chuāng'], ['hén']],
+    '创痛': [['chuāng'], ['tòng']],
+    '创立': [['chuàng'], ['lì']],
+    '创见': [['chuàng'], ['jiàn']],
+    '创议': [['chuàng'], ['yì']],
+    '创设': [['chuàng'], ['shè']],
+    '创造': [['chuàng'], ['zào']],
+    '创面': [['chuāng'], ['miàn']],
+    '初中': [['chū'], ['zhōng']],
+    '初会': [['chū'], ['huì']],
+    '初创': [['chū'], ['chuàng']],
+    '初叶': [['chū'], ['yè']],
+    '初度': [['chū'], ['dù']],
+    '初期': [['chū'], ['qī']],
+    '初见': [['chū'], ['jiàn']],
+    '初露': [['chū'], ['lù']],
+    '删削': [['shān'], ['xuē']],
+    '删节': [['shān'], ['jié']],
+    '判别': [['pàn'], ['bié']],
+    '判处': [['pàn'], ['chǔ']],
+    '判据': [['pàn'], ['jù']],
+    '判读': [['pàn'], ['dú']],
+    '刨冰': [['bào'], ['bīng']],
+    '刨刀': [['bào'], ['dāo']],
+    '刨削': [['páo'], ['xuē']],
+    '刨子': [['bào'], ['zǐ']],
+    '刨工': [['páo'], ['gōng']],
+    '刨平': [['bào'], ['píng']],
+    '刨床': [['bào'], ['chuáng']],
+    '刨花': [['bào'], ['huā']],
+    '刨除': [['páo'], ['chú']],
+    '刨食': [['páo'], ['shí']],
+    '利尿': [['lì'], ['niào']],
+    '利得': [['lì'], ['de']],
+    '利爪': [['lì'], ['zhuǎ']],
+    '利率': [['lì'], ['lǜ']],
+    '利落': [['lì'], ['luò']],
+    '别业': [['bié'], ['yè']],
+    '别个': [['bié'], ['gè']],
+    '别人': [['bié'], ['rén']],
+    '别价': [['bié'], ['jià']],
+    '别传': [['bié'], ['zhuàn']],
+    '别体': [['bié'], ['tǐ']],
+    '别史': [['bié'], ['shǐ']],
+    '别号': [['bié'], ['hào']],
+    '别名': [['bié'], ['míng']],
+    '别嘴': [['bié'], ['zuǐ']],
+    '别国': [['bié'], ['guó']],
+    '别墅': [['bié'], ['shù']],
+    '别处': [['bié'], ['chù']],
+    '别字': [['bié'], ['zì']],
+    '别家': [['bié'], ['jiā']],
+    '别忙': [['bié'], ['máng']],
+    '别情': [['bié'], ['qíng']],
+    '别扭': [['biè'], ['niǔ']],
+    '别提': [['bié'], ['tí']],
+    '别是': [['bié'], ['shì']],
+    '别本': [['bié'], ['běn']],
+    '别样': [['bié'], ['yàng']],
+    '别离': [['bié'], ['lí']],
+    '别称': [['bié'], ['chēng']],
+    '别管': [['bié'], ['guǎn']],
+    '别绪': [['bié'], ['xù']],
+    '别致': [['bié'], ['zhì']],
+    '别论': [['bié'], ['lùn']],
+    '别说': [['bié'], ['shuō']],
+    '别趣': [['bié'], ['qù']],
+    '别针': [['bié'], ['zhēn']],
+    '别集': [['bié'], ['jí']],
+    '别馆': [['bié'], ['guǎn']],
+    '刮削': [['guā'], ['xiāo']],
+    '到了': [['dào'], ['le']],
+    '到任': [['dào'], ['rèn']],
+    '到场': [['dào'], ['chǎng']],
+    '到处': [['dào'], ['chù']],
+    '到头': [['dào'], ['tóu']],
+    '到家': [['dào'], ['jiā']],
+    '到底': [['dào'], ['dǐ']],
+    '到期': [['dào'], ['qī']],
+    '制度': [['zhì'], ['dù']],
+    '制服': [['zhì'], ['fú']],
+    '制约': [['zhì'], ['yuē']],
+    '刷刷': [['shuā'], ['shuā']],
+    '刷子': [['shuā'], ['zǐ']],
+    '刷拉': [['shuā'], ['lā']],
+    '刷新': [['shuā'], ['xīn']],
+    '刷毛': [['shuā'], ['máo']],
+    '刷洗': [['shuā'], ['xǐ']],
+    '刷白': [['shuà'], ['bái']],
+    '刹住': [['shā'], ['zhù']],
+    '刹刹': [['shā'], ['shā']],
+    '刹把': [['shā'], ['bǎ']],
+    '刹时': [['shā'], ['shí']],
+    '刹车': [['shā'], ['chē']],
+    '刹那': [['chà'], ['nà']],
+    '刺伤': [['cì'], ['shāng']],
+    '刺儿': [['cì'], ['ér']],
+    '刺刀': [['cì'], ['dāo']],
+    '刺史': [['cì'], ['shǐ']],
+    '刺啦': [['cī'], ['lā']],
+    '刺头': [['cì'], ['tóu']],
+    '刺字': [['cì'], ['zì']],
+    '刺客': [['cì'], ['kè']],
+    '刺探': [['cì'], ['tàn']],
+    '刺杀': [['cì'], ['shā']],
+    '刺柏': [['cì'], ['bǎi']],
+    '刺桐': [['cì'], ['tóng']],
+    '刺槐': [['cì'], ['huái']],
+    '刺溜': [['cī'], ['liū']],
+    '刺激': [['cì'], ['jī']],
+    '刺猬': [['cì'], ['wèi']],
+    '刺痒': [['cì'], ['yáng']],
+    '刺痛': [['cì'], ['tòng']],
+    '刺目': [['cì'], ['mù']],
+    '刺眼': [['cì'], ['yǎn']],
+    '刺破': [['cì'], ['pò']],
+    '刺绣': [['cì'], ['xiù']],
+    '刺网': [['cì'], ['wǎng']],
+    '刺耳': [['cì'], ['ěr']],
+    '刺配': [['cì'], ['pèi']],
+    '刺针': [['cì'], ['zhēn']],
+    '刺骨': [['cì'], ['gǔ']],
+    '刺鼻': [['cì'], ['bí']],
+    '刻划': [['kè'], ['huá']],
+    '刻度': [['kè'], ['dù']],
+    '刻毒': [['kè'], ['dú']],
+    '刻薄': [['kè'], ['bó']],
+    '刻骨': [['kè'], ['gǔ']],
+    '剀切': [['kǎi'], ['qiē']],
+    '剂量': [['jì'], ['liàng']],
+    '剃发': [['tì'], ['fà']],
+    '剃头': [['tì'], ['tóu']],
+    '剃度': [['tì'], ['dù']],
+    '削价': [['xuē'], ['jià']],
+    '削减': [['xuē'], ['jiǎn']],
+    '削削': [['xuē'], ['xuē']],
+    '削发': [['xuē'], ['fà']],
+    '削地': [['xuē'], ['dì']],
+    '削壁': [['xuē'], ['bì']],
+    '削平': [['xuē'], ['píng']],
+    '削弱': [['xuē'], ['ruò']],
+    '削球': [['xiāo'], ['qiú']],
+    '削瘦': [['xuē'], ['shòu']],
+    '削皮': [['xiāo'], ['pí']],
+    '削职': [['xuē'], ['zhí']],
+    '削肩': [['xuē'], ['jiān']],
+    '削除': [['xuē'], ['chú']],
+    '前仇': [['qián'], ['chóu']],
+    '前任': [['qián'], ['rèn']],
+    '前台': [['qián'], ['tái']],
+    '前场': [['qián'], ['chǎng']],
+    '前夫': [['qián'], ['fū']],
+    '前头': [['qián'], ['tou']],
+    '前妻': [['qián'], ['qī']],
+    '前排': [['qián'], ['pái']],
+    '前提': [['qián'], ['tí']],
+    '前景': [['qián'], ['jǐng']],
+    '前朝': [['qián'], ['cháo']],
+    '前期': [['qián'], ['qī']],
+    '前爪': [['qián'], ['zhuǎ']],
+    '前臂': [['qián'], ['bì']],
+    '前行': [['qián'], ['xíng']],
+    '前车': [['qián'], ['chē']],
+    '剑术': [['jiàn'], ['shù']],
+    '剔红': [['tī'], ['hóng']],
+    '剖解': [['pōu'], ['jiě']],
+    '剥削': [['bō'], ['xuē']],
+    '剥剥': [['bāo'], ['bāo']],
+    '剥取': [['bāo'], ['qǔ']],
+    '剥壳': [['bāo'], ['ké']],
+    '剥夺': [['bō'], ['duó']],
+    '剥皮': [['bāo'], ['pí']],
+    '剥离': [['bō'], ['lí']],
+    '剥脱': [['bāo'], ['tuō']],
+    '剥落': [['bō'], ['luò']],
+    '剥蚀': [['bō'], ['shí']],
+    '剥除': [['bāo'], ['chú']],
+    '剧场': [['jù'], ['chǎng']],
+    '剧曲': [['jù'], ['qǔ']],
+    '剧毒': [['jù'], ['dú']],
+    '剧种': [['jù'], ['zhǒng']],
+    '剪发': [['jiǎn'], ['fà']],
+    '剪枝': [['jiǎn'], ['zhī']],
+    '副刊': [['fù'], ['kān']],
+    '副品': [['fù'], ['pǐn']],
+    '副官': [['fù'], ['guān']],
+    '副手': [['fù'], ['shǒu']],
+    '副本': [['fù'], ['běn']],
+    '副歌': [['fù'], ['gē']],
+    '副署': [['fù'], ['shǔ']],
+    '副职': [['fù'], ['zhí']],
+    '副肾': [['fù'], ['shèn']],
+    '副词': [['fù'], ['cí']],
+    '副食': [['fù'], ['shí']],
+    '割切': [['gē'], ['qiē']],
+    '割地': [['gē'], ['dì']],
+    '割据': [['gē'], ['jù']],
+    '割裂': [['gē'], ['liè']],
+    '剿匪': [['jiǎo'], ['fěi']],
+    '剿杀': [['jiǎo'], ['shā']],
+    '剿灭': [['jiǎo'], ['miè']],
+    '剿袭': [['chāo'], ['xí']],
+    '剿说': [['chāo'], ['shuō']],
+    '剿除': [['jiǎo'], ['chú']],
+    '劈刀': [['pī'], ['dāo']],
+    '劈刺': [['pī'], ['cì']],
+    '劈叉': [['pǐ'], ['chà']],
+    '劈啪': [['pī'], ['pā']],
+    '劈头': [['pī'], ['tóu']],
+    '劈山': [['pī'], ['shān']],
+    '劈成': [['pǐ'], ['chéng']],
+    '劈手': [['pī'], ['shǒu']],
+    '劈杀': [['pī'], ['shā']],
+    '劈柴': [['pǐ'], ['chái']],
+    '劈胸': [['pī'], ['xiōng']],
+    '劈脸': [['pī'], ['liǎn']],
+    '劈裂': [['pī'], ['liè']],
+    '劈面': [['pī'], ['miàn']],
+    '力场': [['lì'], ['chǎng']],
+    '力尽': [['lì'], ['jìn']],
+    '力度': [['lì'], ['dù']],
+    '力臂': [['lì'], ['bì']],
+    '力行': [['lì'], ['xíng']],
+    '力量': [['lì'], ['liàng']],
+    '劝化': [['quàn'], ['huà']],
+    '劝和': [['quàn'], ['hé']],
+    '劝解': [['quàn'], ['jiě']],
+    '劝说': [['quàn'], ['shuō']],
+    '劝降': [['quàn'], ['xiáng']],
+    '办好': [['bàn'], ['hǎo']],
+    '办差': [['bàn'], ['chāi']],
+    '功令': [['gōng'], ['lìng']],
+    '功夫': [['gōng'], ['fū']],
+    '功底': [['gōng'], ['dǐ']],
+    '功率': [['gōng'], ['lǜ']],
+    '功能': [['gōng'], ['néng']],
+    '功过': [['gōng'], ['guò']],
+    '加价': [['jiā'], ['jià']],
+    '加劲': [['jiā'], ['jìn']],
+    '加压': [['jiā'], ['yā']],
+    '加号': [['jiā'], ['hào']],
+    '加强': [['jiā'], ['qiáng']],
+    '加数': [['jiā'], ['shù']],
+    '加盖': [['jiā'], ['gài']],
+    '加车': [['jiā'], ['chē']],
+    '加重': [['jiā'], ['zhòng']],
+    '务期': [['wù'], ['qī']],
+    '务正': [['wù'], ['zhèng']],
+    '务要': [['wù'], ['yào']],
+    '劣种': [['liè'], ['zhǒng']],
+    '动员': [['dòng'], ['yuán']],
+    '动弹': [['dòng'], ['tán']],
+    '动能': [['dòng'], ['néng']],
+    '动脉': [['dòng'], ['mài']],
+    '动觉': [['dòng'], ['jué']],
+    '动量': [['dòng'], ['liàng']],
+    '助产': [['zhù'], ['chǎn']],
+    '助兴': [['zhù'], ['xìng']],
+    '助力': [['zhù'], ['lì']],
+    '助威': [['zhù'], ['wēi']],
+    '助学': [['zhù'], ['xué']],
+    '助工': [['zhù'], ['gōng']],
+    '助战': [['zhù'], ['zhàn']],
+    '助手': [['zhù'], ['shǒu']],
+    '助推': [['zhù'], ['tuī']],
+    '助攻': [['zhù'], ['gōng']],
+    '助教': [['zhù'], ['jiào']],
+    '助燃': [['zhù'], ['rán']],
+    '助理': [['zhù'], ['lǐ']],
+    '助益': [['zhù'], ['yì']],
+    '助研': [['zhù'], ['yán']],
+    '助耕': [['zhù'], ['gēng']],
+    '助词': [['zhù'], ['cí']],
+    '助跑': [['zhù'], ['pǎo']],
+    '助长': [['zhù'], ['zhǎng']],
+    '助阵': [['zhù'], ['zhèn']],
+    '劫数': [['jié'], ['shù']],
+    '劫难': [['jié'], ['nàn']],
+    '励行': [['lì'], ['xíng']],
+    '劲健': [['jìn'], ['jiàn']],
+    '劲儿': [['jìn'], ['er']],
+    '劲兵': [['jìng'], ['bīng']],
+    '劲力': [['jìn'], ['lì']],
+    '劲吹': [['jìng'], ['chuī']],
+    '劲头': [['jìn'], ['tóu']],
+    '劲射': [['jìng'], ['shè']],
+    '劲敌': [['jìng'], ['dí']],
+    '劲旅': [['jìng'], ['lǚ']],
+    '劲松': [['jìng'], ['sōng']],
+    '劲直': [['jìng'], ['zhí']],
+    '劲草': [['jìng'], ['cǎo']],
+    '劲道': [['jìn'], ['dào']],
+    '劲风': [['jìng'], ['fēng']],
+    '劳教': [['láo'], ['jiào']],
+    '劳模': [['láo'], ['mó']],
+    '劳碌': [['láo'], ['lù']],
+    '劳累': [['láo'], ['lèi']],
+    '势头': [['shì'], ['tóu']],
+    '势能': [['shì'], ['néng']],
+    '势要': [['shì'], ['yào']],
+    '勃兴': [['bó'], ['xīng']],
+    '勃发': [['bó'], ['fā']],
+    '勇夫': [['yǒng'], ['fū']],
+    '勉强': [['miǎn'], ['qiǎng']],
+    '勒令': [['lè'], ['lìng']],
+    '勒住': [['lēi'], ['zhù']],
+    '勒派': [['lè'], ['pài']],
+    '勒索': [['lè'], ['suǒ']],
+    '勒紧': [['lēi'], ['jǐn']],
+    '勒逼': [['lè'], ['bī']],
+    '勘查': [['kān'], ['chá']],
+    '勘校': [['kān'], ['jiào']],
+    '募化': [['mù'], ['huà']],
+    '勤朴': [['qín'], ['piáo']],
+    '勤王': [['qín'], ['wáng']],
+    '勾兑': [['gōu'], ['duì']],
+    '勾勒': [['gōu'], ['lè']],
+    '勾引': [['gōu'], ['yǐn']],
+    '勾当': [['gòu'], ['dàng']],
+    '勾描': [['gōu'], ['miáo']],
+    '勾搭': [['gōu'], ['dā']],
+    '勾栏': [['gōu'], ['lán']],
+    '勾消': [['gōu'], ['xiāo']],
+    '勾画': [['gōu'], ['huà']],
+    '勾留': [['gōu'], ['liú']],
+    '勾结': [['gōu'], ['jié']],
+    '勾绘': [['gōu'], ['huì']],
+    '勾脸': [['gōu'], ['liǎn']],
+    '勾芡': [['gōu'], ['qiàn']],
+    '勾起': [['gōu'], ['qǐ']],
+    '勾践': [['gōu'], ['jiàn']],
+    '勾连': [['gōu'], ['lián']],
+    '勾通': [['gōu'], ['tōng']],
+    '勾销': [['gōu'], ['xiāo']],
+    '勾除': [['gōu'], ['chú']],
+    '勾魂': [['gōu'], ['hún']],
+    '匀兑': [['yún'], ['duì']],
+    '匀净': [['yún'], ['jìng']],
+    '匀和': [['yún'], ['hé']],
+    '匀浆': [['yún'], ['jiāng']],
+    '匀溜': [['yún'], ['liū']],
+    '匀称': [['yún'], ['chèn']],
+    '包乘': [['bāo'], ['chéng']],
+    '包囊': [['bāo'], ['náng']],
+    '包场': [['bāo'], ['chǎng']],
+    '包头': [['bāo'], ['tóu']],
+    '包干': [['bāo'], ['gān']],
+    '包扎': [['bāo'], ['zā']],
+    '包括': [['bāo'], ['kuò']],
+    '包票': [['bāo'], ['piào']],
+    '包络': [['bāo'], ['luò']],
+    '包藏': [['bāo'], ['cáng']],
+    '包被': [['bāo'], ['bèi']],
+    '包车': [['bāo'], ['chē']],
+    '包间': [['bāo'], ['jiān']],
+    '化作': [['huà'], ['zuò']],
+    '化冻': [['huà'], ['dòng']],
+    '化分': [['huà'], ['fēn']],
+    '化化': [['huà'], ['huà']],
+    '化合': [['huà'], ['hé']],
+    '化名': [['huà'], ['míng']],
+    '化境': [['huà'], ['jìng']],
+    '化外': [['huà'], ['wài']],
+    '化妆': [['huà'], ['zhuāng']],
+    '化学': [['huà'], ['xué']],
+    '化工': [['huà'], ['gōng']],
+    '化成': [['huà'], ['chéng']],
+    '化斋': [['huà'], ['zhāi']],
+    '化生': [['huà'], ['shēng']],
+    '化疗': [['huà'], ['liáo']],
+    '化痰': [['huà'], ['tán']],
+    '化石': [['huà'], ['shí']],
+    '化纤': [['huà'], ['xiān']],
+    '化缘': [['huà'], ['yuán']],
+    '化肥': [['huà'], ['féi']],
+    '化脓': [['huà'], ['nóng']],
+    '化装': [['huà'], ['zhuāng']],
+    '化解': [['huà'], ['jiě']],
+    '化身': [['huà'], ['shēn']],
+    '化钱': [['huà'], ['qián']],
+    '化验': [['huà'], ['yàn']],
+    '北上': [['běi'], ['shàng']],
+    '北京': [['běi'], ['jīng']],
+    '北伐': [['běi'], ['fá']],
+    '北周': [['běi'], ['zhōu']],
+    '北国': [['běi'], ['guó']],
+    '北宋': [['běi'], ['sòng']],
+    '北岳': [['běi'], ['yuè']],
+    '北平': [['běi'], ['píng']],
+    '北房': [['běi'], ['fáng']],
+    '北斗': [['běi'], ['dǒu']],
+    '北方': [['běi'], ['fāng']],
+    '北曲': [['běi'], ['qǔ']],
+    '北朝': [['běi'], ['cháo']],
+    '北极': [['běi'], ['jí']],
+    '北欧': [['běi'], ['ōu']],
+    '北江': [['běi'], ['jiāng']],
+    '北洋': [['běi'], ['yáng']],
+    '北海': [['běi'], ['hǎi']],
+    '北瓜': [['běi'], ['guā']],
+    '北疆': [['běi'], ['jiāng']],
+    '北纬': [['běi'], ['wěi']],
+    '北越': [['běi'], ['yuè']],
+    '北辰': [['běi'], ['chén']],
+    '北边': [['běi'], ['biān']],
+    '北郊': [['běi'], ['jiāo']],
+    '北部': [['běi'], ['bù']],
+    '北门': [['běi'], ['mén']],
+    '北非': [['běi'], ['fēi']],
+    '北面': [['běi'], ['miàn']],
+    '北风': [['běi'], ['fēng']],
+    '北魏': [['běi'], ['wèi']],
+    '北齐': [['běi'], ['qí']],
+    '匙子': [['chí'], ['zi']],
+    '匝地': [['zā'], ['dì']],
+    '匡助': [['kuāng'], ['zhù']],
+    '匡正': [['kuāng'], ['zhèng']],
+    '匡济': [['kuāng'], ['jì']],
+    '匹夫': [['pǐ'], ['fū']],
+    '区内': [['qū'], ['nèi']],
+    '区分': [['qū'], ['fēn']],
+    '区划': [['qū'], ['huà']],
+    '区别': [['qū'], ['bié']],
+    '区区': [['qū'], ['qū']],
+    '区县': [['qū'], ['xiàn']],
+    '区域': [['qū'], ['yù']],
+    '区外': [['qū'], ['wài']],
+    '区段': [['qū'], ['duàn']],
+    '区间': [['qū'], ['jiān']],
+    '医家': [['yī'], ['jiā']],
+    '医术': [['yī'], ['shù']],
+    '匿藏': [['nì'], ['cáng']],
+    '十万': [['shí'], ['wàn']],
+    '十分': [['shí'], ['fēn']],
+    '十家': [['shí'], ['jiā']],
+    '千万': [['qiān'], ['wàn']],
+    '千卡': [['qiān'], ['kǎ']],
+    '千夫': [['qiān'], ['fū']],
+    '千瓦': [['qiān'], ['wǎ']],
+    '升任': [['shēng'], ['rèn']],
+    '升华': [['shēng'], ['huá']],
+    '升压': [['shēng'], ['yā']],
+    '升涨': [['shēng'], ['zhǎng']],
+    '升空': [['shēng'], ['kōng']],
+    '升降': [['shēng'], ['jiàng']],
+    '午休': [['wǔ'], ['xiū']],
+    '午觉': [['wǔ'], ['jiào']],
+    '午间': [['wǔ'], ['jiān']],
+    '半价': [['bàn'], ['jià']],
+    '半休': [['bàn'], ['xiū']],
+    '半大': [['bàn'], ['dà']],
+    '半宿': [['bàn'], ['xiǔ']],
+    '半拉': [['bàn'], ['lǎ']],
+    '半数': [['bàn'], ['shù']],
+    '半票': [['bàn'], ['piào']],
+    '半空': [['bàn'], ['kōng']],
+    '半载': [['bàn'], ['zǎi']],
+    '华东': [['huá'], ['dōng']],
+    '华严': [['huá'], ['yán']],
+    '华中': [['huá'], ['zhōng']],
+    '华丽': [['huá'], ['lì']],
+    '华人': [['huá'], ['rén']],
+    '华佗': [['huà'], ['tuó']],
+    '华侨': [['huá'], ['qiáo']],
+    '华北': [['huá'], ['běi']],
+    '华南': [['huá'], ['nán']],
+    '华发': [['huá'], ['fà']],
+    '华夏': [['huá'], ['xià']],
+    '华容': [['huá'], ['róng']],
+    '华山': [['huà'], ['shān']],
+    '华工': [['huá'], ['gōng']],
+    '华年': [['huá'], ['nián']],
+    '华府': [['huá'], ['fǔ']],
+    '华彩': [['huá'], ['cǎi']],
+    '华族': [['huá'], ['zú']],
+    '华池': [['huá'], ['chí']],
+    '华润': [['huá'], ['rùn']],
+    '华灯': [['huá'], ['dēng']],
+    '华盖': [['huá'], ['gài']],
+    '华章': [['huá'], ['zhāng']],
+    '华纳': [['huá'], ['nà']],
+    '华美': [['huá'], ['měi']],
+    '华翰': [['huá'], ['hàn']],
+    '华胄': [['huá'], ['zhòu']],
+    '华表': [['huá'], ['biǎo']],
+    '华裔': [['huá'], ['yì']],
+    '华西': [['huá'], ['xī']],
+    '华诞': [['huá'], ['dàn']],
+    '华语': [['huá'], ['yǔ']],
+    '华贵': [['huá'], ['guì']],
+    '华里': [['huá'], ['lǐ']],
+    '协会': [['xié'], ['huì']],
+    '协助': [['xié'], ['zhù']],
+    '协同': [['xié'], ['tóng']],
+    '协和': [['xié'], ['hé']],
+    '协约': [['xié'], ['yuē']],
+    '协调': [['xié'], ['tiáo']],
+    '卒业': [['zú'], ['yè']],
+    '卒子': [['zú'], ['zǐ']],
+    '卒岁': [['zú'], ['suì']],
+    '卒年': [['zú'], ['nián']],
+    '卒然': [['cù'], ['rán']],
+    '卓著': [['zhuó'], ['zhù']],
+    '卓见': [['zhuó'], ['jiàn']],
+    '卓识': [['zhuó'], ['shí']],
+    '单一': [['dān'], ['yī']],
+    '单于': [['chán'], ['yú']],
+    '单产': [['dān'], ['chǎn']],
+    '单价': [['dān'], ['jià']],
+    '单传': [['dān'], ['chuán']],
+    '单位': [['dān'], ['wèi']],
+    '单作': [['dān'], ['zuò']],
+    '单元': [['dān'], ['yuán']],
+    '单兵': [['dān'], ['bīng']],
+    '单刀': [['dān'], ['dāo']],
+    '单列': [['dān'], ['liè']],
+    '单利': [['dān'], ['lì']],
+    '单单': [['dān'], ['dān']],
+    '单发': [['dān'], ['fā']],
+    '单口': [['dān'], ['kǒu']],
+    '单句': [['dān'], ['jù']],
+    '单另': [['dān'], ['lìng']],
+    '单向': [['dān'], ['xiàng']],
+    '单姓': [['shàn'], ['xìng']],
+    '单子': [['dān'], ['zi']],
+    '单字': [['dān'], ['zì']],
+    '单寒': [['dān'], ['hán']],
+    '单帮': [['dān'], ['bāng']],
+    '单幅': [['dān'], ['fú']],
+    '单干': [['dān'], ['gàn']],
+    '单弦': [['dān'], ['xián']],
+    '单弱': [['dān'], ['ruò']],
+    '单恋': [['dān'], ['liàn']],
+    '单打': [['dān'], ['dǎ']],
+    '单据': [['dān'], ['jù']],
+    '单摆': [['dān'], ['bǎi']],
+    '单数': [['dān'], ['shù']],
+    '单方': [['dān'], ['fāng']],
+    '单机': [['dān'], ['jī']],
+    '单杠': [['dān'], ['gàng']],
+    '单极': [['dān'], ['jí']],
+    '单独': [['dān'], ['dú']],
+    '单用': [['dān'], ['yòng']],
+    '单瘫': [['dān'], ['tān']],
+    '单程': [['dān'], ['chéng']],
+    '单篇': [['dān'], ['piān']],
+    '单糖': [['dān'], ['táng']],
+    '单纯': [['dān'], ['chún']],
+    '单线': [['dān'], ['xiàn']],
+    '单薄': [['dān'], ['bó']],
+    '单行': [['dān'], ['xíng']],
+    '单衣': [['dān'], ['yī']],
+    '单裤': [['dān'], ['kù']],
+    '单词': [['dān'], ['cí']],
+    '单调': [['dān'], ['diào']],
+    '单身': [['dān'], ['shēn']],
+    '单车': [['dān'], ['chē']],
+    '单轨': [['dān'], ['guǐ']],
+    '单门': [['dān'], ['mén']],
+    '单间': [['dān'], ['jiān']],
+    '单骑': [['dān'], ['qí']],
+    '卖价': [['mài'], ['jià']],
+    '卖俏': [['mài'], ['qiào']],
+    '卖劲': [['mài'], ['jìn']],
+    '卖好': [['mài'], ['hǎo']],
+    '卖弄': [['mài'], ['nòng']],
+    '卖相': [['mài'], ['xiàng']],
+    '卖空': [['mài'], ['kōng']],
+    '南中': [['nán'], ['zhōng']],
+    '南乐': [['nán'], ['lè']],
+    '南亚': [['nán'], ['yà']],
+    '南京': [['nán'], ['jīng']],
+    '南军': [['nán'], ['jūn']],
+    '南凉': [['nán'], ['liáng']],
+    '南北': [['nán'], ['běi']],
+    '南华': [['nán'], ['huá']],
+    '南吕': [['nán'], ['lǚ']],
+    '南唐': [['nán'], ['táng']],
+    '南国': [['nán'], ['guó']],
+    '南宋': [['nán'], ['sòng']],
+    '南宫': [['nán'], ['gōng']],
+    '南山': [['nán'], ['shān']],
+    '南岭': [['nán'], ['lǐng']],
+    '南岳': [['nán'], ['yuè']],
+    '南川': [['nán'], ['chuān']],
+    '南巡': [['nán'], ['xún']],
+    '南平': [['nán'], ['píng']],
+    '南式': [['nán'], ['shì']],
+    '南戏': [['nán'], ['xì']],
+    '南拳': [['nán'], ['quán']],
+    '南方': [['nán'], ['fāng']],
+    '南无': [['nā'], ['mó']],
+    '南星': [['nán'], ['xīng']],
+    '南朝': [['nán'], ['cháo']],
+    '南极': [['nán'], ['jí']],
+    '南欧': [['nán'], ['ōu']],
+    '南汉': [['nán'], ['hàn']],
+    '南江': [['nán'], ['jiāng']],
+    '南洋': [['nán'], ['yáng']],
+    '南海': [['nán'], ['hǎi']],
+    '南湖': [['nán'], ['hú']],
+    '南燕': [['nán'], ['yàn']],
+    '南瓜': [['nán'], ['guā']],
+    '南皮': [['nán'], ['pí']],
+    '南端': [['nán'], ['duān']],
+    '南竹': [['nán'], ['zhú']],
+    '南粤': [['nán'], ['yuè']],
+    '南纬': [['nán'], ['wěi']],
+    '南胡': [['nán'], ['hú']],
+    '南蛮': [['nán'], ['mán']],
+    '南诏': [['nán'], ['zhào']],
+    '南货': [['nán'], ['huò']],
+    '南越': [['nán'], ['yuè']],
+    '南边': [['nán'], ['biān']],
+    '南迁': [['nán'], ['qiān']],
+    '南郊': [['nán'], ['jiāo']],
+    '南郑': [['nán'], ['zhèng']],
+    '南部': [['nán'], ['bù']],
+    '南门': [['nán'], ['mén']],
+    '南阳': [['nán'], ['yáng']],
+    '南陵': [['nán'], ['líng']],
+    '南面': [['nán'], ['miàn']],
+    '南音': [['nán'], ['yīn']],
+    '南风': [['nán'], ['fēng']],
+    '南齐': [['nán'], ['qí']],
+    '博大': [['bó'], ['dà']],
+    '博得': [['bó'], ['de']],
+    '博识': [['bó'], ['shí']],
+    '博采': [['bó'], ['cǎi']],
+    '卜卦': [['bǔ'], ['guà']],
+    '卜居': [['bǔ'], ['jū']],
+    '卜筮': [['bǔ'], ['shì']],
+    '卜辞': [['bǔ'], ['cí']],
+    '卜骨': [['bǔ'], ['gǔ']],
+    '占先': [['zhàn'], ['xiān']],
+    '占卜': [['zhān'], ['bǔ']],
+    '占卦': [['zhān'], ['guà']],
+    '占压': [['zhàn'], ['yā']],
+    '占地': [['zhàn'], ['dì']],
+    '占居': [['zhàn'], ['jū']],
+    '占据': [['zhàn'], ['jù']],
+    '占星': [['zhān'], ['xīng']],
+    '占有': [['zhàn'], ['yǒu']],
+    '占梦': [['zhān'], ['mèng']],
+    '占理': [['zhàn'], ['lǐ']],
+    '占用': [['zhàn'], ['yòng']],
+    '占筮': [['zhān'], ['shì']],
+    '占线': [['zhàn'], ['xiàn']],
+    '占课': [['zhān'], ['kè']],
+    '占领': [['zhàn'], ['lǐng']],
+    '卡其': [['kǎ'], ['qí']],
+    '卡具': [['qiǎ'], ['jù']],
+    '卡口': [['kǎ'], ['kǒu']],
+    '卡壳': [['qiǎ'], ['ké']],
+    '卡子': [['qiǎ'], ['zi']],
+    '卡尺': [['kǎ'], ['chǐ']],
+    '卡带': [['kǎ'], ['dài']],
+    '卡座': [['kǎ'], ['zuò']],
+    '卡片': [['kǎ'], ['piàn']],
+    '卡纸': [['kǎ'], ['zhǐ']],
+    '卡规': [['kǎ'], ['guī']],
+    '卡诺': [['kǎ'], ['nuò']],
+    '卡车': [['kǎ'], ['chē']],
+    '卡通': [['kǎ'], ['tōng']],
+    '卡钳': [['kǎ'], ['qián']],
+    '卤化': [['lǔ'], ['huà']],
+    '卧倒': [['wò'], ['dǎo']],
+    '卧射': [['wò'], ['shè']],
+    '卧底': [['wò'], ['dǐ']],
+    '卧车': [['wò'], ['chē']],
+    '卧铺': [['wò'], ['pù']],
+    '印信': [['yìn'], ['xìn']],
+    '印刷': [['yìn'], ['shuā']],
+    '印发': [['yìn'], ['fā']],
+    '印台': [['yìn'], ['tái']],
+    '印度': [['yìn'], ['dù']],
+    '印把': [['yìn'], ['bà']],
+    '印泥': [['yìn'], ['ní']],
+    '印纹': [['yìn'], ['wén']],
+    '印行': [['yìn'], ['xíng']],
+    '危亡': [['wēi'], ['wáng']],
+    '危重': [['wēi'], ['zhòng']],
+    '危难': [['wēi'], ['nàn']],
+    '即令': [['jí'], ['lìng']],
+    '即便': [['jí'], ['biàn']],
+    '即兴': [['jí'], ['xìng']],
+    '即将': [['jí'], ['jiāng']],
+    '即景': [['jí'], ['jǐng']],
+    '即期': [['jí'], ['qī']],
+    '即若': [['jí'], ['ruò']],
+    '即行': [['jí'], ['xíng']],
+    '却说': [['què'], ['shuō']],
+    '卵壳': [['luǎn'], ['ké']],
+    '卵石': [['luǎn'], ['shí']],
+    '卵裂': [['luǎn'], ['liè']],
+    '卷云': [['juǎn'], ['yún']],
+    '卷卷': [['juàn'], ['juàn']],
+    '卷发': [['juǎn'], ['fà']],
+    '卷子': [['juǎn'], ['zi']],
+    '卷宗': [['juàn'], ['zōng']],
+    '卷尺': [['juǎn'], ['chǐ']],
+    '卷帘': [['juàn'], ['lián']],
+    '卷帙': [['juàn'], ['zhì']],
+    '卷扬': [['juǎn'], ['yáng']],
+    '卷曲': [['juǎn'], ['qū']],
+    '卷柏': [['juàn'], ['bǎi']],
+    '卷烟': [['juǎn'], ['yān']],
+    '卷缩': [['juàn'], ['suō']],
+    '卷舌': [['juǎn'], ['shé']],
+    '卷轴': [['juàn'], ['zhóu']],
+    '卷逃': [['juǎn'], ['táo']],
+    '卷面': [['juàn'], ['miàn']],
+    '卷须': [['juàn'], ['xū']],
+    '卸任': [['xiè'], ['rèn']],
+    '卸车': [['xiè'], ['chē']],
+    '卸载': [['xiè'], ['zǎi']],
+    '厂休': [['chǎng'], ['xiū']],
+    '厂史': [['chǎng'], ['shǐ']],
+    '厂商': [['chǎng'], ['shāng']],
+    '厂子': [['chǎng'], ['zǐ']],
+    '厂家': [['chǎng'], ['jiā']],
+    '厂房': [['chǎng'], ['fáng']],
+    '厂矿': [['chǎng'], ['kuàng']],
+    '厂规': [['chǎng'], ['guī']],
+    '厂长': [['chǎng'], ['zhǎng']],
+    '厄难': [['è'], ['nàn']],
+    '历任': [['lì'], ['rèn']],
+    '历尽': [['lì'], ['jìn']],
+    '历数': [['lì'], ['shǔ']],
+    '历朝': [['lì'], ['cháo']],
+    '厉行': [['lì'], ['xíng']],
+    '压价': [['yā'], ['jià']],
+    '压倒': [['yā'], ['dǎo']],
+    '压光': [['yā'], ['guāng']],
+    '压制': [['yā'], ['zhì']],
+    '压力': [['yā'], ['lì']],
+    '压卷': [['yā'], ['juàn']],
+    '压压': [['yā'], ['yā']],
+    '压台': [['yā'], ['tái']],
+    '压场': [['yā'], ['chǎng']],
+    '压境': [['yā'], ['jìng']],
+    '压头': [['yā'], ['tóu']],
+    '压平': [['yā'], ['píng']],
+    '压延': [['yā'], ['yán']],
+    '压强': [['yā'], ['qiáng']],
+    '压惊': [['yā'], ['jīng']],
+    '压抑': [['yā'], ['yì']],
+    '压服': [['yā'], ['fú']],
+    '压条': [['yā'], ['tiáo']],
+    '压板': [['yà'], ['bǎn']],
+    '压榨': [['yā'], ['zhà']],
+    '压气': [['yā'], ['qì']],
+    '压港': [['yā'], ['gǎng']],
+    '压痛': [['yā'], ['tòng']],
+    '压秤': [['yā'], ['chèng']],
+    '压缩': [['yā'], ['suō']],
+    '压腿': [['yā'], ['tuǐ']],
+    '压船': [['yā'], ['chuán']],
+    '压蔓': [['yā'], ['wàn']],
+    '压货': [['yā'], ['huò']],
+    '压车': [['yā'], ['chē']],
+    '压轴': [['yā'], ['zhòu']],
+    '压迫': [['yā'], ['pò']],
+    '压队': [['yā'], ['duì']],
+    '压阵': [['yā'], ['zhèn']],
+    '压顶': [['yā'], ['dǐng']],
+    '厌恶': [['yàn'], ['wù']],
+    '厘正': [['lí'], ['zhèng']],
+    '厚度': [['hòu'], ['dù']],
+    '厚待': [['hòu'], ['dài']],
+    '厚朴': [['hòu'], ['pò']],
+    '厚片': [['hòu'], ['piàn']],
+    '厚薄': [['hòu'], ['báo']],
+    '厚重': [['hòu'], ['zhòng']],
+    '原价': [['yuán'], ['jià']],
+    '原任': [['yuán'], ['rèn']],
+    '原地': [['yuán'], ['dì']],
+    '原处': [['yuán'], ['chǔ']],
+    '原委': [['yuán'], ['wěi']],
+    '原汤': [['yuán'], ['tāng']],
+    '原浆': [['yuán'], ['jiāng']],
+    '原著': [['yuán'], ['zhù']],
+    '厦门': [['xià'], ['mén']],
+    '厮打': [['sī'], ['dǎ']],
+    '厮混': [['sī'], ['hùn']],
+    '去任': [['qù'], ['rèn']],
+    '去处': [['qù'], ['chù']],
+    '县令': [['xiàn'], ['lìng']],
+    '县份': [['xiàn'], ['fèn']],
+    '县委': [['xiàn'], ['wěi']],
+    '县尉': [['xiàn'], ['wèi']],
+    '县治': [['xiàn'], ['zhì']],
+    '县长': [['xiàn'], ['zhǎng']],
+    '参与': [['cān'], ['yù']],
+    '参事': [['cān'], ['shì']],
+    '参军': [['cān'], ['jūn']],
+    '参加': [['cān'], ['jiā']],
+    '参劾': [['cān'], ['hé']],
+    '参半': [['cān'], ['bàn']],
+    '参合': [['cān'], ['hé']],
+    '参商': [['shēn'], ['shāng']],
+    '参天': [['cān'], ['tiān']],
+    '参展': [['cān'], ['zhǎn']],
+    '参差': [['cēn'], ['cī']],
+    '参悟': [['cān'], ['wù']],
+    '参战': [['cān'], ['zhàn']],
+    '参拜': [['cān'], ['bài']],
+    '参政': [['cān'], ['zhèng']],
+    '参数': [['cān'], ['shù']],
+    '参杂': [['cān'], ['zá']],
+    '参校': [['cān'], ['jiào']],
+    '参检': [['cān'], ['jiǎn']],
+    '参照': [['cān'], ['zhào']],
+    '参看': [['cān'], ['kàn']],
+    '参禅': [['cān'], ['chán']],
+    '参考': [['cān'], ['kǎo']],
+    '参茸': [['shēn'], ['róng']],
+    '参见': [['cān'], ['jiàn']],
+    '参观': [['cān'], ['guān']],
+    '参议': [['cān'], ['yì']],
+    '参访': [['cān'], ['fǎng']],
+    '参谋': [['cān'], ['móu']],
+    '参谒': [['cān'], ['yè']],
+    '参赛': [['cān'], ['sài']],
+    '参赞': [['cān'], ['zàn']],
+    '参选': [['cān'], ['xuǎn']],
+    '参透': [['cān'], ['tòu']],
+    '参酌': [['cān'], ['zhuó']],
+    '参量': [['cān'], ['liàng']],
+    '参错': [['cēn'], ['cuò']],
+    '参阅': [['cān'], ['yuè']],
+    '参预': [['cān'], ['yù']],
+    '叉儿': [['chā'], ['er']],
+    '叉子': [['chā'], ['zǐ']],
+    '叉开': [['chǎ'], ['kāi']],
+    '叉手': [['chā'], ['shǒu']],
+    '叉烧': [['chā'], ['shāo']],
+    '叉腰': [['chā'], ['yāo']],
+    '叉路': [['chā'], ['lù']],
+    '叉车': [['chā'], ['chē']],
+    '友好': [['yǒu'], ['hǎo']],
+    '双亲': [['shuāng'], ['qīn']],
+    '双打': [['shuāng'], ['dǎ']],
+    '双抢': [['shuāng'], ['qiǎng']],
+    '双杠': [['shuāng'], ['gàng']],
+    '双栖': [['shuāng'], ['qī']],
+    '双重': [['shuāng'], ['chóng']],
+    '反侧': [['fǎn'], ['cè']],
+    '反倒': [['fǎn'], ['dào']],
+    '反冲': [['fǎn'], ['chōng']],
+    '反切': [['fǎn'], ['qiè']],
+    '反射': [['fǎn'], ['shè']],
+    '反差': [['fǎn'], ['chà']],
+    '反应': [['fǎn'], ['yìng']],
+    '反弹': [['fǎn'], ['dàn']],
+    '反思': [['fǎn'], ['sī']],
+    '反把': [['fǎn'], ['bǎ']],
+    '反正': [['fǎn'], ['zhèng']],
+    '反省': [['fǎn'], ['xǐng']],
+    '反观': [['fǎn'], ['guān']],
+    '反诘': [['fǎn'], ['jié']],
+    '反语': [['fǎn'], ['yǔ']],
+    '反调': [['fǎn'], ['diào']],
+    '反转': [['fǎn'], ['zhuǎn']],
+    '反间': [['fǎn'], ['jiàn']],
+    '反骨': [['fǎn'], ['gǔ']],
+    '发丧': [['fā'], ['sāng']],
+    '发乳': [['fà'], ['rǔ']],
+    '发亮': [['fā'], ['liàng']],
+    '发付': [['fā'], ['fù']],
+    '发令': [['fā'], ['lìng']],
+    '发作': [['fā'], ['zuò']],
+    '发信': [['fā'], ['xìn']],
+    '发傻': [['fā'], ['shǎ']],
+    '发光': [['fā'], ['guāng']],
+    '发兵': [['fā'], ['bīng']],
+    '发冷': [['fā'], ['lěng']],
+    '发凡': [['fā'], ['fán']],
+    '发出': [['fā'], ['chū']],
+    '发函': [['fā'], ['hán']],
+    '发刊': [['fā'], ['kān']],
+    '发刷': [['fà'], ['shuā']],
+    '发动': [['fā'], ['dòng']],
+    '发包': [['fā'], ['bāo']],
+    '发单': [['fā'], ['dān']],
+    '发卡': [['fà'], ['qiǎ']],
+    '发发': [['fā'], ['fā']],
+    '发呆': [['fā'], ['dāi']],
+    '发售': [['fā'], ['shòu']],
+    '发喘': [['fā'], ['chuǎn']],
+    '发嗲': [['fā'], ['diǎ']],
+    '发困': [['fā'], ['kùn']],
+    '发坏': [['fā'], ['huài']],
+    '发型': [['fà'], ['xíng']],
+    '发声': [['fā'], ['shēng']],
+    '发夹': [['fā'], ['jiā']],
+    '发奋': [['fā'], ['fèn']],
+    '发奖': [['fā'], ['jiǎng']],
+    '发妻': [['fà'], ['qī']],
+    '发威': [['fā'], ['wēi']],
+    '发家': [['fā'], ['jiā']],
+    '发射': [['fā'], ['shè']],
+    '发屋': [['fà'], ['wū']],
+    '发展': [['fā'], ['zhǎn']],
+    '发市': [['fā'], ['shì']],
+    '发布': [['fā'], ['bù']],
+    '发帖': [['fā'], ['tiē']],
+    '发廊': [['fà'], ['láng']],
+    '发式': [['fà'], ['shì']],
+    '发引': [['fā'], ['yǐn']],
+    '发怒': [['fā'], ['nù']],
+    '发怔': [['fā'], ['zhèng']],
+    '发急': [['fā'], ['jí']],
+    '发怵': [['fā'], ['chù']],
+    '发情': [['fā'], ['qíng']],
+    '发愁': [['fā'], ['chóu']],
+    '发愣': [['fā'], ['lèng']],
+    '发愤': [['fā'], ['fèn']],
+    '发愿': [['fā'], ['yuàn']],
+    '发慌': [['fā'], ['huāng']],
+    '发憷': [['fā'], ['chù']],
+    '发懒': [['fā'], ['lǎn']],
+    '发懵': [['fā'], ['měng']],
+    '发扬': [['fā'], ['yáng']],
+    '发抖': [['fā'], ['dǒu']],
+    '发报': [['fā'], ['bào']],
+    '发指': [['fà'], ['zhǐ']],
+    '发挥': [['fā'], ['huī']],
+    '发排': [['fā'], ['pái']],
+    '发掘': [['fā'], ['jué']],
+    '发放': [['fā'], ['fàng']],
+    '发散': [['fā'], ['sàn']],
+    '发文': [['fā'], ['wén']],
+    '发明': [['fā'], ['míng']],
+    '发昏': [['fā'], ['hūn']],
+    '发晕': [['fā'], ['yūn']],
+    '发木': [['fā'], ['mù']],
+    '发条': [['fā'], ['tiáo']],
+    '发标': [['fā'], ['biāo']],
+    '发根': [['fā'], ['gēn']],
+    '发案': [['fā'], ['àn']],
+    '发楞': [['fā'], ['léng']],
+    '发榜': [['fā'], ['bǎng']],
+    '发横': [['fā'], ['héng']],
+    '发毛': [['fā'], ['máo']],
+    '发气': [['fā'], ['qì']],
+    '发水': [['fā'], ['shuǐ']],
+    '发汗': [['fā'], ['hàn']],
+    '发泄': [['fā'], ['xiè']],
+    '发涩': [['fā'], ['sè']],
+    '发源': [['fā'], ['yuán']],
+    '发火': [['fā'], ['huǒ']],
+    '发炎': [['fā'], ['yán']],
+    '发点': [['fā'], ['diǎn']],
+    '发烧': [['fā'], ['shāo']],
+    '发烫': [['fā'], ['tàng']],
+    '发热': [['fā'], ['rè']],
+    '发牌': [['fā'], ['pái']],
+    '发物': [['fā'], ['wù']],
+    '发狂': [['fā'], ['kuáng']],
+    '发狠': [['fā'], ['hěn']],
+    '发现': [['fā'], ['xiàn']],
+    '发球': [['fā'], ['qiú']],
+    '发生': [['fā'], ['shēng']],
+    '发电': [['fā'], ['diàn']],
+    '发疯': [['fā'], ['fēng']],
+    '发病': [['fā'], ['bìng']],
+    '发痒': [['fā'], ['yǎng']],
+    '发痧': [['fā'], ['shā']],
+    '发痴': [['fā'], ['chī']],
+    '发癣': [['fà'], ['xuǎn']],
+    '发白': [['fā'], ['bái']],
+    '发祥': [['fā'], ['xiáng']],
+    '发票': [['fā'], ['piào']],
+    '发福': [['fā'], ['fú']],
+    '发稿': [['fā'], ['gǎo']],
+    '发窘': [['fā'], ['jiǒng']],
+    '发端': [['fā'], ['duān']],
+    '发笑': [['fā'], ['xiào']],
+    '发箍': [['fà'], ['gū']],
+    '发粉': [['fā'], ['fěn']],
+    '发糕': [['fā'], ['gāo']],
+    '发红': [['fā'], ['hóng']],
+    '发给': [['fā'], ['gěi']],
+    '发网': [['fā'], ['wǎng']],
+    '发育': [['fā'], ['yù']],
+    '发胀': [['fā'], ['zhàng']],
+    '发胖': [['fā'], ['pàng']],
+    '发胶': [['fā'], ['jiāo']],
+    '发花': [['fā'], ['huā']],
+    '发芽': [['fā'], ['yá']],
+    '发菜': [['fà'], ['cài']],
+    '发落': [['fā'], ['luò']],
+    '发蒙': [['fā'], ['mēng']],
+    '发蔫': [['fā'], ['niān']],
+    '发薪': [['fā'], ['xīn']],
+    '发虚': [['fā'], ['xū']],
+    '发蜡': [['fà'], ['là']],
+    '发行': [['fā'], ['xíng']],
+    '发表': [['fā'], ['biǎo']],
+    '发觉': [['fā'], ['jué']],
+    '发言': [['fā'], ['yán']],
+    '发誓': [['fā'], ['shì']],
+    '发话': [['fā'], ['huà']],
+    '发财': [['fā'], ['cái']],
+    '发货': [['fā'], ['huò']],
+    '发起': [['fā'], ['qǐ']],
+    '发躁': [['fā'], ['zào']],
+    '发车': [['fā'], ['chē']],
+    '发轫': [['fā'], ['rèn']],
+    '发软': [['fā'], ['ruǎn']],
+    '发辫': [['fà'], ['biàn']],
+    '发达': [['fā'], ['dá']],
+    '发运': [['fā'], ['yùn']],
+    '发还': [['fā'], ['huán']],
+    '发迹': [['fā'], ['jì']],
+    '发送': [['fā'], ['sòng']],
+    '发配': [['fā'], ['pèi']],
+    '发酵': [['fā'], ['jiào']],
+    '发酸': [['fā'], ['suān']],
+    '发问': [['fā'], ['wèn']],
+    '发闷': [['fā'], ['mèn']],
+    '发际': [['fà'], ['jì']],
+    '发难': [['fā'], ['nàn']],
+    '发霉': [['fā'], ['méi']],
+    '发露': [['fā'], ['lù']],
+    '发青': [['fā'], ['qīng']],
+    '发面': [['fā'], ['miàn']],
+    '发音': [['fā'], ['yīn']],
+    '发颤': [['fā'], ['chàn']],
+    '发飘': [['fā'], ['piāo']],
+    '发饷': [['fā'], ['xiǎng']],
+    '发髻': [['fà'], ['jì']],
+    '发鬓': [['fà'], ['bìn']],
+    '发麻': [['fā'], ['má']],
+    '叔伯': [['shū'], ['bó']],
+    '叔父': [['shū'], ['fù']],
+    '取乐': [['qǔ'], ['lè']],
+    '取信': [['qǔ'], ['xìn']],
+    '取得': [['qǔ'], ['de']],
+    '取景': [['qǔ'], ['jǐng']],
+    '取给': [['qǔ'], ['gěi']],
+    '取齐': [['qǔ'], ['qí']],
+    '受凉': [['shòu'], ['liáng']],
+    '受教': [['shòu'], ['jiào']],
+    '受洗': [['shòu'], ['xǐ']],
+    '受看': [['shòu'], ['kàn']],
+    '受累': [['shòu'], ['lěi']],
+    '受过': [['shòu'], ['guò']],
+    '受降': [['shòu'], ['xiáng']],
+    '受难': [['shòu'], ['nàn']],
+    '变价': [['biàn'], ['jià']],
+    '变体': [['biàn'], ['tǐ']],
+    '变化': [['biàn'], ['huà']],
+    '变压': [['biàn'], ['yā']],
+    '变坏': [['biàn'], ['huài']],
+    '变数': [['biàn'], ['shù']],
+    '变更': [['biàn'], ['gēng']],
+    '变相': [['biàn'], ['xiàng']],
+    '变种': [['biàn'], ['zhǒng']],
+    '变节': [['biàn'], ['jié']],
+    '变调': [['biàn'], ['diào']],
+    '变量': [['biàn'], ['liàng']],
+    '叙别': [['xù'], ['bié']],
+    '叙说': [['xù'], ['shuō']],
+    '口令': [['kǒu'], ['lìng']],
+    '口传': [['kǒu'], ['chuán']],
+    '口供': [['kǒu'], ['gòng']],
+    '口信': [['kǒu'], ['xìn']],
+    '口北': [['kǒu'], ['běi']],
+    '口号': [['kǒu'], ['hào']],
+    '口头': [['kǒu'], ['tóu']],
+    '口子': [['kǒu'], ['zi']],
+    '口服': [['kǒu'], ['fú']],
+    '口称': [['kǒu'], ['chēng']],
+    '口红': [['kǒu'], ['hóng']],
+    '口臭': [['kǒu'], ['chòu']],
+    '口觉': [['kǒu'], ['jué']],
+    '口角': [['kǒu'], ['jué']],
+    '口语': [['kǒu'], ['yǔ']],
+    '口重': [['kǒu'], ['zhòng']],
+    '古体': [['gǔ'], ['tǐ']],
+    '古刹': [['gǔ'], ['chà']],
+    '古奥': [['gǔ'], ['ào']],
+    '古朴': [['gǔ'], ['piáo']],
+    '古语': [['gǔ'], ['yǔ']],
+    '古远': [['gǔ'], ['yuǎn']],
+    '古都': [['gǔ'], ['dū']],
+    '古风': [['gǔ'], ['fēng']],
+    '句号': [['jù'], ['hào']],
+    '句型': [['jù'], ['xíng']],
+    '句子': [['jù'], ['zi']],
+    '句式': [['jù'], ['shì']],
+    '句法': [['jù'], ['fǎ']],
+    '句点': [['jù'], ['diǎn']],
+    '句读': [['jù'], ['dòu']],
+    '另行': [['lìng'], ['xíng']],
+    '叨光': [['tāo'], ['guāng']],
+    '叨叨': [['dāo'], ['dāo']],
+    '叨咕': [['dáo'], ['gu']],
+    '叨唠': [['dāo'], ['láo']],
+    '叨念': [['dāo'], ['niàn']],
+    '叨扰': [['tāo'], ['rǎo']],
+    '叨拢': [['tāo'], ['lǒng']],
+    '叨陪': [['tāo'], ['péi']],
+    '叩头': [['kòu'], ['tóu']],
+    '叩见': [['kòu'], ['jiàn']],
+    '只好': [['zhǐ'], ['hǎo']],
+    '只字': [['zhī'], ['zì']],
+    '只当': [['zhǐ'], ['dāng']],
+    '只得': [['zhǐ'], ['de']],
+    '只怕': [['zhǐ'], ['pà']],
+    '只是': [['zhǐ'], ['shì']],
+    '只有': [['zhǐ'], ['yǒu']],
+    '只此': [['zhī'], ['cǐ']],
+    '只消': [['zhǐ'], ['xiāo']],
+    '只管': [['zhǐ'], ['guǎn']],
+    '只能': [['zhǐ'], ['néng']],
+    '只要': [['zhǐ'], ['yào']],
+    '只见': [['zhī'], ['jiàn']],
+    '只身': [['zhī'], ['shēn']],
+    '只顾': [['zhǐ'], ['gù']],
+    '叫价': [['jiào'], ['jià']],
+    '叫劲': [['jiào'], ['jìn']],
+    '叫化': [['jiào'], ['huà']],
+    '叫号': [['jiào'], ['hào']],
+    '叫嚷': [['jiào'], ['rǎng']],
+    '叫好': [['jiào'], ['hǎo']],
+    '召募': [['zhào'], ['mù']],
+    '召唤': [['zhào'], ['huàn']],
+    '召回': [['zhào'], ['huí']],
+    '召开': [['zhào'], ['kāi']],
+    '召祸': [['zhào'], ['huò']],
+    '召见': [['zhào'], ['jiàn']],
+    '召集': [['zhào'], ['jí']],
+    '叮当': [['dīng'], ['dāng']],
+    '可不': [['kě'], ['bù']],
+    '可乐': [['kě'], ['lè']],
+    '可乘': [['kě'], ['chéng']],
+    '可亲': [['kě'], ['qīn']],
+    '可人': [['kě'], ['rén']],
+    '可以': [['kě'], ['yǐ']],
+    '可信': [['kě'], ['xìn']],
+    '可取': [['kě'], ['qǔ']],
+    '可变': [['kě'], ['biàn']],
+    '可口': [['kě'], ['kǒu']],
+    '可可': [['kě'], ['kě']],
+    '可叹': [['kě'], ['tàn']],
+    '可否': [['kě'], ['fǒu']],
+    '可听': [['kě'], ['tīng']],
+    '可喜': [['kě'], ['xǐ']],
+    '可嘉': [['kě'], ['jiā']],
+    '可好': [['kě'], ['hǎo']],
+    '可巧': [['kě'], ['qiǎo']],
+    '可心': [['kě'], ['xīn']],
+    '可怕': [['kě'], ['pà']],
+    '可怖': [['kě'], ['bù']],
+    '可怜': [['kě'], ['lián']],
+    '可恨': [['kě'], ['hèn']],
+    '可恶': [['kě'], ['wù']],
+    '可恼': [['kě'], ['nǎo']],
+    '可悲': [['kě'], ['bēi']],
+    '可惜': [['kě'], ['xī']],
+    '可意': [['kě'], ['yì']],
+    '可憎': [['kě'], ['zēng']],
+    '可敬': [['kě'], ['jìng']],
+    '可是': [['kě'], ['shì']],
+    '可曾': [['kě'], ['zēng']],
+    '可望': [['kě'], ['wàng']],
+    '可欺': [['kě'], ['qī']],
+    '可气': [['kě'], ['qì']],
+    '可汗': [['kè'], ['hán']],
+    '可爱': [['kě'], ['ài']],
+    '可疑': [['kě'], ['yí']],
+    '可着': [['kě'], ['zhe']],
+    '可知': [['kě'], ['zhī']],
+    '可笑': [['kě'], ['xiào']],
+    '可耻': [['kě'], ['chǐ']],
+    '可能': [['kě'], ['néng']],
+    '可行': [['kě'], ['xíng']],
+    '可见': [['kě'], ['jiàn']],
+    '可观': [['kě'], ['guān']],
+    '可谓': [['kě'], ['wèi']],
+    '可贵': [['kě'], ['guì']],
+    '可逆': [['kě'], ['nì']],
+    '可鄙': [['kě'], ['bǐ']],
+    '可鉴': [['kě'], ['jiàn']],
+    '可靠': [['kě'], ['kào']],
+    '台下': [['tái'], ['xià']],
+    '台中': [['tái'], ['zhōng']],
+    '台北': [['tái'], ['běi']],
+    '台历': [['tái'], ['lì']],
+    '台地': [['tái'], ['dì']],
+    '台基': [['tái'], ['jī']],
+    '台子': [['tái'], ['zi']],
+    '台安': [['tái'], ['ān']],
+    '台州': [['tāi'], ['zhōu']],
+    '台布': [['tái'], ['bù']],
+    '台座': [['tái'], ['zuò']],
+    '台扇': [['tái'], ['shàn']],
+    '台榭': [['tái'], ['xiè']],
+    '台步': [['tái'], ['bù']],
+    '台灯': [['tái'], ['dēng']],
+    '台球': [['tái'], ['qiú']],
+    '台甫': [['tái'], ['fǔ']],
+    '台盘': [['tái'], ['pán']],
+    '台秤': [['tái'], ['chèng']],
+    '台胞': [['tái'], ['bāo']],
+    '台观': [['tái'], ['guàn']],
+    '台词': [['tái'], ['cí']],
+    '台资': [['tái'], ['zī']],
+    '台鉴': [['tái'], ['jiàn']],
+    '台钟': [['tái'], ['zhōng']],
+    '台长': [['tái'], ['zhǎng']],
+    '台阁': [['tái'], ['gé']],
+    '台阶': [['tái'], ['jiē']],
+    '台面': [['tái'], ['miàn']],
+    '台风': [['tái'], ['fēng']],
+    '台驾': [['tái'], ['jià']],
+    '叱令': [['chì'], ['lìng']],
+    '叱咤': [['chì'], ['zhà']],
+    '叱喝': [['chì'], ['hè']],
+    '史乘': [['shǐ'], ['shèng']],
+    '史家': [['shǐ'], ['jiā']],
+    '史论': [['shǐ'], ['lùn']],
+    '右侧': [['yòu'], ['cè']],
+    '右臂': [['yòu'], ['bì']],
+    '右行': [['yòu'], ['xíng']],
+    '叶叶': [['yè'], ['yè']],
+    '叶子': [['yè'], ['zi']],
+    '叶序': [['yè'], ['xù']],
+    '叶枝': [['yè'], ['zhī']],
+    '叶柄': [['yè'], ['bǐng']],
+    '叶片': [['yè'], ['piàn']],
+    '叶猴': [['yè'], ['hóu']],
+    '叶肉': [['yè'], ['ròu']],
+    '叶脉': [['yè'], ['mài']],
+    '叶腋': [['yè'], ['yè']],
+    '叶蜂': [['yè'], ['fēng']],
+    '叶轮': [['yè'], ['lún']],
+    '叶酸': [['yè'], ['suān']],
+    '叶面': [['yè'], ['miàn']],
+    '叶鞘': [['yè'], ['qiào']],
+    '叶韵': [['xié'], ['yùn']],
+    '号丧': [['háo'], ['sāng']],
+    '号令': [['hào'], ['lìng']],
+    '号兵': [['hào'], ['bīng']],
+    '号叫': [['háo'], ['jiào']],
+    '号召': [['hào'], ['zhào']],
+    '号哭': [['hào'], ['kū']],
+    '号啕': [['háo'], ['táo']],
+    '号型': [['hào'], ['xíng']],
+    '号外': [['hào'], ['wài']],
+    '号头': [['hào'], ['tóu']],
+    '号子': [['hào'], ['zǐ']],
+    '号房': [['hào'], ['fáng']],
+    '号手': [['hào'], ['shǒu']],
+    '号数': [['hào'], ['shù']],
+    '号灯': [['hào'], ['dēng']],
+    '号炮': [['hào'], ['pào']],
+    '号牌': [['hào'], ['pái']],
+    '号码': [['hào'], ['mǎ']],
+    '号称': [['hào'], ['chēng']],
+    '号筒': [['hào'], ['tǒng']],
+    '号脉': [['hào'], ['mài']],
+    '号衣': [['hào'], ['yī']],
+    '号角': [['hào'], ['jiǎo']],
+    '司令': [['sī'], ['lìng']],
+    '司南': [['sī'], ['nán']],
+    '司空': [['sī'], ['kōng']],
+    '司长': [['sī'], ['zhǎng']],
+    '叹服': [['tàn'], ['fú']],
+    '吁吁': [['xū'], ['xū']],
+    '吁求': [['yù'], ['qiú']],
+    '吁请': [['yù'], ['qǐng']],
+    '吃劲': [['chī'], ['jìn']],
+    '吃喝': [['chī'], ['hē']],
+    '吃相': [['chī'], ['xiàng']],
+    '吃重': [['chī'], ['zhòng']],
+    '吃食': [['chī'], ['shí']],
+    '各个': [['gè'], ['gè']],
+    '各人': [['gè'], ['rén']],
+    '各位': [['gè'], ['wèi']],
+    '各别': [['gè'], ['bié']],
+    '各半': [['gè'], ['bàn']],
+    '各处': [['gè'], ['chù']],
+    '各样': [['gè'], ['yàng']],
+    '各界': [['gè'], ['jiè']],
+    '各种': [['gè'], ['zhǒng']],
+    '各级': [['gè'], ['jí']],
+    '各自': [['gè'], ['zì']],
+    '各色': [['gè'], ['sè']],
+    '吆喝': [['yāo'], ['hē']],
+    '合一': [['hé'], ['yī']],
+    '合乎': [['hé'], ['hū']],
+    '合于': [['hé'], ['yú']],
+    '合伙': [['hé'], ['huǒ']],
+    '合体': [['hé'], ['tǐ']],
+    '合作': [['hé'], ['zuò']],
+    '合共': [['hé'], ['gòng']],
+    '合击': [['hé'], ['jī']],
+    '合刊': [['hé'], ['kān']],
+    '合力': [['hé'], ['lì']],
+    '合办': [['hé'], ['bàn']],
+    '合十': [['hé'], ['shí']],
+    '合口': [['hé'], ['kǒu']],
+    '合叶': [['hé'], ['yè']],
+    '合同': [['hé'], ['tóng']],
+    '合唱': [['hé'], ['chàng']],
+    '合围': [['hé'], ['wéi']],
+    '合声': [['hé'], ['shēng']],
+    '合奏': [['hé'], ['zòu']],
+    '合子': [['hé'], ['zǐ']],
+    '合宜': [['hé'], ['yí']],
+    '合家': [['hé'], ['jiā']],
+    '合并': [['hé'], ['bìng']],
+    '合度': [['hé'], ['dù']],
+    '合式': [['hé'], ['shì']],
+    '合当': [['hé'], ['dāng']],
+    '合影': [['hé'], ['yǐng']],
+    '合心': [['hé'], ['xīn']],
+    '合情': [['hé'], ['qíng']],
+    '合意': [['hé'], ['yì']],
+    '合成': [['hé'], ['chéng']],
+    '合手': [['hé'], ['shǒu']],
+    '合抱': [['hé'], ['bào']],
+    '合拍': [['hé'], ['pāi']],
+    '合拢': [['hé'], ['lǒng']],
+    '合掌': [['hé'], ['zhǎng']],
+    '合数': [['hé'], ['shù']],
+    '合时': [['hé'], ['shí']],
+    '合格': [['hé'], ['gé']],
+    '合欢': [['hé'], ['huān']],
+    '合法': [['hé'], ['fǎ']],
+    '合流': [['hé'], ['liú']],
+    '合浦': [['hé'], ['pǔ']],
+    '合演': [['hé'], ['yǎn']],
+    '合照': [['hé'], ['zhào']],
+    '合理': [['hé'], ['lǐ']],
+    '合璧': [['hé'], ['bì']],
+    '合用': [['hé'], ['yòng']],
+    '合眼': [['hé'], ['yǎn']],
+    '合着': [['hé'], ['zhe']],
+    '合算': [['hé'], ['suàn']],
+    '合约': [['hé'], ['yuē']],
+    '合编': [['hé'], ['biān']],
+    '合缝': [['hé'], ['fèng']],
+    '合署': [['hé'], ['shǔ']],
+    '合群': [['hé'], ['qún']],
+    '合股': [['hé'], ['gǔ']],
+    '合肥': [['hé'], ['féi']],
+    '合脚': [['hé'], ['jiǎo']],
+    '合营': [['hé'], ['yíng']],
+    '合著': [['hé'], ['zhù']],
+    '合葬': [['hé'], ['zàng']],
+    '合计': [['hé'], ['jì']],
+    '合议': [['hé'], ['yì']],
+    '合该': [['hé'], ['gāi']],
+    '合谋': [['hé'], ['móu']],
+    '合资': [['hé'], ['zī']],
+    '合身': [['hé'], ['shēn']],
+    '合辙': [['hé'], ['zhé']],
+    '合适': [['hé'], ['shì']],
+    '合金': [['hé'], ['jīn']],
+    '合页': [['hé'], ['yè']],
+    '合龙': [['hé'], ['lóng']],
+    '吉期': [['jí'], ['qī']],
+    '吊丧': [['diào'], ['sāng']],
+    '吊卷': [['diào'], ['juàn']],
+    '吊扇': [['diào'], ['shàn']],
+    '吊打': [['diào'], ['dǎ']],
+    '吊杆': [['diào'], ['gān']],
+    '吊祭': [['diào'], ['jì']],
+    '吊车': [['diào'], ['chē']],
+    '吊铺': [['diào'], ['pù']],
+    '同一': [['tóng'], ['yī']],
+    '同上': [['tóng'], ['shàng']],
+    '同业': [['tóng'], ['yè']],
+    '同义': [['tóng'], ['yì']],
+    '同乐': [['tóng'], ['lè']],
+    '同乡': [['tóng'], ['xiāng']],
+    '同事': [['tóng'], ['shì']],
+    '同人': [['tóng'], ['rén']],
+    '同仁': [['tóng'], ['rén']],
+    '同伙': [['tóng'], ['huǒ']],
+    '同伴': [['tóng'], ['bàn']],
+    '同位': [['tóng'], ['wèi']],
+    '同体': [['tóng'], ['tǐ']],
+    '同侪': [['tóng'], ['chái']],
+    '同僚': [['tóng'], ['liáo']],
+    '同党': [['tóng'], ['dǎng']],
+    '同前': [['tóng'], ['qián']],
+    '同化': [['tóng'], ['huà']],
+    '同名': [['tóng'], ['míng']],
+    '同命': [['tóng'], ['mìng']],
+    '同喜': [['tóng'], ['xǐ']],
+    '同堂': [['tóng'], ['táng']],
+    '同声': [['tóng'], ['shēng']],
+    '同好': [['tóng'], ['hào']],
+    '同姓': [['tóng'], ['xìng']],
+    '同学': [['tóng'], ['xué']],
+    '同宗': [['tóng'], ['zōng']],
+    '同室': [['tóng'], ['shì']],
+    '同居': [['tóng'], ['jū']],
+    '同屋': [['tóng'], ['wū']],
+    '同岁': [['tóng'], ['suì']],
+    '同年': [['tóng'], ['nián']],
+    '同庆': [['tóng'], ['qìng']],
+    '同庚': [['tóng'], ['gēng']],
+    '同归': [['tóng'], ['guī']],
+    '同形': [['tóng'], ['xíng']],
+    '同德': [['tóng'], ['dé']],
+    '同心': [['tóng'], ['xīn']],
+    '同志': [['tóng'], ['zhì']],
+    '同性': [['tóng'], ['xìng']],
+    '同情': [['tóng'], ['qíng']],
+    '同意': [['tóng'], ['yì']],
+    '同感': [['tóng'], ['gǎn']],
+    '同房': [['tóng'], ['fáng']],
+    '同方': [['tóng'], ['fāng']],
+    '同族': [['tóng'], ['zú']],
+    '同日': [['tóng'], ['rì']],
+    '同时': [['tóng'], ['shí']],
+    '同期': [['tóng'], ['qī']],
+    '同样': [['tóng'], ['yàng']],
+    '同案': [['tóng'], ['àn']],
+    '同欢': [['tóng'], ['huān']],
+    '同步': [['tóng'], ['bù']],
+    '同气': [['tóng'], ['qì']],
+    '同治': [['tóng'], ['zhì']],
+    '同济': [['tóng'], ['jì']],
+    '同源': [['tóng'], ['yuán']],
+    '同犯': [['tóng'], ['fàn']],
+    '同班': [['tóng'], ['bān']],
+    '同盟': [['tóng'], ['méng']],
+    '同种': [['tóng'], ['zhǒng']],
+    '同科': [['tóng'], ['kē']],
+    '同窗': [['tóng'], ['chuāng']],
+    '同等': [['tóng'], ['děng']],
+    '同类': [['tóng'], ['lèi']],
+    '同级': [['tóng'], ['jí']],
+    '同胞': [['tóng'], ['bāo']],
+    '同行': [['tóng'], ['háng']],
+    '同袍': [['tóng'], ['páo']],
+    '同调': [['tóng'], ['diào']],
+    '同谋': [['tóng'], ['móu']],
+    '同质': [['tóng'], ['zhì']],
+    '同贺': [['tóng'], ['hè']],
+    '同路': [['tóng'], ['lù']],
+    '同辈': [['tóng'], ['bèi']],
+    '同道': [['tóng'], ['dào']],
+    '同量': [['tóng'], ['liàng']],
+    '同门': [['tóng'], ['mén']],
+    '同队': [['tóng'], ['duì']],
+    '同音': [['tóng'], ['yīn']],
+    '同龄': [['tóng'], ['líng']],
+    '名分': [['míng'], ['fēn']],
+    '名刹': [['míng'], ['shā']],
+    '名单': [['míng'], ['dān']],
+    '名句': [['míng'], ['jù']],
+    '名号': [['míng'], ['hào']],
+    '名媛': [['míng'], ['yuàn']],
+    '名家': [['míng'], ['jiā']],
+    '名宿': [['míng'], ['sù']],
+    '名将': [['míng'], ['jiàng']],
+    '名帖': [['míng'], ['tiě']],
+    '名教': [['míng'], ['jiào']],
+    '名数': [['míng'], ['shù']],
+    '名片': [['míng'], ['piàn']],
+    '名称': [['míng'], ['chēng']],
+    '名簿': [['míng'], ['bù']],
+    '名节': [['míng'], ['jié']],
+    '名著': [['míng'], ['zhù']],
+    '名角': [['míng'], ['jué']],
+    '后任': [['hòu'], ['rèn']],
+    '后传': [['hòu'], ['chuán']],
+    '后凉': [['hòu'], ['liáng']],
+    '后劲': [['hòu'], ['jìn']],
+    '后台': [['hòu'], ['tái']],
+    '后场': [['hòu'], ['chǎng']],
+    '后头': [['hòu'], ['tou']],
+    '后妃': [['hòu'], ['fēi']],
+    '后妻': [['hòu'], ['qī']],
+    '后排': [['hòu'], ['pái']],
+    '后景': [['hòu'], ['jǐng']],
+    '后期': [['hòu'], ['qī']],
+    '后燕': [['hòu'], ['yàn']],
+    '后爪': [['hòu'], ['zhuǎ']],
+    '后父': [['hòu'], ['fù']],
+    '吐口': [['tǔ'], ['kǒu']],
+    '吐字': [['tǔ'], ['zì']],
+    '吐属': [['tǔ'], ['shǔ']],
+    '吐弃': [['tǔ'], ['qì']],
+    '吐气': [['tǔ'], ['qì']],
+    '吐沫': [['tù'], ['mò']],
+    '吐泻': [['tù'], ['xiè']],
+    '吐穗': [['tǔ'], ['suì']],
+    '吐絮': [['tǔ'], ['xù']],
+    '吐艳': [['tǔ'], ['yàn']],
+    '吐蕃': [['tǔ'], ['bō']],
+    '吐血': [['tù'], ['xiě']],
+    '吐露': [['tǔ'], ['lù']],
+    '向上': [['xiàng'], ['shàng']],
+    '向着': [['xiàng'], ['zhe']],
+    '向背': [['xiàng'], ['bèi']],
+    '吓人': [['xià'], ['rén']],
+    '吓唬': [['xià'], ['hǔ']],
+    '吖啶': [['ā'], ['dìng']],
+    '吗啡': [['mǎ'], ['fēi']],
+    '君子': [['jūn'], ['zi']],
+    '君王': [['jūn'], ['wáng']],
+    '吞剥': [['tūn'], ['bō']],
+    '吞吐': [['tūn'], ['tǔ']],
+    '吞咽': [['tūn'], ['yàn']],
+    '吞并': [['tūn'], ['bìng']],
+    '吞服': [['tūn'], ['fú']],
+    '吞没': [['tūn'], ['mò']],
+    '吞食': [['tūn'], ['shí']],
+    '吟哦': [['yín'], ['é']],
+    '吡咯': [['bǐ'], ['gē']],
+    '吡啶': [['bǐ'], ['dìng']],
+    '否决': [['fǒu'], ['jué']],
+    '否则': [['fǒu'], ['zé']],
+    '否定': [['fǒu'], ['dìng']],
+    '否认': [['fǒu'], ['rèn']],
+    '吧台': [['bā'], ['tái']],
+    '吧唧': [['bā'], ['jī']],
+    '吧嗒': [['bā'], ['dā']],
+    '吧女': [['bā'], ['nǚ']],
+    '含有': [['hán'], ['yǒu']],
+    '含沙': [['hán'], ['shā']],
+    '含混': [['hán'], ['hùn']],
+    '含糊': [['hán'], ['hú']],
+    '含血': [['hán'], ['xuè']],
+    '含量': [['hán'], ['liàng']],
+    '听从': [['tīng'], ['cóng']],
+    '听任': [['tīng'], ['rèn']],
+    '听会': [['tīng'], ['huì']],
+    '听便': [['tīng'], ['biàn']],
+    '听信': [['tīng'], ['xìn']],
+    '听差': [['tīng'], ['chāi']],
+    '听戏': [['tīng'], ['xì']],
+    '听见': [['tīng'], ['jiàn']],
+    '听觉': [['tīng'], ['jué']],
+    '听说': [['tīng'], ['shuō']],
+    '吭哧': [['kēng'], ['chī']],
+    '吭声': [['kēng'], ['shēng']],
+    '吭气': [['kēng'], ['qì']],
+    '启发': [['qǐ'], ['fā']],
+    '启蒙': [['qǐ'], ['méng']],
+    '启行': [['qǐ'], ['xíng']],
+    '吱吱': [['zhī'], ['zhī']],
+    '吱声': [['zhī'], ['shēng']],
+    '吱扭': [['zī'], ['niǔ']],
+    '吲哚': [['yǐn'], ['duǒ']],
+    '吴中': [['wú'], ['zhōng']],
+    '吴堡': [['wú'], ['bǔ']],
+    '吴王': [['wú'], ['wáng']],
+    '吴语': [['wú'], ['yǔ']],
+    '吵吵': [['chǎo'], ['chǎo']],
+    '吵嘴': [['chǎo'], ['zuǐ']],
+    '吵嚷': [['chǎo'], ['rǎng']],
+    '吵扰': [['chǎo'], ['rǎo']],
+    '吵架': [['chǎo'], ['jià']],
+    '吵翻': [['chǎo'], ['fān']],
+    '吵闹': [['chǎo'], ['nào']],
+    '吸毒': [['xī'], ['dú']],
+    '吸着': [['xī'], ['zhuó']],
+    '吸食': [['xī'], ['shí']],
+    '吹台': [['chuī'], ['tái']],
+    '吹嘘': [['chuī'], ['xū']],
+    '吹弹': [['chuī'], ['tán']],
+    '吹打': [['chuī'], ['dǎ']],
+    '吹拂': [['chuī'], ['fú']],
+    '吹散': [['chuī'], ['sàn']],
+    '吹沙': [['chuī'], ['shā']],
+    '吹风': [['chuī'], ['fēng']],
+    '吻别': [['wěn'], ['bié']],
+    '吻合': [['wěn'], ['hé']],
+    '吾人': [['wú'], ['rén']],
+    '吾侪': [['wú'], ['chái']],
+    '吾子': [['wú'], ['zǐ']],
+    '吾辈': [['wú'], ['bèi']],
+    '呀呀': [['yā'], ['yā']],
+    '呆头': [['dāi'], ['tóu']],
+    '呆子': [['dāi'], ['zi']],
+    '呆板': [['dāi'], ['bǎn']],
+    '呈上': [['chéng'], ['shàng']],
+    '呈正': [['chéng'], ['zhèng']],
+    '呈露': [['chéng'], ['lù']],
+    '告便': [['gào'], ['biàn']],
+    '告倒': [['gào'], ['dǎo']],
+    '告假': [['gào'], ['jià']],
+    '告别': [['gào'], ['bié']],
+    '告发': [['gào'], ['fā']],
+    '告知': [['gào'], ['zhī']],
+    '告语': [['gào'], ['yǔ']],
+    '呐喊': [['nà'], ['hǎn']],
+    '呓语': [['yì'], ['yǔ']],
+    '呕吐': [['ǒu'], ['tù']],
+    '呕哑': [['ōu'], ['yā']],
+    '呕心': [['ǒu'], ['xīn']],
+    '呕气': [['ǒu'], ['qì']],
+    '呕血': [['ǒu'], ['xuè']],
+    '呗唱': [['bài'], ['chàng']],
+    '员司': [['yuán'], ['sī']],
+    '员外': [['yuán'], ['wài']],
+    '员工': [['yuán'], ['gōng']],
+    '员警': [['yuán'], ['jǐng']],
+    '员额': [['yuán'], ['é']],
+    '呛人': [['qiàng'], ['rén']],
+    '呛到': [['qiàng'], ['dào']],
+    '呛眼': [['qiàng'], ['yǎn']],
+    '呛鼻': [['qiàng'], ['bí']],
+    '呜咽': [['wū'], ['yè']],
+    '呢喃': [['ní'], ['nán']],
+    '呢子': [['ní'], ['zǐ']],
+    '呢绒': [['ní'], ['róng']],
+    '周会': [['zhōu'], ['huì']],
+    '周折': [['zhōu'], ['zhé']],
+    '周旋': [['zhōu'], ['xuán']],
+    '周期': [['zhōu'], ['qī']],
+    '周正': [['zhōu'], ['zhēng']],
+    '周济': [['zhōu'], ['jì']],
+    '周知': [['zhōu'], ['zhī']],
+    '周转': [['zhōu'], ['zhuǎn']],
+    '周长': [['zhōu'], ['cháng']],
+    '呱呱': [['gū'], ['gū']],
+    '呱唧': [['guā'], ['jī']],
+    '呱嗒': [['guā'], ['dā']],
+    '呲牙': [['zī'], ['yá']],
+    '味觉': [['wèi'], ['jué']],
+    '呵叱': [['hē'], ['chì']],
+    '呵叻': [['kē'], ['lè']],
+    '呵呵': [['hē'], ['hē']],
+    '呵喝': [['hē'], ['hè']],
+    '呵护': [['hē'], ['hù']],
+    '呵斥': [['hē'], ['chì']],
+    '呵欠': [['hē'], ['qiàn']],
+    '呵痒': [['hē'], ['yǎng']],
+    '呵责': [['hē'], ['zé']],
+    '呼号': [['hū'], ['háo']],
+    '呼吁': [['hū'], ['yù']],
+    '呼啦': [['hū'], ['lā']],
+    '呼喝': [['hū'], ['hè']],
+    '呼应': [['hū'], ['yìng']],
+    '呼扇': [['hū'], ['shàn']],
+    '呼语': [['hū'], ['yǔ']],
+    '命中': [['mìng'], ['zhòng']],
+    '命令': [['mìng'], ['lìng']],
+    '命数': [['mìng'], ['shù']],
+    '命相': [['mìng'], ['xiāng']],
+    '命脉': [['mìng'], ['mài']],
+    '命薄': [['mìng'], ['bó']],
+    '咀嚼': [['jǔ'], ['jué']],
+    '咋办': [['zǎ'], ['bàn']],
+    '咋呼': [['zhā'], ['hū']],
+    '咋舌': [['zé'], ['shé']],
+    '和乐': [['hé'], ['lè']],
+    '和了': [['hú'], ['le']],
+    '和亲': [['hé'], ['qīn']],
+    '和会': [['hé'], ['huì']],
+    '和协': [['hé'], ['xié']],
+    '和合': [['hé'], ['hé']],
+    '和善': [['hé'], ['shàn']],
+    '和声': [['hé'], ['shēng']],
+    '和好': [['hé'], ['hǎo']],
+    '和婉': [['hé'], ['wǎn']],
+    '和尚': [['hé'], ['shàng']],
+    '和局': [['hé'], ['jú']],
+    '和平': [['hé'], ['píng']],
+    '和弄': [['huò'], ['nòng']],
+    '和弦': [['hé'], ['xián']],
+    '和悦': [['hé'], ['yuè']],
+    '和数': [['hé'], ['shù']],
+    '和文': [['hé'], ['wén']],
+    '和易': [['hé'], ['yì']],
+    '和暖': [['hé'], ['nuǎn']],
+    '和服': [['hé'], ['fú']],
+    '和棋': [['hé'], ['qí']],
+    '和气': [['hé'], ['qì']],
+    '和泥': [['huó'], ['ní']],
+    '和洽': [['hé'], ['qià']],
+    '和煦': [['hé'], ['xù']],
+    '和畅': [['hé'], ['chàng']],
+    '和睦': [['hé'], ['mù']],
+    '和硕': [['hé'], ['shuò']],
+    '和约': [['hé'], ['yuē']],
+    '和缓': [['hé'], ['huǎn']],
+    '和美': [['hé'], ['měi']],
+    '和药': [['huò'], ['yào']],
+    '和蔼': [['hé'], ['ǎi']],
+    '和衣': [['hé'], ['yī']],
+    '和衷': [['hé'], ['zhōng']],
+    '和解': [['hé'], ['jiě']],
+    '和议': [['hé'], ['yì']],
+    '和诗': [['hè'], ['shī']],
+    '和谈': [['hé'], ['tán']],
+    '和谐': [['hé'], ['xié']],
+    '和静': [['hé'], ['jìng']],
+    '和面': [['huó'], ['miàn']],
+    '和顺': [['hé'], ['shùn']],
+    '和风': [['hé'], ['fēng']],
+    '和鸣': [['hé'], ['míng']],
+    '咒语': [['zhòu'], ['yǔ']],
+    '咔嗒': [['kā'], ['dā']],
+    '咔嚓': [['kā'], ['chā']],
+    '咖啡': [['kā'], ['fēi']],
+    '咖喱': [['gā'], ['lí']],
+    '咣当': [['guāng'], ['dāng']],
+    '咧咧': [['liē'], ['liē']],
+    '咧嘴': [['liě'], ['zuǐ']],
+    '咫尺': [['zhǐ'], ['chǐ']],
+    '咬合': [['yǎo'], ['hé']],
+    '咯吱': [['gē'], ['zhī']],
+    '咯咯': [['gē'], ['gē']],
+    '咯噔': [['gē'], ['dēng']],
+    '咯血': [['kǎ'], ['xiě']],
+    '咱们': [['zán'], ['men']],
+    '咱俩': [['zán'], ['liǎ']],
+    '咱家': [['zá'], ['jiā']],
+    '咳咳': [['hāi'], ['hāi']],
+    '咳喘': [['ké'], ['chuǎn']],
+    '咳嗽': [['ké'], ['sòu']],
+    '咳血': [['ké'], ['xuè']],
+    '咽喉': [['yān'], ['hóu']],
+    '咽头': [['yān'], ['tóu']],
+    '咽气': [['yàn'], ['qì']],
+    '咽炎': [['yān'], ['yán']],
+    '咿呀': [['yī'], ['yā']],
+    '哀乐': [['āi'], ['yuè']],
+    '哀号': [['āi'], ['háo']],
+    '哀家': [['āi'], ['jiā']],
+    '哀思': [['āi'], ['sī']],
+    '哀矜': [['āi'], ['jīn']],
+    '品种': [['pǐn'], ['zhǒng']],
+    '品系': [['pǐn'], ['xì']],
+    '品红': [['pǐn'], ['hóng']],
+    '品绿': [['pǐn'], ['lǜ']],
+    '品节': [['pǐn'], ['jié']],
+    '品行': [['pǐn'], ['xíng']],
+    '哄人': [['hǒng'], ['rén']],
+    '哄传': [['hōng'], ['chuán']],
+    '哄劝': [['hǒng'], ['quàn']],
+    '哄动': [['hōng'], ['dòng']],
+    '哄哄': [['hǒng'], ['hǒng']],
+    '哄场': [['hòng'], ['chǎng']],
+    '哄堂': [['hōng'], ['táng']],
+    '哄弄': [['hǒng'], ['nòng']],
+    '哄抢': [['hōng'], ['qiǎng']],
+    '哄抬': [['hōng'], ['tái']],
+    '哄然': [['hōng'], ['rán']],
+    '哄笑': [['hōng'], ['xiào']],
+    '哄诱': [['hǒng'], ['yòu']],
+    '哄逗': [['hǒng'], ['dòu']],
+    '哄闹': [['hōng'], ['nào']],
+    '哄骗': [['hǒng'], ['piàn']],
+    '哇哇': [['wā'], ['wā']],
+    '哇啦': [['wā'], ['lā']],
+    '哇塞': [['wā'], ['sāi']],
+    '哈哈': [['hā'], ['hā']],
+    '哈喇': [['hā'], ['lǎ']],
+    '哈密': [['hā'], ['mì']],
+    '哈欠': [['hā'], ['qiàn']],
+    '哈气': [['hā'], ['qì']],
+    '哈罗': [['hā'], ['luó']],
+    '哈腰': [['hā'], ['yāo']],
+    '哈达': [['hǎ'], ['dá']],
+    '响头': [['xiǎng'], ['tóu']],
+    '响应': [['xiǎng'], ['yìng']],
+    '响度': [['xiǎng'], ['dù']],
+    '哎呀': [['āi'], ['yā']],
+    '哎哟': [['āi'], ['yō']],
+    '哑剧': [['yǎ'], ['jù']],
+    '哑口': [['yǎ'], ['kǒu']],
+    '哑哑': [['yā'], ['yā']],
+    '哑场': [['yǎ'], ['chǎng']],
+    '哑子': [['yǎ'], ['zǐ']],
+    '哑巴': [['yǎ'], ['bā']],
+    '哑火': [['yǎ'], ['huǒ']],
+    '哑炮': [['yǎ'], ['pào']],
+    '哑然': [['yǎ'], ['rán']],
+    '哑语': [['yǎ'], ['yǔ']],
+    '哑谜': [['yǎ'], ['mí']],
+    '哑铃': [['yǎ'], ['líng']],
+    '哗众': [['huá'], ['zhòng']],
+    '哗变': [['huá'], ['biàn']],
+    '哗哗': [['huā'], ['huā']],
+    '哗啦': [['huā'], ['lā']],
+    '哗然': [['huá'], ['rán']],
+    '哗笑': [['huá'], ['xiào']],
+    '哥们': [['gē'], ['men']],
+    '哧溜': [['chī'], ['liū']],
+    '哨卡': [['shào'], ['qiǎ']],
+    '哪个': [['něi'], ['gè']],
+    '哪些': [['něi'], ['xiē']],
+    '哪位': [['nǎ'], ['wèi']],
+    '哪儿': [['nǎ'], ['ér']],
+    '哪吒': [['né'], ['zhā']],
+    '哪怕': [['nǎ'], ['pà']],
+    '哪样': [['nǎ'], ['yàng']],
+    '哪能': [['nǎ'], ['néng']],
+    '哪里': [['nǎ'], ['lǐ']],
+    '哭丧': [['kū'], ['sāng']],
+    '哲思': [['zhé'], ['sī']],
+    '哽咽': [['gěng'], ['yè']],
+    '哽塞': [['gěng'], ['sè']],
+    '唇膏': [['chún'], ['gāo']],
+    '唇裂': [['chún'], ['liè']],
+    '唏嘘': [['xī'], ['xū']],
+    '唛头': [['mà'], ['tóu']],
+    '唠叨': [['láo'], ['dāo']],
+    '唠唠': [['lào'], ['lào']],
+    '唠嗑': [['lào'], ['kē']],
+    '唠扯': [['lào'], ['chě']],
+    '唢呐': [['suǒ'], ['nà']],
+    '唤头': [['huàn'], ['tou']],
+    '唱和': [['chàng'], ['hè']],
+    '唱头': [['chàng'], ['tóu']],
+    '啁啾': [['zhōu'], ['jiū']],
+    '商会': [['shāng'], ['huì']],
+    '商兑': [['shāng'], ['duì']],
+    '商号': [['shāng'], ['hào']],
+    '商场': [['shāng'], ['chǎng']],
+    '商家': [['shāng'], ['jiā']],
+    '商港': [['shāng'], ['gǎng']],
+    '商约': [['shāng'], ['yuē']],
+    '商行': [['shāng'], ['háng']],
+    '商调': [['shāng'], ['diào']],
+    '商贾': [['shāng'], ['gǔ']],
+    '商量': [['shāng'], ['liáng']],
+    '啥子': [['shá'], ['zi']],
+    '啪嗒': [['pā'], ['dā']],
+    '啮合': [['niè'], ['hé']],
+    '啼血': [['tí'], ['xuè']],
+    '喀什': [['kā'], ['shí']],
+    '喀吧': [['kā'], ['ba']],
+    '喀嚓': [['kā'], ['chā']],
+    '喂食': [['wèi'], ['shí']],
+    '善处': [['shàn'], ['chǔ']],
+    '善恶': [['shàn'], ['è']],
+    '善行': [['shàn'], ['xíng']],
+    '喇嘛': [['lǎ'], ['ma']],
+    '喉头': [['hóu'], ['tóu']],
+    '喉结': [['hóu'], ['jié']],
+    '喋喋': [['dié'], ['dié']],
+    '喋血': [['dié'], ['xuè']],
+    '喔唷': [['ō'], ['yō']],
+    '喔喔': [['wō'], ['wō']],
+    '喜乐': [['xǐ'], ['lè']],
+    '喜信': [['xǐ'], ['xìn']],
+    '喜兴': [['xǐ'], ['xìng']],
+    '喜好': [['xǐ'], ['hào']],
+    '喜帖': [['xǐ'], ['tiě']],
+    '喜雨': [['xǐ'], ['yǔ']],
+    '喝令': [['hè'], ['lìng']],
+    '喝彩': [['hè'], ['cǎi']],
+    '喝斥': [['hè'], ['chì']],
+    '喝止': [['hè'], ['zhǐ']],
+    '喝水': [['hē'], ['shuǐ']],
+    '喝道': [['hè'], ['dào']],
+    '喝醉': [['hē'], ['zuì']],
+    '喝采': [['hè'], ['cǎi']],
+    '喝问': [['hè'], ['wèn']],
+    '喧哗': [['xuān'], ['huá']],
+    '喧嚷': [['xuān'], ['rǎng']],
+    '喷发': [['pēn'], ['fā']],
+    '喷口': [['pēn'], ['kǒu']],
+    '喷吐': [['pēn'], ['tǔ']],
+    '喷嘴': [['pēn'], ['zuǐ']],
+    '喷嚏': [['pēn'], ['tì']],
+    '喷壶': [['pēn'], ['hú']],
+    '喷头': [['pēn'], ['tóu']],
+    '喷射': [['pēn'], ['shè']],
+    '喷撒': [['pēn'], ['sǎ']],
+    '喷气': [['pēn'], ['qì']],
+    '喷水': [['pēn'], ['shuǐ']],
+    '喷泉': [['pēn'], ['quán']],
+    '喷泻': [['pēn'], ['xiè']],
+    '喷洒': [['pēn'], ['sǎ']],
+    '喷浆': [['pēn'], ['jiāng']],
+    '喷涌': [['pēn'], ['yǒng']],
+    '喷溅': [['pēn'], ['jiàn']],
+    '喷漆': [['pēn'], ['qī']],
+    '喷灌': [['pēn'], ['guàn']],
+    '喷火': [['pēn'], ['huǒ']],
+    '喷灯': [['pēn'], ['dēng']],
+    '喷管': [['pēn'], ['guǎn']],
+    '喷粪': [['pēn'], ['fèn']],
+    '喷薄': [['pēn'], ['bó']],
+    '喷雾': [['pēn'], ['wù']],
+    '喷饭': [['pēn'], ['fàn']],
+    '喷香': [['pèn'], ['xiāng']],
+    '喹啉': [['kuí'], ['lín']],
+    '喽啰': [['lóu'], ['luō']],
+    '喽罗': [['lóu'], ['luó']],
+    '嗅觉': [['xiù'], ['jué']],
+    '嗉囊': [['sù'], ['náng']],
+    '嗒丧': [['tà'], ['sàng']],
+    '嗒嗒': [['dā'], ['dā']],
+    '嗒然': [['tà'], ['rán']],
+    '嗔着': [['chēn'], ['zhe']],
+    '嗜好': [['shì'], ['hào']],
+    '嗜血': [['shì'], ['xuè']],
+    '嗣子': [['sì'], ['zi']],
+    '嗨哟': [['hāi'], ['yō']],
+    '嗳气': [['ài'], ['qì']],
+    '嗳酸': [['ǎi'], ['suān']],
+    '嘀嗒': [['dī'], ['dā']],
+    '嘉应': [['jiā'], ['yìng']],
+    '嘉许': [['jiā'], ['xǔ']],
+    '嘌呤': [['piào'], ['líng']],
+    '嘎吱': [['gā'], ['zhī']],
+    '嘎啦': [['gā'], ['lā']],
+    '嘎嘎': [['gā'], ['gā']],
+    '嘎噔': [['gā'], ['dēng']],
+    '嘎子': [['gǎ'], ['zǐ']],
+    '嘎巴': [['gā'], ['bā']],
+    '嘎然': [['gā'], ['rán']],
+    '嘘唏': [['xū'], ['xī']],
+    '嘲哳': [['zhāo'], ['zhā']],
+    '嘲弄': [['cháo'], ['nòng']],
+    '嘲笑': [['cháo'], ['xiào']],
+    '嘲讽': [['cháo'], ['fěng']],
+    '嘲谑': [['cháo'], ['xuè']],
+    '嘲骂': [['cháo'], ['mà']],
+    '嘴头': [['zuǐ'], ['tóu']],
+    '嘴角': [['zuǐ'], ['jiǎo']],
+    '嘶哑': [['sī'], ['yǎ']],
+    '嘿嘿': [['hēi'], ['hēi']],
+    '器乐': [['qì'], ['lè']],
+    '器度': [['qì'], ['dù']],
+    '器识': [['qì'], ['shí']],
+    '器重': [['qì'], ['zhòng']],
+    '器量': [['qì'], ['liàng']],
+    '噱头': [['xué'], ['tou']],
+    '噶厦': [['gá'], ['xià']],
+    '嚏喷': [['tì'], ['pēn']],
+    '嚷叫': [['rǎng'], ['jiào']],
+    '嚷嚷': [['rāng'], ['rāng']],
+    '嚼子': [['jiáo'], ['zǐ']],
+    '嚼舌': [['jiáo'], ['shé']],
+    '囊括': [['náng'], ['kuò']],
+    '囚禁': [['qiú'], ['jìn']],
+    '囚笼': [['qiú'], ['lóng']],
+    '囚车': [['qiú'], ['chē']],
+    '四会': [['sì'], ['huì']],
+    '四体': [['sì'], ['tǐ']],
+    '四六': [['sì'], ['liù']],
+    '四化': [['sì'], ['huà']],
+    '四处': [['sì'], ['chù']],
+    '四大': [['sì'], ['dà']],
+    '四射': [['sì'], ['shè']],
+    '四散': [['sì'], ['sàn']],
+    '四旁': [['sì'], ['páng']],
+    '四溅': [['sì'], ['jiàn']],
+    '四角': [['sì'], ['jiǎo']],
+    '回佣': [['huí'], ['yòng']],
+    '回信': [['huí'], ['xìn']],
+    '回单': [['huí'], ['dān']],
+    '回合': [['huí'], ['hé']],
+    '回填': [['huí'], ['tián']],
+    '回头': [['huí'], ['tóu']],
+    '回帖': [['huí'], ['tiē']],
+    '回应': [['huí'], ['yìng']],
+    '回弹': [['huí'], ['tán']],
+    '回教': [['huí'], ['jiào']],
+    '回旋': [['huí'], ['xuán']],
+    '回涨': [['huí'], ['zhǎng']],
+    '回空': [['huí'], ['kōng']],
+    '回笼': [['huí'], ['lóng']],
+    '回答': [['huí'], ['dá']],
+    '回纥': [['huí'], ['hé']],
+    '回落': [['huí'], ['luò']],
+    '回见': [['huí'], ['jiàn']],
+    '回车': [['huí'], ['chē']],
+    '回转': [['huí'], ['zhuǎn']],
+    '回还': [['huí'], ['huán']],
+    '回采': [['huí'], ['cǎi']],
+    '因为': [['yīn'], ['wèi']],
+    '因应': [['yīn'], ['yìng']],
+    '因数': [['yīn'], ['shù']],
+    '团丁': [['tuán'], ['dīng']],
+    '团体': [['tuán'], ['tǐ']],
+    '团员': [['tuán'], ['yuán']],
+    '团委': [['tuán'], ['wěi']],
+    '团弄': [['tuán'], ['nòng']],
+    '团扇': [['tuán'], ['shàn']],
+    '团结': [['tuán'], ['jié']],
+    '团长': [['tuán'], ['zhǎng']],
+    '囤积': [['tún'], ['jī']],
+    '囤聚': [['tún'], ['jù']],
+    '园丁': [['yuán'], ['dīng']],
+    '园地': [['yuán'], ['dì']],
+    '困处': [['kùn'], ['chǔ']],
+    '困觉': [['kùn'], ['jiào']],
+    '困难': [['kùn'], ['nán']],
+    '围剿': [['wéi'], ['jiǎo']],
+    '围场': [['wéi'], ['chǎng']],
+    '围屏': [['wéi'], ['píng']],
+    '围观': [['wéi'], ['guān']],
+    '固体': [['gù'], ['tǐ']],
+    '固有': [['gù'], ['yǒu']],
+    '固着': [['gù'], ['zhuó']],
+    '固结': [['gù'], ['jié']],
+    '国丧': [['guó'], ['sāng']],
+    '国乐': [['guó'], ['lè']],
+    '国仇': [['guó'], ['chóu']],
+    '国会': [['guó'], ['huì']],
+    '国体': [['guó'], ['tǐ']],
+    '国信': [['guó'], ['xìn']],
+    '国共': [['guó'], ['gòng']],
+    '国内': [['guó'], ['nèi']],
+    '国别': [['guó'], ['bié']],
+    '国华': [['guó'], ['huá']],
+    '国号': [['guó'], ['hào']],
+    '国家': [['guó'], ['jiā']],
+    '国帑': [['guó'], ['tǎng']],
+    '国度': [['guó'], ['dù']],
+    '国教': [['guó'], ['jiào']],
+    '国有': [['guó'], ['yǒu']],
+    '国术': [['guó'], ['shù']],
+    '国王': [['guó'], ['wáng']],
+    '国脉': [['guó'], ['mài']],
+    '国语': [['guó'], ['yǔ']],
+    '国都': [['guó'], ['dū']],
+    '国难': [['guó'], ['nàn']],
+    '图卷': [['tú'], ['juàn']],
+    '图景': [['tú'], ['jǐng']],
+    '图片': [['tú'], ['piàn']],
+    '图解': [['tú'], ['jiě']],
+    '图说': [['tú'], ['shuō']],
+    '图钉': [['tú'], ['dīng']],
+    '圆号': [['yuán'], ['hào']],
+    '圆圈': [['yuán'], ['quān']],
+    '圆场': [['yuán'], ['chǎng']],
+    '圆笼': [['yuán'], ['lóng']],
+    '圆钢': [['yuán'], ['gāng']],
+    '圈地': [['quān'], ['dì']],
+    '圈子': [['quān'], ['zi']],
+    '圈椅': [['quān'], ['yǐ']],
+    '圈阅': [['quān'], ['yuè']],
+    '土地': [['tǔ'], ['dì']],
+    '土堡': [['tǔ'], ['pù']],
+    '土戏': [['tǔ'], ['xì']],
+    '土棍': [['tǔ'], ['gùn']],
+    '土种': [['tǔ'], ['zhǒng']],
+    '土系': [['tǔ'], ['xì']],
+    '土著': [['tǔ'], ['zhù']],
+    '土语': [['tǔ'], ['yǔ']],
+    '土风': [['tǔ'], ['fēng']],
+    '圣上': [['shèng'], ['shàng']],
+    '圣地': [['shèng'], ['dì']],
+    '圣女': [['shèng'], ['nǚ']],
+    '在任': [['zài'], ['rèn']],
+    '在内': [['zài'], ['nèi']],
+    '在场': [['zài'], ['chǎng']],
+    '在家': [['zài'], ['jiā']],
+    '在教': [['zài'], ['jiào']],
+    '在朝': [['zài'], ['cháo']],
+    '在行': [['zài'], ['háng']],
+    '圩场': [['xū'], ['cháng']],
+    '圩垸': [['wéi'], ['yuàn']],
+    '圩堤': [['wéi'], ['dī']],
+    '圩子': [['wéi'], ['zǐ']],
+    '圭角': [['guī'], ['jiǎo']],
+    '地丁': [['dì'], ['dīng']],
+    '地上': [['dì'], ['shàng']],
+    '地下': [['dì'], ['xià']],
+    '地主': [['dì'], ['zhǔ']],
+    '地产': [['dì'], ['chǎn']],
+    '地亩': [['dì'], ['mǔ']],
+    '地价': [['dì'], ['jià']],
+    '地位': [['dì'], ['wèi']],
+    '地保': [['dì'], ['bǎo']],
+    '地利': [['dì'], ['lì']],
+    '地力': [['dì'], ['lì']],
+    '地动': [['dì'], ['dòng']],
+    '地势': [['dì'], ['shì']],
+    '地勤': [['dì'], ['qín']],
+    '地区': [['dì'], ['qū']],
+    '地名': [['dì'], ['míng']],
+    '地图': [['dì'], ['tú']],
+    '地址': [['dì'], ['zhǐ']],
+    '地块': [['dì'], ['kuài']],
+    '地坪': [['dì'], ['píng']],
+    '地垄': [['dì'], ['lǒng']],
+    '地垒': [['dì'], ['lěi']],
+    '地域': [['dì'], ['yù']],
+    '地基': [['dì'], ['jī']],
+    '地堡': [['dì'], ['pù']],
+    '地壳': [['dì'], ['qiào']],
+    '地处': [['dì'], ['chǔ']],
+    '地头': [['dì'], ['tóu']],
+    '地契': [['dì'], ['qì']],
+    '地委': [['dì'], ['wěi']],
+    '地学': [['dì'], ['xué']],
+    '地宫': [['dì'], ['gōng']],
+    '地层': [['dì'], ['céng']],
+    '地峡': [['dì'], ['xiá']],
+    '地市': [['dì'], ['shì']],
+    '地带': [['dì'], ['dài']],
+    '地幔': [['dì'], ['màn']],
+    '地平': [['dì'], ['píng']],
+    '地府': [['dì'], ['fǔ']],
+    '地形': [['dì'], ['xíng']],
+    '地心': [['dì'], ['xīn']],
+    '地志': [['dì'], ['zhì']],
+    '地摊': [['dì'], ['tān']],
+    '地支': [['dì'], ['zhī']],
+    '地政': [['dì'], ['zhèng']],
+    '地方': [['dì'], ['fāng']],
+    '地机': [['dì'], ['jī']],
+    '地权': [['dì'], ['quán']],
+    '地板': [['dì'], ['bǎn']],
+    '地极': [['dì'], ['jí']],
+    '地栗': [['dì'], ['lì']],
+    '地核': [['dì'], ['hé']],
+    '地梨': [['dì'], ['lí']],
+    '地榆': [['dì'], ['yú']],
+    '地步': [['dì'], ['bù']],
+    '地段': [['dì'], ['duàn']],
+    '地毡': [['dì'], ['zhān']],
+    '地毯': [['dì'], ['tǎn']],
+    '地气': [['dì'], ['qì']],
+    '地沟': [['dì'], ['gōu']],
+    '地波': [['dì'], ['bō']],
+    '地洞': [['dì'], ['dòng']],
+    '地温': [['dì'], ['wēn']],
+    '地漏': [['dì'], ['lòu']],
+    '地炕': [['dì'], ['kàng']],
+    '地点': [['dì'], ['diǎn']],
+    '地热': [['dì'], ['rè']],
+    '地牢': [['dì'], ['láo']],
+    '地物': [['dì'], ['wù']],
+    '地狱': [['dì'], ['yù']],
+    '地球': [['dì'], ['qiú']],
+    '地理': [['dì'], ['lǐ']],
+    '地瓜': [['dì'], ['guā']],
+    '地电': [['dì'], ['diàn']],
+    '地界': [['dì'], ['jiè']],
+    '地痞': [['dì'], ['pǐ']],
+    '地皮': [['dì'], ['pí']],
+    '地盘': [['dì'], ['pán']],
+    '地砖': [['dì'], ['zhuān']],
+    '地磁': [['dì'], ['cí']],
+    '地磅': [['dì'], ['bàng']],
+    '地租': [['dì'], ['zū']],
+    '地秤': [['dì'], ['chèng']],
+    '地积': [['dì'], ['jī']],
+    '地税': [['dì'], ['shuì']],
+    '地穴': [['dì'], ['xué']],
+    '地窖': [['dì'], ['jiào']],
+    '地窟': [['dì'], ['kū']],
+    '地精': [['dì'], ['jīng']],
+    '地线': [['dì'], ['xiàn']],
+    '地缘': [['dì'], ['yuán']],
+    '地脉': [['dì'], ['mài']],
+    '地脚': [['dì'], ['jiǎo']],
+    '地衣': [['dì'], ['yī']],
+    '地表': [['dì'], ['biǎo']],
+    '地角': [['dì'], ['jiǎo']],
+    '地貌': [['dì'], ['mào']],
+    '地质': [['dì'], ['zhì']],
+    '地轴': [['dì'], ['zhóu']],
+    '地边': [['dì'], ['biān']],
+    '地道': [['dì'], ['dào']],
+    '地邻': [['dì'], ['lín']],
+    '地铁': [['dì'], ['tiě']],
+    '地铺': [['dì'], ['pù']],
+    '地雷': [['dì'], ['léi']],
+    '地震': [['dì'], ['zhèn']],
+    '地面': [['dì'], ['miàn']],
+    '地黄': [['dì'], ['huáng']],
+    '地龙': [['dì'], ['lóng']],
+    '场合': [['chǎng'], ['hé']],
+    '场地': [['chǎng'], ['dì']],
+    '场子': [['chǎng'], ['zi']],
+    '场屋': [['chǎng'], ['wū']],
+    '场所': [['chǎng'], ['suǒ']],
+    '场景': [['chǎng'], ['jǐng']],
+    '场次': [['chǎng'], ['cì']],
+    '场记': [['chǎng'], ['jì']],
+    '场院': [['cháng'], ['yuàn']],
+    '场面': [['chǎng'], ['miàn']],
+    '均分': [['jūn'], ['fēn']],
+    '均差': [['jūn'], ['chà']],
+    '坊巷': [['fāng'], ['xiàng']],
+    '坊本': [['fāng'], ['běn']],
+    '坊间': [['fāng'], ['jiān']],
+    '坍台': [['tān'], ['tái']],
+    '坎坷': [['kǎn'], ['kě']],
+    '坏事': [['huài'], ['shì']],
+    '坏人': [['huài'], ['rén']],
+    '坏处': [['huài'], ['chù']],
+    '坏死': [['huài'], ['sǐ']],
+    '坏水': [['huài'], ['shuǐ']],
+    '坏种': [['huài'], ['zhǒng']],
+    '坏蛋': [['huài'], ['dàn']],
+    '坏话': [['huài'], ['huà']],
+    '坐上': [['zuò'], ['shàng']],
+    '坐化': [['zuò'], ['huà']],
+    '坐台': [['zuò'], ['tái']],
+    '坐大': [['zuò'], ['dà']],
+    '坐待': [['zuò'], ['dài']],
+    '坐监': [['zuò'], ['jiān']],
+    '坐禅': [['zuò'], ['chán']],
+    '坐落': [['zuò'], ['luò']],
+    '坐车': [['zuò'], ['chē']],
+    '坐骨': [['zuò'], ['gǔ']],
+    '坑蒙': [['kēng'], ['méng']],
+    '块体': [['kuài'], ['tǐ']],
+    '块头': [['kuài'], ['tóu']],
+    '坚信': [['jiān'], ['xìn']],
+    '坚强': [['jiān'], ['qiáng']],
+    '坚称': [['jiān'], ['chēng']],
+    '坛场': [['tán'], ['chǎng']],
+    '坛子': [['tán'], ['zi']],
+    '坝地': [['bà'], ['dì']],
+    '坟地': [['fén'], ['dì']],
+    '坟场': [['fén'], ['chǎng']],
+    '坟头': [['fén'], ['tóu']],
+    '坠地': [['zhuì'], ['dì']],
+    '坠落': [['zhuì'], ['luò']],
+    '坡地': [['pō'], ['dì']],
+    '坡度': [['pō'], ['dù']],
+    '坦率': [['tǎn'], ['shuài']],
+    '坦露': [['tǎn'], ['lù']],
+    '坯子': [['pī'], ['zi']],
+    '坷垃': [['kē'], ['lā']],
+    '坼裂': [['chè'], ['liè']],
+    '垂体': [['chuí'], ['tǐ']],
+    '垂头': [['chuí'], ['tóu']],
+    '垂落': [['chuí'], ['luò']],
+    '型号': [['xíng'], ['hào']],
+    '型钢': [['xíng'], ['gāng']],
+    '垛口': [['duǒ'], ['kǒu']],
+    '垛子': [['duǒ'], ['zi']],
+    '垢泥': [['gòu'], ['ní']],
+    '垦区': [['kěn'], ['qū']],
+    '垦殖': [['kěn'], ['zhí']],
+    '垦种': [['kěn'], ['zhòng']],
+    '垫圈': [['diàn'], ['juàn']],
+    '垫片': [['diàn'], ['piàn']],
+    '垫背': [['diàn'], ['bèi']],
+    '垫被': [['diàn'], ['bèi']],
+    '垮台': [['kuǎ'], ['tái']],
+    '垸子': [['yuàn'], ['zǐ']],
+    '埋伏': [['mái'], ['fú']],
+    '埋名': [['mái'], ['míng']],
+    '埋头': [['mái'], ['tóu']],
+    '埋怨': [['mán'], ['yuàn']],
+    '埋汰': [['mái'], ['tài']],
+    '埋没': [['mái'], ['mò']],
+    '埋葬': [['mái'], ['zàng']],
+    '埋藏': [['mái'], ['cáng']],
+    '埋设': [['mái'], ['shè']],
+    '埋首': [['mái'], ['shǒu']],
+    '城区': [['chéng'], ['qū']],
+    '城垛': [['chéng'], ['duǒ']],
+    '城堡': [['chéng'], ['bǎo']],
+    '城头': [['chéng'], ['tóu']],
+    '城阙': [['chéng'], ['què']],
+    '域内': [['yù'], ['nèi']],
+    '埠头': [['bù'], ['tou']],
+    '基地': [['jī'], ['dì']],
+    '基数': [['jī'], ['shù']],
+    '基调': [['jī'], ['diào']],
+    '堂会': [['táng'], ['huì']],
+    '堂奥': [['táng'], ['ào']],
+    '堇菜': [['jǐn'], ['cài']],
+    '堕地': [['duò'], ['dì']],
+    '堕胎': [['duò'], ['tāi']],
+    '堕马': [['duò'], ['mǎ']],
+    '堙没': [['yīn'], ['mò']],
+    '堡垒': [['bǎo'], ['lěi']],
+    '堡子': [['bǔ'], ['zi']],
+    '堡寨': [['bǎo'], ['zhài']],
+    '堵塞': [['dǔ'], ['sè']],
+    '堵车': [['dǔ'], ['chē']],
+    '塌台': [['tā'], ['tái']],
+    '塌落': [['tā'], ['luò']],
+    '塔台': [['tǎ'], ['tái']],
+    '塘泥': [['táng'], ['ní']],
+    '塞上': [['sāi'], ['shàng']],
+    '塞北': [['sài'], ['běi']],
+    '塞外': [['sài'], ['wài']],
+    '塞子': [['sāi'], ['zi']],
+    '塞满': [['sāi'], ['mǎn']],
+    '塞规': [['sāi'], ['guī']],
+    '塞责': [['sè'], ['zé']],
+    '塞车': [['sāi'], ['chē']],
+    '塞门': [['sài'], ['mén']],
+    '塞音': [['sè'], ['yīn']],
+    '填充': [['tián'], ['chōng']],
+    '填写': [['tián'], ['xiě']],
+    '填发': [['tián'], ['fā']],
+    '填堵': [['tián'], ['dǔ']],
+    '填塞': [['tián'], ['sāi']],
+    '填填': [['tián'], ['tián']],
+    '填平': [['tián'], ['píng']],
+    '填房': [['tián'], ['fáng']],
+    '填报': [['tián'], ['bào']],
+    '填料': [['tián'], ['liào']],
+    '填方': [['tián'], ['fāng']],
+    '填满': [['tián'], ['mǎn']],
+    '填空': [['tián'], ['kòng']],
+    '填补': [['tián'], ['bǔ']],
+    '填词': [['tián'], ['cí']],
+    '填鸭': [['tián'], ['yā']],
+    '境地': [['jìng'], ['dì']],
+    '墓地': [['mù'], ['dì']],
+    '墓碣': [['mù'], ['jié']],
+    '墓祭': [['mù'], ['jì']],
+    '墙垛': [['qiáng'], ['duǒ']],
+    '墙头': [['qiáng'], ['tóu']],
+    '墙缝': [['qiáng'], ['fèng']],
+    '墙角': [['qiáng'], ['jiǎo']],
+    '增压': [['zēng'], ['yā']],
+    '增大': [['zēng'], ['dà']],
+    '增广': [['zēng'], ['guǎng']],
+    '增强': [['zēng'], ['qiáng']],
+    '增殖': [['zēng'], ['zhí']],
+    '增重': [['zēng'], ['zhòng']],
+    '增量': [['zēng'], ['liàng']],
+    '增长': [['zēng'], ['zhǎng']],
+    '墨囊': [['mò'], ['náng']],
+    '墨家': [['mò'], ['jiā']],
+    '墨斗': [['mò'], ['dǒu']],
+    '墨晕': [['mò'], ['yùn']],
+    '墨绿': [['mò'], ['lǜ']],
+    '壁柜': [['bì'], ['guì']],
+    '壅塞': [['yōng'], ['sè']],
+    '士卒': [['shì'], ['zú']],
+    '士女': [['shì'], ['nǚ']],
+    '壮丁': [['zhuàng'], ['dīng']],
+    '壮丽': [['zhuàng'], ['lì']],
+    '壮大': [['zhuàng'], ['dà']],
+    '壮观': [['zhuàng'], ['guān']],
+    '壮语': [['zhuàng'], ['yǔ']],
+    '声乐': [['shēng'], ['yuè']],
+    '声价': [['shēng'], ['jià']],
+    '声压': [['shēng'], ['yā']],
+    '声场': [['shēng'], ['chǎng']],
+    '声旁': [['shēng'], ['páng']],
+    '声称': [['shēng'], ['chēng']],
+    '声调': [['shēng'], ['diào']],
+    '声频': [['shēng'], ['pín']],
+    '壳子': [['ké'], ['zǐ']],
+    '处世': [['chǔ'], ['shì']],
+    '处事': [['chǔ'], ['shì']],
+    '处于': [['chǔ'], ['yú']],
+    '处决': [['chǔ'], ['jué']],
+    '处分': [['chǔ'], ['fèn']],
+    '处刑': [['chǔ'], ['xíng']],
+    '处境': [['chǔ'], ['jìng']],
+    '处士': [['chǔ'], ['shì']],
+    '处处': [['chǔ'], ['chù']],
+    '处女': [['chǔ'], ['nǚ']],
+    '处子': [['chǔ'], ['zǐ']],
+    '处所': [['chù'], ['suǒ']],
+    '处方': [['chǔ'], ['fāng']],
+    '处暑': [['chǔ'], ['shǔ']],
+    '处死': [['chǔ'], ['sǐ']],
+    '处治': [['chǔ'], ['zhì']],
+    '处理': [['chǔ'], ['lǐ']],
+    '处罚': [['chǔ'], ['fá']],
+    '处置': [['chǔ'], ['zhì']],
+    '处身': [['chǔ'], ['shēn']],
+    '处长': [['chù'], ['zhǎng']],
+    '备份': [['bèi'], ['fèn']],
+    '备员': [['bèi'], ['yuán']],
+    '备查': [['bèi'], ['chá']],
+    '复仇': [['fù'], ['chóu']],
+    '复会': [['fù'], ['huì']],
+    '复信': [['fù'], ['xìn']],
+    '复兴': [['fù'], ['xīng']],
+    '复发': [['fù'], ['fā']],
+    '复句': [['fù'], ['jù']],
+    '复叶': [['fù'], ['yè']],
+    '复合': [['fù'], ['hé']],
+    '复员': [['fù'], ['yuán']],
+    '复数': [['fù'], ['shù']],
+    '复查': [['fù'], ['chá']],
+    '复核': [['fù'], ['hé']],
+    '复种': [['fù'], ['zhǒng']],
+    '复读': [['fù'], ['dú']],
+    '复转': [['fù'], ['zhuǎn']],
+    '复辟': [['fù'], ['bì']],
+    '夏令': [['xià'], ['lìng']],
+    '夏侯': [['xià'], ['hóu']],
+    '夏种': [['xià'], ['zhòng']],
+    '外亲': [['wài'], ['qīn']],
+    '外传': [['wài'], ['zhuàn']],
+    '外侧': [['wài'], ['cè']],
+    '外切': [['wài'], ['qiē']],
+    '外化': [['wài'], ['huà']],
+    '外厂': [['wài'], ['chǎng']],
+    '外号': [['wài'], ['hào']],
+    '外地': [['wài'], ['dì']],
+    '外场': [['wài'], ['chǎng']],
+    '外壳': [['wài'], ['ké']],
+    '外头': [['wài'], ['tou']],
+    '外家': [['wài'], ['jiā']],
+    '外差': [['wài'], ['chà']],
+    '外强': [['wài'], ['qiáng']],
+    '外教': [['wài'], ['jiào']],
+    '外景': [['wài'], ['jǐng']],
+    '外港': [['wài'], ['gǎng']],
+    '外相': [['wài'], ['xiāng']],
+    '外省': [['wài'], ['shěng']],
+    '外行': [['wài'], ['háng']],
+    '外观': [['wài'], ['guān']],
+    '外角': [['wài'], ['jiǎo']],
+    '外语': [['wài'], ['yǔ']],
+    '外调': [['wài'], ['diào']],
+    '外转': [['wài'], ['zhuǎn']],
+    '外长': [['wài'], ['zhǎng']],
+    '外间': [['wài'], ['jiān']],
+    '外露': [['wài'], ['lù']],
+    '夙仇': [['sù'], ['chóu']],
+    '多么': [['duō'], ['me']],
+    '多发': [['duō'], ['fā']],
+    '多咱': [['duō'], ['zá']],
+    '多大': [['duō'], ['dà']],
+    '多头': [['duō'], ['tóu']],
+    '多少': [['duō'], ['shǎo']],
+    '多数': [['duō'], ['shù']],
+    '多疑': [['duō'], ['yí']],
+    '多能': [['duō'], ['néng']],
+    '夜分': [['yè'], ['fēn']],
+    '夜叉': [['yè'], ['chā']],
+    '夜场': [['yè'], ['chǎng']],
+    '夜大': [['yè'], ['dà']],
+    '夜景': [['yè'], ['jǐng']],
+    '夜曲': [['yè'], ['qǔ']],
+    '夜校': [['yè'], ['xiào']],
+    '夜禁': [['yè'], ['jìn']],
+    '夜空': [['yè'], ['kōng']],
+    '夜蛾': [['yè'], ['é']],
+    '夜行': [['yè'], ['xíng']],
+    '夜车': [['yè'], ['chē']],
+    '夜间': [['yè'], ['jiān']],
+    '够呛': [['gòu'], ['qiāng']],
+    '够戗': [['gòu'], ['qiàng']],
+    '大一': [['dà'], ['yī']],
+    '大专': [['dà'], ['zhuān']],
+    '大业': [['dà'], ['yè']],
+    '大举': [['dà'], ['jǔ']],
+    '大义': [['dà'], ['yì']],
+    '大乘': [['dà'], ['chéng']],
+    '大书': [['dà'], ['shū']],
+    '大事': [['dà'], ['shì']],
+    '大亨': [['dà'], ['hēng']],
+    '大人': [['dà'], ['rén']],
+    '大任': [['dà'], ['rèn']],
+    '大众': [['dà'], ['zhòng']],
+    '大伙': [['dà'], ['huǒ']],
+    '大会': [['dà'], ['huì']],
+    '大伯': [['dà'], ['bó']],
+    '大体': [['dà'], ['tǐ']],
+    '大余': [['dà'], ['yú']],
+    '大作': [['dà'], ['zuò']],
+    '大使': [['dà'], ['shǐ']],
+    '大侠': [['dà'], ['xiá']],
+    '大便': [['dà'], ['biàn']],
+    '大修': [['dà'], ['xiū']],
+    '大儒': [['dà'], ['rú']],
+    '大全': [['dà'], ['quán']],
+    '大公': [['dà'], ['gōng']],
+    '大关': [['dà'], ['guān']],
+    '大兴': [['dà'], ['xīng']],
+    '大兵': [['dà'], ['bīng']],
+    '大典': [['dà'], ['diǎn']],
+    '大内': [['dà'], ['nèi']],
+    '大写': [['dà'], ['xiě']],
+    '大军': [['dà'], ['jūn']],
+    '大冶': [['dà'], ['yě']],
+    '大凡': [['dà'], ['fán']],
+    '大刀': [['dà'], ['dāo']],
+    '大分': [['dà'], ['fēn']],
+    '大刑': [['dà'], ['xíng']],
+    '大副': [['dà'], ['fù']],
+    '大力': [['dà'], ['lì']],
+    '大功': [['dà'], ['gōng']],
+    '大势': [['dà'], ['shì']],
+    '大包': [['dà'], ['bāo']],
+    '大北': [['dà'], ['běi']],
+    '大区': [['dà'], ['qū']],
+    '大半': [['dà'], ['bàn']],
+    '大卡': [['dà'], ['kǎ']],
+    '大卫': [['dà'], ['wèi']],
+    '大印': [['dà'], ['yìn']],
+    '大厅': [['dà'], ['tīng']],
+    '大历': [['dà'], ['lì']],
+    '大厦': [['dà'], ['shà']],
+    '大发': [['dà'], ['fā']],
+    '大叔': [['dà'], ['shū']],
+    '大口': [['dà'], ['kǒu']],
+    '大叫': [['dà'], ['jiào']],
+    '大号': [['dà'], ['hào']],
+    '大吉': [['dà'], ['jí']],
+    '大同': [['dà'], ['tóng']],
+    '大名': [['dà'], ['míng']],
+    '大吏': [['dà'], ['lì']],
+    '大吕': [['dà'], ['lǚ']],
+    '大君': [['dà'], ['jūn']],
+    '大员': [['dà'], ['yuán']],
+    '大哥': [['dà'], ['gē']],
+    '大喜': [['dà'], ['xǐ']],
+    '大器': [['dà'], ['qì']],
+    '大嚼': [['dà'], ['jué']],
+    '大国': [['dà'], ['guó']],
+    '大圆': [['dà'], ['yuán']],
+    '大圣': [['dà'], ['shèng']],
+    '大地': [['dà'], ['dì']],
+    '大块': [['dà'], ['kuài']],
+    '大坝': [['dà'], ['bà']],
+    '大型': [['dà'], ['xíng']],
+    '大城': [['dài'], ['chéng']],
+    '大埔': [['dà'], ['bù']],
+    '大堂': [['dà'], ['táng']],
+    '大堤': [['dà'], ['dī']],
+    '大墙': [['dà'], ['qiáng']],
+    '大壮': [['dà'], ['zhuàng']],
+    '大声': [['dà'], ['shēng']],
+    '大处': [['dà'], ['chù']],
+    '大多': [['dà'], ['duō']],
+    '大大': [['dà'], ['dà']],
+    '大夫': [['dài'], ['fū']],
+    '大头': [['dà'], ['tóu']],
+    '大好': [['dà'], ['hǎo']],
+    '大妈': [['dà'], ['mā']],
+    '大姐': [['dà'], ['jiě']],
+    '大姑': [['dà'], ['gū']],
+    '大姓': [['dà'], ['xìng']],
+    '大姨': [['dà'], ['yí']],
+    '大娘': [['dà'], ['niáng']],
+    '大婶': [['dà'], ['shěn']],
+    '大媒': [['dà'], ['méi']],
+    '大嫂': [['dà'], ['sǎo']],
+    '大子': [['dà'], ['zǐ']],
+    '大字': [['dà'], ['zì']],
+    '大学': [['dà'], ['xué']],
+    '大宁': [['dà'], ['níng']],
+    '大宇': [['dà'], ['yǔ']],
+    '大安': [['dà'], ['ān']],
+    '大宗': [['dà'], ['zōng']],
+    '大官': [['dà'], ['guān']],
+    '大家': [['dà'], ['jiā']],
+    '大寒': [['dà'], ['hán']],
+    '大寿': [['dà'], ['shòu']],
+    '大将': [['dà'], ['jiàng']],
+    '大尉': [['dà'], ['wèi']],
+    '大小': [['dà'], ['xiǎo']],
+    '大局': [['dà'], ['jú']],
+    '大工': [['dà'], ['gōng']],
+    '大巴': [['dà'], ['bā']],
+    '大市': [['dà'], ['shì']],
+    '大帅': [['dà'], ['shuài']],
+    '大师': [['dà'], ['shī']],
+    '大帝': [['dà'], ['dì']],
+    '大干': [['dà'], ['gàn']],
+    '大年': [['dà'], ['nián']],
+    '大幸': [['dà'], ['xìng']],
+    '大庆': [['dà'], ['qìng']],
+    '大度': [['dà'], ['dù']],
+    '大德': [['dà'], ['dé']],
+    '大忌': [['dà'], ['jì']],
+    '大志': [['dà'], ['zhì']],
+    '大忙': [['dà'], ['máng']],
+    '大悟': [['dà'], ['wù']],
+    '大悲': [['dà'], ['bēi']],
+    '大意': [['dà'], ['yì']],
+    '大戏': [['dà'], ['xì']],
+    '大成': [['dà'], ['chéng']],
+    '大我': [['dà'], ['wǒ']],
+    '大战': [['dà'], ['zhàn']],
+    '大户': [['dà'], ['hù']],
+    '大批': [['dà'], ['pī']],
+    '大把': [['dà'], ['bǎ']],
+    '大报': [['dà'], ['bào']],
+    '大抵': [['dà'], ['dǐ']],
+    '大拿': [['dà'], ['ná']],
+    '大指': [['dà'], ['zhǐ']],
+    '大捷': [['dà'], ['jié']],
+    '大政': [['dà'], ['zhèng']],
+    '大故': [['dà'], ['gù']],
+    '大敌': [['dà'], ['dí']],
+    '大数': [['dà'], ['shù']],
+    '大料': [['dà'], ['liào']],
+    '大方': [['dà'], ['fāng']],
+    '大族': [['dà'], ['zú']],
+    '大早': [['dà'], ['zǎo']],
+    '大明': [['dà'], ['míng']],
+    '大智': [['dà'], ['zhì']],
+    '大暑': [['dà'], ['shǔ']],
+    '大曲': [['dà'], ['qū']],
+    '大月': [['dà'], ['yuè']],
+    '大有': [['dà'], ['yǒu']],
+    '大本': [['dà'], ['běn']],
+    '大权': [['dà'], ['quán']],
+    '大杯': [['dà'], ['bēi']],
+    '大枣': [['dà'], ['zǎo']],
+    '大树': [['dà'], ['shù']],
+    '大校': [['dà'], ['xiào']],
+    '大样': [['dà'], ['yàng']],
+    '大案': [['dà'], ['àn']],
+    '大桥': [['dà'], ['qiáo']],
+    '大梁': [['dà'], ['liáng']],
+    '大楷': [['dà'], ['kǎi']],
+    '大概': [['dà'], ['gài']],
+    '大款': [['dà'], ['kuǎn']],
+    '大殓': [['dà'], ['liàn']],
+    '大殿': [['dà'], ['diàn']],
+    '大毛': [['dà'], ['máo']],
+    '大氅': [['dà'], ['chǎng']],
+    '大气': [['dà'], ['qì']],
+    '大水': [['dà'], ['shuǐ']],
+    '大汉': [['dà'], ['hàn']],
+    '大汗': [['dà'], ['hán']],
+    '大江': [['dà'], ['jiāng']],
+    '大河': [['dà'], ['hé']],
+    '大油': [['dà'], ['yóu']],
+    '大治': [['dà'], ['zhì']],
+    '大法': [['dà'], ['fǎ']],
+    '大波': [['dà'], ['bō']],
+    '大洋': [['dà'], ['yáng']],
+    '大洲': [['dà'], ['zhōu']],
+    '大浪': [['dà'], ['làng']],
+    '大海': [['dà'], ['hǎi']],
+    '大溜': [['dà'], ['liù']],
+    '大漠': [['dà'], ['mò']],
+    '大潮': [['dà'], ['cháo']],
+    '大火': [['dà'], ['huǒ']],
+    '大灶': [['dà'], ['zào']],
+    '大炮': [['dà'], ['pào']],
+    '大烟': [['dà'], ['yān']],
+    '大爷': [['dà'], ['yé']],
+    '大片': [['dà'], ['piàn']],
+    '大牙': [['dà'], ['yá']],
+    '大牢': [['dà'], ['láo']],
+    '大率': [['dà'], ['shuài']],
+    '大王': [['dài'], ['wáng']],
+    '大班': [['dà'], ['bān']],
+    '大理': [['dà'], ['lǐ']],
+    '大田': [['dà'], ['tián']],
+    '大略': [['dà'], ['lüè']],
+    '大病': [['dà'], ['bìng']],
+    '大白': [['dà'], ['bái']],
+    '大盐': [['dà'], ['yán']],
+    '大礼': [['dà'], ['lǐ']],
+    '大神': [['dà'], ['shén']],
+    '大禹': [['dà'], ['yǔ']],
+    '大秋': [['dà'], ['qiū']],
+    '大端': [['dà'], ['duān']],
+    '大笑': [['dà'], ['xiào']],
+    '大笔': [['dà'], ['bǐ']],
+    '大篆': [['dà'], ['zhuàn']],
+    '大米': [['dà'], ['mǐ']],
+    '大粪': [['dà'], ['fèn']],
+    '大系': [['dà'], ['xì']],
+    '大红': [['dà'], ['hóng']],
+    '大约': [['dà'], ['yuē']],
+    '大纲': [['dà'], ['gāng']],
+    '大统': [['dà'], ['tǒng']],
+    '大群': [['dà'], ['qún']],
+    '大老': [['dà'], ['lǎo']],
+    '大考': [['dà'], ['kǎo']],
+    '大肆': [['dà'], ['sì']],
+    '大肉': [['dà'], ['ròu']],
+    '大肠': [['dà'], ['cháng']],
+    '大胆': [['dà'], ['dǎn']],
+    '大脑': [['dà'], ['nǎo']],
+    '大脚': [['dà'], ['jiǎo']],
+    '大腕': [['dà'], ['wàn']],
+    '大腿': [['dà'], ['tuǐ']],
+    '大臣': [['dà'], ['chén']],
+    '大致': [['dà'], ['zhì']],
+    '大舅': [['dà'], ['jiù']],
+    '大节': [['dà'], ['jié']],
+    '大荔': [['dà'], ['lì']],
+    '大菜': [['dà'], ['cài']],
+    '大葱': [['dà'], ['cōng']],
+    '大蒜': [['dà'], ['suàn']],
+    '大蓟': [['dà'], ['jì']],
+    '大藏': [['dà'], ['zàng']],
+    '大虫': [['dà'], ['chóng']],
+    '大街': [['dà'], ['jiē']],
+    '大衣': [['dà'], ['yī']],
+    '大褂': [['dà'], ['guà']],
+    '大襟': [['dà'], ['jīn']],
+    '大要': [['dà'], ['yào']],
+    '大观': [['dà'], ['guān']],
+    '大角': [['dà'], ['jiǎo']],
+    '大解': [['dà'], ['jiě']],
+    '大计': [['dà'], ['jì']],
+    '大话': [['dà'], ['huà']],
+    '大课': [['dà'], ['kè']],
+    '大调': [['dà'], ['diào']],
+    '大谈': [['dà'], ['tán']],
+    '大豆': [['dà'], ['dòu']],
+    '大象': [['dà'], ['xiàng']],
+    '大败': [['dà'], ['bài']],
+    '大赛': [['dà'], ['sài']],
+    '大赦': [['dà'], ['shè']],
+    '大足': [['dà'], ['zú']],
+    '大路': [['dà'], ['lù']],
+    '大身': [['dà'], ['shēn']],
+    '大车': [['dà'], ['chē']],
+    '大过': [['dà'], ['guò']],
+    '大连': [['dà'], ['lián']],
+    '大逆': [['dà'], ['nì']],
+    '大选': [['dà'], ['xuǎn']],
+    '大通': [['dà'], ['tōng']],
+    '大道': [['dà'], ['dào']],
+    '大邑': [['dà'], ['yì']],
+    '大部': [['dà'], ['bù']],
+    '大都': [['dà'], ['dū']],
+    '大量': [['dà'], ['liàng']],
+    '大钞': [['dà'], ['chāo']],
+    '大钟': [['dà'], ['zhōng']],
+    '大钱': [['dà'], ['qián']],
+    '大错': [['dà'], ['cuò']],
+    '大锣': [['dà'], ['luó']],
+    '大门': [['dà'], ['mén']],
+    '大队': [['dà'], ['duì']],
+    '大陆': [['dà'], ['lù']],
+    '大限': [['dà'], ['xiàn']],
+    '大院': [['dà'], ['yuàn']],
+    '大陵': [['dà'], ['líng']],
+    '大难': [['dà'], ['nàn']],
+    '大雁': [['dà'], ['yàn']],
+    '大雅': [['dà'], ['yá']],
+    '大雨': [['dà'], ['yǔ']],
+    '大雪': [['dà'], ['xuě']],
+    '大青': [['dà'], ['qīng']],
+    '大面': [['dà'], ['miàn']],
+    '大项': [['dà'], ['xiàng']],
+    '大顺': [['dà'], ['shùn']],
+    '大风': [['dà'], ['fēng']],
+    '大餐': [['dà'], ['cān']],
+    '大饼': [['dà'], ['bǐng']],
+    '大驾': [['dà'], ['jià']],
+    '大鲵': [['dà'], ['ní']],
+    '大麦': [['dà'], ['mài']],
+    '大麻': [['dà'], ['má']],
+    '大黄': [['dài'], ['huáng']],
+    '大鼓': [['dà'], ['gǔ']],
+    '大龄': [['dà'], ['líng']],
+    '天上': [['tiān'], ['shàng']],
+    '天体': [['tiān'], ['tǐ']],
+    '天冲': [['tiān'], ['chōng']],
+    '天分': [['tiān'], ['fèn']],
+    '天台': [['tiān'], ['tāi']],
+    '天呀': [['tiān'], ['yā']],
+    '天和': [['tiān'], ['hé']],
+    '天地': [['tiān'], ['dì']],
+    '天头': [['tiān'], ['tóu']],
+    '天女': [['tiān'], ['nǚ']],
+    '天干': [['tiān'], ['gān']],
+    '天底': [['tiān'], ['dǐ']],
+    '天择': [['tiān'], ['zé']],
+    '天数': [['tiān'], ['shù']],
+    '天朝': [['tiān'], ['cháo']],
+    '天正': [['tiān'], ['zhèng']],
+    '天父': [['tiān'], ['fù']],
+    '天王': [['tiān'], ['wáng']],
+    '天空': [['tiān'], ['kōng']],
+    '天竺': [['tiān'], ['zhú']],
+    '天蛾': [['tiān'], ['é']],
+    '天趣': [['tiān'], ['qù']],
+    '天车': [['tiān'], ['chē']],
+    '天阙': [['tiān'], ['què']],
+    '太冲': [['tài'], ['chòng']],
+    '太和': [['tài'], ['hé']],
+    '太尉': [['tài'], ['wèi']],
+    '太甚': [['tài'], ['shèn']],
+    '太监': [['tài'], ['jiàn']],
+    '太空': [['tài'], ['kōng']],
+    '太过': [['tài'], ['guò']],
+    '太阿': [['tài'], ['ē']],
+    '夫人': [['fū'], ['rén']],
+    '夫君': [['fū'], ['jūn']],
+    '夫妇': [['fū'], ['fù']],
+    '夫妻': [['fū'], ['qī']],
+    '夫婿': [['fū'], ['xù']],
+    '夫子': [['fū'], ['zǐ']],
+    '夫权': [['fū'], ['quán']],
+    '夭亡': [['yāo'], ['wáng']],
+    '夭折': [['yāo'], ['zhé']],
+    '夭矫': [['yāo'], ['jiǎo']],
+    '央行': [['yāng'], ['háng']],
+    '夯实': [['hāng'], ['shí']],
+    '夯歌': [['hāng'], ['gē']],
+    '失传': [['shī'], ['chuán']],
+    '失体': [['shī'], ['tǐ']],
+    '失信': [['shī'], ['xìn']],
+    '失单': [['shī'], ['dān']],
+    '失和': [['shī'], ['hé']],
+    '失地': [['shī'], ['dì']],
+    '失当': [['shī'], ['dàng']],
+    '失据': [['shī'], ['jù']],
+    '失散': [['shī'], ['sàn']],
+    '失着': [['shī'], ['zhāo']],
+    '失禁': [['shī'], ['jìn']],
+    '失约': [['shī'], ['yuē']],
+    '失节': [['shī'], ['jié']],
+    '失落': [['shī'], ['luò']],
+    '失血': [['shī'], ['xuè']],
+    '失语': [['shī'], ['yǔ']],
+    '失调': [['shī'], ['tiáo']],
+    '失重': [['shī'], ['zhòng']],
+    '失风': [['shī'], ['fēng']],
+    '头人': [['tóu'], ['rén']],
+    '头伏': [['tóu'], ['fú']],
+    '头像': [['tóu'], ['xiàng']],
+    '头儿': [['tóu'], ['er']],
+    '头先': [['tóu'], ['xiān']],
+    '头前': [['tóu'], ['qián']],
+    '头功': [['tóu'], ['gōng']],
+    '头发': [['tóu'], ['fà']],
+    '头号': [['tóu'], ['hào']],
+    '头名': [['tóu'], ['míng']],
+    '头型': [['tóu'], ['xíng']],
+    '头天': [['tóu'], ['tiān']],
+    '头头': [['tóu'], ['tóu']],
+    '头套': [['tóu'], ['tào']],
+    '头子': [['tóu'], ['zi']],
+    '头家': [['tóu'], ['jiā']],
+    '头寸': [['tóu'], ['cùn']],
+    '头尾': [['tóu'], ['wěi']],
+    '头巾': [['tóu'], ['jīn']],
+    '头帕': [['tóu'], ['pà']],
+    '头年': [['tóu'], ['nián']],
+    '头座': [['tóu'], ['zuò']],
+    '头彩': [['tóu'], ['cǎi']],
+    '头昏': [['tóu'], ['hūn']],
+    '头晕': [['tóu'], ['yūn']],
+    '头晚': [['tóu'], ['wǎn']],
+    '头油': [['tóu'], ['yóu']],
+    '头版': [['tóu'], ['bǎn']],
+    '头牌': [['tóu'], ['pái']],
+    '头球': [['tóu'], ['qiú']],
+    '头生': [['tóu'], ['shēng']],
+    '头疼': [['tóu'], ['téng']],
+    '头痛': [['tóu'], ['tòng']],
+    '头癣': [['tóu'], ['xuǎn']],
+    '头皮': [['tóu'], ['pí']],
+    '头盔': [['tóu'], ['kuī']],
+    '头盖': [['tóu'], ['gài']],
+    '头目': [['tóu'], ['mù']],
+    '头等': [['tóu'], ['děng']],
+    '头筹': [['tóu'], ['chóu']],
+    '头绪': [['tóu'], ['xù']],
+    '头绳': [['tóu'], ['shéng']],
+    '头罩': [['tóu'], ['zhào']],
+    '头羊': [['tóu'], ['yáng']],
+    '头胎': [['tóu'], ['tāi']],
+    '头脑': [['tóu'], ['nǎo']],
+    '头脸': [['tóu'], ['liǎn']],
+    '头虱': [['tóu'], ['shī']],
+    '头衔': [['tóu'], ['xián']],
+    '头角': [['tóu'], ['jiǎo']],
+    '头路': [['tóu'], ['lù']],
+    '头里': [['tóu'], ['lǐ']],
+    '头钱': [['tóu'], ['qián']],
+    '头陀': [['tóu'], ['tuó']],
+    '头面': [['tóu'], ['miàn']],
+    '头顶': [['tóu'], ['dǐng']],
+    '头颅': [['tóu'], ['lú']],
+    '头领': [['tóu'], ['lǐng']],
+    '头颈': [['tóu'], ['jǐng']],
+    '头额': [['tóu'], ['é']],
+    '头饰': [['tóu'], ['shì']],
+    '头马': [['tóu'], ['mǎ']],
+    '头骨': [['tóu'], ['gǔ']],
+    '夸口': [['kuā'], ['kǒu']],
+    '夸嘴': [['kuā'], ['zuǐ']],
+    '夸大': [['kuā'], ['dà']],
+    '夸奖': [['kuā'], ['jiǎng']],
+    '夸张': [['kuā'], ['zhāng']],
+    '夸特': [['kuā'], ['tè']],
+    '夸示': [['kuā'], ['shì']],
+    '夸耀': [['kuā'], ['yào']],
+    '夸脱': [['kuā'], ['tuō']],
+    '夸诞': [['kuā'], ['dàn']],
+    '夸说': [['kuā'], ['shuō']],
+    '夸赞': [['kuā'], ['zàn']],
+    '夸饰': [['kuā'], ['shì']],
+    '夹克': [['jiá'], ['kè']],
+    '夹具': [['jiā'], ['jù']],
+    '夹击': [['jiā'], ['jī']],
+    '夹剪': [['jiā'], ['jiǎn']],
+    '夹墙': [['jiā'], ['qiáng']],
+    '夹子': [['jiā'], ['zi']],
+    '夹层': [['jiā'], ['céng']],
+    '夹峙': [['jiā'], ['zhì']],
+    '夹带': [['jiā'], ['dài']],
+    '夹心': [['jiā'], ['xīn']],
+    '夹批': [['jiā'], ['pī']],
+    '夹持': [['jiā'], ['chí']],
+    '夹攻': [['jiā'], ['gōng']],
+    '夹杂': [['jiā'], ['zá']],
+    '夹板': [['jiā'], ['bǎn']],
+    '夹棍': [['jiā'], ['gùn']],
+    '夹注': [['jiā'], ['zhù']],
+    '夹生': [['jiā'], ['shēng']],
+    '夹紧': [['jiā'], ['jǐn']],
+    '夹缝': [['jiā'], ['fèng']],
+    '夹衣': [['jiá'], ['yī']],
+    '夹袄': [['jiá'], ['ǎo']],
+    '夹被': [['jiá'], ['bèi']],
+    '夹裤': [['jiá'], ['kù']],
+    '夹角': [['jiā'], ['jiǎo']],
+    '夹道': [['jiā'], ['dào']],
+    '夹钳': [['jiā'], ['qián']],
+    '夹馅': [['jiā'], ['xiàn']],
+    '夺冠': [['duó'], ['guàn']],
+    '夺得': [['duó'], ['de']],
+    '奄奄': [['yǎn'], ['yǎn']],
+    '奄忽': [['yǎn'], ['hū']],
+    '奄然': [['yǎn'], ['rán']],
+    '奇丽': [['qí'], ['lì']],
+    '奇事': [['qí'], ['shì']],
+    '奇人': [['qí'], ['rén']],
+    '奇伟': [['qí'], ['wěi']],
+    '奇偶': [['jī'], ['ǒu']],
+    '奇兵': [['qí'], ['bīng']],
+    '奇冤': [['qí'], ['yuān']],
+    '奇功': [['qí'], ['gōng']],
+    '奇勋': [['qí'], ['xūn']],
+    '奇妙': [['qí'], ['miào']],
+    '奇崛': [['qí'], ['jué']],
+    '奇巧': [['qí'], ['qiǎo']],
+    '奇幻': [['qí'], ['huàn']],
+    '奇异': [['qí'], ['yì']],
+    '奇志': [['qí'], ['zhì']],
+    '奇怪': [['qí'], ['guài']],
+    '奇才': [['qí'], ['cái']],
+    '奇技': [['qí'], ['jì']],
+    '奇数': [['jī'], ['shù']],
+    '奇文': [['qí'], ['wén']],
+    '奇景': [['qí'], ['jǐng']],
+    '奇特': [['qí'], ['tè']],
+    '奇珍': [['qí'], ['zhēn']],
+    '奇祸': [['qí'], ['huò']],
+    '奇秀': [['qí'], ['xiù']],
+    '奇绝': [['qí'], ['jué']],
+    '奇缘': [['qí'], ['yuán']],
+    '奇缺': [['qí'], ['quē']],
+    '奇葩': [['qí'], ['pā']],
+    '奇袭': [['qí'], ['xí']],
+    '奇观': [['qí'], ['guān']],
+    '奇诡': [['qí'], ['guǐ']],
+    '奇谈': [['qí'], ['tán']],
+    '奇谋': [['qí'], ['móu']],
+    '奇谲': [['qí'], ['jué']],
+    '奇趣': [['qí'], ['qù']],
+    '奇迹': [['qí'], ['jì']],
+    '奇遇': [['qí'], ['yù']],
+    '奇门': [['qí'], ['mén']],
+    '奇闻': [['qí'], ['wén']],
+    '奇零': [['jī'], ['líng']],
+    '奈何': [['nài'], ['hé']],
+    '奉上': [['fèng'], ['shàng']],
+    '奉令': [['fèng'], ['lìng']],
+    '奉召': [['fèng'], ['zhào']],
+    '奉节': [['fèng'], ['jié']],
+    '奉行': [['fèng'], ['xíng']],
+    '奉还': [['fèng'], ['huán']],
+    '奋发': [['fèn'], ['fā']],
+    '奋斗': [['fèn'], ['dòu']],
+    '奋臂': [['fèn'], ['bì']],
+    '奎宁': [['kuí'], ['níng']],
+    '奏乐': [['zòu'], ['yuè']],
+    '奏折': [['zòu'], ['zhé']],
+    '契丹': [['qì'], ['dān']],
+    '契卡': [['qì'], ['kǎ']],
+    '契友': [['qì'], ['yǒu']],
+    '契合': [['qì'], ['hé']],
+    '契据': [['qì'], ['jù']],
+    '契机': [['qì'], ['jī']],
+    '契约': [['qì'], ['yuē']],
+    '奔丧': [['bēn'], ['sāng']],
+    '奔劳': [['bēn'], ['láo']],
+    '奔命': [['bèn'], ['mìng']],
+    '奔头': [['bèn'], ['tóu']],
+    '奔忙': [['bēn'], ['máng']],
+    '奔放': [['bēn'], ['fàng']],
+    '奔波': [['bēn'], ['bō']],
+    '奔泻': [['bēn'], ['xiè']],
+    '奔流': [['bēn'], ['liú']],
+    '奔涌': [['bēn'], ['yǒng']],
+    '奔突': [['bēn'], ['tū']],
+    '奔窜': [['bēn'], ['cuàn']],
+    '奔腾': [['bēn'], ['téng']],
+    '奔袭': [['bēn'], ['xí']],
+    '奔走': [['bēn'], ['zǒu']],
+    '奔赴': [['bēn'], ['fù']],
+    '奔跑': [['bēn'], ['pǎo']],
+    '奔逃': [['bēn'], ['táo']],
+    '奔逐': [['bēn'], ['zhú']],
+    '奔马': [['bēn'], ['mǎ']],
+    '奔驰': [['bēn'], ['chí']],
+    '奔驶': [['bēn'], ['shǐ']],
+    '奖券': [['jiǎng'], ['quàn']],
+    '奖掖': [['jiǎng'], ['yè']],
+    '套头': [['tào'], ['tóu']],
+    '套数': [['tào'], ['shù']],
+    '套曲': [['tào'], ['qǔ']],
+    '套服': [['tào'], ['fú']],
+    '套种': [['tào'], ['zhòng']],
+    '套红': [['tào'], ['hóng']],
+    '套结': [['tào'], ['jié']],
+    '套语': [['tào'], ['yǔ']],
+    '套车': [['tào'], ['chē']],
+    '套间': [['tào'], ['jiān']],
+    '奚落': [['xī'], ['luò']],
+    '奠都': [['diàn'], ['dū']],
+    '奢糜': [['shē'], ['mí']],
+    '奢靡': [['shē'], ['mí']],
+    '奥义': [['ào'], ['yì']],
+    '奥兰': [['ào'], ['lán']],
+    '奥博': [['ào'], ['bó']],
+    '奥妙': [['ào'], ['miào']],
+    '奥援': [['ào'], ['yuán']],
+    '奥旨': [['ào'], ['zhǐ']],
+    '奥秘': [['ào'], ['mì']],
+    '女人': [['nǚ'], ['rén']],
+    '女仆': [['nǚ'], ['pú']],
+    '女优': [['nǚ'], ['yōu']],
+    '女伴': [['nǚ'], ['bàn']],
+    '女伶': [['nǚ'], ['líng']],
+    '女侍': [['nǚ'], ['shì']],
+    '女儿': [['nǚ'], ['ér']],
+    '女史': [['nǚ'], ['shǐ']],
+    '女墙': [['nǚ'], ['qiáng']],
+    '女士': [['nǚ'], ['shì']],
+    '女奴': [['nǚ'], ['nú']],
+    '女妖': [['nǚ'], ['yāo']],
+    '女娲': [['nǚ'], ['wā']],
+    '女婿': [['nǚ'], ['xù']],
+    '女子': [['nǚ'], ['zǐ']],
+    '女孩': [['nǚ'], ['hái']],
+    '女家': [['nǚ'], ['jiā']],
+    '女将': [['nǚ'], ['jiàng']],
+    '女尸': [['nǚ'], ['shī']],
+    '女工': [['nǚ'], ['gōng']],
+    '女巫': [['nǚ'], ['wū']],
+    '女弟': [['nǚ'], ['dì']],
+    '女性': [['nǚ'], ['xìng']],
+    '女方': [['nǚ'], ['fāng']],
+    '女权': [['nǚ'], ['quán']],
+    '女流': [['nǚ'], ['liú']],
+    '女王': [['nǚ'], ['wáng']],
+    '女生': [['nǚ'], ['shēng']],
+    '女皇': [['nǚ'], ['huáng']],
+    '女监': [['nǚ'], ['jiān']],
+    '女真': [['nǚ'], ['zhēn']],
+    '女眷': [['nǚ'], ['juàn']],
+    '女神': [['nǚ'], ['shén']],
+    '女童': [['nǚ'], ['tóng']],
+    '女红': [['nǚ'], ['gōng']],
+    '女色': [['nǚ'], ['sè']],
+    '女装': [['nǚ'], ['zhuāng']],
+    '女裤': [['nǚ'], ['kù']],
+    '女角': [['nǚ'], ['jiǎo']],
+    '女贞': [['nǚ'], ['zhēn']],
+    '女郎': [['nǚ'], ['láng']],
+    '奴仆': [['nú'], ['pú']],
+    '奴化': [['nú'], ['huà']],
+    '奴家': [['nú'], ['jiā']],
+    '奴隶': [['nú'], ['lì']],
+    '奶头': [['nǎi'], ['tóu']],
+    '奸夫': [['jiān'], ['fū']],
+    '奸恶': [['jiān'], ['è']],
+    '奸邪': [['jiān'], ['xié']],
+    '她们': [['tā'], ['men']],
+    '好不': [['hǎo'], ['bù']],
+    '好丑': [['hǎo'], ['chǒu']],
+    '好久': [['hǎo'], ['jiǔ']],
+    '好书': [['hǎo'], ['shū']],
+    '好事': [['hǎo'], ['shì']],
+    '好些': [['hǎo'], ['xiē']],
+    '好人': [['hǎo'], ['rén']],
+    '好似': [['hǎo'], ['sì']],
+    '好像': [['hǎo'], ['xiàng']],
+    '好儿': [['hǎo'], ['ér']],
+    '好办': [['hǎo'], ['bàn']],
+    '好动': [['hào'], ['dòng']],
+    '好受': [['hǎo'], ['shòu']],
+    '好古': [['hào'], ['gǔ']],
+    '好吃': [['hǎo'], ['chī']],
+    '好吧': [['hǎo'], ['ba']],
+    '好听': [['hǎo'], ['tīng']],
+    '好在': [['hǎo'], ['zài']],
+    '好处': [['hǎo'], ['chù']],
+    '好多': [['hǎo'], ['duō']],
+    '好头': [['hǎo'], ['tóu']],
+    '好奇': [['hào'], ['qí']],
+    '好好': [['hǎo'], ['hǎo']],
+    '好学': [['hào'], ['xué']],
+    '好客': [['hào'], ['kè']],
+    '好尚': [['hào'], ['shàng']],
+    '好强': [['hào'], ['qiáng']],
+    '好心': [['hǎo'], ['xīn']],
+    '好恶': [['hào'], ['wù']],
+    '好惹': [['hǎo'], ['rě']],
+    '好意': [['hǎo'], ['yì']],
+    '好感': [['hǎo'], ['gǎn']],
+    '好戏': [['hǎo'], ['xì']],
+    '好战': [['hào'], ['zhàn']],
+    '好手': [['hǎo'], ['shǒu']],
+    '好斗': [['hào'], ['dòu']],
+    '好景': [['hǎo'], ['jǐng']],
+    '好歹': [['hǎo'], ['dǎi']],
+    '好比': [['hǎo'], ['bǐ']],
+    '好气': [['hǎo'], ['qì']],
+    '好汉': [['hǎo'], ['hàn']],
+    '好玩': [['hǎo'], ['wán']],
+    '好生': [['hǎo'], ['shēng']],
+    '好看': [['hǎo'], ['kàn']],
+    '好笑': [['hǎo'], ['xiào']],
+    '好累': [['hǎo'], ['lèi']],
+    '好胜': [['hào'], ['shèng']],
+    '好脸': [['hǎo'], ['liǎn']],
+    '好色': [['hào'], ['sè']],
+    '好言': [['hǎo'], ['yán']],
+    '好评': [['hǎo'], ['píng']],
+    '好话': [['hǎo'], ['huà']],
+    '好说': [['hǎo'], ['shuō']],
+    '好象': [['hǎo'], ['xiàng']],
+    '好赖': [['hǎo'], ['lài']],
+    '好走': [['hǎo'], ['zǒu']],
+    '好转': [['hǎo'], ['zhuǎn']],
+    '好辩': [['hǎo'], ['biàn']],
+    '好过': [['hǎo'], ['guò']],
+    '好运': [['hǎo'], ['yùn']],
+    '好酒': [['hǎo'], ['jiǔ']],
+    '好问': [['hǎo'], ['wèn']],
+    '好闻': [['hǎo'], ['wén']],
+    '如上': [['rú'], ['shàng']],
+    '如何': [['rú'], ['hé']],
+    '如其': [['rú'], ['qí']],
+    '如同': [['rú'], ['tóng']],
+    '如弟': [['rú'], ['dì']],
+    '如数': [['rú'], ['shù']],
+    '如期': [['rú'], ['qī']],
+    '如约': [['rú'], ['yuē']],
+    '如若': [['rú'], ['ruò']],
+    '如许': [['rú'], ['xǔ']],
+    '妃嫔': [['fēi'], ['pín']],
+    '妃子': [['fēi'], ['zǐ']],
+    '妄为': [['wàng'], ['wéi']],
+    '妄称': [['wàng'], ['chēng']],
+    '妄语': [['wàng'], ['yǔ']],
+    '妄说': [['wàng'], ['shuō']],
+    '妇女': [['fù'], ['nǚ']],
+    '妇弟': [['fù'], ['dì']],
+    '妍丽': [['yán'], ['lì']],
+    '妓女': [['jì'], ['nǚ']],
+    '妖女': [['yāo'], ['nǚ']],
+    '妖娆': [['yāo'], ['ráo']],
+    '妖术': [['yāo'], ['shù']],
+    '妖风': [['yāo'], ['fēng']],
+    '妗子': [['jìn'], ['zi']],
+    '妙句': [['miào'], ['jù']],
+    '妙处': [['miào'], ['chù']],
+    '妙着': [['miào'], ['zhāo']],
+    '妙论': [['miào'], ['lùn']],
+    '妙语': [['miào'], ['yǔ']],
+    '妙趣': [['miào'], ['qù']],
+    '妞儿': [['niū'], ['er']],
+    '妞子': [['niū'], ['zi']],
+    '妥帖': [['tuǒ'], ['tiē']],
+    '妥当': [['tuǒ'], ['dàng']],
+    '妯娌': [['zhóu'], ['lǐ']],
+    '妹夫': [['mèi'], ['fū']],
+    '妻儿': [['qī'], ['ér']],
+    '妻子': [['qī'], ['zǐ']],
+    '妻孥': [['qī'], ['nú']],
+    '妻室': [['qī'], ['shì']],
+    '妻小': [['qī'], ['xiǎo']],
+    '妻弟': [['qī'], ['dì']],
+    '妻舅': [['qī'], ['jiù']],
+    '姊夫': [['zǐ'], ['fū']],
+    '始创': [['shǐ'], ['chuàng']],
+    '姐夫': [['jiě'], ['fū']],
+    '姑且': [['gū'], ['qiě']],
+    '姑夫': [['gū'], ['fū']],
+    '姑洗': [['gū'], ['xǐ']],
+    '姑父': [['gū'], ['fù']],
+    '姓仇': [['xìng'], ['qiú']],
+    '姓任': [['xìng'], ['rén']],
+    '姓冠': [['xìng'], ['guàn']],
+    '姓干': [['xìng'], ['gān']],
+    '姓氏': [['xìng'], ['shì']],
+    '姓解': [['xìng'], ['xiè']],
+    '委任': [['wěi'], ['rèn']],
+    '委员': [['wěi'], ['yuán']],
+    '委婉': [['wěi'], ['wǎn']],
+    '委实': [['wěi'], ['shí']],
+    '委屈': [['wěi'], ['qū']],
+    '委托': [['wěi'], ['tuō']],
+    '委曲': [['wěi'], ['qū']],
+    '委派': [['wěi'], ['pài']],
+    '委琐': [['wěi'], ['suǒ']],
+    '委罪': [['wěi'], ['zuì']],
+    '委蛇': [['wēi'], ['yí']],
+    '委身': [['wěi'], ['shēn']],
+    '委靡': [['wěi'], ['mǐ']],
+    '委顿': [['wěi'], ['dùn']],
+    '姘夫': [['pīn'], ['fū']],
+    '姘头': [['pīn'], ['tou']],
+    '姣丽': [['jiāo'], ['lì']],
+    '姣好': [['jiāo'], ['hǎo']],
+    '姣美': [['jiāo'], ['měi']],
+    '姥姥': [['lǎo'], ['lǎo']],
+    '姨夫': [['yí'], ['fū']],
+    '姨父': [['yí'], ['fù']],
+    '姻亲': [['yīn'], ['qīn']],
+    '威信': [['wēi'], ['xìn']],
+    '威吓': [['wēi'], ['hè']],
+    '威迫': [['wēi'], ['pò']],
+    '娇好': [['jiāo'], ['hǎo']],
+    '娇妻': [['jiāo'], ['qī']],
+    '娇娆': [['jiāo'], ['ráo']],
+    '娘亲': [['niáng'], ['qīn']],
+    '娘子': [['niáng'], ['zi']],
+    '娘家': [['niáng'], ['jiā']],
+    '娱乐': [['yú'], ['lè']],
+    '婀娜': [['ē'], ['nuó']],
+    '婊子': [['biǎo'], ['zi']],
+    '婚假': [['hūn'], ['jià']],
+    '婢女': [['bì'], ['nǚ']],
+    '婵媛': [['chán'], ['yuán']],
+    '媒体': [['méi'], ['tǐ']],
+    '媒合': [['méi'], ['hé']],
+    '媚骨': [['mèi'], ['gǔ']],
+    '媾合': [['gòu'], ['hé']],
+    '媾和': [['gòu'], ['hé']],
+    '嫂子': [['sǎo'], ['zi']],
+    '嫌恶': [['xián'], ['wù']],
+    '嫌疑': [['xián'], ['yí']],
+    '嫔妃': [['pín'], ['fēi']],
+    '嫖妓': [['piáo'], ['jì']],
+    '嫖娼': [['piáo'], ['chāng']],
+    '嫖客': [['piáo'], ['kè']],
+    '嫖宿': [['piáo'], ['sù']],
+    '嫚子': [['mān'], ['zi']],
+    '嫡亲': [['dí'], ['qīn']],
+    '嫡传': [['dí'], ['chuán']],
+    '嫡子': [['dí'], ['zi']],
+    '嫡系': [['dí'], ['xì']],
+    '嫣红': [['yān'], ['hóng']],
+    '嫩枝': [['nèn'], ['zhī']],
+    '嫩红': [['nèn'], ['hóng']],
+    '嫩绿': [['nèn'], ['lǜ']],
+    '嬉戏': [['xī'], ['xì']],
+    '子句': [['zǐ'], ['jù']],
+    '子叶': [['zǐ'], ['yè']],
+    '子囊': [['zǐ'], ['náng']],
+    '子女': [['zǐ'], ['nǚ']],
+    '子孙': [['zǐ'], ['sūn']],
+    '子弟': [['zǐ'], ['dì']],
+    '子弹': [['zǐ'], ['dàn']],
+    '子畜': [['zǐ'], ['chù']],
+    '孔教': [['kǒng'], ['jiào']],
+    '孔雀': [['kǒng'], ['què']],
+    '孕吐': [['yùn'], ['tù']],
+    '孕期': [['yùn'], ['qī']],
+    '字体': [['zì'], ['tǐ']],
+    '字句': [['zì'], ['jù']],
+    '字号': [['zì'], ['hào']],
+    '字帖': [['zì'], ['tiè']],
+    '字据': [['zì'], ['jù']],
+    '字数': [['zì'], ['shù']],
+    '字模': [['zì'], ['mú']],
+    '字节': [['zì'], ['jié']],
+    '字调': [['zì'], ['diào']],
+    '存亡': [['cún'], ['wáng']],
+    '存单': [['cún'], ['dān']],
+    '存折': [['cún'], ['zhé']],
+    '存查': [['cún'], ['chá']],
+    '存疑': [['cún'], ['yí']],
+    '存食': [['cún'], ['shí']],
+    '孙儿': [['sūn'], ['ér']],
+    '孙吴': [['sūn'], ['wú']],
+    '孙女': [['sūn'], ['nǚ']],
+    '孙子': [['sūn'], ['zi']],
+    '孝女': [['xiào'], ['nǚ']],
+    '孝弟': [['xiào'], ['dì']],
+    '孝服': [['xiào'], ['fú']],
+    '孝行': [['xiào'], ['xíng']],
+    '孢子': [['bāo'], ['zi']],
+    '季度': [['jì'], ['dù']],
+    '季父': [['jì'], ['fù']],
+    '季节': [['jì'], ['jié']],
+    '孤单': [['gū'], ['dān']],
+    '孤女': [['gū'], ['nǚ']],
+    '孤行': [['gū'], ['xíng']],
+    '学会': [['xué'], ['huì']],
+    '学分': [['xué'], ['fēn']],
+    '学区': [['xué'], ['qū']],
+    '学员': [['xué'], ['yuán']],
+    '学好': [['xué'], ['hǎo']],
+    '学子': [['xué'], ['zǐ']],
+    '学期': [['xué'], ['qī']],
+    '学术': [['xué'], ['shù']],
+    '学校': [['xué'], ['xiào']],
+    '学棍': [['xué'], ['gùn']],
+    '学监': [['xué'], ['jiān']],
+    '学系': [['xué'], ['xì']],
+    '学识': [['xué'], ['shí']],
+    '学说': [['xué'], ['shuō']],
+    '学长': [['xué'], ['zhǎng']],
+    '孩子': [['hái'], ['zi']],
+    '孩提': [['hái'], ['tí']],
+    '孬种': [['nāo'], ['zhǒng']],
+    '孱弱': [['chán'], ['ruò']],
+    '孵化': [['fū'], ['huà']],
+    '孽种': [['niè'], ['zhǒng']],
+    '宁南': [['níng'], ['nán']],
+    '宁可': [['nìng'], ['kě']],
+    '宁安': [['níng'], ['ān']],
+    '宁帖': [['níng'], ['tiē']],
+    '宁愿': [['nìng'], ['yuàn']],
+    '宁日': [['níng'], ['rì']],
+    '宁肯': [['nìng'], ['kěn']],
+    '宁谧': [['níng'], ['mì']],
+    '宁靖': [['níng'], ['jìng']],
+    '宁静': [['níng'], ['jìng']],
+    '宅地': [['zhái'], ['dì']],
+    '宇内': [['yǔ'], ['nèi']],
+    '守丧': [['shǒu'], ['sāng']],
+    '守信': [['shǒu'], ['xìn']],
+    '守分': [['shǒu'], ['fèn']],
+    '守将': [['shǒu'], ['jiāng']],
+    '守约': [['shǒu'], ['yuē']],
+    '守节': [['shǒu'], ['jié']],
+    '守车': [['shǒu'], ['chē']],
+    '安上': [['ān'], ['shàng']],
+    '安乐': [['ān'], ['lè']],
+    '安分': [['ān'], ['fèn']],
+    '安好': [['ān'], ['hǎo']],
+    '安宁': [['ān'], ['níng']],
+    '安家': [['ān'], ['jiā']],
+    '安度': [['ān'], ['dù']],
+    '安打': [['ān'], ['dǎ']],
+    '安拉': [['ān'], ['lā']],
+    '安排': [['ān'], ['pái']],
+    '宋朝': [['sòng'], ['cháo']],
+    '完了': [['wán'], ['le']],
+    '完好': [['wán'], ['hǎo']],
+    '完结': [['wán'], ['jié']],
+    '宏丽': [['hóng'], ['lì']],
+    '宏大': [['hóng'], ['dà']],
+    '宏观': [['hóng'], ['guān']],
+    '宏论': [['hóng'], ['lùn']],
+    '宏量': [['hóng'], ['liàng']],
+    '宗亲': [['zōng'], ['qīn']],
+    '宗仰': [['zōng'], ['yǎng']],
+    '宗教': [['zōng'], ['jiào']],
+    '官价': [['guān'], ['jià']],
+    '官倒': [['guān'], ['dǎo']],
+    '官员': [['guān'], ['yuán']],
+    '官地': [['guān'], ['dì']],
+    '官场': [['guān'], ['chǎng']],
+    '官家': [['guān'], ['jiā']],
+    '官差': [['guān'], ['chāi']],
+    '官服': [['guān'], ['fú']],
+    '官校': [['guān'], ['xiào']],
+    '官称': [['guān'], ['chēng']],
+    '官能': [['guān'], ['néng']],
+    '官长': [['guān'], ['zhǎng']],
+    '定亲': [['dìng'], ['qīn']],
+    '定价': [['dìng'], ['jià']],
+    '定单': [['dìng'], ['dān']],
+    '定员': [['dìng'], ['yuán']],
+    '定当': [['dìng'], ['dàng']],
+    '定数': [['dìng'], ['shù']],
+    '定期': [['dìng'], ['qī']],
+    '定见': [['dìng'], ['jiàn']],
+    '定论': [['dìng'], ['lùn']],
+    '定语': [['dìng'], ['yǔ']],
+    '定说': [['dìng'], ['shuō']],
+    '定调': [['dìng'], ['diào']],
+    '定都': [['dìng'], ['dū']],
+    '定量': [['dìng'], ['liàng']],
+    '宛似': [['wǎn'], ['sì']],
+    '宛如': [['wǎn'], ['rú']],
+    '宛然': [['wǎn'], ['rán']],
+    '宛若': [['wǎn'], ['ruò']],
+    '宛转': [['wǎn'], ['zhuǎn']],
+    '宝刹': [['bǎo'], ['chà']],
+    '宝号': [['bǎo'], ['hào']],
+    '宝地': [['bǎo'], ['dì']],
+    '宝坻': [['bǎo'], ['dǐ']],
+    '宝应': [['bǎo'], ['yìng']],
+    '宝石': [['bǎo'], ['shí']],
+    '宝藏': [['bǎo'], ['zàng']],
+    '实价': [['shí'], ['jià']],
+    '实体': [['shí'], ['tǐ']],
+    '实地': [['shí'], ['dì']],
+    '实干': [['shí'], ['gàn']],
+    '实弹': [['shí'], ['dàn']],
+    '实据': [['shí'], ['jù']],
+    '实数': [['shí'], ['shù']],
+    '实景': [['shí'], ['jǐng']],
+    '实相': [['shí'], ['xiàng']],
+    '实落': [['shí'], ['luò']],
+    '实行': [['shí'], ['xíng']],
+    '宠信': [['chǒng'], ['xìn']],
+    '审处': [['shěn'], ['chǔ']],
+    '审干': [['shěn'], ['gàn']],
+    '审度': [['shěn'], ['duó']],
+    '审查': [['shěn'], ['chá']],
+    '审校': [['shěn'], ['jiào']],
+    '审核': [['shěn'], ['hé']],
+    '审结': [['shěn'], ['jié']],
+    '审读': [['shěn'], ['dú']],
+    '客体': [['kè'], ['tǐ']],
+    '客家': [['kè'], ['jiā']],
+    '客票': [['kè'], ['piào']],
+    '客观': [['kè'], ['guān']],
+    '客车': [['kè'], ['chē']],
+    '宣传': [['xuān'], ['chuán']],
+    '宣化': [['xuān'], ['huà']],
+    '宣召': [['xuān'], ['zhào']],
+    '宣教': [['xuān'], ['jiào']],
+    '宣泄': [['xuān'], ['xiè']],
+    '宣称': [['xuān'], ['chēng']],
+    '宣读': [['xuān'], ['dú']],
+    '室内': [['shì'], ['nèi']],
+    '室女': [['shì'], ['nǚ']],
+    '宫女': [['gōng'], ['nǚ']],
+    '宫扇': [['gōng'], ['shàn']],
+    '宫掖': [['gōng'], ['yè']],
+    '宫禁': [['gōng'], ['jìn']],
+    '宫调': [['gōng'], ['diào']],
+    '宫阙': [['gōng'], ['què']],
+    '宫颈': [['gōng'], ['jǐng']],
+    '宰相': [['zǎi'], ['xiàng']],
+    '害处': [['hài'], ['chù']],
+    '害臊': [['hài'], ['sào']],
+    '宴乐': [['yàn'], ['lè']],
+    '宴会': [['yàn'], ['huì']],
+    '宵旰': [['xiāo'], ['gàn']],
+    '宵禁': [['xiāo'], ['jìn']],
+    '家丁': [['jiā'], ['dīng']],
+    '家丑': [['jiā'], ['chǒu']],
+    '家世': [['jiā'], ['shì']],
+    '家业': [['jiā'], ['yè']],
+    '家严': [['jiā'], ['yán']],
+    '家乡': [['jiā'], ['xiāng']],
+    '家书': [['jiā'], ['shū']],
+    '家事': [['jiā'], ['shì']],
+    '家产': [['jiā'], ['chǎn']],
+    '家人': [['jiā'], ['rén']],
+    '家什': [['jiā'], ['shí']],
+    '家仆': [['jiā'], ['pú']],
+    '家仇': [['jiā'], ['chóu']],
+    '家伙': [['jiā'], ['huo']],
+    '家传': [['jiā'], ['chuán']],
+    '家信': [['jiā'], ['xìn']],
+    '家俱': [['jiā'], ['jù']],
+    '家兄': [['jiā'], ['xiōng']],
+    '家兔': [['jiā'], ['tù']],
+    '家具': [['jiā'], ['jù']],
+    '家养': [['jiā'], ['yǎng']],
+    '家务': [['jiā'], ['wù']],
+    '家口': [['jiā'], ['kǒu']],
+    '家史': [['jiā'], ['shǐ']],
+    '家园': [['jiā'], ['yuán']],
+    '家塾': [['jiā'], ['shú']],
+    '家境': [['jiā'], ['jìng']],
+    '家奴': [['jiā'], ['nú']],
+    '家姊': [['jiā'], ['zǐ']],
+    '家姑': [['jiā'], ['gū']],
+    '家学': [['jiā'], ['xué']],
+    '家宅': [['jiā'], ['zhái']],
+    '家室': [['jiā'], ['shì']],
+    '家宴': [['jiā'], ['yàn']],
+    '家家': [['jiā'], ['jiā']],
+    '家将': [['jiā'], ['jiàng']],
+    '家小': [['jiā'], ['xiǎo']],
+    '家居': [['jiā'], ['jū']],
+    '家属': [['jiā'], ['shǔ']],
+    '家常': [['jiā'], ['cháng']],
+    '家底': [['jiā'], ['dǐ']],
+    '家庭': [['jiā'], ['tíng']],
+    '家弟': [['jiā'], ['dì']],
+    '家当': [['jiā'], ['dàng']],
+    '家慈': [['jiā'], ['cí']],
+    '家政': [['jiā'], ['zhèng']],
+    '家教': [['jiā'], ['jiào']],
+    '家族': [['jiā'], ['zú']],
+    '家景': [['jiā'], ['jǐng']],
+    '家母': [['jiā'], ['mǔ']],
+    '家法': [['jiā'], ['fǎ']],
+    '家燕': [['jiā'], ['yàn']],
+    '家父': [['jiā'], ['fù']],
+    '家珍': [['jiā'], ['zhēn']],
+    '家用': [['jiā'], ['yòng']],
+    '家电': [['jiā'], ['diàn']],
+    '家畜': [['jiā'], ['chù']],
+    '家眷': [['jiā'], ['juàn']],
+    '家祠': [['jiā'], ['cí']],
+    '家祭': [['jiā'], ['jì']],
+    '家禽': [['jiā'], ['qín']],
+    '家私': [['jiā'], ['sī']],
+    '家种': [['jiā'], ['zhòng']],
+    '家童': [['jiā'], ['tóng']],
+    '家系': [['jiā'], ['xì']],
+    '家累': [['jiā'], ['lěi']],
+    '家翁': [['jiā'], ['wēng']],
+    '家臣': [['jiā'], ['chén']],
+    '家蚕': [['jiā'], ['cán']],
+    '家蝇': [['jiā'], ['yíng']],
+    '家规': [['jiā'], ['guī']],
+    '家计': [['jiā'], ['jì']],
+    '家训': [['jiā'], ['xùn']],
+    '家访': [['jiā'], ['fǎng']],
+    '家谱': [['jiā'], ['pǔ']],
+    '家财': [['jiā'], ['cái']],
+    '家贼': [['jiā'], ['zéi']],
+    '家资': [['jiā'], ['zī']],
+    '家道': [['jiā'], ['dào']],
+    '家酿': [['jiā'], ['niàng']],
+    '家里': [['jiā'], ['lǐ']],
+    '家长': [['jiā'], ['zhǎng']],
+    '家门': [['jiā'], ['mén']],
+    '家院': [['jiā'], ['yuàn']],
+    '家雀': [['jiā'], ['qiǎo']],
+    '家风': [['jiā'], ['fēng']],
+    '家鸡': [['jiā'], ['jī']],
+    '家鸽': [['jiā'], ['gē']],
+    '家鼠': [['jiā'], ['shǔ']],
+    '容许': [['róng'], ['xǔ']],
+    '容量': [['róng'], ['liàng']],
+    '宽假': [['kuān'], ['jiǎ']],
+    '宽和': [['kuān'], ['hé']],
+    '宽大': [['kuān'], ['dà']],
+    '宽广': [['kuān'], ['guǎng']],
+    '宽度': [['kuān'], ['dù']],
+    '宽待': [['kuān'], ['dài']],
+    '宽绰': [['kuān'], ['chuò']],
+    '宽解': [['kuān'], ['jiě']],
+    '宾从': [['bīn'], ['cóng']],
+    '宾服': [['bīn'], ['fú']],
+    '宿将': [['sù'], ['jiàng']],
+    '宿舍': [['sù'], ['shè']],
+    '密发': [['mì'], ['fà']],
+    '密语': [['mì'], ['yǔ']],
+    '富丽': [['fù'], ['lì']],
+    '富家': [['fù'], ['jiā']],
+    '富强': [['fù'], ['qiáng']],
+    '富有': [['fù'], ['yǒu']],
+    '富贾': [['fù'], ['jiǎ']],
+    '寒伧': [['hán'], ['chen']],
+    '寒假': [['hán'], ['jià']],
+    '寒凉': [['hán'], ['liáng']],
+    '寒号': [['hán'], ['hào']],
+    '寒症': [['hán'], ['zhèng']],
+    '寒舍': [['hán'], ['shè']],
+    '寒露': [['hán'], ['lù']],
+    '寒颤': [['hán'], ['zhàn']],
+    '寒食': [['hán'], ['shí']],
+    '寝车': [['qǐn'], ['chē']],
+    '寝食': [['qǐn'], ['shí']],
+    '察看': [['chá'], ['kàn']],
+    '察觉': [['chá'], ['jué']],
+    '寡合': [['guǎ'], ['hé']],
+    '寡头': [['guǎ'], ['tóu']],
+    '寡妻': [['guǎ'], ['qī']],
+    '寥落': [['liáo'], ['luò']],
+    '寸头': [['cùn'], ['tóu']],
+    '寸楷': [['cùn'], ['kǎi']],
+    '对内': [['duì'], ['nèi']],
+    '对劲': [['duì'], ['jìn']],
+    '对号': [['duì'], ['hào']],
+    '对头': [['duì'], ['tóu']],
+    '对家': [['duì'], ['jiā']],
+    '对峙': [['duì'], ['zhì']],
+    '对应': [['duì'], ['yìng']],
+    '对待': [['duì'], ['dài']],
+    '对打': [['duì'], ['dǎ']],
+    '对折': [['duì'], ['zhé']],
+    '对数': [['duì'], ['shù']],
+    '对症': [['duì'], ['zhèng']],
+    '对称': [['duì'], ['chèn']],
+    '对答': [['duì'], ['dá']],
+    '对簿': [['duì'], ['bù']],
+    '对角': [['duì'], ['jiǎo']],
+    '对调': [['duì'], ['diào']],
+    '对过': [['duì'], ['guò']],
+    '对齐': [['duì'], ['qí']],
+    '寺观': [['sì'], ['guàn']],
+    '寻思': [['xín'], ['sī']],
+    '寻见': [['xún'], ['jiàn']],
+    '导体': [['dǎo'], ['tǐ']],
+    '导弹': [['dǎo'], ['dàn']],
+    '导论': [['dǎo'], ['lùn']],
+    '导语': [['dǎo'], ['yǔ']],
+    '导读': [['dǎo'], ['dú']],
+    '寿屏': [['shòu'], ['píng']],
+    '寿数': [['shòu'], ['shù']],
+    '封号': [['fēng'], ['hào']],
+    '封地': [['fēng'], ['dì']],
+    '封底': [['fēng'], ['dǐ']],
+    '封条': [['fēng'], ['tiáo']],
+    '封泥': [['fēng'], ['ní']],
+    '封港': [['fēng'], ['gǎng']],
+    '封王': [['fēng'], ['wáng']],
+    '封疆': [['fēng'], ['jiāng']],
+    '封禁': [['fēng'], ['jìn']],
+    '封禅': [['fēng'], ['shàn']],
+    '射入': [['shè'], ['rù']],
+    '射击': [['shè'], ['jī']],
+    '射干': [['yè'], ['gàn']],
+    '射影': [['shè'], ['yǐng']],
+    '射手': [['shè'], ['shǒu']],
+    '射杀': [['shè'], ['shā']],
+    '射流': [['shè'], ['liú']],
+    '射猎': [['shè'], ['liè']],
+    '射界': [['shè'], ['jiè']],
+    '射程': [['shè'], ['chéng']],
+    '射箭': [['shè'], ['jiàn']],
+    '射精': [['shè'], ['jīng']],
+    '射线': [['shè'], ['xiàn']],
+    '射门': [['shè'], ['mén']],
+    '射频': [['shè'], ['pín']],
+    '将令': [['jiàng'], ['lìng']],
+    '将兵': [['jiàng'], ['bīng']],
+    '将养': [['jiāng'], ['yǎng']],
+    '将军': [['jiāng'], ['jūn']],
+    '将士': [['jiàng'], ['shì']],
+    '将官': [['jiàng'], ['guān']],
+    '将将': [['qiāng'], ['qiāng']],
+    '将尉': [['jiàng'], ['wèi']],
+    '将就': [['jiāng'], ['jiù']],
+    '将帅': [['jiàng'], ['shuài']],
+    '将息': [['jiāng'], ['xī']],
+    '将才': [['jiàng'], ['cái']],
+    '将来': [['jiāng'], ['lái']],
+    '将校': [['jiàng'], ['xiào']],
+    '将次': [['jiāng'], ['cì']],
+    '将相': [['jiàng'], ['xiàng']],
+    '将要': [['jiāng'], ['yào']],
+    '将近': [['jiāng'], ['jìn']],
+    '将门': [['jiàng'], ['mén']],
+    '将领': [['jiàng'], ['lǐng']],
+    '尉官': [['wèi'], ['guān']],
+    '尉犁': [['yù'], ['lí']],
+    '尉迟': [['yù'], ['chí']],
+    '小乘': [['xiǎo'], ['chéng']],
+    '小令': [['xiǎo'], ['lìng']],
+    '小传': [['xiǎo'], ['zhuàn']],
+    '小体': [['xiǎo'], ['tǐ']],
+    '小便': [['xiǎo'], ['biàn']],
+    '小别': [['xiǎo'], ['bié']],
+    '小区': [['xiǎo'], ['qū']],
+    '小卒': [['xiǎo'], ['zú']],
+    '小可': [['xiǎo'], ['kě']],
+    '小号': [['xiǎo'], ['hào']],
+    '小头': [['xiǎo'], ['tóu']],
+    '小女': [['xiǎo'], ['nǚ']],
+    '小将': [['xiǎo'], ['jiàng']],
+    '小弟': [['xiǎo'], ['dì']],
+    '小戏': [['xiǎo'], ['xì']],
+    '小教': [['xiǎo'], ['jiào']],
+    '小数': [['xiǎo'], ['shù']],
+    '小曲': [['xiǎo'], ['qǔ']],
+    '小枝': [['xiǎo'], ['zhī']],
+    '小楷': [['xiǎo'], ['kǎi']],
+    '小王': [['xiǎo'], ['wáng']],
+    '小看': [['xiǎo'], ['kàn']],
+    '小结': [['xiǎo'], ['jié']],
+    '小节': [['xiǎo'], ['jié']],
+    '小觑': [['xiǎo'], ['qù']],
+    '小角': [['xiǎo'], ['jiǎo']],
+    '小解': [['xiǎo'], ['jiě']],
+    '小说': [['xiǎo'], ['shuō']],
+    '小调': [['xiǎo'], ['diào']],
+    '小跑': [['xiǎo'], ['pǎo']],
+    '小车': [['xiǎo'], ['chē']],
+    '小过': [['xiǎo'], ['guò']],
+    '小量': [['xiǎo'], ['liàng']],
+    '小雨': [['xiǎo'], ['yǔ']],
+    '小食': [['xiǎo'], ['shí']],
+    '少儿': [['shǎo'], ['ér']],
+    '少刻': [['shǎo'], ['kè']],
+    '少商': [['shǎo'], ['shāng']],
+    '少壮': [['shào'], ['zhuàng']],
+    '少女': [['shào'], ['nǚ']],
+    '少妇': [['shào'], ['fù']],
+    '少子': [['shǎo'], ['zǐ']],
+    '少将': [['shào'], ['jiàng']],
+    '少尉': [['shào'], ['wèi']],
+    '少小': [['shào'], ['xiǎo']],
+    '少少': [['shǎo'], ['shǎo']],
+    '少帅': [['shǎo'], ['shuài']],
+    '少年': [['shào'], ['nián']],
+    '少府': [['shào'], ['fǔ']],
+    '少待': [['shǎo'], ['dài']],
+    '少数': [['shǎo'], ['shù']],
+    '少时': [['shǎo'], ['shí']],
+    '少有': [['shǎo'], ['yǒu']],
+    '少林': [['shǎo'], ['lín']],
+    '少校': [['shào'], ['xiào']],
+    '少海': [['shǎo'], ['hǎi']],
+    '少爷': [['shào'], ['yé']],
+    '少男': [['shǎo'], ['nán']],
+    '少相': [['shào'], ['xiāng']],
+    '少礼': [['shǎo'], ['lǐ']],
+    '少见': [['shǎo'], ['jiàn']],
+    '少许': [['shǎo'], ['xǔ']],
+    '少说': [['shǎo'], ['shuō']],
+    '少量': [['shǎo'], ['liàng']],
+    '少陪': [['shǎo'], ['péi']],
+    '少顷': [['shǎo'], ['qǐng']],
+    '尖削': [['jiān'], ['xiāo']],
+    '尖头': [['jiān'], ['tóu']],
+    '尘沙': [['chén'], ['shā']],
+    '尘芥': [['chén'], ['jiè']],
+    '尚且': [['shàng'], ['qiě']],
+    '尚可': [['shàng'], ['kě']],
+    '尚好': [['shàng'], ['hǎo']],
+    '尝鲜': [['cháng'], ['xiān']],
+    '尤其': [['yóu'], ['qí']],
+    '就任': [['jiù'], ['rèn']],
+    '就便': [['jiù'], ['biàn']],
+    '就合': [['jiù'], ['hé']],
+    '就地': [['jiù'], ['dì']],
+    '就教': [['jiù'], ['jiào']],
+    '就正': [['jiù'], ['zhèng']],
+    '就要': [['jiù'], ['yào']],
+    '就食': [['jiù'], ['shí']],
+    '尸体': [['shī'], ['tǐ']],
+    '尸骨': [['shī'], ['gǔ']],
+    '尺头': [['chǐ'], ['tóu']],
+    '尺子': [['chǐ'], ['zi']],
+    '尺寸': [['chǐ'], ['cùn']],
+    '尺幅': [['chǐ'], ['fú']],
+    '尺度': [['chǐ'], ['dù']],
+    '尺泽': [['chǐ'], ['zé']],
+    '尺牍': [['chǐ'], ['dú']],
+    '尺码': [['chǐ'], ['mǎ']],
+    '尺蠖': [['chǐ'], ['huò']],
+    '尺骨': [['chǐ'], ['gǔ']],
+    '尼采': [['ní'], ['cǎi']],
+    '尽先': [['jǐn'], ['xiān']],
+    '尽兴': [['jìn'], ['xìng']],
+    '尽力': [['jìn'], ['lì']],
+    '尽头': [['jìn'], ['tóu']],
+    '尽孝': [['jìn'], ['xiào']],
+    '尽心': [['jìn'], ['xīn']],
+    '尽忠': [['jìn'], ['zhōng']],
+    '尽快': [['jǐn'], ['kuài']],
+    '尽性': [['jìn'], ['xìng']],
+    '尽情': [['jìn'], ['qíng']],
+    '尽意': [['jìn'], ['yì']],
+    '尽数': [['jìn'], ['shù']],
+    '尽早': [['jǐn'], ['zǎo']],
+    '尽是': [['jìn'], ['shì']],
+    '尽欢': [['jìn'], ['huān']],
+    '尽然': [['jìn'], ['rán']],
+    '尽瘁': [['jìn'], ['cuì']],
+    '尽着': [['jǐn'], ['zhe']],
+    '尽管': [['jǐn'], ['guǎn']],
+    '尽职': [['jìn'], ['zhí']],
+    '尽自': [['jǐn'], ['zì']],
+    '尽致': [['jìn'], ['zhì']],
+    '尽让': [['jìn'], ['ràng']],
+    '尽责': [['jìn'], ['zé']],
+    '尽量': [['jǐn'], ['liàng']],
+    '尾声': [['wěi'], ['shēng']],
+    '尾巴': [['wěi'], ['bā']],
+    '尾数': [['wěi'], ['shù']],
+    '尾欠': [['wěi'], ['qiàn']],
+    '尾气': [['wěi'], ['qì']],
+    '尾灯': [['wěi'], ['dēng']],
+    '尾矿': [['wěi'], ['kuàng']],
+    '尾羽': [['wěi'], ['yǔ']],
+    '尾翼': [['wěi'], ['yì']],
+    '尾花': [['wěi'], ['huā']],
+    '尾蚴': [['wěi'], ['yòu']],
+    '尾部': [['wěi'], ['bù']],
+    '尾随': [['wěi'], ['suí']],
+    '尾音': [['wěi'], ['yīn']],
+    '尾骨': [['wěi'], ['gǔ']],
+    '尿壶': [['niào'], ['hú']],
+    '尿布': [['niào'], ['bù']],
+    '尿床': [['niào'], ['chuáng']],
+    '尿泡': [['suī'], ['pào']],
+    '尿炕': [['niào'], ['kàng']],
+    '尿盆': [['niào'], ['pén']],
+    '尿素': [['niào'], ['sù']],
+    '尿肥': [['niào'], ['féi']],
+    '尿脬': [['suī'], ['pāo']],
+    '尿血': [['niào'], ['xuè']],
+    '尿道': [['niào'], ['dào']],
+    '尿闭': [['niào'], ['bì']],
+    '局度': [['jú'], ['dù']],
+    '局量': [['jú'], ['liàng']],
+    '局长': [['jú'], ['zhǎng']],
+    '居丧': [['jū'], ['sāng']],
+    '居中': [['jū'], ['zhōng']],
+    '居处': [['jū'], ['chǔ']],
+    '居奇': [['jū'], ['qí']],
+    '居家': [['jū'], ['jiā']],
+    '居间': [['jū'], ['jiān']],
+    '屈从': [['qū'], ['cóng']],
+    '屈强': [['qū'], ['qiáng']],
+    '屈折': [['qū'], ['shé']],
+    '屈曲': [['qū'], ['qǔ']],
+    '屈服': [['qū'], ['fú']],
+    '屈节': [['qū'], ['jié']],
+    '届期': [['jiè'], ['qī']],
+    '屋子': [['wū'], ['zi']],
+    '屏住': [['bǐng'], ['zhù']],
+    '屏山': [['píng'], ['shān']],
+    '屏幕': [['píng'], ['mù']],
+    '屏弃': [['bǐng'], ['qì']],
+    '屏息': [['bǐng'], ['xī']],
+    '屏条': [['píng'], ['tiáo']],
+    '屏气': [['bǐng'], ['qì']],
+    '屏蔽': [['píng'], ['bì']],
+    '屏藩': [['píng'], ['fān']],
+    '屏迹': [['píng'], ['jì']],
+    '屏退': [['bǐng'], ['tuì']],
+    '屏门': [['píng'], ['mén']],
+    '屏除': [['bǐng'], ['chú']],
+    '屏障': [['píng'], ['zhàng']],
+    '屏风': [['píng'], ['fēng']],
+    '屑子': [['xiè'], ['zi']],
+    '展期': [['zhǎn'], ['qī']],
+    '展读': [['zhǎn'], ['dú']],
+    '展转': [['zhǎn'], ['zhuǎn']],
+    '屙尿': [['ē'], ['niào']],
+    '属意': [['zhǔ'], ['yì']],
+    '属文': [['zhǔ'], ['wén']],
+    '属望': [['zhǔ'], ['wàng']],
+    '履约': [['lǚ'], ['yuē']],
+    '履行': [['lǚ'], ['xíng']],
+    '屯兵': [['tún'], ['bīng']],
+    '屯垦': [['tún'], ['kěn']],
+    '屯子': [['tún'], ['zǐ']],
+    '屯守': [['tún'], ['shǒu']],
+    '屯扎': [['tún'], ['zhā']],
+    '屯田': [['tún'], ['tián']],
+    '屯留': [['tún'], ['liú']],
+    '屯积': [['tún'], ['jī']],
+    '屯粮': [['tún'], ['liáng']],
+    '屯聚': [['tún'], ['jù']],
+    '屯落': [['tún'], ['luò']],
+    '屯集': [['tún'], ['jí']],
+    '屯驻': [['tún'], ['zhù']],
+    '山体': [['shān'], ['tǐ']],
+    '山凹': [['shān'], ['āo']],
+    '山区': [['shān'], ['qū']],
+    '山地': [['shān'], ['dì']],
+    '山头': [['shān'], ['tóu']],
+    '山岭': [['shān'], ['lǐng']],
+    '山楂': [['shān'], ['zhā']],
+    '山炮': [['shān'], ['pào']],
+    '山猫': [['shān'], ['māo']],
+    '山系': [['shān'], ['xì']],
+    '山脉': [['shān'], ['mài']],
+    '山雀': [['shān'], ['què']],
+    '山龟': [['shān'], ['guī']],
+    '岁差': [['suì'], ['chà']],
+    '岁数': [['suì'], ['shù']],
+    '岂不': [['qǐ'], ['bù']],
+    '岂但': [['qǐ'], ['dàn']],
+    '岂可': [['qǐ'], ['kě']],
+    '岂敢': [['qǐ'], ['gǎn']],
+    '岂止': [['qǐ'], ['zhǐ']],
+    '岂肯': [['qǐ'], ['kěn']],
+    '岂能': [['qǐ'], ['néng']],
+    '岂非': [['qǐ'], ['fēi']],
+    '岔子': [['chà'], ['zi']],
+    '岗卡': [['gǎng'], ['kǎ']],
+    '岗地': [['gǎng'], ['dì']],
+    '岩浆': [['yán'], ['jiāng']],
+    '岩石': [['yán'], ['shí']],
+    '岩芯': [['yán'], ['xìn']],
+    '岬角': [['jiǎ'], ['jiǎo']],
+    '岭南': [['lǐng'], ['nán']],
+    '岳家': [['yuè'], ['jiā']],
+    '岳父': [['yuè'], ['fù']],
+    '峙立': [['zhì'], ['lì']],
+    '峻岭': [['jùn'], ['lǐng']],
+    '崩坏': [['bēng'], ['huài']],
+    '崩溃': [['bēng'], ['kuì']],
+    '崩裂': [['bēng'], ['liè']],
+    '崩解': [['bēng'], ['jiě']],
+    '嵌入': [['qiàn'], ['rù']],
+    '嵌合': [['qiàn'], ['hé']],
+    '嵌镶': [['qiàn'], ['xiāng']],
+    '州长': [['zhōu'], ['zhǎng']],
+    '巡更': [['xún'], ['gēng']],
+    '巡查': [['xún'], ['chá']],
+    '巡行': [['xún'], ['xíng']],
+    '巡风': [['xún'], ['fēng']],
+    '工价': [['gōng'], ['jià']],
+    '工休': [['gōng'], ['xiū']],
+    '工会': [['gōng'], ['huì']],
+    '工分': [['gōng'], ['fēn']],
+    '工区': [['gōng'], ['qū']],
+    '工厂': [['gōng'], ['chǎng']],
+    '工地': [['gōng'], ['dì']],
+    '工场': [['gōng'], ['chǎng']],
+    '工夫': [['gōng'], ['fū']],
+    '工头': [['gōng'], ['tóu']],
+    '工尺': [['gōng'], ['chě']],
+    '工期': [['gōng'], ['qī']],
+    '工楷': [['gōng'], ['kǎi']],
+    '工种': [['gōng'], ['zhǒng']],
+    '工行': [['gōng'], ['háng']],
+    '工读': [['gōng'], ['dú']],
+    '工长': [['gōng'], ['zhǎng']],
+    '工间': [['gōng'], ['jiān']],
+    '左传': [['zuǒ'], ['zhuàn']],
+    '左侧': [['zuǒ'], ['cè']],
+    '左券': [['zuǒ'], ['quàn']],
+    '左转': [['zuǒ'], ['zhuǎn']],
+    '巧劲': [['qiǎo'], ['jìn']],
+    '巧合': [['qiǎo'], ['hé']],
+    '巧干': [['qiǎo'], ['gàn']],
+    '巧思': [['qiǎo'], ['sī']],
+    '巨大': [['jù'], ['dà']],
+    '巨头': [['jù'], ['tóu']],
+    '巨擘': [['jù'], ['bò']],
+    '巨著': [['jù'], ['zhù']],
+    '巨贾': [['jù'], ['gǔ']],
+    '巨量': [['jù'], ['liàng']],
+    '巨阙': [['jù'], ['quē']],
+    '巫女': [['wū'], ['nǚ']],
+    '巫术': [['wū'], ['shù']],
+    '差事': [['chāi'], ['shì']],
+    '差价': [['chā'], ['jià']],
+    '差使': [['chāi'], ['shǐ']],
+    '差值': [['chā'], ['zhí']],
+    '差分': [['chā'], ['fēn']],
+    '差别': [['chā'], ['bié']],
+    '差动': [['chā'], ['dòng']],
+    '差劲': [['chà'], ['jìn']],
+    '差可': [['chā'], ['kě']],
+    '差失': [['chà'], ['shī']],
+    '差官': [['chà'], ['guān']],
+    '差异': [['chā'], ['yì']],
+    '差役': [['chāi'], ['yì']],
+    '差拨': [['chāi'], ['bō']],
+    '差数': [['chā'], ['shù']],
+    '差池': [['chā'], ['chí']],
+    '差点': [['chà'], ['diǎn']],
+    '差等': [['chà'], ['děng']],
+    '差缺': [['chāi'], ['quē']],
+    '差误': [['chà'], ['wù']],
+    '差距': [['chā'], ['jù']],
+    '差遣': [['chāi'], ['qiǎn']],
+    '差错': [['chā'], ['cuò']],
+    '差额': [['chā'], ['é']],
+    '差饷': [['chāi'], ['xiǎng']],
+    '己任': [['jǐ'], ['rèn']],
+    '己见': [['jǐ'], ['jiàn']],
+    '巴结': [['bā'], ['jié']],
+    '巷口': [['xiàng'], ['kǒu']],
+    '巷子': [['xiàng'], ['zi']],
+    '巷战': [['xiàng'], ['zhàn']],
+    '巷道': [['hàng'], ['dào']],
+    '巷陌': [['xiàng'], ['mò']],
+    '市价': [['shì'], ['jià']],
+    '市区': [['shì'], ['qū']],
+    '市场': [['shì'], ['chǎng']],
+    '市尺': [['shì'], ['chǐ']],
+    '市长': [['shì'], ['zhǎng']],
+    '布丁': [['bù'], ['dīng']],
+    '布头': [['bù'], ['tóu']],
+    '布景': [['bù'], ['jǐng']],
+    '师传': [['shī'], ['chuán']],
+    '师伯': [['shī'], ['bó']],
+    '师弟': [['shī'], ['dì']],
+    '师父': [['shī'], ['fù']],
+    '师长': [['shī'], ['zhǎng']],
+    '希奇': [['xī'], ['qí']],
+    '希有': [['xī'], ['yǒu']],
+    '希腊': [['xī'], ['là']],
+    '帐单': [['zhàng'], ['dān']],
+    '帐簿': [['zhàng'], ['bù']],
+    '帖子': [['tiě'], ['zǐ']],
+    '帖服': [['tiē'], ['fú']],
+    '帘子': [['lián'], ['zi']],
+    '帝号': [['dì'], ['hào']],
+    '帝王': [['dì'], ['wáng']],
+    '帝都': [['dì'], ['dū']],
+    '带劲': [['dài'], ['jìn']],
+    '带头': [['dài'], ['tóu']],
+    '带累': [['dài'], ['lèi']],
+    '带脉': [['dài'], ['mài']],
+    '带菌': [['dài'], ['jūn']],
+    '带钢': [['dài'], ['gāng']],
+    '席卷': [['xí'], ['juǎn']],
+    '席地': [['xí'], ['dì']],
+    '帮会': [['bāng'], ['huì']],
+    '帮佣': [['bāng'], ['yōng']],
+    '帮助': [['bāng'], ['zhù']],
+    '帮同': [['bāng'], ['tóng']],
+    '帮教': [['bāng'], ['jiào']],
+    '常服': [['cháng'], ['fú']],
+    '帽子': [['mào'], ['zi']],
+    '幂数': [['mì'], ['shù']],
+    '幅员': [['fú'], ['yuán']],
+    '幅度': [['fú'], ['dù']],
+    '幌子': [['huǎng'], ['zi']],
+    '幔子': [['màn'], ['zi']],
+    '幛子': [['zhàng'], ['zi']],
+    '幢幢': [['chuáng'], ['chuáng']],
+    '干么': [['gàn'], ['me']],
+    '干事': [['gàn'], ['shì']],
+    '干亲': [['gān'], ['qīn']],
+    '干仗': [['gàn'], ['zhàng']],
+    '干儿': [['gān'], ['ér']],
+    '干冰': [['gān'], ['bīng']],
+    '干冷': [['gān'], ['lěng']],
+    '干净': [['gān'], ['jìng']],
+    '干劲': [['gàn'], ['jìn']],
+    '干号': [['gān'], ['háo']],
+    '干吗': [['gàn'], ['má']],
+    '干呕': [['gān'], ['ǒu']],
+    '干员': [['gàn'], ['yuán']],
+    '干咳': [['gān'], ['hāi']],
+    '干哕': [['gān'], ['yuě']],
+    '干哭': [['gān'], ['kū']],
+    '干嘛': [['gàn'], ['ma']],
+    '干嚎': [['gān'], ['háo']],
+    '干城': [['gān'], ['chéng']],
+    '干姜': [['gān'], ['jiāng']],
+    '干娘': [['gān'], ['niáng']],
+    '干将': [['gàn'], ['jiàng']],
+    '干尸': [['gān'], ['shī']],
+    '干巴': [['gān'], ['bā']],
+    '干干': [['gàn'], ['gàn']],
+    '干急': [['gān'], ['jí']],
+    '干戈': [['gān'], ['gē']],
+    '干才': [['gàn'], ['cái']],
+    '干扰': [['gān'], ['rǎo']],
+    '干掉': [['gàn'], ['diào']],
+    '干支': [['gān'], ['zhī']],
+    '干政': [['gān'], ['zhèng']],
+    '干旱': [['gān'], ['hàn']],
+    '干杯': [['gān'], ['bēi']],
+    '干松': [['gān'], ['sōng']],
+    '干果': [['gān'], ['guǒ']],
+    '干枯': [['gān'], ['kū']],
+    '干架': [['gàn'], ['jià']],
+    '干柴': [['gān'], ['chái']],
+    '干校': [['gàn'], ['xiào']],
+    '干洗': [['gān'], ['xǐ']],
+    '干活': [['gàn'], ['huó']],
+    '干流': [['gàn'], ['liú']],
+    '干涉': [['gān'], ['shè']],
+    '干涩': [['gān'], ['sè']],
+    '干涸': [['gān'], ['hé']],
+    '干渠': [['gàn'], ['qú']],
+    '干渴': [['gān'], ['kě']],
+    '干点': [['gān'], ['diǎn']],
+    '干燥': [['gān'], ['zào']],
+    '干爹': [['gān'], ['diē']],
+    '干爽': [['gān'], ['shuǎng']],
+    '干犯': [['gān'], ['fàn']],
+    '干瘦': [['gān'], ['shòu']],
+    '干瘪': [['gān'], ['biě']],
+    '干白': [['gàn'], ['bái']],
+    '干硬': [['gān'], ['yìng']],
+    '干碍': [['gān'], ['ài']],
+    '干笑': [['gān'], ['xiào']],
+    '干粉': [['gān'], ['fěn']],
+    '干粮': [['gān'], ['liáng']],
+    '干系': [['gān'], ['xì']],
+    '干线': [['gàn'], ['xiàn']],
+    '干练': [['gàn'], ['liàn']],
+    '干结': [['gān'], ['jié']],
+    '干股': [['gān'], ['gǔ']],
+    '干脆': [['gān'], ['cuì']],
+    '干花': [['gān'], ['huā']],
+    '干草': [['gān'], ['cǎo']],
+    '干菜': [['gān'], ['cài']],
+    '干薪': [['gān'], ['xīn']],
+    '干裂': [['gān'], ['liè']],
+    '干警': [['gàn'], ['jǐng']],
+    '干谒': [['gān'], ['yè']],
+    '干贝': [['gān'], ['bèi']],
+    '干货': [['gān'], ['huò']],
+    '干路': [['gàn'], ['lù']],
+    '干连': [['gān'], ['lián']],
+    '干道': [['gàn'], ['dào']],
+    '干部': [['gàn'], ['bù']],
+    '干酪': [['gān'], ['lào']],
+    '干预': [['gān'], ['yù']],
+    '干饭': [['gān'], ['fàn']],
+    '干馏': [['gān'], ['liú']],
+    '平乐': [['píng'], ['lè']],
+    '平价': [['píng'], ['jià']],
+    '平信': [['píng'], ['xìn']],
+    '平分': [['píng'], ['fēn']],
+    '平台': [['píng'], ['tái']],
+    '平和': [['píng'], ['hé']],
+    '平地': [['píng'], ['dì']],
+    '平头': [['píng'], ['tóu']],
+    '平峒': [['píng'], ['dòng']],
+    '平巷': [['píng'], ['hàng']],
+    '平度': [['píng'], ['dù']],
+    '平服': [['píng'], ['fú']],
+    '平正': [['píng'], ['zhèng']],
+    '平空': [['píng'], ['kōng']],
+    '平行': [['píng'], ['xíng']],
+    '平调': [['píng'], ['diào']],
+    '平远': [['píng'], ['yuǎn']],
+    '平铺': [['píng'], ['pù']],
+    '年中': [['nián'], ['zhōng']],
+    '年份': [['nián'], ['fèn']],
+    '年会': [['nián'], ['huì']],
+    '年假': [['nián'], ['jià']],
+    '年分': [['nián'], ['fēn']],
+    '年华': [['nián'], ['huá']],
+    '年号': [['nián'], ['hào']],
+    '年头': [['nián'], ['tóu']],
+    '年少': [['nián'], ['shào']],
+    '年尾': [['nián'], ['wěi']],
+    '年底': [['nián'], ['dǐ']],
+    '年度': [['nián'], ['dù']],
+    '年景': [['nián'], ['jǐng']],
+    '年纪': [['nián'], ['jì']],
+    '年节': [['nián'], ['jié']],
+    '年长': [['nián'], ['zhǎng']],
+    '年间': [['nián'], ['jiān']],
+    '并且': [['bìng'], ['qiě']],
+    '并举': [['bìng'], ['jǔ']],
+    '并入': [['bìng'], ['rù']],
+    '并列': [['bìng'], ['liè']],
+    '并力': [['bìng'], ['lì']],
+    '并发': [['bìng'], ['fā']],
+    '并合': [['bìng'], ['hé']],
+    '并吞': [['bìng'], ['tūn']],
+    '并处': [['bìng'], ['chǔ']],
+    '并存': [['bìng'], ['cún']],
+    '并州': [['bīng'], ['zhōu']],
+    '并拢': [['bìng'], ['lǒng']],
+    '并排': [['bìng'], ['pái']],
+    '并用': [['bìng'], ['yòng']],
+    '并称': [['bìng'], ['chēng']],
+    '并立': [['bìng'], ['lì']],
+    '并网': [['bìng'], ['wǎng']],
+    '并置': [['bìng'], ['zhì']],
+    '并联': [['bìng'], ['lián']],
+    '并肩': [['bìng'], ['jiān']],
+    '并蒂': [['bìng'], ['dì']],
+    '并行': [['bìng'], ['xíng']],
+    '并轨': [['bìng'], ['guǐ']],
+    '并进': [['bìng'], ['jìn']],
+    '并重': [['bìng'], ['zhòng']],
+    '幸会': [['xìng'], ['huì']],
+    '幸好': [['xìng'], ['hǎo']],
+    '幸得': [['xìng'], ['de']],
+    '幸甚': [['xìng'], ['shèn']],
+    '幻化': [['huàn'], ['huà']],
+    '幻数': [['huàn'], ['shù']],
+    '幻景': [['huàn'], ['jǐng']],
+    '幻术': [['huàn'], ['shù']],
+    '幻觉': [['huàn'], ['jué']],
+    '幼体': [['yòu'], ['tǐ']],
+    '幼教': [['yòu'], ['jiào']],
+    '幼畜': [['yòu'], ['chù']],
+    '幽丽': [['yōu'], ['lì']],
+    '幽会': [['yōu'], ['huì']],
+    '幽咽': [['yōu'], ['yè']],
+    '幽思': [['yōu'], ['sī']],
+    '幽期': [['yōu'], ['qī']],
+    '幽禁': [['yōu'], ['jìn']],
+    '幽趣': [['yōu'], ['qù']],
+    '广东': [['guǎng'], ['dōng']],
+    '广义': [['guǎng'], ['yì']],
+    '广众': [['guǎng'], ['zhòng']],
+    '广博': [['guǎng'], ['bó']],
+    '广厦': [['guǎng'], ['shà']],
+    '广告': [['guǎng'], ['gào']],
+    '广场': [['guǎng'], ['chǎng']],
+    '广大': [['guǎng'], ['dà']],
+    '广岛': [['guǎng'], ['dǎo']],
+    '广州': [['guǎng'], ['zhōu']],
+    '广平': [['guǎng'], ['píng']],
+    '广度': [['guǎng'], ['dù']],
+    '广播': [['guǎng'], ['bō']],
+    '广求': [['guǎng'], ['qiú']],
+    '广泛': [['guǎng'], ['fàn']],
+    '广漠': [['guǎng'], ['mò']],
+    '广袤': [['guǎng'], ['mào']],
+    '广西': [['guǎng'], ['xī']],
+    '广谱': [['guǎng'], ['pǔ']],
+    '广货': [['guǎng'], ['huò']],
+    '广远': [['guǎng'], ['yuǎn']],
+    '广阔': [['guǎng'], ['kuò']],
+    '广饶': [['guǎng'], ['ráo']],
+    '庄家': [['zhuāng'], ['jiā']],
+    '庄重': [['zhuāng'], ['zhòng']],
+    '庇荫': [['bì'], ['yìn']],
+    '床单': [['chuáng'], ['dān']],
+    '床头': [['chuáng'], ['tóu']],
+    '床铺': [['chuáng'], ['pù']],
+    '序数': [['xù'], ['shù']],
+    '序曲': [['xù'], ['qǔ']],
+    '序论': [['xù'], ['lùn']],
+    '库券': [['kù'], ['quàn']],
+    '库藏': [['kù'], ['cáng']],
+    '应举': [['yìng'], ['jǔ']],
+    '应从': [['yìng'], ['cóng']],
+    '应付': [['yìng'], ['fù']],
+    '应傲': [['yìng'], ['ào']],
+    '应允': [['yīng'], ['yǔn']],
+    '应分': [['yīng'], ['fèn']],
+    '应制': [['yìng'], ['zhì']],
+    '应募': [['yìng'], ['mù']],
+    '应卯': [['yìng'], ['mǎo']],
+    '应变': [['yìng'], ['biàn']],
+    '应召': [['yìng'], ['zhào']],
+    '应命': [['yìng'], ['mìng']],
+    '应和': [['yìng'], ['hè']],
+    '应声': [['yīng'], ['shēng']],
+    '应对': [['yìng'], ['duì']],
+    '应届': [['yīng'], ['jiè']],
+    '应市': [['yìng'], ['shì']],
+    '应当': [['yīng'], ['dāng']],
+    '应征': [['yìng'], ['zhēng']],
+    '应得': [['yīng'], ['de']],
+    '应徵': [['yìng'], ['zhǐ']],
+    '应急': [['yìng'], ['jí']],
+    '应战': [['yìng'], ['zhàn']],
+    '应手': [['yìng'], ['shǒu']],
+    '应承': [['yìng'], ['chéng']],
+    '应接': [['yìng'], ['jiē']],
+    '应敌': [['yìng'], ['dí']],
+    '应时': [['yìng'], ['shí']],
+    '应景': [['yìng'], ['jǐng']],
+    '应有': [['yīng'], ['yǒu']],
+    '应用': [['yìng'], ['yòng']],
+    '应答': [['yìng'], ['dá']],
+    '应约': [['yìng'], ['yuē']],
+    '应考': [['yìng'], ['kǎo']],
+    '应聘': [['yìng'], ['pìn']],
+    '应许': [['yīng'], ['xǔ']],
+    '应诊': [['yìng'], ['zhěn']],
+    '应试': [['yìng'], ['shì']],
+    '应该': [['yīng'], ['gāi']],
+    '应诺': [['yìng'], ['nuò']],
+    '应运': [['yìng'], ['yùn']],
+    '应选': [['yìng'], ['xuǎn']],
+    '应邀': [['yìng'], ['yāo']],
+    '应酬': [['yìng'], ['chóu']],
+    '应门': [['yìng'], ['mén']],
+    '应验': [['yìng'], ['yàn']],
+    '底下': [['dǐ'], ['xià']],
+    '底册': [['dǐ'], ['cè']],
+    '底土': [['dǐ'], ['tǔ']],
+    '底墒': [['dǐ'], ['shāng']],
+    '底子': [['dǐ'], ['zi']],
+    '底孔': [['dǐ'], ['kǒng']],
+    '底定': [['dǐ'], ['dìng']],
+    '底层': [['dǐ'], ['céng']],
+    '底工': [['dǐ'], ['gōng']],
+    '底座': [['dǐ'], ['zuò']],
+    '底数': [['dǐ'], ['shù']],
+    '底本': [['dǐ'], ['běn']],
+    '底样': [['dǐ'], ['yàng']],
+    '底止': [['dǐ'], ['zhǐ']],
+    '底气': [['dǐ'], ['qì']],
+    '底漆': [['dǐ'], ['qī']],
+    '底火': [['dǐ'], ['huǒ']],
+    '底片': [['dǐ'], ['piàn']],
+    '底版': [['dǐ'], ['bǎn']],
+    '底牌': [['dǐ'], ['pái']],
+    '底盘': [['dǐ'], ['pán']],
+    '底稿': [['dǐ'], ['gǎo']],
+    '底线': [['dǐ'], ['xiàn']],
+    '底细': [['dǐ'], ['xì']],
+    '底肥': [['dǐ'], ['féi']],
+    '底色': [['dǐ'], ['sè']],
+    '底蕴': [['dǐ'], ['yùn']],
+    '底薪': [['dǐ'], ['xīn']],
+    '底襟': [['dǐ'], ['jīn']],
+    '底角': [['dǐ'], ['jiǎo']],
+    '底账': [['dǐ'], ['zhàng']],
+    '底边': [['dǐ'], ['biān']],
+    '底里': [['dǐ'], ['lǐ']],
+    '庖丁': [['páo'], ['dīng']],
+    '店员': [['diàn'], ['yuán']],
+    '店家': [['diàn'], ['jiā']],
+    '店铺': [['diàn'], ['pù']],
+    '店长': [['diàn'], ['zhǎng']],
+    '庙会': [['miào'], ['huì']],
+    '庙号': [['miào'], ['hào']],
+    '庚帖': [['gēng'], ['tiě']],
+    '府上': [['fǔ'], ['shàng']],
+    '庞大': [['páng'], ['dà']],
+    '度假': [['dù'], ['jià']],
+    '度命': [['dù'], ['mìng']],
+    '度外': [['dù'], ['wài']],
+    '度数': [['dù'], ['shù']],
+    '度日': [['dù'], ['rì']],
+    '度曲': [['dù'], ['qǔ']],
+    '度牒': [['dù'], ['dié']],
+    '度荒': [['dù'], ['huāng']],
+    '度过': [['dù'], ['guò']],
+    '度量': [['dù'], ['liàng']],
+    '座号': [['zuò'], ['hào']],
+    '座落': [['zuò'], ['luò']],
+    '庭长': [['tíng'], ['zhǎng']],
+    '庸碌': [['yōng'], ['lù']],
+    '廉价': [['lián'], ['jià']],
+    '廉正': [['lián'], ['zhèng']],
+    '廓落': [['kuò'], ['luò']],
+    '延搁': [['yán'], ['gē']],
+    '延期': [['yán'], ['qī']],
+    '延长': [['yán'], ['cháng']],
+    '廷尉': [['tíng'], ['wèi']],
+    '建中': [['jiàn'], ['zhōng']],
+    '建筑': [['jiàn'], ['zhù']],
+    '建行': [['jiàn'], ['háng']],
+    '建都': [['jiàn'], ['dū']],
+    '开价': [['kāi'], ['jià']],
+    '开会': [['kāi'], ['huì']],
+    '开创': [['kāi'], ['chuàng']],
+    '开化': [['kāi'], ['huà']],
+    '开单': [['kāi'], ['dān']],
+    '开卷': [['kāi'], ['juàn']],
+    '开叉': [['kāi'], ['chā']],
+    '开发': [['kāi'], ['fā']],
+    '开台': [['kāi'], ['tái']],
+    '开场': [['kāi'], ['chǎng']],
+    '开头': [['kāi'], ['tóu']],
+    '开屏': [['kāi'], ['píng']],
+    '开戏': [['kāi'], ['xì']],
+    '开打': [['kāi'], ['dǎ']],
+    '开拓': [['kāi'], ['tuò']],
+    '开溜': [['kāi'], ['liū']],
+    '开炮': [['kāi'], ['pào']],
+    '开疆': [['kāi'], ['jiāng']],
+    '开票': [['kāi'], ['piào']],
+    '开禁': [['kāi'], ['jìn']],
+    '开蒙': [['kāi'], ['méng']],
+    '开行': [['kāi'], ['xíng']],
+    '开裂': [['kāi'], ['liè']],
+    '开解': [['kāi'], ['jiě']],
+    '开豁': [['kāi'], ['huō']],
+    '开车': [['kāi'], ['chē']],
+    '开辟': [['kāi'], ['pì']],
+    '开采': [['kāi'], ['cǎi']],
+    '开间': [['kāi'], ['jiān']],
+    '异化': [['yì'], ['huà']],
+    '异同': [['yì'], ['tóng']],
+    '异地': [['yì'], ['dì']],
+    '异教': [['yì'], ['jiào']],
+    '异能': [['yì'], ['néng']],
+    '异见': [['yì'], ['jiàn']],
+    '异说': [['yì'], ['shuō']],
+    '异读': [['yì'], ['dú']],
+    '异趣': [['yì'], ['qù']],
+    '弄假': [['nòng'], ['jiǎ']],
+    '弄口': [['lòng'], ['kǒu']],
+    '弄堂': [['lòng'], ['táng']],
+    '弄权': [['nòng'], ['quán']],
+    '弄死': [['nòng'], ['sǐ']],
+    '弄潮': [['nòng'], ['cháo']],
+    '弄瓦': [['nòng'], ['wǎ']],
+    '弄脏': [['nòng'], ['zāng']],
+    '弄臣': [['nòng'], ['chén']],
+    '弄错': [['nòng'], ['cuò']],
+    '弄鬼': [['nòng'], ['guǐ']],
+    '弓背': [['gōng'], ['bèi']],
+    '引信': [['yǐn'], ['xìn']],
+    '引发': [['yǐn'], ['fā']],
+    '引号': [['yǐn'], ['hào']],
+    '引得': [['yǐn'], ['de']],
+    '引种': [['yǐn'], ['zhǒng']],
+    '引芯': [['yǐn'], ['xìn']],
+    '引见': [['yǐn'], ['jiàn']],
+    '引语': [['yǐn'], ['yǔ']],
+    '引颈': [['yǐn'], ['jǐng']],
+    '弘大': [['hóng'], ['dà']],
+    '弟兄': [['dì'], ['xiōng']],
+    '弟妇': [['dì'], ['fù']],
+    '弟妹': [['dì'], ['mèi']],
+    '弟媳': [['dì'], ['xí']],
+    '弟子': [['dì'], ['zǐ']],
+    '弟弟': [['dì'], ['dì']],
+    '张大': [['zhāng'], ['dà']],
+    '张榜': [['zhāng'], ['bǎng']],
+    '弥勒': [['mí'], ['lè']],
+    '弥合': [['mí'], ['hé']],
+    '弥封': [['mí'], ['fēng']],
+    '弥撒': [['mí'], ['sā']],
+    '弥散': [['mí'], ['sàn']],
+    '弥月': [['mí'], ['yuè']],
+    '弥留': [['mí'], ['liú']],
+    '弥缝': [['mí'], ['féng']],
+    '弥蒙': [['mí'], ['méng']],
+    '弥陀': [['mí'], ['tuó']],
+    '弦乐': [['xián'], ['yuè']],
+    '弧度': [['hú'], ['dù']],
+    '弧菌': [['hú'], ['jūn']],
+    '弯头': [['wān'], ['tóu']],
+    '弯度': [['wān'], ['dù']],
+    '弯曲': [['wān'], ['qū']],
+    '弱冠': [['ruò'], ['guàn']],
+    '弹丸': [['dàn'], ['wán']],
+    '弹力': [['tán'], ['lì']],
+    '弹劾': [['tán'], ['hé']],
+    '弹壳': [['dàn'], ['ké']],
+    '弹头': [['dàn'], ['tóu']],
+    '弹子': [['dàn'], ['zǐ']],
+    '弹射': [['tán'], ['shè']],
+    '弹弓': [['dàn'], ['gōng']],
+    '弹性': [['tán'], ['xìng']],
+    '弹琴': [['tán'], ['qín']],
+    '弹簧': [['tán'], ['huáng']],
+    '弹腿': [['dàn'], ['tuǐ']],
+    '弹药': [['dàn'], ['yào']],
+    '弹词': [['tán'], ['cí']],
+    '强人': [['qiǎng'], ['rén']],
+    '强令': [['qiáng'], ['lìng']],
+    '强似': [['qiáng'], ['sì']],
+    '强健': [['qiáng'], ['jiàn']],
+    '强击': [['qiáng'], ['jī']],
+    '强制': [['qiáng'], ['zhì']],
+    '强力': [['qiáng'], ['lì']],
+    '强加': [['qiáng'], ['jiā']],
+    '强劲': [['qiáng'], ['jìng']],
+    '强势': [['qiáng'], ['shì']],
+    '强化': [['qiáng'], ['huà']],
+    '强占': [['qiáng'], ['zhàn']],
+    '强取': [['qiáng'], ['qǔ']],
+    '强嘴': [['jiàng'], ['zuǐ']],
+    '强固': [['qiáng'], ['gù']],
+    '强国': [['qiáng'], ['guó']],
+    '强壮': [['qiáng'], ['zhuàng']],
+    '强大': [['qiáng'], ['dà']],
+    '强夺': [['qiáng'], ['duó']],
+    '强奸': [['qiáng'], ['jiān']],
+    '强将': [['qiáng'], ['jiàng']],
+    '强干': [['qiáng'], ['gàn']],
+    '强度': [['qiáng'], ['dù']],
+    '强弱': [['qiáng'], ['ruò']],
+    '强忍': [['qiáng'], ['rěn']],
+    '强悍': [['qiáng'], ['hàn']],
+    '强手': [['qiáng'], ['shǒu']],
+    '强攻': [['qiáng'], ['gōng']],
+    '强敌': [['qiáng'], ['dí']],
+    '强暴': [['qiáng'], ['bào']],
+    '强权': [['qiáng'], ['quán']],
+    '强梁': [['qiáng'], ['liáng']],
+    '强横': [['qiáng'], ['hèng']],
+    '强求': [['qiǎng'], ['qiú']],
+    '强渡': [['qiáng'], ['dù']],
+    '强烈': [['qiáng'], ['liè']],
+    '强留': [['qiǎng'], ['liú']],
+    '强盗': [['qiáng'], ['dào']],
+    '强盛': [['qiáng'], ['shèng']],
+    '强直': [['qiáng'], ['zhí']],
+    '强硬': [['qiáng'], ['yìng']],
+    '强笑': [['qiǎng'], ['xiào']],
+    '强者': [['qiáng'], ['zhě']],
+    '强行': [['qiáng'], ['xíng']],
+    '强记': [['qiáng'], ['jì']],
+    '强词': [['qiǎng'], ['cí']],
+    '强调': [['qiáng'], ['diào']],
+    '强身': [['qiáng'], ['shēn']],
+    '强辩': [['qiáng'], ['biàn']],
+    '强迫': [['qiǎng'], ['pò']],
+    '强逼': [['qiǎng'], ['bī']],
+    '强邻': [['qiáng'], ['lín']],
+    '强酸': [['qiáng'], ['suān']],
+    '强队': [['qiáng'], ['duì']],
+    '强韧': [['qiáng'], ['rèn']],
+    '强音': [['qiáng'], ['yīn']],
+    '强项': [['qiáng'], ['xiàng']],
+    '强颜': [['qiǎng'], ['yán']],
+    '强风': [['qiáng'], ['fēng']],
+    '彀中': [['gòu'], ['zhōng']],
+    '归化': [['guī'], ['huà']],
+    '归宁': [['guī'], ['níng']],
+    '归宿': [['guī'], ['sù']],
+    '归属': [['guī'], ['shǔ']],
+    '归并': [['guī'], ['bìng']],
+    '归期': [['guī'], ['qī']],
+    '归省': [['guī'], ['xǐng']],
+    '归结': [['guī'], ['jié']],
+    '归还': [['guī'], ['huán']],
+    '归降': [['guī'], ['xiáng']],
+    '归齐': [['guī'], ['qí']],
+    '当下': [['dāng'], ['xià']],
+    '当世': [['dāng'], ['shì']],
+    '当中': [['dāng'], ['zhōng']],
+    '当事': [['dāng'], ['shì']],
+    '当今': [['dāng'], ['jīn']],
+    '当代': [['dāng'], ['dài']],
+    '当令': [['dāng'], ['lìng']],
+    '当众': [['dāng'], ['zhòng']],
+    '当作': [['dàng'], ['zuò']],
+    '当值': [['dāng'], ['zhí']],
+    '当做': [['dàng'], ['zuò']],
+    '当儿': [['dāng'], ['ér']],
+    '当先': [['dāng'], ['xiān']],
+    '当兵': [['dāng'], ['bīng']],
+    '当初': [['dāng'], ['chū']],
+    '当前': [['dāng'], ['qián']],
+    '当午': [['dāng'], ['wǔ']],
+    '当即': [['dāng'], ['jí']],
+    '当口': [['dāng'], ['kǒu']],
+    '当啷': [['dāng'], ['lāng']],
+    '当地': [['dāng'], ['dì']],
+    '当场': [['dāng'], ['chǎng']],
+    '当堂': [['dāng'], ['táng']],
+    '当夜': [['dàng'], ['yè']],
+    '当天': [['dàng'], ['tiān']],
+    '当头': [['dāng'], ['tóu']],
+    '当子': [['dāng'], ['zǐ']],
+    '当官': [['dāng'], ['guān']],
+    '当家': [['dāng'], ['jiā']],
+    '当局': [['dāng'], ['jú']],
+    '当差': [['dāng'], ['chāi']],
+    '当年': [['dāng'], ['nián']],
+    '当庭': [['dāng'], ['tíng']],
+    '当归': [['dāng'], ['guī']],
+    '当当': [['dāng'], ['dāng']],
+    '当心': [['dāng'], ['xīn']],
+    '当成': [['dàng'], ['chéng']],
+    '当政': [['dāng'], ['zhèng']],
+    '当日': [['dāng'], ['rì']],
+    '当时': [['dāng'], ['shí']],
+    '当晚': [['dàng'], ['wǎn']],
+    '当月': [['dàng'], ['yuè']],
+    '当朝': [['dāng'], ['cháo']],
+    '当期': [['dāng'], ['qī']],
+    '当权': [['dāng'], ['quán']],
+    '当涂': [['dāng'], ['tú']],
+    '当然': [['dāng'], ['rán']],
+    '当班': [['dāng'], ['bān']],
+    '当真': [['dàng'], ['zhēn']],
+    '当票': [['dàng'], ['piào']],
+    '当空': [['dāng'], ['kōng']],
+    '当紧': [['dāng'], ['jǐn']],
+    '当胸': [['dāng'], ['xiōng']],
+    '当腰': [['dāng'], ['yāo']],
+    '当街': [['dāng'], ['jiē']],
+    '当路': [['dāng'], ['lù']],
+    '当选': [['dāng'], ['xuǎn']],
+    '当道': [['dāng'], ['dào']],
+    '当量': [['dāng'], ['liàng']],
+    '当铺': [['dàng'], ['pù']],
+    '当阳': [['dāng'], ['yáng']],
+    '当面': [['dāng'], ['miàn']],
+    '形似': [['xíng'], ['sì']],
+    '形体': [['xíng'], ['tǐ']],
+    '形数': [['xíng'], ['shù']],
+    '形旁': [['xíng'], ['páng']],
+    '形相': [['xíng'], ['xiāng']],
+    '彩排': [['cǎi'], ['pái']],
+    '彭泽': [['péng'], ['zé']],
+    '影区': [['yǐng'], ['qū']],
+    '影子': [['yǐng'], ['zi']],
+    '影射': [['yǐng'], ['shè']],
+    '影戏': [['yǐng'], ['xì']],
+    '影片': [['yǐng'], ['piān']],
+    '影调': [['yǐng'], ['diào']],
+    '彷佛': [['páng'], ['fó']],
+    '彷徨': [['páng'], ['huáng']],
+    '役畜': [['yì'], ['xù']],
+    '彻底': [['chè'], ['dǐ']],
+    '彻查': [['chè'], ['chá']],
+    '彻骨': [['chè'], ['gǔ']],
+    '往还': [['wǎng'], ['huán']],
+    '征剿': [['zhēng'], ['jiǎo']],
+    '征发': [['zhēng'], ['fā']],
+    '征召': [['zhēng'], ['zhào']],
+    '征夫': [['zhēng'], ['fū']],
+    '征服': [['zhēng'], ['fú']],
+    '征调': [['zhēng'], ['diào']],
+    '径行': [['jìng'], ['xíng']],
+    '待业': [['dài'], ['yè']],
+    '待人': [['dài'], ['rén']],
+    '待到': [['dài'], ['dào']],
+    '待制': [['dài'], ['zhì']],
+    '待办': [['dài'], ['bàn']],
+    '待命': [['dài'], ['mìng']],
+    '待客': [['dài'], ['kè']],
+    '待承': [['dài'], ['chéng']],
+    '待机': [['dài'], ['jī']],
+    '待查': [['dài'], ['chá']],
+    '待用': [['dài'], ['yòng']],
+    '待续': [['dài'], ['xù']],
+    '待考': [['dài'], ['kǎo']],
+    '待聘': [['dài'], ['pìn']],
+    '待遇': [['dài'], ['yù']],
+    '很毒': [['hěn'], ['dú']],
+    '很累': [['hěn'], ['lèi']],
+    '很脏': [['hěn'], ['zāng']],
+    '律令': [['lǜ'], ['lìng']],
+    '徒弟': [['tú'], ['dì']],
+    '徒长': [['tú'], ['zhǎng']],
+    '得亏': [['děi'], ['kuī']],
+    '得体': [['dé'], ['tǐ']],
+    '得力': [['dé'], ['lì']],
+    '得劲': [['dé'], ['jìn']],
+    '得当': [['dé'], ['dàng']],
+    '得志': [['dé'], ['zhì']],
+    '得意': [['dé'], ['yì']],
+    '得手': [['dé'], ['shǒu']],
+    '得数': [['dé'], ['shù']],
+    '得法': [['dé'], ['fǎ']],
+    '得益': [['dé'], ['yì']],
+    '得知': [['dé'], ['zhī']],
+    '得空': [['dé'], ['kòng']],
+    '得罪': [['dé'], ['zuì']],
+    '得胜': [['dé'], ['shèng']],
+    '得逞': [['dé'], ['chěng']],
+    '得道': [['dé'], ['dào']],
+    '得间': [['dé'], ['jiàn']],
+    '微分': [['wēi'], ['fēn']],
+    '微少': [['wēi'], ['shǎo']],
+    '微晕': [['wēi'], ['yùn']],
+    '微服': [['wēi'], ['fú']],
+    '微薄': [['wēi'], ['bó']],
+    '微行': [['wēi'], ['xíng']],
+    '微观': [['wēi'], ['guān']],
+    '德化': [['dé'], ['huà']],
+    '德行': [['dé'], ['xíng']],
+    '德语': [['dé'], ['yǔ']],
+    '徼幸': [['jiǎo'], ['xìng']],
+    '徽号': [['huī'], ['hào']],
+    '徽调': [['huī'], ['diào']],
+    '心上': [['xīn'], ['shàng']],
+    '心中': [['xīn'], ['zhōng']],
+    '心传': [['xīn'], ['chuán']],
+    '心切': [['xīn'], ['qiè']],
+    '心劲': [['xīn'], ['jìn']],
+    '心地': [['xīn'], ['dì']],
+    '心头': [['xīn'], ['tóu']],
+    '心底': [['xīn'], ['dǐ']],
+    '心得': [['xīn'], ['dé']],
+    '心思': [['xīn'], ['sī']],
+    '心折': [['xīn'], ['zhé']],
+    '心数': [['xīn'], ['shù']],
+    '心曲': [['xīn'], ['qǔ']],
+    '心服': [['xīn'], ['fú']],
+    '心术': [['xīn'], ['shù']],
+    '心毒': [['xīn'], ['dú']],
+    '心率': [['xīn'], ['lǜ']],
+    '心王': [['xīn'], ['wáng']],
+    '心疑': [['xīn'], ['yí']],
+    '心结': [['xīn'], ['jié']],
+    '心血': [['xīn'], ['xuè']],
+    '心许': [['xīn'], ['xǔ']],
+    '心跳': [['xīn'], ['tiào']],
+    '心重': [['xīn'], ['zhòng']],
+    '必将': [['bì'], ['jiāng']],
+    '必得': [['bì'], ['děi']],
+    '必要': [['bì'], ['yào']],
+    '忌食': [['jì'], ['shí']],
+    '忖度': [['cǔn'], ['duó']],
+    '忖量': [['cǔn'], ['liàng']],
+    '志节': [['zhì'], ['jié']],
+    '志趣': [['zhì'], ['qù']],
+    '忙碌': [['máng'], ['lù']],
+    '忠仆': [['zhōng'], ['pú']],
+    '忠信': [['zhōng'], ['xìn']],
+    '忠骨': [['zhōng'], ['gǔ']],
+    '忧思': [['yōu'], ['sī']],
+    '忧闷': [['yōu'], ['mèn']],
+    '快乐': [['kuài'], ['lè']],
+    '快信': [['kuài'], ['xìn']],
+    '快当': [['kuài'], ['dāng']],
+    '快行': [['kuài'], ['xíng']],
+    '快要': [['kuài'], ['yào']],
+    '快语': [['kuài'], ['yǔ']],
+    '快车': [['kuài'], ['chē']],
+    '念佛': [['niàn'], ['fó']],
+    '念叨': [['niàn'], ['dāo']],
+    '念头': [['niàn'], ['tou']],
+    '忽地': [['hū'], ['dì']],
+    '怀化': [['huái'], ['huà']],
+    '怀疑': [['huái'], ['yí']],
+    '怀远': [['huái'], ['yuǎn']],
+    '态度': [['tài'], ['dù']],
+    '怎么': [['zěn'], ['me']],
+    '怎地': [['zěn'], ['dì']],
+    '怎的': [['zěn'], ['de']],
+    '怒号': [['nù'], ['háo']],
+    '怒喝': [['nù'], ['hè']],
+    '怔住': [['zhèng'], ['zhù']],
+    '怔忪': [['zhēng'], ['zhōng']],
+    '思亲': [['sī'], ['qīn']],
+    '思凡': [['sī'], ['fán']],
+    '思古': [['sī'], ['gǔ']],
+    '思忖': [['sī'], ['cǔn']],
+    '思念': [['sī'], ['niàn']],
+    '思恋': [['sī'], ['liàn']],
+    '思情': [['sī'], ['qíng']],
+    '思惟': [['sī'], ['wéi']],
+    '思想': [['sī'], ['xiǎng']],
+    '思慕': [['sī'], ['mù']],
+    '思旧': [['sī'], ['jiù']],
+    '思春': [['sī'], ['chūn']],
+    '思潮': [['sī'], ['cháo']],
+    '思索': [['sī'], ['suǒ']],
+    '思绪': [['sī'], ['xù']],
+    '思维': [['sī'], ['wéi']],
+    '思考': [['sī'], ['kǎo']],
+    '思虑': [['sī'], ['lǜ']],
+    '思议': [['sī'], ['yì']],
+    '思谋': [['sī'], ['móu']],
+    '思路': [['sī'], ['lù']],
+    '思辨': [['sī'], ['biàn']],
+    '思过': [['sī'], ['guò']],
+    '思量': [['sī'], ['liáng']],
+    '怡和': [['yí'], ['hé']],
+    '急切': [['jí'], ['qiè']],
+    '急要': [['jí'], ['yào']],
+    '急转': [['jí'], ['zhuǎn']],
+    '急迫': [['jí'], ['pò']],
+    '急难': [['jí'], ['nàn']],
+    '性别': [['xìng'], ['bié']],
+    '性能': [['xìng'], ['néng']],
+    '性行': [['xìng'], ['xíng']],
+    '怨女': [['yuàn'], ['nǚ']],
+    '怨毒': [['yuàn'], ['dú']],
+    '怪相': [['guài'], ['xiàng']],
+    '怪石': [['guài'], ['shí']],
+    '怪论': [['guài'], ['lùn']],
+    '怯场': [['qiè'], ['chǎng']],
+    '怵头': [['chù'], ['tóu']],
+    '总价': [['zǒng'], ['jià']],
+    '总体': [['zǒng'], ['tǐ']],
+    '总共': [['zǒng'], ['gòng']],
+    '总合': [['zǒng'], ['hé']],
+    '总和': [['zǒng'], ['hé']],
+    '总得': [['zǒng'], ['děi']],
+    '总括': [['zǒng'], ['kuò']],
+    '总数': [['zǒng'], ['shù']],
+    '总校': [['zǒng'], ['xiào']],
+    '总监': [['zǒng'], ['jiān']],
+    '总称': [['zǒng'], ['chēng']],
+    '总结': [['zǒng'], ['jié']],
+    '总行': [['zǒng'], ['xíng']],
+    '总角': [['zǒng'], ['jiǎo']],
+    '总论': [['zǒng'], ['lùn']],
+    '总量': [['zǒng'], ['liàng']],
+    '总长': [['zǒng'], ['zhǎng']],
+    '恁地': [['nèn'], ['dì']],
+    '恋家': [['liàn'], ['jiā']],
+    '恍若': [['huǎng'], ['ruò']],
+    '恐吓': [['kǒng'], ['hè']],
+    '恒量': [['héng'], ['liàng']],
+    '恣睢': [['zì'], ['suī']],
+    '恩仇': [['ēn'], ['chóu']],
+    '恫吓': [['dòng'], ['hè']],
+    '恬和': [['tián'], ['hé']],
+    '息率': [['xī'], ['lǜ']],
+    '恰似': [['qià'], ['sì']],
+    '恰切': [['qià'], ['qiē']],
+    '恰好': [['qià'], ['hǎo']],
+    '恰当': [['qià'], ['dàng']],
+    '恳切': [['kěn'], ['qiè']],
+    '恶习': [['è'], ['xí']],
+    '恶事': [['è'], ['shì']],
+    '恶人': [['è'], ['rén']],
+    '恶仗': [['è'], ['zhàng']],
+    '恶俗': [['è'], ['sú']],
+    '恶兆': [['è'], ['zhào']],
+    '恶劣': [['è'], ['liè']],
+    '恶化': [['è'], ['huà']],
+    '恶变': [['è'], ['biàn']],
+    '恶名': [['è'], ['míng']],
+    '恶声': [['è'], ['shēng']],
+    '恶妇': [['è'], ['fù']],
+    '恶少': [['è'], ['shào']],
+    '恶徒': [['è'], ['tú']],
+    '恶心': [['ě'], ['xīn']],
+    '恶念': [['è'], ['niàn']],
+    '恶性': [['è'], ['xìng']],
+    '恶意': [['è'], ['yì']],
+    '恶感': [['è'], ['gǎn']],
+    '恶战': [['è'], ['zhàn']],
+    '恶报': [['è'], ['bào']],
+    '恶斗': [['è'], ['dòu']],
+    '恶果': [['è'], ['guǒ']],
+    '恶梦': [['è'], ['mèng']],
+    '恶棍': [['è'], ['gùn']],
+    '恶毒': [['è'], ['dú']],
+    '恶气': [['è'], ['qì']],
+    '恶浊': [['è'], ['zhuó']],
+    '恶浪': [['è'], ['làng']],
+    '恶煞': [['è'], ['shà']],
+    '恶狗': [['è'], ['gǒu']],
+    '恶狠': [['è'], ['hěn']],
+    '恶疾': [['è'], ['jí']],
+    '恶癖': [['è'], ['pǐ']],
+    '恶相': [['è'], ['xiàng']],
+    '恶臭': [['è'], ['chòu']],
+    '恶行': [['è'], ['xíng']],
+    '恶补': [['è'], ['bǔ']],
+    '恶言': [['è'], ['yán']],
+    '恶语': [['è'], ['yǔ']],
+    '恶运': [['è'], ['yùn']],
+    '恶迹': [['è'], ['jì']],
+    '恶露': [['è'], ['lù']],
+    '恶霸': [['è'], ['bà']],
+    '恶骂': [['è'], ['mà']],
+    '恶鬼': [['è'], ['guǐ']],
+    '恶魔': [['è'], ['mó']],
+    '悄声': [['qiǎo'], ['shēng']],
+    '悄寂': [['qiǎo'], ['jì']],
+    '悄悄': [['qiāo'], ['qiāo']],
+    '悄然': [['qiǎo'], ['rán']],
+    '悍将': [['hàn'], ['jiàng']],
+    '悔过': [['huǐ'], ['guò']],
+    '悟空': [['wù'], ['kōng']],
+    '患难': [['huàn'], ['nàn']],
+    '悦服': [['yuè'], ['fú']],
+    '悲凉': [['bēi'], ['liáng']],
+    '悲切': [['bēi'], ['qiè']],
+    '悲号': [['bēi'], ['hào']],
+    '悲咽': [['bēi'], ['yān']],
+    '悲思': [['bēi'], ['sī']],
+    '悲观': [['bēi'], ['guān']],
+    '悼亡': [['dào'], ['wáng']],
+    '情节': [['qíng'], ['jié']],
+    '情调': [['qíng'], ['diào']],
+    '情趣': [['qíng'], ['qù']],
+    '惊倒': [['jīng'], ['dǎo']],
+    '惊觉': [['jīng'], ['jué']],
+    '惊跳': [['jīng'], ['tiào']],
+    '惊风': [['jīng'], ['fēng']],
+    '惩处': [['chéng'], ['chǔ']],
+    '惩艾': [['chéng'], ['yì']],
+    '惭怍': [['cán'], ['zuò']],
+    '想头': [['xiǎng'], ['tou']],
+    '想着': [['xiǎng'], ['zhe']],
+    '想要': [['xiǎng'], ['yào']],
+    '想见': [['xiǎng'], ['jiàn']],
+    '惺忪': [['xīng'], ['sōng']],
+    '愁思': [['chóu'], ['sī']],
+    '愁闷': [['chóu'], ['mèn']],
+    '愆期': [['qiān'], ['qī']],
+    '愈发': [['yù'], ['fā']],
+    '愈合': [['yù'], ['hé']],
+    '意中': [['yì'], ['zhōng']],
+    '意会': [['yì'], ['huì']],
+    '意兴': [['yì'], ['xìng']],
+    '意思': [['yì'], ['sī']],
+    '意淫': [['yì'], ['yín']],
+    '意见': [['yì'], ['jiàn']],
+    '意识': [['yì'], ['shí']],
+    '意趣': [['yì'], ['qù']],
+    '愚弄': [['yú'], ['nòng']],
+    '愚氓': [['yú'], ['méng']],
+    '愚蒙': [['yú'], ['méng']],
+    '愚见': [['yú'], ['jiàn']],
+    '感冒': [['gǎn'], ['mào']],
+    '感化': [['gǎn'], ['huà']],
+    '感发': [['gǎn'], ['fā']],
+    '感召': [['gǎn'], ['zhào']],
+    '感应': [['gǎn'], ['yìng']],
+    '感知': [['gǎn'], ['zhī']],
+    '感荷': [['gǎn'], ['hè']],
+    '感觉': [['gǎn'], ['jué']],
+    '愧怍': [['kuì'], ['zuò']],
+    '愧汗': [['kuì'], ['hàn']],
+    '慈和': [['cí'], ['hé']],
+    '慈父': [['cí'], ['fù']],
+    '慎思': [['shèn'], ['sī']],
+    '慎行': [['shèn'], ['xíng']],
+    '慎重': [['shèn'], ['zhòng']],
+    '慑服': [['shè'], ['fú']],
+    '慢化': [['màn'], ['huà']],
+    '慢待': [['màn'], ['dài']],
+    '慢说': [['màn'], ['shuō']],
+    '慢车': [['màn'], ['chē']],
+    '慰藉': [['wèi'], ['jiè']],
+    '憋闷': [['biē'], ['mèn']],
+    '憎恶': [['zēng'], ['wù']],
+    '憷头': [['chù'], ['tóu']],
+    '懂得': [['dǒng'], ['de']],
+    '懂行': [['dǒng'], ['háng']],
+    '懊丧': [['ào'], ['sàng']],
+    '懒得': [['lǎn'], ['de']],
+    '懒散': [['lǎn'], ['sǎn']],
+    '懦夫': [['nuò'], ['fū']],
+    '戍卒': [['shù'], ['zú']],
+    '戎行': [['róng'], ['háng']],
+    '戏侮': [['xì'], ['wǔ']],
+    '戏剧': [['xì'], ['jù']],
+    '戏单': [['xì'], ['dān']],
+    '戏台': [['xì'], ['tái']],
+    '戏场': [['xì'], ['chǎng']],
+    '戏子': [['xì'], ['zǐ']],
+    '戏弄': [['xì'], ['nòng']],
+    '戏文': [['xì'], ['wén']],
+    '戏曲': [['xì'], ['qǔ']],
+    '戏本': [['xì'], ['běn']],
+    '戏楼': [['xì'], ['lóu']],
+    '戏水': [['xì'], ['shuǐ']],
+    '戏法': [['xì'], ['fǎ']],
+    '戏照': [['xì'], ['zhào']],
+    '戏班': [['xì'], ['bān']],
+    '戏目': [['xì'], ['mù']],
+    '戏码': [['xì'], ['mǎ']],
+    '戏箱': [['xì'], ['xiāng']],
+    '戏耍': [['xì'], ['shuǎ']],
+    '戏衣': [['xì'], ['yī']],
+    '戏装': [['xì'], ['zhuāng']],
+    '戏言': [['xì'], ['yán']],
+    '戏评': [['xì'], ['píng']],
+    '戏词': [['xì'], ['cí']],
+    '戏说': [['xì'], ['shuō']],
+    '戏谑': [['xì'], ['xuè']],
+    '戏路': [['xì'], ['lù']],
+    '戏迷': [['xì'], ['mí']],
+    '戏院': [['xì'], ['yuàn']],
+    '成丁': [['chéng'], ['dīng']],
+    '成为': [['chéng'], ['wéi']],
+    '成亲': [['chéng'], ['qīn']],
+    '成仇': [['chéng'], ['chóu']],
+    '成份': [['chéng'], ['fèn']],
+    '成体': [['chéng'], ['tǐ']],
+    '成分': [['chéng'], ['fèn']],
+    '成化': [['chéng'], ['huà']],
+    '成员': [['chéng'], ['yuán']],
+    '成家': [['chéng'], ['jiā']],
+    '成宿': [['chéng'], ['xiǔ']],
+    '成数': [['chéng'], ['shù']],
+    '成服': [['chéng'], ['fú']],
+    '成约': [['chéng'], ['yuē']],
+    '成行': [['chéng'], ['háng']],
+    '成见': [['chéng'], ['jiàn']],
+    '成语': [['chéng'], ['yǔ']],
+    '成说': [['chéng'], ['shuō']],
+    '成趣': [['chéng'], ['qù']],
+    '成都': [['chéng'], ['dū']],
+    '成长': [['chéng'], ['zhǎng']],
+    '我们': [['wǒ'], ['men']],
+    '我家': [['wǒ'], ['jiā']],
+    '我见': [['wǒ'], ['jiàn']],
+    '戒尺': [['jiè'], ['chǐ']],
+    '或体': [['huò'], ['tǐ']],
+    '或许': [['huò'], ['xǔ']],
+    '戗住': [['qiàng'], ['zhù']],
+    '戗脊': [['qiàng'], ['jǐ']],
+    '戗金': [['qiàng'], ['jīn']],
+    '戗面': [['qiàng'], ['miàn']],
+    '戗风': [['qiāng'], ['fēng']],
+    '战区': [['zhàn'], ['qū']],
+    '战地': [['zhàn'], ['dì']],
+    '战场': [['zhàn'], ['chǎng']],
+    '战将': [['zhàn'], ['jiàng']],
+    '战斗': [['zhàn'], ['dòu']],
+    '战术': [['zhàn'], ['shù']],
+    '战栗': [['zhàn'], ['lì']],
+    '战车': [['zhàn'], ['chē']],
+    '戚属': [['qī'], ['shǔ']],
+    '户头': [['hù'], ['tóu']],
+    '户调': [['hù'], ['diào']],
+    '户长': [['hù'], ['zhǎng']],
+    '戽斗': [['hù'], ['dǒu']],
+    '房地': [['fáng'], ['dì']],
+    '房契': [['fáng'], ['qì']],
+    '房子': [['fáng'], ['zi']],
+    '房舍': [['fáng'], ['shè']],
+    '房间': [['fáng'], ['jiān']],
+    '所属': [['suǒ'], ['shǔ']],
+    '所得': [['suǒ'], ['de']],
+    '所思': [['suǒ'], ['sī']],
+    '所有': [['suǒ'], ['yǒu']],
+    '所知': [['suǒ'], ['zhī']],
+    '所说': [['suǒ'], ['shuō']],
+    '所长': [['suǒ'], ['zhǎng']],
+    '扁圆': [['biǎn'], ['yuán']],
+    '扁扁': [['biǎn'], ['biǎn']],
+    '扁担': [['biǎn'], ['dàn']],
+    '扁柏': [['biǎn'], ['bǎi']],
+    '扁桃': [['biǎn'], ['táo']],
+    '扁舟': [['piān'], ['zhōu']],
+    '扁豆': [['biǎn'], ['dòu']],
+    '扁锉': [['biǎn'], ['cuò']],
+    '扁食': [['biǎn'], ['shí']],
+    '扁骨': [['biǎn'], ['gǔ']],
+    '扁鹊': [['biǎn'], ['què']],
+    '扇动': [['shān'], ['dòng']],
+    '扇坠': [['shàn'], ['zhuì']],
+    '扇子': [['shàn'], ['zi']],
+    '扇形': [['shàn'], ['xíng']],
+    '扇惑': [['shān'], ['huò']],
+    '扇贝': [['shàn'], ['bèi']],
+    '扇车': [['shàn'], ['chē']],
+    '扇面': [['shàn'], ['miàn']],
+    '扇风': [['shān'], ['fēng']],
+    '扇骨': [['shàn'], ['gǔ']],
+    '手上': [['shǒu'], ['shàng']],
+    '手令': [['shǒu'], ['lìng']],
+    '手创': [['shǒu'], ['chuàng']],
+    '手卷': [['shǒu'], ['juàn']],
+    '手头': [['shǒu'], ['tóu']],
+    '手夹': [['shǒu'], ['jiā']],
+    '手术': [['shǒu'], ['shù']],
+    '手模': [['shǒu'], ['mó']],
+    '手爪': [['shǒu'], ['zhǎo']],
+    '手相': [['shǒu'], ['xiàng']],
+    '手纹': [['shǒu'], ['wén']],
+    '手背': [['shǒu'], ['bèi']],
+    '手臂': [['shǒu'], ['bì']],
+    '手语': [['shǒu'], ['yǔ']],
+    '手车': [['shǒu'], ['chē']],
+    '才分': [['cái'], ['fèn']],
+    '才华': [['cái'], ['huá']],
+    '才女': [['cái'], ['nǚ']],
+    '才干': [['cái'], ['gàn']],
+    '才思': [['cái'], ['sī']],
+    '才能': [['cái'], ['néng']],
+    '才识': [['cái'], ['shí']],
+    '扎堆': [['zhā'], ['duī']],
+    '扎实': [['zhā'], ['shí']],
+    '扎手': [['zhā'], ['shǒu']],
+    '扎扎': [['zhā'], ['zhā']],
+    '扎挣': [['zhá'], ['zhēng']],
+    '扎染': [['zā'], ['rǎn']],
+    '扎根': [['zhā'], ['gēn']],
+    '扎眼': [['zhā'], ['yǎn']],
+    '扎破': [['zhá'], ['pò']],
+    '扎花': [['zhā'], ['huā']],
+    '扎营': [['zhā'], ['yíng']],
+    '扎针': [['zhā'], ['zhēn']],
+    '扑地': [['pū'], ['dì']],
+    '扑扇': [['pū'], ['shān']],
+    '扑打': [['pū'], ['dǎ']],
+    '扑棱': [['pū'], ['lēng']],
+    '扑空': [['pū'], ['kōng']],
+    '扒开': [['bā'], ['kāi']],
+    '扒手': [['pá'], ['shǒu']],
+    '扒拉': [['bā'], ['lā']],
+    '扒灰': [['pá'], ['huī']],
+    '扒皮': [['bā'], ['pí']],
+    '扒窃': [['pá'], ['qiè']],
+    '扒粪': [['pá'], ['fèn']],
+    '扒糕': [['pá'], ['gāo']],
+    '扒草': [['pá'], ['cǎo']],
+    '扒车': [['bā'], ['chē']],
+    '打下': [['dǎ'], ['xià']],
+    '打中': [['dǎ'], ['zhòng']],
+    '打乱': [['dǎ'], ['luàn']],
+    '打从': [['dǎ'], ['cóng']],
+    '打仗': [['dǎ'], ['zhàng']],
+    '打伤': [['dǎ'], ['shāng']],
+    '打住': [['dǎ'], ['zhù']],
+    '打倒': [['dǎ'], ['dǎo']],
+    '打击': [['dǎ'], ['jī']],
+    '打分': [['dǎ'], ['fēn']],
+    '打动': [['dǎ'], ['dòng']],
+    '打劫': [['dǎ'], ['jié']],
+    '打包': [['dǎ'], ['bāo']],
+    '打卦': [['dǎ'], ['guà']],
+    '打印': [['dǎ'], ['yìn']],
+    '打发': [['dǎ'], ['fā']],
+    '打听': [['dǎ'], ['tīng']],
+    '打呃': [['dǎ'], ['e']],
+    '打呼': [['dǎ'], ['hū']],
+    '打响': [['dǎ'], ['xiǎng']],
+    '打嗝': [['dǎ'], ['gé']],
+    '打嘴': [['dǎ'], ['zuǐ']],
+    '打场': [['dǎ'], ['cháng']],
+    '打坐': [['dǎ'], ['zuò']],
+    '打垮': [['dǎ'], ['kuǎ']],
+    '打夯': [['dǎ'], ['hāng']],
+    '打头': [['dǎ'], ['tóu']],
+    '打孔': [['dǎ'], ['kǒng']],
+    '打字': [['dǎ'], ['zì']],
+    '打尖': [['dǎ'], ['jiān']],
+    '打岔': [['dǎ'], ['chà']],
+    '打工': [['dǎ'], ['gōng']],
+    '打平': [['dǎ'], ['píng']],
+    '打底': [['dǎ'], ['dǐ']],
+    '打开': [['dǎ'], ['kāi']],
+    '打弯': [['dǎ'], ['wān']],
+    '打总': [['dǎ'], ['zǒng']],
+    '打战': [['dǎ'], ['zhàn']],
+    '打手': [['dǎ'], ['shǒu']],
+    '打扫': [['dǎ'], ['sǎo']],
+    '打扮': [['dǎ'], ['bàn']],
+    '打扰': [['dǎ'], ['rǎo']],
+    '打拱': [['dǎ'], ['gǒng']],
+    '打拳': [['dǎ'], ['quán']],
+    '打拼': [['dǎ'], ['pīn']],
+    '打捞': [['dǎ'], ['lāo']],
+    '打掉': [['dǎ'], ['diào']],
+    '打探': [['dǎ'], ['tàn']],
+    '打援': [['dǎ'], ['yuán']],
+    '打搅': [['dǎ'], ['jiǎo']],
+    '打擂': [['dǎ'], ['lèi']],
+    '打散': [['dǎ'], ['sàn']],
+    '打斗': [['dǎ'], ['dòu']],
+    '打斜': [['dǎ'], ['xié']],
+    '打断': [['dǎ'], ['duàn']],
+    '打旋': [['dǎ'], ['xuán']],
+    '打春': [['dǎ'], ['chūn']],
+    '打更': [['dǎ'], ['gēng']],
+    '打杀': [['dǎ'], ['shā']],
+    '打杂': [['dǎ'], ['zá']],
+    '打杈': [['dǎ'], ['chà']],
+    '打枪': [['dǎ'], ['qiāng']],
+    '打架': [['dǎ'], ['jià']],
+    '打样': [['dǎ'], ['yàng']],
+    '打桩': [['dǎ'], ['zhuāng']],
+    '打横': [['dǎ'], ['héng']],
+    '打比': [['dǎ'], ['bǐ']],
+    '打气': [['dǎ'], ['qì']],
+    '打水': [['dǎ'], ['shuǐ']],
+    '打油': [['dǎ'], ['yóu']],
+    '打法': [['dǎ'], ['fǎ']],
+    '打泡': [['dǎ'], ['pào']],
+    '打洞': [['dǎ'], ['dòng']],
+    '打浆': [['dǎ'], ['jiāng']],
+    '打消': [['dǎ'], ['xiāo']],
+    '打滑': [['dǎ'], ['huá']],
+    '打滚': [['dǎ'], ['gǔn']],
+    '打火': [['dǎ'], ['huǒ']],
+    '打炮': [['dǎ'], ['pào']],
+    '打点': [['dǎ'], ['diǎn']],
+    '打烊': [['dǎ'], ['yàng']],
+    '打牌': [['dǎ'], ['pái']],
+    '打猎': [['dǎ'], ['liè']],
+    '打球': [['dǎ'], ['qiú']],
+    '打理': [['dǎ'], ['lǐ']],
+    '打的': [['dǎ'], ['dī']],
+    '打皱': [['dǎ'], ['zhòu']],
+    '打盹': [['dǎ'], ['dǔn']],
+    '打眼': [['dǎ'], ['yǎn']],
+    '打破': [['dǎ'], ['pò']],
+    '打磨': [['dǎ'], ['mó']],
+    '打算': [['dǎ'], ['suàn']],
+    '打紧': [['dǎ'], ['jǐn']],
+    '打结': [['dǎ'], ['jié']],
+    '打翻': [['dǎ'], ['fān']],
+    '打胎': [['dǎ'], ['tāi']],
+    '打草': [['dǎ'], ['cǎo']],
+    '打药': [['dǎ'], ['yào']],
+    '打落': [['dǎ'], ['luò']],
+    '打诨': [['dǎ'], ['hùn']],
+    '打谱': [['dǎ'], ['pǔ']],
+    '打谷': [['dǎ'], ['gǔ']],
+    '打败': [['dǎ'], ['bài']],
+    '打赌': [['dǎ'], ['dǔ']],
+    '打趣': [['dǎ'], ['qù']],
+    '打转': [['dǎ'], ['zhuǎn']],
+    '打退': [['dǎ'], ['tuì']],
+    '打通': [['dǎ'], ['tōng']],
+    '打造': [['dǎ'], ['zào']],
+    '打醮': [['dǎ'], ['jiào']],
+    '打量': [['dǎ'], ['liàng']],
+    '打针': [['dǎ'], ['zhēn']],
+    '打钩': [['dǎ'], ['gōu']],
+    '打铁': [['dǎ'], ['tiě']],
+    '打门': [['dǎ'], ['mén']],
+    '打闪': [['dǎ'], ['shǎn']],
+    '打问': [['dǎ'], ['wèn']],
+    '打闹': [['dǎ'], ['nào']],
+    '打雷': [['dǎ'], ['léi']],
+    '打靶': [['dǎ'], ['bǎ']],
+    '打顶': [['dǎ'], ['dǐng']],
+    '打颤': [['dǎ'], ['zhàn']],
+    '打食': [['dǎ'], ['shí']],
+    '打骂': [['dǎ'], ['mà']],
+    '打鬼': [['dǎ'], ['guǐ']],
+    '打鱼': [['dǎ'], ['yú']],
+    '打鼓': [['dǎ'], ['gǔ']],
+    '打鼾': [['dǎ'], ['hān']],
+    '托底': [['tuō'], ['dǐ']],
+    '扛活': [['káng'], ['huó']],
+    '扛鼎': [['gāng'], ['dǐng']],
+    '扣分': [['kòu'], ['fēn']],
+    '扣压': [['kòu'], ['yā']],
+    '扣发': [['kòu'], ['fā']],
+    '扣头': [['kòu'], ['tóu']],
+    '扣子': [['kòu'], ['zi']],
+    '执拗': [['zhí'], ['niù']],
+    '执教': [['zhí'], ['jiào']],
+    '执泥': [['zhí'], ['ní']],
+    '执着': [['zhí'], ['zhuó']],
+    '执著': [['zhí'], ['zhuó']],
+    '执行': [['zhí'], ['xíng']],
+    '扩大': [['kuò'], ['dà']],
+    '扩散': [['kuò'], ['sàn']],
+    '扫兴': [['sǎo'], ['xìng']],
+    '扫地': [['sǎo'], ['dì']],
+    '扫坟': [['sǎo'], ['fén']],
+    '扫墓': [['sǎo'], ['mù']],
+    '扫射': [['sǎo'], ['shè']],
+    '扫尾': [['sǎo'], ['wěi']],
+    '扫帚': [['sào'], ['zhǒu']],
+    '扫平': [['sǎo'], ['píng']],
+    '扫把': [['sào'], ['bǎ']],
+    '扫描': [['sǎo'], ['miáo']],
+    '扫数': [['sǎo'], ['shù']],
+    '扫清': [['sǎo'], ['qīng']],
+    '扫灭': [['sǎo'], ['miè']],
+    '扫盲': [['sǎo'], ['máng']],
+    '扫荡': [['sǎo'], ['dàng']],
+    '扫视': [['sǎo'], ['shì']],
+    '扫除': [['sǎo'], ['chú']],
+    '扫雪': [['sǎo'], ['xuě']],
+    '扫雷': [['sǎo'], ['léi']],
+    '扫黄': [['sǎo'], ['huáng']],
+    '扬场': [['yáng'], ['cháng']],
+    '扬长': [['yáng'], ['cháng']],
+    '扭头': [['niǔ'], ['tóu']],
+    '扭打': [['niǔ'], ['dǎ']],
+    '扭曲': [['niǔ'], ['qū']],
+    '扭结': [['niǔ'], ['jié']],
+    '扭转': [['niǔ'], ['zhuǎn']],
+    '扮戏': [['bàn'], ['xì']],
+    '扮相': [['bàn'], ['xiàng']],
+    '扳倒': [['bān'], ['dǎo']],
+    '扶助': [['fú'], ['zhù']],
+    '扶掖': [['fú'], ['yè']],
+    '扶正': [['fú'], ['zhèng']],
+    '扶风': [['fú'], ['fēng']],
+    '批假': [['pī'], ['jià']],
+    '批发': [['pī'], ['fā']],
+    '批号': [['pī'], ['hào']],
+    '批斗': [['pī'], ['dòu']],
+    '批条': [['pī'], ['tiáo']],
+    '批语': [['pī'], ['yǔ']],
+    '批转': [['pī'], ['zhuǎn']],
+    '批量': [['pī'], ['liàng']],
+    '扼要': [['è'], ['yào']],
+    '找头': [['zhǎo'], ['tou']],
+    '找着': [['zhǎo'], ['zháo']],
+    '找碴': [['zhǎo'], ['chá']],
+    '找齐': [['zhǎo'], ['qí']],
+    '承兑': [['chéng'], ['duì']],
+    '承应': [['chéng'], ['yìng']],
+    '承当': [['chéng'], ['dāng']],
+    '承担': [['chéng'], ['dān']],
+    '承浆': [['chéng'], ['jiāng']],
+    '承溜': [['chéng'], ['liù']],
+    '承蒙': [['chéng'], ['méng']],
+    '承转': [['chéng'], ['zhuǎn']],
+    '承载': [['chéng'], ['zài']],
+    '承重': [['chéng'], ['zhòng']],
+    '技术': [['jì'], ['shù']],
+    '技能': [['jì'], ['néng']],
+    '抄家': [['chāo'], ['jiā']],
+    '抄查': [['chāo'], ['chá']],
+    '抄没': [['chāo'], ['méi']],
+    '抉择': [['jué'], ['zé']],
+    '把住': [['bǎ'], ['zhù']],
+    '把关': [['bǎ'], ['guān']],
+    '把势': [['bǎ'], ['shì']],
+    '把头': [['bǎ'], ['tóu']],
+    '把子': [['bà'], ['zi']],
+    '把守': [['bǎ'], ['shǒu']],
+    '把家': [['bǎ'], ['jiā']],
+    '把式': [['bǎ'], ['shì']],
+    '把戏': [['bǎ'], ['xì']],
+    '把手': [['bǎ'], ['shǒu']],
+    '把持': [['bǎ'], ['chí']],
+    '把握': [['bǎ'], ['wò']],
+    '把揽': [['bǎ'], ['lǎn']],
+    '把晤': [['bǎ'], ['wù']],
+    '把柄': [['bǎ'], ['bǐng']],
+    '把牢': [['bǎ'], ['láo']],
+    '把玩': [['bǎ'], ['wán']],
+    '把盏': [['bǎ'], ['zhǎn']],
+    '把稳': [['bǎ'], ['wěn']],
+    '把脉': [['bǎ'], ['mài']],
+    '把舵': [['bǎ'], ['duò']],
+    '把酒': [['bǎ'], ['jiǔ']],
+    '把门': [['bǎ'], ['mén']],
+    '把风': [['bǎ'], ['fēng']],
+    '抒发': [['shū'], ['fā']],
+    '抓差': [['zhuā'], ['chāi']],
+    '抓斗': [['zhuā'], ['dòu']],
+    '投亲': [['tóu'], ['qīn']],
+    '投合': [['tóu'], ['hé']],
+    '投契': [['tóu'], ['qì']],
+    '投奔': [['tóu'], ['bèn']],
+    '投宿': [['tóu'], ['sù']],
+    '投射': [['tóu'], ['shè']],
+    '投弹': [['tóu'], ['dàn']],
+    '投石': [['tóu'], ['shí']],
+    '投票': [['tóu'], ['piào']],
+    '投降': [['tóu'], ['xiáng']],
+    '抖搂': [['dǒu'], ['lōu']],
+    '抖擞': [['dǒu'], ['sǒu']],
+    '抖落': [['dǒu'], ['luò']],
+    '抖颤': [['dǒu'], ['chàn']],
+    '抗体': [['kàng'], ['tǐ']],
+    '抗暴': [['kàng'], ['bào']],
+    '折中': [['zhé'], ['zhōng']],
+    '折价': [['zhé'], ['jià']],
+    '折光': [['zhé'], ['guāng']],
+    '折兑': [['zhé'], ['duì']],
+    '折冲': [['zhé'], ['chōng']],
+    '折刀': [['zhé'], ['dāo']],
+    '折半': [['zhé'], ['bàn']],
+    '折变': [['zhé'], ['biàn']],
+    '折叠': [['zhé'], ['dié']],
+    '折合': [['zhé'], ['hé']],
+    '折回': [['zhé'], ['huí']],
+    '折堕': [['shé'], ['duò']],
+    '折头': [['zhé'], ['tou']],
+    '折子': [['zhé'], ['zǐ']],
+    '折寿': [['zhé'], ['shòu']],
+    '折射': [['zhé'], ['shè']],
+    '折尺': [['zhé'], ['chǐ']],
+    '折弯': [['zhé'], ['wān']],
+    '折扇': [['zhé'], ['shàn']],
+    '折扣': [['zhé'], ['kòu']],
+    '折损': [['shé'], ['sǔn']],
+    '折断': [['zhé'], ['duàn']],
+    '折旧': [['zhé'], ['jiù']],
+    '折服': [['zhé'], ['fú']],
+    '折本': [['shé'], ['běn']],
+    '折杀': [['zhé'], ['shā']],
+    '折枝': [['zhé'], ['zhī']],
+    '折桂': [['zhé'], ['guì']],
+    '折椅': [['zhé'], ['yǐ']],
+    '折痕': [['zhé'], ['hén']],
+    '折皱': [['zhé'], ['zhòu']],
+    '折磨': [['zhé'], ['mó']],
+    '折福': [['zhé'], ['fú']],
+    '折秤': [['shé'], ['chèng']],
+    '折算': [['zhé'], ['suàn']],
+    '折纸': [['zhé'], ['zhǐ']],
+    '折线': [['zhé'], ['xiàn']],
+    '折耗': [['shé'], ['hào']],
+    '折腰': [['zhé'], ['yāo']],
+    '折腾': [['zhē'], ['téng']],
+    '折衷': [['shé'], ['zhōng']],
+    '折账': [['zhé'], ['zhàng']],
+    '折转': [['zhé'], ['zhuǎn']],
+    '折辱': [['shé'], ['rǔ']],
+    '折返': [['zhé'], ['fǎn']],
+    '折页': [['zhé'], ['yè']],
+    '抚宁': [['fǔ'], ['níng']],
+    '抚弄': [['fǔ'], ['nòng']],
+    '抚摩': [['fǔ'], ['mó']],
+    '抛射': [['pāo'], ['shè']],
+    '抛撒': [['pāo'], ['sā']],
+    '抛洒': [['pāo'], ['sǎ']],
+    '抛空': [['pāo'], ['kōng']],
+    '抛舍': [['pāo'], ['shě']],
+    '抢亲': [['qiǎng'], ['qīn']],
+    '抢修': [['qiǎng'], ['xiū']],
+    '抢先': [['qiǎng'], ['xiān']],
+    '抢劫': [['qiǎng'], ['jié']],
+    '抢占': [['qiǎng'], ['zhàn']],
+    '抢嘴': [['qiǎng'], ['zuǐ']],
+    '抢墒': [['qiǎng'], ['shāng']],
+    '抢夺': [['qiǎng'], ['duó']],
+    '抢工': [['qiǎng'], ['gōng']],
+    '抢市': [['qiǎng'], ['shì']],
+    '抢建': [['qiǎng'], ['jiàn']],
+    '抢手': [['qiǎng'], ['shǒu']],
+    '抢拍': [['qiǎng'], ['pāi']],
+    '抢掠': [['qiǎng'], ['lüè']],
+    '抢收': [['qiǎng'], ['shōu']],
+    '抢攻': [['qiǎng'], ['gōng']],
+    '抢救': [['qiǎng'], ['jiù']],
+    '抢渡': [['qiǎng'], ['dù']],
+    '抢滩': [['qiǎng'], ['tān']],
+    '抢白': [['qiǎng'], ['bái']],
+    '抢眼': [['qiǎng'], ['yǎn']],
+    '抢种': [['qiǎng'], ['zhòng']],
+    '抢话': [['qiǎng'], ['huà']],
+    '抢购': [['qiǎng'], ['gòu']],
+    '抢运': [['qiǎng'], ['yùn']],
+    '抢险': [['qiǎng'], ['xiǎn']],
+    '抢风': [['qiāng'], ['fēng']],
+    '护从': [['hù'], ['cóng']],
+    '护校': [['hù'], ['xiào']],
+    '报丧': [['bào'], ['sāng']],
+    '报仇': [['bào'], ['chóu']],
+    '报价': [['bào'], ['jià']],
+    '报信': [['bào'], ['xìn']],
+    '报单': [['bào'], ['dān']],
+    '报头': [['bào'], ['tóu']],
+    '报应': [['bào'], ['yìng']],
+    '报数': [['bào'], ['shù']],
+    '报知': [['bào'], ['zhī']],
+    '报答': [['bào'], ['dá']],
+    '报载': [['bào'], ['zǎi']],
+    '抨弹': [['pēng'], ['tán']],
+    '披卷': [['pī'], ['juàn']],
+    '披发': [['pī'], ['fà']],
+    '披头': [['pī'], ['tóu']],
+    '披拂': [['pī'], ['fú']],
+    '披散': [['pī'], ['sǎn']],
+    '披红': [['pī'], ['hóng']],
+    '披露': [['pī'], ['lù']],
+    '披靡': [['pī'], ['mǐ']],
+    '抬价': [['tái'], ['jià']],
+    '抬头': [['tái'], ['tóu']],
+    '抬杠': [['tái'], ['gàng']],
+    '抵挡': [['dǐ'], ['dǎng']],
+    '抵还': [['dǐ'], ['hái']],
+    '抹子': [['mǒ'], ['zǐ']],
+    '抹布': [['mā'], ['bù']],
+    '抹杀': [['mǒ'], ['shā']],
+    '抹灰': [['mò'], ['huī']],
+    '抹煞': [['mǒ'], ['shà']],
+    '抹粉': [['mǒ'], ['fěn']],
+    '抹胸': [['mò'], ['xiōng']],
+    '抹脸': [['mā'], ['liǎn']],
+    '抹黑': [['mǒ'], ['hēi']],
+    '押头': [['yā'], ['tou']],
+    '押尾': [['yā'], ['wěi']],
+    '押当': [['yā'], ['dàng']],
+    '押禁': [['yā'], ['jìn']],
+    '押解': [['yā'], ['jiè']],
+    '押车': [['yā'], ['chē']],
+    '抽丁': [['chōu'], ['dīng']],
+    '抽咽': [['chōu'], ['yè']],
+    '抽头': [['chōu'], ['tóu']],
+    '抽打': [['chōu'], ['dǎ']],
+    '抽斗': [['chōu'], ['dǒu']],
+    '抽查': [['chōu'], ['chá']],
+    '抽空': [['chōu'], ['kōng']],
+    '抽缩': [['chōu'], ['suō']],
+    '抽苔': [['chōu'], ['tái']],
+    '抽调': [['chōu'], ['diào']],
+    '拂尘': [['fú'], ['chén']],
+    '拂拂': [['fú'], ['fú']],
+    '拂拭': [['fú'], ['shì']],
+    '拂晓': [['fú'], ['xiǎo']],
+    '拂袖': [['fú'], ['xiù']],
+    '拂逆': [['fú'], ['nì']],
+    '担任': [['dān'], ['rèn']],
+    '担保': [['dān'], ['bǎo']],
+    '担子': [['dàn'], ['zi']],
+    '担当': [['dān'], ['dāng']],
+    '担待': [['dān'], ['dài']],
+    '担心': [['dān'], ['xīn']],
+    '担忧': [['dān'], ['yōu']],
+    '担承': [['dān'], ['chéng']],
+    '担搁': [['dān'], ['gē']],
+    '担架': [['dān'], ['jià']],
+    '担负': [['dān'], ['fù']],
+    '拆伙': [['chāi'], ['huǒ']],
+    '拆借': [['chāi'], ['jiè']],
+    '拆卖': [['chāi'], ['mài']],
+    '拆卸': [['chāi'], ['xiè']],
+    '拆台': [['chāi'], ['tái']],
+    '拆字': [['chāi'], ['zì']],
+    '拆建': [['chāi'], ['jiàn']],
+    '拆开': [['chāi'], ['kāi']],
+    '拆息': [['chāi'], ['xī']],
+    '拆散': [['chāi'], ['sàn']],
+    '拆毁': [['chāi'], ['huǐ']],
+    '拆洗': [['chāi'], ['xǐ']],
+    '拆穿': [['chāi'], ['chuān']],
+    '拆线': [['chāi'], ['xiàn']],
+    '拆迁': [['chāi'], ['qiān']],
+    '拆除': [['chāi'], ['chú']],
+    '拈度': [['niān'], ['dù']],
+    '拉丁': [['lā'], ['dīng']],
+    '拉丝': [['lā'], ['sī']],
+    '拉人': [['lā'], ['rén']],
+    '拉伸': [['lā'], ['shēn']],
+    '拉倒': [['lā'], ['dǎo']],
+    '拉力': [['lā'], ['lì']],
+    '拉套': [['lā'], ['tào']],
+    '拉客': [['lā'], ['kè']],
+    '拉巴': [['lā'], ['bā']],
+    '拉平': [['lā'], ['píng']],
+    '拉开': [['lā'], ['kāi']],
+    '拉德': [['lā'], ['dé']],
+    '拉手': [['lā'], ['shǒu']],
+    '拉扯': [['lā'], ['chě']],
+    '拉拉': [['lā'], ['lā']],
+    '拉拔': [['lā'], ['bá']],
+    '拉拢': [['lā'], ['lǒng']],
+    '拉杂': [['lā'], ['zá']],
+    '拉杆': [['lā'], ['gǎn']],
+    '拉架': [['lā'], ['jià']],
+    '拉稀': [['lā'], ['xī']],
+    '拉纤': [['lā'], ['qiàn']],
+    '拉线': [['lā'], ['xiàn']],
+    '拉练': [['lā'], ['liàn']],
+    '拉网': [['lā'], ['wǎng']],
+    '拉脚': [['lā'], ['jiǎo']],
+    '拉萨': [['lā'], ['sà']],
+    '拉账': [['lā'], ['zhàng']],
+    '拉链': [['lā'], ['liàn']],
+    '拉锯': [['lā'], ['jù']],
+    '拉长': [['lā'], ['cháng']],
+    '拉面': [['lā'], ['miàn']],
+    '拌匀': [['bàn'], ['yún']],
+    '拌和': [['bàn'], ['huò']],
+    '拌嘴': [['bàn'], ['zuǐ']],
+    '拌种': [['bàn'], ['zhǒng']],
+    '拌蒜': [['bàn'], ['suàn']],
+    '拍发': [['pāi'], ['fā']],
+    '拍戏': [['pāi'], ['xì']],
+    '拍打': [['pāi'], ['dǎ']],
+    '拍摄': [['pāi'], ['shè']],
+    '拐棍': [['guǎi'], ['gùn']],
+    '拐角': [['guǎi'], ['jiǎo']],
+    '拓印': [['tà'], ['yìn']],
+    '拓地': [['tuò'], ['dì']],
+    '拓宽': [['tuò'], ['kuān']],
+    '拓展': [['tuò'], ['zhǎn']],
+    '拓扑': [['tuò'], ['pū']],
+    '拓拔': [['tuò'], ['bá']],
+    '拓本': [['tà'], ['běn']],
+    '拓殖': [['tuò'], ['zhí']],
+    '拓片': [['tà'], ['piàn']],
+    '拓荒': [['tuò'], ['huāng']],
+    '拔地': [['bá'], ['dì']],
+    '拔毒': [['bá'], ['dú']],
+    '拔缝': [['bá'], ['fèng']],
+    '拔节': [['bá'], ['jié']],
+    '拖把': [['tuō'], ['bǎ']],
+    '拖拉': [['tuō'], ['lā']],
+    '拖斗': [['tuō'], ['dǒu']],
+    '拖沓': [['tuō'], ['tà']],
+    '拖累': [['tuō'], ['lěi']],
+    '拖车': [['tuō'], ['chē']],
+    '拖长': [['tuō'], ['cháng']],
+    '拗口': [['ào'], ['kǒu']],
+    '拗断': [['ǎo'], ['duàn']],
+    '拘传': [['jū'], ['chuán']],
+    '拘役': [['jū'], ['yì']],
+    '拘执': [['jū'], ['zhí']],
+    '拘押': [['jū'], ['yā']],
+    '拘拿': [['jū'], ['ná']],
+    '拘挛': [['jū'], ['luán']],
+    '拘捕': [['jū'], ['bǔ']],
+    '拘束': [['jū'], ['shù']],
+    '拘泥': [['jū'], ['nì']],
+    '拘牵': [['jū'], ['qiān']],
+    '拘留': [['jū'], ['liú']],
+    '拘礼': [['jū'], ['lǐ']],
+    '拘票': [['jū'], ['piào']],
+    '拘禁': [['jū'], ['jìn']],
+    '拘管': [['jū'], ['guǎn']],
+    '拘谨': [['jū'], ['jǐn']],
+    '拙朴': [['zhuō'], ['piáo']],
+    '拙著': [['zhuō'], ['zhù']],
+    '拙见': [['zhuō'], ['jiàn']],
+    '拚命': [['pàn'], ['mìng']],
+    '招亲': [['zhāo'], ['qīn']],
+    '招供': [['zhāo'], ['gòng']],
+    '招待': [['zhāo'], ['dài']],
+    '招徕': [['zhāo'], ['lái']],
+    '招数': [['zhāo'], ['shù']],
+    '招行': [['zhāo'], ['háng']],
+    '招降': [['zhāo'], ['xiáng']],
+    '招风': [['zhāo'], ['fēng']],
+    '拜会': [['bài'], ['huì']],
+    '拜佛': [['bài'], ['fó']],
+    '拜倒': [['bài'], ['dǎo']],
+    '拜别': [['bài'], ['bié']],
+    '拜将': [['bài'], ['jiàng']],
+    '拜服': [['bài'], ['fú']],
+    '拜祭': [['bài'], ['jì']],
+    '拜节': [['bài'], ['jié']],
+    '拜见': [['bài'], ['jiàn']],
+    '拜读': [['bài'], ['dú']],
+    '拟合': [['nǐ'], ['hé']],
+    '拢共': [['lǒng'], ['gòng']],
+    '拣择': [['jiǎn'], ['zé']],
+    '拥塞': [['yōng'], ['sè']],
+    '拥有': [['yōng'], ['yǒu']],
+    '拦挡': [['lán'], ['dǎng']],
+    '拦柜': [['lán'], ['guì']],
+    '拧紧': [['níng'], ['jǐn']],
+    '拨发': [['bō'], ['fā']],
+    '拨号': [['bō'], ['hào']],
+    '拨弄': [['bō'], ['nòng']],
+    '拨拉': [['bō'], ['lā']],
+    '拨给': [['bō'], ['gěi']],
+    '拨转': [['bō'], ['zhuǎn']],
+    '择交': [['zé'], ['jiāo']],
+    '择优': [['zé'], ['yōu']],
+    '择吉': [['zé'], ['jí']],
+    '择席': [['zhái'], ['xí']],
+    '择日': [['zé'], ['rì']],
+    '择菜': [['zhái'], ['cài']],
+    '择要': [['zé'], ['yào']],
+    '括号': [['kuò'], ['hào']],
+    '括弧': [['kuò'], ['hú']],
+    '拮抗': [['jié'], ['kàng']],
+    '拮据': [['jié'], ['jū']],
+    '拱券': [['gǒng'], ['xuàn']],
+    '拱圈': [['gǒng'], ['quān']],
+    '拳参': [['quán'], ['cān']],
+    '拳头': [['quán'], ['tou']],
+    '拳打': [['quán'], ['dǎ']],
+    '拳曲': [['quán'], ['qū']],
+    '拳术': [['quán'], ['shù']],
+    '拳王': [['quán'], ['wáng']],
+    '拶子': [['zǎn'], ['zǐ']],
+    '拶指': [['zǎn'], ['zhǐ']],
+    '拷打': [['kǎo'], ['dǎ']],
+    '拼刺': [['pīn'], ['cì']],
+    '拼合': [['pīn'], ['hé']],
+    '拼抢': [['pīn'], ['qiǎng']],
+    '拼斗': [['pīn'], ['dòu']],
+    '拼读': [['pīn'], ['dú']],
+    '拾掇': [['shí'], ['duō']],
+    '拾物': [['shí'], ['wù']],
+    '拾荒': [['shí'], ['huāng']],
+    '拾遗': [['shí'], ['yí']],
+    '拾零': [['shí'], ['líng']],
+    '拿大': [['ná'], ['dà']],
+    '拿给': [['ná'], ['gěi']],
+    '持家': [['chí'], ['jiā']],
+    '持有': [['chí'], ['yǒu']],
+    '持正': [['chí'], ['zhèng']],
+    '持节': [['chí'], ['jié']],
+    '持论': [['chí'], ['lùn']],
+    '持重': [['chí'], ['zhòng']],
+    '挂冠': [['guà'], ['guān']],
+    '挂单': [['guà'], ['dān']],
+    '挂号': [['guà'], ['hào']],
+    '挂屏': [['guà'], ['píng']],
+    '挂斗': [['guà'], ['dǒu']],
+    '挂累': [['guà'], ['lèi']],
+    '挂红': [['guà'], ['hóng']],
+    '挂车': [['guà'], ['chē']],
+    '挂轴': [['guà'], ['zhóu']],
+    '指令': [['zhǐ'], ['lìng']],
+    '指供': [['zhǐ'], ['gòng']],
+    '指南': [['zhǐ'], ['nán']],
+    '指头': [['zhǐ'], ['tou']],
+    '指教': [['zhǐ'], ['jiào']],
+    '指数': [['zhǐ'], ['shù']],
+    '指正': [['zhǐ'], ['zhèng']],
+    '指称': [['zhǐ'], ['chēng']],
+    '指纹': [['zhǐ'], ['wén']],
+    '指缝': [['zhǐ'], ['féng']],
+    '指节': [['zhǐ'], ['jié']],
+    '按压': [['àn'], ['yā']],
+    '按摩': [['àn'], ['mó']],
+    '按期': [['àn'], ['qī']],
+    '按脉': [['àn'], ['mài']],
+    '按语': [['àn'], ['yǔ']],
+    '按说': [['àn'], ['shuō']],
+    '挎包': [['kuà'], ['bāo']],
+    '挎斗': [['kuà'], ['dǒu']],
+    '挑中': [['tiāo'], ['zhòng']],
+    '挑刺': [['tiāo'], ['cì']],
+    '挑剔': [['tiāo'], ['tī']],
+    '挑动': [['tiǎo'], ['dòng']],
+    '挑唆': [['tiǎo'], ['suō']],
+    '挑嘴': [['tiǎo'], ['zuǐ']],
+    '挑夫': [['tiāo'], ['fū']],
+    '挑头': [['tiāo'], ['tóu']],
+    '挑子': [['tiāo'], ['zi']],
+    '挑弄': [['tiǎo'], ['nòng']],
+    '挑战': [['tiǎo'], ['zhàn']],
+    '挑担': [['tiāo'], ['dàn']],
+    '挑拣': [['tiāo'], ['jiǎn']],
+    '挑拨': [['tiǎo'], ['bō']],
+    '挑明': [['tiǎo'], ['míng']],
+    '挑灯': [['tiǎo'], ['dēng']],
+    '挑眼': [['tiāo'], ['yǎn']],
+    '挑花': [['tiǎo'], ['huā']],
+    '挑衅': [['tiǎo'], ['xìn']],
+    '挑选': [['tiāo'], ['xuǎn']],
+    '挑逗': [['tiǎo'], ['dòu']],
+    '挑错': [['tiāo'], ['cuò']],
+    '挑食': [['tiāo'], ['shí']],
+    '挛缩': [['luán'], ['suō']],
+    '挟制': [['xié'], ['zhì']],
+    '挟嫌': [['xié'], ['xián']],
+    '挟带': [['xié'], ['dài']],
+    '挟持': [['xié'], ['chí']],
+    '挠头': [['náo'], ['tóu']],
+    '挠曲': [['náo'], ['qū']],
+    '挡子': [['dǎng'], ['zǐ']],
+    '挡板': [['dǎng'], ['bǎn']],
+    '挡路': [['dǎng'], ['lù']],
+    '挡车': [['dǎng'], ['chē']],
+    '挡驾': [['dǎng'], ['jià']],
+    '挣命': [['zhèng'], ['mìng']],
+    '挣扎': [['zhēng'], ['zhá']],
+    '挣揣': [['zhèng'], ['chuài']],
+    '挣脱': [['zhèng'], ['tuō']],
+    '挣钱': [['zhèng'], ['qián']],
+    '挤兑': [['jǐ'], ['duì']],
+    '挤占': [['jǐ'], ['zhàn']],
+    '挤压': [['jǐ'], ['yā']],
+    '挤落': [['jǐ'], ['luò']],
+    '挥发': [['huī'], ['fā']],
+    '挥洒': [['huī'], ['sǎ']],
+    '挨个': [['āi'], ['gè']],
+    '挨打': [['ái'], ['dǎ']],
+    '挨说': [['ái'], ['shuō']],
+    '挨近': [['āi'], ['jìn']],
+    '挨饿': [['ái'], ['è']],
+    '挨骂': [['ái'], ['mà']],
+    '挫折': [['cuò'], ['zhé']],
+    '振兴': [['zhèn'], ['xīng']],
+    '振臂': [['zhèn'], ['bì']],
+    '挺括': [['tǐng'], ['guā']],
+    '捆扎': [['kǔn'], ['zhā']],
+    '捉弄': [['zhuō'], ['nòng']],
+    '捎信': [['shāo'], ['xìn']],
+    '捎带': [['shāo'], ['dài']],
+    '捎脚': [['shāo'], ['jiǎo']],
+    '捎话': [['shāo'], ['huà']],
+    '捏合': [['niē'], ['hé']],
+    '捏弄': [['niē'], ['nòng']],
+    '捐助': [['juān'], ['zhù']],
+    '捕头': [['bǔ'], ['tóu']],
+    '捕食': [['bǔ'], ['shí']],
+    '损坏': [['sǔn'], ['huài']],
+    '捡拾': [['jiǎn'], ['shí']],
+    '换亲': [['huàn'], ['qīn']],
+    '换帖': [['huàn'], ['tiě']],
+    '换洗': [['huàn'], ['xǐ']],
+    '换约': [['huàn'], ['yuē']],
+    '捧场': [['pěng'], ['chǎng']],
+    '捶背': [['chuí'], ['bèi']],
+    '掂掇': [['diān'], ['duō']],
+    '掂量': [['diān'], ['liáng']],
+    '掇拾': [['duō'], ['shí']],
+    '掉价': [['diào'], ['jià']],
+    '掉头': [['diào'], ['tóu']],
+    '掉转': [['diào'], ['zhuǎn']],
+    '掌掴': [['zhǎng'], ['guāi']],
+    '排他': [['pái'], ['tā']],
+    '排偶': [['pái'], ['ǒu']],
+    '排击': [['pái'], ['jī']],
+    '排印': [['pái'], ['yìn']],
+    '排场': [['pái'], ['chǎng']],
+    '排外': [['pái'], ['wài']],
+    '排字': [['pái'], ['zì']],
+    '排尾': [['pái'], ['wěi']],
+    '排律': [['pái'], ['lǜ']],
+    '排戏': [['pái'], ['xì']],
+    '排挡': [['pái'], ['dǎng']],
+    '排放': [['pái'], ['fàng']],
+    '排枪': [['pái'], ['qiāng']],
+    '排污': [['pái'], ['wū']],
+    '排涝': [['pái'], ['lào']],
+    '排演': [['pái'], ['yǎn']],
+    '排灌': [['pái'], ['guàn']],
+    '排炮': [['pái'], ['pào']],
+    '排版': [['pái'], ['bǎn']],
+    '排班': [['pái'], ['bān']],
+    '排空': [['pái'], ['kōng']],
+    '排笔': [['pái'], ['bǐ']],
+    '排筏': [['pái'], ['fá']],
+    '排箫': [['pái'], ['xiāo']],
+    '排练': [['pái'], ['liàn']],
+    '排行': [['pái'], ['háng']],
+    '排解': [['pái'], ['jiě']],
+    '排遣': [['pái'], ['qiǎn']],
+    '排长': [['pái'], ['zhǎng']],
+    '排队': [['pái'], ['duì']],
+    '排除': [['pái'], ['chú']],
+    '排骨': [['pái'], ['gǔ']],
+    '掖满': [['yē'], ['mǎn']],
+    '掖给': [['yē'], ['gěi']],
+    '接着': [['jiē'], ['zhe']],
+    '推磨': [['tuī'], ['mò']],
+    '掴手': [['guāi'], ['shǒu']],
+    '掸子': [['dǎn'], ['zi']],
+    '掺和': [['chān'], ['huo']],
+    '提交': [['tí'], ['jiāo']],
+    '提亲': [['tí'], ['qīn']],
+    '提价': [['tí'], ['jià']],
+    '提供': [['tí'], ['gōng']],
+    '提倡': [['tí'], ['chàng']],
+    '提兜': [['tí'], ['dōu']],
+    '提出': [['tí'], ['chū']],
+    '提到': [['tí'], ['dào']],
+    '提制': [['tí'], ['zhì']],
+    '提前': [['tí'], ['qián']],
+    '提包': [['tí'], ['bāo']],
+    '提升': [['tí'], ['shēng']],
+    '提单': [['tí'], ['dān']],
+    '提及': [['tí'], ['jí']],
+    '提取': [['tí'], ['qǔ']],
+    '提名': [['tí'], ['míng']],
+    '提壶': [['tí'], ['hú']],
+    '提婚': [['tí'], ['hūn']],
+    '提审': [['tí'], ['shěn']],
+    '提干': [['tí'], ['gàn']],
+    '提心': [['tí'], ['xīn']],
+    '提成': [['tí'], ['chéng']],
+    '提手': [['tí'], ['shǒu']],
+    '提拔': [['tí'], ['bá']],
+    '提拨': [['tí'], ['bō']],
+    '提挈': [['tí'], ['qiè']],
+    '提提': [['tí'], ['tí']],
+    '提携': [['tí'], ['xié']],
+    '提早': [['tí'], ['zǎo']],
+    '提案': [['tí'], ['àn']],
+    '提梁': [['tí'], ['liáng']],
+    '提款': [['tí'], ['kuǎn']],
+    '提法': [['tí'], ['fǎ']],
+    '提溜': [['dī'], ['liū']],
+    '提灯': [['tí'], ['dēng']],
+    '提点': [['tí'], ['diǎn']],
+    '提炼': [['tí'], ['liàn']],
+    '提琴': [['tí'], ['qín']],
+    '提留': [['tí'], ['liú']],
+    '提盒': [['tí'], ['hé']],
+    '提督': [['tí'], ['dū']],
+    '提示': [['tí'], ['shì']],
+    '提神': [['tí'], ['shén']],
+    '提笔': [['tí'], ['bǐ']],
+    '提箱': [['tí'], ['xiāng']],
+    '提篮': [['tí'], ['lán']],
+    '提级': [['tí'], ['jí']],
+    '提纯': [['tí'], ['chún']],
+    '提纲': [['tí'], ['gāng']],
+    '提花': [['tí'], ['huā']],
+    '提要': [['tí'], ['yào']],
+    '提议': [['tí'], ['yì']],
+    '提讯': [['tí'], ['xùn']],
+    '提词': [['tí'], ['cí']],
+    '提请': [['tí'], ['qǐng']],
+    '提调': [['tí'], ['diào']],
+    '提货': [['tí'], ['huò']],
+    '提起': [['tí'], ['qǐ']],
+    '提选': [['tí'], ['xuǎn']],
+    '提醒': [['tí'], ['xǐng']],
+    '提问': [['tí'], ['wèn']],
+    '提防': [['dī'], ['fáng']],
+    '提领': [['tí'], ['lǐng']],
+    '提高': [['tí'], ['gāo']],
+    '插头': [['chā'], ['tóu']],
+    '插屏': [['chā'], ['píng']],
+    '插曲': [['chā'], ['qǔ']],
+    '插条': [['chā'], ['tiáo']],
+    '握别': [['wò'], ['bié']],
+    '揣度': [['chuǎi'], ['duó']],
+    '揣想': [['chuǎi'], ['xiǎng']],
+    '揣手': [['chuāi'], ['shǒu']],
+    '揣摩': [['chuǎi'], ['mó']],
+    '揣摸': [['chuǎi'], ['mō']],
+    '揣测': [['chuǎi'], ['cè']],
+    '揪斗': [['jiū'], ['dòu']],
+    '揭发': [['jiē'], ['fā']],
+    '揭帖': [['jiē'], ['tiě']],
+    '揭幕': [['jiē'], ['mù']],
+    '揭底': [['jiē'], ['dǐ']],
+    '揭开': [['jiē'], ['kāi']],
+    '揭批': [['jiē'], ['pī']],
+    '揭揭': [['jiē'], ['jiē']],
+    '揭晓': [['jiē'], ['xiǎo']],
+    '揭榜': [['jiē'], ['bǎng']],
+    '揭橥': [['jiē'], ['zhū']],
+    '揭短': [['jiē'], ['duǎn']],
+    '揭破': [['jiē'], ['pò']],
+    '揭示': [['jiē'], ['shì']],
+    '揭穿': [['jiē'], ['chuān']],
+    '揭锅': [['jiē'], ['guō']],
+    '揭阳': [['jiē'], ['yáng']],
+    '揭露': [['jiē'], ['lù']],
+    '搀假': [['chān'], ['jiǎ']],
+    '搀兑': [['chān'], ['duì']],
+    '搀和': [['chān'], ['huo']],
+    '搁板': [['gē'], ['bǎn']],
+    '搁浅': [['gē'], ['qiǎn']],
+    '搁笔': [['gē'], ['bǐ']],
+    '搁置': [['gē'], ['zhì']],
+    '搂抱': [['lǒu'], ['bào']],
+    '搅合': [['jiǎo'], ['hé']],
+    '搅和': [['jiǎo'], ['huo']],
+    '搅拌': [['jiǎo'], ['bàn']],
+    '搅混': [['jiǎo'], ['gǔn']],
+    '搋子': [['chuāi'], ['zi']],
+    '搏斗': [['bó'], ['dòu']],
+    '搐缩': [['chù'], ['suō']],
+    '搓弄': [['cuō'], ['nòng']],
+    '搓洗': [['cuō'], ['xǐ']],
+    '搔头': [['sāo'], ['tóu']],
+    '搜剿': [['sōu'], ['jiǎo']],
+    '搜括': [['sōu'], ['guā']],
+    '搜查': [['sōu'], ['chá']],
+    '搞好': [['gǎo'], ['hǎo']],
+    '搪塞': [['táng'], ['sè']],
+    '搬家': [['bān'], ['jiā']],
+    '搬弄': [['bān'], ['nòng']],
+    '搭乘': [['dā'], ['chéng']],
+    '搭便': [['dā'], ['biàn']],
+    '搭拉': [['dā'], ['lā']],
+    '搭理': [['dā'], ['lǐ']],
+    '搭盖': [['dā'], ['gài']],
+    '搭车': [['dā'], ['chē']],
+    '搭载': [['dā'], ['zài']],
+    '搶水': [['qiāng'], ['shuǐ']],
+    '摄取': [['shè'], ['qǔ']],
+    '摄政': [['shè'], ['zhèng']],
+    '摄食': [['shè'], ['shí']],
+    '摆弄': [['bǎi'], ['nòng']],
+    '摆擂': [['bǎi'], ['lèi']],
+    '摆正': [['bǎi'], ['zhèng']],
+    '摇头': [['yáo'], ['tóu']],
+    '摇晃': [['yáo'], ['huàng']],
+    '摇椅': [['yáo'], ['yǐ']],
+    '摊子': [['tān'], ['zi']],
+    '摊还': [['tān'], ['hái']],
+    '摔倒': [['shuāi'], ['dǎo']],
+    '摔打': [['shuāi'], ['dá']],
+    '摔角': [['shuāi'], ['jiǎo']],
+    '摘发': [['zhāi'], ['fā']],
+    '摘要': [['zhāi'], ['yào']],
+    '摧折': [['cuī'], ['shé']],
+    '摩天': [['mó'], ['tiān']],
+    '摩尔': [['mó'], ['ěr']],
+    '摩崖': [['mó'], ['yá']],
+    '摩托': [['mó'], ['tuō']],
+    '摩抚': [['mó'], ['fǔ']],
+    '摩挲': [['mā'], ['sā']],
+    '摩擦': [['mó'], ['cā']],
+    '摩登': [['mó'], ['dēng']],
+    '摸头': [['mō'], ['tóu']],
+    '摸底': [['mō'], ['dǐ']],
+    '撅嘴': [['juē'], ['zuǐ']],
+    '撇嘴': [['piě'], ['zuǐ']],
+    '撇开': [['piē'], ['kāi']],
+    '撇弃': [['piē'], ['qì']],
+    '撇条': [['piě'], ['tiáo']],
+    '撑杆': [['chēng'], ['gān']],
+    '撒刁': [['sā'], ['diāo']],
+    '撒娇': [['sā'], ['jiāo']],
+    '撒布': [['sǎ'], ['bù']],
+    '撒开': [['sā'], ['kāi']],
+    '撒手': [['sā'], ['shǒu']],
+    '撒拉': [['sā'], ['lā']],
+    '撒播': [['sǎ'], ['bō']],
+    '撒施': [['sǎ'], ['shī']],
+    '撒旦': [['sā'], ['dàn']],
+    '撒欢': [['sā'], ['huān']],
+    '撒气': [['sā'], ['qì']],
+    '撒泼': [['sā'], ['pō']],
+    '撒种': [['sǎ'], ['zhǒng']],
+    '撒腿': [['sā'], ['tuǐ']],
+    '撒谎': [['sā'], ['huǎng']],
+    '撒赖': [['sā'], ['lài']],
+    '撒野': [['sā'], ['yě']],
+    '撕打': [['sī'], ['dǎ']],
+    '撕票': [['sī'], ['piào']],
+    '撕裂': [['sī'], ['liè']],
+    '撙节': [['zǔn'], ['jié']],
+    '撞坏': [['zhuàng'], ['huài']],
+    '撞见': [['zhuàng'], ['jiàn']],
+    '撞车': [['zhuàng'], ['chē']],
+    '撤佃': [['chè'], ['diàn']],
+    '撤差': [['chè'], ['chāi']],
+    '撩乱': [['liáo'], ['luàn']],
+    '撩人': [['liáo'], ['rén']],
+    '撩动': [['liáo'], ['dòng']],
+    '撩开': [['liáo'], ['kāi']],
+    '撩拨': [['liáo'], ['bō']],
+    '撩逗': [['liáo'], ['dòu']],
+    '撬杠': [['qiào'], ['gàng']],
+    '撬棍': [['qiào'], ['gùn']],
+    '播发': [['bō'], ['fā']],
+    '播弄': [['bō'], ['nòng']],
+    '播撒': [['bō'], ['sǎ']],
+    '播散': [['bō'], ['sàn']],
+    '播种': [['bō'], ['zhǒng']],
+    '撮合': [['cuō'], ['hé']],
+    '撮弄': [['cuō'], ['nòng']],
+    '撮箕': [['cuō'], ['jī']],
+    '撮要': [['cuō'], ['yào']],
+    '撰著': [['zhuàn'], ['zhe']],
+    '撺弄': [['cuān'], ['nòng']],
+    '撺掇': [['cuān'], ['duō']],
+    '擂主': [['lèi'], ['zhǔ']],
+    '擂台': [['lèi'], ['tái']],
+    '擂鼓': [['léi'], ['gǔ']],
+    '擅场': [['shàn'], ['chǎng']],
+    '擅长': [['shàn'], ['cháng']],
+    '操切': [['cāo'], ['qiè']],
+    '操场': [['cāo'], ['chǎng']],
+    '操行': [['cāo'], ['xíng']],
+    '擘划': [['bò'], ['huà']],
+    '擘画': [['bò'], ['huà']],
+    '擦洗': [['cā'], ['xǐ']],
+    '擦背': [['cā'], ['bèi']],
+    '攀亲': [['pān'], ['qīn']],
+    '攀供': [['pān'], ['gòng']],
+    '攀折': [['pān'], ['zhé']],
+    '攒动': [['cuán'], ['dòng']],
+    '攒射': [['cuán'], ['shè']],
+    '攒攒': [['zǎn'], ['zǎn']],
+    '攒盒': [['cuán'], ['hé']],
+    '攒眉': [['cuán'], ['méi']],
+    '攒竹': [['zǎn'], ['zhú']],
+    '攒聚': [['cuán'], ['jù']],
+    '攒钱': [['zǎn'], ['qián']],
+    '攒集': [['cuán'], ['jí']],
+    '攘臂': [['rǎng'], ['bì']],
+    '支会': [['zhī'], ['huì']],
+    '支助': [['zhī'], ['zhù']],
+    '支吾': [['zhī'], ['wú']],
+    '支委': [['zhī'], ['wěi']],
+    '支差': [['zhī'], ['chāi']],
+    '支应': [['zhī'], ['yìng']],
+    '支数': [['zhī'], ['shù']],
+    '支棱': [['zhī'], ['léng']],
+    '支渠': [['zhī'], ['qú']],
+    '支着': [['zhī'], ['zhāo']],
+    '支票': [['zhī'], ['piào']],
+    '支脉': [['zhī'], ['mài']],
+    '支解': [['zhī'], ['jiě']],
+    '支那': [['zhī'], ['nà']],
+    '收发': [['shōu'], ['fā']],
+    '收场': [['shōu'], ['chǎng']],
+    '收尾': [['shōu'], ['wěi']],
+    '收拾': [['shōu'], ['shí']],
+    '收据': [['shōu'], ['jù']],
+    '收服': [['shōu'], ['fú']],
+    '收煞': [['shōu'], ['shā']],
+    '收率': [['shōu'], ['lǜ']],
+    '收监': [['shōu'], ['jiān']],
+    '收看': [['shōu'], ['kàn']],
+    '收缩': [['shōu'], ['suō']],
+    '收缴': [['shōu'], ['jiǎo']],
+    '收藏': [['shōu'], ['cáng']],
+    '收载': [['shōu'], ['zǎi']],
+    '改为': [['gǎi'], ['wéi']],
+    '改任': [['gǎi'], ['rèn']],
+    '改期': [['gǎi'], ['qī']],
+    '改正': [['gǎi'], ['zhèng']],
+    '改称': [['gǎi'], ['chēng']],
+    '改行': [['gǎi'], ['háng']],
+    '改观': [['gǎi'], ['guān']],
+    '改调': [['gǎi'], ['diào']],
+    '改过': [['gǎi'], ['guò']],
+    '攻占': [['gōng'], ['zhàn']],
+    '攻打': [['gōng'], ['dǎ']],
+    '攻读': [['gōng'], ['dú']],
+    '放任': [['fàng'], ['rèn']],
+    '放倒': [['fàng'], ['dǎo']],
+    '放假': [['fàng'], ['jià']],
+    '放大': [['fàng'], ['dà']],
+    '放射': [['fàng'], ['shè']],
+    '放排': [['fàng'], ['pái']],
+    '放散': [['fàng'], ['sàn']],
+    '放榜': [['fàng'], ['bǎng']],
+    '放毒': [['fàng'], ['dú']],
+    '放炮': [['fàng'], ['pào']],
+    '放空': [['fàng'], ['kōng']],
+    '放纵': [['fàng'], ['zòng']],
+    '放血': [['fàng'], ['xuè']],
+    '放行': [['fàng'], ['xíng']],
+    '放过': [['fàng'], ['guò']],
+    '放还': [['fàng'], ['hái']],
+    '放量': [['fàng'], ['liàng']],
+    '放风': [['fàng'], ['fēng']],
+    '政令': [['zhèng'], ['lìng']],
+    '政体': [['zhèng'], ['tǐ']],
+    '政委': [['zhèng'], ['wěi']],
+    '政教': [['zhèng'], ['jiào']],
+    '政纪': [['zhèng'], ['jì']],
+    '政要': [['zhèng'], ['yào']],
+    '政见': [['zhèng'], ['jiàn']],
+    '政论': [['zhèng'], ['lùn']],
+    '故伎': [['gù'], ['jì']],
+    '故地': [['gù'], ['dì']],
+    '故知': [['gù'], ['zhī']],
+    '故都': [['gù'], ['dū']],
+    '效应': [['xiào'], ['yìng']],
+    '效率': [['xiào'], ['lǜ']],
+    '效能': [['xiào'], ['néng']],
+    '敌区': [['dí'], ['qū']],
+    '敌台': [['dí'], ['tái']],
+    '敌忾': [['dí'], ['kài']],
+    '教书': [['jiāo'], ['shū']],
+    '教旨': [['jiào'], ['zhǐ']],
+    '教民': [['jiào'], ['mín']],
+    '教法': [['jiào'], ['fǎ']],
+    '教理': [['jiào'], ['lǐ']],
+    '教给': [['jiāo'], ['gěi']],
+    '敞车': [['chǎng'], ['chē']],
+    '敢当': [['gǎn'], ['dāng']],
+    '散乱': [['sǎn'], ['luàn']],
+    '散亡': [['sàn'], ['wáng']],
+    '散件': [['sǎn'], ['jiàn']],
+    '散伙': [['sàn'], ['huǒ']],
+    '散会': [['sàn'], ['huì']],
+    '散体': [['sǎn'], ['tǐ']],
+    '散佚': [['sàn'], ['yì']],
+    '散光': [['sǎn'], ['guāng']],
+    '散兵': [['sǎn'], ['bīng']],
+    '散剂': [['sǎn'], ['jì']],
+    '散发': [['sàn'], ['fà']],
+    '散场': [['sàn'], ['chǎng']],
+    '散失': [['sàn'], ['shī']],
+    '散学': [['sàn'], ['xué']],
+    '散射': [['sǎn'], ['shè']],
+    '散居': [['sǎn'], ['jū']],
+    '散工': [['sǎn'], ['gōng']],
+    '散布': [['sàn'], ['bù']],
+    '散席': [['sàn'], ['xí']],
+    '散座': [['sàn'], ['zuò']],
+    '散开': [['sàn'], ['kāi']],
+    '散心': [['sàn'], ['xīn']],
+    '散戏': [['sàn'], ['xì']],
+    '散户': [['sàn'], ['hù']],
+    '散播': [['sàn'], ['bō']],
+    '散放': [['sàn'], ['fàng']],
+    '散文': [['sǎn'], ['wén']],
+    '散曲': [['sǎn'], ['qǔ']],
+    '散板': [['sǎn'], ['bǎn']],
+    '散架': [['sǎn'], ['jià']],
+    '散步': [['sàn'], ['bù']],
+    '散水': [['sàn'], ['shuǐ']],
+    '散沙': [['sǎn'], ['shā']],
+    '散漫': [['sǎn'], ['màn']],
+    '散碎': [['sǎn'], ['suì']],
+    '散置': [['sàn'], ['zhì']],
+    '散落': [['sàn'], ['luò']],
+    '散装': [['sǎn'], ['zhuāng']],
+    '散见': [['sǎn'], ['jiàn']],
+    '散记': [['sǎn'], ['jì']],
+    '散钱': [['sàn'], ['qián']],
+    '散闷': [['sàn'], ['mèn']],
+    '敦促': [['dūn'], ['cù']],
+    '敦劝': [['dūn'], ['quàn']],
+    '敦化': [['dūn'], ['huà']],
+    '敦厚': [['dūn'], ['hòu']],
+    '敦实': [['dūn'], ['shí']],
+    '敦朴': [['dūn'], ['piáo']],
+    '敦煌': [['dūn'], ['huáng']],
+    '敦睦': [['dūn'], ['mù']],
+    '敦聘': [['dūn'], ['pìn']],
+    '敦请': [['dūn'], ['qǐng']],
+    '敬仰': [['jìng'], ['yǎng']],
+    '敬服': [['jìng'], ['fú']],
+    '敬语': [['jìng'], ['yǔ']],
+    '敬重': [['jìng'], ['zhòng']],
+    '数九': [['shǔ'], ['jiǔ']],
+    '数位': [['shù'], ['wèi']],
+    '数值': [['shù'], ['zhí']],
+    '数列': [['shù'], ['liè']],
+    '数制': [['shù'], ['zhì']],
+    '数叨': [['shù'], ['dāo']],
+    '数字': [['shù'], ['zì']],
+    '数学': [['shù'], ['xué']],
+    '数据': [['shù'], ['jù']],
+    '数数': [['shuò'], ['shuò']],
+    '数珠': [['shù'], ['zhū']],
+    '数目': [['shù'], ['mù']],
+    '数码': [['shù'], ['mǎ']],
+    '数落': [['shǔ'], ['luò']],
+    '数表': [['shù'], ['biǎo']],
+    '数论': [['shù'], ['lùn']],
+    '数词': [['shù'], ['cí']],
+    '数说': [['shǔ'], ['shuō']],
+    '数量': [['shù'], ['liàng']],
+    '数额': [['shù'], ['é']],
+    '敲打': [['qiāo'], ['dǎ']],
+    '整个': [['zhěng'], ['gè']],
+    '整体': [['zhěng'], ['tǐ']],
+    '整地': [['zhěng'], ['dì']],
+    '整宿': [['zhěng'], ['sù']],
+    '整数': [['zhěng'], ['shù']],
+    '整枝': [['zhěng'], ['zhī']],
+    '整齐': [['zhěng'], ['qí']],
+    '文体': [['wén'], ['tǐ']],
+    '文化': [['wén'], ['huà']],
+    '文华': [['wén'], ['huá']],
+    '文卷': [['wén'], ['juàn']],
+    '文句': [['wén'], ['jù']],
+    '文号': [['wén'], ['hào']],
+    '文员': [['wén'], ['yuán']],
+    '文场': [['wén'], ['chǎng']],
+    '文契': [['wén'], ['qì']],
+    '文思': [['wén'], ['sī']],
+    '文戏': [['wén'], ['xì']],
+    '文教': [['wén'], ['jiào']],
+    '文斗': [['wén'], ['dòu']],
+    '文石': [['wén'], ['shí']],
+    '文脉': [['wén'], ['mài']],
+    '文蛤': [['wén'], ['gé']],
+    '文论': [['wén'], ['lùn']],
+    '文采': [['wén'], ['cǎi']],
+    '斋期': [['zhāi'], ['qī']],
+    '斑纹': [['bān'], ['wén']],
+    '斗争': [['dòu'], ['zhēng']],
+    '斗勇': [['dòu'], ['yǒng']],
+    '斗嘴': [['dòu'], ['zuǐ']],
+    '斗士': [['dòu'], ['shì']],
+    '斗子': [['dǒu'], ['zi']],
+    '斗室': [['dǒu'], ['shì']],
+    '斗富': [['dòu'], ['fù']],
+    '斗志': [['dòu'], ['zhì']],
+    '斗拱': [['dǒu'], ['gǒng']],
+    '斗方': [['dǒu'], ['fāng']],
+    '斗智': [['dòu'], ['zhì']],
+    '斗殴': [['dòu'], ['ōu']],
+    '斗气': [['dòu'], ['qì']],
+    '斗法': [['dòu'], ['fǎ']],
+    '斗渠': [['dǒu'], ['qú']],
+    '斗牌': [['dòu'], ['pái']],
+    '斗牛': [['dòu'], ['niú']],
+    '斗眼': [['dòu'], ['yǎn']],
+    '斗笠': [['dǒu'], ['lì']],
+    '斗箕': [['dòu'], ['jī']],
+    '斗篷': [['dǒu'], ['péng']],
+    '斗胆': [['dǒu'], ['dǎn']],
+    '斗艳': [['dòu'], ['yàn']],
+    '斗车': [['dǒu'], ['chē']],
+    '斗门': [['dǒu'], ['mén']],
+    '斗鸡': [['dòu'], ['jī']],
+    '料斗': [['liào'], ['dǒu']],
+    '料石': [['liào'], ['shí']],
+    '料量': [['liào'], ['liàng']],
+    '斡旋': [['wò'], ['xuán']],
+    '斤斗': [['jīn'], ['dǒu']],
+    '斧头': [['fǔ'], ['tóu']],
+    '斧正': [['fǔ'], ['zhèng']],
+    '断句': [['duàn'], ['jù']],
+    '断片': [['duàn'], ['piàn']],
+    '断种': [['duàn'], ['zhǒng']],
+    '断臂': [['duàn'], ['bì']],
+    '断语': [['duàn'], ['yǔ']],
+    '新丁': [['xīn'], ['dīng']],
+    '新乐': [['xīn'], ['lè']],
+    '新任': [['xīn'], ['rèn']],
+    '新兴': [['xīn'], ['xīng']],
+    '新化': [['xīn'], ['huà']],
+    '新区': [['xīn'], ['qū']],
+    '新奇': [['xīn'], ['qí']],
+    '新教': [['xīn'], ['jiào']],
+    '新正': [['xīn'], ['zhēng']],
+    '新疆': [['xīn'], ['jiāng']],
+    '新知': [['xīn'], ['zhī']],
+    '新绿': [['xīn'], ['lǜ']],
+    '新语': [['xīn'], ['yǔ']],
+    '新郎': [['xīn'], ['láng']],
+    '新雨': [['xīn'], ['yǔ']],
+    '新鲜': [['xīn'], ['xiān']],
+    '方便': [['fāng'], ['biàn']],
+    '方头': [['fāng'], ['tóu']],
+    '方家': [['fāng'], ['jiā']],
+    '方尺': [['fāng'], ['chǐ']],
+    '方差': [['fāng'], ['chà']],
+    '方术': [['fāng'], ['shù']],
+    '方正': [['fāng'], ['zhèng']],
+    '於菟': [['wū'], ['tú']],
+    '施与': [['shī'], ['yǔ']],
+    '施为': [['shī'], ['wéi']],
+    '施予': [['shī'], ['yǔ']],
+    '施教': [['shī'], ['jiào']],
+    '施洗': [['shī'], ['xǐ']],
+    '施行': [['shī'], ['xíng']],
+    '旁人': [['páng'], ['rén']],
+    '旁侧': [['páng'], ['cè']],
+    '旁出': [['páng'], ['chū']],
+    '旁及': [['páng'], ['jí']],
+    '旁听': [['páng'], ['tīng']],
+    '旁坐': [['páng'], ['zuò']],
+    '旁支': [['páng'], ['zhī']],
+    '旁注': [['páng'], ['zhù']],
+    '旁白': [['páng'], ['bái']],
+    '旁落': [['páng'], ['luò']],
+    '旁观': [['páng'], ['guān']],
+    '旁证': [['páng'], ['zhèng']],
+    '旁路': [['páng'], ['lù']],
+    '旁边': [['páng'], ['biān']],
+    '旁通': [['páng'], ['tōng']],
+    '旁门': [['páng'], ['mén']],
+    '旁骛': [['páng'], ['wù']],
+    '旅舍': [['lǚ'], ['shè']],
+    '旅行': [['lǚ'], ['xíng']],
+    '旅贲': [['lǚ'], ['bēn']],
+    '旗号': [['qí'], ['hào']],
+    '旗杆': [['qí'], ['gān']],
+    '旗语': [['qí'], ['yǔ']],
+    '无上': [['wú'], ['shàng']],
+    '无不': [['wú'], ['bù']],
+    '无为': [['wú'], ['wéi']],
+    '无从': [['wú'], ['cóng']],
+    '无价': [['wú'], ['jià']],
+    '无任': [['wú'], ['rèn']],
+    '无何': [['wú'], ['hé']],
+    '无几': [['wú'], ['jǐ']],
+    '无华': [['wú'], ['huá']],
+    '无可': [['wú'], ['kě']],
+    '无处': [['wú'], ['chǔ']],
+    '无宁': [['wú'], ['nìng']],
+    '无尽': [['wú'], ['jìn']],
+    '无干': [['wú'], ['gān']],
+    '无度': [['wú'], ['dù']],
+    '无数': [['wú'], ['shù']],
+    '无期': [['wú'], ['qī']],
+    '无疆': [['wú'], ['jiāng']],
+    '无疑': [['wú'], ['yí']],
+    '无相': [['wú'], ['xiāng']],
+    '无着': [['wú'], ['zhuó']],
+    '无知': [['wú'], ['zhī']],
+    '无稽': [['wú'], ['jī']],
+    '无缝': [['wú'], ['fèng']],
+    '无能': [['wú'], ['néng']],
+    '无臭': [['wú'], ['xiù']],
+    '无行': [['wú'], ['xíng']],
+    '无论': [['wú'], ['lùn']],
+    '无趣': [['wú'], ['qù']],
+    '无过': [['wú'], ['guò']],
+    '无邪': [['wú'], ['xié']],
+    '无量': [['wú'], ['liàng']],
+    '无间': [['wú'], ['jiàn']],
+    '无风': [['wú'], ['fēng']],
+    '日中': [['rì'], ['zhōng']],
+    '日内': [['rì'], ['nèi']],
+    '日华': [['rì'], ['huá']],
+    '日场': [['rì'], ['chǎng']],
+    '日头': [['rì'], ['tou']],
+    '日子': [['rì'], ['zi']],
+    '日射': [['rì'], ['shè']],
+    '日晕': [['rì'], ['yùn']],
+    '日期': [['rì'], ['qī']],
+    '日没': [['rì'], ['méi']],
+    '日渐': [['rì'], ['jiàn']],
+    '日落': [['rì'], ['luò']],
+    '日见': [['rì'], ['jiàn']],
+    '日语': [['rì'], ['yǔ']],
+    '日间': [['rì'], ['jiān']],
+    '日食': [['rì'], ['shí']],
+    '旦角': [['dàn'], ['jué']],
+    '旧体': [['jiù'], ['tǐ']],
+    '旧地': [['jiù'], ['dì']],
+    '旧好': [['jiù'], ['hǎo']],
+    '旧家': [['jiù'], ['jiā']],
+    '旧恶': [['jiù'], ['è']],
+    '旧教': [['jiù'], ['jiào']],
+    '旧知': [['jiù'], ['zhī']],
+    '旧约': [['jiù'], ['yuē']],
+    '旧观': [['jiù'], ['guān']],
+    '旧识': [['jiù'], ['shí']],
+    '旧都': [['jiù'], ['dū']],
+    '旧雨': [['jiù'], ['yǔ']],
+    '旨要': [['zhǐ'], ['yào']],
+    '旨趣': [['zhǐ'], ['qù']],
+    '早上': [['zǎo'], ['shàng']],
+    '早场': [['zǎo'], ['chǎng']],
+    '早朝': [['zǎo'], ['cháo']],
+    '早期': [['zǎo'], ['qī']],
+    '早知': [['zǎo'], ['zhī']],
+    '早衰': [['zǎo'], ['shuāi']],
+    '早车': [['zǎo'], ['chē']],
+    '早间': [['zǎo'], ['jiān']],
+    '旱地': [['hàn'], ['dì']],
+    '时令': [['shí'], ['lìng']],
+    '时价': [['shí'], ['jià']],
+    '时会': [['shí'], ['huì']],
+    '时兴': [['shí'], ['xīng']],
+    '时分': [['shí'], ['fēn']],
+    '时区': [['shí'], ['qū']],
+    '时差': [['shí'], ['chà']],
+    '时期': [['shí'], ['qī']],
+    '时空': [['shí'], ['kōng']],
+    '时节': [['shí'], ['jié']],
+    '时行': [['shí'], ['háng']],
+    '时调': [['shí'], ['diào']],
+    '时长': [['shí'], ['cháng']],
+    '时间': [['shí'], ['jiān']],
+    '时鲜': [['shí'], ['xiān']],
+    '旺盛': [['wàng'], ['shèng']],
+    '昂藏': [['áng'], ['cáng']],
+    '昆曲': [['kūn'], ['qǔ']],
+    '昌乐': [['chāng'], ['lè']],
+    '昌盛': [['chāng'], ['shèng']],
+    '明丽': [['míng'], ['lì']],
+    '明了': [['míng'], ['liǎo']],
+    '明令': [['míng'], ['lìng']],
+    '明净': [['míng'], ['jìng']],
+    '明处': [['míng'], ['chù']],
+    '明度': [['míng'], ['dù']],
+    '明抢': [['míng'], ['qiǎng']],
+    '明教': [['míng'], ['jiào']],
+    '明朝': [['míng'], ['cháo']],
+    '明渠': [['míng'], ['qú']],
+    '明王': [['míng'], ['wáng']],
+    '明瓦': [['míng'], ['wǎ']],
+    '明知': [['míng'], ['zhī']],
+    '明说': [['míng'], ['shuō']],
+    '昏晕': [['hūn'], ['yūn']],
+    '易地': [['yì'], ['dì']],
+    '星体': [['xīng'], ['tǐ']],
+    '星占': [['xīng'], ['zhān']],
+    '星号': [['xīng'], ['hào']],
+    '星宿': [['xīng'], ['xiù']],
+    '星散': [['xīng'], ['sàn']],
+    '星斗': [['xīng'], ['dǒu']],
+    '星期': [['xīng'], ['qī']],
+    '星相': [['xīng'], ['xiàng']],
+    '星空': [['xīng'], ['kōng']],
+    '星系': [['xīng'], ['xì']],
+    '映射': [['yìng'], ['shè']],
+    '春上': [['chūn'], ['shàng']],
+    '春令': [['chūn'], ['lìng']],
+    '春假': [['chūn'], ['jià']],
+    '春分': [['chūn'], ['fēn']],
+    '春化': [['chūn'], ['huà']],
+    '春卷': [['chūn'], ['juǎn']],
+    '春景': [['chūn'], ['jǐng']],
+    '春种': [['chūn'], ['zhòng']],
+    '春节': [['chūn'], ['jié']],
+    '春雨': [['chūn'], ['yǔ']],
+    '春风': [['chūn'], ['fēng']],
+    '昭苏': [['zhāo'], ['sū']],
+    '昭著': [['zhāo'], ['zhù']],
+    '是否': [['shì'], ['fǒu']],
+    '昵称': [['nì'], ['chēng']],
+    '显得': [['xiǎn'], ['de']],
+    '显能': [['xiǎn'], ['néng']],
+    '显著': [['xiǎn'], ['zhù']],
+    '显要': [['xiǎn'], ['yào']],
+    '显见': [['xiǎn'], ['jiàn']],
+    '显豁': [['xiǎn'], ['huò']],
+    '显露': [['xiǎn'], ['lù']],
+    '晃动': [['huàng'], ['dòng']],
+    '晃悠': [['huàng'], ['yōu']],
+    '晃摇': [['huàng'], ['yáo']],
+    '晃晃': [['huàng'], ['huǎng']],
+    '晃眼': [['huǎng'], ['yǎn']],
+    '晃荡': [['huàng'], ['dàng']],
+    '晋见': [['jìn'], ['jiàn']],
+    '晒台': [['shài'], ['tái']],
+    '晒场': [['shài'], ['cháng']],
+    '晓得': [['xiǎo'], ['de']],
+    '晕倒': [['yūn'], ['dǎo']],
+    '晕厥': [['yūn'], ['jué']],
+    '晕场': [['yùn'], ['chǎng']],
+    '晕影': [['yùn'], ['yǐng']],
+    '晕池': [['yùn'], ['chí']],
+    '晕眩': [['yūn'], ['xuàn']],
+    '晕船': [['yùn'], ['chuán']],
+    '晕车': [['yùn'], ['chē']],
+    '晕针': [['yùn'], ['zhēn']],
+    '晕高': [['yùn'], ['gāo']],
+    '晤见': [['wù'], ['jiàn']],
+    '普度': [['pǔ'], ['dù']],
+    '普教': [['pǔ'], ['jiào']],
+    '普查': [['pǔ'], ['chá']],
+    '普降': [['pǔ'], ['jiàng']],
+    '景仰': [['jǐng'], ['yǎng']],
+    '景况': [['jǐng'], ['kuàng']],
+    '景区': [['jǐng'], ['qū']],
+    '景天': [['jǐng'], ['tiān']],
+    '景慕': [['jǐng'], ['mù']],
+    '景教': [['jǐng'], ['jiào']],
+    '景气': [['jǐng'], ['qì']],
+    '景深': [['jǐng'], ['shēn']],
+    '景点': [['jǐng'], ['diǎn']],
+    '景片': [['jǐng'], ['piàn']],
+    '景物': [['jǐng'], ['wù']],
+    '景致': [['jǐng'], ['zhì']],
+    '景色': [['jǐng'], ['sè']],
+    '景行': [['jǐng'], ['xíng']],
+    '景观': [['jǐng'], ['guān']],
+    '景象': [['jǐng'], ['xiàng']],
+    '景遇': [['jǐng'], ['yù']],
+    '晴和': [['qíng'], ['hé']],
+    '晴好': [['qíng'], ['hǎo']],
+    '晴空': [['qíng'], ['kōng']],
+    '晶体': [['jīng'], ['tǐ']],
+    '智囊': [['zhì'], ['náng']],
+    '智术': [['zhì'], ['shù']],
+    '晾台': [['liàng'], ['tái']],
+    '晾干': [['liàng'], ['gān']],
+    '暂行': [['zàn'], ['xíng']],
+    '暑假': [['shǔ'], ['jià']],
+    '暑期': [['shǔ'], ['qī']],
+    '暖和': [['nuǎn'], ['huo']],
+    '暖风': [['nuǎn'], ['fēng']],
+    '暗中': [['àn'], ['zhōng']],
+    '暗号': [['àn'], ['hào']],
+    '暗合': [['àn'], ['hé']],
+    '暗地': [['àn'], ['dì']],
+    '暗场': [['àn'], ['chǎng']],
+    '暗处': [['àn'], ['chù']],
+    '暗藏': [['àn'], ['cáng']],
+    '暗语': [['àn'], ['yǔ']],
+    '暗转': [['àn'], ['zhuǎn']],
+    '暮景': [['mù'], ['jǐng']],
+    '暴乱': [['bào'], ['luàn']],
+    '暴光': [['bào'], ['guāng']],
+    '暴利': [['bào'], ['lì']],
+    '暴力': [['bào'], ['lì']],
+    '暴动': [['bào'], ['dòng']],
+    '暴卒': [['bào'], ['zú']],
+    '暴发': [['bào'], ['fā']],
+    '暴吏': [['bào'], ['lì']],
+    '暴君': [['bào'], ['jūn']],
+    '暴客': [['bào'], ['kè']],
+    '暴富': [['bào'], ['fù']],
+    '暴尸': [['bào'], ['shī']],
+    '暴徒': [['bào'], ['tú']],
+    '暴怒': [['bào'], ['nù']],
+    '暴戾': [['bào'], ['lì']],
+    '暴政': [['bào'], ['zhèng']],
+    '暴敛': [['bào'], ['liǎn']],
+    '暴晒': [['pù'], ['shài']],
+    '暴死': [['bào'], ['sǐ']],
+    '暴毙': [['bào'], ['bì']],
+    '暴民': [['bào'], ['mín']],
+    '暴涨': [['bào'], ['zhǎng']],
+    '暴烈': [['bào'], ['liè']],
+    '暴病': [['bào'], ['bìng']],
+    '暴突': [['bào'], ['tū']],
+    '暴虐': [['bào'], ['nüè']],
+    '暴行': [['bào'], ['xíng']],
+    '暴跌': [['bào'], ['diē']],
+    '暴跳': [['bào'], ['tiào']],
+    '暴躁': [['bào'], ['zào']],
+    '暴雨': [['bào'], ['yǔ']],
+    '暴露': [['bào'], ['lù']],
+    '暴风': [['bào'], ['fēng']],
+    '曝光': [['bào'], ['guāng']],
+    '曝晒': [['pù'], ['shài']],
+    '曝露': [['pù'], ['lù']],
+    '曲剧': [['qǔ'], ['jù']],
+    '曲子': [['qǔ'], ['zi']],
+    '曲尺': [['qū'], ['chǐ']],
+    '曲度': [['qǔ'], ['dù']],
+    '曲张': [['qǔ'], ['zhāng']],
+    '曲径': [['qū'], ['jìng']],
+    '曲折': [['qū'], ['zhé']],
+    '曲曲': [['qū'], ['qū']],
+    '曲柄': [['qū'], ['bǐng']],
+    '曲水': [['qǔ'], ['shuǐ']],
+    '曲江': [['qǔ'], ['jiāng']],
+    '曲池': [['qǔ'], ['chí']],
+    '曲泉': [['qǔ'], ['quán']],
+    '曲泽': [['qǔ'], ['zé']],
+    '曲牌': [['qǔ'], ['pái']],
+    '曲率': [['qǔ'], ['lǜ']],
+    '曲目': [['qǔ'], ['mù']],
+    '曲直': [['qū'], ['zhí']],
+    '曲笔': [['qū'], ['bǐ']],
+    '曲线': [['qū'], ['xiàn']],
+    '曲艺': [['qǔ'], ['yì']],
+    '曲蟮': [['qǔ'], ['shàn']],
+    '曲解': [['qū'], ['jiě']],
+    '曲调': [['qǔ'], ['diào']],
+    '曲谱': [['qǔ'], ['pǔ']],
+    '曲阜': [['qū'], ['fù']],
+    '曲面': [['qǔ'], ['miàn']],
+    '更为': [['gèng'], ['wéi']],
+    '更事': [['gēng'], ['shì']],
+    '更其': [['gèng'], ['qí']],
+    '更加': [['gèng'], ['jiā']],
+    '更动': [['gēng'], ['dòng']],
+    '更卒': [['gēng'], ['zú']],
+    '更名': [['gēng'], ['míng']],
+    '更夫': [['gēng'], ['fū']],
+    '更始': [['gēng'], ['shǐ']],
+    '更定': [['gēng'], ['dìng']],
+    '更张': [['gēng'], ['zhāng']],
+    '更换': [['gēng'], ['huàn']],
+    '更改': [['gēng'], ['gǎi']],
+    '更新': [['gēng'], ['xīn']],
+    '更易': [['gēng'], ['yì']],
+    '更替': [['gēng'], ['tì']],
+    '更次': [['gēng'], ['cì']],
+    '更正': [['gēng'], ['zhèng']],
+    '更深': [['gēng'], ['shēn']],
+    '更生': [['gēng'], ['shēng']],
+    '更番': [['gēng'], ['fān']],
+    '更衣': [['gēng'], ['yī']],
+    '更迭': [['gēng'], ['dié']],
+    '更鼓': [['gēng'], ['gǔ']],
+    '曾孙': [['zēng'], ['sūn']],
+    '曾祖': [['zēng'], ['zǔ']],
+    '曾经': [['céng'], ['jīng']],
+    '月中': [['yuè'], ['zhōng']],
+    '月令': [['yuè'], ['lìng']],
+    '月份': [['yuè'], ['fèn']],
+    '月华': [['yuè'], ['huá']],
+    '月台': [['yuè'], ['tái']],
+    '月尾': [['yuè'], ['wěi']],
+    '月底': [['yuè'], ['dǐ']],
+    '月度': [['yuè'], ['dù']],
+    '月晕': [['yuè'], ['yùn']],
+    '月氏': [['yuè'], ['zhī']],
+    '月相': [['yuè'], ['xiàng']],
+    '月石': [['yuè'], ['shí']],
+    '月票': [['yuè'], ['piào']],
+    '月食': [['yuè'], ['shí']],
+    '有为': [['yǒu'], ['wéi']],
+    '有事': [['yǒu'], ['shì']],
+    '有些': [['yǒu'], ['xiē']],
+    '有人': [['yǒu'], ['rén']],
+    '有余': [['yǒu'], ['yú']],
+    '有偿': [['yǒu'], ['cháng']],
+    '有关': [['yǒu'], ['guān']],
+    '有利': [['yǒu'], ['lì']],
+    '有力': [['yǒu'], ['lì']],
+    '有功': [['yǒu'], ['gōng']],
+    '有劲': [['yǒu'], ['jìn']],
+    '有劳': [['yǒu'], ['láo']],
+    '有司': [['yǒu'], ['sī']],
+    '有名': [['yǒu'], ['míng']],
+    '有味': [['yǒu'], ['wèi']],
+    '有喜': [['yǒu'], ['xǐ']],
+    '有声': [['yǒu'], ['shēng']],
+    '有如': [['yǒu'], ['rú']],
+    '有害': [['yǒu'], ['hài']],
+    '有年': [['yǒu'], ['nián']],
+    '有幸': [['yǒu'], ['xìng']],
+    '有序': [['yǒu'], ['xù']],
+    '有底': [['yǒu'], ['dǐ']],
+    '有形': [['yǒu'], ['xíng']],
+    '有待': [['yǒu'], ['dài']],
+    '有得': [['yǒu'], ['de']],
+    '有德': [['yǒu'], ['dé']],
+    '有心': [['yǒu'], ['xīn']],
+    '有志': [['yǒu'], ['zhì']],
+    '有性': [['yǒu'], ['xìng']],
+    '有恒': [['yǒu'], ['héng']],
+    '有情': [['yǒu'], ['qíng']],
+    '有意': [['yǒu'], ['yì']],
+    '有感': [['yǒu'], ['gǎn']],
+    '有戏': [['yǒu'], ['xì']],
+    '有成': [['yǒu'], ['chéng']],
+    '有效': [['yǒu'], ['xiào']],
+    '有救': [['yǒu'], ['jiù']],
+    '有数': [['yǒu'], ['shù']],
+    '有方': [['yǒu'], ['fāng']],
+    '有无': [['yǒu'], ['wú']],
+    '有旧': [['yǒu'], ['jiù']],
+    '有时': [['yǒu'], ['shí']],
+    '有望': [['yǒu'], ['wàng']],
+    '有机': [['yǒu'], ['jī']],
+    '有染': [['yǒu'], ['rǎn']],
+    '有气': [['yǒu'], ['qì']],
+    '有点': [['yǒu'], ['diǎn']],
+    '有理': [['yǒu'], ['lǐ']],
+    '有生': [['yǒu'], ['shēng']],
+    '有用': [['yǒu'], ['yòng']],
+    '有的': [['yǒu'], ['de']],
+    '有益': [['yǒu'], ['yì']],
+    '有着': [['yǒu'], ['zhe']],
+    '有神': [['yǒu'], ['shén']],
+    '有种': [['yǒu'], ['zhǒng']],
+    '有穷': [['yǒu'], ['qióng']],
+    '有空': [['yǒu'], ['kòng']],
+    '有缘': [['yǒu'], ['yuán']],
+    '有罪': [['yǒu'], ['zuì']],
+    '有脸': [['yǒu'], ['liǎn']],
+    '有致': [['yǒu'], ['zhì']],
+    '有色': [['yǒu'], ['sè']],
+    '有节': [['yǒu'], ['jié']],
+    '有若': [['yǒu'], ['ruò']],
+    '有言': [['yǒu'], ['yán']],
+    '有识': [['yǒu'], ['shí']],
+    '有请': [['yǒu'], ['qǐng']],
+    '有赖': [['yǒu'], ['lài']],
+    '有趣': [['yǒu'], ['qù']],
+    '有道': [['yǒu'], ['dào']],
+    '有钱': [['yǒu'], ['qián']],
+    '有闲': [['yǒu'], ['xián']],
+    '有限': [['yǒu'], ['xiàn']],
+    '有零': [['yǒu'], ['líng']],
+    '有顷': [['yǒu'], ['qǐng']],
+    '有鬼': [['yǒu'], ['guǐ']],
+    '服丧': [['fú'], ['sāng']],
+    '服从': [['fú'], ['cóng']],
+    '服众': [['fú'], ['zhòng']],
+    '服侍': [['fú'], ['shì']],
+    '服刑': [['fú'], ['xíng']],
+    '服务': [['fú'], ['wù']],
+    '服勤': [['fú'], ['qín']],
+    '服帖': [['fú'], ['tiē']],
+    '服式': [['fú'], ['shì']],
+    '服役': [['fú'], ['yì']],
+    '服毒': [['fú'], ['dú']],
+    '服气': [['fú'], ['qì']],
+    '服法': [['fú'], ['fǎ']],
+    '服满': [['fú'], ['mǎn']],
+    '服用': [['fú'], ['yòng']],
+    '服罪': [['fú'], ['zuì']],
+    '服老': [['fú'], ['lǎo']],
+    '服膺': [['fú'], ['yīng']],
+    '服色': [['fú'], ['sè']],
+    '服药': [['fú'], ['yào']],
+    '服装': [['fú'], ['zhuāng']],
+    '服贴': [['fú'], ['tiē']],
+    '服软': [['fú'], ['ruǎn']],
+    '服输': [['fú'], ['shū']],
+    '服饰': [['fú'], ['shì']],
+    '朗读': [['lǎng'], ['dú']],
+    '朝上': [['cháo'], ['shàng']],
+    '朝代': [['cháo'], ['dài']],
+    '朝会': [['zhāo'], ['huì']],
+    '朝向': [['cháo'], ['xiàng']],
+    '朝圣': [['cháo'], ['shèng']],
+    '朝夕': [['zhāo'], ['xī']],
+    '朝天': [['cháo'], ['tiān']],
+    '朝廷': [['cháo'], ['tíng']],
+    '朝拜': [['cháo'], ['bài']],
+    '朝政': [['cháo'], ['zhèng']],
+    '朝日': [['cháo'], ['rì']],
+    '朝晖': [['zhāo'], ['huī']],
+    '朝暮': [['zhāo'], ['mù']],
+    '朝服': [['cháo'], ['fú']],
+    '朝气': [['zhāo'], ['qì']],
+    '朝着': [['cháo'], ['zhe']],
+    '朝纲': [['cháo'], ['gāng']],
+    '朝臣': [['cháo'], ['chén']],
+    '朝见': [['cháo'], ['jiàn']],
+    '朝觐': [['cháo'], ['jìn']],
+    '朝贡': [['cháo'], ['gòng']],
+    '朝野': [['cháo'], ['yě']],
+    '朝阳': [['zhāo', 'cháo'], ['yáng']],
+    '朝霞': [['zhāo'], ['xiá']],
+    '朝露': [['zhāo'], ['lù']],
+    '期中': [['qī'], ['zhōng']],
+    '期冀': [['qī'], ['jì']],
+    '期刊': [['qī'], ['kān']],
+    '期年': [['jī'], ['nián']],
+    '期待': [['qī'], ['dài']],
+    '期数': [['qī'], ['shù']],
+    '期望': [['qī'], ['wàng']],
+    '期期': [['qī'], ['qī']],
+    '期末': [['qī'], ['mò']],
+    '期权': [['qī'], ['quán']],
+    '期求': [['qī'], ['qiú']],
+    '期满': [['qī'], ['mǎn']],
+    '期盼': [['qī'], ['pàn']],
+    '期票': [['qī'], ['piào']],
+    '期考': [['qī'], ['kǎo']],
+    '期许': [['qī'], ['xǔ']],
+    '期货': [['qī'], ['huò']],
+    '期门': [['qī'], ['mén']],
+    '期间': [['qī'], ['jiān']],
+    '期限': [['qī'], ['xiàn']],
+    '木塞': [['mù'], ['sāi']],
+    '木头': [['mù'], ['tou']],
+    '木尺': [['mù'], ['chǐ']],
+    '木排': [['mù'], ['pái']],
+    '木杆': [['mù'], ['gǎn']],
+    '木杠': [['mù'], ['gàng']],
+    '木栅': [['mù'], ['shān']],
+    '木棍': [['mù'], ['gùn']],
+    '木模': [['mù'], ['mú']],
+    '木瓦': [['mù'], ['wǎ']],
+    '木笼': [['mù'], ['lóng']],
+    '木钻': [['mù'], ['zuàn']],
+    '未了': [['wèi'], ['liǎo']],
+    '未便': [['wèi'], ['biàn']],
+    '未几': [['wèi'], ['jǐ']],
+    '未卜': [['wèi'], ['bǔ']],
+    '未可': [['wèi'], ['kě']],
+    '未曾': [['wèi'], ['céng']],
+    '未有': [['wèi'], ['yǒu']],
+    '末了': [['mò'], ['liǎo']],
+    '末叶': [['mò'], ['yè']],
+    '末尾': [['mò'], ['wěi']],
+    '末期': [['mò'], ['qī']],
+    '末梢': [['mò'], ['shāo']],
+    '末节': [['mò'], ['jié']],
+    '本体': [['běn'], ['tǐ']],
+    '本分': [['běn'], ['fèn']],
+    '本县': [['běn'], ['xiàn']],
+    '本地': [['běn'], ['dì']],
+    '本家': [['běn'], ['jiā']],
+    '本底': [['běn'], ['dǐ']],
+    '本戏': [['běn'], ['xì']],
+    '本条': [['běn'], ['tiáo']],
+    '本相': [['běn'], ['xiàng']],
+    '本着': [['běn'], ['zhe']],
+    '本票': [['běn'], ['piào']],
+    '本纪': [['běn'], ['jì']],
+    '本能': [['běn'], ['néng']],
+    '本行': [['běn'], ['háng']],
+    '术业': [['shù'], ['yè']],
+    '术士': [['shù'], ['shì']],
+    '术科': [['shù'], ['kē']],
+    '术语': [['shù'], ['yǔ']],
+    '朱墨': [['zhū'], ['mò']],
+    '朱批': [['zhū'], ['pī']],
+    '朱文': [['zhū'], ['wén']],
+    '朱槿': [['zhū'], ['jǐn']],
+    '朱漆': [['zhū'], ['qī']],
+    '朱熹': [['zhū'], ['xī']],
+    '朱砂': [['zhū'], ['shā']],
+    '朱笔': [['zhū'], ['bǐ']],
+    '朱红': [['zhū'], ['hóng']],
+    '朱诺': [['zhū'], ['nuò']],
+    '朱门': [['zhū'], ['mén']],
+    '朱雀': [['zhū'], ['què']],
+    '朴刀': [['pō'], ['dāo']],
+    '朴厚': [['pǔ'], ['hòu']],
+    '朴学': [['pǔ'], ['xué']],
+    '朴实': [['pǔ'], ['shí']],
+    '朴拙': [['pǔ'], ['zhuō']],
+    '朴直': [['pǔ'], ['zhí']],
+    '朴硝': [['pò'], ['xiāo']],
+    '朴素': [['pǔ'], ['sù']],
+    '朴茂': [['pǔ'], ['mào']],
+    '朴质': [['pǔ'], ['zhì']],
+    '朴陋': [['pǔ'], ['lòu']],
+    '机会': [['jī'], ['huì']],
+    '机体': [['jī'], ['tǐ']],
+    '机化': [['jī'], ['huà']],
+    '机场': [['jī'], ['chǎng']],
+    '机织': [['jī'], ['zhī']],
+    '机能': [['jī'], ['néng']],
+    '机要': [['jī'], ['yào']],
+    '机车': [['jī'], ['chē']],
+    '机轴': [['jī'], ['zhóu']],
+    '机长': [['jī'], ['zhǎng']],
+    '机降': [['jī'], ['jiàng']],
+    '朽坏': [['xiǔ'], ['huài']],
+    '杀价': [['shā'], ['jià']],
+    '杀头': [['shā'], ['tóu']],
+    '杀毒': [['shā'], ['dú']],
+    '杀菌': [['shā'], ['jūn']],
+    '杂处': [['zá'], ['chǔ']],
+    '杂家': [['zá'], ['jiā']],
+    '杂差': [['zá'], ['chà']],
+    '杂拌': [['zá'], ['bàn']],
+    '杂沓': [['zá'], ['tà']],
+    '杂症': [['zá'], ['zhèng']],
+    '杂种': [['zá'], ['zhǒng']],
+    '杂说': [['zá'], ['shuō']],
+    '杂食': [['zá'], ['shí']],
+    '权且': [['quán'], ['qiě']],
+    '权数': [['quán'], ['shù']],
+    '权术': [['quán'], ['shù']],
+    '权能': [['quán'], ['néng']],
+    '权重': [['quán'], ['zhòng']],
+    '杆塔': [['gǎn'], ['tǎ']],
+    '杆子': [['gān'], ['zi']],
+    '杆秤': [['gǎn'], ['chèng']],
+    '杆菌': [['gǎn'], ['jūn']],
+    '杈子': [['chā'], ['zǐ']],
+    '杉木': [['shā'], ['mù']],
+    '李子': [['lǐ'], ['zi']],
+    '杏红': [['xìng'], ['hóng']],
+    '村上': [['cūn'], ['shàng']],
+    '村夫': [['cūn'], ['fū']],
+    '村头': [['cūn'], ['tóu']],
+    '村舍': [['cūn'], ['shè']],
+    '村落': [['cūn'], ['luò']],
+    '村长': [['cūn'], ['zhǎng']],
+    '束发': [['shù'], ['fà']],
+    '杠夫': [['gàng'], ['fū']],
+    '杠头': [['gàng'], ['tóu']],
+    '杠子': [['gàng'], ['zi']],
+    '杠杆': [['gàng'], ['gǎn']],
+    '杠杠': [['gàng'], ['gàng']],
+    '杠铃': [['gàng'], ['líng']],
+    '条令': [['tiáo'], ['lìng']],
+    '条件': [['tiáo'], ['jiàn']],
+    '条例': [['tiáo'], ['lì']],
+    '条几': [['tiáo'], ['jī']],
+    '条子': [['tiáo'], ['zi']],
+    '条幅': [['tiáo'], ['fú']],
+    '条干': [['tiáo'], ['gàn']],
+    '条播': [['tiáo'], ['bō']],
+    '条款': [['tiáo'], ['kuǎn']],
+    '条痕': [['tiáo'], ['hén']],
+    '条石': [['tiáo'], ['shí']],
+    '条约': [['tiáo'], ['yuē']],
+    '条纹': [['tiáo'], ['wén']],
+    '来信': [['lái'], ['xìn']],
+    '来劲': [['lái'], ['jìn']],
+    '来头': [['lái'], ['tou']],
+    '来得': [['lái'], ['de']],
+    '来着': [['lái'], ['zhe']],
+    '杯子': [['bēi'], ['zi']],
+    '松劲': [['sōng'], ['jìn']],
+    '松叶': [['sōng'], ['yè']],
+    '松散': [['sōng'], ['sǎn']],
+    '松柏': [['sōng'], ['bǎi']],
+    '松节': [['sōng'], ['jié']],
+    '板刷': [['bǎn'], ['shuā']],
+    '板子': [['bǎn'], ['zi']],
+    '板正': [['bǎn'], ['zhèng']],
+    '板结': [['bǎn'], ['jié']],
+    '板车': [['bǎn'], ['chē']],
+    '板铺': [['bǎn'], ['pù']],
+    '极为': [['jí'], ['wéi']],
+    '极乐': [['jí'], ['lè']],
+    '极其': [['jí'], ['qí']],
+    '极化': [['jí'], ['huà']],
+    '极圈': [['jí'], ['quān']],
+    '极地': [['jí'], ['dì']],
+    '极大': [['jí'], ['dà']],
+    '极好': [['jí'], ['hǎo']],
+    '极度': [['jí'], ['dù']],
+    '极恶': [['jí'], ['è']],
+    '极盛': [['jí'], ['shèng']],
+    '极量': [['jí'], ['liàng']],
+    '构思': [['gòu'], ['sī']],
+    '构筑': [['gòu'], ['zhù']],
+    '析疑': [['xī'], ['yí']],
+    '枕头': [['zhěn'], ['tou']],
+    '枕藉': [['zhěn'], ['jiè']],
+    '枕骨': [['zhěn'], ['gǔ']],
+    '林冠': [['lín'], ['guān']],
+    '林区': [['lín'], ['qū']],
+    '林地': [['lín'], ['dì']],
+    '林场': [['lín'], ['chǎng']],
+    '林甸': [['lín'], ['diàn']],
+    '果干': [['guǒ'], ['gàn']],
+    '果枝': [['guǒ'], ['zhī']],
+    '果核': [['guǒ'], ['hé']],
+    '枝丫': [['zhī'], ['yā']],
+    '枝叶': [['zhī'], ['yè']],
+    '枝头': [['zhī'], ['tóu']],
+    '枝子': [['zhī'], ['zǐ']],
+    '枝干': [['zhī'], ['gàn']],
+    '枝接': [['zhī'], ['jiē']],
+    '枝杈': [['zhī'], ['chà']],
+    '枝条': [['zhī'], ['tiáo']],
+    '枝柯': [['zhī'], ['kē']],
+    '枝梢': [['zhī'], ['shāo']],
+    '枝梧': [['zhī'], ['wú']],
+    '枝节': [['zhī'], ['jié']],
+    '枝蔓': [['zhī'], ['wàn']],
+    '枞树': [['cōng'], ['shù']],
+    '枞阳': [['zōng'], ['yáng']],
+    '枢要': [['shū'], ['yào']],
+    '枢轴': [['shū'], ['zhóu']],
+    '枣子': [['zǎo'], ['zi']],
+    '枣核': [['zǎo'], ['hé']],
+    '枣泥': [['zǎo'], ['ní']],
+    '枣红': [['zǎo'], ['hóng']],
+    '枪刺': [['qiāng'], ['cì']],
+    '枪弹': [['qiāng'], ['dàn']],
+    '枪术': [['qiāng'], ['shù']],
+    '枪杆': [['qiāng'], ['gǎn']],
+    '枪枝': [['qiāng'], ['zhī']],
+    '枪炮': [['qiāng'], ['pào']],
+    '枫叶': [['fēng'], ['yè']],
+    '枭将': [['xiāo'], ['jiāng']],
+    '枯叶': [['kū'], ['yè']],
+    '枯干': [['kū'], ['gān']],
+    '枯枝': [['kū'], ['zhī']],
+    '枯骨': [['kū'], ['gǔ']],
+    '枳壳': [['zhǐ'], ['ké']],
+    '架子': [['jià'], ['zi']],
+    '架空': [['jià'], ['kōng']],
+    '枸杞': [['gǒu'], ['qǐ']],
+    '枸橘': [['gōu'], ['jú']],
+    '枸橼': [['jǔ'], ['yuán']],
+    '柏乡': [['bǎi'], ['xiāng']],
+    '柏林': [['bó'], ['lín']],
+    '柏油': [['bǎi'], ['yóu']],
+    '某个': [['mǒu'], ['gè']],
+    '某些': [['mǒu'], ['xiē']],
+    '某地': [['mǒu'], ['dì']],
+    '染坊': [['rǎn'], ['fáng']],
+    '染毒': [['rǎn'], ['dú']],
+    '柔化': [['róu'], ['huà']],
+    '柔和': [['róu'], ['hé']],
+    '柔术': [['róu'], ['shù']],
+    '柚子': [['yòu'], ['zi']],
+    '柚木': [['yóu'], ['mù']],
+    '柜上': [['guì'], ['shàng']],
+    '柜台': [['guì'], ['tái']],
+    '柜子': [['guì'], ['zi']],
+    '柜房': [['guì'], ['fáng']],
+    '柜橱': [['guì'], ['chú']],
+    '柞水': [['zhà'], ['shuǐ']],
+    '柞绸': [['zuò'], ['chóu']],
+    '柞蚕': [['zuò'], ['cán']],
+    '查办': [['chá'], ['bàn']],
+    '查勘': [['chá'], ['kān']],
+    '查勤': [['chá'], ['qín']],
+    '查哨': [['chá'], ['shào']],
+    '查处': [['chá'], ['chǔ']],
+    '查夜': [['chá'], ['yè']],
+    '查实': [['chá'], ['shí']],
+    '查对': [['chá'], ['duì']],
+    '查封': [['chá'], ['fēng']],
+    '查岗': [['chá'], ['gǎng']],
+    '查帐': [['chá'], ['zhàng']],
+    '查房': [['chá'], ['fáng']],
+    '查扣': [['chá'], ['kòu']],
+    '查找': [['chá'], ['zhǎo']],
+    '查抄': [['chá'], ['chāo']],
+    '查收': [['chá'], ['shōu']],
+    '查明': [['chá'], ['míng']],
+    '查查': [['zhā'], ['zhā']],
+    '查核': [['chá'], ['hé']],
+    '查案': [['chá'], ['àn']],
+    '查检': [['chá'], ['jiǎn']],
+    '查清': [['chá'], ['qīng']],
+    '查点': [['chá'], ['diǎn']],
+    '查照': [['chá'], ['zhào']],
+    '查看': [['chá'], ['kàn']],
+    '查禁': [['chá'], ['jìn']],
+    '查私': [['chá'], ['sī']],
+    '查究': [['chá'], ['jiū']],
+    '查缉': [['chá'], ['jī']],
+    '查考': [['chá'], ['kǎo']],
+    '查获': [['chá'], ['huò']],
+    '查访': [['chá'], ['fǎng']],
+    '查证': [['chá'], ['zhèng']],
+    '查询': [['chá'], ['xún']],
+    '查账': [['chá'], ['zhàng']],
+    '查铺': [['chá'], ['pù']],
+    '查问': [['chá'], ['wèn']],
+    '查阅': [['chá'], ['yuè']],
+    '查验': [['chá'], ['yàn']],
+    '柩车': [['jiù'], ['chē']],
+    '柬帖': [['jiǎn'], ['tiě']],
+    '柱石': [['zhù'], ['shí']],
+    '柳体': [['liǔ'], ['tǐ']],
+    '柳叶': [['liǔ'], ['yè']],
+    '柳巷': [['liǔ'], ['xiàng']],
+    '柳枝': [['liǔ'], ['zhī']],
+    '柳梢': [['liǔ'], ['shāo']],
+    '柳荫': [['liǔ'], ['yīn']],
+    '柴垛': [['chái'], ['duǒ']],
+    '柿子': [['shì'], ['zi']],
+    '栅子': [['zhà'], ['zǐ']],
+    '栅极': [['shān'], ['jí']],
+    '栅栏': [['zhà'], ['lán']],
+    '栅门': [['zhà'], ['mén']],
+    '标价': [['biāo'], ['jià']],
+    '标号': [['biāo'], ['hào']],
+    '标尺': [['biāo'], ['chǐ']],
+    '标底': [['biāo'], ['dǐ']],
+    '标度': [['biāo'], ['dù']],
+    '标杆': [['biāo'], ['gān']],
+    '标榜': [['biāo'], ['bǎng']],
+    '标的': [['biāo'], ['dì']],
+    '标称': [['biāo'], ['chēng']],
+    '标识': [['biāo'], ['zhì']],
+    '标语': [['biāo'], ['yǔ']],
+    '标量': [['biāo'], ['liàng']],
+    '栎木': [['lì'], ['mù']],
+    '栎树': [['lì'], ['shù']],
+    '栏干': [['lán'], ['gān']],
+    '栏杆': [['lán'], ['gān']],
+    '栏柜': [['lán'], ['guì']],
+    '栏栅': [['lán'], ['shān']],
+    '树冠': [['shù'], ['guān']],
+    '树叶': [['shù'], ['yè']],
+    '树干': [['shù'], ['gàn']],
+    '树杈': [['shù'], ['chà']],
+    '树枝': [['shù'], ['zhī']],
+    '树梢': [['shù'], ['shāo']],
+    '树种': [['shù'], ['zhǒng']],
+    '树荫': [['shù'], ['yīn']],
+    '栓塞': [['shuān'], ['sè']],
+    '栖居': [['qī'], ['jū']],
+    '栖息': [['qī'], ['xī']],
+    '栖栖': [['xī'], ['xī']],
+    '栖止': [['qī'], ['zhǐ']],
+    '栖身': [['qī'], ['shēn']],
+    '栖霞': [['qī'], ['xiá']],
+    '栗子': [['lì'], ['zi']],
+    '栗暴': [['lì'], ['bào']],
+    '校准': [['jiào'], ['zhǔn']],
+    '校刊': [['xiào'], ['kān']],
+    '校务': [['xiào'], ['wù']],
+    '校勘': [['jiào'], ['kān']],
+    '校医': [['xiào'], ['yī']],
+    '校友': [['xiào'], ['yǒu']],
+    '校园': [['xiào'], ['yuán']],
+    '校场': [['jiào'], ['chǎng']],
+    '校址': [['xiào'], ['zhǐ']],
+    '校官': [['xiào'], ['guān']],
+    '校对': [['jiào'], ['duì']],
+    '校尉': [['xiào'], ['wèi']],
+    '校工': [['xiào'], ['gōng']],
+    '校庆': [['xiào'], ['qìng']],
+    '校徽': [['xiào'], ['huī']],
+    '校改': [['jiào'], ['gǎi']],
+    '校旗': [['xiào'], ['qí']],
+    '校服': [['xiào'], ['fú']],
+    '校本': [['xiào'], ['běn']],
+    '校样': [['jiào'], ['yàng']],
+    '校核': [['jiào'], ['hé']],
+    '校歌': [['xiào'], ['gē']],
+    '校正': [['jiào'], ['zhèng']],
+    '校注': [['jiào'], ['zhù']],
+    '校点': [['jiào'], ['diǎn']],
+    '校舍': [['xiào'], ['shè']],
+    '校花': [['xiào'], ['huā']],
+    '校规': [['xiào'], ['guī']],
+    '校订': [['jiào'], ['dìng']],
+    '校训': [['xiào'], ['xùn']],
+    '校长': [['xiào'], ['zhǎng']],
+    '校阅': [['jiào'], ['yuè']],
+    '校风': [['xiào'], ['fēng']],
+    '校验': [['jiào'], ['yàn']],
+    '样片': [['yàng'], ['piàn']],
+    '核仁': [['hé'], ['rén']],
+    '核儿': [['hú'], ['ér']],
+    '核准': [['hé'], ['zhǔn']],
+    '核减': [['hé'], ['jiǎn']],
+    '核子': [['hé'], ['zǐ']],
+    '核定': [['hé'], ['dìng']],
+    '核实': [['hé'], ['shí']],
+    '核对': [['hé'], ['duì']],
+    '核弹': [['hé'], ['dàn']],
+    '核心': [['hé'], ['xīn']],
+    '核果': [['hé'], ['guǒ']],
+    '核查': [['hé'], ['chá']],
+    '核桃': [['hé'], ['táo']],
+    '核算': [['hé'], ['suàn']],
+    '核能': [['hé'], ['néng']],
+    '核膜': [['hé'], ['mó']],
+    '核计': [['hé'], ['jì']],
+    '核资': [['hé'], ['zī']],
+    '核酸': [['hé'], ['suān']],
+    '核销': [['hé'], ['xiāo']],
+    '核验': [['hé'], ['yàn']],
+    '根号': [['gēn'], ['hào']],
+    '根底': [['gēn'], ['dǐ']],
+    '根据': [['gēn'], ['jù']],
+    '根系': [['gēn'], ['xì']],
+    '格斗': [['gé'], ['dòu']],
+    '格调': [['gé'], ['diào']],
+    '栽倒': [['zāi'], ['dǎo']],
+    '栽种': [['zāi'], ['zhòng']],
+    '桁架': [['héng'], ['jià']],
+    '桂冠': [['guì'], ['guān']],
+    '桂枝': [['guì'], ['zhī']],
+    '桃核': [['táo'], ['hé']],
+    '桃红': [['táo'], ['hóng']],
+    '桄榔': [['guāng'], ['láng']],
+    '桅杆': [['wéi'], ['gān']],
+    '案卷': [['àn'], ['juàn']],
+    '案子': [['àn'], ['zi']],
+    '桌子': [['zhuō'], ['zi']],
+    '桑叶': [['sāng'], ['yè']],
+    '桑椹': [['sāng'], ['shèn']],
+    '桑葚': [['sāng'], ['shèn']],
+    '桔梗': [['jié'], ['gěng']],
+    '桔槔': [['jié'], ['gāo']],
+    '桠杈': [['yā'], ['chà']],
+    '桠枝': [['yā'], ['zhī']],
+    '桡骨': [['ráo'], ['gǔ']],
+    '桥台': [['qiáo'], ['tái']],
+    '桥头': [['qiáo'], ['tóu']],
+    '桨叶': [['jiǎng'], ['yè']],
+    '梅雨': [['méi'], ['yǔ']],
+    '梆子': [['bāng'], ['zi']],
+    '梗塞': [['gěng'], ['sè']],
+    '梯子': [['tī'], ['zi']],
+    '梳子': [['shū'], ['zi']],
+    '梵刹': [['fàn'], ['chà']],
+    '梵呗': [['fàn'], ['bài']],
+    '梼杌': [['táo'], ['wù']],
+    '棉被': [['mián'], ['bèi']],
+    '棍子': [['gùn'], ['zi']],
+    '棍棒': [['gùn'], ['bàng']],
+    '棒喝': [['bàng'], ['hè']],
+    '棒头': [['bàng'], ['tóu']],
+    '棘刺': [['jí'], ['cì']],
+    '棚圈': [['péng'], ['juàn']],
+    '棚车': [['péng'], ['chē']],
+    '棠棣': [['táng'], ['dì']],
+    '棣棠': [['dì'], ['táng']],
+    '棱柱': [['léng'], ['zhù']],
+    '棱线': [['léng'], ['xiàn']],
+    '棱角': [['léng'], ['jiǎo']],
+    '棱锥': [['léng'], ['zhuī']],
+    '棱镜': [['léng'], ['jìng']],
+    '椅子': [['yǐ'], ['zi']],
+    '椰子': [['yē'], ['zi']],
+    '楔子': [['xiē'], ['zi']],
+    '楚王': [['chǔ'], ['wáng']],
+    '楞伽': [['léng'], ['jiā']],
+    '楞场': [['léng'], ['chǎng']],
+    '楦头': [['xuàn'], ['tóu']],
+    '楷书': [['kǎi'], ['shū']],
+    '楷体': [['kǎi'], ['tǐ']],
+    '楷模': [['kǎi'], ['mó']],
+    '楼上': [['lóu'], ['shàng']],
+    '楼台': [['lóu'], ['tái']],
+    '楼观': [['lóu'], ['guàn']],
+    '概括': [['gài'], ['kuò']],
+    '概数': [['gài'], ['shù']],
+    '概率': [['gài'], ['lǜ']],
+    '概要': [['gài'], ['yào']],
+    '概观': [['gài'], ['guān']],
+    '概论': [['gài'], ['lùn']],
+    '榆中': [['yú'], ['zhōng']],
+    '榔头': [['láng'], ['tou']],
+    '榜书': [['bǎng'], ['shū']],
+    '榜文': [['bǎng'], ['wén']],
+    '榜样': [['bǎng'], ['yàng']],
+    '榜眼': [['bǎng'], ['yǎn']],
+    '榜额': [['bǎng'], ['é']],
+    '榜首': [['bǎng'], ['shǒu']],
+    '榫头': [['sǔn'], ['tóu']],
+    '榫子': [['sǔn'], ['zi']],
+    '榴弹': [['liú'], ['dàn']],
+    '榾柮': [['gǔ'], ['duò']],
+    '槟子': [['bīn'], ['zǐ']],
+    '槟榔': [['bīng'], ['láng']],
+    '槽坊': [['cáo'], ['fāng']],
+    '槽头': [['cáo'], ['tóu']],
+    '槽车': [['cáo'], ['chē']],
+    '槽钢': [['cáo'], ['gāng']],
+    '樊笼': [['fán'], ['lóng']],
+    '模仿': [['mó'], ['fǎng']],
+    '模具': [['mú'], ['jù']],
+    '模印': [['mó'], ['yìn']],
+    '模型': [['mó'], ['xíng']],
+    '模子': [['mú'], ['zǐ']],
+    '模式': [['mó'], ['shì']],
+    '模拟': [['mó'], ['nǐ']],
+    '模本': [['mó'], ['běn']],
+    '模板': [['mú'], ['bǎn']],
+    '模样': [['mú'], ['yàng']],
+    '模棱': [['mó'], ['léng']],
+    '模糊': [['mó'], ['hú']],
+    '模范': [['mó'], ['fàn']],
+    '横事': [['hèng'], ['shì']],
+    '横亘': [['héng'], ['gèn']],
+    '横列': [['héng'], ['liè']],
+    '横加': [['héng'], ['jiā']],
+    '横匾': [['héng'], ['biǎn']],
+    '横向': [['héng'], ['xiàng']],
+    '横尸': [['héng'], ['shī']],
+    '横幅': [['héng'], ['fú']],
+    '横心': [['héng'], ['xīn']],
+    '横恣': [['hèng'], ['zì']],
+    '横扫': [['héng'], ['sǎo']],
+    '横批': [['héng'], ['pī']],
+    '横披': [['héng'], ['pī']],
+    '横排': [['héng'], ['pái']],
+    '横断': [['héng'], ['duàn']],
+    '横是': [['héng'], ['shì']],
+    '横暴': [['hèng'], ['bào']],
+    '横木': [['héng'], ['mù']],
+    '横标': [['héng'], ['biāo']],
+    '横梁': [['héng'], ['liáng']],
+    '横死': [['hèng'], ['sǐ']],
+    '横渡': [['héng'], ['dù']],
+    '横溢': [['héng'], ['yì']],
+    '横生': [['héng'], ['shēng']],
+    '横直': [['héng'], ['zhí']],
+    '横眉': [['héng'], ['méi']],
+    '横祸': [['hèng'], ['huò']],
+    '横空': [['héng'], ['kōng']],
+    '横穿': [['héng'], ['chuān']],
+    '横竖': [['héng'], ['shù']],
+    '横笛': [['héng'], ['dí']],
+    '横肉': [['héng'], ['ròu']],
+    '横蛮': [['hèng'], ['mán']],
+    '横行': [['héng'], ['xíng']],
+    '横街': [['héng'], ['jiē']],
+    '横议': [['hèng'], ['yì']],
+    '横话': [['hèng'], ['huà']],
+    '横财': [['hèng'], ['cái']],
+    '横贯': [['héng'], ['guàn']],
+    '横越': [['héng'], ['yuè']],
+    '横跨': [['héng'], ['kuà']],
+    '横过': [['héng'], ['guò']],
+    '横逆': [['hèng'], ['nì']],
+    '横遭': [['héng'], ['zāo']],
+    '横队': [['héng'], ['duì']],
+    '横隔': [['héng'], ['gé']],
+    '横额': [['héng'], ['é']],
+    '樵夫': [['qiáo'], ['fū']],
+    '橘子': [['jú'], ['zi']],
+    '橘红': [['jú'], ['hóng']],
+    '橘络': [['jú'], ['luò']],
+    '橙红': [['chéng'], ['hóng']],
+    '橱柜': [['chú'], ['guì']],
+    '檀郎': [['tán'], ['láng']],
+    '檐头': [['yán'], ['tóu']],
+    '檐溜': [['yán'], ['liù']],
+    '次数': [['cì'], ['shù']],
+    '次要': [['cì'], ['yào']],
+    '次长': [['cì'], ['zhǎng']],
+    '欢乐': [['huān'], ['lè']],
+    '欢场': [['huān'], ['chǎng']],
+    '欢好': [['huān'], ['hǎo']],
+    '欢度': [['huān'], ['dù']],
+    '欢愉': [['huān'], ['yú']],
+    '欧体': [['ōu'], ['tǐ']],
+    '欧化': [['ōu'], ['huà']],
+    '欺压': [['qī'], ['yā']],
+    '欺哄': [['qī'], ['hǒng']],
+    '欺蒙': [['qī'], ['méng']],
+    '款待': [['kuǎn'], ['dài']],
+    '款曲': [['kuǎn'], ['qǔ']],
+    '款识': [['kuǎn'], ['zhì']],
+    '歃血': [['shà'], ['xuè']],
+    '歇凉': [['xiē'], ['liáng']],
+    '歇宿': [['xiē'], ['sù']],
+    '歇枝': [['xiē'], ['zhī']],
+    '歌女': [['gē'], ['nǚ']],
+    '歌曲': [['gē'], ['qǔ']],
+    '歌行': [['gē'], ['xíng']],
+    '歙县': [['shè'], ['xiàn']],
+    '止血': [['zhǐ'], ['xuè']],
+    '正业': [['zhèng'], ['yè']],
+    '正中': [['zhèng'], ['zhōng']],
+    '正义': [['zhèng'], ['yì']],
+    '正书': [['zhèng'], ['shū']],
+    '正事': [['zhèng'], ['shì']],
+    '正传': [['zhèng'], ['zhuàn']],
+    '正位': [['zhèng'], ['wèi']],
+    '正体': [['zhèng'], ['tǐ']],
+    '正值': [['zhèng'], ['zhí']],
+    '正像': [['zhèng'], ['xiàng']],
+    '正册': [['zhèng'], ['cè']],
+    '正凶': [['zhèng'], ['xiōng']],
+    '正出': [['zhèng'], ['chū']],
+    '正切': [['zhèng'], ['qiē']],
+    '正则': [['zhèng'], ['zé']],
+    '正剧': [['zhèng'], ['jù']],
+    '正割': [['zhèng'], ['gē']],
+    '正午': [['zhèng'], ['wǔ']],
+    '正厅': [['zhèng'], ['tīng']],
+    '正史': [['zhèng'], ['shǐ']],
+    '正号': [['zhèng'], ['hào']],
+    '正名': [['zhèng'], ['míng']],
+    '正向': [['zhèng'], ['xiàng']],
+    '正告': [['zhèng'], ['gào']],
+    '正品': [['zhèng'], ['pǐn']],
+    '正在': [['zhèng'], ['zài']],
+    '正堂': [['zhèng'], ['táng']],
+    '正大': [['zhèng'], ['dà']],
+    '正好': [['zhèng'], ['hǎo']],
+    '正始': [['zhèng'], ['shǐ']],
+    '正字': [['zhèng'], ['zì']],
+    '正宗': [['zhèng'], ['zōng']],
+    '正定': [['zhèng'], ['dìng']],
+    '正室': [['zhèng'], ['shì']],
+    '正宫': [['zhèng'], ['gōng']],
+    '正屋': [['zhèng'], ['wū']],
+    '正巧': [['zhèng'], ['qiǎo']],
+    '正常': [['zhèng'], ['cháng']],
+    '正座': [['zhèng'], ['zuò']],
+    '正式': [['zhèng'], ['shì']],
+    '正弦': [['zhèng'], ['xián']],
+    '正当': [['zhèng'], ['dāng']],
+    '正德': [['zhèng'], ['dé']],
+    '正心': [['zhèng'], ['xīn']],
+    '正房': [['zhèng'], ['fáng']],
+    '正手': [['zhèng'], ['shǒu']],
+    '正教': [['zhèng'], ['jiào']],
+    '正数': [['zhèng'], ['shù']],
+    '正文': [['zhèng'], ['wén']],
+    '正方': [['zhèng'], ['fāng']],
+    '正日': [['zhèng'], ['rì']],
+    '正旦': [['zhēng'], ['dàn']],
+    '正时': [['zhèng'], ['shí']],
+    '正是': [['zhèng'], ['shì']],
+    '正月': [['zhēng'], ['yuè']],
+    '正朔': [['zhēng'], ['shuò']],
+    '正本': [['zhèng'], ['běn']],
+    '正极': [['zhèng'], ['jí']],
+    '正果': [['zhèng'], ['guǒ']],
+    '正格': [['zhèng'], ['gé']],
+    '正梁': [['zhèng'], ['liáng']],
+    '正楷': [['zhèng'], ['kǎi']],
+    '正步': [['zhèng'], ['bù']],
+    '正殿': [['zhèng'], ['diàn']],
+    '正比': [['zhèng'], ['bǐ']],
+    '正气': [['zhèng'], ['qì']],
+    '正治': [['zhèng'], ['zhì']],
+    '正法': [['zhèng'], ['fǎ']],
+    '正派': [['zhèng'], ['pài']],
+    '正点': [['zhèng'], ['diǎn']],
+    '正片': [['zhèng'], ['piàn']],
+    '正牌': [['zhèng'], ['pái']],
+    '正犯': [['zhèng'], ['fàn']],
+    '正理': [['zhèng'], ['lǐ']],
+    '正用': [['zhèng'], ['yòng']],
+    '正电': [['zhèng'], ['diàn']],
+    '正盐': [['zhèng'], ['yán']],
+    '正直': [['zhèng'], ['zhí']],
+    '正眼': [['zhèng'], ['yǎn']],
+    '正确': [['zhèng'], ['què']],
+    '正经': [['zhèng'], ['jīng']],
+    '正统': [['zhèng'], ['tǒng']],
+    '正职': [['zhèng'], ['zhí']],
+    '正色': [['zhèng'], ['sè']],
+    '正行': [['zhèng'], ['xíng']],
+    '正要': [['zhèng'], ['yào']],
+    '正见': [['zhèng'], ['jiàn']],
+    '正规': [['zhèng'], ['guī']],
+    '正视': [['zhèng'], ['shì']],
+    '正解': [['zhèng'], ['jiě']],
+    '正论': [['zhèng'], ['lùn']],
+    '正话': [['zhèng'], ['huà']],
+    '正误': [['zhèng'], ['wù']],
+    '正课': [['zhèng'], ['kè']],
+    '正负': [['zhèng'], ['fù']],
+    '正路': [['zhèng'], ['lù']],
+    '正身': [['zhèng'], ['shēn']],
+    '正轨': [['zhèng'], ['guǐ']],
+    '正途': [['zhèng'], ['tú']],
+    '正道': [['zhèng'], ['dào']],
+    '正门': [['zhèng'], ['mén']],
+    '正阳': [['zhèng'], ['yáng']],
+    '正面': [['zhèng'], ['miàn']],
+    '正音': [['zhèng'], ['yīn']],
+    '正题': [['zhèng'], ['tí']],
+    '正餐': [['zhèng'], ['cān']],
+    '正骨': [['zhèng'], ['gǔ']],
+    '此地': [['cǐ'], ['dì']],
+    '此间': [['cǐ'], ['jiān']],
+    '步行': [['bù'], ['xíng']],
+    '步调': [['bù'], ['diào']],
+    '武场': [['wǔ'], ['chǎng']],
+    '武夫': [['wǔ'], ['fū']],
+    '武将': [['wǔ'], ['jiàng']],
+    '武戏': [['wǔ'], ['xì']],
+    '武打': [['wǔ'], ['dǎ']],
+    '武斗': [['wǔ'], ['dòu']],
+    '武术': [['wǔ'], ['shù']],
+    '武行': [['wǔ'], ['xíng']],
+    '歪曲': [['wāi'], ['qū']],
+    '歪风': [['wāi'], ['fēng']],
+    '歹毒': [['dǎi'], ['dú']],
+    '死亡': [['sǐ'], ['wáng']],
+    '死信': [['sǐ'], ['xìn']],
+    '死别': [['sǐ'], ['bié']],
+    '死地': [['sǐ'], ['dì']],
+    '死契': [['sǐ'], ['qì']],
+    '死巷': [['sǐ'], ['xiàng']],
+    '死当': [['sǐ'], ['dàng']],
+    '死期': [['sǐ'], ['qī']],
+    '死症': [['sǐ'], ['zhèng']],
+    '死结': [['sǐ'], ['jié']],
+    '死节': [['sǐ'], ['jié']],
+    '死角': [['sǐ'], ['jiǎo']],
+    '死难': [['sǐ'], ['nàn']],
+    '殆尽': [['dài'], ['jìn']],
+    '殉教': [['xùn'], ['jiào']],
+    '殉节': [['xùn'], ['jié']],
+    '殉难': [['xùn'], ['nàn']],
+    '残卷': [['cán'], ['juàn']],
+    '残暴': [['cán'], ['bào']],
+    '残毒': [['cán'], ['dú']],
+    '残片': [['cán'], ['piàn']],
+    '殡车': [['bìn'], ['chē']],
+    '殴打': [['ōu'], ['dǎ']],
+    '殴斗': [['ōu'], ['dòu']],
+    '段落': [['duàn'], ['luò']],
+    '殷切': [['yīn'], ['qiè']],
+    '殷勤': [['yīn'], ['qín']],
+    '殷商': [['yīn'], ['shāng']],
+    '殷墟': [['yīn'], ['xū']],
+    '殷实': [['yīn'], ['shí']],
+    '殷富': [['yīn'], ['fù']],
+    '殷忧': [['yīn'], ['yōu']],
+    '殷殷': [['yīn'], ['yīn']],
+    '殷红': [['yān'], ['hóng']],
+    '殷鉴': [['yīn'], ['jiàn']],
+    '毁坏': [['huǐ'], ['huài']],
+    '毁约': [['huǐ'], ['yuē']],
+    '毋宁': [['wú'], ['nìng']],
+    '母亲': [['mǔ'], ['qīn']],
+    '母体': [['mǔ'], ['tǐ']],
+    '母教': [['mǔ'], ['jiào']],
+    '母校': [['mǔ'], ['xiào']],
+    '母畜': [['mǔ'], ['chù']],
+    '母系': [['mǔ'], ['xì']],
+    '母语': [['mǔ'], ['yǔ']],
+    '每当': [['měi'], ['dāng']],
+    '毒刑': [['dú'], ['xíng']],
+    '毒刺': [['dú'], ['cì']],
+    '毒剂': [['dú'], ['jì']],
+    '毒化': [['dú'], ['huà']],
+    '毒品': [['dú'], ['pǐn']],
+    '毒害': [['dú'], ['hài']],
+    '毒性': [['dú'], ['xìng']],
+    '毒手': [['dú'], ['shǒu']],
+    '毒打': [['dú'], ['dǎ']],
+    '毒杀': [['dú'], ['shā']],
+    '毒死': [['dú'], ['sǐ']],
+    '毒气': [['dú'], ['qì']],
+    '毒汁': [['dú'], ['zhī']],
+    '毒液': [['dú'], ['yè']],
+    '毒焰': [['dú'], ['yàn']],
+    '毒牙': [['dú'], ['yá']],
+    '毒物': [['dú'], ['wù']],
+    '毒瘤': [['dú'], ['liú']],
+    '毒瘾': [['dú'], ['yǐn']],
+    '毒箭': [['dú'], ['jiàn']],
+    '毒素': [['dú'], ['sù']],
+    '毒腺': [['dú'], ['xiàn']],
+    '毒草': [['dú'], ['cǎo']],
+    '毒药': [['dú'], ['yào']],
+    '毒菌': [['dú'], ['jūn']],
+    '毒蕈': [['dú'], ['xùn']],
+    '毒虫': [['dú'], ['chóng']],
+    '毒蛇': [['dú'], ['shé']],
+    '毒蛾': [['dú'], ['é']],
+    '毒计': [['dú'], ['jì']],
+    '毒谋': [['dú'], ['móu']],
+    '毒辣': [['dú'], ['là']],
+    '毒酒': [['dú'], ['jiǔ']],
+    '毒雾': [['dú'], ['wù']],
+    '毒饵': [['dú'], ['ěr']],
+    '毒龙': [['dú'], ['lóng']],
+    '比价': [['bǐ'], ['jià']],
+    '比兴': [['bǐ'], ['xīng']],
+    '比分': [['bǐ'], ['fēn']],
+    '比划': [['bǐ'], ['huà']],
+    '比干': [['bǐ'], ['gān']],
+    '比率': [['bǐ'], ['lǜ']],
+    '比重': [['bǐ'], ['zhòng']],
+    '比量': [['bǐ'], ['liáng']],
+    '毕剥': [['bì'], ['bāo']],
+    '毕肖': [['bì'], ['xiào']],
+    '毕露': [['bì'], ['lù']],
+    '毛刷': [['máo'], ['shuā']],
+    '毛刺': [['máo'], ['cì']],
+    '毛发': [['máo'], ['fà']],
+    '毛呢': [['máo'], ['ní']],
+    '毛囊': [['máo'], ['náng']],
+    '毛头': [['máo'], ['tóu']],
+    '毛拉': [['máo'], ['lā']],
+    '毛条': [['máo'], ['tiáo']],
+    '毛渠': [['máo'], ['qú']],
+    '毛片': [['máo'], ['piàn']],
+    '毛石': [['máo'], ['shí']],
+    '毛票': [['máo'], ['piào']],
+    '毛葛': [['máo'], ['gě']],
+    '毛遂': [['máo'], ['suí']],
+    '毛重': [['máo'], ['zhòng']],
+    '毡子': [['zhān'], ['zi']],
+    '毯子': [['tǎn'], ['zi']],
+    '氏族': [['shì'], ['zú']],
+    '民乐': [['mín'], ['yuè']],
+    '民夫': [['mín'], ['fū']],
+    '民家': [['mín'], ['jiā']],
+    '民校': [['mín'], ['xiào']],
+    '民约': [['mín'], ['yuē']],
+    '民间': [['mín'], ['jiān']],
+    '民食': [['mín'], ['shí']],
+    '气体': [['qì'], ['tǐ']],
+    '气化': [['qì'], ['huà']],
+    '气压': [['qì'], ['yā']],
+    '气囊': [['qì'], ['náng']],
+    '气圈': [['qì'], ['quān']],
+    '气度': [['qì'], ['dù']],
+    '气数': [['qì'], ['shù']],
+    '气旋': [['qì'], ['xuán']],
+    '气泡': [['qì'], ['pào']],
+    '气盛': [['qì'], ['shèng']],
+    '气脉': [['qì'], ['mài']],
+    '气节': [['qì'], ['jié']],
+    '气血': [['qì'], ['xuè']],
+    '气量': [['qì'], ['liàng']],
+    '气闷': [['qì'], ['mèn']],
+    '氢弹': [['qīng'], ['dàn']],
+    '氧化': [['yǎng'], ['huà']],
+    '水上': [['shuǐ'], ['shàng']],
+    '水分': [['shuǐ'], ['fèn']],
+    '水区': [['shuǐ'], ['qū']],
+    '水压': [['shuǐ'], ['yā']],
+    '水发': [['shuǐ'], ['fā']],
+    '水合': [['shuǐ'], ['hé']],
+    '水地': [['shuǐ'], ['dì']],
+    '水头': [['shuǐ'], ['tóu']],
+    '水尺': [['shuǐ'], ['chǐ']],
+    '水斗': [['shuǐ'], ['dòu']],
+    '水景': [['shuǐ'], ['jǐng']],
+    '水杉': [['shuǐ'], ['shān']],
+    '水柜': [['shuǐ'], ['guì']],
+    '水栅': [['shuǐ'], ['shān']],
+    '水泊': [['shuǐ'], ['pō']],
+    '水泡': [['shuǐ'], ['pào']],
+    '水泥': [['shuǐ'], ['ní']],
+    '水浒': [['shuǐ'], ['hǔ']],
+    '水渠': [['shuǐ'], ['qú']],
+    '水溜': [['shuǐ'], ['liù']],
+    '水炮': [['shuǐ'], ['pào']],
+    '水磨': [['shuǐ'], ['mó']],
+    '水系': [['shuǐ'], ['xì']],
+    '水红': [['shuǐ'], ['hóng']],
+    '水纹': [['shuǐ'], ['wén']],
+    '水绿': [['shuǐ'], ['lǜ']],
+    '水能': [['shuǐ'], ['néng']],
+    '水蛇': [['shuǐ'], ['shé']],
+    '水解': [['shuǐ'], ['jiě']],
+    '水车': [['shuǐ'], ['chē']],
+    '水量': [['shuǐ'], ['liàng']],
+    '永别': [['yǒng'], ['bié']],
+    '永宁': [['yǒng'], ['níng']],
+    '求亲': [['qiú'], ['qīn']],
+    '求助': [['qiú'], ['zhù']],
+    '求和': [['qiú'], ['hé']],
+    '求教': [['qiú'], ['jiào']],
+    '求知': [['qiú'], ['zhī']],
+    '求见': [['qiú'], ['jiàn']],
+    '求解': [['qiú'], ['jiě']],
+    '求降': [['qiú'], ['xiáng']],
+    '求雨': [['qiú'], ['yǔ']],
+    '汇价': [['huì'], ['jià']],
+    '汇兑': [['huì'], ['duì']],
+    '汇合': [['huì'], ['hé']],
+    '汇率': [['huì'], ['lǜ']],
+    '汇票': [['huì'], ['piào']],
+    '汉中': [['hàn'], ['zhōng']],
+    '汉家': [['hàn'], ['jiā']],
+    '汉王': [['hàn'], ['wáng']],
+    '汉语': [['hàn'], ['yǔ']],
+    '汊港': [['chà'], ['gǎng']],
+    '汗斑': [['hàn'], ['bān']],
+    '汗毛': [['hàn'], ['máo']],
+    '汗水': [['hàn'], ['shuǐ']],
+    '汗液': [['hàn'], ['yè']],
+    '汗渍': [['hàn'], ['zì']],
+    '汗珠': [['hàn'], ['zhū']],
+    '汗碱': [['hàn'], ['jiǎn']],
+    '汗脚': [['hàn'], ['jiǎo']],
+    '汗腺': [['hàn'], ['xiàn']],
+    '汗衫': [['hàn'], ['shān']],
+    '汗褂': [['hàn'], ['guà']],
+    '汗青': [['hàn'], ['qīng']],
+    '汗颜': [['hàn'], ['yán']],
+    '汛期': [['xùn'], ['qī']],
+    '江北': [['jiāng'], ['běi']],
+    '江南': [['jiāng'], ['nán']],
+    '江宁': [['jiāng'], ['níng']],
+    '江都': [['jiāng'], ['dū']],
+    '污泥': [['wū'], ['ní']],
+    '汤剂': [['tāng'], ['jì']],
+    '汤勺': [['tāng'], ['sháo']],
+    '汤包': [['tāng'], ['bāo']],
+    '汤匙': [['tāng'], ['chí']],
+    '汤团': [['tāng'], ['tuán']],
+    '汤圆': [['tāng'], ['yuán']],
+    '汤头': [['tāng'], ['tóu']],
+    '汤水': [['tāng'], ['shuǐ']],
+    '汤池': [['tāng'], ['chí']],
+    '汤泉': [['tāng'], ['quán']],
+    '汤碗': [['tāng'], ['wǎn']],
+    '汤罐': [['tāng'], ['guàn']],
+    '汤药': [['tāng'], ['yào']],
+    '汤锅': [['tāng'], ['guō']],
+    '汤面': [['tāng'], ['miàn']],
+    '汩汩': [['gǔ'], ['gǔ']],
+    '汩没': [['gǔ'], ['mò']],
+    '汶上': [['wèn'], ['shàng']],
+    '汹涌': [['xiōng'], ['yǒng']],
+    '汽化': [['qì'], ['huà']],
+    '汽车': [['qì'], ['chē']],
+    '沃地': [['wò'], ['dì']],
+    '沈思': [['shěn'], ['sī']],
+    '沉思': [['chén'], ['sī']],
+    '沉没': [['chén'], ['mò']],
+    '沉溺': [['chén'], ['nì']],
+    '沉着': [['chén'], ['zhuó']],
+    '沉重': [['chén'], ['zhòng']],
+    '沉闷': [['chén'], ['mèn']],
+    '沓子': [['tà'], ['zǐ']],
+    '沙丘': [['shā'], ['qiū']],
+    '沙俄': [['shā'], ['é']],
+    '沙包': [['shā'], ['bāo']],
+    '沙化': [['shā'], ['huà']],
+    '沙参': [['shā'], ['shēn']],
+    '沙发': [['shā'], ['fā']],
+    '沙哑': [['shā'], ['yǎ']],
+    '沙囊': [['shā'], ['náng']],
+    '沙土': [['shā'], ['tǔ']],
+    '沙地': [['shā'], ['dì']],
+    '沙场': [['shā'], ['chǎng']],
+    '沙坑': [['shā'], ['kēng']],
+    '沙坝': [['shā'], ['bà']],
+    '沙堆': [['shā'], ['duī']],
+    '沙子': [['shā'], ['zi']],
+    '沙害': [['shā'], ['hài']],
+    '沙尘': [['shā'], ['chén']],
+    '沙岸': [['shā'], ['àn']],
+    '沙市': [['shā'], ['shì']],
+    '沙弥': [['shā'], ['mí']],
+    '沙拉': [['shā'], ['là']],
+    '沙暴': [['shā'], ['bào']],
+    '沙果': [['shā'], ['guǒ']],
+    '沙枣': [['shā'], ['zǎo']],
+    '沙柳': [['shā'], ['liǔ']],
+    '沙梨': [['shā'], ['lí']],
+    '沙棘': [['shā'], ['jí']],
+    '沙沙': [['shā'], ['shā']],
+    '沙洲': [['shā'], ['zhōu']],
+    '沙浴': [['shā'], ['yù']],
+    '沙滩': [['shā'], ['tān']],
+    '沙漏': [['shā'], ['lòu']],
+    '沙漠': [['shā'], ['mò']],
+    '沙灾': [['shā'], ['zāi']],
+    '沙田': [['shā'], ['tián']],
+    '沙皇': [['shā'], ['huáng']],
+    '沙盘': [['shā'], ['pán']],
+    '沙眼': [['shā'], ['yǎn']],
+    '沙石': [['shā'], ['shí']],
+    '沙砾': [['shā'], ['lì']],
+    '沙碛': [['shā'], ['qì']],
+    '沙船': [['shā'], ['chuán']],
+    '沙荒': [['shā'], ['huāng']],
+    '沙虫': [['shā'], ['chóng']],
+    '沙袋': [['shā'], ['dài']],
+    '沙质': [['shā'], ['zhì']],
+    '沙金': [['shā'], ['jīn']],
+    '沙锅': [['shā'], ['guō']],
+    '沙门': [['shā'], ['mén']],
+    '沙鱼': [['shā'], ['yú']],
+    '沙鸡': [['shā'], ['jī']],
+    '沙鸥': [['shā'], ['ōu']],
+    '沙龙': [['shā'], ['lóng']],
+    '沟渠': [['gōu'], ['qú']],
+    '没世': [['mò'], ['shì']],
+    '没事': [['méi'], ['shì']],
+    '没人': [['méi'], ['rén']],
+    '没入': [['mò'], ['rù']],
+    '没劲': [['méi'], ['jìn']],
+    '没味': [['méi'], ['wèi']],
+    '没命': [['méi'], ['mìng']],
+    '没完': [['méi'], ['wán']],
+    '没底': [['méi'], ['dǐ']],
+    '没戏': [['méi'], ['xì']],
+    '没收': [['mò'], ['shōu']],
+    '没救': [['méi'], ['jiù']],
+    '没有': [['méi'], ['yǒu']],
+    '没用': [['méi'], ['yòng']],
+    '没空': [['méi'], ['kòng']],
+    '没羞': [['méi'], ['xiū']],
+    '没脸': [['méi'], ['liǎn']],
+    '没药': [['mò'], ['yào']],
+    '没落': [['mò'], ['luò']],
+    '没趣': [['méi'], ['qù']],
+    '没过': [['mò'], ['guò']],
+    '没齿': [['mò'], ['chǐ']],
+    '沤肥': [['òu'], ['féi']],
+    '沦丧': [['lún'], ['sàng']],
+    '沦亡': [['lún'], ['wáng']],
+    '沦没': [['lún'], ['mò']],
+    '沦落': [['lún'], ['luò']],
+    '沮丧': [['jǔ'], ['sàng']],
+    '沮洳': [['jù'], ['rù']],
+    '河内': [['hé'], ['nèi']],
+    '河北': [['hé'], ['běi']],
+    '河南': [['hé'], ['nán']],
+    '河底': [['hé'], ['dǐ']],
+    '河曲': [['hé'], ['qū']],
+    '河沙': [['hé'], ['shā']],
+    '河泥': [['hé'], ['ní']],
+    '河渠': [['hé'], ['qú']],
+    '河港': [['hé'], ['gǎng']],
+    '河系': [['hé'], ['xì']],
+    '河蚌': [['hé'], ['bàng']],
+    '河间': [['hé'], ['jiān']],
+    '河鲜': [['hé'], ['xiān']],
+    '油区': [['yóu'], ['qū']],
+    '油坊': [['yóu'], ['fáng']],
+    '油条': [['yóu'], ['tiáo']],
+    '油泥': [['yóu'], ['ní']],
+    '油炸': [['yóu'], ['zhá']],
+    '油石': [['yóu'], ['shí']],
+    '油绿': [['yóu'], ['lǜ']],
+    '油膏': [['yóu'], ['gāo']],
+    '油藏': [['yóu'], ['cáng']],
+    '油车': [['yóu'], ['chē']],
+    '治丧': [['zhì'], ['sāng']],
+    '治家': [['zhì'], ['jiā']],
+    '治服': [['zhì'], ['fú']],
+    '沼地': [['zhǎo'], ['dì']],
+    '沾亲': [['zhān'], ['qīn']],
+    '沾化': [['zhān'], ['huà']],
+    '沿条': [['yán'], ['tiáo']],
+    '沿着': [['yán'], ['zhe']],
+    '泄劲': [['xiè'], ['jìn']],
+    '泄密': [['xiè'], ['mì']],
+    '泄底': [['xiè'], ['dǐ']],
+    '泄恨': [['xiè'], ['hèn']],
+    '泄愤': [['xiè'], ['fèn']],
+    '泄气': [['xiè'], ['qì']],
+    '泄水': [['xiè'], ['shuǐ']],
+    '泄沓': [['xiè'], ['tà']],
+    '泄泻': [['xiè'], ['xiè']],
+    '泄洪': [['xiè'], ['hóng']],
+    '泄漏': [['xiè'], ['lòu']],
+    '泄露': [['xiè'], ['lòu']],
+    '泉涌': [['quán'], ['yǒng']],
+    '泊位': [['bó'], ['wèi']],
+    '泊地': [['pō'], ['dì']],
+    '泊车': [['bó'], ['chē']],
+    '泌阳': [['bì'], ['yáng']],
+    '法令': [['fǎ'], ['lìng']],
+    '法会': [['fǎ'], ['huì']],
+    '法号': [['fǎ'], ['hào']],
+    '法场': [['fǎ'], ['chǎng']],
+    '法家': [['fǎ'], ['jiā']],
+    '法帖': [['fǎ'], ['tiè']],
+    '法度': [['fǎ'], ['dù']],
+    '法拉': [['fǎ'], ['lā']],
+    '法术': [['fǎ'], ['shù']],
+    '法王': [['fǎ'], ['wáng']],
+    '法相': [['fǎ'], ['xiāng']],
+    '法纪': [['fǎ'], ['jì']],
+    '法语': [['fǎ'], ['yǔ']],
+    '法郎': [['fǎ'], ['láng']],
+    '泛称': [['fàn'], ['chēng']],
+    '泛论': [['fàn'], ['lùn']],
+    '泡制': [['pào'], ['zhì']],
+    '泡妞': [['pào'], ['niū']],
+    '泡子': [['pāo'], ['zǐ']],
+    '泡影': [['pào'], ['yǐng']],
+    '泡桐': [['pāo'], ['tóng']],
+    '泡汤': [['pào'], ['tāng']],
+    '泡沫': [['pào'], ['mò']],
+    '泡泡': [['pào'], ['pào']],
+    '泡涨': [['pào'], ['zhàng']],
+    '泡漩': [['pào'], ['xuán']],
+    '泡澡': [['pào'], ['zǎo']],
+    '泡茶': [['pào'], ['chá']],
+    '泡菜': [['pào'], ['cài']],
+    '泡货': [['pāo'], ['huò']],
+    '泡饭': [['pào'], ['fàn']],
+    '波折': [['bō'], ['zhé']],
+    '波纹': [['bō'], ['wén']],
+    '波长': [['bō'], ['cháng']],
+    '泣血': [['qì'], ['xuè']],
+    '泥丸': [['ní'], ['wán']],
+    '泥人': [['ní'], ['rén']],
+    '泥古': [['nì'], ['gǔ']],
+    '泥土': [['ní'], ['tǔ']],
+    '泥坑': [['ní'], ['kēng']],
+    '泥坯': [['ní'], ['pī']],
+    '泥垢': [['ní'], ['gòu']],
+    '泥塑': [['ní'], ['sù']],
+    '泥塘': [['ní'], ['táng']],
+    '泥子': [['nì'], ['zǐ']],
+    '泥封': [['ní'], ['fēng']],
+    '泥岩': [['ní'], ['yán']],
+    '泥巴': [['ní'], ['bā']],
+    '泥水': [['ní'], ['shuǐ']],
+    '泥污': [['ní'], ['wū']],
+    '泥沙': [['ní'], ['shā']],
+    '泥沼': [['ní'], ['zhǎo']],
+    '泥泞': [['ní'], ['nìng']],
+    '泥浆': [['ní'], ['jiāng']],
+    '泥淖': [['ní'], ['nào']],
+    '泥滩': [['ní'], ['tān']],
+    '泥潭': [['ní'], ['tán']],
+    '泥灰': [['ní'], ['huī']],
+    '泥炭': [['ní'], ['tàn']],
+    '泥胎': [['ní'], ['tāi']],
+    '泥鳅': [['ní'], ['qiū']],
+    '注射': [['zhù'], ['shè']],
+    '注解': [['zhù'], ['jiě']],
+    '注重': [['zhù'], ['zhòng']],
+    '泯没': [['mǐn'], ['mò']],
+    '泰和': [['tài'], ['hé']],
+    '泰宁': [['tài'], ['níng']],
+    '泰斗': [['tài'], ['dǒu']],
+    '泰语': [['tài'], ['yǔ']],
+    '泻肚': [['xiè'], ['dù']],
+    '泼剌': [['pō'], ['là']],
+    '泼洒': [['pō'], ['sǎ']],
+    '洁净': [['jié'], ['jìng']],
+    '洋化': [['yáng'], ['huà']],
+    '洋场': [['yáng'], ['chǎng']],
+    '洋服': [['yáng'], ['fú']],
+    '洋相': [['yáng'], ['xiàng']],
+    '洋红': [['yáng'], ['hóng']],
+    '洋行': [['yáng'], ['háng']],
+    '洋车': [['yáng'], ['chē']],
+    '洒家': [['sǎ'], ['jiā']],
+    '洒扫': [['sǎ'], ['sǎo']],
+    '洒泪': [['sǎ'], ['lèi']],
+    '洒洒': [['sǎ'], ['sǎ']],
+    '洒脱': [['sǎ'], ['tuō']],
+    '洒落': [['sǎ'], ['luò']],
+    '洗三': [['xǐ'], ['sān']],
+    '洗冤': [['xǐ'], ['yuān']],
+    '洗净': [['xǐ'], ['jìng']],
+    '洗刷': [['xǐ'], ['shuā']],
+    '洗剂': [['xǐ'], ['jì']],
+    '洗劫': [['xǐ'], ['jié']],
+    '洗印': [['xǐ'], ['yìn']],
+    '洗发': [['xǐ'], ['fà']],
+    '洗头': [['xǐ'], ['tóu']],
+    '洗尘': [['xǐ'], ['chén']],
+    '洗手': [['xǐ'], ['shǒu']],
+    '洗洗': [['xǐ'], ['xǐ']],
+    '洗浴': [['xǐ'], ['yù']],
+    '洗涤': [['xǐ'], ['dí']],
+    '洗涮': [['xǐ'], ['shuàn']],
+    '洗漱': [['xǐ'], ['shù']],
+    '洗澡': [['xǐ'], ['zǎo']],
+    '洗濯': [['xǐ'], ['zhuó']],
+    '洗烫': [['xǐ'], ['tàng']],
+    '洗煤': [['xǐ'], ['méi']],
+    '洗牌': [['xǐ'], ['pái']],
+    '洗礼': [['xǐ'], ['lǐ']],
+    '洗练': [['xǐ'], ['liàn']],
+    '洗肠': [['xǐ'], ['cháng']],
+    '洗胃': [['xǐ'], ['wèi']],
+    '洗脱': [['xǐ'], ['tuō']],
+    '洗衣': [['xǐ'], ['yī']],
+    '洗钱': [['xǐ'], ['qián']],
+    '洗雪': [['xǐ'], ['xuě']],
+    '洛夫': [['luò'], ['fū']],
+    '洞见': [['dòng'], ['jiàn']],
+    '津要': [['jīn'], ['yào']],
+    '洪大': [['hóng'], ['dà']],
+    '洪量': [['hóng'], ['liàng']],
+    '活似': [['huó'], ['sì']],
+    '活体': [['huó'], ['tǐ']],
+    '活佛': [['huó'], ['fó']],
+    '活便': [['huó'], ['biàn']],
+    '活儿': [['huó'], ['er']],
+    '活分': [['huó'], ['fēn']],
+    '活化': [['huó'], ['huà']],
+    '活埋': [['huó'], ['mái']],
+    '活塞': [['huó'], ['sāi']],
+    '活期': [['huó'], ['qī']],
+    '活着': [['huó'], ['zhe']],
+    '活结': [['huó'], ['jié']],
+    '活络': [['huó'], ['luò']],
+    '活血': [['huó'], ['xuè']],
+    '活食': [['huó'], ['shí']],
+    '洼地': [['wā'], ['dì']],
+    '派别': [['pài'], ['bié']],
+    '派头': [['pài'], ['tóu']],
+    '派系': [['pài'], ['xì']],
+    '流丽': [['liú'], ['lì']],
+    '流亡': [['liú'], ['wáng']],
+    '流传': [['liú'], ['chuán']],
+    '流体': [['liú'], ['tǐ']],
+    '流别': [['liú'], ['bié']],
+    '流化': [['liú'], ['huà']],
+    '流弹': [['liú'], ['dàn']],
+    '流散': [['liú'], ['sàn']],
+    '流毒': [['liú'], ['dú']],
+    '流氓': [['liú'], ['máng']],
+    '流汗': [['liú'], ['hàn']],
+    '流沙': [['liú'], ['shā']],
+    '流淌': [['liú'], ['tǎng']],
+    '流落': [['liú'], ['luò']],
+    '流血': [['liú'], ['xiě']],
+    '流行': [['liú'], ['xíng']],
+    '流转': [['liú'], ['zhuǎn']],
+    '流量': [['liú'], ['liàng']],
+    '流露': [['liú'], ['lù']],
+    '流食': [['liú'], ['shí']],
+    '浅学': [['qiǎn'], ['xué']],
+    '浅尝': [['qiǎn'], ['cháng']],
+    '浅明': [['qiǎn'], ['míng']],
+    '浅易': [['qiǎn'], ['yì']],
+    '浅显': [['qiǎn'], ['xiǎn']],
+    '浅水': [['qiǎn'], ['shuǐ']],
+    '浅浅': [['jiān'], ['jiān']],
+    '浅海': [['qiǎn'], ['hǎi']],
+    '浅淡': [['qiǎn'], ['dàn']],
+    '浅滩': [['qiǎn'], ['tān']],
+    '浅白': [['qiǎn'], ['bái']],
+    '浅笑': [['qiǎn'], ['xiào']],
+    '浅耕': [['qiǎn'], ['gēng']],
+    '浅色': [['qiǎn'], ['sè']],
+    '浅薄': [['qiǎn'], ['bó']],
+    '浅见': [['qiǎn'], ['jiàn']],
+    '浅说': [['qiǎn'], ['shuō']],
+    '浅近': [['qiǎn'], ['jìn']],
+    '浅陋': [['qiǎn'], ['lòu']],
+    '浅露': [['qiǎn'], ['lù']],
+    '浆果': [['jiāng'], ['guǒ']],
+    '浆汁': [['jiāng'], ['zhī']],
+    '浆洗': [['jiāng'], ['xǐ']],
+    '浆液': [['jiāng'], ['yè']],
+    '浆糊': [['jiāng'], ['hú']],
+    '浇头': [['jiāo'], ['tou']],
+    '浇洒': [['jiāo'], ['sǎ']],
+    '浇薄': [['jiāo'], ['bó']],
+    '浊度': [['zhuó'], ['dù']],
+    '测度': [['cè'], ['duó']],
+    '测量': [['cè'], ['liáng']],
+    '济世': [['jì'], ['shì']],
+    '济事': [['jì'], ['shì']],
+    '济公': [['jì'], ['gōng']],
+    '济助': [['jì'], ['zhù']],
+    '济南': [['jǐ'], ['nán']],
+    '济宁': [['jǐ'], ['níng']],
+    '济济': [['jì'], ['jì']],
+    '济私': [['jì'], ['sī']],
+    '济贫': [['jì'], ['pín']],
+    '浑似': [['hún'], ['sì']],
+    '浑家': [['hún'], ['jiā']],
+    '浑朴': [['hún'], ['piáo']],
+    '浓度': [['nóng'], ['dù']],
+    '浓缩': [['nóng'], ['suō']],
+    '浓荫': [['nóng'], ['yīn']],
+    '浓重': [['nóng'], ['zhòng']],
+    '浩大': [['hào'], ['dà']],
+    '浩繁': [['hào'], ['fán']],
+    '浪头': [['làng'], ['tou']],
+    '浮华': [['fú'], ['huá']],
+    '浮夸': [['fú'], ['kuā']],
+    '浮浅': [['fú'], ['qiǎn']],
+    '浮漂': [['fú'], ['piāo']],
+    '浮石': [['fú'], ['shí']],
+    '浴佛': [['yù'], ['fó']],
+    '浴场': [['yù'], ['chǎng']],
+    '浴血': [['yù'], ['xuè']],
+    '海上': [['hǎi'], ['shàng']],
+    '海内': [['hǎi'], ['nèi']],
+    '海南': [['hǎi'], ['nán']],
+    '海参': [['hǎi'], ['shēn']],
+    '海员': [['hǎi'], ['yuán']],
+    '海地': [['hǎi'], ['dì']],
+    '海岭': [['hǎi'], ['lǐng']],
+    '海底': [['hǎi'], ['dǐ']],
+    '海扇': [['hǎi'], ['shàn']],
+    '海港': [['hǎi'], ['gǎng']],
+    '海燕': [['hǎi'], ['yàn']],
+    '海疆': [['hǎi'], ['jiāng']],
+    '海禁': [['hǎi'], ['jìn']],
+    '海苔': [['hǎi'], ['tái']],
+    '海蛇': [['hǎi'], ['shé']],
+    '海角': [['hǎi'], ['jiǎo']],
+    '海量': [['hǎi'], ['liàng']],
+    '海难': [['hǎi'], ['nàn']],
+    '海鲜': [['hǎi'], ['xiān']],
+    '海龟': [['hǎi'], ['guī']],
+    '浸没': [['jìn'], ['mò']],
+    '浸泡': [['jìn'], ['pào']],
+    '浸洗': [['jìn'], ['xǐ']],
+    '浸种': [['jìn'], ['zhǒng']],
+    '涂抹': [['tú'], ['mǒ']],
+    '涂片': [['tú'], ['piàn']],
+    '消亡': [['xiāo'], ['wáng']],
+    '消化': [['xiāo'], ['huà']],
+    '消散': [['xiāo'], ['sàn']],
+    '消毒': [['xiāo'], ['dú']],
+    '消磨': [['xiāo'], ['mó']],
+    '消解': [['xiāo'], ['jiě']],
+    '消长': [['xiāo'], ['zhǎng']],
+    '消食': [['xiāo'], ['shí']],
+    '涌出': [['yǒng'], ['chū']],
+    '涌泉': [['yǒng'], ['quán']],
+    '涌流': [['yǒng'], ['liú']],
+    '涌浪': [['yǒng'], ['làng']],
+    '涌现': [['yǒng'], ['xiàn']],
+    '涌进': [['yǒng'], ['jìn']],
+    '涡旋': [['wō'], ['xuán']],
+    '涡河': [['guō'], ['hé']],
+    '涣散': [['huàn'], ['sàn']],
+    '涤卡': [['dí'], ['kǎ']],
+    '涤纶': [['dí'], ['lún']],
+    '涨价': [['zhǎng'], ['jià']],
+    '涨水': [['zhǎng'], ['shuǐ']],
+    '涨潮': [['zhǎng'], ['cháo']],
+    '涨红': [['zhàng'], ['hóng']],
+    '涨落': [['zhǎng'], ['luò']],
+    '涨钱': [['zhǎng'], ['qián']],
+    '涨风': [['zhǎng'], ['fēng']],
+    '淋浴': [['lín'], ['yù']],
+    '淋淋': [['lín'], ['lín']],
+    '淋病': [['lìn'], ['bìng']],
+    '淋雨': [['lín'], ['yǔ']],
+    '淑女': [['shū'], ['nǚ']],
+    '淘洗': [['táo'], ['xǐ']],
+    '淡化': [['dàn'], ['huà']],
+    '淡泊': [['dàn'], ['bó']],
+    '淡薄': [['dàn'], ['bó']],
+    '淤塞': [['yū'], ['sè']],
+    '淤泥': [['yū'], ['ní']],
+    '淤血': [['yū'], ['xuè']],
+    '淫雨': [['yín'], ['yǔ']],
+    '深切': [['shēn'], ['qiè']],
+    '深化': [['shēn'], ['huà']],
+    '深巷': [['shēn'], ['xiàng']],
+    '深广': [['shēn'], ['guǎng']],
+    '深度': [['shēn'], ['dù']],
+    '深思': [['shēn'], ['sī']],
+    '深浅': [['shēn'], ['qiǎn']],
+    '深省': [['shēn'], ['xǐng']],
+    '深长': [['shēn'], ['cháng']],
+    '淳于': [['chún'], ['yú']],
+    '淳化': [['chún'], ['huà']],
+    '淳厚': [['chún'], ['hòu']],
+    '淳美': [['chún'], ['měi']],
+    '混和': [['hùn'], ['hé']],
+    '混子': [['hùn'], ['zǐ']],
+    '混帐': [['hùn'], ['zhàng']],
+    '混活': [['hún'], ['huó']],
+    '混浊': [['hún'], ['zhuó']],
+    '混混': [['hùn'], ['hùn']],
+    '混血': [['hùn'], ['xuè']],
+    '混饭': [['hùn'], ['fàn']],
+    '淹埋': [['yān'], ['mái']],
+    '淹没': [['yān'], ['mò']],
+    '淹溺': [['yān'], ['nì']],
+    '添丁': [['tiān'], ['dīng']],
+    '清寒': [['qīng'], ['hán']],
+    '渐染': [['jiān'], ['rǎn']],
+    '渐洳': [['jiān'], ['rù']],
+    '渐渍': [['jiān'], ['zì']],
+    '渑池': [['miǎn'], ['chí']],
+    '渠道': [['qú'], ['dào']],
+    '渡头': [['dù'], ['tóu']],
+    '温和': [['wēn'], ['hé']],
+    '温宿': [['wēn'], ['sù']],
+    '温差': [['wēn'], ['chà']],
+    '温度': [['wēn'], ['dù']],
+    '温觉': [['wēn'], ['jué']],
+    '港元': [['gǎng'], ['yuán']],
+    '港务': [['gǎng'], ['wù']],
+    '港口': [['gǎng'], ['kǒu']],
+    '港商': [['gǎng'], ['shāng']],
+    '港客': [['gǎng'], ['kè']],
+    '港币': [['gǎng'], ['bì']],
+    '港汊': [['gǎng'], ['chà']],
+    '港湾': [['gǎng'], ['wān']],
+    '港澳': [['gǎng'], ['ào']],
+    '港警': [['gǎng'], ['jǐng']],
+    '游兴': [['yóu'], ['xìng']],
+    '游说': [['yóu'], ['shuì']],
+    '湔洗': [['jiān'], ['xǐ']],
+    '湖北': [['hú'], ['běi']],
+    '湖南': [['hú'], ['nán']],
+    '湖广': [['hú'], ['guǎng']],
+    '湖泊': [['hú'], ['pō']],
+    '湘语': [['xiāng'], ['yǔ']],
+    '湫隘': [['jiǎo'], ['ài']],
+    '湮没': [['yān'], ['mò']],
+    '湮灭': [['yān'], ['miè']],
+    '湾头': [['wān'], ['tóu']],
+    '湾泊': [['wān'], ['bó']],
+    '湿地': [['shī'], ['dì']],
+    '湿度': [['shī'], ['dù']],
+    '溃乱': [['kuì'], ['luàn']],
+    '溃兵': [['kuì'], ['bīng']],
+    '溃军': [['kuì'], ['jūn']],
+    '溃决': [['kuì'], ['jué']],
+    '溃围': [['kuì'], ['wéi']],
+    '溃散': [['kuì'], ['sàn']],
+    '溃灭': [['kuì'], ['miè']],
+    '溃烂': [['kuì'], ['làn']],
+    '溃疡': [['kuì'], ['yáng']],
+    '溃脓': [['huì'], ['nóng']],
+    '溃败': [['kuì'], ['bài']],
+    '溃退': [['kuì'], ['tuì']],
+    '溃逃': [['kuì'], ['táo']],
+    '溅射': [['jiàn'], ['shè']],
+    '溅水': [['jiàn'], ['shuǐ']],
+    '溅污': [['jiàn'], ['wū']],
+    '溅湿': [['jiàn'], ['shī']],
+    '溅落': [['jiàn'], ['luò']],
+    '溏便': [['táng'], ['biàn']],
+    '源地': [['yuán'], ['dì']],
+    '源头': [['yuán'], ['tóu']],
+    '溜光': [['liū'], ['guāng']],
+    '溜冰': [['liū'], ['bīng']],
+    '溜号': [['liū'], ['hào']],
+    '溜圆': [['liū'], ['yuán']],
+    '溜子': [['liū'], ['zǐ']],
+    '溜开': [['liū'], ['kāi']],
+    '溜掉': [['liū'], ['diào']],
+    '溜槽': [['liū'], ['cáo']],
+    '溜溜': [['liū'], ['liū']],
+    '溜滑': [['liū'], ['huá']],
+    '溜索': [['liū'], ['suǒ']],
+    '溜走': [['liū'], ['zǒu']],
+    '溜边': [['liū'], ['biān']],
+    '溜达': [['liū'], ['dá']],
+    '溢价': [['yì'], ['jià']],
+    '溵溜': [['yīn'], ['liū']],
+    '溶化': [['róng'], ['huà']],
+    '溶合': [['róng'], ['hé']],
+    '溶斗': [['róng'], ['dòu']],
+    '溶血': [['róng'], ['xuè']],
+    '溶解': [['róng'], ['jiě']],
+    '溺婴': [['nì'], ['yīng']],
+    '溺死': [['nì'], ['sǐ']],
+    '溺水': [['nì'], ['shuǐ']],
+    '溺爱': [['nì'], ['ài']],
+    '滋长': [['zī'], ['zhǎng']],
+    '滑头': [['huá'], ['tóu']],
+    '滑溜': [['huá'], ['liū']],
+    '滑石': [['huá'], ['shí']],
+    '滑稽': [['huá'], ['jī']],
+    '滑落': [['huá'], ['luò']],
+    '滑行': [['huá'], ['xíng']],
+    '滑车': [['huá'], ['chē']],
+    '滚落': [['gǔn'], ['luò']],
+    '满分': [['mǎn'], ['fēn']],
+    '满员': [['mǎn'], ['yuán']],
+    '满处': [['mǎn'], ['chǔ']],
+    '满期': [['mǎn'], ['qī']],
+    '满载': [['mǎn'], ['zài']],
+    '滤过': [['lǜ'], ['guò']],
+    '滥调': [['làn'], ['diào']],
+    '滩地': [['tān'], ['dì']],
+    '滩头': [['tān'], ['tóu']],
+    '滴答': [['dī'], ['dá']],
+    '漂亮': [['piào'], ['liàng']],
+    '漂儿': [['piāo'], ['ér']],
+    '漂染': [['piǎo'], ['rǎn']],
+    '漂泊': [['piāo'], ['bó']],
+    '漂洗': [['piǎo'], ['xǐ']],
+    '漂流': [['piāo'], ['liú']],
+    '漂浮': [['piāo'], ['fú']],
+    '漂海': [['piāo'], ['hǎi']],
+    '漂游': [['piāo'], ['yóu']],
+    '漂漂': [['piāo'], ['piāo']],
+    '漂白': [['piǎo'], ['bái']],
+    '漂砾': [['piāo'], ['lì']],
+    '漂移': [['piāo'], ['yí']],
+    '漏斗': [['lòu'], ['dǒu']],
+    '漏泄': [['lòu'], ['xiè']],
+    '漏风': [['lòu'], ['fēng']],
+    '演化': [['yǎn'], ['huà']],
+    '演员': [['yǎn'], ['yuán']],
+    '演戏': [['yǎn'], ['xì']],
+    '演说': [['yǎn'], ['shuō']],
+    '漠北': [['mò'], ['běi']],
+    '漠南': [['mò'], ['nán']],
+    '漩涡': [['xuán'], ['wō']],
+    '漫卷': [['màn'], ['juàn']],
+    '漫说': [['màn'], ['shuō']],
+    '漫长': [['màn'], ['cháng']],
+    '漯河': [['tà'], ['hé']],
+    '漱洗': [['shù'], ['xǐ']],
+    '潇洒': [['xiāo'], ['sǎ']],
+    '潜能': [['qián'], ['néng']],
+    '潜藏': [['qián'], ['cáng']],
+    '潜血': [['qián'], ['xuè']],
+    '潜行': [['qián'], ['xíng']],
+    '潦倒': [['liáo'], ['dǎo']],
+    '潦草': [['liáo'], ['cǎo']],
+    '潮头': [['cháo'], ['tóu']],
+    '潮差': [['cháo'], ['chā']],
+    '潮涌': [['cháo'], ['yǒng']],
+    '潮红': [['cháo'], ['hóng']],
+    '潮解': [['cháo'], ['jiě']],
+    '澄净': [['chéng'], ['jìng']],
+    '澄明': [['chéng'], ['míng']],
+    '澄江': [['chéng'], ['jiāng']],
+    '澄汰': [['dèng'], ['tài']],
+    '澄沙': [['dèng'], ['shā']],
+    '澄清': [['chéng'], ['qīng']],
+    '澄澈': [['chéng'], ['chè']],
+    '澄碧': [['chéng'], ['bì']],
+    '澄结': [['dèng'], ['jié']],
+    '澄莹': [['chéng'], ['yíng']],
+    '澹台': [['tán'], ['tái']],
+    '澹澹': [['dàn'], ['dàn']],
+    '激切': [['jī'], ['qiè']],
+    '激化': [['jī'], ['huà']],
+    '激发': [['jī'], ['fā']],
+    '激将': [['jī'], ['jiàng']],
+    '濯濯': [['zhuó'], ['zhuó']],
+    '瀑布': [['pù'], ['bù']],
+    '瀛台': [['yíng'], ['tái']],
+    '灌区': [['guàn'], ['qū']],
+    '灌洗': [['guàn'], ['xǐ']],
+    '灌浆': [['guàn'], ['jiāng']],
+    '灌渠': [['guàn'], ['qú']],
+    '火化': [['huǒ'], ['huà']],
+    '火场': [['huǒ'], ['chǎng']],
+    '火夫': [['huǒ'], ['fū']],
+    '火头': [['huǒ'], ['tóu']],
+    '火并': [['huǒ'], ['bìng']],
+    '火把': [['huǒ'], ['bǎ']],
+    '火捻': [['huǒ'], ['niǎn']],
+    '火炮': [['huǒ'], ['pào']],
+    '火石': [['huǒ'], ['shí']],
+    '火种': [['huǒ'], ['zhǒng']],
+    '火笼': [['huǒ'], ['lóng']],
+    '火红': [['huǒ'], ['hóng']],
+    '火车': [['huǒ'], ['chē']],
+    '灭亡': [['miè'], ['wáng']],
+    '灭种': [['miè'], ['zhǒng']],
+    '灭菌': [['miè'], ['jūn']],
+    '灯会': [['dēng'], ['huì']],
+    '灯台': [['dēng'], ['tái']],
+    '灯头': [['dēng'], ['tóu']],
+    '灯捻': [['dēng'], ['niǎn']],
+    '灯晕': [['dēng'], ['yùn']],
+    '灯泡': [['dēng'], ['pào']],
+    '灯笼': [['dēng'], ['lóng']],
+    '灯节': [['dēng'], ['jié']],
+    '灯芯': [['dēng'], ['xīn']],
+    '灯语': [['dēng'], ['yǔ']],
+    '灰分': [['huī'], ['fēn']],
+    '灰化': [['huī'], ['huà']],
+    '灰沙': [['huī'], ['shā']],
+    '灰浆': [['huī'], ['jiāng']],
+    '灵便': [['líng'], ['biàn']],
+    '灵猫': [['líng'], ['māo']],
+    '灵蛇': [['líng'], ['shé']],
+    '灵车': [['líng'], ['chē']],
+    '灶台': [['zào'], ['tái']],
+    '灶头': [['zào'], ['tou']],
+    '灶间': [['zào'], ['jiān']],
+    '灼见': [['zhuó'], ['jiàn']],
+    '灾区': [['zāi'], ['qū']],
+    '灾难': [['zāi'], ['nàn']],
+    '炉台': [['lú'], ['tái']],
+    '炎凉': [['yán'], ['liáng']],
+    '炎症': [['yán'], ['zhèng']],
+    '炕几': [['kàng'], ['jǐ']],
+    '炕头': [['kàng'], ['tóu']],
+    '炕梢': [['kàng'], ['shāo']],
+    '炫弄': [['xuàn'], ['nòng']],
+    '炭化': [['tàn'], ['huà']],
+    '炮仗': [['pào'], ['zhàng']],
+    '炮位': [['pào'], ['wèi']],
+    '炮兵': [['pào'], ['bīng']],
+    '炮击': [['pào'], ['jī']],
+    '炮制': [['páo'], ['zhì']],
+    '炮口': [['pào'], ['kǒu']],
+    '炮台': [['pào'], ['tái']],
+    '炮塔': [['pào'], ['tǎ']],
+    '炮座': [['pào'], ['zuò']],
+    '炮弹': [['pào'], ['dàn']],
+    '炮手': [['pào'], ['shǒu']],
+    '炮楼': [['pào'], ['lóu']],
+    '炮火': [['pào'], ['huǒ']],
+    '炮灰': [['pào'], ['huī']],
+    '炮烙': [['páo'], ['luò']],
+    '炮眼': [['pào'], ['yǎn']],
+    '炮竹': [['pào'], ['zhú']],
+    '炮膛': [['pào'], ['táng']],
+    '炮舰': [['pào'], ['jiàn']],
+    '炮艇': [['pào'], ['tǐng']],
+    '炮衣': [['pào'], ['yī']],
+    '炮车': [['pào'], ['chē']],
+    '炸弹': [['zhà'], ['dàn']],
+    '炸毁': [['zhà'], ['huǐ']],
+    '炸破': [['zhà'], ['pò']],
+    '炸碎': [['zhà'], ['suì']],
+    '炸窝': [['zhà'], ['wō']],
+    '炸糕': [['zhá'], ['gāo']],
+    '炸药': [['zhà'], ['yào']],
+    '炸虾': [['zhá'], ['xiā']],
+    '炸裂': [['zhà'], ['liè']],
+    '炸酱': [['zhá'], ['jiàng']],
+    '炸锅': [['zhà'], ['guō']],
+    '炸雷': [['zhà'], ['léi']],
+    '炸鱼': [['zhá'], ['yú']],
+    '点化': [['diǎn'], ['huà']],
+    '点发': [['diǎn'], ['fā']],
+    '点号': [['diǎn'], ['hào']],
+    '点头': [['diǎn'], ['tóu']],
+    '点射': [['diǎn'], ['shè']],
+    '点将': [['diǎn'], ['jiàng']],
+    '点数': [['diǎn'], ['shù']],
+    '点着': [['diǎn'], ['zháo']],
+    '点种': [['diǎn'], ['zhòng']],
+    '炼句': [['liàn'], ['jù']],
+    '炼钢': [['liàn'], ['gāng']],
+    '炽盛': [['chì'], ['shèng']],
+    '烂泥': [['làn'], ['ní']],
+    '烂糊': [['làn'], ['hú']],
+    '烈女': [['liè'], ['nǚ']],
+    '烈属': [['liè'], ['shǔ']],
+    '烈度': [['liè'], ['dù']],
+    '烘干': [['hōng'], ['gān']],
+    '烘笼': [['hōng'], ['lóng']],
+    '烙印': [['lào'], ['yìn']],
+    '烙痕': [['lào'], ['hén']],
+    '烙花': [['lào'], ['huā']],
+    '烙铁': [['lào'], ['tiě']],
+    '烙饼': [['lào'], ['bǐng']],
+    '烛台': [['zhú'], ['tái']],
+    '烟卷': [['yān'], ['juàn']],
+    '烟叶': [['yān'], ['yè']],
+    '烟头': [['yān'], ['tóu']],
+    '烟斗': [['yān'], ['dǒu']],
+    '烟杆': [['yān'], ['gǎn']],
+    '烟毒': [['yān'], ['dú']],
+    '烟泡': [['yān'], ['pào']],
+    '烟熏': [['yān'], ['xūn']],
+    '烟筒': [['yān'], ['tóng']],
+    '烟膏': [['yān'], ['gāo']],
+    '烟雨': [['yān'], ['yǔ']],
+    '烦闷': [['fán'], ['mèn']],
+    '烦难': [['fán'], ['nán']],
+    '烧化': [['shāo'], ['huà']],
+    '烧结': [['shāo'], ['jié']],
+    '烫发': [['tàng'], ['fà']],
+    '烫头': [['tàng'], ['tóu']],
+    '烫洗': [['tàng'], ['xǐ']],
+    '热中': [['rè'], ['zhōng']],
+    '热切': [['rè'], ['qiè']],
+    '热化': [['rè'], ['huà']],
+    '热和': [['rè'], ['huo']],
+    '热地': [['rè'], ['dì']],
+    '热度': [['rè'], ['dù']],
+    '热毒': [['rè'], ['dú']],
+    '热汤': [['rè'], ['tāng']],
+    '热症': [['rè'], ['zhèng']],
+    '热络': [['rè'], ['luò']],
+    '热能': [['rè'], ['néng']],
+    '热血': [['rè'], ['xuè']],
+    '热量': [['rè'], ['liàng']],
+    '烹调': [['pēng'], ['tiáo']],
+    '焊缝': [['hàn'], ['fèng']],
+    '焙干': [['bèi'], ['gān']],
+    '焚化': [['fén'], ['huà']],
+    '焚风': [['fén'], ['fēng']],
+    '焦化': [['jiāo'], ['huà']],
+    '焦干': [['jiāo'], ['gān']],
+    '焦思': [['jiāo'], ['sī']],
+    '焦糊': [['jiāo'], ['hú']],
+    '煎炸': [['jiān'], ['zhá']],
+    '煎熬': [['jiān'], ['áo']],
+    '煞住': [['shā'], ['zhù']],
+    '煞尾': [['shā'], ['wěi']],
+    '煞星': [['shà'], ['xīng']],
+    '煞气': [['shà'], ['qì']],
+    '煞白': [['shà'], ['bái']],
+    '煞神': [['shà'], ['shén']],
+    '煞笔': [['shā'], ['bǐ']],
+    '煞车': [['shā'], ['chē']],
+    '煤毒': [['méi'], ['dú']],
+    '煤熏': [['méi'], ['xùn']],
+    '照会': [['zhào'], ['huì']],
+    '照发': [['zhào'], ['fā']],
+    '照射': [['zhào'], ['shè']],
+    '照应': [['zhào'], ['yìng']],
+    '照度': [['zhào'], ['dù']],
+    '照拂': [['zhào'], ['fú']],
+    '照片': [['zhào'], ['piān']],
+    '照相': [['zhào'], ['xiàng']],
+    '照看': [['zhào'], ['kàn']],
+    '照见': [['zhào'], ['jiàn']],
+    '照说': [['zhào'], ['shuō']],
+    '熊猫': [['xióng'], ['māo']],
+    '熏倒': [['xùn'], ['dǎo']],
+    '熏制': [['xūn'], ['zhì']],
+    '熏染': [['xūn'], ['rǎn']],
+    '熏熏': [['xūn'], ['xūn']],
+    '熏着': [['xùn'], ['zháo']],
+    '熏蒸': [['xūn'], ['zhēng']],
+    '熏透': [['xùn'], ['tòu']],
+    '熏陶': [['xūn'], ['táo']],
+    '熏风': [['xūn'], ['fēng']],
+    '熏香': [['xūn'], ['xiāng']],
+    '熔化': [['róng'], ['huà']],
+    '熔解': [['róng'], ['jiě']],
+    '熙和': [['xī'], ['hé']],
+    '熟化': [['shú'], ['huà']],
+    '熟地': [['shú'], ['dì']],
+    '熟思': [['shú'], ['sī']],
+    '熟知': [['shú'], ['zhī']],
+    '熟识': [['shú'], ['shí']],
+    '熟语': [['shú'], ['yǔ']],
+    '熟食': [['shú'], ['shí']],
+    '熨帖': [['yù'], ['tiē']],
+    '熨斗': [['yùn'], ['dǒu']],
+    '熨烫': [['yùn'], ['tàng']],
+    '熬夜': [['áo'], ['yè']],
+    '熬心': [['áo'], ['xīn']],
+    '熬煎': [['áo'], ['jiān']],
+    '熬熬': [['áo'], ['áo']],
+    '燎原': [['liáo'], ['yuán']],
+    '燎泡': [['liáo'], ['pào']],
+    '燕京': [['yān'], ['jīng']],
+    '燕儿': [['yàn'], ['ér']],
+    '燕子': [['yàn'], ['zi']],
+    '燕尔': [['yàn'], ['ěr']],
+    '燕尾': [['yàn'], ['wěi']],
+    '燕居': [['yàn'], ['jū']],
+    '燕山': [['yān'], ['shān']],
+    '燕窝': [['yàn'], ['wō']],
+    '燕赵': [['yān'], ['zhào']],
+    '燕雀': [['yàn'], ['què']],
+    '燕麦': [['yān'], ['mài']],
+    '燥裂': [['zào'], ['liè']],
+    '燧石': [['suì'], ['shí']],
+    '爆发': [['bào'], ['fā']],
+    '爆炸': [['bào'], ['zhà']],
+    '爆裂': [['bào'], ['liè']],
+    '爪儿': [['zhuǎ'], ['ér']],
+    '爪哇': [['zhǎo'], ['wā']],
+    '爪子': [['zhuǎ'], ['zǐ']],
+    '爪牙': [['zhǎo'], ['yá']],
+    '爬行': [['pá'], ['xíng']],
+    '爱好': [['ài'], ['hào']],
+    '爱称': [['ài'], ['chēng']],
+    '父业': [['fù'], ['yè']],
+    '父亲': [['fù'], ['qīn']],
+    '父兄': [['fù'], ['xiōng']],
+    '父子': [['fù'], ['zǐ']],
+    '父执': [['fù'], ['zhí']],
+    '父本': [['fù'], ['běn']],
+    '父权': [['fù'], ['quán']],
+    '父母': [['fù'], ['mǔ']],
+    '父系': [['fù'], ['xì']],
+    '父老': [['fù'], ['lǎo']],
+    '父辈': [['fù'], ['bèi']],
+    '片儿': [['piān'], ['er']],
+    '片刻': [['piàn'], ['kè']],
+    '片剂': [['piàn'], ['jì']],
+    '片头': [['piān'], ['tóu']],
+    '片子': [['piān'], ['zi']],
+    '片断': [['piàn'], ['duàn']],
+    '片时': [['piàn'], ['shí']],
+    '片段': [['piàn'], ['duàn']],
+    '片言': [['piàn'], ['yán']],
+    '片语': [['piàn'], ['yǔ']],
+    '片酬': [['piàn'], ['chóu']],
+    '片面': [['piàn'], ['miàn']],
+    '版筑': [['bǎn'], ['zhù']],
+    '牌价': [['pái'], ['jià']],
+    '牌号': [['pái'], ['hào']],
+    '牌坊': [['pái'], ['fāng']],
+    '牌子': [['pái'], ['zi']],
+    '牙刷': [['yá'], ['shuā']],
+    '牙石': [['yá'], ['shí']],
+    '牙碜': [['yá'], ['chěn']],
+    '牙缝': [['yá'], ['fèng']],
+    '牙膏': [['yá'], ['gāo']],
+    '牙龈': [['yá'], ['yín']],
+    '牛仔': [['niú'], ['zǎi']],
+    '牛劲': [['niú'], ['jìn']],
+    '牛头': [['niú'], ['tóu']],
+    '牛扒': [['niú'], ['bā']],
+    '牛排': [['niú'], ['pái']],
+    '牛肚': [['niú'], ['dǔ']],
+    '牛角': [['niú'], ['jiǎo']],
+    '牛车': [['niú'], ['chē']],
+    '牛郎': [['niú'], ['láng']],
+    '牛鞅': [['niú'], ['yàng']],
+    '牟利': [['móu'], ['lì']],
+    '牟取': [['móu'], ['qǔ']],
+    '牟平': [['mù'], ['píng']],
+    '牢度': [['láo'], ['dù']],
+    '牢笼': [['láo'], ['lóng']],
+    '牢骚': [['láo'], ['sāo']],
+    '牧区': [['mù'], ['qū']],
+    '牧地': [['mù'], ['dì']],
+    '牧场': [['mù'], ['chǎng']],
+    '牧畜': [['mù'], ['chù']],
+    '物价': [['wù'], ['jià']],
+    '物体': [['wù'], ['tǐ']],
+    '物化': [['wù'], ['huà']],
+    '物华': [['wù'], ['huá']],
+    '物种': [['wù'], ['zhǒng']],
+    '牲畜': [['shēng'], ['chù']],
+    '牵头': [['qiān'], ['tóu']],
+    '牵强': [['qiān'], ['qiǎng']],
+    '牵拉': [['qiān'], ['lā']],
+    '牵系': [['qiān'], ['xì']],
+    '牵累': [['qiān'], ['lěi']],
+    '特为': [['tè'], ['wèi']],
+    '特价': [['tè'], ['jià']],
+    '特别': [['tè'], ['bié']],
+    '特区': [['tè'], ['qū']],
+    '特地': [['tè'], ['dì']],
+    '特徵': [['tè'], ['zhǐ']],
+    '特有': [['tè'], ['yǒu']],
+    '特种': [['tè'], ['zhǒng']],
+    '特约': [['tè'], ['yuē']],
+    '特许': [['tè'], ['xǔ']],
+    '特长': [['tè'], ['cháng']],
+    '犀角': [['xī'], ['jiǎo']],
+    '犄角': [['jī'], ['jiǎo']],
+    '犍为': [['qián'], ['wéi']],
+    '犍牛': [['jiān'], ['niú']],
+    '犟劲': [['jiàng'], ['jìn']],
+    '犯上': [['fàn'], ['shàng']],
+    '犯疑': [['fàn'], ['yí']],
+    '犯禁': [['fàn'], ['jìn']],
+    '犯难': [['fàn'], ['nán']],
+    '状语': [['zhuàng'], ['yǔ']],
+    '犹大': [['yóu'], ['dà']],
+    '犹疑': [['yóu'], ['yí']],
+    '犹若': [['yóu'], ['ruò']],
+    '狂奔': [['kuáng'], ['bēn']],
+    '狂暴': [['kuáng'], ['bào']],
+    '狂风': [['kuáng'], ['fēng']],
+    '狐疑': [['hú'], ['yí']],
+    '狐臊': [['hú'], ['sāo']],
+    '狐臭': [['hú'], ['chòu']],
+    '狗头': [['gǒu'], ['tóu']],
+    '狞恶': [['níng'], ['è']],
+    '狠劲': [['hěn'], ['jìn']],
+    '狠毒': [['hěn'], ['dú']],
+    '独个': [['dú'], ['gè']],
+    '独体': [['dú'], ['tǐ']],
+    '独创': [['dú'], ['chuàng']],
+    '独占': [['dú'], ['zhàn']],
+    '独处': [['dú'], ['chǔ']],
+    '独夫': [['dú'], ['fū']],
+    '独女': [['dú'], ['nǚ']],
+    '独家': [['dú'], ['jiā']],
+    '独有': [['dú'], ['yǒu']],
+    '独行': [['dú'], ['xíng']],
+    '独角': [['dú'], ['jiǎo']],
+    '狭巷': [['xiá'], ['xiàng']],
+    '狭缝': [['xiá'], ['fèng']],
+    '狭长': [['xiá'], ['cháng']],
+    '狮子': [['shī'], ['zi']],
+    '狱卒': [['yù'], ['zú']],
+    '狴犴': [['bì'], ['àn']],
+    '狸猫': [['lí'], ['māo']],
+    '狼头': [['láng'], ['tóu']],
+    '狼毒': [['láng'], ['dú']],
+    '狼藉': [['láng'], ['jí']],
+    '猛可': [['měng'], ['kě']],
+    '猛将': [['měng'], ['jiàng']],
+    '猜度': [['cāi'], ['duó']],
+    '猜着': [['cāi'], ['zháo']],
+    '猩红': [['xīng'], ['hóng']],
+    '猪排': [['zhū'], ['pái']],
+    '猪肚': [['zhū'], ['dǔ']],
+    '献上': [['xiàn'], ['shàng']],
+    '献血': [['xiàn'], ['xuè']],
+    '猴头': [['hóu'], ['tóu']],
+    '猴子': [['hóu'], ['zi']],
+    '猴戏': [['hóu'], ['xì']],
+    '猴王': [['hóu'], ['wáng']],
+    '獐子': [['zhāng'], ['zi']],
+    '獭祭': [['tǎ'], ['jì']],
+    '玄参': [['xuán'], ['cān']],
+    '玄奥': [['xuán'], ['ào']],
+    '玄孙': [['xuán'], ['sūn']],
+    '玄思': [['xuán'], ['sī']],
+    '玄秘': [['xuán'], ['mì']],
+    '玄远': [['xuán'], ['yuǎn']],
+    '率先': [['shuài'], ['xiān']],
+    '率军': [['shuài'], ['jūn']],
+    '率尔': [['shuài'], ['ěr']],
+    '率性': [['shuài'], ['xìng']],
+    '率然': [['shuài'], ['rán']],
+    '率直': [['shuài'], ['zhí']],
+    '率真': [['shuài'], ['zhēn']],
+    '率队': [['shuài'], ['duì']],
+    '率领': [['shuài'], ['lǐng']],
+    '玉体': [['yù'], ['tǐ']],
+    '玉佛': [['yù'], ['fó']],
+    '玉女': [['yù'], ['nǚ']],
+    '玉石': [['yù'], ['shí']],
+    '玉食': [['yù'], ['shí']],
+    '王位': [['wáng'], ['wèi']],
+    '王侯': [['wáng'], ['hóu']],
+    '王储': [['wáng'], ['chǔ']],
+    '王八': [['wáng'], ['bā']],
+    '王公': [['wáng'], ['gōng']],
+    '王冠': [['wáng'], ['guān']],
+    '王台': [['wáng'], ['tái']],
+    '王后': [['wáng'], ['hòu']],
+    '王国': [['wáng'], ['guó']],
+    '王妃': [['wáng'], ['fēi']],
+    '王子': [['wáng'], ['zǐ']],
+    '王孙': [['wáng'], ['sūn']],
+    '王官': [['wáng'], ['guān']],
+    '王室': [['wáng'], ['shì']],
+    '王宫': [['wáng'], ['gōng']],
+    '王府': [['wáng'], ['fǔ']],
+    '王政': [['wáng'], ['zhèng']],
+    '王族': [['wáng'], ['zú']],
+    '王朝': [['wáng'], ['cháo']],
+    '王权': [['wáng'], ['quán']],
+    '王水': [['wáng'], ['shuǐ']],
+    '王法': [['wáng'], ['fǎ']],
+    '王浆': [['wáng'], ['jiāng']],
+    '王爷': [['wáng'], ['yé']],
+    '王牌': [['wáng'], ['pái']],
+    '王相': [['wáng'], ['xiāng']],
+    '王者': [['wáng'], ['zhě']],
+    '王蒙': [['wáng'], ['méng']],
+    '王蛇': [['wáng'], ['shé']],
+    '王道': [['wáng'], ['dào']],
+    '玩乐': [['wán'], ['lè']],
+    '玩兴': [['wán'], ['xìng']],
+    '玩弄': [['wán'], ['nòng']],
+    '环中': [['huán'], ['zhōng']],
+    '环伺': [['huán'], ['sì']],
+    '环合': [['huán'], ['hé']],
+    '环晕': [['huán'], ['yùn']],
+    '环节': [['huán'], ['jié']],
+    '环行': [['huán'], ['xíng']],
+    '环食': [['huán'], ['shí']],
+    '现任': [['xiàn'], ['rèn']],
+    '现地': [['xiàn'], ['dì']],
+    '现场': [['xiàn'], ['chǎng']],
+    '现有': [['xiàn'], ['yǒu']],
+    '现期': [['xiàn'], ['qī']],
+    '现行': [['xiàn'], ['xíng']],
+    '现量': [['xiàn'], ['liàng']],
+    '珍奇': [['zhēn'], ['qí']],
+    '珍藏': [['zhēn'], ['cáng']],
+    '珍重': [['zhēn'], ['zhòng']],
+    '珠蚌': [['zhū'], ['bàng']],
+    '珠被': [['zhū'], ['bèi']],
+    '班期': [['bān'], ['qī']],
+    '班禅': [['bān'], ['chán']],
+    '班车': [['bān'], ['chē']],
+    '班长': [['bān'], ['zhǎng']],
+    '球迷': [['qiú'], ['mí']],
+    '理发': [['lǐ'], ['fà']],
+    '琢磨': [['zuó'], ['mó']],
+    '琴曲': [['qín'], ['qǔ']],
+    '琼浆': [['qióng'], ['jiāng']],
+    '瑗珲': [['yuàn'], ['huī']],
+    '瑜伽': [['yú'], ['jiā']],
+    '瑟缩': [['sè'], ['suō']],
+    '瑰丽': [['guī'], ['lì']],
+    '瑰奇': [['guī'], ['qí']],
+    '璧还': [['bì'], ['huán']],
+    '瓜分': [['guā'], ['fēn']],
+    '瓜期': [['guā'], ['qī']],
+    '瓜片': [['guā'], ['piàn']],
+    '瓜葛': [['guā'], ['gé']],
+    '瓜蔓': [['guā'], ['wàn']],
+    '瓤子': [['ráng'], ['zi']],
+    '瓦全': [['wǎ'], ['quán']],
+    '瓦刀': [['wà'], ['dāo']],
+    '瓦匠': [['wǎ'], ['jiàng']],
+    '瓦器': [['wǎ'], ['qì']],
+    '瓦圈': [['wǎ'], ['quān']],
+    '瓦垄': [['wǎ'], ['lǒng']],
+    '瓦屋': [['wǎ'], ['wū']],
+    '瓦工': [['wǎ'], ['gōng']],
+    '瓦当': [['wǎ'], ['dāng']],
+    '瓦房': [['wǎ'], ['fáng']],
+    '瓦斯': [['wǎ'], ['sī']],
+    '瓦松': [['wǎ'], ['sōng']],
+    '瓦楞': [['wǎ'], ['léng']],
+    '瓦沟': [['wǎ'], ['gōu']],
+    '瓦片': [['wǎ'], ['piàn']],
+    '瓦特': [['wǎ'], ['tè']],
+    '瓦盆': [['wǎ'], ['pén']],
+    '瓦砾': [['wǎ'], ['lì']],
+    '瓦窑': [['wǎ'], ['yáo']],
+    '瓦罐': [['wǎ'], ['guàn']],
+    '瓦舍': [['wǎ'], ['shè']],
+    '瓦蓝': [['wǎ'], ['lán']],
+    '瓦解': [['wǎ'], ['jiě']],
+    '瓶塞': [['píng'], ['sāi']],
+    '瓶子': [['píng'], ['zi']],
+    '瓶颈': [['píng'], ['jǐng']],
+    '甄别': [['zhēn'], ['bié']],
+    '甘休': [['gān'], ['xiū']],
+    '甘当': [['gān'], ['dāng']],
+    '甘结': [['gān'], ['jié']],
+    '甘雨': [['gān'], ['yǔ']],
+    '甘露': [['gān'], ['lù']],
+    '甚且': [['shèn'], ['qiě']],
+    '甚为': [['shèn'], ['wéi']],
+    '甚么': [['shèn'], ['me']],
+    '甚或': [['shèn'], ['huò']],
+    '甚而': [['shèn'], ['ér']],
+    '甚至': [['shèn'], ['zhì']],
+    '生分': [['shēng'], ['fēn']],
+    '生化': [['shēng'], ['huà']],
+    '生发': [['shēng'], ['fà']],
+    '生员': [['shēng'], ['yuán']],
+    '生地': [['shēng'], ['dì']],
+    '生殖': [['shēng'], ['zhí']],
+    '生父': [['shēng'], ['fù']],
+    '生番': [['shēng'], ['fān']],
+    '生疑': [['shēng'], ['yí']],
+    '生肖': [['shēng'], ['xiào']],
+    '生角': [['shēng'], ['jué']],
+    '生趣': [['shēng'], ['qù']],
+    '生还': [['shēng'], ['huán']],
+    '生长': [['shēng'], ['zhǎng']],
+    '生鲜': [['shēng'], ['xiān']],
+    '甥女': [['shēng'], ['nǚ']],
+    '用劲': [['yòng'], ['jìn']],
+    '用地': [['yòng'], ['dì']],
+    '用场': [['yòng'], ['chǎng']],
+    '用处': [['yòng'], ['chǔ']],
+    '用度': [['yòng'], ['dù']],
+    '用语': [['yòng'], ['yǔ']],
+    '田地': [['tián'], ['dì']],
+    '田头': [['tián'], ['tóu']],
+    '田契': [['tián'], ['qì']],
+    '田家': [['tián'], ['jiā']],
+    '田父': [['tián'], ['fǔ']],
+    '田舍': [['tián'], ['shè']],
+    '田间': [['tián'], ['jiān']],
+    '由头': [['yóu'], ['tou']],
+    '由得': [['yóu'], ['de']],
+    '甲壳': [['jiǎ'], ['qiào']],
+    '甲骨': [['jiǎ'], ['gǔ']],
+    '申令': [['shēn'], ['lìng']],
+    '申曲': [['shēn'], ['qǔ']],
+    '申论': [['shēn'], ['lùn']],
+    '申说': [['shēn'], ['shuō']],
+    '电价': [['diàn'], ['jià']],
+    '电传': [['diàn'], ['chuán']],
+    '电信': [['diàn'], ['xìn']],
+    '电刨': [['diàn'], ['bào']],
+    '电厂': [['diàn'], ['chǎng']],
+    '电压': [['diàn'], ['yā']],
+    '电台': [['diàn'], ['tái']],
+    '电场': [['diàn'], ['chǎng']],
+    '电大': [['diàn'], ['dà']],
+    '电扇': [['diàn'], ['shàn']],
+    '电教': [['diàn'], ['jiào']],
+    '电晕': [['diàn'], ['yūn']],
+    '电杆': [['diàn'], ['gān']],
+    '电椅': [['diàn'], ['yǐ']],
+    '电石': [['diàn'], ['shí']],
+    '电磨': [['diàn'], ['mò']],
+    '电能': [['diàn'], ['néng']],
+    '电荷': [['diàn'], ['hè']],
+    '电解': [['diàn'], ['jiě']],
+    '电车': [['diàn'], ['chē']],
+    '电量': [['diàn'], ['liàng']],
+    '电钻': [['diàn'], ['zuàn']],
+    '男丁': [['nán'], ['dīng']],
+    '男仆': [['nán'], ['pú']],
+    '男女': [['nán'], ['nǚ']],
+    '男家': [['nán'], ['jiā']],
+    '甸子': [['diàn'], ['zǐ']],
+    '画卷': [['huà'], ['juàn']],
+    '画夹': [['huà'], ['jiā']],
+    '画家': [['huà'], ['jiā']],
+    '画屏': [['huà'], ['píng']],
+    '画帖': [['huà'], ['tiè']],
+    '画片': [['huà'], ['piān']],
+    '画论': [['huà'], ['lùn']],
+    '画轴': [['huà'], ['zhóu']],
+    '畅行': [['chàng'], ['xíng']],
+    '界尺': [['jiè'], ['chǐ']],
+    '界石': [['jiè'], ['shí']],
+    '界约': [['jiè'], ['yuē']],
+    '界说': [['jiè'], ['shuō']],
+    '畏服': [['wèi'], ['fú']],
+    '畏缩': [['wèi'], ['suō']],
+    '畏难': [['wèi'], ['nán']],
+    '留任': [['liú'], ['rèn']],
+    '留传': [['liú'], ['chuán']],
+    '留别': [['liú'], ['bié']],
+    '留宿': [['liú'], ['sù']],
+    '留待': [['liú'], ['dài']],
+    '留种': [['liú'], ['zhǒng']],
+    '留空': [['liú'], ['kòng']],
+    '留落': [['liú'], ['luò']],
+    '留难': [['liú'], ['nàn']],
+    '畚斗': [['běn'], ['dòu']],
+    '畜产': [['xù'], ['chǎn']],
+    '畜养': [['xù'], ['yǎng']],
+    '畜力': [['chù'], ['lì']],
+    '畜圈': [['chù'], ['juàn']],
+    '畜栏': [['chù'], ['lán']],
+    '畜牧': [['xù'], ['mù']],
+    '畜牲': [['chù'], ['shēng']],
+    '畜生': [['chù'], ['shēng']],
+    '畜疫': [['chù'], ['yì']],
+    '畜类': [['chù'], ['lèi']],
+    '畜肥': [['chù'], ['féi']],
+    '番号': [['fān'], ['hào']],
+    '番将': [['fān'], ['jiàng']],
+    '番椒': [['fān'], ['jiāo']],
+    '番瓜': [['fān'], ['guā']],
+    '番禺': [['pān'], ['yú']],
+    '番茄': [['fān'], ['qié']],
+    '番菜': [['fān'], ['cài']],
+    '番薯': [['fān'], ['shǔ']],
+    '番邦': [['fān'], ['bāng']],
+    '疆土': [['jiāng'], ['tǔ']],
+    '疆场': [['jiāng'], ['chǎng']],
+    '疆域': [['jiāng'], ['yù']],
+    '疆界': [['jiāng'], ['jiè']],
+    '疏勒': [['shū'], ['lè']],
+    '疏散': [['shū'], ['sàn']],
+    '疏浅': [['shū'], ['qiǎn']],
+    '疏浚': [['shū'], ['jùn']],
+    '疏落': [['shū'], ['luò']],
+    '疏解': [['shū'], ['jiě']],
+    '疑为': [['yí'], ['wéi']],
+    '疑义': [['yí'], ['yì']],
+    '疑云': [['yí'], ['yún']],
+    '疑似': [['yí'], ['sì']],
+    '疑兵': [['yí'], ['bīng']],
+    '疑团': [['yí'], ['tuán']],
+    '疑心': [['yí'], ['xīn']],
+    '疑忌': [['yí'], ['jì']],
+    '疑念': [['yí'], ['niàn']],
+    '疑惑': [['yí'], ['huò']],
+    '疑惧': [['yí'], ['jù']],
+    '疑案': [['yí'], ['àn']],
+    '疑点': [['yí'], ['diǎn']],
+    '疑窦': [['yí'], ['dòu']],
+    '疑虑': [['yí'], ['lǜ']],
+    '疑问': [['yí'], ['wèn']],
+    '疑阵': [['yí'], ['zhèn']],
+    '疑难': [['yí'], ['nán']],
+    '疔毒': [['dīng'], ['dú']],
+    '疖子': [['jiē'], ['zi']],
+    '疙疤': [['gē'], ['bā']],
+    '疙瘩': [['gē'], ['dā']],
+    '疟子': [['yào'], ['zǐ']],
+    '疟疾': [['nüè'], ['jí']],
+    '疟蚊': [['nüè'], ['wén']],
+    '疫区': [['yì'], ['qū']],
+    '疯枝': [['fēng'], ['zhī']],
+    '疯长': [['fēng'], ['zhǎng']],
+    '疲沓': [['pí'], ['tà']],
+    '疲累': [['pí'], ['lèi']],
+    '疾行': [['jí'], ['xíng']],
+    '病体': [['bìng'], ['tǐ']],
+    '病假': [['bìng'], ['jià']],
+    '病员': [['bìng'], ['yuán']],
+    '病毒': [['bìng'], ['dú']],
+    '病症': [['bìng'], ['zhèng']],
+    '病重': [['bìng'], ['zhòng']],
+    '病革': [['bìng'], ['jí']],
+    '症候': [['zhèng'], ['hòu']],
+    '症状': [['zhèng'], ['zhuàng']],
+    '症瘕': [['zhēng'], ['jiǎ']],
+    '症结': [['zhēng'], ['jié']],
+    '痛切': [['tòng'], ['qiè']],
+    '痛处': [['tòng'], ['chù']],
+    '痛恶': [['tòng'], ['wù']],
+    '痛打': [['tòng'], ['dǎ']],
+    '痛觉': [['tòng'], ['jué']],
+    '痞子': [['pǐ'], ['zi']],
+    '痱子': [['fèi'], ['zǐ']],
+    '痹症': [['bì'], ['zhèng']],
+    '瘀血': [['yū'], ['xuè']],
+    '瘅暑': [['dān'], ['shǔ']],
+    '瘅热': [['dān'], ['rè']],
+    '瘊子': [['hóu'], ['zi']],
+    '瘠薄': [['jí'], ['báo']],
+    '瘦削': [['shòu'], ['xuē']],
+    '瘦长': [['shòu'], ['cháng']],
+    '瘪三': [['biē'], ['sān']],
+    '瘸子': [['qué'], ['zi']],
+    '瘾头': [['yǐn'], ['tóu']],
+    '癌症': [['ái'], ['zhèng']],
+    '癖好': [['pǐ'], ['hào']],
+    '登台': [['dēng'], ['tái']],
+    '登场': [['dēng'], ['chǎng']],
+    '登载': [['dēng'], ['zǎi']],
+    '白丁': [['bái'], ['dīng']],
+    '白体': [['bái'], ['tǐ']],
+    '白净': [['bái'], ['jìng']],
+    '白区': [['bái'], ['qū']],
+    '白卷': [['bái'], ['juàn']],
+    '白发': [['bái'], ['fà']],
+    '白地': [['bái'], ['dì']],
+    '白头': [['bái'], ['tóu']],
+    '白术': [['bái'], ['zhú']],
+    '白条': [['bái'], ['tiáo']],
+    '白汤': [['bái'], ['tāng']],
+    '白相': [['bái'], ['xiàng']],
+    '白票': [['bái'], ['piào']],
+    '白种': [['bái'], ['zhǒng']],
+    '白苏': [['bái'], ['sū']],
+    '白蛇': [['bái'], ['shé']],
+    '白血': [['bái'], ['xuè']],
+    '白露': [['bái'], ['lù']],
+    '白食': [['bái'], ['shí']],
+    '白骨': [['bái'], ['gǔ']],
+    '百万': [['bǎi'], ['wàn']],
+    '百会': [['bǎi'], ['huì']],
+    '百分': [['bǎi'], ['fēn']],
+    '百叶': [['bǎi'], ['yè']],
+    '百合': [['bǎi'], ['hé']],
+    '百度': [['bǎi'], ['dù']],
+    '百戏': [['bǎi'], ['xì']],
+    '皂化': [['zào'], ['huà']],
+    '皂角': [['zào'], ['jiǎo']],
+    '皂隶': [['zào'], ['lì']],
+    '的哥': [['dī'], ['gē']],
+    '的士': [['dī'], ['shì']],
+    '的当': [['dí'], ['dàng']],
+    '的确': [['dí'], ['què']],
+    '皇上': [['huáng'], ['shàng']],
+    '皇亲': [['huáng'], ['qīn']],
+    '皇冠': [['huáng'], ['guān']],
+    '皇妃': [['huáng'], ['fēi']],
+    '皇家': [['huáng'], ['jiā']],
+    '皇朝': [['huáng'], ['cháo']],
+    '皋兰': [['gāo'], ['lán']],
+    '皮囊': [['pí'], ['náng']],
+    '皮夹': [['pí'], ['jiā']],
+    '皮尺': [['pí'], ['chǐ']],
+    '皮相': [['pí'], ['xiàng']],
+    '皮重': [['pí'], ['zhòng']],
+    '皱纹': [['zhòu'], ['wén']],
+    '皱缩': [['zhòu'], ['suō']],
+    '皴裂': [['cūn'], ['liè']],
+    '盆地': [['pén'], ['dì']],
+    '盆景': [['pén'], ['jǐng']],
+    '盆汤': [['pén'], ['tāng']],
+    '益发': [['yì'], ['fā']],
+    '益处': [['yì'], ['chù']],
+    '盐分': [['yán'], ['fèn']],
+    '盐场': [['yán'], ['chǎng']],
+    '监事': [['jiān'], ['shì']],
+    '监利': [['jiàn'], ['lì']],
+    '监制': [['jiān'], ['zhì']],
+    '监听': [['jiān'], ['tīng']],
+    '监场': [['jiān'], ['chǎng']],
+    '监守': [['jiān'], ['shǒu']],
+    '监察': [['jiān'], ['chá']],
+    '监工': [['jiān'], ['gōng']],
+    '监房': [['jiān'], ['fáng']],
+    '监护': [['jiān'], ['hù']],
+    '监押': [['jiān'], ['yā']],
+    '监控': [['jiān'], ['kòng']],
+    '监测': [['jiān'], ['cè']],
+    '监牢': [['jiān'], ['láo']],
+    '监犯': [['jiān'], ['fàn']],
+    '监狱': [['jiān'], ['yù']],
+    '监理': [['jiān'], ['lǐ']],
+    '监生': [['jiàn'], ['shēng']],
+    '监督': [['jiān'], ['dū']],
+    '监票': [['jiān'], ['piào']],
+    '监禁': [['jiān'], ['jìn']],
+    '监管': [['jiān'], ['guǎn']],
+    '监考': [['jiān'], ['kǎo']],
+    '监规': [['jiān'], ['guī']],
+    '监视': [['jiān'], ['shì']],
+    '监造': [['jiān'], ['zào']],
+    '监院': [['jiān'], ['yuàn']],
+    '盒子': [['hé'], ['zi']],
+    '盖世': [['gài'], ['shì']],
+    '盖头': [['gài'], ['tóu']],
+    '盖子': [['gài'], ['zi']],
+    '盖帘': [['gài'], ['lián']],
+    '盖造': [['gài'], ['zào']],
+    '盖饭': [['gài'], ['fàn']],
+    '盘子': [['pán'], ['zi']],
+    '盘曲': [['pán'], ['qū']],
+    '盘石': [['pán'], ['shí']],
+    '盛器': [['chéng'], ['qì']],
+    '盛菜': [['chéng'], ['cài']],
+    '盛饭': [['chéng'], ['fàn']],
+    '盟员': [['méng'], ['yuán']],
+    '盟约': [['méng'], ['yuē']],
+    '盥洗': [['guàn'], ['xǐ']],
+    '目的': [['mù'], ['dì']],
+    '目见': [['mù'], ['jiàn']],
+    '目论': [['mù'], ['lùn']],
+    '目语': [['mù'], ['yǔ']],
+    '盯梢': [['dīng'], ['shāo']],
+    '盱眙': [['xū'], ['yí']],
+    '盲从': [['máng'], ['cóng']],
+    '盲女': [['máng'], ['nǚ']],
+    '直冲': [['zhí'], ['chōng']],
+    '直射': [['zhí'], ['shè']],
+    '直尺': [['zhí'], ['chǐ']],
+    '直属': [['zhí'], ['shǔ']],
+    '直待': [['zhí'], ['dài']],
+    '直溜': [['zhí'], ['liū']],
+    '直率': [['zhí'], ['shuài']],
+    '直系': [['zhí'], ['xì']],
+    '直落': [['zhí'], ['luò']],
+    '直行': [['zhí'], ['xíng']],
+    '直观': [['zhí'], ['guān']],
+    '直觉': [['zhí'], ['jué']],
+    '直角': [['zhí'], ['jiǎo']],
+    '直说': [['zhí'], ['shuō']],
+    '相与': [['xiāng'], ['yǔ']],
+    '相中': [['xiāng'], ['zhòng']],
+    '相乘': [['xiāng'], ['chéng']],
+    '相书': [['xiāng'], ['shū']],
+    '相争': [['xiāng'], ['zhēng']],
+    '相互': [['xiāng'], ['hù']],
+    '相交': [['xiāng'], ['jiāo']],
+    '相亲': [['xiāng'], ['qīn']],
+    '相仿': [['xiāng'], ['fǎng']],
+    '相会': [['xiāng'], ['huì']],
+    '相传': [['xiāng'], ['chuán']],
+    '相伴': [['xiāng'], ['bàn']],
+    '相似': [['xiāng'], ['sì']],
+    '相位': [['xiàng'], ['wèi']],
+    '相依': [['xiāng'], ['yī']],
+    '相信': [['xiāng'], ['xìn']],
+    '相偕': [['xiāng'], ['xié']],
+    '相像': [['xiāng'], ['xiàng']],
+    '相克': [['xiāng'], ['kè']],
+    '相公': [['xiàng'], ['gōng']],
+    '相关': [['xiāng'], ['guān']],
+    '相册': [['xiàng'], ['cè']],
+    '相劝': [['xiāng'], ['quàn']],
+    '相助': [['xiāng'], ['zhù']],
+    '相去': [['xiāng'], ['qù']],
+    '相反': [['xiāng'], ['fǎn']],
+    '相合': [['xiāng'], ['hé']],
+    '相同': [['xiāng'], ['tóng']],
+    '相向': [['xiāng'], ['xiàng']],
+    '相命': [['xiāng'], ['mìng']],
+    '相商': [['xiāng'], ['shāng']],
+    '相国': [['xiàng'], ['guó']],
+    '相图': [['xiàng'], ['tú']],
+    '相士': [['xiàng'], ['shì']],
+    '相声': [['xiàng'], ['shēng']],
+    '相处': [['xiāng'], ['chǔ']],
+    '相契': [['xiāng'], ['qì']],
+    '相好': [['xiāng'], ['hǎo']],
+    '相安': [['xiāng'], ['ān']],
+    '相宜': [['xiāng'], ['yí']],
+    '相容': [['xiāng'], ['róng']],
+    '相对': [['xiāng'], ['duì']],
+    '相左': [['xiāng'], ['zuǒ']],
+    '相差': [['xiāng'], ['chà']],
+    '相帮': [['xiāng'], ['bāng']],
+    '相干': [['xiāng'], ['gān']],
+    '相应': [['xiāng'], ['yìng']],
+    '相异': [['xiāng'], ['yì']],
+    '相当': [['xiāng'], ['dāng']],
+    '相形': [['xiāng'], ['xíng']],
+    '相待': [['xiāng'], ['dài']],
+    '相得': [['xiāng'], ['de']],
+    '相态': [['xiāng'], ['tài']],
+    '相思': [['xiāng'], ['sī']],
+    '相恋': [['xiāng'], ['liàn']],
+    '相悖': [['xiāng'], ['bèi']],
+    '相悦': [['xiāng'], ['yuè']],
+    '相成': [['xiāng'], ['chéng']],
+    '相扑': [['xiàng'], ['pū']],
+    '相托': [['xiāng'], ['tuō']],
+    '相扰': [['xiāng'], ['rǎo']],
+    '相承': [['xiāng'], ['chéng']],
+    '相投': [['xiāng'], ['tóu']],
+    '相抵': [['xiāng'], ['dǐ']],
+    '相持': [['xiāng'], ['chí']],
+    '相接': [['xiāng'], ['jiē']],
+    '相撞': [['xiāng'], ['zhuàng']],
+    '相救': [['xiāng'], ['jiù']],
+    '相映': [['xiāng'], ['yìng']],
+    '相望': [['xiāng'], ['wàng']],
+    '相术': [['xiāng'], ['shù']],
+    '相机': [['xiàng'], ['jī']],
+    '相比': [['xiāng'], ['bǐ']],
+    '相沿': [['xiāng'], ['yán']],
+    '相烦': [['xiāng'], ['fán']],
+    '相熟': [['xiāng'], ['shú']],
+    '相爱': [['xiāng'], ['ài']],
+    '相片': [['xiàng'], ['piān']],
+    '相率': [['xiāng'], ['shuài']],
+    '相生': [['xiāng'], ['shēng']],
+    '相看': [['xiāng'], ['kàn']],
+    '相知': [['xiāng'], ['zhī']],
+    '相碰': [['xiāng'], ['pèng']],
+    '相称': [['xiāng'], ['chèn']],
+    '相符': [['xiāng'], ['fú']],
+    '相等': [['xiāng'], ['děng']],
+    '相类': [['xiāng'], ['lèi']],
+    '相约': [['xiāng'], ['yuē']],
+    '相纸': [['xiàng'], ['zhǐ']],
+    '相继': [['xiāng'], ['jì']],
+    '相聚': [['xiāng'], ['jù']],
+    '相若': [['xiāng'], ['ruò']],
+    '相见': [['xiāng'], ['jiàn']],
+    '相视': [['xiāng'], ['shì']],
+    '相角': [['xiàng'], ['jiǎo']],
+    '相认': [['xiāng'], ['rèn']],
+    '相让': [['xiāng'], ['ràng']],
+    '相许': [['xiāng'], ['xǔ']],
+    '相识': [['xiāng'], ['shí']],
+    '相貌': [['xiàng'], ['mào']],
+    '相距': [['xiāng'], ['jù']],
+    '相近': [['xiāng'], ['jìn']],
+    '相违': [['xiāng'], ['wéi']],
+    '相连': [['xiāng'], ['lián']],
+    '相通': [['xiāng'], ['tōng']],
+    '相逢': [['xiāng'], ['féng']],
+    '相遇': [['xiāng'], ['yù']],
+    '相邻': [['xiāng'], ['lín']],
+    '相配': [['xiāng'], ['pèi']],
+    '相间': [['xiāng'], ['jiàn']],
+    '相随': [['xiāng'], ['suí']],
+    '相隔': [['xiāng'], ['gé']],
+    '相面': [['xiàng'], ['miàn']],
+    '相顾': [['xiāng'], ['gù']],
+    '相马': [['xiàng'], ['mǎ']],
+    '盼头': [['pàn'], ['tou']],
+    '省事': [['shěng'], ['shì']],
+    '省亲': [['xǐng'], ['qīn']],
+    '省份': [['shěng'], ['fèn']],
+    '省会': [['shěng'], ['huì']],
+    '省便': [['shěng'], ['biàn']],
+    '省俭': [['shěng'], ['jiǎn']],
+    '省内': [['shěng'], ['nèi']],
+    '省力': [['shěng'], ['lì']],
+    '省却': [['shěng'], ['què']],
+    '省城': [['shěng'], ['chéng']],
+    '省墓': [['shěng'], ['mù']],
+    '省察': [['xǐng'], ['chá']],
+    '省府': [['shěng'], ['fǔ']],
+    '省得': [['shěng'], ['de']],
+    '省心': [['shěng'], ['xīn']],
+    '省悟': [['xǐng'], ['wù']],
+    '省治': [['shěng'], ['zhì']],
+    '省略': [['shěng'], ['lüè']],
+    '省视': [['xǐng'], ['shì']],
+    '省道': [['shěng'], ['dào']],
+    '省钱': [['shěng'], ['qián']],
+    '省长': [['shěng'], ['zhǎng']],
+    '眉头': [['méi'], ['tóu']],
+    '眉梢': [['méi'], ['shāo']],
+    '看上': [['kàn'], ['shàng']],
+    '看中': [['kàn'], ['zhòng']],
+    '看书': [['kàn'], ['shū']],
+    '看作': [['kàn'], ['zuò']],
+    '看做': [['kàn'], ['zuò']],
+    '看出': [['kàn'], ['chū']],
+    '看台': [['kàn'], ['tái']],
+    '看吧': [['kàn'], ['ba']],
+    '看头': [['kàn'], ['tou']],
+    '看好': [['kàn'], ['hǎo']],
+    '看守': [['kān'], ['shǒu']],
+    '看官': [['kàn'], ['guān']],
+    '看客': [['kàn'], ['kè']],
+    '看家': [['kān'], ['jiā']],
+    '看座': [['kàn'], ['zuò']],
+    '看开': [['kàn'], ['kāi']],
+    '看待': [['kàn'], ['dài']],
+    '看戏': [['kàn'], ['xì']],
+    '看成': [['kàn'], ['chéng']],
+    '看扁': [['kàn'], ['biǎn']],
+    '看护': [['kān'], ['hù']],
+    '看押': [['kān'], ['yā']],
+    '看望': [['kàn'], ['wàng']],
+    '看来': [['kàn'], ['lái']],
+    '看板': [['kàn'], ['bǎn']],
+    '看死': [['kàn'], ['sǐ']],
+    '看法': [['kàn'], ['fǎ']],
+    '看涨': [['kàn'], ['zhǎng']],
+    '看清': [['kàn'], ['qīng']],
+    '看漏': [['kàn'], ['lòu']],
+    '看病': [['kàn'], ['bìng']],
+    '看盘': [['kàn'], ['pán']],
+    '看相': [['kàn'], ['xiàng']],
+    '看看': [['kàn'], ['kàn']],
+    '看破': [['kàn'], ['pò']],
+    '看穿': [['kàn'], ['chuān']],
+    '看管': [['kān'], ['guǎn']],
+    '看茶': [['kàn'], ['chá']],
+    '看见': [['kàn'], ['jiàn']],
+    '看跌': [['kàn'], ['diē']],
+    '看轻': [['kàn'], ['qīng']],
+    '看透': [['kàn'], ['tòu']],
+    '看重': [['kàn'], ['zhòng']],
+    '看门': [['kān'], ['mén']],
+    '看青': [['kàn'], ['qīng']],
+    '看顾': [['kàn'], ['gù']],
+    '看齐': [['kàn'], ['qí']],
+    '真个': [['zhēn'], ['gè']],
+    '真传': [['zhēn'], ['chuán']],
+    '真倔': [['zhēn'], ['juè']],
+    '真切': [['zhēn'], ['qiè']],
+    '真数': [['zhēn'], ['shù']],
+    '真正': [['zhēn'], ['zhèng']],
+    '真率': [['zhēn'], ['shuài']],
+    '真相': [['zhēn'], ['xiàng']],
+    '真知': [['zhēn'], ['zhī']],
+    '真空': [['zhēn'], ['kōng']],
+    '真菌': [['zhēn'], ['jūn']],
+    '眩晕': [['xuàn'], ['yūn']],
+    '眸子': [['móu'], ['zi']],
+    '眼晕': [['yǎn'], ['yùn']],
+    '眼见': [['yǎn'], ['jiàn']],
+    '着凉': [['zháo'], ['liáng']],
+    '着力': [['zhuó'], ['lì']],
+    '着墨': [['zhuó'], ['mò']],
+    '着忙': [['zháo'], ['máng']],
+    '着急': [['zháo'], ['jí']],
+    '着想': [['zhuó'], ['xiǎng']],
+    '着意': [['zhuó'], ['yì']],
+    '着慌': [['zháo'], ['huāng']],
+    '着手': [['zhuó'], ['shǒu']],
+    '着数': [['zhāo'], ['shù']],
+    '着水': [['zhe'], ['shuǐ']],
+    '着法': [['zhāo'], ['fǎ']],
+    '着火': [['zháo'], ['huǒ']],
+    '着眼': [['zhuó'], ['yǎn']],
+    '着笔': [['zhuó'], ['bǐ']],
+    '着色': [['zhuó'], ['sè']],
+    '着落': [['zhuó'], ['luò']],
+    '着装': [['zhuó'], ['zhuāng']],
+    '着边': [['zhuó'], ['biān']],
+    '着迷': [['zháo'], ['mí']],
+    '着重': [['zhuó'], ['zhòng']],
+    '着陆': [['zhuó'], ['lù']],
+    '着风': [['zháo'], ['fēng']],
+    '着魔': [['zháo'], ['mó']],
+    '睡椅': [['shuì'], ['yǐ']],
+    '睡相': [['shuì'], ['xiàng']],
+    '睡着': [['shuì'], ['zháo']],
+    '睡觉': [['shuì'], ['jiào']],
+    '督率': [['dū'], ['shuài']],
+    '督脉': [['dū'], ['mài']],
+    '瞅见': [['chǒu'], ['jiàn']],
+    '瞎子': [['xiā'], ['zi']],
+    '瞎炮': [['xiā'], ['pào']],
+    '瞎蒙': [['xiā'], ['mēng']],
+    '瞎说': [['xiā'], ['shuō']],
+    '瞒哄': [['mán'], ['hǒng']],
+    '瞥见': [['piē'], ['jiàn']],
+    '瞧见': [['qiáo'], ['jiàn']],
+    '瞬间': [['shùn'], ['jiān']],
+    '瞭望': [['liào'], ['wàng']],
+    '瞻仰': [['zhān'], ['yǎng']],
+    '瞿然': [['jù'], ['rán']],
+    '瞿麦': [['qú'], ['mài']],
+    '矛头': [['máo'], ['tóu']],
+    '矜夸': [['jīn'], ['kuā']],
+    '矜持': [['jīn'], ['chí']],
+    '矜贵': [['jīn'], ['guì']],
+    '矢石': [['shǐ'], ['shí']],
+    '矢量': [['shǐ'], ['liàng']],
+    '知了': [['zhī'], ['liǎo']],
+    '知事': [['zhī'], ['shì']],
+    '知交': [['zhī'], ['jiāo']],
+    '知人': [['zhī'], ['rén']],
+    '知会': [['zhī'], ['huì']],
+    '知县': [['zhī'], ['xiàn']],
+    '知友': [['zhī'], ['yǒu']],
+    '知名': [['zhī'], ['míng']],
+    '知命': [['zhī'], ['mìng']],
+    '知州': [['zhī'], ['zhōu']],
+    '知己': [['zhī'], ['jǐ']],
+    '知底': [['zhī'], ['dǐ']],
+    '知府': [['zhī'], ['fǔ']],
+    '知心': [['zhī'], ['xīn']],
+    '知性': [['zhī'], ['xìng']],
+    '知悉': [['zhī'], ['xī']],
+    '知情': [['zhī'], ['qíng']],
+    '知晓': [['zhī'], ['xiǎo']],
+    '知照': [['zhī'], ['zhào']],
+    '知者': [['zhī'], ['zhě']],
+    '知能': [['zhī'], ['néng']],
+    '知觉': [['zhī'], ['jué']],
+    '知识': [['zhī'], ['shí']],
+    '知趣': [['zhī'], ['qù']],
+    '知足': [['zhī'], ['zú']],
+    '知遇': [['zhī'], ['yù']],
+    '知道': [['zhī'], ['dào']],
+    '知青': [['zhī'], ['qīng']],
+    '知音': [['zhī'], ['yīn']],
+    '矩尺': [['jǔ'], ['chǐ']],
+    '短传': [['duǎn'], ['chuán']],
+    '短发': [['duǎn'], ['fā']],
+    '短句': [['duǎn'], ['jù']],
+    '短号': [['duǎn'], ['hào']],
+    '短处': [['duǎn'], ['chù']],
+    '短少': [['duǎn'], ['shǎo']],
+    '短打': [['duǎn'], ['dǎ']],
+    '短期': [['duǎn'], ['qī']],
+    '短浅': [['duǎn'], ['qiǎn']],
+    '短片': [['duǎn'], ['piàn']],
+    '短见': [['duǎn'], ['jiàn']],
+    '短语': [['duǎn'], ['yǔ']],
+    '短跑': [['duǎn'], ['pǎo']],
+    '短长': [['duǎn'], ['cháng']],
+    '短骨': [['duǎn'], ['gǔ']],
+    '矮个': [['ǎi'], ['gè']],
+    '石像': [['shí'], ['xiàng']],
+    '石关': [['shí'], ['guān']],
+    '石刀': [['shí'], ['dāo']],
+    '石刻': [['shí'], ['kè']],
+    '石匠': [['shí'], ['jiàng']],
+    '石印': [['shí'], ['yìn']],
+    '石台': [['shí'], ['tái']],
+    '石器': [['shí'], ['qì']],
+    '石坊': [['shí'], ['fāng']],
+    '石坎': [['shí'], ['kǎn']],
+    '石块': [['shí'], ['kuài']],
+    '石城': [['shí'], ['chéng']],
+    '石堰': [['shí'], ['yàn']],
+    '石墨': [['shí'], ['mò']],
+    '石墩': [['shí'], ['dūn']],
+    '石壁': [['shí'], ['bì']],
+    '石头': [['shí'], ['tou']],
+    '石女': [['shí'], ['nǚ']],
+    '石子': [['shí'], ['zǐ']],
+    '石室': [['shí'], ['shì']],
+    '石屋': [['shí'], ['wū']],
+    '石屏': [['shí'], ['píng']],
+    '石山': [['shí'], ['shān']],
+    '石工': [['shí'], ['gōng']],
+    '石弓': [['shí'], ['gōng']],
+    '石径': [['shí'], ['jìng']],
+    '石担': [['shí'], ['dān']],
+    '石料': [['shí'], ['liào']],
+    '石斛': [['shí'], ['hú']],
+    '石斧': [['shí'], ['fǔ']],
+    '石方': [['shí'], ['fāng']],
+    '石材': [['shí'], ['cái']],
+    '石板': [['shí'], ['bǎn']],
+    '石林': [['shí'], ['lín']],
+    '石柱': [['shí'], ['zhù']],
+    '石栏': [['shí'], ['lán']],
+    '石栗': [['shí'], ['lì']],
+    '石桥': [['shí'], ['qiáo']],
+    '石棉': [['shí'], ['mián']],
+    '石棺': [['shí'], ['guān']],
+    '石楠': [['shí'], ['nán']],
+    '石楼': [['shí'], ['lóu']],
+    '石榴': [['shí'], ['liú']],
+    '石槽': [['shí'], ['cáo']],
+    '石油': [['shí'], ['yóu']],
+    '石泉': [['shí'], ['quán']],
+    '石洞': [['shí'], ['dòng']],
+    '石渠': [['shí'], ['qú']],
+    '石灰': [['shí'], ['huī']],
+    '石炭': [['shí'], ['tàn']],
+    '石版': [['shí'], ['bǎn']],
+    '石盐': [['shí'], ['yán']],
+    '石碑': [['shí'], ['bēi']],
+    '石碓': [['shí'], ['duì']],
+    '石磙': [['shí'], ['gǔn']],
+    '石磨': [['shí'], ['mó']],
+    '石窟': [['shí'], ['kū']],
+    '石竹': [['shí'], ['zhú']],
+    '石笋': [['shí'], ['sǔn']],
+    '石笔': [['shí'], ['bǐ']],
+    '石笼': [['shí'], ['lóng']],
+    '石级': [['shí'], ['jí']],
+    '石经': [['shí'], ['jīng']],
+    '石羊': [['shí'], ['yáng']],
+    '石膏': [['shí'], ['gāo']],
+    '石臼': [['shí'], ['jiù']],
+    '石舫': [['shí'], ['fǎng']],
+    '石英': [['shí'], ['yīng']],
+    '石蕊': [['shí'], ['ruǐ']],
+    '石蜡': [['shí'], ['là']],
+    '石锁': [['shí'], ['suǒ']],
+    '石门': [['shí'], ['mén']],
+    '石雕': [['shí'], ['diāo']],
+    '石青': [['shí'], ['qīng']],
+    '石韦': [['shí'], ['wéi']],
+    '石首': [['shí'], ['shǒu']],
+    '石鼓': [['shí'], ['gǔ']],
+    '矸石': [['gān'], ['shí']],
+    '矾石': [['fán'], ['shí']],
+    '矿体': [['kuàng'], ['tǐ']],
+    '矿区': [['kuàng'], ['qū']],
+    '矿石': [['kuàng'], ['shí']],
+    '矿脉': [['kuàng'], ['mài']],
+    '矿芯': [['kuàng'], ['xìn']],
+    '矿藏': [['kuàng'], ['cáng']],
+    '矿车': [['kuàng'], ['chē']],
+    '矿难': [['kuàng'], ['nàn']],
+    '码垛': [['mǎ'], ['duǒ']],
+    '码头': [['mǎ'], ['tóu']],
+    '砂囊': [['shā'], ['náng']],
+    '砂浆': [['shā'], ['jiāng']],
+    '砂石': [['shā'], ['shí']],
+    '砌块': [['qì'], ['kuài']],
+    '研习': [['yán'], ['xí']],
+    '研判': [['yán'], ['pàn']],
+    '研制': [['yán'], ['zhì']],
+    '研拟': [['yán'], ['nǐ']],
+    '研析': [['yán'], ['xī']],
+    '研求': [['yán'], ['qiú']],
+    '研磨': [['yán'], ['mó']],
+    '研究': [['yán'], ['jiū']],
+    '研讨': [['yán'], ['tǎo']],
+    '研读': [['yán'], ['dú']],
+    '砖厂': [['zhuān'], ['chǎng']],
+    '砖头': [['zhuān'], ['tóu']],
+    '砚台': [['yàn'], ['tāi']],
+    '砚石': [['yàn'], ['shí']],
+    '砥石': [['dǐ'], ['shí']],
+    '砭石': [['biān'], ['shí']],
+    '砭骨': [['biān'], ['gǔ']],
+    '破坏': [['pò'], ['huài']],
+    '破家': [['pò'], ['jiā']],
+    '破片': [['pò'], ['piàn']],
+    '破相': [['pò'], ['xiàng']],
+    '破约': [['pò'], ['yuē']],
+    '破落': [['pò'], ['luò']],
+    '破裂': [['pò'], ['liè']],
+    '破解': [['pò'], ['jiě']],
+    '破读': [['pò'], ['dú']],
+    '砺石': [['lì'], ['shí']],
+    '砾石': [['lì'], ['shí']],
+    '础石': [['chǔ'], ['shí']],
+    '硕果': [['shuò'], ['guǒ']],
+    '硝化': [['xiāo'], ['huà']],
+    '硝石': [['xiāo'], ['shí']],
+    '硫化': [['liú'], ['huà']],
+    '确信': [['què'], ['xìn']],
+    '确切': [['què'], ['qiè']],
+    '确当': [['què'], ['dàng']],
+    '碇泊': [['dìng'], ['bó']],
+    '碉堡': [['diāo'], ['bǎo']],
+    '碌碌': [['lù'], ['lù']],
+    '碌碡': [['liù'], ['zhóu']],
+    '碍难': [['ài'], ['nán']],
+    '碎片': [['suì'], ['piàn']],
+    '碎石': [['suì'], ['shí']],
+    '碎裂': [['suì'], ['liè']],
+    '碑帖': [['bēi'], ['tiè']],
+    '碑拓': [['bēi'], ['tuò']],
+    '碑石': [['bēi'], ['shí']],
+    '碑碣': [['bēi'], ['jié']],
+    '碗柜': [['wǎn'], ['guì']],
+    '碘酊': [['diǎn'], ['dǐng']],
+    '碟子': [['dié'], ['zi']],
+    '碣石': [['jié'], ['shí']],
+    '碧空': [['bì'], ['kōng']],
+    '碧绿': [['bì'], ['lǜ']],
+    '碧血': [['bì'], ['xuè']],
+    '碰头': [['pèng'], ['tóu']],
+    '碰见': [['pèng'], ['jiàn']],
+    '碱地': [['jiǎn'], ['dì']],
+    '碴儿': [['chá'], ['ér']],
+    '碾压': [['niǎn'], ['yā']],
+    '碾场': [['niǎn'], ['chǎng']],
+    '碾坊': [['niǎn'], ['fáng']],
+    '碾磨': [['niǎn'], ['mó']],
+    '磁体': [['cí'], ['tǐ']],
+    '磁化': [['cí'], ['huà']],
+    '磁场': [['cí'], ['chǎng']],
+    '磁头': [['cí'], ['tóu']],
+    '磁石': [['cí'], ['shí']],
+    '磅礴': [['páng'], ['bó']],
+    '磅秤': [['bàng'], ['chèng']],
+    '磊落': [['lěi'], ['luò']],
+    '磐石': [['pán'], ['shí']],
+    '磕头': [['kē'], ['tóu']],
+    '磕打': [['kē'], ['dǎ']],
+    '磨光': [['mó'], ['guāng']],
+    '磨叨': [['mò'], ['dāo']],
+    '磨合': [['mó'], ['hé']],
+    '磨嘴': [['mó'], ['zuǐ']],
+    '磨坊': [['mò'], ['fáng']],
+    '磨子': [['mò'], ['zǐ']],
+    '磨快': [['mó'], ['kuài']],
+    '磨房': [['mó'], ['fáng']],
+    '磨扇': [['mó'], ['shàn']],
+    '磨折': [['mó'], ['zhé']],
+    '磨损': [['mó'], ['sǔn']],
+    '磨擦': [['mó'], ['cā']],
+    '磨洗': [['mó'], ['xǐ']],
+    '磨灭': [['mó'], ['miè']],
+    '磨炼': [['mó'], ['liàn']],
+    '磨烦': [['mò'], ['fán']],
+    '磨牙': [['mó'], ['yá']],
+    '磨盘': [['mò'], ['pán']],
+    '磨石': [['mó'], ['shí']],
+    '磨砺': [['mó'], ['lì']],
+    '磨磨': [['mó'], ['mó']],
+    '磨米': [['mò'], ['mǐ']],
+    '磨练': [['mó'], ['liàn']],
+    '磨耗': [['mó'], ['hào']],
+    '磨菇': [['mó'], ['gū']],
+    '磨蚀': [['mó'], ['shí']],
+    '磨蹭': [['mó'], ['cèng']],
+    '磨难': [['mó'], ['nàn']],
+    '磨面': [['mò'], ['miàn']],
+    '礁石': [['jiāo'], ['shí']],
+    '礞石': [['méng'], ['shí']],
+    '礼乐': [['lǐ'], ['yuè']],
+    '礼佛': [['lǐ'], ['fó']],
+    '礼券': [['lǐ'], ['quàn']],
+    '礼单': [['lǐ'], ['dān']],
+    '礼帖': [['lǐ'], ['tiě']],
+    '礼教': [['lǐ'], ['jiào']],
+    '礼数': [['lǐ'], ['shù']],
+    '礼服': [['lǐ'], ['fú']],
+    '礼炮': [['lǐ'], ['pào']],
+    '礼节': [['lǐ'], ['jié']],
+    '社会': [['shè'], ['huì']],
+    '社区': [['shè'], ['qū']],
+    '社员': [['shè'], ['yuán']],
+    '社戏': [['shè'], ['xì']],
+    '社论': [['shè'], ['lùn']],
+    '社长': [['shè'], ['zhǎng']],
+    '祆教': [['xiān'], ['jiào']],
+    '祈雨': [['qí'], ['yǔ']],
+    '祖上': [['zǔ'], ['shàng']],
+    '祖传': [['zǔ'], ['chuán']],
+    '祖孙': [['zǔ'], ['sūn']],
+    '祖父': [['zǔ'], ['fù']],
+    '祖率': [['zǔ'], ['lǜ']],
+    '祛疑': [['qū'], ['yí']],
+    '祛邪': [['qū'], ['xié']],
+    '神会': [['shén'], ['huì']],
+    '神似': [['shén'], ['sì']],
+    '神佛': [['shén'], ['fó']],
+    '神化': [['shén'], ['huà']],
+    '神奇': [['shén'], ['qí']],
+    '神女': [['shén'], ['nǚ']],
+    '神思': [['shén'], ['sī']],
+    '神曲': [['shén'], ['qū']],
+    '神棍': [['shén'], ['gùn']],
+    '神父': [['shén'], ['fù']],
+    '神祇': [['shén'], ['qí']],
+    '神秘': [['shén'], ['mì']],
+    '神采': [['shén'], ['cǎi']],
+    '神阙': [['shén'], ['quē']],
+    '祥和': [['xiáng'], ['hé']],
+    '祭品': [['jì'], ['pǐn']],
+    '禀帖': [['bǐng'], ['tiě']],
+    '禁书': [['jìn'], ['shū']],
+    '禁令': [['jìn'], ['lìng']],
+    '禁例': [['jìn'], ['lì']],
+    '禁军': [['jìn'], ['jūn']],
+    '禁制': [['jìn'], ['zhì']],
+    '禁区': [['jìn'], ['qū']],
+    '禁卫': [['jìn'], ['wèi']],
+    '禁受': [['jīn'], ['shòu']],
+    '禁地': [['jìn'], ['dì']],
+    '禁子': [['jìn'], ['zǐ']],
+    '禁律': [['jìn'], ['lǜ']],
+    '禁忌': [['jìn'], ['jì']],
+    '禁条': [['jìn'], ['tiáo']],
+    '禁果': [['jìn'], ['guǒ']],
+    '禁欲': [['jìn'], ['yù']],
+    '禁止': [['jìn'], ['zhǐ']],
+    '禁毁': [['jìn'], ['huǐ']],
+    '禁渔': [['jìn'], ['yú']],
+    '禁火': [['jìn'], ['huǒ']],
+    '禁烟': [['jìn'], ['yān']],
+    '禁物': [['jìn'], ['wù']],
+    '禁猎': [['jìn'], ['liè']],
+    '禁用': [['jīn'], ['yòng']],
+    '禁绝': [['jìn'], ['jué']],
+    '禁脔': [['jìn'], ['luán']],
+    '禁足': [['jìn'], ['zú']],
+    '禁运': [['jìn'], ['yùn']],
+    '禁酒': [['jìn'], ['jiǔ']],
+    '禁锢': [['jìn'], ['gù']],
+    '禁闭': [['jìn'], ['bì']],
+    '禁阻': [['jìn'], ['zǔ']],
+    '禁食': [['jìn'], ['shí']],
+    '禅堂': [['chán'], ['táng']],
+    '禅学': [['chán'], ['xué']],
+    '禅宗': [['chán'], ['zōng']],
+    '禅定': [['chán'], ['dìng']],
+    '禅师': [['chán'], ['shī']],
+    '禅心': [['chán'], ['xīn']],
+    '禅悟': [['chán'], ['wù']],
+    '禅意': [['chán'], ['yì']],
+    '禅房': [['chán'], ['fáng']],
+    '禅机': [['chán'], ['jī']],
+    '禅杖': [['chán'], ['zhàng']],
+    '禅林': [['chán'], ['lín']],
+    '禅让': [['shàn'], ['ràng']],
+    '禅门': [['chán'], ['mén']],
+    '禅院': [['chán'], ['yuàn']],
+    '福分': [['fú'], ['fēn']],
+    '福地': [['fú'], ['dì']],
+    '福将': [['fú'], ['jiāng']],
+    '福相': [['fú'], ['xiàng']],
+    '离任': [['lí'], ['rèn']],
+    '离休': [['lí'], ['xiū']],
+    '离别': [['lí'], ['bié']],
+    '离合': [['lí'], ['hé']],
+    '离奇': [['lí'], ['qí']],
+    '离散': [['lí'], ['sàn']],
+    '离解': [['lí'], ['jiě']],
+    '离间': [['lí'], ['jiàn']],
+    '离骚': [['lí'], ['sāo']],
+    '禾场': [['hé'], ['cháng']],
+    '秀丽': [['xiù'], ['lì']],
+    '秀发': [['xiù'], ['fā']],
+    '私了': [['sī'], ['le']],
+    '私仇': [['sī'], ['chóu']],
+    '私会': [['sī'], ['huì']],
+    '私分': [['sī'], ['fēn']],
+    '私囊': [['sī'], ['náng']],
+    '私处': [['sī'], ['chǔ']],
+    '私奔': [['sī'], ['bēn']],
+    '私家': [['sī'], ['jiā']],
+    '私斗': [['sī'], ['dòu']],
+    '私藏': [['sī'], ['cáng']],
+    '私见': [['sī'], ['jiàn']],
+    '私车': [['sī'], ['chē']],
+    '秃发': [['tū'], ['fā']],
+    '秃头': [['tū'], ['tóu']],
+    '秉正': [['bǐng'], ['zhèng']],
+    '秋令': [['qiū'], ['lìng']],
+    '秋凉': [['qiū'], ['liáng']],
+    '秋分': [['qiū'], ['fēn']],
+    '秋叶': [['qiū'], ['yè']],
+    '秋景': [['qiū'], ['jǐng']],
+    '秋种': [['qiū'], ['zhǒng']],
+    '种别': [['zhǒng'], ['bié']],
+    '种地': [['zhòng'], ['dì']],
+    '种姓': [['zhǒng'], ['xìng']],
+    '种子': [['zhǒng'], ['zi']],
+    '种差': [['zhǒng'], ['chà']],
+    '种族': [['zhǒng'], ['zú']],
+    '种树': [['zhòng'], ['shù']],
+    '种植': [['zhòng'], ['zhí']],
+    '种牛': [['zhòng'], ['niú']],
+    '种田': [['zhòng'], ['tián']],
+    '种畜': [['zhǒng'], ['chù']],
+    '种痘': [['zhòng'], ['dòu']],
+    '种禽': [['zhǒng'], ['qín']],
+    '种种': [['zhǒng'], ['zhǒng']],
+    '种稻': [['zhòng'], ['dào']],
+    '种类': [['zhǒng'], ['lèi']],
+    '种籽': [['zhǒng'], ['zǐ']],
+    '种系': [['zhǒng'], ['xì']],
+    '种群': [['zhǒng'], ['qún']],
+    '种花': [['zhòng'], ['huā']],
+    '种草': [['zhǒng'], ['cǎo']],
+    '种菜': [['zhòng'], ['cài']],
+    '种蛋': [['zhǒng'], ['dàn']],
+    '种马': [['zhǒng'], ['mǎ']],
+    '种麻': [['zhǒng'], ['má']],
+    '科员': [['kē'], ['yuán']],
+    '科教': [['kē'], ['jiào']],
+    '科研': [['kē'], ['yán']],
+    '科长': [['kē'], ['zhǎng']],
+    '秘书': [['mì'], ['shū']],
+    '秘传': [['mì'], ['chuán']],
+    '秘史': [['mì'], ['shǐ']],
+    '秘宝': [['mì'], ['bǎo']],
+    '秘密': [['mì'], ['mì']],
+    '秘方': [['mì'], ['fāng']],
+    '秘本': [['mì'], ['běn']],
+    '秘籍': [['mì'], ['jí']],
+    '秘藏': [['mì'], ['cáng']],
+    '秘诀': [['mì'], ['jué']],
+    '秘鲁': [['bì'], ['lǔ']],
+    '租价': [['zū'], ['jià']],
+    '租佃': [['zū'], ['diàn']],
+    '租地': [['zū'], ['dì']],
+    '租种': [['zū'], ['zhǒng']],
+    '租约': [['zū'], ['yuē']],
+    '秤杆': [['chèng'], ['gǎn']],
+    '秦岭': [['qín'], ['lǐng']],
+    '秦桧': [['qín'], ['guì']],
+    '秦艽': [['qín'], ['jiāo']],
+    '积分': [['jī'], ['fēn']],
+    '积压': [['jī'], ['yā']],
+    '积攒': [['jī'], ['zǎn']],
+    '积数': [['jī'], ['shù']],
+    '积累': [['jī'], ['lěi']],
+    '积蓄': [['jī'], ['xù']],
+    '积雨': [['jī'], ['yǔ']],
+    '积食': [['jī'], ['shí']],
+    '称为': [['chēng'], ['wéi']],
+    '称作': [['chēng'], ['zuò']],
+    '称便': [['chēng'], ['biàn']],
+    '称兵': [['chēng'], ['bīng']],
+    '称号': [['chēng'], ['hào']],
+    '称叹': [['chēng'], ['tàn']],
+    '称呼': [['chēng'], ['hū']],
+    '称帝': [['chēng'], ['dì']],
+    '称引': [['chēng'], ['yǐn']],
+    '称心': [['chèn'], ['xīn']],
+    '称快': [['chēng'], ['kuài']],
+    '称意': [['chēng'], ['yì']],
+    '称愿': [['chèn'], ['yuàn']],
+    '称扬': [['chēng'], ['yáng']],
+    '称病': [['chēng'], ['bìng']],
+    '称羡': [['chēng'], ['xiàn']],
+    '称职': [['chèn'], ['zhí']],
+    '称臣': [['chēng'], ['chén']],
+    '称誉': [['chēng'], ['yù']],
+    '称许': [['chēng'], ['xǔ']],
+    '称说': [['chēng'], ['shuō']],
+    '称谓': [['chēng'], ['wèi']],
+    '称谢': [['chēng'], ['xiè']],
+    '称贷': [['chēng'], ['dài']],
+    '称贺': [['chēng'], ['hè']],
+    '称赏': [['chēng'], ['shǎng']],
+    '称赞': [['chēng'], ['zàn']],
+    '称身': [['chèn'], ['shēn']],
+    '称述': [['chēng'], ['shù']],
+    '称道': [['chēng'], ['dào']],
+    '称重': [['chēng'], ['zhòng']],
+    '称量': [['chēng'], ['liáng']],
+    '称雄': [['chēng'], ['xióng']],
+    '称霸': [['chēng'], ['bà']],
+    '称颂': [['chēng'], ['sòng']],
+    '移解': [['yí'], ['jiè']],
+    '稀奇': [['xī'], ['qí']],
+    '稀少': [['xī'], ['shǎo']],
+    '稀拉': [['xī'], ['lā']],
+    '稀有': [['xī'], ['yǒu']],
+    '稀落': [['xī'], ['luò']],
+    '稀薄': [['xī'], ['bó']],
+    '程度': [['chéng'], ['dù']],
+    '稍为': [['shāo'], ['wéi']],
+    '稍事': [['shāo'], ['shì']],
+    '稍后': [['shāo'], ['hòu']],
+    '稍微': [['shāo'], ['wēi']],
+    '稍息': [['shào'], ['xī']],
+    '稍稍': [['shāo'], ['shāo']],
+    '稍许': [['shāo'], ['xǔ']],
+    '税单': [['shuì'], ['dān']],
+    '税卡': [['shuì'], ['qiǎ']],
+    '税契': [['shuì'], ['qì']],
+    '税率': [['shuì'], ['lǜ']],
+    '税种': [['shuì'], ['zhǒng']],
+    '稔知': [['rěn'], ['zhī']],
+    '稠度': [['chóu'], ['dù']],
+    '稠糊': [['chóu'], ['hū']],
+    '稳便': [['wěn'], ['biàn']],
+    '稳当': [['wěn'], ['dāng']],
+    '稳重': [['wěn'], ['zhòng']],
+    '稻子': [['dào'], ['zi']],
+    '稽察': [['jī'], ['chá']],
+    '稽延': [['jī'], ['yán']],
+    '稽征': [['jī'], ['zhēng']],
+    '稽查': [['jī'], ['chá']],
+    '稽核': [['jī'], ['hé']],
+    '稽留': [['jī'], ['liú']],
+    '稽考': [['jī'], ['kǎo']],
+    '稽首': [['qǐ'], ['shǒu']],
+    '稿子': [['gǎo'], ['zi']],
+    '稿约': [['gǎo'], ['yuē']],
+    '穴头': [['xué'], ['tóu']],
+    '究诘': [['jiū'], ['jié']],
+    '穷尽': [['qióng'], ['jìn']],
+    '穷期': [['qióng'], ['qī']],
+    '空中': [['kōng'], ['zhōng']],
+    '空乏': [['kōng'], ['fá']],
+    '空位': [['kōng'], ['wèi']],
+    '空余': [['kòng'], ['yú']],
+    '空儿': [['kòng'], ['ér']],
+    '空军': [['kōng'], ['jūn']],
+    '空出': [['kòng'], ['chū']],
+    '空前': [['kōng'], ['qián']],
+    '空勤': [['kōng'], ['qín']],
+    '空口': [['kōng'], ['kǒu']],
+    '空名': [['kōng'], ['míng']],
+    '空喊': [['kōng'], ['hǎn']],
+    '空地': [['kòng'], ['dì']],
+    '空场': [['kōng'], ['chǎng']],
+    '空城': [['kōng'], ['chéng']],
+    '空壳': [['kōng'], ['ké']],
+    '空头': [['kōng'], ['tóu']],
+    '空姐': [['kōng'], ['jiě']],
+    '空子': [['kòng'], ['zi']],
+    '空寂': [['kōng'], ['jì']],
+    '空幻': [['kōng'], ['huàn']],
+    '空廓': [['kōng'], ['kuò']],
+    '空当': [['kōng'], ['dāng']],
+    '空心': [['kōng'], ['xīn']],
+    '空怀': [['kōng'], ['huái']],
+    '空想': [['kōng'], ['xiǎng']],
+    '空战': [['kōng'], ['zhàn']],
+    '空房': [['kōng'], ['fáng']],
+    '空手': [['kōng'], ['shǒu']],
+    '空投': [['kōng'], ['tóu']],
+    '空拳': [['kōng'], ['quán']],
+    '空挡': [['kōng'], ['dǎng']],
+    '空文': [['kōng'], ['wén']],
+    '空无': [['kōng'], ['wú']],
+    '空旷': [['kōng'], ['kuàng']],
+    '空明': [['kōng'], ['míng']],
+    '空暇': [['kòng'], ['xiá']],
+    '空有': [['kōng'], ['yǒu']],
+    '空格': [['kōng'], ['gé']],
+    '空档': [['kōng'], ['dàng']],
+    '空气': [['kōng'], ['qì']],
+    '空泛': [['kōng'], ['fàn']],
+    '空洞': [['kōng'], ['dòng']],
+    '空海': [['kōng'], ['hǎi']],
+    '空灵': [['kōng'], ['líng']],
+    '空炮': [['kōng'], ['pào']],
+    '空疏': [['kōng'], ['shū']],
+    '空瘪': [['kōng'], ['biě']],
+    '空白': [['kòng'], ['bái']],
+    '空穴': [['kōng'], ['xué']],
+    '空空': [['kōng'], ['kōng']],
+    '空竹': [['kōng'], ['zhú']],
+    '空缺': [['kòng'], ['quē']],
+    '空耗': [['kōng'], ['hào']],
+    '空肠': [['kōng'], ['cháng']],
+    '空腔': [['kōng'], ['qiāng']],
+    '空腹': [['kōng'], ['fù']],
+    '空落': [['kōng'], ['luò']],
+    '空虚': [['kōng'], ['xū']],
+    '空袭': [['kōng'], ['xí']],
+    '空言': [['kōng'], ['yán']],
+    '空论': [['kōng'], ['lùn']],
+    '空话': [['kōng'], ['huà']],
+    '空调': [['kōng'], ['tiáo']],
+    '空谈': [['kōng'], ['tán']],
+    '空谷': [['kōng'], ['gǔ']],
+    '空身': [['kōng'], ['shēn']],
+    '空转': [['kōng'], ['zhuàn']],
+    '空运': [['kōng'], ['yùn']],
+    '空速': [['kōng'], ['sù']],
+    '空门': [['kōng'], ['mén']],
+    '空闲': [['kòng'], ['xián']],
+    '空间': [['kōng'], ['jiān']],
+    '空阔': [['kōng'], ['kuò']],
+    '空防': [['kōng'], ['fáng']],
+    '空际': [['kōng'], ['jì']],
+    '空降': [['kōng'], ['jiàng']],
+    '空隙': [['kòng'], ['xì']],
+    '空难': [['kōng'], ['nàn']],
+    '空额': [['kòng'], ['é']],
+    '穿刺': [['chuān'], ['cì']],
+    '穿着': [['chuān'], ['zhe']],
+    '穿行': [['chuān'], ['xíng']],
+    '突发': [['tū'], ['fā']],
+    '突地': [['tū'], ['dì']],
+    '窃据': [['qiè'], ['jù']],
+    '窈窕': [['yǎo'], ['tiǎo']],
+    '窖藏': [['jiào'], ['cáng']],
+    '窗台': [['chuāng'], ['tái']],
+    '窗扇': [['chuāng'], ['shàn']],
+    '窘相': [['jiǒng'], ['xiàng']],
+    '窘迫': [['jiǒng'], ['pò']],
+    '窝囊': [['wō'], ['nāng']],
+    '窝头': [['wō'], ['tóu']],
+    '窝家': [['wō'], ['jiā']],
+    '窝藏': [['wō'], ['cáng']],
+    '窝铺': [['wō'], ['pù']],
+    '窥伺': [['kuī'], ['sì']],
+    '窥度': [['kuī'], ['duó']],
+    '窥看': [['kuī'], ['kàn']],
+    '窥见': [['kuī'], ['jiàn']],
+    '立传': [['lì'], ['zhuàn']],
+    '立体': [['lì'], ['tǐ']],
+    '立地': [['lì'], ['dì']],
+    '立场': [['lì'], ['chǎng']],
+    '立射': [['lì'], ['shè']],
+    '立柜': [['lì'], ['guì']],
+    '立正': [['lì'], ['zhèng']],
+    '立约': [['lì'], ['yuē']],
+    '立论': [['lì'], ['lùn']],
+    '立轴': [['lì'], ['zhóu']],
+    '站台': [['zhàn'], ['tái']],
+    '站票': [['zhàn'], ['piào']],
+    '站长': [['zhàn'], ['zhǎng']],
+    '童仆': [['tóng'], ['pú']],
+    '童便': [['tóng'], ['biàn']],
+    '童女': [['tóng'], ['nǚ']],
+    '童蒙': [['tóng'], ['méng']],
+    '童趣': [['tóng'], ['qù']],
+    '竭尽': [['jié'], ['jìn']],
+    '端丽': [['duān'], ['lì']],
+    '端正': [['duān'], ['zhèng']],
+    '端相': [['duān'], ['xiāng']],
+    '端节': [['duān'], ['jié']],
+    '端重': [['duān'], ['zhòng']],
+    '端量': [['duān'], ['liáng']],
+    '竹叶': [['zhú'], ['yè']],
+    '竹排': [['zhú'], ['pái']],
+    '竹杠': [['zhú'], ['gàng']],
+    '竹枝': [['zhú'], ['zhī']],
+    '竹笼': [['zhú'], ['lóng']],
+    '竹节': [['zhú'], ['jié']],
+    '笃信': [['dǔ'], ['xìn']],
+    '笃行': [['dǔ'], ['xíng']],
+    '笆斗': [['bā'], ['dǒu']],
+    '笋干': [['sǔn'], ['gān']],
+    '笑场': [['xiào'], ['chǎng']],
+    '笑纹': [['xiào'], ['wén']],
+    '笑语': [['xiào'], ['yǔ']],
+    '笔会': [['bǐ'], ['huì']],
+    '笔体': [['bǐ'], ['tǐ']],
+    '笔供': [['bǐ'], ['gòng']],
+    '笔划': [['bǐ'], ['huà']],
+    '笔削': [['bǐ'], ['xuē']],
+    '笔杆': [['bǐ'], ['gǎn']],
+    '笔洗': [['bǐ'], ['xǐ']],
+    '笔答': [['bǐ'], ['dá']],
+    '笔调': [['bǐ'], ['diào']],
+    '符合': [['fú'], ['hé']],
+    '符节': [['fú'], ['jié']],
+    '笨伯': [['bèn'], ['bó']],
+    '笨重': [['bèn'], ['zhòng']],
+    '笼子': [['lóng'], ['zi']],
+    '笼络': [['lǒng'], ['luò']],
+    '笼统': [['lǒng'], ['tǒng']],
+    '笼罩': [['lǒng'], ['zhào']],
+    '等价': [['děng'], ['jià']],
+    '等份': [['děng'], ['fèn']],
+    '等分': [['děng'], ['fēn']],
+    '等号': [['děng'], ['hào']],
+    '等同': [['děng'], ['tóng']],
+    '等差': [['děng'], ['chà']],
+    '等待': [['děng'], ['dài']],
+    '等量': [['děng'], ['liàng']],
+    '筋斗': [['jīn'], ['dǒu']],
+    '筋络': [['jīn'], ['luò']],
+    '筋脉': [['jīn'], ['mài']],
+    '筋节': [['jīn'], ['jié']],
+    '筋骨': [['jīn'], ['gǔ']],
+    '筒瓦': [['tǒng'], ['wǎ']],
+    '答允': [['dā'], ['yǔn']],
+    '答卷': [['dá'], ['juàn']],
+    '答复': [['dá'], ['fù']],
+    '答对': [['dá'], ['duì']],
+    '答应': [['dā'], ['yìng']],
+    '答拜': [['dá'], ['bài']],
+    '答数': [['dá'], ['shù']],
+    '答案': [['dá'], ['àn']],
+    '答理': [['dā'], ['lǐ']],
+    '答疑': [['dá'], ['yí']],
+    '答礼': [['dá'], ['lǐ']],
+    '答腔': [['dā'], ['qiāng']],
+    '答言': [['dá'], ['yán']],
+    '答讪': [['dā'], ['shàn']],
+    '答词': [['dá'], ['cí']],
+    '答话': [['dá'], ['huà']],
+    '答语': [['dá'], ['yǔ']],
+    '答谢': [['dá'], ['xiè']],
+    '答辩': [['dá'], ['biàn']],
+    '答问': [['dá'], ['wèn']],
+    '策划': [['cè'], ['huà']],
+    '策应': [['cè'], ['yìng']],
+    '策论': [['cè'], ['lùn']],
+    '筛分': [['shāi'], ['fēn']],
+    '筛号': [['shāi'], ['hào']],
+    '筛子': [['shāi'], ['zi']],
+    '筛洗': [['shāi'], ['xǐ']],
+    '筷子': [['kuài'], ['zi']],
+    '筹划': [['chóu'], ['huà']],
+    '签发': [['qiān'], ['fā']],
+    '签子': [['qiān'], ['zi']],
+    '简任': [['jiǎn'], ['rèn']],
+    '简便': [['jiǎn'], ['biàn']],
+    '简化': [['jiǎn'], ['huà']],
+    '简单': [['jiǎn'], ['dān']],
+    '简帖': [['jiǎn'], ['tiē']],
+    '简括': [['jiǎn'], ['kuò']],
+    '简朴': [['jiǎn'], ['piáo']],
+    '简省': [['jiǎn'], ['shěng']],
+    '简称': [['jiǎn'], ['chēng']],
+    '简约': [['jiǎn'], ['yuē']],
+    '简缩': [['jiǎn'], ['suō']],
+    '简要': [['jiǎn'], ['yào']],
+    '箕斗': [['jī'], ['dòu']],
+    '算了': [['suàn'], ['le']],
+    '算得': [['suàn'], ['de']],
+    '算数': [['suàn'], ['shù']],
+    '算术': [['suàn'], ['shù']],
+    '管乐': [['guǎn'], ['yuè']],
+    '管区': [['guǎn'], ['qū']],
+    '管家': [['guǎn'], ['jiā']],
+    '管教': [['guǎn'], ['jiào']],
+    '管片': [['guǎn'], ['piàn']],
+    '管见': [['guǎn'], ['jiàn']],
+    '箭垛': [['jiàn'], ['duǒ']],
+    '箭头': [['jiàn'], ['tóu']],
+    '箱子': [['xiāng'], ['zi']],
+    '箱底': [['xiāng'], ['dǐ']],
+    '箱笼': [['xiāng'], ['lǒng']],
+    '篆体': [['zhuàn'], ['tǐ']],
+    '篇什': [['piān'], ['shí']],
+    '篓子': [['lǒu'], ['zi']],
+    '篙头': [['gāo'], ['tou']],
+    '篮子': [['lán'], ['zi']],
+    '篱栅': [['lí'], ['zhà']],
+    '篱落': [['lí'], ['luò']],
+    '篷车': [['péng'], ['chē']],
+    '篾片': [['miè'], ['piàn']],
+    '簪子': [['zān'], ['zi']],
+    '簸动': [['bǒ'], ['dòng']],
+    '簸弄': [['bǒ'], ['nòng']],
+    '簸箕': [['bò'], ['jī']],
+    '簸箩': [['bǒ'], ['luó']],
+    '簸荡': [['bǒ'], ['dàng']],
+    '簿册': [['bù'], ['cè']],
+    '簿子': [['bù'], ['zǐ']],
+    '簿籍': [['bù'], ['jí']],
+    '簿记': [['bù'], ['jì']],
+    '籍没': [['jí'], ['mò']],
+    '籍茅': [['jiè'], ['máo']],
+    '米尺': [['mǐ'], ['chǐ']],
+    '米汤': [['mǐ'], ['tāng']],
+    '类似': [['lèi'], ['sì']],
+    '类别': [['lèi'], ['bié']],
+    '类同': [['lèi'], ['tóng']],
+    '籽种': [['zǐ'], ['zhǒng']],
+    '粉刷': [['fěn'], ['shuā']],
+    '粉刺': [['fěn'], ['cì']],
+    '粉坊': [['fěn'], ['fáng']],
+    '粉沙': [['fěn'], ['shā']],
+    '粉红': [['fěn'], ['hóng']],
+    '粗暴': [['cū'], ['bào']],
+    '粗浅': [['cū'], ['qiǎn']],
+    '粘土': [['nián'], ['tǔ']],
+    '粘液': [['nián'], ['yè']],
+    '粘牙': [['zhān'], ['yá']],
+    '粘稠': [['nián'], ['chóu']],
+    '粘结': [['nián'], ['jié']],
+    '粘贴': [['zhān'], ['tiē']],
+    '粘连': [['zhān'], ['lián']],
+    '粪便': [['fèn'], ['biàn']],
+    '粪车': [['fèn'], ['chē']],
+    '粮囤': [['liáng'], ['dùn']],
+    '粮票': [['liáng'], ['piào']],
+    '粮行': [['liáng'], ['háng']],
+    '粮食': [['liáng'], ['shí']],
+    '粽子': [['zòng'], ['zi']],
+    '精华': [['jīng'], ['huá']],
+    '精干': [['jīng'], ['gàn']],
+    '精度': [['jīng'], ['dù']],
+    '精当': [['jīng'], ['dàng']],
+    '精血': [['jīng'], ['xuè']],
+    '精要': [['jīng'], ['yào']],
+    '精读': [['jīng'], ['dú']],
+    '精辟': [['jīng'], ['pì']],
+    '精采': [['jīng'], ['cǎi']],
+    '精馏': [['jīng'], ['liú']],
+    '糅合': [['róu'], ['hé']],
+    '糊口': [['hú'], ['kǒu']],
+    '糊弄': [['hù'], ['nòng']],
+    '糊涂': [['hú'], ['tú']],
+    '糊精': [['hú'], ['jīng']],
+    '糊糊': [['hū'], ['hū']],
+    '糕干': [['gāo'], ['gān']],
+    '糖厂': [['táng'], ['chǎng']],
+    '糖尿': [['táng'], ['niào']],
+    '糖弹': [['táng'], ['dàn']],
+    '糖食': [['táng'], ['shí']],
+    '糜子': [['méi'], ['zǐ']],
+    '糜烂': [['mí'], ['làn']],
+    '糜费': [['mí'], ['fèi']],
+    '糨糊': [['jiàng'], ['hù']],
+    '系列': [['xì'], ['liè']],
+    '系好': [['jì'], ['hǎo']],
+    '系带': [['jì'], ['dài']],
+    '系念': [['xì'], ['niàn']],
+    '系恋': [['xì'], ['liàn']],
+    '系数': [['xì'], ['shù']],
+    '系泊': [['jì'], ['bó']],
+    '系紧': [['jì'], ['jǐn']],
+    '系统': [['xì'], ['tǒng']],
+    '系绳': [['jì'], ['shéng']],
+    '系缚': [['xì'], ['fù']],
+    '系词': [['xì'], ['cí']],
+    '系谱': [['xì'], ['pǔ']],
+    '素净': [['sù'], ['jìng']],
+    '素数': [['sù'], ['shù']],
+    '素服': [['sù'], ['fú']],
+    '素朴': [['sù'], ['piáo']],
+    '素食': [['sù'], ['shí']],
+    '索价': [['suǒ'], ['jià']],
+    '索要': [['suǒ'], ['yào']],
+    '索解': [['suǒ'], ['jiě']],
+    '紧俏': [['jǐn'], ['qiào']],
+    '紧着': [['jǐn'], ['zhe']],
+    '紧缩': [['jǐn'], ['suō']],
+    '紧要': [['jǐn'], ['yào']],
+    '紧迫': [['jǐn'], ['pò']],
+    '紫菀': [['zǐ'], ['wǎn']],
+    '累乏': [['lèi'], ['fá']],
+    '累了': [['lèi'], ['le']],
+    '累人': [['lèi'], ['rén']],
+    '累卵': [['lěi'], ['luǎn']],
+    '累及': [['lěi'], ['jí']],
+    '累手': [['lèi'], ['shǒu']],
+    '累次': [['lěi'], ['cì']],
+    '累活': [['lèi'], ['huó']],
+    '累着': [['lèi'], ['zhe']],
+    '累积': [['lěi'], ['jī']],
+    '累累': [['lěi'], ['lěi']],
+    '累计': [['lěi'], ['jì']],
+    '累赘': [['léi'], ['zhuì']],
+    '絮叨': [['xù'], ['dáo']],
+    '絮语': [['xù'], ['yǔ']],
+    '繁丽': [['fán'], ['lì']],
+    '繁乱': [['fán'], ['luàn']],
+    '繁体': [['fán'], ['tǐ']],
+    '繁冗': [['fán'], ['rǒng']],
+    '繁华': [['fán'], ['huá']],
+    '繁博': [['fán'], ['bó']],
+    '繁复': [['fán'], ['fù']],
+    '繁多': [['fán'], ['duō']],
+    '繁密': [['fán'], ['mì']],
+    '繁忙': [['fán'], ['máng']],
+    '繁文': [['fán'], ['wén']],
+    '繁昌': [['fán'], ['chāng']],
+    '繁星': [['fán'], ['xīng']],
+    '繁杂': [['fán'], ['zá']],
+    '繁殖': [['fán'], ['zhí']],
+    '繁琐': [['fán'], ['suǒ']],
+    '繁盛': [['fán'], ['shèng']],
+    '繁简': [['fán'], ['jiǎn']],
+    '繁缛': [['fán'], ['rù']],
+    '繁育': [['fán'], ['yù']],
+    '繁芜': [['fán'], ['wú']],
+    '繁花': [['fán'], ['huā']],
+    '繁苛': [['fán'], ['kē']],
+    '繁茂': [['fán'], ['mào']],
+    '繁荣': [['fán'], ['róng']],
+    '繁衍': [['fán'], ['yǎn']],
+    '繁重': [['fán'], ['zhòng']],
+    '繁难': [['fán'], ['nán']],
+    '繇役': [['yáo'], ['yì']],
+    '纠合': [['jiū'], ['hé']],
+    '纠正': [['jiū'], ['zhèng']],
+    '纠结': [['jiū'], ['jié']],
+    '纠葛': [['jiū'], ['gé']],
+    '红专': [['hóng'], ['zhuān']],
+    '红云': [['hóng'], ['yún']],
+    '红人': [['hóng'], ['rén']],
+    '红军': [['hóng'], ['jūn']],
+    '红利': [['hóng'], ['lì']],
+    '红包': [['hóng'], ['bāo']],
+    '红区': [['hóng'], ['qū']],
+    '红参': [['hóng'], ['cān']],
+    '红叶': [['hóng'], ['yè']],
+    '红土': [['hóng'], ['tǔ']],
+    '红场': [['hóng'], ['chǎng']],
+    '红壤': [['hóng'], ['rǎng']],
+    '红头': [['hóng'], ['tóu']],
+    '红女': [['hóng'], ['nǚ']],
+    '红妆': [['hóng'], ['zhuāng']],
+    '红娘': [['hóng'], ['niáng']],
+    '红学': [['hóng'], ['xué']],
+    '红尘': [['hóng'], ['chén']],
+    '红岩': [['hóng'], ['yán']],
+    '红布': [['hóng'], ['bù']],
+    '红心': [['hóng'], ['xīn']],
+    '红教': [['hóng'], ['jiào']],
+    '红旗': [['hóng'], ['qí']],
+    '红日': [['hóng'], ['rì']],
+    '红星': [['hóng'], ['xīng']],
+    '红晕': [['hóng'], ['yùn']],
+    '红曲': [['hóng'], ['qǔ']],
+    '红木': [['hóng'], ['mù']],
+    '红杉': [['hóng'], ['shān']],
+    '红枣': [['hóng'], ['zǎo']],
+    '红树': [['hóng'], ['shù']],
+    '红桃': [['hóng'], ['táo']],
+    '红案': [['hóng'], ['àn']],
+    '红桥': [['hóng'], ['qiáo']],
+    '红棉': [['hóng'], ['mián']],
+    '红楼': [['hóng'], ['lóu']],
+    '红榜': [['hóng'], ['bǎng']],
+    '红汞': [['hóng'], ['gǒng']],
+    '红河': [['hóng'], ['hé']],
+    '红海': [['hóng'], ['hǎi']],
+    '红润': [['hóng'], ['rùn']],
+    '红潮': [['hóng'], ['cháo']],
+    '红火': [['hóng'], ['huǒ']],
+    '红灯': [['hóng'], ['dēng']],
+    '红烧': [['hóng'], ['shāo']],
+    '红牌': [['hóng'], ['pái']],
+    '红玉': [['hóng'], ['yù']],
+    '红生': [['hóng'], ['shēng']],
+    '红皮': [['hóng'], ['pí']],
+    '红盘': [['hóng'], ['pán']],
+    '红眼': [['hóng'], ['yǎn']],
+    '红票': [['hóng'], ['piào']],
+    '红粉': [['hóng'], ['fěn']],
+    '红糖': [['hóng'], ['táng']],
+    '红红': [['hóng'], ['hóng']],
+    '红线': [['hóng'], ['xiàn']],
+    '红肿': [['hóng'], ['zhǒng']],
+    '红脸': [['hóng'], ['liǎn']],
+    '红色': [['hóng'], ['sè']],
+    '红艳': [['hóng'], ['yàn']],
+    '红花': [['hóng'], ['huā']],
+    '红苕': [['hóng'], ['sháo']],
+    '红茶': [['hóng'], ['chá']],
+    '红莲': [['hóng'], ['lián']],
+    '红薯': [['hóng'], ['shǔ']],
+    '红藤': [['hóng'], ['téng']],
+    '红虫': [['hóng'], ['chóng']],
+    '红蛋': [['hóng'], ['dàn']],
+    '红螺': [['hóng'], ['luó']],
+    '红衣': [['hóng'], ['yī']],
+    '红袖': [['hóng'], ['xiù']],
+    '红装': [['hóng'], ['zhuāng']],
+    '红豆': [['hóng'], ['dòu']],
+    '红货': [['hóng'], ['huò']],
+    '红运': [['hóng'], ['yùn']],
+    '红铜': [['hóng'], ['tóng']],
+    '红颜': [['hóng'], ['yán']],
+    '红鱼': [['hóng'], ['yú']],
+    '纤夫': [['qiàn'], ['fū']],
+    '纤小': [['xiān'], ['xiǎo']],
+    '纤尘': [['xiān'], ['chén']],
+    '纤巧': [['xiān'], ['qiǎo']],
+    '纤度': [['xiān'], ['dù']],
+    '纤弱': [['xiān'], ['ruò']],
+    '纤微': [['xiān'], ['wēi']],
+    '纤悉': [['xiān'], ['xī']],
+    '纤手': [['qiàn'], ['shǒu']],
+    '纤柔': [['xiān'], ['róu']],
+    '纤毛': [['xiān'], ['máo']],
+    '纤毫': [['xiān'], ['háo']],
+    '纤瘦': [['xiān'], ['shòu']],
+    '纤秀': [['xiān'], ['xiù']],
+    '纤纤': [['xiān'], ['xiān']],
+    '纤细': [['xiān'], ['xì']],
+    '纤绳': [['qiàn'], ['shéng']],
+    '纤维': [['xiān'], ['wéi']],
+    '纤长': [['xiān'], ['cháng']],
+    '纥繨': [['gē'], ['da']],
+    '约会': [['yuē'], ['huì']],
+    '约分': [['yuē'], ['fēn']],
+    '约同': [['yuē'], ['tóng']],
+    '约定': [['yuē'], ['dìng']],
+    '约摸': [['yuē'], ['mō']],
+    '约数': [['yuē'], ['shù']],
+    '约旦': [['yuē'], ['dàn']],
+    '约期': [['yuē'], ['qī']],
+    '约束': [['yuē'], ['shù']],
+    '约法': [['yuē'], ['fǎ']],
+    '约略': [['yuē'], ['lüè']],
+    '约稿': [['yuē'], ['gǎo']],
+    '约莫': [['yuē'], ['mò']],
+    '约见': [['yuē'], ['jiàn']],
+    '约言': [['yuē'], ['yán']],
+    '约计': [['yuē'], ['jì']],
+    '约请': [['yuē'], ['qǐng']],
+    '约集': [['yuē'], ['jí']],
+    '级任': [['jí'], ['rèn']],
+    '级别': [['jí'], ['bié']],
+    '级差': [['jí'], ['chà']],
+    '级数': [['jí'], ['shù']],
+    '纨扇': [['wán'], ['shàn']],
+    '纪事': [['jì'], ['shì']],
+    '纪元': [['jì'], ['yuán']],
+    '纪委': [['jì'], ['wěi']],
+    '纪实': [['jì'], ['shí']],
+    '纪年': [['jì'], ['nián']],
+    '纪录': [['jì'], ['lù']],
+    '纪律': [['jì'], ['lǜ']],
+    '纪念': [['jì'], ['niàn']],
+    '纪检': [['jì'], ['jiǎn']],
+    '纪纲': [['jì'], ['gāng']],
+    '纪行': [['jì'], ['xíng']],
+    '纪要': [['jì'], ['yào']],
+    '纬度': [['wěi'], ['dù']],
+    '纯净': [['chún'], ['jìng']],
+    '纯化': [['chún'], ['huà']],
+    '纯度': [['chún'], ['dù']],
+    '纯朴': [['chún'], ['piáo']],
+    '纯正': [['chún'], ['zhèng']],
+    '纯种': [['chún'], ['zhǒng']],
+    '纯钢': [['chún'], ['gāng']],
+    '纰漏': [['pī'], ['lòu']],
+    '纰缪': [['pī'], ['miù']],
+    '纱厂': [['shā'], ['chǎng']],
+    '纱笼': [['shā'], ['lóng']],
+    '纲纪': [['gāng'], ['jì']],
+    '纲要': [['gāng'], ['yào']],
+    '纳凉': [['nà'], ['liáng']],
+    '纳采': [['nà'], ['cǎi']],
+    '纳闷': [['nà'], ['mèn']],
+    '纳降': [['nà'], ['xiáng']],
+    '纵令': [['zòng'], ['lìng']],
+    '纵声': [['zòng'], ['shēng']],
+    '纵容': [['zòng'], ['róng']],
+    '纵横': [['zòng'], ['héng']],
+    '纵波': [['zòng'], ['bō']],
+    '纵火': [['zòng'], ['huǒ']],
+    '纵观': [['zòng'], ['guān']],
+    '纵论': [['zòng'], ['lùn']],
+    '纵身': [['zòng'], ['shēn']],
+    '纶巾': [['guān'], ['jīn']],
+    '纷繁': [['fēn'], ['fán']],
+    '纸夹': [['zhǐ'], ['jiā']],
+    '纸捻': [['zhǐ'], ['niǎn']],
+    '纸浆': [['zhǐ'], ['jiāng']],
+    '纸票': [['zhǐ'], ['piào']],
+    '纹理': [['wén'], ['lǐ']],
+    '纹路': [['wén'], ['lù']],
+    '纹身': [['wén'], ['shēn']],
+    '纹银': [['wén'], ['yín']],
+    '纹饰': [['wén'], ['shì']],
+    '纺车': [['fǎng'], ['chē']],
+    '纽结': [['niǔ'], ['jié']],
+    '线呢': [['xiàn'], ['ne']],
+    '线圈': [['xiàn'], ['quān']],
+    '线头': [['xiàn'], ['tóu']],
+    '线轴': [['xiàn'], ['zhóu']],
+    '练漂': [['liàn'], ['piāo']],
+    '组分': [['zǔ'], ['fèn']],
+    '组合': [['zǔ'], ['hé']],
+    '组员': [['zǔ'], ['yuán']],
+    '组曲': [['zǔ'], ['qǔ']],
+    '组长': [['zǔ'], ['zhǎng']],
+    '细别': [['xì'], ['bié']],
+    '细发': [['xì'], ['fà']],
+    '细挑': [['xì'], ['tiāo']],
+    '细看': [['xì'], ['kàn']],
+    '细节': [['xì'], ['jié']],
+    '细菌': [['xì'], ['jūn']],
+    '细语': [['xì'], ['yǔ']],
+    '细说': [['xì'], ['shuō']],
+    '细读': [['xì'], ['dú']],
+    '细长': [['xì'], ['cháng']],
+    '细雨': [['xì'], ['yǔ']],
+    '织女': [['zhī'], ['nǚ']],
+    '织机': [['zhī'], ['jī']],
+    '织造': [['zhī'], ['zào']],
+    '织金': [['zhī'], ['jīn']],
+    '终了': [['zhōng'], ['liǎo']],
+    '终场': [['zhōng'], ['chǎng']],
+    '终将': [['zhōng'], ['jiāng']],
+    '终结': [['zhōng'], ['jié']],
+    '绊倒': [['bàn'], ['dǎo']],
+    '绍兴': [['shào'], ['xīng']],
+    '经传': [['jīng'], ['zhuàn']],
+    '经卷': [['jīng'], ['juàn']],
+    '经幢': [['jīng'], ['chuáng']],
+    '经度': [['jīng'], ['dù']],
+    '经期': [['jīng'], ['qī']],
+    '经济': [['jīng'], ['jì']],
+    '经纪': [['jīng'], ['jì']],
+    '经纶': [['jīng'], ['lún']],
+    '经络': [['jīng'], ['luò']],
+    '经脉': [['jīng'], ['mài']],
+    '经血': [['jīng'], ['xuè']],
+    '经过': [['jīng'], ['guò']],
+    '绑扎': [['bǎng'], ['zhā']],
+    '绑票': [['bǎng'], ['piào']],
+    '结业': [['jié'], ['yè']],
+    '结义': [['jié'], ['yì']],
+    '结交': [['jié'], ['jiāo']],
+    '结亲': [['jié'], ['qīn']],
+    '结仇': [['jié'], ['chóu']],
+    '结伙': [['jié'], ['huǒ']],
+    '结伴': [['jié'], ['bàn']],
+    '结余': [['jié'], ['yú']],
+    '结冰': [['jié'], ['bīng']],
+    '结发': [['jié'], ['fà']],
+    '结合': [['jié'], ['hé']],
+    '结喉': [['jié'], ['hóu']],
+    '结婚': [['jié'], ['hūn']],
+    '结子': [['jié'], ['zǐ']],
+    '结存': [['jié'], ['cún']],
+    '结实': [['jiē'], ['shí']],
+    '结尾': [['jié'], ['wěi']],
+    '结局': [['jié'], ['jú']],
+    '结巴': [['jiē'], ['bā']],
+    '结帐': [['jié'], ['zhàng']],
+    '结幕': [['jié'], ['mù']],
+    '结庐': [['jié'], ['lú']],
+    '结彩': [['jié'], ['cǎi']],
+    '结怨': [['jié'], ['yuàn']],
+    '结成': [['jié'], ['chéng']],
+    '结扎': [['jié'], ['zā']],
+    '结拜': [['jié'], ['bài']],
+    '结晶': [['jié'], ['jīng']],
+    '结束': [['jié'], ['shù']],
+    '结构': [['jié'], ['gòu']],
+    '结果': [['jié'], ['guǒ']],
+    '结核': [['jié'], ['hé']],
+    '结案': [['jié'], ['àn']],
+    '结汇': [['jié'], ['huì']],
+    '结清': [['jié'], ['qīng']],
+    '结点': [['jié'], ['diǎn']],
+    '结疤': [['jié'], ['bā']],
+    '结痂': [['jié'], ['jiā']],
+    '结盟': [['jié'], ['méng']],
+    '结石': [['jié'], ['shí']],
+    '结社': [['jié'], ['shè']],
+    '结算': [['jié'], ['suàn']],
+    '结缘': [['jié'], ['yuán']],
+    '结网': [['jié'], ['wǎng']],
+    '结肠': [['jié'], ['cháng']],
+    '结膜': [['jié'], ['mó']],
+    '结舌': [['jié'], ['shé']],
+    '结节': [['jié'], ['jié']],
+    '结论': [['jié'], ['lùn']],
+    '结识': [['jié'], ['shí']],
+    '结语': [['jié'], ['yǔ']],
+    '结账': [['jié'], ['zhàng']],
+    '结队': [['jié'], ['duì']],
+    '结集': [['jié'], ['jí']],
+    '绕行': [['rào'], ['xíng']],
+    '绘划': [['huì'], ['huà']],
+    '给与': [['gěi'], ['yǔ']],
+    '给予': [['jǐ'], ['yǔ']],
+    '给付': [['gěi'], ['fù']],
+    '给以': [['gěi'], ['yǐ']],
+    '给体': [['jǐ'], ['tǐ']],
+    '给养': [['jǐ'], ['yǎng']],
+    '给定': [['gěi'], ['dìng']],
+    '给水': [['jǐ'], ['shuǐ']],
+    '给钱': [['gěi'], ['qián']],
+    '绚丽': [['xuàn'], ['lì']],
+    '络子': [['lào'], ['zi']],
+    '络绎': [['luò'], ['yì']],
+    '络脉': [['luò'], ['mài']],
+    '络腮': [['luò'], ['sāi']],
+    '绝倒': [['jué'], ['dǎo']],
+    '绝地': [['jué'], ['dì']],
+    '绝景': [['jué'], ['jǐng']],
+    '绝症': [['jué'], ['zhèng']],
+    '绝着': [['jué'], ['zhāo']],
+    '绝种': [['jué'], ['zhǒng']],
+    '绝食': [['jué'], ['shí']],
+    '绞车': [['jiǎo'], ['chē']],
+    '统共': [['tǒng'], ['gòng']],
+    '统属': [['tǒng'], ['shǔ']],
+    '统括': [['tǒng'], ['kuò']],
+    '统率': [['tǒng'], ['shuài']],
+    '统称': [['tǒng'], ['chēng']],
+    '统观': [['tǒng'], ['guān']],
+    '绢扇': [['juàn'], ['shàn']],
+    '绥宁': [['suí'], ['níng']],
+    '继任': [['jì'], ['rèn']],
+    '继父': [['jì'], ['fù']],
+    '绰号': [['chuò'], ['hào']],
+    '绰约': [['chuò'], ['yuē']],
+    '绰绰': [['chuò'], ['chuò']],
+    '绳子': [['shéng'], ['zi']],
+    '绷子': [['bēng'], ['zǐ']],
+    '绷带': [['bēng'], ['dài']],
+    '绷簧': [['bēng'], ['huáng']],
+    '绷脸': [['běng'], ['liǎn']],
+    '绸缪': [['chóu'], ['móu']],
+    '综合': [['zōng'], ['hé']],
+    '综述': [['zōng'], ['shù']],
+    '绿化': [['lǜ'], ['huà']],
+    '绿林': [['lù'], ['lín']],
+    '缆车': [['lǎn'], ['chē']],
+    '缉凶': [['jī'], ['xiōng']],
+    '缉拿': [['jī'], ['ná']],
+    '缉捕': [['jī'], ['bǔ']],
+    '缉查': [['jī'], ['chá']],
+    '缉私': [['jī'], ['sī']],
+    '缉获': [['jī'], ['huò']],
+    '缓冲': [['huǎn'], ['chōng']],
+    '缓和': [['huǎn'], ['hé']],
+    '缓期': [['huǎn'], ['qī']],
+    '缓行': [['huǎn'], ['xíng']],
+    '缓解': [['huǎn'], ['jiě']],
+    '缔合': [['dì'], ['hé']],
+    '缔约': [['dì'], ['yuē']],
+    '缔结': [['dì'], ['jié']],
+    '编内': [['biān'], ['nèi']],
+    '编发': [['biān'], ['fā']],
+    '编号': [['biān'], ['hào']],
+    '编排': [['biān'], ['pái']],
+    '编校': [['biān'], ['xiào']],
+    '编结': [['biān'], ['jié']],
+    '编著': [['biān'], ['zhù']],
+    '缘簿': [['yuán'], ['bù']],
+    '缝儿': [['fèng'], ['er']],
+    '缝制': [['féng'], ['zhì']],
+    '缝合': [['féng'], ['hé']],
+    '缝子': [['fèng'], ['zi']],
+    '缝工': [['fèng'], ['gōng']],
+    '缝穷': [['fèng'], ['qióng']],
+    '缝纫': [['féng'], ['rèn']],
+    '缝线': [['fèng'], ['xiàn']],
+    '缝缀': [['féng'], ['zhuì']],
+    '缝衣': [['féng'], ['yī']],
+    '缝补': [['féng'], ['bǔ']],
+    '缝际': [['fèng'], ['jì']],
+    '缝隙': [['fèng'], ['xì']],
+    '缠磨': [['chán'], ['mó']],
+    '缠结': [['chán'], ['jié']],
+    '缥缈': [['piāo'], ['miǎo']],
+    '缨子': [['yīng'], ['zi']],
+    '缩写': [['suō'], ['xiě']],
+    '缩减': [['suō'], ['jiǎn']],
+    '缩印': [['suō'], ['yìn']],
+    '缩回': [['suō'], ['huí']],
+    '缩图': [['suō'], ['tú']],
+    '缩头': [['suō'], ['tóu']],
+    '缩小': [['suō'], ['xiǎo']],
+    '缩尺': [['suō'], ['chǐ']],
+    '缩影': [['suō'], ['yǐng']],
+    '缩微': [['suō'], ['wēi']],
+    '缩手': [['suō'], ['shǒu']],
+    '缩水': [['suō'], ['shuǐ']],
+    '缩略': [['suō'], ['lüè']],
+    '缩短': [['suō'], ['duǎn']],
+    '缩砂': [['sù'], ['shā']],
+    '缩简': [['suō'], ['jiǎn']],
+    '缩紧': [['suō'], ['jǐn']],
+    '缩编': [['suō'], ['biān']],
+    '缩缩': [['suō'], ['suō']],
+    '缩聚': [['suō'], ['jù']],
+    '缩进': [['suō'], ['jìn']],
+    '缩颈': [['suō'], ['jǐng']],
+    '缴付': [['jiǎo'], ['fù']],
+    '缴枪': [['jiǎo'], ['qiāng']],
+    '缴械': [['jiǎo'], ['xiè']],
+    '缴税': [['jiǎo'], ['shuì']],
+    '缴纳': [['jiǎo'], ['nà']],
+    '缴获': [['jiǎo'], ['huò']],
+    '缴销': [['jiǎo'], ['xiāo']],
+    '缸瓦': [['gāng'], ['wǎ']],
+    '缺少': [['quē'], ['shǎo']],
+    '罄尽': [['qìng'], ['jìn']],
+    '罐头': [['guàn'], ['tou']],
+    '网络': [['wǎng'], ['luò']],
+    '罕有': [['hǎn'], ['yǒu']],
+    '罕见': [['hǎn'], ['jiàn']],
+    '罗刹': [['luó'], ['chà']],
+    '罗勒': [['luó'], ['lè']],
+    '罗圈': [['luó'], ['quān']],
+    '罗拉': [['luó'], ['lā']],
+    '罗甸': [['luó'], ['diàn']],
+    '罗纹': [['luó'], ['wén']],
+    '罗织': [['luó'], ['zhī']],
+    '罪恶': [['zuì'], ['è']],
+    '罪行': [['zuì'], ['xíng']],
+    '罪过': [['zuì'], ['guò']],
+    '置信': [['zhì'], ['xìn']],
+    '置疑': [['zhì'], ['yí']],
+    '罹难': [['lí'], ['nàn']],
+    '羊圈': [['yáng'], ['juàn']],
+    '羊头': [['yáng'], ['tóu']],
+    '羊桃': [['yáng'], ['táo']],
+    '羊毛': [['yáng'], ['máo']],
+    '羊羹': [['yáng'], ['gēng']],
+    '羊肚': [['yáng'], ['dǔ']],
+    '羊脂': [['yáng'], ['zhī']],
+    '羊角': [['yáng'], ['jiǎo']],
+    '美丽': [['měi'], ['lì']],
+    '美化': [['měi'], ['huà']],
+    '美地': [['měi'], ['dì']],
+    '美女': [['měi'], ['nǚ']],
+    '美好': [['měi'], ['hǎo']],
+    '美差': [['měi'], ['chāi']],
+    '美景': [['měi'], ['jǐng']],
+    '美术': [['měi'], ['shù']],
+    '美称': [['měi'], ['chēng']],
+    '美观': [['měi'], ['guān']],
+    '美语': [['měi'], ['yǔ']],
+    '美食': [['měi'], ['shí']],
+    '羞恶': [['xiū'], ['wù']],
+    '羞臊': [['xiū'], ['sào']],
+    '群体': [['qún'], ['tǐ']],
+    '群氓': [['qún'], ['méng']],
+    '羹匙': [['gēng'], ['chí']],
+    '羹汤': [['gēng'], ['tāng']],
+    '羽冠': [['yǔ'], ['guān']],
+    '羽化': [['yǔ'], ['huà']],
+    '羽扇': [['yǔ'], ['shàn']],
+    '翅膀': [['chì'], ['bǎng']],
+    '翅鞘': [['chì'], ['qiào']],
+    '翘企': [['qiáo'], ['qǐ']],
+    '翘望': [['qiáo'], ['wàng']],
+    '翘棱': [['qiáo'], ['lēng']],
+    '翘楚': [['qiáo'], ['chǔ']],
+    '翘盼': [['qiáo'], ['pàn']],
+    '翘翘': [['qiào'], ['qiào']],
+    '翘起': [['qiào'], ['qǐ']],
+    '翘首': [['qiáo'], ['shǒu']],
+    '翠柏': [['cuì'], ['bǎi']],
+    '翠绿': [['cuì'], ['lǜ']],
+    '翻供': [['fān'], ['gòng']],
+    '翻倒': [['fān'], ['dǎo']],
+    '翻卷': [['fān'], ['juǎn']],
+    '翻地': [['fān'], ['dì']],
+    '翻弄': [['fān'], ['nòng']],
+    '翻斗': [['fān'], ['dǒu']],
+    '翻查': [['fān'], ['chá']],
+    '翻浆': [['fān'], ['jiāng']],
+    '翻涌': [['fān'], ['yǒng']],
+    '翻番': [['fān'], ['fān']],
+    '翻盖': [['fān'], ['gài']],
+    '翻车': [['fān'], ['chē']],
+    '翻转': [['fān'], ['zhuǎn']],
+    '翼侧': [['yì'], ['cè']],
+    '老亲': [['lǎo'], ['qīn']],
+    '老伯': [['lǎo'], ['bó']],
+    '老几': [['lǎo'], ['jǐ']],
+    '老化': [['lǎo'], ['huà']],
+    '老区': [['lǎo'], ['ōu']],
+    '老大': [['lǎo'], ['dà']],
+    '老夫': [['lǎo'], ['fū']],
+    '老头': [['lǎo'], ['tóu']],
+    '老子': [['lǎo'], ['zi']],
+    '老家': [['lǎo'], ['jiā']],
+    '老将': [['lǎo'], ['jiàng']],
+    '老少': [['lǎo'], ['shào']],
+    '老底': [['lǎo'], ['dǐ']],
+    '老弟': [['lǎo'], ['dì']],
+    '老景': [['lǎo'], ['jǐng']],
+    '老汤': [['lǎo'], ['tāng']],
+    '老父': [['lǎo'], ['fù']],
+    '老相': [['lǎo'], ['xiāng']],
+    '老调': [['lǎo'], ['diào']],
+    '考中': [['kǎo'], ['zhōng']],
+    '考分': [['kǎo'], ['fēn']],
+    '考区': [['kǎo'], ['qū']],
+    '考卷': [['kǎo'], ['juàn']],
+    '考场': [['kǎo'], ['chǎng']],
+    '考据': [['kǎo'], ['jù']],
+    '考期': [['kǎo'], ['qī']],
+    '考查': [['kǎo'], ['chá']],
+    '考核': [['kǎo'], ['hé']],
+    '考量': [['kǎo'], ['liáng']],
+    '耆宿': [['qí'], ['sù']],
+    '耆老': [['qí'], ['lǎo']],
+    '而且': [['ér'], ['qiě']],
+    '耍弄': [['shuǎ'], ['nòng']],
+    '耍横': [['shuǎ'], ['hèng']],
+    '耐看': [['nài'], ['kàn']],
+    '耐磨': [['nài'], ['mó']],
+    '耕地': [['gēng'], ['dì']],
+    '耕畜': [['gēng'], ['chù']],
+    '耕种': [['gēng'], ['zhòng']],
+    '耕读': [['gēng'], ['dú']],
+    '耗子': [['hào'], ['zi']],
+    '耗尽': [['hào'], ['jìn']],
+    '耗散': [['hào'], ['sàn']],
+    '耙地': [['bà'], ['dì']],
+    '耙子': [['pá'], ['zǐ']],
+    '耥耙': [['tǎng'], ['bà']],
+    '耳塞': [['ěr'], ['sāi']],
+    '耳石': [['ěr'], ['shí']],
+    '耳背': [['ěr'], ['bèi']],
+    '耳语': [['ěr'], ['yǔ']],
+    '耳食': [['ěr'], ['shí']],
+    '耶教': [['yē'], ['jiào']],
+    '耶稣': [['yē'], ['sū']],
+    '耷拉': [['dā'], ['lā']],
+    '耸峙': [['sǒng'], ['zhì']],
+    '耻骨': [['chǐ'], ['gǔ']],
+    '耽搁': [['dān'], ['gē']],
+    '耽溺': [['dān'], ['nì']],
+    '聋子': [['lóng'], ['zi']],
+    '联体': [['lián'], ['tǐ']],
+    '联华': [['lián'], ['huá']],
+    '联句': [['lián'], ['jù']],
+    '联合': [['lián'], ['hé']],
+    '联大': [['lián'], ['dà']],
+    '联票': [['lián'], ['piào']],
+    '联系': [['lián'], ['xì']],
+    '联结': [['lián'], ['jié']],
+    '联络': [['lián'], ['luò']],
+    '聘任': [['pìn'], ['rèn']],
+    '聘期': [['pìn'], ['qī']],
+    '聘约': [['pìn'], ['yuē']],
+    '聚会': [['jù'], ['huì']],
+    '聚合': [['jù'], ['hé']],
+    '聚头': [['jù'], ['tóu']],
+    '聚散': [['jù'], ['sàn']],
+    '聚结': [['jù'], ['jié']],
+    '聚落': [['jù'], ['luò']],
+    '聚齐': [['jù'], ['qí']],
+    '肆应': [['sì'], ['yìng']],
+    '肆行': [['sì'], ['xíng']],
+    '肉丁': [['ròu'], ['dīng']],
+    '肉体': [['ròu'], ['tǐ']],
+    '肉冠': [['ròu'], ['guān']],
+    '肉头': [['ròu'], ['tóu']],
+    '肉干': [['ròu'], ['gān']],
+    '肉排': [['ròu'], ['pái']],
+    '肉片': [['ròu'], ['piàn']],
+    '肉畜': [['ròu'], ['chù']],
+    '肉票': [['ròu'], ['piào']],
+    '肉糜': [['ròu'], ['mí']],
+    '肉红': [['ròu'], ['hóng']],
+    '肉铺': [['ròu'], ['pù']],
+    '肉食': [['ròu'], ['shí']],
+    '肋木': [['lèi'], ['mù']],
+    '肋条': [['lèi'], ['tiáo']],
+    '肋骨': [['lèi'], ['gǔ']],
+    '肌体': [['jī'], ['tǐ']],
+    '肌骨': [['jī'], ['gǔ']],
+    '肖像': [['xiào'], ['xiàng']],
+    '肚丝': [['dǔ'], ['sī']],
+    '肚兜': [['dù'], ['dōu']],
+    '肚子': [['dǔ'], ['zi']],
+    '肚带': [['dù'], ['dài']],
+    '肚片': [['dǔ'], ['piàn']],
+    '肚皮': [['dù'], ['pí']],
+    '肚肠': [['dù'], ['cháng']],
+    '肚脐': [['dù'], ['qí']],
+    '肚量': [['dù'], ['liàng']],
+    '肠子': [['cháng'], ['zi']],
+    '股份': [['gǔ'], ['fèn']],
+    '股分': [['gǔ'], ['fēn']],
+    '股票': [['gǔ'], ['piào']],
+    '股长': [['gǔ'], ['zhǎng']],
+    '股骨': [['gǔ'], ['gǔ']],
+    '肢体': [['zhī'], ['tǐ']],
+    '肢解': [['zhī'], ['jiě']],
+    '肤浅': [['fū'], ['qiǎn']],
+    '肤觉': [['fū'], ['jué']],
+    '肥大': [['féi'], ['dà']],
+    '肥差': [['féi'], ['chà']],
+    '肥硕': [['féi'], ['shuò']],
+    '肩头': [['jiān'], ['tóu']],
+    '肩挑': [['jiān'], ['tiāo']],
+    '肩背': [['jiān'], ['bèi']],
+    '肮脏': [['āng'], ['zāng']],
+    '肯綮': [['kěn'], ['qìng']],
+    '肱骨': [['gōng'], ['gǔ']],
+    '育种': [['yù'], ['zhǒng']],
+    '肺叶': [['fèi'], ['yè']],
+    '肺泡': [['fèi'], ['pào']],
+    '肾囊': [['shèn'], ['náng']],
+    '肿大': [['zhǒng'], ['dà']],
+    '胁从': [['xié'], ['cóng']],
+    '胁迫': [['xié'], ['pò']],
+    '胆囊': [['dǎn'], ['náng']],
+    '胆子': [['dǎn'], ['zi']],
+    '胆识': [['dǎn'], ['shí']],
+    '胆量': [['dǎn'], ['liàng']],
+    '背书': [['bèi'], ['shū']],
+    '背人': [['bèi'], ['rén']],
+    '背信': [['bèi'], ['xìn']],
+    '背债': [['bēi'], ['zhài']],
+    '背光': [['bèi'], ['guāng']],
+    '背包': [['bēi'], ['bāo']],
+    '背叛': [['bèi'], ['pàn']],
+    '背后': [['bèi'], ['hòu']],
+    '背向': [['bèi'], ['xiàng']],
+    '背囊': [['bèi'], ['náng']],
+    '背地': [['bèi'], ['dì']],
+    '背子': [['bēi'], ['zi']],
+    '背带': [['bēi'], ['dài']],
+    '背弃': [['bèi'], ['qì']],
+    '背影': [['bèi'], ['yǐng']],
+    '背心': [['bèi'], ['xīn']],
+    '背时': [['bèi'], ['shí']],
+    '背景': [['bèi'], ['jǐng']],
+    '背榜': [['bēi'], ['bǎng']],
+    '背气': [['bèi'], ['qì']],
+    '背熟': [['bèi'], ['shú']],
+    '背离': [['bèi'], ['lí']],
+    '背筐': [['bēi'], ['kuāng']],
+    '背篓': [['bēi'], ['lǒu']],
+    '背篼': [['bèi'], ['dōu']],
+    '背约': [['bèi'], ['yuē']],
+    '背脊': [['bèi'], ['jǐ']],
+    '背街': [['bèi'], ['jiē']],
+    '背袋': [['bèi'], ['dài']],
+    '背诵': [['bèi'], ['sòng']],
+    '背谬': [['bèi'], ['miù']],
+    '背负': [['bēi'], ['fù']],
+    '背运': [['bèi'], ['yùn']],
+    '背部': [['bèi'], ['bù']],
+    '背阴': [['bèi'], ['yīn']],
+    '背静': [['bèi'], ['jìng']],
+    '背靠': [['bèi'], ['kào']],
+    '背面': [['bèi'], ['miàn']],
+    '背风': [['bèi'], ['fēng']],
+    '背鳍': [['bèi'], ['qí']],
+    '胎发': [['tāi'], ['fà']],
+    '胎教': [['tāi'], ['jiào']],
+    '胎毒': [['tāi'], ['dú']],
+    '胖子': [['pàng'], ['zi']],
+    '胚轴': [['pēi'], ['zhóu']],
+    '胜任': [['shèng'], ['rèn']],
+    '胜似': [['shèng'], ['sì']],
+    '胜券': [['shèng'], ['quàn']],
+    '胜地': [['shèng'], ['dì']],
+    '胜景': [['shèng'], ['jǐng']],
+    '胜朝': [['shèng'], ['cháo']],
+    '胜过': [['shèng'], ['guò']],
+    '胡同': [['hú'], ['tòng']],
+    '胡说': [['hú'], ['shuō']],
+    '胫骨': [['jìng'], ['gǔ']],
+    '胭红': [['yān'], ['hóng']],
+    '胯骨': [['kuà'], ['gǔ']],
+    '胳肢': [['gē'], ['zhī']],
+    '胳膊': [['gē'], ['bó']],
+    '胳臂': [['gē'], ['bei']],
+    '胴体': [['dòng'], ['tǐ']],
+    '胶体': [['jiāo'], ['tǐ']],
+    '胶卷': [['jiāo'], ['juǎn']],
+    '胶合': [['jiāo'], ['hé']],
+    '胶囊': [['jiāo'], ['náng']],
+    '胶泥': [['jiāo'], ['ní']],
+    '胶片': [['jiāo'], ['piàn']],
+    '胶着': [['jiāo'], ['zhe']],
+    '胶结': [['jiāo'], ['jié']],
+    '胸中': [['xiōng'], ['zhōng']],
+    '胸椎': [['xiōng'], ['zhuī']],
+    '胸脯': [['xiōng'], ['pú']],
+    '胸闷': [['xiōng'], ['mēn']],
+    '胸骨': [['xiōng'], ['gǔ']],
+    '能事': [['néng'], ['shì']],
+    '能人': [['néng'], ['rén']],
+    '能力': [['néng'], ['lì']],
+    '能动': [['néng'], ['dòng']],
+    '能否': [['néng'], ['fǒu']],
+    '能够': [['néng'], ['gòu']],
+    '能干': [['néng'], ['gàn']],
+    '能手': [['néng'], ['shǒu']],
+    '能源': [['néng'], ['yuán']],
+    '能耐': [['néng'], ['nài']],
+    '能耗': [['néng'], ['hào']],
+    '能量': [['néng'], ['liàng']],
+    '脂膏': [['zhī'], ['gāo']],
+    '脆骨': [['cuì'], ['gǔ']],
+    '脉冲': [['mài'], ['chōng']],
+    '脉动': [['mài'], ['dòng']],
+    '脉压': [['mài'], ['yā']],
+    '脉息': [['mài'], ['xī']],
+    '脉搏': [['mài'], ['bó']],
+    '脉案': [['mài'], ['àn']],
+    '脉理': [['mài'], ['lǐ']],
+    '脉石': [['mài'], ['shí']],
+    '脉管': [['mài'], ['guǎn']],
+    '脉络': [['mài'], ['luò']],
+    '脉脉': [['mò'], ['mò']],
+    '脉象': [['mài'], ['xiàng']],
+    '脉门': [['mài'], ['mén']],
+    '脊椎': [['jǐ'], ['zhuī']],
+    '脊背': [['jǐ'], ['bèi']],
+    '脊骨': [['jǐ'], ['gǔ']],
+    '脏了': [['zāng'], ['le']],
+    '脏话': [['zāng'], ['huà']],
+    '脑壳': [['nǎo'], ['ké']],
+    '脑子': [['nǎo'], ['zi']],
+    '脑浆': [['nǎo'], ['jiāng']],
+    '脑涨': [['nǎo'], ['zhàng']],
+    '脓血': [['nóng'], ['xuè']],
+    '脖子': [['bó'], ['zi']],
+    '脖颈': [['bó'], ['gěng']],
+    '脱发': [['tuō'], ['fà']],
+    '脱壳': [['tuō'], ['qiào']],
+    '腈纶': [['jīng'], ['lún']],
+    '腊八': [['là'], ['bā']],
+    '腊味': [['là'], ['wèi']],
+    '腊日': [['là'], ['rì']],
+    '腊月': [['là'], ['yuè']],
+    '腊梅': [['là'], ['méi']],
+    '腊肉': [['là'], ['ròu']],
+    '腊肠': [['là'], ['cháng']],
+    '腋臭': [['yè'], ['chòu']],
+    '腌制': [['yān'], ['zhì']],
+    '腌渍': [['yān'], ['zì']],
+    '腌肉': [['yān'], ['ròu']],
+    '腌臜': [['ā'], ['zā']],
+    '腌臢': [['ā'], ['zā']],
+    '腌菜': [['yān'], ['cài']],
+    '腐化': [['fǔ'], ['huà']],
+    '腐坏': [['fǔ'], ['huài']],
+    '腐恶': [['fǔ'], ['è']],
+    '腐臭': [['fǔ'], ['chòu']],
+    '腓骨': [['féi'], ['gǔ']],
+    '腔调': [['qiāng'], ['diào']],
+    '腕骨': [['wàn'], ['gǔ']],
+    '腥膻': [['xīng'], ['shān']],
+    '腥臊': [['xīng'], ['sāo']],
+    '腥臭': [['xīng'], ['chòu']],
+    '腭裂': [['è'], ['liè']],
+    '腮红': [['sāi'], ['hóng']],
+    '腰俞': [['yāo'], ['yú']],
+    '腰杆': [['yāo'], ['gǎn']],
+    '腰椎': [['yāo'], ['zhuī']],
+    '腰背': [['yāo'], ['bèi']],
+    '腱鞘': [['jiàn'], ['qiào']],
+    '腹内': [['fù'], ['nèi']],
+    '腹地': [['fù'], ['dì']],
+    '腾冲': [['téng'], ['chōng']],
+    '腾涌': [['téng'], ['yǒng']],
+    '腾空': [['téng'], ['kōng']],
+    '膀胱': [['páng'], ['guāng']],
+    '膀臂': [['bǎng'], ['bì']],
+    '膏剂': [['gāo'], ['jì']],
+    '膏子': [['gāo'], ['zǐ']],
+    '膏泽': [['gào'], ['zé']],
+    '膏粱': [['gāo'], ['liáng']],
+    '膏肓': [['gāo'], ['huāng']],
+    '膏腴': [['gāo'], ['yú']],
+    '膏药': [['gāo'], ['yào']],
+    '膏血': [['gāo'], ['xuè']],
+    '膝头': [['xī'], ['tóu']],
+    '膝盖': [['xī'], ['gài']],
+    '膝行': [['xī'], ['xíng']],
+    '膨化': [['péng'], ['huà']],
+    '膨大': [['péng'], ['dà']],
+    '膳宿': [['shàn'], ['sù']],
+    '膳食': [['shàn'], ['shí']],
+    '膻中': [['dàn'], ['zhōng']],
+    '膻气': [['shān'], ['qì']],
+    '臂力': [['bì'], ['lì']],
+    '臂助': [['bì'], ['zhù']],
+    '臂弯': [['bì'], ['wān']],
+    '臂章': [['bì'], ['zhāng']],
+    '臂腕': [['bì'], ['wàn']],
+    '臂膀': [['bì'], ['bǎng']],
+    '臂膊': [['bì'], ['bó']],
+    '臆度': [['yì'], ['duó']],
+    '臆见': [['yì'], ['jiàn']],
+    '臆说': [['yì'], ['shuō']],
+    '臊子': [['sào'], ['zǐ']],
+    '臣仆': [['chén'], ['pú']],
+    '臣服': [['chén'], ['fú']],
+    '臧否': [['zāng'], ['pǐ']],
+    '自乘': [['zì'], ['chéng']],
+    '自从': [['zì'], ['cóng']],
+    '自传': [['zì'], ['zhuàn']],
+    '自供': [['zì'], ['gòng']],
+    '自便': [['zì'], ['biàn']],
+    '自信': [['zì'], ['xìn']],
+    '自净': [['zì'], ['jìng']],
+    '自分': [['zì'], ['fēn']],
+    '自助': [['zì'], ['zhù']],
+    '自发': [['zì'], ['fā']],
+    '自嘲': [['zì'], ['cháo']],
+    '自大': [['zì'], ['dà']],
+    '自夸': [['zì'], ['kuā']],
+    '自家': [['zì'], ['jiā']],
+    '自尽': [['zì'], ['jìn']],
+    '自强': [['zì'], ['qiáng']],
+    '自当': [['zì'], ['dāng']],
+    '自得': [['zì'], ['dé']],
+    '自打': [['zì'], ['dǎ']],
+    '自旋': [['zì'], ['xuán']],
+    '自汗': [['zì'], ['hàn']],
+    '自省': [['zì'], ['xǐng']],
+    '自矜': [['zì'], ['jīn']],
+    '自知': [['zì'], ['zhī']],
+    '自禁': [['zì'], ['jīn']],
+    '自称': [['zì'], ['chēng']],
+    '自给': [['zì'], ['jǐ']],
+    '自若': [['zì'], ['ruò']],
+    '自行': [['zì'], ['xíng']],
+    '自觉': [['zì'], ['jué']],
+    '自许': [['zì'], ['xǔ']],
+    '自转': [['zì'], ['zhuàn']],
+    '自重': [['zì'], ['zhòng']],
+    '自量': [['zì'], ['liàng']],
+    '自食': [['zì'], ['shí']],
+    '臭味': [['chòu'], ['wèi']],
+    '臭棋': [['chòu'], ['qí']],
+    '臭椿': [['chòu'], ['chūn']],
+    '臭气': [['chòu'], ['qì']],
+    '臭氧': [['chòu'], ['yǎng']],
+    '臭美': [['chòu'], ['měi']],
+    '臭虫': [['chòu'], ['chóng']],
+    '臭骂': [['chòu'], ['mà']],
+    '至上': [['zhì'], ['shàng']],
+    '至为': [['zhì'], ['wéi']],
+    '至亲': [['zhì'], ['qīn']],
+    '至好': [['zhì'], ['hǎo']],
+    '至少': [['zhì'], ['shǎo']],
+    '至当': [['zhì'], ['dāng']],
+    '至正': [['zhì'], ['zhèng']],
+    '至若': [['zhì'], ['ruò']],
+    '舅父': [['jiù'], ['fù']],
+    '舆论': [['yú'], ['lùn']],
+    '舌头': [['shé'], ['tou']],
+    '舌苔': [['shé'], ['tāi']],
+    '舍亲': [['shè'], ['qīn']],
+    '舍去': [['shě'], ['qù']],
+    '舍己': [['shě'], ['jǐ']],
+    '舍弃': [['shě'], ['qì']],
+    '舍得': [['shè'], ['de']],
+    '舍监': [['shè'], ['jiān']],
+    '舒卷': [['shū'], ['juàn']],
+    '舒散': [['shū'], ['sàn']],
+    '舒服': [['shū'], ['fú']],
+    '舔食': [['tiǎn'], ['shí']],
+    '舞会': [['wǔ'], ['huì']],
+    '舞台': [['wǔ'], ['tái']],
+    '舞场': [['wǔ'], ['chǎng']],
+    '舞女': [['wǔ'], ['nǚ']],
+    '舞弄': [['wǔ'], ['nòng']],
+    '舞曲': [['wǔ'], ['qǔ']],
+    '舟车': [['zhōu'], ['chē']],
+    '航模': [['háng'], ['mó']],
+    '航空': [['háng'], ['kōng']],
+    '航行': [['háng'], ['xíng']],
+    '般桓': [['pán'], ['huán']],
+    '般若': [['bō'], ['rě']],
+    '舰只': [['jiàn'], ['zhī']],
+    '舰炮': [['jiàn'], ['pào']],
+    '船只': [['chuán'], ['zhī']],
+    '船夫': [['chuán'], ['fū']],
+    '船长': [['chuán'], ['zhǎng']],
+    '良好': [['liáng'], ['hǎo']],
+    '良家': [['liáng'], ['jiā']],
+    '良将': [['liáng'], ['jiàng']],
+    '良知': [['liáng'], ['zhī']],
+    '良种': [['liáng'], ['zhǒng']],
+    '良能': [['liáng'], ['néng']],
+    '艰难': [['jiān'], ['nán']],
+    '色子': [['shǎi'], ['zǐ']],
+    '色差': [['sè'], ['chà']],
+    '色度': [['sè'], ['dù']],
+    '色拉': [['sè'], ['lā']],
+    '色散': [['sè'], ['sàn']],
+    '色晕': [['sè'], ['yùn']],
+    '色泽': [['sè'], ['zé']],
+    '色相': [['sè'], ['xiàng']],
+    '色觉': [['sè'], ['jué']],
+    '色调': [['sè'], ['diào']],
+    '艳丽': [['yàn'], ['lì']],
+    '艳服': [['yàn'], ['fú']],
+    '艳称': [['yàn'], ['chēng']],
+    '艳红': [['yàn'], ['hóng']],
+    '艺术': [['yì'], ['shù']],
+    '艺能': [['yì'], ['néng']],
+    '节下': [['jié'], ['xià']],
+    '节令': [['jié'], ['lìng']],
+    '节余': [['jié'], ['yú']],
+    '节俭': [['jié'], ['jiǎn']],
+    '节假': [['jié'], ['jiǎ']],
+    '节减': [['jié'], ['jiǎn']],
+    '节制': [['jié'], ['zhì']],
+    '节哀': [['jié'], ['āi']],
+    '节奏': [['jié'], ['zòu']],
+    '节妇': [['jié'], ['fù']],
+    '节子': [['jiē'], ['zǐ']],
+    '节庆': [['jié'], ['qìng']],
+    '节度': [['jié'], ['dù']],
+    '节录': [['jié'], ['lù']],
+    '节律': [['jié'], ['lǜ']],
+    '节拍': [['jié'], ['pāi']],
+    '节操': [['jié'], ['cāo']],
+    '节支': [['jié'], ['zhī']],
+    '节日': [['jié'], ['rì']],
+    '节本': [['jié'], ['běn']],
+    '节欲': [['jié'], ['yù']],
+    '节气': [['jié'], ['qì']],
+    '节水': [['jié'], ['shuǐ']],
+    '节油': [['jié'], ['yóu']],
+    '节流': [['jié'], ['liú']],
+    '节烈': [['jié'], ['liè']],
+    '节片': [['jié'], ['piàn']],
+    '节理': [['jié'], ['lǐ']],
+    '节用': [['jié'], ['yòng']],
+    '节略': [['jié'], ['lüè']],
+    '节目': [['jié'], ['mù']],
+    '节省': [['jié'], ['shěng']],
+    '节礼': [['jié'], ['lǐ']],
+    '节约': [['jié'], ['yuē']],
+    '节育': [['jié'], ['yù']],
+    '节能': [['jié'], ['néng']],
+    '节节': [['jié'], ['jié']],
+    '节选': [['jié'], ['xuǎn']],
+    '节间': [['jié'], ['jiān']],
+    '节食': [['jié'], ['shí']],
+    '芋头': [['yù'], ['tou']],
+    '芒刺': [['máng'], ['cì']],
+    '芒种': [['máng'], ['zhòng']],
+    '芜荑': [['wú'], ['yí']],
+    '芤脉': [['kōu'], ['mài']],
+    '芥子': [['jiè'], ['zǐ']],
+    '芥末': [['jiè'], ['mò']],
+    '芥菜': [['jiè'], ['cài']],
+    '芥蒂': [['jiè'], ['dì']],
+    '芥蓝': [['gài'], ['lán']],
+    '芦丁': [['lú'], ['dīng']],
+    '芫花': [['yuán'], ['huā']],
+    '芫荽': [['yán'], ['suī']],
+    '芯子': [['xìn'], ['zǐ']],
+    '花会': [['huā'], ['huì']],
+    '花俏': [['huā'], ['qiào']],
+    '花冠': [['huā'], ['guān']],
+    '花卷': [['huā'], ['juǎn']],
+    '花呢': [['huā'], ['ní']],
+    '花期': [['huā'], ['qī']],
+    '花炮': [['huā'], ['pào']],
+    '花红': [['huā'], ['hóng']],
+    '花被': [['huā'], ['bèi']],
+    '花车': [['huā'], ['chē']],
+    '花露': [['huā'], ['lù']],
+    '芳华': [['fāng'], ['huá']],
+    '芳菲': [['fāng'], ['fēi']],
+    '苍凉': [['cāng'], ['liáng']],
+    '苍劲': [['cāng'], ['jìng']],
+    '苍哑': [['cāng'], ['yǎ']],
+    '苍头': [['cāng'], ['tóu']],
+    '苍术': [['cāng'], ['zhú']],
+    '苏区': [['sū'], ['qū']],
+    '苏堤': [['sū'], ['dī']],
+    '苏子': [['sū'], ['zǐ']],
+    '苏打': [['sū'], ['dá']],
+    '苏白': [['sū'], ['bái']],
+    '苏醒': [['sū'], ['xǐng']],
+    '苔藓': [['tái'], ['xiǎn']],
+    '苕帚': [['tiáo'], ['zhǒu']],
+    '苗头': [['miáo'], ['tóu']],
+    '苗期': [['miáo'], ['qī']],
+    '苛刻': [['kē'], ['kè']],
+    '苛待': [['kē'], ['dài']],
+    '苛政': [['kē'], ['zhèng']],
+    '苛求': [['kē'], ['qiú']],
+    '苛细': [['kē'], ['xì']],
+    '苛责': [['kē'], ['zé']],
+    '苜蓿': [['mù'], ['xu']],
+    '苟且': [['gǒu'], ['qiě']],
+    '苟合': [['gǒu'], ['hé']],
+    '苟同': [['gǒu'], ['tóng']],
+    '苤蓝': [['piě'], ['lán']],
+    '若何': [['ruò'], ['hé']],
+    '若夫': [['ruò'], ['fú']],
+    '若干': [['ruò'], ['gān']],
+    '若是': [['ruò'], ['shì']],
+    '若果': [['ruò'], ['guǒ']],
+    '若非': [['ruò'], ['fēi']],
+    '苦参': [['kǔ'], ['shēn']],
+    '苦处': [['kǔ'], ['chǔ']],
+    '苦头': [['kǔ'], ['tóu']],
+    '苦差': [['kǔ'], ['chāi']],
+    '苦干': [['kǔ'], ['gàn']],
+    '苦思': [['kǔ'], ['sī']],
+    '苦斗': [['kǔ'], ['dòu']],
+    '苦熬': [['kǔ'], ['áo']],
+    '苦相': [['kǔ'], ['xiāng']],
+    '苦行': [['kǔ'], ['xíng']],
+    '苦闷': [['kǔ'], ['mèn']],
+    '苦难': [['kǔ'], ['nàn']],
+    '苦雨': [['kǔ'], ['yǔ']],
+    '苫布': [['shàn'], ['bù']],
+    '苫盖': [['shàn'], ['gài']],
+    '英华': [['yīng'], ['huá']],
+    '英尺': [['yīng'], ['chǐ']],
+    '英石': [['yīng'], ['shí']],
+    '英语': [['yīng'], ['yǔ']],
+    '苹果': [['píng'], ['guǒ']],
+    '茁长': [['zhuó'], ['zhǎng']],
+    '茂盛': [['mào'], ['shèng']],
+    '范蠡': [['fàn'], ['lǐ']],
+    '茄子': [['qié'], ['zi']],
+    '茅台': [['máo'], ['tái']],
+    '茅舍': [['máo'], ['shè']],
+    '茎干': [['jīng'], ['gàn']],
+    '茔地': [['yíng'], ['dì']],
+    '茜草': [['xī'], ['cǎo']],
+    '茶会': [['chá'], ['huì']],
+    '茶几': [['chá'], ['jī']],
+    '茶匙': [['chá'], ['chí']],
+    '茶叶': [['chá'], ['yè']],
+    '茶场': [['chá'], ['chǎng']],
+    '茶坊': [['chá'], ['fāng']],
+    '茶汤': [['chá'], ['tāng']],
+    '茶铛': [['chá'], ['chēng']],
+    '茶食': [['chá'], ['shí']],
+    '荆芥': [['jīng'], ['jiè']],
+    '草体': [['cǎo'], ['tǐ']],
+    '草创': [['cǎo'], ['chuàng']],
+    '草地': [['cǎo'], ['dì']],
+    '草场': [['cǎo'], ['chǎng']],
+    '草垛': [['cǎo'], ['duǒ']],
+    '草泽': [['cǎo'], ['zé']],
+    '草率': [['cǎo'], ['shuài']],
+    '草约': [['cǎo'], ['yuē']],
+    '草绿': [['cǎo'], ['lǜ']],
+    '草芥': [['cǎo'], ['jiè']],
+    '草苫': [['cǎo'], ['shān']],
+    '荒凉': [['huāng'], ['liáng']],
+    '荒地': [['huāng'], ['dì']],
+    '荒落': [['huāng'], ['luò']],
+    '荔枝': [['lì'], ['zhī']],
+    '荣任': [['róng'], ['rèn']],
+    '荣华': [['róng'], ['huá']],
+    '荤粥': [['xūn'], ['zhōu']],
+    '荥阳': [['xíng'], ['yáng']],
+    '荧屏': [['yíng'], ['píng']],
+    '荨麻': [['xún'], ['má']],
+    '荫凉': [['yìn'], ['liáng']],
+    '荫庇': [['yìn'], ['bì']],
+    '荫翳': [['yīn'], ['yì']],
+    '荫蔽': [['yīn'], ['bì']],
+    '药单': [['yào'], ['dān']],
+    '药厂': [['yào'], ['chǎng']],
+    '药捻': [['yào'], ['niǎn']],
+    '药片': [['yào'], ['piàn']],
+    '药王': [['yào'], ['wáng']],
+    '药石': [['yào'], ['shí']],
+    '药膏': [['yào'], ['gāo']],
+    '药铺': [['yào'], ['pù']],
+    '荷载': [['hè'], ['zǎi']],
+    '荷重': [['hè'], ['zhòng']],
+    '荷锄': [['hè'], ['chú']],
+    '荸荠': [['bí'], ['qí']],
+    '荼毒': [['tú'], ['dú']],
+    '莎草': [['suō'], ['cǎo']],
+    '莘庄': [['xīn'], ['zhuāng']],
+    '莘莘': [['shēn'], ['shēn']],
+    '莞尔': [['wǎn'], ['ěr']],
+    '莞莞': [['wǎn'], ['wǎn']],
+    '莨绸': [['liáng'], ['chóu']],
+    '莨菪': [['làng'], ['dàng']],
+    '莫不': [['mò'], ['bù']],
+    '莫名': [['mò'], ['míng']],
+    '莫大': [['mò'], ['dà']],
+    '莫如': [['mò'], ['rú']],
+    '莫逆': [['mò'], ['nì']],
+    '莫非': [['mò'], ['fēi']],
+    '莲台': [['lián'], ['tái']],
+    '莳罗': [['shí'], ['luó']],
+    '莳萝': [['shí'], ['luó']],
+    '莴苣': [['wō'], ['jù']],
+    '获得': [['huò'], ['dé']],
+    '获知': [['huò'], ['zhī']],
+    '莺语': [['yīng'], ['yǔ']],
+    '菜单': [['cài'], ['dān']],
+    '菲仪': [['fěi'], ['yí']],
+    '菲材': [['fěi'], ['cái']],
+    '菲礼': [['fěi'], ['lǐ']],
+    '菲菲': [['fēi'], ['fēi']],
+    '菲薄': [['fěi'], ['bó']],
+    '萎靡': [['wěi'], ['mǐ']],
+    '萝卜': [['luó'], ['bo']],
+    '萼片': [['è'], ['piàn']],
+    '落下': [['là'], ['xià']],
+    '落了': [['là'], ['le']],
+    '落价': [['lào'], ['jià']],
+    '落伍': [['luò'], ['wǔ']],
+    '落体': [['luò'], ['tǐ']],
+    '落俗': [['luò'], ['sú']],
+    '落单': [['luò'], ['dān']],
+    '落发': [['luò'], ['fà']],
+    '落叶': [['luò'], ['yè']],
+    '落后': [['luò'], ['hòu']],
+    '落地': [['luò'], ['dì']],
+    '落墨': [['luò'], ['mò']],
+    '落套': [['luò'], ['tào']],
+    '落子': [['lào'], ['zǐ']],
+    '落实': [['luò'], ['shí']],
+    '落寞': [['luò'], ['mò']],
+    '落尘': [['luò'], ['chén']],
+    '落山': [['luò'], ['shān']],
+    '落差': [['luò'], ['chà']],
+    '落市': [['luò'], ['shì']],
+    '落帐': [['luò'], ['zhàng']],
+    '落幕': [['luò'], ['mù']],
+    '落座': [['luò'], ['zuò']],
+    '落得': [['luò'], ['de']],
+    '落成': [['luò'], ['chéng']],
+    '落户': [['luò'], ['hù']],
+    '落拓': [['luò'], ['tuò']],
+    '落日': [['luò'], ['rì']],
+    '落枕': [['lào'], ['zhěn']],
+    '落榜': [['luò'], ['bǎng']],
+    '落款': [['luò'], ['kuǎn']],
+    '落水': [['luò'], ['shuǐ']],
+    '落泊': [['luò'], ['bó']],
+    '落泪': [['luò'], ['lèi']],
+    '落潮': [['luò'], ['cháo']],
+    '落炕': [['lào'], ['kàng']],
+    '落点': [['luò'], ['diǎn']],
+    '落照': [['luò'], ['zhào']],
+    '落空': [['luò'], ['kōng']],
+    '落笔': [['luò'], ['bǐ']],
+    '落第': [['luò'], ['dì']],
+    '落籍': [['luò'], ['jí']],
+    '落网': [['luò'], ['wǎng']],
+    '落脚': [['luò'], ['jiǎo']],
+    '落膘': [['luò'], ['biāo']],
+    '落色': [['lào'], ['shǎi']],
+    '落英': [['luò'], ['yīng']],
+    '落草': [['luò'], ['cǎo']],
+    '落荒': [['luò'], ['huāng']],
+    '落选': [['luò'], ['xuǎn']],
+    '落锁': [['luò'], ['suǒ']],
+    '落难': [['luò'], ['nàn']],
+    '落霞': [['luò'], ['xiá']],
+    '落音': [['luò'], ['yīn']],
+    '落马': [['luò'], ['mǎ']],
+    '落魄': [['luò'], ['tuò']],
+    '葛布': [['gé'], ['bù']],
+    '葛根': [['gé'], ['gēn']],
+    '葛粉': [['gé'], ['fěn']],
+    '葛藤': [['gé'], ['téng']],
+    '葫芦': [['hú'], ['lú']],
+    '葱头': [['cōng'], ['tóu']],
+    '葱绿': [['cōng'], ['lǜ']],
+    '葵扇': [['kuí'], ['shàn']],
+    '蒙事': [['mēng'], ['shì']],
+    '蒙冤': [['méng'], ['yuān']],
+    '蒙受': [['méng'], ['shòu']],
+    '蒙哄': [['méng'], ['hǒng']],
+    '蒙垢': [['méng'], ['gòu']],
+    '蒙尘': [['méng'], ['chén']],
+    '蒙师': [['méng'], ['shī']],
+    '蒙恩': [['méng'], ['ēn']],
+    '蒙昧': [['méng'], ['mèi']],
+    '蒙混': [['méng'], ['hùn']],
+    '蒙皮': [['méng'], ['pí']],
+    '蒙眬': [['méng'], ['lóng']],
+    '蒙着': [['mēng'], ['zháo']],
+    '蒙羞': [['méng'], ['xiū']],
+    '蒙胧': [['méng'], ['lóng']],
+    '蒙药': [['méng'], ['yào']],
+    '蒙蒙': [['méng'], ['méng']],
+    '蒙蔽': [['méng'], ['bì']],
+    '蒙难': [['méng'], ['nàn']],
+    '蒙面': [['méng'], ['miàn']],
+    '蒙骗': [['méng'], ['piàn']],
+    '蒜头': [['suàn'], ['tóu']],
+    '蒜泥': [['suàn'], ['ní']],
+    '蒲扇': [['pú'], ['shàn']],
+    '蒲节': [['pú'], ['jié']],
+    '蒸发': [['zhēng'], ['fā']],
+    '蒸散': [['zhēng'], ['sàn']],
+    '蒸笼': [['zhēng'], ['lóng']],
+    '蒸食': [['zhēng'], ['shí']],
+    '蒸馏': [['zhēng'], ['liú']],
+    '蓄发': [['xù'], ['fā']],
+    '蓍占': [['shī'], ['zhān']],
+    '蓝调': [['lán'], ['diào']],
+    '蓦地': [['mò'], ['dì']],
+    '蓬勃': [['péng'], ['bó']],
+    '蔓延': [['màn'], ['yán']],
+    '蔓生': [['màn'], ['shēng']],
+    '蔓草': [['màn'], ['cǎo']],
+    '蔓衍': [['màn'], ['yǎn']],
+    '蔚县': [['yù'], ['xiàn']],
+    '蔽塞': [['bì'], ['sāi']],
+    '蕃王': [['fān'], ['wáng']],
+    '蕃茄': [['fān'], ['qié']],
+    '蕲蛇': [['qí'], ['shé']],
+    '蕴结': [['yùn'], ['jié']],
+    '蕴藉': [['yùn'], ['jiè']],
+    '蕴藏': [['yùn'], ['cáng']],
+    '薄产': [['bó'], ['chǎn']],
+    '薄利': [['bó'], ['lì']],
+    '薄命': [['bó'], ['mìng']],
+    '薄层': [['báo'], ['céng']],
+    '薄幸': [['bó'], ['xìng']],
+    '薄弱': [['bó'], ['ruò']],
+    '薄待': [['bó'], ['dài']],
+    '薄情': [['bó'], ['qíng']],
+    '薄技': [['bó'], ['jì']],
+    '薄晓': [['bó'], ['xiǎo']],
+    '薄暮': [['bó'], ['mù']],
+    '薄板': [['báo'], ['bǎn']],
+    '薄片': [['báo'], ['piàn']],
+    '薄田': [['bó'], ['tián']],
+    '薄纱': [['báo'], ['shā']],
+    '薄脆': [['báo'], ['cuì']],
+    '薄膜': [['báo'], ['mó']],
+    '薄荷': [['bò'], ['hé']],
+    '薄葬': [['báo'], ['zàng']],
+    '薄薄': [['báo'], ['báo']],
+    '薄酒': [['bó'], ['jiǔ']],
+    '薄酬': [['bó'], ['chóu']],
+    '薄雾': [['bó'], ['wù']],
+    '薄面': [['báo'], ['miàn']],
+    '薄饼': [['báo'], ['bǐng']],
+    '薪传': [['xīn'], ['chuán']],
+    '薪给': [['xīn'], ['gěi']],
+    '薯莨': [['shǔ'], ['liáng']],
+    '藉以': [['jiè'], ['yǐ']],
+    '藉口': [['jiè'], ['kǒu']],
+    '藏书': [['cáng'], ['shū']],
+    '藏人': [['zàng'], ['rén']],
+    '藏匿': [['cáng'], ['nì']],
+    '藏历': [['zàng'], ['lì']],
+    '藏奸': [['cáng'], ['jiān']],
+    '藏府': [['zàng'], ['fǔ']],
+    '藏戏': [['zàng'], ['xì']],
+    '藏拙': [['cáng'], ['zhuō']],
+    '藏掖': [['cáng'], ['yè']],
+    '藏族': [['zàng'], ['zú']],
+    '藏獒': [['zàng'], ['áo']],
+    '藏药': [['zàng'], ['yào']],
+    '藏蓝': [['zàng'], ['lán']],
+    '藏踪': [['cáng'], ['zōng']],
+    '藏身': [['cáng'], ['shēn']],
+    '藏躲': [['cáng'], ['duǒ']],
+    '藏锋': [['cáng'], ['fēng']],
+    '藏青': [['zàng'], ['qīng']],
+    '藏香': [['cáng'], ['xiāng']],
+    '藕节': [['ǒu'], ['jié']],
+    '藤椅': [['téng'], ['yǐ']],
+    '藤蔓': [['téng'], ['wàn']],
+    '藩属': [['fān'], ['shǔ']],
+    '藻思': [['zǎo'], ['sī']],
+    '虎劲': [['hǔ'], ['jìn']],
+    '虎将': [['hǔ'], ['jiàng']],
+    '虎尾': [['hǔ'], ['wěi']],
+    '虎贲': [['hǔ'], ['bēn']],
+    '虎跑': [['hǔ'], ['páo']],
+    '虎骨': [['hǔ'], ['gǔ']],
+    '虐待': [['nüè'], ['dài']],
+    '虔信': [['qián'], ['xìn']],
+    '虚汗': [['xū'], ['hàn']],
+    '虚空': [['xū'], ['kōng']],
+    '虱子': [['shī'], ['zi']],
+    '虽说': [['suī'], ['shuō']],
+    '虾子': [['xiā'], ['zi']],
+    '虾蟆': [['há'], ['má']],
+    '蚁王': [['yǐ'], ['wáng']],
+    '蚂蚁': [['mǎ'], ['yǐ']],
+    '蚂蚱': [['mà'], ['zhà']],
+    '蚂蜂': [['mǎ'], ['fēng']],
+    '蚂蝗': [['mǎ'], ['huáng']],
+    '蚂螂': [['mā'], ['láng']],
+    '蚂蟥': [['mǎ'], ['huáng']],
+    '蚊子': [['wén'], ['zi']],
+    '蚌埠': [['bèng'], ['bù']],
+    '蚕沙': [['cán'], ['shā']],
+    '蚕种': [['cán'], ['zhǒng']],
+    '蚕蛾': [['cán'], ['é']],
+    '蚕食': [['cán'], ['shí']],
+    '蚤休': [['zǎo'], ['xiū']],
+    '蚶子': [['hān'], ['zi']],
+    '蛇行': [['shé'], ['xíng']],
+    '蛏子': [['chēng'], ['zi']],
+    '蛤粉': [['gé'], ['fěn']],
+    '蛤蚌': [['gé'], ['bàng']],
+    '蛤蚧': [['gé'], ['jiè']],
+    '蛤蜊': [['gé'], ['lí']],
+    '蛤蟆': [['há'], ['má']],
+    '蛮劲': [['mán'], ['jìn']],
+    '蛮干': [['mán'], ['gàn']],
+    '蛮横': [['mán'], ['hèng']],
+    '蛹期': [['yǒng'], ['qī']],
+    '蛾子': [['é'], ['zi']],
+    '蛾眉': [['é'], ['méi']],
+    '蜂毒': [['fēng'], ['dú']],
+    '蜂王': [['fēng'], ['wáng']],
+    '蜈蚣': [['wú'], ['gōng']],
+    '蜕化': [['tuì'], ['huà']],
+    '蜗旋': [['wō'], ['xuán']],
+    '蜗角': [['wō'], ['jiǎo']],
+    '蜚语': [['fēi'], ['yǔ']],
+    '蜜供': [['mì'], ['gòng']],
+    '蜜语': [['mì'], ['yǔ']],
+    '蜜露': [['mì'], ['lù']],
+    '蜡台': [['là'], ['tái']],
+    '蜷曲': [['quán'], ['qū']],
+    '蜷缩': [['quán'], ['suō']],
+    '蝇头': [['yíng'], ['tóu']],
+    '蝍蛆': [['jí'], ['jū']],
+    '蝎子': [['xiē'], ['zi']],
+    '蝮蛇': [['fù'], ['shé']],
+    '蝰蛇': [['kuí'], ['shé']],
+    '蝶骨': [['dié'], ['gǔ']],
+    '融会': [['róng'], ['huì']],
+    '融化': [['róng'], ['huà']],
+    '融合': [['róng'], ['hé']],
+    '融和': [['róng'], ['hé']],
+    '融解': [['róng'], ['jiě']],
+    '螟蛾': [['míng'], ['é']],
+    '螫针': [['shì'], ['zhēn']],
+    '螺号': [['luó'], ['hào']],
+    '螺旋': [['luó'], ['xuán']],
+    '螺杆': [['luó'], ['gǎn']],
+    '螺纹': [['luó'], ['wén']],
+    '螺钉': [['luó'], ['dīng']],
+    '蟒蛇': [['mǎng'], ['shé']],
+    '蟒袍': [['mǎng'], ['páo']],
+    '蟠曲': [['pán'], ['qū']],
+    '蠕行': [['rú'], ['xíng']],
+    '蠡县': [['lǐ'], ['xiàn']],
+    '血丝': [['xuè'], ['sī']],
+    '血书': [['xuè'], ['shū']],
+    '血亏': [['xuè'], ['kuī']],
+    '血亲': [['xuè'], ['qīn']],
+    '血仇': [['xuè'], ['chóu']],
+    '血债': [['xuè'], ['zhài']],
+    '血刃': [['xuè'], ['rèn']],
+    '血印': [['xuè'], ['yìn']],
+    '血压': [['xuè'], ['yā']],
+    '血口': [['xuè'], ['kǒu']],
+    '血嗣': [['xuè'], ['sì']],
+    '血块': [['xuè'], ['kuài']],
+    '血型': [['xuè'], ['xíng']],
+    '血尿': [['xuè'], ['niào']],
+    '血崩': [['xuè'], ['bēng']],
+    '血库': [['xuè'], ['kù']],
+    '血性': [['xuè'], ['xìng']],
+    '血战': [['xuè'], ['zhàn']],
+    '血斑': [['xuè'], ['bān']],
+    '血晕': [['xiě'], ['yùn']],
+    '血本': [['xuè'], ['běn']],
+    '血栓': [['xuè'], ['shuān']],
+    '血样': [['xuè'], ['yàng']],
+    '血案': [['xuè'], ['àn']],
+    '血气': [['xuè'], ['qì']],
+    '血水': [['xuè'], ['shuǐ']],
+    '血汗': [['xuè'], ['hàn']],
+    '血污': [['xuè'], ['wū']],
+    '血沉': [['xuè'], ['chén']],
+    '血泊': [['xuè'], ['pō']],
+    '血泡': [['xuè'], ['pào']],
+    '血泪': [['xuè'], ['lèi']],
+    '血洗': [['xuè'], ['xǐ']],
+    '血流': [['xuè'], ['liú']],
+    '血浆': [['xuè'], ['jiāng']],
+    '血海': [['xuè'], ['hǎi']],
+    '血液': [['xuè'], ['yè']],
+    '血清': [['xuè'], ['qīng']],
+    '血渍': [['xuè'], ['zì']],
+    '血球': [['xuè'], ['qiú']],
+    '血痂': [['xuè'], ['jiā']],
+    '血痕': [['xuè'], ['hén']],
+    '血痢': [['xuè'], ['lì']],
+    '血痨': [['xuè'], ['láo']],
+    '血瘕': [['xuè'], ['jiǎ']],
+    '血癌': [['xuè'], ['ái']],
+    '血祭': [['xuè'], ['jì']],
+    '血竭': [['xuè'], ['jié']],
+    '血管': [['xuè'], ['guǎn']],
+    '血粉': [['xuè'], ['fěn']],
+    '血糖': [['xuè'], ['táng']],
+    '血红': [['xuè'], ['hóng']],
+    '血统': [['xuè'], ['tǒng']],
+    '血缘': [['xuè'], ['yuán']],
+    '血肉': [['xuè'], ['ròu']],
+    '血肿': [['xuè'], ['zhǒng']],
+    '血脂': [['xuè'], ['zhī']],
+    '血脉': [['xuè'], ['mài']],
+    '血腥': [['xuè'], ['xīng']],
+    '血色': [['xuè'], ['sè']],
+    '血花': [['xuè'], ['huā']],
+    '血虚': [['xuè'], ['xū']],
+    '血衣': [['xuè'], ['yī']],
+    '血证': [['xuè'], ['zhèng']],
+    '血象': [['xuè'], ['xiàng']],
+    '血账': [['xuè'], ['zhàng']],
+    '血路': [['xuè'], ['lù']],
+    '血迹': [['xuè'], ['jì']],
+    '血量': [['xuè'], ['liàng']],
+    '血防': [['xuè'], ['fáng']],
+    '行业': [['háng'], ['yè']],
+    '行东': [['xíng'], ['dōng']],
+    '行为': [['xíng'], ['wéi']],
+    '行乐': [['xíng'], ['lè']],
+    '行乞': [['xíng'], ['qǐ']],
+    '行书': [['xíng'], ['shū']],
+    '行事': [['xíng'], ['shì']],
+    '行人': [['xíng'], ['rén']],
+    '行令': [['xíng'], ['lìng']],
+    '行伍': [['háng'], ['wǔ']],
+    '行会': [['háng'], ['huì']],
+    '行使': [['xíng'], ['shǐ']],
+    '行军': [['xíng'], ['jūn']],
+    '行凶': [['xíng'], ['xiōng']],
+    '行刑': [['xíng'], ['xíng']],
+    '行列': [['háng'], ['liè']],
+    '行刺': [['xíng'], ['cì']],
+    '行动': [['xíng'], ['dòng']],
+    '行劫': [['xíng'], ['jié']],
+    '行医': [['xíng'], ['yī']],
+    '行号': [['háng'], ['háo']],
+    '行吟': [['xíng'], ['yín']],
+    '行唐': [['xíng'], ['táng']],
+    '行商': [['háng'], ['shāng']],
+    '行善': [['xíng'], ['shàn']],
+    '行囊': [['xíng'], ['náng']],
+    '行头': [['xíng'], ['tou']],
+    '行好': [['xíng'], ['hǎo']],
+    '行宫': [['xíng'], ['gōng']],
+    '行家': [['háng'], ['jiā']],
+    '行将': [['xíng'], ['jiāng']],
+    '行市': [['háng'], ['shì']],
+    '行帮': [['háng'], ['bāng']],
+    '行年': [['xíng'], ['nián']],
+    '行当': [['háng'], ['dāng']],
+    '行径': [['xíng'], ['jìng']],
+    '行情': [['háng'], ['qíng']],
+    '行房': [['xíng'], ['fáng']],
+    '行抢': [['xíng'], ['qiǎng']],
+    '行政': [['xíng'], ['zhèng']],
+    '行文': [['xíng'], ['wén']],
+    '行旅': [['xíng'], ['lǚ']],
+    '行时': [['xíng'], ['shí']],
+    '行星': [['xíng'], ['xīng']],
+    '行期': [['xíng'], ['qī']],
+    '行李': [['xíng'], ['lǐ']],
+    '行板': [['xíng'], ['bǎn']],
+    '行栈': [['xíng'], ['zhàn']],
+    '行楷': [['xíng'], ['kǎi']],
+    '行款': [['háng'], ['kuǎn']],
+    '行止': [['xíng'], ['zhǐ']],
+    '行灶': [['xíng'], ['zào']],
+    '行状': [['xíng'], ['zhuàng']],
+    '行猎': [['xíng'], ['liè']],
+    '行省': [['xíng'], ['shěng']],
+    '行礼': [['xíng'], ['lǐ']],
+    '行程': [['xíng'], ['chéng']],
+    '行窃': [['xíng'], ['qiè']],
+    '行笔': [['xíng'], ['bǐ']],
+    '行箧': [['xíng'], ['qiè']],
+    '行经': [['xíng'], ['jīng']],
+    '行署': [['xíng'], ['shǔ']],
+    '行者': [['xíng'], ['zhě']],
+    '行聘': [['xíng'], ['pìn']],
+    '行脚': [['xíng'], ['jiǎo']],
+    '行腔': [['xíng'], ['qiāng']],
+    '行舟': [['xíng'], ['zhōu']],
+    '行船': [['xíng'], ['chuán']],
+    '行色': [['xíng'], ['sè']],
+    '行草': [['xíng'], ['cǎo']],
+    '行营': [['xíng'], ['yíng']],
+    '行藏': [['xíng'], ['cáng']],
+    '行行': [['xíng'], ['xíng']],
+    '行装': [['xíng'], ['zhuāng']],
+    '行规': [['háng'], ['guī']],
+    '行诈': [['xíng'], ['zhà']],
+    '行话': [['háng'], ['huà']],
+    '行货': [['háng'], ['huò']],
+    '行贩': [['xíng'], ['fàn']],
+    '行贾': [['xíng'], ['gǔ']],
+    '行贿': [['xíng'], ['huì']],
+    '行赏': [['xíng'], ['shǎng']],
+    '行走': [['xíng'], ['zǒu']],
+    '行距': [['háng'], ['jù']],
+    '行路': [['xíng'], ['lù']],
+    '行踪': [['xíng'], ['zōng']],
+    '行车': [['xíng'], ['chē']],
+    '行辈': [['háng'], ['bèi']],
+    '行辕': [['xíng'], ['yuán']],
+    '行运': [['xíng'], ['yùn']],
+    '行进': [['xíng'], ['jìn']],
+    '行述': [['xíng'], ['shù']],
+    '行迹': [['xíng'], ['jì']],
+    '行道': [['háng'], ['dào']],
+    '行都': [['xíng'], ['dū']],
+    '行销': [['xíng'], ['xiāo']],
+    '行间': [['háng'], ['jiān']],
+    '行风': [['xíng'], ['fēng']],
+    '行驶': [['xíng'], ['shǐ']],
+    '行骗': [['xíng'], ['piàn']],
+    '衍射': [['yǎn'], ['shè']],
+    '街上': [['jiē'], ['shàng']],
+    '街区': [['jiē'], ['qū']],
+    '街坊': [['jiē'], ['fāng']],
+    '街头': [['jiē'], ['tóu']],
+    '街巷': [['jiē'], ['xiàng']],
+    '街景': [['jiē'], ['jǐng']],
+    '衙内': [['yá'], ['nèi']],
+    '衡量': [['héng'], ['liáng']],
+    '衣冠': [['yì'], ['guān']],
+    '衣分': [['yī'], ['fēn']],
+    '衣服': [['yī'], ['fú']],
+    '衣柜': [['yī'], ['guì']],
+    '衣着': [['yī'], ['zhuó']],
+    '衣蛾': [['yī'], ['é']],
+    '衣裳': [['yī'], ['shang']],
+    '衣食': [['yī'], ['shí']],
+    '补丁': [['bǔ'], ['dīng']],
+    '补休': [['bǔ'], ['xiū']],
+    '补假': [['bǔ'], ['jià']],
+    '补助': [['bǔ'], ['zhù']],
+    '补发': [['bǔ'], ['fā']],
+    '补台': [['bǔ'], ['tái']],
+    '补差': [['bǔ'], ['chà']],
+    '补正': [['bǔ'], ['zhèng']],
+    '补票': [['bǔ'], ['piào']],
+    '补种': [['bǔ'], ['zhòng']],
+    '补给': [['bǔ'], ['jǐ']],
+    '补血': [['bǔ'], ['xuè']],
+    '补角': [['bǔ'], ['jiǎo']],
+    '补语': [['bǔ'], ['yǔ']],
+    '补过': [['bǔ'], ['guò']],
+    '补钉': [['bǔ'], ['dīng']],
+    '表亲': [['biǎo'], ['qīn']],
+    '表头': [['biǎo'], ['tóu']],
+    '表尺': [['biǎo'], ['chǐ']],
+    '表弟': [['biǎo'], ['dì']],
+    '表徵': [['biǎo'], ['zhǐ']],
+    '表率': [['biǎo'], ['shuài']],
+    '表观': [['biǎo'], ['guān']],
+    '表解': [['biǎo'], ['jiě']],
+    '表语': [['biǎo'], ['yǔ']],
+    '表露': [['biǎo'], ['lù']],
+    '衰乏': [['shuāi'], ['fá']],
+    '衰亡': [['shuāi'], ['wáng']],
+    '衰减': [['shuāi'], ['jiǎn']],
+    '衰变': [['shuāi'], ['biàn']],
+    '衰少': [['shuāi'], ['shǎo']],
+    '衰年': [['shuāi'], ['nián']],
+    '衰弱': [['shuāi'], ['ruò']],
+    '衰微': [['shuāi'], ['wēi']],
+    '衰惫': [['shuāi'], ['bèi']],
+    '衰朽': [['shuāi'], ['xiǔ']],
+    '衰竭': [['shuāi'], ['jié']],
+    '衰老': [['shuāi'], ['lǎo']],
+    '衰草': [['shuāi'], ['cǎo']],
+    '衰萎': [['shuāi'], ['wěi']],
+    '衰落': [['shuāi'], ['luò']],
+    '衰衣': [['cuī'], ['yī']],
+    '衰败': [['shuāi'], ['bài']],
+    '衰迈': [['shuāi'], ['mài']],
+    '衰退': [['shuāi'], ['tuì']],
+    '衰颓': [['shuāi'], ['tuí']],
+    '衷曲': [['zhōng'], ['qǔ']],
+    '袅娜': [['niǎo'], ['nuó']],
+    '袋子': [['dài'], ['zi']],
+    '袍子': [['páo'], ['zi']],
+    '袍服': [['páo'], ['fú']],
+    '袍泽': [['páo'], ['zé']],
+    '袒露': [['tǎn'], ['lù']],
+    '袖头': [['xiù'], ['tóu']],
+    '袜子': [['wà'], ['zi']],
+    '被动': [['bèi'], ['dòng']],
+    '被单': [['bèi'], ['dān']],
+    '被卧': [['bèi'], ['wò']],
+    '被告': [['bèi'], ['gào']],
+    '被头': [['bèi'], ['tóu']],
+    '被套': [['bèi'], ['tào']],
+    '被子': [['bèi'], ['zi']],
+    '被害': [['bèi'], ['hài']],
+    '被服': [['bèi'], ['fú']],
+    '被罩': [['bèi'], ['zhào']],
+    '被袋': [['bèi'], ['dài']],
+    '被覆': [['bèi'], ['fù']],
+    '被里': [['bèi'], ['lǐ']],
+    '被难': [['bèi'], ['nàn']],
+    '被面': [['bèi'], ['miàn']],
+    '袷袢': [['qiā'], ['pàn']],
+    '裁员': [['cái'], ['yuán']],
+    '裁处': [['cái'], ['chǔ']],
+    '裁并': [['cái'], ['bìng']],
+    '裁度': [['cái'], ['duó']],
+    '裁缝': [['cái'], ['féng']],
+    '裁量': [['cái'], ['liàng']],
+    '裂变': [['liè'], ['biàn']],
+    '裂口': [['liè'], ['kǒu']],
+    '裂帛': [['liè'], ['bó']],
+    '裂开': [['liè'], ['kāi']],
+    '裂果': [['liè'], ['guǒ']],
+    '裂片': [['liè'], ['piàn']],
+    '裂璺': [['liè'], ['wèn']],
+    '裂痕': [['liè'], ['hén']],
+    '裂纹': [['liè'], ['wén']],
+    '裂缝': [['liè'], ['fèng']],
+    '裂谷': [['liè'], ['gǔ']],
+    '裂隙': [['liè'], ['xì']],
+    '装潢': [['zhuāng'], ['huáng']],
+    '装载': [['zhuāng'], ['zài']],
+    '裙子': [['qún'], ['zi']],
+    '裤头': [['kù'], ['tóu']],
+    '裤子': [['kù'], ['zi']],
+    '裤缝': [['kù'], ['fèng']],
+    '裤衩': [['kù'], ['chǎ']],
+    '裨将': [['pí'], ['jiàng']],
+    '裨益': [['bì'], ['yì']],
+    '裨补': [['bì'], ['bǔ']],
+    '裱糊': [['biǎo'], ['hú']],
+    '裳裳': [['cháng'], ['cháng']],
+    '裸体': [['luǒ'], ['tǐ']],
+    '裸露': [['luǒ'], ['lù']],
+    '裹挟': [['guǒ'], ['xié']],
+    '褥单': [['rù'], ['dān']],
+    '褥子': [['rù'], ['zi']],
+    '褪去': [['tùn'], ['qù']],
+    '褪色': [['tuì'], ['shǎi']],
+    '褶子': [['zhě'], ['zi']],
+    '襄助': [['xiāng'], ['zhù']],
+    '西乐': [['xī'], ['yuè']],
+    '西化': [['xī'], ['huà']],
+    '西北': [['xī'], ['běi']],
+    '西华': [['xī'], ['huá']],
+    '西南': [['xī'], ['nán']],
+    '西头': [['xī'], ['tóu']],
+    '西服': [['xī'], ['fú']],
+    '西王': [['xī'], ['wáng']],
+    '西藏': [['xī'], ['zàng']],
+    '西语': [['xī'], ['yǔ']],
+    '要不': [['yào'], ['bù']],
+    '要么': [['yào'], ['me']],
+    '要义': [['yào'], ['yì']],
+    '要事': [['yào'], ['shì']],
+    '要人': [['yào'], ['rén']],
+    '要件': [['yào'], ['jiàn']],
+    '要价': [['yào'], ['jià']],
+    '要位': [['yào'], ['wèi']],
+    '要冲': [['yào'], ['chōng']],
+    '要击': [['yāo'], ['jī']],
+    '要则': [['yào'], ['zé']],
+    '要务': [['yào'], ['wù']],
+    '要员': [['yào'], ['yuán']],
+    '要命': [['yào'], ['mìng']],
+    '要图': [['yào'], ['tú']],
+    '要地': [['yào'], ['dì']],
+    '要塞': [['yào'], ['sài']],
+    '要好': [['yāo'], ['hǎo']],
+    '要子': [['yào'], ['zǐ']],
+    '要害': [['yào'], ['hài']],
+    '要强': [['yào'], ['qiáng']],
+    '要得': [['yào'], ['de']],
+    '要挟': [['yāo'], ['xié']],
+    '要旨': [['yào'], ['zhǐ']],
+    '要是': [['yào'], ['shì']],
+    '要死': [['yào'], ['sǐ']],
+    '要求': [['yāo'], ['qiú']],
+    '要津': [['yào'], ['jīn']],
+    '要点': [['yào'], ['diǎn']],
+    '要犯': [['yào'], ['fàn']],
+    '要略': [['yào'], ['lüè']],
+    '要目': [['yào'], ['mù']],
+    '要端': [['yào'], ['duān']],
+    '要素': [['yào'], ['sù']],
+    '要紧': [['yào'], ['jǐn']],
+    '要约': [['yào'], ['yuē']],
+    '要职': [['yào'], ['zhí']],
+    '要脸': [['yào'], ['liǎn']],
+    '要览': [['yào'], ['lǎn']],
+    '要言': [['yào'], ['yán']],
+    '要诀': [['yào'], ['jué']],
+    '要谎': [['yào'], ['huǎng']],
+    '要账': [['yào'], ['zhàng']],
+    '要路': [['yào'], ['lù']],
+    '要道': [['yào'], ['dào']],
+    '要钱': [['yào'], ['qián']],
+    '要闻': [['yào'], ['wén']],
+    '要隘': [['yào'], ['ài']],
+    '要领': [['yào'], ['lǐng']],
+    '要饭': [['yào'], ['fàn']],
+    '覆亡': [['fù'], ['wáng']],
+    '覆核': [['fù'], ['hé']],
+    '覆没': [['fù'], ['mò']],
+    '覆盖': [['fù'], ['gài']],
+    '覆被': [['fù'], ['bèi']],
+    '见习': [['jiàn'], ['xí']],
+    '见于': [['jiàn'], ['yú']],
+    '见到': [['jiàn'], ['dào']],
+    '见告': [['jiàn'], ['gào']],
+    '见地': [['jiàn'], ['dì']],
+    '见外': [['jiàn'], ['wài']],
+    '见天': [['jiàn'], ['tiān']],
+    '见好': [['jiàn'], ['hǎo']],
+    '见得': [['jiàn'], ['de']],
+    '见怪': [['jiàn'], ['guài']],
+    '见报': [['jiàn'], ['bào']],
+    '见效': [['jiàn'], ['xiào']],
+    '见教': [['jiàn'], ['jiào']],
+    '见新': [['jiàn'], ['xīn']],
+    '见方': [['jiàn'], ['fāng']],
+    '见机': [['jiàn'], ['jī']],
+    '见爱': [['jiàn'], ['ài']],
+    '见礼': [['jiàn'], ['lǐ']],
+    '见称': [['jiàn'], ['chēng']],
+    '见笑': [['jiàn'], ['xiào']],
+    '见罪': [['jiàn'], ['zuì']],
+    '见老': [['jiàn'], ['lǎo']],
+    '见背': [['jiàn'], ['bèi']],
+    '见解': [['jiàn'], ['jiě']],
+    '见证': [['jiàn'], ['zhèng']],
+    '见识': [['jiàn'], ['shí']],
+    '见谅': [['jiàn'], ['liàng']],
+    '见长': [['jiàn'], ['zhǎng']],
+    '见闻': [['jiàn'], ['wén']],
+    '见面': [['jiàn'], ['miàn']],
+    '见鬼': [['jiàn'], ['guǐ']],
+    '观众': [['guān'], ['zhòng']],
+    '观光': [['guān'], ['guāng']],
+    '观察': [['guān'], ['chá']],
+    '观念': [['guān'], ['niàn']],
+    '观感': [['guān'], ['gǎn']],
+    '观战': [['guān'], ['zhàn']],
+    '观摩': [['guān'], ['mó']],
+    '观望': [['guān'], ['wàng']],
+    '观止': [['guān'], ['zhǐ']],
+    '观测': [['guān'], ['cè']],
+    '观潮': [['guān'], ['cháo']],
+    '观火': [['guān'], ['huǒ']],
+    '观点': [['guān'], ['diǎn']],
+    '观照': [['guān'], ['zhào']],
+    '观看': [['guān'], ['kàn']],
+    '观瞻': [['guān'], ['zhān']],
+    '观礼': [['guān'], ['lǐ']],
+    '观览': [['guān'], ['lǎn']],
+    '观赏': [['guān'], ['shǎng']],
+    '观阵': [['guān'], ['zhèn']],
+    '观音': [['guān'], ['yīn']],
+    '观风': [['guān'], ['fēng']],
+    '规划': [['guī'], ['huà']],
+    '规模': [['guī'], ['mó']],
+    '规正': [['guī'], ['zhèng']],
+    '规约': [['guī'], ['yuē']],
+    '觅食': [['mì'], ['shí']],
+    '视差': [['shì'], ['chà']],
+    '视觉': [['shì'], ['jué']],
+    '视角': [['shì'], ['jiǎo']],
+    '觉察': [['jué'], ['chá']],
+    '觉得': [['jué'], ['de']],
+    '觉悟': [['jué'], ['wù']],
+    '觉醒': [['jué'], ['xǐng']],
+    '觐见': [['jìn'], ['jiàn']],
+    '角力': [['jué'], ['lì']],
+    '角化': [['jiǎo'], ['huà']],
+    '角子': [['jiǎo'], ['zǐ']],
+    '角尺': [['jiǎo'], ['chǐ']],
+    '角度': [['jiǎo'], ['dù']],
+    '角斗': [['jué'], ['dòu']],
+    '角楼': [['jiǎo'], ['lóu']],
+    '角球': [['jiǎo'], ['qiú']],
+    '角票': [['jiǎo'], ['piào']],
+    '角膜': [['jiǎo'], ['mó']],
+    '角色': [['jué'], ['sè']],
+    '角落': [['jiǎo'], ['luò']],
+    '角质': [['jiǎo'], ['zhì']],
+    '角逐': [['jué'], ['zhú']],
+    '角钢': [['jiǎo'], ['gāng']],
+    '角铁': [['jiǎo'], ['tiě']],
+    '角门': [['jiǎo'], ['mén']],
+    '解下': [['jiě'], ['xià']],
+    '解严': [['jiě'], ['yán']],
+    '解乏': [['jiě'], ['fá']],
+    '解事': [['jiě'], ['shì']],
+    '解任': [['jiě'], ['rèn']],
+    '解体': [['jiě'], ['tǐ']],
+    '解元': [['jiè'], ['yuán']],
+    '解决': [['jiě'], ['jué']],
+    '解冻': [['jiě'], ['dòng']],
+    '解剖': [['jiě'], ['pōu']],
+    '解劝': [['jiě'], ['quàn']],
+    '解危': [['jiě'], ['wēi']],
+    '解吸': [['jiě'], ['xī']],
+    '解嘲': [['jiě'], ['cháo']],
+    '解囊': [['jiě'], ['náng']],
+    '解困': [['jiě'], ['kùn']],
+    '解围': [['jiě'], ['wéi']],
+    '解密': [['jiě'], ['mì']],
+    '解差': [['jiè'], ['chāi']],
+    '解开': [['jiě'], ['kāi']],
+    '解忧': [['jiě'], ['yōu']],
+    '解恨': [['jiě'], ['hèn']],
+    '解悟': [['jiě'], ['wù']],
+    '解惑': [['jiě'], ['huò']],
+    '解愁': [['jiě'], ['chóu']],
+    '解手': [['jiě'], ['shǒu']],
+    '解放': [['jiě'], ['fàng']],
+    '解救': [['jiě'], ['jiù']],
+    '解散': [['jiě'], ['sàn']],
+    '解数': [['xiè'], ['shù']],
+    '解暑': [['jiě'], ['shǔ']],
+    '解构': [['jiě'], ['gòu']],
+    '解析': [['jiě'], ['xī']],
+    '解梦': [['jiě'], ['mèng']],
+    '解款': [['jiè'], ['kuǎn']],
+    '解毒': [['jiě'], ['dú']],
+    '解气': [['jiě'], ['qì']],
+    '解池': [['xiè'], ['chí']],
+    '解法': [['xiè'], ['fǎ']],
+    '解渴': [['jiě'], ['kě']],
+    '解热': [['jiě'], ['rè']],
+    '解甲': [['jiě'], ['jiǎ']],
+    '解疑': [['jiě'], ['yí']],
+    '解码': [['jiě'], ['mǎ']],
+    '解禁': [['jiě'], ['jìn']],
+    '解离': [['jiě'], ['lí']],
+    '解答': [['jiě'], ['dá']],
+    '解约': [['jiě'], ['yuē']],
+    '解缆': [['jiě'], ['lǎn']],
+    '解职': [['jiě'], ['zhí']],
+    '解聘': [['jiě'], ['pìn']],
+    '解脱': [['jiě'], ['tuō']],
+    '解药': [['jiě'], ['yào']],
+    '解表': [['jiě'], ['biǎo']],
+    '解解': [['jiě'], ['jiě']],
+    '解说': [['jiě'], ['shuō']],
+    '解调': [['jiě'], ['tiáo']],
+    '解谜': [['jiě'], ['mí']],
+    '解运': [['jiě'], ['yùn']],
+    '解送': [['jiè'], ['sòng']],
+    '解郁': [['jiě'], ['yù']],
+    '解酒': [['jiě'], ['jiǔ']],
+    '解释': [['jiě'], ['shì']],
+    '解闷': [['jiě'], ['mèn']],
+    '解除': [['jiě'], ['chú']],
+    '解难': [['jiě'], ['nán']],
+    '解雇': [['jiě'], ['gù']],
+    '解颐': [['jiě'], ['yí']],
+    '解题': [['jiě'], ['tí']],
+    '解饿': [['jiě'], ['è']],
+    '解馋': [['jiě'], ['chán']],
+    '触发': [['chù'], ['fā']],
+    '触觉': [['chù'], ['jué']],
+    '触角': [['chù'], ['jiǎo']],
+    '言中': [['yán'], ['zhōng']],
+    '言传': [['yán'], ['chuán']],
+    '言和': [['yán'], ['hé']],
+    '言教': [['yán'], ['jiào']],
+    '言行': [['yán'], ['xíng']],
+    '言论': [['yán'], ['lùn']],
+    '言语': [['yán'], ['yǔ']],
+    '言说': [['yán'], ['shuō']],
+    '言重': [['yán'], ['zhòng']],
+    '誓约': [['shì'], ['yuē']],
+    '謦欬': [['qǐng'], ['kài']],
+    '警句': [['jǐng'], ['jù']],
+    '警号': [['jǐng'], ['hào']],
+    '警员': [['jǐng'], ['yuán']],
+    '警服': [['jǐng'], ['fú']],
+    '警棍': [['jǐng'], ['gùn']],
+    '警种': [['jǐng'], ['zhǒng']],
+    '警觉': [['jǐng'], ['jué']],
+    '警语': [['jǐng'], ['yǔ']],
+    '警车': [['jǐng'], ['chē']],
+    '警长': [['jǐng'], ['zhǎng']],
+    '譬若': [['pì'], ['ruò']],
+    '计划': [['jì'], ['huà']],
+    '计量': [['jì'], ['liàng']],
+    '订单': [['dìng'], ['dān']],
+    '订正': [['dìng'], ['zhèng']],
+    '订约': [['dìng'], ['yuē']],
+    '认为': [['rèn'], ['wéi']],
+    '认亲': [['rèn'], ['qīn']],
+    '认可': [['rèn'], ['kě']],
+    '认同': [['rèn'], ['tóng']],
+    '认头': [['rèn'], ['tóu']],
+    '认得': [['rèn'], ['de']],
+    '认知': [['rèn'], ['zhī']],
+    '认识': [['rèn'], ['shí']],
+    '讥刺': [['jī'], ['cì']],
+    '讥嘲': [['jī'], ['cháo']],
+    '讥弹': [['jī'], ['tán']],
+    '讨亲': [['tǎo'], ['qīn']],
+    '讨价': [['tǎo'], ['jià']],
+    '讨好': [['tǎo'], ['hǎo']],
+    '讨教': [['tǎo'], ['jiào']],
+    '讨要': [['tǎo'], ['yào']],
+    '讨论': [['tǎo'], ['lùn']],
+    '讨还': [['tǎo'], ['huán']],
+    '让与': [['ràng'], ['yǔ']],
+    '让价': [['ràng'], ['jià']],
+    '训令': [['xùn'], ['lìng']],
+    '议价': [['yì'], ['jià']],
+    '议会': [['yì'], ['huì']],
+    '议员': [['yì'], ['yuán']],
+    '议和': [['yì'], ['hé']],
+    '议场': [['yì'], ['chǎng']],
+    '议论': [['yì'], ['lùn']],
+    '议长': [['yì'], ['zhǎng']],
+    '讯号': [['xùn'], ['hào']],
+    '记仇': [['jì'], ['chóu']],
+    '记分': [['jì'], ['fēn']],
+    '记号': [['jì'], ['hào']],
+    '记得': [['jì'], ['de']],
+    '记要': [['jì'], ['yào']],
+    '记载': [['jì'], ['zǎi']],
+    '记过': [['jì'], ['guò']],
+    '讲价': [['jiǎng'], ['jià']],
+    '讲台': [['jiǎng'], ['tái']],
+    '讲和': [['jiǎng'], ['hé']],
+    '讲好': [['jiǎng'], ['hǎo']],
+    '讲解': [['jiǎng'], ['jiě']],
+    '许下': [['xǔ'], ['xià']],
+    '许久': [['xǔ'], ['jiǔ']],
+    '许亲': [['xǔ'], ['qīn']],
+    '许可': [['xǔ'], ['kě']],
+    '许多': [['xǔ'], ['duō']],
+    '许婚': [['xǔ'], ['hūn']],
+    '许愿': [['xǔ'], ['yuàn']],
+    '许昌': [['xǔ'], ['chāng']],
+    '许是': [['xǔ'], ['shì']],
+    '许诺': [['xǔ'], ['nuò']],
+    '许身': [['xǔ'], ['shēn']],
+    '许配': [['xǔ'], ['pèi']],
+    '讹传': [['é'], ['chuán']],
+    '论争': [['lùn'], ['zhēng']],
+    '论交': [['lùn'], ['jiāo']],
+    '论价': [['lùn'], ['jià']],
+    '论列': [['lùn'], ['liè']],
+    '论剑': [['lùn'], ['jiàn']],
+    '论及': [['lùn'], ['jí']],
+    '论坛': [['lùn'], ['tán']],
+    '论处': [['lùn'], ['chǔ']],
+    '论战': [['lùn'], ['zhàn']],
+    '论据': [['lùn'], ['jù']],
+    '论敌': [['lùn'], ['dí']],
+    '论文': [['lùn'], ['wén']],
+    '论断': [['lùn'], ['duàn']],
+    '论点': [['lùn'], ['diǎn']],
+    '论理': [['lùn'], ['lǐ']],
+    '论罪': [['lùn'], ['zuì']],
+    '论著': [['lùn'], ['zhù']],
+    '论证': [['lùn'], ['zhèng']],
+    '论语': [['lún'], ['yǔ']],
+    '论说': [['lùn'], ['shuō']],
+    '论调': [['lùn'], ['diào']],
+    '论辩': [['lùn'], ['biàn']],
+    '论述': [['lùn'], ['shù']],
+    '论道': [['lùn'], ['dào']],
+    '论难': [['lùn'], ['nàn']],
+    '论集': [['lùn'], ['jí']],
+    '论题': [['lùn'], ['tí']],
+    '讼棍': [['sòng'], ['gùn']],
+    '讽刺': [['fěng'], ['cì']],
+    '设若': [['shè'], ['ruò']],
+    '访查': [['fǎng'], ['chá']],
+    '诀别': [['jué'], ['bié']],
+    '证券': [['zhèng'], ['quàn']],
+    '证据': [['zhèng'], ['jù']],
+    '证见': [['zhèng'], ['jiàn']],
+    '诃子': [['hē'], ['zi']],
+    '评价': [['píng'], ['jià']],
+    '评传': [['píng'], ['zhuàn']],
+    '评估': [['píng'], ['gū']],
+    '评分': [['píng'], ['fēn']],
+    '评卷': [['píng'], ['juàn']],
+    '评委': [['píng'], ['wěi']],
+    '评弹': [['píng'], ['tán']],
+    '评戏': [['píng'], ['xì']],
+    '评论': [['píng'], ['lùn']],
+    '评语': [['píng'], ['yǔ']],
+    '评说': [['píng'], ['shuō']],
+    '评量': [['píng'], ['liàng']],
+    '识别': [['shí'], ['bié']],
+    '识字': [['shí'], ['zì']],
+    '识才': [['shí'], ['cái']],
+    '识相': [['shí'], ['xiàng']],
+    '识破': [['shí'], ['pò']],
+    '识羞': [['shí'], ['xiū']],
+    '识见': [['shí'], ['jiàn']],
+    '识记': [['zhì'], ['jì']],
+    '识货': [['shí'], ['huò']],
+    '识趣': [['shí'], ['qù']],
+    '诈唬': [['zhà'], ['hǔ']],
+    '诈称': [['zhà'], ['chēng']],
+    '诈语': [['zhà'], ['yǔ']],
+    '诈降': [['zhà'], ['xiáng']],
+    '诉说': [['sù'], ['shuō']],
+    '诊脉': [['zhěn'], ['mài']],
+    '词令': [['cí'], ['lìng']],
+    '词句': [['cí'], ['jù']],
+    '词头': [['cí'], ['tóu']],
+    '词尾': [['cí'], ['wěi']],
+    '词曲': [['cí'], ['qǔ']],
+    '词语': [['cí'], ['yǔ']],
+    '词调': [['cí'], ['diào']],
+    '诏令': [['zhào'], ['lìng']],
+    '译员': [['yì'], ['yuán']],
+    '译著': [['yì'], ['zhù']],
+    '试卷': [['shì'], ['juàn']],
+    '试场': [['shì'], ['chǎng']],
+    '试射': [['shì'], ['shè']],
+    '试片': [['shì'], ['piàn']],
+    '试看': [['shì'], ['kàn']],
+    '试种': [['shì'], ['zhòng']],
+    '试行': [['shì'], ['xíng']],
+    '试读': [['shì'], ['dú']],
+    '试车': [['shì'], ['chē']],
+    '诗会': [['shī'], ['huì']],
+    '诗体': [['shī'], ['tǐ']],
+    '诗兴': [['shī'], ['xìng']],
+    '诗句': [['shī'], ['jù']],
+    '诗节': [['shī'], ['jié']],
+    '诗行': [['shī'], ['háng']],
+    '诗论': [['shī'], ['lùn']],
+    '诘屈': [['jí'], ['qū']],
+    '诘朝': [['jí'], ['cháo']],
+    '诘责': [['jié'], ['zé']],
+    '诘问': [['jié'], ['wèn']],
+    '诘难': [['jié'], ['nán']],
+    '诚信': [['chéng'], ['xìn']],
+    '诚服': [['chéng'], ['fú']],
+    '诚朴': [['chéng'], ['piáo']],
+    '话别': [['huà'], ['bié']],
+    '话头': [['huà'], ['tóu']],
+    '话语': [['huà'], ['yǔ']],
+    '话说': [['huà'], ['shuō']],
+    '诡奇': [['guǐ'], ['qí']],
+    '诡秘': [['guǐ'], ['mì']],
+    '诡称': [['guǐ'], ['chēng']],
+    '询查': [['xún'], ['chá']],
+    '该当': [['gāi'], ['dāng']],
+    '该着': [['gāi'], ['zháo']],
+    '详察': [['xiáng'], ['chá']],
+    '详尽': [['xiáng'], ['jìn']],
+    '详明': [['xiáng'], ['míng']],
+    '详解': [['xiáng'], ['jiě']],
+    '诨号': [['hùn'], ['hào']],
+    '语云': [['yǔ'], ['yún']],
+    '语体': [['yǔ'], ['tǐ']],
+    '语句': [['yǔ'], ['jù']],
+    '语塞': [['yǔ'], ['sè']],
+    '语境': [['yǔ'], ['jìng']],
+    '语声': [['yǔ'], ['shēng']],
+    '语序': [['yǔ'], ['xù']],
+    '语录': [['yǔ'], ['lù']],
+    '语态': [['yǔ'], ['tài']],
+    '语意': [['yǔ'], ['yì']],
+    '语感': [['yǔ'], ['gǎn']],
+    '语文': [['yǔ'], ['wén']],
+    '语族': [['yǔ'], ['zú']],
+    '语气': [['yǔ'], ['qì']],
+    '语汇': [['yǔ'], ['huì']],
+    '语法': [['yǔ'], ['fǎ']],
+    '语源': [['yǔ'], ['yuán']],
+    '语病': [['yǔ'], ['bìng']],
+    '语种': [['yǔ'], ['zhǒng']],
+    '语系': [['yǔ'], ['xì']],
+    '语素': [['yǔ'], ['sù']],
+    '语言': [['yǔ'], ['yán']],
+    '语词': [['yǔ'], ['cí']],
+    '语调': [['yǔ'], ['diào']],
+    '语音': [['yǔ'], ['yīn']],
+    '误会': [['wù'], ['huì']],
+    '误传': [['wù'], ['chuán']],
+    '误信': [['wù'], ['xìn']],
+    '误场': [['wù'], ['chǎng']],
+    '误差': [['wù'], ['chā']],
+    '误期': [['wù'], ['qī']],
+    '误称': [['wù'], ['chēng']],
+    '误解': [['wù'], ['jiě']],
+    '误车': [['wù'], ['chē']],
+    '诱供': [['yòu'], ['gòng']],
+    '诱发': [['yòu'], ['fā']],
+    '诱掖': [['yòu'], ['yè']],
+    '诱迫': [['yòu'], ['pò']],
+    '诱降': [['yòu'], ['xiáng']],
+    '诳语': [['kuáng'], ['yǔ']],
+    '说书': [['shuō'], ['shū']],
+    '说亲': [['shuō'], ['qīn']],
+    '说合': [['shuō'], ['hé']],
+    '说和': [['shuō'], ['hé']],
+    '说唱': [['shuō'], ['chàng']],
+    '说嘴': [['shuō'], ['zuǐ']],
+    '说头': [['shuō'], ['tóu']],
+    '说好': [['shuō'], ['hǎo']],
+    '说媒': [['shuō'], ['méi']],
+    '说客': [['shuō'], ['kè']],
+    '说开': [['shuō'], ['kāi']],
+    '说情': [['shuō'], ['qíng']],
+    '说戏': [['shuō'], ['xì']],
+    '说教': [['shuō'], ['jiào']],
+    '说明': [['shuō'], ['míng']],
+    '说是': [['shuō'], ['shì']],
+    '说服': [['shuō'], ['fú']],
+    '说死': [['shuō'], ['sǐ']],
+    '说法': [['shuō'], ['fǎ']],
+    '说理': [['shuō'], ['lǐ']],
+    '说白': [['shuō'], ['bái']],
+    '说破': [['shuō'], ['pò']],
+    '说穿': [['shuō'], ['chuān']],
+    '说笑': [['shuō'], ['xiào']],
+    '说词': [['shuō'], ['cí']],
+    '说话': [['shuō'], ['huà']],
+    '说谎': [['shuō'], ['huǎng']],
+    '说辞': [['shuō'], ['cí']],
+    '说道': [['shuō'], ['dào']],
+    '说错': [['shuō'], ['cuò']],
+    '说项': [['shuì'], ['xiàng']],
+    '诵读': [['sòng'], ['dú']],
+    '请便': [['qǐng'], ['biàn']],
+    '请假': [['qǐng'], ['jià']],
+    '请帖': [['qǐng'], ['tiě']],
+    '请教': [['qǐng'], ['jiào']],
+    '请见': [['qǐng'], ['jiàn']],
+    '请调': [['qǐng'], ['diào']],
+    '请降': [['qǐng'], ['xiáng']],
+    '诸侯': [['zhū'], ['hóu']],
+    '诸葛': [['zhū'], ['gě']],
+    '读书': [['dú'], ['shū']],
+    '读数': [['dú'], ['shù']],
+    '读本': [['dú'], ['běn']],
+    '读法': [['dú'], ['fǎ']],
+    '读物': [['dú'], ['wù']],
+    '读破': [['dú'], ['pò']],
+    '读秒': [['dú'], ['miǎo']],
+    '读经': [['dú'], ['jīng']],
+    '读者': [['dú'], ['zhě']],
+    '读若': [['dú'], ['ruò']],
+    '读音': [['dú'], ['yīn']],
+    '课卷': [['kè'], ['juàn']],
+    '课长': [['kè'], ['zhǎng']],
+    '课间': [['kè'], ['jiān']],
+    '诿过': [['wěi'], ['guò']],
+    '谁个': [['shuí'], ['gè']],
+    '谁家': [['shuí'], ['jiā']],
+    '谁的': [['shéi'], ['de']],
+    '谁都': [['shéi'], ['dōu']],
+    '调人': [['diào'], ['rén']],
+    '调令': [['diào'], ['lìng']],
+    '调价': [['tiáo'], ['jià']],
+    '调任': [['diào'], ['rèn']],
+    '调侃': [['tiáo'], ['kǎn']],
+    '调值': [['diào'], ['zhí']],
+    '调停': [['tiáo'], ['tíng']],
+    '调光': [['tiáo'], ['guāng']],
+    '调养': [['tiáo'], ['yǎng']],
+    '调准': [['tiáo'], ['zhǔn']],
+    '调函': [['diào'], ['hán']],
+    '调制': [['tiáo'], ['zhì']],
+    '调剂': [['tiáo'], ['jì']],
+    '调动': [['diào'], ['dòng']],
+    '调匀': [['tiáo'], ['yún']],
+    '调包': [['diào'], ['bāo']],
+    '调协': [['tiáo'], ['xié']],
+    '调卷': [['diào'], ['juàn']],
+    '调取': [['diào'], ['qǔ']],
+    '调号': [['diào'], ['hào']],
+    '调合': [['tiáo'], ['hé']],
+    '调味': [['tiáo'], ['wèi']],
+    '调和': [['tiáo'], ['hé']],
+    '调唆': [['tiáo'], ['suō']],
+    '调回': [['diào'], ['huí']],
+    '调处': [['tiáo'], ['chǔ']],
+    '调头': [['diào'], ['tóu']],
+    '调子': [['diào'], ['zi']],
+    '调幅': [['tiáo'], ['fú']],
+    '调干': [['diào'], ['gàn']],
+    '调度': [['diào'], ['dù']],
+    '调弄': [['tiáo'], ['nòng']],
+    '调式': [['diào'], ['shì']],
+    '调息': [['tiáo'], ['xī']],
+    '调情': [['tiáo'], ['qíng']],
+    '调戏': [['tiáo'], ['xì']],
+    '调护': [['tiáo'], ['hù']],
+    '调拨': [['tiáo'], ['bō']],
+    '调换': [['diào'], ['huàn']],
+    '调控': [['tiáo'], ['kòng']],
+    '调摄': [['tiáo'], ['shè']],
+    '调教': [['tiáo'], ['jiào']],
+    '调整': [['tiáo'], ['zhěng']],
+    '调料': [['tiáo'], ['liào']],
+    '调查': [['diào'], ['chá']],
+    '调档': [['tiáo'], ['dàng']],
+    '调正': [['diào'], ['zhèng']],
+    '调治': [['tiáo'], ['zhì']],
+    '调派': [['diào'], ['pài']],
+    '调温': [['tiáo'], ['wēn']],
+    '调演': [['diào'], ['yǎn']],
+    '调焦': [['tiáo'], ['jiāo']],
+    '调理': [['tiáo'], ['lǐ']],
+    '调用': [['diào'], ['yòng']],
+    '调皮': [['tiáo'], ['pí']],
+    '调研': [['diào'], ['yán']],
+    '调离': [['diào'], ['lí']],
+    '调笑': [['tiáo'], ['xiào']],
+    '调级': [['tiáo'], ['jí']],
+    '调经': [['diào'], ['jīng']],
+    '调羹': [['tiáo'], ['gēng']],
+    '调职': [['diào'], ['zhí']],
+    '调色': [['tiáo'], ['sè']],
+    '调节': [['tiáo'], ['jié']],
+    '调解': [['tiáo'], ['jiě']],
+    '调试': [['tiáo'], ['shì']],
+    '调调': [['tiáo'], ['diào']],
+    '调谐': [['tiáo'], ['xié']],
+    '调谑': [['tiáo'], ['xuè']],
+    '调资': [['tiáo'], ['zī']],
+    '调转': [['diào'], ['zhuǎn']],
+    '调运': [['diào'], ['yùn']],
+    '调适': [['tiáo'], ['shì']],
+    '调遣': [['diào'], ['qiǎn']],
+    '调配': [['diào'], ['pèi']],
+    '调门': [['diào'], ['mén']],
+    '调阅': [['diào'], ['yuè']],
+    '调防': [['diào'], ['fáng']],
+    '调集': [['diào'], ['jí']],
+    '调音': [['tiáo'], ['yīn']],
+    '调频': [['tiáo'], ['pín']],
+    '谅解': [['liàng'], ['jiě']],
+    '谈兴': [['tán'], ['xìng']],
+    '谈助': [['tán'], ['zhù']],
+    '谈吐': [['tán'], ['tǔ']],
+    '谈论': [['tán'], ['lùn']],
+    '谋划': [['móu'], ['huà']],
+    '谎称': [['huǎng'], ['chēng']],
+    '谎言': [['huǎng'], ['yán']],
+    '谢帖': [['xiè'], ['tiě']],
+    '谣传': [['yáo'], ['chuán']],
+    '谥号': [['shì'], ['hào']],
+    '谦冲': [['qiān'], ['chōng']],
+    '谦和': [['qiān'], ['hé']],
+    '谦称': [['qiān'], ['chēng']],
+    '谨上': [['jǐn'], ['shàng']],
+    '谩骂': [['màn'], ['mà']],
+    '谬种': [['miù'], ['zhǒng']],
+    '谬论': [['miù'], ['lùn']],
+    '谬说': [['miù'], ['shuō']],
+    '谱号': [['pǔ'], ['hào']],
+    '谱曲': [['pǔ'], ['qǔ']],
+    '谱系': [['pǔ'], ['xì']],
+    '谵语': [['zhān'], ['yǔ']],
+    '谶语': [['chèn'], ['yǔ']],
+    '谷地': [['gǔ'], ['dì']],
+    '谷坊': [['gǔ'], ['fáng']],
+    '谷底': [['gǔ'], ['dǐ']],
+    '谷雨': [['gǔ'], ['yǔ']],
+    '豁亮': [['huò'], ['liàng']],
+    '豁免': [['huò'], ['miǎn']],
+    '豁出': [['huō'], ['chū']],
+    '豁口': [['huō'], ['kǒu']],
+    '豁嘴': [['huō'], ['zuǐ']],
+    '豁子': [['huō'], ['zǐ']],
+    '豁拳': [['huá'], ['quán']],
+    '豁朗': [['huò'], ['lǎng']],
+    '豁然': [['huò'], ['rán']],
+    '豁达': [['huò'], ['dá']],
+    '豆沙': [['dòu'], ['shā']],
+    '豆泡': [['dòu'], ['pāo']],
+    '豆浆': [['dòu'], ['jiāng']],
+    '豆绿': [['dòu'], ['lǜ']],
+    '豆角': [['dòu'], ['jiǎo']],
+    '豆豉': [['dòu'], ['chǐ']],
+    '豪兴': [['háo'], ['xìng']],
+    '豪华': [['háo'], ['huá']],
+    '豪强': [['háo'], ['qiáng']],
+    '豪横': [['háo'], ['hèng']],
+    '豪语': [['háo'], ['yǔ']],
+    '豪雨': [['háo'], ['yǔ']],
+    '豫见': [['yù'], ['jiàn']],
+    '貉子': [['háo'], ['zi']],
+    '貉绒': [['háo'], ['róng']],
+    '貌似': [['mào'], ['sì']],
+    '貌相': [['mào'], ['xiāng']],
+    '贝勒': [['bèi'], ['lè']],
+    '贝壳': [['bèi'], ['ké']],
+    '贞女': [['zhēn'], ['nǚ']],
+    '贞节': [['zhēn'], ['jié']],
+    '贞观': [['zhēn'], ['guàn']],
+    '负号': [['fù'], ['hào']],
+    '负担': [['fù'], ['dān']],
+    '负数': [['fù'], ['shù']],
+    '负片': [['fù'], ['piàn']],
+    '负累': [['fù'], ['lèi']],
+    '负约': [['fù'], ['yuē']],
+    '负荷': [['fù'], ['hè']],
+    '负载': [['fù'], ['zài']],
+    '负重': [['fù'], ['zhòng']],
+    '财会': [['cái'], ['kuài']],
+    '财长': [['cái'], ['zhǎng']],
+    '责令': [['zé'], ['lìng']],
+    '责任': [['zé'], ['rèn']],
+    '责打': [['zé'], ['dǎ']],
+    '责难': [['zé'], ['nàn']],
+    '贤契': [['xián'], ['qì']],
+    '贤弟': [['xián'], ['dì']],
+    '贤能': [['xián'], ['néng']],
+    '败亡': [['bài'], ['wáng']],
+    '败兴': [['bài'], ['xìng']],
+    '败北': [['bài'], ['běi']],
+    '败坏': [['bài'], ['huài']],
+    '败家': [['bài'], ['jiā']],
+    '败将': [['bài'], ['jiàng']],
+    '败毒': [['bài'], ['dú']],
+    '败落': [['bài'], ['luò']],
+    '败血': [['bài'], ['xuè']],
+    '败露': [['bài'], ['lù']],
+    '账单': [['zhàng'], ['dān']],
+    '账号': [['zhàng'], ['hào']],
+    '账簿': [['zhàng'], ['bù']],
+    '货价': [['huò'], ['jià']],
+    '货单': [['huò'], ['dān']],
+    '货场': [['huò'], ['chǎng']],
+    '货柜': [['huò'], ['guì']],
+    '货殖': [['huò'], ['zhí']],
+    '货票': [['huò'], ['piào']],
+    '货车': [['huò'], ['chē']],
+    '货郎': [['huò'], ['láng']],
+    '质体': [['zhì'], ['tǐ']],
+    '质地': [['zhì'], ['dì']],
+    '质当': [['zhì'], ['dàng']],
+    '质数': [['zhì'], ['shù']],
+    '质朴': [['zhì'], ['piáo']],
+    '质疑': [['zhì'], ['yí']],
+    '质的': [['zhì'], ['dì']],
+    '质量': [['zhì'], ['liàng']],
+    '贩夫': [['fàn'], ['fū']],
+    '贩毒': [['fàn'], ['dú']],
+    '贪占': [['tān'], ['zhàn']],
+    '贪食': [['tān'], ['shí']],
+    '贫化': [['pín'], ['huà']],
+    '贫血': [['pín'], ['xuè']],
+    '贬价': [['biǎn'], ['jià']],
+    '贬称': [['biǎn'], ['chēng']],
+    '购得': [['gòu'], ['de']],
+    '贮藏': [['zhù'], ['cáng']],
+    '贱价': [['jiàn'], ['jià']],
+    '贱内': [['jiàn'], ['nèi']],
+    '贲临': [['bì'], ['lín']],
+    '贲星': [['bēn'], ['xīng']],
+    '贲溃': [['bēn'], ['kuì']],
+    '贲门': [['bēn'], ['mén']],
+    '贴切': [['tiē'], ['qiè']],
+    '贴合': [['tiē'], ['hé']],
+    '贴着': [['tiē'], ['zhe']],
+    '贵体': [['guì'], ['tǐ']],
+    '贵处': [['guì'], ['chǔ']],
+    '贵妃': [['guì'], ['fēi']],
+    '贵干': [['guì'], ['gàn']],
+    '贵重': [['guì'], ['zhòng']],
+    '费劲': [['fèi'], ['jìn']],
+    '费解': [['fèi'], ['jiě']],
+    '费难': [['fèi'], ['nán']],
+    '贺信': [['hè'], ['xìn']],
+    '贺卡': [['hè'], ['kǎ']],
+    '贻累': [['yí'], ['lèi']],
+    '贽见': [['zhì'], ['jiàn']],
+    '贾人': [['gǔ'], ['rén']],
+    '贾勇': [['gǔ'], ['yǒng']],
+    '贾官': [['gǔ'], ['guān']],
+    '贾欺': [['gǔ'], ['qī']],
+    '贾用': [['gǔ'], ['yòng']],
+    '贾田': [['gǔ'], ['tián']],
+    '贾祸': [['gǔ'], ['huò']],
+    '贾贷': [['gǔ'], ['dài']],
+    '贾贸': [['gǔ'], ['mào']],
+    '贾资': [['gǔ'], ['zī']],
+    '贾道': [['gǔ'], ['dào']],
+    '贾马': [['gǔ'], ['mǎ']],
+    '资助': [['zī'], ['zhù']],
+    '赅括': [['gāi'], ['kuò']],
+    '赋予': [['fù'], ['yǔ']],
+    '赋有': [['fù'], ['yǒu']],
+    '赌场': [['dǔ'], ['chǎng']],
+    '赌棍': [['dǔ'], ['gùn']],
+    '赎当': [['shú'], ['dàng']],
+    '赏识': [['shǎng'], ['shí']],
+    '赐予': [['cì'], ['yǔ']],
+    '赐教': [['cì'], ['jiào']],
+    '赐给': [['cì'], ['gěi']],
+    '赔还': [['péi'], ['huán']],
+    '赚头': [['zhuàn'], ['tou']],
+    '赚得': [['zuàn'], ['de']],
+    '赛会': [['sài'], ['huì']],
+    '赛似': [['sài'], ['sì']],
+    '赛场': [['sài'], ['chǎng']],
+    '赛跑': [['sài'], ['pǎo']],
+    '赛车': [['sài'], ['chē']],
+    '赛过': [['sài'], ['guò']],
+    '赞助': [['zàn'], ['zhù']],
+    '赞同': [['zàn'], ['tóng']],
+    '赞许': [['zàn'], ['xǔ']],
+    '赞语': [['zàn'], ['yǔ']],
+    '赠与': [['zèng'], ['yǔ']],
+    '赠予': [['zèng'], ['yǔ']],
+    '赠别': [['zèng'], ['bié']],
+    '赠答': [['zèng'], ['dá']],
+    '赢家': [['yíng'], ['jiā']],
+    '赢得': [['yíng'], ['de']],
+    '赤地': [['chì'], ['dì']],
+    '赤红': [['chì'], ['hóng']],
+    '赤背': [['chì'], ['bèi']],
+    '赤露': [['chì'], ['lù']],
+    '赫兹': [['hè'], ['zī']],
+    '赭石': [['zhě'], ['shí']],
+    '走俏': [['zǒu'], ['qiào']],
+    '走卒': [['zǒu'], ['zú']],
+    '走吧': [['zǒu'], ['ba']],
+    '走散': [['zǒu'], ['sàn']],
+    '走红': [['zǒu'], ['hóng']],
+    '走读': [['zǒu'], ['dú']],
+    '走调': [['zǒu'], ['diào']],
+    '赴任': [['fù'], ['rèn']],
+    '赴会': [['fù'], ['huì']],
+    '赴约': [['fù'], ['yuē']],
+    '赴难': [['fù'], ['nàn']],
+    '赵体': [['zhào'], ['tǐ']],
+    '赶上': [['gǎn'], ['shàng']],
+    '赶会': [['gǎn'], ['huì']],
+    '赶场': [['gǎn'], ['chǎng']],
+    '赶着': [['gǎn'], ['zhe']],
+    '赶趟': [['gǎn'], ['tàng']],
+    '赶跑': [['gǎn'], ['pǎo']],
+    '赶车': [['gǎn'], ['chē']],
+    '赶驴': [['gǎn'], ['lǘ']],
+    '起价': [['qǐ'], ['jià']],
+    '起兴': [['qǐ'], ['xìng']],
+    '起劲': [['qǐ'], ['jìn']],
+    '起哄': [['qǐ'], ['hòng']],
+    '起头': [['qǐ'], ['tóu']],
+    '起家': [['qǐ'], ['jiā']],
+    '起泡': [['qǐ'], ['pào']],
+    '起疑': [['qǐ'], ['yí']],
+    '起落': [['qǐ'], ['luò']],
+    '起行': [['qǐ'], ['xíng']],
+    '起见': [['qǐ'], ['jiàn']],
+    '起解': [['qǐ'], ['jiè']],
+    '起跑': [['qǐ'], ['pǎo']],
+    '起跳': [['qǐ'], ['tiào']],
+    '起重': [['qǐ'], ['zhòng']],
+    '起降': [['qǐ'], ['jiàng']],
+    '趁便': [['chèn'], ['biàn']],
+    '趁空': [['chèn'], ['kòng']],
+    '超假': [['chāo'], ['jiǎ']],
+    '超员': [['chāo'], ['yuán']],
+    '超市': [['chāo'], ['shì']],
+    '超度': [['chāo'], ['dù']],
+    '超车': [['chāo'], ['chē']],
+    '超载': [['chāo'], ['zài']],
+    '超过': [['chāo'], ['guò']],
+    '超重': [['chāo'], ['zhòng']],
+    '趋附': [['qū'], ['fù']],
+    '趑趄': [['zī'], ['jū']],
+    '趔趄': [['liè'], ['qiè']],
+    '趟地': [['tāng'], ['dì']],
+    '趟水': [['tāng'], ['shuǐ']],
+    '趟马': [['tàng'], ['mǎ']],
+    '趣事': [['qù'], ['shì']],
+    '趣剧': [['qù'], ['jù']],
+    '趣味': [['qù'], ['wèi']],
+    '趣话': [['qù'], ['huà']],
+    '趣谈': [['qù'], ['tán']],
+    '足底': [['zú'], ['dǐ']],
+    '足见': [['zú'], ['jiàn']],
+    '趿拉': [['tā'], ['lā']],
+    '跄踉': [['qiàng'], ['liàng']],
+    '跌价': [['diē'], ['jià']],
+    '跌倒': [['diē'], ['dǎo']],
+    '跌落': [['diē'], ['luò']],
+    '跑光': [['pǎo'], ['guāng']],
+    '跑动': [['pǎo'], ['dòng']],
+    '跑反': [['pǎo'], ['fǎn']],
+    '跑堂': [['pǎo'], ['táng']],
+    '跑墒': [['pǎo'], ['shāng']],
+    '跑外': [['pǎo'], ['wài']],
+    '跑步': [['pǎo'], ['bù']],
+    '跑电': [['pǎo'], ['diàn']],
+    '跑肚': [['pǎo'], ['dù']],
+    '跑腿': [['pǎo'], ['tuǐ']],
+    '跑街': [['pǎo'], ['jiē']],
+    '跑表': [['pǎo'], ['biǎo']],
+    '跑调': [['pǎo'], ['diào']],
+    '跑车': [['pǎo'], ['chē']],
+    '跑道': [['pǎo'], ['dào']],
+    '跑鞋': [['pǎo'], ['xié']],
+    '跑题': [['pǎo'], ['tí']],
+    '跑马': [['pǎo'], ['mǎ']],
+    '跛子': [['bǒ'], ['zi']],
+    '跛行': [['bǒ'], ['xíng']],
+    '跟上': [['gēn'], ['shàng']],
+    '跟从': [['gēn'], ['cóng']],
+    '跟头': [['gēn'], ['tou']],
+    '跟差': [['gēn'], ['chāi']],
+    '跟斗': [['gēn'], ['dǒu']],
+    '跟着': [['gēn'], ['zhe']],
+    '跨度': [['kuà'], ['dù']],
+    '跪倒': [['guì'], ['dǎo']],
+    '路上': [['lù'], ['shàng']],
+    '路卡': [['lù'], ['qiǎ']],
+    '路头': [['lù'], ['tóu']],
+    '路子': [['lù'], ['zi']],
+    '路数': [['lù'], ['shù']],
+    '路旁': [['lù'], ['páng']],
+    '路条': [['lù'], ['tiáo']],
+    '路祭': [['lù'], ['jì']],
+    '路过': [['lù'], ['guò']],
+    '路风': [['lù'], ['fēng']],
+    '跳井': [['tiào'], ['jǐng']],
+    '跳伞': [['tiào'], ['sǎn']],
+    '跳出': [['tiào'], ['chū']],
+    '跳动': [['tiào'], ['dòng']],
+    '跳台': [['tiào'], ['tái']],
+    '跳月': [['tiào'], ['yuè']],
+    '跳板': [['tiào'], ['bǎn']],
+    '跳栏': [['tiào'], ['lán']],
+    '跳梁': [['tiào'], ['liáng']],
+    '跳棋': [['tiào'], ['qí']],
+    '跳槽': [['tiào'], ['cáo']],
+    '跳水': [['tiào'], ['shuǐ']],
+    '跳河': [['tiào'], ['hé']],
+    '跳班': [['tiào'], ['bān']],
+    '跳神': [['tiào'], ['shén']],
+    '跳空': [['tiào'], ['kōng']],
+    '跳箱': [['tiào'], ['xiāng']],
+    '跳级': [['tiào'], ['jí']],
+    '跳绳': [['tiào'], ['shéng']],
+    '跳脚': [['tiào'], ['jiǎo']],
+    '跳脱': [['tiào'], ['tuō']],
+    '跳舞': [['tiào'], ['wǔ']],
+    '跳荡': [['tiào'], ['dàng']],
+    '跳虫': [['tiào'], ['chóng']],
+    '跳蚤': [['tiào'], ['zǎo']],
+    '跳行': [['tiào'], ['háng']],
+    '跳越': [['tiào'], ['yuè']],
+    '跳跃': [['tiào'], ['yuè']],
+    '跳踉': [['tiào'], ['liáng']],
+    '跳远': [['tiào'], ['yuǎn']],
+    '跳闸': [['tiào'], ['zhá']],
+    '跳马': [['tiào'], ['mǎ']],
+    '跳高': [['tiào'], ['gāo']],
+    '跳鼠': [['tiào'], ['shǔ']],
+    '践约': [['jiàn'], ['yuē']],
+    '践行': [['jiàn'], ['xíng']],
+    '踉跄': [['liàng'], ['qiàng']],
+    '踏看': [['tà'], ['kàn']],
+    '踏空': [['tà'], ['kōng']],
+    '踝骨': [['huái'], ['gǔ']],
+    '踢打': [['tī'], ['dǎ']],
+    '蹊跷': [['qī'], ['qiāo']],
+    '蹓跶': [['liū'], ['da']],
+    '蹦跳': [['bèng'], ['tiào']],
+    '蹦跶': [['bèng'], ['da']],
+    '蹭蹬': [['cèng'], ['dèng']],
+    '蹿跳': [['cuān'], ['tiào']],
+    '身上': [['shēn'], ['shàng']],
+    '身亡': [['shēn'], ['wáng']],
+    '身价': [['shēn'], ['jià']],
+    '身份': [['shēn'], ['fèn']],
+    '身体': [['shēn'], ['tǐ']],
+    '身分': [['shēn'], ['fèn']],
+    '身子': [['shēn'], ['zi']],
+    '身家': [['shēn'], ['jiā']],
+    '身教': [['shēn'], ['jiào']],
+    '身条': [['shēn'], ['tiáo']],
+    '身量': [['shēn'], ['liàng']],
+    '身长': [['shēn'], ['cháng']],
+    '躬亲': [['gōng'], ['qīn']],
+    '躬行': [['gōng'], ['xíng']],
+    '躯体': [['qū'], ['tǐ']],
+    '躯壳': [['qū'], ['qiào']],
+    '躯干': [['qū'], ['gàn']],
+    '躲藏': [['duǒ'], ['cáng']],
+    '躺倒': [['tǎng'], ['dǎo']],
+    '躺柜': [['tǎng'], ['guì']],
+    '躺椅': [['tǎng'], ['yǐ']],
+    '车主': [['chē'], ['zhǔ']],
+    '车价': [['chē'], ['jià']],
+    '车刀': [['chē'], ['dāo']],
+    '车削': [['chē'], ['xiāo']],
+    '车前': [['chē'], ['qián']],
+    '车厢': [['chē'], ['xiāng']],
+    '车场': [['chē'], ['chǎng']],
+    '车夫': [['chē'], ['fū']],
+    '车头': [['chē'], ['tóu']],
+    '车子': [['chē'], ['zi']],
+    '车尾': [['chē'], ['wěi']],
+    '车工': [['chē'], ['gōng']],
+    '车帮': [['chē'], ['bāng']],
+    '车床': [['chē'], ['chuáng']],
+    '车库': [['chē'], ['kù']],
+    '车座': [['chē'], ['zuò']],
+    '车手': [['chē'], ['shǒu']],
+    '车技': [['chē'], ['jì']],
+    '车把': [['chē'], ['bǎ']],
+    '车掌': [['chē'], ['zhǎng']],
+    '车条': [['chē'], ['tiáo']],
+    '车架': [['chē'], ['jià']],
+    '车次': [['chē'], ['cì']],
+    '车流': [['chē'], ['liú']],
+    '车灯': [['chē'], ['dēng']],
+    '车照': [['chē'], ['zhào']],
+    '车皮': [['chē'], ['pí']],
+    '车盖': [['chē'], ['gài']],
+    '车盘': [['chē'], ['pán']],
+    '车票': [['chē'], ['piào']],
+    '车祸': [['chē'], ['huò']],
+    '车窗': [['chē'], ['chuāng']],
+    '车站': [['chē'], ['zhàn']],
+    '车箱': [['chē'], ['xiāng']],
+    '车胎': [['chē'], ['tāi']],
+    '车船': [['chē'], ['chuán']],
+    '车行': [['chē'], ['xíng']],
+    '车裂': [['chē'], ['liè']],
+    '车费': [['chē'], ['fèi']],
+    '车身': [['chē'], ['shēn']],
+    '车轮': [['chē'], ['lún']],
+    '车轴': [['chē'], ['zhóu']],
+    '车载': [['chē'], ['zài']],
+    '车辆': [['chē'], ['liàng']],
+    '车辐': [['chē'], ['fú']],
+    '车辕': [['chē'], ['yuán']],
+    '车辖': [['chē'], ['xiá']],
+    '车辙': [['chē'], ['zhé']],
+    '车速': [['chē'], ['sù']],
+    '车道': [['chē'], ['dào']],
+    '车钩': [['chē'], ['gōu']],
+    '车钱': [['chē'], ['qián']],
+    '车铃': [['chē'], ['líng']],
+    '车门': [['chē'], ['mén']],
+    '车间': [['chē'], ['jiān']],
+    '车队': [['chē'], ['duì']],
+    '车马': [['chē'], ['mǎ']],
+    '车驾': [['chē'], ['jià']],
+    '轧场': [['yà'], ['chǎng']],
+    '轧机': [['zhá'], ['jī']],
+    '轧账': [['gá'], ['zhàng']],
+    '轧辊': [['zhá'], ['gǔn']],
+    '轧钢': [['zhá'], ['gāng']],
+    '轨度': [['guǐ'], ['dù']],
+    '转世': [['zhuǎn'], ['shì']],
+    '转业': [['zhuǎn'], ['yè']],
+    '转义': [['zhuǎn'], ['yì']],
+    '转乘': [['zhuǎn'], ['chéng']],
+    '转交': [['zhuǎn'], ['jiāo']],
+    '转产': [['zhuǎn'], ['chǎn']],
+    '转任': [['zhuǎn'], ['rèn']],
+    '转体': [['zhuǎn'], ['tǐ']],
+    '转借': [['zhuǎn'], ['jiè']],
+    '转入': [['zhuǎn'], ['rù']],
+    '转写': [['zhuǎn'], ['xiě']],
+    '转动': [['zhuàn'], ['dòng']],
+    '转化': [['zhuǎn'], ['huà']],
+    '转卖': [['zhuǎn'], ['mài']],
+    '转发': [['zhuǎn'], ['fā']],
+    '转变': [['zhuǎn'], ['biàn']],
+    '转口': [['zhuǎn'], ['kǒu']],
+    '转台': [['zhuàn'], ['tái']],
+    '转向': [['zhuǎn'], ['xiàng']],
+    '转告': [['zhuǎn'], ['gào']],
+    '转回': [['zhuǎn'], ['huí']],
+    '转圈': [['zhuàn'], ['quān']],
+    '转圜': [['zhuǎn'], ['huán']],
+    '转场': [['zhuǎn'], ['chǎng']],
+    '转头': [['zhuǎn'], ['tóu']],
+    '转嫁': [['zhuǎn'], ['jià']],
+    '转子': [['zhuàn'], ['zǐ']],
+    '转学': [['zhuǎn'], ['xué']],
+    '转寄': [['zhuǎn'], ['jì']],
+    '转导': [['zhuǎn'], ['dǎo']],
+    '转帐': [['zhuǎn'], ['zhàng']],
+    '转干': [['zhuǎn'], ['gàn']],
+    '转年': [['zhuǎn'], ['nián']],
+    '转引': [['zhuǎn'], ['yǐn']],
+    '转弯': [['zhuǎn'], ['wān']],
+    '转徙': [['zhuǎn'], ['xǐ']],
+    '转念': [['zhuǎn'], ['niàn']],
+    '转悠': [['zhuàn'], ['yōu']],
+    '转战': [['zhuǎn'], ['zhàn']],
+    '转手': [['zhuǎn'], ['shǒu']],
+    '转托': [['zhuǎn'], ['tuō']],
+    '转折': [['zhuǎn'], ['zhé']],
+    '转换': [['zhuǎn'], ['huàn']],
+    '转捩': [['zhuǎn'], ['liè']],
+    '转接': [['zhuǎn'], ['jiē']],
+    '转播': [['zhuǎn'], ['bō']],
+    '转文': [['zhuǎi'], ['wén']],
+    '转机': [['zhuǎn'], ['jī']],
+    '转椅': [['zhuàn'], ['yǐ']],
+    '转正': [['zhuǎn'], ['zhèng']],
+    '转注': [['zhuǎn'], ['zhù']],
+    '转炉': [['zhuàn'], ['lú']],
+    '转生': [['zhuǎn'], ['shēng']],
+    '转盘': [['zhuǎn'], ['pán']],
+    '转眼': [['zhuǎn'], ['yǎn']],
+    '转瞬': [['zhuǎn'], ['shùn']],
+    '转矩': [['zhuàn'], ['jǔ']],
+    '转磨': [['zhuàn'], ['mò']],
+    '转科': [['zhuǎn'], ['kē']],
+    '转租': [['zhuǎn'], ['zū']],
+    '转移': [['zhuǎn'], ['yí']],
+    '转筋': [['zhuàn'], ['jīn']],
+    '转职': [['zhuǎn'], ['zhí']],
+    '转脸': [['zhuǎn'], ['liǎn']],
+    '转船': [['zhuǎn'], ['chuán']],
+    '转行': [['zhuǎn'], ['háng']],
+    '转角': [['zhuǎn'], ['jiǎo']],
+    '转让': [['zhuǎn'], ['ràng']],
+    '转诊': [['zhuǎn'], ['zhěn']],
+    '转译': [['zhuǎn'], ['yì']],
+    '转调': [['zhuǎn'], ['diào']],
+    '转账': [['zhuǎn'], ['zhàng']],
+    '转赠': [['zhuǎn'], ['zèng']],
+    '转身': [['zhuǎn'], ['shēn']],
+    '转车': [['zhuǎn'], ['chē']],
+    '转转': [['zhuǎn'], ['zhuǎn']],
+    '转轮': [['zhuàn'], ['lún']],
+    '转轴': [['zhuǎn'], ['zhóu']],
+    '转载': [['zhuǎn'], ['zǎi']],
+    '转达': [['zhuǎn'], ['dá']],
+    '转运': [['zhuǎn'], ['yùn']],
+    '转述': [['zhuǎn'], ['shù']],
+    '转送': [['zhuǎn'], ['sòng']],
+    '转递': [['zhuǎn'], ['dì']],
+    '转速': [['zhuàn'], ['sù']],
+    '转道': [['zhuǎn'], ['dào']],
+    '转门': [['zhuàn'], ['mén']],
+    '轮休': [['lún'], ['xiū']],
+    '轮台': [['lún'], ['tái']],
+    '轮圈': [['lún'], ['quān']],
+    '轮椅': [['lún'], ['yǐ']],
+    '轮番': [['lún'], ['fān']],
+    '轮种': [['lún'], ['zhòng']],
+    '轮转': [['lún'], ['zhuàn']],
+    '轮轴': [['lún'], ['zhóu']],
+    '软化': [['ruǎn'], ['huà']],
+    '软和': [['ruǎn'], ['huo']],
+    '软尺': [['ruǎn'], ['chǐ']],
+    '软泥': [['ruǎn'], ['ní']],
+    '软片': [['ruǎn'], ['piàn']],
+    '软磨': [['ruǎn'], ['mó']],
+    '软禁': [['ruǎn'], ['jìn']],
+    '软肋': [['ruǎn'], ['lèi']],
+    '软膏': [['ruǎn'], ['gāo']],
+    '软食': [['ruǎn'], ['shí']],
+    '软骨': [['ruǎn'], ['gǔ']],
+    '轰炸': [['hōng'], ['zhà']],
+    '轰隆': [['hōng'], ['lōng']],
+    '轴子': [['zhóu'], ['zǐ']],
+    '轴心': [['zhóu'], ['xīn']],
+    '轴承': [['zhóu'], ['chéng']],
+    '轴瓦': [['zhóu'], ['wǎ']],
+    '轴线': [['zhóu'], ['xiàn']],
+    '轴衬': [['zhóu'], ['chèn']],
+    '轸宿': [['zhěn'], ['xiù']],
+    '轻便': [['qīng'], ['biàn']],
+    '轻俏': [['qīng'], ['qiào']],
+    '轻信': [['qīng'], ['xìn']],
+    '轻度': [['qīng'], ['dù']],
+    '轻拂': [['qīng'], ['fú']],
+    '轻率': [['qīng'], ['shuài']],
+    '轻省': [['qīng'], ['shěng']],
+    '轻看': [['qīng'], ['kàn']],
+    '轻薄': [['qīng'], ['bó']],
+    '轻重': [['qīng'], ['zhòng']],
+    '载体': [['zài'], ['tǐ']],
+    '载客': [['zài'], ['kè']],
+    '载波': [['zài'], ['bō']],
+    '载荷': [['zài'], ['hè']],
+    '载货': [['zài'], ['huò']],
+    '载运': [['zài'], ['yùn']],
+    '载重': [['zài'], ['zhòng']],
+    '载频': [['zài'], ['pín']],
+    '轿夫': [['jiào'], ['fū']],
+    '轿子': [['jiào'], ['zi']],
+    '轿车': [['jiào'], ['chē']],
+    '较为': [['jiào'], ['wéi']],
+    '较劲': [['jiào'], ['jìn']],
+    '较场': [['jiào'], ['chǎng']],
+    '较大': [['jiào'], ['dà']],
+    '较好': [['jiào'], ['hǎo']],
+    '较差': [['jiào'], ['chà']],
+    '较著': [['jiào'], ['zhù']],
+    '较量': [['jiào'], ['liàng']],
+    '辅助': [['fǔ'], ['zhù']],
+    '辅相': [['fǔ'], ['xiàng']],
+    '辈分': [['bèi'], ['fēn']],
+    '辈子': [['bèi'], ['zi']],
+    '辈数': [['bèi'], ['shù']],
+    '辉石': [['huī'], ['shí']],
+    '辊轴': [['gǔn'], ['zhóu']],
+    '辎重': [['zī'], ['zhòng']],
+    '辐射': [['fú'], ['shè']],
+    '辑佚': [['jí'], ['yì']],
+    '辑要': [['jí'], ['yào']],
+    '输家': [['shū'], ['jiā']],
+    '输血': [['shū'], ['xuè']],
+    '辔头': [['pèi'], ['tóu']],
+    '辖区': [['xiá'], ['qū']],
+    '辗转': [['zhǎn'], ['zhuǎn']],
+    '辞令': [['cí'], ['lìng']],
+    '辞别': [['cí'], ['bié']],
+    '辞句': [['cí'], ['jù']],
+    '辞行': [['cí'], ['xíng']],
+    '辟举': [['bì'], ['jǔ']],
+    '辟书': [['bì'], ['shū']],
+    '辟召': [['bì'], ['zhào']],
+    '辟地': [['pì'], ['dì']],
+    '辟引': [['bì'], ['yǐn']],
+    '辟谣': [['pì'], ['yáo']],
+    '辟谷': [['bì'], ['gǔ']],
+    '辟邪': [['bì'], ['xié']],
+    '辟除': [['bì'], ['chú']],
+    '辨别': [['biàn'], ['bié']],
+    '辨正': [['biàn'], ['zhèng']],
+    '辨识': [['biàn'], ['shí']],
+    '辩正': [['biàn'], ['zhèng']],
+    '辩解': [['biàn'], ['jiě']],
+    '辩论': [['biàn'], ['lùn']],
+    '辩说': [['biàn'], ['shuō']],
+    '辩难': [['biàn'], ['nàn']],
+    '辫子': [['biàn'], ['zi']],
+    '辱没': [['rǔ'], ['mò']],
+    '边上': [['biān'], ['shàng']],
+    '边区': [['biān'], ['qū']],
+    '边卡': [['biān'], ['qiǎ']],
+    '边地': [['biān'], ['dì']],
+    '边塞': [['biān'], ['sài']],
+    '边疆': [['biān'], ['jiāng']],
+    '边角': [['biān'], ['jiǎo']],
+    '边远': [['biān'], ['yuǎn']],
+    '达摩': [['dá'], ['mó']],
+    '达观': [['dá'], ['guān']],
+    '迁都': [['qiān'], ['dū']],
+    '迂曲': [['yū'], ['qū']],
+    '迂论': [['yū'], ['lùn']],
+    '迅跑': [['xùn'], ['pǎo']],
+    '迆逦': [['yǐ'], ['lǐ']],
+    '过世': [['guò'], ['shì']],
+    '过于': [['guò'], ['yú']],
+    '过人': [['guò'], ['rén']],
+    '过从': [['guò'], ['cóng']],
+    '过付': [['guò'], ['fù']],
+    '过份': [['guò'], ['fèn']],
+    '过关': [['guò'], ['guān']],
+    '过冬': [['guò'], ['dōng']],
+    '过分': [['guò'], ['fèn']],
+    '过剩': [['guò'], ['shèng']],
+    '过劲': [['guò'], ['jìn']],
+    '过午': [['guò'], ['wǔ']],
+    '过半': [['guò'], ['bàn']],
+    '过厅': [['guò'], ['tīng']],
+    '过去': [['guò'], ['qù']],
+    '过后': [['guò'], ['hòu']],
+    '过场': [['guò'], ['chǎng']],
+    '过堂': [['guò'], ['táng']],
+    '过境': [['guò'], ['jìng']],
+    '过夏': [['guò'], ['xià']],
+    '过多': [['guò'], ['duō']],
+    '过夜': [['guò'], ['yè']],
+    '过失': [['guò'], ['shī']],
+    '过头': [['guò'], ['tóu']],
+    '过奖': [['guò'], ['jiǎng']],
+    '过客': [['guò'], ['kè']],
+    '过年': [['guò'], ['nián']],
+    '过度': [['guò'], ['dù']],
+    '过当': [['guò'], ['dāng']],
+    '过往': [['guò'], ['wǎng']],
+    '过心': [['guò'], ['xīn']],
+    '过户': [['guò'], ['hù']],
+    '过房': [['guò'], ['fáng']],
+    '过手': [['guò'], ['shǒu']],
+    '过敏': [['guò'], ['mǐn']],
+    '过早': [['guò'], ['zǎo']],
+    '过时': [['guò'], ['shí']],
+    '过望': [['guò'], ['wàng']],
+    '过期': [['guò'], ['qī']],
+    '过来': [['guò'], ['lái']],
+    '过桥': [['guò'], ['qiáo']],
+    '过梁': [['guò'], ['liáng']],
+    '过氧': [['guò'], ['yǎng']],
+    '过活': [['guò'], ['huó']],
+    '过渡': [['guò'], ['dù']],
+    '过滤': [['guò'], ['lǜ']],
+    '过激': [['guò'], ['jī']],
+    '过火': [['guò'], ['huǒ']],
+    '过热': [['guò'], ['rè']],
+    '过熟': [['guò'], ['shú']],
+    '过甚': [['guò'], ['shèn']],
+    '过电': [['guò'], ['diàn']],
+    '过瘾': [['guò'], ['yǐn']],
+    '过目': [['guò'], ['mù']],
+    '过眼': [['guò'], ['yǎn']],
+    '过硬': [['guò'], ['yìng']],
+    '过磅': [['guò'], ['bàng']],
+    '过礼': [['guò'], ['lǐ']],
+    '过秤': [['guò'], ['chèng']],
+    '过程': [['guò'], ['chéng']],
+    '过筛': [['guò'], ['shāi']],
+    '过细': [['guò'], ['xì']],
+    '过继': [['guò'], ['jì']],
+    '过节': [['guò'], ['jié']],
+    '过虑': [['guò'], ['lǜ']],
+    '过誉': [['guò'], ['yù']],
+    '过访': [['guò'], ['fǎng']],
+    '过话': [['guò'], ['huà']],
+    '过谦': [['guò'], ['qiān']],
+    '过账': [['guò'], ['zhàng']],
+    '过费': [['guò'], ['fèi']],
+    '过路': [['guò'], ['lù']],
+    '过载': [['guò'], ['zài']],
+    '过道': [['guò'], ['dào']],
+    '过重': [['guò'], ['zhòng']],
+    '过量': [['guò'], ['liàng']],
+    '过错': [['guò'], ['cuò']],
+    '过长': [['guò'], ['cháng']],
+    '过门': [['guò'], ['mén']],
+    '过问': [['guò'], ['wèn']],
+    '迈上': [['mài'], ['shàng']],
+    '迎亲': [['yíng'], ['qīn']],
+    '迎合': [['yíng'], ['hé']],
+    '迎头': [['yíng'], ['tóu']],
+    '迎风': [['yíng'], ['fēng']],
+    '运价': [['yùn'], ['jià']],
+    '运单': [['yùn'], ['dān']],
+    '运思': [['yùn'], ['sī']],
+    '运数': [['yùn'], ['shù']],
+    '运行': [['yùn'], ['xíng']],
+    '运转': [['yùn'], ['zhuàn']],
+    '运载': [['yùn'], ['zài']],
+    '运量': [['yùn'], ['liàng']],
+    '近亲': [['jìn'], ['qīn']],
+    '近似': [['jìn'], ['sì']],
+    '近场': [['jìn'], ['chǎng']],
+    '近处': [['jìn'], ['chù']],
+    '近旁': [['jìn'], ['páng']],
+    '近景': [['jìn'], ['jǐng']],
+    '近期': [['jìn'], ['qī']],
+    '返还': [['fǎn'], ['huán']],
+    '还乡': [['huán'], ['xiāng']],
+    '还书': [['huán'], ['shū']],
+    '还价': [['huán'], ['jià']],
+    '还俗': [['huán'], ['sú']],
+    '还债': [['huán'], ['zhài']],
+    '还击': [['huán'], ['jī']],
+    '还原': [['huán'], ['yuán']],
+    '还口': [['huán'], ['kǒu']],
+    '还嘴': [['huán'], ['zuǐ']],
+    '还好': [['hái'], ['hǎo']],
+    '还帐': [['hái'], ['zhàng']],
+    '还席': [['huán'], ['xí']],
+    '还情': [['hái'], ['qíng']],
+    '还愿': [['huán'], ['yuàn']],
+    '还手': [['huán'], ['shǒu']],
+    '还报': [['hái'], ['bào']],
+    '还政': [['hái'], ['zhèng']],
+    '还是': [['hái'], ['shì']],
+    '还本': [['huán'], ['běn']],
+    '还款': [['hái'], ['kuǎn']],
+    '还清': [['huán'], ['qīng']],
+    '还珠': [['huán'], ['zhū']],
+    '还田': [['hái'], ['tián']],
+    '还礼': [['huán'], ['lǐ']],
+    '还童': [['huán'], ['tóng']],
+    '还给': [['huán'], ['gěi']],
+    '还账': [['huán'], ['zhàng']],
+    '还贷': [['huán'], ['dài']],
+    '还钱': [['huán'], ['qián']],
+    '还阳': [['huán'], ['yáng']],
+    '还魂': [['huán'], ['hún']],
+    '这个': [['zhè'], ['gè']],
+    '这么': [['zhè'], ['me']],
+    '这些': [['zhè'], ['xiē']],
+    '这儿': [['zhè'], ['ér']],
+    '这样': [['zhè'], ['yàng']],
+    '这次': [['zhè'], ['cì']],
+    '这点': [['zhè'], ['diǎn']],
+    '这般': [['zhè'], ['bān']],
+    '这边': [['zhè'], ['biān']],
+    '这里': [['zhè'], ['lǐ']],
+    '进剿': [['jìn'], ['jiǎo']],
+    '进化': [['jìn'], ['huà']],
+    '进发': [['jìn'], ['fā']],
+    '进场': [['jìn'], ['chǎng']],
+    '进尺': [['jìn'], ['chǐ']],
+    '进度': [['jìn'], ['dù']],
+    '进港': [['jìn'], ['gǎng']],
+    '进给': [['jìn'], ['jǐ']],
+    '进见': [['jìn'], ['jiàn']],
+    '进食': [['jìn'], ['shí']],
+    '远亲': [['yuǎn'], ['qīn']],
+    '远别': [['yuǎn'], ['bié']],
+    '远古': [['yuǎn'], ['gǔ']],
+    '远地': [['yuǎn'], ['dì']],
+    '远处': [['yuǎn'], ['chù']],
+    '远大': [['yuǎn'], ['dà']],
+    '远客': [['yuǎn'], ['kè']],
+    '远房': [['yuǎn'], ['fáng']],
+    '远方': [['yuǎn'], ['fāng']],
+    '远景': [['yuǎn'], ['jǐng']],
+    '远期': [['yuǎn'], ['qī']],
+    '远洋': [['yuǎn'], ['yáng']],
+    '远涉': [['yuǎn'], ['shè']],
+    '远离': [['yuǎn'], ['lí']],
+    '远虑': [['yuǎn'], ['lǜ']],
+    '远行': [['yuǎn'], ['xíng']],
+    '远见': [['yuǎn'], ['jiàn']],
+    '远识': [['yuǎn'], ['shí']],
+    '远路': [['yuǎn'], ['lù']],
+    '远道': [['yuǎn'], ['dào']],
+    '违令': [['wéi'], ['lìng']],
+    '违和': [['wéi'], ['hé']],
+    '违拗': [['wéi'], ['ào']],
+    '违禁': [['wéi'], ['jìn']],
+    '违约': [['wéi'], ['yuē']],
+    '违纪': [['wéi'], ['jì']],
+    '违背': [['wéi'], ['bèi']],
+    '连发': [['lián'], ['fā']],
+    '连合': [['lián'], ['hé']],
+    '连杆': [['lián'], ['gǎn']],
+    '连横': [['lián'], ['héng']],
+    '连番': [['lián'], ['fān']],
+    '连累': [['lián'], ['lěi']],
+    '连结': [['lián'], ['jié']],
+    '连翘': [['lián'], ['qiáo']],
+    '连载': [['lián'], ['zǎi']],
+    '连长': [['lián'], ['zhǎng']],
+    '迟疑': [['chí'], ['yí']],
+    '迤逦': [['yǐ'], ['lǐ']],
+    '迫临': [['pò'], ['lín']],
+    '迫于': [['pò'], ['yú']],
+    '迫令': [['pò'], ['lìng']],
+    '迫使': [['pò'], ['shǐ']],
+    '迫促': [['pò'], ['cù']],
+    '迫击': [['pǎi'], ['jī']],
+    '迫切': [['pò'], ['qiè']],
+    '迫害': [['pò'], ['hài']],
+    '迫近': [['pò'], ['jìn']],
+    '迫降': [['pò'], ['jiàng']],
+    '述语': [['shù'], ['yǔ']],
+    '述说': [['shù'], ['shuō']],
+    '迷信': [['mí'], ['xìn']],
+    '迷糊': [['mí'], ['hū']],
+    '迷蒙': [['mí'], ['méng']],
+    '迸发': [['bèng'], ['fā']],
+    '迸射': [['bèng'], ['shè']],
+    '迸溅': [['bèng'], ['jiàn']],
+    '迸裂': [['bèng'], ['liè']],
+    '迹地': [['jì'], ['dì']],
+    '追兵': [['zhuī'], ['bīng']],
+    '追击': [['zhuī'], ['jī']],
+    '追剿': [['zhuī'], ['jiǎo']],
+    '追加': [['zhuī'], ['jiā']],
+    '追叙': [['zhuī'], ['xù']],
+    '追寻': [['zhuī'], ['xún']],
+    '追尾': [['zhuī'], ['wěi']],
+    '追忆': [['zhuī'], ['yì']],
+    '追念': [['zhuī'], ['niàn']],
+    '追怀': [['zhuī'], ['huái']],
+    '追思': [['zhuī'], ['sī']],
+    '追悔': [['zhuī'], ['huǐ']],
+    '追悼': [['zhuī'], ['dào']],
+    '追想': [['zhuī'], ['xiǎng']],
+    '追捕': [['zhuī'], ['bǔ']],
+    '追捧': [['zhuī'], ['pěng']],
+    '追授': [['zhuī'], ['shòu']],
+    '追查': [['zhuī'], ['chá']],
+    '追根': [['zhuī'], ['gēn']],
+    '追歼': [['zhuī'], ['jiān']],
+    '追比': [['zhuī'], ['bǐ']],
+    '追求': [['zhuī'], ['qiú']],
+    '追溯': [['zhuī'], ['sù']],
+    '追究': [['zhuī'], ['jiū']],
+    '追索': [['zhuī'], ['suǒ']],
+    '追缉': [['zhuī'], ['jī']],
+    '追缴': [['zhuī'], ['jiǎo']],
+    '追肥': [['zhuī'], ['féi']],
+    '追补': [['zhuī'], ['bǔ']],
+    '追认': [['zhuī'], ['rèn']],
+    '追讨': [['zhuī'], ['tǎo']],
+    '追记': [['zhuī'], ['jì']],
+    '追诉': [['zhuī'], ['sù']],
+    '追赃': [['zhuī'], ['zāng']],
+    '追赠': [['zhuī'], ['zèng']],
+    '追赶': [['zhuī'], ['gǎn']],
+    '追踪': [['zhuī'], ['zōng']],
+    '追还': [['zhuī'], ['huán']],
+    '追述': [['zhuī'], ['shù']],
+    '追逐': [['zhuī'], ['zhú']],
+    '追逼': [['zhuī'], ['bī']],
+    '追问': [['zhuī'], ['wèn']],
+    '追随': [['zhuī'], ['suí']],
+    '追风': [['zhuī'], ['fēng']],
+    '追魂': [['zhuī'], ['hún']],
+    '退亲': [['tuì'], ['qīn']],
+    '退休': [['tuì'], ['xiū']],
+    '退佃': [['tuì'], ['diàn']],
+    '退化': [['tuì'], ['huà']],
+    '退场': [['tuì'], ['chǎng']],
+    '退朝': [['tuì'], ['cháo']],
+    '退票': [['tuì'], ['piào']],
+    '退缩': [['tuì'], ['suō']],
+    '退行': [['tuì'], ['xíng']],
+    '退还': [['tuì'], ['huán']],
+    '送丧': [['sòng'], ['sàng']],
+    '送亲': [['sòng'], ['qīn']],
+    '送信': [['sòng'], ['xìn']],
+    '送别': [['sòng'], ['bié']],
+    '送给': [['sòng'], ['gěi']],
+    '送行': [['sòng'], ['xíng']],
+    '送还': [['sòng'], ['hái']],
+    '适中': [['shì'], ['zhōng']],
+    '适从': [['shì'], ['cóng']],
+    '适切': [['shì'], ['qiè']],
+    '适合': [['shì'], ['hé']],
+    '适应': [['shì'], ['yìng']],
+    '适度': [['shì'], ['dù']],
+    '适当': [['shì'], ['dàng']],
+    '适量': [['shì'], ['liàng']],
+    '逃亡': [['táo'], ['wáng']],
+    '逃奔': [['táo'], ['bèn']],
+    '逃散': [['táo'], ['sàn']],
+    '逃票': [['táo'], ['piào']],
+    '逃跑': [['táo'], ['pǎo']],
+    '逃难': [['táo'], ['nàn']],
+    '逆差': [['nì'], ['chà']],
+    '逆行': [['nì'], ['xíng']],
+    '逆转': [['nì'], ['zhuǎn']],
+    '选任': [['xuǎn'], ['rèn']],
+    '选区': [['xuǎn'], ['qū']],
+    '选场': [['xuǎn'], ['chǎng']],
+    '选择': [['xuǎn'], ['zé']],
+    '选曲': [['xuǎn'], ['qǔ']],
+    '选票': [['xuǎn'], ['piào']],
+    '选种': [['xuǎn'], ['zhǒng']],
+    '选读': [['xuǎn'], ['dú']],
+    '选调': [['xuǎn'], ['diào']],
+    '透信': [['tòu'], ['xìn']],
+    '透射': [['tòu'], ['shè']],
+    '透底': [['tòu'], ['dǐ']],
+    '透汗': [['tòu'], ['hàn']],
+    '透辟': [['tòu'], ['pì']],
+    '透过': [['tòu'], ['guò']],
+    '透雨': [['tòu'], ['yǔ']],
+    '透露': [['tòu'], ['lù']],
+    '透风': [['tòu'], ['fēng']],
+    '透骨': [['tòu'], ['gǔ']],
+    '逐个': [['zhú'], ['gè']],
+    '逐句': [['zhú'], ['jù']],
+    '逐条': [['zhú'], ['tiáo']],
+    '逐渐': [['zhú'], ['jiàn']],
+    '逐臭': [['zhú'], ['chòu']],
+    '递解': [['dì'], ['jiè']],
+    '递降': [['dì'], ['jiàng']],
+    '途中': [['tú'], ['zhōng']],
+    '逗乐': [['dòu'], ['lè']],
+    '逗号': [['dòu'], ['hào']],
+    '逗哏': [['dòu'], ['gén']],
+    '逗弄': [['dòu'], ['nòng']],
+    '逗趣': [['dòu'], ['qù']],
+    '通令': [['tōng'], ['lìng']],
+    '通体': [['tōng'], ['tǐ']],
+    '通便': [['tōng'], ['biàn']],
+    '通信': [['tōng'], ['xìn']],
+    '通假': [['tōng'], ['jiǎ']],
+    '通共': [['tōng'], ['gòng']],
+    '通分': [['tōng'], ['fēn']],
+    '通化': [['tōng'], ['huà']],
+    '通同': [['tōng'], ['tóng']],
+    '通好': [['tōng'], ['hǎo']],
+    '通家': [['tōng'], ['jiā']],
+    '通宿': [['tōng'], ['sù']],
+    '通条': [['tōng'], ['tiáo']],
+    '通知': [['tōng'], ['zhī']],
+    '通票': [['tōng'], ['piào']],
+    '通称': [['tōng'], ['chēng']],
+    '通红': [['tòng'], ['hóng']],
+    '通缉': [['tōng'], ['jī']],
+    '通行': [['tōng'], ['xíng']],
+    '通观': [['tōng'], ['guān']],
+    '通解': [['tōng'], ['jiě']],
+    '通论': [['tōng'], ['lùn']],
+    '通车': [['tōng'], ['chē']],
+    '通过': [['tōng'], ['guò']],
+    '通量': [['tōng'], ['liàng']],
+    '通铺': [['tōng'], ['pù']],
+    '通风': [['tōng'], ['fēng']],
+    '逞强': [['chěng'], ['qiáng']],
+    '逞能': [['chěng'], ['néng']],
+    '速射': [['sù'], ['shè']],
+    '速度': [['sù'], ['dù']],
+    '速率': [['sù'], ['lǜ']],
+    '造价': [['zào'], ['jià']],
+    '造假': [['zào'], ['jiǎ']],
+    '造化': [['zào'], ['huà']],
+    '造句': [['zào'], ['jù']],
+    '逦迤': [['lǐ'], ['yǐ']],
+    '逮捕': [['dài'], ['bǔ']],
+    '逶迤': [['wēi'], ['yí']],
+    '逸乐': [['yì'], ['lè']],
+    '逼供': [['bī'], ['gòng']],
+    '逼和': [['bī'], ['hé']],
+    '逼肖': [['bī'], ['xiào']],
+    '逼迫': [['bī'], ['pò']],
+    '逾分': [['yú'], ['fèn']],
+    '逾期': [['yú'], ['qī']],
+    '遂行': [['suì'], ['xíng']],
+    '遇难': [['yù'], ['nàn']],
+    '遍体': [['biàn'], ['tǐ']],
+    '遍地': [['biàn'], ['dì']],
+    '遐思': [['xiá'], ['sī']],
+    '遒劲': [['qiú'], ['jìng']],
+    '道别': [['dào'], ['bié']],
+    '道号': [['dào'], ['hào']],
+    '道地': [['dào'], ['dì']],
+    '道场': [['dào'], ['chǎng']],
+    '道家': [['dào'], ['jiā']],
+    '道教': [['dào'], ['jiào']],
+    '道术': [['dào'], ['shù']],
+    '道藏': [['dào'], ['zàng']],
+    '道行': [['dào'], ['héng']],
+    '道观': [['dào'], ['guàn']],
+    '道钉': [['dào'], ['dīng']],
+    '道长': [['dào'], ['zhǎng']],
+    '遗书': [['yí'], ['shū']],
+    '遗传': [['yí'], ['chuán']],
+    '遗体': [['yí'], ['tǐ']],
+    '遗使': [['wèi'], ['shǐ']],
+    '遗劳': [['wèi'], ['láo']],
+    '遗少': [['yí'], ['shào']],
+    '遗尿': [['yí'], ['niào']],
+    '遗属': [['yí'], ['shǔ']],
+    '遗毒': [['yí'], ['dú']],
+    '遗落': [['yí'], ['luò']],
+    '遗风': [['yí'], ['fēng']],
+    '遗骨': [['yí'], ['gǔ']],
+    '遣散': [['qiǎn'], ['sàn']],
+    '遭难': [['zāo'], ['nàn']],
+    '遮挡': [['zhē'], ['dǎng']],
+    '遮盖': [['zhē'], ['gài']],
+    '遮荫': [['zhē'], ['yīn']],
+    '遮藏': [['zhē'], ['cáng']],
+    '遵从': [['zūn'], ['cóng']],
+    '遵行': [['zūn'], ['xíng']],
+    '避邪': [['bì'], ['xié']],
+    '避难': [['bì'], ['nàn']],
+    '避雨': [['bì'], ['yǔ']],
+    '邀约': [['yāo'], ['yuē']],
+    '邈远': [['miǎo'], ['yuǎn']],
+    '邋遢': [['lā'], ['tā']],
+    '邢台': [['xíng'], ['tái']],
+    '那个': [['nà'], ['gè']],
+    '那么': [['nà'], ['me']],
+    '那些': [['nèi'], ['xiē']],
+    '那儿': [['nà'], ['ér']],
+    '那末': [['nà'], ['mò']],
+    '那样': [['nà'], ['yàng']],
+    '那般': [['nà'], ['bān']],
+    '那边': [['nà'], ['biān']],
+    '那里': [['nà'], ['lǐ']],
+    '邪乎': [['xié'], ['hū']],
+    '邪心': [['xié'], ['xīn']],
+    '邪念': [['xié'], ['niàn']],
+    '邪恶': [['xié'], ['è']],
+    '邪教': [['xié'], ['jiào']],
+    '邪气': [['xié'], ['qì']],
+    '邪火': [['xié'], ['huǒ']],
+    '邪祟': [['xié'], ['suì']],
+    '邪行': [['xié'], ['xíng']],
+    '邪说': [['xié'], ['shuō']],
+    '邪财': [['xié'], ['cái']],
+    '邪路': [['xié'], ['lù']],
+    '邪道': [['xié'], ['dào']],
+    '邪门': [['xié'], ['mén']],
+    '邪魔': [['xié'], ['mó']],
+    '邮差': [['yóu'], ['chāi']],
+    '邮票': [['yóu'], ['piào']],
+    '邮车': [['yóu'], ['chē']],
+    '邻家': [['lín'], ['jiā']],
+    '邻舍': [['lín'], ['shè']],
+    '邻角': [['lín'], ['jiǎo']],
+    '郁结': [['yù'], ['jié']],
+    '郁闷': [['yù'], ['mèn']],
+    '郊区': [['jiāo'], ['qū']],
+    '郎中': [['láng'], ['zhōng']],
+    '郎君': [['láng'], ['jūn']],
+    '郎当': [['láng'], ['dāng']],
+    '郎舅': [['láng'], ['jiù']],
+    '郑重': [['zhèng'], ['zhòng']],
+    '郡王': [['jùn'], ['wáng']],
+    '部分': [['bù'], ['fèn']],
+    '部头': [['bù'], ['tóu']],
+    '部委': [['bù'], ['wěi']],
+    '部将': [['bù'], ['jiàng']],
+    '部属': [['bù'], ['shǔ']],
+    '部落': [['bù'], ['luò']],
+    '部长': [['bù'], ['zhǎng']],
+    '都会': [['dōu'], ['huì']],
+    '都城': [['dū'], ['chéng']],
+    '都尉': [['dū'], ['wèi']],
+    '都市': [['dū'], ['shì']],
+    '都督': [['dū'], ['dū']],
+    '都统': [['dū'], ['tǒng']],
+    '鄙夫': [['bǐ'], ['fū']],
+    '鄙称': [['bǐ'], ['chēng']],
+    '鄙薄': [['bǐ'], ['bó']],
+    '鄙见': [['bǐ'], ['jiàn']],
+    '酊剂': [['dīng'], ['jì']],
+    '酋长': [['qiú'], ['zhǎng']],
+    '酌处': [['zhuó'], ['chǔ']],
+    '酌量': [['zhuó'], ['liàng']],
+    '配乐': [['pèi'], ['yuè']],
+    '配发': [['pèi'], ['fā']],
+    '配合': [['pèi'], ['hé']],
+    '配属': [['pèi'], ['shǔ']],
+    '配戏': [['pèi'], ['xì']],
+    '配曲': [['pèi'], ['qǔ']],
+    '配种': [['pèi'], ['zhǒng']],
+    '配称': [['pèi'], ['chèn']],
+    '配给': [['pèi'], ['jǐ']],
+    '配角': [['pèi'], ['jué']],
+    '配调': [['pèi'], ['diào']],
+    '配载': [['pèi'], ['zǎi']],
+    '配重': [['pèi'], ['zhòng']],
+    '酒令': [['jiǔ'], ['lìng']],
+    '酒会': [['jiǔ'], ['huì']],
+    '酒兴': [['jiǔ'], ['xìng']],
+    '酒刺': [['jiǔ'], ['cì']],
+    '酒劲': [['jiǔ'], ['jìn']],
+    '酒吧': [['jiǔ'], ['bā']],
+    '酒场': [['jiǔ'], ['chǎng']],
+    '酒坊': [['jiǔ'], ['fāng']],
+    '酒家': [['jiǔ'], ['jiā']],
+    '酒晕': [['jiǔ'], ['yùn']],
+    '酒曲': [['jiǔ'], ['qū']],
+    '酒浆': [['jiǔ'], ['jiāng']],
+    '酒涡': [['jiǔ'], ['wō']],
+    '酒量': [['jiǔ'], ['liàng']],
+    '酒铛': [['jiǔ'], ['chēng']],
+    '酒铺': [['jiǔ'], ['pù']],
+    '酒食': [['jiǔ'], ['shí']],
+    '酩酊': [['mǐng'], ['dǐng']],
+    '酬和': [['chóu'], ['hè']],
+    '酬应': [['chóu'], ['yìng']],
+    '酬答': [['chóu'], ['dá']],
+    '酷似': [['kù'], ['sì']],
+    '酷肖': [['kù'], ['xiāo']],
+    '酸雨': [['suān'], ['yǔ']],
+    '醇化': [['chún'], ['huà']],
+    '醇和': [['chún'], ['hé']],
+    '醇朴': [['chún'], ['piáo']],
+    '醇正': [['chún'], ['zhèng']],
+    '醍醐': [['tí'], ['hú']],
+    '醒觉': [['xǐng'], ['jué']],
+    '醒豁': [['xǐng'], ['huò']],
+    '采买': [['cǎi'], ['mǎi']],
+    '采伐': [['cǎi'], ['fá']],
+    '采光': [['cǎi'], ['guāng']],
+    '采写': [['cǎi'], ['xiě']],
+    '采制': [['cǎi'], ['zhì']],
+    '采办': [['cǎi'], ['bàn']],
+    '采区': [['cǎi'], ['qū']],
+    '采取': [['cǎi'], ['qǔ']],
+    '采地': [['cài'], ['dì']],
+    '采录': [['cǎi'], ['lù']],
+    '采择': [['cǎi'], ['zé']],
+    '采掘': [['cǎi'], ['jué']],
+    '采摘': [['cǎi'], ['zhāi']],
+    '采撷': [['cǎi'], ['xié']],
+    '采收': [['cǎi'], ['shōu']],
+    '采暖': [['cǎi'], ['nuǎn']],
+    '采样': [['cǎi'], ['yàng']],
+    '采桑': [['cǎi'], ['sāng']],
+    '采油': [['cǎi'], ['yóu']],
+    '采煤': [['cǎi'], ['méi']],
+    '采用': [['cǎi'], ['yòng']],
+    '采石': [['cǎi'], ['shí']],
+    '采矿': [['cǎi'], ['kuàng']],
+    '采种': [['cǎi'], ['zhǒng']],
+    '采纳': [['cǎi'], ['nà']],
+    '采花': [['cǎi'], ['huā']],
+    '采茶': [['cǎi'], ['chá']],
+    '采药': [['cǎi'], ['yào']],
+    '采访': [['cǎi'], ['fǎng']],
+    '采购': [['cǎi'], ['gòu']],
+    '采运': [['cǎi'], ['yùn']],
+    '采邑': [['cài'], ['yì']],
+    '采采': [['cǎi'], ['cǎi']],
+    '采集': [['cǎi'], ['jí']],
+    '采风': [['cǎi'], ['fēng']],
+    '采食': [['cǎi'], ['shí']],
+    '釉子': [['yòu'], ['zi']],
+    '释卷': [['shì'], ['juàn']],
+    '释教': [['shì'], ['jiào']],
+    '释疑': [['shì'], ['yí']],
+    '里头': [['lǐ'], ['tou']],
+    '里子': [['lǐ'], ['zi']],
+    '里巷': [['lǐ'], ['xiàng']],
+    '里弄': [['lǐ'], ['lòng']],
+    '里拉': [['lǐ'], ['lā']],
+    '里长': [['lǐ'], ['zhǎng']],
+    '里间': [['lǐ'], ['jiān']],
+    '重九': [['chóng'], ['jiǔ']],
+    '重价': [['zhòng'], ['jià']],
+    '重任': [['zhòng'], ['rèn']],
+    '重伤': [['zhòng'], ['shāng']],
+    '重修': [['chóng'], ['xiū']],
+    '重光': [['chóng'], ['guāng']],
+    '重兵': [['zhòng'], ['bīng']],
+    '重典': [['zhòng'], ['diǎn']],
+    '重出': [['chóng'], ['chū']],
+    '重创': [['zhòng'], ['chuāng']],
+    '重利': [['zhòng'], ['lì']],
+    '重力': [['zhòng'], ['lì']],
+    '重办': [['zhòng'], ['bàn']],
+    '重印': [['chóng'], ['yìn']],
+    '重压': [['zhòng'], ['yā']],
+    '重叠': [['chóng'], ['dié']],
+    '重合': [['chóng'], ['hé']],
+    '重名': [['zhòng'], ['míng']],
+    '重听': [['zhòng'], ['tīng']],
+    '重启': [['chóng'], ['qǐ']],
+    '重唱': [['chóng'], ['chàng']],
+    '重围': [['chóng'], ['wéi']],
+    '重圆': [['chóng'], ['yuán']],
+    '重地': [['zhòng'], ['dì']],
+    '重型': [['zhòng'], ['xíng']],
+    '重复': [['chóng'], ['fù']],
+    '重大': [['zhòng'], ['dà']],
+    '重头': [['chóng'], ['tóu']],
+    '重奏': [['chóng'], ['zòu']],
+    '重婚': [['chóng'], ['hūn']],
+    '重子': [['zhòng'], ['zǐ']],
+    '重孙': [['chóng'], ['sūn']],
+    '重孝': [['zhòng'], ['xiào']],
+    '重审': [['chóng'], ['shěn']],
+    '重工': [['zhòng'], ['gōng']],
+    '重庆': [['chóng'], ['qìng']],
+    '重建': [['chóng'], ['jiàn']],
+    '重弹': [['chóng'], ['tán']],
+    '重彩': [['zhòng'], ['cǎi']],
+    '重影': [['chóng'], ['yǐng']],
+    '重心': [['zhòng'], ['xīn']],
+    '重惩': [['zhòng'], ['chéng']],
+    '重托': [['zhòng'], ['tuō']],
+    '重担': [['zhòng'], ['dàn']],
+    '重拍': [['chóng'], ['pāi']],
+    '重提': [['chóng'], ['tí']],
+    '重播': [['chóng'], ['bō']],
+    '重数': [['chóng'], ['shù']],
+    '重新': [['chóng'], ['xīn']],
+    '重映': [['chóng'], ['yìng']],
+    '重望': [['zhòng'], ['wàng']],
+    '重楼': [['zhòng'], ['lóu']],
+    '重檐': [['zhòng'], ['yán']],
+    '重氢': [['zhòng'], ['qīng']],
+    '重水': [['zhòng'], ['shuǐ']],
+    '重沓': [['chóng'], ['tà']],
+    '重油': [['zhòng'], ['yóu']],
+    '重洋': [['chóng'], ['yáng']],
+    '重活': [['zhòng'], ['huó']],
+    '重温': [['chóng'], ['wēn']],
+    '重演': [['chóng'], ['yǎn']],
+    '重炮': [['zhòng'], ['pào']],
+    '重点': [['zhòng'], ['diǎn']],
+    '重版': [['chóng'], ['bǎn']],
+    '重物': [['zhòng'], ['wù']],
+    '重犯': [['chóng'], ['fàn']],
+    '重现': [['chóng'], ['xiàn']],
+    '重生': [['zhòng'], ['shēng']],
+    '重申': [['chóng'], ['shēn']],
+    '重税': [['zhòng'], ['shuì']],
+    '重组': [['chóng'], ['zǔ']],
+    '重罚': [['zhòng'], ['fá']],
+    '重罪': [['zhòng'], ['zuì']],
+    '重聚': [['chóng'], ['jù']],
+    '重臂': [['zhòng'], ['bì']],
+    '重臣': [['zhòng'], ['chén']],
+    '重茬': [['zhòng'], ['chá']],
+    '重荷': [['zhòng'], ['hè']],
+    '重获': [['chóng'], ['huò']],
+    '重行': [['chóng'], ['xíng']],
+    '重装': [['zhòng'], ['zhuāng']],
+    '重要': [['zhòng'], ['yào']],
+    '重视': [['zhòng'], ['shì']],
+    '重言': [['zhòng'], ['yán']],
+    '重设': [['zhòng'], ['shè']],
+    '重译': [['chóng'], ['yì']],
+    '重话': [['zhòng'], ['huà']],
+    '重读': [['zhòng'], ['dú']],
+    '重负': [['zhòng'], ['fù']],
+    '重责': [['zhòng'], ['zé']],
+    '重赏': [['zhòng'], ['shǎng']],
+    '重载': [['zhòng'], ['zài']],
+    '重返': [['chóng'], ['fǎn']],
+    '重迭': [['zhòng'], ['dié']],
+    '重述': [['chóng'], ['shù']],
+    '重选': [['zhòng'], ['xuǎn']],
+    '重逢': [['chóng'], ['féng']],
+    '重重': [['chóng'], ['chóng']],
+    '重量': [['zhòng'], ['liàng']],
+    '重金': [['zhòng'], ['jīn']],
+    '重镇': [['zhòng'], ['zhèn']],
+    '重阳': [['chóng'], ['yáng']],
+    '重霄': [['chóng'], ['xiāo']],
+    '重音': [['zhòng'], ['yīn']],
+    '野乘': [['yě'], ['shèng']],
+    '量具': [['liáng'], ['jù']],
+    '量刑': [['liàng'], ['xíng']],
+    '量力': [['liàng'], ['lì']],
+    '量变': [['liàng'], ['biàn']],
+    '量器': [['liáng'], ['qì']],
+    '量子': [['liàng'], ['zǐ']],
+    '量度': [['liáng'], ['dù']],
+    '量杯': [['liáng'], ['bēi']],
+    '量瓶': [['liáng'], ['píng']],
+    '量程': [['liáng'], ['chéng']],
+    '量筒': [['liáng'], ['tǒng']],
+    '量纲': [['liàng'], ['gāng']],
+    '量能': [['liàng'], ['néng']],
+    '量规': [['liáng'], ['guī']],
+    '量计': [['liáng'], ['jì']],
+    '量词': [['liàng'], ['cí']],
+    '金冠': [['jīn'], ['guān']],
+    '金华': [['jīn'], ['huá']],
+    '金发': [['jīn'], ['fà']],
+    '金叶': [['jīn'], ['yè']],
+    '金属': [['jīn'], ['shǔ']],
+    '金弹': [['jīn'], ['dàn']],
+    '金条': [['jīn'], ['tiáo']],
+    '金枝': [['jīn'], ['zhī']],
+    '金榜': [['jīn'], ['bǎng']],
+    '金正': [['jīn'], ['zhèng']],
+    '金汤': [['jīn'], ['tāng']],
+    '金沙': [['jīn'], ['shā']],
+    '金相': [['jīn'], ['xiàng']],
+    '金石': [['jīn'], ['shí']],
+    '金蛇': [['jīn'], ['shé']],
+    '金阙': [['jīn'], ['què']],
+    '金龟': [['jīn'], ['guī']],
+    '鉴别': [['jiàn'], ['bié']],
+    '鉴识': [['jiàn'], ['shí']],
+    '錾子': [['zàn'], ['zi']],
+    '针刺': [['zhēn'], ['cì']],
+    '针叶': [['zhēn'], ['yè']],
+    '针头': [['zhēn'], ['tóu']],
+    '钉住': [['dìng'], ['zhù']],
+    '钉头': [['dīng'], ['tóu']],
+    '钉子': [['dīng'], ['zi']],
+    '钉帽': [['dīng'], ['mào']],
+    '钉牢': [['dīng'], ['láo']],
+    '钉耙': [['dīng'], ['pá']],
+    '钉螺': [['dīng'], ['luó']],
+    '钉锤': [['dīng'], ['chuí']],
+    '钉鞋': [['dīng'], ['xié']],
+    '钙化': [['gài'], ['huà']],
+    '钝化': [['dùn'], ['huà']],
+    '钝角': [['dùn'], ['jiǎo']],
+    '钞票': [['chāo'], ['piào']],
+    '钟头': [['zhōng'], ['tóu']],
+    '钢丝': [['gāng'], ['sī']],
+    '钢刀': [['gāng'], ['dāo']],
+    '钢包': [['gāng'], ['bāo']],
+    '钢印': [['gāng'], ['yìn']],
+    '钢坯': [['gāng'], ['pī']],
+    '钢尺': [['gāng'], ['chǐ']],
+    '钢材': [['gāng'], ['cái']],
+    '钢条': [['gāng'], ['tiáo']],
+    '钢板': [['gāng'], ['bǎn']],
+    '钢枪': [['gāng'], ['qiāng']],
+    '钢水': [['gāng'], ['shuǐ']],
+    '钢渣': [['gāng'], ['zhā']],
+    '钢珠': [['gāng'], ['zhū']],
+    '钢琴': [['gāng'], ['qín']],
+    '钢瓶': [['gāng'], ['píng']],
+    '钢盔': [['gāng'], ['kuī']],
+    '钢砂': [['gāng'], ['shā']],
+    '钢硬': [['gāng'], ['yìng']],
+    '钢种': [['gāng'], ['zhǒng']],
+    '钢笔': [['gāng'], ['bǐ']],
+    '钢筋': [['gāng'], ['jīn']],
+    '钢管': [['gāng'], ['guǎn']],
+    '钢精': [['gāng'], ['jīng']],
+    '钢索': [['gāng'], ['suǒ']],
+    '钢缆': [['gāng'], ['lǎn']],
+    '钢花': [['gāng'], ['huā']],
+    '钢轨': [['gāng'], ['guǐ']],
+    '钢针': [['gāng'], ['zhēn']],
+    '钢钎': [['gāng'], ['qiān']],
+    '钢铁': [['gāng'], ['tiě']],
+    '钢锭': [['gāng'], ['dìng']],
+    '钢锯': [['gāng'], ['jù']],
+    '钢鞭': [['gāng'], ['biān']],
+    '钢骨': [['gāng'], ['gǔ']],
+    '钥匙': [['yào'], ['shi']],
+    '钦仰': [['qīn'], ['yǎng']],
+    '钦差': [['qīn'], ['chāi']],
+    '钨钢': [['wū'], ['gāng']],
+    '钩子': [['gōu'], ['zi']],
+    '钱夹': [['qián'], ['jiā']],
+    '钱柜': [['qián'], ['guì']],
+    '钱票': [['qián'], ['piào']],
+    '钻井': [['zuàn'], ['jǐng']],
+    '钻具': [['zuàn'], ['jù']],
+    '钻劲': [['zuān'], ['jìn']],
+    '钻台': [['zuàn'], ['tái']],
+    '钻塔': [['zuàn'], ['tǎ']],
+    '钻头': [['zuàn'], ['tóu']],
+    '钻孔': [['zuān'], ['kǒng']],
+    '钻床': [['zuàn'], ['chuáng']],
+    '钻心': [['zuān'], ['xīn']],
+    '钻戒': [['zuàn'], ['jiè']],
+    '钻探': [['zuān'], ['tàn']],
+    '钻机': [['zuàn'], ['jī']],
+    '钻杆': [['zuàn'], ['gǎn']],
+    '钻洞': [['zuān'], ['dòng']],
+    '钻石': [['zuàn'], ['shí']],
+    '钻研': [['zuān'], ['yán']],
+    '钻空': [['zuān'], ['kòng']],
+    '钻营': [['zuān'], ['yíng']],
+    '钻谋': [['zuān'], ['móu']],
+    '铁厂': [['tiě'], ['chǎng']],
+    '铁岭': [['tiě'], ['lǐng']],
+    '铁打': [['tiě'], ['dǎ']],
+    '铁杆': [['tiě'], ['gǎn']],
+    '铁柜': [['tiě'], ['guì']],
+    '铁椎': [['tiě'], ['chuí']],
+    '铁片': [['tiě'], ['piàn']],
+    '铁石': [['tiě'], ['shí']],
+    '铁笼': [['tiě'], ['lóng']],
+    '铁耙': [['tiě'], ['pá']],
+    '铁臂': [['tiě'], ['bì']],
+    '铁血': [['tiě'], ['xuè']],
+    '铁钉': [['tiě'], ['dīng']],
+    '铁骨': [['tiě'], ['gǔ']],
+    '铃铛': [['líng'], ['dāng']],
+    '铅丝': [['qiān'], ['sī']],
+    '铅丹': [['qiān'], ['dān']],
+    '铅华': [['qiān'], ['huá']],
+    '铅印': [['qiān'], ['yìn']],
+    '铅字': [['qiān'], ['zì']],
+    '铅山': [['yán'], ['shān']],
+    '铅弹': [['qiān'], ['dàn']],
+    '铅条': [['qiān'], ['tiáo']],
+    '铅板': [['qiān'], ['bǎn']],
+    '铅版': [['qiān'], ['bǎn']],
+    '铅球': [['qiān'], ['qiú']],
+    '铅直': [['qiān'], ['zhí']],
+    '铅笔': [['qiān'], ['bǐ']],
+    '铅粉': [['qiān'], ['fěn']],
+    '铅铁': [['qiān'], ['tiě']],
+    '铆钉': [['mǎo'], ['dīng']],
+    '铜模': [['tóng'], ['mú']],
+    '铜绿': [['tóng'], ['lǜ']],
+    '铜臭': [['tóng'], ['xiù']],
+    '铲子': [['chǎn'], ['zi']],
+    '银子': [['yín'], ['zi']],
+    '银行': [['yín'], ['háng']],
+    '银镪': [['yín'], ['qiǎng']],
+    '铺位': [['pù'], ['wèi']],
+    '铺保': [['pù'], ['bǎo']],
+    '铺叙': [['pū'], ['xù']],
+    '铺垫': [['pū'], ['diàn']],
+    '铺子': [['pù'], ['zǐ']],
+    '铺展': [['pū'], ['zhǎn']],
+    '铺平': [['pū'], ['píng']],
+    '铺床': [['pū'], ['chuáng']],
+    '铺底': [['pù'], ['dǐ']],
+    '铺张': [['pū'], ['zhāng']],
+    '铺户': [['pù'], ['hù']],
+    '铺排': [['pū'], ['pái']],
+    '铺板': [['pù'], ['bǎn']],
+    '铺盖': [['pū'], ['gài']],
+    '铺砌': [['pū'], ['qì']],
+    '铺衬': [['pū'], ['chèn']],
+    '铺设': [['pū'], ['shè']],
+    '铺路': [['pū'], ['lù']],
+    '铺轨': [['pū'], ['guǐ']],
+    '铺铺': [['pù'], ['pù']],
+    '铺陈': [['pū'], ['chén']],
+    '铺面': [['pū'], ['miàn']],
+    '链子': [['liàn'], ['zi']],
+    '链结': [['liàn'], ['jié']],
+    '销价': [['xiāo'], ['jià']],
+    '销假': [['xiāo'], ['jià']],
+    '销号': [['xiāo'], ['hào']],
+    '销差': [['xiāo'], ['chà']],
+    '销行': [['xiāo'], ['xíng']],
+    '销量': [['xiāo'], ['liàng']],
+    '销钉': [['xiāo'], ['dīng']],
+    '锁上': [['suǒ'], ['shàng']],
+    '锁匙': [['suǒ'], ['chí']],
+    '锁头': [['suǒ'], ['tou']],
+    '锁钥': [['suǒ'], ['yuè']],
+    '锁骨': [['suǒ'], ['gǔ']],
+    '锄地': [['chú'], ['dì']],
+    '锄头': [['chú'], ['tou']],
+    '锅台': [['guō'], ['tái']],
+    '锅子': [['guō'], ['zi']],
+    '锅底': [['guō'], ['dǐ']],
+    '锈菌': [['xiù'], ['jūn']],
+    '锐角': [['ruì'], ['jiǎo']],
+    '锒铛': [['láng'], ['dāng']],
+    '错处': [['cuò'], ['chǔ']],
+    '错综': [['cuò'], ['zōng']],
+    '错落': [['cuò'], ['luò']],
+    '错觉': [['cuò'], ['jué']],
+    '错车': [['cuò'], ['chē']],
+    '错过': [['cuò'], ['guò']],
+    '锚地': [['máo'], ['dì']],
+    '锚泊': [['máo'], ['bó']],
+    '锡石': [['xī'], ['shí']],
+    '锤子': [['chuí'], ['zi']],
+    '锤打': [['chuí'], ['dǎ']],
+    '锤骨': [['chuí'], ['gǔ']],
+    '锥体': [['zhuī'], ['tǐ']],
+    '锥度': [['zhuī'], ['dù']],
+    '锦囊': [['jǐn'], ['náng']],
+    '锦屏': [['jǐn'], ['píng']],
+    '锦纶': [['jǐn'], ['lún']],
+    '锭子': [['dìng'], ['zi']],
+    '锯条': [['jù'], ['tiáo']],
+    '锰钢': [['měng'], ['gāng']],
+    '锻压': [['duàn'], ['yā']],
+    '锻打': [['duàn'], ['dǎ']],
+    '锻模': [['duàn'], ['mú']],
+    '镂空': [['lòu'], ['kōng']],
+    '镇压': [['zhèn'], ['yā']],
+    '镇尺': [['zhèn'], ['chǐ']],
+    '镇服': [['zhèn'], ['fú']],
+    '镇长': [['zhèn'], ['zhǎng']],
+    '镊子': [['niè'], ['zi']],
+    '镍钢': [['niè'], ['gāng']],
+    '镐京': [['hào'], ['jīng']],
+    '镐头': [['gǎo'], ['tóu']],
+    '镖头': [['biāo'], ['tóu']],
+    '镚子': [['bèng'], ['zi']],
+    '镜台': [['jìng'], ['tái']],
+    '镜头': [['jìng'], ['tóu']],
+    '镜子': [['jìng'], ['zi']],
+    '镜片': [['jìng'], ['piàn']],
+    '镢头': [['jué'], ['tóu']],
+    '镫子': [['dèng'], ['zi']],
+    '镯子': [['zhuó'], ['zi']],
+    '长上': [['zhǎng'], ['shàng']],
+    '长久': [['cháng'], ['jiǔ']],
+    '长乐': [['cháng'], ['lè']],
+    '长于': [['cháng'], ['yú']],
+    '长亭': [['cháng'], ['tíng']],
+    '长亲': [['zhǎng'], ['qīn']],
+    '长假': [['cháng'], ['jià']],
+    '长兄': [['zhǎng'], ['xiōng']],
+    '长兴': [['cháng'], ['xīng']],
+    '长出': [['zhǎng'], ['chū']],
+    '长剑': [['cháng'], ['jiàn']],
+    '长势': [['zhǎng'], ['shì']],
+    '长卷': [['cháng'], ['juàn']],
+    '长发': [['cháng'], ['fà']],
+    '长句': [['cháng'], ['jù']],
+    '长号': [['cháng'], ['hào']],
+    '长叹': [['cháng'], ['tàn']],
+    '长吏': [['zhǎng'], ['lì']],
+    '长吟': [['cháng'], ['yín']],
+    '长命': [['cháng'], ['mìng']],
+    '长啸': [['cháng'], ['xiào']],
+    '长圆': [['cháng'], ['yuán']],
+    '长坂': [['cháng'], ['bǎn']],
+    '长城': [['cháng'], ['chéng']],
+    '长处': [['cháng'], ['chù']],
+    '长夏': [['cháng'], ['xià']],
+    '长夜': [['cháng'], ['yè']],
+    '长大': [['zhǎng'], ['dà']],
+    '长天': [['cháng'], ['tiān']],
+    '长女': [['zhǎng'], ['nǚ']],
+    '长子': [['zhǎng'], ['zǐ']],
+    '长存': [['cháng'], ['cún']],
+    '长孙': [['zhǎng'], ['sūn']],
+    '长安': [['cháng'], ['ān']],
+    '长官': [['zhǎng'], ['guān']],
+    '长寿': [['cháng'], ['shòu']],
+    '长局': [['cháng'], ['jú']],
+    '长崎': [['cháng'], ['qí']],
+    '长川': [['cháng'], ['chuān']],
+    '长工': [['cháng'], ['gōng']],
+    '长年': [['cháng'], ['nián']],
+    '长幼': [['zhǎng'], ['yòu']],
+    '长庚': [['cháng'], ['gēng']],
+    '长度': [['cháng'], ['dù']],
+    '长廊': [['cháng'], ['láng']],
+    '长征': [['cháng'], ['zhēng']],
+    '长性': [['cháng'], ['xìng']],
+    '长成': [['zhǎng'], ['chéng']],
+    '长房': [['zhǎng'], ['fáng']],
+    '长拳': [['cháng'], ['quán']],
+    '长揖': [['cháng'], ['yī']],
+    '长斋': [['cháng'], ['zhāi']],
+    '长春': [['cháng'], ['chūn']],
+    '长期': [['cháng'], ['qī']],
+    '长机': [['cháng'], ['jī']],
+    '长条': [['cháng'], ['tiáo']],
+    '长枪': [['cháng'], ['qiāng']],
+    '长毛': [['cháng'], ['máo']],
+    '长汀': [['cháng'], ['tīng']],
+    '长江': [['cháng'], ['jiāng']],
+    '长沙': [['cháng'], ['shā']],
+    '长河': [['cháng'], ['hé']],
+    '长法': [['cháng'], ['fǎ']],
+    '长波': [['cháng'], ['bō']],
+    '长活': [['cháng'], ['huó']],
+    '长流': [['cháng'], ['liú']],
+    '长牙': [['zhǎng'], ['yá']],
+    '长物': [['cháng'], ['wù']],
+    '长生': [['cháng'], ['shēng']],
+    '长男': [['zhǎng'], ['nán']],
+    '长相': [['zhǎng'], ['xiàng']],
+    '长眠': [['cháng'], ['mián']],
+    '长矛': [['cháng'], ['máo']],
+    '长短': [['cháng'], ['duǎn']],
+    '长石': [['cháng'], ['shí']],
+    '长空': [['cháng'], ['kōng']],
+    '长笛': [['cháng'], ['dí']],
+    '长策': [['cháng'], ['cè']],
+    '长篇': [['cháng'], ['piān']],
+    '长线': [['cháng'], ['xiàn']],
+    '长统': [['cháng'], ['tǒng']],
+    '长编': [['cháng'], ['biān']],
+    '长缨': [['cháng'], ['yīng']],
+    '长老': [['zhǎng'], ['lǎo']],
+    '长者': [['zhǎng'], ['zhě']],
+    '长膘': [['zhǎng'], ['biāo']],
+    '长舌': [['cháng'], ['shé']],
+    '长虫': [['cháng'], ['chóng']],
+    '长虹': [['cháng'], ['hóng']],
+    '长街': [['cháng'], ['jiē']],
+    '长衣': [['cháng'], ['yī']],
+    '长衫': [['cháng'], ['shān']],
+    '长袍': [['cháng'], ['páo']],
+    '长袖': [['cháng'], ['xiù']],
+    '长袜': [['cháng'], ['wà']],
+    '长裤': [['cháng'], ['kù']],
+    '长褂': [['cháng'], ['guà']],
+    '长诗': [['cháng'], ['shī']],
+    '长话': [['cháng'], ['huà']],
+    '长调': [['cháng'], ['diào']],
+    '长谈': [['cháng'], ['tán']],
+    '长足': [['cháng'], ['zú']],
+    '长跑': [['cháng'], ['pǎo']],
+    '长跪': [['cháng'], ['guì']],
+    '长辈': [['zhǎng'], ['bèi']],
+    '长辞': [['cháng'], ['cí']],
+    '长进': [['zhǎng'], ['jìn']],
+    '长远': [['cháng'], ['yuǎn']],
+    '长途': [['cháng'], ['tú']],
+    '长逝': [['cháng'], ['shì']],
+    '长长': [['cháng'], ['cháng']],
+    '长门': [['cháng'], ['mén']],
+    '长队': [['cháng'], ['duì']],
+    '长随': [['cháng'], ['suí']],
+    '长青': [['cháng'], ['qīng']],
+    '长音': [['cháng'], ['yīn']],
+    '长驱': [['cháng'], ['qū']],
+    '长鸣': [['cháng'], ['míng']],
+    '长鼓': [['cháng'], ['gǔ']],
+    '长龙': [['cháng'], ['lóng']],
+    '门丁': [['mén'], ['dīng']],
+    '门上': [['mén'], ['shàng']],
+    '门号': [['mén'], ['hào']],
+    '门将': [['mén'], ['jiāng']],
+    '门扇': [['mén'], ['shàn']],
+    '门把': [['mén'], ['bà']],
+    '门斗': [['mén'], ['dǒu']],
+    '门槛': [['mén'], ['kǎn']],
+    '门票': [['mén'], ['piào']],
+    '门禁': [['mén'], ['jìn']],
+    '门缝': [['mén'], ['fèng']],
+    '门钉': [['mén'], ['dīng']],
+    '闪射': [['shǎn'], ['shè']],
+    '闪过': [['shǎn'], ['guò']],
+    '闭会': [['bì'], ['huì']],
+    '闭卷': [['bì'], ['juàn']],
+    '闭合': [['bì'], ['hé']],
+    '闭塞': [['bì'], ['sè']],
+    '问卜': [['wèn'], ['bǔ']],
+    '问号': [['wèn'], ['hào']],
+    '问好': [['wèn'], ['hǎo']],
+    '问答': [['wèn'], ['dá']],
+    '问难': [['wèn'], ['nàn']],
+    '闯劲': [['chuǎng'], ['jìn']],
+    '闯将': [['chuǎng'], ['jiàng']],
+    '闯王': [['chuǎng'], ['wáng']],
+    '闲散': [['xián'], ['sǎn']],
+    '闲空': [['xián'], ['kòng']],
+    '间作': [['jiàn'], ['zuò']],
+    '间奏': [['jiàn'], ['zòu']],
+    '间或': [['jiàn'], ['huò']],
+    '间接': [['jiàn'], ['jiē']],
+    '间断': [['jiàn'], ['duàn']],
+    '间日': [['jiàn'], ['rì']],
+    '间架': [['jiān'], ['jià']],
+    '间歇': [['jiàn'], ['xiē']],
+    '间种': [['jiàn'], ['zhòng']],
+    '间色': [['jiàn'], ['sè']],
+    '间苗': [['jiàn'], ['miáo']],
+    '间谍': [['jiàn'], ['dié']],
+    '间距': [['jiān'], ['jù']],
+    '间道': [['jiàn'], ['dào']],
+    '间量': [['jiān'], ['liàng']],
+    '间隔': [['jiàn'], ['gé']],
+    '间隙': [['jiàn'], ['xì']],
+    '闷倦': [['mèn'], ['juàn']],
+    '闷声': [['mēn'], ['shēng']],
+    '闷头': [['mèn'], ['tóu']],
+    '闷棍': [['mèn'], ['gùn']],
+    '闷气': [['mēn'], ['qì']],
+    '闷热': [['mēn'], ['rè']],
+    '闷酒': [['mèn'], ['jiǔ']],
+    '闷锄': [['mēn'], ['chú']],
+    '闷雷': [['mēn'], ['léi']],
+    '闸把': [['zhá'], ['bǎ']],
+    '闹哄': [['nào'], ['hōng']],
+    '闹嚷': [['nào'], ['rāng']],
+    '闹场': [['nào'], ['chǎng']],
+    '闹戏': [['nào'], ['xì']],
+    '闺女': [['guī'], ['nǚ']],
+    '闻知': [['wén'], ['zhī']],
+    '闻见': [['wén'], ['jiàn']],
+    '闽侯': [['mǐn'], ['hòu']],
+    '闾巷': [['lǘ'], ['xiàng']],
+    '阁员': [['gé'], ['yuán']],
+    '阅卷': [['yuè'], ['juàn']],
+    '阅看': [['yuè'], ['kàn']],
+    '阅读': [['yuè'], ['dú']],
+    '阑尾': [['lán'], ['wěi']],
+    '阑干': [['lán'], ['gān']],
+    '阔别': [['kuò'], ['bié']],
+    '阔少': [['kuò'], ['shào']],
+    '阔绰': [['kuò'], ['chuò']],
+    '阖家': [['hé'], ['jiā']],
+    '阙下': [['què'], ['xià']],
+    '阙如': [['quē'], ['rú']],
+    '阙文': [['quē'], ['wén']],
+    '阙漏': [['quē'], ['lòu']],
+    '阙疑': [['quē'], ['yí']],
+    '队副': [['duì'], ['fù']],
+    '队员': [['duì'], ['yuán']],
+    '队长': [['duì'], ['zhǎng']],
+    '防区': [['fáng'], ['qū']],
+    '防地': [['fáng'], ['dì']],
+    '防弹': [['fáng'], ['dàn']],
+    '防暴': [['fáng'], ['bào']],
+    '防毒': [['fáng'], ['dú']],
+    '防空': [['fáng'], ['kōng']],
+    '阳台': [['yáng'], ['tái']],
+    '阳间': [['yáng'], ['jiān']],
+    '阴凉': [['yīn'], ['liáng']],
+    '阴囊': [['yīn'], ['náng']],
+    '阴干': [['yīn'], ['gān']],
+    '阴核': [['yīn'], ['hé']],
+    '阴模': [['yīn'], ['mó']],
+    '阴毒': [['yīn'], ['dú']],
+    '阴间': [['yīn'], ['jiān']],
+    '阴雨': [['yīn'], ['yǔ']],
+    '阵亡': [['zhèn'], ['wáng']],
+    '阵发': [['zhèn'], ['fā']],
+    '阵地': [['zhèn'], ['dì']],
+    '阵子': [['zhèn'], ['zi']],
+    '阵雨': [['zhèn'], ['yǔ']],
+    '阶地': [['jiē'], ['dì']],
+    '阻塞': [['zǔ'], ['sè']],
+    '阻挡': [['zǔ'], ['dǎng']],
+    '阻难': [['zǔ'], ['nàn']],
+    '阿公': [['ā'], ['gōng']],
+    '阿呆': [['ā'], ['dāi']],
+    '阿哥': [['ā'], ['gē']],
+    '阿妈': [['ā'], ['mā']],
+    '阿妹': [['ā'], ['mèi']],
+    '阿姐': [['ā'], ['jiě']],
+    '阿姨': [['ā'], ['yí']],
+    '阿婆': [['ā'], ['pó']],
+    '阿弟': [['ā'], ['dì']],
+    '阿拉': [['ā'], ['lā']],
+    '阿斗': [['ā'], ['dǒu']],
+    '阿曼': [['ā'], ['màn']],
+    '阿爸': [['ā'], ['bà']],
+    '阿爹': [['ā'], ['diē']],
+    '阿片': [['ā'], ['piàn']],
+    '阿胶': [['ē'], ['jiāo']],
+    '阿蒙': [['ā'], ['méng']],
+    '阿訇': [['ā'], ['hōng']],
+    '阿谀': [['ē'], ['yú']],
+    '阿门': [['ā'], ['mén']],
+    '阿附': [['ē'], ['fù']],
+    '阿飞': [['ā'], ['fēi']],
+    '阿鼻': [['ā'], ['bí']],
+    '陀螺': [['tuó'], ['luó']],
+    '陂塘': [['bēi'], ['táng']],
+    '陂池': [['bēi'], ['chí']],
+    '陂陀': [['pō'], ['tuó']],
+    '附上': [['fù'], ['shàng']],
+    '附中': [['fù'], ['zhōng']],
+    '附丽': [['fù'], ['lì']],
+    '附会': [['fù'], ['huì']],
+    '附和': [['fù'], ['hè']],
+    '附属': [['fù'], ['shǔ']],
+    '附着': [['fù'], ['zhuó']],
+    '附识': [['fù'], ['zhì']],
+    '附载': [['fù'], ['zǎi']],
+    '际会': [['jì'], ['huì']],
+    '陆万': [['liù'], ['wàn']],
+    '陆上': [['lù'], ['shàng']],
+    '陆仟': [['liù'], ['qiān']],
+    '陆佰': [['liù'], ['bǎi']],
+    '陆圆': [['liù'], ['yuán']],
+    '陆地': [['lù'], ['dì']],
+    '陆拾': [['liù'], ['shí']],
+    '陆风': [['lù'], ['fēng']],
+    '陈说': [['chén'], ['shuō']],
+    '陋巷': [['lòu'], ['xiàng']],
+    '降下': [['jiàng'], ['xià']],
+    '降世': [['jiàng'], ['shì']],
+    '降临': [['jiàng'], ['lín']],
+    '降价': [['jiàng'], ['jià']],
+    '降伏': [['xiáng'], ['fú']],
+    '降低': [['jiàng'], ['dī']],
+    '降压': [['jiàng'], ['yā']],
+    '降旗': [['jiàng'], ['qí']],
+    '降服': [['xiáng'], ['fú']],
+    '降格': [['jiàng'], ['gé']],
+    '降气': [['jiàng'], ['qì']],
+    '降水': [['jiàng'], ['shuǐ']],
+    '降温': [['jiàng'], ['wēn']],
+    '降火': [['jiàng'], ['huǒ']],
+    '降生': [['jiàng'], ['shēng']],
+    '降等': [['jiàng'], ['děng']],
+    '降级': [['jiàng'], ['jí']],
+    '降职': [['jiàng'], ['zhí']],
+    '降落': [['jiàng'], ['luò']],
+    '降表': [['jiàng'], ['biǎo']],
+    '降解': [['jiàng'], ['jiě']],
+    '降调': [['jiàng'], ['diào']],
+    '降雨': [['jiàng'], ['yǔ']],
+    '降雪': [['jiàng'], ['xuě']],
+    '降顺': [['xiáng'], ['shùn']],
+    '降香': [['jiàng'], ['xiāng']],
+    '降龙': [['xiáng'], ['lóng']],
+    '限令': [['xiàn'], ['lìng']],
+    '限价': [['xiàn'], ['jià']],
+    '限度': [['xiàn'], ['dù']],
+    '限期': [['xiàn'], ['qī']],
+    '限量': [['xiàn'], ['liàng']],
+    '陡度': [['dǒu'], ['dù']],
+    '院子': [['yuàn'], ['zi']],
+    '院落': [['yuàn'], ['luò']],
+    '院长': [['yuàn'], ['zhǎng']],
+    '除丧': [['chú'], ['sàng']],
+    '除了': [['chú'], ['le']],
+    '除号': [['chú'], ['hào']],
+    '除数': [['chú'], ['shù']],
+    '除服': [['chú'], ['fú']],
+    '陨石': [['yǔn'], ['shí']],
+    '陨落': [['yǔn'], ['luò']],
+    '险些': [['xiǎn'], ['xiē']],
+    '险地': [['xiǎn'], ['dì']],
+    '险恶': [['xiǎn'], ['è']],
+    '险毒': [['xiǎn'], ['dú']],
+    '险症': [['xiǎn'], ['zhèng']],
+    '险要': [['xiǎn'], ['yào']],
+    '陪同': [['péi'], ['tóng']],
+    '陪祭': [['péi'], ['jì']],
+    '陪都': [['péi'], ['dū']],
+    '陷没': [['xiàn'], ['méi']],
+    '陷落': [['xiàn'], ['luò']],
+    '随和': [['suí'], ['hé']],
+    '随处': [['suí'], ['chù']],
+    '隐蔽': [['yǐn'], ['bì']],
+    '隔别': [['gé'], ['bié']],
+    '隔宿': [['gé'], ['sù']],
+    '隔扇': [['gé'], ['shān']],
+    '隔栅': [['gé'], ['zhà']],
+    '隔行': [['gé'], ['háng']],
+    '隔间': [['gé'], ['jiān']],
+    '隘巷': [['ài'], ['xiàng']],
+    '隙缝': [['xì'], ['fèng']],
+    '隶书': [['lì'], ['shū']],
+    '隶农': [['lì'], ['nóng']],
+    '隶卒': [['lì'], ['zú']],
+    '隶字': [['lì'], ['zì']],
+    '隶属': [['lì'], ['shǔ']],
+    '隽永': [['juàn'], ['yǒng']],
+    '隽语': [['jùn'], ['yǔ']],
+    '难为': [['nán'], ['wéi']],
+    '难事': [['nán'], ['shì']],
+    '难于': [['nán'], ['yú']],
+    '难产': [['nán'], ['chǎn']],
+    '难人': [['nán'], ['rén']],
+    '难以': [['nán'], ['yǐ']],
+    '难住': [['nán'], ['zhù']],
+    '难侨': [['nàn'], ['qiáo']],
+    '难保': [['nán'], ['bǎo']],
+    '难倒': [['nán'], ['dǎo']],
+    '难免': [['nán'], ['miǎn']],
+    '难关': [['nán'], ['guān']],
+    '难友': [['nàn'], ['yǒu']],
+    '难受': [['nán'], ['shòu']],
+    '难吃': [['nán'], ['chī']],
+    '难听': [['nán'], ['tīng']],
+    '难堪': [['nán'], ['kān']],
+    '难处': [['nán'], ['chǔ']],
+    '难字': [['nán'], ['zì']],
+    '难属': [['nàn'], ['shǔ']],
+    '难度': [['nán'], ['dù']],
+    '难当': [['nán'], ['dāng']],
+    '难得': [['nán'], ['de']],
+    '难忍': [['nán'], ['rěn']],
+    '难忘': [['nán'], ['wàng']],
+    '难怪': [['nán'], ['guài']],
+    '难懂': [['nán'], ['dǒng']],
+    '难易': [['nán'], ['yì']],
+    '难民': [['nàn'], ['mín']],
+    '难点': [['nán'], ['diǎn']],
+    '难熬': [['nán'], ['áo']],
+    '难看': [['nán'], ['kàn']],
+    '难缠': [['nán'], ['chán']],
+    '难耐': [['nán'], ['nài']],
+    '难胞': [['nàn'], ['bāo']],
+    '难色': [['nán'], ['sè']],
+    '难解': [['nán'], ['jiě']],
+    '难言': [['nán'], ['yán']],
+    '难说': [['nán'], ['shuō']],
+    '难过': [['nán'], ['guò']],
+    '难道': [['nán'], ['dào']],
+    '难闻': [['nán'], ['wén']],
+    '难题': [['nán'], ['tí']],
+    '雀子': [['qiāo'], ['zǐ']],
+    '雁行': [['yàn'], ['háng']],
+    '雄劲': [['xióng'], ['jìng']],
+    '雄大': [['xióng'], ['dà']],
+    '雄奇': [['xióng'], ['qí']],
+    '雄峙': [['xióng'], ['zhì']],
+    '雅乐': [['yǎ'], ['yuè']],
+    '雅兴': [['yǎ'], ['xìng']],
+    '雅号': [['yǎ'], ['hào']],
+    '雅思': [['yǎ'], ['sī']],
+    '雅正': [['yǎ'], ['zhèng']],
+    '雅称': [['yǎ'], ['chēng']],
+    '雅观': [['yǎ'], ['guān']],
+    '雅趣': [['yǎ'], ['qù']],
+    '雅量': [['yǎ'], ['liàng']],
+    '集中': [['jí'], ['zhōng']],
+    '集会': [['jí'], ['huì']],
+    '集体': [['jí'], ['tǐ']],
+    '集合': [['jí'], ['hé']],
+    '集宁': [['jí'], ['níng']],
+    '集散': [['jí'], ['sàn']],
+    '集约': [['jí'], ['yuē']],
+    '集结': [['jí'], ['jié']],
+    '雇佣': [['gù'], ['yōng']],
+    '雇员': [['gù'], ['yuán']],
+    '雍和': [['yōng'], ['hé']],
+    '雍正': [['yōng'], ['zhèng']],
+    '雏燕': [['chú'], ['yàn']],
+    '雕琢': [['diāo'], ['zhuó']],
+    '雕砌': [['diāo'], ['qì']],
+    '雨丝': [['yǔ'], ['sī']],
+    '雨云': [['yǔ'], ['yún']],
+    '雨伞': [['yǔ'], ['sǎn']],
+    '雨具': [['yǔ'], ['jù']],
+    '雨凇': [['yǔ'], ['sōng']],
+    '雨前': [['yǔ'], ['qián']],
+    '雨势': [['yǔ'], ['shì']],
+    '雨区': [['yǔ'], ['qū']],
+    '雨季': [['yǔ'], ['jì']],
+    '雨布': [['yǔ'], ['bù']],
+    '雨带': [['yǔ'], ['dài']],
+    '雨幕': [['yǔ'], ['mù']],
+    '雨情': [['yǔ'], ['qíng']],
+    '雨意': [['yǔ'], ['yì']],
+    '雨披': [['yǔ'], ['pī']],
+    '雨水': [['yǔ'], ['shuǐ']],
+    '雨涝': [['yǔ'], ['lào']],
+    '雨滴': [['yǔ'], ['dī']],
+    '雨点': [['yǔ'], ['diǎn']],
+    '雨燕': [['yǔ'], ['yàn']],
+    '雨珠': [['yǔ'], ['zhū']],
+    '雨脚': [['yǔ'], ['jiǎo']],
+    '雨蓬': [['yǔ'], ['péng']],
+    '雨蛙': [['yǔ'], ['wā']],
+    '雨衣': [['yǔ'], ['yī']],
+    '雨量': [['yǔ'], ['liàng']],
+    '雨雾': [['yǔ'], ['wù']],
+    '雨露': [['yǔ'], ['lù']],
+    '雨靴': [['yǔ'], ['xuē']],
+    '雨鞋': [['yǔ'], ['xié']],
+    '雪茄': [['xuě'], ['jiā']],
+    '零头': [['líng'], ['tóu']],
+    '零度': [['líng'], ['dù']],
+    '零散': [['líng'], ['sǎn']],
+    '零数': [['líng'], ['shù']],
+    '零落': [['líng'], ['luò']],
+    '零食': [['líng'], ['shí']],
+    '雷同': [['léi'], ['tóng']],
+    '雷暴': [['léi'], ['bào']],
+    '雷雨': [['léi'], ['yǔ']],
+    '雾化': [['wù'], ['huà']],
+    '需要': [['xū'], ['yào']],
+    '震中': [['zhèn'], ['zhōng']],
+    '震区': [['zhèn'], ['qū']],
+    '震颤': [['zhèn'], ['chàn']],
+    '霉头': [['méi'], ['tóu']],
+    '霉菌': [['méi'], ['jūn']],
+    '霉雨': [['méi'], ['yǔ']],
+    '霍地': [['huò'], ['dì']],
+    '霓裳': [['ní'], ['cháng']],
+    '霖雨': [['lín'], ['yǔ']],
+    '霜叶': [['shuāng'], ['yè']],
+    '霜期': [['shuāng'], ['qī']],
+    '霜降': [['shuāng'], ['jiàng']],
+    '霞石': [['xiá'], ['shí']],
+    '霰弹': [['xiàn'], ['dàn']],
+    '露丑': [['lòu'], ['chǒu']],
+    '露光': [['lù'], ['guāng']],
+    '露刃': [['lòu'], ['rèn']],
+    '露台': [['lù'], ['tái']],
+    '露天': [['lù'], ['tiān']],
+    '露头': [['lù'], ['tóu']],
+    '露宿': [['lù'], ['sù']],
+    '露富': [['lòu'], ['fù']],
+    '露布': [['lù'], ['bù']],
+    '露底': [['lòu'], ['dǐ']],
+    '露怯': [['lòu'], ['qiè']],
+    '露水': [['lù'], ['shuǐ']],
+    '露点': [['lù'], ['diǎn']],
+    '露珠': [['lù'], ['zhū']],
+    '露白': [['lòu'], ['bái']],
+    '露相': [['lòu'], ['xiàng']],
+    '露脸': [['lòu'], ['liǎn']],
+    '露苗': [['lòu'], ['miáo']],
+    '露营': [['lù'], ['yíng']],
+    '露酒': [['lù'], ['jiǔ']],
+    '露面': [['lòu'], ['miàn']],
+    '露风': [['lòu'], ['fēng']],
+    '露馅': [['lòu'], ['xiàn']],
+    '露骨': [['lù'], ['gǔ']],
+    '露齿': [['lù'], ['chǐ']],
+    '霹雷': [['pī'], ['léi']],
+    '青石': [['qīng'], ['shí']],
+    '青绿': [['qīng'], ['lǜ']],
+    '青苔': [['qīng'], ['tái']],
+    '青蛇': [['qīng'], ['shé']],
+    '靓丽': [['liàng'], ['lì']],
+    '靓仔': [['liàng'], ['zǎi']],
+    '靓女': [['liàng'], ['nǚ']],
+    '靓妆': [['jìng'], ['zhuāng']],
+    '靓衣': [['jìng'], ['yī']],
+    '靓饰': [['jìng'], ['shì']],
+    '静乐': [['jìng'], ['lè']],
+    '静场': [['jìng'], ['chǎng']],
+    '静宁': [['jìng'], ['níng']],
+    '静思': [['jìng'], ['sī']],
+    '静脉': [['jìng'], ['mài']],
+    '静观': [['jìng'], ['guān']],
+    '非分': [['fēi'], ['fèn']],
+    '非得': [['fēi'], ['děi']],
+    '非难': [['fēi'], ['nàn']],
+    '靠泊': [['kào'], ['bó']],
+    '靠背': [['kào'], ['bèi']],
+    '靡丽': [['mǐ'], ['lì']],
+    '靡费': [['mí'], ['fèi']],
+    '面上': [['miàn'], ['shàng']],
+    '面子': [['miàn'], ['zi']],
+    '面朝': [['miàn'], ['cháo']],
+    '面汤': [['miàn'], ['tāng']],
+    '面相': [['miàn'], ['xiāng']],
+    '面糊': [['miàn'], ['hù']],
+    '面红': [['miàn'], ['hóng']],
+    '面见': [['miàn'], ['jiàn']],
+    '面食': [['miàn'], ['shí']],
+    '革囊': [['gé'], ['náng']],
+    '靴子': [['xuē'], ['zi']],
+    '靶台': [['bǎ'], ['tái']],
+    '靶场': [['bǎ'], ['chǎng']],
+    '靶子': [['bǎ'], ['zi']],
+    '鞋刷': [['xié'], ['shuā']],
+    '鞋子': [['xié'], ['zi']],
+    '鞋底': [['xié'], ['dǐ']],
+    '鞍子': [['ān'], ['zi']],
+    '鞭子': [['biān'], ['zi']],
+    '鞭打': [['biān'], ['dǎ']],
+    '鞭梢': [['biān'], ['shāo']],
+    '鞭炮': [['biān'], ['pào']],
+    '鞭鞘': [['biān'], ['shāo']],
+    '韧劲': [['rèn'], ['jìn']],
+    '音乐': [['yīn'], ['yuè']],
+    '音信': [['yīn'], ['xìn']],
+    '音区': [['yīn'], ['qū']],
+    '音叉': [['yīn'], ['chā']],
+    '音强': [['yīn'], ['qiáng']],
+    '音节': [['yīn'], ['jié']],
+    '音读': [['yīn'], ['dú']],
+    '音调': [['yīn'], ['diào']],
+    '音量': [['yīn'], ['liàng']],
+    '韵头': [['yùn'], ['tóu']],
+    '韵尾': [['yùn'], ['wěi']],
+    '韵语': [['yùn'], ['yǔ']],
+    '韵调': [['yùn'], ['diào']],
+    '韶华': [['sháo'], ['huá']],
+    '页数': [['yè'], ['shù']],
+    '顶上': [['dǐng'], ['shàng']],
+    '顶头': [['dǐng'], ['tóu']],
+    '顶数': [['dǐng'], ['shù']],
+    '顶盖': [['dǐng'], ['gài']],
+    '顶角': [['dǐng'], ['jiǎo']],
+    '顶骨': [['dǐng'], ['gǔ']],
+    '项圈': [['xiàng'], ['quān']],
+    '项背': [['xiàng'], ['bèi']],
+    '顺从': [['shùn'], ['cóng']],
+    '顺便': [['shùn'], ['biàn']],
+    '顺化': [['shùn'], ['huà']],
+    '顺和': [['shùn'], ['hé']],
+    '顺差': [['shùn'], ['chā']],
+    '顺应': [['shùn'], ['yìng']],
+    '顺当': [['shùn'], ['dāng']],
+    '顺服': [['shùn'], ['fú']],
+    '顺溜': [['shùn'], ['liū']],
+    '须发': [['xū'], ['fà']],
+    '须子': [['xū'], ['zi']],
+    '须知': [['xū'], ['zhī']],
+    '须要': [['xū'], ['yào']],
+    '顽强': [['wán'], ['qiáng']],
+    '顽症': [['wán'], ['zhèng']],
+    '顽石': [['wán'], ['shí']],
+    '顾家': [['gù'], ['jiā']],
+    '顿号': [['dùn'], ['hào']],
+    '顿觉': [['dùn'], ['jué']],
+    '颀长': [['qí'], ['cháng']],
+    '预估': [['yù'], ['gū']],
+    '预卜': [['yù'], ['bǔ']],
+    '预压': [['yù'], ['yā']],
+    '预期': [['yù'], ['qī']],
+    '预知': [['yù'], ['zhī']],
+    '预约': [['yù'], ['yuē']],
+    '预行': [['yù'], ['xíng']],
+    '预见': [['yù'], ['jiàn']],
+    '领地': [['lǐng'], ['dì']],
+    '领教': [['lǐng'], ['jiào']],
+    '颉颃': [['xié'], ['háng']],
+    '颊囊': [['jiá'], ['náng']],
+    '颊车': [['jiá'], ['chē']],
+    '频传': [['pín'], ['chuán']],
+    '频度': [['pín'], ['dù']],
+    '频数': [['pín'], ['shuò']],
+    '频次': [['pín'], ['cì']],
+    '频率': [['pín'], ['lǜ']],
+    '频繁': [['pín'], ['fán']],
+    '频道': [['pín'], ['dào']],
+    '颓丧': [['tuí'], ['sàng']],
+    '题解': [['tí'], ['jiě']],
+    '颚骨': [['è'], ['gǔ']],
+    '颜体': [['yán'], ['tǐ']],
+    '额头': [['é'], ['tóu']],
+    '额度': [['é'], ['dù']],
+    '额数': [['é'], ['shù']],
+    '额枋': [['é'], ['fāng']],
+    '额角': [['é'], ['jiǎo']],
+    '额骨': [['é'], ['gǔ']],
+    '颞骨': [['niè'], ['gǔ']],
+    '颠倒': [['diān'], ['dǎo']],
+    '颠簸': [['diān'], ['bǒ']],
+    '颤动': [['chàn'], ['dòng']],
+    '颤声': [['chàn'], ['shēng']],
+    '颤悠': [['chàn'], ['yōu']],
+    '颤抖': [['chàn'], ['dǒu']],
+    '颤栗': [['zhàn'], ['lì']],
+    '颤音': [['chàn'], ['yīn']],
+    '颤颤': [['chàn'], ['chàn']],
+    '颧骨': [['quán'], ['gǔ']],
+    '风传': [['fēng'], ['chuán']],
+    '风光': [['fēng'], ['guāng']],
+    '风凉': [['fēng'], ['liáng']],
+    '风化': [['fēng'], ['huà']],
+    '风华': [['fēng'], ['huá']],
+    '风发': [['fēng'], ['fā']],
+    '风味': [['fēng'], ['wèi']],
+    '风土': [['fēng'], ['tǔ']],
+    '风声': [['fēng'], ['shēng']],
+    '风头': [['fēng'], ['tou']],
+    '风姿': [['fēng'], ['zī']],
+    '风害': [['fēng'], ['hài']],
+    '风尚': [['fēng'], ['shàng']],
+    '风帆': [['fēng'], ['fān']],
+    '风干': [['fēng'], ['gān']],
+    '风度': [['fēng'], ['dù']],
+    '风扇': [['fēng'], ['shàn']],
+    '风挡': [['fēng'], ['dǎng']],
+    '风斗': [['fēng'], ['dǒu']],
+    '风景': [['fēng'], ['jǐng']],
+    '风暴': [['fēng'], ['bào']],
+    '风月': [['fēng'], ['yuè']],
+    '风机': [['fēng'], ['jī']],
+    '风格': [['fēng'], ['gé']],
+    '风气': [['fēng'], ['qì']],
+    '风池': [['fēng'], ['chí']],
+    '风沙': [['fēng'], ['shā']],
+    '风波': [['fēng'], ['bō']],
+    '风洞': [['fēng'], ['dòng']],
+    '风派': [['fēng'], ['pài']],
+    '风浪': [['fēng'], ['làng']],
+    '风灯': [['fēng'], ['dēng']],
+    '风烟': [['fēng'], ['yān']],
+    '风疹': [['fēng'], ['zhěn']],
+    '风磨': [['fēng'], ['mó']],
+    '风神': [['fēng'], ['shén']],
+    '风纪': [['fēng'], ['jì']],
+    '风能': [['fēng'], ['néng']],
+    '风致': [['fēng'], ['zhì']],
+    '风色': [['fēng'], ['sè']],
+    '风行': [['fēng'], ['xíng']],
+    '风衣': [['fēng'], ['yī']],
+    '风貌': [['fēng'], ['mào']],
+    '风趣': [['fēng'], ['qù']],
+    '风车': [['fēng'], ['chē']],
+    '风道': [['fēng'], ['dào']],
+    '风邪': [['fēng'], ['xié']],
+    '风采': [['fēng'], ['cǎi']],
+    '风量': [['fēng'], ['liàng']],
+    '风钻': [['fēng'], ['zuàn']],
+    '风镐': [['fēng'], ['hào']],
+    '风障': [['fēng'], ['zhàng']],
+    '风雅': [['fēng'], ['yǎ']],
+    '风雨': [['fēng'], ['yǔ']],
+    '风雷': [['fēng'], ['léi']],
+    '风靡': [['fēng'], ['mǐ']],
+    '风骨': [['fēng'], ['gǔ']],
+    '风鸟': [['fēng'], ['niǎo']],
+    '飘拂': [['piāo'], ['fú']],
+    '飘散': [['piāo'], ['sàn']],
+    '飘泊': [['piāo'], ['bó']],
+    '飘洒': [['piāo'], ['sǎ']],
+    '飘落': [['piāo'], ['luò']],
+    '飙车': [['biāo'], ['chē']],
+    '飞地': [['fēi'], ['dì']],
+    '飞奔': [['fēi'], ['bēn']],
+    '飞弹': [['fēi'], ['dàn']],
+    '飞散': [['fēi'], ['sàn']],
+    '飞旋': [['fēi'], ['xuán']],
+    '飞洒': [['fēi'], ['sǎ']],
+    '飞涨': [['fēi'], ['zhǎng']],
+    '飞溅': [['fēi'], ['jiàn']],
+    '飞瀑': [['fēi'], ['pù']],
+    '飞燕': [['fēi'], ['yàn']],
+    '飞石': [['fēi'], ['shí']],
+    '飞红': [['fēi'], ['hóng']],
+    '飞蛾': [['fēi'], ['é']],
+    '飞行': [['fēi'], ['xíng']],
+    '飞语': [['fēi'], ['yǔ']],
+    '飞跑': [['fēi'], ['pǎo']],
+    '飞车': [['fēi'], ['chē']],
+    '飞转': [['fēi'], ['zhuàn']],
+    '飞雨': [['fēi'], ['yǔ']],
+    '食人': [['shí'], ['rén']],
+    '食具': [['shí'], ['jù']],
+    '食口': [['shí'], ['kǒu']],
+    '食品': [['shí'], ['pǐn']],
+    '食堂': [['shí'], ['táng']],
+    '食客': [['shí'], ['kè']],
+    '食宿': [['shí'], ['sù']],
+    '食性': [['shí'], ['xìng']],
+    '食指': [['shí'], ['zhǐ']],
+    '食料': [['shí'], ['liào']],
+    '食槽': [['shí'], ['cáo']],
+    '食欲': [['shí'], ['yù']],
+    '食母': [['sì'], ['mǔ']],
+    '食油': [['shí'], ['yóu']],
+    '食物': [['shí'], ['wù']],
+    '食用': [['shí'], ['yòng']],
+    '食疗': [['shí'], ['liáo']],
+    '食盐': [['shí'], ['yán']],
+    '食盒': [['shí'], ['hé']],
+    '食相': [['shí'], ['xiāng']],
+    '食积': [['shí'], ['jī']],
+    '食管': [['shí'], ['guǎn']],
+    '食粮': [['shí'], ['liáng']],
+    '食糖': [['shí'], ['táng']],
+    '食肉': [['shí'], ['ròu']],
+    '食言': [['shí'], ['yán']],
+    '食谱': [['shí'], ['pǔ']],
+    '食道': [['shí'], ['dào']],
+    '食邑': [['shí'], ['yì']],
+    '食量': [['shí'], ['liàng']],
+    '食饵': [['shí'], ['ěr']],
+    '餐车': [['cān'], ['chē']],
+    '饥荒': [['jī'], ['huāng']],
+    '饬令': [['chì'], ['lìng']],
+    '饭囊': [['fàn'], ['náng']],
+    '饭票': [['fàn'], ['piào']],
+    '饭量': [['fàn'], ['liàng']],
+    '饭铺': [['fàn'], ['pù']],
+    '饭食': [['fàn'], ['shí']],
+    '饮弹': [['yǐn'], ['dàn']],
+    '饮片': [['yǐn'], ['piàn']],
+    '饮食': [['yǐn'], ['shí']],
+    '饯别': [['jiàn'], ['bié']],
+    '饯行': [['jiàn'], ['xíng']],
+    '饱和': [['bǎo'], ['hé']],
+    '饱读': [['bǎo'], ['dú']],
+    '饱食': [['bǎo'], ['shí']],
+    '饶头': [['ráo'], ['tóu']],
+    '饶有': [['ráo'], ['yǒu']],
+    '饸饹': [['hé'], ['le']],
+    '饺子': [['jiǎo'], ['zi']],
+    '饼干': [['bǐng'], ['gān']],
+    '饼铛': [['bǐng'], ['chēng']],
+    '馆子': [['guǎn'], ['zi']],
+    '馆长': [['guǎn'], ['zhǎng']],
+    '馏分': [['liú'], ['fèn']],
+    '馒头': [['mán'], ['tou']],
+    '首倡': [['shǒu'], ['chàng']],
+    '首创': [['shǒu'], ['chuàng']],
+    '首发': [['shǒu'], ['fā']],
+    '首尾': [['shǒu'], ['wěi']],
+    '首度': [['shǒu'], ['dù']],
+    '首恶': [['shǒu'], ['è']],
+    '首相': [['shǒu'], ['xiàng']],
+    '首要': [['shǒu'], ['yào']],
+    '首车': [['shǒu'], ['chē']],
+    '首都': [['shǒu'], ['dū']],
+    '首长': [['shǒu'], ['zhǎng']],
+    '香会': [['xiāng'], ['huì']],
+    '香囊': [['xiāng'], ['náng']],
+    '香干': [['xiāng'], ['gān']],
+    '香槟': [['xiāng'], ['bīn']],
+    '香港': [['xiāng'], ['gǎng']],
+    '香片': [['xiāng'], ['piàn']],
+    '香肚': [['xiāng'], ['dù']],
+    '香臭': [['xiāng'], ['chòu']],
+    '马上': [['mǎ'], ['shàng']],
+    '马仔': [['mǎ'], ['zǎi']],
+    '马刺': [['mǎ'], ['cì']],
+    '马勒': [['mǎ'], ['lè']],
+    '马号': [['mǎ'], ['hào']],
+    '马圈': [['mǎ'], ['juàn']],
+    '马夫': [['mǎ'], ['fū']],
+    '马头': [['mǎ'], ['tóu']],
+    '马子': [['mǎ'], ['zi']],
+    '马尾': [['mǎ'], ['yǐ']],
+    '马尿': [['mǎ'], ['niào']],
+    '马戏': [['mǎ'], ['xì']],
+    '马扎': [['mǎ'], ['zhá']],
+    '马术': [['mǎ'], ['shù']],
+    '马车': [['mǎ'], ['chē']],
+    '驯化': [['xùn'], ['huà']],
+    '驯服': [['xùn'], ['fú']],
+    '驱散': [['qū'], ['sàn']],
+    '驱车': [['qū'], ['chē']],
+    '驱迫': [['qū'], ['pò']],
+    '驱邪': [['qū'], ['xié']],
+    '驳倒': [['bó'], ['dǎo']],
+    '驳论': [['bó'], ['lùn']],
+    '驴子': [['lǘ'], ['zi']],
+    '驻地': [['zhù'], ['dì']],
+    '驻屯': [['zhù'], ['tún']],
+    '驻扎': [['zhù'], ['zhā']],
+    '驼背': [['tuó'], ['bèi']],
+    '驾车': [['jià'], ['chē']],
+    '驿卒': [['yì'], ['zú']],
+    '骁将': [['xiāo'], ['jiàng']],
+    '骄横': [['jiāo'], ['hèng']],
+    '骄矜': [['jiāo'], ['jīn']],
+    '骈体': [['pián'], ['tǐ']],
+    '骈枝': [['pián'], ['zhī']],
+    '验查': [['yàn'], ['chá']],
+    '验核': [['yàn'], ['hé']],
+    '验看': [['yàn'], ['kàn']],
+    '验票': [['yàn'], ['piào']],
+    '验血': [['yàn'], ['xuè']],
+    '骑乘': [['qí'], ['chéng']],
+    '骑射': [['qí'], ['shè']],
+    '骑缝': [['qí'], ['fèng']],
+    '骗子': [['piàn'], ['zi']],
+    '骗术': [['piàn'], ['shù']],
+    '骚体': [['sāo'], ['tǐ']],
+    '骚客': [['sāo'], ['kè']],
+    '骚扰': [['sāo'], ['rǎo']],
+    '骚气': [['sāo'], ['qì']],
+    '骠勇': [['piào'], ['yǒng']],
+    '骠骑': [['piào'], ['qí']],
+    '骡子': [['luó'], ['zi']],
+    '骤降': [['zhòu'], ['jiàng']],
+    '骤雨': [['zhòu'], ['yǔ']],
+    '骨刺': [['gǔ'], ['cì']],
+    '骨力': [['gǔ'], ['lì']],
+    '骨化': [['gǔ'], ['huà']],
+    '骨头': [['gú'], ['tou']],
+    '骨子': [['gǔ'], ['zi']],
+    '骨学': [['gǔ'], ['xué']],
+    '骨干': [['gǔ'], ['gàn']],
+    '骨库': [['gǔ'], ['kù']],
+    '骨折': [['gǔ'], ['zhé']],
+    '骨料': [['gǔ'], ['liào']],
+    '骨朵': [['gū'], ['duǒ']],
+    '骨架': [['gǔ'], ['jià']],
+    '骨殖': [['gǔ'], ['shi']],
+    '骨气': [['gǔ'], ['qì']],
+    '骨灰': [['gǔ'], ['huī']],
+    '骨炭': [['gǔ'], ['tàn']],
+    '骨牌': [['gǔ'], ['pái']],
+    '骨痨': [['gǔ'], ['láo']],
+    '骨盆': [['gǔ'], ['pén']],
+    '骨碌': [['gū'], ['lù']],
+    '骨科': [['gǔ'], ['kē']],
+    '骨粉': [['gǔ'], ['fěn']],
+    '骨肉': [['gǔ'], ['ròu']],
+    '骨胶': [['gǔ'], ['jiāo']],
+    '骨膜': [['gǔ'], ['mó']],
+    '骨节': [['gǔ'], ['jié']],
+    '骨董': [['gǔ'], ['dǒng']],
+    '骨血': [['gǔ'], ['xuè']],
+    '骨骼': [['gǔ'], ['gé']],
+    '骨髓': [['gǔ'], ['suǐ']],
+    '骨鲠': [['gǔ'], ['gěng']],
+    '骰子': [['tóu'], ['zǐ']],
+    '骶椎': [['dǐ'], ['zhuī']],
+    '骶骨': [['dǐ'], ['gǔ']],
+    '骸骨': [['hái'], ['gǔ']],
+    '髋骨': [['kuān'], ['gǔ']],
+    '髌骨': [['bìn'], ['gǔ']],
+    '高个': [['gāo'], ['gè']],
+    '高中': [['gāo'], ['zhōng']],
+    '高丽': [['gāo'], ['lí']],
+    '高价': [['gāo'], ['jià']],
+    '高估': [['gāo'], ['gū']],
+    '高兴': [['gāo'], ['xìng']],
+    '高压': [['gāo'], ['yā']],
+    '高参': [['gāo'], ['cān']],
+    '高发': [['gāo'], ['fā']],
+    '高台': [['gāo'], ['tái']],
+    '高地': [['gāo'], ['dì']],
+    '高处': [['gāo'], ['chù']],
+    '高大': [['gāo'], ['dà']],
+    '高差': [['gāo'], ['chà']],
+    '高干': [['gāo'], ['gàn']],
+    '高度': [['gāo'], ['dù']],
+    '高强': [['gāo'], ['qiáng']],
+    '高挑': [['gāo'], ['tiǎo']],
+    '高教': [['gāo'], ['jiào']],
+    '高枝': [['gāo'], ['zhī']],
+    '高校': [['gāo'], ['xiào']],
+    '高汤': [['gāo'], ['tāng']],
+    '高涨': [['gāo'], ['zhǎng']],
+    '高看': [['gāo'], ['kàn']],
+    '高着': [['gāo'], ['zhāo']],
+    '高知': [['gāo'], ['zhì']],
+    '高空': [['gāo'], ['kōng']],
+    '高能': [['gāo'], ['néng']],
+    '高见': [['gāo'], ['jiàn']],
+    '高论': [['gāo'], ['lùn']],
+    '高调': [['gāo'], ['diào']],
+    '高远': [['gāo'], ['yuǎn']],
+    '高难': [['gāo'], ['nán']],
+    '高频': [['gāo'], ['pín']],
+    '鬃刷': [['zōng'], ['shuā']],
+    '鬈发': [['quán'], ['fà']],
+    '鬈曲': [['quán'], ['qǔ']],
+    '鬓发': [['bìn'], ['fà']],
+    '鬓角': [['bìn'], ['jiǎo']],
+    '鬼头': [['guǐ'], ['tou']],
+    '鬼混': [['guǐ'], ['hùn']],
+    '魏阙': [['wèi'], ['quē']],
+    '魔头': [['mó'], ['tóu']],
+    '魔女': [['mó'], ['nǚ']],
+    '魔教': [['mó'], ['jiào']],
+    '魔术': [['mó'], ['shù']],
+    '魔爪': [['mó'], ['zhǎo']],
+    '魔王': [['mó'], ['wáng']],
+    '鱼刺': [['yú'], ['cì']],
+    '鱼叉': [['yú'], ['chā']],
+    '鱼头': [['yú'], ['tóu']],
+    '鱼尾': [['yú'], ['wěi']],
+    '鱼汤': [['yú'], ['tāng']],
+    '鱼漂': [['yú'], ['piāo']],
+    '鱼片': [['yú'], ['piàn']],
+    '鱼种': [['yú'], ['zhǒng']],
+    '鱼肚': [['yú'], ['dǔ']],
+    '鱼鲜': [['yú'], ['xiān']],
+    '鲑鱼': [['guī'], ['yú']],
+    '鲜丽': [['xiān'], ['lì']],
+    '鲜亮': [['xiān'], ['liàng']],
+    '鲜卑': [['xiān'], ['bēi']],
+    '鲜味': [['xiān'], ['wèi']],
+    '鲜妍': [['xiān'], ['yán']],
+    '鲜嫩': [['xiān'], ['nèn']],
+    '鲜明': [['xiān'], ['míng']],
+    '鲜有': [['xiǎn'], ['yǒu']],
+    '鲜果': [['xiān'], ['guǒ']],
+    '鲜活': [['xiān'], ['huó']],
+    '鲜润': [['xiān'], ['rùn']],
+    '鲜灵': [['xiān'], ['líng']],
+    '鲜甜': [['xiān'], ['tián']],
+    '鲜红': [['xiān'], ['hóng']],
+    '鲜绿': [['xiān'], ['lǜ']],
+    '鲜美': [['xiān'], ['měi']],
+    '鲜艳': [['xiān'], ['yàn']],
+    '鲜花': [['xiān'], ['huā']],
+    '鲜血': [['xiān'], ['xuè']],
+    '鲜见': [['xiǎn'], ['jiàn']],
+    '鲜货': [['xiān'], ['huò']],
+    '鲜食': [['xiān'], ['shí']],
+    '鲜鱼': [['xiān'], ['yú']],
+    '鳌头': [['áo'], ['tóu']],
+    '鳏夫': [['guān'], ['fū']],
+    '鳞爪': [['lín'], ['zhǎo']],
+    '鳞片': [['lín'], ['piàn']],
+    '鸟乱': [['niǎo'], ['luàn']],
+    '鸟事': [['niǎo'], ['shì']],
+    '鸟笼': [['niǎo'], ['lóng']],
+    '鸟闹': [['diǎo'], ['nào']],
+    '鸟雀': [['niǎo'], ['què']],
+    '鸠尾': [['jiū'], ['wěi']],
+    '鸡丁': [['jī'], ['dīng']],
+    '鸡冠': [['jī'], ['guān']],
+    '鸡头': [['jī'], ['tóu']],
+    '鸡笼': [['jī'], ['lóng']],
+    '鸡肋': [['jī'], ['lèi']],
+    '鸢尾': [['yuān'], ['wěi']],
+    '鸦片': [['yā'], ['piàn']],
+    '鸩毒': [['zhèn'], ['dú']],
+    '鸭子': [['yā'], ['zi']],
+    '鸱尾': [['chī'], ['wěi']],
+    '鸽子': [['gē'], ['zi']],
+    '鸽笼': [['gē'], ['lóng']],
+    '鸿爪': [['hóng'], ['zhǎo']],
+    '鸿蒙': [['hóng'], ['méng']],
+    '鹄的': [['gǔ'], ['dì']],
+    '鹰爪': [['yīng'], ['zhǎo']],
+    '鹿尾': [['lù'], ['wěi']],
+    '麦片': [['mài'], ['piàn']],
+    '麦粥': [['mài'], ['zhōu']],
+    '麦蛾': [['mài'], ['é']],
+    '麦角': [['mài'], ['jiǎo']],
+    '麸子': [['fū'], ['zi']],
+    '麻雀': [['má'], ['què']],
+    '黄叶': [['huáng'], ['yè']],
+    '黄埔': [['huáng'], ['pǔ']],
+    '黄沙': [['huáng'], ['shā']],
+    '黄泥': [['huáng'], ['ní']],
+    '黄石': [['huáng'], ['shí']],
+    '黄陂': [['huáng'], ['pí']],
+    '黄雀': [['huáng'], ['què']],
+    '黏度': [['nián'], ['dù']],
+    '黏着': [['nián'], ['zhe']],
+    '黏糊': [['nián'], ['hú']],
+    '黏结': [['nián'], ['jié']],
+    '黑体': [['hēi'], ['tǐ']],
+    '黑信': [['hēi'], ['xìn']],
+    '黑发': [['hēi'], ['fā']],
+    '黑地': [['hēi'], ['dì']],
+    '黑头': [['hēi'], ['tóu']],
+    '黑底': [['hēi'], ['dǐ']],
+    '黑种': [['hēi'], ['zhǒng']],
+    '黑红': [['hēi'], ['hóng']],
+    '黑蛇': [['hēi'], ['shé']],
+    '黑车': [['hēi'], ['chē']],
+    '黑铅': [['hēi'], ['qiān']],
+    '黑雨': [['hēi'], ['yǔ']],
+    '黔南': [['qián'], ['nán']],
+    '默契': [['mò'], ['qì']],
+    '默片': [['mò'], ['piàn']],
+    '默许': [['mò'], ['xǔ']],
+    '默读': [['mò'], ['dú']],
+    '黛绿': [['dài'], ['lǜ']],
+    '黾勉': [['mǐn'], ['miǎn']],
+    '鼎峙': [['dǐng'], ['zhì']],
+    '鼎盛': [['dǐng'], ['shèng']],
+    '鼓乐': [['gǔ'], ['yuè']],
+    '鼓劲': [['gǔ'], ['jìn']],
+    '鼓弄': [['gǔ'], ['nòng']],
+    '鼓角': [['gǔ'], ['jiǎo']],
+    '鼻塞': [['bí'], ['sāi']],
+    '鼻头': [['bí'], ['tóu']],
+    '鼻子': [['bí'], ['zi']],
+    '齐人': [['qí'], ['rén']],
+    '齐全': [['qí'], ['quán']],
+    '齐发': [['qí'], ['fā']],
+    '齐名': [['qí'], ['míng']],
+    '齐唱': [['qí'], ['chàng']],
+    '齐声': [['qí'], ['shēng']],
+    '齐备': [['qí'], ['bèi']],
+    '齐天': [['qí'], ['tiān']],
+    '齐头': [['qí'], ['tóu']],
+    '齐奏': [['qí'], ['zòu']],
+    '齐家': [['qí'], ['jiā']],
+    '齐射': [['qí'], ['shè']],
+    '齐心': [['qí'], ['xīn']],
+    '齐放': [['qí'], ['fàng']],
+    '齐整': [['qí'], ['zhěng']],
+    '齐明': [['qí'], ['míng']],
+    '齐楚': [['qí'], ['chǔ']],
+    '齐步': [['qí'], ['bù']],
+    '齐眉': [['qí'], ['méi']],
+    '齐肩': [['qí'], ['jiān']],
+    '齐行': [['qí'], ['xíng']],
+    '齐集': [['qí'], ['jí']],
+    '齐齐': [['qí'], ['qí']],
+    '齿冠': [['chǐ'], ['guān']],
+    '齿龈': [['chǐ'], ['yín']],
+    '龙体': [['lóng'], ['tǐ']],
+    '龙华': [['lóng'], ['huá']],
+    '龙卷': [['lóng'], ['juǎn']],
+    '龙头': [['lóng'], ['tóu']],
+    '龙柏': [['lóng'], ['bǎi']],
+    '龙王': [['lóng'], ['wáng']],
+    '龙骨': [['lóng'], ['gǔ']],
+    '龟兹': [['qiū'], ['cí']],
+    '龟头': [['guī'], ['tóu']],
+    '龟板': [['guī'], ['bǎn']],
+    '龟甲': [['guī'], ['jiǎ']],
+    '龟缩': [['guī'], ['suō']],
+    '龟背': [['guī'], ['bèi']],
+    '龟裂': [['jūn'], ['liè']],
+    '龟鉴': [['guī'], ['jiàn']],
+}
@@ -2,41460 +2,10 @@
 from __future__ import unicode_literals
 
 # Warning: Auto-generated file, don't edit.
-pinyin_dict = {
-    0x3007: 'líng,yuán,xīng',
-    0x3400: 'qiū',
-    0x3401: 'tiàn',
-    0x3404: 'kuà',
-    0x3405: 'wǔ',
-    0x3406: 'yǐn',
-    0x340C: 'yí',
-    0x3416: 'xié',
-    0x341C: 'chóu',
-    0x3421: 'nuò',
-    0x3424: 'dān,qiú',
-    0x3428: 'xù',
-    0x3429: 'xíng',
-    0x342B: 'xiōng',
-    0x342C: 'liú',
-    0x342D: 'lǐn',
-    0x342E: 'xiāng',
-    0x342F: 'yōng',
-    0x3430: 'xìn',
-    0x3431: 'zhěn',
-    0x3432: 'dài',
-    0x3433: 'wù',
-    0x3434: 'pān',
-    0x3435: 'rú',
-    0x3437: 'mǎ',
-    0x3438: 'qiàn,cì',
-    0x3439: 'yì',
-    0x343A: 'yín,zhòng',
-    0x343B: 'nèi',
-    0x343C: 'chèng',
-    0x343D: 'fēng',
-    0x3441: 'zhuō',
-    0x3442: 'fǎng',
-    0x3443: 'ǎo',
-    0x3444: 'wǔ',
-    0x3445: 'zuò',
-    0x3447: 'zhòu',
-    0x3448: 'dòng',
-    0x3449: 'sù',
-    0x344A: 'yì',
-    0x344B: 'qióng',
-    0x344C: 'kuāng,wāng',
-    0x344D: 'lèi',
-    0x344E: 'nǎo',
-    0x344F: 'zhù',
-    0x3450: 'shū',
-    0x3454: 'xǔ',
-    0x3457: 'shēn',
-    0x3458: 'jiè',
-    0x3459: 'dié',
-    0x345A: 'nuó',
-    0x345B: 'sù',
-    0x345C: 'yì,chì',
-    0x345D: 'lòng',
-    0x345E: 'yìng',
-    0x345F: 'běng',
-    0x3463: 'lán',
-    0x3464: 'miáo',
-    0x3465: 'yì',
-    0x3466: 'lì',
-    0x3467: 'jì',
-    0x3468: 'yǔ',
-    0x3469: 'luó',
-    0x346A: 'chái',
-    0x346E: 'hún',
-    0x346F: 'xǔ',
-    0x3470: 'huì',
-    0x3471: 'rǎo',
-    0x3473: 'zhòu,zhū',
-    0x3475: 'hàn',
-    0x3476: 'xì',
-    0x3477: 'tài',
-    0x3478: 'yáo',
-    0x3479: 'huì',
-    0x347A: 'jùn',
-    0x347B: 'mà',
-    0x347C: 'lüè',
-    0x347D: 'táng',
-    0x347E: 'yáo',
-    0x347F: 'zhào',
-    0x3480: 'zhāi,zhǎ',
-    0x3481: 'yǔ',
-    0x3482: 'zhuó',
-    0x3483: 'èr',
-    0x3484: 'rǎn',
-    0x3485: 'qǐ',
-    0x3486: 'chì',
-    0x3487: 'wǔ',
-    0x3488: 'hàn',
-    0x3489: 'tǎng',
-    0x348A: 'sè',
-    0x348C: 'qióng',
-    0x348D: 'léi',
-    0x348E: 'sà',
-    0x3491: 'kuǐ,huì',
-    0x3492: 'pú',
-    0x3493: 'tà',
-    0x3494: 'shú,dú,tù',
-    0x3495: 'yāng',
-    0x3496: 'ǒu',
-    0x3497: 'tái',
-    0x3499: 'mián',
-    0x349A: 'yìn,wěn',
-    0x349B: 'diào',
-    0x349C: 'yǔ',
-    0x349D: 'miè,wà',
-    0x349E: 'jùn',
-    0x349F: 'niǎo',
-    0x34A0: 'xiè',
-    0x34A1: 'yóu',
-    0x34A4: 'chè',
-    0x34A5: 'fēng',
-    0x34A6: 'lěi,lèi',
-    0x34A7: 'lì',
-    0x34A9: 'luǒ',
-    0x34AB: 'jì',
-    0x34B0: 'quán',
-    0x34B2: 'cái',
-    0x34B3: 'liǎng',
-    0x34B4: 'gǔ',
-    0x34B5: 'mào',
-    0x34B7: 'guǎ',
-    0x34B8: 'suì',
-    0x34BB: 'mào',
-    0x34BC: 'mán',
-    0x34BD: 'quān',
-    0x34BE: 'shì',
-    0x34BF: 'lí',
-    0x34C1: 'wǎng',
-    0x34C2: 'kòu',
-    0x34C3: 'dù',
-    0x34C4: 'zhèn',
-    0x34C5: 'tīng',
-    0x34C8: 'bìng',
-    0x34C9: 'huò',
-    0x34CA: 'dòng',
-    0x34CB: 'gòng',
-    0x34CC: 'chēng',
-    0x34CE: 'qīn,qìn,qǐn',
-    0x34CF: 'jiǒng',
-    0x34D0: 'lù',
-    0x34D1: 'xìng',
-    0x34D3: 'nán',
-    0x34D4: 'xiè',
-    0x34D6: 'bì',
-    0x34D7: 'jié',
-    0x34D8: 'sù',
-    0x34DA: 'gōng',
-    0x34DC: 'yòu',
-    0x34DD: 'xíng',
-    0x34DE: 'qià',
-    0x34DF: 'pí',
-    0x34E0: 'diàn,diǎn',
-    0x34E1: 'fǔ,guā',
-    0x34E2: 'luò',
-    0x34E3: 'qià,gē',
-    0x34E4: 'qià',
-    0x34E5: 'tāng',
-    0x34E6: 'bāi',
-    0x34E7: 'gān',
-    0x34E8: 'cí',
-    0x34E9: 'xuān,jiē',
-    0x34EA: 'lǎng',
-    0x34ED: 'shé',
-    0x34EF: 'lí',
-    0x34F0: 'huà',
-    0x34F1: 'tóu,shū',
-    0x34F2: 'piān',
-    0x34F3: 'dī',
-    0x34F4: 'ruǎn',
-    0x34F5: 'è',
-    0x34F6: 'qiè',
-    0x34F7: 'yì',
-    0x34F8: 'zhuō,dōu',
-    0x34F9: 'ruì,cuì,jì',
-    0x34FA: 'jiān,qián',
-    0x34FC: 'chì',
-    0x34FD: 'chóng',
-    0x34FE: 'xī,chí',
-    0x3500: 'lüè',
-    0x3501: 'dēng',
-    0x3502: 'lín',
-    0x3503: 'jué,xuē',
-    0x3504: 'sù',
-    0x3505: 'xiào',
-    0x3506: 'zàn',
-    0x3509: 'zhǔ',
-    0x350A: 'zhǎn,dǎn',
-    0x350B: 'jiān,lán',
-    0x350C: 'zòu,cǒu',
-    0x350D: 'chuā,zhá',
-    0x350E: 'xiè',
-    0x350F: 'lì,luǒ',
-    0x3511: 'chì',
-    0x3512: 'xí',
-    0x3513: 'jiǎn',
-    0x3515: 'jí',
-    0x3517: 'fèi,bèi,fú',
-    0x3518: 'chù',
-    0x3519: 'bēng',
-    0x351A: 'jié',
-    0x351C: 'bá',
-    0x351D: 'liǎng,liáng',
-    0x351E: 'kuài',
-    0x3520: 'xiā,hé',
-    0x3521: 'biē',
-    0x3522: 'jué,xuē',
-    0x3523: 'léi',
-    0x3524: 'xìn',
-    0x3525: 'bài,pí',
-    0x3526: 'yǎng',
-    0x3527: 'lǜ',
-    0x3528: 'bèi',
-    0x3529: 'è',
-    0x352A: 'lǔ',
-    0x352D: 'chè',
-    0x352E: 'nuó',
-    0x352F: 'xuán,suǎn',
-    0x3530: 'héng',
-    0x3531: 'yǔ',
-    0x3533: 'guǐ',
-    0x3534: 'yì',
-    0x3535: 'xuǎn',
-    0x3536: 'gòng,gǎn',
-    0x3537: 'lòu',
-    0x3538: 'tī',
-    0x3539: 'lè',
-    0x353A: 'shì',
-    0x353C: 'sǔn',
-    0x353D: 'yào',
-    0x353E: 'xiān,jié',
-    0x353F: 'zòu',
-    0x3541: 'què',
-    0x3542: 'yín,qín',
-    0x3543: 'xī',
-    0x3544: 'zhǐ',
-    0x3545: 'jiá',
-    0x3546: 'hù',
-    0x3547: 'lā',
-    0x3548: 'yǐ',
-    0x3549: 'kè',
-    0x354A: 'fū',
-    0x354B: 'qín',
-    0x354C: 'ài',
-    0x354E: 'kè',
-    0x354F: 'chú',
-    0x3550: 'xiě,xiè',
-    0x3551: 'chú',
-    0x3552: 'wēi',
-    0x3555: 'huàn',
-    0x3556: 'sù',
-    0x3557: 'yòu',
-    0x3559: 'jùn',
-    0x355A: 'zhǎo',
-    0x355B: 'xù',
-    0x355C: 'shǐ',
-    0x355E: 'shuā',
-    0x355F: 'kuì,kuài',
-    0x3560: 'shuāng',
-    0x3561: 'hé',
-    0x3562: 'gài,hài',
-    0x3563: 'yǎn',
-    0x3564: 'qiú',
-    0x3565: 'shēn',
-    0x3566: 'huà',
-    0x3567: 'xī',
-    0x3568: 'fàn',
-    0x3569: 'pàng',
-    0x356A: 'dǎn',
-    0x356B: 'fǎng,fēng',
-    0x356C: 'gōng,sòng',
-    0x356D: 'āo,ào',
-    0x356E: 'fǔ',
-    0x356F: 'nè',
-    0x3570: 'xuè,ma',
-    0x3571: 'yóu',
-    0x3572: 'huá,yíng',
-    0x3574: 'chén',
-    0x3575: 'guó',
-    0x3576: 'ň,ňg',
-    0x3577: 'huà,pā',
-    0x3578: 'lì',
-    0x3579: 'fá',
-    0x357A: 'xiāo',
-    0x357B: 'pǒu',
-    0x357D: 'sì',
-    0x3580: 'lè',
-    0x3581: 'lìn',
-    0x3582: 'yì',
-    0x3583: 'hǒu,hòu',
-    0x3585: 'xù',
-    0x3586: 'qú',
-    0x3587: 'ér',
-    0x358A: 'xún',
-    0x358F: 'niè',
-    0x3590: 'wěi',
-    0x3591: 'xiè',
-    0x3592: 'tí',
-    0x3593: 'hóng',
-    0x3594: 'tǔn',
-    0x3595: 'niè,xīn',
-    0x3596: 'niè',
-    0x3597: 'yín',
-    0x3598: 'zhēn',
-    0x359E: 'wāi',
-    0x359F: 'shòu',
-    0x35A0: 'nuò',
-    0x35A1: 'yè',
-    0x35A2: 'qí',
-    0x35A3: 'tòu',
-    0x35A4: 'hán',
-    0x35A5: 'jùn',
-    0x35A6: 'dǒng',
-    0x35A7: 'hūn,wěn',
-    0x35A8: 'lù',
-    0x35A9: 'jū,sǒu',
-    0x35AA: 'huò,guó,xù',
-    0x35AB: 'líng',
-    0x35AD: 'tiǎn',
-    0x35AE: 'lún',
-    0x35B5: 'gé',
-    0x35B6: 'yān,yè,yīn',
-    0x35B7: 'shí,tí',
-    0x35B8: 'xué,niā',
-    0x35B9: 'pēn,fèn',
-    0x35BA: 'chǔn',
-    0x35BB: 'niú,ròu',
-    0x35BC: 'duǒ',
-    0x35BD: 'zé',
-    0x35BE: 'è',
-    0x35BF: 'xié,yé',
-    0x35C0: 'yōu',
-    0x35C1: 'è',
-    0x35C2: 'shěng',
-    0x35C3: 'wěn,hūn',
-    0x35C4: 'kū',
-    0x35C5: 'hú',
-    0x35C6: 'gé',
-    0x35C7: 'xiá,ya',
-    0x35C8: 'màn',
-    0x35C9: 'lüè,è',
-    0x35CA: 'jí,léi',
-    0x35CB: 'hóu',
-    0x35CC: 'zhì',
-    0x35CF: 'wāi',
-    0x35D1: 'bai',
-    0x35D2: 'ài',
-    0x35D3: 'zhuī',
-    0x35D4: 'qiān',
-    0x35D5: 'gòu,gōu',
-    0x35D6: 'dàn',
-    0x35D7: 'bēi',
-    0x35D8: 'bó',
-    0x35D9: 'chū,nà,zhōu',
-    0x35DA: 'lì',
-    0x35DB: 'xiào',
-    0x35DC: 'xiù',
-    0x35E2: 'hóng,dòng,hòng',
-    0x35E3: 'tì',
-    0x35E4: 'cù',
-    0x35E5: 'kuò,guō',
-    0x35E6: 'láo',
-    0x35E7: 'zhì,dié',
-    0x35E8: 'xiē,ǎi',
-    0x35E9: 'xī',
-    0x35EB: 'qiè',
-    0x35EC: 'zhā',
-    0x35ED: 'xī',
-    0x35F0: 'cóng',
-    0x35F1: 'jí',
-    0x35F2: 'huò',
-    0x35F3: 'tǎ,dā',
-    0x35F4: 'yán',
-    0x35F5: 'xù',
-    0x35F6: 'pō',
-    0x35F7: 'sǎi',
-    0x35FB: 'guō',
-    0x35FC: 'yè',
-    0x35FD: 'xiǎng',
-    0x35FE: 'xuē',
-    0x35FF: 'hé,xià,xiā',
-    0x3600: 'zuò',
-    0x3601: 'yì',
-    0x3602: 'cí',
-    0x3604: 'lēng',
-    0x3605: 'xián',
-    0x3606: 'tǎi',
-    0x3607: 'róng',
-    0x3608: 'yì,nǐ',
-    0x3609: 'zhì',
-    0x360A: 'xī,yì',
-    0x360B: 'xián',
-    0x360C: 'jù',
-    0x360D: 'jí',
-    0x360E: 'hǎn',
-    0x3610: 'pào',
-    0x3611: 'lì',
-    0x3613: 'lán',
-    0x3614: 'sǎi',
-    0x3615: 'hǎn,lán',
-    0x3616: 'yán',
-    0x3617: 'qū',
-    0x3619: 'yán',
-    0x361A: 'hǎn',
-    0x361B: 'kān',
-    0x361C: 'chǐ',
-    0x361D: 'niè',
-    0x361E: 'huò',
-    0x3620: 'bì',
-    0x3621: 'xiá',
-    0x3622: 'wěng',
-    0x3623: 'xuán,yuán',
-    0x3624: 'wān',
-    0x3625: 'yóu',
-    0x3626: 'qín',
-    0x3627: 'xù',
-    0x3628: 'niè',
-    0x3629: 'bì',
-    0x362A: 'hào',
-    0x362B: 'jǐng',
-    0x362C: 'ào,wù',
-    0x362D: 'ào',
-    0x3630: 'zhēn',
-    0x3631: 'tān',
-    0x3632: 'jú',
-    0x3634: 'zuò',
-    0x3635: 'bù',
-    0x3636: 'jié',
-    0x3637: 'ài',
-    0x3638: 'zàng,zuò',
-    0x3639: 'cí',
-    0x363A: 'fá',
-    0x363F: 'niè',
-    0x3640: 'liù,jiù',
-    0x3641: 'méi,mù',
-    0x3642: 'duì,wèng',
-    0x3643: 'bāng',
-    0x3644: 'bì',
-    0x3645: 'bǎo',
-    0x3647: 'chù',
-    0x3648: 'xià',
-    0x3649: 'tiǎn',
-    0x364A: 'cháng,zhàng',
-    0x364D: 'duō',
-    0x364E: 'wēi',
-    0x364F: 'fù',
-    0x3650: 'duǒ',
-    0x3651: 'yǔ',
-    0x3652: 'yě',
-    0x3653: 'kuí',
-    0x3654: 'wěi,hán',
-    0x3655: 'kuài',
-    0x3657: 'wēi',
-    0x3658: 'yāo',
-    0x3659: 'lǒng',
-    0x365A: 'xīng',
-    0x365B: 'bǔ',
-    0x365C: 'chí',
-    0x365D: 'xié',
-    0x365E: 'niè',
-    0x365F: 'lǎng',
-    0x3660: 'yī,yì',
-    0x3661: 'zōng',
-    0x3662: 'mán',
-    0x3663: 'zhàng',
-    0x3664: 'xià',
-    0x3665: 'gùn',
-    0x3666: 'xié',
-    0x3668: 'jì',
-    0x3669: 'liáo',
-    0x366A: 'yì',
-    0x366B: 'jí',
-    0x366C: 'yín',
-    0x366E: 'dā,da',
-    0x366F: 'yì',
-    0x3670: 'xiè',
-    0x3671: 'hào',
-    0x3672: 'yǒng',
-    0x3673: 'kǎn,hǎn',
-    0x3674: 'chàn',
-    0x3675: 'tái',
-    0x3676: 'táng',
-    0x3677: 'zhí,zhé',
-    0x3678: 'bào',
-    0x3679: 'méng',
-    0x367A: 'kuí,guì',
-    0x367B: 'chán',
-    0x367C: 'lěi',
-    0x367E: 'xì',
-    0x3680: 'xī',
-    0x3681: 'qiào',
-    0x3682: 'nàng',
-    0x3683: 'yūn',
-    0x3685: 'lóng',
-    0x3686: 'fù',
-    0x3687: 'zōng',
-    0x3689: 'gǔ',
-    0x368A: 'kāi',
-    0x368B: 'diāo',
-    0x368C: 'huà',
-    0x368D: 'kuǐ,kuì',
-    0x368F: 'gǎo',
-    0x3690: 'tào',
-    0x3692: 'shǎn',
-    0x3693: 'lǎi',
-    0x3694: 'niè,xìng',
-    0x3695: 'fú',
-    0x3696: 'gǎo,zé',
-    0x3697: 'qié',
-    0x3698: 'bàn,hè,fú',
-    0x3699: 'jiā',
-    0x369A: 'kōng,kuāng',
-    0x369B: 'xì',
-    0x369C: 'yù,xù',
-    0x369D: 'zhuī',
-    0x369E: 'shěn',
-    0x369F: 'chuò',
-    0x36A0: 'xiāo',
-    0x36A1: 'jǐ',
-    0x36A2: 'nú,wǔ',
-    0x36A3: 'xiáo',
-    0x36A4: 'yì',
-    0x36A5: 'yú',
-    0x36A6: 'yí',
-    0x36A7: 'yǎn',
-    0x36A8: 'shěn',
-    0x36A9: 'rǎn',
-    0x36AA: 'hào',
-    0x36AB: 'sà',
-    0x36AC: 'jūn',
-    0x36AD: 'yóu',
-    0x36AF: 'xín',
-    0x36B0: 'pēi,bǐ',
-    0x36B1: 'qiū',
-    0x36B2: 'chān,diǎn,diàn',
-    0x36B4: 'bù',
-    0x36B5: 'dōng',
-    0x36B6: 'sì,yí',
-    0x36B7: 'ěr',
-    0x36B9: 'mǎo,liǔ',
-    0x36BA: 'yùn',
-    0x36BB: 'jī',
-    0x36BD: 'qiǎo',
-    0x36BE: 'xiōng',
-    0x36BF: 'páo',
-    0x36C0: 'chú',
-    0x36C1: 'pēng',
-    0x36C2: 'nuǒ',
-    0x36C3: 'jié',
-    0x36C4: 'yī',
-    0x36C5: 'èr',
-    0x36C6: 'duò,duǒ',
-    0x36CA: 'duǒ',
-    0x36CD: 'qiè,xiǎn,xiá',
-    0x36CE: 'lǚ',
-    0x36CF: 'qiú',
-    0x36D0: 'sǒu',
-    0x36D1: 'càn',
-    0x36D2: 'dòu',
-    0x36D3: 'xī',
-    0x36D4: 'fēng,péng',
-    0x36D5: 'yì,è',
-    0x36D6: 'suō',
-    0x36D7: 'qiē,zuō,suō',
-    0x36D8: 'pò',
-    0x36D9: 'xīn,qiè',
-    0x36DA: 'tǒng,yǒng',
-    0x36DB: 'xìn',
-    0x36DC: 'yóu',
-    0x36DD: 'bèi',
-    0x36DE: 'lòng',
-    0x36E3: 'yún',
-    0x36E4: 'lí',
-    0x36E5: 'tà',
-    0x36E6: 'lǎn',
-    0x36E7: 'mǎn',
-    0x36E8: 'qiǎng',
-    0x36E9: 'zhóu',
-    0x36EA: 'yàn,yān',
-    0x36EB: 'xī',
-    0x36EC: 'lù',
-    0x36ED: 'xī',
-    0x36EE: 'sǎo',
-    0x36EF: 'fàn,miǎn,zhuàn',
-    0x36F1: 'wěi,wēi',
-    0x36F2: 'fà',
-    0x36F3: 'yì',
-    0x36F4: 'nǎo',
-    0x36F5: 'chēng',
-    0x36F6: 'tàn',
-    0x36F7: 'jī',
-    0x36F8: 'shù',
-    0x36F9: 'pián',
-    0x36FA: 'ān',
-    0x36FB: 'kuā',
-    0x36FC: 'chā,shà',
-    0x36FE: 'xián',
-    0x36FF: 'zhì',
-    0x3702: 'fēng',
-    0x3703: 'liàn',
-    0x3704: 'xún',
-    0x3705: 'xù',
-    0x3706: 'mì',
-    0x3707: 'huì,yè',
-    0x3708: 'mù',
-    0x3709: 'yōng',
-    0x370A: 'zhǎn',
-    0x370B: 'yì',
-    0x370C: 'nǒu,gòu,kòu',
-    0x370D: 'táng',
-    0x370E: 'xī,xì',
-    0x370F: 'yún',
-    0x3710: 'shù',
-    0x3711: 'fú',
-    0x3712: 'yì',
-    0x3713: 'dá',
-    0x3715: 'lián',
-    0x3716: 'cáo',
-    0x3717: 'cān,sēn',
-    0x3718: 'jù,qù,chá',
-    0x3719: 'lù',
-    0x371A: 'sù',
-    0x371B: 'nèn',
-    0x371C: 'ào',
-    0x371D: 'ǎn,yǎn',
-    0x371E: 'qiàn,cán',
-    0x3720: 'cuī',
-    0x3721: 'cōng',
-    0x3723: 'rán,rǎn',
-    0x3724: 'niǎn,tiǎn,tán',
-    0x3725: 'mái',
-    0x3726: 'xín',
-    0x3727: 'yuè',
-    0x3728: 'nái',
-    0x3729: 'ào',
-    0x372A: 'shēn',
-    0x372B: 'mà',
-    0x372E: 'làn,lán',
-    0x372F: 'xī',
-    0x3730: 'yuè',
-    0x3731: 'zhì',
-    0x3732: 'wěng',
-    0x3733: 'huái',
-    0x3734: 'mèng',
-    0x3735: 'niǎo',
-    0x3736: 'wǎn',
-    0x3737: 'mí,xiǎn',
-    0x3738: 'niè',
-    0x3739: 'qú',
-    0x373A: 'zàn',
-    0x373B: 'liàn',
-    0x373C: 'zhí',
-    0x373D: 'zǐ',
-    0x373E: 'hái',
-    0x373F: 'xù',
-    0x3740: 'hào',
-    0x3741: 'xuān,qióng',
-    0x3742: 'zhì,zhè',
-    0x3743: 'miǎn',
-    0x3744: 'chún',
-    0x3745: 'gòu',
-    0x3747: 'chún',
-    0x3748: 'luán',
-    0x3749: 'zhù',
-    0x374A: 'shǒu',
-    0x374B: 'liǎo',
-    0x374C: 'jiù',
-    0x374D: 'xiě',
-    0x374E: 'dìng',
-    0x374F: 'jiè',
-    0x3750: 'róng',
-    0x3751: 'máng',
-    0x3753: 'kè',
-    0x3754: 'yǎo',
-    0x3755: 'níng',
-    0x3756: 'yí',
-    0x3757: 'láng,lǎng',
-    0x3758: 'yóng',
-    0x3759: 'yín',
-    0x375A: 'yán',
-    0x375B: 'sù',
-    0x375D: 'lín',
-    0x375E: 'yā,yà',
-    0x375F: 'máo',
-    0x3760: 'míng',
-    0x3761: 'zuì',
-    0x3762: 'yǔ',
-    0x3763: 'yì',
-    0x3764: 'gòu',
-    0x3765: 'mǐ',
-    0x3766: 'jùn',
-    0x3767: 'wěn',
-    0x3769: 'kāng',
-    0x376A: 'diàn',
-    0x376B: 'lóng',
-    0x376D: 'xǐng',
-    0x376E: 'cuì',
-    0x376F: 'qiáo',
-    0x3770: 'mián',
-    0x3771: 'mèng',
-    0x3772: 'qǐn',
-    0x3774: 'wán',
-    0x3775: 'dé,ài',
-    0x3776: 'ài',
-    0x3778: 'biàn',
-    0x3779: 'nóu',
-    0x377A: 'lián',
-    0x377B: 'jǐn',
-    0x377C: 'yū',
-    0x377D: 'chuí',
-    0x377E: 'zuǒ',
-    0x377F: 'bǒ',
-    0x3780: 'huī',
-    0x3781: 'yào',
-    0x3782: 'tuǐ,tuì',
-    0x3783: 'jì',
-    0x3784: 'ān',
-    0x3785: 'luò',
-    0x3786: 'jǐ',
-    0x3787: 'wěi',
-    0x3788: 'bō',
-    0x3789: 'zā',
-    0x378A: 'xù',
-    0x378B: 'niǎn,jí',
-    0x378C: 'yùn',
-    0x378E: 'bǎ,pā',
-    0x378F: 'zhé,jié',
-    0x3790: 'jū',
-    0x3791: 'wěi',
-    0x3792: 'xiè,xì',
-    0x3793: 'qì,jī',
-    0x3794: 'yí',
-    0x3795: 'xiè',
-    0x3796: 'cí,cì',
-    0x3797: 'qiú',
-    0x3798: 'dū',
-    0x3799: 'niào',
-    0x379A: 'qì,zhǎ',
-    0x379B: 'jǐ',
-    0x379C: 'tuī',
-    0x379E: 'sóng',
-    0x379F: 'diàn,dǐng',
-    0x37A0: 'láo',
-    0x37A1: 'zhǎn',
-    0x37A4: 'yín,cén',
-    0x37A5: 'cén',
-    0x37A6: 'jǐ',
-    0x37A7: 'huì',
-    0x37A8: 'zǐ',
-    0x37A9: 'lán',
-    0x37AA: 'náo',
-    0x37AB: 'jù',
-    0x37AC: 'qìn',
-    0x37AD: 'dài',
-    0x37AF: 'jié',
-    0x37B0: 'xǔ',
-    0x37B1: 'cōng',
-    0x37B2: 'yòng',
-    0x37B3: 'dǒu',
-    0x37B4: 'chí,mín',
-    0x37B6: 'mǐn',
-    0x37B7: 'huáng',
-    0x37B8: 'suì',
-    0x37B9: 'kě',
-    0x37BA: 'zú',
-    0x37BB: 'hào',
-    0x37BC: 'chéng',
-    0x37BD: 'xuè',
-    0x37BE: 'ní',
-    0x37BF: 'chì',
-    0x37C0: 'lián',
-    0x37C1: 'àn',
-    0x37C2: 'mǔ',
-    0x37C3: 'sī',
-    0x37C4: 'xiáng',
-    0x37C5: 'yáng',
-    0x37C6: 'huá',
-    0x37C7: 'cuò,cuó',
-    0x37C8: 'qiú',
-    0x37C9: 'láo',
-    0x37CA: 'fú',
-    0x37CB: 'duì',
-    0x37CC: 'máng',
-    0x37CD: 'láng,lǎng',
-    0x37CE: 'tuǒ,tuǐ',
-    0x37CF: 'hán',
-    0x37D0: 'mǎng',
-    0x37D1: 'bó',
-    0x37D2: 'qūn',
-    0x37D3: 'qí',
-    0x37D4: 'hán',
-    0x37D6: 'lòng,lóng',
-    0x37D8: 'tiáo',
-    0x37D9: 'zé',
-    0x37DA: 'qí',
-    0x37DB: 'zàn',
-    0x37DC: 'mí',
-    0x37DD: 'péi',
-    0x37DE: 'zhàn',
-    0x37DF: 'xiàng',
-    0x37E0: 'gǎng',
-    0x37E2: 'qí',
-    0x37E4: 'lù',
-    0x37E6: 'yùn',
-    0x37E7: 'è',
-    0x37E8: 'duān',
-    0x37E9: 'mín',
-    0x37EA: 'wēi,wěi',
-    0x37EB: 'quán',
-    0x37EC: 'sǒu',
-    0x37ED: 'mín',
-    0x37EE: 'tū',
-    0x37F0: 'mǐng',
-    0x37F1: 'yǎo',
-    0x37F2: 'jué',
-    0x37F3: 'lì',
-    0x37F4: 'kuài',
-    0x37F5: 'gǎng',
-    0x37F6: 'yuán',
-    0x37F7: 'da',
-    0x37F9: 'láo',
-    0x37FA: 'lóu',
-    0x37FB: 'qiàn,zhǎn',
-    0x37FC: 'áo',
-    0x37FD: 'biǎo,biāo',
-    0x37FE: 'yōng',
-    0x37FF: 'mǎng,máng',
-    0x3800: 'dǎo',
-    0x3802: 'áo',
-    0x3804: 'xí',
-    0x3805: 'fú,fù',
-    0x3806: 'dān',
-    0x3807: 'jiù',
-    0x3808: 'rùn',
-    0x3809: 'tóng',
-    0x380A: 'qū',
-    0x380B: 'è',
-    0x380C: 'qī',
-    0x380D: 'jí',
-    0x380E: 'jí,jié',
-    0x380F: 'huá',
-    0x3810: 'jiào',
-    0x3811: 'zuì',
-    0x3812: 'biǎo',
-    0x3813: 'méng',
-    0x3814: 'bài',
-    0x3815: 'wěi',
-    0x3816: 'yǐ',
-    0x3817: 'ào',
-    0x3818: 'yǔ',
-    0x3819: 'háo',
-    0x381A: 'duì',
-    0x381B: 'wò',
-    0x381C: 'nì',
-    0x381D: 'cuán',
-    0x381F: 'lí',
-    0x3820: 'lú',
-    0x3821: 'niǎo',
-    0x3822: 'huái',
-    0x3823: 'lì',
-    0x3825: 'lǜ,léi,lěi',
-    0x3826: 'fēng',
-    0x3827: 'mǐ',
-    0x3828: 'yù',
-    0x382A: 'jù',
-    0x382D: 'zhǎn',
-    0x382E: 'pēng,gāng',
-    0x382F: 'yǐ',
-    0x3831: 'jì,qǐ',
-    0x3832: 'bǐ',
-    0x3834: 'rèn',
-    0x3835: 'huāng',
-    0x3836: 'fán',
-    0x3837: 'gé',
-    0x3838: 'kù',
-    0x3839: 'jiè',
-    0x383A: 'shā,miáo',
-    0x383C: 'sī',
-    0x383D: 'tóng',
-    0x383E: 'yuān',
-    0x383F: 'zī,cǐ',
-    0x3840: 'bì',
-    0x3841: 'kuǎ',
-    0x3842: 'lì',
-    0x3843: 'huāng',
-    0x3844: 'xún',
-    0x3845: 'nuǒ',
-    0x3847: 'zhé,jiē',
-    0x3848: 'wèn,mén,miǎn',
-    0x3849: 'xián',
-    0x384A: 'qià',
-    0x384B: 'yé,ān',
-    0x384C: 'mào',
-    0x384F: 'shù,xū,tóu,shū',
-    0x3851: 'qiāo,jiǎo',
-    0x3852: 'zhūn',
-    0x3853: 'kūn',
-    0x3854: 'wù',
-    0x3855: 'yīng',
-    0x3856: 'chuáng',
-    0x3857: 'tí',
-    0x3858: 'lián,lín',
-    0x3859: 'bī',
-    0x385A: 'gōu',
-    0x385B: 'máng',
-    0x385C: 'xiè,xuě',
-    0x385D: 'fèng',
-    0x385E: 'lóu,lǚ',
-    0x385F: 'zāo',
-    0x3860: 'zhèng',
-    0x3861: 'chú',
-    0x3862: 'màn',
-    0x3863: 'lóng',
-    0x3865: 'yìn',
-    0x3866: 'pīn',
-    0x3867: 'zhèng',
-    0x3868: 'jiān,qiān',
-    0x3869: 'luán',
-    0x386A: 'nié',
-    0x386B: 'yì',
-    0x386D: 'jì',
-    0x386E: 'jí',
-    0x386F: 'zhái,dù,duó',
-    0x3870: 'yǔ',
-    0x3871: 'jiǔ',
-    0x3872: 'huán',
-    0x3873: 'zhǐ',
-    0x3874: 'lā',
-    0x3875: 'líng',
-    0x3876: 'zhǐ',
-    0x3877: 'běn',
-    0x3878: 'zhà,zhǎ,chá',
-    0x3879: 'jū',
-    0x387A: 'dàn',
-    0x387B: 'liào',
-    0x387C: 'yì',
-    0x387D: 'zhào',
-    0x387E: 'xiàn',
-    0x387F: 'chì',
-    0x3880: 'cì',
-    0x3881: 'chǐ,shǐ',
-    0x3882: 'yǎn,tuí,duī',
-    0x3883: 'láng',
-    0x3884: 'dòu',
-    0x3885: 'lòng',
-    0x3886: 'chán',
-    0x3888: 'tuí,duī',
-    0x3889: 'chá',
-    0x388A: 'ǎi,yǐ',
-    0x388B: 'chǐ',
-    0x388D: 'yǐng',
-    0x388E: 'zhé',
-    0x388F: 'tóu,yǔ,yú',
-    0x3891: 'tuí',
-    0x3892: 'chá',
-    0x3893: 'yǎo',
-    0x3894: 'zǒng',
-    0x3896: 'pān,bān',
-    0x3897: 'qiào',
-    0x3898: 'lián',
-    0x3899: 'qín',
-    0x389A: 'lǔ',
-    0x389B: 'yàn,qiān',
-    0x389C: 'kāng,kàng',
-    0x389D: 'sū',
-    0x389E: 'yì',
-    0x389F: 'chān',
-    0x38A0: 'jiǒng',
-    0x38A1: 'jiǎng',
-    0x38A3: 'jìng',
-    0x38A5: 'dòng',
-    0x38A7: 'juàn',
-    0x38A8: 'hàn',
-    0x38A9: 'dì',
-    0x38AC: 'hóng',
-    0x38AE: 'chí',
-    0x38AF: 'diāo,mín',
-    0x38B0: 'bì',
-    0x38B2: 'xùn',
-    0x38B3: 'lú',
-    0x38B5: 'xié,shè',
-    0x38B6: 'bì',
-    0x38B8: 'bì',
-    0x38BA: 'xián',
-    0x38BB: 'ruì',
-    0x38BC: 'biè',
-    0x38BD: 'ěr',
-    0x38BE: 'juàn',
-    0x38C0: 'zhèn',
-    0x38C1: 'bèi',
-    0x38C2: 'è',
-    0x38C3: 'yǔ',
-    0x38C4: 'qú',
-    0x38C5: 'zàn',
-    0x38C6: 'mí',
-    0x38C7: 'yì',
-    0x38C8: 'sì',
-    0x38CC: 'shàn',
-    0x38CD: 'tái',
-    0x38CE: 'mù',
-    0x38CF: 'jìng',
-    0x38D0: 'biàn',
-    0x38D1: 'róng',
-    0x38D2: 'cèng',
-    0x38D3: 'càn',
-    0x38D4: 'dīng',
-    0x38D9: 'dí,zhòu',
-    0x38DA: 'tǒng,tóng,dòng',
-    0x38DB: 'tà,huì',
-    0x38DC: 'xíng',
-    0x38DD: 'sōng',
-    0x38DE: 'duó',
-    0x38DF: 'xì',
-    0x38E0: 'tāo,tóng',
-    0x38E2: 'tí',
-    0x38E3: 'shàn',
-    0x38E4: 'jiàn',
-    0x38E5: 'zhì',
-    0x38E6: 'wēi',
-    0x38E7: 'yìn',
-    0x38EA: 'huǎn',
-    0x38EB: 'zhǒng,dòng',
-    0x38EC: 'qì',
-    0x38ED: 'zōng',
-    0x38EF: 'xiè',
-    0x38F0: 'xiè',
-    0x38F1: 'zé',
-    0x38F2: 'wéi',
-    0x38F5: 'tà',
-    0x38F6: 'zhān',
-    0x38F7: 'nìng',
-    0x38FB: 'yì',
-    0x38FC: 'rěn',
-    0x38FD: 'shù,nù',
-    0x38FE: 'chà',
-    0x38FF: 'zhuó,diǎo',
-    0x3901: 'miǎn',
-    0x3902: 'jí',
-    0x3903: 'fáng',
-    0x3904: 'pèi',
-    0x3905: 'ài,xì,jì',
-    0x3906: 'fàn',
-    0x3907: 'ǎo',
-    0x3908: 'qìn',
-    0x3909: 'qiā,yà',
-    0x390A: 'xiào',
-    0x390B: 'fēn',
-    0x390C: 'gān',
-    0x390D: 'qiāo,qiǎo',
-    0x390E: 'gē',
-    0x390F: 'tóng',
-    0x3910: 'chān',
-    0x3911: 'yòu',
-    0x3912: 'gāo',
-    0x3913: 'bèn',
-    0x3914: 'fù',
-    0x3915: 'chù,pò',
-    0x3916: 'zhù',
-    0x3918: 'zhòu',
-    0x391A: 'háng',
-    0x391B: 'nín',
-    0x391C: 'jué',
-    0x391D: 'chōng',
-    0x391E: 'chà,duó,zé',
-    0x391F: 'kǒng',
-    0x3920: 'liè',
-    0x3921: 'lì,liè',
-    0x3922: 'yù',
-    0x3924: 'yú',
-    0x3925: 'hài',
-    0x3926: 'lì',
-    0x3927: 'hóu',
-    0x3928: 'gǒng',
-    0x3929: 'kè',
-    0x392A: 'yuàn',
-    0x392B: 'dé',
-    0x392C: 'huì',
-    0x392E: 'guàng',
-    0x392F: 'jiǒng',
-    0x3930: 'zuò',
-    0x3931: 'fù,dòu',
-    0x3932: 'qiè',
-    0x3933: 'běi',
-    0x3934: 'chè,shè,dié',
-    0x3935: 'cí',
-    0x3936: 'máng,màng',
-    0x3937: 'hān',
-    0x3938: 'xì',
-    0x3939: 'qiú,jiù',
-    0x393A: 'huǎng',
-    0x393D: 'chóu',
-    0x393E: 'sàn,tàn',
-    0x393F: 'yān',
-    0x3940: 'zhí,dé',
-    0x3941: 'dé',
-    0x3942: 'tè',
-    0x3943: 'mèn',
-    0x3944: 'líng',
-    0x3945: 'shòu',
-    0x3946: 'tuì',
-    0x3947: 'cán',
-    0x3948: 'dié',
-    0x3949: 'chè',
-    0x394A: 'péng,pēng',
-    0x394B: 'yī',
-    0x394C: 'jú',
-    0x394D: 'jì',
-    0x394E: 'lái',
-    0x394F: 'tiǎn',
-    0x3950: 'yuàn',
-    0x3952: 'cǎi,cāi',
-    0x3953: 'qī',
-    0x3954: 'yù',
-    0x3955: 'lián',
-    0x3956: 'cōng',
-    0x395A: 'yú,yǔ',
-    0x395B: 'jí,kè',
-    0x395C: 'wèi',
-    0x395D: 'mǐ',
-    0x395E: 'suì',
-    0x395F: 'xié',
-    0x3960: 'xū',
-    0x3961: 'chì',
-    0x3962: 'qiú,jiū',
-    0x3963: 'huì',
-    0x3965: 'yú',
-    0x3966: 'qiè',
-    0x3967: 'shùn',
-    0x3968: 'shuì,wěi',
-    0x3969: 'duǒ',
-    0x396A: 'lóu',
-    0x396C: 'páng',
-    0x396D: 'tài',
-    0x396E: 'zhòu,chǎo',
-    0x396F: 'yǐn',
-    0x3970: 'sāo',
-    0x3971: 'fěi',
-    0x3972: 'chēn,shèn',
-    0x3973: 'yuán',
-    0x3974: 'yí,tí',
-    0x3975: 'hùn',
-    0x3976: 'sè,qiān',
-    0x3977: 'yè',
-    0x3978: 'mǐn',
-    0x3979: 'fěn',
-    0x397A: 'hé',
-    0x397C: 'yìn,yān',
-    0x397D: 'cè,zé',
-    0x397E: 'nì',
-    0x397F: 'ào',
-    0x3980: 'féng',
-    0x3981: 'lián,liǎn',
-    0x3982: 'cháng',
-    0x3983: 'chǎn',
-    0x3984: 'má',
-    0x3985: 'diē,dì,chài',
-    0x3986: 'hū,xiā',
-    0x3987: 'lù',
-    0x3989: 'yì',
-    0x398A: 'huá',
-    0x398B: 'zhā',
-    0x398C: 'hū,xù',
-    0x398D: 'è',
-    0x398E: 'huò',
-    0x398F: 'sǔn,xuàn',
-    0x3990: 'nì',
-    0x3991: 'xiàn,hān',
-    0x3992: 'lí',
-    0x3993: 'xiàn,rǎn',
-    0x3994: 'yàn',
-    0x3995: 'lóng',
-    0x3996: 'mèn',
-    0x3997: 'jīn,jìn',
-    0x3998: 'jī',
-    0x399A: 'biǎn',
-    0x399B: 'yǔ,yú',
-    0x399C: 'huò,xuè',
-    0x399D: 'miǎo',
-    0x399E: 'chóu',
-    0x399F: 'mái',
-    0x39A1: 'lè',
-    0x39A2: 'jié',
-    0x39A3: 'wèi',
-    0x39A4: 'yì',
-    0x39A5: 'xuān,xiǎn',
-    0x39A6: 'xì',
-    0x39A7: 'cǎn',
-    0x39A8: 'lán',
-    0x39A9: 'yǐn',
-    0x39AA: 'xiè',
-    0x39AB: 'zā',
-    0x39AC: 'luǒ',
-    0x39AD: 'líng',
-    0x39AE: 'qián',
-    0x39AF: 'huò',
-    0x39B0: 'jiān',
-    0x39B1: 'wǒ',
-    0x39B4: 'gé',
-    0x39B5: 'zhū',
-    0x39B6: 'dié,yǒng',
-    0x39B7: 'yǒng',
-    0x39B8: 'jǐ',
-    0x39B9: 'yáng',
-    0x39BA: 'rù',
-    0x39BB: 'xí',
-    0x39BC: 'shuàng',
-    0x39BD: 'yù',
-    0x39BE: 'yí',
-    0x39BF: 'qiǎn,hù',
-    0x39C0: 'jí',
-    0x39C1: 'qù,hé',
-    0x39C2: 'tián',
-    0x39C3: 'shōu,jiū',
-    0x39C4: 'qiǎn',
-    0x39C5: 'mù,dāo',
-    0x39C6: 'jīn',
-    0x39C7: 'mǎo',
-    0x39C8: 'yǐn',
-    0x39C9: 'gài,hài,yè',
-    0x39CA: 'pō,bá',
-    0x39CB: 'xuǎn',
-    0x39CC: 'mào',
-    0x39CD: 'fǎng,bēng',
-    0x39CE: 'yá,yà,qiā',
-    0x39CF: 'gāng',
-    0x39D0: 'sǒng',
-    0x39D1: 'huī',
-    0x39D2: 'yù',
-    0x39D3: 'guā',
-    0x39D4: 'guài',
-    0x39D5: 'liǔ',
-    0x39D6: 'è',
-    0x39D7: 'zǐ,jǐ,zhǐ',
-    0x39D8: 'zì',
-    0x39D9: 'bì,bié',
-    0x39DA: 'wǎ',
-    0x39DC: 'liè',
-    0x39DF: 'kuǎi',
-    0x39E1: 'hài,wèi',
-    0x39E2: 'yīn',
-    0x39E3: 'zhū',
-    0x39E4: 'chòng',
-    0x39E5: 'xiǎn',
-    0x39E6: 'xuàn,hōng',
-    0x39E8: 'qiú',
-    0x39E9: 'pèi',
-    0x39EA: 'guǐ,wěi',
-    0x39EB: 'ér,ruán,ruí',
-    0x39EC: 'gǒng',
-    0x39ED: 'qióng',
-    0x39EE: 'hū',
-    0x39EF: 'lǎo',
-    0x39F0: 'lì',
-    0x39F1: 'chèn',
-    0x39F2: 'sǎn',
-    0x39F3: 'zhuò,bāi',
-    0x39F4: 'wǒ,é',
-    0x39F5: 'póu',
-    0x39F6: 'kēng',
-    0x39F7: 'tùn',
-    0x39F8: 'pēng',
-    0x39F9: 'tè',
-    0x39FA: 'tà',
-    0x39FB: 'zhuó,zú,dū',
-    0x39FC: 'biào',
-    0x39FD: 'gù',
-    0x39FE: 'hū',
-    0x3A00: 'bǐng',
-    0x3A01: 'zhì,zhí',
-    0x3A02: 'dǒng',
-    0x3A03: 'duǐ,chéng',
-    0x3A04: 'zhōu,zhào,tiáo',
-    0x3A05: 'nèi,ruì',
-    0x3A06: 'lǐn',
-    0x3A07: 'pó',
-    0x3A08: 'jǐ',
-    0x3A09: 'mín,wěn',
-    0x3A0A: 'wěi,tuǒ,duò',
-    0x3A0B: 'chě',
-    0x3A0C: 'gòu',
-    0x3A0D: 'bāng',
-    0x3A0E: 'rú',
-    0x3A0F: 'tān',
-    0x3A10: 'bǔ',
-    0x3A11: 'zōng',
-    0x3A12: 'kuī',
-    0x3A13: 'láo',
-    0x3A14: 'hàn',
-    0x3A15: 'yíng',
-    0x3A16: 'zhì',
-    0x3A17: 'jié',
-    0x3A18: 'xǐng',
-    0x3A19: 'xié,xì',
-    0x3A1A: 'xún,sǔn',
-    0x3A1B: 'shǎn,shàn',
-    0x3A1C: 'qián',
-    0x3A1D: 'xiē',
-    0x3A1E: 'sù',
-    0x3A1F: 'hāi',
-    0x3A20: 'mì',
-    0x3A21: 'hún',
-    0x3A22: 'pī',
-    0x3A24: 'huì',
-    0x3A25: 'nà',
-    0x3A26: 'sǒng',
-    0x3A27: 'bèn',
-    0x3A28: 'chōu,liù',
-    0x3A29: 'jié',
-    0x3A2A: 'huàng,huǎng',
-    0x3A2B: 'lǎn',
-    0x3A2D: 'hù',
-    0x3A2E: 'dōu',
-    0x3A2F: 'huò',
-    0x3A30: 'gǔn',
-    0x3A31: 'yáo',
-    0x3A32: 'cè',
-    0x3A33: 'guǐ,jì',
-    0x3A34: 'jiàn',
-    0x3A35: 'jiǎn',
-    0x3A36: 'dǎo',
-    0x3A37: 'jìn',
-    0x3A38: 'mà',
-    0x3A39: 'huì,xuě',
-    0x3A3A: 'miǎn,mén',
-    0x3A3B: 'cán,shǎn,zàn,chàn',
-    0x3A3C: 'lüè',
-    0x3A3D: 'pì',
-    0x3A3E: 'yàng',
-    0x3A3F: 'jù',
-    0x3A40: 'jù',
-    0x3A41: 'què',
-    0x3A43: 'qiān',
-    0x3A44: 'shāi',
-    0x3A46: 'jiù,zú',
-    0x3A47: 'huò,zuó,huá',
-    0x3A48: 'yǔn',
-    0x3A49: 'dá,lā,xī,xié',
-    0x3A4A: 'xuān',
-    0x3A4B: 'xiāo,sù',
-    0x3A4C: 'fèi',
-    0x3A4D: 'cè',
-    0x3A4E: 'yè',
-    0x3A50: 'dèn',
-    0x3A52: 'qín',
-    0x3A53: 'huǐ',
-    0x3A54: 'tún',
-    0x3A56: 'qiáng',
-    0x3A57: 'xí',
-    0x3A58: 'nǐ',
-    0x3A59: 'sāi',
-    0x3A5A: 'méng',
-    0x3A5B: 'tuán',
-    0x3A5C: 'lǎn',
-    0x3A5D: 'háo',
-    0x3A5E: 'cì',
-    0x3A5F: 'zhài',
-    0x3A60: 'āo,piǎo,póu',
-    0x3A61: 'luǒ',
-    0x3A62: 'miè,mì',
-    0x3A64: 'fū',
-    0x3A66: 'xié,xī',
-    0x3A67: 'bó',
-    0x3A68: 'huì',
-    0x3A69: 'qǐng',
-    0x3A6A: 'xié',
-    0x3A6D: 'bó',
-    0x3A6E: 'qián',
-    0x3A6F: 'pó',
-    0x3A70: 'jiǎo',
-    0x3A71: 'jué',
-    0x3A72: 'kǔn',
-    0x3A73: 'sǒng',
-    0x3A74: 'jú,qú',
-    0x3A75: 'è',
-    0x3A76: 'niè',
-    0x3A77: 'qiān',
-    0x3A78: 'dié',
-    0x3A79: 'dié',
-    0x3A7B: 'qī,guì,guǐ',
-    0x3A7C: 'zhī',
-    0x3A7D: 'qí,chì,è',
-    0x3A7E: 'zhuì,qí',
-    0x3A7F: 'kū',
-    0x3A80: 'yú',
-    0x3A81: 'qín,kān,qiàn,qián',
-    0x3A82: 'kū',
-    0x3A83: 'hé',
-    0x3A84: 'fú',
-    0x3A86: 'dǐ',
-    0x3A87: 'xiàn',
-    0x3A88: 'guì',
-    0x3A89: 'hé',
-    0x3A8A: 'qún',
-    0x3A8B: 'hàn,hě',
-    0x3A8C: 'tǒng',
-    0x3A8D: 'bó,bèi',
-    0x3A8E: 'shǎn,nà',
-    0x3A8F: 'bǐ',
-    0x3A90: 'lù',
-    0x3A91: 'yè',
-    0x3A92: 'ní',
-    0x3A93: 'chuái',
-    0x3A94: 'sàn',
-    0x3A95: 'diào,chuò',
-    0x3A96: 'lù',
-    0x3A97: 'tǒu',
-    0x3A98: 'liǎn',
-    0x3A99: 'kě',
-    0x3A9A: 'sàn',
-    0x3A9B: 'zhěn',
-    0x3A9C: 'chuǎi,duǒ',
-    0x3A9D: 'liàn',
-    0x3A9E: 'mào',
-    0x3AA0: 'qiān,qiàn,jiān',
-    0x3AA1: 'kài,kě',
-    0x3AA2: 'shǎo',
-    0x3AA3: 'xiāo,qiāo',
-    0x3AA4: 'bì',
-    0x3AA5: 'zhā',
-    0x3AA6: 'yìn',
-    0x3AA7: 'xī',
-    0x3AA8: 'shàn',
-    0x3AA9: 'sù',
-    0x3AAA: 'sà',
-    0x3AAB: 'ruì',
-    0x3AAC: 'chuō,zhuó',
-    0x3AAD: 'lú',
-    0x3AAE: 'líng',
-    0x3AAF: 'chá',
-    0x3AB1: 'huàn',
-    0x3AB4: 'jiá',
-    0x3AB5: 'bàn',
-    0x3AB6: 'hú',
-    0x3AB7: 'dǒu',
-    0x3AB9: 'lǒu',
-    0x3ABA: 'jū',
-    0x3ABB: 'juàn',
-    0x3ABC: 'kě',
-    0x3ABD: 'suǒ',
-    0x3ABE: 'luò,gé',
-    0x3ABF: 'zhé',
-    0x3AC0: 'dǐng',
-    0x3AC1: 'duàn',
-    0x3AC2: 'zhù',
-    0x3AC3: 'yǎn',
-    0x3AC4: 'páng',
-    0x3AC5: 'chá',
-    0x3ACA: 'yǐ,ě',
-    0x3ACD: 'yóu,yǎo',
-    0x3ACE: 'huī,gǔn',
-    0x3ACF: 'yǎo',
-    0x3AD0: 'yǎo',
-    0x3AD1: 'zhǐ,shí',
-    0x3AD2: 'gǒng',
-    0x3AD3: 'qǐ',
-    0x3AD4: 'gèn',
-    0x3AD7: 'hòu',
-    0x3AD8: 'mì',
-    0x3AD9: 'fú',
-    0x3ADA: 'hū',
-    0x3ADB: 'guàng',
-    0x3ADC: 'tǎn',
-    0x3ADD: 'dī',
-    0x3ADF: 'yán',
-    0x3AE2: 'qù',
-    0x3AE4: 'chǎng',
-    0x3AE5: 'mǐng',
-    0x3AE6: 'tāo',
-    0x3AE7: 'bào',
-    0x3AE8: 'ān',
-    0x3AEB: 'xiǎn',
-    0x3AEF: 'mào',
-    0x3AF0: 'làng,lǎng',
-    0x3AF1: 'nǎn,nàn',
-    0x3AF2: 'bèi',
-    0x3AF3: 'chén',
-    0x3AF5: 'fēi',
-    0x3AF6: 'zhǒu',
-    0x3AF7: 'jī',
-    0x3AF8: 'jiē',
-    0x3AF9: 'shù',
-    0x3AFB: 'kùn',
-    0x3AFC: 'dié',
-    0x3AFD: 'lù',
-    0x3B02: 'yú',
-    0x3B03: 'tái',
-    0x3B04: 'chàn',
-    0x3B05: 'màn',
-    0x3B06: 'mǐn',
-    0x3B07: 'huàn',
-    0x3B08: 'wēn',
-    0x3B09: 'nuǎn',
-    0x3B0A: 'huàn,huǎn',
-    0x3B0B: 'hóu',
-    0x3B0C: 'jìng',
-    0x3B0D: 'bó',
-    0x3B0E: 'xiǎn',
-    0x3B0F: 'lì',
-    0x3B10: 'jìn,zī',
-    0x3B12: 'mǎng',
-    0x3B13: 'piào',
-    0x3B14: 'háo',
-    0x3B15: 'yáng',
-    0x3B17: 'xiàn',
-    0x3B18: 'sù',
-    0x3B19: 'wěi',
-    0x3B1A: 'chè',
-    0x3B1B: 'xī',
-    0x3B1C: 'jìn',
-    0x3B1D: 'céng,sōng',
-    0x3B1E: 'hè',
-    0x3B1F: 'fēn',
-    0x3B20: 'shài,shà',
-    0x3B21: 'líng',
-    0x3B23: 'duì',
-    0x3B24: 'qī',
-    0x3B25: 'pù,bó',
-    0x3B26: 'yuè',
-    0x3B27: 'bó',
-    0x3B29: 'huì',
-    0x3B2A: 'dié',
-    0x3B2B: 'yàn',
-    0x3B2C: 'jù',
-    0x3B2D: 'jiào',
-    0x3B2E: 'nàn',
-    0x3B2F: 'liè',
-    0x3B30: 'yú',
-    0x3B31: 'tì',
-    0x3B32: 'tiān',
-    0x3B33: 'wǔ',
-    0x3B34: 'hǒng',
-    0x3B35: 'xiáo',
-    0x3B36: 'hào',
-    0x3B38: 'tiāo',
-    0x3B39: 'zhēng',
-    0x3B3B: 'huāng,hāng,huǎng',
-    0x3B3C: 'fù',
-    0x3B3F: 'tūn',
-    0x3B41: 'réng',
-    0x3B42: 'jiǎo',
-    0x3B44: 'xìn',
-    0x3B47: 'yuàn',
-    0x3B48: 'jué',
-    0x3B49: 'huá',
-    0x3B4B: 'bàng',
-    0x3B4C: 'móu',
-    0x3B4E: 'gāng',
-    0x3B4F: 'wěi',
-    0x3B51: 'mèi',
-    0x3B52: 'sì',
-    0x3B53: 'biàn',
-    0x3B54: 'lú',
-    0x3B55: 'qū',
-    0x3B58: 'gé,hé',
-    0x3B59: 'zhé',
-    0x3B5A: 'lǚ',
-    0x3B5B: 'pài,bà',
-    0x3B5C: 'róng',
-    0x3B5D: 'qiú,òu',
-    0x3B5E: 'liè',
-    0x3B5F: 'gǒng',
-    0x3B60: 'xiǎn',
-    0x3B61: 'xì,xìn',
-    0x3B62: 'xīn',
-    0x3B64: 'niǎo',
-    0x3B68: 'xié',
-    0x3B69: 'liè',
-    0x3B6A: 'fū',
-    0x3B6B: 'cuó,cuán',
-    0x3B6C: 'zhuó',
-    0x3B6D: 'bā,bèi,biē',
-    0x3B6E: 'zuò,zǎn',
-    0x3B6F: 'zhé,dié',
-    0x3B70: 'zuī,zuǐ',
-    0x3B71: 'hé',
-    0x3B72: 'jí',
-    0x3B74: 'jiān',
-    0x3B78: 'tú',
-    0x3B79: 'xián',
-    0x3B7A: 'yǎn,yàn,ān',
-    0x3B7B: 'táng',
-    0x3B7C: 'tà',
-    0x3B7D: 'dǐ',
-    0x3B7E: 'jué',
-    0x3B7F: 'áng',
-    0x3B80: 'hán',
-    0x3B81: 'xiáo',
-    0x3B82: 'jú',
-    0x3B83: 'wēi,ruí',
-    0x3B84: 'bǎng',
-    0x3B85: 'zhuī',
-    0x3B86: 'niè',
-    0x3B87: 'tiàn',
-    0x3B88: 'nài',
-    0x3B8B: 'yǒu',
-    0x3B8C: 'mián',
-    0x3B8F: 'nài,nì,nà',
-    0x3B90: 'shěng,sì',
-    0x3B91: 'chā,qì',
-    0x3B92: 'yān,yīn',
-    0x3B93: 'gèn',
-    0x3B94: 'chòng,tóng',
-    0x3B95: 'ruǎn',
-    0x3B96: 'jiá',
-    0x3B97: 'qín',
-    0x3B98: 'máo',
-    0x3B99: 'è',
-    0x3B9A: 'lì',
-    0x3B9B: 'chí,yí',
-    0x3B9C: 'zāng',
-    0x3B9D: 'hé',
-    0x3B9E: 'jié',
-    0x3B9F: 'niǎn,kā',
-    0x3BA1: 'guàn',
-    0x3BA2: 'hóu',
-    0x3BA3: 'gài',
-    0x3BA5: 'bèn,fàn',
-    0x3BA6: 'suǒ,sè',
-    0x3BA7: 'wū,wēn',
-    0x3BA8: 'jì',
-    0x3BA9: 'xī',
-    0x3BAA: 'qióng',
-    0x3BAB: 'hé,xiá,qià',
-    0x3BAC: 'wēng',
-    0x3BAD: 'xián',
-    0x3BAE: 'jié',
-    0x3BAF: 'hún,huá',
-    0x3BB0: 'pí',
-    0x3BB1: 'shēn',
-    0x3BB2: 'chōu',
-    0x3BB3: 'zhèn',
-    0x3BB5: 'zhān',
-    0x3BB6: 'shuò',
-    0x3BB7: 'jī',
-    0x3BB8: 'sòng',
-    0x3BB9: 'zhǐ',
-    0x3BBA: 'běn',
-    0x3BBE: 'lǎng',
-    0x3BBF: 'bì',
-    0x3BC0: 'xuàn',
-    0x3BC1: 'péi',
-    0x3BC2: 'dài',
-    0x3BC4: 'zhī',
-    0x3BC5: 'pí,bī',
-    0x3BC6: 'chǎn,shàn',
-    0x3BC7: 'bì',
-    0x3BC8: 'sù',
-    0x3BC9: 'huò',
-    0x3BCA: 'hén',
-    0x3BCB: 'jiǒng,yǐng',
-    0x3BCC: 'chuán',
-    0x3BCD: 'jiǎng',
-    0x3BCE: 'nèn',
-    0x3BCF: 'gǔ',
-    0x3BD0: 'fǎng',
-    0x3BD3: 'tà,dá',
-    0x3BD4: 'cuì',
-    0x3BD5: 'xī',
-    0x3BD6: 'dé',
-    0x3BD7: 'xián',
-    0x3BD8: 'kuǎn',
-    0x3BD9: 'zhé',
-    0x3BDA: 'tā',
-    0x3BDB: 'hú',
-    0x3BDC: 'cuì',
-    0x3BDD: 'lù',
-    0x3BDE: 'juàn',
-    0x3BDF: 'lù',
-    0x3BE0: 'qiàn',
-    0x3BE1: 'pào,páo',
-    0x3BE2: 'zhèn',
-    0x3BE4: 'lì',
-    0x3BE5: 'cáo,zāo',
-    0x3BE6: 'qí',
-    0x3BE9: 'tì',
-    0x3BEA: 'líng',
-    0x3BEB: 'qú',
-    0x3BEC: 'liǎn',
-    0x3BED: 'lǔ',
-    0x3BEE: 'shú',
-    0x3BEF: 'gòng,dǎn,jù',
-    0x3BF0: 'zhé',
-    0x3BF1: 'pāo',
-    0x3BF2: 'jìn',
-    0x3BF3: 'qíng',
-    0x3BF6: 'zōng',
-    0x3BF7: 'pú',
-    0x3BF8: 'jǐn',
-    0x3BF9: 'biǎo',
-    0x3BFA: 'jiàn',
-    0x3BFB: 'gǔn',
-    0x3BFE: 'zāo',
-    0x3BFF: 'liè,là',
-    0x3C00: 'lí',
-    0x3C01: 'luǒ',
-    0x3C02: 'shěn',
-    0x3C03: 'mián,miàn',
-    0x3C04: 'jiàn',
-    0x3C05: 'dí,zhé',
-    0x3C06: 'bèi',
-    0x3C08: 'liǎn',
-    0x3C0A: 'xián',
-    0x3C0B: 'pín',
-    0x3C0C: 'què',
-    0x3C0D: 'lóng',
-    0x3C0E: 'zuì',
-    0x3C10: 'jué',
-    0x3C11: 'shān',
-    0x3C12: 'xué',
-    0x3C14: 'xiè',
-    0x3C16: 'lǎn',
-    0x3C17: 'qí',
-    0x3C18: 'yí',
-    0x3C19: 'nuó',
-    0x3C1A: 'lí',
-    0x3C1B: 'yuè',
-    0x3C1D: 'yǐ',
-    0x3C1E: 'chī',
-    0x3C1F: 'jì,qì',
-    0x3C20: 'hāng',
-    0x3C21: 'xiè',
-    0x3C22: 'kēng',
-    0x3C23: 'zī',
-    0x3C24: 'hē,qiè',
-    0x3C25: 'xì,huì',
-    0x3C26: 'qù',
-    0x3C27: 'hāi',
-    0x3C28: 'xiā',
-    0x3C29: 'hāi',
-    0x3C2A: 'guī',
-    0x3C2B: 'chān',
-    0x3C2C: 'xún',
-    0x3C2D: 'xū',
-    0x3C2E: 'shèn',
-    0x3C2F: 'kòu,tòu,tǒu,hòu',
-    0x3C30: 'xiā,qiè,hē',
-    0x3C31: 'shà',
-    0x3C32: 'yū,xù',
-    0x3C33: 'yà,yā',
-    0x3C34: 'pǒu',
-    0x3C35: 'zú',
-    0x3C36: 'yǒu,ǒu',
-    0x3C37: 'zì',
-    0x3C38: 'liǎn',
-    0x3C39: 'xiān,xiàn,hǎn',
-    0x3C3A: 'xià,xiá',
-    0x3C3B: 'yǐ,xī,hòu',
-    0x3C3C: 'shà,qiè',
-    0x3C3D: 'yàn',
-    0x3C3E: 'jiào',
-    0x3C3F: 'xī',
-    0x3C40: 'chǐ',
-    0x3C41: 'shì,kuǎn',
-    0x3C42: 'kāng',
-    0x3C43: 'yǐn',
-    0x3C44: 'hēi,mò',
-    0x3C45: 'yì',
-    0x3C46: 'xī',
-    0x3C47: 'sè,xì',
-    0x3C48: 'jìn',
-    0x3C49: 'yè',
-    0x3C4A: 'yōu',
-    0x3C4B: 'què',
-    0x3C4C: 'yé,chè',
-    0x3C4D: 'luán',
-    0x3C4E: 'kūn',
-    0x3C4F: 'zhèng',
-    0x3C54: 'xiē',
-    0x3C56: 'cuì',
-    0x3C57: 'xiū',
-    0x3C58: 'àn',
-    0x3C59: 'xiǔ,guǎ',
-    0x3C5A: 'cán',
-    0x3C5B: 'chuǎn,bù',
-    0x3C5C: 'zhá',
-    0x3C5E: 'yì,lā',
-    0x3C5F: 'pī,pǐ',
-    0x3C60: 'kū,gū',
-    0x3C61: 'shēng',
-    0x3C62: 'láng',
-    0x3C63: 'tuǐ',
-    0x3C64: 'xī',
-    0x3C65: 'líng,lèng',
-    0x3C66: 'qī',
-    0x3C67: 'wò,yuǎn',
-    0x3C68: 'liàn',
-    0x3C69: 'dú',
-    0x3C6A: 'mèn',
-    0x3C6B: 'làn',
-    0x3C6C: 'wěi',
-    0x3C6D: 'duàn',
-    0x3C6E: 'kuài',
-    0x3C6F: 'ái',
-    0x3C70: 'zǎi',
-    0x3C71: 'huì',
-    0x3C72: 'yì',
-    0x3C73: 'mò',
-    0x3C74: 'zì',
-    0x3C75: 'fèn',
-    0x3C76: 'péng,bēng',
-    0x3C78: 'bì',
-    0x3C79: 'lì',
-    0x3C7A: 'lú',
-    0x3C7B: 'luò',
-    0x3C7C: 'hāi',
-    0x3C7D: 'zhěn,qín',
-    0x3C7E: 'gāi,kāi',
-    0x3C7F: 'què,hù,qiǎng',
-    0x3C80: 'zhēn,chēn',
-    0x3C81: 'kōng,zhōng',
-    0x3C82: 'chéng',
-    0x3C83: 'jiù',
-    0x3C84: 'jué,kū',
-    0x3C85: 'jì',
-    0x3C86: 'líng',
-    0x3C88: 'sháo,táo',
-    0x3C89: 'què',
-    0x3C8A: 'ruì',
-    0x3C8B: 'chuò',
-    0x3C8C: 'nèng',
-    0x3C8D: 'zhī',
-    0x3C8E: 'lóu',
-    0x3C8F: 'pāo',
-    0x3C92: 'bào,qú',
-    0x3C93: 'róng,shù',
-    0x3C94: 'xiān',
-    0x3C95: 'lèi',
-    0x3C96: 'xiāo',
-    0x3C97: 'fū',
-    0x3C98: 'qú',
-    0x3C9A: 'shā',
-    0x3C9B: 'zhǐ',
-    0x3C9C: 'tán',
-    0x3C9D: 'rǒng',
-    0x3C9E: 'sū,zú',
-    0x3C9F: 'yǐng',
-    0x3CA0: 'máo',
-    0x3CA1: 'nài',
-    0x3CA2: 'biàn',
-    0x3CA4: 'shuāi',
-    0x3CA5: 'táng',
-    0x3CA6: 'hàn',
-    0x3CA7: 'sào',
-    0x3CA8: 'róng',
-    0x3CAA: 'dēng',
-    0x3CAB: 'pú',
-    0x3CAC: 'jiāo',
-    0x3CAD: 'tǎn',
-    0x3CAF: 'rán',
-    0x3CB0: 'níng',
-    0x3CB1: 'liè',
-    0x3CB2: 'dié',
-    0x3CB3: 'dié,zhì',
-    0x3CB4: 'zhòng',
-    0x3CB6: 'lǜ',
-    0x3CB7: 'dàn',
-    0x3CB8: 'xī',
-    0x3CB9: 'guǐ',
-    0x3CBA: 'jí',
-    0x3CBB: 'nì',
-    0x3CBC: 'yì,chà',
-    0x3CBD: 'niàn,rěn',
-    0x3CBE: 'yǔ',
-    0x3CBF: 'wǎng',
-    0x3CC0: 'guò',
-    0x3CC1: 'zè',
-    0x3CC2: 'yán,yàn',
-    0x3CC3: 'cuì',
-    0x3CC4: 'xián',
-    0x3CC5: 'jiǎo',
-    0x3CC6: 'tǒu',
-    0x3CC7: 'fù',
-    0x3CC8: 'pèi',
-    0x3CCA: 'yōu,zhōng',
-    0x3CCB: 'qiū',
-    0x3CCC: 'yā',
-    0x3CCD: 'bù',
-    0x3CCE: 'biàn',
-    0x3CCF: 'shì',
-    0x3CD0: 'zhá',
-    0x3CD1: 'yì',
-    0x3CD2: 'biàn',
-    0x3CD4: 'duì',
-    0x3CD5: 'lán',
-    0x3CD6: 'yī',
-    0x3CD7: 'chài,chà',
-    0x3CD8: 'chōng',
-    0x3CD9: 'xuàn',
-    0x3CDA: 'xù',
-    0x3CDB: 'yú,yóu',
-    0x3CDC: 'xiū',
-    0x3CE0: 'tà',
-    0x3CE1: 'guō',
-    0x3CE5: 'lòng',
-    0x3CE6: 'xiè',
-    0x3CE7: 'chè,rè',
-    0x3CE8: 'jiǎn',
-    0x3CE9: 'tān',
-    0x3CEA: 'pì',
-    0x3CEB: 'zǎn',
-    0x3CEC: 'xuán',
-    0x3CED: 'xián',
-    0x3CEE: 'niào',
-    0x3CF4: 'mì',
-    0x3CF5: 'jì',
-    0x3CF6: 'nǒu,rǔ',
-    0x3CF7: 'hū,mǐn,wěn,tuì',
-    0x3CF8: 'huā',
-    0x3CF9: 'wǎng,wāng',
-    0x3CFA: 'yóu',
-    0x3CFB: 'zé',
-    0x3CFC: 'bì,yù',
-    0x3CFD: 'mǐ',
-    0x3CFE: 'qiāng',
-    0x3CFF: 'xiè',
-    0x3D00: 'fàn,fān',
-    0x3D01: 'yì',
-    0x3D02: 'tān',
-    0x3D03: 'lèi',
-    0x3D04: 'yǒng',
-    0x3D06: 'jìn',
-    0x3D07: 'shè,máng',
-    0x3D08: 'yìn',
-    0x3D09: 'jǐ',
-    0x3D0B: 'sù',
-    0x3D0E: 'nài',
-    0x3D0F: 'wǎng',
-    0x3D10: 'miàn,miǎn',
-    0x3D11: 'sù',
-    0x3D12: 'yì',
-    0x3D13: 'shāi',
-    0x3D14: 'xī,jí,yì,sè',
-    0x3D15: 'jí',
-    0x3D16: 'luò',
-    0x3D17: 'yōu',
-    0x3D18: 'mào',
-    0x3D19: 'zhǎ,zhá',
-    0x3D1A: 'suì',
-    0x3D1B: 'zhì',
-    0x3D1C: 'biàn',
-    0x3D1D: 'lí',
-    0x3D25: 'qiào',
-    0x3D26: 'guàn',
-    0x3D27: 'xī',
-    0x3D28: 'zhèn',
-    0x3D29: 'yōng',
-    0x3D2A: 'niè',
-    0x3D2B: 'jùn,yá',
-    0x3D2C: 'xiè',
-    0x3D2D: 'yǎo',
-    0x3D2E: 'xiè',
-    0x3D2F: 'zhī',
-    0x3D30: 'néng',
-    0x3D32: 'sī',
-    0x3D33: 'lǒng',
-    0x3D34: 'chén',
-    0x3D35: 'mì',
-    0x3D36: 'què,hú',
-    0x3D37: 'dān',
-    0x3D38: 'shǎn',
-    0x3D3C: 'sù',
-    0x3D3D: 'xiè',
-    0x3D3E: 'bó',
-    0x3D3F: 'dǐng',
-    0x3D40: 'zú',
-    0x3D42: 'shù',
-    0x3D43: 'shé',
-    0x3D44: 'hàn,yù',
-    0x3D45: 'tān,tàn',
-    0x3D46: 'gǎo',
-    0x3D4A: 'nà',
-    0x3D4B: 'mì',
-    0x3D4C: 'xún',
-    0x3D4D: 'mèn',
-    0x3D4E: 'jiàn',
-    0x3D4F: 'cuǐ',
-    0x3D50: 'jué',
-    0x3D51: 'hè',
-    0x3D52: 'fèi,pài,bì',
-    0x3D53: 'shí',
-    0x3D54: 'chě',
-    0x3D55: 'shèn',
-    0x3D56: 'nǜ',
-    0x3D57: 'píng',
-    0x3D58: 'màn',
-    0x3D5D: 'yì',
-    0x3D5E: 'chóu',
-    0x3D60: 'kū',
-    0x3D61: 'báo',
-    0x3D62: 'léi',
-    0x3D63: 'kě',
-    0x3D64: 'shà',
-    0x3D65: 'bì',
-    0x3D66: 'suí',
-    0x3D67: 'gé,yì',
-    0x3D68: 'pì,bó',
-    0x3D69: 'yì',
-    0x3D6A: 'xián,yàn,yán',
-    0x3D6B: 'nì',
-    0x3D6C: 'yíng',
-    0x3D6D: 'zhǔ',
-    0x3D6E: 'chún',
-    0x3D6F: 'féng',
-    0x3D70: 'xù',
-    0x3D71: 'piǎo',
-    0x3D72: 'wǔ',
-    0x3D73: 'liáo',
-    0x3D74: 'cáng',
-    0x3D75: 'zòu,jù',
-    0x3D76: 'zuō',
-    0x3D77: 'biàn',
-    0x3D78: 'yào',
-    0x3D79: 'huán,mò',
-    0x3D7A: 'pài',
-    0x3D7B: 'xiū',
-    0x3D7D: 'lěi',
-    0x3D7E: 'qìng,jìng',
-    0x3D7F: 'xiào',
-    0x3D80: 'jiāo',
-    0x3D81: 'guó,huò',
-    0x3D84: 'yán',
-    0x3D85: 'xué',
-    0x3D86: 'zhū,chú',
-    0x3D87: 'héng',
-    0x3D88: 'yíng',
-    0x3D89: 'xī',
-    0x3D8C: 'lián',
-    0x3D8D: 'xiǎn',
-    0x3D8E: 'huán',
-    0x3D8F: 'yīn',
-    0x3D91: 'liàn',
-    0x3D92: 'shǎn,shěn,tàn',
-    0x3D93: 'cáng',
-    0x3D94: 'bèi',
-    0x3D95: 'jiǎn',
-    0x3D96: 'shù',
-    0x3D97: 'fàn,fán',
-    0x3D98: 'diàn',
-    0x3D9A: 'bà',
-    0x3D9B: 'yú',
-    0x3D9E: 'nǎng',
-    0x3D9F: 'lěi',
-    0x3DA0: 'yì',
-    0x3DA1: 'dài,huǒ',
-    0x3DA3: 'chán,yín',
-    0x3DA4: 'chǎo',
-    0x3DA5: 'gān',
-    0x3DA6: 'jìn',
-    0x3DA7: 'nèn',
-    0x3DAB: 'liǎo',
-    0x3DAC: 'mò',
-    0x3DAD: 'yǒu',
-    0x3DAF: 'liù',
-    0x3DB0: 'hán',
-    0x3DB2: 'yòng',
-    0x3DB3: 'jìn',
-    0x3DB4: 'chǐ',
-    0x3DB5: 'rèn',
-    0x3DB6: 'nóng',
-    0x3DB9: 'hòng',
-    0x3DBA: 'tiàn',
-    0x3DBC: 'āi,xī',
-    0x3DBD: 'guā',
-    0x3DBE: 'biāo',
-    0x3DBF: 'bó',
-    0x3DC0: 'qióng',
-    0x3DC2: 'shù',
-    0x3DC3: 'chuǐ',
-    0x3DC4: 'huǐ',
-    0x3DC5: 'chǎo',
-    0x3DC6: 'fù',
-    0x3DC7: 'huī,guài',
-    0x3DC8: 'è',
-    0x3DC9: 'wèi',
-    0x3DCA: 'fén',
-    0x3DCB: 'tán',
-    0x3DCD: 'lún',
-    0x3DCE: 'hè',
-    0x3DCF: 'yǒng',
-    0x3DD0: 'huǐ',
-    0x3DD2: 'yú',
-    0x3DD3: 'zǒng',
-    0x3DD4: 'yàn',
-    0x3DD5: 'qiú',
-    0x3DD6: 'zhào',
-    0x3DD7: 'jiǒng',
-    0x3DD8: 'tái',
-    0x3DDF: 'tuì',
-    0x3DE0: 'lín',
-    0x3DE1: 'jiǒng',
-    0x3DE2: 'zhǎ',
-    0x3DE3: 'xīng',
-    0x3DE4: 'hù,xuè',
-    0x3DE6: 'xù',
-    0x3DEA: 'cuì',
-    0x3DEB: 'qǐng',
-    0x3DEC: 'mò',
-    0x3DEE: 'zāo',
-    0x3DEF: 'bèng',
-    0x3DF0: 'chī,lí',
-    0x3DF3: 'yàn',
-    0x3DF4: 'gé',
-    0x3DF5: 'mò',
-    0x3DF6: 'bèi',
-    0x3DF7: 'juǎn',
-    0x3DF8: 'dié',
-    0x3DF9: 'zhào,shào',
-    0x3DFB: 'wú',
-    0x3DFC: 'yàn',
-    0x3DFE: 'jué',
-    0x3DFF: 'xiān',
-    0x3E00: 'tái',
-    0x3E01: 'hǎn',
-    0x3E03: 'diǎn',
-    0x3E04: 'jì',
-    0x3E05: 'jié,jí',
-    0x3E06: 'kào',
-    0x3E07: 'zuǎn',
-    0x3E09: 'xiè',
-    0x3E0A: 'lài,là',
-    0x3E0B: 'fán',
-    0x3E0C: 'huò',
-    0x3E0D: 'xì',
-    0x3E0E: 'niè',
-    0x3E0F: 'mí',
-    0x3E10: 'rán',
-    0x3E11: 'cuàn',
-    0x3E12: 'yín,jīng',
-    0x3E13: 'mì',
-    0x3E15: 'jué',
-    0x3E16: 'qū',
-    0x3E17: 'tóng',
-    0x3E18: 'wàn',
-    0x3E19: 'zhē',
-    0x3E1A: 'lǐ,lì',
-    0x3E1B: 'sháo',
-    0x3E1C: 'kòng',
-    0x3E1D: 'xiān,kǎn',
-    0x3E1E: 'zhé',
-    0x3E1F: 'zhī',
-    0x3E20: 'tiǎo',
-    0x3E21: 'shū',
-    0x3E22: 'bèi',
-    0x3E23: 'yè',
-    0x3E24: 'piàn',
-    0x3E25: 'chàn',
-    0x3E26: 'hù,jià',
-    0x3E27: 'kèn',
-    0x3E28: 'jiū',
-    0x3E29: 'ān',
-    0x3E2A: 'chún',
-    0x3E2B: 'qián',
-    0x3E2C: 'bèi',
-    0x3E2D: 'bā',
-    0x3E2E: 'fén',
-    0x3E2F: 'kē',
-    0x3E30: 'tuó',
-    0x3E31: 'tuó',
-    0x3E32: 'zuó',
-    0x3E33: 'líng',
-    0x3E35: 'guǐ',
-    0x3E36: 'yān',
-    0x3E37: 'shì',
-    0x3E38: 'hǒu,ǒu,kǒu',
-    0x3E39: 'liè,luō',
-    0x3E3A: 'shā',
-    0x3E3B: 'sì',
-    0x3E3D: 'bèi',
-    0x3E3E: 'rèn',
-    0x3E3F: 'dú',
-    0x3E40: 'bó',
-    0x3E41: 'liáng',
-    0x3E42: 'qiǎn',
-    0x3E43: 'fèi',
-    0x3E44: 'jì',
-    0x3E45: 'zǒng',
-    0x3E46: 'huī',
-    0x3E47: 'hé,jiān',
-    0x3E48: 'lí',
-    0x3E49: 'yuán,wán',
-    0x3E4A: 'yuè',
-    0x3E4B: 'xiū',
-    0x3E4C: 'chǎn,shèng',
-    0x3E4D: 'dí',
-    0x3E4E: 'léi',
-    0x3E4F: 'jǐn',
-    0x3E50: 'chóng',
-    0x3E51: 'sì',
-    0x3E52: 'pǔ',
-    0x3E53: 'yǎo',
-    0x3E54: 'jiāng',
-    0x3E55: 'huān',
-    0x3E56: 'huàn',
-    0x3E57: 'tāo',
-    0x3E58: 'rù',
-    0x3E59: 'wěng',
-    0x3E5A: 'yíng',
-    0x3E5B: 'ráo',
-    0x3E5C: 'yín',
-    0x3E5D: 'shì',
-    0x3E5E: 'yín,yǐn,yá',
-    0x3E5F: 'jué,kuài',
-    0x3E60: 'tún',
-    0x3E61: 'xuán',
-    0x3E62: 'jiā,gā',
-    0x3E63: 'zhōng',
-    0x3E64: 'qiè',
-    0x3E65: 'zhù',
-    0x3E66: 'diāo',
-    0x3E68: 'yòu',
-    0x3E6B: 'yí',
-    0x3E6C: 'shǐ',
-    0x3E6D: 'yì',
-    0x3E6E: 'mò',
-    0x3E71: 'què',
-    0x3E72: 'xiāo,xiào',
-    0x3E73: 'wú',
-    0x3E74: 'gēng',
-    0x3E75: 'yǐng',
-    0x3E76: 'tíng',
-    0x3E77: 'shǐ',
-    0x3E78: 'ní',
-    0x3E79: 'gēng',
-    0x3E7A: 'tà',
-    0x3E7B: 'wō,wēi',
-    0x3E7C: 'jú',
-    0x3E7D: 'chǎn',
-    0x3E7E: 'piǎo,jiào',
-    0x3E7F: 'zhuó,zhào',
-    0x3E80: 'hū,náo',
-    0x3E81: 'nǎo',
-    0x3E82: 'yán,gǎn',
-    0x3E83: 'gǒu',
-    0x3E84: 'yǔ,yú',
-    0x3E85: 'hóu',
-    0x3E87: 'sī',
-    0x3E88: 'chī',
-    0x3E89: 'hù',
-    0x3E8A: 'yàng',
-    0x3E8B: 'wēng',
-    0x3E8C: 'xiàn',
-    0x3E8D: 'pín',
-    0x3E8E: 'róng',
-    0x3E8F: 'lóu',
-    0x3E90: 'lǎo,sāo',
-    0x3E91: 'shān,shàn,sāo,shǎn',
-    0x3E92: 'xiāo,nǎo,qiāo,xiào',
-    0x3E93: 'zé',
-    0x3E94: 'hài,huī',
-    0x3E95: 'fán,biàn',
-    0x3E96: 'hǎn',
-    0x3E97: 'chān',
-    0x3E98: 'zhàn',
-    0x3E9A: 'tǎ',
-    0x3E9B: 'zhù',
-    0x3E9C: 'nóng',
-    0x3E9D: 'hàn',
-    0x3E9E: 'yú',
-    0x3E9F: 'zhuó',
-    0x3EA0: 'yòu',
-    0x3EA1: 'lì',
-    0x3EA2: 'huò,huō',
-    0x3EA3: 'xī',
-    0x3EA4: 'xiān',
-    0x3EA5: 'chán',
-    0x3EA6: 'lián',
-    0x3EA8: 'sī',
-    0x3EA9: 'jiù,qiú',
-    0x3EAA: 'pú',
-    0x3EAB: 'qiú',
-    0x3EAC: 'gǒng',
-    0x3EAD: 'zǐ',
-    0x3EAE: 'yú',
-    0x3EB1: 'réng',
-    0x3EB2: 'niǔ',
-    0x3EB3: 'méi',
-    0x3EB4: 'bā',
-    0x3EB5: 'jiú',
-    0x3EB7: 'xù',
-    0x3EB8: 'píng',
-    0x3EB9: 'biàn',
-    0x3EBA: 'mào',
-    0x3EBF: 'yí',
-    0x3EC0: 'yú',
-    0x3EC2: 'píng',
-    0x3EC3: 'qū',
-    0x3EC4: 'bǎo',
-    0x3EC5: 'huì',
-    0x3EC9: 'bù',
-    0x3ECA: 'máng',
-    0x3ECB: 'là',
-    0x3ECC: 'tú',
-    0x3ECD: 'wú',
-    0x3ECE: 'lì',
-    0x3ECF: 'líng',
-    0x3ED1: 'jì',
-    0x3ED2: 'jùn',
-    0x3ED3: 'zōu',
-    0x3ED4: 'duǒ',
-    0x3ED5: 'jué',
-    0x3ED6: 'dài',
-    0x3ED7: 'bèi',
-    0x3EDD: 'là',
-    0x3EDE: 'bīn,bān',
-    0x3EDF: 'suí',
-    0x3EE0: 'tú',
-    0x3EE1: 'xuē,dié',
-    0x3EE7: 'duò',
-    0x3EEA: 'suì',
-    0x3EEB: 'bì',
-    0x3EEC: 'tū',
-    0x3EED: 'sè',
-    0x3EEE: 'càn',
-    0x3EEF: 'tú',
-    0x3EF0: 'miǎn',
-    0x3EF1: 'jīn',
-    0x3EF2: 'lǚ',
-    0x3EF5: 'zhàn',
-    0x3EF6: 'bǐ',
-    0x3EF7: 'jí',
-    0x3EF8: 'zēn',
-    0x3EF9: 'xuān',
-    0x3EFA: 'lì',
-    0x3EFD: 'suì,xuán',
-    0x3EFE: 'yōng',
-    0x3EFF: 'shǔ',
-    0x3F02: 'é',
-    0x3F07: 'qióng',
-    0x3F08: 'luó',
-    0x3F09: 'zhèn',
-    0x3F0A: 'tún',
-    0x3F0B: 'gū,rǔ',
-    0x3F0C: 'yǔ',
-    0x3F0D: 'lěi',
-    0x3F0E: 'bó',
-    0x3F0F: 'něi',
-    0x3F10: 'pián',
-    0x3F11: 'liàn',
-    0x3F12: 'tǎng',
-    0x3F13: 'lián',
-    0x3F14: 'wēn',
-    0x3F15: 'dāng',
-    0x3F16: 'lì',
-    0x3F17: 'tíng',
-    0x3F18: 'wǎ',
-    0x3F19: 'zhòu',
-    0x3F1A: 'gāng',
-    0x3F1B: 'xíng',
-    0x3F1C: 'àng',
-    0x3F1D: 'fàn',
-    0x3F1E: 'pèng,bèng',
-    0x3F1F: 'bó',
-    0x3F20: 'tuó',
-    0x3F21: 'shū',
-    0x3F22: 'yí',
-    0x3F23: 'bó',
-    0x3F24: 'qiè',
-    0x3F25: 'tǒu,kǎo',
-    0x3F26: 'gǒng',
-    0x3F27: 'tóng',
-    0x3F28: 'hán',
-    0x3F29: 'chéng,shèng',
-    0x3F2A: 'jié',
-    0x3F2B: 'huàn,huà',
-    0x3F2C: 'xìng',
-    0x3F2D: 'diàn',
-    0x3F2E: 'chāi,qì',
-    0x3F2F: 'dòng',
-    0x3F30: 'pí',
-    0x3F31: 'ruǎn,jùn',
-    0x3F32: 'liè',
-    0x3F33: 'shěng',
-    0x3F34: 'ǒu',
-    0x3F35: 'dì',
-    0x3F36: 'yú',
-    0x3F37: 'chuán,zhuān',
-    0x3F38: 'róng',
-    0x3F39: 'kāng,huāng',
-    0x3F3A: 'táng',
-    0x3F3B: 'cóng',
-    0x3F3C: 'piáo',
-    0x3F3D: 'chuǎng,shuǎng',
-    0x3F3E: 'lù',
-    0x3F3F: 'tóng,zhòng',
-    0x3F40: 'zhèng',
-    0x3F41: 'lì',
-    0x3F42: 'sà',
-    0x3F43: 'pān',
-    0x3F44: 'sī',
-    0x3F46: 'dāng',
-    0x3F47: 'hú',
-    0x3F48: 'yì',
-    0x3F49: 'xiàn',
-    0x3F4A: 'xiè',
-    0x3F4B: 'luó',
-    0x3F4C: 'liù',
-    0x3F4E: 'tán,xīn',
-    0x3F4F: 'gàn',
-    0x3F51: 'tán',
-    0x3F55: 'yóu',
-    0x3F56: 'nán',
-    0x3F58: 'gǎng',
-    0x3F59: 'jùn',
-    0x3F5A: 'chì',
-    0x3F5B: 'gōu,qú',
-    0x3F5C: 'wǎn',
-    0x3F5D: 'lì',
-    0x3F5E: 'liú',
-    0x3F5F: 'liè',
-    0x3F60: 'xiá',
-    0x3F61: 'bēi',
-    0x3F62: 'ǎn',
-    0x3F63: 'yù',
-    0x3F64: 'jú',
-    0x3F65: 'róu',
-    0x3F66: 'xún',
-    0x3F67: 'zī',
-    0x3F68: 'cuó',
-    0x3F69: 'càn',
-    0x3F6A: 'zěng',
-    0x3F6B: 'yōng',
-    0x3F6C: 'fù,pì',
-    0x3F6D: 'ruǎn',
-    0x3F6F: 'xí',
-    0x3F70: 'shù',
-    0x3F71: 'jiǎo,jiū,niú',
-    0x3F72: 'jiǎo,xiǔ',
-    0x3F73: 'xū',
-    0x3F74: 'zhàng',
-    0x3F77: 'shuì',
-    0x3F78: 'chén',
-    0x3F79: 'fǎn,fàn',
-    0x3F7A: 'jí',
-    0x3F7B: 'zhī',
-    0x3F7D: 'gù',
-    0x3F7E: 'wù',
-    0x3F80: 'qiè,qǔ',
-    0x3F81: 'shù',
-    0x3F82: 'hāi',
-    0x3F83: 'tuó',
-    0x3F84: 'dú,chóu',
-    0x3F85: 'zǐ',
-    0x3F86: 'rán',
-    0x3F87: 'mù',
-    0x3F88: 'fù',
-    0x3F89: 'líng',
-    0x3F8A: 'jí,cì,sè',
-    0x3F8B: 'xiū,xiù',
-    0x3F8C: 'xuǎn',
-    0x3F8D: 'nái',
-    0x3F8E: 'yā,xiā',
-    0x3F8F: 'jiè,yá',
-    0x3F90: 'lì',
-    0x3F91: 'dá,hè,da',
-    0x3F92: 'rú,rù',
-    0x3F93: 'yuān',
-    0x3F94: 'lǚ',
-    0x3F95: 'shěn',
-    0x3F96: 'lǐ',
-    0x3F97: 'liàng',
-    0x3F98: 'gěng',
-    0x3F99: 'xìn,xì',
-    0x3F9A: 'xiē',
-    0x3F9B: 'qǐn',
-    0x3F9C: 'qiè',
-    0x3F9D: 'chè',
-    0x3F9E: 'yóu',
-    0x3F9F: 'bù',
-    0x3FA0: 'kuáng',
-    0x3FA1: 'què',
-    0x3FA2: 'ài',
-    0x3FA3: 'qīn',
-    0x3FA4: 'qiāng',
-    0x3FA5: 'chù',
-    0x3FA6: 'pèi,pēi',
-    0x3FA7: 'kuò,luǒ',
-    0x3FA8: 'yī,qǐ,ǎi',
-    0x3FA9: 'guāi',
-    0x3FAA: 'shěng',
-    0x3FAB: 'piān',
-    0x3FAD: 'zhòu',
-    0x3FAE: 'huáng',
-    0x3FAF: 'huī,tuí',
-    0x3FB0: 'hú',
-    0x3FB1: 'bèi',
-    0x3FB4: 'zhā',
-    0x3FB5: 'jì',
-    0x3FB6: 'gǔ',
-    0x3FB7: 'xī',
-    0x3FB8: 'gǎo',
-    0x3FB9: 'chái,zhài,chí',
-    0x3FBA: 'mà',
-    0x3FBB: 'zhù,chú',
-    0x3FBC: 'tuǐ',
-    0x3FBD: 'zhuì,tuí',
-    0x3FBE: 'xiān,lián',
-    0x3FBF: 'láng',
-    0x3FC3: 'zhì,dài',
-    0x3FC4: 'ài',
-    0x3FC5: 'xiǎn',
-    0x3FC6: 'guō',
-    0x3FC7: 'xí,xì',
-    0x3FC9: 'tuǐ',
-    0x3FCA: 'cǎn',
-    0x3FCB: 'sào',
-    0x3FCC: 'xiān',
-    0x3FCD: 'jiè',
-    0x3FCE: 'fèn,fén',
-    0x3FCF: 'qún',
-    0x3FD1: 'yào',
-    0x3FD2: 'dǎo,zhòu,chóu',
-    0x3FD3: 'jiá',
-    0x3FD4: 'lěi',
-    0x3FD5: 'yán',
-    0x3FD6: 'lú,lù',
-    0x3FD7: 'tuí',
-    0x3FD8: 'yíng',
-    0x3FD9: 'pì',
-    0x3FDA: 'luò',
-    0x3FDB: 'lì',
-    0x3FDC: 'biě',
-    0x3FDE: 'mào',
-    0x3FDF: 'bái',
-    0x3FE0: 'huàng',
-    0x3FE2: 'yào',
-    0x3FE3: 'hē',
-    0x3FE4: 'chǔn',
-    0x3FE5: 'hé',
-    0x3FE6: 'nìng',
-    0x3FE7: 'chóu',
-    0x3FE8: 'lì',
-    0x3FE9: 'tǎng',
-    0x3FEA: 'huán',
-    0x3FEB: 'bì',
-    0x3FEC: 'bā',
-    0x3FED: 'chè,lè',
-    0x3FEE: 'yàng',
-    0x3FEF: 'dá',
-    0x3FF0: 'áo,bì',
-    0x3FF1: 'xué',
-    0x3FF3: 'zī',
-    0x3FF4: 'dā',
-    0x3FF5: 'rǎn',
-    0x3FF6: 'bāng',
-    0x3FF7: 'cuó,cāo',
-    0x3FF8: 'wǎn,mán',
-    0x3FF9: 'tà',
-    0x3FFA: 'báo',
-    0x3FFB: 'gān',
-    0x3FFC: 'yán',
-    0x3FFD: 'xī',
-    0x3FFE: 'zhù',
-    0x3FFF: 'yǎ',
-    0x4000: 'fàn',
-    0x4001: 'yòu',
-    0x4002: 'ān',
-    0x4003: 'tuí',
-    0x4004: 'méng',
-    0x4005: 'shè',
-    0x4006: 'jìn',
-    0x4007: 'gǔ',
-    0x4008: 'jì',
-    0x4009: 'qiáo',
-    0x400A: 'jiǎo',
-    0x400B: 'yán',
-    0x400C: 'xì',
-    0x400D: 'kàn',
-    0x400E: 'miǎn',
-    0x400F: 'xuàn,xún',
-    0x4010: 'shān',
-    0x4011: 'wò',
-    0x4012: 'qiān',
-    0x4013: 'huàn',
-    0x4014: 'rèn',
-    0x4015: 'zhèn',
-    0x4016: 'tiān',
-    0x4017: 'jué,xuè',
-    0x4018: 'xié,jī',
-    0x4019: 'qì',
-    0x401A: 'áng',
-    0x401B: 'mèi,wù,mà',
-    0x401C: 'gǔ',
-    0x401E: 'tāo',
-    0x401F: 'fán',
-    0x4020: 'jù',
-    0x4021: 'chàn,diān,tàn',
-    0x4022: 'shùn',
-    0x4023: 'bì,mà',
-    0x4024: 'mào',
-    0x4025: 'shuò',
-    0x4026: 'gǔ',
-    0x4027: 'hǒng',
-    0x4028: 'huà,guā',
-    0x4029: 'luò',
-    0x402A: 'háng',
-    0x402B: 'jiá,tǔn',
-    0x402C: 'quán',
-    0x402D: 'gāi',
-    0x402E: 'huāng',
-    0x402F: 'bǔ',
-    0x4030: 'gǔ',
-    0x4031: 'fēng',
-    0x4032: 'mù',
-    0x4033: 'ài',
-    0x4034: 'yǐng,yà,kēng',
-    0x4035: 'shùn',
-    0x4036: 'liàng,lǎng',
-    0x4037: 'jié',
-    0x4038: 'chì',
-    0x4039: 'jié,zhǎ,shè,jiá,yà',
-    0x403A: 'chōu,tāo',
-    0x403B: 'pìng',
-    0x403C: 'chēn,rèn',
-    0x403D: 'yán',
-    0x403E: 'dǔ',
-    0x403F: 'dì',
-    0x4041: 'liàng',
-    0x4042: 'xiàn',
-    0x4043: 'biāo',
-    0x4044: 'xìng',
-    0x4045: 'měng,mèng',
-    0x4046: 'yè',
-    0x4047: 'mì',
-    0x4048: 'qì',
-    0x4049: 'qì',
-    0x404A: 'wò',
-    0x404B: 'xiè,zhé',
-    0x404C: 'yù',
-    0x404D: 'qià,kān',
-    0x404E: 'chéng,tíng,chēng',
-    0x404F: 'yǎo',
-    0x4050: 'yīng,yìng',
-    0x4051: 'yáng',
-    0x4052: 'jí,zí',
-    0x4053: 'zōng,zǒng,jiè',
-    0x4054: 'xuān,hàn',
-    0x4055: 'mín',
-    0x4056: 'lōu',
-    0x4057: 'kǎi',
-    0x4058: 'yǎo',
-    0x4059: 'yǎn',
-    0x405A: 'sǔn,qióng',
-    0x405B: 'guì',
-    0x405C: 'huàng,huǎng',
-    0x405D: 'yíng,yǐng',
-    0x405E: 'shěng',
-    0x405F: 'chá',
-    0x4060: 'lián',
-    0x4062: 'xuán',
-    0x4063: 'chuán',
-    0x4064: 'chè,zhé,huǐ',
-    0x4065: 'nì',
-    0x4066: 'qù',
-    0x4067: 'miáo',
-    0x4068: 'huò',
-    0x4069: 'yú',
-    0x406A: 'zhǎn',
-    0x406B: 'hú,méng',
-    0x406C: 'céng',
-    0x406D: 'biāo',
-    0x406E: 'qián',
-    0x406F: 'xī,xié',
-    0x4070: 'jiǎng',
-    0x4071: 'kōu',
-    0x4072: 'mái',
-    0x4073: 'mǎng',
-    0x4074: 'zhǎn,shǎn',
-    0x4075: 'biǎn,huán',
-    0x4076: 'jī,jiǎo',
-    0x4077: 'jué,wù',
-    0x4078: 'náng,nǒng',
-    0x4079: 'bì',
-    0x407A: 'shì,yì',
-    0x407B: 'shuò,lì',
-    0x407C: 'mò',
-    0x407D: 'liè',
-    0x407E: 'miè',
-    0x407F: 'mò',
-    0x4080: 'xī',
-    0x4081: 'chán',
-    0x4082: 'qú',
-    0x4083: 'jiào',
-    0x4084: 'huò',
-    0x4085: 'xiān',
-    0x4086: 'xù',
-    0x4087: 'niǔ',
-    0x4088: 'tóng',
-    0x4089: 'hóu',
-    0x408A: 'yù',
-    0x408C: 'chōng',
-    0x408D: 'bó',
-    0x408E: 'zuǎn,cuān',
-    0x408F: 'diāo',
-    0x4090: 'zhuō',
-    0x4091: 'jī',
-    0x4092: 'qià',
-    0x4094: 'xìng',
-    0x4095: 'huì',
-    0x4096: 'shí',
-    0x4097: 'kū',
-    0x4099: 'duī',
-    0x409A: 'yáo',
-    0x409B: 'yú',
-    0x409C: 'bàng',
-    0x409D: 'jié',
-    0x409E: 'zhè',
-    0x409F: 'jiā',
-    0x40A0: 'shǐ',
-    0x40A1: 'dǐ',
-    0x40A2: 'dǒng',
-    0x40A3: 'cí',
-    0x40A4: 'fù',
-    0x40A5: 'mín',
-    0x40A6: 'zhēn,zhěn',
-    0x40A7: 'zhěn',
-    0x40A9: 'yàn,qìng',
-    0x40AA: 'qiǎo,diào',
-    0x40AB: 'hāng,hóng',
-    0x40AC: 'gǒng',
-    0x40AD: 'qiāo',
-    0x40AE: 'lüè',
-    0x40AF: 'guài',
-    0x40B0: 'là',
-    0x40B1: 'ruì',
-    0x40B2: 'fǎ',
-    0x40B3: 'cuǒ,chǎ',
-    0x40B4: 'yán',
-    0x40B5: 'gōng',
-    0x40B6: 'jié',
-    0x40B7: 'guāi',
-    0x40B8: 'guó',
-    0x40B9: 'suǒ',
-    0x40BA: 'wǒ,kē',
-    0x40BB: 'zhèng',
-    0x40BC: 'niè',
-    0x40BD: 'diào',
-    0x40BE: 'lǎi',
-    0x40BF: 'tà',
-    0x40C0: 'cuì',
-    0x40C1: 'yā',
-    0x40C2: 'gǔn',
-    0x40C5: 'dī',
-    0x40C7: 'mián',
-    0x40C8: 'jiē',
-    0x40C9: 'mín',
-    0x40CA: 'jǔ',
-    0x40CB: 'yú',
-    0x40CC: 'zhēn,yīn',
-    0x40CD: 'zhào',
-    0x40CE: 'zhà,zhǎ',
-    0x40CF: 'xīng',
-    0x40D1: 'bān,pán',
-    0x40D2: 'hé',
-    0x40D3: 'gòu,gōu',
-    0x40D4: 'hóng,qióng',
-    0x40D5: 'láo,luò',
-    0x40D6: 'wù',
-    0x40D7: 'bō,zhuó',
-    0x40D8: 'kēng',
-    0x40D9: 'lù',
-    0x40DA: 'cù,zú',
-    0x40DB: 'lián',
-    0x40DC: 'yī',
-    0x40DD: 'qiào',
-    0x40DE: 'shú',
-    0x40E0: 'xuàn',
-    0x40E1: 'jīn,qín',
-    0x40E2: 'qīn',
-    0x40E3: 'huǐ',
-    0x40E4: 'sù',
-    0x40E5: 'chuáng',
-    0x40E6: 'dūn',
-    0x40E7: 'lóng',
-    0x40E9: 'náo',
-    0x40EA: 'tán',
-    0x40EB: 'dǎn',
-    0x40EC: 'wěi,kuǐ,lěi',
-    0x40ED: 'gǎn',
-    0x40EE: 'dá',
-    0x40EF: 'lì',
-    0x40F0: 'cā',
-    0x40F1: 'xiàn',
-    0x40F2: 'pán',
-    0x40F3: 'là,liè',
-    0x40F4: 'zhū',
-    0x40F5: 'niǎo',
-    0x40F6: 'huái,guī,guài',
-    0x40F7: 'yíng',
-    0x40F8: 'xiàn,jīn',
-    0x40F9: 'làn',
-    0x40FA: 'mó',
-    0x40FB: 'bà',
-    0x40FD: 'guǐ,zhī,fú',
-    0x40FE: 'bǐ',
-    0x40FF: 'fū',
-    0x4100: 'huò',
-    0x4101: 'yì',
-    0x4102: 'liù',
-    0x4104: 'yīn',
-    0x4105: 'juàn',
-    0x4106: 'huó,huàn',
-    0x4107: 'chéng',
-    0x4108: 'dòu,xiáng',
-    0x4109: 'é',
-    0x410B: 'yǎn,yàn',
-    0x410C: 'zhuì,chuò',
-    0x410D: 'zhà',
-    0x410E: 'qǐ',
-    0x410F: 'yú',
-    0x4110: 'quàn',
-    0x4111: 'huó',
-    0x4112: 'niè',
-    0x4113: 'huáng',
-    0x4114: 'jǔ',
-    0x4115: 'shè',
-    0x4118: 'péng',
-    0x4119: 'míng',
-    0x411A: 'cáo',
-    0x411B: 'lóu',
-    0x411C: 'lí,chī',
-    0x411D: 'chuāng',
-    0x411F: 'cuī',
-    0x4120: 'shàn',
-    0x4121: 'dān',
-    0x4122: 'qí',
-    0x4124: 'lài,lǎn',
-    0x4125: 'líng',
-    0x4126: 'liǎo',
-    0x4127: 'réng',
-    0x4128: 'yú',
-    0x4129: 'yì',
-    0x412A: 'diǎo',
-    0x412B: 'qǐ',
-    0x412C: 'yí',
-    0x412D: 'nián',
-    0x412E: 'fū',
-    0x412F: 'jiǎn',
-    0x4130: 'yá',
-    0x4131: 'fāng',
-    0x4132: 'ruì',
-    0x4133: 'xiān',
-    0x4136: 'bì,bó',
-    0x4137: 'shí',
-    0x4138: 'pò',
-    0x4139: 'nián',
-    0x413A: 'zhì,tí',
-    0x413B: 'táo,cháo,tiāo',
-    0x413C: 'tiǎn',
-    0x413D: 'tiǎn',
-    0x413E: 'rù,rǒng',
-    0x413F: 'yì',
-    0x4140: 'liè',
-    0x4141: 'àn',
-    0x4142: 'hé',
-    0x4143: 'qióng,jiòng',
-    0x4144: 'lì',
-    0x4145: 'guī,wā',
-    0x4146: 'zì',
-    0x4147: 'sù',
-    0x4148: 'yuàn',
-    0x4149: 'yà',
-    0x414A: 'chá',
-    0x414B: 'wǎn',
-    0x414C: 'juān',
-    0x414D: 'tǐng',
-    0x414E: 'yǒu',
-    0x414F: 'huì',
-    0x4150: 'jiǎn',
-    0x4151: 'ruí',
-    0x4152: 'máng',
-    0x4153: 'jǔ',
-    0x4154: 'zī',
-    0x4155: 'jū',
-    0x4156: 'ān,ǎn,yān,yǎn,yè',
-    0x4157: 'suì',
-    0x4158: 'lái',
-    0x4159: 'hùn',
-    0x415A: 'quǎn',
-    0x415B: 'chāng',
-    0x415C: 'duò,chuí,tuǒ',
-    0x415D: 'kōng',
-    0x415E: 'nè',
-    0x415F: 'cǎn',
-    0x4160: 'tí',
-    0x4161: 'xǔ',
-    0x4162: 'jiù',
-    0x4163: 'huáng',
-    0x4164: 'qì',
-    0x4165: 'jié,gé',
-    0x4166: 'máo',
-    0x4167: 'yān,yìn',
-    0x4169: 'zhǐ,qí',
-    0x416A: 'tuí',
-    0x416C: 'ài',
-    0x416D: 'páng',
-    0x416E: 'càng',
-    0x416F: 'táng',
-    0x4170: 'ěn',
-    0x4171: 'hùn',
-    0x4172: 'qí',
-    0x4173: 'chú,zōu',
-    0x4174: 'suǒ',
-    0x4175: 'zhuó',
-    0x4176: 'nòu',
-    0x4177: 'tú,chú',
-    0x4178: 'shēn,zú',
-    0x4179: 'lǒu',
-    0x417A: 'biāo,miǎo',
-    0x417B: 'lí',
-    0x417C: 'mán,màn',
-    0x417D: 'xīn,gǔ',
-    0x417E: 'cén,qián',
-    0x417F: 'huá,huáng',
-    0x4180: 'měi',
-    0x4181: 'gāo',
-    0x4182: 'lián',
-    0x4183: 'dào',
-    0x4184: 'zhǎn',
-    0x4185: 'zī',
-    0x4188: 'zhì',
-    0x4189: 'bà',
-    0x418A: 'cuì,mèi',
-    0x418B: 'qiū',
-    0x418D: 'lóng',
-    0x418E: 'xiān',
-    0x418F: 'fèi,fèn',
-    0x4190: 'guó',
-    0x4191: 'chéng',
-    0x4192: 'jiù',
-    0x4193: 'è,ruǎn',
-    0x4194: 'chōng',
-    0x4195: 'yuè',
-    0x4196: 'hóng',
-    0x4197: 'yǎo',
-    0x4198: 'yā,zā',
-    0x4199: 'yáo',
-    0x419A: 'tóng,dòng',
-    0x419B: 'zhà',
-    0x419C: 'yòu',
-    0x419D: 'xuè,zhú',
-    0x419E: 'yǎo',
-    0x419F: 'kè,āo',
-    0x41A0: 'huàn',
-    0x41A1: 'láng',
-    0x41A2: 'yuè',
-    0x41A3: 'chén',
-    0x41A6: 'shèn',
-    0x41A8: 'níng',
-    0x41A9: 'míng',
-    0x41AA: 'hōng',
-    0x41AB: 'chuāng',
-    0x41AC: 'yǔn',
-    0x41AD: 'xuān',
-    0x41AE: 'jìn',
-    0x41AF: 'zhuó',
-    0x41B0: 'yū',
-    0x41B1: 'tān',
-    0x41B2: 'kāng',
-    0x41B3: 'qióng',
-    0x41B5: 'chéng',
-    0x41B6: 'jiū',
-    0x41B7: 'xuè',
-    0x41B8: 'zhēng',
-    0x41B9: 'chōng,tǒng',
-    0x41BA: 'pān',
-    0x41BB: 'qiào',
-    0x41BD: 'qú',
-    0x41BE: 'lán,làn',
-    0x41BF: 'yì',
-    0x41C0: 'róng',
-    0x41C1: 'sī',
-    0x41C2: 'qiān',
-    0x41C3: 'sì',
-    0x41C5: 'fá',
-    0x41C7: 'méng',
-    0x41C8: 'huà',
-    0x41CB: 'hài',
-    0x41CC: 'qiào',
-    0x41CD: 'chù,qì',
-    0x41CE: 'què',
-    0x41CF: 'duì',
-    0x41D0: 'lì',
-    0x41D1: 'bà,pī',
-    0x41D2: 'jiè',
-    0x41D3: 'xū',
-    0x41D4: 'luò,nuò',
-    0x41D6: 'yǔn',
-    0x41D7: 'zhōng',
-    0x41D8: 'hù',
-    0x41D9: 'yǐn',
-    0x41DB: 'zhǐ',
-    0x41DC: 'qiǎn,qiàn',
-    0x41DE: 'gān,gǎn',
-    0x41DF: 'jiàn',
-    0x41E0: 'zhù',
-    0x41E1: 'zhù',
-    0x41E2: 'kǔ,gù',
-    0x41E3: 'niè',
-    0x41E4: 'ruì',
-    0x41E5: 'zé',
-    0x41E6: 'ǎng,yīng',
-    0x41E7: 'zhì,jī',
-    0x41E8: 'gòng,xiáng',
-    0x41E9: 'yì,yè',
-    0x41EA: 'chī',
-    0x41EB: 'jī',
-    0x41EC: 'zhū,shū,chuǎng',
-    0x41ED: 'lǎo',
-    0x41EE: 'rèn',
-    0x41EF: 'róng',
-    0x41F0: 'zhēng',
-    0x41F1: 'nà',
-    0x41F2: 'cè,jiā',
-    0x41F5: 'yí',
-    0x41F6: 'jué,wò',
-    0x41F7: 'bié',
-    0x41F8: 'chéng,tīng',
-    0x41F9: 'jùn',
-    0x41FA: 'dòu',
-    0x41FB: 'wěi',
-    0x41FC: 'yì',
-    0x41FD: 'zhé,zhì',
-    0x41FE: 'yán',
-    0x4200: 'sān',
-    0x4201: 'lún',
-    0x4202: 'píng',
-    0x4203: 'zhǎo',
-    0x4204: 'hán',
-    0x4205: 'yù',
-    0x4206: 'dài',
-    0x4207: 'zhào',
-    0x4208: 'féi,bā',
-    0x4209: 'shà,qiè',
-    0x420A: 'líng',
-    0x420B: 'tà',
-    0x420C: 'qū',
-    0x420D: 'máng,méng',
-    0x420E: 'yè',
-    0x420F: 'báo,fú',
-    0x4210: 'guì',
-    0x4211: 'guǎ',
-    0x4212: 'nǎn,lǎn',
-    0x4213: 'gé,qià',
-    0x4215: 'shí,tí,jī,yí',
-    0x4216: 'kē',
-    0x4217: 'suǒ',
-    0x4218: 'cí',
-    0x4219: 'zhòu',
-    0x421A: 'tái',
-    0x421B: 'kuài',
-    0x421C: 'qìn',
-    0x421D: 'xū',
-    0x421E: 'dǔ',
-    0x421F: 'cè,zhá',
-    0x4220: 'huǎn,yuàn',
-    0x4221: 'cōng,sōng',
-    0x4222: 'sǎi,xǐ',
-    0x4223: 'zhèng',
-    0x4224: 'qián',
-    0x4225: 'jīn',
-    0x4226: 'zōng',
-    0x4227: 'wěi',
-    0x422A: 'xì',
-    0x422B: 'nà',
-    0x422C: 'pú',
-    0x422D: 'sōu,huái',
-    0x422E: 'jù',
-    0x422F: 'zhēn',
-    0x4230: 'shāo',
-    0x4231: 'tāo',
-    0x4232: 'bān,pán',
-    0x4233: 'tà',
-    0x4234: 'qiàn',
-    0x4235: 'wēng',
-    0x4236: 'róng',
-    0x4237: 'luò',
-    0x4238: 'hú',
-    0x4239: 'sǒu',
-    0x423A: 'zhōng',
-    0x423B: 'pú',
-    0x423C: 'miè,mì',
-    0x423D: 'jīn',
-    0x423E: 'shāo,shuò',
-    0x423F: 'mì',
-    0x4240: 'shù',
-    0x4241: 'líng',
-    0x4242: 'lěi',
-    0x4243: 'jiǎng',
-    0x4244: 'léng',
-    0x4245: 'zhì',
-    0x4246: 'diǎo',
-    0x4248: 'sǎn',
-    0x4249: 'gū,hú',
-    0x424A: 'fàn',
-    0x424B: 'mèi',
-    0x424C: 'suì',
-    0x424D: 'jiǎn',
-    0x424E: 'táng',
-    0x424F: 'xiè',
-    0x4250: 'kū',
-    0x4251: 'wú',
-    0x4252: 'fán',
-    0x4253: 'luò',
-    0x4254: 'cān',
-    0x4255: 'céng',
-    0x4256: 'líng',
-    0x4257: 'yī',
-    0x4258: 'cóng',
-    0x4259: 'yún',
-    0x425A: 'méng',
-    0x425B: 'yù,ǎo',
-    0x425C: 'zhì',
-    0x425D: 'yǐ',
-    0x425E: 'dǎn',
-    0x425F: 'huò',
-    0x4260: 'wéi',
-    0x4261: 'tán',
-    0x4262: 'sè',
-    0x4263: 'xiè',
-    0x4264: 'sǒu',
-    0x4265: 'sǒng',
-    0x4266: 'qiān',
-    0x4267: 'liú,liǔ',
-    0x4268: 'yì',
-    0x426A: 'lèi',
-    0x426B: 'lí',
-    0x426C: 'fèi',
-    0x426D: 'liè',
-    0x426E: 'lìn',
-    0x426F: 'xiàn',
-    0x4270: 'xiào,jiǎo',
-    0x4271: 'ōu',
-    0x4272: 'mí',
-    0x4273: 'xiān,xiǎn',
-    0x4274: 'ráng',
-    0x4275: 'zhuàn,zuǎn',
-    0x4276: 'shuāng',
-    0x4277: 'yán',
-    0x4278: 'biàn',
-    0x4279: 'líng',
-    0x427A: 'hóng',
-    0x427B: 'qí',
-    0x427C: 'liào',
-    0x427D: 'bǎn',
-    0x427E: 'bì',
-    0x427F: 'hú',
-    0x4280: 'hú',
-    0x4282: 'cè,sè',
-    0x4283: 'pèi',
-    0x4284: 'qióng',
-    0x4285: 'míng',
-    0x4286: 'jiù,qiǔ',
-    0x4287: 'bù',
-    0x4288: 'méi',
-    0x4289: 'sǎn',
-    0x428A: 'wèi',
-    0x428D: 'lí',
-    0x428E: 'quǎn,qún',
-    0x4290: 'hún',
-    0x4291: 'xiǎng',
-    0x4293: 'shì',
-    0x4294: 'yíng',
-    0x4296: 'nǎn',
-    0x4297: 'huáng',
-    0x4298: 'jiù',
-    0x4299: 'yān',
-    0x429B: 'sà',
-    0x429C: 'tuán',
-    0x429D: 'xiè',
-    0x429E: 'zhé,chè',
-    0x429F: 'mén',
-    0x42A0: 'xì',
-    0x42A1: 'mán',
-    0x42A3: 'huáng',
-    0x42A4: 'tán,dàn',
-    0x42A5: 'xiào',
-    0x42A6: 'yè',
-    0x42A7: 'bì',
-    0x42A8: 'luó',
-    0x42A9: 'fán',
-    0x42AA: 'lì',
-    0x42AB: 'cuǐ',
-    0x42AC: 'chuā',
-    0x42AD: 'dào,chóu',
-    0x42AE: 'dí',
-    0x42AF: 'kuàng',
-    0x42B0: 'chú',
-    0x42B1: 'xiān',
-    0x42B2: 'chàn,chǎn',
-    0x42B3: 'mí,mó',
-    0x42B4: 'qiàn',
-    0x42B5: 'qiú',
-    0x42B6: 'zhèn',
-    0x42BA: 'hù',
-    0x42BB: 'gān',
-    0x42BC: 'chǐ',
-    0x42BD: 'guài,jué',
-    0x42BE: 'mù',
-    0x42BF: 'bó',
-    0x42C0: 'huà',
-    0x42C1: 'gěng',
-    0x42C2: 'yáo',
-    0x42C3: 'mào',
-    0x42C4: 'wǎng',
-    0x42C8: 'rú,nǎ',
-    0x42C9: 'xué',
-    0x42CA: 'zhēng',
-    0x42CB: 'mín',
-    0x42CC: 'jiǎng',
-    0x42CE: 'zhàn',
-    0x42CF: 'zuó,zhà',
-    0x42D0: 'yuè',
-    0x42D1: 'liè',
-    0x42D3: 'zhòu',
-    0x42D4: 'bì',
-    0x42D5: 'rèn',
-    0x42D6: 'yù',
-    0x42D8: 'chuò',
-    0x42D9: 'ěr',
-    0x42DA: 'yì',
-    0x42DB: 'mǐ',
-    0x42DC: 'qìng',
-    0x42DE: 'wǎng',
-    0x42DF: 'jì',
-    0x42E0: 'bǔ',
-    0x42E2: 'biē',
-    0x42E3: 'fán,pó',
-    0x42E4: 'yuè',
-    0x42E5: 'lí',
-    0x42E6: 'fán',
-    0x42E7: 'qú',
-    0x42E8: 'fǔ',
-    0x42E9: 'ér',
-    0x42EA: 'ē',
-    0x42EB: 'zhēng',
-    0x42EC: 'tiān',
-    0x42ED: 'yù',
-    0x42EE: 'jìn',
-    0x42EF: 'qǐ',
-    0x42F0: 'jú',
-    0x42F1: 'lái',
-    0x42F2: 'chě',
-    0x42F3: 'běi',
-    0x42F4: 'niù',
-    0x42F5: 'yì,yè',
-    0x42F6: 'xǔ,xié',
-    0x42F7: 'móu',
-    0x42F8: 'xún',
-    0x42F9: 'fú',
-    0x42FB: 'nín',
-    0x42FC: 'tīng,yíng',
-    0x42FD: 'běng',
-    0x42FE: 'zhǎ,nà',
-    0x42FF: 'wēi',
-    0x4300: 'kē',
-    0x4301: 'yāo',
-    0x4302: 'òu',
-    0x4303: 'xiāo,shuò',
-    0x4304: 'gěng',
-    0x4305: 'táng',
-    0x4306: 'guì',
-    0x4307: 'huì',
-    0x4308: 'tā,tà',
-    0x430A: 'yáo',
-    0x430B: 'dā',
-    0x430C: 'qì',
-    0x430D: 'jǐn',
-    0x430E: 'lüè',
-    0x430F: 'mì',
-    0x4310: 'mì',
-    0x4311: 'jiān',
-    0x4312: 'lù',
-    0x4313: 'fán',
-    0x4314: 'ōu',
-    0x4315: 'mí',
-    0x4316: 'jié',
-    0x4317: 'fǔ',
-    0x4318: 'biè,bì',
-    0x4319: 'huàng',
-    0x431A: 'sū',
-    0x431B: 'yáo',
-    0x431C: 'niè',
-    0x431D: 'jīn,jìn',
-    0x431E: 'liǎn',
-    0x431F: 'bó,bì',
-    0x4320: 'jiān',
-    0x4321: 'tǐ',
-    0x4322: 'líng',
-    0x4323: 'zuǎn',
-    0x4324: 'shī,zhǐ',
-    0x4325: 'yǐn',
-    0x4326: 'dào',
-    0x4327: 'chóu',
-    0x4328: 'cā,cài',
-    0x4329: 'miè',
-    0x432A: 'yǎn',
-    0x432B: 'lǎn',
-    0x432C: 'chóng',
-    0x432D: 'jiāo',
-    0x432E: 'shuāng',
-    0x432F: 'quān,quán,guàn',
-    0x4330: 'niè',
-    0x4331: 'luò',
-    0x4333: 'shī',
-    0x4334: 'luò',
-    0x4335: 'zhú',
-    0x4337: 'chōu,chóu',
-    0x4338: 'juàn',
-    0x4339: 'jiǒng',
-    0x433A: 'ěr',
-    0x433B: 'yì',
-    0x433C: 'ruì',
-    0x433D: 'cǎi',
-    0x433E: 'rén',
-    0x433F: 'fú',
-    0x4340: 'lán',
-    0x4341: 'suì',
-    0x4342: 'yú',
-    0x4343: 'yóu',
-    0x4344: 'diǎn',
-    0x4345: 'líng',
-    0x4346: 'zhù',
-    0x4347: 'tà',
-    0x4348: 'píng',
-    0x4349: 'zhǎi',
-    0x434A: 'jiāo',
-    0x434B: 'chuí',
-    0x434C: 'bù',
-    0x434D: 'kòu',
-    0x434E: 'cùn,xiǎn',
-    0x4350: 'hǎn',
-    0x4351: 'hǎn',
-    0x4352: 'mǒu',
-    0x4353: 'hù',
-    0x4354: 'gōng',
-    0x4355: 'dī,dǐ',
-    0x4356: 'fú',
-    0x4357: 'xuàn',
-    0x4358: 'mí',
-    0x4359: 'méi,mǒu',
-    0x435A: 'làng',
-    0x435B: 'gù',
-    0x435C: 'zhào',
-    0x435D: 'tà',
-    0x435E: 'yù',
-    0x435F: 'zòng',
-    0x4360: 'lí',
-    0x4361: 'lù',
-    0x4362: 'wú',
-    0x4363: 'léi',
-    0x4364: 'jǐ',
-    0x4365: 'lì',
-    0x4366: 'lí',
-    0x4368: 'pō,fèi',
-    0x4369: 'yǎng',
-    0x436A: 'wà',
-    0x436B: 'tuó',
-    0x436C: 'pēng',
-    0x436E: 'zhào',
-    0x436F: 'guǐ',
-    0x4371: 'xú',
-    0x4372: 'nái',
-    0x4373: 'què,jué,chuò',
-    0x4374: 'wěi',
-    0x4375: 'zhēng',
-    0x4376: 'dōng',
-    0x4377: 'wěi',
-    0x4378: 'bó',
-    0x437A: 'huàn',
-    0x437B: 'xuàn',
-    0x437C: 'zān,cán',
-    0x437D: 'lì',
-    0x437E: 'yǎn',
-    0x437F: 'huáng',
-    0x4380: 'xuè',
-    0x4381: 'hú',
-    0x4382: 'bǎo',
-    0x4383: 'rǎn',
-    0x4384: 'xiāo,tiáo',
-    0x4385: 'pò',
-    0x4386: 'liào',
-    0x4387: 'zhōu',
-    0x4388: 'yì',
-    0x4389: 'xù',
-    0x438A: 'luò,pò',
-    0x438B: 'kào',
-    0x438C: 'chù',
-    0x438E: 'nà',
-    0x438F: 'hán',
-    0x4390: 'chǎo',
-    0x4391: 'lù',
-    0x4392: 'zhǎn',
-    0x4393: 'tà',
-    0x4394: 'fū',
-    0x4395: 'hōng',
-    0x4396: 'zēng',
-    0x4397: 'qiáo',
-    0x4398: 'sù',
-    0x4399: 'pīn',
-    0x439A: 'guàn',
-    0x439C: 'hūn',
-    0x439D: 'chú',
-    0x439F: 'ér',
-    0x43A0: 'ér,nuò',
-    0x43A1: 'ruǎn',
-    0x43A2: 'qǐ',
-    0x43A3: 'sì',
-    0x43A4: 'jú',
-    0x43A6: 'yǎn',
-    0x43A7: 'bàng,póu',
-    0x43A8: 'yè,àn',
-    0x43A9: 'zī',
-    0x43AA: 'nè',
-    0x43AB: 'chuàng',
-    0x43AC: 'bà',
-    0x43AD: 'cāo',
-    0x43AE: 'tì',
-    0x43AF: 'hàn,hǎn',
-    0x43B0: 'zuó',
-    0x43B1: 'bà,bēi',
-    0x43B2: 'zhé',
-    0x43B3: 'wà',
-    0x43B4: 'gēng,shèng',
-    0x43B5: 'bì',
-    0x43B6: 'èr',
-    0x43B7: 'zhù',
-    0x43B8: 'wù',
-    0x43B9: 'wén',
-    0x43BA: 'zhì',
-    0x43BB: 'zhòu',
-    0x43BC: 'lù',
-    0x43BD: 'wén',
-    0x43BE: 'gǔn',
-    0x43BF: 'qiú',
-    0x43C0: 'là',
-    0x43C1: 'zǎi',
-    0x43C2: 'sǒu',
-    0x43C3: 'mián,míng',
-    0x43C4: 'dǐ,zhì',
-    0x43C5: 'qì',
-    0x43C6: 'cáo',
-    0x43C7: 'piào',
-    0x43C8: 'lián,luán',
-    0x43C9: 'shī',
-    0x43CA: 'lóng',
-    0x43CB: 'sù',
-    0x43CC: 'qì,yì',
-    0x43CD: 'yuàn,yuān',
-    0x43CE: 'féng',
-    0x43CF: 'xū',
-    0x43D0: 'jué',
-    0x43D1: 'dì',
-    0x43D2: 'piàn,pàn',
-    0x43D3: 'guǎn',
-    0x43D4: 'niǔ,zhǒu,ròu,nǜ',
-    0x43D5: 'rèn',
-    0x43D6: 'zhèn,yǐn',
-    0x43D7: 'gài',
-    0x43D8: 'pì',
-    0x43D9: 'tǎn,dàn,zhuàn',
-    0x43DA: 'chǎo,miǎo',
-    0x43DB: 'chǔn',
-    0x43DC: 'hē',
-    0x43DD: 'zhuān',
-    0x43DE: 'mò',
-    0x43DF: 'bié,bì',
-    0x43E0: 'qì,lā',
-    0x43E1: 'shì',
-    0x43E2: 'bǐ',
-    0x43E3: 'jué',
-    0x43E4: 'sì',
-    0x43E6: 'guā,tián',
-    0x43E7: 'nà,ná,chǐ',
-    0x43E8: 'huǐ,duī',
-    0x43E9: 'xī',
-    0x43EA: 'èr',
-    0x43EB: 'xiū',
-    0x43EC: 'móu',
-    0x43EE: 'xí',
-    0x43EF: 'zhì',
-    0x43F0: 'rùn',
-    0x43F1: 'jú',
-    0x43F2: 'dié,tī',
-    0x43F3: 'zhè',
-    0x43F4: 'shào',
-    0x43F5: 'měng,mǎng,máng',
-    0x43F6: 'bì',
-    0x43F7: 'hàn',
-    0x43F8: 'yú',
-    0x43F9: 'xiàn,chēn',
-    0x43FA: 'pāng',
-    0x43FB: 'néng',
-    0x43FC: 'cán,zhàn',
-    0x43FD: 'bù,péi',
-    0x43FF: 'qǐ',
-    0x4400: 'jì',
-    0x4401: 'zhuó,dū',
-    0x4402: 'lù',
-    0x4403: 'jùn,zhūn',
-    0x4404: 'xiàn,hàn',
-    0x4405: 'xī',
-    0x4406: 'cǎi',
-    0x4407: 'wěn,chún',
-    0x4408: 'zhí',
-    0x4409: 'zì,nǎo',
-    0x440A: 'kūn,hún,hùn',
-    0x440B: 'cōng',
-    0x440C: 'tiǎn',
-    0x440D: 'chù',
-    0x440E: 'dī',
-    0x440F: 'chǔn,shǔn',
-    0x4410: 'qiū',
-    0x4411: 'zhé',
-    0x4412: 'zhā',
-    0x4413: 'róu',
-    0x4414: 'bǐn,biàn',
-    0x4415: 'jí',
-    0x4416: 'xī',
-    0x4417: 'zhū,dǔ',
-    0x4418: 'jué',
-    0x4419: 'gé',
-    0x441A: 'jī',
-    0x441B: 'dā',
-    0x441C: 'chēn',
-    0x441D: 'suò',
-    0x441E: 'ruò',
-    0x441F: 'xiǎng,gōu',
-    0x4420: 'huǎng',
-    0x4421: 'qí',
-    0x4422: 'zhù,zhòu,chù',
-    0x4423: 'sǔn',
-    0x4424: 'chāi,cuó',
-    0x4425: 'wěng',
-    0x4426: 'kē',
-    0x4427: 'kào,hè',
-    0x4428: 'gǔ,què',
-    0x4429: 'gāi,guī,kǎi',
-    0x442A: 'fàn',
-    0x442B: 'cōng',
-    0x442C: 'cáo',
-    0x442D: 'zhì,dì',
-    0x442E: 'chǎn',
-    0x442F: 'léi,lěi',
-    0x4430: 'xiū',
-    0x4431: 'zhài',
-    0x4432: 'zhé',
-    0x4433: 'yú',
-    0x4434: 'guì',
-    0x4435: 'gōng,huáng',
-    0x4436: 'zān,jǐn,qián',
-    0x4437: 'dān',
-    0x4438: 'huò,guó',
-    0x4439: 'sōu,sào,xiào',
-    0x443A: 'tàn,tán',
-    0x443B: 'gū',
-    0x443C: 'xì',
-    0x443D: 'mán',
-    0x443E: 'duó',
-    0x443F: 'ào,ǎo',
-    0x4440: 'pì,pǐ',
-    0x4441: 'wù',
-    0x4442: 'ǎi',
-    0x4443: 'méng',
-    0x4444: 'pì,yì',
-    0x4445: 'méng',
-    0x4446: 'yǎng',
-    0x4447: 'zhì',
-    0x4448: 'bó',
-    0x4449: 'yíng',
-    0x444A: 'wéi,wèi',
-    0x444B: 'rǎng',
-    0x444C: 'lán,làn',
-    0x444D: 'yān,yàn,yǐng',
-    0x444E: 'chǎn',
-    0x444F: 'quán,huān',
-    0x4450: 'zhěn',
-    0x4451: 'pú',
-    0x4453: 'tái',
-    0x4454: 'fèi',
-    0x4455: 'shǔ',
-    0x4457: 'dàng',
-    0x4458: 'cuó',
-    0x4459: 'tān,rán,tiàn',
-    0x445A: 'tián',
-    0x445B: 'chǐ',
-    0x445C: 'tà,tiè',
-    0x445D: 'jiǎ',
-    0x445E: 'shùn',
-    0x445F: 'huáng',
-    0x4460: 'liǎo',
-    0x4463: 'chēn',
-    0x4464: 'jìn',
-    0x4465: 'è,sà',
-    0x4466: 'gōu',
-    0x4467: 'fú',
-    0x4468: 'duò',
-    0x446A: 'è',
-    0x446B: 'bēng',
-    0x446C: 'tāo,yào,tiāo',
-    0x446D: 'dì',
-    0x446F: 'dì',
-    0x4470: 'bù',
-    0x4471: 'wǎn',
-    0x4472: 'zhào',
-    0x4473: 'lún',
-    0x4474: 'qí',
-    0x4475: 'mù',
-    0x4476: 'qiàn',
-    0x4478: 'zōng',
-    0x4479: 'sōu,sāo',
-    0x447B: 'yóu',
-    0x447C: 'zhōu',
-    0x447D: 'tà',
-    0x447F: 'sù',
-    0x4480: 'bù',
-    0x4481: 'xí',
-    0x4482: 'jiǎng',
-    0x4483: 'cào',
-    0x4484: 'fù',
-    0x4485: 'téng',
-    0x4486: 'chè',
-    0x4487: 'fù',
-    0x4488: 'fèi',
-    0x4489: 'wǔ',
-    0x448A: 'xī',
-    0x448B: 'yǎng',
-    0x448C: 'mìng',
-    0x448D: 'pǎng',
-    0x448E: 'mǎng',
-    0x448F: 'sēng',
-    0x4490: 'méng,mèng',
-    0x4491: 'cǎo',
-    0x4492: 'tiáo',
-    0x4493: 'kǎi',
-    0x4494: 'bài',
-    0x4495: 'xiǎo',
-    0x4496: 'xìn',
-    0x4497: 'qì',
-    0x449A: 'shǎo',
-    0x449B: 'huàn',
-    0x449C: 'niú',
-    0x449D: 'xiáo',
-    0x449E: 'chén,yín',
-    0x449F: 'dān',
-    0x44A0: 'fēng,xiá',
-    0x44A1: 'yǐn',
-    0x44A2: 'áng',
-    0x44A3: 'rǎn',
-    0x44A4: 'rì',
-    0x44A5: 'mán',
-    0x44A6: 'fàn',
-    0x44A7: 'qū,qù',
-    0x44A8: 'shǐ,sì',
-    0x44A9: 'hé',
-    0x44AA: 'biàn',
-    0x44AB: 'dài',
-    0x44AC: 'mò',
-    0x44AD: 'děng',
-    0x44B0: 'kuāng',
-    0x44B2: 'chà',
-    0x44B3: 'duǒ',
-    0x44B4: 'yǒu',
-    0x44B5: 'hào',
-    0x44B7: 'guā',
-    0x44B8: 'xuè',
-    0x44B9: 'lèi',
-    0x44BA: 'jǐn',
-    0x44BB: 'qǐ',
-    0x44BC: 'qū',
-    0x44BD: 'wǎng',
-    0x44BE: 'yī',
-    0x44BF: 'liáo',
-    0x44C2: 'yán',
-    0x44C3: 'yì',
-    0x44C4: 'yín',
-    0x44C5: 'qí',
-    0x44C6: 'zhé',
-    0x44C7: 'xì,hè,kè',
-    0x44C8: 'yì',
-    0x44C9: 'yé,yē',
-    0x44CA: 'wú,yú',
-    0x44CB: 'zhī',
-    0x44CC: 'zhì',
-    0x44CD: 'hǎn',
-    0x44CE: 'chuò',
-    0x44CF: 'fū',
-    0x44D0: 'chún',
-    0x44D1: 'píng',
-    0x44D2: 'kuǎi',
-    0x44D3: 'chóu',
-    0x44D5: 'tuǒ',
-    0x44D6: 'qióng',
-    0x44D7: 'cōng',
-    0x44D8: 'gāo,jiù',
-    0x44D9: 'kuā,guāi',
-    0x44DA: 'qū,cú',
-    0x44DB: 'qū',
-    0x44DC: 'zhī',
-    0x44DD: 'mèng',
-    0x44DE: 'lì',
-    0x44DF: 'zhōu,liè',
-    0x44E0: 'tà',
-    0x44E1: 'zhī',
-    0x44E2: 'gù',
-    0x44E3: 'liǎng',
-    0x44E4: 'hū',
-    0x44E5: 'là',
-    0x44E6: 'diǎn',
-    0x44E7: 'cì',
-    0x44E8: 'yīng',
-    0x44EB: 'qí',
-    0x44EC: 'zhuó',
-    0x44ED: 'chà',
-    0x44EE: 'mào',
-    0x44EF: 'dú',
-    0x44F0: 'yīn',
-    0x44F1: 'chái,zuī',
-    0x44F2: 'ruì',
-    0x44F3: 'hěn,xié',
-    0x44F4: 'ruǎn',
-    0x44F5: 'fū',
-    0x44F6: 'lài',
-    0x44F7: 'xìng',
-    0x44F8: 'jiān',
-    0x44F9: 'yì',
-    0x44FA: 'měi',
-    0x44FC: 'máng,hè',
-    0x44FD: 'jì',
-    0x44FE: 'suō',
-    0x44FF: 'hàn',
-    0x4501: 'lì',
-    0x4502: 'zǐ,zǎi',
-    0x4503: 'zǔ',
-    0x4504: 'yáo,yào',
-    0x4505: 'gē',
-    0x4506: 'lí',
-    0x4507: 'qǐ,ái',
-    0x4508: 'gòng',
-    0x4509: 'lì,suàn',
-    0x450A: 'bīng',
-    0x450B: 'suō',
-    0x450E: 'sù',
-    0x450F: 'chòu',
-    0x4510: 'jiān',
-    0x4511: 'xié,yé,tú',
-    0x4512: 'bèi',
-    0x4513: 'xǔ',
-    0x4514: 'jìng',
-    0x4515: 'pú',
-    0x4516: 'líng',
-    0x4517: 'xiáng',
-    0x4518: 'zuò',
-    0x4519: 'diào',
-    0x451A: 'chún',
-    0x451B: 'qǐng',
-    0x451C: 'nán',
-    0x451D: 'zhāi',
-    0x451E: 'lǜ',
-    0x451F: 'yí',
-    0x4520: 'shǎo,shāo,shuò',
-    0x4521: 'yú',
-    0x4522: 'huá',
-    0x4523: 'lí',
-    0x4524: 'pā',
-    0x4527: 'lí',
-    0x452A: 'shuǎng',
-    0x452C: 'yì',
-    0x452D: 'nìng',
-    0x452E: 'sī',
-    0x452F: 'kù',
-    0x4530: 'fù',
-    0x4531: 'yī',
-    0x4532: 'dēng,chéng',
-    0x4533: 'rán',
-    0x4534: 'cè,cuì,chuà',
-    0x4536: 'tí,tái',
-    0x4537: 'qín',
-    0x4538: 'biǎo,biāo',
-    0x4539: 'suì',
-    0x453A: 'wéi,wěi',
-    0x453B: 'dūn,duī',
-    0x453C: 'sè,zé',
-    0x453D: 'ài',
-    0x453E: 'qì,è',
-    0x453F: 'zǔn',
-    0x4540: 'kuǎn',
-    0x4541: 'fěi',
-    0x4543: 'yìn',
-    0x4545: 'sǎo',
-    0x4546: 'dòu',
-    0x4547: 'huì',
-    0x4548: 'xiè',
-    0x4549: 'zé',
-    0x454A: 'tán',
-    0x454B: 'táng',
-    0x454C: 'zhì',
-    0x454D: 'yì',
-    0x454E: 'fú',
-    0x454F: 'é',
-    0x4551: 'jùn',
-    0x4552: 'jiā',
-    0x4553: 'chá,chuì',
-    0x4554: 'xián',
-    0x4555: 'màn',
-    0x4557: 'bì',
-    0x4558: 'líng,lǐng',
-    0x4559: 'jié',
-    0x455A: 'kuì',
-    0x455B: 'jiá',
-    0x455D: 'chēng',
-    0x455E: 'làng',
-    0x455F: 'xīng',
-    0x4560: 'fèi',
-    0x4561: 'lǘ',
-    0x4562: 'zhǎ',
-    0x4563: 'hé',
-    0x4564: 'jī',
-    0x4565: 'nǐ',
-    0x4566: 'yíng',
-    0x4567: 'xiào,jiǎo',
-    0x4568: 'téng',
-    0x4569: 'lǎo',
-    0x456A: 'zé',
-    0x456B: 'kuí',
-    0x456D: 'qián,xián',
-    0x456E: 'jú,qū',
-    0x456F: 'piáo',
-    0x4570: 'fán',
-    0x4571: 'tóu',
-    0x4572: 'lǐn',
-    0x4573: 'mí',
-    0x4574: 'zhuó',
-    0x4575: 'xié',
-    0x4576: 'hù',
-    0x4577: 'mí',
-    0x4578: 'jiē',
-    0x4579: 'zá',
-    0x457A: 'cóng',
-    0x457B: 'lì',
-    0x457C: 'rán',
-    0x457D: 'zhú',
-    0x457E: 'yín,yán',
-    0x457F: 'hàn',
-    0x4581: 'yì',
-    0x4582: 'luán',
-    0x4583: 'yuè,lǎ',
-    0x4584: 'rán',
-    0x4585: 'líng',
-    0x4586: 'niàng',
-    0x4587: 'yù',
-    0x4588: 'nüè',
-    0x458A: 'yì',
-    0x458B: 'nüè',
-    0x458C: 'yì',
-    0x458D: 'qián',
-    0x458E: 'xiá',
-    0x458F: 'chǔ,chù',
-    0x4590: 'yín',
-    0x4591: 'mì',
-    0x4592: 'xī',
-    0x4593: 'nà',
-    0x4594: 'kǎn,hàn',
-    0x4595: 'zǔ',
-    0x4596: 'xiá',
-    0x4597: 'yán',
-    0x4598: 'tú',
-    0x4599: 'tī',
-    0x459A: 'wū',
-    0x459B: 'suǒ',
-    0x459C: 'yín',
-    0x459D: 'chóng',
-    0x459E: 'zhǒu',
-    0x459F: 'mǎng',
-    0x45A0: 'yuán',
-    0x45A1: 'nǜ',
-    0x45A2: 'miáo',
-    0x45A3: 'zǎo',
-    0x45A4: 'wǎn',
-    0x45A5: 'lí',
-    0x45A6: 'qū,zhuō',
-    0x45A7: 'nà',
-    0x45A8: 'shí,zhì',
-    0x45A9: 'bì',
-    0x45AA: 'zī,cī',
-    0x45AB: 'bàng',
-    0x45AD: 'juàn,juān',
-    0x45AE: 'xiǎng',
-    0x45AF: 'kuí,wā',
-    0x45B0: 'pài',
-    0x45B1: 'kuāng',
-    0x45B2: 'xún,zōng',
-    0x45B3: 'zhà,zhé',
-    0x45B4: 'yáo',
-    0x45B5: 'kūn',
-    0x45B6: 'huī',
-    0x45B7: 'xī',
-    0x45B8: 'é',
-    0x45B9: 'yáng,mǐ',
-    0x45BA: 'tiáo',
-    0x45BB: 'yóu',
-    0x45BC: 'jué',
-    0x45BD: 'lí',
-    0x45BF: 'lí',
-    0x45C0: 'chēng',
-    0x45C1: 'jì,qī',
-    0x45C2: 'hǔ',
-    0x45C3: 'zhàn',
-    0x45C4: 'fǔ',
-    0x45C5: 'cháng',
-    0x45C6: 'guǎn,guān',
-    0x45C7: 'jú,qū',
-    0x45C8: 'méng',
-    0x45C9: 'chāng',
-    0x45CA: 'tàn',
-    0x45CB: 'móu',
-    0x45CC: 'xīng',
-    0x45CD: 'lǐ,luó',
-    0x45CE: 'yān',
-    0x45CF: 'sōu',
-    0x45D0: 'shī',
-    0x45D1: 'yì',
-    0x45D2: 'bìng',
-    0x45D3: 'cōng',
-    0x45D4: 'hóu,hòu',
-    0x45D5: 'wǎn',
-    0x45D6: 'dì',
-    0x45D7: 'jī',
-    0x45D8: 'gé',
-    0x45D9: 'hán',
-    0x45DA: 'bó',
-    0x45DB: 'xiū',
-    0x45DC: 'liú',
-    0x45DD: 'cán',
-    0x45DE: 'cán',
-    0x45DF: 'yì',
-    0x45E0: 'xuán',
-    0x45E1: 'yán,yān',
-    0x45E2: 'zǎo',
-    0x45E3: 'hàn',
-    0x45E4: 'yóng',
-    0x45E5: 'zōng',
-    0x45E7: 'kāng',
-    0x45E8: 'yú',
-    0x45E9: 'qī',
-    0x45EA: 'zhè',
-    0x45EB: 'má',
-    0x45EE: 'shuǎng',
-    0x45EF: 'jìn',
-    0x45F0: 'guàn',
-    0x45F1: 'pú,pù,pǔ',
-    0x45F2: 'lìn',
-    0x45F4: 'tíng',
-    0x45F5: 'jiāng',
-    0x45F6: 'là',
-    0x45F7: 'yì',
-    0x45F8: 'yōng',
-    0x45F9: 'cì',
-    0x45FA: 'yǎn,dàn',
-    0x45FB: 'jié',
-    0x45FC: 'xūn',
-    0x45FD: 'wèi',
-    0x45FE: 'xiǎn',
-    0x45FF: 'níng,nǐng',
-    0x4600: 'fù',
-    0x4601: 'gé',
-    0x4603: 'mò',
-    0x4604: 'zhù',
-    0x4605: 'nái',
-    0x4606: 'xiǎn',
-    0x4607: 'wén',
-    0x4608: 'lì',
-    0x4609: 'cán',
-    0x460A: 'miè',
-    0x460B: 'jiān',
-    0x460C: 'nì',
-    0x460D: 'chài',
-    0x460E: 'wān',
-    0x460F: 'xù',
-    0x4610: 'nǜ',
-    0x4611: 'mài',
-    0x4612: 'zuī',
-    0x4613: 'kàn',
-    0x4614: 'kā',
-    0x4615: 'háng',
-    0x4618: 'yù,sù',
-    0x4619: 'wèi',
-    0x461A: 'zhú',
-    0x461D: 'yì',
-    0x461F: 'diāo',
-    0x4620: 'fú',
-    0x4621: 'bǐ',
-    0x4622: 'zhǔ',
-    0x4623: 'zǐ,zhì',
-    0x4624: 'shù',
-    0x4625: 'xiá,jiá',
-    0x4626: 'ní,nǐ',
-    0x4628: 'jiǎo',
-    0x4629: 'xún,xuàn',
-    0x462A: 'chōng',
-    0x462B: 'nòu',
-    0x462C: 'róng',
-    0x462D: 'zhì',
-    0x462E: 'sāng,sàng',
-    0x4630: 'shān',
-    0x4631: 'yù',
-    0x4633: 'jīn',
-    0x4635: 'lù',
-    0x4636: 'hān,hàn',
-    0x4637: 'biē',
-    0x4638: 'yì',
-    0x4639: 'zuì,cuì',
-    0x463A: 'zhàn',
-    0x463B: 'yù',
-    0x463C: 'wǎn',
-    0x463D: 'ní',
-    0x463E: 'guǎn,guàn',
-    0x463F: 'jué',
-    0x4640: 'běng',
-    0x4641: 'cán',
-    0x4643: 'duò',
-    0x4644: 'qì,zhǎ',
-    0x4645: 'yāo,yào',
-    0x4646: 'kuì',
-    0x4647: 'ruán,nuǎn',
-    0x4648: 'hóu',
-    0x4649: 'xún',
-    0x464A: 'xiè',
-    0x464C: 'kuì',
-    0x464E: 'xié,xì',
-    0x464F: 'bó',
-    0x4650: 'kè',
-    0x4651: 'cuī',
-    0x4652: 'xù',
-    0x4653: 'bǎi',
-    0x4654: 'ōu',
-    0x4655: 'zǒng',
-    0x4657: 'tì',
-    0x4658: 'chǔ,zú',
-    0x4659: 'chí',
-    0x465A: 'niǎo',
-    0x465B: 'guàn',
-    0x465C: 'féng',
-    0x465D: 'xiè',
-    0x465E: 'dēng',
-    0x465F: 'wéi',
-    0x4660: 'jué',
-    0x4661: 'kuì,huì',
-    0x4662: 'zèng',
-    0x4663: 'sà',
-    0x4664: 'duǒ',
-    0x4665: 'líng',
-    0x4666: 'méng',
-    0x4668: 'guǒ',
-    0x4669: 'méng',
-    0x466A: 'lóng',
-    0x466C: 'yìng',
-    0x466E: 'guàn',
-    0x466F: 'cù',
-    0x4670: 'lí',
-    0x4671: 'dú',
-    0x4673: 'biāo,è',
-    0x4675: 'xī',
-    0x4677: 'dé',
-    0x4678: 'dé',
-    0x4679: 'xiàn',
-    0x467A: 'lián',
-    0x467C: 'shào,jiāo',
-    0x467D: 'xié',
-    0x467E: 'shī',
-    0x467F: 'wèi',
-    0x4682: 'hè',
-    0x4683: 'yóu',
-    0x4684: 'lù',
-    0x4685: 'lài,lái',
-    0x4686: 'yǐng',
-    0x4687: 'shěng',
-    0x4688: 'juàn',
-    0x4689: 'qì',
-    0x468A: 'jiǎn',
-    0x468B: 'yùn',
-    0x468D: 'qì',
-    0x468F: 'lìn',
-    0x4690: 'jí',
-    0x4691: 'mái',
-    0x4692: 'chuáng,zhuàng',
-    0x4693: 'niǎn',
-    0x4694: 'bīn',
-    0x4695: 'lì',
-    0x4696: 'líng',
-    0x4697: 'gāng',
-    0x4698: 'chéng',
-    0x4699: 'xuān,xī',
-    0x469A: 'xiǎn',
-    0x469B: 'hú',
-    0x469C: 'bī,bēi',
-    0x469D: 'zú',
-    0x469E: 'dǎi',
-    0x469F: 'dǎi',
-    0x46A0: 'hùn,hún',
-    0x46A1: 'sāi',
-    0x46A2: 'chè',
-    0x46A3: 'tí',
-    0x46A5: 'nuò,ruò',
-    0x46A6: 'zhì',
-    0x46A7: 'liú',
-    0x46A8: 'fèi',
-    0x46A9: 'jiǎo,jiào,qiáo',
-    0x46AA: 'guān',
-    0x46AB: 'xí,áo',
-    0x46AC: 'lín',
-    0x46AD: 'xuān',
-    0x46AE: 'réng',
-    0x46AF: 'tǎo,xuān',
-    0x46B0: 'pǐ,é',
-    0x46B1: 'xìn',
-    0x46B2: 'shàn',
-    0x46B3: 'zhì',
-    0x46B4: 'wà',
-    0x46B5: 'tǒu',
-    0x46B6: 'tiān',
-    0x46B7: 'yī,yǐ,xì',
-    0x46B8: 'xiè',
-    0x46B9: 'pǐ',
-    0x46BA: 'yáo',
-    0x46BB: 'yáo,yóu',
-    0x46BC: 'nǜ',
-    0x46BD: 'hào',
-    0x46BE: 'rén,nín',
-    0x46BF: 'yìn,xī',
-    0x46C0: 'fǎn,fàn,bàn',
-    0x46C1: 'nán',
-    0x46C2: 'yāo',
-    0x46C3: 'wàn',
-    0x46C4: 'yuǎn',
-    0x46C5: 'xiá',
-    0x46C6: 'zhòu',
-    0x46C7: 'yuǎn',
-    0x46C8: 'shì',
-    0x46C9: 'miàn',
-    0x46CA: 'xī,zhī',
-    0x46CB: 'jì',
-    0x46CC: 'táo,páo',
-    0x46CD: 'fèi',
-    0x46CE: 'xuè',
-    0x46CF: 'ní,nǐ,nì',
-    0x46D0: 'cí',
-    0x46D1: 'mì',
-    0x46D2: 'biàn',
-    0x46D4: 'ná',
-    0x46D5: 'yù',
-    0x46D6: 'è',
-    0x46D7: 'zhǐ',
-    0x46D8: 'rén,nín',
-    0x46D9: 'xù',
-    0x46DA: 'lüè',
-    0x46DB: 'huì',
-    0x46DC: 'xùn',
-    0x46DD: 'náo',
-    0x46DE: 'hàn',
-    0x46DF: 'jiá',
-    0x46E0: 'dòu',
-    0x46E1: 'huà',
-    0x46E2: 'tū',
-    0x46E3: 'pīng,chōu',
-    0x46E4: 'cù',
-    0x46E5: 'xī,xì,xīn',
-    0x46E6: 'sòng',
-    0x46E7: 'mí',
-    0x46E8: 'xìn',
-    0x46E9: 'wù,qià,è',
-    0x46EA: 'qióng',
-    0x46EB: 'zhāng,zhèng',
-    0x46EC: 'táo',
-    0x46ED: 'xìng',
-    0x46EE: 'jiù',
-    0x46EF: 'jù',
-    0x46F0: 'hùn',
-    0x46F1: 'tí',
-    0x46F2: 'mán',
-    0x46F3: 'yàn,yān',
-    0x46F4: 'jī,qǐ',
-    0x46F5: 'shòu',
-    0x46F6: 'lěi',
-    0x46F7: 'wǎn',
-    0x46F8: 'chè',
-    0x46F9: 'càn,xuàn',
-    0x46FA: 'jiè',
-    0x46FB: 'yòu',
-    0x46FC: 'huǐ',
-    0x46FD: 'zhǎ,chā,sà',
-    0x46FE: 'sù',
-    0x46FF: 'gé',
-    0x4700: 'nǎo',
-    0x4701: 'xì',
-    0x4703: 'duī',
-    0x4704: 'chí',
-    0x4705: 'wéi,chuī',
-    0x4706: 'zhé,niè,mò',
-    0x4707: 'gǔn,gùn',
-    0x4708: 'chāo,zhāo',
-    0x4709: 'chī',
-    0x470A: 'zāo,zào',
-    0x470B: 'huì',
-    0x470C: 'luán',
-    0x470D: 'liáo',
-    0x470E: 'láo,lào',
-    0x470F: 'tuō',
-    0x4710: 'huī',
-    0x4711: 'wù',
-    0x4712: 'ào',
-    0x4713: 'shè',
-    0x4714: 'suí',
-    0x4715: 'mài,hài',
-    0x4716: 'tàn',
-    0x4717: 'xìn,hàn',
-    0x4718: 'jǐng',
-    0x4719: 'án,è',
-    0x471A: 'tà',
-    0x471B: 'chán',
-    0x471C: 'wèi',
-    0x471D: 'tuǎn',
-    0x471E: 'jì',
-    0x471F: 'chén',
-    0x4720: 'chè',
-    0x4721: 'yù',
-    0x4722: 'xiǎn',
-    0x4723: 'xīn',
-    0x4727: 'nǎo',
-    0x4729: 'yàn',
-    0x472A: 'qiú',
-    0x472B: 'jiāng,hóng',
-    0x472C: 'sǒng',
-    0x472D: 'jùn,ruì',
-    0x472E: 'liáo,láo',
-    0x472F: 'jú',
-    0x4731: 'mǎn',
-    0x4732: 'liè',
-    0x4734: 'chù,shì',
-    0x4735: 'chǐ',
-    0x4736: 'xiáng',
-    0x4737: 'qīn',
-    0x4738: 'měi,méi',
-    0x4739: 'shù',
-    0x473A: 'chǎi,cè',
-    0x473B: 'chǐ',
-    0x473C: 'gú,móu',
-    0x473D: 'yú',
-    0x473E: 'yīn',
-    0x4740: 'liú,liáo',
-    0x4741: 'láo',
-    0x4742: 'shù',
-    0x4743: 'zhé',
-    0x4744: 'shuāng',
-    0x4745: 'huī',
-    0x4748: 'è',
-    0x474A: 'shà',
-    0x474B: 'zòng',
-    0x474C: 'jué',
-    0x474D: 'jùn,jūn',
-    0x474E: 'tuān',
-    0x474F: 'lóu',
-    0x4750: 'wéi,duò',
-    0x4751: 'chōng',
-    0x4752: 'zhù',
-    0x4753: 'liè',
-    0x4755: 'zhé',
-    0x4756: 'zhǎo',
-    0x4758: 'yì',
-    0x4759: 'chū',
-    0x475A: 'ní',
-    0x475B: 'bō',
-    0x475C: 'suān',
-    0x475D: 'yǐ',
-    0x475E: 'hào',
-    0x475F: 'yà',
-    0x4760: 'huán',
-    0x4761: 'màn',
-    0x4762: 'màn',
-    0x4763: 'qú',
-    0x4764: 'lǎo,liáo',
-    0x4765: 'háo',
-    0x4766: 'zhōng',
-    0x4767: 'mín',
-    0x4768: 'xián',
-    0x4769: 'zhèn',
-    0x476A: 'shǔ',
-    0x476B: 'zuó',
-    0x476C: 'zhù',
-    0x476D: 'gòu',
-    0x476E: 'xuàn',
-    0x476F: 'yì',
-    0x4770: 'zhì',
-    0x4771: 'xié',
-    0x4772: 'jìn',
-    0x4773: 'cán,hài',
-    0x4775: 'bù',
-    0x4776: 'liáng',
-    0x4777: 'zhī,zhì',
-    0x4778: 'jì',
-    0x4779: 'wǎn',
-    0x477A: 'guàn',
-    0x477B: 'jū',
-    0x477C: 'jìng,qíng',
-    0x477D: 'ài',
-    0x477E: 'fù',
-    0x477F: 'guì',
-    0x4780: 'hòu',
-    0x4781: 'yàn',
-    0x4782: 'ruǎn',
-    0x4783: 'zhì',
-    0x4784: 'biào',
-    0x4785: 'yí',
-    0x4786: 'suǒ',
-    0x4787: 'dié',
-    0x4788: 'guì',
-    0x4789: 'shèng',
-    0x478A: 'xùn',
-    0x478B: 'chèn',
-    0x478C: 'shé',
-    0x478D: 'qíng',
-    0x4790: 'chǔn',
-    0x4791: 'hóng',
-    0x4792: 'dòng',
-    0x4793: 'chēng',
-    0x4794: 'wěi',
-    0x4795: 'rú,yú',
-    0x4796: 'shǔ',
-    0x4797: 'cāi,chāi',
-    0x4798: 'jí',
-    0x4799: 'zá',
-    0x479A: 'qí,kuí',
-    0x479B: 'yān',
-    0x479C: 'fù',
-    0x479D: 'yù',
-    0x479E: 'fú',
-    0x479F: 'pò',
-    0x47A0: 'zhī',
-    0x47A1: 'tǎn',
-    0x47A2: 'zuó',
-    0x47A3: 'chě,chè,qiè',
-    0x47A4: 'qú,fǔ,qǔ',
-    0x47A5: 'yòu',
-    0x47A6: 'hé',
-    0x47A7: 'hòu',
-    0x47A8: 'guǐ',
-    0x47A9: 'è,xiá',
-    0x47AA: 'jiàng',
-    0x47AB: 'yǔn',
-    0x47AC: 'tòu',
-    0x47AD: 'cūn,qiǔ',
-    0x47AE: 'tū',
-    0x47AF: 'fù,fú',
-    0x47B0: 'zuó',
-    0x47B1: 'hú',
-    0x47B3: 'bó',
-    0x47B4: 'zhāo',
-    0x47B5: 'juě,zhuò',
-    0x47B6: 'tāng,tàng',
-    0x47B7: 'jué',
-    0x47B8: 'fù',
-    0x47B9: 'huáng',
-    0x47BA: 'chūn',
-    0x47BB: 'yǒng',
-    0x47BC: 'chuǐ',
-    0x47BD: 'suǒ',
-    0x47BE: 'chí,dì',
-    0x47BF: 'qiān',
-    0x47C0: 'cāi',
-    0x47C1: 'xiāo,chāo',
-    0x47C2: 'mán',
-    0x47C3: 'cān,cà',
-    0x47C4: 'qì,zuó,zè',
-    0x47C5: 'jiàn,zàn',
-    0x47C6: 'bì',
-    0x47C7: 'jī,xī',
-    0x47C8: 'zhí',
-    0x47C9: 'zhú,shǔ',
-    0x47CA: 'qú',
-    0x47CB: 'zhǎn',
-    0x47CC: 'jí',
-    0x47CD: 'biān,dián',
-    0x47CF: 'lì',
-    0x47D0: 'lì',
-    0x47D1: 'yuè',
-    0x47D2: 'quán',
-    0x47D3: 'chēng,zhēng,dīng',
-    0x47D4: 'fù,bó',
-    0x47D5: 'chà',
-    0x47D6: 'tàng',
-    0x47D7: 'shì',
-    0x47D8: 'hàng',
-    0x47D9: 'qiè',
-    0x47DA: 'qí',
-    0x47DB: 'bó,fèi,bèi',
-    0x47DC: 'nà',
-    0x47DD: 'tòu',
-    0x47DE: 'chú',
-    0x47DF: 'cù',
-    0x47E0: 'yuè',
-    0x47E1: 'zhī,dì',
-    0x47E2: 'chén',
-    0x47E3: 'chù',
-    0x47E4: 'bì,bié',
-    0x47E5: 'méng',
-    0x47E6: 'bá',
-    0x47E7: 'tián',
-    0x47E8: 'mín,mǐn',
-    0x47E9: 'liě,què',
-    0x47EA: 'fěng,fǎn',
-    0x47EB: 'chēng,shàng',
-    0x47EC: 'qiù',
-    0x47ED: 'tiáo,zuò',
-    0x47EE: 'fú,bó',
-    0x47EF: 'kuò',
-    0x47F0: 'jiǎn',
-    0x47F4: 'zhèn',
-    0x47F5: 'qiú',
-    0x47F6: 'zuò,cuò',
-    0x47F7: 'chì,qì',
-    0x47F8: 'kuí,guī',
-    0x47F9: 'liè',
-    0x47FA: 'bèi,pèi',
-    0x47FB: 'dù,zhà',
-    0x47FC: 'wǔ',
-    0x47FE: 'zhuó,juě',
-    0x47FF: 'lù',
-    0x4800: 'tāng,chǎng,tàng',
-    0x4802: 'chú',
-    0x4803: 'liǎng',
-    0x4804: 'tiǎn',
-    0x4805: 'kǔn',
-    0x4806: 'cháng',
-    0x4807: 'jué',
-    0x4808: 'tú',
-    0x4809: 'huàn',
-    0x480A: 'fèi',
-    0x480B: 'bì,bǐ,bāi',
-    0x480D: 'xiā,qiá,qié',
-    0x480E: 'wò',
-    0x480F: 'jì,kuí',
-    0x4810: 'qù',
-    0x4811: 'kuǐ,kuí,wěi',
-    0x4812: 'hú',
-    0x4813: 'qiū,cù',
-    0x4814: 'suì',
-    0x4815: 'cāi',
-    0x4817: 'qiù,xiòng',
-    0x4818: 'pì',
-    0x4819: 'páng',
-    0x481A: 'wà,wǎ',
-    0x481B: 'yáo',
-    0x481C: 'róng,rǒng',
-    0x481D: 'xūn',
-    0x481E: 'cù',
-    0x481F: 'dié',
-    0x4820: 'chì,dài',
-    0x4821: 'cuó,chá',
-    0x4822: 'mèng',
-    0x4823: 'xuǎn',
-    0x4824: 'duǒ,duò',
-    0x4825: 'bié',
-    0x4826: 'zhè',
-    0x4827: 'chú',
-    0x4828: 'chàn',
-    0x4829: 'guì',
-    0x482A: 'duàn',
-    0x482B: 'zòu',
-    0x482C: 'dèng',
-    0x482D: 'lái',
-    0x482E: 'téng',
-    0x482F: 'yuè',
-    0x4830: 'quán',
-    0x4831: 'zhú',
-    0x4832: 'líng',
-    0x4833: 'chēn',
-    0x4834: 'zhěn',
-    0x4835: 'fù',
-    0x4836: 'shè',
-    0x4837: 'tiǎo',
-    0x4838: 'kuā',
-    0x4839: 'ái',
-    0x483B: 'qióng',
-    0x483C: 'shù',
-    0x483D: 'hái,kǎi',
-    0x483E: 'shǎn',
-    0x483F: 'wài,kuì',
-    0x4840: 'zhǎn,zhàn',
-    0x4841: 'lǒng',
-    0x4842: 'jiū,jiù',
-    0x4843: 'lì',
-    0x4845: 'chūn,xún',
-    0x4846: 'róng',
-    0x4847: 'yuè',
-    0x4848: 'jué,jiào',
-    0x4849: 'kǎng',
-    0x484A: 'fǎn',
-    0x484B: 'qí',
-    0x484C: 'hóng',
-    0x484D: 'fú',
-    0x484E: 'lú',
-    0x484F: 'hóng',
-    0x4850: 'tuó',
-    0x4851: 'mín',
-    0x4852: 'tián',
-    0x4853: 'juàn,xuān',
-    0x4854: 'qǐ',
-    0x4855: 'zhěng',
-    0x4856: 'qìng',
-    0x4857: 'gǒng,gòng',
-    0x4858: 'tián',
-    0x4859: 'láng',
-    0x485A: 'mào',
-    0x485B: 'yìn',
-    0x485C: 'lù',
-    0x485D: 'yuān,yǔn',
-    0x485E: 'jú',
-    0x485F: 'pì',
-    0x4861: 'xié',
-    0x4862: 'biàn',
-    0x4863: 'hūn,xuān',
-    0x4864: 'zhū',
-    0x4865: 'róng',
-    0x4866: 'sǎng',
-    0x4867: 'wū,wǔ',
-    0x4868: 'chà',
-    0x4869: 'kēng,zhěn',
-    0x486A: 'shàn',
-    0x486B: 'péng',
-    0x486C: 'màn',
-    0x486D: 'xiū',
-    0x486F: 'cōng,zǒng',
-    0x4870: 'kēng,kěng,gǔ',
-    0x4871: 'zhuǎn',
-    0x4872: 'chán,dān',
-    0x4873: 'sī',
-    0x4874: 'chōng',
-    0x4875: 'suì',
-    0x4876: 'bèi',
-    0x4877: 'kài,kě',
-    0x4879: 'zhì',
-    0x487A: 'wèi',
-    0x487B: 'mín',
-    0x487C: 'líng',
-    0x487D: 'zuān',
-    0x487E: 'niè,yè,yǐ',
-    0x487F: 'líng',
-    0x4880: 'qì',
-    0x4881: 'yuè',
-    0x4883: 'yì',
-    0x4884: 'xǐ',
-    0x4885: 'chén',
-    0x4887: 'rǒng',
-    0x4888: 'chén,huì',
-    0x4889: 'nóng',
-    0x488A: 'yóu',
-    0x488B: 'jì',
-    0x488C: 'bó',
-    0x488D: 'fǎng',
-    0x4890: 'cú',
-    0x4891: 'dǐ,dì',
-    0x4892: 'jiāo',
-    0x4893: 'yú',
-    0x4894: 'hé',
-    0x4895: 'xù',
-    0x4896: 'yù,lǜ',
-    0x4897: 'qū',
-    0x4899: 'bài',
-    0x489A: 'gēng,háng',
-    0x489B: 'jiǒng',
-    0x489D: 'yà',
-    0x489E: 'shù',
-    0x489F: 'yóu',
-    0x48A0: 'sòng',
-    0x48A1: 'yè,xiè,zhuì',
-    0x48A2: 'càng',
-    0x48A3: 'yáo',
-    0x48A4: 'shù',
-    0x48A5: 'yán',
-    0x48A6: 'shuài',
-    0x48A7: 'liào',
-    0x48A8: 'cōng,zōng',
-    0x48A9: 'yù',
-    0x48AA: 'bó',
-    0x48AB: 'suí',
-    0x48AD: 'yàn,xiàn',
-    0x48AE: 'lèi',
-    0x48AF: 'lín',
-    0x48B0: 'tī',
-    0x48B1: 'dú',
-    0x48B2: 'yuè',
-    0x48B3: 'jǐ',
-    0x48B5: 'yún',
-    0x48B8: 'jū',
-    0x48B9: 'jǔ,qú',
-    0x48BA: 'chū',
-    0x48BB: 'chén',
-    0x48BC: 'gōng',
-    0x48BD: 'xiàng',
-    0x48BE: 'xiǎn',
-    0x48BF: 'ān',
-    0x48C0: 'guǐ,qī,wéi',
-    0x48C1: 'yǔ',
-    0x48C2: 'lěi',
-    0x48C4: 'tú',
-    0x48C5: 'chén',
-    0x48C6: 'xíng',
-    0x48C7: 'qiú',
-    0x48C8: 'hàng',
-    0x48CA: 'dǎng',
-    0x48CB: 'cǎi',
-    0x48CC: 'dǐ',
-    0x48CD: 'yǎn,yān',
-    0x48CE: 'zī',
-    0x48D0: 'yīng',
-    0x48D1: 'chán',
-    0x48D3: 'lí,lì',
-    0x48D4: 'suǒ',
-    0x48D5: 'mǎ',
-    0x48D6: 'mǎ',
-    0x48D8: 'táng',
-    0x48D9: 'péi,pěng,bēi',
-    0x48DA: 'lóu',
-    0x48DB: 'qī,xī',
-    0x48DC: 'cuó',
-    0x48DD: 'tú',
-    0x48DE: 'è',
-    0x48DF: 'cán,cǎn,tì',
-    0x48E0: 'jié,tì,zá',
-    0x48E1: 'yí',
-    0x48E2: 'jí',
-    0x48E3: 'dǎng',
-    0x48E4: 'jué',
-    0x48E5: 'bǐ',
-    0x48E6: 'lèi',
-    0x48E7: 'yì',
-    0x48E8: 'chún',
-    0x48E9: 'chún',
-    0x48EA: 'pò',
-    0x48EB: 'lí',
-    0x48EC: 'zǎi,gē',
-    0x48ED: 'tài',
-    0x48EE: 'pò',
-    0x48EF: 'cú,tiǎn',
-    0x48F0: 'jù',
-    0x48F1: 'xù',
-    0x48F2: 'fàn',
-    0x48F4: 'xù',
-    0x48F5: 'èr',
-    0x48F6: 'huó,tián',
-    0x48F7: 'zhū',
-    0x48F8: 'rǎn,nǎn,nàn',
-    0x48F9: 'fá',
-    0x48FA: 'juān',
-    0x48FB: 'hān',
-    0x48FC: 'liáng',
-    0x48FD: 'zhī,tǐ',
-    0x48FE: 'mì',
-    0x48FF: 'yū',
-    0x4901: 'cén',
-    0x4902: 'méi',
-    0x4903: 'yīn,ān,yìn',
-    0x4904: 'miǎn',
-    0x4905: 'tú',
-    0x4906: 'kuí,guì',
-    0x4909: 'mì',
-    0x490A: 'róng',
-    0x490B: 'yù,guó',
-    0x490C: 'qiāng',
-    0x490D: 'mí',
-    0x490E: 'jú,jué',
-    0x490F: 'pǐ',
-    0x4910: 'jǐn',
-    0x4911: 'wàng',
-    0x4912: 'jì,jǐ',
-    0x4913: 'méng',
-    0x4914: 'jiàn',
-    0x4915: 'xuè,hù',
-    0x4916: 'bào',
-    0x4917: 'gǎn',
-    0x4918: 'chǎn,qiǎn',
-    0x4919: 'lì',
-    0x491A: 'lǐ',
-    0x491B: 'qiú',
-    0x491C: 'dùn',
-    0x491D: 'yìng',
-    0x491E: 'yǔn',
-    0x491F: 'chén',
-    0x4920: 'zhǐ',
-    0x4921: 'rǎn',
-    0x4923: 'lüè',
-    0x4924: 'kāi',
-    0x4925: 'guǐ,wěi',
-    0x4926: 'yuè',
-    0x4927: 'huì',
-    0x4928: 'pì',
-    0x4929: 'chá',
-    0x492A: 'duǒ',
-    0x492B: 'chán',
-    0x492C: 'shā',
-    0x492D: 'shì',
-    0x492E: 'shè',
-    0x492F: 'xíng',
-    0x4930: 'yíng',
-    0x4931: 'shì',
-    0x4932: 'chì',
-    0x4933: 'yè',
-    0x4934: 'hán',
-    0x4935: 'fèi,pī,fēi',
-    0x4936: 'yè,ān',
-    0x4937: 'yǎn',
-    0x4938: 'zuàn',
-    0x4939: 'sōu',
-    0x493A: 'jīn,yǐn',
-    0x493B: 'duò',
-    0x493C: 'xiàn',
-    0x493D: 'guān',
-    0x493E: 'tāo',
-    0x493F: 'qiè',
-    0x4940: 'chǎn',
-    0x4941: 'hán',
-    0x4942: 'mèng',
-    0x4943: 'yuè',
-    0x4944: 'cù',
-    0x4945: 'qiàn',
-    0x4946: 'jǐn',
-    0x4947: 'shàn',
-    0x4948: 'mǔ',
-    0x4949: 'yuān',
-    0x494B: 'pēng',
-    0x494C: 'zhèng',
-    0x494D: 'zhì',
-    0x494E: 'chún',
-    0x494F: 'yǔ',
-    0x4950: 'móu',
-    0x4951: 'wàn',
-    0x4952: 'jiàng',
-    0x4953: 'qī',
-    0x4954: 'sù',
-    0x4955: 'piě',
-    0x4956: 'tián',
-    0x4957: 'kuǎn',
-    0x4958: 'cù',
-    0x4959: 'suì',
-    0x495B: 'jiē,jié,qì',
-    0x495C: 'jiàn',
-    0x495D: 'áo',
-    0x495E: 'jiǎo',
-    0x495F: 'yè',
-    0x4961: 'yè',
-    0x4962: 'lóng,qī',
-    0x4963: 'záo',
-    0x4964: 'báo',
-    0x4965: 'lián',
-    0x4967: 'huán',
-    0x4968: 'lǜ,lú',
-    0x4969: 'wéi',
-    0x496A: 'xiǎn',
-    0x496B: 'tiě',
-    0x496C: 'bó',
-    0x496D: 'zhèng',
-    0x496E: 'zhú',
-    0x496F: 'bēi,bà',
-    0x4970: 'méng',
-    0x4971: 'xiě',
-    0x4972: 'ōu',
-    0x4973: 'yōu',
-    0x4975: 'xiǎo',
-    0x4976: 'lì',
-    0x4977: 'zhá',
-    0x4978: 'mí',
-    0x497A: 'yé',
-    0x497D: 'pō',
-    0x497E: 'xiě',
-    0x4982: 'shàn',
-    0x4983: 'zhuō',
-    0x4985: 'shàn',
-    0x4986: 'jué',
-    0x4987: 'jì',
-    0x4988: 'jiē,zuǒ',
-    0x498A: 'niǎo',
-    0x498B: 'áo',
-    0x498C: 'chù',
-    0x498D: 'wù',
-    0x498E: 'guǎn,kàng',
-    0x498F: 'xiè',
-    0x4990: 'tǐng',
-    0x4991: 'xuè',
-    0x4992: 'dàng,qiāo',
-    0x4993: 'zhān,chān',
-    0x4994: 'tǎn,dǎn',
-    0x4995: 'pēng',
-    0x4996: 'xié,xiá',
-    0x4997: 'xù',
-    0x4998: 'xiàn',
-    0x4999: 'sì,shì',
-    0x499A: 'kuà',
-    0x499B: 'zhèng',
-    0x499C: 'wú',
-    0x499D: 'huō',
-    0x499E: 'rùn',
-    0x499F: 'wěn,chuài',
-    0x49A0: 'dū',
-    0x49A1: 'huán',
-    0x49A2: 'kuò',
-    0x49A3: 'fù',
-    0x49A4: 'chuài',
-    0x49A5: 'xián',
-    0x49A6: 'qín',
-    0x49A7: 'qié',
-    0x49A8: 'lán',
-    0x49AA: 'yà',
-    0x49AB: 'yīng',
-    0x49AC: 'què',
-    0x49AD: 'hāng',
-    0x49AE: 'chǔn',
-    0x49AF: 'zhì',
-    0x49B1: 'wěi,kuā',
-    0x49B2: 'yán,qiàn,chàn',
-    0x49B3: 'xiàng',
-    0x49B4: 'yì',
-    0x49B5: 'nǐ',
-    0x49B6: 'zhèng',
-    0x49B7: 'chuài',
-    0x49B9: 'shí',
-    0x49BA: 'dīng',
-    0x49BB: 'zǐ',
-    0x49BC: 'jué,pì',
-    0x49BD: 'xù',
-    0x49BE: 'yuán',
-    0x49C1: 'xǔ',
-    0x49C2: 'dào',
-    0x49C3: 'tián',
-    0x49C4: 'gè',
-    0x49C5: 'yí',
-    0x49C6: 'hóng',
-    0x49C7: 'yī,yǐ',
-    0x49C9: 'lǐ',
-    0x49CA: 'kū',
-    0x49CB: 'xiǎn,xiàn',
-    0x49CC: 'suī',
-    0x49CD: 'xì',
-    0x49CE: 'xuàn',
-    0x49D1: 'dī',
-    0x49D2: 'lái',
-    0x49D3: 'zhōu',
-    0x49D4: 'niàn',
-    0x49D5: 'chéng',
-    0x49D6: 'jiàn',
-    0x49D7: 'bì',
-    0x49D8: 'zhuàn',
-    0x49D9: 'líng',
-    0x49DA: 'hào',
-    0x49DB: 'bàng,péng',
-    0x49DC: 'táng',
-    0x49DD: 'chī,zhì',
-    0x49DE: 'mà,fù',
-    0x49DF: 'xiàn',
-    0x49E0: 'shuàn',
-    0x49E1: 'yōng',
-    0x49E2: 'qū,ōu',
-    0x49E4: 'pú',
-    0x49E5: 'huì',
-    0x49E6: 'wéi',
-    0x49E7: 'yǐ',
-    0x49E8: 'yè',
-    0x49EA: 'chè',
-    0x49EB: 'háo',
-    0x49EC: 'bīn',
-    0x49EE: 'xiàn,xiǎn',
-    0x49EF: 'chán,zhàn',
-    0x49F0: 'hùn',
-    0x49F2: 'hàn',
-    0x49F3: 'cí,zhuī',
-    0x49F4: 'zhī',
-    0x49F5: 'qí',
-    0x49F6: 'kuí',
-    0x49F7: 'róu',
-    0x49F9: 'yīng',
-    0x49FA: 'xióng',
-    0x49FC: 'hú',
-    0x49FD: 'cuǐ',
-    0x49FF: 'què,xī',
-    0x4A00: 'dí',
-    0x4A01: 'wù',
-    0x4A02: 'qiū',
-    0x4A04: 'yàn',
-    0x4A05: 'liáo',
-    0x4A06: 'bí',
-    0x4A08: 'bīn',
-    0x4A0A: 'yuān',
-    0x4A0B: 'nüè',
-    0x4A0C: 'báo',
-    0x4A0D: 'yǐng',
-    0x4A0E: 'hóng',
-    0x4A0F: 'cí',
-    0x4A10: 'qià',
-    0x4A11: 'tí',
-    0x4A12: 'yù',
-    0x4A13: 'léi',
-    0x4A14: 'báo',
-    0x4A16: 'jì',
-    0x4A17: 'fú',
-    0x4A18: 'xiàn',
-    0x4A19: 'cén',
-    0x4A1A: 'hū',
-    0x4A1B: 'sè,xī',
-    0x4A1C: 'bēng',
-    0x4A1D: 'qīng',
-    0x4A1E: 'yǔ,yù',
-    0x4A1F: 'wā',
-    0x4A20: 'ǎi',
-    0x4A21: 'hán',
-    0x4A22: 'dàn',
-    0x4A23: 'gé',
-    0x4A24: 'dí',
-    0x4A25: 'huò,shuāng',
-    0x4A26: 'pāng',
-    0x4A28: 'zhuī',
-    0x4A29: 'líng',
-    0x4A2A: 'mái',
-    0x4A2B: 'mài',
-    0x4A2C: 'lián',
-    0x4A2D: 'xiāo',
-    0x4A2E: 'xuě',
-    0x4A2F: 'zhèn',
-    0x4A30: 'pò',
-    0x4A31: 'fù',
-    0x4A32: 'nóu,wàn',
-    0x4A33: 'xì,xī',
-    0x4A34: 'duì',
-    0x4A35: 'dàn',
-    0x4A36: 'yǔn',
-    0x4A37: 'xiàn',
-    0x4A38: 'yǐn',
-    0x4A39: 'shū',
-    0x4A3A: 'duì',
-    0x4A3B: 'bèng',
-    0x4A3C: 'hù',
-    0x4A3D: 'fěi',
-    0x4A3E: 'fèi',
-    0x4A3F: 'zá',
-    0x4A40: 'bèi',
-    0x4A41: 'fēi',
-    0x4A42: 'xiān',
-    0x4A43: 'shì',
-    0x4A44: 'miǎn,tiǎn',
-    0x4A45: 'zhǎn,nǎn',
-    0x4A46: 'zhǎn',
-    0x4A47: 'zhān,diān',
-    0x4A48: 'huì',
-    0x4A49: 'fǔ',
-    0x4A4A: 'wǎn,wò',
-    0x4A4B: 'mǒ',
-    0x4A4C: 'qiáo',
-    0x4A4D: 'liǎo',
-    0x4A4F: 'miè',
-    0x4A50: 'hū,jí,gé',
-    0x4A51: 'hóng',
-    0x4A52: 'yú',
-    0x4A53: 'qí',
-    0x4A54: 'duò,shān,pán',
-    0x4A55: 'áng,yìng',
-    0x4A57: 'bà',
-    0x4A58: 'dì',
-    0x4A59: 'xuàn,xiǎn',
-    0x4A5A: 'dì,dī',
-    0x4A5B: 'bì,pèi',
-    0x4A5C: 'zhòu',
-    0x4A5D: 'páo',
-    0x4A5E: 'tié,diē',
-    0x4A5F: 'yí,tì',
-    0x4A61: 'jiá,gé',
-    0x4A62: 'zhì,dá',
-    0x4A63: 'tú',
-    0x4A64: 'xié',
-    0x4A65: 'dàn,chān',
-    0x4A66: 'tiáo',
-    0x4A67: 'xiè',
-    0x4A68: 'chàng,zhāng',
-    0x4A69: 'yuǎn',
-    0x4A6A: 'guǎn',
-    0x4A6B: 'liǎng',
-    0x4A6C: 'běng,fěng',
-    0x4A6E: 'lù',
-    0x4A6F: 'jí,qì',
-    0x4A70: 'xuàn',
-    0x4A71: 'shù,yú,shū',
-    0x4A72: 'dū',
-    0x4A73: 'sōu',
-    0x4A74: 'hú',
-    0x4A75: 'yùn',
-    0x4A76: 'chǎn',
-    0x4A77: 'bāng',
-    0x4A78: 'róng,rǒng',
-    0x4A79: 'é,kuò',
-    0x4A7A: 'wēng',
-    0x4A7B: 'bà',
-    0x4A7C: 'féng',
-    0x4A7D: 'yū',
-    0x4A7E: 'zhè',
-    0x4A7F: 'fén',
-    0x4A80: 'guǎn',
-    0x4A81: 'bǔ',
-    0x4A82: 'gé',
-    0x4A83: 'dūn',
-    0x4A84: 'huáng',
-    0x4A85: 'dú',
-    0x4A86: 'tǐ',
-    0x4A87: 'bó',
-    0x4A88: 'qiàn',
-    0x4A89: 'liè',
-    0x4A8A: 'lóng',
-    0x4A8B: 'wèi',
-    0x4A8C: 'zhàn,shān',
-    0x4A8D: 'lán',
-    0x4A8E: 'suī',
-    0x4A8F: 'nà,dā',
-    0x4A90: 'bì',
-    0x4A91: 'tuó',
-    0x4A92: 'zhù',
-    0x4A93: 'diē',
-    0x4A94: 'bǔ,fù',
-    0x4A95: 'jú',
-    0x4A96: 'pò',
-    0x4A97: 'xiá',
-    0x4A98: 'wěi,dī',
-    0x4A99: 'pò,fú,fù',
-    0x4A9A: 'dā,tà',
-    0x4A9B: 'fān,fán',
-    0x4A9C: 'chān,chàn,yán',
-    0x4A9D: 'hù',
-    0x4A9E: 'zá',
-    0x4AA4: 'fán',
-    0x4AA5: 'xiè',
-    0x4AA6: 'hóng',
-    0x4AA7: 'chí',
-    0x4AA8: 'báo',
-    0x4AA9: 'yín',
-    0x4AAB: 'jīng',
-    0x4AAC: 'bó',
-    0x4AAD: 'ruǎn',
-    0x4AAE: 'chǒu',
-    0x4AAF: 'yīng',
-    0x4AB0: 'yī',
-    0x4AB1: 'gǎi,hái',
-    0x4AB2: 'kūn',
-    0x4AB3: 'yǔn',
-    0x4AB4: 'zhěn,dǎn,dàn',
-    0x4AB5: 'yǎ',
-    0x4AB6: 'jū',
-    0x4AB7: 'hòu,gòu',
-    0x4AB8: 'mín,mén',
-    0x4AB9: 'bāi,pī,péi',
-    0x4ABA: 'gé',
-    0x4ABB: 'biàn,fàn',
-    0x4ABC: 'zhuō',
-    0x4ABD: 'hào',
-    0x4ABE: 'zhěn',
-    0x4ABF: 'shěng',
-    0x4AC0: 'gěn',
-    0x4AC1: 'bì',
-    0x4AC2: 'duǒ',
-    0x4AC3: 'chún,zhèn',
-    0x4AC4: 'chuà',
-    0x4AC5: 'sàn',
-    0x4AC6: 'chéng',
-    0x4AC7: 'rán',
-    0x4AC8: 'chěn,zèn,cén',
-    0x4AC9: 'mào',
-    0x4ACA: 'péi',
-    0x4ACB: 'wēi,tuí',
-    0x4ACC: 'pǐ',
-    0x4ACD: 'fǔ',
-    0x4ACE: 'zhuō',
-    0x4ACF: 'qī',
-    0x4AD0: 'lín',
-    0x4AD1: 'yī,qī',
-    0x4AD2: 'mén',
-    0x4AD3: 'wú',
-    0x4AD4: 'qì,qiè,yà,kuí',
-    0x4AD5: 'dié',
-    0x4AD6: 'chěn,shèn',
-    0x4AD7: 'xiá',
-    0x4AD8: 'hé,jié,kě',
-    0x4AD9: 'sǎng',
-    0x4ADA: 'guā',
-    0x4ADB: 'hóu',
-    0x4ADC: 'āo',
-    0x4ADD: 'fǔ',
-    0x4ADE: 'qiāo,fén',
-    0x4ADF: 'hùn',
-    0x4AE0: 'pī',
-    0x4AE1: 'yán,qiàn,qiān,jiàn',
-    0x4AE2: 'sī',
-    0x4AE3: 'xí',
-    0x4AE4: 'míng',
-    0x4AE5: 'kuǐ',
-    0x4AE6: 'gé,kài',
-    0x4AE8: 'ào',
-    0x4AE9: 'sǎn',
-    0x4AEA: 'shuǎng',
-    0x4AEB: 'lóu',
-    0x4AEC: 'zhěn,qǐn',
-    0x4AED: 'huì',
-    0x4AEE: 'chán',
-    0x4AF0: 'lìn',
-    0x4AF1: 'ná',
-    0x4AF2: 'hàn,kǎn',
-    0x4AF3: 'dú',
-    0x4AF4: 'jìn',
-    0x4AF5: 'mián',
-    0x4AF6: 'fán',
-    0x4AF7: 'è',
-    0x4AF8: 'chāo',
-    0x4AF9: 'hóng',
-    0x4AFA: 'hóng',
-    0x4AFB: 'yù',
-    0x4AFC: 'xuè',
-    0x4AFD: 'pāo',
-    0x4AFE: 'bī,bì',
-    0x4AFF: 'chāo',
-    0x4B00: 'yǒu',
-    0x4B01: 'yí',
-    0x4B02: 'xuè',
-    0x4B03: 'sà',
-    0x4B04: 'xù',
-    0x4B05: 'lì,liè,xié',
-    0x4B06: 'lì',
-    0x4B07: 'yuàn',
-    0x4B08: 'duì',
-    0x4B09: 'huò',
-    0x4B0A: 'shà',
-    0x4B0B: 'léng',
-    0x4B0C: 'pōu',
-    0x4B0D: 'hū',
-    0x4B0E: 'guó,xù',
-    0x4B0F: 'bù,fǒu',
-    0x4B10: 'ruí',
-    0x4B11: 'wèi,yù',
-    0x4B12: 'sōu,xiāo',
-    0x4B13: 'àn',
-    0x4B14: 'yú',
-    0x4B15: 'xiāng,shǎng',
-    0x4B16: 'héng',
-    0x4B17: 'yáng',
-    0x4B18: 'xiāo',
-    0x4B19: 'yáo',
-    0x4B1B: 'bì',
-    0x4B1D: 'héng',
-    0x4B1E: 'táo',
-    0x4B1F: 'liú,liǔ',
-    0x4B21: 'zhù',
-    0x4B23: 'xì,qì,gē',
-    0x4B24: 'zàn,zhān',
-    0x4B25: 'yì',
-    0x4B26: 'dòu,shè',
-    0x4B27: 'yuán',
-    0x4B28: 'jiù',
-    0x4B2A: 'bó',
-    0x4B2B: 'tí',
-    0x4B2C: 'yǐng',
-    0x4B2E: 'yí',
-    0x4B2F: 'nián,tiǎn',
-    0x4B30: 'shào',
-    0x4B31: 'bèn',
-    0x4B32: 'gōu',
-    0x4B33: 'bǎn',
-    0x4B34: 'mò',
-    0x4B35: 'gāi,ài',
-    0x4B36: 'èn',
-    0x4B37: 'shě',
-    0x4B39: 'zhì',
-    0x4B3A: 'yàng',
-    0x4B3B: 'jiàn',
-    0x4B3C: 'yuàn',
-    0x4B3D: 'shuì,duì',
-    0x4B3E: 'tí',
-    0x4B3F: 'wěi,wèi',
-    0x4B40: 'xùn',
-    0x4B41: 'zhì',
-    0x4B42: 'yì',
-    0x4B43: 'rěn,niè',
-    0x4B44: 'shì',
-    0x4B45: 'hú',
-    0x4B46: 'nè',
-    0x4B47: 'yē,yì',
-    0x4B48: 'jiàn',
-    0x4B49: 'suǐ',
-    0x4B4A: 'yǐng',
-    0x4B4B: 'bǎo',
-    0x4B4C: 'hú',
-    0x4B4D: 'hú',
-    0x4B4E: 'yè',
-    0x4B50: 'yàng',
-    0x4B51: 'lián,qiàn,xiàn',
-    0x4B52: 'xī',
-    0x4B53: 'èn',
-    0x4B54: 'duī',
-    0x4B55: 'zǎn,jiǎn',
-    0x4B56: 'zhù',
-    0x4B57: 'yǐng',
-    0x4B58: 'yǐng',
-    0x4B59: 'jǐn,jiàn',
-    0x4B5A: 'chuáng',
-    0x4B5B: 'dàn',
-    0x4B5D: 'kuài',
-    0x4B5E: 'yì',
-    0x4B5F: 'yè',
-    0x4B60: 'jiǎn',
-    0x4B61: 'èn',
-    0x4B62: 'níng',
-    0x4B63: 'cí',
-    0x4B64: 'qiǎn',
-    0x4B65: 'xuè',
-    0x4B66: 'bō',
-    0x4B67: 'mǐ',
-    0x4B68: 'shuì',
-    0x4B69: 'mó',
-    0x4B6A: 'liáng',
-    0x4B6B: 'qǐ',
-    0x4B6C: 'qǐ',
-    0x4B6D: 'shǒu',
-    0x4B6E: 'fú',
-    0x4B6F: 'bó',
-    0x4B70: 'bèng',
-    0x4B71: 'bié',
-    0x4B72: 'yǐ',
-    0x4B73: 'wèi',
-    0x4B74: 'huán',
-    0x4B75: 'fán',
-    0x4B76: 'qí',
-    0x4B77: 'máo',
-    0x4B78: 'fù',
-    0x4B79: 'áng',
-    0x4B7A: 'ǎng',
-    0x4B7B: 'fēn,fù',
-    0x4B7C: 'qí',
-    0x4B7D: 'qún',
-    0x4B7E: 'tuó',
-    0x4B7F: 'yì',
-    0x4B80: 'bó',
-    0x4B81: 'pián',
-    0x4B82: 'bá',
-    0x4B84: 'xuán',
-    0x4B87: 'yù',
-    0x4B88: 'chí',
-    0x4B89: 'lú',
-    0x4B8A: 'yí',
-    0x4B8B: 'lì',
-    0x4B8D: 'niǎo',
-    0x4B8E: 'xì',
-    0x4B8F: 'wú',
-    0x4B91: 'lèi,luò',
-    0x4B92: 'pū',
-    0x4B93: 'zhuō,chào',
-    0x4B94: 'zuī',
-    0x4B95: 'zhuó',
-    0x4B96: 'chāng',
-    0x4B97: 'àn,yàn',
-    0x4B98: 'ér',
-    0x4B99: 'yù',
-    0x4B9A: 'lèng,líng',
-    0x4B9B: 'fù',
-    0x4B9C: 'zhá,yè',
-    0x4B9D: 'hún',
-    0x4B9E: 'chǔn',
-    0x4B9F: 'sōu,sǒu',
-    0x4BA0: 'bī',
-    0x4BA1: 'bì,bó',
-    0x4BA2: 'zhá',
-    0x4BA4: 'hé',
-    0x4BA5: 'lì',
-    0x4BA7: 'hàn,hán',
-    0x4BA8: 'zǎi',
-    0x4BA9: 'gú',
-    0x4BAA: 'chéng',
-    0x4BAB: 'lóu,lǘ',
-    0x4BAC: 'mò',
-    0x4BAD: 'mì',
-    0x4BAE: 'mài',
-    0x4BAF: 'ào',
-    0x4BB0: 'zhé',
-    0x4BB1: 'zhú',
-    0x4BB2: 'huáng',
-    0x4BB3: 'fán',
-    0x4BB4: 'dèng,tēng',
-    0x4BB5: 'tóng',
-    0x4BB7: 'dú',
-    0x4BB8: 'wò',
-    0x4BB9: 'wèi,guì',
-    0x4BBA: 'jì',
-    0x4BBB: 'chì',
-    0x4BBC: 'lín',
-    0x4BBD: 'biāo',
-    0x4BBE: 'lóng,lòng',
-    0x4BBF: 'jiǎn',
-    0x4BC0: 'niè',
-    0x4BC1: 'luó',
-    0x4BC2: 'shēn,jí',
-    0x4BC4: 'guā',
-    0x4BC5: 'niè',
-    0x4BC6: 'yì',
-    0x4BC7: 'kū',
-    0x4BC8: 'wán',
-    0x4BC9: 'wā',
-    0x4BCA: 'qià,kē',
-    0x4BCB: 'bó,fèi',
-    0x4BCC: 'kāo',
-    0x4BCD: 'líng',
-    0x4BCE: 'gàn',
-    0x4BCF: 'guā,huá',
-    0x4BD0: 'hái',
-    0x4BD1: 'kuāng',
-    0x4BD2: 'héng',
-    0x4BD3: 'kuī',
-    0x4BD4: 'zé',
-    0x4BD5: 'tīng',
-    0x4BD6: 'láng',
-    0x4BD7: 'bì',
-    0x4BD8: 'huàn',
-    0x4BD9: 'pò',
-    0x4BDA: 'yǎo',
-    0x4BDB: 'wàn',
-    0x4BDC: 'tì,xī',
-    0x4BDD: 'suǐ',
-    0x4BDE: 'kuā',
-    0x4BDF: 'duì,xiá',
-    0x4BE0: 'ǎo',
-    0x4BE1: 'jiàn',
-    0x4BE2: 'mó,mǒ',
-    0x4BE3: 'kuì,guì',
-    0x4BE4: 'kuài',
-    0x4BE5: 'àn,qì',
-    0x4BE6: 'mà',
-    0x4BE7: 'qǐng,qìng',
-    0x4BE8: 'qiāo,hè',
-    0x4BEA: 'kǎo,kào',
-    0x4BEB: 'hào',
-    0x4BEC: 'duǒ',
-    0x4BED: 'xiān',
-    0x4BEE: 'nái',
-    0x4BEF: 'suō',
-    0x4BF0: 'jiè',
-    0x4BF1: 'pī,pēi,fù',
-    0x4BF2: 'pā,bà',
-    0x4BF3: 'sōng',
-    0x4BF4: 'cháng',
-    0x4BF5: 'niè',
-    0x4BF6: 'mán,mián',
-    0x4BF7: 'sōng',
-    0x4BF8: 'cì',
-    0x4BF9: 'xiān',
-    0x4BFA: 'kuò',
-    0x4BFC: 'dí',
-    0x4BFD: 'póu,pǒu,bǎo',
-    0x4BFE: 'tiáo,diāo',
-    0x4BFF: 'zú,suì,zuì',
-    0x4C00: 'wǒ',
-    0x4C01: 'fèi',
-    0x4C02: 'cài',
-    0x4C03: 'péng,pèng,fǎng',
-    0x4C04: 'sāi,shì',
-    0x4C06: 'róu',
-    0x4C07: 'qí',
-    0x4C08: 'cuó',
-    0x4C09: 'pán,bān',
-    0x4C0A: 'bó',
-    0x4C0B: 'mán',
-    0x4C0C: 'zǒng,cōng',
-    0x4C0D: 'cì',
-    0x4C0E: 'kuì',
-    0x4C0F: 'jì',
-    0x4C10: 'lán',
-    0x4C12: 'méng',
-    0x4C13: 'mián',
-    0x4C14: 'pán',
-    0x4C15: 'lú',
-    0x4C16: 'zuǎn',
-    0x4C18: 'liú,jiǎo',
-    0x4C19: 'yǐ',
-    0x4C1A: 'wén',
-    0x4C1B: 'lì,gé',
-    0x4C1C: 'lì',
-    0x4C1D: 'zèng',
-    0x4C1E: 'zhǔ',
-    0x4C1F: 'hún',
-    0x4C20: 'shén',
-    0x4C21: 'chì',
-    0x4C22: 'xìng',
-    0x4C23: 'wǎng',
-    0x4C24: 'dōng',
-    0x4C25: 'huò,yù',
-    0x4C26: 'pǐ',
-    0x4C27: 'hū',
-    0x4C28: 'mèi',
-    0x4C29: 'chě,dū',
-    0x4C2A: 'mèi',
-    0x4C2B: 'chāo,cháo,zhào',
-    0x4C2C: 'jú',
-    0x4C2D: 'nòu',
-    0x4C2F: 'yì',
-    0x4C30: 'rú',
-    0x4C31: 'líng,lóng',
-    0x4C32: 'yà',
-    0x4C34: 'qì',
-    0x4C35: 'zī',
-    0x4C37: 'bàng',
-    0x4C38: 'gōng',
-    0x4C39: 'zé',
-    0x4C3A: 'jiè',
-    0x4C3B: 'yú',
-    0x4C3C: 'qín,yín,shèn',
-    0x4C3D: 'bèi',
-    0x4C3E: 'bā,bà',
-    0x4C3F: 'tuó',
-    0x4C40: 'yāng',
-    0x4C41: 'qiáo',
-    0x4C42: 'yǒu',
-    0x4C43: 'zhì',
-    0x4C44: 'jiè',
-    0x4C45: 'mò',
-    0x4C46: 'shéng',
-    0x4C47: 'shàn',
-    0x4C48: 'qí',
-    0x4C49: 'shàn',
-    0x4C4A: 'mǐ',
-    0x4C4B: 'gǒng',
-    0x4C4C: 'yí',
-    0x4C4D: 'gèng',
-    0x4C4E: 'gèng',
-    0x4C4F: 'tǒu',
-    0x4C50: 'fū',
-    0x4C51: 'xué',
-    0x4C52: 'yè',
-    0x4C53: 'tíng,tǐng',
-    0x4C54: 'tiáo,chóu',
-    0x4C55: 'móu,méi',
-    0x4C56: 'liú',
-    0x4C57: 'cān',
-    0x4C58: 'lí',
-    0x4C59: 'shū',
-    0x4C5A: 'lù',
-    0x4C5B: 'huò,xù,yì',
-    0x4C5C: 'cuò',
-    0x4C5D: 'pái,bēi',
-    0x4C5E: 'liú',
-    0x4C5F: 'jù,jū',
-    0x4C60: 'zhàn',
-    0x4C61: 'jú',
-    0x4C62: 'zhēng',
-    0x4C63: 'zú',
-    0x4C64: 'xiàn',
-    0x4C65: 'zhì,jì',
-    0x4C68: 'là',
-    0x4C6B: 'là',
-    0x4C6C: 'xū',
-    0x4C6D: 'gèng',
-    0x4C6E: 'é',
-    0x4C6F: 'mú',
-    0x4C70: 'zhòng',
-    0x4C71: 'tí,dì',
-    0x4C72: 'yuán',
-    0x4C73: 'zhān',
-    0x4C74: 'gèng',
-    0x4C75: 'wēng',
-    0x4C76: 'láng',
-    0x4C77: 'yú',
-    0x4C78: 'sōu,qiū',
-    0x4C79: 'zhǎ',
-    0x4C7A: 'hái',
-    0x4C7B: 'huá',
-    0x4C7C: 'zhǎn',
-    0x4C7E: 'lóu',
-    0x4C7F: 'chàn',
-    0x4C80: 'zhì',
-    0x4C81: 'wèi',
-    0x4C82: 'xuán',
-    0x4C83: 'zǎo,suǒ,cháo',
-    0x4C84: 'mín',
-    0x4C85: 'guī',
-    0x4C86: 'sū',
-    0x4C89: 'sī',
-    0x4C8A: 'duò,wěi,tuò',
-    0x4C8B: 'cén',
-    0x4C8C: 'kuǎn',
-    0x4C8D: 'téng',
-    0x4C8E: 'něi',
-    0x4C8F: 'láo',
-    0x4C90: 'lǔ',
-    0x4C91: 'yí',
-    0x4C92: 'xiè',
-    0x4C93: 'yǎn,yán',
-    0x4C94: 'qíng',
-    0x4C95: 'pū',
-    0x4C96: 'chóu',
-    0x4C97: 'xián',
-    0x4C98: 'guǎn',
-    0x4C99: 'jié',
-    0x4C9A: 'lài',
-    0x4C9B: 'méng',
-    0x4C9C: 'yè',
-    0x4C9E: 'lì',
-    0x4C9F: 'yìn',
-    0x4CA0: 'chūn',
-    0x4CA1: 'qiū',
-    0x4CA2: 'téng',
-    0x4CA3: 'yú',
-    0x4CA6: 'dài',
-    0x4CA7: 'dù',
-    0x4CA8: 'hóng',
-    0x4CAA: 'xì',
-    0x4CAC: 'qí',
-    0x4CAE: 'yuán',
-    0x4CAF: 'jí',
-    0x4CB0: 'yùn',
-    0x4CB1: 'fǎng',
-    0x4CB2: 'gōng,sōng',
-    0x4CB3: 'háng',
-    0x4CB4: 'zhèn',
-    0x4CB5: 'què',
-    0x4CB8: 'jiè',
-    0x4CB9: 'pí',
-    0x4CBA: 'gàn',
-    0x4CBB: 'xuán,yuān',
-    0x4CBC: 'shēng',
-    0x4CBD: 'shí,diǎo',
-    0x4CBE: 'qiǎo',
-    0x4CBF: 'cí',
-    0x4CC0: 'dié,yì',
-    0x4CC1: 'bó',
-    0x4CC2: 'diāo,chāo,tiáo,xiāo',
-    0x4CC3: 'wǎn',
-    0x4CC4: 'cí',
-    0x4CC5: 'zhǐ,zhì',
-    0x4CC6: 'bái',
-    0x4CC7: 'wǔ',
-    0x4CC8: 'bǎo',
-    0x4CC9: 'dōng,dàn',
-    0x4CCA: 'bá',
-    0x4CCB: 'tóng,tōng,xiāo',
-    0x4CCD: 'gōng',
-    0x4CCE: 'jiù',
-    0x4CCF: 'guì,jué',
-    0x4CD0: 'cì',
-    0x4CD1: 'yǒu',
-    0x4CD2: 'yuán',
-    0x4CD3: 'lǎo',
-    0x4CD4: 'jú,jiù',
-    0x4CD5: 'fú',
-    0x4CD6: 'niè',
-    0x4CD7: 'é',
-    0x4CD8: 'é',
-    0x4CD9: 'xǐng',
-    0x4CDA: 'kàn,hé',
-    0x4CDB: 'yàn',
-    0x4CDC: 'tú',
-    0x4CDD: 'pǒu,bù',
-    0x4CDE: 'běng',
-    0x4CDF: 'míng',
-    0x4CE0: 'shuì,zhù',
-    0x4CE1: 'yàn,zhuī',
-    0x4CE2: 'qí',
-    0x4CE3: 'yuán',
-    0x4CE4: 'biē',
-    0x4CE6: 'xuān',
-    0x4CE7: 'hóu',
-    0x4CE8: 'huáng',
-    0x4CE9: 'yāo',
-    0x4CEA: 'juàn',
-    0x4CEB: 'kuí',
-    0x4CEC: 'è',
-    0x4CED: 'jí',
-    0x4CEE: 'mò',
-    0x4CEF: 'chóng,chǒng',
-    0x4CF0: 'bǎo',
-    0x4CF1: 'wù',
-    0x4CF2: 'zhèn',
-    0x4CF3: 'xù',
-    0x4CF4: 'tà,dá',
-    0x4CF5: 'chì',
-    0x4CF6: 'xī,qī,jī',
-    0x4CF7: 'cóng',
-    0x4CF8: 'má',
-    0x4CF9: 'kòu',
-    0x4CFA: 'yàn',
-    0x4CFB: 'cán,zhàn',
-    0x4CFD: 'hè',
-    0x4CFE: 'dēng',
-    0x4CFF: 'rán',
-    0x4D00: 'tóng',
-    0x4D01: 'yù,yú',
-    0x4D02: 'xiàng',
-    0x4D03: 'náo',
-    0x4D04: 'shùn',
-    0x4D05: 'fén',
-    0x4D06: 'pú,pū',
-    0x4D07: 'líng',
-    0x4D08: 'ǎo',
-    0x4D09: 'huán,xuán',
-    0x4D0A: 'yí',
-    0x4D0B: 'huán,xuán',
-    0x4D0C: 'méng',
-    0x4D0D: 'yīng',
-    0x4D0E: 'lěi',
-    0x4D0F: 'yàn',
-    0x4D10: 'bǎo',
-    0x4D11: 'dié',
-    0x4D12: 'líng',
-    0x4D13: 'shī',
-    0x4D14: 'jiāo',
-    0x4D15: 'liè',
-    0x4D16: 'jīng',
-    0x4D17: 'jú',
-    0x4D18: 'tī',
-    0x4D19: 'pì',
-    0x4D1A: 'gǎng',
-    0x4D1B: 'xiāo',
-    0x4D1C: 'wāi',
-    0x4D1D: 'chuài',
-    0x4D1E: 'dí',
-    0x4D1F: 'huán',
-    0x4D20: 'yǎo',
-    0x4D21: 'lì',
-    0x4D22: 'mí',
-    0x4D23: 'hū',
-    0x4D24: 'shēng',
-    0x4D25: 'jiā',
-    0x4D26: 'yín',
-    0x4D27: 'wēi',
-    0x4D29: 'piáo',
-    0x4D2A: 'lù',
-    0x4D2B: 'líng',
-    0x4D2C: 'yì',
-    0x4D2D: 'cái',
-    0x4D2E: 'shàn',
-    0x4D2F: 'hū',
-    0x4D30: 'shú,yì',
-    0x4D31: 'tuō',
-    0x4D32: 'mò',
-    0x4D33: 'huá',
-    0x4D34: 'tiè,nián',
-    0x4D35: 'bǐng',
-    0x4D36: 'péng',
-    0x4D37: 'hún,huàn',
-    0x4D38: 'fū',
-    0x4D39: 'guǒ,luǒ,hún',
-    0x4D3A: 'bù',
-    0x4D3B: 'lí',
-    0x4D3C: 'chàn',
-    0x4D3D: 'pí',
-    0x4D3E: 'cuó',
-    0x4D3F: 'méng',
-    0x4D40: 'suǒ,suò',
-    0x4D41: 'qiàng',
-    0x4D42: 'zhí',
-    0x4D43: 'kuàng,huáng',
-    0x4D44: 'bí',
-    0x4D45: 'áo',
-    0x4D46: 'méng',
-    0x4D47: 'xiàn',
-    0x4D48: 'kù',
-    0x4D49: 'tóu',
-    0x4D4A: 'tuān',
-    0x4D4B: 'wěi',
-    0x4D4C: 'xiān',
-    0x4D4E: 'tuān',
-    0x4D4F: 'lǎo',
-    0x4D50: 'chǎn',
-    0x4D51: 'nì',
-    0x4D52: 'nì',
-    0x4D53: 'lí',
-    0x4D54: 'dǒng',
-    0x4D55: 'jù',
-    0x4D56: 'qiàn,qīn',
-    0x4D57: 'bó,bí',
-    0x4D58: 'shài',
-    0x4D59: 'zhā,zhǎ',
-    0x4D5A: 'tǎo',
-    0x4D5B: 'qiàn',
-    0x4D5C: 'nǒng',
-    0x4D5D: 'yì,yà',
-    0x4D5E: 'jìng',
-    0x4D5F: 'gǎn',
-    0x4D60: 'dí,zhuó',
-    0x4D61: 'jiǎn',
-    0x4D62: 'mèi',
-    0x4D63: 'dá',
-    0x4D64: 'jiǎn,xiàn',
-    0x4D65: 'yù',
-    0x4D66: 'xiè,wū',
-    0x4D67: 'zài',
-    0x4D68: 'máng',
-    0x4D69: 'lí',
-    0x4D6A: 'gùn,hùn',
-    0x4D6B: 'xūn,yù',
-    0x4D6C: 'tà',
-    0x4D6D: 'zhè',
-    0x4D6E: 'yàng',
-    0x4D6F: 'tuǎn',
-    0x4D70: 'shāng',
-    0x4D71: 'xì,xī',
-    0x4D72: 'qiāo',
-    0x4D73: 'wèi',
-    0x4D74: 'yìng,zèng,yùn',
-    0x4D75: 'chuā,zhuó',
-    0x4D76: 'qú,gōu',
-    0x4D77: 'wā',
-    0x4D79: 'zhī',
-    0x4D7A: 'tǐng,dǐng,tiǎn',
-    0x4D7B: 'huì,gǔ',
-    0x4D7C: 'shāng',
-    0x4D7D: 'cà',
-    0x4D7E: 'fú,fǔ',
-    0x4D7F: 'tiè',
-    0x4D80: 'tà',
-    0x4D81: 'tà',
-    0x4D82: 'zhuó,jué',
-    0x4D83: 'hán',
-    0x4D84: 'píng',
-    0x4D85: 'hé',
-    0x4D86: 'zhuī',
-    0x4D87: 'zhòu',
-    0x4D88: 'bó',
-    0x4D89: 'liú',
-    0x4D8A: 'nǜ',
-    0x4D8B: 'xī',
-    0x4D8C: 'pào',
-    0x4D8D: 'dì',
-    0x4D8E: 'hē',
-    0x4D8F: 'tì,tǐ',
-    0x4D90: 'wài,huì',
-    0x4D91: 'tì',
-    0x4D92: 'qí',
-    0x4D93: 'jì',
-    0x4D94: 'chí',
-    0x4D95: 'bà,bā',
-    0x4D96: 'jìn',
-    0x4D97: 'kè,qiā,qiǎ',
-    0x4D98: 'lì',
-    0x4D99: 'jù',
-    0x4D9A: 'qǔ',
-    0x4D9B: 'là',
-    0x4D9C: 'gǔ',
-    0x4D9D: 'qià',
-    0x4D9E: 'qí',
-    0x4D9F: 'xiàn',
-    0x4DA0: 'jiǎn',
-    0x4DA1: 'shí,zé',
-    0x4DA2: 'jiān,xián',
-    0x4DA3: 'ái,gāi',
-    0x4DA4: 'huá',
-    0x4DA5: 'zhā,jǔ,chǔ',
-    0x4DA6: 'zé',
-    0x4DA7: 'yǎo',
-    0x4DA8: 'zhān',
-    0x4DA9: 'jì',
-    0x4DAA: 'chà',
-    0x4DAB: 'yàn,yán',
-    0x4DAC: 'jiān',
-    0x4DAE: 'yǎn',
-    0x4DB0: 'jiāo',
-    0x4DB1: 'tóng',
-    0x4DB2: 'nán',
-    0x4DB3: 'yuè',
-    0x4DB5: 'chí',
-    0x4E00: 'yī,yí,yì',
-    0x4E01: 'dīng,zhēng',
-    0x4E02: 'kǎo,qiǎo,yú',
-    0x4E03: 'qī,qí',
-    0x4E04: 'shàng',
-    0x4E05: 'xià',
-    0x4E06: 'hǎn',
-    0x4E07: 'wàn,mò',
-    0x4E08: 'zhàng',
-    0x4E09: 'sān',
-    0x4E0A: 'shàng,shǎng',
-    0x4E0B: 'xià',
-    0x4E0C: 'jī,qí',
-    0x4E0D: 'bù,fǒu,fōu,fū,bú',
-    0x4E0E: 'yǔ,yù,yú',
-    0x4E0F: 'miǎn',
-    0x4E10: 'gài',
-    0x4E11: 'chǒu',
-    0x4E12: 'chǒu',
-    0x4E13: 'zhuān',
-    0x4E14: 'qiě,jū,cú',
-    0x4E15: 'pī',
-    0x4E16: 'shì',
-    0x4E17: 'shì',
-    0x4E18: 'qiū',
-    0x4E19: 'bǐng,bìng',
-    0x4E1A: 'yè',
-    0x4E1B: 'cóng',
-    0x4E1C: 'dōng',
-    0x4E1D: 'sī',
-    0x4E1E: 'chéng,shèng,zhēng,zhěng',
-    0x4E1F: 'diū',
-    0x4E20: 'qiū',
-    0x4E21: 'liǎng',
-    0x4E22: 'diū',
-    0x4E23: 'yǒu',
-    0x4E24: 'liǎng',
-    0x4E25: 'yán',
-    0x4E26: 'bìng,bàn,bàng',
-    0x4E27: 'sàng,sāng',
-    0x4E28: 'gǔn',
-    0x4E29: 'jiū',
-    0x4E2A: 'gè,gě,gàn',
-    0x4E2B: 'yā',
-    0x4E2C: 'qiáng',
-    0x4E2D: 'zhōng,zhòng',
-    0x4E2E: 'jǐ',
-    0x4E2F: 'jiè',
-    0x4E30: 'fēng',
-    0x4E31: 'guàn,kuàng',
-    0x4E32: 'chuàn,guàn,quàn',
-    0x4E33: 'chǎn,chuàn',
-    0x4E34: 'lín',
-    0x4E35: 'zhuó',
-    0x4E36: 'zhǔ',
-    0x4E37: 'bā',
-    0x4E38: 'wán',
-    0x4E39: 'dān',
-    0x4E3A: 'wèi,wéi',
-    0x4E3B: 'zhǔ,zhù',
-    0x4E3C: 'jǐng,dǎn',
-    0x4E3D: 'lì,lí',
-    0x4E3E: 'jǔ',
-    0x4E3F: 'piě,yì',
-    0x4E40: 'fú',
-    0x4E41: 'yí,jí',
-    0x4E42: 'yì,ài',
-    0x4E43: 'nǎi,ǎi',
-    0x4E44: 'wǔ',
-    0x4E45: 'jiǔ',
-    0x4E46: 'jiǔ',
-    0x4E47: 'tuō,zhé',
-    0x4E48: 'me,yāo,mó,ma',
-    0x4E49: 'yì',
-    0x4E4A: 'yī',
-    0x4E4B: 'zhī,zhū,zhì',
-    0x4E4C: 'wū,wù',
-    0x4E4D: 'zhà,zuò',
-    0x4E4E: 'hū',
-    0x4E4F: 'fá',
-    0x4E50: 'lè,yuè',
-    0x4E51: 'yín,pān,zhòng',
-    0x4E52: 'pīng',
-    0x4E53: 'pāng',
-    0x4E54: 'qiáo',
-    0x4E55: 'hǔ',
-    0x4E56: 'guāi',
-    0x4E57: 'chéng',
-    0x4E58: 'chéng,shèng',
-    0x4E59: 'yǐ,yì,jué',
-    0x4E5A: 'yǐn',
-    0x4E5B: 'ya',
-    0x4E5C: 'miē,niè',
-    0x4E5D: 'jiǔ,jiū',
-    0x4E5E: 'qǐ,qì',
-    0x4E5F: 'yě,yí',
-    0x4E60: 'xí',
-    0x4E61: 'xiāng',
-    0x4E62: 'gài',
-    0x4E63: 'jiǔ',
-    0x4E64: 'xià',
-    0x4E65: 'hù',
-    0x4E66: 'shū',
-    0x4E67: 'dǒu',
-    0x4E68: 'shǐ',
-    0x4E69: 'jī',
-    0x4E6A: 'náng',
-    0x4E6B: 'jiā',
-    0x4E6C: 'jù',
-    0x4E6D: 'shí',
-    0x4E6E: 'mǎo',
-    0x4E6F: 'hū',
-    0x4E70: 'mǎi',
-    0x4E71: 'luàn',
-    0x4E72: 'zī',
-    0x4E73: 'rǔ',
-    0x4E74: 'xué',
-    0x4E75: 'yǎn',
-    0x4E76: 'fǔ',
-    0x4E77: 'shā',
-    0x4E78: 'nǎ',
-    0x4E79: 'gān',
-    0x4E7A: 'suǒ',
-    0x4E7B: 'yú',
-    0x4E7C: 'cui',
-    0x4E7D: 'zhě',
-    0x4E7E: 'qián,gān',
-    0x4E7F: 'zhì,luàn',
-    0x4E80: 'guī',
-    0x4E81: 'gān',
-    0x4E82: 'luàn',
-    0x4E83: 'lǐn,lìn',
-    0x4E84: 'yì',
-    0x4E85: 'jué',
-    0x4E86: 'le,liǎo,liào',
-    0x4E87: 'ma',
-    0x4E88: 'yǔ,yú,zhù',
-    0x4E89: 'zhēng',
-    0x4E8A: 'shì',
-    0x4E8B: 'shì,zì',
-    0x4E8C: 'èr',
-    0x4E8D: 'chù',
-    0x4E8E: 'yú,wéi,yū,xū',
-    0x4E8F: 'kuī,yú',
-    0x4E90: 'yú',
-    0x4E91: 'yún',
-    0x4E92: 'hù',
-    0x4E93: 'qí',
-    0x4E94: 'wǔ',
-    0x4E95: 'jǐng,jìng',
-    0x4E96: 'sì',
-    0x4E97: 'suì',
-    0x4E98: 'gèn,xuān,gèng',
-    0x4E99: 'gèn,gèng',
-    0x4E9A: 'yà',
-    0x4E9B: 'xiē,suò,suō',
-    0x4E9C: 'yà',
-    0x4E9D: 'qí,zhāi',
-    0x4E9E: 'yà,yā,è',
-    0x4E9F: 'jí,qì',
-    0x4EA0: 'tóu',
-    0x4EA1: 'wáng,wú',
-    0x4EA2: 'kàng,gāng,gēng',
-    0x4EA3: 'dà',
-    0x4EA4: 'jiāo',
-    0x4EA5: 'hài,jiē',
-    0x4EA6: 'yì',
-    0x4EA7: 'chǎn',
-    0x4EA8: 'hēng,xiǎng,pēng',
-    0x4EA9: 'mǔ',
-    0x4EAA: 'ye',
-    0x4EAB: 'xiǎng',
-    0x4EAC: 'jīng',
-    0x4EAD: 'tíng',
-    0x4EAE: 'liàng,liáng',
-    0x4EAF: 'xiǎng',
-    0x4EB0: 'jīng',
-    0x4EB1: 'yè',
-    0x4EB2: 'qīn,qìng',
-    0x4EB3: 'bó',
-    0x4EB4: 'yòu',
-    0x4EB5: 'xiè',
-    0x4EB6: 'dǎn,dàn,chán,zhān',
-    0x4EB7: 'lián',
-    0x4EB8: 'duǒ',
-    0x4EB9: 'wěi,mén',
-    0x4EBA: 'rén',
-    0x4EBB: 'rén',
-    0x4EBC: 'jí',
-    0x4EBD: 'jí',
-    0x4EBE: 'wáng',
-    0x4EBF: 'yì',
-    0x4EC0: 'shén,shí',
-    0x4EC1: 'rén',
-    0x4EC2: 'lè,lì',
-    0x4EC3: 'dīng,dǐng',
-    0x4EC4: 'zè',
-    0x4EC5: 'jǐn,fù,nú,jìn',
-    0x4EC6: 'pū,pú',
-    0x4EC7: 'chóu,qiú,jū',
-    0x4EC8: 'bā',
-    0x4EC9: 'zhǎng',
-    0x4ECA: 'jīn',
-    0x4ECB: 'jiè,gè',
-    0x4ECC: 'bīng',
-    0x4ECD: 'réng',
-    0x4ECE: 'cóng,zòng',
-    0x4ECF: 'fó',
-    0x4ED0: 'sǎn',
-    0x4ED1: 'lún',
-    0x4ED2: 'bīng',
-    0x4ED3: 'cāng',
-    0x4ED4: 'zǎi,zǐ,zī',
-    0x4ED5: 'shì',
-    0x4ED6: 'tā,tuó',
-    0x4ED7: 'zhàng',
-    0x4ED8: 'fù',
-    0x4ED9: 'xiān,xiǎn',
-    0x4EDA: 'xiān',
-    0x4EDB: 'tuō,duó,chà,zhé',
-    0x4EDC: 'hóng',
-    0x4EDD: 'tóng',
-    0x4EDE: 'rèn',
-    0x4EDF: 'qiān',
-    0x4EE0: 'gǎn,hàn',
-    0x4EE1: 'gē,yì,wù',
-    0x4EE2: 'bó',
-    0x4EE3: 'dài',
-    0x4EE4: 'lìng,líng,lǐng,lián',
-    0x4EE5: 'yǐ,sì',
-    0x4EE6: 'chào',
-    0x4EE7: 'cháng',
-    0x4EE8: 'sā',
-    0x4EE9: 'cháng',
-    0x4EEA: 'yí',
-    0x4EEB: 'mù',
-    0x4EEC: 'men,mén',
-    0x4EED: 'rèn',
-    0x4EEE: 'fǎn',
-    0x4EEF: 'chào,miǎo',
-    0x4EF0: 'yǎng,áng',
-    0x4EF1: 'qián,jīng',
-    0x4EF2: 'zhòng',
-    0x4EF3: 'pǐ,pí,bì',
-    0x4EF4: 'wò',
-    0x4EF5: 'wǔ',
-    0x4EF6: 'jiàn,móu',
-    0x4EF7: 'jià,jie,jiè',
-    0x4EF8: 'yǎo,fó',
-    0x4EF9: 'fēng',
-    0x4EFA: 'cāng',
-    0x4EFB: 'rèn,rén,lìn',
-    0x4EFC: 'wáng',
-    0x4EFD: 'fèn,bīn',
-    0x4EFE: 'dī',
-    0x4EFF: 'fǎng,páng',
-    0x4F00: 'zhōng',
-    0x4F01: 'qǐ',
-    0x4F02: 'pèi',
-    0x4F03: 'yú,yǔ,xù',
-    0x4F04: 'diào',
-    0x4F05: 'dùn',
-    0x4F06: 'wù',
-    0x4F07: 'yì',
-    0x4F08: 'xǐn,lǐn',
-    0x4F09: 'kàng,gāng,kǎng',
-    0x4F0A: 'yī',
-    0x4F0B: 'jí,fán',
-    0x4F0C: 'ài',
-    0x4F0D: 'wǔ',
-    0x4F0E: 'jì,zhì,qí,qì',
-    0x4F0F: 'fú,fù',
-    0x4F10: 'fá',
-    0x4F11: 'xiū,xù',
-    0x4F12: 'jìn,yín',
-    0x4F13: 'pī',
-    0x4F14: 'dǎn',
-    0x4F15: 'fū',
-    0x4F16: 'tǎng',
-    0x4F17: 'zhòng,yín',
-    0x4F18: 'yōu,yóu',
-    0x4F19: 'huǒ,huo',
-    0x4F1A: 'huì,kuài',
-    0x4F1B: 'yǔ',
-    0x4F1C: 'cuì',
-    0x4F1D: 'yún',
-    0x4F1E: 'sǎn',
-    0x4F1F: 'wěi',
-    0x4F20: 'chuán,zhuàn',
-    0x4F21: 'chē',
-    0x4F22: 'yá',
-    0x4F23: 'qiàn,xiàn',
-    0x4F24: 'shāng',
-    0x4F25: 'chāng',
-    0x4F26: 'lún',
-    0x4F27: 'cāng,chen',
-    0x4F28: 'xùn',
-    0x4F29: 'xìn',
-    0x4F2A: 'wěi',
-    0x4F2B: 'zhù',
-    0x4F2C: 'ze',
-    0x4F2D: 'xián',
-    0x4F2E: 'nǔ',
-    0x4F2F: 'bó,bǎi,mò,bà',
-    0x4F30: 'gū,gù',
-    0x4F31: 'nǐ',
-    0x4F32: 'nì,ní,nǐ',
-    0x4F33: 'xiè',
-    0x4F34: 'bàn,pàn',
-    0x4F35: 'xù',
-    0x4F36: 'líng',
-    0x4F37: 'zhòu',
-    0x4F38: 'shēn',
-    0x4F39: 'qū,zù',
-    0x4F3A: 'cì,sì',
-    0x4F3B: 'bēng',
-    0x4F3C: 'shì,sì',
-    0x4F3D: 'gā,jiā,qié',
-    0x4F3E: 'pī',
-    0x4F3F: 'yì',
-    0x4F40: 'sì',
-    0x4F41: 'yǐ,ǎi,sì,chì',
-    0x4F42: 'zhēng',
-    0x4F43: 'diàn,tián',
-    0x4F44: 'hān,gàn',
-    0x4F45: 'mài',
-    0x4F46: 'dàn,tǎn,yàn',
-    0x4F47: 'zhù',
-    0x4F48: 'bù',
-    0x4F49: 'qū,qiā',
-    0x4F4A: 'bǐ',
-    0x4F4B: 'zhāo,sháo,shào',
-    0x4F4C: 'cǐ',
-    0x4F4D: 'wèi,lì',
-    0x4F4E: 'dī',
-    0x4F4F: 'zhù',
-    0x4F50: 'zuǒ',
-    0x4F51: 'yòu',
-    0x4F52: 'yǎng,yāng',
-    0x4F53: 'tǐ,tī,bèn,cuì',
-    0x4F54: 'zhàn,chān,diān',
-    0x4F55: 'hé,hè',
-    0x4F56: 'bì',
-    0x4F57: 'tuó,tuō,tuò,yí',
-    0x4F58: 'shé',
-    0x4F59: 'yú,tú,xú,yù',
-    0x4F5A: 'yì,dié',
-    0x4F5B: 'fú,fó,bó,bì',
-    0x4F5C: 'zuò,zuō,zuó',
-    0x4F5D: 'gōu,kòu,jū',
-    0x4F5E: 'nìng',
-    0x4F5F: 'tóng',
-    0x4F60: 'nǐ',
-    0x4F61: 'xiān',
-    0x4F62: 'qú',
-    0x4F63: 'yōng,yòng',
-    0x4F64: 'wǎ',
-    0x4F65: 'qiān',
-    0x4F66: 'shi',
-    0x4F67: 'kǎ',
-    0x4F68: 'bāo',
-    0x4F69: 'pèi',
-    0x4F6A: 'huí,huái',
-    0x4F6B: 'hè,gé',
-    0x4F6C: 'lǎo,liáo',
-    0x4F6D: 'xiáng',
-    0x4F6E: 'gé,é',
-    0x4F6F: 'yáng',
-    0x4F70: 'bǎi,mò',
-    0x4F71: 'fǎ',
-    0x4F72: 'mǐng',
-    0x4F73: 'jiā',
-    0x4F74: 'èr,nài',
-    0x4F75: 'bìng',
-    0x4F76: 'jí',
-    0x4F77: 'hěn,héng',
-    0x4F78: 'huó',
-    0x4F79: 'guǐ,guī',
-    0x4F7A: 'quán',
-    0x4F7B: 'tiāo,tiáo,tiào,diǎo,yáo,dào,zhào',
-    0x4F7C: 'jiǎo,jiāo,xiáo',
-    0x4F7D: 'cì',
-    0x4F7E: 'yì',
-    0x4F7F: 'shǐ',
-    0x4F80: 'xíng',
-    0x4F81: 'shēn',
-    0x4F82: 'tuō',
-    0x4F83: 'kǎn',
-    0x4F84: 'zhí',
-    0x4F85: 'gāi,hài',
-    0x4F86: 'lái,lài',
-    0x4F87: 'yí',
-    0x4F88: 'chǐ',
-    0x4F89: 'kuǎ,huá,è,wú',
-    0x4F8A: 'guāng',
-    0x4F8B: 'lì,liè',
-    0x4F8C: 'yīn',
-    0x4F8D: 'shì',
-    0x4F8E: 'mǐ',
-    0x4F8F: 'zhū,zhōu',
-    0x4F90: 'xù',
-    0x4F91: 'yòu',
-    0x4F92: 'ān,ǎn',
-    0x4F93: 'lù',
-    0x4F94: 'móu,máo',
-    0x4F95: 'ér',
-    0x4F96: 'lún,lùn',
-    0x4F97: 'dòng,tōng,tóng,tǒng',
-    0x4F98: 'chà',
-    0x4F99: 'chī',
-    0x4F9A: 'xùn,xún',
-    0x4F9B: 'gōng,gòng',
-    0x4F9C: 'zhōu',
-    0x4F9D: 'yī,yǐ',
-    0x4F9E: 'rú',
-    0x4F9F: 'cún,jiàn',
-    0x4FA0: 'xiá',
-    0x4FA1: 'sì',
-    0x4FA2: 'dài',
-    0x4FA3: 'lǚ',
-    0x4FA4: 'ta',
-    0x4FA5: 'jiǎo,yáo',
-    0x4FA6: 'zhēn',
-    0x4FA7: 'cè,zè,zhāi',
-    0x4FA8: 'qiáo',
-    0x4FA9: 'kuài',
-    0x4FAA: 'chái',
-    0x4FAB: 'nìng',
-    0x4FAC: 'nóng',
-    0x4FAD: 'jǐn',
-    0x4FAE: 'wǔ',
-    0x4FAF: 'hóu,hòu',
-    0x4FB0: 'jiǒng',
-    0x4FB1: 'chěng,tǐng',
-    0x4FB2: 'zhèn,zhēn,chēn',
-    0x4FB3: 'zuò',
-    0x4FB4: 'chǒu',
-    0x4FB5: 'qīn,qǐn',
-    0x4FB6: 'lǚ',
-    0x4FB7: 'jú',
-    0x4FB8: 'shù,dōu',
-    0x4FB9: 'tǐng',
-    0x4FBA: 'shèn',
-    0x4FBB: 'tuì,tuō',
-    0x4FBC: 'bó',
-    0x4FBD: 'nán',
-    0x4FBE: 'xiāo',
-    0x4FBF: 'biàn,pián,biān',
-    0x4FC0: 'tuǐ',
-    0x4FC1: 'yǔ',
-    0x4FC2: 'xì',
-    0x4FC3: 'cù,chuò',
-    0x4FC4: 'é',
-    0x4FC5: 'qiú',
-    0x4FC6: 'xú,shū',
-    0x4FC7: 'guàng',
-    0x4FC8: 'kù',
-    0x4FC9: 'wǔ,wú',
-    0x4FCA: 'jùn,shùn,dūn',
-    0x4FCB: 'yì',
-    0x4FCC: 'fǔ',
-    0x4FCD: 'liáng,lǎng',
-    0x4FCE: 'zǔ',
-    0x4FCF: 'qiào,xiào,xiāo',
-    0x4FD0: 'lì',
-    0x4FD1: 'yǒng',
-    0x4FD2: 'hùn',
-    0x4FD3: 'jìng,yíng',
-    0x4FD4: 'qiàn,xiàn',
-    0x4FD5: 'sàn',
-    0x4FD6: 'pěi',
-    0x4FD7: 'sú',
-    0x4FD8: 'fú',
-    0x4FD9: 'xī',
-    0x4FDA: 'lǐ,lì',
-    0x4FDB: 'fǔ,miǎn',
-    0x4FDC: 'pīng',
-    0x4FDD: 'bǎo',
-    0x4FDE: 'yú,shù',
-    0x4FDF: 'qí,sì',
-    0x4FE0: 'xiá',
-    0x4FE1: 'xìn,shēn',
-    0x4FE2: 'xiū',
-    0x4FE3: 'yǔ',
-    0x4FE4: 'dì',
-    0x4FE5: 'chē,jū',
-    0x4FE6: 'chóu',
-    0x4FE7: 'zhì',
-    0x4FE8: 'yǎn',
-    0x4FE9: 'liǎ,liǎng',
-    0x4FEA: 'lì',
-    0x4FEB: 'lái',
-    0x4FEC: 'sī',
-    0x4FED: 'jiǎn',
-    0x4FEE: 'xiū',
-    0x4FEF: 'fǔ',
-    0x4FF0: 'huò',
-    0x4FF1: 'jù,jū',
-    0x4FF2: 'xiào',
-    0x4FF3: 'pái',
-    0x4FF4: 'jiàn',
-    0x4FF5: 'biào',
-    0x4FF6: 'chù,shū,tì',
-    0x4FF7: 'fèi',
-    0x4FF8: 'fèng,běng',
-    0x4FF9: 'yà,yā',
-    0x4FFA: 'ǎn,yàn',
-    0x4FFB: 'bèi',
-    0x4FFC: 'yù',
-    0x4FFD: 'xīn',
-    0x4FFE: 'bǐ,bì,bēi,pì',
-    0x4FFF: 'hǔ,chí',
-    0x5000: 'chāng,chéng,zhèng',
-    0x5001: 'zhī',
-    0x5002: 'bìng',
-    0x5003: 'jiù',
-    0x5004: 'yáo',
-    0x5005: 'cuì,zú',
-    0x5006: 'liǎ,liǎng',
-    0x5007: 'wǎn',
-    0x5008: 'lái,lài,liē',
-    0x5009: 'cāng,chuàng',
-    0x500A: 'zòng',
-    0x500B: 'gè,gě',
-    0x500C: 'guān',
-    0x500D: 'bèi,péi',
-    0x500E: 'tiǎn',
-    0x500F: 'shū',
-    0x5010: 'shū',
-    0x5011: 'men,mèn,mén',
-    0x5012: 'dào,dǎo',
-    0x5013: 'tán,dàn,tàn',
-    0x5014: 'jué,juè',
-    0x5015: 'chuí,zhuì',
-    0x5016: 'xìng',
-    0x5017: 'péng,pěng,píng',
-    0x5018: 'tǎng,cháng',
-    0x5019: 'hòu',
-    0x501A: 'yǐ,jī,yī',
-    0x501B: 'qī,qí,qì',
-    0x501C: 'tì,diào,zhōu',
-    0x501D: 'gàn',
-    0x501E: 'jìng,liàng',
-    0x501F: 'jiè',
-    0x5020: 'suī',
-    0x5021: 'chàng,chāng',
-    0x5022: 'jié,qiè',
-    0x5023: 'fǎng',
-    0x5024: 'zhí',
-    0x5025: 'kōng,kǒng',
-    0x5026: 'juàn',
-    0x5027: 'zōng',
-    0x5028: 'jù',
-    0x5029: 'qiàn,qìng',
-    0x502A: 'ní,nì,niè',
-    0x502B: 'lún',
-    0x502C: 'zhuō',
-    0x502D: 'wō,wēi,wǒ',
-    0x502E: 'luǒ',
-    0x502F: 'sōng',
-    0x5030: 'lèng,líng',
-    0x5031: 'hùn',
-    0x5032: 'dōng,dòng',
-    0x5033: 'zì',
-    0x5034: 'bèn,bēn',
-    0x5035: 'wǔ',
-    0x5036: 'jù',
-    0x5037: 'nǎi',
-    0x5038: 'cǎi',
-    0x5039: 'jiǎn',
-    0x503A: 'zhài',
-    0x503B: 'yē',
-    0x503C: 'zhí',
-    0x503D: 'shà',
-    0x503E: 'qīng',
-    0x503F: 'nìng',
-    0x5040: 'yīng',
-    0x5041: 'chēng',
-    0x5042: 'qián',
-    0x5043: 'yǎn',
-    0x5044: 'ruǎn,rú',
-    0x5045: 'zhòng,chōng,tóng',
-    0x5046: 'chǔn',
-    0x5047: 'jiǎ,jià,jie,xià,xiá,gé',
-    0x5048: 'jì,jié,qì',
-    0x5049: 'wěi',
-    0x504A: 'yǔ',
-    0x504B: 'bìng,bǐng',
-    0x504C: 'ruò,rè',
-    0x504D: 'tí',
-    0x504E: 'wēi',
-    0x504F: 'piān',
-    0x5050: 'yàn',
-    0x5051: 'fēng',
-    0x5052: 'tǎng,dàng',
-    0x5053: 'wò',
-    0x5054: 'è',
-    0x5055: 'xié,jiē',
-    0x5056: 'chě',
-    0x5057: 'shěng',
-    0x5058: 'kǎn',
-    0x5059: 'dì',
-    0x505A: 'zuò',
-    0x505B: 'chā',
-    0x505C: 'tíng',
-    0x505D: 'bèi',
-    0x505E: 'xiè,yè,zhá',
-    0x505F: 'huáng',
-    0x5060: 'yǎo',
-    0x5061: 'zhàn',
-    0x5062: 'chǒu,qiào,zōu',
-    0x5063: 'yān',
-    0x5064: 'yóu',
-    0x5065: 'jiàn',
-    0x5066: 'xǔ,xū',
-    0x5067: 'zhā',
-    0x5068: 'cī',
-    0x5069: 'fù',
-    0x506A: 'bī,fù',
-    0x506B: 'zhì',
-    0x506C: 'zǒng,cōng',
-    0x506D: 'miǎn',
-    0x506E: 'jí',
-    0x506F: 'yǐ',
-    0x5070: 'xiè',
-    0x5071: 'xún',
-    0x5072: 'cāi,sī,sǐ',
-    0x5073: 'duān',
-    0x5074: 'cè,zè,zhāi',
-    0x5075: 'zhēn,zhēng',
-    0x5076: 'ǒu',
-    0x5077: 'tōu',
-    0x5078: 'tōu',
-    0x5079: 'bèi',
-    0x507A: 'zá,zán,zan',
-    0x507B: 'lóu,lǚ',
-    0x507C: 'jié',
-    0x507D: 'wěi,wéi,é,guì',
-    0x507E: 'fèn',
-    0x507F: 'cháng',
-    0x5080: 'guī,kuǐ,kuài',
-    0x5081: 'sǒu',
-    0x5082: 'zhì,sī',
-    0x5083: 'sù',
-    0x5084: 'xiā',
-    0x5085: 'fù,fū',
-    0x5086: 'yuàn,yuán',
-    0x5087: 'rǒng',
-    0x5088: 'lì',
-    0x5089: 'nù',
-    0x508A: 'yùn',
-    0x508B: 'jiǎng,gòu',
-    0x508C: 'mà,mǎ',
-    0x508D: 'bàng,páng,bēng,péng',
-    0x508E: 'diān',
-    0x508F: 'táng',
-    0x5090: 'hào',
-    0x5091: 'jié',
-    0x5092: 'xī,xì',
-    0x5093: 'shàn',
-    0x5094: 'qiàn,jiān',
-    0x5095: 'jué,què',
-    0x5096: 'cāng,chéng,chen',
-    0x5097: 'chù',
-    0x5098: 'sǎn',
-    0x5099: 'bèi',
-    0x509A: 'xiào',
-    0x509B: 'yǒng,róng',
-    0x509C: 'yáo',
-    0x509D: 'tàn,tà',
-    0x509E: 'suō',
-    0x509F: 'yǎng',
-    0x50A0: 'fá',
-    0x50A1: 'bìng',
-    0x50A2: 'jiā,xiàng',
-    0x50A3: 'dǎi',
-    0x50A4: 'zài',
-    0x50A5: 'tǎng',
-    0x50A6: 'gǔ',
-    0x50A7: 'bīn',
-    0x50A8: 'chǔ',
-    0x50A9: 'nuó',
-    0x50AA: 'cān,sǎn,càn,cā,sēn',
-    0x50AB: 'lěi',
-    0x50AC: 'cuī',
-    0x50AD: 'yōng,chōng,yòng',
-    0x50AE: 'zāo,cáo',
-    0x50AF: 'zǒng',
-    0x50B0: 'bēng,péng',
-    0x50B1: 'sǒng,shuǎng',
-    0x50B2: 'ào,áo',
-    0x50B3: 'chuán,zhuàn',
-    0x50B4: 'yǔ',
-    0x50B5: 'zhài',
-    0x50B6: 'zú,qī',
-    0x50B7: 'shāng',
-    0x50B8: 'chuǎng',
-    0x50B9: 'jìng',
-    0x50BA: 'chì',
-    0x50BB: 'shǎ',
-    0x50BC: 'hàn',
-    0x50BD: 'zhāng',
-    0x50BE: 'qīng,qǐng',
-    0x50BF: 'yàn,yān,yìn',
-    0x50C0: 'dì',
-    0x50C1: 'xiè,sù',
-    0x50C2: 'lóu,liǔ,lǚ',
-    0x50C3: 'bèi',
-    0x50C4: 'piào,biāo',
-    0x50C5: 'jǐn,jìn',
-    0x50C6: 'liàn,lián',
-    0x50C7: 'lù,liáo',
-    0x50C8: 'mán,màn',
-    0x50C9: 'qiān',
-    0x50CA: 'xiān',
-    0x50CB: 'tàn,làn,tǎn',
-    0x50CC: 'yíng',
-    0x50CD: 'dòng',
-    0x50CE: 'zhuàn,zūn',
-    0x50CF: 'xiàng',
-    0x50D0: 'shàn',
-    0x50D1: 'qiáo,jiǎo',
-    0x50D2: 'jiǒng',
-    0x50D3: 'tuǐ,tuí',
-    0x50D4: 'zǔn,cuán',
-    0x50D5: 'pú,pū,bú',
-    0x50D6: 'xī',
-    0x50D7: 'láo,lào',
-    0x50D8: 'chǎng',
-    0x50D9: 'guāng',
-    0x50DA: 'liáo,liǎo,lǎo',
-    0x50DB: 'qī',
-    0x50DC: 'chēng,dèng,dēng,téng',
-    0x50DD: 'chán,zhuàn',
-    0x50DE: 'wěi',
-    0x50DF: 'jī',
-    0x50E0: 'bō',
-    0x50E1: 'huì',
-    0x50E2: 'chuǎn,chǔn',
-    0x50E3: 'tiě,jiàn',
-    0x50E4: 'dàn,chán,chǎn,shàn,dá',
-    0x50E5: 'jiǎo,yáo,jiāo',
-    0x50E6: 'jiù',
-    0x50E7: 'sēng,céng',
-    0x50E8: 'fèn',
-    0x50E9: 'xiàn',
-    0x50EA: 'jú,yù',
-    0x50EB: 'è',
-    0x50EC: 'jiāo,jiào,jiǎo',
-    0x50ED: 'jiàn,zèn',
-    0x50EE: 'tóng,zhuàng,chòng',
-    0x50EF: 'lìn,lǐn',
-    0x50F0: 'bó',
-    0x50F1: 'gù',
-    0x50F2: 'xiān',
-    0x50F3: 'sù',
-    0x50F4: 'xiàn',
-    0x50F5: 'jiāng',
-    0x50F6: 'mǐn',
-    0x50F7: 'yè',
-    0x50F8: 'jìn',
-    0x50F9: 'jià,qiǎ,jie',
-    0x50FA: 'qiào',
-    0x50FB: 'pì',
-    0x50FC: 'fēng',
-    0x50FD: 'zhòu,zhōu',
-    0x50FE: 'ài',
-    0x50FF: 'sài',
-    0x5100: 'yí',
-    0x5101: 'jùn',
-    0x5102: 'nóng',
-    0x5103: 'chán,shàn,tǎn,dàn,zhǎn',
-    0x5104: 'yì,yī',
-    0x5105: 'dàng,dāng',
-    0x5106: 'jǐng',
-    0x5107: 'xuān,xuán',
-    0x5108: 'kuài',
-    0x5109: 'jiǎn',
-    0x510A: 'chù',
-    0x510B: 'dān,dàn,shàn',
-    0x510C: 'jiǎo,jiāo',
-    0x510D: 'shǎ',
-    0x510E: 'zài',
-    0x510F: 'càn',
-    0x5110: 'bīn,bìn',
-    0x5111: 'án,àn',
-    0x5112: 'rú',
-    0x5113: 'tái,tài',
-    0x5114: 'chóu,dào',
-    0x5115: 'chái',
-    0x5116: 'lán',
-    0x5117: 'nǐ,yí,yì,ài',
-    0x5118: 'jǐn,jìn',
-    0x5119: 'qiàn',
-    0x511A: 'méng',
-    0x511B: 'wǔ',
-    0x511C: 'níng',
-    0x511D: 'qióng',
-    0x511E: 'nǐ',
-    0x511F: 'cháng',
-    0x5120: 'liè,là',
-    0x5121: 'lěi,léi,lèi',
-    0x5122: 'lǚ',
-    0x5123: 'kuǎng',
-    0x5124: 'bào',
-    0x5125: 'yù,dí,dú',
-    0x5126: 'biāo',
-    0x5127: 'zǎn',
-    0x5128: 'zhì',
-    0x5129: 'sì',
-    0x512A: 'yōu',
-    0x512B: 'háo',
-    0x512C: 'qìng',
-    0x512D: 'chèn,qìn,qīn',
-    0x512E: 'lì',
-    0x512F: 'téng',
-    0x5130: 'wěi',
-    0x5131: 'lǒng,lòng,lóng',
-    0x5132: 'chǔ,chú',
-    0x5133: 'chán,chàn',
-    0x5134: 'ráng,xiāng',
-    0x5135: 'shū,tiáo',
-    0x5136: 'huì,xié',
-    0x5137: 'lì,lí',
-    0x5138: 'luó',
-    0x5139: 'zǎn',
-    0x513A: 'nuó',
-    0x513B: 'tǎng,tàng,chǎng',
-    0x513C: 'yǎn',
-    0x513D: 'léi,lěi,luǒ',
-    0x513E: 'nàng',
-    0x513F: 'ér,er,rén',
-    0x5140: 'wù,wū',
-    0x5141: 'yǔn,yuán',
-    0x5142: 'zān',
-    0x5143: 'yuán',
-    0x5144: 'xiōng,kuàng',
-    0x5145: 'chōng',
-    0x5146: 'zhào',
-    0x5147: 'xiōng',
-    0x5148: 'xiān',
-    0x5149: 'guāng,guàng',
-    0x514A: 'duì',
-    0x514B: 'kè',
-    0x514C: 'duì',
-    0x514D: 'miǎn,wèn,wǎn',
-    0x514E: 'tù',
-    0x514F: 'cháng',
-    0x5150: 'ér',
-    0x5151: 'duì,ruì,duó',
-    0x5152: 'ér,ní',
-    0x5153: 'jīn,zàn',
-    0x5154: 'tù,tú,chān',
-    0x5155: 'sì',
-    0x5156: 'yǎn',
-    0x5157: 'yǎn',
-    0x5158: 'shǐ',
-    0x515A: 'dǎng',
-    0x515B: 'qiān',
-    0x515C: 'dōu',
-    0x515D: 'fēn',
-    0x515E: 'máo',
-    0x515F: 'shēn',
-    0x5160: 'dōu',
-    0x5162: 'jīng',
-    0x5163: 'lǐ',
-    0x5164: 'huǎng',
-    0x5165: 'rù',
-    0x5166: 'wáng',
-    0x5167: 'nèi',
-    0x5168: 'quán',
-    0x5169: 'liǎng,liàng',
-    0x516A: 'yú,yù,shù,shū,zhū',
-    0x516B: 'bā,bá',
-    0x516C: 'gōng',
-    0x516D: 'liù,lù',
-    0x516E: 'xī',
-    0x516F: 'han',
-    0x5170: 'lán',
-    0x5171: 'gòng,gōng,gǒng,hóng',
-    0x5172: 'tiān',
-    0x5173: 'guān',
-    0x5174: 'xīng,xìng',
-    0x5175: 'bīng',
-    0x5176: 'qí,jī,jì',
-    0x5177: 'jù',
-    0x5178: 'diǎn,tiǎn',
-    0x5179: 'zī,cí',
-    0x517A: 'fēn',
-    0x517B: 'yǎng',
-    0x517C: 'jiān',
-    0x517D: 'shòu',
-    0x517E: 'jì',
-    0x517F: 'yì',
-    0x5180: 'jì',
-    0x5181: 'chǎn',
-    0x5182: 'jiōng,jiǒng',
-    0x5183: 'mào',
-    0x5184: 'rǎn',
-    0x5185: 'nèi,nà,ruì',
-    0x5186: 'yuán',
-    0x5187: 'mǎo',
-    0x5188: 'gāng',
-    0x5189: 'rǎn,nán,dān',
-    0x518A: 'cè',
-    0x518B: 'jiōng,jiǒng',
-    0x518C: 'cè,zhà',
-    0x518D: 'zài',
-    0x518E: 'guǎ',
-    0x518F: 'jiǒng,jiōng',
-    0x5190: 'mào',
-    0x5191: 'zhòu',
-    0x5192: 'mào,mò',
-    0x5193: 'gòu,gōu',
-    0x5194: 'xǔ',
-    0x5195: 'miǎn',
-    0x5196: 'mì',
-    0x5197: 'rǒng',
-    0x5198: 'yín,yóu',
-    0x5199: 'xiě,xiè',
-    0x519A: 'kǎn',
-    0x519B: 'jūn',
-    0x519C: 'nóng',
-    0x519D: 'yí',
-    0x519E: 'mí',
-    0x519F: 'shì',
-    0x51A0: 'guān,guàn',
-    0x51A1: 'méng',
-    0x51A2: 'zhǒng',
-    0x51A3: 'jù',
-    0x51A4: 'yuān',
-    0x51A5: 'míng,mián,miàn',
-    0x51A6: 'kòu',
-    0x51A7: 'lín',
-    0x51A8: 'fù',
-    0x51A9: 'xiě',
-    0x51AA: 'mì',
-    0x51AB: 'bīng',
-    0x51AC: 'dōng',
-    0x51AD: 'tài',
-    0x51AE: 'gāng',
-    0x51AF: 'féng,píng',
-    0x51B0: 'bīng,níng',
-    0x51B1: 'hù',
-    0x51B2: 'chōng,chòng',
-    0x51B3: 'jué',
-    0x51B4: 'hù',
-    0x51B5: 'kuàng',
-    0x51B6: 'yě',
-    0x51B7: 'lěng,líng,lǐng',
-    0x51B8: 'pàn',
-    0x51B9: 'fú',
-    0x51BA: 'mǐn',
-    0x51BB: 'dòng',
-    0x51BC: 'xiǎn,shěng',
-    0x51BD: 'liè',
-    0x51BE: 'qià',
-    0x51BF: 'jiān',
-    0x51C0: 'jìng,chēng',
-    0x51C1: 'sōu',
-    0x51C2: 'měi',
-    0x51C3: 'tú',
-    0x51C4: 'qī',
-    0x51C5: 'gù',
-    0x51C6: 'zhǔn',
-    0x51C7: 'sōng',
-    0x51C8: 'jìng',
-    0x51C9: 'liáng,liàng',
-    0x51CA: 'qìng',
-    0x51CB: 'diāo',
-    0x51CC: 'líng,lìng',
-    0x51CD: 'dòng',
-    0x51CE: 'gàn',
-    0x51CF: 'jiǎn',
-    0x51D0: 'yīn',
-    0x51D1: 'còu',
-    0x51D2: 'ái',
-    0x51D3: 'lì',
-    0x51D4: 'chuàng,cāng',
-    0x51D5: 'mǐng',
-    0x51D6: 'zhǔn',
-    0x51D7: 'cuī',
-    0x51D8: 'sī',
-    0x51D9: 'duó',
-    0x51DA: 'jìn',
-    0x51DB: 'lǐn',
-    0x51DC: 'lǐn',
-    0x51DD: 'níng',
-    0x51DE: 'xī',
-    0x51DF: 'dú',
-    0x51E0: 'jǐ,jī',
-    0x51E1: 'fán',
-    0x51E2: 'fán',
-    0x51E3: 'fán',
-    0x51E4: 'fèng',
-    0x51E5: 'jū',
-    0x51E6: 'chǔ,chù',
-    0x51E7: 'zhēng',
-    0x51E8: 'fēng',
-    0x51E9: 'mù',
-    0x51EA: 'zhǐ',
-    0x51EB: 'fú',
-    0x51EC: 'fēng',
-    0x51ED: 'píng',
-    0x51EE: 'fēng',
-    0x51EF: 'kǎi',
-    0x51F0: 'huáng',
-    0x51F1: 'kǎi',
-    0x51F2: 'gān',
-    0x51F3: 'dèng',
-    0x51F4: 'píng',
-    0x51F5: 'qiǎn,kǎn',
-    0x51F6: 'xiōng',
-    0x51F7: 'kuài',
-    0x51F8: 'tū',
-    0x51F9: 'āo,wā',
-    0x51FA: 'chū',
-    0x51FB: 'jī',
-    0x51FC: 'dàng',
-    0x51FD: 'hán',
-    0x51FE: 'hán',
-    0x51FF: 'záo,zuò',
-    0x5200: 'dāo,diāo',
-    0x5201: 'diāo',
-    0x5202: 'dāo',
-    0x5203: 'rèn',
-    0x5204: 'rèn',
-    0x5205: 'chuāng',
-    0x5206: 'fēn,fèn,fén',
-    0x5207: 'qiè,qiē,qì',
-    0x5208: 'yì',
-    0x5209: 'jī',
-    0x520A: 'kān',
-    0x520B: 'qiàn',
-    0x520C: 'cǔn',
-    0x520D: 'chú',
-    0x520E: 'wěn',
-    0x520F: 'jī',
-    0x5210: 'dǎn',
-    0x5211: 'xíng',
-    0x5212: 'huà,huá,guò,guǒ,huai',
-    0x5213: 'wán',
-    0x5214: 'jué',
-    0x5215: 'lí',
-    0x5216: 'yuè',
-    0x5217: 'liè,lì',
-    0x5218: 'liú',
-    0x5219: 'zé',
-    0x521A: 'gāng',
-    0x521B: 'chuàng,chuāng',
-    0x521C: 'fú',
-    0x521D: 'chū',
-    0x521E: 'qù',
-    0x521F: 'diāo',
-    0x5220: 'shān',
-    0x5221: 'mǐn',
-    0x5222: 'líng',
-    0x5223: 'zhōng',
-    0x5224: 'pàn',
-    0x5225: 'bié',
-    0x5226: 'jié',
-    0x5227: 'jié',
-    0x5228: 'páo,bào',
-    0x5229: 'lì',
-    0x522A: 'shān',
-    0x522B: 'bié,biè',
-    0x522C: 'chǎn,chàn',
-    0x522D: 'jǐng',
-    0x522E: 'guā',
-    0x522F: 'gēng',
-    0x5230: 'dào',
-    0x5231: 'chuàng',
-    0x5232: 'kuī',
-    0x5233: 'kū,kōu',
-    0x5234: 'duò',
-    0x5235: 'èr',
-    0x5236: 'zhì',
-    0x5237: 'shuā,shuà',
-    0x5238: 'quàn,xuàn',
-    0x5239: 'shā,chà',
-    0x523A: 'cì,cī,qì',
-    0x523B: 'kè,kēi',
-    0x523C: 'jié',
-    0x523D: 'guì',
-    0x523E: 'cì',
-    0x523F: 'guì',
-    0x5240: 'kǎi',
-    0x5241: 'duò',
-    0x5242: 'jì',
-    0x5243: 'tì',
-    0x5244: 'jǐng',
-    0x5245: 'lóu,dōu',
-    0x5246: 'luǒ',
-    0x5247: 'zé',
-    0x5248: 'yuān',
-    0x5249: 'cuò',
-    0x524A: 'xuē,xiāo,qiào,shào',
-    0x524B: 'kè,kēi',
-    0x524C: 'lá,là',
-    0x524D: 'qián,jiǎn',
-    0x524E: 'shā',
-    0x524F: 'chuàng',
-    0x5250: 'guǎ',
-    0x5251: 'jiàn',
-    0x5252: 'cuò',
-    0x5253: 'lí',
-    0x5254: 'tī,tì',
-    0x5255: 'fèi',
-    0x5256: 'pōu,pǒ',
-    0x5257: 'chǎn,chàn',
-    0x5258: 'qí',
-    0x5259: 'chuàng',
-    0x525A: 'zì',
-    0x525B: 'gāng',
-    0x525C: 'wān',
-    0x525D: 'bō',
-    0x525E: 'jī',
-    0x525F: 'duō,chì',
-    0x5260: 'qíng,lüè',
-    0x5261: 'shàn,yǎn',
-    0x5262: 'dū,zhuó',
-    0x5263: 'jiàn',
-    0x5264: 'jì',
-    0x5265: 'bō,bāo,pū',
-    0x5266: 'yān',
-    0x5267: 'jù',
-    0x5268: 'huō,huò',
-    0x5269: 'shèng',
-    0x526A: 'jiǎn',
-    0x526B: 'duó,dù',
-    0x526C: 'duān,tuán,zhì',
-    0x526D: 'wū',
-    0x526E: 'guǎ',
-    0x526F: 'fù,pì',
-    0x5270: 'shèng',
-    0x5271: 'jiàn',
-    0x5272: 'gē',
-    0x5273: 'dá,zhá',
-    0x5274: 'kǎi,āi',
-    0x5275: 'chuàng,chuāng,qiāng',
-    0x5276: 'chuān',
-    0x5277: 'chǎn',
-    0x5278: 'tuán,zhuān,zhuàn',
-    0x5279: 'lù,jiū',
-    0x527A: 'lí',
-    0x527B: 'pěng',
-    0x527C: 'shān',
-    0x527D: 'piāo,piào,piáo,biǎo,biāo',
-    0x527E: 'kōu',
-    0x527F: 'jiǎo,chāo',
-    0x5280: 'guā',
-    0x5281: 'qiāo,qiáo',
-    0x5282: 'jué',
-    0x5283: 'huà,huá,huai',
-    0x5284: 'zhā,zhá',
-    0x5285: 'zhuó',
-    0x5286: 'lián',
-    0x5287: 'jù',
-    0x5288: 'pī,pǐ',
-    0x5289: 'liú',
-    0x528A: 'guì',
-    0x528B: 'jiǎo,chāo',
-    0x528C: 'guì',
-    0x528D: 'jiàn',
-    0x528E: 'jiàn',
-    0x528F: 'tāng',
-    0x5290: 'huō,huò,huá',
-    0x5291: 'jì',
-    0x5292: 'jiàn',
-    0x5293: 'yì',
-    0x5294: 'jiàn',
-    0x5295: 'zhì',
-    0x5296: 'chán',
-    0x5297: 'jiǎn,zuān',
-    0x5298: 'mó,mí',
-    0x5299: 'lí',
-    0x529A: 'zhú',
-    0x529B: 'lì',
-    0x529C: 'yà',
-    0x529D: 'quàn',
-    0x529E: 'bàn',
-    0x529F: 'gōng',
-    0x52A0: 'jiā',
-    0x52A1: 'wù',
-    0x52A2: 'mài',
-    0x52A3: 'liè',
-    0x52A4: 'jìn',
-    0x52A5: 'kēng',
-    0x52A6: 'xié,liè',
-    0x52A7: 'zhǐ',
-    0x52A8: 'dòng',
-    0x52A9: 'zhù,chú',
-    0x52AA: 'nǔ',
-    0x52AB: 'jié',
-    0x52AC: 'qú',
-    0x52AD: 'shào',
-    0x52AE: 'yì',
-    0x52AF: 'zhū',
-    0x52B0: 'mò',
-    0x52B1: 'lì',
-    0x52B2: 'jìn,jìng',
-    0x52B3: 'láo',
-    0x52B4: 'láo',
-    0x52B5: 'juàn',
-    0x52B6: 'kǒu',
-    0x52B7: 'yáng',
-    0x52B8: 'wā',
-    0x52B9: 'xiào',
-    0x52BA: 'móu',
-    0x52BB: 'kuāng',
-    0x52BC: 'jié',
-    0x52BD: 'liè',
-    0x52BE: 'hé,kài',
-    0x52BF: 'shì',
-    0x52C0: 'kè',
-    0x52C1: 'jìn,jìng',
-    0x52C2: 'gào',
-    0x52C3: 'bó',
-    0x52C4: 'mǐn',
-    0x52C5: 'chì',
-    0x52C6: 'láng',
-    0x52C7: 'yǒng',
-    0x52C8: 'yǒng',
-    0x52C9: 'miǎn',
-    0x52CA: 'kè',
-    0x52CB: 'xūn',
-    0x52CC: 'juàn,juān',
-    0x52CD: 'qíng',
-    0x52CE: 'lù',
-    0x52CF: 'bù',
-    0x52D0: 'měng',
-    0x52D1: 'chì,lài',
-    0x52D2: 'lēi,lè,lei',
-    0x52D3: 'kài',
-    0x52D4: 'miǎn',
-    0x52D5: 'dòng',
-    0x52D6: 'xù,mào',
-    0x52D7: 'xù',
-    0x52D8: 'kān',
-    0x52D9: 'wù,wǔ,wú,máo,mào',
-    0x52DA: 'yì',
-    0x52DB: 'xūn',
-    0x52DC: 'wěng,yǎng',
-    0x52DD: 'shèng',
-    0x52DE: 'láo,lào,liáo',
-    0x52DF: 'mù,bó',
-    0x52E0: 'lù',
-    0x52E1: 'piào',
-    0x52E2: 'shì',
-    0x52E3: 'jī',
-    0x52E4: 'qín,qí',
-    0x52E5: 'jiàng,qiǎng,jiǎng',
-    0x52E6: 'chāo,jiǎo,cháo',
-    0x52E7: 'quàn',
-    0x52E8: 'xiàng',
-    0x52E9: 'yì',
-    0x52EA: 'jué',
-    0x52EB: 'fān',
-    0x52EC: 'juān',
-    0x52ED: 'tóng,dòng',
-    0x52EE: 'jù',
-    0x52EF: 'dān',
-    0x52F0: 'xié',
-    0x52F1: 'mài',
-    0x52F2: 'xūn',
-    0x52F3: 'xūn',
-    0x52F4: 'lǜ',
-    0x52F5: 'lì',
-    0x52F6: 'chè',
-    0x52F7: 'ráng,xiāng',
-    0x52F8: 'quàn',
-    0x52F9: 'bāo',
-    0x52FA: 'sháo,shuò,zhuó,dì',
-    0x52FB: 'yún',
-    0x52FC: 'jiū',
-    0x52FD: 'bào',
-    0x52FE: 'gōu,gòu',
-    0x52FF: 'wù,mò',
-    0x5300: 'yún,jūn,yùn',
-    0x5301: 'wén',
-    0x5302: 'xiōng',
-    0x5303: 'gài',
-    0x5304: 'gài',
-    0x5305: 'bāo,páo,fú',
-    0x5306: 'cōng',
-    0x5307: 'yì',
-    0x5308: 'xiōng',
-    0x5309: 'pēng',
-    0x530A: 'jū',
-    0x530B: 'táo,yáo',
-    0x530C: 'gé',
-    0x530D: 'pú',
-    0x530E: 'è',
-    0x530F: 'páo',
-    0x5310: 'fú',
-    0x5311: 'gōng',
-    0x5312: 'dá',
-    0x5313: 'jiù',
-    0x5314: 'gōng',
-    0x5315: 'bǐ,pìn',
-    0x5316: 'huà,huā,huò',
-    0x5317: 'běi,bèi',
-    0x5318: 'nǎo',
-    0x5319: 'shi,chí',
-    0x531A: 'fāng,fàng',
-    0x531B: 'jiù',
-    0x531C: 'yí',
-    0x531D: 'zā',
-    0x531E: 'jiàng',
-    0x531F: 'kàng',
-    0x5320: 'jiàng',
-    0x5321: 'kuāng,wāng',
-    0x5322: 'hū',
-    0x5323: 'xiá',
-    0x5324: 'qū',
-    0x5325: 'fán',
-    0x5326: 'guǐ',
-    0x5327: 'qiè',
-    0x5328: 'zāng,cáng',
-    0x5329: 'kuāng',
-    0x532A: 'fěi,fēi,fēn',
-    0x532B: 'hū',
-    0x532C: 'yǔ',
-    0x532D: 'guǐ',
-    0x532E: 'kuì,guì',
-    0x532F: 'huì',
-    0x5330: 'dān',
-    0x5331: 'guì,kuì',
-    0x5332: 'lián',
-    0x5333: 'lián',
-    0x5334: 'suǎn',
-    0x5335: 'dú',
-    0x5336: 'jiù',
-    0x5337: 'jué',
-    0x5338: 'xì',
-    0x5339: 'pǐ',
-    0x533A: 'qū,ōu',
-    0x533B: 'yī,yì',
-    0x533C: 'kē,ē,ǎn',
-    0x533D: 'yǎn,yàn',
-    0x533E: 'biǎn',
-    0x533F: 'nì,tè',
-    0x5340: 'qū,ōu,gōu,qiū,kòu',
-    0x5341: 'shí',
-    0x5342: 'xùn',
-    0x5343: 'qiān',
-    0x5344: 'niàn',
-    0x5345: 'sà',
-    0x5346: 'zú',
-    0x5347: 'shēng',
-    0x5348: 'wǔ',
-    0x5349: 'huì',
-    0x534A: 'bàn,pàn',
-    0x534B: 'shì',
-    0x534C: 'xì',
-    0x534D: 'wàn',
-    0x534E: 'huá,huà,huā',
-    0x534F: 'xié',
-    0x5350: 'wàn',
-    0x5351: 'bēi,bǐ,bì,pí,bān',
-    0x5352: 'zú,cù,cuì',
-    0x5353: 'zhuó,zhuō',
-    0x5354: 'xié',
-    0x5355: 'dān,chán,shàn',
-    0x5356: 'mài',
-    0x5357: 'nán,nā',
-    0x5358: 'dān',
-    0x5359: 'jí,chì',
-    0x535A: 'bó',
-    0x535B: 'shuài',
-    0x535C: 'bo,bǔ,pū',
-    0x535D: 'kuàng,guàn',
-    0x535E: 'biàn,pán',
-    0x535F: 'bǔ,jī',
-    0x5360: 'zhàn,zhān,tiē',
-    0x5361: 'kǎ,qiǎ',
-    0x5362: 'lú',
-    0x5363: 'yǒu',
-    0x5364: 'lǔ,xī',
-    0x5365: 'xī',
-    0x5366: 'guà',
-    0x5367: 'wò',
-    0x5368: 'xiè',
-    0x5369: 'jié',
-    0x536A: 'jié',
-    0x536B: 'wèi',
-    0x536C: 'áng,yǎng',
-    0x536D: 'qióng',
-    0x536E: 'zhī',
-    0x536F: 'mǎo',
-    0x5370: 'yìn,yì',
-    0x5371: 'wēi',
-    0x5372: 'shào',
-    0x5373: 'jí',
-    0x5374: 'què',
-    0x5375: 'luǎn,kūn',
-    0x5376: 'chǐ',
-    0x5377: 'juǎn,juàn,quán,quān,gǔn,jùn',
-    0x5378: 'xiè',
-    0x5379: 'xù,sū',
-    0x537A: 'jǐn',
-    0x537B: 'què,jiǎo,xì',
-    0x537C: 'wù',
-    0x537D: 'jí',
-    0x537E: 'è',
-    0x537F: 'qīng',
-    0x5380: 'xī',
-    0x5381: 'sān',
-    0x5382: 'chǎng,hǎn,yán,ān',
-    0x5383: 'wěi,yán',
-    0x5384: 'è,ě',
-    0x5385: 'tīng',
-    0x5386: 'lì',
-    0x5387: 'zhé,zhái',
-    0x5388: 'hǎn,àn',
-    0x5389: 'lì',
-    0x538A: 'yǎ',
-    0x538B: 'yā,yà',
-    0x538C: 'yàn',
-    0x538D: 'shè',
-    0x538E: 'dǐ,zhǐ',
-    0x538F: 'zhǎ,zhǎi',
-    0x5390: 'páng',
-    0x5391: 'yá',
-    0x5392: 'qiè',
-    0x5393: 'yá,ái',
-    0x5394: 'zhì,shī',
-    0x5395: 'cè,si',
-    0x5396: 'páng,máng',
-    0x5397: 'tí',
-    0x5398: 'lí,chán',
-    0x5399: 'shè',
-    0x539A: 'hòu',
-    0x539B: 'tīng',
-    0x539C: 'zuī',
-    0x539D: 'cuò,jí',
-    0x539E: 'fèi',
-    0x539F: 'yuán',
-    0x53A0: 'cè',
-    0x53A1: 'yuán',
-    0x53A2: 'xiāng',
-    0x53A3: 'yǎn',
-    0x53A4: 'lì',
-    0x53A5: 'jué',
-    0x53A6: 'shà,xià',
-    0x53A7: 'diān',
-    0x53A8: 'chú',
-    0x53A9: 'jiù',
-    0x53AA: 'jǐn',
-    0x53AB: 'áo',
-    0x53AC: 'guǐ',
-    0x53AD: 'yàn,yā,yǎn,yān,yì',
-    0x53AE: 'sī',
-    0x53AF: 'lì',
-    0x53B0: 'chǎng',
-    0x53B1: 'lán,qiān',
-    0x53B2: 'lì,lài',
-    0x53B3: 'yán',
-    0x53B4: 'yǎn',
-    0x53B5: 'yuán',
-    0x53B6: 'sī,mǒu',
-    0x53B7: 'gōng,hóng',
-    0x53B8: 'lín,min',
-    0x53B9: 'róu,qiú',
-    0x53BA: 'qù',
-    0x53BB: 'qù,qū',
-    0x53BC: 'ěr',
-    0x53BD: 'lěi',
-    0x53BE: 'dū,dǔ',
-    0x53BF: 'xiàn',
-    0x53C0: 'zhuān,huì',
-    0x53C1: 'sān',
-    0x53C2: 'cān,cēn,shēn',
-    0x53C3: 'cān,shēn,sān,cēn,càn,sǎn',
-    0x53C4: 'cān',
-    0x53C5: 'cān',
-    0x53C6: 'ài',
-    0x53C7: 'dài',
-    0x53C8: 'yòu',
-    0x53C9: 'chā,chá,chǎ,chà',
-    0x53CA: 'jí',
-    0x53CB: 'yǒu',
-    0x53CC: 'shuāng',
-    0x53CD: 'fǎn,fàn',
-    0x53CE: 'shōu',
-    0x53CF: 'guài',
-    0x53D0: 'bá',
-    0x53D1: 'fā,fà',
-    0x53D2: 'ruò',
-    0x53D3: 'shì,lì',
-    0x53D4: 'shū',
-    0x53D5: 'zhuó,yǐ,lì,jué',
-    0x53D6: 'qǔ,qū',
-    0x53D7: 'shòu,dào',
-    0x53D8: 'biàn',
-    0x53D9: 'xù',
-    0x53DA: 'jiǎ,xiá',
-    0x53DB: 'pàn',
-    0x53DC: 'sǒu',
-    0x53DD: 'jí',
-    0x53DE: 'wèi',
-    0x53DF: 'sǒu,sōu,xiāo',
-    0x53E0: 'dié',
-    0x53E1: 'ruì',
-    0x53E2: 'cóng',
-    0x53E3: 'kǒu',
-    0x53E4: 'gǔ,gù,kū',
-    0x53E5: 'jù,gōu,gòu,qú',
-    0x53E6: 'lìng',
-    0x53E7: 'guǎ',
-    0x53E8: 'dāo,dáo,tāo',
-    0x53E9: 'kòu',
-    0x53EA: 'zhǐ,zhī',
-    0x53EB: 'jiào',
-    0x53EC: 'zhào,shào',
-    0x53ED: 'bā,pā,ba',
-    0x53EE: 'dīng',
-    0x53EF: 'kě,kè,gē',
-    0x53F0: 'tái,tāi,yí,sì',
-    0x53F1: 'chì,huà,é',
-    0x53F2: 'shǐ',
-    0x53F3: 'yòu',
-    0x53F4: 'qiú',
-    0x53F5: 'pǒ',
-    0x53F6: 'yè,xié',
-    0x53F7: 'hào,háo,xiāo',
-    0x53F8: 'sī,cí,sì',
-    0x53F9: 'tàn,yǐ,yòu',
-    0x53FA: 'chǐ',
-    0x53FB: 'lè,lì',
-    0x53FC: 'diāo',
-    0x53FD: 'jī,jiào',
-    0x53FE: 'liǎo',
-    0x53FF: 'hōng,hóng',
-    0x5400: 'miē',
-    0x5401: 'xū,yū,yù',
-    0x5402: 'máng,màng',
-    0x5403: 'chī,qī',
-    0x5404: 'gè,gě',
-    0x5405: 'xuān,sòng',
-    0x5406: 'yāo',
-    0x5407: 'zǐ,jí',
-    0x5408: 'hé,gě',
-    0x5409: 'jí',
-    0x540A: 'diào',
-    0x540B: 'cùn,dòu,yīng',
-    0x540C: 'tóng,tòng',
-    0x540D: 'míng,mìng',
-    0x540E: 'hòu',
-    0x540F: 'lì',
-    0x5410: 'tǔ,tù',
-    0x5411: 'xiàng',
-    0x5412: 'zhā,zhà',
-    0x5413: 'xià,hè,hà',
-    0x5414: 'yě,yē',
-    0x5415: 'lǚ',
-    0x5416: 'yā,ā',
-    0x5417: 'ma,má,mǎ',
-    0x5418: 'ǒu',
-    0x5419: 'huō',
-    0x541A: 'yī,xī',
-    0x541B: 'jūn',
-    0x541C: 'chǒu',
-    0x541D: 'lìn',
-    0x541E: 'tūn,tiān',
-    0x541F: 'yín,yǐn,jìn',
-    0x5420: 'fèi',
-    0x5421: 'bǐ,bì,pǐ',
-    0x5422: 'qìn',
-    0x5423: 'qìn',
-    0x5424: 'jiè,gè,xiè',
-    0x5425: 'bù,pōu',
-    0x5426: 'fǒu,pǐ',
-    0x5427: 'ba,bā,pā',
-    0x5428: 'dūn,tún,tǔn',
-    0x5429: 'fēn,pèn',
-    0x542A: 'é,huā',
-    0x542B: 'hán,hàn',
-    0x542C: 'tīng,yǐn,yí',
-    0x542D: 'kēng,háng,hàng',
-    0x542E: 'shǔn',
-    0x542F: 'qǐ',
-    0x5430: 'hóng',
-    0x5431: 'zhī,zī,qì',
-    0x5432: 'yǐn,shěn',
-    0x5433: 'wú,yú',
-    0x5434: 'wú,tūn',
-    0x5435: 'chǎo,chāo,miǎo,chào',
-    0x5436: 'nà',
-    0x5437: 'xuè,chuò,jué',
-    0x5438: 'xī',
-    0x5439: 'chuī,chuì',
-    0x543A: 'dōu,rú',
-    0x543B: 'wěn',
-    0x543C: 'hǒu',
-    0x543D: 'hōng,ōu,hǒu',
-    0x543E: 'wú,yú,yá',
-    0x543F: 'gào',
-    0x5440: 'ya,yā,xiā',
-    0x5441: 'jùn',
-    0x5442: 'lǚ',
-    0x5443: 'è,e,ài',
-    0x5444: 'gé',
-    0x5445: 'méi,wěn',
-    0x5446: 'dāi,bǎo,ái',
-    0x5447: 'qǐ,mèn',
-    0x5448: 'chéng,kuáng,chěng',
-    0x5449: 'wú',
-    0x544A: 'gào,jū,gù',
-    0x544B: 'fū',
-    0x544C: 'jiào',
-    0x544D: 'hōng',
-    0x544E: 'chǐ,yīng',
-    0x544F: 'shēng',
-    0x5450: 'nà,nè,na,nuò,ne',
-    0x5451: 'tūn',
-    0x5452: 'wǔ,ḿ',
-    0x5453: 'yì',
-    0x5454: 'dāi,tǎi',
-    0x5455: 'ǒu,ōu,òu',
-    0x5456: 'lì',
-    0x5457: 'bei,bài',
-    0x5458: 'yuán,yùn,yún',
-    0x5459: 'guō',
-    0x545A: 'wen',
-    0x545B: 'qiāng,qiàng',
-    0x545C: 'wū',
-    0x545D: 'è',
-    0x545E: 'shī',
-    0x545F: 'juǎn',
-    0x5460: 'pěn',
-    0x5461: 'wěn,mǐn',
-    0x5462: 'ne,ní,nǐ,nī',
-    0x5463: 'ḿ,m̀,móu',
-    0x5464: 'lìng,líng',
-    0x5465: 'rán',
-    0x5466: 'yōu',
-    0x5467: 'dǐ',
-    0x5468: 'zhōu',
-    0x5469: 'shì',
-    0x546A: 'zhòu',
-    0x546B: 'tiè,chè',
-    0x546C: 'xì,chì',
-    0x546D: 'yì',
-    0x546E: 'qì,zhī',
-    0x546F: 'píng',
-    0x5470: 'zǐ,cī,jī,xì',
-    0x5471: 'gū,guā,guǎ',
-    0x5472: 'cī,cí,zī',
-    0x5473: 'wèi,mèi',
-    0x5474: 'xǔ,hǒu,hōu,gòu,gōu,gū',
-    0x5475: 'hē,hā,ā,a,kē,huō,á,à',
-    0x5476: 'náo,ná,nǔ',
-    0x5477: 'gā,xiā,jiǎ',
-    0x5478: 'pēi',
-    0x5479: 'yì,chì',
-    0x547A: 'xiāo,háo',
-    0x547B: 'shēn',
-    0x547C: 'hū,xiāo,xū,hè,xià',
-    0x547D: 'mìng',
-    0x547E: 'dá,yà,tǎ,dàn',
-    0x547F: 'qù,kā',
-    0x5480: 'jǔ,zuǐ',
-    0x5481: 'hán,xián,gàn',
-    0x5482: 'zā',
-    0x5483: 'tuō',
-    0x5484: 'duō',
-    0x5485: 'pǒu',
-    0x5486: 'páo',
-    0x5487: 'bié,bì',
-    0x5488: 'fú',
-    0x5489: 'yāng,yǎng',
-    0x548A: 'hé',
-    0x548B: 'zǎ,zé,zhā,zhà',
-    0x548C: 'hé,hè,hú,huó,huò,huo',
-    0x548D: 'hāi,tāi',
-    0x548E: 'jiù,gāo',
-    0x548F: 'yǒng',
-    0x5490: 'fù,fú',
-    0x5491: 'dā',
-    0x5492: 'zhòu',
-    0x5493: 'wǎ',
-    0x5494: 'kā,kǎ,nòng',
-    0x5495: 'gū,gu',
-    0x5496: 'kā,gā,jiā',
-    0x5497: 'zuo',
-    0x5498: 'bù',
-    0x5499: 'lóng',
-    0x549A: 'dōng',
-    0x549B: 'níng',
-    0x549C: 'ta',
-    0x549D: 'sī',
-    0x549E: 'xiàn,xián',
-    0x549F: 'huò',
-    0x54A0: 'qì',
-    0x54A1: 'èr,ér',
-    0x54A2: 'è',
-    0x54A3: 'guāng,gōng',
-    0x54A4: 'zhà',
-    0x54A5: 'xì,xī,dié,zhì',
-    0x54A6: 'yí,xī',
-    0x54A7: 'liě,liē,liè,lié,lie',
-    0x54A8: 'zī',
-    0x54A9: 'miē,mie',
-    0x54AA: 'mī,mǐ,miē,mǎi',
-    0x54AB: 'zhǐ',
-    0x54AC: 'yǎo,jiāo,yāo,jiǎo',
-    0x54AD: 'jī,xī,qià',
-    0x54AE: 'zhòu,zhù,zhū,rú',
-    0x54AF: 'gē,kǎ,lo,luò,kā',
-    0x54B0: 'shù,xún',
-    0x54B1: 'zán,zá,zǎ,zan',
-    0x54B2: 'xiào',
-    0x54B3: 'ké,hāi,hái,gāi',
-    0x54B4: 'huī,hái',
-    0x54B5: 'kuǎ',
-    0x54B6: 'huài,shì,guō,guā,huà',
-    0x54B7: 'táo,tiào',
-    0x54B8: 'xián,jiǎn,jiān',
-    0x54B9: 'è,àn,ń',
-    0x54BA: 'xuǎn,xuān',
-    0x54BB: 'xiū,xǔ,xiāo,xù',
-    0x54BC: 'guō,wāi,hé,wǒ,wō,guǎ',
-    0x54BD: 'yàn,yān,yè,yuān',
-    0x54BE: 'lǎo',
-    0x54BF: 'yī',
-    0x54C0: 'āi',
-    0x54C1: 'pǐn',
-    0x54C2: 'shěn',
-    0x54C3: 'tóng',
-    0x54C4: 'hǒng,hōng,hòng',
-    0x54C5: 'xiōng,hōng',
-    0x54C6: 'duō,chǐ,zhà,chì,duò,diě',
-    0x54C7: 'wa,wā,guī,huá,wá',
-    0x54C8: 'hā,hǎ,hà,hē,hé,tà,shà',
-    0x54C9: 'zāi',
-    0x54CA: 'yòu',
-    0x54CB: 'diè,dì',
-    0x54CC: 'pài,gū',
-    0x54CD: 'xiǎng',
-    0x54CE: 'āi',
-    0x54CF: 'gén,hěn,ǹ',
-    0x54D0: 'kuāng,qiāng',
-    0x54D1: 'yǎ,yā',
-    0x54D2: 'dá,dā',
-    0x54D3: 'xiāo',
-    0x54D4: 'bì',
-    0x54D5: 'huì,yuě',
-    0x54D6: 'nián',
-    0x54D7: 'huā,huá',
-    0x54D8: 'xing',
-    0x54D9: 'kuài',
-    0x54DA: 'duǒ',
-    0x54DB: 'fēn',
-    0x54DC: 'jì',
-    0x54DD: 'nóng',
-    0x54DE: 'mōu',
-    0x54DF: 'yō,yo',
-    0x54E0: 'hào',
-    0x54E1: 'yuán,yún,yùn',
-    0x54E2: 'lòng',
-    0x54E3: 'pǒu',
-    0x54E4: 'máng',
-    0x54E5: 'gē',
-    0x54E6: 'ó,é,ò',
-    0x54E7: 'chī,xià,hè',
-    0x54E8: 'shào,sāo,xiāo,xiào,sào',
-    0x54E9: 'lī,li,lì,lǐ,mái,yīng',
-    0x54EA: 'nǎ,na,né,nuó,nǎi,nà,niè,něi',
-    0x54EB: 'zú',
-    0x54EC: 'hé',
-    0x54ED: 'kū',
-    0x54EE: 'xiāo,xiào,xuē',
-    0x54EF: 'xiàn',
-    0x54F0: 'láo',
-    0x54F1: 'bō,pò,bèi,bā,bó',
-    0x54F2: 'zhé',
-    0x54F3: 'zhā',
-    0x54F4: 'liàng,láng',
-    0x54F5: 'bā',
-    0x54F6: 'miē',
-    0x54F7: 'liè,lǜ',
-    0x54F8: 'suī',
-    0x54F9: 'fú',
-    0x54FA: 'bǔ,bū,fǔ',
-    0x54FB: 'hān',
-    0x54FC: 'hēng,hng',
-    0x54FD: 'gěng,yǐng,yìng,ńg,ń',
-    0x54FE: 'shuō,yuè',
-    0x54FF: 'gě',
-    0x5500: 'yòu',
-    0x5501: 'yàn',
-    0x5502: 'gū',
-    0x5503: 'gǔ',
-    0x5504: 'bei,bài',
-    0x5505: 'hán',
-    0x5506: 'suō,shuà',
-    0x5507: 'chún,zhēn,zhèn',
-    0x5508: 'yì',
-    0x5509: 'āi,ài,ǎi',
-    0x550A: 'jiá,qiǎn',
-    0x550B: 'tū',
-    0x550C: 'xián,yán,dàn',
-    0x550D: 'wǎn',
-    0x550E: 'lì',
-    0x550F: 'xī,xiè',
-    0x5510: 'táng',
-    0x5511: 'zuò,shì',
-    0x5512: 'qiú',
-    0x5513: 'chē',
-    0x5514: 'wú,wù,ńg,ḿ,ń',
-    0x5515: 'zào',
-    0x5516: 'yǎ',
-    0x5517: 'dōu',
-    0x5518: 'qǐ',
-    0x5519: 'dí',
-    0x551A: 'qìn,qīn',
-    0x551B: 'mà,mài',
-    0x551C: 'mò',
-    0x551D: 'gòng,hǒng',
-    0x551E: 'dǒu',
-    0x551F: 'qù',
-    0x5520: 'láo,lào',
-    0x5521: 'liǎng,yīng',
-    0x5522: 'suǒ',
-    0x5523: 'zào',
-    0x5524: 'huàn',
-    0x5525: 'lang',
-    0x5526: 'shā',
-    0x5527: 'jī,jié',
-    0x5528: 'zǔ',
-    0x5529: 'wō,wěi',
-    0x552A: 'fěng,běng',
-    0x552B: 'jìn,yín',
-    0x552C: 'hǔ,xiāo,guó,xià,háo',
-    0x552D: 'qì',
-    0x552E: 'shòu,shú',
-    0x552F: 'wéi,wěi',
-    0x5530: 'shuā',
-    0x5531: 'chàng',
-    0x5532: 'ér,wā',
-    0x5533: 'lì',
-    0x5534: 'qiàng',
-    0x5535: 'ǎn,ng,n',
-    0x5536: 'zé,jiè',
-    0x5537: 'yō,yù',
-    0x5538: 'niàn,diàn',
-    0x5539: 'yū',
-    0x553A: 'tiǎn',
-    0x553B: 'lài,lái',
-    0x553C: 'shà,qiè',
-    0x553D: 'xī',
-    0x553E: 'tuò',
-    0x553F: 'hū',
-    0x5540: 'ái',
-    0x5541: 'zhāo,zhōu,dāo,tiáo,diào',
-    0x5542: 'nǒu',
-    0x5543: 'kěn',
-    0x5544: 'zhuó,zhòu',
-    0x5545: 'zhuó,zhào',
-    0x5546: 'shāng',
-    0x5547: 'dì,shì,zhāi',
-    0x5548: 'hēng,hèng,è,zá',
-    0x5549: 'lín,lán,lèn',
-    0x554A: 'a,ā,á,ǎ,à,è',
-    0x554B: 'cǎi,cāi,xiāo',
-    0x554C: 'xiāng,qiāng',
-    0x554D: 'tūn,zhūn,xiāng,tuī,duǐ',
-    0x554E: 'wǔ',
-    0x554F: 'wèn',
-    0x5550: 'cuì,zú,zá,è,chuài',
-    0x5551: 'shà,zā,jié,dié,tì',
-    0x5552: 'gǔ',
-    0x5553: 'qǐ',
-    0x5554: 'qǐ',
-    0x5555: 'táo',
-    0x5556: 'dàn',
-    0x5557: 'dàn',
-    0x5558: 'yè,wā',
-    0x5559: 'zǐ,cī',
-    0x555A: 'bǐ,tú',
-    0x555B: 'cuì',
-    0x555C: 'chuài,chuò,zhuó',
-    0x555D: 'hé',
-    0x555E: 'yǎ,è,yā',
-    0x555F: 'qǐ',
-    0x5560: 'zhé',
-    0x5561: 'fēi,pèi,pái,pēi,bài',
-    0x5562: 'liǎng,yīng',
-    0x5563: 'xián',
-    0x5564: 'pí',
-    0x5565: 'shá,shà',
-    0x5566: 'la,lā',
-    0x5567: 'zé',
-    0x5568: 'yīng,qíng',
-    0x5569: 'guà',
-    0x556A: 'pā',
-    0x556B: 'zhě',
-    0x556C: 'sè',
-    0x556D: 'zhuàn',
-    0x556E: 'niè',
-    0x556F: 'guō',
-    0x5570: 'luō,luó,luo',
-    0x5571: 'yán',
-    0x5572: 'dī',
-    0x5573: 'quán,jué',
-    0x5574: 'chǎn,tān',
-    0x5575: 'bō,bo',
-    0x5576: 'dìng',
-    0x5577: 'lāng',
-    0x5578: 'xiào',
-    0x5579: 'jú',
-    0x557A: 'táng',
-    0x557B: 'chì,dì',
-    0x557C: 'tí',
-    0x557D: 'án,ān',
-    0x557E: 'jiū',
-    0x557F: 'dàn',
-    0x5580: 'kā,kè,ke',
-    0x5581: 'yóng,yú',
-    0x5582: 'wèi',
-    0x5583: 'nán,nǎn',
-    0x5584: 'shàn',
-    0x5585: 'yù',
-    0x5586: 'zhé',
-    0x5587: 'lǎ,lá,lā,la',
-    0x5588: 'jiē,xiè',
-    0x5589: 'hóu',
-    0x558A: 'hǎn,kàn,jiān',
-    0x558B: 'dié,zhá,qiè',
-    0x558C: 'zhōu',
-    0x558D: 'chái',
-    0x558E: 'wāi',
-    0x558F: 'nuò,rě',
-    0x5590: 'yù',
-    0x5591: 'yīn,yǐn,yìn',
-    0x5592: 'zá,zǎn,zán,zà,zan',
-    0x5593: 'yāo',
-    0x5594: 'ō,wō,wū,o,ò',
-    0x5595: 'miǎn',
-    0x5596: 'hú',
-    0x5597: 'yǔn',
-    0x5598: 'chuǎn',
-    0x5599: 'huì,zhòu',
-    0x559A: 'huàn',
-    0x559B: 'huàn,yuán,xuǎn,hé',
-    0x559C: 'xǐ,xī,chì',
-    0x559D: 'hē,hè,yè,kài',
-    0x559E: 'jī',
-    0x559F: 'kuì,huài',
-    0x55A0: 'zhǒng,chǒng',
-    0x55A1: 'wéi,wèi',
-    0x55A2: 'shà,chè',
-    0x55A3: 'xǔ',
-    0x55A4: 'huáng',
-    0x55A5: 'duó,zhà',
-    0x55A6: 'niè,yì',
-    0x55A7: 'xuān,xuǎn',
-    0x55A8: 'liàng',
-    0x55A9: 'yù',
-    0x55AA: 'sàng,sāng',
-    0x55AB: 'chī,kài',
-    0x55AC: 'qiáo,jiǎo',
-    0x55AD: 'yàn,yǎn',
-    0x55AE: 'dān,dǎn,chán,shàn,chǎn,dàn,zhàn,tán',
-    0x55AF: 'pèn,bēn',
-    0x55B0: 'cān,sūn,qī',
-    0x55B1: 'lí',
-    0x55B2: 'yō,yo',
-    0x55B3: 'zhā,chā,zha',
-    0x55B4: 'wēi',
-    0x55B5: 'miāo',
-    0x55B6: 'yíng',
-    0x55B7: 'pēn,pèn',
-    0x55B8: 'bǔ',
-    0x55B9: 'kuí',
-    0x55BA: 'xí',
-    0x55BB: 'yù,yú',
-    0x55BC: 'jiē',
-    0x55BD: 'lóu,lou',
-    0x55BE: 'kù',
-    0x55BF: 'zào,qiāo',
-    0x55C0: 'hù',
-    0x55C1: 'tí',
-    0x55C2: 'yáo',
-    0x55C3: 'hè,xiāo,xiào,hù',
-    0x55C4: 'á,shà,a,xià',
-    0x55C5: 'xiù',
-    0x55C6: 'qiāng,qiàng,chéng',
-    0x55C7: 'sè',
-    0x55C8: 'yōng',
-    0x55C9: 'sù',
-    0x55CA: 'hǒng,gǒng,gòng',
-    0x55CB: 'xié',
-    0x55CC: 'ài,yì,wò',
-    0x55CD: 'suō,shuò',
-    0x55CE: 'ma,mà,má,mǎ',
-    0x55CF: 'chā',
-    0x55D0: 'hài',
-    0x55D1: 'kē,kè,hé,xiá',
-    0x55D2: 'dā,tà,da',
-    0x55D3: 'sǎng',
-    0x55D4: 'chēn,tián',
-    0x55D5: 'rù',
-    0x55D6: 'sōu,sù,sòu',
-    0x55D7: 'wā,gū',
-    0x55D8: 'jī',
-    0x55D9: 'pǎng,bēng,bàng',
-    0x55DA: 'wū,wù',
-    0x55DB: 'qiǎn,xián,qiàn,qiān,qiè',
-    0x55DC: 'shì',
-    0x55DD: 'gé',
-    0x55DE: 'zī',
-    0x55DF: 'jiē,jiè,juē',
-    0x55E0: 'lào',
-    0x55E1: 'wēng,wěng',
-    0x55E2: 'wà',
-    0x55E3: 'sì',
-    0x55E4: 'chī',
-    0x55E5: 'háo',
-    0x55E6: 'suo,suō',
-    0x55E8: 'hāi,hēi',
-    0x55E9: 'suǒ',
-    0x55EA: 'qín',
-    0x55EB: 'niè',
-    0x55EC: 'hē',
-    0x55ED: 'zhí',
-    0x55EE: 'sài',
-    0x55EF: 'ń,ńg,ňg,ǹg,ň,ǹ',
-    0x55F0: 'gě',
-    0x55F1: 'ná',
-    0x55F2: 'diē,diǎ',
-    0x55F3: 'āi,ǎi,ài',
-    0x55F4: 'qiāng',
-    0x55F5: 'tōng',
-    0x55F6: 'bì',
-    0x55F7: 'áo',
-    0x55F8: 'áo',
-    0x55F9: 'lián',
-    0x55FA: 'zuī,suī,zuǐ',
-    0x55FB: 'zhē,zhè,zhù,zhe',
-    0x55FC: 'mò',
-    0x55FD: 'sòu,shuò,shù',
-    0x55FE: 'sǒu',
-    0x55FF: 'tǎn',
-    0x5600: 'dí,zhé,dī',
-    0x5601: 'qī,zú,zā',
-    0x5602: 'jiào',
-    0x5603: 'chōng',
-    0x5604: 'jiāo,jiào,dǎo',
-    0x5605: 'kǎi,kài,gé',
-    0x5606: 'tàn',
-    0x5607: 'shān,càn,shěn',
-    0x5608: 'cáo',
-    0x5609: 'jiā',
-    0x560A: 'ái',
-    0x560B: 'xiào',
-    0x560C: 'piào,piāo',
-    0x560D: 'lóu,lǒu,lou',
-    0x560E: 'gā,gá,gǎ',
-    0x560F: 'gǔ,jiǎ',
-    0x5610: 'xiāo,jiāo,láo,bào,miù',
-    0x5611: 'hū,hù',
-    0x5612: 'huì',
-    0x5613: 'guō',
-    0x5614: 'ǒu,ōu,òu,xū,chū,ou',
-    0x5615: 'xiān',
-    0x5616: 'zé',
-    0x5617: 'cháng',
-    0x5618: 'xū,shī',
-    0x5619: 'pó',
-    0x561A: 'dē,dēi,dé,dāi',
-    0x561B: 'ma,má',
-    0x561C: 'mà',
-    0x561D: 'hú',
-    0x561E: 'lei,lē',
-    0x561F: 'dū',
-    0x5620: 'gā',
-    0x5621: 'tāng',
-    0x5622: 'yě',
-    0x5623: 'bēng',
-    0x5624: 'yīng',
-    0x5625: 'sāi',
-    0x5626: 'jiào',
-    0x5627: 'mì',
-    0x5628: 'xiào',
-    0x5629: 'huā,huá',
-    0x562A: 'mǎi',
-    0x562B: 'rán',
-    0x562C: 'chuài,zuō',
-    0x562D: 'pēng',
-    0x562E: 'láo,chāo,lào,xiāo',
-    0x562F: 'xiào,chì',
-    0x5630: 'jī',
-    0x5631: 'zhǔ',
-    0x5632: 'cháo,zhāo',
-    0x5633: 'kuì',
-    0x5634: 'zuǐ',
-    0x5635: 'xiāo',
-    0x5636: 'sī',
-    0x5637: 'háo',
-    0x5638: 'fǔ,wǔ,m̄,ḿ',
-    0x5639: 'liáo,liào',
-    0x563A: 'qiáo,qiào',
-    0x563B: 'xī',
-    0x563C: 'chù,xù,shòu',
-    0x563D: 'chǎn,tān,chān,tuō,dǎn',
-    0x563E: 'dàn,tán',
-    0x563F: 'hēi,mò,mù',
-    0x5640: 'xùn',
-    0x5641: 'ě,wù,wò',
-    0x5642: 'zǔn',
-    0x5643: 'fān,bo',
-    0x5644: 'chī',
-    0x5645: 'huī',
-    0x5646: 'zǎn,cǎn',
-    0x5647: 'chuáng',
-    0x5648: 'cù,zā,hé',
-    0x5649: 'dàn',
-    0x564A: 'yù',
-    0x564B: 'tūn,kuò',
-    0x564C: 'cēng,chēng',
-    0x564D: 'jiào,jiāo,jiū',
-    0x564E: 'yē,yì,shà',
-    0x564F: 'xī',
-    0x5650: 'qì',
-    0x5651: 'háo',
-    0x5652: 'lián',
-    0x5653: 'xū',
-    0x5654: 'dēng',
-    0x5655: 'huī',
-    0x5656: 'yín',
-    0x5657: 'pū',
-    0x5658: 'juē',
-    0x5659: 'qín',
-    0x565A: 'xún',
-    0x565B: 'niè',
-    0x565C: 'lū',
-    0x565D: 'sī',
-    0x565E: 'yǎn',
-    0x565F: 'yìng',
-    0x5660: 'dā,dá',
-    0x5661: 'zhān,dān',
-    0x5662: 'ō,yǔ,yù,ào',
-    0x5663: 'zhòu,zhuó,zhú,dú',
-    0x5664: 'jìn',
-    0x5665: 'nóng,náng',
-    0x5666: 'yuě,huì',
-    0x5667: 'xiè',
-    0x5668: 'qì',
-    0x5669: 'è',
-    0x566A: 'zào',
-    0x566B: 'yī,ǎi,yì',
-    0x566C: 'shì',
-    0x566D: 'jiào,qiào,chī',
-    0x566E: 'yuàn',
-    0x566F: 'āi,ǎi,ài',
-    0x5670: 'yōng,yǒng',
-    0x5671: 'jué,xué',
-    0x5672: 'kuài,guài,kuò,wèi',
-    0x5673: 'yǔ',
-    0x5674: 'pēn,pèn,fèn',
-    0x5675: 'dào',
-    0x5676: 'gá,gé',
-    0x5677: 'hm,xīn,hēn',
-    0x5678: 'dūn',
-    0x5679: 'dāng',
-    0x567A: 'xīn',
-    0x567B: 'sāi',
-    0x567C: 'pī',
-    0x567D: 'pǐ',
-    0x567E: 'yīn',
-    0x567F: 'zuǐ',
-    0x5680: 'níng',
-    0x5681: 'dí',
-    0x5682: 'làn,hǎn',
-    0x5683: 'tā,tà',
-    0x5684: 'huō,huò,wò,ǒ',
-    0x5685: 'rú',
-    0x5686: 'hāo',
-    0x5687: 'xià,hè',
-    0x5688: 'yè',
-    0x5689: 'duō',
-    0x568A: 'pì,xì,xiù',
-    0x568B: 'chóu,zhōu',
-    0x568C: 'jì,jiē,zhāi',
-    0x568D: 'jìn',
-    0x568E: 'háo',
-    0x568F: 'tì',
-    0x5690: 'cháng',
-    0x5691: 'xūn',
-    0x5692: 'mē',
-    0x5693: 'cā,chā',
-    0x5694: 'tì,zhì',
-    0x5695: 'lǔ,lū',
-    0x5696: 'huì',
-    0x5697: 'bó,pào,bào',
-    0x5698: 'yōu',
-    0x5699: 'niè,yǎo',
-    0x569A: 'yín',
-    0x569B: 'hù,yo',
-    0x569C: 'me,mèi,ma',
-    0x569D: 'hōng',
-    0x569E: 'zhé',
-    0x569F: 'lí',
-    0x56A0: 'liú',
-    0x56A1: 'hai',
-    0x56A2: 'náng',
-    0x56A3: 'xiāo,áo',
-    0x56A4: 'mó',
-    0x56A5: 'yàn',
-    0x56A6: 'lì',
-    0x56A7: 'lú',
-    0x56A8: 'lóng',
-    0x56A9: 'mó',
-    0x56AA: 'dàn',
-    0x56AB: 'chèn',
-    0x56AC: 'pín',
-    0x56AD: 'pǐ',
-    0x56AE: 'xiàng,xiǎng',
-    0x56AF: 'huò,xuè',
-    0x56B0: 'mó',
-    0x56B1: 'xì',
-    0x56B2: 'duǒ',
-    0x56B3: 'kù',
-    0x56B4: 'yán,yǎn',
-    0x56B5: 'chán,chān',
-    0x56B6: 'yīng',
-    0x56B7: 'rǎng,rāng',
-    0x56B8: 'diǎn',
-    0x56B9: 'lá,la',
-    0x56BA: 'tà',
-    0x56BB: 'xiāo',
-    0x56BC: 'jué,jiáo,jiào',
-    0x56BD: 'chuò',
-    0x56BE: 'huān,huàn',
-    0x56BF: 'huò',
-    0x56C0: 'zhuàn',
-    0x56C1: 'niè,zhé',
-    0x56C2: 'xiāo,áo',
-    0x56C3: 'cà,zhā,zǎ',
-    0x56C4: 'lí',
-    0x56C5: 'chǎn',
-    0x56C6: 'chài',
-    0x56C7: 'lì',
-    0x56C8: 'yì',
-    0x56C9: 'luō,luó,luo',
-    0x56CA: 'náng,nāng',
-    0x56CB: 'zá,zàn,cān',
-    0x56CC: 'sū',
-    0x56CD: 'xǐ',
-    0x56CE: 'zen',
-    0x56CF: 'jiān',
-    0x56D0: 'zá,niè,yàn,è',
-    0x56D1: 'zhǔ',
-    0x56D2: 'lán',
-    0x56D3: 'niè',
-    0x56D4: 'nāng,nang',
-    0x56D5: 'lǎn',
-    0x56D6: 'lo',
-    0x56D7: 'wéi,guó',
-    0x56D8: 'huí',
-    0x56D9: 'yīn',
-    0x56DA: 'qiú',
-    0x56DB: 'sì',
-    0x56DC: 'nín',
-    0x56DD: 'jiǎn,nān,yuè',
-    0x56DE: 'huí',
-    0x56DF: 'xìn',
-    0x56E0: 'yīn',
-    0x56E1: 'nān,niè',
-    0x56E2: 'tuán,qiú',
-    0x56E3: 'tuán',
-    0x56E4: 'dùn,tún',
-    0x56E5: 'kàng',
-    0x56E6: 'yuān',
-    0x56E7: 'jiǒng',
-    0x56E8: 'piān',
-    0x56E9: 'yún',
-    0x56EA: 'cōng',
-    0x56EB: 'hú',
-    0x56EC: 'huí',
-    0x56ED: 'yuán,wán',
-    0x56EE: 'é',
-    0x56EF: 'guó',
-    0x56F0: 'kùn',
-    0x56F1: 'cōng,chuāng',
-    0x56F2: 'tōng',
-    0x56F3: 'tú',
-    0x56F4: 'wéi',
-    0x56F5: 'lún',
-    0x56F6: 'guó',
-    0x56F7: 'qūn',
-    0x56F8: 'rì',
-    0x56F9: 'líng',
-    0x56FA: 'gù',
-    0x56FB: 'guó',
-    0x56FC: 'tāi',
-    0x56FD: 'guó',
-    0x56FE: 'tú',
-    0x56FF: 'yòu',
-    0x5700: 'guó',
-    0x5701: 'yín',
-    0x5702: 'hùn,huàn',
-    0x5703: 'pǔ',
-    0x5704: 'yǔ',
-    0x5705: 'hán',
-    0x5706: 'yuán',
-    0x5707: 'lún',
-    0x5708: 'quān,juān,juàn,quán,juǎn',
-    0x5709: 'yǔ',
-    0x570A: 'qīng',
-    0x570B: 'guó',
-    0x570C: 'chuán,chuí',
-    0x570D: 'wéi',
-    0x570E: 'yuán',
-    0x570F: 'quān',
-    0x5710: 'kū',
-    0x5711: 'pǔ',
-    0x5712: 'yuán',
-    0x5713: 'yuán',
-    0x5714: 'yà',
-    0x5715: 'tú',
-    0x5716: 'tú',
-    0x5717: 'tú',
-    0x5718: 'tuán,chuán',
-    0x5719: 'lüè',
-    0x571A: 'huì',
-    0x571B: 'yì',
-    0x571C: 'huán,yuán',
-    0x571D: 'luán',
-    0x571E: 'luán',
-    0x571F: 'tǔ,dù,chǎ,tú',
-    0x5720: 'yà',
-    0x5721: 'tǔ',
-    0x5722: 'tǐng',
-    0x5723: 'shèng,kū',
-    0x5724: 'pú',
-    0x5725: 'lù',
-    0x5726: 'kuài',
-    0x5727: 'yā',
-    0x5728: 'zài',
-    0x5729: 'wéi,xū,yú',
-    0x572A: 'gē,yì',
-    0x572B: 'yù,tuō,zhūn',
-    0x572C: 'wū',
-    0x572D: 'guī',
-    0x572E: 'pǐ',
-    0x572F: 'yí',
-    0x5730: 'dì,de',
-    0x5731: 'qiān,sú',
-    0x5732: 'qiān',
-    0x5733: 'zhèn,quǎn,chóu,huái',
-    0x5734: 'zhuó',
-    0x5735: 'dàng',
-    0x5736: 'qià',
-    0x5737: 'xià',
-    0x5738: 'shān',
-    0x5739: 'kuàng',
-    0x573A: 'chǎng,cháng',
-    0x573B: 'qí,yín',
-    0x573C: 'niè',
-    0x573D: 'mò',
-    0x573E: 'jī,jí,jié',
-    0x573F: 'jiá',
-    0x5740: 'zhǐ',
-    0x5741: 'zhǐ,zhì',
-    0x5742: 'bǎn',
-    0x5743: 'xūn',
-    0x5744: 'yì',
-    0x5745: 'qǐn',
-    0x5746: 'méi,fén',
-    0x5747: 'jūn,yùn',
-    0x5748: 'rǒng,kēng',
-    0x5749: 'tún,dùn',
-    0x574A: 'fāng,fáng',
-    0x574B: 'bèn,fèn',
-    0x574C: 'bèn',
-    0x574D: 'tān',
-    0x574E: 'kǎn,kàn',
-    0x574F: 'huài,pī,péi',
-    0x5750: 'zuò',
-    0x5751: 'kēng,kàng',
-    0x5752: 'bì',
-    0x5753: 'jǐng,xíng',
-    0x5754: 'dì,làn',
-    0x5755: 'jīng',
-    0x5756: 'jì',
-    0x5757: 'kuài,yué',
-    0x5758: 'dǐ',
-    0x5759: 'jīng',
-    0x575A: 'jiān',
-    0x575B: 'tán',
-    0x575C: 'lì',
-    0x575D: 'bà',
-    0x575E: 'wù',
-    0x575F: 'fén',
-    0x5760: 'zhuì',
-    0x5761: 'pō',
-    0x5762: 'bàn,pǎn,pàn',
-    0x5763: 'táng',
-    0x5764: 'kūn',
-    0x5765: 'qū,jù',
-    0x5766: 'tǎn',
-    0x5767: 'zhī',
-    0x5768: 'tuó,yí',
-    0x5769: 'gān',
-    0x576A: 'píng',
-    0x576B: 'diàn,zhēn',
-    0x576C: 'guà,wā',
-    0x576D: 'ní',
-    0x576E: 'tái',
-    0x576F: 'pī,huài',
-    0x5770: 'jiōng',
-    0x5771: 'yǎng',
-    0x5772: 'fó',
-    0x5773: 'ào,āo,yǒu',
-    0x5774: 'lù',
-    0x5775: 'qiū',
-    0x5776: 'mǔ,mù,méi',
-    0x5777: 'kě,kē,jiōng',
-    0x5778: 'gòu',
-    0x5779: 'xuè',
-    0x577A: 'bá',
-    0x577B: 'chí,dǐ',
-    0x577C: 'chè',
-    0x577D: 'líng',
-    0x577E: 'zhù',
-    0x577F: 'fù,fú',
-    0x5780: 'hū',
-    0x5781: 'zhì',
-    0x5782: 'chuí,zhuì',
-    0x5783: 'lā,la',
-    0x5784: 'lǒng',
-    0x5785: 'lǒng',
-    0x5786: 'lú',
-    0x5787: 'ào',
-    0x5788: 'dài',
-    0x5789: 'páo',
-    0x578A: 'min',
-    0x578B: 'xíng',
-    0x578C: 'dòng,tóng,tǒng',
-    0x578D: 'jì,jī',
-    0x578E: 'hè',
-    0x578F: 'lǜ',
-    0x5790: 'cí',
-    0x5791: 'chǐ',
-    0x5792: 'lěi',
-    0x5793: 'gāi',
-    0x5794: 'yīn',
-    0x5795: 'hòu',
-    0x5796: 'duī',
-    0x5797: 'zhào',
-    0x5798: 'fú',
-    0x5799: 'guāng',
-    0x579A: 'yáo',
-    0x579B: 'duǒ,duò',
-    0x579C: 'duǒ,duò',
-    0x579D: 'guǐ',
-    0x579E: 'chá',
-    0x579F: 'yáng',
-    0x57A0: 'yín,kèn',
-    0x57A1: 'fá',
-    0x57A2: 'gòu',
-    0x57A3: 'yuán',
-    0x57A4: 'dié',
-    0x57A5: 'xié',
-    0x57A6: 'kěn,yín',
-    0x57A7: 'shǎng,jiōng',
-    0x57A8: 'shǒu',
-    0x57A9: 'è,shèng',
-    0x57AA: 'bìng',
-    0x57AB: 'diàn',
-    0x57AC: 'hóng',
-    0x57AD: 'yā',
-    0x57AE: 'kuǎ',
-    0x57AF: 'da',
-    0x57B0: 'kǎ',
-    0x57B1: 'dàng',
-    0x57B2: 'kǎi',
-    0x57B3: 'háng',
-    0x57B4: 'nǎo',
-    0x57B5: 'ǎn,ān',
-    0x57B6: 'xīng',
-    0x57B7: 'xiàn',
-    0x57B8: 'yuàn,huán',
-    0x57B9: 'bāng',
-    0x57BA: 'fū,fú,fóu,pēi,póu',
-    0x57BB: 'bà,bèi',
-    0x57BC: 'yì',
-    0x57BD: 'yìn',
-    0x57BE: 'hàn,àn',
-    0x57BF: 'xù',
-    0x57C0: 'chuí',
-    0x57C1: 'qín',
-    0x57C2: 'gěng',
-    0x57C3: 'āi,zhì',
-    0x57C4: 'běng,fēng',
-    0x57C5: 'fáng,fāng,dì',
-    0x57C6: 'què,jué',
-    0x57C7: 'yǒng',
-    0x57C8: 'jùn',
-    0x57C9: 'jiā,xiá',
-    0x57CA: 'dì',
-    0x57CB: 'mái,mán',
-    0x57CC: 'làng',
-    0x57CD: 'juǎn',
-    0x57CE: 'chéng',
-    0x57CF: 'shān,yán',
-    0x57D0: 'jīn,qín',
-    0x57D1: 'zhé',
-    0x57D2: 'liè',
-    0x57D3: 'liè',
-    0x57D4: 'pǔ,bù',
-    0x57D5: 'chéng',
-    0x57D6: 'huā',
-    0x57D7: 'bù',
-    0x57D8: 'shí',
-    0x57D9: 'xūn',
-    0x57DA: 'guō',
-    0x57DB: 'jiōng',
-    0x57DC: 'yě',
-    0x57DD: 'niàn,diàn,niè',
-    0x57DE: 'dī',
-    0x57DF: 'yù',
-    0x57E0: 'bù',
-    0x57E1: 'yā,è,wǔ,yà',
-    0x57E2: 'quán,juǎn',
-    0x57E3: 'suì,sù',
-    0x57E4: 'pí,pì,bì,bēi',
-    0x57E5: 'qīng,zhēng',
-    0x57E6: 'wǎn,wān',
-    0x57E7: 'jù',
-    0x57E8: 'lǔn,lùn',
-    0x57E9: 'zhēng,chéng',
-    0x57EA: 'kōng',
-    0x57EB: 'chǒng,tǎng,shǎng',
-    0x57EC: 'dōng',
-    0x57ED: 'dài',
-    0x57EE: 'tàn,tán',
-    0x57EF: 'ǎn,yǎn',
-    0x57F0: 'cài,cǎi',
-    0x57F1: 'chù,tòu',
-    0x57F2: 'běng,bàng',
-    0x57F3: 'kǎn,xiàn',
-    0x57F4: 'zhí',
-    0x57F5: 'duǒ',
-    0x57F6: 'yì,shì',
-    0x57F7: 'zhí',
-    0x57F8: 'yì',
-    0x57F9: 'péi,pǒu,pī',
-    0x57FA: 'jī',
-    0x57FB: 'zhǔn,duī,guó',
-    0x57FC: 'qí',
-    0x57FD: 'sào,sǎo',
-    0x57FE: 'jù',
-    0x57FF: 'ní,nì,bàn',
-    0x5800: 'kū',
-    0x5801: 'kè',
-    0x5802: 'táng',
-    0x5803: 'kūn',
-    0x5804: 'nì',
-    0x5805: 'jiān',
-    0x5806: 'duī,zuī',
-    0x5807: 'jǐn,qín,jìn',
-    0x5808: 'gāng',
-    0x5809: 'yù',
-    0x580A: 'è,yà',
-    0x580B: 'péng,bèng,pēng,pīng',
-    0x580C: 'gù',
-    0x580D: 'tù',
-    0x580E: 'lèng',
-    0x580F: 'fang',
-    0x5810: 'yá',
-    0x5811: 'qiàn',
-    0x5812: 'kūn',
-    0x5813: 'àn',
-    0x5814: 'shēn',
-    0x5815: 'duò,huī',
-    0x5816: 'nǎo',
-    0x5817: 'tū',
-    0x5818: 'chéng',
-    0x5819: 'yīn',
-    0x581A: 'hún',
-    0x581B: 'bì',
-    0x581C: 'liàn',
-    0x581D: 'guō,wō',
-    0x581E: 'dié',
-    0x581F: 'zhuàn',
-    0x5820: 'hòu',
-    0x5821: 'bǎo,bǔ,pù',
-    0x5822: 'bǎo',
-    0x5823: 'yú',
-    0x5824: 'dī,tí,dǐ,shí,wéi',
-    0x5825: 'máo,móu,wǔ',
-    0x5826: 'jiē',
-    0x5827: 'ruán,nuò',
-    0x5828: 'yè,è,ài',
-    0x5829: 'gèng',
-    0x582A: 'kān,chěn',
-    0x582B: 'zōng',
-    0x582C: 'yú',
-    0x582D: 'huáng',
-    0x582E: 'è',
-    0x582F: 'yáo',
-    0x5830: 'yàn',
-    0x5831: 'bào,fù',
-    0x5832: 'cí,jí',
-    0x5833: 'méi',
-    0x5834: 'chǎng,cháng,shāng,dàng',
-    0x5835: 'dǔ,zhě,dū',
-    0x5836: 'tuó',
-    0x5837: 'yìn,pǒu',
-    0x5838: 'féng',
-    0x5839: 'zhòng',
-    0x583A: 'jiè',
-    0x583B: 'jīn',
-    0x583C: 'hèng',
-    0x583D: 'gāng',
-    0x583E: 'chūn',
-    0x583F: 'jiǎn,kǎn,xián',
-    0x5840: 'píng',
-    0x5841: 'lěi',
-    0x5842: 'xiàng,jiǎng',
-    0x5843: 'huāng',
-    0x5844: 'léng',
-    0x5845: 'duàn',
-    0x5846: 'wān',
-    0x5847: 'xuān',
-    0x5848: 'jì,xì',
-    0x5849: 'jí',
-    0x584A: 'kuài',
-    0x584B: 'yíng',
-    0x584C: 'tā,dā',
-    0x584D: 'chéng',
-    0x584E: 'yǒng',
-    0x584F: 'kǎi',
-    0x5850: 'sù',
-    0x5851: 'sù',
-    0x5852: 'shí',
-    0x5853: 'mì',
-    0x5854: 'tǎ,dā,da',
-    0x5855: 'wěng',
-    0x5856: 'chéng',
-    0x5857: 'tú,dù',
-    0x5858: 'táng',
-    0x5859: 'què,qiāo',
-    0x585A: 'zhǒng',
-    0x585B: 'lì',
-    0x585C: 'zhǒng,péng',
-    0x585D: 'bàng',
-    0x585E: 'sāi,sài,sè',
-    0x585F: 'zàng',
-    0x5860: 'duī',
-    0x5861: 'tián',
-    0x5862: 'wù,wǔ',
-    0x5863: 'zhèng',
-    0x5864: 'xūn',
-    0x5865: 'gé',
-    0x5866: 'zhèn',
-    0x5867: 'ài',
-    0x5868: 'gōng',
-    0x5869: 'yán',
-    0x586A: 'kǎn',
-    0x586B: 'tián,tiǎn,chén,zhèn',
-    0x586C: 'yuán',
-    0x586D: 'wēn',
-    0x586E: 'xiè',
-    0x586F: 'liù',
-    0x5870: 'hǎi',
-    0x5871: 'lǎng',
-    0x5872: 'cháng,shāng,chǎng',
-    0x5873: 'péng',
-    0x5874: 'bèng',
-    0x5875: 'chén',
-    0x5876: 'lù',
-    0x5877: 'lǔ',
-    0x5878: 'ōu',
-    0x5879: 'qiàn,jiàn',
-    0x587A: 'méi',
-    0x587B: 'mò',
-    0x587C: 'zhuān,tuán',
-    0x587D: 'shuǎng',
-    0x587E: 'shú',
-    0x587F: 'lǒu',
-    0x5880: 'chí',
-    0x5881: 'màn',
-    0x5882: 'biāo',
-    0x5883: 'jìng',
-    0x5884: 'cè',
-    0x5885: 'shù,yě',
-    0x5886: 'zhì,dì',
-    0x5887: 'zhàng',
-    0x5888: 'kàn',
-    0x5889: 'yōng',
-    0x588A: 'diàn',
-    0x588B: 'chěn',
-    0x588C: 'zhí,zhuó',
-    0x588D: 'xì',
-    0x588E: 'guō',
-    0x588F: 'qiǎng',
-    0x5890: 'jìn,qín',
-    0x5891: 'dì',
-    0x5892: 'shāng',
-    0x5893: 'mù',
-    0x5894: 'cuī',
-    0x5895: 'yàn,yān',
-    0x5896: 'tǎ',
-    0x5897: 'zēng',
-    0x5898: 'qián',
-    0x5899: 'qiáng',
-    0x589A: 'liáng',
-    0x589B: 'wèi',
-    0x589C: 'zhuì',
-    0x589D: 'qiāo,qiào',
-    0x589E: 'zēng,zèng,céng',
-    0x589F: 'xū',
-    0x58A0: 'shàn,chǎn',
-    0x58A1: 'shàn',
-    0x58A2: 'bá,fèi',
-    0x58A3: 'pú',
-    0x58A4: 'kuài,tuí',
-    0x58A5: 'dǒng,tuǎn',
-    0x58A6: 'fán,fān',
-    0x58A7: 'què,qiáo',
-    0x58A8: 'mò,mèi',
-    0x58A9: 'dūn',
-    0x58AA: 'dūn',
-    0x58AB: 'zūn,cūn',
-    0x58AC: 'dì',
-    0x58AD: 'shèng',
-    0x58AE: 'duò,huī,huì',
-    0x58AF: 'duò',
-    0x58B0: 'tán',
-    0x58B1: 'dèng,dēng',
-    0x58B2: 'mú,wú',
-    0x58B3: 'fén,fèn',
-    0x58B4: 'huáng',
-    0x58B5: 'tán',
-    0x58B6: 'da',
-    0x58B7: 'yè',
-    0x58B8: 'zhù',
-    0x58B9: 'jiàn',
-    0x58BA: 'ào',
-    0x58BB: 'qiáng',
-    0x58BC: 'jī',
-    0x58BD: 'qiāo,qiào,áo',
-    0x58BE: 'kěn',
-    0x58BF: 'yì,tú',
-    0x58C0: 'pí',
-    0x58C1: 'bì',
-    0x58C2: 'diàn',
-    0x58C3: 'jiāng',
-    0x58C4: 'yě',
-    0x58C5: 'yōng,wèng',
-    0x58C6: 'xué,jué,bó',
-    0x58C7: 'tán,shàn,dàn,tǎn',
-    0x58C8: 'lǎn',
-    0x58C9: 'jù',
-    0x58CA: 'huài',
-    0x58CB: 'dàng',
-    0x58CC: 'rǎng',
-    0x58CD: 'qiàn',
-    0x58CE: 'xūn,xùn',
-    0x58CF: 'xiàn,làn',
-    0x58D0: 'xǐ',
-    0x58D1: 'hè,huò',
-    0x58D2: 'ài',
-    0x58D3: 'yā,yà',
-    0x58D4: 'dǎo',
-    0x58D5: 'háo',
-    0x58D6: 'ruán',
-    0x58D7: 'jìn',
-    0x58D8: 'lěi,léi,lǜ',
-    0x58D9: 'kuàng,kuǎng',
-    0x58DA: 'lú',
-    0x58DB: 'yán',
-    0x58DC: 'tán',
-    0x58DD: 'wěi',
-    0x58DE: 'huài,huì,huái',
-    0x58DF: 'lǒng',
-    0x58E0: 'lǒng',
-    0x58E1: 'ruì',
-    0x58E2: 'lì',
-    0x58E3: 'lín',
-    0x58E4: 'rǎng',
-    0x58E5: 'chán',
-    0x58E6: 'xūn',
-    0x58E7: 'yán',
-    0x58E8: 'léi',
-    0x58E9: 'bà',
-    0x58EA: 'wān',
-    0x58EB: 'shì',
-    0x58EC: 'rén',
-    0x58ED: 'san',
-    0x58EE: 'zhuàng',
-    0x58EF: 'zhuàng,zhuāng',
-    0x58F0: 'shēng,qìng',
-    0x58F1: 'yī',
-    0x58F2: 'mài',
-    0x58F3: 'ké,qiào',
-    0x58F4: 'zhù',
-    0x58F5: 'zhuàng',
-    0x58F6: 'hú',
-    0x58F7: 'hú',
-    0x58F8: 'kǔn',
-    0x58F9: 'yī,yīn',
-    0x58FA: 'hú',
-    0x58FB: 'xù',
-    0x58FC: 'kǔn',
-    0x58FD: 'shòu',
-    0x58FE: 'mǎng',
-    0x58FF: 'zūn',
-    0x5900: 'shòu',
-    0x5901: 'yī',
-    0x5902: 'zhǐ,zhōng',
-    0x5903: 'gǔ,yíng',
-    0x5904: 'chù,chǔ',
-    0x5905: 'jiàng',
-    0x5906: 'féng,páng',
-    0x5907: 'bèi',
-    0x5908: 'zhāi',
-    0x5909: 'biàn',
-    0x590A: 'suī',
-    0x590B: 'qūn',
-    0x590C: 'líng',
-    0x590D: 'fù',
-    0x590E: 'cuò',
-    0x590F: 'xià,jiǎ',
-    0x5910: 'xiòng,xuàn',
-    0x5911: 'xiè',
-    0x5912: 'náo',
-    0x5913: 'xià',
-    0x5914: 'kuí',
-    0x5915: 'xī,yì',
-    0x5916: 'wài',
-    0x5917: 'yuàn,wǎn,wān,yuān',
-    0x5918: 'mǎo,wān',
-    0x5919: 'sù',
-    0x591A: 'duō',
-    0x591B: 'duō',
-    0x591C: 'yè',
-    0x591D: 'qíng',
-    0x591E: 'wài',
-    0x591F: 'gòu',
-    0x5920: 'gòu',
-    0x5921: 'qì',
-    0x5922: 'mèng,méng',
-    0x5923: 'mèng',
-    0x5924: 'yín',
-    0x5925: 'huǒ',
-    0x5926: 'chěn',
-    0x5927: 'dà,dài,tài',
-    0x5928: 'zè',
-    0x5929: 'tiān',
-    0x592A: 'tài,tā',
-    0x592B: 'fū,fú',
-    0x592C: 'guài,jué',
-    0x592D: 'yāo,wò,wāi',
-    0x592E: 'yāng,yīng',
-    0x592F: 'hāng,bèn',
-    0x5930: 'gǎo',
-    0x5931: 'shī,yì',
-    0x5932: 'tāo,běn',
-    0x5933: 'tài',
-    0x5934: 'tóu,tou',
-    0x5935: 'yǎn,tāo',
-    0x5936: 'bǐ',
-    0x5937: 'yí',
-    0x5938: 'kuā,kuà,kuǎ',
-    0x5939: 'jiā,gā,jiá',
-    0x593A: 'duó',
-    0x593B: 'huà',
-    0x593C: 'kuǎng',
-    0x593D: 'yǔn',
-    0x593E: 'jiā,jiá,xié,xiá,gā',
-    0x593F: 'bā',
-    0x5940: 'ēn',
-    0x5941: 'lián',
-    0x5942: 'huàn',
-    0x5943: 'dī,tì',
-    0x5944: 'yǎn,yān',
-    0x5945: 'pào',
-    0x5946: 'juàn',
-    0x5947: 'qí,jī,ǎi,yǐ',
-    0x5948: 'nài',
-    0x5949: 'fèng',
-    0x594A: 'xié,liè,xǐ,pí',
-    0x594B: 'fèn,kǎng',
-    0x594C: 'diǎn',
-    0x594D: 'quān',
-    0x594E: 'kuí,kuǐ',
-    0x594F: 'zòu,còu',
-    0x5950: 'huàn',
-    0x5951: 'qì,xiè,qiè,jié',
-    0x5952: 'kāi',
-    0x5953: 'zhā,shē,chǐ,zhà',
-    0x5954: 'bēn,bèn,fèn',
-    0x5955: 'yì',
-    0x5956: 'jiǎng',
-    0x5957: 'tào,tǎo',
-    0x5958: 'zàng,zhuǎng',
-    0x5959: 'běn',
-    0x595A: 'xī',
-    0x595B: 'huǎng',
-    0x595C: 'fěi,fēi',
-    0x595D: 'diāo',
-    0x595E: 'xùn',
-    0x595F: 'bēng,kēng',
-    0x5960: 'diàn,tíng,dìng,zhèng,zūn',
-    0x5961: 'ào,xiào',
-    0x5962: 'shē',
-    0x5963: 'wěng',
-    0x5964: 'hǎ,pò,tǎi',
-    0x5965: 'ào,yù,yōu',
-    0x5966: 'wù',
-    0x5967: 'ào',
-    0x5968: 'jiǎng',
-    0x5969: 'lián',
-    0x596A: 'duó,duì',
-    0x596B: 'yūn',
-    0x596C: 'jiǎng',
-    0x596D: 'shì',
-    0x596E: 'fèn',
-    0x596F: 'huò',
-    0x5970: 'bì',
-    0x5971: 'luán',
-    0x5972: 'duǒ,chě',
-    0x5973: 'nǚ,nǜ,rǔ',
-    0x5974: 'nú',
-    0x5975: 'dǐng,dīng,tiǎn',
-    0x5976: 'nǎi',
-    0x5977: 'qiān',
-    0x5978: 'jiān,gān',
-    0x5979: 'tā,jiě,chí',
-    0x597A: 'jiǔ',
-    0x597B: 'nuán',
-    0x597C: 'chà',
-    0x597D: 'hǎo,hào',
-    0x597E: 'xiān',
-    0x597F: 'fàn',
-    0x5980: 'jǐ',
-    0x5981: 'shuò,yuē',
-    0x5982: 'rú',
-    0x5983: 'fēi,pèi',
-    0x5984: 'wàng,wáng',
-    0x5985: 'hóng',
-    0x5986: 'zhuāng',
-    0x5987: 'fù',
-    0x5988: 'mā',
-    0x5989: 'dān',
-    0x598A: 'rèn,rén',
-    0x598B: 'fū,yōu',
-    0x598C: 'jìng',
-    0x598D: 'yán',
-    0x598E: 'hài,jiè',
-    0x598F: 'wèn',
-    0x5990: 'zhōng',
-    0x5991: 'pā',
-    0x5992: 'dù',
-    0x5993: 'jì,jī',
-    0x5994: 'kēng,háng',
-    0x5995: 'zhòng',
-    0x5996: 'yāo,jiǎo',
-    0x5997: 'jìn,xiān',
-    0x5998: 'yún',
-    0x5999: 'miào,miǎo',
-    0x599A: 'fǒu,pēi,pī',
-    0x599B: 'chī',
-    0x599C: 'yuè,jué',
-    0x599D: 'zhuāng',
-    0x599E: 'niū,hào',
-    0x599F: 'yàn',
-    0x59A0: 'nà,nàn',
-    0x59A1: 'xīn',
-    0x59A2: 'fén',
-    0x59A3: 'bǐ',
-    0x59A4: 'yú',
-    0x59A5: 'tuǒ',
-    0x59A6: 'fēng',
-    0x59A7: 'wàn,yuán',
-    0x59A8: 'fáng,fāng',
-    0x59A9: 'wǔ',
-    0x59AA: 'yù',
-    0x59AB: 'guī',
-    0x59AC: 'dù',
-    0x59AD: 'bá,bō',
-    0x59AE: 'nī,ní',
-    0x59AF: 'zhóu,chōu',
-    0x59B0: 'zhuó',
-    0x59B1: 'zhāo',
-    0x59B2: 'dá',
-    0x59B3: 'nǐ,nǎi',
-    0x59B4: 'yuàn',
-    0x59B5: 'tǒu',
-    0x59B6: 'xián,xuán,xù',
-    0x59B7: 'zhí,yì',
-    0x59B8: 'ē,ě',
-    0x59B9: 'mèi',
-    0x59BA: 'mò',
-    0x59BB: 'qī,qì',
-    0x59BC: 'bì',
-    0x59BD: 'shēn',
-    0x59BE: 'qiè',
-    0x59BF: 'ē',
-    0x59C0: 'hé',
-    0x59C1: 'xǔ,xū',
-    0x59C2: 'fá',
-    0x59C3: 'zhēng',
-    0x59C4: 'mín',
-    0x59C5: 'bàn',
-    0x59C6: 'mǔ',
-    0x59C7: 'fū,fú',
-    0x59C8: 'líng',
-    0x59C9: 'zǐ',
-    0x59CA: 'zǐ',
-    0x59CB: 'shǐ',
-    0x59CC: 'rǎn',
-    0x59CD: 'shān,xiān,pān',
-    0x59CE: 'yāng',
-    0x59CF: 'mán',
-    0x59D0: 'jiě,jù,xù,zū',
-    0x59D1: 'gū',
-    0x59D2: 'sì',
-    0x59D3: 'xìng,shēng',
-    0x59D4: 'wěi,wēi,wèi',
-    0x59D5: 'zī,cǐ,cī',
-    0x59D6: 'jù',
-    0x59D7: 'shān',
-    0x59D8: 'pīn,pín',
-    0x59D9: 'rèn',
-    0x59DA: 'yáo,tiào,táo,yào',
-    0x59DB: 'dòng',
-    0x59DC: 'jiāng',
-    0x59DD: 'shū',
-    0x59DE: 'jí',
-    0x59DF: 'gāi',
-    0x59E0: 'xiàng',
-    0x59E1: 'huá,huó',
-    0x59E2: 'juān',
-    0x59E3: 'jiāo,jiǎo,xiáo',
-    0x59E4: 'gòu',
-    0x59E5: 'lǎo,mǔ',
-    0x59E6: 'jiān',
-    0x59E7: 'jiān',
-    0x59E8: 'yí',
-    0x59E9: 'niàn,nián',
-    0x59EA: 'zhí',
-    0x59EB: 'jī,zhěn',
-    0x59EC: 'jī,yí',
-    0x59ED: 'xiàn',
-    0x59EE: 'héng',
-    0x59EF: 'guāng',
-    0x59F0: 'jūn,xūn,xuàn,xīn',
-    0x59F1: 'kuā,hù',
-    0x59F2: 'yàn',
-    0x59F3: 'mǐng',
-    0x59F4: 'liè',
-    0x59F5: 'pèi',
-    0x59F6: 'è,yà',
-    0x59F7: 'yòu',
-    0x59F8: 'yán',
-    0x59F9: 'chà',
-    0x59FA: 'shēn,xiān',
-    0x59FB: 'yīn',
-    0x59FC: 'shí,tí,jì',
-    0x59FD: 'guǐ,wá',
-    0x59FE: 'quán',
-    0x59FF: 'zī,zì',
-    0x5A00: 'sōng',
-    0x5A01: 'wēi',
-    0x5A02: 'hóng',
-    0x5A03: 'wá,wā,guì',
-    0x5A04: 'lóu',
-    0x5A05: 'yà',
-    0x5A06: 'ráo,rǎo',
-    0x5A07: 'jiāo',
-    0x5A08: 'luán',
-    0x5A09: 'pīng,pìn',
-    0x5A0A: 'xiàn,dān',
-    0x5A0B: 'shào,shāo',
-    0x5A0C: 'lǐ',
-    0x5A0D: 'chéng,shèng',
-    0x5A0E: 'xiè',
-    0x5A0F: 'máng',
-    0x5A10: 'fū',
-    0x5A11: 'suō,suǒ,suò',
-    0x5A12: 'méi,mǔ,wǔ',
-    0x5A13: 'wěi',
-    0x5A14: 'kè',
-    0x5A15: 'chuò,cù,lài',
-    0x5A16: 'chuò,cù',
-    0x5A17: 'tǐng,tiǎn',
-    0x5A18: 'niáng',
-    0x5A19: 'xíng',
-    0x5A1A: 'nán',
-    0x5A1B: 'yú',
-    0x5A1C: 'nà,nuó',
-    0x5A1D: 'pōu,bǐ',
-    0x5A1E: 'něi,suī',
-    0x5A1F: 'juān',
-    0x5A20: 'shēn',
-    0x5A21: 'zhì',
-    0x5A22: 'hán',
-    0x5A23: 'dì',
-    0x5A24: 'zhuāng',
-    0x5A25: 'é',
-    0x5A26: 'pín',
-    0x5A27: 'tuì',
-    0x5A28: 'xiàn',
-    0x5A29: 'miǎn,wǎn,wèn',
-    0x5A2A: 'wú,wù,yú',
-    0x5A2B: 'yán',
-    0x5A2C: 'wǔ',
-    0x5A2D: 'āi,xī',
-    0x5A2E: 'yán',
-    0x5A2F: 'yú',
-    0x5A30: 'sì',
-    0x5A31: 'yú',
-    0x5A32: 'wā',
-    0x5A33: 'lì',
-    0x5A34: 'xián',
-    0x5A35: 'jū',
-    0x5A36: 'qǔ,jū,shū',
-    0x5A37: 'zhuì,shuì',
-    0x5A38: 'qī',
-    0x5A39: 'xián',
-    0x5A3A: 'zhuó',
-    0x5A3B: 'dōng,dòng',
-    0x5A3C: 'chāng',
-    0x5A3D: 'lù',
-    0x5A3E: 'ǎi,ái,è',
-    0x5A3F: 'ē,ě',
-    0x5A40: 'ē,ě',
-    0x5A41: 'lóu,lǚ,lǘ,léi',
-    0x5A42: 'mián',
-    0x5A43: 'cóng',
-    0x5A44: 'pǒu,péi,bù',
-    0x5A45: 'jú',
-    0x5A46: 'pó',
-    0x5A47: 'cǎi',
-    0x5A48: 'líng',
-    0x5A49: 'wǎn',
-    0x5A4A: 'biǎo',
-    0x5A4B: 'xiāo',
-    0x5A4C: 'shú',
-    0x5A4D: 'qǐ',
-    0x5A4E: 'huī',
-    0x5A4F: 'fàn,fù',
-    0x5A50: 'wǒ',
-    0x5A51: 'ruí,wǒ,něi',
-    0x5A52: 'tán',
-    0x5A53: 'fēi',
-    0x5A54: 'fēi',
-    0x5A55: 'jié,qiè',
-    0x5A56: 'tiān',
-    0x5A57: 'ní,nǐ',
-    0x5A58: 'quán,juàn',
-    0x5A59: 'jìng',
-    0x5A5A: 'hūn',
-    0x5A5B: 'jīng',
-    0x5A5C: 'qiān,jǐn',
-    0x5A5D: 'diàn',
-    0x5A5E: 'xìng',
-    0x5A5F: 'hù',
-    0x5A60: 'wān,guàn',
-    0x5A61: 'lái,lài',
-    0x5A62: 'bì',
-    0x5A63: 'yīn',
-    0x5A64: 'chōu,zhōu',
-    0x5A65: 'nào,chuò',
-    0x5A66: 'fù',
-    0x5A67: 'jìng',
-    0x5A68: 'lún',
-    0x5A69: 'àn,nüè',
-    0x5A6A: 'lán,lǎn',
-    0x5A6B: 'kūn,hùn',
-    0x5A6C: 'yín',
-    0x5A6D: 'yà,yā,yǎ',
-    0x5A6E: 'jū',
-    0x5A6F: 'lì',
-    0x5A70: 'diǎn',
-    0x5A71: 'xián',
-    0x5A72: 'huā',
-    0x5A73: 'huà',
-    0x5A74: 'yīng',
-    0x5A75: 'chán',
-    0x5A76: 'shěn',
-    0x5A77: 'tíng',
-    0x5A78: 'dàng,yáng',
-    0x5A79: 'yǎo',
-    0x5A7A: 'wù,móu,mù',
-    0x5A7B: 'nàn',
-    0x5A7C: 'chuò,ruò',
-    0x5A7D: 'jiǎ',
-    0x5A7E: 'tōu',
-    0x5A7F: 'xù',
-    0x5A80: 'yù,yú',
-    0x5A81: 'wéi,wěi',
-    0x5A82: 'dì,tí',
-    0x5A83: 'róu',
-    0x5A84: 'měi',
-    0x5A85: 'dān',
-    0x5A86: 'ruǎn,nèn,nùn',
-    0x5A87: 'qīn',
-    0x5A88: 'huī',
-    0x5A89: 'wò',
-    0x5A8A: 'qián',
-    0x5A8B: 'chūn',
-    0x5A8C: 'miáo',
-    0x5A8D: 'fù',
-    0x5A8E: 'jiě',
-    0x5A8F: 'duān',
-    0x5A90: 'yí,xī',
-    0x5A91: 'zhòng',
-    0x5A92: 'méi,mèi',
-    0x5A93: 'huáng',
-    0x5A94: 'mián,miǎn',
-    0x5A95: 'ān,yǎn,è',
-    0x5A96: 'yīng',
-    0x5A97: 'xuān',
-    0x5A98: 'jiē',
-    0x5A99: 'wēi',
-    0x5A9A: 'mèi',
-    0x5A9B: 'yuàn,yuán',
-    0x5A9C: 'zhēng',
-    0x5A9D: 'qiū',
-    0x5A9E: 'shì,tí,zhī,dài',
-    0x5A9F: 'xiè',
-    0x5AA0: 'tuǒ,duò,nuǒ',
-    0x5AA1: 'liàn',
-    0x5AA2: 'mào',
-    0x5AA3: 'rǎn',
-    0x5AA4: 'sī',
-    0x5AA5: 'piān',
-    0x5AA6: 'wèi',
-    0x5AA7: 'wā',
-    0x5AA8: 'cù',
-    0x5AA9: 'hú',
-    0x5AAA: 'ǎo,yǔn,wò',
-    0x5AAB: 'jié',
-    0x5AAC: 'bǎo',
-    0x5AAD: 'xū',
-    0x5AAE: 'tōu,yú',
-    0x5AAF: 'guī,guì',
-    0x5AB0: 'chú,zòu',
-    0x5AB1: 'yáo',
-    0x5AB2: 'pì,bī,pí',
-    0x5AB3: 'xí',
-    0x5AB4: 'yuán',
-    0x5AB5: 'yìng,shèng',
-    0x5AB6: 'róng',
-    0x5AB7: 'rù',
-    0x5AB8: 'chī',
-    0x5AB9: 'liú',
-    0x5ABA: 'měi',
-    0x5ABB: 'pán',
-    0x5ABC: 'ǎo',
-    0x5ABD: 'mā',
-    0x5ABE: 'gòu',
-    0x5ABF: 'kuì,chǒu',
-    0x5AC0: 'qín,shēn',
-    0x5AC1: 'jià',
-    0x5AC2: 'sǎo',
-    0x5AC3: 'zhēn,zhěn',
-    0x5AC4: 'yuán',
-    0x5AC5: 'jiē,suǒ',
-    0x5AC6: 'róng',
-    0x5AC7: 'míng,mǐng,méng',
-    0x5AC8: 'yīng,xīng,yíng',
-    0x5AC9: 'jí',
-    0x5ACA: 'sù',
-    0x5ACB: 'niǎo',
-    0x5ACC: 'xián',
-    0x5ACD: 'tāo',
-    0x5ACE: 'páng,bàng',
-    0x5ACF: 'láng',
-    0x5AD0: 'nǎo',
-    0x5AD1: 'báo',
-    0x5AD2: 'ài',
-    0x5AD3: 'pì',
-    0x5AD4: 'pín',
-    0x5AD5: 'yì',
-    0x5AD6: 'piáo,piào,biāo',
-    0x5AD7: 'yù,yǔ,kōu',
-    0x5AD8: 'léi',
-    0x5AD9: 'xuán',
-    0x5ADA: 'mān,màn,yuān',
-    0x5ADB: 'yī',
-    0x5ADC: 'zhāng',
-    0x5ADD: 'kāng',
-    0x5ADE: 'yōng',
-    0x5ADF: 'nì',
-    0x5AE0: 'lí',
-    0x5AE1: 'dí',
-    0x5AE2: 'guī,zuī',
-    0x5AE3: 'yān',
-    0x5AE4: 'jǐn,jìn',
-    0x5AE5: 'zhuān,tuán',
-    0x5AE6: 'cháng',
-    0x5AE7: 'zé,cè',
-    0x5AE8: 'hān,nǎn',
-    0x5AE9: 'nèn',
-    0x5AEA: 'lào,láo',
-    0x5AEB: 'mó',
-    0x5AEC: 'zhē',
-    0x5AED: 'hù',
-    0x5AEE: 'hù',
-    0x5AEF: 'ào',
-    0x5AF0: 'nèn',
-    0x5AF1: 'qiáng',
-    0x5AF2: 'ma',
-    0x5AF3: 'piè',
-    0x5AF4: 'gū',
-    0x5AF5: 'wǔ',
-    0x5AF6: 'qiáo,jiāo',
-    0x5AF7: 'tuǒ',
-    0x5AF8: 'zhǎn',
-    0x5AF9: 'miáo',
-    0x5AFA: 'xián',
-    0x5AFB: 'xián',
-    0x5AFC: 'mò',
-    0x5AFD: 'liáo,liǎo,liào,lǎo',
-    0x5AFE: 'lián',
-    0x5AFF: 'huà',
-    0x5B00: 'guī',
-    0x5B01: 'dēng',
-    0x5B02: 'zhí',
-    0x5B03: 'xū',
-    0x5B04: 'yī',
-    0x5B05: 'huà',
-    0x5B06: 'xī',
-    0x5B07: 'kuì',
-    0x5B08: 'ráo,rǎo,yǎo',
-    0x5B09: 'xī,xǐ',
-    0x5B0A: 'yàn',
-    0x5B0B: 'chán',
-    0x5B0C: 'jiāo',
-    0x5B0D: 'měi',
-    0x5B0E: 'fàn,fù',
-    0x5B0F: 'fān',
-    0x5B10: 'xiān,yǎn,jìn',
-    0x5B11: 'yì',
-    0x5B12: 'huì',
-    0x5B13: 'jiào',
-    0x5B14: 'fù',
-    0x5B15: 'shì',
-    0x5B16: 'bì',
-    0x5B17: 'shàn,chán',
-    0x5B18: 'suì',
-    0x5B19: 'qiáng',
-    0x5B1A: 'liǎn',
-    0x5B1B: 'huán,xuān,qióng,xuán',
-    0x5B1C: 'xīn',
-    0x5B1D: 'niǎo',
-    0x5B1E: 'dǒng',
-    0x5B1F: 'yì,yǐ',
-    0x5B20: 'cān',
-    0x5B21: 'ài',
-    0x5B22: 'niáng',
-    0x5B23: 'níng',
-    0x5B24: 'mā',
-    0x5B25: 'tiǎo,diào',
-    0x5B26: 'chóu',
-    0x5B27: 'jìn',
-    0x5B28: 'cí',
-    0x5B29: 'yú',
-    0x5B2A: 'pín',
-    0x5B2B: 'róng',
-    0x5B2C: 'rú,nòu',
-    0x5B2D: 'nǎi,ěr,nì',
-    0x5B2E: 'yān,yàn',
-    0x5B2F: 'tái',
-    0x5B30: 'yīng,yìng',
-    0x5B31: 'qiàn',
-    0x5B32: 'niǎo',
-    0x5B33: 'yuè',
-    0x5B34: 'yíng',
-    0x5B35: 'mián',
-    0x5B36: 'bí',
-    0x5B37: 'mā,mó',
-    0x5B38: 'shěn',
-    0x5B39: 'xìng,xīng',
-    0x5B3A: 'nì',
-    0x5B3B: 'dú',
-    0x5B3C: 'liǔ',
-    0x5B3D: 'yuān',
-    0x5B3E: 'lǎn',
-    0x5B3F: 'yàn',
-    0x5B40: 'shuāng',
-    0x5B41: 'líng',
-    0x5B42: 'jiǎo',
-    0x5B43: 'niáng,ráng',
-    0x5B44: 'lǎn',
-    0x5B45: 'qiān,xiān',
-    0x5B46: 'yīng',
-    0x5B47: 'shuāng',
-    0x5B48: 'huì,xié',
-    0x5B49: 'quán,huān',
-    0x5B4A: 'mǐ',
-    0x5B4B: 'lí,lì',
-    0x5B4C: 'luán,liàn,luǎn',
-    0x5B4D: 'yán,yǎn',
-    0x5B4E: 'zhú,shú,chuò',
-    0x5B4F: 'lǎn',
-    0x5B50: 'zi,zǐ',
-    0x5B51: 'jié',
-    0x5B52: 'jué',
-    0x5B53: 'jué',
-    0x5B54: 'kǒng',
-    0x5B55: 'yùn',
-    0x5B56: 'mā,zī',
-    0x5B57: 'zì',
-    0x5B58: 'cún',
-    0x5B59: 'sūn',
-    0x5B5A: 'fú',
-    0x5B5B: 'bèi,bó',
-    0x5B5C: 'zī',
-    0x5B5D: 'xiào',
-    0x5B5E: 'xìn',
-    0x5B5F: 'mèng',
-    0x5B60: 'sì',
-    0x5B61: 'tāi',
-    0x5B62: 'bāo',
-    0x5B63: 'jì',
-    0x5B64: 'gū',
-    0x5B65: 'nú',
-    0x5B66: 'xué',
-    0x5B67: 'yòu',
-    0x5B68: 'zhuǎn,nì',
-    0x5B69: 'hái',
-    0x5B6A: 'luán',
-    0x5B6B: 'sūn,xùn',
-    0x5B6C: 'nāo',
-    0x5B6D: 'miē',
-    0x5B6E: 'cóng',
-    0x5B6F: 'qiān',
-    0x5B70: 'shú',
-    0x5B71: 'càn,chán,jiān,zhàn',
-    0x5B72: 'yā',
-    0x5B73: 'zī',
-    0x5B74: 'nǐ,nì,yì',
-    0x5B75: 'fū',
-    0x5B76: 'zī',
-    0x5B77: 'lí',
-    0x5B78: 'xué,huá,jiào',
-    0x5B79: 'bò',
-    0x5B7A: 'rú',
-    0x5B7B: 'nái',
-    0x5B7C: 'niè',
-    0x5B7D: 'niè',
-    0x5B7E: 'yīng',
-    0x5B7F: 'luán',
-    0x5B80: 'mián',
-    0x5B81: 'níng,nìng,zhù',
-    0x5B82: 'rǒng',
-    0x5B83: 'tā,tuó,yí',
-    0x5B84: 'guǐ',
-    0x5B85: 'zhái,chè,dù',
-    0x5B86: 'qióng',
-    0x5B87: 'yǔ',
-    0x5B88: 'shǒu,shòu',
-    0x5B89: 'ān',
-    0x5B8A: 'tū,jiā',
-    0x5B8B: 'sòng',
-    0x5B8C: 'wán,kuān',
-    0x5B8D: 'ròu',
-    0x5B8E: 'yǎo,yāo',
-    0x5B8F: 'hóng',
-    0x5B90: 'yí',
-    0x5B91: 'jǐng',
-    0x5B92: 'zhūn',
-    0x5B93: 'mì,fú',
-    0x5B94: 'zhǔ',
-    0x5B95: 'dàng',
-    0x5B96: 'hóng',
-    0x5B97: 'zōng',
-    0x5B98: 'guān',
-    0x5B99: 'zhòu',
-    0x5B9A: 'dìng',
-    0x5B9B: 'wǎn,yuān,yǔn,yù',
-    0x5B9C: 'yí',
-    0x5B9D: 'bǎo',
-    0x5B9E: 'shí',
-    0x5B9F: 'shí',
-    0x5BA0: 'chǒng',
-    0x5BA1: 'shěn',
-    0x5BA2: 'kè,qià',
-    0x5BA3: 'xuān',
-    0x5BA4: 'shì',
-    0x5BA5: 'yòu',
-    0x5BA6: 'huàn',
-    0x5BA7: 'yí',
-    0x5BA8: 'tiǎo',
-    0x5BA9: 'shǐ',
-    0x5BAA: 'xiàn,xiòng',
-    0x5BAB: 'gōng',
-    0x5BAC: 'chéng',
-    0x5BAD: 'qún',
-    0x5BAE: 'gōng',
-    0x5BAF: 'xiāo',
-    0x5BB0: 'zǎi',
-    0x5BB1: 'zhà',
-    0x5BB2: 'bǎo,shí',
-    0x5BB3: 'hài,hé',
-    0x5BB4: 'yàn',
-    0x5BB5: 'xiāo',
-    0x5BB6: 'jiā,jia,jià,jie,gū',
-    0x5BB7: 'shěn',
-    0x5BB8: 'chén',
-    0x5BB9: 'róng,yǒng',
-    0x5BBA: 'huǎng',
-    0x5BBB: 'mì',
-    0x5BBC: 'kòu',
-    0x5BBD: 'kuān',
-    0x5BBE: 'bīn',
-    0x5BBF: 'sù,xiǔ,xiù,qī',
-    0x5BC0: 'cǎi,cài',
-    0x5BC1: 'zǎn',
-    0x5BC2: 'jì',
-    0x5BC3: 'yuān',
-    0x5BC4: 'jì',
-    0x5BC5: 'yín',
-    0x5BC6: 'mì',
-    0x5BC7: 'kòu',
-    0x5BC8: 'qīng',
-    0x5BC9: 'hè',
-    0x5BCA: 'zhēn',
-    0x5BCB: 'jiàn',
-    0x5BCC: 'fù',
-    0x5BCD: 'níng',
-    0x5BCE: 'bìng,bǐng',
-    0x5BCF: 'huán',
-    0x5BD0: 'mèi',
-    0x5BD1: 'qǐn',
-    0x5BD2: 'hán',
-    0x5BD3: 'yù',
-    0x5BD4: 'shí',
-    0x5BD5: 'níng',
-    0x5BD6: 'jìn',
-    0x5BD7: 'níng',
-    0x5BD8: 'zhì,tián',
-    0x5BD9: 'yǔ',
-    0x5BDA: 'bǎo',
-    0x5BDB: 'kuān',
-    0x5BDC: 'níng',
-    0x5BDD: 'qǐn',
-    0x5BDE: 'mò',
-    0x5BDF: 'chá,cuì',
-    0x5BE0: 'jù,lǜ,lóu',
-    0x5BE1: 'guǎ',
-    0x5BE2: 'qǐn',
-    0x5BE3: 'hū',
-    0x5BE4: 'wù',
-    0x5BE5: 'liáo',
-    0x5BE6: 'shí,zhì',
-    0x5BE7: 'níng,nìng',
-    0x5BE8: 'zhài,sè,qiān',
-    0x5BE9: 'shěn,pán',
-    0x5BEA: 'wěi,wéi',
-    0x5BEB: 'xiě,xiè',
-    0x5BEC: 'kuān',
-    0x5BED: 'huì',
-    0x5BEE: 'liáo',
-    0x5BEF: 'jùn',
-    0x5BF0: 'huán,xiàn',
-    0x5BF1: 'yì',
-    0x5BF2: 'yí',
-    0x5BF3: 'bǎo',
-    0x5BF4: 'qīn,qìn',
-    0x5BF5: 'chǒng,lóng',
-    0x5BF6: 'bǎo',
-    0x5BF7: 'fēng',
-    0x5BF8: 'cùn,cǔn',
-    0x5BF9: 'duì',
-    0x5BFA: 'sì,shì',
-    0x5BFB: 'xún,xín',
-    0x5BFC: 'dǎo',
-    0x5BFD: 'lǜ,lüè',
-    0x5BFE: 'duì',
-    0x5BFF: 'shòu',
-    0x5C00: 'pǒ',
-    0x5C01: 'fēng,biǎn',
-    0x5C02: 'zhuān',
-    0x5C03: 'fū,bù,fǔ,pò',
-    0x5C04: 'shè,yè,yì',
-    0x5C05: 'kè,kēi',
-    0x5C06: 'jiāng,jiàng,qiāng',
-    0x5C07: 'jiāng,jiàng,qiāng,yáng,jiǎng',
-    0x5C08: 'zhuān,tuán,shuàn',
-    0x5C09: 'wèi,yù,yùn',
-    0x5C0A: 'zūn',
-    0x5C0B: 'xún,xín',
-    0x5C0C: 'shù,zhù',
-    0x5C0D: 'duì',
-    0x5C0E: 'dǎo,dào',
-    0x5C0F: 'xiǎo',
-    0x5C10: 'jié,jí',
-    0x5C11: 'shǎo,shào',
-    0x5C12: 'ěr',
-    0x5C13: 'ěr',
-    0x5C14: 'ěr',
-    0x5C15: 'gǎ',
-    0x5C16: 'jiān',
-    0x5C17: 'shū,shú',
-    0x5C18: 'chén',
-    0x5C19: 'shàng',
-    0x5C1A: 'shàng,cháng',
-    0x5C1B: 'mó',
-    0x5C1C: 'gá',
-    0x5C1D: 'cháng',
-    0x5C1E: 'liào,liáo',
-    0x5C1F: 'xiǎn',
-    0x5C20: 'xiǎn',
-    0x5C21: 'kun',
-    0x5C22: 'yóu,wāng',
-    0x5C23: 'wāng',
-    0x5C24: 'yóu',
-    0x5C25: 'liào,niǎo',
-    0x5C26: 'liào',
-    0x5C27: 'yáo',
-    0x5C28: 'máng,méng,páng',
-    0x5C29: 'wāng',
-    0x5C2A: 'wāng',
-    0x5C2B: 'wāng',
-    0x5C2C: 'gà',
-    0x5C2D: 'yáo',
-    0x5C2E: 'duò',
-    0x5C2F: 'kuì,kuǐ',
-    0x5C30: 'zhǒng',
-    0x5C31: 'jiù',
-    0x5C32: 'gān',
-    0x5C33: 'gǔ',
-    0x5C34: 'gān',
-    0x5C35: 'tuí,zhuài',
-    0x5C36: 'gān',
-    0x5C37: 'gān',
-    0x5C38: 'shī',
-    0x5C39: 'yǐn,yún',
-    0x5C3A: 'chǐ,chě',
-    0x5C3B: 'kāo',
-    0x5C3C: 'ní,nǐ',
-    0x5C3D: 'jǐn,jìn',
-    0x5C3E: 'wěi,yǐ',
-    0x5C3F: 'niào,suī',
-    0x5C40: 'jú',
-    0x5C41: 'pì',
-    0x5C42: 'céng',
-    0x5C43: 'xì',
-    0x5C44: 'bī',
-    0x5C45: 'jū,jī',
-    0x5C46: 'jiè',
-    0x5C47: 'tián',
-    0x5C48: 'qū,jué,què,jú',
-    0x5C49: 'tì',
-    0x5C4A: 'jiè',
-    0x5C4B: 'wū',
-    0x5C4C: 'diǎo',
-    0x5C4D: 'shī,shì',
-    0x5C4E: 'shǐ,xī',
-    0x5C4F: 'píng,bǐng,bìng,bīng',
-    0x5C50: 'jī',
-    0x5C51: 'xiè',
-    0x5C52: 'zhěn',
-    0x5C53: 'xiè',
-    0x5C54: 'ní',
-    0x5C55: 'zhǎn',
-    0x5C56: 'xī',
-    0x5C57: 'wěi',
-    0x5C58: 'mǎn',
-    0x5C59: 'ē',
-    0x5C5A: 'lòu',
-    0x5C5B: 'píng',
-    0x5C5C: 'tì',
-    0x5C5D: 'fèi',
-    0x5C5E: 'shǔ,zhǔ',
-    0x5C5F: 'xiè,tì',
-    0x5C60: 'tú',
-    0x5C61: 'lǚ',
-    0x5C62: 'lǚ',
-    0x5C63: 'xǐ',
-    0x5C64: 'céng',
-    0x5C65: 'lǚ',
-    0x5C66: 'jù',
-    0x5C67: 'xiè',
-    0x5C68: 'jù',
-    0x5C69: 'juē',
-    0x5C6A: 'liáo',
-    0x5C6B: 'jué',
-    0x5C6C: 'shǔ,zhǔ',
-    0x5C6D: 'xì',
-    0x5C6E: 'chè,cǎo',
-    0x5C6F: 'tún,zhūn',
-    0x5C70: 'nì,pò,jí',
-    0x5C71: 'shān',
-    0x5C72: 'wā',
-    0x5C73: 'xiān',
-    0x5C74: 'lì',
-    0x5C75: 'è,yǎn',
-    0x5C76: 'huì',
-    0x5C77: 'huì',
-    0x5C78: 'lóng,hóng',
-    0x5C79: 'yì,gē',
-    0x5C7A: 'qǐ',
-    0x5C7B: 'rèn',
-    0x5C7C: 'wù',
-    0x5C7D: 'hàn,àn',
-    0x5C7E: 'shēn',
-    0x5C7F: 'yǔ',
-    0x5C80: 'chū',
-    0x5C81: 'suì',
-    0x5C82: 'qǐ,kǎi',
-    0x5C83: 'rèn',
-    0x5C84: 'yuè',
-    0x5C85: 'bǎn',
-    0x5C86: 'yǎo',
-    0x5C87: 'áng',
-    0x5C88: 'yá,xiā',
-    0x5C89: 'wù',
-    0x5C8A: 'jié',
-    0x5C8B: 'è,jí',
-    0x5C8C: 'jí',
-    0x5C8D: 'qiān',
-    0x5C8E: 'fén,chà',
-    0x5C8F: 'wán',
-    0x5C90: 'qí',
-    0x5C91: 'cén',
-    0x5C92: 'qián',
-    0x5C93: 'qí',
-    0x5C94: 'chà',
-    0x5C95: 'jiè',
-    0x5C96: 'qū',
-    0x5C97: 'gǎng,gāng',
-    0x5C98: 'xiàn',
-    0x5C99: 'ào',
-    0x5C9A: 'lán',
-    0x5C9B: 'dǎo',
-    0x5C9C: 'bā',
-    0x5C9D: 'zuò',
-    0x5C9E: 'zuò',
-    0x5C9F: 'yǎng',
-    0x5CA0: 'jù',
-    0x5CA1: 'gāng',
-    0x5CA2: 'kě',
-    0x5CA3: 'gǒu',
-    0x5CA4: 'xué',
-    0x5CA5: 'pō',
-    0x5CA6: 'lì',
-    0x5CA7: 'tiáo',
-    0x5CA8: 'qū,jū,zǔ,jǔ',
-    0x5CA9: 'yán',
-    0x5CAA: 'fú',
-    0x5CAB: 'xiù',
-    0x5CAC: 'jiǎ,jiá',
-    0x5CAD: 'lǐng,líng',
-    0x5CAE: 'tuó',
-    0x5CAF: 'pí',
-    0x5CB0: 'ào',
-    0x5CB1: 'dài',
-    0x5CB2: 'kuàng',
-    0x5CB3: 'yuè',
-    0x5CB4: 'qū',
-    0x5CB5: 'hù',
-    0x5CB6: 'pò',
-    0x5CB7: 'mín',
-    0x5CB8: 'àn',
-    0x5CB9: 'tiáo',
-    0x5CBA: 'líng',
-    0x5CBB: 'chí',
-    0x5CBC: 'píng',
-    0x5CBD: 'dōng',
-    0x5CBE: 'hàn',
-    0x5CBF: 'kuī',
-    0x5CC0: 'xiù',
-    0x5CC1: 'mǎo',
-    0x5CC2: 'tóng',
-    0x5CC3: 'xué',
-    0x5CC4: 'yì',
-    0x5CC5: 'biàn',
-    0x5CC6: 'hé',
-    0x5CC7: 'bā,kè',
-    0x5CC8: 'luò',
-    0x5CC9: 'è',
-    0x5CCA: 'fù,niè',
-    0x5CCB: 'xún',
-    0x5CCC: 'dié',
-    0x5CCD: 'lù',
-    0x5CCE: 'ěn',
-    0x5CCF: 'ér',
-    0x5CD0: 'gāi',
-    0x5CD1: 'quān',
-    0x5CD2: 'dòng,tóng',
-    0x5CD3: 'yí',
-    0x5CD4: 'mǔ',
-    0x5CD5: 'shí',
-    0x5CD6: 'ān',
-    0x5CD7: 'wéi,wěi',
-    0x5CD8: 'huán',
-    0x5CD9: 'zhì,shì',
-    0x5CDA: 'mì',
-    0x5CDB: 'lǐ,liè',
-    0x5CDC: 'jì',
-    0x5CDD: 'tóng',
-    0x5CDE: 'wéi,wěi',
-    0x5CDF: 'yòu',
-    0x5CE0: 'qiǎ',
-    0x5CE1: 'xiá',
-    0x5CE2: 'lǐ',
-    0x5CE3: 'yáo',
-    0x5CE4: 'jiào,qiáo',
-    0x5CE5: 'zhēng',
-    0x5CE6: 'luán',
-    0x5CE7: 'jiāo',
-    0x5CE8: 'é',
-    0x5CE9: 'é',
-    0x5CEA: 'yù',
-    0x5CEB: 'xié,yé',
-    0x5CEC: 'bū',
-    0x5CED: 'qiào',
-    0x5CEE: 'qūn',
-    0x5CEF: 'fēng',
-    0x5CF0: 'fēng',
-    0x5CF1: 'náo',
-    0x5CF2: 'lǐ',
-    0x5CF3: 'yóu',
-    0x5CF4: 'xiàn',
-    0x5CF5: 'róng',
-    0x5CF6: 'dǎo',
-    0x5CF7: 'shēn',
-    0x5CF8: 'chéng',
-    0x5CF9: 'tú',
-    0x5CFA: 'gěng',
-    0x5CFB: 'jùn',
-    0x5CFC: 'gào',
-    0x5CFD: 'xiá',
-    0x5CFE: 'yín',
-    0x5CFF: 'yǔ,wú',
-    0x5D00: 'làng,lǎng',
-    0x5D01: 'kàn',
-    0x5D02: 'láo',
-    0x5D03: 'lái',
-    0x5D04: 'xiǎn',
-    0x5D05: 'què',
-    0x5D06: 'kōng',
-    0x5D07: 'chóng',
-    0x5D08: 'chóng',
-    0x5D09: 'tà',
-    0x5D0A: 'lín',
-    0x5D0B: 'huà',
-    0x5D0C: 'jū',
-    0x5D0D: 'lái',
-    0x5D0E: 'qí,qǐ,yī',
-    0x5D0F: 'mín',
-    0x5D10: 'kūn',
-    0x5D11: 'kūn',
-    0x5D12: 'zú,cuì',
-    0x5D13: 'gù',
-    0x5D14: 'cuī',
-    0x5D15: 'yá',
-    0x5D16: 'yá',
-    0x5D17: 'gǎng,gāng',
-    0x5D18: 'lún',
-    0x5D19: 'lún',
-    0x5D1A: 'léng,líng',
-    0x5D1B: 'jué,yù',
-    0x5D1C: 'duō,duǒ',
-    0x5D1D: 'zhēng',
-    0x5D1E: 'guō',
-    0x5D1F: 'yín',
-    0x5D20: 'dōng,dòng',
-    0x5D21: 'hán',
-    0x5D22: 'zhēng',
-    0x5D23: 'wěi',
-    0x5D24: 'xiáo,yáo',
-    0x5D25: 'pí,bǐ',
-    0x5D26: 'yān',
-    0x5D27: 'sōng',
-    0x5D28: 'jié',
-    0x5D29: 'bēng',
-    0x5D2A: 'zú',
-    0x5D2B: 'kū,jué',
-    0x5D2C: 'dōng',
-    0x5D2D: 'zhǎn',
-    0x5D2E: 'gù',
-    0x5D2F: 'yín',
-    0x5D30: 'zī',
-    0x5D31: 'zè',
-    0x5D32: 'huáng',
-    0x5D33: 'yú',
-    0x5D34: 'wǎi,wēi,wěi',
-    0x5D35: 'yáng,dàng',
-    0x5D36: 'fēng',
-    0x5D37: 'qiú',
-    0x5D38: 'yáng',
-    0x5D39: 'tí',
-    0x5D3A: 'yǐ',
-    0x5D3B: 'zhì',
-    0x5D3C: 'shì,dié',
-    0x5D3D: 'zǎi',
-    0x5D3E: 'yǎo,yào',
-    0x5D3F: 'è',
-    0x5D40: 'zhù',
-    0x5D41: 'kān,zhàn',
-    0x5D42: 'lǜ',
-    0x5D43: 'yǎn,yàn',
-    0x5D44: 'měi',
-    0x5D45: 'hán',
-    0x5D46: 'jī',
-    0x5D47: 'jī,xí',
-    0x5D48: 'huàn',
-    0x5D49: 'tíng',
-    0x5D4A: 'shèng,chéng',
-    0x5D4B: 'méi',
-    0x5D4C: 'qiàn,hǎn,kàn',
-    0x5D4D: 'wù,máo',
-    0x5D4E: 'yú',
-    0x5D4F: 'zōng',
-    0x5D50: 'lán',
-    0x5D51: 'kě,jié',
-    0x5D52: 'yán,niè',
-    0x5D53: 'yán',
-    0x5D54: 'wěi',
-    0x5D55: 'zōng',
-    0x5D56: 'chá',
-    0x5D57: 'suì',
-    0x5D58: 'róng',
-    0x5D59: 'kē',
-    0x5D5A: 'qīn',
-    0x5D5B: 'yú',
-    0x5D5C: 'qí',
-    0x5D5D: 'lǒu',
-    0x5D5E: 'tú',
-    0x5D5F: 'duī',
-    0x5D60: 'xī',
-    0x5D61: 'wěng',
-    0x5D62: 'cāng',
-    0x5D63: 'dàng,táng',
-    0x5D64: 'róng,yíng',
-    0x5D65: 'jié',
-    0x5D66: 'kǎi,ái',
-    0x5D67: 'liú',
-    0x5D68: 'wù',
-    0x5D69: 'sōng',
-    0x5D6A: 'qiāo,kāo',
-    0x5D6B: 'zī',
-    0x5D6C: 'wéi,wěi',
-    0x5D6D: 'bēng',
-    0x5D6E: 'diān',
-    0x5D6F: 'cuó,cī',
-    0x5D70: 'qiǎn',
-    0x5D71: 'yǒng,yóng',
-    0x5D72: 'niè',
-    0x5D73: 'cuó',
-    0x5D74: 'jǐ,jí',
-    0x5D75: 'shí',
-    0x5D76: 'ruò',
-    0x5D77: 'sǒng',
-    0x5D78: 'zōng',
-    0x5D79: 'jiàng',
-    0x5D7A: 'liáo,jiāo',
-    0x5D7B: 'kāng',
-    0x5D7C: 'chǎn',
-    0x5D7D: 'dié,dì',
-    0x5D7E: 'cēn,cān',
-    0x5D7F: 'dǐng',
-    0x5D80: 'tū',
-    0x5D81: 'lǒu',
-    0x5D82: 'zhàng',
-    0x5D83: 'zhǎn',
-    0x5D84: 'zhǎn,chán',
-    0x5D85: 'áo,ào',
-    0x5D86: 'cáo',
-    0x5D87: 'qū',
-    0x5D88: 'qiāng',
-    0x5D89: 'cuī,zuǐ',
-    0x5D8A: 'zuǐ',
-    0x5D8B: 'dǎo',
-    0x5D8C: 'dǎo',
-    0x5D8D: 'xí',
-    0x5D8E: 'yù',
-    0x5D8F: 'pèi,pǐ',
-    0x5D90: 'lóng',
-    0x5D91: 'xiàng',
-    0x5D92: 'céng,zhēng',
-    0x5D93: 'bō',
-    0x5D94: 'qīn',
-    0x5D95: 'jiāo',
-    0x5D96: 'yān',
-    0x5D97: 'láo',
-    0x5D98: 'zhàn',
-    0x5D99: 'lín,lǐn',
-    0x5D9A: 'liáo',
-    0x5D9B: 'liáo',
-    0x5D9C: 'jīn,qín',
-    0x5D9D: 'dèng',
-    0x5D9E: 'duò',
-    0x5D9F: 'zūn',
-    0x5DA0: 'jiào,qiáo',
-    0x5DA1: 'guì,jué',
-    0x5DA2: 'yáo',
-    0x5DA3: 'jiāo',
-    0x5DA4: 'yáo',
-    0x5DA5: 'jué',
-    0x5DA6: 'zhān,shàn',
-    0x5DA7: 'yì',
-    0x5DA8: 'xué',
-    0x5DA9: 'náo',
-    0x5DAA: 'yè',
-    0x5DAB: 'yè',
-    0x5DAC: 'yí,yǐ',
-    0x5DAD: 'niè',
-    0x5DAE: 'xiǎn,yǎn',
-    0x5DAF: 'jí',
-    0x5DB0: 'xiè,jiè',
-    0x5DB1: 'kě',
-    0x5DB2: 'xī',
-    0x5DB3: 'dì',
-    0x5DB4: 'ào',
-    0x5DB5: 'zuǐ',
-    0x5DB6: 'wēi',
-    0x5DB7: 'yí,nì',
-    0x5DB8: 'róng',
-    0x5DB9: 'dǎo',
-    0x5DBA: 'lǐng',
-    0x5DBB: 'jié',
-    0x5DBC: 'yǔ,xù',
-    0x5DBD: 'yuè',
-    0x5DBE: 'yǐn',
-    0x5DBF: 'ru',
-    0x5DC0: 'jié',
-    0x5DC1: 'lì,liè',
-    0x5DC2: 'guī,xī,juàn',
-    0x5DC3: 'lóng',
-    0x5DC4: 'lóng',
-    0x5DC5: 'diān',
-    0x5DC6: 'róng,hōng,yíng',
-    0x5DC7: 'xī',
-    0x5DC8: 'jú',
-    0x5DC9: 'chán',
-    0x5DCA: 'yǐng',
-    0x5DCB: 'kuī,kuì,wěi',
-    0x5DCC: 'yán',
-    0x5DCD: 'wēi',
-    0x5DCE: 'náo',
-    0x5DCF: 'quán',
-    0x5DD0: 'chǎo',
-    0x5DD1: 'cuán',
-    0x5DD2: 'luán',
-    0x5DD3: 'diān',
-    0x5DD4: 'diān',
-    0x5DD5: 'niè',
-    0x5DD6: 'yán',
-    0x5DD7: 'yán',
-    0x5DD8: 'yǎn',
-    0x5DD9: 'kuí,náo',
-    0x5DDA: 'yǎn',
-    0x5DDB: 'chuān,shùn',
-    0x5DDC: 'kuài,huān',
-    0x5DDD: 'chuān',
-    0x5DDE: 'zhōu',
-    0x5DDF: 'huāng',
-    0x5DE0: 'jīng,xíng',
-    0x5DE1: 'xún,yán,shùn',
-    0x5DE2: 'cháo,chào',
-    0x5DE3: 'cháo',
-    0x5DE4: 'liè',
-    0x5DE5: 'gōng',
-    0x5DE6: 'zuǒ',
-    0x5DE7: 'qiǎo',
-    0x5DE8: 'jù,qú',
-    0x5DE9: 'gǒng',
-    0x5DEA: 'jù',
-    0x5DEB: 'wū',
-    0x5DEC: 'pu',
-    0x5DED: 'pu',
-    0x5DEE: 'chà,chā,chāi,cī,chài,cuō,jiē',
-    0x5DEF: 'qiú',
-    0x5DF0: 'qiú',
-    0x5DF1: 'jǐ,qǐ',
-    0x5DF2: 'yǐ,sì',
-    0x5DF3: 'sì,yǐ',
-    0x5DF4: 'bā',
-    0x5DF5: 'zhī',
-    0x5DF6: 'zhāo',
-    0x5DF7: 'xiàng,hàng',
-    0x5DF8: 'yí',
-    0x5DF9: 'jǐn',
-    0x5DFA: 'xùn',
-    0x5DFB: 'juàn',
-    0x5DFC: 'bā',
-    0x5DFD: 'xùn,zhuàn',
-    0x5DFE: 'jīn',
-    0x5DFF: 'fú,pó',
-    0x5E00: 'zā',
-    0x5E01: 'bì,yìn',
-    0x5E02: 'shì,fú',
-    0x5E03: 'bù',
-    0x5E04: 'dīng',
-    0x5E05: 'shuài',
-    0x5E06: 'fān,fán,fàn',
-    0x5E07: 'niè',
-    0x5E08: 'shī',
-    0x5E09: 'fēn',
-    0x5E0A: 'pà,pā',
-    0x5E0B: 'zhǐ',
-    0x5E0C: 'xī',
-    0x5E0D: 'hù',
-    0x5E0E: 'dàn',
-    0x5E0F: 'wéi',
-    0x5E10: 'zhàng',
-    0x5E11: 'tǎng,nú',
-    0x5E12: 'dài',
-    0x5E13: 'mò,wà',
-    0x5E14: 'pèi,pī',
-    0x5E15: 'pà,mò',
-    0x5E16: 'tiē,tiě,tiè',
-    0x5E17: 'bō,fú',
-    0x5E18: 'lián,chén',
-    0x5E19: 'zhì',
-    0x5E1A: 'zhǒu',
-    0x5E1B: 'bó',
-    0x5E1C: 'zhì',
-    0x5E1D: 'dì',
-    0x5E1E: 'mò',
-    0x5E1F: 'yì',
-    0x5E20: 'yì',
-    0x5E21: 'píng',
-    0x5E22: 'qià',
-    0x5E23: 'juǎn,juàn',
-    0x5E24: 'rú',
-    0x5E25: 'shuài',
-    0x5E26: 'dài',
-    0x5E27: 'zhèng,zhēn',
-    0x5E28: 'shuì',
-    0x5E29: 'qiào',
-    0x5E2A: 'zhēn',
-    0x5E2B: 'shī',
-    0x5E2C: 'qún',
-    0x5E2D: 'xí',
-    0x5E2E: 'bāng',
-    0x5E2F: 'dài',
-    0x5E30: 'guī',
-    0x5E31: 'chóu,dào',
-    0x5E32: 'píng',
-    0x5E33: 'zhàng',
-    0x5E34: 'sàn,jiǎn,jiān',
-    0x5E35: 'wān',
-    0x5E36: 'dài',
-    0x5E37: 'wéi',
-    0x5E38: 'cháng',
-    0x5E39: 'shà,qiè',
-    0x5E3A: 'qí,jì',
-    0x5E3B: 'zé',
-    0x5E3C: 'guó',
-    0x5E3D: 'mào',
-    0x5E3E: 'dǔ',
-    0x5E3F: 'hóu',
-    0x5E40: 'zhèng',
-    0x5E41: 'xū',
-    0x5E42: 'mì',
-    0x5E43: 'wéi',
-    0x5E44: 'wò',
-    0x5E45: 'fú,bī',
-    0x5E46: 'yì,kài',
-    0x5E47: 'bāng',
-    0x5E48: 'píng',
-    0x5E49: 'dié',
-    0x5E4A: 'gōng',
-    0x5E4B: 'pán',
-    0x5E4C: 'huǎng',
-    0x5E4D: 'tāo',
-    0x5E4E: 'mì',
-    0x5E4F: 'jià',
-    0x5E50: 'téng',
-    0x5E51: 'huī',
-    0x5E52: 'zhōng',
-    0x5E53: 'shān,shēn,qiāo',
-    0x5E54: 'màn',
-    0x5E55: 'mù,màn',
-    0x5E56: 'biāo',
-    0x5E57: 'guó',
-    0x5E58: 'zé,cè',
-    0x5E59: 'mù',
-    0x5E5A: 'bāng',
-    0x5E5B: 'zhàng',
-    0x5E5C: 'jǐng',
-    0x5E5D: 'chǎn,chàn',
-    0x5E5E: 'fú',
-    0x5E5F: 'zhì',
-    0x5E60: 'hū,wú',
-    0x5E61: 'fān',
-    0x5E62: 'chuáng,zhuàng',
-    0x5E63: 'bì',
-    0x5E64: 'bì',
-    0x5E65: 'zhǎng',
-    0x5E66: 'mì',
-    0x5E67: 'qiāo',
-    0x5E68: 'chān,chàn',
-    0x5E69: 'fén,fèn',
-    0x5E6A: 'méng,měng',
-    0x5E6B: 'bāng',
-    0x5E6C: 'chóu,dào',
-    0x5E6D: 'miè',
-    0x5E6E: 'chú',
-    0x5E6F: 'jié',
-    0x5E70: 'xiǎn',
-    0x5E71: 'lán',
-    0x5E72: 'gàn,gān,àn',
-    0x5E73: 'píng,pián,bìng,bēng',
-    0x5E74: 'nián,nìng',
-    0x5E75: 'jiān,qiān',
-    0x5E76: 'bìng,bīng',
-    0x5E77: 'bìng,bīng',
-    0x5E78: 'xìng,niè',
-    0x5E79: 'gàn,gān,hán,guǎn',
-    0x5E7A: 'yāo,mì',
-    0x5E7B: 'huàn',
-    0x5E7C: 'yòu,yào',
-    0x5E7D: 'yōu',
-    0x5E7E: 'jǐ,jī,jì,qí',
-    0x5E7F: 'guǎng,yǎn,ān',
-    0x5E80: 'pǐ',
-    0x5E81: 'tīng',
-    0x5E82: 'zè',
-    0x5E83: 'guǎng',
-    0x5E84: 'zhuāng,péng',
-    0x5E85: 'mó',
-    0x5E86: 'qìng',
-    0x5E87: 'bì,pí,pǐ',
-    0x5E88: 'qín',
-    0x5E89: 'dùn,tún',
-    0x5E8A: 'chuáng',
-    0x5E8B: 'guǐ,guì',
-    0x5E8C: 'yǎ,yá',
-    0x5E8D: 'bài,xìn,tīng',
-    0x5E8E: 'jiè',
-    0x5E8F: 'xù',
-    0x5E90: 'lú',
-    0x5E91: 'wǔ',
-    0x5E92: 'zhuāng',
-    0x5E93: 'kù',
-    0x5E94: 'yīng,yìng',
-    0x5E95: 'dǐ,de',
-    0x5E96: 'páo',
-    0x5E97: 'diàn',
-    0x5E98: 'yā',
-    0x5E99: 'miào',
-    0x5E9A: 'gēng',
-    0x5E9B: 'cì',
-    0x5E9C: 'fǔ',
-    0x5E9D: 'tóng',
-    0x5E9E: 'páng',
-    0x5E9F: 'fèi',
-    0x5EA0: 'xiáng',
-    0x5EA1: 'yǐ',
-    0x5EA2: 'zhì',
-    0x5EA3: 'tiāo',
-    0x5EA4: 'zhì',
-    0x5EA5: 'xiū',
-    0x5EA6: 'dù,duó,zhái',
-    0x5EA7: 'zuò',
-    0x5EA8: 'xiāo',
-    0x5EA9: 'tú',
-    0x5EAA: 'guǐ',
-    0x5EAB: 'kù',
-    0x5EAC: 'máng,méng',
-    0x5EAD: 'tíng',
-    0x5EAE: 'yǒu,yóu',
-    0x5EAF: 'bū',
-    0x5EB0: 'bìng,bǐng',
-    0x5EB1: 'chěng',
-    0x5EB2: 'lái',
-    0x5EB3: 'bì,pí',
-    0x5EB4: 'jí,jī',
-    0x5EB5: 'ān,yǎn,è',
-    0x5EB6: 'shù,zhù,zhē',
-    0x5EB7: 'kāng,kàng',
-    0x5EB8: 'yōng,yóng',
-    0x5EB9: 'tuǒ',
-    0x5EBA: 'sōng',
-    0x5EBB: 'shù',
-    0x5EBC: 'qǐng',
-    0x5EBD: 'yù',
-    0x5EBE: 'yǔ,yú',
-    0x5EBF: 'miào',
-    0x5EC0: 'sōu',
-    0x5EC1: 'cè,cì,zè,si',
-    0x5EC2: 'xiāng',
-    0x5EC3: 'fèi',
-    0x5EC4: 'jiù',
-    0x5EC5: 'è',
-    0x5EC6: 'guī,wěi,huì',
-    0x5EC7: 'liù',
-    0x5EC8: 'shà,xià',
-    0x5EC9: 'lián',
-    0x5ECA: 'láng',
-    0x5ECB: 'sōu',
-    0x5ECC: 'zhì',
-    0x5ECD: 'bù',
-    0x5ECE: 'qǐng,qìng,qīng',
-    0x5ECF: 'jiù',
-    0x5ED0: 'jiù',
-    0x5ED1: 'jǐn,qín',
-    0x5ED2: 'áo',
-    0x5ED3: 'kuò',
-    0x5ED4: 'lóu',
-    0x5ED5: 'yìn',
-    0x5ED6: 'liào,liáo',
-    0x5ED7: 'dài',
-    0x5ED8: 'lù',
-    0x5ED9: 'yì',
-    0x5EDA: 'chú',
-    0x5EDB: 'chán',
-    0x5EDC: 'tú',
-    0x5EDD: 'sī',
-    0x5EDE: 'xīn,qiàn',
-    0x5EDF: 'miào',
-    0x5EE0: 'chǎng',
-    0x5EE1: 'wǔ,wú',
-    0x5EE2: 'fèi',
-    0x5EE3: 'guǎng,guàng,kuàng,guāng',
-    0x5EE4: 'kù',
-    0x5EE5: 'kuài',
-    0x5EE6: 'bì',
-    0x5EE7: 'qiáng,sè',
-    0x5EE8: 'xiè',
-    0x5EE9: 'lǐn,lǎn',
-    0x5EEA: 'lǐn',
-    0x5EEB: 'liáo',
-    0x5EEC: 'lú,lǘ',
-    0x5EED: 'jì',
-    0x5EEE: 'yǐng',
-    0x5EEF: 'xiān',
-    0x5EF0: 'tīng',
-    0x5EF1: 'yōng',
-    0x5EF2: 'lí',
-    0x5EF3: 'tīng',
-    0x5EF4: 'yǐn,yìn',
-    0x5EF5: 'xún',
-    0x5EF6: 'yán',
-    0x5EF7: 'tíng',
-    0x5EF8: 'dí',
-    0x5EF9: 'pǎi,pò',
-    0x5EFA: 'jiàn',
-    0x5EFB: 'huí',
-    0x5EFC: 'nǎi',
-    0x5EFD: 'huí',
-    0x5EFE: 'gǒng',
-    0x5EFF: 'niàn',
-    0x5F00: 'kāi',
-    0x5F01: 'biàn,pán',
-    0x5F02: 'yì,yí',
-    0x5F03: 'qì',
-    0x5F04: 'nòng,lòng',
-    0x5F05: 'fèn',
-    0x5F06: 'jǔ,qǔ',
-    0x5F07: 'yǎn,yān,nán',
-    0x5F08: 'yì',
-    0x5F09: 'zàng',
-    0x5F0A: 'bì',
-    0x5F0B: 'yì',
-    0x5F0C: 'yī',
-    0x5F0D: 'èr',
-    0x5F0E: 'sān',
-    0x5F0F: 'shì,tè',
-    0x5F10: 'èr',
-    0x5F11: 'shì',
-    0x5F12: 'shì',
-    0x5F13: 'gōng',
-    0x5F14: 'diào,dì',
-    0x5F15: 'yǐn',
-    0x5F16: 'hù',
-    0x5F17: 'fú',
-    0x5F18: 'hóng',
-    0x5F19: 'wū',
-    0x5F1A: 'tuí',
-    0x5F1B: 'chí',
-    0x5F1C: 'jiàng',
-    0x5F1D: 'bà',
-    0x5F1E: 'shěn',
-    0x5F1F: 'dì,tì,tuí',
-    0x5F20: 'zhāng',
-    0x5F21: 'jué,zhāng',
-    0x5F22: 'tāo',
-    0x5F23: 'fǔ',
-    0x5F24: 'dǐ',
-    0x5F25: 'mí',
-    0x5F26: 'xián',
-    0x5F27: 'hú',
-    0x5F28: 'chāo',
-    0x5F29: 'nǔ',
-    0x5F2A: 'jìng',
-    0x5F2B: 'zhěn',
-    0x5F2C: 'yí',
-    0x5F2D: 'mǐ',
-    0x5F2E: 'quān,juàn',
-    0x5F2F: 'wān',
-    0x5F30: 'shāo',
-    0x5F31: 'ruò',
-    0x5F32: 'xuān,yuān',
-    0x5F33: 'jìng',
-    0x5F34: 'diāo',
-    0x5F35: 'zhāng,zhàng',
-    0x5F36: 'jiàng',
-    0x5F37: 'qiáng,jiàng,qiǎng',
-    0x5F38: 'péng,pēng',
-    0x5F39: 'dàn,tán',
-    0x5F3A: 'qiáng,jiàng,qiǎng',
-    0x5F3B: 'bì',
-    0x5F3C: 'bì',
-    0x5F3D: 'shè',
-    0x5F3E: 'dàn',
-    0x5F3F: 'jiǎn',
-    0x5F40: 'gòu,kōu',
-    0x5F41: 'gē',
-    0x5F42: 'fā',
-    0x5F43: 'bì',
-    0x5F44: 'kōu',
-    0x5F45: 'jiǎn',
-    0x5F46: 'biè',
-    0x5F47: 'xiāo',
-    0x5F48: 'dàn,tán',
-    0x5F49: 'guō',
-    0x5F4A: 'jiàng,qiáng,qiǎng,jiāng',
-    0x5F4B: 'hóng',
-    0x5F4C: 'mí,mǐ,ní',
-    0x5F4D: 'guō',
-    0x5F4E: 'wān',
-    0x5F4F: 'jué',
-    0x5F50: 'jì',
-    0x5F51: 'jì',
-    0x5F52: 'guī',
-    0x5F53: 'dāng,dàng',
-    0x5F54: 'lù',
-    0x5F55: 'lù',
-    0x5F56: 'tuàn,shǐ',
-    0x5F57: 'huì,suì',
-    0x5F58: 'zhì',
-    0x5F59: 'huì',
-    0x5F5A: 'huì',
-    0x5F5B: 'yí',
-    0x5F5C: 'yí',
-    0x5F5D: 'yí',
-    0x5F5E: 'yí',
-    0x5F5F: 'yuē',
-    0x5F60: 'yuē',
-    0x5F61: 'shān,xiǎn',
-    0x5F62: 'xíng',
-    0x5F63: 'wén',
-    0x5F64: 'tóng',
-    0x5F65: 'yàn',
-    0x5F66: 'yàn,pán',
-    0x5F67: 'yù',
-    0x5F68: 'chī',
-    0x5F69: 'cǎi',
-    0x5F6A: 'biāo',
-    0x5F6B: 'diāo',
-    0x5F6C: 'bīn,bān',
-    0x5F6D: 'péng,páng,bāng,pēng',
-    0x5F6E: 'yǒng',
-    0x5F6F: 'piāo,piào,miǎo',
-    0x5F70: 'zhāng',
-    0x5F71: 'yǐng',
-    0x5F72: 'chī',
-    0x5F73: 'chì,fú',
-    0x5F74: 'zhuó,bó',
-    0x5F75: 'tuǒ,yí',
-    0x5F76: 'jí',
-    0x5F77: 'páng,fǎng,fáng',
-    0x5F78: 'zhōng',
-    0x5F79: 'yì',
-    0x5F7A: 'wáng',
-    0x5F7B: 'chè',
-    0x5F7C: 'bǐ',
-    0x5F7D: 'dī',
-    0x5F7E: 'líng,lǐng',
-    0x5F7F: 'fú',
-    0x5F80: 'wǎng,wàng',
-    0x5F81: 'zhēng',
-    0x5F82: 'cú',
-    0x5F83: 'wǎng',
-    0x5F84: 'jìng',
-    0x5F85: 'dài,dāi',
-    0x5F86: 'xī',
-    0x5F87: 'xùn',
-    0x5F88: 'hěn',
-    0x5F89: 'yáng',
-    0x5F8A: 'huái,huí',
-    0x5F8B: 'lǜ',
-    0x5F8C: 'hòu',
-    0x5F8D: 'wǎng,wā',
-    0x5F8E: 'chěng,zhèng',
-    0x5F8F: 'zhì',
-    0x5F90: 'xú',
-    0x5F91: 'jìng,jīng',
-    0x5F92: 'tú',
-    0x5F93: 'cóng',
-    0x5F94: 'zhi',
-    0x5F95: 'lái,lài',
-    0x5F96: 'cóng',
-    0x5F97: 'dé,de,děi',
-    0x5F98: 'pái',
-    0x5F99: 'xǐ,sī',
-    0x5F9A: 'dōng',
-    0x5F9B: 'jì',
-    0x5F9C: 'cháng',
-    0x5F9D: 'zhì',
-    0x5F9E: 'cóng,zòng,zōng,cōng,zǒng',
-    0x5F9F: 'zhōu',
-    0x5FA0: 'lái,lài',
-    0x5FA1: 'yù,yà',
-    0x5FA2: 'xiè',
-    0x5FA3: 'jiè',
-    0x5FA4: 'jiàn',
-    0x5FA5: 'shì,tǐ',
-    0x5FA6: 'jiǎ,xiá',
-    0x5FA7: 'biàn,pián,piān',
-    0x5FA8: 'huáng',
-    0x5FA9: 'fù',
-    0x5FAA: 'xún',
-    0x5FAB: 'wěi',
-    0x5FAC: 'páng,bàng',
-    0x5FAD: 'yáo',
-    0x5FAE: 'wēi',
-    0x5FAF: 'xī,xí',
-    0x5FB0: 'zhēng',
-    0x5FB1: 'piào',
-    0x5FB2: 'tí,chí',
-    0x5FB3: 'dé',
-    0x5FB4: 'zhēng',
-    0x5FB5: 'zhēng,zhǐ,chéng',
-    0x5FB6: 'bié',
-    0x5FB7: 'dé',
-    0x5FB8: 'chōng,zhōng,zhǒng',
-    0x5FB9: 'chè',
-    0x5FBA: 'jiǎo',
-    0x5FBB: 'huì',
-    0x5FBC: 'jiǎo,jiào,jiāo,yāo',
-    0x5FBD: 'huī',
-    0x5FBE: 'méi',
-    0x5FBF: 'lòng,lǒng',
-    0x5FC0: 'xiāng,rǎng',
-    0x5FC1: 'bào',
-    0x5FC2: 'qú,jù',
-    0x5FC3: 'xīn',
-    0x5FC4: 'xin',
-    0x5FC5: 'bì',
-    0x5FC6: 'yì',
-    0x5FC7: 'lè',
-    0x5FC8: 'rén',
-    0x5FC9: 'dāo',
-    0x5FCA: 'dìng,tìng',
-    0x5FCB: 'gǎi',
-    0x5FCC: 'jì',
-    0x5FCD: 'rěn,rèn',
-    0x5FCE: 'rén',
-    0x5FCF: 'chàn,qiǎn,qiān',
-    0x5FD0: 'tǎn,kěng',
-    0x5FD1: 'tè,dǎo',
-    0x5FD2: 'tè,tuī,tēi',
-    0x5FD3: 'gān,hàn',
-    0x5FD4: 'qì,yì',
-    0x5FD5: 'shì,tài',
-    0x5FD6: 'cǔn',
-    0x5FD7: 'zhì',
-    0x5FD8: 'wàng,wáng',
-    0x5FD9: 'máng',
-    0x5FDA: 'xī,liě',
-    0x5FDB: 'fān',
-    0x5FDC: 'yīng',
-    0x5FDD: 'tiǎn',
-    0x5FDE: 'mín,wěn',
-    0x5FDF: 'wěn',
-    0x5FE0: 'zhōng',
-    0x5FE1: 'chōng',
-    0x5FE2: 'wù',
-    0x5FE3: 'jí',
-    0x5FE4: 'wǔ,wù',
-    0x5FE5: 'xì',
-    0x5FE6: 'jiá',
-    0x5FE7: 'yōu,yòu',
-    0x5FE8: 'wàn,wán',
-    0x5FE9: 'cōng',
-    0x5FEA: 'sōng,zhōng',
-    0x5FEB: 'kuài',
-    0x5FEC: 'yù,shū',
-    0x5FED: 'biàn',
-    0x5FEE: 'zhì,qí',
-    0x5FEF: 'qí,shì',
-    0x5FF0: 'cuì',
-    0x5FF1: 'chén,dàn',
-    0x5FF2: 'tài',
-    0x5FF3: 'tún,zhūn,dùn',
-    0x5FF4: 'qián,qín',
-    0x5FF5: 'niàn',
-    0x5FF6: 'hún',
-    0x5FF7: 'xiōng',
-    0x5FF8: 'niǔ',
-    0x5FF9: 'kuáng,wǎng',
-    0x5FFA: 'xiān',
-    0x5FFB: 'xīn',
-    0x5FFC: 'kāng,hāng,hàng',
-    0x5FFD: 'hū',
-    0x5FFE: 'kài,qì',
-    0x5FFF: 'fèn',
-    0x6000: 'huái,fù',
-    0x6001: 'tài',
-    0x6002: 'sǒng',
-    0x6003: 'wǔ',
-    0x6004: 'òu',
-    0x6005: 'chàng',
-    0x6006: 'chuàng',
-    0x6007: 'jù',
-    0x6008: 'yì',
-    0x6009: 'bǎo,bào',
-    0x600A: 'chāo',
-    0x600B: 'mín,mén',
-    0x600C: 'pēi',
-    0x600D: 'zuò,zhà',
-    0x600E: 'zěn',
-    0x600F: 'yàng,yāng',
-    0x6010: 'jù,kòu',
-    0x6011: 'bàn',
-    0x6012: 'nù',
-    0x6013: 'náo,niú',
-    0x6014: 'zhēng,zhèng',
-    0x6015: 'pà,bó',
-    0x6016: 'bù',
-    0x6017: 'tiē,zhān',
-    0x6018: 'hù,gù',
-    0x6019: 'hù,tiē',
-    0x601A: 'jù,qū,cū,zū',
-    0x601B: 'dá,dàn',
-    0x601C: 'lián,líng,lǐng',
-    0x601D: 'sī,sāi',
-    0x601E: 'chóu,yóu',
-    0x601F: 'dì',
-    0x6020: 'dài,yí',
-    0x6021: 'yí',
-    0x6022: 'tū,dié,tuì',
-    0x6023: 'yóu',
-    0x6024: 'fū',
-    0x6025: 'jí',
-    0x6026: 'pēng',
-    0x6027: 'xìng',
-    0x6028: 'yuàn,yùn',
-    0x6029: 'ní',
-    0x602A: 'guài',
-    0x602B: 'fú,fèi,bèi',
-    0x602C: 'xì',
-    0x602D: 'bì',
-    0x602E: 'yōu,yào',
-    0x602F: 'qiè',
-    0x6030: 'xuàn',
-    0x6031: 'cōng',
-    0x6032: 'bǐng',
-    0x6033: 'huǎng',
-    0x6034: 'xù,xuè',
-    0x6035: 'chù,xù',
-    0x6036: 'bì,pī',
-    0x6037: 'shù',
-    0x6038: 'xī',
-    0x6039: 'tān',
-    0x603A: 'yǒng',
-    0x603B: 'zǒng',
-    0x603C: 'duì',
-    0x603D: 'mo',
-    0x603E: 'zhǐ',
-    0x603F: 'yì',
-    0x6040: 'shì',
-    0x6041: 'nèn,rèn,nín',
-    0x6042: 'xún,shùn',
-    0x6043: 'shì,zhì',
-    0x6044: 'xì',
-    0x6045: 'lǎo',
-    0x6046: 'héng,gèng',
-    0x6047: 'kuāng',
-    0x6048: 'móu',
-    0x6049: 'zhǐ',
-    0x604A: 'xié',
-    0x604B: 'liàn',
-    0x604C: 'tiāo,yáo',
-    0x604D: 'huǎng,guāng',
-    0x604E: 'dié',
-    0x604F: 'hào',
-    0x6050: 'kǒng',
-    0x6051: 'guǐ,wéi',
-    0x6052: 'héng',
-    0x6053: 'xī,qī,xù',
-    0x6054: 'jiǎo,xiào',
-    0x6055: 'shù',
-    0x6056: 'sī',
-    0x6057: 'hū,kuā',
-    0x6058: 'qiū',
-    0x6059: 'yàng',
-    0x605A: 'huì',
-    0x605B: 'huí',
-    0x605C: 'chì',
-    0x605D: 'jiá,qì',
-    0x605E: 'yí',
-    0x605F: 'xiōng',
-    0x6060: 'guài',
-    0x6061: 'lìn',
-    0x6062: 'huī',
-    0x6063: 'zì',
-    0x6064: 'xù',
-    0x6065: 'chǐ',
-    0x6066: 'shàng',
-    0x6067: 'nǜ',
-    0x6068: 'hèn',
-    0x6069: 'ēn',
-    0x606A: 'kè',
-    0x606B: 'dòng,tōng',
-    0x606C: 'tián',
-    0x606D: 'gōng',
-    0x606E: 'quān,zhuān',
-    0x606F: 'xī',
-    0x6070: 'qià',
-    0x6071: 'yuè',
-    0x6072: 'pēng',
-    0x6073: 'kěn',
-    0x6074: 'dé',
-    0x6075: 'huì',
-    0x6076: 'è,ě,wù,wū',
-    0x6077: 'xiao',
-    0x6078: 'tòng',
-    0x6079: 'yān',
-    0x607A: 'kǎi',
-    0x607B: 'cè',
-    0x607C: 'nǎo',
-    0x607D: 'yùn',
-    0x607E: 'máng',
-    0x607F: 'yǒng,tōng',
-    0x6080: 'yǒng',
-    0x6081: 'yuān,juàn',
-    0x6082: 'pī,bī,pǐ',
-    0x6083: 'kǔn',
-    0x6084: 'qiāo,qiǎo,qiào',
-    0x6085: 'yuè',
-    0x6086: 'yù,shū',
-    0x6087: 'tú,yú',
-    0x6088: 'jiè,kè',
-    0x6089: 'xī',
-    0x608A: 'zhé',
-    0x608B: 'lìn',
-    0x608C: 'tì',
-    0x608D: 'hàn',
-    0x608E: 'hào,jiào',
-    0x608F: 'qiè',
-    0x6090: 'tì',
-    0x6091: 'bù',
-    0x6092: 'yì',
-    0x6093: 'qiàn',
-    0x6094: 'huǐ',
-    0x6095: 'xī',
-    0x6096: 'bèi,běi',
-    0x6097: 'mán,mèn',
-    0x6098: 'yī,yì',
-    0x6099: 'hēng,hèng',
-    0x609A: 'sǒng',
-    0x609B: 'quān,xún',
-    0x609C: 'chěng',
-    0x609D: 'kuī,lǐ',
-    0x609E: 'wù',
-    0x609F: 'wù',
-    0x60A0: 'yōu',
-    0x60A1: 'lí',
-    0x60A2: 'liàng,lǎng',
-    0x60A3: 'huàn',
-    0x60A4: 'cōng',
-    0x60A5: 'yì',
-    0x60A6: 'yuè',
-    0x60A7: 'lì',
-    0x60A8: 'nín',
-    0x60A9: 'nǎo',
-    0x60AA: 'è',
-    0x60AB: 'què',
-    0x60AC: 'xuán',
-    0x60AD: 'qiān',
-    0x60AE: 'wù',
-    0x60AF: 'mǐn',
-    0x60B0: 'cóng',
-    0x60B1: 'fěi',
-    0x60B2: 'bēi',
-    0x60B3: 'dé',
-    0x60B4: 'cuì',
-    0x60B5: 'chàng',
-    0x60B6: 'mèn,mēn',
-    0x60B7: 'lì',
-    0x60B8: 'jì',
-    0x60B9: 'guàn',
-    0x60BA: 'guàn',
-    0x60BB: 'xìng',
-    0x60BC: 'dào',
-    0x60BD: 'qī,qì',
-    0x60BE: 'kōng,kǒng',
-    0x60BF: 'tiǎn',
-    0x60C0: 'lún,lùn',
-    0x60C1: 'xī',
-    0x60C2: 'kǎn',
-    0x60C3: 'gǔn',
-    0x60C4: 'nì',
-    0x60C5: 'qíng',
-    0x60C6: 'chóu,qiū,dāo',
-    0x60C7: 'dūn',
-    0x60C8: 'guǒ',
-    0x60C9: 'zhān',
-    0x60CA: 'jīng,liáng',
-    0x60CB: 'wǎn',
-    0x60CC: 'yuān,wǎn,yù',
-    0x60CD: 'jīn',
-    0x60CE: 'jì',
-    0x60CF: 'lán,lín',
-    0x60D0: 'yù,xù',
-    0x60D1: 'huò',
-    0x60D2: 'hé',
-    0x60D3: 'quán,juàn',
-    0x60D4: 'tán,dàn',
-    0x60D5: 'tì',
-    0x60D6: 'tì',
-    0x60D7: 'niè',
-    0x60D8: 'wǎng',
-    0x60D9: 'chuò,chuì',
-    0x60DA: 'hū',
-    0x60DB: 'hūn,hǔn,mèn',
-    0x60DC: 'xī',
-    0x60DD: 'chǎng,tǎng',
-    0x60DE: 'xīn',
-    0x60DF: 'wéi,wěi',
-    0x60E0: 'huì',
-    0x60E1: 'è,wù,wū,ě,hū',
-    0x60E2: 'suǒ,ruǐ',
-    0x60E3: 'zǒng',
-    0x60E4: 'jiān',
-    0x60E5: 'yǒng',
-    0x60E6: 'diàn',
-    0x60E7: 'jù',
-    0x60E8: 'cǎn',
-    0x60E9: 'chéng',
-    0x60EA: 'dé',
-    0x60EB: 'bèi',
-    0x60EC: 'qiè',
-    0x60ED: 'cán',
-    0x60EE: 'dàn',
-    0x60EF: 'guàn',
-    0x60F0: 'duò,tuó',
-    0x60F1: 'nǎo',
-    0x60F2: 'yùn',
-    0x60F3: 'xiǎng',
-    0x60F4: 'zhuì,chuǎn,guà',
-    0x60F5: 'dié,tiē',
-    0x60F6: 'huáng',
-    0x60F7: 'chǔn',
-    0x60F8: 'qióng',
-    0x60F9: 'rě,ruò',
-    0x60FA: 'xīng',
-    0x60FB: 'cè',
-    0x60FC: 'biǎn',
-    0x60FD: 'mǐn,hūn',
-    0x60FE: 'zōng',
-    0x60FF: 'tí,shì',
-    0x6100: 'qiǎo,qiù',
-    0x6101: 'chóu,qiǎo,jiū',
-    0x6102: 'bèi',
-    0x6103: 'xuān',
-    0x6104: 'wēi',
-    0x6105: 'gé',
-    0x6106: 'qiān',
-    0x6107: 'wěi',
-    0x6108: 'yù',
-    0x6109: 'yú,tōu,yǔ',
-    0x610A: 'bì',
-    0x610B: 'xuān',
-    0x610C: 'huàn',
-    0x610D: 'mǐn,fēn',
-    0x610E: 'bì',
-    0x610F: 'yì,yī',
-    0x6110: 'miǎn',
-    0x6111: 'yǒng',
-    0x6112: 'kài,qì,hè',
-    0x6113: 'dàng,shāng,táng,yáng',
-    0x6114: 'yīn',
-    0x6115: 'è',
-    0x6116: 'chén,dān,xìn',
-    0x6117: 'mào',
-    0x6118: 'qià,qiā,kè',
-    0x6119: 'kè',
-    0x611A: 'yú',
-    0x611B: 'ài',
-    0x611C: 'qiè',
-    0x611D: 'yǎn',
-    0x611E: 'nuò',
-    0x611F: 'gǎn,hàn',
-    0x6120: 'yùn,yǔn,wěn',
-    0x6121: 'zǒng',
-    0x6122: 'sāi,sī,sǐ',
-    0x6123: 'lèng',
-    0x6124: 'fèn',
-    0x6125: 'yīng',
-    0x6126: 'kuì',
-    0x6127: 'kuì',
-    0x6128: 'què',
-    0x6129: 'gōng,gòng,hǒng',
-    0x612A: 'yún',
-    0x612B: 'sù',
-    0x612C: 'sù,sè',
-    0x612D: 'qí',
-    0x612E: 'yáo,yào',
-    0x612F: 'sǒng',
-    0x6130: 'huàng,huǎng',
-    0x6131: 'jí',
-    0x6132: 'gǔ',
-    0x6133: 'jù',
-    0x6134: 'chuàng,chuǎng',
-    0x6135: 'nì',
-    0x6136: 'xié',
-    0x6137: 'kǎi',
-    0x6138: 'zhěng',
-    0x6139: 'yǒng',
-    0x613A: 'cǎo',
-    0x613B: 'xùn',
-    0x613C: 'shèn',
-    0x613D: 'bó',
-    0x613E: 'kài,xì,qì',
-    0x613F: 'yuàn',
-    0x6140: 'xì,xié',
-    0x6141: 'hùn',
-    0x6142: 'yǒng',
-    0x6143: 'yǎng',
-    0x6144: 'lì',
-    0x6145: 'sāo,cǎo',
-    0x6146: 'tāo',
-    0x6147: 'yīn',
-    0x6148: 'cí',
-    0x6149: 'xù,chù',
-    0x614A: 'qiàn,qiè,xián,qiǎn',
-    0x614B: 'tài',
-    0x614C: 'huāng,huǎng,huang',
-    0x614D: 'yùn',
-    0x614E: 'shèn,zhèn',
-    0x614F: 'mǐng',
-    0x6150: 'gong',
-    0x6151: 'shè',
-    0x6152: 'cóng,cáo',
-    0x6153: 'piāo,piào',
-    0x6154: 'mù',
-    0x6155: 'mù',
-    0x6156: 'guó',
-    0x6157: 'chì',
-    0x6158: 'cǎn',
-    0x6159: 'cán',
-    0x615A: 'cán',
-    0x615B: 'cuī',
-    0x615C: 'mǐn',
-    0x615D: 'tè,nì',
-    0x615E: 'zhāng',
-    0x615F: 'tòng',
-    0x6160: 'ào,áo',
-    0x6161: 'shuǎng',
-    0x6162: 'màn,mán',
-    0x6163: 'guàn',
-    0x6164: 'què',
-    0x6165: 'zào,cào',
-    0x6166: 'jiù',
-    0x6167: 'huì',
-    0x6168: 'kǎi',
-    0x6169: 'lián',
-    0x616A: 'òu,ōu',
-    0x616B: 'sǒng',
-    0x616C: 'qín,jìn,jǐn',
-    0x616D: 'yìn',
-    0x616E: 'lǜ,lǘ',
-    0x616F: 'shāng',
-    0x6170: 'wèi',
-    0x6171: 'tuán',
-    0x6172: 'mán',
-    0x6173: 'qiān,xián',
-    0x6174: 'shè,zhé',
-    0x6175: 'yōng',
-    0x6176: 'qìng,qīng,qiāng',
-    0x6177: 'kāng',
-    0x6178: 'dì,chì',
-    0x6179: 'zhí,zhé',
-    0x617A: 'lóu,lǚ',
-    0x617B: 'juàn',
-    0x617C: 'qī',
-    0x617D: 'qī',
-    0x617E: 'yù',
-    0x617F: 'píng',
-    0x6180: 'liáo',
-    0x6181: 'còng,sōng',
-    0x6182: 'yōu',
-    0x6183: 'chōng',
-    0x6184: 'zhì',
-    0x6185: 'tòng',
-    0x6186: 'chēng',
-    0x6187: 'qì',
-    0x6188: 'qū',
-    0x6189: 'péng',
-    0x618A: 'bèi',
-    0x618B: 'biē',
-    0x618C: 'qióng',
-    0x618D: 'jiāo',
-    0x618E: 'zēng',
-    0x618F: 'chì',
-    0x6190: 'lián',
-    0x6191: 'píng',
-    0x6192: 'kuì',
-    0x6193: 'huì',
-    0x6194: 'qiáo',
-    0x6195: 'chéng,zhèng,dèng',
-    0x6196: 'yìn,xìn,yín',
-    0x6197: 'yìn',
-    0x6198: 'xǐ,xī',
-    0x6199: 'xī,xǐ',
-    0x619A: 'dàn,dá,chǎn',
-    0x619B: 'tán',
-    0x619C: 'duò',
-    0x619D: 'duì',
-    0x619E: 'duì,dùn,tūn',
-    0x619F: 'sù',
-    0x61A0: 'jué',
-    0x61A1: 'cè',
-    0x61A2: 'xiāo,jiāo',
-    0x61A3: 'fān',
-    0x61A4: 'fèn',
-    0x61A5: 'láo',
-    0x61A6: 'lào,láo',
-    0x61A7: 'chōng,zhuàng',
-    0x61A8: 'hān',
-    0x61A9: 'qì',
-    0x61AA: 'xián,xiàn',
-    0x61AB: 'mǐn',
-    0x61AC: 'jǐng',
-    0x61AD: 'liǎo,liáo',
-    0x61AE: 'wǔ,wú',
-    0x61AF: 'cǎn',
-    0x61B0: 'jué',
-    0x61B1: 'cù',
-    0x61B2: 'xiàn,xiǎn',
-    0x61B3: 'tǎn',
-    0x61B4: 'shéng',
-    0x61B5: 'pī',
-    0x61B6: 'yì',
-    0x61B7: 'chù,chǔ',
-    0x61B8: 'xiān',
-    0x61B9: 'náo,nóng,náng,nǎo',
-    0x61BA: 'dàn',
-    0x61BB: 'tǎn',
-    0x61BC: 'jǐng,jìng',
-    0x61BD: 'sōng',
-    0x61BE: 'hàn,dàn',
-    0x61BF: 'jiǎo,jī',
-    0x61C0: 'wèi',
-    0x61C1: 'xuān,huān',
-    0x61C2: 'dǒng',
-    0x61C3: 'qín',
-    0x61C4: 'qín',
-    0x61C5: 'jù',
-    0x61C6: 'cǎo,sāo,sào',
-    0x61C7: 'kěn',
-    0x61C8: 'xiè',
-    0x61C9: 'yīng,yìng',
-    0x61CA: 'ào,yù',
-    0x61CB: 'mào',
-    0x61CC: 'yì',
-    0x61CD: 'lǐn',
-    0x61CE: 'sè',
-    0x61CF: 'jùn',
-    0x61D0: 'huái',
-    0x61D1: 'mèn',
-    0x61D2: 'lǎn',
-    0x61D3: 'ài',
-    0x61D4: 'lǐn,lǎn',
-    0x61D5: 'yān,yàn,yè',
-    0x61D6: 'kuò',
-    0x61D7: 'xià',
-    0x61D8: 'chì',
-    0x61D9: 'yǔ',
-    0x61DA: 'yìn',
-    0x61DB: 'dāi',
-    0x61DC: 'měng,mèng,méng',
-    0x61DD: 'ài,nì,nǐ',
-    0x61DE: 'méng,měng',
-    0x61DF: 'duì',
-    0x61E0: 'qí,jì,jī',
-    0x61E1: 'mǒ',
-    0x61E2: 'lán,xiàn',
-    0x61E3: 'mèn',
-    0x61E4: 'chóu',
-    0x61E5: 'zhì',
-    0x61E6: 'nuò',
-    0x61E7: 'nuò',
-    0x61E8: 'yān',
-    0x61E9: 'yǎng',
-    0x61EA: 'bó',
-    0x61EB: 'zhì',
-    0x61EC: 'kuàng',
-    0x61ED: 'kuǎng',
-    0x61EE: 'yǒu,yōu',
-    0x61EF: 'fū',
-    0x61F0: 'liú,liǔ',
-    0x61F1: 'miè',
-    0x61F2: 'chéng',
-    0x61F3: 'hui',
-    0x61F4: 'chàn',
-    0x61F5: 'měng,mèng',
-    0x61F6: 'lǎn,lài',
-    0x61F7: 'huái',
-    0x61F8: 'xuán',
-    0x61F9: 'ràng',
-    0x61FA: 'chàn',
-    0x61FB: 'jì',
-    0x61FC: 'jù',
-    0x61FD: 'huān,guàn',
-    0x61FE: 'shè',
-    0x61FF: 'yì,yī',
-    0x6200: 'liàn',
-    0x6201: 'nǎn',
-    0x6202: 'mí,mó',
-    0x6203: 'tǎng',
-    0x6204: 'jué',
-    0x6205: 'gàng',
-    0x6206: 'gàng,zhuàng',
-    0x6207: 'zhuàng,gàng',
-    0x6208: 'gē',
-    0x6209: 'yuè',
-    0x620A: 'wù',
-    0x620B: 'jiān',
-    0x620C: 'xū,qu',
-    0x620D: 'shù',
-    0x620E: 'róng,rēng',
-    0x620F: 'xì,hū',
-    0x6210: 'chéng',
-    0x6211: 'wǒ',
-    0x6212: 'jiè',
-    0x6213: 'gē',
-    0x6214: 'jiān,cán',
-    0x6215: 'qiāng,zāng',
-    0x6216: 'huò,yù',
-    0x6217: 'qiāng,qiàng',
-    0x6218: 'zhàn',
-    0x6219: 'dòng',
-    0x621A: 'qī,cù',
-    0x621B: 'jiá,gā',
-    0x621C: 'dié',
-    0x621D: 'zéi',
-    0x621E: 'jiá',
-    0x621F: 'jǐ',
-    0x6220: 'zhī,zhí',
-    0x6221: 'kān,zhěn',
-    0x6222: 'jí',
-    0x6223: 'kuí',
-    0x6224: 'gài',
-    0x6225: 'děng',
-    0x6226: 'zhàn',
-    0x6227: 'qiāng,chuāng,qiàng',
-    0x6228: 'gē',
-    0x6229: 'jiǎn',
-    0x622A: 'jié',
-    0x622B: 'yù',
-    0x622C: 'jiǎn',
-    0x622D: 'yǎn,yǒu',
-    0x622E: 'lù',
-    0x622F: 'hū,xì',
-    0x6230: 'zhàn',
-    0x6231: 'xì',
-    0x6232: 'xì,hū,xī,huī,suō,yī',
-    0x6233: 'chuō',
-    0x6234: 'dài',
-    0x6235: 'qú',
-    0x6236: 'hù',
-    0x6237: 'hù',
-    0x6238: 'hù',
-    0x6239: 'è',
-    0x623A: 'shì,yí',
-    0x623B: 'tì',
-    0x623C: 'mǎo',
-    0x623D: 'hù',
-    0x623E: 'lì',
-    0x623F: 'fáng,páng',
-    0x6240: 'suǒ',
-    0x6241: 'biǎn,piān,biān,pián',
-    0x6242: 'diàn',
-    0x6243: 'jiōng,jiǒng',
-    0x6244: 'shǎng,jiōng',
-    0x6245: 'yí',
-    0x6246: 'yǐ',
-    0x6247: 'shàn,shān',
-    0x6248: 'hù',
-    0x6249: 'fēi',
-    0x624A: 'yǎn',
-    0x624B: 'shǒu',
-    0x624C: 'shou',
-    0x624D: 'cái,zāi',
-    0x624E: 'zhā,zā,zhá,zhǎ',
-    0x624F: 'qiú',
-    0x6250: 'lè,lì,cái',
-    0x6251: 'pū,pì',
-    0x6252: 'bā,pá,bài,bié',
-    0x6253: 'dǎ,dá',
-    0x6254: 'rēng,rèng',
-    0x6255: 'fǎn',
-    0x6256: 'rù',
-    0x6257: 'zài',
-    0x6258: 'tuō',
-    0x6259: 'zhàng',
-    0x625A: 'diǎo,dí,yuē,lì',
-    0x625B: 'káng,gāng',
-    0x625C: 'yū,wū',
-    0x625D: 'kū,wū',
-    0x625E: 'gǎn,hàn',
-    0x625F: 'shēn',
-    0x6260: 'chā,chāi,zhǎ',
-    0x6261: 'tuō,yǐ,chǐ',
-    0x6262: 'gǔ,qì,jié,gē',
-    0x6263: 'kòu',
-    0x6264: 'wù',
-    0x6265: 'dèn',
-    0x6266: 'qiān',
-    0x6267: 'zhí',
-    0x6268: 'rèn',
-    0x6269: 'kuò',
-    0x626A: 'mén',
-    0x626B: 'sǎo,sào',
-    0x626C: 'yáng',
-    0x626D: 'niǔ,chǒu,zhǒu,zhòu',
-    0x626E: 'bàn,fěn,fēn,huǒ',
-    0x626F: 'chě',
-    0x6270: 'rǎo,yòu',
-    0x6271: 'xī,chā,qì',
-    0x6272: 'qián,qín',
-    0x6273: 'bān,pān',
-    0x6274: 'jiá',
-    0x6275: 'yú',
-    0x6276: 'fú,pú',
-    0x6277: 'ào',
-    0x6278: 'xī,zhé',
-    0x6279: 'pī,pí',
-    0x627A: 'zhǐ,qí',
-    0x627B: 'zhì,sǔn,kǎn',
-    0x627C: 'è',
-    0x627D: 'dèn',
-    0x627E: 'zhǎo,huá',
-    0x627F: 'chéng,zhěng,zhèng',
-    0x6280: 'jì,qí',
-    0x6281: 'yǎn',
-    0x6282: 'kuáng,wǎng',
-    0x6283: 'biàn',
-    0x6284: 'chāo,suō,chào,chǎo',
-    0x6285: 'jū',
-    0x6286: 'wěn',
-    0x6287: 'hú',
-    0x6288: 'yuè',
-    0x6289: 'jué',
-    0x628A: 'bǎ,bà,pá',
-    0x628B: 'qìn',
-    0x628C: 'dǎn,shěn',
-    0x628D: 'zhěng',
-    0x628E: 'yǔn',
-    0x628F: 'wán',
-    0x6290: 'nè,nì,nà,ruì',
-    0x6291: 'yì',
-    0x6292: 'shū',
-    0x6293: 'zhuā',
-    0x6294: 'póu',
-    0x6295: 'tóu,dòu',
-    0x6296: 'dǒu',
-    0x6297: 'kàng,gāng',
-    0x6298: 'zhé,shé,zhē,tí',
-    0x6299: 'póu',
-    0x629A: 'fǔ',
-    0x629B: 'pāo',
-    0x629C: 'bá',
-    0x629D: 'ǎo,ào,niù',
-    0x629E: 'zé',
-    0x629F: 'tuán',
-    0x62A0: 'kōu',
-    0x62A1: 'lūn,lún',
-    0x62A2: 'qiǎng,qiāng',
-    0x62A3: 'yun',
-    0x62A4: 'hù',
-    0x62A5: 'bào',
-    0x62A6: 'bǐng',
-    0x62A7: 'zhǐ,zhǎi',
-    0x62A8: 'pēng,bēng',
-    0x62A9: 'nán',
-    0x62AA: 'bù,pū,bá',
-    0x62AB: 'pī',
-    0x62AC: 'tái,chī',
-    0x62AD: 'yǎo,tāo',
-    0x62AE: 'zhěn',
-    0x62AF: 'zhā',
-    0x62B0: 'yāng',
-    0x62B1: 'bào,pāo,pǒu',
-    0x62B2: 'hē,hè,qiā',
-    0x62B3: 'nǐ,ní',
-    0x62B4: 'yè,shé',
-    0x62B5: 'dǐ,zhǐ,qí',
-    0x62B6: 'chì',
-    0x62B7: 'pī,pēi',
-    0x62B8: 'jiā',
-    0x62B9: 'mǒ,mā,mò',
-    0x62BA: 'mèi',
-    0x62BB: 'chēn,shēn',
-    0x62BC: 'yā,xiá,jiǎ',
-    0x62BD: 'chōu',
-    0x62BE: 'qū',
-    0x62BF: 'mǐn',
-    0x62C0: 'chù',
-    0x62C1: 'jiā,yá',
-    0x62C2: 'fú,bì,pì,fèi',
-    0x62C3: 'zhǎ,zhǎn,zhà,zhá',
-    0x62C4: 'zhǔ',
-    0x62C5: 'dān,dàn,dǎn,jiē',
-    0x62C6: 'chāi,chè,chì,cā',
-    0x62C7: 'mǔ',
-    0x62C8: 'niān,niǎn,diān',
-    0x62C9: 'lā,lá,lǎ,là,la',
-    0x62CA: 'fǔ,fū,bǔ',
-    0x62CB: 'pāo',
-    0x62CC: 'bàn,pān',
-    0x62CD: 'pāi,bó',
-    0x62CE: 'līn,līng',
-    0x62CF: 'ná',
-    0x62D0: 'guǎi',
-    0x62D1: 'qián',
-    0x62D2: 'jù,jǔ',
-    0x62D3: 'tuò,tà,zhí',
-    0x62D4: 'bá,bō,bié,fá,bèi',
-    0x62D5: 'tuō',
-    0x62D6: 'tuō,chǐ',
-    0x62D7: 'ǎo,ào,niù,yù',
-    0x62D8: 'jū,gōu,jǔ,jú',
-    0x62D9: 'zhuō',
-    0x62DA: 'pàn,biàn,fèn,fān,pīn',
-    0x62DB: 'zhāo,qiáo,sháo',
-    0x62DC: 'bài,bái',
-    0x62DD: 'bài',
-    0x62DE: 'dǐ',
-    0x62DF: 'nǐ',
-    0x62E0: 'jù',
-    0x62E1: 'kuò',
-    0x62E2: 'lǒng',
-    0x62E3: 'jiǎn',
-    0x62E4: 'qiá',
-    0x62E5: 'yōng',
-    0x62E6: 'lán',
-    0x62E7: 'níng,nǐng,nìng',
-    0x62E8: 'bō',
-    0x62E9: 'zé,zhái',
-    0x62EA: 'qiān',
-    0x62EB: 'hén',
-    0x62EC: 'kuò,guā',
-    0x62ED: 'shì',
-    0x62EE: 'jié,jiá',
-    0x62EF: 'zhěng',
-    0x62F0: 'nǐn',
-    0x62F1: 'gǒng,jú',
-    0x62F2: 'gǒng',
-    0x62F3: 'quán',
-    0x62F4: 'shuān,quán',
-    0x62F5: 'cún,zùn',
-    0x62F6: 'zā,zǎn',
-    0x62F7: 'kǎo',
-    0x62F8: 'yí,chǐ,hài',
-    0x62F9: 'xié',
-    0x62FA: 'cè,sè,chuò',
-    0x62FB: 'huī',
-    0x62FC: 'pīn,bìng',
-    0x62FD: 'zhuāi,zhuài,yè',
-    0x62FE: 'shí,shè,jiè',
-    0x62FF: 'ná',
-    0x6300: 'bāi',
-    0x6301: 'chí',
-    0x6302: 'guà',
-    0x6303: 'zhì,dié',
-    0x6304: 'kuò,guāng',
-    0x6305: 'duǒ,duò',
-    0x6306: 'duǒ',
-    0x6307: 'zhǐ,zhī,zhí',
-    0x6308: 'qiè,qì,jiá,qià,shì',
-    0x6309: 'àn',
-    0x630A: 'nòng',
-    0x630B: 'zhèn',
-    0x630C: 'gé,hé',
-    0x630D: 'jiào,jiāo',
-    0x630E: 'kuà,kū,kōu',
-    0x630F: 'dòng',
-    0x6310: 'ná,rú,nú',
-    0x6311: 'tiāo,tiǎo,táo,diào,tiáo,tiao',
-    0x6312: 'liè',
-    0x6313: 'zhā',
-    0x6314: 'lǚ',
-    0x6315: 'dié,shè',
-    0x6316: 'wā',
-    0x6317: 'jué',
-    0x6318: 'liě',
-    0x6319: 'jǔ',
-    0x631A: 'zhì',
-    0x631B: 'luán',
-    0x631C: 'yà',
-    0x631D: 'wō,zhuā',
-    0x631E: 'tà',
-    0x631F: 'xié,jiā',
-    0x6320: 'náo',
-    0x6321: 'dǎng,dàng',
-    0x6322: 'jiǎo',
-    0x6323: 'zhēng,zhèng',
-    0x6324: 'jǐ',
-    0x6325: 'huī',
-    0x6326: 'xián',
-    0x6327: 'yǔ',
-    0x6328: 'āi,ái',
-    0x6329: 'tuō',
-    0x632A: 'nuó',
-    0x632B: 'cuò,zuò',
-    0x632C: 'bó',
-    0x632D: 'gěng',
-    0x632E: 'tǐ,tì',
-    0x632F: 'zhèn,zhēn,zhěn',
-    0x6330: 'chéng',
-    0x6331: 'sā,shā,suō',
-    0x6332: 'sā,suō,shā',
-    0x6333: 'kēng',
-    0x6334: 'měi',
-    0x6335: 'nòng',
-    0x6336: 'jū',
-    0x6337: 'péng',
-    0x6338: 'jiǎn',
-    0x6339: 'yì',
-    0x633A: 'tǐng,tíng',
-    0x633B: 'shān,yán',
-    0x633C: 'ruá,ruó,suī,luò',
-    0x633D: 'wǎn',
-    0x633E: 'xié,jiā',
-    0x633F: 'chā',
-    0x6340: 'féng',
-    0x6341: 'jiǎo,kù',
-    0x6342: 'wǔ,wú',
-    0x6343: 'jùn',
-    0x6344: 'jiù,jū,qiú',
-    0x6345: 'tǒng',
-    0x6346: 'kǔn,hún',
-    0x6347: 'huò,chì',
-    0x6348: 'tú,shū,chá',
-    0x6349: 'zhuō',
-    0x634A: 'póu,pōu,fū',
-    0x634B: 'lǚ,luō',
-    0x634C: 'bā,bié',
-    0x634D: 'hàn,xiàn,gǎn',
-    0x634E: 'shāo,shào,shǎo,xiāo,qiào',
-    0x634F: 'niē',
-    0x6350: 'juān,yuán',
-    0x6351: 'zè',
-    0x6352: 'shù,sōu,sǒng',
-    0x6353: 'yé,yú',
-    0x6354: 'jué,zhuó',
-    0x6355: 'bǔ',
-    0x6356: 'wán,guā',
-    0x6357: 'bù,pú,zhì',
-    0x6358: 'zùn',
-    0x6359: 'yè',
-    0x635A: 'zhāi',
-    0x635B: 'lǚ',
-    0x635C: 'sōu',
-    0x635D: 'tuō,shuì,yǎn',
-    0x635E: 'lāo',
-    0x635F: 'sǔn',
-    0x6360: 'bāng',
-    0x6361: 'jiǎn',
-    0x6362: 'huàn',
-    0x6363: 'dǎo',
-    0x6364: 'wěi',
-    0x6365: 'wàn,wān,wǎn,yù',
-    0x6366: 'qín',
-    0x6367: 'pěng,fèng',
-    0x6368: 'shě',
-    0x6369: 'liè,lì',
-    0x636A: 'mín',
-    0x636B: 'mén',
-    0x636C: 'fǔ,fù,bǔ',
-    0x636D: 'bǎi,bā,bǐ',
-    0x636E: 'jù,jū',
-    0x636F: 'dáo,dǎo',
-    0x6370: 'wǒ,luò,luǒ',
-    0x6371: 'ái,āi',
-    0x6372: 'juǎn,quán,juàn',
-    0x6373: 'yuè',
-    0x6374: 'zǒng',
-    0x6375: 'chēn,tiǎn,niǎn',
-    0x6376: 'chuí,duǒ',
-    0x6377: 'jié,qiè,chā',
-    0x6378: 'tū',
-    0x6379: 'bèn',
-    0x637A: 'nà',
-    0x637B: 'niǎn,niē,niān',
-    0x637C: 'ruó,wō,wěi,ré',
-    0x637D: 'zuó,cù,sū,zùn',
-    0x637E: 'wò,xiá',
-    0x637F: 'qī',
-    0x6380: 'xiān,hén',
-    0x6381: 'chéng',
-    0x6382: 'diān',
-    0x6383: 'sǎo,sào',
-    0x6384: 'lūn,lún',
-    0x6385: 'qìng',
-    0x6386: 'gāng,gàng',
-    0x6387: 'duō,duó,zhuō',
-    0x6388: 'shòu',
-    0x6389: 'diào,nuó',
-    0x638A: 'póu,pǒu,fù,péi',
-    0x638B: 'dǐ,dì',
-    0x638C: 'zhǎng',
-    0x638D: 'hùn',
-    0x638E: 'jǐ,yǐ',
-    0x638F: 'tāo,táo',
-    0x6390: 'qiā',
-    0x6391: 'qí',
-    0x6392: 'pái,pǎi,bài',
-    0x6393: 'shū',
-    0x6394: 'qiān,wàn',
-    0x6395: 'líng',
-    0x6396: 'yē,yè',
-    0x6397: 'yà,yǎ',
-    0x6398: 'jué,kū',
-    0x6399: 'zhēng',
-    0x639A: 'liǎng',
-    0x639B: 'guà',
-    0x639C: 'yì,nǐ,nái,niè',
-    0x639D: 'huò,xù',
-    0x639E: 'shàn,yàn,yǎn',
-    0x639F: 'zhěng,dìng',
-    0x63A0: 'lüè,lüě',
-    0x63A1: 'cǎi',
-    0x63A2: 'tàn,xián',
-    0x63A3: 'chè',
-    0x63A4: 'bīng',
-    0x63A5: 'jiē,xié,shà,chā',
-    0x63A6: 'tì',
-    0x63A7: 'kòng,kōng,qiāng',
-    0x63A8: 'tuī',
-    0x63A9: 'yǎn,yàn',
-    0x63AA: 'cuò,zé,cì',
-    0x63AB: 'zhōu,zōu,chōu',
-    0x63AC: 'jū',
-    0x63AD: 'tiàn',
-    0x63AE: 'qián',
-    0x63AF: 'kèn',
-    0x63B0: 'bāi',
-    0x63B1: 'pá,shǒu',
-    0x63B2: 'jiē',
-    0x63B3: 'lǔ',
-    0x63B4: 'guāi,guó',
-    0x63B5: 'ming',
-    0x63B6: 'jié',
-    0x63B7: 'zhì,zhī',
-    0x63B8: 'dǎn,shàn',
-    0x63B9: 'meng',
-    0x63BA: 'càn,chān,shǎn',
-    0x63BB: 'sāo',
-    0x63BC: 'guàn',
-    0x63BD: 'pèng',
-    0x63BE: 'yuàn,chuán',
-    0x63BF: 'nuò',
-    0x63C0: 'jiǎn',
-    0x63C1: 'zhēng,kēng',
-    0x63C2: 'jiū,yóu',
-    0x63C3: 'jiǎn,jiān,qiān',
-    0x63C4: 'yú,chōu,yóu,shū,yáo',
-    0x63C5: 'yán',
-    0x63C6: 'kuí',
-    0x63C7: 'nǎn',
-    0x63C8: 'hōng,hóng,xuàn,jū',
-    0x63C9: 'róu',
-    0x63CA: 'pì,chè',
-    0x63CB: 'wēi',
-    0x63CC: 'sāi,cāi',
-    0x63CD: 'zòu,còu',
-    0x63CE: 'xuān',
-    0x63CF: 'miáo,mào',
-    0x63D0: 'tí,dī,chí,shí,dǐ',
-    0x63D1: 'niē',
-    0x63D2: 'chā,zhǎ',
-    0x63D3: 'shì',
-    0x63D4: 'zǒng,sōng',
-    0x63D5: 'zhèn,zhēn',
-    0x63D6: 'yī,jí',
-    0x63D7: 'xún',
-    0x63D8: 'yóng,huáng',
-    0x63D9: 'biān,biàn',
-    0x63DA: 'yáng',
-    0x63DB: 'huàn',
-    0x63DC: 'yǎn',
-    0x63DD: 'zǎn,zuàn',
-    0x63DE: 'ǎn,yàn,yè',
-    0x63DF: 'xū,jū',
-    0x63E0: 'yà',
-    0x63E1: 'wò,òu',
-    0x63E2: 'ké,qiā',
-    0x63E3: 'chuāi,chuǎi,chuài,duǒ,zhuī,tuán',
-    0x63E4: 'jí',
-    0x63E5: 'tì,dì',
-    0x63E6: 'lá,là',
-    0x63E7: 'là',
-    0x63E8: 'chén',
-    0x63E9: 'kāi,jiá',
-    0x63EA: 'jiū',
-    0x63EB: 'jiū',
-    0x63EC: 'tú',
-    0x63ED: 'jiē,qì,hé',
-    0x63EE: 'huī,hún',
-    0x63EF: 'gèn',
-    0x63F0: 'chòng,dǒng',
-    0x63F1: 'xiāo,shuò,xiān',
-    0x63F2: 'dié,shé,yè',
-    0x63F3: 'xiē,xiè,xié,jiá',
-    0x63F4: 'yuán,huàn',
-    0x63F5: 'qián,jiàn,jiǎn',
-    0x63F6: 'yé',
-    0x63F7: 'chā',
-    0x63F8: 'zhā',
-    0x63F9: 'bēi',
-    0x63FA: 'yáo',
-    0x63FB: 'wēi',
-    0x63FC: 'beng',
-    0x63FD: 'lǎn',
-    0x63FE: 'wèn,wù',
-    0x63FF: 'qìn',
-    0x6400: 'chān',
-    0x6401: 'gē,gé',
-    0x6402: 'lǒu,lōu',
-    0x6403: 'zǒng',
-    0x6404: 'gèn',
-    0x6405: 'jiǎo',
-    0x6406: 'gòu,gōu',
-    0x6407: 'qìn',
-    0x6408: 'róng',
-    0x6409: 'què,huō',
-    0x640A: 'chōu,zǒu,zhū',
-    0x640B: 'chuāi,chǐ,yí',
-    0x640C: 'zhǎn',
-    0x640D: 'sǔn',
-    0x640E: 'sūn',
-    0x640F: 'bó',
-    0x6410: 'chù',
-    0x6411: 'róng,náng,nǎng',
-    0x6412: 'bàng,péng,bēng,bǎng',
-    0x6413: 'cuō,cuǒ,chāi',
-    0x6414: 'sāo,sào',
-    0x6415: 'kē,è',
-    0x6416: 'yáo',
-    0x6417: 'dǎo',
-    0x6418: 'zhī',
-    0x6419: 'nù,nuò,nòu',
-    0x641A: 'lā,xié,xiàn',
-    0x641B: 'jiān,lián',
-    0x641C: 'sōu,xiāo,sòu,shǎo',
-    0x641D: 'qiǔ',
-    0x641E: 'gǎo,qiāo,kào',
-    0x641F: 'xiǎn,xiān',
-    0x6420: 'shuò',
-    0x6421: 'sǎng',
-    0x6422: 'jìn',
-    0x6423: 'miè',
-    0x6424: 'è,yì',
-    0x6425: 'chuí,duī',
-    0x6426: 'nuò',
-    0x6427: 'shān',
-    0x6428: 'tà,dá',
-    0x6429: 'zhǎ,jié',
-    0x642A: 'táng',
-    0x642B: 'pán,bān,pó',
-    0x642C: 'bān,sù',
-    0x642D: 'dā,tà',
-    0x642E: 'lì',
-    0x642F: 'tāo',
-    0x6430: 'hú,kū',
-    0x6431: 'zhì,nái',
-    0x6432: 'wā,wǎ,wà',
-    0x6433: 'huá,xiá,qiā',
-    0x6434: 'qiān',
-    0x6435: 'wèn',
-    0x6436: 'qiǎng,qiāng,qiàng,chéng,chēng',
-    0x6437: 'tián,shēn',
-    0x6438: 'zhēn',
-    0x6439: 'è',
-    0x643A: 'xié',
-    0x643B: 'nuò',
-    0x643C: 'quán',
-    0x643D: 'chá',
-    0x643E: 'zhà',
-    0x643F: 'gé',
-    0x6440: 'wǔ',
-    0x6441: 'èn',
-    0x6442: 'shè',
-    0x6443: 'káng',
-    0x6444: 'shè',
-    0x6445: 'shū',
-    0x6446: 'bǎi',
-    0x6447: 'yáo',
-    0x6448: 'bìn',
-    0x6449: 'sōu',
-    0x644A: 'tān',
-    0x644B: 'sà,shǎi,shā',
-    0x644C: 'chǎn,sùn',
-    0x644D: 'suō',
-    0x644E: 'jiū,liú,liáo,jiǎo,náo',
-    0x644F: 'chōng',
-    0x6450: 'chuāng',
-    0x6451: 'guāi,guó',
-    0x6452: 'bǐng,bìng',
-    0x6453: 'féng,pěng',
-    0x6454: 'shuāi',
-    0x6455: 'dì,tú,zhí',
-    0x6456: 'qì,chá',
-    0x6457: 'sōu,sǒng',
-    0x6458: 'zhāi',
-    0x6459: 'liǎn,liàn',
-    0x645A: 'chēng',
-    0x645B: 'chī',
-    0x645C: 'guàn',
-    0x645D: 'lù',
-    0x645E: 'luò',
-    0x645F: 'lǒu,lōu',
-    0x6460: 'zǒng',
-    0x6461: 'gài,xì',
-    0x6462: 'hù,chū',
-    0x6463: 'zhā,zhuā',
-    0x6464: 'chuǎng',
-    0x6465: 'tàng',
-    0x6466: 'huà',
-    0x6467: 'cuī,zuì,cuò',
-    0x6468: 'nái,zhì',
-    0x6469: 'mó,mā,mí',
-    0x646A: 'jiāng,qiàng',
-    0x646B: 'guī',
-    0x646C: 'yǐng',
-    0x646D: 'zhí',
-    0x646E: 'áo,qiāo',
-    0x646F: 'zhì',
-    0x6470: 'niè,chè',
-    0x6471: 'màn,mán',
-    0x6472: 'chàn,cán',
-    0x6473: 'kōu,ōu',
-    0x6474: 'chū,chī',
-    0x6475: 'shè,sù,mí',
-    0x6476: 'tuán,zhuàn,zhuān',
-    0x6477: 'jiǎo,chāo',
-    0x6478: 'mō,mó',
-    0x6479: 'mó,mō',
-    0x647A: 'zhé,lā,xié',
-    0x647B: 'càn,shǎn,shān,chān,sēn',
-    0x647C: 'kēng,qiān',
-    0x647D: 'biāo,biào,piāo,pāo',
-    0x647E: 'jiàng',
-    0x647F: 'yáo',
-    0x6480: 'gòu',
-    0x6481: 'qiān,qiàn',
-    0x6482: 'liào',
-    0x6483: 'jī',
-    0x6484: 'yīng',
-    0x6485: 'juē,juè,jué,guì',
-    0x6486: 'piē',
-    0x6487: 'piē,piě,biē',
-    0x6488: 'lāo',
-    0x6489: 'dūn',
-    0x648A: 'xiàn',
-    0x648B: 'ruán,ruí,rún,ruó,suī',
-    0x648C: 'guì',
-    0x648D: 'zǎn,zān,zēn,qián',
-    0x648E: 'yì',
-    0x648F: 'xián,xún',
-    0x6490: 'chēng',
-    0x6491: 'chēng',
-    0x6492: 'sā,sǎ',
-    0x6493: 'náo,xiāo,rào',
-    0x6494: 'hòng',
-    0x6495: 'sī,xī',
-    0x6496: 'hàn,qiǎn',
-    0x6497: 'guàng',
-    0x6498: 'dā',
-    0x6499: 'zǔn',
-    0x649A: 'niǎn',
-    0x649B: 'lǐn',
-    0x649C: 'zhěng,chéng',
-    0x649D: 'huī,wéi',
-    0x649E: 'zhuàng',
-    0x649F: 'jiǎo,jiāo,kǎo',
-    0x64A0: 'jǐ',
-    0x64A1: 'cāo',
-    0x64A2: 'dǎn,tàn,dàn,xín',
-    0x64A3: 'dǎn,dàn,chán,tān,zhǎn,shàn,tián',
-    0x64A4: 'chè',
-    0x64A5: 'bō,fá',
-    0x64A6: 'chě',
-    0x64A7: 'juē',
-    0x64A8: 'fǔ,xiāo,sōu',
-    0x64A9: 'liāo,liáo,liǎo,lào,liào',
-    0x64AA: 'bèn',
-    0x64AB: 'fǔ,mó',
-    0x64AC: 'qiào',
-    0x64AD: 'bō,bǒ',
-    0x64AE: 'cuō,zuǒ,zuì,zuān,chuā',
-    0x64AF: 'zhuó',
-    0x64B0: 'zhuàn,xuǎn,suàn',
-    0x64B1: 'wěi,tuǒ',
-    0x64B2: 'pū,bǔ',
-    0x64B3: 'qìn',
-    0x64B4: 'dūn',
-    0x64B5: 'niǎn',
-    0x64B6: 'huá',
-    0x64B7: 'xié',
-    0x64B8: 'lū',
-    0x64B9: 'jiǎo',
-    0x64BA: 'cuān',
-    0x64BB: 'tà',
-    0x64BC: 'hàn',
-    0x64BD: 'qiào,yāo,jī',
-    0x64BE: 'wō,zhuā',
-    0x64BF: 'jiǎn,liàn',
-    0x64C0: 'gǎn',
-    0x64C1: 'yōng',
-    0x64C2: 'léi,lèi,lēi',
-    0x64C3: 'nǎng',
-    0x64C4: 'lǔ',
-    0x64C5: 'shàn',
-    0x64C6: 'zhuó',
-    0x64C7: 'zé,zhái,yì',
-    0x64C8: 'pū',
-    0x64C9: 'chuò',
-    0x64CA: 'jī,jì,xí',
-    0x64CB: 'dǎng,dàng',
-    0x64CC: 'sè',
-    0x64CD: 'cāo',
-    0x64CE: 'qíng',
-    0x64CF: 'qíng,jǐng,jìng',
-    0x64D0: 'huàn,juǎn,xuān',
-    0x64D1: 'jiē',
-    0x64D2: 'qín',
-    0x64D3: 'kuǎi',
-    0x64D4: 'dān,dàn,shàn',
-    0x64D5: 'xié',
-    0x64D6: 'kā,qiā,jiā,zhá,guā,yè,gē,liè',
-    0x64D7: 'pǐ,bò',
-    0x64D8: 'bāi,bò',
-    0x64D9: 'ào',
-    0x64DA: 'jù',
-    0x64DB: 'yè',
-    0x64DC: 'è',
-    0x64DD: 'mēng',
-    0x64DE: 'sǒu,sòu',
-    0x64DF: 'mí',
-    0x64E0: 'jǐ',
-    0x64E1: 'tái',
-    0x64E2: 'zhuó',
-    0x64E3: 'dǎo,chóu',
-    0x64E4: 'xǐng',
-    0x64E5: 'lǎn',
-    0x64E6: 'cā',
-    0x64E7: 'jǔ',
-    0x64E8: 'yé',
-    0x64E9: 'rǔ,nǔ,rù,nòu,ruán',
-    0x64EA: 'yè',
-    0x64EB: 'yè',
-    0x64EC: 'nǐ',
-    0x64ED: 'wò,huò,hù',
-    0x64EE: 'jié',
-    0x64EF: 'bìn',
-    0x64F0: 'níng,nǐng,nìng',
-    0x64F1: 'gē,gé',
-    0x64F2: 'zhì,zhī',
-    0x64F3: 'zhì,jié',
-    0x64F4: 'kuò,tǎng,guàng',
-    0x64F5: 'mó',
-    0x64F6: 'jiàn',
-    0x64F7: 'xié',
-    0x64F8: 'liè,là',
-    0x64F9: 'tān',
-    0x64FA: 'bǎi',
-    0x64FB: 'sǒu,sòu',
-    0x64FC: 'lǔ,lū',
-    0x64FD: 'lüè,lì,yuè',
-    0x64FE: 'rǎo',
-    0x64FF: 'tī,zhì,zhāi',
-    0x6500: 'pān',
-    0x6501: 'yǎng',
-    0x6502: 'lèi',
-    0x6503: 'cā,sǎ',
-    0x6504: 'shū,lù',
-    0x6505: 'zǎn',
-    0x6506: 'niǎn',
-    0x6507: 'xiǎn',
-    0x6508: 'jùn,pèi',
-    0x6509: 'huō,huò,què',
-    0x650A: 'lì',
-    0x650B: 'là,lài',
-    0x650C: 'huǎn',
-    0x650D: 'yíng',
-    0x650E: 'lú,luó',
-    0x650F: 'lǒng',
-    0x6510: 'qiān',
-    0x6511: 'qiān',
-    0x6512: 'zǎn,cuán',
-    0x6513: 'qiān',
-    0x6514: 'lán',
-    0x6515: 'xiān,jiān',
-    0x6516: 'yīng',
-    0x6517: 'méi',
-    0x6518: 'rǎng,ràng,níng,xiǎng',
-    0x6519: 'chān,shàn',
-    0x651A: 'wěng',
-    0x651B: 'cuān',
-    0x651C: 'xié',
-    0x651D: 'shè,zhé,niè,shà',
-    0x651E: 'luó,luǒ',
-    0x651F: 'jùn',
-    0x6520: 'mí,mó',
-    0x6521: 'chī',
-    0x6522: 'zǎn,cuán,zuān,zàn',
-    0x6523: 'luán,liàn',
-    0x6524: 'tān,nàn',
-    0x6525: 'zuàn',
-    0x6526: 'lì,shài',
-    0x6527: 'diān',
-    0x6528: 'wā',
-    0x6529: 'dǎng,tǎng',
-    0x652A: 'jiǎo',
-    0x652B: 'jué',
-    0x652C: 'lǎn',
-    0x652D: 'lì,luǒ',
-    0x652E: 'nǎng',
-    0x652F: 'zhī,zhì,qí',
-    0x6530: 'guì',
-    0x6531: 'guǐ,guì',
-    0x6532: 'qī,jī',
-    0x6533: 'xún',
-    0x6534: 'pū',
-    0x6535: 'pū',
-    0x6536: 'shōu',
-    0x6537: 'kǎo',
-    0x6538: 'yōu',
-    0x6539: 'gǎi',
-    0x653A: 'yǐ',
-    0x653B: 'gōng',
-    0x653C: 'gān,hàn',
-    0x653D: 'bān,bīn',
-    0x653E: 'fàng,fǎng,fāng',
-    0x653F: 'zhèng,zhēng',
-    0x6540: 'pò',
-    0x6541: 'diān',
-    0x6542: 'kòu',
-    0x6543: 'mǐn,fēn',
-    0x6544: 'wù,móu',
-    0x6545: 'gù',
-    0x6546: 'hé',
-    0x6547: 'cè',
-    0x6548: 'xiào',
-    0x6549: 'mǐ',
-    0x654A: 'chù,shōu',
-    0x654B: 'gé',
-    0x654C: 'dí,huá',
-    0x654D: 'xù',
-    0x654E: 'jiào',
-    0x654F: 'mǐn',
-    0x6550: 'chén',
-    0x6551: 'jiù,jiū',
-    0x6552: 'shēn',
-    0x6553: 'duó',
-    0x6554: 'yǔ,yù',
-    0x6555: 'chì,sōu',
-    0x6556: 'áo,ào',
-    0x6557: 'bài',
-    0x6558: 'xù',
-    0x6559: 'jiào,jiāo',
-    0x655A: 'duó',
-    0x655B: 'liǎn',
-    0x655C: 'niè',
-    0x655D: 'bì',
-    0x655E: 'chǎng,chèng,zhèng',
-    0x655F: 'diǎn',
-    0x6560: 'duō,què',
-    0x6561: 'yì',
-    0x6562: 'gǎn',
-    0x6563: 'sàn,sǎn,sān',
-    0x6564: 'kě',
-    0x6565: 'yàn,jiǎo',
-    0x6566: 'dūn,duī,tuán,diāo,dùn,dào,zhǔn,tūn,duì,tún',
-    0x6567: 'jī,qǐ',
-    0x6568: 'tǒu',
-    0x6569: 'xiào,xué',
-    0x656A: 'duō',
-    0x656B: 'jiǎo,qiāo,jiào',
-    0x656C: 'jìng',
-    0x656D: 'yáng',
-    0x656E: 'xiá',
-    0x656F: 'mǐn',
-    0x6570: 'shù,shǔ,shuò',
-    0x6571: 'ái,zhú',
-    0x6572: 'qiāo',
-    0x6573: 'ái',
-    0x6574: 'zhěng',
-    0x6575: 'dí',
-    0x6576: 'zhèn',
-    0x6577: 'fū',
-    0x6578: 'shù,shǔ,shuò',
-    0x6579: 'liáo',
-    0x657A: 'qū,ōu',
-    0x657B: 'xiòng',
-    0x657C: 'yǐ',
-    0x657D: 'jiǎo',
-    0x657E: 'shàn',
-    0x657F: 'jiǎo',
-    0x6580: 'zhuó,zhú',
-    0x6581: 'yì,dù,tú',
-    0x6582: 'liǎn,lián',
-    0x6583: 'bì',
-    0x6584: 'lí,tái',
-    0x6585: 'xiào,xué',
-    0x6586: 'xiào',
-    0x6587: 'wén',
-    0x6588: 'xué',
-    0x6589: 'qí',
-    0x658A: 'qí',
-    0x658B: 'zhāi',
-    0x658C: 'bīn',
-    0x658D: 'jué',
-    0x658E: 'zhāi',
-    0x658F: 'láng',
-    0x6590: 'fěi',
-    0x6591: 'bān',
-    0x6592: 'bān',
-    0x6593: 'lán',
-    0x6594: 'yǔ',
-    0x6595: 'lán',
-    0x6596: 'wěi',
-    0x6597: 'dòu,dǒu,zhǔ',
-    0x6598: 'shēng',
-    0x6599: 'liào,liáo',
-    0x659A: 'jiǎ',
-    0x659B: 'hú',
-    0x659C: 'xié,xiá,chá,yé',
-    0x659D: 'jiǎ',
-    0x659E: 'yǔ',
-    0x659F: 'zhēn',
-    0x65A0: 'jiào',
-    0x65A1: 'wò,guǎn',
-    0x65A2: 'tiǎo,tǒu',
-    0x65A3: 'dòu',
-    0x65A4: 'jīn',
-    0x65A5: 'chì,chè,zhè',
-    0x65A6: 'yín,zhì',
-    0x65A7: 'fǔ',
-    0x65A8: 'qiāng',
-    0x65A9: 'zhǎn',
-    0x65AA: 'qú',
-    0x65AB: 'zhuó,chuò',
-    0x65AC: 'zhǎn,zhàn',
-    0x65AD: 'duàn',
-    0x65AE: 'cuò,zhuó',
-    0x65AF: 'sī,shǐ',
-    0x65B0: 'xīn',
-    0x65B1: 'zhuó',
-    0x65B2: 'zhuó',
-    0x65B3: 'qín,jǐn',
-    0x65B4: 'lín',
-    0x65B5: 'zhuó',
-    0x65B6: 'chù',
-    0x65B7: 'duàn',
-    0x65B8: 'zhǔ,zhú',
-    0x65B9: 'fāng,fáng,fǎng,páng,wǎng,fēng',
-    0x65BA: 'chǎn,jiè',
-    0x65BB: 'háng',
-    0x65BC: 'yú,yū,wū',
-    0x65BD: 'shī,yì,shǐ',
-    0x65BE: 'pèi',
-    0x65BF: 'yóu,liú',
-    0x65C0: 'mèi',
-    0x65C1: 'páng,pēng,bēng,bàng',
-    0x65C2: 'qí',
-    0x65C3: 'zhān',
-    0x65C4: 'máo,mào,wù',
-    0x65C5: 'lǚ',
-    0x65C6: 'pèi',
-    0x65C7: 'pī,bì',
-    0x65C8: 'liú',
-    0x65C9: 'fū',
-    0x65CA: 'fǎng',
-    0x65CB: 'xuán,xuàn',
-    0x65CC: 'jīng',
-    0x65CD: 'jīng',
-    0x65CE: 'nǐ',
-    0x65CF: 'zú,sǒu,còu,zòu',
-    0x65D0: 'zhào',
-    0x65D1: 'yǐ',
-    0x65D2: 'liú',
-    0x65D3: 'shāo',
-    0x65D4: 'jiàn',
-    0x65D5: 'yú',
-    0x65D6: 'yǐ',
-    0x65D7: 'qí',
-    0x65D8: 'zhì',
-    0x65D9: 'fān',
-    0x65DA: 'piāo',
-    0x65DB: 'fān',
-    0x65DC: 'zhān',
-    0x65DD: 'kuài',
-    0x65DE: 'suì',
-    0x65DF: 'yú',
-    0x65E0: 'wú,mó',
-    0x65E1: 'jì',
-    0x65E2: 'jì,xì',
-    0x65E3: 'jì',
-    0x65E4: 'huò',
-    0x65E5: 'rì',
-    0x65E6: 'dàn',
-    0x65E7: 'jiù',
-    0x65E8: 'zhǐ',
-    0x65E9: 'zǎo',
-    0x65EA: 'xié',
-    0x65EB: 'tiāo',
-    0x65EC: 'xún,jūn',
-    0x65ED: 'xù',
-    0x65EE: 'gā,xù',
-    0x65EF: 'lá',
-    0x65F0: 'gàn,hàn',
-    0x65F1: 'hàn',
-    0x65F2: 'tái,yīng',
-    0x65F3: 'dì',
-    0x65F4: 'xū',
-    0x65F5: 'chǎn',
-    0x65F6: 'shí',
-    0x65F7: 'kuàng',
-    0x65F8: 'yáng',
-    0x65F9: 'shí',
-    0x65FA: 'wàng',
-    0x65FB: 'mín',
-    0x65FC: 'mín',
-    0x65FD: 'tūn,zhùn',
-    0x65FE: 'chūn',
-    0x65FF: 'wǔ,wù',
-    0x6600: 'yún',
-    0x6601: 'bèi',
-    0x6602: 'áng,yàng',
-    0x6603: 'zè',
-    0x6604: 'bǎn',
-    0x6605: 'jié',
-    0x6606: 'kūn,hún,kùn',
-    0x6607: 'shēng',
-    0x6608: 'hù',
-    0x6609: 'fǎng',
-    0x660A: 'hào',
-    0x660B: 'guì,jiǒng',
-    0x660C: 'chāng,chàng',
-    0x660D: 'xuān',
-    0x660E: 'míng,mèng',
-    0x660F: 'hūn,hùn',
-    0x6610: 'fēn',
-    0x6611: 'qǐn',
-    0x6612: 'hū',
-    0x6613: 'yì',
-    0x6614: 'xī,cuò',
-    0x6615: 'xīn,xuān',
-    0x6616: 'yán',
-    0x6617: 'zè',
-    0x6618: 'fǎng',
-    0x6619: 'tán,yù',
-    0x661A: 'shèn',
-    0x661B: 'jù',
-    0x661C: 'yáng',
-    0x661D: 'zǎn',
-    0x661E: 'bǐng,fǎng',
-    0x661F: 'xīng',
-    0x6620: 'yìng,yǎng',
-    0x6621: 'xuàn',
-    0x6622: 'pò,pèi',
-    0x6623: 'zhěn',
-    0x6624: 'líng',
-    0x6625: 'chūn,chǔn',
-    0x6626: 'hào',
-    0x6627: 'mèi,wěn,mò',
-    0x6628: 'zuó',
-    0x6629: 'mò',
-    0x662A: 'biàn',
-    0x662B: 'xù,xiǒng',
-    0x662C: 'hūn',
-    0x662D: 'zhāo,zhào',
-    0x662E: 'zòng',
-    0x662F: 'shì,tí',
-    0x6630: 'shì,xià',
-    0x6631: 'yù',
-    0x6632: 'fèi',
-    0x6633: 'dié,diè,yì',
-    0x6634: 'mǎo',
-    0x6635: 'nì,nǐ,zhì',
-    0x6636: 'chǎng',
-    0x6637: 'wēn',
-    0x6638: 'dōng',
-    0x6639: 'ǎi',
-    0x663A: 'bǐng',
-    0x663B: 'áng',
-    0x663C: 'zhòu',
-    0x663D: 'lóng',
-    0x663E: 'xiǎn',
-    0x663F: 'kuàng',
-    0x6640: 'tiǎo',
-    0x6641: 'cháo,zhāo,chào',
-    0x6642: 'shí',
-    0x6643: 'huǎng,huàng',
-    0x6644: 'huǎng',
-    0x6645: 'xuǎn,xuān',
-    0x6646: 'kuí',
-    0x6647: 'xū,kuā',
-    0x6648: 'jiǎo',
-    0x6649: 'jìn',
-    0x664A: 'zhì',
-    0x664B: 'jìn',
-    0x664C: 'shǎng',
-    0x664D: 'tóng',
-    0x664E: 'hǒng',
-    0x664F: 'yàn',
-    0x6650: 'gāi',
-    0x6651: 'xiǎng',
-    0x6652: 'shài',
-    0x6653: 'xiǎo',
-    0x6654: 'yè',
-    0x6655: 'yūn,yùn',
-    0x6656: 'huī',
-    0x6657: 'hán',
-    0x6658: 'hàn',
-    0x6659: 'jùn',
-    0x665A: 'wǎn',
-    0x665B: 'xiàn',
-    0x665C: 'kūn',
-    0x665D: 'zhòu',
-    0x665E: 'xī',
-    0x665F: 'chéng,shèng,jīng',
-    0x6660: 'shèng',
-    0x6661: 'bū',
-    0x6662: 'zhé,zhì',
-    0x6663: 'zhé',
-    0x6664: 'wù',
-    0x6665: 'wǎn',
-    0x6666: 'huì',
-    0x6667: 'hào',
-    0x6668: 'chén',
-    0x6669: 'wǎn',
-    0x666A: 'tiǎn',
-    0x666B: 'zhuó',
-    0x666C: 'zuì',
-    0x666D: 'zhǒu',
-    0x666E: 'pǔ',
-    0x666F: 'jǐng,yǐng',
-    0x6670: 'xī',
-    0x6671: 'shǎn',
-    0x6672: 'nǐ',
-    0x6673: 'xī',
-    0x6674: 'qíng',
-    0x6675: 'qǐ,dù',
-    0x6676: 'jīng',
-    0x6677: 'guǐ',
-    0x6678: 'zhěng',
-    0x6679: 'yì',
-    0x667A: 'zhì,zhī',
-    0x667B: 'àn,ǎn,yǎn',
-    0x667C: 'wǎn',
-    0x667D: 'lín',
-    0x667E: 'liàng',
-    0x667F: 'chāng',
-    0x6680: 'wǎng,wàng',
-    0x6681: 'xiǎo',
-    0x6682: 'zàn',
-    0x6683: 'fēi',
-    0x6684: 'xuān',
-    0x6685: 'gèng,xuǎn',
-    0x6686: 'yí',
-    0x6687: 'xiá,xià,jiǎ',
-    0x6688: 'yūn,yùn',
-    0x6689: 'huī',
-    0x668A: 'xǔ',
-    0x668B: 'mǐn,mín',
-    0x668C: 'kuí',
-    0x668D: 'yē',
-    0x668E: 'yìng',
-    0x668F: 'shǔ,dǔ',
-    0x6690: 'wěi',
-    0x6691: 'shǔ',
-    0x6692: 'qíng',
-    0x6693: 'mào',
-    0x6694: 'nán',
-    0x6695: 'jiǎn,lán',
-    0x6696: 'nuǎn,xuān',
-    0x6697: 'àn',
-    0x6698: 'yáng',
-    0x6699: 'chūn',
-    0x669A: 'yáo',
-    0x669B: 'suǒ',
-    0x669C: 'pǔ',
-    0x669D: 'míng',
-    0x669E: 'jiǎo',
-    0x669F: 'kǎi',
-    0x66A0: 'gǎo,hào',
-    0x66A1: 'wěng',
-    0x66A2: 'chàng',
-    0x66A3: 'qì',
-    0x66A4: 'hào',
-    0x66A5: 'yàn',
-    0x66A6: 'lì',
-    0x66A7: 'ài,nuǎn',
-    0x66A8: 'jì,jiè',
-    0x66A9: 'jì',
-    0x66AA: 'mèn',
-    0x66AB: 'zàn',
-    0x66AC: 'xiè',
-    0x66AD: 'hào',
-    0x66AE: 'mù',
-    0x66AF: 'mò',
-    0x66B0: 'cōng',
-    0x66B1: 'nì',
-    0x66B2: 'zhāng',
-    0x66B3: 'huì',
-    0x66B4: 'bào,pù,bó',
-    0x66B5: 'hàn',
-    0x66B6: 'xuán',
-    0x66B7: 'chuán',
-    0x66B8: 'liáo',
-    0x66B9: 'xiān',
-    0x66BA: 'tǎn',
-    0x66BB: 'jǐng',
-    0x66BC: 'piē',
-    0x66BD: 'lín',
-    0x66BE: 'tūn',
-    0x66BF: 'xǐ,xī',
-    0x66C0: 'yì',
-    0x66C1: 'jì',
-    0x66C2: 'huàng',
-    0x66C3: 'dài',
-    0x66C4: 'yè',
-    0x66C5: 'yè',
-    0x66C6: 'lì',
-    0x66C7: 'tán',
-    0x66C8: 'tóng',
-    0x66C9: 'xiǎo',
-    0x66CA: 'fèi',
-    0x66CB: 'shěn',
-    0x66CC: 'zhào',
-    0x66CD: 'hào',
-    0x66CE: 'yì',
-    0x66CF: 'xiǎng,xiàng,shǎng',
-    0x66D0: 'xīng',
-    0x66D1: 'shēn',
-    0x66D2: 'jiǎo',
-    0x66D3: 'bào',
-    0x66D4: 'jìng',
-    0x66D5: 'yàn',
-    0x66D6: 'ài',
-    0x66D7: 'yè',
-    0x66D8: 'rú',
-    0x66D9: 'shǔ',
-    0x66DA: 'méng',
-    0x66DB: 'xūn',
-    0x66DC: 'yào',
-    0x66DD: 'pù,bào',
-    0x66DE: 'lì',
-    0x66DF: 'chén',
-    0x66E0: 'kuàng',
-    0x66E1: 'dié',
-    0x66E2: 'liǎo',
-    0x66E3: 'yàn',
-    0x66E4: 'huò',
-    0x66E5: 'lú',
-    0x66E6: 'xī',
-    0x66E7: 'róng',
-    0x66E8: 'lóng',
-    0x66E9: 'nǎng',
-    0x66EA: 'luǒ',
-    0x66EB: 'luán',
-    0x66EC: 'shài',
-    0x66ED: 'tǎng',
-    0x66EE: 'yǎn',
-    0x66EF: 'zhú',
-    0x66F0: 'yuē',
-    0x66F1: 'yuē',
-    0x66F2: 'qū,qǔ',
-    0x66F3: 'yè',
-    0x66F4: 'gèng,gēng',
-    0x66F5: 'yè',
-    0x66F6: 'hū',
-    0x66F7: 'hé,è,hè',
-    0x66F8: 'shū',
-    0x66F9: 'cáo',
-    0x66FA: 'cáo',
-    0x66FB: 'shēng',
-    0x66FC: 'màn',
-    0x66FD: 'cēng',
-    0x66FE: 'céng,zēng',
-    0x66FF: 'tì',
-    0x6700: 'zuì,cuō',
-    0x6701: 'cǎn,qián,jiàn',
-    0x6702: 'xù',
-    0x6703: 'huì,kuài,kuò',
-    0x6704: 'yǐn',
-    0x6705: 'qiè',
-    0x6706: 'fēn',
-    0x6707: 'pí',
-    0x6708: 'yuè,rù',
-    0x6709: 'yǒu,yòu,wěi',
-    0x670A: 'ruǎn,wǎn',
-    0x670B: 'péng',
-    0x670C: 'fén,bān',
-    0x670D: 'fú,fù,bì,bó',
-    0x670E: 'líng',
-    0x670F: 'fěi,kū',
-    0x6710: 'qú,xū,xù,chǔn',
-    0x6711: 'tì',
-    0x6712: 'nǜ',
-    0x6713: 'tiǎo,tiào,yóu',
-    0x6714: 'shuò',
-    0x6715: 'zhèn',
-    0x6716: 'lǎng',
-    0x6717: 'lǎng',
-    0x6718: 'zuī,juān',
-    0x6719: 'míng',
-    0x671A: 'huāng,máng,wáng,mèng',
-    0x671B: 'wàng',
-    0x671C: 'tūn',
-    0x671D: 'cháo,zhāo,zhū',
-    0x671E: 'jī,qī',
-    0x671F: 'qī,jī',
-    0x6720: 'yīng',
-    0x6721: 'zōng',
-    0x6722: 'wàng',
-    0x6723: 'tóng,chuáng',
-    0x6724: 'lǎng',
-    0x6725: 'láo',
-    0x6726: 'méng,mǎng',
-    0x6727: 'lóng,lǒng',
-    0x6728: 'mù',
-    0x6729: 'děng',
-    0x672A: 'wèi',
-    0x672B: 'mò,me',
-    0x672C: 'běn,bēn',
-    0x672D: 'zhá,yà',
-    0x672E: 'shù,zhú',
-    0x672F: 'shù,zhú,shú',
-    0x6730: 'mù',
-    0x6731: 'zhū,shū',
-    0x6732: 'rén',
-    0x6733: 'bā',
-    0x6734: 'pǔ,piáo,pò,pū,pō',
-    0x6735: 'duǒ',
-    0x6736: 'duǒ',
-    0x6737: 'dāo,mù,tiáo',
-    0x6738: 'lì',
-    0x6739: 'guǐ,qiú',
-    0x673A: 'jī,wèi',
-    0x673B: 'jiū',
-    0x673C: 'bǐ',
-    0x673D: 'xiǔ',
-    0x673E: 'chéng,zhēng,chēng,tīng',
-    0x673F: 'cì',
-    0x6740: 'shā',
-    0x6741: 'rù',
-    0x6742: 'zá,duǒ',
-    0x6743: 'quán',
-    0x6744: 'qiān',
-    0x6745: 'yú,wū',
-    0x6746: 'gān,gǎn,gàn',
-    0x6747: 'wū',
-    0x6748: 'chā,chà',
-    0x6749: 'shān,shā',
-    0x674A: 'xún',
-    0x674B: 'fán',
-    0x674C: 'wù,wò',
-    0x674D: 'zǐ',
-    0x674E: 'lǐ',
-    0x674F: 'xìng',
-    0x6750: 'cái',
-    0x6751: 'cūn',
-    0x6752: 'rèn,ér',
-    0x6753: 'biāo,sháo,shuó,dí,zhuó',
-    0x6754: 'tuō,zhé',
-    0x6755: 'dì,duò',
-    0x6756: 'zhàng',
-    0x6757: 'máng',
-    0x6758: 'chì',
-    0x6759: 'yì',
-    0x675A: 'gài,gé',
-    0x675B: 'gōng',
-    0x675C: 'dù,dǔ,tú',
-    0x675D: 'lí,zhì,yí,tuò,duò',
-    0x675E: 'qǐ',
-    0x675F: 'shù',
-    0x6760: 'gāng,gàng,gōng',
-    0x6761: 'tiáo',
-    0x6762: 'jiang',
-    0x6763: 'mián',
-    0x6764: 'wàn',
-    0x6765: 'lái',
-    0x6766: 'jiǔ',
-    0x6767: 'máng',
-    0x6768: 'yáng',
-    0x6769: 'mà',
-    0x676A: 'miǎo',
-    0x676B: 'sì,zhǐ,xǐ',
-    0x676C: 'yuán,yuàn',
-    0x676D: 'háng,kàng,kāng',
-    0x676E: 'fèi,bèi',
-    0x676F: 'bēi',
-    0x6770: 'jié',
-    0x6771: 'dōng',
-    0x6772: 'gǎo',
-    0x6773: 'yǎo',
-    0x6774: 'xiān,qiān',
-    0x6775: 'chǔ',
-    0x6776: 'chūn',
-    0x6777: 'pá,bà',
-    0x6778: 'shū,duì',
-    0x6779: 'huà',
-    0x677A: 'xīn',
-    0x677B: 'chǒu,niǔ',
-    0x677C: 'zhù,shù',
-    0x677D: 'chǒu',
-    0x677E: 'sōng',
-    0x677F: 'bǎn',
-    0x6780: 'sōng',
-    0x6781: 'jí',
-    0x6782: 'wò,yuè',
-    0x6783: 'jìn',
-    0x6784: 'gòu',
-    0x6785: 'jī',
-    0x6786: 'máo',
-    0x6787: 'pí,bǐ,bì,pī',
-    0x6788: 'bì,pī',
-    0x6789: 'wǎng,kuáng',
-    0x678A: 'àng',
-    0x678B: 'fāng,fǎng,bǐng',
-    0x678C: 'fén',
-    0x678D: 'yì',
-    0x678E: 'fú,fū',
-    0x678F: 'nán',
-    0x6790: 'xī,sī',
-    0x6791: 'hù',
-    0x6792: 'yā,yē,yá,yà',
-    0x6793: 'dǒu,zhǔ',
-    0x6794: 'xín',
-    0x6795: 'zhěn,chén',
-    0x6796: 'yāo,yǎo',
-    0x6797: 'lín',
-    0x6798: 'ruì,nèn',
-    0x6799: 'ě,è',
-    0x679A: 'méi',
-    0x679B: 'zhào',
-    0x679C: 'guǒ,luǒ,guàn',
-    0x679D: 'zhī,qí',
-    0x679E: 'cōng,zōng',
-    0x679F: 'yùn',
-    0x67A0: 'zui',
-    0x67A1: 'shēng',
-    0x67A2: 'shū',
-    0x67A3: 'zǎo',
-    0x67A4: 'dì',
-    0x67A5: 'lì',
-    0x67A6: 'lú',
-    0x67A7: 'jiǎn',
-    0x67A8: 'chéng',
-    0x67A9: 'sōng',
-    0x67AA: 'qiāng',
-    0x67AB: 'fēng',
-    0x67AC: 'zhān',
-    0x67AD: 'xiāo',
-    0x67AE: 'xiān,zhēn',
-    0x67AF: 'kū,gū',
-    0x67B0: 'píng',
-    0x67B1: 'tái,sì,cí',
-    0x67B2: 'xǐ',
-    0x67B3: 'zhǐ,zhī',
-    0x67B4: 'guǎi',
-    0x67B5: 'xiāo',
-    0x67B6: 'jià',
-    0x67B7: 'jiā,jià',
-    0x67B8: 'gǒu,gōu,jǔ,qú',
-    0x67B9: 'bāo,fú',
-    0x67BA: 'mò',
-    0x67BB: 'yì,xiè',
-    0x67BC: 'yè',
-    0x67BD: 'yè',
-    0x67BE: 'shì',
-    0x67BF: 'niè',
-    0x67C0: 'bǐ',
-    0x67C1: 'duò,tuó,tuǒ',
-    0x67C2: 'yí,duò,lí',
-    0x67C3: 'líng',
-    0x67C4: 'bǐng',
-    0x67C5: 'nǐ,chì',
-    0x67C6: 'lā',
-    0x67C7: 'hé',
-    0x67C8: 'bàn,pán,pàn',
-    0x67C9: 'fán',
-    0x67CA: 'zhōng',
-    0x67CB: 'dài',
-    0x67CC: 'cí',
-    0x67CD: 'yǎng,yàng,yīng',
-    0x67CE: 'fū,fǔ,fù',
-    0x67CF: 'bǎi,bó,bò',
-    0x67D0: 'mǒu,méi',
-    0x67D1: 'gān,qián',
-    0x67D2: 'qī',
-    0x67D3: 'rǎn',
-    0x67D4: 'róu',
-    0x67D5: 'mào',
-    0x67D6: 'sháo,shào',
-    0x67D7: 'sōng',
-    0x67D8: 'zhè',
-    0x67D9: 'xiá,jiǎ',
-    0x67DA: 'yòu,yóu,zhóu',
-    0x67DB: 'shēn',
-    0x67DC: 'guì,jǔ',
-    0x67DD: 'tuò',
-    0x67DE: 'zhà,zuò,zé',
-    0x67DF: 'nán,rán',
-    0x67E0: 'níng,chǔ,zhù',
-    0x67E1: 'yǒng',
-    0x67E2: 'dǐ,dì,chí',
-    0x67E3: 'zhì,dié',
-    0x67E4: 'zhā,zǔ,zū',
-    0x67E5: 'chá,zhā,chái',
-    0x67E6: 'dàn',
-    0x67E7: 'gū',
-    0x67E8: 'bù,pū',
-    0x67E9: 'jiù',
-    0x67EA: 'āo,ào',
-    0x67EB: 'fú',
-    0x67EC: 'jiǎn',
-    0x67ED: 'bā,fú,bó,biē,pèi',
-    0x67EE: 'duò,zuó,wù',
-    0x67EF: 'kē',
-    0x67F0: 'nài',
-    0x67F1: 'zhù,zhǔ',
-    0x67F2: 'bì,bié',
-    0x67F3: 'liǔ',
-    0x67F4: 'chái,cī,zhài,zì',
-    0x67F5: 'shān,zhà',
-    0x67F6: 'sì',
-    0x67F7: 'chù,zhù',
-    0x67F8: 'pēi,bēi',
-    0x67F9: 'shì,fèi',
-    0x67FA: 'guǎi',
-    0x67FB: 'zhā',
-    0x67FC: 'yǎo',
-    0x67FD: 'chēng,jué',
-    0x67FE: 'jiù',
-    0x67FF: 'shì',
-    0x6800: 'zhī',
-    0x6801: 'liǔ',
-    0x6802: 'méi',
-    0x6803: 'lì',
-    0x6804: 'róng',
-    0x6805: 'zhà,shān,cè',
-    0x6806: 'zǎo',
-    0x6807: 'biāo',
-    0x6808: 'zhàn',
-    0x6809: 'zhì',
-    0x680A: 'lóng',
-    0x680B: 'dòng',
-    0x680C: 'lú',
-    0x680D: 'shēng',
-    0x680E: 'lì,yuè',
-    0x680F: 'lán',
-    0x6810: 'yǒng',
-    0x6811: 'shù',
-    0x6812: 'xún,sǔn',
-    0x6813: 'shuān,shuàn,quán',
-    0x6814: 'qì',
-    0x6815: 'zhēn',
-    0x6816: 'qī,xī',
-    0x6817: 'lì,liè',
-    0x6818: 'yí',
-    0x6819: 'xiáng',
-    0x681A: 'zhèn',
-    0x681B: 'lì',
-    0x681C: 'sè,cì',
-    0x681D: 'guā,tiǎn,kuò',
-    0x681E: 'kān',
-    0x681F: 'bēn,bīng',
-    0x6820: 'rěn',
-    0x6821: 'xiào,jiào,jiǎo,qiāo',
-    0x6822: 'bǎi',
-    0x6823: 'rěn',
-    0x6824: 'bìng',
-    0x6825: 'zī',
-    0x6826: 'chóu',
-    0x6827: 'yì',
-    0x6828: 'cì',
-    0x6829: 'xǔ,yǔ',
-    0x682A: 'zhū',
-    0x682B: 'jiàn,zùn',
-    0x682C: 'zuì',
-    0x682D: 'ér',
-    0x682E: 'ěr',
-    0x682F: 'yǒu,yù',
-    0x6830: 'fá',
-    0x6831: 'gǒng',
-    0x6832: 'kǎo',
-    0x6833: 'lǎo',
-    0x6834: 'zhān',
-    0x6835: 'liè',
-    0x6836: 'yīn',
-    0x6837: 'yàng,yáng',
-    0x6838: 'hé,hú,gāi,kài',
-    0x6839: 'gēn',
-    0x683A: 'yì,zhī,zhǐ',
-    0x683B: 'shì',
-    0x683C: 'gé,luò,hè,gē',
-    0x683D: 'zāi,zài',
-    0x683E: 'luán',
-    0x683F: 'fú',
-    0x6840: 'jié',
-    0x6841: 'héng,háng,hàng',
-    0x6842: 'guì',
-    0x6843: 'táo,tiāo,zhào',
-    0x6844: 'guāng,guàng',
-    0x6845: 'wéi,guǐ',
-    0x6846: 'kuāng,kuàng,kuáng',
-    0x6847: 'rú',
-    0x6848: 'àn',
-    0x6849: 'ān,àn',
-    0x684A: 'juàn,quān',
-    0x684B: 'yí,tí',
-    0x684C: 'zhuō',
-    0x684D: 'kū',
-    0x684E: 'zhì',
-    0x684F: 'qióng',
-    0x6850: 'tóng,tōng,dòng',
-    0x6851: 'sāng',
-    0x6852: 'sāng',
-    0x6853: 'huán',
-    0x6854: 'jú,jié,xié',
-    0x6855: 'jiù',
-    0x6856: 'xuè',
-    0x6857: 'duò',
-    0x6858: 'zhuì',
-    0x6859: 'yú,móu',
-    0x685A: 'zǎn',
-    0x685C: 'yīng',
-    0x685D: 'jié',
-    0x685E: 'liǔ',
-    0x685F: 'zhàn',
-    0x6860: 'yā',
-    0x6861: 'ráo',
-    0x6862: 'zhēn',
-    0x6863: 'dàng',
-    0x6864: 'qī',
-    0x6865: 'qiáo',
-    0x6866: 'huà',
-    0x6867: 'guì,huì',
-    0x6868: 'jiǎng',
-    0x6869: 'zhuāng',
-    0x686A: 'xún',
-    0x686B: 'suō',
-    0x686C: 'shā',
-    0x686D: 'zhēn,chén,zhèn',
-    0x686E: 'bēi',
-    0x686F: 'tīng,yíng',
-    0x6870: 'kuò',
-    0x6871: 'jìng',
-    0x6872: 'po,bó',
-    0x6873: 'bèn',
-    0x6874: 'fú',
-    0x6875: 'ruí',
-    0x6876: 'tǒng',
-    0x6877: 'jué',
-    0x6878: 'xī',
-    0x6879: 'láng',
-    0x687A: 'liǔ',
-    0x687B: 'fēng,fèng',
-    0x687C: 'qī',
-    0x687D: 'wěn',
-    0x687E: 'jūn',
-    0x687F: 'gǎn,hàn',
-    0x6880: 'sù,yìn',
-    0x6881: 'liáng',
-    0x6882: 'qiú',
-    0x6883: 'tǐng,tìng',
-    0x6884: 'yǒu',
-    0x6885: 'méi',
-    0x6886: 'bāng',
-    0x6887: 'lòng',
-    0x6888: 'pēng',
-    0x6889: 'zhuāng',
-    0x688A: 'dì',
-    0x688B: 'xuān,juān,xié',
-    0x688C: 'tú,chá,tū',
-    0x688D: 'zào',
-    0x688E: 'āo,yòu',
-    0x688F: 'gù,jué',
-    0x6890: 'bì',
-    0x6891: 'dí',
-    0x6892: 'hán',
-    0x6893: 'zǐ',
-    0x6894: 'zhī',
-    0x6895: 'rèn',
-    0x6896: 'bèi',
-    0x6897: 'gěng',
-    0x6898: 'jiǎn,xiàn,jiàn',
-    0x6899: 'huàn',
-    0x689A: 'wǎn',
-    0x689B: 'nuó',
-    0x689C: 'jiā',
-    0x689D: 'tiáo,tiāo',
-    0x689E: 'jì',
-    0x689F: 'xiāo',
-    0x68A0: 'lǚ',
-    0x68A1: 'hún,kuǎn',
-    0x68A2: 'shāo,shào,xiāo,sào',
-    0x68A3: 'cén,chén,qín',
-    0x68A4: 'fén',
-    0x68A5: 'sōng',
-    0x68A6: 'mèng',
-    0x68A7: 'wú,wù,yǔ',
-    0x68A8: 'lí',
-    0x68A9: 'lí,sì,qǐ',
-    0x68AA: 'dòu',
-    0x68AB: 'qǐn,qīn',
-    0x68AC: 'yǐng',
-    0x68AD: 'suō,xùn',
-    0x68AE: 'jū',
-    0x68AF: 'tī,tí',
-    0x68B0: 'xiè',
-    0x68B1: 'kǔn,hún',
-    0x68B2: 'zhuó',
-    0x68B3: 'shū',
-    0x68B4: 'chān',
-    0x68B5: 'fàn',
-    0x68B6: 'wěi',
-    0x68B7: 'jìng',
-    0x68B8: 'lí',
-    0x68B9: 'bīn,bīng',
-    0x68BA: 'xià',
-    0x68BB: 'fó',
-    0x68BC: 'táo',
-    0x68BD: 'zhì',
-    0x68BE: 'lái',
-    0x68BF: 'lián',
-    0x68C0: 'jiǎn',
-    0x68C1: 'zhuō,tuō,ruì',
-    0x68C2: 'líng',
-    0x68C3: 'lí',
-    0x68C4: 'qì',
-    0x68C5: 'bǐng',
-    0x68C6: 'lún',
-    0x68C7: 'cōng,sōng',
-    0x68C8: 'qiàn',
-    0x68C9: 'mián',
-    0x68CA: 'qí',
-    0x68CB: 'qí,jī',
-    0x68CC: 'cài',
-    0x68CD: 'gùn,hùn,āo,gǔn',
-    0x68CE: 'chán',
-    0x68CF: 'dé,zhé',
-    0x68D0: 'fěi,féi',
-    0x68D1: 'pái,bèi,pèi',
-    0x68D2: 'bàng',
-    0x68D3: 'bàng,bèi,pǒu,péi,bēi',
-    0x68D4: 'hūn',
-    0x68D5: 'zōng',
-    0x68D6: 'chéng,cháng',
-    0x68D7: 'zǎo',
-    0x68D8: 'jí',
-    0x68D9: 'lì,liè',
-    0x68DA: 'péng',
-    0x68DB: 'yù',
-    0x68DC: 'yù',
-    0x68DD: 'gù',
-    0x68DE: 'jùn',
-    0x68DF: 'dòng',
-    0x68E0: 'táng',
-    0x68E1: 'gāng',
-    0x68E2: 'wǎng',
-    0x68E3: 'dì,tì,dài',
-    0x68E4: 'cuò',
-    0x68E5: 'fán',
-    0x68E6: 'chēng',
-    0x68E7: 'zhàn,zhǎn,chén',
-    0x68E8: 'qǐ',
-    0x68E9: 'yuān',
-    0x68EA: 'yǎn,yàn',
-    0x68EB: 'yù',
-    0x68EC: 'quān,juàn,quán',
-    0x68ED: 'yì',
-    0x68EE: 'sēn',
-    0x68EF: 'rěn,shěn',
-    0x68F0: 'chuí,duǒ',
-    0x68F1: 'léng,lēng,líng,lèng,chēng',
-    0x68F2: 'qī,xī',
-    0x68F3: 'zhuō',
-    0x68F4: 'fú,sù',
-    0x68F5: 'kē,kuǎn,kě',
-    0x68F6: 'lái',
-    0x68F7: 'zōu,sǒu',
-    0x68F8: 'zōu',
-    0x68F9: 'zhào,zhuō',
-    0x68FA: 'guān,guàn',
-    0x68FB: 'fēn',
-    0x68FC: 'fén,fèn,fēn',
-    0x68FD: 'shēn,chēn',
-    0x68FE: 'qíng',
-    0x68FF: 'ní,niè',
-    0x6900: 'wǎn',
-    0x6901: 'guǒ',
-    0x6902: 'lù',
-    0x6903: 'háo',
-    0x6904: 'jiē,jié,qiè',
-    0x6905: 'yǐ,yī',
-    0x6906: 'chóu,zhòu,diāo',
-    0x6907: 'jǔ',
-    0x6908: 'jú',
-    0x6909: 'chéng,shèng',
-    0x690A: 'zuó,cuì',
-    0x690B: 'liáng',
-    0x690C: 'qiāng,kōng',
-    0x690D: 'zhí',
-    0x690E: 'chuí,zhuī',
-    0x690F: 'yā,ě',
-    0x6910: 'jū',
-    0x6911: 'bēi,pí,bì,pái',
-    0x6912: 'jiāo',
-    0x6913: 'zhuó',
-    0x6914: 'zī',
-    0x6915: 'bīn',
-    0x6916: 'péng',
-    0x6917: 'dìng',
-    0x6918: 'chǔ',
-    0x6919: 'chāng',
-    0x691A: 'mēn',
-    0x691B: 'huā',
-    0x691C: 'jiǎn',
-    0x691D: 'guī',
-    0x691E: 'xì',
-    0x691F: 'dú',
-    0x6920: 'qiàn',
-    0x6921: 'dào',
-    0x6922: 'guì',
-    0x6923: 'diǎn',
-    0x6924: 'luó',
-    0x6925: 'zhī',
-    0x6926: 'quan',
-    0x6927: 'mìng',
-    0x6928: 'fǔ',
-    0x6929: 'gēng',
-    0x692A: 'pèng',
-    0x692B: 'shàn',
-    0x692C: 'yí',
-    0x692D: 'tuǒ',
-    0x692E: 'sēn',
-    0x692F: 'duǒ,chuán',
-    0x6930: 'yē',
-    0x6931: 'fù',
-    0x6932: 'wěi,huī',
-    0x6933: 'wēi',
-    0x6934: 'duàn',
-    0x6935: 'jiǎ,jiā',
-    0x6936: 'zōng',
-    0x6937: 'jiān,hán',
-    0x6938: 'yí',
-    0x6939: 'shèn,zhēn',
-    0x693A: 'xí',
-    0x693B: 'yàn,yà',
-    0x693C: 'yǎn',
-    0x693D: 'chuán',
-    0x693E: 'jiān,zhàn',
-    0x693F: 'chūn',
-    0x6940: 'yǔ',
-    0x6941: 'hé',
-    0x6942: 'zhā,chá',
-    0x6943: 'wò',
-    0x6944: 'pián',
-    0x6945: 'bī',
-    0x6946: 'yāo',
-    0x6947: 'huò,guō,kuǎ',
-    0x6948: 'xū',
-    0x6949: 'ruò',
-    0x694A: 'yáng',
-    0x694B: 'là',
-    0x694C: 'yán',
-    0x694D: 'běn',
-    0x694E: 'huī',
-    0x694F: 'kuí',
-    0x6950: 'jiè',
-    0x6951: 'kuí',
-    0x6952: 'sī',
-    0x6953: 'fēng,fán',
-    0x6954: 'xiē,xiè',
-    0x6955: 'tuǒ',
-    0x6956: 'zhì,jí',
-    0x6957: 'jiàn,jiǎn',
-    0x6958: 'mù',
-    0x6959: 'mào',
-    0x695A: 'chǔ',
-    0x695B: 'hù,kǔ',
-    0x695C: 'hú',
-    0x695D: 'liàn',
-    0x695E: 'léng,lèng',
-    0x695F: 'tíng',
-    0x6960: 'nán',
-    0x6961: 'yú',
-    0x6962: 'yóu,yǒu',
-    0x6963: 'méi,měi',
-    0x6964: 'sǒng,cōng',
-    0x6965: 'xuàn,yuán',
-    0x6966: 'xuàn',
-    0x6967: 'yǎng',
-    0x6968: 'zhēn',
-    0x6969: 'pián',
-    0x696A: 'yè,dié',
-    0x696B: 'jí',
-    0x696C: 'jié,qià',
-    0x696D: 'yè',
-    0x696E: 'chǔ,zhū',
-    0x696F: 'dùn,shǔn,chūn',
-    0x6970: 'yú',
-    0x6971: 'zòu,cōu',
-    0x6972: 'wēi',
-    0x6973: 'méi',
-    0x6974: 'tì,dǐ,shì',
-    0x6975: 'jí,jǐ',
-    0x6976: 'jié',
-    0x6977: 'kǎi,jiē,jiè',
-    0x6978: 'qiū',
-    0x6979: 'yíng',
-    0x697A: 'rǒu,ròu',
-    0x697B: 'huáng',
-    0x697C: 'lóu',
-    0x697D: 'lè',
-    0x697E: 'quán',
-    0x697F: 'xiāng',
-    0x6980: 'pǐn',
-    0x6981: 'shǐ',
-    0x6982: 'gài,guì,jié',
-    0x6983: 'tán',
-    0x6984: 'lǎn',
-    0x6985: 'wēn,yùn',
-    0x6986: 'yú',
-    0x6987: 'chèn',
-    0x6988: 'lǘ',
-    0x6989: 'jǔ',
-    0x698A: 'shén',
-    0x698B: 'chu',
-    0x698C: 'bī',
-    0x698D: 'xiè',
-    0x698E: 'jiǎ',
-    0x698F: 'yì',
-    0x6990: 'zhǎn,chǎn,niàn,zhèn',
-    0x6991: 'fú,fù,bó',
-    0x6992: 'nuò',
-    0x6993: 'mì',
-    0x6994: 'láng,lǎng',
-    0x6995: 'róng',
-    0x6996: 'gǔ',
-    0x6997: 'jiàn,jìn',
-    0x6998: 'jǔ',
-    0x6999: 'tā',
-    0x699A: 'yǎo',
-    0x699B: 'zhēn',
-    0x699C: 'bǎng,bēng,bàng,páng,péng',
-    0x699D: 'shā,xiè',
-    0x699E: 'yuán',
-    0x699F: 'zǐ',
-    0x69A0: 'míng',
-    0x69A1: 'sù',
-    0x69A2: 'jià',
-    0x69A3: 'yáo',
-    0x69A4: 'jié',
-    0x69A5: 'huàng',
-    0x69A6: 'gàn,hán',
-    0x69A7: 'fěi',
-    0x69A8: 'zhà',
-    0x69A9: 'qián',
-    0x69AA: 'mà,mǎ',
-    0x69AB: 'sǔn',
-    0x69AC: 'yuán',
-    0x69AD: 'xiè',
-    0x69AE: 'róng',
-    0x69AF: 'shí',
-    0x69B0: 'zhī',
-    0x69B1: 'cuī',
-    0x69B2: 'wēn',
-    0x69B3: 'tíng',
-    0x69B4: 'liú',
-    0x69B5: 'róng',
-    0x69B6: 'táng',
-    0x69B7: 'què',
-    0x69B8: 'zhāi',
-    0x69B9: 'sī',
-    0x69BA: 'shèng',
-    0x69BB: 'tà',
-    0x69BC: 'kē',
-    0x69BD: 'xī',
-    0x69BE: 'gǔ',
-    0x69BF: 'qī',
-    0x69C0: 'gǎo,kào',
-    0x69C1: 'gǎo,kào,gāo',
-    0x69C2: 'sūn',
-    0x69C3: 'pán',
-    0x69C4: 'tāo',
-    0x69C5: 'gé',
-    0x69C6: 'chūn',
-    0x69C7: 'diān,zhěn,zhēn',
-    0x69C8: 'nòu',
-    0x69C9: 'jí',
-    0x69CA: 'shuò',
-    0x69CB: 'gòu,jué',
-    0x69CC: 'chuí,zhuì,duī',
-    0x69CD: 'qiāng,chēng,qiǎng',
-    0x69CE: 'chá',
-    0x69CF: 'qiǎn,xiàn,lián',
-    0x69D0: 'huái',
-    0x69D1: 'méi',
-    0x69D2: 'xù',
-    0x69D3: 'gàng',
-    0x69D4: 'gāo',
-    0x69D5: 'zhuō',
-    0x69D6: 'tuó',
-    0x69D7: 'qiáo',
-    0x69D8: 'yàng',
-    0x69D9: 'diān',
-    0x69DA: 'jiǎ',
-    0x69DB: 'kǎn,jiàn',
-    0x69DC: 'zuì',
-    0x69DD: 'dǎo',
-    0x69DE: 'lóng',
-    0x69DF: 'bīn,bīng',
-    0x69E0: 'zhū',
-    0x69E1: 'sāng',
-    0x69E2: 'xí,dié',
-    0x69E3: 'jī,guī',
-    0x69E4: 'lián,liǎn',
-    0x69E5: 'huì',
-    0x69E6: 'yōng',
-    0x69E7: 'qiàn',
-    0x69E8: 'guǒ',
-    0x69E9: 'gài',
-    0x69EA: 'gài',
-    0x69EB: 'tuán,shuàn,quán',
-    0x69EC: 'huà',
-    0x69ED: 'qī,qì,zú,sè',
-    0x69EE: 'sēn,shěn',
-    0x69EF: 'cuī,zuǐ',
-    0x69F0: 'péng',
-    0x69F1: 'yǒu,chǎo',
-    0x69F2: 'hú',
-    0x69F3: 'jiǎng,jiāng',
-    0x69F4: 'hù',
-    0x69F5: 'huàn',
-    0x69F6: 'guì',
-    0x69F7: 'niè,xiè,yì',
-    0x69F8: 'yì',
-    0x69F9: 'gāo',
-    0x69FA: 'kāng',
-    0x69FB: 'guī',
-    0x69FC: 'guī',
-    0x69FD: 'cáo,zāo',
-    0x69FE: 'màn,wàn,mán',
-    0x69FF: 'jǐn,qín',
-    0x6A00: 'dí,zhí,zhé,dī',
-    0x6A01: 'zhuāng,chōng',
-    0x6A02: 'lè,yuè,yào,luò,liáo',
-    0x6A03: 'lǎng',
-    0x6A04: 'chén',
-    0x6A05: 'cōng,zōng',
-    0x6A06: 'lí,chī',
-    0x6A07: 'xiū',
-    0x6A08: 'qíng',
-    0x6A09: 'shuǎng',
-    0x6A0A: 'fán,fàn',
-    0x6A0B: 'tōng',
-    0x6A0C: 'guàn',
-    0x6A0D: 'zé',
-    0x6A0E: 'sù',
-    0x6A0F: 'lěi,léi',
-    0x6A10: 'lǔ',
-    0x6A11: 'liáng',
-    0x6A12: 'mì',
-    0x6A13: 'lóu,lǘ',
-    0x6A14: 'cháo,chāo,jiǎo',
-    0x6A15: 'sù',
-    0x6A16: 'kē',
-    0x6A17: 'chū',
-    0x6A18: 'táng,chēng',
-    0x6A19: 'biāo,biào',
-    0x6A1A: 'lù,dú',
-    0x6A1B: 'jiū,liáo',
-    0x6A1C: 'zhè',
-    0x6A1D: 'zhā',
-    0x6A1E: 'shū,ōu',
-    0x6A1F: 'zhāng',
-    0x6A20: 'mán,lǎng',
-    0x6A21: 'mó,mú',
-    0x6A22: 'niǎo,mù',
-    0x6A23: 'yàng,xiàng',
-    0x6A24: 'tiáo',
-    0x6A25: 'péng',
-    0x6A26: 'zhù',
-    0x6A27: 'shā',
-    0x6A28: 'xī',
-    0x6A29: 'quán',
-    0x6A2A: 'héng,hèng,guāng,guàng,huáng,huàng',
-    0x6A2B: 'jiān',
-    0x6A2C: 'cōng',
-    0x6A2D: 'jī',
-    0x6A2E: 'yān',
-    0x6A2F: 'qiáng',
-    0x6A30: 'xuě',
-    0x6A31: 'yīng',
-    0x6A32: 'èr,zhì',
-    0x6A33: 'xún',
-    0x6A34: 'zhí,yì',
-    0x6A35: 'qiáo',
-    0x6A36: 'zuī',
-    0x6A37: 'cóng',
-    0x6A38: 'pǔ,pú',
-    0x6A39: 'shù',
-    0x6A3A: 'huà',
-    0x6A3B: 'kuì',
-    0x6A3C: 'zhēn',
-    0x6A3D: 'zūn',
-    0x6A3E: 'yuè',
-    0x6A3F: 'shàn',
-    0x6A40: 'xī',
-    0x6A41: 'chūn',
-    0x6A42: 'diàn',
-    0x6A43: 'fá,fèi',
-    0x6A44: 'gǎn',
-    0x6A45: 'mó',
-    0x6A46: 'wǔ,wú',
-    0x6A47: 'qiāo',
-    0x6A48: 'ráo,náo',
-    0x6A49: 'lìn',
-    0x6A4A: 'liú',
-    0x6A4B: 'qiáo,jiāo,jiào,qiāo,jiǎo',
-    0x6A4C: 'xiàn',
-    0x6A4D: 'rùn',
-    0x6A4E: 'fán',
-    0x6A4F: 'zhǎn,jiǎn',
-    0x6A50: 'tuó,dù,luò',
-    0x6A51: 'lǎo,liáo',
-    0x6A52: 'yún',
-    0x6A53: 'shùn',
-    0x6A54: 'dūn,tuí',
-    0x6A55: 'chēng',
-    0x6A56: 'táng,chēng',
-    0x6A57: 'méng',
-    0x6A58: 'jú',
-    0x6A59: 'chéng,dèng,chén',
-    0x6A5A: 'sù,xiāo,qiū',
-    0x6A5B: 'jué',
-    0x6A5C: 'jué',
-    0x6A5D: 'diàn,tán,xín',
-    0x6A5E: 'huì',
-    0x6A5F: 'jī',
-    0x6A60: 'nuǒ,nuó',
-    0x6A61: 'xiàng',
-    0x6A62: 'tuǒ,duǒ',
-    0x6A63: 'nǐng',
-    0x6A64: 'ruǐ',
-    0x6A65: 'zhū',
-    0x6A66: 'tóng,chuáng,zhōng,chōng',
-    0x6A67: 'zēng,céng',
-    0x6A68: 'fén,fèn,fèi',
-    0x6A69: 'qióng',
-    0x6A6A: 'rǎn,yān',
-    0x6A6B: 'héng',
-    0x6A6C: 'qián,qín',
-    0x6A6D: 'gū',
-    0x6A6E: 'liǔ',
-    0x6A6F: 'lào',
-    0x6A70: 'gāo',
-    0x6A71: 'chú',
-    0x6A72: 'xǐ',
-    0x6A73: 'shèng',
-    0x6A74: 'zǐ',
-    0x6A75: 'san',
-    0x6A76: 'jí',
-    0x6A77: 'dōu',
-    0x6A78: 'jīng',
-    0x6A79: 'lǔ',
-    0x6A7A: 'jian',
-    0x6A7B: 'chu',
-    0x6A7C: 'yuán',
-    0x6A7D: 'tà',
-    0x6A7E: 'shū,qiāo,sāo',
-    0x6A7F: 'jiāng',
-    0x6A80: 'tán,shàn',
-    0x6A81: 'lǐn',
-    0x6A82: 'nóng',
-    0x6A83: 'yǐn',
-    0x6A84: 'xí',
-    0x6A85: 'huì',
-    0x6A86: 'shān',
-    0x6A87: 'zuì',
-    0x6A88: 'xuán',
-    0x6A89: 'chēng',
-    0x6A8A: 'gàn',
-    0x6A8B: 'jú',
-    0x6A8C: 'zuì',
-    0x6A8D: 'yì',
-    0x6A8E: 'qín',
-    0x6A8F: 'pǔ',
-    0x6A90: 'yán,dān',
-    0x6A91: 'léi,lèi',
-    0x6A92: 'fēng',
-    0x6A93: 'huǐ',
-    0x6A94: 'dàng,dāng',
-    0x6A95: 'jì',
-    0x6A96: 'suì',
-    0x6A97: 'bò,bì',
-    0x6A98: 'píng,bò',
-    0x6A99: 'chéng',
-    0x6A9A: 'chǔ',
-    0x6A9B: 'zhuā',
-    0x6A9C: 'guì,kuài,huì',
-    0x6A9D: 'jí',
-    0x6A9E: 'jiě,xiè',
-    0x6A9F: 'jiǎ',
-    0x6AA0: 'qíng,jìng',
-    0x6AA1: 'zhái,shì,tú',
-    0x6AA2: 'jiǎn',
-    0x6AA3: 'qiáng',
-    0x6AA4: 'dào',
-    0x6AA5: 'yǐ',
-    0x6AA6: 'biǎo',
-    0x6AA7: 'sōng',
-    0x6AA8: 'shē',
-    0x6AA9: 'lǐn',
-    0x6AAA: 'lì',
-    0x6AAB: 'chá,sà',
-    0x6AAC: 'méng',
-    0x6AAD: 'yín',
-    0x6AAE: 'táo,chóu,dào',
-    0x6AAF: 'tái',
-    0x6AB0: 'mián',
-    0x6AB1: 'qí',
-    0x6AB2: 'tuán',
-    0x6AB3: 'bīn,bīng',
-    0x6AB4: 'huò,huà',
-    0x6AB5: 'jì',
-    0x6AB6: 'qiān',
-    0x6AB7: 'nǐ,mí',
-    0x6AB8: 'níng',
-    0x6AB9: 'yī',
-    0x6ABA: 'gǎo',
-    0x6ABB: 'kǎn,jiàn',
-    0x6ABC: 'yìn',
-    0x6ABD: 'nòu,ruǎn,rú',
-    0x6ABE: 'qǐng',
-    0x6ABF: 'yǎn',
-    0x6AC0: 'qí',
-    0x6AC1: 'mì',
-    0x6AC2: 'zhào,dí',
-    0x6AC3: 'guì',
-    0x6AC4: 'chūn',
-    0x6AC5: 'jī,jì',
-    0x6AC6: 'kuí',
-    0x6AC7: 'pó',
-    0x6AC8: 'dèng',
-    0x6AC9: 'chú',
-    0x6ACA: 'gé',
-    0x6ACB: 'mián',
-    0x6ACC: 'yōu',
-    0x6ACD: 'zhì',
-    0x6ACE: 'huǎng,guàng,guǒ,gǔ',
-    0x6ACF: 'qiān',
-    0x6AD0: 'lěi',
-    0x6AD1: 'léi,lěi',
-    0x6AD2: 'sà',
-    0x6AD3: 'lǔ',
-    0x6AD4: 'lì',
-    0x6AD5: 'cuán',
-    0x6AD6: 'lǜ,chū',
-    0x6AD7: 'miè,mèi',
-    0x6AD8: 'huì',
-    0x6AD9: 'ōu',
-    0x6ADA: 'lǘ',
-    0x6ADB: 'zhì',
-    0x6ADC: 'gāo',
-    0x6ADD: 'dú',
-    0x6ADE: 'yuán',
-    0x6ADF: 'lì,luò,yuè',
-    0x6AE0: 'fèi',
-    0x6AE1: 'zhuó,zhù',
-    0x6AE2: 'sǒu',
-    0x6AE3: 'lián',
-    0x6AE4: 'jiàng',
-    0x6AE5: 'chú',
-    0x6AE6: 'qìng',
-    0x6AE7: 'zhū',
-    0x6AE8: 'lú,lǘ',
-    0x6AE9: 'yán,yǎn',
-    0x6AEA: 'lì',
-    0x6AEB: 'zhū',
-    0x6AEC: 'chèn,qìn,guàn',
-    0x6AED: 'jié,jì',
-    0x6AEE: 'è',
-    0x6AEF: 'sū',
-    0x6AF0: 'huái,guī',
-    0x6AF1: 'niè',
-    0x6AF2: 'yù',
-    0x6AF3: 'lóng',
-    0x6AF4: 'lài',
-    0x6AF5: 'jiao',
-    0x6AF6: 'xiǎn',
-    0x6AF7: 'guī',
-    0x6AF8: 'jǔ',
-    0x6AF9: 'xiāo,qiū,xiū',
-    0x6AFA: 'líng',
-    0x6AFB: 'yīng',
-    0x6AFC: 'jiān,shān',
-    0x6AFD: 'yǐn',
-    0x6AFE: 'yóu,yòu',
-    0x6AFF: 'yíng',
-    0x6B00: 'xiāng,ràng',
-    0x6B01: 'nóng',
-    0x6B02: 'bó',
-    0x6B03: 'chán,zhàn',
-    0x6B04: 'lán,liàn',
-    0x6B05: 'jǔ',
-    0x6B06: 'shuāng',
-    0x6B07: 'shè',
-    0x6B08: 'wéi,zuì',
-    0x6B09: 'cóng',
-    0x6B0A: 'quán,guàn',
-    0x6B0B: 'qú',
-    0x6B0C: 'cáng',
-    0x6B0D: 'jiù',
-    0x6B0E: 'yù',
-    0x6B0F: 'luó,luǒ',
-    0x6B10: 'lì,lǐ',
-    0x6B11: 'cuán,zuàn',
-    0x6B12: 'luán',
-    0x6B13: 'dǎng,tǎng',
-    0x6B14: 'jué',
-    0x6B15: 'yán',
-    0x6B16: 'lǎn',
-    0x6B17: 'lán',
-    0x6B18: 'zhú',
-    0x6B19: 'léi,luǒ',
-    0x6B1A: 'lǐ',
-    0x6B1B: 'bà',
-    0x6B1C: 'náng',
-    0x6B1D: 'yù',
-    0x6B1E: 'líng',
-    0x6B1F: 'guang',
-    0x6B20: 'qiàn',
-    0x6B21: 'cì,zī,cí',
-    0x6B22: 'huān',
-    0x6B23: 'xīn',
-    0x6B24: 'yú',
-    0x6B25: 'yì,huān,yù',
-    0x6B26: 'qiān,hān,xiān,qián',
-    0x6B27: 'ōu',
-    0x6B28: 'xū',
-    0x6B29: 'chāo',
-    0x6B2A: 'chù,xì,qù',
-    0x6B2B: 'qì',
-    0x6B2C: 'kài,ài',
-    0x6B2D: 'yì,yīn',
-    0x6B2E: 'jué',
-    0x6B2F: 'xì,kài',
-    0x6B30: 'xù',
-    0x6B31: 'hē,xiá',
-    0x6B32: 'yù',
-    0x6B33: 'kuì',
-    0x6B34: 'láng',
-    0x6B35: 'kuǎn',
-    0x6B36: 'shuò,sòu',
-    0x6B37: 'xī',
-    0x6B38: 'āi,ǎi,ê̄,ế,ê̌,ề,xiè,éi,ěi,èi,ēi',
-    0x6B39: 'yī,qī',
-    0x6B3A: 'qī',
-    0x6B3B: 'chuā,xū',
-    0x6B3C: 'chǐ,chuài',
-    0x6B3D: 'qīn,qìn,yín',
-    0x6B3E: 'kuǎn,xīn',
-    0x6B3F: 'kǎn,qiàn,dàn',
-    0x6B40: 'kuǎn',
-    0x6B41: 'kǎn,kè,qiǎn',
-    0x6B42: 'chuǎn,chuán',
-    0x6B43: 'shà,xiá',
-    0x6B44: 'guā',
-    0x6B45: 'yīn',
-    0x6B46: 'xīn',
-    0x6B47: 'xiē,yà',
-    0x6B48: 'yú',
-    0x6B49: 'qiàn',
-    0x6B4A: 'xiāo',
-    0x6B4B: 'yè',
-    0x6B4C: 'gē',
-    0x6B4D: 'wū,yāng',
-    0x6B4E: 'tàn',
-    0x6B4F: 'jìn,qūn',
-    0x6B50: 'ōu,ǒu',
-    0x6B51: 'hū',
-    0x6B52: 'tì,xiāo',
-    0x6B53: 'huān',
-    0x6B54: 'xū',
-    0x6B55: 'pēn',
-    0x6B56: 'xǐ,yǐ',
-    0x6B57: 'xiào',
-    0x6B58: 'chuā,xū',
-    0x6B59: 'shè,xī,xié',
-    0x6B5A: 'shàn',
-    0x6B5B: 'hān,liǎn',
-    0x6B5C: 'chù',
-    0x6B5D: 'yì',
-    0x6B5E: 'è',
-    0x6B5F: 'yú',
-    0x6B60: 'chuò',
-    0x6B61: 'huān',
-    0x6B62: 'zhǐ',
-    0x6B63: 'zhèng,zhēng',
-    0x6B64: 'cǐ',
-    0x6B65: 'bù',
-    0x6B66: 'wǔ',
-    0x6B67: 'qí',
-    0x6B68: 'bù',
-    0x6B69: 'bù',
-    0x6B6A: 'wāi,wǎi',
-    0x6B6B: 'jù',
-    0x6B6C: 'qián',
-    0x6B6D: 'chí,zhì',
-    0x6B6E: 'sè',
-    0x6B6F: 'chǐ',
-    0x6B70: 'sè,shà',
-    0x6B71: 'zhǒng',
-    0x6B72: 'suì,suò',
-    0x6B73: 'suì',
-    0x6B74: 'lì',
-    0x6B75: 'zé',
-    0x6B76: 'yú',
-    0x6B77: 'lì',
-    0x6B78: 'guī,kuì,kuí',
-    0x6B79: 'dǎi,è,dāi',
-    0x6B7A: 'è',
-    0x6B7B: 'sǐ',
-    0x6B7C: 'jiān',
-    0x6B7D: 'zhé',
-    0x6B7E: 'mò,wěn',
-    0x6B7F: 'mò',
-    0x6B80: 'yāo',
-    0x6B81: 'mò,wěn',
-    0x6B82: 'cú',
-    0x6B83: 'yāng',
-    0x6B84: 'tiǎn',
-    0x6B85: 'shēng',
-    0x6B86: 'dài',
-    0x6B87: 'shāng',
-    0x6B88: 'xù',
-    0x6B89: 'xùn',
-    0x6B8A: 'shū',
-    0x6B8B: 'cán',
-    0x6B8C: 'jué',
-    0x6B8D: 'piǎo,bì',
-    0x6B8E: 'qià',
-    0x6B8F: 'qiú',
-    0x6B90: 'sù',
-    0x6B91: 'qíng,jīng,jìng',
-    0x6B92: 'yǔn',
-    0x6B93: 'liàn',
-    0x6B94: 'yì',
-    0x6B95: 'fǒu,yè,bó',
-    0x6B96: 'zhí,shi,shì',
-    0x6B97: 'yè,yàn,yān',
-    0x6B98: 'cán',
-    0x6B99: 'hūn,mèn',
-    0x6B9A: 'dān',
-    0x6B9B: 'jí',
-    0x6B9C: 'dié',
-    0x6B9D: 'zhēn',
-    0x6B9E: 'yǔn',
-    0x6B9F: 'wēn',
-    0x6BA0: 'chòu',
-    0x6BA1: 'bìn',
-    0x6BA2: 'tì',
-    0x6BA3: 'jìn',
-    0x6BA4: 'shāng',
-    0x6BA5: 'yín',
-    0x6BA6: 'diāo',
-    0x6BA7: 'jiù',
-    0x6BA8: 'huì,kuì',
-    0x6BA9: 'cuàn',
-    0x6BAA: 'yì',
-    0x6BAB: 'dān',
-    0x6BAC: 'dù',
-    0x6BAD: 'jiāng',
-    0x6BAE: 'liàn',
-    0x6BAF: 'bìn',
-    0x6BB0: 'dú',
-    0x6BB1: 'jiān',
-    0x6BB2: 'jiān',
-    0x6BB3: 'shū',
-    0x6BB4: 'ōu',
-    0x6BB5: 'duàn',
-    0x6BB6: 'zhù',
-    0x6BB7: 'yīn,yān,yǐn',
-    0x6BB8: 'qìng,kēng,shēng',
-    0x6BB9: 'yì',
-    0x6BBA: 'shā,shài,sà,xiè,shì',
-    0x6BBB: 'qiào',
-    0x6BBC: 'ké,qiào',
-    0x6BBD: 'xiáo,yáo,xiào',
-    0x6BBE: 'xùn',
-    0x6BBF: 'diàn',
-    0x6BC0: 'huǐ',
-    0x6BC1: 'huǐ,huì',
-    0x6BC2: 'gǔ,gū',
-    0x6BC3: 'qiāo',
-    0x6BC4: 'jī',
-    0x6BC5: 'yì',
-    0x6BC6: 'ōu,kōu,qū',
-    0x6BC7: 'huǐ',
-    0x6BC8: 'duàn',
-    0x6BC9: 'yī',
-    0x6BCA: 'xiāo',
-    0x6BCB: 'wú,móu',
-    0x6BCC: 'guàn',
-    0x6BCD: 'mǔ,mú,wǔ,wú',
-    0x6BCE: 'měi',
-    0x6BCF: 'měi',
-    0x6BD0: 'ǎi',
-    0x6BD1: 'jiě',
-    0x6BD2: 'dú,dài',
-    0x6BD3: 'yù',
-    0x6BD4: 'bǐ,bì,pí,pǐ',
-    0x6BD5: 'bì',
-    0x6BD6: 'bì',
-    0x6BD7: 'pí',
-    0x6BD8: 'pí',
-    0x6BD9: 'bì',
-    0x6BDA: 'chán',
-    0x6BDB: 'máo,mào',
-    0x6BDC: 'háo',
-    0x6BDD: 'cǎi',
-    0x6BDE: 'pí',
-    0x6BDF: 'liě',
-    0x6BE0: 'jiā',
-    0x6BE1: 'zhān',
-    0x6BE2: 'sāi',
-    0x6BE3: 'mù,mào',
-    0x6BE4: 'tuò',
-    0x6BE5: 'xún,xùn',
-    0x6BE6: 'ěr',
-    0x6BE7: 'róng',
-    0x6BE8: 'xiǎn',
-    0x6BE9: 'jú',
-    0x6BEA: 'mú',
-    0x6BEB: 'háo',
-    0x6BEC: 'qiú',
-    0x6BED: 'dòu,nuò',
-    0x6BEE: 'shā',
-    0x6BEF: 'tǎn',
-    0x6BF0: 'péi',
-    0x6BF1: 'jú',
-    0x6BF2: 'duō',
-    0x6BF3: 'cuì,qiāo,xiā',
-    0x6BF4: 'bī',
-    0x6BF5: 'sān',
-    0x6BF6: 'sān',
-    0x6BF7: 'mào',
-    0x6BF8: 'sāi,suī',
-    0x6BF9: 'shū,yú',
-    0x6BFA: 'shū',
-    0x6BFB: 'tuò',
-    0x6BFC: 'hé,kě,dā',
-    0x6BFD: 'jiàn',
-    0x6BFE: 'tà',
-    0x6BFF: 'sān',
-    0x6C00: 'lǘ,shū,yú,dōu',
-    0x6C01: 'mú',
-    0x6C02: 'máo,lí',
-    0x6C03: 'tóng',
-    0x6C04: 'rǒng,róng',
-    0x6C05: 'chǎng',
-    0x6C06: 'pǔ',
-    0x6C07: 'lu',
-    0x6C08: 'zhān',
-    0x6C09: 'sào',
-    0x6C0A: 'zhān',
-    0x6C0B: 'méng',
-    0x6C0C: 'lǔ',
-    0x6C0D: 'qú',
-    0x6C0E: 'dié',
-    0x6C0F: 'shì,zhī,jīng',
-    0x6C10: 'dī,dǐ,zhī',
-    0x6C11: 'mín',
-    0x6C12: 'jué',
-    0x6C13: 'máng,méng',
-    0x6C14: 'qì,qǐ',
-    0x6C15: 'piē',
-    0x6C16: 'nǎi',
-    0x6C17: 'qì',
-    0x6C18: 'dāo',
-    0x6C19: 'xiān',
-    0x6C1A: 'chuān',
-    0x6C1B: 'fēn',
-    0x6C1C: 'yáng,rì',
-    0x6C1D: 'nèi',
-    0x6C1E: 'bin',
-    0x6C1F: 'fú',
-    0x6C20: 'shēn',
-    0x6C21: 'dōng',
-    0x6C22: 'qīng',
-    0x6C23: 'qì,xì',
-    0x6C24: 'yīn,yán',
-    0x6C25: 'xī',
-    0x6C26: 'hài',
-    0x6C27: 'yǎng',
-    0x6C28: 'ān',
-    0x6C29: 'yà',
-    0x6C2A: 'kè',
-    0x6C2B: 'qīng',
-    0x6C2C: 'yà',
-    0x6C2D: 'dōng',
-    0x6C2E: 'dàn',
-    0x6C2F: 'lǜ',
-    0x6C30: 'qíng',
-    0x6C31: 'yǎng',
-    0x6C32: 'yūn,yún',
-    0x6C33: 'yūn',
-    0x6C34: 'shuǐ',
-    0x6C35: 'shui',
-    0x6C36: 'zhěng,chéng,zhèng',
-    0x6C37: 'bīng',
-    0x6C38: 'yǒng',
-    0x6C39: 'dàng',
-    0x6C3A: 'shuǐ',
-    0x6C3B: 'lè',
-    0x6C3C: 'nì,mèi',
-    0x6C3D: 'tǔn,qiú',
-    0x6C3E: 'fàn,fán',
-    0x6C3F: 'guǐ,jiǔ,qiú',
-    0x6C40: 'tīng,tìng,dìng',
-    0x6C41: 'zhī,xié,shí',
-    0x6C42: 'qiú',
-    0x6C43: 'bīn,pà,pā',
-    0x6C44: 'zè',
-    0x6C45: 'miǎn',
-    0x6C46: 'cuān',
-    0x6C47: 'huì',
-    0x6C48: 'diāo',
-    0x6C49: 'hàn',
-    0x6C4A: 'chà',
-    0x6C4B: 'zhuó,yuè,què,shuò',
-    0x6C4C: 'chuàn',
-    0x6C4D: 'wán,huán',
-    0x6C4E: 'fàn,fá',
-    0x6C4F: 'dà,tài',
-    0x6C50: 'xī',
-    0x6C51: 'tuō',
-    0x6C52: 'máng,mǎng',
-    0x6C53: 'qiú,yóu',
-    0x6C54: 'qì',
-    0x6C55: 'shàn,shuàn',
-    0x6C56: 'pìn,chí',
-    0x6C57: 'hàn,hán,gān',
-    0x6C58: 'qiān',
-    0x6C59: 'wū,yú,wā,yū',
-    0x6C5A: 'wū',
-    0x6C5B: 'xùn',
-    0x6C5C: 'sì',
-    0x6C5D: 'rǔ',
-    0x6C5E: 'gǒng',
-    0x6C5F: 'jiāng',
-    0x6C60: 'chí,tuó,chè',
-    0x6C61: 'wū',
-    0x6C62: 'tu',
-    0x6C63: 'jiǔ',
-    0x6C64: 'tāng,shāng',
-    0x6C65: 'zhī,jì',
-    0x6C66: 'zhǐ',
-    0x6C67: 'qiān,yán',
-    0x6C68: 'mì',
-    0x6C69: 'gǔ,yù,hú',
-    0x6C6A: 'wāng,wǎng,hóng',
-    0x6C6B: 'jǐng',
-    0x6C6C: 'jǐng',
-    0x6C6D: 'ruì,tūn',
-    0x6C6E: 'jūn',
-    0x6C6F: 'hóng',
-    0x6C70: 'tài',
-    0x6C71: 'quǎn,fú',
-    0x6C72: 'jí,jī',
-    0x6C73: 'biàn',
-    0x6C74: 'biàn',
-    0x6C75: 'gàn,hán,cén',
-    0x6C76: 'wèn,wén,mín,mén',
-    0x6C77: 'zhōng',
-    0x6C78: 'fāng,pāng',
-    0x6C79: 'xiōng',
-    0x6C7A: 'jué,quē,xuè',
-    0x6C7B: 'hǔ,huǎng',
-    0x6C7C: 'niú,yóu',
-    0x6C7D: 'qì,gài,yǐ',
-    0x6C7E: 'fén,pén,fēn',
-    0x6C7F: 'xù',
-    0x6C80: 'xù',
-    0x6C81: 'qìn',
-    0x6C82: 'yí,yín',
-    0x6C83: 'wò',
-    0x6C84: 'yún',
-    0x6C85: 'yuán',
-    0x6C86: 'hàng,háng,kàng',
-    0x6C87: 'yǎn,wěi',
-    0x6C88: 'shěn,chén,tán',
-    0x6C89: 'chén',
-    0x6C8A: 'dàn',
-    0x6C8B: 'yóu',
-    0x6C8C: 'dùn,zhuàn,tún,chún',
-    0x6C8D: 'hù,hú',
-    0x6C8E: 'huò',
-    0x6C8F: 'qī,qiè',
-    0x6C90: 'mù',
-    0x6C91: 'nǜ,niǔ',
-    0x6C92: 'méi',
-    0x6C93: 'dá,tà',
-    0x6C94: 'miǎn',
-    0x6C95: 'mì,wù,fū',
-    0x6C96: 'chōng',
-    0x6C97: 'pāng,tiān',
-    0x6C98: 'bǐ',
-    0x6C99: 'shā,shà,suō',
-    0x6C9A: 'zhǐ',
-    0x6C9B: 'pèi',
-    0x6C9C: 'pàn',
-    0x6C9D: 'zhuǐ,zǐ',
-    0x6C9E: 'zā',
-    0x6C9F: 'gōu',
-    0x6CA0: 'liú',
-    0x6CA1: 'méi,mò,me',
-    0x6CA2: 'zé',
-    0x6CA3: 'fēng',
-    0x6CA4: 'ōu,òu',
-    0x6CA5: 'lì',
-    0x6CA6: 'lún',
-    0x6CA7: 'cāng',
-    0x6CA8: 'fēng',
-    0x6CA9: 'wéi',
-    0x6CAA: 'hù',
-    0x6CAB: 'mò',
-    0x6CAC: 'mèi,huì',
-    0x6CAD: 'shù',
-    0x6CAE: 'jǔ,jū,jù,jiān,zǔ',
-    0x6CAF: 'zá',
-    0x6CB0: 'tuō,duó',
-    0x6CB1: 'tuó,duò,chí',
-    0x6CB2: 'tuó',
-    0x6CB3: 'hé',
-    0x6CB4: 'lì,zhěn',
-    0x6CB5: 'mǐ',
-    0x6CB6: 'yí,chí,shì',
-    0x6CB7: 'fā',
-    0x6CB8: 'fèi,fú',
-    0x6CB9: 'yóu,yòu',
-    0x6CBA: 'tián',
-    0x6CBB: 'zhì,chí',
-    0x6CBC: 'zhǎo',
-    0x6CBD: 'gū,gǔ',
-    0x6CBE: 'zhān,tiān,diàn,chān',
-    0x6CBF: 'yán,yǎn,yàn',
-    0x6CC0: 'sī',
-    0x6CC1: 'kuàng',
-    0x6CC2: 'jiǒng,yíng,yǐng,jiōng',
-    0x6CC3: 'jū,gōu',
-    0x6CC4: 'xiè,yì',
-    0x6CC5: 'qiú,yōu',
-    0x6CC6: 'yì,dié',
-    0x6CC7: 'jiā',
-    0x6CC8: 'zhōng',
-    0x6CC9: 'quán',
-    0x6CCA: 'pō,bó,pò',
-    0x6CCB: 'huì,huǐ',
-    0x6CCC: 'mì,bì',
-    0x6CCD: 'bēn,bèn',
-    0x6CCE: 'zé',
-    0x6CCF: 'zhú,kū',
-    0x6CD0: 'lè',
-    0x6CD1: 'yōu,āo',
-    0x6CD2: 'gū',
-    0x6CD3: 'hóng',
-    0x6CD4: 'gān,hàn',
-    0x6CD5: 'fǎ',
-    0x6CD6: 'mǎo,liǔ',
-    0x6CD7: 'sì',
-    0x6CD8: 'hū',
-    0x6CD9: 'píng,pēng',
-    0x6CDA: 'cǐ,zǐ',
-    0x6CDB: 'fàn,fěng,fá',
-    0x6CDC: 'zhī,chí,zhì',
-    0x6CDD: 'sù',
-    0x6CDE: 'nìng,zhù',
-    0x6CDF: 'chēng',
-    0x6CE0: 'líng,lǐng',
-    0x6CE1: 'pào,pāo,páo',
-    0x6CE2: 'bō,bēi,bì',
-    0x6CE3: 'qì,lì,sè',
-    0x6CE4: 'sì',
-    0x6CE5: 'ní,nì,nǐ,niè,nìng',
-    0x6CE6: 'jú',
-    0x6CE7: 'sà,xuè',
-    0x6CE8: 'zhù,zhòu',
-    0x6CE9: 'shēng',
-    0x6CEA: 'lèi',
-    0x6CEB: 'xuàn,xuán,juān',
-    0x6CEC: 'jué,xuè',
-    0x6CED: 'fú',
-    0x6CEE: 'pàn',
-    0x6CEF: 'mǐn,miàn',
-    0x6CF0: 'tài',
-    0x6CF1: 'yāng',
-    0x6CF2: 'jǐ',
-    0x6CF3: 'yǒng',
-    0x6CF4: 'guàn',
-    0x6CF5: 'bèng,pìn,liú',
-    0x6CF6: 'xué',
-    0x6CF7: 'lóng,shuāng',
-    0x6CF8: 'lú',
-    0x6CF9: 'dàn',
-    0x6CFA: 'luò,pō',
-    0x6CFB: 'xiè',
-    0x6CFC: 'pō',
-    0x6CFD: 'zé',
-    0x6CFE: 'jīng',
-    0x6CFF: 'yín',
-    0x6D00: 'pán,zhōu',
-    0x6D01: 'jié,jí',
-    0x6D02: 'yè',
-    0x6D03: 'huī',
-    0x6D04: 'huí,huì',
-    0x6D05: 'zài',
-    0x6D06: 'chéng',
-    0x6D07: 'yīn,yān,yē',
-    0x6D08: 'wéi',
-    0x6D09: 'hòu',
-    0x6D0A: 'jiàn,cún',
-    0x6D0B: 'yáng,xiáng,yǎng',
-    0x6D0C: 'liè',
-    0x6D0D: 'sì',
-    0x6D0E: 'jì',
-    0x6D0F: 'ér',
-    0x6D10: 'xíng',
-    0x6D11: 'fú,fù',
-    0x6D12: 'sǎ,xǐ,xiǎn,sěn,cuǐ,xùn',
-    0x6D13: 'sè,qì,zì',
-    0x6D14: 'zhǐ',
-    0x6D15: 'yìn',
-    0x6D16: 'wú',
-    0x6D17: 'xǐ,xiǎn',
-    0x6D18: 'kǎo,kào',
-    0x6D19: 'zhū',
-    0x6D1A: 'jiàng,hóng',
-    0x6D1B: 'luò',
-    0x6D1C: 'luò',
-    0x6D1D: 'àn,yàn,è',
-    0x6D1E: 'dòng,tóng',
-    0x6D1F: 'tì',
-    0x6D20: 'móu',
-    0x6D21: 'lèi,lěi',
-    0x6D22: 'yī',
-    0x6D23: 'mǐ',
-    0x6D24: 'quán',
-    0x6D25: 'jīn',
-    0x6D26: 'pò',
-    0x6D27: 'wěi',
-    0x6D28: 'xiáo',
-    0x6D29: 'xiè,yì',
-    0x6D2A: 'hóng',
-    0x6D2B: 'xù,yì',
-    0x6D2C: 'sù,shuò',
-    0x6D2D: 'kuāng',
-    0x6D2E: 'táo,yáo,dào',
-    0x6D2F: 'qiè,jié',
-    0x6D30: 'jù',
-    0x6D31: 'ěr',
-    0x6D32: 'zhōu',
-    0x6D33: 'rù,rú',
-    0x6D34: 'píng,pēng',
-    0x6D35: 'xún,xuàn',
-    0x6D36: 'xiōng',
-    0x6D37: 'zhì',
-    0x6D38: 'guāng,huàng',
-    0x6D39: 'huán',
-    0x6D3A: 'míng',
-    0x6D3B: 'huó,guō',
-    0x6D3C: 'wā,guī',
-    0x6D3D: 'qià,hé',
-    0x6D3E: 'pài,mài,bài,pā',
-    0x6D3F: 'wū,hù',
-    0x6D40: 'qū',
-    0x6D41: 'liú',
-    0x6D42: 'yì',
-    0x6D43: 'jiā',
-    0x6D44: 'jìng',
-    0x6D45: 'qiǎn,jiān',
-    0x6D46: 'jiāng,jiàng',
-    0x6D47: 'jiāo',
-    0x6D48: 'zhēn',
-    0x6D49: 'shī',
-    0x6D4A: 'zhuó',
-    0x6D4B: 'cè',
-    0x6D4C: 'fá',
-    0x6D4D: 'huì,kuài',
-    0x6D4E: 'jì,jǐ',
-    0x6D4F: 'liú',
-    0x6D50: 'chǎn',
-    0x6D51: 'hún',
-    0x6D52: 'hǔ,xǔ',
-    0x6D53: 'nóng',
-    0x6D54: 'xún',
-    0x6D55: 'jìn',
-    0x6D56: 'liè',
-    0x6D57: 'qiú',
-    0x6D58: 'wěi',
-    0x6D59: 'zhè',
-    0x6D5A: 'jùn,xùn,cún',
-    0x6D5B: 'hán,hàn,gān',
-    0x6D5C: 'bāng,bīn',
-    0x6D5D: 'máng',
-    0x6D5E: 'zhuó',
-    0x6D5F: 'yóu,dí',
-    0x6D60: 'xī',
-    0x6D61: 'bó',
-    0x6D62: 'dòu',
-    0x6D63: 'huàn',
-    0x6D64: 'hóng',
-    0x6D65: 'yì,yà',
-    0x6D66: 'pǔ',
-    0x6D67: 'yǐng,chéng,yíng,zhèng,yìng',
-    0x6D68: 'lǎn',
-    0x6D69: 'hào,gǎo,gé',
-    0x6D6A: 'làng,láng',
-    0x6D6B: 'hǎn',
-    0x6D6C: 'lǐ,hǎi',
-    0x6D6D: 'gēng',
-    0x6D6E: 'fú',
-    0x6D6F: 'wú',
-    0x6D70: 'liàn,lì',
-    0x6D71: 'chún',
-    0x6D72: 'féng,hóng',
-    0x6D73: 'yì',
-    0x6D74: 'yù',
-    0x6D75: 'tóng',
-    0x6D76: 'láo',
-    0x6D77: 'hǎi',
-    0x6D78: 'jìn,qīn',
-    0x6D79: 'jiā,xiá',
-    0x6D7A: 'chōng',
-    0x6D7B: 'jiǒng,jiōng',
-    0x6D7C: 'měi',
-    0x6D7D: 'suī,něi',
-    0x6D7E: 'chēng',
-    0x6D7F: 'pèi',
-    0x6D80: 'xiàn,jiǎn',
-    0x6D81: 'shèn',
-    0x6D82: 'tú,chú,yé',
-    0x6D83: 'kùn',
-    0x6D84: 'pīng',
-    0x6D85: 'niè',
-    0x6D86: 'hàn',
-    0x6D87: 'jīng,qǐng',
-    0x6D88: 'xiāo',
-    0x6D89: 'shè,dié',
-    0x6D8A: 'niǎn,rěn',
-    0x6D8B: 'tū',
-    0x6D8C: 'yǒng,chōng',
-    0x6D8D: 'xiào',
-    0x6D8E: 'xián,yàn,diàn',
-    0x6D8F: 'tǐng',
-    0x6D90: 'é',
-    0x6D91: 'sù,sōu,shù',
-    0x6D92: 'tūn,yūn',
-    0x6D93: 'juān,yuàn,xuàn',
-    0x6D94: 'cén,qián,zàn',
-    0x6D95: 'tì',
-    0x6D96: 'lì',
-    0x6D97: 'shuì',
-    0x6D98: 'sì',
-    0x6D99: 'lèi',
-    0x6D9A: 'shuì',
-    0x6D9B: 'tāo',
-    0x6D9C: 'dú',
-    0x6D9D: 'lào',
-    0x6D9E: 'lái',
-    0x6D9F: 'lián',
-    0x6DA0: 'wéi',
-    0x6DA1: 'wō,guō',
-    0x6DA2: 'yún',
-    0x6DA3: 'huàn,huì',
-    0x6DA4: 'dí',
-    0x6DA5: 'hēng',
-    0x6DA6: 'rùn',
-    0x6DA7: 'jiàn',
-    0x6DA8: 'zhǎng,zhàng',
-    0x6DA9: 'sè',
-    0x6DAA: 'fú,póu',
-    0x6DAB: 'guàn',
-    0x6DAC: 'xìng',
-    0x6DAD: 'shòu,tāo',
-    0x6DAE: 'shuàn,shuā',
-    0x6DAF: 'yá',
-    0x6DB0: 'chuò',
-    0x6DB1: 'zhàng',
-    0x6DB2: 'yè,shì',
-    0x6DB3: 'kōng,náng',
-    0x6DB4: 'wò,yuān,wǎn',
-    0x6DB5: 'hán,hàn',
-    0x6DB6: 'tuō,tuò',
-    0x6DB7: 'dōng',
-    0x6DB8: 'hé',
-    0x6DB9: 'wō',
-    0x6DBA: 'jū',
-    0x6DBB: 'shè',
-    0x6DBC: 'liáng,liàng',
-    0x6DBD: 'hūn,hùn',
-    0x6DBE: 'tà',
-    0x6DBF: 'zhuō,zhuó',
-    0x6DC0: 'diàn',
-    0x6DC1: 'qiè,jí',
-    0x6DC2: 'dé',
-    0x6DC3: 'juàn',
-    0x6DC4: 'zī',
-    0x6DC5: 'xī',
-    0x6DC6: 'xiáo',
-    0x6DC7: 'qí',
-    0x6DC8: 'gǔ,hù',
-    0x6DC9: 'guǒ,guàn',
-    0x6DCA: 'yān,hàn,yǎn,hán',
-    0x6DCB: 'lín,lìn',
-    0x6DCC: 'tǎng,chàng,chǎng',
-    0x6DCD: 'zhōu,diāo',
-    0x6DCE: 'pěng',
-    0x6DCF: 'hào',
-    0x6DD0: 'chāng',
-    0x6DD1: 'shū,chù',
-    0x6DD2: 'qī,qiàn',
-    0x6DD3: 'fāng',
-    0x6DD4: 'zhí',
-    0x6DD5: 'lù',
-    0x6DD6: 'nào,zhào,zhuō,chuò',
-    0x6DD7: 'jú',
-    0x6DD8: 'táo',
-    0x6DD9: 'cóng,shuàng',
-    0x6DDA: 'lèi,lì',
-    0x6DDB: 'zhè',
-    0x6DDC: 'píng,péng',
-    0x6DDD: 'féi',
-    0x6DDE: 'sōng',
-    0x6DDF: 'tiǎn',
-    0x6DE0: 'pì,pèi',
-    0x6DE1: 'dàn,yàn,tán',
-    0x6DE2: 'yù,xù',
-    0x6DE3: 'ní',
-    0x6DE4: 'yū',
-    0x6DE5: 'lù',
-    0x6DE6: 'gàn,hán',
-    0x6DE7: 'mì',
-    0x6DE8: 'jìng,chéng',
-    0x6DE9: 'líng',
-    0x6DEA: 'lún,lǔn,guān',
-    0x6DEB: 'yín,yàn,yáo',
-    0x6DEC: 'cuì,zú',
-    0x6DED: 'qú',
-    0x6DEE: 'huái',
-    0x6DEF: 'yù',
-    0x6DF0: 'niǎn,shěn,nà',
-    0x6DF1: 'shēn',
-    0x6DF2: 'biāo,hū,hǔ',
-    0x6DF3: 'chún,zhūn,zhǔn',
-    0x6DF4: 'hū',
-    0x6DF5: 'yuān',
-    0x6DF6: 'lái',
-    0x6DF7: 'hùn,gǔn,hún,kūn',
-    0x6DF8: 'qīng',
-    0x6DF9: 'yān,yǎn',
-    0x6DFA: 'qiǎn,jiān,jiàn,cán,zàn',
-    0x6DFB: 'tiān,tiàn',
-    0x6DFC: 'miǎo',
-    0x6DFD: 'zhǐ',
-    0x6DFE: 'yǐn',
-    0x6DFF: 'bó',
-    0x6E00: 'bèn,bēn',
-    0x6E01: 'yuān',
-    0x6E02: 'wèn,mín',
-    0x6E03: 'ruò,rè',
-    0x6E04: 'fēi',
-    0x6E05: 'qīng,qìng',
-    0x6E06: 'yuān',
-    0x6E07: 'kě',
-    0x6E08: 'jì',
-    0x6E09: 'shè',
-    0x6E0A: 'yuān',
-    0x6E0B: 'sè',
-    0x6E0C: 'lù',
-    0x6E0D: 'zì',
-    0x6E0E: 'dú',
-    0x6E0F: 'yī',
-    0x6E10: 'jiàn,jiān',
-    0x6E11: 'miǎn,shéng',
-    0x6E12: 'pài',
-    0x6E13: 'xī',
-    0x6E14: 'yú',
-    0x6E15: 'yuān',
-    0x6E16: 'shěn',
-    0x6E17: 'shèn',
-    0x6E18: 'róu',
-    0x6E19: 'huàn',
-    0x6E1A: 'zhǔ',
-    0x6E1B: 'jiǎn',
-    0x6E1C: 'nuǎn,nuán',
-    0x6E1D: 'yú,yū',
-    0x6E1E: 'qiú,wù',
-    0x6E1F: 'tíng,tīng',
-    0x6E20: 'qú,jù',
-    0x6E21: 'dù',
-    0x6E22: 'fán,féng',
-    0x6E23: 'zhā',
-    0x6E24: 'bó',
-    0x6E25: 'wò,òu,wū',
-    0x6E26: 'wō,guō',
-    0x6E27: 'dì,tí,dī',
-    0x6E28: 'wēi',
-    0x6E29: 'wēn,yùn',
-    0x6E2A: 'rú',
-    0x6E2B: 'xiè,dié,zhá,yì,qiè',
-    0x6E2C: 'cè',
-    0x6E2D: 'wèi',
-    0x6E2E: 'hé',
-    0x6E2F: 'gǎng,hòng',
-    0x6E30: 'yǎn',
-    0x6E31: 'hóng,gòng',
-    0x6E32: 'xuàn',
-    0x6E33: 'mǐ',
-    0x6E34: 'kě,jié,kài,hé',
-    0x6E35: 'máo',
-    0x6E36: 'yīng',
-    0x6E37: 'yǎn',
-    0x6E38: 'yóu,liú',
-    0x6E39: 'hōng,qìng',
-    0x6E3A: 'miǎo',
-    0x6E3B: 'shěng',
-    0x6E3C: 'měi',
-    0x6E3D: 'zāi',
-    0x6E3E: 'hún,hùn,gǔn',
-    0x6E3F: 'nài',
-    0x6E40: 'guǐ',
-    0x6E41: 'chì',
-    0x6E42: 'è',
-    0x6E43: 'pài,bá',
-    0x6E44: 'méi',
-    0x6E45: 'liàn,làn',
-    0x6E46: 'qì',
-    0x6E47: 'qì',
-    0x6E48: 'méi',
-    0x6E49: 'tián',
-    0x6E4A: 'còu',
-    0x6E4B: 'wéi',
-    0x6E4C: 'cān',
-    0x6E4D: 'tuān,zhuān',
-    0x6E4E: 'miǎn',
-    0x6E4F: 'huì,mǐn',
-    0x6E50: 'mò',
-    0x6E51: 'xū,xù,xǔ',
-    0x6E52: 'jí',
-    0x6E53: 'pén,pèn',
-    0x6E54: 'jiān,zàn,zhǎn,qián,jiàn',
-    0x6E55: 'jiǎn',
-    0x6E56: 'hú',
-    0x6E57: 'fèng',
-    0x6E58: 'xiāng',
-    0x6E59: 'yì',
-    0x6E5A: 'yìn',
-    0x6E5B: 'zhàn,chén,dān,tán,jìn,yǐn,chěn,yín,shèn',
-    0x6E5C: 'shí',
-    0x6E5D: 'jiē,xié',
-    0x6E5E: 'zhēn,chēng',
-    0x6E5F: 'huáng,kuàng',
-    0x6E60: 'tàn',
-    0x6E61: 'yú',
-    0x6E62: 'bì',
-    0x6E63: 'mǐn,hūn,miàn',
-    0x6E64: 'shī',
-    0x6E65: 'tū',
-    0x6E66: 'shēng',
-    0x6E67: 'yǒng',
-    0x6E68: 'jú',
-    0x6E69: 'dòng,dǒng,tóng',
-    0x6E6A: 'tuàn,nuǎn',
-    0x6E6B: 'jiǎo,qiū,jiù,jiū,jiāo',
-    0x6E6C: 'jiǎo',
-    0x6E6D: 'qiú',
-    0x6E6E: 'yān,yīn',
-    0x6E6F: 'tāng,tàng,shāng,yáng',
-    0x6E70: 'lóng',
-    0x6E71: 'huò',
-    0x6E72: 'yuán',
-    0x6E73: 'nǎn',
-    0x6E74: 'bàn,pán',
-    0x6E75: 'yǒu',
-    0x6E76: 'quán',
-    0x6E77: 'zhuāng,hún',
-    0x6E78: 'liàng',
-    0x6E79: 'chán',
-    0x6E7A: 'xián',
-    0x6E7B: 'chún',
-    0x6E7C: 'niè',
-    0x6E7D: 'zī',
-    0x6E7E: 'wān',
-    0x6E7F: 'shī',
-    0x6E80: 'mǎn',
-    0x6E81: 'yíng',
-    0x6E82: 'là',
-    0x6E83: 'kuì,huì',
-    0x6E84: 'féng',
-    0x6E85: 'jiàn,jiān',
-    0x6E86: 'xù',
-    0x6E87: 'lóu',
-    0x6E88: 'wéi',
-    0x6E89: 'gài,xiè',
-    0x6E8A: 'bō',
-    0x6E8B: 'yíng',
-    0x6E8C: 'pō',
-    0x6E8D: 'jìn',
-    0x6E8E: 'yàn,guì',
-    0x6E8F: 'táng',
-    0x6E90: 'yuán',
-    0x6E91: 'suǒ',
-    0x6E92: 'yuán',
-    0x6E93: 'lián,liǎn,xián,xiàn,nián,lín',
-    0x6E94: 'yǎo',
-    0x6E95: 'méng',
-    0x6E96: 'zhǔn,zhuó',
-    0x6E97: 'chéng',
-    0x6E98: 'kè,kài',
-    0x6E99: 'tài',
-    0x6E9A: 'tǎ,dá',
-    0x6E9B: 'wā',
-    0x6E9C: 'liū,liù,liú',
-    0x6E9D: 'gōu,gǎng,kòu',
-    0x6E9E: 'sāo',
-    0x6E9F: 'míng,mǐng,mì',
-    0x6EA0: 'zhà,zhā',
-    0x6EA1: 'shí',
-    0x6EA2: 'yì',
-    0x6EA3: 'lùn',
-    0x6EA4: 'mǎ',
-    0x6EA5: 'pǔ,fū,bù,bó,pò',
-    0x6EA6: 'wēi,méi',
-    0x6EA7: 'lì',
-    0x6EA8: 'zāi',
-    0x6EA9: 'wù',
-    0x6EAA: 'xī,qī',
-    0x6EAB: 'wēn',
-    0x6EAC: 'qiāng',
-    0x6EAD: 'zé',
-    0x6EAE: 'shī',
-    0x6EAF: 'sù,shuò',
-    0x6EB0: 'ái',
-    0x6EB1: 'qín,zhēn',
-    0x6EB2: 'sōu,sǒu,shāo',
-    0x6EB3: 'yún,yǔn',
-    0x6EB4: 'xiù,chòu',
-    0x6EB5: 'yīn',
-    0x6EB6: 'róng',
-    0x6EB7: 'hùn,hún',
-    0x6EB8: 'sù',
-    0x6EB9: 'suò,suǒ,sè',
-    0x6EBA: 'nì,ruò,niào',
-    0x6EBB: 'tā',
-    0x6EBC: 'shī',
-    0x6EBD: 'rù,rú',
-    0x6EBE: 'āi',
-    0x6EBF: 'pàn',
-    0x6EC0: 'chù,xù',
-    0x6EC1: 'chú',
-    0x6EC2: 'pāng,pēng',
-    0x6EC3: 'wēng,wěng',
-    0x6EC4: 'cāng',
-    0x6EC5: 'miè',
-    0x6EC6: 'gé',
-    0x6EC7: 'diān,tián,zhēn',
-    0x6EC8: 'hào,xuè',
-    0x6EC9: 'huàng',
-    0x6ECA: 'xì,xiē,qì',
-    0x6ECB: 'zī,cí,xuán',
-    0x6ECC: 'dí',
-    0x6ECD: 'zhì',
-    0x6ECE: 'xíng,yīng,yíng',
-    0x6ECF: 'fǔ',
-    0x6ED0: 'jié',
-    0x6ED1: 'huá,gǔ',
-    0x6ED2: 'gē',
-    0x6ED3: 'zǐ',
-    0x6ED4: 'tāo',
-    0x6ED5: 'téng',
-    0x6ED6: 'suī',
-    0x6ED7: 'bì',
-    0x6ED8: 'jiào',
-    0x6ED9: 'huì',
-    0x6EDA: 'gǔn',
-    0x6EDB: 'yín',
-    0x6EDC: 'gāo',
-    0x6EDD: 'lóng',
-    0x6EDE: 'zhì',
-    0x6EDF: 'yàn',
-    0x6EE0: 'shè',
-    0x6EE1: 'mǎn',
-    0x6EE2: 'yíng',
-    0x6EE3: 'chún',
-    0x6EE4: 'lǜ',
-    0x6EE5: 'làn',
-    0x6EE6: 'luán',
-    0x6EE7: 'yáo,xiào',
-    0x6EE8: 'bīn',
-    0x6EE9: 'tān',
-    0x6EEA: 'yù',
-    0x6EEB: 'xiǔ',
-    0x6EEC: 'hù',
-    0x6EED: 'bì',
-    0x6EEE: 'biāo',
-    0x6EEF: 'zhì,chì',
-    0x6EF0: 'jiàng',
-    0x6EF1: 'kòu',
-    0x6EF2: 'shèn,sēn,qīn,lín',
-    0x6EF3: 'shāng',
-    0x6EF4: 'dī',
-    0x6EF5: 'mì',
-    0x6EF6: 'áo',
-    0x6EF7: 'lǔ',
-    0x6EF8: 'hǔ,xǔ',
-    0x6EF9: 'hū,hǔ',
-    0x6EFA: 'yōu',
-    0x6EFB: 'chǎn',
-    0x6EFC: 'fàn',
-    0x6EFD: 'yōng',
-    0x6EFE: 'gǔn',
-    0x6EFF: 'mǎn,mèn',
-    0x6F00: 'qǐng,qīng',
-    0x6F01: 'yú',
-    0x6F02: 'piāo,piào,piǎo,biāo',
-    0x6F03: 'jì',
-    0x6F04: 'yá',
-    0x6F05: 'cháo',
-    0x6F06: 'qī,qiè',
-    0x6F07: 'xǐ',
-    0x6F08: 'jì',
-    0x6F09: 'lù',
-    0x6F0A: 'lóu,lǚ,lǒu',
-    0x6F0B: 'lóng',
-    0x6F0C: 'jǐn',
-    0x6F0D: 'guó',
-    0x6F0E: 'cóng,sǒng',
-    0x6F0F: 'lòu,lóu',
-    0x6F10: 'zhí',
-    0x6F11: 'gài',
-    0x6F12: 'qiáng',
-    0x6F13: 'lí',
-    0x6F14: 'yǎn,yàn',
-    0x6F15: 'cáo,cào',
-    0x6F16: 'jiào',
-    0x6F17: 'cōng',
-    0x6F18: 'chún',
-    0x6F19: 'tuán,zhuān',
-    0x6F1A: 'ōu,òu',
-    0x6F1B: 'téng',
-    0x6F1C: 'yě',
-    0x6F1D: 'xí',
-    0x6F1E: 'mì',
-    0x6F1F: 'táng',
-    0x6F20: 'mò',
-    0x6F21: 'shāng,tàng',
-    0x6F22: 'hàn,tān',
-    0x6F23: 'lián,lán',
-    0x6F24: 'lǎn',
-    0x6F25: 'wā',
-    0x6F26: 'chí,tāi',
-    0x6F27: 'gān',
-    0x6F28: 'féng,péng,běng',
-    0x6F29: 'xuán',
-    0x6F2A: 'yī',
-    0x6F2B: 'màn',
-    0x6F2C: 'zì,sè,qì',
-    0x6F2D: 'mǎng',
-    0x6F2E: 'kāng',
-    0x6F2F: 'luò,tà,lěi',
-    0x6F30: 'pēng',
-    0x6F31: 'shù',
-    0x6F32: 'zhǎng,zhàng,zhāng',
-    0x6F33: 'zhāng',
-    0x6F34: 'zhuàng,chóng,shuāng,chuáng',
-    0x6F35: 'xù',
-    0x6F36: 'huàn',
-    0x6F37: 'huǒ,kuò,huò',
-    0x6F38: 'jiàn,jiān,qián,chán',
-    0x6F39: 'yān',
-    0x6F3A: 'shuǎng,chuǎng',
-    0x6F3B: 'liáo,xiào,liú',
-    0x6F3C: 'cuǐ,cuī',
-    0x6F3D: 'tí',
-    0x6F3E: 'yàng',
-    0x6F3F: 'jiāng,jiàng',
-    0x6F40: 'cóng',
-    0x6F41: 'yǐng',
-    0x6F42: 'hóng',
-    0x6F43: 'xiǔ',
-    0x6F44: 'shù',
-    0x6F45: 'guàn',
-    0x6F46: 'yíng',
-    0x6F47: 'xiāo',
-    0x6F48: 'zong',
-    0x6F49: 'kūn',
-    0x6F4A: 'xù',
-    0x6F4B: 'liàn',
-    0x6F4C: 'zhì',
-    0x6F4D: 'wéi',
-    0x6F4E: 'pì,piē,piào',
-    0x6F4F: 'yù,jué,shù',
-    0x6F50: 'jiào,jiǎo,qiáo',
-    0x6F51: 'pō,bō',
-    0x6F52: 'dàng,xiàng,yǎng',
-    0x6F53: 'huì',
-    0x6F54: 'jié',
-    0x6F55: 'wǔ',
-    0x6F56: 'pá',
-    0x6F57: 'jí',
-    0x6F58: 'pān,pàn,bō,pán,fān',
-    0x6F59: 'wéi,guī',
-    0x6F5A: 'sù,xiāo,sōu',
-    0x6F5B: 'qián',
-    0x6F5C: 'qián',
-    0x6F5D: 'xī,yà',
-    0x6F5E: 'lù',
-    0x6F5F: 'xì',
-    0x6F60: 'xùn,sùn',
-    0x6F61: 'dùn',
-    0x6F62: 'huáng,huàng,guāng',
-    0x6F63: 'mǐn',
-    0x6F64: 'rùn',
-    0x6F65: 'sù',
-    0x6F66: 'lǎo,liáo,lào,láo,liǎo',
-    0x6F67: 'zhēn',
-    0x6F68: 'cóng,zōng',
-    0x6F69: 'yì',
-    0x6F6A: 'zhè,zhì',
-    0x6F6B: 'wān',
-    0x6F6C: 'shàn,tān',
-    0x6F6D: 'tán,xún,yǐn,dàn',
-    0x6F6E: 'cháo',
-    0x6F6F: 'xún,yín',
-    0x6F70: 'kuì,xiè',
-    0x6F71: 'yē',
-    0x6F72: 'shào',
-    0x6F73: 'tú,zhā',
-    0x6F74: 'zhū',
-    0x6F75: 'sǎ,sàn',
-    0x6F76: 'hēi',
-    0x6F77: 'bì',
-    0x6F78: 'shān',
-    0x6F79: 'chán',
-    0x6F7A: 'chán',
-    0x6F7B: 'shǔ',
-    0x6F7C: 'tóng,chōng,zhōng',
-    0x6F7D: 'pū,pǔ',
-    0x6F7E: 'lín',
-    0x6F7F: 'wéi',
-    0x6F80: 'sè',
-    0x6F81: 'sè',
-    0x6F82: 'chéng',
-    0x6F83: 'jiǒng',
-    0x6F84: 'chéng,dèng',
-    0x6F85: 'huà',
-    0x6F86: 'jiāo,ào,nào',
-    0x6F87: 'lào,láo',
-    0x6F88: 'chè',
-    0x6F89: 'gǎn,hàn',
-    0x6F8A: 'cūn,cún',
-    0x6F8B: 'hòng',
-    0x6F8C: 'sī',
-    0x6F8D: 'shù,zhù',
-    0x6F8E: 'pēng,péng',
-    0x6F8F: 'hán',
-    0x6F90: 'yún',
-    0x6F91: 'liù',
-    0x6F92: 'hòng',
-    0x6F93: 'fú',
-    0x6F94: 'hào',
-    0x6F95: 'hé',
-    0x6F96: 'xián',
-    0x6F97: 'jiàn',
-    0x6F98: 'shān',
-    0x6F99: 'xì',
-    0x6F9A: 'yu',
-    0x6F9B: 'lǔ',
-    0x6F9C: 'lán',
-    0x6F9D: 'nìng',
-    0x6F9E: 'yú',
-    0x6F9F: 'lǐn',
-    0x6FA0: 'miǎn,shéng',
-    0x6FA1: 'zǎo,cāo',
-    0x6FA2: 'dāng',
-    0x6FA3: 'huàn,hàn',
-    0x6FA4: 'zé,shì,yì,duó',
-    0x6FA5: 'xiè',
-    0x6FA6: 'yù',
-    0x6FA7: 'lǐ',
-    0x6FA8: 'shì,cuó',
-    0x6FA9: 'xué,xiào',
-    0x6FAA: 'líng',
-    0x6FAB: 'wàn,màn,ǒu',
-    0x6FAC: 'zī,cí',
-    0x6FAD: 'yōng,yǒng',
-    0x6FAE: 'huì,kuài,huá',
-    0x6FAF: 'càn',
-    0x6FB0: 'liàn',
-    0x6FB1: 'diàn',
-    0x6FB2: 'yè',
-    0x6FB3: 'ào,yù',
-    0x6FB4: 'huán,xuàn',
-    0x6FB5: 'zhēn',
-    0x6FB6: 'chán,dàn,zhān',
-    0x6FB7: 'màn',
-    0x6FB8: 'dǎn',
-    0x6FB9: 'dàn,tán,dān,shàn',
-    0x6FBA: 'yì',
-    0x6FBB: 'suì',
-    0x6FBC: 'pì',
-    0x6FBD: 'jù',
-    0x6FBE: 'tà',
-    0x6FBF: 'qín',
-    0x6FC0: 'jī,jiào,jiāo',
-    0x6FC1: 'zhuó',
-    0x6FC2: 'lián,xiǎn',
-    0x6FC3: 'nóng',
-    0x6FC4: 'guō,wō',
-    0x6FC5: 'jìn',
-    0x6FC6: 'fén,pēn',
-    0x6FC7: 'sè',
-    0x6FC8: 'jí,shà',
-    0x6FC9: 'suī',
-    0x6FCA: 'huì,wèi,huò',
-    0x6FCB: 'chǔ',
-    0x6FCC: 'tà',
-    0x6FCD: 'sōng',
-    0x6FCE: 'dǐng,tìng',
-    0x6FCF: 'sè',
-    0x6FD0: 'zhǔ',
-    0x6FD1: 'lài',
-    0x6FD2: 'bīn',
-    0x6FD3: 'lián',
-    0x6FD4: 'mǐ,mí,nǐ',
-    0x6FD5: 'shī,tà,xí',
-    0x6FD6: 'shù',
-    0x6FD7: 'mì',
-    0x6FD8: 'nìng,níng,nì',
-    0x6FD9: 'yíng',
-    0x6FDA: 'yíng',
-    0x6FDB: 'méng',
-    0x6FDC: 'jìn,jīn',
-    0x6FDD: 'qí',
-    0x6FDE: 'bì,pì',
-    0x6FDF: 'jì,jǐ,qí',
-    0x6FE0: 'háo',
-    0x6FE1: 'rú,ruǎn,ér,nuán,nuò',
-    0x6FE2: 'cuì,zuǐ',
-    0x6FE3: 'wò',
-    0x6FE4: 'tāo,cháo,shòu,dào',
-    0x6FE5: 'yǐn',
-    0x6FE6: 'yǐn',
-    0x6FE7: 'duì',
-    0x6FE8: 'cí',
-    0x6FE9: 'huò,hù',
-    0x6FEA: 'qìng',
-    0x6FEB: 'làn,jiàn,lǎn,lán',
-    0x6FEC: 'jùn,xùn',
-    0x6FED: 'ǎi,kài,kè',
-    0x6FEE: 'pú',
-    0x6FEF: 'zhuó,shuò,zhào',
-    0x6FF0: 'wéi',
-    0x6FF1: 'bīn',
-    0x6FF2: 'gǔ',
-    0x6FF3: 'qián',
-    0x6FF4: 'yíng',
-    0x6FF5: 'bīn',
-    0x6FF6: 'kuò',
-    0x6FF7: 'fèi',
-    0x6FF8: 'cāng',
-    0x6FF9: 'me',
-    0x6FFA: 'jiàn,jiān,zàn',
-    0x6FFB: 'wěi',
-    0x6FFC: 'luò,pō,lì',
-    0x6FFD: 'zàn',
-    0x6FFE: 'lǜ',
-    0x6FFF: 'lì',
-    0x7000: 'yōu',
-    0x7001: 'yàng,yǎng',
-    0x7002: 'lǔ',
-    0x7003: 'sì',
-    0x7004: 'zhì',
-    0x7005: 'yíng,yìng,jiōng',
-    0x7006: 'dú,dòu',
-    0x7007: 'wǎng,wāng',
-    0x7008: 'huī',
-    0x7009: 'xiè',
-    0x700A: 'pán',
-    0x700B: 'shěn,chèn,pán',
-    0x700C: 'biāo',
-    0x700D: 'chán',
-    0x700E: 'mò,miè',
-    0x700F: 'liú,liū',
-    0x7010: 'jiān',
-    0x7011: 'pù,bào,bó',
-    0x7012: 'sè',
-    0x7013: 'chéng',
-    0x7014: 'gǔ',
-    0x7015: 'bīn',
-    0x7016: 'huò',
-    0x7017: 'xiàn',
-    0x7018: 'lú',
-    0x7019: 'qìn',
-    0x701A: 'hàn',
-    0x701B: 'yíng',
-    0x701C: 'róng',
-    0x701D: 'lì',
-    0x701E: 'jìng',
-    0x701F: 'xiāo',
-    0x7020: 'yíng',
-    0x7021: 'suǐ',
-    0x7022: 'wěi,duì',
-    0x7023: 'xiè',
-    0x7024: 'huái,wāi',
-    0x7025: 'xuè',
-    0x7026: 'zhū',
-    0x7027: 'lóng,shuāng',
-    0x7028: 'lài',
-    0x7029: 'duì',
-    0x702A: 'fán',
-    0x702B: 'hú',
-    0x702C: 'lài',
-    0x702D: 'shū',
-    0x702E: 'ling',
-    0x702F: 'yíng',
-    0x7030: 'mí,mǐ,nǐ',
-    0x7031: 'jì',
-    0x7032: 'liàn',
-    0x7033: 'jiàn,zùn',
-    0x7034: 'yíng,yǐng,yìng',
-    0x7035: 'fèn',
-    0x7036: 'lín',
-    0x7037: 'yì',
-    0x7038: 'jiān',
-    0x7039: 'yuè,yào',
-    0x703A: 'chán',
-    0x703B: 'dài',
-    0x703C: 'ráng,ràng,nǎng',
-    0x703D: 'jiǎn',
-    0x703E: 'lán',
-    0x703F: 'fán',
-    0x7040: 'shuàng',
-    0x7041: 'yuān',
-    0x7042: 'zhuó,zé,jiào',
-    0x7043: 'fēng',
-    0x7044: 'shè,nì',
-    0x7045: 'lěi',
-    0x7046: 'lán',
-    0x7047: 'cóng',
-    0x7048: 'qú',
-    0x7049: 'yōng',
-    0x704A: 'qián',
-    0x704B: 'fǎ',
-    0x704C: 'guàn,huàn',
-    0x704D: 'jué',
-    0x704E: 'yàn',
-    0x704F: 'hào',
-    0x7050: 'yíng',
-    0x7051: 'sǎ,xiǎn,xǐ,lí,shī',
-    0x7052: 'zàn,cuán,qián,zā',
-    0x7053: 'luán,luàn',
-    0x7054: 'yàn',
-    0x7055: 'lí',
-    0x7056: 'mǐ',
-    0x7057: 'shàn',
-    0x7058: 'tān,hàn,nàn',
-    0x7059: 'dǎng',
-    0x705A: 'jiǎo',
-    0x705B: 'chǎn',
-    0x705C: 'yíng',
-    0x705D: 'hào',
-    0x705E: 'bà',
-    0x705F: 'zhú',
-    0x7060: 'lǎn,làn',
-    0x7061: 'lán',
-    0x7062: 'nǎng',
-    0x7063: 'wān',
-    0x7064: 'luán',
-    0x7065: 'xún,quán,quàn',
-    0x7066: 'xiǎn',
-    0x7067: 'yàn',
-    0x7068: 'gàn',
-    0x7069: 'yàn',
-    0x706A: 'yù',
-    0x706B: 'huǒ,huō',
-    0x706C: 'biāo,huǒ',
-    0x706D: 'miè',
-    0x706E: 'guāng',
-    0x706F: 'dēng,dīng',
-    0x7070: 'huī',
-    0x7071: 'xiāo',
-    0x7072: 'xiāo',
-    0x7073: 'huī',
-    0x7074: 'hōng',
-    0x7075: 'líng',
-    0x7076: 'zào',
-    0x7077: 'zhuàn',
-    0x7078: 'jiǔ',
-    0x7079: 'zhà,yù',
-    0x707A: 'xiè',
-    0x707B: 'chì',
-    0x707C: 'zhuó',
-    0x707D: 'zāi',
-    0x707E: 'zāi',
-    0x707F: 'càn',
-    0x7080: 'yáng',
-    0x7081: 'qì',
-    0x7082: 'zhōng',
-    0x7083: 'fén,bèn',
-    0x7084: 'niǔ',
-    0x7085: 'jiǒng,guì',
-    0x7086: 'wén',
-    0x7087: 'pū',
-    0x7088: 'yì',
-    0x7089: 'lú',
-    0x708A: 'chuī',
-    0x708B: 'pī',
-    0x708C: 'kài',
-    0x708D: 'pàn',
-    0x708E: 'yán,yàn,tán',
-    0x708F: 'kài,yán',
-    0x7090: 'pàng,fēng',
-    0x7091: 'mù',
-    0x7092: 'chǎo',
-    0x7093: 'liào',
-    0x7094: 'guì,quē,xuè',
-    0x7095: 'kàng,hāng',
-    0x7096: 'dùn,tún',
-    0x7097: 'guāng',
-    0x7098: 'xīn',
-    0x7099: 'zhì',
-    0x709A: 'guāng',
-    0x709B: 'guāng',
-    0x709C: 'wěi',
-    0x709D: 'qiàng',
-    0x709E: 'bian',
-    0x709F: 'dá',
-    0x70A0: 'xiá',
-    0x70A1: 'zhēng',
-    0x70A2: 'zhú',
-    0x70A3: 'kě',
-    0x70A4: 'zhào,zhāo,zhǎo',
-    0x70A5: 'fú',
-    0x70A6: 'bá',
-    0x70A7: 'xiè',
-    0x70A8: 'xiè',
-    0x70A9: 'lìng',
-    0x70AA: 'zhuō,chù',
-    0x70AB: 'xuàn',
-    0x70AC: 'jù',
-    0x70AD: 'tàn',
-    0x70AE: 'pào,bāo,páo',
-    0x70AF: 'jiǒng',
-    0x70B0: 'páo,fǒu',
-    0x70B1: 'tái',
-    0x70B2: 'tái',
-    0x70B3: 'bǐng',
-    0x70B4: 'yǎng',
-    0x70B5: 'tōng',
-    0x70B6: 'shǎn',
-    0x70B7: 'zhù',
-    0x70B8: 'zhà,zhá',
-    0x70B9: 'diǎn',
-    0x70BA: 'wèi,wéi',
-    0x70BB: 'shí',
-    0x70BC: 'liàn',
-    0x70BD: 'chì',
-    0x70BE: 'huǎng',
-    0x70BF: 'zhōu',
-    0x70C0: 'hū',
-    0x70C1: 'shuò',
-    0x70C2: 'làn',
-    0x70C3: 'tīng',
-    0x70C4: 'jiǎo,yào',
-    0x70C5: 'xù',
-    0x70C6: 'héng',
-    0x70C7: 'quǎn',
-    0x70C8: 'liè',
-    0x70C9: 'huàn',
-    0x70CA: 'yáng,yàng',
-    0x70CB: 'xiū,xiāo',
-    0x70CC: 'xiū',
-    0x70CD: 'xiǎn',
-    0x70CE: 'yín',
-    0x70CF: 'wū,yā,wù',
-    0x70D0: 'zhōu',
-    0x70D1: 'yáo',
-    0x70D2: 'shì',
-    0x70D3: 'wēi',
-    0x70D4: 'tóng,dòng',
-    0x70D5: 'miè',
-    0x70D6: 'zāi',
-    0x70D7: 'kài',
-    0x70D8: 'hōng',
-    0x70D9: 'lào,luò',
-    0x70DA: 'xiá',
-    0x70DB: 'zhú,chóng',
-    0x70DC: 'xuǎn,xuān,huǐ',
-    0x70DD: 'zhēng',
-    0x70DE: 'pò',
-    0x70DF: 'yān,yīn',
-    0x70E0: 'huí,huǐ,ǎi',
-    0x70E1: 'guāng',
-    0x70E2: 'chè',
-    0x70E3: 'huī',
-    0x70E4: 'kǎo',
-    0x70E5: 'jù',
-    0x70E6: 'fán',
-    0x70E7: 'shāo',
-    0x70E8: 'yè',
-    0x70E9: 'huì',
-    0x70EB: 'tàng',
-    0x70EC: 'jìn',
-    0x70ED: 'rè',
-    0x70EE: 'liè',
-    0x70EF: 'xī',
-    0x70F0: 'fú,fū',
-    0x70F1: 'jiǒng',
-    0x70F2: 'xiè,chè',
-    0x70F3: 'pǔ',
-    0x70F4: 'tīng,jǐng',
-    0x70F5: 'zhuó',
-    0x70F6: 'tǐng',
-    0x70F7: 'wán',
-    0x70F8: 'hǎi',
-    0x70F9: 'pēng',
-    0x70FA: 'lǎng',
-    0x70FB: 'yàn,shān',
-    0x70FC: 'xù',
-    0x70FD: 'fēng',
-    0x70FE: 'chì',
-    0x70FF: 'róng',
-    0x7100: 'hú',
-    0x7101: 'xī',
-    0x7102: 'shū',
-    0x7103: 'hè,huò',
-    0x7104: 'xūn,hūn',
-    0x7105: 'kù,kào',
-    0x7106: 'juān,yè,yuè,yuān',
-    0x7107: 'xiāo',
-    0x7108: 'xī',
-    0x7109: 'yān,yí',
-    0x710A: 'hàn',
-    0x710B: 'zhuàng',
-    0x710C: 'jùn,qū',
-    0x710D: 'dì',
-    0x710E: 'xiè',
-    0x710F: 'jí,qì',
-    0x7110: 'wù',
-    0x7111: 'yān',
-    0x7112: 'lǚ',
-    0x7113: 'hán',
-    0x7114: 'yàn',
-    0x7115: 'huàn',
-    0x7116: 'mèn',
-    0x7117: 'jú',
-    0x7118: 'dào,tāo',
-    0x7119: 'bèi',
-    0x711A: 'fén,fèn',
-    0x711B: 'lìn',
-    0x711C: 'kūn',
-    0x711D: 'hùn',
-    0x711E: 'tūn,tuī,jùn',
-    0x711F: 'xī',
-    0x7120: 'cuì',
-    0x7121: 'wú,mó',
-    0x7122: 'hōng',
-    0x7123: 'chǎo,jù',
-    0x7124: 'fǔ',
-    0x7125: 'wò,ài',
-    0x7126: 'jiāo,qiáo',
-    0x7127: 'cōng',
-    0x7128: 'fèng',
-    0x7129: 'píng',
-    0x712A: 'qióng',
-    0x712B: 'ruò,rè',
-    0x712C: 'xī,yì',
-    0x712D: 'qióng',
-    0x712E: 'xìn',
-    0x712F: 'chāo,zhuō,zhuó,chuò',
-    0x7130: 'yàn',
-    0x7131: 'yàn,yì',
-    0x7132: 'yì',
-    0x7133: 'jué',
-    0x7134: 'yù',
-    0x7135: 'gàng',
-    0x7136: 'rán',
-    0x7137: 'pí',
-    0x7138: 'xiòng,yīng,gǔ',
-    0x7139: 'gàng',
-    0x713A: 'shēng',
-    0x713B: 'chàng,guā',
-    0x713C: 'shāo',
-    0x713D: 'xiǒng',
-    0x713E: 'niǎn',
-    0x713F: 'gēng',
-    0x7140: 'wei',
-    0x7141: 'chén',
-    0x7142: 'hè',
-    0x7143: 'kuǐ',
-    0x7144: 'zhǒng',
-    0x7145: 'duàn',
-    0x7146: 'xiā,xià',
-    0x7147: 'huī,hún,yùn,xūn,xuàn',
-    0x7148: 'fèng',
-    0x7149: 'liàn,làn',
-    0x714A: 'xuān',
-    0x714B: 'xīng',
-    0x714C: 'huáng',
-    0x714D: 'jiǎo',
-    0x714E: 'jiān,jiàn,jiǎn',
-    0x714F: 'bì',
-    0x7150: 'yīng',
-    0x7151: 'zhǔ',
-    0x7152: 'wěi,huī',
-    0x7153: 'tuān',
-    0x7154: 'shǎn,qián,shān',
-    0x7155: 'xī',
-    0x7156: 'nuǎn,xuān',
-    0x7157: 'nuǎn',
-    0x7158: 'chán',
-    0x7159: 'yān',
-    0x715A: 'jiǒng',
-    0x715B: 'jiǒng',
-    0x715C: 'yù',
-    0x715D: 'mèi',
-    0x715E: 'shā,shà',
-    0x715F: 'wèi',
-    0x7160: 'zhá,yè',
-    0x7161: 'jìn',
-    0x7162: 'qióng',
-    0x7163: 'róu,rǒu',
-    0x7164: 'méi',
-    0x7165: 'huàn',
-    0x7166: 'xù,xiū',
-    0x7167: 'zhào',
-    0x7168: 'wēi,yù',
-    0x7169: 'fán',
-    0x716A: 'qiú',
-    0x716B: 'suì',
-    0x716C: 'yáng,yàng',
-    0x716D: 'liè',
-    0x716E: 'zhǔ',
-    0x716F: 'jiē',
-    0x7170: 'zào',
-    0x7171: 'guā',
-    0x7172: 'bāo',
-    0x7173: 'hú',
-    0x7174: 'yūn,yùn,wěn',
-    0x7175: 'nǎn',
-    0x7176: 'shì',
-    0x7177: 'liang',
-    0x7178: 'biān',
-    0x7179: 'gòu',
-    0x717A: 'tuì',
-    0x717B: 'táng',
-    0x717C: 'chǎo',
-    0x717D: 'shān',
-    0x717E: 'ēn,yūn',
-    0x717F: 'bó',
-    0x7180: 'huǎng,yè',
-    0x7181: 'xié',
-    0x7182: 'xì',
-    0x7183: 'wù',
-    0x7184: 'xī',
-    0x7185: 'yùn',
-    0x7186: 'hé',
-    0x7187: 'hè,xiāo,kǎo,kào',
-    0x7188: 'xī',
-    0x7189: 'yún',
-    0x718A: 'xióng',
-    0x718B: 'nái',
-    0x718C: 'shǎn',
-    0x718D: 'qióng',
-    0x718E: 'yào',
-    0x718F: 'xūn,xùn',
-    0x7190: 'mì',
-    0x7191: 'lián,qiān',
-    0x7192: 'yíng,xíng,jiǒng',
-    0x7193: 'wǔ',
-    0x7194: 'róng',
-    0x7195: 'gōng',
-    0x7196: 'yàn',
-    0x7197: 'qiàng',
-    0x7198: 'liū',
-    0x7199: 'xī,yí',
-    0x719A: 'bì',
-    0x719B: 'biāo',
-    0x719C: 'cōng,zǒng',
-    0x719D: 'lù,āo',
-    0x719E: 'jiān',
-    0x719F: 'shú,shóu',
-    0x71A0: 'yì',
-    0x71A1: 'lóu',
-    0x71A2: 'péng,bèng,fēng',
-    0x71A3: 'suī,cuǐ',
-    0x71A4: 'yì',
-    0x71A5: 'tēng,tōng',
-    0x71A6: 'jué',
-    0x71A7: 'zōng',
-    0x71A8: 'yùn,yù,wèi',
-    0x71A9: 'hù',
-    0x71AA: 'yí',
-    0x71AB: 'zhì',
-    0x71AC: 'áo,āo',
-    0x71AD: 'wèi',
-    0x71AE: 'liǔ',
-    0x71AF: 'hàn,rǎn',
-    0x71B0: 'ōu,òu',
-    0x71B1: 'rè',
-    0x71B2: 'jiǒng',
-    0x71B3: 'màn',
-    0x71B4: 'kūn',
-    0x71B5: 'shāng',
-    0x71B6: 'cuàn',
-    0x71B7: 'zēng',
-    0x71B8: 'jiān',
-    0x71B9: 'xī',
-    0x71BA: 'xī',
-    0x71BB: 'xī',
-    0x71BC: 'yì',
-    0x71BD: 'xiào',
-    0x71BE: 'chì',
-    0x71BF: 'huáng,huǎng',
-    0x71C0: 'chǎn,dǎn,chàn',
-    0x71C1: 'yè',
-    0x71C2: 'tán,xún,qián',
-    0x71C3: 'rán',
-    0x71C4: 'yàn',
-    0x71C5: 'xún',
-    0x71C6: 'qiāo,xiāo',
-    0x71C7: 'jùn',
-    0x71C8: 'dēng',
-    0x71C9: 'dùn,tún,dūn',
-    0x71CA: 'shēn',
-    0x71CB: 'jiāo,qiáo,jué,zhuó',
-    0x71CC: 'fén,bèn',
-    0x71CD: 'sī,xī',
-    0x71CE: 'liáo,liǎo,liào',
-    0x71CF: 'yù',
-    0x71D0: 'lín',
-    0x71D1: 'tóng',
-    0x71D2: 'shāo,shào',
-    0x71D3: 'fén',
-    0x71D4: 'fán,fén',
-    0x71D5: 'yàn,yān',
-    0x71D6: 'xún,qián',
-    0x71D7: 'làn',
-    0x71D8: 'měi',
-    0x71D9: 'tàng,dàng',
-    0x71DA: 'yì',
-    0x71DB: 'jiǒng',
-    0x71DC: 'mèn',
-    0x71DD: 'jing',
-    0x71DE: 'jiǎo',
-    0x71DF: 'yíng,cuō',
-    0x71E0: 'yù,ào',
-    0x71E1: 'yì',
-    0x71E2: 'xué',
-    0x71E3: 'lán',
-    0x71E4: 'tài,liè',
-    0x71E5: 'zào,sào',
-    0x71E6: 'càn',
-    0x71E7: 'suì',
-    0x71E8: 'xī',
-    0x71E9: 'què',
-    0x71EA: 'zǒng',
-    0x71EB: 'lián',
-    0x71EC: 'huǐ',
-    0x71ED: 'zhú,kuò',
-    0x71EE: 'xiè',
-    0x71EF: 'líng',
-    0x71F0: 'wēi',
-    0x71F1: 'yì',
-    0x71F2: 'xié',
-    0x71F3: 'zhào',
-    0x71F4: 'huì',
-    0x71F5: 'dá',
-    0x71F6: 'nóng',
-    0x71F7: 'lán',
-    0x71F8: 'rú,ruǎn',
-    0x71F9: 'xiǎn,bìng',
-    0x71FA: 'hè',
-    0x71FB: 'xūn',
-    0x71FC: 'jìn',
-    0x71FD: 'chóu',
-    0x71FE: 'dào,tāo',
-    0x71FF: 'yào,shuò,shào',
-    0x7200: 'hè',
-    0x7201: 'làn',
-    0x7202: 'biāo',
-    0x7203: 'róng',
-    0x7204: 'lì,liè',
-    0x7205: 'mò',
-    0x7206: 'bào,bó',
-    0x7207: 'ruò',
-    0x7208: 'lǜ',
-    0x7209: 'là,liè',
-    0x720A: 'āo',
-    0x720B: 'xūn',
-    0x720C: 'kuàng,huǎng,kuǎng',
-    0x720D: 'shuò,luò,yuè',
-    0x720E: 'liáo',
-    0x720F: 'lì',
-    0x7210: 'lú',
-    0x7211: 'jué',
-    0x7212: 'liǎo',
-    0x7213: 'yàn,xún',
-    0x7214: 'xī',
-    0x7215: 'xiè',
-    0x7216: 'lóng',
-    0x7217: 'yè',
-    0x7218: 'cān',
-    0x7219: 'rǎng',
-    0x721A: 'yuè',
-    0x721B: 'làn',
-    0x721C: 'cóng',
-    0x721D: 'jué,jiào',
-    0x721E: 'chóng,tóng',
-    0x721F: 'guàn',
-    0x7220: 'ju',
-    0x7221: 'chè',
-    0x7222: 'mí',
-    0x7223: 'tǎng',
-    0x7224: 'làn',
-    0x7225: 'zhú',
-    0x7226: 'lǎn',
-    0x7227: 'líng',
-    0x7228: 'cuàn',
-    0x7229: 'yù',
-    0x722A: 'zhǎo,zhuǎ',
-    0x722B: 'zhǎo',
-    0x722C: 'pá',
-    0x722D: 'zhēng,zhèng',
-    0x722E: 'páo',
-    0x722F: 'chēng,chèng',
-    0x7230: 'yuán',
-    0x7231: 'ài',
-    0x7232: 'wèi,wéi',
-    0x7233: 'han',
-    0x7234: 'jué',
-    0x7235: 'jué',
-    0x7236: 'fù,fǔ',
-    0x7237: 'yé',
-    0x7238: 'bà',
-    0x7239: 'diē',
-    0x723A: 'yé',
-    0x723B: 'yáo,xiào',
-    0x723C: 'zǔ',
-    0x723D: 'shuǎng,shuāng',
-    0x723E: 'ěr,mǐ,nǐ',
-    0x723F: 'pán,qiáng',
-    0x7240: 'chuáng',
-    0x7241: 'kē',
-    0x7242: 'zāng',
-    0x7243: 'dié',
-    0x7244: 'qiāng',
-    0x7245: 'yōng',
-    0x7246: 'qiáng',
-    0x7247: 'piàn,piān,pàn',
-    0x7248: 'bǎn',
-    0x7249: 'pàn',
-    0x724A: 'cháo',
-    0x724B: 'jiān',
-    0x724C: 'pái',
-    0x724D: 'dú',
-    0x724E: 'chuāng',
-    0x724F: 'yú',
-    0x7250: 'zhá',
-    0x7251: 'biān,miàn',
-    0x7252: 'dié',
-    0x7253: 'bǎng,pāng',
-    0x7254: 'bó',
-    0x7255: 'chuāng',
-    0x7256: 'yǒu',
-    0x7257: 'yǒu',
-    0x7258: 'dú',
-    0x7259: 'yá,yà',
-    0x725A: 'chēng,chèng',
-    0x725B: 'niú',
-    0x725C: 'niú',
-    0x725D: 'pìn',
-    0x725E: 'jiū,lè',
-    0x725F: 'móu,mù,mào',
-    0x7260: 'tā,tuó',
-    0x7261: 'mǔ',
-    0x7262: 'láo,lào,lóu',
-    0x7263: 'rèn',
-    0x7264: 'māng',
-    0x7265: 'fāng',
-    0x7266: 'máo',
-    0x7267: 'mù',
-    0x7268: 'gāng',
-    0x7269: 'wù',
-    0x726A: 'yàn',
-    0x726B: 'gē,qiú,zāng',
-    0x726C: 'bèi',
-    0x726D: 'sì',
-    0x726E: 'jiàn',
-    0x726F: 'gǔ',
-    0x7270: 'yòu,chōu',
-    0x7271: 'gē',
-    0x7272: 'shēng',
-    0x7273: 'mǔ',
-    0x7274: 'dǐ,dī,zhāi',
-    0x7275: 'qiān',
-    0x7276: 'quàn',
-    0x7277: 'quán',
-    0x7278: 'zì',
-    0x7279: 'tè',
-    0x727A: 'xī',
-    0x727B: 'máng',
-    0x727C: 'kēng',
-    0x727D: 'qiān,qiàn',
-    0x727E: 'wǔ,wú',
-    0x727F: 'gù',
-    0x7280: 'xī',
-    0x7281: 'lí',
-    0x7282: 'lí',
-    0x7283: 'pǒu',
-    0x7284: 'jī,yī',
-    0x7285: 'gāng',
-    0x7286: 'zhí,tè',
-    0x7287: 'bēn',
-    0x7288: 'quán',
-    0x7289: 'chún',
-    0x728A: 'dú',
-    0x728B: 'jù',
-    0x728C: 'jiā',
-    0x728D: 'jiān,qián,jiǎn',
-    0x728E: 'fēng',
-    0x728F: 'piān',
-    0x7290: 'kē',
-    0x7291: 'jú',
-    0x7292: 'kào',
-    0x7293: 'chú',
-    0x7294: 'xì',
-    0x7295: 'bèi',
-    0x7296: 'luò',
-    0x7297: 'jiè',
-    0x7298: 'má',
-    0x7299: 'sān',
-    0x729A: 'wèi',
-    0x729B: 'máo,lí',
-    0x729C: 'dūn',
-    0x729D: 'tóng',
-    0x729E: 'qiáo',
-    0x729F: 'jiàng',
-    0x72A0: 'xī',
-    0x72A1: 'lì',
-    0x72A2: 'dú',
-    0x72A3: 'liè',
-    0x72A4: 'pái',
-    0x72A5: 'piāo,pào',
-    0x72A6: 'bó',
-    0x72A7: 'xī,suō',
-    0x72A8: 'chōu',
-    0x72A9: 'wéi',
-    0x72AA: 'kuí,ráo',
-    0x72AB: 'chōu',
-    0x72AC: 'quǎn',
-    0x72AD: 'quǎn',
-    0x72AE: 'bá',
-    0x72AF: 'fàn',
-    0x72B0: 'qiú',
-    0x72B1: 'jǐ',
-    0x72B2: 'chái',
-    0x72B3: 'zhuó',
-    0x72B4: 'àn,hān,án,jiàn',
-    0x72B5: 'gē,hé',
-    0x72B6: 'zhuàng',
-    0x72B7: 'guǎng',
-    0x72B8: 'mà,mǎ',
-    0x72B9: 'yóu,yòu',
-    0x72BA: 'kàng,gǎng',
-    0x72BB: 'bó,pèi,fèi',
-    0x72BC: 'hǒu',
-    0x72BD: 'yà',
-    0x72BE: 'yín',
-    0x72BF: 'huān,fān',
-    0x72C0: 'zhuàng',
-    0x72C1: 'yǔn',
-    0x72C2: 'kuáng,jué',
-    0x72C3: 'niǔ,nǜ',
-    0x72C4: 'dí,tì',
-    0x72C5: 'kuáng',
-    0x72C6: 'zhòng',
-    0x72C7: 'mù',
-    0x72C8: 'bèi',
-    0x72C9: 'pī',
-    0x72CA: 'jú',
-    0x72CB: 'yí,quán,chí',
-    0x72CC: 'shēng,xīng',
-    0x72CD: 'páo',
-    0x72CE: 'xiá',
-    0x72CF: 'tuó,yí',
-    0x72D0: 'hú',
-    0x72D1: 'líng',
-    0x72D2: 'fèi',
-    0x72D3: 'pí,pī',
-    0x72D4: 'nǐ',
-    0x72D5: 'yǎo',
-    0x72D6: 'yòu',
-    0x72D7: 'gǒu',
-    0x72D8: 'xuè',
-    0x72D9: 'jū',
-    0x72DA: 'dàn',
-    0x72DB: 'bó',
-    0x72DC: 'kǔ',
-    0x72DD: 'xiǎn',
-    0x72DE: 'níng',
-    0x72DF: 'huán,xuān,héng',
-    0x72E0: 'hěn,yán,kěn,hǎng',
-    0x72E1: 'jiǎo,xiào',
-    0x72E2: 'hé,mò',
-    0x72E3: 'zhào',
-    0x72E4: 'jí,jié,kuài',
-    0x72E5: 'xùn',
-    0x72E6: 'shān',
-    0x72E7: 'tà,shì',
-    0x72E8: 'róng',
-    0x72E9: 'shòu',
-    0x72EA: 'tóng,dòng',
-    0x72EB: 'lǎo',
-    0x72EC: 'dú',
-    0x72ED: 'xiá',
-    0x72EE: 'shī',
-    0x72EF: 'kuài',
-    0x72F0: 'zhēng',
-    0x72F1: 'yù',
-    0x72F2: 'sūn',
-    0x72F3: 'yú',
-    0x72F4: 'bì',
-    0x72F5: 'máng,zhuó',
-    0x72F6: 'xī,shǐ',
-    0x72F7: 'juàn',
-    0x72F8: 'lí',
-    0x72F9: 'xiá',
-    0x72FA: 'yín',
-    0x72FB: 'suān,xùn,jùn',
-    0x72FC: 'láng,lǎng,làng,hǎng',
-    0x72FD: 'bèi',
-    0x72FE: 'zhì',
-    0x72FF: 'yán',
-    0x7300: 'shā',
-    0x7301: 'lì',
-    0x7302: 'hàn',
-    0x7303: 'xiǎn',
-    0x7304: 'jīng',
-    0x7305: 'pái',
-    0x7306: 'fēi',
-    0x7307: 'xiāo',
-    0x7308: 'bài,pí',
-    0x7309: 'qí',
-    0x730A: 'ní',
-    0x730B: 'biāo',
-    0x730C: 'yìn',
-    0x730D: 'lái',
-    0x730E: 'liè,xī,què',
-    0x730F: 'jiān',
-    0x7310: 'qiāng',
-    0x7311: 'kūn',
-    0x7312: 'yàn',
-    0x7313: 'guǒ,luǒ',
-    0x7314: 'zòng',
-    0x7315: 'mí',
-    0x7316: 'chāng',
-    0x7317: 'yī,yǐ,jì,ē,wēi',
-    0x7318: 'zhì',
-    0x7319: 'zhēng',
-    0x731A: 'yá,wèi',
-    0x731B: 'měng',
-    0x731C: 'cāi',
-    0x731D: 'cù',
-    0x731E: 'shē',
-    0x731F: 'liè',
-    0x7320: 'diǎn',
-    0x7321: 'luó',
-    0x7322: 'hú',
-    0x7323: 'zōng',
-    0x7324: 'guì',
-    0x7325: 'wěi,wèi',
-    0x7326: 'fēng',
-    0x7327: 'wō',
-    0x7328: 'yuán',
-    0x7329: 'xīng',
-    0x732A: 'zhū',
-    0x732B: 'māo,miáo,máo',
-    0x732C: 'wèi',
-    0x732D: 'chuān,chuàn,shān',
-    0x732E: 'xiàn',
-    0x732F: 'tuān',
-    0x7330: 'yà,jiá,qiè',
-    0x7331: 'náo',
-    0x7332: 'xiē,hè,gé,hài',
-    0x7333: 'jiā',
-    0x7334: 'hóu',
-    0x7335: 'biān,piàn',
-    0x7336: 'yóu,yáo',
-    0x7337: 'yóu',
-    0x7338: 'méi',
-    0x7339: 'chá',
-    0x733A: 'yáo',
-    0x733B: 'sūn',
-    0x733C: 'bó,pò',
-    0x733D: 'míng',
-    0x733E: 'huá',
-    0x733F: 'yuán',
-    0x7340: 'sōu',
-    0x7341: 'mà,mǎ',
-    0x7342: 'yuán',
-    0x7343: 'dāi,ái',
-    0x7344: 'yù',
-    0x7345: 'shī',
-    0x7346: 'háo',
-    0x7347: 'qiāng',
-    0x7348: 'yì',
-    0x7349: 'zhēn',
-    0x734A: 'cāng',
-    0x734B: 'háo,gāo',
-    0x734C: 'màn',
-    0x734D: 'jìng',
-    0x734E: 'jiǎng',
-    0x734F: 'mò,mú',
-    0x7350: 'zhāng',
-    0x7351: 'chán',
-    0x7352: 'áo',
-    0x7353: 'áo',
-    0x7354: 'háo',
-    0x7355: 'cuī',
-    0x7356: 'bèn,fèn,fén',
-    0x7357: 'jué',
-    0x7358: 'bì',
-    0x7359: 'bì',
-    0x735A: 'huáng',
-    0x735B: 'pú',
-    0x735C: 'lín,lìn',
-    0x735D: 'xù,yù',
-    0x735E: 'tóng,zhuàng',
-    0x735F: 'yào,xiāo',
-    0x7360: 'liáo,lǎo',
-    0x7361: 'shuò',
-    0x7362: 'xiāo',
-    0x7363: 'shòu',
-    0x7364: 'dūn',
-    0x7365: 'jiào',
-    0x7366: 'gé,xiē,liè',
-    0x7367: 'juàn',
-    0x7368: 'dú',
-    0x7369: 'huì',
-    0x736A: 'kuài,huá',
-    0x736B: 'xiǎn',
-    0x736C: 'xiè,hǎ,jiě',
-    0x736D: 'tǎ',
-    0x736E: 'xiǎn,mí',
-    0x736F: 'xūn',
-    0x7370: 'níng',
-    0x7371: 'biān',
-    0x7372: 'huò',
-    0x7373: 'nòu,rú',
-    0x7374: 'měng,méng',
-    0x7375: 'liè',
-    0x7376: 'nǎo,yōu,náo',
-    0x7377: 'guǎng,jǐng',
-    0x7378: 'shòu',
-    0x7379: 'lú',
-    0x737A: 'tǎ',
-    0x737B: 'xiàn,suō,xī',
-    0x737C: 'mí',
-    0x737D: 'ráng',
-    0x737E: 'huān,quán',
-    0x737F: 'nǎo,náo',
-    0x7380: 'luó,ě',
-    0x7381: 'xiǎn',
-    0x7382: 'qí',
-    0x7383: 'jué',
-    0x7384: 'xuán,xuàn',
-    0x7385: 'miào,yāo',
-    0x7386: 'zī,xuán',
-    0x7387: 'lǜ,shuài,lüè',
-    0x7388: 'lú',
-    0x7389: 'yù',
-    0x738A: 'sù',
-    0x738B: 'wáng,wàng,yù',
-    0x738C: 'qiú',
-    0x738D: 'gǎ',
-    0x738E: 'dīng',
-    0x738F: 'lè',
-    0x7390: 'bā',
-    0x7391: 'jī',
-    0x7392: 'hóng',
-    0x7393: 'dì',
-    0x7394: 'chuàn',
-    0x7395: 'gān',
-    0x7396: 'jiǔ',
-    0x7397: 'yú',
-    0x7398: 'qǐ',
-    0x7399: 'yú',
-    0x739A: 'chàng,yáng',
-    0x739B: 'mǎ',
-    0x739C: 'hóng',
-    0x739D: 'wǔ',
-    0x739E: 'fū',
-    0x739F: 'wén,mín',
-    0x73A0: 'jiè',
-    0x73A1: 'yá,yà',
-    0x73A2: 'bīn,fēn',
-    0x73A3: 'biàn',
-    0x73A4: 'bàng',
-    0x73A5: 'yuè',
-    0x73A6: 'jué',
-    0x73A7: 'mén,yǔn',
-    0x73A8: 'jué',
-    0x73A9: 'wán',
-    0x73AA: 'jiān,yín,qián,lín',
-    0x73AB: 'méi',
-    0x73AC: 'dǎn',
-    0x73AD: 'pín',
-    0x73AE: 'wěi',
-    0x73AF: 'huán',
-    0x73B0: 'xiàn',
-    0x73B1: 'qiāng',
-    0x73B2: 'líng',
-    0x73B3: 'dài',
-    0x73B4: 'yì',
-    0x73B5: 'án,gān',
-    0x73B6: 'píng',
-    0x73B7: 'diàn,diān',
-    0x73B8: 'fú',
-    0x73B9: 'xuán,xuàn,xián',
-    0x73BA: 'xǐ',
-    0x73BB: 'bō',
-    0x73BC: 'cǐ,cī,cuō',
-    0x73BD: 'gǒu',
-    0x73BE: 'jiǎ',
-    0x73BF: 'sháo',
-    0x73C0: 'pò',
-    0x73C1: 'cí',
-    0x73C2: 'kē',
-    0x73C3: 'rǎn',
-    0x73C4: 'shēng',
-    0x73C5: 'shēn',
-    0x73C6: 'yí,tāi',
-    0x73C7: 'zǔ,jù',
-    0x73C8: 'jiā',
-    0x73C9: 'mín',
-    0x73CA: 'shān',
-    0x73CB: 'liǔ',
-    0x73CC: 'bì',
-    0x73CD: 'zhēn',
-    0x73CE: 'zhēn',
-    0x73CF: 'jué',
-    0x73D0: 'fà',
-    0x73D1: 'lóng',
-    0x73D2: 'jīn',
-    0x73D3: 'jiào',
-    0x73D4: 'jiàn',
-    0x73D5: 'lì',
-    0x73D6: 'guāng',
-    0x73D7: 'xiān',
-    0x73D8: 'zhōu',
-    0x73D9: 'gǒng',
-    0x73DA: 'yān',
-    0x73DB: 'xiù',
-    0x73DC: 'yáng',
-    0x73DD: 'xǔ',
-    0x73DE: 'luò,lì',
-    0x73DF: 'sù',
-    0x73E0: 'zhū',
-    0x73E1: 'qín',
-    0x73E2: 'yín,kèn',
-    0x73E3: 'xún',
-    0x73E4: 'bǎo',
-    0x73E5: 'ěr',
-    0x73E6: 'xiàng',
-    0x73E7: 'yáo',
-    0x73E8: 'xiá',
-    0x73E9: 'háng,héng',
-    0x73EA: 'guī',
-    0x73EB: 'chōng',
-    0x73EC: 'xù',
-    0x73ED: 'bān',
-    0x73EE: 'pèi',
-    0x73EF: 'lǎo',
-    0x73F0: 'dāng',
-    0x73F1: 'yīng',
-    0x73F2: 'huī,hún',
-    0x73F3: 'wén',
-    0x73F4: 'é',
-    0x73F5: 'chéng,tǐng',
-    0x73F6: 'dì,tí',
-    0x73F7: 'wǔ,wù',
-    0x73F8: 'wú',
-    0x73F9: 'chéng',
-    0x73FA: 'jùn',
-    0x73FB: 'méi',
-    0x73FC: 'bèi',
-    0x73FD: 'tǐng',
-    0x73FE: 'xiàn',
-    0x73FF: 'chù',
-    0x7400: 'hán',
-    0x7401: 'xuán,qióng',
-    0x7402: 'yán',
-    0x7403: 'qiú',
-    0x7404: 'xuàn',
-    0x7405: 'láng,làng',
-    0x7406: 'lǐ',
-    0x7407: 'xiù',
-    0x7408: 'fú,fū',
-    0x7409: 'liú',
-    0x740A: 'yá',
-    0x740B: 'xī',
-    0x740C: 'líng',
-    0x740D: 'lí',
-    0x740E: 'jìn',
-    0x740F: 'liǎn',
-    0x7410: 'suǒ',
-    0x7411: 'suǒ',
-    0x7412: 'fēng',
-    0x7413: 'wán',
-    0x7414: 'diàn',
-    0x7415: 'pín,bǐng',
-    0x7416: 'zhǎn',
-    0x7417: 'sè,cuì',
-    0x7418: 'mín',
-    0x7419: 'yù',
-    0x741A: 'jū',
-    0x741B: 'chēn',
-    0x741C: 'lái',
-    0x741D: 'mín',
-    0x741E: 'shèng,wàng',
-    0x741F: 'wéi,yù',
-    0x7420: 'tiǎn,tiàn',
-    0x7421: 'chù',
-    0x7422: 'zuó,zhuó',
-    0x7423: 'běng,pěi',
-    0x7424: 'chēng',
-    0x7425: 'hǔ',
-    0x7426: 'qí',
-    0x7427: 'è',
-    0x7428: 'kūn',
-    0x7429: 'chāng',
-    0x742A: 'qí',
-    0x742B: 'běng',
-    0x742C: 'wǎn',
-    0x742D: 'lù',
-    0x742E: 'cóng',
-    0x742F: 'guǎn,gùn,guān,guàn',
-    0x7430: 'yǎn',
-    0x7431: 'diāo',
-    0x7432: 'bèi',
-    0x7433: 'lín',
-    0x7434: 'qín',
-    0x7435: 'pí',
-    0x7436: 'pá',
-    0x7437: 'què',
-    0x7438: 'zhuó',
-    0x7439: 'qín',
-    0x743A: 'fà',
-    0x743B: 'jīn',
-    0x743C: 'qióng',
-    0x743D: 'dǔ',
-    0x743E: 'jiè',
-    0x743F: 'hún,huī',
-    0x7440: 'yǔ',
-    0x7441: 'mào',
-    0x7442: 'méi',
-    0x7443: 'chūn',
-    0x7444: 'xuān',
-    0x7445: 'tí',
-    0x7446: 'xīng',
-    0x7447: 'dài',
-    0x7448: 'róu',
-    0x7449: 'mín',
-    0x744A: 'jiān',
-    0x744B: 'wěi',
-    0x744C: 'ruǎn',
-    0x744D: 'huàn',
-    0x744E: 'xié',
-    0x744F: 'chuān',
-    0x7450: 'jiǎn',
-    0x7451: 'zhuàn',
-    0x7452: 'chàng,yáng,dàng',
-    0x7453: 'liàn',
-    0x7454: 'quán',
-    0x7455: 'xiá',
-    0x7456: 'duàn',
-    0x7457: 'yuàn,huán',
-    0x7458: 'yá',
-    0x7459: 'nǎo',
-    0x745A: 'hú',
-    0x745B: 'yīng',
-    0x745C: 'yú',
-    0x745D: 'huáng',
-    0x745E: 'ruì',
-    0x745F: 'sè',
-    0x7460: 'liú',
-    0x7461: 'shī',
-    0x7462: 'róng',
-    0x7463: 'suǒ',
-    0x7464: 'yáo',
-    0x7465: 'wēn',
-    0x7466: 'wǔ',
-    0x7467: 'zhēn',
-    0x7468: 'jìn',
-    0x7469: 'yíng,yǐng',
-    0x746A: 'mǎ',
-    0x746B: 'tāo',
-    0x746C: 'liú',
-    0x746D: 'táng',
-    0x746E: 'lì',
-    0x746F: 'láng',
-    0x7470: 'guī',
-    0x7471: 'zhèn,tiàn',
-    0x7472: 'qiāng,chēng,cāng',
-    0x7473: 'cuō',
-    0x7474: 'jué',
-    0x7475: 'zhǎo',
-    0x7476: 'yáo',
-    0x7477: 'ài',
-    0x7478: 'bīn',
-    0x7479: 'shū,tū',
-    0x747A: 'cháng',
-    0x747B: 'kūn',
-    0x747C: 'zhuān',
-    0x747D: 'cōng',
-    0x747E: 'jǐn,jìn',
-    0x747F: 'yī',
-    0x7480: 'cuǐ',
-    0x7481: 'cōng',
-    0x7482: 'qí',
-    0x7483: 'lí',
-    0x7484: 'jǐng',
-    0x7485: 'suǒ,zǎo',
-    0x7486: 'qiú',
-    0x7487: 'xuán',
-    0x7488: 'áo',
-    0x7489: 'liǎn,lián',
-    0x748A: 'mén',
-    0x748B: 'zhāng',
-    0x748C: 'yín',
-    0x748D: 'yè',
-    0x748E: 'yīng',
-    0x748F: 'wèi,zhì',
-    0x7490: 'lù',
-    0x7491: 'wú',
-    0x7492: 'dēng',
-    0x7493: 'xiù',
-    0x7494: 'zēng',
-    0x7495: 'xún',
-    0x7496: 'qú',
-    0x7497: 'dàng',
-    0x7498: 'lín',
-    0x7499: 'liáo',
-    0x749A: 'qióng,jué',
-    0x749B: 'sù',
-    0x749C: 'huáng',
-    0x749D: 'guī',
-    0x749E: 'pú',
-    0x749F: 'jǐng',
-    0x74A0: 'fán',
-    0x74A1: 'jìn,jīn',
-    0x74A2: 'liú',
-    0x74A3: 'jī',
-    0x74A4: 'huì',
-    0x74A5: 'jǐng',
-    0x74A6: 'ài',
-    0x74A7: 'bì',
-    0x74A8: 'càn',
-    0x74A9: 'qú',
-    0x74AA: 'zǎo',
-    0x74AB: 'dāng',
-    0x74AC: 'jiǎo',
-    0x74AD: 'gùn',
-    0x74AE: 'tǎn',
-    0x74AF: 'huì,kuài',
-    0x74B0: 'huán,huàn',
-    0x74B1: 'sè',
-    0x74B2: 'suì',
-    0x74B3: 'tián',
-    0x74B4: 'chǔ',
-    0x74B5: 'yú',
-    0x74B6: 'jìn',
-    0x74B7: 'lú,fū',
-    0x74B8: 'bīn,pián',
-    0x74B9: 'shú',
-    0x74BA: 'wèn',
-    0x74BB: 'zuǐ',
-    0x74BC: 'lán',
-    0x74BD: 'xǐ',
-    0x74BE: 'zī,jì',
-    0x74BF: 'xuán',
-    0x74C0: 'ruǎn',
-    0x74C1: 'wò',
-    0x74C2: 'gài',
-    0x74C3: 'léi',
-    0x74C4: 'dú',
-    0x74C5: 'lì',
-    0x74C6: 'zhì',
-    0x74C7: 'róu',
-    0x74C8: 'lí,li',
-    0x74C9: 'zàn',
-    0x74CA: 'qióng,xuán',
-    0x74CB: 'tì',
-    0x74CC: 'guī',
-    0x74CD: 'suí',
-    0x74CE: 'là',
-    0x74CF: 'lóng',
-    0x74D0: 'lú',
-    0x74D1: 'lì',
-    0x74D2: 'zàn',
-    0x74D3: 'làn',
-    0x74D4: 'yīng',
-    0x74D5: 'mí,xǐ',
-    0x74D6: 'xiāng',
-    0x74D7: 'qióng,wěi,wèi',
-    0x74D8: 'guàn',
-    0x74D9: 'dào',
-    0x74DA: 'zàn',
-    0x74DB: 'huán,yè,yǎn',
-    0x74DC: 'guā',
-    0x74DD: 'bó',
-    0x74DE: 'dié',
-    0x74DF: 'bó,páo',
-    0x74E0: 'hù,hú,huò,gū',
-    0x74E1: 'zhí,hú',
-    0x74E2: 'piáo',
-    0x74E3: 'bàn',
-    0x74E4: 'ráng',
-    0x74E5: 'lì',
-    0x74E6: 'wǎ,wà',
-    0x74E8: 'xiáng,hóng',
-    0x74E9: 'qiān,wǎ',
-    0x74EA: 'bǎn',
-    0x74EB: 'pén',
-    0x74EC: 'fǎng',
-    0x74ED: 'dǎn,dān',
-    0x74EE: 'wèng',
-    0x74EF: 'ōu',
-    0x74F2: 'wa',
-    0x74F3: 'hú',
-    0x74F4: 'líng',
-    0x74F5: 'yí',
-    0x74F6: 'píng',
-    0x74F7: 'cí',
-    0x74F8: 'bǎi',
-    0x74F9: 'juān,juàn',
-    0x74FA: 'cháng',
-    0x74FB: 'chī',
-    0x74FD: 'dàng',
-    0x74FE: 'měng',
-    0x74FF: 'bù,pǒu',
-    0x7500: 'zhuì',
-    0x7501: 'píng',
-    0x7502: 'biān',
-    0x7503: 'zhòu',
-    0x7504: 'zhēn,zhèn,juàn',
-    0x7506: 'cí',
-    0x7507: 'yīng',
-    0x7508: 'qì',
-    0x7509: 'xián',
-    0x750A: 'lǒu',
-    0x750B: 'dì',
-    0x750C: 'ōu,ǒu',
-    0x750D: 'méng',
-    0x750E: 'zhuān,chuán',
-    0x750F: 'bèng',
-    0x7510: 'lìn',
-    0x7511: 'zèng',
-    0x7512: 'wǔ',
-    0x7513: 'pì',
-    0x7514: 'dān,dàn',
-    0x7515: 'wèng',
-    0x7516: 'yīng',
-    0x7517: 'yǎn',
-    0x7518: 'gān,hān',
-    0x7519: 'dài',
-    0x751A: 'shén,shèn',
-    0x751B: 'tián',
-    0x751C: 'tián',
-    0x751D: 'hán',
-    0x751E: 'cháng',
-    0x751F: 'shēng',
-    0x7520: 'qíng',
-    0x7521: 'shēn',
-    0x7522: 'chǎn',
-    0x7523: 'chǎn',
-    0x7524: 'ruí',
-    0x7525: 'shēng',
-    0x7526: 'sū',
-    0x7527: 'shēn',
-    0x7528: 'yòng',
-    0x7529: 'shuǎi',
-    0x752A: 'lù',
-    0x752B: 'fǔ,fū,pǔ',
-    0x752C: 'yǒng,dòng',
-    0x752D: 'béng,qì',
-    0x752E: 'fèng',
-    0x752F: 'níng,nìng',
-    0x7530: 'tián',
-    0x7531: 'yóu,yāo',
-    0x7532: 'jiǎ',
-    0x7533: 'shēn',
-    0x7534: 'zhá,yóu',
-    0x7535: 'diàn',
-    0x7536: 'fú',
-    0x7537: 'nán',
-    0x7538: 'diān,diàn,tián,shèng,yìng',
-    0x7539: 'pīng',
-    0x753A: 'tīng,dīng,tǐng,zhèng,tiǎn',
-    0x753B: 'huà',
-    0x753C: 'tǐng',
-    0x753D: 'zhèn,quǎn,zhùn',
-    0x753E: 'zāi,zī',
-    0x753F: 'méng,máng',
-    0x7540: 'bì',
-    0x7541: 'bì',
-    0x7542: 'liù',
-    0x7543: 'xún',
-    0x7544: 'liú',
-    0x7545: 'chàng',
-    0x7546: 'mǔ',
-    0x7547: 'yún,tián',
-    0x7548: 'fàn',
-    0x7549: 'fú',
-    0x754A: 'gēng',
-    0x754B: 'tián',
-    0x754C: 'jiè',
-    0x754D: 'jiè',
-    0x754E: 'quǎn',
-    0x754F: 'wèi,wēi,wěi',
-    0x7550: 'fú,bì',
-    0x7551: 'tián',
-    0x7552: 'mǔ',
-    0x7553: 'duō',
-    0x7554: 'pàn',
-    0x7555: 'jiāng',
-    0x7556: 'wā',
-    0x7557: 'dá,fú',
-    0x7558: 'nán',
-    0x7559: 'liú,liù,liǔ',
-    0x755A: 'běn',
-    0x755B: 'zhěn',
-    0x755C: 'chù,xù',
-    0x755D: 'mǔ,mǒu',
-    0x755E: 'mǔ',
-    0x755F: 'cè,jì',
-    0x7560: 'tián',
-    0x7561: 'gāi',
-    0x7562: 'bì',
-    0x7563: 'dá',
-    0x7564: 'zhì,chóu,shì',
-    0x7565: 'lüè',
-    0x7566: 'qí',
-    0x7567: 'lüè',
-    0x7568: 'pān,fān',
-    0x7569: 'yī',
-    0x756A: 'fān,pān,fán,bō,pó,pán,pàn,pí',
-    0x756B: 'huà',
-    0x756C: 'shē,yú',
-    0x756D: 'yú',
-    0x756E: 'mǔ',
-    0x756F: 'jùn',
-    0x7570: 'yì',
-    0x7571: 'liú',
-    0x7572: 'shē',
-    0x7573: 'dié',
-    0x7574: 'chóu',
-    0x7575: 'huà',
-    0x7576: 'dāng,dàng,dang',
-    0x7577: 'zhuì',
-    0x7578: 'jī,qí',
-    0x7579: 'wǎn,yuǎn',
-    0x757A: 'jiāng,jiàng',
-    0x757B: 'chéng',
-    0x757C: 'chàng',
-    0x757D: 'tǔn,tuǎn',
-    0x757E: 'léi',
-    0x757F: 'jī',
-    0x7580: 'chā',
-    0x7581: 'liú',
-    0x7582: 'dié',
-    0x7583: 'tuǎn',
-    0x7584: 'lìn,lín',
-    0x7585: 'jiāng',
-    0x7586: 'jiāng,jiàng',
-    0x7587: 'chóu',
-    0x7588: 'pì',
-    0x7589: 'dié',
-    0x758A: 'dié',
-    0x758B: 'pǐ,shū,yǎ',
-    0x758C: 'jié,qiè',
-    0x758D: 'dàn',
-    0x758E: 'shū',
-    0x758F: 'shū',
-    0x7590: 'zhì,dì',
-    0x7591: 'yí,níng',
-    0x7592: 'nè',
-    0x7593: 'nǎi',
-    0x7594: 'dīng,nè',
-    0x7595: 'bǐ',
-    0x7596: 'jiē',
-    0x7597: 'liáo',
-    0x7598: 'gāng,gōng',
-    0x7599: 'gē,yì',
-    0x759A: 'jiù',
-    0x759B: 'zhǒu',
-    0x759C: 'xià',
-    0x759D: 'shàn',
-    0x759E: 'xū',
-    0x759F: 'nüè,yào',
-    0x75A0: 'lì',
-    0x75A1: 'yáng',
-    0x75A2: 'chèn',
-    0x75A3: 'yóu,yòu',
-    0x75A4: 'bā',
-    0x75A5: 'jiè',
-    0x75A6: 'jué,xuè',
-    0x75A7: 'qí',
-    0x75A8: 'xiā,yá',
-    0x75A9: 'cuì',
-    0x75AA: 'bì',
-    0x75AB: 'yì',
-    0x75AC: 'lì',
-    0x75AD: 'zòng',
-    0x75AE: 'chuāng',
-    0x75AF: 'fēng',
-    0x75B0: 'zhù',
-    0x75B1: 'pào',
-    0x75B2: 'pí',
-    0x75B3: 'gān',
-    0x75B4: 'kē,ē,qià',
-    0x75B5: 'cī,zī,zhài,jì',
-    0x75B6: 'xuē',
-    0x75B7: 'zhī',
-    0x75B8: 'dǎn,da',
-    0x75B9: 'zhěn,chèn',
-    0x75BA: 'fá,biǎn',
-    0x75BB: 'zhǐ',
-    0x75BC: 'téng',
-    0x75BD: 'jū,jǔ',
-    0x75BE: 'jí',
-    0x75BF: 'fèi',
-    0x75C0: 'jū,gōu',
-    0x75C1: 'shān',
-    0x75C2: 'jiā',
-    0x75C3: 'xuán',
-    0x75C4: 'zhà',
-    0x75C5: 'bìng',
-    0x75C6: 'niè,nì,niǎn',
-    0x75C7: 'zhèng,zhēng',
-    0x75C8: 'yōng',
-    0x75C9: 'jìng',
-    0x75CA: 'quán',
-    0x75CB: 'téng,chóng',
-    0x75CC: 'tōng,tóng',
-    0x75CD: 'yí',
-    0x75CE: 'jiē',
-    0x75CF: 'wěi,yòu,yù',
-    0x75D0: 'huí',
-    0x75D1: 'tān,shǐ',
-    0x75D2: 'yǎng,yáng',
-    0x75D3: 'chì',
-    0x75D4: 'zhì',
-    0x75D5: 'hén,gèn',
-    0x75D6: 'yǎ',
-    0x75D7: 'mèi',
-    0x75D8: 'dòu',
-    0x75D9: 'jìng',
-    0x75DA: 'xiāo',
-    0x75DB: 'tòng',
-    0x75DC: 'tū',
-    0x75DD: 'máng',
-    0x75DE: 'pǐ',
-    0x75DF: 'xiāo',
-    0x75E0: 'suān',
-    0x75E1: 'fū,pū,pù',
-    0x75E2: 'lì',
-    0x75E3: 'zhì',
-    0x75E4: 'cuó',
-    0x75E5: 'duó',
-    0x75E6: 'wù,pī',
-    0x75E7: 'shā',
-    0x75E8: 'láo',
-    0x75E9: 'shòu',
-    0x75EA: 'huàn,tuǎn',
-    0x75EB: 'xián',
-    0x75EC: 'yì',
-    0x75ED: 'bēng,péng,bìng',
-    0x75EE: 'zhàng',
-    0x75EF: 'guǎn',
-    0x75F0: 'tán',
-    0x75F1: 'fèi,féi,fěi',
-    0x75F2: 'má',
-    0x75F3: 'lín,lìn',
-    0x75F4: 'chī',
-    0x75F5: 'jì',
-    0x75F6: 'tiǎn,diǎn',
-    0x75F7: 'ān,yè,è',
-    0x75F8: 'chì',
-    0x75F9: 'bì',
-    0x75FA: 'bì',
-    0x75FB: 'mín',
-    0x75FC: 'gù',
-    0x75FD: 'duī',
-    0x75FE: 'ē,kē',
-    0x75FF: 'wěi',
-    0x7600: 'yū',
-    0x7601: 'cuì',
-    0x7602: 'yǎ',
-    0x7603: 'zhú',
-    0x7604: 'cù',
-    0x7605: 'dān,dàn',
-    0x7606: 'shèn',
-    0x7607: 'zhǒng',
-    0x7608: 'chì,zhì',
-    0x7609: 'yù',
-    0x760A: 'hóu',
-    0x760B: 'fēng',
-    0x760C: 'là',
-    0x760D: 'yáng,dàng',
-    0x760E: 'chén',
-    0x760F: 'tú',
-    0x7610: 'yǔ,yù',
-    0x7611: 'guō',
-    0x7612: 'wén',
-    0x7613: 'huàn',
-    0x7614: 'kù',
-    0x7615: 'jiǎ,xiā',
-    0x7616: 'yīn,yìn',
-    0x7617: 'yì',
-    0x7618: 'lòu',
-    0x7619: 'sào',
-    0x761A: 'jué',
-    0x761B: 'chì',
-    0x761C: 'xī',
-    0x761D: 'guān',
-    0x761E: 'yì',
-    0x761F: 'wēn,wò,yūn',
-    0x7620: 'jí',
-    0x7621: 'chuāng',
-    0x7622: 'bān',
-    0x7623: 'huì,lěi',
-    0x7624: 'liú',
-    0x7625: 'chài,cuó',
-    0x7626: 'shòu',
-    0x7627: 'nüè,yào',
-    0x7628: 'diān,chēn',
-    0x7629: 'dā,da,dá',
-    0x762A: 'biě,biē',
-    0x762B: 'tān',
-    0x762C: 'zhàng',
-    0x762D: 'biāo',
-    0x762E: 'shèn',
-    0x762F: 'cù',
-    0x7630: 'luǒ',
-    0x7631: 'yì',
-    0x7632: 'zòng',
-    0x7633: 'chōu,lù',
-    0x7634: 'zhàng',
-    0x7635: 'zhài,jì',
-    0x7636: 'sòu',
-    0x7637: 'sè',
-    0x7638: 'qué',
-    0x7639: 'diào',
-    0x763A: 'lòu',
-    0x763B: 'lòu,lǘ',
-    0x763C: 'mò',
-    0x763D: 'qín',
-    0x763E: 'yǐn',
-    0x763F: 'yǐng',
-    0x7640: 'huáng',
-    0x7641: 'fú',
-    0x7642: 'liáo,liào,shuò',
-    0x7643: 'lóng',
-    0x7644: 'qiáo',
-    0x7645: 'liú',
-    0x7646: 'láo,lào',
-    0x7647: 'xián',
-    0x7648: 'fèi',
-    0x7649: 'dān,dàn,dǎn,tán',
-    0x764A: 'yìn',
-    0x764B: 'hè',
-    0x764C: 'ái,yán',
-    0x764D: 'bān',
-    0x764E: 'xián',
-    0x764F: 'guān',
-    0x7650: 'guì,wēi',
-    0x7651: 'nòng,nóng',
-    0x7652: 'yù',
-    0x7653: 'wéi',
-    0x7654: 'yì',
-    0x7655: 'yōng',
-    0x7656: 'pǐ',
-    0x7657: 'lěi',
-    0x7658: 'lì,lài',
-    0x7659: 'shǔ',
-    0x765A: 'dàn',
-    0x765B: 'lǐn,bǐng',
-    0x765C: 'diàn',
-    0x765D: 'lǐn',
-    0x765E: 'lài',
-    0x765F: 'biě,bié,biē',
-    0x7660: 'jì',
-    0x7661: 'chī',
-    0x7662: 'yǎng',
-    0x7663: 'xuǎn',
-    0x7664: 'jiē',
-    0x7665: 'zhēng',
-    0x7666: 'me',
-    0x7667: 'lì',
-    0x7668: 'huò',
-    0x7669: 'lài,là',
-    0x766A: 'jī',
-    0x766B: 'diān',
-    0x766C: 'xuǎn',
-    0x766D: 'yǐng',
-    0x766E: 'yǐn',
-    0x766F: 'qú',
-    0x7670: 'yōng',
-    0x7671: 'tān',
-    0x7672: 'diān',
-    0x7673: 'luǒ',
-    0x7674: 'luán',
-    0x7675: 'luán',
-    0x7676: 'bō',
-    0x7677: 'bō',
-    0x7678: 'guǐ',
-    0x7679: 'bá',
-    0x767A: 'fā',
-    0x767B: 'dēng,dé',
-    0x767C: 'fā,bō',
-    0x767D: 'bái,bó',
-    0x767E: 'bǎi,bó,mò',
-    0x767F: 'qié,bié',
-    0x7680: 'jí,xiāng,bī',
-    0x7681: 'zào',
-    0x7682: 'zào',
-    0x7683: 'mào',
-    0x7684: 'de,dī,dí,dì',
-    0x7685: 'pā,bà',
-    0x7686: 'jiē',
-    0x7687: 'huáng,wǎng',
-    0x7688: 'guī',
-    0x7689: 'cǐ',
-    0x768A: 'líng',
-    0x768B: 'gāo,háo,gū',
-    0x768C: 'mò',
-    0x768D: 'jí',
-    0x768E: 'jiǎo',
-    0x768F: 'pěng',
-    0x7690: 'gāo',
-    0x7691: 'ái',
-    0x7692: 'é',
-    0x7693: 'hào,huī',
-    0x7694: 'hàn',
-    0x7695: 'bì',
-    0x7696: 'wǎn,huàn',
-    0x7697: 'chóu',
-    0x7698: 'qiàn',
-    0x7699: 'xī',
-    0x769A: 'ái',
-    0x769B: 'xiǎo,jiǎo,pò',
-    0x769C: 'hào',
-    0x769D: 'huàng',
-    0x769E: 'hào',
-    0x769F: 'zé',
-    0x76A0: 'cuǐ',
-    0x76A1: 'hào',
-    0x76A2: 'xiǎo',
-    0x76A3: 'yè',
-    0x76A4: 'pó,pán',
-    0x76A5: 'hào',
-    0x76A6: 'jiǎo',
-    0x76A7: 'ài',
-    0x76A8: 'xīng',
-    0x76A9: 'huàng',
-    0x76AA: 'lì,luò,bō',
-    0x76AB: 'piǎo',
-    0x76AC: 'hé',
-    0x76AD: 'jiào',
-    0x76AE: 'pí',
-    0x76AF: 'gǎn',
-    0x76B0: 'pào',
-    0x76B1: 'zhòu',
-    0x76B2: 'jūn',
-    0x76B3: 'qiú',
-    0x76B4: 'cūn',
-    0x76B5: 'què',
-    0x76B6: 'zhā',
-    0x76B7: 'gǔ',
-    0x76B8: 'jūn',
-    0x76B9: 'jūn',
-    0x76BA: 'zhòu,zhōu',
-    0x76BB: 'zhā,cǔ',
-    0x76BC: 'gǔ',
-    0x76BD: 'zhāo,zhǎn,dǎn',
-    0x76BE: 'dú',
-    0x76BF: 'mǐn,mǐng',
-    0x76C0: 'qǐ',
-    0x76C1: 'yíng',
-    0x76C2: 'yú',
-    0x76C3: 'bēi',
-    0x76C4: 'zhāo',
-    0x76C5: 'zhōng,chōng',
-    0x76C6: 'pén',
-    0x76C7: 'hé',
-    0x76C8: 'yíng',
-    0x76C9: 'hé',
-    0x76CA: 'yì',
-    0x76CB: 'bō',
-    0x76CC: 'wǎn',
-    0x76CD: 'hé,kě',
-    0x76CE: 'àng',
-    0x76CF: 'zhǎn',
-    0x76D0: 'yán',
-    0x76D1: 'jiān,jiàn',
-    0x76D2: 'hé,ān',
-    0x76D3: 'yū,wū',
-    0x76D4: 'kuī',
-    0x76D5: 'fàn',
-    0x76D6: 'gài,gě',
-    0x76D7: 'dào',
-    0x76D8: 'pán',
-    0x76D9: 'fǔ',
-    0x76DA: 'qiú',
-    0x76DB: 'shèng,chéng',
-    0x76DC: 'dào',
-    0x76DD: 'lù',
-    0x76DE: 'zhǎn',
-    0x76DF: 'méng,mèng,míng',
-    0x76E0: 'lí',
-    0x76E1: 'jǐn,jìn',
-    0x76E2: 'xù',
-    0x76E3: 'jiān,jiàn,kàn',
-    0x76E4: 'pán,xuán',
-    0x76E5: 'guàn',
-    0x76E6: 'ān',
-    0x76E7: 'lú,lǘ,léi',
-    0x76E8: 'xǔ',
-    0x76E9: 'zhōu,chóu',
-    0x76EA: 'dàng',
-    0x76EB: 'ān',
-    0x76EC: 'gǔ,gù,gū',
-    0x76ED: 'lì',
-    0x76EE: 'mù',
-    0x76EF: 'dīng,chéng',
-    0x76F0: 'gàn',
-    0x76F1: 'xū',
-    0x76F2: 'máng',
-    0x76F3: 'wàng,máng',
-    0x76F4: 'zhí',
-    0x76F5: 'qì',
-    0x76F6: 'yuǎn',
-    0x76F7: 'tián,xián,mín',
-    0x76F8: 'xiāng,xiàng',
-    0x76F9: 'dǔn,zhūn',
-    0x76FA: 'xīn',
-    0x76FB: 'xì,pǎn',
-    0x76FC: 'pàn,fén',
-    0x76FD: 'fēng',
-    0x76FE: 'dùn,shǔn,yǔn',
-    0x76FF: 'mín',
-    0x7700: 'míng',
-    0x7701: 'shěng,xǐng,xiǎn',
-    0x7702: 'shì',
-    0x7703: 'yún,hùn',
-    0x7704: 'miǎn,miàn',
-    0x7705: 'pān',
-    0x7706: 'fǎng',
-    0x7707: 'miǎo,miào',
-    0x7708: 'dān,chěn',
-    0x7709: 'méi',
-    0x770A: 'mào,mèi',
-    0x770B: 'kàn,kān',
-    0x770C: 'xiàn',
-    0x770D: 'kōu',
-    0x770E: 'shì',
-    0x770F: 'yāng,yǎng,yìng',
-    0x7710: 'zhēng',
-    0x7711: 'yǎo,āo,ǎo',
-    0x7712: 'shēn',
-    0x7713: 'huò',
-    0x7714: 'dà',
-    0x7715: 'zhěn',
-    0x7716: 'kuàng',
-    0x7717: 'jū,xū,kōu',
-    0x7718: 'shèn',
-    0x7719: 'yí,chì',
-    0x771A: 'shěng',
-    0x771B: 'mèi',
-    0x771C: 'mò,miè',
-    0x771D: 'zhù',
-    0x771E: 'zhēn',
-    0x771F: 'zhēn',
-    0x7720: 'mián,miǎn,mǐn',
-    0x7721: 'shì',
-    0x7722: 'yuān',
-    0x7723: 'dié,chōu',
-    0x7724: 'nì',
-    0x7725: 'zì',
-    0x7726: 'zì',
-    0x7727: 'chǎo',
-    0x7728: 'zhǎ',
-    0x7729: 'xuàn,huàn,juàn',
-    0x772A: 'bǐng,fǎng',
-    0x772B: 'mǐ,pàn',
-    0x772C: 'lóng',
-    0x772D: 'suī,huī,xié,wèi',
-    0x772E: 'tóng',
-    0x772F: 'mī,mí,mǐ,mì',
-    0x7730: 'diè,zhì',
-    0x7731: 'dì',
-    0x7732: 'nè',
-    0x7733: 'míng',
-    0x7734: 'xuàn,shùn,xún',
-    0x7735: 'chī',
-    0x7736: 'kuàng',
-    0x7737: 'juàn',
-    0x7738: 'móu',
-    0x7739: 'zhèn',
-    0x773A: 'tiào',
-    0x773B: 'yáng',
-    0x773C: 'yǎn,wěn',
-    0x773D: 'mò,mì',
-    0x773E: 'zhòng',
-    0x773F: 'mò',
-    0x7740: 'zhe,zhāo,zháo,zhuó',
-    0x7741: 'zhēng',
-    0x7742: 'méi',
-    0x7743: 'suō,jùn,juān',
-    0x7744: 'shào,qiáo,xiāo',
-    0x7745: 'hàn',
-    0x7746: 'huàn,huǎn',
-    0x7747: 'dì,tī,tí',
-    0x7748: 'chěng',
-    0x7749: 'cuó,zhuài',
-    0x774A: 'juàn',
-    0x774B: 'é',
-    0x774C: 'mǎn',
-    0x774D: 'xiàn',
-    0x774E: 'xī',
-    0x774F: 'kùn',
-    0x7750: 'lài',
-    0x7751: 'jiǎn',
-    0x7752: 'shǎn',
-    0x7753: 'tiǎn',
-    0x7754: 'gùn,huán,lǔn',
-    0x7755: 'wǎn,wàn,wān',
-    0x7756: 'lèng,chēng',
-    0x7757: 'shì',
-    0x7758: 'qióng',
-    0x7759: 'liè',
-    0x775A: 'yá',
-    0x775B: 'jīng,jǐng',
-    0x775C: 'zhēng',
-    0x775D: 'lí',
-    0x775E: 'lài',
-    0x775F: 'suì,zuì',
-    0x7760: 'juàn',
-    0x7761: 'shuì',
-    0x7762: 'suī,huī,wěi',
-    0x7763: 'dū',
-    0x7764: 'bì',
-    0x7765: 'pì',
-    0x7766: 'mù',
-    0x7767: 'hūn',
-    0x7768: 'nì',
-    0x7769: 'lù',
-    0x776A: 'yì,zé,dù,gāo',
-    0x776B: 'jié,shè',
-    0x776C: 'cǎi',
-    0x776D: 'zhǒu',
-    0x776E: 'yú',
-    0x776F: 'hūn',
-    0x7770: 'mà',
-    0x7771: 'xià,xiá',
-    0x7772: 'xǐng,xìng',
-    0x7773: 'huī',
-    0x7774: 'gùn',
-    0x7775: 'zāi',
-    0x7776: 'chǔn',
-    0x7777: 'jiān',
-    0x7778: 'mèi',
-    0x7779: 'dǔ',
-    0x777A: 'hóu',
-    0x777B: 'xuān',
-    0x777C: 'tiàn',
-    0x777D: 'kuí,kuì,jì',
-    0x777E: 'gāo,hào',
-    0x777F: 'ruì',
-    0x7780: 'mào,wú',
-    0x7781: 'xù',
-    0x7782: 'fá',
-    0x7783: 'wò',
-    0x7784: 'miáo',
-    0x7785: 'chǒu',
-    0x7786: 'kuì',
-    0x7787: 'mī,mǐ,mì',
-    0x7788: 'wěng',
-    0x7789: 'kòu,jì',
-    0x778A: 'dàng',
-    0x778B: 'chēn,tián,tiàn,shèn',
-    0x778C: 'kē',
-    0x778D: 'sǒu',
-    0x778E: 'xiā',
-    0x778F: 'qióng,huán',
-    0x7790: 'mò',
-    0x7791: 'míng,méng,mián',
-    0x7792: 'mán',
-    0x7793: 'shuì',
-    0x7794: 'zé',
-    0x7795: 'zhàng',
-    0x7796: 'yì',
-    0x7797: 'diāo,dōu',
-    0x7798: 'kōu',
-    0x7799: 'mò',
-    0x779A: 'shùn',
-    0x779B: 'cōng',
-    0x779C: 'lōu,lóu,lǘ',
-    0x779D: 'chī',
-    0x779E: 'mán,mén,mèn',
-    0x779F: 'piǎo,piào,piāo',
-    0x77A0: 'chēng,zhèng',
-    0x77A1: 'guī',
-    0x77A2: 'méng,máng,mèng',
-    0x77A3: 'wàn',
-    0x77A4: 'rún,shùn',
-    0x77A5: 'piē,bì',
-    0x77A6: 'xī',
-    0x77A7: 'qiáo',
-    0x77A8: 'pú',
-    0x77A9: 'zhǔ',
-    0x77AA: 'dèng',
-    0x77AB: 'shěn',
-    0x77AC: 'shùn',
-    0x77AD: 'liǎo,liào',
-    0x77AE: 'chè',
-    0x77AF: 'xián,jiàn',
-    0x77B0: 'kàn',
-    0x77B1: 'yè',
-    0x77B2: 'xù,xuè',
-    0x77B3: 'tóng',
-    0x77B4: 'móu,wǔ,mí',
-    0x77B5: 'lín,lìn,lián',
-    0x77B6: 'guì,wèi,kuì',
-    0x77B7: 'jiàn,xián',
-    0x77B8: 'yè',
-    0x77B9: 'ài',
-    0x77BA: 'huì',
-    0x77BB: 'zhān',
-    0x77BC: 'jiǎn',
-    0x77BD: 'gǔ',
-    0x77BE: 'zhào',
-    0x77BF: 'qú,jù,jí',
-    0x77C0: 'méi',
-    0x77C1: 'chǒu',
-    0x77C2: 'sào',
-    0x77C3: 'nǐng,chēng',
-    0x77C4: 'xūn',
-    0x77C5: 'yào',
-    0x77C6: 'huò,xuē,yuè,wò',
-    0x77C7: 'méng,měng,mēng',
-    0x77C8: 'mián',
-    0x77C9: 'pín',
-    0x77CA: 'mián',
-    0x77CB: 'lěi',
-    0x77CC: 'kuàng,guō',
-    0x77CD: 'jué',
-    0x77CE: 'xuān,xuàn',
-    0x77CF: 'mián',
-    0x77D0: 'huò',
-    0x77D1: 'lú',
-    0x77D2: 'méng',
-    0x77D3: 'lóng',
-    0x77D4: 'guàn,quán',
-    0x77D5: 'mǎn,mán',
-    0x77D6: 'xǐ,lí',
-    0x77D7: 'chù',
-    0x77D8: 'tǎng',
-    0x77D9: 'kàn',
-    0x77DA: 'zhǔ',
-    0x77DB: 'máo',
-    0x77DC: 'jīn,qín,guān',
-    0x77DD: 'jīn',
-    0x77DE: 'yù,jué,xù',
-    0x77DF: 'shuò',
-    0x77E0: 'zé,zhuó',
-    0x77E1: 'jué',
-    0x77E2: 'shǐ',
-    0x77E3: 'yǐ,xián',
-    0x77E4: 'shěn',
-    0x77E5: 'zhī,zhì',
-    0x77E6: 'hóu',
-    0x77E7: 'shěn',
-    0x77E8: 'yǐng',
-    0x77E9: 'jǔ',
-    0x77EA: 'zhōu',
-    0x77EB: 'jiǎo,jiáo',
-    0x77EC: 'cuó',
-    0x77ED: 'duǎn',
-    0x77EE: 'ǎi',
-    0x77EF: 'jiǎo,jiāo,jiáo',
-    0x77F0: 'zēng',
-    0x77F1: 'yuē',
-    0x77F2: 'bà',
-    0x77F3: 'shí,dàn',
-    0x77F4: 'dìng',
-    0x77F5: 'qì,diāo',
-    0x77F6: 'jī',
-    0x77F7: 'zǐ',
-    0x77F8: 'gān,gàn,gǎn,hàn',
-    0x77F9: 'wù',
-    0x77FA: 'zhé,dā',
-    0x77FB: 'kū,qià',
-    0x77FC: 'gāng,kòng,qiāng',
-    0x77FD: 'xì,xī',
-    0x77FE: 'fán',
-    0x77FF: 'kuàng',
-    0x7800: 'dàng',
-    0x7801: 'mǎ',
-    0x7802: 'shā',
-    0x7803: 'dān',
-    0x7804: 'jué',
-    0x7805: 'lì',
-    0x7806: 'fū',
-    0x7807: 'mín',
-    0x7808: 'ě',
-    0x7809: 'huò,huā,xū',
-    0x780A: 'kāng,kàng',
-    0x780B: 'zhǐ',
-    0x780C: 'qì,qiè',
-    0x780D: 'kǎn',
-    0x780E: 'jiè',
-    0x780F: 'bīn,fēn,pīn',
-    0x7810: 'è',
-    0x7811: 'yà',
-    0x7812: 'pī',
-    0x7813: 'zhé',
-    0x7814: 'yán,yàn,xíng',
-    0x7815: 'suì',
-    0x7816: 'zhuān',
-    0x7817: 'chē',
-    0x7818: 'dùn',
-    0x7819: 'wǎ',
-    0x781A: 'yàn',
-    0x781B: 'jīn',
-    0x781C: 'fēng',
-    0x781D: 'fá,fǎ,jié,gé',
-    0x781E: 'mò',
-    0x781F: 'zhǎ,zhà,zuó',
-    0x7820: 'jū,zū',
-    0x7821: 'yù',
-    0x7822: 'kē,luǒ',
-    0x7823: 'tuó',
-    0x7824: 'tuó',
-    0x7825: 'dǐ,zhǐ',
-    0x7826: 'zhài',
-    0x7827: 'zhēn',
-    0x7828: 'è',
-    0x7829: 'fú,fèi',
-    0x782A: 'mǔ',
-    0x782B: 'zhù,zhǔ',
-    0x782C: 'lá,lì,lā',
-    0x782D: 'biān',
-    0x782E: 'nǔ,nú',
-    0x782F: 'pīng',
-    0x7830: 'pēng,pīng,pèng',
-    0x7831: 'líng',
-    0x7832: 'pào,báo,pū',
-    0x7833: 'lè',
-    0x7834: 'pò',
-    0x7835: 'bō,è',
-    0x7836: 'pò',
-    0x7837: 'shēn',
-    0x7838: 'zá',
-    0x7839: 'ài',
-    0x783A: 'lì',
-    0x783B: 'lóng',
-    0x783C: 'tóng',
-    0x783D: 'yòng',
-    0x783E: 'lì',
-    0x783F: 'kuàng',
-    0x7840: 'chǔ',
-    0x7841: 'kēng',
-    0x7842: 'quán',
-    0x7843: 'zhū',
-    0x7844: 'kuāng,guāng',
-    0x7845: 'guī,hè',
-    0x7846: 'è',
-    0x7847: 'náo',
-    0x7848: 'qià',
-    0x7849: 'lù',
-    0x784A: 'wěi,huì,guì',
-    0x784B: 'ài',
-    0x784C: 'gè,luò,lì',
-    0x784D: 'xiàn,yín,kèn,kēng,yǐn',
-    0x784E: 'xíng,kēng',
-    0x784F: 'yán,yàn',
-    0x7850: 'dòng,tóng,liú',
-    0x7851: 'pēng,píng',
-    0x7852: 'xī',
-    0x7853: 'lǎo',
-    0x7854: 'hóng,gǒng',
-    0x7855: 'shuò',
-    0x7856: 'xiá',
-    0x7857: 'qiāo',
-    0x7858: 'qing',
-    0x7859: 'wéi,wèi',
-    0x785A: 'qiáo',
-    0x785B: 'yì',
-    0x785C: 'kēng,qìng',
-    0x785D: 'xiāo,qiào',
-    0x785E: 'què,kè,kù',
-    0x785F: 'chàn',
-    0x7860: 'láng',
-    0x7861: 'hōng',
-    0x7862: 'yú',
-    0x7863: 'xiāo',
-    0x7864: 'xiá',
-    0x7865: 'mǎng,bàng',
-    0x7866: 'luò,lòng',
-    0x7867: 'yǒng,tóng',
-    0x7868: 'chē',
-    0x7869: 'chè',
-    0x786A: 'wò,é,yǐ',
-    0x786B: 'liú,chù',
-    0x786C: 'yìng,gěng',
-    0x786D: 'máng',
-    0x786E: 'què',
-    0x786F: 'yàn',
-    0x7870: 'shā',
-    0x7871: 'kǔn',
-    0x7872: 'yù',
-    0x7873: 'chì',
-    0x7874: 'huā',
-    0x7875: 'lǔ',
-    0x7876: 'chěn,cén',
-    0x7877: 'jiǎn',
-    0x7878: 'nüè',
-    0x7879: 'sōng',
-    0x787A: 'zhuó',
-    0x787B: 'kēng,kěng',
-    0x787C: 'péng,pēng',
-    0x787D: 'yān,yǎn',
-    0x787E: 'zhuì,duǒ',
-    0x787F: 'kōng,kòng',
-    0x7880: 'chéng',
-    0x7881: 'qí',
-    0x7882: 'zòng,cóng',
-    0x7883: 'qìng',
-    0x7884: 'lín',
-    0x7885: 'jūn',
-    0x7886: 'bō',
-    0x7887: 'dìng',
-    0x7888: 'mín,hūn',
-    0x7889: 'diāo',
-    0x788A: 'jiān,zhàn',
-    0x788B: 'hè',
-    0x788C: 'lù,liù,luò',
-    0x788D: 'ài',
-    0x788E: 'suì',
-    0x788F: 'què,xī',
-    0x7890: 'léng',
-    0x7891: 'bēi',
-    0x7892: 'yín',
-    0x7893: 'duì,duī',
-    0x7894: 'wǔ',
-    0x7895: 'qí,qī,qǐ',
-    0x7896: 'lǔn,lùn,lún',
-    0x7897: 'wǎn',
-    0x7898: 'diǎn',
-    0x7899: 'náo,gāng',
-    0x789A: 'bèi',
-    0x789B: 'qì',
-    0x789C: 'chěn',
-    0x789D: 'ruǎn',
-    0x789E: 'yán',
-    0x789F: 'dié,shé',
-    0x78A0: 'dìng',
-    0x78A1: 'dú,zhóu',
-    0x78A2: 'tuó',
-    0x78A3: 'jié,kě,yà',
-    0x78A4: 'yīng',
-    0x78A5: 'biǎn',
-    0x78A6: 'kè',
-    0x78A7: 'bì',
-    0x78A8: 'wèi,wěi',
-    0x78A9: 'shuò',
-    0x78AA: 'zhēn,ǎn,kàn',
-    0x78AB: 'duàn',
-    0x78AC: 'xiá',
-    0x78AD: 'dàng',
-    0x78AE: 'tí,dī',
-    0x78AF: 'nǎo',
-    0x78B0: 'pèng',
-    0x78B1: 'jiǎn,xián',
-    0x78B2: 'dì',
-    0x78B3: 'tàn',
-    0x78B4: 'chá,chā',
-    0x78B5: 'tián',
-    0x78B6: 'qì',
-    0x78B7: 'dùn',
-    0x78B8: 'fēng',
-    0x78B9: 'xuàn',
-    0x78BA: 'què',
-    0x78BB: 'què,qiāo',
-    0x78BC: 'mǎ',
-    0x78BD: 'gōng',
-    0x78BE: 'niǎn',
-    0x78BF: 'sù,xiè',
-    0x78C0: 'é',
-    0x78C1: 'cí',
-    0x78C2: 'liú,liù',
-    0x78C3: 'sī,tí',
-    0x78C4: 'táng',
-    0x78C5: 'bàng,páng,pāng',
-    0x78C6: 'huá,kě,gū',
-    0x78C7: 'pī',
-    0x78C8: 'wěi,kuǐ',
-    0x78C9: 'sǎng',
-    0x78CA: 'lěi',
-    0x78CB: 'cuō',
-    0x78CC: 'tián',
-    0x78CD: 'xiá,qià,yà',
-    0x78CE: 'xī,qī',
-    0x78CF: 'lián,qiān',
-    0x78D0: 'pán',
-    0x78D1: 'wéi,wèi,ái,gài',
-    0x78D2: 'yǔn',
-    0x78D3: 'duī,zhuì',
-    0x78D4: 'zhé',
-    0x78D5: 'kē,kě',
-    0x78D6: 'lá,lā',
-    0x78D7: 'zhuān',
-    0x78D8: 'yáo',
-    0x78D9: 'gǔn',
-    0x78DA: 'zhuān,tuán,tuó',
-    0x78DB: 'chán',
-    0x78DC: 'qì,qī',
-    0x78DD: 'áo,qiāo',
-    0x78DE: 'pēng',
-    0x78DF: 'liù,lù',
-    0x78E0: 'lǔ',
-    0x78E1: 'kàn',
-    0x78E2: 'chuǎng',
-    0x78E3: 'chěn,cà',
-    0x78E4: 'yǐn,yīn',
-    0x78E5: 'lěi,léi',
-    0x78E6: 'biāo',
-    0x78E7: 'qì',
-    0x78E8: 'mó,mò',
-    0x78E9: 'qì,zhú',
-    0x78EA: 'cuī',
-    0x78EB: 'zōng',
-    0x78EC: 'qìng,qǐng',
-    0x78ED: 'chuò',
-    0x78EE: 'lún',
-    0x78EF: 'jī',
-    0x78F0: 'shàn',
-    0x78F1: 'láo',
-    0x78F2: 'qú',
-    0x78F3: 'zēng',
-    0x78F4: 'dèng,dēng',
-    0x78F5: 'jiàn',
-    0x78F6: 'xì',
-    0x78F7: 'lín,lìn,lǐn,líng',
-    0x78F8: 'dìng',
-    0x78F9: 'tán,diàn',
-    0x78FA: 'huáng,kuàng,gǒng',
-    0x78FB: 'pán,bō',
-    0x78FC: 'zá,shé',
-    0x78FD: 'qiāo,qiǎo,qiào,áo',
-    0x78FE: 'dī',
-    0x78FF: 'lì',
-    0x7900: 'jiàn',
-    0x7901: 'jiāo',
-    0x7902: 'xī',
-    0x7903: 'zhǎng',
-    0x7904: 'qiáo',
-    0x7905: 'dūn',
-    0x7906: 'jiǎn,xiǎn',
-    0x7907: 'yù',
-    0x7908: 'zhuì',
-    0x7909: 'hé,qiāo,qiào,áo',
-    0x790A: 'kè,huò',
-    0x790B: 'zé',
-    0x790C: 'léi,lèi,lěi',
-    0x790D: 'jié',
-    0x790E: 'chǔ',
-    0x790F: 'yè',
-    0x7910: 'què,hú',
-    0x7911: 'dàng',
-    0x7912: 'yǐ',
-    0x7913: 'jiāng',
-    0x7914: 'pī',
-    0x7915: 'pī',
-    0x7916: 'yù',
-    0x7917: 'pīn',
-    0x7918: 'è,qì',
-    0x7919: 'ài,yí',
-    0x791A: 'kē',
-    0x791B: 'jiān',
-    0x791C: 'yù',
-    0x791D: 'ruǎn',
-    0x791E: 'méng',
-    0x791F: 'pào',
-    0x7920: 'cí',
-    0x7921: 'bó',
-    0x7922: 'yǎng',
-    0x7923: 'mà',
-    0x7924: 'cǎ',
-    0x7925: 'xián,xín',
-    0x7926: 'kuàng,gǒng',
-    0x7927: 'léi,lèi,lěi',
-    0x7928: 'lěi',
-    0x7929: 'zhì',
-    0x792A: 'lì',
-    0x792B: 'lì,luò',
-    0x792C: 'fán',
-    0x792D: 'què',
-    0x792E: 'pào',
-    0x792F: 'yīng',
-    0x7930: 'lì',
-    0x7931: 'lóng',
-    0x7932: 'lóng',
-    0x7933: 'mò',
-    0x7934: 'bó',
-    0x7935: 'shuāng',
-    0x7936: 'guàn',
-    0x7937: 'lán',
-    0x7938: 'cǎ',
-    0x7939: 'yán,yǎn',
-    0x793A: 'shì,qí,zhì,shí',
-    0x793B: 'shì',
-    0x793C: 'lǐ',
-    0x793D: 'réng',
-    0x793E: 'shè',
-    0x793F: 'yuè',
-    0x7940: 'sì',
-    0x7941: 'qí,zhǐ',
-    0x7942: 'tā',
-    0x7943: 'mà',
-    0x7944: 'xiè',
-    0x7945: 'yāo',
-    0x7946: 'xiān',
-    0x7947: 'qí,chí,zhī,zhǐ',
-    0x7948: 'qí,guǐ',
-    0x7949: 'zhǐ',
-    0x794A: 'bēng,fāng',
-    0x794B: 'duì',
-    0x794C: 'zhòng,chōng',
-    0x794D: 'rèn',
-    0x794E: 'yī',
-    0x794F: 'shí',
-    0x7950: 'yòu',
-    0x7951: 'zhì',
-    0x7952: 'tiáo',
-    0x7953: 'fú,fèi',
-    0x7954: 'fù',
-    0x7955: 'mì,bì',
-    0x7956: 'zǔ,jiē',
-    0x7957: 'zhī',
-    0x7958: 'suàn',
-    0x7959: 'mèi',
-    0x795A: 'zuò',
-    0x795B: 'qū',
-    0x795C: 'hù',
-    0x795D: 'zhù,zhòu,chù',
-    0x795E: 'shén,shēn',
-    0x795F: 'suì',
-    0x7960: 'cí,sì',
-    0x7961: 'chái',
-    0x7962: 'mí,nǐ',
-    0x7963: 'lǚ',
-    0x7964: 'yǔ',
-    0x7965: 'xiáng',
-    0x7966: 'wú',
-    0x7967: 'tiāo',
-    0x7968: 'piào,piāo',
-    0x7969: 'zhù',
-    0x796A: 'guǐ',
-    0x796B: 'xiá',
-    0x796C: 'zhī',
-    0x796D: 'jì,zhài',
-    0x796E: 'gào',
-    0x796F: 'zhēn',
-    0x7970: 'gào',
-    0x7971: 'shuì,lèi',
-    0x7972: 'jìn',
-    0x7973: 'shèn',
-    0x7974: 'gāi',
-    0x7975: 'kǔn',
-    0x7976: 'dì',
-    0x7977: 'dǎo',
-    0x7978: 'huò',
-    0x7979: 'táo',
-    0x797A: 'qí',
-    0x797B: 'gù',
-    0x797C: 'guàn',
-    0x797D: 'zuì',
-    0x797E: 'líng',
-    0x797F: 'lù',
-    0x7980: 'bǐng',
-    0x7981: 'jìn,jīn',
-    0x7982: 'dǎo',
-    0x7983: 'zhí',
-    0x7984: 'lù',
-    0x7985: 'chán,shàn',
-    0x7986: 'bì',
-    0x7987: 'zhě',
-    0x7988: 'huī',
-    0x7989: 'yǒu',
-    0x798A: 'xì',
-    0x798B: 'yīn',
-    0x798C: 'zī',
-    0x798D: 'huò',
-    0x798E: 'zhēn,zhēng',
-    0x798F: 'fú,fù',
-    0x7990: 'yuàn',
-    0x7991: 'wú',
-    0x7992: 'xiǎn',
-    0x7993: 'yáng,shāng',
-    0x7994: 'zhī',
-    0x7995: 'yī',
-    0x7996: 'méi',
-    0x7997: 'sī',
-    0x7998: 'dì',
-    0x7999: 'bèi',
-    0x799A: 'zhuó',
-    0x799B: 'zhēn',
-    0x799C: 'yǒng,yíng',
-    0x799D: 'jì',
-    0x799E: 'gào',
-    0x799F: 'táng',
-    0x79A0: 'sī',
-    0x79A1: 'mà',
-    0x79A2: 'tà',
-    0x79A3: 'fù',
-    0x79A4: 'xuān',
-    0x79A5: 'qí',
-    0x79A6: 'yù',
-    0x79A7: 'xǐ,xī',
-    0x79A8: 'jī,jì,qí',
-    0x79A9: 'sì',
-    0x79AA: 'chán,shàn,tán',
-    0x79AB: 'dàn',
-    0x79AC: 'guì',
-    0x79AD: 'suì',
-    0x79AE: 'lǐ',
-    0x79AF: 'nóng',
-    0x79B0: 'mí,nǐ,xiǎn',
-    0x79B1: 'dǎo',
-    0x79B2: 'lì',
-    0x79B3: 'ráng',
-    0x79B4: 'yuè',
-    0x79B5: 'tí',
-    0x79B6: 'zàn',
-    0x79B7: 'lèi',
-    0x79B8: 'róu',
-    0x79B9: 'yǔ',
-    0x79BA: 'yú,yù',
-    0x79BB: 'lí,chī',
-    0x79BC: 'xiè',
-    0x79BD: 'qín',
-    0x79BE: 'hé',
-    0x79BF: 'tū',
-    0x79C0: 'xiù',
-    0x79C1: 'sī',
-    0x79C2: 'rén',
-    0x79C3: 'tū',
-    0x79C4: 'zǐ,zì',
-    0x79C5: 'chá,ná',
-    0x79C6: 'gǎn',
-    0x79C7: 'yì,zhí',
-    0x79C8: 'xiān',
-    0x79C9: 'bǐng',
-    0x79CA: 'nián',
-    0x79CB: 'qiū',
-    0x79CC: 'qiū',
-    0x79CD: 'zhǒng,chóng,zhòng',
-    0x79CE: 'fèn',
-    0x79CF: 'hào,mào',
-    0x79D0: 'yún',
-    0x79D1: 'kē,kè',
-    0x79D2: 'miǎo',
-    0x79D3: 'zhī',
-    0x79D4: 'jīng',
-    0x79D5: 'bǐ',
-    0x79D6: 'zhī',
-    0x79D7: 'yù',
-    0x79D8: 'mì,bì,bié',
-    0x79D9: 'kù',
-    0x79DA: 'bàn',
-    0x79DB: 'pī',
-    0x79DC: 'ní,nì',
-    0x79DD: 'lì',
-    0x79DE: 'yóu',
-    0x79DF: 'zū,jū',
-    0x79E0: 'pī',
-    0x79E1: 'bó',
-    0x79E2: 'líng',
-    0x79E3: 'mò',
-    0x79E4: 'chèng,chēng,píng',
-    0x79E5: 'nián',
-    0x79E6: 'qín',
-    0x79E7: 'yāng',
-    0x79E8: 'zuó',
-    0x79E9: 'zhì',
-    0x79EA: 'zhī',
-    0x79EB: 'shú',
-    0x79EC: 'jù',
-    0x79ED: 'zǐ',
-    0x79EE: 'huó',
-    0x79EF: 'jī,zhǐ',
-    0x79F0: 'chēng,chèn,chèng',
-    0x79F1: 'tóng',
-    0x79F2: 'zhì,shì',
-    0x79F3: 'huó,kuò',
-    0x79F4: 'hé,gé',
-    0x79F5: 'yīn',
-    0x79F6: 'zī',
-    0x79F7: 'zhì',
-    0x79F8: 'jiē,jí',
-    0x79F9: 'rěn',
-    0x79FA: 'dù',
-    0x79FB: 'yí,chǐ,yì',
-    0x79FC: 'zhū',
-    0x79FD: 'huì',
-    0x79FE: 'nóng',
-    0x79FF: 'fù,bū,pū',
-    0x7A00: 'xī',
-    0x7A01: 'gǎo',
-    0x7A02: 'láng',
-    0x7A03: 'fū',
-    0x7A04: 'xùn,zè',
-    0x7A05: 'shuì',
-    0x7A06: 'lǚ',
-    0x7A07: 'kǔn',
-    0x7A08: 'gǎn',
-    0x7A09: 'jīng',
-    0x7A0A: 'tí',
-    0x7A0B: 'chéng',
-    0x7A0C: 'tú,shǔ',
-    0x7A0D: 'shāo,shào',
-    0x7A0E: 'shuì,tuō,tuì,tuàn',
-    0x7A0F: 'yà',
-    0x7A10: 'lǔn',
-    0x7A11: 'lù',
-    0x7A12: 'gù',
-    0x7A13: 'zuó',
-    0x7A14: 'rěn',
-    0x7A15: 'zhùn,zhǔn',
-    0x7A16: 'bàng',
-    0x7A17: 'bài',
-    0x7A18: 'jī,qí',
-    0x7A19: 'zhī,zhì',
-    0x7A1A: 'zhì',
-    0x7A1B: 'kǔn',
-    0x7A1C: 'léng,lèng,líng',
-    0x7A1D: 'péng',
-    0x7A1E: 'kē,huà',
-    0x7A1F: 'bǐng,lǐn',
-    0x7A20: 'chóu,tiáo,diào',
-    0x7A21: 'zuì,zú,sū',
-    0x7A22: 'yù',
-    0x7A23: 'sū',
-    0x7A24: 'lüè',
-    0x7A25: 'xiāng',
-    0x7A26: 'yī',
-    0x7A27: 'xì,qiè',
-    0x7A28: 'biǎn',
-    0x7A29: 'jì',
-    0x7A2A: 'fú',
-    0x7A2B: 'pì,bì',
-    0x7A2C: 'nuò',
-    0x7A2D: 'jiē',
-    0x7A2E: 'zhǒng,chóng,zhòng',
-    0x7A2F: 'zōng,zǒng',
-    0x7A30: 'xǔ,xū',
-    0x7A31: 'chēng,chèn,chèng',
-    0x7A32: 'dào',
-    0x7A33: 'wěn',
-    0x7A34: 'xián,jiān,liàn,liǎn',
-    0x7A35: 'zī,jiū',
-    0x7A36: 'yù',
-    0x7A37: 'jì,zè',
-    0x7A38: 'xù',
-    0x7A39: 'zhěn,zhēn,biān',
-    0x7A3A: 'zhì',
-    0x7A3B: 'dào',
-    0x7A3C: 'jià',
-    0x7A3D: 'jī,qǐ',
-    0x7A3E: 'gǎo,kào,gào,jiào',
-    0x7A3F: 'gǎo',
-    0x7A40: 'gǔ',
-    0x7A41: 'róng',
-    0x7A42: 'suì',
-    0x7A43: 'rong',
-    0x7A44: 'jì',
-    0x7A45: 'kāng',
-    0x7A46: 'mù',
-    0x7A47: 'cǎn,shān,cēn',
-    0x7A48: 'méi,mén,mí',
-    0x7A49: 'zhì,chí,tí',
-    0x7A4A: 'jì',
-    0x7A4B: 'lù,jiū',
-    0x7A4C: 'sū',
-    0x7A4D: 'jī',
-    0x7A4E: 'yǐng',
-    0x7A4F: 'wěn',
-    0x7A50: 'qiū',
-    0x7A51: 'sè',
-    0x7A52: 'hè',
-    0x7A53: 'yì',
-    0x7A54: 'huáng',
-    0x7A55: 'qiè',
-    0x7A56: 'jǐ,jì',
-    0x7A57: 'suì',
-    0x7A58: 'xiāo,rào',
-    0x7A59: 'pú',
-    0x7A5A: 'jiāo',
-    0x7A5B: 'zhuō,bó',
-    0x7A5C: 'zhǒng,tóng,zhòng',
-    0x7A5D: 'zui',
-    0x7A5E: 'lǚ',
-    0x7A5F: 'suì',
-    0x7A60: 'nóng',
-    0x7A61: 'sè',
-    0x7A62: 'huì',
-    0x7A63: 'ráng',
-    0x7A64: 'nuò',
-    0x7A65: 'yù,yǔ',
-    0x7A66: 'pīn',
-    0x7A67: 'jì,zì',
-    0x7A68: 'tuí',
-    0x7A69: 'wěn',
-    0x7A6A: 'chēng,bié',
-    0x7A6B: 'huò,hù',
-    0x7A6C: 'kuàng',
-    0x7A6D: 'lǚ',
-    0x7A6E: 'biāo,pāo',
-    0x7A6F: 'sè',
-    0x7A70: 'ráng,rǎng,réng',
-    0x7A71: 'zhuō,jué',
-    0x7A72: 'lí',
-    0x7A73: 'cuán,zàn',
-    0x7A74: 'xué,jué',
-    0x7A75: 'wā,yà',
-    0x7A76: 'jiū,jiù',
-    0x7A77: 'qióng',
-    0x7A78: 'xī',
-    0x7A79: 'qióng,qiōng,kōng',
-    0x7A7A: 'kōng,kòng,kǒng',
-    0x7A7B: 'yū,yǔ',
-    0x7A7C: 'shēn',
-    0x7A7D: 'jǐng',
-    0x7A7E: 'yào,yǎo',
-    0x7A7F: 'chuān,chuàn,yuān',
-    0x7A80: 'zhūn,tún',
-    0x7A81: 'tū',
-    0x7A82: 'láo',
-    0x7A83: 'qiè',
-    0x7A84: 'zhǎi',
-    0x7A85: 'yǎo',
-    0x7A86: 'biǎn',
-    0x7A87: 'báo',
-    0x7A88: 'yǎo,yào',
-    0x7A89: 'bǐng',
-    0x7A8A: 'wā',
-    0x7A8B: 'zhú,kū',
-    0x7A8C: 'jiào,pào,liáo,liù',
-    0x7A8D: 'qiào',
-    0x7A8E: 'diào',
-    0x7A8F: 'wū',
-    0x7A90: 'guī,wā',
-    0x7A91: 'yáo',
-    0x7A92: 'zhì,dié',
-    0x7A93: 'chuāng',
-    0x7A94: 'yào,yǎo',
-    0x7A95: 'tiǎo,tiāo',
-    0x7A96: 'jiào,zào',
-    0x7A97: 'chuāng,cōng',
-    0x7A98: 'jiǒng',
-    0x7A99: 'xiāo',
-    0x7A9A: 'chéng',
-    0x7A9B: 'kòu',
-    0x7A9C: 'cuàn',
-    0x7A9D: 'wō',
-    0x7A9E: 'dàn',
-    0x7A9F: 'kū',
-    0x7AA0: 'kē',
-    0x7AA1: 'zhuó',
-    0x7AA2: 'xū',
-    0x7AA3: 'sū',
-    0x7AA4: 'guān',
-    0x7AA5: 'kuī',
-    0x7AA6: 'dòu',
-    0x7AA7: 'zhuo',
-    0x7AA8: 'xūn,yìn,yīn',
-    0x7AA9: 'wō',
-    0x7AAA: 'wā',
-    0x7AAB: 'yà,yē',
-    0x7AAC: 'yú,dōu',
-    0x7AAD: 'jù',
-    0x7AAE: 'qióng',
-    0x7AAF: 'yáo,yào,qiāo',
-    0x7AB0: 'yáo',
-    0x7AB1: 'tiǎo',
-    0x7AB2: 'cháo',
-    0x7AB3: 'yǔ,yú',
-    0x7AB4: 'tián',
-    0x7AB5: 'diào',
-    0x7AB6: 'jù,lóu',
-    0x7AB7: 'liào',
-    0x7AB8: 'xī',
-    0x7AB9: 'wù',
-    0x7ABA: 'kuī,kuǐ',
-    0x7ABB: 'chuāng',
-    0x7ABC: 'zhāo,kē',
-    0x7ABD: 'kuǎn',
-    0x7ABE: 'kuǎn,cuàn',
-    0x7ABF: 'lóng',
-    0x7AC0: 'chēng,chèng',
-    0x7AC1: 'cuì',
-    0x7AC2: 'liáo',
-    0x7AC3: 'zào',
-    0x7AC4: 'cuàn,cuān',
-    0x7AC5: 'qiào',
-    0x7AC6: 'qióng',
-    0x7AC7: 'dòu,dú',
-    0x7AC8: 'zào',
-    0x7AC9: 'lǒng',
-    0x7ACA: 'qiè',
-    0x7ACB: 'lì,wèi',
-    0x7ACC: 'chù',
-    0x7ACD: 'shí',
-    0x7ACE: 'fù',
-    0x7ACF: 'qiān',
-    0x7AD0: 'chù',
-    0x7AD1: 'hóng',
-    0x7AD2: 'qí',
-    0x7AD3: 'háo',
-    0x7AD4: 'shēng',
-    0x7AD5: 'fēn',
-    0x7AD6: 'shù',
-    0x7AD7: 'miào',
-    0x7AD8: 'qǔ,kǒu',
-    0x7AD9: 'zhàn,zhān',
-    0x7ADA: 'zhù',
-    0x7ADB: 'líng',
-    0x7ADC: 'lóng,néng',
-    0x7ADD: 'bìng',
-    0x7ADE: 'jìng',
-    0x7ADF: 'jìng',
-    0x7AE0: 'zhāng,zhàng',
-    0x7AE1: 'bǎi',
-    0x7AE2: 'sì',
-    0x7AE3: 'jùn',
-    0x7AE4: 'hóng',
-    0x7AE5: 'tóng,zhōng',
-    0x7AE6: 'sǒng',
-    0x7AE7: 'jìng,zhěn',
-    0x7AE8: 'diào',
-    0x7AE9: 'yì',
-    0x7AEA: 'shù',
-    0x7AEB: 'jìng',
-    0x7AEC: 'qǔ',
-    0x7AED: 'jié',
-    0x7AEE: 'pīng',
-    0x7AEF: 'duān',
-    0x7AF0: 'lí',
-    0x7AF1: 'zhuǎn',
-    0x7AF2: 'céng',
-    0x7AF3: 'dēng',
-    0x7AF4: 'cūn',
-    0x7AF5: 'wāi,huā',
-    0x7AF6: 'jìng',
-    0x7AF7: 'kǎn,kàn',
-    0x7AF8: 'jìng',
-    0x7AF9: 'zhú',
-    0x7AFA: 'zhú,dǔ',
-    0x7AFB: 'lè,jīn',
-    0x7AFC: 'péng',
-    0x7AFD: 'yú',
-    0x7AFE: 'chí',
-    0x7AFF: 'gān,gàn,gǎn',
-    0x7B00: 'máng',
-    0x7B01: 'zhú',
-    0x7B02: 'wán',
-    0x7B03: 'dǔ',
-    0x7B04: 'jī',
-    0x7B05: 'jiǎo',
-    0x7B06: 'bā',
-    0x7B07: 'suàn',
-    0x7B08: 'jí',
-    0x7B09: 'qǐn',
-    0x7B0A: 'zhào',
-    0x7B0B: 'sǔn',
-    0x7B0C: 'yá',
-    0x7B0D: 'zhuì,ruì',
-    0x7B0E: 'yuán',
-    0x7B0F: 'hù,wěn,wù',
-    0x7B10: 'háng,hàng',
-    0x7B11: 'xiào',
-    0x7B12: 'cén,jìn,hán',
-    0x7B13: 'bì,pí,bī',
-    0x7B14: 'bǐ',
-    0x7B15: 'jiǎn',
-    0x7B16: 'yǐ',
-    0x7B17: 'dōng',
-    0x7B18: 'shān',
-    0x7B19: 'shēng',
-    0x7B1A: 'dā,xiá,nà',
-    0x7B1B: 'dí',
-    0x7B1C: 'zhú',
-    0x7B1D: 'nà',
-    0x7B1E: 'chī',
-    0x7B1F: 'gū',
-    0x7B20: 'lì',
-    0x7B21: 'qiè',
-    0x7B22: 'mǐn',
-    0x7B23: 'bāo',
-    0x7B24: 'tiáo,shào',
-    0x7B25: 'sì',
-    0x7B26: 'fú',
-    0x7B27: 'cè,shàn',
-    0x7B28: 'bèn',
-    0x7B29: 'fá',
-    0x7B2A: 'dá',
-    0x7B2B: 'zǐ',
-    0x7B2C: 'dì',
-    0x7B2D: 'líng',
-    0x7B2E: 'zé,zuó,zhà',
-    0x7B2F: 'nú',
-    0x7B30: 'fú,fèi',
-    0x7B31: 'gǒu',
-    0x7B32: 'fán',
-    0x7B33: 'jiā',
-    0x7B34: 'gǎn',
-    0x7B35: 'fàn',
-    0x7B36: 'shǐ',
-    0x7B37: 'mǎo',
-    0x7B38: 'pǒ',
-    0x7B39: 'ti',
-    0x7B3A: 'jiān',
-    0x7B3B: 'qióng',
-    0x7B3C: 'lóng,lǒng',
-    0x7B3D: 'mǐn',
-    0x7B3E: 'biān',
-    0x7B3F: 'luò',
-    0x7B40: 'guì',
-    0x7B41: 'qū',
-    0x7B42: 'chí',
-    0x7B43: 'yīn',
-    0x7B44: 'yào',
-    0x7B45: 'xiǎn',
-    0x7B46: 'bǐ',
-    0x7B47: 'qióng',
-    0x7B48: 'kuò',
-    0x7B49: 'děng',
-    0x7B4A: 'xiáo,jiǎo,jiào',
-    0x7B4B: 'jīn,qián',
-    0x7B4C: 'quán',
-    0x7B4D: 'sǔn,yún,xùn',
-    0x7B4E: 'rú',
-    0x7B4F: 'fá',
-    0x7B50: 'kuāng',
-    0x7B51: 'zhù,zhú',
-    0x7B52: 'tǒng,dòng,tóng',
-    0x7B53: 'jī',
-    0x7B54: 'dá,dā',
-    0x7B55: 'háng',
-    0x7B56: 'cè',
-    0x7B57: 'zhòng',
-    0x7B58: 'kòu',
-    0x7B59: 'lái',
-    0x7B5A: 'bì',
-    0x7B5B: 'shāi',
-    0x7B5C: 'dāng',
-    0x7B5D: 'zhēng',
-    0x7B5E: 'cè',
-    0x7B5F: 'fū',
-    0x7B60: 'yún,jūn',
-    0x7B61: 'tú',
-    0x7B62: 'pá',
-    0x7B63: 'lí',
-    0x7B64: 'láng,làng',
-    0x7B65: 'jǔ',
-    0x7B66: 'guǎn',
-    0x7B67: 'jiǎn,xiàn',
-    0x7B68: 'hán',
-    0x7B69: 'tóng,tǒng,yǒng,dòng',
-    0x7B6A: 'xiá',
-    0x7B6B: 'zhì,zhǐ',
-    0x7B6C: 'chéng',
-    0x7B6D: 'suàn',
-    0x7B6E: 'shì',
-    0x7B6F: 'zhù',
-    0x7B70: 'zuó',
-    0x7B71: 'xiǎo',
-    0x7B72: 'shāo',
-    0x7B73: 'tíng',
-    0x7B74: 'cè,jiā,jiá',
-    0x7B75: 'yán',
-    0x7B76: 'gào,gǎo',
-    0x7B77: 'kuài',
-    0x7B78: 'gān',
-    0x7B79: 'chóu',
-    0x7B7A: 'kuāng',
-    0x7B7B: 'gàng',
-    0x7B7C: 'yún',
-    0x7B7D: 'o',
-    0x7B7E: 'qiān',
-    0x7B7F: 'xiǎo',
-    0x7B80: 'jiǎn',
-    0x7B81: 'póu,bù,fú,pú',
-    0x7B82: 'lái',
-    0x7B83: 'zōu',
-    0x7B84: 'bǐ,bēi,bī,bì,pái',
-    0x7B85: 'bì',
-    0x7B86: 'bì',
-    0x7B87: 'gè',
-    0x7B88: 'tái,chí',
-    0x7B89: 'guǎi,dài',
-    0x7B8A: 'yū',
-    0x7B8B: 'jiān',
-    0x7B8C: 'dào,zhào',
-    0x7B8D: 'gū',
-    0x7B8E: 'chí,hǔ',
-    0x7B8F: 'zhēng',
-    0x7B90: 'qìng,jīng,qiāng',
-    0x7B91: 'shà,zhá',
-    0x7B92: 'zhǒu',
-    0x7B93: 'lù',
-    0x7B94: 'bó',
-    0x7B95: 'jī',
-    0x7B96: 'lín,lǐn',
-    0x7B97: 'suàn',
-    0x7B98: 'jùn,qūn',
-    0x7B99: 'fú',
-    0x7B9A: 'zhá',
-    0x7B9B: 'gū',
-    0x7B9C: 'kōng',
-    0x7B9D: 'qián',
-    0x7B9E: 'qiān',
-    0x7B9F: 'jùn',
-    0x7BA0: 'chuí,zhuī',
-    0x7BA1: 'guǎn',
-    0x7BA2: 'yuān,wǎn',
-    0x7BA3: 'cè',
-    0x7BA4: 'zú',
-    0x7BA5: 'bǒ',
-    0x7BA6: 'zé',
-    0x7BA7: 'qiè',
-    0x7BA8: 'tuò',
-    0x7BA9: 'luó',
-    0x7BAA: 'dān',
-    0x7BAB: 'xiāo',
-    0x7BAC: 'ruò,nà',
-    0x7BAD: 'jiàn',
-    0x7BAE: 'xuān',
-    0x7BAF: 'biān',
-    0x7BB0: 'sǔn',
-    0x7BB1: 'xiāng',
-    0x7BB2: 'xiǎn',
-    0x7BB3: 'píng',
-    0x7BB4: 'zhēn,jiǎn',
-    0x7BB5: 'xīng,xǐng,shěng',
-    0x7BB6: 'hú',
-    0x7BB7: 'yí,shī',
-    0x7BB8: 'zhù,zhuó',
-    0x7BB9: 'yuē,yào,chuò',
-    0x7BBA: 'chūn',
-    0x7BBB: 'lǜ',
-    0x7BBC: 'wū',
-    0x7BBD: 'dǒng',
-    0x7BBE: 'shuò,xiāo,qiào',
-    0x7BBF: 'jí',
-    0x7BC0: 'jié,jiē',
-    0x7BC1: 'huáng',
-    0x7BC2: 'xīng',
-    0x7BC3: 'mèi',
-    0x7BC4: 'fàn',
-    0x7BC5: 'chuán,duān',
-    0x7BC6: 'zhuàn',
-    0x7BC7: 'piān',
-    0x7BC8: 'fēng',
-    0x7BC9: 'zhù,zhú',
-    0x7BCA: 'huáng,hóng',
-    0x7BCB: 'qiè',
-    0x7BCC: 'hóu',
-    0x7BCD: 'qiū',
-    0x7BCE: 'miǎo',
-    0x7BCF: 'qiàn',
-    0x7BD0: 'gū',
-    0x7BD1: 'kuì',
-    0x7BD2: 'shi',
-    0x7BD3: 'lǒu',
-    0x7BD4: 'yún,xūn',
-    0x7BD5: 'hé',
-    0x7BD6: 'táng',
-    0x7BD7: 'yuè',
-    0x7BD8: 'chōu',
-    0x7BD9: 'gāo',
-    0x7BDA: 'fěi',
-    0x7BDB: 'ruò',
-    0x7BDC: 'zhēng',
-    0x7BDD: 'gōu',
-    0x7BDE: 'niè',
-    0x7BDF: 'qiàn',
-    0x7BE0: 'xiǎo',
-    0x7BE1: 'cuàn',
-    0x7BE2: 'lǒng,gōng,gǎn',
-    0x7BE3: 'péng,páng',
-    0x7BE4: 'dǔ',
-    0x7BE5: 'lì',
-    0x7BE6: 'bì,pí',
-    0x7BE7: 'zhuó,huò',
-    0x7BE8: 'chú',
-    0x7BE9: 'shāi,shī',
-    0x7BEA: 'chí',
-    0x7BEB: 'zhù',
-    0x7BEC: 'qiāng,cāng',
-    0x7BED: 'lóng',
-    0x7BEE: 'lán',
-    0x7BEF: 'jiān',
-    0x7BF0: 'bù',
-    0x7BF1: 'lí',
-    0x7BF2: 'huì,suì',
-    0x7BF3: 'bì',
-    0x7BF4: 'dí,zhú',
-    0x7BF5: 'cōng',
-    0x7BF6: 'yān',
-    0x7BF7: 'péng',
-    0x7BF8: 'cǎn,cēn,zān',
-    0x7BF9: 'zhuàn,suǎn,zuǎn',
-    0x7BFA: 'pí',
-    0x7BFB: 'piǎo,biāo',
-    0x7BFC: 'dōu',
-    0x7BFD: 'yù',
-    0x7BFE: 'miè',
-    0x7BFF: 'tuán,zhuān',
-    0x7C00: 'zé,zhài',
-    0x7C01: 'shāi',
-    0x7C02: 'guì,guó',
-    0x7C03: 'yí',
-    0x7C04: 'hù',
-    0x7C05: 'chǎn',
-    0x7C06: 'kòu',
-    0x7C07: 'cù,chuò,còu',
-    0x7C08: 'píng',
-    0x7C09: 'zào,chòu',
-    0x7C0A: 'jī',
-    0x7C0B: 'guǐ',
-    0x7C0C: 'sù',
-    0x7C0D: 'lǒu,lǚ,jù',
-    0x7C0E: 'cè,jí',
-    0x7C0F: 'lù',
-    0x7C10: 'niǎn',
-    0x7C11: 'suō',
-    0x7C12: 'cuàn',
-    0x7C13: 'diāo',
-    0x7C14: 'suō',
-    0x7C15: 'lè',
-    0x7C16: 'duàn',
-    0x7C17: 'zhù',
-    0x7C18: 'xiāo',
-    0x7C19: 'bó',
-    0x7C1A: 'mì',
-    0x7C1B: 'shāi,sī',
-    0x7C1C: 'dàng,tāng',
-    0x7C1D: 'liáo',
-    0x7C1E: 'dān',
-    0x7C1F: 'diàn',
-    0x7C20: 'fǔ',
-    0x7C21: 'jiǎn',
-    0x7C22: 'mǐn',
-    0x7C23: 'kuì',
-    0x7C24: 'dài',
-    0x7C25: 'jiāo',
-    0x7C26: 'dēng',
-    0x7C27: 'huáng',
-    0x7C28: 'sǔn,zhuàn',
-    0x7C29: 'láo',
-    0x7C2A: 'zān,zǎn',
-    0x7C2B: 'xiāo,xiǎo',
-    0x7C2C: 'lù',
-    0x7C2D: 'shì',
-    0x7C2E: 'zān',
-    0x7C2F: 'qi',
-    0x7C30: 'pái',
-    0x7C31: 'qí',
-    0x7C32: 'pái',
-    0x7C33: 'gǎn,gàn',
-    0x7C34: 'jù',
-    0x7C35: 'lù',
-    0x7C36: 'lù',
-    0x7C37: 'yán',
-    0x7C38: 'bǒ,bò',
-    0x7C39: 'dāng',
-    0x7C3A: 'sài',
-    0x7C3B: 'zhuā,kē',
-    0x7C3C: 'gōu',
-    0x7C3D: 'qiān',
-    0x7C3E: 'lián',
-    0x7C3F: 'bù,bó',
-    0x7C40: 'zhòu',
-    0x7C41: 'lài',
-    0x7C42: 'shi',
-    0x7C43: 'lán',
-    0x7C44: 'kuì',
-    0x7C45: 'yú',
-    0x7C46: 'yuè',
-    0x7C47: 'háo',
-    0x7C48: 'zhēn,jiān',
-    0x7C49: 'tái',
-    0x7C4A: 'tì',
-    0x7C4B: 'niè,mí',
-    0x7C4C: 'chóu,táo',
-    0x7C4D: 'jí,jiè',
-    0x7C4E: 'yí',
-    0x7C4F: 'qí',
-    0x7C50: 'téng',
-    0x7C51: 'zhuàn,zuǎn',
-    0x7C52: 'zhòu',
-    0x7C53: 'fān,bān,pān',
-    0x7C54: 'sǒu,shǔ',
-    0x7C55: 'zhòu',
-    0x7C56: 'qian',
-    0x7C57: 'zhuó',
-    0x7C58: 'téng',
-    0x7C59: 'lù',
-    0x7C5A: 'lú',
-    0x7C5B: 'jiǎn,jiān',
-    0x7C5C: 'tuò',
-    0x7C5D: 'yíng',
-    0x7C5E: 'yù',
-    0x7C5F: 'lài',
-    0x7C60: 'lóng,lǒng',
-    0x7C61: 'qiè',
-    0x7C62: 'lián',
-    0x7C63: 'lán',
-    0x7C64: 'qiān',
-    0x7C65: 'yuè',
-    0x7C66: 'zhōng',
-    0x7C67: 'qú,jǔ',
-    0x7C68: 'lián',
-    0x7C69: 'biān',
-    0x7C6A: 'duàn',
-    0x7C6B: 'zuǎn',
-    0x7C6C: 'lí',
-    0x7C6D: 'sī',
-    0x7C6E: 'luó',
-    0x7C6F: 'yíng',
-    0x7C70: 'yuè',
-    0x7C71: 'zhuó',
-    0x7C72: 'yù',
-    0x7C73: 'mǐ',
-    0x7C74: 'dí,zá',
-    0x7C75: 'fán',
-    0x7C76: 'shēn',
-    0x7C77: 'zhé',
-    0x7C78: 'shēn',
-    0x7C79: 'nǚ',
-    0x7C7A: 'hé',
-    0x7C7B: 'lèi',
-    0x7C7C: 'xiān',
-    0x7C7D: 'zǐ',
-    0x7C7E: 'ní',
-    0x7C7F: 'cùn',
-    0x7C80: 'zhàng',
-    0x7C81: 'qiān',
-    0x7C82: 'zhāi',
-    0x7C83: 'bǐ,pī',
-    0x7C84: 'bǎn',
-    0x7C85: 'wù',
-    0x7C86: 'shā,chǎo',
-    0x7C87: 'kāng,jīng',
-    0x7C88: 'róu',
-    0x7C89: 'fěn',
-    0x7C8A: 'bì',
-    0x7C8B: 'cuì',
-    0x7C8C: 'yin',
-    0x7C8D: 'zhé',
-    0x7C8E: 'mǐ',
-    0x7C8F: 'tai',
-    0x7C90: 'hù',
-    0x7C91: 'bā',
-    0x7C92: 'lì',
-    0x7C93: 'gān',
-    0x7C94: 'jù',
-    0x7C95: 'pò',
-    0x7C96: 'mò',
-    0x7C97: 'cū',
-    0x7C98: 'zhān,nián',
-    0x7C99: 'zhòu',
-    0x7C9A: 'chī',
-    0x7C9B: 'sù',
-    0x7C9C: 'tiào',
-    0x7C9D: 'lì',
-    0x7C9E: 'xī',
-    0x7C9F: 'sù',
-    0x7CA0: 'hóng',
-    0x7CA1: 'tóng',
-    0x7CA2: 'zī,cí,jì',
-    0x7CA3: 'cè,sè',
-    0x7CA4: 'yuè',
-    0x7CA5: 'zhōu,yù',
-    0x7CA6: 'lín',
-    0x7CA7: 'zhuāng',
-    0x7CA8: 'bǎi',
-    0x7CA9: 'lāo',
-    0x7CAA: 'fèn',
-    0x7CAB: 'ér',
-    0x7CAC: 'qū',
-    0x7CAD: 'hé',
-    0x7CAE: 'liáng',
-    0x7CAF: 'xiàn',
-    0x7CB0: 'fú,fū',
-    0x7CB1: 'liáng',
-    0x7CB2: 'càn',
-    0x7CB3: 'jīng',
-    0x7CB4: 'lǐ',
-    0x7CB5: 'yuè',
-    0x7CB6: 'lù',
-    0x7CB7: 'jú',
-    0x7CB8: 'qí',
-    0x7CB9: 'cuì,suì',
-    0x7CBA: 'bài',
-    0x7CBB: 'zhāng',
-    0x7CBC: 'lín,lǐn',
-    0x7CBD: 'zòng',
-    0x7CBE: 'jīng,qíng,jìng',
-    0x7CBF: 'guǒ,huà',
-    0x7CC0: 'huā',
-    0x7CC1: 'sǎn,shēn',
-    0x7CC2: 'sǎn',
-    0x7CC3: 'táng',
-    0x7CC4: 'biǎn,biān',
-    0x7CC5: 'róu',
-    0x7CC6: 'miàn',
-    0x7CC7: 'hóu',
-    0x7CC8: 'xǔ',
-    0x7CC9: 'zòng',
-    0x7CCA: 'hú,hū,hù',
-    0x7CCB: 'jiàn',
-    0x7CCC: 'zān',
-    0x7CCD: 'cí',
-    0x7CCE: 'lí',
-    0x7CCF: 'xiè',
-    0x7CD0: 'fū',
-    0x7CD1: 'nuò',
-    0x7CD2: 'bèi',
-    0x7CD3: 'gǔ',
-    0x7CD4: 'xiǔ',
-    0x7CD5: 'gāo',
-    0x7CD6: 'táng',
-    0x7CD7: 'qiǔ',
-    0x7CD8: 'jiā',
-    0x7CD9: 'cāo',
-    0x7CDA: 'zhuāng',
-    0x7CDB: 'táng',
-    0x7CDC: 'mí,méi',
-    0x7CDD: 'sǎn,sān,shēn',
-    0x7CDE: 'fèn',
-    0x7CDF: 'zāo',
-    0x7CE0: 'kāng',
-    0x7CE1: 'jiàng',
-    0x7CE2: 'mó',
-    0x7CE3: 'sǎn',
-    0x7CE4: 'sǎn',
-    0x7CE5: 'nuò',
-    0x7CE6: 'xī',
-    0x7CE7: 'liáng',
-    0x7CE8: 'jiàng,jiāng',
-    0x7CE9: 'kuài',
-    0x7CEA: 'bò',
-    0x7CEB: 'huán',
-    0x7CEC: 'shǔ',
-    0x7CED: 'zòng',
-    0x7CEE: 'xiàn',
-    0x7CEF: 'nuò',
-    0x7CF0: 'tuán',
-    0x7CF1: 'niè',
-    0x7CF2: 'lì',
-    0x7CF3: 'zuò',
-    0x7CF4: 'dí',
-    0x7CF5: 'niè',
-    0x7CF6: 'tiào,diào',
-    0x7CF7: 'làn',
-    0x7CF8: 'mì,sī',
-    0x7CF9: 'sī',
-    0x7CFA: 'jiū,jiǔ',
-    0x7CFB: 'xì,jì',
-    0x7CFC: 'gōng',
-    0x7CFD: 'zhěng,zhēng',
-    0x7CFE: 'jiū,jiǎo',
-    0x7CFF: 'yòu',
-    0x7D00: 'jì,jǐ',
-    0x7D01: 'chà',
-    0x7D02: 'zhòu',
-    0x7D03: 'xún',
-    0x7D04: 'yuē,yāo,yào,dì',
-    0x7D05: 'hóng,gōng,jiàng',
-    0x7D06: 'yū,ōu',
-    0x7D07: 'hé,gē,jié',
-    0x7D08: 'wán',
-    0x7D09: 'rèn',
-    0x7D0A: 'wěn,wèn',
-    0x7D0B: 'wén,wèn',
-    0x7D0C: 'qiú',
-    0x7D0D: 'nà',
-    0x7D0E: 'zī',
-    0x7D0F: 'tǒu',
-    0x7D10: 'niǔ',
-    0x7D11: 'fóu',
-    0x7D12: 'jì,jié,jiè',
-    0x7D13: 'shū',
-    0x7D14: 'chún,zhǔn,tún,quán,zī,zhūn',
-    0x7D15: 'pī,pí,bǐ,bī,bì,chǐ',
-    0x7D16: 'zhèn',
-    0x7D17: 'shā,miǎo',
-    0x7D18: 'hóng',
-    0x7D19: 'zhǐ',
-    0x7D1A: 'jí',
-    0x7D1B: 'fēn',
-    0x7D1C: 'yún',
-    0x7D1D: 'rèn',
-    0x7D1E: 'dǎn',
-    0x7D1F: 'jīn,jìn',
-    0x7D20: 'sù',
-    0x7D21: 'fǎng,bǎng,fàng',
-    0x7D22: 'suǒ',
-    0x7D23: 'cuì',
-    0x7D24: 'jiǔ',
-    0x7D25: 'zā,zhā',
-    0x7D26: 'ba',
-    0x7D27: 'jǐn',
-    0x7D28: 'fū,fù',
-    0x7D29: 'zhì',
-    0x7D2A: 'qī',
-    0x7D2B: 'zǐ',
-    0x7D2C: 'chóu,chōu,zhòu',
-    0x7D2D: 'hóng',
-    0x7D2E: 'zā,zhā',
-    0x7D2F: 'lèi,léi,lěi,lǜ,liè',
-    0x7D30: 'xì',
-    0x7D31: 'fú',
-    0x7D32: 'xiè,yì',
-    0x7D33: 'shēn',
-    0x7D34: 'bō,bì',
-    0x7D35: 'zhù,shū',
-    0x7D36: 'qū,qǔ',
-    0x7D37: 'líng',
-    0x7D38: 'zhù',
-    0x7D39: 'shào,chāo',
-    0x7D3A: 'gàn',
-    0x7D3B: 'yǎng',
-    0x7D3C: 'fú,fèi',
-    0x7D3D: 'tuó',
-    0x7D3E: 'zhěn,tiǎn,jǐn',
-    0x7D3F: 'dài',
-    0x7D40: 'chù',
-    0x7D41: 'shī',
-    0x7D42: 'zhōng',
-    0x7D43: 'xián,xuàn',
-    0x7D44: 'zǔ,qū',
-    0x7D45: 'jiōng,jiǒng',
-    0x7D46: 'bàn',
-    0x7D47: 'qú',
-    0x7D48: 'mò',
-    0x7D49: 'shù',
-    0x7D4A: 'zuì',
-    0x7D4B: 'kuàng',
-    0x7D4C: 'jīng',
-    0x7D4D: 'rèn',
-    0x7D4E: 'háng',
-    0x7D4F: 'xiè,yì',
-    0x7D50: 'jié,jì,jiē',
-    0x7D51: 'zhū',
-    0x7D52: 'chóu',
-    0x7D53: 'guà,kuā',
-    0x7D54: 'bǎi,mò',
-    0x7D55: 'jué',
-    0x7D56: 'kuàng',
-    0x7D57: 'hú',
-    0x7D58: 'cì',
-    0x7D59: 'huán,gēng',
-    0x7D5A: 'gēng',
-    0x7D5B: 'tāo',
-    0x7D5C: 'jié,xié,qià,jiá,qì',
-    0x7D5D: 'kù',
-    0x7D5E: 'jiǎo,xiáo,jiào',
-    0x7D5F: 'quán',
-    0x7D60: 'gǎi,ǎi',
-    0x7D61: 'luò,lào',
-    0x7D62: 'xuàn,xún',
-    0x7D63: 'bēng,bīng,pēng',
-    0x7D64: 'xiàn',
-    0x7D65: 'fú',
-    0x7D66: 'gěi,jǐ,xiá',
-    0x7D67: 'dòng,tóng,tōng',
-    0x7D68: 'róng',
-    0x7D69: 'tiào,diào,dào',
-    0x7D6A: 'yīn',
-    0x7D6B: 'lěi',
-    0x7D6C: 'xiè',
-    0x7D6D: 'juàn',
-    0x7D6E: 'xù,chù,nǜ,nà',
-    0x7D6F: 'gāi,hài',
-    0x7D70: 'dié',
-    0x7D71: 'tǒng',
-    0x7D72: 'sī',
-    0x7D73: 'jiàng',
-    0x7D74: 'xiáng',
-    0x7D75: 'huì',
-    0x7D76: 'jué',
-    0x7D77: 'zhí',
-    0x7D78: 'jiǎn',
-    0x7D79: 'juàn,xuàn',
-    0x7D7A: 'chī,zhǐ',
-    0x7D7B: 'miǎn,wèn,mán,wàn',
-    0x7D7C: 'zhèn',
-    0x7D7D: 'lǚ',
-    0x7D7E: 'chéng',
-    0x7D7F: 'qiú',
-    0x7D80: 'shū',
-    0x7D81: 'bǎng',
-    0x7D82: 'tǒng',
-    0x7D83: 'xiāo,shāo',
-    0x7D84: 'huán,huàn,wàn',
-    0x7D85: 'qīn,xiān',
-    0x7D86: 'gěng,bǐng',
-    0x7D87: 'xiǔ',
-    0x7D88: 'tí,tì',
-    0x7D89: 'tòu,xiù',
-    0x7D8A: 'xié',
-    0x7D8B: 'hóng',
-    0x7D8C: 'xì',
-    0x7D8D: 'fú',
-    0x7D8E: 'tīng',
-    0x7D8F: 'suī,suí,shuāi,ruí,tuǒ',
-    0x7D90: 'duì',
-    0x7D91: 'kǔn',
-    0x7D92: 'fū',
-    0x7D93: 'jīng,jìng',
-    0x7D94: 'hù',
-    0x7D95: 'zhī',
-    0x7D96: 'yán,xiàn',
-    0x7D97: 'jiǒng',
-    0x7D98: 'féng',
-    0x7D99: 'jì',
-    0x7D9A: 'xù',
-    0x7D9B: 'rěn',
-    0x7D9C: 'zōng,zèng,zòng',
-    0x7D9D: 'chēn,shēn,lín',
-    0x7D9E: 'duǒ',
-    0x7D9F: 'lì,liè',
-    0x7DA0: 'lǜ',
-    0x7DA1: 'liáng',
-    0x7DA2: 'chóu,tāo,diào',
-    0x7DA3: 'quǎn',
-    0x7DA4: 'shào',
-    0x7DA5: 'qí',
-    0x7DA6: 'qí,qì',
-    0x7DA7: 'zhǔn,zhùn',
-    0x7DA8: 'qí',
-    0x7DA9: 'wǎn',
-    0x7DAA: 'qiàn,qīng,zhēng',
-    0x7DAB: 'xiàn',
-    0x7DAC: 'shòu',
-    0x7DAD: 'wéi,yí',
-    0x7DAE: 'qǐ,qìng,qǐng',
-    0x7DAF: 'táo',
-    0x7DB0: 'wǎn',
-    0x7DB1: 'gāng',
-    0x7DB2: 'wǎng',
-    0x7DB3: 'bēng',
-    0x7DB4: 'zhuì,chuò',
-    0x7DB5: 'cǎi',
-    0x7DB6: 'guǒ',
-    0x7DB7: 'cuì,zú',
-    0x7DB8: 'lún,guān',
-    0x7DB9: 'liǔ',
-    0x7DBA: 'qǐ,yǐ',
-    0x7DBB: 'zhàn',
-    0x7DBC: 'bì',
-    0x7DBD: 'chuò,chāo',
-    0x7DBE: 'líng',
-    0x7DBF: 'mián',
-    0x7DC0: 'qī',
-    0x7DC1: 'qiè',
-    0x7DC2: 'tián,tǎn,chān',
-    0x7DC3: 'zōng',
-    0x7DC4: 'gǔn,hùn,hún',
-    0x7DC5: 'zōu',
-    0x7DC6: 'xī',
-    0x7DC7: 'zī',
-    0x7DC8: 'xìng',
-    0x7DC9: 'liǎng',
-    0x7DCA: 'jǐn',
-    0x7DCB: 'fēi',
-    0x7DCC: 'ruí',
-    0x7DCD: 'mín',
-    0x7DCE: 'yù',
-    0x7DCF: 'zǒng,cōng',
-    0x7DD0: 'fán',
-    0x7DD1: 'lǜ,lù',
-    0x7DD2: 'xù',
-    0x7DD3: 'yīng',
-    0x7DD4: 'shàng',
-    0x7DD5: 'qi',
-    0x7DD6: 'xù',
-    0x7DD7: 'xiāng',
-    0x7DD8: 'jiān',
-    0x7DD9: 'kè',
-    0x7DDA: 'xiàn',
-    0x7DDB: 'ruǎn,ruàn',
-    0x7DDC: 'mián',
-    0x7DDD: 'jī,qì,qī,jí',
-    0x7DDE: 'duàn',
-    0x7DDF: 'chóng,zhòng',
-    0x7DE0: 'dì',
-    0x7DE1: 'mín,mǐn,mián,hún',
-    0x7DE2: 'miáo,máo',
-    0x7DE3: 'yuán,yuàn',
-    0x7DE4: 'xiè,yè',
-    0x7DE5: 'bǎo',
-    0x7DE6: 'sī',
-    0x7DE7: 'qiū',
-    0x7DE8: 'biān,biǎn,biàn',
-    0x7DE9: 'huǎn',
-    0x7DEA: 'gēng,gèng',
-    0x7DEB: 'cōng',
-    0x7DEC: 'miǎn',
-    0x7DED: 'wèi',
-    0x7DEE: 'fù',
-    0x7DEF: 'wěi',
-    0x7DF0: 'tóu,xū,yú',
-    0x7DF1: 'gōu',
-    0x7DF2: 'miǎo',
-    0x7DF3: 'xié',
-    0x7DF4: 'liàn',
-    0x7DF5: 'zōng,zòng',
-    0x7DF6: 'biàn,pián,biǎn',
-    0x7DF7: 'yùn,gǔn',
-    0x7DF8: 'yīn',
-    0x7DF9: 'tí',
-    0x7DFA: 'guā',
-    0x7DFB: 'zhì',
-    0x7DFC: 'yùn,wēn',
-    0x7DFD: 'chēng',
-    0x7DFE: 'chán',
-    0x7DFF: 'dài',
-    0x7E00: 'xiá',
-    0x7E01: 'yuán',
-    0x7E02: 'zǒng',
-    0x7E03: 'xū',
-    0x7E04: 'shéng',
-    0x7E05: 'wēi',
-    0x7E06: 'gēng',
-    0x7E07: 'xuān',
-    0x7E08: 'yíng',
-    0x7E09: 'jìn',
-    0x7E0A: 'yì',
-    0x7E0B: 'zhuì',
-    0x7E0C: 'nì',
-    0x7E0D: 'bāng,bàng',
-    0x7E0E: 'gǔ,hú',
-    0x7E0F: 'pán',
-    0x7E10: 'zhòu,chào,cù,zhōu',
-    0x7E11: 'jiān',
-    0x7E12: 'cī,cuò,suǒ',
-    0x7E13: 'quán',
-    0x7E14: 'shuǎng',
-    0x7E15: 'yùn',
-    0x7E16: 'xiá',
-    0x7E17: 'cuī,suī,shuāi',
-    0x7E18: 'xī',
-    0x7E19: 'róng,rǒng,ròng',
-    0x7E1A: 'tāo',
-    0x7E1B: 'fù',
-    0x7E1C: 'yún',
-    0x7E1D: 'chēn,zhěn',
-    0x7E1E: 'gǎo',
-    0x7E1F: 'rù,rǒng',
-    0x7E20: 'hú',
-    0x7E21: 'zài,zēng',
-    0x7E22: 'téng',
-    0x7E23: 'xiàn,xuán',
-    0x7E24: 'sù',
-    0x7E25: 'zhěn',
-    0x7E26: 'zòng',
-    0x7E27: 'tāo',
-    0x7E28: 'huǎng',
-    0x7E29: 'cài',
-    0x7E2A: 'bì',
-    0x7E2B: 'fèng,féng',
-    0x7E2C: 'cù',
-    0x7E2D: 'lí',
-    0x7E2E: 'suō,sù',
-    0x7E2F: 'yǎn,yǐn',
-    0x7E30: 'xǐ',
-    0x7E31: 'zòng,cóng,zǒng',
-    0x7E32: 'léi',
-    0x7E33: 'juàn,zhuàn',
-    0x7E34: 'qiàn,qiān',
-    0x7E35: 'màn',
-    0x7E36: 'zhí',
-    0x7E37: 'lǚ',
-    0x7E38: 'mù,mò',
-    0x7E39: 'piǎo,piāo',
-    0x7E3A: 'lián',
-    0x7E3B: 'mí',
-    0x7E3C: 'xuàn',
-    0x7E3D: 'zǒng,zōng,cōng',
-    0x7E3E: 'jī',
-    0x7E3F: 'shān,xiān,xiāo,sāo,cǎn',
-    0x7E40: 'suì,cuǐ',
-    0x7E41: 'fán,pó,pán',
-    0x7E42: 'lǜ',
-    0x7E43: 'běng,bēng,bèng',
-    0x7E44: 'yī,yì',
-    0x7E45: 'sāo,zǎo',
-    0x7E46: 'móu,jiū,miù,mù,miào,liáo,liǎo,liào,lù',
-    0x7E47: 'yáo,yóu,zhòu',
-    0x7E48: 'qiǎng',
-    0x7E49: 'hún',
-    0x7E4A: 'xiān',
-    0x7E4B: 'jì',
-    0x7E4C: 'sha',
-    0x7E4D: 'xiù',
-    0x7E4E: 'rán',
-    0x7E4F: 'xuàn',
-    0x7E50: 'suì',
-    0x7E51: 'qiāo,juē',
-    0x7E52: 'zēng,zèng,céng',
-    0x7E53: 'zuǒ',
-    0x7E54: 'zhī,zhì',
-    0x7E55: 'shàn',
-    0x7E56: 'sǎn',
-    0x7E57: 'lín',
-    0x7E58: 'yù,jué',
-    0x7E59: 'fān,fán',
-    0x7E5A: 'liáo,rǎo',
-    0x7E5B: 'chuò',
-    0x7E5C: 'zūn',
-    0x7E5D: 'jiàn',
-    0x7E5E: 'rào,rǎo',
-    0x7E5F: 'chǎn,chán',
-    0x7E60: 'ruǐ',
-    0x7E61: 'xiù',
-    0x7E62: 'huì,huí',
-    0x7E63: 'huà',
-    0x7E64: 'zuǎn',
-    0x7E65: 'xī',
-    0x7E66: 'qiǎng',
-    0x7E67: 'yun',
-    0x7E68: 'da',
-    0x7E69: 'shéng,yìng,mǐn,shèng',
-    0x7E6A: 'huì,guì',
-    0x7E6B: 'xì,jì',
-    0x7E6C: 'sè',
-    0x7E6D: 'jiǎn',
-    0x7E6E: 'jiāng',
-    0x7E6F: 'huán',
-    0x7E70: 'zǎo,sāo,qiāo',
-    0x7E71: 'cōng',
-    0x7E72: 'xiè',
-    0x7E73: 'jiǎo,zhuó,jiào,hé',
-    0x7E74: 'bì',
-    0x7E75: 'dàn,tán,chán',
-    0x7E76: 'yì',
-    0x7E77: 'nǒng',
-    0x7E78: 'suì',
-    0x7E79: 'yì,shì',
-    0x7E7A: 'shǎi',
-    0x7E7B: 'xū,rú',
-    0x7E7C: 'jì',
-    0x7E7D: 'bīn',
-    0x7E7E: 'qiǎn',
-    0x7E7F: 'lán',
-    0x7E80: 'pú,fú',
-    0x7E81: 'xūn',
-    0x7E82: 'zuǎn',
-    0x7E83: 'qí',
-    0x7E84: 'péng',
-    0x7E85: 'yào,lì',
-    0x7E86: 'mò',
-    0x7E87: 'lèi',
-    0x7E88: 'xié',
-    0x7E89: 'zuǎn',
-    0x7E8A: 'kuàng',
-    0x7E8B: 'yōu',
-    0x7E8C: 'xù',
-    0x7E8D: 'léi,lěi,lèi',
-    0x7E8E: 'xiān',
-    0x7E8F: 'chán',
-    0x7E90: 'jiǎo',
-    0x7E91: 'lú',
-    0x7E92: 'chán',
-    0x7E93: 'yīng',
-    0x7E94: 'cái,shān',
-    0x7E95: 'rǎng,xiāng,sāng',
-    0x7E96: 'xiān,jiān',
-    0x7E97: 'zuī',
-    0x7E98: 'zuǎn',
-    0x7E99: 'luò',
-    0x7E9A: 'lí,xǐ,lǐ,sǎ',
-    0x7E9B: 'dào,dú',
-    0x7E9C: 'lǎn',
-    0x7E9D: 'léi',
-    0x7E9E: 'liàn',
-    0x7E9F: 'sī',
-    0x7EA0: 'jiū',
-    0x7EA1: 'yū',
-    0x7EA2: 'hóng,gōng',
-    0x7EA3: 'zhòu',
-    0x7EA4: 'xiān,qiàn',
-    0x7EA5: 'gē,hé',
-    0x7EA6: 'yuē,yāo',
-    0x7EA7: 'jí',
-    0x7EA8: 'wán',
-    0x7EA9: 'kuàng',
-    0x7EAA: 'jì,jǐ',
-    0x7EAB: 'rèn',
-    0x7EAC: 'wěi',
-    0x7EAD: 'yún',
-    0x7EAE: 'hóng',
-    0x7EAF: 'chún',
-    0x7EB0: 'pī',
-    0x7EB1: 'shā',
-    0x7EB2: 'gāng',
-    0x7EB3: 'nà',
-    0x7EB4: 'rèn',
-    0x7EB5: 'zòng',
-    0x7EB6: 'lún,guān',
-    0x7EB7: 'fēn',
-    0x7EB8: 'zhǐ',
-    0x7EB9: 'wén,wèn',
-    0x7EBA: 'fǎng',
-    0x7EBB: 'zhù',
-    0x7EBC: 'zhèn',
-    0x7EBD: 'niǔ',
-    0x7EBE: 'shū',
-    0x7EBF: 'xiàn',
-    0x7EC0: 'gàn',
-    0x7EC1: 'xiè',
-    0x7EC2: 'fú',
-    0x7EC3: 'liàn',
-    0x7EC4: 'zǔ',
-    0x7EC5: 'shēn',
-    0x7EC6: 'xì',
-    0x7EC7: 'zhī',
-    0x7EC8: 'zhōng',
-    0x7EC9: 'zhòu',
-    0x7ECA: 'bàn',
-    0x7ECB: 'fú',
-    0x7ECC: 'chù',
-    0x7ECD: 'shào',
-    0x7ECE: 'yì',
-    0x7ECF: 'jīng,jìng',
-    0x7ED0: 'dài',
-    0x7ED1: 'bǎng',
-    0x7ED2: 'róng',
-    0x7ED3: 'jié,jiē',
-    0x7ED4: 'kù',
-    0x7ED5: 'rào,rǎo',
-    0x7ED6: 'dié',
-    0x7ED7: 'háng',
-    0x7ED8: 'huì',
-    0x7ED9: 'gěi,jǐ',
-    0x7EDA: 'xuàn',
-    0x7EDB: 'jiàng',
-    0x7EDC: 'luò,lào',
-    0x7EDD: 'jué',
-    0x7EDE: 'jiǎo',
-    0x7EDF: 'tǒng',
-    0x7EE0: 'gěng',
-    0x7EE1: 'xiāo',
-    0x7EE2: 'juàn',
-    0x7EE3: 'xiù',
-    0x7EE4: 'xì',
-    0x7EE5: 'suí',
-    0x7EE6: 'tāo',
-    0x7EE7: 'jì',
-    0x7EE8: 'tí,tì',
-    0x7EE9: 'jì,jī',
-    0x7EEA: 'xù',
-    0x7EEB: 'líng',
-    0x7EEC: 'yīng',
-    0x7EED: 'xù',
-    0x7EEE: 'qǐ',
-    0x7EEF: 'fēi',
-    0x7EF0: 'chuò,chāo',
-    0x7EF1: 'shàng',
-    0x7EF2: 'gǔn',
-    0x7EF3: 'shéng',
-    0x7EF4: 'wéi',
-    0x7EF5: 'mián',
-    0x7EF6: 'shòu',
-    0x7EF7: 'bēng,běng,bèng',
-    0x7EF8: 'chóu',
-    0x7EF9: 'táo',
-    0x7EFA: 'liǔ',
-    0x7EFB: 'quǎn',
-    0x7EFC: 'zōng,zèng',
-    0x7EFD: 'zhàn',
-    0x7EFE: 'wǎn',
-    0x7EFF: 'lǜ,lù',
-    0x7F00: 'zhuì',
-    0x7F01: 'zī',
-    0x7F02: 'kè',
-    0x7F03: 'xiāng',
-    0x7F04: 'jiān',
-    0x7F05: 'miǎn',
-    0x7F06: 'lǎn',
-    0x7F07: 'tí',
-    0x7F08: 'miǎo',
-    0x7F09: 'jī,qī',
-    0x7F0A: 'yūn,yùn',
-    0x7F0B: 'huì',
-    0x7F0C: 'sī',
-    0x7F0D: 'duǒ',
-    0x7F0E: 'duàn',
-    0x7F0F: 'biàn,pián',
-    0x7F10: 'xiàn',
-    0x7F11: 'gōu',
-    0x7F12: 'zhuì',
-    0x7F13: 'huǎn',
-    0x7F14: 'dì',
-    0x7F15: 'lǚ',
-    0x7F16: 'biān',
-    0x7F17: 'mín',
-    0x7F18: 'yuán',
-    0x7F19: 'jìn',
-    0x7F1A: 'fù',
-    0x7F1B: 'rù',
-    0x7F1C: 'zhěn',
-    0x7F1D: 'fèng,féng',
-    0x7F1E: 'cuī',
-    0x7F1F: 'gǎo',
-    0x7F20: 'chán',
-    0x7F21: 'lí',
-    0x7F22: 'yì',
-    0x7F23: 'jiān',
-    0x7F24: 'bīn',
-    0x7F25: 'piāo,piǎo',
-    0x7F26: 'màn',
-    0x7F27: 'léi',
-    0x7F28: 'yīng',
-    0x7F29: 'suō,sù',
-    0x7F2A: 'móu,miào,miù',
-    0x7F2B: 'sāo',
-    0x7F2C: 'xié',
-    0x7F2D: 'liáo',
-    0x7F2E: 'shàn',
-    0x7F2F: 'zēng,zèng',
-    0x7F30: 'jiāng',
-    0x7F31: 'qiǎn',
-    0x7F32: 'qiāo,sāo',
-    0x7F33: 'huán',
-    0x7F34: 'jiǎo,zhuó',
-    0x7F35: 'zuǎn',
-    0x7F36: 'fǒu',
-    0x7F37: 'xiè',
-    0x7F38: 'gāng',
-    0x7F39: 'fǒu',
-    0x7F3A: 'quē,kuǐ',
-    0x7F3B: 'fǒu',
-    0x7F3C: 'qi',
-    0x7F3D: 'bō',
-    0x7F3E: 'píng',
-    0x7F3F: 'xiàng',
-    0x7F40: 'zhao',
-    0x7F41: 'gāng',
-    0x7F42: 'yīng',
-    0x7F43: 'yīng',
-    0x7F44: 'qìng',
-    0x7F45: 'xià',
-    0x7F46: 'guàn',
-    0x7F47: 'zūn',
-    0x7F48: 'tán',
-    0x7F49: 'chēng',
-    0x7F4A: 'qì',
-    0x7F4B: 'wèng',
-    0x7F4C: 'yīng',
-    0x7F4D: 'léi',
-    0x7F4E: 'tán',
-    0x7F4F: 'lú',
-    0x7F50: 'guàn',
-    0x7F51: 'wǎng',
-    0x7F52: 'wǎng',
-    0x7F53: 'gāng',
-    0x7F54: 'wǎng,wáng',
-    0x7F55: 'hǎn,hàn',
-    0x7F56: 'luó',
-    0x7F57: 'luó,luō',
-    0x7F58: 'fú',
-    0x7F59: 'shēn',
-    0x7F5A: 'fá',
-    0x7F5B: 'gū',
-    0x7F5C: 'zhǔ,dú',
-    0x7F5D: 'jū,jiē',
-    0x7F5E: 'máo',
-    0x7F5F: 'gǔ',
-    0x7F60: 'mín',
-    0x7F61: 'gāng',
-    0x7F62: 'bà,ba',
-    0x7F63: 'guà',
-    0x7F64: 'tí,kūn',
-    0x7F65: 'juàn',
-    0x7F66: 'fú',
-    0x7F67: 'shèn',
-    0x7F68: 'yǎn',
-    0x7F69: 'zhào',
-    0x7F6A: 'zuì',
-    0x7F6B: 'guà,huà,guǎi',
-    0x7F6C: 'zhuó',
-    0x7F6D: 'yù',
-    0x7F6E: 'zhì',
-    0x7F6F: 'ǎn',
-    0x7F70: 'fá',
-    0x7F71: 'lǎn,nǎn',
-    0x7F72: 'shǔ',
-    0x7F73: 'sī',
-    0x7F74: 'pí',
-    0x7F75: 'mà',
-    0x7F76: 'liǔ',
-    0x7F77: 'bà,pí,pì,bǐ,ba,bǎi',
-    0x7F78: 'fá',
-    0x7F79: 'lí',
-    0x7F7A: 'cháo',
-    0x7F7B: 'wèi',
-    0x7F7C: 'bì',
-    0x7F7D: 'jì',
-    0x7F7E: 'zēng',
-    0x7F7F: 'chōng',
-    0x7F80: 'liǔ',
-    0x7F81: 'jī',
-    0x7F82: 'juàn',
-    0x7F83: 'mì',
-    0x7F84: 'zhào',
-    0x7F85: 'luó,luō,luo',
-    0x7F86: 'pí',
-    0x7F87: 'jī',
-    0x7F88: 'jī',
-    0x7F89: 'luán',
-    0x7F8A: 'yáng',
-    0x7F8B: 'mǐ,miē',
-    0x7F8C: 'qiāng',
-    0x7F8D: 'dá',
-    0x7F8E: 'měi',
-    0x7F8F: 'yáng,xiáng',
-    0x7F90: 'yǒu',
-    0x7F91: 'yǒu',
-    0x7F92: 'fén',
-    0x7F93: 'bā',
-    0x7F94: 'gāo',
-    0x7F95: 'yàng',
-    0x7F96: 'gǔ',
-    0x7F97: 'qiāng,yǒu',
-    0x7F98: 'zāng',
-    0x7F99: 'gāo,měi',
-    0x7F9A: 'líng',
-    0x7F9B: 'yì,xī',
-    0x7F9C: 'zhù',
-    0x7F9D: 'dī',
-    0x7F9E: 'xiū',
-    0x7F9F: 'qiǎng',
-    0x7FA0: 'yí',
-    0x7FA1: 'xiàn,yán,yí',
-    0x7FA2: 'róng',
-    0x7FA3: 'qún',
-    0x7FA4: 'qún',
-    0x7FA5: 'qiǎng,qiān',
-    0x7FA6: 'huán',
-    0x7FA7: 'suō,zuī',
-    0x7FA8: 'xiàn',
-    0x7FA9: 'yì,yí,xī',
-    0x7FAA: 'yang',
-    0x7FAB: 'qiāng,kàng',
-    0x7FAC: 'qián,xián,yán',
-    0x7FAD: 'yú',
-    0x7FAE: 'gēng',
-    0x7FAF: 'jié',
-    0x7FB0: 'tāng',
-    0x7FB1: 'yuán',
-    0x7FB2: 'xī',
-    0x7FB3: 'fán',
-    0x7FB4: 'shān',
-    0x7FB5: 'fén',
-    0x7FB6: 'shān',
-    0x7FB7: 'liǎn',
-    0x7FB8: 'léi,lián',
-    0x7FB9: 'gēng,láng',
-    0x7FBA: 'nóu',
-    0x7FBB: 'qiàng',
-    0x7FBC: 'chàn',
-    0x7FBD: 'yǔ,hù',
-    0x7FBE: 'gòng',
-    0x7FBF: 'yì',
-    0x7FC0: 'chōng',
-    0x7FC1: 'wēng,wěng',
-    0x7FC2: 'fēn',
-    0x7FC3: 'hóng',
-    0x7FC4: 'chì',
-    0x7FC5: 'chì',
-    0x7FC6: 'cuì',
-    0x7FC7: 'fú',
-    0x7FC8: 'xiá',
-    0x7FC9: 'běn',
-    0x7FCA: 'yì',
-    0x7FCB: 'lā',
-    0x7FCC: 'yì',
-    0x7FCD: 'pī,bì,pō',
-    0x7FCE: 'líng',
-    0x7FCF: 'liù,lù',
-    0x7FD0: 'zhì',
-    0x7FD1: 'qú',
-    0x7FD2: 'xí',
-    0x7FD3: 'xié',
-    0x7FD4: 'xiáng',
-    0x7FD5: 'xī',
-    0x7FD6: 'xī',
-    0x7FD7: 'ké',
-    0x7FD8: 'qiào,qiáo',
-    0x7FD9: 'huì',
-    0x7FDA: 'huī',
-    0x7FDB: 'xiāo,shū',
-    0x7FDC: 'shà',
-    0x7FDD: 'hóng',
-    0x7FDE: 'jiāng',
-    0x7FDF: 'dí,zhái',
-    0x7FE0: 'cuì',
-    0x7FE1: 'fěi',
-    0x7FE2: 'dào,zhōu',
-    0x7FE3: 'shà',
-    0x7FE4: 'chì',
-    0x7FE5: 'zhù',
-    0x7FE6: 'jiǎn',
-    0x7FE7: 'xuān',
-    0x7FE8: 'chì',
-    0x7FE9: 'piān',
-    0x7FEA: 'zōng',
-    0x7FEB: 'wán,wàn',
-    0x7FEC: 'huī',
-    0x7FED: 'hóu',
-    0x7FEE: 'hé,lì',
-    0x7FEF: 'hè,hào',
-    0x7FF0: 'hàn',
-    0x7FF1: 'áo',
-    0x7FF2: 'piāo',
-    0x7FF3: 'yì',
-    0x7FF4: 'lián',
-    0x7FF5: 'hóu,qú',
-    0x7FF6: 'áo',
-    0x7FF7: 'lín',
-    0x7FF8: 'pěn',
-    0x7FF9: 'qiào,qiáo',
-    0x7FFA: 'áo',
-    0x7FFB: 'fān',
-    0x7FFC: 'yì',
-    0x7FFD: 'huì',
-    0x7FFE: 'xuān',
-    0x7FFF: 'dào',
-    0x8000: 'yào',
-    0x8001: 'lǎo',
-    0x8002: 'lǎo',
-    0x8003: 'kǎo',
-    0x8004: 'mào',
-    0x8005: 'zhě',
-    0x8006: 'qí,zhǐ,shì',
-    0x8007: 'gǒu',
-    0x8008: 'gǒu',
-    0x8009: 'gǒu',
-    0x800A: 'dié',
-    0x800B: 'dié',
-    0x800C: 'ér,néng',
-    0x800D: 'shuǎ',
-    0x800E: 'ruǎn,nuò',
-    0x800F: 'nài,ér',
-    0x8010: 'nài,néng',
-    0x8011: 'duān,zhuān',
-    0x8012: 'lěi',
-    0x8013: 'tīng',
-    0x8014: 'zǐ',
-    0x8015: 'gēng',
-    0x8016: 'chào',
-    0x8017: 'hào,máo,mào',
-    0x8018: 'yún',
-    0x8019: 'bà,pá',
-    0x801A: 'pī',
-    0x801B: 'yí,chí',
-    0x801C: 'sì',
-    0x801D: 'qù,chú',
-    0x801E: 'jiā',
-    0x801F: 'jù',
-    0x8020: 'huō',
-    0x8021: 'chú',
-    0x8022: 'lào',
-    0x8023: 'lǔn,lún',
-    0x8024: 'jí,jiè',
-    0x8025: 'tāng,tǎng',
-    0x8026: 'ǒu',
-    0x8027: 'lóu',
-    0x8028: 'nòu',
-    0x8029: 'jiǎng',
-    0x802A: 'pǎng',
-    0x802B: 'zhá,zé',
-    0x802C: 'lóu,lǒu',
-    0x802D: 'jī',
-    0x802E: 'lào',
-    0x802F: 'huò',
-    0x8030: 'yōu',
-    0x8031: 'mò',
-    0x8032: 'huái',
-    0x8033: 'ěr,réng',
-    0x8034: 'yì',
-    0x8035: 'dīng',
-    0x8036: 'yé,yē,xié',
-    0x8037: 'dā,zhé',
-    0x8038: 'sǒng',
-    0x8039: 'qín',
-    0x803A: 'yún,yíng',
-    0x803B: 'chǐ',
-    0x803C: 'dān',
-    0x803D: 'dān',
-    0x803E: 'hóng',
-    0x803F: 'gěng',
-    0x8040: 'zhí',
-    0x8041: 'pàn',
-    0x8042: 'niè',
-    0x8043: 'dān',
-    0x8044: 'zhěn',
-    0x8045: 'chè',
-    0x8046: 'líng',
-    0x8047: 'zhēng',
-    0x8048: 'yǒu',
-    0x8049: 'wà,tuǐ,zhuó',
-    0x804A: 'liáo,liú',
-    0x804B: 'lóng',
-    0x804C: 'zhí',
-    0x804D: 'níng',
-    0x804E: 'tiāo',
-    0x804F: 'ér,nǜ',
-    0x8050: 'yà',
-    0x8051: 'tiē,zhé',
-    0x8052: 'guā,guō',
-    0x8053: 'xù',
-    0x8054: 'lián',
-    0x8055: 'hào',
-    0x8056: 'shèng',
-    0x8057: 'liè',
-    0x8058: 'pìn,pìng',
-    0x8059: 'jīng',
-    0x805A: 'jù',
-    0x805B: 'bǐ',
-    0x805C: 'dǐ',
-    0x805D: 'guó',
-    0x805E: 'wén,wèn',
-    0x805F: 'xù',
-    0x8060: 'pīng',
-    0x8061: 'cōng',
-    0x8062: 'dìng',
-    0x8063: 'ní',
-    0x8064: 'tíng',
-    0x8065: 'jǔ',
-    0x8066: 'cōng',
-    0x8067: 'kuī',
-    0x8068: 'lián',
-    0x8069: 'kuì',
-    0x806A: 'cōng',
-    0x806B: 'lián',
-    0x806C: 'wěng',
-    0x806D: 'kuì',
-    0x806E: 'lián',
-    0x806F: 'lián',
-    0x8070: 'cōng',
-    0x8071: 'áo,yóu',
-    0x8072: 'shēng',
-    0x8073: 'sǒng',
-    0x8074: 'tīng',
-    0x8075: 'kuì',
-    0x8076: 'niè,zhé,shè,yè',
-    0x8077: 'zhí,tè',
-    0x8078: 'dān',
-    0x8079: 'níng',
-    0x807A: 'qié',
-    0x807B: 'nǐ,jiàn',
-    0x807C: 'tīng',
-    0x807D: 'tīng,tìng',
-    0x807E: 'lóng',
-    0x807F: 'yù',
-    0x8080: 'yù',
-    0x8081: 'zhào',
-    0x8082: 'sì',
-    0x8083: 'sù',
-    0x8084: 'yì,sì',
-    0x8085: 'sù',
-    0x8086: 'sì,tì',
-    0x8087: 'zhào',
-    0x8088: 'zhào',
-    0x8089: 'ròu,rù',
-    0x808A: 'yì',
-    0x808B: 'lē,lèi,jīn',
-    0x808C: 'jī,jì',
-    0x808D: 'qiú',
-    0x808E: 'kěn',
-    0x808F: 'cào',
-    0x8090: 'gē,qì',
-    0x8091: 'bó,dí',
-    0x8092: 'huàn',
-    0x8093: 'huāng',
-    0x8094: 'chǐ',
-    0x8095: 'rèn',
-    0x8096: 'xiào,xiāo',
-    0x8097: 'rǔ',
-    0x8098: 'zhǒu',
-    0x8099: 'yuàn',
-    0x809A: 'dù,dǔ',
-    0x809B: 'gāng',
-    0x809C: 'róng,chēn',
-    0x809D: 'gān',
-    0x809E: 'chā',
-    0x809F: 'wò',
-    0x80A0: 'cháng',
-    0x80A1: 'gǔ',
-    0x80A2: 'zhī,shì',
-    0x80A3: 'hán,hàn,qín',
-    0x80A4: 'fū',
-    0x80A5: 'féi,bǐ',
-    0x80A6: 'fén',
-    0x80A7: 'pēi',
-    0x80A8: 'pàng,pāng,fēng',
-    0x80A9: 'jiān,xián',
-    0x80AA: 'fáng',
-    0x80AB: 'zhūn,chún,tún,zhuō',
-    0x80AC: 'yóu',
-    0x80AD: 'nà,nù',
-    0x80AE: 'āng,háng,gāng',
-    0x80AF: 'kěn',
-    0x80B0: 'rán',
-    0x80B1: 'gōng',
-    0x80B2: 'yù,zhòu,yō',
-    0x80B3: 'wěn',
-    0x80B4: 'yáo',
-    0x80B5: 'qí',
-    0x80B6: 'pí,bì',
-    0x80B7: 'qiǎn,xù',
-    0x80B8: 'xī,bì',
-    0x80B9: 'xī',
-    0x80BA: 'fèi,pèi',
-    0x80BB: 'kěn',
-    0x80BC: 'jǐng',
-    0x80BD: 'tài',
-    0x80BE: 'shèn',
-    0x80BF: 'zhǒng',
-    0x80C0: 'zhàng',
-    0x80C1: 'xié',
-    0x80C2: 'shèn,shēn,chēn',
-    0x80C3: 'wèi',
-    0x80C4: 'zhòu',
-    0x80C5: 'dié',
-    0x80C6: 'dǎn,tán,tǎn,dá',
-    0x80C7: 'fèi,bì,fěi',
-    0x80C8: 'bá',
-    0x80C9: 'bó',
-    0x80CA: 'qú',
-    0x80CB: 'tián',
-    0x80CC: 'bèi,bēi',
-    0x80CD: 'guā,gū,hù',
-    0x80CE: 'tāi',
-    0x80CF: 'zǐ,fèi',
-    0x80D0: 'fěi',
-    0x80D1: 'zhī',
-    0x80D2: 'nì',
-    0x80D3: 'píng,pēng',
-    0x80D4: 'zì,cí,jí',
-    0x80D5: 'fǔ,fū,fú,zhǒu',
-    0x80D6: 'pàng,pán,pàn',
-    0x80D7: 'zhēn,zhěn,zhūn',
-    0x80D8: 'xián',
-    0x80D9: 'zuò',
-    0x80DA: 'pēi',
-    0x80DB: 'jiǎ',
-    0x80DC: 'shèng,xīng,qìng,shēng',
-    0x80DD: 'zhī,chī,dì',
-    0x80DE: 'bāo,páo,pào',
-    0x80DF: 'mǔ',
-    0x80E0: 'qū',
-    0x80E1: 'hú',
-    0x80E2: 'kē',
-    0x80E3: 'chǐ',
-    0x80E4: 'yìn',
-    0x80E5: 'xū,xǔ',
-    0x80E6: 'yāng',
-    0x80E7: 'lóng',
-    0x80E8: 'dòng',
-    0x80E9: 'kǎ',
-    0x80EA: 'lú',
-    0x80EB: 'jìng',
-    0x80EC: 'nǔ,nǚ',
-    0x80ED: 'yān',
-    0x80EE: 'pāng',
-    0x80EF: 'kuà,kuǎ',
-    0x80F0: 'yí',
-    0x80F1: 'guāng',
-    0x80F2: 'hǎi,gāi,gǎi',
-    0x80F3: 'gē,gé,gā',
-    0x80F4: 'dòng',
-    0x80F5: 'chī,zhì',
-    0x80F6: 'jiāo,xiáo',
-    0x80F7: 'xiōng',
-    0x80F8: 'xiōng',
-    0x80F9: 'ér',
-    0x80FA: 'àn,è',
-    0x80FB: 'héng',
-    0x80FC: 'pián',
-    0x80FD: 'néng,tái,nái,nài,xióng',
-    0x80FE: 'zì',
-    0x80FF: 'guī,kuì',
-    0x8100: 'chéng,zhēng,zhèng',
-    0x8101: 'tiǎo',
-    0x8102: 'zhī,zhǐ',
-    0x8103: 'cuì',
-    0x8104: 'méi',
-    0x8105: 'xié,xiàn,xī',
-    0x8106: 'cuì',
-    0x8107: 'xié',
-    0x8108: 'mài,mò',
-    0x8109: 'mài,mò',
-    0x810A: 'jí,jǐ',
-    0x810B: 'xié',
-    0x810C: 'nin',
-    0x810D: 'kuài',
-    0x810E: 'sà',
-    0x810F: 'zàng,zāng',
-    0x8110: 'qí',
-    0x8111: 'nǎo',
-    0x8112: 'mǐ',
-    0x8113: 'nóng',
-    0x8114: 'luán,jī',
-    0x8115: 'wàn,wèn',
-    0x8116: 'bó,bō',
-    0x8117: 'wěn',
-    0x8118: 'wǎn,huàn',
-    0x8119: 'xiū',
-    0x811A: 'jiǎo,jué',
-    0x811B: 'jìng,kēng',
-    0x811C: 'yǒu',
-    0x811D: 'hēng',
-    0x811E: 'cuǒ,qiē',
-    0x811F: 'liè,luán,pāo',
-    0x8120: 'shān,chān',
-    0x8121: 'tǐng',
-    0x8122: 'méi',
-    0x8123: 'chún',
-    0x8124: 'shèn',
-    0x8125: 'qiǎn,qū,jié',
-    0x8126: 'de,tè,te',
-    0x8127: 'juān,zuī',
-    0x8128: 'cù,jí',
-    0x8129: 'xiū,yǒu,tiáo,xiāo',
-    0x812A: 'xìn,chī',
-    0x812B: 'tuō',
-    0x812C: 'pāo',
-    0x812D: 'chéng',
-    0x812E: 'něi,tuǐ',
-    0x812F: 'pú,fǔ',
-    0x8130: 'dòu',
-    0x8131: 'tuō,tuì',
-    0x8132: 'niào',
-    0x8133: 'nǎo',
-    0x8134: 'pǐ',
-    0x8135: 'gǔ',
-    0x8136: 'luó',
-    0x8137: 'lì',
-    0x8138: 'liǎn',
-    0x8139: 'zhàng,cháng',
-    0x813A: 'cuì,suì',
-    0x813B: 'jiē',
-    0x813C: 'liǎng,lǎng',
-    0x813D: 'shuí',
-    0x813E: 'pí,pái,bì,pì',
-    0x813F: 'biāo,biǎo,biào',
-    0x8140: 'lún',
-    0x8141: 'pián',
-    0x8142: 'lěi,guò,huà',
-    0x8143: 'kuì,quān,quán,juàn',
-    0x8144: 'chuí,hóu,chuái',
-    0x8145: 'dàn',
-    0x8146: 'tiǎn',
-    0x8147: 'něi',
-    0x8148: 'jīng',
-    0x8149: 'nái',
-    0x814A: 'là,xī',
-    0x814B: 'yè',
-    0x814C: 'yān,ā,āng',
-    0x814D: 'rèn,diàn',
-    0x814E: 'shèn',
-    0x814F: 'chuò,zhuì',
-    0x8150: 'fǔ',
-    0x8151: 'fǔ',
-    0x8152: 'jū',
-    0x8153: 'féi',
-    0x8154: 'qiāng,kòng',
-    0x8155: 'wàn',
-    0x8156: 'dòng',
-    0x8157: 'pí',
-    0x8158: 'guó',
-    0x8159: 'zōng',
-    0x815A: 'dìng',
-    0x815B: 'wò',
-    0x815C: 'méi',
-    0x815D: 'ní,ruǎn,nào,nèn,ér',
-    0x815E: 'zhuàn,dùn,tú',
-    0x815F: 'chì',
-    0x8160: 'còu',
-    0x8161: 'luó',
-    0x8162: 'ǒu',
-    0x8163: 'dì',
-    0x8164: 'ān',
-    0x8165: 'xīng',
-    0x8166: 'nǎo,nào',
-    0x8167: 'shù,yú',
-    0x8168: 'shuàn',
-    0x8169: 'nǎn',
-    0x816A: 'yùn',
-    0x816B: 'zhǒng',
-    0x816C: 'róu',
-    0x816D: 'è',
-    0x816E: 'sāi',
-    0x816F: 'tú,dùn',
-    0x8170: 'yāo',
-    0x8171: 'jiàn,qián',
-    0x8172: 'wěi',
-    0x8173: 'jiǎo,jué',
-    0x8174: 'yú',
-    0x8175: 'jiā',
-    0x8176: 'duàn',
-    0x8177: 'bì',
-    0x8178: 'cháng',
-    0x8179: 'fù',
-    0x817A: 'xiàn',
-    0x817B: 'nì',
-    0x817C: 'miǎn',
-    0x817D: 'wà',
-    0x817E: 'téng',
-    0x817F: 'tuǐ',
-    0x8180: 'bǎng,pāng,páng,bàng,pǎng',
-    0x8181: 'qiǎn,xiàn,yán',
-    0x8182: 'lǚ',
-    0x8183: 'wà',
-    0x8184: 'shòu',
-    0x8185: 'táng',
-    0x8186: 'sù',
-    0x8187: 'zhuì',
-    0x8188: 'gé',
-    0x8189: 'yì',
-    0x818A: 'bó,pò,liè',
-    0x818B: 'liáo',
-    0x818C: 'jí',
-    0x818D: 'pí',
-    0x818E: 'xié',
-    0x818F: 'gāo,gào',
-    0x8190: 'lǚ',
-    0x8191: 'bìn',
-    0x8192: 'ōu',
-    0x8193: 'cháng',
-    0x8194: 'lù,biāo',
-    0x8195: 'guó,huò',
-    0x8196: 'pāng',
-    0x8197: 'chuái',
-    0x8198: 'biāo,piǎo',
-    0x8199: 'jiǎng',
-    0x819A: 'fū,lú',
-    0x819B: 'táng,tāng',
-    0x819C: 'mó',
-    0x819D: 'xī',
-    0x819E: 'zhuān,zhuǎn,chuǎn,chún',
-    0x819F: 'lǜ',
-    0x81A0: 'jiāo,jiǎo,háo,nǎo',
-    0x81A1: 'yìng',
-    0x81A2: 'lǘ',
-    0x81A3: 'zhì',
-    0x81A4: 'xuě',
-    0x81A5: 'cūn',
-    0x81A6: 'lìn,liǎn',
-    0x81A7: 'tóng',
-    0x81A8: 'péng,pèng',
-    0x81A9: 'nì',
-    0x81AA: 'chuài,zhà,zhài',
-    0x81AB: 'liáo,liǎo',
-    0x81AC: 'cuì',
-    0x81AD: 'guī,kuì,duì',
-    0x81AE: 'xiāo',
-    0x81AF: 'tēng,tún',
-    0x81B0: 'fán,pán',
-    0x81B1: 'zhí',
-    0x81B2: 'jiāo',
-    0x81B3: 'shàn',
-    0x81B4: 'hū,wǔ,méi',
-    0x81B5: 'cuì',
-    0x81B6: 'rùn',
-    0x81B7: 'xiāng',
-    0x81B8: 'suǐ,wěi',
-    0x81B9: 'fèn',
-    0x81BA: 'yīng',
-    0x81BB: 'shān,dàn',
-    0x81BC: 'zhuā',
-    0x81BD: 'dǎn',
-    0x81BE: 'kuài',
-    0x81BF: 'nóng',
-    0x81C0: 'tún',
-    0x81C1: 'lián',
-    0x81C2: 'bì,bei',
-    0x81C3: 'yōng',
-    0x81C4: 'jué,jū',
-    0x81C5: 'chù',
-    0x81C6: 'yì,yǐ',
-    0x81C7: 'juǎn',
-    0x81C8: 'là,gé',
-    0x81C9: 'liǎn',
-    0x81CA: 'sāo,sào',
-    0x81CB: 'tún',
-    0x81CC: 'gǔ',
-    0x81CD: 'qí',
-    0x81CE: 'cuì',
-    0x81CF: 'bìn',
-    0x81D0: 'xūn',
-    0x81D1: 'nào,rú,ér,nèn,nuǎn',
-    0x81D2: 'wò,yuè',
-    0x81D3: 'zàng',
-    0x81D4: 'xiàn',
-    0x81D5: 'biāo',
-    0x81D6: 'xìng',
-    0x81D7: 'kuān',
-    0x81D8: 'là,liè',
-    0x81D9: 'yān',
-    0x81DA: 'lú,lǚ',
-    0x81DB: 'huò',
-    0x81DC: 'zā',
-    0x81DD: 'luǒ',
-    0x81DE: 'qú',
-    0x81DF: 'zàng',
-    0x81E0: 'luán',
-    0x81E1: 'ní,luán',
-    0x81E2: 'zā,zān',
-    0x81E3: 'chén',
-    0x81E4: 'qiān,xián,qìn',
-    0x81E5: 'wò',
-    0x81E6: 'guàng,jiǒng',
-    0x81E7: 'zāng,cáng,zàng',
-    0x81E8: 'lín,lìn',
-    0x81E9: 'guǎng,jiǒng',
-    0x81EA: 'zì',
-    0x81EB: 'jiǎo',
-    0x81EC: 'niè',
-    0x81ED: 'chòu,xiù',
-    0x81EE: 'jì',
-    0x81EF: 'gāo',
-    0x81F0: 'chòu',
-    0x81F1: 'mián,biān',
-    0x81F2: 'niè',
-    0x81F3: 'zhì,dié',
-    0x81F4: 'zhì,zhuì',
-    0x81F5: 'gé',
-    0x81F6: 'jiàn',
-    0x81F7: 'dié,zhí',
-    0x81F8: 'zhī,jìn',
-    0x81F9: 'xiū',
-    0x81FA: 'tái',
-    0x81FB: 'zhēn',
-    0x81FC: 'jiù',
-    0x81FD: 'xiàn',
-    0x81FE: 'yú,yǔ,yǒng,kuì',
-    0x81FF: 'chā',
-    0x8200: 'yǎo',
-    0x8201: 'yú',
-    0x8202: 'chōng,chuāng,zhōng',
-    0x8203: 'xì',
-    0x8204: 'xì,què,tuō',
-    0x8205: 'jiù',
-    0x8206: 'yú',
-    0x8207: 'yǔ,yú,yù',
-    0x8208: 'xìng,xīng,xìn',
-    0x8209: 'jǔ',
-    0x820A: 'jiù',
-    0x820B: 'xìn',
-    0x820C: 'shé,guā',
-    0x820D: 'shě,shè,shì',
-    0x820E: 'shè',
-    0x820F: 'jiǔ',
-    0x8210: 'shì',
-    0x8211: 'tān',
-    0x8212: 'shū,yù',
-    0x8213: 'shì',
-    0x8214: 'tiǎn,tān',
-    0x8215: 'tàn',
-    0x8216: 'pù',
-    0x8217: 'pù',
-    0x8218: 'guǎn',
-    0x8219: 'huà,qì',
-    0x821A: 'tiàn',
-    0x821B: 'chuǎn',
-    0x821C: 'shùn',
-    0x821D: 'xiá',
-    0x821E: 'wǔ',
-    0x821F: 'zhōu',
-    0x8220: 'dāo',
-    0x8221: 'chuán,xiāng',
-    0x8222: 'shān',
-    0x8223: 'yǐ',
-    0x8224: 'fán',
-    0x8225: 'pā',
-    0x8226: 'tài',
-    0x8227: 'fán',
-    0x8228: 'bǎn',
-    0x8229: 'chuán,fán',
-    0x822A: 'háng',
-    0x822B: 'fǎng',
-    0x822C: 'bān,pán,bǎn,bō',
-    0x822D: 'bǐ',
-    0x822E: 'lú',
-    0x822F: 'zhōng',
-    0x8230: 'jiàn',
-    0x8231: 'cāng',
-    0x8232: 'líng',
-    0x8233: 'zhú,zhǒu',
-    0x8234: 'zé',
-    0x8235: 'duò',
-    0x8236: 'bó',
-    0x8237: 'xián',
-    0x8238: 'gě',
-    0x8239: 'chuán',
-    0x823A: 'xiá',
-    0x823B: 'lú',
-    0x823C: 'qióng,hóng',
-    0x823D: 'páng,féng',
-    0x823E: 'xī',
-    0x823F: 'kuā',
-    0x8240: 'fú',
-    0x8241: 'zào',
-    0x8242: 'féng',
-    0x8243: 'lí',
-    0x8244: 'shāo,shào',
-    0x8245: 'yú',
-    0x8246: 'láng',
-    0x8247: 'tǐng',
-    0x8248: 'yù',
-    0x8249: 'wěi',
-    0x824A: 'bó',
-    0x824B: 'měng',
-    0x824C: 'niàn,qiàn',
-    0x824D: 'jū',
-    0x824E: 'huáng',
-    0x824F: 'shǒu',
-    0x8250: 'kè,jiè,zōng',
-    0x8251: 'biàn',
-    0x8252: 'mù,mò',
-    0x8253: 'dié',
-    0x8254: 'dào',
-    0x8255: 'bàng',
-    0x8256: 'chā',
-    0x8257: 'yì',
-    0x8258: 'sōu',
-    0x8259: 'cāng',
-    0x825A: 'cáo',
-    0x825B: 'lóu',
-    0x825C: 'dài',
-    0x825D: 'xuě',
-    0x825E: 'yào,tiào',
-    0x825F: 'chōng,zhuàng,tóng',
-    0x8260: 'dēng',
-    0x8261: 'dāng',
-    0x8262: 'qiáng',
-    0x8263: 'lǔ',
-    0x8264: 'yǐ',
-    0x8265: 'jí',
-    0x8266: 'jiàn',
-    0x8267: 'huò,wò',
-    0x8268: 'méng',
-    0x8269: 'qí',
-    0x826A: 'lǔ',
-    0x826B: 'lú',
-    0x826C: 'chán',
-    0x826D: 'shuāng',
-    0x826E: 'gěn,gèn,hén',
-    0x826F: 'liáng,liǎng',
-    0x8270: 'jiān',
-    0x8271: 'jiān',
-    0x8272: 'sè,shǎi',
-    0x8273: 'yàn',
-    0x8274: 'fú,bó,pèi',
-    0x8275: 'pīng',
-    0x8276: 'yàn',
-    0x8277: 'yàn',
-    0x8278: 'cǎo',
-    0x8279: 'cǎo',
-    0x827A: 'yì',
-    0x827B: 'lè,jí',
-    0x827C: 'tīng,dǐng',
-    0x827D: 'jiāo,qiú',
-    0x827E: 'ài,yì',
-    0x827F: 'nǎi,réng,rèng',
-    0x8280: 'tiáo',
-    0x8281: 'jiāo',
-    0x8282: 'jié,jiē',
-    0x8283: 'péng',
-    0x8284: 'wán',
-    0x8285: 'yì',
-    0x8286: 'chāi,chā',
-    0x8287: 'mián',
-    0x8288: 'mǐ',
-    0x8289: 'gān,gǎn',
-    0x828A: 'qiān,qiàn',
-    0x828B: 'yù,yú,xū,yǔ',
-    0x828C: 'yù',
-    0x828D: 'sháo,xiào,què,dì',
-    0x828E: 'qiōng,xiōng',
-    0x828F: 'dù',
-    0x8290: 'hù,xià',
-    0x8291: 'qǐ',
-    0x8292: 'máng,huāng,huǎng,wáng',
-    0x8293: 'zì,zǐ,zī',
-    0x8294: 'huì,hū',
-    0x8295: 'suī',
-    0x8296: 'zhì',
-    0x8297: 'xiāng',
-    0x8298: 'pí,bǐ,bì',
-    0x8299: 'fú',
-    0x829A: 'tún,chūn',
-    0x829B: 'wěi',
-    0x829C: 'wú',
-    0x829D: 'zhī',
-    0x829E: 'qì',
-    0x829F: 'shān,wěi',
-    0x82A0: 'wén',
-    0x82A1: 'qiàn',
-    0x82A2: 'rén',
-    0x82A3: 'fú,fǒu,fū',
-    0x82A4: 'kōu',
-    0x82A5: 'jiè,gài',
-    0x82A6: 'lú,lǔ,hù',
-    0x82A7: 'xù,zhù',
-    0x82A8: 'jī',
-    0x82A9: 'qín,yín',
-    0x82AA: 'qí,chí',
-    0x82AB: 'yán,yuán',
-    0x82AC: 'fēn',
-    0x82AD: 'bā,pā',
-    0x82AE: 'ruì,ruò',
-    0x82AF: 'xīn,xìn',
-    0x82B0: 'jì',
-    0x82B1: 'huā',
-    0x82B2: 'huā',
-    0x82B3: 'fāng',
-    0x82B4: 'wù,hū',
-    0x82B5: 'jué',
-    0x82B6: 'gǒu',
-    0x82B7: 'zhǐ',
-    0x82B8: 'yún,yùn',
-    0x82B9: 'qín',
-    0x82BA: 'ǎo',
-    0x82BB: 'chú,zōu',
-    0x82BC: 'mào',
-    0x82BD: 'yá',
-    0x82BE: 'fèi,fú',
-    0x82BF: 'rèng',
-    0x82C0: 'háng',
-    0x82C1: 'cōng',
-    0x82C2: 'yín',
-    0x82C3: 'yǒu',
-    0x82C4: 'biàn',
-    0x82C5: 'yì',
-    0x82C6: 'qiē',
-    0x82C7: 'wěi',
-    0x82C8: 'lì',
-    0x82C9: 'pǐ',
-    0x82CA: 'è',
-    0x82CB: 'xiàn',
-    0x82CC: 'cháng',
-    0x82CD: 'cāng',
-    0x82CE: 'zhù',
-    0x82CF: 'sū',
-    0x82D0: 'tí,dì',
-    0x82D1: 'yuàn,yuān,yù,yùn',
-    0x82D2: 'rǎn',
-    0x82D3: 'líng,lián',
-    0x82D4: 'tái,tāi',
-    0x82D5: 'sháo,tiáo',
-    0x82D6: 'dí',
-    0x82D7: 'miáo',
-    0x82D8: 'qǐng',
-    0x82D9: 'lì,jī',
-    0x82DA: 'yòng',
-    0x82DB: 'kē,hē',
-    0x82DC: 'mù',
-    0x82DD: 'bèi',
-    0x82DE: 'bāo,páo,biāo',
-    0x82DF: 'gǒu,gōu',
-    0x82E0: 'mín',
-    0x82E1: 'yǐ',
-    0x82E2: 'yǐ',
-    0x82E3: 'jù,qǔ',
-    0x82E4: 'piě,pī',
-    0x82E5: 'ruò,ré,rè,rě',
-    0x82E6: 'kǔ,gǔ,hù',
-    0x82E7: 'níng,zhù',
-    0x82E8: 'nǐ',
-    0x82E9: 'bó,pā',
-    0x82EA: 'bǐng',
-    0x82EB: 'shān,shàn,tiān,chān',
-    0x82EC: 'xiú',
-    0x82ED: 'yǎo',
-    0x82EE: 'xiān',
-    0x82EF: 'běn',
-    0x82F0: 'hóng',
-    0x82F1: 'yīng,yāng',
-    0x82F2: 'zhǎ,zhà,zuó',
-    0x82F3: 'dōng',
-    0x82F4: 'jū,chá,zhǎ,zū,jiē,bāo,xié',
-    0x82F5: 'dié',
-    0x82F6: 'nié,niè',
-    0x82F7: 'gān',
-    0x82F8: 'hū',
-    0x82F9: 'píng,pēng',
-    0x82FA: 'méi',
-    0x82FB: 'fú,pú',
-    0x82FC: 'shēng,ruí',
-    0x82FD: 'gū,guā',
-    0x82FE: 'bì,bié,mì',
-    0x82FF: 'wèi',
-    0x8300: 'fú,bó,fèi,bèi,bì',
-    0x8301: 'zhuó,zhú',
-    0x8302: 'mào',
-    0x8303: 'fàn',
-    0x8304: 'jiā,qié',
-    0x8305: 'máo',
-    0x8306: 'máo,mǎo',
-    0x8307: 'bá,pèi,fèi',
-    0x8308: 'cí,zǐ,cǐ,chái',
-    0x8309: 'mò',
-    0x830A: 'zī',
-    0x830B: 'zhǐ,dǐ',
-    0x830C: 'chí',
-    0x830D: 'jì',
-    0x830E: 'jīng',
-    0x830F: 'lóng',
-    0x8310: 'cōng',
-    0x8311: 'niǎo',
-    0x8312: 'yuán',
-    0x8313: 'xué',
-    0x8314: 'yíng',
-    0x8315: 'qióng',
-    0x8316: 'gé,luò',
-    0x8317: 'míng',
-    0x8318: 'lì',
-    0x8319: 'róng',
-    0x831A: 'yìn',
-    0x831B: 'gèn,jiàn',
-    0x831C: 'qiàn,xī',
-    0x831D: 'chǎi,zhǐ',
-    0x831E: 'chén',
-    0x831F: 'yù,wěi',
-    0x8320: 'hāo,xiū,kòu',
-    0x8321: 'zì',
-    0x8322: 'liè',
-    0x8323: 'wú',
-    0x8324: 'jì,duō',
-    0x8325: 'guī,guì',
-    0x8326: 'cì',
-    0x8327: 'jiǎn,chóng',
-    0x8328: 'cí',
-    0x8329: 'gòu',
-    0x832A: 'guāng',
-    0x832B: 'máng,huǎng',
-    0x832C: 'chá,chí',
-    0x832D: 'jiāo,xiào,qiào',
-    0x832E: 'jiāo,niǎo',
-    0x832F: 'fú',
-    0x8330: 'yú',
-    0x8331: 'zhū',
-    0x8332: 'zī,cí',
-    0x8333: 'jiāng',
-    0x8334: 'huí',
-    0x8335: 'yīn',
-    0x8336: 'chá',
-    0x8337: 'fá,pèi,bó,bá',
-    0x8338: 'rōng,róng,rǒng',
-    0x8339: 'rú',
-    0x833A: 'chōng',
-    0x833B: 'mǎng,mǔ',
-    0x833C: 'tóng',
-    0x833D: 'zhòng',
-    0x833E: 'qiān',
-    0x833F: 'zhú',
-    0x8340: 'xún',
-    0x8341: 'huán',
-    0x8342: 'fū',
-    0x8343: 'quán,chuò',
-    0x8344: 'gāi',
-    0x8345: 'dā,dá,tà',
-    0x8346: 'jīng',
-    0x8347: 'xìng',
-    0x8348: 'chuǎn',
-    0x8349: 'cǎo,zào',
-    0x834A: 'jīng',
-    0x834B: 'ér',
-    0x834C: 'àn',
-    0x834D: 'qiáo',
-    0x834E: 'chí',
-    0x834F: 'rěn',
-    0x8350: 'jiàn',
-    0x8351: 'tí,yí',
-    0x8352: 'huāng,huǎng,kāng,huáng',
-    0x8353: 'píng,pēng',
-    0x8354: 'lì',
-    0x8355: 'jīn',
-    0x8356: 'lǎo,chā',
-    0x8357: 'shù',
-    0x8358: 'zhuāng',
-    0x8359: 'dá',
-    0x835A: 'jiá',
-    0x835B: 'ráo',
-    0x835C: 'bì',
-    0x835D: 'cè',
-    0x835E: 'qiáo',
-    0x835F: 'huì',
-    0x8360: 'jì,qí',
-    0x8361: 'dàng',
-    0x8362: 'zì',
-    0x8363: 'róng',
-    0x8364: 'hūn,xūn',
-    0x8365: 'xíng,yíng',
-    0x8366: 'luò',
-    0x8367: 'yíng',
-    0x8368: 'xún,qián',
-    0x8369: 'jìn',
-    0x836A: 'sūn',
-    0x836B: 'yīn,yìn',
-    0x836C: 'mǎi',
-    0x836D: 'hóng',
-    0x836E: 'zhòu',
-    0x836F: 'yào',
-    0x8370: 'dù',
-    0x8371: 'wěi,wèi',
-    0x8372: 'lí',
-    0x8373: 'dòu',
-    0x8374: 'fū',
-    0x8375: 'rěn',
-    0x8376: 'yín',
-    0x8377: 'hé,hè,hē',
-    0x8378: 'bí',
-    0x8379: 'bù,pú',
-    0x837A: 'yǔn,yún',
-    0x837B: 'dí',
-    0x837C: 'tú,chá,yé,shū',
-    0x837D: 'suī,wěi',
-    0x837E: 'suī',
-    0x837F: 'chéng',
-    0x8380: 'chén,nóng',
-    0x8381: 'wú',
-    0x8382: 'bié',
-    0x8383: 'xī',
-    0x8384: 'gěng',
-    0x8385: 'lì',
-    0x8386: 'pú,fǔ',
-    0x8387: 'zhù',
-    0x8388: 'mò',
-    0x8389: 'lì,lí,chí',
-    0x838A: 'zhuāng',
-    0x838B: 'zuó,jí',
-    0x838C: 'tuō',
-    0x838D: 'qiú',
-    0x838E: 'shā,suō,suī',
-    0x838F: 'suō',
-    0x8390: 'chén',
-    0x8391: 'péng,fēng',
-    0x8392: 'jǔ',
-    0x8393: 'méi',
-    0x8394: 'méng,xí,qǐng',
-    0x8395: 'xìng',
-    0x8396: 'jīng,yīng',
-    0x8397: 'chē',
-    0x8398: 'shēn,xīn',
-    0x8399: 'jūn',
-    0x839A: 'yán',
-    0x839B: 'tíng,tǐng',
-    0x839C: 'yóu,diào,dí',
-    0x839D: 'cuò',
-    0x839E: 'guǎn,wǎn,guān',
-    0x839F: 'hàn',
-    0x83A0: 'yǒu,xiù',
-    0x83A1: 'cuò',
-    0x83A2: 'jiá',
-    0x83A3: 'wáng',
-    0x83A4: 'sù,yóu',
-    0x83A5: 'niǔ,ròu',
-    0x83A6: 'shāo,xiāo',
-    0x83A7: 'xiàn,wàn',
-    0x83A8: 'làng,liáng,láng',
-    0x83A9: 'fú,piǎo',
-    0x83AA: 'é',
-    0x83AB: 'mò,mù',
-    0x83AC: 'wèn,wǎn,miǎn',
-    0x83AD: 'jié',
-    0x83AE: 'nán',
-    0x83AF: 'mù',
-    0x83B0: 'kǎn',
-    0x83B1: 'lái',
-    0x83B2: 'lián',
-    0x83B3: 'shí,shì',
-    0x83B4: 'wō',
-    0x83B5: 'tù',
-    0x83B6: 'xiān',
-    0x83B7: 'huò',
-    0x83B8: 'yóu',
-    0x83B9: 'yíng',
-    0x83BA: 'yīng',
-    0x83BB: 'gòng',
-    0x83BC: 'chún',
-    0x83BD: 'mǎng,máng',
-    0x83BE: 'mǎng',
-    0x83BF: 'cì',
-    0x83C0: 'wǎn,yù,yùn',
-    0x83C1: 'jīng',
-    0x83C2: 'dì',
-    0x83C3: 'qú',
-    0x83C4: 'dōng',
-    0x83C5: 'jiān,guān',
-    0x83C6: 'zōu,cuán,chù,cóng',
-    0x83C7: 'gū',
-    0x83C8: 'lā',
-    0x83C9: 'lù,lǜ',
-    0x83CA: 'jú',
-    0x83CB: 'wèi',
-    0x83CC: 'jūn,jùn',
-    0x83CD: 'niè,rěn',
-    0x83CE: 'kūn',
-    0x83CF: 'hé,gē',
-    0x83D0: 'pú',
-    0x83D1: 'zāi,zī,zì',
-    0x83D2: 'gǎo',
-    0x83D3: 'guǒ',
-    0x83D4: 'fú',
-    0x83D5: 'lún',
-    0x83D6: 'chāng',
-    0x83D7: 'chóu',
-    0x83D8: 'sōng',
-    0x83D9: 'chuí',
-    0x83DA: 'zhàn',
-    0x83DB: 'mén',
-    0x83DC: 'cài',
-    0x83DD: 'bá',
-    0x83DE: 'lí',
-    0x83DF: 'tú,tù',
-    0x83E0: 'bō',
-    0x83E1: 'hàn',
-    0x83E2: 'bào',
-    0x83E3: 'qìn',
-    0x83E4: 'juǎn',
-    0x83E5: 'xī,sī',
-    0x83E6: 'qín',
-    0x83E7: 'dǐ',
-    0x83E8: 'jiē,shà',
-    0x83E9: 'pú,bèi,bó',
-    0x83EA: 'dàng',
-    0x83EB: 'jǐn',
-    0x83EC: 'qiáo,zhǎo',
-    0x83ED: 'tái,zhī,chí',
-    0x83EE: 'gēng',
-    0x83EF: 'huá,huā,huà,kuā',
-    0x83F0: 'gū',
-    0x83F1: 'líng',
-    0x83F2: 'fēi,fěi,fèi',
-    0x83F3: 'qín,qīn,jīn',
-    0x83F4: 'ān,yǎn',
-    0x83F5: 'wǎng',
-    0x83F6: 'běng',
-    0x83F7: 'zhǒu',
-    0x83F8: 'yān,yū,yù',
-    0x83F9: 'jū,zū,jù',
-    0x83FA: 'jiān',
-    0x83FB: 'lǐn',
-    0x83FC: 'tǎn',
-    0x83FD: 'shū,jiāo',
-    0x83FE: 'tián,tiàn',
-    0x83FF: 'dào,dǎo',
-    0x8400: 'hǔ',
-    0x8401: 'qí,jī',
-    0x8402: 'hé',
-    0x8403: 'cuì',
-    0x8404: 'táo',
-    0x8405: 'chūn',
-    0x8406: 'bì,pì,bēi,bá',
-    0x8407: 'cháng',
-    0x8408: 'huán',
-    0x8409: 'fèi,féi,fú',
-    0x840A: 'lái',
-    0x840B: 'qī',
-    0x840C: 'méng,míng',
-    0x840D: 'píng',
-    0x840E: 'wēi,wěi,wèi',
-    0x840F: 'dàn',
-    0x8410: 'shà',
-    0x8411: 'huán,zhuī',
-    0x8412: 'yǎn,juàn',
-    0x8413: 'yí',
-    0x8414: 'tiáo',
-    0x8415: 'qí',
-    0x8416: 'wǎn',
-    0x8417: 'cè',
-    0x8418: 'nài',
-    0x8419: 'zhěn',
-    0x841A: 'tuò',
-    0x841B: 'jiū',
-    0x841C: 'tiē',
-    0x841D: 'luó',
-    0x841E: 'bì',
-    0x841F: 'yì',
-    0x8420: 'pān',
-    0x8421: 'bo',
-    0x8422: 'pāo',
-    0x8423: 'dìng',
-    0x8424: 'yíng',
-    0x8425: 'yíng',
-    0x8426: 'yíng',
-    0x8427: 'xiāo',
-    0x8428: 'sà',
-    0x8429: 'qiū,jiāo',
-    0x842A: 'kē',
-    0x842B: 'xiàng',
-    0x842C: 'wàn',
-    0x842D: 'yǔ,jǔ',
-    0x842E: 'yú,yǔ,yù',
-    0x842F: 'fù,bèi',
-    0x8430: 'liàn',
-    0x8431: 'xuān',
-    0x8432: 'xuān',
-    0x8433: 'nǎn,nán',
-    0x8434: 'cè',
-    0x8435: 'wō',
-    0x8436: 'chǔn',
-    0x8437: 'xiāo,shāo,shuò',
-    0x8438: 'yú',
-    0x8439: 'biǎn,biān,pián',
-    0x843A: 'mào,mù',
-    0x843B: 'ān',
-    0x843C: 'è',
-    0x843D: 'luò,là,lào,luō',
-    0x843E: 'yíng',
-    0x843F: 'kuò,huó',
-    0x8440: 'kuò',
-    0x8441: 'jiāng',
-    0x8442: 'miǎn',
-    0x8443: 'zuò,zé',
-    0x8444: 'zuò',
-    0x8445: 'zū',
-    0x8446: 'bǎo,bāo',
-    0x8447: 'róu,rǒu',
-    0x8448: 'xǐ',
-    0x8449: 'yè,shè',
-    0x844A: 'ān',
-    0x844B: 'qú',
-    0x844C: 'jiān',
-    0x844D: 'fú',
-    0x844E: 'lǜ',
-    0x844F: 'jīng',
-    0x8450: 'pén,fén',
-    0x8451: 'fēng,fèng',
-    0x8452: 'hóng',
-    0x8453: 'hóng',
-    0x8454: 'hóu',
-    0x8455: 'yàn',
-    0x8456: 'tū',
-    0x8457: 'zhù,zhe,zhuó,chú,zhāo,zháo',
-    0x8458: 'zī',
-    0x8459: 'xiāng',
-    0x845A: 'rèn,shèn',
-    0x845B: 'gé,gě',
-    0x845C: 'qiā',
-    0x845D: 'qíng,jìng',
-    0x845E: 'mǐ',
-    0x845F: 'huáng',
-    0x8460: 'shēn,shān',
-    0x8461: 'pú,bèi',
-    0x8462: 'gài',
-    0x8463: 'dǒng,zhǒng',
-    0x8464: 'zhòu',
-    0x8465: 'jiàn,qián',
-    0x8466: 'wěi',
-    0x8467: 'bó',
-    0x8468: 'wēi',
-    0x8469: 'pā',
-    0x846A: 'jì',
-    0x846B: 'hú',
-    0x846C: 'zàng',
-    0x846D: 'jiā,xiá',
-    0x846E: 'duàn',
-    0x846F: 'yào',
-    0x8470: 'suī,jùn,suǒ',
-    0x8471: 'cōng,chuāng',
-    0x8472: 'quán',
-    0x8473: 'wēi',
-    0x8474: 'zhēn,qián',
-    0x8475: 'kuí',
-    0x8476: 'tíng,dǐng',
-    0x8477: 'hūn,xūn',
-    0x8478: 'xǐ',
-    0x8479: 'shī',
-    0x847A: 'qì',
-    0x847B: 'lán',
-    0x847C: 'zōng',
-    0x847D: 'yāo,yǎo',
-    0x847E: 'yuān',
-    0x847F: 'méi',
-    0x8480: 'yūn',
-    0x8481: 'shù',
-    0x8482: 'dì',
-    0x8483: 'zhuàn',
-    0x8484: 'guān',
-    0x8485: 'rǎn',
-    0x8486: 'xuē',
-    0x8487: 'chǎn',
-    0x8488: 'kǎi',
-    0x8489: 'kuì',
-    0x848A: 'huā',
-    0x848B: 'jiǎng',
-    0x848C: 'lóu',
-    0x848D: 'wěi,huā,kuī,é',
-    0x848E: 'pài',
-    0x848F: 'you',
-    0x8490: 'sōu,huì',
-    0x8491: 'yīn',
-    0x8492: 'shī',
-    0x8493: 'chún',
-    0x8494: 'shí,shì',
-    0x8495: 'yūn',
-    0x8496: 'zhēn',
-    0x8497: 'làng',
-    0x8498: 'rú,ná',
-    0x8499: 'méng,mēng,měng',
-    0x849A: 'lì',
-    0x849B: 'quē',
-    0x849C: 'suàn',
-    0x849D: 'yuán,huán',
-    0x849E: 'lì',
-    0x849F: 'jǔ',
-    0x84A0: 'xī',
-    0x84A1: 'bàng,páng',
-    0x84A2: 'chú',
-    0x84A3: 'xú,shú',
-    0x84A4: 'tú',
-    0x84A5: 'liú',
-    0x84A6: 'huò,wò',
-    0x84A7: 'diǎn',
-    0x84A8: 'qiàn',
-    0x84A9: 'zū,jù,jí',
-    0x84AA: 'pò',
-    0x84AB: 'cuó',
-    0x84AC: 'yuān',
-    0x84AD: 'chú',
-    0x84AE: 'yù',
-    0x84AF: 'kuǎi,kuài',
-    0x84B0: 'pán',
-    0x84B1: 'pú',
-    0x84B2: 'pú,bó',
-    0x84B3: 'nà',
-    0x84B4: 'shuò',
-    0x84B5: 'xí,xì',
-    0x84B6: 'fén',
-    0x84B7: 'yún',
-    0x84B8: 'zhēng',
-    0x84B9: 'jiān',
-    0x84BA: 'jí',
-    0x84BB: 'ruò',
-    0x84BC: 'cāng,cǎng',
-    0x84BD: 'ēn',
-    0x84BE: 'mí',
-    0x84BF: 'hāo,gǎo',
-    0x84C0: 'sūn',
-    0x84C1: 'zhēn,qín',
-    0x84C2: 'míng,mì',
-    0x84C3: 'sōu,sǒu',
-    0x84C4: 'xù',
-    0x84C5: 'liú',
-    0x84C6: 'xí',
-    0x84C7: 'gǔ,gū',
-    0x84C8: 'láng',
-    0x84C9: 'róng',
-    0x84CA: 'wěng',
-    0x84CB: 'gài,gě',
-    0x84CC: 'cuò',
-    0x84CD: 'shī',
-    0x84CE: 'táng',
-    0x84CF: 'luǒ',
-    0x84D0: 'rù',
-    0x84D1: 'suō,suī',
-    0x84D2: 'xuān',
-    0x84D3: 'bèi',
-    0x84D4: 'yǎo,zhuó',
-    0x84D5: 'guì',
-    0x84D6: 'bì',
-    0x84D7: 'zǒng',
-    0x84D8: 'gǔn',
-    0x84D9: 'zuò',
-    0x84DA: 'tiáo',
-    0x84DB: 'cè',
-    0x84DC: 'pèi',
-    0x84DD: 'lán,la',
-    0x84DE: 'dàn',
-    0x84DF: 'jì',
-    0x84E0: 'lí',
-    0x84E1: 'shēn',
-    0x84E2: 'lǎng',
-    0x84E3: 'yù',
-    0x84E4: 'líng',
-    0x84E5: 'yíng',
-    0x84E6: 'mò',
-    0x84E7: 'diào,tiáo,dí',
-    0x84E8: 'tiáo,xiū',
-    0x84E9: 'mǎo',
-    0x84EA: 'tōng',
-    0x84EB: 'chù,zhú',
-    0x84EC: 'péng,pèng',
-    0x84ED: 'ān',
-    0x84EE: 'lián,liǎn',
-    0x84EF: 'cōng,zǒng,sǒng',
-    0x84F0: 'xǐ',
-    0x84F1: 'píng',
-    0x84F2: 'qiū,ōu,xū,fū',
-    0x84F3: 'jǐn',
-    0x84F4: 'chún,tuán',
-    0x84F5: 'jié',
-    0x84F6: 'wéi',
-    0x84F7: 'tuī',
-    0x84F8: 'cáo',
-    0x84F9: 'yù',
-    0x84FA: 'yì',
-    0x84FB: 'zí,jú',
-    0x84FC: 'liǎo,lù,lǎo,liǔ',
-    0x84FD: 'bì',
-    0x84FE: 'lǔ',
-    0x84FF: 'xu,sù',
-    0x8500: 'bù',
-    0x8501: 'zhāng',
-    0x8502: 'léi',
-    0x8503: 'qiáng,jiàng',
-    0x8504: 'màn',
-    0x8505: 'yán',
-    0x8506: 'líng',
-    0x8507: 'jì,xì',
-    0x8508: 'biāo,piào,piǎo,biào',
-    0x8509: 'gǔn',
-    0x850A: 'hǎn,hàn',
-    0x850B: 'dí',
-    0x850C: 'sù',
-    0x850D: 'lù,cū',
-    0x850E: 'shè',
-    0x850F: 'shāng',
-    0x8510: 'dí',
-    0x8511: 'miè',
-    0x8512: 'xūn',
-    0x8513: 'màn,mán,wàn',
-    0x8514: 'bó,bo',
-    0x8515: 'dì,dài,chài',
-    0x8516: 'cuó,cǔ,zhā',
-    0x8517: 'zhè',
-    0x8518: 'shēn,sān,sǎn',
-    0x8519: 'xuàn',
-    0x851A: 'wèi,yù',
-    0x851B: 'hú',
-    0x851C: 'áo',
-    0x851D: 'mǐ',
-    0x851E: 'lóu,lǚ,jù,liǔ',
-    0x851F: 'cù,còu,chuò',
-    0x8520: 'zhōng',
-    0x8521: 'cài,sà,cā',
-    0x8522: 'pó,bò',
-    0x8523: 'jiǎng,jiāng',
-    0x8524: 'mì',
-    0x8525: 'cōng',
-    0x8526: 'niǎo',
-    0x8527: 'huì',
-    0x8528: 'juàn,jùn',
-    0x8529: 'yín',
-    0x852A: 'jiàn,jiān,shān',
-    0x852B: 'niān,yān,yàn',
-    0x852C: 'shū,shǔ',
-    0x852D: 'yīn,yìn',
-    0x852E: 'guó',
-    0x852F: 'chén',
-    0x8530: 'hù',
-    0x8531: 'shā',
-    0x8532: 'kòu',
-    0x8533: 'qiàn',
-    0x8534: 'má',
-    0x8535: 'zāng,cáng',
-    0x8536: 'zé',
-    0x8537: 'qiáng',
-    0x8538: 'dōu',
-    0x8539: 'liǎn',
-    0x853A: 'lìn',
-    0x853B: 'kòu',
-    0x853C: 'ǎi',
-    0x853D: 'bì,biē,piē',
-    0x853E: 'lí',
-    0x853F: 'wěi',
-    0x8540: 'jí',
-    0x8541: 'qián,tán,xún',
-    0x8542: 'shèng',
-    0x8543: 'fān,bō,fán,pí',
-    0x8544: 'méng',
-    0x8545: 'ǒu',
-    0x8546: 'chǎn',
-    0x8547: 'diǎn',
-    0x8548: 'xùn,tán',
-    0x8549: 'jiāo,qiáo,qiāo',
-    0x854A: 'ruǐ,juǎn',
-    0x854B: 'ruǐ',
-    0x854C: 'lěi',
-    0x854D: 'yú',
-    0x854E: 'qiáo,jiāo',
-    0x854F: 'chú',
-    0x8550: 'huá',
-    0x8551: 'jiān',
-    0x8552: 'mǎi',
-    0x8553: 'yún',
-    0x8554: 'bāo',
-    0x8555: 'yóu',
-    0x8556: 'qú',
-    0x8557: 'lù',
-    0x8558: 'ráo,yáo',
-    0x8559: 'huì',
-    0x855A: 'è',
-    0x855B: 'tí',
-    0x855C: 'fěi',
-    0x855D: 'jué,zuì',
-    0x855E: 'zuì,jué,zhuó',
-    0x855F: 'fà,fèi',
-    0x8560: 'rú',
-    0x8561: 'fén,fèi',
-    0x8562: 'kuì,kuài',
-    0x8563: 'shùn',
-    0x8564: 'ruí',
-    0x8565: 'yǎ',
-    0x8566: 'xū',
-    0x8567: 'fù',
-    0x8568: 'jué',
-    0x8569: 'dàng,tāng,tàng',
-    0x856A: 'wú,wǔ',
-    0x856B: 'dǒng',
-    0x856C: 'sī',
-    0x856D: 'xiāo',
-    0x856E: 'xì',
-    0x856F: 'lóng',
-    0x8570: 'wēn,yùn',
-    0x8571: 'shāo',
-    0x8572: 'qí',
-    0x8573: 'jiān',
-    0x8574: 'yùn',
-    0x8575: 'sūn',
-    0x8576: 'líng',
-    0x8577: 'yù',
-    0x8578: 'xiá',
-    0x8579: 'wèng,yōng',
-    0x857A: 'jí,qiè',
-    0x857B: 'hóng,hòng',
-    0x857C: 'sì',
-    0x857D: 'nóng',
-    0x857E: 'lěi',
-    0x857F: 'xuān',
-    0x8580: 'yùn',
-    0x8581: 'yù,ào',
-    0x8582: 'xí,xiào',
-    0x8583: 'hào',
-    0x8584: 'báo,bó,bò,bù',
-    0x8585: 'hāo',
-    0x8586: 'ài',
-    0x8587: 'wēi',
-    0x8588: 'huì',
-    0x8589: 'huì',
-    0x858A: 'jì',
-    0x858B: 'cí,zī',
-    0x858C: 'xiāng,xiǎng',
-    0x858D: 'wàn,luàn',
-    0x858E: 'miè',
-    0x858F: 'yì',
-    0x8590: 'léng',
-    0x8591: 'jiāng',
-    0x8592: 'càn',
-    0x8593: 'shēn',
-    0x8594: 'qiáng,sè',
-    0x8595: 'lián',
-    0x8596: 'kē',
-    0x8597: 'yuán',
-    0x8598: 'dá',
-    0x8599: 'tì,zhì',
-    0x859A: 'tāng',
-    0x859B: 'xuē',
-    0x859C: 'bì,bò,bó,bài,pì',
-    0x859D: 'zhān',
-    0x859E: 'sūn',
-    0x859F: 'xiān,liǎn,yán,kàn',
-    0x85A0: 'fán',
-    0x85A1: 'dǐng',
-    0x85A2: 'xiè',
-    0x85A3: 'gǔ',
-    0x85A4: 'xiè',
-    0x85A5: 'shǔ,zhú',
-    0x85A6: 'jiàn',
-    0x85A7: 'hāo,kǎo',
-    0x85A8: 'hōng',
-    0x85A9: 'sà',
-    0x85AA: 'xīn',
-    0x85AB: 'xūn',
-    0x85AC: 'yào',
-    0x85AD: 'bài',
-    0x85AE: 'sǒu',
-    0x85AF: 'shǔ',
-    0x85B0: 'xūn',
-    0x85B1: 'duì',
-    0x85B2: 'pín',
-    0x85B3: 'wěi,yuǎn',
-    0x85B4: 'níng',
-    0x85B5: 'chóu,zhòu,dào',
-    0x85B6: 'mái,wō',
-    0x85B7: 'rú',
-    0x85B8: 'piáo',
-    0x85B9: 'tái',
-    0x85BA: 'jì,cí,qì,qí',
-    0x85BB: 'zǎo',
-    0x85BC: 'chén',
-    0x85BD: 'zhēn',
-    0x85BE: 'ěr',
-    0x85BF: 'nǐ',
-    0x85C0: 'yíng',
-    0x85C1: 'gǎo',
-    0x85C2: 'cóng,còng',
-    0x85C3: 'xiāo,hào,hè',
-    0x85C4: 'qí',
-    0x85C5: 'fá',
-    0x85C6: 'jiǎn',
-    0x85C7: 'xù,yǔ,yú,yù,xū',
-    0x85C8: 'kuí',
-    0x85C9: 'jí,jiè',
-    0x85CA: 'biǎn',
-    0x85CB: 'diào,dí,zhuó',
-    0x85CC: 'mì',
-    0x85CD: 'lán,la',
-    0x85CE: 'jìn',
-    0x85CF: 'cáng,zàng,zāng',
-    0x85D0: 'miǎo,mò',
-    0x85D1: 'qióng',
-    0x85D2: 'qiè',
-    0x85D3: 'xiǎn',
-    0x85D4: 'liáo',
-    0x85D5: 'ǒu',
-    0x85D6: 'xián,qiān',
-    0x85D7: 'sù',
-    0x85D8: 'lǘ',
-    0x85D9: 'yì',
-    0x85DA: 'xù',
-    0x85DB: 'xiě',
-    0x85DC: 'lí',
-    0x85DD: 'yì',
-    0x85DE: 'lǎ',
-    0x85DF: 'lěi',
-    0x85E0: 'jiào',
-    0x85E1: 'dí',
-    0x85E2: 'zhǐ',
-    0x85E3: 'bēi',
-    0x85E4: 'téng',
-    0x85E5: 'yào,shuò,lüè',
-    0x85E6: 'mò,mó',
-    0x85E7: 'huàn',
-    0x85E8: 'biāo,pāo',
-    0x85E9: 'fān,fán',
-    0x85EA: 'sǒu,shǔ,còu',
-    0x85EB: 'tán',
-    0x85EC: 'tuī',
-    0x85ED: 'qióng',
-    0x85EE: 'qiáo',
-    0x85EF: 'wèi',
-    0x85F0: 'liú,liǔ',
-    0x85F1: 'huì,huí',
-    0x85F2: 'ōu',
-    0x85F3: 'gǎo',
-    0x85F4: 'yùn,wēn',
-    0x85F5: 'bǎo',
-    0x85F6: 'lì',
-    0x85F7: 'shǔ,zhū',
-    0x85F8: 'chú,zhū,zhā',
-    0x85F9: 'ǎi',
-    0x85FA: 'lìn',
-    0x85FB: 'zǎo',
-    0x85FC: 'xuān',
-    0x85FD: 'qìn',
-    0x85FE: 'lài',
-    0x85FF: 'huò,hé',
-    0x8600: 'tuò,zé',
-    0x8601: 'wù,è',
-    0x8602: 'ruǐ',
-    0x8603: 'ruǐ',
-    0x8604: 'qí,jī,qín',
-    0x8605: 'héng',
-    0x8606: 'lú,lǔ',
-    0x8607: 'sū',
-    0x8608: 'tuí',
-    0x8609: 'méng,máng',
-    0x860A: 'yùn',
-    0x860B: 'píng,pín',
-    0x860C: 'yǔ',
-    0x860D: 'xūn',
-    0x860E: 'jì',
-    0x860F: 'jiōng',
-    0x8610: 'xuān',
-    0x8611: 'mó',
-    0x8612: 'qiū',
-    0x8613: 'sū',
-    0x8614: 'jiōng',
-    0x8615: 'péng',
-    0x8616: 'niè,bò',
-    0x8617: 'bò,bì',
-    0x8618: 'ráng,xiāng,nāng',
-    0x8619: 'yì',
-    0x861A: 'xiǎn',
-    0x861B: 'yú',
-    0x861C: 'jú',
-    0x861D: 'liǎn',
-    0x861E: 'liǎn,xiān',
-    0x861F: 'yǐn',
-    0x8620: 'qiáng',
-    0x8621: 'yīng',
-    0x8622: 'lóng,lǒng,lòng',
-    0x8623: 'tǒu',
-    0x8624: 'huā',
-    0x8625: 'yuè',
-    0x8626: 'líng',
-    0x8627: 'qú,jù',
-    0x8628: 'yáo',
-    0x8629: 'fán',
-    0x862A: 'méi',
-    0x862B: 'hàn,làn',
-    0x862C: 'kuī,huǐ,guī',
-    0x862D: 'lán',
-    0x862E: 'jì',
-    0x862F: 'dàng',
-    0x8630: 'màn',
-    0x8631: 'lèi',
-    0x8632: 'léi',
-    0x8633: 'huī',
-    0x8634: 'fēng,sōng',
-    0x8635: 'zhī',
-    0x8636: 'wèi',
-    0x8637: 'kuí',
-    0x8638: 'zhàn',
-    0x8639: 'huái',
-    0x863A: 'lí',
-    0x863B: 'jì',
-    0x863C: 'mí',
-    0x863D: 'lěi',
-    0x863E: 'huài',
-    0x863F: 'luó',
-    0x8640: 'jī',
-    0x8641: 'kuí',
-    0x8642: 'lù',
-    0x8643: 'jiān',
-    0x8644: 'sà',
-    0x8645: 'téng',
-    0x8646: 'léi',
-    0x8647: 'quǎn',
-    0x8648: 'xiāo',
-    0x8649: 'yì',
-    0x864A: 'luán',
-    0x864B: 'mén',
-    0x864C: 'biē',
-    0x864D: 'hū',
-    0x864E: 'hǔ,hù',
-    0x864F: 'lǔ',
-    0x8650: 'nüè',
-    0x8651: 'lǜ,bì',
-    0x8652: 'sī,xī,tí,zhì',
-    0x8653: 'xiāo',
-    0x8654: 'qián',
-    0x8655: 'chù,chǔ,jù',
-    0x8656: 'hū,hú,hù',
-    0x8657: 'xū',
-    0x8658: 'cuó',
-    0x8659: 'fú',
-    0x865A: 'xū',
-    0x865B: 'xū',
-    0x865C: 'lǔ',
-    0x865D: 'hǔ',
-    0x865E: 'yú',
-    0x865F: 'hào,háo',
-    0x8660: 'jiāo,háo',
-    0x8661: 'jù',
-    0x8662: 'guó',
-    0x8663: 'bào',
-    0x8664: 'yán',
-    0x8665: 'zhàn',
-    0x8666: 'zhàn',
-    0x8667: 'kuī',
-    0x8668: 'bīn',
-    0x8669: 'xì,sè',
-    0x866A: 'shù',
-    0x866B: 'chóng,huǐ',
-    0x866C: 'qiú',
-    0x866D: 'diāo,dāo',
-    0x866E: 'jǐ,jī',
-    0x866F: 'qiú',
-    0x8670: 'dīng,chēng',
-    0x8671: 'shī',
-    0x8672: 'xiā',
-    0x8673: 'jué',
-    0x8674: 'zhé',
-    0x8675: 'shé,yě',
-    0x8676: 'yū',
-    0x8677: 'hán,gān',
-    0x8678: 'zǐ',
-    0x8679: 'hóng,jiàng,hòng,gòng',
-    0x867A: 'huī,huǐ',
-    0x867B: 'méng',
-    0x867C: 'gè',
-    0x867D: 'suī',
-    0x867E: 'xiā,há',
-    0x867F: 'chài',
-    0x8680: 'shí',
-    0x8681: 'yǐ',
-    0x8682: 'mǎ,mà,mā',
-    0x8683: 'xiǎng',
-    0x8684: 'fāng,bàng',
-    0x8685: 'è',
-    0x8686: 'bā',
-    0x8687: 'chǐ',
-    0x8688: 'qiān',
-    0x8689: 'wén',
-    0x868A: 'wén',
-    0x868B: 'ruì',
-    0x868C: 'bàng,bèng,pí,fēng',
-    0x868D: 'pí',
-    0x868E: 'yuè',
-    0x868F: 'yuè',
-    0x8690: 'jūn',
-    0x8691: 'qí',
-    0x8692: 'tóng',
-    0x8693: 'yǐn',
-    0x8694: 'qí,zhǐ',
-    0x8695: 'cán,tiǎn',
-    0x8696: 'yuán,wán',
-    0x8697: 'jué,quē',
-    0x8698: 'huí,huì,yóu',
-    0x8699: 'qín,qián',
-    0x869A: 'qí',
-    0x869B: 'zhòng',
-    0x869C: 'yá',
-    0x869D: 'háo,cì',
-    0x869E: 'mù',
-    0x869F: 'wáng',
-    0x86A0: 'fén',
-    0x86A1: 'fén',
-    0x86A2: 'háng',
-    0x86A3: 'gōng,zhōng',
-    0x86A4: 'zǎo,zhǎo',
-    0x86A5: 'fù,fǔ',
-    0x86A6: 'rán',
-    0x86A7: 'jiè',
-    0x86A8: 'fú',
-    0x86A9: 'chī',
-    0x86AA: 'dǒu',
-    0x86AB: 'bào,páo',
-    0x86AC: 'xiǎn',
-    0x86AD: 'ní',
-    0x86AE: 'dài',
-    0x86AF: 'qiū',
-    0x86B0: 'yóu,zhú',
-    0x86B1: 'zhà',
-    0x86B2: 'píng',
-    0x86B3: 'chí,chī,dì',
-    0x86B4: 'yòu,yǒu,niù',
-    0x86B5: 'hé,kè',
-    0x86B6: 'hān,hán',
-    0x86B7: 'jù',
-    0x86B8: 'lì',
-    0x86B9: 'fù',
-    0x86BA: 'rán,tiàn',
-    0x86BB: 'zhá',
-    0x86BC: 'gǒu,qú,xù',
-    0x86BD: 'pí',
-    0x86BE: 'pí,bǒ',
-    0x86BF: 'xián',
-    0x86C0: 'zhù',
-    0x86C1: 'diāo',
-    0x86C2: 'bié',
-    0x86C3: 'bǐng',
-    0x86C4: 'gū,gǔ',
-    0x86C5: 'zhān',
-    0x86C6: 'qū,jū',
-    0x86C7: 'shé,yí,tuó,chí',
-    0x86C8: 'tiě',
-    0x86C9: 'líng',
-    0x86CA: 'gǔ',
-    0x86CB: 'dàn',
-    0x86CC: 'gǔ',
-    0x86CD: 'yíng',
-    0x86CE: 'lì',
-    0x86CF: 'chēng',
-    0x86D0: 'qū',
-    0x86D1: 'móu,máo',
-    0x86D2: 'gé,luò',
-    0x86D3: 'cì',
-    0x86D4: 'huí',
-    0x86D5: 'huí,huǐ',
-    0x86D6: 'máng,bàng',
-    0x86D7: 'fù',
-    0x86D8: 'yáng,yǎng',
-    0x86D9: 'wā,jué',
-    0x86DA: 'liè',
-    0x86DB: 'zhū',
-    0x86DC: 'yī',
-    0x86DD: 'xián',
-    0x86DE: 'kuò,shé',
-    0x86DF: 'jiāo',
-    0x86E0: 'lì',
-    0x86E1: 'yì,xǔ',
-    0x86E2: 'píng',
-    0x86E3: 'qī,jié,qiè',
-    0x86E4: 'há,gé,hā,é',
-    0x86E5: 'shé',
-    0x86E6: 'yí',
-    0x86E7: 'wǎng',
-    0x86E8: 'mò',
-    0x86E9: 'qióng,gǒng',
-    0x86EA: 'qiè,ní',
-    0x86EB: 'guǐ',
-    0x86EC: 'qióng',
-    0x86ED: 'zhì',
-    0x86EE: 'mán',
-    0x86EF: 'lǎo',
-    0x86F0: 'zhé',
-    0x86F1: 'jiá',
-    0x86F2: 'náo',
-    0x86F3: 'sī',
-    0x86F4: 'qí',
-    0x86F5: 'xīng',
-    0x86F6: 'jiè',
-    0x86F7: 'qiú',
-    0x86F8: 'shāo,xiāo',
-    0x86F9: 'yǒng',
-    0x86FA: 'jiá',
-    0x86FB: 'tuì',
-    0x86FC: 'chē',
-    0x86FD: 'bèi',
-    0x86FE: 'é,yǐ',
-    0x86FF: 'hàn',
-    0x8700: 'shǔ',
-    0x8701: 'xuán',
-    0x8702: 'fēng',
-    0x8703: 'shèn',
-    0x8704: 'shèn,zhèn',
-    0x8705: 'fǔ,pú',
-    0x8706: 'xiàn,xiǎn',
-    0x8707: 'zhē,zhé',
-    0x8708: 'wú',
-    0x8709: 'fú',
-    0x870A: 'lí',
-    0x870B: 'láng,liáng',
-    0x870C: 'bì',
-    0x870D: 'chú,yú',
-    0x870E: 'yuān,xuān',
-    0x870F: 'yǒu',
-    0x8710: 'jié',
-    0x8711: 'dàn',
-    0x8712: 'yán,yàn,dàn',
-    0x8713: 'tíng,diàn',
-    0x8714: 'diàn',
-    0x8715: 'tuì,yuè',
-    0x8716: 'huí',
-    0x8717: 'wō',
-    0x8718: 'zhī',
-    0x8719: 'sōng',
-    0x871A: 'fēi,fěi,pèi,bèi',
-    0x871B: 'jū',
-    0x871C: 'mì',
-    0x871D: 'qí',
-    0x871E: 'qí',
-    0x871F: 'yù',
-    0x8720: 'jùn',
-    0x8721: 'là,qù,zhà,jí',
-    0x8722: 'měng,mèng',
-    0x8723: 'qiāng',
-    0x8724: 'sī,xī',
-    0x8725: 'xī',
-    0x8726: 'lún,lǔn',
-    0x8727: 'lì',
-    0x8728: 'dié',
-    0x8729: 'tiáo,diào',
-    0x872A: 'táo',
-    0x872B: 'kūn',
-    0x872C: 'hán',
-    0x872D: 'hàn',
-    0x872E: 'yù,guō',
-    0x872F: 'bàng',
-    0x8730: 'féi,fèi',
-    0x8731: 'pí,miáo',
-    0x8732: 'wēi,wěi',
-    0x8733: 'dūn,tūn',
-    0x8734: 'yì,xí',
-    0x8735: 'yuān,yūn',
-    0x8736: 'suò',
-    0x8737: 'quán,juǎn',
-    0x8738: 'qiǎn',
-    0x8739: 'ruì,wèi',
-    0x873A: 'ní',
-    0x873B: 'qīng,jīng',
-    0x873C: 'wèi,wěi,tóng',
-    0x873D: 'liǎng',
-    0x873E: 'guǒ,luǒ',
-    0x873F: 'wān,wǎn',
-    0x8740: 'dōng',
-    0x8741: 'è',
-    0x8742: 'bǎn',
-    0x8743: 'dì,zhuō',
-    0x8744: 'wǎng',
-    0x8745: 'cán',
-    0x8746: 'yǎng',
-    0x8747: 'yíng',
-    0x8748: 'guō',
-    0x8749: 'chán',
-    0x874A: 'dìng',
-    0x874B: 'là',
-    0x874C: 'kē',
-    0x874D: 'jié,jí',
-    0x874E: 'xiē,hé',
-    0x874F: 'tíng',
-    0x8750: 'mào',
-    0x8751: 'xū,xiè',
-    0x8752: 'mián',
-    0x8753: 'yú',
-    0x8754: 'jiē',
-    0x8755: 'shí,lì,lóng',
-    0x8756: 'xuān',
-    0x8757: 'huáng',
-    0x8758: 'yǎn',
-    0x8759: 'biān,pián',
-    0x875A: 'róu,náo',
-    0x875B: 'wēi',
-    0x875C: 'fù',
-    0x875D: 'yuán,yuān',
-    0x875E: 'mèi',
-    0x875F: 'wèi',
-    0x8760: 'fú',
-    0x8761: 'rú,ruǎn',
-    0x8762: 'xié',
-    0x8763: 'yóu',
-    0x8764: 'qiú,yóu,jiū',
-    0x8765: 'máo,wú,wù',
-    0x8766: 'xiā,há,jiǎ',
-    0x8767: 'yīng',
-    0x8768: 'shī',
-    0x8769: 'chóng,zhōng',
-    0x876A: 'tāng',
-    0x876B: 'zhū',
-    0x876C: 'zōng',
-    0x876D: 'tí,chí',
-    0x876E: 'fù',
-    0x876F: 'yuán',
-    0x8770: 'kuí',
-    0x8771: 'méng',
-    0x8772: 'là',
-    0x8773: 'dú,dài',
-    0x8774: 'hú',
-    0x8775: 'qiū',
-    0x8776: 'dié,tiē',
-    0x8777: 'lì,xí',
-    0x8778: 'wō,luó,guǒ',
-    0x8779: 'yūn,ǎo',
-    0x877A: 'qǔ,yǔ',
-    0x877B: 'nǎn',
-    0x877C: 'lóu',
-    0x877D: 'chūn',
-    0x877E: 'róng',
-    0x877F: 'yíng',
-    0x8780: 'jiāng',
-    0x8781: 'ban',
-    0x8782: 'láng',
-    0x8783: 'páng,bǎng',
-    0x8784: 'sī',
-    0x8785: 'xī,cì',
-    0x8786: 'cì',
-    0x8787: 'xī,qī',
-    0x8788: 'yuán',
-    0x8789: 'wēng',
-    0x878A: 'lián',
-    0x878B: 'sōu',
-    0x878C: 'bān,pán,huàn',
-    0x878D: 'róng',
-    0x878E: 'róng',
-    0x878F: 'jí',
-    0x8790: 'wū',
-    0x8791: 'xiù',
-    0x8792: 'hàn',
-    0x8793: 'qín',
-    0x8794: 'yí,sī',
-    0x8795: 'bī,pī',
-    0x8796: 'huá',
-    0x8797: 'táng',
-    0x8798: 'yǐ',
-    0x8799: 'dù',
-    0x879A: 'nài,nái,něng',
-    0x879B: 'hé,xiá',
-    0x879C: 'hú',
-    0x879D: 'guī,huǐ',
-    0x879E: 'mǎ,mā,mà',
-    0x879F: 'míng',
-    0x87A0: 'yì',
-    0x87A1: 'wén',
-    0x87A2: 'yíng',
-    0x87A3: 'tè,téng',
-    0x87A4: 'zhōng',
-    0x87A5: 'cāng',
-    0x87A6: 'sāo',
-    0x87A7: 'qí',
-    0x87A8: 'mǎn',
-    0x87A9: 'tiao',
-    0x87AA: 'shāng',
-    0x87AB: 'shì,zhē',
-    0x87AC: 'cáo',
-    0x87AD: 'chī',
-    0x87AE: 'dì,dài',
-    0x87AF: 'áo',
-    0x87B0: 'lù',
-    0x87B1: 'wèi',
-    0x87B2: 'zhì,dié',
-    0x87B3: 'táng',
-    0x87B4: 'chén',
-    0x87B5: 'piāo',
-    0x87B6: 'qú,jù',
-    0x87B7: 'pí',
-    0x87B8: 'yú',
-    0x87B9: 'jiàn,chán',
-    0x87BA: 'luó',
-    0x87BB: 'lóu',
-    0x87BC: 'qǐn',
-    0x87BD: 'zhōng',
-    0x87BE: 'yǐn,yín',
-    0x87BF: 'jiāng',
-    0x87C0: 'shuài',
-    0x87C1: 'wén',
-    0x87C2: 'xiāo',
-    0x87C3: 'wàn',
-    0x87C4: 'zhé',
-    0x87C5: 'zhè',
-    0x87C6: 'má,mò',
-    0x87C7: 'má',
-    0x87C8: 'guō,yù',
-    0x87C9: 'liú,liào',
-    0x87CA: 'máo,méng',
-    0x87CB: 'xī',
-    0x87CC: 'cōng',
-    0x87CD: 'lí',
-    0x87CE: 'mǎn',
-    0x87CF: 'xiāo',
-    0x87D0: 'chang',
-    0x87D1: 'zhāng',
-    0x87D2: 'mǎng,měng',
-    0x87D3: 'xiàng',
-    0x87D4: 'mò',
-    0x87D5: 'zuī',
-    0x87D6: 'sī',
-    0x87D7: 'qiū',
-    0x87D8: 'tè',
-    0x87D9: 'zhí',
-    0x87DA: 'péng',
-    0x87DB: 'péng',
-    0x87DC: 'jiǎo,qiáo',
-    0x87DD: 'qú',
-    0x87DE: 'biē,bié',
-    0x87DF: 'liáo',
-    0x87E0: 'pán,fán',
-    0x87E1: 'guǐ',
-    0x87E2: 'xǐ',
-    0x87E3: 'jǐ,qí',
-    0x87E4: 'zhuān',
-    0x87E5: 'huáng',
-    0x87E6: 'féi,bēn',
-    0x87E7: 'láo,liáo',
-    0x87E8: 'jué',
-    0x87E9: 'jué',
-    0x87EA: 'huì',
-    0x87EB: 'yín,xún',
-    0x87EC: 'chán,tí,shàn',
-    0x87ED: 'jiāo',
-    0x87EE: 'shàn',
-    0x87EF: 'náo,rào',
-    0x87F0: 'xiāo',
-    0x87F1: 'wú,móu',
-    0x87F2: 'chóng,zhòng,tóng',
-    0x87F3: 'xún',
-    0x87F4: 'sī',
-    0x87F5: 'chú',
-    0x87F6: 'chēng',
-    0x87F7: 'dāng',
-    0x87F8: 'lǐ',
-    0x87F9: 'xiè',
-    0x87FA: 'shàn,dàn,chán,tuó',
-    0x87FB: 'yǐ,jǐ',
-    0x87FC: 'jǐng',
-    0x87FD: 'dá',
-    0x87FE: 'chán',
-    0x87FF: 'qì,jì',
-    0x8800: 'cī,jí',
-    0x8801: 'xiǎng',
-    0x8802: 'shè',
-    0x8803: 'luǒ,luó,guǒ',
-    0x8804: 'qín',
-    0x8805: 'yíng',
-    0x8806: 'chài',
-    0x8807: 'lì',
-    0x8808: 'zéi',
-    0x8809: 'xuān',
-    0x880A: 'lián',
-    0x880B: 'zhú',
-    0x880C: 'zé',
-    0x880D: 'xiē',
-    0x880E: 'mǎng',
-    0x880F: 'xiè',
-    0x8810: 'qí',
-    0x8811: 'róng',
-    0x8812: 'jiǎn',
-    0x8813: 'měng',
-    0x8814: 'háo',
-    0x8815: 'rú',
-    0x8816: 'huò,yuè',
-    0x8817: 'zhuó',
-    0x8818: 'jié',
-    0x8819: 'pín',
-    0x881A: 'hē',
-    0x881B: 'miè',
-    0x881C: 'fán',
-    0x881D: 'lěi',
-    0x881E: 'jié',
-    0x881F: 'là',
-    0x8820: 'mǐn,mián',
-    0x8821: 'lí,lǐ,luǒ,luó,lì',
-    0x8822: 'chǔn',
-    0x8823: 'lì',
-    0x8824: 'qiū',
-    0x8825: 'niè',
-    0x8826: 'lú',
-    0x8827: 'dù',
-    0x8828: 'xiāo',
-    0x8829: 'zhū,chú',
-    0x882A: 'lóng',
-    0x882B: 'lí',
-    0x882C: 'lóng',
-    0x882D: 'fēng,páng',
-    0x882E: 'yē',
-    0x882F: 'pí',
-    0x8830: 'náng,shàng,rǎng',
-    0x8831: 'gǔ,yě',
-    0x8832: 'juān',
-    0x8833: 'yīng',
-    0x8834: 'shǔ',
-    0x8835: 'xī',
-    0x8836: 'cán',
-    0x8837: 'qú',
-    0x8838: 'quán,huàn',
-    0x8839: 'dù',
-    0x883A: 'cán',
-    0x883B: 'mán',
-    0x883C: 'qú,jué',
-    0x883D: 'jié',
-    0x883E: 'zhú,shú',
-    0x883F: 'zhuō',
-    0x8840: 'xuè,xiě',
-    0x8841: 'huāng',
-    0x8842: 'nǜ',
-    0x8843: 'pēi,fǒu',
-    0x8844: 'nǜ',
-    0x8845: 'xìn',
-    0x8846: 'zhòng,zhōng',
-    0x8847: 'mài',
-    0x8848: 'èr',
-    0x8849: 'kā',
-    0x884A: 'miè',
-    0x884B: 'xì',
-    0x884C: 'xíng,háng,héng,xìng,hàng',
-    0x884D: 'yǎn,yán',
-    0x884E: 'kàn,kǎn',
-    0x884F: 'yuàn',
-    0x8850: 'qú',
-    0x8851: 'líng',
-    0x8852: 'xuàn',
-    0x8853: 'shù',
-    0x8854: 'xián',
-    0x8855: 'tòng,tóng,dòng',
-    0x8856: 'xiàng,lòng',
-    0x8857: 'jiē',
-    0x8858: 'xián,yù',
-    0x8859: 'yá,yú,yù',
-    0x885A: 'hú',
-    0x885B: 'wèi',
-    0x885C: 'dào',
-    0x885D: 'chōng,chǒng,chòng',
-    0x885E: 'wèi',
-    0x885F: 'dào',
-    0x8860: 'zhūn',
-    0x8861: 'héng',
-    0x8862: 'qú',
-    0x8863: 'yī,yì',
-    0x8864: 'yī',
-    0x8865: 'bǔ',
-    0x8866: 'gǎn',
-    0x8867: 'yú',
-    0x8868: 'biǎo',
-    0x8869: 'chǎ,chà',
-    0x886A: 'yí',
-    0x886B: 'shān',
-    0x886C: 'chèn',
-    0x886D: 'fū',
-    0x886E: 'gǔn',
-    0x886F: 'fēn,pén',
-    0x8870: 'shuāi,suō,cuī',
-    0x8871: 'jié',
-    0x8872: 'nà',
-    0x8873: 'zhōng',
-    0x8874: 'dǎn',
-    0x8875: 'yì',
-    0x8876: 'zhòng',
-    0x8877: 'zhōng,zhòng',
-    0x8878: 'jiè',
-    0x8879: 'zhǐ,tǐ,zhī,qí',
-    0x887A: 'xié',
-    0x887B: 'rán',
-    0x887C: 'zhī',
-    0x887D: 'rèn',
-    0x887E: 'qīn',
-    0x887F: 'jīn,qìn',
-    0x8880: 'jūn',
-    0x8881: 'yuán',
-    0x8882: 'mèi,yì',
-    0x8883: 'chài',
-    0x8884: 'ǎo',
-    0x8885: 'niǎo',
-    0x8886: 'huī',
-    0x8887: 'rán',
-    0x8888: 'jiā',
-    0x8889: 'tuó,tuǒ',
-    0x888A: 'lǐng,líng',
-    0x888B: 'dài',
-    0x888C: 'bào,páo,pào',
-    0x888D: 'páo,bào',
-    0x888E: 'yào',
-    0x888F: 'zuò',
-    0x8890: 'bì',
-    0x8891: 'shào',
-    0x8892: 'tǎn,zhàn',
-    0x8893: 'jù,jiě',
-    0x8894: 'hè,kè,kuǎ',
-    0x8895: 'xué',
-    0x8896: 'xiù',
-    0x8897: 'zhěn',
-    0x8898: 'yí,yì,tuó',
-    0x8899: 'pà',
-    0x889A: 'bō,fú',
-    0x889B: 'dī',
-    0x889C: 'wà,mò',
-    0x889D: 'fù',
-    0x889E: 'gǔn',
-    0x889F: 'zhì',
-    0x88A0: 'zhì',
-    0x88A1: 'rán',
-    0x88A2: 'pàn,fán',
-    0x88A3: 'yì',
-    0x88A4: 'mào,móu',
-    0x88A5: 'tuō',
-    0x88A6: 'nà,jué',
-    0x88A7: 'gōu,gòu',
-    0x88A8: 'xuàn',
-    0x88A9: 'zhé,chān',
-    0x88AA: 'qū',
-    0x88AB: 'bèi,bì,pī,pì',
-    0x88AC: 'yù',
-    0x88AD: 'xí',
-    0x88AE: 'mí',
-    0x88AF: 'bó',
-    0x88B0: 'bō',
-    0x88B1: 'fú',
-    0x88B2: 'chǐ,nuǒ',
-    0x88B3: 'chǐ,qǐ,duǒ,nuǒ',
-    0x88B4: 'kù',
-    0x88B5: 'rèn',
-    0x88B6: 'jiàng',
-    0x88B7: 'jiá,qiā,jiā,jié',
-    0x88B8: 'jiàn,zùn',
-    0x88B9: 'bó,mò',
-    0x88BA: 'jié',
-    0x88BB: 'ér',
-    0x88BC: 'gē,luò',
-    0x88BD: 'rú',
-    0x88BE: 'zhū',
-    0x88BF: 'guī,guà',
-    0x88C0: 'yīn',
-    0x88C1: 'cái',
-    0x88C2: 'liè,liě',
-    0x88C3: 'kǎ',
-    0x88C4: 'xing',
-    0x88C5: 'zhuāng',
-    0x88C6: 'dāng',
-    0x88C7: 'xū',
-    0x88C8: 'kūn',
-    0x88C9: 'kèn',
-    0x88CA: 'niǎo',
-    0x88CB: 'shù',
-    0x88CC: 'jiá,jiā,xié',
-    0x88CD: 'kǔn',
-    0x88CE: 'chéng,chěng',
-    0x88CF: 'lǐ',
-    0x88D0: 'juān',
-    0x88D1: 'shēn',
-    0x88D2: 'póu,bāo',
-    0x88D3: 'gé,jiē',
-    0x88D4: 'yì',
-    0x88D5: 'yù',
-    0x88D6: 'zhěn',
-    0x88D7: 'liú',
-    0x88D8: 'qiú',
-    0x88D9: 'qún',
-    0x88DA: 'jì',
-    0x88DB: 'yì',
-    0x88DC: 'bǔ',
-    0x88DD: 'zhuāng',
-    0x88DE: 'shuì',
-    0x88DF: 'shā',
-    0x88E0: 'qún',
-    0x88E1: 'lǐ',
-    0x88E2: 'lián,shāo',
-    0x88E3: 'liǎn',
-    0x88E4: 'kù',
-    0x88E5: 'jiǎn',
-    0x88E6: 'fóu',
-    0x88E7: 'chān,chàn,tǎn',
-    0x88E8: 'bì,pí',
-    0x88E9: 'kūn',
-    0x88EA: 'táo',
-    0x88EB: 'yuàn',
-    0x88EC: 'líng',
-    0x88ED: 'chǐ',
-    0x88EE: 'chāng',
-    0x88EF: 'chóu,dāo',
-    0x88F0: 'duō',
-    0x88F1: 'biǎo',
-    0x88F2: 'liǎng',
-    0x88F3: 'shang,cháng',
-    0x88F4: 'péi,féi',
-    0x88F5: 'péi',
-    0x88F6: 'fēi',
-    0x88F7: 'yuān,gǔn',
-    0x88F8: 'luǒ',
-    0x88F9: 'guǒ',
-    0x88FA: 'yǎn,ān,yàn',
-    0x88FB: 'dú',
-    0x88FC: 'tì,xī',
-    0x88FD: 'zhì',
-    0x88FE: 'jū,jù',
-    0x88FF: 'yǐ,qǐ',
-    0x8900: 'qí',
-    0x8901: 'guǒ',
-    0x8902: 'guà',
-    0x8903: 'kèn',
-    0x8904: 'qī',
-    0x8905: 'tì',
-    0x8906: 'tí,shì',
-    0x8907: 'fù,fú',
-    0x8908: 'chóng,chōng,zhòng',
-    0x8909: 'xiè',
-    0x890A: 'biǎn,pián',
-    0x890B: 'dié',
-    0x890C: 'kūn',
-    0x890D: 'duān,tuān',
-    0x890E: 'xiù,yòu',
-    0x890F: 'xiù',
-    0x8910: 'hè',
-    0x8911: 'yuàn,yuán',
-    0x8912: 'bāo',
-    0x8913: 'bǎo',
-    0x8914: 'fù',
-    0x8915: 'yú,tóu',
-    0x8916: 'tuàn',
-    0x8917: 'yǎn',
-    0x8918: 'huī,yī',
-    0x8919: 'bèi',
-    0x891A: 'chǔ,zhě,zhǔ',
-    0x891B: 'lǚ',
-    0x891C: 'páo',
-    0x891D: 'dān',
-    0x891E: 'yǔn,wēn',
-    0x891F: 'tā',
-    0x8920: 'gōu',
-    0x8921: 'dā',
-    0x8922: 'huái',
-    0x8923: 'róng',
-    0x8924: 'yuàn',
-    0x8925: 'rù,nù',
-    0x8926: 'nài',
-    0x8927: 'jiǒng',
-    0x8928: 'suǒ,chá',
-    0x8929: 'bān,pán',
-    0x892A: 'tuì,tùn',
-    0x892B: 'chǐ',
-    0x892C: 'sǎng',
-    0x892D: 'niǎo',
-    0x892E: 'yīng,yìng',
-    0x892F: 'jiè',
-    0x8930: 'qiān',
-    0x8931: 'huái',
-    0x8932: 'kù',
-    0x8933: 'lián',
-    0x8934: 'lán',
-    0x8935: 'lí',
-    0x8936: 'zhě,dié,xí',
-    0x8937: 'shī',
-    0x8938: 'lǚ',
-    0x8939: 'yì,niè',
-    0x893A: 'diē',
-    0x893B: 'xiè',
-    0x893C: 'xiān',
-    0x893D: 'wèi',
-    0x893E: 'biǎo',
-    0x893F: 'cáo',
-    0x8940: 'jī,jì',
-    0x8941: 'qiǎng',
-    0x8942: 'sēn,shān',
-    0x8943: 'bāo,póu',
-    0x8944: 'xiāng',
-    0x8945: 'bì',
-    0x8946: 'fú,pú',
-    0x8947: 'jiǎn',
-    0x8948: 'zhuàn,juàn',
-    0x8949: 'jiǎn',
-    0x894A: 'cuì,cuō',
-    0x894B: 'jí',
-    0x894C: 'dān',
-    0x894D: 'zá',
-    0x894E: 'fán,bò',
-    0x894F: 'bó,fèi',
-    0x8950: 'xiàng',
-    0x8951: 'xín',
-    0x8952: 'bié',
-    0x8953: 'ráo',
-    0x8954: 'mǎn',
-    0x8955: 'lán',
-    0x8956: 'ǎo',
-    0x8957: 'zé,duó,yì',
-    0x8958: 'guì,huì',
-    0x8959: 'cào',
-    0x895A: 'suì',
-    0x895B: 'nóng',
-    0x895C: 'chān,chàn,dān',
-    0x895D: 'liǎn,chān',
-    0x895E: 'bì',
-    0x895F: 'jīn',
-    0x8960: 'dāng',
-    0x8961: 'shǔ,dú',
-    0x8962: 'tǎn,zhàn,chán,zhān',
-    0x8963: 'bì',
-    0x8964: 'lán',
-    0x8965: 'fú',
-    0x8966: 'rú',
-    0x8967: 'zhǐ',
-    0x8968: 'duì',
-    0x8969: 'shǔ',
-    0x896A: 'wà',
-    0x896B: 'shì',
-    0x896C: 'bǎi,bēi',
-    0x896D: 'xié',
-    0x896E: 'bó',
-    0x896F: 'chèn',
-    0x8970: 'lài',
-    0x8971: 'lóng,lòng',
-    0x8972: 'xí',
-    0x8973: 'xiān,shān',
-    0x8974: 'lán',
-    0x8975: 'zhě,zhé',
-    0x8976: 'dài',
-    0x8977: 'jǔ',
-    0x8978: 'zàn,cuán',
-    0x8979: 'shī',
-    0x897A: 'jiǎn',
-    0x897B: 'pàn',
-    0x897C: 'yì',
-    0x897D: 'lán',
-    0x897E: 'yà',
-    0x897F: 'xī',
-    0x8980: 'xī',
-    0x8981: 'yào,yāo,yǎo',
-    0x8982: 'fěng,bǎn',
-    0x8983: 'tán,qín,yǎn',
-    0x8984: 'fù',
-    0x8985: 'fiào',
-    0x8986: 'fù',
-    0x8987: 'bà',
-    0x8988: 'hé',
-    0x8989: 'jī',
-    0x898A: 'jī',
-    0x898B: 'jiàn,xiàn',
-    0x898C: 'guān',
-    0x898D: 'biàn',
-    0x898E: 'yàn',
-    0x898F: 'guī,guì,xù',
-    0x8990: 'jué',
-    0x8991: 'piǎn',
-    0x8992: 'mào',
-    0x8993: 'mì',
-    0x8994: 'mì',
-    0x8995: 'miè,piē',
-    0x8996: 'shì',
-    0x8997: 'sì',
-    0x8998: 'chān,dān,jī',
-    0x8999: 'luó',
-    0x899A: 'jué',
-    0x899B: 'mì',
-    0x899C: 'tiào',
-    0x899D: 'lián',
-    0x899E: 'yào',
-    0x899F: 'zhì',
-    0x89A0: 'jūn',
-    0x89A1: 'xí',
-    0x89A2: 'shǎn',
-    0x89A3: 'wēi',
-    0x89A4: 'xì',
-    0x89A5: 'tiǎn',
-    0x89A6: 'yú',
-    0x89A7: 'lǎn',
-    0x89A8: 'è',
-    0x89A9: 'dǔ',
-    0x89AA: 'qīn,qìng',
-    0x89AB: 'pǎng',
-    0x89AC: 'jì',
-    0x89AD: 'míng',
-    0x89AE: 'yíng',
-    0x89AF: 'gòu',
-    0x89B0: 'qū,qù',
-    0x89B1: 'zhàn,zhān',
-    0x89B2: 'jìn',
-    0x89B3: 'guān',
-    0x89B4: 'dēng',
-    0x89B5: 'jiàn,biǎn',
-    0x89B6: 'luó,luǎn',
-    0x89B7: 'qù',
-    0x89B8: 'jiān',
-    0x89B9: 'wéi',
-    0x89BA: 'jué,jiào',
-    0x89BB: 'qū,qù',
-    0x89BC: 'luó',
-    0x89BD: 'lǎn,làn',
-    0x89BE: 'shěn',
-    0x89BF: 'dí,jí',
-    0x89C0: 'guān,guàn',
-    0x89C1: 'jiàn,xiàn',
-    0x89C2: 'guān,guàn',
-    0x89C3: 'yàn',
-    0x89C4: 'guī',
-    0x89C5: 'mì',
-    0x89C6: 'shì',
-    0x89C7: 'chān',
-    0x89C8: 'lǎn',
-    0x89C9: 'jué,jiào',
-    0x89CA: 'jì',
-    0x89CB: 'xí',
-    0x89CC: 'dí',
-    0x89CD: 'tiǎn',
-    0x89CE: 'yú',
-    0x89CF: 'gòu',
-    0x89D0: 'jìn',
-    0x89D1: 'qù,qū',
-    0x89D2: 'jiǎo,jué,lù,gǔ',
-    0x89D3: 'qiú',
-    0x89D4: 'jīn',
-    0x89D5: 'cū,chù,chéng',
-    0x89D6: 'jué,kuì,guì',
-    0x89D7: 'zhì',
-    0x89D8: 'chào',
-    0x89D9: 'jí',
-    0x89DA: 'gū',
-    0x89DB: 'dàn',
-    0x89DC: 'zī,zuǐ',
-    0x89DD: 'dǐ,zhǐ',
-    0x89DE: 'shāng',
-    0x89DF: 'huà,xiè',
-    0x89E0: 'quán',
-    0x89E1: 'gé',
-    0x89E2: 'shì',
-    0x89E3: 'jiě,jiè,xiè',
-    0x89E4: 'guǐ',
-    0x89E5: 'gōng',
-    0x89E6: 'chù',
-    0x89E7: 'jiě,jiè',
-    0x89E8: 'hùn',
-    0x89E9: 'qiú',
-    0x89EA: 'xīng',
-    0x89EB: 'sù',
-    0x89EC: 'ní',
-    0x89ED: 'jī,qǐ,qí',
-    0x89EE: 'lù',
-    0x89EF: 'zhì',
-    0x89F0: 'zhā,dǎ,zhǎ',
-    0x89F1: 'bì',
-    0x89F2: 'xīng',
-    0x89F3: 'hú,què,jué',
-    0x89F4: 'shāng',
-    0x89F5: 'gōng',
-    0x89F6: 'zhì',
-    0x89F7: 'xué,hù',
-    0x89F8: 'chù',
-    0x89F9: 'xī',
-    0x89FA: 'yí',
-    0x89FB: 'lì,lù',
-    0x89FC: 'jué',
-    0x89FD: 'xī',
-    0x89FE: 'yàn',
-    0x89FF: 'xī,wéi',
-    0x8A00: 'yán,yàn,yín',
-    0x8A01: 'yán',
-    0x8A02: 'dìng',
-    0x8A03: 'fù',
-    0x8A04: 'qiú,kāo',
-    0x8A05: 'qiú',
-    0x8A06: 'jiào',
-    0x8A07: 'hōng,jùn,hēng',
-    0x8A08: 'jì',
-    0x8A09: 'fàn',
-    0x8A0A: 'xùn',
-    0x8A0B: 'diào',
-    0x8A0C: 'hòng',
-    0x8A0D: 'chài,chā,chà',
-    0x8A0E: 'tǎo',
-    0x8A0F: 'xū,xǔ',
-    0x8A10: 'jié,jì',
-    0x8A11: 'yí,dàn,shī,tuó,tuǒ',
-    0x8A12: 'rèn',
-    0x8A13: 'xùn',
-    0x8A14: 'yín',
-    0x8A15: 'shàn',
-    0x8A16: 'qì',
-    0x8A17: 'tuō',
-    0x8A18: 'jì',
-    0x8A19: 'xùn',
-    0x8A1A: 'yín',
-    0x8A1B: 'é',
-    0x8A1C: 'fēn,bīn',
-    0x8A1D: 'yà',
-    0x8A1E: 'yāo',
-    0x8A1F: 'sòng',
-    0x8A20: 'shěn',
-    0x8A21: 'yín',
-    0x8A22: 'xīn,xī,yín',
-    0x8A23: 'jué',
-    0x8A24: 'xiáo,ná',
-    0x8A25: 'nè',
-    0x8A26: 'chén',
-    0x8A27: 'yóu',
-    0x8A28: 'zhǐ',
-    0x8A29: 'xiōng',
-    0x8A2A: 'fǎng',
-    0x8A2B: 'xìn',
-    0x8A2C: 'chāo,miǎo,chǎo',
-    0x8A2D: 'shè',
-    0x8A2E: 'yán',
-    0x8A2F: 'sǎ,sà',
-    0x8A30: 'zhùn,zhūn',
-    0x8A31: 'xǔ,hǔ',
-    0x8A32: 'yì',
-    0x8A33: 'yì',
-    0x8A34: 'sù',
-    0x8A35: 'chī,chì',
-    0x8A36: 'hē',
-    0x8A37: 'shēn',
-    0x8A38: 'hé',
-    0x8A39: 'xù',
-    0x8A3A: 'zhěn',
-    0x8A3B: 'zhù',
-    0x8A3C: 'zhèng',
-    0x8A3D: 'gòu',
-    0x8A3E: 'zī,zǐ',
-    0x8A3F: 'zǐ',
-    0x8A40: 'zhān,chè,diān,zhàn,tiē',
-    0x8A41: 'gǔ',
-    0x8A42: 'fù',
-    0x8A43: 'jiǎn',
-    0x8A44: 'dié',
-    0x8A45: 'líng',
-    0x8A46: 'dǐ,tì',
-    0x8A47: 'yàng',
-    0x8A48: 'lì',
-    0x8A49: 'náo,ná,nù',
-    0x8A4A: 'pàn',
-    0x8A4B: 'zhòu',
-    0x8A4C: 'gàn',
-    0x8A4D: 'yì',
-    0x8A4E: 'jù',
-    0x8A4F: 'yào',
-    0x8A50: 'zhà',
-    0x8A51: 'yí,tuó,duò,yī,xī',
-    0x8A52: 'yí,dài,tái',
-    0x8A53: 'qǔ',
-    0x8A54: 'zhào,zhāo',
-    0x8A55: 'píng',
-    0x8A56: 'bì',
-    0x8A57: 'xiòng',
-    0x8A58: 'qū,chù',
-    0x8A59: 'bá,bó',
-    0x8A5A: 'dá',
-    0x8A5B: 'zǔ',
-    0x8A5C: 'tāo',
-    0x8A5D: 'zhǔ',
-    0x8A5E: 'cí',
-    0x8A5F: 'zhé',
-    0x8A60: 'yǒng',
-    0x8A61: 'xǔ',
-    0x8A62: 'xún',
-    0x8A63: 'yì',
-    0x8A64: 'huǎng',
-    0x8A65: 'hé,gé',
-    0x8A66: 'shì',
-    0x8A67: 'chá,qiè',
-    0x8A68: 'xiào',
-    0x8A69: 'shī',
-    0x8A6A: 'hěn',
-    0x8A6B: 'chà,dù',
-    0x8A6C: 'gòu,hòu',
-    0x8A6D: 'guǐ',
-    0x8A6E: 'quán',
-    0x8A6F: 'huì',
-    0x8A70: 'jié',
-    0x8A71: 'huà',
-    0x8A72: 'gāi',
-    0x8A73: 'xiáng,yáng',
-    0x8A74: 'wēi',
-    0x8A75: 'shēn',
-    0x8A76: 'zhòu,chóu',
-    0x8A77: 'tóng,dòng',
-    0x8A78: 'mí',
-    0x8A79: 'zhān,dàn',
-    0x8A7A: 'mìng',
-    0x8A7B: 'è,lüè,luò',
-    0x8A7C: 'huī',
-    0x8A7D: 'yán',
-    0x8A7E: 'xiōng',
-    0x8A7F: 'guà',
-    0x8A80: 'èr,chǐ',
-    0x8A81: 'bìng',
-    0x8A82: 'tiǎo,diào',
-    0x8A83: 'yí,chǐ,chì,duò',
-    0x8A84: 'lěi',
-    0x8A85: 'zhū',
-    0x8A86: 'kuāng',
-    0x8A87: 'kuā,qù',
-    0x8A88: 'wū',
-    0x8A89: 'yù',
-    0x8A8A: 'téng',
-    0x8A8B: 'jì',
-    0x8A8C: 'zhì',
-    0x8A8D: 'rèn',
-    0x8A8E: 'cù',
-    0x8A8F: 'lǎng,làng',
-    0x8A90: 'é,ě',
-    0x8A91: 'kuáng',
-    0x8A92: 'éi,xī,yì,ê̄,ế,ê̌,ěi,ề,èi,ēi',
-    0x8A93: 'shì',
-    0x8A94: 'tǐng',
-    0x8A95: 'dàn',
-    0x8A96: 'bèi',
-    0x8A97: 'chán',
-    0x8A98: 'yòu',
-    0x8A99: 'kēng',
-    0x8A9A: 'qiào',
-    0x8A9B: 'qīn',
-    0x8A9C: 'shuà',
-    0x8A9D: 'ān',
-    0x8A9E: 'yǔ,yù',
-    0x8A9F: 'xiào',
-    0x8AA0: 'chéng',
-    0x8AA1: 'jiè',
-    0x8AA2: 'xiàn',
-    0x8AA3: 'wū',
-    0x8AA4: 'wù',
-    0x8AA5: 'gào',
-    0x8AA6: 'sòng',
-    0x8AA7: 'bū',
-    0x8AA8: 'huì',
-    0x8AA9: 'jìng',
-    0x8AAA: 'shuō',
-    0x8AAB: 'zhèn',
-    0x8AAC: 'shuō,shuì,yuè,tuō',
-    0x8AAD: 'dú',
-    0x8AAE: 'huā',
-    0x8AAF: 'chàng',
-    0x8AB0: 'shuí,shéi',
-    0x8AB1: 'jié',
-    0x8AB2: 'kè',
-    0x8AB3: 'qū,juè',
-    0x8AB4: 'cóng',
-    0x8AB5: 'xiáo',
-    0x8AB6: 'suì',
-    0x8AB7: 'wǎng',
-    0x8AB8: 'xián',
-    0x8AB9: 'fěi',
-    0x8ABA: 'chī,lài',
-    0x8ABB: 'tà',
-    0x8ABC: 'yì',
-    0x8ABD: 'nì,ná',
-    0x8ABE: 'yín',
-    0x8ABF: 'diào,tiáo,zhōu',
-    0x8AC0: 'pǐ,bēi',
-    0x8AC1: 'zhuó',
-    0x8AC2: 'chǎn',
-    0x8AC3: 'chēn',
-    0x8AC4: 'zhūn',
-    0x8AC5: 'jì,jī',
-    0x8AC6: 'qī',
-    0x8AC7: 'tán',
-    0x8AC8: 'zhuì',
-    0x8AC9: 'wěi',
-    0x8ACA: 'jū',
-    0x8ACB: 'qǐng,qìng,qíng',
-    0x8ACC: 'dǒng',
-    0x8ACD: 'zhèng,zhēng',
-    0x8ACE: 'zé,cuò,zuò,zhǎ,jiè',
-    0x8ACF: 'zōu,zhōu',
-    0x8AD0: 'qiān',
-    0x8AD1: 'zhuó',
-    0x8AD2: 'liàng,liáng',
-    0x8AD3: 'jiàn',
-    0x8AD4: 'chù,jí',
-    0x8AD5: 'háo,xià,huò',
-    0x8AD6: 'lùn,lún',
-    0x8AD7: 'shěn,niè',
-    0x8AD8: 'biǎo',
-    0x8AD9: 'huà',
-    0x8ADA: 'pián',
-    0x8ADB: 'yú',
-    0x8ADC: 'dié,xiè',
-    0x8ADD: 'xū',
-    0x8ADE: 'piǎn,pián',
-    0x8ADF: 'shì,dì',
-    0x8AE0: 'xuān',
-    0x8AE1: 'shì',
-    0x8AE2: 'hùn',
-    0x8AE3: 'huà,guā',
-    0x8AE4: 'è',
-    0x8AE5: 'zhòng',
-    0x8AE6: 'dì,tí',
-    0x8AE7: 'xié',
-    0x8AE8: 'fú',
-    0x8AE9: 'pǔ',
-    0x8AEA: 'tíng',
-    0x8AEB: 'jiàn,làn',
-    0x8AEC: 'qǐ',
-    0x8AED: 'yù,tǒu',
-    0x8AEE: 'zī',
-    0x8AEF: 'zhuān',
-    0x8AF0: 'xǐ,shāi,āi',
-    0x8AF1: 'huì',
-    0x8AF2: 'yīn',
-    0x8AF3: 'ān,tǒu',
-    0x8AF4: 'xián,gān',
-    0x8AF5: 'nán,nàn',
-    0x8AF6: 'chén',
-    0x8AF7: 'fěng,fèng',
-    0x8AF8: 'zhū,chú',
-    0x8AF9: 'yáng',
-    0x8AFA: 'yàn',
-    0x8AFB: 'huáng',
-    0x8AFC: 'xuān',
-    0x8AFD: 'gé',
-    0x8AFE: 'nuò',
-    0x8AFF: 'qī,xǔ',
-    0x8B00: 'móu',
-    0x8B01: 'yè,ǎi',
-    0x8B02: 'wèi',
-    0x8B03: 'xīng',
-    0x8B04: 'téng',
-    0x8B05: 'zhōu,chōu,chǎo',
-    0x8B06: 'shàn',
-    0x8B07: 'jiǎn',
-    0x8B08: 'pó,páo',
-    0x8B09: 'kuì,duǐ,tuí,guǐ',
-    0x8B0A: 'huǎng',
-    0x8B0B: 'huò',
-    0x8B0C: 'gē',
-    0x8B0D: 'yíng,yīng,hōng',
-    0x8B0E: 'mí',
-    0x8B0F: 'xiǎo,sǒu,sòu',
-    0x8B10: 'mì',
-    0x8B11: 'xǐ,xià,xí',
-    0x8B12: 'qiāng',
-    0x8B13: 'chēn,zhèn',
-    0x8B14: 'xuè',
-    0x8B15: 'tí,sī',
-    0x8B16: 'sù',
-    0x8B17: 'bàng',
-    0x8B18: 'chí',
-    0x8B19: 'qiān,zhàn',
-    0x8B1A: 'shì,yì,xì',
-    0x8B1B: 'jiǎng',
-    0x8B1C: 'yuán,quán',
-    0x8B1D: 'xiè',
-    0x8B1E: 'hè,xiāo',
-    0x8B1F: 'tāo',
-    0x8B20: 'yáo',
-    0x8B21: 'yáo',
-    0x8B22: 'lū',
-    0x8B23: 'yú,xū',
-    0x8B24: 'biāo,piāo',
-    0x8B25: 'còng',
-    0x8B26: 'qǐng,qìng',
-    0x8B27: 'lí',
-    0x8B28: 'mó',
-    0x8B29: 'mó',
-    0x8B2A: 'shāng',
-    0x8B2B: 'zhé,zé',
-    0x8B2C: 'miù',
-    0x8B2D: 'jiǎn',
-    0x8B2E: 'zé',
-    0x8B2F: 'jiē,zhā,zhǎ,zǔ',
-    0x8B30: 'lián',
-    0x8B31: 'lóu,lǚ',
-    0x8B32: 'càn,zào,sān,chěn',
-    0x8B33: 'ōu,xú',
-    0x8B34: 'gùn',
-    0x8B35: 'xí,chè',
-    0x8B36: 'zhuó,shù,zhē',
-    0x8B37: 'áo,ào',
-    0x8B38: 'áo',
-    0x8B39: 'jǐn',
-    0x8B3A: 'zhé',
-    0x8B3B: 'yí,chí',
-    0x8B3C: 'hū,xiāo',
-    0x8B3D: 'jiàng',
-    0x8B3E: 'mán,màn',
-    0x8B3F: 'cháo',
-    0x8B40: 'hàn,xiàn',
-    0x8B41: 'huá,wà',
-    0x8B42: 'chǎn,dàn',
-    0x8B43: 'xū',
-    0x8B44: 'zēng',
-    0x8B45: 'sè',
-    0x8B46: 'xī',
-    0x8B47: 'zhā',
-    0x8B48: 'duì',
-    0x8B49: 'zhèng',
-    0x8B4A: 'náo,xiāo',
-    0x8B4B: 'lán',
-    0x8B4C: 'é,wá,guǐ',
-    0x8B4D: 'yīng,yìng',
-    0x8B4E: 'jué',
-    0x8B4F: 'jī',
-    0x8B50: 'zǔn',
-    0x8B51: 'jiǎo,qiào',
-    0x8B52: 'bò',
-    0x8B53: 'huì',
-    0x8B54: 'zhuàn,quán',
-    0x8B55: 'wú,mó',
-    0x8B56: 'zèn,jiàn',
-    0x8B57: 'zhá',
-    0x8B58: 'shí,shì,zhì',
-    0x8B59: 'qiào,qiáo',
-    0x8B5A: 'tán',
-    0x8B5B: 'zèn',
-    0x8B5C: 'pǔ',
-    0x8B5D: 'shéng',
-    0x8B5E: 'xuān',
-    0x8B5F: 'zào',
-    0x8B60: 'tán',
-    0x8B61: 'dǎng',
-    0x8B62: 'suì',
-    0x8B63: 'xiǎn',
-    0x8B64: 'jī',
-    0x8B65: 'jiào',
-    0x8B66: 'jǐng',
-    0x8B67: 'zhàn,lián',
-    0x8B68: 'náng,nóu',
-    0x8B69: 'yī',
-    0x8B6A: 'ǎi',
-    0x8B6B: 'zhān',
-    0x8B6C: 'pì',
-    0x8B6D: 'huǐ',
-    0x8B6E: 'huà,xiè,huì',
-    0x8B6F: 'yì',
-    0x8B70: 'yì',
-    0x8B71: 'shàn',
-    0x8B72: 'ràng',
-    0x8B73: 'nòu',
-    0x8B74: 'qiǎn',
-    0x8B75: 'duì',
-    0x8B76: 'tà',
-    0x8B77: 'hù',
-    0x8B78: 'zhōu,chóu',
-    0x8B79: 'háo',
-    0x8B7A: 'ài,yǐ,nǐ,yì,yí',
-    0x8B7B: 'yīng',
-    0x8B7C: 'jiàn',
-    0x8B7D: 'yù',
-    0x8B7E: 'jiǎn',
-    0x8B7F: 'huì',
-    0x8B80: 'dú,dòu',
-    0x8B81: 'zhé',
-    0x8B82: 'xuàn',
-    0x8B83: 'zàn',
-    0x8B84: 'lěi',
-    0x8B85: 'shěn',
-    0x8B86: 'wèi',
-    0x8B87: 'chǎn',
-    0x8B88: 'lì',
-    0x8B89: 'yí,tuī',
-    0x8B8A: 'biàn',
-    0x8B8B: 'zhé',
-    0x8B8C: 'yàn',
-    0x8B8D: 'è',
-    0x8B8E: 'chóu',
-    0x8B8F: 'wèi',
-    0x8B90: 'chóu',
-    0x8B91: 'yào',
-    0x8B92: 'chán',
-    0x8B93: 'ràng',
-    0x8B94: 'yǐn',
-    0x8B95: 'lán',
-    0x8B96: 'chèn,chàn',
-    0x8B97: 'xié',
-    0x8B98: 'niè',
-    0x8B99: 'huān,huàn',
-    0x8B9A: 'zàn',
-    0x8B9B: 'yì',
-    0x8B9C: 'dǎng,dàng',
-    0x8B9D: 'zhán,zhān',
-    0x8B9E: 'yàn',
-    0x8B9F: 'dú',
-    0x8BA0: 'yán',
-    0x8BA1: 'jì',
-    0x8BA2: 'dìng',
-    0x8BA3: 'fù',
-    0x8BA4: 'rèn',
-    0x8BA5: 'jī',
-    0x8BA6: 'jié',
-    0x8BA7: 'hòng',
-    0x8BA8: 'tǎo',
-    0x8BA9: 'ràng',
-    0x8BAA: 'shàn',
-    0x8BAB: 'qì',
-    0x8BAC: 'tuō',
-    0x8BAD: 'xùn',
-    0x8BAE: 'yì',
-    0x8BAF: 'xùn',
-    0x8BB0: 'jì',
-    0x8BB1: 'rèn',
-    0x8BB2: 'jiǎng',
-    0x8BB3: 'huì',
-    0x8BB4: 'ōu',
-    0x8BB5: 'jù',
-    0x8BB6: 'yà',
-    0x8BB7: 'nè',
-    0x8BB8: 'xǔ,hǔ',
-    0x8BB9: 'é',
-    0x8BBA: 'lùn,lún',
-    0x8BBB: 'xiōng',
-    0x8BBC: 'sòng',
-    0x8BBD: 'fěng,fèng',
-    0x8BBE: 'shè',
-    0x8BBF: 'fǎng',
-    0x8BC0: 'jué',
-    0x8BC1: 'zhèng',
-    0x8BC2: 'gǔ',
-    0x8BC3: 'hē',
-    0x8BC4: 'píng',
-    0x8BC5: 'zǔ',
-    0x8BC6: 'shí,shì,zhì',
-    0x8BC7: 'xiòng',
-    0x8BC8: 'zhà',
-    0x8BC9: 'sù',
-    0x8BCA: 'zhěn',
-    0x8BCB: 'dǐ',
-    0x8BCC: 'zhōu',
-    0x8BCD: 'cí',
-    0x8BCE: 'qū',
-    0x8BCF: 'zhào',
-    0x8BD0: 'bì',
-    0x8BD1: 'yì',
-    0x8BD2: 'yí',
-    0x8BD3: 'kuāng',
-    0x8BD4: 'lěi',
-    0x8BD5: 'shì',
-    0x8BD6: 'guà',
-    0x8BD7: 'shī',
-    0x8BD8: 'jí,jié',
-    0x8BD9: 'huī',
-    0x8BDA: 'chéng',
-    0x8BDB: 'zhū',
-    0x8BDC: 'shēn',
-    0x8BDD: 'huà',
-    0x8BDE: 'dàn',
-    0x8BDF: 'gòu',
-    0x8BE0: 'quán',
-    0x8BE1: 'guǐ',
-    0x8BE2: 'xún',
-    0x8BE3: 'yì',
-    0x8BE4: 'zhèng,zhēng',
-    0x8BE5: 'gāi',
-    0x8BE6: 'xiáng',
-    0x8BE7: 'chà',
-    0x8BE8: 'hùn',
-    0x8BE9: 'xǔ',
-    0x8BEA: 'zhōu',
-    0x8BEB: 'jiè',
-    0x8BEC: 'wū',
-    0x8BED: 'yǔ,yù',
-    0x8BEE: 'qiào',
-    0x8BEF: 'wù',
-    0x8BF0: 'gào',
-    0x8BF1: 'yòu',
-    0x8BF2: 'huì',
-    0x8BF3: 'kuáng',
-    0x8BF4: 'shuō,shuì,yuè',
-    0x8BF5: 'sòng',
-    0x8BF6: 'éi',
-    0x8BF7: 'qǐng',
-    0x8BF8: 'zhū',
-    0x8BF9: 'zōu',
-    0x8BFA: 'nuò',
-    0x8BFB: 'dú,dòu',
-    0x8BFC: 'zhuó',
-    0x8BFD: 'fěi',
-    0x8BFE: 'kè',
-    0x8BFF: 'wěi',
-    0x8C00: 'yú',
-    0x8C01: 'shéi,shuí',
-    0x8C02: 'shěn',
-    0x8C03: 'diào,tiáo',
-    0x8C04: 'chǎn',
-    0x8C05: 'liàng',
-    0x8C06: 'zhūn',
-    0x8C07: 'suì',
-    0x8C08: 'tán',
-    0x8C09: 'shěn',
-    0x8C0A: 'yì',
-    0x8C0B: 'móu',
-    0x8C0C: 'chén',
-    0x8C0D: 'dié',
-    0x8C0E: 'huǎng',
-    0x8C0F: 'jiàn',
-    0x8C10: 'xié',
-    0x8C11: 'xuè',
-    0x8C12: 'yè',
-    0x8C13: 'wèi',
-    0x8C14: 'è',
-    0x8C15: 'yù',
-    0x8C16: 'xuān',
-    0x8C17: 'chán',
-    0x8C18: 'zī',
-    0x8C19: 'ān',
-    0x8C1A: 'yàn',
-    0x8C1B: 'dì',
-    0x8C1C: 'mí,mèi',
-    0x8C1D: 'pián,piǎn',
-    0x8C1E: 'xū',
-    0x8C1F: 'mó',
-    0x8C20: 'dǎng',
-    0x8C21: 'sù',
-    0x8C22: 'xiè',
-    0x8C23: 'yáo',
-    0x8C24: 'bàng',
-    0x8C25: 'shì',
-    0x8C26: 'qiān',
-    0x8C27: 'mì',
-    0x8C28: 'jǐn',
-    0x8C29: 'mán,màn',
-    0x8C2A: 'zhé',
-    0x8C2B: 'jiǎn',
-    0x8C2C: 'miù',
-    0x8C2D: 'tán',
-    0x8C2E: 'zèn',
-    0x8C2F: 'qiáo,qiào',
-    0x8C30: 'lán',
-    0x8C31: 'pǔ',
-    0x8C32: 'jué',
-    0x8C33: 'yàn',
-    0x8C34: 'qiǎn',
-    0x8C35: 'zhān',
-    0x8C36: 'chèn',
-    0x8C37: 'gǔ,lù,yù',
-    0x8C38: 'qiān',
-    0x8C39: 'hóng',
-    0x8C3A: 'xiā',
-    0x8C3B: 'jí',
-    0x8C3C: 'hóng',
-    0x8C3D: 'hān',
-    0x8C3E: 'hōng,lóng',
-    0x8C3F: 'xī,jī',
-    0x8C40: 'xī',
-    0x8C41: 'huō,huò,huá',
-    0x8C42: 'liáo',
-    0x8C43: 'hǎn,gǎn',
-    0x8C44: 'dú',
-    0x8C45: 'lóng,lòng',
-    0x8C46: 'dòu',
-    0x8C47: 'jiāng',
-    0x8C48: 'qǐ,kǎi',
-    0x8C49: 'shì,chǐ',
-    0x8C4A: 'lǐ,fēng',
-    0x8C4B: 'dēng',
-    0x8C4C: 'wān',
-    0x8C4D: 'bī,biǎn',
-    0x8C4E: 'shù',
-    0x8C4F: 'xiàn',
-    0x8C50: 'fēng',
-    0x8C51: 'zhì',
-    0x8C52: 'zhì',
-    0x8C53: 'yàn',
-    0x8C54: 'yàn',
-    0x8C55: 'shǐ',
-    0x8C56: 'chù',
-    0x8C57: 'huī',
-    0x8C58: 'tún',
-    0x8C59: 'yì',
-    0x8C5A: 'tún,dūn,dùn',
-    0x8C5B: 'yì',
-    0x8C5C: 'jiān',
-    0x8C5D: 'bā',
-    0x8C5E: 'hòu',
-    0x8C5F: 'è',
-    0x8C60: 'chú',
-    0x8C61: 'xiàng',
-    0x8C62: 'huàn',
-    0x8C63: 'jiān,yàn',
-    0x8C64: 'kěn,kūn',
-    0x8C65: 'gāi',
-    0x8C66: 'jù',
-    0x8C67: 'fū,fù,pū',
-    0x8C68: 'xī',
-    0x8C69: 'bīn,huān',
-    0x8C6A: 'háo',
-    0x8C6B: 'yù,xiè,shū',
-    0x8C6C: 'zhū',
-    0x8C6D: 'jiā',
-    0x8C6E: 'fén',
-    0x8C6F: 'xī',
-    0x8C70: 'bó,hù,huò,gòu',
-    0x8C71: 'wēn',
-    0x8C72: 'huán',
-    0x8C73: 'bīn,bān',
-    0x8C74: 'dí',
-    0x8C75: 'zōng',
-    0x8C76: 'fén',
-    0x8C77: 'yì',
-    0x8C78: 'zhì,zhài',
-    0x8C79: 'bào',
-    0x8C7A: 'chái',
-    0x8C7B: 'àn',
-    0x8C7C: 'pí',
-    0x8C7D: 'nà',
-    0x8C7E: 'pī',
-    0x8C7F: 'gǒu',
-    0x8C80: 'nà,duò',
-    0x8C81: 'yòu',
-    0x8C82: 'diāo',
-    0x8C83: 'mò',
-    0x8C84: 'sì',
-    0x8C85: 'xiū',
-    0x8C86: 'huán,huān',
-    0x8C87: 'kūn,mào,kěn',
-    0x8C88: 'hé,mò',
-    0x8C89: 'háo,hé,mò,mà',
-    0x8C8A: 'mò,má',
-    0x8C8B: 'àn',
-    0x8C8C: 'mào,mò',
-    0x8C8D: 'lí,mái,yù',
-    0x8C8E: 'ní',
-    0x8C8F: 'bǐ',
-    0x8C90: 'yǔ',
-    0x8C91: 'jiā',
-    0x8C92: 'tuān,tuàn',
-    0x8C93: 'māo,máo',
-    0x8C94: 'pí',
-    0x8C95: 'xī',
-    0x8C96: 'yì',
-    0x8C97: 'jù,yú',
-    0x8C98: 'mò',
-    0x8C99: 'chū',
-    0x8C9A: 'tán',
-    0x8C9B: 'huān',
-    0x8C9C: 'jué',
-    0x8C9D: 'bèi',
-    0x8C9E: 'zhēn,zhēng',
-    0x8C9F: 'yuán',
-    0x8CA0: 'fù',
-    0x8CA1: 'cái',
-    0x8CA2: 'gòng',
-    0x8CA3: 'tè',
-    0x8CA4: 'yí,yì',
-    0x8CA5: 'háng',
-    0x8CA6: 'wán',
-    0x8CA7: 'pín',
-    0x8CA8: 'huò',
-    0x8CA9: 'fàn',
-    0x8CAA: 'tān',
-    0x8CAB: 'guàn,wān',
-    0x8CAC: 'zé,zhài',
-    0x8CAD: 'zhì',
-    0x8CAE: 'èr',
-    0x8CAF: 'zhù',
-    0x8CB0: 'shì',
-    0x8CB1: 'bì',
-    0x8CB2: 'zī',
-    0x8CB3: 'èr',
-    0x8CB4: 'guì',
-    0x8CB5: 'piǎn',
-    0x8CB6: 'biǎn,fá',
-    0x8CB7: 'mǎi',
-    0x8CB8: 'dài,tè',
-    0x8CB9: 'shèng',
-    0x8CBA: 'kuàng',
-    0x8CBB: 'fèi,fú,bì',
-    0x8CBC: 'tiē',
-    0x8CBD: 'yí',
-    0x8CBE: 'chí',
-    0x8CBF: 'mào',
-    0x8CC0: 'hè',
-    0x8CC1: 'bì,fén,bēn,fèn,féi,bān,lù,pān',
-    0x8CC2: 'lù',
-    0x8CC3: 'lìn',
-    0x8CC4: 'huì',
-    0x8CC5: 'gāi',
-    0x8CC6: 'pián',
-    0x8CC7: 'zī,zì',
-    0x8CC8: 'jiǎ,gǔ,jià',
-    0x8CC9: 'xù',
-    0x8CCA: 'zéi',
-    0x8CCB: 'jiǎo',
-    0x8CCC: 'gāi',
-    0x8CCD: 'zāng',
-    0x8CCE: 'jiàn',
-    0x8CCF: 'yīng',
-    0x8CD0: 'xùn',
-    0x8CD1: 'zhèn',
-    0x8CD2: 'shē,shā',
-    0x8CD3: 'bīn',
-    0x8CD4: 'bīn',
-    0x8CD5: 'qiú',
-    0x8CD6: 'shē',
-    0x8CD7: 'chuàn',
-    0x8CD8: 'zāng',
-    0x8CD9: 'zhōu',
-    0x8CDA: 'lài',
-    0x8CDB: 'zàn',
-    0x8CDC: 'cì',
-    0x8CDD: 'chēn',
-    0x8CDE: 'shǎng',
-    0x8CDF: 'tiǎn',
-    0x8CE0: 'péi',
-    0x8CE1: 'gēng',
-    0x8CE2: 'xián,xiàn',
-    0x8CE3: 'mài',
-    0x8CE4: 'jiàn',
-    0x8CE5: 'suì',
-    0x8CE6: 'fù',
-    0x8CE7: 'tàn',
-    0x8CE8: 'cóng',
-    0x8CE9: 'cóng',
-    0x8CEA: 'zhì',
-    0x8CEB: 'jī',
-    0x8CEC: 'zhàng',
-    0x8CED: 'dǔ',
-    0x8CEE: 'jìn',
-    0x8CEF: 'xiōng',
-    0x8CF0: 'chǔn',
-    0x8CF1: 'yǔn',
-    0x8CF2: 'bǎo',
-    0x8CF3: 'zāi',
-    0x8CF4: 'lài',
-    0x8CF5: 'fèng',
-    0x8CF6: 'càng',
-    0x8CF7: 'jī',
-    0x8CF8: 'shèng',
-    0x8CF9: 'yì,ài',
-    0x8CFA: 'zhuàn,zuàn',
-    0x8CFB: 'fù',
-    0x8CFC: 'gòu',
-    0x8CFD: 'sài',
-    0x8CFE: 'zé',
-    0x8CFF: 'liáo',
-    0x8D00: 'yì',
-    0x8D01: 'bài',
-    0x8D02: 'chěn',
-    0x8D03: 'wàn',
-    0x8D04: 'zhì,zhí',
-    0x8D05: 'zhuì',
-    0x8D06: 'biāo',
-    0x8D07: 'yūn,bīn',
-    0x8D08: 'zèng',
-    0x8D09: 'dàn',
-    0x8D0A: 'zàn',
-    0x8D0B: 'yàn',
-    0x8D0C: 'pú',
-    0x8D0D: 'shàn,dàn',
-    0x8D0E: 'wàn',
-    0x8D0F: 'yíng',
-    0x8D10: 'jìn',
-    0x8D11: 'gàn',
-    0x8D12: 'xián',
-    0x8D13: 'zāng',
-    0x8D14: 'bì',
-    0x8D15: 'dú',
-    0x8D16: 'shú,shù',
-    0x8D17: 'yàn,yán',
-    0x8D18: 'shǎng',
-    0x8D19: 'xuàn',
-    0x8D1A: 'lòng',
-    0x8D1B: 'gàn,gòng,zhuàng',
-    0x8D1C: 'zāng',
-    0x8D1D: 'bèi',
-    0x8D1E: 'zhēn',
-    0x8D1F: 'fù',
-    0x8D20: 'yuán',
-    0x8D21: 'gòng',
-    0x8D22: 'cái',
-    0x8D23: 'zé',
-    0x8D24: 'xián',
-    0x8D25: 'bài',
-    0x8D26: 'zhàng',
-    0x8D27: 'huò',
-    0x8D28: 'zhì',
-    0x8D29: 'fàn',
-    0x8D2A: 'tān',
-    0x8D2B: 'pín',
-    0x8D2C: 'biǎn',
-    0x8D2D: 'gòu',
-    0x8D2E: 'zhù',
-    0x8D2F: 'guàn',
-    0x8D30: 'èr',
-    0x8D31: 'jiàn',
-    0x8D32: 'bēn,bì',
-    0x8D33: 'shì',
-    0x8D34: 'tiē',
-    0x8D35: 'guì',
-    0x8D36: 'kuàng',
-    0x8D37: 'dài',
-    0x8D38: 'mào',
-    0x8D39: 'fèi',
-    0x8D3A: 'hè',
-    0x8D3B: 'yí',
-    0x8D3C: 'zéi',
-    0x8D3D: 'zhì',
-    0x8D3E: 'jiǎ,gǔ',
-    0x8D3F: 'huì',
-    0x8D40: 'zī',
-    0x8D41: 'lìn',
-    0x8D42: 'lù',
-    0x8D43: 'zāng',
-    0x8D44: 'zī',
-    0x8D45: 'gāi',
-    0x8D46: 'jìn',
-    0x8D47: 'qiú',
-    0x8D48: 'zhèn',
-    0x8D49: 'lài',
-    0x8D4A: 'shē',
-    0x8D4B: 'fù',
-    0x8D4C: 'dǔ',
-    0x8D4D: 'jī',
-    0x8D4E: 'shú',
-    0x8D4F: 'shǎng',
-    0x8D50: 'cì',
-    0x8D51: 'bì',
-    0x8D52: 'zhōu',
-    0x8D53: 'gēng',
-    0x8D54: 'péi',
-    0x8D55: 'dǎn',
-    0x8D56: 'lài',
-    0x8D57: 'fèng',
-    0x8D58: 'zhuì',
-    0x8D59: 'fù',
-    0x8D5A: 'zhuàn,zuàn',
-    0x8D5B: 'sài',
-    0x8D5C: 'zé',
-    0x8D5D: 'yàn',
-    0x8D5E: 'zàn',
-    0x8D5F: 'yūn',
-    0x8D60: 'zèng',
-    0x8D61: 'shàn',
-    0x8D62: 'yíng',
-    0x8D63: 'gàn',
-    0x8D64: 'chì',
-    0x8D65: 'xī',
-    0x8D66: 'shè,cè',
-    0x8D67: 'nǎn',
-    0x8D68: 'tóng,xióng',
-    0x8D69: 'xì',
-    0x8D6A: 'chēng',
-    0x8D6B: 'hè,shì',
-    0x8D6C: 'chēng',
-    0x8D6D: 'zhě',
-    0x8D6E: 'xiá',
-    0x8D6F: 'táng',
-    0x8D70: 'zǒu',
-    0x8D71: 'zǒu',
-    0x8D72: 'lì',
-    0x8D73: 'jiū,jiù',
-    0x8D74: 'fù',
-    0x8D75: 'zhào',
-    0x8D76: 'gǎn,qián',
-    0x8D77: 'qǐ',
-    0x8D78: 'shàn',
-    0x8D79: 'qióng',
-    0x8D7A: 'yǐn,qǐn',
-    0x8D7B: 'xiǎn',
-    0x8D7C: 'zī',
-    0x8D7D: 'jué,guì',
-    0x8D7E: 'qǐn',
-    0x8D7F: 'chí,dì',
-    0x8D80: 'cī',
-    0x8D81: 'chèn,zhēn,chén,niǎn,zhěn',
-    0x8D82: 'chèn',
-    0x8D83: 'dié,tú',
-    0x8D84: 'jū,qiè',
-    0x8D85: 'chāo,chǎo,chào,tiào',
-    0x8D86: 'dī',
-    0x8D87: 'xì',
-    0x8D88: 'zhān',
-    0x8D89: 'jué,jú',
-    0x8D8A: 'yuè,huó',
-    0x8D8B: 'qū',
-    0x8D8C: 'jí,jié',
-    0x8D8D: 'chí,qū',
-    0x8D8E: 'chú',
-    0x8D8F: 'guā,huó',
-    0x8D90: 'xuè,chì',
-    0x8D91: 'zī,cì',
-    0x8D92: 'tiáo,tiào,tiǎo',
-    0x8D93: 'duǒ',
-    0x8D94: 'liè',
-    0x8D95: 'gǎn',
-    0x8D96: 'suō',
-    0x8D97: 'cù',
-    0x8D98: 'xí',
-    0x8D99: 'zhào,diào',
-    0x8D9A: 'sù',
-    0x8D9B: 'yǐn',
-    0x8D9C: 'jú,qū,qiú',
-    0x8D9D: 'jiàn',
-    0x8D9E: 'què,qì,jí',
-    0x8D9F: 'tàng,zhēng,zhèng,chéng,tāng',
-    0x8DA0: 'chuò,chào,tiào,zhuó',
-    0x8DA1: 'cuǐ,wěi,jù',
-    0x8DA2: 'lù',
-    0x8DA3: 'qù,cù,qū,cǒu,zōu',
-    0x8DA4: 'dàng',
-    0x8DA5: 'qiū,cù',
-    0x8DA6: 'zī',
-    0x8DA7: 'tí',
-    0x8DA8: 'qū,cù,qù,cǒu',
-    0x8DA9: 'chì',
-    0x8DAA: 'huáng,guāng',
-    0x8DAB: 'qiáo,jiào,chǎo',
-    0x8DAC: 'qiāo',
-    0x8DAD: 'jiào',
-    0x8DAE: 'zào',
-    0x8DAF: 'tì,yuè,yào',
-    0x8DB0: 'ěr',
-    0x8DB1: 'zǎn',
-    0x8DB2: 'zǎn,zū',
-    0x8DB3: 'zú,jù',
-    0x8DB4: 'pā',
-    0x8DB5: 'bào,bō,zhuó,chuò,páo',
-    0x8DB6: 'kù,wū',
-    0x8DB7: 'kē',
-    0x8DB8: 'dǔn',
-    0x8DB9: 'jué,guì',
-    0x8DBA: 'fū',
-    0x8DBB: 'chěn',
-    0x8DBC: 'jiǎn,yàn,yán,jiān',
-    0x8DBD: 'fàng,páng,fāng',
-    0x8DBE: 'zhǐ',
-    0x8DBF: 'tā,sà,qì',
-    0x8DC0: 'yuè',
-    0x8DC1: 'bà,pá',
-    0x8DC2: 'qí,qǐ,qì,jī,zhī',
-    0x8DC3: 'yuè',
-    0x8DC4: 'qiāng,qiàng',
-    0x8DC5: 'tuò,chì',
-    0x8DC6: 'tái',
-    0x8DC7: 'yì',
-    0x8DC8: 'niǎn,jiàn,chén,tiàn',
-    0x8DC9: 'líng',
-    0x8DCA: 'mèi',
-    0x8DCB: 'bá,bèi',
-    0x8DCC: 'diē,dié,tú',
-    0x8DCD: 'kū',
-    0x8DCE: 'tuó',
-    0x8DCF: 'jiā',
-    0x8DD0: 'cī,cǐ,zǐ',
-    0x8DD1: 'pǎo,páo,bó',
-    0x8DD2: 'qiǎ',
-    0x8DD3: 'zhù',
-    0x8DD4: 'jū,qǔ',
-    0x8DD5: 'diǎn,tiē,dié,zhàn,diē',
-    0x8DD6: 'zhí',
-    0x8DD7: 'fū,fù',
-    0x8DD8: 'pán,bàn',
-    0x8DD9: 'jù,qū,qiě,zhù,qiè',
-    0x8DDA: 'shān',
-    0x8DDB: 'bǒ,bì,pō',
-    0x8DDC: 'ní',
-    0x8DDD: 'jù',
-    0x8DDE: 'lì,luò',
-    0x8DDF: 'gēn',
-    0x8DE0: 'yí',
-    0x8DE1: 'jī',
-    0x8DE2: 'duò,dài,duō,chí',
-    0x8DE3: 'xiǎn,xiān,sǔn',
-    0x8DE4: 'jiāo,qiāo',
-    0x8DE5: 'duò',
-    0x8DE6: 'zhū,chú',
-    0x8DE7: 'quán,zūn',
-    0x8DE8: 'kuà,kù,kuā,kuǎ',
-    0x8DE9: 'zhuǎi,shì',
-    0x8DEA: 'guì',
-    0x8DEB: 'qióng,qiāng,qiōng',
-    0x8DEC: 'kuǐ,xiè',
-    0x8DED: 'xiáng',
-    0x8DEE: 'chì,dié',
-    0x8DEF: 'lù,luò',
-    0x8DF0: 'pián,bèng,bǐng',
-    0x8DF1: 'zhì',
-    0x8DF2: 'jiá,jié',
-    0x8DF3: 'tiào,diào,táo',
-    0x8DF4: 'cǎi',
-    0x8DF5: 'jiàn',
-    0x8DF6: 'dá,da',
-    0x8DF7: 'qiāo',
-    0x8DF8: 'bì',
-    0x8DF9: 'xiān',
-    0x8DFA: 'duò',
-    0x8DFB: 'jī',
-    0x8DFC: 'jú,qù',
-    0x8DFD: 'jì',
-    0x8DFE: 'shū,chōu',
-    0x8DFF: 'tú,duó,chuō',
-    0x8E00: 'chù,cù',
-    0x8E01: 'jìng,kēng',
-    0x8E02: 'niè',
-    0x8E03: 'xiāo,qiào',
-    0x8E04: 'bù',
-    0x8E05: 'xué,chì',
-    0x8E06: 'cūn,qūn,cún,zūn,qiù,zhūn',
-    0x8E07: 'mǔ',
-    0x8E08: 'shū',
-    0x8E09: 'liáng,liàng,láng,làng',
-    0x8E0A: 'yǒng',
-    0x8E0B: 'jiǎo',
-    0x8E0C: 'chóu',
-    0x8E0D: 'qiāo',
-    0x8E0E: 'móu',
-    0x8E0F: 'tà,tā',
-    0x8E10: 'jiàn',
-    0x8E11: 'qí,jī,jì',
-    0x8E12: 'wō,wēi,ruí',
-    0x8E13: 'wěi,cù',
-    0x8E14: 'chuō,diào,zhuō,tiào,chuò',
-    0x8E15: 'jié',
-    0x8E16: 'jí,qì,què',
-    0x8E17: 'niè',
-    0x8E18: 'jū',
-    0x8E19: 'niè',
-    0x8E1A: 'lún',
-    0x8E1B: 'lù',
-    0x8E1C: 'lèng,léng,chěng',
-    0x8E1D: 'huái',
-    0x8E1E: 'jù',
-    0x8E1F: 'chí',
-    0x8E20: 'wǎn,wò',
-    0x8E21: 'quán,juǎn',
-    0x8E22: 'tī,dié',
-    0x8E23: 'bó,pòu',
-    0x8E24: 'zú,cù,cuì',
-    0x8E25: 'qiè',
-    0x8E26: 'yǐ,qī,jī,jǐ,yì',
-    0x8E27: 'cù,dí',
-    0x8E28: 'zōng',
-    0x8E29: 'cǎi,kuí',
-    0x8E2A: 'zōng',
-    0x8E2B: 'pèng,pán',
-    0x8E2C: 'zhì',
-    0x8E2D: 'zhēng',
-    0x8E2E: 'diǎn',
-    0x8E2F: 'zhí',
-    0x8E30: 'yú,yáo,chū',
-    0x8E31: 'duó,chuò,duò',
-    0x8E32: 'dùn',
-    0x8E33: 'chuǎn,chǔn,chūn',
-    0x8E34: 'yǒng',
-    0x8E35: 'zhǒng,zhòng',
-    0x8E36: 'dì,zhì,tí,chí,shì',
-    0x8E37: 'zhǎ',
-    0x8E38: 'chěn',
-    0x8E39: 'chuài,shuàn,duàn,chuǎn',
-    0x8E3A: 'jiàn',
-    0x8E3B: 'guā,guǎ,tuó',
-    0x8E3C: 'táng,tǎng,shāng',
-    0x8E3D: 'jǔ',
-    0x8E3E: 'fú,bì',
-    0x8E3F: 'zú',
-    0x8E40: 'dié',
-    0x8E41: 'pián',
-    0x8E42: 'róu,rǒu',
-    0x8E43: 'nuò,rè,nà',
-    0x8E44: 'tí,dì',
-    0x8E45: 'chǎ,zhā',
-    0x8E46: 'tuǐ',
-    0x8E47: 'jiǎn',
-    0x8E48: 'dǎo',
-    0x8E49: 'cuō',
-    0x8E4A: 'qī,xī',
-    0x8E4B: 'tà',
-    0x8E4C: 'qiāng,qiàng',
-    0x8E4D: 'niǎn,zhǎn,chán',
-    0x8E4E: 'diān',
-    0x8E4F: 'tí',
-    0x8E50: 'jí',
-    0x8E51: 'niè',
-    0x8E52: 'pán,mán',
-    0x8E53: 'liū,liù',
-    0x8E54: 'zàn,cán',
-    0x8E55: 'bì',
-    0x8E56: 'chōng',
-    0x8E57: 'lù',
-    0x8E58: 'liáo',
-    0x8E59: 'cù',
-    0x8E5A: 'tāng,tàng,chēng',
-    0x8E5B: 'dài,diē,dān,zhì',
-    0x8E5C: 'sù',
-    0x8E5D: 'xǐ',
-    0x8E5E: 'kuǐ',
-    0x8E5F: 'jī',
-    0x8E60: 'zhí,zhuó',
-    0x8E61: 'qiāng,qiàng',
-    0x8E62: 'dí,zhí',
-    0x8E63: 'pán,mán,liǎng',
-    0x8E64: 'zōng',
-    0x8E65: 'lián',
-    0x8E66: 'bèng',
-    0x8E67: 'zāo',
-    0x8E68: 'niǎn,rǎn',
-    0x8E69: 'bié',
-    0x8E6A: 'tuí',
-    0x8E6B: 'jú',
-    0x8E6C: 'dēng,dèng',
-    0x8E6D: 'cèng,céng',
-    0x8E6E: 'xiān',
-    0x8E6F: 'fán',
-    0x8E70: 'chú',
-    0x8E71: 'zhōng,chòng',
-    0x8E72: 'dūn,zún,cún,zūn,cǔn,cuán,qǔn',
-    0x8E73: 'bō',
-    0x8E74: 'cù,zú,jiu',
-    0x8E75: 'cù',
-    0x8E76: 'jué,juě,guì',
-    0x8E77: 'jué',
-    0x8E78: 'lìn,lín',
-    0x8E79: 'tá',
-    0x8E7A: 'qiāo,qiào',
-    0x8E7B: 'juē,qiāo,jiǎo,jué,jú,xuè',
-    0x8E7C: 'pǔ',
-    0x8E7D: 'liāo',
-    0x8E7E: 'dūn',
-    0x8E7F: 'cuān',
-    0x8E80: 'guàn',
-    0x8E81: 'zào',
-    0x8E82: 'dá',
-    0x8E83: 'bì',
-    0x8E84: 'bì',
-    0x8E85: 'zhú,zhuó',
-    0x8E86: 'jù',
-    0x8E87: 'chú,chuò',
-    0x8E88: 'qiào',
-    0x8E89: 'dǔn',
-    0x8E8A: 'chóu',
-    0x8E8B: 'jī',
-    0x8E8C: 'wǔ',
-    0x8E8D: 'yuè,tì',
-    0x8E8E: 'niǎn',
-    0x8E8F: 'lìn',
-    0x8E90: 'liè',
-    0x8E91: 'zhí',
-    0x8E92: 'lì,yuè,luò',
-    0x8E93: 'zhì,zhī',
-    0x8E94: 'chán,zhàn',
-    0x8E95: 'chú',
-    0x8E96: 'duàn',
-    0x8E97: 'wèi',
-    0x8E98: 'lóng,lǒng',
-    0x8E99: 'lìn',
-    0x8E9A: 'xiān',
-    0x8E9B: 'wèi',
-    0x8E9C: 'zuān',
-    0x8E9D: 'lán',
-    0x8E9E: 'xiè',
-    0x8E9F: 'ráng',
-    0x8EA0: 'sǎ,xiè',
-    0x8EA1: 'niè',
-    0x8EA2: 'tà',
-    0x8EA3: 'qú',
-    0x8EA4: 'jí',
-    0x8EA5: 'cuān',
-    0x8EA6: 'cuó,zuān',
-    0x8EA7: 'xǐ',
-    0x8EA8: 'kuí',
-    0x8EA9: 'jué,qì',
-    0x8EAA: 'lìn',
-    0x8EAB: 'shēn,juān',
-    0x8EAC: 'gōng',
-    0x8EAD: 'dān',
-    0x8EAE: 'fēn',
-    0x8EAF: 'qū',
-    0x8EB0: 'tǐ',
-    0x8EB1: 'duǒ',
-    0x8EB2: 'duǒ',
-    0x8EB3: 'gōng',
-    0x8EB4: 'láng',
-    0x8EB5: 'rěn',
-    0x8EB6: 'luǒ',
-    0x8EB7: 'ǎi',
-    0x8EB8: 'jī',
-    0x8EB9: 'jú',
-    0x8EBA: 'tǎng,tàng',
-    0x8EBB: 'kōng',
-    0x8EBC: 'lào',
-    0x8EBD: 'yǎn,yàn',
-    0x8EBE: 'měi',
-    0x8EBF: 'kāng',
-    0x8EC0: 'qū',
-    0x8EC1: 'lóu,lǚ',
-    0x8EC2: 'lào',
-    0x8EC3: 'duǒ,tuǒ',
-    0x8EC4: 'zhí',
-    0x8EC5: 'yàn',
-    0x8EC6: 'tǐ',
-    0x8EC7: 'dào',
-    0x8EC8: 'yīng',
-    0x8EC9: 'yù',
-    0x8ECA: 'chē,jū',
-    0x8ECB: 'yà,zhá,gá',
-    0x8ECC: 'guǐ',
-    0x8ECD: 'jūn',
-    0x8ECE: 'wèi',
-    0x8ECF: 'yuè',
-    0x8ED0: 'xìn,xiàn',
-    0x8ED1: 'dài',
-    0x8ED2: 'xuān,xiǎn,xiàn,hǎn,jiān',
-    0x8ED3: 'fàn',
-    0x8ED4: 'rèn',
-    0x8ED5: 'shān',
-    0x8ED6: 'kuáng',
-    0x8ED7: 'shū',
-    0x8ED8: 'tún',
-    0x8ED9: 'chén,qí',
-    0x8EDA: 'dài',
-    0x8EDB: 'è',
-    0x8EDC: 'nà',
-    0x8EDD: 'qí',
-    0x8EDE: 'máo',
-    0x8EDF: 'ruǎn',
-    0x8EE0: 'kuáng',
-    0x8EE1: 'qián',
-    0x8EE2: 'zhuǎn',
-    0x8EE3: 'hōng',
-    0x8EE4: 'hū',
-    0x8EE5: 'qú,gōu,gòu,jū',
-    0x8EE6: 'kuàng',
-    0x8EE7: 'dǐ,chí',
-    0x8EE8: 'líng,lǐng',
-    0x8EE9: 'dài',
-    0x8EEA: 'āo,ào',
-    0x8EEB: 'zhěn',
-    0x8EEC: 'fàn,bèn',
-    0x8EED: 'kuāng',
-    0x8EEE: 'yǎng',
-    0x8EEF: 'pēng',
-    0x8EF0: 'bèi',
-    0x8EF1: 'gū',
-    0x8EF2: 'gū',
-    0x8EF3: 'páo',
-    0x8EF4: 'zhù',
-    0x8EF5: 'rǒng,fǔ,fù,róng',
-    0x8EF6: 'è',
-    0x8EF7: 'bá',
-    0x8EF8: 'zhóu,zhú,zhòu',
-    0x8EF9: 'zhǐ',
-    0x8EFA: 'yáo,diāo',
-    0x8EFB: 'kē',
-    0x8EFC: 'yì,dié,zhé',
-    0x8EFD: 'zhì,qīng',
-    0x8EFE: 'shì',
-    0x8EFF: 'píng',
-    0x8F00: 'ér',
-    0x8F01: 'gǒng',
-    0x8F02: 'jú',
-    0x8F03: 'jiào,jué,xiào',
-    0x8F04: 'guāng',
-    0x8F05: 'hé,lù,yà',
-    0x8F06: 'kǎi,kài',
-    0x8F07: 'quán,chūn',
-    0x8F08: 'zhōu',
-    0x8F09: 'zài,zǎi,dài,zāi,zī',
-    0x8F0A: 'zhì',
-    0x8F0B: 'shē',
-    0x8F0C: 'liàng',
-    0x8F0D: 'yù',
-    0x8F0E: 'shāo',
-    0x8F0F: 'yóu',
-    0x8F10: 'wàn,yuǎn',
-    0x8F11: 'yǐn,qūn',
-    0x8F12: 'zhé',
-    0x8F13: 'wǎn',
-    0x8F14: 'fǔ',
-    0x8F15: 'qīng,qìng',
-    0x8F16: 'zhōu',
-    0x8F17: 'ní,yì',
-    0x8F18: 'léng,líng,lèng',
-    0x8F19: 'zhé',
-    0x8F1A: 'zhàn',
-    0x8F1B: 'liàng',
-    0x8F1C: 'zī,zì',
-    0x8F1D: 'huī',
-    0x8F1E: 'wǎng',
-    0x8F1F: 'chuò',
-    0x8F20: 'guǒ,huà,huì',
-    0x8F21: 'kǎn',
-    0x8F22: 'yǐ',
-    0x8F23: 'péng',
-    0x8F24: 'qiàn',
-    0x8F25: 'gǔn',
-    0x8F26: 'niǎn,liǎn',
-    0x8F27: 'píng,pēng',
-    0x8F28: 'guǎn',
-    0x8F29: 'bèi',
-    0x8F2A: 'lún',
-    0x8F2B: 'pái',
-    0x8F2C: 'liáng',
-    0x8F2D: 'ruǎn,ér',
-    0x8F2E: 'róu,rǒu',
-    0x8F2F: 'jí',
-    0x8F30: 'yáng',
-    0x8F31: 'xián,kàn',
-    0x8F32: 'chuán',
-    0x8F33: 'còu',
-    0x8F34: 'chūn,shǔn',
-    0x8F35: 'gé,yà,è,qiè',
-    0x8F36: 'yóu',
-    0x8F37: 'hōng',
-    0x8F38: 'shū,shù',
-    0x8F39: 'fù,bú',
-    0x8F3A: 'zī',
-    0x8F3B: 'fú',
-    0x8F3C: 'wēn,yūn',
-    0x8F3D: 'bèn',
-    0x8F3E: 'zhǎn,niǎn',
-    0x8F3F: 'yú,yù',
-    0x8F40: 'wēn',
-    0x8F41: 'tāo,kǎn',
-    0x8F42: 'gǔ,gū',
-    0x8F43: 'zhēn',
-    0x8F44: 'xiá,hé',
-    0x8F45: 'yuán',
-    0x8F46: 'lù',
-    0x8F47: 'jiāo,xiǎo',
-    0x8F48: 'cháo',
-    0x8F49: 'zhuǎn,zhuàn,zhuǎi',
-    0x8F4A: 'wèi',
-    0x8F4B: 'hún',
-    0x8F4C: 'xuě',
-    0x8F4D: 'zhé',
-    0x8F4E: 'jiào',
-    0x8F4F: 'zhàn',
-    0x8F50: 'bú',
-    0x8F51: 'lǎo,láo,liáo,liǎo,liào',
-    0x8F52: 'fén',
-    0x8F53: 'fān',
-    0x8F54: 'lín,lìn',
-    0x8F55: 'gé',
-    0x8F56: 'sè',
-    0x8F57: 'kǎn',
-    0x8F58: 'huán,huàn',
-    0x8F59: 'yǐ',
-    0x8F5A: 'jí',
-    0x8F5B: 'zhuì',
-    0x8F5C: 'ér',
-    0x8F5D: 'yù',
-    0x8F5E: 'jiàn',
-    0x8F5F: 'hōng',
-    0x8F60: 'léi',
-    0x8F61: 'pèi',
-    0x8F62: 'lì',
-    0x8F63: 'lì',
-    0x8F64: 'lú',
-    0x8F65: 'lìn',
-    0x8F66: 'chē,jū',
-    0x8F67: 'yà,zhá,gá',
-    0x8F68: 'guǐ',
-    0x8F69: 'xuān',
-    0x8F6A: 'dài',
-    0x8F6B: 'rèn',
-    0x8F6C: 'zhuǎn,zhuàn,zhuǎi',
-    0x8F6D: 'è',
-    0x8F6E: 'lún',
-    0x8F6F: 'ruǎn',
-    0x8F70: 'hōng',
-    0x8F71: 'gū',
-    0x8F72: 'kē,kě',
-    0x8F73: 'lú',
-    0x8F74: 'zhóu,zhòu',
-    0x8F75: 'zhǐ',
-    0x8F76: 'yì',
-    0x8F77: 'hū',
-    0x8F78: 'zhěn',
-    0x8F79: 'lì',
-    0x8F7A: 'yáo',
-    0x8F7B: 'qīng',
-    0x8F7C: 'shì',
-    0x8F7D: 'zài,zǎi',
-    0x8F7E: 'zhì',
-    0x8F7F: 'jiào',
-    0x8F80: 'zhōu',
-    0x8F81: 'quán',
-    0x8F82: 'lù',
-    0x8F83: 'jiào',
-    0x8F84: 'zhé',
-    0x8F85: 'fǔ',
-    0x8F86: 'liàng',
-    0x8F87: 'niǎn',
-    0x8F88: 'bèi',
-    0x8F89: 'huī',
-    0x8F8A: 'gǔn',
-    0x8F8B: 'wǎng',
-    0x8F8C: 'liáng',
-    0x8F8D: 'chuò',
-    0x8F8E: 'zī',
-    0x8F8F: 'còu',
-    0x8F90: 'fú',
-    0x8F91: 'jí',
-    0x8F92: 'wēn',
-    0x8F93: 'shū',
-    0x8F94: 'pèi',
-    0x8F95: 'yuán',
-    0x8F96: 'xiá',
-    0x8F97: 'niǎn,zhǎn',
-    0x8F98: 'lù',
-    0x8F99: 'zhé',
-    0x8F9A: 'lín',
-    0x8F9B: 'xīn',
-    0x8F9C: 'gū',
-    0x8F9D: 'cí',
-    0x8F9E: 'cí',
-    0x8F9F: 'pì,bì,mǐ,pī',
-    0x8FA0: 'zuì,zuī',
-    0x8FA1: 'biàn',
-    0x8FA2: 'là',
-    0x8FA3: 'là',
-    0x8FA4: 'cí',
-    0x8FA5: 'xuē,yì',
-    0x8FA6: 'bàn',
-    0x8FA7: 'biàn',
-    0x8FA8: 'biàn,biǎn,bàn,piàn',
-    0x8FA9: 'biàn',
-    0x8FAA: 'xuē',
-    0x8FAB: 'biàn',
-    0x8FAC: 'bān',
-    0x8FAD: 'cí',
-    0x8FAE: 'biàn',
-    0x8FAF: 'biàn,pián,biǎn,bàn',
-    0x8FB0: 'chén',
-    0x8FB1: 'rǔ',
-    0x8FB2: 'nóng',
-    0x8FB3: 'nóng',
-    0x8FB4: 'chǎn,zhěn',
-    0x8FB5: 'chuò',
-    0x8FB6: 'chuò',
-    0x8FB7: 'yī',
-    0x8FB8: 'réng',
-    0x8FB9: 'biān,bian',
-    0x8FBA: 'biān',
-    0x8FBB: 'shí',
-    0x8FBC: 'yū',
-    0x8FBD: 'liáo',
-    0x8FBE: 'dá,tì,tà',
-    0x8FBF: 'chān,chán',
-    0x8FC0: 'gān',
-    0x8FC1: 'qiān',
-    0x8FC2: 'yū',
-    0x8FC3: 'yū',
-    0x8FC4: 'qì',
-    0x8FC5: 'xùn',
-    0x8FC6: 'yí,yǐ,tuó',
-    0x8FC7: 'guò,guō',
-    0x8FC8: 'mài',
-    0x8FC9: 'qī',
-    0x8FCA: 'zā',
-    0x8FCB: 'wàng,guàng,kuáng',
-    0x8FCC: 'tù',
-    0x8FCD: 'zhūn',
-    0x8FCE: 'yíng,yìng',
-    0x8FCF: 'dá',
-    0x8FD0: 'yùn,yǔn',
-    0x8FD1: 'jìn',
-    0x8FD2: 'háng,xiáng',
-    0x8FD3: 'yà',
-    0x8FD4: 'fǎn',
-    0x8FD5: 'wù,wǔ',
-    0x8FD6: 'dá',
-    0x8FD7: 'é',
-    0x8FD8: 'hái,huán,fú',
-    0x8FD9: 'zhè,zhèi',
-    0x8FDA: 'dá',
-    0x8FDB: 'jìn',
-    0x8FDC: 'yuǎn',
-    0x8FDD: 'wéi',
-    0x8FDE: 'lián',
-    0x8FDF: 'chí',
-    0x8FE0: 'chè',
-    0x8FE1: 'nì,chí',
-    0x8FE2: 'tiáo',
-    0x8FE3: 'zhì,chì',
-    0x8FE4: 'yí,yǐ,tuó',
-    0x8FE5: 'jiǒng',
-    0x8FE6: 'jiā,xiè',
-    0x8FE7: 'chén',
-    0x8FE8: 'dài',
-    0x8FE9: 'ěr',
-    0x8FEA: 'dí',
-    0x8FEB: 'pò,pǎi',
-    0x8FEC: 'zhù,wǎng',
-    0x8FED: 'dié,yì,dá',
-    0x8FEE: 'zé,zuò',
-    0x8FEF: 'táo',
-    0x8FF0: 'shù',
-    0x8FF1: 'tuó,yí',
-    0x8FF2: 'qu',
-    0x8FF3: 'jìng',
-    0x8FF4: 'huí',
-    0x8FF5: 'dòng',
-    0x8FF6: 'yòu',
-    0x8FF7: 'mí,mì',
-    0x8FF8: 'bèng',
-    0x8FF9: 'jì,jī',
-    0x8FFA: 'nǎi',
-    0x8FFB: 'yí',
-    0x8FFC: 'jié',
-    0x8FFD: 'zhuī,duī,tuī',
-    0x8FFE: 'liè',
-    0x8FFF: 'xùn',
-    0x9000: 'tuì',
-    0x9001: 'sòng',
-    0x9002: 'shì,kuò',
-    0x9003: 'táo',
-    0x9004: 'páng,féng',
-    0x9005: 'hòu',
-    0x9006: 'nì',
-    0x9007: 'dùn',
-    0x9008: 'jiǒng',
-    0x9009: 'xuǎn',
-    0x900A: 'xùn',
-    0x900B: 'bū',
-    0x900C: 'yōu,yóu',
-    0x900D: 'xiāo',
-    0x900E: 'qiú',
-    0x900F: 'tòu,shū',
-    0x9010: 'zhú,dí,zhòu,tún',
-    0x9011: 'qiú',
-    0x9012: 'dì',
-    0x9013: 'dì',
-    0x9014: 'tú',
-    0x9015: 'jìng',
-    0x9016: 'tì',
-    0x9017: 'dòu,zhù,tóu,qí',
-    0x9018: 'yǐ,sì',
-    0x9019: 'zhè,yàn,zhèi',
-    0x901A: 'tōng,tòng',
-    0x901B: 'guàng,kuáng',
-    0x901C: 'wù,wǔ',
-    0x901D: 'shì',
-    0x901E: 'chěng,yíng',
-    0x901F: 'sù',
-    0x9020: 'zào,cào,cāo',
-    0x9021: 'qūn,xùn,suō',
-    0x9022: 'féng,péng,páng',
-    0x9023: 'lián,liǎn,liàn,làn',
-    0x9024: 'suò',
-    0x9025: 'huí',
-    0x9026: 'lǐ',
-    0x9027: 'gǔ',
-    0x9028: 'lái,lài',
-    0x9029: 'bèn,bēn',
-    0x902A: 'cuò',
-    0x902B: 'jué,zhú',
-    0x902C: 'bèng,pēng',
-    0x902D: 'huàn',
-    0x902E: 'dǎi,dài,dì',
-    0x902F: 'lù,dài',
-    0x9030: 'yóu',
-    0x9031: 'zhōu',
-    0x9032: 'jìn',
-    0x9033: 'yù',
-    0x9034: 'chuō,chuò',
-    0x9035: 'kuí,kuǐ',
-    0x9036: 'wēi',
-    0x9037: 'tì',
-    0x9038: 'yì',
-    0x9039: 'dá',
-    0x903A: 'yuǎn',
-    0x903B: 'luó',
-    0x903C: 'bī',
-    0x903D: 'nuò',
-    0x903E: 'yú,dòu',
-    0x903F: 'dàng,táng',
-    0x9040: 'suí',
-    0x9041: 'dùn,qūn,xún',
-    0x9042: 'suì,suí',
-    0x9043: 'yǎn,àn',
-    0x9044: 'chuán',
-    0x9045: 'chí',
-    0x9046: 'tí',
-    0x9047: 'yù,yóng,ǒu',
-    0x9048: 'shí',
-    0x9049: 'zhēn',
-    0x904A: 'yóu',
-    0x904B: 'yùn',
-    0x904C: 'è',
-    0x904D: 'biàn',
-    0x904E: 'guò,guō,guo,huò',
-    0x904F: 'è',
-    0x9050: 'xiá',
-    0x9051: 'huáng',
-    0x9052: 'qiú,qiū',
-    0x9053: 'dào,dǎo',
-    0x9054: 'dá,tà',
-    0x9055: 'wéi,huí',
-    0x9056: 'nán',
-    0x9057: 'yí,wèi',
-    0x9058: 'gòu',
-    0x9059: 'yáo',
-    0x905A: 'chòu',
-    0x905B: 'liú,liù',
-    0x905C: 'xùn',
-    0x905D: 'tà',
-    0x905E: 'dì,shì,dài',
-    0x905F: 'chí,zhì,xī',
-    0x9060: 'yuǎn,yuàn',
-    0x9061: 'sù',
-    0x9062: 'tà,tā',
-    0x9063: 'qiǎn,qiàn',
-    0x9064: 'mǎ',
-    0x9065: 'yáo',
-    0x9066: 'guàn',
-    0x9067: 'zhāng',
-    0x9068: 'áo',
-    0x9069: 'shì,dí,tì,zhé',
-    0x906A: 'cà',
-    0x906B: 'chì',
-    0x906C: 'sù',
-    0x906D: 'zāo',
-    0x906E: 'zhē',
-    0x906F: 'dùn',
-    0x9070: 'dì,shì,dài',
-    0x9071: 'lóu',
-    0x9072: 'chí,zhì',
-    0x9073: 'cuō',
-    0x9074: 'lín,lìn',
-    0x9075: 'zūn',
-    0x9076: 'rào',
-    0x9077: 'qiān',
-    0x9078: 'xuǎn,xuàn,suàn,shuā',
-    0x9079: 'yù',
-    0x907A: 'yí,wèi,suí',
-    0x907B: 'è',
-    0x907C: 'liáo',
-    0x907D: 'jù,qú',
-    0x907E: 'shì',
-    0x907F: 'bì',
-    0x9080: 'yāo',
-    0x9081: 'mài',
-    0x9082: 'xiè',
-    0x9083: 'suì',
-    0x9084: 'hái,huán,xuán',
-    0x9085: 'zhān,zhàn',
-    0x9086: 'téng',
-    0x9087: 'ěr',
-    0x9088: 'miǎo,miáo',
-    0x9089: 'biān',
-    0x908A: 'biān',
-    0x908B: 'lā,liè',
-    0x908C: 'lí,chí',
-    0x908D: 'yuán',
-    0x908E: 'yáo',
-    0x908F: 'luó,luò',
-    0x9090: 'lǐ',
-    0x9091: 'yì,è',
-    0x9092: 'tíng',
-    0x9093: 'dèng,shān',
-    0x9094: 'qǐ',
-    0x9095: 'yōng,yǒng',
-    0x9096: 'shān',
-    0x9097: 'hán',
-    0x9098: 'yú',
-    0x9099: 'máng',
-    0x909A: 'rú,fù',
-    0x909B: 'qióng',
-    0x909C: 'xī',
-    0x909D: 'kuàng',
-    0x909E: 'fū',
-    0x909F: 'kàng,háng,kāng',
-    0x90A0: 'bīn',
-    0x90A1: 'fāng,fàng',
-    0x90A2: 'xíng,gěng',
-    0x90A3: 'nà,nā,nuó,nuò,nèi,nǎ,něi,né,nǎi,nè',
-    0x90A4: 'xīn',
-    0x90A5: 'shěn',
-    0x90A6: 'bāng',
-    0x90A7: 'yuán',
-    0x90A8: 'cūn',
-    0x90A9: 'huǒ',
-    0x90AA: 'xié,yá,yé,xú,shé',
-    0x90AB: 'bāng',
-    0x90AC: 'wū',
-    0x90AD: 'jù',
-    0x90AE: 'yóu',
-    0x90AF: 'hán,hàn',
-    0x90B0: 'tái',
-    0x90B1: 'qiū',
-    0x90B2: 'bì,biàn',
-    0x90B3: 'pī',
-    0x90B4: 'bǐng',
-    0x90B5: 'shào',
-    0x90B6: 'bèi',
-    0x90B7: 'wǎ',
-    0x90B8: 'dǐ',
-    0x90B9: 'zōu',
-    0x90BA: 'yè,qiū',
-    0x90BB: 'lín',
-    0x90BC: 'kuāng',
-    0x90BD: 'guī',
-    0x90BE: 'zhū',
-    0x90BF: 'shī',
-    0x90C0: 'kū',
-    0x90C1: 'yù',
-    0x90C2: 'gāi,hái',
-    0x90C3: 'hé,xiá',
-    0x90C4: 'qiè,xì',
-    0x90C5: 'zhì,jí',
-    0x90C6: 'jí',
-    0x90C7: 'huán,xún',
-    0x90C8: 'hòu',
-    0x90C9: 'xíng',
-    0x90CA: 'jiāo',
-    0x90CB: 'xí',
-    0x90CC: 'guī',
-    0x90CD: 'nuó,nǎ,fú',
-    0x90CE: 'láng,làng',
-    0x90CF: 'jiá',
-    0x90D0: 'kuài',
-    0x90D1: 'zhèng',
-    0x90D2: 'láng',
-    0x90D3: 'yùn',
-    0x90D4: 'yán',
-    0x90D5: 'chéng',
-    0x90D6: 'dòu',
-    0x90D7: 'xī,chī',
-    0x90D8: 'lǚ',
-    0x90D9: 'fǔ',
-    0x90DA: 'wú,yú',
-    0x90DB: 'fú',
-    0x90DC: 'gào',
-    0x90DD: 'hǎo,shì',
-    0x90DE: 'láng',
-    0x90DF: 'jiá',
-    0x90E0: 'gěng',
-    0x90E1: 'jùn',
-    0x90E2: 'yǐng,chéng',
-    0x90E3: 'bó',
-    0x90E4: 'xì',
-    0x90E5: 'bèi',
-    0x90E6: 'lì',
-    0x90E7: 'yún',
-    0x90E8: 'bù,pǒu',
-    0x90E9: 'xiáo,ǎo',
-    0x90EA: 'qī',
-    0x90EB: 'pí',
-    0x90EC: 'qīng',
-    0x90ED: 'guō,guó',
-    0x90EE: 'zhōu',
-    0x90EF: 'tán',
-    0x90F0: 'zōu,jǔ',
-    0x90F1: 'píng',
-    0x90F2: 'lái,lěi',
-    0x90F3: 'ní',
-    0x90F4: 'chēn,lán',
-    0x90F5: 'yóu,chuí',
-    0x90F6: 'bù',
-    0x90F7: 'xiāng',
-    0x90F8: 'dān',
-    0x90F9: 'jú',
-    0x90FA: 'yōng',
-    0x90FB: 'qiāo',
-    0x90FC: 'yī',
-    0x90FD: 'dōu,dū',
-    0x90FE: 'yǎn,yān',
-    0x90FF: 'méi',
-    0x9100: 'ruò',
-    0x9101: 'bèi',
-    0x9102: 'è',
-    0x9103: 'shū',
-    0x9104: 'juàn',
-    0x9105: 'yǔ',
-    0x9106: 'yùn',
-    0x9107: 'hóu',
-    0x9108: 'kuí',
-    0x9109: 'xiāng,xiǎng,xiàng',
-    0x910A: 'xiāng',
-    0x910B: 'sōu',
-    0x910C: 'táng',
-    0x910D: 'míng',
-    0x910E: 'xī',
-    0x910F: 'rǔ',
-    0x9110: 'chù',
-    0x9111: 'zī',
-    0x9112: 'zōu,jù',
-    0x9113: 'yè',
-    0x9114: 'wū',
-    0x9115: 'xiāng',
-    0x9116: 'yún',
-    0x9117: 'hào,qiāo,jiāo',
-    0x9118: 'yōng',
-    0x9119: 'bǐ',
-    0x911A: 'mào,mò',
-    0x911B: 'cháo',
-    0x911C: 'fū,lù',
-    0x911D: 'liǎo',
-    0x911E: 'yín',
-    0x911F: 'zhuān',
-    0x9120: 'hù',
-    0x9121: 'qiāo',
-    0x9122: 'yān',
-    0x9123: 'zhāng,zhàng',
-    0x9124: 'màn,wàn',
-    0x9125: 'qiāo',
-    0x9126: 'xǔ',
-    0x9127: 'dèng',
-    0x9128: 'bì',
-    0x9129: 'xún',
-    0x912A: 'bì',
-    0x912B: 'zēng,céng',
-    0x912C: 'wéi',
-    0x912D: 'zhèng',
-    0x912E: 'mào',
-    0x912F: 'shàn',
-    0x9130: 'lín,lìn',
-    0x9131: 'pó,pí,pán',
-    0x9132: 'dān,duō',
-    0x9133: 'méng',
-    0x9134: 'yè',
-    0x9135: 'cào,sāo',
-    0x9136: 'kuài',
-    0x9137: 'fēng',
-    0x9138: 'méng',
-    0x9139: 'zōu,jù',
-    0x913A: 'kuàng,kuò',
-    0x913B: 'liǎn',
-    0x913C: 'zàn',
-    0x913D: 'chán',
-    0x913E: 'yōu',
-    0x913F: 'jī,qí',
-    0x9140: 'yàn,yǎn',
-    0x9141: 'chán',
-    0x9142: 'cuó,zàn',
-    0x9143: 'líng',
-    0x9144: 'huān,quān',
-    0x9145: 'xī',
-    0x9146: 'fēng',
-    0x9147: 'zàn,cuó',
-    0x9148: 'lì,lí,zhí',
-    0x9149: 'yǒu',
-    0x914A: 'dīng,dǐng',
-    0x914B: 'qiú',
-    0x914C: 'zhuó',
-    0x914D: 'pèi',
-    0x914E: 'zhòu',
-    0x914F: 'yǐ,yí',
-    0x9150: 'gān,hàng',
-    0x9151: 'yú',
-    0x9152: 'jiǔ',
-    0x9153: 'yǎn,yàn,yǐn',
-    0x9154: 'zuì',
-    0x9155: 'máo',
-    0x9156: 'zhèn,dān',
-    0x9157: 'xù',
-    0x9158: 'dòu',
-    0x9159: 'zhēn',
-    0x915A: 'fēn',
-    0x915B: 'yuán',
-    0x915C: 'fu',
-    0x915D: 'yùn',
-    0x915E: 'tài',
-    0x915F: 'tiān',
-    0x9160: 'qiǎ',
-    0x9161: 'tuó,duò',
-    0x9162: 'cù,zuò',
-    0x9163: 'hān,hàn',
-    0x9164: 'gū',
-    0x9165: 'sū',
-    0x9166: 'pò,pō,fā',
-    0x9167: 'chóu',
-    0x9168: 'zài,zuì',
-    0x9169: 'mǐng',
-    0x916A: 'lào,luò,lù',
-    0x916B: 'chuò',
-    0x916C: 'chóu',
-    0x916D: 'yòu',
-    0x916E: 'tóng,dòng,chóng',
-    0x916F: 'zhǐ',
-    0x9170: 'xiān',
-    0x9171: 'jiàng',
-    0x9172: 'chéng',
-    0x9173: 'yìn',
-    0x9174: 'tú',
-    0x9175: 'jiào',
-    0x9176: 'méi',
-    0x9177: 'kù',
-    0x9178: 'suān',
-    0x9179: 'lèi',
-    0x917A: 'pú',
-    0x917B: 'zuì,fú',
-    0x917C: 'hǎi',
-    0x917D: 'yàn',
-    0x917E: 'shāi,shī',
-    0x917F: 'niàng,niáng',
-    0x9180: 'wéi,zhuì',
-    0x9181: 'lù',
-    0x9182: 'lǎn',
-    0x9183: 'yān,āng',
-    0x9184: 'táo',
-    0x9185: 'pēi',
-    0x9186: 'zhǎn',
-    0x9187: 'chún',
-    0x9188: 'tán,dàn',
-    0x9189: 'zuì',
-    0x918A: 'zhuì',
-    0x918B: 'cù,zuò',
-    0x918C: 'kūn',
-    0x918D: 'tí,tǐ',
-    0x918E: 'xián,jiǎn',
-    0x918F: 'dū',
-    0x9190: 'hú',
-    0x9191: 'xǔ',
-    0x9192: 'xǐng,chéng,jīng',
-    0x9193: 'tǎn',
-    0x9194: 'qiú,chōu',
-    0x9195: 'chún',
-    0x9196: 'yùn',
-    0x9197: 'pò',
-    0x9198: 'kē',
-    0x9199: 'sōu',
-    0x919A: 'mí',
-    0x919B: 'quán,chuò',
-    0x919C: 'chǒu',
-    0x919D: 'cuō,cuǒ',
-    0x919E: 'yùn',
-    0x919F: 'yòng',
-    0x91A0: 'àng',
-    0x91A1: 'zhà',
-    0x91A2: 'hǎi',
-    0x91A3: 'táng',
-    0x91A4: 'jiàng',
-    0x91A5: 'piǎo',
-    0x91A6: 'chěn,chǎn',
-    0x91A7: 'yù,ōu',
-    0x91A8: 'lí',
-    0x91A9: 'zāo',
-    0x91AA: 'láo',
-    0x91AB: 'yī,yǐ',
-    0x91AC: 'jiàng',
-    0x91AD: 'bú',
-    0x91AE: 'jiào,qiáo,zhàn',
-    0x91AF: 'xī',
-    0x91B0: 'tán',
-    0x91B1: 'fā,pò,pō',
-    0x91B2: 'nóng',
-    0x91B3: 'yì,shì',
-    0x91B4: 'lǐ',
-    0x91B5: 'jù',
-    0x91B6: 'yàn,liǎn,xiān,jiǎn',
-    0x91B7: 'yì,yǐ,ài',
-    0x91B8: 'niàng',
-    0x91B9: 'rú',
-    0x91BA: 'xūn',
-    0x91BB: 'chóu,shòu,dào',
-    0x91BC: 'yàn',
-    0x91BD: 'líng',
-    0x91BE: 'mí',
-    0x91BF: 'mí',
-    0x91C0: 'niàng,niáng',
-    0x91C1: 'xìn',
-    0x91C2: 'jiào',
-    0x91C3: 'shāi,shī,lí',
-    0x91C4: 'mí',
-    0x91C5: 'yàn',
-    0x91C6: 'biàn,biǎn',
-    0x91C7: 'cǎi,cài',
-    0x91C8: 'shì',
-    0x91C9: 'yòu',
-    0x91CA: 'shì',
-    0x91CB: 'shì,yì',
-    0x91CC: 'lǐ,li',
-    0x91CD: 'zhòng,chóng,tóng',
-    0x91CE: 'yě,shù',
-    0x91CF: 'liàng,liáng',
-    0x91D0: 'lí,xī,lái,tāi,lài,xǐ',
-    0x91D1: 'jīn,jìn',
-    0x91D2: 'jīn',
-    0x91D3: 'qiú,gá',
-    0x91D4: 'yǐ',
-    0x91D5: 'liǎo,liào',
-    0x91D6: 'dāo',
-    0x91D7: 'zhāo',
-    0x91D8: 'dīng,dìng,líng',
-    0x91D9: 'pò,pō',
-    0x91DA: 'qiú',
-    0x91DB: 'bā',
-    0x91DC: 'fǔ',
-    0x91DD: 'zhēn',
-    0x91DE: 'zhí',
-    0x91DF: 'bā',
-    0x91E0: 'luàn',
-    0x91E1: 'fǔ',
-    0x91E2: 'nǎi',
-    0x91E3: 'diào',
-    0x91E4: 'shàn,shān,xiān',
-    0x91E5: 'qiǎo,jiǎo',
-    0x91E6: 'kòu',
-    0x91E7: 'chuàn,chuān',
-    0x91E8: 'zǐ',
-    0x91E9: 'fǎn,fàn,fán',
-    0x91EA: 'huá,yú',
-    0x91EB: 'huá,wū',
-    0x91EC: 'hàn,gān',
-    0x91ED: 'gāng,gōng',
-    0x91EE: 'qí',
-    0x91EF: 'máng',
-    0x91F0: 'rì,rèn,jiàn',
-    0x91F1: 'dì',
-    0x91F2: 'sì',
-    0x91F3: 'xì',
-    0x91F4: 'yì',
-    0x91F5: 'chāi,chā',
-    0x91F6: 'shī,yí,yě',
-    0x91F7: 'tǔ',
-    0x91F8: 'xī',
-    0x91F9: 'nǚ',
-    0x91FA: 'qiān',
-    0x91FB: 'qiú',
-    0x91FC: 'jiàn',
-    0x91FD: 'pì,pī,zhāo',
-    0x91FE: 'yé,yá',
-    0x91FF: 'jīn,yǐn,yín',
-    0x9200: 'bǎ,bā,pá',
-    0x9201: 'fāng',
-    0x9202: 'chén,qín,zhèn',
-    0x9203: 'xíng',
-    0x9204: 'dǒu',
-    0x9205: 'yuè',
-    0x9206: 'qiān,zhōng',
-    0x9207: 'fū,fǔ',
-    0x9208: 'pī,bù',
-    0x9209: 'nà,ruì',
-    0x920A: 'xīn,qìn',
-    0x920B: 'é',
-    0x920C: 'jué',
-    0x920D: 'dùn',
-    0x920E: 'gōu',
-    0x920F: 'yǐn',
-    0x9210: 'qián,hán',
-    0x9211: 'bǎn',
-    0x9212: 'sà,xì',
-    0x9213: 'rén',
-    0x9214: 'chāo,chǎo',
-    0x9215: 'niǔ,chǒu',
-    0x9216: 'fēn',
-    0x9217: 'yǔn,duì',
-    0x9218: 'yǐ',
-    0x9219: 'qín',
-    0x921A: 'pī,bī,bǐ',
-    0x921B: 'guō',
-    0x921C: 'hóng',
-    0x921D: 'yín',
-    0x921E: 'jūn',
-    0x921F: 'diào',
-    0x9220: 'yì',
-    0x9221: 'zhōng',
-    0x9222: 'xǐ',
-    0x9223: 'gài',
-    0x9224: 'rì',
-    0x9225: 'huǒ',
-    0x9226: 'tài',
-    0x9227: 'kàng',
-    0x9228: 'yuán',
-    0x9229: 'lú',
-    0x922A: 'è',
-    0x922B: 'qín',
-    0x922C: 'duó',
-    0x922D: 'zī',
-    0x922E: 'nǐ,ní',
-    0x922F: 'tú',
-    0x9230: 'shì',
-    0x9231: 'mín,mǐn',
-    0x9232: 'gū,pì',
-    0x9233: 'kē',
-    0x9234: 'líng',
-    0x9235: 'bǐng',
-    0x9236: 'sì,cí,tái',
-    0x9237: 'gǔ,hú,gù',
-    0x9238: 'bó',
-    0x9239: 'pī,pí',
-    0x923A: 'yù',
-    0x923B: 'sì',
-    0x923C: 'zuó',
-    0x923D: 'bū',
-    0x923E: 'yóu,zhòu',
-    0x923F: 'tián,diàn',
-    0x9240: 'jiǎ,gé',
-    0x9241: 'zhēn,zhèn',
-    0x9242: 'shǐ',
-    0x9243: 'shì,zú',
-    0x9244: 'zhí,tiě',
-    0x9245: 'jù',
-    0x9246: 'chān,qián,tiē',
-    0x9247: 'shī,yí',
-    0x9248: 'shī,shé,yí,tuó,tā',
-    0x9249: 'xuàn',
-    0x924A: 'zhāo',
-    0x924B: 'bào,páo,báo',
-    0x924C: 'hé',
-    0x924D: 'bì,sè',
-    0x924E: 'shēng',
-    0x924F: 'chú,zū,zhù,jǔ,chá,xú',
-    0x9250: 'shí,zú',
-    0x9251: 'bó',
-    0x9252: 'zhù',
-    0x9253: 'chì',
-    0x9254: 'zā',
-    0x9255: 'pō,pǒ',
-    0x9256: 'tóng',
-    0x9257: 'qián,ān',
-    0x9258: 'fú',
-    0x9259: 'zhǎi',
-    0x925A: 'liǔ,mǎo',
-    0x925B: 'qiān,yán',
-    0x925C: 'fú',
-    0x925D: 'lì',
-    0x925E: 'yuè',
-    0x925F: 'pī',
-    0x9260: 'yāng',
-    0x9261: 'bàn',
-    0x9262: 'bō',
-    0x9263: 'jié',
-    0x9264: 'gōu,gòu,qú',
-    0x9265: 'shù,xù',
-    0x9266: 'zhēng',
-    0x9267: 'mǔ',
-    0x9268: 'xǐ,nǐ,niě',
-    0x9269: 'xǐ,niè',
-    0x926A: 'dì',
-    0x926B: 'jiā',
-    0x926C: 'mù',
-    0x926D: 'tǎn',
-    0x926E: 'huán,shén,shēn',
-    0x926F: 'yǐ',
-    0x9270: 'sī',
-    0x9271: 'kuàng',
-    0x9272: 'kǎ',
-    0x9273: 'běi',
-    0x9274: 'jiàn',
-    0x9275: 'tóng,zhuó',
-    0x9276: 'xíng',
-    0x9277: 'hóng',
-    0x9278: 'jiǎo',
-    0x9279: 'chǐ',
-    0x927A: 'èr,kēng,ěr',
-    0x927B: 'luò,gē,gè',
-    0x927C: 'bǐng,píng',
-    0x927D: 'shì',
-    0x927E: 'móu,máo',
-    0x927F: 'jiā,gē,kē,hā',
-    0x9280: 'yín',
-    0x9281: 'jūn',
-    0x9282: 'zhōu',
-    0x9283: 'chòng',
-    0x9284: 'xiǎng,jiōng',
-    0x9285: 'tóng',
-    0x9286: 'mò',
-    0x9287: 'lèi',
-    0x9288: 'jī',
-    0x9289: 'yù,sì',
-    0x928A: 'xù,huì',
-    0x928B: 'rén,rěn',
-    0x928C: 'zùn',
-    0x928D: 'zhì',
-    0x928E: 'qióng,qiōng',
-    0x928F: 'shàn,shuò',
-    0x9290: 'chì,lì',
-    0x9291: 'xiǎn,xiān,xǐ',
-    0x9292: 'xíng,jiān',
-    0x9293: 'quán',
-    0x9294: 'pī',
-    0x9295: 'tiě,yí',
-    0x9296: 'zhū',
-    0x9297: 'xiàng,hóu',
-    0x9298: 'míng',
-    0x9299: 'kuǎ',
-    0x929A: 'yáo,diào,tiáo,qiāo,yào',
-    0x929B: 'xiān,tiǎn,guā',
-    0x929C: 'xián',
-    0x929D: 'xiū',
-    0x929E: 'jūn',
-    0x929F: 'chā',
-    0x92A0: 'lǎo',
-    0x92A1: 'jí',
-    0x92A2: 'pǐ',
-    0x92A3: 'rú',
-    0x92A4: 'mǐ',
-    0x92A5: 'yī',
-    0x92A6: 'yīn',
-    0x92A7: 'guāng',
-    0x92A8: 'ǎn',
-    0x92A9: 'diū',
-    0x92AA: 'yǒu',
-    0x92AB: 'sè',
-    0x92AC: 'kào',
-    0x92AD: 'qián',
-    0x92AE: 'luán',
-    0x92AF: 'sī',
-    0x92B0: 'āi',
-    0x92B1: 'diào',
-    0x92B2: 'hàn',
-    0x92B3: 'ruì',
-    0x92B4: 'shì,zhì',
-    0x92B5: 'kēng',
-    0x92B6: 'qiú',
-    0x92B7: 'xiāo',
-    0x92B8: 'zhé,niè',
-    0x92B9: 'xiù,yòu',
-    0x92BA: 'zàng',
-    0x92BB: 'tí,tī',
-    0x92BC: 'cuò',
-    0x92BD: 'guā',
-    0x92BE: 'hòng,gǒng',
-    0x92BF: 'zhōng,yōng',
-    0x92C0: 'tōu,dòu,tù',
-    0x92C1: 'lǚ,lǜ',
-    0x92C2: 'méi,méng',
-    0x92C3: 'láng',
-    0x92C4: 'wàn',
-    0x92C5: 'xīn,zǐ',
-    0x92C6: 'yún,jūn',
-    0x92C7: 'bèi',
-    0x92C8: 'wù',
-    0x92C9: 'sù',
-    0x92CA: 'yù',
-    0x92CB: 'chán,yán',
-    0x92CC: 'dìng,tǐng',
-    0x92CD: 'bó',
-    0x92CE: 'hàn',
-    0x92CF: 'jiá',
-    0x92D0: 'hóng',
-    0x92D1: 'cuān,jiān,juān',
-    0x92D2: 'fēng',
-    0x92D3: 'chān',
-    0x92D4: 'wǎn',
-    0x92D5: 'zhì',
-    0x92D6: 'sī,tuó',
-    0x92D7: 'xuān,juān,juàn',
-    0x92D8: 'huá,wú,hú',
-    0x92D9: 'yǔ,yú,wú',
-    0x92DA: 'tiáo',
-    0x92DB: 'kuàng',
-    0x92DC: 'zhuó,chuò',
-    0x92DD: 'lüè',
-    0x92DE: 'xíng,xìng,jīng',
-    0x92DF: 'qǐn,qiān,qīn,jìn',
-    0x92E0: 'shèn',
-    0x92E1: 'hán',
-    0x92E2: 'lüè',
-    0x92E3: 'yé',
-    0x92E4: 'chú,jǔ',
-    0x92E5: 'zèng',
-    0x92E6: 'jū,jú',
-    0x92E7: 'xiàn',
-    0x92E8: 'tiě,é',
-    0x92E9: 'máng',
-    0x92EA: 'pù,pū',
-    0x92EB: 'lí',
-    0x92EC: 'pàn',
-    0x92ED: 'ruì,duì,yuè',
-    0x92EE: 'chéng',
-    0x92EF: 'gào',
-    0x92F0: 'lǐ',
-    0x92F1: 'tè',
-    0x92F2: 'bīng',
-    0x92F3: 'zhù',
-    0x92F4: 'zhèn',
-    0x92F5: 'tū',
-    0x92F6: 'liǔ',
-    0x92F7: 'zuì,niè',
-    0x92F8: 'jù,jū',
-    0x92F9: 'chǎng',
-    0x92FA: 'yuǎn,yuān,wǎn,wān',
-    0x92FB: 'jiàn,jiān',
-    0x92FC: 'gāng,gàng',
-    0x92FD: 'diào',
-    0x92FE: 'táo',
-    0x92FF: 'cháng',
-    0x9300: 'lún,fēn',
-    0x9301: 'guǒ,kuǎ,kè',
-    0x9302: 'líng',
-    0x9303: 'pī',
-    0x9304: 'lù',
-    0x9305: 'lí',
-    0x9306: 'qiāng',
-    0x9307: 'póu,fú,péi',
-    0x9308: 'juǎn',
-    0x9309: 'mín',
-    0x930A: 'zuì,zū',
-    0x930B: 'péng,bèng',
-    0x930C: 'àn',
-    0x930D: 'pī,bēi,bī,pí',
-    0x930E: 'xiàn,gàn,qiàn',
-    0x930F: 'yā,yà',
-    0x9310: 'zhuī',
-    0x9311: 'lèi,lì',
-    0x9312: 'kē,ā',
-    0x9313: 'kōng',
-    0x9314: 'tà',
-    0x9315: 'kūn,gǔn',
-    0x9316: 'dú',
-    0x9317: 'nèi,zhuì,wèi',
-    0x9318: 'chuí',
-    0x9319: 'zī',
-    0x931A: 'zhēng',
-    0x931B: 'bēn',
-    0x931C: 'niè',
-    0x931D: 'zòng',
-    0x931E: 'chún,duì,duò',
-    0x931F: 'tán,xiān,yǎn',
-    0x9320: 'dìng',
-    0x9321: 'qí,yǐ',
-    0x9322: 'qián,jiǎn',
-    0x9323: 'zhuì,chuò',
-    0x9324: 'jī',
-    0x9325: 'yù',
-    0x9326: 'jǐn',
-    0x9327: 'guǎn',
-    0x9328: 'máo',
-    0x9329: 'chāng',
-    0x932A: 'tiǎn,tǔn',
-    0x932B: 'xī,tì',
-    0x932C: 'liàn',
-    0x932D: 'táo,diāo',
-    0x932E: 'gù',
-    0x932F: 'cuò,cù,xī',
-    0x9330: 'shù',
-    0x9331: 'zhēn',
-    0x9332: 'lù,lǜ',
-    0x9333: 'měng',
-    0x9334: 'lù',
-    0x9335: 'huā',
-    0x9336: 'biǎo',
-    0x9337: 'gá',
-    0x9338: 'lái',
-    0x9339: 'kěn',
-    0x933A: 'fāng',
-    0x933B: 'wu',
-    0x933C: 'nài',
-    0x933D: 'wàn,jiǎn',
-    0x933E: 'zàn',
-    0x933F: 'hǔ',
-    0x9340: 'dé',
-    0x9341: 'xiān',
-    0x9342: 'piān',
-    0x9343: 'huō',
-    0x9344: 'liàng',
-    0x9345: 'fǎ',
-    0x9346: 'mén',
-    0x9347: 'kǎi,jiē,jiě',
-    0x9348: 'yīng',
-    0x9349: 'dī,chí,dí,shì',
-    0x934A: 'liàn,jiàn',
-    0x934B: 'guō,guǒ',
-    0x934C: 'xiǎn',
-    0x934D: 'dù',
-    0x934E: 'tú',
-    0x934F: 'wéi',
-    0x9350: 'zōng',
-    0x9351: 'fù',
-    0x9352: 'róu',
-    0x9353: 'jí',
-    0x9354: 'è',
-    0x9355: 'jūn',
-    0x9356: 'chěn,zhēn',
-    0x9357: 'tí',
-    0x9358: 'zhá',
-    0x9359: 'hù',
-    0x935A: 'yáng',
-    0x935B: 'duàn',
-    0x935C: 'xiá',
-    0x935D: 'yú',
-    0x935E: 'kēng',
-    0x935F: 'shēng',
-    0x9360: 'huáng',
-    0x9361: 'wěi',
-    0x9362: 'fù',
-    0x9363: 'zhāo',
-    0x9364: 'chā',
-    0x9365: 'qiè',
-    0x9366: 'shī,shé',
-    0x9367: 'hōng',
-    0x9368: 'kuí',
-    0x9369: 'tiǎn,nuò',
-    0x936A: 'móu',
-    0x936B: 'qiāo',
-    0x936C: 'qiāo',
-    0x936D: 'hóu',
-    0x936E: 'tōu',
-    0x936F: 'cōng',
-    0x9370: 'huán',
-    0x9371: 'yè,xié',
-    0x9372: 'mín',
-    0x9373: 'jiàn',
-    0x9374: 'duān',
-    0x9375: 'jiàn',
-    0x9376: 'sōng,sī',
-    0x9377: 'kuí',
-    0x9378: 'hú',
-    0x9379: 'xuān',
-    0x937A: 'duǒ,dǔ,zhě',
-    0x937B: 'jié',
-    0x937C: 'zhēn,qián',
-    0x937D: 'biān',
-    0x937E: 'zhōng',
-    0x937F: 'zī',
-    0x9380: 'xiū',
-    0x9381: 'yé',
-    0x9382: 'měi',
-    0x9383: 'pài',
-    0x9384: 'āi',
-    0x9385: 'jiè',
-    0x9386: 'qian',
-    0x9387: 'méi',
-    0x9388: 'suǒ,chā',
-    0x9389: 'dá,tà',
-    0x938A: 'bàng,pāng',
-    0x938B: 'xiá',
-    0x938C: 'lián',
-    0x938D: 'suǒ,sè',
-    0x938E: 'kài',
-    0x938F: 'liú',
-    0x9390: 'yáo,zú',
-    0x9391: 'yè,tà,gé',
-    0x9392: 'nòu,hāo',
-    0x9393: 'wēng',
-    0x9394: 'róng',
-    0x9395: 'táng',
-    0x9396: 'suǒ',
-    0x9397: 'qiāng,chēng,qiàng',
-    0x9398: 'lì,gé',
-    0x9399: 'shuò',
-    0x939A: 'chuí,duī,zhuì',
-    0x939B: 'bó',
-    0x939C: 'pán',
-    0x939D: 'dā,sà',
-    0x939E: 'bī,pī',
-    0x939F: 'sǎng',
-    0x93A0: 'gāng',
-    0x93A1: 'zī',
-    0x93A2: 'wū',
-    0x93A3: 'yíng,yīng,jiǒng',
-    0x93A4: 'huàng',
-    0x93A5: 'tiáo',
-    0x93A6: 'liú,liù',
-    0x93A7: 'kǎi',
-    0x93A8: 'sǔn',
-    0x93A9: 'shā,shì,sè',
-    0x93AA: 'sōu',
-    0x93AB: 'wàn',
-    0x93AC: 'hào,gǎo',
-    0x93AD: 'zhèn',
-    0x93AE: 'zhèn,zhēn,tián',
-    0x93AF: 'láng,luǒ',
-    0x93B0: 'yì',
-    0x93B1: 'yuán',
-    0x93B2: 'tǎng',
-    0x93B3: 'niè',
-    0x93B4: 'xí',
-    0x93B5: 'jiā',
-    0x93B6: 'gē',
-    0x93B7: 'mǎ',
-    0x93B8: 'juān',
-    0x93B9: 'sòng',
-    0x93BA: 'zǔ',
-    0x93BB: 'suǒ',
-    0x93BC: 'xià',
-    0x93BD: 'fēng',
-    0x93BE: 'wēn',
-    0x93BF: 'ná',
-    0x93C0: 'lǔ',
-    0x93C1: 'suǒ',
-    0x93C2: 'ōu,kōu',
-    0x93C3: 'zú,chuò',
-    0x93C4: 'tuán',
-    0x93C5: 'xiū,xiù',
-    0x93C6: 'guàn',
-    0x93C7: 'xuàn,xuán',
-    0x93C8: 'liàn,lián',
-    0x93C9: 'shòu,sōu',
-    0x93CA: 'ào',
-    0x93CB: 'mǎn',
-    0x93CC: 'mò',
-    0x93CD: 'luó',
-    0x93CE: 'bì',
-    0x93CF: 'wèi',
-    0x93D0: 'liú,liù,liáo',
-    0x93D1: 'dí,dī',
-    0x93D2: 'sǎn,qiāo,càn',
-    0x93D3: 'zǒng,cōng',
-    0x93D4: 'yí',
-    0x93D5: 'lù,áo',
-    0x93D6: 'áo,biāo',
-    0x93D7: 'kēng',
-    0x93D8: 'qiāng',
-    0x93D9: 'cuī',
-    0x93DA: 'qī',
-    0x93DB: 'cháng',
-    0x93DC: 'tāng,táng',
-    0x93DD: 'màn',
-    0x93DE: 'yōng',
-    0x93DF: 'chǎn',
-    0x93E0: 'fēng',
-    0x93E1: 'jìng',
-    0x93E2: 'biāo',
-    0x93E3: 'shù',
-    0x93E4: 'lòu,lǘ',
-    0x93E5: 'xiù',
-    0x93E6: 'cōng',
-    0x93E7: 'lóng',
-    0x93E8: 'zàn',
-    0x93E9: 'jiàn,zàn',
-    0x93EA: 'cáo',
-    0x93EB: 'lí',
-    0x93EC: 'xià',
-    0x93ED: 'xī',
-    0x93EE: 'kāng',
-    0x93EF: 'shuǎng',
-    0x93F0: 'bèng',
-    0x93F1: 'zhang',
-    0x93F2: 'qian',
-    0x93F3: 'chēng',
-    0x93F4: 'lù',
-    0x93F5: 'huá',
-    0x93F6: 'jí',
-    0x93F7: 'pú',
-    0x93F8: 'huì,suì,ruì',
-    0x93F9: 'qiǎng,qiāng',
-    0x93FA: 'pō',
-    0x93FB: 'lín',
-    0x93FC: 'sè',
-    0x93FD: 'xiù',
-    0x93FE: 'sǎn,xiàn,sà',
-    0x93FF: 'chēng',
-    0x9400: 'kuì,guì',
-    0x9401: 'sī',
-    0x9402: 'liú',
-    0x9403: 'náo,nào',
-    0x9404: 'huáng',
-    0x9405: 'piě',
-    0x9406: 'suì',
-    0x9407: 'fán',
-    0x9408: 'qiáo',
-    0x9409: 'quān',
-    0x940A: 'yáng',
-    0x940B: 'tāng,tàng',
-    0x940C: 'xiàng',
-    0x940D: 'jué,yù',
-    0x940E: 'jiāo',
-    0x940F: 'zūn',
-    0x9410: 'liáo',
-    0x9411: 'qiè',
-    0x9412: 'láo',
-    0x9413: 'duì,duī,dūn',
-    0x9414: 'xín',
-    0x9415: 'zān',
-    0x9416: 'jī,qí',
-    0x9417: 'jiǎn',
-    0x9418: 'zhōng',
-    0x9419: 'dèng,dēng',
-    0x941A: 'yā',
-    0x941B: 'yǐng',
-    0x941C: 'duī,dūn',
-    0x941D: 'jué',
-    0x941E: 'nòu',
-    0x941F: 'zān,tì',
-    0x9420: 'pǔ',
-    0x9421: 'tiě',
-    0x9422: 'fán',
-    0x9423: 'chēng',
-    0x9424: 'dǐng',
-    0x9425: 'shàn',
-    0x9426: 'kāi',
-    0x9427: 'jiān,jiǎn',
-    0x9428: 'fèi',
-    0x9429: 'suì',
-    0x942A: 'lǔ',
-    0x942B: 'juān',
-    0x942C: 'huì',
-    0x942D: 'yù',
-    0x942E: 'lián',
-    0x942F: 'zhuó',
-    0x9430: 'qiāo,sào,cáo',
-    0x9431: 'jiàn,qiān',
-    0x9432: 'zhuó,shǔ',
-    0x9433: 'léi',
-    0x9434: 'bì,bèi',
-    0x9435: 'tiě,dié',
-    0x9436: 'huán,xuàn',
-    0x9437: 'yè',
-    0x9438: 'duó',
-    0x9439: 'guǒ,guō',
-    0x943A: 'dāng,chēng,tāng',
-    0x943B: 'jù,qú',
-    0x943C: 'fén,bēn',
-    0x943D: 'dá',
-    0x943E: 'bèi',
-    0x943F: 'yì',
-    0x9440: 'ài',
-    0x9441: 'zōng',
-    0x9442: 'xùn',
-    0x9443: 'diào',
-    0x9444: 'zhù',
-    0x9445: 'héng',
-    0x9446: 'zhuì',
-    0x9447: 'jī',
-    0x9448: 'niè,nǐ',
-    0x9449: 'hé',
-    0x944A: 'huò',
-    0x944B: 'qīng',
-    0x944C: 'bīn',
-    0x944D: 'yīng',
-    0x944E: 'kuì',
-    0x944F: 'níng,nǐng',
-    0x9450: 'xū,rú,róu',
-    0x9451: 'jiàn',
-    0x9452: 'jiàn',
-    0x9453: 'qiǎn',
-    0x9454: 'chǎ',
-    0x9455: 'zhì',
-    0x9456: 'miè,mì',
-    0x9457: 'lí',
-    0x9458: 'léi,lěi',
-    0x9459: 'jī',
-    0x945A: 'zuàn',
-    0x945B: 'kuàng,gǒng',
-    0x945C: 'shǎng',
-    0x945D: 'péng',
-    0x945E: 'là',
-    0x945F: 'dú',
-    0x9460: 'shuò,yuè,lì',
-    0x9461: 'chuò',
-    0x9462: 'lǜ',
-    0x9463: 'biāo',
-    0x9464: 'bào',
-    0x9465: 'lǔ',
-    0x9466: 'xian',
-    0x9467: 'kuān',
-    0x9468: 'lóng',
-    0x9469: 'è',
-    0x946A: 'lú',
-    0x946B: 'xīn,xùn',
-    0x946C: 'jiàn',
-    0x946D: 'làn,lán',
-    0x946E: 'bó',
-    0x946F: 'jiān,qiān',
-    0x9470: 'yào,yuè',
-    0x9471: 'chán',
-    0x9472: 'xiāng,ráng',
-    0x9473: 'jiàn',
-    0x9474: 'xī,huī',
-    0x9475: 'guàn',
-    0x9476: 'cáng',
-    0x9477: 'niè',
-    0x9478: 'lěi',
-    0x9479: 'cuān,cuàn',
-    0x947A: 'qú',
-    0x947B: 'pàn',
-    0x947C: 'luó',
-    0x947D: 'zuān,zuàn',
-    0x947E: 'luán',
-    0x947F: 'záo,zuò,zú,zào',
-    0x9480: 'niè,yǐ',
-    0x9481: 'jué',
-    0x9482: 'tǎng',
-    0x9483: 'zhú',
-    0x9484: 'lán',
-    0x9485: 'jīn',
-    0x9486: 'gá',
-    0x9487: 'yǐ',
-    0x9488: 'zhēn',
-    0x9489: 'dīng,dìng',
-    0x948A: 'zhāo',
-    0x948B: 'pō',
-    0x948C: 'liǎo,liào',
-    0x948D: 'tǔ',
-    0x948E: 'qiān',
-    0x948F: 'chuàn',
-    0x9490: 'shān,shàn',
-    0x9491: 'sà',
-    0x9492: 'fán',
-    0x9493: 'diào',
-    0x9494: 'mén',
-    0x9495: 'nǚ',
-    0x9496: 'yáng',
-    0x9497: 'chāi',
-    0x9498: 'xíng',
-    0x9499: 'gài',
-    0x949A: 'bù',
-    0x949B: 'tài',
-    0x949C: 'jù',
-    0x949D: 'dùn',
-    0x949E: 'chāo',
-    0x949F: 'zhōng',
-    0x94A0: 'nà',
-    0x94A1: 'bèi',
-    0x94A2: 'gāng,gàng',
-    0x94A3: 'bǎn',
-    0x94A4: 'qián',
-    0x94A5: 'yào,yuè',
-    0x94A6: 'qīn',
-    0x94A7: 'jūn',
-    0x94A8: 'wū',
-    0x94A9: 'gōu',
-    0x94AA: 'kàng',
-    0x94AB: 'fāng',
-    0x94AC: 'huǒ',
-    0x94AD: 'tǒu,dǒu',
-    0x94AE: 'niǔ',
-    0x94AF: 'bǎ,pá',
-    0x94B0: 'yù',
-    0x94B1: 'qián',
-    0x94B2: 'zhēng',
-    0x94B3: 'qián',
-    0x94B4: 'gǔ',
-    0x94B5: 'bō',
-    0x94B6: 'kē',
-    0x94B7: 'pǒ',
-    0x94B8: 'bū',
-    0x94B9: 'bó',
-    0x94BA: 'yuè',
-    0x94BB: 'zuān,zuàn',
-    0x94BC: 'mù',
-    0x94BD: 'tǎn',
-    0x94BE: 'jiǎ',
-    0x94BF: 'diàn,tián',
-    0x94C0: 'yóu',
-    0x94C1: 'tiě',
-    0x94C2: 'bó',
-    0x94C3: 'líng',
-    0x94C4: 'shuò',
-    0x94C5: 'qiān,yán',
-    0x94C6: 'mǎo',
-    0x94C7: 'bào',
-    0x94C8: 'shì',
-    0x94C9: 'xuàn',
-    0x94CA: 'tā,tuó',
-    0x94CB: 'bì',
-    0x94CC: 'ní',
-    0x94CD: 'pī,pí',
-    0x94CE: 'duó',
-    0x94CF: 'xíng',
-    0x94D0: 'kào',
-    0x94D1: 'lǎo',
-    0x94D2: 'ěr',
-    0x94D3: 'máng',
-    0x94D4: 'yā',
-    0x94D5: 'yǒu',
-    0x94D6: 'chéng',
-    0x94D7: 'jiá',
-    0x94D8: 'yé',
-    0x94D9: 'náo',
-    0x94DA: 'zhì',
-    0x94DB: 'dāng,chēng',
-    0x94DC: 'tóng',
-    0x94DD: 'lǚ',
-    0x94DE: 'diào',
-    0x94DF: 'yīn',
-    0x94E0: 'kǎi',
-    0x94E1: 'zhá',
-    0x94E2: 'zhū',
-    0x94E3: 'xǐ,xiǎn',
-    0x94E4: 'dìng,tǐng',
-    0x94E5: 'diū',
-    0x94E6: 'xiān',
-    0x94E7: 'huá',
-    0x94E8: 'quán',
-    0x94E9: 'shā',
-    0x94EA: 'hā',
-    0x94EB: 'diào,yáo',
-    0x94EC: 'gè',
-    0x94ED: 'míng',
-    0x94EE: 'zhēng,zhèng',
-    0x94EF: 'sè',
-    0x94F0: 'jiǎo',
-    0x94F1: 'yī',
-    0x94F2: 'chǎn',
-    0x94F3: 'chòng',
-    0x94F4: 'tāng',
-    0x94F5: 'ǎn',
-    0x94F6: 'yín',
-    0x94F7: 'rú',
-    0x94F8: 'zhù',
-    0x94F9: 'láo',
-    0x94FA: 'pù,pū',
-    0x94FB: 'wú,yǔ',
-    0x94FC: 'lái',
-    0x94FD: 'tè',
-    0x94FE: 'liàn',
-    0x94FF: 'kēng',
-    0x9500: 'xiāo',
-    0x9501: 'suǒ',
-    0x9502: 'lǐ',
-    0x9503: 'zèng',
-    0x9504: 'chú',
-    0x9505: 'guō',
-    0x9506: 'gào',
-    0x9507: 'é',
-    0x9508: 'xiù',
-    0x9509: 'cuò',
-    0x950A: 'lüè',
-    0x950B: 'fēng',
-    0x950C: 'xīn',
-    0x950D: 'liǔ',
-    0x950E: 'kāi',
-    0x950F: 'jiǎn,jiàn',
-    0x9510: 'ruì',
-    0x9511: 'tī',
-    0x9512: 'láng',
-    0x9513: 'qǐn',
-    0x9514: 'jū,jú',
-    0x9515: 'ā',
-    0x9516: 'qiāng',
-    0x9517: 'zhě',
-    0x9518: 'nuò',
-    0x9519: 'cuò',
-    0x951A: 'máo',
-    0x951B: 'bēn',
-    0x951C: 'qí',
-    0x951D: 'dé',
-    0x951E: 'kè',
-    0x951F: 'kūn',
-    0x9520: 'chāng',
-    0x9521: 'xī',
-    0x9522: 'gù',
-    0x9523: 'luó',
-    0x9524: 'chuí',
-    0x9525: 'zhuī',
-    0x9526: 'jǐn',
-    0x9527: 'zhì',
-    0x9528: 'xiān',
-    0x9529: 'juǎn',
-    0x952A: 'huō',
-    0x952B: 'péi',
-    0x952C: 'tán,xiān',
-    0x952D: 'dìng',
-    0x952E: 'jiàn',
-    0x952F: 'jù,jū',
-    0x9530: 'měng',
-    0x9531: 'zī',
-    0x9532: 'qiè',
-    0x9533: 'yīng',
-    0x9534: 'kǎi',
-    0x9535: 'qiāng',
-    0x9536: 'sī',
-    0x9537: 'è',
-    0x9538: 'chā',
-    0x9539: 'qiāo',
-    0x953A: 'zhōng',
-    0x953B: 'duàn',
-    0x953C: 'sōu',
-    0x953D: 'huáng',
-    0x953E: 'huán',
-    0x953F: 'āi',
-    0x9540: 'dù',
-    0x9541: 'měi',
-    0x9542: 'lòu',
-    0x9543: 'zī',
-    0x9544: 'fèi',
-    0x9545: 'méi',
-    0x9546: 'mò',
-    0x9547: 'zhèn',
-    0x9548: 'bó',
-    0x9549: 'gé',
-    0x954A: 'niè',
-    0x954B: 'tǎng',
-    0x954C: 'juān',
-    0x954D: 'niè',
-    0x954E: 'ná',
-    0x954F: 'liú,liù',
-    0x9550: 'gǎo,hào',
-    0x9551: 'bàng',
-    0x9552: 'yì',
-    0x9553: 'jiā',
-    0x9554: 'bīn',
-    0x9555: 'róng',
-    0x9556: 'biāo',
-    0x9557: 'tāng,táng',
-    0x9558: 'màn',
-    0x9559: 'luó',
-    0x955A: 'bèng',
-    0x955B: 'yōng',
-    0x955C: 'jìng',
-    0x955D: 'dī,dí',
-    0x955E: 'zú',
-    0x955F: 'xuàn',
-    0x9560: 'liú',
-    0x9561: 'chán,tán,xín',
-    0x9562: 'jué',
-    0x9563: 'liào',
-    0x9564: 'pú',
-    0x9565: 'lǔ',
-    0x9566: 'duì,dūn',
-    0x9567: 'lán',
-    0x9568: 'pǔ',
-    0x9569: 'cuān',
-    0x956A: 'qiāng,qiǎng',
-    0x956B: 'dèng',
-    0x956C: 'huò',
-    0x956D: 'léi',
-    0x956E: 'huán',
-    0x956F: 'zhuó',
-    0x9570: 'lián',
-    0x9571: 'yì',
-    0x9572: 'chǎ',
-    0x9573: 'biāo',
-    0x9574: 'là',
-    0x9575: 'chán',
-    0x9576: 'xiāng',
-    0x9577: 'zhǎng,cháng,zhàng',
-    0x9578: 'cháng',
-    0x9579: 'jiǔ',
-    0x957A: 'ǎo',
-    0x957B: 'dié',
-    0x957C: 'qū',
-    0x957D: 'liǎo,liáo',
-    0x957E: 'mí',
-    0x957F: 'zhǎng,cháng',
-    0x9580: 'mén',
-    0x9581: 'mà',
-    0x9582: 'shuān',
-    0x9583: 'shǎn',
-    0x9584: 'huò,shǎn',
-    0x9585: 'mén',
-    0x9586: 'yán',
-    0x9587: 'bì',
-    0x9588: 'hàn,bì',
-    0x9589: 'bì',
-    0x958A: 'shān',
-    0x958B: 'kāi,qiān',
-    0x958C: 'kàng',
-    0x958D: 'bēng',
-    0x958E: 'hóng',
-    0x958F: 'rùn',
-    0x9590: 'sàn',
-    0x9591: 'xián',
-    0x9592: 'xián,jiàn,jiān,jiǎn',
-    0x9593: 'jiān,jiàn,jiǎn',
-    0x9594: 'mǐn,mín',
-    0x9595: 'xiā,xiǎ',
-    0x9596: 'shui',
-    0x9597: 'dòu',
-    0x9598: 'zhá,yā,gē',
-    0x9599: 'nào',
-    0x959A: 'zhān',
-    0x959B: 'pēng,pèng',
-    0x959C: 'xiǎ,ě',
-    0x959D: 'líng',
-    0x959E: 'biàn,guān',
-    0x959F: 'bì',
-    0x95A0: 'rùn',
-    0x95A1: 'ài,hé,hài,gāi,kǎi',
-    0x95A2: 'guān',
-    0x95A3: 'gé',
-    0x95A4: 'gé,gē,hé',
-    0x95A5: 'fá',
-    0x95A6: 'chù',
-    0x95A7: 'hòng,xiàng',
-    0x95A8: 'guī',
-    0x95A9: 'mǐn',
-    0x95AA: 'sē',
-    0x95AB: 'kǔn',
-    0x95AC: 'làng,lǎng,liǎng',
-    0x95AD: 'lǘ',
-    0x95AE: 'tíng,tǐng',
-    0x95AF: 'shà',
-    0x95B0: 'jú',
-    0x95B1: 'yuè',
-    0x95B2: 'yuè',
-    0x95B3: 'chǎn',
-    0x95B4: 'qù',
-    0x95B5: 'lìn',
-    0x95B6: 'chāng,tāng',
-    0x95B7: 'shài,shā',
-    0x95B8: 'kǔn',
-    0x95B9: 'yān',
-    0x95BA: 'wén',
-    0x95BB: 'yán,yǎn,yàn',
-    0x95BC: 'è,yù,yān',
-    0x95BD: 'hūn',
-    0x95BE: 'yù',
-    0x95BF: 'wén',
-    0x95C0: 'hòng',
-    0x95C1: 'bāo',
-    0x95C2: 'hòng,xiàng,juǎn',
-    0x95C3: 'qù',
-    0x95C4: 'yǎo',
-    0x95C5: 'wén',
-    0x95C6: 'bǎn,pǎn',
-    0x95C7: 'àn,ǎn,ān,yīn,yǐn',
-    0x95C8: 'wéi',
-    0x95C9: 'yīn',
-    0x95CA: 'kuò',
-    0x95CB: 'què,jué,kuí',
-    0x95CC: 'lán,làn',
-    0x95CD: 'dū,shé',
-    0x95CE: 'quán',
-    0x95CF: 'fēng',
-    0x95D0: 'tián',
-    0x95D1: 'niè',
-    0x95D2: 'tà',
-    0x95D3: 'kǎi',
-    0x95D4: 'hé',
-    0x95D5: 'què,quē,jué',
-    0x95D6: 'chuǎng,chèn',
-    0x95D7: 'guān',
-    0x95D8: 'dòu',
-    0x95D9: 'qǐ',
-    0x95DA: 'kuī',
-    0x95DB: 'táng,tāng,chāng',
-    0x95DC: 'guān,wān,wǎn',
-    0x95DD: 'piáo',
-    0x95DE: 'kàn,hǎn,xiàn',
-    0x95DF: 'xì,sè,tà',
-    0x95E0: 'huì',
-    0x95E1: 'chǎn',
-    0x95E2: 'pì,pī',
-    0x95E3: 'dàng,tāng',
-    0x95E4: 'huán',
-    0x95E5: 'tà',
-    0x95E6: 'wén',
-    0x95E7: 'tā',
-    0x95E8: 'mén',
-    0x95E9: 'shuān',
-    0x95EA: 'shǎn',
-    0x95EB: 'yán',
-    0x95EC: 'hàn',
-    0x95ED: 'bì',
-    0x95EE: 'wèn',
-    0x95EF: 'chuǎng',
-    0x95F0: 'rùn',
-    0x95F1: 'wéi',
-    0x95F2: 'xián',
-    0x95F3: 'hóng',
-    0x95F4: 'jiān,jiàn',
-    0x95F5: 'mǐn',
-    0x95F6: 'kāng,kàng',
-    0x95F7: 'mèn,mēn',
-    0x95F8: 'zhá',
-    0x95F9: 'nào',
-    0x95FA: 'guī',
-    0x95FB: 'wén',
-    0x95FC: 'tà',
-    0x95FD: 'mǐn',
-    0x95FE: 'lǘ',
-    0x95FF: 'kǎi',
-    0x9600: 'fá',
-    0x9601: 'gé',
-    0x9602: 'hé',
-    0x9603: 'kǔn',
-    0x9604: 'jiū',
-    0x9605: 'yuè',
-    0x9606: 'láng,làng',
-    0x9607: 'dū,shé',
-    0x9608: 'yù',
-    0x9609: 'yān',
-    0x960A: 'chāng',
-    0x960B: 'xì',
-    0x960C: 'wén',
-    0x960D: 'hūn',
-    0x960E: 'yán',
-    0x960F: 'è,yān',
-    0x9610: 'chǎn',
-    0x9611: 'lán',
-    0x9612: 'qù',
-    0x9613: 'huì',
-    0x9614: 'kuò',
-    0x9615: 'què',
-    0x9616: 'hé',
-    0x9617: 'tián',
-    0x9618: 'dá,tà',
-    0x9619: 'quē,què',
-    0x961A: 'hǎn,kàn',
-    0x961B: 'huán',
-    0x961C: 'fù',
-    0x961D: 'fù',
-    0x961E: 'lè',
-    0x961F: 'duì',
-    0x9620: 'xìn',
-    0x9621: 'qiān',
-    0x9622: 'wù,wéi',
-    0x9623: 'gài,yì',
-    0x9624: 'zhì,yí,tuó',
-    0x9625: 'yīn',
-    0x9626: 'yáng',
-    0x9627: 'dǒu',
-    0x9628: 'è,ài',
-    0x9629: 'shēng',
-    0x962A: 'bǎn',
-    0x962B: 'péi',
-    0x962C: 'kēng,kàng,gāng',
-    0x962D: 'yǔn,yǎn',
-    0x962E: 'ruǎn,yuán',
-    0x962F: 'zhǐ',
-    0x9630: 'pí',
-    0x9631: 'jǐng',
-    0x9632: 'fáng',
-    0x9633: 'yáng',
-    0x9634: 'yīn',
-    0x9635: 'zhèn',
-    0x9636: 'jiē',
-    0x9637: 'chēng',
-    0x9638: 'è,ài',
-    0x9639: 'qū',
-    0x963A: 'dǐ',
-    0x963B: 'zǔ,zhù',
-    0x963C: 'zuò',
-    0x963D: 'diàn,yán',
-    0x963E: 'lǐng,líng',
-    0x963F: 'ā,ē,ě,ǎ,à,a',
-    0x9640: 'tuó,duò',
-    0x9641: 'tuó,zhì,yǐ',
-    0x9642: 'bēi,pí,bì,pō',
-    0x9643: 'bǐng',
-    0x9644: 'fù,bù,fū',
-    0x9645: 'jì',
-    0x9646: 'lù,liù',
-    0x9647: 'lǒng',
-    0x9648: 'chén',
-    0x9649: 'xíng',
-    0x964A: 'duò',
-    0x964B: 'lòu',
-    0x964C: 'mò',
-    0x964D: 'jiàng,xiáng,xiàng',
-    0x964E: 'shū',
-    0x964F: 'duò,suí',
-    0x9650: 'xiàn,wěn',
-    0x9651: 'ér',
-    0x9652: 'guǐ',
-    0x9653: 'yū',
-    0x9654: 'gāi',
-    0x9655: 'shǎn',
-    0x9656: 'jùn',
-    0x9657: 'qiào',
-    0x9658: 'xíng,jìng',
-    0x9659: 'chún',
-    0x965A: 'fù,wǔ',
-    0x965B: 'bì',
-    0x965C: 'xiá',
-    0x965D: 'shǎn',
-    0x965E: 'shēng',
-    0x965F: 'zhì,dé',
-    0x9660: 'pū,bū,bù',
-    0x9661: 'dǒu',
-    0x9662: 'yuàn',
-    0x9663: 'zhèn',
-    0x9664: 'chú,zhù,shū',
-    0x9665: 'xiàn',
-    0x9666: 'dǎo',
-    0x9667: 'niè',
-    0x9668: 'yǔn',
-    0x9669: 'xiǎn',
-    0x966A: 'péi',
-    0x966B: 'fèi,péi',
-    0x966C: 'zōu,zhé',
-    0x966D: 'yì,yǐ',
-    0x966E: 'duì',
-    0x966F: 'lún,lùn',
-    0x9670: 'yīn,yìn,ān',
-    0x9671: 'jū',
-    0x9672: 'chuí',
-    0x9673: 'chén,zhèn',
-    0x9674: 'pí,bì',
-    0x9675: 'líng',
-    0x9676: 'táo,yáo,dào',
-    0x9677: 'xiàn',
-    0x9678: 'lù,liù',
-    0x9679: 'shēng',
-    0x967A: 'xiǎn',
-    0x967B: 'yīn',
-    0x967C: 'zhǔ,dǔ',
-    0x967D: 'yáng',
-    0x967E: 'réng,ér',
-    0x967F: 'xiá',
-    0x9680: 'chóng',
-    0x9681: 'yàn,yǎn',
-    0x9682: 'yīn',
-    0x9683: 'shù,yú,yáo',
-    0x9684: 'dī,tí',
-    0x9685: 'yú',
-    0x9686: 'lóng,lōng',
-    0x9687: 'wēi',
-    0x9688: 'wēi',
-    0x9689: 'niè',
-    0x968A: 'duì,zhuì,suì',
-    0x968B: 'suí,duò,tuǒ,tuō',
-    0x968C: 'ǎn',
-    0x968D: 'huáng',
-    0x968E: 'jiē',
-    0x968F: 'suí',
-    0x9690: 'yǐn',
-    0x9691: 'gài,gāi,ái,qí',
-    0x9692: 'yǎn',
-    0x9693: 'huī,duò',
-    0x9694: 'gé,rǒng,jī',
-    0x9695: 'yǔn,yuán',
-    0x9696: 'wù',
-    0x9697: 'kuí,wěi,guī',
-    0x9698: 'ài,è',
-    0x9699: 'xì',
-    0x969A: 'táng',
-    0x969B: 'jì',
-    0x969C: 'zhàng,zhāng',
-    0x969D: 'dǎo',
-    0x969E: 'áo',
-    0x969F: 'xì',
-    0x96A0: 'yǐn',
-    0x96A1: 'sà',
-    0x96A2: 'rǎo',
-    0x96A3: 'lín',
-    0x96A4: 'tuí',
-    0x96A5: 'dèng',
-    0x96A6: 'jiǎo,pí',
-    0x96A7: 'suì,zhuì',
-    0x96A8: 'suí',
-    0x96A9: 'ào,yù',
-    0x96AA: 'xiǎn,jiǎn,yán',
-    0x96AB: 'fén',
-    0x96AC: 'nǐ',
-    0x96AD: 'ér',
-    0x96AE: 'jī',
-    0x96AF: 'dǎo',
-    0x96B0: 'xí,xiè',
-    0x96B1: 'yǐn,yìn',
-    0x96B2: 'zhì',
-    0x96B3: 'huī',
-    0x96B4: 'lǒng',
-    0x96B5: 'xī',
-    0x96B6: 'lì,dài,yì,dì',
-    0x96B7: 'lì',
-    0x96B8: 'lì',
-    0x96B9: 'zhuī,cuī,wéi',
-    0x96BA: 'hú,hè,què',
-    0x96BB: 'zhī,huò',
-    0x96BC: 'sǔn',
-    0x96BD: 'juàn,jùn',
-    0x96BE: 'nán,nàn',
-    0x96BF: 'yì',
-    0x96C0: 'què,qiāo,qiǎo',
-    0x96C1: 'yàn',
-    0x96C2: 'qín',
-    0x96C3: 'qiān,jiè',
-    0x96C4: 'xióng',
-    0x96C5: 'yǎ,yā,yá',
-    0x96C6: 'jí',
-    0x96C7: 'gù,hù',
-    0x96C8: 'huán',
-    0x96C9: 'zhì,kǎi,yǐ,sì',
-    0x96CA: 'gòu',
-    0x96CB: 'juàn,jùn,zuì',
-    0x96CC: 'cí',
-    0x96CD: 'yōng',
-    0x96CE: 'jū',
-    0x96CF: 'chú',
-    0x96D0: 'hū',
-    0x96D1: 'zá',
-    0x96D2: 'luò',
-    0x96D3: 'yú',
-    0x96D4: 'chóu',
-    0x96D5: 'diāo',
-    0x96D6: 'suī',
-    0x96D7: 'hàn',
-    0x96D8: 'wò',
-    0x96D9: 'shuāng',
-    0x96DA: 'guàn,huán',
-    0x96DB: 'chú,jú,jù',
-    0x96DC: 'zá',
-    0x96DD: 'yōng',
-    0x96DE: 'jī',
-    0x96DF: 'xī',
-    0x96E0: 'chóu',
-    0x96E1: 'liù',
-    0x96E2: 'lí,lì,lǐ,chī,gǔ',
-    0x96E3: 'nán,nàn,nuó',
-    0x96E4: 'xué',
-    0x96E5: 'zá',
-    0x96E6: 'jí',
-    0x96E7: 'jí',
-    0x96E8: 'yǔ,yù',
-    0x96E9: 'yú,yù,xū',
-    0x96EA: 'xuě',
-    0x96EB: 'nǎ',
-    0x96EC: 'fǒu',
-    0x96ED: 'sè,xí',
-    0x96EE: 'mù',
-    0x96EF: 'wén',
-    0x96F0: 'fēn',
-    0x96F1: 'pāng,páng,fāng',
-    0x96F2: 'yún',
-    0x96F3: 'lì',
-    0x96F4: 'chì',
-    0x96F5: 'yāng',
-    0x96F6: 'líng,lián',
-    0x96F7: 'léi,lèi',
-    0x96F8: 'án',
-    0x96F9: 'báo',
-    0x96FA: 'wù,méng',
-    0x96FB: 'diàn',
-    0x96FC: 'dàng',
-    0x96FD: 'hù,hū',
-    0x96FE: 'wù',
-    0x96FF: 'diào',
-    0x9700: 'xū,nuò,rú,ruǎn',
-    0x9701: 'jì',
-    0x9702: 'mù',
-    0x9703: 'chén',
-    0x9704: 'xiāo,xiào',
-    0x9705: 'zhà,zhá,shà,sà,yì',
-    0x9706: 'tíng',
-    0x9707: 'zhèn,shēn',
-    0x9708: 'pèi',
-    0x9709: 'méi',
-    0x970A: 'líng',
-    0x970B: 'qī',
-    0x970C: 'zhōu',
-    0x970D: 'huò,hè,suǒ',
-    0x970E: 'shà',
-    0x970F: 'fēi',
-    0x9710: 'hóng',
-    0x9711: 'zhān',
-    0x9712: 'yīn',
-    0x9713: 'ní',
-    0x9714: 'zhù',
-    0x9715: 'tún',
-    0x9716: 'lín',
-    0x9717: 'líng',
-    0x9718: 'dòng',
-    0x9719: 'yīng,yāng',
-    0x971A: 'wù',
-    0x971B: 'líng',
-    0x971C: 'shuāng',
-    0x971D: 'líng',
-    0x971E: 'xiá',
-    0x971F: 'hóng',
-    0x9720: 'yīn',
-    0x9721: 'mài',
-    0x9722: 'mài',
-    0x9723: 'yǔn',
-    0x9724: 'liù',
-    0x9725: 'mèng',
-    0x9726: 'bīn',
-    0x9727: 'wù,méng',
-    0x9728: 'wèi',
-    0x9729: 'kuò',
-    0x972A: 'yín',
-    0x972B: 'xí',
-    0x972C: 'yì',
-    0x972D: 'ǎi',
-    0x972E: 'dàn',
-    0x972F: 'tèng',
-    0x9730: 'sǎn,xiàn',
-    0x9731: 'yù',
-    0x9732: 'lù,lòu',
-    0x9733: 'lóng',
-    0x9734: 'dài',
-    0x9735: 'jí',
-    0x9736: 'pāng',
-    0x9737: 'yáng',
-    0x9738: 'bà,pò',
-    0x9739: 'pī',
-    0x973A: 'wéi',
-    0x973B: 'fēng',
-    0x973C: 'xì',
-    0x973D: 'jì',
-    0x973E: 'mái,lí',
-    0x973F: 'méng,mào,wù',
-    0x9740: 'méng',
-    0x9741: 'léi',
-    0x9742: 'lì',
-    0x9743: 'huò,suǐ,suǒ',
-    0x9744: 'ǎi',
-    0x9745: 'fèi',
-    0x9746: 'dài',
-    0x9747: 'lóng,líng',
-    0x9748: 'líng',
-    0x9749: 'ài,yǐ',
-    0x974A: 'fēng',
-    0x974B: 'lì',
-    0x974C: 'bǎo',
-    0x974D: 'hè',
-    0x974E: 'hè',
-    0x974F: 'hè',
-    0x9750: 'bìng',
-    0x9751: 'qīng',
-    0x9752: 'qīng,jīng',
-    0x9753: 'jìng,liàng',
-    0x9754: 'tiān',
-    0x9755: 'zhēn',
-    0x9756: 'jìng',
-    0x9757: 'chēng',
-    0x9758: 'qìng,qīng,jìng',
-    0x9759: 'jìng',
-    0x975A: 'jìng,liáng',
-    0x975B: 'diàn',
-    0x975C: 'jìng',
-    0x975D: 'tiān',
-    0x975E: 'fēi,fěi',
-    0x975F: 'fēi',
-    0x9760: 'kào',
-    0x9761: 'mí,mǐ,má',
-    0x9762: 'miàn',
-    0x9763: 'miàn',
-    0x9764: 'bào',
-    0x9765: 'yè',
-    0x9766: 'tiǎn,miǎn',
-    0x9767: 'huì',
-    0x9768: 'yè,yǎn',
-    0x9769: 'gé,jí',
-    0x976A: 'dīng',
-    0x976B: 'chá',
-    0x976C: 'qián,jiān,kān,hàn',
-    0x976D: 'rèn',
-    0x976E: 'dí',
-    0x976F: 'dù',
-    0x9770: 'wù',
-    0x9771: 'rèn',
-    0x9772: 'qín',
-    0x9773: 'jìn',
-    0x9774: 'xuē',
-    0x9775: 'niǔ',
-    0x9776: 'bǎ,bà',
-    0x9777: 'yǐn',
-    0x9778: 'sǎ,tā',
-    0x9779: 'nà',
-    0x977A: 'mò,wà',
-    0x977B: 'zǔ',
-    0x977C: 'dá',
-    0x977D: 'bàn',
-    0x977E: 'yì',
-    0x977F: 'yào',
-    0x9780: 'táo',
-    0x9781: 'bèi,bài,bì',
-    0x9782: 'jiē',
-    0x9783: 'hóng',
-    0x9784: 'páo',
-    0x9785: 'yāng,yàng,yǎng',
-    0x9786: 'bǐng',
-    0x9787: 'yīn',
-    0x9788: 'gé,sǎ,tà',
-    0x9789: 'táo',
-    0x978A: 'jié,jí',
-    0x978B: 'xié,wā',
-    0x978C: 'ān',
-    0x978D: 'ān',
-    0x978E: 'hén',
-    0x978F: 'gǒng',
-    0x9790: 'qiǎ',
-    0x9791: 'dá',
-    0x9792: 'qiáo',
-    0x9793: 'tīng',
-    0x9794: 'mán,mèn',
-    0x9795: 'yìng,biān',
-    0x9796: 'suī',
-    0x9797: 'tiáo',
-    0x9798: 'qiào,shāo',
-    0x9799: 'xuàn,juān',
-    0x979A: 'kòng',
-    0x979B: 'běng',
-    0x979C: 'tà',
-    0x979D: 'shàng,zhǎng',
-    0x979E: 'bǐng,bì,pí,bēi',
-    0x979F: 'kuò',
-    0x97A0: 'jū,qū,qiōng',
-    0x97A1: 'la',
-    0x97A2: 'xiè,zhá,dié',
-    0x97A3: 'róu',
-    0x97A4: 'bāng',
-    0x97A5: 'ēng',
-    0x97A6: 'qiū',
-    0x97A7: 'qiū',
-    0x97A8: 'hé,shé,mò',
-    0x97A9: 'qiào',
-    0x97AA: 'mù,móu',
-    0x97AB: 'jū,qū',
-    0x97AC: 'jiān,jiàn',
-    0x97AD: 'biān',
-    0x97AE: 'dī',
-    0x97AF: 'jiān',
-    0x97B0: 'wēn',
-    0x97B1: 'tāo',
-    0x97B2: 'gōu',
-    0x97B3: 'tà',
-    0x97B4: 'bèi,fú,bù,bài',
-    0x97B5: 'xié',
-    0x97B6: 'pán',
-    0x97B7: 'gé',
-    0x97B8: 'bì,bǐng',
-    0x97B9: 'kuò',
-    0x97BA: 'tāng',
-    0x97BB: 'lóu',
-    0x97BC: 'guì,huì',
-    0x97BD: 'qiáo,qiāo,juē',
-    0x97BE: 'xuē',
-    0x97BF: 'jī',
-    0x97C0: 'jiān',
-    0x97C1: 'jiāng',
-    0x97C2: 'chàn',
-    0x97C3: 'dá,tà',
-    0x97C4: 'hù',
-    0x97C5: 'xiǎn',
-    0x97C6: 'qiān',
-    0x97C7: 'dú',
-    0x97C8: 'wà',
-    0x97C9: 'jiān',
-    0x97CA: 'lán',
-    0x97CB: 'wéi,huí',
-    0x97CC: 'rèn',
-    0x97CD: 'fú',
-    0x97CE: 'mèi',
-    0x97CF: 'quàn,juàn',
-    0x97D0: 'gé',
-    0x97D1: 'wěi',
-    0x97D2: 'qiào,shāo',
-    0x97D3: 'hán',
-    0x97D4: 'chàng',
-    0x97D5: 'kuò',
-    0x97D6: 'rǒu',
-    0x97D7: 'yùn',
-    0x97D8: 'shè',
-    0x97D9: 'wěi',
-    0x97DA: 'gé',
-    0x97DB: 'bài,fú',
-    0x97DC: 'tāo,tào',
-    0x97DD: 'gōu',
-    0x97DE: 'yùn,wēn',
-    0x97DF: 'gāo',
-    0x97E0: 'bì',
-    0x97E1: 'wěi,xuē',
-    0x97E2: 'suì,huì',
-    0x97E3: 'dú',
-    0x97E4: 'wà',
-    0x97E5: 'dú',
-    0x97E6: 'wéi',
-    0x97E7: 'rèn',
-    0x97E8: 'fú',
-    0x97E9: 'hán',
-    0x97EA: 'wěi',
-    0x97EB: 'yùn',
-    0x97EC: 'tāo',
-    0x97ED: 'jiǔ',
-    0x97EE: 'jiǔ',
-    0x97EF: 'xiān',
-    0x97F0: 'xiè',
-    0x97F1: 'xiān',
-    0x97F2: 'jī',
-    0x97F3: 'yīn',
-    0x97F4: 'zá',
-    0x97F5: 'yùn',
-    0x97F6: 'sháo',
-    0x97F7: 'lè',
-    0x97F8: 'péng',
-    0x97F9: 'huáng,yīng',
-    0x97FA: 'yīng',
-    0x97FB: 'yùn',
-    0x97FC: 'péng',
-    0x97FD: 'ān',
-    0x97FE: 'yīn',
-    0x97FF: 'xiǎng',
-    0x9800: 'hù',
-    0x9801: 'yè,xié',
-    0x9802: 'dǐng',
-    0x9803: 'qǐng,qīng,kuǐ',
-    0x9804: 'kuí',
-    0x9805: 'xiàng',
-    0x9806: 'shùn',
-    0x9807: 'hān,àn',
-    0x9808: 'xū',
-    0x9809: 'yí',
-    0x980A: 'xū',
-    0x980B: 'ě',
-    0x980C: 'sòng,róng',
-    0x980D: 'kuǐ',
-    0x980E: 'qí,kěn',
-    0x980F: 'háng,gāng,hàng',
-    0x9810: 'yù',
-    0x9811: 'wán,kūn',
-    0x9812: 'bān,fén',
-    0x9813: 'dùn,dú',
-    0x9814: 'dí',
-    0x9815: 'dān,diàn',
-    0x9816: 'pàn',
-    0x9817: 'pō,pǒ,pò,pí',
-    0x9818: 'lǐng',
-    0x9819: 'chè',
-    0x981A: 'jǐng',
-    0x981B: 'lèi',
-    0x981C: 'hé,hán,qīn,gé',
-    0x981D: 'qiāo',
-    0x981E: 'è,àn',
-    0x981F: 'é',
-    0x9820: 'wěi',
-    0x9821: 'xié,jiá,jié',
-    0x9822: 'kuò',
-    0x9823: 'shěn',
-    0x9824: 'yí',
-    0x9825: 'yí',
-    0x9826: 'hái,kē,ké',
-    0x9827: 'duǐ,duī',
-    0x9828: 'yǔ,biàn',
-    0x9829: 'pīng,pǐng',
-    0x982A: 'lèi',
-    0x982B: 'fǔ,tāo,tiào',
-    0x982C: 'jiá',
-    0x982D: 'tóu,tou',
-    0x982E: 'huì',
-    0x982F: 'kuí',
-    0x9830: 'jiá',
-    0x9831: 'luō',
-    0x9832: 'tǐng',
-    0x9833: 'chēng',
-    0x9834: 'yǐng,jǐng',
-    0x9835: 'yūn',
-    0x9836: 'hú',
-    0x9837: 'hàn',
-    0x9838: 'jǐng,gěng',
-    0x9839: 'tuí',
-    0x983A: 'tuí',
-    0x983B: 'pín,bīn',
-    0x983C: 'lài',
-    0x983D: 'tuí',
-    0x983E: 'zī',
-    0x983F: 'zī',
-    0x9840: 'chuí',
-    0x9841: 'dìng,dǐng',
-    0x9842: 'lài,lái',
-    0x9843: 'tán,shǎn',
-    0x9844: 'hàn',
-    0x9845: 'qiān',
-    0x9846: 'kē,kě,kuǎn',
-    0x9847: 'cuì,zú',
-    0x9848: 'xuǎn,jiōng,jiǒng,xiàn',
-    0x9849: 'qīn',
-    0x984A: 'yí',
-    0x984B: 'sāi',
-    0x984C: 'tí,dì',
-    0x984D: 'é',
-    0x984E: 'è',
-    0x984F: 'yán',
-    0x9850: 'wèn,hún,hùn',
-    0x9851: 'kǎn,yàn',
-    0x9852: 'yóng,yú',
-    0x9853: 'zhuān',
-    0x9854: 'yán,yá',
-    0x9855: 'xiǎn',
-    0x9856: 'xìn',
-    0x9857: 'yǐ',
-    0x9858: 'yuàn,yuǎn',
-    0x9859: 'sǎng',
-    0x985A: 'diān,tián,tiàn',
-    0x985B: 'diān',
-    0x985C: 'jiǎng',
-    0x985D: 'kuī,kuǎ',
-    0x985E: 'lèi',
-    0x985F: 'láo',
-    0x9860: 'piǎo',
-    0x9861: 'wài,zhuài',
-    0x9862: 'mán',
-    0x9863: 'cù',
-    0x9864: 'yáo,qiào',
-    0x9865: 'hào',
-    0x9866: 'qiáo',
-    0x9867: 'gù',
-    0x9868: 'xùn',
-    0x9869: 'yǎn,qìn,hàn,qiǎn',
-    0x986A: 'huì',
-    0x986B: 'chàn,zhàn,shān',
-    0x986C: 'rú',
-    0x986D: 'méng',
-    0x986E: 'bīn',
-    0x986F: 'xiǎn,xiàn',
-    0x9870: 'pín',
-    0x9871: 'lú',
-    0x9872: 'lǎn,lǐn',
-    0x9873: 'niè',
-    0x9874: 'quán',
-    0x9875: 'yè',
-    0x9876: 'dǐng',
-    0x9877: 'qǐng',
-    0x9878: 'hān',
-    0x9879: 'xiàng',
-    0x987A: 'shùn',
-    0x987B: 'xū',
-    0x987C: 'xū',
-    0x987D: 'wán',
-    0x987E: 'gù',
-    0x987F: 'dùn,dú',
-    0x9880: 'qí',
-    0x9881: 'bān',
-    0x9882: 'sòng',
-    0x9883: 'háng',
-    0x9884: 'yù',
-    0x9885: 'lú',
-    0x9886: 'lǐng',
-    0x9887: 'pǒ,pō',
-    0x9888: 'jǐng,gěng',
-    0x9889: 'jié,xié',
-    0x988A: 'jiá',
-    0x988B: 'tǐng',
-    0x988C: 'hé,gé',
-    0x988D: 'yǐng',
-    0x988E: 'jiǒng',
-    0x988F: 'kē,ké',
-    0x9890: 'yí',
-    0x9891: 'pín',
-    0x9892: 'huì',
-    0x9893: 'tuí',
-    0x9894: 'hàn',
-    0x9895: 'yǐng',
-    0x9896: 'yǐng',
-    0x9897: 'kē',
-    0x9898: 'tí',
-    0x9899: 'yóng',
-    0x989A: 'è',
-    0x989B: 'zhuān',
-    0x989C: 'yán',
-    0x989D: 'é',
-    0x989E: 'niè',
-    0x989F: 'mān',
-    0x98A0: 'diān',
-    0x98A1: 'sǎng',
-    0x98A2: 'hào',
-    0x98A3: 'lèi',
-    0x98A4: 'chàn,zhàn',
-    0x98A5: 'rú',
-    0x98A6: 'pín',
-    0x98A7: 'quán',
-    0x98A8: 'fēng,fèng,fěng',
-    0x98A9: 'biāo,diū',
-    0x98AA: 'guā',
-    0x98AB: 'fú',
-    0x98AC: 'xiā',
-    0x98AD: 'zhǎn',
-    0x98AE: 'biāo,páo',
-    0x98AF: 'sà,lì',
-    0x98B0: 'bá,fú',
-    0x98B1: 'tái',
-    0x98B2: 'liè',
-    0x98B3: 'guā,jǐ',
-    0x98B4: 'xuàn',
-    0x98B5: 'shāo,xiāo',
-    0x98B6: 'jù',
-    0x98B7: 'biāo',
-    0x98B8: 'sī',
-    0x98B9: 'wěi',
-    0x98BA: 'yáng',
-    0x98BB: 'yáo,yào',
-    0x98BC: 'sōu',
-    0x98BD: 'kǎi',
-    0x98BE: 'sōu,sāo',
-    0x98BF: 'fān',
-    0x98C0: 'liú',
-    0x98C1: 'xí',
-    0x98C2: 'liù,liáo',
-    0x98C3: 'piāo,piào',
-    0x98C4: 'piāo',
-    0x98C5: 'liú',
-    0x98C6: 'biāo',
-    0x98C7: 'biāo',
-    0x98C8: 'biāo',
-    0x98C9: 'liáo',
-    0x98CA: 'biāo',
-    0x98CB: 'sè',
-    0x98CC: 'fēng',
-    0x98CD: 'xiū',
-    0x98CE: 'fēng',
-    0x98CF: 'yáng',
-    0x98D0: 'zhǎn',
-    0x98D1: 'biāo',
-    0x98D2: 'sà',
-    0x98D3: 'jù',
-    0x98D4: 'sī',
-    0x98D5: 'sōu',
-    0x98D6: 'yáo',
-    0x98D7: 'liú',
-    0x98D8: 'piāo',
-    0x98D9: 'biāo',
-    0x98DA: 'biāo',
-    0x98DB: 'fēi',
-    0x98DC: 'fān',
-    0x98DD: 'fēi',
-    0x98DE: 'fēi',
-    0x98DF: 'shí,sì,yì',
-    0x98E0: 'shí',
-    0x98E1: 'cān',
-    0x98E2: 'jī',
-    0x98E3: 'dìng',
-    0x98E4: 'sì',
-    0x98E5: 'tuō',
-    0x98E6: 'zhān,gān',
-    0x98E7: 'sūn',
-    0x98E8: 'xiǎng',
-    0x98E9: 'tún,zhùn',
-    0x98EA: 'rèn',
-    0x98EB: 'yù',
-    0x98EC: 'juàn,yǒng',
-    0x98ED: 'chì,shì',
-    0x98EE: 'yǐn',
-    0x98EF: 'fàn',
-    0x98F0: 'fàn',
-    0x98F1: 'sūn,cān',
-    0x98F2: 'yǐn,yìn',
-    0x98F3: 'tǒu,zhù',
-    0x98F4: 'yí,sì',
-    0x98F5: 'zuò,zé',
-    0x98F6: 'bì',
-    0x98F7: 'jiě',
-    0x98F8: 'tāo',
-    0x98F9: 'bǎo',
-    0x98FA: 'cí',
-    0x98FB: 'tiè',
-    0x98FC: 'sì',
-    0x98FD: 'bǎo',
-    0x98FE: 'shì,chì',
-    0x98FF: 'duò',
-    0x9900: 'hài',
-    0x9901: 'rèn',
-    0x9902: 'tiǎn,tián',
-    0x9903: 'jiǎo,jiào',
-    0x9904: 'jiá,hé',
-    0x9905: 'bǐng',
-    0x9906: 'yáo',
-    0x9907: 'tóng',
-    0x9908: 'cí',
-    0x9909: 'xiǎng',
-    0x990A: 'yǎng,yàng',
-    0x990B: 'juàn',
-    0x990C: 'ěr',
-    0x990D: 'yàn',
-    0x990E: 'le',
-    0x990F: 'xī',
-    0x9910: 'cān,sūn',
-    0x9911: 'bō',
-    0x9912: 'něi',
-    0x9913: 'è',
-    0x9914: 'bù,bū',
-    0x9915: 'jùn',
-    0x9916: 'dòu',
-    0x9917: 'sù',
-    0x9918: 'yú,yé',
-    0x9919: 'shì,xī',
-    0x991A: 'yáo',
-    0x991B: 'hún,kūn',
-    0x991C: 'guǒ',
-    0x991D: 'shì',
-    0x991E: 'jiàn',
-    0x991F: 'zhuì',
-    0x9920: 'bǐng',
-    0x9921: 'xiàn,kàn',
-    0x9922: 'bù',
-    0x9923: 'yè',
-    0x9924: 'tán,dàn',
-    0x9925: 'fēi',
-    0x9926: 'zhāng',
-    0x9927: 'wèi,něi',
-    0x9928: 'guǎn',
-    0x9929: 'è',
-    0x992A: 'nuǎn,nuàn',
-    0x992B: 'yùn,hún',
-    0x992C: 'hú',
-    0x992D: 'huáng',
-    0x992E: 'tiè',
-    0x992F: 'huì',
-    0x9930: 'jiān,zhān',
-    0x9931: 'hóu',
-    0x9932: 'ài,hé',
-    0x9933: 'táng,xíng',
-    0x9934: 'fēn',
-    0x9935: 'wèi',
-    0x9936: 'gǔ',
-    0x9937: 'chā',
-    0x9938: 'sòng',
-    0x9939: 'táng',
-    0x993A: 'bó',
-    0x993B: 'gāo',
-    0x993C: 'xì',
-    0x993D: 'kuì',
-    0x993E: 'liù,liú',
-    0x993F: 'sōu',
-    0x9940: 'táo,tāo,xiàn',
-    0x9941: 'yè',
-    0x9942: 'wēn',
-    0x9943: 'mó',
-    0x9944: 'táng',
-    0x9945: 'mán',
-    0x9946: 'bì',
-    0x9947: 'yù',
-    0x9948: 'xiū',
-    0x9949: 'jǐn',
-    0x994A: 'sǎn',
-    0x994B: 'kuì,tuí',
-    0x994C: 'zhuàn,xuǎn',
-    0x994D: 'shàn',
-    0x994E: 'chì',
-    0x994F: 'dàn',
-    0x9950: 'yì,yē,èn',
-    0x9951: 'jī,qí',
-    0x9952: 'ráo',
-    0x9953: 'chēng',
-    0x9954: 'yōng',
-    0x9955: 'tāo',
-    0x9956: 'wèi',
-    0x9957: 'xiǎng',
-    0x9958: 'zhān',
-    0x9959: 'fēn',
-    0x995A: 'hài',
-    0x995B: 'méng',
-    0x995C: 'yàn',
-    0x995D: 'mó',
-    0x995E: 'chán',
-    0x995F: 'xiǎng',
-    0x9960: 'luó',
-    0x9961: 'zàn',
-    0x9962: 'náng,nǎng',
-    0x9963: 'shí',
-    0x9964: 'dìng',
-    0x9965: 'jī',
-    0x9966: 'tuō',
-    0x9967: 'táng,xíng',
-    0x9968: 'tún',
-    0x9969: 'xì',
-    0x996A: 'rèn',
-    0x996B: 'yù',
-    0x996C: 'chì',
-    0x996D: 'fàn',
-    0x996E: 'yǐn,yìn',
-    0x996F: 'jiàn',
-    0x9970: 'shì',
-    0x9971: 'bǎo',
-    0x9972: 'sì',
-    0x9973: 'duò',
-    0x9974: 'yí',
-    0x9975: 'ěr',
-    0x9976: 'ráo',
-    0x9977: 'xiǎng',
-    0x9978: 'hé',
-    0x9979: 'le,gē',
-    0x997A: 'jiǎo',
-    0x997B: 'xī',
-    0x997C: 'bǐng',
-    0x997D: 'bō',
-    0x997E: 'dòu',
-    0x997F: 'è',
-    0x9980: 'yú',
-    0x9981: 'něi',
-    0x9982: 'jùn',
-    0x9983: 'guǒ',
-    0x9984: 'hún',
-    0x9985: 'xiàn',
-    0x9986: 'guǎn',
-    0x9987: 'chā,zha',
-    0x9988: 'kuì',
-    0x9989: 'gǔ',
-    0x998A: 'sōu',
-    0x998B: 'chán',
-    0x998C: 'yè',
-    0x998D: 'mó',
-    0x998E: 'bó',
-    0x998F: 'liú,liù',
-    0x9990: 'xiū',
-    0x9991: 'jǐn',
-    0x9992: 'mán',
-    0x9993: 'sǎn',
-    0x9994: 'zhuàn',
-    0x9995: 'náng,nǎng',
-    0x9996: 'shǒu',
-    0x9997: 'kuí,qiú',
-    0x9998: 'guó,xù',
-    0x9999: 'xiāng',
-    0x999A: 'fén',
-    0x999B: 'bó',
-    0x999C: 'nǐ',
-    0x999D: 'bì',
-    0x999E: 'bó,pò',
-    0x999F: 'tú',
-    0x99A0: 'hān',
-    0x99A1: 'fēi',
-    0x99A2: 'jiān',
-    0x99A3: 'ān',
-    0x99A4: 'ài',
-    0x99A5: 'fù,bì',
-    0x99A6: 'xiān',
-    0x99A7: 'yūn,wò',
-    0x99A8: 'xīn',
-    0x99A9: 'fén',
-    0x99AA: 'pīn',
-    0x99AB: 'xīn',
-    0x99AC: 'mǎ',
-    0x99AD: 'yù',
-    0x99AE: 'féng,píng',
-    0x99AF: 'hàn,qián,hán',
-    0x99B0: 'dí',
-    0x99B1: 'tuó,duò,dài',
-    0x99B2: 'zhé,tuō',
-    0x99B3: 'chí',
-    0x99B4: 'xún',
-    0x99B5: 'zhù',
-    0x99B6: 'zhī,shì',
-    0x99B7: 'pèi',
-    0x99B8: 'xìn,jìn',
-    0x99B9: 'rì',
-    0x99BA: 'sà',
-    0x99BB: 'yǔn',
-    0x99BC: 'wén',
-    0x99BD: 'zhí',
-    0x99BE: 'dàn,dǎn',
-    0x99BF: 'lǘ',
-    0x99C0: 'yóu',
-    0x99C1: 'bó',
-    0x99C2: 'bǎo',
-    0x99C3: 'jué,kuài',
-    0x99C4: 'tuó',
-    0x99C5: 'yì',
-    0x99C6: 'qū',
-    0x99C7: 'wén',
-    0x99C8: 'qū',
-    0x99C9: 'jiōng',
-    0x99CA: 'pǒ',
-    0x99CB: 'zhāo',
-    0x99CC: 'yuān',
-    0x99CD: 'péi,pēng',
-    0x99CE: 'zhòu',
-    0x99CF: 'jù',
-    0x99D0: 'zhù',
-    0x99D1: 'nú',
-    0x99D2: 'jū,jù',
-    0x99D3: 'pī',
-    0x99D4: 'zǎng,zù,zǔ',
-    0x99D5: 'jià,jiā',
-    0x99D6: 'líng',
-    0x99D7: 'zhěn',
-    0x99D8: 'tái,dài,zhài,tāi',
-    0x99D9: 'fù',
-    0x99DA: 'yǎng',
-    0x99DB: 'shǐ',
-    0x99DC: 'bì',
-    0x99DD: 'tuó',
-    0x99DE: 'tuó',
-    0x99DF: 'sì',
-    0x99E0: 'liú',
-    0x99E1: 'mà',
-    0x99E2: 'pián',
-    0x99E3: 'táo',
-    0x99E4: 'zhì',
-    0x99E5: 'róng',
-    0x99E6: 'téng',
-    0x99E7: 'dòng',
-    0x99E8: 'xūn,xuàn',
-    0x99E9: 'quān',
-    0x99EA: 'shēn',
-    0x99EB: 'jiōng',
-    0x99EC: 'ěr',
-    0x99ED: 'hài',
-    0x99EE: 'bó',
-    0x99EF: 'zhū',
-    0x99F0: 'yīn',
-    0x99F1: 'luò,jià',
-    0x99F2: 'zhōu',
-    0x99F3: 'dàn',
-    0x99F4: 'hài',
-    0x99F5: 'liú',
-    0x99F6: 'jú',
-    0x99F7: 'sǒng',
-    0x99F8: 'qīn',
-    0x99F9: 'máng',
-    0x99FA: 'láng,liáng',
-    0x99FB: 'hàn',
-    0x99FC: 'tú',
-    0x99FD: 'xuān',
-    0x99FE: 'tuì',
-    0x99FF: 'jùn',
-    0x9A00: 'ě,é',
-    0x9A01: 'chěng',
-    0x9A02: 'xīng',
-    0x9A03: 'ái,sì,tǎi',
-    0x9A04: 'lù',
-    0x9A05: 'zhuī',
-    0x9A06: 'zhōu,dòng',
-    0x9A07: 'shè',
-    0x9A08: 'pián',
-    0x9A09: 'kūn',
-    0x9A0A: 'táo',
-    0x9A0B: 'lái',
-    0x9A0C: 'zōng',
-    0x9A0D: 'kè',
-    0x9A0E: 'qí,jì',
-    0x9A0F: 'qí',
-    0x9A10: 'yàn',
-    0x9A11: 'fēi',
-    0x9A12: 'sāo',
-    0x9A13: 'yàn',
-    0x9A14: 'gé',
-    0x9A15: 'yǎo',
-    0x9A16: 'wù',
-    0x9A17: 'piàn',
-    0x9A18: 'cōng',
-    0x9A19: 'piàn',
-    0x9A1A: 'qián',
-    0x9A1B: 'fēi',
-    0x9A1C: 'huáng',
-    0x9A1D: 'qián',
-    0x9A1E: 'huō',
-    0x9A1F: 'yú',
-    0x9A20: 'tí',
-    0x9A21: 'quán',
-    0x9A22: 'xiá',
-    0x9A23: 'zōng',
-    0x9A24: 'kuí,jué',
-    0x9A25: 'róu',
-    0x9A26: 'sī',
-    0x9A27: 'guā',
-    0x9A28: 'tuó',
-    0x9A29: 'guī,tuí',
-    0x9A2A: 'sōu',
-    0x9A2B: 'qiān,jiǎn',
-    0x9A2C: 'chéng',
-    0x9A2D: 'zhì',
-    0x9A2E: 'liú',
-    0x9A2F: 'péng,bǎng',
-    0x9A30: 'téng',
-    0x9A31: 'xí',
-    0x9A32: 'cǎo',
-    0x9A33: 'dú',
-    0x9A34: 'yàn',
-    0x9A35: 'yuán',
-    0x9A36: 'zōu,zhū,zhòu,qū',
-    0x9A37: 'sāo,sǎo,xiāo',
-    0x9A38: 'shàn',
-    0x9A39: 'qí',
-    0x9A3A: 'zhì,chì',
-    0x9A3B: 'shuāng',
-    0x9A3C: 'lù',
-    0x9A3D: 'xí',
-    0x9A3E: 'luó',
-    0x9A3F: 'zhāng',
-    0x9A40: 'mò,mà',
-    0x9A41: 'ào,yào',
-    0x9A42: 'cān',
-    0x9A43: 'biāo,piào',
-    0x9A44: 'cōng',
-    0x9A45: 'qū',
-    0x9A46: 'bì',
-    0x9A47: 'zhì',
-    0x9A48: 'yù',
-    0x9A49: 'xū',
-    0x9A4A: 'huá',
-    0x9A4B: 'bō',
-    0x9A4C: 'sù',
-    0x9A4D: 'xiāo',
-    0x9A4E: 'lín',
-    0x9A4F: 'zhàn',
-    0x9A50: 'dūn',
-    0x9A51: 'liú',
-    0x9A52: 'tuó',
-    0x9A53: 'céng',
-    0x9A54: 'diàn',
-    0x9A55: 'jiāo,xiāo,jū,qiáo',
-    0x9A56: 'tiě',
-    0x9A57: 'yàn',
-    0x9A58: 'luó',
-    0x9A59: 'zhān,zhàn',
-    0x9A5A: 'jīng',
-    0x9A5B: 'yì',
-    0x9A5C: 'yè',
-    0x9A5D: 'tuō',
-    0x9A5E: 'pīn',
-    0x9A5F: 'zhòu',
-    0x9A60: 'yàn',
-    0x9A61: 'lóng,zǎng',
-    0x9A62: 'lǘ',
-    0x9A63: 'téng',
-    0x9A64: 'xiāng',
-    0x9A65: 'jì',
-    0x9A66: 'shuāng',
-    0x9A67: 'jú',
-    0x9A68: 'xí',
-    0x9A69: 'huān',
-    0x9A6A: 'lí,chí',
-    0x9A6B: 'biāo,piāo',
-    0x9A6C: 'mǎ',
-    0x9A6D: 'yù',
-    0x9A6E: 'tuó,duò',
-    0x9A6F: 'xùn,xún',
-    0x9A70: 'chí',
-    0x9A71: 'qū',
-    0x9A72: 'rì',
-    0x9A73: 'bó',
-    0x9A74: 'lǘ',
-    0x9A75: 'zǎng',
-    0x9A76: 'shǐ',
-    0x9A77: 'sì',
-    0x9A78: 'fù',
-    0x9A79: 'jū',
-    0x9A7A: 'zōu',
-    0x9A7B: 'zhù',
-    0x9A7C: 'tuó',
-    0x9A7D: 'nú',
-    0x9A7E: 'jià',
-    0x9A7F: 'yì',
-    0x9A80: 'dài,tái',
-    0x9A81: 'xiāo',
-    0x9A82: 'mà',
-    0x9A83: 'yīn',
-    0x9A84: 'jiāo',
-    0x9A85: 'huá',
-    0x9A86: 'luò',
-    0x9A87: 'hài',
-    0x9A88: 'pián',
-    0x9A89: 'biāo',
-    0x9A8A: 'lí',
-    0x9A8B: 'chěng',
-    0x9A8C: 'yàn',
-    0x9A8D: 'xīng',
-    0x9A8E: 'qīn',
-    0x9A8F: 'jùn',
-    0x9A90: 'qí',
-    0x9A91: 'qí',
-    0x9A92: 'kè',
-    0x9A93: 'zhuī',
-    0x9A94: 'zōng',
-    0x9A95: 'sù',
-    0x9A96: 'cān',
-    0x9A97: 'piàn',
-    0x9A98: 'zhì',
-    0x9A99: 'kuí',
-    0x9A9A: 'sāo',
-    0x9A9B: 'wù',
-    0x9A9C: 'ào',
-    0x9A9D: 'liú',
-    0x9A9E: 'qiān',
-    0x9A9F: 'shàn',
-    0x9AA0: 'biāo,piào',
-    0x9AA1: 'luó',
-    0x9AA2: 'cōng',
-    0x9AA3: 'chǎn',
-    0x9AA4: 'zhòu',
-    0x9AA5: 'jì',
-    0x9AA6: 'shuāng',
-    0x9AA7: 'xiāng',
-    0x9AA8: 'gǔ,gū,gú',
-    0x9AA9: 'wěi',
-    0x9AAA: 'wěi',
-    0x9AAB: 'wěi,wán',
-    0x9AAC: 'yú',
-    0x9AAD: 'gàn',
-    0x9AAE: 'yì',
-    0x9AAF: 'āng,kǎng',
-    0x9AB0: 'tóu,gǔ',
-    0x9AB1: 'jiè,jiá,xiè',
-    0x9AB2: 'bào',
-    0x9AB3: 'bèi',
-    0x9AB4: 'cī,zhài',
-    0x9AB5: 'tǐ',
-    0x9AB6: 'dǐ',
-    0x9AB7: 'kū',
-    0x9AB8: 'hái,gāi',
-    0x9AB9: 'qiāo,jiāo,xiāo',
-    0x9ABA: 'hóu',
-    0x9ABB: 'kuà',
-    0x9ABC: 'gé',
-    0x9ABD: 'tuǐ',
-    0x9ABE: 'gěng',
-    0x9ABF: 'pián',
-    0x9AC0: 'bì',
-    0x9AC1: 'kē,kuà',
-    0x9AC2: 'qià,gé',
-    0x9AC3: 'yú',
-    0x9AC4: 'suǐ',
-    0x9AC5: 'lóu',
-    0x9AC6: 'bó,pò',
-    0x9AC7: 'xiāo',
-    0x9AC8: 'bǎng,páng,pǎng',
-    0x9AC9: 'bó,jué',
-    0x9ACA: 'cī,cuō',
-    0x9ACB: 'kuān',
-    0x9ACC: 'bìn',
-    0x9ACD: 'mó',
-    0x9ACE: 'liáo',
-    0x9ACF: 'lóu',
-    0x9AD0: 'xiāo',
-    0x9AD1: 'dú',
-    0x9AD2: 'zāng,zǎng',
-    0x9AD3: 'suǐ',
-    0x9AD4: 'tǐ,tī',
-    0x9AD5: 'bìn',
-    0x9AD6: 'kuān',
-    0x9AD7: 'lú',
-    0x9AD8: 'gāo,gào',
-    0x9AD9: 'gāo',
-    0x9ADA: 'qiào',
-    0x9ADB: 'kāo',
-    0x9ADC: 'qiǎo',
-    0x9ADD: 'láo',
-    0x9ADE: 'sào',
-    0x9ADF: 'biāo,piào,shān',
-    0x9AE0: 'kūn',
-    0x9AE1: 'kūn',
-    0x9AE2: 'dí',
-    0x9AE3: 'fǎng',
-    0x9AE4: 'xiū',
-    0x9AE5: 'rán',
-    0x9AE6: 'máo',
-    0x9AE7: 'dàn',
-    0x9AE8: 'kūn',
-    0x9AE9: 'bìn',
-    0x9AEA: 'fà,fǎ',
-    0x9AEB: 'tiáo',
-    0x9AEC: 'pī',
-    0x9AED: 'zī',
-    0x9AEE: 'fà,fǎ',
-    0x9AEF: 'rán',
-    0x9AF0: 'tì',
-    0x9AF1: 'bào',
-    0x9AF2: 'bì',
-    0x9AF3: 'máo,róu,méng',
-    0x9AF4: 'fú,fèi',
-    0x9AF5: 'ér',
-    0x9AF6: 'róng,èr',
-    0x9AF7: 'qū',
-    0x9AF8: 'gōng',
-    0x9AF9: 'xiū',
-    0x9AFA: 'kuò,yuè',
-    0x9AFB: 'jì,jié',
-    0x9AFC: 'péng',
-    0x9AFD: 'zhuā',
-    0x9AFE: 'shāo,shǎo,shào',
-    0x9AFF: 'suō',
-    0x9B00: 'tì',
-    0x9B01: 'lì',
-    0x9B02: 'bìn',
-    0x9B03: 'zōng',
-    0x9B04: 'dí,tì',
-    0x9B05: 'péng',
-    0x9B06: 'sōng,sòng,sóng',
-    0x9B07: 'zhēng',
-    0x9B08: 'quán',
-    0x9B09: 'zōng',
-    0x9B0A: 'shùn',
-    0x9B0B: 'jiǎn',
-    0x9B0C: 'tuǒ,chuí,duǒ',
-    0x9B0D: 'hú',
-    0x9B0E: 'là',
-    0x9B0F: 'jiū',
-    0x9B10: 'qí',
-    0x9B11: 'lián',
-    0x9B12: 'zhěn',
-    0x9B13: 'bìn',
-    0x9B14: 'péng',
-    0x9B15: 'mà',
-    0x9B16: 'sān,sàn',
-    0x9B17: 'mán',
-    0x9B18: 'mán',
-    0x9B19: 'sēng',
-    0x9B1A: 'xū',
-    0x9B1B: 'liè',
-    0x9B1C: 'qiān',
-    0x9B1D: 'qiān',
-    0x9B1E: 'náng,nàng',
-    0x9B1F: 'huán',
-    0x9B20: 'kuò,kuài',
-    0x9B21: 'níng',
-    0x9B22: 'bìn',
-    0x9B23: 'liè',
-    0x9B24: 'ráng,níng',
-    0x9B25: 'dòu',
-    0x9B26: 'dòu',
-    0x9B27: 'nào',
-    0x9B28: 'hòng,xiàng',
-    0x9B29: 'xì,hè',
-    0x9B2A: 'dòu',
-    0x9B2B: 'hǎn',
-    0x9B2C: 'dòu',
-    0x9B2D: 'dòu',
-    0x9B2E: 'jiū',
-    0x9B2F: 'chàng',
-    0x9B30: 'yù',
-    0x9B31: 'yù',
-    0x9B32: 'gé,lì,è',
-    0x9B33: 'yàn',
-    0x9B34: 'fǔ,lì',
-    0x9B35: 'qín,xín',
-    0x9B36: 'guī',
-    0x9B37: 'zōng,zěng',
-    0x9B38: 'liù',
-    0x9B39: 'guī,xié',
-    0x9B3A: 'shāng',
-    0x9B3B: 'yù,zhōu,jū',
-    0x9B3C: 'guǐ',
-    0x9B3D: 'mèi',
-    0x9B3E: 'jì,qí',
-    0x9B3F: 'qí',
-    0x9B40: 'gà',
-    0x9B41: 'kuí,kuǐ,kuài',
-    0x9B42: 'hún',
-    0x9B43: 'bá',
-    0x9B44: 'pò,bó,tuò',
-    0x9B45: 'mèi',
-    0x9B46: 'xū',
-    0x9B47: 'yǎn',
-    0x9B48: 'xiāo',
-    0x9B49: 'liǎng',
-    0x9B4A: 'yù',
-    0x9B4B: 'tuí,chuí',
-    0x9B4C: 'qī',
-    0x9B4D: 'wǎng',
-    0x9B4E: 'liǎng',
-    0x9B4F: 'wèi,wéi,wēi',
-    0x9B50: 'gān',
-    0x9B51: 'chī',
-    0x9B52: 'piāo',
-    0x9B53: 'bì',
-    0x9B54: 'mó',
-    0x9B55: 'jǐ',
-    0x9B56: 'xū',
-    0x9B57: 'chǒu,chóu',
-    0x9B58: 'yǎn',
-    0x9B59: 'zhān',
-    0x9B5A: 'yú',
-    0x9B5B: 'dāo',
-    0x9B5C: 'rén',
-    0x9B5D: 'jié,jì',
-    0x9B5E: 'bā',
-    0x9B5F: 'hóng,gōng',
-    0x9B60: 'tuō',
-    0x9B61: 'diào,dí',
-    0x9B62: 'jǐ',
-    0x9B63: 'xù,yú',
-    0x9B64: 'é,huà',
-    0x9B65: 'è,qiè,jì',
-    0x9B66: 'shā,suō',
-    0x9B67: 'háng',
-    0x9B68: 'tún',
-    0x9B69: 'mò',
-    0x9B6A: 'jiè',
-    0x9B6B: 'shěn',
-    0x9B6C: 'bǎn',
-    0x9B6D: 'yuán,wǎn',
-    0x9B6E: 'pí,bǐ',
-    0x9B6F: 'lǔ,lǚ',
-    0x9B70: 'wén',
-    0x9B71: 'hú,hù',
-    0x9B72: 'lú',
-    0x9B73: 'zā,shī',
-    0x9B74: 'fáng',
-    0x9B75: 'fén,fèn',
-    0x9B76: 'nà',
-    0x9B77: 'yóu',
-    0x9B78: 'piàn',
-    0x9B79: 'mó',
-    0x9B7A: 'hé,gě',
-    0x9B7B: 'xiá,xiā',
-    0x9B7C: 'qū,xié',
-    0x9B7D: 'hán,hān',
-    0x9B7E: 'pī,pí',
-    0x9B7F: 'líng,lín',
-    0x9B80: 'tuó',
-    0x9B81: 'bō,bà',
-    0x9B82: 'qiú',
-    0x9B83: 'píng',
-    0x9B84: 'fú',
-    0x9B85: 'bì',
-    0x9B86: 'cǐ,jì',
-    0x9B87: 'wèi',
-    0x9B88: 'jū,qú,gǒu',
-    0x9B89: 'diāo',
-    0x9B8A: 'bà,bó',
-    0x9B8B: 'yóu,chóu',
-    0x9B8C: 'gǔn',
-    0x9B8D: 'pī,pí,jù',
-    0x9B8E: 'nián',
-    0x9B8F: 'xīng,zhēng',
-    0x9B90: 'tái',
-    0x9B91: 'bào,bāo,pāo',
-    0x9B92: 'fù',
-    0x9B93: 'zhǎ,zhà',
-    0x9B94: 'jù',
-    0x9B95: 'gū',
-    0x9B96: 'shí',
-    0x9B97: 'dōng',
-    0x9B98: 'dai',
-    0x9B99: 'tà',
-    0x9B9A: 'jié,qià',
-    0x9B9B: 'shū',
-    0x9B9C: 'hòu',
-    0x9B9D: 'xiǎng,zhèn',
-    0x9B9E: 'ér',
-    0x9B9F: 'àn,ān',
-    0x9BA0: 'wéi',
-    0x9BA1: 'zhào',
-    0x9BA2: 'zhū',
-    0x9BA3: 'yìn',
-    0x9BA4: 'liè',
-    0x9BA5: 'luò,gé',
-    0x9BA6: 'tóng',
-    0x9BA7: 'tǐ,yí',
-    0x9BA8: 'yì,qí',
-    0x9BA9: 'bìng,bì',
-    0x9BAA: 'wěi',
-    0x9BAB: 'jiāo',
-    0x9BAC: 'kū,kù',
-    0x9BAD: 'guī,xié,huà,wā,kuí',
-    0x9BAE: 'xiān,xiǎn,xiàn',
-    0x9BAF: 'gé',
-    0x9BB0: 'huí',
-    0x9BB1: 'lǎo',
-    0x9BB2: 'fú',
-    0x9BB3: 'kào',
-    0x9BB4: 'xiū',
-    0x9BB5: 'duó',
-    0x9BB6: 'jūn',
-    0x9BB7: 'tí',
-    0x9BB8: 'miǎn',
-    0x9BB9: 'shāo',
-    0x9BBA: 'zhǎ',
-    0x9BBB: 'suō',
-    0x9BBC: 'qīn',
-    0x9BBD: 'yú',
-    0x9BBE: 'něi',
-    0x9BBF: 'zhé',
-    0x9BC0: 'gǔn',
-    0x9BC1: 'gěng',
-    0x9BC2: 'sū',
-    0x9BC3: 'wú',
-    0x9BC4: 'qiú',
-    0x9BC5: 'shān,shěn',
-    0x9BC6: 'pū,bū',
-    0x9BC7: 'huàn',
-    0x9BC8: 'tiáo,yóu,chóu',
-    0x9BC9: 'lǐ',
-    0x9BCA: 'shā',
-    0x9BCB: 'shā',
-    0x9BCC: 'kào',
-    0x9BCD: 'méng',
-    0x9BCE: 'chéng',
-    0x9BCF: 'lí',
-    0x9BD0: 'zǒu',
-    0x9BD1: 'xī',
-    0x9BD2: 'yǒng',
-    0x9BD3: 'shēn',
-    0x9BD4: 'zī',
-    0x9BD5: 'qí',
-    0x9BD6: 'zhēng,qīng',
-    0x9BD7: 'xiǎng',
-    0x9BD8: 'něi',
-    0x9BD9: 'chún',
-    0x9BDA: 'jì',
-    0x9BDB: 'diāo',
-    0x9BDC: 'qiè',
-    0x9BDD: 'gù',
-    0x9BDE: 'zhǒu',
-    0x9BDF: 'dōng',
-    0x9BE0: 'lái',
-    0x9BE1: 'fèi,fēi',
-    0x9BE2: 'ní',
-    0x9BE3: 'yì',
-    0x9BE4: 'kūn',
-    0x9BE5: 'lù',
-    0x9BE6: 'jiù,ǎi',
-    0x9BE7: 'chāng',
-    0x9BE8: 'jīng,qíng',
-    0x9BE9: 'lún',
-    0x9BEA: 'líng',
-    0x9BEB: 'zōu',
-    0x9BEC: 'lí',
-    0x9BED: 'měng',
-    0x9BEE: 'zōng',
-    0x9BEF: 'zhì',
-    0x9BF0: 'nián',
-    0x9BF1: 'hǔ',
-    0x9BF2: 'yú',
-    0x9BF3: 'dǐ',
-    0x9BF4: 'shī',
-    0x9BF5: 'shēn',
-    0x9BF6: 'huàn',
-    0x9BF7: 'tí',
-    0x9BF8: 'hóu',
-    0x9BF9: 'xīng',
-    0x9BFA: 'zhū',
-    0x9BFB: 'là',
-    0x9BFC: 'zōng',
-    0x9BFD: 'zéi,jì',
-    0x9BFE: 'biān',
-    0x9BFF: 'biān',
-    0x9C00: 'huàn',
-    0x9C01: 'quán',
-    0x9C02: 'zéi,zé',
-    0x9C03: 'wēi',
-    0x9C04: 'wēi',
-    0x9C05: 'yú',
-    0x9C06: 'chūn',
-    0x9C07: 'róu',
-    0x9C08: 'dié,qiè,zhá',
-    0x9C09: 'huáng',
-    0x9C0A: 'liàn',
-    0x9C0B: 'yǎn',
-    0x9C0C: 'qiū',
-    0x9C0D: 'qiū',
-    0x9C0E: 'jiǎn',
-    0x9C0F: 'bī',
-    0x9C10: 'è',
-    0x9C11: 'yáng',
-    0x9C12: 'fù',
-    0x9C13: 'sāi,xí',
-    0x9C14: 'gǎn,jiān,xián',
-    0x9C15: 'xiā',
-    0x9C16: 'tuǒ,wěi',
-    0x9C17: 'hú',
-    0x9C18: 'shì',
-    0x9C19: 'ruò',
-    0x9C1A: 'xuān',
-    0x9C1B: 'wēn',
-    0x9C1C: 'qiàn,jiān',
-    0x9C1D: 'hào',
-    0x9C1E: 'wū',
-    0x9C1F: 'fáng,páng',
-    0x9C20: 'sāo',
-    0x9C21: 'liú',
-    0x9C22: 'mǎ',
-    0x9C23: 'shí',
-    0x9C24: 'shī',
-    0x9C25: 'guān,guàn,kūn,gǔn',
-    0x9C26: 'zī',
-    0x9C27: 'téng',
-    0x9C28: 'tǎ,dié',
-    0x9C29: 'yáo',
-    0x9C2A: 'é,gé',
-    0x9C2B: 'yóng',
-    0x9C2C: 'qián',
-    0x9C2D: 'qí',
-    0x9C2E: 'wēn',
-    0x9C2F: 'ruò',
-    0x9C30: 'shén',
-    0x9C31: 'lián',
-    0x9C32: 'áo',
-    0x9C33: 'lè',
-    0x9C34: 'huī',
-    0x9C35: 'mǐn',
-    0x9C36: 'jì',
-    0x9C37: 'tiáo',
-    0x9C38: 'qū',
-    0x9C39: 'jiān',
-    0x9C3A: 'shēn,sāo,cān',
-    0x9C3B: 'mán',
-    0x9C3C: 'xí',
-    0x9C3D: 'qiú',
-    0x9C3E: 'biào',
-    0x9C3F: 'jì',
-    0x9C40: 'jì',
-    0x9C41: 'zhú',
-    0x9C42: 'jiāng',
-    0x9C43: 'xiū,qiū',
-    0x9C44: 'zhuān,tuán,liàn',
-    0x9C45: 'yōng,yóng',
-    0x9C46: 'zhāng',
-    0x9C47: 'kāng',
-    0x9C48: 'xuě',
-    0x9C49: 'biē',
-    0x9C4A: 'yù',
-    0x9C4B: 'qū',
-    0x9C4C: 'xiàng',
-    0x9C4D: 'bō',
-    0x9C4E: 'jiǎo',
-    0x9C4F: 'xún',
-    0x9C50: 'sù',
-    0x9C51: 'huáng',
-    0x9C52: 'zūn,zùn',
-    0x9C53: 'shàn,tuó',
-    0x9C54: 'shàn',
-    0x9C55: 'fān',
-    0x9C56: 'guì,jué',
-    0x9C57: 'lín',
-    0x9C58: 'xún',
-    0x9C59: 'miáo',
-    0x9C5A: 'xǐ,xī',
-    0x9C5B: 'zēng',
-    0x9C5C: 'xiāng',
-    0x9C5D: 'fèn',
-    0x9C5E: 'guān',
-    0x9C5F: 'hòu',
-    0x9C60: 'kuài',
-    0x9C61: 'zéi',
-    0x9C62: 'sāo',
-    0x9C63: 'zhān,shàn',
-    0x9C64: 'gǎn',
-    0x9C65: 'guì',
-    0x9C66: 'yìng,shéng,měng',
-    0x9C67: 'lǐ',
-    0x9C68: 'cháng',
-    0x9C69: 'léi',
-    0x9C6A: 'shǔ',
-    0x9C6B: 'ài',
-    0x9C6C: 'rú',
-    0x9C6D: 'jì',
-    0x9C6E: 'xù,yú',
-    0x9C6F: 'hù',
-    0x9C70: 'shǔ',
-    0x9C71: 'lì',
-    0x9C72: 'liè,là',
-    0x9C73: 'lì,lù,luò',
-    0x9C74: 'miè',
-    0x9C75: 'zhēn',
-    0x9C76: 'xiǎng',
-    0x9C77: 'è',
-    0x9C78: 'lú',
-    0x9C79: 'guàn',
-    0x9C7A: 'lí,lǐ',
-    0x9C7B: 'xiān,xiǎn',
-    0x9C7C: 'yú',
-    0x9C7D: 'dāo',
-    0x9C7E: 'jǐ',
-    0x9C7F: 'yóu',
-    0x9C80: 'tún',
-    0x9C81: 'lǔ',
-    0x9C82: 'fáng',
-    0x9C83: 'bā',
-    0x9C84: 'hé',
-    0x9C85: 'bà,bō',
-    0x9C86: 'píng',
-    0x9C87: 'nián',
-    0x9C88: 'lú',
-    0x9C89: 'yóu',
-    0x9C8A: 'zhǎ',
-    0x9C8B: 'fù',
-    0x9C8C: 'bà,bó',
-    0x9C8D: 'bào',
-    0x9C8E: 'hòu',
-    0x9C8F: 'pí',
-    0x9C90: 'tái',
-    0x9C91: 'guī,xié',
-    0x9C92: 'jié',
-    0x9C93: 'kào',
-    0x9C94: 'wěi',
-    0x9C95: 'ér',
-    0x9C96: 'tóng',
-    0x9C97: 'zéi',
-    0x9C98: 'hòu',
-    0x9C99: 'kuài',
-    0x9C9A: 'jì',
-    0x9C9B: 'jiāo',
-    0x9C9C: 'xiān,xiǎn',
-    0x9C9D: 'zhǎ',
-    0x9C9E: 'xiǎng',
-    0x9C9F: 'xún',
-    0x9CA0: 'gěng',
-    0x9CA1: 'lí',
-    0x9CA2: 'lián',
-    0x9CA3: 'jiān',
-    0x9CA4: 'lǐ',
-    0x9CA5: 'shí',
-    0x9CA6: 'tiáo',
-    0x9CA7: 'gǔn',
-    0x9CA8: 'shā',
-    0x9CA9: 'huàn',
-    0x9CAA: 'jūn',
-    0x9CAB: 'jì',
-    0x9CAC: 'yǒng',
-    0x9CAD: 'qīng,zhēng',
-    0x9CAE: 'líng',
-    0x9CAF: 'qí',
-    0x9CB0: 'zōu',
-    0x9CB1: 'fēi',
-    0x9CB2: 'kūn',
-    0x9CB3: 'chāng',
-    0x9CB4: 'gù',
-    0x9CB5: 'ní',
-    0x9CB6: 'nián',
-    0x9CB7: 'diāo',
-    0x9CB8: 'jīng',
-    0x9CB9: 'shēn',
-    0x9CBA: 'shī',
-    0x9CBB: 'zī',
-    0x9CBC: 'fèn',
-    0x9CBD: 'dié',
-    0x9CBE: 'bī',
-    0x9CBF: 'cháng',
-    0x9CC0: 'tí',
-    0x9CC1: 'wēn',
-    0x9CC2: 'wēi',
-    0x9CC3: 'sāi',
-    0x9CC4: 'è',
-    0x9CC5: 'qiū',
-    0x9CC6: 'fù',
-    0x9CC7: 'huáng',
-    0x9CC8: 'quán',
-    0x9CC9: 'jiāng',
-    0x9CCA: 'biān',
-    0x9CCB: 'sāo',
-    0x9CCC: 'áo',
-    0x9CCD: 'qí',
-    0x9CCE: 'tǎ',
-    0x9CCF: 'guān',
-    0x9CD0: 'yáo',
-    0x9CD1: 'páng',
-    0x9CD2: 'jiān',
-    0x9CD3: 'lè',
-    0x9CD4: 'biào',
-    0x9CD5: 'xuě',
-    0x9CD6: 'biē',
-    0x9CD7: 'mán',
-    0x9CD8: 'mǐn',
-    0x9CD9: 'yōng',
-    0x9CDA: 'wèi',
-    0x9CDB: 'xí',
-    0x9CDC: 'guì',
-    0x9CDD: 'shàn',
-    0x9CDE: 'lín',
-    0x9CDF: 'zūn',
-    0x9CE0: 'hù',
-    0x9CE1: 'gǎn',
-    0x9CE2: 'lǐ',
-    0x9CE3: 'zhān',
-    0x9CE4: 'guǎn',
-    0x9CE5: 'niǎo,diǎo,dǎo,què',
-    0x9CE6: 'yǐ',
-    0x9CE7: 'fú',
-    0x9CE8: 'lì',
-    0x9CE9: 'jiū,qiú,zhì',
-    0x9CEA: 'bú',
-    0x9CEB: 'yàn',
-    0x9CEC: 'fǔ',
-    0x9CED: 'diāo,zhāo',
-    0x9CEE: 'jī',
-    0x9CEF: 'fèng',
-    0x9CF0: 'rù',
-    0x9CF1: 'gān,hàn,yàn',
-    0x9CF2: 'shī',
-    0x9CF3: 'fèng',
-    0x9CF4: 'míng',
-    0x9CF5: 'bǎo',
-    0x9CF6: 'yuān',
-    0x9CF7: 'zhī,chì',
-    0x9CF8: 'hù',
-    0x9CF9: 'qín',
-    0x9CFA: 'fū,guī',
-    0x9CFB: 'bān,fén',
-    0x9CFC: 'wén',
-    0x9CFD: 'jiān,qiān,zhān',
-    0x9CFE: 'shī',
-    0x9CFF: 'yù',
-    0x9D00: 'fǒu',
-    0x9D01: 'yāo,ǎo',
-    0x9D02: 'jué,guī',
-    0x9D03: 'jué',
-    0x9D04: 'pǐ',
-    0x9D05: 'huān',
-    0x9D06: 'zhèn',
-    0x9D07: 'bǎo',
-    0x9D08: 'yàn',
-    0x9D09: 'yā,yǎ',
-    0x9D0A: 'zhèng',
-    0x9D0B: 'fāng,fǎng',
-    0x9D0C: 'fèng',
-    0x9D0D: 'wén',
-    0x9D0E: 'ōu',
-    0x9D0F: 'dài',
-    0x9D10: 'gē',
-    0x9D11: 'rú',
-    0x9D12: 'líng',
-    0x9D13: 'miè,bì',
-    0x9D14: 'fú',
-    0x9D15: 'tuó',
-    0x9D16: 'mín,wén',
-    0x9D17: 'lì',
-    0x9D18: 'biǎn',
-    0x9D19: 'zhì',
-    0x9D1A: 'gē',
-    0x9D1B: 'yuān',
-    0x9D1C: 'cí',
-    0x9D1D: 'qú,gōu,gòu',
-    0x9D1E: 'xiāo',
-    0x9D1F: 'chī',
-    0x9D20: 'dàn',
-    0x9D21: 'jū',
-    0x9D22: 'yǎo,āo',
-    0x9D23: 'gū',
-    0x9D24: 'zhōng',
-    0x9D25: 'yù',
-    0x9D26: 'yāng',
-    0x9D27: 'yù',
-    0x9D28: 'yā',
-    0x9D29: 'tiě,hú',
-    0x9D2A: 'yù',
-    0x9D2B: 'tián',
-    0x9D2C: 'yīng',
-    0x9D2D: 'duī',
-    0x9D2E: 'wū',
-    0x9D2F: 'ér',
-    0x9D30: 'guā',
-    0x9D31: 'ài',
-    0x9D32: 'zhī',
-    0x9D33: 'yàn,ān,è',
-    0x9D34: 'héng',
-    0x9D35: 'xiāo',
-    0x9D36: 'jiá',
-    0x9D37: 'liè',
-    0x9D38: 'zhū',
-    0x9D39: 'yáng,xiáng',
-    0x9D3A: 'tí,yí',
-    0x9D3B: 'hóng,hòng',
-    0x9D3C: 'luò',
-    0x9D3D: 'rú',
-    0x9D3E: 'móu',
-    0x9D3F: 'gē',
-    0x9D40: 'rén',
-    0x9D41: 'jiāo,xiāo',
-    0x9D42: 'xiū',
-    0x9D43: 'zhōu,diǎo',
-    0x9D44: 'chī',
-    0x9D45: 'luò,gé',
-    0x9D46: 'héng',
-    0x9D47: 'nián',
-    0x9D48: 'ě',
-    0x9D49: 'luán',
-    0x9D4A: 'jiá',
-    0x9D4B: 'jì',
-    0x9D4C: 'tú',
-    0x9D4D: 'huān,juān,guàn',
-    0x9D4E: 'tuǒ',
-    0x9D4F: 'bǔ,bū,pū,pú',
-    0x9D50: 'wú',
-    0x9D51: 'juān',
-    0x9D52: 'yù',
-    0x9D53: 'bó',
-    0x9D54: 'jùn',
-    0x9D55: 'jùn',
-    0x9D56: 'bī',
-    0x9D57: 'xī',
-    0x9D58: 'jùn',
-    0x9D59: 'jú',
-    0x9D5A: 'tū',
-    0x9D5B: 'jīng',
-    0x9D5C: 'tí,tī',
-    0x9D5D: 'é',
-    0x9D5E: 'é',
-    0x9D5F: 'kuáng',
-    0x9D60: 'hú,gǔ,hè',
-    0x9D61: 'wǔ',
-    0x9D62: 'shēn',
-    0x9D63: 'lài,chì',
-    0x9D64: 'jiao',
-    0x9D65: 'pàn',
-    0x9D66: 'lù',
-    0x9D67: 'pí',
-    0x9D68: 'shū',
-    0x9D69: 'fú',
-    0x9D6A: 'ān,yā',
-    0x9D6B: 'zhuó',
-    0x9D6C: 'péng,fèng',
-    0x9D6D: 'qín',
-    0x9D6E: 'qiān',
-    0x9D6F: 'bēi',
-    0x9D70: 'diāo',
-    0x9D71: 'lù',
-    0x9D72: 'què',
-    0x9D73: 'jiān',
-    0x9D74: 'jú',
-    0x9D75: 'tù',
-    0x9D76: 'yā',
-    0x9D77: 'yuān',
-    0x9D78: 'qí',
-    0x9D79: 'lí',
-    0x9D7A: 'yè',
-    0x9D7B: 'zhuī',
-    0x9D7C: 'kōng',
-    0x9D7D: 'duò',
-    0x9D7E: 'kūn',
-    0x9D7F: 'shēng',
-    0x9D80: 'qí',
-    0x9D81: 'jīng',
-    0x9D82: 'yì',
-    0x9D83: 'yì',
-    0x9D84: 'jīng,qīng',
-    0x9D85: 'zī',
-    0x9D86: 'lái',
-    0x9D87: 'dōng',
-    0x9D88: 'qī',
-    0x9D89: 'chún,tuán',
-    0x9D8A: 'gēng',
-    0x9D8B: 'jū',
-    0x9D8C: 'jué,qū',
-    0x9D8D: 'yì',
-    0x9D8E: 'zūn',
-    0x9D8F: 'jī',
-    0x9D90: 'shù',
-    0x9D91: 'yīng',
-    0x9D92: 'chì',
-    0x9D93: 'miáo',
-    0x9D94: 'róu',
-    0x9D95: 'ān',
-    0x9D96: 'qiū',
-    0x9D97: 'tí,chí',
-    0x9D98: 'hú',
-    0x9D99: 'tí',
-    0x9D9A: 'è',
-    0x9D9B: 'jiē,jiè',
-    0x9D9C: 'máo',
-    0x9D9D: 'fú,bì',
-    0x9D9E: 'chūn',
-    0x9D9F: 'tú',
-    0x9DA0: 'yǎn',
-    0x9DA1: 'hé,hè',
-    0x9DA2: 'yuán',
-    0x9DA3: 'piān,biǎn',
-    0x9DA4: 'kūn',
-    0x9DA5: 'méi',
-    0x9DA6: 'hú',
-    0x9DA7: 'yīng',
-    0x9DA8: 'chuàn,zhì',
-    0x9DA9: 'wù,mù',
-    0x9DAA: 'jú',
-    0x9DAB: 'dōng',
-    0x9DAC: 'cāng,qiāng',
-    0x9DAD: 'fǎng',
-    0x9DAE: 'hè,hú',
-    0x9DAF: 'yīng',
-    0x9DB0: 'yuán',
-    0x9DB1: 'xiān',
-    0x9DB2: 'wēng',
-    0x9DB3: 'shī',
-    0x9DB4: 'hè',
-    0x9DB5: 'chú',
-    0x9DB6: 'táng',
-    0x9DB7: 'xiá',
-    0x9DB8: 'ruò',
-    0x9DB9: 'liú',
-    0x9DBA: 'jí',
-    0x9DBB: 'gú,hú',
-    0x9DBC: 'jiān,qiān',
-    0x9DBD: 'sǔn,xùn',
-    0x9DBE: 'hàn',
-    0x9DBF: 'cí',
-    0x9DC0: 'cí',
-    0x9DC1: 'yì',
-    0x9DC2: 'yào,yáo',
-    0x9DC3: 'yàn',
-    0x9DC4: 'jī',
-    0x9DC5: 'lì',
-    0x9DC6: 'tián',
-    0x9DC7: 'kòu',
-    0x9DC8: 'tī',
-    0x9DC9: 'tī,sī',
-    0x9DCA: 'yì',
-    0x9DCB: 'tú',
-    0x9DCC: 'mǎ',
-    0x9DCD: 'xiāo',
-    0x9DCE: 'gāo',
-    0x9DCF: 'tián',
-    0x9DD0: 'chén',
-    0x9DD1: 'jí',
-    0x9DD2: 'tuán',
-    0x9DD3: 'zhè',
-    0x9DD4: 'áo,ào',
-    0x9DD5: 'yǎo,xiào',
-    0x9DD6: 'yī,yì',
-    0x9DD7: 'ōu',
-    0x9DD8: 'chì',
-    0x9DD9: 'zhì,zhé',
-    0x9DDA: 'liù',
-    0x9DDB: 'yōng',
-    0x9DDC: 'lǘ,lǚ',
-    0x9DDD: 'bì',
-    0x9DDE: 'shuāng,shuǎng',
-    0x9DDF: 'zhuó',
-    0x9DE0: 'yú',
-    0x9DE1: 'wú',
-    0x9DE2: 'jué',
-    0x9DE3: 'yín',
-    0x9DE4: 'tí,tán',
-    0x9DE5: 'sī',
-    0x9DE6: 'jiāo',
-    0x9DE7: 'yì',
-    0x9DE8: 'huá',
-    0x9DE9: 'bì',
-    0x9DEA: 'yīng',
-    0x9DEB: 'sù',
-    0x9DEC: 'huáng',
-    0x9DED: 'fán',
-    0x9DEE: 'jiāo',
-    0x9DEF: 'liáo',
-    0x9DF0: 'yàn',
-    0x9DF1: 'gāo',
-    0x9DF2: 'jiù',
-    0x9DF3: 'xián',
-    0x9DF4: 'xián',
-    0x9DF5: 'tú',
-    0x9DF6: 'mǎi',
-    0x9DF7: 'zūn',
-    0x9DF8: 'yù,shù',
-    0x9DF9: 'yīng',
-    0x9DFA: 'lù',
-    0x9DFB: 'tuán',
-    0x9DFC: 'xián',
-    0x9DFD: 'xué',
-    0x9DFE: 'yì',
-    0x9DFF: 'pì',
-    0x9E00: 'chǔ,zhú,chù',
-    0x9E01: 'luó',
-    0x9E02: 'xī,qī',
-    0x9E03: 'yí',
-    0x9E04: 'jī',
-    0x9E05: 'zé',
-    0x9E06: 'yú',
-    0x9E07: 'zhān',
-    0x9E08: 'yè',
-    0x9E09: 'yáng',
-    0x9E0A: 'pì,bì',
-    0x9E0B: 'níng',
-    0x9E0C: 'hù',
-    0x9E0D: 'mí',
-    0x9E0E: 'yīng',
-    0x9E0F: 'méng,máng',
-    0x9E10: 'dí',
-    0x9E11: 'yuè',
-    0x9E12: 'yù',
-    0x9E13: 'lěi',
-    0x9E14: 'bǔ',
-    0x9E15: 'lú',
-    0x9E16: 'hè',
-    0x9E17: 'lóng',
-    0x9E18: 'shuāng',
-    0x9E19: 'yuè',
-    0x9E1A: 'yīng',
-    0x9E1B: 'guàn,huān,quán',
-    0x9E1C: 'qú',
-    0x9E1D: 'lí',
-    0x9E1E: 'luán',
-    0x9E1F: 'niǎo,diǎo',
-    0x9E20: 'jiū',
-    0x9E21: 'jī',
-    0x9E22: 'yuān',
-    0x9E23: 'míng',
-    0x9E24: 'shī',
-    0x9E25: 'ōu',
-    0x9E26: 'yā',
-    0x9E27: 'cāng',
-    0x9E28: 'bǎo',
-    0x9E29: 'zhèn',
-    0x9E2A: 'gū',
-    0x9E2B: 'dōng',
-    0x9E2C: 'lú',
-    0x9E2D: 'yā',
-    0x9E2E: 'xiāo',
-    0x9E2F: 'yāng',
-    0x9E30: 'líng',
-    0x9E31: 'chī',
-    0x9E32: 'qú',
-    0x9E33: 'yuān',
-    0x9E34: 'xué',
-    0x9E35: 'tuó',
-    0x9E36: 'sī',
-    0x9E37: 'zhì',
-    0x9E38: 'ér',
-    0x9E39: 'guā',
-    0x9E3A: 'xiū',
-    0x9E3B: 'héng',
-    0x9E3C: 'zhōu',
-    0x9E3D: 'gē',
-    0x9E3E: 'luán',
-    0x9E3F: 'hóng',
-    0x9E40: 'wú',
-    0x9E41: 'bó',
-    0x9E42: 'lí',
-    0x9E43: 'juān',
-    0x9E44: 'gǔ,hú',
-    0x9E45: 'é',
-    0x9E46: 'yù',
-    0x9E47: 'xián',
-    0x9E48: 'tí',
-    0x9E49: 'wǔ',
-    0x9E4A: 'què',
-    0x9E4B: 'miáo',
-    0x9E4C: 'ān',
-    0x9E4D: 'kūn',
-    0x9E4E: 'bēi',
-    0x9E4F: 'péng',
-    0x9E50: 'qiān',
-    0x9E51: 'chún',
-    0x9E52: 'gēng',
-    0x9E53: 'yuān',
-    0x9E54: 'sù',
-    0x9E55: 'hú',
-    0x9E56: 'hé',
-    0x9E57: 'è',
-    0x9E58: 'gǔ,hú',
-    0x9E59: 'qiū',
-    0x9E5A: 'cí',
-    0x9E5B: 'méi',
-    0x9E5C: 'wù',
-    0x9E5D: 'yì',
-    0x9E5E: 'yào',
-    0x9E5F: 'wēng',
-    0x9E60: 'liú',
-    0x9E61: 'jí',
-    0x9E62: 'yì',
-    0x9E63: 'jiān',
-    0x9E64: 'hè',
-    0x9E65: 'yī',
-    0x9E66: 'yīng',
-    0x9E67: 'zhè',
-    0x9E68: 'liù',
-    0x9E69: 'liáo',
-    0x9E6A: 'jiāo',
-    0x9E6B: 'jiù',
-    0x9E6C: 'yù',
-    0x9E6D: 'lù',
-    0x9E6E: 'huán',
-    0x9E6F: 'zhān',
-    0x9E70: 'yīng',
-    0x9E71: 'hù',
-    0x9E72: 'méng',
-    0x9E73: 'guàn',
-    0x9E74: 'shuāng',
-    0x9E75: 'lǔ,lú',
-    0x9E76: 'jīn',
-    0x9E77: 'líng',
-    0x9E78: 'jiǎn',
-    0x9E79: 'xián,jiǎn',
-    0x9E7A: 'cuó',
-    0x9E7B: 'jiǎn',
-    0x9E7C: 'jiǎn',
-    0x9E7D: 'yán,yàn',
-    0x9E7E: 'cuó',
-    0x9E7F: 'lù,lǘ',
-    0x9E80: 'yōu',
-    0x9E81: 'cū',
-    0x9E82: 'jǐ',
-    0x9E83: 'páo,biāo,piǎo',
-    0x9E84: 'cū',
-    0x9E85: 'páo',
-    0x9E86: 'zhù,cū',
-    0x9E87: 'jūn,qún',
-    0x9E88: 'zhǔ',
-    0x9E89: 'jiān',
-    0x9E8A: 'mí',
-    0x9E8B: 'mí',
-    0x9E8C: 'yǔ',
-    0x9E8D: 'liú',
-    0x9E8E: 'chén',
-    0x9E8F: 'jūn',
-    0x9E90: 'lín',
-    0x9E91: 'ní',
-    0x9E92: 'qí',
-    0x9E93: 'lù',
-    0x9E94: 'jiù',
-    0x9E95: 'jūn,qún',
-    0x9E96: 'jīng',
-    0x9E97: 'lì,lí,lǐ,sī',
-    0x9E98: 'xiāng',
-    0x9E99: 'xián,yán',
-    0x9E9A: 'jiā',
-    0x9E9B: 'mí',
-    0x9E9C: 'lì',
-    0x9E9D: 'shè',
-    0x9E9E: 'zhāng',
-    0x9E9F: 'lín',
-    0x9EA0: 'jīng',
-    0x9EA1: 'qí',
-    0x9EA2: 'líng',
-    0x9EA3: 'yán',
-    0x9EA4: 'cū',
-    0x9EA5: 'mài',
-    0x9EA6: 'mài',
-    0x9EA7: 'hé',
-    0x9EA8: 'chǎo',
-    0x9EA9: 'fū',
-    0x9EAA: 'miàn',
-    0x9EAB: 'miàn',
-    0x9EAC: 'fū',
-    0x9EAD: 'pào',
-    0x9EAE: 'qù',
-    0x9EAF: 'qū',
-    0x9EB0: 'móu',
-    0x9EB1: 'fū',
-    0x9EB2: 'xiàn,yàn',
-    0x9EB3: 'lái',
-    0x9EB4: 'qū',
-    0x9EB5: 'miàn',
-    0x9EB6: 'chi',
-    0x9EB7: 'fēng',
-    0x9EB8: 'fū',
-    0x9EB9: 'qū',
-    0x9EBA: 'miàn',
-    0x9EBB: 'má,mā',
-    0x9EBC: 'me',
-    0x9EBD: 'mó,má,ma,me',
-    0x9EBE: 'huī',
-    0x9EBF: 'mí',
-    0x9EC0: 'zōu',
-    0x9EC1: 'nún',
-    0x9EC2: 'fén',
-    0x9EC3: 'huáng',
-    0x9EC4: 'huáng',
-    0x9EC5: 'jīn',
-    0x9EC6: 'guāng',
-    0x9EC7: 'tiān',
-    0x9EC8: 'tǒu',
-    0x9EC9: 'hóng',
-    0x9ECA: 'huà',
-    0x9ECB: 'kuàng',
-    0x9ECC: 'hóng',
-    0x9ECD: 'shǔ',
-    0x9ECE: 'lí',
-    0x9ECF: 'nián',
-    0x9ED0: 'chī,lí',
-    0x9ED1: 'hēi',
-    0x9ED2: 'hēi',
-    0x9ED3: 'yì',
-    0x9ED4: 'qián',
-    0x9ED5: 'dǎn',
-    0x9ED6: 'xì',
-    0x9ED7: 'tūn',
-    0x9ED8: 'mò',
-    0x9ED9: 'mò',
-    0x9EDA: 'qián,jiān',
-    0x9EDB: 'dài',
-    0x9EDC: 'chù',
-    0x9EDD: 'yǒu,yī',
-    0x9EDE: 'diǎn,zhān,duò',
-    0x9EDF: 'yī',
-    0x9EE0: 'xiá',
-    0x9EE1: 'yǎn',
-    0x9EE2: 'qū',
-    0x9EE3: 'měi',
-    0x9EE4: 'yǎn',
-    0x9EE5: 'qíng',
-    0x9EE6: 'yuè,yè',
-    0x9EE7: 'lí,lái',
-    0x9EE8: 'dǎng,tǎng,chèng',
-    0x9EE9: 'dú',
-    0x9EEA: 'cǎn',
-    0x9EEB: 'yān',
-    0x9EEC: 'yán,yǎn,jiān',
-    0x9EED: 'yǎn',
-    0x9EEE: 'dǎn,tàn,zhèn,shèn',
-    0x9EEF: 'àn,ān',
-    0x9EF0: 'zhěn,yān',
-    0x9EF1: 'dài,zhèn',
-    0x9EF2: 'cǎn',
-    0x9EF3: 'yī,wā',
-    0x9EF4: 'méi,mèi',
-    0x9EF5: 'zhǎn,dǎn',
-    0x9EF6: 'yǎn',
-    0x9EF7: 'dú',
-    0x9EF8: 'lú',
-    0x9EF9: 'zhǐ,xiàn',
-    0x9EFA: 'fěn',
-    0x9EFB: 'fú',
-    0x9EFC: 'fǔ',
-    0x9EFD: 'miǎn,měng,mǐn,méng',
-    0x9EFE: 'mǐn,miǎn,měng',
-    0x9EFF: 'yuán',
-    0x9F00: 'cù',
-    0x9F01: 'qù',
-    0x9F02: 'cháo,zhāo',
-    0x9F03: 'wā',
-    0x9F04: 'zhū',
-    0x9F05: 'zhī',
-    0x9F06: 'méng,měng',
-    0x9F07: 'áo',
-    0x9F08: 'biē',
-    0x9F09: 'tuó',
-    0x9F0A: 'bì',
-    0x9F0B: 'yuán',
-    0x9F0C: 'cháo',
-    0x9F0D: 'tuó',
-    0x9F0E: 'dǐng,zhēn',
-    0x9F0F: 'mì',
-    0x9F10: 'nài',
-    0x9F11: 'dǐng',
-    0x9F12: 'zī',
-    0x9F13: 'gǔ',
-    0x9F14: 'gǔ',
-    0x9F15: 'dōng,tóng',
-    0x9F16: 'fén',
-    0x9F17: 'táo',
-    0x9F18: 'yuān',
-    0x9F19: 'pí',
-    0x9F1A: 'chāng',
-    0x9F1B: 'gāo',
-    0x9F1C: 'qì,cào',
-    0x9F1D: 'yuān',
-    0x9F1E: 'tāng',
-    0x9F1F: 'tēng',
-    0x9F20: 'shǔ',
-    0x9F21: 'shǔ',
-    0x9F22: 'fén',
-    0x9F23: 'fèi',
-    0x9F24: 'wén,wèn',
-    0x9F25: 'bá,fèi',
-    0x9F26: 'diāo',
-    0x9F27: 'tuó',
-    0x9F28: 'zhōng',
-    0x9F29: 'qú',
-    0x9F2A: 'shēng',
-    0x9F2B: 'shí',
-    0x9F2C: 'yòu',
-    0x9F2D: 'shí',
-    0x9F2E: 'tíng',
-    0x9F2F: 'wú',
-    0x9F30: 'jú',
-    0x9F31: 'jīng',
-    0x9F32: 'hún',
-    0x9F33: 'jú,xí',
-    0x9F34: 'yǎn',
-    0x9F35: 'tū',
-    0x9F36: 'sī',
-    0x9F37: 'xī',
-    0x9F38: 'xiàn',
-    0x9F39: 'yǎn',
-    0x9F3A: 'léi',
-    0x9F3B: 'bí',
-    0x9F3C: 'yào',
-    0x9F3D: 'qiú',
-    0x9F3E: 'hān',
-    0x9F3F: 'wù,huī',
-    0x9F40: 'wù',
-    0x9F41: 'hōu,kù',
-    0x9F42: 'xiè',
-    0x9F43: 'è,hè',
-    0x9F44: 'zhā',
-    0x9F45: 'xiù',
-    0x9F46: 'wèng',
-    0x9F47: 'zhā',
-    0x9F48: 'nòng',
-    0x9F49: 'nàng',
-    0x9F4A: 'qí,jī,jì,zī,zhāi,jiǎn',
-    0x9F4B: 'zhāi',
-    0x9F4C: 'jì',
-    0x9F4D: 'zī,jì',
-    0x9F4E: 'jī',
-    0x9F4F: 'jī',
-    0x9F50: 'qí,jì',
-    0x9F51: 'jī',
-    0x9F52: 'chǐ',
-    0x9F53: 'chèn',
-    0x9F54: 'chèn',
-    0x9F55: 'hé',
-    0x9F56: 'yá,yà',
-    0x9F57: 'yín,yǐn,yǎn',
-    0x9F58: 'xiè',
-    0x9F59: 'bāo',
-    0x9F5A: 'zé',
-    0x9F5B: 'xiè,shì',
-    0x9F5C: 'chái,zī',
-    0x9F5D: 'chī',
-    0x9F5E: 'yǎn',
-    0x9F5F: 'jǔ,zhā',
-    0x9F60: 'tiáo',
-    0x9F61: 'líng',
-    0x9F62: 'líng',
-    0x9F63: 'chū,chǐ',
-    0x9F64: 'quán',
-    0x9F65: 'xiè',
-    0x9F66: 'kěn,qiǎn,yín,kǔn',
-    0x9F67: 'niè',
-    0x9F68: 'jiù',
-    0x9F69: 'yǎo',
-    0x9F6A: 'chuò',
-    0x9F6B: 'yǔn',
-    0x9F6C: 'yǔ,wú',
-    0x9F6D: 'chǔ',
-    0x9F6E: 'yǐ,qǐ',
-    0x9F6F: 'ní',
-    0x9F70: 'zé,cè,zhà',
-    0x9F71: 'zōu,chuò',
-    0x9F72: 'qǔ',
-    0x9F73: 'yǔn',
-    0x9F74: 'yǎn',
-    0x9F75: 'óu,yú',
-    0x9F76: 'è',
-    0x9F77: 'wò',
-    0x9F78: 'yì',
-    0x9F79: 'cī,cuó',
-    0x9F7A: 'zōu',
-    0x9F7B: 'diān',
-    0x9F7C: 'chǔ',
-    0x9F7D: 'jìn',
-    0x9F7E: 'yà,è',
-    0x9F7F: 'chǐ',
-    0x9F80: 'chèn',
-    0x9F81: 'hé',
-    0x9F82: 'yín',
-    0x9F83: 'jǔ',
-    0x9F84: 'líng',
-    0x9F85: 'bāo',
-    0x9F86: 'tiáo',
-    0x9F87: 'zī',
-    0x9F88: 'kěn,yín',
-    0x9F89: 'yǔ',
-    0x9F8A: 'chuò',
-    0x9F8B: 'qǔ',
-    0x9F8C: 'wò',
-    0x9F8D: 'lóng,máng',
-    0x9F8E: 'páng',
-    0x9F8F: 'gōng,wò',
-    0x9F90: 'páng,lóng',
-    0x9F91: 'yǎn',
-    0x9F92: 'lóng',
-    0x9F93: 'lǒng,lóng',
-    0x9F94: 'gōng',
-    0x9F95: 'kān,kè',
-    0x9F96: 'dá',
-    0x9F97: 'líng',
-    0x9F98: 'dá',
-    0x9F99: 'lóng',
-    0x9F9A: 'gōng',
-    0x9F9B: 'kān',
-    0x9F9C: 'guī,qiū,jūn',
-    0x9F9D: 'qiū',
-    0x9F9E: 'biē',
-    0x9F9F: 'guī,jūn,qiū',
-    0x9FA0: 'yuè',
-    0x9FA1: 'chuī',
-    0x9FA2: 'hé',
-    0x9FA3: 'jué',
-    0x9FA4: 'xié',
-    0x9FA5: 'yù',
-    0x9FC3: 'shǎn',
-    0x9FCD: 'gàng',
-    0x9FCE: 'tǎ,dá',
-    0x9FCF: 'mài',
-    0x9FD4: 'gē',
-    0x9FD5: 'dān',
-    0x9FEB: 'ào',
-    0x9FEC: 'tián',
-    0x9FED: 'nǐ',
-    0xE815: 'yè',
-    0xE816: 'zuǒ,yǒu',
-    0xE818: 'gǔn',
-    0xE81A: 'zhòu,zhū',
-    0xE81B: 'zhòu,zhū',
-    0xE81D: 'jié,jiē',
-    0xE81F: 'wāi',
-    0xE820: 'hǎn',
-    0xE821: 'hǎn',
-    0xE824: 'zhòu',
-    0xE825: 'zhòu',
-    0xE826: 'shǒu',
-    0xE827: 'gāng',
-    0xE828: 'kuǎi',
-    0xE829: 'sǒng',
-    0xE82A: 'sǒng',
-    0xE82B: 'fēng',
-    0xE82C: 'gòng',
-    0xE82D: 'gāng',
-    0xE82E: 'huì,kuì',
-    0xE82F: 'tà',
-    0xE830: 'jiān',
-    0xE831: 'ēn',
-    0xE832: 'xiǎo',
-    0xE834: 'lóu,lǘ',
-    0xE835: 'cǎn,shān,cēn',
-    0xE836: 'zhú',
-    0xE837: 'chōu,chóu',
-    0xE838: 'wǎng',
-    0xE83A: 'yáng,xiáng',
-    0xE83B: 'zāi',
-    0xE83C: 'bà,bēi',
-    0xE83D: 'bà,bēi',
-    0xE83F: 'zhuān,zhuán,chuǎn,chún',
-    0xE840: 'qióng',
-    0xE841: 'kuì,huì',
-    0xE842: 'kuì,huì',
-    0xE843: 'juǎn',
-    0xE844: 'xīn',
-    0xE845: 'yàn',
-    0xE846: 'qíng',
-    0xE847: 'qíng',
-    0xE849: 'shàn',
-    0xE84A: 'yé,yá',
-    0xE84B: 'pō',
-    0xE84C: 'shàn',
-    0xE84D: 'zhuō',
-    0xE84E: 'shàn',
-    0xE84F: 'jué',
-    0xE850: 'chuài',
-    0xE851: 'zhèng',
-    0xE852: 'chuài',
-    0xE853: 'zhèng',
-    0xE854: 'zhuó',
-    0xE855: 'yíng',
-    0xE856: 'yú',
-    0xE857: 'yìn',
-    0xE858: 'chūn',
-    0xE859: 'qiū',
-    0xE85A: 'yú',
-    0xE85B: 'téng',
-    0xE85C: 'shī',
-    0xE85D: 'jiāo',
-    0xE85E: 'liè',
-    0xE85F: 'jīng',
-    0xE860: 'jú',
-    0xE861: 'tī',
-    0xE862: 'pì',
-    0xE863: 'yǎn',
-    0xE864: 'luán',
-    0x20000: 'hē',
-    0x20001: 'qī',
-    0x20003: 'qiě,jī',
-    0x20005: 'hài',
-    0x20009: 'qiū',
-    0x2000A: 'cāo',
-    0x2000D: 'shì',
-    0x20013: 'sī',
-    0x20014: 'jué',
-    0x2001B: 'yù',
-    0x2001D: 'kōng',
-    0x20022: 'zī',
-    0x20026: 'xíng',
-    0x20031: 'mǒu',
-    0x20037: 'jī',
-    0x20038: 'yè',
-    0x20039: 'jūn',
-    0x2003C: 'qián,xià',
-    0x2003D: 'lù',
-    0x20049: 'chū',
-    0x20057: 'shì,hè',
-    0x20060: 'qiè',
-    0x20065: 'gǎ',
-    0x2006D: 'qí',
-    0x20077: 'chǎn',
-    0x20084: 'huān',
-    0x20086: 'yì',
-    0x20087: 'zuǒ',
-    0x20088: 'jié,tiǎn',
-    0x20091: 'zōu',
-    0x20094: 'zǐ',
-    0x2009F: 'jīn',
-    0x200A2: 'pài',
-    0x200A4: 'duī',
-    0x200A5: 'cóng',
-    0x200A7: 'shèn',
-    0x200B8: 'huáng',
-    0x200CA: 'yǐn',
-    0x200CC: 'gǔn',
-    0x200D6: 'jiū',
-    0x200EB: 'shēn',
-    0x200FA: 'jiù',
-    0x20105: 'yè',
-    0x20109: 'dòng',
-    0x2010C: 'jué,zhuì',
-    0x2010D: 'jié',
-    0x2010F: 'diǎo',
-    0x20111: 'jué',
-    0x20112: 'chuí,shā',
-    0x20116: 'líng',
-    0x2011A: 'tīng',
-    0x20123: 'gèn',
-    0x2012E: 'yà,mǒ',
-    0x20131: 'yí',
-    0x2013F: 'wéi',
-    0x20142: 'jié',
-    0x2014C: 'yí',
-    0x20157: 'diè',
-    0x2015A: 'qí',
-    0x20164: 'xí',
-    0x2016C: 'bāo',
-    0x20171: 'xiè',
-    0x20179: 'zhàng',
-    0x2018C: 'yōng',
-    0x20190: 'xù',
-    0x20199: 'diè',
-    0x2019B: 'dān',
-    0x2019F: 'wěi',
-    0x201A3: 'guǎ,zhuǎ',
-    0x201A9: 'fàn',
-    0x201AE: 'mò',
-    0x201B1: 'xī',
-    0x201B2: 'yǎn',
-    0x201B5: 'ní',
-    0x201B6: 'dàn',
-    0x201CB: 'dǎn',
-    0x201CF: 'tāo',
-    0x201D2: 'gōng',
-    0x201D7: 'kuā',
-    0x201D8: 'chù',
-    0x201EF: 'qù',
-    0x201F1: 'mò',
-    0x201F3: 'shī',
-    0x201F5: 'gǎn',
-    0x201F7: 'shēng',
-    0x20201: 'tuō',
-    0x20205: 'shōu',
-    0x2020A: 'niě',
-    0x20224: 'yùn',
-    0x20225: 'guǎ',
-    0x2022C: 'xiāo',
-    0x2022D: 'láo',
-    0x20230: 'dàn',
-    0x20231: 'suō',
-    0x20235: 'mǎng',
-    0x20236: 'yí',
-    0x20238: 'tè',
-    0x2023A: 'bì',
-    0x20242: 'tà',
-    0x20257: 'luò',
-    0x20262: 'xǐ',
-    0x20263: 'hūn,hùn',
-    0x20264: 'dá',
-    0x20267: 'jù',
-    0x20269: 'dú',
-    0x2026C: 'ǎn,yǎn',
-    0x20289: 'mèi',
-    0x2028C: 'rán',
-    0x2028E: 'ái',
-    0x2028F: 'yù,xián',
-    0x20292: 'jiàn',
-    0x20294: 'qì',
-    0x2029F: 'mǐn',
-    0x202A3: 'zhòu',
-    0x202A4: 'zhì',
-    0x202A5: 'zhǒng',
-    0x202A6: 'nǎo',
-    0x202A7: 'bìng',
-    0x202A9: 'zhuàn',
-    0x202AA: 'shù',
-    0x202AB: 'xùn,qióng',
-    0x202AC: 'jué',
-    0x202AD: 'qiǎn',
-    0x202B0: 'guǎ',
-    0x202B2: 'tū',
-    0x202B6: 'yìng',
-    0x202B7: 'zhì',
-    0x202BE: 'kuí',
-    0x202C6: 'chèn',
-    0x202D6: 'liàn',
-    0x202D7: 'yā',
-    0x202DC: 'guò',
-    0x202DD: 'miǎo',
-    0x202DE: 'shé',
-    0x202DF: 'yǔ',
-    0x202E1: 'sì',
-    0x202E2: 'sǒu,zhòu',
-    0x202E4: 'zhì',
-    0x202E7: 'qiē',
-    0x202E9: 'fù',
-    0x202EC: 'jú',
-    0x202ED: 'bèi',
-    0x202EF: 'bì',
-    0x202F2: 'suǒ',
-    0x202F5: 'qiǎn',
-    0x202F6: 'mǐng',
-    0x202F7: 'chǎn',
-    0x202FA: 'sāo',
-    0x202FB: 'jī',
-    0x20315: 'gòng',
-    0x20316: 'qióng',
-    0x2031A: 'nòng,ròng',
-    0x2031E: 'sǒu',
-    0x2031F: 'sǒu',
-    0x20320: 'yáo',
-    0x2032A: 'chōu,tāo',
-    0x2032D: 'shuài',
-    0x2032E: 'zhē',
-    0x2032F: 'lì,lí',
-    0x20330: 'gài',
-    0x20331: 'suī',
-    0x20332: 'zhān',
-    0x20334: 'zhuàng',
-    0x2033D: 'fù',
-    0x20343: 'jī',
-    0x20344: 'dōu',
-    0x20357: 'huì',
-    0x2035A: 'jiǎn',
-    0x2035B: 'yǎn',
-    0x2035C: 'zhì',
-    0x20368: 'měi',
-    0x20369: 'yào',
-    0x2036A: 'dī',
-    0x2036B: 'yí',
-    0x2036F: 'bié',
-    0x20372: 'qú',
-    0x20373: 'yì',
-    0x20375: 'yàng',
-    0x20379: 'zhá',
-    0x2037D: 'shà',
-    0x20399: 'lái',
-    0x203AE: 'jué',
-    0x203B0: 'qī',
-    0x203B3: 'yú',
-    0x203B6: 'zǎi',
-    0x203B7: 'sà',
-    0x203B8: 'sè',
-    0x203BB: 'dùn',
-    0x203BF: 'jiě',
-    0x203C0: 'kē',
-    0x203C3: 'yuē',
-    0x203C7: 'jiǎn',
-    0x203C8: 'yáo',
-    0x203D3: 'xiān',
-    0x203D5: 'xiào',
-    0x203D6: 'qiāo',
-    0x203DA: 'yù',
-    0x203DB: 'qú',
-    0x203E1: 'xiān,líng',
-    0x203E2: 'luò',
-    0x203E4: 'guǎng',
-    0x203E7: 'chēng',
-    0x203E8: 'chuǎng',
-    0x203E9: 'yí',
-    0x203EB: 'zhěng',
-    0x203ED: 'zòng',
-    0x203EE: 'duì',
-    0x203F0: 'zhǎi',
-    0x203FF: 'fěi',
-    0x20400: 'yí',
-    0x20401: 'méng',
-    0x20408: 'biān,pián',
-    0x20409: 'jié',
-    0x2040A: 'shù',
-    0x2040B: 'liáo',
-    0x2040C: 'bǐ,bà',
-    0x2040D: 'sú',
-    0x20411: 'dì',
-    0x20421: 'bèi',
-    0x20422: 'wèn',
-    0x20427: 'méng',
-    0x20429: 'chǎn',
-    0x20435: 'dǎo',
-    0x2043A: 'pín',
-    0x2043B: 'jiǎn',
-    0x2043C: 'lìn',
-    0x2043D: 'guì,guī',
-    0x2043E: 'qī',
-    0x2043F: 'hōng',
-    0x20443: 'jí',
-    0x20444: 'xiè',
-    0x20445: 'zhēng',
-    0x20446: 'chǎn',
-    0x20450: 'yáo',
-    0x20451: 'chǎn',
-    0x20458: 'diān',
-    0x20459: 'chòng',
-    0x2045A: 'néi',
-    0x2045B: 'néi',
-    0x2045E: 'zhài',
-    0x2045F: 'biān,pián',
-    0x20461: 'chǎn',
-    0x2046A: 'xiāo',
-    0x2046F: 'cù',
-    0x20470: 'xīn',
-    0x20471: 'jǐng',
-    0x20472: 'qiān',
-    0x20474: 'qīng',
-    0x20479: 'gǔ',
-    0x20484: 'wù',
-    0x2049C: 'yuǎn',
-    0x2049D: 'bǐng',
-    0x204A2: 'wán',
-    0x204B0: 'niǎo,ní',
-    0x204B5: 'liàn',
-    0x204B8: 'rǎo',
-    0x204BE: 'fàn',
-    0x204BF: 'dí',
-    0x204CA: 'huī,dān',
-    0x204CB: 'yì',
-    0x204CC: 'xián',
-    0x204D6: 'lán',
-    0x204D7: 'fù',
-    0x204D9: 'xiòng',
-    0x204DC: 'liǎng',
-    0x204DD: 'tāo',
-    0x204DE: 'jí',
-    0x204E2: 'jiè',
-    0x204E3: 'zhá',
-    0x204E4: 'shī',
-    0x204EA: 'qí',
-    0x204EB: 'biǎn',
-    0x204ED: 'lǎn',
-    0x204EE: 'lǐn',
-    0x204F6: 'zhì',
-    0x204F7: 'bì,chéng',
-    0x204F8: 'shèng',
-    0x204FD: 'shèng',
-    0x204FF: 'qín',
-    0x20502: 'biāo',
-    0x20503: 'xī',
-    0x20509: 'juàn',
-    0x2050B: 'jī,xìn',
-    0x2050D: 'xī',
-    0x2050E: 'qǐn',
-    0x20511: 'hài',
-    0x20515: 'lún',
-    0x20520: 'yuè',
-    0x20528: 'lián',
-    0x2052F: 'bān',
-    0x20532: 'héng',
-    0x20536: 'qī',
-    0x2053A: 'qiān',
-    0x2053B: 'zhèng',
-    0x2053C: 'mǎo',
-    0x20541: 'cóng',
-    0x20544: 'nà',
-    0x2054A: 'tǐng',
-    0x2054C: 'zōng',
-    0x20555: 'jiōng',
-    0x20556: 'zhǎo',
-    0x2055F: 'niǎn',
-    0x20560: 'chéng',
-    0x20563: 'qià',
-    0x20566: 'yù',
-    0x20567: 'jiǎo',
-    0x2056D: 'zhào',
-    0x20573: 'dí',
-    0x20574: 'jiū',
-    0x20578: 'suǐ',
-    0x2057B: 'yāo',
-    0x2057F: 'wāng',
-    0x20582: 'liáo',
-    0x20584: 'tóng',
-    0x20586: 'mèng',
-    0x2058B: 'yǒu',
-    0x20593: 'sī',
-    0x2059B: 'lòu',
-    0x2059F: 'yīn',
-    0x205A5: 'chǒng',
-    0x205AB: 'gǎn',
-    0x205AC: 'jiū',
-    0x205B6: 'qìn',
-    0x205B7: 'jiǒng',
-    0x205B9: 'xié,xiá',
-    0x205C2: 'hè',
-    0x205C6: 'tāo',
-    0x205C8: 'qiú',
-    0x205C9: 'xié',
-    0x205CA: 'jìng',
-    0x205CB: 'niǎn',
-    0x205CC: 'jìng',
-    0x205CF: 'jí',
-    0x205D8: 'tiǎn',
-    0x205DA: 'cuì',
-    0x205DB: 'dié',
-    0x205DD: 'qǐng',
-    0x205E5: 'pìng',
-    0x205E6: 'píng',
-    0x205E8: 'dié',
-    0x205E9: 'lòu',
-    0x205F3: 'liǎn',
-    0x205F4: 'hán',
-    0x205F5: 'pāng',
-    0x205F6: 'táng',
-    0x205FA: 'yí',
-    0x205FB: 'xuán',
-    0x205FC: 'suò',
-    0x205FD: 'liú',
-    0x205FE: 'shuǎng',
-    0x205FF: 'shèn',
-    0x20601: 'bù',
-    0x20602: 'sōu',
-    0x20605: 'qín',
-    0x20606: 'shěn',
-    0x2060A: 'nòng',
-    0x2060B: 'tǐng',
-    0x2060C: 'jiāng',
-    0x20615: 'xī',
-    0x20616: 'zhì',
-    0x2061D: 'lài',
-    0x2061E: 'lì',
-    0x2061F: 'lì',
-    0x20622: 'hé',
-    0x20623: 'jiào',
-    0x20625: 'yán',
-    0x20627: 'shū',
-    0x2062A: 'shǐ',
-    0x20631: 'zhěn',
-    0x20633: 'yōu',
-    0x2063A: 'suò',
-    0x2063B: 'wú',
-    0x20641: 'cháng',
-    0x20642: 'cóng',
-    0x20646: 'jù',
-    0x2064E: 'shū',
-    0x20654: 'jiù',
-    0x20655: 'wéi',
-    0x2065E: 'huò',
-    0x20664: 'jiē',
-    0x2066C: 'zǎo',
-    0x20676: 'ǒu',
-    0x2067C: 'guǎ',
-    0x20683: 'háo',
-    0x20684: 'lǐ',
-    0x20685: 'zhì',
-    0x20686: 'xiàn',
-    0x20689: 'bū',
-    0x2068A: 'chàng',
-    0x20693: 'yūn',
-    0x20694: 'hé',
-    0x2069C: 'tāo',
-    0x206A0: 'biāo',
-    0x206A5: 'diāo',
-    0x206A7: 'èr',
-    0x206A8: 'jiū',
-    0x206AD: 'dì',
-    0x206AE: 'yì',
-    0x206AF: 'kūn',
-    0x206B1: 'zhé',
-    0x206B3: 'kuò',
-    0x206B4: 'zhōu',
-    0x206B5: 'jù',
-    0x206B9: 'shàn',
-    0x206BA: 'shà',
-    0x206BB: 'diāo',
-    0x206BC: 'bān',
-    0x206BD: 'jī',
-    0x206C0: 'zhōng',
-    0x206C3: 'yí',
-    0x206C5: 'kōu',
-    0x206C6: 'wū',
-    0x206CA: 'gē',
-    0x206CB: 'bā',
-    0x206CE: 'gōu',
-    0x206D1: 'xián',
-    0x206D2: 'guā',
-    0x206D3: 'liǔ',
-    0x206D4: 'chǐ',
-    0x206D5: 'guāi',
-    0x206D6: 'chuān',
-    0x206D8: 'lí',
-    0x206D9: 'cù',
-    0x206DA: 'shuā',
-    0x206E1: 'bǐ',
-    0x206E5: 'bǐng',
-    0x206E6: 'lì',
-    0x206E9: 'jiǔ',
-    0x206EA: 'tiāo,diāo',
-    0x206EB: 'duǒ',
-    0x206ED: 'yān,yuān',
-    0x206EE: 'quān',
-    0x206F1: 'liè,zā',
-    0x206F3: 'kè,hé',
-    0x206F5: 'gēn',
-    0x206F6: 'zhēn',
-    0x206F8: 'fén',
-    0x20701: 'yí',
-    0x20703: 'jiù',
-    0x20704: 'xù',
-    0x20705: 'jiǎo',
-    0x20708: 'lǜ',
-    0x20709: 'jiǔ',
-    0x2070B: 'chǒu',
-    0x2070E: 'xiàn',
-    0x20710: 'kuài',
-    0x20711: 'duì',
-    0x20716: 'luō',
-    0x20717: 'xī,xì',
-    0x20718: 'qìn',
-    0x20719: 'bù',
-    0x20724: 'qià',
-    0x20731: 'pī',
-    0x20732: 'yā',
-    0x20733: 'bēng',
-    0x20734: 'guǒ',
-    0x20735: 'guā',
-    0x20739: 'jú',
-    0x2073C: 'qiā',
-    0x2073E: 'jué,guì',
-    0x20744: 'lì',
-    0x20750: 'huā',
-    0x20751: 'jiāo',
-    0x20758: 'qià',
-    0x2075A: 'zhá,zhé',
-    0x2075B: 'qiā',
-    0x2075D: 'zhé,zhá',
-    0x2075E: 'chā',
-    0x2075F: 'yǐng',
-    0x20762: 'yān',
-    0x20764: 'chōng',
-    0x20768: 'chǐ',
-    0x2076A: 'wān',
-    0x2076C: 'sōu',
-    0x20772: 'kǎn',
-    0x20773: 'yuán',
-    0x2077D: 'chóu',
-    0x2077F: 'suǒ',
-    0x20780: 'tū',
-    0x20783: 'zhé',
-    0x20784: 'tī,chǐ',
-    0x20786: 'wū',
-    0x20788: 'dā',
-    0x20789: 'lì',
-    0x2078A: 'chā,chāi,chá',
-    0x20795: 'róng',
-    0x20796: 'gòng',
-    0x20797: 'què',
-    0x20799: 'lí',
-    0x2079E: 'tāo',
-    0x207A4: 'lì',
-    0x207A7: 'mí',
-    0x207A9: 'chì,shuài',
-    0x207AC: 'gùn',
-    0x207AD: 'lóu,lòu',
-    0x207AE: 'chuǎng',
-    0x207AF: 'suǒ',
-    0x207B0: 'jiǎo',
-    0x207B1: 'jìn',
-    0x207B5: 'fá',
-    0x207B6: 'zhāi',
-    0x207BE: 'jìn',
-    0x207BF: 'cuì',
-    0x207C2: 'cèng',
-    0x207C3: 'zǔn',
-    0x207C5: 'zhào,rì,zhì',
-    0x207C8: 'piē',
-    0x207C9: 'zhǎn,chàn',
-    0x207CA: 'xī',
-    0x207CB: 'yào',
-    0x207CC: 'fǔ,pǒu',
-    0x207CD: 'chōng',
-    0x207D3: 'cuì',
-    0x207D7: 'guā',
-    0x207E3: 'jī',
-    0x207E6: 'sè',
-    0x207E7: 'zhān',
-    0x207E8: 'lìng,líng',
-    0x207E9: 'sè',
-    0x207EA: 'yè',
-    0x207F0: 'jū',
-    0x207F6: 'tū',
-    0x207FA: 'rú,ruǎn',
-    0x207FB: 'zé,bài',
-    0x207FC: 'huán',
-    0x20801: 'xiǎn',
-    0x20803: 'qiān',
-    0x20804: 'zhào',
-    0x2080B: 'cán',
-    0x2080E: 'kuò',
-    0x2080F: 'lì',
-    0x20810: 'róu',
-    0x20814: 'dú',
-    0x20817: 'liè',
-    0x2081C: 'yīng',
-    0x2081D: 'lì',
-    0x20820: 'dú',
-    0x20822: 'líng',
-    0x2082A: 'wān',
-    0x2082F: 'dié',
-    0x20833: 'jiū',
-    0x20835: 'lì',
-    0x20836: 'kū',
-    0x20837: 'kēng',
-    0x20839: 'zhěn',
-    0x20840: 'hè',
-    0x20842: 'bì,fú',
-    0x20844: 'pī',
-    0x2084A: 'hāng',
-    0x20851: 'zhuó',
-    0x20852: 'duǐ',
-    0x20854: 'yì',
-    0x2085C: 'kè',
-    0x2085D: 'yì',
-    0x2085E: 'mò',
-    0x20861: 'cán',
-    0x20863: 'gěng',
-    0x20864: 'kè',
-    0x20865: 'shì',
-    0x2086D: 'líng,lìng',
-    0x2086E: 'bēng,kēng',
-    0x20871: 'duàn',
-    0x20876: 'juān',
-    0x20877: 'nǎo',
-    0x20878: 'zǐ',
-    0x2087B: 'zòng',
-    0x20883: 'táng',
-    0x20886: 'xiá',
-    0x20887: 'hàn',
-    0x2088C: 'lüè',
-    0x2088D: 'qián',
-    0x20893: 'mò',
-    0x20894: 'ōu',
-    0x20895: 'háo',
-    0x20899: 'zhá',
-    0x2089A: 'juàn',
-    0x2089B: 'cóng',
-    0x208A0: 'lì,jí',
-    0x208A1: 'zhá',
-    0x208A2: 'yǒu',
-    0x208A3: 'diàn',
-    0x208A4: 'jué',
-    0x208A5: 'bèi',
-    0x208A9: 'yǎo',
-    0x208AA: 'piē',
-    0x208B1: 'jìn',
-    0x208B2: 'kǎi,xiè',
-    0x208B3: 'sè',
-    0x208B4: 'yǎng',
-    0x208B5: 'jìn',
-    0x208B9: 'kè',
-    0x208C4: 'chān',
-    0x208C7: 'niǎn',
-    0x208C9: 'wàn',
-    0x208CA: 'lǜ',
-    0x208D0: 'yún',
-    0x208D1: 'yāo',
-    0x208D2: 'bāo',
-    0x208D5: 'jūn',
-    0x208D6: 'xuán',
-    0x208D8: 'zhōu',
-    0x208E0: 'kuì',
-    0x208E1: 'fèng',
-    0x208EA: 'qú',
-    0x208EB: 'shào',
-    0x208EC: 'sǔn',
-    0x208F0: 'dū',
-    0x208F2: 'kuǎi',
-    0x208F3: 'pào',
-    0x208FA: 'bào',
-    0x208FE: 'fù',
-    0x208FF: 'jiù',
-    0x20900: 'rán',
-    0x20904: 'jū',
-    0x2090A: 'qióng',
-    0x2090D: 'zhōu',
-    0x2090E: 'huà',
-    0x2090F: 'bǎo',
-    0x20915: 'yí,xián',
-    0x20917: 'yí',
-    0x20918: 'yí,yǐ',
-    0x2091D: 'mào',
-    0x20926: 'ruǎn,rú',
-    0x2092B: 'cí',
-    0x2092E: 'hán',
-    0x20930: 'cóng,xuán',
-    0x20934: 'xì',
-    0x20939: 'quán',
-    0x2093A: 'tiáo',
-    0x2093C: 'diào',
-    0x2093E: 'hán',
-    0x20947: 'yě',
-    0x2094D: 'ē',
-    0x2094E: 'wéi',
-    0x20950: 'cāng',
-    0x20951: 'diào',
-    0x20955: 'è',
-    0x20956: 'dì',
-    0x20958: 'suǎn',
-    0x20959: 'quán',
-    0x2095C: 'è',
-    0x2095D: 'ōu,ǒu',
-    0x2095E: 'xuán',
-    0x20962: 'wǔ',
-    0x20966: 'yì',
-    0x20968: 'móu',
-    0x20970: 'hū',
-    0x20974: 'hán,gān',
-    0x2097F: 'shí',
-    0x20983: 'sà',
-    0x20988: 'bì',
-    0x2098A: 'hán',
-    0x2098B: 'jìng',
-    0x2098C: 'xì',
-    0x2098E: 'qìn',
-    0x2098F: 'cuó',
-    0x20990: 'cì',
-    0x20992: 'bān',
-    0x20997: 'duī',
-    0x2099C: 'xì,shù',
-    0x209A7: 'zhī',
-    0x209A8: 'luàn',
-    0x209AA: 'hū',
-    0x209AB: 'jí',
-    0x209AC: 'guāi',
-    0x209B2: 'pāng',
-    0x209C0: 'zhū',
-    0x209C5: 'bǐ',
-    0x209C7: 'yú',
-    0x209D2: 'qǐ',
-    0x209D5: 'hé',
-    0x209D6: 'chǔ',
-    0x209D9: 'shào',
-    0x209DA: 'chì',
-    0x209DB: 'bó',
-    0x209DF: 'réng,nǎi',
-    0x209E0: 'yóu',
-    0x209E4: 'nǎi',
-    0x209E9: 'huì,huǐ',
-    0x209EA: 'tiáo,yǒu',
-    0x209EB: 'bǎn',
-    0x209F0: 'xū',
-    0x209F4: 'yóu,yòu',
-    0x209F5: 'chì',
-    0x209FF: 'héng',
-    0x20A03: 'wài',
-    0x20A06: 'xiè',
-    0x20A0A: 'jué',
-    0x20A0C: 'suī',
-    0x20A0D: 'qīng',
-    0x20A0E: 'zhuàn',
-    0x20A15: 'jì',
-    0x20A18: 'bì',
-    0x20A1A: 'xī',
-    0x20A20: 'jí',
-    0x20A22: 'jùn',
-    0x20A25: 'liáo',
-    0x20A26: 'yōu',
-    0x20A2D: 'jú',
-    0x20A32: 'yuè',
-    0x20A35: 'bàng',
-    0x20A38: 'pí',
-    0x20A3B: 'zè',
-    0x20A3E: 'yì',
-    0x20A3F: 'dǐ',
-    0x20A42: 'qiè',
-    0x20A44: 'suǒ',
-    0x20A46: 'cì',
-    0x20A48: 'zhù',
-    0x20A49: 'yuè,jú',
-    0x20A4F: 'jiāo',
-    0x20A54: 'shí',
-    0x20A57: 'yí',
-    0x20A58: 'xiá',
-    0x20A60: 'yuán',
-    0x20A65: 'guó',
-    0x20A67: 'kè',
-    0x20A6A: 'cuì',
-    0x20A6B: 'yì',
-    0x20A75: 'lì',
-    0x20A77: 'diǎn',
-    0x20A7A: 'xī,chí',
-    0x20A7F: 'bì',
-    0x20A82: 'biǎn',
-    0x20A83: 'méi',
-    0x20A84: 'lì',
-    0x20A87: 'sǒu',
-    0x20A90: 'liú',
-    0x20A91: 'guì',
-    0x20A92: 'kè',
-    0x20A97: 'yí',
-    0x20A99: 'xǐ',
-    0x20A9A: 'yín,ǎn,kǎn',
-    0x20A9F: 'kè',
-    0x20AA3: 'shè',
-    0x20AA7: 'wǒ',
-    0x20AAE: 'pì',
-    0x20AB6: 'yuè',
-    0x20AB7: 'hóng',
-    0x20ABA: 'lì',
-    0x20ABB: 'fù',
-    0x20AC3: 'jué',
-    0x20AC4: 'xiān',
-    0x20AC9: 'diān',
-    0x20ACC: 'lì',
-    0x20AD3: 'tū',
-    0x20AD8: 'jiān',
-    0x20ADB: 'bǎi',
-    0x20ADC: 'dì',
-    0x20ADD: 'zhǎng',
-    0x20AE3: 'yù',
-    0x20AE8: 'duì',
-    0x20AED: 'cān',
-    0x20AEE: 'tú',
-    0x20AF6: 'tān',
-    0x20AF7: 'jí',
-    0x20AF8: 'qí,zhāi',
-    0x20AF9: 'shàn',
-    0x20AFA: 'nián,shì',
-    0x20B06: 'guàn',
-    0x20B08: 'bǐ',
-    0x20B0B: 'xīng,nián',
-    0x20B13: 'zhěn',
-    0x20B19: 'sā',
-    0x20B1B: 'mò',
-    0x20B1D: 'fú',
-    0x20B22: 'tāo',
-    0x20B23: 'bàng',
-    0x20B2A: 'biào',
-    0x20B2C: 'xī',
-    0x20B2E: 'jié',
-    0x20B36: 'jìn',
-    0x20B3E: 'qiān',
-    0x20B48: 'sì',
-    0x20B49: 'jǐng',
-    0x20B4B: 'chǐ',
-    0x20B57: 'jǐng',
-    0x20B65: 'suì',
-    0x20B6F: 'zhā',
-    0x20B70: 'lí',
-    0x20B74: 'zhuō',
-    0x20B79: 'biàn',
-    0x20B7F: 'tún',
-    0x20B83: 'bì',
-    0x20B86: 'fèi',
-    0x20B8A: 'dé',
-    0x20B8C: 'zhú',
-    0x20B91: 'jū',
-    0x20B99: 'yǐ',
-    0x20B9C: 'yà,yīn',
-    0x20B9F: 'chì',
-    0x20BA0: 'guǎ,bǎi',
-    0x20BA1: 'zhǐ',
-    0x20BA8: 'réng',
-    0x20BAB: 'yōu',
-    0x20BAD: 'bó',
-    0x20BAF: 'jǐ',
-    0x20BB0: 'pǐn',
-    0x20BB3: 'yīng',
-    0x20BB4: 'yāng',
-    0x20BB5: 'màng',
-    0x20BBD: 'lòng',
-    0x20BBE: 'ǹ,ǹg',
-    0x20BBF: 'sa,san',
-    0x20BC0: 'chuān',
-    0x20BC2: 'cí',
-    0x20BC3: 'wǔ',
-    0x20BC4: 'rèn',
-    0x20BC8: 'dài',
-    0x20BC9: 'jí',
-    0x20BCB: 'yǐ',
-    0x20BCD: 'rán',
-    0x20BD0: 'huò',
-    0x20BD1: 'guā',
-    0x20BD3: 'zhé',
-    0x20BD4: 'pì',
-    0x20BD7: 'zā',
-    0x20BD8: 'bàn',
-    0x20BD9: 'jié',
-    0x20BDC: 'hōu,xǔ',
-    0x20BDF: 'xiàn',
-    0x20BE0: 'huī',
-    0x20BE9: 'zhā',
-    0x20BEA: 'dāi,dǎi,è',
-    0x20BEB: 'gē',
-    0x20BED: 'pì',
-    0x20BEF: 'piàn',
-    0x20BF0: 'shí',
-    0x20BF1: 'liǎng',
-    0x20BF2: 'yuè',
-    0x20BF3: 'hù,wěn',
-    0x20BF4: 'biàn',
-    0x20BF7: 'réng',
-    0x20BF9: 'réng',
-    0x20C04: 'yī',
-    0x20C05: 'zhī',
-    0x20C07: 'jīn',
-    0x20C08: 'wēng',
-    0x20C09: 'chāo',
-    0x20C0B: 'qiū',
-    0x20C0D: 'zhǔ,zhù',
-    0x20C0F: 'zhá',
-    0x20C10: 'pǒ',
-    0x20C11: 'àn',
-    0x20C13: 'hé',
-    0x20C15: 'chū',
-    0x20C16: 'yán',
-    0x20C1A: 'shì',
-    0x20C1B: 'hù,gào',
-    0x20C1C: 'è',
-    0x20C34: 'shí',
-    0x20C39: 'tuō',
-    0x20C3A: 'dài',
-    0x20C3B: 'wài,wai',
-    0x20C3C: 'pō',
-    0x20C3D: 'rǒng',
-    0x20C3E: 'jū',
-    0x20C40: 'bō',
-    0x20C50: 'yǔ',
-    0x20C51: 'dōu',
-    0x20C53: 'guǐ',
-    0x20C54: 'shòu',
-    0x20C57: 'suō',
-    0x20C58: 'nì',
-    0x20C59: 'zhōu,yù,jì,cù',
-    0x20C5A: 'lòng',
-    0x20C5B: 'bǐng',
-    0x20C5C: 'zùn',
-    0x20C5D: 'yè',
-    0x20C5E: 'rǎn',
-    0x20C60: 'líng',
-    0x20C61: 'sà,shài',
-    0x20C64: 'lěi',
-    0x20C65: 'è,huì,zá',
-    0x20C67: 'zhòng',
-    0x20C68: 'jǐ',
-    0x20C6B: 'è',
-    0x20C6F: 'zuò',
-    0x20C72: 'nà',
-    0x20C73: 'yǔn',
-    0x20C8A: 'xiè',
-    0x20C8B: 'zuǐ',
-    0x20C8C: 'shù',
-    0x20C8D: 'diū',
-    0x20C8E: 'fa,fèi,fá,wa',
-    0x20C8F: 'rěn',
-    0x20C91: 'bāng',
-    0x20C92: 'hán',
-    0x20C93: 'hóng',
-    0x20C94: 'yī',
-    0x20C96: 'yī',
-    0x20C99: 'kē',
-    0x20C9A: 'yì',
-    0x20C9B: 'huí',
-    0x20C9C: 'zhēng',
-    0x20CAE: 'jìng',
-    0x20CB1: 'gé',
-    0x20CB4: 'nóu',
-    0x20CB5: 'qiè,jié',
-    0x20CB7: 'dié',
-    0x20CB9: 'jì',
-    0x20CBA: 'yì',
-    0x20CBB: 'yí',
-    0x20CBD: 'fú',
-    0x20CBE: 'shuò',
-    0x20CBF: 'shuò',
-    0x20CC0: 'yǒng',
-    0x20CC1: 'kěn',
-    0x20CC2: 'huá',
-    0x20CC3: 'hòng',
-    0x20CC7: 'hé',
-    0x20CCA: 'hē',
-    0x20CCB: 'qiǎn',
-    0x20CCC: 'qià',
-    0x20CCE: 'sì',
-    0x20CD0: 'bāng',
-    0x20CEC: 'jīng',
-    0x20CED: 'kè',
-    0x20CF3: 'āi',
-    0x20CF4: 'lóu',
-    0x20CF6: 'tū',
-    0x20CF9: 'chuáng',
-    0x20CFC: 'sòng',
-    0x20CFD: 'chéng',
-    0x20CFF: 'wēi',
-    0x20D02: 'nǔ',
-    0x20D04: 'jiǔ',
-    0x20D07: 'bīn',
-    0x20D21: 'xiào',
-    0x20D22: 'shēng',
-    0x20D23: 'hǒu',
-    0x20D26: 'zhù',
-    0x20D28: 'guān',
-    0x20D29: 'jī,qǐ',
-    0x20D2B: 'jì,cù,yù,zhù',
-    0x20D2D: 'xī',
-    0x20D2F: 'shè',
-    0x20D30: 'ǒu',
-    0x20D31: 'hú',
-    0x20D32: 'tà',
-    0x20D33: 'xiáo',
-    0x20D35: 'zào',
-    0x20D38: 'bò',
-    0x20D39: 'qì',
-    0x20D3A: 'wā',
-    0x20D3B: 'tuō',
-    0x20D3C: 'dào',
-    0x20D3E: 'nà',
-    0x20D60: 'zhāi',
-    0x20D63: 'yà',
-    0x20D66: 'wǔ',
-    0x20D67: 'zhén,chún',
-    0x20D68: 'de',
-    0x20D69: 'hē',
-    0x20D6B: 'āng',
-    0x20D6C: 'pí',
-    0x20D6D: 'sè',
-    0x20D6E: 'fěn',
-    0x20D6F: 'guā',
-    0x20D73: 'pǒ',
-    0x20D77: 'xuàn',
-    0x20D78: 'hān,mí',
-    0x20D79: 'gāng',
-    0x20D7A: 'bā',
-    0x20D7B: 'zōng',
-    0x20D7C: 'mèng',
-    0x20D7E: 'huò',
-    0x20DA7: 'diān',
-    0x20DA8: 'xī',
-    0x20DAB: 'dà',
-    0x20DAC: 'nàng',
-    0x20DB0: 'diāo',
-    0x20DB1: 'luò',
-    0x20DB2: 'kè',
-    0x20DB7: 'yì',
-    0x20DB8: 'jué',
-    0x20DB9: 'hé',
-    0x20DBB: 'jí',
-    0x20DBE: 'hè',
-    0x20DBF: 'niè,zá',
-    0x20DC0: 'rǔn',
-    0x20DC1: 'qián,jiān',
-    0x20DC2: 'dài',
-    0x20DC3: 'shāo,sù,shòu',
-    0x20DC4: 'kè',
-    0x20DC5: 'zhú',
-    0x20DC7: 'shī',
-    0x20DC8: 'lǜ,liè',
-    0x20DC9: 'jiā',
-    0x20DCA: 'pián',
-    0x20DCB: 'hòu',
-    0x20DCC: 'jī,zé',
-    0x20DCD: 'tà',
-    0x20DCE: 'chóu,shòu',
-    0x20DCF: 'wō',
-    0x20DD0: 'jìng,jiàng',
-    0x20DD1: 'pō',
-    0x20DD2: 'zhāi',
-    0x20DD3: 'xīn',
-    0x20DD6: 'biàn',
-    0x20DD9: 'xù',
-    0x20DDE: 'gū',
-    0x20DDF: 'jiè',
-    0x20DE2: 'xián',
-    0x20DF8: 'é,yóng',
-    0x20DFA: 'bó',
-    0x20DFB: 'piāo',
-    0x20DFF: 'zǎ',
-    0x20E01: 'pài',
-    0x20E02: 'tū',
-    0x20E04: 'yīng',
-    0x20E2E: 'xiǎng',
-    0x20E31: 'nuò',
-    0x20E32: 'gē',
-    0x20E33: 'bó',
-    0x20E34: 'xiè',
-    0x20E38: 'zhēn,chún',
-    0x20E39: 'yú',
-    0x20E3A: 'nì',
-    0x20E40: 'xùn',
-    0x20E41: 'wà',
-    0x20E43: 'àng',
-    0x20E44: 'hàn',
-    0x20E45: 'hōng',
-    0x20E46: 'dān',
-    0x20E48: 'nuó',
-    0x20E4A: 'cǎo',
-    0x20E4B: 'jí',
-    0x20E4C: 'něng',
-    0x20E4D: 'yǒng,róng',
-    0x20E4E: 'xiāo',
-    0x20E50: 'chuǎ',
-    0x20E51: 'yào',
-    0x20E53: 'gé',
-    0x20E54: 'táng',
-    0x20E55: 'bào',
-    0x20E56: 'chǎn',
-    0x20E58: 'xù',
-    0x20E5B: 'hái',
-    0x20E5D: 'chóu',
-    0x20E5F: 'jiǎn',
-    0x20E60: 'zuō',
-    0x20E64: 'wèi',
-    0x20E65: 'dā',
-    0x20E66: 'pī',
-    0x20E90: 'huàn',
-    0x20E92: 'xī',
-    0x20E94: 'pèn',
-    0x20E95: 'liū,liáo',
-    0x20E96: 'mǔ,yīng',
-    0x20E97: 'miē',
-    0x20E98: 'làng',
-    0x20E99: 'tuì',
-    0x20E9A: 'bān',
-    0x20E9D: 'gē',
-    0x20E9F: 'kù',
-    0x20EA2: 'jiā',
-    0x20EA3: 'bō',
-    0x20ECD: 'huàn',
-    0x20ECF: 'zú',
-    0x20ED0: 'luò',
-    0x20ED7: 'lí',
-    0x20ED9: 'hé',
-    0x20EDA: 'mó',
-    0x20EDC: 'shuì,lǜ,sū',
-    0x20EDD: 'shēn',
-    0x20EDE: 'kǎng',
-    0x20EDF: 'chì',
-    0x20EE0: 'líng',
-    0x20EE1: 'luǒ',
-    0x20EE4: 'yǎn',
-    0x20EE5: 'zhào',
-    0x20EE6: 'chuǎ',
-    0x20EE7: 'gǔ',
-    0x20EE8: 'qǐn',
-    0x20EEA: 'tán',
-    0x20EEB: 'fèn',
-    0x20EEC: 'tú',
-    0x20EF1: 'líng',
-    0x20EF4: 'lǎng',
-    0x20F16: 'lán',
-    0x20F17: 'zàn',
-    0x20F18: 'wù',
-    0x20F1D: 'lí',
-    0x20F1E: 'ā',
-    0x20F1F: 'lüè',
-    0x20F20: 'zhǐ',
-    0x20F21: 'chóu',
-    0x20F22: 'jiàng,qiàng',
-    0x20F24: 'jiān',
-    0x20F29: 'lún',
-    0x20F2A: 'yí',
-    0x20F2C: 'shāng',
-    0x20F3B: 'jī',
-    0x20F5C: 'yì',
-    0x20F5D: 'nín',
-    0x20F61: 'huì',
-    0x20F63: 'zhā',
-    0x20F66: 'hǎn',
-    0x20F68: 'yǐn',
-    0x20F69: 'bì',
-    0x20F6A: 'ān',
-    0x20F6B: 'xiā,xiǎ',
-    0x20F6C: 'ní',
-    0x20F70: 'dī',
-    0x20F71: 'jiǎn',
-    0x20F72: 'pán',
-    0x20F75: 'yù',
-    0x20F76: 'chuài,cuì,chuò',
-    0x20F77: 'zā',
-    0x20F79: 'chá',
-    0x20F7B: 'zhé',
-    0x20F7C: 'sè',
-    0x20F7E: 'pēn,pǔ',
-    0x20F7F: 'gū',
-    0x20F80: 'zhé',
-    0x20F86: 'lí',
-    0x20F87: 'dōu',
-    0x20F89: 'chóu',
-    0x20F8B: 'zuǐ',
-    0x20F8C: 'pò',
-    0x20F8F: 'shē',
-    0x20F90: 'lóng',
-    0x20FA2: 'shù',
-    0x20FA4: 'jìn',
-    0x20FA5: 'líng',
-    0x20FA8: 'kāng',
-    0x20FA9: 'là',
-    0x20FAB: 'xū',
-    0x20FAC: 'jìn',
-    0x20FAE: 'chuān',
-    0x20FB2: 'yuè',
-    0x20FC6: 'mǎi',
-    0x20FC7: 'xiè',
-    0x20FC8: 'jiū',
-    0x20FC9: 'jì',
-    0x20FCB: 'yuè',
-    0x20FCF: 'jiān',
-    0x20FD1: 'hán,gǎn,ǎn,hǎn',
-    0x20FD3: 'sà',
-    0x20FD4: 'huì',
-    0x20FD5: 'qiào',
-    0x20FD7: 'sè',
-    0x20FD8: 'zuǐ',
-    0x20FDB: 'lǔ',
-    0x20FDC: 'huà',
-    0x20FDD: 'chū',
-    0x20FDE: 'shǎn',
-    0x20FDF: 'wò',
-    0x20FE0: 'jí',
-    0x20FE1: 'zhuó',
-    0x20FE2: 'xián,xiàn',
-    0x20FE3: 'yī',
-    0x20FE4: 'guó',
-    0x20FE5: 'kuì,guì',
-    0x21011: 'zhōu',
-    0x21014: 'lù,lou',
-    0x21016: 'bō',
-    0x21017: 'shí',
-    0x21018: 'yìng',
-    0x21019: 'kū',
-    0x21039: 'zhì',
-    0x2103A: 'xié',
-    0x2103D: 'yè,hè',
-    0x2103E: 'è',
-    0x2103F: 'lǜ',
-    0x21040: 'hàn',
-    0x21041: 'yè,kài',
-    0x21046: 'luò',
-    0x21047: 'chuò',
-    0x21048: 'fàn',
-    0x21049: 'zhí',
-    0x2104A: 'yìng',
-    0x2104B: 'wěn',
-    0x2104C: 'wā',
-    0x2104D: 'ài',
-    0x2104E: 'yú',
-    0x21051: 'huā',
-    0x21053: 'liè',
-    0x21054: 'jīng',
-    0x21055: 'zá',
-    0x21067: 'zāng',
-    0x21068: 'duì',
-    0x2106A: 'jì',
-    0x2106E: 'wō',
-    0x21070: 'jí',
-    0x21071: 'xī',
-    0x21073: 'zhàn',
-    0x21074: 'tuán',
-    0x2108A: 'yú',
-    0x2108F: 'liè',
-    0x21092: 'zhì',
-    0x21093: 'shī',
-    0x21095: 'lǎo',
-    0x21096: 'lài,tà',
-    0x21097: 'wěi',
-    0x21098: 'páo',
-    0x21099: 'chí',
-    0x2109A: 'yǐng',
-    0x2109B: 'dòu',
-    0x2109D: 'dòu',
-    0x2109F: 'bào',
-    0x210A0: 'qiè',
-    0x210A1: 'shù',
-    0x210A3: 'zhí',
-    0x210A9: 'liè',
-    0x210AB: 'péng',
-    0x210AD: 'zhē',
-    0x210BF: 'ōu,ou',
-    0x210C2: 'xiè',
-    0x210C3: 'jí',
-    0x210C4: 'lài',
-    0x210C5: 'yíng',
-    0x210C6: 'cēng',
-    0x210D6: 'lē',
-    0x210DD: 'lùn',
-    0x210E1: 'lóng',
-    0x210E2: 'xì',
-    0x210E6: 'lìn',
-    0x210E9: 'guī',
-    0x210F3: 'xīng',
-    0x210F7: 'lí',
-    0x210F8: 'cī',
-    0x21107: 'qǐng',
-    0x21111: 'jiān',
-    0x21112: 'dào',
-    0x21113: 'jiǎn',
-    0x21114: 'qìng',
-    0x21115: 'xiè',
-    0x21116: 'yìng',
-    0x2111F: 'há',
-    0x21121: 'zhe',
-    0x21122: 'shē',
-    0x21123: 'mí',
-    0x21124: 'huán',
-    0x21131: 'cù',
-    0x21132: 'rú',
-    0x21133: 'sǎ',
-    0x21134: 'huò',
-    0x21135: 'yī',
-    0x21137: 'dī',
-    0x21139: 'luàn',
-    0x2113B: 'yì',
-    0x21142: 'bò',
-    0x21143: 'páng',
-    0x21144: 'tán',
-    0x21145: 'é,éi',
-    0x21146: 'zāng',
-    0x21147: 'cóng',
-    0x21153: 'zhāi',
-    0x21155: 'xǐ',
-    0x21156: 'mǎng',
-    0x21158: 'là',
-    0x21159: 'yùn',
-    0x21161: 'è',
-    0x21165: 'dié',
-    0x2116D: 'guān',
-    0x21171: 'huàn',
-    0x21175: 'shì',
-    0x21176: 'jiǎn',
-    0x21179: 'zhān',
-    0x2117A: 'jí',
-    0x2117B: 'huàn',
-    0x21185: 'wàn',
-    0x21186: 'luǒ',
-    0x2118F: 'dòu',
-    0x21195: 'liàn',
-    0x211A3: 'niè,dí',
-    0x211A4: 'nǎn',
-    0x211A5: 'jiù',
-    0x211A6: 'yuè',
-    0x211A9: 'yāo,jiǒng',
-    0x211AA: 'chuāng',
-    0x211AE: 'cǎn',
-    0x211AF: 'lǐ',
-    0x211B0: 'dùn',
-    0x211B1: 'nǎn',
-    0x211B2: 'nǎn',
-    0x211B8: 'rì,guó',
-    0x211BD: 'yuè',
-    0x211C0: 'yóu',
-    0x211C2: 'yīn',
-    0x211C4: 'guó,niè',
-    0x211C8: 'dàng,tuó',
-    0x211D1: 'zhēn',
-    0x211D2: 'mí',
-    0x211D3: 'dié',
-    0x211D6: 'zhēn',
-    0x211DA: 'kuā',
-    0x211DC: 'hán',
-    0x211DD: 'sòng',
-    0x211DE: 'hé',
-    0x211DF: 'jī',
-    0x211E0: 'zhé',
-    0x211E4: 'bǐng',
-    0x211E6: 'wéi',
-    0x211E7: 'tōu',
-    0x211E9: 'tú',
-    0x211EC: 'gāng',
-    0x211ED: 'lóu',
-    0x211EE: 'quán',
-    0x211EF: 'hùn',
-    0x211F0: 'zhuǎn',
-    0x211F1: 'què',
-    0x211F3: 'hóng',
-    0x211F5: 'dàng',
-    0x211F6: 'hé',
-    0x211F7: 'tài',
-    0x211F8: 'guāi',
-    0x211FA: 'yù',
-    0x211FC: 'yà',
-    0x211FF: 'wān',
-    0x21200: 'qūn',
-    0x21205: 'jué',
-    0x21206: 'ōu',
-    0x21209: 'quān',
-    0x2120A: 'zhí',
-    0x2120D: 'líng',
-    0x2120E: 'wū,rì',
-    0x2120F: 'xìn',
-    0x21210: 'dá',
-    0x21212: 'yuān',
-    0x21213: 'yuàn',
-    0x21217: 'mò',
-    0x21219: 'yóu',
-    0x2121E: 'wǔ',
-    0x21220: 'zhāng',
-    0x21223: 'xuān',
-    0x21226: 'rǎo',
-    0x21227: 'gǔn',
-    0x21228: 'yù',
-    0x2122E: 'xiá',
-    0x2122F: 'biǎn',
-    0x21230: 'yóu',
-    0x21232: 'yīn',
-    0x21234: 'xuán,rǔ',
-    0x21235: 'yóu',
-    0x21236: 'léi',
-    0x2123C: 'tǐng,tíng,zhēng,zhǐ',
-    0x2123F: 'zhēn',
-    0x21244: 'zài,kū',
-    0x21245: 'gā',
-    0x21246: 'lá',
-    0x21249: 'què',
-    0x2124E: 'jú',
-    0x21250: 'chūn',
-    0x21251: 'dā',
-    0x21252: 'tún',
-    0x21253: 'āi',
-    0x21257: 'zǐ',
-    0x2125A: 'huáng,fēng',
-    0x2125B: 'yì',
-    0x21269: 'bào',
-    0x2126A: 'chí',
-    0x2126D: 'rì',
-    0x21274: 'lú,hù',
-    0x21277: 'jié',
-    0x21278: 'shì',
-    0x2127A: 'zuān',
-    0x21281: 'yì',
-    0x21284: 'fèn',
-    0x21285: 'fèn,biàn',
-    0x21289: 'mò',
-    0x2128D: 'shù',
-    0x2129B: 'áo',
-    0x2129D: 'pǐ',
-    0x2129E: 'píng,pìng',
-    0x2129F: 'pō',
-    0x212A0: 'jiá',
-    0x212A1: 'zhóu',
-    0x212A3: 'qiū',
-    0x212A7: 'yǒu',
-    0x212A8: 'tán',
-    0x212AB: 'rǒng',
-    0x212AD: 'mì',
-    0x212B6: 'yì',
-    0x212B8: 'rǒng',
-    0x212BB: 'liè',
-    0x212BC: 'qióng',
-    0x212D9: 'huí',
-    0x212DA: 'jì',
-    0x212DF: 'gào',
-    0x212E7: 'yóu',
-    0x212E8: 'chā',
-    0x212E9: 'dé',
-    0x212EA: 'yīn',
-    0x212EC: 'yù',
-    0x212ED: 'bèi',
-    0x212EF: 'bó',
-    0x21314: 'qiāo',
-    0x2131A: 'chǎ',
-    0x2131C: 'xīn',
-    0x2131E: 'chí',
-    0x21323: 'zào',
-    0x21324: 'kuí',
-    0x21326: 'fèi',
-    0x21329: 'tā,dá',
-    0x2132A: 'guài',
-    0x2132D: 'duō',
-    0x21332: 'guī',
-    0x21334: 'zhí',
-    0x2134C: 'chǎn',
-    0x2134D: 'nǎo',
-    0x21350: 'hú',
-    0x21352: 'táo',
-    0x21361: 'yì',
-    0x21364: 'niè',
-    0x21365: 'zhài',
-    0x21366: 'huán',
-    0x21368: 'dù',
-    0x2136A: 'qì',
-    0x2136B: 'cè',
-    0x2136E: 'chuí',
-    0x21372: 'dā',
-    0x21376: 'zhì',
-    0x21377: 'gèng',
-    0x2137B: 'wèng',
-    0x21389: 'dù',
-    0x2138D: 'chí',
-    0x21391: 'àn',
-    0x21392: 'kuò',
-    0x21394: 'wò',
-    0x21398: 'yīng',
-    0x2139A: 'piǎn',
-    0x213AB: 'zhá,qì',
-    0x213AC: 'zhuǎ',
-    0x213AE: 'sù',
-    0x213B3: 'nì',
-    0x213BA: 'zhú',
-    0x213BB: 'chán',
-    0x213BE: 'bèng',
-    0x213BF: 'ní',
-    0x213C0: 'zhí',
-    0x213C1: 'huì',
-    0x213D8: 'xià',
-    0x213DA: 'zhì',
-    0x213DB: 'xī',
-    0x213DE: 'jiǎng',
-    0x213E9: 'duī',
-    0x213EA: 'fū',
-    0x213ED: 'jiāo',
-    0x213EE: 'cháo',
-    0x213EF: 'bài',
-    0x213F5: 'liè',
-    0x213FC: 'áo',
-    0x2140B: 'zāo',
-    0x2140C: 'chù',
-    0x2140F: 'tuǒ',
-    0x21412: 'háo,hào',
-    0x21413: 'kāng',
-    0x21414: 'yín',
-    0x21416: 'xiàn',
-    0x2141D: 'fú,fù',
-    0x2141E: 'biē',
-    0x21420: 'kuī',
-    0x21424: 'qiè',
-    0x21425: 'sà',
-    0x2143F: 'dā,da',
-    0x21440: 'yě,shù',
-    0x21444: 'zhǎng',
-    0x21446: 'liáng',
-    0x21448: 'duǐ',
-    0x2144D: 'láo',
-    0x2144E: 'xūn',
-    0x21458: 'zhì',
-    0x2145A: 'kū',
-    0x2145E: 'suì',
-    0x2145F: 'wō',
-    0x21463: 'kū',
-    0x2146F: 'jiǎn',
-    0x21476: 'jiǎng',
-    0x2147B: 'zhuì',
-    0x2147D: 'shuǎng',
-    0x2147E: 'yú',
-    0x21481: 'sà',
-    0x21483: 'yù,ào',
-    0x21484: 'lǎn',
-    0x2148A: 'yù',
-    0x2148C: 'qiǎn',
-    0x2148D: 'jù',
-    0x2148F: 'liè',
-    0x21492: 'shú',
-    0x21493: 'xiàn',
-    0x21496: 'gài',
-    0x214A2: 'tái',
-    0x214A7: 'tiǎn',
-    0x214AF: 'mèng',
-    0x214B1: 'dí',
-    0x214B3: 'mián',
-    0x214BE: 'huī,kuì',
-    0x214C9: 'duò',
-    0x214CD: 'liè',
-    0x214D2: 'lài',
-    0x214D3: 'yín,yīn',
-    0x214D4: 'lǎn',
-    0x214D6: 'jiāo',
-    0x214D8: 'huò',
-    0x214E3: 'guō',
-    0x214E6: 'zhàn',
-    0x214ED: 'mǐ',
-    0x214F0: 'kuī',
-    0x214F7: 'duò',
-    0x214FF: 'yín',
-    0x21507: 'lèi',
-    0x21515: 'gòng',
-    0x2151B: 'tǐng',
-    0x2151C: 'yáo',
-    0x2151E: 'wǎng',
-    0x21523: 'jié,qiè',
-    0x21528: 'xiū',
-    0x2152A: 'shù',
-    0x21531: 'wèi',
-    0x21534: 'yù',
-    0x21541: 'zhān',
-    0x21549: 'āng',
-    0x2154F: 'sǎng',
-    0x21550: 'chóu',
-    0x21552: 'kuà',
-    0x21556: 'jǔ,féng',
-    0x21557: 'hài',
-    0x21562: 'miǎn,mǎn',
-    0x21567: 'hàng',
-    0x2156A: 'chóu',
-    0x2156E: 'líng',
-    0x21570: 'zōng',
-    0x21589: 'kūn',
-    0x2158C: 'zhōng',
-    0x2158E: 'zhāo',
-    0x21590: 'diě',
-    0x21591: 'gǒu',
-    0x21592: 'yún',
-    0x21593: 'dān',
-    0x21594: 'nuó,nuǒ',
-    0x2159B: 'bǐng',
-    0x2159D: 'rán',
-    0x2159E: 'chān',
-    0x215A2: 'rǒng',
-    0x215A3: 'yīn',
-    0x215A4: 'chān',
-    0x215A7: 'zhì',
-    0x215AA: 'guài',
-    0x215AB: 'nuó',
-    0x215AC: 'shēn',
-    0x215AF: 'sù',
-    0x215B2: 'wǒ',
-    0x215B3: 'chǐ',
-    0x215BA: 'miè',
-    0x215BB: 'zhí',
-    0x215BE: 'qī',
-    0x215C1: 'gōu',
-    0x215C6: 'lǒu',
-    0x215C8: 'zī',
-    0x215CD: 'dǎng',
-    0x215CF: 'xiǎn',
-    0x215D1: 'rǒu',
-    0x215D7: 'pěng',
-    0x215DE: 'xī',
-    0x215E2: 'kuā,běn',
-    0x215E4: 'guì',
-    0x215E5: 'chún',
-    0x215E6: 'jiè',
-    0x215F2: 'jiè,bēn',
-    0x215F3: 'xī',
-    0x215F5: 'kū',
-    0x215F7: 'gū',
-    0x215F8: 'zhà,kuā',
-    0x215F9: 'fàn',
-    0x215FC: 'xiè',
-    0x2160D: 'huán,qié',
-    0x2160F: 'niǎo',
-    0x21610: 'xì',
-    0x2161B: 'cū',
-    0x2161D: 'gǔn',
-    0x21621: 'xī',
-    0x21627: 'qiá',
-    0x2162A: 'māng',
-    0x2162D: 'zhé',
-    0x21630: 'juàn',
-    0x21634: 'biē',
-    0x21640: 'biē',
-    0x21645: 'quán',
-    0x2164B: 'xì',
-    0x2164E: 'jiǎo,miǎo',
-    0x21650: 'quán',
-    0x21651: 'zhǐ',
-    0x21652: 'tiān',
-    0x21653: 'kāi',
-    0x21658: 'sǎn,yì',
-    0x2165B: 'zī',
-    0x21663: 'jié',
-    0x2166A: 'bié',
-    0x2166C: 'dòu',
-    0x2166D: 'zuī',
-    0x21676: 'yǎn',
-    0x21681: 'bì',
-    0x21685: 'kuǎi',
-    0x21687: 'yàn',
-    0x21688: 'wéi',
-    0x2168A: 'huān',
-    0x2168C: 'hào',
-    0x21691: 'gōng',
-    0x21694: 'méng',
-    0x21697: 'lěi',
-    0x21699: 'dì',
-    0x2169B: 'bǐng',
-    0x2169C: 'huān,kàn',
-    0x2169F: 'wā',
-    0x216A0: 'jué',
-    0x216A8: 'chì',
-    0x216AD: 'bā',
-    0x216AE: 'jiǔ',
-    0x216B7: 'dì',
-    0x216B9: 'zhàng',
-    0x216BB: 'dà',
-    0x216BC: 'shí',
-    0x216BD: 'hào',
-    0x216CC: 'yè',
-    0x216D7: 'bì',
-    0x216D8: 'pǐ',
-    0x216D9: 'yǎo,yāo',
-    0x216DC: 'dī',
-    0x216DD: 'càn',
-    0x216DE: 'pín',
-    0x216DF: 'yuè',
-    0x216E0: 'qiē',
-    0x216E1: 'pī',
-    0x216F5: 'tuǒ',
-    0x216F6: 'xiè',
-    0x216FD: 'yè',
-    0x21700: 'fàn',
-    0x21701: 'guā',
-    0x21702: 'hù',
-    0x21703: 'rǔ',
-    0x21709: 'rǎn,ràn',
-    0x2170A: 'fǒu',
-    0x2170B: 'huāng',
-    0x2171A: 'rú',
-    0x21722: 'mǎo',
-    0x21725: 'duī',
-    0x21726: 'huì',
-    0x21727: 'xì',
-    0x21728: 'xiū',
-    0x2172B: 'rǎn',
-    0x2172C: 'yī',
-    0x2172F: 'zhé',
-    0x21731: 'jì',
-    0x21732: 'gào',
-    0x21733: 'yòu',
-    0x21735: 'pū',
-    0x21748: 'chù',
-    0x21749: 'cū',
-    0x2174A: 'zhé',
-    0x2174B: 'niǎo',
-    0x2174D: 'qiè',
-    0x21750: 'chá',
-    0x21752: 'niǎo',
-    0x21753: 'suī',
-    0x21759: 'chá',
-    0x2175A: 'chéng',
-    0x2175B: 'yáo',
-    0x2175C: 'dù',
-    0x2175D: 'wāng',
-    0x2175F: 'niàn',
-    0x21760: 'mí',
-    0x21766: 'nǒu',
-    0x21767: 'xì',
-    0x21769: 'yāo',
-    0x2176B: 'chān',
-    0x21798: 'xiè',
-    0x21799: 'miè',
-    0x2179A: 'kěng',
-    0x2179C: 'cù',
-    0x2179E: 'shěng',
-    0x2179F: 'pàn',
-    0x217A0: 'hù',
-    0x217A2: 'kè',
-    0x217A3: 'xiàn',
-    0x217A5: 'hóu',
-    0x217A6: 'qióng',
-    0x217A7: 'zōng',
-    0x217AA: 'fú',
-    0x217AB: 'nài',
-    0x217AD: 'nì',
-    0x217AF: 'kǔ',
-    0x217BE: 'nèn',
-    0x217CD: 'gē',
-    0x217D1: 'hóu',
-    0x217D3: 'āi',
-    0x217D5: 'shī',
-    0x217DE: 'xiū',
-    0x217DF: 'cōng',
-    0x217E0: 'jiāo',
-    0x217E2: 'zhá',
-    0x217E3: 'xiāo',
-    0x217E4: 'liàn',
-    0x217E5: 'qǔ',
-    0x217E8: 'shǎn',
-    0x217E9: 'xiè',
-    0x217EB: 'gòng',
-    0x217EC: 'miè',
-    0x217ED: 'chái',
-    0x217EF: 'ēn',
-    0x217F3: 'dòu',
-    0x21806: 'kòu',
-    0x2180A: 'tiáo',
-    0x2180B: 'shī',
-    0x2180F: 'sāng',
-    0x21812: 'guān',
-    0x21816: 'hào',
-    0x21817: 'zhì',
-    0x21818: 'yàng',
-    0x21819: 'tōng',
-    0x2181A: 'bì',
-    0x2181C: 'mó,mò',
-    0x2181E: 'fú',
-    0x21825: 'qiáng',
-    0x21839: 'zhì',
-    0x2183C: 'sōu',
-    0x2183F: 'niǎo',
-    0x21840: 'juàn',
-    0x21842: 'yàng',
-    0x21844: 'huāng',
-    0x21848: 'bēng',
-    0x21849: 'mó',
-    0x2184A: 'cháo',
-    0x2184E: 'lǚ,lóu',
-    0x2184F: 'shāo',
-    0x21850: 'bǔ',
-    0x21851: 'zēng',
-    0x21852: 'sī,xī',
-    0x21854: 'zuì',
-    0x21855: 'yuē',
-    0x21856: 'zān,cān',
-    0x21857: 'luǎn,luàn',
-    0x21865: 'qú',
-    0x2187A: 'miǎo',
-    0x21880: 'zhuàn',
-    0x21888: 'dàng',
-    0x2188A: 'yuān',
-    0x21892: 'jǔ',
-    0x21895: 'huǐ',
-    0x21896: 'qì',
-    0x21898: 'yùn,yíng',
-    0x2189A: 'màn',
-    0x2189C: 'mǒ',
-    0x218B1: 'piāo',
-    0x218B3: 'jìn',
-    0x218B9: 'yāo',
-    0x218C0: 'chì',
-    0x218C1: 'nì',
-    0x218C2: 'sōu',
-    0x218C8: 'shù',
-    0x218CB: 'piāo',
-    0x218D4: 'hàn',
-    0x218E0: 'yāo',
-    0x218E2: 'néi',
-    0x218EA: 'shì',
-    0x218EC: 'yuān',
-    0x218EE: 'cài',
-    0x218EF: 'jié',
-    0x218F9: 'xiè',
-    0x218FD: 'yán',
-    0x218FE: 'xiāo',
-    0x2190B: 'xiè',
-    0x2190C: 'lì',
-    0x2190E: 'fàn',
-    0x21917: 'zhù',
-    0x21919: 'nà',
-    0x2191B: 'zhuǎn',
-    0x2191E: 'kuī',
-    0x21922: 'luó',
-    0x2192B: 'qiā',
-    0x21936: 'wān',
-    0x2193D: 'shǔ',
-    0x2193F: 'chèng,kǒng',
-    0x21941: 'yì',
-    0x21946: 'hǎo,hào',
-    0x21948: 'jiào',
-    0x2194B: 'huì',
-    0x2194D: 'xiào',
-    0x2194E: 'cí,zǐ',
-    0x2195E: 'jì,bèi',
-    0x21966: 'nǐ,jìn',
-    0x21968: 'nǐ,jìn',
-    0x21969: 'tǐ',
-    0x21976: 'jù,rú',
-    0x21978: 'mìng',
-    0x2197D: 'lí',
-    0x2197F: 'zhòng',
-    0x21981: 'xù',
-    0x21983: 'qióng',
-    0x21984: 'fú',
-    0x21986: 'bìn',
-    0x2198A: 'jì',
-    0x2198D: 'qí',
-    0x2198E: 'xì',
-    0x21994: 'dèng',
-    0x21995: 'ér',
-    0x2199B: 'shú',
-    0x2199C: 'tóng',
-    0x2199D: 'xiāo,xiáo',
-    0x2199F: 'pí',
-    0x219A8: 'dǎn',
-    0x219AA: 'jí',
-    0x219B3: 'xiào',
-    0x219B7: 'cóng',
-    0x219BB: 'bīn',
-    0x219BC: 'rǒng',
-    0x219CD: 'miàn,bīn',
-    0x219D2: 'miàn',
-    0x219D4: 'shū',
-    0x219D5: 'xiáo,shǒu',
-    0x219D6: 'bǎo',
-    0x219D7: 'wà',
-    0x219D9: 'pào',
-    0x219E3: 'gǎi',
-    0x219E5: 'hū',
-    0x219E6: 'héng',
-    0x219E8: 'zhú',
-    0x219E9: 'guāi',
-    0x219ED: 'guì,guǐ',
-    0x219F9: 'dài',
-    0x219FC: 'bīn',
-    0x219FD: 'huǎng,huāng',
-    0x21A00: 'chá',
-    0x21A04: 'xià,sāi',
-    0x21A05: 'jú',
-    0x21A07: 'yǎo,xiǎng',
-    0x21A16: 'fěn',
-    0x21A17: 'zào',
-    0x21A1B: 'fēng',
-    0x21A22: 'jū',
-    0x21A23: 'yù',
-    0x21A29: 'hūn',
-    0x21A32: 'jié',
-    0x21A33: 'xiòng,hùn',
-    0x21A35: 'nài',
-    0x21A3B: 'nǒu',
-    0x21A3D: 'shěng',
-    0x21A3F: 'yù',
-    0x21A42: 'huán',
-    0x21A43: 'gěng',
-    0x21A44: 'wǎn',
-    0x21A46: 'tuó',
-    0x21A47: 'qiāo',
-    0x21A58: 'yìn',
-    0x21A5A: 'jiā,zhuàn',
-    0x21A61: 'suǒ',
-    0x21A63: 'jié',
-    0x21A64: 'xī',
-    0x21A65: 'wěng',
-    0x21A69: 'máng',
-    0x21A76: 'yáng',
-    0x21A78: 'yáo',
-    0x21A7D: 'máng',
-    0x21A7E: 'ōu',
-    0x21A81: 'án',
-    0x21A85: 'lòu',
-    0x21A91: 'è',
-    0x21A92: 'zǐ',
-    0x21A97: 'è',
-    0x21A99: 'àn',
-    0x21A9E: 'huò',
-    0x21AA0: 'céng',
-    0x21AB0: 'xiòng',
-    0x21AB1: 'jì',
-    0x21AB3: 'zuó',
-    0x21AB5: 'qí',
-    0x21ABA: 'zhēng',
-    0x21AC0: 'jī',
-    0x21AC1: 'qī,chèn',
-    0x21AC2: 'juǎn',
-    0x21AC3: 'níng',
-    0x21ADF: 'sè',
-    0x21AE5: 'hè',
-    0x21AE6: 'rǒng',
-    0x21AE7: 'qǐn',
-    0x21AEC: 'jū',
-    0x21AEF: 'lì',
-    0x21AF5: 'shí',
-    0x21AF8: 'nì',
-    0x21AF9: 'xián',
-    0x21AFA: 'fū',
-    0x21AFD: 'rǔ,yù',
-    0x21B01: 'xiòng',
-    0x21B02: 'guì',
-    0x21B04: 'jì',
-    0x21B06: 'měng,mèng',
-    0x21B07: 'fū',
-    0x21B09: 'sài',
-    0x21B0A: 'yù',
-    0x21B0B: 'jiào',
-    0x21B0C: 'mèng',
-    0x21B0D: 'mí,lóng,mǐ',
-    0x21B0E: 'qiāng',
-    0x21B10: 'yí,mí',
-    0x21B13: 'yí',
-    0x21B15: 'lóng',
-    0x21B16: 'hān',
-    0x21B17: 'nì',
-    0x21B18: 'lào',
-    0x21B19: 'sèng',
-    0x21B1C: 'lǐn',
-    0x21B1E: 'yù',
-    0x21B25: 'nuó',
-    0x21B2B: 'wù',
-    0x21B2F: 'biǎn',
-    0x21B32: 'biǎn',
-    0x21B33: 'xuān,shòu',
-    0x21B35: 'jiān',
-    0x21B38: 'biǎn',
-    0x21B42: 'dé',
-    0x21B47: 'zhuān',
-    0x21B4B: 'rǒng',
-    0x21B50: 'shuàn',
-    0x21B58: 'jiā',
-    0x21B5B: 'huǐ',
-    0x21B5E: 'zhān',
-    0x21B62: 'bài',
-    0x21B63: 'liè',
-    0x21B65: 'xiē',
-    0x21B6D: 'jiǎn',
-    0x21B6E: 'shǒu',
-    0x21B73: 'kào',
-    0x21B77: 'guān',
-    0x21B78: 'luàn',
-    0x21B7E: 'nǒu',
-    0x21B7F: 'chǎng',
-    0x21B8E: 'liáng',
-    0x21B99: 'nài',
-    0x21B9A: 'rǔ',
-    0x21B9E: 'zhì',
-    0x21BA6: 'cáo',
-    0x21BB0: 'lì',
-    0x21BBB: 'lán',
-    0x21BBF: 'chān',
-    0x21BC1: 'wāng',
-    0x21BC4: 'lì',
-    0x21BC7: 'wù',
-    0x21BC8: 'páo',
-    0x21BC9: 'yòu',
-    0x21BCB: 'gān',
-    0x21BCF: 'ān',
-    0x21BD0: 'xiū',
-    0x21BD1: 'shuǐ,zhuǐ',
-    0x21BD2: 'ruǐ',
-    0x21BD8: 'bǎn',
-    0x21BD9: 'yóu',
-    0x21BE2: 'huó',
-    0x21BE5: 'huī',
-    0x21BE8: 'zuò',
-    0x21BE9: 'xiāo',
-    0x21BEB: 'mián',
-    0x21BF0: 'gà',
-    0x21BF1: 'yuǎn',
-    0x21BF3: 'bò',
-    0x21BF4: 'chào',
-    0x21BF5: 'tuǐ,kuì',
-    0x21BF7: 'bò,kòu',
-    0x21BFD: 'gà',
-    0x21BFF: 'tiāo',
-    0x21C00: 'ná',
-    0x21C05: 'hú',
-    0x21C06: 'niè',
-    0x21C0B: 'huí',
-    0x21C0C: 'lǒu',
-    0x21C0E: 'tí',
-    0x21C10: 'qiào',
-    0x21C11: 'qiáo',
-    0x21C12: 'zhǒng',
-    0x21C16: 'dī',
-    0x21C1A: 'lín',
-    0x21C1D: 'quán',
-    0x21C1E: 'zhuān',
-    0x21C20: 'léi,luán',
-    0x21C22: 'xié',
-    0x21C25: 'rén,yí',
-    0x21C28: 'dāng',
-    0x21C2A: 'dū',
-    0x21C2B: 'niǎn',
-    0x21C2F: 'shǐ,diǎo,běi',
-    0x21C32: 'xián',
-    0x21C39: 'zhí',
-    0x21C3D: 'ài',
-    0x21C3E: 'cī',
-    0x21C3F: 'pú',
-    0x21C41: 'shǐ',
-    0x21C45: 'qū',
-    0x21C46: 'shǔ',
-    0x21C47: 'diān',
-    0x21C49: 'xiǎo',
-    0x21C4A: 'shuǐ',
-    0x21C4C: 'huán',
-    0x21C50: 'yí',
-    0x21C51: 'juān',
-    0x21C54: 'zhǐ,qì',
-    0x21C5C: 'zhào',
-    0x21C63: 'xù',
-    0x21C6F: 'lòng',
-    0x21C71: 'zhù',
-    0x21C73: 'suǒ',
-    0x21C77: 'dié',
-    0x21C7A: 'qú',
-    0x21C7C: 'kè,kuà',
-    0x21C7D: 'hū',
-    0x21C7E: 'jū',
-    0x21C80: 'qǐng',
-    0x21C8D: 'bīng',
-    0x21C95: 'tì',
-    0x21C97: 'jué',
-    0x21C9A: 'qiú',
-    0x21CA3: 'jiàng',
-    0x21CAA: 'yùn',
-    0x21CAD: 'mèi',
-    0x21CAE: 'pī',
-    0x21CB0: 'qú',
-    0x21CBC: 'mì',
-    0x21CBF: 'tì',
-    0x21CC2: 'kài',
-    0x21CC4: 'bǐ',
-    0x21CC6: 'qū,qù',
-    0x21CCF: 'tiāo',
-    0x21CD1: 'chù',
-    0x21CD8: 'jú',
-    0x21CDA: 'xī',
-    0x21CDE: 'lìn',
-    0x21CED: 'chǐ',
-    0x21CEE: 'jī',
-    0x21CF4: 'lú',
-    0x21CF8: 'lì',
-    0x21CFE: 'jué',
-    0x21D05: 'zhū',
-    0x21D06: 'lù',
-    0x21D0E: 'niè',
-    0x21D14: 'quán',
-    0x21D2D: 'yà',
-    0x21D2F: 'è',
-    0x21D31: 'hù,jié',
-    0x21D40: 'máng',
-    0x21D49: 'wù',
-    0x21D4C: 'chā',
-    0x21D51: 'qīn',
-    0x21D52: 'jié,qǐ',
-    0x21D53: 'hóng',
-    0x21D55: 'dān',
-    0x21D56: 'ěn',
-    0x21D57: 'zè',
-    0x21D58: 'hù',
-    0x21D59: 'àng',
-    0x21D5A: 'jiè',
-    0x21D5B: 'fù',
-    0x21D5C: 'yòng',
-    0x21D5E: 'fēng',
-    0x21D6C: 'mù',
-    0x21D76: 'sè',
-    0x21D77: 'cóng',
-    0x21D7B: 'kāng',
-    0x21D82: 'yào',
-    0x21D83: 'ài',
-    0x21D84: 'bāo',
-    0x21D86: 'pǒ',
-    0x21D88: 'shǐ',
-    0x21D89: 'fàn',
-    0x21D8B: 'jú',
-    0x21D8C: 'pí',
-    0x21D8E: 'wèi',
-    0x21D8F: 'kū',
-    0x21D90: 'qié',
-    0x21D91: 'gān',
-    0x21DA2: 'kuàng',
-    0x21DA3: 'suì',
-    0x21DA4: 'bēng,yòng',
-    0x21DA5: 'jiā',
-    0x21DA6: 'yà',
-    0x21DAA: 'kàn',
-    0x21DAB: 'niè',
-    0x21DAD: 'xíng',
-    0x21DAF: 'xì',
-    0x21DB1: 'lìn',
-    0x21DB2: 'duǒ',
-    0x21DB4: 'chǎn',
-    0x21DC8: 'shì',
-    0x21DCB: 'duì',
-    0x21DCD: 'jiāng',
-    0x21DCE: 'yǔ',
-    0x21DCF: 'lù',
-    0x21DD0: 'ěn',
-    0x21DD3: 'gǔ',
-    0x21DD5: 'wěi',
-    0x21DD6: 'chē',
-    0x21DD7: 'huàn,huán',
-    0x21DD8: 'bié',
-    0x21DDB: 'hàn',
-    0x21DDC: 'tuí',
-    0x21DDD: 'nà',
-    0x21DDE: 'qǐ',
-    0x21DE0: 'tóu',
-    0x21DE1: 'yuān',
-    0x21DE2: 'wáng',
-    0x21DE4: 'wú',
-    0x21DE5: 'gào',
-    0x21DE8: 'kēng,xíng',
-    0x21DEA: 'yí,níng',
-    0x21DF8: 'xiāo',
-    0x21DFA: 'guǐ',
-    0x21DFB: 'yà',
-    0x21DFC: 'suì',
-    0x21DFD: 'sǒng',
-    0x21DFF: 'zhuó',
-    0x21E02: 'tū,tú',
-    0x21E03: 'xiǎn,jiǎn',
-    0x21E08: 'zè',
-    0x21E09: 'lì',
-    0x21E0C: 'zhù',
-    0x21E0E: 'jié',
-    0x21E11: 'tì',
-    0x21E14: 'xié',
-    0x21E15: 'qióng',
-    0x21E17: 'yà',
-    0x21E18: 'jū',
-    0x21E1B: 'yín',
-    0x21E1C: 'zhí',
-    0x21E1E: 'kǎn',
-    0x21E1F: 'zī',
-    0x21E21: 'kē',
-    0x21E23: 'niè',
-    0x21E24: 'qiáng',
-    0x21E25: 'wǎn',
-    0x21E26: 'zé',
-    0x21E28: 'jū',
-    0x21E2A: 'zì',
-    0x21E44: 'yà',
-    0x21E47: 'lín',
-    0x21E49: 'qí',
-    0x21E4E: 'huí',
-    0x21E53: 'qì',
-    0x21E55: 'yáng',
-    0x21E56: 'suì',
-    0x21E58: 'qǐ',
-    0x21E59: 'guī',
-    0x21E62: 'qìn',
-    0x21E63: 'ē',
-    0x21E65: 'zuò',
-    0x21E68: 'zè',
-    0x21E69: 'qì',
-    0x21E6A: 'jí',
-    0x21E6C: 'tuó',
-    0x21E6D: 'dié',
-    0x21E6F: 'huì',
-    0x21E70: 'máo',
-    0x21E72: 'xǔ',
-    0x21E75: 'hóu',
-    0x21E76: 'yǎn',
-    0x21E77: 'xiáng',
-    0x21E78: 'cōng',
-    0x21E79: 'hú',
-    0x21E7C: 'àn,yǎn',
-    0x21E7E: 'bǐng',
-    0x21E87: 'duǒ',
-    0x21E90: 'zhǔ',
-    0x21E91: 'dié',
-    0x21E92: 'yōu',
-    0x21E93: 'qǐ',
-    0x21E94: 'shí',
-    0x21E95: 'xūn',
-    0x21E96: 'yōu',
-    0x21E97: 'kān',
-    0x21E98: 'qiǎo',
-    0x21E9B: 'qiāng,huà',
-    0x21E9C: 'pén',
-    0x21E9F: 'quán',
-    0x21EA1: 'yíng',
-    0x21EA7: 'shā',
-    0x21EAB: 'tāo',
-    0x21EAD: 'hòng',
-    0x21EAE: 'pǐ',
-    0x21EAF: 'yáo',
-    0x21EB4: 'tú',
-    0x21EB5: 'chái',
-    0x21EB7: 'xià',
-    0x21EB8: 'qí',
-    0x21EBA: 'qióng',
-    0x21EBD: 'jìn',
-    0x21EC8: 'zhēn',
-    0x21ECC: 'zhū',
-    0x21ECE: 'xī',
-    0x21ED0: 'wēng',
-    0x21ED1: 'zhǒng',
-    0x21ED5: 'suì',
-    0x21ED8: 'kē',
-    0x21ED9: 'kuò',
-    0x21EDA: 'kǎng',
-    0x21EDD: 'cháo',
-    0x21EDE: 'bì',
-    0x21EDF: 'mò',
-    0x21EE0: 'zhù',
-    0x21EE1: 'hàn,yán',
-    0x21EE2: 'yǔ',
-    0x21EE3: 'yí',
-    0x21EE4: 'má',
-    0x21EE7: 'qì',
-    0x21EE8: 'gùn',
-    0x21EE9: 'màn',
-    0x21EEA: 'liáo,liù',
-    0x21EEB: 'lín',
-    0x21EEC: 'zú',
-    0x21EED: 'lěi',
-    0x21EEE: 'hù',
-    0x21EEF: 'chuǎng',
-    0x21EF0: 'qì',
-    0x21EF1: 'léi',
-    0x21F01: 'chī',
-    0x21F03: 'pó',
-    0x21F04: 'dié',
-    0x21F0A: 'lěi',
-    0x21F0E: 'yǐ',
-    0x21F13: 'diàn',
-    0x21F16: 'dūn',
-    0x21F17: 'gāo',
-    0x21F18: 'hū',
-    0x21F1A: 'xiāo',
-    0x21F1B: 'gá',
-    0x21F1C: 'pēng',
-    0x21F2C: 'shěn',
-    0x21F31: 'wéi',
-    0x21F3B: 'duì',
-    0x21F3C: 'cháo',
-    0x21F3D: 'yǐn',
-    0x21F3E: 'kuài',
-    0x21F3F: 'kū',
-    0x21F41: 'zuì',
-    0x21F42: 'gǔ',
-    0x21F45: 'yùn',
-    0x21F46: 'zhì',
-    0x21F49: 'jì',
-    0x21F4A: 'chēng',
-    0x21F56: 'xiè',
-    0x21F5B: 'zuǐ',
-    0x21F5C: 'án',
-    0x21F5D: 'hāo',
-    0x21F60: 'pǒ',
-    0x21F62: 'dí',
-    0x21F63: 'yè',
-    0x21F67: 'náo',
-    0x21F71: 'jié',
-    0x21F72: 'bàng',
-    0x21F73: 'lǎn',
-    0x21F74: 'cáng',
-    0x21F76: 'bì',
-    0x21F7B: 'zhǎn',
-    0x21F7C: 'qì',
-    0x21F82: 'náo',
-    0x21F85: 'lǜ',
-    0x21F87: 'kuàng',
-    0x21F89: 'mó',
-    0x21F8B: 'lěi,léi',
-    0x21F8C: 'páo',
-    0x21F92: 'lì',
-    0x21F93: 'céng',
-    0x21F95: 'dàng',
-    0x21F96: 'lěi',
-    0x21F99: 'è',
-    0x21F9B: 'bèng',
-    0x21F9C: 'jué,huò',
-    0x21FA5: 'xuán',
-    0x21FA6: 'niè',
-    0x21FA8: 'hài',
-    0x21FAE: 'xiǎn',
-    0x21FB0: 'jiǎn',
-    0x21FB1: 'mí',
-    0x21FB2: 'niè',
-    0x21FBB: 'cáng',
-    0x21FBC: 'sǒng',
-    0x21FBD: 'zēng',
-    0x21FBE: 'yì',
-    0x21FC2: 'chóng',
-    0x21FC4: 'cáng',
-    0x21FC9: 'lěi',
-    0x21FCA: 'nuó',
-    0x21FCB: 'lì',
-    0x21FCE: 'lí',
-    0x21FCF: 'luó',
-    0x21FD3: 'tǎng',
-    0x21FD6: 'niè,yà',
-    0x21FD7: 'niè',
-    0x21FD9: 'jī',
-    0x21FDB: 'lěi',
-    0x21FDD: 'nàng',
-    0x21FE0: 'lín',
-    0x21FE1: 'líng',
-    0x21FE4: 'xián',
-    0x21FE5: 'yù',
-    0x21FE7: 'zāi',
-    0x21FE8: 'quǎn',
-    0x21FE9: 'liè',
-    0x21FEF: 'yù',
-    0x21FF0: 'huāng',
-    0x21FFA: 'nǎo',
-    0x21FFC: 'xùn',
-    0x21FFE: 'jú',
-    0x21FFF: 'huò',
-    0x22001: 'yì',
-    0x2200A: 'xī',
-    0x2200B: 'sè',
-    0x2200C: 'jiǎo',
-    0x2200D: 'yōng',
-    0x22015: 'shī',
-    0x22016: 'jīng',
-    0x22017: 'wàn',
-    0x22018: 'yě',
-    0x22019: 'jiū',
-    0x2201C: 'gǒng',
-    0x22021: 'huī,zuǒ',
-    0x2202A: 'ěr',
-    0x22035: 'hàn',
-    0x2203C: 'fú',
-    0x22040: 'fú',
-    0x22041: 'zhuó',
-    0x22042: 'jī,jì',
-    0x2204F: 'bāng',
-    0x22052: 'qí',
-    0x22053: 'shǐ,hài',
-    0x22055: 'diǎo',
-    0x22056: 'pèi',
-    0x22057: 'xiǎn,gàn',
-    0x22058: 'sān',
-    0x2205D: 'cháng',
-    0x2205E: 'yuē',
-    0x22060: 'gōng',
-    0x22062: 'wū',
-    0x22064: 'fēn',
-    0x22067: 'chǎn',
-    0x22069: 'nèi',
-    0x2206A: 'jué',
-    0x2206C: 'zhǎo',
-    0x2206E: 'qián',
-    0x22071: 'ǎo',
-    0x22076: 'wǎng',
-    0x22077: 'zhōng',
-    0x22079: 'huāng',
-    0x2207B: 'bù',
-    0x2207C: 'zhǔ',
-    0x2207D: 'bì',
-    0x2207E: 'chāo',
-    0x2207F: 'zhēng',
-    0x22080: 'fú',
-    0x22081: 'kōu,qú',
-    0x22083: 'zuó',
-    0x22084: 'xuàn',
-    0x22086: 'fù',
-    0x2208A: 'yǎo',
-    0x2208D: 'bō',
-    0x2208F: 'bèi',
-    0x22090: 'xié',
-    0x22091: 'shì',
-    0x22092: 'yí',
-    0x22094: 'hóng',
-    0x22095: 'cuì',
-    0x22097: 'yì',
-    0x22098: 'zhuān',
-    0x2209D: 'chì',
-    0x220A4: 'pō,lù',
-    0x220A8: 'yín',
-    0x220B1: 'yuàn',
-    0x220B6: 'jiōng',
-    0x220B9: 'mào',
-    0x220BA: 'qiàn',
-    0x220BC: 'yì',
-    0x220C0: 'wú',
-    0x220CD: 'bēi',
-    0x220CE: 'huò',
-    0x220CF: 'cóng',
-    0x220D0: 'kōng',
-    0x220D5: 'tà',
-    0x220D7: 'hàn',
-    0x220D8: 'qiàn',
-    0x220DC: 'zhí',
-    0x220E2: 'sè',
-    0x220E5: 'qiān',
-    0x220E6: 'guǒ',
-    0x220E9: 'gǔn,juǎn',
-    0x220EC: 'jiān',
-    0x220ED: 'zhōng',
-    0x220EE: 'miǎn',
-    0x220EF: 'guǐ',
-    0x220F0: 'shì',
-    0x220F1: 'móu',
-    0x220F2: 'è',
-    0x220F3: 'bǎ',
-    0x220F4: 'là',
-    0x220F8: 'zhòu',
-    0x220FA: 'jí',
-    0x22100: 'zǎo',
-    0x22104: 'zhā',
-    0x22105: 'yì',
-    0x22107: 'gǒu',
-    0x2210A: 'guī',
-    0x2210B: 'yīng',
-    0x2210C: 'shǎi',
-    0x2210D: 'hé,gé',
-    0x2210E: 'bàng',
-    0x2210F: 'mò',
-    0x22110: 'méng',
-    0x22113: 'wù',
-    0x22114: 'dài',
-    0x22117: 'jiǒng',
-    0x2211C: 'hàn',
-    0x2211F: 'tōng',
-    0x22120: 'kōu',
-    0x22121: 'lí',
-    0x22122: 'zhì',
-    0x22123: 'huì',
-    0x22124: 'zǎn',
-    0x22126: 'diǎo',
-    0x22127: 'cù',
-    0x22131: 'zhì',
-    0x22133: 'kuǎ',
-    0x22135: 'xiàng',
-    0x22136: 'huà',
-    0x22137: 'liáo',
-    0x22138: 'cuì',
-    0x22139: 'qiāo',
-    0x2213A: 'jiǎo',
-    0x2213C: 'xū',
-    0x2213D: 'èr',
-    0x2213F: 'tuō',
-    0x22140: 'tán',
-    0x22141: 'zhì',
-    0x22148: 'nǎo',
-    0x22149: 'mào',
-    0x2214A: 'dì',
-    0x2214B: 'céng',
-    0x2214E: 'jiǎo',
-    0x2214F: 'lián',
-    0x22151: 'shā',
-    0x22152: 'dàn',
-    0x22155: 'suì',
-    0x22156: 'lián',
-    0x22157: 'guò',
-    0x2215A: 'biǎo,biāo',
-    0x2215C: 'cì',
-    0x2215D: 'diàn',
-    0x2215E: 'lǜ',
-    0x2215F: 'nǐ',
-    0x22160: 'yǎn',
-    0x22161: 'lán',
-    0x22164: 'gài',
-    0x22165: 'chú',
-    0x22169: 'bì',
-    0x2216A: 'zú',
-    0x2216B: 'huì',
-    0x2216D: 'lǎi',
-    0x2216E: 'xián',
-    0x2216F: 'fèn',
-    0x22170: 'hè',
-    0x22179: 'yào',
-    0x2217A: 'zhǎn',
-    0x2217C: 'néi',
-    0x2217E: 'luǒ',
-    0x22180: 'yuán',
-    0x22182: 'néng',
-    0x22189: 'rěn',
-    0x2219C: 'gé',
-    0x2219E: 'jiǎn',
-    0x2219F: 'píng',
-    0x221A3: 'biè',
-    0x221A6: 'jiàn',
-    0x221A9: 'bìng',
-    0x221AF: 'mì,xuán',
-    0x221B0: 'hù',
-    0x221B4: 'diǎo',
-    0x221B6: 'yōu,zī',
-    0x221B7: 'yāo,miào',
-    0x221B8: 'bēng',
-    0x221BA: 'chén',
-    0x221BB: 'jī,duì',
-    0x221BD: 'yāo',
-    0x221C7: 'guān',
-    0x221C8: 'yàn',
-    0x221D5: 'chǐ',
-    0x221D7: 'shà',
-    0x221D8: 'yǎn',
-    0x221D9: 'yì',
-    0x221DA: 'yì',
-    0x221DB: 'chè,chǐ',
-    0x221DE: 'hàn',
-    0x221DF: 'huāng',
-    0x221E4: 'shuì',
-    0x221E5: 'suì',
-    0x221E6: 'rén',
-    0x221E7: 'tán',
-    0x221E8: 'zhǐ',
-    0x221EA: 'fàn',
-    0x221EB: 'fěng',
-    0x221F0: 'tán',
-    0x221F2: 'mí',
-    0x221F3: 'pí',
-    0x221F4: 'bù',
-    0x221F5: 'nà',
-    0x221F6: 'tián',
-    0x221F7: 'bá',
-    0x221F8: 'yì',
-    0x22202: 'yǎn',
-    0x22204: 'tiāo',
-    0x22206: 'yáo',
-    0x22207: 'shěn',
-    0x22208: 'kē,wā',
-    0x22209: 'tóng',
-    0x2220B: 'xuǎn',
-    0x22213: 'yòu',
-    0x22215: 'bài',
-    0x22219: 'xiá',
-    0x2221A: 'lǚ',
-    0x2221B: 'kùn',
-    0x2221C: 'zāng',
-    0x2221D: 'qiú',
-    0x22220: 'cù,là',
-    0x22221: 'zuī',
-    0x22222: 'lǒu',
-    0x22224: 'xiá',
-    0x2222F: 'shēn',
-    0x22232: 'pú',
-    0x22234: 'jīng',
-    0x22235: 'qiāng',
-    0x22236: 'yì,sī',
-    0x22238: 'niè',
-    0x22239: 'duī,tuí',
-    0x2223B: 'jié',
-    0x2223C: 'suì',
-    0x2223D: 'zhàn',
-    0x2223E: 'cōu',
-    0x22241: 'bēng',
-    0x22242: 'guān',
-    0x22243: 'shě',
-    0x22245: 'jìn',
-    0x22246: 'dì',
-    0x22251: 'dān',
-    0x22253: 'nǎi',
-    0x22255: 'nóu',
-    0x22257: 'jí',
-    0x22258: 'yán',
-    0x2225A: 'nòu',
-    0x2225C: 'dù,tú',
-    0x2225D: 'wèi',
-    0x2225E: 'piān',
-    0x22262: 'hú',
-    0x22264: 'jià',
-    0x22265: 'yè',
-    0x22266: 'jǔn',
-    0x22267: 'lán,lián',
-    0x22268: 'là',
-    0x22269: 'yīn',
-    0x2226D: 'tuí',
-    0x22275: 'nǎo',
-    0x2227A: 'zǔ',
-    0x2227F: 'mà',
-    0x22280: 'sī,mà',
-    0x22281: 'zhì',
-    0x22284: 'huī',
-    0x22285: 'zhuì',
-    0x22287: 'huì',
-    0x2228D: 'chú',
-    0x2228F: 'chè',
-    0x22292: 'xiū',
-    0x22293: 'lán',
-    0x22295: 'cōng',
-    0x22296: 'shèn',
-    0x22297: 'mò',
-    0x22298: 'yī',
-    0x22299: 'yáo',
-    0x2229A: 'xǐ',
-    0x2229B: 'zuǐ',
-    0x2229C: 'bìng',
-    0x222A7: 'yú',
-    0x222A9: 'lù',
-    0x222AE: 'tuí',
-    0x222AF: 'wěi',
-    0x222B1: 'fén',
-    0x222B2: 'shěn',
-    0x222BB: 'liáo',
-    0x222C2: 'shǔ',
-    0x222C3: 'dǎn',
-    0x222C4: 'juǎn',
-    0x222C5: 'yú',
-    0x222C6: 'xìn',
-    0x222C7: 'yáo',
-    0x222C8: 'sū',
-    0x222D2: 'huó',
-    0x222D4: 'qiān',
-    0x222DA: 'má',
-    0x222DD: 'kǎi',
-    0x222E1: 'lǔ',
-    0x222E3: 'yōu',
-    0x222EE: 'xiàn',
-    0x222F9: 'wú',
-    0x222FB: 'yǐn',
-    0x222FC: 'xī',
-    0x222FF: 'zhāi',
-    0x22300: 'xiè',
-    0x22304: 'qú',
-    0x22308: 'lí',
-    0x2230D: 'qiān',
-    0x22314: 'líng',
-    0x22315: 'luán',
-    0x2231A: 'chān',
-    0x22326: 'zhèng',
-    0x22328: 'yán',
-    0x22332: 'yìn',
-    0x22333: 'kuí',
-    0x22337: 'qū',
-    0x22339: 'fú',
-    0x2233B: 'yù',
-    0x22341: 'qí,bì',
-    0x22346: 'qì,qiè',
-    0x22347: 'jì',
-    0x22348: 'yuān,zàng',
-    0x2234E: 'gào',
-    0x2234F: 'juàn',
-    0x22351: 'qí',
-    0x22353: 'gǎi',
-    0x22355: 'quàn',
-    0x2235A: 'wèi',
-    0x22367: 'zhì',
-    0x2236B: 'jiǎn',
-    0x2236D: 'sì',
-    0x22370: 'yì,zé',
-    0x22371: 'qiān',
-    0x2237C: 'lì',
-    0x2237F: 'zāng',
-    0x22380: 'yì',
-    0x22382: 'cái',
-    0x22383: 'yì',
-    0x22384: 'gē',
-    0x22386: 'dié',
-    0x22388: 'zhī',
-    0x22389: 'yì',
-    0x2238B: 'zāi',
-    0x2238C: 'dài',
-    0x2238E: 'sù',
-    0x22394: 'jié',
-    0x22395: 'chèn',
-    0x22396: 'qú',
-    0x22398: 'hàn',
-    0x22399: 'xián',
-    0x223A0: 'quán,juàn',
-    0x223A1: 'jié',
-    0x223A5: 'juàn',
-    0x223AA: 'dàn',
-    0x223AD: 'jīn',
-    0x223B4: 'bīng',
-    0x223B5: 'hú',
-    0x223B9: 'jué',
-    0x223BB: 'yú',
-    0x223C3: 'lǐ',
-    0x223C4: 'qiáng',
-    0x223C5: 'shuǐ',
-    0x223C6: 'kū',
-    0x223C8: 'zhěn',
-    0x223CD: 'fú',
-    0x223CE: 'shēn',
-    0x223D2: 'chuí',
-    0x223D5: 'tóng',
-    0x223D7: 'yì',
-    0x223D9: 'yáng',
-    0x223DC: 'tuó',
-    0x223DD: 'zhōu',
-    0x223DE: 'jí',
-    0x223E4: 'xùn',
-    0x223E6: 'shěn',
-    0x223E7: 'xuān',
-    0x223ED: 'liú',
-    0x223EE: 'yuān',
-    0x223EF: 'hú,shǐ',
-    0x223F0: 'zhèng',
-    0x223F3: 'pēng,bēng',
-    0x223F7: 'jué',
-    0x22402: 'zhì',
-    0x22403: 'piān',
-    0x22404: 'yuàn',
-    0x22406: 'jiān',
-    0x2240A: 'páng',
-    0x2240E: 'zhuàn',
-    0x22410: 'xián',
-    0x22412: 'bēng',
-    0x22414: 'cōng',
-    0x22416: 'mò',
-    0x2241A: 'guó',
-    0x2241E: 'chéng',
-    0x2241F: 'qiāo',
-    0x22426: 'bì',
-    0x22429: 'qiǎng',
-    0x2242B: 'zhōu',
-    0x22432: 'fán',
-    0x22433: 'biē',
-    0x2243E: 'bó',
-    0x2243F: 'rǎng,rǒng',
-    0x22445: 'dǐng',
-    0x22446: 'quán',
-    0x22447: 'jiù',
-    0x22448: 'yáo',
-    0x22453: 'xiá',
-    0x22456: 'zǎo',
-    0x2245D: 'dān',
-    0x2245F: 'wǔ',
-    0x22460: 'tuó',
-    0x22462: 'hū',
-    0x22467: 'xī',
-    0x2246C: 'lái',
-    0x2246E: 'fēi',
-    0x22479: 'hú',
-    0x22486: 'xiān',
-    0x22489: 'shǎn',
-    0x2248D: 'fèi',
-    0x22490: 'cuò',
-    0x22492: 'fú',
-    0x22494: 'chù',
-    0x2249D: 'diū',
-    0x2249E: 'làn',
-    0x224A9: 'xǐ',
-    0x224AF: 'biāo',
-    0x224B0: 'yù',
-    0x224B1: 'suì',
-    0x224B2: 'xǐ',
-    0x224B7: 'póu',
-    0x224B9: 'shǎn',
-    0x224BE: 'jiào',
-    0x224C0: 'yì',
-    0x224C3: 'wán',
-    0x224C4: 'jǐ',
-    0x224C6: 'wán',
-    0x224C7: 'tuì,nà',
-    0x224CB: 'àng',
-    0x224CD: 'tiān',
-    0x224CE: 'chí',
-    0x224D2: 'rán',
-    0x224D4: 'sà',
-    0x224D5: 'yín',
-    0x224D6: 'pī',
-    0x224D7: 'cǐ',
-    0x224D8: 'tóng,tāo',
-    0x224D9: 'yǐn',
-    0x224DC: 'gé',
-    0x224DD: 'tiāo',
-    0x224DE: 'zhēng',
-    0x224DF: 'zhòu',
-    0x224E1: 'yí,tí',
-    0x224E2: 'kuà',
-    0x224E3: 'sōng',
-    0x224E7: 'dì',
-    0x224EC: 'xié',
-    0x224EE: 'xiāo',
-    0x224EF: 'guàng,wǎng',
-    0x224F0: 'tuǒ',
-    0x224F1: 'fēng,fèng',
-    0x224F2: 'wú,hú',
-    0x224F5: 'xiù',
-    0x224FF: 'yóu',
-    0x22501: 'líng',
-    0x22502: 'yàn',
-    0x22505: 'dōng',
-    0x22506: 'qì',
-    0x22507: 'táo',
-    0x22508: 'hán',
-    0x2250A: 'chí',
-    0x2250B: 'sōng',
-    0x22511: 'quǎn',
-    0x22514: 'hàn,jí',
-    0x2251F: 'rǒu,niǔ',
-    0x22520: 'qì',
-    0x22521: 'kāi',
-    0x22522: 'yú',
-    0x22523: 'chā,shà',
-    0x22524: 'chèng',
-    0x22525: 'yù',
-    0x22527: 'bìng',
-    0x22529: 'cōng,sǒng',
-    0x2252A: 'zhū',
-    0x2252C: 'yù',
-    0x22531: 'jué,què',
-    0x22532: 'liù',
-    0x22533: 'sāo',
-    0x22534: 'yù',
-    0x22545: 'shuài',
-    0x2254B: 'yuàn',
-    0x2254E: 'zhāng',
-    0x22551: 'shuài',
-    0x22553: 'chǔ',
-    0x22554: 'zhāng,zhàng',
-    0x22555: 'sǎn,sàn',
-    0x22556: 'xiān',
-    0x22558: 'cuī',
-    0x22559: 'měng',
-    0x2255A: 'dí',
-    0x2255E: 'zhì',
-    0x2255F: 'ào',
-    0x22566: 'xiū',
-    0x22568: 'pián',
-    0x2256A: 'jiào',
-    0x2256B: 'kuǎn',
-    0x2256C: 'sà',
-    0x2256D: 'xiàn',
-    0x2256E: 'zhà',
-    0x2256F: 'diàn',
-    0x22577: 'yí',
-    0x2257A: 'huì',
-    0x2257B: 'shàn',
-    0x22584: 'chóng',
-    0x22585: 'yí',
-    0x22586: 'xiè',
-    0x22587: 'zhì',
-    0x22588: 'tiào',
-    0x2258A: 'pīng',
-    0x2258B: 'xián',
-    0x2258E: 'xiān',
-    0x2258F: 'sù',
-    0x22591: 'cuán',
-    0x22597: 'sǒng',
-    0x2259B: 'hēi',
-    0x2259D: 'xiàn',
-    0x2259F: 'yóu',
-    0x225A1: 'yù',
-    0x225A4: 'tái',
-    0x225A6: 'jué',
-    0x225A7: 'nàng',
-    0x225A9: 'diān',
-    0x225AB: 'yì',
-    0x225AC: 'bì',
-    0x225B3: 'xū',
-    0x225B4: 'yì',
-    0x225B5: 'rù',
-    0x225B7: 'gōng',
-    0x225BA: 'yì',
-    0x225BF: 'zhì',
-    0x225C0: 'xīn',
-    0x225C2: 'jì',
-    0x225C4: 'xià',
-    0x225C8: 'zhāo',
-    0x225C9: 'nè',
-    0x225CA: 'xiè,jiá',
-    0x225CE: 'yì',
-    0x225EB: 'fǔ',
-    0x225ED: 'shè',
-    0x225EF: 'yuán',
-    0x225F0: 'fǎn',
-    0x225F2: 'fū',
-    0x225F3: 'wù',
-    0x225F4: 'xī',
-    0x225F5: 'hǒng',
-    0x225F9: 'jì',
-    0x225FA: 'chàng',
-    0x225FF: 'mò',
-    0x22600: 'pèi',
-    0x22603: 'mú,wǔ',
-    0x22604: 'qiú',
-    0x22605: 'mào,róu',
-    0x22607: 'dá,dàn',
-    0x22609: 'xiá',
-    0x2260A: 'shēn',
-    0x2260B: 'tè',
-    0x2260C: 'hóng',
-    0x2260D: 'bì,fú',
-    0x2261D: 'nǐ',
-    0x2261F: 'qiáo',
-    0x22627: 'ruǎn',
-    0x22638: 'jiàng',
-    0x22639: 'chā',
-    0x2263A: 'mǐ,mí',
-    0x2263D: 'yì',
-    0x2263F: 'suō',
-    0x22641: 'wù',
-    0x22642: 'xuān',
-    0x22645: 'xí',
-    0x22647: 'yǐ',
-    0x22650: 'náo',
-    0x22653: 'wèi',
-    0x2266E: 'kàn',
-    0x22671: 'lòng',
-    0x22672: 'lǚ',
-    0x22673: 'zhuǎng',
-    0x2267A: 'zhì',
-    0x2267C: 'xìng',
-    0x2267E: 'gěng',
-    0x2267F: 'jìn',
-    0x22680: 'xiàn',
-    0x22681: 'jì',
-    0x22682: 'cuò',
-    0x22684: 'láo',
-    0x22685: 'fěn',
-    0x22686: 'jù',
-    0x2268B: 'miào',
-    0x2268C: 'xiá',
-    0x22691: 'sù',
-    0x226A8: 'zhì',
-    0x226AA: 'hù',
-    0x226AB: 'kòu',
-    0x226AD: 'suǒ',
-    0x226AE: 'nì',
-    0x226BA: 'tēng',
-    0x226BB: 'zhù',
-    0x226C1: 'dá,chè',
-    0x226C3: 'qiú',
-    0x226C4: 'yà',
-    0x226C6: 'xián',
-    0x226C9: 'nèi',
-    0x226CD: 'zhǐ',
-    0x226CE: 'bié',
-    0x226D2: 'chǒng',
-    0x226D3: 'lán',
-    0x226D4: 'dōng',
-    0x226D5: 'qūn',
-    0x226D6: 'xiàng',
-    0x226D8: 'xiáo',
-    0x226D9: 'wǎn',
-    0x226DA: 'rù',
-    0x226DB: 'wàng',
-    0x226DC: 'nì',
-    0x226DE: 'bāi',
-    0x226DF: 'yà',
-    0x226E5: 'sī',
-    0x226E6: 'yǐn',
-    0x226E8: 'yù',
-    0x226EE: 'lí',
-    0x226EF: 'huò',
-    0x22717: 'bàng',
-    0x22723: 'xī',
-    0x22725: 'jiū',
-    0x22728: 'xiè,dié',
-    0x22729: 'qiān',
-    0x2272A: 'nuò,ruò',
-    0x2272B: 'xǐng',
-    0x2272C: 'duó',
-    0x2272D: 'jǐ',
-    0x2272E: 'wǔ',
-    0x2272F: 'mú,móu,mǔ',
-    0x22730: 'yàn,yǎn',
-    0x22731: 'qì',
-    0x22732: 'ná',
-    0x22733: 'chì',
-    0x22734: 'hóu',
-    0x22736: 'sào',
-    0x22738: 'náo',
-    0x2273B: 'chěng',
-    0x2273C: 'chěng',
-    0x2273D: 'kuí,kuǐ',
-    0x2273F: 'jià',
-    0x22740: 'tú',
-    0x22741: 'hōng',
-    0x22742: 'dú',
-    0x22745: 'xiá',
-    0x22746: 'zhòng',
-    0x22747: 'huò',
-    0x22748: 'chóng',
-    0x22749: 'dá',
-    0x2274C: 'mào',
-    0x2274D: 'yào',
-    0x22753: 'juān',
-    0x2276C: 'shì',
-    0x2276F: 'yín',
-    0x22773: 'gǔ',
-    0x22774: 'wù',
-    0x22778: 'guò',
-    0x22779: 'tì',
-    0x2277B: 'hōng',
-    0x22787: 'rě',
-    0x22789: 'yí',
-    0x2278B: 'tǔn',
-    0x2278F: 'qióng',
-    0x22790: 'hài',
-    0x22792: 'qì',
-    0x22795: 'huò',
-    0x22796: 'tì',
-    0x22797: 'pī,bī',
-    0x2279A: 'gěng',
-    0x2279C: 'xiè',
-    0x2279E: 'mì,mí',
-    0x2279F: 'gào',
-    0x227A0: 'tā',
-    0x227A1: 'xiǎng',
-    0x227A3: 'shū',
-    0x227A6: 'fú',
-    0x227AC: 'zhuān',
-    0x227AD: 'liù',
-    0x227C5: 'yóu',
-    0x227CA: 'chěng',
-    0x227CB: 'duī',
-    0x227E2: 'lí',
-    0x227E3: 'yàng',
-    0x227E4: 'lí',
-    0x227E7: 'lǔ',
-    0x227E8: 'mǔ',
-    0x227E9: 'suì',
-    0x227EA: 'ài,xì',
-    0x227ED: 'kòu',
-    0x227EF: 'zhé,shì',
-    0x227F0: 'ài',
-    0x227F1: 'téng',
-    0x227F3: 'lǜ',
-    0x227F4: 'tuí',
-    0x227F5: 'bī',
-    0x227FE: 'huì',
-    0x227FF: 'huán',
-    0x2281B: 'kuò',
-    0x2281D: 'xīn',
-    0x22821: 'sào',
-    0x2282B: 'shù',
-    0x2282C: 'què',
-    0x2282D: 'bā',
-    0x2282E: 'tuì',
-    0x22832: 'fù',
-    0x22833: 'biē',
-    0x22835: 'tǎng',
-    0x22837: 'xiàng',
-    0x22839: 'sī,xī',
-    0x2283A: 'bó',
-    0x2283C: 'mái',
-    0x2283D: 'dàng',
-    0x2283F: 'guì',
-    0x22840: 'hēi',
-    0x22841: 'xī',
-    0x22842: 'dàng',
-    0x22843: 'yì',
-    0x22845: 'bī',
-    0x22847: 'gū',
-    0x22848: 'cuì',
-    0x22849: 'sè',
-    0x2284D: 'gé',
-    0x2284E: 'yù',
-    0x2284F: 'nǎ',
-    0x22851: 'lì',
-    0x22852: 'zhì',
-    0x22870: 'zhào',
-    0x22874: 'jī',
-    0x22875: 'ruǎn',
-    0x22879: 'chòng',
-    0x22882: 'jié',
-    0x2288C: 'chàng',
-    0x2288D: 'zhé',
-    0x22892: 'sū,sù',
-    0x22893: 'yōng',
-    0x22896: 'qì',
-    0x22897: 'zhuó',
-    0x2289A: 'kài',
-    0x2289C: 'yè',
-    0x2289E: 'qì,jì,kuài',
-    0x228B9: 'xiòng',
-    0x228C9: 'yī',
-    0x228CA: 'chǒu',
-    0x228CE: 'tuǎn',
-    0x228CF: 'ài',
-    0x228D0: 'pīn',
-    0x228D3: 'liè',
-    0x228D4: 'mián',
-    0x228D5: 'ài,chī',
-    0x228D7: 'mǒ',
-    0x228D8: 'wèi',
-    0x228D9: 'yìng',
-    0x228DA: 'nǐ',
-    0x228DE: 'bó',
-    0x228E0: 'liù',
-    0x228F3: 'ruì',
-    0x228F5: 'chú',
-    0x228FB: 'lǘ',
-    0x228FC: 'chá',
-    0x228FF: 'chù',
-    0x22901: 'sào',
-    0x22902: 'lí',
-    0x22904: 'sōng',
-    0x22906: 'lì,là',
-    0x2290B: 'xì',
-    0x2290D: 'yān',
-    0x2290E: 'cuō,zuǒ',
-    0x22910: 'liú',
-    0x22918: 'méng',
-    0x2291A: 'zhàn',
-    0x22924: 'zhuàng',
-    0x22927: 'miǎo',
-    0x22929: 'lì',
-    0x2292B: 'jǔ',
-    0x2292F: 'xiè',
-    0x22930: 'xiè',
-    0x22931: 'lǒng',
-    0x22932: 'lóng',
-    0x22942: 'téng',
-    0x22943: 'zhù',
-    0x2294B: 'chán',
-    0x2294C: 'xiǎn',
-    0x2294F: 'yíng',
-    0x22950: 'pèi',
-    0x22958: 'xié',
-    0x2295A: 'jiào',
-    0x2295E: 'chōng',
-    0x22973: 'hē',
-    0x2297D: 'tǔn',
-    0x22985: 'hǒng,zhuàng',
-    0x22988: 'mán',
-    0x2298A: 'jīn',
-    0x2298C: 'qú',
-    0x2298D: 'dǒu',
-    0x2298E: 'qiú',
-    0x2298F: 'zāi',
-    0x22991: 'shēng',
-    0x22992: 'zāi',
-    0x22995: 'yǐ,zhí',
-    0x2299A: 'huà',
-    0x2299F: 'kān',
-    0x229B0: 'yuè',
-    0x229B1: 'nì',
-    0x229B2: 'sī',
-    0x229B4: 'wǒ',
-    0x229B8: 'cán',
-    0x229BA: 'jiān',
-    0x229BC: 'miè',
-    0x229BD: 'sháo,qī',
-    0x229BF: 'rǒng',
-    0x229C0: 'gān',
-    0x229C5: 'qiáng',
-    0x229C7: 'shú',
-    0x229C8: 'zhuó',
-    0x229CF: 'shī',
-    0x229D1: 'tì',
-    0x229D6: 'zhá',
-    0x229D7: 'zhān',
-    0x229DD: 'fèn',
-    0x229DE: 'miè',
-    0x229E0: 'zè',
-    0x229E4: 'zhì',
-    0x229E5: 'qiān',
-    0x229E6: 'hàn',
-    0x229E7: 'gé',
-    0x229EE: 'cán',
-    0x229F0: 'guó',
-    0x229F1: 'jiāo',
-    0x229F3: 'yōng',
-    0x229F4: 'áo',
-    0x229FB: 'zhá',
-    0x229FD: 'xì',
-    0x22A01: 'xū',
-    0x22A02: 'wǔ',
-    0x22A0F: 'jué',
-    0x22A10: 'jí,jī',
-    0x22A12: 'chì',
-    0x22A14: 'wǎn',
-    0x22A16: 'miè',
-    0x22A17: 'zéi',
-    0x22A1C: 'jié',
-    0x22A1D: 'shí',
-    0x22A1F: 'xī,xì',
-    0x22A21: 'è',
-    0x22A25: 'hù',
-    0x22A26: 'hù',
-    0x22A28: 'lì',
-    0x22A2B: 'chù',
-    0x22A2E: 'yī',
-    0x22A2F: 'mǎo',
-    0x22A30: 'xū',
-    0x22A31: 'zhōng',
-    0x22A33: 'yì',
-    0x22A3A: 'liáo',
-    0x22A3F: 'jiān',
-    0x22A40: 'jiǎn',
-    0x22A41: 'jú',
-    0x22A44: 'zhù',
-    0x22A48: 'wǔ',
-    0x22A4F: 'kè',
-    0x22A50: 'kě',
-    0x22A51: 'lì',
-    0x22A52: 'bǐ',
-    0x22A53: 'gé',
-    0x22A55: 'xū',
-    0x22A56: 'shā',
-    0x22A57: 'líng',
-    0x22A58: 'kē',
-    0x22A5E: 'bó',
-    0x22A5F: 'biān',
-    0x22A60: 'shuān',
-    0x22A61: 'qí',
-    0x22A62: 'shàn',
-    0x22A66: 'jī',
-    0x22A68: 'qiǎo,xiǔ',
-    0x22A6E: 'yì',
-    0x22A6F: 'jué',
-    0x22A70: 'zhǎng',
-    0x22A72: 'xìn',
-    0x22A77: 'tuō',
-    0x22A78: 'hài',
-    0x22A79: 'xià',
-    0x22A7B: 'tuó',
-    0x22A7C: 'yí',
-    0x22A83: 'cù',
-    0x22A87: 'jiāng',
-    0x22A88: 'nán',
-    0x22A8B: 'pěng,féng,bàng',
-    0x22A8D: 'jié,jiā',
-    0x22A8E: 'xuē',
-    0x22A8F: 'hú,gǔ',
-    0x22AA5: 'yǒu',
-    0x22AA6: 'nǔ',
-    0x22AA7: 'yè',
-    0x22AAA: 'yìn',
-    0x22AAC: 'kǒng',
-    0x22AB6: 'xiāo',
-    0x22AB7: 'xiāng',
-    0x22ABC: 'náo',
-    0x22ABE: 'zhàng',
-    0x22AD0: 'jié',
-    0x22AD3: 'nǔ',
-    0x22AD4: 'shàn,quán',
-    0x22AE2: 'jiá',
-    0x22AE7: 'zhǒu',
-    0x22AE8: 'rǒng,rēng',
-    0x22AEB: 'lù',
-    0x22AEC: 'sà,cuō,shā',
-    0x22AED: 'nù',
-    0x22AEF: 'bó',
-    0x22AF0: 'zhé',
-    0x22AF2: 'qǐn',
-    0x22AF4: 'cī',
-    0x22AF5: 'zú',
-    0x22AF7: 'wǒ',
-    0x22AF8: 'wǔ,wū',
-    0x22AFB: 'nié',
-    0x22AFF: 'xiān',
-    0x22B00: 'hóng',
-    0x22B2B: 'tìng',
-    0x22B2C: 'jǐn',
-    0x22B31: 'jié',
-    0x22B32: 'hè',
-    0x22B33: 'tū',
-    0x22B34: 'zhé,niè,dié',
-    0x22B35: 'pīn,pān,biàn,fān',
-    0x22B36: 'jìn',
-    0x22B37: 'nàn',
-    0x22B3C: 'dùn',
-    0x22B3E: 'xī',
-    0x22B3F: 'xiè',
-    0x22B41: 'xì',
-    0x22B42: 'láo',
-    0x22B43: 'duǎn,dòu',
-    0x22B44: 'jì',
-    0x22B45: 'chā',
-    0x22B46: 'chōu',
-    0x22B48: 'gāng',
-    0x22B4E: 'xiáng',
-    0x22B4F: 'dǎo',
-    0x22B65: 'biàn',
-    0x22B66: 'xiāo',
-    0x22B67: 'xīn',
-    0x22B81: 'yǔ',
-    0x22B82: 'xián',
-    0x22B83: 'lí',
-    0x22B84: 'qiǎn',
-    0x22B87: 'měi',
-    0x22B89: 'qiāo',
-    0x22B8A: 'yà',
-    0x22B8C: 'qiā,jié',
-    0x22B8D: 'qiòng',
-    0x22B8F: 'bàng',
-    0x22B90: 'zhēng',
-    0x22B9A: 'zè',
-    0x22B9B: 'shuàn,tuán',
-    0x22B9E: 'sào',
-    0x22BC5: 'lù,jué',
-    0x22BC9: 'xié',
-    0x22BCB: 'fǔ',
-    0x22BCC: 'zhài',
-    0x22BE9: 'zè',
-    0x22BEB: 'duàn,wǎn',
-    0x22BED: 'dèng',
-    0x22BEE: 'yù',
-    0x22BF0: 'lǜ',
-    0x22BF2: 'wàn',
-    0x22BF3: 'xué',
-    0x22BF4: 'jiǎo',
-    0x22BF5: 'yuě',
-    0x22BF6: 'zhì',
-    0x22BF7: 'wěi,huī',
-    0x22BF9: 'gé',
-    0x22BFA: 'jǔ',
-    0x22BFC: 'yǎn',
-    0x22BFD: 'cuò',
-    0x22BFE: 'mào',
-    0x22C06: 'fú',
-    0x22C07: 'āi',
-    0x22C0A: 'xuān',
-    0x22C0C: 'gāng',
-    0x22C0D: 'ān',
-    0x22C12: 'jí',
-    0x22C18: 'pí',
-    0x22C19: 'zhǐ',
-    0x22C1C: 'nuó',
-    0x22C3F: 'pàn',
-    0x22C41: 'yí',
-    0x22C44: 'jié',
-    0x22C46: 'zī',
-    0x22C48: 'jià',
-    0x22C49: 'wǎi',
-    0x22C4C: 'jià',
-    0x22C5F: 'chǎn,chī',
-    0x22C61: 'suǒ',
-    0x22C62: 'suǒ,sè',
-    0x22C63: 'jí',
-    0x22C64: 'sǒng',
-    0x22C66: 'tī',
-    0x22C67: 'pī',
-    0x22C68: 'pó',
-    0x22C6E: 'mì',
-    0x22C74: 'yè',
-    0x22C76: 'qìn',
-    0x22C77: 'jìn',
-    0x22C7A: 'juē',
-    0x22C7D: 'yuān',
-    0x22C7E: 'ruán',
-    0x22C94: 'bàn,bān,pān',
-    0x22CB0: 'bīn',
-    0x22CB4: 'wèi',
-    0x22CB5: 'zào',
-    0x22CB6: 'qiè',
-    0x22CB7: 'sōu',
-    0x22CB8: 'lǔ',
-    0x22CBC: 'dié',
-    0x22CBD: 'chuāi',
-    0x22CBE: 'bì',
-    0x22CBF: 'zhú',
-    0x22CC0: 'mā,mó',
-    0x22CC1: 'fèi',
-    0x22CC2: 'piē',
-    0x22CC3: 'yìn',
-    0x22CC4: 'xuàn,xuán',
-    0x22CC6: 'ào,áo',
-    0x22CC7: 'zhuó,zú',
-    0x22CC8: 'zú',
-    0x22CCB: 'bǐ',
-    0x22CD1: 'làng',
-    0x22CD3: 'tì',
-    0x22CD9: 'tiǎo',
-    0x22CDA: 'jiān',
-    0x22CDF: 'tǒng',
-    0x22CFD: 'duō',
-    0x22CFE: 'dòng',
-    0x22D02: 'biǎn',
-    0x22D20: 'zhì',
-    0x22D22: 'fén',
-    0x22D26: 'káng',
-    0x22D27: 'zhì',
-    0x22D28: 'zhāi,zhì,chì',
-    0x22D29: 'bì',
-    0x22D2A: 'kuǎn',
-    0x22D2C: 'bàn',
-    0x22D2D: 'juē',
-    0x22D2E: 'qū',
-    0x22D30: 'qī',
-    0x22D31: 'léi',
-    0x22D32: 'xié,jié',
-    0x22D33: 'tāng',
-    0x22D3C: 'sōu',
-    0x22D3E: 'bèi',
-    0x22D47: 'yàng',
-    0x22D48: 'jiǎn,zhǎn',
-    0x22D65: 'zào',
-    0x22D80: 'zhuài,chuái',
-    0x22D83: 'fán',
-    0x22D85: 'shé',
-    0x22D87: 'qióng',
-    0x22D89: 'pò',
-    0x22D8B: 'tiě',
-    0x22D8C: 'shā',
-    0x22D8D: 'zá,sà',
-    0x22D91: 'niǎo',
-    0x22D92: 'guài',
-    0x22D93: 'cuǐ',
-    0x22DA1: 'qiào,jiǎo',
-    0x22DA3: 'dié',
-    0x22DB3: 'pīn',
-    0x22DB4: 'cí',
-    0x22DB6: 'bàng',
-    0x22DCD: 'yìn',
-    0x22DD1: 'xiǎn',
-    0x22DD4: 'yǐ',
-    0x22DD5: 'miǎo',
-    0x22DD6: 'duǎn',
-    0x22DD7: 'zhòu',
-    0x22DD9: 'kōng',
-    0x22DE2: 'zhāng',
-    0x22DF6: 'liú',
-    0x22DF8: 'zhǐ',
-    0x22DF9: 'chǎn',
-    0x22DFA: 'dú',
-    0x22DFB: 'yuán',
-    0x22DFE: 'suò,cè',
-    0x22DFF: 'jié',
-    0x22E00: 'lì',
-    0x22E01: 'gǒng',
-    0x22E0C: 'bāng',
-    0x22E17: 'guó',
-    0x22E18: 'liáo',
-    0x22E19: 'shěn',
-    0x22E23: 'niǎo',
-    0x22E25: 'cuàn',
-    0x22E26: 'wěi',
-    0x22E28: 'tuō',
-    0x22E2B: 'sū',
-    0x22E2D: 'lóng',
-    0x22E33: 'xiāo',
-    0x22E34: 'yǎn,yán',
-    0x22E43: 'qǐng',
-    0x22E4D: 'xī',
-    0x22E4F: 'yú',
-    0x22E51: 'zhèng,zhēng',
-    0x22E52: 'xiè',
-    0x22E53: 'chāi',
-    0x22E54: 'fèn',
-    0x22E56: 'guó',
-    0x22E58: 'jǐng',
-    0x22E59: 'làn',
-    0x22E5A: 'xiān',
-    0x22E5D: 'líng',
-    0x22E6E: 'lěi',
-    0x22E72: 'jùn',
-    0x22E73: 'xiào',
-    0x22E7C: 'zá',
-    0x22E84: 'guān',
-    0x22E85: 'qiè',
-    0x22E86: 'luò',
-    0x22E87: 'yào',
-    0x22E88: 'luán',
-    0x22E89: 'tà',
-    0x22E91: 'luò',
-    0x22E9E: 'bǎ',
-    0x22E9F: 'chàn',
-    0x22EA1: 'zhuó',
-    0x22EAB: 'tiǎo',
-    0x22EAF: 'wān',
-    0x22EB0: 'líng,lìng',
-    0x22EB4: 'yù',
-    0x22EB5: 'qì,qǐ',
-    0x22EB7: 'qí',
-    0x22EBC: 'jì',
-    0x22EBD: 'bó,jiào',
-    0x22EBF: 'shī',
-    0x22EC0: 'fǔ',
-    0x22EC2: 'guī',
-    0x22EC5: 'diǎn',
-    0x22EC7: 'hāo',
-    0x22EC9: 'gǎi',
-    0x22ECB: 'qí',
-    0x22ED3: 'chéng',
-    0x22ED4: 'huì',
-    0x22ED7: 'xiá,guī',
-    0x22ED8: 'shí',
-    0x22ED9: 'zhì',
-    0x22EDA: 'qí',
-    0x22EDC: 'hài',
-    0x22EDF: 'jiǎo',
-    0x22EE0: 'lì',
-    0x22EE2: 'liǎo',
-    0x22EE4: 'qiāo,qiáo',
-    0x22EE8: 'sà',
-    0x22EEA: 'qī',
-    0x22EEB: 'shī',
-    0x22EEE: 'jié,fú',
-    0x22EF5: 'bèi,lù',
-    0x22EF6: 'biān',
-    0x22EF7: 'bā',
-    0x22EF8: 'jūn',
-    0x22EF9: 'pī',
-    0x22EFC: 'dǎn',
-    0x22EFF: 'táng',
-    0x22F00: 'kuǐ',
-    0x22F01: 'kū',
-    0x22F03: 'kǒu',
-    0x22F09: 'shī',
-    0x22F0A: 'shī,tuó',
-    0x22F0B: 'jī',
-    0x22F0C: 'bào',
-    0x22F10: 'kě',
-    0x22F11: 'kuāng',
-    0x22F16: 'mǐn',
-    0x22F19: 'liáo',
-    0x22F1A: 'è',
-    0x22F1B: 'gé,guó,è',
-    0x22F1F: 'wǎng',
-    0x22F20: 'duó',
-    0x22F23: 'qià',
-    0x22F24: 'huá',
-    0x22F26: 'hǒng',
-    0x22F29: 'pēng',
-    0x22F2B: 'jiào',
-    0x22F30: 'qū',
-    0x22F31: 'zì',
-    0x22F32: 'zhòu',
-    0x22F33: 'kuāng',
-    0x22F35: 'shā',
-    0x22F37: 'jì',
-    0x22F38: 'wēi,wéi',
-    0x22F39: 'pū,bǔ',
-    0x22F3A: 'xué',
-    0x22F3C: 'shāo',
-    0x22F42: 'láng',
-    0x22F43: 'zhǐ',
-    0x22F44: 'tǐng',
-    0x22F47: 'dà',
-    0x22F55: 'yáng',
-    0x22F56: 'jìn',
-    0x22F57: 'zhǐ',
-    0x22F5A: 'zhuó,dū',
-    0x22F5C: 'zá',
-    0x22F5D: 'chán',
-    0x22F62: 'mào',
-    0x22F66: 'kōng',
-    0x22F67: 'zhōu',
-    0x22F68: 'hū',
-    0x22F69: 'pēng',
-    0x22F6D: 'jiù',
-    0x22F78: 'chuò',
-    0x22F79: 'mǐn',
-    0x22F7E: 'xiào',
-    0x22F80: 'dǔ',
-    0x22F81: 'wéi',
-    0x22F83: 'cán',
-    0x22F84: 'yú',
-    0x22F85: 'dù',
-    0x22F86: 'kāi',
-    0x22F87: 'pì',
-    0x22F8A: 'chéng',
-    0x22F8E: 'chǔn',
-    0x22F90: 'shǎo',
-    0x22F91: 'yǎn',
-    0x22F92: 'kuài',
-    0x22F94: 'yuē',
-    0x22FA6: 'qí',
-    0x22FA7: 'zhēng',
-    0x22FA9: 'kè',
-    0x22FAA: 'qí',
-    0x22FAB: 'zhǐ',
-    0x22FAC: 'lù',
-    0x22FB1: 'pī',
-    0x22FB2: 'nuò',
-    0x22FB3: 'pǎo',
-    0x22FBA: 'fěi',
-    0x22FBF: 'wén',
-    0x22FC2: 'méng',
-    0x22FC8: 'shǎn',
-    0x22FCC: 'xiòng,xuàn',
-    0x22FCE: 'duò',
-    0x22FCF: 'biào,pāo',
-    0x22FDA: 'yōu',
-    0x22FDC: 'màn',
-    0x22FDE: 'liǎo',
-    0x22FE1: 'xié',
-    0x22FE2: 'luàn',
-    0x22FE3: 'qiāo',
-    0x22FE4: 'dèng',
-    0x22FE6: 'chéng',
-    0x22FE7: 'chéng',
-    0x22FED: 'chuò',
-    0x22FF8: 'cè',
-    0x23000: 'léi',
-    0x23001: 'zhǎn',
-    0x23002: 'lǐ',
-    0x23003: 'lián',
-    0x23004: 'qún',
-    0x2300D: 'chén',
-    0x2300F: 'chéng',
-    0x23010: 'gū',
-    0x23012: 'zòng',
-    0x23013: 'chóu,dǎo',
-    0x23014: 'chuàn,chuò',
-    0x2301C: 'lèi',
-    0x2301D: 'shuò',
-    0x2301E: 'lǜ',
-    0x23023: 'fú',
-    0x23025: 'lì',
-    0x23027: 'sàn',
-    0x2302B: 'sān',
-    0x2302F: 'sà',
-    0x23033: 'niè',
-    0x23036: 'zuān',
-    0x23037: 'lǐ,lí',
-    0x2303B: 'shǔ,zhǔ',
-    0x2303E: 'fú',
-    0x23049: 'bì',
-    0x2304D: 'dào',
-    0x23052: 'shī',
-    0x23056: 'gàn',
-    0x23057: 'tàn',
-    0x2305C: 'màn',
-    0x2305F: 'lí',
-    0x23062: 'bì',
-    0x23066: 'pán',
-    0x23068: 'yōu',
-    0x2306D: 'jiū',
-    0x2306F: 'guō',
-    0x23070: 'liáo',
-    0x23073: 'wò',
-    0x23074: 'qià',
-    0x23075: 'dǒu',
-    0x23077: 'liè',
-    0x23079: 'jiǎo',
-    0x2307B: 'liè,luō',
-    0x23081: 'tiāo,qiāo',
-    0x23084: 'guō',
-    0x23086: 'pāng',
-    0x23087: 'qiāo',
-    0x23089: 'dí',
-    0x2308A: 'yùn',
-    0x23092: 'lè',
-    0x23096: 'sī',
-    0x23097: 'xīn',
-    0x2309C: 'xīn',
-    0x2309D: 'xiàng',
-    0x2309E: 'luǒ',
-    0x230A4: 'bēng',
-    0x230A5: 'tiāo,qiāo',
-    0x230AC: 'xiào',
-    0x230AE: 'dōu,tóu',
-    0x230B3: 'dàng',
-    0x230B4: 'tíng',
-    0x230B5: 'zhuàn',
-    0x230BB: 'ōu,kōu',
-    0x230BD: 'wò',
-    0x230C4: 'xīn',
-    0x230C5: 'ruǎn',
-    0x230C8: 'zhuó',
-    0x230C9: 'dàng',
-    0x230CD: 'cuì,chà',
-    0x230D1: 'zhuó',
-    0x230D7: 'cóng',
-    0x230D8: 'chǎn,chuáng',
-    0x230DD: 'yǎng',
-    0x230E7: 'yǎn',
-    0x230F3: 'yǎn,yè',
-    0x230F5: 'zhèn,shēn',
-    0x230FD: 'nuǒ',
-    0x230FE: 'yàn',
-    0x23105: 'fǎng',
-    0x23109: 'yǎn',
-    0x2310A: 'yú',
-    0x2310D: 'tí',
-    0x2310E: 'fù',
-    0x2310F: 'běn',
-    0x23111: 'yǎn',
-    0x23113: 'huī',
-    0x23119: 'huǎng',
-    0x2311C: 'guì',
-    0x2311D: 'yàn',
-    0x2311F: 'hú',
-    0x23120: 'biāo',
-    0x23127: 'suì,wéi',
-    0x2312E: 'zì',
-    0x2312F: 'jì',
-    0x23130: 'ě',
-    0x23131: 'jì',
-    0x23132: 'kuǐ',
-    0x23134: 'liàng',
-    0x23138: 'huò',
-    0x2313A: 'wéi',
-    0x2313B: 'zhuō',
-    0x2313F: 'tǐng',
-    0x23143: 'zǎi',
-    0x23144: 'yòu',
-    0x23149: 'rèn',
-    0x2314D: 'miàn,bīng',
-    0x2315A: 'nà,niǔ',
-    0x2315D: 'tū',
-    0x2315F: 'dān',
-    0x23161: 'jué',
-    0x23164: 'xū',
-    0x23165: 'dī',
-    0x23170: 'xiàng',
-    0x23177: 'xiòng',
-    0x2317A: 'yǒu',
-    0x2317B: 'guǎ,jiōng',
-    0x2317E: 'xī',
-    0x23188: 'hè',
-    0x2318D: 'dǐng',
-    0x23190: 'lú',
-    0x23192: 'xú',
-    0x23194: 'zhòu',
-    0x23195: 'xiàn',
-    0x23196: 'huāng',
-    0x23197: 'chā',
-    0x23198: 'shǐ',
-    0x23199: 'gàn',
-    0x2319A: 'nuǒ,chǐ',
-    0x2319B: 'àn,wǎn',
-    0x2319F: 'xiē,jiē',
-    0x231A7: 'hào',
-    0x231B2: 'qīn',
-    0x231B3: 'gěng',
-    0x231B4: 'shān',
-    0x231B5: 'fú',
-    0x231BD: 'zè',
-    0x231C7: 'dàn',
-    0x231D6: 'diǎn',
-    0x231D7: 'shēn',
-    0x231D9: 'zǔ',
-    0x231E2: 'biē',
-    0x231E6: 'chuí',
-    0x231E7: 'zhè',
-    0x231E8: 'dài',
-    0x231EB: 'wǒ',
-    0x231EC: 'qióng',
-    0x231F0: 'lín',
-    0x231F2: 'hūn',
-    0x231F3: 'jī',
-    0x23205: 'cáo',
-    0x2320A: 'mù',
-    0x2320D: 'dié',
-    0x2320E: 'wèi',
-    0x23220: 'biàn',
-    0x23221: 'tǐ',
-    0x23225: 'tú',
-    0x23236: 'gèng',
-    0x23244: 'chí',
-    0x23245: 'còu',
-    0x23246: 'tǐ',
-    0x23252: 'huò',
-    0x23253: 'qī',
-    0x23254: 'sāo',
-    0x23255: 'sàng',
-    0x23256: 'xuǎn',
-    0x23257: 'àng',
-    0x23258: 'nài',
-    0x2325A: 'yáng',
-    0x2325B: 'shū',
-    0x2325C: 'shā',
-    0x23261: 'tǐng',
-    0x23269: 'yà',
-    0x2326A: 'huǎng',
-    0x2326E: 'bīn',
-    0x2327E: 'òu',
-    0x2327F: 'cáo',
-    0x23281: 'áo',
-    0x23283: 'mào',
-    0x23294: 'méng',
-    0x23296: 'tiān',
-    0x2329D: 'sàng',
-    0x2329E: 'xù',
-    0x2329F: 'kàn',
-    0x232A7: 'lǎng,zhào',
-    0x232B6: 'biē',
-    0x232B7: 'cóng',
-    0x232BA: 'xián',
-    0x232C4: 'tūn',
-    0x232C9: 'yù',
-    0x232CA: 'dàn',
-    0x232CB: 'yìng',
-    0x232CD: 'zhāo',
-    0x232CF: 'pù',
-    0x232D8: 'huì',
-    0x232DE: 'ài',
-    0x232DF: 'mǒ',
-    0x232E2: 'jīng',
-    0x232E3: 'lán',
-    0x232F2: 'liè',
-    0x232F3: 'piǎo,bào',
-    0x232F5: 'bó',
-    0x232F6: 'qióng',
-    0x232F9: 'bì',
-    0x232FF: 'yōng',
-    0x23305: 'lì',
-    0x2330D: 'niè',
-    0x2330F: 'dé',
-    0x23313: 'huān',
-    0x23317: 'yuè',
-    0x2331A: 'chūn',
-    0x2331C: 'lì',
-    0x2331E: 'zhāng',
-    0x2331F: 'líng',
-    0x23320: 'chún',
-    0x23327: 'cè',
-    0x23328: 'xún',
-    0x2332C: 'jǔ',
-    0x2332D: 'hui,dá',
-    0x2333E: 'tōng',
-    0x23346: 'níng',
-    0x23347: 'jù',
-    0x2334F: 'chà',
-    0x23356: 'zāo',
-    0x2335B: 'yù',
-    0x2335F: 'kěn,wěi',
-    0x23366: 'kuàng',
-    0x23367: 'fěi',
-    0x2336F: 'yùn',
-    0x23370: 'qiǎn',
-    0x23374: 'quán',
-    0x23378: 'pò',
-    0x2337A: 'pěi',
-    0x23384: 'gèng',
-    0x23385: 'yì,huān',
-    0x23386: 'luò',
-    0x23391: 'kuān',
-    0x23393: 'xuǎn',
-    0x23394: 'niàn',
-    0x2339A: 'hú',
-    0x2339B: 'jú,xuè',
-    0x233A9: 'yè',
-    0x233AE: 'xī',
-    0x233B1: 'yuè',
-    0x233B2: 'tǎng',
-    0x233B3: 'pìn',
-    0x233B4: 'dǔn,è,ài',
-    0x233B5: 'bèi,pō',
-    0x233B8: 'liǎo',
-    0x233C0: 'yǒng',
-    0x233CE: 'yā',
-    0x233D1: 'jiǎo',
-    0x233D4: 'kùn,kǔn',
-    0x233D6: 'zhèn',
-    0x233D7: 'shù',
-    0x233DA: 'shí',
-    0x233DE: 'yóu',
-    0x233DF: 'pài',
-    0x233E0: 'xiáo',
-    0x233E1: 'jí',
-    0x233F6: 'qī',
-    0x233F7: 'hé',
-    0x233FA: 'kǒng',
-    0x23402: 'yè',
-    0x23403: 'chì',
-    0x2340A: 'kǎo,jú',
-    0x2340B: 'yuè',
-    0x2340E: 'wǎ',
-    0x2340F: 'niǎn',
-    0x23411: 'cí',
-    0x23413: 'yí',
-    0x23424: 'jiu',
-    0x2342B: 'yāng',
-    0x2342C: 'lí',
-    0x2342E: 'dāi',
-    0x2342F: 'chóng',
-    0x23435: 'yí',
-    0x2343A: 'hàn',
-    0x2343F: 'yī',
-    0x23441: 'chòng',
-    0x23442: 'hù',
-    0x23443: 'zhuǎ',
-    0x23466: 'qióng',
-    0x23467: 'duò',
-    0x23478: 'tóng',
-    0x23479: 'xiān',
-    0x2347F: 'fú',
-    0x23482: 'diàn',
-    0x23483: 'xí',
-    0x23484: 'xiē',
-    0x23485: 'zhèn',
-    0x23486: 'qiào',
-    0x23487: 'tū',
-    0x234B7: 'hàn',
-    0x234B8: 'kuàng',
-    0x234B9: 'suō',
-    0x234BB: 'shòu',
-    0x234BC: 'tiáo',
-    0x234C0: 'zhēn,zhěn',
-    0x234C3: 'nèi',
-    0x234C5: 'qiǎn',
-    0x234C6: 'yín',
-    0x234C8: 'liǎng',
-    0x234C9: 'shà,jié',
-    0x234CA: 'zì',
-    0x234CB: 'pí',
-    0x234CC: 'gāo,jú',
-    0x234CF: 'jìn',
-    0x234D0: 'yóu',
-    0x234D2: 'shàn',
-    0x234D4: 'mì',
-    0x234D5: 'òu',
-    0x234D7: 'hū',
-    0x234DB: 'yòu',
-    0x234DD: 'měng',
-    0x23510: 'zhǐ',
-    0x23513: 'bǐ',
-    0x23517: 'shēn',
-    0x23518: 'qì',
-    0x23519: 'xiān',
-    0x2351A: 'pán',
-    0x2351B: 'kǎng',
-    0x2352B: 'shuān',
-    0x2352C: 'pí',
-    0x2352E: 'zāi',
-    0x2352F: 'zhǔ',
-    0x23531: 'sōu,sāo',
-    0x23532: 'jiǒng',
-    0x23535: 'chán',
-    0x23536: 'fán,fàn',
-    0x23537: 'xiáo',
-    0x23538: 'yǐn',
-    0x23539: 'hóu',
-    0x2353A: 'mào',
-    0x2353B: 'tú,chán',
-    0x2353D: 'jì',
-    0x23541: 'yí',
-    0x23543: 'yù',
-    0x23544: 'jiōng',
-    0x23545: 'pào',
-    0x23547: 'xiāo',
-    0x23549: 'gǒu',
-    0x2354C: 'gōu',
-    0x2354D: 'sǔn',
-    0x2354E: 'xiǎn',
-    0x2354F: 'zhuǎn',
-    0x2357E: 'chóu,bì',
-    0x23584: 'qiāo',
-    0x23585: 'tí',
-    0x23586: 'yún',
-    0x23589: 'shān',
-    0x2358A: 'liè,lì',
-    0x2358C: 'zhǐ',
-    0x23590: 'pāi',
-    0x235A3: 'jú',
-    0x235A4: 'lái',
-    0x235A8: 'zǐ',
-    0x235AA: 'qú',
-    0x235AB: 'gǔ,què',
-    0x235AC: 'jué',
-    0x235AD: 'zhí',
-    0x235AE: 'àng',
-    0x235AF: 'qìn',
-    0x235B0: 'pí',
-    0x235B1: 'zuī',
-    0x235B3: 'qián',
-    0x235B5: 'cuó',
-    0x235B7: 'jí',
-    0x235B8: 'tí',
-    0x235B9: 'rú',
-    0x235BB: 'hǎi',
-    0x235BC: 'xún',
-    0x235BE: 'bèi',
-    0x235BF: 'zhí',
-    0x235C1: 'dùn,zā',
-    0x235CB: 'dǎng',
-    0x235D0: 'réng',
-    0x235F2: 'gān',
-    0x235F5: 'gàng,gāng',
-    0x235F6: 'tà',
-    0x235F8: 'tuò',
-    0x235F9: 'yàng',
-    0x235FA: 'kū',
-    0x235FB: 'zhì',
-    0x23616: 'jiān',
-    0x23617: 'nì',
-    0x23618: 'shēn,zhēn',
-    0x23619: 'bàng',
-    0x2361A: 'shuài',
-    0x2361B: 'dōu',
-    0x2361D: 'qiān',
-    0x2361E: 'hán',
-    0x2361F: 'qiā',
-    0x23620: 'gǎn',
-    0x23623: 'chún',
-    0x23624: 'chá,sà',
-    0x23625: 'bì',
-    0x23626: 'yī',
-    0x23627: 'fū',
-    0x23628: 'ě,ē',
-    0x2362A: 'láo',
-    0x2362B: 'háo',
-    0x2362C: 'lí',
-    0x23631: 'tè',
-    0x23632: 'shēn',
-    0x23634: 'yín',
-    0x23637: 'jiān',
-    0x2363B: 'chá,tú',
-    0x23657: 'niè',
-    0x23658: 'còu',
-    0x2365B: 'yí',
-    0x2365F: 'táng',
-    0x23662: 'juàn',
-    0x23670: 'chì',
-    0x23671: 'gǒu',
-    0x23674: 'jié',
-    0x23675: 'zhé',
-    0x23676: 'hú',
-    0x23677: 'máng',
-    0x2367B: 'zōu',
-    0x2367C: 'sì,cí',
-    0x2367F: 'fèi',
-    0x23680: 'zī',
-    0x23681: 'zī',
-    0x23683: 'jié',
-    0x23684: 'sī',
-    0x23686: 'chūn',
-    0x23687: 'pào',
-    0x2368B: 'yé',
-    0x2368C: 'dī,shì',
-    0x2368E: 'léi',
-    0x2368F: 'xū',
-    0x23690: 'rú',
-    0x23692: 'pá',
-    0x23693: 'juàn',
-    0x23694: 'xì',
-    0x23695: 'yè,yǎn',
-    0x23696: 'ān',
-    0x23698: 'yì',
-    0x23699: 'jiān,jiàn',
-    0x2369C: 'sōng',
-    0x2369D: 'wǒ',
-    0x2369F: 'sè',
-    0x236A0: 'zhǐ',
-    0x236A1: 'bī',
-    0x236A2: 'zhuàn',
-    0x236A6: 'jiàng',
-    0x236A7: 'hào',
-    0x236A9: 'chì',
-    0x236AA: 'dùn',
-    0x236D3: 'bó',
-    0x236D4: 'jí',
-    0x236D5: 'chuǎ',
-    0x236D7: 'luò',
-    0x236DA: 'ruǐ',
-    0x236EB: 'hú',
-    0x236F1: 'dàn,lǎn',
-    0x236F4: 'hǎn',
-    0x236F5: 'què',
-    0x236F6: 'shā',
-    0x236F7: 'zhǎn',
-    0x236F8: 'zé',
-    0x236F9: 'chuán,chuǎi',
-    0x236FA: 'qī',
-    0x236FB: 'dié',
-    0x236FD: 'zhà',
-    0x236FE: 'tòu',
-    0x23701: 'cī',
-    0x23702: 'sà',
-    0x23704: 'luó',
-    0x23707: 'jí',
-    0x23722: 'luǒ',
-    0x23723: 'qín',
-    0x23727: 'qióng',
-    0x23728: 'juàn',
-    0x2372C: 'ài',
-    0x2372D: 'jiǎn',
-    0x23739: 'tì',
-    0x2373A: 'wén',
-    0x2373D: 'qiāo',
-    0x23741: 'pái,bēi',
-    0x23742: 'hún',
-    0x23745: 'ài',
-    0x23747: 'shuò',
-    0x23748: 'lián',
-    0x23749: 'duì',
-    0x2374B: 'tà',
-    0x2374C: 'jǐn',
-    0x2374D: 'bì',
-    0x2374E: 'yǎn',
-    0x2374F: 'gào',
-    0x23750: 'piáo',
-    0x23751: 'yù,yú',
-    0x23752: 'shè',
-    0x23755: 'jiān',
-    0x23757: 'hú',
-    0x2375A: 'liè',
-    0x2375C: 'biàn',
-    0x2375D: 'sù',
-    0x2375E: 'jiāo',
-    0x23778: 'zhuì',
-    0x2377D: 'hān',
-    0x23787: 'dùn',
-    0x23790: 'xiě',
-    0x23791: 'méng',
-    0x23792: 'fū',
-    0x23793: 'lù',
-    0x23794: 'tàn',
-    0x23797: 'liú',
-    0x23798: 'xiān',
-    0x23799: 'sǎng',
-    0x2379C: 'còu',
-    0x2379D: 'zhuāng',
-    0x2379F: 'chēn',
-    0x237B0: 'liàn',
-    0x237B4: 'lí',
-    0x237C0: 'pèng',
-    0x237C1: 'tuǒ',
-    0x237C4: 'tuò',
-    0x237C6: 'liáo',
-    0x237C7: 'xiào',
-    0x237C8: 'chuì',
-    0x237C9: 'huài',
-    0x237CA: 'niǎo',
-    0x237CB: 'qiān',
-    0x237CC: 'lì',
-    0x237CF: 'pāo',
-    0x237D0: 'tiáo',
-    0x237D1: 'liú',
-    0x237D2: 'wú',
-    0x237E4: 'yǐng',
-    0x237E6: 'zhá',
-    0x237F0: 'yú',
-    0x237F2: 'xiǎn',
-    0x237F3: 'xuán',
-    0x237F4: 'shuān',
-    0x237F5: 'xī',
-    0x237F8: 'méi',
-    0x237F9: 'sēn',
-    0x237FA: 'liàn',
-    0x237FC: 'jiū,qiāo',
-    0x237FD: 'lào',
-    0x2380E: 'xiāo',
-    0x2380F: 'zōu',
-    0x2381A: 'liú',
-    0x2381C: 'zhào',
-    0x2381E: 'zhé,shè',
-    0x23820: 'lěi',
-    0x2382D: 'duǎn',
-    0x23837: 'jiǎn',
-    0x23838: 'shuān',
-    0x23839: 'zuó',
-    0x2383A: 'qiè',
-    0x2383C: 'lǎo',
-    0x23849: 'yù',
-    0x2384A: 'yì',
-    0x2384B: 'nǐ',
-    0x2384E: 'cén',
-    0x23855: 'yàn',
-    0x23857: 'ruǎn',
-    0x2385E: 'yán',
-    0x2385F: 'dié',
-    0x23860: 'mián',
-    0x23867: 'léi',
-    0x23869: 'wān',
-    0x23870: 'nǎ',
-    0x23876: 'yán',
-    0x2387A: 'lěi',
-    0x2387D: 'shā',
-    0x2387E: 'hū',
-    0x23881: 'xī',
-    0x23882: 'xī',
-    0x23884: 'yǒu,yōu',
-    0x23885: 'hān',
-    0x23887: 'hāi,xī',
-    0x23889: 'wā',
-    0x2388A: 'xù',
-    0x2388B: 'pī',
-    0x2388C: 'tān',
-    0x2388D: 'xī',
-    0x2388E: 'xī',
-    0x2388F: 'bīn',
-    0x23890: 'qīn,kēng',
-    0x23891: 'xī',
-    0x23892: 'yú',
-    0x23893: 'xì',
-    0x23895: 'cì',
-    0x23896: 'qiàn',
-    0x23897: 'xiā',
-    0x2389A: 'wá',
-    0x2389B: 'è',
-    0x2389C: 'yǒu,yōu',
-    0x2389D: 'xìng',
-    0x2389E: 'ní',
-    0x2389F: 'hán,xián',
-    0x238A0: 'bì',
-    0x238A1: 'shēng',
-    0x238A4: 'zhān',
-    0x238A5: 'diàn',
-    0x238A6: 'yǔ',
-    0x238A8: 'ǒu',
-    0x238AA: 'guǐ',
-    0x238AB: 'wǎng,wāng',
-    0x238AC: 'qiān',
-    0x238AD: 'yí',
-    0x238B0: 'zú',
-    0x238B2: 'qiān',
-    0x238B3: 'dìng',
-    0x238B4: 'kēng',
-    0x238B6: 'chù',
-    0x238B7: 'yī',
-    0x238BA: 'hān',
-    0x238BB: 'kuǎn',
-    0x238C8: 'diàn',
-    0x238C9: 'xì',
-    0x238CA: 'zī',
-    0x238CB: 'líng',
-    0x238CC: 'zì,sì',
-    0x238CE: 'yù',
-    0x238CF: 'hūn',
-    0x238D1: 'sǐ',
-    0x238D2: 'kǎn',
-    0x238DA: 'àn',
-    0x238DC: 'yǒu',
-    0x238DD: 'jí',
-    0x238DE: 'hùn',
-    0x238DF: 'qiā',
-    0x238E0: 'hóu',
-    0x238E1: 'hóu',
-    0x238E3: 'diàn',
-    0x238E9: 'xiē',
-    0x238ED: 'shè',
-    0x238EE: 'shà',
-    0x238F2: 'xié',
-    0x238F3: 'yáo,yǎo',
-    0x238F4: 'dà',
-    0x238F6: 'xiè',
-    0x238F7: 'chī',
-    0x238F8: 'yǒu',
-    0x238F9: 'hē',
-    0x238FA: 'shà',
-    0x238FF: 'tái',
-    0x23901: 'zhú',
-    0x23903: 'ǎi',
-    0x23907: 'què',
-    0x23908: 'zé',
-    0x2390A: 'lā',
-    0x2390B: 'lòu',
-    0x2390C: 'chuài,chǐ,chuò',
-    0x2390E: 'yǒu',
-    0x23916: 'tì',
-    0x23918: 'shī',
-    0x23921: 'xiào,yǒu',
-    0x23922: 'xì',
-    0x23928: 'huò',
-    0x23929: 'chì',
-    0x2392A: 'yì',
-    0x2392F: 'shú',
-    0x23930: 'yuè',
-    0x23931: 'chán',
-    0x23932: 'è',
-    0x23933: 'xī',
-    0x23934: 'xī',
-    0x23935: 'yǐng',
-    0x23936: 'zú,zā,zǎn',
-    0x23937: 'zā',
-    0x2393A: 'zā',
-    0x23942: 'tà',
-    0x23943: 'wàn',
-    0x23947: 'xìn',
-    0x2394A: 'wàng',
-    0x2394B: 'fǔ',
-    0x23950: 'lǔ,lǚ',
-    0x2395E: 'jiǎn',
-    0x23961: 'yán',
-    0x23963: 'bì',
-    0x23964: 'kěn',
-    0x23965: 'guàn',
-    0x23968: 'zī',
-    0x2396E: 'kuǐ',
-    0x2396F: 'zhǒu',
-    0x23970: 'zhì',
-    0x23973: 'tú',
-    0x23977: 'tà',
-    0x23979: 'chù',
-    0x2397A: 'chēng',
-    0x2397B: 'chěng',
-    0x2397C: 'zhù',
-    0x2397E: 'dà',
-    0x23987: 'bì',
-    0x23989: 'jiǎ',
-    0x2398C: 'yì',
-    0x2398F: 'yuè',
-    0x23990: 'gāng',
-    0x23996: 'gān',
-    0x2399C: 'qiāo',
-    0x239A0: 'chú',
-    0x239A1: 'chú',
-    0x239A2: 'bì',
-    0x239A6: 'guì',
-    0x239A9: 'gǔ',
-    0x239AA: 'bǐng',
-    0x239AB: 'yìn',
-    0x239AC: 'zhuì',
-    0x239AD: 'gǔ',
-    0x239AF: 'lì',
-    0x239B5: 'è,zhēn',
-    0x239B6: 'dǎi',
-    0x239BC: 'cán',
-    0x239C2: 'tì',
-    0x239C3: 'dù',
-    0x239C4: 'yì',
-    0x239C8: 'dié',
-    0x239CA: 'niǔ',
-    0x239CC: 'xuè',
-    0x239CD: 'nè',
-    0x239CE: 'guì',
-    0x239CF: 'kǎo',
-    0x239D2: 'chuǎn,mò',
-    0x239D6: 'zhá',
-    0x239D7: 'yóu',
-    0x239D9: 'bài',
-    0x239DA: 'shí',
-    0x239DB: 'diàn',
-    0x239DC: 'pā',
-    0x239DD: 'qiú',
-    0x239E1: 'xuè',
-    0x239E3: 'mò',
-    0x239E4: 'kē',
-    0x239E5: 'yǒu',
-    0x239E6: 'jiǎo',
-    0x239E7: 'bó',
-    0x239EC: 'xiǔ',
-    0x239F2: 'mǐ',
-    0x239F3: 'luò',
-    0x239F5: 'xuè,xù',
-    0x239F7: 'duò',
-    0x239F9: 'èr',
-    0x239FA: 'shān',
-    0x239FC: 'kuì',
-    0x239FD: 'nào',
-    0x239FE: 'miǎn',
-    0x239FF: 'lì',
-    0x23A00: 'luàn',
-    0x23A02: 'dié',
-    0x23A04: 'qià',
-    0x23A05: 'lèi',
-    0x23A07: 'mào',
-    0x23A09: 'hēng',
-    0x23A0A: 'chè',
-    0x23A0B: 'zhì',
-    0x23A0D: 'gǔ',
-    0x23A0E: 'cuō',
-    0x23A13: 'wù',
-    0x23A14: 'tào',
-    0x23A17: 'xī',
-    0x23A18: 'yāo',
-    0x23A19: 'wěi,wèi',
-    0x23A1B: 'zú',
-    0x23A1C: 'mà',
-    0x23A1D: 'yǔ',
-    0x23A1E: 'pěng',
-    0x23A1F: 'yì',
-    0x23A20: 'qìn,qīn',
-    0x23A21: 'yuè',
-    0x23A22: 'juè',
-    0x23A23: 'jiàng',
-    0x23A24: 'xù',
-    0x23A25: 'bēng',
-    0x23A2A: 'luǒ',
-    0x23A2B: 'zhuī',
-    0x23A32: 'dù',
-    0x23A33: 'xiàng',
-    0x23A36: 'huì',
-    0x23A3A: 'gǔ',
-    0x23A3B: 'kǎo',
-    0x23A3E: 'xīng',
-    0x23A3F: 'hún',
-    0x23A40: 'biān',
-    0x23A44: 'kè,ài',
-    0x23A45: 'kǎo',
-    0x23A48: 'cuó,zuō',
-    0x23A4F: 'lù',
-    0x23A51: 'zuì',
-    0x23A52: 'zāo',
-    0x23A53: 'jiǎo',
-    0x23A54: 'guàn',
-    0x23A59: 'yān',
-    0x23A5A: 'ér',
-    0x23A5C: 'qíng',
-    0x23A5F: 'dèng',
-    0x23A60: 'sì',
-    0x23A61: 'suì',
-    0x23A62: 'liào',
-    0x23A67: 'shàn',
-    0x23A69: 'bì',
-    0x23A6A: 'wèi',
-    0x23A6B: 'yè',
-    0x23A6D: 'zhài',
-    0x23A6F: 'yé',
-    0x23A70: 'diào',
-    0x23A71: 'ài,kē',
-    0x23A74: 'jiàng',
-    0x23A77: 'sū',
-    0x23A79: 'huài',
-    0x23A7A: 'yù',
-    0x23A7D: 'rǎng',
-    0x23A80: 'diān',
-    0x23A81: 'zuān',
-    0x23A82: 'bān',
-    0x23A84: 'qín',
-    0x23A87: 'jiā',
-    0x23A89: 'pí',
-    0x23A8C: 'tóu,duì',
-    0x23A90: 'chóu',
-    0x23A95: 'guǐ',
-    0x23AA0: 'jī,jì,qì',
-    0x23AA8: 'xuè',
-    0x23AAA: 'diàn',
-    0x23AAD: 'biàn',
-    0x23AAE: 'zǎi',
-    0x23AAF: 'tóng',
-    0x23AB6: 'shǎn',
-    0x23AB8: 'gù',
-    0x23AB9: 'què',
-    0x23AC0: 'gǔ',
-    0x23AC8: 'hú',
-    0x23AC9: 'kuǎi',
-    0x23ACC: 'gòu',
-    0x23ACE: 'sù',
-    0x23AD0: 'chóu',
-    0x23AD2: 'kēng',
-    0x23AD4: 'dū',
-    0x23AD9: 'yì',
-    0x23ADC: 'dào',
-    0x23ADD: 'qiāng',
-    0x23AE3: 'lóng',
-    0x23AE5: 'lí',
-    0x23AE7: 'lì',
-    0x23AE8: 'qīng',
-    0x23AEA: 'wēi',
-    0x23AEC: 'móu',
-    0x23AF1: 'qì',
-    0x23AF3: 'jiǎng',
-    0x23AF4: 'xié',
-    0x23AF9: 'dài',
-    0x23AFB: 'lóu',
-    0x23B02: 'guàn',
-    0x23B06: 'péi',
-    0x23B09: 'pí',
-    0x23B0B: 'juàn,chuò',
-    0x23B0D: 'bēi',
-    0x23B0E: 'jué',
-    0x23B0F: 'juàn',
-    0x23B10: 'shì',
-    0x23B15: 'xiě',
-    0x23B18: 'ruí',
-    0x23B19: 'jìng',
-    0x23B1A: 'pò',
-    0x23B1B: 'sān,shān',
-    0x23B20: 'jī',
-    0x23B29: 'fēn',
-    0x23B2A: 'bèi',
-    0x23B2B: 'jiè,gà',
-    0x23B2C: 'sā',
-    0x23B2E: 'pī',
-    0x23B34: 'dì',
-    0x23B35: 'máo,mào',
-    0x23B36: 'ba',
-    0x23B37: 'ba',
-    0x23B38: 'tiáo',
-    0x23B39: 'líng',
-    0x23B3A: 'shēng',
-    0x23B3B: 'zhěn',
-    0x23B3C: 'pī',
-    0x23B3D: 'wù',
-    0x23B3F: 'zè',
-    0x23B40: 'bào',
-    0x23B47: 'lǚ',
-    0x23B56: 'hāo',
-    0x23B57: 'dǒu',
-    0x23B58: 'fú',
-    0x23B59: 'ní',
-    0x23B5D: 'gé',
-    0x23B60: 'rú',
-    0x23B61: 'xiǎn',
-    0x23B64: 'bì',
-    0x23B6E: 'máo',
-    0x23B72: 'rǒng',
-    0x23B73: 'qiú,qú',
-    0x23B77: 'bó',
-    0x23B79: 'hāo',
-    0x23B7A: 'nǎo',
-    0x23B7B: 'yán',
-    0x23B83: 'páo',
-    0x23B84: 'suī',
-    0x23B86: 'tuò',
-    0x23B88: 'qū',
-    0x23B89: 'lí',
-    0x23B8A: 'dé',
-    0x23B8C: 'jié',
-    0x23B8D: 'jié',
-    0x23B8E: 'gǔn',
-    0x23B8F: 'jiān',
-    0x23B90: 'bì',
-    0x23BA0: 'sàn',
-    0x23BA1: 'bāng',
-    0x23BA2: 'chún',
-    0x23BA6: 'nài',
-    0x23BA7: 'bǎng',
-    0x23BAA: 'róng',
-    0x23BAB: 'jiā',
-    0x23BAC: 'sōu',
-    0x23BB0: 'dé',
-    0x23BBE: 'xiān',
-    0x23BBF: 'zhān',
-    0x23BC0: 'mào',
-    0x23BC3: 'zī',
-    0x23BC5: 'jì',
-    0x23BC6: 'qí',
-    0x23BCB: 'rù',
-    0x23BCC: 'suō',
-    0x23BCD: 'rǒng',
-    0x23BCE: 'wù',
-    0x23BCF: 'róng,rǒng',
-    0x23BD0: 'róng',
-    0x23BDA: 'tà',
-    0x23BDC: 'sōu',
-    0x23BE4: 'lí',
-    0x23BE7: 'cuǐ,suī',
-    0x23BE8: 'zōng',
-    0x23BE9: 'mén',
-    0x23BEA: 'xǐ',
-    0x23BEC: 'mǎng',
-    0x23BED: 'niè',
-    0x23BEF: 'suī',
-    0x23BF1: 'péi',
-    0x23BF4: 'bì',
-    0x23BF5: 'dì',
-    0x23BF8: 'qú',
-    0x23BF9: 'qiáo',
-    0x23BFB: 'fēn',
-    0x23BFC: 'sù',
-    0x23C03: 'xū',
-    0x23C07: 'rǒng',
-    0x23C08: 'jī',
-    0x23C0B: 'qú',
-    0x23C0C: 'liè,hé',
-    0x23C15: 'sào',
-    0x23C18: 'kùn',
-    0x23C1A: 'cuì',
-    0x23C1B: 'yè',
-    0x23C1C: 'bìng',
-    0x23C1E: 'jié',
-    0x23C20: 'qú',
-    0x23C21: 'qú',
-    0x23C25: 'méng',
-    0x23C26: 'rán,gān',
-    0x23C28: 'bīn',
-    0x23C29: 'cháo',
-    0x23C2C: 'dú',
-    0x23C36: 'ráng,nǎng',
-    0x23C37: 'xiān',
-    0x23C3A: 'táo',
-    0x23C3B: 'qú',
-    0x23C3C: 'niè',
-    0x23C3F: 'shū',
-    0x23C40: 'lǔ',
-    0x23C42: 'kùn',
-    0x23C48: 'mín',
-    0x23C49: 'mǐn',
-    0x23C4D: 'dàn',
-    0x23C50: 'yìn,zhì',
-    0x23C53: 'xiào,hào',
-    0x23C57: 'jì',
-    0x23C5C: 'yīn',
-    0x23C66: 'fēn',
-    0x23C67: 'zhòng',
-    0x23C6B: 'gǔ',
-    0x23C71: 'chá',
-    0x23C73: 'liú',
-    0x23C76: 'bǔ',
-    0x23C7A: 'pā',
-    0x23C7B: 'sì',
-    0x23C7C: 'dāo',
-    0x23C7D: 'zhěn',
-    0x23C80: 'shān',
-    0x23C82: 'chuǎi',
-    0x23C84: 'jiǔ',
-    0x23C8A: 'kè',
-    0x23C8B: 'chí',
-    0x23C91: 'hù,chí,hé,hú',
-    0x23C92: 'lì,lè',
-    0x23C93: 'shā',
-    0x23C96: 'pài,liú,gū',
-    0x23C97: 'wéi',
-    0x23C98: 'wǔ',
-    0x23C9C: 'yíng',
-    0x23CA1: 'shā,jí,jié',
-    0x23CA2: 'dī',
-    0x23CA5: 'dān',
-    0x23CB1: 'tū',
-    0x23CB2: 'hé',
-    0x23CB3: 'pǒ',
-    0x23CB5: 'zhǐ',
-    0x23CB6: 'niǔ',
-    0x23CB7: 'nì',
-    0x23CBD: 'rǒng',
-    0x23CBE: 'guài',
-    0x23CC0: 'zhí',
-    0x23CC3: 'jí',
-    0x23CDC: 'fàn',
-    0x23CDF: 'jié',
-    0x23CE0: 'hǎi,mǔ',
-    0x23CE4: 'zhàn',
-    0x23CE6: 'xì,náo',
-    0x23CE9: 'zī',
-    0x23CEC: 'xí',
-    0x23CED: 'piào',
-    0x23CF0: 'bēn',
-    0x23CF2: 'jiǎn',
-    0x23D13: 'jiàn',
-    0x23D16: 'zá',
-    0x23D1E: 'bèn',
-    0x23D1F: 'mào,huǎn',
-    0x23D22: 'zào',
-    0x23D23: 'zhuàng',
-    0x23D25: 'kuáng',
-    0x23D28: 'bí',
-    0x23D2A: 'pài,pì',
-    0x23D3C: 'mào',
-    0x23D3D: 'tàn',
-    0x23D5E: 'tǔn',
-    0x23D5F: 'luǒ',
-    0x23D62: 'tān',
-    0x23D71: 'án',
-    0x23D77: 'hán,gàn',
-    0x23D78: 'zhú',
-    0x23D7A: 'duò,tuó',
-    0x23D7B: 'duò,tuó',
-    0x23D7C: 'gàn',
-    0x23D86: 'qiòng',
-    0x23D88: 'wǎng,mǎng',
-    0x23D8A: 'mò',
-    0x23D8B: 'zhè',
-    0x23D8C: 'wěn',
-    0x23D8D: 'zhuàng',
-    0x23D8F: 'jiē,diē',
-    0x23D90: 'pào',
-    0x23D98: 'sù',
-    0x23D9D: 'jù',
-    0x23DA0: 'qī',
-    0x23DA1: 'càn',
-    0x23DA3: 'tuán',
-    0x23DA4: 'shā',
-    0x23DA6: 'tuó',
-    0x23DA9: 'huà',
-    0x23DAB: 'yì',
-    0x23DE0: 'mín',
-    0x23DE1: 'zhōng',
-    0x23DE5: 'shuò',
-    0x23DE9: 'yì',
-    0x23DEA: 'wǎng',
-    0x23DEB: 'áo',
-    0x23DF6: 'sǔ',
-    0x23DFE: 'guǐ',
-    0x23DFF: 'tuǒ',
-    0x23E00: 'huǐ',
-    0x23E03: 'xù',
-    0x23E04: 'zǎn',
-    0x23E06: 'zǐ',
-    0x23E07: 'biàn',
-    0x23E09: 'dá',
-    0x23E0A: 'yīn',
-    0x23E0B: 'quǎn',
-    0x23E0E: 'huài',
-    0x23E0F: 'ná',
-    0x23E10: 'zá',
-    0x23E12: 'tí',
-    0x23E18: 'yí',
-    0x23E19: 'tān',
-    0x23E1A: 'shé',
-    0x23E1B: 'shuò',
-    0x23E1D: 'xíng',
-    0x23E20: 'yǒu',
-    0x23E23: 'fén',
-    0x23E47: 'kè',
-    0x23E4B: 'fú',
-    0x23E52: 'mǐn',
-    0x23E5A: 'pì',
-    0x23E5C: 'jí',
-    0x23E5D: 'qiào,xiào',
-    0x23E5E: 'zhǒng',
-    0x23E5F: 'gàn',
-    0x23E60: 'yuān',
-    0x23E61: 'chí',
-    0x23E65: 'qiàn',
-    0x23E67: 'zuó,zhà',
-    0x23E69: 'xié',
-    0x23E6A: 'máo',
-    0x23E6C: 'hú',
-    0x23E6E: 'pì',
-    0x23E6F: 'xùn',
-    0x23E71: 'xiá',
-    0x23E72: 'tí',
-    0x23E75: 'nà',
-    0x23E76: 'chuǎ',
-    0x23E80: 'wǔ',
-    0x23EAC: 'huāng',
-    0x23EAD: 'xuè',
-    0x23EAE: 'tào',
-    0x23EB0: 'qiào',
-    0x23EB3: 'jiāo',
-    0x23EBC: 'dǎng',
-    0x23EBD: 'bài',
-    0x23ECD: 'dàng,xiàng',
-    0x23ECE: 'kòu',
-    0x23ED0: 'jū',
-    0x23ED1: 'shā,shài',
-    0x23ED2: 'jīng',
-    0x23ED5: 'mó',
-    0x23ED6: 'nóu',
-    0x23ED8: 'shuò',
-    0x23EDA: 'shù',
-    0x23EDB: 'zhuāng',
-    0x23EDC: 'fú',
-    0x23EDF: 'zāng',
-    0x23EE0: 'xié',
-    0x23EE1: 'làng',
-    0x23EE2: 'tōng',
-    0x23EE9: 'zhé',
-    0x23EEC: 'càn',
-    0x23EEE: 'yuè',
-    0x23EF1: 'zhòu',
-    0x23F1A: 'tān',
-    0x23F1E: 'yán',
-    0x23F1F: 'lù',
-    0x23F20: 'yǎn',
-    0x23F26: 'zé',
-    0x23F27: 'shuài',
-    0x23F45: 'guō',
-    0x23F46: 'zhú',
-    0x23F48: 'rú,ruán',
-    0x23F49: 'rú',
-    0x23F4C: 'kǎn',
-    0x23F4D: 'jì',
-    0x23F4E: 'gāo,zé,háo',
-    0x23F52: 'xiè',
-    0x23F55: 'òu',
-    0x23F56: 'jiān',
-    0x23F5A: 'zhí',
-    0x23F5B: 'zhá',
-    0x23F5D: 'hǒng',
-    0x23F5F: 'kuǎn',
-    0x23F61: 'bó',
-    0x23F64: 'sè',
-    0x23F65: 'àn',
-    0x23F66: 'jiàn',
-    0x23F68: 'téng',
-    0x23F6B: 'sōng',
-    0x23F6D: 'mèng',
-    0x23F6E: 'yín',
-    0x23F6F: 'tān',
-    0x23F70: 'guō',
-    0x23F73: 'ruán',
-    0x23F74: 'wèi',
-    0x23F77: 'sì',
-    0x23FA4: 'qì',
-    0x23FA6: 'zhǎng',
-    0x23FC5: 'dǒng',
-    0x23FC6: 'fú',
-    0x23FC7: 'shěn',
-    0x23FC8: 'sù',
-    0x23FC9: 'yì',
-    0x23FCA: 'liàn',
-    0x23FCC: 'hé',
-    0x23FCE: 'zhēn',
-    0x23FD0: 'zé',
-    0x23FD2: 'cuǐ',
-    0x23FD3: 'cuǐ',
-    0x23FDD: 'fèng',
-    0x23FDE: 'lǐ',
-    0x23FDF: 'kòu',
-    0x23FE3: 'xiào',
-    0x23FE4: 'yǒu',
-    0x24003: 'háo',
-    0x24009: 'hàn',
-    0x2400A: 'kěn',
-    0x2401D: 'yù',
-    0x24023: 'huǎn',
-    0x24024: 'suō,shàn,shuài',
-    0x24026: 'là',
-    0x24028: 'dòu',
-    0x24029: 'jiàn',
-    0x2402A: 'pō',
-    0x2402B: 'biǎn',
-    0x24030: 'xuè',
-    0x24032: 'biàn',
-    0x24037: 'wèi',
-    0x24061: 'dàn',
-    0x24062: 'jié',
-    0x24063: 'bài',
-    0x24065: 'niǎn',
-    0x24066: 'xiàn',
-    0x24067: 'sè',
-    0x2406A: 'huá',
-    0x2406B: 'chuā',
-    0x2406E: 'òu',
-    0x2406F: 'liè',
-    0x24070: 'dí',
-    0x24071: 'cài',
-    0x24073: 'zhá',
-    0x24075: 'lǘ',
-    0x24079: 'huò',
-    0x2407C: 'lì',
-    0x2407D: 'yǐng',
-    0x2407F: 'wěi',
-    0x24080: 'bì',
-    0x24081: 'guó',
-    0x24083: 'pì',
-    0x24086: 'biāo',
-    0x240A0: 'yǎn',
-    0x240A4: 'zhuàn',
-    0x240B2: 'hóng',
-    0x240B6: 'lìn',
-    0x240B7: 'è',
-    0x240B9: 'yǐn',
-    0x240BA: 'làn',
-    0x240BC: 'yào',
-    0x240BF: 'xuàn',
-    0x240C0: 'lì',
-    0x240E8: 'làn',
-    0x240E9: 'líng',
-    0x240EA: 'xī',
-    0x240EB: 'hōng',
-    0x240ED: 'jiǎo',
-    0x240EE: 'zhuó',
-    0x240F2: 'zhí',
-    0x240F5: 'bó',
-    0x240F6: 'tēng',
-    0x240F7: 'ǎn',
-    0x240FA: 'xún',
-    0x240FB: 'lěi',
-    0x240FC: 'zāng',
-    0x240FD: 'huǐ',
-    0x2410E: 'xì',
-    0x2410F: 'hóng',
-    0x24111: 'fàn',
-    0x24112: 'jiǎn',
-    0x24113: 'cóng',
-    0x24114: 'zá',
-    0x24116: 'cā,zá',
-    0x24118: 'yōu',
-    0x2411B: 'duì',
-    0x2411C: 'pān',
-    0x24125: 'tà',
-    0x24127: 'pàn',
-    0x2412B: 'fān',
-    0x2412C: 'xī',
-    0x24136: 'yào,shuò',
-    0x24137: 'luó',
-    0x2413A: 'biān',
-    0x2413C: 'jìn',
-    0x2413D: 'lì',
-    0x2414A: 'yàn',
-    0x2414B: 'dòu',
-    0x2414E: 'màn',
-    0x24150: 'gōng',
-    0x24151: 'rǎng',
-    0x24152: 'càn',
-    0x24163: 'mén',
-    0x24171: 'gǔ',
-    0x24172: 'shuàn',
-    0x24178: 'yán,yàn',
-    0x24179: 'bì',
-    0x24180: 'biāo',
-    0x24181: 'chéng',
-    0x24182: 'kuì',
-    0x24184: 'huǒ,zāi',
-    0x2418D: 'chì',
-    0x2418F: 'wò',
-    0x24191: 'còu',
-    0x24192: 'zhì',
-    0x24199: 'shuǐ',
-    0x2419C: 'guà',
-    0x2419D: 'pū',
-    0x2419E: 'xù',
-    0x2419F: 'sī',
-    0x241A1: 'wǔ',
-    0x241AE: 'fū',
-    0x241B0: 'shì',
-    0x241B3: 'huì',
-    0x241B4: 'huāng',
-    0x241B5: 'pā',
-    0x241BC: 'zhǔ',
-    0x241BE: 'yí',
-    0x241C3: 'lì',
-    0x241C4: 'shǎn',
-    0x241DC: 'mín',
-    0x241DE: 'gē',
-    0x241E0: 'hū',
-    0x241EF: 'ēn,āo',
-    0x241F0: 'fá',
-    0x241F3: 'xù,xuè',
-    0x241F4: 'yí,xī',
-    0x241FE: 'yíng',
-    0x24214: 'chí',
-    0x24219: 'yí',
-    0x24225: 'dí',
-    0x24226: 'huǐ,méi',
-    0x24227: 'hé',
-    0x24229: 'zhǎ',
-    0x24236: 'yún',
-    0x24237: 'xiān',
-    0x2424C: 'xián',
-    0x2424D: 'lào',
-    0x2424E: 'shào',
-    0x2424F: 'shì',
-    0x24250: 'zhuó',
-    0x24264: 'biē',
-    0x24265: 'jiǔ',
-    0x24266: 'wō',
-    0x24267: 'jiǎo',
-    0x24268: 'fú',
-    0x2426A: 'xiāng',
-    0x2426B: 'kài',
-    0x242B2: 'nǎo',
-    0x242B4: 'huò',
-    0x242B5: 'jí',
-    0x242B6: 'là',
-    0x242BB: 'fōu',
-    0x242BC: 'shǎn',
-    0x242BD: 'liào,liǎo',
-    0x242BE: 'miè',
-    0x242BF: 'chè',
-    0x242C2: 'mó',
-    0x242CF: 'lóu',
-    0x242E8: 'duò',
-    0x242EB: 'nǎo',
-    0x242ED: 'jī',
-    0x242F0: 'zhù',
-    0x24302: 'sù',
-    0x24303: 'duò',
-    0x24307: 'jiǒng',
-    0x2430A: 'zǎi',
-    0x2430B: 'huǐ',
-    0x2430C: 'yǐng',
-    0x2430D: 'hú',
-    0x2430E: 'lìn,lǐn',
-    0x2430F: 'wěng',
-    0x24310: 'hàn',
-    0x24314: 'nán',
-    0x24337: 'xì',
-    0x24339: 'gàn',
-    0x2433E: 'hè',
-    0x2433F: 'jī',
-    0x24340: 'xiǎng',
-    0x24341: 'shā',
-    0x24350: 'tuì',
-    0x24352: 'zhāo',
-    0x24353: 'shù',
-    0x24355: 'yǒu',
-    0x24356: 'jiān',
-    0x2435C: 'zào',
-    0x24364: 'zhāng',
-    0x2437D: 'ruò',
-    0x24384: 'yān',
-    0x2438B: 'cuì',
-    0x24397: 'jí',
-    0x24398: 'shāng',
-    0x243A3: 'è',
-    0x243A4: 'láo',
-    0x243A5: 'tǎn,chān',
-    0x243A7: 'zhù',
-    0x243AD: 'lǐn,yǐn',
-    0x243AF: 'zēng',
-    0x243B1: 'juǎn',
-    0x243B2: 'hū',
-    0x243D7: 'shěn',
-    0x243D8: 'huò',
-    0x243DC: 'kuì',
-    0x243F1: 'chù',
-    0x243F2: 'zhòu',
-    0x243F6: 'āo',
-    0x243F8: 'zhuó',
-    0x243FD: 'xīng',
-    0x243FF: 'miè',
-    0x24400: 'hū',
-    0x24414: 'tán',
-    0x24419: 'bì',
-    0x24423: 'dǐng',
-    0x24429: 'kài',
-    0x2442B: 'biāo',
-    0x24430: 'huò',
-    0x24431: 'liè',
-    0x24432: 'cuàn',
-    0x24443: 'xiàn',
-    0x24444: 'rè',
-    0x24453: 'yuè',
-    0x24455: 'xūn',
-    0x24457: 'liǎo,zhāo',
-    0x24463: 'shā',
-    0x24466: 'shì',
-    0x2446A: 'xiè',
-    0x24473: 'xiāo',
-    0x24477: 'yé',
-    0x24478: 'lǎn',
-    0x24479: 'yì',
-    0x2447F: 'liǎn',
-    0x24494: 'bó',
-    0x24495: 'cāo',
-    0x2449D: 'yào',
-    0x244A6: 'liàn,yàn',
-    0x244BB: 'tà',
-    0x244D1: 'jì',
-    0x244D4: 'xī',
-    0x244D5: 'zhì',
-    0x244DA: 'xī',
-    0x244DD: 'yuè',
-    0x244E4: 'xiǎn',
-    0x244E6: 'zhuò',
-    0x244EF: 'zhǎng,jú',
-    0x244F5: 'zǔ',
-    0x244F7: 'ná',
-    0x244FE: 'dào',
-    0x244FF: 'liè',
-    0x24500: 'ná',
-    0x24509: 'páo',
-    0x2450B: 'jù',
-    0x24516: 'luǒ',
-    0x24519: 'shuǎ',
-    0x2451A: 'shàng',
-    0x2451D: 'luǒ',
-    0x2451F: 'fēn',
-    0x24523: 'bào',
-    0x24528: 'lì',
-    0x2452B: 'xiòng',
-    0x24536: 'dāng',
-    0x24540: 'chèng',
-    0x24544: 'zhǎng',
-    0x24547: 'sǒu',
-    0x2454A: 'shén',
-    0x24552: 'gě',
-    0x24558: 'yū,wù',
-    0x2455A: 'huī',
-    0x2455B: 'chè',
-    0x2455D: 'jiào,bó',
-    0x2455E: 'zhù',
-    0x2455F: 'shū',
-    0x24562: 'xiáo',
-    0x24566: 'níng',
-    0x2456D: 'jiāng',
-    0x2456F: 'jiāng,zhuàng',
-    0x24577: 'diào',
-    0x2457D: 'qiáng',
-    0x2457E: 'qiú,fǔ',
-    0x24580: 'fēng',
-    0x24586: 'zhàn',
-    0x24587: 'kē',
-    0x24592: 'dié',
-    0x24593: 'zé',
-    0x24596: 'guāng',
-    0x24597: 'sè',
-    0x24598: 'fèn,fén',
-    0x2459B: 'jiǎng',
-    0x2459D: 'yán',
-    0x2459E: 'zhì',
-    0x245A2: 'lì',
-    0x245A6: 'líng',
-    0x245AA: 'yí',
-    0x245AC: 'qǔ',
-    0x245AD: 'pán',
-    0x245AE: 'gōu',
-    0x245B0: 'jiǎ',
-    0x245B1: 'hé',
-    0x245B3: 'pèng',
-    0x245B5: 'jù',
-    0x245B7: 'chè',
-    0x245BA: 'liè',
-    0x245BB: 'shì',
-    0x245BC: 'pò',
-    0x245BD: 'xiàng',
-    0x245BF: 'pì',
-    0x245C0: 'luǒ',
-    0x245C1: 'cù',
-    0x245C3: 'yǔ',
-    0x245C7: 'kòng',
-    0x245C8: 'xiè',
-    0x245CD: 'wǎn',
-    0x245CE: 'yǎn',
-    0x245CF: 'péi',
-    0x245D3: 'chéng',
-    0x245D8: 'tí',
-    0x245D9: 'chè,tuò',
-    0x245DA: 'bì',
-    0x245DB: 'liàn',
-    0x245DC: 'jiǎ',
-    0x245DE: 'tíng',
-    0x245E2: 'tī',
-    0x245E8: 'dié',
-    0x245EA: 'shù',
-    0x245EB: 'lí',
-    0x245EC: 'lǘ',
-    0x245ED: 'xià,xiā',
-    0x245EF: 'cuī',
-    0x245F3: 'bō',
-    0x245F4: 'tuí',
-    0x245F5: 'pú',
-    0x245F7: 'lìn',
-    0x245F8: 'fèn,fén',
-    0x245FA: 'bó',
-    0x245FB: 'chàn',
-    0x245FE: 'dāng',
-    0x245FF: 'tǎi',
-    0x24600: 'dào',
-    0x24603: 'lì',
-    0x24605: 'yá',
-    0x24606: 'yá',
-    0x24607: 'zhān',
-    0x2460A: 'yí',
-    0x2460C: 'qī',
-    0x24614: 'hù',
-    0x24616: 'tīng',
-    0x24618: 'kǒu',
-    0x2461B: 'chún',
-    0x2461C: 'yóu',
-    0x2461D: 'fèn',
-    0x2461F: 'nuó',
-    0x24620: 'tiàn',
-    0x24621: 'jìn',
-    0x24622: 'pí',
-    0x24623: 'chén',
-    0x24624: 'pì',
-    0x24626: 'jiè',
-    0x24627: 'guǐ',
-    0x24632: 'zhuàng',
-    0x24635: 'hú',
-    0x24636: 'chǒu',
-    0x24637: 'shù',
-    0x24638: 'tāo',
-    0x24639: 'pí',
-    0x2463A: 'rǒng',
-    0x2463B: 'rǒng',
-    0x2463D: 'hǒu',
-    0x2463E: 'pēng',
-    0x24645: 'bài',
-    0x24647: 'xiá',
-    0x2464B: 'qǐn',
-    0x2464C: 'nǐ',
-    0x2464E: 'tāo',
-    0x2464F: 'qù',
-    0x24652: 'xié',
-    0x24654: 'zhào',
-    0x24655: 'huā',
-    0x24656: 'xīn',
-    0x24658: 'shōu',
-    0x2465B: 'tú',
-    0x2465D: 'liáng',
-    0x2465E: 'bì',
-    0x2465F: 'chū',
-    0x24661: 'xīng',
-    0x24663: 'xīn',
-    0x24664: 'fū',
-    0x24669: 'jiè',
-    0x2466D: 'fǔ',
-    0x24670: 'tè',
-    0x24671: 'shè',
-    0x24674: 'chāo',
-    0x24675: 'chuī',
-    0x2467C: 'rán',
-    0x2467D: 'hǒu',
-    0x2467E: 'bēng',
-    0x24680: 'cǎi',
-    0x24685: 'mú',
-    0x24689: 'xū',
-    0x2468A: 'dié',
-    0x2468D: 'chǎn',
-    0x2468E: 'yú',
-    0x2468F: 'zhòng',
-    0x24693: 'lí',
-    0x24694: 'shōu',
-    0x2469A: 'dú',
-    0x2469C: 'māo',
-    0x2469D: 'huáng',
-    0x2469F: 'táo',
-    0x246A1: 'dù',
-    0x246A2: 'tí',
-    0x246A3: 'shēng',
-    0x246A4: 'méi',
-    0x246A8: 'zhēn',
-    0x246A9: 'qín',
-    0x246AA: 'pì',
-    0x246AB: 'táng',
-    0x246AC: 'cāng',
-    0x246AD: 'yáo',
-    0x246AF: 'xiù',
-    0x246B0: 'bāng',
-    0x246B1: 'gǔ',
-    0x246B5: 'bù',
-    0x246BC: 'gòu',
-    0x246BD: 'bó',
-    0x246C1: 'wèn',
-    0x246C4: 'jì',
-    0x246CA: 'lā',
-    0x246CD: 'cuī',
-    0x246CE: 'mǐn',
-    0x246CF: 'cǔ',
-    0x246D0: 'ōu',
-    0x246D1: 'yōng',
-    0x246D6: 'máo',
-    0x246D7: 'kè',
-    0x246D8: 'māng',
-    0x246D9: 'dǐng',
-    0x246DA: 'huān',
-    0x246DB: 'duǒ',
-    0x246DC: 'jiāng',
-    0x246DD: 'sù',
-    0x246E2: 'céng',
-    0x246E3: 'tà',
-    0x246E5: 'huáng',
-    0x246E6: 'jué',
-    0x246E7: 'xún',
-    0x246EA: 'xiòng',
-    0x246EC: 'mì',
-    0x246ED: 'qún',
-    0x246EE: 'láo',
-    0x246F1: 'zhì',
-    0x246F2: 'wěi,wéi',
-    0x246F7: 'sè',
-    0x246FB: 'zāng',
-    0x24701: 'ǎn',
-    0x24702: 'wèi,guì',
-    0x24704: 'huái,huài',
-    0x24707: 'zhàn',
-    0x24709: 'yīng',
-    0x2470A: 'gē',
-    0x2470B: 'huì',
-    0x2470D: 'quán',
-    0x24713: 'liè',
-    0x24714: 'jú',
-    0x24715: 'bà',
-    0x24716: 'léi',
-    0x24718: 'mán',
-    0x24719: 'líng',
-    0x2471C: 'lì',
-    0x2471D: 'jǐ',
-    0x24721: 'huí',
-    0x24722: 'xìn',
-    0x24723: 'shì,shé',
-    0x24724: 'zhé',
-    0x24727: 'bō',
-    0x2472B: 'chā',
-    0x2472F: 'chā',
-    0x24730: 'jīng',
-    0x24731: 'bā',
-    0x24732: 'bèi,pèi',
-    0x24735: 'yàn',
-    0x24737: 'hù',
-    0x24739: 'yú',
-    0x2473B: 'bì,pí',
-    0x2473C: 'chuán',
-    0x2473E: 'jǐ',
-    0x24742: 'mù',
-    0x24744: 'máo',
-    0x24745: 'zhōng',
-    0x24747: 'yè',
-    0x24748: 'dōu',
-    0x24749: 'yě',
-    0x2474D: 'rì',
-    0x2474E: 'yīn',
-    0x24750: 'hào',
-    0x24752: 'nà',
-    0x24753: 'tiè',
-    0x24754: 'fù,chái',
-    0x24755: 'mǔ',
-    0x24756: 'zǎi',
-    0x24758: 'hú',
-    0x2475A: 'chēn',
-    0x2475B: 'tuó',
-    0x2475E: 'chù',
-    0x2475F: 'fú,fèi',
-    0x24767: 'bào',
-    0x2476C: 'dǐ',
-    0x2476D: 'cǎi',
-    0x2476E: 'lù',
-    0x2476F: 'pǒ',
-    0x24770: 'dá',
-    0x24771: 'yè',
-    0x24773: 'yǐ',
-    0x24777: 'xiáng',
-    0x24778: 'bī',
-    0x24779: 'zhū',
-    0x2477B: 'yí',
-    0x2477D: 'lǜ',
-    0x2477F: 'kuāng',
-    0x24782: 'zhì',
-    0x24787: 'wá,kuáng',
-    0x24788: 'dī',
-    0x24789: 'shù',
-    0x2478A: 'liè',
-    0x2478B: 'zǎo',
-    0x2478C: 'zhì',
-    0x2478D: 'náo',
-    0x24797: 'chái',
-    0x2479A: 'xiāo',
-    0x2479B: 'zàng',
-    0x2479E: 'yù',
-    0x2479F: 'dòu',
-    0x247A0: 'chà',
-    0x247A1: 'xié',
-    0x247A2: 'yáng',
-    0x247A4: 'xiǎn',
-    0x247A5: 'bǎo',
-    0x247AE: 'zhài,zhāi',
-    0x247B0: 'qiú',
-    0x247B2: 'hú',
-    0x247B3: 'zài',
-    0x247B4: 'jué',
-    0x247B6: 'hān,hàn',
-    0x247BF: 'àn',
-    0x247C0: 'zào',
-    0x247C3: 'shà',
-    0x247C5: 'xiàn',
-    0x247C6: 'chǐ',
-    0x247C7: 'yǎn',
-    0x247C9: 'àn',
-    0x247CD: 'zhé',
-    0x247CE: 'jué',
-    0x247D1: 'lì',
-    0x247D3: 'lè',
-    0x247D6: 'cǎi',
-    0x247D8: 'lù',
-    0x247DA: 'jiā',
-    0x247DD: 'xià',
-    0x247DE: 'xiào',
-    0x247DF: 'yān',
-    0x247E0: 'xū',
-    0x247E2: 'dùn',
-    0x247E3: 'yíng',
-    0x247E4: 'huī,xūn',
-    0x247E5: 'tí',
-    0x247E6: 'nóu',
-    0x247E7: 'xǐ',
-    0x247EA: 'tú',
-    0x247F7: 'wāi',
-    0x247F8: 'chēn',
-    0x247FC: 'hōng',
-    0x247FE: 'tí',
-    0x247FF: 'xuān',
-    0x24800: 'zá',
-    0x24807: 'gé',
-    0x2480B: 'lóu',
-    0x2480C: 'chái',
-    0x2480D: 'pán',
-    0x2480E: 'jí',
-    0x24810: 'tà',
-    0x24813: 'xī',
-    0x24816: 'xiāo',
-    0x24818: 'sāo',
-    0x24819: 'jiā',
-    0x2481A: 'sù',
-    0x2481B: 'huāng',
-    0x2481D: 'cuō',
-    0x2481F: 'tà',
-    0x24820: 'shuāi',
-    0x2482A: 'fú',
-    0x2482B: 'lì',
-    0x2482D: 'shè',
-    0x2482F: 'táng',
-    0x24836: 'diān',
-    0x2483A: 'bì',
-    0x2483C: 'gòu',
-    0x2483D: 'cù',
-    0x2483F: 'qiān',
-    0x24842: 'léi,lěi',
-    0x24843: 'sù',
-    0x24846: 'zòng,zōng',
-    0x24847: 'hāo',
-    0x2484F: 'chì',
-    0x24850: 'cáo',
-    0x24853: 'wò',
-    0x24854: 'xiāo',
-    0x24855: 'liè,wěn',
-    0x24856: 'yán,yān',
-    0x2485D: 'bì',
-    0x2485F: 'huàn',
-    0x24861: 'xī',
-    0x24862: 'chī',
-    0x24863: 'xū',
-    0x24864: 'náo,nà,rú',
-    0x24865: 'yán,xiàn',
-    0x24867: 'xiè',
-    0x24868: 'zhá',
-    0x2486A: 'suì,wěi',
-    0x2486C: 'xì',
-    0x2486D: 'bēng,péng',
-    0x2486E: 'rán',
-    0x2486F: 'shuò,xī,què',
-    0x24870: 'bān',
-    0x24871: 'guì',
-    0x24872: 'kāi',
-    0x24873: 'chēn',
-    0x24876: 'xù',
-    0x2487E: 'è',
-    0x2487F: 'lì',
-    0x24880: 'xī',
-    0x24881: 'huàn',
-    0x24882: 'sù',
-    0x24884: 'chǎng',
-    0x2488A: 'lù',
-    0x2488B: 'yán',
-    0x2488E: 'dāng',
-    0x2488F: 'dǎn',
-    0x24890: 'yāng',
-    0x24892: 'zhǎi',
-    0x24893: 'jù,qú',
-    0x24895: 'duó',
-    0x24896: 'sāo,shān',
-    0x24897: 'lái',
-    0x24898: 'sù',
-    0x2489F: 'zé',
-    0x248A3: 'bì',
-    0x248A6: 'yìn',
-    0x248A8: 'hāo',
-    0x248AA: 'liè',
-    0x248AD: 'háo',
-    0x248AE: 'yáng',
-    0x248B4: 'shuò,lì',
-    0x248B5: 'lài,ài',
-    0x248B6: 'qióng',
-    0x248B9: 'lěi',
-    0x248BA: 'xié',
-    0x248BC: 'shì',
-    0x248C3: 'lǔ',
-    0x248C5: 'què',
-    0x248C6: 'lián',
-    0x248CC: 'xiào',
-    0x248CE: 'yīng',
-    0x248D1: 'xié',
-    0x248D8: 'líng',
-    0x248D9: 'yōu',
-    0x248DE: 'dǎng',
-    0x248DF: 'lǎn',
-    0x248E0: 'xiāo',
-    0x248E8: 'yì',
-    0x248EC: 'wū',
-    0x248EE: 'yì',
-    0x248EF: 'tuō',
-    0x248F0: 'bǔ',
-    0x248F2: 'xìn',
-    0x248F5: 'sī',
-    0x248F6: 'jīn',
-    0x248F8: 'bā',
-    0x248F9: 'fǎ',
-    0x248FB: 'mò',
-    0x248FC: 'ruò',
-    0x2490A: 'dà',
-    0x2490B: 'jì',
-    0x24910: 'sù',
-    0x24911: 'qióng',
-    0x24912: 'bā',
-    0x24926: 'tián',
-    0x24927: 'yóu',
-    0x24929: 'tuó',
-    0x2492B: 'wài',
-    0x2492C: 'yòu',
-    0x2492E: 'dōng',
-    0x24931: 'xǐ',
-    0x24932: 'kǒng',
-    0x24936: 'qióng',
-    0x24937: 'duī',
-    0x24938: 'duò',
-    0x2493A: 'yì',
-    0x24952: 'xī',
-    0x24953: 'qīn',
-    0x24954: 'sù',
-    0x24957: 'liú',
-    0x24959: 'wán',
-    0x2496D: 'chē',
-    0x2496E: 'zhū',
-    0x24970: 'mào',
-    0x24977: 'quán',
-    0x2497D: 'yū',
-    0x2497F: 'yì',
-    0x24980: 'mí',
-    0x24983: 'lái',
-    0x24984: 'zhì',
-    0x249A4: 'ní',
-    0x249A6: 'bān',
-    0x249AA: 'dōng',
-    0x249AE: 'zhì',
-    0x249D5: 'yì',
-    0x249D8: 'líng',
-    0x249D9: 'yú',
-    0x249DA: 'cōng',
-    0x249DB: 'dì',
-    0x249DC: 'zhì',
-    0x249E0: 'ruǎn',
-    0x249E3: 'jiàn',
-    0x249E9: 'wàn',
-    0x249EB: 'jīn,jìn,duī',
-    0x249ED: 'páng',
-    0x24A0D: 'lù',
-    0x24A0E: 'qú',
-    0x24A10: 'xǐ,tāo',
-    0x24A11: 'dá',
-    0x24A16: 'hù',
-    0x24A17: 'luǒ',
-    0x24A19: 'lè',
-    0x24A36: 'gǒng',
-    0x24A3B: 'lìng',
-    0x24A42: 'láo',
-    0x24A44: 'zhuàn',
-    0x24A68: 'zǎo',
-    0x24A69: 'hào',
-    0x24A6A: 'xiàng',
-    0x24A6D: 'hào',
-    0x24A6E: 'lì',
-    0x24A71: 'diàn,tiàn',
-    0x24A72: 'gé',
-    0x24A7D: 'huán',
-    0x24A84: 'è',
-    0x24A86: 'xiá',
-    0x24A8B: 'jiān',
-    0x24A8C: 'qí',
-    0x24A8D: 'xiá',
-    0x24A8E: 'yǒu',
-    0x24AA1: 'zhēng',
-    0x24AAA: 'zhuàn,chūn',
-    0x24AAE: 'chàn',
-    0x24AC9: 'xiè',
-    0x24AD5: 'náo',
-    0x24ADD: 'jì',
-    0x24ADE: 'tián',
-    0x24AE3: 'yǎn',
-    0x24AE7: 'hǎo',
-    0x24AE8: 'xín',
-    0x24AE9: 'líng',
-    0x24AEB: 'bān',
-    0x24AEC: 'běng',
-    0x24AF1: 'gōu',
-    0x24AF2: 'líng',
-    0x24AF5: 'kuò,guó',
-    0x24AF6: 'qià',
-    0x24AF7: 'jiào',
-    0x24AF9: 'ēn',
-    0x24AFA: 'yáo',
-    0x24AFB: 'dū',
-    0x24B01: 'huǒ,guǒ,luǒ',
-    0x24B02: 'dǔ',
-    0x24B03: 'pēi',
-    0x24B0C: 'yuán',
-    0x24B0F: 'lóu',
-    0x24B10: 'xíng',
-    0x24B13: 'lián,liǎn',
-    0x24B14: 'yáo',
-    0x24B15: 'xī',
-    0x24B16: 'yáo',
-    0x24B18: 'xī',
-    0x24B1B: 'lú',
-    0x24B1D: 'yàn',
-    0x24B20: 'quán',
-    0x24B25: 'ráng',
-    0x24B26: 'wà',
-    0x24B27: 'zú',
-    0x24B28: 'fàn',
-    0x24B29: 'yì',
-    0x24B2A: 'dù,kān',
-    0x24B2B: 'suì',
-    0x24B2D: 'pī',
-    0x24B2F: 'hán,qiàn',
-    0x24B31: 'xù',
-    0x24B33: 'gǒng',
-    0x24B35: 'dì',
-    0x24B37: 'nà',
-    0x24B3E: 'duò,tuó',
-    0x24B3F: 'wā',
-    0x24B42: 'niè',
-    0x24B48: 'diào',
-    0x24B49: 'huāng',
-    0x24B4C: 'tí',
-    0x24B4D: 'fàn',
-    0x24B51: 'wú',
-    0x24B52: 'áng',
-    0x24B54: 'píng',
-    0x24B59: 'hán,gān',
-    0x24B5B: 'gāng',
-    0x24B5C: 'lí',
-    0x24B5E: 'dūn',
-    0x24B5F: 'fù',
-    0x24B60: 'nà',
-    0x24B62: 'cèi,suì',
-    0x24B67: 'jiē',
-    0x24B69: 'qìng',
-    0x24B6B: 'yīng',
-    0x24B6C: 'xiáng',
-    0x24B71: 'hú',
-    0x24B74: 'sù',
-    0x24B7B: 'gē',
-    0x24B7C: 'è',
-    0x24B7D: 'xù',
-    0x24B86: 'xī',
-    0x24B8A: 'kāng',
-    0x24B8B: 'guó',
-    0x24B8C: 'jiē',
-    0x24B8D: 'chuán',
-    0x24B8E: 'léi',
-    0x24B8F: 'héng',
-    0x24B90: 'zūn',
-    0x24B95: 'piè',
-    0x24B98: 'dēng',
-    0x24B99: 'xī',
-    0x24B9A: 'léi',
-    0x24B9C: 'shàn',
-    0x24BA7: 'lú',
-    0x24BA9: 'duì',
-    0x24BAA: 'jùn',
-    0x24BAD: 'chàn',
-    0x24BAF: 'xié',
-    0x24BB0: 'wā',
-    0x24BB1: 'zhé',
-    0x24BB3: 'zhuān,guàn',
-    0x24BB7: 'liù',
-    0x24BB8: 'léi',
-    0x24BBC: 'dài',
-    0x24BBD: 'gān',
-    0x24BC4: 'shì',
-    0x24BC7: 'yǎn',
-    0x24BCC: 'gān',
-    0x24BD0: 'yán',
-    0x24BD6: 'suī',
-    0x24BDA: 'zhōng',
-    0x24BDC: 'shì',
-    0x24BE1: 'shèng',
-    0x24BE5: 'chǎn',
-    0x24BF7: 'huáng',
-    0x24BF8: 'yìn',
-    0x24BFB: 'měng',
-    0x24C02: 'ráng',
-    0x24C05: 'xiáng',
-    0x24C08: 'bèi,fú',
-    0x24C0C: 'chuán',
-    0x24C11: 'pú',
-    0x24C19: 'kē,gé',
-    0x24C1A: 'lā,lá',
-    0x24C1D: 'quǎn',
-    0x24C1F: 'hàng',
-    0x24C20: 'chì',
-    0x24C21: 'máng',
-    0x24C26: 'zhà',
-    0x24C2A: 'fèn',
-    0x24C2C: 'chào',
-    0x24C33: 'jǐng',
-    0x24C43: 'liè',
-    0x24C45: 'nà',
-    0x24C46: 'nà',
-    0x24C47: 'tóng',
-    0x24C4B: 'rán',
-    0x24C4C: 'zǔ',
-    0x24C4D: 'pī,pǒ',
-    0x24C4E: 'yǒu',
-    0x24C50: 'shū',
-    0x24C5B: 'liè',
-    0x24C5C: 'shōu',
-    0x24C5D: 'tuǎn',
-    0x24C5F: 'gǎo',
-    0x24C60: 'sháo',
-    0x24C61: 'tuó',
-    0x24C63: 'nán',
-    0x24C67: 'tuǒ',
-    0x24C68: 'gōng',
-    0x24C69: 'diào',
-    0x24C74: 'měng',
-    0x24C75: 'bāng',
-    0x24C77: 'xié',
-    0x24C78: 'sì',
-    0x24C79: 'tǐng',
-    0x24C7A: 'guì',
-    0x24C7D: 'fú',
-    0x24C7E: 'guì',
-    0x24C89: 'guì',
-    0x24C91: 'zhǔ',
-    0x24C93: 'lái',
-    0x24C95: 'lǔn',
-    0x24C96: 'tiǎn',
-    0x24C97: 'rǎn',
-    0x24C9A: 'dōng',
-    0x24CA8: 'juàn',
-    0x24CA9: 'yán',
-    0x24CAC: 'ruán',
-    0x24CAD: 'dǎn',
-    0x24CB0: 'mào',
-    0x24CB6: 'luán,niǎo',
-    0x24CB8: 'xù,zī',
-    0x24CBA: 'xī',
-    0x24CC2: 'má',
-    0x24CC3: 'qī',
-    0x24CC5: 'chà',
-    0x24CC8: 'shāng',
-    0x24CC9: 'hàn',
-    0x24CCA: 'píng',
-    0x24CCE: 'jī',
-    0x24CD3: 'lì',
-    0x24CD5: 'yù',
-    0x24CD6: 'bān,fān',
-    0x24CD8: 'tēng',
-    0x24CDD: 'chóu',
-    0x24CE0: 'chóu',
-    0x24CE4: 'qī',
-    0x24CE5: 'xī',
-    0x24CE6: 'bèi',
-    0x24CEA: 'yè',
-    0x24CED: 'guǎng',
-    0x24CEF: 'zhù',
-    0x24CF3: 'léi,huǐ',
-    0x24CF4: 'léi',
-    0x24CF5: 'chā',
-    0x24D00: 'guǎng,qiāo',
-    0x24D0D: 'dié',
-    0x24D13: 'yǎ',
-    0x24D18: 'niè',
-    0x24D19: 'shū,xū',
-    0x24D1B: 'zhì',
-    0x24D1F: 'zhì',
-    0x24D22: 'zhì',
-    0x24D23: 'pǐ',
-    0x24D25: 'jiū',
-    0x24D26: 'jiū',
-    0x24D27: 'yì',
-    0x24D28: 'yòu,yǒu',
-    0x24D2A: 'jiū',
-    0x24D2F: 'huàn',
-    0x24D31: 'dù',
-    0x24D3B: 'táo',
-    0x24D3C: 'qiè,cí',
-    0x24D3D: 'qín',
-    0x24D3E: 'xìn',
-    0x24D3F: 'chān',
-    0x24D40: 'jì',
-    0x24D42: 'qìn',
-    0x24D4A: 'dù',
-    0x24D4B: 'zhī',
-    0x24D4E: 'ǒu',
-    0x24D50: 'wù',
-    0x24D52: 'wén',
-    0x24D58: 'bì',
-    0x24D5B: 'bēi',
-    0x24D5D: 'mǔ',
-    0x24D5E: 'jìn',
-    0x24D5F: 'táo',
-    0x24D60: 'liáo',
-    0x24D65: 'cáo,zhǒu',
-    0x24D66: 'zhá',
-    0x24D6C: 'chǐ',
-    0x24D6D: 'yā',
-    0x24D6E: 'kuí',
-    0x24D6F: 'yìn',
-    0x24D78: 'lóng,pāng',
-    0x24D79: 'qià',
-    0x24D7B: 'hāng',
-    0x24D7C: 'shàng,shāng',
-    0x24D7D: 'hài',
-    0x24D7E: 'chā',
-    0x24D80: 'jiǎo',
-    0x24D81: 'lǎo',
-    0x24D88: 'xī',
-    0x24D8B: 'bó',
-    0x24D93: 'zhǐ',
-    0x24D95: 'tùn',
-    0x24D96: 'fú',
-    0x24D98: 'hū',
-    0x24D9A: 'niè',
-    0x24D9B: 'yì',
-    0x24D9C: 'zhuàng',
-    0x24DA0: 'chá',
-    0x24DA4: 'suān',
-    0x24DA7: 'yùn',
-    0x24DAE: 'dù',
-    0x24DB0: 'xī',
-    0x24DB1: 'chuàn',
-    0x24DB2: 'xíng',
-    0x24DB3: 'jiǎo',
-    0x24DB4: 'shēn',
-    0x24DC0: 'wāng',
-    0x24DC1: 'bēi',
-    0x24DC2: 'féi',
-    0x24DC3: 'jiàn',
-    0x24DC4: 'quán',
-    0x24DC5: 'yì,yá',
-    0x24DC6: 'dōng',
-    0x24DC7: 'xù',
-    0x24DC8: 'nà,niè',
-    0x24DC9: 'jí',
-    0x24DCC: 'zhěn',
-    0x24DCD: 'qí',
-    0x24DCE: 'duī',
-    0x24DCF: 'yín',
-    0x24DD1: 'jiù',
-    0x24DD2: 'pí,bì,bēi',
-    0x24DD3: 'xìn',
-    0x24DD4: 'lún',
-    0x24DD5: 'cǎi',
-    0x24DD6: 'lìng',
-    0x24DD7: 'biē',
-    0x24DD8: 'dào',
-    0x24DD9: 'dé',
-    0x24DDF: 'la',
-    0x24DE1: 'xī,nüè',
-    0x24DE2: 'jù',
-    0x24DE4: 'xiáo',
-    0x24DE6: 'jīng',
-    0x24DF9: 'wài',
-    0x24DFB: 'nǎo',
-    0x24DFC: 'xiāng',
-    0x24DFD: 'què',
-    0x24DFE: 'qiè',
-    0x24DFF: 'tū',
-    0x24E00: 'xǔ',
-    0x24E01: 'huì',
-    0x24E05: 'mín',
-    0x24E06: 'wěi',
-    0x24E08: 'yóu',
-    0x24E09: 'tuí',
-    0x24E0A: 'dài',
-    0x24E0E: 'kě,hài',
-    0x24E0F: 'nà,niè',
-    0x24E11: 'fù',
-    0x24E12: 'yù',
-    0x24E13: 'zhǐ',
-    0x24E15: 'hān',
-    0x24E16: 'āi',
-    0x24E17: 'fù',
-    0x24E21: 'yāng',
-    0x24E24: 'shí',
-    0x24E26: 'chán',
-    0x24E2A: 'chì',
-    0x24E2B: 'yùn',
-    0x24E2C: 'shuāi',
-    0x24E2E: 'sù',
-    0x24E2F: 'sǎng',
-    0x24E31: 'è,kè,kài,yà',
-    0x24E32: 'zhěng',
-    0x24E33: 'ái',
-    0x24E34: 'suǒ',
-    0x24E35: 'bù',
-    0x24E37: 'qún',
-    0x24E38: 'yì',
-    0x24E39: 'yǎn',
-    0x24E3B: 'nà',
-    0x24E3C: 'wǔ',
-    0x24E47: 'lì',
-    0x24E48: 'lì',
-    0x24E4A: 'xī',
-    0x24E4B: 'jué',
-    0x24E4C: 'shī',
-    0x24E4E: 'yǎ',
-    0x24E5B: 'chén',
-    0x24E5C: 'yíng',
-    0x24E5D: 'bì',
-    0x24E5E: 'chè',
-    0x24E61: 'zhā',
-    0x24E62: 'tuǒ',
-    0x24E63: 'hù',
-    0x24E64: 'téng',
-    0x24E65: 'yìng',
-    0x24E66: 'bǐ',
-    0x24E67: 'níng',
-    0x24E68: 'liàn',
-    0x24E69: 'xìn',
-    0x24E6A: 'yǔ',
-    0x24E72: 'bèi',
-    0x24E74: 'mó',
-    0x24E75: 'duī',
-    0x24E77: 'dǎo',
-    0x24E78: 'qí',
-    0x24E80: 'shuāi',
-    0x24E83: 'xiāo,jiāo,yāo',
-    0x24E84: 'zhǒng,tóng',
-    0x24E85: 'zhuì',
-    0x24E87: 'biàn',
-    0x24E89: 'wěi',
-    0x24E8A: 'xī,sī',
-    0x24E8C: 'dēng',
-    0x24E8E: 'xiē',
-    0x24E8F: 'pān',
-    0x24E90: 'niè',
-    0x24E93: 'bié',
-    0x24E94: 'shè',
-    0x24E95: 'fèi',
-    0x24E96: 'mǐn',
-    0x24E97: 'qì,jì',
-    0x24EAA: 'shàn',
-    0x24EAB: 'suǒ',
-    0x24EB7: 'jí',
-    0x24EBA: 'dǎn,dàn,tán',
-    0x24EBB: 'juàn',
-    0x24EBC: 'lù',
-    0x24EBE: 'ào',
-    0x24EC2: 'yì',
-    0x24EC3: 'shǔ',
-    0x24EC4: 'suì',
-    0x24EC5: 'wèi',
-    0x24EC6: 'wán',
-    0x24EC7: 'chǔ',
-    0x24ECC: 'wò',
-    0x24ED6: 'bì',
-    0x24ED8: 'yǐn',
-    0x24ED9: 'huó',
-    0x24EDC: 'kài,è',
-    0x24EDD: 'níng',
-    0x24EE2: 'ài',
-    0x24EE4: 'lì',
-    0x24EE6: 'zhāi',
-    0x24EF1: 'lù',
-    0x24EF6: 'biàn',
-    0x24EF7: 'pán',
-    0x24EFF: 'guì',
-    0x24F00: 'sū',
-    0x24F01: 'méng',
-    0x24F02: 'xiǎn',
-    0x24F03: 'lòng,lóng',
-    0x24F05: 'qì',
-    0x24F0B: 'chàn',
-    0x24F0C: 'yì',
-    0x24F0D: 'háng',
-    0x24F0F: 'liǎn',
-    0x24F10: 'guàn,huàn',
-    0x24F12: 'wěi,huà',
-    0x24F17: 'jué',
-    0x24F18: 'léi',
-    0x24F19: 'luán',
-    0x24F1A: 'lì',
-    0x24F1C: 'pí',
-    0x24F22: 'huǎn',
-    0x24F2E: 'guī',
-    0x24F33: 'jú',
-    0x24F36: 'dēng',
-    0x24F3A: 'fèi',
-    0x24F41: 'zhī',
-    0x24F43: 'mèi',
-    0x24F45: 'huàn',
-    0x24F49: 'pā',
-    0x24F4A: 'bǐ',
-    0x24F4C: 'pō',
-    0x24F53: 'ér',
-    0x24F55: 'huàn',
-    0x24F63: 'chàng',
-    0x24F65: 'luò',
-    0x24F66: 'fǒu',
-    0x24F6F: 'chóu',
-    0x24F71: 'zú',
-    0x24F72: 'nán',
-    0x24F73: 'xiǎo',
-    0x24F79: 'bài',
-    0x24F7A: 'lù',
-    0x24F7C: 'luò',
-    0x24F7F: 'niàn',
-    0x24F80: 'zé',
-    0x24F84: 'zhù',
-    0x24F85: 'hú',
-    0x24F88: 'huī',
-    0x24F89: 'tǎng',
-    0x24F8A: 'chóu',
-    0x24F91: 'huáng',
-    0x24F92: 'dōu',
-    0x24F9B: 'miào',
-    0x24F9D: 'bó',
-    0x24FA0: 'dì',
-    0x24FA2: 'děng',
-    0x24FA3: 'pū',
-    0x24FA5: 'sōng',
-    0x24FA6: 'chóu',
-    0x24FAB: 'yào',
-    0x24FAC: 'měng',
-    0x24FAD: 'lóng',
-    0x24FB2: 'lián',
-    0x24FB5: 'bié',
-    0x24FBA: 'lǚ',
-    0x24FBF: 'sè',
-    0x24FC0: 'zuó',
-    0x24FC4: 'cún',
-    0x24FC5: 'líng',
-    0x24FC6: 'zhěng',
-    0x24FC7: 'pǐ',
-    0x24FC8: 'báo',
-    0x24FCB: 'què',
-    0x24FCE: 'pī',
-    0x24FCF: 'nàn',
-    0x24FD0: 'pī',
-    0x24FD1: 'bǒ',
-    0x24FD2: 'bèi',
-    0x24FD3: 'fā',
-    0x24FD5: 'mǐn',
-    0x24FD6: 'mò',
-    0x24FD7: 'wà',
-    0x24FD8: 'zhāo',
-    0x24FD9: 'zhì,pí',
-    0x24FDA: 'cū',
-    0x24FDF: 'xún',
-    0x24FE0: 'jí',
-    0x24FE1: 'guì,qí',
-    0x24FE3: 'chéng',
-    0x24FE7: 'hàn',
-    0x24FE8: 'xiào',
-    0x24FE9: 'què',
-    0x24FEB: 'chuò',
-    0x24FED: 'fǔ',
-    0x24FF3: 'qǐn',
-    0x24FF4: 'lù',
-    0x24FF5: 'què',
-    0x24FF6: 'diǎn',
-    0x24FF7: 'qiān',
-    0x24FFC: 'chǎng',
-    0x24FFD: 'tà',
-    0x24FFE: 'bēi',
-    0x25001: 'dù',
-    0x25002: 'běng,bāng',
-    0x25003: 'hòu',
-    0x25008: 'zhǎ',
-    0x25009: 'zhǎ',
-    0x2500E: 'què',
-    0x2500F: 'má',
-    0x25010: 'hán',
-    0x25013: 'liú',
-    0x25014: 'lù',
-    0x25016: 'zī',
-    0x25018: 'pǐ',
-    0x25019: 'zhòu',
-    0x2501B: 'zāo',
-    0x2501D: 'niǔ',
-    0x25020: 'huì',
-    0x25023: 'xué,qiào',
-    0x25025: 'là',
-    0x2502B: 'nóu,rǎn',
-    0x2502C: 'yǎn,yè',
-    0x2502D: 'rǎn',
-    0x2502E: 'nǎo',
-    0x25030: 'là',
-    0x25031: 'guǎng',
-    0x25032: 'dú',
-    0x25035: 'lú',
-    0x25039: 'jiǎn',
-    0x2503A: 'xiè',
-    0x2503B: 'qì',
-    0x2503E: 'xiàng',
-    0x25041: 'guǒ',
-    0x25042: 'jié',
-    0x25043: 'màng',
-    0x25046: 'xiā',
-    0x25047: 'kuī',
-    0x2504E: 'yòng',
-    0x25050: 'hǎi',
-    0x25051: 'mì',
-    0x25052: 'yào',
-    0x25055: 'wēn',
-    0x2505F: 'lì',
-    0x25060: 'juàn,quán,quān',
-    0x25061: 'wū',
-    0x25062: 'qiáo',
-    0x2506E: 'diào',
-    0x2506F: 'chù,chuò',
-    0x25072: 'suō',
-    0x25075: 'chōng',
-    0x25078: 'quān',
-    0x25079: 'shè',
-    0x25082: 'měng',
-    0x25083: 'jù',
-    0x2508B: 'tú',
-    0x25092: 'nóng',
-    0x25093: 'mó',
-    0x25099: 'fèn',
-    0x250A2: 'áo',
-    0x250A3: 'guō',
-    0x250A4: 'hú',
-    0x250A5: 'cán',
-    0x250A6: 'dūn',
-    0x250A7: 'hǎi',
-    0x250A8: 'jiǎo',
-    0x250B0: 'gū',
-    0x250B5: 'jīn',
-    0x250B8: 'yáng',
-    0x250C0: 'chà',
-    0x250CC: 'huī',
-    0x250D4: 'qú',
-    0x250D5: 'kē',
-    0x250DF: 'qīng',
-    0x250E0: 'yì',
-    0x250E3: 'kǎi',
-    0x250E4: 'jiǎo',
-    0x250E7: 'chōu,jiǎo,yǎo',
-    0x250E8: 'bǔ',
-    0x250E9: 'gèn,yǎn',
-    0x250EA: 'jiāo',
-    0x250EB: 'zhī',
-    0x250EE: 'wèn',
-    0x250F0: 'bīn',
-    0x250F4: 'xiòng',
-    0x250F5: 'fàn',
-    0x250F8: 'yí',
-    0x250F9: 'chuàn',
-    0x250FA: 'yào',
-    0x250FD: 'yāng',
-    0x250FE: 'dù',
-    0x250FF: 'yǎn',
-    0x25101: 'méng',
-    0x25107: 'chī,hūn',
-    0x25108: 'mù',
-    0x25109: 'jiāo',
-    0x2510B: 'nǜ',
-    0x2510D: 'guó',
-    0x2510E: 'xuè',
-    0x25111: 'fú',
-    0x25112: 'xuē',
-    0x25113: 'fū',
-    0x25114: 'pèi,pò',
-    0x25115: 'mò',
-    0x25116: 'xī',
-    0x25117: 'wò,nài',
-    0x25118: 'shǎn',
-    0x2511B: 'xī',
-    0x2511C: 'qì',
-    0x2511D: 'miàn',
-    0x25126: 'dǎn',
-    0x25128: 'chǒu',
-    0x25131: 'fèi',
-    0x25132: 'mié',
-    0x25134: 'xuè,jué',
-    0x25135: 'xù,yù',
-    0x25136: 'sī',
-    0x25137: 'jǔ',
-    0x25138: 'mǎo',
-    0x25139: 'bào',
-    0x2513B: 'yí',
-    0x2513C: 'guā',
-    0x2513D: 'nì',
-    0x2513F: 'yí,dì',
-    0x25141: 'zuò',
-    0x25144: 'nǔ',
-    0x25151: 'diàn',
-    0x25152: 'fàn',
-    0x25153: 'yì',
-    0x25154: 'shì',
-    0x25157: 'cū',
-    0x25158: 'zhěn,mí',
-    0x2515E: 'shì',
-    0x2515F: 'jiǎo',
-    0x25160: 'hòu',
-    0x25161: 'ér',
-    0x25166: 'lèi',
-    0x25167: 'xuè',
-    0x25168: 'gèng',
-    0x2516A: 'shōu',
-    0x2516C: 'juān',
-    0x25174: 'jié',
-    0x25175: 'wéi',
-    0x25177: 'shǒu',
-    0x25178: 'jìng',
-    0x2517A: 'xú',
-    0x2517B: 'chòng',
-    0x25185: 'jiāng',
-    0x25186: 'mòu',
-    0x25189: 'yù',
-    0x2518C: 'jué',
-    0x25191: 'tìng',
-    0x25194: 'xiāo',
-    0x25196: 'dōu',
-    0x25198: 'guó',
-    0x25199: 'máng',
-    0x2519A: 'wāng',
-    0x2519B: 'xù',
-    0x2519C: 'wàng',
-    0x2519D: 'suō',
-    0x2519E: 'juàn',
-    0x2519F: 'yuè',
-    0x251A1: 'hán',
-    0x251A3: 'shēn',
-    0x251A5: 'xié',
-    0x251A6: 'liú',
-    0x251A7: 'rún',
-    0x251AF: 'bì',
-    0x251B2: 'nào',
-    0x251B6: 'wàn',
-    0x251B7: 'jiù',
-    0x251B8: 'quē',
-    0x251C4: 'nì',
-    0x251C6: 'mí',
-    0x251C7: 'suō',
-    0x251C9: 'qiǎng',
-    0x251CC: 'hàn,qià',
-    0x251CD: 'zhuó',
-    0x251CE: 'mí',
-    0x251CF: 'xù',
-    0x251D1: 'lǎng',
-    0x251D2: 'jié',
-    0x251D3: 'dìng',
-    0x251D4: 'chàng,zhāng',
-    0x251D5: 'zhì',
-    0x251D6: 'fēi',
-    0x251D7: 'jiá',
-    0x251D8: 'jùn',
-    0x251D9: 'huò',
-    0x251DA: 'qī',
-    0x251DB: 'jū,jù,xì',
-    0x251DC: 'zhūn,guō',
-    0x251DE: 'diàn',
-    0x251DF: 'jiǎo',
-    0x251E0: 'yā',
-    0x251E2: 'zhǎn',
-    0x251ED: 'zhī',
-    0x251EF: 'mài',
-    0x251F0: 'hū',
-    0x251F1: 'xiè',
-    0x251F2: 'shí',
-    0x251F3: 'guī',
-    0x251FF: 'xù',
-    0x25202: 'jí',
-    0x25204: 'chuàng',
-    0x25206: 'mào',
-    0x25207: 'ruán',
-    0x25208: 'xū',
-    0x25209: 'huàn',
-    0x2520A: 'shà',
-    0x2520B: 'jǔ',
-    0x2520F: 'kuàng',
-    0x25211: 'hóu',
-    0x25212: 'guān',
-    0x25213: 'guā',
-    0x25215: 'mí',
-    0x25216: 'dié',
-    0x25217: 'bì',
-    0x25218: 'liǎng',
-    0x25219: 'là',
-    0x2521A: 'shǎn',
-    0x2521B: 'lù',
-    0x2521C: 'xì',
-    0x2521F: 'sǒu',
-    0x2522C: 'ōu',
-    0x2522E: 'léng',
-    0x25237: 'kū',
-    0x25238: 'guī',
-    0x2523B: 'xī',
-    0x2523C: 'pán,pān',
-    0x2523D: 'sè',
-    0x2523E: 'juè',
-    0x2523F: 'hòng',
-    0x25240: 'guàn',
-    0x25241: 'jù',
-    0x25243: 'nài',
-    0x25244: 'huá',
-    0x25245: 'gé',
-    0x25246: 'lì',
-    0x25247: 'gòu',
-    0x25248: 'tì',
-    0x2524A: 'mà',
-    0x2524B: 'téng',
-    0x2524C: 'dá',
-    0x25250: 'qī',
-    0x25251: 'yù,hè',
-    0x25252: 'jiǎo',
-    0x25253: 'miè',
-    0x25254: 'gěng',
-    0x25255: 'mèng,méng',
-    0x25256: 'wèi',
-    0x25258: 'tí',
-    0x25259: 'qí',
-    0x2525C: 'chén',
-    0x2525D: 'dōu',
-    0x2525F: 'pán',
-    0x25270: 'hàn,qià',
-    0x25274: 'mì',
-    0x25275: 'má',
-    0x25276: 'lù',
-    0x25277: 'qī',
-    0x25278: 'kēng',
-    0x2527A: 'dié',
-    0x2527B: 'qì',
-    0x2527C: 'jiāo',
-    0x2527D: 'kāng',
-    0x2527E: 'qiāo',
-    0x2527F: 'mì',
-    0x25280: 'shān,sǎn',
-    0x25287: 'jiān',
-    0x25288: 'lí',
-    0x25289: 'kè',
-    0x2528A: 'xù',
-    0x25291: 'mán,màn',
-    0x25292: 'fèng',
-    0x25293: 'chàn',
-    0x25294: 'huǐ',
-    0x252A7: 'kòu',
-    0x252AA: 'wěi',
-    0x252AB: 'guàn',
-    0x252AC: 'jí',
-    0x252AD: 'zùn',
-    0x252AE: 'huò',
-    0x252AF: 'xié',
-    0x252B4: 'suì',
-    0x252B6: 'ruǎn',
-    0x252B8: 'tè',
-    0x252BC: 'zhèng',
-    0x252BD: 'kūn',
-    0x252BE: 'xiǎng',
-    0x252BF: 'mián',
-    0x252C1: 'xì',
-    0x252CC: 'sā',
-    0x252D9: 'è',
-    0x252DA: 'miè',
-    0x252DB: 'zhǔ',
-    0x252DC: 'zōu',
-    0x252DD: 'měng',
-    0x252DF: 'xī',
-    0x252E1: 'táng',
-    0x252E3: 'jià',
-    0x252E4: 'cháng',
-    0x252E5: 'jí',
-    0x252EE: 'zhuó',
-    0x252FF: 'hè',
-    0x25300: 'chá',
-    0x25301: 'qì',
-    0x25302: 'mián',
-    0x25303: 'zhěn',
-    0x25304: 'kū',
-    0x25305: 'yè',
-    0x25306: 'zhōu',
-    0x25308: 'jiān',
-    0x2530A: 'pàn',
-    0x2530D: 'huī',
-    0x2530F: 'míng',
-    0x25310: 'liù',
-    0x25318: 'shuì',
-    0x2531A: 'mài,yá,shù',
-    0x2531B: 'lí',
-    0x2531E: 'shuò',
-    0x2531F: 'yí',
-    0x25324: 'lì',
-    0x25328: 'xiē,miè',
-    0x25329: 'tè',
-    0x2532A: 'xiū',
-    0x2532D: 'xuàn',
-    0x2532E: 'lì',
-    0x2532F: 'méng',
-    0x25330: 'wéi',
-    0x25331: 'méng',
-    0x2533A: 'yào',
-    0x2533B: 'lán',
-    0x2533C: 'líng',
-    0x2533D: 'yīng',
-    0x2533E: 'yīng',
-    0x2533F: 'lì',
-    0x25340: 'jiǎn',
-    0x25341: 'guī,guì',
-    0x25345: 'guān',
-    0x25346: 'xiè',
-    0x25349: 'shè',
-    0x2534B: 'zuī,xiē,huǐ',
-    0x25353: 'kàn,yǎn',
-    0x25354: 'léi',
-    0x2535A: 'biàn',
-    0x2535D: 'shǔ',
-    0x2535E: 'nǜ',
-    0x2535F: 'xù,yì',
-    0x25363: 'hào',
-    0x25368: 'guǐ',
-    0x2536A: 'zhài',
-    0x2536B: 'láng',
-    0x2536C: 'cuān',
-    0x2536D: 'zhì',
-    0x2536E: 'féng,fēng',
-    0x2536F: 'qīn',
-    0x25371: 'zé',
-    0x25372: 'nà',
-    0x25373: 'niǔ',
-    0x25374: 'yì',
-    0x25377: 'cōng',
-    0x25378: 'shī',
-    0x25379: 'jiǎn',
-    0x2537A: 'zōng',
-    0x2537B: 'yǎn',
-    0x2537C: 'yīng',
-    0x25380: 'ruǎn',
-    0x25382: 'róng',
-    0x25383: 'xì',
-    0x25385: 'guān',
-    0x25386: 'kài',
-    0x25388: 'wù',
-    0x2538A: 'qín',
-    0x2538B: 'cōng',
-    0x2538D: 'zé',
-    0x2538E: 'xiè',
-    0x25390: 'yù',
-    0x25391: 'zàn',
-    0x25392: 'chuāng',
-    0x25393: 'lǐ',
-    0x25394: 'lǐ',
-    0x25395: 'xù',
-    0x25396: 'mí',
-    0x25397: 'xù',
-    0x25398: 'ruǎn',
-    0x2539B: 'guì',
-    0x2539C: 'rǒng',
-    0x2539F: 'máo',
-    0x253A1: 'qín',
-    0x253A2: 'cuàn',
-    0x253A3: 'cuàn',
-    0x253A4: 'cuàn',
-    0x253AE: 'wū',
-    0x253B0: 'fǎ',
-    0x253B1: 'bá',
-    0x253B8: 'qià',
-    0x253B9: 'zhì',
-    0x253BA: 'tiào',
-    0x253C4: 'zhì',
-    0x253C5: 'zhí',
-    0x253C7: 'huàn',
-    0x253C8: 'chóu',
-    0x253CA: 'zhì',
-    0x253CE: 'yǐng',
-    0x253D2: 'wù',
-    0x253D3: 'bēi',
-    0x253D5: 'hóng',
-    0x253D6: 'shěn',
-    0x253D8: 'jué',
-    0x253D9: 'kuì',
-    0x253DC: 'yǐ',
-    0x253DD: 'yà',
-    0x253E0: 'bī',
-    0x253E4: 'kuà',
-    0x253E5: 'qiān',
-    0x253E8: 'zhāo',
-    0x253EA: 'kǎi',
-    0x253EB: 'shāng',
-    0x253EE: 'àn',
-    0x253EF: 'zhé',
-    0x253F0: 'zhì',
-    0x253F7: 'zhì',
-    0x253F9: 'jiǎo',
-    0x25400: 'sī',
-    0x25401: 'pú',
-    0x25402: 'ǒu',
-    0x2540A: 'zhuó',
-    0x25411: 'yīng',
-    0x25413: 'huān',
-    0x25415: 'yà',
-    0x25418: 'shí',
-    0x25419: 'pā,bā',
-    0x2541A: 'pǔ',
-    0x2541E: 'máng',
-    0x2541F: 'chāi',
-    0x25429: 'yún',
-    0x2542C: 'gǔ',
-    0x25439: 'dǎn',
-    0x2543B: 'náo',
-    0x2543D: 'zhé',
-    0x2543F: 'hú',
-    0x25445: 'kēng',
-    0x25447: 'dié',
-    0x25448: 'tīng',
-    0x2544B: 'guài',
-    0x2544E: 'qiōng',
-    0x2544F: 'shǐ',
-    0x25450: 'jiǎ',
-    0x25451: 'ào',
-    0x25452: 'nǎ,kēng',
-    0x25453: 'pǐn',
-    0x25454: 'jiá',
-    0x25461: 'zhè',
-    0x25462: 'bù',
-    0x25463: 'wǒ',
-    0x25465: 'chǎ',
-    0x2546A: 'náo',
-    0x2546B: 'kān,kǎn',
-    0x2546F: 'dú',
-    0x25470: 'guài',
-    0x25471: 'qióng',
-    0x25473: 'róng',
-    0x25474: 'yǐ',
-    0x25475: 'duī',
-    0x25476: 'lěi',
-    0x25478: 'zhōu',
-    0x25479: 'kuā',
-    0x2547A: 'ē',
-    0x2547B: 'xiān',
-    0x2547C: 'diàn',
-    0x2547D: 'nuò',
-    0x2547E: 'è',
-    0x2547F: 'yōng',
-    0x25480: 'wù',
-    0x25481: 'kēng',
-    0x25493: 'zhì',
-    0x25497: 'zhǐ',
-    0x25498: 'xún',
-    0x2549B: 'zhèng',
-    0x2549E: 'yáng',
-    0x254A0: 'huò',
-    0x254A1: 'jí',
-    0x254A2: 'nǎo,lì',
-    0x254A7: 'yà',
-    0x254A8: 'lù',
-    0x254AB: 'fū',
-    0x254AC: 'sǎn',
-    0x254AD: 'chù',
-    0x254AE: 'wěi',
-    0x254B0: 'fǔ',
-    0x254B1: 'kēng',
-    0x254B2: 'sì',
-    0x254B3: 'kàng',
-    0x254B5: 'yì',
-    0x254B6: 'huà',
-    0x254BE: 'yǔ',
-    0x254C3: 'lì',
-    0x254C6: 'lǐn',
-    0x254C7: 'dǔ',
-    0x254C8: 'è',
-    0x254CC: 'qiǎng',
-    0x254CD: 'dú',
-    0x254D0: 'jié',
-    0x254D1: 'chuò',
-    0x254D2: 'xiàn,kàn',
-    0x254D6: 'gǎo',
-    0x254EC: 'dào',
-    0x254F0: 'hōng',
-    0x254FB: 'zōng',
-    0x254FE: 'qì',
-    0x254FF: 'tuó',
-    0x25500: 'hōng',
-    0x25501: 'pǐ',
-    0x25502: 'gèng',
-    0x25504: 'niè',
-    0x25507: 'kōng',
-    0x2550A: 'zhǐ',
-    0x25511: 'xiǎo',
-    0x25521: 'shè',
-    0x25522: 'yú',
-    0x25523: 'jiāng',
-    0x25529: 'qǐ',
-    0x2552A: 'chěn',
-    0x2552B: 'sǎng',
-    0x2552D: 'suǒ',
-    0x2552E: 'qián',
-    0x2552F: 'huì',
-    0x25531: 'shàn',
-    0x25532: 'è',
-    0x2553B: 'qiū',
-    0x2553D: 'kè',
-    0x25540: 'wēng',
-    0x25541: 'zī',
-    0x25542: 'jí',
-    0x25547: 'dǎ',
-    0x25549: 'cuò',
-    0x2554D: 'lǒu',
-    0x2554E: 'kāng',
-    0x2554F: 'kuò',
-    0x25550: 'dí',
-    0x25551: 'qiē,jū',
-    0x25553: 'mò',
-    0x25556: 'guǒ',
-    0x25557: 'hōng',
-    0x25558: 'cháo,suǒ',
-    0x25559: 'hēi',
-    0x25562: 'cáo',
-    0x25563: 'zhé',
-    0x25566: 'gǔn',
-    0x25570: 'xū',
-    0x25571: 'péng,pēng',
-    0x25572: 'jué',
-    0x25575: 'gǎn',
-    0x25576: 'sī',
-    0x25578: 'suì',
-    0x25579: 'què',
-    0x2557B: 'wú,wǔ',
-    0x2557C: 'yán',
-    0x2557D: 'pèng',
-    0x2557E: 'xiǎo',
-    0x2557F: 'pān',
-    0x2558D: 'là',
-    0x25597: 'bèng',
-    0x25598: 'zhěn',
-    0x25599: 'jí',
-    0x2559C: 'jǐn',
-    0x2559D: 'lián',
-    0x2559E: 'kěn',
-    0x255A0: 'zhóu,dú',
-    0x255A8: 'zào',
-    0x255AA: 'lè',
-    0x255AB: 'qī',
-    0x255AC: 'bìng',
-    0x255B5: 'yǐn',
-    0x255B6: 'pīn',
-    0x255BB: 'sǒu',
-    0x255BC: 'lǜ',
-    0x255BE: 'dí',
-    0x255BF: 'dú',
-    0x255C0: 'liǎo',
-    0x255C1: 'zhuó',
-    0x255CA: 'chǎng',
-    0x255D2: 'chèn',
-    0x255D3: 'tà',
-    0x255D9: 'què',
-    0x255DA: 'dào',
-    0x255DD: 'rǎng',
-    0x255DF: 'pò',
-    0x255E6: 'zhōng',
-    0x255E7: 'xiē',
-    0x255EA: 'jiāng',
-    0x255EB: 'qú',
-    0x255EC: 'lěi',
-    0x255ED: 'cà',
-    0x255EE: 'quē',
-    0x255F5: 'xiàng',
-    0x255F6: 'lèi',
-    0x255FA: 'làn',
-    0x255FF: 'lǎ',
-    0x25601: 'lǎ',
-    0x25604: 'yù',
-    0x2560A: 'jiào',
-    0x2560B: 'qín',
-    0x2560C: 'jī',
-    0x2560F: 'gǎn',
-    0x25612: 'yì',
-    0x25620: 'yì',
-    0x25621: 'zhī',
-    0x25624: 'biǎo',
-    0x25625: 'shēng',
-    0x25626: 'jiù,shè',
-    0x2562B: 'hē',
-    0x2562C: 'fú',
-    0x2562E: 'jū',
-    0x25640: 'zuǒ',
-    0x25641: 'yí',
-    0x25646: 'xiàn,zhī',
-    0x25647: 'yí',
-    0x25649: 'sì,tái',
-    0x2564B: 'chuì',
-    0x2564E: 'mò',
-    0x25661: 'zhān',
-    0x25663: 'xún',
-    0x25666: 'rú',
-    0x25668: 'huò',
-    0x2566C: 'shāo',
-    0x25670: 'shòu',
-    0x2567E: 'yòu',
-    0x2567F: 'yù',
-    0x25682: 'jùn',
-    0x25689: 'zī',
-    0x2568A: 'lù',
-    0x2569A: 'chǐ',
-    0x2569B: 'kūn',
-    0x256A0: 'zhùn',
-    0x256A6: 'hóu',
-    0x256A9: 'xǔ',
-    0x256BE: 'zōng',
-    0x256BF: 'yìng',
-    0x256C2: 'zhū',
-    0x256C5: 'liù',
-    0x256D1: 'nù',
-    0x256D8: 'bì',
-    0x256DA: 'chì',
-    0x256DC: 'zǔ',
-    0x256DD: 'féng',
-    0x256DE: 'lù',
-    0x256DF: 'pǔ',
-    0x256E5: 'zhuàn',
-    0x256E7: 'zhé',
-    0x256E8: 'shī',
-    0x256E9: 'yǔ',
-    0x256EA: 'lù',
-    0x256EB: 'liáng',
-    0x256EF: 'jué',
-    0x256F0: 'liào',
-    0x256F1: 'bēng',
-    0x25703: 'yì',
-    0x25704: 'guān',
-    0x2570C: 'ǎo',
-    0x2570F: 'guì',
-    0x25710: 'mǐn',
-    0x25712: 'yǎn',
-    0x25713: 'lán',
-    0x25716: 'bó',
-    0x25719: 'zàn',
-    0x2571A: 'yǒu',
-    0x25725: 'yì',
-    0x25726: 'nǐ,xiǎn',
-    0x2572C: 'nǐ,xiǎn',
-    0x2572D: 'guǒ',
-    0x2572E: 'jùn',
-    0x25730: 'shī',
-    0x25732: 'xiǎn,jiǎn',
-    0x25734: 'qiān',
-    0x25735: 'què',
-    0x25736: 'kuí',
-    0x25740: 'shé',
-    0x25742: 'huò',
-    0x25744: 'wàn',
-    0x2574A: 'fèi',
-    0x2574B: 'fèi',
-    0x2574C: 'jī',
-    0x2574D: 'yù,wáng',
-    0x25751: 'zhī',
-    0x25752: 'guà',
-    0x25754: 'jié',
-    0x25755: 'máng',
-    0x25756: 'hé,xié',
-    0x25758: 'yǒu',
-    0x2575F: 'dù',
-    0x25760: 'sī,xiù',
-    0x25762: 'lì',
-    0x25765: 'jié',
-    0x25766: 'niǔ',
-    0x25767: 'bà',
-    0x25768: 'yú',
-    0x2576E: 'zhī',
-    0x25778: 'hé',
-    0x25779: 'kē',
-    0x2577E: 'dù,zhà',
-    0x2577F: 'jiā',
-    0x25781: 'chēn',
-    0x25783: 'chuì,shù',
-    0x25784: 'hé',
-    0x25785: 'zhǎi',
-    0x2578A: 'mèi',
-    0x2578D: 'hé',
-    0x2578E: 'zǐ',
-    0x2578F: 'zhú',
-    0x25792: 'tuó',
-    0x25798: 'zùn',
-    0x2579A: 'rú',
-    0x2579B: 'duò',
-    0x2579C: 'jiàng',
-    0x257A7: 'héng',
-    0x257A9: 'bēng,hé',
-    0x257AA: 'mò,mǐ',
-    0x257AF: 'zú',
-    0x257B2: 'biē',
-    0x257B4: 'kù',
-    0x257B5: 'jiá',
-    0x257BA: 'zhuō',
-    0x257BC: 'xiū',
-    0x257C3: 'hé',
-    0x257C5: 'qiāo',
-    0x257CD: 'fěi',
-    0x257CE: 'shēng',
-    0x257D2: 'zhuì',
-    0x257D3: 'kuǎn',
-    0x257D4: 'zè',
-    0x257D5: 'xiān',
-    0x257D7: 'bì',
-    0x257D8: 'yì',
-    0x257DA: 'chàng',
-    0x257EA: 'mào',
-    0x257F6: 'wǎn',
-    0x257FD: 'wū',
-    0x257FE: 'kū',
-    0x257FF: 'wǒ',
-    0x25800: 'xīng',
-    0x25801: 'kē',
-    0x25803: 'jiū',
-    0x25804: 'duān',
-    0x25805: 'huàn',
-    0x25808: 'zhì,jì',
-    0x25809: 'cè',
-    0x2580A: 'róu',
-    0x2580B: 'jí',
-    0x2580D: 'yè',
-    0x2581B: 'jīng',
-    0x2581C: 'yàng',
-    0x25821: 'zǒng',
-    0x25829: 'cǎn',
-    0x25831: 'sī',
-    0x25832: 'lì',
-    0x25833: 'gǔ',
-    0x25834: 'chàng',
-    0x25836: 'fěi',
-    0x25837: 'liú',
-    0x25839: 'jié',
-    0x2583A: 'yūn',
-    0x2583D: 'zhì',
-    0x25840: 'chóu',
-    0x25841: 'biē',
-    0x25852: 'jī',
-    0x2585C: 'luó,suì',
-    0x2585D: 'jiān,qiān',
-    0x2585F: 'chuāng',
-    0x25860: 'shuǎng',
-    0x25862: 'lǜ',
-    0x25863: 'jùn',
-    0x25864: 'jiào',
-    0x25866: 'tì,dì',
-    0x25867: 'zhā',
-    0x2586A: 'yì',
-    0x2586C: 'cōng',
-    0x2586D: 'něi',
-    0x2586E: 'jiā',
-    0x25874: 'jì',
-    0x2587D: 'ài',
-    0x25887: 'jiǎn',
-    0x2588A: 'bèn',
-    0x2588C: 'fán',
-    0x2588D: 'hù,suì',
-    0x2588E: 'zùn',
-    0x2588F: 'diàn',
-    0x25890: 'gāo',
-    0x25891: 'gǎo,hào',
-    0x25892: 'láo,lào',
-    0x25894: 'zhuó,zhào',
-    0x2589F: 'hù',
-    0x258A2: 'tuí',
-    0x258A6: 'bì',
-    0x258A7: 'jú,yì',
-    0x258AE: 'huá',
-    0x258B2: 'chéng',
-    0x258B6: 'kuài',
-    0x258B7: 'dāng',
-    0x258B8: 'gé',
-    0x258B9: 'xié',
-    0x258BB: 'jié',
-    0x258BD: 'cān',
-    0x258C6: 'zú',
-    0x258C8: 'pú',
-    0x258CB: 'shǔ',
-    0x258CC: 'bǔ',
-    0x258D7: 'níng',
-    0x258D8: 'yǎn',
-    0x258D9: 'zhòu,còng',
-    0x258DB: 'méng',
-    0x258DD: 'biǎn',
-    0x258DF: 'xiàng',
-    0x258E4: 'lù',
-    0x258E5: 'lí',
-    0x258E9: 'jì',
-    0x258EB: 'miè',
-    0x258EC: 'lèi',
-    0x258EE: 'zhì',
-    0x258EF: 'yōu',
-    0x258F0: 'biǎn',
-    0x258F8: 'mù',
-    0x258F9: 'ràn',
-    0x258FA: 'ràn',
-    0x25902: 'niǎo',
-    0x2590A: 'quán',
-    0x2590B: 'zhé',
-    0x25910: 'lèi,léi',
-    0x25917: 'dǎng',
-    0x25918: 'jué',
-    0x2591C: 'líng',
-    0x2591E: 'líng',
-    0x2591F: 'yán',
-    0x25923: 'yǎo',
-    0x25924: 'zhèn',
-    0x25925: 'qī',
-    0x25926: 'ài',
-    0x25928: 'nú',
-    0x25929: 'mǎng',
-    0x25931: 'kǎn,hān',
-    0x25933: 'jiū,cuàn',
-    0x25934: 'yǎn',
-    0x25935: 'miàn',
-    0x25937: 'yín',
-    0x25938: 'wán',
-    0x25939: 'yào,yǎo',
-    0x2593A: 'wā',
-    0x2593B: 'pí',
-    0x2593C: 'suì',
-    0x25945: 'kǒng',
-    0x25948: 'hóng,wòng',
-    0x2594A: 'mǐng',
-    0x2594B: 'líng',
-    0x2594C: 'yì,dié',
-    0x2594D: 'shēn,shèn',
-    0x2594F: 'zuò',
-    0x2595B: 'tū,bá',
-    0x2595D: 'yòng',
-    0x2595F: 'wà',
-    0x25960: 'guǐ',
-    0x25961: 'hòng',
-    0x25965: 'shì',
-    0x25967: 'xiòng',
-    0x25969: 'ā,xiàng',
-    0x25971: 'chéng',
-    0x25973: 'kēng',
-    0x25974: 'yì',
-    0x25975: 'yàng',
-    0x25976: 'tíng',
-    0x25977: 'dòu',
-    0x25978: 'chá',
-    0x25979: 'liù',
-    0x2597D: 'qiú',
-    0x2597E: 'xuǎn',
-    0x2597F: 'shēn',
-    0x25980: 'kuān,mì',
-    0x25981: 'tòng',
-    0x25983: 'qiǎn',
-    0x25985: 'chòu',
-    0x2598A: 'wěn',
-    0x2598C: 'lòng',
-    0x2598D: 'ǎn,yǎn',
-    0x25994: 'kǎn',
-    0x25996: 'yǎo',
-    0x25998: 'fú',
-    0x2599C: 'bèng',
-    0x2599D: 'lǎn',
-    0x2599E: 'qià',
-    0x2599F: 'diàn',
-    0x259A2: 'jiào',
-    0x259A3: 'guī',
-    0x259A5: 'xiòng',
-    0x259A8: 'kè',
-    0x259B6: 'xiàn',
-    0x259B7: 'wòng',
-    0x259C2: 'gǒng',
-    0x259C6: 'ǒu',
-    0x259C7: 'kē,cháo',
-    0x259CB: 'kū',
-    0x259D1: 'tián,diān,yǎn,chǎn',
-    0x259D2: 'gòu',
-    0x259D3: 'mǎ',
-    0x259D5: 'liù',
-    0x259D9: 'wèi',
-    0x259DA: 'wěn',
-    0x259E1: 'gòng',
-    0x259E3: 'tú',
-    0x259E4: 'níng',
-    0x259E7: 'mì',
-    0x259EB: 'láng',
-    0x259EC: 'qiǎn',
-    0x259ED: 'mán',
-    0x259EE: 'zhé',
-    0x259F0: 'huà',
-    0x259F1: 'yōng',
-    0x259F2: 'jìn,jǐn',
-    0x259F4: 'mèi',
-    0x259F7: 'fú',
-    0x259FB: 'qú',
-    0x25A0C: 'liù',
-    0x25A0D: 'fù',
-    0x25A0E: 'dàn',
-    0x25A10: 'gǒng',
-    0x25A12: 'cuì,cuàn',
-    0x25A15: 'xǐng',
-    0x25A1C: 'tū',
-    0x25A1D: 'shòu',
-    0x25A2A: 'qióng',
-    0x25A33: 'róng',
-    0x25A3B: 'lì',
-    0x25A3F: 'jī',
-    0x25A40: 'tuò',
-    0x25A4C: 'tóng',
-    0x25A52: 'tán',
-    0x25A54: 'líng',
-    0x25A56: 'yì',
-    0x25A57: 'ruǎn',
-    0x25A59: 'pǎ',
-    0x25A5D: 'cà',
-    0x25A61: 'yuè',
-    0x25A62: 'què',
-    0x25A63: 'zhù',
-    0x25A64: 'hài',
-    0x25A71: 'fá',
-    0x25A72: 'hài',
-    0x25A80: 'bū',
-    0x25A81: 'pīng',
-    0x25A82: 'liè',
-    0x25A8A: 'kuǐ,jué',
-    0x25A8B: 'fú',
-    0x25A8C: 'tiǎn',
-    0x25A8D: 'wò',
-    0x25A8F: 'jū',
-    0x25A98: 'zhēn',
-    0x25A9A: 'fú',
-    0x25AA2: 'lóng',
-    0x25AA6: 'xì',
-    0x25AA7: 'tián',
-    0x25AAB: 'jì',
-    0x25AAF: 'yào,qiáo',
-    0x25AB1: 'cù',
-    0x25AB4: 'pàng',
-    0x25AB5: 'qiè',
-    0x25ABB: 'lóng',
-    0x25ABC: 'jǐ',
-    0x25AC2: 'tóng',
-    0x25AC3: 'yí',
-    0x25AC5: 'chāng',
-    0x25ACB: 'gōng',
-    0x25ACE: 'dòng',
-    0x25AD6: 'xiāng',
-    0x25AD9: 'tǐng',
-    0x25ADB: 'zhuān',
-    0x25ADC: 'yǐ',
-    0x25ADD: 'yì',
-    0x25ADE: 'zǐ',
-    0x25ADF: 'qǐ',
-    0x25AE2: 'chǎ',
-    0x25AEC: 'dùn',
-    0x25AEF: 'chōng',
-    0x25AF0: 'lù',
-    0x25AF1: 'dùn',
-    0x25AF3: 'fāng',
-    0x25AF4: 'shì',
-    0x25AF5: 'tì',
-    0x25AF6: 'jī',
-    0x25AF7: 'qiū',
-    0x25AF8: 'shuǐ',
-    0x25AF9: 'chén',
-    0x25AFC: 'huàng',
-    0x25AFD: 'shi',
-    0x25B00: 'yún',
-    0x25B06: 'lóng',
-    0x25B08: 'mǎn',
-    0x25B09: 'gōu',
-    0x25B0D: 'xiān',
-    0x25B0E: 'mò',
-    0x25B10: 'shěn',
-    0x25B12: 'pō',
-    0x25B13: 'yào',
-    0x25B14: 'qū',
-    0x25B15: 'rǎn',
-    0x25B19: 'jù',
-    0x25B1C: 'yǐn',
-    0x25B1D: 'bái',
-    0x25B1E: 'niè',
-    0x25B20: 'chōu',
-    0x25B2A: 'róng',
-    0x25B2B: 'chuǎn',
-    0x25B2C: 'niè',
-    0x25B2D: 'lì,liè',
-    0x25B2E: 'jiāng',
-    0x25B2F: 'kǎo',
-    0x25B30: 'cè,zhà',
-    0x25B31: 'chòng',
-    0x25B32: 'zhuā,duò',
-    0x25B33: 'zǐ',
-    0x25B34: 'yáng',
-    0x25B3C: 'wěn',
-    0x25B4B: 'jì',
-    0x25B4C: 'jì',
-    0x25B50: 'lǜ',
-    0x25B51: 'qiú',
-    0x25B52: 'dùn',
-    0x25B53: 'báo',
-    0x25B54: 'chān',
-    0x25B56: 'bó',
-    0x25B58: 'chī',
-    0x25B59: 'zhè,niè',
-    0x25B5A: 'màng',
-    0x25B5C: 'jì',
-    0x25B5D: 'miào',
-    0x25B5E: 'yuàn',
-    0x25B60: 'wú',
-    0x25B61: 'zhì',
-    0x25B62: 'pīng',
-    0x25B65: 'chōng',
-    0x25B6B: 'mí',
-    0x25B6C: 'féi',
-    0x25B6D: 'cuō',
-    0x25B6E: 'méng',
-    0x25B8D: 'yín',
-    0x25B8E: 'mǎng',
-    0x25B8F: 'diǎn',
-    0x25B90: 'diāo',
-    0x25B92: 'qián,zhān',
-    0x25B95: 'hàng',
-    0x25B96: 'zhí',
-    0x25B97: 'jú',
-    0x25B98: 'niàn',
-    0x25B9C: 'mí',
-    0x25B9D: 'gǔ',
-    0x25BA3: 'zhuā',
-    0x25BA4: 'niè',
-    0x25BA5: 'zhuó',
-    0x25BA7: 'yè',
-    0x25BA8: 'còng',
-    0x25BAA: 'xū,jí',
-    0x25BAC: 'xì',
-    0x25BAF: 'bō',
-    0x25BBE: 'cǎn,zān',
-    0x25BC3: 'yǎn',
-    0x25BD1: 'jǐn',
-    0x25BD4: 'jǔ',
-    0x25BD5: 'dàng',
-    0x25BD6: 'dù',
-    0x25BD8: 'yé',
-    0x25BD9: 'jìng',
-    0x25BDA: 'kè',
-    0x25BDB: 'luò',
-    0x25BDC: 'wěi',
-    0x25BDD: 'tū',
-    0x25BDE: 'yóu',
-    0x25BDF: 'pài',
-    0x25BE1: 'pí',
-    0x25BE2: 'dìng',
-    0x25BE4: 'wěi',
-    0x25BE5: 'chè',
-    0x25BE6: 'jiàn,shà',
-    0x25BE8: 'sī',
-    0x25BE9: 'zhuó',
-    0x25BEA: 'sòu',
-    0x25BEC: 'ruǎn',
-    0x25BEE: 'yú',
-    0x25BF3: 'è',
-    0x25BF6: 'kǔ',
-    0x25BF8: 'zhù',
-    0x25BFE: 'xiá',
-    0x25C1B: 'fú',
-    0x25C1C: 'táo',
-    0x25C1D: 'xī',
-    0x25C1E: 'chōu,sǒu',
-    0x25C1F: 'yuán',
-    0x25C20: 'lǘ',
-    0x25C21: 'cè',
-    0x25C22: 'shàn',
-    0x25C23: 'liú',
-    0x25C25: 'xì',
-    0x25C26: 'jī',
-    0x25C27: 'yǐ',
-    0x25C28: 'tán',
-    0x25C2A: 'hú',
-    0x25C2D: 'cuō,zhǎ,cī',
-    0x25C2E: 'gě',
-    0x25C30: 'shì,shé',
-    0x25C31: 'sāo',
-    0x25C32: 'hòng',
-    0x25C33: 'xiàn',
-    0x25C36: 'xiá',
-    0x25C3B: 'mù',
-    0x25C3C: 'suǒ',
-    0x25C3E: 'zhài',
-    0x25C40: 'fū',
-    0x25C41: 'sè',
-    0x25C42: 'nú',
-    0x25C43: 'yì',
-    0x25C67: 'qín',
-    0x25C68: 'qìng',
-    0x25C75: 'huì,suì,xí',
-    0x25C76: 'shuǎng',
-    0x25C77: 'dǎn',
-    0x25C78: 'ōu',
-    0x25C79: 'mò',
-    0x25C7A: 'qiān',
-    0x25C7B: 'chì,tú',
-    0x25C7C: 'pái,pì',
-    0x25C7D: 'juàn',
-    0x25C80: 'cháo',
-    0x25C81: 'liè',
-    0x25C82: 'bīng',
-    0x25C83: 'kòu',
-    0x25C84: 'dàn',
-    0x25C85: 'chóu',
-    0x25C86: 'tōng',
-    0x25C87: 'dàn',
-    0x25C88: 'mǎn',
-    0x25C89: 'hù',
-    0x25C8A: 'liáo',
-    0x25C8B: 'xián',
-    0x25C8D: 'cáo',
-    0x25C8E: 'lù',
-    0x25C8F: 'chuàn',
-    0x25C90: 'wú',
-    0x25C91: 'mán',
-    0x25C95: 'zǐ',
-    0x25C97: 'dù',
-    0x25C9A: 'shuàng',
-    0x25C9B: 'fù',
-    0x25C9C: 'jù',
-    0x25C9D: 'zhòu',
-    0x25C9F: 'diào',
-    0x25CA0: 'wàng',
-    0x25CA1: 'chuāng',
-    0x25CA2: 'qiān',
-    0x25CA3: 'tuì',
-    0x25CA5: 'lián',
-    0x25CA6: 'biāo',
-    0x25CA7: 'lí',
-    0x25CAA: 'lí',
-    0x25CC6: 'bì',
-    0x25CC7: 'fù',
-    0x25CC8: 'cuì',
-    0x25CC9: 'dū',
-    0x25CCB: 'zàn,zān',
-    0x25CCC: 'lóng',
-    0x25CCD: 'xún',
-    0x25CCE: 'qióng',
-    0x25CCF: 'jī',
-    0x25CD0: 'qiǎn',
-    0x25CD2: 'jiǎn',
-    0x25CD3: 'shāo',
-    0x25CD4: 'duò',
-    0x25CD5: 'shū',
-    0x25CD6: 'bù',
-    0x25CD7: 'xū',
-    0x25CD8: 'dǒng',
-    0x25CDA: 'rán',
-    0x25CDC: 'yáng',
-    0x25CDD: 'ruǐ',
-    0x25CDE: 'lìn',
-    0x25CDF: 'jiǎn',
-    0x25CE0: 'dì',
-    0x25CE1: 'fén',
-    0x25CE2: 'diàn',
-    0x25CE3: 'zuì',
-    0x25CE5: 'nǐng',
-    0x25CEA: 'suàn',
-    0x25CEB: 'tiǎn',
-    0x25CEC: 'àn',
-    0x25CEF: 'cè',
-    0x25CF0: 'dìng',
-    0x25CF1: 'shēn',
-    0x25CF2: 'dù',
-    0x25CF3: 'tí',
-    0x25CF4: 'jiǎo',
-    0x25CF5: 'zuì',
-    0x25CF6: 'zhǎng',
-    0x25CF7: 'jiǎn',
-    0x25CF8: 'dàn',
-    0x25CF9: 'dǎn',
-    0x25CFA: 'sǒng',
-    0x25D10: 'zhǎn',
-    0x25D11: 'tíng',
-    0x25D12: 'zhì',
-    0x25D15: 'yóu',
-    0x25D16: 'pái',
-    0x25D21: 'lǐ',
-    0x25D24: 'qián',
-    0x25D26: 'suì,dí',
-    0x25D27: 'jǔ',
-    0x25D28: 'ài',
-    0x25D29: 'gé',
-    0x25D2A: 'jù',
-    0x25D2B: 'tún,diàn',
-    0x25D2C: 'bì',
-    0x25D2D: 'qià',
-    0x25D2E: 'bó',
-    0x25D2F: 'huì',
-    0x25D31: 'jiàn',
-    0x25D34: 'gōu',
-    0x25D35: 'suàn',
-    0x25D3A: 'cí',
-    0x25D3B: 'qiàng',
-    0x25D3F: 'yán',
-    0x25D4F: 'diàn',
-    0x25D52: 'miè',
-    0x25D5C: 'pò',
-    0x25D5D: 'lǐng',
-    0x25D5E: 'jié',
-    0x25D5F: 'zhù',
-    0x25D60: 'gǔ',
-    0x25D63: 'duān',
-    0x25D64: 'zhào',
-    0x25D66: 'shǎo',
-    0x25D67: 'qǐn',
-    0x25D68: 'mí',
-    0x25D6A: 'píng',
-    0x25D6B: 'cóng',
-    0x25D6C: 'chōu',
-    0x25D6F: 'sà',
-    0x25D76: 'tiǎn',
-    0x25D85: 'liú',
-    0x25D86: 'lǘ',
-    0x25D87: 'lǔ',
-    0x25D88: 'zōu',
-    0x25D8C: 'lǜ',
-    0x25D8D: 'huǎn',
-    0x25D8F: 'tiáo',
-    0x25D90: 'tuí',
-    0x25D91: 'qiǎng',
-    0x25D92: 'lìn',
-    0x25D93: 'bēi',
-    0x25D94: 'páo',
-    0x25D95: 'zhān',
-    0x25D97: 'lì',
-    0x25D9B: 'tí',
-    0x25D9C: 'hú',
-    0x25DA2: 'liè',
-    0x25DB5: 'huǐ',
-    0x25DB6: 'qū',
-    0x25DB7: 'xuǎn',
-    0x25DB9: 'jìng',
-    0x25DBA: 'dié',
-    0x25DBB: 'suí',
-    0x25DBD: 'wèi',
-    0x25DBF: 'yán',
-    0x25DC0: 'yān',
-    0x25DC1: 'bàn',
-    0x25DC3: 'jiǎng',
-    0x25DC4: 'nǐ',
-    0x25DC5: 'lì',
-    0x25DC6: 'hú',
-    0x25DC7: 'qì',
-    0x25DC8: 'zhōng',
-    0x25DD1: 'bì',
-    0x25DD4: 'yú',
-    0x25DD5: 'dié',
-    0x25DD6: 'lìn',
-    0x25DD7: 'lì',
-    0x25DD8: 'zhuó',
-    0x25DD9: 'jì',
-    0x25DDA: 'jū',
-    0x25DDC: 'fēng',
-    0x25DDE: 'yù',
-    0x25DE8: 'liè',
-    0x25DE9: 'zá',
-    0x25DEA: 'qián',
-    0x25DEB: 'jiē',
-    0x25DEC: 'guān',
-    0x25DEE: 'zhuó,zhāo',
-    0x25DF1: 'fù',
-    0x25DF9: 'sè',
-    0x25DFC: 'cù',
-    0x25E03: 'huǐ',
-    0x25E08: 'dàng',
-    0x25E09: 'lóng',
-    0x25E0A: 'yì',
-    0x25E17: 'sǎ',
-    0x25E18: 'yuè',
-    0x25E1A: 'dí',
-    0x25E21: 'gǎn',
-    0x25E22: 'zān',
-    0x25E23: 'shàn',
-    0x25E24: 'yù',
-    0x25E25: 'bǒ',
-    0x25E27: 'dìng',
-    0x25E28: 'fán,bǒ,bǔ',
-    0x25E2A: 'yù',
-    0x25E2C: 'shēn',
-    0x25E32: 'gōng',
-    0x25E34: 'miè',
-    0x25E35: 'tún',
-    0x25E38: 'liè',
-    0x25E41: 'zhā,zuò',
-    0x25E42: 'pēi',
-    0x25E44: 'mí',
-    0x25E46: 'míng',
-    0x25E47: 'fàn',
-    0x25E49: 'nà',
-    0x25E4A: 'sì',
-    0x25E4B: 'yí',
-    0x25E4C: 'jiā',
-    0x25E4D: 'zhù',
-    0x25E53: 'bān',
-    0x25E54: 'yù',
-    0x25E56: 'pǒ',
-    0x25E5A: 'huān',
-    0x25E5B: 'càn',
-    0x25E5C: 'jiāo',
-    0x25E60: 'tán',
-    0x25E69: 'zhì',
-    0x25E6B: 'mǐ',
-    0x25E6C: 'kǎo',
-    0x25E71: 'yāo',
-    0x25E72: 'duì',
-    0x25E73: 'quǎn,huán',
-    0x25E74: 'bù',
-    0x25E75: 'chù',
-    0x25E76: 'qiǎo',
-    0x25E77: 'liú',
-    0x25E78: 'bó',
-    0x25E7A: 'kāng',
-    0x25E7B: 'fèn',
-    0x25E85: 'dào',
-    0x25E89: 'dòu',
-    0x25E8A: 'gé',
-    0x25E99: 'líng',
-    0x25E9A: 'xí',
-    0x25E9C: 'nì',
-    0x25E9D: 'zhōu',
-    0x25E9E: 'zhōu,yù',
-    0x25EA3: 'chōu',
-    0x25EB4: 'niān',
-    0x25EB5: 'jī',
-    0x25EB7: 'qū',
-    0x25EC4: 'kāi',
-    0x25EC7: 'xiàn',
-    0x25EC9: 'hé',
-    0x25ECB: 'lín',
-    0x25ECD: 'zī',
-    0x25ED1: 'ǒu,lì',
-    0x25ED2: 'cù,mì',
-    0x25ED7: 'chá',
-    0x25EDD: 'zhòng',
-    0x25EDE: 'bú',
-    0x25EE4: 'chōu',
-    0x25EE5: 'xì',
-    0x25EE6: 'sà',
-    0x25EE7: 'xián,jiān',
-    0x25EE8: 'sè',
-    0x25EE9: 'miàn',
-    0x25EEB: 'fán',
-    0x25EEC: 'zhī',
-    0x25EEE: 'cuì',
-    0x25EF4: 'xià',
-    0x25EFE: 'nuò',
-    0x25EFF: 'lí',
-    0x25F00: 'zú',
-    0x25F02: 'cuī',
-    0x25F03: 'zé',
-    0x25F05: 'lí',
-    0x25F18: 'qí',
-    0x25F1A: 'zhuō',
-    0x25F1B: 'cuì',
-    0x25F1C: 'pū',
-    0x25F1E: 'fán',
-    0x25F1F: 'tán',
-    0x25F29: 'zī',
-    0x25F2A: 'zǔ',
-    0x25F2B: 'zhōu',
-    0x25F2C: 'róng',
-    0x25F2D: 'lín',
-    0x25F2E: 'tán',
-    0x25F36: 'shì',
-    0x25F3A: 'cuǐ',
-    0x25F3B: 'zī',
-    0x25F3C: 'fū',
-    0x25F41: 'xiào',
-    0x25F48: 'fēng,lǐ',
-    0x25F4F: 'xiàn',
-    0x25F50: 'jiàn',
-    0x25F52: 'fèn',
-    0x25F57: 'lì',
-    0x25F58: 'mò,miè',
-    0x25F5F: 'yōu',
-    0x25F65: 'huò',
-    0x25F67: 'qū',
-    0x25F6C: 'niàng',
-    0x25F70: 'mí',
-    0x25F73: 'qì',
-    0x25F76: 'hé',
-    0x25F78: 'liàn',
-    0x25F7F: 'zuò',
-    0x25F82: 'líng',
-    0x25F85: 'zhú',
-    0x25F87: 'niǎo',
-    0x25F8A: 'jǐ',
-    0x25F8B: 'réng',
-    0x25F8C: 'jié',
-    0x25F8D: 'gǎn',
-    0x25F90: 'yì',
-    0x25F93: 'zhóu',
-    0x25F95: 'wù',
-    0x25F9A: 'gěng,dǎn',
-    0x25F9B: 'cù',
-    0x25F9D: 'miè,miǎn',
-    0x25FA1: 'xún,jī',
-    0x25FA3: 'zhī',
-    0x25FA4: 'xiáo',
-    0x25FA7: 'fú',
-    0x25FA8: 'hú',
-    0x25FAC: 'dī',
-    0x25FAE: 'jué',
-    0x25FAF: 'diào',
-    0x25FB9: 'shǒu',
-    0x25FBC: 'wǎng',
-    0x25FC3: 'nà',
-    0x25FC4: 'dī',
-    0x25FC5: 'shì',
-    0x25FC6: 'cí',
-    0x25FC7: 'shū',
-    0x25FC9: 'wà,mò',
-    0x25FCA: 'chè',
-    0x25FCB: 'fán,biàn',
-    0x25FCD: 'gū',
-    0x25FCE: 'yuān,wǎn',
-    0x25FD1: 'guān,lún',
-    0x25FDA: 'qiè',
-    0x25FDC: 'zhǎn,zhěn',
-    0x25FDD: 'dài',
-    0x25FDE: 'shē',
-    0x25FE6: 'zhōu',
-    0x25FE7: 'xiǎng',
-    0x25FE8: 'míng',
-    0x25FE9: 'zì',
-    0x25FEA: 'huāng',
-    0x25FEB: 'mí,yì,wèi',
-    0x25FED: 'xì',
-    0x25FEE: 'zhì,shì',
-    0x25FEF: 'pài',
-    0x25FF0: 'duǒ',
-    0x25FF4: 'cì',
-    0x25FF5: 'móu',
-    0x25FF7: 'chào',
-    0x25FF9: 'yì',
-    0x25FFA: 'gōu',
-    0x26007: 'jīng',
-    0x26013: 'zēng,jiē',
-    0x26014: 'pīng',
-    0x26015: 'yè',
-    0x26016: 'jié',
-    0x26018: 'pī,bī',
-    0x2601B: 'shā',
-    0x2601C: 'zhuàng',
-    0x2601D: 'jiǒng',
-    0x26020: 'liú',
-    0x26021: 'yǔ',
-    0x26023: 'jū',
-    0x26028: 'nuò',
-    0x26038: 'mào',
-    0x26044: 'chēn',
-    0x26046: 'zhuàn,juàn,shuàn',
-    0x26047: 'niàn',
-    0x26048: 'kòng',
-    0x26049: 'jiē',
-    0x2604A: 'huà',
-    0x2604D: 'xīn',
-    0x2604E: 'zuó',
-    0x2604F: 'yàn',
-    0x26050: 'jué',
-    0x26055: 'hū',
-    0x26056: 'zhòu',
-    0x26057: 'shè',
-    0x26059: 'yǎn',
-    0x2605B: 'xiè,dié',
-    0x2605C: 'dié',
-    0x2605F: 'chēn,chén,zhěn',
-    0x26072: 'jiǎn',
-    0x26073: 'jì',
-    0x26076: 'chuò',
-    0x26077: 'hóng',
-    0x26080: 'dá',
-    0x26084: 'kāi',
-    0x26085: 'xīng,xǐ',
-    0x26086: 'huì',
-    0x26087: 'jiǎn',
-    0x26088: 'zhòu',
-    0x26089: 'zhǎ',
-    0x2608A: 'fù',
-    0x2608B: 'chì',
-    0x2608C: 'běng',
-    0x2608D: 'nuò',
-    0x26091: 'jì',
-    0x26092: 'qián',
-    0x26094: 'wàn',
-    0x26095: 'óu',
-    0x26096: 'bì',
-    0x26097: 'shuò',
-    0x260A0: 'jīng',
-    0x260A1: 'yè',
-    0x260C4: 'fěi',
-    0x260C7: 'lí',
-    0x260CA: 'lì',
-    0x260CB: 'pí',
-    0x260D2: 'suì',
-    0x260D3: 'liú',
-    0x260D4: 'hé',
-    0x260D5: 'hǔn',
-    0x260D6: 'tǎn',
-    0x260D7: 'shuò',
-    0x260D8: 'zhì',
-    0x260D9: 'bó',
-    0x260DD: 'xì',
-    0x260E1: 'pó,tāo',
-    0x260E2: 'qǔn',
-    0x260E4: 'mù',
-    0x260FD: 'yōng',
-    0x26102: 'dài',
-    0x2610A: 'qǐ',
-    0x2610B: 'diǎo',
-    0x2610C: 'niè',
-    0x2610D: 'shuǎng',
-    0x2610F: 'shāo',
-    0x26110: 'kǔn,mí',
-    0x26111: 'suì',
-    0x26113: 'dōu',
-    0x26114: 'dié',
-    0x2611C: 'gōng',
-    0x2612F: 'zhuǎn',
-    0x26130: 'guó',
-    0x2613C: 'xū',
-    0x2613D: 'qú',
-    0x26140: 'xún',
-    0x26143: 'jiāo,qiāo',
-    0x26144: 'zhé',
-    0x26146: 'diàn',
-    0x26147: 'sāng',
-    0x26148: 'bēng',
-    0x2614A: 'suǒ',
-    0x2614B: 'qiǎn',
-    0x2614F: 'xū',
-    0x26151: 'xún',
-    0x26154: 'mò',
-    0x26175: 'suì',
-    0x26176: 'là,liè',
-    0x26177: 'zhǔ,zhù',
-    0x26178: 'zhòu',
-    0x2617A: 'lì',
-    0x2617C: 'dān',
-    0x2617D: 'jú',
-    0x2617F: 'yùn',
-    0x26180: 'chǎn',
-    0x26181: 'luó',
-    0x26184: 'sè',
-    0x26186: 'lián',
-    0x26188: 'zuǎn,zuí',
-    0x2618B: 'lài',
-    0x2618C: 'shuǎng',
-    0x2618D: 'qiè',
-    0x26198: 'dōu',
-    0x2619E: 'wù',
-    0x2619F: 'méng',
-    0x261A1: 'jì',
-    0x261A4: 'chī',
-    0x261A6: 'nǐ',
-    0x261B8: 'yáo',
-    0x261BB: 'là',
-    0x261BE: 'lǜ',
-    0x261C0: 'suì',
-    0x261C1: 'fū',
-    0x261C4: 'lěi',
-    0x261C5: 'wěi',
-    0x261CE: 'cōng',
-    0x261D4: 'lì',
-    0x261D6: 'pín',
-    0x261D8: 'jūn',
-    0x261D9: 'jǔ',
-    0x261DB: 'là',
-    0x261E7: 'jì',
-    0x261EA: 'miè',
-    0x261EC: 'yào',
-    0x261ED: 'biān',
-    0x261F1: 'cóng',
-    0x261F2: 'sī,chī',
-    0x261F5: 'sī',
-    0x261F8: 'hé',
-    0x26203: 'nàng',
-    0x26205: 'dié',
-    0x26208: 'chè',
-    0x26209: 'yùn',
-    0x2620B: 'xiǔ',
-    0x2620C: 'shū',
-    0x2620E: 'chǎn',
-    0x2620F: 'mín',
-    0x26210: 'lián',
-    0x26211: 'yīn',
-    0x26212: 'xīng',
-    0x26213: 'wēi',
-    0x26214: 'gǔ',
-    0x26215: 'tóu',
-    0x26216: 'tā',
-    0x26217: 'fěi',
-    0x26218: 'dā',
-    0x26219: 'niè',
-    0x2621A: 'cù',
-    0x2621B: 'zuǒ',
-    0x2621C: 'jié',
-    0x2621D: 'xuàn',
-    0x2621E: 'bó',
-    0x2621F: 'jīn',
-    0x26220: 'yǐn',
-    0x26221: 'xū',
-    0x26223: 'yú',
-    0x26224: 'xiòng',
-    0x26226: 'qì',
-    0x26227: 'bēi',
-    0x26228: 'xíng',
-    0x26229: 'gǒng',
-    0x2622C: 'zuǐ',
-    0x26230: 'jiē',
-    0x26232: 'kāi,gǔ',
-    0x26235: 'xíng',
-    0x26236: 'bēi',
-    0x26237: 'shū',
-    0x26238: 'yù',
-    0x2623A: 'zhǒu',
-    0x2623B: 'zhǎn',
-    0x26242: 'zhōng',
-    0x26246: 'chá',
-    0x26248: 'chuí',
-    0x26249: 'liù',
-    0x2624E: 'suī',
-    0x26250: 'zhǔ',
-    0x26259: 'biàn',
-    0x2625D: 'xìn',
-    0x2625F: 'yà',
-    0x26262: 'líng',
-    0x26267: 'yà',
-    0x2626C: 'tīng',
-    0x26279: 'dí',
-    0x26281: 'pí',
-    0x26282: 'hù',
-    0x26283: 'cén',
-    0x2628A: 'tiān',
-    0x2628B: 'mǒu',
-    0x2628C: 'juǎn',
-    0x2628E: 'mǒu',
-    0x26290: 'jù',
-    0x26291: 'liǔ',
-    0x26293: 'lǐng',
-    0x26297: 'liǔ',
-    0x26298: 'hù',
-    0x262A6: 'fú',
-    0x262A7: 'hú',
-    0x262AA: 'è',
-    0x262AB: 'gōng',
-    0x262AC: 'gū',
-    0x262B1: 'guà',
-    0x262B9: 'lüè',
-    0x262BB: 'fán',
-    0x262BC: 'lǜ',
-    0x262BD: 'méng',
-    0x262BE: 'fú',
-    0x262BF: 'liú',
-    0x262C5: 'xié',
-    0x262C6: 'gū',
-    0x262C8: 'xiàn',
-    0x262C9: 'bó',
-    0x262CB: 'jì',
-    0x262D3: 'quān',
-    0x262D4: 'lù',
-    0x262DE: 'shuò',
-    0x262E1: 'mǒu',
-    0x262E2: 'yù',
-    0x262E3: 'hàn',
-    0x262E9: 'yuè',
-    0x262EA: 'dàn',
-    0x262EF: 'yú',
-    0x262F0: 'jiān',
-    0x262F3: 'gāng',
-    0x262FF: 'cáo',
-    0x26300: 'shèn',
-    0x26301: 'liǔ,lóu',
-    0x26306: 'jiāo',
-    0x26309: 'sù',
-    0x2630A: 'sù',
-    0x2630B: 'zhòng',
-    0x26312: 'liào',
-    0x26314: 'xuǎn',
-    0x26315: 'lù',
-    0x26317: 'jì',
-    0x2631A: 'yán',
-    0x2631F: 'lù',
-    0x26321: 'mǐn',
-    0x26322: 'tí',
-    0x26326: 'huàn',
-    0x26329: 'yì',
-    0x2632A: 'tǎn',
-    0x2632C: 'wǔ,wú',
-    0x26330: 'jī',
-    0x26337: 'dú',
-    0x26338: 'kūn',
-    0x2633A: 'jūn',
-    0x2633F: 'shī',
-    0x26340: 'nàn',
-    0x26341: 'pò',
-    0x26344: 'shū',
-    0x26345: 'quàn',
-    0x2634C: 'rèn',
-    0x2634F: 'fén',
-    0x26352: 'tà',
-    0x26353: 'tún',
-    0x26355: 'yáng',
-    0x26366: 'duō',
-    0x26367: 'cī',
-    0x26369: 'gǔ',
-    0x2636A: 'fén',
-    0x2636D: 'róu',
-    0x26371: 'gāo',
-    0x26372: 'xiáng,yàng',
-    0x26374: 'xiáng',
-    0x26375: 'hǒu',
-    0x26377: 'tāo',
-    0x26378: 'shàn',
-    0x26379: 'yáng',
-    0x2637A: 'zì',
-    0x2637C: 'yuán',
-    0x26384: 'sú',
-    0x26387: 'chuàn',
-    0x26388: 'xiáng,xiè',
-    0x2638A: 'bān',
-    0x2638C: 'mǎn',
-    0x2638E: 'fǔ',
-    0x2638F: 'lǎ',
-    0x26390: 'lǐ',
-    0x26392: 'jié',
-    0x26393: 'yōu',
-    0x26398: 'yù',
-    0x2639A: 'chì',
-    0x2639C: 'chuàn',
-    0x2639D: 'yì',
-    0x2639E: 'shān',
-    0x263A2: 'jí',
-    0x263A3: 'yān',
-    0x263A6: 'wù',
-    0x263A7: 'chún,dūn,dùn',
-    0x263A8: 'máng',
-    0x263AD: 'fú',
-    0x263AE: 'jiā',
-    0x263AF: 'gòu',
-    0x263B0: 'gú',
-    0x263B1: 'jiá',
-    0x263B5: 'xián',
-    0x263B7: 'jìn',
-    0x263B8: 'zì',
-    0x263B9: 'lóu',
-    0x263BC: 'gòu',
-    0x263C0: 'rén',
-    0x263C2: 'shān',
-    0x263C5: 'jué',
-    0x263C6: 'tóng',
-    0x263C7: 'yǒu',
-    0x263D4: 'jiān',
-    0x263D5: 'dú',
-    0x263D7: 'hú',
-    0x263DB: 'sāo',
-    0x263DC: 'yù',
-    0x263E2: 'mài',
-    0x263E4: 'zhī',
-    0x263E5: 'yān',
-    0x263E6: 'gāo',
-    0x263E8: 'huài',
-    0x263EE: 'quán',
-    0x263F1: 'yǎng,chài',
-    0x263F3: 'zuǐ',
-    0x263F7: 'xiāo',
-    0x263F8: 'yì,chí',
-    0x263F9: 'yǎn',
-    0x263FA: 'hóng,gòng',
-    0x263FB: 'yú,yù',
-    0x263FF: 'chì',
-    0x26401: 'chí',
-    0x26404: 'háng',
-    0x26405: 'sè',
-    0x26406: 'pā',
-    0x26407: 'tà',
-    0x26408: 'fēn',
-    0x26409: 'chī',
-    0x2640C: 'hóng',
-    0x2640D: 'xuè',
-    0x26416: 'zhǐ',
-    0x2641B: 'qú,yù',
-    0x26420: 'xī',
-    0x26421: 'fú',
-    0x26423: 'shū',
-    0x26424: 'hài',
-    0x26426: 'pò',
-    0x26428: 'cǐ',
-    0x26430: 'chài',
-    0x26433: 'hōng',
-    0x26438: 'pǎo',
-    0x26439: 'shēn',
-    0x2643A: 'xiāo',
-    0x2643D: 'xuān,líng',
-    0x2643E: 'cǐ',
-    0x2643F: 'tíng',
-    0x26440: 'pò',
-    0x26447: 'tà',
-    0x26448: 'chā',
-    0x2644B: 'zú',
-    0x2644C: 'huò',
-    0x2644D: 'xù',
-    0x2644E: 'yàn',
-    0x2644F: 'chài',
-    0x26451: 'tuó',
-    0x26458: 'xián',
-    0x26459: 'xuān',
-    0x2645A: 'hóu',
-    0x2645B: 'huǎn',
-    0x2645C: 'gé',
-    0x2645D: 'chǒng',
-    0x2645E: 'bì',
-    0x2645F: 'hōng',
-    0x26460: 'hōng',
-    0x26461: 'chí,chī',
-    0x26463: 'chá',
-    0x2646F: 'zhǎ',
-    0x26471: 'zhái,huò',
-    0x26472: 'tà',
-    0x26475: 'pò',
-    0x26476: 'tà',
-    0x26478: 'yóu',
-    0x26479: 'fú',
-    0x2647A: 'cī',
-    0x2647B: 'dá',
-    0x2647C: 'tǎ',
-    0x2647E: 'liú',
-    0x26481: 'cī',
-    0x26483: 'hōng',
-    0x26485: 'hàn',
-    0x26486: 'lā',
-    0x26488: 'shī',
-    0x2648D: 'tóng',
-    0x2648E: 'huì',
-    0x2648F: 'hé',
-    0x26490: 'piē',
-    0x26491: 'yù',
-    0x2649C: 'xiān',
-    0x2649D: 'hǎn',
-    0x2649F: 'pò',
-    0x264A6: 'là',
-    0x264A7: 'huò',
-    0x264B0: 'tài',
-    0x264B4: 'lǎo',
-    0x264B6: 'shù',
-    0x264BA: 'dào',
-    0x264BB: 'diǎn',
-    0x264C8: 'xiòng',
-    0x264CB: 'wàng',
-    0x264CD: 'chě',
-    0x264CE: 'nài',
-    0x264D0: 'jué',
-    0x264D3: 'ér,liè',
-    0x264D4: 'ér,xū',
-    0x264D5: 'nǘ',
-    0x264D6: 'nǜ',
-    0x264DD: 'zhuǎn',
-    0x264E2: 'nuò',
-    0x264E4: 'liè',
-    0x264E5: 'lěi',
-    0x264E7: 'bā',
-    0x264EC: 'chēng',
-    0x264EF: 'guī',
-    0x264F0: 'quán',
-    0x264F1: 'gè',
-    0x264F3: 'gǒng',
-    0x264F4: 'shào,shāo',
-    0x264F9: 'lái',
-    0x264FA: 'zhēng',
-    0x264FB: 'yì',
-    0x264FC: 'gǔn',
-    0x264FD: 'wēi',
-    0x264FE: 'lǔn,kǔn',
-    0x26502: 'shí',
-    0x26503: 'yīng',
-    0x26504: 'shěng',
-    0x26505: 'tú',
-    0x26506: 'bì',
-    0x26508: 'zé',
-    0x26509: 'zhòng',
-    0x2650B: 'rǒng',
-    0x2650C: 'qí,sí',
-    0x2650D: 'fù',
-    0x2650E: 'cè',
-    0x26513: 'lí',
-    0x26514: 'mán,màn',
-    0x26516: 'lián',
-    0x26517: 'biāo',
-    0x2651B: 'chuáng',
-    0x2651C: 'yì',
-    0x26520: 'pài',
-    0x26525: 'yì,shì',
-    0x26526: 'kuài',
-    0x26529: 'biāo,pāo',
-    0x2652B: 'chì,yì',
-    0x2652C: 'qú',
-    0x2652D: 'mò',
-    0x2652E: 'zhé',
-    0x2652F: 'shà',
-    0x26530: 'shà,xū',
-    0x26537: 'yāo',
-    0x26538: 'gōng',
-    0x26539: 'nài',
-    0x2653C: 'xiè',
-    0x2653F: 'tiàn',
-    0x26546: 'yé',
-    0x26549: 'shā',
-    0x2654F: 'sào',
-    0x26552: 'diān',
-    0x26553: 'xù',
-    0x26559: 'qú',
-    0x26560: 'hōng',
-    0x26561: 'shèng',
-    0x26562: 'tìng',
-    0x26570: 'duo',
-    0x26575: 'liáo',
-    0x26577: 'hòng',
-    0x26578: 'lǐ',
-    0x2657A: 'xiǎng,gāo',
-    0x2657D: 'shèn',
-    0x26580: 'fū',
-    0x26588: 'yǎn',
-    0x26589: 'wǎng',
-    0x2658A: 'qī',
-    0x2658B: 'duǒ',
-    0x2658D: 'huà',
-    0x2658E: 'qiān',
-    0x26590: 'xiè',
-    0x2659D: 'cì',
-    0x2659E: 'shēng,wén',
-    0x265A2: 'èr',
-    0x265A4: 'xīng',
-    0x265A6: 'tuì',
-    0x265A7: 'yàn',
-    0x265A9: 'liè',
-    0x265AC: 'mí',
-    0x265B8: 'zòng',
-    0x265BA: 'zī',
-    0x265BC: 'hú',
-    0x265BD: 'yíng',
-    0x265BE: 'lián',
-    0x265BF: 'dā',
-    0x265C0: 'tián',
-    0x265C1: 'tiàn',
-    0x265CB: 'róng',
-    0x265CD: 'ài',
-    0x265D0: 'ài',
-    0x265D1: 'zhé',
-    0x265D2: 'guō',
-    0x265D3: 'lù',
-    0x265D4: 'zhāo',
-    0x265D5: 'mí',
-    0x265D6: 'liáo',
-    0x265D7: 'zhé',
-    0x265DB: 'qǔ',
-    0x265DC: 'cōng',
-    0x265DF: 'tīng,tè',
-    0x265E1: 'tán',
-    0x265E2: 'zhǎn',
-    0x265E3: 'hú',
-    0x265E5: 'piē',
-    0x265E7: 'dā',
-    0x265E8: 'róng',
-    0x265EE: 'nǎo',
-    0x265F3: 'náng',
-    0x265F4: 'dāng',
-    0x265F5: 'jiǎo',
-    0x265FB: 'jù',
-    0x265FC: 'ěr',
-    0x2660A: 'lì',
-    0x2660C: 'guō',
-    0x2660D: 'wài,wà',
-    0x26612: 'niè',
-    0x26614: 'jīn',
-    0x26629: 'pǐ',
-    0x2662A: 'chì',
-    0x26632: 'pǐ',
-    0x26633: 'yì',
-    0x26634: 'dū',
-    0x26635: 'wǎ',
-    0x26636: 'xūn',
-    0x26638: 'qì',
-    0x26639: 'shàn,yuè',
-    0x2663C: 'xū',
-    0x2663F: 'hē',
-    0x26640: 'pàn',
-    0x26642: 'pēi',
-    0x26644: 'xiōng',
-    0x26646: 'chǐ',
-    0x26647: 'tān',
-    0x26648: 'zuì,cuì',
-    0x26649: 'zuǎn',
-    0x2664A: 'qì',
-    0x2664B: 'dū',
-    0x26659: 'shuǐ',
-    0x2665C: 'nǎ',
-    0x2665D: 'xī',
-    0x26667: 'chǎo',
-    0x26668: 'yì',
-    0x2666B: 'zhēng',
-    0x2666E: 'jú',
-    0x2666F: 'dài',
-    0x26671: 'sān',
-    0x26674: 'zhù',
-    0x26675: 'wàn',
-    0x26676: 'gǔ',
-    0x26678: 'sān',
-    0x26679: 'bàn',
-    0x2667A: 'jià,jiā',
-    0x2667B: 'mài',
-    0x26688: 'tuò,dù',
-    0x2668A: 'qì',
-    0x2668F: 'zhuāng',
-    0x26690: 'tuó',
-    0x26693: 'píng',
-    0x2669D: 'pēng',
-    0x2669E: 'kuāng,kuàng',
-    0x2669F: 'yí',
-    0x266A1: 'xiè,mài',
-    0x266A2: 'yuē',
-    0x266A3: 'hén',
-    0x266A5: 'hóu,yóu',
-    0x266A6: 'zhēng',
-    0x266A7: 'chǔn',
-    0x266A8: 'shì',
-    0x266A9: 'wǎ',
-    0x266AB: 'xié',
-    0x266B8: 'gèng',
-    0x266C5: 'è',
-    0x266CF: 'kú',
-    0x266D0: 'nà',
-    0x266D3: 'jū',
-    0x266D4: 'xuàn',
-    0x266D5: 'qū',
-    0x266D6: 'chè',
-    0x266D7: 'lǚ',
-    0x266D8: 'hé',
-    0x266D9: 'shèng',
-    0x266DA: 'nàn',
-    0x266DC: 'hé,hán',
-    0x266DD: 'chá',
-    0x266DE: 'yān',
-    0x266DF: 'gěng',
-    0x266E0: 'niè',
-    0x266E2: 'guó',
-    0x266E3: 'yán',
-    0x266E4: 'guǎn',
-    0x266E7: 'zhì',
-    0x266E8: 'lao',
-    0x266EF: 'dǔ',
-    0x266F0: 'qì',
-    0x266F1: 'qū',
-    0x266F2: 'jué',
-    0x26701: 'fēng',
-    0x26703: 'xù',
-    0x26704: 'tuì',
-    0x26706: 'hán',
-    0x26707: 'kū',
-    0x2670A: 'shēn',
-    0x2670B: 'zhì',
-    0x2670D: 'pàng',
-    0x2670E: 'zhēng',
-    0x2670F: 'lì',
-    0x26710: 'wǎn',
-    0x26712: 'fǎn',
-    0x26713: 'xìn',
-    0x26716: 'yà',
-    0x2671B: 'jū',
-    0x2671C: 'shèn',
-    0x2672D: 'mǎng',
-    0x2672F: 'tǔn',
-    0x26730: 'zhuó',
-    0x26731: 'xī',
-    0x26732: 'yìn',
-    0x26733: 'jīng',
-    0x26734: 'tún',
-    0x26737: 'gèng',
-    0x26738: 'jì',
-    0x2674F: 'zhuǎn,shuàn',
-    0x26752: 'tiē',
-    0x26754: 'zhī',
-    0x26756: 'jí',
-    0x2675A: 'yíng',
-    0x2675B: 'wèi',
-    0x2675D: 'huàn',
-    0x2675E: 'tíng',
-    0x2675F: 'chán',
-    0x26762: 'kuí',
-    0x26763: 'qià,kē',
-    0x26764: 'bàn',
-    0x26765: 'chā,zhá',
-    0x26766: 'tuǒ',
-    0x26767: 'nǎn',
-    0x26768: 'jiē',
-    0x2676A: 'yān',
-    0x2676C: 'tú',
-    0x2676E: 'wěn',
-    0x26770: 'cōng',
-    0x26773: 'xù',
-    0x26774: 'yìn',
-    0x26777: 'bèng',
-    0x2677C: 'lǘ,lóu',
-    0x26781: 'zāi',
-    0x26782: 'dā,da',
-    0x26786: 'niè',
-    0x26787: 'jǔ',
-    0x26788: 'hóu',
-    0x2678C: 'gèng',
-    0x26795: 'hóu',
-    0x26796: 'kān',
-    0x26797: 'gōng',
-    0x26799: 'huǐ',
-    0x2679A: 'xiè',
-    0x2679D: 'xì',
-    0x2679E: 'hán',
-    0x2679F: 'mí',
-    0x267A1: 'wěng',
-    0x267A2: 'hùn',
-    0x267A3: 'sāo',
-    0x267A4: 'xìn,zǐ',
-    0x267A5: 'zhé',
-    0x267A6: 'huò,hè',
-    0x267A8: 'gōng',
-    0x267AB: 'sài',
-    0x267AC: 'jīn,jiàn',
-    0x267AD: 'wā',
-    0x267B1: 'duǐ',
-    0x267B2: 'chī',
-    0x267BD: 'xī,wèi,jí',
-    0x267C2: 'mí',
-    0x267C3: 'zāng',
-    0x267C4: 'sǎng,sào',
-    0x267D3: 'tún',
-    0x267D4: 'zhì',
-    0x267D5: 'wěn',
-    0x267D8: 'yín',
-    0x267D9: 'tǔn',
-    0x267DB: 'chōng',
-    0x267DC: 'zé',
-    0x267DE: 'xiāo',
-    0x267DF: 'mó',
-    0x267E0: 'cù',
-    0x267E3: 'biǎn',
-    0x267E4: 'xiū',
-    0x267E7: 'yí',
-    0x267EE: 'huǎng',
-    0x267F0: 'zhā',
-    0x267F1: 'suō',
-    0x267F2: 'hún',
-    0x267F3: 'jù',
-    0x26801: 'cù',
-    0x26804: 'jī',
-    0x26805: 'xún',
-    0x26806: 'sǔn,zhuàn',
-    0x26807: 'céng',
-    0x26809: 'yì',
-    0x2680E: 'biāo',
-    0x26812: 'jué',
-    0x26813: 'lì',
-    0x26816: 'pào',
-    0x2681B: 'zā',
-    0x2681C: 'yè',
-    0x2681E: 'bì',
-    0x2681F: 'zhè',
-    0x26820: 'zhè',
-    0x26822: 'jiù',
-    0x26823: 'zhé',
-    0x26826: 'shù',
-    0x2682A: 'xī',
-    0x26837: 'xǔ',
-    0x26838: 'nǎi',
-    0x26839: 'xián',
-    0x2683A: 'gǔn',
-    0x2683B: 'wèi',
-    0x2683E: 'jí',
-    0x2683F: 'sà',
-    0x26842: 'dǒng',
-    0x26843: 'nuó,nié',
-    0x26844: 'dù',
-    0x26845: 'zhēng',
-    0x26846: 'kū',
-    0x26849: 'míng',
-    0x26855: 'báo',
-    0x26856: 'huì',
-    0x26859: 'zōng',
-    0x26868: 'sàn',
-    0x2686A: 'tēng',
-    0x2686B: 'yí',
-    0x2686D: 'yù',
-    0x26871: 'yào,shào',
-    0x26872: 'nǐng',
-    0x26874: 'chóu,zhǒu',
-    0x26875: 'hùn',
-    0x26877: 'duì',
-    0x26879: 'qì',
-    0x2687A: 'yǐng',
-    0x2687B: 'bìng',
-    0x2687C: 'níng',
-    0x2687D: 'huáng',
-    0x26886: 'yǐng',
-    0x2688A: 'báo,bó',
-    0x2688E: 'guàng',
-    0x2688F: 'lěi',
-    0x26890: 'zǔn',
-    0x26899: 'chǎn,qiān,xiān',
-    0x268A3: 'jiǎn',
-    0x268A7: 'méng',
-    0x268A9: 'xiào,sōu',
-    0x268AF: 'xìn,xìng',
-    0x268B1: 'lí',
-    0x268BA: 'qiǎo',
-    0x268BF: 'wěi,juǎn',
-    0x268C0: 'nà,niè,zhé',
-    0x268C2: 'pāng',
-    0x268C4: 'léi',
-    0x268C7: 'luó',
-    0x268CB: 'luán',
-    0x268CD: 'gēng',
-    0x268CF: 'luán',
-    0x268D2: 'qú',
-    0x268D6: 'luó',
-    0x268D8: 'náng',
-    0x268DB: 'luó',
-    0x268DC: 'yuè',
-    0x268E2: 'shuì',
-    0x268E5: 'mì',
-    0x268E6: 'wáng',
-    0x268E7: 'cè',
-    0x268E8: 'jiān',
-    0x268E9: 'wǎng',
-    0x268EF: 'jiā',
-    0x268F4: 'huán',
-    0x268F8: 'liàn',
-    0x268F9: 'zì',
-    0x268FA: 'bái',
-    0x268FB: 'shǒu,bǎi',
-    0x268FE: 'wǎn',
-    0x26902: 'shū',
-    0x26907: 'guī',
-    0x26908: 'xī',
-    0x2690A: 'rú',
-    0x2690B: 'yào',
-    0x2690E: 'gāo',
-    0x26915: 'yuè',
-    0x26918: 'yōng',
-    0x26919: 'wà',
-    0x2691A: 'bó',
-    0x2691F: 'xìn',
-    0x26922: 'pì',
-    0x26923: 'bó',
-    0x26926: 'hài,hè,ài',
-    0x26927: 'zhài',
-    0x26928: 'wò',
-    0x2692A: 'yè',
-    0x2692B: 'bì,bí',
-    0x2692C: 'hài',
-    0x26938: 'chì',
-    0x2693B: 'zhì',
-    0x2693D: 'ní',
-    0x26941: 'wú',
-    0x26942: 'ǎi',
-    0x26948: 'ǎi',
-    0x26949: 'yǔ',
-    0x2694A: 'chì',
-    0x2694D: 'jìng',
-    0x2694E: 'zhì',
-    0x2694F: 'zhì',
-    0x26950: 'zhì',
-    0x26951: 'jú,jǔ,póu',
-    0x26956: 'hán,xián',
-    0x2695A: 'pīng',
-    0x2695D: 'yǎo',
-    0x26963: 'yóu',
-    0x26964: 'pīng',
-    0x26966: 'mò',
-    0x2696C: 'zuò',
-    0x2696D: 'pò',
-    0x2696F: 'xué',
-    0x26970: 'kuáng',
-    0x26971: 'yì',
-    0x26972: 'pò',
-    0x2697B: 'zhuì',
-    0x26983: 'ní',
-    0x26984: 'qiǔ',
-    0x26985: 'còu',
-    0x2698C: 'yǎo',
-    0x26991: 'fén',
-    0x26995: 'xiá',
-    0x26997: 'jiāng',
-    0x26998: 'chā',
-    0x2699B: 'xiào',
-    0x2699C: 'chā',
-    0x269A2: 'chéng',
-    0x269A3: 'cuì',
-    0x269A7: 'qióng,gǒng',
-    0x269A9: 'yù',
-    0x269AB: 'yú',
-    0x269AF: 'wèn',
-    0x269B1: 'chā',
-    0x269B2: 'yǔ,yù',
-    0x269B9: 'zuó',
-    0x269BA: 'dǎo',
-    0x269BD: 'juàn,fàn',
-    0x269BE: 'dǎo',
-    0x269BF: 'yīng',
-    0x269C1: 'fěng',
-    0x269C5: 'wèng',
-    0x269C8: 'jìn',
-    0x269C9: 'qì',
-    0x269CB: 'qìn',
-    0x269CD: 'kuò',
-    0x269CF: 'tān',
-    0x269D0: 'xiān',
-    0x269D2: 'tiān',
-    0x269D4: 'kuò',
-    0x269D6: 'tiàn',
-    0x269D8: 'hú',
-    0x269D9: 'zhū',
-    0x269DA: 'zhān',
-    0x269DB: 'tà',
-    0x269DD: 'tiān',
-    0x269DE: 'tà',
-    0x269DF: 'tà',
-    0x269E0: 'huá',
-    0x269E1: 'yǎn,tiàn',
-    0x269E2: 'tiè',
-    0x269E4: 'tiè',
-    0x269E5: 'tà',
-    0x269EC: 'huài',
-    0x269EE: 'jiá',
-    0x269EF: 'qì',
-    0x269F1: 'tà',
-    0x269F4: 'tān',
-    0x269F5: 'huà',
-    0x269F8: 'zhuàn',
-    0x269F9: 'huā',
-    0x269FC: 'lán',
-    0x26A06: 'zūn',
-    0x26A07: 'yì',
-    0x26A08: 'fú',
-    0x26A09: 'wù',
-    0x26A0B: 'fú',
-    0x26A0D: 'dīng',
-    0x26A0E: 'tà',
-    0x26A16: 'chào',
-    0x26A19: 'rì',
-    0x26A1A: 'quǎn',
-    0x26A1C: 'gē',
-    0x26A21: 'fú',
-    0x26A22: 'dì',
-    0x26A23: 'diāo',
-    0x26A24: 'yǒng',
-    0x26A26: 'jià',
-    0x26A29: 'lóng',
-    0x26A2C: 'yǒng',
-    0x26A2D: 'pí',
-    0x26A2F: 'huó',
-    0x26A30: 'qióng',
-    0x26A32: 'fán',
-    0x26A33: 'wú',
-    0x26A34: 'tóng',
-    0x26A35: 'háng',
-    0x26A38: 'tān',
-    0x26A3E: 'hēng',
-    0x26A44: 'tiāo',
-    0x26A48: 'zhōu',
-    0x26A4B: 'bài',
-    0x26A4C: 'xiè',
-    0x26A4D: 'dāo,diāo',
-    0x26A4F: 'jīn,wéi',
-    0x26A55: 'hū',
-    0x26A56: 'bēi',
-    0x26A58: 'dìng',
-    0x26A5C: 'nuó',
-    0x26A5D: 'wèi',
-    0x26A5E: 'yú',
-    0x26A60: 'xīng',
-    0x26A61: 'fú',
-    0x26A62: 'xiàn',
-    0x26A63: 'qì',
-    0x26A64: 'tū',
-    0x26A67: 'jí',
-    0x26A69: 'yìng',
-    0x26A6B: 'dèng,téng',
-    0x26A6C: 'wēi',
-    0x26A6D: 'xī',
-    0x26A6F: 'pái',
-    0x26A71: 'shéng',
-    0x26A72: 'yǒu',
-    0x26A74: 'ái',
-    0x26A75: 'jiàn',
-    0x26A77: 'gōu',
-    0x26A78: 'ruò',
-    0x26A7C: 'gòng',
-    0x26A7F: 'shà',
-    0x26A80: 'táng',
-    0x26A87: 'lù',
-    0x26A88: 'áo',
-    0x26A8A: 'qì',
-    0x26A8B: 'xiū',
-    0x26A8D: 'dāi',
-    0x26A91: 'fá',
-    0x26A92: 'wèi',
-    0x26A94: 'dùn',
-    0x26A95: 'liáo',
-    0x26A96: 'fān',
-    0x26A97: 'huáng,héng',
-    0x26A98: 'jué',
-    0x26A99: 'tà',
-    0x26A9A: 'zùn',
-    0x26A9B: 'ráo',
-    0x26A9C: 'cān',
-    0x26A9D: 'téng',
-    0x26AA0: 'huà',
-    0x26AA1: 'xū',
-    0x26AA3: 'zhān',
-    0x26AA7: 'gǎn',
-    0x26AAA: 'péng',
-    0x26AAB: 'cān',
-    0x26AAC: 'xiē',
-    0x26AAD: 'dá',
-    0x26AB1: 'jì',
-    0x26AB6: 'lǐ',
-    0x26AB9: 'pán',
-    0x26ABD: 'lóng,lǒng',
-    0x26ABE: 'lì',
-    0x26ABF: 'xí',
-    0x26AC0: 'téng',
-    0x26AC3: 'líng',
-    0x26AC8: 'lǐ',
-    0x26AC9: 'rán',
-    0x26ACA: 'líng',
-    0x26ACE: 'gǔn',
-    0x26AD4: 'pō',
-    0x26AD5: 'mò',
-    0x26AD6: 'pāi',
-    0x26AD9: 'bà',
-    0x26AE1: 'qí',
-    0x26AE4: 'yán',
-    0x26AEA: 'wà',
-    0x26AEB: 'ǎng',
-    0x26AED: 'mìng',
-    0x26AEE: 'mǐn',
-    0x26AEF: 'xùn',
-    0x26AF0: 'méng',
-    0x26AF3: 'guǎi',
-    0x26AF6: 'jiāo',
-    0x26AFB: 'gǎi',
-    0x26B01: 'cái',
-    0x26B02: 'wù',
-    0x26B03: 'zhé',
-    0x26B04: 'rěn',
-    0x26B05: 'kōu',
-    0x26B14: 'zhǎo',
-    0x26B15: 'zhōng',
-    0x26B16: 'qiú',
-    0x26B17: 'guō',
-    0x26B18: 'gōng,sōng',
-    0x26B19: 'pū',
-    0x26B1A: 'hù',
-    0x26B1B: 'miǎn',
-    0x26B1E: 'tiān',
-    0x26B23: 'wǎng',
-    0x26B38: 'zhú',
-    0x26B39: 'dá,dàn',
-    0x26B3A: 'xiòng,huǎng',
-    0x26B3B: 'ná',
-    0x26B3E: 'juān',
-    0x26B41: 'niǎn',
-    0x26B48: 'hù',
-    0x26B49: 'shā',
-    0x26B5C: 'zhī',
-    0x26B5F: 'tā',
-    0x26B61: 'sī',
-    0x26B65: 'yì',
-    0x26B6D: 'qióng',
-    0x26B6E: 'zhì',
-    0x26B6F: 'lǚ,lóu',
-    0x26B70: 'rú',
-    0x26B72: 'qí',
-    0x26B73: 'yǔ',
-    0x26B74: 'zhōu',
-    0x26B75: 'yáng',
-    0x26B76: 'xiǎn',
-    0x26B77: 'móu',
-    0x26B78: 'chóu',
-    0x26B79: 'huī',
-    0x26B7A: 'jiū',
-    0x26B7B: 'jiù',
-    0x26B7C: 'piǎo,bì',
-    0x26B81: 'jiào',
-    0x26B83: 'guāi,kuā',
-    0x26B85: 'mò',
-    0x26B90: 'xī',
-    0x26B91: 'pú',
-    0x26BAF: 'jì',
-    0x26BB6: 'wěn',
-    0x26BB7: 'bèi',
-    0x26BB8: 'yǐ',
-    0x26BB9: 'fú',
-    0x26BBA: 'sī',
-    0x26BBB: 'juān',
-    0x26BBC: 'jì,qí',
-    0x26BBE: 'nì',
-    0x26BC0: 'bèn',
-    0x26BC5: 'xù',
-    0x26BC8: 'qǐn',
-    0x26BC9: 'bó',
-    0x26BCC: 'wáng',
-    0x26BCD: 'zhè',
-    0x26BCF: 'wò',
-    0x26BD0: 'sháo',
-    0x26BD1: 'zào',
-    0x26BD2: 'yǎng',
-    0x26BD5: 'sòng',
-    0x26BD6: 'niè',
-    0x26BDB: 'bì',
-    0x26BE3: 'cú',
-    0x26BE4: 'qiāng',
-    0x26BEA: 'xiào',
-    0x26BEB: 'zhī',
-    0x26BEC: 'shé',
-    0x26BEF: 'zhì',
-    0x26BF0: 'pēng',
-    0x26C0F: 'diào',
-    0x26C16: 'wò',
-    0x26C18: 'zhǐ',
-    0x26C19: 'bì',
-    0x26C1B: 'fén',
-    0x26C21: 'nà,nuó',
-    0x26C25: 'bāng',
-    0x26C2A: 'qiú',
-    0x26C2B: 'nǐ',
-    0x26C2C: 'bó',
-    0x26C2D: 'dùn',
-    0x26C2F: 'shǐ',
-    0x26C30: 'xū',
-    0x26C31: 'cháng',
-    0x26C32: 'xū',
-    0x26C33: 'yé',
-    0x26C34: 'mí',
-    0x26C38: 'xīn',
-    0x26C39: 'zhuó',
-    0x26C3A: 'fù',
-    0x26C3D: 'pǐ',
-    0x26C3E: 'xuè',
-    0x26C40: 'yù',
-    0x26C41: 'xián',
-    0x26C42: 'yù',
-    0x26C43: 'yú',
-    0x26C45: 'jū',
-    0x26C46: 'tā',
-    0x26C47: 'kōng',
-    0x26C4A: 'zhēng',
-    0x26C4B: 'méng',
-    0x26C4C: 'gāng',
-    0x26C52: 'mù',
-    0x26C53: 'xǐ',
-    0x26C54: 'bì',
-    0x26C56: 'fù',
-    0x26C5C: 'xiào',
-    0x26C60: 'jiū',
-    0x26C63: 'gǒu',
-    0x26C70: 'chí',
-    0x26C71: 'jiū',
-    0x26C72: 'jiū',
-    0x26C75: 'shā',
-    0x26C77: 'fēi',
-    0x26CAB: 'fú',
-    0x26CAF: 'wàn',
-    0x26CB0: 'xū',
-    0x26CB1: 'bō',
-    0x26CC1: 'hào,mào',
-    0x26CC3: 'xié',
-    0x26CC4: 'pián',
-    0x26CC5: 'yǔ',
-    0x26CC7: 'tián',
-    0x26CC8: 'pí,bì',
-    0x26CCA: 'shǐ',
-    0x26CCB: 'kuǎi',
-    0x26CCC: 'jī',
-    0x26CCF: 'zhā',
-    0x26CD0: 'nài,nà',
-    0x26CD1: 'mǒu',
-    0x26CD3: 'fú',
-    0x26CD4: 'dù',
-    0x26CD7: 'shěng',
-    0x26CD8: 'chá',
-    0x26CDA: 'chí',
-    0x26CDB: 'guǐ',
-    0x26CDC: 'mín',
-    0x26CDD: 'tāng,dàng',
-    0x26CDE: 'bài',
-    0x26CDF: 'qiāng',
-    0x26CE1: 'zhuó',
-    0x26CE2: 'wèi',
-    0x26CE3: 'xún',
-    0x26CE5: 'miǎo',
-    0x26CE6: 'zāi',
-    0x26CE7: 'yóu',
-    0x26CE9: 'yòu',
-    0x26CEB: 'shān',
-    0x26CEC: 'hé',
-    0x26CED: 'lǚ',
-    0x26CEE: 'zhí',
-    0x26CF2: 'jìng',
-    0x26CF3: 'zhēn',
-    0x26CF6: 'méng',
-    0x26CF7: 'yóu',
-    0x26CF9: 'wò',
-    0x26CFA: 'bá',
-    0x26CFD: 'juàn',
-    0x26CFE: 'rú',
-    0x26CFF: 'còu',
-    0x26D00: 'zhī',
-    0x26D09: 'hú',
-    0x26D0A: 'yāng',
-    0x26D0C: 'jùn',
-    0x26D0D: 'shé',
-    0x26D0E: 'kòu',
-    0x26D11: 'qián',
-    0x26D14: 'méng',
-    0x26D1A: 'tiáo',
-    0x26D50: 'niè',
-    0x26D5F: 'chí',
-    0x26D61: 'xiōng,gōng',
-    0x26D63: 'hùn',
-    0x26D66: 'dí',
-    0x26D67: 'láng',
-    0x26D69: 'zāo,qiú',
-    0x26D6A: 'cè',
-    0x26D6B: 'suǒ',
-    0x26D6C: 'zù',
-    0x26D6D: 'suī',
-    0x26D6F: 'xiá',
-    0x26D71: 'xiè',
-    0x26D74: 'jié',
-    0x26D75: 'yóu',
-    0x26D77: 'gòu',
-    0x26D78: 'gěng',
-    0x26D7C: 'jùn',
-    0x26D7D: 'huǎng',
-    0x26D7E: 'jí',
-    0x26D7F: 'pōu',
-    0x26D80: 'wū',
-    0x26D82: 'yì',
-    0x26D85: 'nǎi',
-    0x26D87: 'rǒng,ruǎn',
-    0x26D88: 'nán',
-    0x26D8A: 'píng',
-    0x26D8B: 'shàn',
-    0x26D8C: 'diāo',
-    0x26D8D: 'jí',
-    0x26D8E: 'huā',
-    0x26D8F: 'duì',
-    0x26D90: 'kǒng',
-    0x26D91: 'tà',
-    0x26D93: 'hòng',
-    0x26D95: 'shū',
-    0x26D99: 'héng',
-    0x26D9A: 'fěn',
-    0x26DB2: 'kòu',
-    0x26DD9: 'nián',
-    0x26DDD: 'chú',
-    0x26DE6: 'qiàng',
-    0x26DF2: 'xì',
-    0x26DF3: 'hú',
-    0x26DF4: 'sòng',
-    0x26DF5: 'wò',
-    0x26DF7: 'hài',
-    0x26DF8: 'rú',
-    0x26DF9: 'méng',
-    0x26DFB: 'sǎn',
-    0x26DFD: 'wú',
-    0x26DFF: 'yóu',
-    0x26E01: 'tān',
-    0x26E02: 'shēn',
-    0x26E06: 'qǐ',
-    0x26E08: 'guó',
-    0x26E09: 'qià',
-    0x26E0A: 'xiān',
-    0x26E0F: 'suī',
-    0x26E10: 'lù',
-    0x26E13: 'qī',
-    0x26E14: 'diāo',
-    0x26E17: 'qí',
-    0x26E18: 'jiá',
-    0x26E19: 'yóu',
-    0x26E1A: 'xí',
-    0x26E1B: 'cháo',
-    0x26E21: 'mì',
-    0x26E22: 'lòu',
-    0x26E23: 'bǐ',
-    0x26E2A: 'péi',
-    0x26E2E: 'zhēn',
-    0x26E2F: 'shēn',
-    0x26E30: 'chǎn',
-    0x26E31: 'fù',
-    0x26E36: 'qū',
-    0x26E37: 'sī',
-    0x26E3A: 'zuī',
-    0x26E6B: 'zhào',
-    0x26E7D: 'pí',
-    0x26E80: 'còu',
-    0x26E86: 'gāo',
-    0x26E87: 'dú',
-    0x26E89: 'fū',
-    0x26E8A: 'guān',
-    0x26E8B: 'sǎo',
-    0x26E8C: 'sǒu',
-    0x26E8D: 'jiǎn',
-    0x26E8E: 'póu',
-    0x26E90: 'cán',
-    0x26E91: 'bèng',
-    0x26E92: 'mòu',
-    0x26E93: 'zhāo',
-    0x26E94: 'xiáo',
-    0x26E96: 'jú',
-    0x26E97: 'shū',
-    0x26E98: 'jiǎn',
-    0x26E99: 'lí',
-    0x26E9B: 'chuàn',
-    0x26E9C: 'lào,láo',
-    0x26E9E: 'hè',
-    0x26E9F: 'hú',
-    0x26EA0: 'gū',
-    0x26EA1: 'zhǎng',
-    0x26EA2: 'jié',
-    0x26EA3: 'xiàng',
-    0x26EA5: 'dū',
-    0x26EA6: 'hán',
-    0x26EA7: 'jiá',
-    0x26EA8: 'xiàng',
-    0x26EA9: 'jí',
-    0x26EAA: 'shǔ',
-    0x26EAB: 'làng',
-    0x26EAC: 'jī',
-    0x26EAD: 'shān',
-    0x26EB0: 'tāo,tiáo',
-    0x26EB1: 'zī',
-    0x26EB2: 'shuàn',
-    0x26EB4: 'jí',
-    0x26EB5: 'chù',
-    0x26EB6: 'jì',
-    0x26EB7: 'shēn',
-    0x26EB8: 'lìn,lín',
-    0x26EB9: 'liáo',
-    0x26EBB: 'sǎn',
-    0x26EBD: 'ǎn',
-    0x26EBE: 'ruǎn',
-    0x26EC0: 'tí,tái',
-    0x26EC1: 'dàn',
-    0x26EC3: 'huán',
-    0x26EC5: 'sà',
-    0x26F06: 'ruí',
-    0x26F07: 'wū',
-    0x26F08: 'jù',
-    0x26F09: 'huán',
-    0x26F0A: 'léng',
-    0x26F0B: 'lù',
-    0x26F0E: 'tān',
-    0x26F0F: 'zēng',
-    0x26F13: 'qián',
-    0x26F17: 'xī',
-    0x26F21: 'cǐ',
-    0x26F22: 'shé',
-    0x26F27: 'sà',
-    0x26F2A: 'mào',
-    0x26F2B: 'qú',
-    0x26F2D: 'bó',
-    0x26F2E: 'gǎn,gàn',
-    0x26F30: 'qiè,hé',
-    0x26F31: 'juàn',
-    0x26F32: 'dāng',
-    0x26F33: 'cháng',
-    0x26F34: 'yáng',
-    0x26F35: 'hé',
-    0x26F37: 'jī',
-    0x26F39: 'bǐng',
-    0x26F3B: 'méi',
-    0x26F3F: 'dūn',
-    0x26F40: 'ǎo',
-    0x26F41: 'jīng',
-    0x26F42: 'lù',
-    0x26F43: 'miàn',
-    0x26F44: 'diàn',
-    0x26F45: 'hè',
-    0x26F47: 'jiān',
-    0x26F4A: 'huá',
-    0x26F4B: 'gōu',
-    0x26F4E: 'lù',
-    0x26F4F: 'fú',
-    0x26F50: 'huǐ',
-    0x26F52: 'zéi',
-    0x26F54: 'jìn',
-    0x26F55: 'sī',
-    0x26F56: 'qūn',
-    0x26F5C: 'dàn',
-    0x26F5E: 'wàn',
-    0x26F5F: 'biǎn',
-    0x26F64: 'jiá',
-    0x26F6B: 'dǎn',
-    0x26F6C: 'jiū',
-    0x26F6D: 'xián',
-    0x26F6E: 'bó',
-    0x26F8F: 'xiá',
-    0x26F91: 'biāo',
-    0x26F95: 'pò',
-    0x26F98: 'sǎo',
-    0x26F99: 'bèi',
-    0x26F9A: 'shà',
-    0x26F9B: 'wěi',
-    0x26F9D: 'cāng',
-    0x26F9E: 'lù',
-    0x26FA9: 'dàn',
-    0x26FAB: 'gǔ',
-    0x26FAC: 'zā',
-    0x26FAD: 'bǎng',
-    0x26FAE: 'gàn,gǎn',
-    0x26FB1: 'chāo',
-    0x26FB2: 'jì',
-    0x26FB3: 'liē',
-    0x26FB5: 'qióng',
-    0x26FB6: 'jiàn',
-    0x26FB7: 'lù',
-    0x26FB8: 'duān',
-    0x26FB9: 'suān',
-    0x26FBA: 'yáo',
-    0x26FBB: 'yǐn',
-    0x26FBD: 'tà',
-    0x26FBE: 'yáo',
-    0x26FBF: 'jīng',
-    0x26FC0: 'chú',
-    0x26FC1: 'fú',
-    0x26FC2: 'yuán',
-    0x26FC3: 'shǎo',
-    0x26FC5: 'bìng',
-    0x26FC6: 'dàng',
-    0x26FC7: 'shì',
-    0x26FCA: 'lú',
-    0x26FCB: 'qiè',
-    0x26FCC: 'luó',
-    0x26FCD: 'pò',
-    0x26FCF: 'méng,mèng',
-    0x26FD0: 'jié',
-    0x26FD3: 'jī',
-    0x26FD6: 'lù',
-    0x27004: 'chàng',
-    0x27005: 'miè,mò',
-    0x27006: 'méng',
-    0x27007: 'jiǎn',
-    0x2700A: 'cǎi',
-    0x2700C: 'sù',
-    0x27014: 'hè',
-    0x27015: 'sà',
-    0x27017: 'zī',
-    0x27018: 'kēng',
-    0x27019: 'gěng',
-    0x2701A: 'sī',
-    0x27020: 'tí',
-    0x27021: 'zhàn',
-    0x27022: 'xiè',
-    0x27023: 'shuí',
-    0x27024: 'chǐ',
-    0x27025: 'yōu',
-    0x27026: 'lǔ',
-    0x27027: 'mèng',
-    0x27028: 'liè',
-    0x27029: 'sì',
-    0x2702C: 'xī',
-    0x2702D: 'fán',
-    0x2702E: 'fū',
-    0x2702F: 'shěn',
-    0x27030: 'tí',
-    0x27031: 'chài',
-    0x27032: 'yuè',
-    0x27034: 'fū',
-    0x27035: 'jiàn,shǎn',
-    0x27036: 'dì',
-    0x2703A: 'xié',
-    0x2703B: 'dān',
-    0x2703F: 'zhí',
-    0x27043: 'xù',
-    0x27048: 'niè',
-    0x27049: 'fàn',
-    0x2704A: 'méng',
-    0x2704B: 'mǐn',
-    0x2707E: 'lóu',
-    0x2707F: 'dú,shǔ',
-    0x27081: 'zhàn',
-    0x27082: 'jiàn',
-    0x27083: 'hàn',
-    0x27084: 'dàn',
-    0x27085: 'sēn',
-    0x27086: 'jiàn',
-    0x27087: 'tán,xún',
-    0x27088: 'jiǎo',
-    0x27089: 'pó',
-    0x2708B: 'píng',
-    0x2708D: 'zhuàn,sūn',
-    0x2708F: 'liáo',
-    0x27090: 'zì',
-    0x27092: 'zhuó',
-    0x27094: 'hù',
-    0x27099: 'xì',
-    0x2709B: 'méng',
-    0x2709C: 'jù',
-    0x2709D: 'miè',
-    0x2709E: 'xián',
-    0x270A0: 'kuì',
-    0x270A1: 'méng',
-    0x270A2: 'jiān',
-    0x270A6: 'nóu',
-    0x270A8: 'dì',
-    0x270A9: 'sāo',
-    0x270CF: 'chù',
-    0x270D0: 'zhí',
-    0x270D1: 'qián',
-    0x270D2: 'lǚ',
-    0x270D4: 'zhuó',
-    0x270D8: 'zuò',
-    0x270D9: 'hán',
-    0x270DA: 'suǐ',
-    0x270DB: 'gòu',
-    0x270DD: 'chǒu',
-    0x270DE: 'jì',
-    0x270DF: 'yì',
-    0x270E0: 'yú',
-    0x270E8: 'nóu',
-    0x270E9: 'nǐ',
-    0x270EA: 'ruò',
-    0x270EE: 'lín',
-    0x270F1: 'níng',
-    0x2710D: 'qiáo',
-    0x2710E: 'yáo',
-    0x2710F: 'fù',
-    0x27110: 'shuāng',
-    0x27111: 'kuì',
-    0x27112: 'qú',
-    0x27113: 'dǒng',
-    0x27114: 'shǔ',
-    0x2711A: 'lí',
-    0x2711B: 'jú',
-    0x2711C: 'ruǐ',
-    0x27120: 'zhá',
-    0x27124: 'xiāo',
-    0x27138: 'mén,wěi',
-    0x27139: 'shí',
-    0x2713A: 'diān',
-    0x2713B: 'lì',
-    0x2713C: 'dèng,téng',
-    0x2713D: 'zàn,zā',
-    0x2713F: 'luó',
-    0x27140: 'cán',
-    0x27143: 'āo',
-    0x27146: 'jiǎn',
-    0x27148: 'diào',
-    0x2714B: 'yíng',
-    0x27156: 'yì',
-    0x27157: 'dǎng',
-    0x27158: 'nóu',
-    0x2715A: 'yuè',
-    0x2716E: 'lǐ',
-    0x2716F: 'lí',
-    0x27170: 'hù',
-    0x27172: 'yòu',
-    0x2717A: 'nàng',
-    0x27182: 'chèn',
-    0x27189: 'fēng',
-    0x2718A: 'biē',
-    0x2718F: 'mǎn',
-    0x27190: 'gàn',
-    0x27191: 'huò,suǐ',
-    0x27193: 'cū',
-    0x27195: 'yǒu',
-    0x27198: 'yòu',
-    0x2719C: 'xū',
-    0x271A1: 'xù',
-    0x271A2: 'hǔ',
-    0x271A3: 'lú',
-    0x271A5: 'xiá',
-    0x271A6: 'yì',
-    0x271AE: 'hǔ',
-    0x271AF: 'hù',
-    0x271B0: 'zǐ',
-    0x271B7: 'gōng',
-    0x271B8: 'tuī',
-    0x271B9: 'wū',
-    0x271BA: 'líng',
-    0x271BB: 'gū',
-    0x271BC: 'zhōng,dōng',
-    0x271C4: 'lú',
-    0x271C8: 'zù',
-    0x271CC: 'tóng',
-    0x271CD: 'xiā',
-    0x271CE: 'hé',
-    0x271D3: 'yuè',
-    0x271D9: 'nán',
-    0x271DA: 'bó',
-    0x271DB: 'hū',
-    0x271DC: 'qì',
-    0x271DD: 'shú',
-    0x271DE: 'qiāng',
-    0x271DF: 'zhōu',
-    0x271E0: 'yào',
-    0x271E1: 'gū',
-    0x271E5: 'bān',
-    0x271E6: 'kǎn',
-    0x271EE: 'hé',
-    0x271EF: 'jì',
-    0x271F0: 'hú',
-    0x271F1: 'yán',
-    0x271F6: 'chūn',
-    0x271F7: 'dǐng',
-    0x271F8: 'qiū',
-    0x271F9: 'hóu',
-    0x271FC: 'hào',
-    0x271FF: 'zù',
-    0x27201: 'xián',
-    0x27204: 'xià',
-    0x27205: 'xì',
-    0x27208: 'sè,xì',
-    0x2720C: 'gé',
-    0x2720D: 'xì',
-    0x27211: 'gé',
-    0x27214: 'lǚ',
-    0x27216: 'gé',
-    0x27217: 'kè',
-    0x27219: 'shòu',
-    0x2721A: 'zhù',
-    0x2721C: 'téng',
-    0x2721D: 'yà',
-    0x2721E: 'nì',
-    0x27226: 'luò',
-    0x27227: 'suī,méng',
-    0x2722A: 'chǎn',
-    0x2722D: 'wù',
-    0x2722F: 'yū',
-    0x27239: 'zǎo',
-    0x2723B: 'yì',
-    0x2723C: 'xī,jí',
-    0x2723D: 'hóng',
-    0x2723E: 'quán',
-    0x2723F: 'wǎng',
-    0x27240: 'chǐ',
-    0x27241: 'xì',
-    0x27242: 'tiǎn',
-    0x27243: 'yǔn',
-    0x27245: 'yī',
-    0x27246: 'jí',
-    0x27247: 'huī',
-    0x27248: 'fóu,fú',
-    0x2724A: 'fǔ',
-    0x2724D: 'jí',
-    0x2724E: 'xuán',
-    0x27251: 'tài',
-    0x27253: 'dù',
-    0x27257: 'yuán',
-    0x2725B: 'dì',
-    0x2725E: 'zhǔ',
-    0x2725F: 'tāi',
-    0x27261: 'rǒng',
-    0x27262: 'xué',
-    0x27263: 'yù',
-    0x27264: 'fàn',
-    0x27265: 'běi',
-    0x27267: 'qǔ,jié',
-    0x27269: 'bù',
-    0x2726A: 'jiā',
-    0x2726B: 'zhá',
-    0x2726D: 'nǔ',
-    0x2726E: 'shé,yán,yí',
-    0x27272: 'lì',
-    0x27284: 'guǐ',
-    0x27285: 'guǎi',
-    0x27287: 'dài,dé',
-    0x2728F: 'gāi',
-    0x27292: 'cì',
-    0x27294: 'yǎn',
-    0x27295: 'sōng',
-    0x27296: 'shì',
-    0x27298: 'kù',
-    0x27299: 'zhǐ',
-    0x2729A: 'tóng',
-    0x2729B: 'qú',
-    0x2729C: 'è',
-    0x2729E: 'xíng',
-    0x2729F: 'rú',
-    0x272A0: 'yú,shū',
-    0x272A3: 'yì',
-    0x272A4: 'yì',
-    0x272A5: 'xù',
-    0x272A6: 'fǒu',
-    0x272A7: 'gé,è',
-    0x272AC: 'hé',
-    0x272AD: 'yīn',
-    0x272AF: 'hòng',
-    0x272B1: 'duǒ',
-    0x272BD: 'xíng',
-    0x272BE: 'fán',
-    0x272C9: 'qī',
-    0x272CA: 'shā,shuō',
-    0x272CC: 'dù',
-    0x272CD: 'dì,xué',
-    0x272CE: 'lí',
-    0x272CF: 'yì',
-    0x272D0: 'xí',
-    0x272D1: 'gěng',
-    0x272D2: 'tóng,shì',
-    0x272D3: 'kào',
-    0x272D4: 'hòng',
-    0x272D5: 'kùn',
-    0x272D6: 'niè',
-    0x272D7: 'chí',
-    0x272D8: 'tí',
-    0x272DA: 'tóng',
-    0x272E0: 'lí,lǐ',
-    0x272E1: 'nà',
-    0x272F1: 'zhān',
-    0x272F2: 'běi',
-    0x27301: 'tiáo',
-    0x27303: 'zā',
-    0x27304: 'è,yè',
-    0x27305: 'shòu',
-    0x27306: 'kōng',
-    0x27307: 'péng',
-    0x27308: 'fù',
-    0x27309: 'lù',
-    0x2730A: 'xiè',
-    0x2730B: 'xiè',
-    0x2730C: 'xiū',
-    0x2730D: 'lù',
-    0x2730E: 'tiǎn',
-    0x2730F: 'tà',
-    0x27310: 'cì',
-    0x27311: 'qū',
-    0x27313: 'fù',
-    0x27314: 'zhī',
-    0x27316: 'xiè,shè',
-    0x27317: 'zǒu',
-    0x27318: 'fèi',
-    0x27319: 'mín',
-    0x2731A: 'xīng',
-    0x2731D: 'tóng',
-    0x2731E: 'qí',
-    0x27320: 'piāo',
-    0x27322: 'suì',
-    0x27323: 'ěr',
-    0x27327: 'hǔ',
-    0x2733B: 'sōng',
-    0x2733D: 'biē',
-    0x2733E: 'dīng',
-    0x2733F: 'bǎn',
-    0x27340: 'shī,lǐ',
-    0x27341: 'xiè',
-    0x27342: 'xiáo',
-    0x27343: 'fěi',
-    0x27352: 'chuǎn,chuǎi',
-    0x27353: 'shuài',
-    0x27354: 'yāo',
-    0x27355: 'jué',
-    0x27356: 'shěng,nìng',
-    0x27358: 'yōu',
-    0x27359: 'fàn',
-    0x2735C: 'kuí',
-    0x2735D: 'dì',
-    0x2735F: 'máo',
-    0x27360: 'jié',
-    0x27362: 'yán,yǐn',
-    0x27365: 'wēi',
-    0x27368: 'sāng',
-    0x27369: 'jié',
-    0x2736A: 'yú',
-    0x2736B: 'wèi',
-    0x2736C: 'è',
-    0x2736D: 'quán',
-    0x2736E: 'jiǒng',
-    0x2736F: 'féng',
-    0x27370: 'lóng',
-    0x27371: 'dié',
-    0x27372: 'pián',
-    0x27374: 'liàn',
-    0x27375: 'hú',
-    0x27376: 'lǜ',
-    0x2737F: 'diàn',
-    0x27383: 'cuì',
-    0x27384: 'móu,wù',
-    0x27395: 'wáng',
-    0x27396: 'juān',
-    0x27397: 'kē',
-    0x27398: 'yán',
-    0x27399: 'jiǎo',
-    0x273A1: 'gōng',
-    0x273A3: 'róng',
-    0x273A4: 'sūn',
-    0x273A5: 'shàn',
-    0x273A8: 'chí',
-    0x273AA: 'qí',
-    0x273AB: 'suǒ',
-    0x273AD: 'yè',
-    0x273AE: 'zǎo',
-    0x273AF: 'quē',
-    0x273B0: 'zhǎn',
-    0x273B1: 'bā',
-    0x273B2: 'zú',
-    0x273B3: 'suǒ',
-    0x273B4: 'zhé',
-    0x273B5: 'xì',
-    0x273B7: 'chǔ',
-    0x273B8: 'jiǎo',
-    0x273B9: 'zuì',
-    0x273BA: 'gē',
-    0x273BB: 'wù,móu',
-    0x273BE: 'lüè',
-    0x273BF: 'jí',
-    0x273C2: 'xié',
-    0x273C3: 'xié',
-    0x273C6: 'dǒu',
-    0x273CB: 'qiū',
-    0x273D1: 'píng',
-    0x273D3: 'liú',
-    0x273E5: 'jié',
-    0x273E7: 'huì',
-    0x273EB: 'shà',
-    0x273F8: 'zhí',
-    0x273F9: 'ài',
-    0x273FA: 'xù,òu',
-    0x273FB: 'bì',
-    0x273FD: 'yē',
-    0x273FE: 'nì',
-    0x273FF: 'zhú',
-    0x27401: 'sù',
-    0x27403: 'xié',
-    0x27404: 'yù,yú',
-    0x27405: 'qū',
-    0x27408: 'zú',
-    0x27409: 'zhī',
-    0x2740A: 'zhāng',
-    0x2740B: 'lüè',
-    0x2740C: 'wěi',
-    0x2740D: 'chōng',
-    0x2740E: 'mì',
-    0x27410: 'jī',
-    0x27412: 'sù',
-    0x27413: 'yě',
-    0x27414: 'xí,yì',
-    0x27415: 'tuán',
-    0x27416: 'lián,liàn',
-    0x27417: 'xuán',
-    0x27419: 'wù',
-    0x2741F: 'máo',
-    0x2742C: 'hóng',
-    0x2742F: 'lüè',
-    0x27430: 'dú',
-    0x27431: 'cóng',
-    0x27432: 'chán',
-    0x27433: 'lù',
-    0x27434: 'sù',
-    0x27440: 'lüè',
-    0x27446: 'zhōng',
-    0x27447: 'lí',
-    0x27448: 'fèi',
-    0x2744A: 'jǐng',
-    0x2744B: 'kuì',
-    0x2744C: 'yì',
-    0x2744D: 'huá',
-    0x2744E: 'cuì',
-    0x27450: 'yù',
-    0x27451: 'běng',
-    0x27452: 'tūn',
-    0x27453: 'shǔ',
-    0x27454: 'dài',
-    0x27455: 'wū',
-    0x27456: 'cì',
-    0x27457: 'nìng',
-    0x27458: 'dàng',
-    0x27459: 'zú',
-    0x2745A: 'hán',
-    0x2745C: 'pí',
-    0x2745D: 'chuàn',
-    0x27460: 'dù',
-    0x27461: 'pá',
-    0x27464: 'zhū',
-    0x27466: 'xié',
-    0x27467: 'zhé',
-    0x27468: 'qiè',
-    0x27469: 'xuān',
-    0x2746B: 'sào',
-    0x27480: 'bì',
-    0x27482: 'fù',
-    0x27488: 'lì',
-    0x2748E: 'é',
-    0x27490: 'yē',
-    0x27491: 'shǔ',
-    0x27493: 'sè',
-    0x27495: 'qī',
-    0x27496: 'guò',
-    0x27497: 'sè',
-    0x27499: 'fù',
-    0x2749A: 'máo',
-    0x2749C: 'léi',
-    0x2749D: 'zhān',
-    0x274A8: 'chài',
-    0x274AD: 'wèi',
-    0x274BD: 'léi',
-    0x274BF: 'zéi',
-    0x274C0: 'yīng',
-    0x274C1: 'ài',
-    0x274C2: 'xiē',
-    0x274C4: 'bì',
-    0x274CB: 'chán',
-    0x274CE: 'pí,bī',
-    0x274CF: 'cóng',
-    0x274D0: 'liè',
-    0x274D1: 'qí',
-    0x274D3: 'jì',
-    0x274D4: 'jīng',
-    0x274D5: 'dōng',
-    0x274D6: 'féi',
-    0x274D7: 'yí',
-    0x274D8: 'tuán',
-    0x274E8: 'měng',
-    0x274E9: 'cán',
-    0x274EA: 'yá',
-    0x274F2: 'yǎng',
-    0x274F4: 'tíng',
-    0x274F8: 'zhí',
-    0x274FA: 'xiè',
-    0x274FB: 'lǜ',
-    0x274FD: 'lì,chài',
-    0x274FF: 'máo',
-    0x27502: 'xiá',
-    0x27505: 'sòu',
-    0x27516: 'sū',
-    0x27517: 'xuè',
-    0x2751D: 'lì',
-    0x2751E: 'yuán',
-    0x27521: 'zhǎn',
-    0x27523: 'tà',
-    0x27524: 'xuán',
-    0x27525: 'wèi',
-    0x27526: 'yè',
-    0x27527: 'páng',
-    0x27528: 'máo',
-    0x27529: 'tí',
-    0x2752A: 'pín',
-    0x2752C: 'dù',
-    0x2752D: 'qiú',
-    0x2752E: 'yǐ',
-    0x27533: 'tuó',
-    0x27534: 'chài',
-    0x27537: 'jìn',
-    0x2753C: 'é',
-    0x27543: 'chán',
-    0x27544: 'yīng',
-    0x27545: 'líng',
-    0x27547: 'xiǎn',
-    0x27549: 'qī',
-    0x2754B: 'yuè',
-    0x2754C: 'lüè',
-    0x2754D: 'yíng',
-    0x2754E: 'qú',
-    0x27552: 'fěi',
-    0x27553: 'zī',
-    0x27559: 'qīng',
-    0x2755D: 'níng',
-    0x2755E: 'wèi',
-    0x2755F: 'shuāng',
-    0x27561: 'fù',
-    0x27564: 'mò',
-    0x27565: 'mò',
-    0x27566: 'tuó',
-    0x27567: 'chài',
-    0x27568: 'zàng',
-    0x2756E: 'lí',
-    0x2756F: 'lí,shī',
-    0x27571: 'xiá',
-    0x27572: 'juǎn',
-    0x27574: 'nán',
-    0x27575: 'mì',
-    0x27578: 'huáng',
-    0x2757A: 'shuāng',
-    0x2757C: 'xǔ',
-    0x2757F: 'fěi',
-    0x27581: 'xiè,wén',
-    0x27586: 'tà',
-    0x27587: 'yǒng',
-    0x27589: 'zhǎn',
-    0x27591: 'qiáng',
-    0x27592: 'náng',
-    0x27594: 'lìn',
-    0x27598: 'luán',
-    0x27599: 'xiǎn',
-    0x2759A: 'fú',
-    0x2759C: 'líng',
-    0x275A0: 'sāo',
-    0x275A2: 'huì',
-    0x275A8: 'tíng',
-    0x275AA: 'qíng',
-    0x275AC: 'huāng',
-    0x275AE: 'àn',
-    0x275B5: 'mǎn',
-    0x275B7: 'nì,nǜ',
-    0x275BB: 'guó',
-    0x275BC: 'ǒu',
-    0x275BF: 'xiàng',
-    0x275C1: 'jīn',
-    0x275C6: 'zhēng',
-    0x275C8: 'nú',
-    0x275CB: 'sàn',
-    0x275CC: 'hù',
-    0x275CE: 'zú',
-    0x275CF: 'huǐ',
-    0x275D2: 'jī',
-    0x275D6: 'yè',
-    0x275E6: 'xíng',
-    0x275E9: 'là',
-    0x275EA: 'yù,qú',
-    0x275EB: 'jué',
-    0x275F1: 'shù,yù',
-    0x275F2: 'zhēng',
-    0x275F4: 'yǒng',
-    0x275F6: 'gē',
-    0x275F8: 'jiàn',
-    0x275F9: 'xìn,xiān',
-    0x275FC: 'huī',
-    0x275FF: 'shuài',
-    0x27602: 'chōng',
-    0x27603: 'háng',
-    0x27608: 'liǎo',
-    0x2760D: 'jiāng',
-    0x2760F: 'gōng',
-    0x27611: 'zhuó,bào',
-    0x27617: 'qǐ',
-    0x2761C: 'qiān',
-    0x2761E: 'dǒu',
-    0x2761F: 'pō,bō',
-    0x27622: 'hù',
-    0x27625: 'niǔ',
-    0x27627: 'qì',
-    0x27628: 'diāo',
-    0x27629: 'diāo',
-    0x2762B: 'lì',
-    0x2762E: 'xiōng',
-    0x2763D: 'ná',
-    0x2763F: 'zhēng',
-    0x27640: 'là',
-    0x27641: 'zhì,zī,jì,pī',
-    0x27643: 'ě',
-    0x27644: 'bō',
-    0x27645: 'pō',
-    0x27646: 'xū',
-    0x27647: 'yòng,dǎn',
-    0x27648: 'cí',
-    0x27649: 'lì',
-    0x2764C: 'páo',
-    0x2764F: 'xiù,yǒu',
-    0x2765B: 'pù',
-    0x2765D: 'ché',
-    0x2765E: 'qì',
-    0x27661: 'yì',
-    0x27663: 'tí',
-    0x27664: 'duǒ',
-    0x27665: 'lóng,tǒng',
-    0x27667: 'jiàn',
-    0x2766D: 'zhàn',
-    0x2766E: 'yuàn',
-    0x27676: 'yú',
-    0x27678: 'gēng',
-    0x2767A: 'hòu',
-    0x2767E: 'qǐ',
-    0x27680: 'mù',
-    0x27681: 'huàn',
-    0x27682: 'lòng',
-    0x27683: 'xì',
-    0x27684: 'é',
-    0x27685: 'lǎng',
-    0x27686: 'fèi',
-    0x27687: 'wǎn,wèn',
-    0x27689: 'cūn',
-    0x2768B: 'péng',
-    0x2768F: 'cuò',
-    0x27690: 'wēng',
-    0x276A1: 'gǎo',
-    0x276A5: 'cuì',
-    0x276A8: 'qì,shà,qiè',
-    0x276A9: 'lí',
-    0x276AA: 'qiè',
-    0x276AB: 'qiàn,jīng',
-    0x276AC: 'kōng',
-    0x276AD: 'běng',
-    0x276AF: 'shòu',
-    0x276B7: 'wēi',
-    0x276C4: 'shān',
-    0x276CF: 'zī',
-    0x276D2: 'tì',
-    0x276D3: 'qiān',
-    0x276D4: 'dú',
-    0x276D7: 'tú',
-    0x276DA: 'wēi',
-    0x276DE: 'hú',
-    0x276DF: 'xīng',
-    0x276E1: 'shān',
-    0x276E2: 'zhǐ',
-    0x276E7: 'chǐ',
-    0x276F8: 'zhòu',
-    0x276F9: 'wēng',
-    0x276FA: 'chí',
-    0x276FB: 'suǒ',
-    0x276FC: 'xiè',
-    0x276FE: 'kè',
-    0x27701: 'shài,shā,shǎi',
-    0x27702: 'shī',
-    0x27703: 'shòu',
-    0x27705: 'jiè',
-    0x27709: 'gǎo',
-    0x2770A: 'lǚ',
-    0x27714: 'xiè',
-    0x2771A: 'zhǐ',
-    0x2771E: 'mán,màn',
-    0x27720: 'shuài',
-    0x27721: 'kè',
-    0x27723: 'diǎo',
-    0x27724: 'yī',
-    0x27726: 'sù',
-    0x27727: 'chuāng',
-    0x27731: 'cuì',
-    0x27732: 'tuò',
-    0x27735: 'xiè',
-    0x2773D: 'xuán',
-    0x27742: 'hè',
-    0x27743: 'jué',
-    0x27746: 'tì',
-    0x27747: 'fèi',
-    0x27749: 'zhǐ',
-    0x2774A: 'shì',
-    0x2774B: 'tuí',
-    0x2774E: 'chōng,chuáng,chóng',
-    0x27750: 'tì',
-    0x27751: 'zhàn',
-    0x27752: 'héng',
-    0x27754: 'qú',
-    0x27755: 'wéi',
-    0x27757: 'dūn',
-    0x27758: 'bào',
-    0x2775C: 'liáo',
-    0x27764: 'sī',
-    0x2776A: 'biǎo',
-    0x2776B: 'xiè',
-    0x2776C: 'bié,bì',
-    0x2776E: 'cǒng',
-    0x27772: 'jù',
-    0x27773: 'hé',
-    0x27777: 'kuì',
-    0x27778: 'yōng',
-    0x27780: 'shù',
-    0x2778D: 'niè',
-    0x2778F: 'yú',
-    0x27790: 'zhuó',
-    0x27791: 'méng',
-    0x27792: 'hú',
-    0x27795: 'liè',
-    0x2779D: 'jiē',
-    0x2779E: 'xióng',
-    0x277A3: 'yǎn',
-    0x277A9: 'jié',
-    0x277AA: 'là,lié',
-    0x277AB: 'shù',
-    0x277AC: 'jié',
-    0x277AD: 'léi',
-    0x277B0: 'zú',
-    0x277B2: 'shì',
-    0x277B8: 'wéi,suì',
-    0x277B9: 'dū',
-    0x277BA: 'sù',
-    0x277C3: 'xié',
-    0x277C4: 'ráng',
-    0x277CC: 'luò',
-    0x277D1: 'qiān',
-    0x277D8: 'nàng',
-    0x277D9: 'líng',
-    0x277DC: 'jì',
-    0x277E0: 'mìng',
-    0x277E3: 'gǔ',
-    0x277E8: 'xuán',
-    0x277EC: 'xū',
-    0x277F1: 'bó',
-    0x277FC: 'wēi',
-    0x27802: 'kū',
-    0x27806: 'wǎn',
-    0x27808: 'chà',
-    0x2780A: 'mào',
-    0x2780B: 'kè',
-    0x2780E: 'cì',
-    0x27812: 'xiàn',
-    0x27813: 'mò',
-    0x2781A: 'hūn',
-    0x2781B: 'chàn',
-    0x2781C: 'shī',
-    0x2781D: 'zhěn',
-    0x2781E: 'è',
-    0x2781F: 'mí',
-    0x27821: 'shī',
-    0x27822: 'qū',
-    0x27823: 'shū',
-    0x27825: 'cī',
-    0x27826: 'yǎn',
-    0x27829: 'hū',
-    0x2782A: 'qī',
-    0x2782B: 'zhì,dí,chì',
-    0x2782C: 'huāng',
-    0x27834: 'zhǐ',
-    0x27836: 'yǒu',
-    0x2783C: 'gào',
-    0x2783D: 'yǎo',
-    0x2783E: 'pōu',
-    0x27847: 'yí',
-    0x27848: 'chèng',
-    0x27849: 'jì',
-    0x2784B: 'ǎi,yá',
-    0x2784D: 'dòng',
-    0x2784F: 'suì',
-    0x27851: 'jiù',
-    0x27858: 'qì,qīn',
-    0x27859: 'lián',
-    0x2785A: 'xuǎn',
-    0x2785C: 'liǎo',
-    0x27861: 'yùn',
-    0x27862: 'xuǎn',
-    0x27863: 'cóu',
-    0x27864: 'piān',
-    0x27866: 'kuí',
-    0x27868: 'tí',
-    0x27869: 'huǎn',
-    0x2786A: 'dān,dàn',
-    0x2786B: 'guì,kuì',
-    0x2786C: 'chēn',
-    0x2786E: 'shǎng',
-    0x2786F: 'jì',
-    0x27874: 'liàn',
-    0x27875: 'kān',
-    0x27876: 'shèng',
-    0x27878: 'dōu',
-    0x27879: 'yóu',
-    0x2787A: 'qí',
-    0x2787C: 'xiǎo',
-    0x27882: 'yì',
-    0x27883: 'lóu',
-    0x27886: 'chuāng',
-    0x2788B: 'lào',
-    0x2788C: 'gāo',
-    0x27890: 'zēng',
-    0x27892: 'wéi,wěi',
-    0x27896: 'jiān',
-    0x2789B: 'yīng',
-    0x2789C: 'fán',
-    0x2789D: 'lì',
-    0x2789E: 'qiān',
-    0x278A2: 'yào',
-    0x278A6: 'kuī,kuí,guì',
-    0x278A7: 'wéi',
-    0x278A9: 'què',
-    0x278AC: 'xiǎo',
-    0x278AD: 'què',
-    0x278B0: 'hū',
-    0x278B5: 'duō',
-    0x278B6: 'chù',
-    0x278B9: 'shēn,jīn',
-    0x278BC: 'zhuó',
-    0x278BD: 'é',
-    0x278BE: 'jì',
-    0x278C1: 'tán',
-    0x278C3: 'pā',
-    0x278CB: 'jiè',
-    0x278CC: 'qiào',
-    0x278D1: 'qián',
-    0x278D2: 'jù',
-    0x278D5: 'qiú',
-    0x278D6: 'tuó',
-    0x278DA: 'nuò',
-    0x278DB: 'sì',
-    0x278DF: 'yí',
-    0x278E1: 'gǔ',
-    0x278E2: 'hùn',
-    0x278E3: 'pá',
-    0x278E4: 'zī',
-    0x278E6: 'jiāo',
-    0x278E9: 'xǐ',
-    0x278EA: 'shǎo,shào',
-    0x278EC: 'yí',
-    0x278ED: 'zhì',
-    0x278F5: 'lùn',
-    0x278F7: 'zhōu',
-    0x278F8: 'jué',
-    0x278F9: 'tán',
-    0x278FA: 'nuò,chuò',
-    0x278FB: 'jù',
-    0x278FC: 'hú',
-    0x278FE: 'zhì',
-    0x27903: 'bī',
-    0x2790D: 'chì,tì',
-    0x2790E: 'xuān',
-    0x2790F: 'jí',
-    0x27910: 'guǎ',
-    0x27911: 'jú',
-    0x27912: 'wò',
-    0x27913: 'tuó',
-    0x27915: 'qiú',
-    0x27916: 'wēi',
-    0x27917: 'duān',
-    0x27919: 'shòu',
-    0x2791B: 'zhěn',
-    0x2791C: 'nè,lì',
-    0x2791F: 'xì',
-    0x27920: 'zhé',
-    0x27921: 'zhì',
-    0x27923: 'ná',
-    0x27928: 'jiān',
-    0x2792E: 'yáo',
-    0x2792F: 'guó,yuè',
-    0x27932: 'dǐ',
-    0x27934: 'huò',
-    0x27935: 'jīng',
-    0x2793C: 'jué',
-    0x2793D: 'yuè,jiàn',
-    0x27944: 'jí',
-    0x27946: 'sù',
-    0x27948: 'jiān',
-    0x2794A: 'kūn',
-    0x2794B: 'wò',
-    0x2794C: 'kuàng',
-    0x2794D: 'biāo',
-    0x2794E: 'jué',
-    0x27951: 'bì',
-    0x27953: 'chán',
-    0x27955: 'zī',
-    0x27956: 'lí,shǐ',
-    0x2795A: 'fó',
-    0x2795B: 'qiǎn',
-    0x2795C: 'yǎn',
-    0x2795E: 'tàn',
-    0x2795F: 'mò',
-    0x27963: 'kòu',
-    0x27964: 'xī,xiē',
-    0x2796E: 'hù,dǐ',
-    0x2796F: 'hù',
-    0x27971: 'fú',
-    0x27974: 'yàng',
-    0x27975: 'guò',
-    0x27977: 'rén',
-    0x27978: 'yìn',
-    0x27979: 'fēng',
-    0x2797A: 'jùn,yùn',
-    0x2797C: 'yún',
-    0x2797F: 'xùn',
-    0x27981: 'xì',
-    0x2798E: 'xiā',
-    0x27991: 'háng',
-    0x2799A: 'hù,dǐ',
-    0x2799D: 'hū,hào',
-    0x2799E: 'pù',
-    0x2799F: 'fān',
-    0x279A4: 'jiā',
-    0x279A7: 'yí,tuō',
-    0x279AD: 'tuō,xī',
-    0x279AE: 'ná',
-    0x279B8: 'yín',
-    0x279B9: 'yìn',
-    0x279C3: 'jì',
-    0x279C4: 'wàng',
-    0x279C5: 'shì,jiàn',
-    0x279C6: 'duī',
-    0x279C7: 'duò',
-    0x279C9: 'tuó',
-    0x279CA: 'wā',
-    0x279CB: 'lì',
-    0x279CF: 'rè,rě',
-    0x279D2: 'cì',
-    0x279D3: 'xù',
-    0x279D4: 'zhōu',
-    0x279D5: 'zì',
-    0x279DC: 'wǎng',
-    0x279DD: 'yǎ',
-    0x279DF: 'jì',
-    0x279E0: 'chǎo',
-    0x279E9: 'jí',
-    0x279F5: 'shǎn',
-    0x279F6: 'tú',
-    0x279F8: 'bié',
-    0x279F9: 'xì',
-    0x279FA: 'pī',
-    0x279FB: 'zhà',
-    0x279FE: 'huì',
-    0x27A00: 'suō,zuò',
-    0x27A02: 'hè',
-    0x27A04: 'yuē',
-    0x27A06: 'wū,huǎng',
-    0x27A08: 'líng,wū',
-    0x27A0A: 'zhà',
-    0x27A0B: 'huá',
-    0x27A17: 'chán',
-    0x27A1F: 'è',
-    0x27A21: 'chén',
-    0x27A27: 'suì',
-    0x27A29: 'tiǎn',
-    0x27A30: 'zhì',
-    0x27A31: 'tì',
-    0x27A32: 'āo',
-    0x27A33: 'zhuó',
-    0x27A34: 'zì',
-    0x27A35: 'kē',
-    0x27A37: 'sè',
-    0x27A38: 'tián',
-    0x27A39: 'lù',
-    0x27A3E: 'shán',
-    0x27A3F: 'zhǎ',
-    0x27A43: 'chōng',
-    0x27A45: 'yàn',
-    0x27A52: 'mǔ',
-    0x27A53: 'hū',
-    0x27A5A: 'chī',
-    0x27A5D: 'sù',
-    0x27A63: 'nǎo',
-    0x27A66: 'jí',
-    0x27A67: 'duó',
-    0x27A68: 'hòu',
-    0x27A6A: 'còng',
-    0x27A6B: 'zhā,chà',
-    0x27A6C: 'yín',
-    0x27A6E: 'xiǎo,sǒu,sòu',
-    0x27A70: 'biàn',
-    0x27A71: 'bèng',
-    0x27A72: 'là',
-    0x27A74: 'chī,chì',
-    0x27A76: 'qià',
-    0x27A78: 'ān',
-    0x27A79: 'shī,yǐ',
-    0x27A7C: 'chì,zhǐ',
-    0x27A85: 'nù',
-    0x27A87: 'jì',
-    0x27A93: 'ǒu',
-    0x27A95: 'xiā',
-    0x27A98: 'chài,cuǒ,jiē',
-    0x27A9A: 'ái',
-    0x27A9D: 'shèng',
-    0x27A9E: 'hé,gé',
-    0x27AA0: 'jí',
-    0x27AA1: 'chī',
-    0x27AA2: 'xì',
-    0x27AA3: 'zhēng',
-    0x27AA6: 'tā',
-    0x27AA8: 'mà',
-    0x27AAB: 'pī',
-    0x27AAE: 'xū,huá',
-    0x27AAF: 'qiǎn',
-    0x27AB9: 'xià',
-    0x27ACA: 'yù',
-    0x27AD1: 'jié',
-    0x27AD2: 'xià',
-    0x27AD3: 'lǔ',
-    0x27AD5: 'qiè',
-    0x27AD7: 'chà',
-    0x27ADB: 'yàng',
-    0x27ADC: 'jì',
-    0x27ADD: 'shǎ',
-    0x27ADE: 'lòu',
-    0x27AE0: 'jī',
-    0x27AE1: 'zhì',
-    0x27AE2: 'wàng',
-    0x27AE4: 'bì',
-    0x27AE5: 'ān',
-    0x27AE6: 'yī',
-    0x27AE7: 'ān,àn',
-    0x27AEC: 'lí',
-    0x27AF9: 'xiān',
-    0x27AFE: 'jiù',
-    0x27AFF: 'tǎn',
-    0x27B01: 'hào',
-    0x27B02: 'hè',
-    0x27B05: 'zhā',
-    0x27B06: 'zhǎn',
-    0x27B07: 'yì',
-    0x27B08: 'xì',
-    0x27B0A: 'xì,sí',
-    0x27B0B: 'fà',
-    0x27B0C: 'yán',
-    0x27B0F: 'mǔ',
-    0x27B15: 'gū',
-    0x27B1E: 'yún',
-    0x27B24: 'zhòng',
-    0x27B26: 'chǎn',
-    0x27B27: 'chuáng',
-    0x27B28: 'huì',
-    0x27B29: 'zá',
-    0x27B2A: 'gùn',
-    0x27B2B: 'jiǎn',
-    0x27B2C: 'yá',
-    0x27B30: 'xiàng,xiǎng',
-    0x27B31: 'hè',
-    0x27B43: 'dàn',
-    0x27B47: 'mián',
-    0x27B48: 'níng,nìng',
-    0x27B4A: 'méng',
-    0x27B4C: 'liè',
-    0x27B4D: 'zhòu',
-    0x27B4E: 'pū',
-    0x27B4F: 'tāi',
-    0x27B53: 'yíng',
-    0x27B54: 'téng',
-    0x27B55: 'guó',
-    0x27B5A: 'qiáng',
-    0x27B5C: 'lǜ',
-    0x27B5D: 'sà',
-    0x27B5E: 'liè',
-    0x27B5F: 'chí',
-    0x27B60: 'xiě',
-    0x27B63: 'guó',
-    0x27B64: 'bào,báo',
-    0x27B65: 'luò',
-    0x27B66: 'juàn,xuān',
-    0x27B6A: 'è',
-    0x27B73: 'hé',
-    0x27B75: 'mèi',
-    0x27B78: 'xiè',
-    0x27B79: 'pín',
-    0x27B7B: 'hān',
-    0x27B7C: 'chèn',
-    0x27B7D: 'shàn',
-    0x27B7E: 'huì',
-    0x27B86: 'yīng',
-    0x27B88: 'jiǎn',
-    0x27B8D: 'ān',
-    0x27B91: 'tà',
-    0x27B92: 'yī',
-    0x27B93: 'tuí',
-    0x27B97: 'liú',
-    0x27B99: 'zuó',
-    0x27B9B: 'lí',
-    0x27B9D: 'pín',
-    0x27B9E: 'xuè',
-    0x27BA0: 'nèn',
-    0x27BA1: 'dòu',
-    0x27BA4: 'lǎn',
-    0x27BAA: 'zhān',
-    0x27BAB: 'jué',
-    0x27BAC: 'zhēn,jué',
-    0x27BAD: 'jí',
-    0x27BAE: 'qiān',
-    0x27BB0: 'hān',
-    0x27BB1: 'fén',
-    0x27BB3: 'hān',
-    0x27BB4: 'hóng',
-    0x27BB5: 'hé',
-    0x27BB6: 'hóu',
-    0x27BBA: 'zhàn',
-    0x27BBB: 'chóu,xiāo',
-    0x27BBC: 'tài',
-    0x27BBD: 'qiàn',
-    0x27BBF: 'shè',
-    0x27BC0: 'yīng',
-    0x27BC3: 'qīn',
-    0x27BC6: 'huò',
-    0x27BC8: 'xì',
-    0x27BC9: 'hè',
-    0x27BCA: 'xì',
-    0x27BCB: 'xiā',
-    0x27BCC: 'hāo',
-    0x27BCD: 'lào',
-    0x27BCF: 'lì',
-    0x27BD2: 'chēng',
-    0x27BD6: 'jùn',
-    0x27BD7: 'xī',
-    0x27BD8: 'hǎn',
-    0x27BDE: 'dòu,dōu',
-    0x27BE0: 'dōu',
-    0x27BE1: 'wān,yuè',
-    0x27BE4: 'dōu',
-    0x27BE5: 'zài',
-    0x27BE6: 'juàn',
-    0x27BE8: 'lǒu',
-    0x27BE9: 'chù',
-    0x27BEB: 'zhēng',
-    0x27BEF: 'qí',
-    0x27BF0: 'kàn',
-    0x27BF1: 'huò,yù',
-    0x27BF2: 'lái',
-    0x27BFA: 'gāi',
-    0x27BFC: 'shòu',
-    0x27BFE: 'dōng',
-    0x27C03: 'lóu',
-    0x27C04: 'tuān',
-    0x27C07: 'yú',
-    0x27C08: 'wù',
-    0x27C0A: 'tián',
-    0x27C12: 'guó',
-    0x27C18: 'tán',
-    0x27C19: 'qí',
-    0x27C20: 'liè',
-    0x27C21: 'lì',
-    0x27C23: 'xūn',
-    0x27C28: 'gèng',
-    0x27C29: 'tīng',
-    0x27C2A: 'hàn',
-    0x27C2B: 'chù',
-    0x27C2D: 'tún',
-    0x27C2F: 'xióng',
-    0x27C30: 'yóu',
-    0x27C31: 'mò',
-    0x27C32: 'chǐ',
-    0x27C34: 'hǔ',
-    0x27C35: 'dū,dú,zhuó',
-    0x27C37: 'mǔ',
-    0x27C39: 'nà',
-    0x27C3B: 'líng',
-    0x27C3F: 'ài',
-    0x27C40: 'xiān',
-    0x27C44: 'kǎn',
-    0x27C45: 'sì',
-    0x27C46: 'sān',
-    0x27C4A: 'yì',
-    0x27C4F: 'yì',
-    0x27C50: 'xiào,xiāo',
-    0x27C52: 'zhī,zhuō',
-    0x27C53: 'dòu',
-    0x27C58: 'mài',
-    0x27C5C: 'lún',
-    0x27C5D: 'jué,jùn',
-    0x27C61: 'qiāng',
-    0x27C62: 'líng',
-    0x27C69: 'pián',
-    0x27C6A: 'còu',
-    0x27C6B: 'duò',
-    0x27C6C: 'yǔ',
-    0x27C70: 'zhuō',
-    0x27C72: 'xì',
-    0x27C73: 'huài',
-    0x27C74: 'míng',
-    0x27C75: 'táng',
-    0x27C79: 'pū',
-    0x27C7B: 'mì',
-    0x27C7C: 'mán',
-    0x27C7E: 'guāi',
-    0x27C80: 'qiān',
-    0x27C82: 'lín',
-    0x27C83: 'mǐn',
-    0x27C84: 'wěi',
-    0x27C85: 'céng',
-    0x27C87: 'hù',
-    0x27C88: 'suí',
-    0x27C8B: 'jù',
-    0x27C8C: 'shà',
-    0x27C8D: 'méng',
-    0x27C97: 'wéi',
-    0x27C98: 'xī',
-    0x27C99: 'lìng',
-    0x27C9C: 'bì',
-    0x27C9D: 'wèi',
-    0x27CA1: 'lì',
-    0x27CA2: 'zhé',
-    0x27CA4: 'yóng',
-    0x27CA5: 'hú',
-    0x27CA6: 'wán,hé',
-    0x27CA7: 'bā',
-    0x27CA8: 'jiān',
-    0x27CAD: 'zuǒ',
-    0x27CAE: 'zhǎn',
-    0x27CAF: 'bō',
-    0x27CB0: 'qiū,chū',
-    0x27CB1: 'yāng',
-    0x27CB4: 'dōng',
-    0x27CB5: 'qú',
-    0x27CBA: 'pí',
-    0x27CBB: 'zhǎi',
-    0x27CBE: 'shān',
-    0x27CBF: 'gòu',
-    0x27CC0: 'biào,nǎo',
-    0x27CC1: 'yí',
-    0x27CC2: 'fú',
-    0x27CC4: 'xìn',
-    0x27CC5: 'shì,shǐ',
-    0x27CC6: 'tōng,tóng',
-    0x27CC9: 'dīng',
-    0x27CCC: 'tū',
-    0x27CCD: 'xiāo',
-    0x27CCE: 'wú',
-    0x27CCF: 'péi',
-    0x27CD0: 'huī,xī',
-    0x27CD5: 'lái',
-    0x27CD9: 'sì',
-    0x27CDA: 'cuǐ',
-    0x27CDB: 'shà',
-    0x27CDC: 'zhǒu',
-    0x27CDD: 'zhào',
-    0x27CDE: 'wéi',
-    0x27CDF: 'lái',
-    0x27CE0: 'bì,bǐ',
-    0x27CE3: 'dǒng',
-    0x27CE6: 'nǎo',
-    0x27CE7: 'xiē',
-    0x27CE8: 'rǎo',
-    0x27CE9: 'tuàn',
-    0x27CEA: 'wèi',
-    0x27CEB: 'yóu,jiū,qiú,yòu',
-    0x27CEC: 'méi',
-    0x27CED: 'yuán',
-    0x27CEE: 'zhòng',
-    0x27CF6: 'sōu',
-    0x27CF8: 'gú',
-    0x27CF9: 'shào',
-    0x27CFB: 'zhǎo',
-    0x27CFC: 'pí',
-    0x27CFF: 'tōng',
-    0x27D01: 'chī',
-    0x27D02: 'péng',
-    0x27D03: 'chán',
-    0x27D04: 'yōng',
-    0x27D05: 'shuǎng',
-    0x27D07: 'wǔ',
-    0x27D09: 'pí',
-    0x27D0A: 'huàn',
-    0x27D0C: 'fú',
-    0x27D0E: 'biào',
-    0x27D13: 'náo',
-    0x27D15: 'biào',
-    0x27D16: 'wèi',
-    0x27D17: 'yōng',
-    0x27D19: 'nǎo',
-    0x27D1A: 'guài',
-    0x27D20: 'lì',
-    0x27D22: 'xìn',
-    0x27D23: 'yán',
-    0x27D24: 'pò',
-    0x27D25: 'péi',
-    0x27D2A: 'suǒ',
-    0x27D2C: 'rèn',
-    0x27D2D: 'shǎn',
-    0x27D32: 'suǒ',
-    0x27D38: 'dān',
-    0x27D3A: 'mèn',
-    0x27D43: 'shǒu',
-    0x27D48: 'gòu',
-    0x27D4A: 'hān,hàn,tàn',
-    0x27D4B: 'shì',
-    0x27D4C: 'yǎng',
-    0x27D4E: 'gǔ',
-    0x27D5B: 'kē',
-    0x27D5E: 'jū',
-    0x27D60: 'pài',
-    0x27D61: 'cè',
-    0x27D62: 'bāo',
-    0x27D63: 'xiōng,mín',
-    0x27D64: 'cái,zhù',
-    0x27D67: 'lǐn',
-    0x27D68: 'ài',
-    0x27D6C: 'mì,shèn',
-    0x27D6D: 'lǎi',
-    0x27D71: 'xiāo',
-    0x27D73: 'shé',
-    0x27D7B: 'huó',
-    0x27D7C: 'nì',
-    0x27D84: 'zhèng',
-    0x27D86: 'lìn',
-    0x27D87: 'zhá',
-    0x27D8A: 'yún',
-    0x27D8D: 'xù',
-    0x27D94: 'chéng',
-    0x27D95: 'wǒ',
-    0x27D96: 'xī',
-    0x27D99: 'bèi',
-    0x27D9C: 'shāng,shǎng',
-    0x27DA0: 'yù',
-    0x27DA1: 'mì',
-    0x27DB2: 'duǎn,zhuàn',
-    0x27DB5: 'chà',
-    0x27DB7: 'zé',
-    0x27DB8: 'chèng',
-    0x27DBA: 'tíng',
-    0x27DC5: 'yí',
-    0x27DCB: 'yāo',
-    0x27DCE: 'kū',
-    0x27DD0: 'fén',
-    0x27DD1: 'xié',
-    0x27DD2: 'chèng',
-    0x27DDB: 'kuì',
-    0x27DDF: 'bīn',
-    0x27DE1: 'lóu,lòu',
-    0x27DE5: 'yì',
-    0x27DE6: 'mì',
-    0x27DE7: 'xiè',
-    0x27DF1: 'guī',
-    0x27DF3: 'luó',
-    0x27DF6: 'shàn',
-    0x27DFE: 'jú',
-    0x27DFF: 'dū',
-    0x27E02: 'xiān',
-    0x27E05: 'zhǐ',
-    0x27E08: 'bìn',
-    0x27E15: 'zhǐ',
-    0x27E16: 'zhuàn,lián',
-    0x27E17: 'xué',
-    0x27E18: 'liàn,biǎn,jiǎn',
-    0x27E19: 'suì',
-    0x27E26: 'làn',
-    0x27E27: 'jù',
-    0x27E28: 'mián',
-    0x27E29: 'xùn',
-    0x27E2A: 'zhàn',
-    0x27E2B: 'gùn',
-    0x27E32: 'zhì',
-    0x27E3D: 'wèi',
-    0x27E3E: 'quǎn,xuàn',
-    0x27E3F: 'chài',
-    0x27E48: 'réng',
-    0x27E4A: 'yuè',
-    0x27E4C: 'zī',
-    0x27E50: 'luò',
-    0x27E51: 'guì',
-    0x27E53: 'chéng',
-    0x27E55: 'jū',
-    0x27E56: 'tiǎn',
-    0x27E57: 'wàn',
-    0x27E5B: 'zhī',
-    0x27E5E: 'nǎn,niǎn',
-    0x27E63: 'hān',
-    0x27E68: 'xī',
-    0x27E69: 'lín',
-    0x27E6C: 'yān',
-    0x27E6D: 'xù',
-    0x27E72: 'hù',
-    0x27E73: 'gàn',
-    0x27E74: 'xù,huò',
-    0x27E76: 'xì',
-    0x27E7A: 'cuì',
-    0x27E7D: 'xì',
-    0x27E7E: 'hú',
-    0x27E85: 'yān',
-    0x27E8E: 'yì',
-    0x27E8F: 'chí',
-    0x27E90: 'jué',
-    0x27E92: 'zú',
-    0x27E9C: 'jiào',
-    0x27E9D: 'yì',
-    0x27E9F: 'tǎn',
-    0x27EA0: 'chì',
-    0x27EA1: 'bá',
-    0x27EA2: 'tòu,yì',
-    0x27EA3: 'zōng',
-    0x27EA4: 'qiú,jū',
-    0x27EA7: 'chì',
-    0x27EA8: 'xǐ',
-    0x27EB0: 'nì',
-    0x27EB2: 'cū',
-    0x27EB4: 'wǔ',
-    0x27EB6: 'chù',
-    0x27EB7: 'sū',
-    0x27EB8: 'yóng',
-    0x27EB9: 'jǔ',
-    0x27EBA: 'bá',
-    0x27EBC: 'cǐ',
-    0x27EBD: 'dì',
-    0x27EBE: 'pǎn',
-    0x27EBF: 'chì,yì',
-    0x27EC1: 'qiǔ',
-    0x27EC3: 'yán,qù',
-    0x27ECD: 'zhǎi',
-    0x27ED2: 'xiàn',
-    0x27ED3: 'bèng',
-    0x27ED4: 'kuāng',
-    0x27ED5: 'qì',
-    0x27ED6: 'zhōu',
-    0x27ED7: 'jú',
-    0x27ED8: 'qiè',
-    0x27ED9: 'mò,pò',
-    0x27EDA: 'yuán',
-    0x27EDC: 'guì,kuǐ',
-    0x27EDD: 'zuī',
-    0x27EE7: 'qiè',
-    0x27EF0: 'hú,zào',
-    0x27EF1: 'qiú',
-    0x27EF2: 'hái,kuī',
-    0x27EF3: 'fù',
-    0x27EF4: 'làng',
-    0x27EF5: 'shà',
-    0x27EF6: 'xī',
-    0x27EF7: 'bū',
-    0x27EF8: 'shì',
-    0x27EF9: 'yǒng',
-    0x27EFA: 'guāng,kuāng',
-    0x27EFC: 'niè',
-    0x27EFF: 'hǒu',
-    0x27F0A: 'mì',
-    0x27F0E: 'è',
-    0x27F0F: 'xián',
-    0x27F10: 'yǔn,qūn',
-    0x27F11: 'xù',
-    0x27F12: 'qǐn',
-    0x27F13: 'dōng',
-    0x27F14: 'léng',
-    0x27F15: 'qì',
-    0x27F16: 'lán',
-    0x27F17: 'fú',
-    0x27F18: 'qǐ',
-    0x27F19: 'chǒng',
-    0x27F1C: 'cù',
-    0x27F1F: 'mò',
-    0x27F20: 'bēi',
-    0x27F24: 'dào',
-    0x27F28: 'jié,jué',
-    0x27F29: 'chòng,dòng',
-    0x27F2A: 'chì',
-    0x27F2B: 'yù',
-    0x27F2C: 'cuī',
-    0x27F2D: 'sù,sōu,sǒu,qiù',
-    0x27F2E: 'tì',
-    0x27F2F: 'shù,yú',
-    0x27F30: 'zhá',
-    0x27F31: 'fú,bí',
-    0x27F33: 'chè',
-    0x27F34: 'fó,zhì',
-    0x27F35: 'hóu',
-    0x27F36: 'zhá',
-    0x27F44: 'jié',
-    0x27F45: 'zhá',
-    0x27F46: 'zhān',
-    0x27F49: 'yǎn',
-    0x27F4A: 'hái',
-    0x27F4B: 'wǔ',
-    0x27F4C: 'huá',
-    0x27F4D: 'diān,diàn',
-    0x27F4E: 'yáo',
-    0x27F4F: 'sōu',
-    0x27F50: 'qiān',
-    0x27F51: 'jí',
-    0x27F52: 'xiòng',
-    0x27F53: 'qì',
-    0x27F54: 'jūn',
-    0x27F56: 'hái',
-    0x27F5E: 'yǎn',
-    0x27F5F: 'jié',
-    0x27F60: 'cuī',
-    0x27F62: 'tuán',
-    0x27F63: 'zhāng',
-    0x27F64: 'piāo',
-    0x27F65: 'lù',
-    0x27F66: 'zhī',
-    0x27F67: 'chù',
-    0x27F68: 'mì',
-    0x27F69: 'qiāng',
-    0x27F6B: 'liàn',
-    0x27F72: 'lì',
-    0x27F76: 'é',
-    0x27F77: 'sù',
-    0x27F78: 'jué,guì',
-    0x27F7B: 'jú',
-    0x27F7C: 'tán',
-    0x27F7D: 'liáo',
-    0x27F7E: 'sān,cún',
-    0x27F7F: 'dòng',
-    0x27F81: 'zá',
-    0x27F82: 'zhí',
-    0x27F86: 'xuàn',
-    0x27F87: 'líng',
-    0x27F8A: 'dēng',
-    0x27F8D: 'zhān,zhàn,chán',
-    0x27F8E: 'xuān',
-    0x27F8F: 'qǐn',
-    0x27F90: 'jiào',
-    0x27F91: 'pì',
-    0x27F94: 'hǎn',
-    0x27F9A: 'yú',
-    0x27F9B: 'guó',
-    0x27F9D: 'xún',
-    0x27FA0: 'xún',
-    0x27FA1: 'chán',
-    0x27FA2: 'jié,jí',
-    0x27FA3: 'jú',
-    0x27FA4: 'yǎn',
-    0x27FA5: 'dú',
-    0x27FA7: 'hòng',
-    0x27FA8: 'xiàn,xiǎn',
-    0x27FA9: 'xún,xuàn',
-    0x27FAE: 'líng',
-    0x27FAF: 'jié',
-    0x27FB0: 'yì',
-    0x27FB1: 'qú',
-    0x27FB2: 'gān',
-    0x27FB3: 'fēng',
-    0x27FB5: 'jué',
-    0x27FB6: 'qū',
-    0x27FBB: 'jiù',
-    0x27FBD: 'jì',
-    0x27FBE: 'jǐ',
-    0x27FC5: 'xí',
-    0x27FC6: 'pāng',
-    0x27FC8: 'kuàng',
-    0x27FC9: 'kù,wù',
-    0x27FCB: 'kù',
-    0x27FCC: 'zhà',
-    0x27FCF: 'bà',
-    0x27FD2: 'chěn',
-    0x27FD3: 'hù',
-    0x27FD4: 'nù',
-    0x27FD5: 'é',
-    0x27FD6: 'xiōng',
-    0x27FD7: 'dǔn',
-    0x27FD8: 'shēng',
-    0x27FD9: 'wán',
-    0x27FDA: 'fēn',
-    0x27FDD: 'xī',
-    0x27FDE: 'zī',
-    0x27FE0: 'hù,dì',
-    0x27FE5: 'bié',
-    0x27FE7: 'tuò',
-    0x27FE8: 'bǎn',
-    0x27FE9: 'gé',
-    0x27FEB: 'kē',
-    0x27FF2: 'zhuì,bó',
-    0x27FF3: 'fú,fèi',
-    0x27FF4: 'mò',
-    0x27FF5: 'jiá',
-    0x27FF6: 'tuó',
-    0x27FF7: 'yù',
-    0x27FF9: 'mǔ',
-    0x27FFA: 'jué',
-    0x27FFB: 'jú',
-    0x27FFC: 'guā',
-    0x27FFD: 'pǒ',
-    0x28000: 'nǐ,niǎn',
-    0x28004: 'wǎ',
-    0x28005: 'yǎn',
-    0x28014: 'chǒu',
-    0x28015: 'kuāng',
-    0x28016: 'hài',
-    0x28018: 'xiáng',
-    0x28019: 'xī',
-    0x2801B: 'cún',
-    0x2801C: 'tōng',
-    0x2801D: 'ruò',
-    0x2801F: 'duó',
-    0x28020: 'chè',
-    0x28024: 'lèi',
-    0x28025: 'zī',
-    0x28027: 'zhěng',
-    0x28028: 'zuǒ',
-    0x2802B: 'kāng',
-    0x2802C: 'zài',
-    0x2802E: 'yuān,xuān',
-    0x2802F: 'qióng',
-    0x28033: 'fá',
-    0x28034: 'xún',
-    0x28036: 'jì',
-    0x28038: 'chā',
-    0x28040: 'shū,chōu',
-    0x28041: 'xuàn',
-    0x28042: 'xié',
-    0x28043: 'tī',
-    0x28044: 'hàn',
-    0x28045: 'xiān',
-    0x28046: 'shān',
-    0x28047: 'tùn',
-    0x28048: 'háng,gēng',
-    0x28049: 'kǔn',
-    0x2804A: 'cén',
-    0x2804B: 'dōu',
-    0x2804C: 'nuó',
-    0x2804D: 'yàn',
-    0x2804E: 'chéng,jìng',
-    0x2804F: 'pū',
-    0x28050: 'qì',
-    0x28051: 'yuè',
-    0x28052: 'fū',
-    0x28057: 'tǐng',
-    0x2805F: 'wǒ',
-    0x28060: 'shēng',
-    0x28061: 'tuǒ',
-    0x28074: 'tǎn',
-    0x28076: 'yǎ,yā',
-    0x28077: 'zhì',
-    0x28078: 'lù,lì',
-    0x28079: 'yǎn',
-    0x2807A: 'jū',
-    0x2807D: 'dé',
-    0x2807F: 'chù,zhuó',
-    0x28080: 'zǔ',
-    0x28081: 'è',
-    0x28082: 'zhí,xuě',
-    0x28083: 'péng',
-    0x28085: 'biē',
-    0x28087: 'dǐ',
-    0x28090: 'lái',
-    0x28092: 'yè',
-    0x2809C: 'háo',
-    0x2809D: 'pán',
-    0x2809E: 'tàn',
-    0x2809F: 'kāng',
-    0x280A0: 'xū,lǚ',
-    0x280A1: 'zòu',
-    0x280A2: 'jí',
-    0x280A3: 'wù',
-    0x280A6: 'chuàn',
-    0x280A9: 'pò',
-    0x280AA: 'yǎn',
-    0x280AB: 'tuò',
-    0x280AD: 'dú',
-    0x280AF: 'pián',
-    0x280B0: 'chì',
-    0x280B1: 'hùn',
-    0x280B2: 'pīng',
-    0x280B4: 'cōng',
-    0x280B5: 'zhǎ',
-    0x280BA: 'wān',
-    0x280BF: 'wǎi',
-    0x280C3: 'è',
-    0x280C4: 'wèi',
-    0x280C5: 'bāi',
-    0x280C7: 'jiāng',
-    0x280D3: 'chá',
-    0x280D5: 'chù',
-    0x280D6: 'kuà',
-    0x280D7: 'téng',
-    0x280D8: 'zōu,qū',
-    0x280D9: 'lì',
-    0x280DA: 'tà',
-    0x280DB: 'sà',
-    0x280DE: 'pán',
-    0x280DF: 'pán',
-    0x280E3: 'sào',
-    0x280E4: 'qiāo,kào',
-    0x280ED: 'zú',
-    0x280EF: 'zhì',
-    0x280F0: 'yǎn',
-    0x280F2: 'jié',
-    0x280F3: 'néng',
-    0x28104: 'luán',
-    0x28105: 'qū',
-    0x28107: 'dèng,téng',
-    0x28108: 'liáng',
-    0x28109: 'chǎn',
-    0x2810A: 'qiè',
-    0x2810B: 'lòu',
-    0x2810C: 'dié,xiè',
-    0x2810D: 'cuī',
-    0x28110: 'jǐ',
-    0x28113: 'cháo',
-    0x28114: 'shuàn',
-    0x28115: 'zú',
-    0x28117: 'kāng',
-    0x2811A: 'qiāng',
-    0x2811B: 'lí',
-    0x2812E: 'shuāi',
-    0x2812F: 'yù',
-    0x28130: 'zhāng',
-    0x28131: 'lěi',
-    0x28145: 'pó',
-    0x2814A: 'zhé,chè',
-    0x2814B: 'xiào',
-    0x2814D: 'tǎn',
-    0x2814E: 'cuì',
-    0x2814F: 'lán',
-    0x28151: 'xū',
-    0x28152: 'shù,chú',
-    0x28153: 'zhǎ,dá',
-    0x28154: 'cán',
-    0x28157: 'bǐ',
-    0x28158: 'pèng',
-    0x2815D: 'chéng',
-    0x28163: 'qiáo',
-    0x28164: 'jī',
-    0x2816A: 'zhāi',
-    0x2816C: 'lán',
-    0x28181: 'tiǎn,yǎn',
-    0x28182: 'sà',
-    0x28183: 'jīn',
-    0x28184: 'zhù',
-    0x28185: 'duò',
-    0x28187: 'chà',
-    0x28188: 'juàn',
-    0x28189: 'táng',
-    0x2818A: 'bèng',
-    0x2818C: 'fán',
-    0x2818D: 'liè',
-    0x2818E: 'zéi',
-    0x2818F: 'suì',
-    0x28199: 'sè',
-    0x281A7: 'zhì',
-    0x281A8: 'tuí',
-    0x281AA: 'qīng',
-    0x281AC: 'chuò',
-    0x281B0: 'tà,dà',
-    0x281B1: 'bìng',
-    0x281B2: 'wěn',
-    0x281B5: 'pǒ',
-    0x281BD: 'mó',
-    0x281BE: 'cā',
-    0x281C1: 'kuàng',
-    0x281C3: 'cuó,zuān',
-    0x281C4: 'rǎo',
-    0x281C5: 'bào',
-    0x281C6: 'lài',
-    0x281CD: 'niǎn',
-    0x281CE: 'lí',
-    0x281D5: 'jiǎo',
-    0x281D6: 'lú',
-    0x281D7: 'lì',
-    0x281D8: 'lóng',
-    0x281D9: 'guì',
-    0x281DD: 'chǎn',
-    0x281E4: 'xiān',
-    0x281E6: 'chàn',
-    0x281E8: 'xiè',
-    0x281E9: 'zhàn',
-    0x281EF: 'shuāng',
-    0x281FB: 'mǐ',
-    0x281FC: 'luán',
-    0x281FD: 'luò',
-    0x28200: 'diān',
-    0x28208: 'dié',
-    0x2820A: 'wān',
-    0x2820B: 'yuè',
-    0x2820C: 'luán',
-    0x2820E: 'luán',
-    0x28213: 'léng',
-    0x28215: 'wǎi',
-    0x28216: 'dìn',
-    0x28217: 'nèn',
-    0x28218: 'shǎo',
-    0x28219: 'xiè,zhī',
-    0x2821A: 'pí',
-    0x28225: 'máo',
-    0x28227: 'yǐn',
-    0x28229: 'bó',
-    0x2822B: 'zhù',
-    0x2822E: 'chōng',
-    0x28236: 'mǔ',
-    0x28237: 'tuó',
-    0x28239: 'tǒng',
-    0x2823A: 'yé',
-    0x28241: 'huàng',
-    0x28243: 'rèn',
-    0x28245: 'yè',
-    0x2824B: 'tuō',
-    0x28256: 'zuān',
-    0x28257: 'yù',
-    0x2825A: 'ā',
-    0x2825C: 'zhōu',
-    0x2825D: 'wān',
-    0x28261: 'duǒ',
-    0x28262: 'zhòng',
-    0x28263: 'hā',
-    0x28264: 'huáng',
-    0x28265: 'miàn,tǐ',
-    0x28269: 'chūn',
-    0x2826A: 'qiè',
-    0x2826B: 'gōng,qiōng',
-    0x2826C: 'tíng',
-    0x2826D: 'méi',
-    0x28271: 'tàng',
-    0x28274: 'róng',
-    0x28277: 'róng',
-    0x28278: 'qí',
-    0x28279: 'guó',
-    0x2827D: 'xiàng',
-    0x2827E: 'tián',
-    0x28285: 'xiāo',
-    0x28288: 'zhān',
-    0x28289: 'cuì',
-    0x28294: 'lán',
-    0x28298: 'shēn,qū',
-    0x2829A: 'lěi',
-    0x2829B: 'lì',
-    0x2829D: 'chān',
-    0x2829E: 'niè',
-    0x2829F: 'luán',
-    0x282A1: 'tīng',
-    0x282A2: 'huì,sháo',
-    0x282A7: 'gōng',
-    0x282B0: 'qì',
-    0x282B1: 'yú',
-    0x282B3: 'xīn',
-    0x282B8: 'yuè',
-    0x282B9: 'bā',
-    0x282BA: 'dài',
-    0x282BB: 'jī',
-    0x282BC: 'xuàn',
-    0x282BF: 'jué',
-    0x282C0: 'niǔ',
-    0x282C8: 'dù',
-    0x282C9: 'jí',
-    0x282D0: 'pā',
-    0x282D1: 'gǒng',
-    0x282D2: 'bèn',
-    0x282D4: 'kēng,jú',
-    0x282D5: 'yàng,ǎng',
-    0x282D6: 'liǔ',
-    0x282D7: 'ní',
-    0x282D8: 'zhà',
-    0x282D9: 'yìn',
-    0x282DA: 'niǎn,ruǎn',
-    0x282DB: 'pào',
-    0x282DD: 'gōng',
-    0x282DE: 'bù',
-    0x282DF: 'hé',
-    0x282E0: 'rǒng',
-    0x282E1: 'guì',
-    0x282E5: 'bì',
-    0x282E6: 'xī',
-    0x282E7: 'jú',
-    0x282E8: 'hún',
-    0x282E9: 'bì,fú',
-    0x282EB: 'tiāo',
-    0x282EC: 'zhěng,chèng',
-    0x282EE: 'hōng,chūn',
-    0x282EF: 'yì',
-    0x282F0: 'cì',
-    0x282F2: 'bìng',
-    0x282F7: 'gōng',
-    0x282FA: 'fá',
-    0x282FD: 'yáng',
-    0x282FE: 'xǔ',
-    0x28301: 'hōng',
-    0x28304: 'zàng',
-    0x28305: 'chái',
-    0x28306: 'hóng',
-    0x28308: 'tián',
-    0x2830C: 'zhī',
-    0x2830D: 'xīng',
-    0x2830E: 'xú',
-    0x28311: 'zhèn',
-    0x28314: 'wǎn,wàn',
-    0x28318: 'jùn',
-    0x2831D: 'wò,huò',
-    0x28320: 'lù',
-    0x28322: 'zhēng',
-    0x28323: 'rǒng',
-    0x28324: 'chéng,chèng',
-    0x28325: 'fú',
-    0x28327: 'è',
-    0x28328: 'tāo',
-    0x28329: 'táng',
-    0x2832B: 'juān',
-    0x2832C: 'chào',
-    0x2832D: 'tà',
-    0x2832E: 'dǐ',
-    0x28330: 'zōng',
-    0x28333: 'kēng',
-    0x28334: 'tuī',
-    0x28336: 'kēng',
-    0x28345: 'rǒng',
-    0x28346: 'yūn',
-    0x28347: 'hé',
-    0x28348: 'zǒng',
-    0x28349: 'cōng,zǒng',
-    0x2834A: 'qiū',
-    0x2834E: 'mù',
-    0x2834F: 'duó',
-    0x28350: 'xǔ',
-    0x28351: 'kēng',
-    0x28352: 'xiàn,jiàn',
-    0x2835B: 'dú',
-    0x2835C: 'kǎn',
-    0x2835E: 'yīng',
-    0x28362: 'zī',
-    0x28367: 'huáng',
-    0x28369: 'péng',
-    0x2836B: 'lì',
-    0x2836D: 'bó,pò',
-    0x2836E: 'gé,lì',
-    0x2836F: 'jú',
-    0x28370: 'kē',
-    0x28372: 'hú,gǔn',
-    0x28373: 'yáo',
-    0x28374: 'táng',
-    0x28376: 'qióng',
-    0x28377: 'rǒng',
-    0x28378: 'liǔ',
-    0x28379: 'huì',
-    0x2837A: 'jī',
-    0x28389: 'zhì',
-    0x2838B: 'táng,chēng',
-    0x2838C: 'zhǐ',
-    0x2838D: 'kāng,liáng',
-    0x28394: 'yàng',
-    0x28396: 'tǎng,chǎng',
-    0x28397: 'hōng',
-    0x2839B: 'liáng',
-    0x2839D: 'cáo',
-    0x283A1: 'nǎi',
-    0x283A2: 'zǒng',
-    0x283A4: 'dèng',
-    0x283A6: 'jiāo',
-    0x283A7: 'péng',
-    0x283A9: 'guāng',
-    0x283AA: 'ér',
-    0x283AB: 'jiàn',
-    0x283AC: 'jiào',
-    0x283AD: 'nuó',
-    0x283AE: 'zǎo',
-    0x283B3: 'péng',
-    0x283B4: 'dāng',
-    0x283B6: 'qú',
-    0x283B7: 'lián',
-    0x283B8: 'mù',
-    0x283B9: 'lǎn',
-    0x283BE: 'fén',
-    0x283C2: 'hún,xuān',
-    0x283C6: 'kuāng',
-    0x283C8: 'yǐn',
-    0x283C9: 'shuàn',
-    0x283CA: 'jiàn',
-    0x283D2: 'luò,léi',
-    0x283D4: 'lù,dú',
-    0x283DA: 'gé',
-    0x283DB: 'rǎng,niǎn',
-    0x283DE: 'pín',
-    0x283E0: 'lóng',
-    0x283E4: 'zhěn',
-    0x283E5: 'xiàn',
-    0x283E8: 'lìn',
-    0x283E9: 'lián',
-    0x283EA: 'shān',
-    0x283EB: 'bó',
-    0x283EC: 'lì',
-    0x283F3: 'xié',
-    0x283F4: 'gé',
-    0x283F5: 'mǐn',
-    0x283F6: 'lián',
-    0x283F9: 'jué',
-    0x283FA: 'zhōu',
-    0x283FF: 'kē',
-    0x28401: 'dié',
-    0x28403: 'zhé',
-    0x28405: 'shū',
-    0x28406: 'jī',
-    0x28407: 'lóng',
-    0x28408: 'guāng',
-    0x28409: 'zǎo',
-    0x2840A: 'xiàn',
-    0x2840B: 'qiān',
-    0x2840D: 'shēn',
-    0x28410: 'yǐn',
-    0x28411: 'jiè',
-    0x28414: 'shēn',
-    0x28415: 'shēn,cí',
-    0x28416: 'sǎ',
-    0x2841B: 'xì',
-    0x28421: 'kù',
-    0x28423: 'qú',
-    0x28425: 'gé',
-    0x28426: 'bàn',
-    0x28428: 'bì',
-    0x28429: 'qiān',
-    0x28430: 'bīn',
-    0x28431: 'bàn',
-    0x28433: 'zuò',
-    0x28434: 'pì',
-    0x28436: 'huò',
-    0x2843E: 'bàn,biàn',
-    0x2844A: 'nóng',
-    0x2844C: 'chén',
-    0x2844E: 'pēng',
-    0x28451: 'fǔ',
-    0x28452: 'tú',
-    0x2845C: 'pǐ',
-    0x2845D: 'pò',
-    0x28460: 'chǐ',
-    0x28463: 'xuè',
-    0x28464: 'qì',
-    0x28465: 'wù',
-    0x28468: 'zhì',
-    0x28469: 'dì',
-    0x2846A: 'cōng',
-    0x2846B: 'yóu',
-    0x28479: 'cōng',
-    0x2847C: 'dì',
-    0x2847D: 'zhuó',
-    0x2847F: 'zǒu',
-    0x28480: 'cóng',
-    0x28483: 'pàn',
-    0x28484: 'yǎn',
-    0x28485: 'qì',
-    0x28486: 'rǒng',
-    0x28487: 'jiá',
-    0x28489: 'zhì,zhuì,suì',
-    0x2848A: 'qiú',
-    0x2848B: 'yuè',
-    0x2848D: 'shì',
-    0x28491: 'háo',
-    0x28499: 'tuō,hòu',
-    0x2849C: 'bié',
-    0x2849E: 'kàn',
-    0x284A2: 'chuò',
-    0x284A4: 'cǐ',
-    0x284A6: 'yǐn',
-    0x284A7: 'shì',
-    0x284A8: 'hài',
-    0x284A9: 'ruǎn',
-    0x284AB: 'yáng,nì',
-    0x284AC: 'chī',
-    0x284AE: 'cī',
-    0x284B1: 'gōng',
-    0x284B2: 'mí,xuè',
-    0x284B4: 'jǐ',
-    0x284BC: 'gèn',
-    0x284BD: 'zào,suō',
-    0x284C1: 'běng',
-    0x284C7: 'xǐn',
-    0x284C8: 'kuò',
-    0x284CA: 'dié',
-    0x284CD: 'tíng',
-    0x284DA: 'shuì',
-    0x284DE: 'dài',
-    0x284E6: 'lǐ',
-    0x284E8: 'yǒng',
-    0x284E9: 'jiāo',
-    0x284EC: 'tá',
-    0x284ED: 'qǔ,còu',
-    0x284EE: 'yín',
-    0x284EF: 'yuān',
-    0x284F0: 'jié',
-    0x284F2: 'qiān',
-    0x284F3: 'yāo',
-    0x284F4: 'yà',
-    0x284F7: 'qīng',
-    0x284FF: 'péi',
-    0x28517: 'jiā',
-    0x28519: 'tòu',
-    0x2851B: 'tī',
-    0x28521: 'dùn,tún,chuàn,chuán',
-    0x28522: 'chǎn',
-    0x28523: 'jiā,jià',
-    0x28524: 'chì',
-    0x28525: 'jiān,jīn',
-    0x28526: 'shù',
-    0x2852F: 'tà',
-    0x28555: 'zhī',
-    0x28557: 'yuán',
-    0x2855A: 'hū',
-    0x2855C: 'liè',
-    0x28560: 'zé',
-    0x28562: 'chù',
-    0x28566: 'qiù',
-    0x28567: 'bēng',
-    0x28579: 'huán',
-    0x2857A: 'kuā',
-    0x2857B: 'shēng',
-    0x2857D: 'jié',
-    0x2857F: 'wǎng',
-    0x28583: 'hū',
-    0x2858A: 'zé,jī',
-    0x2858B: 'zǎn,zhì',
-    0x2858C: 'yàng',
-    0x2858E: 'chǐ',
-    0x2858F: 'jiù',
-    0x2859A: 'liáo',
-    0x2859B: 'yū',
-    0x285A0: 'biǎn,biàn',
-    0x285A2: 'kuáng',
-    0x285AC: 'chòu',
-    0x285AD: 'yá',
-    0x285AE: 'zhuó',
-    0x285B0: 'qiè',
-    0x285B1: 'xiàn',
-    0x285B3: 'yuān',
-    0x285B4: 'wǔ',
-    0x285B5: 'jiǎo',
-    0x285B6: 'xiàng',
-    0x285B7: 'shà',
-    0x285B9: 'zhì',
-    0x285BC: 'chòng',
-    0x285BE: 'biān',
-    0x285BF: 'wēi',
-    0x285D3: 'dào',
-    0x285DD: 'yù,jú',
-    0x285DE: 'tuí',
-    0x285E1: 'chào',
-    0x285E5: 'huì',
-    0x285E6: 'qiǎn',
-    0x285E8: 'wěi',
-    0x285F0: 'yóu',
-    0x285FC: 'dì,dài',
-    0x285FE: 'dà',
-    0x28601: 'yóu',
-    0x28602: 'jiù',
-    0x28603: 'tuí',
-    0x28604: 'zǎn',
-    0x28607: 'huì',
-    0x28609: 'shà',
-    0x2860C: 'huò',
-    0x28614: 'yáo',
-    0x28619: 'xiàn',
-    0x2861E: 'xiàn',
-    0x2862C: 'dì',
-    0x2862E: 'jiù',
-    0x28632: 'huì',
-    0x28634: 'kào',
-    0x28635: 'yóu',
-    0x28638: 'lì',
-    0x2863C: 'chuán',
-    0x2863E: 'chí',
-    0x28640: 'huò',
-    0x28642: 'yóu',
-    0x28644: 'yuè',
-    0x2864E: 'tà',
-    0x2864F: 'zàn',
-    0x28653: 'niè',
-    0x28654: 'zhù',
-    0x28661: 'xiǎn',
-    0x28669: 'shí',
-    0x2866B: 'kǒu',
-    0x2866C: 'qǐ',
-    0x2866D: 'tǔ',
-    0x2866E: 'fán',
-    0x2866F: 'cūn',
-    0x28672: 'tún,cūn',
-    0x28673: 'chā',
-    0x28674: 'cái,zài',
-    0x28675: 'xiàng',
-    0x28676: 'pèi',
-    0x28677: 'jǐng',
-    0x28678: 'qí,zhī',
-    0x28679: 'shǎo',
-    0x2867A: 'niǔ',
-    0x2867B: 'nà',
-    0x2867D: 'qín',
-    0x2868D: 'bì,bèi',
-    0x28693: 'bì,fèi,fú',
-    0x28694: 'bāo',
-    0x28695: 'biàn',
-    0x28696: 'zī',
-    0x28697: 'nà',
-    0x28698: 'wèi',
-    0x28699: 'háo',
-    0x286A1: 'jǐn',
-    0x286A3: 'zhèng',
-    0x286A7: 'qié',
-    0x286AE: 'hào',
-    0x286AF: 'tóng',
-    0x286B0: 'zǎo',
-    0x286B1: 'shèng',
-    0x286B2: 'cún',
-    0x286B3: 'huāng',
-    0x286B4: 'rú',
-    0x286B5: 'zài',
-    0x286B6: 'nián',
-    0x286BE: 'xiān',
-    0x286C8: 'quán',
-    0x286C9: 'jì',
-    0x286CA: 'yín',
-    0x286CB: 'lǐ',
-    0x286CC: 'máng',
-    0x286CD: 'shào',
-    0x286CE: 'hàn',
-    0x286CF: 'cuò',
-    0x286D0: 'jùn',
-    0x286D1: 'jì',
-    0x286D2: 'bù',
-    0x286D3: 'lòng',
-    0x286D4: 'fǒu',
-    0x286D5: 'yóu',
-    0x286D6: 'kuài',
-    0x286DC: 'xiàng',
-    0x286E1: 'yún',
-    0x286E3: 'qín',
-    0x286E4: 'huí',
-    0x286E5: 'pú',
-    0x286EB: 'lí',
-    0x286EC: 'péi',
-    0x286ED: 'shū,shè',
-    0x286EE: 'jū',
-    0x286EF: 'yí',
-    0x286F0: 'zhēng',
-    0x286F1: 'chóng',
-    0x286F3: 'xí,jí',
-    0x286F5: 'hǔ',
-    0x286F6: 'róu,shòu',
-    0x2870C: 'huàn',
-    0x2870D: 'qiào',
-    0x2870E: 'zhī',
-    0x2870F: 'yíng',
-    0x28710: 'xǐ',
-    0x28711: 'qiāo',
-    0x28712: 'jì',
-    0x28713: 'zhēng',
-    0x28714: 'huáng',
-    0x28716: 'yú',
-    0x28717: 'zōu',
-    0x28718: 'méi',
-    0x2871C: 'shěng',
-    0x28729: 'quán',
-    0x28730: 'jiāng',
-    0x28731: 'hé',
-    0x28733: 'tóng',
-    0x28734: 'hé',
-    0x28735: 'wēn',
-    0x28736: 'yì',
-    0x28737: 'páng',
-    0x2873A: 'wēng',
-    0x2873B: 'qián',
-    0x2873C: 'lì',
-    0x2873D: 'yí',
-    0x2873E: 'chuàng',
-    0x2873F: 'xù',
-    0x28740: 'wěi',
-    0x28746: 'gē',
-    0x28748: 'yǔ',
-    0x2874B: 'zhài',
-    0x2874C: 'gān',
-    0x2874D: 'qiān',
-    0x2874E: 'kāng',
-    0x2874F: 'lí',
-    0x28750: 'shēn',
-    0x28751: 'guàn',
-    0x28753: 'piáo',
-    0x28756: 'lí',
-    0x28758: 'hǔ',
-    0x2875B: 'tú',
-    0x2875C: 'shùn',
-    0x2875E: 'hù',
-    0x2875F: 'lí',
-    0x28762: 'lòu',
-    0x28766: 'dàng',
-    0x28768: 'zuò',
-    0x28769: 'shān',
-    0x2876B: 'shè,xì',
-    0x2876D: 'féng',
-    0x2876E: 'jù,zōu',
-    0x2876F: 'tóng',
-    0x28770: 'jiǎo',
-    0x28771: 'qiáo',
-    0x28772: 'gāo,hào',
-    0x28773: 'zī',
-    0x28774: 'huáng',
-    0x28775: 'shān',
-    0x28778: 'tán',
-    0x2878C: 'tuō',
-    0x2878E: 'lìng',
-    0x28790: 'chéng',
-    0x28791: 'wèng',
-    0x28792: 'zuó',
-    0x28793: 'yù',
-    0x28795: 'zhú,chù',
-    0x28797: 'qún',
-    0x28798: 'xǐ',
-    0x28799: 'qú',
-    0x2879B: 'gé',
-    0x287A2: 'qī',
-    0x287A3: 'xū',
-    0x287A8: 'gài',
-    0x287A9: 'què',
-    0x287AA: 'chóu,shòu',
-    0x287AB: 'méng',
-    0x287B2: 'shēn',
-    0x287B3: 'qú',
-    0x287B6: 'qiāo',
-    0x287B7: 'cán',
-    0x287BA: 'lì',
-    0x287BC: 'wàn',
-    0x287BD: 'léi',
-    0x287BE: 'xīng',
-    0x287BF: 'láng',
-    0x287C2: 'shì',
-    0x287C3: 'zhēng',
-    0x287C4: 'fán',
-    0x287CA: 'zhì',
-    0x287CF: 'yín',
-    0x287D1: 'lì',
-    0x287D6: 'mó',
-    0x287D7: 'wěi',
-    0x287D9: 'yīng',
-    0x287DA: 'ráng',
-    0x287E0: 'quān,què,jué',
-    0x287E5: 'luǒ',
-    0x287F2: 'dài',
-    0x287F4: 'yìn',
-    0x287F5: 'bǐ',
-    0x287F6: 'gē',
-    0x287F8: 'wèn',
-    0x287F9: 'yǎn',
-    0x287FA: 'miǎn',
-    0x287FC: 'gǎng',
-    0x287FD: 'qiú',
-    0x287FE: 'zhī',
-    0x2880B: 'gū',
-    0x2880C: 'tóng',
-    0x2880E: 'líng',
-    0x2880F: 'tí',
-    0x28810: 'cí',
-    0x28811: 'yí,tuó',
-    0x28812: 'fàn',
-    0x28813: 'pō',
-    0x28814: 'bì',
-    0x28816: 'bào',
-    0x2881F: 'pēng',
-    0x28821: 'suān',
-    0x28824: 'sōng,nóng',
-    0x28825: 'wéi',
-    0x28826: 'xiáo',
-    0x2882C: 'hào',
-    0x2882D: 'yǎn',
-    0x28836: 'yí',
-    0x28837: 'zāo',
-    0x28838: 'yǐng',
-    0x28839: 'nǎn',
-    0x2883F: 'zā',
-    0x28841: 'tiǎn',
-    0x28842: 'xī',
-    0x28843: 'jiào',
-    0x28844: 'yán',
-    0x2884C: 'néi',
-    0x2884D: 'tǎn',
-    0x2884E: 'yàn',
-    0x2884F: 'tiǎn',
-    0x28850: 'zhì',
-    0x28851: 'chōu,chóu',
-    0x28852: 'táo',
-    0x28857: 'zhà',
-    0x2885E: 'miǎn',
-    0x28861: 'wǔ',
-    0x28862: 'yǐn',
-    0x28863: 'yàn',
-    0x28864: 'lǎo',
-    0x28869: 'pō',
-    0x2886B: 'hùn',
-    0x2886C: 'hǎi',
-    0x2886D: 'mú',
-    0x2886E: 'cōng',
-    0x28871: 'kù,dǐng',
-    0x28872: 'chōu',
-    0x28874: 'yǒu',
-    0x28878: 'zhuó',
-    0x2887B: 'sōu',
-    0x28882: 'yìn',
-    0x28885: 'zuì',
-    0x28886: 'sāng',
-    0x28887: 'liù',
-    0x28888: 'hàn',
-    0x28889: 'wèi',
-    0x2888A: 'méng',
-    0x2888B: 'hú',
-    0x2888C: 'lì',
-    0x2888E: 'mì,yīn',
-    0x28890: 'bāng',
-    0x28891: 'jiǎn',
-    0x2889C: 'què',
-    0x288A0: 'méng',
-    0x288A2: 'mú',
-    0x288A3: 'hǒng',
-    0x288A4: 'hù',
-    0x288A5: 'mí',
-    0x288A6: 'shài,zhà',
-    0x288A9: 'shāng',
-    0x288AA: 'chào',
-    0x288AC: 'zhuó,tú',
-    0x288AE: 'zhī',
-    0x288AF: 'niàn',
-    0x288B5: 'jì',
-    0x288B8: 'kē',
-    0x288B9: 'zhēng',
-    0x288BF: 'dān',
-    0x288C0: 'liǎo',
-    0x288C1: 'zhǎn',
-    0x288C2: 'gǒng',
-    0x288C3: 'láo,lào',
-    0x288C4: 'huā',
-    0x288C5: 'chuài',
-    0x288C7: 'jiǎn',
-    0x288C8: 'kuì',
-    0x288CD: 'shē',
-    0x288D4: 'chěn',
-    0x288D5: 'tǎn',
-    0x288D7: 'hú',
-    0x288D8: 'méng',
-    0x288D9: 'pào',
-    0x288DA: 'zhǎn',
-    0x288DB: 'cháng',
-    0x288DD: 'gǎn,jiǎn',
-    0x288E0: 'yì',
-    0x288E2: 'suì',
-    0x288E6: 'xù',
-    0x288E7: 'jì',
-    0x288E8: 'làn',
-    0x288EC: 'yí',
-    0x288EF: 'mì',
-    0x288F1: 'miè',
-    0x288F5: 'cuán',
-    0x288F8: 'lǎn',
-    0x288FB: 'yān,yǎn',
-    0x288FE: 'mí',
-    0x28902: 'yǒng',
-    0x28903: 'cáng,zā',
-    0x28904: 'jiǎn',
-    0x28907: 'sōu,zāo',
-    0x2890E: 'yán',
-    0x28911: 'juàn',
-    0x28915: 'è',
-    0x28918: 'fèn',
-    0x2891A: 'fèn',
-    0x28921: 'guàng',
-    0x28922: 'mái',
-    0x28924: 'liě',
-    0x28929: 'chōng',
-    0x2892B: 'lí',
-    0x28931: 'zhí',
-    0x28934: 'xiè',
-    0x28937: 'chóu',
-    0x28939: 'jí',
-    0x2893D: 'pī',
-    0x28942: 'jié',
-    0x28947: 'zhǒu,zhù',
-    0x2894D: 'xiōng',
-    0x28951: 'kuàng,gǒng',
-    0x28959: 'jǐng',
-    0x2895B: 'hù',
-    0x2895E: 'qián',
-    0x28963: 'cén',
-    0x28966: 'qí',
-    0x28967: 'wǎn,fàn,biān',
-    0x28968: 'máo',
-    0x2896A: 'dǒu',
-    0x28974: 'kǒu',
-    0x28976: 'dài',
-    0x28978: 'náo',
-    0x2897A: 'hóng',
-    0x28982: 'lǎi',
-    0x28983: 'duǒ,duò',
-    0x28984: 'qiān',
-    0x28986: 'yín',
-    0x28996: 'lòu',
-    0x28997: 'huī',
-    0x2899B: 'fù',
-    0x2899C: 'máo',
-    0x2899E: 'zhōu',
-    0x289A1: 'yóng,yáng',
-    0x289AD: 'láo',
-    0x289AE: 'jí',
-    0x289AF: 'yì',
-    0x289B0: 'liú',
-    0x289B1: 'cōng',
-    0x289B3: 'nǎn',
-    0x289D0: 'tūn',
-    0x289D1: 'xiàng',
-    0x289D5: 'biàn',
-    0x289D6: 'chuáng',
-    0x289D7: 'wù',
-    0x289D9: 'jū',
-    0x289E5: 'xiē',
-    0x289E6: 'pī',
-    0x289E7: 'zhuó',
-    0x289E8: 'ruì,zhuì',
-    0x289EA: 'sào',
-    0x289EB: 'zì',
-    0x289ED: 'zhèng',
-    0x289F0: 'zú',
-    0x289F1: 'qū',
-    0x289F3: 'chì',
-    0x289F5: 'zhì',
-    0x28A17: 'quàn',
-    0x28A18: 'qiān',
-    0x28A19: 'yā',
-    0x28A1A: 'chào',
-    0x28A1B: 'hé',
-    0x28A1C: 'rǔ',
-    0x28A20: 'jū',
-    0x28A21: 'wù',
-    0x28A2C: 'chì',
-    0x28A2D: 'kuàng,gǒng',
-    0x28A2F: 'còu,zhòu',
-    0x28A30: 'ruàn',
-    0x28A31: 'kuò',
-    0x28A32: 'chí',
-    0x28A33: 'zú',
-    0x28A34: 'jiāo',
-    0x28A36: 'yú',
-    0x28A37: 'tú',
-    0x28A38: 'méng',
-    0x28A39: 'dā',
-    0x28A3A: 'shuò,xuē',
-    0x28A65: 'fēng',
-    0x28A66: 'gǒu',
-    0x28A67: 'dōng',
-    0x28A68: 'chǎ',
-    0x28A69: 'mào',
-    0x28A6A: 'chǎn',
-    0x28A6B: 'biān',
-    0x28A6C: 'yù',
-    0x28A6F: 'wán',
-    0x28A70: 'zú',
-    0x28A72: 'zī',
-    0x28A74: 'chuān',
-    0x28A75: 'wǎn',
-    0x28A76: 'wā',
-    0x28A78: 'quān,juān',
-    0x28A7B: 'wǎn',
-    0x28A7D: 'xià',
-    0x28A84: 'yìng',
-    0x28A85: 'jiàn',
-    0x28A88: 'wěi',
-    0x28A89: 'tí',
-    0x28A8A: 'sāo',
-    0x28A8C: 'qí',
-    0x28A8D: 'shā',
-    0x28A8E: 'yù',
-    0x28A8F: 'jí',
-    0x28A90: 'dòu,tōu',
-    0x28A91: 'chǎn',
-    0x28A92: 'tuán',
-    0x28A95: 'liú',
-    0x28A97: 'zhuì',
-    0x28AB3: 'ruàn',
-    0x28AB6: 'yàn',
-    0x28AB7: 'gǔ',
-    0x28AB9: 'lì',
-    0x28ABA: 'chā',
-    0x28ABE: 'dì',
-    0x28ABF: 'liú',
-    0x28AC0: 'zhǎn',
-    0x28AC1: 'pō',
-    0x28AD2: 'lòu',
-    0x28AD4: 'zhì,xiè',
-    0x28B01: 'lián',
-    0x28B05: 'luǒ',
-    0x28B0D: 'duò,duì',
-    0x28B10: 'jué',
-    0x28B11: 'lì',
-    0x28B12: 'lán',
-    0x28B14: 'ruàn',
-    0x28B15: 'gū',
-    0x28B16: 'chán',
-    0x28B17: 'xū',
-    0x28B1A: 'zhǐ',
-    0x28B41: 'xuè',
-    0x28B42: 'bō',
-    0x28B43: 'chēng',
-    0x28B45: 'zhù',
-    0x28B46: 'hēi',
-    0x28B49: 'bān',
-    0x28B53: 'dié',
-    0x28B56: 'zhǎn',
-    0x28B57: 'guó',
-    0x28B5A: 'biāo',
-    0x28B5B: 'là,gě',
-    0x28B7A: 'jīn',
-    0x28B82: 'gǎi',
-    0x28B92: 'mèng',
-    0x28B94: 'yù',
-    0x28BAA: 'xǐ',
-    0x28BAC: 'piāo',
-    0x28BAD: 'sī',
-    0x28BB4: 'dèng',
-    0x28BB8: 'chuō',
-    0x28BB9: 'dí',
-    0x28BBA: 'jī',
-    0x28BBB: 'chán',
-    0x28BBF: 'zhuó',
-    0x28BD3: 'cài',
-    0x28BDE: 'jiàng',
-    0x28BF2: 'tóu',
-    0x28BFD: 'lí',
-    0x28C02: 'qiàn',
-    0x28C06: 'chuō',
-    0x28C0F: 'tà',
-    0x28C11: 'diào',
-    0x28C13: 'jiǎn',
-    0x28C1B: 'zhǐ',
-    0x28C1C: 'jué',
-    0x28C1E: 'mó',
-    0x28C20: 'luó',
-    0x28C26: 'bǎo',
-    0x28C2D: 'zuǎn',
-    0x28C35: 'zhē',
-    0x28C38: 'yú',
-    0x28C3B: 'bǎo',
-    0x28C3E: 'mǎ',
-    0x28C3F: 'xì',
-    0x28C40: 'hù',
-    0x28C41: 'yì',
-    0x28C42: 'é',
-    0x28C43: 'gū',
-    0x28C44: 'tú',
-    0x28C45: 'zhēn',
-    0x28C47: 'qiú',
-    0x28C48: 'sù',
-    0x28C49: 'liàng',
-    0x28C4A: 'qū',
-    0x28C4B: 'líng',
-    0x28C4C: 'guàn',
-    0x28C4D: 'láng',
-    0x28C4E: 'tōu',
-    0x28C4F: 'dā',
-    0x28C50: 'lòu',
-    0x28C51: 'huáng',
-    0x28C52: 'shòu',
-    0x28C53: 'jiāo',
-    0x28C54: 'zūn',
-    0x28C55: 'gǎi',
-    0x28C56: 'wéi',
-    0x28C59: 'kūn',
-    0x28C5A: 'duàn',
-    0x28C5B: 'sōng',
-    0x28C5C: 'qí',
-    0x28C5D: 'yǎng',
-    0x28C61: 'shì',
-    0x28C63: 'gǎi',
-    0x28C66: 'dào',
-    0x28C67: 'yǎo,ǎo',
-    0x28C6B: 'qián',
-    0x28C6D: 'shāo',
-    0x28C6E: 'cháng',
-    0x28C6F: 'miǔ',
-    0x28C71: 'mó',
-    0x28C75: 'nǎo',
-    0x28C78: 'cōng',
-    0x28C7A: 'niè',
-    0x28C7B: 'zhāo',
-    0x28C7C: 'cén',
-    0x28C7F: 'sōng',
-    0x28C80: 'niè',
-    0x28C81: 'cì',
-    0x28C84: 'jùn',
-    0x28C86: 'shāo',
-    0x28C88: 'zhú',
-    0x28C89: 'duǒ,tuǒ,shèng',
-    0x28C8A: 'àn',
-    0x28C8B: 'bī',
-    0x28C8E: 'tì',
-    0x28C90: 'pǐ',
-    0x28C91: 'xiá',
-    0x28C92: 'qiú',
-    0x28C93: 'shěng',
-    0x28C97: 'tāng',
-    0x28C9B: 'mán,mián',
-    0x28C9C: 'piān',
-    0x28C9E: 'tì',
-    0x28C9F: 'róng',
-    0x28CA7: 'cōng',
-    0x28CAA: 'jī',
-    0x28CAB: 'féng',
-    0x28CAC: 'wù',
-    0x28CAD: 'jiào',
-    0x28CAE: 'láo',
-    0x28CAF: 'zēng',
-    0x28CB0: 'péng',
-    0x28CB1: 'cǎn',
-    0x28CB3: 'nóng',
-    0x28CB5: 'chǎn',
-    0x28CBE: 'mán,mián',
-    0x28CBF: 'guì',
-    0x28CC0: 'niào',
-    0x28CC1: 'chōng',
-    0x28CC2: 'chàn',
-    0x28CC6: 'nàng',
-    0x28CC9: 'xiā',
-    0x28CCA: 'jiū',
-    0x28CCB: 'jǐ',
-    0x28CCC: 'zhèn',
-    0x28CD1: 'tǐng',
-    0x28CD4: 'mén',
-    0x28CD5: 'yuè',
-    0x28CD7: 'zhōng',
-    0x28CD8: 'tún',
-    0x28CD9: 'ruì',
-    0x28CDA: 'xiè,fēn',
-    0x28CDB: 'xī',
-    0x28CDD: 'tǐng,rùn',
-    0x28CDE: 'niǔ',
-    0x28CE0: 'wǎng',
-    0x28CE1: 'jiān,guān',
-    0x28CE3: 'fēn',
-    0x28CF2: 'biàn,bì',
-    0x28CF7: 'yí',
-    0x28CFA: 'dié',
-    0x28CFB: 'jī',
-    0x28CFC: 'gǎn',
-    0x28CFF: 'jiān,xì,mǎ',
-    0x28D00: 'jiōng',
-    0x28D06: 'kāi',
-    0x28D0A: 'què,guān',
-    0x28D0C: 'nán',
-    0x28D0D: 'móu',
-    0x28D0E: 'xù',
-    0x28D0F: 'sǒng',
-    0x28D10: 'shèn',
-    0x28D11: 'kuāng',
-    0x28D12: 'què',
-    0x28D13: 'wéi',
-    0x28D17: 'dié',
-    0x28D18: 'nán',
-    0x28D1A: 'ruò',
-    0x28D1B: 'gōng',
-    0x28D1C: 'dòu,yòu',
-    0x28D1E: 'niǎn',
-    0x28D21: 'chāo',
-    0x28D22: 'hé',
-    0x28D23: 'yàn',
-    0x28D29: 'tú',
-    0x28D2A: 'bǔ',
-    0x28D2C: 'hú',
-    0x28D2D: 'yǒng',
-    0x28D2F: 'shǐ',
-    0x28D30: 'chù',
-    0x28D39: 'xiāo',
-    0x28D3A: 'mén',
-    0x28D3B: 'lǐ',
-    0x28D3C: 'tí',
-    0x28D3E: 'jiān',
-    0x28D42: 'zhǐ',
-    0x28D43: 'guā,fǔ,yuè',
-    0x28D44: 'guǎn',
-    0x28D46: 'qì',
-    0x28D48: 'fēi',
-    0x28D49: 'yǔ',
-    0x28D4A: 'zhé',
-    0x28D4B: 'wěi',
-    0x28D4C: 'ě',
-    0x28D4D: 'chān',
-    0x28D4E: 'xī,qí',
-    0x28D50: 'gǔ',
-    0x28D57: 'què',
-    0x28D58: 'huì',
-    0x28D5A: 'xié',
-    0x28D5B: 'yīng',
-    0x28D5D: 'tà',
-    0x28D5E: 'wāi',
-    0x28D5F: 'fú',
-    0x28D60: 'jiè',
-    0x28D61: 'pì',
-    0x28D65: 'shěng',
-    0x28D66: 'yú',
-    0x28D67: 'kuā',
-    0x28D69: 'pì',
-    0x28D6A: 'xié',
-    0x28D6B: 'nüè',
-    0x28D6C: 'xiàn',
-    0x28D6D: 'jiàn',
-    0x28D6E: 'xù',
-    0x28D70: 'bì',
-    0x28D74: 'nán',
-    0x28D76: 'liáng',
-    0x28D78: 'pián',
-    0x28D7C: 'jìng',
-    0x28D80: 'tǎ',
-    0x28D81: 'yàn',
-    0x28D82: 'ài',
-    0x28D85: 'xiāo',
-    0x28D86: 'qiāng',
-    0x28D87: 'wǔ',
-    0x28D88: 'táng',
-    0x28D8A: 'jùn',
-    0x28D90: 'kuò',
-    0x28D97: 'làng',
-    0x28D99: 'něng',
-    0x28D9C: 'dòu,dǒu',
-    0x28D9D: 'shú',
-    0x28D9F: 'jiǎo',
-    0x28DA0: 'niè',
-    0x28DA2: 'yú',
-    0x28DA8: 'cè',
-    0x28DAA: 'jiǎo,liú',
-    0x28DAC: 'huà',
-    0x28DAD: 'wén',
-    0x28DAE: 'yē',
-    0x28DAF: 'é',
-    0x28DB0: 'guāng',
-    0x28DB1: 'huā',
-    0x28DB2: 'jiāo',
-    0x28DBA: 'lèi',
-    0x28DBC: 'shāng',
-    0x28DBD: 'yòng',
-    0x28DBF: 'dēng',
-    0x28DC0: 'guān',
-    0x28DC1: 'niú',
-    0x28DC3: 'suì',
-    0x28DC4: 'xiàng',
-    0x28DC6: 'sà',
-    0x28DC7: 'chāng',
-    0x28DCE: 'rùn',
-    0x28DD0: 'yūn',
-    0x28DD2: 'fēn',
-    0x28DD3: 'jiàn',
-    0x28DD4: 'xù',
-    0x28DD8: 'xì',
-    0x28DD9: 'shú',
-    0x28DE5: 'xié',
-    0x28DE6: 'lì',
-    0x28DE9: 'tóu',
-    0x28DEC: 'mǐ',
-    0x28DED: 'chán',
-    0x28DEE: 'huō',
-    0x28DF1: 'zhuǎn',
-    0x28DF2: 'yuè',
-    0x28DFB: 'lán',
-    0x28DFD: 'yán',
-    0x28DFE: 'dàng',
-    0x28DFF: 'xiàng',
-    0x28E00: 'yuè',
-    0x28E01: 'tǐng',
-    0x28E02: 'bēng',
-    0x28E03: 'sàn',
-    0x28E04: 'xiàn',
-    0x28E05: 'dié',
-    0x28E06: 'pì',
-    0x28E07: 'pián',
-    0x28E09: 'tǎ',
-    0x28E0B: 'jiāo',
-    0x28E0C: 'yē',
-    0x28E0E: 'yuè',
-    0x28E10: 'réng',
-    0x28E11: 'qiǎo',
-    0x28E12: 'qí',
-    0x28E13: 'diāo',
-    0x28E14: 'qí,wéi',
-    0x28E17: 'hàn',
-    0x28E18: 'yuán',
-    0x28E19: 'yóu',
-    0x28E1A: 'jí',
-    0x28E1B: 'gài',
-    0x28E1C: 'hāi',
-    0x28E1D: 'shì',
-    0x28E1F: 'qū',
-    0x28E29: 'wèn',
-    0x28E2C: 'zhèn',
-    0x28E2D: 'pō',
-    0x28E2E: 'yán,yǔn',
-    0x28E2F: 'gū',
-    0x28E30: 'jú',
-    0x28E31: 'tiàn,niǎn',
-    0x28E37: 'è',
-    0x28E3A: 'yā',
-    0x28E3B: 'lìn',
-    0x28E3C: 'bì',
-    0x28E40: 'zǐ',
-    0x28E41: 'hóng',
-    0x28E43: 'duǒ,duò',
-    0x28E45: 'duì',
-    0x28E46: 'xuàn',
-    0x28E48: 'shǎn,yáng',
-    0x28E4A: 'shǎn',
-    0x28E4B: 'yáo',
-    0x28E4C: 'rǎn',
-    0x28E54: 'tuó',
-    0x28E57: 'bīng',
-    0x28E58: 'xù',
-    0x28E59: 'tūn',
-    0x28E5A: 'chéng',
-    0x28E5C: 'dòu',
-    0x28E5D: 'yì,yà',
-    0x28E61: 'chè',
-    0x28E75: 'juǎn',
-    0x28E76: 'jī',
-    0x28E78: 'zhào',
-    0x28E79: 'bēng,bèng',
-    0x28E7B: 'tiǎn',
-    0x28E80: 'pēng',
-    0x28E85: 'fù',
-    0x28E96: 'tuǒ',
-    0x28E98: 'xián',
-    0x28E99: 'nì',
-    0x28E9A: 'lóng',
-    0x28E9D: 'zhuó',
-    0x28E9F: 'zhēng',
-    0x28EA0: 'shǔn',
-    0x28EA1: 'zōng',
-    0x28EA2: 'fēng',
-    0x28EA3: 'duàn',
-    0x28EA4: 'pì',
-    0x28EA5: 'yǎn',
-    0x28EA6: 'sǒu',
-    0x28EA7: 'qiú',
-    0x28EA8: 'è',
-    0x28EA9: 'qián',
-    0x28EAB: 'qiǎn',
-    0x28EAD: 'cā',
-    0x28EAE: 'xùn',
-    0x28EB5: 'zhuì',
-    0x28EB8: 'mǎo',
-    0x28EB9: 'jiǎo',
-    0x28EBF: 'zhǎn',
-    0x28EC0: 'pí,bī',
-    0x28EC1: 'xī',
-    0x28EC2: 'yàn',
-    0x28EC3: 'fèi',
-    0x28EC4: 'niè',
-    0x28EC6: 'zhì',
-    0x28EC8: 'suǒ',
-    0x28ECA: 'yì',
-    0x28ECC: 'lěi',
-    0x28ECD: 'xù',
-    0x28ECF: 'yì',
-    0x28ED2: 'wēi',
-    0x28ED5: 'jī',
-    0x28ED6: 'chēn',
-    0x28ED7: 'dié',
-    0x28EE3: 'yuán',
-    0x28EE5: 'xí',
-    0x28EE7: 'liú',
-    0x28EE8: 'suǒ',
-    0x28EF1: 'bēng',
-    0x28EF2: 'xià',
-    0x28EF3: 'yàn,yān',
-    0x28EF5: 'cuī,zuī,duì',
-    0x28EF7: 'kāng',
-    0x28EFA: 'qīng',
-    0x28EFB: 'lóu',
-    0x28EFC: 'bī',
-    0x28F08: 'zhàn',
-    0x28F09: 'cuàn',
-    0x28F0A: 'wú',
-    0x28F0B: 'xū',
-    0x28F0C: 'chēn',
-    0x28F0D: 'háo',
-    0x28F0E: 'jué',
-    0x28F10: 'chèn',
-    0x28F11: 'chá',
-    0x28F12: 'chǎn',
-    0x28F13: 'zhí',
-    0x28F14: 'xún',
-    0x28F23: 'gé',
-    0x28F24: 'chén',
-    0x28F25: 'yè,gé',
-    0x28F2A: 'chǔ',
-    0x28F2B: 'qú',
-    0x28F2C: 'xiè',
-    0x28F2E: 'zhàn',
-    0x28F2F: 'kěn',
-    0x28F31: 'jué',
-    0x28F3D: 'qú',
-    0x28F3F: 'méng',
-    0x28F40: 'yè',
-    0x28F41: 'zōu,cóng',
-    0x28F42: 'pú',
-    0x28F44: 'shì',
-    0x28F49: 'shǔ',
-    0x28F4A: 'chán',
-    0x28F4D: 'dú',
-    0x28F4F: 'guō',
-    0x28F50: 'lù,yáng',
-    0x28F51: 'yān',
-    0x28F56: 'niǎo',
-    0x28F57: 'bīn,pín',
-    0x28F5F: 'tuí',
-    0x28F66: 'nì',
-    0x28F67: 'huān',
-    0x28F68: 'qián',
-    0x28F6F: 'xià',
-    0x28F72: 'líng',
-    0x28F77: 'lián',
-    0x28F79: 'yì,lì',
-    0x28F7B: 'lì',
-    0x28F7C: 'sì',
-    0x28F7F: 'dài',
-    0x28F82: 'wèi',
-    0x28F85: 'cì',
-    0x28F89: 'jiǔ',
-    0x28F8A: 'hóng',
-    0x28F8C: 'yú',
-    0x28F8E: 'kuí',
-    0x28F92: 'háng',
-    0x28F93: 'gē,yì',
-    0x28F94: 'fàng',
-    0x28F97: 'kuí,xié',
-    0x28F9A: 'guī,fū',
-    0x28F9B: 'chǐ,qí',
-    0x28F9E: 'jiǔ',
-    0x28FA1: 'suī,huǎng',
-    0x28FA4: 'dié',
-    0x28FAC: 'suǐ',
-    0x28FB0: 'qín',
-    0x28FB4: 'guī',
-    0x28FBB: 'zhuī',
-    0x28FBE: 'tiào',
-    0x28FC1: 'yuè',
-    0x28FC7: 'zuǐ',
-    0x28FCF: 'wú',
-    0x28FD0: 'cuǐ',
-    0x28FDB: 'zhì,xī',
-    0x28FE0: 'shuì',
-    0x28FE2: 'dōng',
-    0x28FED: 'wéi',
-    0x28FFF: 'chǒng',
-    0x2900B: 'rún',
-    0x29016: 'jí',
-    0x2901C: 'diāo',
-    0x2901E: 'cāng',
-    0x29020: 'kòu,gǔ',
-    0x29023: 'wéi',
-    0x29027: 'cán',
-    0x2902A: 'má',
-    0x2902B: 'òu',
-    0x29032: 'sǎn',
-    0x29036: 'wéi,huī,mí',
-    0x2903C: 'sǎn',
-    0x2903F: 'jīn',
-    0x2904C: 'wéi',
-    0x2905E: 'cài',
-    0x2905F: 'lí',
-    0x2906F: 'yuè',
-    0x29074: 'yūn',
-    0x29077: 'chēng',
-    0x2907A: 'shān',
-    0x29082: 'hū',
-    0x29083: 'shài',
-    0x29084: 'tún',
-    0x29086: 'fǒu,fù',
-    0x29088: 'qìn',
-    0x29089: 'xū,chēn',
-    0x2908D: 'chuān',
-    0x2908E: 'fù',
-    0x29092: 'yì,ài',
-    0x29093: 'dōng',
-    0x29094: 'fú',
-    0x29095: 'fú',
-    0x29096: 'zé',
-    0x29097: 'pù',
-    0x29099: 'líng',
-    0x2909D: 'shài,yīng',
-    0x2909E: 'pào',
-    0x290A2: 'yín,ái',
-    0x290A3: 'luò',
-    0x290A4: 'huà',
-    0x290A5: 'yìn',
-    0x290A6: 'bèng',
-    0x290A7: 'yū',
-    0x290A8: 'shè',
-    0x290AA: 'xiè',
-    0x290AB: 'chǔ',
-    0x290B4: 'shè',
-    0x290B5: 'diàn',
-    0x290B9: 'yì',
-    0x290BB: 'chè',
-    0x290BC: 'gěng',
-    0x290BD: 'lóng',
-    0x290BE: 'píng',
-    0x290BF: 'yǔn',
-    0x290C0: 'yàn',
-    0x290C1: 'mò',
-    0x290C3: 'suī',
-    0x290CB: 'jìng',
-    0x290CD: 'sòng',
-    0x290CE: 'páng',
-    0x290D0: 'yá',
-    0x290D1: 'sè',
-    0x290D2: 'duǒ',
-    0x290D5: 'chuáng',
-    0x290D6: 'xiè',
-    0x290D8: 'tuán',
-    0x290D9: 'gōng',
-    0x290DA: 'xuàn',
-    0x290DC: 'lā',
-    0x290DE: 'líng',
-    0x290E0: 'dài',
-    0x290E1: 'zhá',
-    0x290EC: 'yīn',
-    0x290ED: 'sōng',
-    0x290EF: 'yǔ',
-    0x290F0: 'tuó',
-    0x290F1: 'tuó',
-    0x290F4: 'bà',
-    0x290F5: 'rǎn',
-    0x290F6: 'bó',
-    0x290F7: 'dài',
-    0x290F9: 'zhá,zhǎ',
-    0x290FA: 'hóu',
-    0x290FE: 'huǐ',
-    0x29105: 'lú',
-    0x2910A: 'lìng',
-    0x2910B: 'rú',
-    0x29115: 'dàn',
-    0x29116: 'méng',
-    0x29117: 'xià',
-    0x29118: 'wěng',
-    0x29119: 'hán',
-    0x2911A: 'zī',
-    0x2911B: 'zhèn',
-    0x2911C: 'sè',
-    0x2911D: 'cuó',
-    0x2911E: 'lì',
-    0x29120: 'diān',
-    0x29121: 'lián',
-    0x29122: 'gòu',
-    0x29126: 'péng',
-    0x2912A: 'yīng',
-    0x2912C: 'hòu',
-    0x2912E: 'duì',
-    0x2912F: 'wù',
-    0x29137: 'piào',
-    0x29138: 'hè',
-    0x2913A: 'lóng',
-    0x2913B: 'mò',
-    0x2913C: 'fěi',
-    0x2913D: 'lǚ',
-    0x2913E: 'zé',
-    0x2913F: 'bó',
-    0x29140: 'diàn,zhí',
-    0x29141: 'mǎng',
-    0x29143: 'zhuàng,chóng',
-    0x29144: 'lù',
-    0x29145: 'pāng',
-    0x29146: 'duì',
-    0x29147: 'bù',
-    0x2914C: 'chēn',
-    0x2914D: 'màn',
-    0x29156: 'xī',
-    0x2915D: 'ǎn',
-    0x2915E: 'zhōng,chòng',
-    0x29160: 'nàn',
-    0x29161: 'tuò',
-    0x29162: 'hé',
-    0x29165: 'duì',
-    0x29166: 'wān,dān',
-    0x29167: 'zhōng',
-    0x29168: 'cén,shèn',
-    0x29169: 'lì',
-    0x2916A: 'shuāng',
-    0x2916E: 'cén',
-    0x29170: 'sī',
-    0x29172: 'duì',
-    0x29174: 'hūn',
-    0x2917C: 'jiān,jiàn',
-    0x2917D: 'nóng',
-    0x2917E: 'dàn',
-    0x2917F: 'fù',
-    0x29180: 'huò',
-    0x29181: 'huì,wèi',
-    0x29182: 'cí',
-    0x29184: 'yǒng',
-    0x29185: 'sà',
-    0x29186: 'tíng',
-    0x2918E: 'liù',
-    0x29191: 'suān',
-    0x29192: 'líng',
-    0x29193: 'mán,màn',
-    0x29194: 'diàn',
-    0x29198: 'pāo',
-    0x2919A: 'líng',
-    0x2919D: 'lì',
-    0x2919F: 'nóu',
-    0x291A3: 'liè',
-    0x291A4: 'shǎn',
-    0x291A6: 'fèi',
-    0x291AB: 'shǎn',
-    0x291AE: 'líng',
-    0x291AF: 'zhàn,jiān',
-    0x291B1: 'bīn',
-    0x291B2: 'lí',
-    0x291B5: 'sī,xiàn',
-    0x291B6: 'ráng',
-    0x291B7: 'jiān',
-    0x291B8: 'zhuó',
-    0x291BB: 'líng',
-    0x291BC: 'líng',
-    0x291BD: 'mèng',
-    0x291BF: 'shuāng',
-    0x291C4: 'líng',
-    0x291C7: 'hùn',
-    0x291CE: 'líng',
-    0x291CF: 'jiān',
-    0x291D0: 'qú',
-    0x291D4: 'nóng',
-    0x291D5: 'jìng',
-    0x291D6: 'chēn',
-    0x291DC: 'zhēn,chèng,chēng',
-    0x291DD: 'qìng',
-    0x291DF: 'qìng',
-    0x291E0: 'è,yǎn',
-    0x291E3: 'sè',
-    0x291E9: 'bèi',
-    0x291EB: 'fēi',
-    0x291EE: 'fèi',
-    0x291EF: 'féi',
-    0x291F4: 'fāng',
-    0x291F5: 'kǔ',
-    0x291FA: 'zá',
-    0x291FB: 'huì',
-    0x291FD: 'féi',
-    0x29201: 'duì',
-    0x29206: 'pā',
-    0x29207: 'niǔ',
-    0x29208: 'pàng',
-    0x29209: 'dàn',
-    0x2920A: 'dān,dàn',
-    0x2920B: 'ài',
-    0x2920D: 'tiǎn',
-    0x2920E: 'chǎo',
-    0x2920F: 'ǎo,yǒu',
-    0x29210: 'mèi',
-    0x29211: 'nǎn',
-    0x29214: 'bò',
-    0x29215: 'yù,chì',
-    0x29216: 'xiān,hān',
-    0x29217: 'mài',
-    0x2921A: 'pīng',
-    0x2921C: 'duī',
-    0x2921E: 'dào',
-    0x29221: 'xìng',
-    0x29222: 'nì,nǜ',
-    0x29223: 'hān',
-    0x29224: 'chù',
-    0x29225: 'shuǎ',
-    0x29226: 'mǎn',
-    0x2922C: 'wàn',
-    0x2922D: 'yì',
-    0x2922E: 'diào',
-    0x2922F: 'yān',
-    0x29231: 'wò',
-    0x29232: 'suàn',
-    0x29234: 'ǎn',
-    0x29235: 'lán',
-    0x29236: 'nǎn',
-    0x29238: 'qiǔ',
-    0x29239: 'miàn',
-    0x2923A: 'nuǒ',
-    0x2923B: 'cán',
-    0x2923C: 'cǎn',
-    0x29240: 'làn',
-    0x29241: 'tiǎn',
-    0x29242: 'yè',
-    0x29244: 'niǎn',
-    0x29246: 'shuǎ',
-    0x2924B: 'cí',
-    0x2924D: 'jiǎn',
-    0x29250: 'gàn',
-    0x29254: 'jiàn',
-    0x29255: 'guó',
-    0x29257: 'zhān',
-    0x29259: 'luǒ',
-    0x2925C: 'jī,hàng',
-    0x2925D: 'guì',
-    0x29261: 'jiá',
-    0x29262: 'jǐ',
-    0x29265: 'xuàn',
-    0x29267: 'fēng',
-    0x2926B: 'bì',
-    0x2926C: 'qí,chí',
-    0x2926F: 'yuán',
-    0x29270: 'àng',
-    0x29271: 'dī',
-    0x29274: 'è',
-    0x29275: 'fén',
-    0x29278: 'jù',
-    0x29279: 'nǐ',
-    0x2927A: 'tuó',
-    0x2927C: 'shēn',
-    0x2927D: 'fú',
-    0x2927E: 'xiá',
-    0x2927F: 'qú',
-    0x29280: 'pò',
-    0x29281: 'wǎn',
-    0x29282: 'líng',
-    0x29283: 'mà',
-    0x29284: 'zhòu',
-    0x29285: 'bào',
-    0x29287: 'yù',
-    0x2928C: 'běng',
-    0x2928D: 'mài',
-    0x2928F: 'jiā',
-    0x29291: 'yǎng',
-    0x29293: 'kuǎ,kù',
-    0x29294: 'jiào',
-    0x29296: 'bǐng',
-    0x2929A: 'luò',
-    0x2929B: 'guǐ',
-    0x2929C: 'duò',
-    0x2929D: 'zhì',
-    0x292A1: 'zhèn',
-    0x292A2: 'è',
-    0x292A3: 'zhū',
-    0x292A4: 'bá',
-    0x292A8: 'zhèn',
-    0x292A9: 'fēng,féng',
-    0x292AA: 'dòu',
-    0x292AB: 'niǎn',
-    0x292AC: 'bù',
-    0x292AD: 'duì',
-    0x292AE: 'shā,suō',
-    0x292AF: 'sè',
-    0x292B0: 'bì',
-    0x292B4: 'zhì',
-    0x292B5: 'zhé',
-    0x292B6: 'bù',
-    0x292BA: 'jué',
-    0x292BB: 'xùn',
-    0x292BF: 'xì',
-    0x292C1: 'zhuó',
-    0x292C2: 'bài',
-    0x292C3: 'yáo,táo',
-    0x292C4: 'chǒu',
-    0x292C5: 'tà',
-    0x292C6: 'qiān',
-    0x292C8: 'nào',
-    0x292C9: 'yù',
-    0x292CA: 'è',
-    0x292CB: 'jiān',
-    0x292CC: 'yì',
-    0x292CD: 'xiāo',
-    0x292CF: 'niè',
-    0x292D2: 'bīng',
-    0x292D7: 'guǒ',
-    0x292D8: 'xié',
-    0x292D9: 'diào',
-    0x292DC: 'jū',
-    0x292DD: 'suǒ',
-    0x292DE: 'dié',
-    0x292DF: 'fú,fù',
-    0x292E0: 'miǎn',
-    0x292E1: 'shì',
-    0x292E2: 'xuàn,yùn',
-    0x292E3: 'tí',
-    0x292E4: 'yù',
-    0x292E7: 'xié,kài',
-    0x292E8: 'fú',
-    0x292E9: 'zhì',
-    0x292EA: 'nǐ',
-    0x292EB: 'xuàn',
-    0x292EC: 'yáng',
-    0x292EE: 'fěng,bāng',
-    0x292EF: 'zòng',
-    0x292F0: 'zhòu',
-    0x292F1: 'xuān',
-    0x292F5: 'zhū',
-    0x292F7: 'la',
-    0x292F9: 'yìng',
-    0x292FA: 'gào',
-    0x292FB: 'kuò',
-    0x292FD: 'é',
-    0x292FE: 'wéi,wěi,xuē',
-    0x292FF: 'méi',
-    0x29303: 'huái,guì',
-    0x29304: 'chǒu,zhōu',
-    0x29306: 'suǒ',
-    0x29307: 'tà',
-    0x29308: 'suǒ',
-    0x29309: 'tà',
-    0x2930A: 'xuè',
-    0x2930C: 'gǒng',
-    0x2930D: 'jiǎ',
-    0x2930F: 'bó,fú,bù,fù',
-    0x29310: 'tà',
-    0x29311: 'yuǎn',
-    0x29318: 'tà',
-    0x2931D: 'chuí',
-    0x29320: 'xiōng',
-    0x29321: 'hé,juē',
-    0x29322: 'suō',
-    0x29327: 'mò',
-    0x29328: 'chóng',
-    0x29329: 'suī',
-    0x2932A: 'zé',
-    0x2932B: 'lù',
-    0x2932C: 'zhāng',
-    0x2932D: 'luò',
-    0x2932E: 'xù',
-    0x2932F: 'jiān',
-    0x29330: 'shān',
-    0x29332: 'xù',
-    0x2933E: 'jiǎng',
-    0x29342: 'bào',
-    0x29343: 'mái',
-    0x29345: 'tóng',
-    0x29346: 'xì',
-    0x29349: 'róng',
-    0x2934B: 'shéng',
-    0x2934C: 'zhòu',
-    0x2934E: 'jiān',
-    0x2934F: 'fù',
-    0x29350: 'dèng',
-    0x29353: 'yōng',
-    0x29354: 'jū,qū',
-    0x29356: 'yì',
-    0x29357: 'bāng',
-    0x29359: 'sè',
-    0x2935A: 'suì',
-    0x2935C: 'duó',
-    0x2935D: 'xiè',
-    0x29361: 'huán',
-    0x29365: 'rǔ',
-    0x29366: 'nǐ',
-    0x29367: 'zhòu',
-    0x29368: 'guì',
-    0x2936A: 'luò',
-    0x29372: 'zhī,chàn',
-    0x29373: 'xù',
-    0x29375: 'zhī',
-    0x29377: 'jué',
-    0x29378: 'jū',
-    0x2937B: 'yuán',
-    0x2937C: 'lú',
-    0x2937F: 'bó,fù',
-    0x29382: 'róng',
-    0x29383: 'xiè',
-    0x29389: 'xǐ',
-    0x2938A: 'luó',
-    0x2938E: 'gé',
-    0x29391: 'zuān',
-    0x29392: 'hàn,jiān',
-    0x29394: 'jiāo',
-    0x29395: 'sǎ',
-    0x29396: 'qín,qián',
-    0x29397: 'qūn',
-    0x29398: 'páo',
-    0x29399: 'yuè',
-    0x2939A: 'chè',
-    0x2939B: 'fú',
-    0x2939C: 'pēi',
-    0x2939F: 'mèi,mò,wà',
-    0x293A2: 'tāo',
-    0x293A4: 'kēn',
-    0x293A5: 'xì',
-    0x293AB: 'duò',
-    0x293AD: 'yì',
-    0x293B0: 'suì',
-    0x293B2: 'xiá',
-    0x293B3: 'juān',
-    0x293B5: 'wéi',
-    0x293B7: 'yì',
-    0x293B9: 'yù',
-    0x293BB: 'bài',
-    0x293BC: 'tuó',
-    0x293BD: 'tà',
-    0x293BE: 'páo',
-    0x293C2: 'bǐng,bì',
-    0x293C5: 'yùn',
-    0x293C6: 'yùn',
-    0x293C7: 'duàn',
-    0x293C8: 'ruǎn',
-    0x293C9: 'wéi',
-    0x293CF: 'wéi',
-    0x293D0: 'guì,wěi',
-    0x293D2: 'dá',
-    0x293D3: 'xiá',
-    0x293D6: 'hùn',
-    0x293D7: 'juǎn',
-    0x293D8: 'suī',
-    0x293DA: 'suì',
-    0x293DD: 'lóu',
-    0x293DE: 'bài',
-    0x293DF: 'yù',
-    0x293E0: 'zhèng',
-    0x293E1: 'guì',
-    0x293E3: 'kuī',
-    0x293E4: 'gāo',
-    0x293E5: 'dān',
-    0x293E9: 'xiǎn',
-    0x293EA: 'zhái',
-    0x293EB: 'sè',
-    0x293ED: 'kē',
-    0x293EE: 'bǔ',
-    0x293EF: 'bó',
-    0x293F2: 'suì',
-    0x293F4: 'yù',
-    0x293F5: 'bǔ,bù',
-    0x293F6: 'jiū',
-    0x293F7: 'jiū,jiào',
-    0x293F9: 'juàn',
-    0x293FA: 'jué',
-    0x293FC: 'nà',
-    0x293FD: 'zhái',
-    0x293FE: 'tāo',
-    0x293FF: 'wěi',
-    0x29400: 'xiá',
-    0x29401: 'xiè',
-    0x29405: 'sà',
-    0x29406: 'jī',
-    0x29409: 'xiè',
-    0x2940C: 'duì',
-    0x2940D: 'zǐ',
-    0x29418: 'yuǎn',
-    0x29419: 'qìn',
-    0x2941A: 'fú',
-    0x2941B: 'péng',
-    0x2941C: 'páo',
-    0x2941E: 'yìn',
-    0x29420: 'hōng',
-    0x29421: 'zú',
-    0x29423: 'gōng',
-    0x29424: 'dòng',
-    0x29425: 'hē',
-    0x29426: 'wò',
-    0x29428: 'pāng',
-    0x2942B: 'sù',
-    0x2942C: 'kǎn',
-    0x2942D: 'niè',
-    0x2942E: 'háo',
-    0x2942F: 'fèng',
-    0x29430: 'è',
-    0x29431: 'yè',
-    0x29434: 'tíng',
-    0x29435: 'dòng',
-    0x29436: 'zhé',
-    0x29437: 'sāng',
-    0x2943B: 'mò',
-    0x2943C: 'sù',
-    0x2943E: 'lè',
-    0x29440: 'pǔ',
-    0x29441: 'é',
-    0x29442: 'zhuó',
-    0x29443: 'yè',
-    0x29447: 'xiāng',
-    0x29448: 'guàng',
-    0x29449: 'rěn',
-    0x2944A: 'líng',
-    0x2944D: 'ào',
-    0x29450: 'chāi',
-    0x29452: 'duó',
-    0x29453: 'qióng',
-    0x29454: 'kū,yà',
-    0x29455: 'xū',
-    0x29456: 'huán',
-    0x29457: 'yāo',
-    0x29458: 'zhèn',
-    0x29459: 'tǐng',
-    0x2945A: 'běng,lèi',
-    0x2945D: 'áng',
-    0x2945F: 'kān,qiān',
-    0x29461: 'kū,gěn',
-    0x29462: 'péi,bāi',
-    0x29463: 'yòu',
-    0x29464: 'ǎo',
-    0x29465: 'mén',
-    0x29466: 'mò',
-    0x2946C: 'fǔ,guī',
-    0x2946D: 'qīng',
-    0x2946E: 'là',
-    0x2946F: 'dǒu',
-    0x29470: 'tǎn',
-    0x29473: 'qiǎn',
-    0x29474: 'yào',
-    0x29475: 'wèi',
-    0x29476: 'hú,kū',
-    0x29477: 'mò',
-    0x29478: 'hē',
-    0x29479: 'xuàn',
-    0x2947B: 'bì,pó',
-    0x2947C: 'pō',
-    0x2947E: 'dī',
-    0x29480: 'zhěn',
-    0x29482: 'shī',
-    0x29483: 'kǎn',
-    0x29484: 'cè',
-    0x29487: 'xū',
-    0x29488: 'zhěn',
-    0x2948A: 'zhǔ',
-    0x2948F: 'huì',
-    0x29490: 'chǐ',
-    0x29493: 'hǒng',
-    0x29494: 'nóu',
-    0x29495: 'niè,pò,è',
-    0x29496: 'yàn',
-    0x29498: 'chǒng',
-    0x29499: 'fǔ,guì',
-    0x2949A: 'guāng',
-    0x2949B: 'qī',
-    0x2949D: 'gěn',
-    0x2949E: 'tǐng',
-    0x294A2: 'tǎn',
-    0x294A3: 'qiǎn',
-    0x294A6: 'jiù,xìn',
-    0x294A7: 'xū',
-    0x294A8: 'qǐ',
-    0x294AA: 'zhèn',
-    0x294AE: 'qiú',
-    0x294B0: 'ě',
-    0x294B3: 'huì',
-    0x294B4: 'hòng',
-    0x294B5: 'qǐng',
-    0x294B7: 'chē,rǒng',
-    0x294BA: 'fù',
-    0x294BC: 'hōng',
-    0x294BD: 'xī',
-    0x294BE: 'wú',
-    0x294BF: 'máng',
-    0x294C2: 'tī',
-    0x294C5: 'hōng',
-    0x294D0: 'bó',
-    0x294D2: 'qǐn',
-    0x294D3: 'gěn',
-    0x294D6: 'fú',
-    0x294D7: 'kuǐ',
-    0x294DD: 'bié',
-    0x294DE: 'jìng',
-    0x294DF: 'kǎn',
-    0x294E0: 'guī',
-    0x294E2: 'gǎo',
-    0x294E3: 'xū',
-    0x294E4: 'àn',
-    0x294E5: 'yuè',
-    0x294E6: 'wù',
-    0x294E7: 'yí',
-    0x294E8: 'jīng',
-    0x294EA: 'lù',
-    0x294EB: 'quán',
-    0x294EC: 'tuí',
-    0x294EE: 'jì',
-    0x294FA: 'jiǒng',
-    0x294FB: 'jué',
-    0x294FC: 'piē',
-    0x294FD: 'kūn',
-    0x29500: 'wài',
-    0x29501: 'huì',
-    0x29502: 'dùn',
-    0x29503: 'yuǎn',
-    0x29504: 'jié',
-    0x29506: 'guì',
-    0x29507: 'gǎo',
-    0x29508: 'pò',
-    0x29509: 'mén,mín,hūn',
-    0x2950A: 'zhuàn',
-    0x2950B: 'hàng',
-    0x29514: 'yóng',
-    0x29515: 'qiú',
-    0x29517: 'lèi',
-    0x29518: 'áng',
-    0x29519: 'pǐ,xìn',
-    0x2951A: 'wēng,wěng',
-    0x2951D: 'qìn',
-    0x2951F: 'qǐn',
-    0x29520: 'miè',
-    0x29521: 'dōu',
-    0x29522: 'mí',
-    0x29523: 'zhān',
-    0x29525: 'qǐng',
-    0x29526: 'yí',
-    0x2952E: 'bān',
-    0x29531: 'juān',
-    0x29533: 'zé',
-    0x29534: 'xù',
-    0x29535: 'lán',
-    0x29536: 'má',
-    0x29537: 'má',
-    0x29538: 'ōu',
-    0x29539: 'bēi',
-    0x2953B: 'póu',
-    0x2953C: 'xù',
-    0x29540: 'ào',
-    0x29546: 'hǒng',
-    0x29549: 'hǒng',
-    0x2954A: 'zhǎn',
-    0x2954C: 'sěn',
-    0x2954D: 'gǎo,háo',
-    0x2954F: 'pó,fán',
-    0x29550: 'liào',
-    0x29555: 'wài',
-    0x29556: 'xuān',
-    0x2955C: 'kuí',
-    0x2955F: 'è',
-    0x29560: 'hàn',
-    0x29561: 'sè',
-    0x29564: 'dàn',
-    0x2956A: 'xuān',
-    0x2956C: 'è',
-    0x2956D: 'gài',
-    0x2956F: 'dāo',
-    0x29571: 'měng',
-    0x29572: 'yī',
-    0x29573: 'nǐng',
-    0x29575: 'pín',
-    0x29579: 'cāng',
-    0x2957E: 'yuàn',
-    0x29580: 'è',
-    0x29581: 'niè,yá',
-    0x29584: 'yǐn',
-    0x29587: 'qiāo',
-    0x29589: 'hōng',
-    0x2958A: 'líng',
-    0x2958C: 'chān',
-    0x2958D: 'yǐng',
-    0x29592: 'guān',
-    0x29594: 'niǎo',
-    0x29595: 'xū',
-    0x29596: 'tán',
-    0x29597: 'jìn',
-    0x2959B: 'péng',
-    0x2959D: 'liáo',
-    0x295A0: 'bèi',
-    0x295A3: 'xín,bá',
-    0x295A4: 'tún',
-    0x295A5: 'chāo',
-    0x295A6: 'gān',
-    0x295A8: 'hū',
-    0x295A9: 'wǎng',
-    0x295AC: 'fú',
-    0x295AD: 'pèi',
-    0x295AF: 'náo',
-    0x295B0: 'xún,xín',
-    0x295B1: 'xuè',
-    0x295B4: 'liǔ',
-    0x295B5: 'líng',
-    0x295B6: 'xuè',
-    0x295B7: 'qū',
-    0x295B8: 'háo',
-    0x295B9: 'yí',
-    0x295BA: 'hàn',
-    0x295BC: 'fú',
-    0x295BD: 'bá',
-    0x295BE: 'yí',
-    0x295C0: 'bó',
-    0x295C4: 'hōng',
-    0x295C5: 'lì',
-    0x295C9: 'sà',
-    0x295CA: 'xī',
-    0x295CE: 'shì',
-    0x295CF: 'piāo',
-    0x295D0: 'huà',
-    0x295D1: 'yí',
-    0x295D2: 'bó',
-    0x295D3: 'bó',
-    0x295D4: 'něi',
-    0x295D5: 'qiú',
-    0x295D8: 'wěi',
-    0x295D9: 'chè',
-    0x295DA: 'yóu',
-    0x295DC: 'wèi',
-    0x295DD: 'huǐ',
-    0x295DE: 'sà',
-    0x295E2: 'hòng',
-    0x295E3: 'sōu',
-    0x295E4: 'hàn',
-    0x295E5: 'páo',
-    0x295E7: 'fáng',
-    0x295E9: 'liú',
-    0x295EA: 'zhòu',
-    0x295EB: 'pí',
-    0x295ED: 'lì',
-    0x295F0: 'chuí',
-    0x295F1: 'xī',
-    0x295F2: 'zhēng',
-    0x295F4: 'bèng',
-    0x295F5: 'zhēng',
-    0x295F6: 'suì',
-    0x295F7: 'yǎn',
-    0x295FC: 'qīng',
-    0x295FD: 'wù',
-    0x295FE: 'liǎng',
-    0x29600: 'zhào',
-    0x29601: 'liáng',
-    0x29605: 'jiē',
-    0x29607: 'hōng',
-    0x29608: 'yōu',
-    0x2960A: 'là',
-    0x2960B: 'hòu',
-    0x2960D: 'yuàn',
-    0x2960E: 'hóng',
-    0x2960F: 'yè',
-    0x29611: 'yǐng,yīng',
-    0x29612: 'xuǎn,juān',
-    0x29613: 'yóu',
-    0x29618: 'quán',
-    0x2961C: 'táng',
-    0x2961D: 'suǒ',
-    0x2961F: 'lì',
-    0x29620: 'sōu',
-    0x29621: 'lì',
-    0x29624: 'yù',
-    0x29627: 'yì',
-    0x2962D: 'xiū',
-    0x2962E: 'áo',
-    0x2962F: 'tuán',
-    0x29630: 'sù',
-    0x29631: 'shuài',
-    0x29633: 'yù',
-    0x29635: 'fēng',
-    0x29639: 'sù',
-    0x2963A: 'tuí',
-    0x2963B: 'yù',
-    0x2963C: 'zhēng',
-    0x2963D: 'zhēng',
-    0x2963F: 'táo',
-    0x29644: 'liú',
-    0x29646: 'chéng',
-    0x29647: 'suí',
-    0x29648: 'sāo',
-    0x2964F: 'gǔ',
-    0x29650: 'fēng',
-    0x29651: 'liè',
-    0x29652: 'piāo,piào',
-    0x29656: 'lì',
-    0x29658: 'lóng',
-    0x29659: 'chū',
-    0x2965A: 'xiāo',
-    0x2965B: 'hōng',
-    0x2965C: 'xiè',
-    0x2965D: 'shè',
-    0x29660: 'lóng',
-    0x29661: 'hōu',
-    0x29662: 'xuán,shī',
-    0x29663: 'fēng',
-    0x29665: 'bá',
-    0x29666: 'bó',
-    0x29667: 'táo',
-    0x29668: 'sù',
-    0x29669: 'zhào',
-    0x2966A: 'biāo',
-    0x2966B: 'sōu',
-    0x2966C: 'tuí',
-    0x2966D: 'suǒ',
-    0x2966E: 'xiāo',
-    0x2966F: 'héng',
-    0x29670: 'sāo',
-    0x29672: 'fēi',
-    0x29677: 'niù',
-    0x29678: 'mǎng',
-    0x2967D: 'huán,xuān',
-    0x2967E: 'zhī',
-    0x29682: 'yì',
-    0x29684: 'yù',
-    0x29687: 'yí',
-    0x29688: 'yuē',
-    0x29689: 'chí',
-    0x29695: 'yǐn,qiāng',
-    0x29696: 'niù',
-    0x29697: 'rǒng',
-    0x2969B: 'nà',
-    0x296A3: 'tián',
-    0x296A5: 'bā',
-    0x296AA: 'ěr',
-    0x296AB: 'zhēng',
-    0x296AC: 'è',
-    0x296AD: 'póu',
-    0x296AE: 'jī,nì',
-    0x296AF: 'ní',
-    0x296B1: 'jiǒng',
-    0x296B2: 'jiá',
-    0x296B5: 'gān',
-    0x296B9: 'líng',
-    0x296BB: 'zuì',
-    0x296BE: 'bèi',
-    0x296C5: 'shū',
-    0x296C6: 'yǐ',
-    0x296C7: 'pāi',
-    0x296CB: 'nǎo',
-    0x296CC: 'shì',
-    0x296CE: 'mǎn',
-    0x296CF: 'shì',
-    0x296D1: 'tí',
-    0x296D8: 'gōng',
-    0x296DD: 'lèi',
-    0x296DE: 'bǎo,něi,piǎo',
-    0x296DF: 'yuān,mán',
-    0x296E0: 'zuō',
-    0x296E1: 'láng,náng',
-    0x296E2: 'xiū',
-    0x296E5: 'zài',
-    0x296E6: 'chèng',
-    0x296E7: 'jiān',
-    0x296E8: 'mào',
-    0x296E9: 'jiá',
-    0x296EA: 'yù',
-    0x296ED: 'yù',
-    0x296EE: 'yí',
-    0x296F2: 'māng',
-    0x296F3: 'zài,cān',
-    0x296F5: 'zhuì',
-    0x296F6: 'tí',
-    0x296F9: 'xì',
-    0x296FA: 'jú',
-    0x296FB: 'zàn,zuǎn,zhān',
-    0x296FC: 'lù',
-    0x296FD: 'táo',
-    0x29700: 'zhuì,duī',
-    0x29701: 'líng',
-    0x29703: 'jù',
-    0x29706: 'jī',
-    0x29707: 'juǎn,juàn',
-    0x2970A: 'zī',
-    0x2970C: 'yuē',
-    0x2970D: 'dōng',
-    0x29712: 'nǎng',
-    0x29716: 'chóng',
-    0x2971F: 'àng',
-    0x29723: 'gēng',
-    0x29725: 'bō',
-    0x29726: 'dìng',
-    0x29727: 'wěi',
-    0x2972C: 'quán',
-    0x2972D: 'kē',
-    0x29730: 'pì',
-    0x29731: 'kǎn,sǎn',
-    0x29732: 'fú',
-    0x29733: 'yǒng',
-    0x29735: 'tuán',
-    0x29736: 'tǒu',
-    0x29737: 'yòu,niù',
-    0x29738: 'yāo',
-    0x2973A: 'yē',
-    0x2973D: 'yàn',
-    0x29748: 'xián',
-    0x2974A: 'tí',
-    0x2974C: 'suì',
-    0x29750: 'cí',
-    0x29754: 'xǔ',
-    0x29755: 'wù',
-    0x29756: 'cān',
-    0x29757: 'yù',
-    0x2975A: 'chǎn',
-    0x2975B: 'xiá',
-    0x2975D: 'kào,gāo',
-    0x2975E: 'cāng',
-    0x2975F: 'chā',
-    0x29760: 'qiǔ',
-    0x29763: 'dā',
-    0x29765: 'sù',
-    0x29768: 'huā',
-    0x29777: 'wū',
-    0x29778: 'yuān',
-    0x2977D: 'jiàng',
-    0x2977E: 'xiǎng',
-    0x2977F: 'zhāi',
-    0x29780: 'sǎn,chěn,càn',
-    0x29781: 'mó,mí',
-    0x29783: 'shǎng,xiǎng',
-    0x29784: 'cáo',
-    0x29785: 'suī',
-    0x29786: 'chuáng',
-    0x29787: 'mí',
-    0x29788: 'zhú',
-    0x29789: 'chóng',
-    0x2978A: 'jì',
-    0x2978B: 'chóng',
-    0x29799: 'lián',
-    0x2979E: 'hài',
-    0x297A4: 'dūn',
-    0x297A5: 'xiǎng',
-    0x297A6: 'chēng',
-    0x297A7: 'shǎng',
-    0x297A8: 'lì',
-    0x297A9: 'huáng',
-    0x297AC: 'dèng',
-    0x297AF: 'liáng',
-    0x297B6: 'zā',
-    0x297BA: 'huò',
-    0x297BB: 'lín',
-    0x297BE: 'dú,yì',
-    0x297BF: 'hàn',
-    0x297C0: 'yōng,yǒng',
-    0x297C1: 'yuàn,xuàn',
-    0x297C2: 'guò',
-    0x297C3: 'líng',
-    0x297C5: 'liǎn',
-    0x297C7: 'ào',
-    0x297C8: 'dāng',
-    0x297C9: 'yì',
-    0x297CA: 'nóng',
-    0x297CB: 'shàn',
-    0x297CD: 'xìn',
-    0x297D0: 'dá',
-    0x297D1: 'yù',
-    0x297D2: 'cān',
-    0x297D3: 'wò',
-    0x297D4: 'chá',
-    0x297D5: 'bó',
-    0x297D7: 'jiǎn',
-    0x297DE: 'méng',
-    0x297DF: 'wěi',
-    0x297E0: 'mó',
-    0x297E5: 'shuì,juǎn',
-    0x297E6: 'jié',
-    0x297E7: 'shuò',
-    0x297E8: 'huò',
-    0x297EB: 'chuò',
-    0x297ED: 'lóng',
-    0x297EE: 'huài',
-    0x297F0: 'tuō',
-    0x297F3: 'yú',
-    0x297F6: 'chàn,jié',
-    0x297F7: 'yōng',
-    0x297F8: 'huò',
-    0x297FA: 'lǎn',
-    0x297FF: 'nà',
-    0x29800: 'bā',
-    0x29801: 'gān',
-    0x29802: 'yǐ',
-    0x29803: 'jiá',
-    0x29805: 'dá',
-    0x29806: 'dìng',
-    0x29807: 'xùn',
-    0x29808: 'rěn',
-    0x29809: 'juǎn',
-    0x2980A: 'tuán',
-    0x2980B: 'xǔ',
-    0x2980C: 'sòng',
-    0x2980E: 'cáo',
-    0x2980F: 'chēng',
-    0x29811: 'dǐng',
-    0x2981A: 'hái',
-    0x2981F: 'wǔ',
-    0x29826: 'qǐ,shǒu',
-    0x29828: 'jī,qǐ',
-    0x2982E: 'kuí',
-    0x2982F: 'wéi',
-    0x29836: 'shǒu',
-    0x29837: 'fú',
-    0x29839: 'tuán',
-    0x2983B: 'bié,hān',
-    0x2983D: 'tán',
-    0x2983E: 'hāng',
-    0x2983F: 'piē',
-    0x29843: 'yú',
-    0x29844: 'tán,xiāng',
-    0x2984C: 'xiāng',
-    0x2984E: 'xiū',
-    0x29853: 'wěng',
-    0x29854: 'hài',
-    0x29855: 'péng',
-    0x2985D: 'tán',
-    0x2985F: 'bié',
-    0x29860: 'xiāng',
-    0x29863: 'yǐ',
-    0x29866: 'piáo',
-    0x29867: 'huán',
-    0x29868: 'mǔ',
-    0x29869: 'bā',
-    0x2986B: 'fàn',
-    0x2986F: 'dīng',
-    0x29877: 'fēn,fèi',
-    0x2987A: 'jiè',
-    0x2987E: 'suó',
-    0x29884: 'wàn',
-    0x29885: 'gē',
-    0x29888: 'fēn',
-    0x2988A: 'tuó',
-    0x2988C: 'wén',
-    0x2988D: 'guā',
-    0x2988E: 'duō',
-    0x29890: 'zhé',
-    0x29891: 'cǐ',
-    0x29892: 'yǎo',
-    0x29894: 'bàn',
-    0x29895: 'bù',
-    0x29896: 'mò',
-    0x29898: 'pǒ',
-    0x2989B: 'gé',
-    0x2989E: 'liú',
-    0x298A1: 'rǎn',
-    0x298A8: 'gān',
-    0x298AA: 'hú',
-    0x298AB: 'móu',
-    0x298AE: 'xiū',
-    0x298AF: 'huāng',
-    0x298B0: 'fú',
-    0x298B1: 'huí',
-    0x298B3: 'qú',
-    0x298B4: 'jié,jí',
-    0x298B5: 'tuō',
-    0x298B6: 'yú',
-    0x298B7: 'mò',
-    0x298B8: 'zhōu',
-    0x298B9: 'jiù',
-    0x298BB: 'shú',
-    0x298BC: 'kuāng',
-    0x298BD: 'qióng',
-    0x298BE: 'liè',
-    0x298BF: 'fù',
-    0x298CA: 'xù',
-    0x298D6: 'lìn',
-    0x298D8: 'niè',
-    0x298DA: 'pī,bǐ',
-    0x298DC: 'fù',
-    0x298DD: 'bù',
-    0x298DE: 'yì,sà',
-    0x298E1: 'bó',
-    0x298E3: 'é,ě',
-    0x298E9: 'zhé',
-    0x298EB: 'lì',
-    0x298EE: 'tù',
-    0x298EF: 'dá',
-    0x298F1: 'lù',
-    0x298F2: 'yān',
-    0x298F3: 'dōng',
-    0x298F4: 'qiè',
-    0x298F5: 'wǎn,wò',
-    0x298F6: 'mǐng',
-    0x298F7: 'zuī,zhù',
-    0x298F8: 'fù',
-    0x298F9: 'qū',
-    0x298FA: 'bēn',
-    0x298FB: 'ǎo',
-    0x298FC: 'qiāng',
-    0x29901: 'qūn',
-    0x29908: 'què',
-    0x29909: 'huá,táo',
-    0x2990A: 'xiàn,jiàn',
-    0x2990B: 'kùn',
-    0x2990F: 'cuì',
-    0x29912: 'yí',
-    0x29916: 'chī,ér',
-    0x29917: 'zòng',
-    0x29918: 'nǎo',
-    0x29919: 'chéng',
-    0x2991A: 'duān',
-    0x2991B: 'yóng',
-    0x2991C: 'zhě',
-    0x2991E: 'tàn',
-    0x2991F: 'yáng',
-    0x29920: 'xié',
-    0x29921: 'xuān',
-    0x29923: 'duàn',
-    0x29924: 'shuǎ',
-    0x29925: 'xián',
-    0x29926: 'xián',
-    0x29929: 'é',
-    0x29932: 'lā',
-    0x29938: 'wèi',
-    0x29939: 'yōu',
-    0x2993A: 'yú',
-    0x2993D: 'tī',
-    0x2993F: 'jīn',
-    0x29941: 'táng',
-    0x29942: 'qí',
-    0x29944: 'diān',
-    0x29945: 'tāo',
-    0x29946: 'lǜ',
-    0x29947: 'zhàn',
-    0x29948: 'wēn',
-    0x29949: 'jì',
-    0x2994A: 'āo,jiāo',
-    0x2994B: 'òu,dú',
-    0x2994C: 'qià',
-    0x29950: 'shī',
-    0x29951: 'tǎ',
-    0x29954: 'mò',
-    0x29958: 'yóu',
-    0x29960: 'zhá',
-    0x29963: 'yáo',
-    0x2996B: 'chōng',
-    0x2996C: 'lí',
-    0x2996D: 'yú',
-    0x2996E: 'chǎn',
-    0x2996F: 'yī',
-    0x29972: 'chì',
-    0x29974: 'lí',
-    0x2997D: 'tú',
-    0x2997F: 'zú',
-    0x29982: 'xián',
-    0x29987: 'xì',
-    0x29989: 'bié',
-    0x2998A: 'hán,qiān',
-    0x2998B: 'qí',
-    0x2998C: 'sāng,shuāng',
-    0x2998E: 'fēi,fěi',
-    0x29990: 'shàn,huō',
-    0x29998: 'huān',
-    0x299A0: 'bàng',
-    0x299A1: 'yú',
-    0x299A2: 'yú',
-    0x299A4: 'jí',
-    0x299B1: 'kuǎi',
-    0x299B2: 'zōng',
-    0x299B9: 'xiàn',
-    0x299BA: 'méng',
-    0x299C3: 'lì',
-    0x299C4: 'zhì',
-    0x299C5: 'fán',
-    0x299C6: 'liè,là',
-    0x299C7: 'cài',
-    0x299C8: 'dú',
-    0x299C9: 'guāng',
-    0x299CA: 'xiòng',
-    0x299CB: 'lí',
-    0x299CC: 'qì',
-    0x299CF: 'jué',
-    0x299D0: 'tuō',
-    0x299D2: 'jù',
-    0x299D3: 'xiāo',
-    0x299D8: 'qú',
-    0x299DC: 'zhuǎn',
-    0x299E1: 'jué',
-    0x299E6: 'jiè',
-    0x299E8: 'zhòu',
-    0x299E9: 'xiàn',
-    0x299EA: 'lóng',
-    0x299EB: 'yǎng',
-    0x299EC: 'rǎn',
-    0x299ED: 'yì',
-    0x299EE: 'liè',
-    0x299EF: 'bō',
-    0x299F0: 'hún',
-    0x299F1: 'jì',
-    0x299F2: 'dòng',
-    0x299F3: 'zhōu',
-    0x299F4: 'quān',
-    0x299F5: 'jié',
-    0x299FA: 'jú',
-    0x299FC: 'bēn',
-    0x299FF: 'bī',
-    0x29A00: 'gé',
-    0x29A01: 'chǔn',
-    0x29A03: 'qián',
-    0x29A04: 'sōu',
-    0x29A05: 'wèi',
-    0x29A06: 'chéng',
-    0x29A07: 'lóu',
-    0x29A08: 'yú',
-    0x29A09: 'lā',
-    0x29A0A: 'qián',
-    0x29A0B: 'diān',
-    0x29A0C: 'tǎ',
-    0x29A0D: 'zhàn',
-    0x29A0F: 'fán',
-    0x29A10: 'liè',
-    0x29A11: 'tīng',
-    0x29A12: 'jī',
-    0x29A13: 'qiān',
-    0x29A14: 'hú,huá',
-    0x29A17: 'yú',
-    0x29A18: 'qì,gē',
-    0x29A19: 'yú',
-    0x29A1A: 'wā',
-    0x29A1C: 'bà',
-    0x29A1D: 'qí',
-    0x29A1E: 'sǎ',
-    0x29A1F: 'qiāo',
-    0x29A20: 'yà',
-    0x29A21: 'xiǎn,sǎn',
-    0x29A28: 'cī',
-    0x29A29: 'fàn',
-    0x29A2B: 'kǔn',
-    0x29A2C: 'gǔn',
-    0x29A2D: 'quē',
-    0x29A2E: 'è',
-    0x29A2F: 'qióng',
-    0x29A32: 'mà',
-    0x29A33: 'kū,dū',
-    0x29A34: 'yǎo',
-    0x29A37: 'quē',
-    0x29A38: 'chū',
-    0x29A39: 'jiǎ',
-    0x29A3B: 'zhǔ',
-    0x29A3D: 'duī',
-    0x29A3E: 'wá',
-    0x29A40: 'nǎo',
-    0x29A44: 'yán',
-    0x29A45: 'tóng',
-    0x29A4B: 'xíng,jìng',
-    0x29A4C: 'gǔn',
-    0x29A4D: 'pīng',
-    0x29A51: 'yǔ',
-    0x29A52: 'hè',
-    0x29A54: 'zhuó',
-    0x29A57: 'shē',
-    0x29A58: 'yǔ',
-    0x29A5B: 'jì',
-    0x29A5D: 'qiāng',
-    0x29A5E: 'shuì',
-    0x29A5F: 'chuò',
-    0x29A60: 'zú',
-    0x29A61: 'léng',
-    0x29A62: 'ní',
-    0x29A64: 'wā',
-    0x29A65: 'zhá',
-    0x29A67: 'dàn',
-    0x29A6E: 'dù',
-    0x29A6F: 'biàn',
-    0x29A70: 'jiē,hái',
-    0x29A71: 'qià',
-    0x29A72: 'hé',
-    0x29A73: 'chòng',
-    0x29A74: 'yán',
-    0x29A76: 'yàn',
-    0x29A7A: 'sóng',
-    0x29A7B: 'téng',
-    0x29A7C: 'yǎo',
-    0x29A7E: 'kāo',
-    0x29A80: 'zhuī',
-    0x29A81: 'guì',
-    0x29A82: 'ái',
-    0x29A83: 'hài',
-    0x29A88: 'suǒ',
-    0x29A89: 'xù',
-    0x29A8A: 'biāo',
-    0x29A8C: 'fèng',
-    0x29A8D: 'qū,shū',
-    0x29A8E: 'mǎng',
-    0x29A90: 'guó',
-    0x29A96: 'bì',
-    0x29A97: 'jué',
-    0x29A98: 'chuáng',
-    0x29A9B: 'pú',
-    0x29A9F: 'yì',
-    0x29AA2: 'qiān',
-    0x29AA3: 'yì',
-    0x29AA4: 'è',
-    0x29AA5: 'líng',
-    0x29AA7: 'bì',
-    0x29AAD: 'huò',
-    0x29AAE: 'mǒ,mó',
-    0x29AB1: 'xūn',
-    0x29AB4: 'yàn',
-    0x29AB8: 'lì',
-    0x29ABA: 'tán',
-    0x29ABE: 'luán',
-    0x29AC0: 'kài',
-    0x29AC1: 'mào',
-    0x29AC2: 'xiāo',
-    0x29AC7: 'ǎi',
-    0x29ACA: 'tǎ',
-    0x29ACD: 'mèi',
-    0x29ACF: 'guō,yōng',
-    0x29AD3: 'gǎo',
-    0x29AD4: 'náo',
-    0x29AD5: 'háo',
-    0x29AE0: 'quē',
-    0x29AE5: 'cáo',
-    0x29AE6: 'sào',
-    0x29AEB: 'pí',
-    0x29AF2: 'xiē',
-    0x29AF3: 'xiāo',
-    0x29AF4: 'jú',
-    0x29AF9: 'chéng',
-    0x29AFA: 'nǎo',
-    0x29B00: 'nèi',
-    0x29B0D: 'mǔ',
-    0x29B0F: 'shāo',
-    0x29B11: 'diān,chān',
-    0x29B14: 'líng',
-    0x29B16: 'zhěn',
-    0x29B17: 'yǎo',
-    0x29B19: 'fù,fū',
-    0x29B1A: 'qián,gàn',
-    0x29B1B: 'qióng',
-    0x29B1C: 'jú',
-    0x29B1D: 'bìng,fǎng',
-    0x29B1E: 'máo,mán,mián',
-    0x29B1F: 'zhà',
-    0x29B20: 'tāi',
-    0x29B24: 'chōng',
-    0x29B2B: 'zhǎi',
-    0x29B2D: 'shī',
-    0x29B2E: 'yòng',
-    0x29B30: 'qióng',
-    0x29B31: 'dào',
-    0x29B32: 'tì',
-    0x29B33: 'zhuǐ',
-    0x29B35: 'yìn',
-    0x29B37: 'nǎo',
-    0x29B38: 'bō',
-    0x29B39: 'kuāng',
-    0x29B3A: 'zhǐ',
-    0x29B3B: 'duǒ',
-    0x29B3C: 'cōng',
-    0x29B3D: 'bǎo',
-    0x29B47: 'lí',
-    0x29B4A: 'jú',
-    0x29B4B: 'wén,kūn',
-    0x29B4C: 'liè',
-    0x29B4F: 'wǒ',
-    0x29B50: 'shǐ',
-    0x29B51: 'niǎo',
-    0x29B52: 'máng',
-    0x29B53: 'jiū',
-    0x29B58: 'xiū',
-    0x29B5D: 'wǒ',
-    0x29B5F: 'dào',
-    0x29B61: 'xī',
-    0x29B62: 'àn',
-    0x29B63: 'dá',
-    0x29B64: 'zǒng,zōng',
-    0x29B65: 'hàn',
-    0x29B66: 'chuí',
-    0x29B67: 'bī,bān',
-    0x29B69: 'dòng',
-    0x29B6B: 'zhǎng',
-    0x29B6F: 'yā',
-    0x29B72: 'dí',
-    0x29B73: 'huō',
-    0x29B77: 'mín',
-    0x29B7A: 'fù',
-    0x29B7C: 'bǎo',
-    0x29B7D: 'kè',
-    0x29B7E: 'máo',
-    0x29B7F: 'rè',
-    0x29B80: 'zōng,zǒng,sōng',
-    0x29B81: 'qià',
-    0x29B82: 'xiā',
-    0x29B83: 'sōu',
-    0x29B84: 'xiū',
-    0x29B85: 'nà',
-    0x29B89: 'mán,mián',
-    0x29B8E: 'zhā',
-    0x29B8F: 'chán',
-    0x29B90: 'shè',
-    0x29B91: 'wǒ',
-    0x29B96: 'ái',
-    0x29B97: 'bàng,péng,fǎng',
-    0x29B98: 'hāo',
-    0x29B9A: 'sāo',
-    0x29B9B: 'suǒ',
-    0x29B9C: 'tì',
-    0x29B9D: 'yà',
-    0x29B9F: 'bìng',
-    0x29BA0: 'róng',
-    0x29BAB: 'shā',
-    0x29BAC: 'wěng',
-    0x29BAF: 'áo',
-    0x29BB1: 'zhuāng',
-    0x29BB3: 'piào,piǎo,piē',
-    0x29BB4: 'suī,cuǐ',
-    0x29BB5: 'yī',
-    0x29BB6: 'sōu',
-    0x29BB7: 'dōu',
-    0x29BB8: 'sōu,nà',
-    0x29BB9: 'luó',
-    0x29BC3: 'fèi,bì',
-    0x29BC4: 'zùn',
-    0x29BC6: 'nào',
-    0x29BC7: 'dēng',
-    0x29BC8: 'zhí',
-    0x29BC9: 'cuō',
-    0x29BCA: 'liáo',
-    0x29BCB: 'jǐ',
-    0x29BCC: 'bō',
-    0x29BCD: 'cóng',
-    0x29BCE: 'chéng',
-    0x29BCF: 'bǔ',
-    0x29BD1: 'sān',
-    0x29BD2: 'zàn',
-    0x29BD8: 'jiào',
-    0x29BDB: 'yào',
-    0x29BDC: 'lǔ',
-    0x29BDE: 'càn',
-    0x29BE8: 'nǐ',
-    0x29BF0: 'jié,jì',
-    0x29BF1: 'pú',
-    0x29BF2: 'zhuàng',
-    0x29BF3: 'zàn,zuǎn,zā',
-    0x29BFA: 'lì',
-    0x29BFD: 'là',
-    0x29C00: 'chōng',
-    0x29C03: 'zhàn',
-    0x29C0D: 'biàn',
-    0x29C0E: 'wēng',
-    0x29C13: 'hòng',
-    0x29C17: 'pīn',
-    0x29C19: 'sè',
-    0x29C1E: 'nǐ',
-    0x29C1F: 'fēn',
-    0x29C20: 'xǔ',
-    0x29C22: 'shǐ',
-    0x29C24: 'jù',
-    0x29C28: 'jué',
-    0x29C2A: 'yù',
-    0x29C2C: 'guō,wāi',
-    0x29C2D: 'guō',
-    0x29C2F: 'hú',
-    0x29C32: 'lì,fèi',
-    0x29C33: 'xié',
-    0x29C34: 'ér',
-    0x29C35: 'yuán',
-    0x29C36: 'hái,bèn',
-    0x29C39: 'jìng',
-    0x29C3B: 'kè',
-    0x29C3D: 'zōng',
-    0x29C3E: 'fèi',
-    0x29C40: 'pēng',
-    0x29C41: 'gēng',
-    0x29C43: 'jiān',
-    0x29C44: 'ní',
-    0x29C46: 'xián',
-    0x29C47: 'lì',
-    0x29C48: 'chǎo',
-    0x29C4A: 'ér,xiàn',
-    0x29C4B: 'gēng,pēng',
-    0x29C4C: 'yù',
-    0x29C4D: 'hú',
-    0x29C4E: 'fèi',
-    0x29C4F: 'áo',
-    0x29C53: 'ěr',
-    0x29C58: 'kè',
-    0x29C59: 'kù',
-    0x29C5A: 'bó',
-    0x29C5D: 'yè',
-    0x29C5E: 'jiào',
-    0x29C66: 'chǎo',
-    0x29C67: 'gēng',
-    0x29C68: 'rù',
-    0x29C6A: 'yuè',
-    0x29C6C: 'lín',
-    0x29C71: 'yù',
-    0x29C72: 'yuè',
-    0x29C73: 'zhāi',
-    0x29C74: 'xiāo',
-    0x29C77: 'miè',
-    0x29C7B: 'guǐ',
-    0x29C7C: 'jiū',
-    0x29C7E: 'tuò',
-    0x29C81: 'xí',
-    0x29C82: 'wěi',
-    0x29C83: 'zhuó',
-    0x29C84: 'wèi',
-    0x29C85: 'kuí',
-    0x29C88: 'mèi,wéi',
-    0x29C8A: 'hào',
-    0x29C8B: 'hāng',
-    0x29C8C: 'fāng',
-    0x29C8D: 'niú',
-    0x29C8E: 'yòu',
-    0x29C8F: 'huà',
-    0x29C92: 'làng',
-    0x29CA0: 'zhú',
-    0x29CA1: 'guǐ',
-    0x29CA2: 'bì,mèi',
-    0x29CA3: 'jiǎ',
-    0x29CA4: 'tiáo',
-    0x29CA6: 'lǜ',
-    0x29CA7: 'kǒng',
-    0x29CA8: 'zuǐ',
-    0x29CA9: 'líng',
-    0x29CAA: 'qí',
-    0x29CAC: 'zhú',
-    0x29CB1: 'gǔ',
-    0x29CB2: 'zù',
-    0x29CB4: 'yāng',
-    0x29CB5: 'sū',
-    0x29CB7: 'kuí',
-    0x29CB9: 'chāng',
-    0x29CBB: 'yáo',
-    0x29CBE: 'yù',
-    0x29CC5: 'shū',
-    0x29CC6: 'lài',
-    0x29CC7: 'yì',
-    0x29CC8: 'dōu',
-    0x29CCC: 'wú',
-    0x29CCD: 'yǐng',
-    0x29CCE: 'fú',
-    0x29CCF: 'zhuàn',
-    0x29CD0: 'fǔ',
-    0x29CD2: 'sù',
-    0x29CD3: 'lǐ',
-    0x29CD4: 'yào',
-    0x29CD5: 'tuì,tì',
-    0x29CDD: 'guì',
-    0x29CE1: 'lǜ',
-    0x29CE2: 'yàn',
-    0x29CE3: 'qí',
-    0x29CE4: 'làng,chāng',
-    0x29CE5: 'zhú',
-    0x29CE7: 'guǐ',
-    0x29CE8: 'hū',
-    0x29CEF: 'jīng',
-    0x29CF2: 'chǐ',
-    0x29CF5: 'jú',
-    0x29CF6: 'zhá',
-    0x29CF8: 'miáo',
-    0x29D00: 'zhū',
-    0x29D01: 'gān',
-    0x29D02: 'xiōng',
-    0x29D03: 'jí',
-    0x29D07: 'shài',
-    0x29D08: 'mèi',
-    0x29D09: 'yùn',
-    0x29D0D: 'shòu',
-    0x29D10: 'lǜ',
-    0x29D11: 'yòu',
-    0x29D12: 'jiàng',
-    0x29D13: 'nuó',
-    0x29D18: 'jù',
-    0x29D19: 'yòu',
-    0x29D1C: 'yì',
-    0x29D1D: 'téng',
-    0x29D1E: 'wéi',
-    0x29D1F: 'chě',
-    0x29D20: 'lìn',
-    0x29D21: 'gù',
-    0x29D23: 'lì',
-    0x29D24: 'liào',
-    0x29D27: 'jiāo',
-    0x29D28: 'yáng',
-    0x29D29: 'biāo',
-    0x29D2A: 'qí',
-    0x29D2E: 'yì',
-    0x29D31: 'bīn',
-    0x29D32: 'méng',
-    0x29D33: 'chà',
-    0x29D35: 'gān',
-    0x29D39: 'qú',
-    0x29D3A: 'dí',
-    0x29D3B: 'léi',
-    0x29D40: 'líng',
-    0x29D44: 'huān',
-    0x29D45: 'qú',
-    0x29D47: 'luó',
-    0x29D49: 'kuí',
-    0x29D4D: 'qiú',
-    0x29D4E: 'yǔ,yú',
-    0x29D4F: 'huà',
-    0x29D53: 'lèi',
-    0x29D55: 'rèn,dāo',
-    0x29D56: 'xiǎo',
-    0x29D57: 'sì',
-    0x29D5A: 'dù',
-    0x29D5B: 'biē',
-    0x29D60: 'niú,wěi',
-    0x29D62: 'hè,zā',
-    0x29D63: 'pēi',
-    0x29D65: 'fèi',
-    0x29D66: 'mù',
-    0x29D69: 'fū',
-    0x29D6C: 'hú',
-    0x29D6D: 'wáng',
-    0x29D6E: 'shā,xiǎo',
-    0x29D70: 'jiāo,qiū',
-    0x29D71: 'wǔ',
-    0x29D79: 'fù',
-    0x29D81: 'bǐng',
-    0x29D82: 'zhù',
-    0x29D84: 'zhú',
-    0x29D85: 'chī',
-    0x29D87: 'shěn',
-    0x29D88: 'hū',
-    0x29D89: 'bū',
-    0x29D8E: 'rǎn',
-    0x29D96: 'mù',
-    0x29D98: 'lì',
-    0x29D9B: 'jiā',
-    0x29D9E: 'mà,háng',
-    0x29DA1: 'méng',
-    0x29DA2: 'móu',
-    0x29DA3: 'zhōu',
-    0x29DA4: 'xiǎn',
-    0x29DA5: 'huǐ,hóng',
-    0x29DA6: 'guài',
-    0x29DA7: 'jiù',
-    0x29DA9: 'mù',
-    0x29DAB: 'rù,xuè',
-    0x29DAD: 'wú',
-    0x29DAF: 'rú',
-    0x29DB1: 'zhà',
-    0x29DC1: 'nuǒ',
-    0x29DC2: 'xié',
-    0x29DC4: 'jiàng',
-    0x29DCB: 'lǐ',
-    0x29DCC: 'shū',
-    0x29DCD: 'yì',
-    0x29DCE: 'dí',
-    0x29DCF: 'qíng',
-    0x29DD0: 'jú',
-    0x29DD3: 'zhì',
-    0x29DD5: 'láng',
-    0x29DD6: 'bù',
-    0x29DD7: 'kuáng',
-    0x29DD8: 'yì',
-    0x29DDA: 'bó',
-    0x29DE7: 'chì',
-    0x29DED: 'jiàng',
-    0x29DEF: 'wò',
-    0x29DF0: 'xùn',
-    0x29DF5: 'tūn',
-    0x29DF6: 'máng',
-    0x29DF8: 'fáng',
-    0x29DF9: 'zhuó',
-    0x29DFB: 'qià',
-    0x29DFD: 'tǎ',
-    0x29DFE: 'qí',
-    0x29E00: 'pèng',
-    0x29E01: 'biē',
-    0x29E02: 'fèn,pèn',
-    0x29E03: 'tù',
-    0x29E04: 'huà',
-    0x29E07: 'è',
-    0x29E0B: 'è,yā',
-    0x29E0E: 'dìng',
-    0x29E10: 'rú',
-    0x29E16: 'è',
-    0x29E1E: 'yàn,qí',
-    0x29E1F: 'sì',
-    0x29E25: 'yíng',
-    0x29E26: 'ní',
-    0x29E27: 'ní',
-    0x29E28: 'yí',
-    0x29E39: 'mí',
-    0x29E3E: 'yé',
-    0x29E3F: 'pō',
-    0x29E40: 'còu',
-    0x29E42: 'wèi',
-    0x29E44: 'hài',
-    0x29E45: 'yīng',
-    0x29E47: 'tíng',
-    0x29E48: 'zhì',
-    0x29E49: 'fēi',
-    0x29E4A: 'yóu',
-    0x29E4D: 'kuí',
-    0x29E4E: 'àn',
-    0x29E4F: 'bà',
-    0x29E51: 'hàn',
-    0x29E5E: 'nán',
-    0x29E5F: 'nài',
-    0x29E62: 'jīng',
-    0x29E65: 'wēi',
-    0x29E71: 'chù',
-    0x29E73: 'suǒ',
-    0x29E74: 'tāo',
-    0x29E75: 'qí',
-    0x29E76: 'táng',
-    0x29E77: 'wěi',
-    0x29E78: 'gǎn',
-    0x29E7A: 'gé',
-    0x29E7C: 'hàn',
-    0x29E7E: 'nà',
-    0x29E7F: 'gé',
-    0x29E84: 'zhēng',
-    0x29E97: 'tǎ,dá',
-    0x29E9B: 'sī',
-    0x29E9D: 'nì',
-    0x29E9E: 'sǎng',
-    0x29EAB: 'xié',
-    0x29EAF: 'zú',
-    0x29EB0: 'yú,wú',
-    0x29EB1: 'nì',
-    0x29EB2: 'qī',
-    0x29EB5: 'shēn',
-    0x29EBC: 'bū',
-    0x29ECB: 'kūn',
-    0x29ECC: 'lí',
-    0x29ECE: 'guā',
-    0x29ED6: 'yǎn',
-    0x29ED7: 'bù',
-    0x29ED8: 'jiàn',
-    0x29EDA: 'wú',
-    0x29EDB: 'cén,jīn',
-    0x29EDC: 'lín',
-    0x29EDD: 'zhuàn',
-    0x29EDF: 'huī',
-    0x29EE1: 'tóng',
-    0x29EE2: 'zhǎ',
-    0x29EE4: 'hēi',
-    0x29EE7: 'guǒ',
-    0x29EF1: 'jǐng',
-    0x29EF5: 'dié',
-    0x29EF7: 'yíng',
-    0x29EFC: 'zhì',
-    0x29F02: 'wěi',
-    0x29F04: 'jì',
-    0x29F05: 'rǒng',
-    0x29F08: 'ào,yǒu',
-    0x29F09: 'dāng,hān',
-    0x29F0A: 'luó',
-    0x29F0B: 'yè',
-    0x29F0C: 'wēi',
-    0x29F12: 'qiáng',
-    0x29F19: 'gé',
-    0x29F1A: 'jì',
-    0x29F26: 'zòu',
-    0x29F28: 'yí',
-    0x29F2B: 'zhǎ',
-    0x29F2D: 'liè',
-    0x29F34: 'yè',
-    0x29F3C: 'zhān',
-    0x29F40: 'chóu',
-    0x29F41: 'biāo',
-    0x29F46: 'xù',
-    0x29F47: 'yōu',
-    0x29F4D: 'xiè',
-    0x29F4E: 'wéi',
-    0x29F4F: 'lì',
-    0x29F5B: 'bó',
-    0x29F5C: 'jiǎn',
-    0x29F5D: 'chán',
-    0x29F5E: 'kūn',
-    0x29F61: 'qíng',
-    0x29F67: 'shuāng',
-    0x29F68: 'xī',
-    0x29F69: 'qú',
-    0x29F70: 'luó',
-    0x29F73: 'dǎng',
-    0x29F74: 'nián',
-    0x29F75: 'lǐ',
-    0x29F77: 'bà',
-    0x29F79: 'è',
-    0x29F7A: 'fū',
-    0x29F7B: 'fù',
-    0x29F7C: 'hǔn',
-    0x29F7D: 'zhà',
-    0x29F7E: 'ān',
-    0x29F81: 'qiú',
-    0x29F82: 'chóu',
-    0x29F83: 'miǎn',
-    0x29F84: 'xùn',
-    0x29F85: 'tù',
-    0x29F86: 'ní',
-    0x29F87: 'hu',
-    0x29F88: 'shū',
-    0x29F8A: 'xū',
-    0x29F8B: 'zhòng',
-    0x29F8C: 'kāng',
-    0x29F92: 'xiāo',
-    0x29F93: 'xiāo',
-    0x29F94: 'cì',
-    0x29F95: 'chì',
-    0x29F97: 'diāo,jiāo',
-    0x29F98: 'yì',
-    0x29F9A: 'dīng',
-    0x29F9D: 'hàn,yàn',
-    0x29F9E: 'wán',
-    0x29FA0: 'yǐ',
-    0x29FA1: 'bào',
-    0x29FA2: 'yì,yuān',
-    0x29FA7: 'xùn',
-    0x29FAC: 'xiáng',
-    0x29FB3: 'bí',
-    0x29FB6: 'jié',
-    0x29FB7: 'gē',
-    0x29FB8: 'zè,yàn',
-    0x29FBA: 'zhèn',
-    0x29FBB: 'hú',
-    0x29FBC: 'xī',
-    0x29FBD: 'xīn',
-    0x29FBE: 'xiāo,jiāo',
-    0x29FBF: 'fù',
-    0x29FC0: 'zhòng',
-    0x29FC2: 'mào',
-    0x29FC3: 'xīn',
-    0x29FC4: 'qiāng',
-    0x29FC8: 'fén,fēn',
-    0x29FC9: 'bān',
-    0x29FCA: 'huān',
-    0x29FD1: 'jiāo',
-    0x29FD3: 'bào',
-    0x29FD4: 'yā',
-    0x29FD5: 'yáo',
-    0x29FDB: 'xì',
-    0x29FDD: 'jù',
-    0x29FDF: 'qù',
-    0x29FE0: 'yuè',
-    0x29FE1: 'tái',
-    0x29FE2: 'tǒu',
-    0x29FE3: 'mò',
-    0x29FE4: 'zhá',
-    0x29FE5: 'qú',
-    0x29FE7: 'fū',
-    0x29FE9: 'qú,duó',
-    0x29FEA: 'chì',
-    0x29FEC: 'yóu',
-    0x29FF7: 'tí',
-    0x29FFA: 'wā',
-    0x29FFD: 'tuó',
-    0x29FFF: 'chú',
-    0x2A001: 'gē',
-    0x2A008: 'yuān',
-    0x2A009: 'gē,kě',
-    0x2A00A: 'qú',
-    0x2A00F: 'jù,jiū',
-    0x2A012: 'dié',
-    0x2A013: 'yí',
-    0x2A014: 'shī',
-    0x2A015: 'yì',
-    0x2A017: 'guǐ',
-    0x2A018: 'jiàng',
-    0x2A01A: 'sōng',
-    0x2A01B: 'qióng',
-    0x2A01D: 'è,yuān',
-    0x2A01E: 'huāng',
-    0x2A01F: 'huí',
-    0x2A020: 'xún',
-    0x2A023: 'jú',
-    0x2A025: 'zhái',
-    0x2A026: 'chì',
-    0x2A027: 'lǎo',
-    0x2A029: 'qí,dàn,chú',
-    0x2A02A: 'xiū',
-    0x2A02C: 'huī',
-    0x2A02D: 'tóng',
-    0x2A03A: 'fù',
-    0x2A03D: 'xún,xīn',
-    0x2A03E: 'jié',
-    0x2A03F: 'mǐ',
-    0x2A040: 'yù',
-    0x2A048: 'zhuāng,zhuàng',
-    0x2A049: 'jiāo',
-    0x2A04A: 'zhì,zhé',
-    0x2A04B: 'chéng',
-    0x2A04D: 'jié',
-    0x2A04E: 'xiāo',
-    0x2A04F: 'chén',
-    0x2A050: 'lí',
-    0x2A051: 'yuè',
-    0x2A053: 'zhì',
-    0x2A054: 'láo',
-    0x2A055: 'wò',
-    0x2A056: 'qú',
-    0x2A058: 'wāng',
-    0x2A05A: 'yī',
-    0x2A05B: 'yì',
-    0x2A05C: 'láng',
-    0x2A05E: 'tóu',
-    0x2A05F: 'ān,hàn',
-    0x2A060: 'jué',
-    0x2A061: 'yàn',
-    0x2A065: 'jù',
-    0x2A067: 'zhèn,chén',
-    0x2A069: 'zhì,tí',
-    0x2A06A: 'mǎng',
-    0x2A06E: 'xiù',
-    0x2A071: 'chuáng',
-    0x2A072: 'chū',
-    0x2A078: 'qiāng',
-    0x2A079: 'fēi',
-    0x2A07A: 'cháng,chǎng',
-    0x2A07C: 'mián',
-    0x2A07D: 'sù',
-    0x2A07E: 'ǎo,wò',
-    0x2A080: 'fǔ',
-    0x2A084: 'wèi',
-    0x2A085: 'zhī',
-    0x2A086: 'mín',
-    0x2A087: 'chāng',
-    0x2A088: 'yán',
-    0x2A089: 'yù',
-    0x2A08B: 'fù',
-    0x2A08C: 'tà',
-    0x2A08D: 'jǐ',
-    0x2A08F: 'fèi',
-    0x2A092: 'hú',
-    0x2A093: 'jū',
-    0x2A095: 'yǔ',
-    0x2A09B: 'qí',
-    0x2A09C: 'méi',
-    0x2A09F: 'biē',
-    0x2A0A0: 'guǒ',
-    0x2A0A4: 'mìng',
-    0x2A0A6: 'wǎn,yuān',
-    0x2A0A7: 'wǎn',
-    0x2A0B4: 'jīng',
-    0x2A0B5: 'yù',
-    0x2A0B6: 'xián',
-    0x2A0B9: 'chūn',
-    0x2A0BA: 'jí',
-    0x2A0BC: 'xiāng',
-    0x2A0BD: 'pén',
-    0x2A0BE: 'fù',
-    0x2A0C2: 'liú',
-    0x2A0C4: 'sāi',
-    0x2A0C5: 'xuē',
-    0x2A0C6: 'zòu',
-    0x2A0C8: 'jié',
-    0x2A0CB: 'zhān,jiān',
-    0x2A0CD: 'yú',
-    0x2A0CE: 'yú',
-    0x2A0CF: 'méi',
-    0x2A0D0: 'miǎo',
-    0x2A0D1: 'mào',
-    0x2A0D2: 'duó',
-    0x2A0D3: 'fù',
-    0x2A0DB: 'jiàn',
-    0x2A0E6: 'miáo',
-    0x2A0E8: 'āo',
-    0x2A0ED: 'kè',
-    0x2A0F6: 'hóu',
-    0x2A0FA: 'gòu',
-    0x2A0FC: 'xī',
-    0x2A0FE: 'róng',
-    0x2A0FF: 'gē',
-    0x2A100: 'pán',
-    0x2A101: 'yuán',
-    0x2A102: 'xià',
-    0x2A105: 'shā',
-    0x2A106: 'pī,pí',
-    0x2A108: 'qíng',
-    0x2A109: 'yōng',
-    0x2A10A: 'qú',
-    0x2A10C: 'gòng',
-    0x2A10E: 'gé',
-    0x2A10F: 'xiān',
-    0x2A111: 'sù',
-    0x2A115: 'bān',
-    0x2A116: 'qí',
-    0x2A117: 'hòu',
-    0x2A11B: 'xī',
-    0x2A11D: 'wū',
-    0x2A12D: 'qī',
-    0x2A12E: 'hù,gù',
-    0x2A12F: 'guī',
-    0x2A131: 'dí',
-    0x2A132: 'shāng',
-    0x2A133: 'mài',
-    0x2A134: 'mǐn',
-    0x2A135: 'jì',
-    0x2A136: 'xí',
-    0x2A137: 'xiān',
-    0x2A138: 'jí',
-    0x2A139: 'cháng',
-    0x2A13A: 'kòu',
-    0x2A13B: 'chōng,zhuāng',
-    0x2A142: 'zhāng',
-    0x2A143: 'piǎo,piāo',
-    0x2A144: 'sù',
-    0x2A145: 'lüè',
-    0x2A146: 'lí',
-    0x2A147: 'mèng',
-    0x2A148: 'chōng',
-    0x2A149: 'tiān',
-    0x2A14B: 'líng',
-    0x2A14D: 'chì',
-    0x2A156: 'chōng,zhuāng',
-    0x2A159: 'chì',
-    0x2A15D: 'niǎo',
-    0x2A15F: 'yóng',
-    0x2A16E: 'mì',
-    0x2A170: 'shū',
-    0x2A172: 'xì',
-    0x2A174: 'è',
-    0x2A175: 'zī',
-    0x2A178: 'jié',
-    0x2A179: 'jī',
-    0x2A17A: 'hōu',
-    0x2A17B: 'shèng',
-    0x2A17C: 'lì',
-    0x2A17E: 'qī',
-    0x2A180: 'zhōu',
-    0x2A181: 'sī',
-    0x2A182: 'qú',
-    0x2A18B: 'xié',
-    0x2A197: 'sī',
-    0x2A19B: 'xū',
-    0x2A1A0: 'fù',
-    0x2A1AF: 'nóng',
-    0x2A1B0: 'yà',
-    0x2A1B1: 'liú',
-    0x2A1B2: 'jiǎ,zhān',
-    0x2A1B3: 'guī',
-    0x2A1B4: 'kuí',
-    0x2A1B5: 'chì',
-    0x2A1B6: 'càn',
-    0x2A1B7: 'chú',
-    0x2A1B9: 'guō',
-    0x2A1BB: 'dǎn',
-    0x2A1BF: 'jiàn',
-    0x2A1C1: 'dāng',
-    0x2A1C2: 'hòu',
-    0x2A1C4: 'kòu,kū',
-    0x2A1C6: 'chù,dú',
-    0x2A1C7: 'qiān',
-    0x2A1C8: 'ài',
-    0x2A1CA: 'pì',
-    0x2A1D1: 'xùn',
-    0x2A1D2: 'jīng',
-    0x2A1D3: 'mèng',
-    0x2A1D5: 'bīn',
-    0x2A1D6: 'lán',
-    0x2A1D7: 'gǔ',
-    0x2A1D8: 'chóu,táo',
-    0x2A1DB: 'yōng',
-    0x2A1DC: 'guá',
-    0x2A1DD: 'yú',
-    0x2A1DE: 'zhòu',
-    0x2A1ED: 'cài',
-    0x2A1EF: 'liú',
-    0x2A1F0: 'bǔ',
-    0x2A1F1: 'luò',
-    0x2A1F2: 'jié',
-    0x2A1F3: 'zhēn',
-    0x2A1F4: 'miè',
-    0x2A1F5: 'guǎng',
-    0x2A1F7: 'jiá',
-    0x2A1F9: 'là',
-    0x2A200: 'shòu',
-    0x2A203: 'guō',
-    0x2A206: 'mèng',
-    0x2A207: 'qián',
-    0x2A208: 'lài',
-    0x2A20A: 'hé',
-    0x2A20B: 'tuán',
-    0x2A211: 'huī',
-    0x2A218: 'hōng',
-    0x2A21C: 'lǚ',
-    0x2A21F: 'jiá',
-    0x2A225: 'guī',
-    0x2A228: 'yī',
-    0x2A229: 'huān',
-    0x2A230: 'luó',
-    0x2A234: 'jué',
-    0x2A238: 'guàn',
-    0x2A23B: 'quán',
-    0x2A23C: 'niǎo',
-    0x2A23F: 'mán',
-    0x2A242: 'yùn',
-    0x2A243: 'wén',
-    0x2A244: 'chì',
-    0x2A245: 'chì',
-    0x2A246: 'zhī',
-    0x2A248: 'cí',
-    0x2A249: 'zhuàng',
-    0x2A24A: 'huá',
-    0x2A24B: 'jié',
-    0x2A24C: 'qú',
-    0x2A24D: 'tū',
-    0x2A24E: 'mín',
-    0x2A24F: 'méi',
-    0x2A250: 'yú',
-    0x2A251: 'áo',
-    0x2A252: 'bān',
-    0x2A254: 'pī',
-    0x2A255: 'zhēn',
-    0x2A256: 'lǔ',
-    0x2A257: 'chì',
-    0x2A258: 'tóu',
-    0x2A25A: 'jiē',
-    0x2A25C: 'zhān',
-    0x2A262: 'jīn',
-    0x2A263: 'lǔ',
-    0x2A266: 'jiàn,jiǎn,gàn',
-    0x2A267: 'tàn',
-    0x2A268: 'chāng',
-    0x2A26A: 'cì',
-    0x2A26D: 'wāi',
-    0x2A26E: 'còu',
-    0x2A26F: 'kàn',
-    0x2A271: 'biàn',
-    0x2A278: 'wēn',
-    0x2A27B: 'qiān',
-    0x2A27F: 'gàn',
-    0x2A282: 'huì',
-    0x2A284: 'gǎn,gàn',
-    0x2A286: 'jì',
-    0x2A287: 'gàn,tàn',
-    0x2A289: 'huái',
-    0x2A28D: 'sì',
-    0x2A290: 'fū',
-    0x2A295: 'pí',
-    0x2A297: 'cā',
-    0x2A29C: 'bèn',
-    0x2A2A2: 'shí,shǐ',
-    0x2A2A5: 'huán',
-    0x2A2A7: 'guī',
-    0x2A2AA: 'ǒu',
-    0x2A2B3: 'páo',
-    0x2A2B5: 'yǐng',
-    0x2A2B6: 'tǐng',
-    0x2A2B7: 'xiào',
-    0x2A2B9: 'zhù',
-    0x2A2BB: 'yú',
-    0x2A2C1: 'jiàn',
-    0x2A2C4: 'qǔ',
-    0x2A2C5: 'wǎn',
-    0x2A2C6: 'kūn',
-    0x2A2C7: 'zhuī',
-    0x2A2C9: 'yù',
-    0x2A2CA: 'guǒ',
-    0x2A2CB: 'píng',
-    0x2A2CC: 'zuǐ',
-    0x2A2CD: 'zú',
-    0x2A2CF: 'zhū',
-    0x2A2D0: 'nuàn',
-    0x2A2D1: 'zhū',
-    0x2A2D6: 'piāo',
-    0x2A2D7: 'mí',
-    0x2A2DC: 'bì',
-    0x2A2DD: 'sù',
-    0x2A2E1: 'pú',
-    0x2A2E2: 'mí',
-    0x2A2EB: 'yè',
-    0x2A2EC: 'yǔ',
-    0x2A2EE: 'yù',
-    0x2A2F0: 'zhǔ',
-    0x2A2F3: 'líng',
-    0x2A2FA: 'nòu',
-    0x2A2FE: 'líng',
-    0x2A300: 'liǎo',
-    0x2A302: 'tuō',
-    0x2A304: 'bǐ',
-    0x2A305: 'nà',
-    0x2A306: 'qú',
-    0x2A308: 'pí',
-    0x2A309: 'dǒu',
-    0x2A30A: 'niè',
-    0x2A30B: 'tún',
-    0x2A30D: 'jī',
-    0x2A30F: 'líng',
-    0x2A313: 'kù',
-    0x2A314: 'sù',
-    0x2A318: 'tǒu',
-    0x2A31E: 'nái',
-    0x2A31F: 'zé',
-    0x2A322: 'tǒng',
-    0x2A323: 'gé',
-    0x2A324: 'duī',
-    0x2A327: 'jié',
-    0x2A329: 'tián',
-    0x2A32A: 'tiào',
-    0x2A32B: 'chí',
-    0x2A32C: 'qū,chǎo',
-    0x2A32E: 'shā,suō',
-    0x2A330: 'bó',
-    0x2A331: 'lí',
-    0x2A333: 'luò',
-    0x2A335: 'liáo',
-    0x2A336: 'shù',
-    0x2A337: 'děng',
-    0x2A339: 'chī',
-    0x2A33A: 'miè',
-    0x2A33C: 'táo',
-    0x2A33D: 'hún',
-    0x2A33F: 'nié',
-    0x2A341: 'jùn',
-    0x2A342: 'hù',
-    0x2A344: 'lù',
-    0x2A345: 'yè',
-    0x2A347: 'mò,chǎo,mài',
-    0x2A348: 'chào',
-    0x2A34C: 'suò',
-    0x2A34E: 'kē',
-    0x2A34F: 'fù',
-    0x2A351: 'chǎo',
-    0x2A354: 'suǒ',
-    0x2A357: 'qiū',
-    0x2A35B: 'sù,xiè',
-    0x2A35D: 'yùn',
-    0x2A35F: 'suǒ',
-    0x2A360: 'kū',
-    0x2A361: 'bó',
-    0x2A363: 'lǒu',
-    0x2A364: 'mò',
-    0x2A366: 'liǎn',
-    0x2A367: 'xuàn',
-    0x2A368: 'suǒ',
-    0x2A369: 'mán',
-    0x2A36A: 'bì',
-    0x2A372: 'tì',
-    0x2A374: 'lián',
-    0x2A375: 'tán',
-    0x2A376: 'shàn',
-    0x2A378: 'qú',
-    0x2A379: 'dú',
-    0x2A37A: 'huán,huàn',
-    0x2A37B: 'sào',
-    0x2A37F: 'kuàng',
-    0x2A383: 'niè',
-    0x2A385: 'niè',
-    0x2A386: 'luó',
-    0x2A387: 'zuó',
-    0x2A388: 'yì',
-    0x2A389: 'xiàn',
-    0x2A38A: 'chǎo',
-    0x2A38B: 'tiè',
-    0x2A392: 'shuò',
-    0x2A394: 'mǐ',
-    0x2A397: 'mí',
-    0x2A39B: 'wǎn',
-    0x2A39D: 'bèn',
-    0x2A39E: 'qiāng',
-    0x2A3A0: 'mǒ',
-    0x2A3A3: 'liú',
-    0x2A3A4: 'wò',
-    0x2A3A6: 'měi',
-    0x2A3A8: 'tóu',
-    0x2A3AB: 'mǔ',
-    0x2A3AD: 'méi',
-    0x2A3B2: 'zuò',
-    0x2A3B4: 'tún',
-    0x2A3B5: 'kàng',
-    0x2A3B6: 'tún',
-    0x2A3BA: 'chè',
-    0x2A3BB: 'zhèng',
-    0x2A3BD: 'chōng',
-    0x2A3BE: 'tiān',
-    0x2A3C0: 'zhì',
-    0x2A3C1: 'chán',
-    0x2A3C2: 'chán',
-    0x2A3C5: 'qīng',
-    0x2A3C6: 'tūn',
-    0x2A3C7: 'huǐ',
-    0x2A3C8: 'què',
-    0x2A3C9: 'zhān',
-    0x2A3CA: 'jiān,miǎn',
-    0x2A3CB: 'chán',
-    0x2A3CD: 'huáng',
-    0x2A3CF: 'huī',
-    0x2A3D0: 'chí',
-    0x2A3D2: 'huáng',
-    0x2A3D3: 'héng',
-    0x2A3D4: 'yǔn',
-    0x2A3D6: 'tuān',
-    0x2A3D7: 'biān',
-    0x2A3D9: 'huáng',
-    0x2A3DA: 'yǔn',
-    0x2A3DF: 'mò',
-    0x2A3E0: 'gōng',
-    0x2A3E2: 'gōng',
-    0x2A3E4: 'guì',
-    0x2A3E6: 'chán',
-    0x2A3E8: 'què',
-    0x2A3E9: 'ruì',
-    0x2A3EA: 'kuàng',
-    0x2A3EB: 'piào',
-    0x2A3EE: 'rǔ',
-    0x2A3F2: 'niǔ',
-    0x2A3F3: 'hù',
-    0x2A3F4: 'jǐn',
-    0x2A3F5: 'nì,lí',
-    0x2A3F6: 'bào',
-    0x2A3F8: 'nǐ,chī',
-    0x2A3FA: 'bì',
-    0x2A3FB: 'hú',
-    0x2A3FC: 'lí',
-    0x2A3FF: 'zhū',
-    0x2A400: 'nǎ',
-    0x2A402: 'quǎn',
-    0x2A403: 'fěng',
-    0x2A404: 'bǐ',
-    0x2A405: 'lí',
-    0x2A406: 'bié',
-    0x2A407: 'nián',
-    0x2A408: 'dǒng',
-    0x2A40B: 'lián',
-    0x2A40C: 'nì',
-    0x2A40D: 'lián',
-    0x2A40E: 'má',
-    0x2A40F: 'zhé,zhí',
-    0x2A413: 'jiā',
-    0x2A414: 'yí',
-    0x2A416: 'lǒng',
-    0x2A418: 'yì,yān',
-    0x2A41D: 'dài,tài',
-    0x2A41E: 'dù',
-    0x2A423: 'yǐ',
-    0x2A425: 'tài',
-    0x2A426: 'hāng',
-    0x2A427: 'shù',
-    0x2A42C: 'wán',
-    0x2A42E: 'sù',
-    0x2A42F: 'yǎo',
-    0x2A430: 'èr',
-    0x2A432: 'zhèn',
-    0x2A43A: 'dòu',
-    0x2A43B: 'jiān',
-    0x2A43F: 'pāng',
-    0x2A440: 'huī',
-    0x2A442: 'chà',
-    0x2A443: 'shān',
-    0x2A444: 'lú',
-    0x2A446: 'yù',
-    0x2A448: 'yàn',
-    0x2A449: 'wǎn',
-    0x2A44A: 'qiào',
-    0x2A44B: 'luō',
-    0x2A44C: 'yù',
-    0x2A44F: 'tú',
-    0x2A450: 'wèi',
-    0x2A452: 'tùn',
-    0x2A455: 'hǔn',
-    0x2A456: 'bēn',
-    0x2A457: 'qiè',
-    0x2A459: 'jīn,qián',
-    0x2A45A: 'lái,lí',
-    0x2A45C: 'zhǐ',
-    0x2A45D: 'yú',
-    0x2A45F: 'cì',
-    0x2A466: 'yè',
-    0x2A467: 'dié',
-    0x2A468: 'chà',
-    0x2A469: 'diàn',
-    0x2A46A: 'mán',
-    0x2A46C: 'dèng',
-    0x2A46D: 'wēi',
-    0x2A46E: 'niǎn',
-    0x2A46F: 'lèi',
-    0x2A470: 'bīng',
-    0x2A471: 'wū,wò',
-    0x2A473: 'zhěn',
-    0x2A476: 'róu',
-    0x2A477: 'wài',
-    0x2A478: 'mì,yān',
-    0x2A479: 'jiè',
-    0x2A47B: 'hóu',
-    0x2A47D: 'zhài',
-    0x2A47E: 'rǔ',
-    0x2A47F: 'zī',
-    0x2A480: 'pán',
-    0x2A482: 'mò',
-    0x2A484: 'mì',
-    0x2A486: 'qī',
-    0x2A487: 'mò',
-    0x2A48A: 'zhī',
-    0x2A48B: 'bān,pán',
-    0x2A48D: 'miè',
-    0x2A48F: 'lù',
-    0x2A491: 'qī',
-    0x2A492: 'chōng',
-    0x2A494: 'lí',
-    0x2A495: 'yì',
-    0x2A498: 'dèng',
-    0x2A499: 'cuō',
-    0x2A49B: 'duì',
-    0x2A49C: 'mà',
-    0x2A49D: 'yǎn',
-    0x2A49F: 'zèng',
-    0x2A4A0: 'yǎn,ǎn,àn',
-    0x2A4A1: 'duì,dài',
-    0x2A4A2: 'pū',
-    0x2A4A5: 'yuè',
-    0x2A4A9: 'huò',
-    0x2A4AA: 'mài',
-    0x2A4AB: 'jiǎn',
-    0x2A4AC: 'nóng',
-    0x2A4AD: 'qín',
-    0x2A4AF: 'qín',
-    0x2A4B2: 'yè',
-    0x2A4B4: 'tái',
-    0x2A4B9: 'jiān',
-    0x2A4BC: 'chá',
-    0x2A4BE: 'dàn',
-    0x2A4BF: 'téng',
-    0x2A4C0: 'lì',
-    0x2A4C3: 'niǎng',
-    0x2A4C4: 'chán',
-    0x2A4C5: 'zāng',
-    0x2A4CA: 'yù',
-    0x2A4CC: 'zuì',
-    0x2A4CD: 'biān',
-    0x2A4D0: 'chǔ',
-    0x2A4D8: 'rán',
-    0x2A4DA: 'rán',
-    0x2A4DB: 'yāng',
-    0x2A4DC: 'bǒ',
-    0x2A4E1: 'cù',
-    0x2A4EC: 'mí',
-    0x2A4EE: 'kě',
-    0x2A4F0: 'cù',
-    0x2A4F7: 'xí',
-    0x2A4F9: 'má',
-    0x2A4FB: 'shī',
-    0x2A4FC: 'diān',
-    0x2A4FF: 'shī',
-    0x2A502: 'dǐng',
-    0x2A503: 'jiōng',
-    0x2A505: 'yuán',
-    0x2A506: 'gān',
-    0x2A50A: 'huì',
-    0x2A50B: 'jī',
-    0x2A50D: 'péng',
-    0x2A50F: 'dēng',
-    0x2A511: 'bèng',
-    0x2A514: 'pāng,péng',
-    0x2A515: 'tà,lóng',
-    0x2A517: 'yuān',
-    0x2A518: 'gāo',
-    0x2A519: 'yuān',
-    0x2A51F: 'jiā',
-    0x2A523: 'kōng',
-    0x2A526: 'dòng',
-    0x2A529: 'xián',
-    0x2A52A: 'qì',
-    0x2A52C: 'sāng',
-    0x2A530: 'yìn',
-    0x2A533: 'lóng',
-    0x2A536: 'tēng',
-    0x2A537: 'lóng',
-    0x2A53A: 'rèn',
-    0x2A53D: 'yìn',
-    0x2A53E: 'píng',
-    0x2A53F: 'pū',
-    0x2A540: 'yuán',
-    0x2A541: 'rǒng,chén',
-    0x2A543: 'fāng',
-    0x2A547: 'hāng',
-    0x2A548: 'mí',
-    0x2A549: 'hú',
-    0x2A54A: 'zī',
-    0x2A54C: 'líng',
-    0x2A54D: 'jiōng',
-    0x2A54E: 'rǒng',
-    0x2A552: 'píng',
-    0x2A553: 'guāng',
-    0x2A554: 'ěr',
-    0x2A55D: 'cù',
-    0x2A55E: 'jùn',
-    0x2A566: 'xiǔ',
-    0x2A568: 'ér',
-    0x2A569: 'tì',
-    0x2A56B: 'yáng',
-    0x2A56D: 'ài',
-    0x2A56E: 'hú',
-    0x2A56F: 'xí,xié',
-    0x2A571: 'hú',
-    0x2A573: 'sī',
-    0x2A574: 'lǐ',
-    0x2A576: 'yì',
-    0x2A577: 'gǔ',
-    0x2A579: 'táng',
-    0x2A580: 'què',
-    0x2A581: 'zōng',
-    0x2A582: 'lí',
-    0x2A584: 'jiào',
-    0x2A587: 'fán',
-    0x2A588: 'pú',
-    0x2A589: 'sī',
-    0x2A58B: 'jié',
-    0x2A58C: 'lú',
-    0x2A58D: 'lì',
-    0x2A58E: 'chán',
-    0x2A590: 'yào,yà',
-    0x2A595: 'huī',
-    0x2A599: 'hōu',
-    0x2A59A: 'diān',
-    0x2A59B: 'qiù',
-    0x2A59C: 'jué',
-    0x2A59E: 'pì',
-    0x2A5A2: 'kuī',
-    0x2A5A5: 'xǐ',
-    0x2A5A6: 'tī',
-    0x2A5A9: 'xù',
-    0x2A5AF: 'biǎn',
-    0x2A5B2: 'hē',
-    0x2A5B3: 'lián',
-    0x2A5B6: 'sù',
-    0x2A5B7: 'liào',
-    0x2A5BC: 'jīn',
-    0x2A5C1: 'lì',
-    0x2A5C2: 'chán',
-    0x2A5C5: 'qí',
-    0x2A5C6: 'qí',
-    0x2A5C9: 'zī',
-    0x2A5CB: 'zī',
-    0x2A5CD: 'qí',
-    0x2A5CF: 'qí',
-    0x2A5D0: 'zī',
-    0x2A5D2: 'zhāi',
-    0x2A5D3: 'zhāi',
-    0x2A5D4: 'pà',
-    0x2A5D6: 'jū',
-    0x2A5D9: 'yǎn',
-    0x2A5DC: 'háng',
-    0x2A5DD: 'nà',
-    0x2A5E4: 'yǎn',
-    0x2A5E6: 'zhàn',
-    0x2A5E7: 'shǐ',
-    0x2A5E8: 'zhí',
-    0x2A5ED: 'zhā',
-    0x2A5F4: 'rǒng',
-    0x2A5F5: 'zhā',
-    0x2A5F7: 'yì',
-    0x2A5F8: 'míng',
-    0x2A5F9: 'yá',
-    0x2A5FB: 'zhì',
-    0x2A5FD: 'kuò,huá',
-    0x2A5FE: 'xiá',
-    0x2A600: 'pián',
-    0x2A601: 'tà,xiá',
-    0x2A603: 'yǐ',
-    0x2A606: 'xiū',
-    0x2A607: 'zhāi',
-    0x2A609: 'duǒ',
-    0x2A60A: 'è',
-    0x2A60E: 'yín,niè',
-    0x2A610: 'è',
-    0x2A611: 'suān',
-    0x2A612: 'ān',
-    0x2A613: 'cuó',
-    0x2A615: 'tuó',
-    0x2A617: 'tuó',
-    0x2A618: 'xiá',
-    0x2A61B: 'chuò',
-    0x2A61D: 'suān',
-    0x2A625: 'jì',
-    0x2A626: 'qiǎn',
-    0x2A627: 'zú',
-    0x2A628: 'zhāi',
-    0x2A629: 'yǔn,kǔn',
-    0x2A62A: 'zhàn',
-    0x2A62C: 'yí,yà,yá',
-    0x2A632: 'yá,yí,yà,cī',
-    0x2A633: 'yuē',
-    0x2A639: 'hé',
-    0x2A63A: 'qià',
-    0x2A63E: 'chā',
-    0x2A643: 'óu',
-    0x2A648: 'hú',
-    0x2A64A: 'yàn',
-    0x2A64C: 'qiè',
-    0x2A64D: 'bó',
-    0x2A64E: 'qiāng',
-    0x2A64F: 'jiè,jiá',
-    0x2A65B: 'nì',
-    0x2A65E: 'chǎn',
-    0x2A65F: 'qǐn',
-    0x2A661: 'zāo',
-    0x2A664: 'yǐn',
-    0x2A665: 'xiè',
-    0x2A667: 'qí',
-    0x2A668: 'jiàn,jiān',
-    0x2A66B: 'xū',
-    0x2A66D: 'zèng',
-    0x2A66F: 'è',
-    0x2A673: 'zū',
-    0x2A674: 'yǐ',
-    0x2A679: 'zhí',
-    0x2A67A: 'lì',
-    0x2A67D: 'lì',
-    0x2A67E: 'yín',
-    0x2A681: 'lián',
-    0x2A683: 'chán',
-    0x2A685: 'jué',
-    0x2A687: 'zá',
-    0x2A68E: 'zhāi',
-    0x2A68F: 'pián',
-    0x2A691: 'lóng',
-    0x2A693: 'lóng',
-    0x2A698: 'lóng',
-    0x2A69D: 'lóng',
-    0x2A6A0: 'lóng',
-    0x2A6A2: 'mǎng',
-    0x2A6A5: 'zhé',
-    0x2A6AC: 'gàn',
-    0x2A6AD: 'gōu',
-    0x2A6AE: 'rán',
-    0x2A6AF: 'cù',
-    0x2A6B0: 'jiāo',
-    0x2A6B7: 'bǒ',
-    0x2A6B9: 'zhù',
-    0x2A6BA: 'qiū',
-    0x2A6BB: 'yāng',
-    0x2A6C0: 'xiào',
-    0x2A6C2: 'huí',
-    0x2A6C3: 'qū',
-    0x2A6C8: 'líng',
-    0x2A6CA: 'yín',
-    0x2A6CE: 'pì',
-    0x2A6D2: 'lián',
-    0x2A79D: 'duó',
-    0x2A7DD: 'jì,jī',
-    0x2A848: 'bái',
-    0x2A84F: 'zhān',
-    0x2A8AE: 'luán',
-    0x2A8FB: 'lóu',
-    0x2A917: 'liào',
-    0x2AA0A: 'sóng',
-    0x2AA17: 'juē',
-    0x2AA30: 'qū',
-    0x2AA36: 'shē',
-    0x2AA58: 'yǎn',
-    0x2AA9D: 'yōng',
-    0x2AEB9: 'nǔ',
-    0x2AED0: 'cōng',
-    0x2AFA2: 'xiàn',
-    0x2B061: 'lì',
-    0x2B088: 'fèi',
-    0x2B099: 'sù',
-    0x2B0DC: 'kòu',
-    0x2B127: 'yán',
-    0x2B128: 'chī',
-    0x2B137: 'yì',
-    0x2B138: 'xūn',
-    0x2B1ED: 'wěi',
-    0x2B230: 'qià',
-    0x2B2D0: 'gǒng',
-    0x2B300: 'jī',
-    0x2B328: 'luó',
-    0x2B359: 'yì',
-    0x2B35F: 'yí',
-    0x2B362: 'náo',
-    0x2B363: 'tóng',
-    0x2B36F: 'xián',
-    0x2B370: 'xǐ',
-    0x2B372: 'xiǎo',
-    0x2B37D: 'xuān',
-    0x2B3CB: 'juē,qiāo',
-    0x2B404: 'yuè',
-    0x2B406: 'kuài',
-    0x2B409: 'líng',
-    0x2B410: 'ní',
-    0x2B413: 'bù,róu',
-    0x2B461: 'méng',
-    0x2B4B6: 'hán',
-    0x2B4E7: 'fū',
-    0x2B4E9: 'cōng',
-    0x2B4EF: 'jī',
-    0x2B4F6: 'xuān',
-    0x2B4F9: 'jī',
-    0x2B50D: 'fán',
-    0x2B50E: 'jué',
-    0x2B536: 'niè',
-    0x2B5AE: 'yǐ',
-    0x2B5AF: 'fǔ',
-    0x2B5B3: 'yūn',
-    0x2B5E0: 'zhāng',
-    0x2B5E6: 'bù',
-    0x2B5E7: 'sù',
-    0x2B5EE: 'huáng',
-    0x2B5F4: 'zhān',
-    0x2B61C: 'wén',
-    0x2B61D: 'jué',
-    0x2B623: 'hàn',
-    0x2B624: 'ái',
-    0x2B626: 'táo',
-    0x2B627: 'lù',
-    0x2B628: 'tí',
-    0x2B62A: 'yuán',
-    0x2B62C: 'xí',
-    0x2B688: 'xù',
-    0x2B689: 'hóng',
-    0x2B692: 'fú',
-    0x2B694: 'huí',
-    0x2B695: 'shī',
-    0x2B696: 'cǐ',
-    0x2B699: 'pū',
-    0x2B6AD: 'liè',
-    0x2B6DB: 'zhī',
-    0x2B6DE: 'jué',
-    0x2B6E2: 'níng',
-    0x2B6ED: 'kuáng',
-    0x2B6F6: 'chì',
-    0x2B6F8: 'tí',
-    0x2B7A9: 'mén',
-    0x2B7C5: 'liáng',
-    0x2B7E6: 'suì',
-    0x2B7F7: 'lì',
-    0x2B7F9: 'hóng',
-    0x2B7FC: 'dá',
-    0x2B806: 'kuǐ',
-    0x2B80A: 'xuán',
-    0x2B81C: 'ní',
-    0x2B851: 'yīn',
-    0x2B8B8: 'dàn',
-    0x2BAC7: 'ě,è',
-    0x2BB5F: 'ōu,qū',
-    0x2BB62: 'lǔn',
-    0x2BB7C: 'láo',
-    0x2BB83: 'shàn',
-    0x2BC1B: 'xíng',
-    0x2BD77: 'lì',
-    0x2BD87: 'dié',
-    0x2BDF7: 'xīn',
-    0x2BE29: 'kōu',
-    0x2C029: 'wěi',
-    0x2C02A: 'xiàn',
-    0x2C0A9: 'jiā',
-    0x2C0CA: 'zhì',
-    0x2C1D5: 'wàn',
-    0x2C1D9: 'pèi,bèi',
-    0x2C1F9: 'guó',
-    0x2C27C: 'ōu,ǒu',
-    0x2C288: 'xún',
-    0x2C2A4: 'chǎn',
-    0x2C317: 'hé',
-    0x2C35B: 'lì',
-    0x2C361: 'dàng',
-    0x2C364: 'xún',
-    0x2C488: 'què',
-    0x2C494: 'gěng',
-    0x2C497: 'lán',
-    0x2C4FC: 'tuí',
-    0x2C542: 'gōng,lǒng',
-    0x2C613: 'xún',
-    0x2C618: 'dǎn',
-    0x2C621: 'yīn',
-    0x2C629: 'tīng',
-    0x2C62B: 'huán',
-    0x2C62C: 'qiàn',
-    0x2C62D: 'lín,chēn',
-    0x2C62F: 'zhǔn',
-    0x2C642: 'yǎn',
-    0x2C64A: 'mò',
-    0x2C64B: 'xiāng',
-    0x2C72C: 'màn',
-    0x2C72F: 'liǎng',
-    0x2C79F: 'pín',
-    0x2C7C1: 'yì',
-    0x2C7FD: 'dōng',
-    0x2C8D9: 'xū',
-    0x2C8DE: 'zhǔ',
-    0x2C8E1: 'jiàn',
-    0x2C8F3: 'hěn',
-    0x2C907: 'yīn',
-    0x2C90A: 'shì',
-    0x2C91D: 'huì',
-    0x2C925: 'zhuàn',
-    0x2CA02: 'qí',
-    0x2CA0E: 'yóu',
-    0x2CA7D: 'xún',
-    0x2CAA9: 'nóng',
-    0x2CB29: 'yì',
-    0x2CB2D: 'lún',
-    0x2CB2E: 'chǎng',
-    0x2CB31: 'jīn',
-    0x2CB38: 'shù',
-    0x2CB39: 'shén',
-    0x2CB3B: 'lú',
-    0x2CB3F: 'zhāo',
-    0x2CB41: 'mǔ',
-    0x2CB4A: 'dù',
-    0x2CB4E: 'hóng',
-    0x2CB5A: 'chún',
-    0x2CB5B: 'bō',
-    0x2CB64: 'hóu',
-    0x2CB69: 'wēng',
-    0x2CB6C: 'wèi,huì',
-    0x2CB6F: 'piě',
-    0x2CB73: 'xǐ',
-    0x2CB76: 'hēi',
-    0x2CB78: 'lín',
-    0x2CB7C: 'suì',
-    0x2CBB1: 'yīn',
-    0x2CBBF: 'qí,gài',
-    0x2CBC0: 'jī',
-    0x2CBCE: 'tuí',
-    0x2CC56: 'dí',
-    0x2CC5F: 'wěi',
-    0x2CCF5: 'pī',
-    0x2CCF6: 'jiōng',
-    0x2CCFD: 'shēn',
-    0x2CCFF: 'tú',
-    0x2CD02: 'fēi',
-    0x2CD03: 'huō',
-    0x2CD0A: 'lín',
-    0x2CD8B: 'jū',
-    0x2CD8D: 'tuó',
-    0x2CD8F: 'wéi',
-    0x2CD90: 'zhào',
-    0x2CD9F: 'là',
-    0x2CDA0: 'liàn',
-    0x2CDA8: 'jì',
-    0x2CDAD: 'jì',
-    0x2CDAE: 'xǐ',
-    0x2CDD5: 'bū,bǔ',
-    0x2CE18: 'yǎn',
-    0x2CE1A: 'yuè',
-    0x2CE23: 'xiān',
-    0x2CE26: 'zhuó',
-    0x2CE2A: 'fán',
-    0x2CE7C: 'xiè',
-    0x2CE88: 'yǐ',
-    0x2CE93: 'chǔ',
-    0x30EDD: 'biáng',
-    0x30EDE: 'biáng',
-}
+# 合并了 pinyin_dict_<区块名>.py 中的所有区块，详见 pypinyin.block_dict
+from importlib import import_module
+
+pinyin_dict = {}
+for _name in ('basic', 'ext_a', 'compat', 'ext_b', 'ext_c', 'ext_d', 'ext_efg'):
+    pinyin_dict.update(
+        import_module('pypinyin.pinyin_dict_' + _name).pinyin_dict)
@@ -0,0 +1,20978 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+pinyin_dict = {
+    0x3007: 'líng,yuán,xīng',
+    0x4E00: 'yī,yí,yì',
+    0x4E01: 'dīng,zhēng',
+    0x4E02: 'kǎo,qiǎo,yú',
+    0x4E03: 'qī,qí',
+    0x4E04: 'shàng',
+    0x4E05: 'xià',
+    0x4E06: 'hǎn',
+    0x4E07: 'wàn,mò',
+    0x4E08: 'zhàng',
+    0x4E09: 'sān',
+    0x4E0A: 'shàng,shǎng',
+    0x4E0B: 'xià',
+    0x4E0C: 'jī,qí',
+    0x4E0D: 'bù,fǒu,fōu,fū,bú',
+    0x4E0E: 'yǔ,yù,yú',
+    0x4E0F: 'miǎn',
+    0x4E10: 'gài',
+    0x4E11: 'chǒu',
+    0x4E12: 'chǒu',
+    0x4E13: 'zhuān',
+    0x4E14: 'qiě,jū,cú',
+    0x4E15: 'pī',
+    0x4E16: 'shì',
+    0x4E17: 'shì',
+    0x4E18: 'qiū',
+    0x4E19: 'bǐng,bìng',
+    0x4E1A: 'yè',
+    0x4E1B: 'cóng',
+    0x4E1C: 'dōng',
+    0x4E1D: 'sī',
+    0x4E1E: 'chéng,shèng,zhēng,zhěng',
+    0x4E1F: 'diū',
+    0x4E20: 'qiū',
+    0x4E21: 'liǎng',
+    0x4E22: 'diū',
+    0x4E23: 'yǒu',
+    0x4E24: 'liǎng',
+    0x4E25: 'yán',
+    0x4E26: 'bìng,bàn,bàng',
+    0x4E27: 'sàng,sāng',
+    0x4E28: 'gǔn',
+    0x4E29: 'jiū',
+    0x4E2A: 'gè,gě,gàn',
+    0x4E2B: 'yā',
+    0x4E2C: 'qiáng',
+    0x4E2D: 'zhōng,zhòng',
+    0x4E2E: 'jǐ',
+    0x4E2F: 'jiè',
+    0x4E30: 'fēng',
+    0x4E31: 'guàn,kuàng',
+    0x4E32: 'chuàn,guàn,quàn',
+    0x4E33: 'chǎn,chuàn',
+    0x4E34: 'lín',
+    0x4E35: 'zhuó',
+    0x4E36: 'zhǔ',
+    0x4E37: 'bā',
+    0x4E38: 'wán',
+    0x4E39: 'dān',
+    0x4E3A: 'wèi,wéi',
+    0x4E3B: 'zhǔ,zhù',
+    0x4E3C: 'jǐng,dǎn',
+    0x4E3D: 'lì,lí',
+    0x4E3E: 'jǔ',
+    0x4E3F: 'piě,yì',
+    0x4E40: 'fú',
+    0x4E41: 'yí,jí',
+    0x4E42: 'yì,ài',
+    0x4E43: 'nǎi,ǎi',
+    0x4E44: 'wǔ',
+    0x4E45: 'jiǔ',
+    0x4E46: 'jiǔ',
+    0x4E47: 'tuō,zhé',
+    0x4E48: 'me,yāo,mó,ma',
+    0x4E49: 'yì',
+    0x4E4A: 'yī',
+    0x4E4B: 'zhī,zhū,zhì',
+    0x4E4C: 'wū,wù',
+    0x4E4D: 'zhà,zuò',
+    0x4E4E: 'hū',
+    0x4E4F: 'fá',
+    0x4E50: 'lè,yuè',
+    0x4E51: 'yín,pān,zhòng',
+    0x4E52: 'pīng',
+    0x4E53: 'pāng',
+    0x4E54: 'qiáo',
+    0x4E55: 'hǔ',
+    0x4E56: 'guāi',
+    0x4E57: 'chéng',
+    0x4E58: 'chéng,shèng',
+    0x4E59: 'yǐ,yì,jué',
+    0x4E5A: 'yǐn',
+    0x4E5B: 'ya',
+    0x4E5C: 'miē,niè',
+    0x4E5D: 'jiǔ,jiū',
+    0x4E5E: 'qǐ,qì',
+    0x4E5F: 'yě,yí',
+    0x4E60: 'xí',
+    0x4E61: 'xiāng',
+    0x4E62: 'gài',
+    0x4E63: 'jiǔ',
+    0x4E64: 'xià',
+    0x4E65: 'hù',
+    0x4E66: 'shū',
+    0x4E67: 'dǒu',
+    0x4E68: 'shǐ',
+    0x4E69: 'jī',
+    0x4E6A: 'náng',
+    0x4E6B: 'jiā',
+    0x4E6C: 'jù',
+    0x4E6D: 'shí',
+    0x4E6E: 'mǎo',
+    0x4E6F: 'hū',
+    0x4E70: 'mǎi',
+    0x4E71: 'luàn',
+    0x4E72: 'zī',
+    0x4E73: 'rǔ',
+    0x4E74: 'xué',
+    0x4E75: 'yǎn',
+    0x4E76: 'fǔ',
+    0x4E77: 'shā',
+    0x4E78: 'nǎ',
+    0x4E79: 'gān',
+    0x4E7A: 'suǒ',
+    0x4E7B: 'yú',
+    0x4E7C: 'cui',
+    0x4E7D: 'zhě',
+    0x4E7E: 'qián,gān',
+    0x4E7F: 'zhì,luàn',
+    0x4E80: 'guī',
+    0x4E81: 'gān',
+    0x4E82: 'luàn',
+    0x4E83: 'lǐn,lìn',
+    0x4E84: 'yì',
+    0x4E85: 'jué',
+    0x4E86: 'le,liǎo,liào',
+    0x4E87: 'ma',
+    0x4E88: 'yǔ,yú,zhù',
+    0x4E89: 'zhēng',
+    0x4E8A: 'shì',
+    0x4E8B: 'shì,zì',
+    0x4E8C: 'èr',
+    0x4E8D: 'chù',
+    0x4E8E: 'yú,wéi,yū,xū',
+    0x4E8F: 'kuī,yú',
+    0x4E90: 'yú',
+    0x4E91: 'yún',
+    0x4E92: 'hù',
+    0x4E93: 'qí',
+    0x4E94: 'wǔ',
+    0x4E95: 'jǐng,jìng',
+    0x4E96: 'sì',
+    0x4E97: 'suì',
+    0x4E98: 'gèn,xuān,gèng',
+    0x4E99: 'gèn,gèng',
+    0x4E9A: 'yà',
+    0x4E9B: 'xiē,suò,suō',
+    0x4E9C: 'yà',
+    0x4E9D: 'qí,zhāi',
+    0x4E9E: 'yà,yā,è',
+    0x4E9F: 'jí,qì',
+    0x4EA0: 'tóu',
+    0x4EA1: 'wáng,wú',
+    0x4EA2: 'kàng,gāng,gēng',
+    0x4EA3: 'dà',
+    0x4EA4: 'jiāo',
+    0x4EA5: 'hài,jiē',
+    0x4EA6: 'yì',
+    0x4EA7: 'chǎn',
+    0x4EA8: 'hēng,xiǎng,pēng',
+    0x4EA9: 'mǔ',
+    0x4EAA: 'ye',
+    0x4EAB: 'xiǎng',
+    0x4EAC: 'jīng',
+    0x4EAD: 'tíng',
+    0x4EAE: 'liàng,liáng',
+    0x4EAF: 'xiǎng',
+    0x4EB0: 'jīng',
+    0x4EB1: 'yè',
+    0x4EB2: 'qīn,qìng',
+    0x4EB3: 'bó',
+    0x4EB4: 'yòu',
+    0x4EB5: 'xiè',
+    0x4EB6: 'dǎn,dàn,chán,zhān',
+    0x4EB7: 'lián',
+    0x4EB8: 'duǒ',
+    0x4EB9: 'wěi,mén',
+    0x4EBA: 'rén',
+    0x4EBB: 'rén',
+    0x4EBC: 'jí',
+    0x4EBD: 'jí',
+    0x4EBE: 'wáng',
+    0x4EBF: 'yì',
+    0x4EC0: 'shén,shí',
+    0x4EC1: 'rén',
+    0x4EC2: 'lè,lì',
+    0x4EC3: 'dīng,dǐng',
+    0x4EC4: 'zè',
+    0x4EC5: 'jǐn,fù,nú,jìn',
+    0x4EC6: 'pū,pú',
+    0x4EC7: 'chóu,qiú,jū',
+    0x4EC8: 'bā',
+    0x4EC9: 'zhǎng',
+    0x4ECA: 'jīn',
+    0x4ECB: 'jiè,gè',
+    0x4ECC: 'bīng',
+    0x4ECD: 'réng',
+    0x4ECE: 'cóng,zòng',
+    0x4ECF: 'fó',
+    0x4ED0: 'sǎn',
+    0x4ED1: 'lún',
+    0x4ED2: 'bīng',
+    0x4ED3: 'cāng',
+    0x4ED4: 'zǎi,zǐ,zī',
+    0x4ED5: 'shì',
+    0x4ED6: 'tā,tuó',
+    0x4ED7: 'zhàng',
+    0x4ED8: 'fù',
+    0x4ED9: 'xiān,xiǎn',
+    0x4EDA: 'xiān',
+    0x4EDB: 'tuō,duó,chà,zhé',
+    0x4EDC: 'hóng',
+    0x4EDD: 'tóng',
+    0x4EDE: 'rèn',
+    0x4EDF: 'qiān',
+    0x4EE0: 'gǎn,hàn',
+    0x4EE1: 'gē,yì,wù',
+    0x4EE2: 'bó',
+    0x4EE3: 'dài',
+    0x4EE4: 'lìng,líng,lǐng,lián',
+    0x4EE5: 'yǐ,sì',
+    0x4EE6: 'chào',
+    0x4EE7: 'cháng',
+    0x4EE8: 'sā',
+    0x4EE9: 'cháng',
+    0x4EEA: 'yí',
+    0x4EEB: 'mù',
+    0x4EEC: 'men,mén',
+    0x4EED: 'rèn',
+    0x4EEE: 'fǎn',
+    0x4EEF: 'chào,miǎo',
+    0x4EF0: 'yǎng,áng',
+    0x4EF1: 'qián,jīng',
+    0x4EF2: 'zhòng',
+    0x4EF3: 'pǐ,pí,bì',
+    0x4EF4: 'wò',
+    0x4EF5: 'wǔ',
+    0x4EF6: 'jiàn,móu',
+    0x4EF7: 'jià,jie,jiè',
+    0x4EF8: 'yǎo,fó',
+    0x4EF9: 'fēng',
+    0x4EFA: 'cāng',
+    0x4EFB: 'rèn,rén,lìn',
+    0x4EFC: 'wáng',
+    0x4EFD: 'fèn,bīn',
+    0x4EFE: 'dī',
+    0x4EFF: 'fǎng,páng',
+    0x4F00: 'zhōng',
+    0x4F01: 'qǐ',
+    0x4F02: 'pèi',
+    0x4F03: 'yú,yǔ,xù',
+    0x4F04: 'diào',
+    0x4F05: 'dùn',
+    0x4F06: 'wù',
+    0x4F07: 'yì',
+    0x4F08: 'xǐn,lǐn',
+    0x4F09: 'kàng,gāng,kǎng',
+    0x4F0A: 'yī',
+    0x4F0B: 'jí,fán',
+    0x4F0C: 'ài',
+    0x4F0D: 'wǔ',
+    0x4F0E: 'jì,zhì,qí,qì',
+    0x4F0F: 'fú,fù',
+    0x4F10: 'fá',
+    0x4F11: 'xiū,xù',
+    0x4F12: 'jìn,yín',
+    0x4F13: 'pī',
+    0x4F14: 'dǎn',
+    0x4F15: 'fū',
+    0x4F16: 'tǎng',
+    0x4F17: 'zhòng,yín',
+    0x4F18: 'yōu,yóu',
+    0x4F19: 'huǒ,huo',
+    0x4F1A: 'huì,kuài',
+    0x4F1B: 'yǔ',
+    0x4F1C: 'cuì',
+    0x4F1D: 'yún',
+    0x4F1E: 'sǎn',
+    0x4F1F: 'wěi',
+    0x4F20: 'chuán,zhuàn',
+    0x4F21: 'chē',
+    0x4F22: 'yá',
+    0x4F23: 'qiàn,xiàn',
+    0x4F24: 'shāng',
+    0x4F25: 'chāng',
+    0x4F26: 'lún',
+    0x4F27: 'cāng,chen',
+    0x4F28: 'xùn',
+    0x4F29: 'xìn',
+    0x4F2A: 'wěi',
+    0x4F2B: 'zhù',
+    0x4F2C: 'ze',
+    0x4F2D: 'xián',
+    0x4F2E: 'nǔ',
+    0x4F2F: 'bó,bǎi,mò,bà',
+    0x4F30: 'gū,gù',
+    0x4F31: 'nǐ',
+    0x4F32: 'nì,ní,nǐ',
+    0x4F33: 'xiè',
+    0x4F34: 'bàn,pàn',
+    0x4F35: 'xù',
+    0x4F36: 'líng',
+    0x4F37: 'zhòu',
+    0x4F38: 'shēn',
+    0x4F39: 'qū,zù',
+    0x4F3A: 'cì,sì',
+    0x4F3B: 'bēng',
+    0x4F3C: 'shì,sì',
+    0x4F3D: 'gā,jiā,qié',
+    0x4F3E: 'pī',
+    0x4F3F: 'yì',
+    0x4F40: 'sì',
+    0x4F41: 'yǐ,ǎi,sì,chì',
+    0x4F42: 'zhēng',
+    0x4F43: 'diàn,tián',
+    0x4F44: 'hān,gàn',
+    0x4F45: 'mài',
+    0x4F46: 'dàn,tǎn,yàn',
+    0x4F47: 'zhù',
+    0x4F48: 'bù',
+    0x4F49: 'qū,qiā',
+    0x4F4A: 'bǐ',
+    0x4F4B: 'zhāo,sháo,shào',
+    0x4F4C: 'cǐ',
+    0x4F4D: 'wèi,lì',
+    0x4F4E: 'dī',
+    0x4F4F: 'zhù',
+    0x4F50: 'zuǒ',
+    0x4F51: 'yòu',
+    0x4F52: 'yǎng,yāng',
+    0x4F53: 'tǐ,tī,bèn,cuì',
+    0x4F54: 'zhàn,chān,diān',
+    0x4F55: 'hé,hè',
+    0x4F56: 'bì',
+    0x4F57: 'tuó,tuō,tuò,yí',
+    0x4F58: 'shé',
+    0x4F59: 'yú,tú,xú,yù',
+    0x4F5A: 'yì,dié',
+    0x4F5B: 'fú,fó,bó,bì',
+    0x4F5C: 'zuò,zuō,zuó',
+    0x4F5D: 'gōu,kòu,jū',
+    0x4F5E: 'nìng',
+    0x4F5F: 'tóng',
+    0x4F60: 'nǐ',
+    0x4F61: 'xiān',
+    0x4F62: 'qú',
+    0x4F63: 'yōng,yòng',
+    0x4F64: 'wǎ',
+    0x4F65: 'qiān',
+    0x4F66: 'shi',
+    0x4F67: 'kǎ',
+    0x4F68: 'bāo',
+    0x4F69: 'pèi',
+    0x4F6A: 'huí,huái',
+    0x4F6B: 'hè,gé',
+    0x4F6C: 'lǎo,liáo',
+    0x4F6D: 'xiáng',
+    0x4F6E: 'gé,é',
+    0x4F6F: 'yáng',
+    0x4F70: 'bǎi,mò',
+    0x4F71: 'fǎ',
+    0x4F72: 'mǐng',
+    0x4F73: 'jiā',
+    0x4F74: 'èr,nài',
+    0x4F75: 'bìng',
+    0x4F76: 'jí',
+    0x4F77: 'hěn,héng',
+    0x4F78: 'huó',
+    0x4F79: 'guǐ,guī',
+    0x4F7A: 'quán',
+    0x4F7B: 'tiāo,tiáo,tiào,diǎo,yáo,dào,zhào',
+    0x4F7C: 'jiǎo,jiāo,xiáo',
+    0x4F7D: 'cì',
+    0x4F7E: 'yì',
+    0x4F7F: 'shǐ',
+    0x4F80: 'xíng',
+    0x4F81: 'shēn',
+    0x4F82: 'tuō',
+    0x4F83: 'kǎn',
+    0x4F84: 'zhí',
+    0x4F85: 'gāi,hài',
+    0x4F86: 'lái,lài',
+    0x4F87: 'yí',
+    0x4F88: 'chǐ',
+    0x4F89: 'kuǎ,huá,è,wú',
+    0x4F8A: 'guāng',
+    0x4F8B: 'lì,liè',
+    0x4F8C: 'yīn',
+    0x4F8D: 'shì',
+    0x4F8E: 'mǐ',
+    0x4F8F: 'zhū,zhōu',
+    0x4F90: 'xù',
+    0x4F91: 'yòu',
+    0x4F92: 'ān,ǎn',
+    0x4F93: 'lù',
+    0x4F94: 'móu,máo',
+    0x4F95: 'ér',
+    0x4F96: 'lún,lùn',
+    0x4F97: 'dòng,tōng,tóng,tǒng',
+    0x4F98: 'chà',
+    0x4F99: 'chī',
+    0x4F9A: 'xùn,xún',
+    0x4F9B: 'gōng,gòng',
+    0x4F9C: 'zhōu',
+    0x4F9D: 'yī,yǐ',
+    0x4F9E: 'rú',
+    0x4F9F: 'cún,jiàn',
+    0x4FA0: 'xiá',
+    0x4FA1: 'sì',
+    0x4FA2: 'dài',
+    0x4FA3: 'lǚ',
+    0x4FA4: 'ta',
+    0x4FA5: 'jiǎo,yáo',
+    0x4FA6: 'zhēn',
+    0x4FA7: 'cè,zè,zhāi',
+    0x4FA8: 'qiáo',
+    0x4FA9: 'kuài',
+    0x4FAA: 'chái',
+    0x4FAB: 'nìng',
+    0x4FAC: 'nóng',
+    0x4FAD: 'jǐn',
+    0x4FAE: 'wǔ',
+    0x4FAF: 'hóu,hòu',
+    0x4FB0: 'jiǒng',
+    0x4FB1: 'chěng,tǐng',
+    0x4FB2: 'zhèn,zhēn,chēn',
+    0x4FB3: 'zuò',
+    0x4FB4: 'chǒu',
+    0x4FB5: 'qīn,qǐn',
+    0x4FB6: 'lǚ',
+    0x4FB7: 'jú',
+    0x4FB8: 'shù,dōu',
+    0x4FB9: 'tǐng',
+    0x4FBA: 'shèn',
+    0x4FBB: 'tuì,tuō',
+    0x4FBC: 'bó',
+    0x4FBD: 'nán',
+    0x4FBE: 'xiāo',
+    0x4FBF: 'biàn,pián,biān',
+    0x4FC0: 'tuǐ',
+    0x4FC1: 'yǔ',
+    0x4FC2: 'xì',
+    0x4FC3: 'cù,chuò',
+    0x4FC4: 'é',
+    0x4FC5: 'qiú',
+    0x4FC6: 'xú,shū',
+    0x4FC7: 'guàng',
+    0x4FC8: 'kù',
+    0x4FC9: 'wǔ,wú',
+    0x4FCA: 'jùn,shùn,dūn',
+    0x4FCB: 'yì',
+    0x4FCC: 'fǔ',
+    0x4FCD: 'liáng,lǎng',
+    0x4FCE: 'zǔ',
+    0x4FCF: 'qiào,xiào,xiāo',
+    0x4FD0: 'lì',
+    0x4FD1: 'yǒng',
+    0x4FD2: 'hùn',
+    0x4FD3: 'jìng,yíng',
+    0x4FD4: 'qiàn,xiàn',
+    0x4FD5: 'sàn',
+    0x4FD6: 'pěi',
+    0x4FD7: 'sú',
+    0x4FD8: 'fú',
+    0x4FD9: 'xī',
+    0x4FDA: 'lǐ,lì',
+    0x4FDB: 'fǔ,miǎn',
+    0x4FDC: 'pīng',
+    0x4FDD: 'bǎo',
+    0x4FDE: 'yú,shù',
+    0x4FDF: 'qí,sì',
+    0x4FE0: 'xiá',
+    0x4FE1: 'xìn,shēn',
+    0x4FE2: 'xiū',
+    0x4FE3: 'yǔ',
+    0x4FE4: 'dì',
+    0x4FE5: 'chē,jū',
+    0x4FE6: 'chóu',
+    0x4FE7: 'zhì',
+    0x4FE8: 'yǎn',
+    0x4FE9: 'liǎ,liǎng',
+    0x4FEA: 'lì',
+    0x4FEB: 'lái',
+    0x4FEC: 'sī',
+    0x4FED: 'jiǎn',
+    0x4FEE: 'xiū',
+    0x4FEF: 'fǔ',
+    0x4FF0: 'huò',
+    0x4FF1: 'jù,jū',
+    0x4FF2: 'xiào',
+    0x4FF3: 'pái',
+    0x4FF4: 'jiàn',
+    0x4FF5: 'biào',
+    0x4FF6: 'chù,shū,tì',
+    0x4FF7: 'fèi',
+    0x4FF8: 'fèng,běng',
+    0x4FF9: 'yà,yā',
+    0x4FFA: 'ǎn,yàn',
+    0x4FFB: 'bèi',
+    0x4FFC: 'yù',
+    0x4FFD: 'xīn',
+    0x4FFE: 'bǐ,bì,bēi,pì',
+    0x4FFF: 'hǔ,chí',
+    0x5000: 'chāng,chéng,zhèng',
+    0x5001: 'zhī',
+    0x5002: 'bìng',
+    0x5003: 'jiù',
+    0x5004: 'yáo',
+    0x5005: 'cuì,zú',
+    0x5006: 'liǎ,liǎng',
+    0x5007: 'wǎn',
+    0x5008: 'lái,lài,liē',
+    0x5009: 'cāng,chuàng',
+    0x500A: 'zòng',
+    0x500B: 'gè,gě',
+    0x500C: 'guān',
+    0x500D: 'bèi,péi',
+    0x500E: 'tiǎn',
+    0x500F: 'shū',
+    0x5010: 'shū',
+    0x5011: 'men,mèn,mén',
+    0x5012: 'dào,dǎo',
+    0x5013: 'tán,dàn,tàn',
+    0x5014: 'jué,juè',
+    0x5015: 'chuí,zhuì',
+    0x5016: 'xìng',
+    0x5017: 'péng,pěng,píng',
+    0x5018: 'tǎng,cháng',
+    0x5019: 'hòu',
+    0x501A: 'yǐ,jī,yī',
+    0x501B: 'qī,qí,qì',
+    0x501C: 'tì,diào,zhōu',
+    0x501D: 'gàn',
+    0x501E: 'jìng,liàng',
+    0x501F: 'jiè',
+    0x5020: 'suī',
+    0x5021: 'chàng,chāng',
+    0x5022: 'jié,qiè',
+    0x5023: 'fǎng',
+    0x5024: 'zhí',
+    0x5025: 'kōng,kǒng',
+    0x5026: 'juàn',
+    0x5027: 'zōng',
+    0x5028: 'jù',
+    0x5029: 'qiàn,qìng',
+    0x502A: 'ní,nì,niè',
+    0x502B: 'lún',
+    0x502C: 'zhuō',
+    0x502D: 'wō,wēi,wǒ',
+    0x502E: 'luǒ',
+    0x502F: 'sōng',
+    0x5030: 'lèng,líng',
+    0x5031: 'hùn',
+    0x5032: 'dōng,dòng',
+    0x5033: 'zì',
+    0x5034: 'bèn,bēn',
+    0x5035: 'wǔ',
+    0x5036: 'jù',
+    0x5037: 'nǎi',
+    0x5038: 'cǎi',
+    0x5039: 'jiǎn',
+    0x503A: 'zhài',
+    0x503B: 'yē',
+    0x503C: 'zhí',
+    0x503D: 'shà',
+    0x503E: 'qīng',
+    0x503F: 'nìng',
+    0x5040: 'yīng',
+    0x5041: 'chēng',
+    0x5042: 'qián',
+    0x5043: 'yǎn',
+    0x5044: 'ruǎn,rú',
+    0x5045: 'zhòng,chōng,tóng',
+    0x5046: 'chǔn',
+    0x5047: 'jiǎ,jià,jie,xià,xiá,gé',
+    0x5048: 'jì,jié,qì',
+    0x5049: 'wěi',
+    0x504A: 'yǔ',
+    0x504B: 'bìng,bǐng',
+    0x504C: 'ruò,rè',
+    0x504D: 'tí',
+    0x504E: 'wēi',
+    0x504F: 'piān',
+    0x5050: 'yàn',
+    0x5051: 'fēng',
+    0x5052: 'tǎng,dàng',
+    0x5053: 'wò',
+    0x5054: 'è',
+    0x5055: 'xié,jiē',
+    0x5056: 'chě',
+    0x5057: 'shěng',
+    0x5058: 'kǎn',
+    0x5059: 'dì',
+    0x505A: 'zuò',
+    0x505B: 'chā',
+    0x505C: 'tíng',
+    0x505D: 'bèi',
+    0x505E: 'xiè,yè,zhá',
+    0x505F: 'huáng',
+    0x5060: 'yǎo',
+    0x5061: 'zhàn',
+    0x5062: 'chǒu,qiào,zōu',
+    0x5063: 'yān',
+    0x5064: 'yóu',
+    0x5065: 'jiàn',
+    0x5066: 'xǔ,xū',
+    0x5067: 'zhā',
+    0x5068: 'cī',
+    0x5069: 'fù',
+    0x506A: 'bī,fù',
+    0x506B: 'zhì',
+    0x506C: 'zǒng,cōng',
+    0x506D: 'miǎn',
+    0x506E: 'jí',
+    0x506F: 'yǐ',
+    0x5070: 'xiè',
+    0x5071: 'xún',
+    0x5072: 'cāi,sī,sǐ',
+    0x5073: 'duān',
+    0x5074: 'cè,zè,zhāi',
+    0x5075: 'zhēn,zhēng',
+    0x5076: 'ǒu',
+    0x5077: 'tōu',
+    0x5078: 'tōu',
+    0x5079: 'bèi',
+    0x507A: 'zá,zán,zan',
+    0x507B: 'lóu,lǚ',
+    0x507C: 'jié',
+    0x507D: 'wěi,wéi,é,guì',
+    0x507E: 'fèn',
+    0x507F: 'cháng',
+    0x5080: 'guī,kuǐ,kuài',
+    0x5081: 'sǒu',
+    0x5082: 'zhì,sī',
+    0x5083: 'sù',
+    0x5084: 'xiā',
+    0x5085: 'fù,fū',
+    0x5086: 'yuàn,yuán',
+    0x5087: 'rǒng',
+    0x5088: 'lì',
+    0x5089: 'nù',
+    0x508A: 'yùn',
+    0x508B: 'jiǎng,gòu',
+    0x508C: 'mà,mǎ',
+    0x508D: 'bàng,páng,bēng,péng',
+    0x508E: 'diān',
+    0x508F: 'táng',
+    0x5090: 'hào',
+    0x5091: 'jié',
+    0x5092: 'xī,xì',
+    0x5093: 'shàn',
+    0x5094: 'qiàn,jiān',
+    0x5095: 'jué,què',
+    0x5096: 'cāng,chéng,chen',
+    0x5097: 'chù',
+    0x5098: 'sǎn',
+    0x5099: 'bèi',
+    0x509A: 'xiào',
+    0x509B: 'yǒng,róng',
+    0x509C: 'yáo',
+    0x509D: 'tàn,tà',
+    0x509E: 'suō',
+    0x509F: 'yǎng',
+    0x50A0: 'fá',
+    0x50A1: 'bìng',
+    0x50A2: 'jiā,xiàng',
+    0x50A3: 'dǎi',
+    0x50A4: 'zài',
+    0x50A5: 'tǎng',
+    0x50A6: 'gǔ',
+    0x50A7: 'bīn',
+    0x50A8: 'chǔ',
+    0x50A9: 'nuó',
+    0x50AA: 'cān,sǎn,càn,cā,sēn',
+    0x50AB: 'lěi',
+    0x50AC: 'cuī',
+    0x50AD: 'yōng,chōng,yòng',
+    0x50AE: 'zāo,cáo',
+    0x50AF: 'zǒng',
+    0x50B0: 'bēng,péng',
+    0x50B1: 'sǒng,shuǎng',
+    0x50B2: 'ào,áo',
+    0x50B3: 'chuán,zhuàn',
+    0x50B4: 'yǔ',
+    0x50B5: 'zhài',
+    0x50B6: 'zú,qī',
+    0x50B7: 'shāng',
+    0x50B8: 'chuǎng',
+    0x50B9: 'jìng',
+    0x50BA: 'chì',
+    0x50BB: 'shǎ',
+    0x50BC: 'hàn',
+    0x50BD: 'zhāng',
+    0x50BE: 'qīng,qǐng',
+    0x50BF: 'yàn,yān,yìn',
+    0x50C0: 'dì',
+    0x50C1: 'xiè,sù',
+    0x50C2: 'lóu,liǔ,lǚ',
+    0x50C3: 'bèi',
+    0x50C4: 'piào,biāo',
+    0x50C5: 'jǐn,jìn',
+    0x50C6: 'liàn,lián',
+    0x50C7: 'lù,liáo',
+    0x50C8: 'mán,màn',
+    0x50C9: 'qiān',
+    0x50CA: 'xiān',
+    0x50CB: 'tàn,làn,tǎn',
+    0x50CC: 'yíng',
+    0x50CD: 'dòng',
+    0x50CE: 'zhuàn,zūn',
+    0x50CF: 'xiàng',
+    0x50D0: 'shàn',
+    0x50D1: 'qiáo,jiǎo',
+    0x50D2: 'jiǒng',
+    0x50D3: 'tuǐ,tuí',
+    0x50D4: 'zǔn,cuán',
+    0x50D5: 'pú,pū,bú',
+    0x50D6: 'xī',
+    0x50D7: 'láo,lào',
+    0x50D8: 'chǎng',
+    0x50D9: 'guāng',
+    0x50DA: 'liáo,liǎo,lǎo',
+    0x50DB: 'qī',
+    0x50DC: 'chēng,dèng,dēng,téng',
+    0x50DD: 'chán,zhuàn',
+    0x50DE: 'wěi',
+    0x50DF: 'jī',
+    0x50E0: 'bō',
+    0x50E1: 'huì',
+    0x50E2: 'chuǎn,chǔn',
+    0x50E3: 'tiě,jiàn',
+    0x50E4: 'dàn,chán,chǎn,shàn,dá',
+    0x50E5: 'jiǎo,yáo,jiāo',
+    0x50E6: 'jiù',
+    0x50E7: 'sēng,céng',
+    0x50E8: 'fèn',
+    0x50E9: 'xiàn',
+    0x50EA: 'jú,yù',
+    0x50EB: 'è',
+    0x50EC: 'jiāo,jiào,jiǎo',
+    0x50ED: 'jiàn,zèn',
+    0x50EE: 'tóng,zhuàng,chòng',
+    0x50EF: 'lìn,lǐn',
+    0x50F0: 'bó',
+    0x50F1: 'gù',
+    0x50F2: 'xiān',
+    0x50F3: 'sù',
+    0x50F4: 'xiàn',
+    0x50F5: 'jiāng',
+    0x50F6: 'mǐn',
+    0x50F7: 'yè',
+    0x50F8: 'jìn',
+    0x50F9: 'jià,qiǎ,jie',
+    0x50FA: 'qiào',
+    0x50FB: 'pì',
+    0x50FC: 'fēng',
+    0x50FD: 'zhòu,zhōu',
+    0x50FE: 'ài',
+    0x50FF: 'sài',
+    0x5100: 'yí',
+    0x5101: 'jùn',
+    0x5102: 'nóng',
+    0x5103: 'chán,shàn,tǎn,dàn,zhǎn',
+    0x5104: 'yì,yī',
+    0x5105: 'dàng,dāng',
+    0x5106: 'jǐng',
+    0x5107: 'xuān,xuán',
+    0x5108: 'kuài',
+    0x5109: 'jiǎn',
+    0x510A: 'chù',
+    0x510B: 'dān,dàn,shàn',
+    0x510C: 'jiǎo,jiāo',
+    0x510D: 'shǎ',
+    0x510E: 'zài',
+    0x510F: 'càn',
+    0x5110: 'bīn,bìn',
+    0x5111: 'án,àn',
+    0x5112: 'rú',
+    0x5113: 'tái,tài',
+    0x5114: 'chóu,dào',
+    0x5115: 'chái',
+    0x5116: 'lán',
+    0x5117: 'nǐ,yí,yì,ài',
+    0x5118: 'jǐn,jìn',
+    0x5119: 'qiàn',
+    0x511A: 'méng',
+    0x511B: 'wǔ',
+    0x511C: 'níng',
+    0x511D: 'qióng',
+    0x511E: 'nǐ',
+    0x511F: 'cháng',
+    0x5120: 'liè,là',
+    0x5121: 'lěi,léi,lèi',
+    0x5122: 'lǚ',
+    0x5123: 'kuǎng',
+    0x5124: 'bào',
+    0x5125: 'yù,dí,dú',
+    0x5126: 'biāo',
+    0x5127: 'zǎn',
+    0x5128: 'zhì',
+    0x5129: 'sì',
+    0x512A: 'yōu',
+    0x512B: 'háo',
+    0x512C: 'qìng',
+    0x512D: 'chèn,qìn,qīn',
+    0x512E: 'lì',
+    0x512F: 'téng',
+    0x5130: 'wěi',
+    0x5131: 'lǒng,lòng,lóng',
+    0x5132: 'chǔ,chú',
+    0x5133: 'chán,chàn',
+    0x5134: 'ráng,xiāng',
+    0x5135: 'shū,tiáo',
+    0x5136: 'huì,xié',
+    0x5137: 'lì,lí',
+    0x5138: 'luó',
+    0x5139: 'zǎn',
+    0x513A: 'nuó',
+    0x513B: 'tǎng,tàng,chǎng',
+    0x513C: 'yǎn',
+    0x513D: 'léi,lěi,luǒ',
+    0x513E: 'nàng',
+    0x513F: 'ér,er,rén',
+    0x5140: 'wù,wū',
+    0x5141: 'yǔn,yuán',
+    0x5142: 'zān',
+    0x5143: 'yuán',
+    0x5144: 'xiōng,kuàng',
+    0x5145: 'chōng',
+    0x5146: 'zhào',
+    0x5147: 'xiōng',
+    0x5148: 'xiān',
+    0x5149: 'guāng,guàng',
+    0x514A: 'duì',
+    0x514B: 'kè',
+    0x514C: 'duì',
+    0x514D: 'miǎn,wèn,wǎn',
+    0x514E: 'tù',
+    0x514F: 'cháng',
+    0x5150: 'ér',
+    0x5151: 'duì,ruì,duó',
+    0x5152: 'ér,ní',
+    0x5153: 'jīn,zàn',
+    0x5154: 'tù,tú,chān',
+    0x5155: 'sì',
+    0x5156: 'yǎn',
+    0x5157: 'yǎn',
+    0x5158: 'shǐ',
+    0x515A: 'dǎng',
+    0x515B: 'qiān',
+    0x515C: 'dōu',
+    0x515D: 'fēn',
+    0x515E: 'máo',
+    0x515F: 'shēn',
+    0x5160: 'dōu',
+    0x5162: 'jīng',
+    0x5163: 'lǐ',
+    0x5164: 'huǎng',
+    0x5165: 'rù',
+    0x5166: 'wáng',
+    0x5167: 'nèi',
+    0x5168: 'quán',
+    0x5169: 'liǎng,liàng',
+    0x516A: 'yú,yù,shù,shū,zhū',
+    0x516B: 'bā,bá',
+    0x516C: 'gōng',
+    0x516D: 'liù,lù',
+    0x516E: 'xī',
+    0x516F: 'han',
+    0x5170: 'lán',
+    0x5171: 'gòng,gōng,gǒng,hóng',
+    0x5172: 'tiān',
+    0x5173: 'guān',
+    0x5174: 'xīng,xìng',
+    0x5175: 'bīng',
+    0x5176: 'qí,jī,jì',
+    0x5177: 'jù',
+    0x5178: 'diǎn,tiǎn',
+    0x5179: 'zī,cí',
+    0x517A: 'fēn',
+    0x517B: 'yǎng',
+    0x517C: 'jiān',
+    0x517D: 'shòu',
+    0x517E: 'jì',
+    0x517F: 'yì',
+    0x5180: 'jì',
+    0x5181: 'chǎn',
+    0x5182: 'jiōng,jiǒng',
+    0x5183: 'mào',
+    0x5184: 'rǎn',
+    0x5185: 'nèi,nà,ruì',
+    0x5186: 'yuán',
+    0x5187: 'mǎo',
+    0x5188: 'gāng',
+    0x5189: 'rǎn,nán,dān',
+    0x518A: 'cè',
+    0x518B: 'jiōng,jiǒng',
+    0x518C: 'cè,zhà',
+    0x518D: 'zài',
+    0x518E: 'guǎ',
+    0x518F: 'jiǒng,jiōng',
+    0x5190: 'mào',
+    0x5191: 'zhòu',
+    0x5192: 'mào,mò',
+    0x5193: 'gòu,gōu',
+    0x5194: 'xǔ',
+    0x5195: 'miǎn',
+    0x5196: 'mì',
+    0x5197: 'rǒng',
+    0x5198: 'yín,yóu',
+    0x5199: 'xiě,xiè',
+    0x519A: 'kǎn',
+    0x519B: 'jūn',
+    0x519C: 'nóng',
+    0x519D: 'yí',
+    0x519E: 'mí',
+    0x519F: 'shì',
+    0x51A0: 'guān,guàn',
+    0x51A1: 'méng',
+    0x51A2: 'zhǒng',
+    0x51A3: 'jù',
+    0x51A4: 'yuān',
+    0x51A5: 'míng,mián,miàn',
+    0x51A6: 'kòu',
+    0x51A7: 'lín',
+    0x51A8: 'fù',
+    0x51A9: 'xiě',
+    0x51AA: 'mì',
+    0x51AB: 'bīng',
+    0x51AC: 'dōng',
+    0x51AD: 'tài',
+    0x51AE: 'gāng',
+    0x51AF: 'féng,píng',
+    0x51B0: 'bīng,níng',
+    0x51B1: 'hù',
+    0x51B2: 'chōng,chòng',
+    0x51B3: 'jué',
+    0x51B4: 'hù',
+    0x51B5: 'kuàng',
+    0x51B6: 'yě',
+    0x51B7: 'lěng,líng,lǐng',
+    0x51B8: 'pàn',
+    0x51B9: 'fú',
+    0x51BA: 'mǐn',
+    0x51BB: 'dòng',
+    0x51BC: 'xiǎn,shěng',
+    0x51BD: 'liè',
+    0x51BE: 'qià',
+    0x51BF: 'jiān',
+    0x51C0: 'jìng,chēng',
+    0x51C1: 'sōu',
+    0x51C2: 'měi',
+    0x51C3: 'tú',
+    0x51C4: 'qī',
+    0x51C5: 'gù',
+    0x51C6: 'zhǔn',
+    0x51C7: 'sōng',
+    0x51C8: 'jìng',
+    0x51C9: 'liáng,liàng',
+    0x51CA: 'qìng',
+    0x51CB: 'diāo',
+    0x51CC: 'líng,lìng',
+    0x51CD: 'dòng',
+    0x51CE: 'gàn',
+    0x51CF: 'jiǎn',
+    0x51D0: 'yīn',
+    0x51D1: 'còu',
+    0x51D2: 'ái',
+    0x51D3: 'lì',
+    0x51D4: 'chuàng,cāng',
+    0x51D5: 'mǐng',
+    0x51D6: 'zhǔn',
+    0x51D7: 'cuī',
+    0x51D8: 'sī',
+    0x51D9: 'duó',
+    0x51DA: 'jìn',
+    0x51DB: 'lǐn',
+    0x51DC: 'lǐn',
+    0x51DD: 'níng',
+    0x51DE: 'xī',
+    0x51DF: 'dú',
+    0x51E0: 'jǐ,jī',
+    0x51E1: 'fán',
+    0x51E2: 'fán',
+    0x51E3: 'fán',
+    0x51E4: 'fèng',
+    0x51E5: 'jū',
+    0x51E6: 'chǔ,chù',
+    0x51E7: 'zhēng',
+    0x51E8: 'fēng',
+    0x51E9: 'mù',
+    0x51EA: 'zhǐ',
+    0x51EB: 'fú',
+    0x51EC: 'fēng',
+    0x51ED: 'píng',
+    0x51EE: 'fēng',
+    0x51EF: 'kǎi',
+    0x51F0: 'huáng',
+    0x51F1: 'kǎi',
+    0x51F2: 'gān',
+    0x51F3: 'dèng',
+    0x51F4: 'píng',
+    0x51F5: 'qiǎn,kǎn',
+    0x51F6: 'xiōng',
+    0x51F7: 'kuài',
+    0x51F8: 'tū',
+    0x51F9: 'āo,wā',
+    0x51FA: 'chū',
+    0x51FB: 'jī',
+    0x51FC: 'dàng',
+    0x51FD: 'hán',
+    0x51FE: 'hán',
+    0x51FF: 'záo,zuò',
+    0x5200: 'dāo,diāo',
+    0x5201: 'diāo',
+    0x5202: 'dāo',
+    0x5203: 'rèn',
+    0x5204: 'rèn',
+    0x5205: 'chuāng',
+    0x5206: 'fēn,fèn,fén',
+    0x5207: 'qiè,qiē,qì',
+    0x5208: 'yì',
+    0x5209: 'jī',
+    0x520A: 'kān',
+    0x520B: 'qiàn',
+    0x520C: 'cǔn',
+    0x520D: 'chú',
+    0x520E: 'wěn',
+    0x520F: 'jī',
+    0x5210: 'dǎn',
+    0x5211: 'xíng',
+    0x5212: 'huà,huá,guò,guǒ,huai',
+    0x5213: 'wán',
+    0x5214: 'jué',
+    0x5215: 'lí',
+    0x5216: 'yuè',
+    0x5217: 'liè,lì',
+    0x5218: 'liú',
+    0x5219: 'zé',
+    0x521A: 'gāng',
+    0x521B: 'chuàng,chuāng',
+    0x521C: 'fú',
+    0x521D: 'chū',
+    0x521E: 'qù',
+    0x521F: 'diāo',
+    0x5220: 'shān',
+    0x5221: 'mǐn',
+    0x5222: 'líng',
+    0x5223: 'zhōng',
+    0x5224: 'pàn',
+    0x5225: 'bié',
+    0x5226: 'jié',
+    0x5227: 'jié',
+    0x5228: 'páo,bào',
+    0x5229: 'lì',
+    0x522A: 'shān',
+    0x522B: 'bié,biè',
+    0x522C: 'chǎn,chàn',
+    0x522D: 'jǐng',
+    0x522E: 'guā',
+    0x522F: 'gēng',
+    0x5230: 'dào',
+    0x5231: 'chuàng',
+    0x5232: 'kuī',
+    0x5233: 'kū,kōu',
+    0x5234: 'duò',
+    0x5235: 'èr',
+    0x5236: 'zhì',
+    0x5237: 'shuā,shuà',
+    0x5238: 'quàn,xuàn',
+    0x5239: 'shā,chà',
+    0x523A: 'cì,cī,qì',
+    0x523B: 'kè,kēi',
+    0x523C: 'jié',
+    0x523D: 'guì',
+    0x523E: 'cì',
+    0x523F: 'guì',
+    0x5240: 'kǎi',
+    0x5241: 'duò',
+    0x5242: 'jì',
+    0x5243: 'tì',
+    0x5244: 'jǐng',
+    0x5245: 'lóu,dōu',
+    0x5246: 'luǒ',
+    0x5247: 'zé',
+    0x5248: 'yuān',
+    0x5249: 'cuò',
+    0x524A: 'xuē,xiāo,qiào,shào',
+    0x524B: 'kè,kēi',
+    0x524C: 'lá,là',
+    0x524D: 'qián,jiǎn',
+    0x524E: 'shā',
+    0x524F: 'chuàng',
+    0x5250: 'guǎ',
+    0x5251: 'jiàn',
+    0x5252: 'cuò',
+    0x5253: 'lí',
+    0x5254: 'tī,tì',
+    0x5255: 'fèi',
+    0x5256: 'pōu,pǒ',
+    0x5257: 'chǎn,chàn',
+    0x5258: 'qí',
+    0x5259: 'chuàng',
+    0x525A: 'zì',
+    0x525B: 'gāng',
+    0x525C: 'wān',
+    0x525D: 'bō',
+    0x525E: 'jī',
+    0x525F: 'duō,chì',
+    0x5260: 'qíng,lüè',
+    0x5261: 'shàn,yǎn',
+    0x5262: 'dū,zhuó',
+    0x5263: 'jiàn',
+    0x5264: 'jì',
+    0x5265: 'bō,bāo,pū',
+    0x5266: 'yān',
+    0x5267: 'jù',
+    0x5268: 'huō,huò',
+    0x5269: 'shèng',
+    0x526A: 'jiǎn',
+    0x526B: 'duó,dù',
+    0x526C: 'duān,tuán,zhì',
+    0x526D: 'wū',
+    0x526E: 'guǎ',
+    0x526F: 'fù,pì',
+    0x5270: 'shèng',
+    0x5271: 'jiàn',
+    0x5272: 'gē',
+    0x5273: 'dá,zhá',
+    0x5274: 'kǎi,āi',
+    0x5275: 'chuàng,chuāng,qiāng',
+    0x5276: 'chuān',
+    0x5277: 'chǎn',
+    0x5278: 'tuán,zhuān,zhuàn',
+    0x5279: 'lù,jiū',
+    0x527A: 'lí',
+    0x527B: 'pěng',
+    0x527C: 'shān',
+    0x527D: 'piāo,piào,piáo,biǎo,biāo',
+    0x527E: 'kōu',
+    0x527F: 'jiǎo,chāo',
+    0x5280: 'guā',
+    0x5281: 'qiāo,qiáo',
+    0x5282: 'jué',
+    0x5283: 'huà,huá,huai',
+    0x5284: 'zhā,zhá',
+    0x5285: 'zhuó',
+    0x5286: 'lián',
+    0x5287: 'jù',
+    0x5288: 'pī,pǐ',
+    0x5289: 'liú',
+    0x528A: 'guì',
+    0x528B: 'jiǎo,chāo',
+    0x528C: 'guì',
+    0x528D: 'jiàn',
+    0x528E: 'jiàn',
+    0x528F: 'tāng',
+    0x5290: 'huō,huò,huá',
+    0x5291: 'jì',
+    0x5292: 'jiàn',
+    0x5293: 'yì',
+    0x5294: 'jiàn',
+    0x5295: 'zhì',
+    0x5296: 'chán',
+    0x5297: 'jiǎn,zuān',
+    0x5298: 'mó,mí',
+    0x5299: 'lí',
+    0x529A: 'zhú',
+    0x529B: 'lì',
+    0x529C: 'yà',
+    0x529D: 'quàn',
+    0x529E: 'bàn',
+    0x529F: 'gōng',
+    0x52A0: 'jiā',
+    0x52A1: 'wù',
+    0x52A2: 'mài',
+    0x52A3: 'liè',
+    0x52A4: 'jìn',
+    0x52A5: 'kēng',
+    0x52A6: 'xié,liè',
+    0x52A7: 'zhǐ',
+    0x52A8: 'dòng',
+    0x52A9: 'zhù,chú',
+    0x52AA: 'nǔ',
+    0x52AB: 'jié',
+    0x52AC: 'qú',
+    0x52AD: 'shào',
+    0x52AE: 'yì',
+    0x52AF: 'zhū',
+    0x52B0: 'mò',
+    0x52B1: 'lì',
+    0x52B2: 'jìn,jìng',
+    0x52B3: 'láo',
+    0x52B4: 'láo',
+    0x52B5: 'juàn',
+    0x52B6: 'kǒu',
+    0x52B7: 'yáng',
+    0x52B8: 'wā',
+    0x52B9: 'xiào',
+    0x52BA: 'móu',
+    0x52BB: 'kuāng',
+    0x52BC: 'jié',
+    0x52BD: 'liè',
+    0x52BE: 'hé,kài',
+    0x52BF: 'shì',
+    0x52C0: 'kè',
+    0x52C1: 'jìn,jìng',
+    0x52C2: 'gào',
+    0x52C3: 'bó',
+    0x52C4: 'mǐn',
+    0x52C5: 'chì',
+    0x52C6: 'láng',
+    0x52C7: 'yǒng',
+    0x52C8: 'yǒng',
+    0x52C9: 'miǎn',
+    0x52CA: 'kè',
+    0x52CB: 'xūn',
+    0x52CC: 'juàn,juān',
+    0x52CD: 'qíng',
+    0x52CE: 'lù',
+    0x52CF: 'bù',
+    0x52D0: 'měng',
+    0x52D1: 'chì,lài',
+    0x52D2: 'lēi,lè,lei',
+    0x52D3: 'kài',
+    0x52D4: 'miǎn',
+    0x52D5: 'dòng',
+    0x52D6: 'xù,mào',
+    0x52D7: 'xù',
+    0x52D8: 'kān',
+    0x52D9: 'wù,wǔ,wú,máo,mào',
+    0x52DA: 'yì',
+    0x52DB: 'xūn',
+    0x52DC: 'wěng,yǎng',
+    0x52DD: 'shèng',
+    0x52DE: 'láo,lào,liáo',
+    0x52DF: 'mù,bó',
+    0x52E0: 'lù',
+    0x52E1: 'piào',
+    0x52E2: 'shì',
+    0x52E3: 'jī',
+    0x52E4: 'qín,qí',
+    0x52E5: 'jiàng,qiǎng,jiǎng',
+    0x52E6: 'chāo,jiǎo,cháo',
+    0x52E7: 'quàn',
+    0x52E8: 'xiàng',
+    0x52E9: 'yì',
+    0x52EA: 'jué',
+    0x52EB: 'fān',
+    0x52EC: 'juān',
+    0x52ED: 'tóng,dòng',
+    0x52EE: 'jù',
+    0x52EF: 'dān',
+    0x52F0: 'xié',
+    0x52F1: 'mài',
+    0x52F2: 'xūn',
+    0x52F3: 'xūn',
+    0x52F4: 'lǜ',
+    0x52F5: 'lì',
+    0x52F6: 'chè',
+    0x52F7: 'ráng,xiāng',
+    0x52F8: 'quàn',
+    0x52F9: 'bāo',
+    0x52FA: 'sháo,shuò,zhuó,dì',
+    0x52FB: 'yún',
+    0x52FC: 'jiū',
+    0x52FD: 'bào',
+    0x52FE: 'gōu,gòu',
+    0x52FF: 'wù,mò',
+    0x5300: 'yún,jūn,yùn',
+    0x5301: 'wén',
+    0x5302: 'xiōng',
+    0x5303: 'gài',
+    0x5304: 'gài',
+    0x5305: 'bāo,páo,fú',
+    0x5306: 'cōng',
+    0x5307: 'yì',
+    0x5308: 'xiōng',
+    0x5309: 'pēng',
+    0x530A: 'jū',
+    0x530B: 'táo,yáo',
+    0x530C: 'gé',
+    0x530D: 'pú',
+    0x530E: 'è',
+    0x530F: 'páo',
+    0x5310: 'fú',
+    0x5311: 'gōng',
+    0x5312: 'dá',
+    0x5313: 'jiù',
+    0x5314: 'gōng',
+    0x5315: 'bǐ,pìn',
+    0x5316: 'huà,huā,huò',
+    0x5317: 'běi,bèi',
+    0x5318: 'nǎo',
+    0x5319: 'shi,chí',
+    0x531A: 'fāng,fàng',
+    0x531B: 'jiù',
+    0x531C: 'yí',
+    0x531D: 'zā',
+    0x531E: 'jiàng',
+    0x531F: 'kàng',
+    0x5320: 'jiàng',
+    0x5321: 'kuāng,wāng',
+    0x5322: 'hū',
+    0x5323: 'xiá',
+    0x5324: 'qū',
+    0x5325: 'fán',
+    0x5326: 'guǐ',
+    0x5327: 'qiè',
+    0x5328: 'zāng,cáng',
+    0x5329: 'kuāng',
+    0x532A: 'fěi,fēi,fēn',
+    0x532B: 'hū',
+    0x532C: 'yǔ',
+    0x532D: 'guǐ',
+    0x532E: 'kuì,guì',
+    0x532F: 'huì',
+    0x5330: 'dān',
+    0x5331: 'guì,kuì',
+    0x5332: 'lián',
+    0x5333: 'lián',
+    0x5334: 'suǎn',
+    0x5335: 'dú',
+    0x5336: 'jiù',
+    0x5337: 'jué',
+    0x5338: 'xì',
+    0x5339: 'pǐ',
+    0x533A: 'qū,ōu',
+    0x533B: 'yī,yì',
+    0x533C: 'kē,ē,ǎn',
+    0x533D: 'yǎn,yàn',
+    0x533E: 'biǎn',
+    0x533F: 'nì,tè',
+    0x5340: 'qū,ōu,gōu,qiū,kòu',
+    0x5341: 'shí',
+    0x5342: 'xùn',
+    0x5343: 'qiān',
+    0x5344: 'niàn',
+    0x5345: 'sà',
+    0x5346: 'zú',
+    0x5347: 'shēng',
+    0x5348: 'wǔ',
+    0x5349: 'huì',
+    0x534A: 'bàn,pàn',
+    0x534B: 'shì',
+    0x534C: 'xì',
+    0x534D: 'wàn',
+    0x534E: 'huá,huà,huā',
+    0x534F: 'xié',
+    0x5350: 'wàn',
+    0x5351: 'bēi,bǐ,bì,pí,bān',
+    0x5352: 'zú,cù,cuì',
+    0x5353: 'zhuó,zhuō',
+    0x5354: 'xié',
+    0x5355: 'dān,chán,shàn',
+    0x5356: 'mài',
+    0x5357: 'nán,nā',
+    0x5358: 'dān',
+    0x5359: 'jí,chì',
+    0x535A: 'bó',
+    0x535B: 'shuài',
+    0x535C: 'bo,bǔ,pū',
+    0x535D: 'kuàng,guàn',
+    0x535E: 'biàn,pán',
+    0x535F: 'bǔ,jī',
+    0x5360: 'zhàn,zhān,tiē',
+    0x5361: 'kǎ,qiǎ',
+    0x5362: 'lú',
+    0x5363: 'yǒu',
+    0x5364: 'lǔ,xī',
+    0x5365: 'xī',
+    0x5366: 'guà',
+    0x5367: 'wò',
+    0x5368: 'xiè',
+    0x5369: 'jié',
+    0x536A: 'jié',
+    0x536B: 'wèi',
+    0x536C: 'áng,yǎng',
+    0x536D: 'qióng',
+    0x536E: 'zhī',
+    0x536F: 'mǎo',
+    0x5370: 'yìn,yì',
+    0x5371: 'wēi',
+    0x5372: 'shào',
+    0x5373: 'jí',
+    0x5374: 'què',
+    0x5375: 'luǎn,kūn',
+    0x5376: 'chǐ',
+    0x5377: 'juǎn,juàn,quán,quān,gǔn,jùn',
+    0x5378: 'xiè',
+    0x5379: 'xù,sū',
+    0x537A: 'jǐn',
+    0x537B: 'què,jiǎo,xì',
+    0x537C: 'wù',
+    0x537D: 'jí',
+    0x537E: 'è',
+    0x537F: 'qīng',
+    0x5380: 'xī',
+    0x5381: 'sān',
+    0x5382: 'chǎng,hǎn,yán,ān',
+    0x5383: 'wěi,yán',
+    0x5384: 'è,ě',
+    0x5385: 'tīng',
+    0x5386: 'lì',
+    0x5387: 'zhé,zhái',
+    0x5388: 'hǎn,àn',
+    0x5389: 'lì',
+    0x538A: 'yǎ',
+    0x538B: 'yā,yà',
+    0x538C: 'yàn',
+    0x538D: 'shè',
+    0x538E: 'dǐ,zhǐ',
+    0x538F: 'zhǎ,zhǎi',
+    0x5390: 'páng',
+    0x5391: 'yá',
+    0x5392: 'qiè',
+    0x5393: 'yá,ái',
+    0x5394: 'zhì,shī',
+    0x5395: 'cè,si',
+    0x5396: 'páng,máng',
+    0x5397: 'tí',
+    0x5398: 'lí,chán',
+    0x5399: 'shè',
+    0x539A: 'hòu',
+    0x539B: 'tīng',
+    0x539C: 'zuī',
+    0x539D: 'cuò,jí',
+    0x539E: 'fèi',
+    0x539F: 'yuán',
+    0x53A0: 'cè',
+    0x53A1: 'yuán',
+    0x53A2: 'xiāng',
+    0x53A3: 'yǎn',
+    0x53A4: 'lì',
+    0x53A5: 'jué',
+    0x53A6: 'shà,xià',
+    0x53A7: 'diān',
+    0x53A8: 'chú',
+    0x53A9: 'jiù',
+    0x53AA: 'jǐn',
+    0x53AB: 'áo',
+    0x53AC: 'guǐ',
+    0x53AD: 'yàn,yā,yǎn,yān,yì',
+    0x53AE: 'sī',
+    0x53AF: 'lì',
+    0x53B0: 'chǎng',
+    0x53B1: 'lán,qiān',
+    0x53B2: 'lì,lài',
+    0x53B3: 'yán',
+    0x53B4: 'yǎn',
+    0x53B5: 'yuán',
+    0x53B6: 'sī,mǒu',
+    0x53B7: 'gōng,hóng',
+    0x53B8: 'lín,min',
+    0x53B9: 'róu,qiú',
+    0x53BA: 'qù',
+    0x53BB: 'qù,qū',
+    0x53BC: 'ěr',
+    0x53BD: 'lěi',
+    0x53BE: 'dū,dǔ',
+    0x53BF: 'xiàn',
+    0x53C0: 'zhuān,huì',
+    0x53C1: 'sān',
+    0x53C2: 'cān,cēn,shēn',
+    0x53C3: 'cān,shēn,sān,cēn,càn,sǎn',
+    0x53C4: 'cān',
+    0x53C5: 'cān',
+    0x53C6: 'ài',
+    0x53C7: 'dài',
+    0x53C8: 'yòu',
+    0x53C9: 'chā,chá,chǎ,chà',
+    0x53CA: 'jí',
+    0x53CB: 'yǒu',
+    0x53CC: 'shuāng',
+    0x53CD: 'fǎn,fàn',
+    0x53CE: 'shōu',
+    0x53CF: 'guài',
+    0x53D0: 'bá',
+    0x53D1: 'fā,fà',
+    0x53D2: 'ruò',
+    0x53D3: 'shì,lì',
+    0x53D4: 'shū',
+    0x53D5: 'zhuó,yǐ,lì,jué',
+    0x53D6: 'qǔ,qū',
+    0x53D7: 'shòu,dào',
+    0x53D8: 'biàn',
+    0x53D9: 'xù',
+    0x53DA: 'jiǎ,xiá',
+    0x53DB: 'pàn',
+    0x53DC: 'sǒu',
+    0x53DD: 'jí',
+    0x53DE: 'wèi',
+    0x53DF: 'sǒu,sōu,xiāo',
+    0x53E0: 'dié',
+    0x53E1: 'ruì',
+    0x53E2: 'cóng',
+    0x53E3: 'kǒu',
+    0x53E4: 'gǔ,gù,kū',
+    0x53E5: 'jù,gōu,gòu,qú',
+    0x53E6: 'lìng',
+    0x53E7: 'guǎ',
+    0x53E8: 'dāo,dáo,tāo',
+    0x53E9: 'kòu',
+    0x53EA: 'zhǐ,zhī',
+    0x53EB: 'jiào',
+    0x53EC: 'zhào,shào',
+    0x53ED: 'bā,pā,ba',
+    0x53EE: 'dīng',
+    0x53EF: 'kě,kè,gē',
+    0x53F0: 'tái,tāi,yí,sì',
+    0x53F1: 'chì,huà,é',
+    0x53F2: 'shǐ',
+    0x53F3: 'yòu',
+    0x53F4: 'qiú',
+    0x53F5: 'pǒ',
+    0x53F6: 'yè,xié',
+    0x53F7: 'hào,háo,xiāo',
+    0x53F8: 'sī,cí,sì',
+    0x53F9: 'tàn,yǐ,yòu',
+    0x53FA: 'chǐ',
+    0x53FB: 'lè,lì',
+    0x53FC: 'diāo',
+    0x53FD: 'jī,jiào',
+    0x53FE: 'liǎo',
+    0x53FF: 'hōng,hóng',
+    0x5400: 'miē',
+    0x5401: 'xū,yū,yù',
+    0x5402: 'máng,màng',
+    0x5403: 'chī,qī',
+    0x5404: 'gè,gě',
+    0x5405: 'xuān,sòng',
+    0x5406: 'yāo',
+    0x5407: 'zǐ,jí',
+    0x5408: 'hé,gě',
+    0x5409: 'jí',
+    0x540A: 'diào',
+    0x540B: 'cùn,dòu,yīng',
+    0x540C: 'tóng,tòng',
+    0x540D: 'míng,mìng',
+    0x540E: 'hòu',
+    0x540F: 'lì',
+    0x5410: 'tǔ,tù',
+    0x5411: 'xiàng',
+    0x5412: 'zhā,zhà',
+    0x5413: 'xià,hè,hà',
+    0x5414: 'yě,yē',
+    0x5415: 'lǚ',
+    0x5416: 'yā,ā',
+    0x5417: 'ma,má,mǎ',
+    0x5418: 'ǒu',
+    0x5419: 'huō',
+    0x541A: 'yī,xī',
+    0x541B: 'jūn',
+    0x541C: 'chǒu',
+    0x541D: 'lìn',
+    0x541E: 'tūn,tiān',
+    0x541F: 'yín,yǐn,jìn',
+    0x5420: 'fèi',
+    0x5421: 'bǐ,bì,pǐ',
+    0x5422: 'qìn',
+    0x5423: 'qìn',
+    0x5424: 'jiè,gè,xiè',
+    0x5425: 'bù,pōu',
+    0x5426: 'fǒu,pǐ',
+    0x5427: 'ba,bā,pā',
+    0x5428: 'dūn,tún,tǔn',
+    0x5429: 'fēn,pèn',
+    0x542A: 'é,huā',
+    0x542B: 'hán,hàn',
+    0x542C: 'tīng,yǐn,yí',
+    0x542D: 'kēng,háng,hàng',
+    0x542E: 'shǔn',
+    0x542F: 'qǐ',
+    0x5430: 'hóng',
+    0x5431: 'zhī,zī,qì',
+    0x5432: 'yǐn,shěn',
+    0x5433: 'wú,yú',
+    0x5434: 'wú,tūn',
+    0x5435: 'chǎo,chāo,miǎo,chào',
+    0x5436: 'nà',
+    0x5437: 'xuè,chuò,jué',
+    0x5438: 'xī',
+    0x5439: 'chuī,chuì',
+    0x543A: 'dōu,rú',
+    0x543B: 'wěn',
+    0x543C: 'hǒu',
+    0x543D: 'hōng,ōu,hǒu',
+    0x543E: 'wú,yú,yá',
+    0x543F: 'gào',
+    0x5440: 'ya,yā,xiā',
+    0x5441: 'jùn',
+    0x5442: 'lǚ',
+    0x5443: 'è,e,ài',
+    0x5444: 'gé',
+    0x5445: 'méi,wěn',
+    0x5446: 'dāi,bǎo,ái',
+    0x5447: 'qǐ,mèn',
+    0x5448: 'chéng,kuáng,chěng',
+    0x5449: 'wú',
+    0x544A: 'gào,jū,gù',
+    0x544B: 'fū',
+    0x544C: 'jiào',
+    0x544D: 'hōng',
+    0x544E: 'chǐ,yīng',
+    0x544F: 'shēng',
+    0x5450: 'nà,nè,na,nuò,ne',
+    0x5451: 'tūn',
+    0x5452: 'wǔ,ḿ',
+    0x5453: 'yì',
+    0x5454: 'dāi,tǎi',
+    0x5455: 'ǒu,ōu,òu',
+    0x5456: 'lì',
+    0x5457: 'bei,bài',
+    0x5458: 'yuán,yùn,yún',
+    0x5459: 'guō',
+    0x545A: 'wen',
+    0x545B: 'qiāng,qiàng',
+    0x545C: 'wū',
+    0x545D: 'è',
+    0x545E: 'shī',
+    0x545F: 'juǎn',
+    0x5460: 'pěn',
+    0x5461: 'wěn,mǐn',
+    0x5462: 'ne,ní,nǐ,nī',
+    0x5463: 'ḿ,m̀,móu',
+    0x5464: 'lìng,líng',
+    0x5465: 'rán',
+    0x5466: 'yōu',
+    0x5467: 'dǐ',
+    0x5468: 'zhōu',
+    0x5469: 'shì',
+    0x546A: 'zhòu',
+    0x546B: 'tiè,chè',
+    0x546C: 'xì,chì',
+    0x546D: 'yì',
+    0x546E: 'qì,zhī',
+    0x546F: 'píng',
+    0x5470: 'zǐ,cī,jī,xì',
+    0x5471: 'gū,guā,guǎ',
+    0x5472: 'cī,cí,zī',
+    0x5473: 'wèi,mèi',
+    0x5474: 'xǔ,hǒu,hōu,gòu,gōu,gū',
+    0x5475: 'hē,hā,ā,a,kē,huō,á,à',
+    0x5476: 'náo,ná,nǔ',
+    0x5477: 'gā,xiā,jiǎ',
+    0x5478: 'pēi',
+    0x5479: 'yì,chì',
+    0x547A: 'xiāo,háo',
+    0x547B: 'shēn',
+    0x547C: 'hū,xiāo,xū,hè,xià',
+    0x547D: 'mìng',
+    0x547E: 'dá,yà,tǎ,dàn',
+    0x547F: 'qù,kā',
+    0x5480: 'jǔ,zuǐ',
+    0x5481: 'hán,xián,gàn',
+    0x5482: 'zā',
+    0x5483: 'tuō',
+    0x5484: 'duō',
+    0x5485: 'pǒu',
+    0x5486: 'páo',
+    0x5487: 'bié,bì',
+    0x5488: 'fú',
+    0x5489: 'yāng,yǎng',
+    0x548A: 'hé',
+    0x548B: 'zǎ,zé,zhā,zhà',
+    0x548C: 'hé,hè,hú,huó,huò,huo',
+    0x548D: 'hāi,tāi',
+    0x548E: 'jiù,gāo',
+    0x548F: 'yǒng',
+    0x5490: 'fù,fú',
+    0x5491: 'dā',
+    0x5492: 'zhòu',
+    0x5493: 'wǎ',
+    0x5494: 'kā,kǎ,nòng',
+    0x5495: 'gū,gu',
+    0x5496: 'kā,gā,jiā',
+    0x5497: 'zuo',
+    0x5498: 'bù',
+    0x5499: 'lóng',
+    0x549A: 'dōng',
+    0x549B: 'níng',
+    0x549C: 'ta',
+    0x549D: 'sī',
+    0x549E: 'xiàn,xián',
+    0x549F: 'huò',
+    0x54A0: 'qì',
+    0x54A1: 'èr,ér',
+    0x54A2: 'è',
+    0x54A3: 'guāng,gōng',
+    0x54A4: 'zhà',
+    0x54A5: 'xì,xī,dié,zhì',
+    0x54A6: 'yí,xī',
+    0x54A7: 'liě,liē,liè,lié,lie',
+    0x54A8: 'zī',
+    0x54A9: 'miē,mie',
+    0x54AA: 'mī,mǐ,miē,mǎi',
+    0x54AB: 'zhǐ',
+    0x54AC: 'yǎo,jiāo,yāo,jiǎo',
+    0x54AD: 'jī,xī,qià',
+    0x54AE: 'zhòu,zhù,zhū,rú',
+    0x54AF: 'gē,kǎ,lo,luò,kā',
+    0x54B0: 'shù,xún',
+    0x54B1: 'zán,zá,zǎ,zan',
+    0x54B2: 'xiào',
+    0x54B3: 'ké,hāi,hái,gāi',
+    0x54B4: 'huī,hái',
+    0x54B5: 'kuǎ',
+    0x54B6: 'huài,shì,guō,guā,huà',
+    0x54B7: 'táo,tiào',
+    0x54B8: 'xián,jiǎn,jiān',
+    0x54B9: 'è,àn,ń',
+    0x54BA: 'xuǎn,xuān',
+    0x54BB: 'xiū,xǔ,xiāo,xù',
+    0x54BC: 'guō,wāi,hé,wǒ,wō,guǎ',
+    0x54BD: 'yàn,yān,yè,yuān',
+    0x54BE: 'lǎo',
+    0x54BF: 'yī',
+    0x54C0: 'āi',
+    0x54C1: 'pǐn',
+    0x54C2: 'shěn',
+    0x54C3: 'tóng',
+    0x54C4: 'hǒng,hōng,hòng',
+    0x54C5: 'xiōng,hōng',
+    0x54C6: 'duō,chǐ,zhà,chì,duò,diě',
+    0x54C7: 'wa,wā,guī,huá,wá',
+    0x54C8: 'hā,hǎ,hà,hē,hé,tà,shà',
+    0x54C9: 'zāi',
+    0x54CA: 'yòu',
+    0x54CB: 'diè,dì',
+    0x54CC: 'pài,gū',
+    0x54CD: 'xiǎng',
+    0x54CE: 'āi',
+    0x54CF: 'gén,hěn,ǹ',
+    0x54D0: 'kuāng,qiāng',
+    0x54D1: 'yǎ,yā',
+    0x54D2: 'dá,dā',
+    0x54D3: 'xiāo',
+    0x54D4: 'bì',
+    0x54D5: 'huì,yuě',
+    0x54D6: 'nián',
+    0x54D7: 'huā,huá',
+    0x54D8: 'xing',
+    0x54D9: 'kuài',
+    0x54DA: 'duǒ',
+    0x54DB: 'fēn',
+    0x54DC: 'jì',
+    0x54DD: 'nóng',
+    0x54DE: 'mōu',
+    0x54DF: 'yō,yo',
+    0x54E0: 'hào',
+    0x54E1: 'yuán,yún,yùn',
+    0x54E2: 'lòng',
+    0x54E3: 'pǒu',
+    0x54E4: 'máng',
+    0x54E5: 'gē',
+    0x54E6: 'ó,é,ò',
+    0x54E7: 'chī,xià,hè',
+    0x54E8: 'shào,sāo,xiāo,xiào,sào',
+    0x54E9: 'lī,li,lì,lǐ,mái,yīng',
+    0x54EA: 'nǎ,na,né,nuó,nǎi,nà,niè,něi',
+    0x54EB: 'zú',
+    0x54EC: 'hé',
+    0x54ED: 'kū',
+    0x54EE: 'xiāo,xiào,xuē',
+    0x54EF: 'xiàn',
+    0x54F0: 'láo',
+    0x54F1: 'bō,pò,bèi,bā,bó',
+    0x54F2: 'zhé',
+    0x54F3: 'zhā',
+    0x54F4: 'liàng,láng',
+    0x54F5: 'bā',
+    0x54F6: 'miē',
+    0x54F7: 'liè,lǜ',
+    0x54F8: 'suī',
+    0x54F9: 'fú',
+    0x54FA: 'bǔ,bū,fǔ',
+    0x54FB: 'hān',
+    0x54FC: 'hēng,hng',
+    0x54FD: 'gěng,yǐng,yìng,ńg,ń',
+    0x54FE: 'shuō,yuè',
+    0x54FF: 'gě',
+    0x5500: 'yòu',
+    0x5501: 'yàn',
+    0x5502: 'gū',
+    0x5503: 'gǔ',
+    0x5504: 'bei,bài',
+    0x5505: 'hán',
+    0x5506: 'suō,shuà',
+    0x5507: 'chún,zhēn,zhèn',
+    0x5508: 'yì',
+    0x5509: 'āi,ài,ǎi',
+    0x550A: 'jiá,qiǎn',
+    0x550B: 'tū',
+    0x550C: 'xián,yán,dàn',
+    0x550D: 'wǎn',
+    0x550E: 'lì',
+    0x550F: 'xī,xiè',
+    0x5510: 'táng',
+    0x5511: 'zuò,shì',
+    0x5512: 'qiú',
+    0x5513: 'chē',
+    0x5514: 'wú,wù,ńg,ḿ,ń',
+    0x5515: 'zào',
+    0x5516: 'yǎ',
+    0x5517: 'dōu',
+    0x5518: 'qǐ',
+    0x5519: 'dí',
+    0x551A: 'qìn,qīn',
+    0x551B: 'mà,mài',
+    0x551C: 'mò',
+    0x551D: 'gòng,hǒng',
+    0x551E: 'dǒu',
+    0x551F: 'qù',
+    0x5520: 'láo,lào',
+    0x5521: 'liǎng,yīng',
+    0x5522: 'suǒ',
+    0x5523: 'zào',
+    0x5524: 'huàn',
+    0x5525: 'lang',
+    0x5526: 'shā',
+    0x5527: 'jī,jié',
+    0x5528: 'zǔ',
+    0x5529: 'wō,wěi',
+    0x552A: 'fěng,běng',
+    0x552B: 'jìn,yín',
+    0x552C: 'hǔ,xiāo,guó,xià,háo',
+    0x552D: 'qì',
+    0x552E: 'shòu,shú',
+    0x552F: 'wéi,wěi',
+    0x5530: 'shuā',
+    0x5531: 'chàng',
+    0x5532: 'ér,wā',
+    0x5533: 'lì',
+    0x5534: 'qiàng',
+    0x5535: 'ǎn,ng,n',
+    0x5536: 'zé,jiè',
+    0x5537: 'yō,yù',
+    0x5538: 'niàn,diàn',
+    0x5539: 'yū',
+    0x553A: 'tiǎn',
+    0x553B: 'lài,lái',
+    0x553C: 'shà,qiè',
+    0x553D: 'xī',
+    0x553E: 'tuò',
+    0x553F: 'hū',
+    0x5540: 'ái',
+    0x5541: 'zhāo,zhōu,dāo,tiáo,diào',
+    0x5542: 'nǒu',
+    0x5543: 'kěn',
+    0x5544: 'zhuó,zhòu',
+    0x5545: 'zhuó,zhào',
+    0x5546: 'shāng',
+    0x5547: 'dì,shì,zhāi',
+    0x5548: 'hēng,hèng,è,zá',
+    0x5549: 'lín,lán,lèn',
+    0x554A: 'a,ā,á,ǎ,à,è',
+    0x554B: 'cǎi,cāi,xiāo',
+    0x554C: 'xiāng,qiāng',
+    0x554D: 'tūn,zhūn,xiāng,tuī,duǐ',
+    0x554E: 'wǔ',
+    0x554F: 'wèn',
+    0x5550: 'cuì,zú,zá,è,chuài',
+    0x5551: 'shà,zā,jié,dié,tì',
+    0x5552: 'gǔ',
+    0x5553: 'qǐ',
+    0x5554: 'qǐ',
+    0x5555: 'táo',
+    0x5556: 'dàn',
+    0x5557: 'dàn',
+    0x5558: 'yè,wā',
+    0x5559: 'zǐ,cī',
+    0x555A: 'bǐ,tú',
+    0x555B: 'cuì',
+    0x555C: 'chuài,chuò,zhuó',
+    0x555D: 'hé',
+    0x555E: 'yǎ,è,yā',
+    0x555F: 'qǐ',
+    0x5560: 'zhé',
+    0x5561: 'fēi,pèi,pái,pēi,bài',
+    0x5562: 'liǎng,yīng',
+    0x5563: 'xián',
+    0x5564: 'pí',
+    0x5565: 'shá,shà',
+    0x5566: 'la,lā',
+    0x5567: 'zé',
+    0x5568: 'yīng,qíng',
+    0x5569: 'guà',
+    0x556A: 'pā',
+    0x556B: 'zhě',
+    0x556C: 'sè',
+    0x556D: 'zhuàn',
+    0x556E: 'niè',
+    0x556F: 'guō',
+    0x5570: 'luō,luó,luo',
+    0x5571: 'yán',
+    0x5572: 'dī',
+    0x5573: 'quán,jué',
+    0x5574: 'chǎn,tān',
+    0x5575: 'bō,bo',
+    0x5576: 'dìng',
+    0x5577: 'lāng',
+    0x5578: 'xiào',
+    0x5579: 'jú',
+    0x557A: 'táng',
+    0x557B: 'chì,dì',
+    0x557C: 'tí',
+    0x557D: 'án,ān',
+    0x557E: 'jiū',
+    0x557F: 'dàn',
+    0x5580: 'kā,kè,ke',
+    0x5581: 'yóng,yú',
+    0x5582: 'wèi',
+    0x5583: 'nán,nǎn',
+    0x5584: 'shàn',
+    0x5585: 'yù',
+    0x5586: 'zhé',
+    0x5587: 'lǎ,lá,lā,la',
+    0x5588: 'jiē,xiè',
+    0x5589: 'hóu',
+    0x558A: 'hǎn,kàn,jiān',
+    0x558B: 'dié,zhá,qiè',
+    0x558C: 'zhōu',
+    0x558D: 'chái',
+    0x558E: 'wāi',
+    0x558F: 'nuò,rě',
+    0x5590: 'yù',
+    0x5591: 'yīn,yǐn,yìn',
+    0x5592: 'zá,zǎn,zán,zà,zan',
+    0x5593: 'yāo',
+    0x5594: 'ō,wō,wū,o,ò',
+    0x5595: 'miǎn',
+    0x5596: 'hú',
+    0x5597: 'yǔn',
+    0x5598: 'chuǎn',
+    0x5599: 'huì,zhòu',
+    0x559A: 'huàn',
+    0x559B: 'huàn,yuán,xuǎn,hé',
+    0x559C: 'xǐ,xī,chì',
+    0x559D: 'hē,hè,yè,kài',
+    0x559E: 'jī',
+    0x559F: 'kuì,huài',
+    0x55A0: 'zhǒng,chǒng',
+    0x55A1: 'wéi,wèi',
+    0x55A2: 'shà,chè',
+    0x55A3: 'xǔ',
+    0x55A4: 'huáng',
+    0x55A5: 'duó,zhà',
+    0x55A6: 'niè,yì',
+    0x55A7: 'xuān,xuǎn',
+    0x55A8: 'liàng',
+    0x55A9: 'yù',
+    0x55AA: 'sàng,sāng',
+    0x55AB: 'chī,kài',
+    0x55AC: 'qiáo,jiǎo',
+    0x55AD: 'yàn,yǎn',
+    0x55AE: 'dān,dǎn,chán,shàn,chǎn,dàn,zhàn,tán',
+    0x55AF: 'pèn,bēn',
+    0x55B0: 'cān,sūn,qī',
+    0x55B1: 'lí',
+    0x55B2: 'yō,yo',
+    0x55B3: 'zhā,chā,zha',
+    0x55B4: 'wēi',
+    0x55B5: 'miāo',
+    0x55B6: 'yíng',
+    0x55B7: 'pēn,pèn',
+    0x55B8: 'bǔ',
+    0x55B9: 'kuí',
+    0x55BA: 'xí',
+    0x55BB: 'yù,yú',
+    0x55BC: 'jiē',
+    0x55BD: 'lóu,lou',
+    0x55BE: 'kù',
+    0x55BF: 'zào,qiāo',
+    0x55C0: 'hù',
+    0x55C1: 'tí',
+    0x55C2: 'yáo',
+    0x55C3: 'hè,xiāo,xiào,hù',
+    0x55C4: 'á,shà,a,xià',
+    0x55C5: 'xiù',
+    0x55C6: 'qiāng,qiàng,chéng',
+    0x55C7: 'sè',
+    0x55C8: 'yōng',
+    0x55C9: 'sù',
+    0x55CA: 'hǒng,gǒng,gòng',
+    0x55CB: 'xié',
+    0x55CC: 'ài,yì,wò',
+    0x55CD: 'suō,shuò',
+    0x55CE: 'ma,mà,má,mǎ',
+    0x55CF: 'chā',
+    0x55D0: 'hài',
+    0x55D1: 'kē,kè,hé,xiá',
+    0x55D2: 'dā,tà,da',
+    0x55D3: 'sǎng',
+    0x55D4: 'chēn,tián',
+    0x55D5: 'rù',
+    0x55D6: 'sōu,sù,sòu',
+    0x55D7: 'wā,gū',
+    0x55D8: 'jī',
+    0x55D9: 'pǎng,bēng,bàng',
+    0x55DA: 'wū,wù',
+    0x55DB: 'qiǎn,xián,qiàn,qiān,qiè',
+    0x55DC: 'shì',
+    0x55DD: 'gé',
+    0x55DE: 'zī',
+    0x55DF: 'jiē,jiè,juē',
+    0x55E0: 'lào',
+    0x55E1: 'wēng,wěng',
+    0x55E2: 'wà',
+    0x55E3: 'sì',
+    0x55E4: 'chī',
+    0x55E5: 'háo',
+    0x55E6: 'suo,suō',
+    0x55E8: 'hāi,hēi',
+    0x55E9: 'suǒ',
+    0x55EA: 'qín',
+    0x55EB: 'niè',
+    0x55EC: 'hē',
+    0x55ED: 'zhí',
+    0x55EE: 'sài',
+    0x55EF: 'ń,ńg,ňg,ǹg,ň,ǹ',
+    0x55F0: 'gě',
+    0x55F1: 'ná',
+    0x55F2: 'diē,diǎ',
+    0x55F3: 'āi,ǎi,ài',
+    0x55F4: 'qiāng',
+    0x55F5: 'tōng',
+    0x55F6: 'bì',
+    0x55F7: 'áo',
+    0x55F8: 'áo',
+    0x55F9: 'lián',
+    0x55FA: 'zuī,suī,zuǐ',
+    0x55FB: 'zhē,zhè,zhù,zhe',
+    0x55FC: 'mò',
+    0x55FD: 'sòu,shuò,shù',
+    0x55FE: 'sǒu',
+    0x55FF: 'tǎn',
+    0x5600: 'dí,zhé,dī',
+    0x5601: 'qī,zú,zā',
+    0x5602: 'jiào',
+    0x5603: 'chōng',
+    0x5604: 'jiāo,jiào,dǎo',
+    0x5605: 'kǎi,kài,gé',
+    0x5606: 'tàn',
+    0x5607: 'shān,càn,shěn',
+    0x5608: 'cáo',
+    0x5609: 'jiā',
+    0x560A: 'ái',
+    0x560B: 'xiào',
+    0x560C: 'piào,piāo',
+    0x560D: 'lóu,lǒu,lou',
+    0x560E: 'gā,gá,gǎ',
+    0x560F: 'gǔ,jiǎ',
+    0x5610: 'xiāo,jiāo,láo,bào,miù',
+    0x5611: 'hū,hù',
+    0x5612: 'huì',
+    0x5613: 'guō',
+    0x5614: 'ǒu,ōu,òu,xū,chū,ou',
+    0x5615: 'xiān',
+    0x5616: 'zé',
+    0x5617: 'cháng',
+    0x5618: 'xū,shī',
+    0x5619: 'pó',
+    0x561A: 'dē,dēi,dé,dāi',
+    0x561B: 'ma,má',
+    0x561C: 'mà',
+    0x561D: 'hú',
+    0x561E: 'lei,lē',
+    0x561F: 'dū',
+    0x5620: 'gā',
+    0x5621: 'tāng',
+    0x5622: 'yě',
+    0x5623: 'bēng',
+    0x5624: 'yīng',
+    0x5625: 'sāi',
+    0x5626: 'jiào',
+    0x5627: 'mì',
+    0x5628: 'xiào',
+    0x5629: 'huā,huá',
+    0x562A: 'mǎi',
+    0x562B: 'rán',
+    0x562C: 'chuài,zuō',
+    0x562D: 'pēng',
+    0x562E: 'láo,chāo,lào,xiāo',
+    0x562F: 'xiào,chì',
+    0x5630: 'jī',
+    0x5631: 'zhǔ',
+    0x5632: 'cháo,zhāo',
+    0x5633: 'kuì',
+    0x5634: 'zuǐ',
+    0x5635: 'xiāo',
+    0x5636: 'sī',
+    0x5637: 'háo',
+    0x5638: 'fǔ,wǔ,m̄,ḿ',
+    0x5639: 'liáo,liào',
+    0x563A: 'qiáo,qiào',
+    0x563B: 'xī',
+    0x563C: 'chù,xù,shòu',
+    0x563D: 'chǎn,tān,chān,tuō,dǎn',
+    0x563E: 'dàn,tán',
+    0x563F: 'hēi,mò,mù',
+    0x5640: 'xùn',
+    0x5641: 'ě,wù,wò',
+    0x5642: 'zǔn',
+    0x5643: 'fān,bo',
+    0x5644: 'chī',
+    0x5645: 'huī',
+    0x5646: 'zǎn,cǎn',
+    0x5647: 'chuáng',
+    0x5648: 'cù,zā,hé',
+    0x5649: 'dàn',
+    0x564A: 'yù',
+    0x564B: 'tūn,kuò',
+    0x564C: 'cēng,chēng',
+    0x564D: 'jiào,jiāo,jiū',
+    0x564E: 'yē,yì,shà',
+    0x564F: 'xī',
+    0x5650: 'qì',
+    0x5651: 'háo',
+    0x5652: 'lián',
+    0x5653: 'xū',
+    0x5654: 'dēng',
+    0x5655: 'huī',
+    0x5656: 'yín',
+    0x5657: 'pū',
+    0x5658: 'juē',
+    0x5659: 'qín',
+    0x565A: 'xún',
+    0x565B: 'niè',
+    0x565C: 'lū',
+    0x565D: 'sī',
+    0x565E: 'yǎn',
+    0x565F: 'yìng',
+    0x5660: 'dā,dá',
+    0x5661: 'zhān,dān',
+    0x5662: 'ō,yǔ,yù,ào',
+    0x5663: 'zhòu,zhuó,zhú,dú',
+    0x5664: 'jìn',
+    0x5665: 'nóng,náng',
+    0x5666: 'yuě,huì',
+    0x5667: 'xiè',
+    0x5668: 'qì',
+    0x5669: 'è',
+    0x566A: 'zào',
+    0x566B: 'yī,ǎi,yì',
+    0x566C: 'shì',
+    0x566D: 'jiào,qiào,chī',
+    0x566E: 'yuàn',
+    0x566F: 'āi,ǎi,ài',
+    0x5670: 'yōng,yǒng',
+    0x5671: 'jué,xué',
+    0x5672: 'kuài,guài,kuò,wèi',
+    0x5673: 'yǔ',
+    0x5674: 'pēn,pèn,fèn',
+    0x5675: 'dào',
+    0x5676: 'gá,gé',
+    0x5677: 'hm,xīn,hēn',
+    0x5678: 'dūn',
+    0x5679: 'dāng',
+    0x567A: 'xīn',
+    0x567B: 'sāi',
+    0x567C: 'pī',
+    0x567D: 'pǐ',
+    0x567E: 'yīn',
+    0x567F: 'zuǐ',
+    0x5680: 'níng',
+    0x5681: 'dí',
+    0x5682: 'làn,hǎn',
+    0x5683: 'tā,tà',
+    0x5684: 'huō,huò,wò,ǒ',
+    0x5685: 'rú',
+    0x5686: 'hāo',
+    0x5687: 'xià,hè',
+    0x5688: 'yè',
+    0x5689: 'duō',
+    0x568A: 'pì,xì,xiù',
+    0x568B: 'chóu,zhōu',
+    0x568C: 'jì,jiē,zhāi',
+    0x568D: 'jìn',
+    0x568E: 'háo',
+    0x568F: 'tì',
+    0x5690: 'cháng',
+    0x5691: 'xūn',
+    0x5692: 'mē',
+    0x5693: 'cā,chā',
+    0x5694: 'tì,zhì',
+    0x5695: 'lǔ,lū',
+    0x5696: 'huì',
+    0x5697: 'bó,pào,bào',
+    0x5698: 'yōu',
+    0x5699: 'niè,yǎo',
+    0x569A: 'yín',
+    0x569B: 'hù,yo',
+    0x569C: 'me,mèi,ma',
+    0x569D: 'hōng',
+    0x569E: 'zhé',
+    0x569F: 'lí',
+    0x56A0: 'liú',
+    0x56A1: 'hai',
+    0x56A2: 'náng',
+    0x56A3: 'xiāo,áo',
+    0x56A4: 'mó',
+    0x56A5: 'yàn',
+    0x56A6: 'lì',
+    0x56A7: 'lú',
+    0x56A8: 'lóng',
+    0x56A9: 'mó',
+    0x56AA: 'dàn',
+    0x56AB: 'chèn',
+    0x56AC: 'pín',
+    0x56AD: 'pǐ',
+    0x56AE: 'xiàng,xiǎng',
+    0x56AF: 'huò,xuè',
+    0x56B0: 'mó',
+    0x56B1: 'xì',
+    0x56B2: 'duǒ',
+    0x56B3: 'kù',
+    0x56B4: 'yán,yǎn',
+    0x56B5: 'chán,chān',
+    0x56B6: 'yīng',
+    0x56B7: 'rǎng,rāng',
+    0x56B8: 'diǎn',
+    0x56B9: 'lá,la',
+    0x56BA: 'tà',
+    0x56BB: 'xiāo',
+    0x56BC: 'jué,jiáo,jiào',
+    0x56BD: 'chuò',
+    0x56BE: 'huān,huàn',
+    0x56BF: 'huò',
+    0x56C0: 'zhuàn',
+    0x56C1: 'niè,zhé',
+    0x56C2: 'xiāo,áo',
+    0x56C3: 'cà,zhā,zǎ',
+    0x56C4: 'lí',
+    0x56C5: 'chǎn',
+    0x56C6: 'chài',
+    0x56C7: 'lì',
+    0x56C8: 'yì',
+    0x56C9: 'luō,luó,luo',
+    0x56CA: 'náng,nāng',
+    0x56CB: 'zá,zàn,cān',
+    0x56CC: 'sū',
+    0x56CD: 'xǐ',
+    0x56CE: 'zen',
+    0x56CF: 'jiān',
+    0x56D0: 'zá,niè,yàn,è',
+    0x56D1: 'zhǔ',
+    0x56D2: 'lán',
+    0x56D3: 'niè',
+    0x56D4: 'nāng,nang',
+    0x56D5: 'lǎn',
+    0x56D6: 'lo',
+    0x56D7: 'wéi,guó',
+    0x56D8: 'huí',
+    0x56D9: 'yīn',
+    0x56DA: 'qiú',
+    0x56DB: 'sì',
+    0x56DC: 'nín',
+    0x56DD: 'jiǎn,nān,yuè',
+    0x56DE: 'huí',
+    0x56DF: 'xìn',
+    0x56E0: 'yīn',
+    0x56E1: 'nān,niè',
+    0x56E2: 'tuán,qiú',
+    0x56E3: 'tuán',
+    0x56E4: 'dùn,tún',
+    0x56E5: 'kàng',
+    0x56E6: 'yuān',
+    0x56E7: 'jiǒng',
+    0x56E8: 'piān',
+    0x56E9: 'yún',
+    0x56EA: 'cōng',
+    0x56EB: 'hú',
+    0x56EC: 'huí',
+    0x56ED: 'yuán,wán',
+    0x56EE: 'é',
+    0x56EF: 'guó',
+    0x56F0: 'kùn',
+    0x56F1: 'cōng,chuāng',
+    0x56F2: 'tōng',
+    0x56F3: 'tú',
+    0x56F4: 'wéi',
+    0x56F5: 'lún',
+    0x56F6: 'guó',
+    0x56F7: 'qūn',
+    0x56F8: 'rì',
+    0x56F9: 'líng',
+    0x56FA: 'gù',
+    0x56FB: 'guó',
+    0x56FC: 'tāi',
+    0x56FD: 'guó',
+    0x56FE: 'tú',
+    0x56FF: 'yòu',
+    0x5700: 'guó',
+    0x5701: 'yín',
+    0x5702: 'hùn,huàn',
+    0x5703: 'pǔ',
+    0x5704: 'yǔ',
+    0x5705: 'hán',
+    0x5706: 'yuán',
+    0x5707: 'lún',
+    0x5708: 'quān,juān,juàn,quán,juǎn',
+    0x5709: 'yǔ',
+    0x570A: 'qīng',
+    0x570B: 'guó',
+    0x570C: 'chuán,chuí',
+    0x570D: 'wéi',
+    0x570E: 'yuán',
+    0x570F: 'quān',
+    0x5710: 'kū',
+    0x5711: 'pǔ',
+    0x5712: 'yuán',
+    0x5713: 'yuán',
+    0x5714: 'yà',
+    0x5715: 'tú',
+    0x5716: 'tú',
+    0x5717: 'tú',
+    0x5718: 'tuán,chuán',
+    0x5719: 'lüè',
+    0x571A: 'huì',
+    0x571B: 'yì',
+    0x571C: 'huán,yuán',
+    0x571D: 'luán',
+    0x571E: 'luán',
+    0x571F: 'tǔ,dù,chǎ,tú',
+    0x5720: 'yà',
+    0x5721: 'tǔ',
+    0x5722: 'tǐng',
+    0x5723: 'shèng,kū',
+    0x5724: 'pú',
+    0x5725: 'lù',
+    0x5726: 'kuài',
+    0x5727: 'yā',
+    0x5728: 'zài',
+    0x5729: 'wéi,xū,yú',
+    0x572A: 'gē,yì',
+    0x572B: 'yù,tuō,zhūn',
+    0x572C: 'wū',
+    0x572D: 'guī',
+    0x572E: 'pǐ',
+    0x572F: 'yí',
+    0x5730: 'dì,de',
+    0x5731: 'qiān,sú',
+    0x5732: 'qiān',
+    0x5733: 'zhèn,quǎn,chóu,huái',
+    0x5734: 'zhuó',
+    0x5735: 'dàng',
+    0x5736: 'qià',
+    0x5737: 'xià',
+    0x5738: 'shān',
+    0x5739: 'kuàng',
+    0x573A: 'chǎng,cháng',
+    0x573B: 'qí,yín',
+    0x573C: 'niè',
+    0x573D: 'mò',
+    0x573E: 'jī,jí,jié',
+    0x573F: 'jiá',
+    0x5740: 'zhǐ',
+    0x5741: 'zhǐ,zhì',
+    0x5742: 'bǎn',
+    0x5743: 'xūn',
+    0x5744: 'yì',
+    0x5745: 'qǐn',
+    0x5746: 'méi,fén',
+    0x5747: 'jūn,yùn',
+    0x5748: 'rǒng,kēng',
+    0x5749: 'tún,dùn',
+    0x574A: 'fāng,fáng',
+    0x574B: 'bèn,fèn',
+    0x574C: 'bèn',
+    0x574D: 'tān',
+    0x574E: 'kǎn,kàn',
+    0x574F: 'huài,pī,péi',
+    0x5750: 'zuò',
+    0x5751: 'kēng,kàng',
+    0x5752: 'bì',
+    0x5753: 'jǐng,xíng',
+    0x5754: 'dì,làn',
+    0x5755: 'jīng',
+    0x5756: 'jì',
+    0x5757: 'kuài,yué',
+    0x5758: 'dǐ',
+    0x5759: 'jīng',
+    0x575A: 'jiān',
+    0x575B: 'tán',
+    0x575C: 'lì',
+    0x575D: 'bà',
+    0x575E: 'wù',
+    0x575F: 'fén',
+    0x5760: 'zhuì',
+    0x5761: 'pō',
+    0x5762: 'bàn,pǎn,pàn',
+    0x5763: 'táng',
+    0x5764: 'kūn',
+    0x5765: 'qū,jù',
+    0x5766: 'tǎn',
+    0x5767: 'zhī',
+    0x5768: 'tuó,yí',
+    0x5769: 'gān',
+    0x576A: 'píng',
+    0x576B: 'diàn,zhēn',
+    0x576C: 'guà,wā',
+    0x576D: 'ní',
+    0x576E: 'tái',
+    0x576F: 'pī,huài',
+    0x5770: 'jiōng',
+    0x5771: 'yǎng',
+    0x5772: 'fó',
+    0x5773: 'ào,āo,yǒu',
+    0x5774: 'lù',
+    0x5775: 'qiū',
+    0x5776: 'mǔ,mù,méi',
+    0x5777: 'kě,kē,jiōng',
+    0x5778: 'gòu',
+    0x5779: 'xuè',
+    0x577A: 'bá',
+    0x577B: 'chí,dǐ',
+    0x577C: 'chè',
+    0x577D: 'líng',
+    0x577E: 'zhù',
+    0x577F: 'fù,fú',
+    0x5780: 'hū',
+    0x5781: 'zhì',
+    0x5782: 'chuí,zhuì',
+    0x5783: 'lā,la',
+    0x5784: 'lǒng',
+    0x5785: 'lǒng',
+    0x5786: 'lú',
+    0x5787: 'ào',
+    0x5788: 'dài',
+    0x5789: 'páo',
+    0x578A: 'min',
+    0x578B: 'xíng',
+    0x578C: 'dòng,tóng,tǒng',
+    0x578D: 'jì,jī',
+    0x578E: 'hè',
+    0x578F: 'lǜ',
+    0x5790: 'cí',
+    0x5791: 'chǐ',
+    0x5792: 'lěi',
+    0x5793: 'gāi',
+    0x5794: 'yīn',
+    0x5795: 'hòu',
+    0x5796: 'duī',
+    0x5797: 'zhào',
+    0x5798: 'fú',
+    0x5799: 'guāng',
+    0x579A: 'yáo',
+    0x579B: 'duǒ,duò',
+    0x579C: 'duǒ,duò',
+    0x579D: 'guǐ',
+    0x579E: 'chá',
+    0x579F: 'yáng',
+    0x57A0: 'yín,kèn',
+    0x57A1: 'fá',
+    0x57A2: 'gòu',
+    0x57A3: 'yuán',
+    0x57A4: 'dié',
+    0x57A5: 'xié',
+    0x57A6: 'kěn,yín',
+    0x57A7: 'shǎng,jiōng',
+    0x57A8: 'shǒu',
+    0x57A9: 'è,shèng',
+    0x57AA: 'bìng',
+    0x57AB: 'diàn',
+    0x57AC: 'hóng',
+    0x57AD: 'yā',
+    0x57AE: 'kuǎ',
+    0x57AF: 'da',
+    0x57B0: 'kǎ',
+    0x57B1: 'dàng',
+    0x57B2: 'kǎi',
+    0x57B3: 'háng',
+    0x57B4: 'nǎo',
+    0x57B5: 'ǎn,ān',
+    0x57B6: 'xīng',
+    0x57B7: 'xiàn',
+    0x57B8: 'yuàn,huán',
+    0x57B9: 'bāng',
+    0x57BA: 'fū,fú,fóu,pēi,póu',
+    0x57BB: 'bà,bèi',
+    0x57BC: 'yì',
+    0x57BD: 'yìn',
+    0x57BE: 'hàn,àn',
+    0x57BF: 'xù',
+    0x57C0: 'chuí',
+    0x57C1: 'qín',
+    0x57C2: 'gěng',
+    0x57C3: 'āi,zhì',
+    0x57C4: 'běng,fēng',
+    0x57C5: 'fáng,fāng,dì',
+    0x57C6: 'què,jué',
+    0x57C7: 'yǒng',
+    0x57C8: 'jùn',
+    0x57C9: 'jiā,xiá',
+    0x57CA: 'dì',
+    0x57CB: 'mái,mán',
+    0x57CC: 'làng',
+    0x57CD: 'juǎn',
+    0x57CE: 'chéng',
+    0x57CF: 'shān,yán',
+    0x57D0: 'jīn,qín',
+    0x57D1: 'zhé',
+    0x57D2: 'liè',
+    0x57D3: 'liè',
+    0x57D4: 'pǔ,bù',
+    0x57D5: 'chéng',
+    0x57D6: 'huā',
+    0x57D7: 'bù',
+    0x57D8: 'shí',
+    0x57D9: 'xūn',
+    0x57DA: 'guō',
+    0x57DB: 'jiōng',
+    0x57DC: 'yě',
+    0x57DD: 'niàn,diàn,niè',
+    0x57DE: 'dī',
+    0x57DF: 'yù',
+    0x57E0: 'bù',
+    0x57E1: 'yā,è,wǔ,yà',
+    0x57E2: 'quán,juǎn',
+    0x57E3: 'suì,sù',
+    0x57E4: 'pí,pì,bì,bēi',
+    0x57E5: 'qīng,zhēng',
+    0x57E6: 'wǎn,wān',
+    0x57E7: 'jù',
+    0x57E8: 'lǔn,lùn',
+    0x57E9: 'zhēng,chéng',
+    0x57EA: 'kōng',
+    0x57EB: 'chǒng,tǎng,shǎng',
+    0x57EC: 'dōng',
+    0x57ED: 'dài',
+    0x57EE: 'tàn,tán',
+    0x57EF: 'ǎn,yǎn',
+    0x57F0: 'cài,cǎi',
+    0x57F1: 'chù,tòu',
+    0x57F2: 'běng,bàng',
+    0x57F3: 'kǎn,xiàn',
+    0x57F4: 'zhí',
+    0x57F5: 'duǒ',
+    0x57F6: 'yì,shì',
+    0x57F7: 'zhí',
+    0x57F8: 'yì',
+    0x57F9: 'péi,pǒu,pī',
+    0x57FA: 'jī',
+    0x57FB: 'zhǔn,duī,guó',
+    0x57FC: 'qí',
+    0x57FD: 'sào,sǎo',
+    0x57FE: 'jù',
+    0x57FF: 'ní,nì,bàn',
+    0x5800: 'kū',
+    0x5801: 'kè',
+    0x5802: 'táng',
+    0x5803: 'kūn',
+    0x5804: 'nì',
+    0x5805: 'jiān',
+    0x5806: 'duī,zuī',
+    0x5807: 'jǐn,qín,jìn',
+    0x5808: 'gāng',
+    0x5809: 'yù',
+    0x580A: 'è,yà',
+    0x580B: 'péng,bèng,pēng,pīng',
+    0x580C: 'gù',
+    0x580D: 'tù',
+    0x580E: 'lèng',
+    0x580F: 'fang',
+    0x5810: 'yá',
+    0x5811: 'qiàn',
+    0x5812: 'kūn',
+    0x5813: 'àn',
+    0x5814: 'shēn',
+    0x5815: 'duò,huī',
+    0x5816: 'nǎo',
+    0x5817: 'tū',
+    0x5818: 'chéng',
+    0x5819: 'yīn',
+    0x581A: 'hún',
+    0x581B: 'bì',
+    0x581C: 'liàn',
+    0x581D: 'guō,wō',
+    0x581E: 'dié',
+    0x581F: 'zhuàn',
+    0x5820: 'hòu',
+    0x5821: 'bǎo,bǔ,pù',
+    0x5822: 'bǎo',
+    0x5823: 'yú',
+    0x5824: 'dī,tí,dǐ,shí,wéi',
+    0x5825: 'máo,móu,wǔ',
+    0x5826: 'jiē',
+    0x5827: 'ruán,nuò',
+    0x5828: 'yè,è,ài',
+    0x5829: 'gèng',
+    0x582A: 'kān,chěn',
+    0x582B: 'zōng',
+    0x582C: 'yú',
+    0x582D: 'huáng',
+    0x582E: 'è',
+    0x582F: 'yáo',
+    0x5830: 'yàn',
+    0x5831: 'bào,fù',
+    0x5832: 'cí,jí',
+    0x5833: 'méi',
+    0x5834: 'chǎng,cháng,shāng,dàng',
+    0x5835: 'dǔ,zhě,dū',
+    0x5836: 'tuó',
+    0x5837: 'yìn,pǒu',
+    0x5838: 'féng',
+    0x5839: 'zhòng',
+    0x583A: 'jiè',
+    0x583B: 'jīn',
+    0x583C: 'hèng',
+    0x583D: 'gāng',
+    0x583E: 'chūn',
+    0x583F: 'jiǎn,kǎn,xián',
+    0x5840: 'píng',
+    0x5841: 'lěi',
+    0x5842: 'xiàng,jiǎng',
+    0x5843: 'huāng',
+    0x5844: 'léng',
+    0x5845: 'duàn',
+    0x5846: 'wān',
+    0x5847: 'xuān',
+    0x5848: 'jì,xì',
+    0x5849: 'jí',
+    0x584A: 'kuài',
+    0x584B: 'yíng',
+    0x584C: 'tā,dā',
+    0x584D: 'chéng',
+    0x584E: 'yǒng',
+    0x584F: 'kǎi',
+    0x5850: 'sù',
+    0x5851: 'sù',
+    0x5852: 'shí',
+    0x5853: 'mì',
+    0x5854: 'tǎ,dā,da',
+    0x5855: 'wěng',
+    0x5856: 'chéng',
+    0x5857: 'tú,dù',
+    0x5858: 'táng',
+    0x5859: 'què,qiāo',
+    0x585A: 'zhǒng',
+    0x585B: 'lì',
+    0x585C: 'zhǒng,péng',
+    0x585D: 'bàng',
+    0x585E: 'sāi,sài,sè',
+    0x585F: 'zàng',
+    0x5860: 'duī',
+    0x5861: 'tián',
+    0x5862: 'wù,wǔ',
+    0x5863: 'zhèng',
+    0x5864: 'xūn',
+    0x5865: 'gé',
+    0x5866: 'zhèn',
+    0x5867: 'ài',
+    0x5868: 'gōng',
+    0x5869: 'yán',
+    0x586A: 'kǎn',
+    0x586B: 'tián,tiǎn,chén,zhèn',
+    0x586C: 'yuán',
+    0x586D: 'wēn',
+    0x586E: 'xiè',
+    0x586F: 'liù',
+    0x5870: 'hǎi',
+    0x5871: 'lǎng',
+    0x5872: 'cháng,shāng,chǎng',
+    0x5873: 'péng',
+    0x5874: 'bèng',
+    0x5875: 'chén',
+    0x5876: 'lù',
+    0x5877: 'lǔ',
+    0x5878: 'ōu',
+    0x5879: 'qiàn,jiàn',
+    0x587A: 'méi',
+    0x587B: 'mò',
+    0x587C: 'zhuān,tuán',
+    0x587D: 'shuǎng',
+    0x587E: 'shú',
+    0x587F: 'lǒu',
+    0x5880: 'chí',
+    0x5881: 'màn',
+    0x5882: 'biāo',
+    0x5883: 'jìng',
+    0x5884: 'cè',
+    0x5885: 'shù,yě',
+    0x5886: 'zhì,dì',
+    0x5887: 'zhàng',
+    0x5888: 'kàn',
+    0x5889: 'yōng',
+    0x588A: 'diàn',
+    0x588B: 'chěn',
+    0x588C: 'zhí,zhuó',
+    0x588D: 'xì',
+    0x588E: 'guō',
+    0x588F: 'qiǎng',
+    0x5890: 'jìn,qín',
+    0x5891: 'dì',
+    0x5892: 'shāng',
+    0x5893: 'mù',
+    0x5894: 'cuī',
+    0x5895: 'yàn,yān',
+    0x5896: 'tǎ',
+    0x5897: 'zēng',
+    0x5898: 'qián',
+    0x5899: 'qiáng',
+    0x589A: 'liáng',
+    0x589B: 'wèi',
+    0x589C: 'zhuì',
+    0x589D: 'qiāo,qiào',
+    0x589E: 'zēng,zèng,céng',
+    0x589F: 'xū',
+    0x58A0: 'shàn,chǎn',
+    0x58A1: 'shàn',
+    0x58A2: 'bá,fèi',
+    0x58A3: 'pú',
+    0x58A4: 'kuài,tuí',
+    0x58A5: 'dǒng,tuǎn',
+    0x58A6: 'fán,fān',
+    0x58A7: 'què,qiáo',
+    0x58A8: 'mò,mèi',
+    0x58A9: 'dūn',
+    0x58AA: 'dūn',
+    0x58AB: 'zūn,cūn',
+    0x58AC: 'dì',
+    0x58AD: 'shèng',
+    0x58AE: 'duò,huī,huì',
+    0x58AF: 'duò',
+    0x58B0: 'tán',
+    0x58B1: 'dèng,dēng',
+    0x58B2: 'mú,wú',
+    0x58B3: 'fén,fèn',
+    0x58B4: 'huáng',
+    0x58B5: 'tán',
+    0x58B6: 'da',
+    0x58B7: 'yè',
+    0x58B8: 'zhù',
+    0x58B9: 'jiàn',
+    0x58BA: 'ào',
+    0x58BB: 'qiáng',
+    0x58BC: 'jī',
+    0x58BD: 'qiāo,qiào,áo',
+    0x58BE: 'kěn',
+    0x58BF: 'yì,tú',
+    0x58C0: 'pí',
+    0x58C1: 'bì',
+    0x58C2: 'diàn',
+    0x58C3: 'jiāng',
+    0x58C4: 'yě',
+    0x58C5: 'yōng,wèng',
+    0x58C6: 'xué,jué,bó',
+    0x58C7: 'tán,shàn,dàn,tǎn',
+    0x58C8: 'lǎn',
+    0x58C9: 'jù',
+    0x58CA: 'huài',
+    0x58CB: 'dàng',
+    0x58CC: 'rǎng',
+    0x58CD: 'qiàn',
+    0x58CE: 'xūn,xùn',
+    0x58CF: 'xiàn,làn',
+    0x58D0: 'xǐ',
+    0x58D1: 'hè,huò',
+    0x58D2: 'ài',
+    0x58D3: 'yā,yà',
+    0x58D4: 'dǎo',
+    0x58D5: 'háo',
+    0x58D6: 'ruán',
+    0x58D7: 'jìn',
+    0x58D8: 'lěi,léi,lǜ',
+    0x58D9: 'kuàng,kuǎng',
+    0x58DA: 'lú',
+    0x58DB: 'yán',
+    0x58DC: 'tán',
+    0x58DD: 'wěi',
+    0x58DE: 'huài,huì,huái',
+    0x58DF: 'lǒng',
+    0x58E0: 'lǒng',
+    0x58E1: 'ruì',
+    0x58E2: 'lì',
+    0x58E3: 'lín',
+    0x58E4: 'rǎng',
+    0x58E5: 'chán',
+    0x58E6: 'xūn',
+    0x58E7: 'yán',
+    0x58E8: 'léi',
+    0x58E9: 'bà',
+    0x58EA: 'wān',
+    0x58EB: 'shì',
+    0x58EC: 'rén',
+    0x58ED: 'san',
+    0x58EE: 'zhuàng',
+    0x58EF: 'zhuàng,zhuāng',
+    0x58F0: 'shēng,qìng',
+    0x58F1: 'yī',
+    0x58F2: 'mài',
+    0x58F3: 'ké,qiào',
+    0x58F4: 'zhù',
+    0x58F5: 'zhuàng',
+    0x58F6: 'hú',
+    0x58F7: 'hú',
+    0x58F8: 'kǔn',
+    0x58F9: 'yī,yīn',
+    0x58FA: 'hú',
+    0x58FB: 'xù',
+    0x58FC: 'kǔn',
+    0x58FD: 'shòu',
+    0x58FE: 'mǎng',
+    0x58FF: 'zūn',
+    0x5900: 'shòu',
+    0x5901: 'yī',
+    0x5902: 'zhǐ,zhōng',
+    0x5903: 'gǔ,yíng',
+    0x5904: 'chù,chǔ',
+    0x5905: 'jiàng',
+    0x5906: 'féng,páng',
+    0x5907: 'bèi',
+    0x5908: 'zhāi',
+    0x5909: 'biàn',
+    0x590A: 'suī',
+    0x590B: 'qūn',
+    0x590C: 'líng',
+    0x590D: 'fù',
+    0x590E: 'cuò',
+    0x590F: 'xià,jiǎ',
+    0x5910: 'xiòng,xuàn',
+    0x5911: 'xiè',
+    0x5912: 'náo',
+    0x5913: 'xià',
+    0x5914: 'kuí',
+    0x5915: 'xī,yì',
+    0x5916: 'wài',
+    0x5917: 'yuàn,wǎn,wān,yuān',
+    0x5918: 'mǎo,wān',
+    0x5919: 'sù',
+    0x591A: 'duō',
+    0x591B: 'duō',
+    0x591C: 'yè',
+    0x591D: 'qíng',
+    0x591E: 'wài',
+    0x591F: 'gòu',
+    0x5920: 'gòu',
+    0x5921: 'qì',
+    0x5922: 'mèng,méng',
+    0x5923: 'mèng',
+    0x5924: 'yín',
+    0x5925: 'huǒ',
+    0x5926: 'chěn',
+    0x5927: 'dà,dài,tài',
+    0x5928: 'zè',
+    0x5929: 'tiān',
+    0x592A: 'tài,tā',
+    0x592B: 'fū,fú',
+    0x592C: 'guài,jué',
+    0x592D: 'yāo,wò,wāi',
+    0x592E: 'yāng,yīng',
+    0x592F: 'hāng,bèn',
+    0x5930: 'gǎo',
+    0x5931: 'shī,yì',
+    0x5932: 'tāo,běn',
+    0x5933: 'tài',
+    0x5934: 'tóu,tou',
+    0x5935: 'yǎn,tāo',
+    0x5936: 'bǐ',
+    0x5937: 'yí',
+    0x5938: 'kuā,kuà,kuǎ',
+    0x5939: 'jiā,gā,jiá',
+    0x593A: 'duó',
+    0x593B: 'huà',
+    0x593C: 'kuǎng',
+    0x593D: 'yǔn',
+    0x593E: 'jiā,jiá,xié,xiá,gā',
+    0x593F: 'bā',
+    0x5940: 'ēn',
+    0x5941: 'lián',
+    0x5942: 'huàn',
+    0x5943: 'dī,tì',
+    0x5944: 'yǎn,yān',
+    0x5945: 'pào',
+    0x5946: 'juàn',
+    0x5947: 'qí,jī,ǎi,yǐ',
+    0x5948: 'nài',
+    0x5949: 'fèng',
+    0x594A: 'xié,liè,xǐ,pí',
+    0x594B: 'fèn,kǎng',
+    0x594C: 'diǎn',
+    0x594D: 'quān',
+    0x594E: 'kuí,kuǐ',
+    0x594F: 'zòu,còu',
+    0x5950: 'huàn',
+    0x5951: 'qì,xiè,qiè,jié',
+    0x5952: 'kāi',
+    0x5953: 'zhā,shē,chǐ,zhà',
+    0x5954: 'bēn,bèn,fèn',
+    0x5955: 'yì',
+    0x5956: 'jiǎng',
+    0x5957: 'tào,tǎo',
+    0x5958: 'zàng,zhuǎng',
+    0x5959: 'běn',
+    0x595A: 'xī',
+    0x595B: 'huǎng',
+    0x595C: 'fěi,fēi',
+    0x595D: 'diāo',
+    0x595E: 'xùn',
+    0x595F: 'bēng,kēng',
+    0x5960: 'diàn,tíng,dìng,zhèng,zūn',
+    0x5961: 'ào,xiào',
+    0x5962: 'shē',
+    0x5963: 'wěng',
+    0x5964: 'hǎ,pò,tǎi',
+    0x5965: 'ào,yù,yōu',
+    0x5966: 'wù',
+    0x5967: 'ào',
+    0x5968: 'jiǎng',
+    0x5969: 'lián',
+    0x596A: 'duó,duì',
+    0x596B: 'yūn',
+    0x596C: 'jiǎng',
+    0x596D: 'shì',
+    0x596E: 'fèn',
+    0x596F: 'huò',
+    0x5970: 'bì',
+    0x5971: 'luán',
+    0x5972: 'duǒ,chě',
+    0x5973: 'nǚ,nǜ,rǔ',
+    0x5974: 'nú',
+    0x5975: 'dǐng,dīng,tiǎn',
+    0x5976: 'nǎi',
+    0x5977: 'qiān',
+    0x5978: 'jiān,gān',
+    0x5979: 'tā,jiě,chí',
+    0x597A: 'jiǔ',
+    0x597B: 'nuán',
+    0x597C: 'chà',
+    0x597D: 'hǎo,hào',
+    0x597E: 'xiān',
+    0x597F: 'fàn',
+    0x5980: 'jǐ',
+    0x5981: 'shuò,yuē',
+    0x5982: 'rú',
+    0x5983: 'fēi,pèi',
+    0x5984: 'wàng,wáng',
+    0x5985: 'hóng',
+    0x5986: 'zhuāng',
+    0x5987: 'fù',
+    0x5988: 'mā',
+    0x5989: 'dān',
+    0x598A: 'rèn,rén',
+    0x598B: 'fū,yōu',
+    0x598C: 'jìng',
+    0x598D: 'yán',
+    0x598E: 'hài,jiè',
+    0x598F: 'wèn',
+    0x5990: 'zhōng',
+    0x5991: 'pā',
+    0x5992: 'dù',
+    0x5993: 'jì,jī',
+    0x5994: 'kēng,háng',
+    0x5995: 'zhòng',
+    0x5996: 'yāo,jiǎo',
+    0x5997: 'jìn,xiān',
+    0x5998: 'yún',
+    0x5999: 'miào,miǎo',
+    0x599A: 'fǒu,pēi,pī',
+    0x599B: 'chī',
+    0x599C: 'yuè,jué',
+    0x599D: 'zhuāng',
+    0x599E: 'niū,hào',
+    0x599F: 'yàn',
+    0x59A0: 'nà,nàn',
+    0x59A1: 'xīn',
+    0x59A2: 'fén',
+    0x59A3: 'bǐ',
+    0x59A4: 'yú',
+    0x59A5: 'tuǒ',
+    0x59A6: 'fēng',
+    0x59A7: 'wàn,yuán',
+    0x59A8: 'fáng,fāng',
+    0x59A9: 'wǔ',
+    0x59AA: 'yù',
+    0x59AB: 'guī',
+    0x59AC: 'dù',
+    0x59AD: 'bá,bō',
+    0x59AE: 'nī,ní',
+    0x59AF: 'zhóu,chōu',
+    0x59B0: 'zhuó',
+    0x59B1: 'zhāo',
+    0x59B2: 'dá',
+    0x59B3: 'nǐ,nǎi',
+    0x59B4: 'yuàn',
+    0x59B5: 'tǒu',
+    0x59B6: 'xián,xuán,xù',
+    0x59B7: 'zhí,yì',
+    0x59B8: 'ē,ě',
+    0x59B9: 'mèi',
+    0x59BA: 'mò',
+    0x59BB: 'qī,qì',
+    0x59BC: 'bì',
+    0x59BD: 'shēn',
+    0x59BE: 'qiè',
+    0x59BF: 'ē',
+    0x59C0: 'hé',
+    0x59C1: 'xǔ,xū',
+    0x59C2: 'fá',
+    0x59C3: 'zhēng',
+    0x59C4: 'mín',
+    0x59C5: 'bàn',
+    0x59C6: 'mǔ',
+    0x59C7: 'fū,fú',
+    0x59C8: 'líng',
+    0x59C9: 'zǐ',
+    0x59CA: 'zǐ',
+    0x59CB: 'shǐ',
+    0x59CC: 'rǎn',
+    0x59CD: 'shān,xiān,pān',
+    0x59CE: 'yāng',
+    0x59CF: 'mán',
+    0x59D0: 'jiě,jù,xù,zū',
+    0x59D1: 'gū',
+    0x59D2: 'sì',
+    0x59D3: 'xìng,shēng',
+    0x59D4: 'wěi,wēi,wèi',
+    0x59D5: 'zī,cǐ,cī',
+    0x59D6: 'jù',
+    0x59D7: 'shān',
+    0x59D8: 'pīn,pín',
+    0x59D9: 'rèn',
+    0x59DA: 'yáo,tiào,táo,yào',
+    0x59DB: 'dòng',
+    0x59DC: 'jiāng',
+    0x59DD: 'shū',
+    0x59DE: 'jí',
+    0x59DF: 'gāi',
+    0x59E0: 'xiàng',
+    0x59E1: 'huá,huó',
+    0x59E2: 'juān',
+    0x59E3: 'jiāo,jiǎo,xiáo',
+    0x59E4: 'gòu',
+    0x59E5: 'lǎo,mǔ',
+    0x59E6: 'jiān',
+    0x59E7: 'jiān',
+    0x59E8: 'yí',
+    0x59E9: 'niàn,nián',
+    0x59EA: 'zhí',
+    0x59EB: 'jī,zhěn',
+    0x59EC: 'jī,yí',
+    0x59ED: 'xiàn',
+    0x59EE: 'héng',
+    0x59EF: 'guāng',
+    0x59F0: 'jūn,xūn,xuàn,xīn',
+    0x59F1: 'kuā,hù',
+    0x59F2: 'yàn',
+    0x59F3: 'mǐng',
+    0x59F4: 'liè',
+    0x59F5: 'pèi',
+    0x59F6: 'è,yà',
+    0x59F7: 'yòu',
+    0x59F8: 'yán',
+    0x59F9: 'chà',
+    0x59FA: 'shēn,xiān',
+    0x59FB: 'yīn',
+    0x59FC: 'shí,tí,jì',
+    0x59FD: 'guǐ,wá',
+    0x59FE: 'quán',
+    0x59FF: 'zī,zì',
+    0x5A00: 'sōng',
+    0x5A01: 'wēi',
+    0x5A02: 'hóng',
+    0x5A03: 'wá,wā,guì',
+    0x5A04: 'lóu',
+    0x5A05: 'yà',
+    0x5A06: 'ráo,rǎo',
+    0x5A07: 'jiāo',
+    0x5A08: 'luán',
+    0x5A09: 'pīng,pìn',
+    0x5A0A: 'xiàn,dān',
+    0x5A0B: 'shào,shāo',
+    0x5A0C: 'lǐ',
+    0x5A0D: 'chéng,shèng',
+    0x5A0E: 'xiè',
+    0x5A0F: 'máng',
+    0x5A10: 'fū',
+    0x5A11: 'suō,suǒ,suò',
+    0x5A12: 'méi,mǔ,wǔ',
+    0x5A13: 'wěi',
+    0x5A14: 'kè',
+    0x5A15: 'chuò,cù,lài',
+    0x5A16: 'chuò,cù',
+    0x5A17: 'tǐng,tiǎn',
+    0x5A18: 'niáng',
+    0x5A19: 'xíng',
+    0x5A1A: 'nán',
+    0x5A1B: 'yú',
+    0x5A1C: 'nà,nuó',
+    0x5A1D: 'pōu,bǐ',
+    0x5A1E: 'něi,suī',
+    0x5A1F: 'juān',
+    0x5A20: 'shēn',
+    0x5A21: 'zhì',
+    0x5A22: 'hán',
+    0x5A23: 'dì',
+    0x5A24: 'zhuāng',
+    0x5A25: 'é',
+    0x5A26: 'pín',
+    0x5A27: 'tuì',
+    0x5A28: 'xiàn',
+    0x5A29: 'miǎn,wǎn,wèn',
+    0x5A2A: 'wú,wù,yú',
+    0x5A2B: 'yán',
+    0x5A2C: 'wǔ',
+    0x5A2D: 'āi,xī',
+    0x5A2E: 'yán',
+    0x5A2F: 'yú',
+    0x5A30: 'sì',
+    0x5A31: 'yú',
+    0x5A32: 'wā',
+    0x5A33: 'lì',
+    0x5A34: 'xián',
+    0x5A35: 'jū',
+    0x5A36: 'qǔ,jū,shū',
+    0x5A37: 'zhuì,shuì',
+    0x5A38: 'qī',
+    0x5A39: 'xián',
+    0x5A3A: 'zhuó',
+    0x5A3B: 'dōng,dòng',
+    0x5A3C: 'chāng',
+    0x5A3D: 'lù',
+    0x5A3E: 'ǎi,ái,è',
+    0x5A3F: 'ē,ě',
+    0x5A40: 'ē,ě',
+    0x5A41: 'lóu,lǚ,lǘ,léi',
+    0x5A42: 'mián',
+    0x5A43: 'cóng',
+    0x5A44: 'pǒu,péi,bù',
+    0x5A45: 'jú',
+    0x5A46: 'pó',
+    0x5A47: 'cǎi',
+    0x5A48: 'líng',
+    0x5A49: 'wǎn',
+    0x5A4A: 'biǎo',
+    0x5A4B: 'xiāo',
+    0x5A4C: 'shú',
+    0x5A4D: 'qǐ',
+    0x5A4E: 'huī',
+    0x5A4F: 'fàn,fù',
+    0x5A50: 'wǒ',
+    0x5A51: 'ruí,wǒ,něi',
+    0x5A52: 'tán',
+    0x5A53: 'fēi',
+    0x5A54: 'fēi',
+    0x5A55: 'jié,qiè',
+    0x5A56: 'tiān',
+    0x5A57: 'ní,nǐ',
+    0x5A58: 'quán,juàn',
+    0x5A59: 'jìng',
+    0x5A5A: 'hūn',
+    0x5A5B: 'jīng',
+    0x5A5C: 'qiān,jǐn',
+    0x5A5D: 'diàn',
+    0x5A5E: 'xìng',
+    0x5A5F: 'hù',
+    0x5A60: 'wān,guàn',
+    0x5A61: 'lái,lài',
+    0x5A62: 'bì',
+    0x5A63: 'yīn',
+    0x5A64: 'chōu,zhōu',
+    0x5A65: 'nào,chuò',
+    0x5A66: 'fù',
+    0x5A67: 'jìng',
+    0x5A68: 'lún',
+    0x5A69: 'àn,nüè',
+    0x5A6A: 'lán,lǎn',
+    0x5A6B: 'kūn,hùn',
+    0x5A6C: 'yín',
+    0x5A6D: 'yà,yā,yǎ',
+    0x5A6E: 'jū',
+    0x5A6F: 'lì',
+    0x5A70: 'diǎn',
+    0x5A71: 'xián',
+    0x5A72: 'huā',
+    0x5A73: 'huà',
+    0x5A74: 'yīng',
+    0x5A75: 'chán',
+    0x5A76: 'shěn',
+    0x5A77: 'tíng',
+    0x5A78: 'dàng,yáng',
+    0x5A79: 'yǎo',
+    0x5A7A: 'wù,móu,mù',
+    0x5A7B: 'nàn',
+    0x5A7C: 'chuò,ruò',
+    0x5A7D: 'jiǎ',
+    0x5A7E: 'tōu',
+    0x5A7F: 'xù',
+    0x5A80: 'yù,yú',
+    0x5A81: 'wéi,wěi',
+    0x5A82: 'dì,tí',
+    0x5A83: 'róu',
+    0x5A84: 'měi',
+    0x5A85: 'dān',
+    0x5A86: 'ruǎn,nèn,nùn',
+    0x5A87: 'qīn',
+    0x5A88: 'huī',
+    0x5A89: 'wò',
+    0x5A8A: 'qián',
+    0x5A8B: 'chūn',
+    0x5A8C: 'miáo',
+    0x5A8D: 'fù',
+    0x5A8E: 'jiě',
+    0x5A8F: 'duān',
+    0x5A90: 'yí,xī',
+    0x5A91: 'zhòng',
+    0x5A92: 'méi,mèi',
+    0x5A93: 'huáng',
+    0x5A94: 'mián,miǎn',
+    0x5A95: 'ān,yǎn,è',
+    0x5A96: 'yīng',
+    0x5A97: 'xuān',
+    0x5A98: 'jiē',
+    0x5A99: 'wēi',
+    0x5A9A: 'mèi',
+    0x5A9B: 'yuàn,yuán',
+    0x5A9C: 'zhēng',
+    0x5A9D: 'qiū',
+    0x5A9E: 'shì,tí,zhī,dài',
+    0x5A9F: 'xiè',
+    0x5AA0: 'tuǒ,duò,nuǒ',
+    0x5AA1: 'liàn',
+    0x5AA2: 'mào',
+    0x5AA3: 'rǎn',
+    0x5AA4: 'sī',
+    0x5AA5: 'piān',
+    0x5AA6: 'wèi',
+    0x5AA7: 'wā',
+    0x5AA8: 'cù',
+    0x5AA9: 'hú',
+    0x5AAA: 'ǎo,yǔn,wò',
+    0x5AAB: 'jié',
+    0x5AAC: 'bǎo',
+    0x5AAD: 'xū',
+    0x5AAE: 'tōu,yú',
+    0x5AAF: 'guī,guì',
+    0x5AB0: 'chú,zòu',
+    0x5AB1: 'yáo',
+    0x5AB2: 'pì,bī,pí',
+    0x5AB3: 'xí',
+    0x5AB4: 'yuán',
+    0x5AB5: 'yìng,shèng',
+    0x5AB6: 'róng',
+    0x5AB7: 'rù',
+    0x5AB8: 'chī',
+    0x5AB9: 'liú',
+    0x5ABA: 'měi',
+    0x5ABB: 'pán',
+    0x5ABC: 'ǎo',
+    0x5ABD: 'mā',
+    0x5ABE: 'gòu',
+    0x5ABF: 'kuì,chǒu',
+    0x5AC0: 'qín,shēn',
+    0x5AC1: 'jià',
+    0x5AC2: 'sǎo',
+    0x5AC3: 'zhēn,zhěn',
+    0x5AC4: 'yuán',
+    0x5AC5: 'jiē,suǒ',
+    0x5AC6: 'róng',
+    0x5AC7: 'míng,mǐng,méng',
+    0x5AC8: 'yīng,xīng,yíng',
+    0x5AC9: 'jí',
+    0x5ACA: 'sù',
+    0x5ACB: 'niǎo',
+    0x5ACC: 'xián',
+    0x5ACD: 'tāo',
+    0x5ACE: 'páng,bàng',
+    0x5ACF: 'láng',
+    0x5AD0: 'nǎo',
+    0x5AD1: 'báo',
+    0x5AD2: 'ài',
+    0x5AD3: 'pì',
+    0x5AD4: 'pín',
+    0x5AD5: 'yì',
+    0x5AD6: 'piáo,piào,biāo',
+    0x5AD7: 'yù,yǔ,kōu',
+    0x5AD8: 'léi',
+    0x5AD9: 'xuán',
+    0x5ADA: 'mān,màn,yuān',
+    0x5ADB: 'yī',
+    0x5ADC: 'zhāng',
+    0x5ADD: 'kāng',
+    0x5ADE: 'yōng',
+    0x5ADF: 'nì',
+    0x5AE0: 'lí',
+    0x5AE1: 'dí',
+    0x5AE2: 'guī,zuī',
+    0x5AE3: 'yān',
+    0x5AE4: 'jǐn,jìn',
+    0x5AE5: 'zhuān,tuán',
+    0x5AE6: 'cháng',
+    0x5AE7: 'zé,cè',
+    0x5AE8: 'hān,nǎn',
+    0x5AE9: 'nèn',
+    0x5AEA: 'lào,láo',
+    0x5AEB: 'mó',
+    0x5AEC: 'zhē',
+    0x5AED: 'hù',
+    0x5AEE: 'hù',
+    0x5AEF: 'ào',
+    0x5AF0: 'nèn',
+    0x5AF1: 'qiáng',
+    0x5AF2: 'ma',
+    0x5AF3: 'piè',
+    0x5AF4: 'gū',
+    0x5AF5: 'wǔ',
+    0x5AF6: 'qiáo,jiāo',
+    0x5AF7: 'tuǒ',
+    0x5AF8: 'zhǎn',
+    0x5AF9: 'miáo',
+    0x5AFA: 'xián',
+    0x5AFB: 'xián',
+    0x5AFC: 'mò',
+    0x5AFD: 'liáo,liǎo,liào,lǎo',
+    0x5AFE: 'lián',
+    0x5AFF: 'huà',
+    0x5B00: 'guī',
+    0x5B01: 'dēng',
+    0x5B02: 'zhí',
+    0x5B03: 'xū',
+    0x5B04: 'yī',
+    0x5B05: 'huà',
+    0x5B06: 'xī',
+    0x5B07: 'kuì',
+    0x5B08: 'ráo,rǎo,yǎo',
+    0x5B09: 'xī,xǐ',
+    0x5B0A: 'yàn',
+    0x5B0B: 'chán',
+    0x5B0C: 'jiāo',
+    0x5B0D: 'měi',
+    0x5B0E: 'fàn,fù',
+    0x5B0F: 'fān',
+    0x5B10: 'xiān,yǎn,jìn',
+    0x5B11: 'yì',
+    0x5B12: 'huì',
+    0x5B13: 'jiào',
+    0x5B14: 'fù',
+    0x5B15: 'shì',
+    0x5B16: 'bì',
+    0x5B17: 'shàn,chán',
+    0x5B18: 'suì',
+    0x5B19: 'qiáng',
+    0x5B1A: 'liǎn',
+    0x5B1B: 'huán,xuān,qióng,xuán',
+    0x5B1C: 'xīn',
+    0x5B1D: 'niǎo',
+    0x5B1E: 'dǒng',
+    0x5B1F: 'yì,yǐ',
+    0x5B20: 'cān',
+    0x5B21: 'ài',
+    0x5B22: 'niáng',
+    0x5B23: 'níng',
+    0x5B24: 'mā',
+    0x5B25: 'tiǎo,diào',
+    0x5B26: 'chóu',
+    0x5B27: 'jìn',
+    0x5B28: 'cí',
+    0x5B29: 'yú',
+    0x5B2A: 'pín',
+    0x5B2B: 'róng',
+    0x5B2C: 'rú,nòu',
+    0x5B2D: 'nǎi,ěr,nì',
+    0x5B2E: 'yān,yàn',
+    0x5B2F: 'tái',
+    0x5B30: 'yīng,yìng',
+    0x5B31: 'qiàn',
+    0x5B32: 'niǎo',
+    0x5B33: 'yuè',
+    0x5B34: 'yíng',
+    0x5B35: 'mián',
+    0x5B36: 'bí',
+    0x5B37: 'mā,mó',
+    0x5B38: 'shěn',
+    0x5B39: 'xìng,xīng',
+    0x5B3A: 'nì',
+    0x5B3B: 'dú',
+    0x5B3C: 'liǔ',
+    0x5B3D: 'yuān',
+    0x5B3E: 'lǎn',
+    0x5B3F: 'yàn',
+    0x5B40: 'shuāng',
+    0x5B41: 'líng',
+    0x5B42: 'jiǎo',
+    0x5B43: 'niáng,ráng',
+    0x5B44: 'lǎn',
+    0x5B45: 'qiān,xiān',
+    0x5B46: 'yīng',
+    0x5B47: 'shuāng',
+    0x5B48: 'huì,xié',
+    0x5B49: 'quán,huān',
+    0x5B4A: 'mǐ',
+    0x5B4B: 'lí,lì',
+    0x5B4C: 'luán,liàn,luǎn',
+    0x5B4D: 'yán,yǎn',
+    0x5B4E: 'zhú,shú,chuò',
+    0x5B4F: 'lǎn',
+    0x5B50: 'zi,zǐ',
+    0x5B51: 'jié',
+    0x5B52: 'jué',
+    0x5B53: 'jué',
+    0x5B54: 'kǒng',
+    0x5B55: 'yùn',
+    0x5B56: 'mā,zī',
+    0x5B57: 'zì',
+    0x5B58: 'cún',
+    0x5B59: 'sūn',
+    0x5B5A: 'fú',
+    0x5B5B: 'bèi,bó',
+    0x5B5C: 'zī',
+    0x5B5D: 'xiào',
+    0x5B5E: 'xìn',
+    0x5B5F: 'mèng',
+    0x5B60: 'sì',
+    0x5B61: 'tāi',
+    0x5B62: 'bāo',
+    0x5B63: 'jì',
+    0x5B64: 'gū',
+    0x5B65: 'nú',
+    0x5B66: 'xué',
+    0x5B67: 'yòu',
+    0x5B68: 'zhuǎn,nì',
+    0x5B69: 'hái',
+    0x5B6A: 'luán',
+    0x5B6B: 'sūn,xùn',
+    0x5B6C: 'nāo',
+    0x5B6D: 'miē',
+    0x5B6E: 'cóng',
+    0x5B6F: 'qiān',
+    0x5B70: 'shú',
+    0x5B71: 'càn,chán,jiān,zhàn',
+    0x5B72: 'yā',
+    0x5B73: 'zī',
+    0x5B74: 'nǐ,nì,yì',
+    0x5B75: 'fū',
+    0x5B76: 'zī',
+    0x5B77: 'lí',
+    0x5B78: 'xué,huá,jiào',
+    0x5B79: 'bò',
+    0x5B7A: 'rú',
+    0x5B7B: 'nái',
+    0x5B7C: 'niè',
+    0x5B7D: 'niè',
+    0x5B7E: 'yīng',
+    0x5B7F: 'luán',
+    0x5B80: 'mián',
+    0x5B81: 'níng,nìng,zhù',
+    0x5B82: 'rǒng',
+    0x5B83: 'tā,tuó,yí',
+    0x5B84: 'guǐ',
+    0x5B85: 'zhái,chè,dù',
+    0x5B86: 'qióng',
+    0x5B87: 'yǔ',
+    0x5B88: 'shǒu,shòu',
+    0x5B89: 'ān',
+    0x5B8A: 'tū,jiā',
+    0x5B8B: 'sòng',
+    0x5B8C: 'wán,kuān',
+    0x5B8D: 'ròu',
+    0x5B8E: 'yǎo,yāo',
+    0x5B8F: 'hóng',
+    0x5B90: 'yí',
+    0x5B91: 'jǐng',
+    0x5B92: 'zhūn',
+    0x5B93: 'mì,fú',
+    0x5B94: 'zhǔ',
+    0x5B95: 'dàng',
+    0x5B96: 'hóng',
+    0x5B97: 'zōng',
+    0x5B98: 'guān',
+    0x5B99: 'zhòu',
+    0x5B9A: 'dìng',
+    0x5B9B: 'wǎn,yuān,yǔn,yù',
+    0x5B9C: 'yí',
+    0x5B9D: 'bǎo',
+    0x5B9E: 'shí',
+    0x5B9F: 'shí',
+    0x5BA0: 'chǒng',
+    0x5BA1: 'shěn',
+    0x5BA2: 'kè,qià',
+    0x5BA3: 'xuān',
+    0x5BA4: 'shì',
+    0x5BA5: 'yòu',
+    0x5BA6: 'huàn',
+    0x5BA7: 'yí',
+    0x5BA8: 'tiǎo',
+    0x5BA9: 'shǐ',
+    0x5BAA: 'xiàn,xiòng',
+    0x5BAB: 'gōng',
+    0x5BAC: 'chéng',
+    0x5BAD: 'qún',
+    0x5BAE: 'gōng',
+    0x5BAF: 'xiāo',
+    0x5BB0: 'zǎi',
+    0x5BB1: 'zhà',
+    0x5BB2: 'bǎo,shí',
+    0x5BB3: 'hài,hé',
+    0x5BB4: 'yàn',
+    0x5BB5: 'xiāo',
+    0x5BB6: 'jiā,jia,jià,jie,gū',
+    0x5BB7: 'shěn',
+    0x5BB8: 'chén',
+    0x5BB9: 'róng,yǒng',
+    0x5BBA: 'huǎng',
+    0x5BBB: 'mì',
+    0x5BBC: 'kòu',
+    0x5BBD: 'kuān',
+    0x5BBE: 'bīn',
+    0x5BBF: 'sù,xiǔ,xiù,qī',
+    0x5BC0: 'cǎi,cài',
+    0x5BC1: 'zǎn',
+    0x5BC2: 'jì',
+    0x5BC3: 'yuān',
+    0x5BC4: 'jì',
+    0x5BC5: 'yín',
+    0x5BC6: 'mì',
+    0x5BC7: 'kòu',
+    0x5BC8: 'qīng',
+    0x5BC9: 'hè',
+    0x5BCA: 'zhēn',
+    0x5BCB: 'jiàn',
+    0x5BCC: 'fù',
+    0x5BCD: 'níng',
+    0x5BCE: 'bìng,bǐng',
+    0x5BCF: 'huán',
+    0x5BD0: 'mèi',
+    0x5BD1: 'qǐn',
+    0x5BD2: 'hán',
+    0x5BD3: 'yù',
+    0x5BD4: 'shí',
+    0x5BD5: 'níng',
+    0x5BD6: 'jìn',
+    0x5BD7: 'níng',
+    0x5BD8: 'zhì,tián',
+    0x5BD9: 'yǔ',
+    0x5BDA: 'bǎo',
+    0x5BDB: 'kuān',
+    0x5BDC: 'níng',
+    0x5BDD: 'qǐn',
+    0x5BDE: 'mò',
+    0x5BDF: 'chá,cuì',
+    0x5BE0: 'jù,lǜ,lóu',
+    0x5BE1: 'guǎ',
+    0x5BE2: 'qǐn',
+    0x5BE3: 'hū',
+    0x5BE4: 'wù',
+    0x5BE5: 'liáo',
+    0x5BE6: 'shí,zhì',
+    0x5BE7: 'níng,nìng',
+    0x5BE8: 'zhài,sè,qiān',
+    0x5BE9: 'shěn,pán',
+    0x5BEA: 'wěi,wéi',
+    0x5BEB: 'xiě,xiè',
+    0x5BEC: 'kuān',
+    0x5BED: 'huì',
+    0x5BEE: 'liáo',
+    0x5BEF: 'jùn',
+    0x5BF0: 'huán,xiàn',
+    0x5BF1: 'yì',
+    0x5BF2: 'yí',
+    0x5BF3: 'bǎo',
+    0x5BF4: 'qīn,qìn',
+    0x5BF5: 'chǒng,lóng',
+    0x5BF6: 'bǎo',
+    0x5BF7: 'fēng',
+    0x5BF8: 'cùn,cǔn',
+    0x5BF9: 'duì',
+    0x5BFA: 'sì,shì',
+    0x5BFB: 'xún,xín',
+    0x5BFC: 'dǎo',
+    0x5BFD: 'lǜ,lüè',
+    0x5BFE: 'duì',
+    0x5BFF: 'shòu',
+    0x5C00: 'pǒ',
+    0x5C01: 'fēng,biǎn',
+    0x5C02: 'zhuān',
+    0x5C03: 'fū,bù,fǔ,pò',
+    0x5C04: 'shè,yè,yì',
+    0x5C05: 'kè,kēi',
+    0x5C06: 'jiāng,jiàng,qiāng',
+    0x5C07: 'jiāng,jiàng,qiāng,yáng,jiǎng',
+    0x5C08: 'zhuān,tuán,shuàn',
+    0x5C09: 'wèi,yù,yùn',
+    0x5C0A: 'zūn',
+    0x5C0B: 'xún,xín',
+    0x5C0C: 'shù,zhù',
+    0x5C0D: 'duì',
+    0x5C0E: 'dǎo,dào',
+    0x5C0F: 'xiǎo',
+    0x5C10: 'jié,jí',
+    0x5C11: 'shǎo,shào',
+    0x5C12: 'ěr',
+    0x5C13: 'ěr',
+    0x5C14: 'ěr',
+    0x5C15: 'gǎ',
+    0x5C16: 'jiān',
+    0x5C17: 'shū,shú',
+    0x5C18: 'chén',
+    0x5C19: 'shàng',
+    0x5C1A: 'shàng,cháng',
+    0x5C1B: 'mó',
+    0x5C1C: 'gá',
+    0x5C1D: 'cháng',
+    0x5C1E: 'liào,liáo',
+    0x5C1F: 'xiǎn',
+    0x5C20: 'xiǎn',
+    0x5C21: 'kun',
+    0x5C22: 'yóu,wāng',
+    0x5C23: 'wāng',
+    0x5C24: 'yóu',
+    0x5C25: 'liào,niǎo',
+    0x5C26: 'liào',
+    0x5C27: 'yáo',
+    0x5C28: 'máng,méng,páng',
+    0x5C29: 'wāng',
+    0x5C2A: 'wāng',
+    0x5C2B: 'wāng',
+    0x5C2C: 'gà',
+    0x5C2D: 'yáo',
+    0x5C2E: 'duò',
+    0x5C2F: 'kuì,kuǐ',
+    0x5C30: 'zhǒng',
+    0x5C31: 'jiù',
+    0x5C32: 'gān',
+    0x5C33: 'gǔ',
+    0x5C34: 'gān',
+    0x5C35: 'tuí,zhuài',
+    0x5C36: 'gān',
+    0x5C37: 'gān',
+    0x5C38: 'shī',
+    0x5C39: 'yǐn,yún',
+    0x5C3A: 'chǐ,chě',
+    0x5C3B: 'kāo',
+    0x5C3C: 'ní,nǐ',
+    0x5C3D: 'jǐn,jìn',
+    0x5C3E: 'wěi,yǐ',
+    0x5C3F: 'niào,suī',
+    0x5C40: 'jú',
+    0x5C41: 'pì',
+    0x5C42: 'céng',
+    0x5C43: 'xì',
+    0x5C44: 'bī',
+    0x5C45: 'jū,jī',
+    0x5C46: 'jiè',
+    0x5C47: 'tián',
+    0x5C48: 'qū,jué,què,jú',
+    0x5C49: 'tì',
+    0x5C4A: 'jiè',
+    0x5C4B: 'wū',
+    0x5C4C: 'diǎo',
+    0x5C4D: 'shī,shì',
+    0x5C4E: 'shǐ,xī',
+    0x5C4F: 'píng,bǐng,bìng,bīng',
+    0x5C50: 'jī',
+    0x5C51: 'xiè',
+    0x5C52: 'zhěn',
+    0x5C53: 'xiè',
+    0x5C54: 'ní',
+    0x5C55: 'zhǎn',
+    0x5C56: 'xī',
+    0x5C57: 'wěi',
+    0x5C58: 'mǎn',
+    0x5C59: 'ē',
+    0x5C5A: 'lòu',
+    0x5C5B: 'píng',
+    0x5C5C: 'tì',
+    0x5C5D: 'fèi',
+    0x5C5E: 'shǔ,zhǔ',
+    0x5C5F: 'xiè,tì',
+    0x5C60: 'tú',
+    0x5C61: 'lǚ',
+    0x5C62: 'lǚ',
+    0x5C63: 'xǐ',
+    0x5C64: 'céng',
+    0x5C65: 'lǚ',
+    0x5C66: 'jù',
+    0x5C67: 'xiè',
+    0x5C68: 'jù',
+    0x5C69: 'juē',
+    0x5C6A: 'liáo',
+    0x5C6B: 'jué',
+    0x5C6C: 'shǔ,zhǔ',
+    0x5C6D: 'xì',
+    0x5C6E: 'chè,cǎo',
+    0x5C6F: 'tún,zhūn',
+    0x5C70: 'nì,pò,jí',
+    0x5C71: 'shān',
+    0x5C72: 'wā',
+    0x5C73: 'xiān',
+    0x5C74: 'lì',
+    0x5C75: 'è,yǎn',
+    0x5C76: 'huì',
+    0x5C77: 'huì',
+    0x5C78: 'lóng,hóng',
+    0x5C79: 'yì,gē',
+    0x5C7A: 'qǐ',
+    0x5C7B: 'rèn',
+    0x5C7C: 'wù',
+    0x5C7D: 'hàn,àn',
+    0x5C7E: 'shēn',
+    0x5C7F: 'yǔ',
+    0x5C80: 'chū',
+    0x5C81: 'suì',
+    0x5C82: 'qǐ,kǎi',
+    0x5C83: 'rèn',
+    0x5C84: 'yuè',
+    0x5C85: 'bǎn',
+    0x5C86: 'yǎo',
+    0x5C87: 'áng',
+    0x5C88: 'yá,xiā',
+    0x5C89: 'wù',
+    0x5C8A: 'jié',
+    0x5C8B: 'è,jí',
+    0x5C8C: 'jí',
+    0x5C8D: 'qiān',
+    0x5C8E: 'fén,chà',
+    0x5C8F: 'wán',
+    0x5C90: 'qí',
+    0x5C91: 'cén',
+    0x5C92: 'qián',
+    0x5C93: 'qí',
+    0x5C94: 'chà',
+    0x5C95: 'jiè',
+    0x5C96: 'qū',
+    0x5C97: 'gǎng,gāng',
+    0x5C98: 'xiàn',
+    0x5C99: 'ào',
+    0x5C9A: 'lán',
+    0x5C9B: 'dǎo',
+    0x5C9C: 'bā',
+    0x5C9D: 'zuò',
+    0x5C9E: 'zuò',
+    0x5C9F: 'yǎng',
+    0x5CA0: 'jù',
+    0x5CA1: 'gāng',
+    0x5CA2: 'kě',
+    0x5CA3: 'gǒu',
+    0x5CA4: 'xué',
+    0x5CA5: 'pō',
+    0x5CA6: 'lì',
+    0x5CA7: 'tiáo',
+    0x5CA8: 'qū,jū,zǔ,jǔ',
+    0x5CA9: 'yán',
+    0x5CAA: 'fú',
+    0x5CAB: 'xiù',
+    0x5CAC: 'jiǎ,jiá',
+    0x5CAD: 'lǐng,líng',
+    0x5CAE: 'tuó',
+    0x5CAF: 'pí',
+    0x5CB0: 'ào',
+    0x5CB1: 'dài',
+    0x5CB2: 'kuàng',
+    0x5CB3: 'yuè',
+    0x5CB4: 'qū',
+    0x5CB5: 'hù',
+    0x5CB6: 'pò',
+    0x5CB7: 'mín',
+    0x5CB8: 'àn',
+    0x5CB9: 'tiáo',
+    0x5CBA: 'líng',
+    0x5CBB: 'chí',
+    0x5CBC: 'píng',
+    0x5CBD: 'dōng',
+    0x5CBE: 'hàn',
+    0x5CBF: 'kuī',
+    0x5CC0: 'xiù',
+    0x5CC1: 'mǎo',
+    0x5CC2: 'tóng',
+    0x5CC3: 'xué',
+    0x5CC4: 'yì',
+    0x5CC5: 'biàn',
+    0x5CC6: 'hé',
+    0x5CC7: 'bā,kè',
+    0x5CC8: 'luò',
+    0x5CC9: 'è',
+    0x5CCA: 'fù,niè',
+    0x5CCB: 'xún',
+    0x5CCC: 'dié',
+    0x5CCD: 'lù',
+    0x5CCE: 'ěn',
+    0x5CCF: 'ér',
+    0x5CD0: 'gāi',
+    0x5CD1: 'quān',
+    0x5CD2: 'dòng,tóng',
+    0x5CD3: 'yí',
+    0x5CD4: 'mǔ',
+    0x5CD5: 'shí',
+    0x5CD6: 'ān',
+    0x5CD7: 'wéi,wěi',
+    0x5CD8: 'huán',
+    0x5CD9: 'zhì,shì',
+    0x5CDA: 'mì',
+    0x5CDB: 'lǐ,liè',
+    0x5CDC: 'jì',
+    0x5CDD: 'tóng',
+    0x5CDE: 'wéi,wěi',
+    0x5CDF: 'yòu',
+    0x5CE0: 'qiǎ',
+    0x5CE1: 'xiá',
+    0x5CE2: 'lǐ',
+    0x5CE3: 'yáo',
+    0x5CE4: 'jiào,qiáo',
+    0x5CE5: 'zhēng',
+    0x5CE6: 'luán',
+    0x5CE7: 'jiāo',
+    0x5CE8: 'é',
+    0x5CE9: 'é',
+    0x5CEA: 'yù',
+    0x5CEB: 'xié,yé',
+    0x5CEC: 'bū',
+    0x5CED: 'qiào',
+    0x5CEE: 'qūn',
+    0x5CEF: 'fēng',
+    0x5CF0: 'fēng',
+    0x5CF1: 'náo',
+    0x5CF2: 'lǐ',
+    0x5CF3: 'yóu',
+    0x5CF4: 'xiàn',
+    0x5CF5: 'róng',
+    0x5CF6: 'dǎo',
+    0x5CF7: 'shēn',
+    0x5CF8: 'chéng',
+    0x5CF9: 'tú',
+    0x5CFA: 'gěng',
+    0x5CFB: 'jùn',
+    0x5CFC: 'gào',
+    0x5CFD: 'xiá',
+    0x5CFE: 'yín',
+    0x5CFF: 'yǔ,wú',
+    0x5D00: 'làng,lǎng',
+    0x5D01: 'kàn',
+    0x5D02: 'láo',
+    0x5D03: 'lái',
+    0x5D04: 'xiǎn',
+    0x5D05: 'què',
+    0x5D06: 'kōng',
+    0x5D07: 'chóng',
+    0x5D08: 'chóng',
+    0x5D09: 'tà',
+    0x5D0A: 'lín',
+    0x5D0B: 'huà',
+    0x5D0C: 'jū',
+    0x5D0D: 'lái',
+    0x5D0E: 'qí,qǐ,yī',
+    0x5D0F: 'mín',
+    0x5D10: 'kūn',
+    0x5D11: 'kūn',
+    0x5D12: 'zú,cuì',
+    0x5D13: 'gù',
+    0x5D14: 'cuī',
+    0x5D15: 'yá',
+    0x5D16: 'yá',
+    0x5D17: 'gǎng,gāng',
+    0x5D18: 'lún',
+    0x5D19: 'lún',
+    0x5D1A: 'léng,líng',
+    0x5D1B: 'jué,yù',
+    0x5D1C: 'duō,duǒ',
+    0x5D1D: 'zhēng',
+    0x5D1E: 'guō',
+    0x5D1F: 'yín',
+    0x5D20: 'dōng,dòng',
+    0x5D21: 'hán',
+    0x5D22: 'zhēng',
+    0x5D23: 'wěi',
+    0x5D24: 'xiáo,yáo',
+    0x5D25: 'pí,bǐ',
+    0x5D26: 'yān',
+    0x5D27: 'sōng',
+    0x5D28: 'jié',
+    0x5D29: 'bēng',
+    0x5D2A: 'zú',
+    0x5D2B: 'kū,jué',
+    0x5D2C: 'dōng',
+    0x5D2D: 'zhǎn',
+    0x5D2E: 'gù',
+    0x5D2F: 'yín',
+    0x5D30: 'zī',
+    0x5D31: 'zè',
+    0x5D32: 'huáng',
+    0x5D33: 'yú',
+    0x5D34: 'wǎi,wēi,wěi',
+    0x5D35: 'yáng,dàng',
+    0x5D36: 'fēng',
+    0x5D37: 'qiú',
+    0x5D38: 'yáng',
+    0x5D39: 'tí',
+    0x5D3A: 'yǐ',
+    0x5D3B: 'zhì',
+    0x5D3C: 'shì,dié',
+    0x5D3D: 'zǎi',
+    0x5D3E: 'yǎo,yào',
+    0x5D3F: 'è',
+    0x5D40: 'zhù',
+    0x5D41: 'kān,zhàn',
+    0x5D42: 'lǜ',
+    0x5D43: 'yǎn,yàn',
+    0x5D44: 'měi',
+    0x5D45: 'hán',
+    0x5D46: 'jī',
+    0x5D47: 'jī,xí',
+    0x5D48: 'huàn',
+    0x5D49: 'tíng',
+    0x5D4A: 'shèng,chéng',
+    0x5D4B: 'méi',
+    0x5D4C: 'qiàn,hǎn,kàn',
+    0x5D4D: 'wù,máo',
+    0x5D4E: 'yú',
+    0x5D4F: 'zōng',
+    0x5D50: 'lán',
+    0x5D51: 'kě,jié',
+    0x5D52: 'yán,niè',
+    0x5D53: 'yán',
+    0x5D54: 'wěi',
+    0x5D55: 'zōng',
+    0x5D56: 'chá',
+    0x5D57: 'suì',
+    0x5D58: 'róng',
+    0x5D59: 'kē',
+    0x5D5A: 'qīn',
+    0x5D5B: 'yú',
+    0x5D5C: 'qí',
+    0x5D5D: 'lǒu',
+    0x5D5E: 'tú',
+    0x5D5F: 'duī',
+    0x5D60: 'xī',
+    0x5D61: 'wěng',
+    0x5D62: 'cāng',
+    0x5D63: 'dàng,táng',
+    0x5D64: 'róng,yíng',
+    0x5D65: 'jié',
+    0x5D66: 'kǎi,ái',
+    0x5D67: 'liú',
+    0x5D68: 'wù',
+    0x5D69: 'sōng',
+    0x5D6A: 'qiāo,kāo',
+    0x5D6B: 'zī',
+    0x5D6C: 'wéi,wěi',
+    0x5D6D: 'bēng',
+    0x5D6E: 'diān',
+    0x5D6F: 'cuó,cī',
+    0x5D70: 'qiǎn',
+    0x5D71: 'yǒng,yóng',
+    0x5D72: 'niè',
+    0x5D73: 'cuó',
+    0x5D74: 'jǐ,jí',
+    0x5D75: 'shí',
+    0x5D76: 'ruò',
+    0x5D77: 'sǒng',
+    0x5D78: 'zōng',
+    0x5D79: 'jiàng',
+    0x5D7A: 'liáo,jiāo',
+    0x5D7B: 'kāng',
+    0x5D7C: 'chǎn',
+    0x5D7D: 'dié,dì',
+    0x5D7E: 'cēn,cān',
+    0x5D7F: 'dǐng',
+    0x5D80: 'tū',
+    0x5D81: 'lǒu',
+    0x5D82: 'zhàng',
+    0x5D83: 'zhǎn',
+    0x5D84: 'zhǎn,chán',
+    0x5D85: 'áo,ào',
+    0x5D86: 'cáo',
+    0x5D87: 'qū',
+    0x5D88: 'qiāng',
+    0x5D89: 'cuī,zuǐ',
+    0x5D8A: 'zuǐ',
+    0x5D8B: 'dǎo',
+    0x5D8C: 'dǎo',
+    0x5D8D: 'xí',
+    0x5D8E: 'yù',
+    0x5D8F: 'pèi,pǐ',
+    0x5D90: 'lóng',
+    0x5D91: 'xiàng',
+    0x5D92: 'céng,zhēng',
+    0x5D93: 'bō',
+    0x5D94: 'qīn',
+    0x5D95: 'jiāo',
+    0x5D96: 'yān',
+    0x5D97: 'láo',
+    0x5D98: 'zhàn',
+    0x5D99: 'lín,lǐn',
+    0x5D9A: 'liáo',
+    0x5D9B: 'liáo',
+    0x5D9C: 'jīn,qín',
+    0x5D9D: 'dèng',
+    0x5D9E: 'duò',
+    0x5D9F: 'zūn',
+    0x5DA0: 'jiào,qiáo',
+    0x5DA1: 'guì,jué',
+    0x5DA2: 'yáo',
+    0x5DA3: 'jiāo',
+    0x5DA4: 'yáo',
+    0x5DA5: 'jué',
+    0x5DA6: 'zhān,shàn',
+    0x5DA7: 'yì',
+    0x5DA8: 'xué',
+    0x5DA9: 'náo',
+    0x5DAA: 'yè',
+    0x5DAB: 'yè',
+    0x5DAC: 'yí,yǐ',
+    0x5DAD: 'niè',
+    0x5DAE: 'xiǎn,yǎn',
+    0x5DAF: 'jí',
+    0x5DB0: 'xiè,jiè',
+    0x5DB1: 'kě',
+    0x5DB2: 'xī',
+    0x5DB3: 'dì',
+    0x5DB4: 'ào',
+    0x5DB5: 'zuǐ',
+    0x5DB6: 'wēi',
+    0x5DB7: 'yí,nì',
+    0x5DB8: 'róng',
+    0x5DB9: 'dǎo',
+    0x5DBA: 'lǐng',
+    0x5DBB: 'jié',
+    0x5DBC: 'yǔ,xù',
+    0x5DBD: 'yuè',
+    0x5DBE: 'yǐn',
+    0x5DBF: 'ru',
+    0x5DC0: 'jié',
+    0x5DC1: 'lì,liè',
+    0x5DC2: 'guī,xī,juàn',
+    0x5DC3: 'lóng',
+    0x5DC4: 'lóng',
+    0x5DC5: 'diān',
+    0x5DC6: 'róng,hōng,yíng',
+    0x5DC7: 'xī',
+    0x5DC8: 'jú',
+    0x5DC9: 'chán',
+    0x5DCA: 'yǐng',
+    0x5DCB: 'kuī,kuì,wěi',
+    0x5DCC: 'yán',
+    0x5DCD: 'wēi',
+    0x5DCE: 'náo',
+    0x5DCF: 'quán',
+    0x5DD0: 'chǎo',
+    0x5DD1: 'cuán',
+    0x5DD2: 'luán',
+    0x5DD3: 'diān',
+    0x5DD4: 'diān',
+    0x5DD5: 'niè',
+    0x5DD6: 'yán',
+    0x5DD7: 'yán',
+    0x5DD8: 'yǎn',
+    0x5DD9: 'kuí,náo',
+    0x5DDA: 'yǎn',
+    0x5DDB: 'chuān,shùn',
+    0x5DDC: 'kuài,huān',
+    0x5DDD: 'chuān',
+    0x5DDE: 'zhōu',
+    0x5DDF: 'huāng',
+    0x5DE0: 'jīng,xíng',
+    0x5DE1: 'xún,yán,shùn',
+    0x5DE2: 'cháo,chào',
+    0x5DE3: 'cháo',
+    0x5DE4: 'liè',
+    0x5DE5: 'gōng',
+    0x5DE6: 'zuǒ',
+    0x5DE7: 'qiǎo',
+    0x5DE8: 'jù,qú',
+    0x5DE9: 'gǒng',
+    0x5DEA: 'jù',
+    0x5DEB: 'wū',
+    0x5DEC: 'pu',
+    0x5DED: 'pu',
+    0x5DEE: 'chà,chā,chāi,cī,chài,cuō,jiē',
+    0x5DEF: 'qiú',
+    0x5DF0: 'qiú',
+    0x5DF1: 'jǐ,qǐ',
+    0x5DF2: 'yǐ,sì',
+    0x5DF3: 'sì,yǐ',
+    0x5DF4: 'bā',
+    0x5DF5: 'zhī',
+    0x5DF6: 'zhāo',
+    0x5DF7: 'xiàng,hàng',
+    0x5DF8: 'yí',
+    0x5DF9: 'jǐn',
+    0x5DFA: 'xùn',
+    0x5DFB: 'juàn',
+    0x5DFC: 'bā',
+    0x5DFD: 'xùn,zhuàn',
+    0x5DFE: 'jīn',
+    0x5DFF: 'fú,pó',
+    0x5E00: 'zā',
+    0x5E01: 'bì,yìn',
+    0x5E02: 'shì,fú',
+    0x5E03: 'bù',
+    0x5E04: 'dīng',
+    0x5E05: 'shuài',
+    0x5E06: 'fān,fán,fàn',
+    0x5E07: 'niè',
+    0x5E08: 'shī',
+    0x5E09: 'fēn',
+    0x5E0A: 'pà,pā',
+    0x5E0B: 'zhǐ',
+    0x5E0C: 'xī',
+    0x5E0D: 'hù',
+    0x5E0E: 'dàn',
+    0x5E0F: 'wéi',
+    0x5E10: 'zhàng',
+    0x5E11: 'tǎng,nú',
+    0x5E12: 'dài',
+    0x5E13: 'mò,wà',
+    0x5E14: 'pèi,pī',
+    0x5E15: 'pà,mò',
+    0x5E16: 'tiē,tiě,tiè',
+    0x5E17: 'bō,fú',
+    0x5E18: 'lián,chén',
+    0x5E19: 'zhì',
+    0x5E1A: 'zhǒu',
+    0x5E1B: 'bó',
+    0x5E1C: 'zhì',
+    0x5E1D: 'dì',
+    0x5E1E: 'mò',
+    0x5E1F: 'yì',
+    0x5E20: 'yì',
+    0x5E21: 'píng',
+    0x5E22: 'qià',
+    0x5E23: 'juǎn,juàn',
+    0x5E24: 'rú',
+    0x5E25: 'shuài',
+    0x5E26: 'dài',
+    0x5E27: 'zhèng,zhēn',
+    0x5E28: 'shuì',
+    0x5E29: 'qiào',
+    0x5E2A: 'zhēn',
+    0x5E2B: 'shī',
+    0x5E2C: 'qún',
+    0x5E2D: 'xí',
+    0x5E2E: 'bāng',
+    0x5E2F: 'dài',
+    0x5E30: 'guī',
+    0x5E31: 'chóu,dào',
+    0x5E32: 'píng',
+    0x5E33: 'zhàng',
+    0x5E34: 'sàn,jiǎn,jiān',
+    0x5E35: 'wān',
+    0x5E36: 'dài',
+    0x5E37: 'wéi',
+    0x5E38: 'cháng',
+    0x5E39: 'shà,qiè',
+    0x5E3A: 'qí,jì',
+    0x5E3B: 'zé',
+    0x5E3C: 'guó',
+    0x5E3D: 'mào',
+    0x5E3E: 'dǔ',
+    0x5E3F: 'hóu',
+    0x5E40: 'zhèng',
+    0x5E41: 'xū',
+    0x5E42: 'mì',
+    0x5E43: 'wéi',
+    0x5E44: 'wò',
+    0x5E45: 'fú,bī',
+    0x5E46: 'yì,kài',
+    0x5E47: 'bāng',
+    0x5E48: 'píng',
+    0x5E49: 'dié',
+    0x5E4A: 'gōng',
+    0x5E4B: 'pán',
+    0x5E4C: 'huǎng',
+    0x5E4D: 'tāo',
+    0x5E4E: 'mì',
+    0x5E4F: 'jià',
+    0x5E50: 'téng',
+    0x5E51: 'huī',
+    0x5E52: 'zhōng',
+    0x5E53: 'shān,shēn,qiāo',
+    0x5E54: 'màn',
+    0x5E55: 'mù,màn',
+    0x5E56: 'biāo',
+    0x5E57: 'guó',
+    0x5E58: 'zé,cè',
+    0x5E59: 'mù',
+    0x5E5A: 'bāng',
+    0x5E5B: 'zhàng',
+    0x5E5C: 'jǐng',
+    0x5E5D: 'chǎn,chàn',
+    0x5E5E: 'fú',
+    0x5E5F: 'zhì',
+    0x5E60: 'hū,wú',
+    0x5E61: 'fān',
+    0x5E62: 'chuáng,zhuàng',
+    0x5E63: 'bì',
+    0x5E64: 'bì',
+    0x5E65: 'zhǎng',
+    0x5E66: 'mì',
+    0x5E67: 'qiāo',
+    0x5E68: 'chān,chàn',
+    0x5E69: 'fén,fèn',
+    0x5E6A: 'méng,měng',
+    0x5E6B: 'bāng',
+    0x5E6C: 'chóu,dào',
+    0x5E6D: 'miè',
+    0x5E6E: 'chú',
+    0x5E6F: 'jié',
+    0x5E70: 'xiǎn',
+    0x5E71: 'lán',
+    0x5E72: 'gàn,gān,àn',
+    0x5E73: 'píng,pián,bìng,bēng',
+    0x5E74: 'nián,nìng',
+    0x5E75: 'jiān,qiān',
+    0x5E76: 'bìng,bīng',
+    0x5E77: 'bìng,bīng',
+    0x5E78: 'xìng,niè',
+    0x5E79: 'gàn,gān,hán,guǎn',
+    0x5E7A: 'yāo,mì',
+    0x5E7B: 'huàn',
+    0x5E7C: 'yòu,yào',
+    0x5E7D: 'yōu',
+    0x5E7E: 'jǐ,jī,jì,qí',
+    0x5E7F: 'guǎng,yǎn,ān',
+    0x5E80: 'pǐ',
+    0x5E81: 'tīng',
+    0x5E82: 'zè',
+    0x5E83: 'guǎng',
+    0x5E84: 'zhuāng,péng',
+    0x5E85: 'mó',
+    0x5E86: 'qìng',
+    0x5E87: 'bì,pí,pǐ',
+    0x5E88: 'qín',
+    0x5E89: 'dùn,tún',
+    0x5E8A: 'chuáng',
+    0x5E8B: 'guǐ,guì',
+    0x5E8C: 'yǎ,yá',
+    0x5E8D: 'bài,xìn,tīng',
+    0x5E8E: 'jiè',
+    0x5E8F: 'xù',
+    0x5E90: 'lú',
+    0x5E91: 'wǔ',
+    0x5E92: 'zhuāng',
+    0x5E93: 'kù',
+    0x5E94: 'yīng,yìng',
+    0x5E95: 'dǐ,de',
+    0x5E96: 'páo',
+    0x5E97: 'diàn',
+    0x5E98: 'yā',
+    0x5E99: 'miào',
+    0x5E9A: 'gēng',
+    0x5E9B: 'cì',
+    0x5E9C: 'fǔ',
+    0x5E9D: 'tóng',
+    0x5E9E: 'páng',
+    0x5E9F: 'fèi',
+    0x5EA0: 'xiáng',
+    0x5EA1: 'yǐ',
+    0x5EA2: 'zhì',
+    0x5EA3: 'tiāo',
+    0x5EA4: 'zhì',
+    0x5EA5: 'xiū',
+    0x5EA6: 'dù,duó,zhái',
+    0x5EA7: 'zuò',
+    0x5EA8: 'xiāo',
+    0x5EA9: 'tú',
+    0x5EAA: 'guǐ',
+    0x5EAB: 'kù',
+    0x5EAC: 'máng,méng',
+    0x5EAD: 'tíng',
+    0x5EAE: 'yǒu,yóu',
+    0x5EAF: 'bū',
+    0x5EB0: 'bìng,bǐng',
+    0x5EB1: 'chěng',
+    0x5EB2: 'lái',
+    0x5EB3: 'bì,pí',
+    0x5EB4: 'jí,jī',
+    0x5EB5: 'ān,yǎn,è',
+    0x5EB6: 'shù,zhù,zhē',
+    0x5EB7: 'kāng,kàng',
+    0x5EB8: 'yōng,yóng',
+    0x5EB9: 'tuǒ',
+    0x5EBA: 'sōng',
+    0x5EBB: 'shù',
+    0x5EBC: 'qǐng',
+    0x5EBD: 'yù',
+    0x5EBE: 'yǔ,yú',
+    0x5EBF: 'miào',
+    0x5EC0: 'sōu',
+    0x5EC1: 'cè,cì,zè,si',
+    0x5EC2: 'xiāng',
+    0x5EC3: 'fèi',
+    0x5EC4: 'jiù',
+    0x5EC5: 'è',
+    0x5EC6: 'guī,wěi,huì',
+    0x5EC7: 'liù',
+    0x5EC8: 'shà,xià',
+    0x5EC9: 'lián',
+    0x5ECA: 'láng',
+    0x5ECB: 'sōu',
+    0x5ECC: 'zhì',
+    0x5ECD: 'bù',
+    0x5ECE: 'qǐng,qìng,qīng',
+    0x5ECF: 'jiù',
+    0x5ED0: 'jiù',
+    0x5ED1: 'jǐn,qín',
+    0x5ED2: 'áo',
+    0x5ED3: 'kuò',
+    0x5ED4: 'lóu',
+    0x5ED5: 'yìn',
+    0x5ED6: 'liào,liáo',
+    0x5ED7: 'dài',
+    0x5ED8: 'lù',
+    0x5ED9: 'yì',
+    0x5EDA: 'chú',
+    0x5EDB: 'chán',
+    0x5EDC: 'tú',
+    0x5EDD: 'sī',
+    0x5EDE: 'xīn,qiàn',
+    0x5EDF: 'miào',
+    0x5EE0: 'chǎng',
+    0x5EE1: 'wǔ,wú',
+    0x5EE2: 'fèi',
+    0x5EE3: 'guǎng,guàng,kuàng,guāng',
+    0x5EE4: 'kù',
+    0x5EE5: 'kuài',
+    0x5EE6: 'bì',
+    0x5EE7: 'qiáng,sè',
+    0x5EE8: 'xiè',
+    0x5EE9: 'lǐn,lǎn',
+    0x5EEA: 'lǐn',
+    0x5EEB: 'liáo',
+    0x5EEC: 'lú,lǘ',
+    0x5EED: 'jì',
+    0x5EEE: 'yǐng',
+    0x5EEF: 'xiān',
+    0x5EF0: 'tīng',
+    0x5EF1: 'yōng',
+    0x5EF2: 'lí',
+    0x5EF3: 'tīng',
+    0x5EF4: 'yǐn,yìn',
+    0x5EF5: 'xún',
+    0x5EF6: 'yán',
+    0x5EF7: 'tíng',
+    0x5EF8: 'dí',
+    0x5EF9: 'pǎi,pò',
+    0x5EFA: 'jiàn',
+    0x5EFB: 'huí',
+    0x5EFC: 'nǎi',
+    0x5EFD: 'huí',
+    0x5EFE: 'gǒng',
+    0x5EFF: 'niàn',
+    0x5F00: 'kāi',
+    0x5F01: 'biàn,pán',
+    0x5F02: 'yì,yí',
+    0x5F03: 'qì',
+    0x5F04: 'nòng,lòng',
+    0x5F05: 'fèn',
+    0x5F06: 'jǔ,qǔ',
+    0x5F07: 'yǎn,yān,nán',
+    0x5F08: 'yì',
+    0x5F09: 'zàng',
+    0x5F0A: 'bì',
+    0x5F0B: 'yì',
+    0x5F0C: 'yī',
+    0x5F0D: 'èr',
+    0x5F0E: 'sān',
+    0x5F0F: 'shì,tè',
+    0x5F10: 'èr',
+    0x5F11: 'shì',
+    0x5F12: 'shì',
+    0x5F13: 'gōng',
+    0x5F14: 'diào,dì',
+    0x5F15: 'yǐn',
+    0x5F16: 'hù',
+    0x5F17: 'fú',
+    0x5F18: 'hóng',
+    0x5F19: 'wū',
+    0x5F1A: 'tuí',
+    0x5F1B: 'chí',
+    0x5F1C: 'jiàng',
+    0x5F1D: 'bà',
+    0x5F1E: 'shěn',
+    0x5F1F: 'dì,tì,tuí',
+    0x5F20: 'zhāng',
+    0x5F21: 'jué,zhāng',
+    0x5F22: 'tāo',
+    0x5F23: 'fǔ',
+    0x5F24: 'dǐ',
+    0x5F25: 'mí',
+    0x5F26: 'xián',
+    0x5F27: 'hú',
+    0x5F28: 'chāo',
+    0x5F29: 'nǔ',
+    0x5F2A: 'jìng',
+    0x5F2B: 'zhěn',
+    0x5F2C: 'yí',
+    0x5F2D: 'mǐ',
+    0x5F2E: 'quān,juàn',
+    0x5F2F: 'wān',
+    0x5F30: 'shāo',
+    0x5F31: 'ruò',
+    0x5F32: 'xuān,yuān',
+    0x5F33: 'jìng',
+    0x5F34: 'diāo',
+    0x5F35: 'zhāng,zhàng',
+    0x5F36: 'jiàng',
+    0x5F37: 'qiáng,jiàng,qiǎng',
+    0x5F38: 'péng,pēng',
+    0x5F39: 'dàn,tán',
+    0x5F3A: 'qiáng,jiàng,qiǎng',
+    0x5F3B: 'bì',
+    0x5F3C: 'bì',
+    0x5F3D: 'shè',
+    0x5F3E: 'dàn',
+    0x5F3F: 'jiǎn',
+    0x5F40: 'gòu,kōu',
+    0x5F41: 'gē',
+    0x5F42: 'fā',
+    0x5F43: 'bì',
+    0x5F44: 'kōu',
+    0x5F45: 'jiǎn',
+    0x5F46: 'biè',
+    0x5F47: 'xiāo',
+    0x5F48: 'dàn,tán',
+    0x5F49: 'guō',
+    0x5F4A: 'jiàng,qiáng,qiǎng,jiāng',
+    0x5F4B: 'hóng',
+    0x5F4C: 'mí,mǐ,ní',
+    0x5F4D: 'guō',
+    0x5F4E: 'wān',
+    0x5F4F: 'jué',
+    0x5F50: 'jì',
+    0x5F51: 'jì',
+    0x5F52: 'guī',
+    0x5F53: 'dāng,dàng',
+    0x5F54: 'lù',
+    0x5F55: 'lù',
+    0x5F56: 'tuàn,shǐ',
+    0x5F57: 'huì,suì',
+    0x5F58: 'zhì',
+    0x5F59: 'huì',
+    0x5F5A: 'huì',
+    0x5F5B: 'yí',
+    0x5F5C: 'yí',
+    0x5F5D: 'yí',
+    0x5F5E: 'yí',
+    0x5F5F: 'yuē',
+    0x5F60: 'yuē',
+    0x5F61: 'shān,xiǎn',
+    0x5F62: 'xíng',
+    0x5F63: 'wén',
+    0x5F64: 'tóng',
+    0x5F65: 'yàn',
+    0x5F66: 'yàn,pán',
+    0x5F67: 'yù',
+    0x5F68: 'chī',
+    0x5F69: 'cǎi',
+    0x5F6A: 'biāo',
+    0x5F6B: 'diāo',
+    0x5F6C: 'bīn,bān',
+    0x5F6D: 'péng,páng,bāng,pēng',
+    0x5F6E: 'yǒng',
+    0x5F6F: 'piāo,piào,miǎo',
+    0x5F70: 'zhāng',
+    0x5F71: 'yǐng',
+    0x5F72: 'chī',
+    0x5F73: 'chì,fú',
+    0x5F74: 'zhuó,bó',
+    0x5F75: 'tuǒ,yí',
+    0x5F76: 'jí',
+    0x5F77: 'páng,fǎng,fáng',
+    0x5F78: 'zhōng',
+    0x5F79: 'yì',
+    0x5F7A: 'wáng',
+    0x5F7B: 'chè',
+    0x5F7C: 'bǐ',
+    0x5F7D: 'dī',
+    0x5F7E: 'líng,lǐng',
+    0x5F7F: 'fú',
+    0x5F80: 'wǎng,wàng',
+    0x5F81: 'zhēng',
+    0x5F82: 'cú',
+    0x5F83: 'wǎng',
+    0x5F84: 'jìng',
+    0x5F85: 'dài,dāi',
+    0x5F86: 'xī',
+    0x5F87: 'xùn',
+    0x5F88: 'hěn',
+    0x5F89: 'yáng',
+    0x5F8A: 'huái,huí',
+    0x5F8B: 'lǜ',
+    0x5F8C: 'hòu',
+    0x5F8D: 'wǎng,wā',
+    0x5F8E: 'chěng,zhèng',
+    0x5F8F: 'zhì',
+    0x5F90: 'xú',
+    0x5F91: 'jìng,jīng',
+    0x5F92: 'tú',
+    0x5F93: 'cóng',
+    0x5F94: 'zhi',
+    0x5F95: 'lái,lài',
+    0x5F96: 'cóng',
+    0x5F97: 'dé,de,děi',
+    0x5F98: 'pái',
+    0x5F99: 'xǐ,sī',
+    0x5F9A: 'dōng',
+    0x5F9B: 'jì',
+    0x5F9C: 'cháng',
+    0x5F9D: 'zhì',
+    0x5F9E: 'cóng,zòng,zōng,cōng,zǒng',
+    0x5F9F: 'zhōu',
+    0x5FA0: 'lái,lài',
+    0x5FA1: 'yù,yà',
+    0x5FA2: 'xiè',
+    0x5FA3: 'jiè',
+    0x5FA4: 'jiàn',
+    0x5FA5: 'shì,tǐ',
+    0x5FA6: 'jiǎ,xiá',
+    0x5FA7: 'biàn,pián,piān',
+    0x5FA8: 'huáng',
+    0x5FA9: 'fù',
+    0x5FAA: 'xún',
+    0x5FAB: 'wěi',
+    0x5FAC: 'páng,bàng',
+    0x5FAD: 'yáo',
+    0x5FAE: 'wēi',
+    0x5FAF: 'xī,xí',
+    0x5FB0: 'zhēng',
+    0x5FB1: 'piào',
+    0x5FB2: 'tí,chí',
+    0x5FB3: 'dé',
+    0x5FB4: 'zhēng',
+    0x5FB5: 'zhēng,zhǐ,chéng',
+    0x5FB6: 'bié',
+    0x5FB7: 'dé',
+    0x5FB8: 'chōng,zhōng,zhǒng',
+    0x5FB9: 'chè',
+    0x5FBA: 'jiǎo',
+    0x5FBB: 'huì',
+    0x5FBC: 'jiǎo,jiào,jiāo,yāo',
+    0x5FBD: 'huī',
+    0x5FBE: 'méi',
+    0x5FBF: 'lòng,lǒng',
+    0x5FC0: 'xiāng,rǎng',
+    0x5FC1: 'bào',
+    0x5FC2: 'qú,jù',
+    0x5FC3: 'xīn',
+    0x5FC4: 'xin',
+    0x5FC5: 'bì',
+    0x5FC6: 'yì',
+    0x5FC7: 'lè',
+    0x5FC8: 'rén',
+    0x5FC9: 'dāo',
+    0x5FCA: 'dìng,tìng',
+    0x5FCB: 'gǎi',
+    0x5FCC: 'jì',
+    0x5FCD: 'rěn,rèn',
+    0x5FCE: 'rén',
+    0x5FCF: 'chàn,qiǎn,qiān',
+    0x5FD0: 'tǎn,kěng',
+    0x5FD1: 'tè,dǎo',
+    0x5FD2: 'tè,tuī,tēi',
+    0x5FD3: 'gān,hàn',
+    0x5FD4: 'qì,yì',
+    0x5FD5: 'shì,tài',
+    0x5FD6: 'cǔn',
+    0x5FD7: 'zhì',
+    0x5FD8: 'wàng,wáng',
+    0x5FD9: 'máng',
+    0x5FDA: 'xī,liě',
+    0x5FDB: 'fān',
+    0x5FDC: 'yīng',
+    0x5FDD: 'tiǎn',
+    0x5FDE: 'mín,wěn',
+    0x5FDF: 'wěn',
+    0x5FE0: 'zhōng',
+    0x5FE1: 'chōng',
+    0x5FE2: 'wù',
+    0x5FE3: 'jí',
+    0x5FE4: 'wǔ,wù',
+    0x5FE5: 'xì',
+    0x5FE6: 'jiá',
+    0x5FE7: 'yōu,yòu',
+    0x5FE8: 'wàn,wán',
+    0x5FE9: 'cōng',
+    0x5FEA: 'sōng,zhōng',
+    0x5FEB: 'kuài',
+    0x5FEC: 'yù,shū',
+    0x5FED: 'biàn',
+    0x5FEE: 'zhì,qí',
+    0x5FEF: 'qí,shì',
+    0x5FF0: 'cuì',
+    0x5FF1: 'chén,dàn',
+    0x5FF2: 'tài',
+    0x5FF3: 'tún,zhūn,dùn',
+    0x5FF4: 'qián,qín',
+    0x5FF5: 'niàn',
+    0x5FF6: 'hún',
+    0x5FF7: 'xiōng',
+    0x5FF8: 'niǔ',
+    0x5FF9: 'kuáng,wǎng',
+    0x5FFA: 'xiān',
+    0x5FFB: 'xīn',
+    0x5FFC: 'kāng,hāng,hàng',
+    0x5FFD: 'hū',
+    0x5FFE: 'kài,qì',
+    0x5FFF: 'fèn',
+    0x6000: 'huái,fù',
+    0x6001: 'tài',
+    0x6002: 'sǒng',
+    0x6003: 'wǔ',
+    0x6004: 'òu',
+    0x6005: 'chàng',
+    0x6006: 'chuàng',
+    0x6007: 'jù',
+    0x6008: 'yì',
+    0x6009: 'bǎo,bào',
+    0x600A: 'chāo',
+    0x600B: 'mín,mén',
+    0x600C: 'pēi',
+    0x600D: 'zuò,zhà',
+    0x600E: 'zěn',
+    0x600F: 'yàng,yāng',
+    0x6010: 'jù,kòu',
+    0x6011: 'bàn',
+    0x6012: 'nù',
+    0x6013: 'náo,niú',
+    0x6014: 'zhēng,zhèng',
+    0x6015: 'pà,bó',
+    0x6016: 'bù',
+    0x6017: 'tiē,zhān',
+    0x6018: 'hù,gù',
+    0x6019: 'hù,tiē',
+    0x601A: 'jù,qū,cū,zū',
+    0x601B: 'dá,dàn',
+    0x601C: 'lián,líng,lǐng',
+    0x601D: 'sī,sāi',
+    0x601E: 'chóu,yóu',
+    0x601F: 'dì',
+    0x6020: 'dài,yí',
+    0x6021: 'yí',
+    0x6022: 'tū,dié,tuì',
+    0x6023: 'yóu',
+    0x6024: 'fū',
+    0x6025: 'jí',
+    0x6026: 'pēng',
+    0x6027: 'xìng',
+    0x6028: 'yuàn,yùn',
+    0x6029: 'ní',
+    0x602A: 'guài',
+    0x602B: 'fú,fèi,bèi',
+    0x602C: 'xì',
+    0x602D: 'bì',
+    0x602E: 'yōu,yào',
+    0x602F: 'qiè',
+    0x6030: 'xuàn',
+    0x6031: 'cōng',
+    0x6032: 'bǐng',
+    0x6033: 'huǎng',
+    0x6034: 'xù,xuè',
+    0x6035: 'chù,xù',
+    0x6036: 'bì,pī',
+    0x6037: 'shù',
+    0x6038: 'xī',
+    0x6039: 'tān',
+    0x603A: 'yǒng',
+    0x603B: 'zǒng',
+    0x603C: 'duì',
+    0x603D: 'mo',
+    0x603E: 'zhǐ',
+    0x603F: 'yì',
+    0x6040: 'shì',
+    0x6041: 'nèn,rèn,nín',
+    0x6042: 'xún,shùn',
+    0x6043: 'shì,zhì',
+    0x6044: 'xì',
+    0x6045: 'lǎo',
+    0x6046: 'héng,gèng',
+    0x6047: 'kuāng',
+    0x6048: 'móu',
+    0x6049: 'zhǐ',
+    0x604A: 'xié',
+    0x604B: 'liàn',
+    0x604C: 'tiāo,yáo',
+    0x604D: 'huǎng,guāng',
+    0x604E: 'dié',
+    0x604F: 'hào',
+    0x6050: 'kǒng',
+    0x6051: 'guǐ,wéi',
+    0x6052: 'héng',
+    0x6053: 'xī,qī,xù',
+    0x6054: 'jiǎo,xiào',
+    0x6055: 'shù',
+    0x6056: 'sī',
+    0x6057: 'hū,kuā',
+    0x6058: 'qiū',
+    0x6059: 'yàng',
+    0x605A: 'huì',
+    0x605B: 'huí',
+    0x605C: 'chì',
+    0x605D: 'jiá,qì',
+    0x605E: 'yí',
+    0x605F: 'xiōng',
+    0x6060: 'guài',
+    0x6061: 'lìn',
+    0x6062: 'huī',
+    0x6063: 'zì',
+    0x6064: 'xù',
+    0x6065: 'chǐ',
+    0x6066: 'shàng',
+    0x6067: 'nǜ',
+    0x6068: 'hèn',
+    0x6069: 'ēn',
+    0x606A: 'kè',
+    0x606B: 'dòng,tōng',
+    0x606C: 'tián',
+    0x606D: 'gōng',
+    0x606E: 'quān,zhuān',
+    0x606F: 'xī',
+    0x6070: 'qià',
+    0x6071: 'yuè',
+    0x6072: 'pēng',
+    0x6073: 'kěn',
+    0x6074: 'dé',
+    0x6075: 'huì',
+    0x6076: 'è,ě,wù,wū',
+    0x6077: 'xiao',
+    0x6078: 'tòng',
+    0x6079: 'yān',
+    0x607A: 'kǎi',
+    0x607B: 'cè',
+    0x607C: 'nǎo',
+    0x607D: 'yùn',
+    0x607E: 'máng',
+    0x607F: 'yǒng,tōng',
+    0x6080: 'yǒng',
+    0x6081: 'yuān,juàn',
+    0x6082: 'pī,bī,pǐ',
+    0x6083: 'kǔn',
+    0x6084: 'qiāo,qiǎo,qiào',
+    0x6085: 'yuè',
+    0x6086: 'yù,shū',
+    0x6087: 'tú,yú',
+    0x6088: 'jiè,kè',
+    0x6089: 'xī',
+    0x608A: 'zhé',
+    0x608B: 'lìn',
+    0x608C: 'tì',
+    0x608D: 'hàn',
+    0x608E: 'hào,jiào',
+    0x608F: 'qiè',
+    0x6090: 'tì',
+    0x6091: 'bù',
+    0x6092: 'yì',
+    0x6093: 'qiàn',
+    0x6094: 'huǐ',
+    0x6095: 'xī',
+    0x6096: 'bèi,běi',
+    0x6097: 'mán,mèn',
+    0x6098: 'yī,yì',
+    0x6099: 'hēng,hèng',
+    0x609A: 'sǒng',
+    0x609B: 'quān,xún',
+    0x609C: 'chěng',
+    0x609D: 'kuī,lǐ',
+    0x609E: 'wù',
+    0x609F: 'wù',
+    0x60A0: 'yōu',
+    0x60A1: 'lí',
+    0x60A2: 'liàng,lǎng',
+    0x60A3: 'huàn',
+    0x60A4: 'cōng',
+    0x60A5: 'yì',
+    0x60A6: 'yuè',
+    0x60A7: 'lì',
+    0x60A8: 'nín',
+    0x60A9: 'nǎo',
+    0x60AA: 'è',
+    0x60AB: 'què',
+    0x60AC: 'xuán',
+    0x60AD: 'qiān',
+    0x60AE: 'wù',
+    0x60AF: 'mǐn',
+    0x60B0: 'cóng',
+    0x60B1: 'fěi',
+    0x60B2: 'bēi',
+    0x60B3: 'dé',
+    0x60B4: 'cuì',
+    0x60B5: 'chàng',
+    0x60B6: 'mèn,mēn',
+    0x60B7: 'lì',
+    0x60B8: 'jì',
+    0x60B9: 'guàn',
+    0x60BA: 'guàn',
+    0x60BB: 'xìng',
+    0x60BC: 'dào',
+    0x60BD: 'qī,qì',
+    0x60BE: 'kōng,kǒng',
+    0x60BF: 'tiǎn',
+    0x60C0: 'lún,lùn',
+    0x60C1: 'xī',
+    0x60C2: 'kǎn',
+    0x60C3: 'gǔn',
+    0x60C4: 'nì',
+    0x60C5: 'qíng',
+    0x60C6: 'chóu,qiū,dāo',
+    0x60C7: 'dūn',
+    0x60C8: 'guǒ',
+    0x60C9: 'zhān',
+    0x60CA: 'jīng,liáng',
+    0x60CB: 'wǎn',
+    0x60CC: 'yuān,wǎn,yù',
+    0x60CD: 'jīn',
+    0x60CE: 'jì',
+    0x60CF: 'lán,lín',
+    0x60D0: 'yù,xù',
+    0x60D1: 'huò',
+    0x60D2: 'hé',
+    0x60D3: 'quán,juàn',
+    0x60D4: 'tán,dàn',
+    0x60D5: 'tì',
+    0x60D6: 'tì',
+    0x60D7: 'niè',
+    0x60D8: 'wǎng',
+    0x60D9: 'chuò,chuì',
+    0x60DA: 'hū',
+    0x60DB: 'hūn,hǔn,mèn',
+    0x60DC: 'xī',
+    0x60DD: 'chǎng,tǎng',
+    0x60DE: 'xīn',
+    0x60DF: 'wéi,wěi',
+    0x60E0: 'huì',
+    0x60E1: 'è,wù,wū,ě,hū',
+    0x60E2: 'suǒ,ruǐ',
+    0x60E3: 'zǒng',
+    0x60E4: 'jiān',
+    0x60E5: 'yǒng',
+    0x60E6: 'diàn',
+    0x60E7: 'jù',
+    0x60E8: 'cǎn',
+    0x60E9: 'chéng',
+    0x60EA: 'dé',
+    0x60EB: 'bèi',
+    0x60EC: 'qiè',
+    0x60ED: 'cán',
+    0x60EE: 'dàn',
+    0x60EF: 'guàn',
+    0x60F0: 'duò,tuó',
+    0x60F1: 'nǎo',
+    0x60F2: 'yùn',
+    0x60F3: 'xiǎng',
+    0x60F4: 'zhuì,chuǎn,guà',
+    0x60F5: 'dié,tiē',
+    0x60F6: 'huáng',
+    0x60F7: 'chǔn',
+    0x60F8: 'qióng',
+    0x60F9: 'rě,ruò',
+    0x60FA: 'xīng',
+    0x60FB: 'cè',
+    0x60FC: 'biǎn',
+    0x60FD: 'mǐn,hūn',
+    0x60FE: 'zōng',
+    0x60FF: 'tí,shì',
+    0x6100: 'qiǎo,qiù',
+    0x6101: 'chóu,qiǎo,jiū',
+    0x6102: 'bèi',
+    0x6103: 'xuān',
+    0x6104: 'wēi',
+    0x6105: 'gé',
+    0x6106: 'qiān',
+    0x6107: 'wěi',
+    0x6108: 'yù',
+    0x6109: 'yú,tōu,yǔ',
+    0x610A: 'bì',
+    0x610B: 'xuān',
+    0x610C: 'huàn',
+    0x610D: 'mǐn,fēn',
+    0x610E: 'bì',
+    0x610F: 'yì,yī',
+    0x6110: 'miǎn',
+    0x6111: 'yǒng',
+    0x6112: 'kài,qì,hè',
+    0x6113: 'dàng,shāng,táng,yáng',
+    0x6114: 'yīn',
+    0x6115: 'è',
+    0x6116: 'chén,dān,xìn',
+    0x6117: 'mào',
+    0x6118: 'qià,qiā,kè',
+    0x6119: 'kè',
+    0x611A: 'yú',
+    0x611B: 'ài',
+    0x611C: 'qiè',
+    0x611D: 'yǎn',
+    0x611E: 'nuò',
+    0x611F: 'gǎn,hàn',
+    0x6120: 'yùn,yǔn,wěn',
+    0x6121: 'zǒng',
+    0x6122: 'sāi,sī,sǐ',
+    0x6123: 'lèng',
+    0x6124: 'fèn',
+    0x6125: 'yīng',
+    0x6126: 'kuì',
+    0x6127: 'kuì',
+    0x6128: 'què',
+    0x6129: 'gōng,gòng,hǒng',
+    0x612A: 'yún',
+    0x612B: 'sù',
+    0x612C: 'sù,sè',
+    0x612D: 'qí',
+    0x612E: 'yáo,yào',
+    0x612F: 'sǒng',
+    0x6130: 'huàng,huǎng',
+    0x6131: 'jí',
+    0x6132: 'gǔ',
+    0x6133: 'jù',
+    0x6134: 'chuàng,chuǎng',
+    0x6135: 'nì',
+    0x6136: 'xié',
+    0x6137: 'kǎi',
+    0x6138: 'zhěng',
+    0x6139: 'yǒng',
+    0x613A: 'cǎo',
+    0x613B: 'xùn',
+    0x613C: 'shèn',
+    0x613D: 'bó',
+    0x613E: 'kài,xì,qì',
+    0x613F: 'yuàn',
+    0x6140: 'xì,xié',
+    0x6141: 'hùn',
+    0x6142: 'yǒng',
+    0x6143: 'yǎng',
+    0x6144: 'lì',
+    0x6145: 'sāo,cǎo',
+    0x6146: 'tāo',
+    0x6147: 'yīn',
+    0x6148: 'cí',
+    0x6149: 'xù,chù',
+    0x614A: 'qiàn,qiè,xián,qiǎn',
+    0x614B: 'tài',
+    0x614C: 'huāng,huǎng,huang',
+    0x614D: 'yùn',
+    0x614E: 'shèn,zhèn',
+    0x614F: 'mǐng',
+    0x6150: 'gong',
+    0x6151: 'shè',
+    0x6152: 'cóng,cáo',
+    0x6153: 'piāo,piào',
+    0x6154: 'mù',
+    0x6155: 'mù',
+    0x6156: 'guó',
+    0x6157: 'chì',
+    0x6158: 'cǎn',
+    0x6159: 'cán',
+    0x615A: 'cán',
+    0x615B: 'cuī',
+    0x615C: 'mǐn',
+    0x615D: 'tè,nì',
+    0x615E: 'zhāng',
+    0x615F: 'tòng',
+    0x6160: 'ào,áo',
+    0x6161: 'shuǎng',
+    0x6162: 'màn,mán',
+    0x6163: 'guàn',
+    0x6164: 'què',
+    0x6165: 'zào,cào',
+    0x6166: 'jiù',
+    0x6167: 'huì',
+    0x6168: 'kǎi',
+    0x6169: 'lián',
+    0x616A: 'òu,ōu',
+    0x616B: 'sǒng',
+    0x616C: 'qín,jìn,jǐn',
+    0x616D: 'yìn',
+    0x616E: 'lǜ,lǘ',
+    0x616F: 'shāng',
+    0x6170: 'wèi',
+    0x6171: 'tuán',
+    0x6172: 'mán',
+    0x6173: 'qiān,xián',
+    0x6174: 'shè,zhé',
+    0x6175: 'yōng',
+    0x6176: 'qìng,qīng,qiāng',
+    0x6177: 'kāng',
+    0x6178: 'dì,chì',
+    0x6179: 'zhí,zhé',
+    0x617A: 'lóu,lǚ',
+    0x617B: 'juàn',
+    0x617C: 'qī',
+    0x617D: 'qī',
+    0x617E: 'yù',
+    0x617F: 'píng',
+    0x6180: 'liáo',
+    0x6181: 'còng,sōng',
+    0x6182: 'yōu',
+    0x6183: 'chōng',
+    0x6184: 'zhì',
+    0x6185: 'tòng',
+    0x6186: 'chēng',
+    0x6187: 'qì',
+    0x6188: 'qū',
+    0x6189: 'péng',
+    0x618A: 'bèi',
+    0x618B: 'biē',
+    0x618C: 'qióng',
+    0x618D: 'jiāo',
+    0x618E: 'zēng',
+    0x618F: 'chì',
+    0x6190: 'lián',
+    0x6191: 'píng',
+    0x6192: 'kuì',
+    0x6193: 'huì',
+    0x6194: 'qiáo',
+    0x6195: 'chéng,zhèng,dèng',
+    0x6196: 'yìn,xìn,yín',
+    0x6197: 'yìn',
+    0x6198: 'xǐ,xī',
+    0x6199: 'xī,xǐ',
+    0x619A: 'dàn,dá,chǎn',
+    0x619B: 'tán',
+    0x619C: 'duò',
+    0x619D: 'duì',
+    0x619E: 'duì,dùn,tūn',
+    0x619F: 'sù',
+    0x61A0: 'jué',
+    0x61A1: 'cè',
+    0x61A2: 'xiāo,jiāo',
+    0x61A3: 'fān',
+    0x61A4: 'fèn',
+    0x61A5: 'láo',
+    0x61A6: 'lào,láo',
+    0x61A7: 'chōng,zhuàng',
+    0x61A8: 'hān',
+    0x61A9: 'qì',
+    0x61AA: 'xián,xiàn',
+    0x61AB: 'mǐn',
+    0x61AC: 'jǐng',
+    0x61AD: 'liǎo,liáo',
+    0x61AE: 'wǔ,wú',
+    0x61AF: 'cǎn',
+    0x61B0: 'jué',
+    0x61B1: 'cù',
+    0x61B2: 'xiàn,xiǎn',
+    0x61B3: 'tǎn',
+    0x61B4: 'shéng',
+    0x61B5: 'pī',
+    0x61B6: 'yì',
+    0x61B7: 'chù,chǔ',
+    0x61B8: 'xiān',
+    0x61B9: 'náo,nóng,náng,nǎo',
+    0x61BA: 'dàn',
+    0x61BB: 'tǎn',
+    0x61BC: 'jǐng,jìng',
+    0x61BD: 'sōng',
+    0x61BE: 'hàn,dàn',
+    0x61BF: 'jiǎo,jī',
+    0x61C0: 'wèi',
+    0x61C1: 'xuān,huān',
+    0x61C2: 'dǒng',
+    0x61C3: 'qín',
+    0x61C4: 'qín',
+    0x61C5: 'jù',
+    0x61C6: 'cǎo,sāo,sào',
+    0x61C7: 'kěn',
+    0x61C8: 'xiè',
+    0x61C9: 'yīng,yìng',
+    0x61CA: 'ào,yù',
+    0x61CB: 'mào',
+    0x61CC: 'yì',
+    0x61CD: 'lǐn',
+    0x61CE: 'sè',
+    0x61CF: 'jùn',
+    0x61D0: 'huái',
+    0x61D1: 'mèn',
+    0x61D2: 'lǎn',
+    0x61D3: 'ài',
+    0x61D4: 'lǐn,lǎn',
+    0x61D5: 'yān,yàn,yè',
+    0x61D6: 'kuò',
+    0x61D7: 'xià',
+    0x61D8: 'chì',
+    0x61D9: 'yǔ',
+    0x61DA: 'yìn',
+    0x61DB: 'dāi',
+    0x61DC: 'měng,mèng,méng',
+    0x61DD: 'ài,nì,nǐ',
+    0x61DE: 'méng,měng',
+    0x61DF: 'duì',
+    0x61E0: 'qí,jì,jī',
+    0x61E1: 'mǒ',
+    0x61E2: 'lán,xiàn',
+    0x61E3: 'mèn',
+    0x61E4: 'chóu',
+    0x61E5: 'zhì',
+    0x61E6: 'nuò',
+    0x61E7: 'nuò',
+    0x61E8: 'yān',
+    0x61E9: 'yǎng',
+    0x61EA: 'bó',
+    0x61EB: 'zhì',
+    0x61EC: 'kuàng',
+    0x61ED: 'kuǎng',
+    0x61EE: 'yǒu,yōu',
+    0x61EF: 'fū',
+    0x61F0: 'liú,liǔ',
+    0x61F1: 'miè',
+    0x61F2: 'chéng',
+    0x61F3: 'hui',
+    0x61F4: 'chàn',
+    0x61F5: 'měng,mèng',
+    0x61F6: 'lǎn,lài',
+    0x61F7: 'huái',
+    0x61F8: 'xuán',
+    0x61F9: 'ràng',
+    0x61FA: 'chàn',
+    0x61FB: 'jì',
+    0x61FC: 'jù',
+    0x61FD: 'huān,guàn',
+    0x61FE: 'shè',
+    0x61FF: 'yì,yī',
+    0x6200: 'liàn',
+    0x6201: 'nǎn',
+    0x6202: 'mí,mó',
+    0x6203: 'tǎng',
+    0x6204: 'jué',
+    0x6205: 'gàng',
+    0x6206: 'gàng,zhuàng',
+    0x6207: 'zhuàng,gàng',
+    0x6208: 'gē',
+    0x6209: 'yuè',
+    0x620A: 'wù',
+    0x620B: 'jiān',
+    0x620C: 'xū,qu',
+    0x620D: 'shù',
+    0x620E: 'róng,rēng',
+    0x620F: 'xì,hū',
+    0x6210: 'chéng',
+    0x6211: 'wǒ',
+    0x6212: 'jiè',
+    0x6213: 'gē',
+    0x6214: 'jiān,cán',
+    0x6215: 'qiāng,zāng',
+    0x6216: 'huò,yù',
+    0x6217: 'qiāng,qiàng',
+    0x6218: 'zhàn',
+    0x6219: 'dòng',
+    0x621A: 'qī,cù',
+    0x621B: 'jiá,gā',
+    0x621C: 'dié',
+    0x621D: 'zéi',
+    0x621E: 'jiá',
+    0x621F: 'jǐ',
+    0x6220: 'zhī,zhí',
+    0x6221: 'kān,zhěn',
+    0x6222: 'jí',
+    0x6223: 'kuí',
+    0x6224: 'gài',
+    0x6225: 'děng',
+    0x6226: 'zhàn',
+    0x6227: 'qiāng,chuāng,qiàng',
+    0x6228: 'gē',
+    0x6229: 'jiǎn',
+    0x622A: 'jié',
+    0x622B: 'yù',
+    0x622C: 'jiǎn',
+    0x622D: 'yǎn,yǒu',
+    0x622E: 'lù',
+    0x622F: 'hū,xì',
+    0x6230: 'zhàn',
+    0x6231: 'xì',
+    0x6232: 'xì,hū,xī,huī,suō,yī',
+    0x6233: 'chuō',
+    0x6234: 'dài',
+    0x6235: 'qú',
+    0x6236: 'hù',
+    0x6237: 'hù',
+    0x6238: 'hù',
+    0x6239: 'è',
+    0x623A: 'shì,yí',
+    0x623B: 'tì',
+    0x623C: 'mǎo',
+    0x623D: 'hù',
+    0x623E: 'lì',
+    0x623F: 'fáng,páng',
+    0x6240: 'suǒ',
+    0x6241: 'biǎn,piān,biān,pián',
+    0x6242: 'diàn',
+    0x6243: 'jiōng,jiǒng',
+    0x6244: 'shǎng,jiōng',
+    0x6245: 'yí',
+    0x6246: 'yǐ',
+    0x6247: 'shàn,shān',
+    0x6248: 'hù',
+    0x6249: 'fēi',
+    0x624A: 'yǎn',
+    0x624B: 'shǒu',
+    0x624C: 'shou',
+    0x624D: 'cái,zāi',
+    0x624E: 'zhā,zā,zhá,zhǎ',
+    0x624F: 'qiú',
+    0x6250: 'lè,lì,cái',
+    0x6251: 'pū,pì',
+    0x6252: 'bā,pá,bài,bié',
+    0x6253: 'dǎ,dá',
+    0x6254: 'rēng,rèng',
+    0x6255: 'fǎn',
+    0x6256: 'rù',
+    0x6257: 'zài',
+    0x6258: 'tuō',
+    0x6259: 'zhàng',
+    0x625A: 'diǎo,dí,yuē,lì',
+    0x625B: 'káng,gāng',
+    0x625C: 'yū,wū',
+    0x625D: 'kū,wū',
+    0x625E: 'gǎn,hàn',
+    0x625F: 'shēn',
+    0x6260: 'chā,chāi,zhǎ',
+    0x6261: 'tuō,yǐ,chǐ',
+    0x6262: 'gǔ,qì,jié,gē',
+    0x6263: 'kòu',
+    0x6264: 'wù',
+    0x6265: 'dèn',
+    0x6266: 'qiān',
+    0x6267: 'zhí',
+    0x6268: 'rèn',
+    0x6269: 'kuò',
+    0x626A: 'mén',
+    0x626B: 'sǎo,sào',
+    0x626C: 'yáng',
+    0x626D: 'niǔ,chǒu,zhǒu,zhòu',
+    0x626E: 'bàn,fěn,fēn,huǒ',
+    0x626F: 'chě',
+    0x6270: 'rǎo,yòu',
+    0x6271: 'xī,chā,qì',
+    0x6272: 'qián,qín',
+    0x6273: 'bān,pān',
+    0x6274: 'jiá',
+    0x6275: 'yú',
+    0x6276: 'fú,pú',
+    0x6277: 'ào',
+    0x6278: 'xī,zhé',
+    0x6279: 'pī,pí',
+    0x627A: 'zhǐ,qí',
+    0x627B: 'zhì,sǔn,kǎn',
+    0x627C: 'è',
+    0x627D: 'dèn',
+    0x627E: 'zhǎo,huá',
+    0x627F: 'chéng,zhěng,zhèng',
+    0x6280: 'jì,qí',
+    0x6281: 'yǎn',
+    0x6282: 'kuáng,wǎng',
+    0x6283: 'biàn',
+    0x6284: 'chāo,suō,chào,chǎo',
+    0x6285: 'jū',
+    0x6286: 'wěn',
+    0x6287: 'hú',
+    0x6288: 'yuè',
+    0x6289: 'jué',
+    0x628A: 'bǎ,bà,pá',
+    0x628B: 'qìn',
+    0x628C: 'dǎn,shěn',
+    0x628D: 'zhěng',
+    0x628E: 'yǔn',
+    0x628F: 'wán',
+    0x6290: 'nè,nì,nà,ruì',
+    0x6291: 'yì',
+    0x6292: 'shū',
+    0x6293: 'zhuā',
+    0x6294: 'póu',
+    0x6295: 'tóu,dòu',
+    0x6296: 'dǒu',
+    0x6297: 'kàng,gāng',
+    0x6298: 'zhé,shé,zhē,tí',
+    0x6299: 'póu',
+    0x629A: 'fǔ',
+    0x629B: 'pāo',
+    0x629C: 'bá',
+    0x629D: 'ǎo,ào,niù',
+    0x629E: 'zé',
+    0x629F: 'tuán',
+    0x62A0: 'kōu',
+    0x62A1: 'lūn,lún',
+    0x62A2: 'qiǎng,qiāng',
+    0x62A3: 'yun',
+    0x62A4: 'hù',
+    0x62A5: 'bào',
+    0x62A6: 'bǐng',
+    0x62A7: 'zhǐ,zhǎi',
+    0x62A8: 'pēng,bēng',
+    0x62A9: 'nán',
+    0x62AA: 'bù,pū,bá',
+    0x62AB: 'pī',
+    0x62AC: 'tái,chī',
+    0x62AD: 'yǎo,tāo',
+    0x62AE: 'zhěn',
+    0x62AF: 'zhā',
+    0x62B0: 'yāng',
+    0x62B1: 'bào,pāo,pǒu',
+    0x62B2: 'hē,hè,qiā',
+    0x62B3: 'nǐ,ní',
+    0x62B4: 'yè,shé',
+    0x62B5: 'dǐ,zhǐ,qí',
+    0x62B6: 'chì',
+    0x62B7: 'pī,pēi',
+    0x62B8: 'jiā',
+    0x62B9: 'mǒ,mā,mò',
+    0x62BA: 'mèi',
+    0x62BB: 'chēn,shēn',
+    0x62BC: 'yā,xiá,jiǎ',
+    0x62BD: 'chōu',
+    0x62BE: 'qū',
+    0x62BF: 'mǐn',
+    0x62C0: 'chù',
+    0x62C1: 'jiā,yá',
+    0x62C2: 'fú,bì,pì,fèi',
+    0x62C3: 'zhǎ,zhǎn,zhà,zhá',
+    0x62C4: 'zhǔ',
+    0x62C5: 'dān,dàn,dǎn,jiē',
+    0x62C6: 'chāi,chè,chì,cā',
+    0x62C7: 'mǔ',
+    0x62C8: 'niān,niǎn,diān',
+    0x62C9: 'lā,lá,lǎ,là,la',
+    0x62CA: 'fǔ,fū,bǔ',
+    0x62CB: 'pāo',
+    0x62CC: 'bàn,pān',
+    0x62CD: 'pāi,bó',
+    0x62CE: 'līn,līng',
+    0x62CF: 'ná',
+    0x62D0: 'guǎi',
+    0x62D1: 'qián',
+    0x62D2: 'jù,jǔ',
+    0x62D3: 'tuò,tà,zhí',
+    0x62D4: 'bá,bō,bié,fá,bèi',
+    0x62D5: 'tuō',
+    0x62D6: 'tuō,chǐ',
+    0x62D7: 'ǎo,ào,niù,yù',
+    0x62D8: 'jū,gōu,jǔ,jú',
+    0x62D9: 'zhuō',
+    0x62DA: 'pàn,biàn,fèn,fān,pīn',
+    0x62DB: 'zhāo,qiáo,sháo',
+    0x62DC: 'bài,bái',
+    0x62DD: 'bài',
+    0x62DE: 'dǐ',
+    0x62DF: 'nǐ',
+    0x62E0: 'jù',
+    0x62E1: 'kuò',
+    0x62E2: 'lǒng',
+    0x62E3: 'jiǎn',
+    0x62E4: 'qiá',
+    0x62E5: 'yōng',
+    0x62E6: 'lán',
+    0x62E7: 'níng,nǐng,nìng',
+    0x62E8: 'bō',
+    0x62E9: 'zé,zhái',
+    0x62EA: 'qiān',
+    0x62EB: 'hén',
+    0x62EC: 'kuò,guā',
+    0x62ED: 'shì',
+    0x62EE: 'jié,jiá',
+    0x62EF: 'zhěng',
+    0x62F0: 'nǐn',
+    0x62F1: 'gǒng,jú',
+    0x62F2: 'gǒng',
+    0x62F3: 'quán',
+    0x62F4: 'shuān,quán',
+    0x62F5: 'cún,zùn',
+    0x62F6: 'zā,zǎn',
+    0x62F7: 'kǎo',
+    0x62F8: 'yí,chǐ,hài',
+    0x62F9: 'xié',
+    0x62FA: 'cè,sè,chuò',
+    0x62FB: 'huī',
+    0x62FC: 'pīn,bìng',
+    0x62FD: 'zhuāi,zhuài,yè',
+    0x62FE: 'shí,shè,jiè',
+    0x62FF: 'ná',
+    0x6300: 'bāi',
+    0x6301: 'chí',
+    0x6302: 'guà',
+    0x6303: 'zhì,dié',
+    0x6304: 'kuò,guāng',
+    0x6305: 'duǒ,duò',
+    0x6306: 'duǒ',
+    0x6307: 'zhǐ,zhī,zhí',
+    0x6308: 'qiè,qì,jiá,qià,shì',
+    0x6309: 'àn',
+    0x630A: 'nòng',
+    0x630B: 'zhèn',
+    0x630C: 'gé,hé',
+    0x630D: 'jiào,jiāo',
+    0x630E: 'kuà,kū,kōu',
+    0x630F: 'dòng',
+    0x6310: 'ná,rú,nú',
+    0x6311: 'tiāo,tiǎo,táo,diào,tiáo,tiao',
+    0x6312: 'liè',
+    0x6313: 'zhā',
+    0x6314: 'lǚ',
+    0x6315: 'dié,shè',
+    0x6316: 'wā',
+    0x6317: 'jué',
+    0x6318: 'liě',
+    0x6319: 'jǔ',
+    0x631A: 'zhì',
+    0x631B: 'luán',
+    0x631C: 'yà',
+    0x631D: 'wō,zhuā',
+    0x631E: 'tà',
+    0x631F: 'xié,jiā',
+    0x6320: 'náo',
+    0x6321: 'dǎng,dàng',
+    0x6322: 'jiǎo',
+    0x6323: 'zhēng,zhèng',
+    0x6324: 'jǐ',
+    0x6325: 'huī',
+    0x6326: 'xián',
+    0x6327: 'yǔ',
+    0x6328: 'āi,ái',
+    0x6329: 'tuō',
+    0x632A: 'nuó',
+    0x632B: 'cuò,zuò',
+    0x632C: 'bó',
+    0x632D: 'gěng',
+    0x632E: 'tǐ,tì',
+    0x632F: 'zhèn,zhēn,zhěn',
+    0x6330: 'chéng',
+    0x6331: 'sā,shā,suō',
+    0x6332: 'sā,suō,shā',
+    0x6333: 'kēng',
+    0x6334: 'měi',
+    0x6335: 'nòng',
+    0x6336: 'jū',
+    0x6337: 'péng',
+    0x6338: 'jiǎn',
+    0x6339: 'yì',
+    0x633A: 'tǐng,tíng',
+    0x633B: 'shān,yán',
+    0x633C: 'ruá,ruó,suī,luò',
+    0x633D: 'wǎn',
+    0x633E: 'xié,jiā',
+    0x633F: 'chā',
+    0x6340: 'féng',
+    0x6341: 'jiǎo,kù',
+    0x6342: 'wǔ,wú',
+    0x6343: 'jùn',
+    0x6344: 'jiù,jū,qiú',
+    0x6345: 'tǒng',
+    0x6346: 'kǔn,hún',
+    0x6347: 'huò,chì',
+    0x6348: 'tú,shū,chá',
+    0x6349: 'zhuō',
+    0x634A: 'póu,pōu,fū',
+    0x634B: 'lǚ,luō',
+    0x634C: 'bā,bié',
+    0x634D: 'hàn,xiàn,gǎn',
+    0x634E: 'shāo,shào,shǎo,xiāo,qiào',
+    0x634F: 'niē',
+    0x6350: 'juān,yuán',
+    0x6351: 'zè',
+    0x6352: 'shù,sōu,sǒng',
+    0x6353: 'yé,yú',
+    0x6354: 'jué,zhuó',
+    0x6355: 'bǔ',
+    0x6356: 'wán,guā',
+    0x6357: 'bù,pú,zhì',
+    0x6358: 'zùn',
+    0x6359: 'yè',
+    0x635A: 'zhāi',
+    0x635B: 'lǚ',
+    0x635C: 'sōu',
+    0x635D: 'tuō,shuì,yǎn',
+    0x635E: 'lāo',
+    0x635F: 'sǔn',
+    0x6360: 'bāng',
+    0x6361: 'jiǎn',
+    0x6362: 'huàn',
+    0x6363: 'dǎo',
+    0x6364: 'wěi',
+    0x6365: 'wàn,wān,wǎn,yù',
+    0x6366: 'qín',
+    0x6367: 'pěng,fèng',
+    0x6368: 'shě',
+    0x6369: 'liè,lì',
+    0x636A: 'mín',
+    0x636B: 'mén',
+    0x636C: 'fǔ,fù,bǔ',
+    0x636D: 'bǎi,bā,bǐ',
+    0x636E: 'jù,jū',
+    0x636F: 'dáo,dǎo',
+    0x6370: 'wǒ,luò,luǒ',
+    0x6371: 'ái,āi',
+    0x6372: 'juǎn,quán,juàn',
+    0x6373: 'yuè',
+    0x6374: 'zǒng',
+    0x6375: 'chēn,tiǎn,niǎn',
+    0x6376: 'chuí,duǒ',
+    0x6377: 'jié,qiè,chā',
+    0x6378: 'tū',
+    0x6379: 'bèn',
+    0x637A: 'nà',
+    0x637B: 'niǎn,niē,niān',
+    0x637C: 'ruó,wō,wěi,ré',
+    0x637D: 'zuó,cù,sū,zùn',
+    0x637E: 'wò,xiá',
+    0x637F: 'qī',
+    0x6380: 'xiān,hén',
+    0x6381: 'chéng',
+    0x6382: 'diān',
+    0x6383: 'sǎo,sào',
+    0x6384: 'lūn,lún',
+    0x6385: 'qìng',
+    0x6386: 'gāng,gàng',
+    0x6387: 'duō,duó,zhuō',
+    0x6388: 'shòu',
+    0x6389: 'diào,nuó',
+    0x638A: 'póu,pǒu,fù,péi',
+    0x638B: 'dǐ,dì',
+    0x638C: 'zhǎng',
+    0x638D: 'hùn',
+    0x638E: 'jǐ,yǐ',
+    0x638F: 'tāo,táo',
+    0x6390: 'qiā',
+    0x6391: 'qí',
+    0x6392: 'pái,pǎi,bài',
+    0x6393: 'shū',
+    0x6394: 'qiān,wàn',
+    0x6395: 'líng',
+    0x6396: 'yē,yè',
+    0x6397: 'yà,yǎ',
+    0x6398: 'jué,kū',
+    0x6399: 'zhēng',
+    0x639A: 'liǎng',
+    0x639B: 'guà',
+    0x639C: 'yì,nǐ,nái,niè',
+    0x639D: 'huò,xù',
+    0x639E: 'shàn,yàn,yǎn',
+    0x639F: 'zhěng,dìng',
+    0x63A0: 'lüè,lüě',
+    0x63A1: 'cǎi',
+    0x63A2: 'tàn,xián',
+    0x63A3: 'chè',
+    0x63A4: 'bīng',
+    0x63A5: 'jiē,xié,shà,chā',
+    0x63A6: 'tì',
+    0x63A7: 'kòng,kōng,qiāng',
+    0x63A8: 'tuī',
+    0x63A9: 'yǎn,yàn',
+    0x63AA: 'cuò,zé,cì',
+    0x63AB: 'zhōu,zōu,chōu',
+    0x63AC: 'jū',
+    0x63AD: 'tiàn',
+    0x63AE: 'qián',
+    0x63AF: 'kèn',
+    0x63B0: 'bāi',
+    0x63B1: 'pá,shǒu',
+    0x63B2: 'jiē',
+    0x63B3: 'lǔ',
+    0x63B4: 'guāi,guó',
+    0x63B5: 'ming',
+    0x63B6: 'jié',
+    0x63B7: 'zhì,zhī',
+    0x63B8: 'dǎn,shàn',
+    0x63B9: 'meng',
+    0x63BA: 'càn,chān,shǎn',
+    0x63BB: 'sāo',
+    0x63BC: 'guàn',
+    0x63BD: 'pèng',
+    0x63BE: 'yuàn,chuán',
+    0x63BF: 'nuò',
+    0x63C0: 'jiǎn',
+    0x63C1: 'zhēng,kēng',
+    0x63C2: 'jiū,yóu',
+    0x63C3: 'jiǎn,jiān,qiān',
+    0x63C4: 'yú,chōu,yóu,shū,yáo',
+    0x63C5: 'yán',
+    0x63C6: 'kuí',
+    0x63C7: 'nǎn',
+    0x63C8: 'hōng,hóng,xuàn,jū',
+    0x63C9: 'róu',
+    0x63CA: 'pì,chè',
+    0x63CB: 'wēi',
+    0x63CC: 'sāi,cāi',
+    0x63CD: 'zòu,còu',
+    0x63CE: 'xuān',
+    0x63CF: 'miáo,mào',
+    0x63D0: 'tí,dī,chí,shí,dǐ',
+    0x63D1: 'niē',
+    0x63D2: 'chā,zhǎ',
+    0x63D3: 'shì',
+    0x63D4: 'zǒng,sōng',
+    0x63D5: 'zhèn,zhēn',
+    0x63D6: 'yī,jí',
+    0x63D7: 'xún',
+    0x63D8: 'yóng,huáng',
+    0x63D9: 'biān,biàn',
+    0x63DA: 'yáng',
+    0x63DB: 'huàn',
+    0x63DC: 'yǎn',
+    0x63DD: 'zǎn,zuàn',
+    0x63DE: 'ǎn,yàn,yè',
+    0x63DF: 'xū,jū',
+    0x63E0: 'yà',
+    0x63E1: 'wò,òu',
+    0x63E2: 'ké,qiā',
+    0x63E3: 'chuāi,chuǎi,chuài,duǒ,zhuī,tuán',
+    0x63E4: 'jí',
+    0x63E5: 'tì,dì',
+    0x63E6: 'lá,là',
+    0x63E7: 'là',
+    0x63E8: 'chén',
+    0x63E9: 'kāi,jiá',
+    0x63EA: 'jiū',
+    0x63EB: 'jiū',
+    0x63EC: 'tú',
+    0x63ED: 'jiē,qì,hé',
+    0x63EE: 'huī,hún',
+    0x63EF: 'gèn',
+    0x63F0: 'chòng,dǒng',
+    0x63F1: 'xiāo,shuò,xiān',
+    0x63F2: 'dié,shé,yè',
+    0x63F3: 'xiē,xiè,xié,jiá',
+    0x63F4: 'yuán,huàn',
+    0x63F5: 'qián,jiàn,jiǎn',
+    0x63F6: 'yé',
+    0x63F7: 'chā',
+    0x63F8: 'zhā',
+    0x63F9: 'bēi',
+    0x63FA: 'yáo',
+    0x63FB: 'wēi',
+    0x63FC: 'beng',
+    0x63FD: 'lǎn',
+    0x63FE: 'wèn,wù',
+    0x63FF: 'qìn',
+    0x6400: 'chān',
+    0x6401: 'gē,gé',
+    0x6402: 'lǒu,lōu',
+    0x6403: 'zǒng',
+    0x6404: 'gèn',
+    0x6405: 'jiǎo',
+    0x6406: 'gòu,gōu',
+    0x6407: 'qìn',
+    0x6408: 'róng',
+    0x6409: 'què,huō',
+    0x640A: 'chōu,zǒu,zhū',
+    0x640B: 'chuāi,chǐ,yí',
+    0x640C: 'zhǎn',
+    0x640D: 'sǔn',
+    0x640E: 'sūn',
+    0x640F: 'bó',
+    0x6410: 'chù',
+    0x6411: 'róng,náng,nǎng',
+    0x6412: 'bàng,péng,bēng,bǎng',
+    0x6413: 'cuō,cuǒ,chāi',
+    0x6414: 'sāo,sào',
+    0x6415: 'kē,è',
+    0x6416: 'yáo',
+    0x6417: 'dǎo',
+    0x6418: 'zhī',
+    0x6419: 'nù,nuò,nòu',
+    0x641A: 'lā,xié,xiàn',
+    0x641B: 'jiān,lián',
+    0x641C: 'sōu,xiāo,sòu,shǎo',
+    0x641D: 'qiǔ',
+    0x641E: 'gǎo,qiāo,kào',
+    0x641F: 'xiǎn,xiān',
+    0x6420: 'shuò',
+    0x6421: 'sǎng',
+    0x6422: 'jìn',
+    0x6423: 'miè',
+    0x6424: 'è,yì',
+    0x6425: 'chuí,duī',
+    0x6426: 'nuò',
+    0x6427: 'shān',
+    0x6428: 'tà,dá',
+    0x6429: 'zhǎ,jié',
+    0x642A: 'táng',
+    0x642B: 'pán,bān,pó',
+    0x642C: 'bān,sù',
+    0x642D: 'dā,tà',
+    0x642E: 'lì',
+    0x642F: 'tāo',
+    0x6430: 'hú,kū',
+    0x6431: 'zhì,nái',
+    0x6432: 'wā,wǎ,wà',
+    0x6433: 'huá,xiá,qiā',
+    0x6434: 'qiān',
+    0x6435: 'wèn',
+    0x6436: 'qiǎng,qiāng,qiàng,chéng,chēng',
+    0x6437: 'tián,shēn',
+    0x6438: 'zhēn',
+    0x6439: 'è',
+    0x643A: 'xié',
+    0x643B: 'nuò',
+    0x643C: 'quán',
+    0x643D: 'chá',
+    0x643E: 'zhà',
+    0x643F: 'gé',
+    0x6440: 'wǔ',
+    0x6441: 'èn',
+    0x6442: 'shè',
+    0x6443: 'káng',
+    0x6444: 'shè',
+    0x6445: 'shū',
+    0x6446: 'bǎi',
+    0x6447: 'yáo',
+    0x6448: 'bìn',
+    0x6449: 'sōu',
+    0x644A: 'tān',
+    0x644B: 'sà,shǎi,shā',
+    0x644C: 'chǎn,sùn',
+    0x644D: 'suō',
+    0x644E: 'jiū,liú,liáo,jiǎo,náo',
+    0x644F: 'chōng',
+    0x6450: 'chuāng',
+    0x6451: 'guāi,guó',
+    0x6452: 'bǐng,bìng',
+    0x6453: 'féng,pěng',
+    0x6454: 'shuāi',
+    0x6455: 'dì,tú,zhí',
+    0x6456: 'qì,chá',
+    0x6457: 'sōu,sǒng',
+    0x6458: 'zhāi',
+    0x6459: 'liǎn,liàn',
+    0x645A: 'chēng',
+    0x645B: 'chī',
+    0x645C: 'guàn',
+    0x645D: 'lù',
+    0x645E: 'luò',
+    0x645F: 'lǒu,lōu',
+    0x6460: 'zǒng',
+    0x6461: 'gài,xì',
+    0x6462: 'hù,chū',
+    0x6463: 'zhā,zhuā',
+    0x6464: 'chuǎng',
+    0x6465: 'tàng',
+    0x6466: 'huà',
+    0x6467: 'cuī,zuì,cuò',
+    0x6468: 'nái,zhì',
+    0x6469: 'mó,mā,mí',
+    0x646A: 'jiāng,qiàng',
+    0x646B: 'guī',
+    0x646C: 'yǐng',
+    0x646D: 'zhí',
+    0x646E: 'áo,qiāo',
+    0x646F: 'zhì',
+    0x6470: 'niè,chè',
+    0x6471: 'màn,mán',
+    0x6472: 'chàn,cán',
+    0x6473: 'kōu,ōu',
+    0x6474: 'chū,chī',
+    0x6475: 'shè,sù,mí',
+    0x6476: 'tuán,zhuàn,zhuān',
+    0x6477: 'jiǎo,chāo',
+    0x6478: 'mō,mó',
+    0x6479: 'mó,mō',
+    0x647A: 'zhé,lā,xié',
+    0x647B: 'càn,shǎn,shān,chān,sēn',
+    0x647C: 'kēng,qiān',
+    0x647D: 'biāo,biào,piāo,pāo',
+    0x647E: 'jiàng',
+    0x647F: 'yáo',
+    0x6480: 'gòu',
+    0x6481: 'qiān,qiàn',
+    0x6482: 'liào',
+    0x6483: 'jī',
+    0x6484: 'yīng',
+    0x6485: 'juē,juè,jué,guì',
+    0x6486: 'piē',
+    0x6487: 'piē,piě,biē',
+    0x6488: 'lāo',
+    0x6489: 'dūn',
+    0x648A: 'xiàn',
+    0x648B: 'ruán,ruí,rún,ruó,suī',
+    0x648C: 'guì',
+    0x648D: 'zǎn,zān,zēn,qián',
+    0x648E: 'yì',
+    0x648F: 'xián,xún',
+    0x6490: 'chēng',
+    0x6491: 'chēng',
+    0x6492: 'sā,sǎ',
+    0x6493: 'náo,xiāo,rào',
+    0x6494: 'hòng',
+    0x6495: 'sī,xī',
+    0x6496: 'hàn,qiǎn',
+    0x6497: 'guàng',
+    0x6498: 'dā',
+    0x6499: 'zǔn',
+    0x649A: 'niǎn',
+    0x649B: 'lǐn',
+    0x649C: 'zhěng,chéng',
+    0x649D: 'huī,wéi',
+    0x649E: 'zhuàng',
+    0x649F: 'jiǎo,jiāo,kǎo',
+    0x64A0: 'jǐ',
+    0x64A1: 'cāo',
+    0x64A2: 'dǎn,tàn,dàn,xín',
+    0x64A3: 'dǎn,dàn,chán,tān,zhǎn,shàn,tián',
+    0x64A4: 'chè',
+    0x64A5: 'bō,fá',
+    0x64A6: 'chě',
+    0x64A7: 'juē',
+    0x64A8: 'fǔ,xiāo,sōu',
+    0x64A9: 'liāo,liáo,liǎo,lào,liào',
+    0x64AA: 'bèn',
+    0x64AB: 'fǔ,mó',
+    0x64AC: 'qiào',
+    0x64AD: 'bō,bǒ',
+    0x64AE: 'cuō,zuǒ,zuì,zuān,chuā',
+    0x64AF: 'zhuó',
+    0x64B0: 'zhuàn,xuǎn,suàn',
+    0x64B1: 'wěi,tuǒ',
+    0x64B2: 'pū,bǔ',
+    0x64B3: 'qìn',
+    0x64B4: 'dūn',
+    0x64B5: 'niǎn',
+    0x64B6: 'huá',
+    0x64B7: 'xié',
+    0x64B8: 'lū',
+    0x64B9: 'jiǎo',
+    0x64BA: 'cuān',
+    0x64BB: 'tà',
+    0x64BC: 'hàn',
+    0x64BD: 'qiào,yāo,jī',
+    0x64BE: 'wō,zhuā',
+    0x64BF: 'jiǎn,liàn',
+    0x64C0: 'gǎn',
+    0x64C1: 'yōng',
+    0x64C2: 'léi,lèi,lēi',
+    0x64C3: 'nǎng',
+    0x64C4: 'lǔ',
+    0x64C5: 'shàn',
+    0x64C6: 'zhuó',
+    0x64C7: 'zé,zhái,yì',
+    0x64C8: 'pū',
+    0x64C9: 'chuò',
+    0x64CA: 'jī,jì,xí',
+    0x64CB: 'dǎng,dàng',
+    0x64CC: 'sè',
+    0x64CD: 'cāo',
+    0x64CE: 'qíng',
+    0x64CF: 'qíng,jǐng,jìng',
+    0x64D0: 'huàn,juǎn,xuān',
+    0x64D1: 'jiē',
+    0x64D2: 'qín',
+    0x64D3: 'kuǎi',
+    0x64D4: 'dān,dàn,shàn',
+    0x64D5: 'xié',
+    0x64D6: 'kā,qiā,jiā,zhá,guā,yè,gē,liè',
+    0x64D7: 'pǐ,bò',
+    0x64D8: 'bāi,bò',
+    0x64D9: 'ào',
+    0x64DA: 'jù',
+    0x64DB: 'yè',
+    0x64DC: 'è',
+    0x64DD: 'mēng',
+    0x64DE: 'sǒu,sòu',
+    0x64DF: 'mí',
+    0x64E0: 'jǐ',
+    0x64E1: 'tái',
+    0x64E2: 'zhuó',
+    0x64E3: 'dǎo,chóu',
+    0x64E4: 'xǐng',
+    0x64E5: 'lǎn',
+    0x64E6: 'cā',
+    0x64E7: 'jǔ',
+    0x64E8: 'yé',
+    0x64E9: 'rǔ,nǔ,rù,nòu,ruán',
+    0x64EA: 'yè',
+    0x64EB: 'yè',
+    0x64EC: 'nǐ',
+    0x64ED: 'wò,huò,hù',
+    0x64EE: 'jié',
+    0x64EF: 'bìn',
+    0x64F0: 'níng,nǐng,nìng',
+    0x64F1: 'gē,gé',
+    0x64F2: 'zhì,zhī',
+    0x64F3: 'zhì,jié',
+    0x64F4: 'kuò,tǎng,guàng',
+    0x64F5: 'mó',
+    0x64F6: 'jiàn',
+    0x64F7: 'xié',
+    0x64F8: 'liè,là',
+    0x64F9: 'tān',
+    0x64FA: 'bǎi',
+    0x64FB: 'sǒu,sòu',
+    0x64FC: 'lǔ,lū',
+    0x64FD: 'lüè,lì,yuè',
+    0x64FE: 'rǎo',
+    0x64FF: 'tī,zhì,zhāi',
+    0x6500: 'pān',
+    0x6501: 'yǎng',
+    0x6502: 'lèi',
+    0x6503: 'cā,sǎ',
+    0x6504: 'shū,lù',
+    0x6505: 'zǎn',
+    0x6506: 'niǎn',
+    0x6507: 'xiǎn',
+    0x6508: 'jùn,pèi',
+    0x6509: 'huō,huò,què',
+    0x650A: 'lì',
+    0x650B: 'là,lài',
+    0x650C: 'huǎn',
+    0x650D: 'yíng',
+    0x650E: 'lú,luó',
+    0x650F: 'lǒng',
+    0x6510: 'qiān',
+    0x6511: 'qiān',
+    0x6512: 'zǎn,cuán',
+    0x6513: 'qiān',
+    0x6514: 'lán',
+    0x6515: 'xiān,jiān',
+    0x6516: 'yīng',
+    0x6517: 'méi',
+    0x6518: 'rǎng,ràng,níng,xiǎng',
+    0x6519: 'chān,shàn',
+    0x651A: 'wěng',
+    0x651B: 'cuān',
+    0x651C: 'xié',
+    0x651D: 'shè,zhé,niè,shà',
+    0x651E: 'luó,luǒ',
+    0x651F: 'jùn',
+    0x6520: 'mí,mó',
+    0x6521: 'chī',
+    0x6522: 'zǎn,cuán,zuān,zàn',
+    0x6523: 'luán,liàn',
+    0x6524: 'tān,nàn',
+    0x6525: 'zuàn',
+    0x6526: 'lì,shài',
+    0x6527: 'diān',
+    0x6528: 'wā',
+    0x6529: 'dǎng,tǎng',
+    0x652A: 'jiǎo',
+    0x652B: 'jué',
+    0x652C: 'lǎn',
+    0x652D: 'lì,luǒ',
+    0x652E: 'nǎng',
+    0x652F: 'zhī,zhì,qí',
+    0x6530: 'guì',
+    0x6531: 'guǐ,guì',
+    0x6532: 'qī,jī',
+    0x6533: 'xún',
+    0x6534: 'pū',
+    0x6535: 'pū',
+    0x6536: 'shōu',
+    0x6537: 'kǎo',
+    0x6538: 'yōu',
+    0x6539: 'gǎi',
+    0x653A: 'yǐ',
+    0x653B: 'gōng',
+    0x653C: 'gān,hàn',
+    0x653D: 'bān,bīn',
+    0x653E: 'fàng,fǎng,fāng',
+    0x653F: 'zhèng,zhēng',
+    0x6540: 'pò',
+    0x6541: 'diān',
+    0x6542: 'kòu',
+    0x6543: 'mǐn,fēn',
+    0x6544: 'wù,móu',
+    0x6545: 'gù',
+    0x6546: 'hé',
+    0x6547: 'cè',
+    0x6548: 'xiào',
+    0x6549: 'mǐ',
+    0x654A: 'chù,shōu',
+    0x654B: 'gé',
+    0x654C: 'dí,huá',
+    0x654D: 'xù',
+    0x654E: 'jiào',
+    0x654F: 'mǐn',
+    0x6550: 'chén',
+    0x6551: 'jiù,jiū',
+    0x6552: 'shēn',
+    0x6553: 'duó',
+    0x6554: 'yǔ,yù',
+    0x6555: 'chì,sōu',
+    0x6556: 'áo,ào',
+    0x6557: 'bài',
+    0x6558: 'xù',
+    0x6559: 'jiào,jiāo',
+    0x655A: 'duó',
+    0x655B: 'liǎn',
+    0x655C: 'niè',
+    0x655D: 'bì',
+    0x655E: 'chǎng,chèng,zhèng',
+    0x655F: 'diǎn',
+    0x6560: 'duō,què',
+    0x6561: 'yì',
+    0x6562: 'gǎn',
+    0x6563: 'sàn,sǎn,sān',
+    0x6564: 'kě',
+    0x6565: 'yàn,jiǎo',
+    0x6566: 'dūn,duī,tuán,diāo,dùn,dào,zhǔn,tūn,duì,tún',
+    0x6567: 'jī,qǐ',
+    0x6568: 'tǒu',
+    0x6569: 'xiào,xué',
+    0x656A: 'duō',
+    0x656B: 'jiǎo,qiāo,jiào',
+    0x656C: 'jìng',
+    0x656D: 'yáng',
+    0x656E: 'xiá',
+    0x656F: 'mǐn',
+    0x6570: 'shù,shǔ,shuò',
+    0x6571: 'ái,zhú',
+    0x6572: 'qiāo',
+    0x6573: 'ái',
+    0x6574: 'zhěng',
+    0x6575: 'dí',
+    0x6576: 'zhèn',
+    0x6577: 'fū',
+    0x6578: 'shù,shǔ,shuò',
+    0x6579: 'liáo',
+    0x657A: 'qū,ōu',
+    0x657B: 'xiòng',
+    0x657C: 'yǐ',
+    0x657D: 'jiǎo',
+    0x657E: 'shàn',
+    0x657F: 'jiǎo',
+    0x6580: 'zhuó,zhú',
+    0x6581: 'yì,dù,tú',
+    0x6582: 'liǎn,lián',
+    0x6583: 'bì',
+    0x6584: 'lí,tái',
+    0x6585: 'xiào,xué',
+    0x6586: 'xiào',
+    0x6587: 'wén',
+    0x6588: 'xué',
+    0x6589: 'qí',
+    0x658A: 'qí',
+    0x658B: 'zhāi',
+    0x658C: 'bīn',
+    0x658D: 'jué',
+    0x658E: 'zhāi',
+    0x658F: 'láng',
+    0x6590: 'fěi',
+    0x6591: 'bān',
+    0x6592: 'bān',
+    0x6593: 'lán',
+    0x6594: 'yǔ',
+    0x6595: 'lán',
+    0x6596: 'wěi',
+    0x6597: 'dòu,dǒu,zhǔ',
+    0x6598: 'shēng',
+    0x6599: 'liào,liáo',
+    0x659A: 'jiǎ',
+    0x659B: 'hú',
+    0x659C: 'xié,xiá,chá,yé',
+    0x659D: 'jiǎ',
+    0x659E: 'yǔ',
+    0x659F: 'zhēn',
+    0x65A0: 'jiào',
+    0x65A1: 'wò,guǎn',
+    0x65A2: 'tiǎo,tǒu',
+    0x65A3: 'dòu',
+    0x65A4: 'jīn',
+    0x65A5: 'chì,chè,zhè',
+    0x65A6: 'yín,zhì',
+    0x65A7: 'fǔ',
+    0x65A8: 'qiāng',
+    0x65A9: 'zhǎn',
+    0x65AA: 'qú',
+    0x65AB: 'zhuó,chuò',
+    0x65AC: 'zhǎn,zhàn',
+    0x65AD: 'duàn',
+    0x65AE: 'cuò,zhuó',
+    0x65AF: 'sī,shǐ',
+    0x65B0: 'xīn',
+    0x65B1: 'zhuó',
+    0x65B2: 'zhuó',
+    0x65B3: 'qín,jǐn',
+    0x65B4: 'lín',
+    0x65B5: 'zhuó',
+    0x65B6: 'chù',
+    0x65B7: 'duàn',
+    0x65B8: 'zhǔ,zhú',
+    0x65B9: 'fāng,fáng,fǎng,páng,wǎng,fēng',
+    0x65BA: 'chǎn,jiè',
+    0x65BB: 'háng',
+    0x65BC: 'yú,yū,wū',
+    0x65BD: 'shī,yì,shǐ',
+    0x65BE: 'pèi',
+    0x65BF: 'yóu,liú',
+    0x65C0: 'mèi',
+    0x65C1: 'páng,pēng,bēng,bàng',
+    0x65C2: 'qí',
+    0x65C3: 'zhān',
+    0x65C4: 'máo,mào,wù',
+    0x65C5: 'lǚ',
+    0x65C6: 'pèi',
+    0x65C7: 'pī,bì',
+    0x65C8: 'liú',
+    0x65C9: 'fū',
+    0x65CA: 'fǎng',
+    0x65CB: 'xuán,xuàn',
+    0x65CC: 'jīng',
+    0x65CD: 'jīng',
+    0x65CE: 'nǐ',
+    0x65CF: 'zú,sǒu,còu,zòu',
+    0x65D0: 'zhào',
+    0x65D1: 'yǐ',
+    0x65D2: 'liú',
+    0x65D3: 'shāo',
+    0x65D4: 'jiàn',
+    0x65D5: 'yú',
+    0x65D6: 'yǐ',
+    0x65D7: 'qí',
+    0x65D8: 'zhì',
+    0x65D9: 'fān',
+    0x65DA: 'piāo',
+    0x65DB: 'fān',
+    0x65DC: 'zhān',
+    0x65DD: 'kuài',
+    0x65DE: 'suì',
+    0x65DF: 'yú',
+    0x65E0: 'wú,mó',
+    0x65E1: 'jì',
+    0x65E2: 'jì,xì',
+    0x65E3: 'jì',
+    0x65E4: 'huò',
+    0x65E5: 'rì',
+    0x65E6: 'dàn',
+    0x65E7: 'jiù',
+    0x65E8: 'zhǐ',
+    0x65E9: 'zǎo',
+    0x65EA: 'xié',
+    0x65EB: 'tiāo',
+    0x65EC: 'xún,jūn',
+    0x65ED: 'xù',
+    0x65EE: 'gā,xù',
+    0x65EF: 'lá',
+    0x65F0: 'gàn,hàn',
+    0x65F1: 'hàn',
+    0x65F2: 'tái,yīng',
+    0x65F3: 'dì',
+    0x65F4: 'xū',
+    0x65F5: 'chǎn',
+    0x65F6: 'shí',
+    0x65F7: 'kuàng',
+    0x65F8: 'yáng',
+    0x65F9: 'shí',
+    0x65FA: 'wàng',
+    0x65FB: 'mín',
+    0x65FC: 'mín',
+    0x65FD: 'tūn,zhùn',
+    0x65FE: 'chūn',
+    0x65FF: 'wǔ,wù',
+    0x6600: 'yún',
+    0x6601: 'bèi',
+    0x6602: 'áng,yàng',
+    0x6603: 'zè',
+    0x6604: 'bǎn',
+    0x6605: 'jié',
+    0x6606: 'kūn,hún,kùn',
+    0x6607: 'shēng',
+    0x6608: 'hù',
+    0x6609: 'fǎng',
+    0x660A: 'hào',
+    0x660B: 'guì,jiǒng',
+    0x660C: 'chāng,chàng',
+    0x660D: 'xuān',
+    0x660E: 'míng,mèng',
+    0x660F: 'hūn,hùn',
+    0x6610: 'fēn',
+    0x6611: 'qǐn',
+    0x6612: 'hū',
+    0x6613: 'yì',
+    0x6614: 'xī,cuò',
+    0x6615: 'xīn,xuān',
+    0x6616: 'yán',
+    0x6617: 'zè',
+    0x6618: 'fǎng',
+    0x6619: 'tán,yù',
+    0x661A: 'shèn',
+    0x661B: 'jù',
+    0x661C: 'yáng',
+    0x661D: 'zǎn',
+    0x661E: 'bǐng,fǎng',
+    0x661F: 'xīng',
+    0x6620: 'yìng,yǎng',
+    0x6621: 'xuàn',
+    0x6622: 'pò,pèi',
+    0x6623: 'zhěn',
+    0x6624: 'líng',
+    0x6625: 'chūn,chǔn',
+    0x6626: 'hào',
+    0x6627: 'mèi,wěn,mò',
+    0x6628: 'zuó',
+    0x6629: 'mò',
+    0x662A: 'biàn',
+    0x662B: 'xù,xiǒng',
+    0x662C: 'hūn',
+    0x662D: 'zhāo,zhào',
+    0x662E: 'zòng',
+    0x662F: 'shì,tí',
+    0x6630: 'shì,xià',
+    0x6631: 'yù',
+    0x6632: 'fèi',
+    0x6633: 'dié,diè,yì',
+    0x6634: 'mǎo',
+    0x6635: 'nì,nǐ,zhì',
+    0x6636: 'chǎng',
+    0x6637: 'wēn',
+    0x6638: 'dōng',
+    0x6639: 'ǎi',
+    0x663A: 'bǐng',
+    0x663B: 'áng',
+    0x663C: 'zhòu',
+    0x663D: 'lóng',
+    0x663E: 'xiǎn',
+    0x663F: 'kuàng',
+    0x6640: 'tiǎo',
+    0x6641: 'cháo,zhāo,chào',
+    0x6642: 'shí',
+    0x6643: 'huǎng,huàng',
+    0x6644: 'huǎng',
+    0x6645: 'xuǎn,xuān',
+    0x6646: 'kuí',
+    0x6647: 'xū,kuā',
+    0x6648: 'jiǎo',
+    0x6649: 'jìn',
+    0x664A: 'zhì',
+    0x664B: 'jìn',
+    0x664C: 'shǎng',
+    0x664D: 'tóng',
+    0x664E: 'hǒng',
+    0x664F: 'yàn',
+    0x6650: 'gāi',
+    0x6651: 'xiǎng',
+    0x6652: 'shài',
+    0x6653: 'xiǎo',
+    0x6654: 'yè',
+    0x6655: 'yūn,yùn',
+    0x6656: 'huī',
+    0x6657: 'hán',
+    0x6658: 'hàn',
+    0x6659: 'jùn',
+    0x665A: 'wǎn',
+    0x665B: 'xiàn',
+    0x665C: 'kūn',
+    0x665D: 'zhòu',
+    0x665E: 'xī',
+    0x665F: 'chéng,shèng,jīng',
+    0x6660: 'shèng',
+    0x6661: 'bū',
+    0x6662: 'zhé,zhì',
+    0x6663: 'zhé',
+    0x6664: 'wù',
+    0x6665: 'wǎn',
+    0x6666: 'huì',
+    0x6667: 'hào',
+    0x6668: 'chén',
+    0x6669: 'wǎn',
+    0x666A: 'tiǎn',
+    0x666B: 'zhuó',
+    0x666C: 'zuì',
+    0x666D: 'zhǒu',
+    0x666E: 'pǔ',
+    0x666F: 'jǐng,yǐng',
+    0x6670: 'xī',
+    0x6671: 'shǎn',
+    0x6672: 'nǐ',
+    0x6673: 'xī',
+    0x6674: 'qíng',
+    0x6675: 'qǐ,dù',
+    0x6676: 'jīng',
+    0x6677: 'guǐ',
+    0x6678: 'zhěng',
+    0x6679: 'yì',
+    0x667A: 'zhì,zhī',
+    0x667B: 'àn,ǎn,yǎn',
+    0x667C: 'wǎn',
+    0x667D: 'lín',
+    0x667E: 'liàng',
+    0x667F: 'chāng',
+    0x6680: 'wǎng,wàng',
+    0x6681: 'xiǎo',
+    0x6682: 'zàn',
+    0x6683: 'fēi',
+    0x6684: 'xuān',
+    0x6685: 'gèng,xuǎn',
+    0x6686: 'yí',
+    0x6687: 'xiá,xià,jiǎ',
+    0x6688: 'yūn,yùn',
+    0x6689: 'huī',
+    0x668A: 'xǔ',
+    0x668B: 'mǐn,mín',
+    0x668C: 'kuí',
+    0x668D: 'yē',
+    0x668E: 'yìng',
+    0x668F: 'shǔ,dǔ',
+    0x6690: 'wěi',
+    0x6691: 'shǔ',
+    0x6692: 'qíng',
+    0x6693: 'mào',
+    0x6694: 'nán',
+    0x6695: 'jiǎn,lán',
+    0x6696: 'nuǎn,xuān',
+    0x6697: 'àn',
+    0x6698: 'yáng',
+    0x6699: 'chūn',
+    0x669A: 'yáo',
+    0x669B: 'suǒ',
+    0x669C: 'pǔ',
+    0x669D: 'míng',
+    0x669E: 'jiǎo',
+    0x669F: 'kǎi',
+    0x66A0: 'gǎo,hào',
+    0x66A1: 'wěng',
+    0x66A2: 'chàng',
+    0x66A3: 'qì',
+    0x66A4: 'hào',
+    0x66A5: 'yàn',
+    0x66A6: 'lì',
+    0x66A7: 'ài,nuǎn',
+    0x66A8: 'jì,jiè',
+    0x66A9: 'jì',
+    0x66AA: 'mèn',
+    0x66AB: 'zàn',
+    0x66AC: 'xiè',
+    0x66AD: 'hào',
+    0x66AE: 'mù',
+    0x66AF: 'mò',
+    0x66B0: 'cōng',
+    0x66B1: 'nì',
+    0x66B2: 'zhāng',
+    0x66B3: 'huì',
+    0x66B4: 'bào,pù,bó',
+    0x66B5: 'hàn',
+    0x66B6: 'xuán',
+    0x66B7: 'chuán',
+    0x66B8: 'liáo',
+    0x66B9: 'xiān',
+    0x66BA: 'tǎn',
+    0x66BB: 'jǐng',
+    0x66BC: 'piē',
+    0x66BD: 'lín',
+    0x66BE: 'tūn',
+    0x66BF: 'xǐ,xī',
+    0x66C0: 'yì',
+    0x66C1: 'jì',
+    0x66C2: 'huàng',
+    0x66C3: 'dài',
+    0x66C4: 'yè',
+    0x66C5: 'yè',
+    0x66C6: 'lì',
+    0x66C7: 'tán',
+    0x66C8: 'tóng',
+    0x66C9: 'xiǎo',
+    0x66CA: 'fèi',
+    0x66CB: 'shěn',
+    0x66CC: 'zhào',
+    0x66CD: 'hào',
+    0x66CE: 'yì',
+    0x66CF: 'xiǎng,xiàng,shǎng',
+    0x66D0: 'xīng',
+    0x66D1: 'shēn',
+    0x66D2: 'jiǎo',
+    0x66D3: 'bào',
+    0x66D4: 'jìng',
+    0x66D5: 'yàn',
+    0x66D6: 'ài',
+    0x66D7: 'yè',
+    0x66D8: 'rú',
+    0x66D9: 'shǔ',
+    0x66DA: 'méng',
+    0x66DB: 'xūn',
+    0x66DC: 'yào',
+    0x66DD: 'pù,bào',
+    0x66DE: 'lì',
+    0x66DF: 'chén',
+    0x66E0: 'kuàng',
+    0x66E1: 'dié',
+    0x66E2: 'liǎo',
+    0x66E3: 'yàn',
+    0x66E4: 'huò',
+    0x66E5: 'lú',
+    0x66E6: 'xī',
+    0x66E7: 'róng',
+    0x66E8: 'lóng',
+    0x66E9: 'nǎng',
+    0x66EA: 'luǒ',
+    0x66EB: 'luán',
+    0x66EC: 'shài',
+    0x66ED: 'tǎng',
+    0x66EE: 'yǎn',
+    0x66EF: 'zhú',
+    0x66F0: 'yuē',
+    0x66F1: 'yuē',
+    0x66F2: 'qū,qǔ',
+    0x66F3: 'yè',
+    0x66F4: 'gèng,gēng',
+    0x66F5: 'yè',
+    0x66F6: 'hū',
+    0x66F7: 'hé,è,hè',
+    0x66F8: 'shū',
+    0x66F9: 'cáo',
+    0x66FA: 'cáo',
+    0x66FB: 'shēng',
+    0x66FC: 'màn',
+    0x66FD: 'cēng',
+    0x66FE: 'céng,zēng',
+    0x66FF: 'tì',
+    0x6700: 'zuì,cuō',
+    0x6701: 'cǎn,qián,jiàn',
+    0x6702: 'xù',
+    0x6703: 'huì,kuài,kuò',
+    0x6704: 'yǐn',
+    0x6705: 'qiè',
+    0x6706: 'fēn',
+    0x6707: 'pí',
+    0x6708: 'yuè,rù',
+    0x6709: 'yǒu,yòu,wěi',
+    0x670A: 'ruǎn,wǎn',
+    0x670B: 'péng',
+    0x670C: 'fén,bān',
+    0x670D: 'fú,fù,bì,bó',
+    0x670E: 'líng',
+    0x670F: 'fěi,kū',
+    0x6710: 'qú,xū,xù,chǔn',
+    0x6711: 'tì',
+    0x6712: 'nǜ',
+    0x6713: 'tiǎo,tiào,yóu',
+    0x6714: 'shuò',
+    0x6715: 'zhèn',
+    0x6716: 'lǎng',
+    0x6717: 'lǎng',
+    0x6718: 'zuī,juān',
+    0x6719: 'míng',
+    0x671A: 'huāng,máng,wáng,mèng',
+    0x671B: 'wàng',
+    0x671C: 'tūn',
+    0x671D: 'cháo,zhāo,zhū',
+    0x671E: 'jī,qī',
+    0x671F: 'qī,jī',
+    0x6720: 'yīng',
+    0x6721: 'zōng',
+    0x6722: 'wàng',
+    0x6723: 'tóng,chuáng',
+    0x6724: 'lǎng',
+    0x6725: 'láo',
+    0x6726: 'méng,mǎng',
+    0x6727: 'lóng,lǒng',
+    0x6728: 'mù',
+    0x6729: 'děng',
+    0x672A: 'wèi',
+    0x672B: 'mò,me',
+    0x672C: 'běn,bēn',
+    0x672D: 'zhá,yà',
+    0x672E: 'shù,zhú',
+    0x672F: 'shù,zhú,shú',
+    0x6730: 'mù',
+    0x6731: 'zhū,shū',
+    0x6732: 'rén',
+    0x6733: 'bā',
+    0x6734: 'pǔ,piáo,pò,pū,pō',
+    0x6735: 'duǒ',
+    0x6736: 'duǒ',
+    0x6737: 'dāo,mù,tiáo',
+    0x6738: 'lì',
+    0x6739: 'guǐ,qiú',
+    0x673A: 'jī,wèi',
+    0x673B: 'jiū',
+    0x673C: 'bǐ',
+    0x673D: 'xiǔ',
+    0x673E: 'chéng,zhēng,chēng,tīng',
+    0x673F: 'cì',
+    0x6740: 'shā',
+    0x6741: 'rù',
+    0x6742: 'zá,duǒ',
+    0x6743: 'quán',
+    0x6744: 'qiān',
+    0x6745: 'yú,wū',
+    0x6746: 'gān,gǎn,gàn',
+    0x6747: 'wū',
+    0x6748: 'chā,chà',
+    0x6749: 'shān,shā',
+    0x674A: 'xún',
+    0x674B: 'fán',
+    0x674C: 'wù,wò',
+    0x674D: 'zǐ',
+    0x674E: 'lǐ',
+    0x674F: 'xìng',
+    0x6750: 'cái',
+    0x6751: 'cūn',
+    0x6752: 'rèn,ér',
+    0x6753: 'biāo,sháo,shuó,dí,zhuó',
+    0x6754: 'tuō,zhé',
+    0x6755: 'dì,duò',
+    0x6756: 'zhàng',
+    0x6757: 'máng',
+    0x6758: 'chì',
+    0x6759: 'yì',
+    0x675A: 'gài,gé',
+    0x675B: 'gōng',
+    0x675C: 'dù,dǔ,tú',
+    0x675D: 'lí,zhì,yí,tuò,duò',
+    0x675E: 'qǐ',
+    0x675F: 'shù',
+    0x6760: 'gāng,gàng,gōng',
+    0x6761: 'tiáo',
+    0x6762: 'jiang',
+    0x6763: 'mián',
+    0x6764: 'wàn',
+    0x6765: 'lái',
+    0x6766: 'jiǔ',
+    0x6767: 'máng',
+    0x6768: 'yáng',
+    0x6769: 'mà',
+    0x676A: 'miǎo',
+    0x676B: 'sì,zhǐ,xǐ',
+    0x676C: 'yuán,yuàn',
+    0x676D: 'háng,kàng,kāng',
+    0x676E: 'fèi,bèi',
+    0x676F: 'bēi',
+    0x6770: 'jié',
+    0x6771: 'dōng',
+    0x6772: 'gǎo',
+    0x6773: 'yǎo',
+    0x6774: 'xiān,qiān',
+    0x6775: 'chǔ',
+    0x6776: 'chūn',
+    0x6777: 'pá,bà',
+    0x6778: 'shū,duì',
+    0x6779: 'huà',
+    0x677A: 'xīn',
+    0x677B: 'chǒu,niǔ',
+    0x677C: 'zhù,shù',
+    0x677D: 'chǒu',
+    0x677E: 'sōng',
+    0x677F: 'bǎn',
+    0x6780: 'sōng',
+    0x6781: 'jí',
+    0x6782: 'wò,yuè',
+    0x6783: 'jìn',
+    0x6784: 'gòu',
+    0x6785: 'jī',
+    0x6786: 'máo',
+    0x6787: 'pí,bǐ,bì,pī',
+    0x6788: 'bì,pī',
+    0x6789: 'wǎng,kuáng',
+    0x678A: 'àng',
+    0x678B: 'fāng,fǎng,bǐng',
+    0x678C: 'fén',
+    0x678D: 'yì',
+    0x678E: 'fú,fū',
+    0x678F: 'nán',
+    0x6790: 'xī,sī',
+    0x6791: 'hù',
+    0x6792: 'yā,yē,yá,yà',
+    0x6793: 'dǒu,zhǔ',
+    0x6794: 'xín',
+    0x6795: 'zhěn,chén',
+    0x6796: 'yāo,yǎo',
+    0x6797: 'lín',
+    0x6798: 'ruì,nèn',
+    0x6799: 'ě,è',
+    0x679A: 'méi',
+    0x679B: 'zhào',
+    0x679C: 'guǒ,luǒ,guàn',
+    0x679D: 'zhī,qí',
+    0x679E: 'cōng,zōng',
+    0x679F: 'yùn',
+    0x67A0: 'zui',
+    0x67A1: 'shēng',
+    0x67A2: 'shū',
+    0x67A3: 'zǎo',
+    0x67A4: 'dì',
+    0x67A5: 'lì',
+    0x67A6: 'lú',
+    0x67A7: 'jiǎn',
+    0x67A8: 'chéng',
+    0x67A9: 'sōng',
+    0x67AA: 'qiāng',
+    0x67AB: 'fēng',
+    0x67AC: 'zhān',
+    0x67AD: 'xiāo',
+    0x67AE: 'xiān,zhēn',
+    0x67AF: 'kū,gū',
+    0x67B0: 'píng',
+    0x67B1: 'tái,sì,cí',
+    0x67B2: 'xǐ',
+    0x67B3: 'zhǐ,zhī',
+    0x67B4: 'guǎi',
+    0x67B5: 'xiāo',
+    0x67B6: 'jià',
+    0x67B7: 'jiā,jià',
+    0x67B8: 'gǒu,gōu,jǔ,qú',
+    0x67B9: 'bāo,fú',
+    0x67BA: 'mò',
+    0x67BB: 'yì,xiè',
+    0x67BC: 'yè',
+    0x67BD: 'yè',
+    0x67BE: 'shì',
+    0x67BF: 'niè',
+    0x67C0: 'bǐ',
+    0x67C1: 'duò,tuó,tuǒ',
+    0x67C2: 'yí,duò,lí',
+    0x67C3: 'líng',
+    0x67C4: 'bǐng',
+    0x67C5: 'nǐ,chì',
+    0x67C6: 'lā',
+    0x67C7: 'hé',
+    0x67C8: 'bàn,pán,pàn',
+    0x67C9: 'fán',
+    0x67CA: 'zhōng',
+    0x67CB: 'dài',
+    0x67CC: 'cí',
+    0x67CD: 'yǎng,yàng,yīng',
+    0x67CE: 'fū,fǔ,fù',
+    0x67CF: 'bǎi,bó,bò',
+    0x67D0: 'mǒu,méi',
+    0x67D1: 'gān,qián',
+    0x67D2: 'qī',
+    0x67D3: 'rǎn',
+    0x67D4: 'róu',
+    0x67D5: 'mào',
+    0x67D6: 'sháo,shào',
+    0x67D7: 'sōng',
+    0x67D8: 'zhè',
+    0x67D9: 'xiá,jiǎ',
+    0x67DA: 'yòu,yóu,zhóu',
+    0x67DB: 'shēn',
+    0x67DC: 'guì,jǔ',
+    0x67DD: 'tuò',
+    0x67DE: 'zhà,zuò,zé',
+    0x67DF: 'nán,rán',
+    0x67E0: 'níng,chǔ,zhù',
+    0x67E1: 'yǒng',
+    0x67E2: 'dǐ,dì,chí',
+    0x67E3: 'zhì,dié',
+    0x67E4: 'zhā,zǔ,zū',
+    0x67E5: 'chá,zhā,chái',
+    0x67E6: 'dàn',
+    0x67E7: 'gū',
+    0x67E8: 'bù,pū',
+    0x67E9: 'jiù',
+    0x67EA: 'āo,ào',
+    0x67EB: 'fú',
+    0x67EC: 'jiǎn',
+    0x67ED: 'bā,fú,bó,biē,pèi',
+    0x67EE: 'duò,zuó,wù',
+    0x67EF: 'kē',
+    0x67F0: 'nài',
+    0x67F1: 'zhù,zhǔ',
+    0x67F2: 'bì,bié',
+    0x67F3: 'liǔ',
+    0x67F4: 'chái,cī,zhài,zì',
+    0x67F5: 'shān,zhà',
+    0x67F6: 'sì',
+    0x67F7: 'chù,zhù',
+    0x67F8: 'pēi,bēi',
+    0x67F9: 'shì,fèi',
+    0x67FA: 'guǎi',
+    0x67FB: 'zhā',
+    0x67FC: 'yǎo',
+    0x67FD: 'chēng,jué',
+    0x67FE: 'jiù',
+    0x67FF: 'shì',
+    0x6800: 'zhī',
+    0x6801: 'liǔ',
+    0x6802: 'méi',
+    0x6803: 'lì',
+    0x6804: 'róng',
+    0x6805: 'zhà,shān,cè',
+    0x6806: 'zǎo',
+    0x6807: 'biāo',
+    0x6808: 'zhàn',
+    0x6809: 'zhì',
+    0x680A: 'lóng',
+    0x680B: 'dòng',
+    0x680C: 'lú',
+    0x680D: 'shēng',
+    0x680E: 'lì,yuè',
+    0x680F: 'lán',
+    0x6810: 'yǒng',
+    0x6811: 'shù',
+    0x6812: 'xún,sǔn',
+    0x6813: 'shuān,shuàn,quán',
+    0x6814: 'qì',
+    0x6815: 'zhēn',
+    0x6816: 'qī,xī',
+    0x6817: 'lì,liè',
+    0x6818: 'yí',
+    0x6819: 'xiáng',
+    0x681A: 'zhèn',
+    0x681B: 'lì',
+    0x681C: 'sè,cì',
+    0x681D: 'guā,tiǎn,kuò',
+    0x681E: 'kān',
+    0x681F: 'bēn,bīng',
+    0x6820: 'rěn',
+    0x6821: 'xiào,jiào,jiǎo,qiāo',
+    0x6822: 'bǎi',
+    0x6823: 'rěn',
+    0x6824: 'bìng',
+    0x6825: 'zī',
+    0x6826: 'chóu',
+    0x6827: 'yì',
+    0x6828: 'cì',
+    0x6829: 'xǔ,yǔ',
+    0x682A: 'zhū',
+    0x682B: 'jiàn,zùn',
+    0x682C: 'zuì',
+    0x682D: 'ér',
+    0x682E: 'ěr',
+    0x682F: 'yǒu,yù',
+    0x6830: 'fá',
+    0x6831: 'gǒng',
+    0x6832: 'kǎo',
+    0x6833: 'lǎo',
+    0x6834: 'zhān',
+    0x6835: 'liè',
+    0x6836: 'yīn',
+    0x6837: 'yàng,yáng',
+    0x6838: 'hé,hú,gāi,kài',
+    0x6839: 'gēn',
+    0x683A: 'yì,zhī,zhǐ',
+    0x683B: 'shì',
+    0x683C: 'gé,luò,hè,gē',
+    0x683D: 'zāi,zài',
+    0x683E: 'luán',
+    0x683F: 'fú',
+    0x6840: 'jié',
+    0x6841: 'héng,háng,hàng',
+    0x6842: 'guì',
+    0x6843: 'táo,tiāo,zhào',
+    0x6844: 'guāng,guàng',
+    0x6845: 'wéi,guǐ',
+    0x6846: 'kuāng,kuàng,kuáng',
+    0x6847: 'rú',
+    0x6848: 'àn',
+    0x6849: 'ān,àn',
+    0x684A: 'juàn,quān',
+    0x684B: 'yí,tí',
+    0x684C: 'zhuō',
+    0x684D: 'kū',
+    0x684E: 'zhì',
+    0x684F: 'qióng',
+    0x6850: 'tóng,tōng,dòng',
+    0x6851: 'sāng',
+    0x6852: 'sāng',
+    0x6853: 'huán',
+    0x6854: 'jú,jié,xié',
+    0x6855: 'jiù',
+    0x6856: 'xuè',
+    0x6857: 'duò',
+    0x6858: 'zhuì',
+    0x6859: 'yú,móu',
+    0x685A: 'zǎn',
+    0x685C: 'yīng',
+    0x685D: 'jié',
+    0x685E: 'liǔ',
+    0x685F: 'zhàn',
+    0x6860: 'yā',
+    0x6861: 'ráo',
+    0x6862: 'zhēn',
+    0x6863: 'dàng',
+    0x6864: 'qī',
+    0x6865: 'qiáo',
+    0x6866: 'huà',
+    0x6867: 'guì,huì',
+    0x6868: 'jiǎng',
+    0x6869: 'zhuāng',
+    0x686A: 'xún',
+    0x686B: 'suō',
+    0x686C: 'shā',
+    0x686D: 'zhēn,chén,zhèn',
+    0x686E: 'bēi',
+    0x686F: 'tīng,yíng',
+    0x6870: 'kuò',
+    0x6871: 'jìng',
+    0x6872: 'po,bó',
+    0x6873: 'bèn',
+    0x6874: 'fú',
+    0x6875: 'ruí',
+    0x6876: 'tǒng',
+    0x6877: 'jué',
+    0x6878: 'xī',
+    0x6879: 'láng',
+    0x687A: 'liǔ',
+    0x687B: 'fēng,fèng',
+    0x687C: 'qī',
+    0x687D: 'wěn',
+    0x687E: 'jūn',
+    0x687F: 'gǎn,hàn',
+    0x6880: 'sù,yìn',
+    0x6881: 'liáng',
+    0x6882: 'qiú',
+    0x6883: 'tǐng,tìng',
+    0x6884: 'yǒu',
+    0x6885: 'méi',
+    0x6886: 'bāng',
+    0x6887: 'lòng',
+    0x6888: 'pēng',
+    0x6889: 'zhuāng',
+    0x688A: 'dì',
+    0x688B: 'xuān,juān,xié',
+    0x688C: 'tú,chá,tū',
+    0x688D: 'zào',
+    0x688E: 'āo,yòu',
+    0x688F: 'gù,jué',
+    0x6890: 'bì',
+    0x6891: 'dí',
+    0x6892: 'hán',
+    0x6893: 'zǐ',
+    0x6894: 'zhī',
+    0x6895: 'rèn',
+    0x6896: 'bèi',
+    0x6897: 'gěng',
+    0x6898: 'jiǎn,xiàn,jiàn',
+    0x6899: 'huàn',
+    0x689A: 'wǎn',
+    0x689B: 'nuó',
+    0x689C: 'jiā',
+    0x689D: 'tiáo,tiāo',
+    0x689E: 'jì',
+    0x689F: 'xiāo',
+    0x68A0: 'lǚ',
+    0x68A1: 'hún,kuǎn',
+    0x68A2: 'shāo,shào,xiāo,sào',
+    0x68A3: 'cén,chén,qín',
+    0x68A4: 'fén',
+    0x68A5: 'sōng',
+    0x68A6: 'mèng',
+    0x68A7: 'wú,wù,yǔ',
+    0x68A8: 'lí',
+    0x68A9: 'lí,sì,qǐ',
+    0x68AA: 'dòu',
+    0x68AB: 'qǐn,qīn',
+    0x68AC: 'yǐng',
+    0x68AD: 'suō,xùn',
+    0x68AE: 'jū',
+    0x68AF: 'tī,tí',
+    0x68B0: 'xiè',
+    0x68B1: 'kǔn,hún',
+    0x68B2: 'zhuó',
+    0x68B3: 'shū',
+    0x68B4: 'chān',
+    0x68B5: 'fàn',
+    0x68B6: 'wěi',
+    0x68B7: 'jìng',
+    0x68B8: 'lí',
+    0x68B9: 'bīn,bīng',
+    0x68BA: 'xià',
+    0x68BB: 'fó',
+    0x68BC: 'táo',
+    0x68BD: 'zhì',
+    0x68BE: 'lái',
+    0x68BF: 'lián',
+    0x68C0: 'jiǎn',
+    0x68C1: 'zhuō,tuō,ruì',
+    0x68C2: 'líng',
+    0x68C3: 'lí',
+    0x68C4: 'qì',
+    0x68C5: 'bǐng',
+    0x68C6: 'lún',
+    0x68C7: 'cōng,sōng',
+    0x68C8: 'qiàn',
+    0x68C9: 'mián',
+    0x68CA: 'qí',
+    0x68CB: 'qí,jī',
+    0x68CC: 'cài',
+    0x68CD: 'gùn,hùn,āo,gǔn',
+    0x68CE: 'chán',
+    0x68CF: 'dé,zhé',
+    0x68D0: 'fěi,féi',
+    0x68D1: 'pái,bèi,pèi',
+    0x68D2: 'bàng',
+    0x68D3: 'bàng,bèi,pǒu,péi,bēi',
+    0x68D4: 'hūn',
+    0x68D5: 'zōng',
+    0x68D6: 'chéng,cháng',
+    0x68D7: 'zǎo',
+    0x68D8: 'jí',
+    0x68D9: 'lì,liè',
+    0x68DA: 'péng',
+    0x68DB: 'yù',
+    0x68DC: 'yù',
+    0x68DD: 'gù',
+    0x68DE: 'jùn',
+    0x68DF: 'dòng',
+    0x68E0: 'táng',
+    0x68E1: 'gāng',
+    0x68E2: 'wǎng',
+    0x68E3: 'dì,tì,dài',
+    0x68E4: 'cuò',
+    0x68E5: 'fán',
+    0x68E6: 'chēng',
+    0x68E7: 'zhàn,zhǎn,chén',
+    0x68E8: 'qǐ',
+    0x68E9: 'yuān',
+    0x68EA: 'yǎn,yàn',
+    0x68EB: 'yù',
+    0x68EC: 'quān,juàn,quán',
+    0x68ED: 'yì',
+    0x68EE: 'sēn',
+    0x68EF: 'rěn,shěn',
+    0x68F0: 'chuí,duǒ',
+    0x68F1: 'léng,lēng,líng,lèng,chēng',
+    0x68F2: 'qī,xī',
+    0x68F3: 'zhuō',
+    0x68F4: 'fú,sù',
+    0x68F5: 'kē,kuǎn,kě',
+    0x68F6: 'lái',
+    0x68F7: 'zōu,sǒu',
+    0x68F8: 'zōu',
+    0x68F9: 'zhào,zhuō',
+    0x68FA: 'guān,guàn',
+    0x68FB: 'fēn',
+    0x68FC: 'fén,fèn,fēn',
+    0x68FD: 'shēn,chēn',
+    0x68FE: 'qíng',
+    0x68FF: 'ní,niè',
+    0x6900: 'wǎn',
+    0x6901: 'guǒ',
+    0x6902: 'lù',
+    0x6903: 'háo',
+    0x6904: 'jiē,jié,qiè',
+    0x6905: 'yǐ,yī',
+    0x6906: 'chóu,zhòu,diāo',
+    0x6907: 'jǔ',
+    0x6908: 'jú',
+    0x6909: 'chéng,shèng',
+    0x690A: 'zuó,cuì',
+    0x690B: 'liáng',
+    0x690C: 'qiāng,kōng',
+    0x690D: 'zhí',
+    0x690E: 'chuí,zhuī',
+    0x690F: 'yā,ě',
+    0x6910: 'jū',
+    0x6911: 'bēi,pí,bì,pái',
+    0x6912: 'jiāo',
+    0x6913: 'zhuó',
+    0x6914: 'zī',
+    0x6915: 'bīn',
+    0x6916: 'péng',
+    0x6917: 'dìng',
+    0x6918: 'chǔ',
+    0x6919: 'chāng',
+    0x691A: 'mēn',
+    0x691B: 'huā',
+    0x691C: 'jiǎn',
+    0x691D: 'guī',
+    0x691E: 'xì',
+    0x691F: 'dú',
+    0x6920: 'qiàn',
+    0x6921: 'dào',
+    0x6922: 'guì',
+    0x6923: 'diǎn',
+    0x6924: 'luó',
+    0x6925: 'zhī',
+    0x6926: 'quan',
+    0x6927: 'mìng',
+    0x6928: 'fǔ',
+    0x6929: 'gēng',
+    0x692A: 'pèng',
+    0x692B: 'shàn',
+    0x692C: 'yí',
+    0x692D: 'tuǒ',
+    0x692E: 'sēn',
+    0x692F: 'duǒ,chuán',
+    0x6930: 'yē',
+    0x6931: 'fù',
+    0x6932: 'wěi,huī',
+    0x6933: 'wēi',
+    0x6934: 'duàn',
+    0x6935: 'jiǎ,jiā',
+    0x6936: 'zōng',
+    0x6937: 'jiān,hán',
+    0x6938: 'yí',
+    0x6939: 'shèn,zhēn',
+    0x693A: 'xí',
+    0x693B: 'yàn,yà',
+    0x693C: 'yǎn',
+    0x693D: 'chuán',
+    0x693E: 'jiān,zhàn',
+    0x693F: 'chūn',
+    0x6940: 'yǔ',
+    0x6941: 'hé',
+    0x6942: 'zhā,chá',
+    0x6943: 'wò',
+    0x6944: 'pián',
+    0x6945: 'bī',
+    0x6946: 'yāo',
+    0x6947: 'huò,guō,kuǎ',
+    0x6948: 'xū',
+    0x6949: 'ruò',
+    0x694A: 'yáng',
+    0x694B: 'là',
+    0x694C: 'yán',
+    0x694D: 'běn',
+    0x694E: 'huī',
+    0x694F: 'kuí',
+    0x6950: 'jiè',
+    0x6951: 'kuí',
+    0x6952: 'sī',
+    0x6953: 'fēng,fán',
+    0x6954: 'xiē,xiè',
+    0x6955: 'tuǒ',
+    0x6956: 'zhì,jí',
+    0x6957: 'jiàn,jiǎn',
+    0x6958: 'mù',
+    0x6959: 'mào',
+    0x695A: 'chǔ',
+    0x695B: 'hù,kǔ',
+    0x695C: 'hú',
+    0x695D: 'liàn',
+    0x695E: 'léng,lèng',
+    0x695F: 'tíng',
+    0x6960: 'nán',
+    0x6961: 'yú',
+    0x6962: 'yóu,yǒu',
+    0x6963: 'méi,měi',
+    0x6964: 'sǒng,cōng',
+    0x6965: 'xuàn,yuán',
+    0x6966: 'xuàn',
+    0x6967: 'yǎng',
+    0x6968: 'zhēn',
+    0x6969: 'pián',
+    0x696A: 'yè,dié',
+    0x696B: 'jí',
+    0x696C: 'jié,qià',
+    0x696D: 'yè',
+    0x696E: 'chǔ,zhū',
+    0x696F: 'dùn,shǔn,chūn',
+    0x6970: 'yú',
+    0x6971: 'zòu,cōu',
+    0x6972: 'wēi',
+    0x6973: 'méi',
+    0x6974: 'tì,dǐ,shì',
+    0x6975: 'jí,jǐ',
+    0x6976: 'jié',
+    0x6977: 'kǎi,jiē,jiè',
+    0x6978: 'qiū',
+    0x6979: 'yíng',
+    0x697A: 'rǒu,ròu',
+    0x697B: 'huáng',
+    0x697C: 'lóu',
+    0x697D: 'lè',
+    0x697E: 'quán',
+    0x697F: 'xiāng',
+    0x6980: 'pǐn',
+    0x6981: 'shǐ',
+    0x6982: 'gài,guì,jié',
+    0x6983: 'tán',
+    0x6984: 'lǎn',
+    0x6985: 'wēn,yùn',
+    0x6986: 'yú',
+    0x6987: 'chèn',
+    0x6988: 'lǘ',
+    0x6989: 'jǔ',
+    0x698A: 'shén',
+    0x698B: 'chu',
+    0x698C: 'bī',
+    0x698D: 'xiè',
+    0x698E: 'jiǎ',
+    0x698F: 'yì',
+    0x6990: 'zhǎn,chǎn,niàn,zhèn',
+    0x6991: 'fú,fù,bó',
+    0x6992: 'nuò',
+    0x6993: 'mì',
+    0x6994: 'láng,lǎng',
+    0x6995: 'róng',
+    0x6996: 'gǔ',
+    0x6997: 'jiàn,jìn',
+    0x6998: 'jǔ',
+    0x6999: 'tā',
+    0x699A: 'yǎo',
+    0x699B: 'zhēn',
+    0x699C: 'bǎng,bēng,bàng,páng,péng',
+    0x699D: 'shā,xiè',
+    0x699E: 'yuán',
+    0x699F: 'zǐ',
+    0x69A0: 'míng',
+    0x69A1: 'sù',
+    0x69A2: 'jià',
+    0x69A3: 'yáo',
+    0x69A4: 'jié',
+    0x69A5: 'huàng',
+    0x69A6: 'gàn,hán',
+    0x69A7: 'fěi',
+    0x69A8: 'zhà',
+    0x69A9: 'qián',
+    0x69AA: 'mà,mǎ',
+    0x69AB: 'sǔn',
+    0x69AC: 'yuán',
+    0x69AD: 'xiè',
+    0x69AE: 'róng',
+    0x69AF: 'shí',
+    0x69B0: 'zhī',
+    0x69B1: 'cuī',
+    0x69B2: 'wēn',
+    0x69B3: 'tíng',
+    0x69B4: 'liú',
+    0x69B5: 'róng',
+    0x69B6: 'táng',
+    0x69B7: 'què',
+    0x69B8: 'zhāi',
+    0x69B9: 'sī',
+    0x69BA: 'shèng',
+    0x69BB: 'tà',
+    0x69BC: 'kē',
+    0x69BD: 'xī',
+    0x69BE: 'gǔ',
+    0x69BF: 'qī',
+    0x69C0: 'gǎo,kào',
+    0x69C1: 'gǎo,kào,gāo',
+    0x69C2: 'sūn',
+    0x69C3: 'pán',
+    0x69C4: 'tāo',
+    0x69C5: 'gé',
+    0x69C6: 'chūn',
+    0x69C7: 'diān,zhěn,zhēn',
+    0x69C8: 'nòu',
+    0x69C9: 'jí',
+    0x69CA: 'shuò',
+    0x69CB: 'gòu,jué',
+    0x69CC: 'chuí,zhuì,duī',
+    0x69CD: 'qiāng,chēng,qiǎng',
+    0x69CE: 'chá',
+    0x69CF: 'qiǎn,xiàn,lián',
+    0x69D0: 'huái',
+    0x69D1: 'méi',
+    0x69D2: 'xù',
+    0x69D3: 'gàng',
+    0x69D4: 'gāo',
+    0x69D5: 'zhuō',
+    0x69D6: 'tuó',
+    0x69D7: 'qiáo',
+    0x69D8: 'yàng',
+    0x69D9: 'diān',
+    0x69DA: 'jiǎ',
+    0x69DB: 'kǎn,jiàn',
+    0x69DC: 'zuì',
+    0x69DD: 'dǎo',
+    0x69DE: 'lóng',
+    0x69DF: 'bīn,bīng',
+    0x69E0: 'zhū',
+    0x69E1: 'sāng',
+    0x69E2: 'xí,dié',
+    0x69E3: 'jī,guī',
+    0x69E4: 'lián,liǎn',
+    0x69E5: 'huì',
+    0x69E6: 'yōng',
+    0x69E7: 'qiàn',
+    0x69E8: 'guǒ',
+    0x69E9: 'gài',
+    0x69EA: 'gài',
+    0x69EB: 'tuán,shuàn,quán',
+    0x69EC: 'huà',
+    0x69ED: 'qī,qì,zú,sè',
+    0x69EE: 'sēn,shěn',
+    0x69EF: 'cuī,zuǐ',
+    0x69F0: 'péng',
+    0x69F1: 'yǒu,chǎo',
+    0x69F2: 'hú',
+    0x69F3: 'jiǎng,jiāng',
+    0x69F4: 'hù',
+    0x69F5: 'huàn',
+    0x69F6: 'guì',
+    0x69F7: 'niè,xiè,yì',
+    0x69F8: 'yì',
+    0x69F9: 'gāo',
+    0x69FA: 'kāng',
+    0x69FB: 'guī',
+    0x69FC: 'guī',
+    0x69FD: 'cáo,zāo',
+    0x69FE: 'màn,wàn,mán',
+    0x69FF: 'jǐn,qín',
+    0x6A00: 'dí,zhí,zhé,dī',
+    0x6A01: 'zhuāng,chōng',
+    0x6A02: 'lè,yuè,yào,luò,liáo',
+    0x6A03: 'lǎng',
+    0x6A04: 'chén',
+    0x6A05: 'cōng,zōng',
+    0x6A06: 'lí,chī',
+    0x6A07: 'xiū',
+    0x6A08: 'qíng',
+    0x6A09: 'shuǎng',
+    0x6A0A: 'fán,fàn',
+    0x6A0B: 'tōng',
+    0x6A0C: 'guàn',
+    0x6A0D: 'zé',
+    0x6A0E: 'sù',
+    0x6A0F: 'lěi,léi',
+    0x6A10: 'lǔ',
+    0x6A11: 'liáng',
+    0x6A12: 'mì',
+    0x6A13: 'lóu,lǘ',
+    0x6A14: 'cháo,chāo,jiǎo',
+    0x6A15: 'sù',
+    0x6A16: 'kē',
+    0x6A17: 'chū',
+    0x6A18: 'táng,chēng',
+    0x6A19: 'biāo,biào',
+    0x6A1A: 'lù,dú',
+    0x6A1B: 'jiū,liáo',
+    0x6A1C: 'zhè',
+    0x6A1D: 'zhā',
+    0x6A1E: 'shū,ōu',
+    0x6A1F: 'zhāng',
+    0x6A20: 'mán,lǎng',
+    0x6A21: 'mó,mú',
+    0x6A22: 'niǎo,mù',
+    0x6A23: 'yàng,xiàng',
+    0x6A24: 'tiáo',
+    0x6A25: 'péng',
+    0x6A26: 'zhù',
+    0x6A27: 'shā',
+    0x6A28: 'xī',
+    0x6A29: 'quán',
+    0x6A2A: 'héng,hèng,guāng,guàng,huáng,huàng',
+    0x6A2B: 'jiān',
+    0x6A2C: 'cōng',
+    0x6A2D: 'jī',
+    0x6A2E: 'yān',
+    0x6A2F: 'qiáng',
+    0x6A30: 'xuě',
+    0x6A31: 'yīng',
+    0x6A32: 'èr,zhì',
+    0x6A33: 'xún',
+    0x6A34: 'zhí,yì',
+    0x6A35: 'qiáo',
+    0x6A36: 'zuī',
+    0x6A37: 'cóng',
+    0x6A38: 'pǔ,pú',
+    0x6A39: 'shù',
+    0x6A3A: 'huà',
+    0x6A3B: 'kuì',
+    0x6A3C: 'zhēn',
+    0x6A3D: 'zūn',
+    0x6A3E: 'yuè',
+    0x6A3F: 'shàn',
+    0x6A40: 'xī',
+    0x6A41: 'chūn',
+    0x6A42: 'diàn',
+    0x6A43: 'fá,fèi',
+    0x6A44: 'gǎn',
+    0x6A45: 'mó',
+    0x6A46: 'wǔ,wú',
+    0x6A47: 'qiāo',
+    0x6A48: 'ráo,náo',
+    0x6A49: 'lìn',
+    0x6A4A: 'liú',
+    0x6A4B: 'qiáo,jiāo,jiào,qiāo,jiǎo',
+    0x6A4C: 'xiàn',
+    0x6A4D: 'rùn',
+    0x6A4E: 'fán',
+    0x6A4F: 'zhǎn,jiǎn',
+    0x6A50: 'tuó,dù,luò',
+    0x6A51: 'lǎo,liáo',
+    0x6A52: 'yún',
+    0x6A53: 'shùn',
+    0x6A54: 'dūn,tuí',
+    0x6A55: 'chēng',
+    0x6A56: 'táng,chēng',
+    0x6A57: 'méng',
+    0x6A58: 'jú',
+    0x6A59: 'chéng,dèng,chén',
+    0x6A5A: 'sù,xiāo,qiū',
+    0x6A5B: 'jué',
+    0x6A5C: 'jué',
+    0x6A5D: 'diàn,tán,xín',
+    0x6A5E: 'huì',
+    0x6A5F: 'jī',
+    0x6A60: 'nuǒ,nuó',
+    0x6A61: 'xiàng',
+    0x6A62: 'tuǒ,duǒ',
+    0x6A63: 'nǐng',
+    0x6A64: 'ruǐ',
+    0x6A65: 'zhū',
+    0x6A66: 'tóng,chuáng,zhōng,chōng',
+    0x6A67: 'zēng,céng',
+    0x6A68: 'fén,fèn,fèi',
+    0x6A69: 'qióng',
+    0x6A6A: 'rǎn,yān',
+    0x6A6B: 'héng',
+    0x6A6C: 'qián,qín',
+    0x6A6D: 'gū',
+    0x6A6E: 'liǔ',
+    0x6A6F: 'lào',
+    0x6A70: 'gāo',
+    0x6A71: 'chú',
+    0x6A72: 'xǐ',
+    0x6A73: 'shèng',
+    0x6A74: 'zǐ',
+    0x6A75: 'san',
+    0x6A76: 'jí',
+    0x6A77: 'dōu',
+    0x6A78: 'jīng',
+    0x6A79: 'lǔ',
+    0x6A7A: 'jian',
+    0x6A7B: 'chu',
+    0x6A7C: 'yuán',
+    0x6A7D: 'tà',
+    0x6A7E: 'shū,qiāo,sāo',
+    0x6A7F: 'jiāng',
+    0x6A80: 'tán,shàn',
+    0x6A81: 'lǐn',
+    0x6A82: 'nóng',
+    0x6A83: 'yǐn',
+    0x6A84: 'xí',
+    0x6A85: 'huì',
+    0x6A86: 'shān',
+    0x6A87: 'zuì',
+    0x6A88: 'xuán',
+    0x6A89: 'chēng',
+    0x6A8A: 'gàn',
+    0x6A8B: 'jú',
+    0x6A8C: 'zuì',
+    0x6A8D: 'yì',
+    0x6A8E: 'qín',
+    0x6A8F: 'pǔ',
+    0x6A90: 'yán,dān',
+    0x6A91: 'léi,lèi',
+    0x6A92: 'fēng',
+    0x6A93: 'huǐ',
+    0x6A94: 'dàng,dāng',
+    0x6A95: 'jì',
+    0x6A96: 'suì',
+    0x6A97: 'bò,bì',
+    0x6A98: 'píng,bò',
+    0x6A99: 'chéng',
+    0x6A9A: 'chǔ',
+    0x6A9B: 'zhuā',
+    0x6A9C: 'guì,kuài,huì',
+    0x6A9D: 'jí',
+    0x6A9E: 'jiě,xiè',
+    0x6A9F: 'jiǎ',
+    0x6AA0: 'qíng,jìng',
+    0x6AA1: 'zhái,shì,tú',
+    0x6AA2: 'jiǎn',
+    0x6AA3: 'qiáng',
+    0x6AA4: 'dào',
+    0x6AA5: 'yǐ',
+    0x6AA6: 'biǎo',
+    0x6AA7: 'sōng',
+    0x6AA8: 'shē',
+    0x6AA9: 'lǐn',
+    0x6AAA: 'lì',
+    0x6AAB: 'chá,sà',
+    0x6AAC: 'méng',
+    0x6AAD: 'yín',
+    0x6AAE: 'táo,chóu,dào',
+    0x6AAF: 'tái',
+    0x6AB0: 'mián',
+    0x6AB1: 'qí',
+    0x6AB2: 'tuán',
+    0x6AB3: 'bīn,bīng',
+    0x6AB4: 'huò,huà',
+    0x6AB5: 'jì',
+    0x6AB6: 'qiān',
+    0x6AB7: 'nǐ,mí',
+    0x6AB8: 'níng',
+    0x6AB9: 'yī',
+    0x6ABA: 'gǎo',
+    0x6ABB: 'kǎn,jiàn',
+    0x6ABC: 'yìn',
+    0x6ABD: 'nòu,ruǎn,rú',
+    0x6ABE: 'qǐng',
+    0x6ABF: 'yǎn',
+    0x6AC0: 'qí',
+    0x6AC1: 'mì',
+    0x6AC2: 'zhào,dí',
+    0x6AC3: 'guì',
+    0x6AC4: 'chūn',
+    0x6AC5: 'jī,jì',
+    0x6AC6: 'kuí',
+    0x6AC7: 'pó',
+    0x6AC8: 'dèng',
+    0x6AC9: 'chú',
+    0x6ACA: 'gé',
+    0x6ACB: 'mián',
+    0x6ACC: 'yōu',
+    0x6ACD: 'zhì',
+    0x6ACE: 'huǎng,guàng,guǒ,gǔ',
+    0x6ACF: 'qiān',
+    0x6AD0: 'lěi',
+    0x6AD1: 'léi,lěi',
+    0x6AD2: 'sà',
+    0x6AD3: 'lǔ',
+    0x6AD4: 'lì',
+    0x6AD5: 'cuán',
+    0x6AD6: 'lǜ,chū',
+    0x6AD7: 'miè,mèi',
+    0x6AD8: 'huì',
+    0x6AD9: 'ōu',
+    0x6ADA: 'lǘ',
+    0x6ADB: 'zhì',
+    0x6ADC: 'gāo',
+    0x6ADD: 'dú',
+    0x6ADE: 'yuán',
+    0x6ADF: 'lì,luò,yuè',
+    0x6AE0: 'fèi',
+    0x6AE1: 'zhuó,zhù',
+    0x6AE2: 'sǒu',
+    0x6AE3: 'lián',
+    0x6AE4: 'jiàng',
+    0x6AE5: 'chú',
+    0x6AE6: 'qìng',
+    0x6AE7: 'zhū',
+    0x6AE8: 'lú,lǘ',
+    0x6AE9: 'yán,yǎn',
+    0x6AEA: 'lì',
+    0x6AEB: 'zhū',
+    0x6AEC: 'chèn,qìn,guàn',
+    0x6AED: 'jié,jì',
+    0x6AEE: 'è',
+    0x6AEF: 'sū',
+    0x6AF0: 'huái,guī',
+    0x6AF1: 'niè',
+    0x6AF2: 'yù',
+    0x6AF3: 'lóng',
+    0x6AF4: 'lài',
+    0x6AF5: 'jiao',
+    0x6AF6: 'xiǎn',
+    0x6AF7: 'guī',
+    0x6AF8: 'jǔ',
+    0x6AF9: 'xiāo,qiū,xiū',
+    0x6AFA: 'líng',
+    0x6AFB: 'yīng',
+    0x6AFC: 'jiān,shān',
+    0x6AFD: 'yǐn',
+    0x6AFE: 'yóu,yòu',
+    0x6AFF: 'yíng',
+    0x6B00: 'xiāng,ràng',
+    0x6B01: 'nóng',
+    0x6B02: 'bó',
+    0x6B03: 'chán,zhàn',
+    0x6B04: 'lán,liàn',
+    0x6B05: 'jǔ',
+    0x6B06: 'shuāng',
+    0x6B07: 'shè',
+    0x6B08: 'wéi,zuì',
+    0x6B09: 'cóng',
+    0x6B0A: 'quán,guàn',
+    0x6B0B: 'qú',
+    0x6B0C: 'cáng',
+    0x6B0D: 'jiù',
+    0x6B0E: 'yù',
+    0x6B0F: 'luó,luǒ',
+    0x6B10: 'lì,lǐ',
+    0x6B11: 'cuán,zuàn',
+    0x6B12: 'luán',
+    0x6B13: 'dǎng,tǎng',
+    0x6B14: 'jué',
+    0x6B15: 'yán',
+    0x6B16: 'lǎn',
+    0x6B17: 'lán',
+    0x6B18: 'zhú',
+    0x6B19: 'léi,luǒ',
+    0x6B1A: 'lǐ',
+    0x6B1B: 'bà',
+    0x6B1C: 'náng',
+    0x6B1D: 'yù',
+    0x6B1E: 'líng',
+    0x6B1F: 'guang',
+    0x6B20: 'qiàn',
+    0x6B21: 'cì,zī,cí',
+    0x6B22: 'huān',
+    0x6B23: 'xīn',
+    0x6B24: 'yú',
+    0x6B25: 'yì,huān,yù',
+    0x6B26: 'qiān,hān,xiān,qián',
+    0x6B27: 'ōu',
+    0x6B28: 'xū',
+    0x6B29: 'chāo',
+    0x6B2A: 'chù,xì,qù',
+    0x6B2B: 'qì',
+    0x6B2C: 'kài,ài',
+    0x6B2D: 'yì,yīn',
+    0x6B2E: 'jué',
+    0x6B2F: 'xì,kài',
+    0x6B30: 'xù',
+    0x6B31: 'hē,xiá',
+    0x6B32: 'yù',
+    0x6B33: 'kuì',
+    0x6B34: 'láng',
+    0x6B35: 'kuǎn',
+    0x6B36: 'shuò,sòu',
+    0x6B37: 'xī',
+    0x6B38: 'āi,ǎi,ê̄,ế,ê̌,ề,xiè,éi,ěi,èi,ēi',
+    0x6B39: 'yī,qī',
+    0x6B3A: 'qī',
+    0x6B3B: 'chuā,xū',
+    0x6B3C: 'chǐ,chuài',
+    0x6B3D: 'qīn,qìn,yín',
+    0x6B3E: 'kuǎn,xīn',
+    0x6B3F: 'kǎn,qiàn,dàn',
+    0x6B40: 'kuǎn',
+    0x6B41: 'kǎn,kè,qiǎn',
+    0x6B42: 'chuǎn,chuán',
+    0x6B43: 'shà,xiá',
+    0x6B44: 'guā',
+    0x6B45: 'yīn',
+    0x6B46: 'xīn',
+    0x6B47: 'xiē,yà',
+    0x6B48: 'yú',
+    0x6B49: 'qiàn',
+    0x6B4A: 'xiāo',
+    0x6B4B: 'yè',
+    0x6B4C: 'gē',
+    0x6B4D: 'wū,yāng',
+    0x6B4E: 'tàn',
+    0x6B4F: 'jìn,qūn',
+    0x6B50: 'ōu,ǒu',
+    0x6B51: 'hū',
+    0x6B52: 'tì,xiāo',
+    0x6B53: 'huān',
+    0x6B54: 'xū',
+    0x6B55: 'pēn',
+    0x6B56: 'xǐ,yǐ',
+    0x6B57: 'xiào',
+    0x6B58: 'chuā,xū',
+    0x6B59: 'shè,xī,xié',
+    0x6B5A: 'shàn',
+    0x6B5B: 'hān,liǎn',
+    0x6B5C: 'chù',
+    0x6B5D: 'yì',
+    0x6B5E: 'è',
+    0x6B5F: 'yú',
+    0x6B60: 'chuò',
+    0x6B61: 'huān',
+    0x6B62: 'zhǐ',
+    0x6B63: 'zhèng,zhēng',
+    0x6B64: 'cǐ',
+    0x6B65: 'bù',
+    0x6B66: 'wǔ',
+    0x6B67: 'qí',
+    0x6B68: 'bù',
+    0x6B69: 'bù',
+    0x6B6A: 'wāi,wǎi',
+    0x6B6B: 'jù',
+    0x6B6C: 'qián',
+    0x6B6D: 'chí,zhì',
+    0x6B6E: 'sè',
+    0x6B6F: 'chǐ',
+    0x6B70: 'sè,shà',
+    0x6B71: 'zhǒng',
+    0x6B72: 'suì,suò',
+    0x6B73: 'suì',
+    0x6B74: 'lì',
+    0x6B75: 'zé',
+    0x6B76: 'yú',
+    0x6B77: 'lì',
+    0x6B78: 'guī,kuì,kuí',
+    0x6B79: 'dǎi,è,dāi',
+    0x6B7A: 'è',
+    0x6B7B: 'sǐ',
+    0x6B7C: 'jiān',
+    0x6B7D: 'zhé',
+    0x6B7E: 'mò,wěn',
+    0x6B7F: 'mò',
+    0x6B80: 'yāo',
+    0x6B81: 'mò,wěn',
+    0x6B82: 'cú',
+    0x6B83: 'yāng',
+    0x6B84: 'tiǎn',
+    0x6B85: 'shēng',
+    0x6B86: 'dài',
+    0x6B87: 'shāng',
+    0x6B88: 'xù',
+    0x6B89: 'xùn',
+    0x6B8A: 'shū',
+    0x6B8B: 'cán',
+    0x6B8C: 'jué',
+    0x6B8D: 'piǎo,bì',
+    0x6B8E: 'qià',
+    0x6B8F: 'qiú',
+    0x6B90: 'sù',
+    0x6B91: 'qíng,jīng,jìng',
+    0x6B92: 'yǔn',
+    0x6B93: 'liàn',
+    0x6B94: 'yì',
+    0x6B95: 'fǒu,yè,bó',
+    0x6B96: 'zhí,shi,shì',
+    0x6B97: 'yè,yàn,yān',
+    0x6B98: 'cán',
+    0x6B99: 'hūn,mèn',
+    0x6B9A: 'dān',
+    0x6B9B: 'jí',
+    0x6B9C: 'dié',
+    0x6B9D: 'zhēn',
+    0x6B9E: 'yǔn',
+    0x6B9F: 'wēn',
+    0x6BA0: 'chòu',
+    0x6BA1: 'bìn',
+    0x6BA2: 'tì',
+    0x6BA3: 'jìn',
+    0x6BA4: 'shāng',
+    0x6BA5: 'yín',
+    0x6BA6: 'diāo',
+    0x6BA7: 'jiù',
+    0x6BA8: 'huì,kuì',
+    0x6BA9: 'cuàn',
+    0x6BAA: 'yì',
+    0x6BAB: 'dān',
+    0x6BAC: 'dù',
+    0x6BAD: 'jiāng',
+    0x6BAE: 'liàn',
+    0x6BAF: 'bìn',
+    0x6BB0: 'dú',
+    0x6BB1: 'jiān',
+    0x6BB2: 'jiān',
+    0x6BB3: 'shū',
+    0x6BB4: 'ōu',
+    0x6BB5: 'duàn',
+    0x6BB6: 'zhù',
+    0x6BB7: 'yīn,yān,yǐn',
+    0x6BB8: 'qìng,kēng,shēng',
+    0x6BB9: 'yì',
+    0x6BBA: 'shā,shài,sà,xiè,shì',
+    0x6BBB: 'qiào',
+    0x6BBC: 'ké,qiào',
+    0x6BBD: 'xiáo,yáo,xiào',
+    0x6BBE: 'xùn',
+    0x6BBF: 'diàn',
+    0x6BC0: 'huǐ',
+    0x6BC1: 'huǐ,huì',
+    0x6BC2: 'gǔ,gū',
+    0x6BC3: 'qiāo',
+    0x6BC4: 'jī',
+    0x6BC5: 'yì',
+    0x6BC6: 'ōu,kōu,qū',
+    0x6BC7: 'huǐ',
+    0x6BC8: 'duàn',
+    0x6BC9: 'yī',
+    0x6BCA: 'xiāo',
+    0x6BCB: 'wú,móu',
+    0x6BCC: 'guàn',
+    0x6BCD: 'mǔ,mú,wǔ,wú',
+    0x6BCE: 'měi',
+    0x6BCF: 'měi',
+    0x6BD0: 'ǎi',
+    0x6BD1: 'jiě',
+    0x6BD2: 'dú,dài',
+    0x6BD3: 'yù',
+    0x6BD4: 'bǐ,bì,pí,pǐ',
+    0x6BD5: 'bì',
+    0x6BD6: 'bì',
+    0x6BD7: 'pí',
+    0x6BD8: 'pí',
+    0x6BD9: 'bì',
+    0x6BDA: 'chán',
+    0x6BDB: 'máo,mào',
+    0x6BDC: 'háo',
+    0x6BDD: 'cǎi',
+    0x6BDE: 'pí',
+    0x6BDF: 'liě',
+    0x6BE0: 'jiā',
+    0x6BE1: 'zhān',
+    0x6BE2: 'sāi',
+    0x6BE3: 'mù,mào',
+    0x6BE4: 'tuò',
+    0x6BE5: 'xún,xùn',
+    0x6BE6: 'ěr',
+    0x6BE7: 'róng',
+    0x6BE8: 'xiǎn',
+    0x6BE9: 'jú',
+    0x6BEA: 'mú',
+    0x6BEB: 'háo',
+    0x6BEC: 'qiú',
+    0x6BED: 'dòu,nuò',
+    0x6BEE: 'shā',
+    0x6BEF: 'tǎn',
+    0x6BF0: 'péi',
+    0x6BF1: 'jú',
+    0x6BF2: 'duō',
+    0x6BF3: 'cuì,qiāo,xiā',
+    0x6BF4: 'bī',
+    0x6BF5: 'sān',
+    0x6BF6: 'sān',
+    0x6BF7: 'mào',
+    0x6BF8: 'sāi,suī',
+    0x6BF9: 'shū,yú',
+    0x6BFA: 'shū',
+    0x6BFB: 'tuò',
+    0x6BFC: 'hé,kě,dā',
+    0x6BFD: 'jiàn',
+    0x6BFE: 'tà',
+    0x6BFF: 'sān',
+    0x6C00: 'lǘ,shū,yú,dōu',
+    0x6C01: 'mú',
+    0x6C02: 'máo,lí',
+    0x6C03: 'tóng',
+    0x6C04: 'rǒng,róng',
+    0x6C05: 'chǎng',
+    0x6C06: 'pǔ',
+    0x6C07: 'lu',
+    0x6C08: 'zhān',
+    0x6C09: 'sào',
+    0x6C0A: 'zhān',
+    0x6C0B: 'méng',
+    0x6C0C: 'lǔ',
+    0x6C0D: 'qú',
+    0x6C0E: 'dié',
+    0x6C0F: 'shì,zhī,jīng',
+    0x6C10: 'dī,dǐ,zhī',
+    0x6C11: 'mín',
+    0x6C12: 'jué',
+    0x6C13: 'máng,méng',
+    0x6C14: 'qì,qǐ',
+    0x6C15: 'piē',
+    0x6C16: 'nǎi',
+    0x6C17: 'qì',
+    0x6C18: 'dāo',
+    0x6C19: 'xiān',
+    0x6C1A: 'chuān',
+    0x6C1B: 'fēn',
+    0x6C1C: 'yáng,rì',
+    0x6C1D: 'nèi',
+    0x6C1E: 'bin',
+    0x6C1F: 'fú',
+    0x6C20: 'shēn',
+    0x6C21: 'dōng',
+    0x6C22: 'qīng',
+    0x6C23: 'qì,xì',
+    0x6C24: 'yīn,yán',
+    0x6C25: 'xī',
+    0x6C26: 'hài',
+    0x6C27: 'yǎng',
+    0x6C28: 'ān',
+    0x6C29: 'yà',
+    0x6C2A: 'kè',
+    0x6C2B: 'qīng',
+    0x6C2C: 'yà',
+    0x6C2D: 'dōng',
+    0x6C2E: 'dàn',
+    0x6C2F: 'lǜ',
+    0x6C30: 'qíng',
+    0x6C31: 'yǎng',
+    0x6C32: 'yūn,yún',
+    0x6C33: 'yūn',
+    0x6C34: 'shuǐ',
+    0x6C35: 'shui',
+    0x6C36: 'zhěng,chéng,zhèng',
+    0x6C37: 'bīng',
+    0x6C38: 'yǒng',
+    0x6C39: 'dàng',
+    0x6C3A: 'shuǐ',
+    0x6C3B: 'lè',
+    0x6C3C: 'nì,mèi',
+    0x6C3D: 'tǔn,qiú',
+    0x6C3E: 'fàn,fán',
+    0x6C3F: 'guǐ,jiǔ,qiú',
+    0x6C40: 'tīng,tìng,dìng',
+    0x6C41: 'zhī,xié,shí',
+    0x6C42: 'qiú',
+    0x6C43: 'bīn,pà,pā',
+    0x6C44: 'zè',
+    0x6C45: 'miǎn',
+    0x6C46: 'cuān',
+    0x6C47: 'huì',
+    0x6C48: 'diāo',
+    0x6C49: 'hàn',
+    0x6C4A: 'chà',
+    0x6C4B: 'zhuó,yuè,què,shuò',
+    0x6C4C: 'chuàn',
+    0x6C4D: 'wán,huán',
+    0x6C4E: 'fàn,fá',
+    0x6C4F: 'dà,tài',
+    0x6C50: 'xī',
+    0x6C51: 'tuō',
+    0x6C52: 'máng,mǎng',
+    0x6C53: 'qiú,yóu',
+    0x6C54: 'qì',
+    0x6C55: 'shàn,shuàn',
+    0x6C56: 'pìn,chí',
+    0x6C57: 'hàn,hán,gān',
+    0x6C58: 'qiān',
+    0x6C59: 'wū,yú,wā,yū',
+    0x6C5A: 'wū',
+    0x6C5B: 'xùn',
+    0x6C5C: 'sì',
+    0x6C5D: 'rǔ',
+    0x6C5E: 'gǒng',
+    0x6C5F: 'jiāng',
+    0x6C60: 'chí,tuó,chè',
+    0x6C61: 'wū',
+    0x6C62: 'tu',
+    0x6C63: 'jiǔ',
+    0x6C64: 'tāng,shāng',
+    0x6C65: 'zhī,jì',
+    0x6C66: 'zhǐ',
+    0x6C67: 'qiān,yán',
+    0x6C68: 'mì',
+    0x6C69: 'gǔ,yù,hú',
+    0x6C6A: 'wāng,wǎng,hóng',
+    0x6C6B: 'jǐng',
+    0x6C6C: 'jǐng',
+    0x6C6D: 'ruì,tūn',
+    0x6C6E: 'jūn',
+    0x6C6F: 'hóng',
+    0x6C70: 'tài',
+    0x6C71: 'quǎn,fú',
+    0x6C72: 'jí,jī',
+    0x6C73: 'biàn',
+    0x6C74: 'biàn',
+    0x6C75: 'gàn,hán,cén',
+    0x6C76: 'wèn,wén,mín,mén',
+    0x6C77: 'zhōng',
+    0x6C78: 'fāng,pāng',
+    0x6C79: 'xiōng',
+    0x6C7A: 'jué,quē,xuè',
+    0x6C7B: 'hǔ,huǎng',
+    0x6C7C: 'niú,yóu',
+    0x6C7D: 'qì,gài,yǐ',
+    0x6C7E: 'fén,pén,fēn',
+    0x6C7F: 'xù',
+    0x6C80: 'xù',
+    0x6C81: 'qìn',
+    0x6C82: 'yí,yín',
+    0x6C83: 'wò',
+    0x6C84: 'yún',
+    0x6C85: 'yuán',
+    0x6C86: 'hàng,háng,kàng',
+    0x6C87: 'yǎn,wěi',
+    0x6C88: 'shěn,chén,tán',
+    0x6C89: 'chén',
+    0x6C8A: 'dàn',
+    0x6C8B: 'yóu',
+    0x6C8C: 'dùn,zhuàn,tún,chún',
+    0x6C8D: 'hù,hú',
+    0x6C8E: 'huò',
+    0x6C8F: 'qī,qiè',
+    0x6C90: 'mù',
+    0x6C91: 'nǜ,niǔ',
+    0x6C92: 'méi',
+    0x6C93: 'dá,tà',
+    0x6C94: 'miǎn',
+    0x6C95: 'mì,wù,fū',
+    0x6C96: 'chōng',
+    0x6C97: 'pāng,tiān',
+    0x6C98: 'bǐ',
+    0x6C99: 'shā,shà,suō',
+    0x6C9A: 'zhǐ',
+    0x6C9B: 'pèi',
+    0x6C9C: 'pàn',
+    0x6C9D: 'zhuǐ,zǐ',
+    0x6C9E: 'zā',
+    0x6C9F: 'gōu',
+    0x6CA0: 'liú',
+    0x6CA1: 'méi,mò,me',
+    0x6CA2: 'zé',
+    0x6CA3: 'fēng',
+    0x6CA4: 'ōu,òu',
+    0x6CA5: 'lì',
+    0x6CA6: 'lún',
+    0x6CA7: 'cāng',
+    0x6CA8: 'fēng',
+    0x6CA9: 'wéi',
+    0x6CAA: 'hù',
+    0x6CAB: 'mò',
+    0x6CAC: 'mèi,huì',
+    0x6CAD: 'shù',
+    0x6CAE: 'jǔ,jū,jù,jiān,zǔ',
+    0x6CAF: 'zá',
+    0x6CB0: 'tuō,duó',
+    0x6CB1: 'tuó,duò,chí',
+    0x6CB2: 'tuó',
+    0x6CB3: 'hé',
+    0x6CB4: 'lì,zhěn',
+    0x6CB5: 'mǐ',
+    0x6CB6: 'yí,chí,shì',
+    0x6CB7: 'fā',
+    0x6CB8: 'fèi,fú',
+    0x6CB9: 'yóu,yòu',
+    0x6CBA: 'tián',
+    0x6CBB: 'zhì,chí',
+    0x6CBC: 'zhǎo',
+    0x6CBD: 'gū,gǔ',
+    0x6CBE: 'zhān,tiān,diàn,chān',
+    0x6CBF: 'yán,yǎn,yàn',
+    0x6CC0: 'sī',
+    0x6CC1: 'kuàng',
+    0x6CC2: 'jiǒng,yíng,yǐng,jiōng',
+    0x6CC3: 'jū,gōu',
+    0x6CC4: 'xiè,yì',
+    0x6CC5: 'qiú,yōu',
+    0x6CC6: 'yì,dié',
+    0x6CC7: 'jiā',
+    0x6CC8: 'zhōng',
+    0x6CC9: 'quán',
+    0x6CCA: 'pō,bó,pò',
+    0x6CCB: 'huì,huǐ',
+    0x6CCC: 'mì,bì',
+    0x6CCD: 'bēn,bèn',
+    0x6CCE: 'zé',
+    0x6CCF: 'zhú,kū',
+    0x6CD0: 'lè',
+    0x6CD1: 'yōu,āo',
+    0x6CD2: 'gū',
+    0x6CD3: 'hóng',
+    0x6CD4: 'gān,hàn',
+    0x6CD5: 'fǎ',
+    0x6CD6: 'mǎo,liǔ',
+    0x6CD7: 'sì',
+    0x6CD8: 'hū',
+    0x6CD9: 'píng,pēng',
+    0x6CDA: 'cǐ,zǐ',
+    0x6CDB: 'fàn,fěng,fá',
+    0x6CDC: 'zhī,chí,zhì',
+    0x6CDD: 'sù',
+    0x6CDE: 'nìng,zhù',
+    0x6CDF: 'chēng',
+    0x6CE0: 'líng,lǐng',
+    0x6CE1: 'pào,pāo,páo',
+    0x6CE2: 'bō,bēi,bì',
+    0x6CE3: 'qì,lì,sè',
+    0x6CE4: 'sì',
+    0x6CE5: 'ní,nì,nǐ,niè,nìng',
+    0x6CE6: 'jú',
+    0x6CE7: 'sà,xuè',
+    0x6CE8: 'zhù,zhòu',
+    0x6CE9: 'shēng',
+    0x6CEA: 'lèi',
+    0x6CEB: 'xuàn,xuán,juān',
+    0x6CEC: 'jué,xuè',
+    0x6CED: 'fú',
+    0x6CEE: 'pàn',
+    0x6CEF: 'mǐn,miàn',
+    0x6CF0: 'tài',
+    0x6CF1: 'yāng',
+    0x6CF2: 'jǐ',
+    0x6CF3: 'yǒng',
+    0x6CF4: 'guàn',
+    0x6CF5: 'bèng,pìn,liú',
+    0x6CF6: 'xué',
+    0x6CF7: 'lóng,shuāng',
+    0x6CF8: 'lú',
+    0x6CF9: 'dàn',
+    0x6CFA: 'luò,pō',
+    0x6CFB: 'xiè',
+    0x6CFC: 'pō',
+    0x6CFD: 'zé',
+    0x6CFE: 'jīng',
+    0x6CFF: 'yín',
+    0x6D00: 'pán,zhōu',
+    0x6D01: 'jié,jí',
+    0x6D02: 'yè',
+    0x6D03: 'huī',
+    0x6D04: 'huí,huì',
+    0x6D05: 'zài',
+    0x6D06: 'chéng',
+    0x6D07: 'yīn,yān,yē',
+    0x6D08: 'wéi',
+    0x6D09: 'hòu',
+    0x6D0A: 'jiàn,cún',
+    0x6D0B: 'yáng,xiáng,yǎng',
+    0x6D0C: 'liè',
+    0x6D0D: 'sì',
+    0x6D0E: 'jì',
+    0x6D0F: 'ér',
+    0x6D10: 'xíng',
+    0x6D11: 'fú,fù',
+    0x6D12: 'sǎ,xǐ,xiǎn,sěn,cuǐ,xùn',
+    0x6D13: 'sè,qì,zì',
+    0x6D14: 'zhǐ',
+    0x6D15: 'yìn',
+    0x6D16: 'wú',
+    0x6D17: 'xǐ,xiǎn',
+    0x6D18: 'kǎo,kào',
+    0x6D19: 'zhū',
+    0x6D1A: 'jiàng,hóng',
+    0x6D1B: 'luò',
+    0x6D1C: 'luò',
+    0x6D1D: 'àn,yàn,è',
+    0x6D1E: 'dòng,tóng',
+    0x6D1F: 'tì',
+    0x6D20: 'móu',
+    0x6D21: 'lèi,lěi',
+    0x6D22: 'yī',
+    0x6D23: 'mǐ',
+    0x6D24: 'quán',
+    0x6D25: 'jīn',
+    0x6D26: 'pò',
+    0x6D27: 'wěi',
+    0x6D28: 'xiáo',
+    0x6D29: 'xiè,yì',
+    0x6D2A: 'hóng',
+    0x6D2B: 'xù,yì',
+    0x6D2C: 'sù,shuò',
+    0x6D2D: 'kuāng',
+    0x6D2E: 'táo,yáo,dào',
+    0x6D2F: 'qiè,jié',
+    0x6D30: 'jù',
+    0x6D31: 'ěr',
+    0x6D32: 'zhōu',
+    0x6D33: 'rù,rú',
+    0x6D34: 'píng,pēng',
+    0x6D35: 'xún,xuàn',
+    0x6D36: 'xiōng',
+    0x6D37: 'zhì',
+    0x6D38: 'guāng,huàng',
+    0x6D39: 'huán',
+    0x6D3A: 'míng',
+    0x6D3B: 'huó,guō',
+    0x6D3C: 'wā,guī',
+    0x6D3D: 'qià,hé',
+    0x6D3E: 'pài,mài,bài,pā',
+    0x6D3F: 'wū,hù',
+    0x6D40: 'qū',
+    0x6D41: 'liú',
+    0x6D42: 'yì',
+    0x6D43: 'jiā',
+    0x6D44: 'jìng',
+    0x6D45: 'qiǎn,jiān',
+    0x6D46: 'jiāng,jiàng',
+    0x6D47: 'jiāo',
+    0x6D48: 'zhēn',
+    0x6D49: 'shī',
+    0x6D4A: 'zhuó',
+    0x6D4B: 'cè',
+    0x6D4C: 'fá',
+    0x6D4D: 'huì,kuài',
+    0x6D4E: 'jì,jǐ',
+    0x6D4F: 'liú',
+    0x6D50: 'chǎn',
+    0x6D51: 'hún',
+    0x6D52: 'hǔ,xǔ',
+    0x6D53: 'nóng',
+    0x6D54: 'xún',
+    0x6D55: 'jìn',
+    0x6D56: 'liè',
+    0x6D57: 'qiú',
+    0x6D58: 'wěi',
+    0x6D59: 'zhè',
+    0x6D5A: 'jùn,xùn,cún',
+    0x6D5B: 'hán,hàn,gān',
+    0x6D5C: 'bāng,bīn',
+    0x6D5D: 'máng',
+    0x6D5E: 'zhuó',
+    0x6D5F: 'yóu,dí',
+    0x6D60: 'xī',
+    0x6D61: 'bó',
+    0x6D62: 'dòu',
+    0x6D63: 'huàn',
+    0x6D64: 'hóng',
+    0x6D65: 'yì,yà',
+    0x6D66: 'pǔ',
+    0x6D67: 'yǐng,chéng,yíng,zhèng,yìng',
+    0x6D68: 'lǎn',
+    0x6D69: 'hào,gǎo,gé',
+    0x6D6A: 'làng,láng',
+    0x6D6B: 'hǎn',
+    0x6D6C: 'lǐ,hǎi',
+    0x6D6D: 'gēng',
+    0x6D6E: 'fú',
+    0x6D6F: 'wú',
+    0x6D70: 'liàn,lì',
+    0x6D71: 'chún',
+    0x6D72: 'féng,hóng',
+    0x6D73: 'yì',
+    0x6D74: 'yù',
+    0x6D75: 'tóng',
+    0x6D76: 'láo',
+    0x6D77: 'hǎi',
+    0x6D78: 'jìn,qīn',
+    0x6D79: 'jiā,xiá',
+    0x6D7A: 'chōng',
+    0x6D7B: 'jiǒng,jiōng',
+    0x6D7C: 'měi',
+    0x6D7D: 'suī,něi',
+    0x6D7E: 'chēng',
+    0x6D7F: 'pèi',
+    0x6D80: 'xiàn,jiǎn',
+    0x6D81: 'shèn',
+    0x6D82: 'tú,chú,yé',
+    0x6D83: 'kùn',
+    0x6D84: 'pīng',
+    0x6D85: 'niè',
+    0x6D86: 'hàn',
+    0x6D87: 'jīng,qǐng',
+    0x6D88: 'xiāo',
+    0x6D89: 'shè,dié',
+    0x6D8A: 'niǎn,rěn',
+    0x6D8B: 'tū',
+    0x6D8C: 'yǒng,chōng',
+    0x6D8D: 'xiào',
+    0x6D8E: 'xián,yàn,diàn',
+    0x6D8F: 'tǐng',
+    0x6D90: 'é',
+    0x6D91: 'sù,sōu,shù',
+    0x6D92: 'tūn,yūn',
+    0x6D93: 'juān,yuàn,xuàn',
+    0x6D94: 'cén,qián,zàn',
+    0x6D95: 'tì',
+    0x6D96: 'lì',
+    0x6D97: 'shuì',
+    0x6D98: 'sì',
+    0x6D99: 'lèi',
+    0x6D9A: 'shuì',
+    0x6D9B: 'tāo',
+    0x6D9C: 'dú',
+    0x6D9D: 'lào',
+    0x6D9E: 'lái',
+    0x6D9F: 'lián',
+    0x6DA0: 'wéi',
+    0x6DA1: 'wō,guō',
+    0x6DA2: 'yún',
+    0x6DA3: 'huàn,huì',
+    0x6DA4: 'dí',
+    0x6DA5: 'hēng',
+    0x6DA6: 'rùn',
+    0x6DA7: 'jiàn',
+    0x6DA8: 'zhǎng,zhàng',
+    0x6DA9: 'sè',
+    0x6DAA: 'fú,póu',
+    0x6DAB: 'guàn',
+    0x6DAC: 'xìng',
+    0x6DAD: 'shòu,tāo',
+    0x6DAE: 'shuàn,shuā',
+    0x6DAF: 'yá',
+    0x6DB0: 'chuò',
+    0x6DB1: 'zhàng',
+    0x6DB2: 'yè,shì',
+    0x6DB3: 'kōng,náng',
+    0x6DB4: 'wò,yuān,wǎn',
+    0x6DB5: 'hán,hàn',
+    0x6DB6: 'tuō,tuò',
+    0x6DB7: 'dōng',
+    0x6DB8: 'hé',
+    0x6DB9: 'wō',
+    0x6DBA: 'jū',
+    0x6DBB: 'shè',
+    0x6DBC: 'liáng,liàng',
+    0x6DBD: 'hūn,hùn',
+    0x6DBE: 'tà',
+    0x6DBF: 'zhuō,zhuó',
+    0x6DC0: 'diàn',
+    0x6DC1: 'qiè,jí',
+    0x6DC2: 'dé',
+    0x6DC3: 'juàn',
+    0x6DC4: 'zī',
+    0x6DC5: 'xī',
+    0x6DC6: 'xiáo',
+    0x6DC7: 'qí',
+    0x6DC8: 'gǔ,hù',
+    0x6DC9: 'guǒ,guàn',
+    0x6DCA: 'yān,hàn,yǎn,hán',
+    0x6DCB: 'lín,lìn',
+    0x6DCC: 'tǎng,chàng,chǎng',
+    0x6DCD: 'zhōu,diāo',
+    0x6DCE: 'pěng',
+    0x6DCF: 'hào',
+    0x6DD0: 'chāng',
+    0x6DD1: 'shū,chù',
+    0x6DD2: 'qī,qiàn',
+    0x6DD3: 'fāng',
+    0x6DD4: 'zhí',
+    0x6DD5: 'lù',
+    0x6DD6: 'nào,zhào,zhuō,chuò',
+    0x6DD7: 'jú',
+    0x6DD8: 'táo',
+    0x6DD9: 'cóng,shuàng',
+    0x6DDA: 'lèi,lì',
+    0x6DDB: 'zhè',
+    0x6DDC: 'píng,péng',
+    0x6DDD: 'féi',
+    0x6DDE: 'sōng',
+    0x6DDF: 'tiǎn',
+    0x6DE0: 'pì,pèi',
+    0x6DE1: 'dàn,yàn,tán',
+    0x6DE2: 'yù,xù',
+    0x6DE3: 'ní',
+    0x6DE4: 'yū',
+    0x6DE5: 'lù',
+    0x6DE6: 'gàn,hán',
+    0x6DE7: 'mì',
+    0x6DE8: 'jìng,chéng',
+    0x6DE9: 'líng',
+    0x6DEA: 'lún,lǔn,guān',
+    0x6DEB: 'yín,yàn,yáo',
+    0x6DEC: 'cuì,zú',
+    0x6DED: 'qú',
+    0x6DEE: 'huái',
+    0x6DEF: 'yù',
+    0x6DF0: 'niǎn,shěn,nà',
+    0x6DF1: 'shēn',
+    0x6DF2: 'biāo,hū,hǔ',
+    0x6DF3: 'chún,zhūn,zhǔn',
+    0x6DF4: 'hū',
+    0x6DF5: 'yuān',
+    0x6DF6: 'lái',
+    0x6DF7: 'hùn,gǔn,hún,kūn',
+    0x6DF8: 'qīng',
+    0x6DF9: 'yān,yǎn',
+    0x6DFA: 'qiǎn,jiān,jiàn,cán,zàn',
+    0x6DFB: 'tiān,tiàn',
+    0x6DFC: 'miǎo',
+    0x6DFD: 'zhǐ',
+    0x6DFE: 'yǐn',
+    0x6DFF: 'bó',
+    0x6E00: 'bèn,bēn',
+    0x6E01: 'yuān',
+    0x6E02: 'wèn,mín',
+    0x6E03: 'ruò,rè',
+    0x6E04: 'fēi',
+    0x6E05: 'qīng,qìng',
+    0x6E06: 'yuān',
+    0x6E07: 'kě',
+    0x6E08: 'jì',
+    0x6E09: 'shè',
+    0x6E0A: 'yuān',
+    0x6E0B: 'sè',
+    0x6E0C: 'lù',
+    0x6E0D: 'zì',
+    0x6E0E: 'dú',
+    0x6E0F: 'yī',
+    0x6E10: 'jiàn,jiān',
+    0x6E11: 'miǎn,shéng',
+    0x6E12: 'pài',
+    0x6E13: 'xī',
+    0x6E14: 'yú',
+    0x6E15: 'yuān',
+    0x6E16: 'shěn',
+    0x6E17: 'shèn',
+    0x6E18: 'róu',
+    0x6E19: 'huàn',
+    0x6E1A: 'zhǔ',
+    0x6E1B: 'jiǎn',
+    0x6E1C: 'nuǎn,nuán',
+    0x6E1D: 'yú,yū',
+    0x6E1E: 'qiú,wù',
+    0x6E1F: 'tíng,tīng',
+    0x6E20: 'qú,jù',
+    0x6E21: 'dù',
+    0x6E22: 'fán,féng',
+    0x6E23: 'zhā',
+    0x6E24: 'bó',
+    0x6E25: 'wò,òu,wū',
+    0x6E26: 'wō,guō',
+    0x6E27: 'dì,tí,dī',
+    0x6E28: 'wēi',
+    0x6E29: 'wēn,yùn',
+    0x6E2A: 'rú',
+    0x6E2B: 'xiè,dié,zhá,yì,qiè',
+    0x6E2C: 'cè',
+    0x6E2D: 'wèi',
+    0x6E2E: 'hé',
+    0x6E2F: 'gǎng,hòng',
+    0x6E30: 'yǎn',
+    0x6E31: 'hóng,gòng',
+    0x6E32: 'xuàn',
+    0x6E33: 'mǐ',
+    0x6E34: 'kě,jié,kài,hé',
+    0x6E35: 'máo',
+    0x6E36: 'yīng',
+    0x6E37: 'yǎn',
+    0x6E38: 'yóu,liú',
+    0x6E39: 'hōng,qìng',
+    0x6E3A: 'miǎo',
+    0x6E3B: 'shěng',
+    0x6E3C: 'měi',
+    0x6E3D: 'zāi',
+    0x6E3E: 'hún,hùn,gǔn',
+    0x6E3F: 'nài',
+    0x6E40: 'guǐ',
+    0x6E41: 'chì',
+    0x6E42: 'è',
+    0x6E43: 'pài,bá',
+    0x6E44: 'méi',
+    0x6E45: 'liàn,làn',
+    0x6E46: 'qì',
+    0x6E47: 'qì',
+    0x6E48: 'méi',
+    0x6E49: 'tián',
+    0x6E4A: 'còu',
+    0x6E4B: 'wéi',
+    0x6E4C: 'cān',
+    0x6E4D: 'tuān,zhuān',
+    0x6E4E: 'miǎn',
+    0x6E4F: 'huì,mǐn',
+    0x6E50: 'mò',
+    0x6E51: 'xū,xù,xǔ',
+    0x6E52: 'jí',
+    0x6E53: 'pén,pèn',
+    0x6E54: 'jiān,zàn,zhǎn,qián,jiàn',
+    0x6E55: 'jiǎn',
+    0x6E56: 'hú',
+    0x6E57: 'fèng',
+    0x6E58: 'xiāng',
+    0x6E59: 'yì',
+    0x6E5A: 'yìn',
+    0x6E5B: 'zhàn,chén,dān,tán,jìn,yǐn,chěn,yín,shèn',
+    0x6E5C: 'shí',
+    0x6E5D: 'jiē,xié',
+    0x6E5E: 'zhēn,chēng',
+    0x6E5F: 'huáng,kuàng',
+    0x6E60: 'tàn',
+    0x6E61: 'yú',
+    0x6E62: 'bì',
+    0x6E63: 'mǐn,hūn,miàn',
+    0x6E64: 'shī',
+    0x6E65: 'tū',
+    0x6E66: 'shēng',
+    0x6E67: 'yǒng',
+    0x6E68: 'jú',
+    0x6E69: 'dòng,dǒng,tóng',
+    0x6E6A: 'tuàn,nuǎn',
+    0x6E6B: 'jiǎo,qiū,jiù,jiū,jiāo',
+    0x6E6C: 'jiǎo',
+    0x6E6D: 'qiú',
+    0x6E6E: 'yān,yīn',
+    0x6E6F: 'tāng,tàng,shāng,yáng',
+    0x6E70: 'lóng',
+    0x6E71: 'huò',
+    0x6E72: 'yuán',
+    0x6E73: 'nǎn',
+    0x6E74: 'bàn,pán',
+    0x6E75: 'yǒu',
+    0x6E76: 'quán',
+    0x6E77: 'zhuāng,hún',
+    0x6E78: 'liàng',
+    0x6E79: 'chán',
+    0x6E7A: 'xián',
+    0x6E7B: 'chún',
+    0x6E7C: 'niè',
+    0x6E7D: 'zī',
+    0x6E7E: 'wān',
+    0x6E7F: 'shī',
+    0x6E80: 'mǎn',
+    0x6E81: 'yíng',
+    0x6E82: 'là',
+    0x6E83: 'kuì,huì',
+    0x6E84: 'féng',
+    0x6E85: 'jiàn,jiān',
+    0x6E86: 'xù',
+    0x6E87: 'lóu',
+    0x6E88: 'wéi',
+    0x6E89: 'gài,xiè',
+    0x6E8A: 'bō',
+    0x6E8B: 'yíng',
+    0x6E8C: 'pō',
+    0x6E8D: 'jìn',
+    0x6E8E: 'yàn,guì',
+    0x6E8F: 'táng',
+    0x6E90: 'yuán',
+    0x6E91: 'suǒ',
+    0x6E92: 'yuán',
+    0x6E93: 'lián,liǎn,xián,xiàn,nián,lín',
+    0x6E94: 'yǎo',
+    0x6E95: 'méng',
+    0x6E96: 'zhǔn,zhuó',
+    0x6E97: 'chéng',
+    0x6E98: 'kè,kài',
+    0x6E99: 'tài',
+    0x6E9A: 'tǎ,dá',
+    0x6E9B: 'wā',
+    0x6E9C: 'liū,liù,liú',
+    0x6E9D: 'gōu,gǎng,kòu',
+    0x6E9E: 'sāo',
+    0x6E9F: 'míng,mǐng,mì',
+    0x6EA0: 'zhà,zhā',
+    0x6EA1: 'shí',
+    0x6EA2: 'yì',
+    0x6EA3: 'lùn',
+    0x6EA4: 'mǎ',
+    0x6EA5: 'pǔ,fū,bù,bó,pò',
+    0x6EA6: 'wēi,méi',
+    0x6EA7: 'lì',
+    0x6EA8: 'zāi',
+    0x6EA9: 'wù',
+    0x6EAA: 'xī,qī',
+    0x6EAB: 'wēn',
+    0x6EAC: 'qiāng',
+    0x6EAD: 'zé',
+    0x6EAE: 'shī',
+    0x6EAF: 'sù,shuò',
+    0x6EB0: 'ái',
+    0x6EB1: 'qín,zhēn',
+    0x6EB2: 'sōu,sǒu,shāo',
+    0x6EB3: 'yún,yǔn',
+    0x6EB4: 'xiù,chòu',
+    0x6EB5: 'yīn',
+    0x6EB6: 'róng',
+    0x6EB7: 'hùn,hún',
+    0x6EB8: 'sù',
+    0x6EB9: 'suò,suǒ,sè',
+    0x6EBA: 'nì,ruò,niào',
+    0x6EBB: 'tā',
+    0x6EBC: 'shī',
+    0x6EBD: 'rù,rú',
+    0x6EBE: 'āi',
+    0x6EBF: 'pàn',
+    0x6EC0: 'chù,xù',
+    0x6EC1: 'chú',
+    0x6EC2: 'pāng,pēng',
+    0x6EC3: 'wēng,wěng',
+    0x6EC4: 'cāng',
+    0x6EC5: 'miè',
+    0x6EC6: 'gé',
+    0x6EC7: 'diān,tián,zhēn',
+    0x6EC8: 'hào,xuè',
+    0x6EC9: 'huàng',
+    0x6ECA: 'xì,xiē,qì',
+    0x6ECB: 'zī,cí,xuán',
+    0x6ECC: 'dí',
+    0x6ECD: 'zhì',
+    0x6ECE: 'xíng,yīng,yíng',
+    0x6ECF: 'fǔ',
+    0x6ED0: 'jié',
+    0x6ED1: 'huá,gǔ',
+    0x6ED2: 'gē',
+    0x6ED3: 'zǐ',
+    0x6ED4: 'tāo',
+    0x6ED5: 'téng',
+    0x6ED6: 'suī',
+    0x6ED7: 'bì',
+    0x6ED8: 'jiào',
+    0x6ED9: 'huì',
+    0x6EDA: 'gǔn',
+    0x6EDB: 'yín',
+    0x6EDC: 'gāo',
+    0x6EDD: 'lóng',
+    0x6EDE: 'zhì',
+    0x6EDF: 'yàn',
+    0x6EE0: 'shè',
+    0x6EE1: 'mǎn',
+    0x6EE2: 'yíng',
+    0x6EE3: 'chún',
+    0x6EE4: 'lǜ',
+    0x6EE5: 'làn',
+    0x6EE6: 'luán',
+    0x6EE7: 'yáo,xiào',
+    0x6EE8: 'bīn',
+    0x6EE9: 'tān',
+    0x6EEA: 'yù',
+    0x6EEB: 'xiǔ',
+    0x6EEC: 'hù',
+    0x6EED: 'bì',
+    0x6EEE: 'biāo',
+    0x6EEF: 'zhì,chì',
+    0x6EF0: 'jiàng',
+    0x6EF1: 'kòu',
+    0x6EF2: 'shèn,sēn,qīn,lín',
+    0x6EF3: 'shāng',
+    0x6EF4: 'dī',
+    0x6EF5: 'mì',
+    0x6EF6: 'áo',
+    0x6EF7: 'lǔ',
+    0x6EF8: 'hǔ,xǔ',
+    0x6EF9: 'hū,hǔ',
+    0x6EFA: 'yōu',
+    0x6EFB: 'chǎn',
+    0x6EFC: 'fàn',
+    0x6EFD: 'yōng',
+    0x6EFE: 'gǔn',
+    0x6EFF: 'mǎn,mèn',
+    0x6F00: 'qǐng,qīng',
+    0x6F01: 'yú',
+    0x6F02: 'piāo,piào,piǎo,biāo',
+    0x6F03: 'jì',
+    0x6F04: 'yá',
+    0x6F05: 'cháo',
+    0x6F06: 'qī,qiè',
+    0x6F07: 'xǐ',
+    0x6F08: 'jì',
+    0x6F09: 'lù',
+    0x6F0A: 'lóu,lǚ,lǒu',
+    0x6F0B: 'lóng',
+    0x6F0C: 'jǐn',
+    0x6F0D: 'guó',
+    0x6F0E: 'cóng,sǒng',
+    0x6F0F: 'lòu,lóu',
+    0x6F10: 'zhí',
+    0x6F11: 'gài',
+    0x6F12: 'qiáng',
+    0x6F13: 'lí',
+    0x6F14: 'yǎn,yàn',
+    0x6F15: 'cáo,cào',
+    0x6F16: 'jiào',
+    0x6F17: 'cōng',
+    0x6F18: 'chún',
+    0x6F19: 'tuán,zhuān',
+    0x6F1A: 'ōu,òu',
+    0x6F1B: 'téng',
+    0x6F1C: 'yě',
+    0x6F1D: 'xí',
+    0x6F1E: 'mì',
+    0x6F1F: 'táng',
+    0x6F20: 'mò',
+    0x6F21: 'shāng,tàng',
+    0x6F22: 'hàn,tān',
+    0x6F23: 'lián,lán',
+    0x6F24: 'lǎn',
+    0x6F25: 'wā',
+    0x6F26: 'chí,tāi',
+    0x6F27: 'gān',
+    0x6F28: 'féng,péng,běng',
+    0x6F29: 'xuán',
+    0x6F2A: 'yī',
+    0x6F2B: 'màn',
+    0x6F2C: 'zì,sè,qì',
+    0x6F2D: 'mǎng',
+    0x6F2E: 'kāng',
+    0x6F2F: 'luò,tà,lěi',
+    0x6F30: 'pēng',
+    0x6F31: 'shù',
+    0x6F32: 'zhǎng,zhàng,zhāng',
+    0x6F33: 'zhāng',
+    0x6F34: 'zhuàng,chóng,shuāng,chuáng',
+    0x6F35: 'xù',
+    0x6F36: 'huàn',
+    0x6F37: 'huǒ,kuò,huò',
+    0x6F38: 'jiàn,jiān,qián,chán',
+    0x6F39: 'yān',
+    0x6F3A: 'shuǎng,chuǎng',
+    0x6F3B: 'liáo,xiào,liú',
+    0x6F3C: 'cuǐ,cuī',
+    0x6F3D: 'tí',
+    0x6F3E: 'yàng',
+    0x6F3F: 'jiāng,jiàng',
+    0x6F40: 'cóng',
+    0x6F41: 'yǐng',
+    0x6F42: 'hóng',
+    0x6F43: 'xiǔ',
+    0x6F44: 'shù',
+    0x6F45: 'guàn',
+    0x6F46: 'yíng',
+    0x6F47: 'xiāo',
+    0x6F48: 'zong',
+    0x6F49: 'kūn',
+    0x6F4A: 'xù',
+    0x6F4B: 'liàn',
+    0x6F4C: 'zhì',
+    0x6F4D: 'wéi',
+    0x6F4E: 'pì,piē,piào',
+    0x6F4F: 'yù,jué,shù',
+    0x6F50: 'jiào,jiǎo,qiáo',
+    0x6F51: 'pō,bō',
+    0x6F52: 'dàng,xiàng,yǎng',
+    0x6F53: 'huì',
+    0x6F54: 'jié',
+    0x6F55: 'wǔ',
+    0x6F56: 'pá',
+    0x6F57: 'jí',
+    0x6F58: 'pān,pàn,bō,pán,fān',
+    0x6F59: 'wéi,guī',
+    0x6F5A: 'sù,xiāo,sōu',
+    0x6F5B: 'qián',
+    0x6F5C: 'qián',
+    0x6F5D: 'xī,yà',
+    0x6F5E: 'lù',
+    0x6F5F: 'xì',
+    0x6F60: 'xùn,sùn',
+    0x6F61: 'dùn',
+    0x6F62: 'huáng,huàng,guāng',
+    0x6F63: 'mǐn',
+    0x6F64: 'rùn',
+    0x6F65: 'sù',
+    0x6F66: 'lǎo,liáo,lào,láo,liǎo',
+    0x6F67: 'zhēn',
+    0x6F68: 'cóng,zōng',
+    0x6F69: 'yì',
+    0x6F6A: 'zhè,zhì',
+    0x6F6B: 'wān',
+    0x6F6C: 'shàn,tān',
+    0x6F6D: 'tán,xún,yǐn,dàn',
+    0x6F6E: 'cháo',
+    0x6F6F: 'xún,yín',
+    0x6F70: 'kuì,xiè',
+    0x6F71: 'yē',
+    0x6F72: 'shào',
+    0x6F73: 'tú,zhā',
+    0x6F74: 'zhū',
+    0x6F75: 'sǎ,sàn',
+    0x6F76: 'hēi',
+    0x6F77: 'bì',
+    0x6F78: 'shān',
+    0x6F79: 'chán',
+    0x6F7A: 'chán',
+    0x6F7B: 'shǔ',
+    0x6F7C: 'tóng,chōng,zhōng',
+    0x6F7D: 'pū,pǔ',
+    0x6F7E: 'lín',
+    0x6F7F: 'wéi',
+    0x6F80: 'sè',
+    0x6F81: 'sè',
+    0x6F82: 'chéng',
+    0x6F83: 'jiǒng',
+    0x6F84: 'chéng,dèng',
+    0x6F85: 'huà',
+    0x6F86: 'jiāo,ào,nào',
+    0x6F87: 'lào,láo',
+    0x6F88: 'chè',
+    0x6F89: 'gǎn,hàn',
+    0x6F8A: 'cūn,cún',
+    0x6F8B: 'hòng',
+    0x6F8C: 'sī',
+    0x6F8D: 'shù,zhù',
+    0x6F8E: 'pēng,péng',
+    0x6F8F: 'hán',
+    0x6F90: 'yún',
+    0x6F91: 'liù',
+    0x6F92: 'hòng',
+    0x6F93: 'fú',
+    0x6F94: 'hào',
+    0x6F95: 'hé',
+    0x6F96: 'xián',
+    0x6F97: 'jiàn',
+    0x6F98: 'shān',
+    0x6F99: 'xì',
+    0x6F9A: 'yu',
+    0x6F9B: 'lǔ',
+    0x6F9C: 'lán',
+    0x6F9D: 'nìng',
+    0x6F9E: 'yú',
+    0x6F9F: 'lǐn',
+    0x6FA0: 'miǎn,shéng',
+    0x6FA1: 'zǎo,cāo',
+    0x6FA2: 'dāng',
+    0x6FA3: 'huàn,hàn',
+    0x6FA4: 'zé,shì,yì,duó',
+    0x6FA5: 'xiè',
+    0x6FA6: 'yù',
+    0x6FA7: 'lǐ',
+    0x6FA8: 'shì,cuó',
+    0x6FA9: 'xué,xiào',
+    0x6FAA: 'líng',
+    0x6FAB: 'wàn,màn,ǒu',
+    0x6FAC: 'zī,cí',
+    0x6FAD: 'yōng,yǒng',
+    0x6FAE: 'huì,kuài,huá',
+    0x6FAF: 'càn',
+    0x6FB0: 'liàn',
+    0x6FB1: 'diàn',
+    0x6FB2: 'yè',
+    0x6FB3: 'ào,yù',
+    0x6FB4: 'huán,xuàn',
+    0x6FB5: 'zhēn',
+    0x6FB6: 'chán,dàn,zhān',
+    0x6FB7: 'màn',
+    0x6FB8: 'dǎn',
+    0x6FB9: 'dàn,tán,dān,shàn',
+    0x6FBA: 'yì',
+    0x6FBB: 'suì',
+    0x6FBC: 'pì',
+    0x6FBD: 'jù',
+    0x6FBE: 'tà',
+    0x6FBF: 'qín',
+    0x6FC0: 'jī,jiào,jiāo',
+    0x6FC1: 'zhuó',
+    0x6FC2: 'lián,xiǎn',
+    0x6FC3: 'nóng',
+    0x6FC4: 'guō,wō',
+    0x6FC5: 'jìn',
+    0x6FC6: 'fén,pēn',
+    0x6FC7: 'sè',
+    0x6FC8: 'jí,shà',
+    0x6FC9: 'suī',
+    0x6FCA: 'huì,wèi,huò',
+    0x6FCB: 'chǔ',
+    0x6FCC: 'tà',
+    0x6FCD: 'sōng',
+    0x6FCE: 'dǐng,tìng',
+    0x6FCF: 'sè',
+    0x6FD0: 'zhǔ',
+    0x6FD1: 'lài',
+    0x6FD2: 'bīn',
+    0x6FD3: 'lián',
+    0x6FD4: 'mǐ,mí,nǐ',
+    0x6FD5: 'shī,tà,xí',
+    0x6FD6: 'shù',
+    0x6FD7: 'mì',
+    0x6FD8: 'nìng,níng,nì',
+    0x6FD9: 'yíng',
+    0x6FDA: 'yíng',
+    0x6FDB: 'méng',
+    0x6FDC: 'jìn,jīn',
+    0x6FDD: 'qí',
+    0x6FDE: 'bì,pì',
+    0x6FDF: 'jì,jǐ,qí',
+    0x6FE0: 'háo',
+    0x6FE1: 'rú,ruǎn,ér,nuán,nuò',
+    0x6FE2: 'cuì,zuǐ',
+    0x6FE3: 'wò',
+    0x6FE4: 'tāo,cháo,shòu,dào',
+    0x6FE5: 'yǐn',
+    0x6FE6: 'yǐn',
+    0x6FE7: 'duì',
+    0x6FE8: 'cí',
+    0x6FE9: 'huò,hù',
+    0x6FEA: 'qìng',
+    0x6FEB: 'làn,jiàn,lǎn,lán',
+    0x6FEC: 'jùn,xùn',
+    0x6FED: 'ǎi,kài,kè',
+    0x6FEE: 'pú',
+    0x6FEF: 'zhuó,shuò,zhào',
+    0x6FF0: 'wéi',
+    0x6FF1: 'bīn',
+    0x6FF2: 'gǔ',
+    0x6FF3: 'qián',
+    0x6FF4: 'yíng',
+    0x6FF5: 'bīn',
+    0x6FF6: 'kuò',
+    0x6FF7: 'fèi',
+    0x6FF8: 'cāng',
+    0x6FF9: 'me',
+    0x6FFA: 'jiàn,jiān,zàn',
+    0x6FFB: 'wěi',
+    0x6FFC: 'luò,pō,lì',
+    0x6FFD: 'zàn',
+    0x6FFE: 'lǜ',
+    0x6FFF: 'lì',
+    0x7000: 'yōu',
+    0x7001: 'yàng,yǎng',
+    0x7002: 'lǔ',
+    0x7003: 'sì',
+    0x7004: 'zhì',
+    0x7005: 'yíng,yìng,jiōng',
+    0x7006: 'dú,dòu',
+    0x7007: 'wǎng,wāng',
+    0x7008: 'huī',
+    0x7009: 'xiè',
+    0x700A: 'pán',
+    0x700B: 'shěn,chèn,pán',
+    0x700C: 'biāo',
+    0x700D: 'chán',
+    0x700E: 'mò,miè',
+    0x700F: 'liú,liū',
+    0x7010: 'jiān',
+    0x7011: 'pù,bào,bó',
+    0x7012: 'sè',
+    0x7013: 'chéng',
+    0x7014: 'gǔ',
+    0x7015: 'bīn',
+    0x7016: 'huò',
+    0x7017: 'xiàn',
+    0x7018: 'lú',
+    0x7019: 'qìn',
+    0x701A: 'hàn',
+    0x701B: 'yíng',
+    0x701C: 'róng',
+    0x701D: 'lì',
+    0x701E: 'jìng',
+    0x701F: 'xiāo',
+    0x7020: 'yíng',
+    0x7021: 'suǐ',
+    0x7022: 'wěi,duì',
+    0x7023: 'xiè',
+    0x7024: 'huái,wāi',
+    0x7025: 'xuè',
+    0x7026: 'zhū',
+    0x7027: 'lóng,shuāng',
+    0x7028: 'lài',
+    0x7029: 'duì',
+    0x702A: 'fán',
+    0x702B: 'hú',
+    0x702C: 'lài',
+    0x702D: 'shū',
+    0x702E: 'ling',
+    0x702F: 'yíng',
+    0x7030: 'mí,mǐ,nǐ',
+    0x7031: 'jì',
+    0x7032: 'liàn',
+    0x7033: 'jiàn,zùn',
+    0x7034: 'yíng,yǐng,yìng',
+    0x7035: 'fèn',
+    0x7036: 'lín',
+    0x7037: 'yì',
+    0x7038: 'jiān',
+    0x7039: 'yuè,yào',
+    0x703A: 'chán',
+    0x703B: 'dài',
+    0x703C: 'ráng,ràng,nǎng',
+    0x703D: 'jiǎn',
+    0x703E: 'lán',
+    0x703F: 'fán',
+    0x7040: 'shuàng',
+    0x7041: 'yuān',
+    0x7042: 'zhuó,zé,jiào',
+    0x7043: 'fēng',
+    0x7044: 'shè,nì',
+    0x7045: 'lěi',
+    0x7046: 'lán',
+    0x7047: 'cóng',
+    0x7048: 'qú',
+    0x7049: 'yōng',
+    0x704A: 'qián',
+    0x704B: 'fǎ',
+    0x704C: 'guàn,huàn',
+    0x704D: 'jué',
+    0x704E: 'yàn',
+    0x704F: 'hào',
+    0x7050: 'yíng',
+    0x7051: 'sǎ,xiǎn,xǐ,lí,shī',
+    0x7052: 'zàn,cuán,qián,zā',
+    0x7053: 'luán,luàn',
+    0x7054: 'yàn',
+    0x7055: 'lí',
+    0x7056: 'mǐ',
+    0x7057: 'shàn',
+    0x7058: 'tān,hàn,nàn',
+    0x7059: 'dǎng',
+    0x705A: 'jiǎo',
+    0x705B: 'chǎn',
+    0x705C: 'yíng',
+    0x705D: 'hào',
+    0x705E: 'bà',
+    0x705F: 'zhú',
+    0x7060: 'lǎn,làn',
+    0x7061: 'lán',
+    0x7062: 'nǎng',
+    0x7063: 'wān',
+    0x7064: 'luán',
+    0x7065: 'xún,quán,quàn',
+    0x7066: 'xiǎn',
+    0x7067: 'yàn',
+    0x7068: 'gàn',
+    0x7069: 'yàn',
+    0x706A: 'yù',
+    0x706B: 'huǒ,huō',
+    0x706C: 'biāo,huǒ',
+    0x706D: 'miè',
+    0x706E: 'guāng',
+    0x706F: 'dēng,dīng',
+    0x7070: 'huī',
+    0x7071: 'xiāo',
+    0x7072: 'xiāo',
+    0x7073: 'huī',
+    0x7074: 'hōng',
+    0x7075: 'líng',
+    0x7076: 'zào',
+    0x7077: 'zhuàn',
+    0x7078: 'jiǔ',
+    0x7079: 'zhà,yù',
+    0x707A: 'xiè',
+    0x707B: 'chì',
+    0x707C: 'zhuó',
+    0x707D: 'zāi',
+    0x707E: 'zāi',
+    0x707F: 'càn',
+    0x7080: 'yáng',
+    0x7081: 'qì',
+    0x7082: 'zhōng',
+    0x7083: 'fén,bèn',
+    0x7084: 'niǔ',
+    0x7085: 'jiǒng,guì',
+    0x7086: 'wén',
+    0x7087: 'pū',
+    0x7088: 'yì',
+    0x7089: 'lú',
+    0x708A: 'chuī',
+    0x708B: 'pī',
+    0x708C: 'kài',
+    0x708D: 'pàn',
+    0x708E: 'yán,yàn,tán',
+    0x708F: 'kài,yán',
+    0x7090: 'pàng,fēng',
+    0x7091: 'mù',
+    0x7092: 'chǎo',
+    0x7093: 'liào',
+    0x7094: 'guì,quē,xuè',
+    0x7095: 'kàng,hāng',
+    0x7096: 'dùn,tún',
+    0x7097: 'guāng',
+    0x7098: 'xīn',
+    0x7099: 'zhì',
+    0x709A: 'guāng',
+    0x709B: 'guāng',
+    0x709C: 'wěi',
+    0x709D: 'qiàng',
+    0x709E: 'bian',
+    0x709F: 'dá',
+    0x70A0: 'xiá',
+    0x70A1: 'zhēng',
+    0x70A2: 'zhú',
+    0x70A3: 'kě',
+    0x70A4: 'zhào,zhāo,zhǎo',
+    0x70A5: 'fú',
+    0x70A6: 'bá',
+    0x70A7: 'xiè',
+    0x70A8: 'xiè',
+    0x70A9: 'lìng',
+    0x70AA: 'zhuō,chù',
+    0x70AB: 'xuàn',
+    0x70AC: 'jù',
+    0x70AD: 'tàn',
+    0x70AE: 'pào,bāo,páo',
+    0x70AF: 'jiǒng',
+    0x70B0: 'páo,fǒu',
+    0x70B1: 'tái',
+    0x70B2: 'tái',
+    0x70B3: 'bǐng',
+    0x70B4: 'yǎng',
+    0x70B5: 'tōng',
+    0x70B6: 'shǎn',
+    0x70B7: 'zhù',
+    0x70B8: 'zhà,zhá',
+    0x70B9: 'diǎn',
+    0x70BA: 'wèi,wéi',
+    0x70BB: 'shí',
+    0x70BC: 'liàn',
+    0x70BD: 'chì',
+    0x70BE: 'huǎng',
+    0x70BF: 'zhōu',
+    0x70C0: 'hū',
+    0x70C1: 'shuò',
+    0x70C2: 'làn',
+    0x70C3: 'tīng',
+    0x70C4: 'jiǎo,yào',
+    0x70C5: 'xù',
+    0x70C6: 'héng',
+    0x70C7: 'quǎn',
+    0x70C8: 'liè',
+    0x70C9: 'huàn',
+    0x70CA: 'yáng,yàng',
+    0x70CB: 'xiū,xiāo',
+    0x70CC: 'xiū',
+    0x70CD: 'xiǎn',
+    0x70CE: 'yín',
+    0x70CF: 'wū,yā,wù',
+    0x70D0: 'zhōu',
+    0x70D1: 'yáo',
+    0x70D2: 'shì',
+    0x70D3: 'wēi',
+    0x70D4: 'tóng,dòng',
+    0x70D5: 'miè',
+    0x70D6: 'zāi',
+    0x70D7: 'kài',
+    0x70D8: 'hōng',
+    0x70D9: 'lào,luò',
+    0x70DA: 'xiá',
+    0x70DB: 'zhú,chóng',
+    0x70DC: 'xuǎn,xuān,huǐ',
+    0x70DD: 'zhēng',
+    0x70DE: 'pò',
+    0x70DF: 'yān,yīn',
+    0x70E0: 'huí,huǐ,ǎi',
+    0x70E1: 'guāng',
+    0x70E2: 'chè',
+    0x70E3: 'huī',
+    0x70E4: 'kǎo',
+    0x70E5: 'jù',
+    0x70E6: 'fán',
+    0x70E7: 'shāo',
+    0x70E8: 'yè',
+    0x70E9: 'huì',
+    0x70EB: 'tàng',
+    0x70EC: 'jìn',
+    0x70ED: 'rè',
+    0x70EE: 'liè',
+    0x70EF: 'xī',
+    0x70F0: 'fú,fū',
+    0x70F1: 'jiǒng',
+    0x70F2: 'xiè,chè',
+    0x70F3: 'pǔ',
+    0x70F4: 'tīng,jǐng',
+    0x70F5: 'zhuó',
+    0x70F6: 'tǐng',
+    0x70F7: 'wán',
+    0x70F8: 'hǎi',
+    0x70F9: 'pēng',
+    0x70FA: 'lǎng',
+    0x70FB: 'yàn,shān',
+    0x70FC: 'xù',
+    0x70FD: 'fēng',
+    0x70FE: 'chì',
+    0x70FF: 'róng',
+    0x7100: 'hú',
+    0x7101: 'xī',
+    0x7102: 'shū',
+    0x7103: 'hè,huò',
+    0x7104: 'xūn,hūn',
+    0x7105: 'kù,kào',
+    0x7106: 'juān,yè,yuè,yuān',
+    0x7107: 'xiāo',
+    0x7108: 'xī',
+    0x7109: 'yān,yí',
+    0x710A: 'hàn',
+    0x710B: 'zhuàng',
+    0x710C: 'jùn,qū',
+    0x710D: 'dì',
+    0x710E: 'xiè',
+    0x710F: 'jí,qì',
+    0x7110: 'wù',
+    0x7111: 'yān',
+    0x7112: 'lǚ',
+    0x7113: 'hán',
+    0x7114: 'yàn',
+    0x7115: 'huàn',
+    0x7116: 'mèn',
+    0x7117: 'jú',
+    0x7118: 'dào,tāo',
+    0x7119: 'bèi',
+    0x711A: 'fén,fèn',
+    0x711B: 'lìn',
+    0x711C: 'kūn',
+    0x711D: 'hùn',
+    0x711E: 'tūn,tuī,jùn',
+    0x711F: 'xī',
+    0x7120: 'cuì',
+    0x7121: 'wú,mó',
+    0x7122: 'hōng',
+    0x7123: 'chǎo,jù',
+    0x7124: 'fǔ',
+    0x7125: 'wò,ài',
+    0x7126: 'jiāo,qiáo',
+    0x7127: 'cōng',
+    0x7128: 'fèng',
+    0x7129: 'píng',
+    0x712A: 'qióng',
+    0x712B: 'ruò,rè',
+    0x712C: 'xī,yì',
+    0x712D: 'qióng',
+    0x712E: 'xìn',
+    0x712F: 'chāo,zhuō,zhuó,chuò',
+    0x7130: 'yàn',
+    0x7131: 'yàn,yì',
+    0x7132: 'yì',
+    0x7133: 'jué',
+    0x7134: 'yù',
+    0x7135: 'gàng',
+    0x7136: 'rán',
+    0x7137: 'pí',
+    0x7138: 'xiòng,yīng,gǔ',
+    0x7139: 'gàng',
+    0x713A: 'shēng',
+    0x713B: 'chàng,guā',
+    0x713C: 'shāo',
+    0x713D: 'xiǒng',
+    0x713E: 'niǎn',
+    0x713F: 'gēng',
+    0x7140: 'wei',
+    0x7141: 'chén',
+    0x7142: 'hè',
+    0x7143: 'kuǐ',
+    0x7144: 'zhǒng',
+    0x7145: 'duàn',
+    0x7146: 'xiā,xià',
+    0x7147: 'huī,hún,yùn,xūn,xuàn',
+    0x7148: 'fèng',
+    0x7149: 'liàn,làn',
+    0x714A: 'xuān',
+    0x714B: 'xīng',
+    0x714C: 'huáng',
+    0x714D: 'jiǎo',
+    0x714E: 'jiān,jiàn,jiǎn',
+    0x714F: 'bì',
+    0x7150: 'yīng',
+    0x7151: 'zhǔ',
+    0x7152: 'wěi,huī',
+    0x7153: 'tuān',
+    0x7154: 'shǎn,qián,shān',
+    0x7155: 'xī',
+    0x7156: 'nuǎn,xuān',
+    0x7157: 'nuǎn',
+    0x7158: 'chán',
+    0x7159: 'yān',
+    0x715A: 'jiǒng',
+    0x715B: 'jiǒng',
+    0x715C: 'yù',
+    0x715D: 'mèi',
+    0x715E: 'shā,shà',
+    0x715F: 'wèi',
+    0x7160: 'zhá,yè',
+    0x7161: 'jìn',
+    0x7162: 'qióng',
+    0x7163: 'róu,rǒu',
+    0x7164: 'méi',
+    0x7165: 'huàn',
+    0x7166: 'xù,xiū',
+    0x7167: 'zhào',
+    0x7168: 'wēi,yù',
+    0x7169: 'fán',
+    0x716A: 'qiú',
+    0x716B: 'suì',
+    0x716C: 'yáng,yàng',
+    0x716D: 'liè',
+    0x716E: 'zhǔ',
+    0x716F: 'jiē',
+    0x7170: 'zào',
+    0x7171: 'guā',
+    0x7172: 'bāo',
+    0x7173: 'hú',
+    0x7174: 'yūn,yùn,wěn',
+    0x7175: 'nǎn',
+    0x7176: 'shì',
+    0x7177: 'liang',
+    0x7178: 'biān',
+    0x7179: 'gòu',
+    0x717A: 'tuì',
+    0x717B: 'táng',
+    0x717C: 'chǎo',
+    0x717D: 'shān',
+    0x717E: 'ēn,yūn',
+    0x717F: 'bó',
+    0x7180: 'huǎng,yè',
+    0x7181: 'xié',
+    0x7182: 'xì',
+    0x7183: 'wù',
+    0x7184: 'xī',
+    0x7185: 'yùn',
+    0x7186: 'hé',
+    0x7187: 'hè,xiāo,kǎo,kào',
+    0x7188: 'xī',
+    0x7189: 'yún',
+    0x718A: 'xióng',
+    0x718B: 'nái',
+    0x718C: 'shǎn',
+    0x718D: 'qióng',
+    0x718E: 'yào',
+    0x718F: 'xūn,xùn',
+    0x7190: 'mì',
+    0x7191: 'lián,qiān',
+    0x7192: 'yíng,xíng,jiǒng',
+    0x7193: 'wǔ',
+    0x7194: 'róng',
+    0x7195: 'gōng',
+    0x7196: 'yàn',
+    0x7197: 'qiàng',
+    0x7198: 'liū',
+    0x7199: 'xī,yí',
+    0x719A: 'bì',
+    0x719B: 'biāo',
+    0x719C: 'cōng,zǒng',
+    0x719D: 'lù,āo',
+    0x719E: 'jiān',
+    0x719F: 'shú,shóu',
+    0x71A0: 'yì',
+    0x71A1: 'lóu',
+    0x71A2: 'péng,bèng,fēng',
+    0x71A3: 'suī,cuǐ',
+    0x71A4: 'yì',
+    0x71A5: 'tēng,tōng',
+    0x71A6: 'jué',
+    0x71A7: 'zōng',
+    0x71A8: 'yùn,yù,wèi',
+    0x71A9: 'hù',
+    0x71AA: 'yí',
+    0x71AB: 'zhì',
+    0x71AC: 'áo,āo',
+    0x71AD: 'wèi',
+    0x71AE: 'liǔ',
+    0x71AF: 'hàn,rǎn',
+    0x71B0: 'ōu,òu',
+    0x71B1: 'rè',
+    0x71B2: 'jiǒng',
+    0x71B3: 'màn',
+    0x71B4: 'kūn',
+    0x71B5: 'shāng',
+    0x71B6: 'cuàn',
+    0x71B7: 'zēng',
+    0x71B8: 'jiān',
+    0x71B9: 'xī',
+    0x71BA: 'xī',
+    0x71BB: 'xī',
+    0x71BC: 'yì',
+    0x71BD: 'xiào',
+    0x71BE: 'chì',
+    0x71BF: 'huáng,huǎng',
+    0x71C0: 'chǎn,dǎn,chàn',
+    0x71C1: 'yè',
+    0x71C2: 'tán,xún,qián',
+    0x71C3: 'rán',
+    0x71C4: 'yàn',
+    0x71C5: 'xún',
+    0x71C6: 'qiāo,xiāo',
+    0x71C7: 'jùn',
+    0x71C8: 'dēng',
+    0x71C9: 'dùn,tún,dūn',
+    0x71CA: 'shēn',
+    0x71CB: 'jiāo,qiáo,jué,zhuó',
+    0x71CC: 'fén,bèn',
+    0x71CD: 'sī,xī',
+    0x71CE: 'liáo,liǎo,liào',
+    0x71CF: 'yù',
+    0x71D0: 'lín',
+    0x71D1: 'tóng',
+    0x71D2: 'shāo,shào',
+    0x71D3: 'fén',
+    0x71D4: 'fán,fén',
+    0x71D5: 'yàn,yān',
+    0x71D6: 'xún,qián',
+    0x71D7: 'làn',
+    0x71D8: 'měi',
+    0x71D9: 'tàng,dàng',
+    0x71DA: 'yì',
+    0x71DB: 'jiǒng',
+    0x71DC: 'mèn',
+    0x71DD: 'jing',
+    0x71DE: 'jiǎo',
+    0x71DF: 'yíng,cuō',
+    0x71E0: 'yù,ào',
+    0x71E1: 'yì',
+    0x71E2: 'xué',
+    0x71E3: 'lán',
+    0x71E4: 'tài,liè',
+    0x71E5: 'zào,sào',
+    0x71E6: 'càn',
+    0x71E7: 'suì',
+    0x71E8: 'xī',
+    0x71E9: 'què',
+    0x71EA: 'zǒng',
+    0x71EB: 'lián',
+    0x71EC: 'huǐ',
+    0x71ED: 'zhú,kuò',
+    0x71EE: 'xiè',
+    0x71EF: 'líng',
+    0x71F0: 'wēi',
+    0x71F1: 'yì',
+    0x71F2: 'xié',
+    0x71F3: 'zhào',
+    0x71F4: 'huì',
+    0x71F5: 'dá',
+    0x71F6: 'nóng',
+    0x71F7: 'lán',
+    0x71F8: 'rú,ruǎn',
+    0x71F9: 'xiǎn,bìng',
+    0x71FA: 'hè',
+    0x71FB: 'xūn',
+    0x71FC: 'jìn',
+    0x71FD: 'chóu',
+    0x71FE: 'dào,tāo',
+    0x71FF: 'yào,shuò,shào',
+    0x7200: 'hè',
+    0x7201: 'làn',
+    0x7202: 'biāo',
+    0x7203: 'róng',
+    0x7204: 'lì,liè',
+    0x7205: 'mò',
+    0x7206: 'bào,bó',
+    0x7207: 'ruò',
+    0x7208: 'lǜ',
+    0x7209: 'là,liè',
+    0x720A: 'āo',
+    0x720B: 'xūn',
+    0x720C: 'kuàng,huǎng,kuǎng',
+    0x720D: 'shuò,luò,yuè',
+    0x720E: 'liáo',
+    0x720F: 'lì',
+    0x7210: 'lú',
+    0x7211: 'jué',
+    0x7212: 'liǎo',
+    0x7213: 'yàn,xún',
+    0x7214: 'xī',
+    0x7215: 'xiè',
+    0x7216: 'lóng',
+    0x7217: 'yè',
+    0x7218: 'cān',
+    0x7219: 'rǎng',
+    0x721A: 'yuè',
+    0x721B: 'làn',
+    0x721C: 'cóng',
+    0x721D: 'jué,jiào',
+    0x721E: 'chóng,tóng',
+    0x721F: 'guàn',
+    0x7220: 'ju',
+    0x7221: 'chè',
+    0x7222: 'mí',
+    0x7223: 'tǎng',
+    0x7224: 'làn',
+    0x7225: 'zhú',
+    0x7226: 'lǎn',
+    0x7227: 'líng',
+    0x7228: 'cuàn',
+    0x7229: 'yù',
+    0x722A: 'zhǎo,zhuǎ',
+    0x722B: 'zhǎo',
+    0x722C: 'pá',
+    0x722D: 'zhēng,zhèng',
+    0x722E: 'páo',
+    0x722F: 'chēng,chèng',
+    0x7230: 'yuán',
+    0x7231: 'ài',
+    0x7232: 'wèi,wéi',
+    0x7233: 'han',
+    0x7234: 'jué',
+    0x7235: 'jué',
+    0x7236: 'fù,fǔ',
+    0x7237: 'yé',
+    0x7238: 'bà',
+    0x7239: 'diē',
+    0x723A: 'yé',
+    0x723B: 'yáo,xiào',
+    0x723C: 'zǔ',
+    0x723D: 'shuǎng,shuāng',
+    0x723E: 'ěr,mǐ,nǐ',
+    0x723F: 'pán,qiáng',
+    0x7240: 'chuáng',
+    0x7241: 'kē',
+    0x7242: 'zāng',
+    0x7243: 'dié',
+    0x7244: 'qiāng',
+    0x7245: 'yōng',
+    0x7246: 'qiáng',
+    0x7247: 'piàn,piān,pàn',
+    0x7248: 'bǎn',
+    0x7249: 'pàn',
+    0x724A: 'cháo',
+    0x724B: 'jiān',
+    0x724C: 'pái',
+    0x724D: 'dú',
+    0x724E: 'chuāng',
+    0x724F: 'yú',
+    0x7250: 'zhá',
+    0x7251: 'biān,miàn',
+    0x7252: 'dié',
+    0x7253: 'bǎng,pāng',
+    0x7254: 'bó',
+    0x7255: 'chuāng',
+    0x7256: 'yǒu',
+    0x7257: 'yǒu',
+    0x7258: 'dú',
+    0x7259: 'yá,yà',
+    0x725A: 'chēng,chèng',
+    0x725B: 'niú',
+    0x725C: 'niú',
+    0x725D: 'pìn',
+    0x725E: 'jiū,lè',
+    0x725F: 'móu,mù,mào',
+    0x7260: 'tā,tuó',
+    0x7261: 'mǔ',
+    0x7262: 'láo,lào,lóu',
+    0x7263: 'rèn',
+    0x7264: 'māng',
+    0x7265: 'fāng',
+    0x7266: 'máo',
+    0x7267: 'mù',
+    0x7268: 'gāng',
+    0x7269: 'wù',
+    0x726A: 'yàn',
+    0x726B: 'gē,qiú,zāng',
+    0x726C: 'bèi',
+    0x726D: 'sì',
+    0x726E: 'jiàn',
+    0x726F: 'gǔ',
+    0x7270: 'yòu,chōu',
+    0x7271: 'gē',
+    0x7272: 'shēng',
+    0x7273: 'mǔ',
+    0x7274: 'dǐ,dī,zhāi',
+    0x7275: 'qiān',
+    0x7276: 'quàn',
+    0x7277: 'quán',
+    0x7278: 'zì',
+    0x7279: 'tè',
+    0x727A: 'xī',
+    0x727B: 'máng',
+    0x727C: 'kēng',
+    0x727D: 'qiān,qiàn',
+    0x727E: 'wǔ,wú',
+    0x727F: 'gù',
+    0x7280: 'xī',
+    0x7281: 'lí',
+    0x7282: 'lí',
+    0x7283: 'pǒu',
+    0x7284: 'jī,yī',
+    0x7285: 'gāng',
+    0x7286: 'zhí,tè',
+    0x7287: 'bēn',
+    0x7288: 'quán',
+    0x7289: 'chún',
+    0x728A: 'dú',
+    0x728B: 'jù',
+    0x728C: 'jiā',
+    0x728D: 'jiān,qián,jiǎn',
+    0x728E: 'fēng',
+    0x728F: 'piān',
+    0x7290: 'kē',
+    0x7291: 'jú',
+    0x7292: 'kào',
+    0x7293: 'chú',
+    0x7294: 'xì',
+    0x7295: 'bèi',
+    0x7296: 'luò',
+    0x7297: 'jiè',
+    0x7298: 'má',
+    0x7299: 'sān',
+    0x729A: 'wèi',
+    0x729B: 'máo,lí',
+    0x729C: 'dūn',
+    0x729D: 'tóng',
+    0x729E: 'qiáo',
+    0x729F: 'jiàng',
+    0x72A0: 'xī',
+    0x72A1: 'lì',
+    0x72A2: 'dú',
+    0x72A3: 'liè',
+    0x72A4: 'pái',
+    0x72A5: 'piāo,pào',
+    0x72A6: 'bó',
+    0x72A7: 'xī,suō',
+    0x72A8: 'chōu',
+    0x72A9: 'wéi',
+    0x72AA: 'kuí,ráo',
+    0x72AB: 'chōu',
+    0x72AC: 'quǎn',
+    0x72AD: 'quǎn',
+    0x72AE: 'bá',
+    0x72AF: 'fàn',
+    0x72B0: 'qiú',
+    0x72B1: 'jǐ',
+    0x72B2: 'chái',
+    0x72B3: 'zhuó',
+    0x72B4: 'àn,hān,án,jiàn',
+    0x72B5: 'gē,hé',
+    0x72B6: 'zhuàng',
+    0x72B7: 'guǎng',
+    0x72B8: 'mà,mǎ',
+    0x72B9: 'yóu,yòu',
+    0x72BA: 'kàng,gǎng',
+    0x72BB: 'bó,pèi,fèi',
+    0x72BC: 'hǒu',
+    0x72BD: 'yà',
+    0x72BE: 'yín',
+    0x72BF: 'huān,fān',
+    0x72C0: 'zhuàng',
+    0x72C1: 'yǔn',
+    0x72C2: 'kuáng,jué',
+    0x72C3: 'niǔ,nǜ',
+    0x72C4: 'dí,tì',
+    0x72C5: 'kuáng',
+    0x72C6: 'zhòng',
+    0x72C7: 'mù',
+    0x72C8: 'bèi',
+    0x72C9: 'pī',
+    0x72CA: 'jú',
+    0x72CB: 'yí,quán,chí',
+    0x72CC: 'shēng,xīng',
+    0x72CD: 'páo',
+    0x72CE: 'xiá',
+    0x72CF: 'tuó,yí',
+    0x72D0: 'hú',
+    0x72D1: 'líng',
+    0x72D2: 'fèi',
+    0x72D3: 'pí,pī',
+    0x72D4: 'nǐ',
+    0x72D5: 'yǎo',
+    0x72D6: 'yòu',
+    0x72D7: 'gǒu',
+    0x72D8: 'xuè',
+    0x72D9: 'jū',
+    0x72DA: 'dàn',
+    0x72DB: 'bó',
+    0x72DC: 'kǔ',
+    0x72DD: 'xiǎn',
+    0x72DE: 'níng',
+    0x72DF: 'huán,xuān,héng',
+    0x72E0: 'hěn,yán,kěn,hǎng',
+    0x72E1: 'jiǎo,xiào',
+    0x72E2: 'hé,mò',
+    0x72E3: 'zhào',
+    0x72E4: 'jí,jié,kuài',
+    0x72E5: 'xùn',
+    0x72E6: 'shān',
+    0x72E7: 'tà,shì',
+    0x72E8: 'róng',
+    0x72E9: 'shòu',
+    0x72EA: 'tóng,dòng',
+    0x72EB: 'lǎo',
+    0x72EC: 'dú',
+    0x72ED: 'xiá',
+    0x72EE: 'shī',
+    0x72EF: 'kuài',
+    0x72F0: 'zhēng',
+    0x72F1: 'yù',
+    0x72F2: 'sūn',
+    0x72F3: 'yú',
+    0x72F4: 'bì',
+    0x72F5: 'máng,zhuó',
+    0x72F6: 'xī,shǐ',
+    0x72F7: 'juàn',
+    0x72F8: 'lí',
+    0x72F9: 'xiá',
+    0x72FA: 'yín',
+    0x72FB: 'suān,xùn,jùn',
+    0x72FC: 'láng,lǎng,làng,hǎng',
+    0x72FD: 'bèi',
+    0x72FE: 'zhì',
+    0x72FF: 'yán',
+    0x7300: 'shā',
+    0x7301: 'lì',
+    0x7302: 'hàn',
+    0x7303: 'xiǎn',
+    0x7304: 'jīng',
+    0x7305: 'pái',
+    0x7306: 'fēi',
+    0x7307: 'xiāo',
+    0x7308: 'bài,pí',
+    0x7309: 'qí',
+    0x730A: 'ní',
+    0x730B: 'biāo',
+    0x730C: 'yìn',
+    0x730D: 'lái',
+    0x730E: 'liè,xī,què',
+    0x730F: 'jiān',
+    0x7310: 'qiāng',
+    0x7311: 'kūn',
+    0x7312: 'yàn',
+    0x7313: 'guǒ,luǒ',
+    0x7314: 'zòng',
+    0x7315: 'mí',
+    0x7316: 'chāng',
+    0x7317: 'yī,yǐ,jì,ē,wēi',
+    0x7318: 'zhì',
+    0x7319: 'zhēng',
+    0x731A: 'yá,wèi',
+    0x731B: 'měng',
+    0x731C: 'cāi',
+    0x731D: 'cù',
+    0x731E: 'shē',
+    0x731F: 'liè',
+    0x7320: 'diǎn',
+    0x7321: 'luó',
+    0x7322: 'hú',
+    0x7323: 'zōng',
+    0x7324: 'guì',
+    0x7325: 'wěi,wèi',
+    0x7326: 'fēng',
+    0x7327: 'wō',
+    0x7328: 'yuán',
+    0x7329: 'xīng',
+    0x732A: 'zhū',
+    0x732B: 'māo,miáo,máo',
+    0x732C: 'wèi',
+    0x732D: 'chuān,chuàn,shān',
+    0x732E: 'xiàn',
+    0x732F: 'tuān',
+    0x7330: 'yà,jiá,qiè',
+    0x7331: 'náo',
+    0x7332: 'xiē,hè,gé,hài',
+    0x7333: 'jiā',
+    0x7334: 'hóu',
+    0x7335: 'biān,piàn',
+    0x7336: 'yóu,yáo',
+    0x7337: 'yóu',
+    0x7338: 'méi',
+    0x7339: 'chá',
+    0x733A: 'yáo',
+    0x733B: 'sūn',
+    0x733C: 'bó,pò',
+    0x733D: 'míng',
+    0x733E: 'huá',
+    0x733F: 'yuán',
+    0x7340: 'sōu',
+    0x7341: 'mà,mǎ',
+    0x7342: 'yuán',
+    0x7343: 'dāi,ái',
+    0x7344: 'yù',
+    0x7345: 'shī',
+    0x7346: 'háo',
+    0x7347: 'qiāng',
+    0x7348: 'yì',
+    0x7349: 'zhēn',
+    0x734A: 'cāng',
+    0x734B: 'háo,gāo',
+    0x734C: 'màn',
+    0x734D: 'jìng',
+    0x734E: 'jiǎng',
+    0x734F: 'mò,mú',
+    0x7350: 'zhāng',
+    0x7351: 'chán',
+    0x7352: 'áo',
+    0x7353: 'áo',
+    0x7354: 'háo',
+    0x7355: 'cuī',
+    0x7356: 'bèn,fèn,fén',
+    0x7357: 'jué',
+    0x7358: 'bì',
+    0x7359: 'bì',
+    0x735A: 'huáng',
+    0x735B: 'pú',
+    0x735C: 'lín,lìn',
+    0x735D: 'xù,yù',
+    0x735E: 'tóng,zhuàng',
+    0x735F: 'yào,xiāo',
+    0x7360: 'liáo,lǎo',
+    0x7361: 'shuò',
+    0x7362: 'xiāo',
+    0x7363: 'shòu',
+    0x7364: 'dūn',
+    0x7365: 'jiào',
+    0x7366: 'gé,xiē,liè',
+    0x7367: 'juàn',
+    0x7368: 'dú',
+    0x7369: 'huì',
+    0x736A: 'kuài,huá',
+    0x736B: 'xiǎn',
+    0x736C: 'xiè,hǎ,jiě',
+    0x736D: 'tǎ',
+    0x736E: 'xiǎn,mí',
+    0x736F: 'xūn',
+    0x7370: 'níng',
+    0x7371: 'biān',
+    0x7372: 'huò',
+    0x7373: 'nòu,rú',
+    0x7374: 'měng,méng',
+    0x7375: 'liè',
+    0x7376: 'nǎo,yōu,náo',
+    0x7377: 'guǎng,jǐng',
+    0x7378: 'shòu',
+    0x7379: 'lú',
+    0x737A: 'tǎ',
+    0x737B: 'xiàn,suō,xī',
+    0x737C: 'mí',
+    0x737D: 'ráng',
+    0x737E: 'huān,quán',
+    0x737F: 'nǎo,náo',
+    0x7380: 'luó,ě',
+    0x7381: 'xiǎn',
+    0x7382: 'qí',
+    0x7383: 'jué',
+    0x7384: 'xuán,xuàn',
+    0x7385: 'miào,yāo',
+    0x7386: 'zī,xuán',
+    0x7387: 'lǜ,shuài,lüè',
+    0x7388: 'lú',
+    0x7389: 'yù',
+    0x738A: 'sù',
+    0x738B: 'wáng,wàng,yù',
+    0x738C: 'qiú',
+    0x738D: 'gǎ',
+    0x738E: 'dīng',
+    0x738F: 'lè',
+    0x7390: 'bā',
+    0x7391: 'jī',
+    0x7392: 'hóng',
+    0x7393: 'dì',
+    0x7394: 'chuàn',
+    0x7395: 'gān',
+    0x7396: 'jiǔ',
+    0x7397: 'yú',
+    0x7398: 'qǐ',
+    0x7399: 'yú',
+    0x739A: 'chàng,yáng',
+    0x739B: 'mǎ',
+    0x739C: 'hóng',
+    0x739D: 'wǔ',
+    0x739E: 'fū',
+    0x739F: 'wén,mín',
+    0x73A0: 'jiè',
+    0x73A1: 'yá,yà',
+    0x73A2: 'bīn,fēn',
+    0x73A3: 'biàn',
+    0x73A4: 'bàng',
+    0x73A5: 'yuè',
+    0x73A6: 'jué',
+    0x73A7: 'mén,yǔn',
+    0x73A8: 'jué',
+    0x73A9: 'wán',
+    0x73AA: 'jiān,yín,qián,lín',
+    0x73AB: 'méi',
+    0x73AC: 'dǎn',
+    0x73AD: 'pín',
+    0x73AE: 'wěi',
+    0x73AF: 'huán',
+    0x73B0: 'xiàn',
+    0x73B1: 'qiāng',
+    0x73B2: 'líng',
+    0x73B3: 'dài',
+    0x73B4: 'yì',
+    0x73B5: 'án,gān',
+    0x73B6: 'píng',
+    0x73B7: 'diàn,diān',
+    0x73B8: 'fú',
+    0x73B9: 'xuán,xuàn,xián',
+    0x73BA: 'xǐ',
+    0x73BB: 'bō',
+    0x73BC: 'cǐ,cī,cuō',
+    0x73BD: 'gǒu',
+    0x73BE: 'jiǎ',
+    0x73BF: 'sháo',
+    0x73C0: 'pò',
+    0x73C1: 'cí',
+    0x73C2: 'kē',
+    0x73C3: 'rǎn',
+    0x73C4: 'shēng',
+    0x73C5: 'shēn',
+    0x73C6: 'yí,tāi',
+    0x73C7: 'zǔ,jù',
+    0x73C8: 'jiā',
+    0x73C9: 'mín',
+    0x73CA: 'shān',
+    0x73CB: 'liǔ',
+    0x73CC: 'bì',
+    0x73CD: 'zhēn',
+    0x73CE: 'zhēn',
+    0x73CF: 'jué',
+    0x73D0: 'fà',
+    0x73D1: 'lóng',
+    0x73D2: 'jīn',
+    0x73D3: 'jiào',
+    0x73D4: 'jiàn',
+    0x73D5: 'lì',
+    0x73D6: 'guāng',
+    0x73D7: 'xiān',
+    0x73D8: 'zhōu',
+    0x73D9: 'gǒng',
+    0x73DA: 'yān',
+    0x73DB: 'xiù',
+    0x73DC: 'yáng',
+    0x73DD: 'xǔ',
+    0x73DE: 'luò,lì',
+    0x73DF: 'sù',
+    0x73E0: 'zhū',
+    0x73E1: 'qín',
+    0x73E2: 'yín,kèn',
+    0x73E3: 'xún',
+    0x73E4: 'bǎo',
+    0x73E5: 'ěr',
+    0x73E6: 'xiàng',
+    0x73E7: 'yáo',
+    0x73E8: 'xiá',
+    0x73E9: 'háng,héng',
+    0x73EA: 'guī',
+    0x73EB: 'chōng',
+    0x73EC: 'xù',
+    0x73ED: 'bān',
+    0x73EE: 'pèi',
+    0x73EF: 'lǎo',
+    0x73F0: 'dāng',
+    0x73F1: 'yīng',
+    0x73F2: 'huī,hún',
+    0x73F3: 'wén',
+    0x73F4: 'é',
+    0x73F5: 'chéng,tǐng',
+    0x73F6: 'dì,tí',
+    0x73F7: 'wǔ,wù',
+    0x73F8: 'wú',
+    0x73F9: 'chéng',
+    0x73FA: 'jùn',
+    0x73FB: 'méi',
+    0x73FC: 'bèi',
+    0x73FD: 'tǐng',
+    0x73FE: 'xiàn',
+    0x73FF: 'chù',
+    0x7400: 'hán',
+    0x7401: 'xuán,qióng',
+    0x7402: 'yán',
+    0x7403: 'qiú',
+    0x7404: 'xuàn',
+    0x7405: 'láng,làng',
+    0x7406: 'lǐ',
+    0x7407: 'xiù',
+    0x7408: 'fú,fū',
+    0x7409: 'liú',
+    0x740A: 'yá',
+    0x740B: 'xī',
+    0x740C: 'líng',
+    0x740D: 'lí',
+    0x740E: 'jìn',
+    0x740F: 'liǎn',
+    0x7410: 'suǒ',
+    0x7411: 'suǒ',
+    0x7412: 'fēng',
+    0x7413: 'wán',
+    0x7414: 'diàn',
+    0x7415: 'pín,bǐng',
+    0x7416: 'zhǎn',
+    0x7417: 'sè,cuì',
+    0x7418: 'mín',
+    0x7419: 'yù',
+    0x741A: 'jū',
+    0x741B: 'chēn',
+    0x741C: 'lái',
+    0x741D: 'mín',
+    0x741E: 'shèng,wàng',
+    0x741F: 'wéi,yù',
+    0x7420: 'tiǎn,tiàn',
+    0x7421: 'chù',
+    0x7422: 'zuó,zhuó',
+    0x7423: 'běng,pěi',
+    0x7424: 'chēng',
+    0x7425: 'hǔ',
+    0x7426: 'qí',
+    0x7427: 'è',
+    0x7428: 'kūn',
+    0x7429: 'chāng',
+    0x742A: 'qí',
+    0x742B: 'běng',
+    0x742C: 'wǎn',
+    0x742D: 'lù',
+    0x742E: 'cóng',
+    0x742F: 'guǎn,gùn,guān,guàn',
+    0x7430: 'yǎn',
+    0x7431: 'diāo',
+    0x7432: 'bèi',
+    0x7433: 'lín',
+    0x7434: 'qín',
+    0x7435: 'pí',
+    0x7436: 'pá',
+    0x7437: 'què',
+    0x7438: 'zhuó',
+    0x7439: 'qín',
+    0x743A: 'fà',
+    0x743B: 'jīn',
+    0x743C: 'qióng',
+    0x743D: 'dǔ',
+    0x743E: 'jiè',
+    0x743F: 'hún,huī',
+    0x7440: 'yǔ',
+    0x7441: 'mào',
+    0x7442: 'méi',
+    0x7443: 'chūn',
+    0x7444: 'xuān',
+    0x7445: 'tí',
+    0x7446: 'xīng',
+    0x7447: 'dài',
+    0x7448: 'róu',
+    0x7449: 'mín',
+    0x744A: 'jiān',
+    0x744B: 'wěi',
+    0x744C: 'ruǎn',
+    0x744D: 'huàn',
+    0x744E: 'xié',
+    0x744F: 'chuān',
+    0x7450: 'jiǎn',
+    0x7451: 'zhuàn',
+    0x7452: 'chàng,yáng,dàng',
+    0x7453: 'liàn',
+    0x7454: 'quán',
+    0x7455: 'xiá',
+    0x7456: 'duàn',
+    0x7457: 'yuàn,huán',
+    0x7458: 'yá',
+    0x7459: 'nǎo',
+    0x745A: 'hú',
+    0x745B: 'yīng',
+    0x745C: 'yú',
+    0x745D: 'huáng',
+    0x745E: 'ruì',
+    0x745F: 'sè',
+    0x7460: 'liú',
+    0x7461: 'shī',
+    0x7462: 'róng',
+    0x7463: 'suǒ',
+    0x7464: 'yáo',
+    0x7465: 'wēn',
+    0x7466: 'wǔ',
+    0x7467: 'zhēn',
+    0x7468: 'jìn',
+    0x7469: 'yíng,yǐng',
+    0x746A: 'mǎ',
+    0x746B: 'tāo',
+    0x746C: 'liú',
+    0x746D: 'táng',
+    0x746E: 'lì',
+    0x746F: 'láng',
+    0x7470: 'guī',
+    0x7471: 'zhèn,tiàn',
+    0x7472: 'qiāng,chēng,cāng',
+    0x7473: 'cuō',
+    0x7474: 'jué',
+    0x7475: 'zhǎo',
+    0x7476: 'yáo',
+    0x7477: 'ài',
+    0x7478: 'bīn',
+    0x7479: 'shū,tū',
+    0x747A: 'cháng',
+    0x747B: 'kūn',
+    0x747C: 'zhuān',
+    0x747D: 'cōng',
+    0x747E: 'jǐn,jìn',
+    0x747F: 'yī',
+    0x7480: 'cuǐ',
+    0x7481: 'cōng',
+    0x7482: 'qí',
+    0x7483: 'lí',
+    0x7484: 'jǐng',
+    0x7485: 'suǒ,zǎo',
+    0x7486: 'qiú',
+    0x7487: 'xuán',
+    0x7488: 'áo',
+    0x7489: 'liǎn,lián',
+    0x748A: 'mén',
+    0x748B: 'zhāng',
+    0x748C: 'yín',
+    0x748D: 'yè',
+    0x748E: 'yīng',
+    0x748F: 'wèi,zhì',
+    0x7490: 'lù',
+    0x7491: 'wú',
+    0x7492: 'dēng',
+    0x7493: 'xiù',
+    0x7494: 'zēng',
+    0x7495: 'xún',
+    0x7496: 'qú',
+    0x7497: 'dàng',
+    0x7498: 'lín',
+    0x7499: 'liáo',
+    0x749A: 'qióng,jué',
+    0x749B: 'sù',
+    0x749C: 'huáng',
+    0x749D: 'guī',
+    0x749E: 'pú',
+    0x749F: 'jǐng',
+    0x74A0: 'fán',
+    0x74A1: 'jìn,jīn',
+    0x74A2: 'liú',
+    0x74A3: 'jī',
+    0x74A4: 'huì',
+    0x74A5: 'jǐng',
+    0x74A6: 'ài',
+    0x74A7: 'bì',
+    0x74A8: 'càn',
+    0x74A9: 'qú',
+    0x74AA: 'zǎo',
+    0x74AB: 'dāng',
+    0x74AC: 'jiǎo',
+    0x74AD: 'gùn',
+    0x74AE: 'tǎn',
+    0x74AF: 'huì,kuài',
+    0x74B0: 'huán,huàn',
+    0x74B1: 'sè',
+    0x74B2: 'suì',
+    0x74B3: 'tián',
+    0x74B4: 'chǔ',
+    0x74B5: 'yú',
+    0x74B6: 'jìn',
+    0x74B7: 'lú,fū',
+    0x74B8: 'bīn,pián',
+    0x74B9: 'shú',
+    0x74BA: 'wèn',
+    0x74BB: 'zuǐ',
+    0x74BC: 'lán',
+    0x74BD: 'xǐ',
+    0x74BE: 'zī,jì',
+    0x74BF: 'xuán',
+    0x74C0: 'ruǎn',
+    0x74C1: 'wò',
+    0x74C2: 'gài',
+    0x74C3: 'léi',
+    0x74C4: 'dú',
+    0x74C5: 'lì',
+    0x74C6: 'zhì',
+    0x74C7: 'róu',
+    0x74C8: 'lí,li',
+    0x74C9: 'zàn',
+    0x74CA: 'qióng,xuán',
+    0x74CB: 'tì',
+    0x74CC: 'guī',
+    0x74CD: 'suí',
+    0x74CE: 'là',
+    0x74CF: 'lóng',
+    0x74D0: 'lú',
+    0x74D1: 'lì',
+    0x74D2: 'zàn',
+    0x74D3: 'làn',
+    0x74D4: 'yīng',
+    0x74D5: 'mí,xǐ',
+    0x74D6: 'xiāng',
+    0x74D7: 'qióng,wěi,wèi',
+    0x74D8: 'guàn',
+    0x74D9: 'dào',
+    0x74DA: 'zàn',
+    0x74DB: 'huán,yè,yǎn',
+    0x74DC: 'guā',
+    0x74DD: 'bó',
+    0x74DE: 'dié',
+    0x74DF: 'bó,páo',
+    0x74E0: 'hù,hú,huò,gū',
+    0x74E1: 'zhí,hú',
+    0x74E2: 'piáo',
+    0x74E3: 'bàn',
+    0x74E4: 'ráng',
+    0x74E5: 'lì',
+    0x74E6: 'wǎ,wà',
+    0x74E8: 'xiáng,hóng',
+    0x74E9: 'qiān,wǎ',
+    0x74EA: 'bǎn',
+    0x74EB: 'pén',
+    0x74EC: 'fǎng',
+    0x74ED: 'dǎn,dān',
+    0x74EE: 'wèng',
+    0x74EF: 'ōu',
+    0x74F2: 'wa',
+    0x74F3: 'hú',
+    0x74F4: 'líng',
+    0x74F5: 'yí',
+    0x74F6: 'píng',
+    0x74F7: 'cí',
+    0x74F8: 'bǎi',
+    0x74F9: 'juān,juàn',
+    0x74FA: 'cháng',
+    0x74FB: 'chī',
+    0x74FD: 'dàng',
+    0x74FE: 'měng',
+    0x74FF: 'bù,pǒu',
+    0x7500: 'zhuì',
+    0x7501: 'píng',
+    0x7502: 'biān',
+    0x7503: 'zhòu',
+    0x7504: 'zhēn,zhèn,juàn',
+    0x7506: 'cí',
+    0x7507: 'yīng',
+    0x7508: 'qì',
+    0x7509: 'xián',
+    0x750A: 'lǒu',
+    0x750B: 'dì',
+    0x750C: 'ōu,ǒu',
+    0x750D: 'méng',
+    0x750E: 'zhuān,chuán',
+    0x750F: 'bèng',
+    0x7510: 'lìn',
+    0x7511: 'zèng',
+    0x7512: 'wǔ',
+    0x7513: 'pì',
+    0x7514: 'dān,dàn',
+    0x7515: 'wèng',
+    0x7516: 'yīng',
+    0x7517: 'yǎn',
+    0x7518: 'gān,hān',
+    0x7519: 'dài',
+    0x751A: 'shén,shèn',
+    0x751B: 'tián',
+    0x751C: 'tián',
+    0x751D: 'hán',
+    0x751E: 'cháng',
+    0x751F: 'shēng',
+    0x7520: 'qíng',
+    0x7521: 'shēn',
+    0x7522: 'chǎn',
+    0x7523: 'chǎn',
+    0x7524: 'ruí',
+    0x7525: 'shēng',
+    0x7526: 'sū',
+    0x7527: 'shēn',
+    0x7528: 'yòng',
+    0x7529: 'shuǎi',
+    0x752A: 'lù',
+    0x752B: 'fǔ,fū,pǔ',
+    0x752C: 'yǒng,dòng',
+    0x752D: 'béng,qì',
+    0x752E: 'fèng',
+    0x752F: 'níng,nìng',
+    0x7530: 'tián',
+    0x7531: 'yóu,yāo',
+    0x7532: 'jiǎ',
+    0x7533: 'shēn',
+    0x7534: 'zhá,yóu',
+    0x7535: 'diàn',
+    0x7536: 'fú',
+    0x7537: 'nán',
+    0x7538: 'diān,diàn,tián,shèng,yìng',
+    0x7539: 'pīng',
+    0x753A: 'tīng,dīng,tǐng,zhèng,tiǎn',
+    0x753B: 'huà',
+    0x753C: 'tǐng',
+    0x753D: 'zhèn,quǎn,zhùn',
+    0x753E: 'zāi,zī',
+    0x753F: 'méng,máng',
+    0x7540: 'bì',
+    0x7541: 'bì',
+    0x7542: 'liù',
+    0x7543: 'xún',
+    0x7544: 'liú',
+    0x7545: 'chàng',
+    0x7546: 'mǔ',
+    0x7547: 'yún,tián',
+    0x7548: 'fàn',
+    0x7549: 'fú',
+    0x754A: 'gēng',
+    0x754B: 'tián',
+    0x754C: 'jiè',
+    0x754D: 'jiè',
+    0x754E: 'quǎn',
+    0x754F: 'wèi,wēi,wěi',
+    0x7550: 'fú,bì',
+    0x7551: 'tián',
+    0x7552: 'mǔ',
+    0x7553: 'duō',
+    0x7554: 'pàn',
+    0x7555: 'jiāng',
+    0x7556: 'wā',
+    0x7557: 'dá,fú',
+    0x7558: 'nán',
+    0x7559: 'liú,liù,liǔ',
+    0x755A: 'běn',
+    0x755B: 'zhěn',
+    0x755C: 'chù,xù',
+    0x755D: 'mǔ,mǒu',
+    0x755E: 'mǔ',
+    0x755F: 'cè,jì',
+    0x7560: 'tián',
+    0x7561: 'gāi',
+    0x7562: 'bì',
+    0x7563: 'dá',
+    0x7564: 'zhì,chóu,shì',
+    0x7565: 'lüè',
+    0x7566: 'qí',
+    0x7567: 'lüè',
+    0x7568: 'pān,fān',
+    0x7569: 'yī',
+    0x756A: 'fān,pān,fán,bō,pó,pán,pàn,pí',
+    0x756B: 'huà',
+    0x756C: 'shē,yú',
+    0x756D: 'yú',
+    0x756E: 'mǔ',
+    0x756F: 'jùn',
+    0x7570: 'yì',
+    0x7571: 'liú',
+    0x7572: 'shē',
+    0x7573: 'dié',
+    0x7574: 'chóu',
+    0x7575: 'huà',
+    0x7576: 'dāng,dàng,dang',
+    0x7577: 'zhuì',
+    0x7578: 'jī,qí',
+    0x7579: 'wǎn,yuǎn',
+    0x757A: 'jiāng,jiàng',
+    0x757B: 'chéng',
+    0x757C: 'chàng',
+    0x757D: 'tǔn,tuǎn',
+    0x757E: 'léi',
+    0x757F: 'jī',
+    0x7580: 'chā',
+    0x7581: 'liú',
+    0x7582: 'dié',
+    0x7583: 'tuǎn',
+    0x7584: 'lìn,lín',
+    0x7585: 'jiāng',
+    0x7586: 'jiāng,jiàng',
+    0x7587: 'chóu',
+    0x7588: 'pì',
+    0x7589: 'dié',
+    0x758A: 'dié',
+    0x758B: 'pǐ,shū,yǎ',
+    0x758C: 'jié,qiè',
+    0x758D: 'dàn',
+    0x758E: 'shū',
+    0x758F: 'shū',
+    0x7590: 'zhì,dì',
+    0x7591: 'yí,níng',
+    0x7592: 'nè',
+    0x7593: 'nǎi',
+    0x7594: 'dīng,nè',
+    0x7595: 'bǐ',
+    0x7596: 'jiē',
+    0x7597: 'liáo',
+    0x7598: 'gāng,gōng',
+    0x7599: 'gē,yì',
+    0x759A: 'jiù',
+    0x759B: 'zhǒu',
+    0x759C: 'xià',
+    0x759D: 'shàn',
+    0x759E: 'xū',
+    0x759F: 'nüè,yào',
+    0x75A0: 'lì',
+    0x75A1: 'yáng',
+    0x75A2: 'chèn',
+    0x75A3: 'yóu,yòu',
+    0x75A4: 'bā',
+    0x75A5: 'jiè',
+    0x75A6: 'jué,xuè',
+    0x75A7: 'qí',
+    0x75A8: 'xiā,yá',
+    0x75A9: 'cuì',
+    0x75AA: 'bì',
+    0x75AB: 'yì',
+    0x75AC: 'lì',
+    0x75AD: 'zòng',
+    0x75AE: 'chuāng',
+    0x75AF: 'fēng',
+    0x75B0: 'zhù',
+    0x75B1: 'pào',
+    0x75B2: 'pí',
+    0x75B3: 'gān',
+    0x75B4: 'kē,ē,qià',
+    0x75B5: 'cī,zī,zhài,jì',
+    0x75B6: 'xuē',
+    0x75B7: 'zhī',
+    0x75B8: 'dǎn,da',
+    0x75B9: 'zhěn,chèn',
+    0x75BA: 'fá,biǎn',
+    0x75BB: 'zhǐ',
+    0x75BC: 'téng',
+    0x75BD: 'jū,jǔ',
+    0x75BE: 'jí',
+    0x75BF: 'fèi',
+    0x75C0: 'jū,gōu',
+    0x75C1: 'shān',
+    0x75C2: 'jiā',
+    0x75C3: 'xuán',
+    0x75C4: 'zhà',
+    0x75C5: 'bìng',
+    0x75C6: 'niè,nì,niǎn',
+    0x75C7: 'zhèng,zhēng',
+    0x75C8: 'yōng',
+    0x75C9: 'jìng',
+    0x75CA: 'quán',
+    0x75CB: 'téng,chóng',
+    0x75CC: 'tōng,tóng',
+    0x75CD: 'yí',
+    0x75CE: 'jiē',
+    0x75CF: 'wěi,yòu,yù',
+    0x75D0: 'huí',
+    0x75D1: 'tān,shǐ',
+    0x75D2: 'yǎng,yáng',
+    0x75D3: 'chì',
+    0x75D4: 'zhì',
+    0x75D5: 'hén,gèn',
+    0x75D6: 'yǎ',
+    0x75D7: 'mèi',
+    0x75D8: 'dòu',
+    0x75D9: 'jìng',
+    0x75DA: 'xiāo',
+    0x75DB: 'tòng',
+    0x75DC: 'tū',
+    0x75DD: 'máng',
+    0x75DE: 'pǐ',
+    0x75DF: 'xiāo',
+    0x75E0: 'suān',
+    0x75E1: 'fū,pū,pù',
+    0x75E2: 'lì',
+    0x75E3: 'zhì',
+    0x75E4: 'cuó',
+    0x75E5: 'duó',
+    0x75E6: 'wù,pī',
+    0x75E7: 'shā',
+    0x75E8: 'láo',
+    0x75E9: 'shòu',
+    0x75EA: 'huàn,tuǎn',
+    0x75EB: 'xián',
+    0x75EC: 'yì',
+    0x75ED: 'bēng,péng,bìng',
+    0x75EE: 'zhàng',
+    0x75EF: 'guǎn',
+    0x75F0: 'tán',
+    0x75F1: 'fèi,féi,fěi',
+    0x75F2: 'má',
+    0x75F3: 'lín,lìn',
+    0x75F4: 'chī',
+    0x75F5: 'jì',
+    0x75F6: 'tiǎn,diǎn',
+    0x75F7: 'ān,yè,è',
+    0x75F8: 'chì',
+    0x75F9: 'bì',
+    0x75FA: 'bì',
+    0x75FB: 'mín',
+    0x75FC: 'gù',
+    0x75FD: 'duī',
+    0x75FE: 'ē,kē',
+    0x75FF: 'wěi',
+    0x7600: 'yū',
+    0x7601: 'cuì',
+    0x7602: 'yǎ',
+    0x7603: 'zhú',
+    0x7604: 'cù',
+    0x7605: 'dān,dàn',
+    0x7606: 'shèn',
+    0x7607: 'zhǒng',
+    0x7608: 'chì,zhì',
+    0x7609: 'yù',
+    0x760A: 'hóu',
+    0x760B: 'fēng',
+    0x760C: 'là',
+    0x760D: 'yáng,dàng',
+    0x760E: 'chén',
+    0x760F: 'tú',
+    0x7610: 'yǔ,yù',
+    0x7611: 'guō',
+    0x7612: 'wén',
+    0x7613: 'huàn',
+    0x7614: 'kù',
+    0x7615: 'jiǎ,xiā',
+    0x7616: 'yīn,yìn',
+    0x7617: 'yì',
+    0x7618: 'lòu',
+    0x7619: 'sào',
+    0x761A: 'jué',
+    0x761B: 'chì',
+    0x761C: 'xī',
+    0x761D: 'guān',
+    0x761E: 'yì',
+    0x761F: 'wēn,wò,yūn',
+    0x7620: 'jí',
+    0x7621: 'chuāng',
+    0x7622: 'bān',
+    0x7623: 'huì,lěi',
+    0x7624: 'liú',
+    0x7625: 'chài,cuó',
+    0x7626: 'shòu',
+    0x7627: 'nüè,yào',
+    0x7628: 'diān,chēn',
+    0x7629: 'dā,da,dá',
+    0x762A: 'biě,biē',
+    0x762B: 'tān',
+    0x762C: 'zhàng',
+    0x762D: 'biāo',
+    0x762E: 'shèn',
+    0x762F: 'cù',
+    0x7630: 'luǒ',
+    0x7631: 'yì',
+    0x7632: 'zòng',
+    0x7633: 'chōu,lù',
+    0x7634: 'zhàng',
+    0x7635: 'zhài,jì',
+    0x7636: 'sòu',
+    0x7637: 'sè',
+    0x7638: 'qué',
+    0x7639: 'diào',
+    0x763A: 'lòu',
+    0x763B: 'lòu,lǘ',
+    0x763C: 'mò',
+    0x763D: 'qín',
+    0x763E: 'yǐn',
+    0x763F: 'yǐng',
+    0x7640: 'huáng',
+    0x7641: 'fú',
+    0x7642: 'liáo,liào,shuò',
+    0x7643: 'lóng',
+    0x7644: 'qiáo',
+    0x7645: 'liú',
+    0x7646: 'láo,lào',
+    0x7647: 'xián',
+    0x7648: 'fèi',
+    0x7649: 'dān,dàn,dǎn,tán',
+    0x764A: 'yìn',
+    0x764B: 'hè',
+    0x764C: 'ái,yán',
+    0x764D: 'bān',
+    0x764E: 'xián',
+    0x764F: 'guān',
+    0x7650: 'guì,wēi',
+    0x7651: 'nòng,nóng',
+    0x7652: 'yù',
+    0x7653: 'wéi',
+    0x7654: 'yì',
+    0x7655: 'yōng',
+    0x7656: 'pǐ',
+    0x7657: 'lěi',
+    0x7658: 'lì,lài',
+    0x7659: 'shǔ',
+    0x765A: 'dàn',
+    0x765B: 'lǐn,bǐng',
+    0x765C: 'diàn',
+    0x765D: 'lǐn',
+    0x765E: 'lài',
+    0x765F: 'biě,bié,biē',
+    0x7660: 'jì',
+    0x7661: 'chī',
+    0x7662: 'yǎng',
+    0x7663: 'xuǎn',
+    0x7664: 'jiē',
+    0x7665: 'zhēng',
+    0x7666: 'me',
+    0x7667: 'lì',
+    0x7668: 'huò',
+    0x7669: 'lài,là',
+    0x766A: 'jī',
+    0x766B: 'diān',
+    0x766C: 'xuǎn',
+    0x766D: 'yǐng',
+    0x766E: 'yǐn',
+    0x766F: 'qú',
+    0x7670: 'yōng',
+    0x7671: 'tān',
+    0x7672: 'diān',
+    0x7673: 'luǒ',
+    0x7674: 'luán',
+    0x7675: 'luán',
+    0x7676: 'bō',
+    0x7677: 'bō',
+    0x7678: 'guǐ',
+    0x7679: 'bá',
+    0x767A: 'fā',
+    0x767B: 'dēng,dé',
+    0x767C: 'fā,bō',
+    0x767D: 'bái,bó',
+    0x767E: 'bǎi,bó,mò',
+    0x767F: 'qié,bié',
+    0x7680: 'jí,xiāng,bī',
+    0x7681: 'zào',
+    0x7682: 'zào',
+    0x7683: 'mào',
+    0x7684: 'de,dī,dí,dì',
+    0x7685: 'pā,bà',
+    0x7686: 'jiē',
+    0x7687: 'huáng,wǎng',
+    0x7688: 'guī',
+    0x7689: 'cǐ',
+    0x768A: 'líng',
+    0x768B: 'gāo,háo,gū',
+    0x768C: 'mò',
+    0x768D: 'jí',
+    0x768E: 'jiǎo',
+    0x768F: 'pěng',
+    0x7690: 'gāo',
+    0x7691: 'ái',
+    0x7692: 'é',
+    0x7693: 'hào,huī',
+    0x7694: 'hàn',
+    0x7695: 'bì',
+    0x7696: 'wǎn,huàn',
+    0x7697: 'chóu',
+    0x7698: 'qiàn',
+    0x7699: 'xī',
+    0x769A: 'ái',
+    0x769B: 'xiǎo,jiǎo,pò',
+    0x769C: 'hào',
+    0x769D: 'huàng',
+    0x769E: 'hào',
+    0x769F: 'zé',
+    0x76A0: 'cuǐ',
+    0x76A1: 'hào',
+    0x76A2: 'xiǎo',
+    0x76A3: 'yè',
+    0x76A4: 'pó,pán',
+    0x76A5: 'hào',
+    0x76A6: 'jiǎo',
+    0x76A7: 'ài',
+    0x76A8: 'xīng',
+    0x76A9: 'huàng',
+    0x76AA: 'lì,luò,bō',
+    0x76AB: 'piǎo',
+    0x76AC: 'hé',
+    0x76AD: 'jiào',
+    0x76AE: 'pí',
+    0x76AF: 'gǎn',
+    0x76B0: 'pào',
+    0x76B1: 'zhòu',
+    0x76B2: 'jūn',
+    0x76B3: 'qiú',
+    0x76B4: 'cūn',
+    0x76B5: 'què',
+    0x76B6: 'zhā',
+    0x76B7: 'gǔ',
+    0x76B8: 'jūn',
+    0x76B9: 'jūn',
+    0x76BA: 'zhòu,zhōu',
+    0x76BB: 'zhā,cǔ',
+    0x76BC: 'gǔ',
+    0x76BD: 'zhāo,zhǎn,dǎn',
+    0x76BE: 'dú',
+    0x76BF: 'mǐn,mǐng',
+    0x76C0: 'qǐ',
+    0x76C1: 'yíng',
+    0x76C2: 'yú',
+    0x76C3: 'bēi',
+    0x76C4: 'zhāo',
+    0x76C5: 'zhōng,chōng',
+    0x76C6: 'pén',
+    0x76C7: 'hé',
+    0x76C8: 'yíng',
+    0x76C9: 'hé',
+    0x76CA: 'yì',
+    0x76CB: 'bō',
+    0x76CC: 'wǎn',
+    0x76CD: 'hé,kě',
+    0x76CE: 'àng',
+    0x76CF: 'zhǎn',
+    0x76D0: 'yán',
+    0x76D1: 'jiān,jiàn',
+    0x76D2: 'hé,ān',
+    0x76D3: 'yū,wū',
+    0x76D4: 'kuī',
+    0x76D5: 'fàn',
+    0x76D6: 'gài,gě',
+    0x76D7: 'dào',
+    0x76D8: 'pán',
+    0x76D9: 'fǔ',
+    0x76DA: 'qiú',
+    0x76DB: 'shèng,chéng',
+    0x76DC: 'dào',
+    0x76DD: 'lù',
+    0x76DE: 'zhǎn',
+    0x76DF: 'méng,mèng,míng',
+    0x76E0: 'lí',
+    0x76E1: 'jǐn,jìn',
+    0x76E2: 'xù',
+    0x76E3: 'jiān,jiàn,kàn',
+    0x76E4: 'pán,xuán',
+    0x76E5: 'guàn',
+    0x76E6: 'ān',
+    0x76E7: 'lú,lǘ,léi',
+    0x76E8: 'xǔ',
+    0x76E9: 'zhōu,chóu',
+    0x76EA: 'dàng',
+    0x76EB: 'ān',
+    0x76EC: 'gǔ,gù,gū',
+    0x76ED: 'lì',
+    0x76EE: 'mù',
+    0x76EF: 'dīng,chéng',
+    0x76F0: 'gàn',
+    0x76F1: 'xū',
+    0x76F2: 'máng',
+    0x76F3: 'wàng,máng',
+    0x76F4: 'zhí',
+    0x76F5: 'qì',
+    0x76F6: 'yuǎn',
+    0x76F7: 'tián,xián,mín',
+    0x76F8: 'xiāng,xiàng',
+    0x76F9: 'dǔn,zhūn',
+    0x76FA: 'xīn',
+    0x76FB: 'xì,pǎn',
+    0x76FC: 'pàn,fén',
+    0x76FD: 'fēng',
+    0x76FE: 'dùn,shǔn,yǔn',
+    0x76FF: 'mín',
+    0x7700: 'míng',
+    0x7701: 'shěng,xǐng,xiǎn',
+    0x7702: 'shì',
+    0x7703: 'yún,hùn',
+    0x7704: 'miǎn,miàn',
+    0x7705: 'pān',
+    0x7706: 'fǎng',
+    0x7707: 'miǎo,miào',
+    0x7708: 'dān,chěn',
+    0x7709: 'méi',
+    0x770A: 'mào,mèi',
+    0x770B: 'kàn,kān',
+    0x770C: 'xiàn',
+    0x770D: 'kōu',
+    0x770E: 'shì',
+    0x770F: 'yāng,yǎng,yìng',
+    0x7710: 'zhēng',
+    0x7711: 'yǎo,āo,ǎo',
+    0x7712: 'shēn',
+    0x7713: 'huò',
+    0x7714: 'dà',
+    0x7715: 'zhěn',
+    0x7716: 'kuàng',
+    0x7717: 'jū,xū,kōu',
+    0x7718: 'shèn',
+    0x7719: 'yí,chì',
+    0x771A: 'shěng',
+    0x771B: 'mèi',
+    0x771C: 'mò,miè',
+    0x771D: 'zhù',
+    0x771E: 'zhēn',
+    0x771F: 'zhēn',
+    0x7720: 'mián,miǎn,mǐn',
+    0x7721: 'shì',
+    0x7722: 'yuān',
+    0x7723: 'dié,chōu',
+    0x7724: 'nì',
+    0x7725: 'zì',
+    0x7726: 'zì',
+    0x7727: 'chǎo',
+    0x7728: 'zhǎ',
+    0x7729: 'xuàn,huàn,juàn',
+    0x772A: 'bǐng,fǎng',
+    0x772B: 'mǐ,pàn',
+    0x772C: 'lóng',
+    0x772D: 'suī,huī,xié,wèi',
+    0x772E: 'tóng',
+    0x772F: 'mī,mí,mǐ,mì',
+    0x7730: 'diè,zhì',
+    0x7731: 'dì',
+    0x7732: 'nè',
+    0x7733: 'míng',
+    0x7734: 'xuàn,shùn,xún',
+    0x7735: 'chī',
+    0x7736: 'kuàng',
+    0x7737: 'juàn',
+    0x7738: 'móu',
+    0x7739: 'zhèn',
+    0x773A: 'tiào',
+    0x773B: 'yáng',
+    0x773C: 'yǎn,wěn',
+    0x773D: 'mò,mì',
+    0x773E: 'zhòng',
+    0x773F: 'mò',
+    0x7740: 'zhe,zhāo,zháo,zhuó',
+    0x7741: 'zhēng',
+    0x7742: 'méi',
+    0x7743: 'suō,jùn,juān',
+    0x7744: 'shào,qiáo,xiāo',
+    0x7745: 'hàn',
+    0x7746: 'huàn,huǎn',
+    0x7747: 'dì,tī,tí',
+    0x7748: 'chěng',
+    0x7749: 'cuó,zhuài',
+    0x774A: 'juàn',
+    0x774B: 'é',
+    0x774C: 'mǎn',
+    0x774D: 'xiàn',
+    0x774E: 'xī',
+    0x774F: 'kùn',
+    0x7750: 'lài',
+    0x7751: 'jiǎn',
+    0x7752: 'shǎn',
+    0x7753: 'tiǎn',
+    0x7754: 'gùn,huán,lǔn',
+    0x7755: 'wǎn,wàn,wān',
+    0x7756: 'lèng,chēng',
+    0x7757: 'shì',
+    0x7758: 'qióng',
+    0x7759: 'liè',
+    0x775A: 'yá',
+    0x775B: 'jīng,jǐng',
+    0x775C: 'zhēng',
+    0x775D: 'lí',
+    0x775E: 'lài',
+    0x775F: 'suì,zuì',
+    0x7760: 'juàn',
+    0x7761: 'shuì',
+    0x7762: 'suī,huī,wěi',
+    0x7763: 'dū',
+    0x7764: 'bì',
+    0x7765: 'pì',
+    0x7766: 'mù',
+    0x7767: 'hūn',
+    0x7768: 'nì',
+    0x7769: 'lù',
+    0x776A: 'yì,zé,dù,gāo',
+    0x776B: 'jié,shè',
+    0x776C: 'cǎi',
+    0x776D: 'zhǒu',
+    0x776E: 'yú',
+    0x776F: 'hūn',
+    0x7770: 'mà',
+    0x7771: 'xià,xiá',
+    0x7772: 'xǐng,xìng',
+    0x7773: 'huī',
+    0x7774: 'gùn',
+    0x7775: 'zāi',
+    0x7776: 'chǔn',
+    0x7777: 'jiān',
+    0x7778: 'mèi',
+    0x7779: 'dǔ',
+    0x777A: 'hóu',
+    0x777B: 'xuān',
+    0x777C: 'tiàn',
+    0x777D: 'kuí,kuì,jì',
+    0x777E: 'gāo,hào',
+    0x777F: 'ruì',
+    0x7780: 'mào,wú',
+    0x7781: 'xù',
+    0x7782: 'fá',
+    0x7783: 'wò',
+    0x7784: 'miáo',
+    0x7785: 'chǒu',
+    0x7786: 'kuì',
+    0x7787: 'mī,mǐ,mì',
+    0x7788: 'wěng',
+    0x7789: 'kòu,jì',
+    0x778A: 'dàng',
+    0x778B: 'chēn,tián,tiàn,shèn',
+    0x778C: 'kē',
+    0x778D: 'sǒu',
+    0x778E: 'xiā',
+    0x778F: 'qióng,huán',
+    0x7790: 'mò',
+    0x7791: 'míng,méng,mián',
+    0x7792: 'mán',
+    0x7793: 'shuì',
+    0x7794: 'zé',
+    0x7795: 'zhàng',
+    0x7796: 'yì',
+    0x7797: 'diāo,dōu',
+    0x7798: 'kōu',
+    0x7799: 'mò',
+    0x779A: 'shùn',
+    0x779B: 'cōng',
+    0x779C: 'lōu,lóu,lǘ',
+    0x779D: 'chī',
+    0x779E: 'mán,mén,mèn',
+    0x779F: 'piǎo,piào,piāo',
+    0x77A0: 'chēng,zhèng',
+    0x77A1: 'guī',
+    0x77A2: 'méng,máng,mèng',
+    0x77A3: 'wàn',
+    0x77A4: 'rún,shùn',
+    0x77A5: 'piē,bì',
+    0x77A6: 'xī',
+    0x77A7: 'qiáo',
+    0x77A8: 'pú',
+    0x77A9: 'zhǔ',
+    0x77AA: 'dèng',
+    0x77AB: 'shěn',
+    0x77AC: 'shùn',
+    0x77AD: 'liǎo,liào',
+    0x77AE: 'chè',
+    0x77AF: 'xián,jiàn',
+    0x77B0: 'kàn',
+    0x77B1: 'yè',
+    0x77B2: 'xù,xuè',
+    0x77B3: 'tóng',
+    0x77B4: 'móu,wǔ,mí',
+    0x77B5: 'lín,lìn,lián',
+    0x77B6: 'guì,wèi,kuì',
+    0x77B7: 'jiàn,xián',
+    0x77B8: 'yè',
+    0x77B9: 'ài',
+    0x77BA: 'huì',
+    0x77BB: 'zhān',
+    0x77BC: 'jiǎn',
+    0x77BD: 'gǔ',
+    0x77BE: 'zhào',
+    0x77BF: 'qú,jù,jí',
+    0x77C0: 'méi',
+    0x77C1: 'chǒu',
+    0x77C2: 'sào',
+    0x77C3: 'nǐng,chēng',
+    0x77C4: 'xūn',
+    0x77C5: 'yào',
+    0x77C6: 'huò,xuē,yuè,wò',
+    0x77C7: 'méng,měng,mēng',
+    0x77C8: 'mián',
+    0x77C9: 'pín',
+    0x77CA: 'mián',
+    0x77CB: 'lěi',
+    0x77CC: 'kuàng,guō',
+    0x77CD: 'jué',
+    0x77CE: 'xuān,xuàn',
+    0x77CF: 'mián',
+    0x77D0: 'huò',
+    0x77D1: 'lú',
+    0x77D2: 'méng',
+    0x77D3: 'lóng',
+    0x77D4: 'guàn,quán',
+    0x77D5: 'mǎn,mán',
+    0x77D6: 'xǐ,lí',
+    0x77D7: 'chù',
+    0x77D8: 'tǎng',
+    0x77D9: 'kàn',
+    0x77DA: 'zhǔ',
+    0x77DB: 'máo',
+    0x77DC: 'jīn,qín,guān',
+    0x77DD: 'jīn',
+    0x77DE: 'yù,jué,xù',
+    0x77DF: 'shuò',
+    0x77E0: 'zé,zhuó',
+    0x77E1: 'jué',
+    0x77E2: 'shǐ',
+    0x77E3: 'yǐ,xián',
+    0x77E4: 'shěn',
+    0x77E5: 'zhī,zhì',
+    0x77E6: 'hóu',
+    0x77E7: 'shěn',
+    0x77E8: 'yǐng',
+    0x77E9: 'jǔ',
+    0x77EA: 'zhōu',
+    0x77EB: 'jiǎo,jiáo',
+    0x77EC: 'cuó',
+    0x77ED: 'duǎn',
+    0x77EE: 'ǎi',
+    0x77EF: 'jiǎo,jiāo,jiáo',
+    0x77F0: 'zēng',
+    0x77F1: 'yuē',
+    0x77F2: 'bà',
+    0x77F3: 'shí,dàn',
+    0x77F4: 'dìng',
+    0x77F5: 'qì,diāo',
+    0x77F6: 'jī',
+    0x77F7: 'zǐ',
+    0x77F8: 'gān,gàn,gǎn,hàn',
+    0x77F9: 'wù',
+    0x77FA: 'zhé,dā',
+    0x77FB: 'kū,qià',
+    0x77FC: 'gāng,kòng,qiāng',
+    0x77FD: 'xì,xī',
+    0x77FE: 'fán',
+    0x77FF: 'kuàng',
+    0x7800: 'dàng',
+    0x7801: 'mǎ',
+    0x7802: 'shā',
+    0x7803: 'dān',
+    0x7804: 'jué',
+    0x7805: 'lì',
+    0x7806: 'fū',
+    0x7807: 'mín',
+    0x7808: 'ě',
+    0x7809: 'huò,huā,xū',
+    0x780A: 'kāng,kàng',
+    0x780B: 'zhǐ',
+    0x780C: 'qì,qiè',
+    0x780D: 'kǎn',
+    0x780E: 'jiè',
+    0x780F: 'bīn,fēn,pīn',
+    0x7810: 'è',
+    0x7811: 'yà',
+    0x7812: 'pī',
+    0x7813: 'zhé',
+    0x7814: 'yán,yàn,xíng',
+    0x7815: 'suì',
+    0x7816: 'zhuān',
+    0x7817: 'chē',
+    0x7818: 'dùn',
+    0x7819: 'wǎ',
+    0x781A: 'yàn',
+    0x781B: 'jīn',
+    0x781C: 'fēng',
+    0x781D: 'fá,fǎ,jié,gé',
+    0x781E: 'mò',
+    0x781F: 'zhǎ,zhà,zuó',
+    0x7820: 'jū,zū',
+    0x7821: 'yù',
+    0x7822: 'kē,luǒ',
+    0x7823: 'tuó',
+    0x7824: 'tuó',
+    0x7825: 'dǐ,zhǐ',
+    0x7826: 'zhài',
+    0x7827: 'zhēn',
+    0x7828: 'è',
+    0x7829: 'fú,fèi',
+    0x782A: 'mǔ',
+    0x782B: 'zhù,zhǔ',
+    0x782C: 'lá,lì,lā',
+    0x782D: 'biān',
+    0x782E: 'nǔ,nú',
+    0x782F: 'pīng',
+    0x7830: 'pēng,pīng,pèng',
+    0x7831: 'líng',
+    0x7832: 'pào,báo,pū',
+    0x7833: 'lè',
+    0x7834: 'pò',
+    0x7835: 'bō,è',
+    0x7836: 'pò',
+    0x7837: 'shēn',
+    0x7838: 'zá',
+    0x7839: 'ài',
+    0x783A: 'lì',
+    0x783B: 'lóng',
+    0x783C: 'tóng',
+    0x783D: 'yòng',
+    0x783E: 'lì',
+    0x783F: 'kuàng',
+    0x7840: 'chǔ',
+    0x7841: 'kēng',
+    0x7842: 'quán',
+    0x7843: 'zhū',
+    0x7844: 'kuāng,guāng',
+    0x7845: 'guī,hè',
+    0x7846: 'è',
+    0x7847: 'náo',
+    0x7848: 'qià',
+    0x7849: 'lù',
+    0x784A: 'wěi,huì,guì',
+    0x784B: 'ài',
+    0x784C: 'gè,luò,lì',
+    0x784D: 'xiàn,yín,kèn,kēng,yǐn',
+    0x784E: 'xíng,kēng',
+    0x784F: 'yán,yàn',
+    0x7850: 'dòng,tóng,liú',
+    0x7851: 'pēng,píng',
+    0x7852: 'xī',
+    0x7853: 'lǎo',
+    0x7854: 'hóng,gǒng',
+    0x7855: 'shuò',
+    0x7856: 'xiá',
+    0x7857: 'qiāo',
+    0x7858: 'qing',
+    0x7859: 'wéi,wèi',
+    0x785A: 'qiáo',
+    0x785B: 'yì',
+    0x785C: 'kēng,qìng',
+    0x785D: 'xiāo,qiào',
+    0x785E: 'què,kè,kù',
+    0x785F: 'chàn',
+    0x7860: 'láng',
+    0x7861: 'hōng',
+    0x7862: 'yú',
+    0x7863: 'xiāo',
+    0x7864: 'xiá',
+    0x7865: 'mǎng,bàng',
+    0x7866: 'luò,lòng',
+    0x7867: 'yǒng,tóng',
+    0x7868: 'chē',
+    0x7869: 'chè',
+    0x786A: 'wò,é,yǐ',
+    0x786B: 'liú,chù',
+    0x786C: 'yìng,gěng',
+    0x786D: 'máng',
+    0x786E: 'què',
+    0x786F: 'yàn',
+    0x7870: 'shā',
+    0x7871: 'kǔn',
+    0x7872: 'yù',
+    0x7873: 'chì',
+    0x7874: 'huā',
+    0x7875: 'lǔ',
+    0x7876: 'chěn,cén',
+    0x7877: 'jiǎn',
+    0x7878: 'nüè',
+    0x7879: 'sōng',
+    0x787A: 'zhuó',
+    0x787B: 'kēng,kěng',
+    0x787C: 'péng,pēng',
+    0x787D: 'yān,yǎn',
+    0x787E: 'zhuì,duǒ',
+    0x787F: 'kōng,kòng',
+    0x7880: 'chéng',
+    0x7881: 'qí',
+    0x7882: 'zòng,cóng',
+    0x7883: 'qìng',
+    0x7884: 'lín',
+    0x7885: 'jūn',
+    0x7886: 'bō',
+    0x7887: 'dìng',
+    0x7888: 'mín,hūn',
+    0x7889: 'diāo',
+    0x788A: 'jiān,zhàn',
+    0x788B: 'hè',
+    0x788C: 'lù,liù,luò',
+    0x788D: 'ài',
+    0x788E: 'suì',
+    0x788F: 'què,xī',
+    0x7890: 'léng',
+    0x7891: 'bēi',
+    0x7892: 'yín',
+    0x7893: 'duì,duī',
+    0x7894: 'wǔ',
+    0x7895: 'qí,qī,qǐ',
+    0x7896: 'lǔn,lùn,lún',
+    0x7897: 'wǎn',
+    0x7898: 'diǎn',
+    0x7899: 'náo,gāng',
+    0x789A: 'bèi',
+    0x789B: 'qì',
+    0x789C: 'chěn',
+    0x789D: 'ruǎn',
+    0x789E: 'yán',
+    0x789F: 'dié,shé',
+    0x78A0: 'dìng',
+    0x78A1: 'dú,zhóu',
+    0x78A2: 'tuó',
+    0x78A3: 'jié,kě,yà',
+    0x78A4: 'yīng',
+    0x78A5: 'biǎn',
+    0x78A6: 'kè',
+    0x78A7: 'bì',
+    0x78A8: 'wèi,wěi',
+    0x78A9: 'shuò',
+    0x78AA: 'zhēn,ǎn,kàn',
+    0x78AB: 'duàn',
+    0x78AC: 'xiá',
+    0x78AD: 'dàng',
+    0x78AE: 'tí,dī',
+    0x78AF: 'nǎo',
+    0x78B0: 'pèng',
+    0x78B1: 'jiǎn,xián',
+    0x78B2: 'dì',
+    0x78B3: 'tàn',
+    0x78B4: 'chá,chā',
+    0x78B5: 'tián',
+    0x78B6: 'qì',
+    0x78B7: 'dùn',
+    0x78B8: 'fēng',
+    0x78B9: 'xuàn',
+    0x78BA: 'què',
+    0x78BB: 'què,qiāo',
+    0x78BC: 'mǎ',
+    0x78BD: 'gōng',
+    0x78BE: 'niǎn',
+    0x78BF: 'sù,xiè',
+    0x78C0: 'é',
+    0x78C1: 'cí',
+    0x78C2: 'liú,liù',
+    0x78C3: 'sī,tí',
+    0x78C4: 'táng',
+    0x78C5: 'bàng,páng,pāng',
+    0x78C6: 'huá,kě,gū',
+    0x78C7: 'pī',
+    0x78C8: 'wěi,kuǐ',
+    0x78C9: 'sǎng',
+    0x78CA: 'lěi',
+    0x78CB: 'cuō',
+    0x78CC: 'tián',
+    0x78CD: 'xiá,qià,yà',
+    0x78CE: 'xī,qī',
+    0x78CF: 'lián,qiān',
+    0x78D0: 'pán',
+    0x78D1: 'wéi,wèi,ái,gài',
+    0x78D2: 'yǔn',
+    0x78D3: 'duī,zhuì',
+    0x78D4: 'zhé',
+    0x78D5: 'kē,kě',
+    0x78D6: 'lá,lā',
+    0x78D7: 'zhuān',
+    0x78D8: 'yáo',
+    0x78D9: 'gǔn',
+    0x78DA: 'zhuān,tuán,tuó',
+    0x78DB: 'chán',
+    0x78DC: 'qì,qī',
+    0x78DD: 'áo,qiāo',
+    0x78DE: 'pēng',
+    0x78DF: 'liù,lù',
+    0x78E0: 'lǔ',
+    0x78E1: 'kàn',
+    0x78E2: 'chuǎng',
+    0x78E3: 'chěn,cà',
+    0x78E4: 'yǐn,yīn',
+    0x78E5: 'lěi,léi',
+    0x78E6: 'biāo',
+    0x78E7: 'qì',
+    0x78E8: 'mó,mò',
+    0x78E9: 'qì,zhú',
+    0x78EA: 'cuī',
+    0x78EB: 'zōng',
+    0x78EC: 'qìng,qǐng',
+    0x78ED: 'chuò',
+    0x78EE: 'lún',
+    0x78EF: 'jī',
+    0x78F0: 'shàn',
+    0x78F1: 'láo',
+    0x78F2: 'qú',
+    0x78F3: 'zēng',
+    0x78F4: 'dèng,dēng',
+    0x78F5: 'jiàn',
+    0x78F6: 'xì',
+    0x78F7: 'lín,lìn,lǐn,líng',
+    0x78F8: 'dìng',
+    0x78F9: 'tán,diàn',
+    0x78FA: 'huáng,kuàng,gǒng',
+    0x78FB: 'pán,bō',
+    0x78FC: 'zá,shé',
+    0x78FD: 'qiāo,qiǎo,qiào,áo',
+    0x78FE: 'dī',
+    0x78FF: 'lì',
+    0x7900: 'jiàn',
+    0x7901: 'jiāo',
+    0x7902: 'xī',
+    0x7903: 'zhǎng',
+    0x7904: 'qiáo',
+    0x7905: 'dūn',
+    0x7906: 'jiǎn,xiǎn',
+    0x7907: 'yù',
+    0x7908: 'zhuì',
+    0x7909: 'hé,qiāo,qiào,áo',
+    0x790A: 'kè,huò',
+    0x790B: 'zé',
+    0x790C: 'léi,lèi,lěi',
+    0x790D: 'jié',
+    0x790E: 'chǔ',
+    0x790F: 'yè',
+    0x7910: 'què,hú',
+    0x7911: 'dàng',
+    0x7912: 'yǐ',
+    0x7913: 'jiāng',
+    0x7914: 'pī',
+    0x7915: 'pī',
+    0x7916: 'yù',
+    0x7917: 'pīn',
+    0x7918: 'è,qì',
+    0x7919: 'ài,yí',
+    0x791A: 'kē',
+    0x791B: 'jiān',
+    0x791C: 'yù',
+    0x791D: 'ruǎn',
+    0x791E: 'méng',
+    0x791F: 'pào',
+    0x7920: 'cí',
+    0x7921: 'bó',
+    0x7922: 'yǎng',
+    0x7923: 'mà',
+    0x7924: 'cǎ',
+    0x7925: 'xián,xín',
+    0x7926: 'kuàng,gǒng',
+    0x7927: 'léi,lèi,lěi',
+    0x7928: 'lěi',
+    0x7929: 'zhì',
+    0x792A: 'lì',
+    0x792B: 'lì,luò',
+    0x792C: 'fán',
+    0x792D: 'què',
+    0x792E: 'pào',
+    0x792F: 'yīng',
+    0x7930: 'lì',
+    0x7931: 'lóng',
+    0x7932: 'lóng',
+    0x7933: 'mò',
+    0x7934: 'bó',
+    0x7935: 'shuāng',
+    0x7936: 'guàn',
+    0x7937: 'lán',
+    0x7938: 'cǎ',
+    0x7939: 'yán,yǎn',
+    0x793A: 'shì,qí,zhì,shí',
+    0x793B: 'shì',
+    0x793C: 'lǐ',
+    0x793D: 'réng',
+    0x793E: 'shè',
+    0x793F: 'yuè',
+    0x7940: 'sì',
+    0x7941: 'qí,zhǐ',
+    0x7942: 'tā',
+    0x7943: 'mà',
+    0x7944: 'xiè',
+    0x7945: 'yāo',
+    0x7946: 'xiān',
+    0x7947: 'qí,chí,zhī,zhǐ',
+    0x7948: 'qí,guǐ',
+    0x7949: 'zhǐ',
+    0x794A: 'bēng,fāng',
+    0x794B: 'duì',
+    0x794C: 'zhòng,chōng',
+    0x794D: 'rèn',
+    0x794E: 'yī',
+    0x794F: 'shí',
+    0x7950: 'yòu',
+    0x7951: 'zhì',
+    0x7952: 'tiáo',
+    0x7953: 'fú,fèi',
+    0x7954: 'fù',
+    0x7955: 'mì,bì',
+    0x7956: 'zǔ,jiē',
+    0x7957: 'zhī',
+    0x7958: 'suàn',
+    0x7959: 'mèi',
+    0x795A: 'zuò',
+    0x795B: 'qū',
+    0x795C: 'hù',
+    0x795D: 'zhù,zhòu,chù',
+    0x795E: 'shén,shēn',
+    0x795F: 'suì',
+    0x7960: 'cí,sì',
+    0x7961: 'chái',
+    0x7962: 'mí,nǐ',
+    0x7963: 'lǚ',
+    0x7964: 'yǔ',
+    0x7965: 'xiáng',
+    0x7966: 'wú',
+    0x7967: 'tiāo',
+    0x7968: 'piào,piāo',
+    0x7969: 'zhù',
+    0x796A: 'guǐ',
+    0x796B: 'xiá',
+    0x796C: 'zhī',
+    0x796D: 'jì,zhài',
+    0x796E: 'gào',
+    0x796F: 'zhēn',
+    0x7970: 'gào',
+    0x7971: 'shuì,lèi',
+    0x7972: 'jìn',
+    0x7973: 'shèn',
+    0x7974: 'gāi',
+    0x7975: 'kǔn',
+    0x7976: 'dì',
+    0x7977: 'dǎo',
+    0x7978: 'huò',
+    0x7979: 'táo',
+    0x797A: 'qí',
+    0x797B: 'gù',
+    0x797C: 'guàn',
+    0x797D: 'zuì',
+    0x797E: 'líng',
+    0x797F: 'lù',
+    0x7980: 'bǐng',
+    0x7981: 'jìn,jīn',
+    0x7982: 'dǎo',
+    0x7983: 'zhí',
+    0x7984: 'lù',
+    0x7985: 'chán,shàn',
+    0x7986: 'bì',
+    0x7987: 'zhě',
+    0x7988: 'huī',
+    0x7989: 'yǒu',
+    0x798A: 'xì',
+    0x798B: 'yīn',
+    0x798C: 'zī',
+    0x798D: 'huò',
+    0x798E: 'zhēn,zhēng',
+    0x798F: 'fú,fù',
+    0x7990: 'yuàn',
+    0x7991: 'wú',
+    0x7992: 'xiǎn',
+    0x7993: 'yáng,shāng',
+    0x7994: 'zhī',
+    0x7995: 'yī',
+    0x7996: 'méi',
+    0x7997: 'sī',
+    0x7998: 'dì',
+    0x7999: 'bèi',
+    0x799A: 'zhuó',
+    0x799B: 'zhēn',
+    0x799C: 'yǒng,yíng',
+    0x799D: 'jì',
+    0x799E: 'gào',
+    0x799F: 'táng',
+    0x79A0: 'sī',
+    0x79A1: 'mà',
+    0x79A2: 'tà',
+    0x79A3: 'fù',
+    0x79A4: 'xuān',
+    0x79A5: 'qí',
+    0x79A6: 'yù',
+    0x79A7: 'xǐ,xī',
+    0x79A8: 'jī,jì,qí',
+    0x79A9: 'sì',
+    0x79AA: 'chán,shàn,tán',
+    0x79AB: 'dàn',
+    0x79AC: 'guì',
+    0x79AD: 'suì',
+    0x79AE: 'lǐ',
+    0x79AF: 'nóng',
+    0x79B0: 'mí,nǐ,xiǎn',
+    0x79B1: 'dǎo',
+    0x79B2: 'lì',
+    0x79B3: 'ráng',
+    0x79B4: 'yuè',
+    0x79B5: 'tí',
+    0x79B6: 'zàn',
+    0x79B7: 'lèi',
+    0x79B8: 'róu',
+    0x79B9: 'yǔ',
+    0x79BA: 'yú,yù',
+    0x79BB: 'lí,chī',
+    0x79BC: 'xiè',
+    0x79BD: 'qín',
+    0x79BE: 'hé',
+    0x79BF: 'tū',
+    0x79C0: 'xiù',
+    0x79C1: 'sī',
+    0x79C2: 'rén',
+    0x79C3: 'tū',
+    0x79C4: 'zǐ,zì',
+    0x79C5: 'chá,ná',
+    0x79C6: 'gǎn',
+    0x79C7: 'yì,zhí',
+    0x79C8: 'xiān',
+    0x79C9: 'bǐng',
+    0x79CA: 'nián',
+    0x79CB: 'qiū',
+    0x79CC: 'qiū',
+    0x79CD: 'zhǒng,chóng,zhòng',
+    0x79CE: 'fèn',
+    0x79CF: 'hào,mào',
+    0x79D0: 'yún',
+    0x79D1: 'kē,kè',
+    0x79D2: 'miǎo',
+    0x79D3: 'zhī',
+    0x79D4: 'jīng',
+    0x79D5: 'bǐ',
+    0x79D6: 'zhī',
+    0x79D7: 'yù',
+    0x79D8: 'mì,bì,bié',
+    0x79D9: 'kù',
+    0x79DA: 'bàn',
+    0x79DB: 'pī',
+    0x79DC: 'ní,nì',
+    0x79DD: 'lì',
+    0x79DE: 'yóu',
+    0x79DF: 'zū,jū',
+    0x79E0: 'pī',
+    0x79E1: 'bó',
+    0x79E2: 'líng',
+    0x79E3: 'mò',
+    0x79E4: 'chèng,chēng,píng',
+    0x79E5: 'nián',
+    0x79E6: 'qín',
+    0x79E7: 'yāng',
+    0x79E8: 'zuó',
+    0x79E9: 'zhì',
+    0x79EA: 'zhī',
+    0x79EB: 'shú',
+    0x79EC: 'jù',
+    0x79ED: 'zǐ',
+    0x79EE: 'huó',
+    0x79EF: 'jī,zhǐ',
+    0x79F0: 'chēng,chèn,chèng',
+    0x79F1: 'tóng',
+    0x79F2: 'zhì,shì',
+    0x79F3: 'huó,kuò',
+    0x79F4: 'hé,gé',
+    0x79F5: 'yīn',
+    0x79F6: 'zī',
+    0x79F7: 'zhì',
+    0x79F8: 'jiē,jí',
+    0x79F9: 'rěn',
+    0x79FA: 'dù',
+    0x79FB: 'yí,chǐ,yì',
+    0x79FC: 'zhū',
+    0x79FD: 'huì',
+    0x79FE: 'nóng',
+    0x79FF: 'fù,bū,pū',
+    0x7A00: 'xī',
+    0x7A01: 'gǎo',
+    0x7A02: 'láng',
+    0x7A03: 'fū',
+    0x7A04: 'xùn,zè',
+    0x7A05: 'shuì',
+    0x7A06: 'lǚ',
+    0x7A07: 'kǔn',
+    0x7A08: 'gǎn',
+    0x7A09: 'jīng',
+    0x7A0A: 'tí',
+    0x7A0B: 'chéng',
+    0x7A0C: 'tú,shǔ',
+    0x7A0D: 'shāo,shào',
+    0x7A0E: 'shuì,tuō,tuì,tuàn',
+    0x7A0F: 'yà',
+    0x7A10: 'lǔn',
+    0x7A11: 'lù',
+    0x7A12: 'gù',
+    0x7A13: 'zuó',
+    0x7A14: 'rěn',
+    0x7A15: 'zhùn,zhǔn',
+    0x7A16: 'bàng',
+    0x7A17: 'bài',
+    0x7A18: 'jī,qí',
+    0x7A19: 'zhī,zhì',
+    0x7A1A: 'zhì',
+    0x7A1B: 'kǔn',
+    0x7A1C: 'léng,lèng,líng',
+    0x7A1D: 'péng',
+    0x7A1E: 'kē,huà',
+    0x7A1F: 'bǐng,lǐn',
+    0x7A20: 'chóu,tiáo,diào',
+    0x7A21: 'zuì,zú,sū',
+    0x7A22: 'yù',
+    0x7A23: 'sū',
+    0x7A24: 'lüè',
+    0x7A25: 'xiāng',
+    0x7A26: 'yī',
+    0x7A27: 'xì,qiè',
+    0x7A28: 'biǎn',
+    0x7A29: 'jì',
+    0x7A2A: 'fú',
+    0x7A2B: 'pì,bì',
+    0x7A2C: 'nuò',
+    0x7A2D: 'jiē',
+    0x7A2E: 'zhǒng,chóng,zhòng',
+    0x7A2F: 'zōng,zǒng',
+    0x7A30: 'xǔ,xū',
+    0x7A31: 'chēng,chèn,chèng',
+    0x7A32: 'dào',
+    0x7A33: 'wěn',
+    0x7A34: 'xián,jiān,liàn,liǎn',
+    0x7A35: 'zī,jiū',
+    0x7A36: 'yù',
+    0x7A37: 'jì,zè',
+    0x7A38: 'xù',
+    0x7A39: 'zhěn,zhēn,biān',
+    0x7A3A: 'zhì',
+    0x7A3B: 'dào',
+    0x7A3C: 'jià',
+    0x7A3D: 'jī,qǐ',
+    0x7A3E: 'gǎo,kào,gào,jiào',
+    0x7A3F: 'gǎo',
+    0x7A40: 'gǔ',
+    0x7A41: 'róng',
+    0x7A42: 'suì',
+    0x7A43: 'rong',
+    0x7A44: 'jì',
+    0x7A45: 'kāng',
+    0x7A46: 'mù',
+    0x7A47: 'cǎn,shān,cēn',
+    0x7A48: 'méi,mén,mí',
+    0x7A49: 'zhì,chí,tí',
+    0x7A4A: 'jì',
+    0x7A4B: 'lù,jiū',
+    0x7A4C: 'sū',
+    0x7A4D: 'jī',
+    0x7A4E: 'yǐng',
+    0x7A4F: 'wěn',
+    0x7A50: 'qiū',
+    0x7A51: 'sè',
+    0x7A52: 'hè',
+    0x7A53: 'yì',
+    0x7A54: 'huáng',
+    0x7A55: 'qiè',
+    0x7A56: 'jǐ,jì',
+    0x7A57: 'suì',
+    0x7A58: 'xiāo,rào',
+    0x7A59: 'pú',
+    0x7A5A: 'jiāo',
+    0x7A5B: 'zhuō,bó',
+    0x7A5C: 'zhǒng,tóng,zhòng',
+    0x7A5D: 'zui',
+    0x7A5E: 'lǚ',
+    0x7A5F: 'suì',
+    0x7A60: 'nóng',
+    0x7A61: 'sè',
+    0x7A62: 'huì',
+    0x7A63: 'ráng',
+    0x7A64: 'nuò',
+    0x7A65: 'yù,yǔ',
+    0x7A66: 'pīn',
+    0x7A67: 'jì,zì',
+    0x7A68: 'tuí',
+    0x7A69: 'wěn',
+    0x7A6A: 'chēng,bié',
+    0x7A6B: 'huò,hù',
+    0x7A6C: 'kuàng',
+    0x7A6D: 'lǚ',
+    0x7A6E: 'biāo,pāo',
+    0x7A6F: 'sè',
+    0x7A70: 'ráng,rǎng,réng',
+    0x7A71: 'zhuō,jué',
+    0x7A72: 'lí',
+    0x7A73: 'cuán,zàn',
+    0x7A74: 'xué,jué',
+    0x7A75: 'wā,yà',
+    0x7A76: 'jiū,jiù',
+    0x7A77: 'qióng',
+    0x7A78: 'xī',
+    0x7A79: 'qióng,qiōng,kōng',
+    0x7A7A: 'kōng,kòng,kǒng',
+    0x7A7B: 'yū,yǔ',
+    0x7A7C: 'shēn',
+    0x7A7D: 'jǐng',
+    0x7A7E: 'yào,yǎo',
+    0x7A7F: 'chuān,chuàn,yuān',
+    0x7A80: 'zhūn,tún',
+    0x7A81: 'tū',
+    0x7A82: 'láo',
+    0x7A83: 'qiè',
+    0x7A84: 'zhǎi',
+    0x7A85: 'yǎo',
+    0x7A86: 'biǎn',
+    0x7A87: 'báo',
+    0x7A88: 'yǎo,yào',
+    0x7A89: 'bǐng',
+    0x7A8A: 'wā',
+    0x7A8B: 'zhú,kū',
+    0x7A8C: 'jiào,pào,liáo,liù',
+    0x7A8D: 'qiào',
+    0x7A8E: 'diào',
+    0x7A8F: 'wū',
+    0x7A90: 'guī,wā',
+    0x7A91: 'yáo',
+    0x7A92: 'zhì,dié',
+    0x7A93: 'chuāng',
+    0x7A94: 'yào,yǎo',
+    0x7A95: 'tiǎo,tiāo',
+    0x7A96: 'jiào,zào',
+    0x7A97: 'chuāng,cōng',
+    0x7A98: 'jiǒng',
+    0x7A99: 'xiāo',
+    0x7A9A: 'chéng',
+    0x7A9B: 'kòu',
+    0x7A9C: 'cuàn',
+    0x7A9D: 'wō',
+    0x7A9E: 'dàn',
+    0x7A9F: 'kū',
+    0x7AA0: 'kē',
+    0x7AA1: 'zhuó',
+    0x7AA2: 'xū',
+    0x7AA3: 'sū',
+    0x7AA4: 'guān',
+    0x7AA5: 'kuī',
+    0x7AA6: 'dòu',
+    0x7AA7: 'zhuo',
+    0x7AA8: 'xūn,yìn,yīn',
+    0x7AA9: 'wō',
+    0x7AAA: 'wā',
+    0x7AAB: 'yà,yē',
+    0x7AAC: 'yú,dōu',
+    0x7AAD: 'jù',
+    0x7AAE: 'qióng',
+    0x7AAF: 'yáo,yào,qiāo',
+    0x7AB0: 'yáo',
+    0x7AB1: 'tiǎo',
+    0x7AB2: 'cháo',
+    0x7AB3: 'yǔ,yú',
+    0x7AB4: 'tián',
+    0x7AB5: 'diào',
+    0x7AB6: 'jù,lóu',
+    0x7AB7: 'liào',
+    0x7AB8: 'xī',
+    0x7AB9: 'wù',
+    0x7ABA: 'kuī,kuǐ',
+    0x7ABB: 'chuāng',
+    0x7ABC: 'zhāo,kē',
+    0x7ABD: 'kuǎn',
+    0x7ABE: 'kuǎn,cuàn',
+    0x7ABF: 'lóng',
+    0x7AC0: 'chēng,chèng',
+    0x7AC1: 'cuì',
+    0x7AC2: 'liáo',
+    0x7AC3: 'zào',
+    0x7AC4: 'cuàn,cuān',
+    0x7AC5: 'qiào',
+    0x7AC6: 'qióng',
+    0x7AC7: 'dòu,dú',
+    0x7AC8: 'zào',
+    0x7AC9: 'lǒng',
+    0x7ACA: 'qiè',
+    0x7ACB: 'lì,wèi',
+    0x7ACC: 'chù',
+    0x7ACD: 'shí',
+    0x7ACE: 'fù',
+    0x7ACF: 'qiān',
+    0x7AD0: 'chù',
+    0x7AD1: 'hóng',
+    0x7AD2: 'qí',
+    0x7AD3: 'háo',
+    0x7AD4: 'shēng',
+    0x7AD5: 'fēn',
+    0x7AD6: 'shù',
+    0x7AD7: 'miào',
+    0x7AD8: 'qǔ,kǒu',
+    0x7AD9: 'zhàn,zhān',
+    0x7ADA: 'zhù',
+    0x7ADB: 'líng',
+    0x7ADC: 'lóng,néng',
+    0x7ADD: 'bìng',
+    0x7ADE: 'jìng',
+    0x7ADF: 'jìng',
+    0x7AE0: 'zhāng,zhàng',
+    0x7AE1: 'bǎi',
+    0x7AE2: 'sì',
+    0x7AE3: 'jùn',
+    0x7AE4: 'hóng',
+    0x7AE5: 'tóng,zhōng',
+    0x7AE6: 'sǒng',
+    0x7AE7: 'jìng,zhěn',
+    0x7AE8: 'diào',
+    0x7AE9: 'yì',
+    0x7AEA: 'shù',
+    0x7AEB: 'jìng',
+    0x7AEC: 'qǔ',
+    0x7AED: 'jié',
+    0x7AEE: 'pīng',
+    0x7AEF: 'duān',
+    0x7AF0: 'lí',
+    0x7AF1: 'zhuǎn',
+    0x7AF2: 'céng',
+    0x7AF3: 'dēng',
+    0x7AF4: 'cūn',
+    0x7AF5: 'wāi,huā',
+    0x7AF6: 'jìng',
+    0x7AF7: 'kǎn,kàn',
+    0x7AF8: 'jìng',
+    0x7AF9: 'zhú',
+    0x7AFA: 'zhú,dǔ',
+    0x7AFB: 'lè,jīn',
+    0x7AFC: 'péng',
+    0x7AFD: 'yú',
+    0x7AFE: 'chí',
+    0x7AFF: 'gān,gàn,gǎn',
+    0x7B00: 'máng',
+    0x7B01: 'zhú',
+    0x7B02: 'wán',
+    0x7B03: 'dǔ',
+    0x7B04: 'jī',
+    0x7B05: 'jiǎo',
+    0x7B06: 'bā',
+    0x7B07: 'suàn',
+    0x7B08: 'jí',
+    0x7B09: 'qǐn',
+    0x7B0A: 'zhào',
+    0x7B0B: 'sǔn',
+    0x7B0C: 'yá',
+    0x7B0D: 'zhuì,ruì',
+    0x7B0E: 'yuán',
+    0x7B0F: 'hù,wěn,wù',
+    0x7B10: 'háng,hàng',
+    0x7B11: 'xiào',
+    0x7B12: 'cén,jìn,hán',
+    0x7B13: 'bì,pí,bī',
+    0x7B14: 'bǐ',
+    0x7B15: 'jiǎn',
+    0x7B16: 'yǐ',
+    0x7B17: 'dōng',
+    0x7B18: 'shān',
+    0x7B19: 'shēng',
+    0x7B1A: 'dā,xiá,nà',
+    0x7B1B: 'dí',
+    0x7B1C: 'zhú',
+    0x7B1D: 'nà',
+    0x7B1E: 'chī',
+    0x7B1F: 'gū',
+    0x7B20: 'lì',
+    0x7B21: 'qiè',
+    0x7B22: 'mǐn',
+    0x7B23: 'bāo',
+    0x7B24: 'tiáo,shào',
+    0x7B25: 'sì',
+    0x7B26: 'fú',
+    0x7B27: 'cè,shàn',
+    0x7B28: 'bèn',
+    0x7B29: 'fá',
+    0x7B2A: 'dá',
+    0x7B2B: 'zǐ',
+    0x7B2C: 'dì',
+    0x7B2D: 'líng',
+    0x7B2E: 'zé,zuó,zhà',
+    0x7B2F: 'nú',
+    0x7B30: 'fú,fèi',
+    0x7B31: 'gǒu',
+    0x7B32: 'fán',
+    0x7B33: 'jiā',
+    0x7B34: 'gǎn',
+    0x7B35: 'fàn',
+    0x7B36: 'shǐ',
+    0x7B37: 'mǎo',
+    0x7B38: 'pǒ',
+    0x7B39: 'ti',
+    0x7B3A: 'jiān',
+    0x7B3B: 'qióng',
+    0x7B3C: 'lóng,lǒng',
+    0x7B3D: 'mǐn',
+    0x7B3E: 'biān',
+    0x7B3F: 'luò',
+    0x7B40: 'guì',
+    0x7B41: 'qū',
+    0x7B42: 'chí',
+    0x7B43: 'yīn',
+    0x7B44: 'yào',
+    0x7B45: 'xiǎn',
+    0x7B46: 'bǐ',
+    0x7B47: 'qióng',
+    0x7B48: 'kuò',
+    0x7B49: 'děng',
+    0x7B4A: 'xiáo,jiǎo,jiào',
+    0x7B4B: 'jīn,qián',
+    0x7B4C: 'quán',
+    0x7B4D: 'sǔn,yún,xùn',
+    0x7B4E: 'rú',
+    0x7B4F: 'fá',
+    0x7B50: 'kuāng',
+    0x7B51: 'zhù,zhú',
+    0x7B52: 'tǒng,dòng,tóng',
+    0x7B53: 'jī',
+    0x7B54: 'dá,dā',
+    0x7B55: 'háng',
+    0x7B56: 'cè',
+    0x7B57: 'zhòng',
+    0x7B58: 'kòu',
+    0x7B59: 'lái',
+    0x7B5A: 'bì',
+    0x7B5B: 'shāi',
+    0x7B5C: 'dāng',
+    0x7B5D: 'zhēng',
+    0x7B5E: 'cè',
+    0x7B5F: 'fū',
+    0x7B60: 'yún,jūn',
+    0x7B61: 'tú',
+    0x7B62: 'pá',
+    0x7B63: 'lí',
+    0x7B64: 'láng,làng',
+    0x7B65: 'jǔ',
+    0x7B66: 'guǎn',
+    0x7B67: 'jiǎn,xiàn',
+    0x7B68: 'hán',
+    0x7B69: 'tóng,tǒng,yǒng,dòng',
+    0x7B6A: 'xiá',
+    0x7B6B: 'zhì,zhǐ',
+    0x7B6C: 'chéng',
+    0x7B6D: 'suàn',
+    0x7B6E: 'shì',
+    0x7B6F: 'zhù',
+    0x7B70: 'zuó',
+    0x7B71: 'xiǎo',
+    0x7B72: 'shāo',
+    0x7B73: 'tíng',
+    0x7B74: 'cè,jiā,jiá',
+    0x7B75: 'yán',
+    0x7B76: 'gào,gǎo',
+    0x7B77: 'kuài',
+    0x7B78: 'gān',
+    0x7B79: 'chóu',
+    0x7B7A: 'kuāng',
+    0x7B7B: 'gàng',
+    0x7B7C: 'yún',
+    0x7B7D: 'o',
+    0x7B7E: 'qiān',
+    0x7B7F: 'xiǎo',
+    0x7B80: 'jiǎn',
+    0x7B81: 'póu,bù,fú,pú',
+    0x7B82: 'lái',
+    0x7B83: 'zōu',
+    0x7B84: 'bǐ,bēi,bī,bì,pái',
+    0x7B85: 'bì',
+    0x7B86: 'bì',
+    0x7B87: 'gè',
+    0x7B88: 'tái,chí',
+    0x7B89: 'guǎi,dài',
+    0x7B8A: 'yū',
+    0x7B8B: 'jiān',
+    0x7B8C: 'dào,zhào',
+    0x7B8D: 'gū',
+    0x7B8E: 'chí,hǔ',
+    0x7B8F: 'zhēng',
+    0x7B90: 'qìng,jīng,qiāng',
+    0x7B91: 'shà,zhá',
+    0x7B92: 'zhǒu',
+    0x7B93: 'lù',
+    0x7B94: 'bó',
+    0x7B95: 'jī',
+    0x7B96: 'lín,lǐn',
+    0x7B97: 'suàn',
+    0x7B98: 'jùn,qūn',
+    0x7B99: 'fú',
+    0x7B9A: 'zhá',
+    0x7B9B: 'gū',
+    0x7B9C: 'kōng',
+    0x7B9D: 'qián',
+    0x7B9E: 'qiān',
+    0x7B9F: 'jùn',
+    0x7BA0: 'chuí,zhuī',
+    0x7BA1: 'guǎn',
+    0x7BA2: 'yuān,wǎn',
+    0x7BA3: 'cè',
+    0x7BA4: 'zú',
+    0x7BA5: 'bǒ',
+    0x7BA6: 'zé',
+    0x7BA7: 'qiè',
+    0x7BA8: 'tuò',
+    0x7BA9: 'luó',
+    0x7BAA: 'dān',
+    0x7BAB: 'xiāo',
+    0x7BAC: 'ruò,nà',
+    0x7BAD: 'jiàn',
+    0x7BAE: 'xuān',
+    0x7BAF: 'biān',
+    0x7BB0: 'sǔn',
+    0x7BB1: 'xiāng',
+    0x7BB2: 'xiǎn',
+    0x7BB3: 'píng',
+    0x7BB4: 'zhēn,jiǎn',
+    0x7BB5: 'xīng,xǐng,shěng',
+    0x7BB6: 'hú',
+    0x7BB7: 'yí,shī',
+    0x7BB8: 'zhù,zhuó',
+    0x7BB9: 'yuē,yào,chuò',
+    0x7BBA: 'chūn',
+    0x7BBB: 'lǜ',
+    0x7BBC: 'wū',
+    0x7BBD: 'dǒng',
+    0x7BBE: 'shuò,xiāo,qiào',
+    0x7BBF: 'jí',
+    0x7BC0: 'jié,jiē',
+    0x7BC1: 'huáng',
+    0x7BC2: 'xīng',
+    0x7BC3: 'mèi',
+    0x7BC4: 'fàn',
+    0x7BC5: 'chuán,duān',
+    0x7BC6: 'zhuàn',
+    0x7BC7: 'piān',
+    0x7BC8: 'fēng',
+    0x7BC9: 'zhù,zhú',
+    0x7BCA: 'huáng,hóng',
+    0x7BCB: 'qiè',
+    0x7BCC: 'hóu',
+    0x7BCD: 'qiū',
+    0x7BCE: 'miǎo',
+    0x7BCF: 'qiàn',
+    0x7BD0: 'gū',
+    0x7BD1: 'kuì',
+    0x7BD2: 'shi',
+    0x7BD3: 'lǒu',
+    0x7BD4: 'yún,xūn',
+    0x7BD5: 'hé',
+    0x7BD6: 'táng',
+    0x7BD7: 'yuè',
+    0x7BD8: 'chōu',
+    0x7BD9: 'gāo',
+    0x7BDA: 'fěi',
+    0x7BDB: 'ruò',
+    0x7BDC: 'zhēng',
+    0x7BDD: 'gōu',
+    0x7BDE: 'niè',
+    0x7BDF: 'qiàn',
+    0x7BE0: 'xiǎo',
+    0x7BE1: 'cuàn',
+    0x7BE2: 'lǒng,gōng,gǎn',
+    0x7BE3: 'péng,páng',
+    0x7BE4: 'dǔ',
+    0x7BE5: 'lì',
+    0x7BE6: 'bì,pí',
+    0x7BE7: 'zhuó,huò',
+    0x7BE8: 'chú',
+    0x7BE9: 'shāi,shī',
+    0x7BEA: 'chí',
+    0x7BEB: 'zhù',
+    0x7BEC: 'qiāng,cāng',
+    0x7BED: 'lóng',
+    0x7BEE: 'lán',
+    0x7BEF: 'jiān',
+    0x7BF0: 'bù',
+    0x7BF1: 'lí',
+    0x7BF2: 'huì,suì',
+    0x7BF3: 'bì',
+    0x7BF4: 'dí,zhú',
+    0x7BF5: 'cōng',
+    0x7BF6: 'yān',
+    0x7BF7: 'péng',
+    0x7BF8: 'cǎn,cēn,zān',
+    0x7BF9: 'zhuàn,suǎn,zuǎn',
+    0x7BFA: 'pí',
+    0x7BFB: 'piǎo,biāo',
+    0x7BFC: 'dōu',
+    0x7BFD: 'yù',
+    0x7BFE: 'miè',
+    0x7BFF: 'tuán,zhuān',
+    0x7C00: 'zé,zhài',
+    0x7C01: 'shāi',
+    0x7C02: 'guì,guó',
+    0x7C03: 'yí',
+    0x7C04: 'hù',
+    0x7C05: 'chǎn',
+    0x7C06: 'kòu',
+    0x7C07: 'cù,chuò,còu',
+    0x7C08: 'píng',
+    0x7C09: 'zào,chòu',
+    0x7C0A: 'jī',
+    0x7C0B: 'guǐ',
+    0x7C0C: 'sù',
+    0x7C0D: 'lǒu,lǚ,jù',
+    0x7C0E: 'cè,jí',
+    0x7C0F: 'lù',
+    0x7C10: 'niǎn',
+    0x7C11: 'suō',
+    0x7C12: 'cuàn',
+    0x7C13: 'diāo',
+    0x7C14: 'suō',
+    0x7C15: 'lè',
+    0x7C16: 'duàn',
+    0x7C17: 'zhù',
+    0x7C18: 'xiāo',
+    0x7C19: 'bó',
+    0x7C1A: 'mì',
+    0x7C1B: 'shāi,sī',
+    0x7C1C: 'dàng,tāng',
+    0x7C1D: 'liáo',
+    0x7C1E: 'dān',
+    0x7C1F: 'diàn',
+    0x7C20: 'fǔ',
+    0x7C21: 'jiǎn',
+    0x7C22: 'mǐn',
+    0x7C23: 'kuì',
+    0x7C24: 'dài',
+    0x7C25: 'jiāo',
+    0x7C26: 'dēng',
+    0x7C27: 'huáng',
+    0x7C28: 'sǔn,zhuàn',
+    0x7C29: 'láo',
+    0x7C2A: 'zān,zǎn',
+    0x7C2B: 'xiāo,xiǎo',
+    0x7C2C: 'lù',
+    0x7C2D: 'shì',
+    0x7C2E: 'zān',
+    0x7C2F: 'qi',
+    0x7C30: 'pái',
+    0x7C31: 'qí',
+    0x7C32: 'pái',
+    0x7C33: 'gǎn,gàn',
+    0x7C34: 'jù',
+    0x7C35: 'lù',
+    0x7C36: 'lù',
+    0x7C37: 'yán',
+    0x7C38: 'bǒ,bò',
+    0x7C39: 'dāng',
+    0x7C3A: 'sài',
+    0x7C3B: 'zhuā,kē',
+    0x7C3C: 'gōu',
+    0x7C3D: 'qiān',
+    0x7C3E: 'lián',
+    0x7C3F: 'bù,bó',
+    0x7C40: 'zhòu',
+    0x7C41: 'lài',
+    0x7C42: 'shi',
+    0x7C43: 'lán',
+    0x7C44: 'kuì',
+    0x7C45: 'yú',
+    0x7C46: 'yuè',
+    0x7C47: 'háo',
+    0x7C48: 'zhēn,jiān',
+    0x7C49: 'tái',
+    0x7C4A: 'tì',
+    0x7C4B: 'niè,mí',
+    0x7C4C: 'chóu,táo',
+    0x7C4D: 'jí,jiè',
+    0x7C4E: 'yí',
+    0x7C4F: 'qí',
+    0x7C50: 'téng',
+    0x7C51: 'zhuàn,zuǎn',
+    0x7C52: 'zhòu',
+    0x7C53: 'fān,bān,pān',
+    0x7C54: 'sǒu,shǔ',
+    0x7C55: 'zhòu',
+    0x7C56: 'qian',
+    0x7C57: 'zhuó',
+    0x7C58: 'téng',
+    0x7C59: 'lù',
+    0x7C5A: 'lú',
+    0x7C5B: 'jiǎn,jiān',
+    0x7C5C: 'tuò',
+    0x7C5D: 'yíng',
+    0x7C5E: 'yù',
+    0x7C5F: 'lài',
+    0x7C60: 'lóng,lǒng',
+    0x7C61: 'qiè',
+    0x7C62: 'lián',
+    0x7C63: 'lán',
+    0x7C64: 'qiān',
+    0x7C65: 'yuè',
+    0x7C66: 'zhōng',
+    0x7C67: 'qú,jǔ',
+    0x7C68: 'lián',
+    0x7C69: 'biān',
+    0x7C6A: 'duàn',
+    0x7C6B: 'zuǎn',
+    0x7C6C: 'lí',
+    0x7C6D: 'sī',
+    0x7C6E: 'luó',
+    0x7C6F: 'yíng',
+    0x7C70: 'yuè',
+    0x7C71: 'zhuó',
+    0x7C72: 'yù',
+    0x7C73: 'mǐ',
+    0x7C74: 'dí,zá',
+    0x7C75: 'fán',
+    0x7C76: 'shēn',
+    0x7C77: 'zhé',
+    0x7C78: 'shēn',
+    0x7C79: 'nǚ',
+    0x7C7A: 'hé',
+    0x7C7B: 'lèi',
+    0x7C7C: 'xiān',
+    0x7C7D: 'zǐ',
+    0x7C7E: 'ní',
+    0x7C7F: 'cùn',
+    0x7C80: 'zhàng',
+    0x7C81: 'qiān',
+    0x7C82: 'zhāi',
+    0x7C83: 'bǐ,pī',
+    0x7C84: 'bǎn',
+    0x7C85: 'wù',
+    0x7C86: 'shā,chǎo',
+    0x7C87: 'kāng,jīng',
+    0x7C88: 'róu',
+    0x7C89: 'fěn',
+    0x7C8A: 'bì',
+    0x7C8B: 'cuì',
+    0x7C8C: 'yin',
+    0x7C8D: 'zhé',
+    0x7C8E: 'mǐ',
+    0x7C8F: 'tai',
+    0x7C90: 'hù',
+    0x7C91: 'bā',
+    0x7C92: 'lì',
+    0x7C93: 'gān',
+    0x7C94: 'jù',
+    0x7C95: 'pò',
+    0x7C96: 'mò',
+    0x7C97: 'cū',
+    0x7C98: 'zhān,nián',
+    0x7C99: 'zhòu',
+    0x7C9A: 'chī',
+    0x7C9B: 'sù',
+    0x7C9C: 'tiào',
+    0x7C9D: 'lì',
+    0x7C9E: 'xī',
+    0x7C9F: 'sù',
+    0x7CA0: 'hóng',
+    0x7CA1: 'tóng',
+    0x7CA2: 'zī,cí,jì',
+    0x7CA3: 'cè,sè',
+    0x7CA4: 'yuè',
+    0x7CA5: 'zhōu,yù',
+    0x7CA6: 'lín',
+    0x7CA7: 'zhuāng',
+    0x7CA8: 'bǎi',
+    0x7CA9: 'lāo',
+    0x7CAA: 'fèn',
+    0x7CAB: 'ér',
+    0x7CAC: 'qū',
+    0x7CAD: 'hé',
+    0x7CAE: 'liáng',
+    0x7CAF: 'xiàn',
+    0x7CB0: 'fú,fū',
+    0x7CB1: 'liáng',
+    0x7CB2: 'càn',
+    0x7CB3: 'jīng',
+    0x7CB4: 'lǐ',
+    0x7CB5: 'yuè',
+    0x7CB6: 'lù',
+    0x7CB7: 'jú',
+    0x7CB8: 'qí',
+    0x7CB9: 'cuì,suì',
+    0x7CBA: 'bài',
+    0x7CBB: 'zhāng',
+    0x7CBC: 'lín,lǐn',
+    0x7CBD: 'zòng',
+    0x7CBE: 'jīng,qíng,jìng',
+    0x7CBF: 'guǒ,huà',
+    0x7CC0: 'huā',
+    0x7CC1: 'sǎn,shēn',
+    0x7CC2: 'sǎn',
+    0x7CC3: 'táng',
+    0x7CC4: 'biǎn,biān',
+    0x7CC5: 'róu',
+    0x7CC6: 'miàn',
+    0x7CC7: 'hóu',
+    0x7CC8: 'xǔ',
+    0x7CC9: 'zòng',
+    0x7CCA: 'hú,hū,hù',
+    0x7CCB: 'jiàn',
+    0x7CCC: 'zān',
+    0x7CCD: 'cí',
+    0x7CCE: 'lí',
+    0x7CCF: 'xiè',
+    0x7CD0: 'fū',
+    0x7CD1: 'nuò',
+    0x7CD2: 'bèi',
+    0x7CD3: 'gǔ',
+    0x7CD4: 'xiǔ',
+    0x7CD5: 'gāo',
+    0x7CD6: 'táng',
+    0x7CD7: 'qiǔ',
+    0x7CD8: 'jiā',
+    0x7CD9: 'cāo',
+    0x7CDA: 'zhuāng',
+    0x7CDB: 'táng',
+    0x7CDC: 'mí,méi',
+    0x7CDD: 'sǎn,sān,shēn',
+    0x7CDE: 'fèn',
+    0x7CDF: 'zāo',
+    0x7CE0: 'kāng',
+    0x7CE1: 'jiàng',
+    0x7CE2: 'mó',
+    0x7CE3: 'sǎn',
+    0x7CE4: 'sǎn',
+    0x7CE5: 'nuò',
+    0x7CE6: 'xī',
+    0x7CE7: 'liáng',
+    0x7CE8: 'jiàng,jiāng',
+    0x7CE9: 'kuài',
+    0x7CEA: 'bò',
+    0x7CEB: 'huán',
+    0x7CEC: 'shǔ',
+    0x7CED: 'zòng',
+    0x7CEE: 'xiàn',
+    0x7CEF: 'nuò',
+    0x7CF0: 'tuán',
+    0x7CF1: 'niè',
+    0x7CF2: 'lì',
+    0x7CF3: 'zuò',
+    0x7CF4: 'dí',
+    0x7CF5: 'niè',
+    0x7CF6: 'tiào,diào',
+    0x7CF7: 'làn',
+    0x7CF8: 'mì,sī',
+    0x7CF9: 'sī',
+    0x7CFA: 'jiū,jiǔ',
+    0x7CFB: 'xì,jì',
+    0x7CFC: 'gōng',
+    0x7CFD: 'zhěng,zhēng',
+    0x7CFE: 'jiū,jiǎo',
+    0x7CFF: 'yòu',
+    0x7D00: 'jì,jǐ',
+    0x7D01: 'chà',
+    0x7D02: 'zhòu',
+    0x7D03: 'xún',
+    0x7D04: 'yuē,yāo,yào,dì',
+    0x7D05: 'hóng,gōng,jiàng',
+    0x7D06: 'yū,ōu',
+    0x7D07: 'hé,gē,jié',
+    0x7D08: 'wán',
+    0x7D09: 'rèn',
+    0x7D0A: 'wěn,wèn',
+    0x7D0B: 'wén,wèn',
+    0x7D0C: 'qiú',
+    0x7D0D: 'nà',
+    0x7D0E: 'zī',
+    0x7D0F: 'tǒu',
+    0x7D10: 'niǔ',
+    0x7D11: 'fóu',
+    0x7D12: 'jì,jié,jiè',
+    0x7D13: 'shū',
+    0x7D14: 'chún,zhǔn,tún,quán,zī,zhūn',
+    0x7D15: 'pī,pí,bǐ,bī,bì,chǐ',
+    0x7D16: 'zhèn',
+    0x7D17: 'shā,miǎo',
+    0x7D18: 'hóng',
+    0x7D19: 'zhǐ',
+    0x7D1A: 'jí',
+    0x7D1B: 'fēn',
+    0x7D1C: 'yún',
+    0x7D1D: 'rèn',
+    0x7D1E: 'dǎn',
+    0x7D1F: 'jīn,jìn',
+    0x7D20: 'sù',
+    0x7D21: 'fǎng,bǎng,fàng',
+    0x7D22: 'suǒ',
+    0x7D23: 'cuì',
+    0x7D24: 'jiǔ',
+    0x7D25: 'zā,zhā',
+    0x7D26: 'ba',
+    0x7D27: 'jǐn',
+    0x7D28: 'fū,fù',
+    0x7D29: 'zhì',
+    0x7D2A: 'qī',
+    0x7D2B: 'zǐ',
+    0x7D2C: 'chóu,chōu,zhòu',
+    0x7D2D: 'hóng',
+    0x7D2E: 'zā,zhā',
+    0x7D2F: 'lèi,léi,lěi,lǜ,liè',
+    0x7D30: 'xì',
+    0x7D31: 'fú',
+    0x7D32: 'xiè,yì',
+    0x7D33: 'shēn',
+    0x7D34: 'bō,bì',
+    0x7D35: 'zhù,shū',
+    0x7D36: 'qū,qǔ',
+    0x7D37: 'líng',
+    0x7D38: 'zhù',
+    0x7D39: 'shào,chāo',
+    0x7D3A: 'gàn',
+    0x7D3B: 'yǎng',
+    0x7D3C: 'fú,fèi',
+    0x7D3D: 'tuó',
+    0x7D3E: 'zhěn,tiǎn,jǐn',
+    0x7D3F: 'dài',
+    0x7D40: 'chù',
+    0x7D41: 'shī',
+    0x7D42: 'zhōng',
+    0x7D43: 'xián,xuàn',
+    0x7D44: 'zǔ,qū',
+    0x7D45: 'jiōng,jiǒng',
+    0x7D46: 'bàn',
+    0x7D47: 'qú',
+    0x7D48: 'mò',
+    0x7D49: 'shù',
+    0x7D4A: 'zuì',
+    0x7D4B: 'kuàng',
+    0x7D4C: 'jīng',
+    0x7D4D: 'rèn',
+    0x7D4E: 'háng',
+    0x7D4F: 'xiè,yì',
+    0x7D50: 'jié,jì,jiē',
+    0x7D51: 'zhū',
+    0x7D52: 'chóu',
+    0x7D53: 'guà,kuā',
+    0x7D54: 'bǎi,mò',
+    0x7D55: 'jué',
+    0x7D56: 'kuàng',
+    0x7D57: 'hú',
+    0x7D58: 'cì',
+    0x7D59: 'huán,gēng',
+    0x7D5A: 'gēng',
+    0x7D5B: 'tāo',
+    0x7D5C: 'jié,xié,qià,jiá,qì',
+    0x7D5D: 'kù',
+    0x7D5E: 'jiǎo,xiáo,jiào',
+    0x7D5F: 'quán',
+    0x7D60: 'gǎi,ǎi',
+    0x7D61: 'luò,lào',
+    0x7D62: 'xuàn,xún',
+    0x7D63: 'bēng,bīng,pēng',
+    0x7D64: 'xiàn',
+    0x7D65: 'fú',
+    0x7D66: 'gěi,jǐ,xiá',
+    0x7D67: 'dòng,tóng,tōng',
+    0x7D68: 'róng',
+    0x7D69: 'tiào,diào,dào',
+    0x7D6A: 'yīn',
+    0x7D6B: 'lěi',
+    0x7D6C: 'xiè',
+    0x7D6D: 'juàn',
+    0x7D6E: 'xù,chù,nǜ,nà',
+    0x7D6F: 'gāi,hài',
+    0x7D70: 'dié',
+    0x7D71: 'tǒng',
+    0x7D72: 'sī',
+    0x7D73: 'jiàng',
+    0x7D74: 'xiáng',
+    0x7D75: 'huì',
+    0x7D76: 'jué',
+    0x7D77: 'zhí',
+    0x7D78: 'jiǎn',
+    0x7D79: 'juàn,xuàn',
+    0x7D7A: 'chī,zhǐ',
+    0x7D7B: 'miǎn,wèn,mán,wàn',
+    0x7D7C: 'zhèn',
+    0x7D7D: 'lǚ',
+    0x7D7E: 'chéng',
+    0x7D7F: 'qiú',
+    0x7D80: 'shū',
+    0x7D81: 'bǎng',
+    0x7D82: 'tǒng',
+    0x7D83: 'xiāo,shāo',
+    0x7D84: 'huán,huàn,wàn',
+    0x7D85: 'qīn,xiān',
+    0x7D86: 'gěng,bǐng',
+    0x7D87: 'xiǔ',
+    0x7D88: 'tí,tì',
+    0x7D89: 'tòu,xiù',
+    0x7D8A: 'xié',
+    0x7D8B: 'hóng',
+    0x7D8C: 'xì',
+    0x7D8D: 'fú',
+    0x7D8E: 'tīng',
+    0x7D8F: 'suī,suí,shuāi,ruí,tuǒ',
+    0x7D90: 'duì',
+    0x7D91: 'kǔn',
+    0x7D92: 'fū',
+    0x7D93: 'jīng,jìng',
+    0x7D94: 'hù',
+    0x7D95: 'zhī',
+    0x7D96: 'yán,xiàn',
+    0x7D97: 'jiǒng',
+    0x7D98: 'féng',
+    0x7D99: 'jì',
+    0x7D9A: 'xù',
+    0x7D9B: 'rěn',
+    0x7D9C: 'zōng,zèng,zòng',
+    0x7D9D: 'chēn,shēn,lín',
+    0x7D9E: 'duǒ',
+    0x7D9F: 'lì,liè',
+    0x7DA0: 'lǜ',
+    0x7DA1: 'liáng',
+    0x7DA2: 'chóu,tāo,diào',
+    0x7DA3: 'quǎn',
+    0x7DA4: 'shào',
+    0x7DA5: 'qí',
+    0x7DA6: 'qí,qì',
+    0x7DA7: 'zhǔn,zhùn',
+    0x7DA8: 'qí',
+    0x7DA9: 'wǎn',
+    0x7DAA: 'qiàn,qīng,zhēng',
+    0x7DAB: 'xiàn',
+    0x7DAC: 'shòu',
+    0x7DAD: 'wéi,yí',
+    0x7DAE: 'qǐ,qìng,qǐng',
+    0x7DAF: 'táo',
+    0x7DB0: 'wǎn',
+    0x7DB1: 'gāng',
+    0x7DB2: 'wǎng',
+    0x7DB3: 'bēng',
+    0x7DB4: 'zhuì,chuò',
+    0x7DB5: 'cǎi',
+    0x7DB6: 'guǒ',
+    0x7DB7: 'cuì,zú',
+    0x7DB8: 'lún,guān',
+    0x7DB9: 'liǔ',
+    0x7DBA: 'qǐ,yǐ',
+    0x7DBB: 'zhàn',
+    0x7DBC: 'bì',
+    0x7DBD: 'chuò,chāo',
+    0x7DBE: 'líng',
+    0x7DBF: 'mián',
+    0x7DC0: 'qī',
+    0x7DC1: 'qiè',
+    0x7DC2: 'tián,tǎn,chān',
+    0x7DC3: 'zōng',
+    0x7DC4: 'gǔn,hùn,hún',
+    0x7DC5: 'zōu',
+    0x7DC6: 'xī',
+    0x7DC7: 'zī',
+    0x7DC8: 'xìng',
+    0x7DC9: 'liǎng',
+    0x7DCA: 'jǐn',
+    0x7DCB: 'fēi',
+    0x7DCC: 'ruí',
+    0x7DCD: 'mín',
+    0x7DCE: 'yù',
+    0x7DCF: 'zǒng,cōng',
+    0x7DD0: 'fán',
+    0x7DD1: 'lǜ,lù',
+    0x7DD2: 'xù',
+    0x7DD3: 'yīng',
+    0x7DD4: 'shàng',
+    0x7DD5: 'qi',
+    0x7DD6: 'xù',
+    0x7DD7: 'xiāng',
+    0x7DD8: 'jiān',
+    0x7DD9: 'kè',
+    0x7DDA: 'xiàn',
+    0x7DDB: 'ruǎn,ruàn',
+    0x7DDC: 'mián',
+    0x7DDD: 'jī,qì,qī,jí',
+    0x7DDE: 'duàn',
+    0x7DDF: 'chóng,zhòng',
+    0x7DE0: 'dì',
+    0x7DE1: 'mín,mǐn,mián,hún',
+    0x7DE2: 'miáo,máo',
+    0x7DE3: 'yuán,yuàn',
+    0x7DE4: 'xiè,yè',
+    0x7DE5: 'bǎo',
+    0x7DE6: 'sī',
+    0x7DE7: 'qiū',
+    0x7DE8: 'biān,biǎn,biàn',
+    0x7DE9: 'huǎn',
+    0x7DEA: 'gēng,gèng',
+    0x7DEB: 'cōng',
+    0x7DEC: 'miǎn',
+    0x7DED: 'wèi',
+    0x7DEE: 'fù',
+    0x7DEF: 'wěi',
+    0x7DF0: 'tóu,xū,yú',
+    0x7DF1: 'gōu',
+    0x7DF2: 'miǎo',
+    0x7DF3: 'xié',
+    0x7DF4: 'liàn',
+    0x7DF5: 'zōng,zòng',
+    0x7DF6: 'biàn,pián,biǎn',
+    0x7DF7: 'yùn,gǔn',
+    0x7DF8: 'yīn',
+    0x7DF9: 'tí',
+    0x7DFA: 'guā',
+    0x7DFB: 'zhì',
+    0x7DFC: 'yùn,wēn',
+    0x7DFD: 'chēng',
+    0x7DFE: 'chán',
+    0x7DFF: 'dài',
+    0x7E00: 'xiá',
+    0x7E01: 'yuán',
+    0x7E02: 'zǒng',
+    0x7E03: 'xū',
+    0x7E04: 'shéng',
+    0x7E05: 'wēi',
+    0x7E06: 'gēng',
+    0x7E07: 'xuān',
+    0x7E08: 'yíng',
+    0x7E09: 'jìn',
+    0x7E0A: 'yì',
+    0x7E0B: 'zhuì',
+    0x7E0C: 'nì',
+    0x7E0D: 'bāng,bàng',
+    0x7E0E: 'gǔ,hú',
+    0x7E0F: 'pán',
+    0x7E10: 'zhòu,chào,cù,zhōu',
+    0x7E11: 'jiān',
+    0x7E12: 'cī,cuò,suǒ',
+    0x7E13: 'quán',
+    0x7E14: 'shuǎng',
+    0x7E15: 'yùn',
+    0x7E16: 'xiá',
+    0x7E17: 'cuī,suī,shuāi',
+    0x7E18: 'xī',
+    0x7E19: 'róng,rǒng,ròng',
+    0x7E1A: 'tāo',
+    0x7E1B: 'fù',
+    0x7E1C: 'yún',
+    0x7E1D: 'chēn,zhěn',
+    0x7E1E: 'gǎo',
+    0x7E1F: 'rù,rǒng',
+    0x7E20: 'hú',
+    0x7E21: 'zài,zēng',
+    0x7E22: 'téng',
+    0x7E23: 'xiàn,xuán',
+    0x7E24: 'sù',
+    0x7E25: 'zhěn',
+    0x7E26: 'zòng',
+    0x7E27: 'tāo',
+    0x7E28: 'huǎng',
+    0x7E29: 'cài',
+    0x7E2A: 'bì',
+    0x7E2B: 'fèng,féng',
+    0x7E2C: 'cù',
+    0x7E2D: 'lí',
+    0x7E2E: 'suō,sù',
+    0x7E2F: 'yǎn,yǐn',
+    0x7E30: 'xǐ',
+    0x7E31: 'zòng,cóng,zǒng',
+    0x7E32: 'léi',
+    0x7E33: 'juàn,zhuàn',
+    0x7E34: 'qiàn,qiān',
+    0x7E35: 'màn',
+    0x7E36: 'zhí',
+    0x7E37: 'lǚ',
+    0x7E38: 'mù,mò',
+    0x7E39: 'piǎo,piāo',
+    0x7E3A: 'lián',
+    0x7E3B: 'mí',
+    0x7E3C: 'xuàn',
+    0x7E3D: 'zǒng,zōng,cōng',
+    0x7E3E: 'jī',
+    0x7E3F: 'shān,xiān,xiāo,sāo,cǎn',
+    0x7E40: 'suì,cuǐ',
+    0x7E41: 'fán,pó,pán',
+    0x7E42: 'lǜ',
+    0x7E43: 'běng,bēng,bèng',
+    0x7E44: 'yī,yì',
+    0x7E45: 'sāo,zǎo',
+    0x7E46: 'móu,jiū,miù,mù,miào,liáo,liǎo,liào,lù',
+    0x7E47: 'yáo,yóu,zhòu',
+    0x7E48: 'qiǎng',
+    0x7E49: 'hún',
+    0x7E4A: 'xiān',
+    0x7E4B: 'jì',
+    0x7E4C: 'sha',
+    0x7E4D: 'xiù',
+    0x7E4E: 'rán',
+    0x7E4F: 'xuàn',
+    0x7E50: 'suì',
+    0x7E51: 'qiāo,juē',
+    0x7E52: 'zēng,zèng,céng',
+    0x7E53: 'zuǒ',
+    0x7E54: 'zhī,zhì',
+    0x7E55: 'shàn',
+    0x7E56: 'sǎn',
+    0x7E57: 'lín',
+    0x7E58: 'yù,jué',
+    0x7E59: 'fān,fán',
+    0x7E5A: 'liáo,rǎo',
+    0x7E5B: 'chuò',
+    0x7E5C: 'zūn',
+    0x7E5D: 'jiàn',
+    0x7E5E: 'rào,rǎo',
+    0x7E5F: 'chǎn,chán',
+    0x7E60: 'ruǐ',
+    0x7E61: 'xiù',
+    0x7E62: 'huì,huí',
+    0x7E63: 'huà',
+    0x7E64: 'zuǎn',
+    0x7E65: 'xī',
+    0x7E66: 'qiǎng',
+    0x7E67: 'yun',
+    0x7E68: 'da',
+    0x7E69: 'shéng,yìng,mǐn,shèng',
+    0x7E6A: 'huì,guì',
+    0x7E6B: 'xì,jì',
+    0x7E6C: 'sè',
+    0x7E6D: 'jiǎn',
+    0x7E6E: 'jiāng',
+    0x7E6F: 'huán',
+    0x7E70: 'zǎo,sāo,qiāo',
+    0x7E71: 'cōng',
+    0x7E72: 'xiè',
+    0x7E73: 'jiǎo,zhuó,jiào,hé',
+    0x7E74: 'bì',
+    0x7E75: 'dàn,tán,chán',
+    0x7E76: 'yì',
+    0x7E77: 'nǒng',
+    0x7E78: 'suì',
+    0x7E79: 'yì,shì',
+    0x7E7A: 'shǎi',
+    0x7E7B: 'xū,rú',
+    0x7E7C: 'jì',
+    0x7E7D: 'bīn',
+    0x7E7E: 'qiǎn',
+    0x7E7F: 'lán',
+    0x7E80: 'pú,fú',
+    0x7E81: 'xūn',
+    0x7E82: 'zuǎn',
+    0x7E83: 'qí',
+    0x7E84: 'péng',
+    0x7E85: 'yào,lì',
+    0x7E86: 'mò',
+    0x7E87: 'lèi',
+    0x7E88: 'xié',
+    0x7E89: 'zuǎn',
+    0x7E8A: 'kuàng',
+    0x7E8B: 'yōu',
+    0x7E8C: 'xù',
+    0x7E8D: 'léi,lěi,lèi',
+    0x7E8E: 'xiān',
+    0x7E8F: 'chán',
+    0x7E90: 'jiǎo',
+    0x7E91: 'lú',
+    0x7E92: 'chán',
+    0x7E93: 'yīng',
+    0x7E94: 'cái,shān',
+    0x7E95: 'rǎng,xiāng,sāng',
+    0x7E96: 'xiān,jiān',
+    0x7E97: 'zuī',
+    0x7E98: 'zuǎn',
+    0x7E99: 'luò',
+    0x7E9A: 'lí,xǐ,lǐ,sǎ',
+    0x7E9B: 'dào,dú',
+    0x7E9C: 'lǎn',
+    0x7E9D: 'léi',
+    0x7E9E: 'liàn',
+    0x7E9F: 'sī',
+    0x7EA0: 'jiū',
+    0x7EA1: 'yū',
+    0x7EA2: 'hóng,gōng',
+    0x7EA3: 'zhòu',
+    0x7EA4: 'xiān,qiàn',
+    0x7EA5: 'gē,hé',
+    0x7EA6: 'yuē,yāo',
+    0x7EA7: 'jí',
+    0x7EA8: 'wán',
+    0x7EA9: 'kuàng',
+    0x7EAA: 'jì,jǐ',
+    0x7EAB: 'rèn',
+    0x7EAC: 'wěi',
+    0x7EAD: 'yún',
+    0x7EAE: 'hóng',
+    0x7EAF: 'chún',
+    0x7EB0: 'pī',
+    0x7EB1: 'shā',
+    0x7EB2: 'gāng',
+    0x7EB3: 'nà',
+    0x7EB4: 'rèn',
+    0x7EB5: 'zòng',
+    0x7EB6: 'lún,guān',
+    0x7EB7: 'fēn',
+    0x7EB8: 'zhǐ',
+    0x7EB9: 'wén,wèn',
+    0x7EBA: 'fǎng',
+    0x7EBB: 'zhù',
+    0x7EBC: 'zhèn',
+    0x7EBD: 'niǔ',
+    0x7EBE: 'shū',
+    0x7EBF: 'xiàn',
+    0x7EC0: 'gàn',
+    0x7EC1: 'xiè',
+    0x7EC2: 'fú',
+    0x7EC3: 'liàn',
+    0x7EC4: 'zǔ',
+    0x7EC5: 'shēn',
+    0x7EC6: 'xì',
+    0x7EC7: 'zhī',
+    0x7EC8: 'zhōng',
+    0x7EC9: 'zhòu',
+    0x7ECA: 'bàn',
+    0x7ECB: 'fú',
+    0x7ECC: 'chù',
+    0x7ECD: 'shào',
+    0x7ECE: 'yì',
+    0x7ECF: 'jīng,jìng',
+    0x7ED0: 'dài',
+    0x7ED1: 'bǎng',
+    0x7ED2: 'róng',
+    0x7ED3: 'jié,jiē',
+    0x7ED4: 'kù',
+    0x7ED5: 'rào,rǎo',
+    0x7ED6: 'dié',
+    0x7ED7: 'háng',
+    0x7ED8: 'huì',
+    0x7ED9: 'gěi,jǐ',
+    0x7EDA: 'xuàn',
+    0x7EDB: 'jiàng',
+    0x7EDC: 'luò,lào',
+    0x7EDD: 'jué',
+    0x7EDE: 'jiǎo',
+    0x7EDF: 'tǒng',
+    0x7EE0: 'gěng',
+    0x7EE1: 'xiāo',
+    0x7EE2: 'juàn',
+    0x7EE3: 'xiù',
+    0x7EE4: 'xì',
+    0x7EE5: 'suí',
+    0x7EE6: 'tāo',
+    0x7EE7: 'jì',
+    0x7EE8: 'tí,tì',
+    0x7EE9: 'jì,jī',
+    0x7EEA: 'xù',
+    0x7EEB: 'líng',
+    0x7EEC: 'yīng',
+    0x7EED: 'xù',
+    0x7EEE: 'qǐ',
+    0x7EEF: 'fēi',
+    0x7EF0: 'chuò,chāo',
+    0x7EF1: 'shàng',
+    0x7EF2: 'gǔn',
+    0x7EF3: 'shéng',
+    0x7EF4: 'wéi',
+    0x7EF5: 'mián',
+    0x7EF6: 'shòu',
+    0x7EF7: 'bēng,běng,bèng',
+    0x7EF8: 'chóu',
+    0x7EF9: 'táo',
+    0x7EFA: 'liǔ',
+    0x7EFB: 'quǎn',
+    0x7EFC: 'zōng,zèng',
+    0x7EFD: 'zhàn',
+    0x7EFE: 'wǎn',
+    0x7EFF: 'lǜ,lù',
+    0x7F00: 'zhuì',
+    0x7F01: 'zī',
+    0x7F02: 'kè',
+    0x7F03: 'xiāng',
+    0x7F04: 'jiān',
+    0x7F05: 'miǎn',
+    0x7F06: 'lǎn',
+    0x7F07: 'tí',
+    0x7F08: 'miǎo',
+    0x7F09: 'jī,qī',
+    0x7F0A: 'yūn,yùn',
+    0x7F0B: 'huì',
+    0x7F0C: 'sī',
+    0x7F0D: 'duǒ',
+    0x7F0E: 'duàn',
+    0x7F0F: 'biàn,pián',
+    0x7F10: 'xiàn',
+    0x7F11: 'gōu',
+    0x7F12: 'zhuì',
+    0x7F13: 'huǎn',
+    0x7F14: 'dì',
+    0x7F15: 'lǚ',
+    0x7F16: 'biān',
+    0x7F17: 'mín',
+    0x7F18: 'yuán',
+    0x7F19: 'jìn',
+    0x7F1A: 'fù',
+    0x7F1B: 'rù',
+    0x7F1C: 'zhěn',
+    0x7F1D: 'fèng,féng',
+    0x7F1E: 'cuī',
+    0x7F1F: 'gǎo',
+    0x7F20: 'chán',
+    0x7F21: 'lí',
+    0x7F22: 'yì',
+    0x7F23: 'jiān',
+    0x7F24: 'bīn',
+    0x7F25: 'piāo,piǎo',
+    0x7F26: 'màn',
+    0x7F27: 'léi',
+    0x7F28: 'yīng',
+    0x7F29: 'suō,sù',
+    0x7F2A: 'móu,miào,miù',
+    0x7F2B: 'sāo',
+    0x7F2C: 'xié',
+    0x7F2D: 'liáo',
+    0x7F2E: 'shàn',
+    0x7F2F: 'zēng,zèng',
+    0x7F30: 'jiāng',
+    0x7F31: 'qiǎn',
+    0x7F32: 'qiāo,sāo',
+    0x7F33: 'huán',
+    0x7F34: 'jiǎo,zhuó',
+    0x7F35: 'zuǎn',
+    0x7F36: 'fǒu',
+    0x7F37: 'xiè',
+    0x7F38: 'gāng',
+    0x7F39: 'fǒu',
+    0x7F3A: 'quē,kuǐ',
+    0x7F3B: 'fǒu',
+    0x7F3C: 'qi',
+    0x7F3D: 'bō',
+    0x7F3E: 'píng',
+    0x7F3F: 'xiàng',
+    0x7F40: 'zhao',
+    0x7F41: 'gāng',
+    0x7F42: 'yīng',
+    0x7F43: 'yīng',
+    0x7F44: 'qìng',
+    0x7F45: 'xià',
+    0x7F46: 'guàn',
+    0x7F47: 'zūn',
+    0x7F48: 'tán',
+    0x7F49: 'chēng',
+    0x7F4A: 'qì',
+    0x7F4B: 'wèng',
+    0x7F4C: 'yīng',
+    0x7F4D: 'léi',
+    0x7F4E: 'tán',
+    0x7F4F: 'lú',
+    0x7F50: 'guàn',
+    0x7F51: 'wǎng',
+    0x7F52: 'wǎng',
+    0x7F53: 'gāng',
+    0x7F54: 'wǎng,wáng',
+    0x7F55: 'hǎn,hàn',
+    0x7F56: 'luó',
+    0x7F57: 'luó,luō',
+    0x7F58: 'fú',
+    0x7F59: 'shēn',
+    0x7F5A: 'fá',
+    0x7F5B: 'gū',
+    0x7F5C: 'zhǔ,dú',
+    0x7F5D: 'jū,jiē',
+    0x7F5E: 'máo',
+    0x7F5F: 'gǔ',
+    0x7F60: 'mín',
+    0x7F61: 'gāng',
+    0x7F62: 'bà,ba',
+    0x7F63: 'guà',
+    0x7F64: 'tí,kūn',
+    0x7F65: 'juàn',
+    0x7F66: 'fú',
+    0x7F67: 'shèn',
+    0x7F68: 'yǎn',
+    0x7F69: 'zhào',
+    0x7F6A: 'zuì',
+    0x7F6B: 'guà,huà,guǎi',
+    0x7F6C: 'zhuó',
+    0x7F6D: 'yù',
+    0x7F6E: 'zhì',
+    0x7F6F: 'ǎn',
+    0x7F70: 'fá',
+    0x7F71: 'lǎn,nǎn',
+    0x7F72: 'shǔ',
+    0x7F73: 'sī',
+    0x7F74: 'pí',
+    0x7F75: 'mà',
+    0x7F76: 'liǔ',
+    0x7F77: 'bà,pí,pì,bǐ,ba,bǎi',
+    0x7F78: 'fá',
+    0x7F79: 'lí',
+    0x7F7A: 'cháo',
+    0x7F7B: 'wèi',
+    0x7F7C: 'bì',
+    0x7F7D: 'jì',
+    0x7F7E: 'zēng',
+    0x7F7F: 'chōng',
+    0x7F80: 'liǔ',
+    0x7F81: 'jī',
+    0x7F82: 'juàn',
+    0x7F83: 'mì',
+    0x7F84: 'zhào',
+    0x7F85: 'luó,luō,luo',
+    0x7F86: 'pí',
+    0x7F87: 'jī',
+    0x7F88: 'jī',
+    0x7F89: 'luán',
+    0x7F8A: 'yáng',
+    0x7F8B: 'mǐ,miē',
+    0x7F8C: 'qiāng',
+    0x7F8D: 'dá',
+    0x7F8E: 'měi',
+    0x7F8F: 'yáng,xiáng',
+    0x7F90: 'yǒu',
+    0x7F91: 'yǒu',
+    0x7F92: 'fén',
+    0x7F93: 'bā',
+    0x7F94: 'gāo',
+    0x7F95: 'yàng',
+    0x7F96: 'gǔ',
+    0x7F97: 'qiāng,yǒu',
+    0x7F98: 'zāng',
+    0x7F99: 'gāo,měi',
+    0x7F9A: 'líng',
+    0x7F9B: 'yì,xī',
+    0x7F9C: 'zhù',
+    0x7F9D: 'dī',
+    0x7F9E: 'xiū',
+    0x7F9F: 'qiǎng',
+    0x7FA0: 'yí',
+    0x7FA1: 'xiàn,yán,yí',
+    0x7FA2: 'róng',
+    0x7FA3: 'qún',
+    0x7FA4: 'qún',
+    0x7FA5: 'qiǎng,qiān',
+    0x7FA6: 'huán',
+    0x7FA7: 'suō,zuī',
+    0x7FA8: 'xiàn',
+    0x7FA9: 'yì,yí,xī',
+    0x7FAA: 'yang',
+    0x7FAB: 'qiāng,kàng',
+    0x7FAC: 'qián,xián,yán',
+    0x7FAD: 'yú',
+    0x7FAE: 'gēng',
+    0x7FAF: 'jié',
+    0x7FB0: 'tāng',
+    0x7FB1: 'yuán',
+    0x7FB2: 'xī',
+    0x7FB3: 'fán',
+    0x7FB4: 'shān',
+    0x7FB5: 'fén',
+    0x7FB6: 'shān',
+    0x7FB7: 'liǎn',
+    0x7FB8: 'léi,lián',
+    0x7FB9: 'gēng,láng',
+    0x7FBA: 'nóu',
+    0x7FBB: 'qiàng',
+    0x7FBC: 'chàn',
+    0x7FBD: 'yǔ,hù',
+    0x7FBE: 'gòng',
+    0x7FBF: 'yì',
+    0x7FC0: 'chōng',
+    0x7FC1: 'wēng,wěng',
+    0x7FC2: 'fēn',
+    0x7FC3: 'hóng',
+    0x7FC4: 'chì',
+    0x7FC5: 'chì',
+    0x7FC6: 'cuì',
+    0x7FC7: 'fú',
+    0x7FC8: 'xiá',
+    0x7FC9: 'běn',
+    0x7FCA: 'yì',
+    0x7FCB: 'lā',
+    0x7FCC: 'yì',
+    0x7FCD: 'pī,bì,pō',
+    0x7FCE: 'líng',
+    0x7FCF: 'liù,lù',
+    0x7FD0: 'zhì',
+    0x7FD1: 'qú',
+    0x7FD2: 'xí',
+    0x7FD3: 'xié',
+    0x7FD4: 'xiáng',
+    0x7FD5: 'xī',
+    0x7FD6: 'xī',
+    0x7FD7: 'ké',
+    0x7FD8: 'qiào,qiáo',
+    0x7FD9: 'huì',
+    0x7FDA: 'huī',
+    0x7FDB: 'xiāo,shū',
+    0x7FDC: 'shà',
+    0x7FDD: 'hóng',
+    0x7FDE: 'jiāng',
+    0x7FDF: 'dí,zhái',
+    0x7FE0: 'cuì',
+    0x7FE1: 'fěi',
+    0x7FE2: 'dào,zhōu',
+    0x7FE3: 'shà',
+    0x7FE4: 'chì',
+    0x7FE5: 'zhù',
+    0x7FE6: 'jiǎn',
+    0x7FE7: 'xuān',
+    0x7FE8: 'chì',
+    0x7FE9: 'piān',
+    0x7FEA: 'zōng',
+    0x7FEB: 'wán,wàn',
+    0x7FEC: 'huī',
+    0x7FED: 'hóu',
+    0x7FEE: 'hé,lì',
+    0x7FEF: 'hè,hào',
+    0x7FF0: 'hàn',
+    0x7FF1: 'áo',
+    0x7FF2: 'piāo',
+    0x7FF3: 'yì',
+    0x7FF4: 'lián',
+    0x7FF5: 'hóu,qú',
+    0x7FF6: 'áo',
+    0x7FF7: 'lín',
+    0x7FF8: 'pěn',
+    0x7FF9: 'qiào,qiáo',
+    0x7FFA: 'áo',
+    0x7FFB: 'fān',
+    0x7FFC: 'yì',
+    0x7FFD: 'huì',
+    0x7FFE: 'xuān',
+    0x7FFF: 'dào',
+    0x8000: 'yào',
+    0x8001: 'lǎo',
+    0x8002: 'lǎo',
+    0x8003: 'kǎo',
+    0x8004: 'mào',
+    0x8005: 'zhě',
+    0x8006: 'qí,zhǐ,shì',
+    0x8007: 'gǒu',
+    0x8008: 'gǒu',
+    0x8009: 'gǒu',
+    0x800A: 'dié',
+    0x800B: 'dié',
+    0x800C: 'ér,néng',
+    0x800D: 'shuǎ',
+    0x800E: 'ruǎn,nuò',
+    0x800F: 'nài,ér',
+    0x8010: 'nài,néng',
+    0x8011: 'duān,zhuān',
+    0x8012: 'lěi',
+    0x8013: 'tīng',
+    0x8014: 'zǐ',
+    0x8015: 'gēng',
+    0x8016: 'chào',
+    0x8017: 'hào,máo,mào',
+    0x8018: 'yún',
+    0x8019: 'bà,pá',
+    0x801A: 'pī',
+    0x801B: 'yí,chí',
+    0x801C: 'sì',
+    0x801D: 'qù,chú',
+    0x801E: 'jiā',
+    0x801F: 'jù',
+    0x8020: 'huō',
+    0x8021: 'chú',
+    0x8022: 'lào',
+    0x8023: 'lǔn,lún',
+    0x8024: 'jí,jiè',
+    0x8025: 'tāng,tǎng',
+    0x8026: 'ǒu',
+    0x8027: 'lóu',
+    0x8028: 'nòu',
+    0x8029: 'jiǎng',
+    0x802A: 'pǎng',
+    0x802B: 'zhá,zé',
+    0x802C: 'lóu,lǒu',
+    0x802D: 'jī',
+    0x802E: 'lào',
+    0x802F: 'huò',
+    0x8030: 'yōu',
+    0x8031: 'mò',
+    0x8032: 'huái',
+    0x8033: 'ěr,réng',
+    0x8034: 'yì',
+    0x8035: 'dīng',
+    0x8036: 'yé,yē,xié',
+    0x8037: 'dā,zhé',
+    0x8038: 'sǒng',
+    0x8039: 'qín',
+    0x803A: 'yún,yíng',
+    0x803B: 'chǐ',
+    0x803C: 'dān',
+    0x803D: 'dān',
+    0x803E: 'hóng',
+    0x803F: 'gěng',
+    0x8040: 'zhí',
+    0x8041: 'pàn',
+    0x8042: 'niè',
+    0x8043: 'dān',
+    0x8044: 'zhěn',
+    0x8045: 'chè',
+    0x8046: 'líng',
+    0x8047: 'zhēng',
+    0x8048: 'yǒu',
+    0x8049: 'wà,tuǐ,zhuó',
+    0x804A: 'liáo,liú',
+    0x804B: 'lóng',
+    0x804C: 'zhí',
+    0x804D: 'níng',
+    0x804E: 'tiāo',
+    0x804F: 'ér,nǜ',
+    0x8050: 'yà',
+    0x8051: 'tiē,zhé',
+    0x8052: 'guā,guō',
+    0x8053: 'xù',
+    0x8054: 'lián',
+    0x8055: 'hào',
+    0x8056: 'shèng',
+    0x8057: 'liè',
+    0x8058: 'pìn,pìng',
+    0x8059: 'jīng',
+    0x805A: 'jù',
+    0x805B: 'bǐ',
+    0x805C: 'dǐ',
+    0x805D: 'guó',
+    0x805E: 'wén,wèn',
+    0x805F: 'xù',
+    0x8060: 'pīng',
+    0x8061: 'cōng',
+    0x8062: 'dìng',
+    0x8063: 'ní',
+    0x8064: 'tíng',
+    0x8065: 'jǔ',
+    0x8066: 'cōng',
+    0x8067: 'kuī',
+    0x8068: 'lián',
+    0x8069: 'kuì',
+    0x806A: 'cōng',
+    0x806B: 'lián',
+    0x806C: 'wěng',
+    0x806D: 'kuì',
+    0x806E: 'lián',
+    0x806F: 'lián',
+    0x8070: 'cōng',
+    0x8071: 'áo,yóu',
+    0x8072: 'shēng',
+    0x8073: 'sǒng',
+    0x8074: 'tīng',
+    0x8075: 'kuì',
+    0x8076: 'niè,zhé,shè,yè',
+    0x8077: 'zhí,tè',
+    0x8078: 'dān',
+    0x8079: 'níng',
+    0x807A: 'qié',
+    0x807B: 'nǐ,jiàn',
+    0x807C: 'tīng',
+    0x807D: 'tīng,tìng',
+    0x807E: 'lóng',
+    0x807F: 'yù',
+    0x8080: 'yù',
+    0x8081: 'zhào',
+    0x8082: 'sì',
+    0x8083: 'sù',
+    0x8084: 'yì,sì',
+    0x8085: 'sù',
+    0x8086: 'sì,tì',
+    0x8087: 'zhào',
+    0x8088: 'zhào',
+    0x8089: 'ròu,rù',
+    0x808A: 'yì',
+    0x808B: 'lē,lèi,jīn',
+    0x808C: 'jī,jì',
+    0x808D: 'qiú',
+    0x808E: 'kěn',
+    0x808F: 'cào',
+    0x8090: 'gē,qì',
+    0x8091: 'bó,dí',
+    0x8092: 'huàn',
+    0x8093: 'huāng',
+    0x8094: 'chǐ',
+    0x8095: 'rèn',
+    0x8096: 'xiào,xiāo',
+    0x8097: 'rǔ',
+    0x8098: 'zhǒu',
+    0x8099: 'yuàn',
+    0x809A: 'dù,dǔ',
+    0x809B: 'gāng',
+    0x809C: 'róng,chēn',
+    0x809D: 'gān',
+    0x809E: 'chā',
+    0x809F: 'wò',
+    0x80A0: 'cháng',
+    0x80A1: 'gǔ',
+    0x80A2: 'zhī,shì',
+    0x80A3: 'hán,hàn,qín',
+    0x80A4: 'fū',
+    0x80A5: 'féi,bǐ',
+    0x80A6: 'fén',
+    0x80A7: 'pēi',
+    0x80A8: 'pàng,pāng,fēng',
+    0x80A9: 'jiān,xián',
+    0x80AA: 'fáng',
+    0x80AB: 'zhūn,chún,tún,zhuō',
+    0x80AC: 'yóu',
+    0x80AD: 'nà,nù',
+    0x80AE: 'āng,háng,gāng',
+    0x80AF: 'kěn',
+    0x80B0: 'rán',
+    0x80B1: 'gōng',
+    0x80B2: 'yù,zhòu,yō',
+    0x80B3: 'wěn',
+    0x80B4: 'yáo',
+    0x80B5: 'qí',
+    0x80B6: 'pí,bì',
+    0x80B7: 'qiǎn,xù',
+    0x80B8: 'xī,bì',
+    0x80B9: 'xī',
+    0x80BA: 'fèi,pèi',
+    0x80BB: 'kěn',
+    0x80BC: 'jǐng',
+    0x80BD: 'tài',
+    0x80BE: 'shèn',
+    0x80BF: 'zhǒng',
+    0x80C0: 'zhàng',
+    0x80C1: 'xié',
+    0x80C2: 'shèn,shēn,chēn',
+    0x80C3: 'wèi',
+    0x80C4: 'zhòu',
+    0x80C5: 'dié',
+    0x80C6: 'dǎn,tán,tǎn,dá',
+    0x80C7: 'fèi,bì,fěi',
+    0x80C8: 'bá',
+    0x80C9: 'bó',
+    0x80CA: 'qú',
+    0x80CB: 'tián',
+    0x80CC: 'bèi,bēi',
+    0x80CD: 'guā,gū,hù',
+    0x80CE: 'tāi',
+    0x80CF: 'zǐ,fèi',
+    0x80D0: 'fěi',
+    0x80D1: 'zhī',
+    0x80D2: 'nì',
+    0x80D3: 'píng,pēng',
+    0x80D4: 'zì,cí,jí',
+    0x80D5: 'fǔ,fū,fú,zhǒu',
+    0x80D6: 'pàng,pán,pàn',
+    0x80D7: 'zhēn,zhěn,zhūn',
+    0x80D8: 'xián',
+    0x80D9: 'zuò',
+    0x80DA: 'pēi',
+    0x80DB: 'jiǎ',
+    0x80DC: 'shèng,xīng,qìng,shēng',
+    0x80DD: 'zhī,chī,dì',
+    0x80DE: 'bāo,páo,pào',
+    0x80DF: 'mǔ',
+    0x80E0: 'qū',
+    0x80E1: 'hú',
+    0x80E2: 'kē',
+    0x80E3: 'chǐ',
+    0x80E4: 'yìn',
+    0x80E5: 'xū,xǔ',
+    0x80E6: 'yāng',
+    0x80E7: 'lóng',
+    0x80E8: 'dòng',
+    0x80E9: 'kǎ',
+    0x80EA: 'lú',
+    0x80EB: 'jìng',
+    0x80EC: 'nǔ,nǚ',
+    0x80ED: 'yān',
+    0x80EE: 'pāng',
+    0x80EF: 'kuà,kuǎ',
+    0x80F0: 'yí',
+    0x80F1: 'guāng',
+    0x80F2: 'hǎi,gāi,gǎi',
+    0x80F3: 'gē,gé,gā',
+    0x80F4: 'dòng',
+    0x80F5: 'chī,zhì',
+    0x80F6: 'jiāo,xiáo',
+    0x80F7: 'xiōng',
+    0x80F8: 'xiōng',
+    0x80F9: 'ér',
+    0x80FA: 'àn,è',
+    0x80FB: 'héng',
+    0x80FC: 'pián',
+    0x80FD: 'néng,tái,nái,nài,xióng',
+    0x80FE: 'zì',
+    0x80FF: 'guī,kuì',
+    0x8100: 'chéng,zhēng,zhèng',
+    0x8101: 'tiǎo',
+    0x8102: 'zhī,zhǐ',
+    0x8103: 'cuì',
+    0x8104: 'méi',
+    0x8105: 'xié,xiàn,xī',
+    0x8106: 'cuì',
+    0x8107: 'xié',
+    0x8108: 'mài,mò',
+    0x8109: 'mài,mò',
+    0x810A: 'jí,jǐ',
+    0x810B: 'xié',
+    0x810C: 'nin',
+    0x810D: 'kuài',
+    0x810E: 'sà',
+    0x810F: 'zàng,zāng',
+    0x8110: 'qí',
+    0x8111: 'nǎo',
+    0x8112: 'mǐ',
+    0x8113: 'nóng',
+    0x8114: 'luán,jī',
+    0x8115: 'wàn,wèn',
+    0x8116: 'bó,bō',
+    0x8117: 'wěn',
+    0x8118: 'wǎn,huàn',
+    0x8119: 'xiū',
+    0x811A: 'jiǎo,jué',
+    0x811B: 'jìng,kēng',
+    0x811C: 'yǒu',
+    0x811D: 'hēng',
+    0x811E: 'cuǒ,qiē',
+    0x811F: 'liè,luán,pāo',
+    0x8120: 'shān,chān',
+    0x8121: 'tǐng',
+    0x8122: 'méi',
+    0x8123: 'chún',
+    0x8124: 'shèn',
+    0x8125: 'qiǎn,qū,jié',
+    0x8126: 'de,tè,te',
+    0x8127: 'juān,zuī',
+    0x8128: 'cù,jí',
+    0x8129: 'xiū,yǒu,tiáo,xiāo',
+    0x812A: 'xìn,chī',
+    0x812B: 'tuō',
+    0x812C: 'pāo',
+    0x812D: 'chéng',
+    0x812E: 'něi,tuǐ',
+    0x812F: 'pú,fǔ',
+    0x8130: 'dòu',
+    0x8131: 'tuō,tuì',
+    0x8132: 'niào',
+    0x8133: 'nǎo',
+    0x8134: 'pǐ',
+    0x8135: 'gǔ',
+    0x8136: 'luó',
+    0x8137: 'lì',
+    0x8138: 'liǎn',
+    0x8139: 'zhàng,cháng',
+    0x813A: 'cuì,suì',
+    0x813B: 'jiē',
+    0x813C: 'liǎng,lǎng',
+    0x813D: 'shuí',
+    0x813E: 'pí,pái,bì,pì',
+    0x813F: 'biāo,biǎo,biào',
+    0x8140: 'lún',
+    0x8141: 'pián',
+    0x8142: 'lěi,guò,huà',
+    0x8143: 'kuì,quān,quán,juàn',
+    0x8144: 'chuí,hóu,chuái',
+    0x8145: 'dàn',
+    0x8146: 'tiǎn',
+    0x8147: 'něi',
+    0x8148: 'jīng',
+    0x8149: 'nái',
+    0x814A: 'là,xī',
+    0x814B: 'yè',
+    0x814C: 'yān,ā,āng',
+    0x814D: 'rèn,diàn',
+    0x814E: 'shèn',
+    0x814F: 'chuò,zhuì',
+    0x8150: 'fǔ',
+    0x8151: 'fǔ',
+    0x8152: 'jū',
+    0x8153: 'féi',
+    0x8154: 'qiāng,kòng',
+    0x8155: 'wàn',
+    0x8156: 'dòng',
+    0x8157: 'pí',
+    0x8158: 'guó',
+    0x8159: 'zōng',
+    0x815A: 'dìng',
+    0x815B: 'wò',
+    0x815C: 'méi',
+    0x815D: 'ní,ruǎn,nào,nèn,ér',
+    0x815E: 'zhuàn,dùn,tú',
+    0x815F: 'chì',
+    0x8160: 'còu',
+    0x8161: 'luó',
+    0x8162: 'ǒu',
+    0x8163: 'dì',
+    0x8164: 'ān',
+    0x8165: 'xīng',
+    0x8166: 'nǎo,nào',
+    0x8167: 'shù,yú',
+    0x8168: 'shuàn',
+    0x8169: 'nǎn',
+    0x816A: 'yùn',
+    0x816B: 'zhǒng',
+    0x816C: 'róu',
+    0x816D: 'è',
+    0x816E: 'sāi',
+    0x816F: 'tú,dùn',
+    0x8170: 'yāo',
+    0x8171: 'jiàn,qián',
+    0x8172: 'wěi',
+    0x8173: 'jiǎo,jué',
+    0x8174: 'yú',
+    0x8175: 'jiā',
+    0x8176: 'duàn',
+    0x8177: 'bì',
+    0x8178: 'cháng',
+    0x8179: 'fù',
+    0x817A: 'xiàn',
+    0x817B: 'nì',
+    0x817C: 'miǎn',
+    0x817D: 'wà',
+    0x817E: 'téng',
+    0x817F: 'tuǐ',
+    0x8180: 'bǎng,pāng,páng,bàng,pǎng',
+    0x8181: 'qiǎn,xiàn,yán',
+    0x8182: 'lǚ',
+    0x8183: 'wà',
+    0x8184: 'shòu',
+    0x8185: 'táng',
+    0x8186: 'sù',
+    0x8187: 'zhuì',
+    0x8188: 'gé',
+    0x8189: 'yì',
+    0x818A: 'bó,pò,liè',
+    0x818B: 'liáo',
+    0x818C: 'jí',
+    0x818D: 'pí',
+    0x818E: 'xié',
+    0x818F: 'gāo,gào',
+    0x8190: 'lǚ',
+    0x8191: 'bìn',
+    0x8192: 'ōu',
+    0x8193: 'cháng',
+    0x8194: 'lù,biāo',
+    0x8195: 'guó,huò',
+    0x8196: 'pāng',
+    0x8197: 'chuái',
+    0x8198: 'biāo,piǎo',
+    0x8199: 'jiǎng',
+    0x819A: 'fū,lú',
+    0x819B: 'táng,tāng',
+    0x819C: 'mó',
+    0x819D: 'xī',
+    0x819E: 'zhuān,zhuǎn,chuǎn,chún',
+    0x819F: 'lǜ',
+    0x81A0: 'jiāo,jiǎo,háo,nǎo',
+    0x81A1: 'yìng',
+    0x81A2: 'lǘ',
+    0x81A3: 'zhì',
+    0x81A4: 'xuě',
+    0x81A5: 'cūn',
+    0x81A6: 'lìn,liǎn',
+    0x81A7: 'tóng',
+    0x81A8: 'péng,pèng',
+    0x81A9: 'nì',
+    0x81AA: 'chuài,zhà,zhài',
+    0x81AB: 'liáo,liǎo',
+    0x81AC: 'cuì',
+    0x81AD: 'guī,kuì,duì',
+    0x81AE: 'xiāo',
+    0x81AF: 'tēng,tún',
+    0x81B0: 'fán,pán',
+    0x81B1: 'zhí',
+    0x81B2: 'jiāo',
+    0x81B3: 'shàn',
+    0x81B4: 'hū,wǔ,méi',
+    0x81B5: 'cuì',
+    0x81B6: 'rùn',
+    0x81B7: 'xiāng',
+    0x81B8: 'suǐ,wěi',
+    0x81B9: 'fèn',
+    0x81BA: 'yīng',
+    0x81BB: 'shān,dàn',
+    0x81BC: 'zhuā',
+    0x81BD: 'dǎn',
+    0x81BE: 'kuài',
+    0x81BF: 'nóng',
+    0x81C0: 'tún',
+    0x81C1: 'lián',
+    0x81C2: 'bì,bei',
+    0x81C3: 'yōng',
+    0x81C4: 'jué,jū',
+    0x81C5: 'chù',
+    0x81C6: 'yì,yǐ',
+    0x81C7: 'juǎn',
+    0x81C8: 'là,gé',
+    0x81C9: 'liǎn',
+    0x81CA: 'sāo,sào',
+    0x81CB: 'tún',
+    0x81CC: 'gǔ',
+    0x81CD: 'qí',
+    0x81CE: 'cuì',
+    0x81CF: 'bìn',
+    0x81D0: 'xūn',
+    0x81D1: 'nào,rú,ér,nèn,nuǎn',
+    0x81D2: 'wò,yuè',
+    0x81D3: 'zàng',
+    0x81D4: 'xiàn',
+    0x81D5: 'biāo',
+    0x81D6: 'xìng',
+    0x81D7: 'kuān',
+    0x81D8: 'là,liè',
+    0x81D9: 'yān',
+    0x81DA: 'lú,lǚ',
+    0x81DB: 'huò',
+    0x81DC: 'zā',
+    0x81DD: 'luǒ',
+    0x81DE: 'qú',
+    0x81DF: 'zàng',
+    0x81E0: 'luán',
+    0x81E1: 'ní,luán',
+    0x81E2: 'zā,zān',
+    0x81E3: 'chén',
+    0x81E4: 'qiān,xián,qìn',
+    0x81E5: 'wò',
+    0x81E6: 'guàng,jiǒng',
+    0x81E7: 'zāng,cáng,zàng',
+    0x81E8: 'lín,lìn',
+    0x81E9: 'guǎng,jiǒng',
+    0x81EA: 'zì',
+    0x81EB: 'jiǎo',
+    0x81EC: 'niè',
+    0x81ED: 'chòu,xiù',
+    0x81EE: 'jì',
+    0x81EF: 'gāo',
+    0x81F0: 'chòu',
+    0x81F1: 'mián,biān',
+    0x81F2: 'niè',
+    0x81F3: 'zhì,dié',
+    0x81F4: 'zhì,zhuì',
+    0x81F5: 'gé',
+    0x81F6: 'jiàn',
+    0x81F7: 'dié,zhí',
+    0x81F8: 'zhī,jìn',
+    0x81F9: 'xiū',
+    0x81FA: 'tái',
+    0x81FB: 'zhēn',
+    0x81FC: 'jiù',
+    0x81FD: 'xiàn',
+    0x81FE: 'yú,yǔ,yǒng,kuì',
+    0x81FF: 'chā',
+    0x8200: 'yǎo',
+    0x8201: 'yú',
+    0x8202: 'chōng,chuāng,zhōng',
+    0x8203: 'xì',
+    0x8204: 'xì,què,tuō',
+    0x8205: 'jiù',
+    0x8206: 'yú',
+    0x8207: 'yǔ,yú,yù',
+    0x8208: 'xìng,xīng,xìn',
+    0x8209: 'jǔ',
+    0x820A: 'jiù',
+    0x820B: 'xìn',
+    0x820C: 'shé,guā',
+    0x820D: 'shě,shè,shì',
+    0x820E: 'shè',
+    0x820F: 'jiǔ',
+    0x8210: 'shì',
+    0x8211: 'tān',
+    0x8212: 'shū,yù',
+    0x8213: 'shì',
+    0x8214: 'tiǎn,tān',
+    0x8215: 'tàn',
+    0x8216: 'pù',
+    0x8217: 'pù',
+    0x8218: 'guǎn',
+    0x8219: 'huà,qì',
+    0x821A: 'tiàn',
+    0x821B: 'chuǎn',
+    0x821C: 'shùn',
+    0x821D: 'xiá',
+    0x821E: 'wǔ',
+    0x821F: 'zhōu',
+    0x8220: 'dāo',
+    0x8221: 'chuán,xiāng',
+    0x8222: 'shān',
+    0x8223: 'yǐ',
+    0x8224: 'fán',
+    0x8225: 'pā',
+    0x8226: 'tài',
+    0x8227: 'fán',
+    0x8228: 'bǎn',
+    0x8229: 'chuán,fán',
+    0x822A: 'háng',
+    0x822B: 'fǎng',
+    0x822C: 'bān,pán,bǎn,bō',
+    0x822D: 'bǐ',
+    0x822E: 'lú',
+    0x822F: 'zhōng',
+    0x8230: 'jiàn',
+    0x8231: 'cāng',
+    0x8232: 'líng',
+    0x8233: 'zhú,zhǒu',
+    0x8234: 'zé',
+    0x8235: 'duò',
+    0x8236: 'bó',
+    0x8237: 'xián',
+    0x8238: 'gě',
+    0x8239: 'chuán',
+    0x823A: 'xiá',
+    0x823B: 'lú',
+    0x823C: 'qióng,hóng',
+    0x823D: 'páng,féng',
+    0x823E: 'xī',
+    0x823F: 'kuā',
+    0x8240: 'fú',
+    0x8241: 'zào',
+    0x8242: 'féng',
+    0x8243: 'lí',
+    0x8244: 'shāo,shào',
+    0x8245: 'yú',
+    0x8246: 'láng',
+    0x8247: 'tǐng',
+    0x8248: 'yù',
+    0x8249: 'wěi',
+    0x824A: 'bó',
+    0x824B: 'měng',
+    0x824C: 'niàn,qiàn',
+    0x824D: 'jū',
+    0x824E: 'huáng',
+    0x824F: 'shǒu',
+    0x8250: 'kè,jiè,zōng',
+    0x8251: 'biàn',
+    0x8252: 'mù,mò',
+    0x8253: 'dié',
+    0x8254: 'dào',
+    0x8255: 'bàng',
+    0x8256: 'chā',
+    0x8257: 'yì',
+    0x8258: 'sōu',
+    0x8259: 'cāng',
+    0x825A: 'cáo',
+    0x825B: 'lóu',
+    0x825C: 'dài',
+    0x825D: 'xuě',
+    0x825E: 'yào,tiào',
+    0x825F: 'chōng,zhuàng,tóng',
+    0x8260: 'dēng',
+    0x8261: 'dāng',
+    0x8262: 'qiáng',
+    0x8263: 'lǔ',
+    0x8264: 'yǐ',
+    0x8265: 'jí',
+    0x8266: 'jiàn',
+    0x8267: 'huò,wò',
+    0x8268: 'méng',
+    0x8269: 'qí',
+    0x826A: 'lǔ',
+    0x826B: 'lú',
+    0x826C: 'chán',
+    0x826D: 'shuāng',
+    0x826E: 'gěn,gèn,hén',
+    0x826F: 'liáng,liǎng',
+    0x8270: 'jiān',
+    0x8271: 'jiān',
+    0x8272: 'sè,shǎi',
+    0x8273: 'yàn',
+    0x8274: 'fú,bó,pèi',
+    0x8275: 'pīng',
+    0x8276: 'yàn',
+    0x8277: 'yàn',
+    0x8278: 'cǎo',
+    0x8279: 'cǎo',
+    0x827A: 'yì',
+    0x827B: 'lè,jí',
+    0x827C: 'tīng,dǐng',
+    0x827D: 'jiāo,qiú',
+    0x827E: 'ài,yì',
+    0x827F: 'nǎi,réng,rèng',
+    0x8280: 'tiáo',
+    0x8281: 'jiāo',
+    0x8282: 'jié,jiē',
+    0x8283: 'péng',
+    0x8284: 'wán',
+    0x8285: 'yì',
+    0x8286: 'chāi,chā',
+    0x8287: 'mián',
+    0x8288: 'mǐ',
+    0x8289: 'gān,gǎn',
+    0x828A: 'qiān,qiàn',
+    0x828B: 'yù,yú,xū,yǔ',
+    0x828C: 'yù',
+    0x828D: 'sháo,xiào,què,dì',
+    0x828E: 'qiōng,xiōng',
+    0x828F: 'dù',
+    0x8290: 'hù,xià',
+    0x8291: 'qǐ',
+    0x8292: 'máng,huāng,huǎng,wáng',
+    0x8293: 'zì,zǐ,zī',
+    0x8294: 'huì,hū',
+    0x8295: 'suī',
+    0x8296: 'zhì',
+    0x8297: 'xiāng',
+    0x8298: 'pí,bǐ,bì',
+    0x8299: 'fú',
+    0x829A: 'tún,chūn',
+    0x829B: 'wěi',
+    0x829C: 'wú',
+    0x829D: 'zhī',
+    0x829E: 'qì',
+    0x829F: 'shān,wěi',
+    0x82A0: 'wén',
+    0x82A1: 'qiàn',
+    0x82A2: 'rén',
+    0x82A3: 'fú,fǒu,fū',
+    0x82A4: 'kōu',
+    0x82A5: 'jiè,gài',
+    0x82A6: 'lú,lǔ,hù',
+    0x82A7: 'xù,zhù',
+    0x82A8: 'jī',
+    0x82A9: 'qín,yín',
+    0x82AA: 'qí,chí',
+    0x82AB: 'yán,yuán',
+    0x82AC: 'fēn',
+    0x82AD: 'bā,pā',
+    0x82AE: 'ruì,ruò',
+    0x82AF: 'xīn,xìn',
+    0x82B0: 'jì',
+    0x82B1: 'huā',
+    0x82B2: 'huā',
+    0x82B3: 'fāng',
+    0x82B4: 'wù,hū',
+    0x82B5: 'jué',
+    0x82B6: 'gǒu',
+    0x82B7: 'zhǐ',
+    0x82B8: 'yún,yùn',
+    0x82B9: 'qín',
+    0x82BA: 'ǎo',
+    0x82BB: 'chú,zōu',
+    0x82BC: 'mào',
+    0x82BD: 'yá',
+    0x82BE: 'fèi,fú',
+    0x82BF: 'rèng',
+    0x82C0: 'háng',
+    0x82C1: 'cōng',
+    0x82C2: 'yín',
+    0x82C3: 'yǒu',
+    0x82C4: 'biàn',
+    0x82C5: 'yì',
+    0x82C6: 'qiē',
+    0x82C7: 'wěi',
+    0x82C8: 'lì',
+    0x82C9: 'pǐ',
+    0x82CA: 'è',
+    0x82CB: 'xiàn',
+    0x82CC: 'cháng',
+    0x82CD: 'cāng',
+    0x82CE: 'zhù',
+    0x82CF: 'sū',
+    0x82D0: 'tí,dì',
+    0x82D1: 'yuàn,yuān,yù,yùn',
+    0x82D2: 'rǎn',
+    0x82D3: 'líng,lián',
+    0x82D4: 'tái,tāi',
+    0x82D5: 'sháo,tiáo',
+    0x82D6: 'dí',
+    0x82D7: 'miáo',
+    0x82D8: 'qǐng',
+    0x82D9: 'lì,jī',
+    0x82DA: 'yòng',
+    0x82DB: 'kē,hē',
+    0x82DC: 'mù',
+    0x82DD: 'bèi',
+    0x82DE: 'bāo,páo,biāo',
+    0x82DF: 'gǒu,gōu',
+    0x82E0: 'mín',
+    0x82E1: 'yǐ',
+    0x82E2: 'yǐ',
+    0x82E3: 'jù,qǔ',
+    0x82E4: 'piě,pī',
+    0x82E5: 'ruò,ré,rè,rě',
+    0x82E6: 'kǔ,gǔ,hù',
+    0x82E7: 'níng,zhù',
+    0x82E8: 'nǐ',
+    0x82E9: 'bó,pā',
+    0x82EA: 'bǐng',
+    0x82EB: 'shān,shàn,tiān,chān',
+    0x82EC: 'xiú',
+    0x82ED: 'yǎo',
+    0x82EE: 'xiān',
+    0x82EF: 'běn',
+    0x82F0: 'hóng',
+    0x82F1: 'yīng,yāng',
+    0x82F2: 'zhǎ,zhà,zuó',
+    0x82F3: 'dōng',
+    0x82F4: 'jū,chá,zhǎ,zū,jiē,bāo,xié',
+    0x82F5: 'dié',
+    0x82F6: 'nié,niè',
+    0x82F7: 'gān',
+    0x82F8: 'hū',
+    0x82F9: 'píng,pēng',
+    0x82FA: 'méi',
+    0x82FB: 'fú,pú',
+    0x82FC: 'shēng,ruí',
+    0x82FD: 'gū,guā',
+    0x82FE: 'bì,bié,mì',
+    0x82FF: 'wèi',
+    0x8300: 'fú,bó,fèi,bèi,bì',
+    0x8301: 'zhuó,zhú',
+    0x8302: 'mào',
+    0x8303: 'fàn',
+    0x8304: 'jiā,qié',
+    0x8305: 'máo',
+    0x8306: 'máo,mǎo',
+    0x8307: 'bá,pèi,fèi',
+    0x8308: 'cí,zǐ,cǐ,chái',
+    0x8309: 'mò',
+    0x830A: 'zī',
+    0x830B: 'zhǐ,dǐ',
+    0x830C: 'chí',
+    0x830D: 'jì',
+    0x830E: 'jīng',
+    0x830F: 'lóng',
+    0x8310: 'cōng',
+    0x8311: 'niǎo',
+    0x8312: 'yuán',
+    0x8313: 'xué',
+    0x8314: 'yíng',
+    0x8315: 'qióng',
+    0x8316: 'gé,luò',
+    0x8317: 'míng',
+    0x8318: 'lì',
+    0x8319: 'róng',
+    0x831A: 'yìn',
+    0x831B: 'gèn,jiàn',
+    0x831C: 'qiàn,xī',
+    0x831D: 'chǎi,zhǐ',
+    0x831E: 'chén',
+    0x831F: 'yù,wěi',
+    0x8320: 'hāo,xiū,kòu',
+    0x8321: 'zì',
+    0x8322: 'liè',
+    0x8323: 'wú',
+    0x8324: 'jì,duō',
+    0x8325: 'guī,guì',
+    0x8326: 'cì',
+    0x8327: 'jiǎn,chóng',
+    0x8328: 'cí',
+    0x8329: 'gòu',
+    0x832A: 'guāng',
+    0x832B: 'máng,huǎng',
+    0x832C: 'chá,chí',
+    0x832D: 'jiāo,xiào,qiào',
+    0x832E: 'jiāo,niǎo',
+    0x832F: 'fú',
+    0x8330: 'yú',
+    0x8331: 'zhū',
+    0x8332: 'zī,cí',
+    0x8333: 'jiāng',
+    0x8334: 'huí',
+    0x8335: 'yīn',
+    0x8336: 'chá',
+    0x8337: 'fá,pèi,bó,bá',
+    0x8338: 'rōng,róng,rǒng',
+    0x8339: 'rú',
+    0x833A: 'chōng',
+    0x833B: 'mǎng,mǔ',
+    0x833C: 'tóng',
+    0x833D: 'zhòng',
+    0x833E: 'qiān',
+    0x833F: 'zhú',
+    0x8340: 'xún',
+    0x8341: 'huán',
+    0x8342: 'fū',
+    0x8343: 'quán,chuò',
+    0x8344: 'gāi',
+    0x8345: 'dā,dá,tà',
+    0x8346: 'jīng',
+    0x8347: 'xìng',
+    0x8348: 'chuǎn',
+    0x8349: 'cǎo,zào',
+    0x834A: 'jīng',
+    0x834B: 'ér',
+    0x834C: 'àn',
+    0x834D: 'qiáo',
+    0x834E: 'chí',
+    0x834F: 'rěn',
+    0x8350: 'jiàn',
+    0x8351: 'tí,yí',
+    0x8352: 'huāng,huǎng,kāng,huáng',
+    0x8353: 'píng,pēng',
+    0x8354: 'lì',
+    0x8355: 'jīn',
+    0x8356: 'lǎo,chā',
+    0x8357: 'shù',
+    0x8358: 'zhuāng',
+    0x8359: 'dá',
+    0x835A: 'jiá',
+    0x835B: 'ráo',
+    0x835C: 'bì',
+    0x835D: 'cè',
+    0x835E: 'qiáo',
+    0x835F: 'huì',
+    0x8360: 'jì,qí',
+    0x8361: 'dàng',
+    0x8362: 'zì',
+    0x8363: 'róng',
+    0x8364: 'hūn,xūn',
+    0x8365: 'xíng,yíng',
+    0x8366: 'luò',
+    0x8367: 'yíng',
+    0x8368: 'xún,qián',
+    0x8369: 'jìn',
+    0x836A: 'sūn',
+    0x836B: 'yīn,yìn',
+    0x836C: 'mǎi',
+    0x836D: 'hóng',
+    0x836E: 'zhòu',
+    0x836F: 'yào',
+    0x8370: 'dù',
+    0x8371: 'wěi,wèi',
+    0x8372: 'lí',
+    0x8373: 'dòu',
+    0x8374: 'fū',
+    0x8375: 'rěn',
+    0x8376: 'yín',
+    0x8377: 'hé,hè,hē',
+    0x8378: 'bí',
+    0x8379: 'bù,pú',
+    0x837A: 'yǔn,yún',
+    0x837B: 'dí',
+    0x837C: 'tú,chá,yé,shū',
+    0x837D: 'suī,wěi',
+    0x837E: 'suī',
+    0x837F: 'chéng',
+    0x8380: 'chén,nóng',
+    0x8381: 'wú',
+    0x8382: 'bié',
+    0x8383: 'xī',
+    0x8384: 'gěng',
+    0x8385: 'lì',
+    0x8386: 'pú,fǔ',
+    0x8387: 'zhù',
+    0x8388: 'mò',
+    0x8389: 'lì,lí,chí',
+    0x838A: 'zhuāng',
+    0x838B: 'zuó,jí',
+    0x838C: 'tuō',
+    0x838D: 'qiú',
+    0x838E: 'shā,suō,suī',
+    0x838F: 'suō',
+    0x8390: 'chén',
+    0x8391: 'péng,fēng',
+    0x8392: 'jǔ',
+    0x8393: 'méi',
+    0x8394: 'méng,xí,qǐng',
+    0x8395: 'xìng',
+    0x8396: 'jīng,yīng',
+    0x8397: 'chē',
+    0x8398: 'shēn,xīn',
+    0x8399: 'jūn',
+    0x839A: 'yán',
+    0x839B: 'tíng,tǐng',
+    0x839C: 'yóu,diào,dí',
+    0x839D: 'cuò',
+    0x839E: 'guǎn,wǎn,guān',
+    0x839F: 'hàn',
+    0x83A0: 'yǒu,xiù',
+    0x83A1: 'cuò',
+    0x83A2: 'jiá',
+    0x83A3: 'wáng',
+    0x83A4: 'sù,yóu',
+    0x83A5: 'niǔ,ròu',
+    0x83A6: 'shāo,xiāo',
+    0x83A7: 'xiàn,wàn',
+    0x83A8: 'làng,liáng,láng',
+    0x83A9: 'fú,piǎo',
+    0x83AA: 'é',
+    0x83AB: 'mò,mù',
+    0x83AC: 'wèn,wǎn,miǎn',
+    0x83AD: 'jié',
+    0x83AE: 'nán',
+    0x83AF: 'mù',
+    0x83B0: 'kǎn',
+    0x83B1: 'lái',
+    0x83B2: 'lián',
+    0x83B3: 'shí,shì',
+    0x83B4: 'wō',
+    0x83B5: 'tù',
+    0x83B6: 'xiān',
+    0x83B7: 'huò',
+    0x83B8: 'yóu',
+    0x83B9: 'yíng',
+    0x83BA: 'yīng',
+    0x83BB: 'gòng',
+    0x83BC: 'chún',
+    0x83BD: 'mǎng,máng',
+    0x83BE: 'mǎng',
+    0x83BF: 'cì',
+    0x83C0: 'wǎn,yù,yùn',
+    0x83C1: 'jīng',
+    0x83C2: 'dì',
+    0x83C3: 'qú',
+    0x83C4: 'dōng',
+    0x83C5: 'jiān,guān',
+    0x83C6: 'zōu,cuán,chù,cóng',
+    0x83C7: 'gū',
+    0x83C8: 'lā',
+    0x83C9: 'lù,lǜ',
+    0x83CA: 'jú',
+    0x83CB: 'wèi',
+    0x83CC: 'jūn,jùn',
+    0x83CD: 'niè,rěn',
+    0x83CE: 'kūn',
+    0x83CF: 'hé,gē',
+    0x83D0: 'pú',
+    0x83D1: 'zāi,zī,zì',
+    0x83D2: 'gǎo',
+    0x83D3: 'guǒ',
+    0x83D4: 'fú',
+    0x83D5: 'lún',
+    0x83D6: 'chāng',
+    0x83D7: 'chóu',
+    0x83D8: 'sōng',
+    0x83D9: 'chuí',
+    0x83DA: 'zhàn',
+    0x83DB: 'mén',
+    0x83DC: 'cài',
+    0x83DD: 'bá',
+    0x83DE: 'lí',
+    0x83DF: 'tú,tù',
+    0x83E0: 'bō',
+    0x83E1: 'hàn',
+    0x83E2: 'bào',
+    0x83E3: 'qìn',
+    0x83E4: 'juǎn',
+    0x83E5: 'xī,sī',
+    0x83E6: 'qín',
+    0x83E7: 'dǐ',
+    0x83E8: 'jiē,shà',
+    0x83E9: 'pú,bèi,bó',
+    0x83EA: 'dàng',
+    0x83EB: 'jǐn',
+    0x83EC: 'qiáo,zhǎo',
+    0x83ED: 'tái,zhī,chí',
+    0x83EE: 'gēng',
+    0x83EF: 'huá,huā,huà,kuā',
+    0x83F0: 'gū',
+    0x83F1: 'líng',
+    0x83F2: 'fēi,fěi,fèi',
+    0x83F3: 'qín,qīn,jīn',
+    0x83F4: 'ān,yǎn',
+    0x83F5: 'wǎng',
+    0x83F6: 'běng',
+    0x83F7: 'zhǒu',
+    0x83F8: 'yān,yū,yù',
+    0x83F9: 'jū,zū,jù',
+    0x83FA: 'jiān',
+    0x83FB: 'lǐn',
+    0x83FC: 'tǎn',
+    0x83FD: 'shū,jiāo',
+    0x83FE: 'tián,tiàn',
+    0x83FF: 'dào,dǎo',
+    0x8400: 'hǔ',
+    0x8401: 'qí,jī',
+    0x8402: 'hé',
+    0x8403: 'cuì',
+    0x8404: 'táo',
+    0x8405: 'chūn',
+    0x8406: 'bì,pì,bēi,bá',
+    0x8407: 'cháng',
+    0x8408: 'huán',
+    0x8409: 'fèi,féi,fú',
+    0x840A: 'lái',
+    0x840B: 'qī',
+    0x840C: 'méng,míng',
+    0x840D: 'píng',
+    0x840E: 'wēi,wěi,wèi',
+    0x840F: 'dàn',
+    0x8410: 'shà',
+    0x8411: 'huán,zhuī',
+    0x8412: 'yǎn,juàn',
+    0x8413: 'yí',
+    0x8414: 'tiáo',
+    0x8415: 'qí',
+    0x8416: 'wǎn',
+    0x8417: 'cè',
+    0x8418: 'nài',
+    0x8419: 'zhěn',
+    0x841A: 'tuò',
+    0x841B: 'jiū',
+    0x841C: 'tiē',
+    0x841D: 'luó',
+    0x841E: 'bì',
+    0x841F: 'yì',
+    0x8420: 'pān',
+    0x8421: 'bo',
+    0x8422: 'pāo',
+    0x8423: 'dìng',
+    0x8424: 'yíng',
+    0x8425: 'yíng',
+    0x8426: 'yíng',
+    0x8427: 'xiāo',
+    0x8428: 'sà',
+    0x8429: 'qiū,jiāo',
+    0x842A: 'kē',
+    0x842B: 'xiàng',
+    0x842C: 'wàn',
+    0x842D: 'yǔ,jǔ',
+    0x842E: 'yú,yǔ,yù',
+    0x842F: 'fù,bèi',
+    0x8430: 'liàn',
+    0x8431: 'xuān',
+    0x8432: 'xuān',
+    0x8433: 'nǎn,nán',
+    0x8434: 'cè',
+    0x8435: 'wō',
+    0x8436: 'chǔn',
+    0x8437: 'xiāo,shāo,shuò',
+    0x8438: 'yú',
+    0x8439: 'biǎn,biān,pián',
+    0x843A: 'mào,mù',
+    0x843B: 'ān',
+    0x843C: 'è',
+    0x843D: 'luò,là,lào,luō',
+    0x843E: 'yíng',
+    0x843F: 'kuò,huó',
+    0x8440: 'kuò',
+    0x8441: 'jiāng',
+    0x8442: 'miǎn',
+    0x8443: 'zuò,zé',
+    0x8444: 'zuò',
+    0x8445: 'zū',
+    0x8446: 'bǎo,bāo',
+    0x8447: 'róu,rǒu',
+    0x8448: 'xǐ',
+    0x8449: 'yè,shè',
+    0x844A: 'ān',
+    0x844B: 'qú',
+    0x844C: 'jiān',
+    0x844D: 'fú',
+    0x844E: 'lǜ',
+    0x844F: 'jīng',
+    0x8450: 'pén,fén',
+    0x8451: 'fēng,fèng',
+    0x8452: 'hóng',
+    0x8453: 'hóng',
+    0x8454: 'hóu',
+    0x8455: 'yàn',
+    0x8456: 'tū',
+    0x8457: 'zhù,zhe,zhuó,chú,zhāo,zháo',
+    0x8458: 'zī',
+    0x8459: 'xiāng',
+    0x845A: 'rèn,shèn',
+    0x845B: 'gé,gě',
+    0x845C: 'qiā',
+    0x845D: 'qíng,jìng',
+    0x845E: 'mǐ',
+    0x845F: 'huáng',
+    0x8460: 'shēn,shān',
+    0x8461: 'pú,bèi',
+    0x8462: 'gài',
+    0x8463: 'dǒng,zhǒng',
+    0x8464: 'zhòu',
+    0x8465: 'jiàn,qián',
+    0x8466: 'wěi',
+    0x8467: 'bó',
+    0x8468: 'wēi',
+    0x8469: 'pā',
+    0x846A: 'jì',
+    0x846B: 'hú',
+    0x846C: 'zàng',
+    0x846D: 'jiā,xiá',
+    0x846E: 'duàn',
+    0x846F: 'yào',
+    0x8470: 'suī,jùn,suǒ',
+    0x8471: 'cōng,chuāng',
+    0x8472: 'quán',
+    0x8473: 'wēi',
+    0x8474: 'zhēn,qián',
+    0x8475: 'kuí',
+    0x8476: 'tíng,dǐng',
+    0x8477: 'hūn,xūn',
+    0x8478: 'xǐ',
+    0x8479: 'shī',
+    0x847A: 'qì',
+    0x847B: 'lán',
+    0x847C: 'zōng',
+    0x847D: 'yāo,yǎo',
+    0x847E: 'yuān',
+    0x847F: 'méi',
+    0x8480: 'yūn',
+    0x8481: 'shù',
+    0x8482: 'dì',
+    0x8483: 'zhuàn',
+    0x8484: 'guān',
+    0x8485: 'rǎn',
+    0x8486: 'xuē',
+    0x8487: 'chǎn',
+    0x8488: 'kǎi',
+    0x8489: 'kuì',
+    0x848A: 'huā',
+    0x848B: 'jiǎng',
+    0x848C: 'lóu',
+    0x848D: 'wěi,huā,kuī,é',
+    0x848E: 'pài',
+    0x848F: 'you',
+    0x8490: 'sōu,huì',
+    0x8491: 'yīn',
+    0x8492: 'shī',
+    0x8493: 'chún',
+    0x8494: 'shí,shì',
+    0x8495: 'yūn',
+    0x8496: 'zhēn',
+    0x8497: 'làng',
+    0x8498: 'rú,ná',
+    0x8499: 'méng,mēng,měng',
+    0x849A: 'lì',
+    0x849B: 'quē',
+    0x849C: 'suàn',
+    0x849D: 'yuán,huán',
+    0x849E: 'lì',
+    0x849F: 'jǔ',
+    0x84A0: 'xī',
+    0x84A1: 'bàng,páng',
+    0x84A2: 'chú',
+    0x84A3: 'xú,shú',
+    0x84A4: 'tú',
+    0x84A5: 'liú',
+    0x84A6: 'huò,wò',
+    0x84A7: 'diǎn',
+    0x84A8: 'qiàn',
+    0x84A9: 'zū,jù,jí',
+    0x84AA: 'pò',
+    0x84AB: 'cuó',
+    0x84AC: 'yuān',
+    0x84AD: 'chú',
+    0x84AE: 'yù',
+    0x84AF: 'kuǎi,kuài',
+    0x84B0: 'pán',
+    0x84B1: 'pú',
+    0x84B2: 'pú,bó',
+    0x84B3: 'nà',
+    0x84B4: 'shuò',
+    0x84B5: 'xí,xì',
+    0x84B6: 'fén',
+    0x84B7: 'yún',
+    0x84B8: 'zhēng',
+    0x84B9: 'jiān',
+    0x84BA: 'jí',
+    0x84BB: 'ruò',
+    0x84BC: 'cāng,cǎng',
+    0x84BD: 'ēn',
+    0x84BE: 'mí',
+    0x84BF: 'hāo,gǎo',
+    0x84C0: 'sūn',
+    0x84C1: 'zhēn,qín',
+    0x84C2: 'míng,mì',
+    0x84C3: 'sōu,sǒu',
+    0x84C4: 'xù',
+    0x84C5: 'liú',
+    0x84C6: 'xí',
+    0x84C7: 'gǔ,gū',
+    0x84C8: 'láng',
+    0x84C9: 'róng',
+    0x84CA: 'wěng',
+    0x84CB: 'gài,gě',
+    0x84CC: 'cuò',
+    0x84CD: 'shī',
+    0x84CE: 'táng',
+    0x84CF: 'luǒ',
+    0x84D0: 'rù',
+    0x84D1: 'suō,suī',
+    0x84D2: 'xuān',
+    0x84D3: 'bèi',
+    0x84D4: 'yǎo,zhuó',
+    0x84D5: 'guì',
+    0x84D6: 'bì',
+    0x84D7: 'zǒng',
+    0x84D8: 'gǔn',
+    0x84D9: 'zuò',
+    0x84DA: 'tiáo',
+    0x84DB: 'cè',
+    0x84DC: 'pèi',
+    0x84DD: 'lán,la',
+    0x84DE: 'dàn',
+    0x84DF: 'jì',
+    0x84E0: 'lí',
+    0x84E1: 'shēn',
+    0x84E2: 'lǎng',
+    0x84E3: 'yù',
+    0x84E4: 'líng',
+    0x84E5: 'yíng',
+    0x84E6: 'mò',
+    0x84E7: 'diào,tiáo,dí',
+    0x84E8: 'tiáo,xiū',
+    0x84E9: 'mǎo',
+    0x84EA: 'tōng',
+    0x84EB: 'chù,zhú',
+    0x84EC: 'péng,pèng',
+    0x84ED: 'ān',
+    0x84EE: 'lián,liǎn',
+    0x84EF: 'cōng,zǒng,sǒng',
+    0x84F0: 'xǐ',
+    0x84F1: 'píng',
+    0x84F2: 'qiū,ōu,xū,fū',
+    0x84F3: 'jǐn',
+    0x84F4: 'chún,tuán',
+    0x84F5: 'jié',
+    0x84F6: 'wéi',
+    0x84F7: 'tuī',
+    0x84F8: 'cáo',
+    0x84F9: 'yù',
+    0x84FA: 'yì',
+    0x84FB: 'zí,jú',
+    0x84FC: 'liǎo,lù,lǎo,liǔ',
+    0x84FD: 'bì',
+    0x84FE: 'lǔ',
+    0x84FF: 'xu,sù',
+    0x8500: 'bù',
+    0x8501: 'zhāng',
+    0x8502: 'léi',
+    0x8503: 'qiáng,jiàng',
+    0x8504: 'màn',
+    0x8505: 'yán',
+    0x8506: 'líng',
+    0x8507: 'jì,xì',
+    0x8508: 'biāo,piào,piǎo,biào',
+    0x8509: 'gǔn',
+    0x850A: 'hǎn,hàn',
+    0x850B: 'dí',
+    0x850C: 'sù',
+    0x850D: 'lù,cū',
+    0x850E: 'shè',
+    0x850F: 'shāng',
+    0x8510: 'dí',
+    0x8511: 'miè',
+    0x8512: 'xūn',
+    0x8513: 'màn,mán,wàn',
+    0x8514: 'bó,bo',
+    0x8515: 'dì,dài,chài',
+    0x8516: 'cuó,cǔ,zhā',
+    0x8517: 'zhè',
+    0x8518: 'shēn,sān,sǎn',
+    0x8519: 'xuàn',
+    0x851A: 'wèi,yù',
+    0x851B: 'hú',
+    0x851C: 'áo',
+    0x851D: 'mǐ',
+    0x851E: 'lóu,lǚ,jù,liǔ',
+    0x851F: 'cù,còu,chuò',
+    0x8520: 'zhōng',
+    0x8521: 'cài,sà,cā',
+    0x8522: 'pó,bò',
+    0x8523: 'jiǎng,jiāng',
+    0x8524: 'mì',
+    0x8525: 'cōng',
+    0x8526: 'niǎo',
+    0x8527: 'huì',
+    0x8528: 'juàn,jùn',
+    0x8529: 'yín',
+    0x852A: 'jiàn,jiān,shān',
+    0x852B: 'niān,yān,yàn',
+    0x852C: 'shū,shǔ',
+    0x852D: 'yīn,yìn',
+    0x852E: 'guó',
+    0x852F: 'chén',
+    0x8530: 'hù',
+    0x8531: 'shā',
+    0x8532: 'kòu',
+    0x8533: 'qiàn',
+    0x8534: 'má',
+    0x8535: 'zāng,cáng',
+    0x8536: 'zé',
+    0x8537: 'qiáng',
+    0x8538: 'dōu',
+    0x8539: 'liǎn',
+    0x853A: 'lìn',
+    0x853B: 'kòu',
+    0x853C: 'ǎi',
+    0x853D: 'bì,biē,piē',
+    0x853E: 'lí',
+    0x853F: 'wěi',
+    0x8540: 'jí',
+    0x8541: 'qián,tán,xún',
+    0x8542: 'shèng',
+    0x8543: 'fān,bō,fán,pí',
+    0x8544: 'méng',
+    0x8545: 'ǒu',
+    0x8546: 'chǎn',
+    0x8547: 'diǎn',
+    0x8548: 'xùn,tán',
+    0x8549: 'jiāo,qiáo,qiāo',
+    0x854A: 'ruǐ,juǎn',
+    0x854B: 'ruǐ',
+    0x854C: 'lěi',
+    0x854D: 'yú',
+    0x854E: 'qiáo,jiāo',
+    0x854F: 'chú',
+    0x8550: 'huá',
+    0x8551: 'jiān',
+    0x8552: 'mǎi',
+    0x8553: 'yún',
+    0x8554: 'bāo',
+    0x8555: 'yóu',
+    0x8556: 'qú',
+    0x8557: 'lù',
+    0x8558: 'ráo,yáo',
+    0x8559: 'huì',
+    0x855A: 'è',
+    0x855B: 'tí',
+    0x855C: 'fěi',
+    0x855D: 'jué,zuì',
+    0x855E: 'zuì,jué,zhuó',
+    0x855F: 'fà,fèi',
+    0x8560: 'rú',
+    0x8561: 'fén,fèi',
+    0x8562: 'kuì,kuài',
+    0x8563: 'shùn',
+    0x8564: 'ruí',
+    0x8565: 'yǎ',
+    0x8566: 'xū',
+    0x8567: 'fù',
+    0x8568: 'jué',
+    0x8569: 'dàng,tāng,tàng',
+    0x856A: 'wú,wǔ',
+    0x856B: 'dǒng',
+    0x856C: 'sī',
+    0x856D: 'xiāo',
+    0x856E: 'xì',
+    0x856F: 'lóng',
+    0x8570: 'wēn,yùn',
+    0x8571: 'shāo',
+    0x8572: 'qí',
+    0x8573: 'jiān',
+    0x8574: 'yùn',
+    0x8575: 'sūn',
+    0x8576: 'líng',
+    0x8577: 'yù',
+    0x8578: 'xiá',
+    0x8579: 'wèng,yōng',
+    0x857A: 'jí,qiè',
+    0x857B: 'hóng,hòng',
+    0x857C: 'sì',
+    0x857D: 'nóng',
+    0x857E: 'lěi',
+    0x857F: 'xuān',
+    0x8580: 'yùn',
+    0x8581: 'yù,ào',
+    0x8582: 'xí,xiào',
+    0x8583: 'hào',
+    0x8584: 'báo,bó,bò,bù',
+    0x8585: 'hāo',
+    0x8586: 'ài',
+    0x8587: 'wēi',
+    0x8588: 'huì',
+    0x8589: 'huì',
+    0x858A: 'jì',
+    0x858B: 'cí,zī',
+    0x858C: 'xiāng,xiǎng',
+    0x858D: 'wàn,luàn',
+    0x858E: 'miè',
+    0x858F: 'yì',
+    0x8590: 'léng',
+    0x8591: 'jiāng',
+    0x8592: 'càn',
+    0x8593: 'shēn',
+    0x8594: 'qiáng,sè',
+    0x8595: 'lián',
+    0x8596: 'kē',
+    0x8597: 'yuán',
+    0x8598: 'dá',
+    0x8599: 'tì,zhì',
+    0x859A: 'tāng',
+    0x859B: 'xuē',
+    0x859C: 'bì,bò,bó,bài,pì',
+    0x859D: 'zhān',
+    0x859E: 'sūn',
+    0x859F: 'xiān,liǎn,yán,kàn',
+    0x85A0: 'fán',
+    0x85A1: 'dǐng',
+    0x85A2: 'xiè',
+    0x85A3: 'gǔ',
+    0x85A4: 'xiè',
+    0x85A5: 'shǔ,zhú',
+    0x85A6: 'jiàn',
+    0x85A7: 'hāo,kǎo',
+    0x85A8: 'hōng',
+    0x85A9: 'sà',
+    0x85AA: 'xīn',
+    0x85AB: 'xūn',
+    0x85AC: 'yào',
+    0x85AD: 'bài',
+    0x85AE: 'sǒu',
+    0x85AF: 'shǔ',
+    0x85B0: 'xūn',
+    0x85B1: 'duì',
+    0x85B2: 'pín',
+    0x85B3: 'wěi,yuǎn',
+    0x85B4: 'níng',
+    0x85B5: 'chóu,zhòu,dào',
+    0x85B6: 'mái,wō',
+    0x85B7: 'rú',
+    0x85B8: 'piáo',
+    0x85B9: 'tái',
+    0x85BA: 'jì,cí,qì,qí',
+    0x85BB: 'zǎo',
+    0x85BC: 'chén',
+    0x85BD: 'zhēn',
+    0x85BE: 'ěr',
+    0x85BF: 'nǐ',
+    0x85C0: 'yíng',
+    0x85C1: 'gǎo',
+    0x85C2: 'cóng,còng',
+    0x85C3: 'xiāo,hào,hè',
+    0x85C4: 'qí',
+    0x85C5: 'fá',
+    0x85C6: 'jiǎn',
+    0x85C7: 'xù,yǔ,yú,yù,xū',
+    0x85C8: 'kuí',
+    0x85C9: 'jí,jiè',
+    0x85CA: 'biǎn',
+    0x85CB: 'diào,dí,zhuó',
+    0x85CC: 'mì',
+    0x85CD: 'lán,la',
+    0x85CE: 'jìn',
+    0x85CF: 'cáng,zàng,zāng',
+    0x85D0: 'miǎo,mò',
+    0x85D1: 'qióng',
+    0x85D2: 'qiè',
+    0x85D3: 'xiǎn',
+    0x85D4: 'liáo',
+    0x85D5: 'ǒu',
+    0x85D6: 'xián,qiān',
+    0x85D7: 'sù',
+    0x85D8: 'lǘ',
+    0x85D9: 'yì',
+    0x85DA: 'xù',
+    0x85DB: 'xiě',
+    0x85DC: 'lí',
+    0x85DD: 'yì',
+    0x85DE: 'lǎ',
+    0x85DF: 'lěi',
+    0x85E0: 'jiào',
+    0x85E1: 'dí',
+    0x85E2: 'zhǐ',
+    0x85E3: 'bēi',
+    0x85E4: 'téng',
+    0x85E5: 'yào,shuò,lüè',
+    0x85E6: 'mò,mó',
+    0x85E7: 'huàn',
+    0x85E8: 'biāo,pāo',
+    0x85E9: 'fān,fán',
+    0x85EA: 'sǒu,shǔ,còu',
+    0x85EB: 'tán',
+    0x85EC: 'tuī',
+    0x85ED: 'qióng',
+    0x85EE: 'qiáo',
+    0x85EF: 'wèi',
+    0x85F0: 'liú,liǔ',
+    0x85F1: 'huì,huí',
+    0x85F2: 'ōu',
+    0x85F3: 'gǎo',
+    0x85F4: 'yùn,wēn',
+    0x85F5: 'bǎo',
+    0x85F6: 'lì',
+    0x85F7: 'shǔ,zhū',
+    0x85F8: 'chú,zhū,zhā',
+    0x85F9: 'ǎi',
+    0x85FA: 'lìn',
+    0x85FB: 'zǎo',
+    0x85FC: 'xuān',
+    0x85FD: 'qìn',
+    0x85FE: 'lài',
+    0x85FF: 'huò,hé',
+    0x8600: 'tuò,zé',
+    0x8601: 'wù,è',
+    0x8602: 'ruǐ',
+    0x8603: 'ruǐ',
+    0x8604: 'qí,jī,qín',
+    0x8605: 'héng',
+    0x8606: 'lú,lǔ',
+    0x8607: 'sū',
+    0x8608: 'tuí',
+    0x8609: 'méng,máng',
+    0x860A: 'yùn',
+    0x860B: 'píng,pín',
+    0x860C: 'yǔ',
+    0x860D: 'xūn',
+    0x860E: 'jì',
+    0x860F: 'jiōng',
+    0x8610: 'xuān',
+    0x8611: 'mó',
+    0x8612: 'qiū',
+    0x8613: 'sū',
+    0x8614: 'jiōng',
+    0x8615: 'péng',
+    0x8616: 'niè,bò',
+    0x8617: 'bò,bì',
+    0x8618: 'ráng,xiāng,nāng',
+    0x8619: 'yì',
+    0x861A: 'xiǎn',
+    0x861B: 'yú',
+    0x861C: 'jú',
+    0x861D: 'liǎn',
+    0x861E: 'liǎn,xiān',
+    0x861F: 'yǐn',
+    0x8620: 'qiáng',
+    0x8621: 'yīng',
+    0x8622: 'lóng,lǒng,lòng',
+    0x8623: 'tǒu',
+    0x8624: 'huā',
+    0x8625: 'yuè',
+    0x8626: 'líng',
+    0x8627: 'qú,jù',
+    0x8628: 'yáo',
+    0x8629: 'fán',
+    0x862A: 'méi',
+    0x862B: 'hàn,làn',
+    0x862C: 'kuī,huǐ,guī',
+    0x862D: 'lán',
+    0x862E: 'jì',
+    0x862F: 'dàng',
+    0x8630: 'màn',
+    0x8631: 'lèi',
+    0x8632: 'léi',
+    0x8633: 'huī',
+    0x8634: 'fēng,sōng',
+    0x8635: 'zhī',
+    0x8636: 'wèi',
+    0x8637: 'kuí',
+    0x8638: 'zhàn',
+    0x8639: 'huái',
+    0x863A: 'lí',
+    0x863B: 'jì',
+    0x863C: 'mí',
+    0x863D: 'lěi',
+    0x863E: 'huài',
+    0x863F: 'luó',
+    0x8640: 'jī',
+    0x8641: 'kuí',
+    0x8642: 'lù',
+    0x8643: 'jiān',
+    0x8644: 'sà',
+    0x8645: 'téng',
+    0x8646: 'léi',
+    0x8647: 'quǎn',
+    0x8648: 'xiāo',
+    0x8649: 'yì',
+    0x864A: 'luán',
+    0x864B: 'mén',
+    0x864C: 'biē',
+    0x864D: 'hū',
+    0x864E: 'hǔ,hù',
+    0x864F: 'lǔ',
+    0x8650: 'nüè',
+    0x8651: 'lǜ,bì',
+    0x8652: 'sī,xī,tí,zhì',
+    0x8653: 'xiāo',
+    0x8654: 'qián',
+    0x8655: 'chù,chǔ,jù',
+    0x8656: 'hū,hú,hù',
+    0x8657: 'xū',
+    0x8658: 'cuó',
+    0x8659: 'fú',
+    0x865A: 'xū',
+    0x865B: 'xū',
+    0x865C: 'lǔ',
+    0x865D: 'hǔ',
+    0x865E: 'yú',
+    0x865F: 'hào,háo',
+    0x8660: 'jiāo,háo',
+    0x8661: 'jù',
+    0x8662: 'guó',
+    0x8663: 'bào',
+    0x8664: 'yán',
+    0x8665: 'zhàn',
+    0x8666: 'zhàn',
+    0x8667: 'kuī',
+    0x8668: 'bīn',
+    0x8669: 'xì,sè',
+    0x866A: 'shù',
+    0x866B: 'chóng,huǐ',
+    0x866C: 'qiú',
+    0x866D: 'diāo,dāo',
+    0x866E: 'jǐ,jī',
+    0x866F: 'qiú',
+    0x8670: 'dīng,chēng',
+    0x8671: 'shī',
+    0x8672: 'xiā',
+    0x8673: 'jué',
+    0x8674: 'zhé',
+    0x8675: 'shé,yě',
+    0x8676: 'yū',
+    0x8677: 'hán,gān',
+    0x8678: 'zǐ',
+    0x8679: 'hóng,jiàng,hòng,gòng',
+    0x867A: 'huī,huǐ',
+    0x867B: 'méng',
+    0x867C: 'gè',
+    0x867D: 'suī',
+    0x867E: 'xiā,há',
+    0x867F: 'chài',
+    0x8680: 'shí',
+    0x8681: 'yǐ',
+    0x8682: 'mǎ,mà,mā',
+    0x8683: 'xiǎng',
+    0x8684: 'fāng,bàng',
+    0x8685: 'è',
+    0x8686: 'bā',
+    0x8687: 'chǐ',
+    0x8688: 'qiān',
+    0x8689: 'wén',
+    0x868A: 'wén',
+    0x868B: 'ruì',
+    0x868C: 'bàng,bèng,pí,fēng',
+    0x868D: 'pí',
+    0x868E: 'yuè',
+    0x868F: 'yuè',
+    0x8690: 'jūn',
+    0x8691: 'qí',
+    0x8692: 'tóng',
+    0x8693: 'yǐn',
+    0x8694: 'qí,zhǐ',
+    0x8695: 'cán,tiǎn',
+    0x8696: 'yuán,wán',
+    0x8697: 'jué,quē',
+    0x8698: 'huí,huì,yóu',
+    0x8699: 'qín,qián',
+    0x869A: 'qí',
+    0x869B: 'zhòng',
+    0x869C: 'yá',
+    0x869D: 'háo,cì',
+    0x869E: 'mù',
+    0x869F: 'wáng',
+    0x86A0: 'fén',
+    0x86A1: 'fén',
+    0x86A2: 'háng',
+    0x86A3: 'gōng,zhōng',
+    0x86A4: 'zǎo,zhǎo',
+    0x86A5: 'fù,fǔ',
+    0x86A6: 'rán',
+    0x86A7: 'jiè',
+    0x86A8: 'fú',
+    0x86A9: 'chī',
+    0x86AA: 'dǒu',
+    0x86AB: 'bào,páo',
+    0x86AC: 'xiǎn',
+    0x86AD: 'ní',
+    0x86AE: 'dài',
+    0x86AF: 'qiū',
+    0x86B0: 'yóu,zhú',
+    0x86B1: 'zhà',
+    0x86B2: 'píng',
+    0x86B3: 'chí,chī,dì',
+    0x86B4: 'yòu,yǒu,niù',
+    0x86B5: 'hé,kè',
+    0x86B6: 'hān,hán',
+    0x86B7: 'jù',
+    0x86B8: 'lì',
+    0x86B9: 'fù',
+    0x86BA: 'rán,tiàn',
+    0x86BB: 'zhá',
+    0x86BC: 'gǒu,qú,xù',
+    0x86BD: 'pí',
+    0x86BE: 'pí,bǒ',
+    0x86BF: 'xián',
+    0x86C0: 'zhù',
+    0x86C1: 'diāo',
+    0x86C2: 'bié',
+    0x86C3: 'bǐng',
+    0x86C4: 'gū,gǔ',
+    0x86C5: 'zhān',
+    0x86C6: 'qū,jū',
+    0x86C7: 'shé,yí,tuó,chí',
+    0x86C8: 'tiě',
+    0x86C9: 'líng',
+    0x86CA: 'gǔ',
+    0x86CB: 'dàn',
+    0x86CC: 'gǔ',
+    0x86CD: 'yíng',
+    0x86CE: 'lì',
+    0x86CF: 'chēng',
+    0x86D0: 'qū',
+    0x86D1: 'móu,máo',
+    0x86D2: 'gé,luò',
+    0x86D3: 'cì',
+    0x86D4: 'huí',
+    0x86D5: 'huí,huǐ',
+    0x86D6: 'máng,bàng',
+    0x86D7: 'fù',
+    0x86D8: 'yáng,yǎng',
+    0x86D9: 'wā,jué',
+    0x86DA: 'liè',
+    0x86DB: 'zhū',
+    0x86DC: 'yī',
+    0x86DD: 'xián',
+    0x86DE: 'kuò,shé',
+    0x86DF: 'jiāo',
+    0x86E0: 'lì',
+    0x86E1: 'yì,xǔ',
+    0x86E2: 'píng',
+    0x86E3: 'qī,jié,qiè',
+    0x86E4: 'há,gé,hā,é',
+    0x86E5: 'shé',
+    0x86E6: 'yí',
+    0x86E7: 'wǎng',
+    0x86E8: 'mò',
+    0x86E9: 'qióng,gǒng',
+    0x86EA: 'qiè,ní',
+    0x86EB: 'guǐ',
+    0x86EC: 'qióng',
+    0x86ED: 'zhì',
+    0x86EE: 'mán',
+    0x86EF: 'lǎo',
+    0x86F0: 'zhé',
+    0x86F1: 'jiá',
+    0x86F2: 'náo',
+    0x86F3: 'sī',
+    0x86F4: 'qí',
+    0x86F5: 'xīng',
+    0x86F6: 'jiè',
+    0x86F7: 'qiú',
+    0x86F8: 'shāo,xiāo',
+    0x86F9: 'yǒng',
+    0x86FA: 'jiá',
+    0x86FB: 'tuì',
+    0x86FC: 'chē',
+    0x86FD: 'bèi',
+    0x86FE: 'é,yǐ',
+    0x86FF: 'hàn',
+    0x8700: 'shǔ',
+    0x8701: 'xuán',
+    0x8702: 'fēng',
+    0x8703: 'shèn',
+    0x8704: 'shèn,zhèn',
+    0x8705: 'fǔ,pú',
+    0x8706: 'xiàn,xiǎn',
+    0x8707: 'zhē,zhé',
+    0x8708: 'wú',
+    0x8709: 'fú',
+    0x870A: 'lí',
+    0x870B: 'láng,liáng',
+    0x870C: 'bì',
+    0x870D: 'chú,yú',
+    0x870E: 'yuān,xuān',
+    0x870F: 'yǒu',
+    0x8710: 'jié',
+    0x8711: 'dàn',
+    0x8712: 'yán,yàn,dàn',
+    0x8713: 'tíng,diàn',
+    0x8714: 'diàn',
+    0x8715: 'tuì,yuè',
+    0x8716: 'huí',
+    0x8717: 'wō',
+    0x8718: 'zhī',
+    0x8719: 'sōng',
+    0x871A: 'fēi,fěi,pèi,bèi',
+    0x871B: 'jū',
+    0x871C: 'mì',
+    0x871D: 'qí',
+    0x871E: 'qí',
+    0x871F: 'yù',
+    0x8720: 'jùn',
+    0x8721: 'là,qù,zhà,jí',
+    0x8722: 'měng,mèng',
+    0x8723: 'qiāng',
+    0x8724: 'sī,xī',
+    0x8725: 'xī',
+    0x8726: 'lún,lǔn',
+    0x8727: 'lì',
+    0x8728: 'dié',
+    0x8729: 'tiáo,diào',
+    0x872A: 'táo',
+    0x872B: 'kūn',
+    0x872C: 'hán',
+    0x872D: 'hàn',
+    0x872E: 'yù,guō',
+    0x872F: 'bàng',
+    0x8730: 'féi,fèi',
+    0x8731: 'pí,miáo',
+    0x8732: 'wēi,wěi',
+    0x8733: 'dūn,tūn',
+    0x8734: 'yì,xí',
+    0x8735: 'yuān,yūn',
+    0x8736: 'suò',
+    0x8737: 'quán,juǎn',
+    0x8738: 'qiǎn',
+    0x8739: 'ruì,wèi',
+    0x873A: 'ní',
+    0x873B: 'qīng,jīng',
+    0x873C: 'wèi,wěi,tóng',
+    0x873D: 'liǎng',
+    0x873E: 'guǒ,luǒ',
+    0x873F: 'wān,wǎn',
+    0x8740: 'dōng',
+    0x8741: 'è',
+    0x8742: 'bǎn',
+    0x8743: 'dì,zhuō',
+    0x8744: 'wǎng',
+    0x8745: 'cán',
+    0x8746: 'yǎng',
+    0x8747: 'yíng',
+    0x8748: 'guō',
+    0x8749: 'chán',
+    0x874A: 'dìng',
+    0x874B: 'là',
+    0x874C: 'kē',
+    0x874D: 'jié,jí',
+    0x874E: 'xiē,hé',
+    0x874F: 'tíng',
+    0x8750: 'mào',
+    0x8751: 'xū,xiè',
+    0x8752: 'mián',
+    0x8753: 'yú',
+    0x8754: 'jiē',
+    0x8755: 'shí,lì,lóng',
+    0x8756: 'xuān',
+    0x8757: 'huáng',
+    0x8758: 'yǎn',
+    0x8759: 'biān,pián',
+    0x875A: 'róu,náo',
+    0x875B: 'wēi',
+    0x875C: 'fù',
+    0x875D: 'yuán,yuān',
+    0x875E: 'mèi',
+    0x875F: 'wèi',
+    0x8760: 'fú',
+    0x8761: 'rú,ruǎn',
+    0x8762: 'xié',
+    0x8763: 'yóu',
+    0x8764: 'qiú,yóu,jiū',
+    0x8765: 'máo,wú,wù',
+    0x8766: 'xiā,há,jiǎ',
+    0x8767: 'yīng',
+    0x8768: 'shī',
+    0x8769: 'chóng,zhōng',
+    0x876A: 'tāng',
+    0x876B: 'zhū',
+    0x876C: 'zōng',
+    0x876D: 'tí,chí',
+    0x876E: 'fù',
+    0x876F: 'yuán',
+    0x8770: 'kuí',
+    0x8771: 'méng',
+    0x8772: 'là',
+    0x8773: 'dú,dài',
+    0x8774: 'hú',
+    0x8775: 'qiū',
+    0x8776: 'dié,tiē',
+    0x8777: 'lì,xí',
+    0x8778: 'wō,luó,guǒ',
+    0x8779: 'yūn,ǎo',
+    0x877A: 'qǔ,yǔ',
+    0x877B: 'nǎn',
+    0x877C: 'lóu',
+    0x877D: 'chūn',
+    0x877E: 'róng',
+    0x877F: 'yíng',
+    0x8780: 'jiāng',
+    0x8781: 'ban',
+    0x8782: 'láng',
+    0x8783: 'páng,bǎng',
+    0x8784: 'sī',
+    0x8785: 'xī,cì',
+    0x8786: 'cì',
+    0x8787: 'xī,qī',
+    0x8788: 'yuán',
+    0x8789: 'wēng',
+    0x878A: 'lián',
+    0x878B: 'sōu',
+    0x878C: 'bān,pán,huàn',
+    0x878D: 'róng',
+    0x878E: 'róng',
+    0x878F: 'jí',
+    0x8790: 'wū',
+    0x8791: 'xiù',
+    0x8792: 'hàn',
+    0x8793: 'qín',
+    0x8794: 'yí,sī',
+    0x8795: 'bī,pī',
+    0x8796: 'huá',
+    0x8797: 'táng',
+    0x8798: 'yǐ',
+    0x8799: 'dù',
+    0x879A: 'nài,nái,něng',
+    0x879B: 'hé,xiá',
+    0x879C: 'hú',
+    0x879D: 'guī,huǐ',
+    0x879E: 'mǎ,mā,mà',
+    0x879F: 'míng',
+    0x87A0: 'yì',
+    0x87A1: 'wén',
+    0x87A2: 'yíng',
+    0x87A3: 'tè,téng',
+    0x87A4: 'zhōng',
+    0x87A5: 'cāng',
+    0x87A6: 'sāo',
+    0x87A7: 'qí',
+    0x87A8: 'mǎn',
+    0x87A9: 'tiao',
+    0x87AA: 'shāng',
+    0x87AB: 'shì,zhē',
+    0x87AC: 'cáo',
+    0x87AD: 'chī',
+    0x87AE: 'dì,dài',
+    0x87AF: 'áo',
+    0x87B0: 'lù',
+    0x87B1: 'wèi',
+    0x87B2: 'zhì,dié',
+    0x87B3: 'táng',
+    0x87B4: 'chén',
+    0x87B5: 'piāo',
+    0x87B6: 'qú,jù',
+    0x87B7: 'pí',
+    0x87B8: 'yú',
+    0x87B9: 'jiàn,chán',
+    0x87BA: 'luó',
+    0x87BB: 'lóu',
+    0x87BC: 'qǐn',
+    0x87BD: 'zhōng',
+    0x87BE: 'yǐn,yín',
+    0x87BF: 'jiāng',
+    0x87C0: 'shuài',
+    0x87C1: 'wén',
+    0x87C2: 'xiāo',
+    0x87C3: 'wàn',
+    0x87C4: 'zhé',
+    0x87C5: 'zhè',
+    0x87C6: 'má,mò',
+    0x87C7: 'má',
+    0x87C8: 'guō,yù',
+    0x87C9: 'liú,liào',
+    0x87CA: 'máo,méng',
+    0x87CB: 'xī',
+    0x87CC: 'cōng',
+    0x87CD: 'lí',
+    0x87CE: 'mǎn',
+    0x87CF: 'xiāo',
+    0x87D0: 'chang',
+    0x87D1: 'zhāng',
+    0x87D2: 'mǎng,měng',
+    0x87D3: 'xiàng',
+    0x87D4: 'mò',
+    0x87D5: 'zuī',
+    0x87D6: 'sī',
+    0x87D7: 'qiū',
+    0x87D8: 'tè',
+    0x87D9: 'zhí',
+    0x87DA: 'péng',
+    0x87DB: 'péng',
+    0x87DC: 'jiǎo,qiáo',
+    0x87DD: 'qú',
+    0x87DE: 'biē,bié',
+    0x87DF: 'liáo',
+    0x87E0: 'pán,fán',
+    0x87E1: 'guǐ',
+    0x87E2: 'xǐ',
+    0x87E3: 'jǐ,qí',
+    0x87E4: 'zhuān',
+    0x87E5: 'huáng',
+    0x87E6: 'féi,bēn',
+    0x87E7: 'láo,liáo',
+    0x87E8: 'jué',
+    0x87E9: 'jué',
+    0x87EA: 'huì',
+    0x87EB: 'yín,xún',
+    0x87EC: 'chán,tí,shàn',
+    0x87ED: 'jiāo',
+    0x87EE: 'shàn',
+    0x87EF: 'náo,rào',
+    0x87F0: 'xiāo',
+    0x87F1: 'wú,móu',
+    0x87F2: 'chóng,zhòng,tóng',
+    0x87F3: 'xún',
+    0x87F4: 'sī',
+    0x87F5: 'chú',
+    0x87F6: 'chēng',
+    0x87F7: 'dāng',
+    0x87F8: 'lǐ',
+    0x87F9: 'xiè',
+    0x87FA: 'shàn,dàn,chán,tuó',
+    0x87FB: 'yǐ,jǐ',
+    0x87FC: 'jǐng',
+    0x87FD: 'dá',
+    0x87FE: 'chán',
+    0x87FF: 'qì,jì',
+    0x8800: 'cī,jí',
+    0x8801: 'xiǎng',
+    0x8802: 'shè',
+    0x8803: 'luǒ,luó,guǒ',
+    0x8804: 'qín',
+    0x8805: 'yíng',
+    0x8806: 'chài',
+    0x8807: 'lì',
+    0x8808: 'zéi',
+    0x8809: 'xuān',
+    0x880A: 'lián',
+    0x880B: 'zhú',
+    0x880C: 'zé',
+    0x880D: 'xiē',
+    0x880E: 'mǎng',
+    0x880F: 'xiè',
+    0x8810: 'qí',
+    0x8811: 'róng',
+    0x8812: 'jiǎn',
+    0x8813: 'měng',
+    0x8814: 'háo',
+    0x8815: 'rú',
+    0x8816: 'huò,yuè',
+    0x8817: 'zhuó',
+    0x8818: 'jié',
+    0x8819: 'pín',
+    0x881A: 'hē',
+    0x881B: 'miè',
+    0x881C: 'fán',
+    0x881D: 'lěi',
+    0x881E: 'jié',
+    0x881F: 'là',
+    0x8820: 'mǐn,mián',
+    0x8821: 'lí,lǐ,luǒ,luó,lì',
+    0x8822: 'chǔn',
+    0x8823: 'lì',
+    0x8824: 'qiū',
+    0x8825: 'niè',
+    0x8826: 'lú',
+    0x8827: 'dù',
+    0x8828: 'xiāo',
+    0x8829: 'zhū,chú',
+    0x882A: 'lóng',
+    0x882B: 'lí',
+    0x882C: 'lóng',
+    0x882D: 'fēng,páng',
+    0x882E: 'yē',
+    0x882F: 'pí',
+    0x8830: 'náng,shàng,rǎng',
+    0x8831: 'gǔ,yě',
+    0x8832: 'juān',
+    0x8833: 'yīng',
+    0x8834: 'shǔ',
+    0x8835: 'xī',
+    0x8836: 'cán',
+    0x8837: 'qú',
+    0x8838: 'quán,huàn',
+    0x8839: 'dù',
+    0x883A: 'cán',
+    0x883B: 'mán',
+    0x883C: 'qú,jué',
+    0x883D: 'jié',
+    0x883E: 'zhú,shú',
+    0x883F: 'zhuō',
+    0x8840: 'xuè,xiě',
+    0x8841: 'huāng',
+    0x8842: 'nǜ',
+    0x8843: 'pēi,fǒu',
+    0x8844: 'nǜ',
+    0x8845: 'xìn',
+    0x8846: 'zhòng,zhōng',
+    0x8847: 'mài',
+    0x8848: 'èr',
+    0x8849: 'kā',
+    0x884A: 'miè',
+    0x884B: 'xì',
+    0x884C: 'xíng,háng,héng,xìng,hàng',
+    0x884D: 'yǎn,yán',
+    0x884E: 'kàn,kǎn',
+    0x884F: 'yuàn',
+    0x8850: 'qú',
+    0x8851: 'líng',
+    0x8852: 'xuàn',
+    0x8853: 'shù',
+    0x8854: 'xián',
+    0x8855: 'tòng,tóng,dòng',
+    0x8856: 'xiàng,lòng',
+    0x8857: 'jiē',
+    0x8858: 'xián,yù',
+    0x8859: 'yá,yú,yù',
+    0x885A: 'hú',
+    0x885B: 'wèi',
+    0x885C: 'dào',
+    0x885D: 'chōng,chǒng,chòng',
+    0x885E: 'wèi',
+    0x885F: 'dào',
+    0x8860: 'zhūn',
+    0x8861: 'héng',
+    0x8862: 'qú',
+    0x8863: 'yī,yì',
+    0x8864: 'yī',
+    0x8865: 'bǔ',
+    0x8866: 'gǎn',
+    0x8867: 'yú',
+    0x8868: 'biǎo',
+    0x8869: 'chǎ,chà',
+    0x886A: 'yí',
+    0x886B: 'shān',
+    0x886C: 'chèn',
+    0x886D: 'fū',
+    0x886E: 'gǔn',
+    0x886F: 'fēn,pén',
+    0x8870: 'shuāi,suō,cuī',
+    0x8871: 'jié',
+    0x8872: 'nà',
+    0x8873: 'zhōng',
+    0x8874: 'dǎn',
+    0x8875: 'yì',
+    0x8876: 'zhòng',
+    0x8877: 'zhōng,zhòng',
+    0x8878: 'jiè',
+    0x8879: 'zhǐ,tǐ,zhī,qí',
+    0x887A: 'xié',
+    0x887B: 'rán',
+    0x887C: 'zhī',
+    0x887D: 'rèn',
+    0x887E: 'qīn',
+    0x887F: 'jīn,qìn',
+    0x8880: 'jūn',
+    0x8881: 'yuán',
+    0x8882: 'mèi,yì',
+    0x8883: 'chài',
+    0x8884: 'ǎo',
+    0x8885: 'niǎo',
+    0x8886: 'huī',
+    0x8887: 'rán',
+    0x8888: 'jiā',
+    0x8889: 'tuó,tuǒ',
+    0x888A: 'lǐng,líng',
+    0x888B: 'dài',
+    0x888C: 'bào,páo,pào',
+    0x888D: 'páo,bào',
+    0x888E: 'yào',
+    0x888F: 'zuò',
+    0x8890: 'bì',
+    0x8891: 'shào',
+    0x8892: 'tǎn,zhàn',
+    0x8893: 'jù,jiě',
+    0x8894: 'hè,kè,kuǎ',
+    0x8895: 'xué',
+    0x8896: 'xiù',
+    0x8897: 'zhěn',
+    0x8898: 'yí,yì,tuó',
+    0x8899: 'pà',
+    0x889A: 'bō,fú',
+    0x889B: 'dī',
+    0x889C: 'wà,mò',
+    0x889D: 'fù',
+    0x889E: 'gǔn',
+    0x889F: 'zhì',
+    0x88A0: 'zhì',
+    0x88A1: 'rán',
+    0x88A2: 'pàn,fán',
+    0x88A3: 'yì',
+    0x88A4: 'mào,móu',
+    0x88A5: 'tuō',
+    0x88A6: 'nà,jué',
+    0x88A7: 'gōu,gòu',
+    0x88A8: 'xuàn',
+    0x88A9: 'zhé,chān',
+    0x88AA: 'qū',
+    0x88AB: 'bèi,bì,pī,pì',
+    0x88AC: 'yù',
+    0x88AD: 'xí',
+    0x88AE: 'mí',
+    0x88AF: 'bó',
+    0x88B0: 'bō',
+    0x88B1: 'fú',
+    0x88B2: 'chǐ,nuǒ',
+    0x88B3: 'chǐ,qǐ,duǒ,nuǒ',
+    0x88B4: 'kù',
+    0x88B5: 'rèn',
+    0x88B6: 'jiàng',
+    0x88B7: 'jiá,qiā,jiā,jié',
+    0x88B8: 'jiàn,zùn',
+    0x88B9: 'bó,mò',
+    0x88BA: 'jié',
+    0x88BB: 'ér',
+    0x88BC: 'gē,luò',
+    0x88BD: 'rú',
+    0x88BE: 'zhū',
+    0x88BF: 'guī,guà',
+    0x88C0: 'yīn',
+    0x88C1: 'cái',
+    0x88C2: 'liè,liě',
+    0x88C3: 'kǎ',
+    0x88C4: 'xing',
+    0x88C5: 'zhuāng',
+    0x88C6: 'dāng',
+    0x88C7: 'xū',
+    0x88C8: 'kūn',
+    0x88C9: 'kèn',
+    0x88CA: 'niǎo',
+    0x88CB: 'shù',
+    0x88CC: 'jiá,jiā,xié',
+    0x88CD: 'kǔn',
+    0x88CE: 'chéng,chěng',
+    0x88CF: 'lǐ',
+    0x88D0: 'juān',
+    0x88D1: 'shēn',
+    0x88D2: 'póu,bāo',
+    0x88D3: 'gé,jiē',
+    0x88D4: 'yì',
+    0x88D5: 'yù',
+    0x88D6: 'zhěn',
+    0x88D7: 'liú',
+    0x88D8: 'qiú',
+    0x88D9: 'qún',
+    0x88DA: 'jì',
+    0x88DB: 'yì',
+    0x88DC: 'bǔ',
+    0x88DD: 'zhuāng',
+    0x88DE: 'shuì',
+    0x88DF: 'shā',
+    0x88E0: 'qún',
+    0x88E1: 'lǐ',
+    0x88E2: 'lián,shāo',
+    0x88E3: 'liǎn',
+    0x88E4: 'kù',
+    0x88E5: 'jiǎn',
+    0x88E6: 'fóu',
+    0x88E7: 'chān,chàn,tǎn',
+    0x88E8: 'bì,pí',
+    0x88E9: 'kūn',
+    0x88EA: 'táo',
+    0x88EB: 'yuàn',
+    0x88EC: 'líng',
+    0x88ED: 'chǐ',
+    0x88EE: 'chāng',
+    0x88EF: 'chóu,dāo',
+    0x88F0: 'duō',
+    0x88F1: 'biǎo',
+    0x88F2: 'liǎng',
+    0x88F3: 'shang,cháng',
+    0x88F4: 'péi,féi',
+    0x88F5: 'péi',
+    0x88F6: 'fēi',
+    0x88F7: 'yuān,gǔn',
+    0x88F8: 'luǒ',
+    0x88F9: 'guǒ',
+    0x88FA: 'yǎn,ān,yàn',
+    0x88FB: 'dú',
+    0x88FC: 'tì,xī',
+    0x88FD: 'zhì',
+    0x88FE: 'jū,jù',
+    0x88FF: 'yǐ,qǐ',
+    0x8900: 'qí',
+    0x8901: 'guǒ',
+    0x8902: 'guà',
+    0x8903: 'kèn',
+    0x8904: 'qī',
+    0x8905: 'tì',
+    0x8906: 'tí,shì',
+    0x8907: 'fù,fú',
+    0x8908: 'chóng,chōng,zhòng',
+    0x8909: 'xiè',
+    0x890A: 'biǎn,pián',
+    0x890B: 'dié',
+    0x890C: 'kūn',
+    0x890D: 'duān,tuān',
+    0x890E: 'xiù,yòu',
+    0x890F: 'xiù',
+    0x8910: 'hè',
+    0x8911: 'yuàn,yuán',
+    0x8912: 'bāo',
+    0x8913: 'bǎo',
+    0x8914: 'fù',
+    0x8915: 'yú,tóu',
+    0x8916: 'tuàn',
+    0x8917: 'yǎn',
+    0x8918: 'huī,yī',
+    0x8919: 'bèi',
+    0x891A: 'chǔ,zhě,zhǔ',
+    0x891B: 'lǚ',
+    0x891C: 'páo',
+    0x891D: 'dān',
+    0x891E: 'yǔn,wēn',
+    0x891F: 'tā',
+    0x8920: 'gōu',
+    0x8921: 'dā',
+    0x8922: 'huái',
+    0x8923: 'róng',
+    0x8924: 'yuàn',
+    0x8925: 'rù,nù',
+    0x8926: 'nài',
+    0x8927: 'jiǒng',
+    0x8928: 'suǒ,chá',
+    0x8929: 'bān,pán',
+    0x892A: 'tuì,tùn',
+    0x892B: 'chǐ',
+    0x892C: 'sǎng',
+    0x892D: 'niǎo',
+    0x892E: 'yīng,yìng',
+    0x892F: 'jiè',
+    0x8930: 'qiān',
+    0x8931: 'huái',
+    0x8932: 'kù',
+    0x8933: 'lián',
+    0x8934: 'lán',
+    0x8935: 'lí',
+    0x8936: 'zhě,dié,xí',
+    0x8937: 'shī',
+    0x8938: 'lǚ',
+    0x8939: 'yì,niè',
+    0x893A: 'diē',
+    0x893B: 'xiè',
+    0x893C: 'xiān',
+    0x893D: 'wèi',
+    0x893E: 'biǎo',
+    0x893F: 'cáo',
+    0x8940: 'jī,jì',
+    0x8941: 'qiǎng',
+    0x8942: 'sēn,shān',
+    0x8943: 'bāo,póu',
+    0x8944: 'xiāng',
+    0x8945: 'bì',
+    0x8946: 'fú,pú',
+    0x8947: 'jiǎn',
+    0x8948: 'zhuàn,juàn',
+    0x8949: 'jiǎn',
+    0x894A: 'cuì,cuō',
+    0x894B: 'jí',
+    0x894C: 'dān',
+    0x894D: 'zá',
+    0x894E: 'fán,bò',
+    0x894F: 'bó,fèi',
+    0x8950: 'xiàng',
+    0x8951: 'xín',
+    0x8952: 'bié',
+    0x8953: 'ráo',
+    0x8954: 'mǎn',
+    0x8955: 'lán',
+    0x8956: 'ǎo',
+    0x8957: 'zé,duó,yì',
+    0x8958: 'guì,huì',
+    0x8959: 'cào',
+    0x895A: 'suì',
+    0x895B: 'nóng',
+    0x895C: 'chān,chàn,dān',
+    0x895D: 'liǎn,chān',
+    0x895E: 'bì',
+    0x895F: 'jīn',
+    0x8960: 'dāng',
+    0x8961: 'shǔ,dú',
+    0x8962: 'tǎn,zhàn,chán,zhān',
+    0x8963: 'bì',
+    0x8964: 'lán',
+    0x8965: 'fú',
+    0x8966: 'rú',
+    0x8967: 'zhǐ',
+    0x8968: 'duì',
+    0x8969: 'shǔ',
+    0x896A: 'wà',
+    0x896B: 'shì',
+    0x896C: 'bǎi,bēi',
+    0x896D: 'xié',
+    0x896E: 'bó',
+    0x896F: 'chèn',
+    0x8970: 'lài',
+    0x8971: 'lóng,lòng',
+    0x8972: 'xí',
+    0x8973: 'xiān,shān',
+    0x8974: 'lán',
+    0x8975: 'zhě,zhé',
+    0x8976: 'dài',
+    0x8977: 'jǔ',
+    0x8978: 'zàn,cuán',
+    0x8979: 'shī',
+    0x897A: 'jiǎn',
+    0x897B: 'pàn',
+    0x897C: 'yì',
+    0x897D: 'lán',
+    0x897E: 'yà',
+    0x897F: 'xī',
+    0x8980: 'xī',
+    0x8981: 'yào,yāo,yǎo',
+    0x8982: 'fěng,bǎn',
+    0x8983: 'tán,qín,yǎn',
+    0x8984: 'fù',
+    0x8985: 'fiào',
+    0x8986: 'fù',
+    0x8987: 'bà',
+    0x8988: 'hé',
+    0x8989: 'jī',
+    0x898A: 'jī',
+    0x898B: 'jiàn,xiàn',
+    0x898C: 'guān',
+    0x898D: 'biàn',
+    0x898E: 'yàn',
+    0x898F: 'guī,guì,xù',
+    0x8990: 'jué',
+    0x8991: 'piǎn',
+    0x8992: 'mào',
+    0x8993: 'mì',
+    0x8994: 'mì',
+    0x8995: 'miè,piē',
+    0x8996: 'shì',
+    0x8997: 'sì',
+    0x8998: 'chān,dān,jī',
+    0x8999: 'luó',
+    0x899A: 'jué',
+    0x899B: 'mì',
+    0x899C: 'tiào',
+    0x899D: 'lián',
+    0x899E: 'yào',
+    0x899F: 'zhì',
+    0x89A0: 'jūn',
+    0x89A1: 'xí',
+    0x89A2: 'shǎn',
+    0x89A3: 'wēi',
+    0x89A4: 'xì',
+    0x89A5: 'tiǎn',
+    0x89A6: 'yú',
+    0x89A7: 'lǎn',
+    0x89A8: 'è',
+    0x89A9: 'dǔ',
+    0x89AA: 'qīn,qìng',
+    0x89AB: 'pǎng',
+    0x89AC: 'jì',
+    0x89AD: 'míng',
+    0x89AE: 'yíng',
+    0x89AF: 'gòu',
+    0x89B0: 'qū,qù',
+    0x89B1: 'zhàn,zhān',
+    0x89B2: 'jìn',
+    0x89B3: 'guān',
+    0x89B4: 'dēng',
+    0x89B5: 'jiàn,biǎn',
+    0x89B6: 'luó,luǎn',
+    0x89B7: 'qù',
+    0x89B8: 'jiān',
+    0x89B9: 'wéi',
+    0x89BA: 'jué,jiào',
+    0x89BB: 'qū,qù',
+    0x89BC: 'luó',
+    0x89BD: 'lǎn,làn',
+    0x89BE: 'shěn',
+    0x89BF: 'dí,jí',
+    0x89C0: 'guān,guàn',
+    0x89C1: 'jiàn,xiàn',
+    0x89C2: 'guān,guàn',
+    0x89C3: 'yàn',
+    0x89C4: 'guī',
+    0x89C5: 'mì',
+    0x89C6: 'shì',
+    0x89C7: 'chān',
+    0x89C8: 'lǎn',
+    0x89C9: 'jué,jiào',
+    0x89CA: 'jì',
+    0x89CB: 'xí',
+    0x89CC: 'dí',
+    0x89CD: 'tiǎn',
+    0x89CE: 'yú',
+    0x89CF: 'gòu',
+    0x89D0: 'jìn',
+    0x89D1: 'qù,qū',
+    0x89D2: 'jiǎo,jué,lù,gǔ',
+    0x89D3: 'qiú',
+    0x89D4: 'jīn',
+    0x89D5: 'cū,chù,chéng',
+    0x89D6: 'jué,kuì,guì',
+    0x89D7: 'zhì',
+    0x89D8: 'chào',
+    0x89D9: 'jí',
+    0x89DA: 'gū',
+    0x89DB: 'dàn',
+    0x89DC: 'zī,zuǐ',
+    0x89DD: 'dǐ,zhǐ',
+    0x89DE: 'shāng',
+    0x89DF: 'huà,xiè',
+    0x89E0: 'quán',
+    0x89E1: 'gé',
+    0x89E2: 'shì',
+    0x89E3: 'jiě,jiè,xiè',
+    0x89E4: 'guǐ',
+    0x89E5: 'gōng',
+    0x89E6: 'chù',
+    0x89E7: 'jiě,jiè',
+    0x89E8: 'hùn',
+    0x89E9: 'qiú',
+    0x89EA: 'xīng',
+    0x89EB: 'sù',
+    0x89EC: 'ní',
+    0x89ED: 'jī,qǐ,qí',
+    0x89EE: 'lù',
+    0x89EF: 'zhì',
+    0x89F0: 'zhā,dǎ,zhǎ',
+    0x89F1: 'bì',
+    0x89F2: 'xīng',
+    0x89F3: 'hú,què,jué',
+    0x89F4: 'shāng',
+    0x89F5: 'gōng',
+    0x89F6: 'zhì',
+    0x89F7: 'xué,hù',
+    0x89F8: 'chù',
+    0x89F9: 'xī',
+    0x89FA: 'yí',
+    0x89FB: 'lì,lù',
+    0x89FC: 'jué',
+    0x89FD: 'xī',
+    0x89FE: 'yàn',
+    0x89FF: 'xī,wéi',
+    0x8A00: 'yán,yàn,yín',
+    0x8A01: 'yán',
+    0x8A02: 'dìng',
+    0x8A03: 'fù',
+    0x8A04: 'qiú,kāo',
+    0x8A05: 'qiú',
+    0x8A06: 'jiào',
+    0x8A07: 'hōng,jùn,hēng',
+    0x8A08: 'jì',
+    0x8A09: 'fàn',
+    0x8A0A: 'xùn',
+    0x8A0B: 'diào',
+    0x8A0C: 'hòng',
+    0x8A0D: 'chài,chā,chà',
+    0x8A0E: 'tǎo',
+    0x8A0F: 'xū,xǔ',
+    0x8A10: 'jié,jì',
+    0x8A11: 'yí,dàn,shī,tuó,tuǒ',
+    0x8A12: 'rèn',
+    0x8A13: 'xùn',
+    0x8A14: 'yín',
+    0x8A15: 'shàn',
+    0x8A16: 'qì',
+    0x8A17: 'tuō',
+    0x8A18: 'jì',
+    0x8A19: 'xùn',
+    0x8A1A: 'yín',
+    0x8A1B: 'é',
+    0x8A1C: 'fēn,bīn',
+    0x8A1D: 'yà',
+    0x8A1E: 'yāo',
+    0x8A1F: 'sòng',
+    0x8A20: 'shěn',
+    0x8A21: 'yín',
+    0x8A22: 'xīn,xī,yín',
+    0x8A23: 'jué',
+    0x8A24: 'xiáo,ná',
+    0x8A25: 'nè',
+    0x8A26: 'chén',
+    0x8A27: 'yóu',
+    0x8A28: 'zhǐ',
+    0x8A29: 'xiōng',
+    0x8A2A: 'fǎng',
+    0x8A2B: 'xìn',
+    0x8A2C: 'chāo,miǎo,chǎo',
+    0x8A2D: 'shè',
+    0x8A2E: 'yán',
+    0x8A2F: 'sǎ,sà',
+    0x8A30: 'zhùn,zhūn',
+    0x8A31: 'xǔ,hǔ',
+    0x8A32: 'yì',
+    0x8A33: 'yì',
+    0x8A34: 'sù',
+    0x8A35: 'chī,chì',
+    0x8A36: 'hē',
+    0x8A37: 'shēn',
+    0x8A38: 'hé',
+    0x8A39: 'xù',
+    0x8A3A: 'zhěn',
+    0x8A3B: 'zhù',
+    0x8A3C: 'zhèng',
+    0x8A3D: 'gòu',
+    0x8A3E: 'zī,zǐ',
+    0x8A3F: 'zǐ',
+    0x8A40: 'zhān,chè,diān,zhàn,tiē',
+    0x8A41: 'gǔ',
+    0x8A42: 'fù',
+    0x8A43: 'jiǎn',
+    0x8A44: 'dié',
+    0x8A45: 'líng',
+    0x8A46: 'dǐ,tì',
+    0x8A47: 'yàng',
+    0x8A48: 'lì',
+    0x8A49: 'náo,ná,nù',
+    0x8A4A: 'pàn',
+    0x8A4B: 'zhòu',
+    0x8A4C: 'gàn',
+    0x8A4D: 'yì',
+    0x8A4E: 'jù',
+    0x8A4F: 'yào',
+    0x8A50: 'zhà',
+    0x8A51: 'yí,tuó,duò,yī,xī',
+    0x8A52: 'yí,dài,tái',
+    0x8A53: 'qǔ',
+    0x8A54: 'zhào,zhāo',
+    0x8A55: 'píng',
+    0x8A56: 'bì',
+    0x8A57: 'xiòng',
+    0x8A58: 'qū,chù',
+    0x8A59: 'bá,bó',
+    0x8A5A: 'dá',
+    0x8A5B: 'zǔ',
+    0x8A5C: 'tāo',
+    0x8A5D: 'zhǔ',
+    0x8A5E: 'cí',
+    0x8A5F: 'zhé',
+    0x8A60: 'yǒng',
+    0x8A61: 'xǔ',
+    0x8A62: 'xún',
+    0x8A63: 'yì',
+    0x8A64: 'huǎng',
+    0x8A65: 'hé,gé',
+    0x8A66: 'shì',
+    0x8A67: 'chá,qiè',
+    0x8A68: 'xiào',
+    0x8A69: 'shī',
+    0x8A6A: 'hěn',
+    0x8A6B: 'chà,dù',
+    0x8A6C: 'gòu,hòu',
+    0x8A6D: 'guǐ',
+    0x8A6E: 'quán',
+    0x8A6F: 'huì',
+    0x8A70: 'jié',
+    0x8A71: 'huà',
+    0x8A72: 'gāi',
+    0x8A73: 'xiáng,yáng',
+    0x8A74: 'wēi',
+    0x8A75: 'shēn',
+    0x8A76: 'zhòu,chóu',
+    0x8A77: 'tóng,dòng',
+    0x8A78: 'mí',
+    0x8A79: 'zhān,dàn',
+    0x8A7A: 'mìng',
+    0x8A7B: 'è,lüè,luò',
+    0x8A7C: 'huī',
+    0x8A7D: 'yán',
+    0x8A7E: 'xiōng',
+    0x8A7F: 'guà',
+    0x8A80: 'èr,chǐ',
+    0x8A81: 'bìng',
+    0x8A82: 'tiǎo,diào',
+    0x8A83: 'yí,chǐ,chì,duò',
+    0x8A84: 'lěi',
+    0x8A85: 'zhū',
+    0x8A86: 'kuāng',
+    0x8A87: 'kuā,qù',
+    0x8A88: 'wū',
+    0x8A89: 'yù',
+    0x8A8A: 'téng',
+    0x8A8B: 'jì',
+    0x8A8C: 'zhì',
+    0x8A8D: 'rèn',
+    0x8A8E: 'cù',
+    0x8A8F: 'lǎng,làng',
+    0x8A90: 'é,ě',
+    0x8A91: 'kuáng',
+    0x8A92: 'éi,xī,yì,ê̄,ế,ê̌,ěi,ề,èi,ēi',
+    0x8A93: 'shì',
+    0x8A94: 'tǐng',
+    0x8A95: 'dàn',
+    0x8A96: 'bèi',
+    0x8A97: 'chán',
+    0x8A98: 'yòu',
+    0x8A99: 'kēng',
+    0x8A9A: 'qiào',
+    0x8A9B: 'qīn',
+    0x8A9C: 'shuà',
+    0x8A9D: 'ān',
+    0x8A9E: 'yǔ,yù',
+    0x8A9F: 'xiào',
+    0x8AA0: 'chéng',
+    0x8AA1: 'jiè',
+    0x8AA2: 'xiàn',
+    0x8AA3: 'wū',
+    0x8AA4: 'wù',
+    0x8AA5: 'gào',
+    0x8AA6: 'sòng',
+    0x8AA7: 'bū',
+    0x8AA8: 'huì',
+    0x8AA9: 'jìng',
+    0x8AAA: 'shuō',
+    0x8AAB: 'zhèn',
+    0x8AAC: 'shuō,shuì,yuè,tuō',
+    0x8AAD: 'dú',
+    0x8AAE: 'huā',
+    0x8AAF: 'chàng',
+    0x8AB0: 'shuí,shéi',
+    0x8AB1: 'jié',
+    0x8AB2: 'kè',
+    0x8AB3: 'qū,juè',
+    0x8AB4: 'cóng',
+    0x8AB5: 'xiáo',
+    0x8AB6: 'suì',
+    0x8AB7: 'wǎng',
+    0x8AB8: 'xián',
+    0x8AB9: 'fěi',
+    0x8ABA: 'chī,lài',
+    0x8ABB: 'tà',
+    0x8ABC: 'yì',
+    0x8ABD: 'nì,ná',
+    0x8ABE: 'yín',
+    0x8ABF: 'diào,tiáo,zhōu',
+    0x8AC0: 'pǐ,bēi',
+    0x8AC1: 'zhuó',
+    0x8AC2: 'chǎn',
+    0x8AC3: 'chēn',
+    0x8AC4: 'zhūn',
+    0x8AC5: 'jì,jī',
+    0x8AC6: 'qī',
+    0x8AC7: 'tán',
+    0x8AC8: 'zhuì',
+    0x8AC9: 'wěi',
+    0x8ACA: 'jū',
+    0x8ACB: 'qǐng,qìng,qíng',
+    0x8ACC: 'dǒng',
+    0x8ACD: 'zhèng,zhēng',
+    0x8ACE: 'zé,cuò,zuò,zhǎ,jiè',
+    0x8ACF: 'zōu,zhōu',
+    0x8AD0: 'qiān',
+    0x8AD1: 'zhuó',
+    0x8AD2: 'liàng,liáng',
+    0x8AD3: 'jiàn',
+    0x8AD4: 'chù,jí',
+    0x8AD5: 'háo,xià,huò',
+    0x8AD6: 'lùn,lún',
+    0x8AD7: 'shěn,niè',
+    0x8AD8: 'biǎo',
+    0x8AD9: 'huà',
+    0x8ADA: 'pián',
+    0x8ADB: 'yú',
+    0x8ADC: 'dié,xiè',
+    0x8ADD: 'xū',
+    0x8ADE: 'piǎn,pián',
+    0x8ADF: 'shì,dì',
+    0x8AE0: 'xuān',
+    0x8AE1: 'shì',
+    0x8AE2: 'hùn',
+    0x8AE3: 'huà,guā',
+    0x8AE4: 'è',
+    0x8AE5: 'zhòng',
+    0x8AE6: 'dì,tí',
+    0x8AE7: 'xié',
+    0x8AE8: 'fú',
+    0x8AE9: 'pǔ',
+    0x8AEA: 'tíng',
+    0x8AEB: 'jiàn,làn',
+    0x8AEC: 'qǐ',
+    0x8AED: 'yù,tǒu',
+    0x8AEE: 'zī',
+    0x8AEF: 'zhuān',
+    0x8AF0: 'xǐ,shāi,āi',
+    0x8AF1: 'huì',
+    0x8AF2: 'yīn',
+    0x8AF3: 'ān,tǒu',
+    0x8AF4: 'xián,gān',
+    0x8AF5: 'nán,nàn',
+    0x8AF6: 'chén',
+    0x8AF7: 'fěng,fèng',
+    0x8AF8: 'zhū,chú',
+    0x8AF9: 'yáng',
+    0x8AFA: 'yàn',
+    0x8AFB: 'huáng',
+    0x8AFC: 'xuān',
+    0x8AFD: 'gé',
+    0x8AFE: 'nuò',
+    0x8AFF: 'qī,xǔ',
+    0x8B00: 'móu',
+    0x8B01: 'yè,ǎi',
+    0x8B02: 'wèi',
+    0x8B03: 'xīng',
+    0x8B04: 'téng',
+    0x8B05: 'zhōu,chōu,chǎo',
+    0x8B06: 'shàn',
+    0x8B07: 'jiǎn',
+    0x8B08: 'pó,páo',
+    0x8B09: 'kuì,duǐ,tuí,guǐ',
+    0x8B0A: 'huǎng',
+    0x8B0B: 'huò',
+    0x8B0C: 'gē',
+    0x8B0D: 'yíng,yīng,hōng',
+    0x8B0E: 'mí',
+    0x8B0F: 'xiǎo,sǒu,sòu',
+    0x8B10: 'mì',
+    0x8B11: 'xǐ,xià,xí',
+    0x8B12: 'qiāng',
+    0x8B13: 'chēn,zhèn',
+    0x8B14: 'xuè',
+    0x8B15: 'tí,sī',
+    0x8B16: 'sù',
+    0x8B17: 'bàng',
+    0x8B18: 'chí',
+    0x8B19: 'qiān,zhàn',
+    0x8B1A: 'shì,yì,xì',
+    0x8B1B: 'jiǎng',
+    0x8B1C: 'yuán,quán',
+    0x8B1D: 'xiè',
+    0x8B1E: 'hè,xiāo',
+    0x8B1F: 'tāo',
+    0x8B20: 'yáo',
+    0x8B21: 'yáo',
+    0x8B22: 'lū',
+    0x8B23: 'yú,xū',
+    0x8B24: 'biāo,piāo',
+    0x8B25: 'còng',
+    0x8B26: 'qǐng,qìng',
+    0x8B27: 'lí',
+    0x8B28: 'mó',
+    0x8B29: 'mó',
+    0x8B2A: 'shāng',
+    0x8B2B: 'zhé,zé',
+    0x8B2C: 'miù',
+    0x8B2D: 'jiǎn',
+    0x8B2E: 'zé',
+    0x8B2F: 'jiē,zhā,zhǎ,zǔ',
+    0x8B30: 'lián',
+    0x8B31: 'lóu,lǚ',
+    0x8B32: 'càn,zào,sān,chěn',
+    0x8B33: 'ōu,xú',
+    0x8B34: 'gùn',
+    0x8B35: 'xí,chè',
+    0x8B36: 'zhuó,shù,zhē',
+    0x8B37: 'áo,ào',
+    0x8B38: 'áo',
+    0x8B39: 'jǐn',
+    0x8B3A: 'zhé',
+    0x8B3B: 'yí,chí',
+    0x8B3C: 'hū,xiāo',
+    0x8B3D: 'jiàng',
+    0x8B3E: 'mán,màn',
+    0x8B3F: 'cháo',
+    0x8B40: 'hàn,xiàn',
+    0x8B41: 'huá,wà',
+    0x8B42: 'chǎn,dàn',
+    0x8B43: 'xū',
+    0x8B44: 'zēng',
+    0x8B45: 'sè',
+    0x8B46: 'xī',
+    0x8B47: 'zhā',
+    0x8B48: 'duì',
+    0x8B49: 'zhèng',
+    0x8B4A: 'náo,xiāo',
+    0x8B4B: 'lán',
+    0x8B4C: 'é,wá,guǐ',
+    0x8B4D: 'yīng,yìng',
+    0x8B4E: 'jué',
+    0x8B4F: 'jī',
+    0x8B50: 'zǔn',
+    0x8B51: 'jiǎo,qiào',
+    0x8B52: 'bò',
+    0x8B53: 'huì',
+    0x8B54: 'zhuàn,quán',
+    0x8B55: 'wú,mó',
+    0x8B56: 'zèn,jiàn',
+    0x8B57: 'zhá',
+    0x8B58: 'shí,shì,zhì',
+    0x8B59: 'qiào,qiáo',
+    0x8B5A: 'tán',
+    0x8B5B: 'zèn',
+    0x8B5C: 'pǔ',
+    0x8B5D: 'shéng',
+    0x8B5E: 'xuān',
+    0x8B5F: 'zào',
+    0x8B60: 'tán',
+    0x8B61: 'dǎng',
+    0x8B62: 'suì',
+    0x8B63: 'xiǎn',
+    0x8B64: 'jī',
+    0x8B65: 'jiào',
+    0x8B66: 'jǐng',
+    0x8B67: 'zhàn,lián',
+    0x8B68: 'náng,nóu',
+    0x8B69: 'yī',
+    0x8B6A: 'ǎi',
+    0x8B6B: 'zhān',
+    0x8B6C: 'pì',
+    0x8B6D: 'huǐ',
+    0x8B6E: 'huà,xiè,huì',
+    0x8B6F: 'yì',
+    0x8B70: 'yì',
+    0x8B71: 'shàn',
+    0x8B72: 'ràng',
+    0x8B73: 'nòu',
+    0x8B74: 'qiǎn',
+    0x8B75: 'duì',
+    0x8B76: 'tà',
+    0x8B77: 'hù',
+    0x8B78: 'zhōu,chóu',
+    0x8B79: 'háo',
+    0x8B7A: 'ài,yǐ,nǐ,yì,yí',
+    0x8B7B: 'yīng',
+    0x8B7C: 'jiàn',
+    0x8B7D: 'yù',
+    0x8B7E: 'jiǎn',
+    0x8B7F: 'huì',
+    0x8B80: 'dú,dòu',
+    0x8B81: 'zhé',
+    0x8B82: 'xuàn',
+    0x8B83: 'zàn',
+    0x8B84: 'lěi',
+    0x8B85: 'shěn',
+    0x8B86: 'wèi',
+    0x8B87: 'chǎn',
+    0x8B88: 'lì',
+    0x8B89: 'yí,tuī',
+    0x8B8A: 'biàn',
+    0x8B8B: 'zhé',
+    0x8B8C: 'yàn',
+    0x8B8D: 'è',
+    0x8B8E: 'chóu',
+    0x8B8F: 'wèi',
+    0x8B90: 'chóu',
+    0x8B91: 'yào',
+    0x8B92: 'chán',
+    0x8B93: 'ràng',
+    0x8B94: 'yǐn',
+    0x8B95: 'lán',
+    0x8B96: 'chèn,chàn',
+    0x8B97: 'xié',
+    0x8B98: 'niè',
+    0x8B99: 'huān,huàn',
+    0x8B9A: 'zàn',
+    0x8B9B: 'yì',
+    0x8B9C: 'dǎng,dàng',
+    0x8B9D: 'zhán,zhān',
+    0x8B9E: 'yàn',
+    0x8B9F: 'dú',
+    0x8BA0: 'yán',
+    0x8BA1: 'jì',
+    0x8BA2: 'dìng',
+    0x8BA3: 'fù',
+    0x8BA4: 'rèn',
+    0x8BA5: 'jī',
+    0x8BA6: 'jié',
+    0x8BA7: 'hòng',
+    0x8BA8: 'tǎo',
+    0x8BA9: 'ràng',
+    0x8BAA: 'shàn',
+    0x8BAB: 'qì',
+    0x8BAC: 'tuō',
+    0x8BAD: 'xùn',
+    0x8BAE: 'yì',
+    0x8BAF: 'xùn',
+    0x8BB0: 'jì',
+    0x8BB1: 'rèn',
+    0x8BB2: 'jiǎng',
+    0x8BB3: 'huì',
+    0x8BB4: 'ōu',
+    0x8BB5: 'jù',
+    0x8BB6: 'yà',
+    0x8BB7: 'nè',
+    0x8BB8: 'xǔ,hǔ',
+    0x8BB9: 'é',
+    0x8BBA: 'lùn,lún',
+    0x8BBB: 'xiōng',
+    0x8BBC: 'sòng',
+    0x8BBD: 'fěng,fèng',
+    0x8BBE: 'shè',
+    0x8BBF: 'fǎng',
+    0x8BC0: 'jué',
+    0x8BC1: 'zhèng',
+    0x8BC2: 'gǔ',
+    0x8BC3: 'hē',
+    0x8BC4: 'píng',
+    0x8BC5: 'zǔ',
+    0x8BC6: 'shí,shì,zhì',
+    0x8BC7: 'xiòng',
+    0x8BC8: 'zhà',
+    0x8BC9: 'sù',
+    0x8BCA: 'zhěn',
+    0x8BCB: 'dǐ',
+    0x8BCC: 'zhōu',
+    0x8BCD: 'cí',
+    0x8BCE: 'qū',
+    0x8BCF: 'zhào',
+    0x8BD0: 'bì',
+    0x8BD1: 'yì',
+    0x8BD2: 'yí',
+    0x8BD3: 'kuāng',
+    0x8BD4: 'lěi',
+    0x8BD5: 'shì',
+    0x8BD6: 'guà',
+    0x8BD7: 'shī',
+    0x8BD8: 'jí,jié',
+    0x8BD9: 'huī',
+    0x8BDA: 'chéng',
+    0x8BDB: 'zhū',
+    0x8BDC: 'shēn',
+    0x8BDD: 'huà',
+    0x8BDE: 'dàn',
+    0x8BDF: 'gòu',
+    0x8BE0: 'quán',
+    0x8BE1: 'guǐ',
+    0x8BE2: 'xún',
+    0x8BE3: 'yì',
+    0x8BE4: 'zhèng,zhēng',
+    0x8BE5: 'gāi',
+    0x8BE6: 'xiáng',
+    0x8BE7: 'chà',
+    0x8BE8: 'hùn',
+    0x8BE9: 'xǔ',
+    0x8BEA: 'zhōu',
+    0x8BEB: 'jiè',
+    0x8BEC: 'wū',
+    0x8BED: 'yǔ,yù',
+    0x8BEE: 'qiào',
+    0x8BEF: 'wù',
+    0x8BF0: 'gào',
+    0x8BF1: 'yòu',
+    0x8BF2: 'huì',
+    0x8BF3: 'kuáng',
+    0x8BF4: 'shuō,shuì,yuè',
+    0x8BF5: 'sòng',
+    0x8BF6: 'éi',
+    0x8BF7: 'qǐng',
+    0x8BF8: 'zhū',
+    0x8BF9: 'zōu',
+    0x8BFA: 'nuò',
+    0x8BFB: 'dú,dòu',
+    0x8BFC: 'zhuó',
+    0x8BFD: 'fěi',
+    0x8BFE: 'kè',
+    0x8BFF: 'wěi',
+    0x8C00: 'yú',
+    0x8C01: 'shéi,shuí',
+    0x8C02: 'shěn',
+    0x8C03: 'diào,tiáo',
+    0x8C04: 'chǎn',
+    0x8C05: 'liàng',
+    0x8C06: 'zhūn',
+    0x8C07: 'suì',
+    0x8C08: 'tán',
+    0x8C09: 'shěn',
+    0x8C0A: 'yì',
+    0x8C0B: 'móu',
+    0x8C0C: 'chén',
+    0x8C0D: 'dié',
+    0x8C0E: 'huǎng',
+    0x8C0F: 'jiàn',
+    0x8C10: 'xié',
+    0x8C11: 'xuè',
+    0x8C12: 'yè',
+    0x8C13: 'wèi',
+    0x8C14: 'è',
+    0x8C15: 'yù',
+    0x8C16: 'xuān',
+    0x8C17: 'chán',
+    0x8C18: 'zī',
+    0x8C19: 'ān',
+    0x8C1A: 'yàn',
+    0x8C1B: 'dì',
+    0x8C1C: 'mí,mèi',
+    0x8C1D: 'pián,piǎn',
+    0x8C1E: 'xū',
+    0x8C1F: 'mó',
+    0x8C20: 'dǎng',
+    0x8C21: 'sù',
+    0x8C22: 'xiè',
+    0x8C23: 'yáo',
+    0x8C24: 'bàng',
+    0x8C25: 'shì',
+    0x8C26: 'qiān',
+    0x8C27: 'mì',
+    0x8C28: 'jǐn',
+    0x8C29: 'mán,màn',
+    0x8C2A: 'zhé',
+    0x8C2B: 'jiǎn',
+    0x8C2C: 'miù',
+    0x8C2D: 'tán',
+    0x8C2E: 'zèn',
+    0x8C2F: 'qiáo,qiào',
+    0x8C30: 'lán',
+    0x8C31: 'pǔ',
+    0x8C32: 'jué',
+    0x8C33: 'yàn',
+    0x8C34: 'qiǎn',
+    0x8C35: 'zhān',
+    0x8C36: 'chèn',
+    0x8C37: 'gǔ,lù,yù',
+    0x8C38: 'qiān',
+    0x8C39: 'hóng',
+    0x8C3A: 'xiā',
+    0x8C3B: 'jí',
+    0x8C3C: 'hóng',
+    0x8C3D: 'hān',
+    0x8C3E: 'hōng,lóng',
+    0x8C3F: 'xī,jī',
+    0x8C40: 'xī',
+    0x8C41: 'huō,huò,huá',
+    0x8C42: 'liáo',
+    0x8C43: 'hǎn,gǎn',
+    0x8C44: 'dú',
+    0x8C45: 'lóng,lòng',
+    0x8C46: 'dòu',
+    0x8C47: 'jiāng',
+    0x8C48: 'qǐ,kǎi',
+    0x8C49: 'shì,chǐ',
+    0x8C4A: 'lǐ,fēng',
+    0x8C4B: 'dēng',
+    0x8C4C: 'wān',
+    0x8C4D: 'bī,biǎn',
+    0x8C4E: 'shù',
+    0x8C4F: 'xiàn',
+    0x8C50: 'fēng',
+    0x8C51: 'zhì',
+    0x8C52: 'zhì',
+    0x8C53: 'yàn',
+    0x8C54: 'yàn',
+    0x8C55: 'shǐ',
+    0x8C56: 'chù',
+    0x8C57: 'huī',
+    0x8C58: 'tún',
+    0x8C59: 'yì',
+    0x8C5A: 'tún,dūn,dùn',
+    0x8C5B: 'yì',
+    0x8C5C: 'jiān',
+    0x8C5D: 'bā',
+    0x8C5E: 'hòu',
+    0x8C5F: 'è',
+    0x8C60: 'chú',
+    0x8C61: 'xiàng',
+    0x8C62: 'huàn',
+    0x8C63: 'jiān,yàn',
+    0x8C64: 'kěn,kūn',
+    0x8C65: 'gāi',
+    0x8C66: 'jù',
+    0x8C67: 'fū,fù,pū',
+    0x8C68: 'xī',
+    0x8C69: 'bīn,huān',
+    0x8C6A: 'háo',
+    0x8C6B: 'yù,xiè,shū',
+    0x8C6C: 'zhū',
+    0x8C6D: 'jiā',
+    0x8C6E: 'fén',
+    0x8C6F: 'xī',
+    0x8C70: 'bó,hù,huò,gòu',
+    0x8C71: 'wēn',
+    0x8C72: 'huán',
+    0x8C73: 'bīn,bān',
+    0x8C74: 'dí',
+    0x8C75: 'zōng',
+    0x8C76: 'fén',
+    0x8C77: 'yì',
+    0x8C78: 'zhì,zhài',
+    0x8C79: 'bào',
+    0x8C7A: 'chái',
+    0x8C7B: 'àn',
+    0x8C7C: 'pí',
+    0x8C7D: 'nà',
+    0x8C7E: 'pī',
+    0x8C7F: 'gǒu',
+    0x8C80: 'nà,duò',
+    0x8C81: 'yòu',
+    0x8C82: 'diāo',
+    0x8C83: 'mò',
+    0x8C84: 'sì',
+    0x8C85: 'xiū',
+    0x8C86: 'huán,huān',
+    0x8C87: 'kūn,mào,kěn',
+    0x8C88: 'hé,mò',
+    0x8C89: 'háo,hé,mò,mà',
+    0x8C8A: 'mò,má',
+    0x8C8B: 'àn',
+    0x8C8C: 'mào,mò',
+    0x8C8D: 'lí,mái,yù',
+    0x8C8E: 'ní',
+    0x8C8F: 'bǐ',
+    0x8C90: 'yǔ',
+    0x8C91: 'jiā',
+    0x8C92: 'tuān,tuàn',
+    0x8C93: 'māo,máo',
+    0x8C94: 'pí',
+    0x8C95: 'xī',
+    0x8C96: 'yì',
+    0x8C97: 'jù,yú',
+    0x8C98: 'mò',
+    0x8C99: 'chū',
+    0x8C9A: 'tán',
+    0x8C9B: 'huān',
+    0x8C9C: 'jué',
+    0x8C9D: 'bèi',
+    0x8C9E: 'zhēn,zhēng',
+    0x8C9F: 'yuán',
+    0x8CA0: 'fù',
+    0x8CA1: 'cái',
+    0x8CA2: 'gòng',
+    0x8CA3: 'tè',
+    0x8CA4: 'yí,yì',
+    0x8CA5: 'háng',
+    0x8CA6: 'wán',
+    0x8CA7: 'pín',
+    0x8CA8: 'huò',
+    0x8CA9: 'fàn',
+    0x8CAA: 'tān',
+    0x8CAB: 'guàn,wān',
+    0x8CAC: 'zé,zhài',
+    0x8CAD: 'zhì',
+    0x8CAE: 'èr',
+    0x8CAF: 'zhù',
+    0x8CB0: 'shì',
+    0x8CB1: 'bì',
+    0x8CB2: 'zī',
+    0x8CB3: 'èr',
+    0x8CB4: 'guì',
+    0x8CB5: 'piǎn',
+    0x8CB6: 'biǎn,fá',
+    0x8CB7: 'mǎi',
+    0x8CB8: 'dài,tè',
+    0x8CB9: 'shèng',
+    0x8CBA: 'kuàng',
+    0x8CBB: 'fèi,fú,bì',
+    0x8CBC: 'tiē',
+    0x8CBD: 'yí',
+    0x8CBE: 'chí',
+    0x8CBF: 'mào',
+    0x8CC0: 'hè',
+    0x8CC1: 'bì,fén,bēn,fèn,féi,bān,lù,pān',
+    0x8CC2: 'lù',
+    0x8CC3: 'lìn',
+    0x8CC4: 'huì',
+    0x8CC5: 'gāi',
+    0x8CC6: 'pián',
+    0x8CC7: 'zī,zì',
+    0x8CC8: 'jiǎ,gǔ,jià',
+    0x8CC9: 'xù',
+    0x8CCA: 'zéi',
+    0x8CCB: 'jiǎo',
+    0x8CCC: 'gāi',
+    0x8CCD: 'zāng',
+    0x8CCE: 'jiàn',
+    0x8CCF: 'yīng',
+    0x8CD0: 'xùn',
+    0x8CD1: 'zhèn',
+    0x8CD2: 'shē,shā',
+    0x8CD3: 'bīn',
+    0x8CD4: 'bīn',
+    0x8CD5: 'qiú',
+    0x8CD6: 'shē',
+    0x8CD7: 'chuàn',
+    0x8CD8: 'zāng',
+    0x8CD9: 'zhōu',
+    0x8CDA: 'lài',
+    0x8CDB: 'zàn',
+    0x8CDC: 'cì',
+    0x8CDD: 'chēn',
+    0x8CDE: 'shǎng',
+    0x8CDF: 'tiǎn',
+    0x8CE0: 'péi',
+    0x8CE1: 'gēng',
+    0x8CE2: 'xián,xiàn',
+    0x8CE3: 'mài',
+    0x8CE4: 'jiàn',
+    0x8CE5: 'suì',
+    0x8CE6: 'fù',
+    0x8CE7: 'tàn',
+    0x8CE8: 'cóng',
+    0x8CE9: 'cóng',
+    0x8CEA: 'zhì',
+    0x8CEB: 'jī',
+    0x8CEC: 'zhàng',
+    0x8CED: 'dǔ',
+    0x8CEE: 'jìn',
+    0x8CEF: 'xiōng',
+    0x8CF0: 'chǔn',
+    0x8CF1: 'yǔn',
+    0x8CF2: 'bǎo',
+    0x8CF3: 'zāi',
+    0x8CF4: 'lài',
+    0x8CF5: 'fèng',
+    0x8CF6: 'càng',
+    0x8CF7: 'jī',
+    0x8CF8: 'shèng',
+    0x8CF9: 'yì,ài',
+    0x8CFA: 'zhuàn,zuàn',
+    0x8CFB: 'fù',
+    0x8CFC: 'gòu',
+    0x8CFD: 'sài',
+    0x8CFE: 'zé',
+    0x8CFF: 'liáo',
+    0x8D00: 'yì',
+    0x8D01: 'bài',
+    0x8D02: 'chěn',
+    0x8D03: 'wàn',
+    0x8D04: 'zhì,zhí',
+    0x8D05: 'zhuì',
+    0x8D06: 'biāo',
+    0x8D07: 'yūn,bīn',
+    0x8D08: 'zèng',
+    0x8D09: 'dàn',
+    0x8D0A: 'zàn',
+    0x8D0B: 'yàn',
+    0x8D0C: 'pú',
+    0x8D0D: 'shàn,dàn',
+    0x8D0E: 'wàn',
+    0x8D0F: 'yíng',
+    0x8D10: 'jìn',
+    0x8D11: 'gàn',
+    0x8D12: 'xián',
+    0x8D13: 'zāng',
+    0x8D14: 'bì',
+    0x8D15: 'dú',
+    0x8D16: 'shú,shù',
+    0x8D17: 'yàn,yán',
+    0x8D18: 'shǎng',
+    0x8D19: 'xuàn',
+    0x8D1A: 'lòng',
+    0x8D1B: 'gàn,gòng,zhuàng',
+    0x8D1C: 'zāng',
+    0x8D1D: 'bèi',
+    0x8D1E: 'zhēn',
+    0x8D1F: 'fù',
+    0x8D20: 'yuán',
+    0x8D21: 'gòng',
+    0x8D22: 'cái',
+    0x8D23: 'zé',
+    0x8D24: 'xián',
+    0x8D25: 'bài',
+    0x8D26: 'zhàng',
+    0x8D27: 'huò',
+    0x8D28: 'zhì',
+    0x8D29: 'fàn',
+    0x8D2A: 'tān',
+    0x8D2B: 'pín',
+    0x8D2C: 'biǎn',
+    0x8D2D: 'gòu',
+    0x8D2E: 'zhù',
+    0x8D2F: 'guàn',
+    0x8D30: 'èr',
+    0x8D31: 'jiàn',
+    0x8D32: 'bēn,bì',
+    0x8D33: 'shì',
+    0x8D34: 'tiē',
+    0x8D35: 'guì',
+    0x8D36: 'kuàng',
+    0x8D37: 'dài',
+    0x8D38: 'mào',
+    0x8D39: 'fèi',
+    0x8D3A: 'hè',
+    0x8D3B: 'yí',
+    0x8D3C: 'zéi',
+    0x8D3D: 'zhì',
+    0x8D3E: 'jiǎ,gǔ',
+    0x8D3F: 'huì',
+    0x8D40: 'zī',
+    0x8D41: 'lìn',
+    0x8D42: 'lù',
+    0x8D43: 'zāng',
+    0x8D44: 'zī',
+    0x8D45: 'gāi',
+    0x8D46: 'jìn',
+    0x8D47: 'qiú',
+    0x8D48: 'zhèn',
+    0x8D49: 'lài',
+    0x8D4A: 'shē',
+    0x8D4B: 'fù',
+    0x8D4C: 'dǔ',
+    0x8D4D: 'jī',
+    0x8D4E: 'shú',
+    0x8D4F: 'shǎng',
+    0x8D50: 'cì',
+    0x8D51: 'bì',
+    0x8D52: 'zhōu',
+    0x8D53: 'gēng',
+    0x8D54: 'péi',
+    0x8D55: 'dǎn',
+    0x8D56: 'lài',
+    0x8D57: 'fèng',
+    0x8D58: 'zhuì',
+    0x8D59: 'fù',
+    0x8D5A: 'zhuàn,zuàn',
+    0x8D5B: 'sài',
+    0x8D5C: 'zé',
+    0x8D5D: 'yàn',
+    0x8D5E: 'zàn',
+    0x8D5F: 'yūn',
+    0x8D60: 'zèng',
+    0x8D61: 'shàn',
+    0x8D62: 'yíng',
+    0x8D63: 'gàn',
+    0x8D64: 'chì',
+    0x8D65: 'xī',
+    0x8D66: 'shè,cè',
+    0x8D67: 'nǎn',
+    0x8D68: 'tóng,xióng',
+    0x8D69: 'xì',
+    0x8D6A: 'chēng',
+    0x8D6B: 'hè,shì',
+    0x8D6C: 'chēng',
+    0x8D6D: 'zhě',
+    0x8D6E: 'xiá',
+    0x8D6F: 'táng',
+    0x8D70: 'zǒu',
+    0x8D71: 'zǒu',
+    0x8D72: 'lì',
+    0x8D73: 'jiū,jiù',
+    0x8D74: 'fù',
+    0x8D75: 'zhào',
+    0x8D76: 'gǎn,qián',
+    0x8D77: 'qǐ',
+    0x8D78: 'shàn',
+    0x8D79: 'qióng',
+    0x8D7A: 'yǐn,qǐn',
+    0x8D7B: 'xiǎn',
+    0x8D7C: 'zī',
+    0x8D7D: 'jué,guì',
+    0x8D7E: 'qǐn',
+    0x8D7F: 'chí,dì',
+    0x8D80: 'cī',
+    0x8D81: 'chèn,zhēn,chén,niǎn,zhěn',
+    0x8D82: 'chèn',
+    0x8D83: 'dié,tú',
+    0x8D84: 'jū,qiè',
+    0x8D85: 'chāo,chǎo,chào,tiào',
+    0x8D86: 'dī',
+    0x8D87: 'xì',
+    0x8D88: 'zhān',
+    0x8D89: 'jué,jú',
+    0x8D8A: 'yuè,huó',
+    0x8D8B: 'qū',
+    0x8D8C: 'jí,jié',
+    0x8D8D: 'chí,qū',
+    0x8D8E: 'chú',
+    0x8D8F: 'guā,huó',
+    0x8D90: 'xuè,chì',
+    0x8D91: 'zī,cì',
+    0x8D92: 'tiáo,tiào,tiǎo',
+    0x8D93: 'duǒ',
+    0x8D94: 'liè',
+    0x8D95: 'gǎn',
+    0x8D96: 'suō',
+    0x8D97: 'cù',
+    0x8D98: 'xí',
+    0x8D99: 'zhào,diào',
+    0x8D9A: 'sù',
+    0x8D9B: 'yǐn',
+    0x8D9C: 'jú,qū,qiú',
+    0x8D9D: 'jiàn',
+    0x8D9E: 'què,qì,jí',
+    0x8D9F: 'tàng,zhēng,zhèng,chéng,tāng',
+    0x8DA0: 'chuò,chào,tiào,zhuó',
+    0x8DA1: 'cuǐ,wěi,jù',
+    0x8DA2: 'lù',
+    0x8DA3: 'qù,cù,qū,cǒu,zōu',
+    0x8DA4: 'dàng',
+    0x8DA5: 'qiū,cù',
+    0x8DA6: 'zī',
+    0x8DA7: 'tí',
+    0x8DA8: 'qū,cù,qù,cǒu',
+    0x8DA9: 'chì',
+    0x8DAA: 'huáng,guāng',
+    0x8DAB: 'qiáo,jiào,chǎo',
+    0x8DAC: 'qiāo',
+    0x8DAD: 'jiào',
+    0x8DAE: 'zào',
+    0x8DAF: 'tì,yuè,yào',
+    0x8DB0: 'ěr',
+    0x8DB1: 'zǎn',
+    0x8DB2: 'zǎn,zū',
+    0x8DB3: 'zú,jù',
+    0x8DB4: 'pā',
+    0x8DB5: 'bào,bō,zhuó,chuò,páo',
+    0x8DB6: 'kù,wū',
+    0x8DB7: 'kē',
+    0x8DB8: 'dǔn',
+    0x8DB9: 'jué,guì',
+    0x8DBA: 'fū',
+    0x8DBB: 'chěn',
+    0x8DBC: 'jiǎn,yàn,yán,jiān',
+    0x8DBD: 'fàng,páng,fāng',
+    0x8DBE: 'zhǐ',
+    0x8DBF: 'tā,sà,qì',
+    0x8DC0: 'yuè',
+    0x8DC1: 'bà,pá',
+    0x8DC2: 'qí,qǐ,qì,jī,zhī',
+    0x8DC3: 'yuè',
+    0x8DC4: 'qiāng,qiàng',
+    0x8DC5: 'tuò,chì',
+    0x8DC6: 'tái',
+    0x8DC7: 'yì',
+    0x8DC8: 'niǎn,jiàn,chén,tiàn',
+    0x8DC9: 'líng',
+    0x8DCA: 'mèi',
+    0x8DCB: 'bá,bèi',
+    0x8DCC: 'diē,dié,tú',
+    0x8DCD: 'kū',
+    0x8DCE: 'tuó',
+    0x8DCF: 'jiā',
+    0x8DD0: 'cī,cǐ,zǐ',
+    0x8DD1: 'pǎo,páo,bó',
+    0x8DD2: 'qiǎ',
+    0x8DD3: 'zhù',
+    0x8DD4: 'jū,qǔ',
+    0x8DD5: 'diǎn,tiē,dié,zhàn,diē',
+    0x8DD6: 'zhí',
+    0x8DD7: 'fū,fù',
+    0x8DD8: 'pán,bàn',
+    0x8DD9: 'jù,qū,qiě,zhù,qiè',
+    0x8DDA: 'shān',
+    0x8DDB: 'bǒ,bì,pō',
+    0x8DDC: 'ní',
+    0x8DDD: 'jù',
+    0x8DDE: 'lì,luò',
+    0x8DDF: 'gēn',
+    0x8DE0: 'yí',
+    0x8DE1: 'jī',
+    0x8DE2: 'duò,dài,duō,chí',
+    0x8DE3: 'xiǎn,xiān,sǔn',
+    0x8DE4: 'jiāo,qiāo',
+    0x8DE5: 'duò',
+    0x8DE6: 'zhū,chú',
+    0x8DE7: 'quán,zūn',
+    0x8DE8: 'kuà,kù,kuā,kuǎ',
+    0x8DE9: 'zhuǎi,shì',
+    0x8DEA: 'guì',
+    0x8DEB: 'qióng,qiāng,qiōng',
+    0x8DEC: 'kuǐ,xiè',
+    0x8DED: 'xiáng',
+    0x8DEE: 'chì,dié',
+    0x8DEF: 'lù,luò',
+    0x8DF0: 'pián,bèng,bǐng',
+    0x8DF1: 'zhì',
+    0x8DF2: 'jiá,jié',
+    0x8DF3: 'tiào,diào,táo',
+    0x8DF4: 'cǎi',
+    0x8DF5: 'jiàn',
+    0x8DF6: 'dá,da',
+    0x8DF7: 'qiāo',
+    0x8DF8: 'bì',
+    0x8DF9: 'xiān',
+    0x8DFA: 'duò',
+    0x8DFB: 'jī',
+    0x8DFC: 'jú,qù',
+    0x8DFD: 'jì',
+    0x8DFE: 'shū,chōu',
+    0x8DFF: 'tú,duó,chuō',
+    0x8E00: 'chù,cù',
+    0x8E01: 'jìng,kēng',
+    0x8E02: 'niè',
+    0x8E03: 'xiāo,qiào',
+    0x8E04: 'bù',
+    0x8E05: 'xué,chì',
+    0x8E06: 'cūn,qūn,cún,zūn,qiù,zhūn',
+    0x8E07: 'mǔ',
+    0x8E08: 'shū',
+    0x8E09: 'liáng,liàng,láng,làng',
+    0x8E0A: 'yǒng',
+    0x8E0B: 'jiǎo',
+    0x8E0C: 'chóu',
+    0x8E0D: 'qiāo',
+    0x8E0E: 'móu',
+    0x8E0F: 'tà,tā',
+    0x8E10: 'jiàn',
+    0x8E11: 'qí,jī,jì',
+    0x8E12: 'wō,wēi,ruí',
+    0x8E13: 'wěi,cù',
+    0x8E14: 'chuō,diào,zhuō,tiào,chuò',
+    0x8E15: 'jié',
+    0x8E16: 'jí,qì,què',
+    0x8E17: 'niè',
+    0x8E18: 'jū',
+    0x8E19: 'niè',
+    0x8E1A: 'lún',
+    0x8E1B: 'lù',
+    0x8E1C: 'lèng,léng,chěng',
+    0x8E1D: 'huái',
+    0x8E1E: 'jù',
+    0x8E1F: 'chí',
+    0x8E20: 'wǎn,wò',
+    0x8E21: 'quán,juǎn',
+    0x8E22: 'tī,dié',
+    0x8E23: 'bó,pòu',
+    0x8E24: 'zú,cù,cuì',
+    0x8E25: 'qiè',
+    0x8E26: 'yǐ,qī,jī,jǐ,yì',
+    0x8E27: 'cù,dí',
+    0x8E28: 'zōng',
+    0x8E29: 'cǎi,kuí',
+    0x8E2A: 'zōng',
+    0x8E2B: 'pèng,pán',
+    0x8E2C: 'zhì',
+    0x8E2D: 'zhēng',
+    0x8E2E: 'diǎn',
+    0x8E2F: 'zhí',
+    0x8E30: 'yú,yáo,chū',
+    0x8E31: 'duó,chuò,duò',
+    0x8E32: 'dùn',
+    0x8E33: 'chuǎn,chǔn,chūn',
+    0x8E34: 'yǒng',
+    0x8E35: 'zhǒng,zhòng',
+    0x8E36: 'dì,zhì,tí,chí,shì',
+    0x8E37: 'zhǎ',
+    0x8E38: 'chěn',
+    0x8E39: 'chuài,shuàn,duàn,chuǎn',
+    0x8E3A: 'jiàn',
+    0x8E3B: 'guā,guǎ,tuó',
+    0x8E3C: 'táng,tǎng,shāng',
+    0x8E3D: 'jǔ',
+    0x8E3E: 'fú,bì',
+    0x8E3F: 'zú',
+    0x8E40: 'dié',
+    0x8E41: 'pián',
+    0x8E42: 'róu,rǒu',
+    0x8E43: 'nuò,rè,nà',
+    0x8E44: 'tí,dì',
+    0x8E45: 'chǎ,zhā',
+    0x8E46: 'tuǐ',
+    0x8E47: 'jiǎn',
+    0x8E48: 'dǎo',
+    0x8E49: 'cuō',
+    0x8E4A: 'qī,xī',
+    0x8E4B: 'tà',
+    0x8E4C: 'qiāng,qiàng',
+    0x8E4D: 'niǎn,zhǎn,chán',
+    0x8E4E: 'diān',
+    0x8E4F: 'tí',
+    0x8E50: 'jí',
+    0x8E51: 'niè',
+    0x8E52: 'pán,mán',
+    0x8E53: 'liū,liù',
+    0x8E54: 'zàn,cán',
+    0x8E55: 'bì',
+    0x8E56: 'chōng',
+    0x8E57: 'lù',
+    0x8E58: 'liáo',
+    0x8E59: 'cù',
+    0x8E5A: 'tāng,tàng,chēng',
+    0x8E5B: 'dài,diē,dān,zhì',
+    0x8E5C: 'sù',
+    0x8E5D: 'xǐ',
+    0x8E5E: 'kuǐ',
+    0x8E5F: 'jī',
+    0x8E60: 'zhí,zhuó',
+    0x8E61: 'qiāng,qiàng',
+    0x8E62: 'dí,zhí',
+    0x8E63: 'pán,mán,liǎng',
+    0x8E64: 'zōng',
+    0x8E65: 'lián',
+    0x8E66: 'bèng',
+    0x8E67: 'zāo',
+    0x8E68: 'niǎn,rǎn',
+    0x8E69: 'bié',
+    0x8E6A: 'tuí',
+    0x8E6B: 'jú',
+    0x8E6C: 'dēng,dèng',
+    0x8E6D: 'cèng,céng',
+    0x8E6E: 'xiān',
+    0x8E6F: 'fán',
+    0x8E70: 'chú',
+    0x8E71: 'zhōng,chòng',
+    0x8E72: 'dūn,zún,cún,zūn,cǔn,cuán,qǔn',
+    0x8E73: 'bō',
+    0x8E74: 'cù,zú,jiu',
+    0x8E75: 'cù',
+    0x8E76: 'jué,juě,guì',
+    0x8E77: 'jué',
+    0x8E78: 'lìn,lín',
+    0x8E79: 'tá',
+    0x8E7A: 'qiāo,qiào',
+    0x8E7B: 'juē,qiāo,jiǎo,jué,jú,xuè',
+    0x8E7C: 'pǔ',
+    0x8E7D: 'liāo',
+    0x8E7E: 'dūn',
+    0x8E7F: 'cuān',
+    0x8E80: 'guàn',
+    0x8E81: 'zào',
+    0x8E82: 'dá',
+    0x8E83: 'bì',
+    0x8E84: 'bì',
+    0x8E85: 'zhú,zhuó',
+    0x8E86: 'jù',
+    0x8E87: 'chú,chuò',
+    0x8E88: 'qiào',
+    0x8E89: 'dǔn',
+    0x8E8A: 'chóu',
+    0x8E8B: 'jī',
+    0x8E8C: 'wǔ',
+    0x8E8D: 'yuè,tì',
+    0x8E8E: 'niǎn',
+    0x8E8F: 'lìn',
+    0x8E90: 'liè',
+    0x8E91: 'zhí',
+    0x8E92: 'lì,yuè,luò',
+    0x8E93: 'zhì,zhī',
+    0x8E94: 'chán,zhàn',
+    0x8E95: 'chú',
+    0x8E96: 'duàn',
+    0x8E97: 'wèi',
+    0x8E98: 'lóng,lǒng',
+    0x8E99: 'lìn',
+    0x8E9A: 'xiān',
+    0x8E9B: 'wèi',
+    0x8E9C: 'zuān',
+    0x8E9D: 'lán',
+    0x8E9E: 'xiè',
+    0x8E9F: 'ráng',
+    0x8EA0: 'sǎ,xiè',
+    0x8EA1: 'niè',
+    0x8EA2: 'tà',
+    0x8EA3: 'qú',
+    0x8EA4: 'jí',
+    0x8EA5: 'cuān',
+    0x8EA6: 'cuó,zuān',
+    0x8EA7: 'xǐ',
+    0x8EA8: 'kuí',
+    0x8EA9: 'jué,qì',
+    0x8EAA: 'lìn',
+    0x8EAB: 'shēn,juān',
+    0x8EAC: 'gōng',
+    0x8EAD: 'dān',
+    0x8EAE: 'fēn',
+    0x8EAF: 'qū',
+    0x8EB0: 'tǐ',
+    0x8EB1: 'duǒ',
+    0x8EB2: 'duǒ',
+    0x8EB3: 'gōng',
+    0x8EB4: 'láng',
+    0x8EB5: 'rěn',
+    0x8EB6: 'luǒ',
+    0x8EB7: 'ǎi',
+    0x8EB8: 'jī',
+    0x8EB9: 'jú',
+    0x8EBA: 'tǎng,tàng',
+    0x8EBB: 'kōng',
+    0x8EBC: 'lào',
+    0x8EBD: 'yǎn,yàn',
+    0x8EBE: 'měi',
+    0x8EBF: 'kāng',
+    0x8EC0: 'qū',
+    0x8EC1: 'lóu,lǚ',
+    0x8EC2: 'lào',
+    0x8EC3: 'duǒ,tuǒ',
+    0x8EC4: 'zhí',
+    0x8EC5: 'yàn',
+    0x8EC6: 'tǐ',
+    0x8EC7: 'dào',
+    0x8EC8: 'yīng',
+    0x8EC9: 'yù',
+    0x8ECA: 'chē,jū',
+    0x8ECB: 'yà,zhá,gá',
+    0x8ECC: 'guǐ',
+    0x8ECD: 'jūn',
+    0x8ECE: 'wèi',
+    0x8ECF: 'yuè',
+    0x8ED0: 'xìn,xiàn',
+    0x8ED1: 'dài',
+    0x8ED2: 'xuān,xiǎn,xiàn,hǎn,jiān',
+    0x8ED3: 'fàn',
+    0x8ED4: 'rèn',
+    0x8ED5: 'shān',
+    0x8ED6: 'kuáng',
+    0x8ED7: 'shū',
+    0x8ED8: 'tún',
+    0x8ED9: 'chén,qí',
+    0x8EDA: 'dài',
+    0x8EDB: 'è',
+    0x8EDC: 'nà',
+    0x8EDD: 'qí',
+    0x8EDE: 'máo',
+    0x8EDF: 'ruǎn',
+    0x8EE0: 'kuáng',
+    0x8EE1: 'qián',
+    0x8EE2: 'zhuǎn',
+    0x8EE3: 'hōng',
+    0x8EE4: 'hū',
+    0x8EE5: 'qú,gōu,gòu,jū',
+    0x8EE6: 'kuàng',
+    0x8EE7: 'dǐ,chí',
+    0x8EE8: 'líng,lǐng',
+    0x8EE9: 'dài',
+    0x8EEA: 'āo,ào',
+    0x8EEB: 'zhěn',
+    0x8EEC: 'fàn,bèn',
+    0x8EED: 'kuāng',
+    0x8EEE: 'yǎng',
+    0x8EEF: 'pēng',
+    0x8EF0: 'bèi',
+    0x8EF1: 'gū',
+    0x8EF2: 'gū',
+    0x8EF3: 'páo',
+    0x8EF4: 'zhù',
+    0x8EF5: 'rǒng,fǔ,fù,róng',
+    0x8EF6: 'è',
+    0x8EF7: 'bá',
+    0x8EF8: 'zhóu,zhú,zhòu',
+    0x8EF9: 'zhǐ',
+    0x8EFA: 'yáo,diāo',
+    0x8EFB: 'kē',
+    0x8EFC: 'yì,dié,zhé',
+    0x8EFD: 'zhì,qīng',
+    0x8EFE: 'shì',
+    0x8EFF: 'píng',
+    0x8F00: 'ér',
+    0x8F01: 'gǒng',
+    0x8F02: 'jú',
+    0x8F03: 'jiào,jué,xiào',
+    0x8F04: 'guāng',
+    0x8F05: 'hé,lù,yà',
+    0x8F06: 'kǎi,kài',
+    0x8F07: 'quán,chūn',
+    0x8F08: 'zhōu',
+    0x8F09: 'zài,zǎi,dài,zāi,zī',
+    0x8F0A: 'zhì',
+    0x8F0B: 'shē',
+    0x8F0C: 'liàng',
+    0x8F0D: 'yù',
+    0x8F0E: 'shāo',
+    0x8F0F: 'yóu',
+    0x8F10: 'wàn,yuǎn',
+    0x8F11: 'yǐn,qūn',
+    0x8F12: 'zhé',
+    0x8F13: 'wǎn',
+    0x8F14: 'fǔ',
+    0x8F15: 'qīng,qìng',
+    0x8F16: 'zhōu',
+    0x8F17: 'ní,yì',
+    0x8F18: 'léng,líng,lèng',
+    0x8F19: 'zhé',
+    0x8F1A: 'zhàn',
+    0x8F1B: 'liàng',
+    0x8F1C: 'zī,zì',
+    0x8F1D: 'huī',
+    0x8F1E: 'wǎng',
+    0x8F1F: 'chuò',
+    0x8F20: 'guǒ,huà,huì',
+    0x8F21: 'kǎn',
+    0x8F22: 'yǐ',
+    0x8F23: 'péng',
+    0x8F24: 'qiàn',
+    0x8F25: 'gǔn',
+    0x8F26: 'niǎn,liǎn',
+    0x8F27: 'píng,pēng',
+    0x8F28: 'guǎn',
+    0x8F29: 'bèi',
+    0x8F2A: 'lún',
+    0x8F2B: 'pái',
+    0x8F2C: 'liáng',
+    0x8F2D: 'ruǎn,ér',
+    0x8F2E: 'róu,rǒu',
+    0x8F2F: 'jí',
+    0x8F30: 'yáng',
+    0x8F31: 'xián,kàn',
+    0x8F32: 'chuán',
+    0x8F33: 'còu',
+    0x8F34: 'chūn,shǔn',
+    0x8F35: 'gé,yà,è,qiè',
+    0x8F36: 'yóu',
+    0x8F37: 'hōng',
+    0x8F38: 'shū,shù',
+    0x8F39: 'fù,bú',
+    0x8F3A: 'zī',
+    0x8F3B: 'fú',
+    0x8F3C: 'wēn,yūn',
+    0x8F3D: 'bèn',
+    0x8F3E: 'zhǎn,niǎn',
+    0x8F3F: 'yú,yù',
+    0x8F40: 'wēn',
+    0x8F41: 'tāo,kǎn',
+    0x8F42: 'gǔ,gū',
+    0x8F43: 'zhēn',
+    0x8F44: 'xiá,hé',
+    0x8F45: 'yuán',
+    0x8F46: 'lù',
+    0x8F47: 'jiāo,xiǎo',
+    0x8F48: 'cháo',
+    0x8F49: 'zhuǎn,zhuàn,zhuǎi',
+    0x8F4A: 'wèi',
+    0x8F4B: 'hún',
+    0x8F4C: 'xuě',
+    0x8F4D: 'zhé',
+    0x8F4E: 'jiào',
+    0x8F4F: 'zhàn',
+    0x8F50: 'bú',
+    0x8F51: 'lǎo,láo,liáo,liǎo,liào',
+    0x8F52: 'fén',
+    0x8F53: 'fān',
+    0x8F54: 'lín,lìn',
+    0x8F55: 'gé',
+    0x8F56: 'sè',
+    0x8F57: 'kǎn',
+    0x8F58: 'huán,huàn',
+    0x8F59: 'yǐ',
+    0x8F5A: 'jí',
+    0x8F5B: 'zhuì',
+    0x8F5C: 'ér',
+    0x8F5D: 'yù',
+    0x8F5E: 'jiàn',
+    0x8F5F: 'hōng',
+    0x8F60: 'léi',
+    0x8F61: 'pèi',
+    0x8F62: 'lì',
+    0x8F63: 'lì',
+    0x8F64: 'lú',
+    0x8F65: 'lìn',
+    0x8F66: 'chē,jū',
+    0x8F67: 'yà,zhá,gá',
+    0x8F68: 'guǐ',
+    0x8F69: 'xuān',
+    0x8F6A: 'dài',
+    0x8F6B: 'rèn',
+    0x8F6C: 'zhuǎn,zhuàn,zhuǎi',
+    0x8F6D: 'è',
+    0x8F6E: 'lún',
+    0x8F6F: 'ruǎn',
+    0x8F70: 'hōng',
+    0x8F71: 'gū',
+    0x8F72: 'kē,kě',
+    0x8F73: 'lú',
+    0x8F74: 'zhóu,zhòu',
+    0x8F75: 'zhǐ',
+    0x8F76: 'yì',
+    0x8F77: 'hū',
+    0x8F78: 'zhěn',
+    0x8F79: 'lì',
+    0x8F7A: 'yáo',
+    0x8F7B: 'qīng',
+    0x8F7C: 'shì',
+    0x8F7D: 'zài,zǎi',
+    0x8F7E: 'zhì',
+    0x8F7F: 'jiào',
+    0x8F80: 'zhōu',
+    0x8F81: 'quán',
+    0x8F82: 'lù',
+    0x8F83: 'jiào',
+    0x8F84: 'zhé',
+    0x8F85: 'fǔ',
+    0x8F86: 'liàng',
+    0x8F87: 'niǎn',
+    0x8F88: 'bèi',
+    0x8F89: 'huī',
+    0x8F8A: 'gǔn',
+    0x8F8B: 'wǎng',
+    0x8F8C: 'liáng',
+    0x8F8D: 'chuò',
+    0x8F8E: 'zī',
+    0x8F8F: 'còu',
+    0x8F90: 'fú',
+    0x8F91: 'jí',
+    0x8F92: 'wēn',
+    0x8F93: 'shū',
+    0x8F94: 'pèi',
+    0x8F95: 'yuán',
+    0x8F96: 'xiá',
+    0x8F97: 'niǎn,zhǎn',
+    0x8F98: 'lù',
+    0x8F99: 'zhé',
+    0x8F9A: 'lín',
+    0x8F9B: 'xīn',
+    0x8F9C: 'gū',
+    0x8F9D: 'cí',
+    0x8F9E: 'cí',
+    0x8F9F: 'pì,bì,mǐ,pī',
+    0x8FA0: 'zuì,zuī',
+    0x8FA1: 'biàn',
+    0x8FA2: 'là',
+    0x8FA3: 'là',
+    0x8FA4: 'cí',
+    0x8FA5: 'xuē,yì',
+    0x8FA6: 'bàn',
+    0x8FA7: 'biàn',
+    0x8FA8: 'biàn,biǎn,bàn,piàn',
+    0x8FA9: 'biàn',
+    0x8FAA: 'xuē',
+    0x8FAB: 'biàn',
+    0x8FAC: 'bān',
+    0x8FAD: 'cí',
+    0x8FAE: 'biàn',
+    0x8FAF: 'biàn,pián,biǎn,bàn',
+    0x8FB0: 'chén',
+    0x8FB1: 'rǔ',
+    0x8FB2: 'nóng',
+    0x8FB3: 'nóng',
+    0x8FB4: 'chǎn,zhěn',
+    0x8FB5: 'chuò',
+    0x8FB6: 'chuò',
+    0x8FB7: 'yī',
+    0x8FB8: 'réng',
+    0x8FB9: 'biān,bian',
+    0x8FBA: 'biān',
+    0x8FBB: 'shí',
+    0x8FBC: 'yū',
+    0x8FBD: 'liáo',
+    0x8FBE: 'dá,tì,tà',
+    0x8FBF: 'chān,chán',
+    0x8FC0: 'gān',
+    0x8FC1: 'qiān',
+    0x8FC2: 'yū',
+    0x8FC3: 'yū',
+    0x8FC4: 'qì',
+    0x8FC5: 'xùn',
+    0x8FC6: 'yí,yǐ,tuó',
+    0x8FC7: 'guò,guō',
+    0x8FC8: 'mài',
+    0x8FC9: 'qī',
+    0x8FCA: 'zā',
+    0x8FCB: 'wàng,guàng,kuáng',
+    0x8FCC: 'tù',
+    0x8FCD: 'zhūn',
+    0x8FCE: 'yíng,yìng',
+    0x8FCF: 'dá',
+    0x8FD0: 'yùn,yǔn',
+    0x8FD1: 'jìn',
+    0x8FD2: 'háng,xiáng',
+    0x8FD3: 'yà',
+    0x8FD4: 'fǎn',
+    0x8FD5: 'wù,wǔ',
+    0x8FD6: 'dá',
+    0x8FD7: 'é',
+    0x8FD8: 'hái,huán,fú',
+    0x8FD9: 'zhè,zhèi',
+    0x8FDA: 'dá',
+    0x8FDB: 'jìn',
+    0x8FDC: 'yuǎn',
+    0x8FDD: 'wéi',
+    0x8FDE: 'lián',
+    0x8FDF: 'chí',
+    0x8FE0: 'chè',
+    0x8FE1: 'nì,chí',
+    0x8FE2: 'tiáo',
+    0x8FE3: 'zhì,chì',
+    0x8FE4: 'yí,yǐ,tuó',
+    0x8FE5: 'jiǒng',
+    0x8FE6: 'jiā,xiè',
+    0x8FE7: 'chén',
+    0x8FE8: 'dài',
+    0x8FE9: 'ěr',
+    0x8FEA: 'dí',
+    0x8FEB: 'pò,pǎi',
+    0x8FEC: 'zhù,wǎng',
+    0x8FED: 'dié,yì,dá',
+    0x8FEE: 'zé,zuò',
+    0x8FEF: 'táo',
+    0x8FF0: 'shù',
+    0x8FF1: 'tuó,yí',
+    0x8FF2: 'qu',
+    0x8FF3: 'jìng',
+    0x8FF4: 'huí',
+    0x8FF5: 'dòng',
+    0x8FF6: 'yòu',
+    0x8FF7: 'mí,mì',
+    0x8FF8: 'bèng',
+    0x8FF9: 'jì,jī',
+    0x8FFA: 'nǎi',
+    0x8FFB: 'yí',
+    0x8FFC: 'jié',
+    0x8FFD: 'zhuī,duī,tuī',
+    0x8FFE: 'liè',
+    0x8FFF: 'xùn',
+    0x9000: 'tuì',
+    0x9001: 'sòng',
+    0x9002: 'shì,kuò',
+    0x9003: 'táo',
+    0x9004: 'páng,féng',
+    0x9005: 'hòu',
+    0x9006: 'nì',
+    0x9007: 'dùn',
+    0x9008: 'jiǒng',
+    0x9009: 'xuǎn',
+    0x900A: 'xùn',
+    0x900B: 'bū',
+    0x900C: 'yōu,yóu',
+    0x900D: 'xiāo',
+    0x900E: 'qiú',
+    0x900F: 'tòu,shū',
+    0x9010: 'zhú,dí,zhòu,tún',
+    0x9011: 'qiú',
+    0x9012: 'dì',
+    0x9013: 'dì',
+    0x9014: 'tú',
+    0x9015: 'jìng',
+    0x9016: 'tì',
+    0x9017: 'dòu,zhù,tóu,qí',
+    0x9018: 'yǐ,sì',
+    0x9019: 'zhè,yàn,zhèi',
+    0x901A: 'tōng,tòng',
+    0x901B: 'guàng,kuáng',
+    0x901C: 'wù,wǔ',
+    0x901D: 'shì',
+    0x901E: 'chěng,yíng',
+    0x901F: 'sù',
+    0x9020: 'zào,cào,cāo',
+    0x9021: 'qūn,xùn,suō',
+    0x9022: 'féng,péng,páng',
+    0x9023: 'lián,liǎn,liàn,làn',
+    0x9024: 'suò',
+    0x9025: 'huí',
+    0x9026: 'lǐ',
+    0x9027: 'gǔ',
+    0x9028: 'lái,lài',
+    0x9029: 'bèn,bēn',
+    0x902A: 'cuò',
+    0x902B: 'jué,zhú',
+    0x902C: 'bèng,pēng',
+    0x902D: 'huàn',
+    0x902E: 'dǎi,dài,dì',
+    0x902F: 'lù,dài',
+    0x9030: 'yóu',
+    0x9031: 'zhōu',
+    0x9032: 'jìn',
+    0x9033: 'yù',
+    0x9034: 'chuō,chuò',
+    0x9035: 'kuí,kuǐ',
+    0x9036: 'wēi',
+    0x9037: 'tì',
+    0x9038: 'yì',
+    0x9039: 'dá',
+    0x903A: 'yuǎn',
+    0x903B: 'luó',
+    0x903C: 'bī',
+    0x903D: 'nuò',
+    0x903E: 'yú,dòu',
+    0x903F: 'dàng,táng',
+    0x9040: 'suí',
+    0x9041: 'dùn,qūn,xún',
+    0x9042: 'suì,suí',
+    0x9043: 'yǎn,àn',
+    0x9044: 'chuán',
+    0x9045: 'chí',
+    0x9046: 'tí',
+    0x9047: 'yù,yóng,ǒu',
+    0x9048: 'shí',
+    0x9049: 'zhēn',
+    0x904A: 'yóu',
+    0x904B: 'yùn',
+    0x904C: 'è',
+    0x904D: 'biàn',
+    0x904E: 'guò,guō,guo,huò',
+    0x904F: 'è',
+    0x9050: 'xiá',
+    0x9051: 'huáng',
+    0x9052: 'qiú,qiū',
+    0x9053: 'dào,dǎo',
+    0x9054: 'dá,tà',
+    0x9055: 'wéi,huí',
+    0x9056: 'nán',
+    0x9057: 'yí,wèi',
+    0x9058: 'gòu',
+    0x9059: 'yáo',
+    0x905A: 'chòu',
+    0x905B: 'liú,liù',
+    0x905C: 'xùn',
+    0x905D: 'tà',
+    0x905E: 'dì,shì,dài',
+    0x905F: 'chí,zhì,xī',
+    0x9060: 'yuǎn,yuàn',
+    0x9061: 'sù',
+    0x9062: 'tà,tā',
+    0x9063: 'qiǎn,qiàn',
+    0x9064: 'mǎ',
+    0x9065: 'yáo',
+    0x9066: 'guàn',
+    0x9067: 'zhāng',
+    0x9068: 'áo',
+    0x9069: 'shì,dí,tì,zhé',
+    0x906A: 'cà',
+    0x906B: 'chì',
+    0x906C: 'sù',
+    0x906D: 'zāo',
+    0x906E: 'zhē',
+    0x906F: 'dùn',
+    0x9070: 'dì,shì,dài',
+    0x9071: 'lóu',
+    0x9072: 'chí,zhì',
+    0x9073: 'cuō',
+    0x9074: 'lín,lìn',
+    0x9075: 'zūn',
+    0x9076: 'rào',
+    0x9077: 'qiān',
+    0x9078: 'xuǎn,xuàn,suàn,shuā',
+    0x9079: 'yù',
+    0x907A: 'yí,wèi,suí',
+    0x907B: 'è',
+    0x907C: 'liáo',
+    0x907D: 'jù,qú',
+    0x907E: 'shì',
+    0x907F: 'bì',
+    0x9080: 'yāo',
+    0x9081: 'mài',
+    0x9082: 'xiè',
+    0x9083: 'suì',
+    0x9084: 'hái,huán,xuán',
+    0x9085: 'zhān,zhàn',
+    0x9086: 'téng',
+    0x9087: 'ěr',
+    0x9088: 'miǎo,miáo',
+    0x9089: 'biān',
+    0x908A: 'biān',
+    0x908B: 'lā,liè',
+    0x908C: 'lí,chí',
+    0x908D: 'yuán',
+    0x908E: 'yáo',
+    0x908F: 'luó,luò',
+    0x9090: 'lǐ',
+    0x9091: 'yì,è',
+    0x9092: 'tíng',
+    0x9093: 'dèng,shān',
+    0x9094: 'qǐ',
+    0x9095: 'yōng,yǒng',
+    0x9096: 'shān',
+    0x9097: 'hán',
+    0x9098: 'yú',
+    0x9099: 'máng',
+    0x909A: 'rú,fù',
+    0x909B: 'qióng',
+    0x909C: 'xī',
+    0x909D: 'kuàng',
+    0x909E: 'fū',
+    0x909F: 'kàng,háng,kāng',
+    0x90A0: 'bīn',
+    0x90A1: 'fāng,fàng',
+    0x90A2: 'xíng,gěng',
+    0x90A3: 'nà,nā,nuó,nuò,nèi,nǎ,něi,né,nǎi,nè',
+    0x90A4: 'xīn',
+    0x90A5: 'shěn',
+    0x90A6: 'bāng',
+    0x90A7: 'yuán',
+    0x90A8: 'cūn',
+    0x90A9: 'huǒ',
+    0x90AA: 'xié,yá,yé,xú,shé',
+    0x90AB: 'bāng',
+    0x90AC: 'wū',
+    0x90AD: 'jù',
+    0x90AE: 'yóu',
+    0x90AF: 'hán,hàn',
+    0x90B0: 'tái',
+    0x90B1: 'qiū',
+    0x90B2: 'bì,biàn',
+    0x90B3: 'pī',
+    0x90B4: 'bǐng',
+    0x90B5: 'shào',
+    0x90B6: 'bèi',
+    0x90B7: 'wǎ',
+    0x90B8: 'dǐ',
+    0x90B9: 'zōu',
+    0x90BA: 'yè,qiū',
+    0x90BB: 'lín',
+    0x90BC: 'kuāng',
+    0x90BD: 'guī',
+    0x90BE: 'zhū',
+    0x90BF: 'shī',
+    0x90C0: 'kū',
+    0x90C1: 'yù',
+    0x90C2: 'gāi,hái',
+    0x90C3: 'hé,xiá',
+    0x90C4: 'qiè,xì',
+    0x90C5: 'zhì,jí',
+    0x90C6: 'jí',
+    0x90C7: 'huán,xún',
+    0x90C8: 'hòu',
+    0x90C9: 'xíng',
+    0x90CA: 'jiāo',
+    0x90CB: 'xí',
+    0x90CC: 'guī',
+    0x90CD: 'nuó,nǎ,fú',
+    0x90CE: 'láng,làng',
+    0x90CF: 'jiá',
+    0x90D0: 'kuài',
+    0x90D1: 'zhèng',
+    0x90D2: 'láng',
+    0x90D3: 'yùn',
+    0x90D4: 'yán',
+    0x90D5: 'chéng',
+    0x90D6: 'dòu',
+    0x90D7: 'xī,chī',
+    0x90D8: 'lǚ',
+    0x90D9: 'fǔ',
+    0x90DA: 'wú,yú',
+    0x90DB: 'fú',
+    0x90DC: 'gào',
+    0x90DD: 'hǎo,shì',
+    0x90DE: 'láng',
+    0x90DF: 'jiá',
+    0x90E0: 'gěng',
+    0x90E1: 'jùn',
+    0x90E2: 'yǐng,chéng',
+    0x90E3: 'bó',
+    0x90E4: 'xì',
+    0x90E5: 'bèi',
+    0x90E6: 'lì',
+    0x90E7: 'yún',
+    0x90E8: 'bù,pǒu',
+    0x90E9: 'xiáo,ǎo',
+    0x90EA: 'qī',
+    0x90EB: 'pí',
+    0x90EC: 'qīng',
+    0x90ED: 'guō,guó',
+    0x90EE: 'zhōu',
+    0x90EF: 'tán',
+    0x90F0: 'zōu,jǔ',
+    0x90F1: 'píng',
+    0x90F2: 'lái,lěi',
+    0x90F3: 'ní',
+    0x90F4: 'chēn,lán',
+    0x90F5: 'yóu,chuí',
+    0x90F6: 'bù',
+    0x90F7: 'xiāng',
+    0x90F8: 'dān',
+    0x90F9: 'jú',
+    0x90FA: 'yōng',
+    0x90FB: 'qiāo',
+    0x90FC: 'yī',
+    0x90FD: 'dōu,dū',
+    0x90FE: 'yǎn,yān',
+    0x90FF: 'méi',
+    0x9100: 'ruò',
+    0x9101: 'bèi',
+    0x9102: 'è',
+    0x9103: 'shū',
+    0x9104: 'juàn',
+    0x9105: 'yǔ',
+    0x9106: 'yùn',
+    0x9107: 'hóu',
+    0x9108: 'kuí',
+    0x9109: 'xiāng,xiǎng,xiàng',
+    0x910A: 'xiāng',
+    0x910B: 'sōu',
+    0x910C: 'táng',
+    0x910D: 'míng',
+    0x910E: 'xī',
+    0x910F: 'rǔ',
+    0x9110: 'chù',
+    0x9111: 'zī',
+    0x9112: 'zōu,jù',
+    0x9113: 'yè',
+    0x9114: 'wū',
+    0x9115: 'xiāng',
+    0x9116: 'yún',
+    0x9117: 'hào,qiāo,jiāo',
+    0x9118: 'yōng',
+    0x9119: 'bǐ',
+    0x911A: 'mào,mò',
+    0x911B: 'cháo',
+    0x911C: 'fū,lù',
+    0x911D: 'liǎo',
+    0x911E: 'yín',
+    0x911F: 'zhuān',
+    0x9120: 'hù',
+    0x9121: 'qiāo',
+    0x9122: 'yān',
+    0x9123: 'zhāng,zhàng',
+    0x9124: 'màn,wàn',
+    0x9125: 'qiāo',
+    0x9126: 'xǔ',
+    0x9127: 'dèng',
+    0x9128: 'bì',
+    0x9129: 'xún',
+    0x912A: 'bì',
+    0x912B: 'zēng,céng',
+    0x912C: 'wéi',
+    0x912D: 'zhèng',
+    0x912E: 'mào',
+    0x912F: 'shàn',
+    0x9130: 'lín,lìn',
+    0x9131: 'pó,pí,pán',
+    0x9132: 'dān,duō',
+    0x9133: 'méng',
+    0x9134: 'yè',
+    0x9135: 'cào,sāo',
+    0x9136: 'kuài',
+    0x9137: 'fēng',
+    0x9138: 'méng',
+    0x9139: 'zōu,jù',
+    0x913A: 'kuàng,kuò',
+    0x913B: 'liǎn',
+    0x913C: 'zàn',
+    0x913D: 'chán',
+    0x913E: 'yōu',
+    0x913F: 'jī,qí',
+    0x9140: 'yàn,yǎn',
+    0x9141: 'chán',
+    0x9142: 'cuó,zàn',
+    0x9143: 'líng',
+    0x9144: 'huān,quān',
+    0x9145: 'xī',
+    0x9146: 'fēng',
+    0x9147: 'zàn,cuó',
+    0x9148: 'lì,lí,zhí',
+    0x9149: 'yǒu',
+    0x914A: 'dīng,dǐng',
+    0x914B: 'qiú',
+    0x914C: 'zhuó',
+    0x914D: 'pèi',
+    0x914E: 'zhòu',
+    0x914F: 'yǐ,yí',
+    0x9150: 'gān,hàng',
+    0x9151: 'yú',
+    0x9152: 'jiǔ',
+    0x9153: 'yǎn,yàn,yǐn',
+    0x9154: 'zuì',
+    0x9155: 'máo',
+    0x9156: 'zhèn,dān',
+    0x9157: 'xù',
+    0x9158: 'dòu',
+    0x9159: 'zhēn',
+    0x915A: 'fēn',
+    0x915B: 'yuán',
+    0x915C: 'fu',
+    0x915D: 'yùn',
+    0x915E: 'tài',
+    0x915F: 'tiān',
+    0x9160: 'qiǎ',
+    0x9161: 'tuó,duò',
+    0x9162: 'cù,zuò',
+    0x9163: 'hān,hàn',
+    0x9164: 'gū',
+    0x9165: 'sū',
+    0x9166: 'pò,pō,fā',
+    0x9167: 'chóu',
+    0x9168: 'zài,zuì',
+    0x9169: 'mǐng',
+    0x916A: 'lào,luò,lù',
+    0x916B: 'chuò',
+    0x916C: 'chóu',
+    0x916D: 'yòu',
+    0x916E: 'tóng,dòng,chóng',
+    0x916F: 'zhǐ',
+    0x9170: 'xiān',
+    0x9171: 'jiàng',
+    0x9172: 'chéng',
+    0x9173: 'yìn',
+    0x9174: 'tú',
+    0x9175: 'jiào',
+    0x9176: 'méi',
+    0x9177: 'kù',
+    0x9178: 'suān',
+    0x9179: 'lèi',
+    0x917A: 'pú',
+    0x917B: 'zuì,fú',
+    0x917C: 'hǎi',
+    0x917D: 'yàn',
+    0x917E: 'shāi,shī',
+    0x917F: 'niàng,niáng',
+    0x9180: 'wéi,zhuì',
+    0x9181: 'lù',
+    0x9182: 'lǎn',
+    0x9183: 'yān,āng',
+    0x9184: 'táo',
+    0x9185: 'pēi',
+    0x9186: 'zhǎn',
+    0x9187: 'chún',
+    0x9188: 'tán,dàn',
+    0x9189: 'zuì',
+    0x918A: 'zhuì',
+    0x918B: 'cù,zuò',
+    0x918C: 'kūn',
+    0x918D: 'tí,tǐ',
+    0x918E: 'xián,jiǎn',
+    0x918F: 'dū',
+    0x9190: 'hú',
+    0x9191: 'xǔ',
+    0x9192: 'xǐng,chéng,jīng',
+    0x9193: 'tǎn',
+    0x9194: 'qiú,chōu',
+    0x9195: 'chún',
+    0x9196: 'yùn',
+    0x9197: 'pò',
+    0x9198: 'kē',
+    0x9199: 'sōu',
+    0x919A: 'mí',
+    0x919B: 'quán,chuò',
+    0x919C: 'chǒu',
+    0x919D: 'cuō,cuǒ',
+    0x919E: 'yùn',
+    0x919F: 'yòng',
+    0x91A0: 'àng',
+    0x91A1: 'zhà',
+    0x91A2: 'hǎi',
+    0x91A3: 'táng',
+    0x91A4: 'jiàng',
+    0x91A5: 'piǎo',
+    0x91A6: 'chěn,chǎn',
+    0x91A7: 'yù,ōu',
+    0x91A8: 'lí',
+    0x91A9: 'zāo',
+    0x91AA: 'láo',
+    0x91AB: 'yī,yǐ',
+    0x91AC: 'jiàng',
+    0x91AD: 'bú',
+    0x91AE: 'jiào,qiáo,zhàn',
+    0x91AF: 'xī',
+    0x91B0: 'tán',
+    0x91B1: 'fā,pò,pō',
+    0x91B2: 'nóng',
+    0x91B3: 'yì,shì',
+    0x91B4: 'lǐ',
+    0x91B5: 'jù',
+    0x91B6: 'yàn,liǎn,xiān,jiǎn',
+    0x91B7: 'yì,yǐ,ài',
+    0x91B8: 'niàng',
+    0x91B9: 'rú',
+    0x91BA: 'xūn',
+    0x91BB: 'chóu,shòu,dào',
+    0x91BC: 'yàn',
+    0x91BD: 'líng',
+    0x91BE: 'mí',
+    0x91BF: 'mí',
+    0x91C0: 'niàng,niáng',
+    0x91C1: 'xìn',
+    0x91C2: 'jiào',
+    0x91C3: 'shāi,shī,lí',
+    0x91C4: 'mí',
+    0x91C5: 'yàn',
+    0x91C6: 'biàn,biǎn',
+    0x91C7: 'cǎi,cài',
+    0x91C8: 'shì',
+    0x91C9: 'yòu',
+    0x91CA: 'shì',
+    0x91CB: 'shì,yì',
+    0x91CC: 'lǐ,li',
+    0x91CD: 'zhòng,chóng,tóng',
+    0x91CE: 'yě,shù',
+    0x91CF: 'liàng,liáng',
+    0x91D0: 'lí,xī,lái,tāi,lài,xǐ',
+    0x91D1: 'jīn,jìn',
+    0x91D2: 'jīn',
+    0x91D3: 'qiú,gá',
+    0x91D4: 'yǐ',
+    0x91D5: 'liǎo,liào',
+    0x91D6: 'dāo',
+    0x91D7: 'zhāo',
+    0x91D8: 'dīng,dìng,líng',
+    0x91D9: 'pò,pō',
+    0x91DA: 'qiú',
+    0x91DB: 'bā',
+    0x91DC: 'fǔ',
+    0x91DD: 'zhēn',
+    0x91DE: 'zhí',
+    0x91DF: 'bā',
+    0x91E0: 'luàn',
+    0x91E1: 'fǔ',
+    0x91E2: 'nǎi',
+    0x91E3: 'diào',
+    0x91E4: 'shàn,shān,xiān',
+    0x91E5: 'qiǎo,jiǎo',
+    0x91E6: 'kòu',
+    0x91E7: 'chuàn,chuān',
+    0x91E8: 'zǐ',
+    0x91E9: 'fǎn,fàn,fán',
+    0x91EA: 'huá,yú',
+    0x91EB: 'huá,wū',
+    0x91EC: 'hàn,gān',
+    0x91ED: 'gāng,gōng',
+    0x91EE: 'qí',
+    0x91EF: 'máng',
+    0x91F0: 'rì,rèn,jiàn',
+    0x91F1: 'dì',
+    0x91F2: 'sì',
+    0x91F3: 'xì',
+    0x91F4: 'yì',
+    0x91F5: 'chāi,chā',
+    0x91F6: 'shī,yí,yě',
+    0x91F7: 'tǔ',
+    0x91F8: 'xī',
+    0x91F9: 'nǚ',
+    0x91FA: 'qiān',
+    0x91FB: 'qiú',
+    0x91FC: 'jiàn',
+    0x91FD: 'pì,pī,zhāo',
+    0x91FE: 'yé,yá',
+    0x91FF: 'jīn,yǐn,yín',
+    0x9200: 'bǎ,bā,pá',
+    0x9201: 'fāng',
+    0x9202: 'chén,qín,zhèn',
+    0x9203: 'xíng',
+    0x9204: 'dǒu',
+    0x9205: 'yuè',
+    0x9206: 'qiān,zhōng',
+    0x9207: 'fū,fǔ',
+    0x9208: 'pī,bù',
+    0x9209: 'nà,ruì',
+    0x920A: 'xīn,qìn',
+    0x920B: 'é',
+    0x920C: 'jué',
+    0x920D: 'dùn',
+    0x920E: 'gōu',
+    0x920F: 'yǐn',
+    0x9210: 'qián,hán',
+    0x9211: 'bǎn',
+    0x9212: 'sà,xì',
+    0x9213: 'rén',
+    0x9214: 'chāo,chǎo',
+    0x9215: 'niǔ,chǒu',
+    0x9216: 'fēn',
+    0x9217: 'yǔn,duì',
+    0x9218: 'yǐ',
+    0x9219: 'qín',
+    0x921A: 'pī,bī,bǐ',
+    0x921B: 'guō',
+    0x921C: 'hóng',
+    0x921D: 'yín',
+    0x921E: 'jūn',
+    0x921F: 'diào',
+    0x9220: 'yì',
+    0x9221: 'zhōng',
+    0x9222: 'xǐ',
+    0x9223: 'gài',
+    0x9224: 'rì',
+    0x9225: 'huǒ',
+    0x9226: 'tài',
+    0x9227: 'kàng',
+    0x9228: 'yuán',
+    0x9229: 'lú',
+    0x922A: 'è',
+    0x922B: 'qín',
+    0x922C: 'duó',
+    0x922D: 'zī',
+    0x922E: 'nǐ,ní',
+    0x922F: 'tú',
+    0x9230: 'shì',
+    0x9231: 'mín,mǐn',
+    0x9232: 'gū,pì',
+    0x9233: 'kē',
+    0x9234: 'líng',
+    0x9235: 'bǐng',
+    0x9236: 'sì,cí,tái',
+    0x9237: 'gǔ,hú,gù',
+    0x9238: 'bó',
+    0x9239: 'pī,pí',
+    0x923A: 'yù',
+    0x923B: 'sì',
+    0x923C: 'zuó',
+    0x923D: 'bū',
+    0x923E: 'yóu,zhòu',
+    0x923F: 'tián,diàn',
+    0x9240: 'jiǎ,gé',
+    0x9241: 'zhēn,zhèn',
+    0x9242: 'shǐ',
+    0x9243: 'shì,zú',
+    0x9244: 'zhí,tiě',
+    0x9245: 'jù',
+    0x9246: 'chān,qián,tiē',
+    0x9247: 'shī,yí',
+    0x9248: 'shī,shé,yí,tuó,tā',
+    0x9249: 'xuàn',
+    0x924A: 'zhāo',
+    0x924B: 'bào,páo,báo',
+    0x924C: 'hé',
+    0x924D: 'bì,sè',
+    0x924E: 'shēng',
+    0x924F: 'chú,zū,zhù,jǔ,chá,xú',
+    0x9250: 'shí,zú',
+    0x9251: 'bó',
+    0x9252: 'zhù',
+    0x9253: 'chì',
+    0x9254: 'zā',
+    0x9255: 'pō,pǒ',
+    0x9256: 'tóng',
+    0x9257: 'qián,ān',
+    0x9258: 'fú',
+    0x9259: 'zhǎi',
+    0x925A: 'liǔ,mǎo',
+    0x925B: 'qiān,yán',
+    0x925C: 'fú',
+    0x925D: 'lì',
+    0x925E: 'yuè',
+    0x925F: 'pī',
+    0x9260: 'yāng',
+    0x9261: 'bàn',
+    0x9262: 'bō',
+    0x9263: 'jié',
+    0x9264: 'gōu,gòu,qú',
+    0x9265: 'shù,xù',
+    0x9266: 'zhēng',
+    0x9267: 'mǔ',
+    0x9268: 'xǐ,nǐ,niě',
+    0x9269: 'xǐ,niè',
+    0x926A: 'dì',
+    0x926B: 'jiā',
+    0x926C: 'mù',
+    0x926D: 'tǎn',
+    0x926E: 'huán,shén,shēn',
+    0x926F: 'yǐ',
+    0x9270: 'sī',
+    0x9271: 'kuàng',
+    0x9272: 'kǎ',
+    0x9273: 'běi',
+    0x9274: 'jiàn',
+    0x9275: 'tóng,zhuó',
+    0x9276: 'xíng',
+    0x9277: 'hóng',
+    0x9278: 'jiǎo',
+    0x9279: 'chǐ',
+    0x927A: 'èr,kēng,ěr',
+    0x927B: 'luò,gē,gè',
+    0x927C: 'bǐng,píng',
+    0x927D: 'shì',
+    0x927E: 'móu,máo',
+    0x927F: 'jiā,gē,kē,hā',
+    0x9280: 'yín',
+    0x9281: 'jūn',
+    0x9282: 'zhōu',
+    0x9283: 'chòng',
+    0x9284: 'xiǎng,jiōng',
+    0x9285: 'tóng',
+    0x9286: 'mò',
+    0x9287: 'lèi',
+    0x9288: 'jī',
+    0x9289: 'yù,sì',
+    0x928A: 'xù,huì',
+    0x928B: 'rén,rěn',
+    0x928C: 'zùn',
+    0x928D: 'zhì',
+    0x928E: 'qióng,qiōng',
+    0x928F: 'shàn,shuò',
+    0x9290: 'chì,lì',
+    0x9291: 'xiǎn,xiān,xǐ',
+    0x9292: 'xíng,jiān',
+    0x9293: 'quán',
+    0x9294: 'pī',
+    0x9295: 'tiě,yí',
+    0x9296: 'zhū',
+    0x9297: 'xiàng,hóu',
+    0x9298: 'míng',
+    0x9299: 'kuǎ',
+    0x929A: 'yáo,diào,tiáo,qiāo,yào',
+    0x929B: 'xiān,tiǎn,guā',
+    0x929C: 'xián',
+    0x929D: 'xiū',
+    0x929E: 'jūn',
+    0x929F: 'chā',
+    0x92A0: 'lǎo',
+    0x92A1: 'jí',
+    0x92A2: 'pǐ',
+    0x92A3: 'rú',
+    0x92A4: 'mǐ',
+    0x92A5: 'yī',
+    0x92A6: 'yīn',
+    0x92A7: 'guāng',
+    0x92A8: 'ǎn',
+    0x92A9: 'diū',
+    0x92AA: 'yǒu',
+    0x92AB: 'sè',
+    0x92AC: 'kào',
+    0x92AD: 'qián',
+    0x92AE: 'luán',
+    0x92AF: 'sī',
+    0x92B0: 'āi',
+    0x92B1: 'diào',
+    0x92B2: 'hàn',
+    0x92B3: 'ruì',
+    0x92B4: 'shì,zhì',
+    0x92B5: 'kēng',
+    0x92B6: 'qiú',
+    0x92B7: 'xiāo',
+    0x92B8: 'zhé,niè',
+    0x92B9: 'xiù,yòu',
+    0x92BA: 'zàng',
+    0x92BB: 'tí,tī',
+    0x92BC: 'cuò',
+    0x92BD: 'guā',
+    0x92BE: 'hòng,gǒng',
+    0x92BF: 'zhōng,yōng',
+    0x92C0: 'tōu,dòu,tù',
+    0x92C1: 'lǚ,lǜ',
+    0x92C2: 'méi,méng',
+    0x92C3: 'láng',
+    0x92C4: 'wàn',
+    0x92C5: 'xīn,zǐ',
+    0x92C6: 'yún,jūn',
+    0x92C7: 'bèi',
+    0x92C8: 'wù',
+    0x92C9: 'sù',
+    0x92CA: 'yù',
+    0x92CB: 'chán,yán',
+    0x92CC: 'dìng,tǐng',
+    0x92CD: 'bó',
+    0x92CE: 'hàn',
+    0x92CF: 'jiá',
+    0x92D0: 'hóng',
+    0x92D1: 'cuān,jiān,juān',
+    0x92D2: 'fēng',
+    0x92D3: 'chān',
+    0x92D4: 'wǎn',
+    0x92D5: 'zhì',
+    0x92D6: 'sī,tuó',
+    0x92D7: 'xuān,juān,juàn',
+    0x92D8: 'huá,wú,hú',
+    0x92D9: 'yǔ,yú,wú',
+    0x92DA: 'tiáo',
+    0x92DB: 'kuàng',
+    0x92DC: 'zhuó,chuò',
+    0x92DD: 'lüè',
+    0x92DE: 'xíng,xìng,jīng',
+    0x92DF: 'qǐn,qiān,qīn,jìn',
+    0x92E0: 'shèn',
+    0x92E1: 'hán',
+    0x92E2: 'lüè',
+    0x92E3: 'yé',
+    0x92E4: 'chú,jǔ',
+    0x92E5: 'zèng',
+    0x92E6: 'jū,jú',
+    0x92E7: 'xiàn',
+    0x92E8: 'tiě,é',
+    0x92E9: 'máng',
+    0x92EA: 'pù,pū',
+    0x92EB: 'lí',
+    0x92EC: 'pàn',
+    0x92ED: 'ruì,duì,yuè',
+    0x92EE: 'chéng',
+    0x92EF: 'gào',
+    0x92F0: 'lǐ',
+    0x92F1: 'tè',
+    0x92F2: 'bīng',
+    0x92F3: 'zhù',
+    0x92F4: 'zhèn',
+    0x92F5: 'tū',
+    0x92F6: 'liǔ',
+    0x92F7: 'zuì,niè',
+    0x92F8: 'jù,jū',
+    0x92F9: 'chǎng',
+    0x92FA: 'yuǎn,yuān,wǎn,wān',
+    0x92FB: 'jiàn,jiān',
+    0x92FC: 'gāng,gàng',
+    0x92FD: 'diào',
+    0x92FE: 'táo',
+    0x92FF: 'cháng',
+    0x9300: 'lún,fēn',
+    0x9301: 'guǒ,kuǎ,kè',
+    0x9302: 'líng',
+    0x9303: 'pī',
+    0x9304: 'lù',
+    0x9305: 'lí',
+    0x9306: 'qiāng',
+    0x9307: 'póu,fú,péi',
+    0x9308: 'juǎn',
+    0x9309: 'mín',
+    0x930A: 'zuì,zū',
+    0x930B: 'péng,bèng',
+    0x930C: 'àn',
+    0x930D: 'pī,bēi,bī,pí',
+    0x930E: 'xiàn,gàn,qiàn',
+    0x930F: 'yā,yà',
+    0x9310: 'zhuī',
+    0x9311: 'lèi,lì',
+    0x9312: 'kē,ā',
+    0x9313: 'kōng',
+    0x9314: 'tà',
+    0x9315: 'kūn,gǔn',
+    0x9316: 'dú',
+    0x9317: 'nèi,zhuì,wèi',
+    0x9318: 'chuí',
+    0x9319: 'zī',
+    0x931A: 'zhēng',
+    0x931B: 'bēn',
+    0x931C: 'niè',
+    0x931D: 'zòng',
+    0x931E: 'chún,duì,duò',
+    0x931F: 'tán,xiān,yǎn',
+    0x9320: 'dìng',
+    0x9321: 'qí,yǐ',
+    0x9322: 'qián,jiǎn',
+    0x9323: 'zhuì,chuò',
+    0x9324: 'jī',
+    0x9325: 'yù',
+    0x9326: 'jǐn',
+    0x9327: 'guǎn',
+    0x9328: 'máo',
+    0x9329: 'chāng',
+    0x932A: 'tiǎn,tǔn',
+    0x932B: 'xī,tì',
+    0x932C: 'liàn',
+    0x932D: 'táo,diāo',
+    0x932E: 'gù',
+    0x932F: 'cuò,cù,xī',
+    0x9330: 'shù',
+    0x9331: 'zhēn',
+    0x9332: 'lù,lǜ',
+    0x9333: 'měng',
+    0x9334: 'lù',
+    0x9335: 'huā',
+    0x9336: 'biǎo',
+    0x9337: 'gá',
+    0x9338: 'lái',
+    0x9339: 'kěn',
+    0x933A: 'fāng',
+    0x933B: 'wu',
+    0x933C: 'nài',
+    0x933D: 'wàn,jiǎn',
+    0x933E: 'zàn',
+    0x933F: 'hǔ',
+    0x9340: 'dé',
+    0x9341: 'xiān',
+    0x9342: 'piān',
+    0x9343: 'huō',
+    0x9344: 'liàng',
+    0x9345: 'fǎ',
+    0x9346: 'mén',
+    0x9347: 'kǎi,jiē,jiě',
+    0x9348: 'yīng',
+    0x9349: 'dī,chí,dí,shì',
+    0x934A: 'liàn,jiàn',
+    0x934B: 'guō,guǒ',
+    0x934C: 'xiǎn',
+    0x934D: 'dù',
+    0x934E: 'tú',
+    0x934F: 'wéi',
+    0x9350: 'zōng',
+    0x9351: 'fù',
+    0x9352: 'róu',
+    0x9353: 'jí',
+    0x9354: 'è',
+    0x9355: 'jūn',
+    0x9356: 'chěn,zhēn',
+    0x9357: 'tí',
+    0x9358: 'zhá',
+    0x9359: 'hù',
+    0x935A: 'yáng',
+    0x935B: 'duàn',
+    0x935C: 'xiá',
+    0x935D: 'yú',
+    0x935E: 'kēng',
+    0x935F: 'shēng',
+    0x9360: 'huáng',
+    0x9361: 'wěi',
+    0x9362: 'fù',
+    0x9363: 'zhāo',
+    0x9364: 'chā',
+    0x9365: 'qiè',
+    0x9366: 'shī,shé',
+    0x9367: 'hōng',
+    0x9368: 'kuí',
+    0x9369: 'tiǎn,nuò',
+    0x936A: 'móu',
+    0x936B: 'qiāo',
+    0x936C: 'qiāo',
+    0x936D: 'hóu',
+    0x936E: 'tōu',
+    0x936F: 'cōng',
+    0x9370: 'huán',
+    0x9371: 'yè,xié',
+    0x9372: 'mín',
+    0x9373: 'jiàn',
+    0x9374: 'duān',
+    0x9375: 'jiàn',
+    0x9376: 'sōng,sī',
+    0x9377: 'kuí',
+    0x9378: 'hú',
+    0x9379: 'xuān',
+    0x937A: 'duǒ,dǔ,zhě',
+    0x937B: 'jié',
+    0x937C: 'zhēn,qián',
+    0x937D: 'biān',
+    0x937E: 'zhōng',
+    0x937F: 'zī',
+    0x9380: 'xiū',
+    0x9381: 'yé',
+    0x9382: 'měi',
+    0x9383: 'pài',
+    0x9384: 'āi',
+    0x9385: 'jiè',
+    0x9386: 'qian',
+    0x9387: 'méi',
+    0x9388: 'suǒ,chā',
+    0x9389: 'dá,tà',
+    0x938A: 'bàng,pāng',
+    0x938B: 'xiá',
+    0x938C: 'lián',
+    0x938D: 'suǒ,sè',
+    0x938E: 'kài',
+    0x938F: 'liú',
+    0x9390: 'yáo,zú',
+    0x9391: 'yè,tà,gé',
+    0x9392: 'nòu,hāo',
+    0x9393: 'wēng',
+    0x9394: 'róng',
+    0x9395: 'táng',
+    0x9396: 'suǒ',
+    0x9397: 'qiāng,chēng,qiàng',
+    0x9398: 'lì,gé',
+    0x9399: 'shuò',
+    0x939A: 'chuí,duī,zhuì',
+    0x939B: 'bó',
+    0x939C: 'pán',
+    0x939D: 'dā,sà',
+    0x939E: 'bī,pī',
+    0x939F: 'sǎng',
+    0x93A0: 'gāng',
+    0x93A1: 'zī',
+    0x93A2: 'wū',
+    0x93A3: 'yíng,yīng,jiǒng',
+    0x93A4: 'huàng',
+    0x93A5: 'tiáo',
+    0x93A6: 'liú,liù',
+    0x93A7: 'kǎi',
+    0x93A8: 'sǔn',
+    0x93A9: 'shā,shì,sè',
+    0x93AA: 'sōu',
+    0x93AB: 'wàn',
+    0x93AC: 'hào,gǎo',
+    0x93AD: 'zhèn',
+    0x93AE: 'zhèn,zhēn,tián',
+    0x93AF: 'láng,luǒ',
+    0x93B0: 'yì',
+    0x93B1: 'yuán',
+    0x93B2: 'tǎng',
+    0x93B3: 'niè',
+    0x93B4: 'xí',
+    0x93B5: 'jiā',
+    0x93B6: 'gē',
+    0x93B7: 'mǎ',
+    0x93B8: 'juān',
+    0x93B9: 'sòng',
+    0x93BA: 'zǔ',
+    0x93BB: 'suǒ',
+    0x93BC: 'xià',
+    0x93BD: 'fēng',
+    0x93BE: 'wēn',
+    0x93BF: 'ná',
+    0x93C0: 'lǔ',
+    0x93C1: 'suǒ',
+    0x93C2: 'ōu,kōu',
+    0x93C3: 'zú,chuò',
+    0x93C4: 'tuán',
+    0x93C5: 'xiū,xiù',
+    0x93C6: 'guàn',
+    0x93C7: 'xuàn,xuán',
+    0x93C8: 'liàn,lián',
+    0x93C9: 'shòu,sōu',
+    0x93CA: 'ào',
+    0x93CB: 'mǎn',
+    0x93CC: 'mò',
+    0x93CD: 'luó',
+    0x93CE: 'bì',
+    0x93CF: 'wèi',
+    0x93D0: 'liú,liù,liáo',
+    0x93D1: 'dí,dī',
+    0x93D2: 'sǎn,qiāo,càn',
+    0x93D3: 'zǒng,cōng',
+    0x93D4: 'yí',
+    0x93D5: 'lù,áo',
+    0x93D6: 'áo,biāo',
+    0x93D7: 'kēng',
+    0x93D8: 'qiāng',
+    0x93D9: 'cuī',
+    0x93DA: 'qī',
+    0x93DB: 'cháng',
+    0x93DC: 'tāng,táng',
+    0x93DD: 'màn',
+    0x93DE: 'yōng',
+    0x93DF: 'chǎn',
+    0x93E0: 'fēng',
+    0x93E1: 'jìng',
+    0x93E2: 'biāo',
+    0x93E3: 'shù',
+    0x93E4: 'lòu,lǘ',
+    0x93E5: 'xiù',
+    0x93E6: 'cōng',
+    0x93E7: 'lóng',
+    0x93E8: 'zàn',
+    0x93E9: 'jiàn,zàn',
+    0x93EA: 'cáo',
+    0x93EB: 'lí',
+    0x93EC: 'xià',
+    0x93ED: 'xī',
+    0x93EE: 'kāng',
+    0x93EF: 'shuǎng',
+    0x93F0: 'bèng',
+    0x93F1: 'zhang',
+    0x93F2: 'qian',
+    0x93F3: 'chēng',
+    0x93F4: 'lù',
+    0x93F5: 'huá',
+    0x93F6: 'jí',
+    0x93F7: 'pú',
+    0x93F8: 'huì,suì,ruì',
+    0x93F9: 'qiǎng,qiāng',
+    0x93FA: 'pō',
+    0x93FB: 'lín',
+    0x93FC: 'sè',
+    0x93FD: 'xiù',
+    0x93FE: 'sǎn,xiàn,sà',
+    0x93FF: 'chēng',
+    0x9400: 'kuì,guì',
+    0x9401: 'sī',
+    0x9402: 'liú',
+    0x9403: 'náo,nào',
+    0x9404: 'huáng',
+    0x9405: 'piě',
+    0x9406: 'suì',
+    0x9407: 'fán',
+    0x9408: 'qiáo',
+    0x9409: 'quān',
+    0x940A: 'yáng',
+    0x940B: 'tāng,tàng',
+    0x940C: 'xiàng',
+    0x940D: 'jué,yù',
+    0x940E: 'jiāo',
+    0x940F: 'zūn',
+    0x9410: 'liáo',
+    0x9411: 'qiè',
+    0x9412: 'láo',
+    0x9413: 'duì,duī,dūn',
+    0x9414: 'xín',
+    0x9415: 'zān',
+    0x9416: 'jī,qí',
+    0x9417: 'jiǎn',
+    0x9418: 'zhōng',
+    0x9419: 'dèng,dēng',
+    0x941A: 'yā',
+    0x941B: 'yǐng',
+    0x941C: 'duī,dūn',
+    0x941D: 'jué',
+    0x941E: 'nòu',
+    0x941F: 'zān,tì',
+    0x9420: 'pǔ',
+    0x9421: 'tiě',
+    0x9422: 'fán',
+    0x9423: 'chēng',
+    0x9424: 'dǐng',
+    0x9425: 'shàn',
+    0x9426: 'kāi',
+    0x9427: 'jiān,jiǎn',
+    0x9428: 'fèi',
+    0x9429: 'suì',
+    0x942A: 'lǔ',
+    0x942B: 'juān',
+    0x942C: 'huì',
+    0x942D: 'yù',
+    0x942E: 'lián',
+    0x942F: 'zhuó',
+    0x9430: 'qiāo,sào,cáo',
+    0x9431: 'jiàn,qiān',
+    0x9432: 'zhuó,shǔ',
+    0x9433: 'léi',
+    0x9434: 'bì,bèi',
+    0x9435: 'tiě,dié',
+    0x9436: 'huán,xuàn',
+    0x9437: 'yè',
+    0x9438: 'duó',
+    0x9439: 'guǒ,guō',
+    0x943A: 'dāng,chēng,tāng',
+    0x943B: 'jù,qú',
+    0x943C: 'fén,bēn',
+    0x943D: 'dá',
+    0x943E: 'bèi',
+    0x943F: 'yì',
+    0x9440: 'ài',
+    0x9441: 'zōng',
+    0x9442: 'xùn',
+    0x9443: 'diào',
+    0x9444: 'zhù',
+    0x9445: 'héng',
+    0x9446: 'zhuì',
+    0x9447: 'jī',
+    0x9448: 'niè,nǐ',
+    0x9449: 'hé',
+    0x944A: 'huò',
+    0x944B: 'qīng',
+    0x944C: 'bīn',
+    0x944D: 'yīng',
+    0x944E: 'kuì',
+    0x944F: 'níng,nǐng',
+    0x9450: 'xū,rú,róu',
+    0x9451: 'jiàn',
+    0x9452: 'jiàn',
+    0x9453: 'qiǎn',
+    0x9454: 'chǎ',
+    0x9455: 'zhì',
+    0x9456: 'miè,mì',
+    0x9457: 'lí',
+    0x9458: 'léi,lěi',
+    0x9459: 'jī',
+    0x945A: 'zuàn',
+    0x945B: 'kuàng,gǒng',
+    0x945C: 'shǎng',
+    0x945D: 'péng',
+    0x945E: 'là',
+    0x945F: 'dú',
+    0x9460: 'shuò,yuè,lì',
+    0x9461: 'chuò',
+    0x9462: 'lǜ',
+    0x9463: 'biāo',
+    0x9464: 'bào',
+    0x9465: 'lǔ',
+    0x9466: 'xian',
+    0x9467: 'kuān',
+    0x9468: 'lóng',
+    0x9469: 'è',
+    0x946A: 'lú',
+    0x946B: 'xīn,xùn',
+    0x946C: 'jiàn',
+    0x946D: 'làn,lán',
+    0x946E: 'bó',
+    0x946F: 'jiān,qiān',
+    0x9470: 'yào,yuè',
+    0x9471: 'chán',
+    0x9472: 'xiāng,ráng',
+    0x9473: 'jiàn',
+    0x9474: 'xī,huī',
+    0x9475: 'guàn',
+    0x9476: 'cáng',
+    0x9477: 'niè',
+    0x9478: 'lěi',
+    0x9479: 'cuān,cuàn',
+    0x947A: 'qú',
+    0x947B: 'pàn',
+    0x947C: 'luó',
+    0x947D: 'zuān,zuàn',
+    0x947E: 'luán',
+    0x947F: 'záo,zuò,zú,zào',
+    0x9480: 'niè,yǐ',
+    0x9481: 'jué',
+    0x9482: 'tǎng',
+    0x9483: 'zhú',
+    0x9484: 'lán',
+    0x9485: 'jīn',
+    0x9486: 'gá',
+    0x9487: 'yǐ',
+    0x9488: 'zhēn',
+    0x9489: 'dīng,dìng',
+    0x948A: 'zhāo',
+    0x948B: 'pō',
+    0x948C: 'liǎo,liào',
+    0x948D: 'tǔ',
+    0x948E: 'qiān',
+    0x948F: 'chuàn',
+    0x9490: 'shān,shàn',
+    0x9491: 'sà',
+    0x9492: 'fán',
+    0x9493: 'diào',
+    0x9494: 'mén',
+    0x9495: 'nǚ',
+    0x9496: 'yáng',
+    0x9497: 'chāi',
+    0x9498: 'xíng',
+    0x9499: 'gài',
+    0x949A: 'bù',
+    0x949B: 'tài',
+    0x949C: 'jù',
+    0x949D: 'dùn',
+    0x949E: 'chāo',
+    0x949F: 'zhōng',
+    0x94A0: 'nà',
+    0x94A1: 'bèi',
+    0x94A2: 'gāng,gàng',
+    0x94A3: 'bǎn',
+    0x94A4: 'qián',
+    0x94A5: 'yào,yuè',
+    0x94A6: 'qīn',
+    0x94A7: 'jūn',
+    0x94A8: 'wū',
+    0x94A9: 'gōu',
+    0x94AA: 'kàng',
+    0x94AB: 'fāng',
+    0x94AC: 'huǒ',
+    0x94AD: 'tǒu,dǒu',
+    0x94AE: 'niǔ',
+    0x94AF: 'bǎ,pá',
+    0x94B0: 'yù',
+    0x94B1: 'qián',
+    0x94B2: 'zhēng',
+    0x94B3: 'qián',
+    0x94B4: 'gǔ',
+    0x94B5: 'bō',
+    0x94B6: 'kē',
+    0x94B7: 'pǒ',
+    0x94B8: 'bū',
+    0x94B9: 'bó',
+    0x94BA: 'yuè',
+    0x94BB: 'zuān,zuàn',
+    0x94BC: 'mù',
+    0x94BD: 'tǎn',
+    0x94BE: 'jiǎ',
+    0x94BF: 'diàn,tián',
+    0x94C0: 'yóu',
+    0x94C1: 'tiě',
+    0x94C2: 'bó',
+    0x94C3: 'líng',
+    0x94C4: 'shuò',
+    0x94C5: 'qiān,yán',
+    0x94C6: 'mǎo',
+    0x94C7: 'bào',
+    0x94C8: 'shì',
+    0x94C9: 'xuàn',
+    0x94CA: 'tā,tuó',
+    0x94CB: 'bì',
+    0x94CC: 'ní',
+    0x94CD: 'pī,pí',
+    0x94CE: 'duó',
+    0x94CF: 'xíng',
+    0x94D0: 'kào',
+    0x94D1: 'lǎo',
+    0x94D2: 'ěr',
+    0x94D3: 'máng',
+    0x94D4: 'yā',
+    0x94D5: 'yǒu',
+    0x94D6: 'chéng',
+    0x94D7: 'jiá',
+    0x94D8: 'yé',
+    0x94D9: 'náo',
+    0x94DA: 'zhì',
+    0x94DB: 'dāng,chēng',
+    0x94DC: 'tóng',
+    0x94DD: 'lǚ',
+    0x94DE: 'diào',
+    0x94DF: 'yīn',
+    0x94E0: 'kǎi',
+    0x94E1: 'zhá',
+    0x94E2: 'zhū',
+    0x94E3: 'xǐ,xiǎn',
+    0x94E4: 'dìng,tǐng',
+    0x94E5: 'diū',
+    0x94E6: 'xiān',
+    0x94E7: 'huá',
+    0x94E8: 'quán',
+    0x94E9: 'shā',
+    0x94EA: 'hā',
+    0x94EB: 'diào,yáo',
+    0x94EC: 'gè',
+    0x94ED: 'míng',
+    0x94EE: 'zhēng,zhèng',
+    0x94EF: 'sè',
+    0x94F0: 'jiǎo',
+    0x94F1: 'yī',
+    0x94F2: 'chǎn',
+    0x94F3: 'chòng',
+    0x94F4: 'tāng',
+    0x94F5: 'ǎn',
+    0x94F6: 'yín',
+    0x94F7: 'rú',
+    0x94F8: 'zhù',
+    0x94F9: 'láo',
+    0x94FA: 'pù,pū',
+    0x94FB: 'wú,yǔ',
+    0x94FC: 'lái',
+    0x94FD: 'tè',
+    0x94FE: 'liàn',
+    0x94FF: 'kēng',
+    0x9500: 'xiāo',
+    0x9501: 'suǒ',
+    0x9502: 'lǐ',
+    0x9503: 'zèng',
+    0x9504: 'chú',
+    0x9505: 'guō',
+    0x9506: 'gào',
+    0x9507: 'é',
+    0x9508: 'xiù',
+    0x9509: 'cuò',
+    0x950A: 'lüè',
+    0x950B: 'fēng',
+    0x950C: 'xīn',
+    0x950D: 'liǔ',
+    0x950E: 'kāi',
+    0x950F: 'jiǎn,jiàn',
+    0x9510: 'ruì',
+    0x9511: 'tī',
+    0x9512: 'láng',
+    0x9513: 'qǐn',
+    0x9514: 'jū,jú',
+    0x9515: 'ā',
+    0x9516: 'qiāng',
+    0x9517: 'zhě',
+    0x9518: 'nuò',
+    0x9519: 'cuò',
+    0x951A: 'máo',
+    0x951B: 'bēn',
+    0x951C: 'qí',
+    0x951D: 'dé',
+    0x951E: 'kè',
+    0x951F: 'kūn',
+    0x9520: 'chāng',
+    0x9521: 'xī',
+    0x9522: 'gù',
+    0x9523: 'luó',
+    0x9524: 'chuí',
+    0x9525: 'zhuī',
+    0x9526: 'jǐn',
+    0x9527: 'zhì',
+    0x9528: 'xiān',
+    0x9529: 'juǎn',
+    0x952A: 'huō',
+    0x952B: 'péi',
+    0x952C: 'tán,xiān',
+    0x952D: 'dìng',
+    0x952E: 'jiàn',
+    0x952F: 'jù,jū',
+    0x9530: 'měng',
+    0x9531: 'zī',
+    0x9532: 'qiè',
+    0x9533: 'yīng',
+    0x9534: 'kǎi',
+    0x9535: 'qiāng',
+    0x9536: 'sī',
+    0x9537: 'è',
+    0x9538: 'chā',
+    0x9539: 'qiāo',
+    0x953A: 'zhōng',
+    0x953B: 'duàn',
+    0x953C: 'sōu',
+    0x953D: 'huáng',
+    0x953E: 'huán',
+    0x953F: 'āi',
+    0x9540: 'dù',
+    0x9541: 'měi',
+    0x9542: 'lòu',
+    0x9543: 'zī',
+    0x9544: 'fèi',
+    0x9545: 'méi',
+    0x9546: 'mò',
+    0x9547: 'zhèn',
+    0x9548: 'bó',
+    0x9549: 'gé',
+    0x954A: 'niè',
+    0x954B: 'tǎng',
+    0x954C: 'juān',
+    0x954D: 'niè',
+    0x954E: 'ná',
+    0x954F: 'liú,liù',
+    0x9550: 'gǎo,hào',
+    0x9551: 'bàng',
+    0x9552: 'yì',
+    0x9553: 'jiā',
+    0x9554: 'bīn',
+    0x9555: 'róng',
+    0x9556: 'biāo',
+    0x9557: 'tāng,táng',
+    0x9558: 'màn',
+    0x9559: 'luó',
+    0x955A: 'bèng',
+    0x955B: 'yōng',
+    0x955C: 'jìng',
+    0x955D: 'dī,dí',
+    0x955E: 'zú',
+    0x955F: 'xuàn',
+    0x9560: 'liú',
+    0x9561: 'chán,tán,xín',
+    0x9562: 'jué',
+    0x9563: 'liào',
+    0x9564: 'pú',
+    0x9565: 'lǔ',
+    0x9566: 'duì,dūn',
+    0x9567: 'lán',
+    0x9568: 'pǔ',
+    0x9569: 'cuān',
+    0x956A: 'qiāng,qiǎng',
+    0x956B: 'dèng',
+    0x956C: 'huò',
+    0x956D: 'léi',
+    0x956E: 'huán',
+    0x956F: 'zhuó',
+    0x9570: 'lián',
+    0x9571: 'yì',
+    0x9572: 'chǎ',
+    0x9573: 'biāo',
+    0x9574: 'là',
+    0x9575: 'chán',
+    0x9576: 'xiāng',
+    0x9577: 'zhǎng,cháng,zhàng',
+    0x9578: 'cháng',
+    0x9579: 'jiǔ',
+    0x957A: 'ǎo',
+    0x957B: 'dié',
+    0x957C: 'qū',
+    0x957D: 'liǎo,liáo',
+    0x957E: 'mí',
+    0x957F: 'zhǎng,cháng',
+    0x9580: 'mén',
+    0x9581: 'mà',
+    0x9582: 'shuān',
+    0x9583: 'shǎn',
+    0x9584: 'huò,shǎn',
+    0x9585: 'mén',
+    0x9586: 'yán',
+    0x9587: 'bì',
+    0x9588: 'hàn,bì',
+    0x9589: 'bì',
+    0x958A: 'shān',
+    0x958B: 'kāi,qiān',
+    0x958C: 'kàng',
+    0x958D: 'bēng',
+    0x958E: 'hóng',
+    0x958F: 'rùn',
+    0x9590: 'sàn',
+    0x9591: 'xián',
+    0x9592: 'xián,jiàn,jiān,jiǎn',
+    0x9593: 'jiān,jiàn,jiǎn',
+    0x9594: 'mǐn,mín',
+    0x9595: 'xiā,xiǎ',
+    0x9596: 'shui',
+    0x9597: 'dòu',
+    0x9598: 'zhá,yā,gē',
+    0x9599: 'nào',
+    0x959A: 'zhān',
+    0x959B: 'pēng,pèng',
+    0x959C: 'xiǎ,ě',
+    0x959D: 'líng',
+    0x959E: 'biàn,guān',
+    0x959F: 'bì',
+    0x95A0: 'rùn',
+    0x95A1: 'ài,hé,hài,gāi,kǎi',
+    0x95A2: 'guān',
+    0x95A3: 'gé',
+    0x95A4: 'gé,gē,hé',
+    0x95A5: 'fá',
+    0x95A6: 'chù',
+    0x95A7: 'hòng,xiàng',
+    0x95A8: 'guī',
+    0x95A9: 'mǐn',
+    0x95AA: 'sē',
+    0x95AB: 'kǔn',
+    0x95AC: 'làng,lǎng,liǎng',
+    0x95AD: 'lǘ',
+    0x95AE: 'tíng,tǐng',
+    0x95AF: 'shà',
+    0x95B0: 'jú',
+    0x95B1: 'yuè',
+    0x95B2: 'yuè',
+    0x95B3: 'chǎn',
+    0x95B4: 'qù',
+    0x95B5: 'lìn',
+    0x95B6: 'chāng,tāng',
+    0x95B7: 'shài,shā',
+    0x95B8: 'kǔn',
+    0x95B9: 'yān',
+    0x95BA: 'wén',
+    0x95BB: 'yán,yǎn,yàn',
+    0x95BC: 'è,yù,yān',
+    0x95BD: 'hūn',
+    0x95BE: 'yù',
+    0x95BF: 'wén',
+    0x95C0: 'hòng',
+    0x95C1: 'bāo',
+    0x95C2: 'hòng,xiàng,juǎn',
+    0x95C3: 'qù',
+    0x95C4: 'yǎo',
+    0x95C5: 'wén',
+    0x95C6: 'bǎn,pǎn',
+    0x95C7: 'àn,ǎn,ān,yīn,yǐn',
+    0x95C8: 'wéi',
+    0x95C9: 'yīn',
+    0x95CA: 'kuò',
+    0x95CB: 'què,jué,kuí',
+    0x95CC: 'lán,làn',
+    0x95CD: 'dū,shé',
+    0x95CE: 'quán',
+    0x95CF: 'fēng',
+    0x95D0: 'tián',
+    0x95D1: 'niè',
+    0x95D2: 'tà',
+    0x95D3: 'kǎi',
+    0x95D4: 'hé',
+    0x95D5: 'què,quē,jué',
+    0x95D6: 'chuǎng,chèn',
+    0x95D7: 'guān',
+    0x95D8: 'dòu',
+    0x95D9: 'qǐ',
+    0x95DA: 'kuī',
+    0x95DB: 'táng,tāng,chāng',
+    0x95DC: 'guān,wān,wǎn',
+    0x95DD: 'piáo',
+    0x95DE: 'kàn,hǎn,xiàn',
+    0x95DF: 'xì,sè,tà',
+    0x95E0: 'huì',
+    0x95E1: 'chǎn',
+    0x95E2: 'pì,pī',
+    0x95E3: 'dàng,tāng',
+    0x95E4: 'huán',
+    0x95E5: 'tà',
+    0x95E6: 'wén',
+    0x95E7: 'tā',
+    0x95E8: 'mén',
+    0x95E9: 'shuān',
+    0x95EA: 'shǎn',
+    0x95EB: 'yán',
+    0x95EC: 'hàn',
+    0x95ED: 'bì',
+    0x95EE: 'wèn',
+    0x95EF: 'chuǎng',
+    0x95F0: 'rùn',
+    0x95F1: 'wéi',
+    0x95F2: 'xián',
+    0x95F3: 'hóng',
+    0x95F4: 'jiān,jiàn',
+    0x95F5: 'mǐn',
+    0x95F6: 'kāng,kàng',
+    0x95F7: 'mèn,mēn',
+    0x95F8: 'zhá',
+    0x95F9: 'nào',
+    0x95FA: 'guī',
+    0x95FB: 'wén',
+    0x95FC: 'tà',
+    0x95FD: 'mǐn',
+    0x95FE: 'lǘ',
+    0x95FF: 'kǎi',
+    0x9600: 'fá',
+    0x9601: 'gé',
+    0x9602: 'hé',
+    0x9603: 'kǔn',
+    0x9604: 'jiū',
+    0x9605: 'yuè',
+    0x9606: 'láng,làng',
+    0x9607: 'dū,shé',
+    0x9608: 'yù',
+    0x9609: 'yān',
+    0x960A: 'chāng',
+    0x960B: 'xì',
+    0x960C: 'wén',
+    0x960D: 'hūn',
+    0x960E: 'yán',
+    0x960F: 'è,yān',
+    0x9610: 'chǎn',
+    0x9611: 'lán',
+    0x9612: 'qù',
+    0x9613: 'huì',
+    0x9614: 'kuò',
+    0x9615: 'què',
+    0x9616: 'hé',
+    0x9617: 'tián',
+    0x9618: 'dá,tà',
+    0x9619: 'quē,què',
+    0x961A: 'hǎn,kàn',
+    0x961B: 'huán',
+    0x961C: 'fù',
+    0x961D: 'fù',
+    0x961E: 'lè',
+    0x961F: 'duì',
+    0x9620: 'xìn',
+    0x9621: 'qiān',
+    0x9622: 'wù,wéi',
+    0x9623: 'gài,yì',
+    0x9624: 'zhì,yí,tuó',
+    0x9625: 'yīn',
+    0x9626: 'yáng',
+    0x9627: 'dǒu',
+    0x9628: 'è,ài',
+    0x9629: 'shēng',
+    0x962A: 'bǎn',
+    0x962B: 'péi',
+    0x962C: 'kēng,kàng,gāng',
+    0x962D: 'yǔn,yǎn',
+    0x962E: 'ruǎn,yuán',
+    0x962F: 'zhǐ',
+    0x9630: 'pí',
+    0x9631: 'jǐng',
+    0x9632: 'fáng',
+    0x9633: 'yáng',
+    0x9634: 'yīn',
+    0x9635: 'zhèn',
+    0x9636: 'jiē',
+    0x9637: 'chēng',
+    0x9638: 'è,ài',
+    0x9639: 'qū',
+    0x963A: 'dǐ',
+    0x963B: 'zǔ,zhù',
+    0x963C: 'zuò',
+    0x963D: 'diàn,yán',
+    0x963E: 'lǐng,líng',
+    0x963F: 'ā,ē,ě,ǎ,à,a',
+    0x9640: 'tuó,duò',
+    0x9641: 'tuó,zhì,yǐ',
+    0x9642: 'bēi,pí,bì,pō',
+    0x9643: 'bǐng',
+    0x9644: 'fù,bù,fū',
+    0x9645: 'jì',
+    0x9646: 'lù,liù',
+    0x9647: 'lǒng',
+    0x9648: 'chén',
+    0x9649: 'xíng',
+    0x964A: 'duò',
+    0x964B: 'lòu',
+    0x964C: 'mò',
+    0x964D: 'jiàng,xiáng,xiàng',
+    0x964E: 'shū',
+    0x964F: 'duò,suí',
+    0x9650: 'xiàn,wěn',
+    0x9651: 'ér',
+    0x9652: 'guǐ',
+    0x9653: 'yū',
+    0x9654: 'gāi',
+    0x9655: 'shǎn',
+    0x9656: 'jùn',
+    0x9657: 'qiào',
+    0x9658: 'xíng,jìng',
+    0x9659: 'chún',
+    0x965A: 'fù,wǔ',
+    0x965B: 'bì',
+    0x965C: 'xiá',
+    0x965D: 'shǎn',
+    0x965E: 'shēng',
+    0x965F: 'zhì,dé',
+    0x9660: 'pū,bū,bù',
+    0x9661: 'dǒu',
+    0x9662: 'yuàn',
+    0x9663: 'zhèn',
+    0x9664: 'chú,zhù,shū',
+    0x9665: 'xiàn',
+    0x9666: 'dǎo',
+    0x9667: 'niè',
+    0x9668: 'yǔn',
+    0x9669: 'xiǎn',
+    0x966A: 'péi',
+    0x966B: 'fèi,péi',
+    0x966C: 'zōu,zhé',
+    0x966D: 'yì,yǐ',
+    0x966E: 'duì',
+    0x966F: 'lún,lùn',
+    0x9670: 'yīn,yìn,ān',
+    0x9671: 'jū',
+    0x9672: 'chuí',
+    0x9673: 'chén,zhèn',
+    0x9674: 'pí,bì',
+    0x9675: 'líng',
+    0x9676: 'táo,yáo,dào',
+    0x9677: 'xiàn',
+    0x9678: 'lù,liù',
+    0x9679: 'shēng',
+    0x967A: 'xiǎn',
+    0x967B: 'yīn',
+    0x967C: 'zhǔ,dǔ',
+    0x967D: 'yáng',
+    0x967E: 'réng,ér',
+    0x967F: 'xiá',
+    0x9680: 'chóng',
+    0x9681: 'yàn,yǎn',
+    0x9682: 'yīn',
+    0x9683: 'shù,yú,yáo',
+    0x9684: 'dī,tí',
+    0x9685: 'yú',
+    0x9686: 'lóng,lōng',
+    0x9687: 'wēi',
+    0x9688: 'wēi',
+    0x9689: 'niè',
+    0x968A: 'duì,zhuì,suì',
+    0x968B: 'suí,duò,tuǒ,tuō',
+    0x968C: 'ǎn',
+    0x968D: 'huáng',
+    0x968E: 'jiē',
+    0x968F: 'suí',
+    0x9690: 'yǐn',
+    0x9691: 'gài,gāi,ái,qí',
+    0x9692: 'yǎn',
+    0x9693: 'huī,duò',
+    0x9694: 'gé,rǒng,jī',
+    0x9695: 'yǔn,yuán',
+    0x9696: 'wù',
+    0x9697: 'kuí,wěi,guī',
+    0x9698: 'ài,è',
+    0x9699: 'xì',
+    0x969A: 'táng',
+    0x969B: 'jì',
+    0x969C: 'zhàng,zhāng',
+    0x969D: 'dǎo',
+    0x969E: 'áo',
+    0x969F: 'xì',
+    0x96A0: 'yǐn',
+    0x96A1: 'sà',
+    0x96A2: 'rǎo',
+    0x96A3: 'lín',
+    0x96A4: 'tuí',
+    0x96A5: 'dèng',
+    0x96A6: 'jiǎo,pí',
+    0x96A7: 'suì,zhuì',
+    0x96A8: 'suí',
+    0x96A9: 'ào,yù',
+    0x96AA: 'xiǎn,jiǎn,yán',
+    0x96AB: 'fén',
+    0x96AC: 'nǐ',
+    0x96AD: 'ér',
+    0x96AE: 'jī',
+    0x96AF: 'dǎo',
+    0x96B0: 'xí,xiè',
+    0x96B1: 'yǐn,yìn',
+    0x96B2: 'zhì',
+    0x96B3: 'huī',
+    0x96B4: 'lǒng',
+    0x96B5: 'xī',
+    0x96B6: 'lì,dài,yì,dì',
+    0x96B7: 'lì',
+    0x96B8: 'lì',
+    0x96B9: 'zhuī,cuī,wéi',
+    0x96BA: 'hú,hè,què',
+    0x96BB: 'zhī,huò',
+    0x96BC: 'sǔn',
+    0x96BD: 'juàn,jùn',
+    0x96BE: 'nán,nàn',
+    0x96BF: 'yì',
+    0x96C0: 'què,qiāo,qiǎo',
+    0x96C1: 'yàn',
+    0x96C2: 'qín',
+    0x96C3: 'qiān,jiè',
+    0x96C4: 'xióng',
+    0x96C5: 'yǎ,yā,yá',
+    0x96C6: 'jí',
+    0x96C7: 'gù,hù',
+    0x96C8: 'huán',
+    0x96C9: 'zhì,kǎi,yǐ,sì',
+    0x96CA: 'gòu',
+    0x96CB: 'juàn,jùn,zuì',
+    0x96CC: 'cí',
+    0x96CD: 'yōng',
+    0x96CE: 'jū',
+    0x96CF: 'chú',
+    0x96D0: 'hū',
+    0x96D1: 'zá',
+    0x96D2: 'luò',
+    0x96D3: 'yú',
+    0x96D4: 'chóu',
+    0x96D5: 'diāo',
+    0x96D6: 'suī',
+    0x96D7: 'hàn',
+    0x96D8: 'wò',
+    0x96D9: 'shuāng',
+    0x96DA: 'guàn,huán',
+    0x96DB: 'chú,jú,jù',
+    0x96DC: 'zá',
+    0x96DD: 'yōng',
+    0x96DE: 'jī',
+    0x96DF: 'xī',
+    0x96E0: 'chóu',
+    0x96E1: 'liù',
+    0x96E2: 'lí,lì,lǐ,chī,gǔ',
+    0x96E3: 'nán,nàn,nuó',
+    0x96E4: 'xué',
+    0x96E5: 'zá',
+    0x96E6: 'jí',
+    0x96E7: 'jí',
+    0x96E8: 'yǔ,yù',
+    0x96E9: 'yú,yù,xū',
+    0x96EA: 'xuě',
+    0x96EB: 'nǎ',
+    0x96EC: 'fǒu',
+    0x96ED: 'sè,xí',
+    0x96EE: 'mù',
+    0x96EF: 'wén',
+    0x96F0: 'fēn',
+    0x96F1: 'pāng,páng,fāng',
+    0x96F2: 'yún',
+    0x96F3: 'lì',
+    0x96F4: 'chì',
+    0x96F5: 'yāng',
+    0x96F6: 'líng,lián',
+    0x96F7: 'léi,lèi',
+    0x96F8: 'án',
+    0x96F9: 'báo',
+    0x96FA: 'wù,méng',
+    0x96FB: 'diàn',
+    0x96FC: 'dàng',
+    0x96FD: 'hù,hū',
+    0x96FE: 'wù',
+    0x96FF: 'diào',
+    0x9700: 'xū,nuò,rú,ruǎn',
+    0x9701: 'jì',
+    0x9702: 'mù',
+    0x9703: 'chén',
+    0x9704: 'xiāo,xiào',
+    0x9705: 'zhà,zhá,shà,sà,yì',
+    0x9706: 'tíng',
+    0x9707: 'zhèn,shēn',
+    0x9708: 'pèi',
+    0x9709: 'méi',
+    0x970A: 'líng',
+    0x970B: 'qī',
+    0x970C: 'zhōu',
+    0x970D: 'huò,hè,suǒ',
+    0x970E: 'shà',
+    0x970F: 'fēi',
+    0x9710: 'hóng',
+    0x9711: 'zhān',
+    0x9712: 'yīn',
+    0x9713: 'ní',
+    0x9714: 'zhù',
+    0x9715: 'tún',
+    0x9716: 'lín',
+    0x9717: 'líng',
+    0x9718: 'dòng',
+    0x9719: 'yīng,yāng',
+    0x971A: 'wù',
+    0x971B: 'líng',
+    0x971C: 'shuāng',
+    0x971D: 'líng',
+    0x971E: 'xiá',
+    0x971F: 'hóng',
+    0x9720: 'yīn',
+    0x9721: 'mài',
+    0x9722: 'mài',
+    0x9723: 'yǔn',
+    0x9724: 'liù',
+    0x9725: 'mèng',
+    0x9726: 'bīn',
+    0x9727: 'wù,méng',
+    0x9728: 'wèi',
+    0x9729: 'kuò',
+    0x972A: 'yín',
+    0x972B: 'xí',
+    0x972C: 'yì',
+    0x972D: 'ǎi',
+    0x972E: 'dàn',
+    0x972F: 'tèng',
+    0x9730: 'sǎn,xiàn',
+    0x9731: 'yù',
+    0x9732: 'lù,lòu',
+    0x9733: 'lóng',
+    0x9734: 'dài',
+    0x9735: 'jí',
+    0x9736: 'pāng',
+    0x9737: 'yáng',
+    0x9738: 'bà,pò',
+    0x9739: 'pī',
+    0x973A: 'wéi',
+    0x973B: 'fēng',
+    0x973C: 'xì',
+    0x973D: 'jì',
+    0x973E: 'mái,lí',
+    0x973F: 'méng,mào,wù',
+    0x9740: 'méng',
+    0x9741: 'léi',
+    0x9742: 'lì',
+    0x9743: 'huò,suǐ,suǒ',
+    0x9744: 'ǎi',
+    0x9745: 'fèi',
+    0x9746: 'dài',
+    0x9747: 'lóng,líng',
+    0x9748: 'líng',
+    0x9749: 'ài,yǐ',
+    0x974A: 'fēng',
+    0x974B: 'lì',
+    0x974C: 'bǎo',
+    0x974D: 'hè',
+    0x974E: 'hè',
+    0x974F: 'hè',
+    0x9750: 'bìng',
+    0x9751: 'qīng',
+    0x9752: 'qīng,jīng',
+    0x9753: 'jìng,liàng',
+    0x9754: 'tiān',
+    0x9755: 'zhēn',
+    0x9756: 'jìng',
+    0x9757: 'chēng',
+    0x9758: 'qìng,qīng,jìng',
+    0x9759: 'jìng',
+    0x975A: 'jìng,liáng',
+    0x975B: 'diàn',
+    0x975C: 'jìng',
+    0x975D: 'tiān',
+    0x975E: 'fēi,fěi',
+    0x975F: 'fēi',
+    0x9760: 'kào',
+    0x9761: 'mí,mǐ,má',
+    0x9762: 'miàn',
+    0x9763: 'miàn',
+    0x9764: 'bào',
+    0x9765: 'yè',
+    0x9766: 'tiǎn,miǎn',
+    0x9767: 'huì',
+    0x9768: 'yè,yǎn',
+    0x9769: 'gé,jí',
+    0x976A: 'dīng',
+    0x976B: 'chá',
+    0x976C: 'qián,jiān,kān,hàn',
+    0x976D: 'rèn',
+    0x976E: 'dí',
+    0x976F: 'dù',
+    0x9770: 'wù',
+    0x9771: 'rèn',
+    0x9772: 'qín',
+    0x9773: 'jìn',
+    0x9774: 'xuē',
+    0x9775: 'niǔ',
+    0x9776: 'bǎ,bà',
+    0x9777: 'yǐn',
+    0x9778: 'sǎ,tā',
+    0x9779: 'nà',
+    0x977A: 'mò,wà',
+    0x977B: 'zǔ',
+    0x977C: 'dá',
+    0x977D: 'bàn',
+    0x977E: 'yì',
+    0x977F: 'yào',
+    0x9780: 'táo',
+    0x9781: 'bèi,bài,bì',
+    0x9782: 'jiē',
+    0x9783: 'hóng',
+    0x9784: 'páo',
+    0x9785: 'yāng,yàng,yǎng',
+    0x9786: 'bǐng',
+    0x9787: 'yīn',
+    0x9788: 'gé,sǎ,tà',
+    0x9789: 'táo',
+    0x978A: 'jié,jí',
+    0x978B: 'xié,wā',
+    0x978C: 'ān',
+    0x978D: 'ān',
+    0x978E: 'hén',
+    0x978F: 'gǒng',
+    0x9790: 'qiǎ',
+    0x9791: 'dá',
+    0x9792: 'qiáo',
+    0x9793: 'tīng',
+    0x9794: 'mán,mèn',
+    0x9795: 'yìng,biān',
+    0x9796: 'suī',
+    0x9797: 'tiáo',
+    0x9798: 'qiào,shāo',
+    0x9799: 'xuàn,juān',
+    0x979A: 'kòng',
+    0x979B: 'běng',
+    0x979C: 'tà',
+    0x979D: 'shàng,zhǎng',
+    0x979E: 'bǐng,bì,pí,bēi',
+    0x979F: 'kuò',
+    0x97A0: 'jū,qū,qiōng',
+    0x97A1: 'la',
+    0x97A2: 'xiè,zhá,dié',
+    0x97A3: 'róu',
+    0x97A4: 'bāng',
+    0x97A5: 'ēng',
+    0x97A6: 'qiū',
+    0x97A7: 'qiū',
+    0x97A8: 'hé,shé,mò',
+    0x97A9: 'qiào',
+    0x97AA: 'mù,móu',
+    0x97AB: 'jū,qū',
+    0x97AC: 'jiān,jiàn',
+    0x97AD: 'biān',
+    0x97AE: 'dī',
+    0x97AF: 'jiān',
+    0x97B0: 'wēn',
+    0x97B1: 'tāo',
+    0x97B2: 'gōu',
+    0x97B3: 'tà',
+    0x97B4: 'bèi,fú,bù,bài',
+    0x97B5: 'xié',
+    0x97B6: 'pán',
+    0x97B7: 'gé',
+    0x97B8: 'bì,bǐng',
+    0x97B9: 'kuò',
+    0x97BA: 'tāng',
+    0x97BB: 'lóu',
+    0x97BC: 'guì,huì',
+    0x97BD: 'qiáo,qiāo,juē',
+    0x97BE: 'xuē',
+    0x97BF: 'jī',
+    0x97C0: 'jiān',
+    0x97C1: 'jiāng',
+    0x97C2: 'chàn',
+    0x97C3: 'dá,tà',
+    0x97C4: 'hù',
+    0x97C5: 'xiǎn',
+    0x97C6: 'qiān',
+    0x97C7: 'dú',
+    0x97C8: 'wà',
+    0x97C9: 'jiān',
+    0x97CA: 'lán',
+    0x97CB: 'wéi,huí',
+    0x97CC: 'rèn',
+    0x97CD: 'fú',
+    0x97CE: 'mèi',
+    0x97CF: 'quàn,juàn',
+    0x97D0: 'gé',
+    0x97D1: 'wěi',
+    0x97D2: 'qiào,shāo',
+    0x97D3: 'hán',
+    0x97D4: 'chàng',
+    0x97D5: 'kuò',
+    0x97D6: 'rǒu',
+    0x97D7: 'yùn',
+    0x97D8: 'shè',
+    0x97D9: 'wěi',
+    0x97DA: 'gé',
+    0x97DB: 'bài,fú',
+    0x97DC: 'tāo,tào',
+    0x97DD: 'gōu',
+    0x97DE: 'yùn,wēn',
+    0x97DF: 'gāo',
+    0x97E0: 'bì',
+    0x97E1: 'wěi,xuē',
+    0x97E2: 'suì,huì',
+    0x97E3: 'dú',
+    0x97E4: 'wà',
+    0x97E5: 'dú',
+    0x97E6: 'wéi',
+    0x97E7: 'rèn',
+    0x97E8: 'fú',
+    0x97E9: 'hán',
+    0x97EA: 'wěi',
+    0x97EB: 'yùn',
+    0x97EC: 'tāo',
+    0x97ED: 'jiǔ',
+    0x97EE: 'jiǔ',
+    0x97EF: 'xiān',
+    0x97F0: 'xiè',
+    0x97F1: 'xiān',
+    0x97F2: 'jī',
+    0x97F3: 'yīn',
+    0x97F4: 'zá',
+    0x97F5: 'yùn',
+    0x97F6: 'sháo',
+    0x97F7: 'lè',
+    0x97F8: 'péng',
+    0x97F9: 'huáng,yīng',
+    0x97FA: 'yīng',
+    0x97FB: 'yùn',
+    0x97FC: 'péng',
+    0x97FD: 'ān',
+    0x97FE: 'yīn',
+    0x97FF: 'xiǎng',
+    0x9800: 'hù',
+    0x9801: 'yè,xié',
+    0x9802: 'dǐng',
+    0x9803: 'qǐng,qīng,kuǐ',
+    0x9804: 'kuí',
+    0x9805: 'xiàng',
+    0x9806: 'shùn',
+    0x9807: 'hān,àn',
+    0x9808: 'xū',
+    0x9809: 'yí',
+    0x980A: 'xū',
+    0x980B: 'ě',
+    0x980C: 'sòng,róng',
+    0x980D: 'kuǐ',
+    0x980E: 'qí,kěn',
+    0x980F: 'háng,gāng,hàng',
+    0x9810: 'yù',
+    0x9811: 'wán,kūn',
+    0x9812: 'bān,fén',
+    0x9813: 'dùn,dú',
+    0x9814: 'dí',
+    0x9815: 'dān,diàn',
+    0x9816: 'pàn',
+    0x9817: 'pō,pǒ,pò,pí',
+    0x9818: 'lǐng',
+    0x9819: 'chè',
+    0x981A: 'jǐng',
+    0x981B: 'lèi',
+    0x981C: 'hé,hán,qīn,gé',
+    0x981D: 'qiāo',
+    0x981E: 'è,àn',
+    0x981F: 'é',
+    0x9820: 'wěi',
+    0x9821: 'xié,jiá,jié',
+    0x9822: 'kuò',
+    0x9823: 'shěn',
+    0x9824: 'yí',
+    0x9825: 'yí',
+    0x9826: 'hái,kē,ké',
+    0x9827: 'duǐ,duī',
+    0x9828: 'yǔ,biàn',
+    0x9829: 'pīng,pǐng',
+    0x982A: 'lèi',
+    0x982B: 'fǔ,tāo,tiào',
+    0x982C: 'jiá',
+    0x982D: 'tóu,tou',
+    0x982E: 'huì',
+    0x982F: 'kuí',
+    0x9830: 'jiá',
+    0x9831: 'luō',
+    0x9832: 'tǐng',
+    0x9833: 'chēng',
+    0x9834: 'yǐng,jǐng',
+    0x9835: 'yūn',
+    0x9836: 'hú',
+    0x9837: 'hàn',
+    0x9838: 'jǐng,gěng',
+    0x9839: 'tuí',
+    0x983A: 'tuí',
+    0x983B: 'pín,bīn',
+    0x983C: 'lài',
+    0x983D: 'tuí',
+    0x983E: 'zī',
+    0x983F: 'zī',
+    0x9840: 'chuí',
+    0x9841: 'dìng,dǐng',
+    0x9842: 'lài,lái',
+    0x9843: 'tán,shǎn',
+    0x9844: 'hàn',
+    0x9845: 'qiān',
+    0x9846: 'kē,kě,kuǎn',
+    0x9847: 'cuì,zú',
+    0x9848: 'xuǎn,jiōng,jiǒng,xiàn',
+    0x9849: 'qīn',
+    0x984A: 'yí',
+    0x984B: 'sāi',
+    0x984C: 'tí,dì',
+    0x984D: 'é',
+    0x984E: 'è',
+    0x984F: 'yán',
+    0x9850: 'wèn,hún,hùn',
+    0x9851: 'kǎn,yàn',
+    0x9852: 'yóng,yú',
+    0x9853: 'zhuān',
+    0x9854: 'yán,yá',
+    0x9855: 'xiǎn',
+    0x9856: 'xìn',
+    0x9857: 'yǐ',
+    0x9858: 'yuàn,yuǎn',
+    0x9859: 'sǎng',
+    0x985A: 'diān,tián,tiàn',
+    0x985B: 'diān',
+    0x985C: 'jiǎng',
+    0x985D: 'kuī,kuǎ',
+    0x985E: 'lèi',
+    0x985F: 'láo',
+    0x9860: 'piǎo',
+    0x9861: 'wài,zhuài',
+    0x9862: 'mán',
+    0x9863: 'cù',
+    0x9864: 'yáo,qiào',
+    0x9865: 'hào',
+    0x9866: 'qiáo',
+    0x9867: 'gù',
+    0x9868: 'xùn',
+    0x9869: 'yǎn,qìn,hàn,qiǎn',
+    0x986A: 'huì',
+    0x986B: 'chàn,zhàn,shān',
+    0x986C: 'rú',
+    0x986D: 'méng',
+    0x986E: 'bīn',
+    0x986F: 'xiǎn,xiàn',
+    0x9870: 'pín',
+    0x9871: 'lú',
+    0x9872: 'lǎn,lǐn',
+    0x9873: 'niè',
+    0x9874: 'quán',
+    0x9875: 'yè',
+    0x9876: 'dǐng',
+    0x9877: 'qǐng',
+    0x9878: 'hān',
+    0x9879: 'xiàng',
+    0x987A: 'shùn',
+    0x987B: 'xū',
+    0x987C: 'xū',
+    0x987D: 'wán',
+    0x987E: 'gù',
+    0x987F: 'dùn,dú',
+    0x9880: 'qí',
+    0x9881: 'bān',
+    0x9882: 'sòng',
+    0x9883: 'háng',
+    0x9884: 'yù',
+    0x9885: 'lú',
+    0x9886: 'lǐng',
+    0x9887: 'pǒ,pō',
+    0x9888: 'jǐng,gěng',
+    0x9889: 'jié,xié',
+    0x988A: 'jiá',
+    0x988B: 'tǐng',
+    0x988C: 'hé,gé',
+    0x988D: 'yǐng',
+    0x988E: 'jiǒng',
+    0x988F: 'kē,ké',
+    0x9890: 'yí',
+    0x9891: 'pín',
+    0x9892: 'huì',
+    0x9893: 'tuí',
+    0x9894: 'hàn',
+    0x9895: 'yǐng',
+    0x9896: 'yǐng',
+    0x9897: 'kē',
+    0x9898: 'tí',
+    0x9899: 'yóng',
+    0x989A: 'è',
+    0x989B: 'zhuān',
+    0x989C: 'yán',
+    0x989D: 'é',
+    0x989E: 'niè',
+    0x989F: 'mān',
+    0x98A0: 'diān',
+    0x98A1: 'sǎng',
+    0x98A2: 'hào',
+    0x98A3: 'lèi',
+    0x98A4: 'chàn,zhàn',
+    0x98A5: 'rú',
+    0x98A6: 'pín',
+    0x98A7: 'quán',
+    0x98A8: 'fēng,fèng,fěng',
+    0x98A9: 'biāo,diū',
+    0x98AA: 'guā',
+    0x98AB: 'fú',
+    0x98AC: 'xiā',
+    0x98AD: 'zhǎn',
+    0x98AE: 'biāo,páo',
+    0x98AF: 'sà,lì',
+    0x98B0: 'bá,fú',
+    0x98B1: 'tái',
+    0x98B2: 'liè',
+    0x98B3: 'guā,jǐ',
+    0x98B4: 'xuàn',
+    0x98B5: 'shāo,xiāo',
+    0x98B6: 'jù',
+    0x98B7: 'biāo',
+    0x98B8: 'sī',
+    0x98B9: 'wěi',
+    0x98BA: 'yáng',
+    0x98BB: 'yáo,yào',
+    0x98BC: 'sōu',
+    0x98BD: 'kǎi',
+    0x98BE: 'sōu,sāo',
+    0x98BF: 'fān',
+    0x98C0: 'liú',
+    0x98C1: 'xí',
+    0x98C2: 'liù,liáo',
+    0x98C3: 'piāo,piào',
+    0x98C4: 'piāo',
+    0x98C5: 'liú',
+    0x98C6: 'biāo',
+    0x98C7: 'biāo',
+    0x98C8: 'biāo',
+    0x98C9: 'liáo',
+    0x98CA: 'biāo',
+    0x98CB: 'sè',
+    0x98CC: 'fēng',
+    0x98CD: 'xiū',
+    0x98CE: 'fēng',
+    0x98CF: 'yáng',
+    0x98D0: 'zhǎn',
+    0x98D1: 'biāo',
+    0x98D2: 'sà',
+    0x98D3: 'jù',
+    0x98D4: 'sī',
+    0x98D5: 'sōu',
+    0x98D6: 'yáo',
+    0x98D7: 'liú',
+    0x98D8: 'piāo',
+    0x98D9: 'biāo',
+    0x98DA: 'biāo',
+    0x98DB: 'fēi',
+    0x98DC: 'fān',
+    0x98DD: 'fēi',
+    0x98DE: 'fēi',
+    0x98DF: 'shí,sì,yì',
+    0x98E0: 'shí',
+    0x98E1: 'cān',
+    0x98E2: 'jī',
+    0x98E3: 'dìng',
+    0x98E4: 'sì',
+    0x98E5: 'tuō',
+    0x98E6: 'zhān,gān',
+    0x98E7: 'sūn',
+    0x98E8: 'xiǎng',
+    0x98E9: 'tún,zhùn',
+    0x98EA: 'rèn',
+    0x98EB: 'yù',
+    0x98EC: 'juàn,yǒng',
+    0x98ED: 'chì,shì',
+    0x98EE: 'yǐn',
+    0x98EF: 'fàn',
+    0x98F0: 'fàn',
+    0x98F1: 'sūn,cān',
+    0x98F2: 'yǐn,yìn',
+    0x98F3: 'tǒu,zhù',
+    0x98F4: 'yí,sì',
+    0x98F5: 'zuò,zé',
+    0x98F6: 'bì',
+    0x98F7: 'jiě',
+    0x98F8: 'tāo',
+    0x98F9: 'bǎo',
+    0x98FA: 'cí',
+    0x98FB: 'tiè',
+    0x98FC: 'sì',
+    0x98FD: 'bǎo',
+    0x98FE: 'shì,chì',
+    0x98FF: 'duò',
+    0x9900: 'hài',
+    0x9901: 'rèn',
+    0x9902: 'tiǎn,tián',
+    0x9903: 'jiǎo,jiào',
+    0x9904: 'jiá,hé',
+    0x9905: 'bǐng',
+    0x9906: 'yáo',
+    0x9907: 'tóng',
+    0x9908: 'cí',
+    0x9909: 'xiǎng',
+    0x990A: 'yǎng,yàng',
+    0x990B: 'juàn',
+    0x990C: 'ěr',
+    0x990D: 'yàn',
+    0x990E: 'le',
+    0x990F: 'xī',
+    0x9910: 'cān,sūn',
+    0x9911: 'bō',
+    0x9912: 'něi',
+    0x9913: 'è',
+    0x9914: 'bù,bū',
+    0x9915: 'jùn',
+    0x9916: 'dòu',
+    0x9917: 'sù',
+    0x9918: 'yú,yé',
+    0x9919: 'shì,xī',
+    0x991A: 'yáo',
+    0x991B: 'hún,kūn',
+    0x991C: 'guǒ',
+    0x991D: 'shì',
+    0x991E: 'jiàn',
+    0x991F: 'zhuì',
+    0x9920: 'bǐng',
+    0x9921: 'xiàn,kàn',
+    0x9922: 'bù',
+    0x9923: 'yè',
+    0x9924: 'tán,dàn',
+    0x9925: 'fēi',
+    0x9926: 'zhāng',
+    0x9927: 'wèi,něi',
+    0x9928: 'guǎn',
+    0x9929: 'è',
+    0x992A: 'nuǎn,nuàn',
+    0x992B: 'yùn,hún',
+    0x992C: 'hú',
+    0x992D: 'huáng',
+    0x992E: 'tiè',
+    0x992F: 'huì',
+    0x9930: 'jiān,zhān',
+    0x9931: 'hóu',
+    0x9932: 'ài,hé',
+    0x9933: 'táng,xíng',
+    0x9934: 'fēn',
+    0x9935: 'wèi',
+    0x9936: 'gǔ',
+    0x9937: 'chā',
+    0x9938: 'sòng',
+    0x9939: 'táng',
+    0x993A: 'bó',
+    0x993B: 'gāo',
+    0x993C: 'xì',
+    0x993D: 'kuì',
+    0x993E: 'liù,liú',
+    0x993F: 'sōu',
+    0x9940: 'táo,tāo,xiàn',
+    0x9941: 'yè',
+    0x9942: 'wēn',
+    0x9943: 'mó',
+    0x9944: 'táng',
+    0x9945: 'mán',
+    0x9946: 'bì',
+    0x9947: 'yù',
+    0x9948: 'xiū',
+    0x9949: 'jǐn',
+    0x994A: 'sǎn',
+    0x994B: 'kuì,tuí',
+    0x994C: 'zhuàn,xuǎn',
+    0x994D: 'shàn',
+    0x994E: 'chì',
+    0x994F: 'dàn',
+    0x9950: 'yì,yē,èn',
+    0x9951: 'jī,qí',
+    0x9952: 'ráo',
+    0x9953: 'chēng',
+    0x9954: 'yōng',
+    0x9955: 'tāo',
+    0x9956: 'wèi',
+    0x9957: 'xiǎng',
+    0x9958: 'zhān',
+    0x9959: 'fēn',
+    0x995A: 'hài',
+    0x995B: 'méng',
+    0x995C: 'yàn',
+    0x995D: 'mó',
+    0x995E: 'chán',
+    0x995F: 'xiǎng',
+    0x9960: 'luó',
+    0x9961: 'zàn',
+    0x9962: 'náng,nǎng',
+    0x9963: 'shí',
+    0x9964: 'dìng',
+    0x9965: 'jī',
+    0x9966: 'tuō',
+    0x9967: 'táng,xíng',
+    0x9968: 'tún',
+    0x9969: 'xì',
+    0x996A: 'rèn',
+    0x996B: 'yù',
+    0x996C: 'chì',
+    0x996D: 'fàn',
+    0x996E: 'yǐn,yìn',
+    0x996F: 'jiàn',
+    0x9970: 'shì',
+    0x9971: 'bǎo',
+    0x9972: 'sì',
+    0x9973: 'duò',
+    0x9974: 'yí',
+    0x9975: 'ěr',
+    0x9976: 'ráo',
+    0x9977: 'xiǎng',
+    0x9978: 'hé',
+    0x9979: 'le,gē',
+    0x997A: 'jiǎo',
+    0x997B: 'xī',
+    0x997C: 'bǐng',
+    0x997D: 'bō',
+    0x997E: 'dòu',
+    0x997F: 'è',
+    0x9980: 'yú',
+    0x9981: 'něi',
+    0x9982: 'jùn',
+    0x9983: 'guǒ',
+    0x9984: 'hún',
+    0x9985: 'xiàn',
+    0x9986: 'guǎn',
+    0x9987: 'chā,zha',
+    0x9988: 'kuì',
+    0x9989: 'gǔ',
+    0x998A: 'sōu',
+    0x998B: 'chán',
+    0x998C: 'yè',
+    0x998D: 'mó',
+    0x998E: 'bó',
+    0x998F: 'liú,liù',
+    0x9990: 'xiū',
+    0x9991: 'jǐn',
+    0x9992: 'mán',
+    0x9993: 'sǎn',
+    0x9994: 'zhuàn',
+    0x9995: 'náng,nǎng',
+    0x9996: 'shǒu',
+    0x9997: 'kuí,qiú',
+    0x9998: 'guó,xù',
+    0x9999: 'xiāng',
+    0x999A: 'fén',
+    0x999B: 'bó',
+    0x999C: 'nǐ',
+    0x999D: 'bì',
+    0x999E: 'bó,pò',
+    0x999F: 'tú',
+    0x99A0: 'hān',
+    0x99A1: 'fēi',
+    0x99A2: 'jiān',
+    0x99A3: 'ān',
+    0x99A4: 'ài',
+    0x99A5: 'fù,bì',
+    0x99A6: 'xiān',
+    0x99A7: 'yūn,wò',
+    0x99A8: 'xīn',
+    0x99A9: 'fén',
+    0x99AA: 'pīn',
+    0x99AB: 'xīn',
+    0x99AC: 'mǎ',
+    0x99AD: 'yù',
+    0x99AE: 'féng,píng',
+    0x99AF: 'hàn,qián,hán',
+    0x99B0: 'dí',
+    0x99B1: 'tuó,duò,dài',
+    0x99B2: 'zhé,tuō',
+    0x99B3: 'chí',
+    0x99B4: 'xún',
+    0x99B5: 'zhù',
+    0x99B6: 'zhī,shì',
+    0x99B7: 'pèi',
+    0x99B8: 'xìn,jìn',
+    0x99B9: 'rì',
+    0x99BA: 'sà',
+    0x99BB: 'yǔn',
+    0x99BC: 'wén',
+    0x99BD: 'zhí',
+    0x99BE: 'dàn,dǎn',
+    0x99BF: 'lǘ',
+    0x99C0: 'yóu',
+    0x99C1: 'bó',
+    0x99C2: 'bǎo',
+    0x99C3: 'jué,kuài',
+    0x99C4: 'tuó',
+    0x99C5: 'yì',
+    0x99C6: 'qū',
+    0x99C7: 'wén',
+    0x99C8: 'qū',
+    0x99C9: 'jiōng',
+    0x99CA: 'pǒ',
+    0x99CB: 'zhāo',
+    0x99CC: 'yuān',
+    0x99CD: 'péi,pēng',
+    0x99CE: 'zhòu',
+    0x99CF: 'jù',
+    0x99D0: 'zhù',
+    0x99D1: 'nú',
+    0x99D2: 'jū,jù',
+    0x99D3: 'pī',
+    0x99D4: 'zǎng,zù,zǔ',
+    0x99D5: 'jià,jiā',
+    0x99D6: 'líng',
+    0x99D7: 'zhěn',
+    0x99D8: 'tái,dài,zhài,tāi',
+    0x99D9: 'fù',
+    0x99DA: 'yǎng',
+    0x99DB: 'shǐ',
+    0x99DC: 'bì',
+    0x99DD: 'tuó',
+    0x99DE: 'tuó',
+    0x99DF: 'sì',
+    0x99E0: 'liú',
+    0x99E1: 'mà',
+    0x99E2: 'pián',
+    0x99E3: 'táo',
+    0x99E4: 'zhì',
+    0x99E5: 'róng',
+    0x99E6: 'téng',
+    0x99E7: 'dòng',
+    0x99E8: 'xūn,xuàn',
+    0x99E9: 'quān',
+    0x99EA: 'shēn',
+    0x99EB: 'jiōng',
+    0x99EC: 'ěr',
+    0x99ED: 'hài',
+    0x99EE: 'bó',
+    0x99EF: 'zhū',
+    0x99F0: 'yīn',
+    0x99F1: 'luò,jià',
+    0x99F2: 'zhōu',
+    0x99F3: 'dàn',
+    0x99F4: 'hài',
+    0x99F5: 'liú',
+    0x99F6: 'jú',
+    0x99F7: 'sǒng',
+    0x99F8: 'qīn',
+    0x99F9: 'máng',
+    0x99FA: 'láng,liáng',
+    0x99FB: 'hàn',
+    0x99FC: 'tú',
+    0x99FD: 'xuān',
+    0x99FE: 'tuì',
+    0x99FF: 'jùn',
+    0x9A00: 'ě,é',
+    0x9A01: 'chěng',
+    0x9A02: 'xīng',
+    0x9A03: 'ái,sì,tǎi',
+    0x9A04: 'lù',
+    0x9A05: 'zhuī',
+    0x9A06: 'zhōu,dòng',
+    0x9A07: 'shè',
+    0x9A08: 'pián',
+    0x9A09: 'kūn',
+    0x9A0A: 'táo',
+    0x9A0B: 'lái',
+    0x9A0C: 'zōng',
+    0x9A0D: 'kè',
+    0x9A0E: 'qí,jì',
+    0x9A0F: 'qí',
+    0x9A10: 'yàn',
+    0x9A11: 'fēi',
+    0x9A12: 'sāo',
+    0x9A13: 'yàn',
+    0x9A14: 'gé',
+    0x9A15: 'yǎo',
+    0x9A16: 'wù',
+    0x9A17: 'piàn',
+    0x9A18: 'cōng',
+    0x9A19: 'piàn',
+    0x9A1A: 'qián',
+    0x9A1B: 'fēi',
+    0x9A1C: 'huáng',
+    0x9A1D: 'qián',
+    0x9A1E: 'huō',
+    0x9A1F: 'yú',
+    0x9A20: 'tí',
+    0x9A21: 'quán',
+    0x9A22: 'xiá',
+    0x9A23: 'zōng',
+    0x9A24: 'kuí,jué',
+    0x9A25: 'róu',
+    0x9A26: 'sī',
+    0x9A27: 'guā',
+    0x9A28: 'tuó',
+    0x9A29: 'guī,tuí',
+    0x9A2A: 'sōu',
+    0x9A2B: 'qiān,jiǎn',
+    0x9A2C: 'chéng',
+    0x9A2D: 'zhì',
+    0x9A2E: 'liú',
+    0x9A2F: 'péng,bǎng',
+    0x9A30: 'téng',
+    0x9A31: 'xí',
+    0x9A32: 'cǎo',
+    0x9A33: 'dú',
+    0x9A34: 'yàn',
+    0x9A35: 'yuán',
+    0x9A36: 'zōu,zhū,zhòu,qū',
+    0x9A37: 'sāo,sǎo,xiāo',
+    0x9A38: 'shàn',
+    0x9A39: 'qí',
+    0x9A3A: 'zhì,chì',
+    0x9A3B: 'shuāng',
+    0x9A3C: 'lù',
+    0x9A3D: 'xí',
+    0x9A3E: 'luó',
+    0x9A3F: 'zhāng',
+    0x9A40: 'mò,mà',
+    0x9A41: 'ào,yào',
+    0x9A42: 'cān',
+    0x9A43: 'biāo,piào',
+    0x9A44: 'cōng',
+    0x9A45: 'qū',
+    0x9A46: 'bì',
+    0x9A47: 'zhì',
+    0x9A48: 'yù',
+    0x9A49: 'xū',
+    0x9A4A: 'huá',
+    0x9A4B: 'bō',
+    0x9A4C: 'sù',
+    0x9A4D: 'xiāo',
+    0x9A4E: 'lín',
+    0x9A4F: 'zhàn',
+    0x9A50: 'dūn',
+    0x9A51: 'liú',
+    0x9A52: 'tuó',
+    0x9A53: 'céng',
+    0x9A54: 'diàn',
+    0x9A55: 'jiāo,xiāo,jū,qiáo',
+    0x9A56: 'tiě',
+    0x9A57: 'yàn',
+    0x9A58: 'luó',
+    0x9A59: 'zhān,zhàn',
+    0x9A5A: 'jīng',
+    0x9A5B: 'yì',
+    0x9A5C: 'yè',
+    0x9A5D: 'tuō',
+    0x9A5E: 'pīn',
+    0x9A5F: 'zhòu',
+    0x9A60: 'yàn',
+    0x9A61: 'lóng,zǎng',
+    0x9A62: 'lǘ',
+    0x9A63: 'téng',
+    0x9A64: 'xiāng',
+    0x9A65: 'jì',
+    0x9A66: 'shuāng',
+    0x9A67: 'jú',
+    0x9A68: 'xí',
+    0x9A69: 'huān',
+    0x9A6A: 'lí,chí',
+    0x9A6B: 'biāo,piāo',
+    0x9A6C: 'mǎ',
+    0x9A6D: 'yù',
+    0x9A6E: 'tuó,duò',
+    0x9A6F: 'xùn,xún',
+    0x9A70: 'chí',
+    0x9A71: 'qū',
+    0x9A72: 'rì',
+    0x9A73: 'bó',
+    0x9A74: 'lǘ',
+    0x9A75: 'zǎng',
+    0x9A76: 'shǐ',
+    0x9A77: 'sì',
+    0x9A78: 'fù',
+    0x9A79: 'jū',
+    0x9A7A: 'zōu',
+    0x9A7B: 'zhù',
+    0x9A7C: 'tuó',
+    0x9A7D: 'nú',
+    0x9A7E: 'jià',
+    0x9A7F: 'yì',
+    0x9A80: 'dài,tái',
+    0x9A81: 'xiāo',
+    0x9A82: 'mà',
+    0x9A83: 'yīn',
+    0x9A84: 'jiāo',
+    0x9A85: 'huá',
+    0x9A86: 'luò',
+    0x9A87: 'hài',
+    0x9A88: 'pián',
+    0x9A89: 'biāo',
+    0x9A8A: 'lí',
+    0x9A8B: 'chěng',
+    0x9A8C: 'yàn',
+    0x9A8D: 'xīng',
+    0x9A8E: 'qīn',
+    0x9A8F: 'jùn',
+    0x9A90: 'qí',
+    0x9A91: 'qí',
+    0x9A92: 'kè',
+    0x9A93: 'zhuī',
+    0x9A94: 'zōng',
+    0x9A95: 'sù',
+    0x9A96: 'cān',
+    0x9A97: 'piàn',
+    0x9A98: 'zhì',
+    0x9A99: 'kuí',
+    0x9A9A: 'sāo',
+    0x9A9B: 'wù',
+    0x9A9C: 'ào',
+    0x9A9D: 'liú',
+    0x9A9E: 'qiān',
+    0x9A9F: 'shàn',
+    0x9AA0: 'biāo,piào',
+    0x9AA1: 'luó',
+    0x9AA2: 'cōng',
+    0x9AA3: 'chǎn',
+    0x9AA4: 'zhòu',
+    0x9AA5: 'jì',
+    0x9AA6: 'shuāng',
+    0x9AA7: 'xiāng',
+    0x9AA8: 'gǔ,gū,gú',
+    0x9AA9: 'wěi',
+    0x9AAA: 'wěi',
+    0x9AAB: 'wěi,wán',
+    0x9AAC: 'yú',
+    0x9AAD: 'gàn',
+    0x9AAE: 'yì',
+    0x9AAF: 'āng,kǎng',
+    0x9AB0: 'tóu,gǔ',
+    0x9AB1: 'jiè,jiá,xiè',
+    0x9AB2: 'bào',
+    0x9AB3: 'bèi',
+    0x9AB4: 'cī,zhài',
+    0x9AB5: 'tǐ',
+    0x9AB6: 'dǐ',
+    0x9AB7: 'kū',
+    0x9AB8: 'hái,gāi',
+    0x9AB9: 'qiāo,jiāo,xiāo',
+    0x9ABA: 'hóu',
+    0x9ABB: 'kuà',
+    0x9ABC: 'gé',
+    0x9ABD: 'tuǐ',
+    0x9ABE: 'gěng',
+    0x9ABF: 'pián',
+    0x9AC0: 'bì',
+    0x9AC1: 'kē,kuà',
+    0x9AC2: 'qià,gé',
+    0x9AC3: 'yú',
+    0x9AC4: 'suǐ',
+    0x9AC5: 'lóu',
+    0x9AC6: 'bó,pò',
+    0x9AC7: 'xiāo',
+    0x9AC8: 'bǎng,páng,pǎng',
+    0x9AC9: 'bó,jué',
+    0x9ACA: 'cī,cuō',
+    0x9ACB: 'kuān',
+    0x9ACC: 'bìn',
+    0x9ACD: 'mó',
+    0x9ACE: 'liáo',
+    0x9ACF: 'lóu',
+    0x9AD0: 'xiāo',
+    0x9AD1: 'dú',
+    0x9AD2: 'zāng,zǎng',
+    0x9AD3: 'suǐ',
+    0x9AD4: 'tǐ,tī',
+    0x9AD5: 'bìn',
+    0x9AD6: 'kuān',
+    0x9AD7: 'lú',
+    0x9AD8: 'gāo,gào',
+    0x9AD9: 'gāo',
+    0x9ADA: 'qiào',
+    0x9ADB: 'kāo',
+    0x9ADC: 'qiǎo',
+    0x9ADD: 'láo',
+    0x9ADE: 'sào',
+    0x9ADF: 'biāo,piào,shān',
+    0x9AE0: 'kūn',
+    0x9AE1: 'kūn',
+    0x9AE2: 'dí',
+    0x9AE3: 'fǎng',
+    0x9AE4: 'xiū',
+    0x9AE5: 'rán',
+    0x9AE6: 'máo',
+    0x9AE7: 'dàn',
+    0x9AE8: 'kūn',
+    0x9AE9: 'bìn',
+    0x9AEA: 'fà,fǎ',
+    0x9AEB: 'tiáo',
+    0x9AEC: 'pī',
+    0x9AED: 'zī',
+    0x9AEE: 'fà,fǎ',
+    0x9AEF: 'rán',
+    0x9AF0: 'tì',
+    0x9AF1: 'bào',
+    0x9AF2: 'bì',
+    0x9AF3: 'máo,róu,méng',
+    0x9AF4: 'fú,fèi',
+    0x9AF5: 'ér',
+    0x9AF6: 'róng,èr',
+    0x9AF7: 'qū',
+    0x9AF8: 'gōng',
+    0x9AF9: 'xiū',
+    0x9AFA: 'kuò,yuè',
+    0x9AFB: 'jì,jié',
+    0x9AFC: 'péng',
+    0x9AFD: 'zhuā',
+    0x9AFE: 'shāo,shǎo,shào',
+    0x9AFF: 'suō',
+    0x9B00: 'tì',
+    0x9B01: 'lì',
+    0x9B02: 'bìn',
+    0x9B03: 'zōng',
+    0x9B04: 'dí,tì',
+    0x9B05: 'péng',
+    0x9B06: 'sōng,sòng,sóng',
+    0x9B07: 'zhēng',
+    0x9B08: 'quán',
+    0x9B09: 'zōng',
+    0x9B0A: 'shùn',
+    0x9B0B: 'jiǎn',
+    0x9B0C: 'tuǒ,chuí,duǒ',
+    0x9B0D: 'hú',
+    0x9B0E: 'là',
+    0x9B0F: 'jiū',
+    0x9B10: 'qí',
+    0x9B11: 'lián',
+    0x9B12: 'zhěn',
+    0x9B13: 'bìn',
+    0x9B14: 'péng',
+    0x9B15: 'mà',
+    0x9B16: 'sān,sàn',
+    0x9B17: 'mán',
+    0x9B18: 'mán',
+    0x9B19: 'sēng',
+    0x9B1A: 'xū',
+    0x9B1B: 'liè',
+    0x9B1C: 'qiān',
+    0x9B1D: 'qiān',
+    0x9B1E: 'náng,nàng',
+    0x9B1F: 'huán',
+    0x9B20: 'kuò,kuài',
+    0x9B21: 'níng',
+    0x9B22: 'bìn',
+    0x9B23: 'liè',
+    0x9B24: 'ráng,níng',
+    0x9B25: 'dòu',
+    0x9B26: 'dòu',
+    0x9B27: 'nào',
+    0x9B28: 'hòng,xiàng',
+    0x9B29: 'xì,hè',
+    0x9B2A: 'dòu',
+    0x9B2B: 'hǎn',
+    0x9B2C: 'dòu',
+    0x9B2D: 'dòu',
+    0x9B2E: 'jiū',
+    0x9B2F: 'chàng',
+    0x9B30: 'yù',
+    0x9B31: 'yù',
+    0x9B32: 'gé,lì,è',
+    0x9B33: 'yàn',
+    0x9B34: 'fǔ,lì',
+    0x9B35: 'qín,xín',
+    0x9B36: 'guī',
+    0x9B37: 'zōng,zěng',
+    0x9B38: 'liù',
+    0x9B39: 'guī,xié',
+    0x9B3A: 'shāng',
+    0x9B3B: 'yù,zhōu,jū',
+    0x9B3C: 'guǐ',
+    0x9B3D: 'mèi',
+    0x9B3E: 'jì,qí',
+    0x9B3F: 'qí',
+    0x9B40: 'gà',
+    0x9B41: 'kuí,kuǐ,kuài',
+    0x9B42: 'hún',
+    0x9B43: 'bá',
+    0x9B44: 'pò,bó,tuò',
+    0x9B45: 'mèi',
+    0x9B46: 'xū',
+    0x9B47: 'yǎn',
+    0x9B48: 'xiāo',
+    0x9B49: 'liǎng',
+    0x9B4A: 'yù',
+    0x9B4B: 'tuí,chuí',
+    0x9B4C: 'qī',
+    0x9B4D: 'wǎng',
+    0x9B4E: 'liǎng',
+    0x9B4F: 'wèi,wéi,wēi',
+    0x9B50: 'gān',
+    0x9B51: 'chī',
+    0x9B52: 'piāo',
+    0x9B53: 'bì',
+    0x9B54: 'mó',
+    0x9B55: 'jǐ',
+    0x9B56: 'xū',
+    0x9B57: 'chǒu,chóu',
+    0x9B58: 'yǎn',
+    0x9B59: 'zhān',
+    0x9B5A: 'yú',
+    0x9B5B: 'dāo',
+    0x9B5C: 'rén',
+    0x9B5D: 'jié,jì',
+    0x9B5E: 'bā',
+    0x9B5F: 'hóng,gōng',
+    0x9B60: 'tuō',
+    0x9B61: 'diào,dí',
+    0x9B62: 'jǐ',
+    0x9B63: 'xù,yú',
+    0x9B64: 'é,huà',
+    0x9B65: 'è,qiè,jì',
+    0x9B66: 'shā,suō',
+    0x9B67: 'háng',
+    0x9B68: 'tún',
+    0x9B69: 'mò',
+    0x9B6A: 'jiè',
+    0x9B6B: 'shěn',
+    0x9B6C: 'bǎn',
+    0x9B6D: 'yuán,wǎn',
+    0x9B6E: 'pí,bǐ',
+    0x9B6F: 'lǔ,lǚ',
+    0x9B70: 'wén',
+    0x9B71: 'hú,hù',
+    0x9B72: 'lú',
+    0x9B73: 'zā,shī',
+    0x9B74: 'fáng',
+    0x9B75: 'fén,fèn',
+    0x9B76: 'nà',
+    0x9B77: 'yóu',
+    0x9B78: 'piàn',
+    0x9B79: 'mó',
+    0x9B7A: 'hé,gě',
+    0x9B7B: 'xiá,xiā',
+    0x9B7C: 'qū,xié',
+    0x9B7D: 'hán,hān',
+    0x9B7E: 'pī,pí',
+    0x9B7F: 'líng,lín',
+    0x9B80: 'tuó',
+    0x9B81: 'bō,bà',
+    0x9B82: 'qiú',
+    0x9B83: 'píng',
+    0x9B84: 'fú',
+    0x9B85: 'bì',
+    0x9B86: 'cǐ,jì',
+    0x9B87: 'wèi',
+    0x9B88: 'jū,qú,gǒu',
+    0x9B89: 'diāo',
+    0x9B8A: 'bà,bó',
+    0x9B8B: 'yóu,chóu',
+    0x9B8C: 'gǔn',
+    0x9B8D: 'pī,pí,jù',
+    0x9B8E: 'nián',
+    0x9B8F: 'xīng,zhēng',
+    0x9B90: 'tái',
+    0x9B91: 'bào,bāo,pāo',
+    0x9B92: 'fù',
+    0x9B93: 'zhǎ,zhà',
+    0x9B94: 'jù',
+    0x9B95: 'gū',
+    0x9B96: 'shí',
+    0x9B97: 'dōng',
+    0x9B98: 'dai',
+    0x9B99: 'tà',
+    0x9B9A: 'jié,qià',
+    0x9B9B: 'shū',
+    0x9B9C: 'hòu',
+    0x9B9D: 'xiǎng,zhèn',
+    0x9B9E: 'ér',
+    0x9B9F: 'àn,ān',
+    0x9BA0: 'wéi',
+    0x9BA1: 'zhào',
+    0x9BA2: 'zhū',
+    0x9BA3: 'yìn',
+    0x9BA4: 'liè',
+    0x9BA5: 'luò,gé',
+    0x9BA6: 'tóng',
+    0x9BA7: 'tǐ,yí',
+    0x9BA8: 'yì,qí',
+    0x9BA9: 'bìng,bì',
+    0x9BAA: 'wěi',
+    0x9BAB: 'jiāo',
+    0x9BAC: 'kū,kù',
+    0x9BAD: 'guī,xié,huà,wā,kuí',
+    0x9BAE: 'xiān,xiǎn,xiàn',
+    0x9BAF: 'gé',
+    0x9BB0: 'huí',
+    0x9BB1: 'lǎo',
+    0x9BB2: 'fú',
+    0x9BB3: 'kào',
+    0x9BB4: 'xiū',
+    0x9BB5: 'duó',
+    0x9BB6: 'jūn',
+    0x9BB7: 'tí',
+    0x9BB8: 'miǎn',
+    0x9BB9: 'shāo',
+    0x9BBA: 'zhǎ',
+    0x9BBB: 'suō',
+    0x9BBC: 'qīn',
+    0x9BBD: 'yú',
+    0x9BBE: 'něi',
+    0x9BBF: 'zhé',
+    0x9BC0: 'gǔn',
+    0x9BC1: 'gěng',
+    0x9BC2: 'sū',
+    0x9BC3: 'wú',
+    0x9BC4: 'qiú',
+    0x9BC5: 'shān,shěn',
+    0x9BC6: 'pū,bū',
+    0x9BC7: 'huàn',
+    0x9BC8: 'tiáo,yóu,chóu',
+    0x9BC9: 'lǐ',
+    0x9BCA: 'shā',
+    0x9BCB: 'shā',
+    0x9BCC: 'kào',
+    0x9BCD: 'méng',
+    0x9BCE: 'chéng',
+    0x9BCF: 'lí',
+    0x9BD0: 'zǒu',
+    0x9BD1: 'xī',
+    0x9BD2: 'yǒng',
+    0x9BD3: 'shēn',
+    0x9BD4: 'zī',
+    0x9BD5: 'qí',
+    0x9BD6: 'zhēng,qīng',
+    0x9BD7: 'xiǎng',
+    0x9BD8: 'něi',
+    0x9BD9: 'chún',
+    0x9BDA: 'jì',
+    0x9BDB: 'diāo',
+    0x9BDC: 'qiè',
+    0x9BDD: 'gù',
+    0x9BDE: 'zhǒu',
+    0x9BDF: 'dōng',
+    0x9BE0: 'lái',
+    0x9BE1: 'fèi,fēi',
+    0x9BE2: 'ní',
+    0x9BE3: 'yì',
+    0x9BE4: 'kūn',
+    0x9BE5: 'lù',
+    0x9BE6: 'jiù,ǎi',
+    0x9BE7: 'chāng',
+    0x9BE8: 'jīng,qíng',
+    0x9BE9: 'lún',
+    0x9BEA: 'líng',
+    0x9BEB: 'zōu',
+    0x9BEC: 'lí',
+    0x9BED: 'měng',
+    0x9BEE: 'zōng',
+    0x9BEF: 'zhì',
+    0x9BF0: 'nián',
+    0x9BF1: 'hǔ',
+    0x9BF2: 'yú',
+    0x9BF3: 'dǐ',
+    0x9BF4: 'shī',
+    0x9BF5: 'shēn',
+    0x9BF6: 'huàn',
+    0x9BF7: 'tí',
+    0x9BF8: 'hóu',
+    0x9BF9: 'xīng',
+    0x9BFA: 'zhū',
+    0x9BFB: 'là',
+    0x9BFC: 'zōng',
+    0x9BFD: 'zéi,jì',
+    0x9BFE: 'biān',
+    0x9BFF: 'biān',
+    0x9C00: 'huàn',
+    0x9C01: 'quán',
+    0x9C02: 'zéi,zé',
+    0x9C03: 'wēi',
+    0x9C04: 'wēi',
+    0x9C05: 'yú',
+    0x9C06: 'chūn',
+    0x9C07: 'róu',
+    0x9C08: 'dié,qiè,zhá',
+    0x9C09: 'huáng',
+    0x9C0A: 'liàn',
+    0x9C0B: 'yǎn',
+    0x9C0C: 'qiū',
+    0x9C0D: 'qiū',
+    0x9C0E: 'jiǎn',
+    0x9C0F: 'bī',
+    0x9C10: 'è',
+    0x9C11: 'yáng',
+    0x9C12: 'fù',
+    0x9C13: 'sāi,xí',
+    0x9C14: 'gǎn,jiān,xián',
+    0x9C15: 'xiā',
+    0x9C16: 'tuǒ,wěi',
+    0x9C17: 'hú',
+    0x9C18: 'shì',
+    0x9C19: 'ruò',
+    0x9C1A: 'xuān',
+    0x9C1B: 'wēn',
+    0x9C1C: 'qiàn,jiān',
+    0x9C1D: 'hào',
+    0x9C1E: 'wū',
+    0x9C1F: 'fáng,páng',
+    0x9C20: 'sāo',
+    0x9C21: 'liú',
+    0x9C22: 'mǎ',
+    0x9C23: 'shí',
+    0x9C24: 'shī',
+    0x9C25: 'guān,guàn,kūn,gǔn',
+    0x9C26: 'zī',
+    0x9C27: 'téng',
+    0x9C28: 'tǎ,dié',
+    0x9C29: 'yáo',
+    0x9C2A: 'é,gé',
+    0x9C2B: 'yóng',
+    0x9C2C: 'qián',
+    0x9C2D: 'qí',
+    0x9C2E: 'wēn',
+    0x9C2F: 'ruò',
+    0x9C30: 'shén',
+    0x9C31: 'lián',
+    0x9C32: 'áo',
+    0x9C33: 'lè',
+    0x9C34: 'huī',
+    0x9C35: 'mǐn',
+    0x9C36: 'jì',
+    0x9C37: 'tiáo',
+    0x9C38: 'qū',
+    0x9C39: 'jiān',
+    0x9C3A: 'shēn,sāo,cān',
+    0x9C3B: 'mán',
+    0x9C3C: 'xí',
+    0x9C3D: 'qiú',
+    0x9C3E: 'biào',
+    0x9C3F: 'jì',
+    0x9C40: 'jì',
+    0x9C41: 'zhú',
+    0x9C42: 'jiāng',
+    0x9C43: 'xiū,qiū',
+    0x9C44: 'zhuān,tuán,liàn',
+    0x9C45: 'yōng,yóng',
+    0x9C46: 'zhāng',
+    0x9C47: 'kāng',
+    0x9C48: 'xuě',
+    0x9C49: 'biē',
+    0x9C4A: 'yù',
+    0x9C4B: 'qū',
+    0x9C4C: 'xiàng',
+    0x9C4D: 'bō',
+    0x9C4E: 'jiǎo',
+    0x9C4F: 'xún',
+    0x9C50: 'sù',
+    0x9C51: 'huáng',
+    0x9C52: 'zūn,zùn',
+    0x9C53: 'shàn,tuó',
+    0x9C54: 'shàn',
+    0x9C55: 'fān',
+    0x9C56: 'guì,jué',
+    0x9C57: 'lín',
+    0x9C58: 'xún',
+    0x9C59: 'miáo',
+    0x9C5A: 'xǐ,xī',
+    0x9C5B: 'zēng',
+    0x9C5C: 'xiāng',
+    0x9C5D: 'fèn',
+    0x9C5E: 'guān',
+    0x9C5F: 'hòu',
+    0x9C60: 'kuài',
+    0x9C61: 'zéi',
+    0x9C62: 'sāo',
+    0x9C63: 'zhān,shàn',
+    0x9C64: 'gǎn',
+    0x9C65: 'guì',
+    0x9C66: 'yìng,shéng,měng',
+    0x9C67: 'lǐ',
+    0x9C68: 'cháng',
+    0x9C69: 'léi',
+    0x9C6A: 'shǔ',
+    0x9C6B: 'ài',
+    0x9C6C: 'rú',
+    0x9C6D: 'jì',
+    0x9C6E: 'xù,yú',
+    0x9C6F: 'hù',
+    0x9C70: 'shǔ',
+    0x9C71: 'lì',
+    0x9C72: 'liè,là',
+    0x9C73: 'lì,lù,luò',
+    0x9C74: 'miè',
+    0x9C75: 'zhēn',
+    0x9C76: 'xiǎng',
+    0x9C77: 'è',
+    0x9C78: 'lú',
+    0x9C79: 'guàn',
+    0x9C7A: 'lí,lǐ',
+    0x9C7B: 'xiān,xiǎn',
+    0x9C7C: 'yú',
+    0x9C7D: 'dāo',
+    0x9C7E: 'jǐ',
+    0x9C7F: 'yóu',
+    0x9C80: 'tún',
+    0x9C81: 'lǔ',
+    0x9C82: 'fáng',
+    0x9C83: 'bā',
+    0x9C84: 'hé',
+    0x9C85: 'bà,bō',
+    0x9C86: 'píng',
+    0x9C87: 'nián',
+    0x9C88: 'lú',
+    0x9C89: 'yóu',
+    0x9C8A: 'zhǎ',
+    0x9C8B: 'fù',
+    0x9C8C: 'bà,bó',
+    0x9C8D: 'bào',
+    0x9C8E: 'hòu',
+    0x9C8F: 'pí',
+    0x9C90: 'tái',
+    0x9C91: 'guī,xié',
+    0x9C92: 'jié',
+    0x9C93: 'kào',
+    0x9C94: 'wěi',
+    0x9C95: 'ér',
+    0x9C96: 'tóng',
+    0x9C97: 'zéi',
+    0x9C98: 'hòu',
+    0x9C99: 'kuài',
+    0x9C9A: 'jì',
+    0x9C9B: 'jiāo',
+    0x9C9C: 'xiān,xiǎn',
+    0x9C9D: 'zhǎ',
+    0x9C9E: 'xiǎng',
+    0x9C9F: 'xún',
+    0x9CA0: 'gěng',
+    0x9CA1: 'lí',
+    0x9CA2: 'lián',
+    0x9CA3: 'jiān',
+    0x9CA4: 'lǐ',
+    0x9CA5: 'shí',
+    0x9CA6: 'tiáo',
+    0x9CA7: 'gǔn',
+    0x9CA8: 'shā',
+    0x9CA9: 'huàn',
+    0x9CAA: 'jūn',
+    0x9CAB: 'jì',
+    0x9CAC: 'yǒng',
+    0x9CAD: 'qīng,zhēng',
+    0x9CAE: 'líng',
+    0x9CAF: 'qí',
+    0x9CB0: 'zōu',
+    0x9CB1: 'fēi',
+    0x9CB2: 'kūn',
+    0x9CB3: 'chāng',
+    0x9CB4: 'gù',
+    0x9CB5: 'ní',
+    0x9CB6: 'nián',
+    0x9CB7: 'diāo',
+    0x9CB8: 'jīng',
+    0x9CB9: 'shēn',
+    0x9CBA: 'shī',
+    0x9CBB: 'zī',
+    0x9CBC: 'fèn',
+    0x9CBD: 'dié',
+    0x9CBE: 'bī',
+    0x9CBF: 'cháng',
+    0x9CC0: 'tí',
+    0x9CC1: 'wēn',
+    0x9CC2: 'wēi',
+    0x9CC3: 'sāi',
+    0x9CC4: 'è',
+    0x9CC5: 'qiū',
+    0x9CC6: 'fù',
+    0x9CC7: 'huáng',
+    0x9CC8: 'quán',
+    0x9CC9: 'jiāng',
+    0x9CCA: 'biān',
+    0x9CCB: 'sāo',
+    0x9CCC: 'áo',
+    0x9CCD: 'qí',
+    0x9CCE: 'tǎ',
+    0x9CCF: 'guān',
+    0x9CD0: 'yáo',
+    0x9CD1: 'páng',
+    0x9CD2: 'jiān',
+    0x9CD3: 'lè',
+    0x9CD4: 'biào',
+    0x9CD5: 'xuě',
+    0x9CD6: 'biē',
+    0x9CD7: 'mán',
+    0x9CD8: 'mǐn',
+    0x9CD9: 'yōng',
+    0x9CDA: 'wèi',
+    0x9CDB: 'xí',
+    0x9CDC: 'guì',
+    0x9CDD: 'shàn',
+    0x9CDE: 'lín',
+    0x9CDF: 'zūn',
+    0x9CE0: 'hù',
+    0x9CE1: 'gǎn',
+    0x9CE2: 'lǐ',
+    0x9CE3: 'zhān',
+    0x9CE4: 'guǎn',
+    0x9CE5: 'niǎo,diǎo,dǎo,què',
+    0x9CE6: 'yǐ',
+    0x9CE7: 'fú',
+    0x9CE8: 'lì',
+    0x9CE9: 'jiū,qiú,zhì',
+    0x9CEA: 'bú',
+    0x9CEB: 'yàn',
+    0x9CEC: 'fǔ',
+    0x9CED: 'diāo,zhāo',
+    0x9CEE: 'jī',
+    0x9CEF: 'fèng',
+    0x9CF0: 'rù',
+    0x9CF1: 'gān,hàn,yàn',
+    0x9CF2: 'shī',
+    0x9CF3: 'fèng',
+    0x9CF4: 'míng',
+    0x9CF5: 'bǎo',
+    0x9CF6: 'yuān',
+    0x9CF7: 'zhī,chì',
+    0x9CF8: 'hù',
+    0x9CF9: 'qín',
+    0x9CFA: 'fū,guī',
+    0x9CFB: 'bān,fén',
+    0x9CFC: 'wén',
+    0x9CFD: 'jiān,qiān,zhān',
+    0x9CFE: 'shī',
+    0x9CFF: 'yù',
+    0x9D00: 'fǒu',
+    0x9D01: 'yāo,ǎo',
+    0x9D02: 'jué,guī',
+    0x9D03: 'jué',
+    0x9D04: 'pǐ',
+    0x9D05: 'huān',
+    0x9D06: 'zhèn',
+    0x9D07: 'bǎo',
+    0x9D08: 'yàn',
+    0x9D09: 'yā,yǎ',
+    0x9D0A: 'zhèng',
+    0x9D0B: 'fāng,fǎng',
+    0x9D0C: 'fèng',
+    0x9D0D: 'wén',
+    0x9D0E: 'ōu',
+    0x9D0F: 'dài',
+    0x9D10: 'gē',
+    0x9D11: 'rú',
+    0x9D12: 'líng',
+    0x9D13: 'miè,bì',
+    0x9D14: 'fú',
+    0x9D15: 'tuó',
+    0x9D16: 'mín,wén',
+    0x9D17: 'lì',
+    0x9D18: 'biǎn',
+    0x9D19: 'zhì',
+    0x9D1A: 'gē',
+    0x9D1B: 'yuān',
+    0x9D1C: 'cí',
+    0x9D1D: 'qú,gōu,gòu',
+    0x9D1E: 'xiāo',
+    0x9D1F: 'chī',
+    0x9D20: 'dàn',
+    0x9D21: 'jū',
+    0x9D22: 'yǎo,āo',
+    0x9D23: 'gū',
+    0x9D24: 'zhōng',
+    0x9D25: 'yù',
+    0x9D26: 'yāng',
+    0x9D27: 'yù',
+    0x9D28: 'yā',
+    0x9D29: 'tiě,hú',
+    0x9D2A: 'yù',
+    0x9D2B: 'tián',
+    0x9D2C: 'yīng',
+    0x9D2D: 'duī',
+    0x9D2E: 'wū',
+    0x9D2F: 'ér',
+    0x9D30: 'guā',
+    0x9D31: 'ài',
+    0x9D32: 'zhī',
+    0x9D33: 'yàn,ān,è',
+    0x9D34: 'héng',
+    0x9D35: 'xiāo',
+    0x9D36: 'jiá',
+    0x9D37: 'liè',
+    0x9D38: 'zhū',
+    0x9D39: 'yáng,xiáng',
+    0x9D3A: 'tí,yí',
+    0x9D3B: 'hóng,hòng',
+    0x9D3C: 'luò',
+    0x9D3D: 'rú',
+    0x9D3E: 'móu',
+    0x9D3F: 'gē',
+    0x9D40: 'rén',
+    0x9D41: 'jiāo,xiāo',
+    0x9D42: 'xiū',
+    0x9D43: 'zhōu,diǎo',
+    0x9D44: 'chī',
+    0x9D45: 'luò,gé',
+    0x9D46: 'héng',
+    0x9D47: 'nián',
+    0x9D48: 'ě',
+    0x9D49: 'luán',
+    0x9D4A: 'jiá',
+    0x9D4B: 'jì',
+    0x9D4C: 'tú',
+    0x9D4D: 'huān,juān,guàn',
+    0x9D4E: 'tuǒ',
+    0x9D4F: 'bǔ,bū,pū,pú',
+    0x9D50: 'wú',
+    0x9D51: 'juān',
+    0x9D52: 'yù',
+    0x9D53: 'bó',
+    0x9D54: 'jùn',
+    0x9D55: 'jùn',
+    0x9D56: 'bī',
+    0x9D57: 'xī',
+    0x9D58: 'jùn',
+    0x9D59: 'jú',
+    0x9D5A: 'tū',
+    0x9D5B: 'jīng',
+    0x9D5C: 'tí,tī',
+    0x9D5D: 'é',
+    0x9D5E: 'é',
+    0x9D5F: 'kuáng',
+    0x9D60: 'hú,gǔ,hè',
+    0x9D61: 'wǔ',
+    0x9D62: 'shēn',
+    0x9D63: 'lài,chì',
+    0x9D64: 'jiao',
+    0x9D65: 'pàn',
+    0x9D66: 'lù',
+    0x9D67: 'pí',
+    0x9D68: 'shū',
+    0x9D69: 'fú',
+    0x9D6A: 'ān,yā',
+    0x9D6B: 'zhuó',
+    0x9D6C: 'péng,fèng',
+    0x9D6D: 'qín',
+    0x9D6E: 'qiān',
+    0x9D6F: 'bēi',
+    0x9D70: 'diāo',
+    0x9D71: 'lù',
+    0x9D72: 'què',
+    0x9D73: 'jiān',
+    0x9D74: 'jú',
+    0x9D75: 'tù',
+    0x9D76: 'yā',
+    0x9D77: 'yuān',
+    0x9D78: 'qí',
+    0x9D79: 'lí',
+    0x9D7A: 'yè',
+    0x9D7B: 'zhuī',
+    0x9D7C: 'kōng',
+    0x9D7D: 'duò',
+    0x9D7E: 'kūn',
+    0x9D7F: 'shēng',
+    0x9D80: 'qí',
+    0x9D81: 'jīng',
+    0x9D82: 'yì',
+    0x9D83: 'yì',
+    0x9D84: 'jīng,qīng',
+    0x9D85: 'zī',
+    0x9D86: 'lái',
+    0x9D87: 'dōng',
+    0x9D88: 'qī',
+    0x9D89: 'chún,tuán',
+    0x9D8A: 'gēng',
+    0x9D8B: 'jū',
+    0x9D8C: 'jué,qū',
+    0x9D8D: 'yì',
+    0x9D8E: 'zūn',
+    0x9D8F: 'jī',
+    0x9D90: 'shù',
+    0x9D91: 'yīng',
+    0x9D92: 'chì',
+    0x9D93: 'miáo',
+    0x9D94: 'róu',
+    0x9D95: 'ān',
+    0x9D96: 'qiū',
+    0x9D97: 'tí,chí',
+    0x9D98: 'hú',
+    0x9D99: 'tí',
+    0x9D9A: 'è',
+    0x9D9B: 'jiē,jiè',
+    0x9D9C: 'máo',
+    0x9D9D: 'fú,bì',
+    0x9D9E: 'chūn',
+    0x9D9F: 'tú',
+    0x9DA0: 'yǎn',
+    0x9DA1: 'hé,hè',
+    0x9DA2: 'yuán',
+    0x9DA3: 'piān,biǎn',
+    0x9DA4: 'kūn',
+    0x9DA5: 'méi',
+    0x9DA6: 'hú',
+    0x9DA7: 'yīng',
+    0x9DA8: 'chuàn,zhì',
+    0x9DA9: 'wù,mù',
+    0x9DAA: 'jú',
+    0x9DAB: 'dōng',
+    0x9DAC: 'cāng,qiāng',
+    0x9DAD: 'fǎng',
+    0x9DAE: 'hè,hú',
+    0x9DAF: 'yīng',
+    0x9DB0: 'yuán',
+    0x9DB1: 'xiān',
+    0x9DB2: 'wēng',
+    0x9DB3: 'shī',
+    0x9DB4: 'hè',
+    0x9DB5: 'chú',
+    0x9DB6: 'táng',
+    0x9DB7: 'xiá',
+    0x9DB8: 'ruò',
+    0x9DB9: 'liú',
+    0x9DBA: 'jí',
+    0x9DBB: 'gú,hú',
+    0x9DBC: 'jiān,qiān',
+    0x9DBD: 'sǔn,xùn',
+    0x9DBE: 'hàn',
+    0x9DBF: 'cí',
+    0x9DC0: 'cí',
+    0x9DC1: 'yì',
+    0x9DC2: 'yào,yáo',
+    0x9DC3: 'yàn',
+    0x9DC4: 'jī',
+    0x9DC5: 'lì',
+    0x9DC6: 'tián',
+    0x9DC7: 'kòu',
+    0x9DC8: 'tī',
+    0x9DC9: 'tī,sī',
+    0x9DCA: 'yì',
+    0x9DCB: 'tú',
+    0x9DCC: 'mǎ',
+    0x9DCD: 'xiāo',
+    0x9DCE: 'gāo',
+    0x9DCF: 'tián',
+    0x9DD0: 'chén',
+    0x9DD1: 'jí',
+    0x9DD2: 'tuán',
+    0x9DD3: 'zhè',
+    0x9DD4: 'áo,ào',
+    0x9DD5: 'yǎo,xiào',
+    0x9DD6: 'yī,yì',
+    0x9DD7: 'ōu',
+    0x9DD8: 'chì',
+    0x9DD9: 'zhì,zhé',
+    0x9DDA: 'liù',
+    0x9DDB: 'yōng',
+    0x9DDC: 'lǘ,lǚ',
+    0x9DDD: 'bì',
+    0x9DDE: 'shuāng,shuǎng',
+    0x9DDF: 'zhuó',
+    0x9DE0: 'yú',
+    0x9DE1: 'wú',
+    0x9DE2: 'jué',
+    0x9DE3: 'yín',
+    0x9DE4: 'tí,tán',
+    0x9DE5: 'sī',
+    0x9DE6: 'jiāo',
+    0x9DE7: 'yì',
+    0x9DE8: 'huá',
+    0x9DE9: 'bì',
+    0x9DEA: 'yīng',
+    0x9DEB: 'sù',
+    0x9DEC: 'huáng',
+    0x9DED: 'fán',
+    0x9DEE: 'jiāo',
+    0x9DEF: 'liáo',
+    0x9DF0: 'yàn',
+    0x9DF1: 'gāo',
+    0x9DF2: 'jiù',
+    0x9DF3: 'xián',
+    0x9DF4: 'xián',
+    0x9DF5: 'tú',
+    0x9DF6: 'mǎi',
+    0x9DF7: 'zūn',
+    0x9DF8: 'yù,shù',
+    0x9DF9: 'yīng',
+    0x9DFA: 'lù',
+    0x9DFB: 'tuán',
+    0x9DFC: 'xián',
+    0x9DFD: 'xué',
+    0x9DFE: 'yì',
+    0x9DFF: 'pì',
+    0x9E00: 'chǔ,zhú,chù',
+    0x9E01: 'luó',
+    0x9E02: 'xī,qī',
+    0x9E03: 'yí',
+    0x9E04: 'jī',
+    0x9E05: 'zé',
+    0x9E06: 'yú',
+    0x9E07: 'zhān',
+    0x9E08: 'yè',
+    0x9E09: 'yáng',
+    0x9E0A: 'pì,bì',
+    0x9E0B: 'níng',
+    0x9E0C: 'hù',
+    0x9E0D: 'mí',
+    0x9E0E: 'yīng',
+    0x9E0F: 'méng,máng',
+    0x9E10: 'dí',
+    0x9E11: 'yuè',
+    0x9E12: 'yù',
+    0x9E13: 'lěi',
+    0x9E14: 'bǔ',
+    0x9E15: 'lú',
+    0x9E16: 'hè',
+    0x9E17: 'lóng',
+    0x9E18: 'shuāng',
+    0x9E19: 'yuè',
+    0x9E1A: 'yīng',
+    0x9E1B: 'guàn,huān,quán',
+    0x9E1C: 'qú',
+    0x9E1D: 'lí',
+    0x9E1E: 'luán',
+    0x9E1F: 'niǎo,diǎo',
+    0x9E20: 'jiū',
+    0x9E21: 'jī',
+    0x9E22: 'yuān',
+    0x9E23: 'míng',
+    0x9E24: 'shī',
+    0x9E25: 'ōu',
+    0x9E26: 'yā',
+    0x9E27: 'cāng',
+    0x9E28: 'bǎo',
+    0x9E29: 'zhèn',
+    0x9E2A: 'gū',
+    0x9E2B: 'dōng',
+    0x9E2C: 'lú',
+    0x9E2D: 'yā',
+    0x9E2E: 'xiāo',
+    0x9E2F: 'yāng',
+    0x9E30: 'líng',
+    0x9E31: 'chī',
+    0x9E32: 'qú',
+    0x9E33: 'yuān',
+    0x9E34: 'xué',
+    0x9E35: 'tuó',
+    0x9E36: 'sī',
+    0x9E37: 'zhì',
+    0x9E38: 'ér',
+    0x9E39: 'guā',
+    0x9E3A: 'xiū',
+    0x9E3B: 'héng',
+    0x9E3C: 'zhōu',
+    0x9E3D: 'gē',
+    0x9E3E: 'luán',
+    0x9E3F: 'hóng',
+    0x9E40: 'wú',
+    0x9E41: 'bó',
+    0x9E42: 'lí',
+    0x9E43: 'juān',
+    0x9E44: 'gǔ,hú',
+    0x9E45: 'é',
+    0x9E46: 'yù',
+    0x9E47: 'xián',
+    0x9E48: 'tí',
+    0x9E49: 'wǔ',
+    0x9E4A: 'què',
+    0x9E4B: 'miáo',
+    0x9E4C: 'ān',
+    0x9E4D: 'kūn',
+    0x9E4E: 'bēi',
+    0x9E4F: 'péng',
+    0x9E50: 'qiān',
+    0x9E51: 'chún',
+    0x9E52: 'gēng',
+    0x9E53: 'yuān',
+    0x9E54: 'sù',
+    0x9E55: 'hú',
+    0x9E56: 'hé',
+    0x9E57: 'è',
+    0x9E58: 'gǔ,hú',
+    0x9E59: 'qiū',
+    0x9E5A: 'cí',
+    0x9E5B: 'méi',
+    0x9E5C: 'wù',
+    0x9E5D: 'yì',
+    0x9E5E: 'yào',
+    0x9E5F: 'wēng',
+    0x9E60: 'liú',
+    0x9E61: 'jí',
+    0x9E62: 'yì',
+    0x9E63: 'jiān',
+    0x9E64: 'hè',
+    0x9E65: 'yī',
+    0x9E66: 'yīng',
+    0x9E67: 'zhè',
+    0x9E68: 'liù',
+    0x9E69: 'liáo',
+    0x9E6A: 'jiāo',
+    0x9E6B: 'jiù',
+    0x9E6C: 'yù',
+    0x9E6D: 'lù',
+    0x9E6E: 'huán',
+    0x9E6F: 'zhān',
+    0x9E70: 'yīng',
+    0x9E71: 'hù',
+    0x9E72: 'méng',
+    0x9E73: 'guàn',
+    0x9E74: 'shuāng',
+    0x9E75: 'lǔ,lú',
+    0x9E76: 'jīn',
+    0x9E77: 'líng',
+    0x9E78: 'jiǎn',
+    0x9E79: 'xián,jiǎn',
+    0x9E7A: 'cuó',
+    0x9E7B: 'jiǎn',
+    0x9E7C: 'jiǎn',
+    0x9E7D: 'yán,yàn',
+    0x9E7E: 'cuó',
+    0x9E7F: 'lù,lǘ',
+    0x9E80: 'yōu',
+    0x9E81: 'cū',
+    0x9E82: 'jǐ',
+    0x9E83: 'páo,biāo,piǎo',
+    0x9E84: 'cū',
+    0x9E85: 'páo',
+    0x9E86: 'zhù,cū',
+    0x9E87: 'jūn,qún',
+    0x9E88: 'zhǔ',
+    0x9E89: 'jiān',
+    0x9E8A: 'mí',
+    0x9E8B: 'mí',
+    0x9E8C: 'yǔ',
+    0x9E8D: 'liú',
+    0x9E8E: 'chén',
+    0x9E8F: 'jūn',
+    0x9E90: 'lín',
+    0x9E91: 'ní',
+    0x9E92: 'qí',
+    0x9E93: 'lù',
+    0x9E94: 'jiù',
+    0x9E95: 'jūn,qún',
+    0x9E96: 'jīng',
+    0x9E97: 'lì,lí,lǐ,sī',
+    0x9E98: 'xiāng',
+    0x9E99: 'xián,yán',
+    0x9E9A: 'jiā',
+    0x9E9B: 'mí',
+    0x9E9C: 'lì',
+    0x9E9D: 'shè',
+    0x9E9E: 'zhāng',
+    0x9E9F: 'lín',
+    0x9EA0: 'jīng',
+    0x9EA1: 'qí',
+    0x9EA2: 'líng',
+    0x9EA3: 'yán',
+    0x9EA4: 'cū',
+    0x9EA5: 'mài',
+    0x9EA6: 'mài',
+    0x9EA7: 'hé',
+    0x9EA8: 'chǎo',
+    0x9EA9: 'fū',
+    0x9EAA: 'miàn',
+    0x9EAB: 'miàn',
+    0x9EAC: 'fū',
+    0x9EAD: 'pào',
+    0x9EAE: 'qù',
+    0x9EAF: 'qū',
+    0x9EB0: 'móu',
+    0x9EB1: 'fū',
+    0x9EB2: 'xiàn,yàn',
+    0x9EB3: 'lái',
+    0x9EB4: 'qū',
+    0x9EB5: 'miàn',
+    0x9EB6: 'chi',
+    0x9EB7: 'fēng',
+    0x9EB8: 'fū',
+    0x9EB9: 'qū',
+    0x9EBA: 'miàn',
+    0x9EBB: 'má,mā',
+    0x9EBC: 'me',
+    0x9EBD: 'mó,má,ma,me',
+    0x9EBE: 'huī',
+    0x9EBF: 'mí',
+    0x9EC0: 'zōu',
+    0x9EC1: 'nún',
+    0x9EC2: 'fén',
+    0x9EC3: 'huáng',
+    0x9EC4: 'huáng',
+    0x9EC5: 'jīn',
+    0x9EC6: 'guāng',
+    0x9EC7: 'tiān',
+    0x9EC8: 'tǒu',
+    0x9EC9: 'hóng',
+    0x9ECA: 'huà',
+    0x9ECB: 'kuàng',
+    0x9ECC: 'hóng',
+    0x9ECD: 'shǔ',
+    0x9ECE: 'lí',
+    0x9ECF: 'nián',
+    0x9ED0: 'chī,lí',
+    0x9ED1: 'hēi',
+    0x9ED2: 'hēi',
+    0x9ED3: 'yì',
+    0x9ED4: 'qián',
+    0x9ED5: 'dǎn',
+    0x9ED6: 'xì',
+    0x9ED7: 'tūn',
+    0x9ED8: 'mò',
+    0x9ED9: 'mò',
+    0x9EDA: 'qián,jiān',
+    0x9EDB: 'dài',
+    0x9EDC: 'chù',
+    0x9EDD: 'yǒu,yī',
+    0x9EDE: 'diǎn,zhān,duò',
+    0x9EDF: 'yī',
+    0x9EE0: 'xiá',
+    0x9EE1: 'yǎn',
+    0x9EE2: 'qū',
+    0x9EE3: 'měi',
+    0x9EE4: 'yǎn',
+    0x9EE5: 'qíng',
+    0x9EE6: 'yuè,yè',
+    0x9EE7: 'lí,lái',
+    0x9EE8: 'dǎng,tǎng,chèng',
+    0x9EE9: 'dú',
+    0x9EEA: 'cǎn',
+    0x9EEB: 'yān',
+    0x9EEC: 'yán,yǎn,jiān',
+    0x9EED: 'yǎn',
+    0x9EEE: 'dǎn,tàn,zhèn,shèn',
+    0x9EEF: 'àn,ān',
+    0x9EF0: 'zhěn,yān',
+    0x9EF1: 'dài,zhèn',
+    0x9EF2: 'cǎn',
+    0x9EF3: 'yī,wā',
+    0x9EF4: 'méi,mèi',
+    0x9EF5: 'zhǎn,dǎn',
+    0x9EF6: 'yǎn',
+    0x9EF7: 'dú',
+    0x9EF8: 'lú',
+    0x9EF9: 'zhǐ,xiàn',
+    0x9EFA: 'fěn',
+    0x9EFB: 'fú',
+    0x9EFC: 'fǔ',
+    0x9EFD: 'miǎn,měng,mǐn,méng',
+    0x9EFE: 'mǐn,miǎn,měng',
+    0x9EFF: 'yuán',
+    0x9F00: 'cù',
+    0x9F01: 'qù',
+    0x9F02: 'cháo,zhāo',
+    0x9F03: 'wā',
+    0x9F04: 'zhū',
+    0x9F05: 'zhī',
+    0x9F06: 'méng,měng',
+    0x9F07: 'áo',
+    0x9F08: 'biē',
+    0x9F09: 'tuó',
+    0x9F0A: 'bì',
+    0x9F0B: 'yuán',
+    0x9F0C: 'cháo',
+    0x9F0D: 'tuó',
+    0x9F0E: 'dǐng,zhēn',
+    0x9F0F: 'mì',
+    0x9F10: 'nài',
+    0x9F11: 'dǐng',
+    0x9F12: 'zī',
+    0x9F13: 'gǔ',
+    0x9F14: 'gǔ',
+    0x9F15: 'dōng,tóng',
+    0x9F16: 'fén',
+    0x9F17: 'táo',
+    0x9F18: 'yuān',
+    0x9F19: 'pí',
+    0x9F1A: 'chāng',
+    0x9F1B: 'gāo',
+    0x9F1C: 'qì,cào',
+    0x9F1D: 'yuān',
+    0x9F1E: 'tāng',
+    0x9F1F: 'tēng',
+    0x9F20: 'shǔ',
+    0x9F21: 'shǔ',
+    0x9F22: 'fén',
+    0x9F23: 'fèi',
+    0x9F24: 'wén,wèn',
+    0x9F25: 'bá,fèi',
+    0x9F26: 'diāo',
+    0x9F27: 'tuó',
+    0x9F28: 'zhōng',
+    0x9F29: 'qú',
+    0x9F2A: 'shēng',
+    0x9F2B: 'shí',
+    0x9F2C: 'yòu',
+    0x9F2D: 'shí',
+    0x9F2E: 'tíng',
+    0x9F2F: 'wú',
+    0x9F30: 'jú',
+    0x9F31: 'jīng',
+    0x9F32: 'hún',
+    0x9F33: 'jú,xí',
+    0x9F34: 'yǎn',
+    0x9F35: 'tū',
+    0x9F36: 'sī',
+    0x9F37: 'xī',
+    0x9F38: 'xiàn',
+    0x9F39: 'yǎn',
+    0x9F3A: 'léi',
+    0x9F3B: 'bí',
+    0x9F3C: 'yào',
+    0x9F3D: 'qiú',
+    0x9F3E: 'hān',
+    0x9F3F: 'wù,huī',
+    0x9F40: 'wù',
+    0x9F41: 'hōu,kù',
+    0x9F42: 'xiè',
+    0x9F43: 'è,hè',
+    0x9F44: 'zhā',
+    0x9F45: 'xiù',
+    0x9F46: 'wèng',
+    0x9F47: 'zhā',
+    0x9F48: 'nòng',
+    0x9F49: 'nàng',
+    0x9F4A: 'qí,jī,jì,zī,zhāi,jiǎn',
+    0x9F4B: 'zhāi',
+    0x9F4C: 'jì',
+    0x9F4D: 'zī,jì',
+    0x9F4E: 'jī',
+    0x9F4F: 'jī',
+    0x9F50: 'qí,jì',
+    0x9F51: 'jī',
+    0x9F52: 'chǐ',
+    0x9F53: 'chèn',
+    0x9F54: 'chèn',
+    0x9F55: 'hé',
+    0x9F56: 'yá,yà',
+    0x9F57: 'yín,yǐn,yǎn',
+    0x9F58: 'xiè',
+    0x9F59: 'bāo',
+    0x9F5A: 'zé',
+    0x9F5B: 'xiè,shì',
+    0x9F5C: 'chái,zī',
+    0x9F5D: 'chī',
+    0x9F5E: 'yǎn',
+    0x9F5F: 'jǔ,zhā',
+    0x9F60: 'tiáo',
+    0x9F61: 'líng',
+    0x9F62: 'líng',
+    0x9F63: 'chū,chǐ',
+    0x9F64: 'quán',
+    0x9F65: 'xiè',
+    0x9F66: 'kěn,qiǎn,yín,kǔn',
+    0x9F67: 'niè',
+    0x9F68: 'jiù',
+    0x9F69: 'yǎo',
+    0x9F6A: 'chuò',
+    0x9F6B: 'yǔn',
+    0x9F6C: 'yǔ,wú',
+    0x9F6D: 'chǔ',
+    0x9F6E: 'yǐ,qǐ',
+    0x9F6F: 'ní',
+    0x9F70: 'zé,cè,zhà',
+    0x9F71: 'zōu,chuò',
+    0x9F72: 'qǔ',
+    0x9F73: 'yǔn',
+    0x9F74: 'yǎn',
+    0x9F75: 'óu,yú',
+    0x9F76: 'è',
+    0x9F77: 'wò',
+    0x9F78: 'yì',
+    0x9F79: 'cī,cuó',
+    0x9F7A: 'zōu',
+    0x9F7B: 'diān',
+    0x9F7C: 'chǔ',
+    0x9F7D: 'jìn',
+    0x9F7E: 'yà,è',
+    0x9F7F: 'chǐ',
+    0x9F80: 'chèn',
+    0x9F81: 'hé',
+    0x9F82: 'yín',
+    0x9F83: 'jǔ',
+    0x9F84: 'líng',
+    0x9F85: 'bāo',
+    0x9F86: 'tiáo',
+    0x9F87: 'zī',
+    0x9F88: 'kěn,yín',
+    0x9F89: 'yǔ',
+    0x9F8A: 'chuò',
+    0x9F8B: 'qǔ',
+    0x9F8C: 'wò',
+    0x9F8D: 'lóng,máng',
+    0x9F8E: 'páng',
+    0x9F8F: 'gōng,wò',
+    0x9F90: 'páng,lóng',
+    0x9F91: 'yǎn',
+    0x9F92: 'lóng',
+    0x9F93: 'lǒng,lóng',
+    0x9F94: 'gōng',
+    0x9F95: 'kān,kè',
+    0x9F96: 'dá',
+    0x9F97: 'líng',
+    0x9F98: 'dá',
+    0x9F99: 'lóng',
+    0x9F9A: 'gōng',
+    0x9F9B: 'kān',
+    0x9F9C: 'guī,qiū,jūn',
+    0x9F9D: 'qiū',
+    0x9F9E: 'biē',
+    0x9F9F: 'guī,jūn,qiū',
+    0x9FA0: 'yuè',
+    0x9FA1: 'chuī',
+    0x9FA2: 'hé',
+    0x9FA3: 'jué',
+    0x9FA4: 'xié',
+    0x9FA5: 'yù',
+    0x9FC3: 'shǎn',
+    0x9FCD: 'gàng',
+    0x9FCE: 'tǎ,dá',
+    0x9FCF: 'mài',
+    0x9FD4: 'gē',
+    0x9FD5: 'dān',
+    0x9FEB: 'ào',
+    0x9FEC: 'tián',
+    0x9FED: 'nǐ',
+    0xE815: 'yè',
+    0xE816: 'zuǒ,yǒu',
+    0xE818: 'gǔn',
+    0xE81A: 'zhòu,zhū',
+    0xE81B: 'zhòu,zhū',
+    0xE81D: 'jié,jiē',
+    0xE81F: 'wāi',
+    0xE820: 'hǎn',
+    0xE821: 'hǎn',
+    0xE824: 'zhòu',
+    0xE825: 'zhòu',
+    0xE826: 'shǒu',
+    0xE827: 'gāng',
+    0xE828: 'kuǎi',
+    0xE829: 'sǒng',
+    0xE82A: 'sǒng',
+    0xE82B: 'fēng',
+    0xE82C: 'gòng',
+    0xE82D: 'gāng',
+    0xE82E: 'huì,kuì',
+    0xE82F: 'tà',
+    0xE830: 'jiān',
+    0xE831: 'ēn',
+    0xE832: 'xiǎo',
+    0xE834: 'lóu,lǘ',
+    0xE835: 'cǎn,shān,cēn',
+    0xE836: 'zhú',
+    0xE837: 'chōu,chóu',
+    0xE838: 'wǎng',
+    0xE83A: 'yáng,xiáng',
+    0xE83B: 'zāi',
+    0xE83C: 'bà,bēi',
+    0xE83D: 'bà,bēi',
+    0xE83F: 'zhuān,zhuán,chuǎn,chún',
+    0xE840: 'qióng',
+    0xE841: 'kuì,huì',
+    0xE842: 'kuì,huì',
+    0xE843: 'juǎn',
+    0xE844: 'xīn',
+    0xE845: 'yàn',
+    0xE846: 'qíng',
+    0xE847: 'qíng',
+    0xE849: 'shàn',
+    0xE84A: 'yé,yá',
+    0xE84B: 'pō',
+    0xE84C: 'shàn',
+    0xE84D: 'zhuō',
+    0xE84E: 'shàn',
+    0xE84F: 'jué',
+    0xE850: 'chuài',
+    0xE851: 'zhèng',
+    0xE852: 'chuài',
+    0xE853: 'zhèng',
+    0xE854: 'zhuó',
+    0xE855: 'yíng',
+    0xE856: 'yú',
+    0xE857: 'yìn',
+    0xE858: 'chūn',
+    0xE859: 'qiū',
+    0xE85A: 'yú',
+    0xE85B: 'téng',
+    0xE85C: 'shī',
+    0xE85D: 'jiāo',
+    0xE85E: 'liè',
+    0xE85F: 'jīng',
+    0xE860: 'jú',
+    0xE861: 'tī',
+    0xE862: 'pì',
+    0xE863: 'yǎn',
+    0xE864: 'luán',
+}
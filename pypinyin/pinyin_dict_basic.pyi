@@ -0,0 +1,3 @@
+from typing import Dict, Text
+
+pinyin_dict = ...  # type: Dict[int, Text]
@@ -0,0 +1,5770 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+pinyin_dict = {
+    0x3400: 'qiū',
+    0x3401: 'tiàn',
+    0x3404: 'kuà',
+    0x3405: 'wǔ',
+    0x3406: 'yǐn',
+    0x340C: 'yí',
+    0x3416: 'xié',
+    0x341C: 'chóu',
+    0x3421: 'nuò',
+    0x3424: 'dān,qiú',
+    0x3428: 'xù',
+    0x3429: 'xíng',
+    0x342B: 'xiōng',
+    0x342C: 'liú',
+    0x342D: 'lǐn',
+    0x342E: 'xiāng',
+    0x342F: 'yōng',
+    0x3430: 'xìn',
+    0x3431: 'zhěn',
+    0x3432: 'dài',
+    0x3433: 'wù',
+    0x3434: 'pān',
+    0x3435: 'rú',
+    0x3437: 'mǎ',
+    0x3438: 'qiàn,cì',
+    0x3439: 'yì',
+    0x343A: 'yín,zhòng',
+    0x343B: 'nèi',
+    0x343C: 'chèng',
+    0x343D: 'fēng',
+    0x3441: 'zhuō',
+    0x3442: 'fǎng',
+    0x3443: 'ǎo',
+    0x3444: 'wǔ',
+    0x3445: 'zuò',
+    0x3447: 'zhòu',
+    0x3448: 'dòng',
+    0x3449: 'sù',
+    0x344A: 'yì',
+    0x344B: 'qióng',
+    0x344C: 'kuāng,wāng',
+    0x344D: 'lèi',
+    0x344E: 'nǎo',
+    0x344F: 'zhù',
+    0x3450: 'shū',
+    0x3454: 'xǔ',
+    0x3457: 'shēn',
+    0x3458: 'jiè',
+    0x3459: 'dié',
+    0x345A: 'nuó',
+    0x345B: 'sù',
+    0x345C: 'yì,chì',
+    0x345D: 'lòng',
+    0x345E: 'yìng',
+    0x345F: 'běng',
+    0x3463: 'lán',
+    0x3464: 'miáo',
+    0x3465: 'yì',
+    0x3466: 'lì',
+    0x3467: 'jì',
+    0x3468: 'yǔ',
+    0x3469: 'luó',
+    0x346A: 'chái',
+    0x346E: 'hún',
+    0x346F: 'xǔ',
+    0x3470: 'huì',
+    0x3471: 'rǎo',
+    0x3473: 'zhòu,zhū',
+    0x3475: 'hàn',
+    0x3476: 'xì',
+    0x3477: 'tài',
+    0x3478: 'yáo',
+    0x3479: 'huì',
+    0x347A: 'jùn',
+    0x347B: 'mà',
+    0x347C: 'lüè',
+    0x347D: 'táng',
+    0x347E: 'yáo',
+    0x347F: 'zhào',
+    0x3480: 'zhāi,zhǎ',
+    0x3481: 'yǔ',
+    0x3482: 'zhuó',
+    0x3483: 'èr',
+    0x3484: 'rǎn',
+    0x3485: 'qǐ',
+    0x3486: 'chì',
+    0x3487: 'wǔ',
+    0x3488: 'hàn',
+    0x3489: 'tǎng',
+    0x348A: 'sè',
+    0x348C: 'qióng',
+    0x348D: 'léi',
+    0x348E: 'sà',
+    0x3491: 'kuǐ,huì',
+    0x3492: 'pú',
+    0x3493: 'tà',
+    0x3494: 'shú,dú,tù',
+    0x3495: 'yāng',
+    0x3496: 'ǒu',
+    0x3497: 'tái',
+    0x3499: 'mián',
+    0x349A: 'yìn,wěn',
+    0x349B: 'diào',
+    0x349C: 'yǔ',
+    0x349D: 'miè,wà',
+    0x349E: 'jùn',
+    0x349F: 'niǎo',
+    0x34A0: 'xiè',
+    0x34A1: 'yóu',
+    0x34A4: 'chè',
+    0x34A5: 'fēng',
+    0x34A6: 'lěi,lèi',
+    0x34A7: 'lì',
+    0x34A9: 'luǒ',
+    0x34AB: 'jì',
+    0x34B0: 'quán',
+    0x34B2: 'cái',
+    0x34B3: 'liǎng',
+    0x34B4: 'gǔ',
+    0x34B5: 'mào',
+    0x34B7: 'guǎ',
+    0x34B8: 'suì',
+    0x34BB: 'mào',
+    0x34BC: 'mán',
+    0x34BD: 'quān',
+    0x34BE: 'shì',
+    0x34BF: 'lí',
+    0x34C1: 'wǎng',
+    0x34C2: 'kòu',
+    0x34C3: 'dù',
+    0x34C4: 'zhèn',
+    0x34C5: 'tīng',
+    0x34C8: 'bìng',
+    0x34C9: 'huò',
+    0x34CA: 'dòng',
+    0x34CB: 'gòng',
+    0x34CC: 'chēng',
+    0x34CE: 'qīn,qìn,qǐn',
+    0x34CF: 'jiǒng',
+    0x34D0: 'lù',
+    0x34D1: 'xìng',
+    0x34D3: 'nán',
+    0x34D4: 'xiè',
+    0x34D6: 'bì',
+    0x34D7: 'jié',
+    0x34D8: 'sù',
+    0x34DA: 'gōng',
+    0x34DC: 'yòu',
+    0x34DD: 'xíng',
+    0x34DE: 'qià',
+    0x34DF: 'pí',
+    0x34E0: 'diàn,diǎn',
+    0x34E1: 'fǔ,guā',
+    0x34E2: 'luò',
+    0x34E3: 'qià,gē',
+    0x34E4: 'qià',
+    0x34E5: 'tāng',
+    0x34E6: 'bāi',
+    0x34E7: 'gān',
+    0x34E8: 'cí',
+    0x34E9: 'xuān,jiē',
+    0x34EA: 'lǎng',
+    0x34ED: 'shé',
+    0x34EF: 'lí',
+    0x34F0: 'huà',
+    0x34F1: 'tóu,shū',
+    0x34F2: 'piān',
+    0x34F3: 'dī',
+    0x34F4: 'ruǎn',
+    0x34F5: 'è',
+    0x34F6: 'qiè',
+    0x34F7: 'yì',
+    0x34F8: 'zhuō,dōu',
+    0x34F9: 'ruì,cuì,jì',
+    0x34FA: 'jiān,qián',
+    0x34FC: 'chì',
+    0x34FD: 'chóng',
+    0x34FE: 'xī,chí',
+    0x3500: 'lüè',
+    0x3501: 'dēng',
+    0x3502: 'lín',
+    0x3503: 'jué,xuē',
+    0x3504: 'sù',
+    0x3505: 'xiào',
+    0x3506: 'zàn',
+    0x3509: 'zhǔ',
+    0x350A: 'zhǎn,dǎn',
+    0x350B: 'jiān,lán',
+    0x350C: 'zòu,cǒu',
+    0x350D: 'chuā,zhá',
+    0x350E: 'xiè',
+    0x350F: 'lì,luǒ',
+    0x3511: 'chì',
+    0x3512: 'xí',
+    0x3513: 'jiǎn',
+    0x3515: 'jí',
+    0x3517: 'fèi,bèi,fú',
+    0x3518: 'chù',
+    0x3519: 'bēng',
+    0x351A: 'jié',
+    0x351C: 'bá',
+    0x351D: 'liǎng,liáng',
+    0x351E: 'kuài',
+    0x3520: 'xiā,hé',
+    0x3521: 'biē',
+    0x3522: 'jué,xuē',
+    0x3523: 'léi',
+    0x3524: 'xìn',
+    0x3525: 'bài,pí',
+    0x3526: 'yǎng',
+    0x3527: 'lǜ',
+    0x3528: 'bèi',
+    0x3529: 'è',
+    0x352A: 'lǔ',
+    0x352D: 'chè',
+    0x352E: 'nuó',
+    0x352F: 'xuán,suǎn',
+    0x3530: 'héng',
+    0x3531: 'yǔ',
+    0x3533: 'guǐ',
+    0x3534: 'yì',
+    0x3535: 'xuǎn',
+    0x3536: 'gòng,gǎn',
+    0x3537: 'lòu',
+    0x3538: 'tī',
+    0x3539: 'lè',
+    0x353A: 'shì',
+    0x353C: 'sǔn',
+    0x353D: 'yào',
+    0x353E: 'xiān,jié',
+    0x353F: 'zòu',
+    0x3541: 'què',
+    0x3542: 'yín,qín',
+    0x3543: 'xī',
+    0x3544: 'zhǐ',
+    0x3545: 'jiá',
+    0x3546: 'hù',
+    0x3547: 'lā',
+    0x3548: 'yǐ',
+    0x3549: 'kè',
+    0x354A: 'fū',
+    0x354B: 'qín',
+    0x354C: 'ài',
+    0x354E: 'kè',
+    0x354F: 'chú',
+    0x3550: 'xiě,xiè',
+    0x3551: 'chú',
+    0x3552: 'wēi',
+    0x3555: 'huàn',
+    0x3556: 'sù',
+    0x3557: 'yòu',
+    0x3559: 'jùn',
+    0x355A: 'zhǎo',
+    0x355B: 'xù',
+    0x355C: 'shǐ',
+    0x355E: 'shuā',
+    0x355F: 'kuì,kuài',
+    0x3560: 'shuāng',
+    0x3561: 'hé',
+    0x3562: 'gài,hài',
+    0x3563: 'yǎn',
+    0x3564: 'qiú',
+    0x3565: 'shēn',
+    0x3566: 'huà',
+    0x3567: 'xī',
+    0x3568: 'fàn',
+    0x3569: 'pàng',
+    0x356A: 'dǎn',
+    0x356B: 'fǎng,fēng',
+    0x356C: 'gōng,sòng',
+    0x356D: 'āo,ào',
+    0x356E: 'fǔ',
+    0x356F: 'nè',
+    0x3570: 'xuè,ma',
+    0x3571: 'yóu',
+    0x3572: 'huá,yíng',
+    0x3574: 'chén',
+    0x3575: 'guó',
+    0x3576: 'ň,ňg',
+    0x3577: 'huà,pā',
+    0x3578: 'lì',
+    0x3579: 'fá',
+    0x357A: 'xiāo',
+    0x357B: 'pǒu',
+    0x357D: 'sì',
+    0x3580: 'lè',
+    0x3581: 'lìn',
+    0x3582: 'yì',
+    0x3583: 'hǒu,hòu',
+    0x3585: 'xù',
+    0x3586: 'qú',
+    0x3587: 'ér',
+    0x358A: 'xún',
+    0x358F: 'niè',
+    0x3590: 'wěi',
+    0x3591: 'xiè',
+    0x3592: 'tí',
+    0x3593: 'hóng',
+    0x3594: 'tǔn',
+    0x3595: 'niè,xīn',
+    0x3596: 'niè',
+    0x3597: 'yín',
+    0x3598: 'zhēn',
+    0x359E: 'wāi',
+    0x359F: 'shòu',
+    0x35A0: 'nuò',
+    0x35A1: 'yè',
+    0x35A2: 'qí',
+    0x35A3: 'tòu',
+    0x35A4: 'hán',
+    0x35A5: 'jùn',
+    0x35A6: 'dǒng',
+    0x35A7: 'hūn,wěn',
+    0x35A8: 'lù',
+    0x35A9: 'jū,sǒu',
+    0x35AA: 'huò,guó,xù',
+    0x35AB: 'líng',
+    0x35AD: 'tiǎn',
+    0x35AE: 'lún',
+    0x35B5: 'gé',
+    0x35B6: 'yān,yè,yīn',
+    0x35B7: 'shí,tí',
+    0x35B8: 'xué,niā',
+    0x35B9: 'pēn,fèn',
+    0x35BA: 'chǔn',
+    0x35BB: 'niú,ròu',
+    0x35BC: 'duǒ',
+    0x35BD: 'zé',
+    0x35BE: 'è',
+    0x35BF: 'xié,yé',
+    0x35C0: 'yōu',
+    0x35C1: 'è',
+    0x35C2: 'shěng',
+    0x35C3: 'wěn,hūn',
+    0x35C4: 'kū',
+    0x35C5: 'hú',
+    0x35C6: 'gé',
+    0x35C7: 'xiá,ya',
+    0x35C8: 'màn',
+    0x35C9: 'lüè,è',
+    0x35CA: 'jí,léi',
+    0x35CB: 'hóu',
+    0x35CC: 'zhì',
+    0x35CF: 'wāi',
+    0x35D1: 'bai',
+    0x35D2: 'ài',
+    0x35D3: 'zhuī',
+    0x35D4: 'qiān',
+    0x35D5: 'gòu,gōu',
+    0x35D6: 'dàn',
+    0x35D7: 'bēi',
+    0x35D8: 'bó',
+    0x35D9: 'chū,nà,zhōu',
+    0x35DA: 'lì',
+    0x35DB: 'xiào',
+    0x35DC: 'xiù',
+    0x35E2: 'hóng,dòng,hòng',
+    0x35E3: 'tì',
+    0x35E4: 'cù',
+    0x35E5: 'kuò,guō',
+    0x35E6: 'láo',
+    0x35E7: 'zhì,dié',
+    0x35E8: 'xiē,ǎi',
+    0x35E9: 'xī',
+    0x35EB: 'qiè',
+    0x35EC: 'zhā',
+    0x35ED: 'xī',
+    0x35F0: 'cóng',
+    0x35F1: 'jí',
+    0x35F2: 'huò',
+    0x35F3: 'tǎ,dā',
+    0x35F4: 'yán',
+    0x35F5: 'xù',
+    0x35F6: 'pō',
+    0x35F7: 'sǎi',
+    0x35FB: 'guō',
+    0x35FC: 'yè',
+    0x35FD: 'xiǎng',
+    0x35FE: 'xuē',
+    0x35FF: 'hé,xià,xiā',
+    0x3600: 'zuò',
+    0x3601: 'yì',
+    0x3602: 'cí',
+    0x3604: 'lēng',
+    0x3605: 'xián',
+    0x3606: 'tǎi',
+    0x3607: 'róng',
+    0x3608: 'yì,nǐ',
+    0x3609: 'zhì',
+    0x360A: 'xī,yì',
+    0x360B: 'xián',
+    0x360C: 'jù',
+    0x360D: 'jí',
+    0x360E: 'hǎn',
+    0x3610: 'pào',
+    0x3611: 'lì',
+    0x3613: 'lán',
+    0x3614: 'sǎi',
+    0x3615: 'hǎn,lán',
+    0x3616: 'yán',
+    0x3617: 'qū',
+    0x3619: 'yán',
+    0x361A: 'hǎn',
+    0x361B: 'kān',
+    0x361C: 'chǐ',
+    0x361D: 'niè',
+    0x361E: 'huò',
+    0x3620: 'bì',
+    0x3621: 'xiá',
+    0x3622: 'wěng',
+    0x3623: 'xuán,yuán',
+    0x3624: 'wān',
+    0x3625: 'yóu',
+    0x3626: 'qín',
+    0x3627: 'xù',
+    0x3628: 'niè',
+    0x3629: 'bì',
+    0x362A: 'hào',
+    0x362B: 'jǐng',
+    0x362C: 'ào,wù',
+    0x362D: 'ào',
+    0x3630: 'zhēn',
+    0x3631: 'tān',
+    0x3632: 'jú',
+    0x3634: 'zuò',
+    0x3635: 'bù',
+    0x3636: 'jié',
+    0x3637: 'ài',
+    0x3638: 'zàng,zuò',
+    0x3639: 'cí',
+    0x363A: 'fá',
+    0x363F: 'niè',
+    0x3640: 'liù,jiù',
+    0x3641: 'méi,mù',
+    0x3642: 'duì,wèng',
+    0x3643: 'bāng',
+    0x3644: 'bì',
+    0x3645: 'bǎo',
+    0x3647: 'chù',
+    0x3648: 'xià',
+    0x3649: 'tiǎn',
+    0x364A: 'cháng,zhàng',
+    0x364D: 'duō',
+    0x364E: 'wēi',
+    0x364F: 'fù',
+    0x3650: 'duǒ',
+    0x3651: 'yǔ',
+    0x3652: 'yě',
+    0x3653: 'kuí',
+    0x3654: 'wěi,hán',
+    0x3655: 'kuài',
+    0x3657: 'wēi',
+    0x3658: 'yāo',
+    0x3659: 'lǒng',
+    0x365A: 'xīng',
+    0x365B: 'bǔ',
+    0x365C: 'chí',
+    0x365D: 'xié',
+    0x365E: 'niè',
+    0x365F: 'lǎng',
+    0x3660: 'yī,yì',
+    0x3661: 'zōng',
+    0x3662: 'mán',
+    0x3663: 'zhàng',
+    0x3664: 'xià',
+    0x3665: 'gùn',
+    0x3666: 'xié',
+    0x3668: 'jì',
+    0x3669: 'liáo',
+    0x366A: 'yì',
+    0x366B: 'jí',
+    0x366C: 'yín',
+    0x366E: 'dā,da',
+    0x366F: 'yì',
+    0x3670: 'xiè',
+    0x3671: 'hào',
+    0x3672: 'yǒng',
+    0x3673: 'kǎn,hǎn',
+    0x3674: 'chàn',
+    0x3675: 'tái',
+    0x3676: 'táng',
+    0x3677: 'zhí,zhé',
+    0x3678: 'bào',
+    0x3679: 'méng',
+    0x367A: 'kuí,guì',
+    0x367B: 'chán',
+    0x367C: 'lěi',
+    0x367E: 'xì',
+    0x3680: 'xī',
+    0x3681: 'qiào',
+    0x3682: 'nàng',
+    0x3683: 'yūn',
+    0x3685: 'lóng',
+    0x3686: 'fù',
+    0x3687: 'zōng',
+    0x3689: 'gǔ',
+    0x368A: 'kāi',
+    0x368B: 'diāo',
+    0x368C: 'huà',
+    0x368D: 'kuǐ,kuì',
+    0x368F: 'gǎo',
+    0x3690: 'tào',
+    0x3692: 'shǎn',
+    0x3693: 'lǎi',
+    0x3694: 'niè,xìng',
+    0x3695: 'fú',
+    0x3696: 'gǎo,zé',
+    0x3697: 'qié',
+    0x3698: 'bàn,hè,fú',
+    0x3699: 'jiā',
+    0x369A: 'kōng,kuāng',
+    0x369B: 'xì',
+    0x369C: 'yù,xù',
+    0x369D: 'zhuī',
+    0x369E: 'shěn',
+    0x369F: 'chuò',
+    0x36A0: 'xiāo',
+    0x36A1: 'jǐ',
+    0x36A2: 'nú,wǔ',
+    0x36A3: 'xiáo',
+    0x36A4: 'yì',
+    0x36A5: 'yú',
+    0x36A6: 'yí',
+    0x36A7: 'yǎn',
+    0x36A8: 'shěn',
+    0x36A9: 'rǎn',
+    0x36AA: 'hào',
+    0x36AB: 'sà',
+    0x36AC: 'jūn',
+    0x36AD: 'yóu',
+    0x36AF: 'xín',
+    0x36B0: 'pēi,bǐ',
+    0x36B1: 'qiū',
+    0x36B2: 'chān,diǎn,diàn',
+    0x36B4: 'bù',
+    0x36B5: 'dōng',
+    0x36B6: 'sì,yí',
+    0x36B7: 'ěr',
+    0x36B9: 'mǎo,liǔ',
+    0x36BA: 'yùn',
+    0x36BB: 'jī',
+    0x36BD: 'qiǎo',
+    0x36BE: 'xiōng',
+    0x36BF: 'páo',
+    0x36C0: 'chú',
+    0x36C1: 'pēng',
+    0x36C2: 'nuǒ',
+    0x36C3: 'jié',
+    0x36C4: 'yī',
+    0x36C5: 'èr',
+    0x36C6: 'duò,duǒ',
+    0x36CA: 'duǒ',
+    0x36CD: 'qiè,xiǎn,xiá',
+    0x36CE: 'lǚ',
+    0x36CF: 'qiú',
+    0x36D0: 'sǒu',
+    0x36D1: 'càn',
+    0x36D2: 'dòu',
+    0x36D3: 'xī',
+    0x36D4: 'fēng,péng',
+    0x36D5: 'yì,è',
+    0x36D6: 'suō',
+    0x36D7: 'qiē,zuō,suō',
+    0x36D8: 'pò',
+    0x36D9: 'xīn,qiè',
+    0x36DA: 'tǒng,yǒng',
+    0x36DB: 'xìn',
+    0x36DC: 'yóu',
+    0x36DD: 'bèi',
+    0x36DE: 'lòng',
+    0x36E3: 'yún',
+    0x36E4: 'lí',
+    0x36E5: 'tà',
+    0x36E6: 'lǎn',
+    0x36E7: 'mǎn',
+    0x36E8: 'qiǎng',
+    0x36E9: 'zhóu',
+    0x36EA: 'yàn,yān',
+    0x36EB: 'xī',
+    0x36EC: 'lù',
+    0x36ED: 'xī',
+    0x36EE: 'sǎo',
+    0x36EF: 'fàn,miǎn,zhuàn',
+    0x36F1: 'wěi,wēi',
+    0x36F2: 'fà',
+    0x36F3: 'yì',
+    0x36F4: 'nǎo',
+    0x36F5: 'chēng',
+    0x36F6: 'tàn',
+    0x36F7: 'jī',
+    0x36F8: 'shù',
+    0x36F9: 'pián',
+    0x36FA: 'ān',
+    0x36FB: 'kuā',
+    0x36FC: 'chā,shà',
+    0x36FE: 'xián',
+    0x36FF: 'zhì',
+    0x3702: 'fēng',
+    0x3703: 'liàn',
+    0x3704: 'xún',
+    0x3705: 'xù',
+    0x3706: 'mì',
+    0x3707: 'huì,yè',
+    0x3708: 'mù',
+    0x3709: 'yōng',
+    0x370A: 'zhǎn',
+    0x370B: 'yì',
+    0x370C: 'nǒu,gòu,kòu',
+    0x370D: 'táng',
+    0x370E: 'xī,xì',
+    0x370F: 'yún',
+    0x3710: 'shù',
+    0x3711: 'fú',
+    0x3712: 'yì',
+    0x3713: 'dá',
+    0x3715: 'lián',
+    0x3716: 'cáo',
+    0x3717: 'cān,sēn',
+    0x3718: 'jù,qù,chá',
+    0x3719: 'lù',
+    0x371A: 'sù',
+    0x371B: 'nèn',
+    0x371C: 'ào',
+    0x371D: 'ǎn,yǎn',
+    0x371E: 'qiàn,cán',
+    0x3720: 'cuī',
+    0x3721: 'cōng',
+    0x3723: 'rán,rǎn',
+    0x3724: 'niǎn,tiǎn,tán',
+    0x3725: 'mái',
+    0x3726: 'xín',
+    0x3727: 'yuè',
+    0x3728: 'nái',
+    0x3729: 'ào',
+    0x372A: 'shēn',
+    0x372B: 'mà',
+    0x372E: 'làn,lán',
+    0x372F: 'xī',
+    0x3730: 'yuè',
+    0x3731: 'zhì',
+    0x3732: 'wěng',
+    0x3733: 'huái',
+    0x3734: 'mèng',
+    0x3735: 'niǎo',
+    0x3736: 'wǎn',
+    0x3737: 'mí,xiǎn',
+    0x3738: 'niè',
+    0x3739: 'qú',
+    0x373A: 'zàn',
+    0x373B: 'liàn',
+    0x373C: 'zhí',
+    0x373D: 'zǐ',
+    0x373E: 'hái',
+    0x373F: 'xù',
+    0x3740: 'hào',
+    0x3741: 'xuān,qióng',
+    0x3742: 'zhì,zhè',
+    0x3743: 'miǎn',
+    0x3744: 'chún',
+    0x3745: 'gòu',
+    0x3747: 'chún',
+    0x3748: 'luán',
+    0x3749: 'zhù',
+    0x374A: 'shǒu',
+    0x374B: 'liǎo',
+    0x374C: 'jiù',
+    0x374D: 'xiě',
+    0x374E: 'dìng',
+    0x374F: 'jiè',
+    0x3750: 'róng',
+    0x3751: 'máng',
+    0x3753: 'kè',
+    0x3754: 'yǎo',
+    0x3755: 'níng',
+    0x3756: 'yí',
+    0x3757: 'láng,lǎng',
+    0x3758: 'yóng',
+    0x3759: 'yín',
+    0x375A: 'yán',
+    0x375B: 'sù',
+    0x375D: 'lín',
+    0x375E: 'yā,yà',
+    0x375F: 'máo',
+    0x3760: 'míng',
+    0x3761: 'zuì',
+    0x3762: 'yǔ',
+    0x3763: 'yì',
+    0x3764: 'gòu',
+    0x3765: 'mǐ',
+    0x3766: 'jùn',
+    0x3767: 'wěn',
+    0x3769: 'kāng',
+    0x376A: 'diàn',
+    0x376B: 'lóng',
+    0x376D: 'xǐng',
+    0x376E: 'cuì',
+    0x376F: 'qiáo',
+    0x3770: 'mián',
+    0x3771: 'mèng',
+    0x3772: 'qǐn',
+    0x3774: 'wán',
+    0x3775: 'dé,ài',
+    0x3776: 'ài',
+    0x3778: 'biàn',
+    0x3779: 'nóu',
+    0x377A: 'lián',
+    0x377B: 'jǐn',
+    0x377C: 'yū',
+    0x377D: 'chuí',
+    0x377E: 'zuǒ',
+    0x377F: 'bǒ',
+    0x3780: 'huī',
+    0x3781: 'yào',
+    0x3782: 'tuǐ,tuì',
+    0x3783: 'jì',
+    0x3784: 'ān',
+    0x3785: 'luò',
+    0x3786: 'jǐ',
+    0x3787: 'wěi',
+    0x3788: 'bō',
+    0x3789: 'zā',
+    0x378A: 'xù',
+    0x378B: 'niǎn,jí',
+    0x378C: 'yùn',
+    0x378E: 'bǎ,pā',
+    0x378F: 'zhé,jié',
+    0x3790: 'jū',
+    0x3791: 'wěi',
+    0x3792: 'xiè,xì',
+    0x3793: 'qì,jī',
+    0x3794: 'yí',
+    0x3795: 'xiè',
+    0x3796: 'cí,cì',
+    0x3797: 'qiú',
+    0x3798: 'dū',
+    0x3799: 'niào',
+    0x379A: 'qì,zhǎ',
+    0x379B: 'jǐ',
+    0x379C: 'tuī',
+    0x379E: 'sóng',
+    0x379F: 'diàn,dǐng',
+    0x37A0: 'láo',
+    0x37A1: 'zhǎn',
+    0x37A4: 'yín,cén',
+    0x37A5: 'cén',
+    0x37A6: 'jǐ',
+    0x37A7: 'huì',
+    0x37A8: 'zǐ',
+    0x37A9: 'lán',
+    0x37AA: 'náo',
+    0x37AB: 'jù',
+    0x37AC: 'qìn',
+    0x37AD: 'dài',
+    0x37AF: 'jié',
+    0x37B0: 'xǔ',
+    0x37B1: 'cōng',
+    0x37B2: 'yòng',
+    0x37B3: 'dǒu',
+    0x37B4: 'chí,mín',
+    0x37B6: 'mǐn',
+    0x37B7: 'huáng',
+    0x37B8: 'suì',
+    0x37B9: 'kě',
+    0x37BA: 'zú',
+    0x37BB: 'hào',
+    0x37BC: 'chéng',
+    0x37BD: 'xuè',
+    0x37BE: 'ní',
+    0x37BF: 'chì',
+    0x37C0: 'lián',
+    0x37C1: 'àn',
+    0x37C2: 'mǔ',
+    0x37C3: 'sī',
+    0x37C4: 'xiáng',
+    0x37C5: 'yáng',
+    0x37C6: 'huá',
+    0x37C7: 'cuò,cuó',
+    0x37C8: 'qiú',
+    0x37C9: 'láo',
+    0x37CA: 'fú',
+    0x37CB: 'duì',
+    0x37CC: 'máng',
+    0x37CD: 'láng,lǎng',
+    0x37CE: 'tuǒ,tuǐ',
+    0x37CF: 'hán',
+    0x37D0: 'mǎng',
+    0x37D1: 'bó',
+    0x37D2: 'qūn',
+    0x37D3: 'qí',
+    0x37D4: 'hán',
+    0x37D6: 'lòng,lóng',
+    0x37D8: 'tiáo',
+    0x37D9: 'zé',
+    0x37DA: 'qí',
+    0x37DB: 'zàn',
+    0x37DC: 'mí',
+    0x37DD: 'péi',
+    0x37DE: 'zhàn',
+    0x37DF: 'xiàng',
+    0x37E0: 'gǎng',
+    0x37E2: 'qí',
+    0x37E4: 'lù',
+    0x37E6: 'yùn',
+    0x37E7: 'è',
+    0x37E8: 'duān',
+    0x37E9: 'mín',
+    0x37EA: 'wēi,wěi',
+    0x37EB: 'quán',
+    0x37EC: 'sǒu',
+    0x37ED: 'mín',
+    0x37EE: 'tū',
+    0x37F0: 'mǐng',
+    0x37F1: 'yǎo',
+    0x37F2: 'jué',
+    0x37F3: 'lì',
+    0x37F4: 'kuài',
+    0x37F5: 'gǎng',
+    0x37F6: 'yuán',
+    0x37F7: 'da',
+    0x37F9: 'láo',
+    0x37FA: 'lóu',
+    0x37FB: 'qiàn,zhǎn',
+    0x37FC: 'áo',
+    0x37FD: 'biǎo,biāo',
+    0x37FE: 'yōng',
+    0x37FF: 'mǎng,máng',
+    0x3800: 'dǎo',
+    0x3802: 'áo',
+    0x3804: 'xí',
+    0x3805: 'fú,fù',
+    0x3806: 'dān',
+    0x3807: 'jiù',
+    0x3808: 'rùn',
+    0x3809: 'tóng',
+    0x380A: 'qū',
+    0x380B: 'è',
+    0x380C: 'qī',
+    0x380D: 'jí',
+    0x380E: 'jí,jié',
+    0x380F: 'huá',
+    0x3810: 'jiào',
+    0x3811: 'zuì',
+    0x3812: 'biǎo',
+    0x3813: 'méng',
+    0x3814: 'bài',
+    0x3815: 'wěi',
+    0x3816: 'yǐ',
+    0x3817: 'ào',
+    0x3818: 'yǔ',
+    0x3819: 'háo',
+    0x381A: 'duì',
+    0x381B: 'wò',
+    0x381C: 'nì',
+    0x381D: 'cuán',
+    0x381F: 'lí',
+    0x3820: 'lú',
+    0x3821: 'niǎo',
+    0x3822: 'huái',
+    0x3823: 'lì',
+    0x3825: 'lǜ,léi,lěi',
+    0x3826: 'fēng',
+    0x3827: 'mǐ',
+    0x3828: 'yù',
+    0x382A: 'jù',
+    0x382D: 'zhǎn',
+    0x382E: 'pēng,gāng',
+    0x382F: 'yǐ',
+    0x3831: 'jì,qǐ',
+    0x3832: 'bǐ',
+    0x3834: 'rèn',
+    0x3835: 'huāng',
+    0x3836: 'fán',
+    0x3837: 'gé',
+    0x3838: 'kù',
+    0x3839: 'jiè',
+    0x383A: 'shā,miáo',
+    0x383C: 'sī',
+    0x383D: 'tóng',
+    0x383E: 'yuān',
+    0x383F: 'zī,cǐ',
+    0x3840: 'bì',
+    0x3841: 'kuǎ',
+    0x3842: 'lì',
+    0x3843: 'huāng',
+    0x3844: 'xún',
+    0x3845: 'nuǒ',
+    0x3847: 'zhé,jiē',
+    0x3848: 'wèn,mén,miǎn',
+    0x3849: 'xián',
+    0x384A: 'qià',
+    0x384B: 'yé,ān',
+    0x384C: 'mào',
+    0x384F: 'shù,xū,tóu,shū',
+    0x3851: 'qiāo,jiǎo',
+    0x3852: 'zhūn',
+    0x3853: 'kūn',
+    0x3854: 'wù',
+    0x3855: 'yīng',
+    0x3856: 'chuáng',
+    0x3857: 'tí',
+    0x3858: 'lián,lín',
+    0x3859: 'bī',
+    0x385A: 'gōu',
+    0x385B: 'máng',
+    0x385C: 'xiè,xuě',
+    0x385D: 'fèng',
+    0x385E: 'lóu,lǚ',
+    0x385F: 'zāo',
+    0x3860: 'zhèng',
+    0x3861: 'chú',
+    0x3862: 'màn',
+    0x3863: 'lóng',
+    0x3865: 'yìn',
+    0x3866: 'pīn',
+    0x3867: 'zhèng',
+    0x3868: 'jiān,qiān',
+    0x3869: 'luán',
+    0x386A: 'nié',
+    0x386B: 'yì',
+    0x386D: 'jì',
+    0x386E: 'jí',
+    0x386F: 'zhái,dù,duó',
+    0x3870: 'yǔ',
+    0x3871: 'jiǔ',
+    0x3872: 'huán',
+    0x3873: 'zhǐ',
+    0x3874: 'lā',
+    0x3875: 'líng',
+    0x3876: 'zhǐ',
+    0x3877: 'běn',
+    0x3878: 'zhà,zhǎ,chá',
+    0x3879: 'jū',
+    0x387A: 'dàn',
+    0x387B: 'liào',
+    0x387C: 'yì',
+    0x387D: 'zhào',
+    0x387E: 'xiàn',
+    0x387F: 'chì',
+    0x3880: 'cì',
+    0x3881: 'chǐ,shǐ',
+    0x3882: 'yǎn,tuí,duī',
+    0x3883: 'láng',
+    0x3884: 'dòu',
+    0x3885: 'lòng',
+    0x3886: 'chán',
+    0x3888: 'tuí,duī',
+    0x3889: 'chá',
+    0x388A: 'ǎi,yǐ',
+    0x388B: 'chǐ',
+    0x388D: 'yǐng',
+    0x388E: 'zhé',
+    0x388F: 'tóu,yǔ,yú',
+    0x3891: 'tuí',
+    0x3892: 'chá',
+    0x3893: 'yǎo',
+    0x3894: 'zǒng',
+    0x3896: 'pān,bān',
+    0x3897: 'qiào',
+    0x3898: 'lián',
+    0x3899: 'qín',
+    0x389A: 'lǔ',
+    0x389B: 'yàn,qiān',
+    0x389C: 'kāng,kàng',
+    0x389D: 'sū',
+    0x389E: 'yì',
+    0x389F: 'chān',
+    0x38A0: 'jiǒng',
+    0x38A1: 'jiǎng',
+    0x38A3: 'jìng',
+    0x38A5: 'dòng',
+    0x38A7: 'juàn',
+    0x38A8: 'hàn',
+    0x38A9: 'dì',
+    0x38AC: 'hóng',
+    0x38AE: 'chí',
+    0x38AF: 'diāo,mín',
+    0x38B0: 'bì',
+    0x38B2: 'xùn',
+    0x38B3: 'lú',
+    0x38B5: 'xié,shè',
+    0x38B6: 'bì',
+    0x38B8: 'bì',
+    0x38BA: 'xián',
+    0x38BB: 'ruì',
+    0x38BC: 'biè',
+    0x38BD: 'ěr',
+    0x38BE: 'juàn',
+    0x38C0: 'zhèn',
+    0x38C1: 'bèi',
+    0x38C2: 'è',
+    0x38C3: 'yǔ',
+    0x38C4: 'qú',
+    0x38C5: 'zàn',
+    0x38C6: 'mí',
+    0x38C7: 'yì',
+    0x38C8: 'sì',
+    0x38CC: 'shàn',
+    0x38CD: 'tái',
+    0x38CE: 'mù',
+    0x38CF: 'jìng',
+    0x38D0: 'biàn',
+    0x38D1: 'róng',
+    0x38D2: 'cèng',
+    0x38D3: 'càn',
+    0x38D4: 'dīng',
+    0x38D9: 'dí,zhòu',
+    0x38DA: 'tǒng,tóng,dòng',
+    0x38DB: 'tà,huì',
+    0x38DC: 'xíng',
+    0x38DD: 'sōng',
+    0x38DE: 'duó',
+    0x38DF: 'xì',
+    0x38E0: 'tāo,tóng',
+    0x38E2: 'tí',
+    0x38E3: 'shàn',
+    0x38E4: 'jiàn',
+    0x38E5: 'zhì',
+    0x38E6: 'wēi',
+    0x38E7: 'yìn',
+    0x38EA: 'huǎn',
+    0x38EB: 'zhǒng,dòng',
+    0x38EC: 'qì',
+    0x38ED: 'zōng',
+    0x38EF: 'xiè',
+    0x38F0: 'xiè',
+    0x38F1: 'zé',
+    0x38F2: 'wéi',
+    0x38F5: 'tà',
+    0x38F6: 'zhān',
+    0x38F7: 'nìng',
+    0x38FB: 'yì',
+    0x38FC: 'rěn',
+    0x38FD: 'shù,nù',
+    0x38FE: 'chà',
+    0x38FF: 'zhuó,diǎo',
+    0x3901: 'miǎn',
+    0x3902: 'jí',
+    0x3903: 'fáng',
+    0x3904: 'pèi',
+    0x3905: 'ài,xì,jì',
+    0x3906: 'fàn',
+    0x3907: 'ǎo',
+    0x3908: 'qìn',
+    0x3909: 'qiā,yà',
+    0x390A: 'xiào',
+    0x390B: 'fēn',
+    0x390C: 'gān',
+    0x390D: 'qiāo,qiǎo',
+    0x390E: 'gē',
+    0x390F: 'tóng',
+    0x3910: 'chān',
+    0x3911: 'yòu',
+    0x3912: 'gāo',
+    0x3913: 'bèn',
+    0x3914: 'fù',
+    0x3915: 'chù,pò',
+    0x3916: 'zhù',
+    0x3918: 'zhòu',
+    0x391A: 'háng',
+    0x391B: 'nín',
+    0x391C: 'jué',
+    0x391D: 'chōng',
+    0x391E: 'chà,duó,zé',
+    0x391F: 'kǒng',
+    0x3920: 'liè',
+    0x3921: 'lì,liè',
+    0x3922: 'yù',
+    0x3924: 'yú',
+    0x3925: 'hài',
+    0x3926: 'lì',
+    0x3927: 'hóu',
+    0x3928: 'gǒng',
+    0x3929: 'kè',
+    0x392A: 'yuàn',
+    0x392B: 'dé',
+    0x392C: 'huì',
+    0x392E: 'guàng',
+    0x392F: 'jiǒng',
+    0x3930: 'zuò',
+    0x3931: 'fù,dòu',
+    0x3932: 'qiè',
+    0x3933: 'běi',
+    0x3934: 'chè,shè,dié',
+    0x3935: 'cí',
+    0x3936: 'máng,màng',
+    0x3937: 'hān',
+    0x3938: 'xì',
+    0x3939: 'qiú,jiù',
+    0x393A: 'huǎng',
+    0x393D: 'chóu',
+    0x393E: 'sàn,tàn',
+    0x393F: 'yān',
+    0x3940: 'zhí,dé',
+    0x3941: 'dé',
+    0x3942: 'tè',
+    0x3943: 'mèn',
+    0x3944: 'líng',
+    0x3945: 'shòu',
+    0x3946: 'tuì',
+    0x3947: 'cán',
+    0x3948: 'dié',
+    0x3949: 'chè',
+    0x394A: 'péng,pēng',
+    0x394B: 'yī',
+    0x394C: 'jú',
+    0x394D: 'jì',
+    0x394E: 'lái',
+    0x394F: 'tiǎn',
+    0x3950: 'yuàn',
+    0x3952: 'cǎi,cāi',
+    0x3953: 'qī',
+    0x3954: 'yù',
+    0x3955: 'lián',
+    0x3956: 'cōng',
+    0x395A: 'yú,yǔ',
+    0x395B: 'jí,kè',
+    0x395C: 'wèi',
+    0x395D: 'mǐ',
+    0x395E: 'suì',
+    0x395F: 'xié',
+    0x3960: 'xū',
+    0x3961: 'chì',
+    0x3962: 'qiú,jiū',
+    0x3963: 'huì',
+    0x3965: 'yú',
+    0x3966: 'qiè',
+    0x3967: 'shùn',
+    0x3968: 'shuì,wěi',
+    0x3969: 'duǒ',
+    0x396A: 'lóu',
+    0x396C: 'páng',
+    0x396D: 'tài',
+    0x396E: 'zhòu,chǎo',
+    0x396F: 'yǐn',
+    0x3970: 'sāo',
+    0x3971: 'fěi',
+    0x3972: 'chēn,shèn',
+    0x3973: 'yuán',
+    0x3974: 'yí,tí',
+    0x3975: 'hùn',
+    0x3976: 'sè,qiān',
+    0x3977: 'yè',
+    0x3978: 'mǐn',
+    0x3979: 'fěn',
+    0x397A: 'hé',
+    0x397C: 'yìn,yān',
+    0x397D: 'cè,zé',
+    0x397E: 'nì',
+    0x397F: 'ào',
+    0x3980: 'féng',
+    0x3981: 'lián,liǎn',
+    0x3982: 'cháng',
+    0x3983: 'chǎn',
+    0x3984: 'má',
+    0x3985: 'diē,dì,chài',
+    0x3986: 'hū,xiā',
+    0x3987: 'lù',
+    0x3989: 'yì',
+    0x398A: 'huá',
+    0x398B: 'zhā',
+    0x398C: 'hū,xù',
+    0x398D: 'è',
+    0x398E: 'huò',
+    0x398F: 'sǔn,xuàn',
+    0x3990: 'nì',
+    0x3991: 'xiàn,hān',
+    0x3992: 'lí',
+    0x3993: 'xiàn,rǎn',
+    0x3994: 'yàn',
+    0x3995: 'lóng',
+    0x3996: 'mèn',
+    0x3997: 'jīn,jìn',
+    0x3998: 'jī',
+    0x399A: 'biǎn',
+    0x399B: 'yǔ,yú',
+    0x399C: 'huò,xuè',
+    0x399D: 'miǎo',
+    0x399E: 'chóu',
+    0x399F: 'mái',
+    0x39A1: 'lè',
+    0x39A2: 'jié',
+    0x39A3: 'wèi',
+    0x39A4: 'yì',
+    0x39A5: 'xuān,xiǎn',
+    0x39A6: 'xì',
+    0x39A7: 'cǎn',
+    0x39A8: 'lán',
+    0x39A9: 'yǐn',
+    0x39AA: 'xiè',
+    0x39AB: 'zā',
+    0x39AC: 'luǒ',
+    0x39AD: 'líng',
+    0x39AE: 'qián',
+    0x39AF: 'huò',
+    0x39B0: 'jiān',
+    0x39B1: 'wǒ',
+    0x39B4: 'gé',
+    0x39B5: 'zhū',
+    0x39B6: 'dié,yǒng',
+    0x39B7: 'yǒng',
+    0x39B8: 'jǐ',
+    0x39B9: 'yáng',
+    0x39BA: 'rù',
+    0x39BB: 'xí',
+    0x39BC: 'shuàng',
+    0x39BD: 'yù',
+    0x39BE: 'yí',
+    0x39BF: 'qiǎn,hù',
+    0x39C0: 'jí',
+    0x39C1: 'qù,hé',
+    0x39C2: 'tián',
+    0x39C3: 'shōu,jiū',
+    0x39C4: 'qiǎn',
+    0x39C5: 'mù,dāo',
+    0x39C6: 'jīn',
+    0x39C7: 'mǎo',
+    0x39C8: 'yǐn',
+    0x39C9: 'gài,hài,yè',
+    0x39CA: 'pō,bá',
+    0x39CB: 'xuǎn',
+    0x39CC: 'mào',
+    0x39CD: 'fǎng,bēng',
+    0x39CE: 'yá,yà,qiā',
+    0x39CF: 'gāng',
+    0x39D0: 'sǒng',
+    0x39D1: 'huī',
+    0x39D2: 'yù',
+    0x39D3: 'guā',
+    0x39D4: 'guài',
+    0x39D5: 'liǔ',
+    0x39D6: 'è',
+    0x39D7: 'zǐ,jǐ,zhǐ',
+    0x39D8: 'zì',
+    0x39D9: 'bì,bié',
+    0x39DA: 'wǎ',
+    0x39DC: 'liè',
+    0x39DF: 'kuǎi',
+    0x39E1: 'hài,wèi',
+    0x39E2: 'yīn',
+    0x39E3: 'zhū',
+    0x39E4: 'chòng',
+    0x39E5: 'xiǎn',
+    0x39E6: 'xuàn,hōng',
+    0x39E8: 'qiú',
+    0x39E9: 'pèi',
+    0x39EA: 'guǐ,wěi',
+    0x39EB: 'ér,ruán,ruí',
+    0x39EC: 'gǒng',
+    0x39ED: 'qióng',
+    0x39EE: 'hū',
+    0x39EF: 'lǎo',
+    0x39F0: 'lì',
+    0x39F1: 'chèn',
+    0x39F2: 'sǎn',
+    0x39F3: 'zhuò,bāi',
+    0x39F4: 'wǒ,é',
+    0x39F5: 'póu',
+    0x39F6: 'kēng',
+    0x39F7: 'tùn',
+    0x39F8: 'pēng',
+    0x39F9: 'tè',
+    0x39FA: 'tà',
+    0x39FB: 'zhuó,zú,dū',
+    0x39FC: 'biào',
+    0x39FD: 'gù',
+    0x39FE: 'hū',
+    0x3A00: 'bǐng',
+    0x3A01: 'zhì,zhí',
+    0x3A02: 'dǒng',
+    0x3A03: 'duǐ,chéng',
+    0x3A04: 'zhōu,zhào,tiáo',
+    0x3A05: 'nèi,ruì',
+    0x3A06: 'lǐn',
+    0x3A07: 'pó',
+    0x3A08: 'jǐ',
+    0x3A09: 'mín,wěn',
+    0x3A0A: 'wěi,tuǒ,duò',
+    0x3A0B: 'chě',
+    0x3A0C: 'gòu',
+    0x3A0D: 'bāng',
+    0x3A0E: 'rú',
+    0x3A0F: 'tān',
+    0x3A10: 'bǔ',
+    0x3A11: 'zōng',
+    0x3A12: 'kuī',
+    0x3A13: 'láo',
+    0x3A14: 'hàn',
+    0x3A15: 'yíng',
+    0x3A16: 'zhì',
+    0x3A17: 'jié',
+    0x3A18: 'xǐng',
+    0x3A19: 'xié,xì',
+    0x3A1A: 'xún,sǔn',
+    0x3A1B: 'shǎn,shàn',
+    0x3A1C: 'qián',
+    0x3A1D: 'xiē',
+    0x3A1E: 'sù',
+    0x3A1F: 'hāi',
+    0x3A20: 'mì',
+    0x3A21: 'hún',
+    0x3A22: 'pī',
+    0x3A24: 'huì',
+    0x3A25: 'nà',
+    0x3A26: 'sǒng',
+    0x3A27: 'bèn',
+    0x3A28: 'chōu,liù',
+    0x3A29: 'jié',
+    0x3A2A: 'huàng,huǎng',
+    0x3A2B: 'lǎn',
+    0x3A2D: 'hù',
+    0x3A2E: 'dōu',
+    0x3A2F: 'huò',
+    0x3A30: 'gǔn',
+    0x3A31: 'yáo',
+    0x3A32: 'cè',
+    0x3A33: 'guǐ,jì',
+    0x3A34: 'jiàn',
+    0x3A35: 'jiǎn',
+    0x3A36: 'dǎo',
+    0x3A37: 'jìn',
+    0x3A38: 'mà',
+    0x3A39: 'huì,xuě',
+    0x3A3A: 'miǎn,mén',
+    0x3A3B: 'cán,shǎn,zàn,chàn',
+    0x3A3C: 'lüè',
+    0x3A3D: 'pì',
+    0x3A3E: 'yàng',
+    0x3A3F: 'jù',
+    0x3A40: 'jù',
+    0x3A41: 'què',
+    0x3A43: 'qiān',
+    0x3A44: 'shāi',
+    0x3A46: 'jiù,zú',
+    0x3A47: 'huò,zuó,huá',
+    0x3A48: 'yǔn',
+    0x3A49: 'dá,lā,xī,xié',
+    0x3A4A: 'xuān',
+    0x3A4B: 'xiāo,sù',
+    0x3A4C: 'fèi',
+    0x3A4D: 'cè',
+    0x3A4E: 'yè',
+    0x3A50: 'dèn',
+    0x3A52: 'qín',
+    0x3A53: 'huǐ',
+    0x3A54: 'tún',
+    0x3A56: 'qiáng',
+    0x3A57: 'xí',
+    0x3A58: 'nǐ',
+    0x3A59: 'sāi',
+    0x3A5A: 'méng',
+    0x3A5B: 'tuán',
+    0x3A5C: 'lǎn',
+    0x3A5D: 'háo',
+    0x3A5E: 'cì',
+    0x3A5F: 'zhài',
+    0x3A60: 'āo,piǎo,póu',
+    0x3A61: 'luǒ',
+    0x3A62: 'miè,mì',
+    0x3A64: 'fū',
+    0x3A66: 'xié,xī',
+    0x3A67: 'bó',
+    0x3A68: 'huì',
+    0x3A69: 'qǐng',
+    0x3A6A: 'xié',
+    0x3A6D: 'bó',
+    0x3A6E: 'qián',
+    0x3A6F: 'pó',
+    0x3A70: 'jiǎo',
+    0x3A71: 'jué',
+    0x3A72: 'kǔn',
+    0x3A73: 'sǒng',
+    0x3A74: 'jú,qú',
+    0x3A75: 'è',
+    0x3A76: 'niè',
+    0x3A77: 'qiān',
+    0x3A78: 'dié',
+    0x3A79: 'dié',
+    0x3A7B: 'qī,guì,guǐ',
+    0x3A7C: 'zhī',
+    0x3A7D: 'qí,chì,è',
+    0x3A7E: 'zhuì,qí',
+    0x3A7F: 'kū',
+    0x3A80: 'yú',
+    0x3A81: 'qín,kān,qiàn,qián',
+    0x3A82: 'kū',
+    0x3A83: 'hé',
+    0x3A84: 'fú',
+    0x3A86: 'dǐ',
+    0x3A87: 'xiàn',
+    0x3A88: 'guì',
+    0x3A89: 'hé',
+    0x3A8A: 'qún',
+    0x3A8B: 'hàn,hě',
+    0x3A8C: 'tǒng',
+    0x3A8D: 'bó,bèi',
+    0x3A8E: 'shǎn,nà',
+    0x3A8F: 'bǐ',
+    0x3A90: 'lù',
+    0x3A91: 'yè',
+    0x3A92: 'ní',
+    0x3A93: 'chuái',
+    0x3A94: 'sàn',
+    0x3A95: 'diào,chuò',
+    0x3A96: 'lù',
+    0x3A97: 'tǒu',
+    0x3A98: 'liǎn',
+    0x3A99: 'kě',
+    0x3A9A: 'sàn',
+    0x3A9B: 'zhěn',
+    0x3A9C: 'chuǎi,duǒ',
+    0x3A9D: 'liàn',
+    0x3A9E: 'mào',
+    0x3AA0: 'qiān,qiàn,jiān',
+    0x3AA1: 'kài,kě',
+    0x3AA2: 'shǎo',
+    0x3AA3: 'xiāo,qiāo',
+    0x3AA4: 'bì',
+    0x3AA5: 'zhā',
+    0x3AA6: 'yìn',
+    0x3AA7: 'xī',
+    0x3AA8: 'shàn',
+    0x3AA9: 'sù',
+    0x3AAA: 'sà',
+    0x3AAB: 'ruì',
+    0x3AAC: 'chuō,zhuó',
+    0x3AAD: 'lú',
+    0x3AAE: 'líng',
+    0x3AAF: 'chá',
+    0x3AB1: 'huàn',
+    0x3AB4: 'jiá',
+    0x3AB5: 'bàn',
+    0x3AB6: 'hú',
+    0x3AB7: 'dǒu',
+    0x3AB9: 'lǒu',
+    0x3ABA: 'jū',
+    0x3ABB: 'juàn',
+    0x3ABC: 'kě',
+    0x3ABD: 'suǒ',
+    0x3ABE: 'luò,gé',
+    0x3ABF: 'zhé',
+    0x3AC0: 'dǐng',
+    0x3AC1: 'duàn',
+    0x3AC2: 'zhù',
+    0x3AC3: 'yǎn',
+    0x3AC4: 'páng',
+    0x3AC5: 'chá',
+    0x3ACA: 'yǐ,ě',
+    0x3ACD: 'yóu,yǎo',
+    0x3ACE: 'huī,gǔn',
+    0x3ACF: 'yǎo',
+    0x3AD0: 'yǎo',
+    0x3AD1: 'zhǐ,shí',
+    0x3AD2: 'gǒng',
+    0x3AD3: 'qǐ',
+    0x3AD4: 'gèn',
+    0x3AD7: 'hòu',
+    0x3AD8: 'mì',
+    0x3AD9: 'fú',
+    0x3ADA: 'hū',
+    0x3ADB: 'guàng',
+    0x3ADC: 'tǎn',
+    0x3ADD: 'dī',
+    0x3ADF: 'yán',
+    0x3AE2: 'qù',
+    0x3AE4: 'chǎng',
+    0x3AE5: 'mǐng',
+    0x3AE6: 'tāo',
+    0x3AE7: 'bào',
+    0x3AE8: 'ān',
+    0x3AEB: 'xiǎn',
+    0x3AEF: 'mào',
+    0x3AF0: 'làng,lǎng',
+    0x3AF1: 'nǎn,nàn',
+    0x3AF2: 'bèi',
+    0x3AF3: 'chén',
+    0x3AF5: 'fēi',
+    0x3AF6: 'zhǒu',
+    0x3AF7: 'jī',
+    0x3AF8: 'jiē',
+    0x3AF9: 'shù',
+    0x3AFB: 'kùn',
+    0x3AFC: 'dié',
+    0x3AFD: 'lù',
+    0x3B02: 'yú',
+    0x3B03: 'tái',
+    0x3B04: 'chàn',
+    0x3B05: 'màn',
+    0x3B06: 'mǐn',
+    0x3B07: 'huàn',
+    0x3B08: 'wēn',
+    0x3B09: 'nuǎn',
+    0x3B0A: 'huàn,huǎn',
+    0x3B0B: 'hóu',
+    0x3B0C: 'jìng',
+    0x3B0D: 'bó',
+    0x3B0E: 'xiǎn',
+    0x3B0F: 'lì',
+    0x3B10: 'jìn,zī',
+    0x3B12: 'mǎng',
+    0x3B13: 'piào',
+    0x3B14: 'háo',
+    0x3B15: 'yáng',
+    0x3B17: 'xiàn',
+    0x3B18: 'sù',
+    0x3B19: 'wěi',
+    0x3B1A: 'chè',
+    0x3B1B: 'xī',
+    0x3B1C: 'jìn',
+    0x3B1D: 'céng,sōng',
+    0x3B1E: 'hè',
+    0x3B1F: 'fēn',
+    0x3B20: 'shài,shà',
+    0x3B21: 'líng',
+    0x3B23: 'duì',
+    0x3B24: 'qī',
+    0x3B25: 'pù,bó',
+    0x3B26: 'yuè',
+    0x3B27: 'bó',
+    0x3B29: 'huì',
+    0x3B2A: 'dié',
+    0x3B2B: 'yàn',
+    0x3B2C: 'jù',
+    0x3B2D: 'jiào',
+    0x3B2E: 'nàn',
+    0x3B2F: 'liè',
+    0x3B30: 'yú',
+    0x3B31: 'tì',
+    0x3B32: 'tiān',
+    0x3B33: 'wǔ',
+    0x3B34: 'hǒng',
+    0x3B35: 'xiáo',
+    0x3B36: 'hào',
+    0x3B38: 'tiāo',
+    0x3B39: 'zhēng',
+    0x3B3B: 'huāng,hāng,huǎng',
+    0x3B3C: 'fù',
+    0x3B3F: 'tūn',
+    0x3B41: 'réng',
+    0x3B42: 'jiǎo',
+    0x3B44: 'xìn',
+    0x3B47: 'yuàn',
+    0x3B48: 'jué',
+    0x3B49: 'huá',
+    0x3B4B: 'bàng',
+    0x3B4C: 'móu',
+    0x3B4E: 'gāng',
+    0x3B4F: 'wěi',
+    0x3B51: 'mèi',
+    0x3B52: 'sì',
+    0x3B53: 'biàn',
+    0x3B54: 'lú',
+    0x3B55: 'qū',
+    0x3B58: 'gé,hé',
+    0x3B59: 'zhé',
+    0x3B5A: 'lǚ',
+    0x3B5B: 'pài,bà',
+    0x3B5C: 'róng',
+    0x3B5D: 'qiú,òu',
+    0x3B5E: 'liè',
+    0x3B5F: 'gǒng',
+    0x3B60: 'xiǎn',
+    0x3B61: 'xì,xìn',
+    0x3B62: 'xīn',
+    0x3B64: 'niǎo',
+    0x3B68: 'xié',
+    0x3B69: 'liè',
+    0x3B6A: 'fū',
+    0x3B6B: 'cuó,cuán',
+    0x3B6C: 'zhuó',
+    0x3B6D: 'bā,bèi,biē',
+    0x3B6E: 'zuò,zǎn',
+    0x3B6F: 'zhé,dié',
+    0x3B70: 'zuī,zuǐ',
+    0x3B71: 'hé',
+    0x3B72: 'jí',
+    0x3B74: 'jiān',
+    0x3B78: 'tú',
+    0x3B79: 'xián',
+    0x3B7A: 'yǎn,yàn,ān',
+    0x3B7B: 'táng',
+    0x3B7C: 'tà',
+    0x3B7D: 'dǐ',
+    0x3B7E: 'jué',
+    0x3B7F: 'áng',
+    0x3B80: 'hán',
+    0x3B81: 'xiáo',
+    0x3B82: 'jú',
+    0x3B83: 'wēi,ruí',
+    0x3B84: 'bǎng',
+    0x3B85: 'zhuī',
+    0x3B86: 'niè',
+    0x3B87: 'tiàn',
+    0x3B88: 'nài',
+    0x3B8B: 'yǒu',
+    0x3B8C: 'mián',
+    0x3B8F: 'nài,nì,nà',
+    0x3B90: 'shěng,sì',
+    0x3B91: 'chā,qì',
+    0x3B92: 'yān,yīn',
+    0x3B93: 'gèn',
+    0x3B94: 'chòng,tóng',
+    0x3B95: 'ruǎn',
+    0x3B96: 'jiá',
+    0x3B97: 'qín',
+    0x3B98: 'máo',
+    0x3B99: 'è',
+    0x3B9A: 'lì',
+    0x3B9B: 'chí,yí',
+    0x3B9C: 'zāng',
+    0x3B9D: 'hé',
+    0x3B9E: 'jié',
+    0x3B9F: 'niǎn,kā',
+    0x3BA1: 'guàn',
+    0x3BA2: 'hóu',
+    0x3BA3: 'gài',
+    0x3BA5: 'bèn,fàn',
+    0x3BA6: 'suǒ,sè',
+    0x3BA7: 'wū,wēn',
+    0x3BA8: 'jì',
+    0x3BA9: 'xī',
+    0x3BAA: 'qióng',
+    0x3BAB: 'hé,xiá,qià',
+    0x3BAC: 'wēng',
+    0x3BAD: 'xián',
+    0x3BAE: 'jié',
+    0x3BAF: 'hún,huá',
+    0x3BB0: 'pí',
+    0x3BB1: 'shēn',
+    0x3BB2: 'chōu',
+    0x3BB3: 'zhèn',
+    0x3BB5: 'zhān',
+    0x3BB6: 'shuò',
+    0x3BB7: 'jī',
+    0x3BB8: 'sòng',
+    0x3BB9: 'zhǐ',
+    0x3BBA: 'běn',
+    0x3BBE: 'lǎng',
+    0x3BBF: 'bì',
+    0x3BC0: 'xuàn',
+    0x3BC1: 'péi',
+    0x3BC2: 'dài',
+    0x3BC4: 'zhī',
+    0x3BC5: 'pí,bī',
+    0x3BC6: 'chǎn,shàn',
+    0x3BC7: 'bì',
+    0x3BC8: 'sù',
+    0x3BC9: 'huò',
+    0x3BCA: 'hén',
+    0x3BCB: 'jiǒng,yǐng',
+    0x3BCC: 'chuán',
+    0x3BCD: 'jiǎng',
+    0x3BCE: 'nèn',
+    0x3BCF: 'gǔ',
+    0x3BD0: 'fǎng',
+    0x3BD3: 'tà,dá',
+    0x3BD4: 'cuì',
+    0x3BD5: 'xī',
+    0x3BD6: 'dé',
+    0x3BD7: 'xián',
+    0x3BD8: 'kuǎn',
+    0x3BD9: 'zhé',
+    0x3BDA: 'tā',
+    0x3BDB: 'hú',
+    0x3BDC: 'cuì',
+    0x3BDD: 'lù',
+    0x3BDE: 'juàn',
+    0x3BDF: 'lù',
+    0x3BE0: 'qiàn',
+    0x3BE1: 'pào,páo',
+    0x3BE2: 'zhèn',
+    0x3BE4: 'lì',
+    0x3BE5: 'cáo,zāo',
+    0x3BE6: 'qí',
+    0x3BE9: 'tì',
+    0x3BEA: 'líng',
+    0x3BEB: 'qú',
+    0x3BEC: 'liǎn',
+    0x3BED: 'lǔ',
+    0x3BEE: 'shú',
+    0x3BEF: 'gòng,dǎn,jù',
+    0x3BF0: 'zhé',
+    0x3BF1: 'pāo',
+    0x3BF2: 'jìn',
+    0x3BF3: 'qíng',
+    0x3BF6: 'zōng',
+    0x3BF7: 'pú',
+    0x3BF8: 'jǐn',
+    0x3BF9: 'biǎo',
+    0x3BFA: 'jiàn',
+    0x3BFB: 'gǔn',
+    0x3BFE: 'zāo',
+    0x3BFF: 'liè,là',
+    0x3C00: 'lí',
+    0x3C01: 'luǒ',
+    0x3C02: 'shěn',
+    0x3C03: 'mián,miàn',
+    0x3C04: 'jiàn',
+    0x3C05: 'dí,zhé',
+    0x3C06: 'bèi',
+    0x3C08: 'liǎn',
+    0x3C0A: 'xián',
+    0x3C0B: 'pín',
+    0x3C0C: 'què',
+    0x3C0D: 'lóng',
+    0x3C0E: 'zuì',
+    0x3C10: 'jué',
+    0x3C11: 'shān',
+    0x3C12: 'xué',
+    0x3C14: 'xiè',
+    0x3C16: 'lǎn',
+    0x3C17: 'qí',
+    0x3C18: 'yí',
+    0x3C19: 'nuó',
+    0x3C1A: 'lí',
+    0x3C1B: 'yuè',
+    0x3C1D: 'yǐ',
+    0x3C1E: 'chī',
+    0x3C1F: 'jì,qì',
+    0x3C20: 'hāng',
+    0x3C21: 'xiè',
+    0x3C22: 'kēng',
+    0x3C23: 'zī',
+    0x3C24: 'hē,qiè',
+    0x3C25: 'xì,huì',
+    0x3C26: 'qù',
+    0x3C27: 'hāi',
+    0x3C28: 'xiā',
+    0x3C29: 'hāi',
+    0x3C2A: 'guī',
+    0x3C2B: 'chān',
+    0x3C2C: 'xún',
+    0x3C2D: 'xū',
+    0x3C2E: 'shèn',
+    0x3C2F: 'kòu,tòu,tǒu,hòu',
+    0x3C30: 'xiā,qiè,hē',
+    0x3C31: 'shà',
+    0x3C32: 'yū,xù',
+    0x3C33: 'yà,yā',
+    0x3C34: 'pǒu',
+    0x3C35: 'zú',
+    0x3C36: 'yǒu,ǒu',
+    0x3C37: 'zì',
+    0x3C38: 'liǎn',
+    0x3C39: 'xiān,xiàn,hǎn',
+    0x3C3A: 'xià,xiá',
+    0x3C3B: 'yǐ,xī,hòu',
+    0x3C3C: 'shà,qiè',
+    0x3C3D: 'yàn',
+    0x3C3E: 'jiào',
+    0x3C3F: 'xī',
+    0x3C40: 'chǐ',
+    0x3C41: 'shì,kuǎn',
+    0x3C42: 'kāng',
+    0x3C43: 'yǐn',
+    0x3C44: 'hēi,mò',
+    0x3C45: 'yì',
+    0x3C46: 'xī',
+    0x3C47: 'sè,xì',
+    0x3C48: 'jìn',
+    0x3C49: 'yè',
+    0x3C4A: 'yōu',
+    0x3C4B: 'què',
+    0x3C4C: 'yé,chè',
+    0x3C4D: 'luán',
+    0x3C4E: 'kūn',
+    0x3C4F: 'zhèng',
+    0x3C54: 'xiē',
+    0x3C56: 'cuì',
+    0x3C57: 'xiū',
+    0x3C58: 'àn',
+    0x3C59: 'xiǔ,guǎ',
+    0x3C5A: 'cán',
+    0x3C5B: 'chuǎn,bù',
+    0x3C5C: 'zhá',
+    0x3C5E: 'yì,lā',
+    0x3C5F: 'pī,pǐ',
+    0x3C60: 'kū,gū',
+    0x3C61: 'shēng',
+    0x3C62: 'láng',
+    0x3C63: 'tuǐ',
+    0x3C64: 'xī',
+    0x3C65: 'líng,lèng',
+    0x3C66: 'qī',
+    0x3C67: 'wò,yuǎn',
+    0x3C68: 'liàn',
+    0x3C69: 'dú',
+    0x3C6A: 'mèn',
+    0x3C6B: 'làn',
+    0x3C6C: 'wěi',
+    0x3C6D: 'duàn',
+    0x3C6E: 'kuài',
+    0x3C6F: 'ái',
+    0x3C70: 'zǎi',
+    0x3C71: 'huì',
+    0x3C72: 'yì',
+    0x3C73: 'mò',
+    0x3C74: 'zì',
+    0x3C75: 'fèn',
+    0x3C76: 'péng,bēng',
+    0x3C78: 'bì',
+    0x3C79: 'lì',
+    0x3C7A: 'lú',
+    0x3C7B: 'luò',
+    0x3C7C: 'hāi',
+    0x3C7D: 'zhěn,qín',
+    0x3C7E: 'gāi,kāi',
+    0x3C7F: 'què,hù,qiǎng',
+    0x3C80: 'zhēn,chēn',
+    0x3C81: 'kōng,zhōng',
+    0x3C82: 'chéng',
+    0x3C83: 'jiù',
+    0x3C84: 'jué,kū',
+    0x3C85: 'jì',
+    0x3C86: 'líng',
+    0x3C88: 'sháo,táo',
+    0x3C89: 'què',
+    0x3C8A: 'ruì',
+    0x3C8B: 'chuò',
+    0x3C8C: 'nèng',
+    0x3C8D: 'zhī',
+    0x3C8E: 'lóu',
+    0x3C8F: 'pāo',
+    0x3C92: 'bào,qú',
+    0x3C93: 'róng,shù',
+    0x3C94: 'xiān',
+    0x3C95: 'lèi',
+    0x3C96: 'xiāo',
+    0x3C97: 'fū',
+    0x3C98: 'qú',
+    0x3C9A: 'shā',
+    0x3C9B: 'zhǐ',
+    0x3C9C: 'tán',
+    0x3C9D: 'rǒng',
+    0x3C9E: 'sū,zú',
+    0x3C9F: 'yǐng',
+    0x3CA0: 'máo',
+    0x3CA1: 'nài',
+    0x3CA2: 'biàn',
+    0x3CA4: 'shuāi',
+    0x3CA5: 'táng',
+    0x3CA6: 'hàn',
+    0x3CA7: 'sào',
+    0x3CA8: 'róng',
+    0x3CAA: 'dēng',
+    0x3CAB: 'pú',
+    0x3CAC: 'jiāo',
+    0x3CAD: 'tǎn',
+    0x3CAF: 'rán',
+    0x3CB0: 'níng',
+    0x3CB1: 'liè',
+    0x3CB2: 'dié',
+    0x3CB3: 'dié,zhì',
+    0x3CB4: 'zhòng',
+    0x3CB6: 'lǜ',
+    0x3CB7: 'dàn',
+    0x3CB8: 'xī',
+    0x3CB9: 'guǐ',
+    0x3CBA: 'jí',
+    0x3CBB: 'nì',
+    0x3CBC: 'yì,chà',
+    0x3CBD: 'niàn,rěn',
+    0x3CBE: 'yǔ',
+    0x3CBF: 'wǎng',
+    0x3CC0: 'guò',
+    0x3CC1: 'zè',
+    0x3CC2: 'yán,yàn',
+    0x3CC3: 'cuì',
+    0x3CC4: 'xián',
+    0x3CC5: 'jiǎo',
+    0x3CC6: 'tǒu',
+    0x3CC7: 'fù',
+    0x3CC8: 'pèi',
+    0x3CCA: 'yōu,zhōng',
+    0x3CCB: 'qiū',
+    0x3CCC: 'yā',
+    0x3CCD: 'bù',
+    0x3CCE: 'biàn',
+    0x3CCF: 'shì',
+    0x3CD0: 'zhá',
+    0x3CD1: 'yì',
+    0x3CD2: 'biàn',
+    0x3CD4: 'duì',
+    0x3CD5: 'lán',
+    0x3CD6: 'yī',
+    0x3CD7: 'chài,chà',
+    0x3CD8: 'chōng',
+    0x3CD9: 'xuàn',
+    0x3CDA: 'xù',
+    0x3CDB: 'yú,yóu',
+    0x3CDC: 'xiū',
+    0x3CE0: 'tà',
+    0x3CE1: 'guō',
+    0x3CE5: 'lòng',
+    0x3CE6: 'xiè',
+    0x3CE7: 'chè,rè',
+    0x3CE8: 'jiǎn',
+    0x3CE9: 'tān',
+    0x3CEA: 'pì',
+    0x3CEB: 'zǎn',
+    0x3CEC: 'xuán',
+    0x3CED: 'xián',
+    0x3CEE: 'niào',
+    0x3CF4: 'mì',
+    0x3CF5: 'jì',
+    0x3CF6: 'nǒu,rǔ',
+    0x3CF7: 'hū,mǐn,wěn,tuì',
+    0x3CF8: 'huā',
+    0x3CF9: 'wǎng,wāng',
+    0x3CFA: 'yóu',
+    0x3CFB: 'zé',
+    0x3CFC: 'bì,yù',
+    0x3CFD: 'mǐ',
+    0x3CFE: 'qiāng',
+    0x3CFF: 'xiè',
+    0x3D00: 'fàn,fān',
+    0x3D01: 'yì',
+    0x3D02: 'tān',
+    0x3D03: 'lèi',
+    0x3D04: 'yǒng',
+    0x3D06: 'jìn',
+    0x3D07: 'shè,máng',
+    0x3D08: 'yìn',
+    0x3D09: 'jǐ',
+    0x3D0B: 'sù',
+    0x3D0E: 'nài',
+    0x3D0F: 'wǎng',
+    0x3D10: 'miàn,miǎn',
+    0x3D11: 'sù',
+    0x3D12: 'yì',
+    0x3D13: 'shāi',
+    0x3D14: 'xī,jí,yì,sè',
+    0x3D15: 'jí',
+    0x3D16: 'luò',
+    0x3D17: 'yōu',
+    0x3D18: 'mào',
+    0x3D19: 'zhǎ,zhá',
+    0x3D1A: 'suì',
+    0x3D1B: 'zhì',
+    0x3D1C: 'biàn',
+    0x3D1D: 'lí',
+    0x3D25: 'qiào',
+    0x3D26: 'guàn',
+    0x3D27: 'xī',
+    0x3D28: 'zhèn',
+    0x3D29: 'yōng',
+    0x3D2A: 'niè',
+    0x3D2B: 'jùn,yá',
+    0x3D2C: 'xiè',
+    0x3D2D: 'yǎo',
+    0x3D2E: 'xiè',
+    0x3D2F: 'zhī',
+    0x3D30: 'néng',
+    0x3D32: 'sī',
+    0x3D33: 'lǒng',
+    0x3D34: 'chén',
+    0x3D35: 'mì',
+    0x3D36: 'què,hú',
+    0x3D37: 'dān',
+    0x3D38: 'shǎn',
+    0x3D3C: 'sù',
+    0x3D3D: 'xiè',
+    0x3D3E: 'bó',
+    0x3D3F: 'dǐng',
+    0x3D40: 'zú',
+    0x3D42: 'shù',
+    0x3D43: 'shé',
+    0x3D44: 'hàn,yù',
+    0x3D45: 'tān,tàn',
+    0x3D46: 'gǎo',
+    0x3D4A: 'nà',
+    0x3D4B: 'mì',
+    0x3D4C: 'xún',
+    0x3D4D: 'mèn',
+    0x3D4E: 'jiàn',
+    0x3D4F: 'cuǐ',
+    0x3D50: 'jué',
+    0x3D51: 'hè',
+    0x3D52: 'fèi,pài,bì',
+    0x3D53: 'shí',
+    0x3D54: 'chě',
+    0x3D55: 'shèn',
+    0x3D56: 'nǜ',
+    0x3D57: 'píng',
+    0x3D58: 'màn',
+    0x3D5D: 'yì',
+    0x3D5E: 'chóu',
+    0x3D60: 'kū',
+    0x3D61: 'báo',
+    0x3D62: 'léi',
+    0x3D63: 'kě',
+    0x3D64: 'shà',
+    0x3D65: 'bì',
+    0x3D66: 'suí',
+    0x3D67: 'gé,yì',
+    0x3D68: 'pì,bó',
+    0x3D69: 'yì',
+    0x3D6A: 'xián,yàn,yán',
+    0x3D6B: 'nì',
+    0x3D6C: 'yíng',
+    0x3D6D: 'zhǔ',
+    0x3D6E: 'chún',
+    0x3D6F: 'féng',
+    0x3D70: 'xù',
+    0x3D71: 'piǎo',
+    0x3D72: 'wǔ',
+    0x3D73: 'liáo',
+    0x3D74: 'cáng',
+    0x3D75: 'zòu,jù',
+    0x3D76: 'zuō',
+    0x3D77: 'biàn',
+    0x3D78: 'yào',
+    0x3D79: 'huán,mò',
+    0x3D7A: 'pài',
+    0x3D7B: 'xiū',
+    0x3D7D: 'lěi',
+    0x3D7E: 'qìng,jìng',
+    0x3D7F: 'xiào',
+    0x3D80: 'jiāo',
+    0x3D81: 'guó,huò',
+    0x3D84: 'yán',
+    0x3D85: 'xué',
+    0x3D86: 'zhū,chú',
+    0x3D87: 'héng',
+    0x3D88: 'yíng',
+    0x3D89: 'xī',
+    0x3D8C: 'lián',
+    0x3D8D: 'xiǎn',
+    0x3D8E: 'huán',
+    0x3D8F: 'yīn',
+    0x3D91: 'liàn',
+    0x3D92: 'shǎn,shěn,tàn',
+    0x3D93: 'cáng',
+    0x3D94: 'bèi',
+    0x3D95: 'jiǎn',
+    0x3D96: 'shù',
+    0x3D97: 'fàn,fán',
+    0x3D98: 'diàn',
+    0x3D9A: 'bà',
+    0x3D9B: 'yú',
+    0x3D9E: 'nǎng',
+    0x3D9F: 'lěi',
+    0x3DA0: 'yì',
+    0x3DA1: 'dài,huǒ',
+    0x3DA3: 'chán,yín',
+    0x3DA4: 'chǎo',
+    0x3DA5: 'gān',
+    0x3DA6: 'jìn',
+    0x3DA7: 'nèn',
+    0x3DAB: 'liǎo',
+    0x3DAC: 'mò',
+    0x3DAD: 'yǒu',
+    0x3DAF: 'liù',
+    0x3DB0: 'hán',
+    0x3DB2: 'yòng',
+    0x3DB3: 'jìn',
+    0x3DB4: 'chǐ',
+    0x3DB5: 'rèn',
+    0x3DB6: 'nóng',
+    0x3DB9: 'hòng',
+    0x3DBA: 'tiàn',
+    0x3DBC: 'āi,xī',
+    0x3DBD: 'guā',
+    0x3DBE: 'biāo',
+    0x3DBF: 'bó',
+    0x3DC0: 'qióng',
+    0x3DC2: 'shù',
+    0x3DC3: 'chuǐ',
+    0x3DC4: 'huǐ',
+    0x3DC5: 'chǎo',
+    0x3DC6: 'fù',
+    0x3DC7: 'huī,guài',
+    0x3DC8: 'è',
+    0x3DC9: 'wèi',
+    0x3DCA: 'fén',
+    0x3DCB: 'tán',
+    0x3DCD: 'lún',
+    0x3DCE: 'hè',
+    0x3DCF: 'yǒng',
+    0x3DD0: 'huǐ',
+    0x3DD2: 'yú',
+    0x3DD3: 'zǒng',
+    0x3DD4: 'yàn',
+    0x3DD5: 'qiú',
+    0x3DD6: 'zhào',
+    0x3DD7: 'jiǒng',
+    0x3DD8: 'tái',
+    0x3DDF: 'tuì',
+    0x3DE0: 'lín',
+    0x3DE1: 'jiǒng',
+    0x3DE2: 'zhǎ',
+    0x3DE3: 'xīng',
+    0x3DE4: 'hù,xuè',
+    0x3DE6: 'xù',
+    0x3DEA: 'cuì',
+    0x3DEB: 'qǐng',
+    0x3DEC: 'mò',
+    0x3DEE: 'zāo',
+    0x3DEF: 'bèng',
+    0x3DF0: 'chī,lí',
+    0x3DF3: 'yàn',
+    0x3DF4: 'gé',
+    0x3DF5: 'mò',
+    0x3DF6: 'bèi',
+    0x3DF7: 'juǎn',
+    0x3DF8: 'dié',
+    0x3DF9: 'zhào,shào',
+    0x3DFB: 'wú',
+    0x3DFC: 'yàn',
+    0x3DFE: 'jué',
+    0x3DFF: 'xiān',
+    0x3E00: 'tái',
+    0x3E01: 'hǎn',
+    0x3E03: 'diǎn',
+    0x3E04: 'jì',
+    0x3E05: 'jié,jí',
+    0x3E06: 'kào',
+    0x3E07: 'zuǎn',
+    0x3E09: 'xiè',
+    0x3E0A: 'lài,là',
+    0x3E0B: 'fán',
+    0x3E0C: 'huò',
+    0x3E0D: 'xì',
+    0x3E0E: 'niè',
+    0x3E0F: 'mí',
+    0x3E10: 'rán',
+    0x3E11: 'cuàn',
+    0x3E12: 'yín,jīng',
+    0x3E13: 'mì',
+    0x3E15: 'jué',
+    0x3E16: 'qū',
+    0x3E17: 'tóng',
+    0x3E18: 'wàn',
+    0x3E19: 'zhē',
+    0x3E1A: 'lǐ,lì',
+    0x3E1B: 'sháo',
+    0x3E1C: 'kòng',
+    0x3E1D: 'xiān,kǎn',
+    0x3E1E: 'zhé',
+    0x3E1F: 'zhī',
+    0x3E20: 'tiǎo',
+    0x3E21: 'shū',
+    0x3E22: 'bèi',
+    0x3E23: 'yè',
+    0x3E24: 'piàn',
+    0x3E25: 'chàn',
+    0x3E26: 'hù,jià',
+    0x3E27: 'kèn',
+    0x3E28: 'jiū',
+    0x3E29: 'ān',
+    0x3E2A: 'chún',
+    0x3E2B: 'qián',
+    0x3E2C: 'bèi',
+    0x3E2D: 'bā',
+    0x3E2E: 'fén',
+    0x3E2F: 'kē',
+    0x3E30: 'tuó',
+    0x3E31: 'tuó',
+    0x3E32: 'zuó',
+    0x3E33: 'líng',
+    0x3E35: 'guǐ',
+    0x3E36: 'yān',
+    0x3E37: 'shì',
+    0x3E38: 'hǒu,ǒu,kǒu',
+    0x3E39: 'liè,luō',
+    0x3E3A: 'shā',
+    0x3E3B: 'sì',
+    0x3E3D: 'bèi',
+    0x3E3E: 'rèn',
+    0x3E3F: 'dú',
+    0x3E40: 'bó',
+    0x3E41: 'liáng',
+    0x3E42: 'qiǎn',
+    0x3E43: 'fèi',
+    0x3E44: 'jì',
+    0x3E45: 'zǒng',
+    0x3E46: 'huī',
+    0x3E47: 'hé,jiān',
+    0x3E48: 'lí',
+    0x3E49: 'yuán,wán',
+    0x3E4A: 'yuè',
+    0x3E4B: 'xiū',
+    0x3E4C: 'chǎn,shèng',
+    0x3E4D: 'dí',
+    0x3E4E: 'léi',
+    0x3E4F: 'jǐn',
+    0x3E50: 'chóng',
+    0x3E51: 'sì',
+    0x3E52: 'pǔ',
+    0x3E53: 'yǎo',
+    0x3E54: 'jiāng',
+    0x3E55: 'huān',
+    0x3E56: 'huàn',
+    0x3E57: 'tāo',
+    0x3E58: 'rù',
+    0x3E59: 'wěng',
+    0x3E5A: 'yíng',
+    0x3E5B: 'ráo',
+    0x3E5C: 'yín',
+    0x3E5D: 'shì',
+    0x3E5E: 'yín,yǐn,yá',
+    0x3E5F: 'jué,kuài',
+    0x3E60: 'tún',
+    0x3E61: 'xuán',
+    0x3E62: 'jiā,gā',
+    0x3E63: 'zhōng',
+    0x3E64: 'qiè',
+    0x3E65: 'zhù',
+    0x3E66: 'diāo',
+    0x3E68: 'yòu',
+    0x3E6B: 'yí',
+    0x3E6C: 'shǐ',
+    0x3E6D: 'yì',
+    0x3E6E: 'mò',
+    0x3E71: 'què',
+    0x3E72: 'xiāo,xiào',
+    0x3E73: 'wú',
+    0x3E74: 'gēng',
+    0x3E75: 'yǐng',
+    0x3E76: 'tíng',
+    0x3E77: 'shǐ',
+    0x3E78: 'ní',
+    0x3E79: 'gēng',
+    0x3E7A: 'tà',
+    0x3E7B: 'wō,wēi',
+    0x3E7C: 'jú',
+    0x3E7D: 'chǎn',
+    0x3E7E: 'piǎo,jiào',
+    0x3E7F: 'zhuó,zhào',
+    0x3E80: 'hū,náo',
+    0x3E81: 'nǎo',
+    0x3E82: 'yán,gǎn',
+    0x3E83: 'gǒu',
+    0x3E84: 'yǔ,yú',
+    0x3E85: 'hóu',
+    0x3E87: 'sī',
+    0x3E88: 'chī',
+    0x3E89: 'hù',
+    0x3E8A: 'yàng',
+    0x3E8B: 'wēng',
+    0x3E8C: 'xiàn',
+    0x3E8D: 'pín',
+    0x3E8E: 'róng',
+    0x3E8F: 'lóu',
+    0x3E90: 'lǎo,sāo',
+    0x3E91: 'shān,shàn,sāo,shǎn',
+    0x3E92: 'xiāo,nǎo,qiāo,xiào',
+    0x3E93: 'zé',
+    0x3E94: 'hài,huī',
+    0x3E95: 'fán,biàn',
+    0x3E96: 'hǎn',
+    0x3E97: 'chān',
+    0x3E98: 'zhàn',
+    0x3E9A: 'tǎ',
+    0x3E9B: 'zhù',
+    0x3E9C: 'nóng',
+    0x3E9D: 'hàn',
+    0x3E9E: 'yú',
+    0x3E9F: 'zhuó',
+    0x3EA0: 'yòu',
+    0x3EA1: 'lì',
+    0x3EA2: 'huò,huō',
+    0x3EA3: 'xī',
+    0x3EA4: 'xiān',
+    0x3EA5: 'chán',
+    0x3EA6: 'lián',
+    0x3EA8: 'sī',
+    0x3EA9: 'jiù,qiú',
+    0x3EAA: 'pú',
+    0x3EAB: 'qiú',
+    0x3EAC: 'gǒng',
+    0x3EAD: 'zǐ',
+    0x3EAE: 'yú',
+    0x3EB1: 'réng',
+    0x3EB2: 'niǔ',
+    0x3EB3: 'méi',
+    0x3EB4: 'bā',
+    0x3EB5: 'jiú',
+    0x3EB7: 'xù',
+    0x3EB8: 'píng',
+    0x3EB9: 'biàn',
+    0x3EBA: 'mào',
+    0x3EBF: 'yí',
+    0x3EC0: 'yú',
+    0x3EC2: 'píng',
+    0x3EC3: 'qū',
+    0x3EC4: 'bǎo',
+    0x3EC5: 'huì',
+    0x3EC9: 'bù',
+    0x3ECA: 'máng',
+    0x3ECB: 'là',
+    0x3ECC: 'tú',
+    0x3ECD: 'wú',
+    0x3ECE: 'lì',
+    0x3ECF: 'líng',
+    0x3ED1: 'jì',
+    0x3ED2: 'jùn',
+    0x3ED3: 'zōu',
+    0x3ED4: 'duǒ',
+    0x3ED5: 'jué',
+    0x3ED6: 'dài',
+    0x3ED7: 'bèi',
+    0x3EDD: 'là',
+    0x3EDE: 'bīn,bān',
+    0x3EDF: 'suí',
+    0x3EE0: 'tú',
+    0x3EE1: 'xuē,dié',
+    0x3EE7: 'duò',
+    0x3EEA: 'suì',
+    0x3EEB: 'bì',
+    0x3EEC: 'tū',
+    0x3EED: 'sè',
+    0x3EEE: 'càn',
+    0x3EEF: 'tú',
+    0x3EF0: 'miǎn',
+    0x3EF1: 'jīn',
+    0x3EF2: 'lǚ',
+    0x3EF5: 'zhàn',
+    0x3EF6: 'bǐ',
+    0x3EF7: 'jí',
+    0x3EF8: 'zēn',
+    0x3EF9: 'xuān',
+    0x3EFA: 'lì',
+    0x3EFD: 'suì,xuán',
+    0x3EFE: 'yōng',
+    0x3EFF: 'shǔ',
+    0x3F02: 'é',
+    0x3F07: 'qióng',
+    0x3F08: 'luó',
+    0x3F09: 'zhèn',
+    0x3F0A: 'tún',
+    0x3F0B: 'gū,rǔ',
+    0x3F0C: 'yǔ',
+    0x3F0D: 'lěi',
+    0x3F0E: 'bó',
+    0x3F0F: 'něi',
+    0x3F10: 'pián',
+    0x3F11: 'liàn',
+    0x3F12: 'tǎng',
+    0x3F13: 'lián',
+    0x3F14: 'wēn',
+    0x3F15: 'dāng',
+    0x3F16: 'lì',
+    0x3F17: 'tíng',
+    0x3F18: 'wǎ',
+    0x3F19: 'zhòu',
+    0x3F1A: 'gāng',
+    0x3F1B: 'xíng',
+    0x3F1C: 'àng',
+    0x3F1D: 'fàn',
+    0x3F1E: 'pèng,bèng',
+    0x3F1F: 'bó',
+    0x3F20: 'tuó',
+    0x3F21: 'shū',
+    0x3F22: 'yí',
+    0x3F23: 'bó',
+    0x3F24: 'qiè',
+    0x3F25: 'tǒu,kǎo',
+    0x3F26: 'gǒng',
+    0x3F27: 'tóng',
+    0x3F28: 'hán',
+    0x3F29: 'chéng,shèng',
+    0x3F2A: 'jié',
+    0x3F2B: 'huàn,huà',
+    0x3F2C: 'xìng',
+    0x3F2D: 'diàn',
+    0x3F2E: 'chāi,qì',
+    0x3F2F: 'dòng',
+    0x3F30: 'pí',
+    0x3F31: 'ruǎn,jùn',
+    0x3F32: 'liè',
+    0x3F33: 'shěng',
+    0x3F34: 'ǒu',
+    0x3F35: 'dì',
+    0x3F36: 'yú',
+    0x3F37: 'chuán,zhuān',
+    0x3F38: 'róng',
+    0x3F39: 'kāng,huāng',
+    0x3F3A: 'táng',
+    0x3F3B: 'cóng',
+    0x3F3C: 'piáo',
+    0x3F3D: 'chuǎng,shuǎng',
+    0x3F3E: 'lù',
+    0x3F3F: 'tóng,zhòng',
+    0x3F40: 'zhèng',
+    0x3F41: 'lì',
+    0x3F42: 'sà',
+    0x3F43: 'pān',
+    0x3F44: 'sī',
+    0x3F46: 'dāng',
+    0x3F47: 'hú',
+    0x3F48: 'yì',
+    0x3F49: 'xiàn',
+    0x3F4A: 'xiè',
+    0x3F4B: 'luó',
+    0x3F4C: 'liù',
+    0x3F4E: 'tán,xīn',
+    0x3F4F: 'gàn',
+    0x3F51: 'tán',
+    0x3F55: 'yóu',
+    0x3F56: 'nán',
+    0x3F58: 'gǎng',
+    0x3F59: 'jùn',
+    0x3F5A: 'chì',
+    0x3F5B: 'gōu,qú',
+    0x3F5C: 'wǎn',
+    0x3F5D: 'lì',
+    0x3F5E: 'liú',
+    0x3F5F: 'liè',
+    0x3F60: 'xiá',
+    0x3F61: 'bēi',
+    0x3F62: 'ǎn',
+    0x3F63: 'yù',
+    0x3F64: 'jú',
+    0x3F65: 'róu',
+    0x3F66: 'xún',
+    0x3F67: 'zī',
+    0x3F68: 'cuó',
+    0x3F69: 'càn',
+    0x3F6A: 'zěng',
+    0x3F6B: 'yōng',
+    0x3F6C: 'fù,pì',
+    0x3F6D: 'ruǎn',
+    0x3F6F: 'xí',
+    0x3F70: 'shù',
+    0x3F71: 'jiǎo,jiū,niú',
+    0x3F72: 'jiǎo,xiǔ',
+    0x3F73: 'xū',
+    0x3F74: 'zhàng',
+    0x3F77: 'shuì',
+    0x3F78: 'chén',
+    0x3F79: 'fǎn,fàn',
+    0x3F7A: 'jí',
+    0x3F7B: 'zhī',
+    0x3F7D: 'gù',
+    0x3F7E: 'wù',
+    0x3F80: 'qiè,qǔ',
+    0x3F81: 'shù',
+    0x3F82: 'hāi',
+    0x3F83: 'tuó',
+    0x3F84: 'dú,chóu',
+    0x3F85: 'zǐ',
+    0x3F86: 'rán',
+    0x3F87: 'mù',
+    0x3F88: 'fù',
+    0x3F89: 'líng',
+    0x3F8A: 'jí,cì,sè',
+    0x3F8B: 'xiū,xiù',
+    0x3F8C: 'xuǎn',
+    0x3F8D: 'nái',
+    0x3F8E: 'yā,xiā',
+    0x3F8F: 'jiè,yá',
+    0x3F90: 'lì',
+    0x3F91: 'dá,hè,da',
+    0x3F92: 'rú,rù',
+    0x3F93: 'yuān',
+    0x3F94: 'lǚ',
+    0x3F95: 'shěn',
+    0x3F96: 'lǐ',
+    0x3F97: 'liàng',
+    0x3F98: 'gěng',
+    0x3F99: 'xìn,xì',
+    0x3F9A: 'xiē',
+    0x3F9B: 'qǐn',
+    0x3F9C: 'qiè',
+    0x3F9D: 'chè',
+    0x3F9E: 'yóu',
+    0x3F9F: 'bù',
+    0x3FA0: 'kuáng',
+    0x3FA1: 'què',
+    0x3FA2: 'ài',
+    0x3FA3: 'qīn',
+    0x3FA4: 'qiāng',
+    0x3FA5: 'chù',
+    0x3FA6: 'pèi,pēi',
+    0x3FA7: 'kuò,luǒ',
+    0x3FA8: 'yī,qǐ,ǎi',
+    0x3FA9: 'guāi',
+    0x3FAA: 'shěng',
+    0x3FAB: 'piān',
+    0x3FAD: 'zhòu',
+    0x3FAE: 'huáng',
+    0x3FAF: 'huī,tuí',
+    0x3FB0: 'hú',
+    0x3FB1: 'bèi',
+    0x3FB4: 'zhā',
+    0x3FB5: 'jì',
+    0x3FB6: 'gǔ',
+    0x3FB7: 'xī',
+    0x3FB8: 'gǎo',
+    0x3FB9: 'chái,zhài,chí',
+    0x3FBA: 'mà',
+    0x3FBB: 'zhù,chú',
+    0x3FBC: 'tuǐ',
+    0x3FBD: 'zhuì,tuí',
+    0x3FBE: 'xiān,lián',
+    0x3FBF: 'láng',
+    0x3FC3: 'zhì,dài',
+    0x3FC4: 'ài',
+    0x3FC5: 'xiǎn',
+    0x3FC6: 'guō',
+    0x3FC7: 'xí,xì',
+    0x3FC9: 'tuǐ',
+    0x3FCA: 'cǎn',
+    0x3FCB: 'sào',
+    0x3FCC: 'xiān',
+    0x3FCD: 'jiè',
+    0x3FCE: 'fèn,fén',
+    0x3FCF: 'qún',
+    0x3FD1: 'yào',
+    0x3FD2: 'dǎo,zhòu,chóu',
+    0x3FD3: 'jiá',
+    0x3FD4: 'lěi',
+    0x3FD5: 'yán',
+    0x3FD6: 'lú,lù',
+    0x3FD7: 'tuí',
+    0x3FD8: 'yíng',
+    0x3FD9: 'pì',
+    0x3FDA: 'luò',
+    0x3FDB: 'lì',
+    0x3FDC: 'biě',
+    0x3FDE: 'mào',
+    0x3FDF: 'bái',
+    0x3FE0: 'huàng',
+    0x3FE2: 'yào',
+    0x3FE3: 'hē',
+    0x3FE4: 'chǔn',
+    0x3FE5: 'hé',
+    0x3FE6: 'nìng',
+    0x3FE7: 'chóu',
+    0x3FE8: 'lì',
+    0x3FE9: 'tǎng',
+    0x3FEA: 'huán',
+    0x3FEB: 'bì',
+    0x3FEC: 'bā',
+    0x3FED: 'chè,lè',
+    0x3FEE: 'yàng',
+    0x3FEF: 'dá',
+    0x3FF0: 'áo,bì',
+    0x3FF1: 'xué',
+    0x3FF3: 'zī',
+    0x3FF4: 'dā',
+    0x3FF5: 'rǎn',
+    0x3FF6: 'bāng',
+    0x3FF7: 'cuó,cāo',
+    0x3FF8: 'wǎn,mán',
+    0x3FF9: 'tà',
+    0x3FFA: 'báo',
+    0x3FFB: 'gān',
+    0x3FFC: 'yán',
+    0x3FFD: 'xī',
+    0x3FFE: 'zhù',
+    0x3FFF: 'yǎ',
+    0x4000: 'fàn',
+    0x4001: 'yòu',
+    0x4002: 'ān',
+    0x4003: 'tuí',
+    0x4004: 'méng',
+    0x4005: 'shè',
+    0x4006: 'jìn',
+    0x4007: 'gǔ',
+    0x4008: 'jì',
+    0x4009: 'qiáo',
+    0x400A: 'jiǎo',
+    0x400B: 'yán',
+    0x400C: 'xì',
+    0x400D: 'kàn',
+    0x400E: 'miǎn',
+    0x400F: 'xuàn,xún',
+    0x4010: 'shān',
+    0x4011: 'wò',
+    0x4012: 'qiān',
+    0x4013: 'huàn',
+    0x4014: 'rèn',
+    0x4015: 'zhèn',
+    0x4016: 'tiān',
+    0x4017: 'jué,xuè',
+    0x4018: 'xié,jī',
+    0x4019: 'qì',
+    0x401A: 'áng',
+    0x401B: 'mèi,wù,mà',
+    0x401C: 'gǔ',
+    0x401E: 'tāo',
+    0x401F: 'fán',
+    0x4020: 'jù',
+    0x4021: 'chàn,diān,tàn',
+    0x4022: 'shùn',
+    0x4023: 'bì,mà',
+    0x4024: 'mào',
+    0x4025: 'shuò',
+    0x4026: 'gǔ',
+    0x4027: 'hǒng',
+    0x4028: 'huà,guā',
+    0x4029: 'luò',
+    0x402A: 'háng',
+    0x402B: 'jiá,tǔn',
+    0x402C: 'quán',
+    0x402D: 'gāi',
+    0x402E: 'huāng',
+    0x402F: 'bǔ',
+    0x4030: 'gǔ',
+    0x4031: 'fēng',
+    0x4032: 'mù',
+    0x4033: 'ài',
+    0x4034: 'yǐng,yà,kēng',
+    0x4035: 'shùn',
+    0x4036: 'liàng,lǎng',
+    0x4037: 'jié',
+    0x4038: 'chì',
+    0x4039: 'jié,zhǎ,shè,jiá,yà',
+    0x403A: 'chōu,tāo',
+    0x403B: 'pìng',
+    0x403C: 'chēn,rèn',
+    0x403D: 'yán',
+    0x403E: 'dǔ',
+    0x403F: 'dì',
+    0x4041: 'liàng',
+    0x4042: 'xiàn',
+    0x4043: 'biāo',
+    0x4044: 'xìng',
+    0x4045: 'měng,mèng',
+    0x4046: 'yè',
+    0x4047: 'mì',
+    0x4048: 'qì',
+    0x4049: 'qì',
+    0x404A: 'wò',
+    0x404B: 'xiè,zhé',
+    0x404C: 'yù',
+    0x404D: 'qià,kān',
+    0x404E: 'chéng,tíng,chēng',
+    0x404F: 'yǎo',
+    0x4050: 'yīng,yìng',
+    0x4051: 'yáng',
+    0x4052: 'jí,zí',
+    0x4053: 'zōng,zǒng,jiè',
+    0x4054: 'xuān,hàn',
+    0x4055: 'mín',
+    0x4056: 'lōu',
+    0x4057: 'kǎi',
+    0x4058: 'yǎo',
+    0x4059: 'yǎn',
+    0x405A: 'sǔn,qióng',
+    0x405B: 'guì',
+    0x405C: 'huàng,huǎng',
+    0x405D: 'yíng,yǐng',
+    0x405E: 'shěng',
+    0x405F: 'chá',
+    0x4060: 'lián',
+    0x4062: 'xuán',
+    0x4063: 'chuán',
+    0x4064: 'chè,zhé,huǐ',
+    0x4065: 'nì',
+    0x4066: 'qù',
+    0x4067: 'miáo',
+    0x4068: 'huò',
+    0x4069: 'yú',
+    0x406A: 'zhǎn',
+    0x406B: 'hú,méng',
+    0x406C: 'céng',
+    0x406D: 'biāo',
+    0x406E: 'qián',
+    0x406F: 'xī,xié',
+    0x4070: 'jiǎng',
+    0x4071: 'kōu',
+    0x4072: 'mái',
+    0x4073: 'mǎng',
+    0x4074: 'zhǎn,shǎn',
+    0x4075: 'biǎn,huán',
+    0x4076: 'jī,jiǎo',
+    0x4077: 'jué,wù',
+    0x4078: 'náng,nǒng',
+    0x4079: 'bì',
+    0x407A: 'shì,yì',
+    0x407B: 'shuò,lì',
+    0x407C: 'mò',
+    0x407D: 'liè',
+    0x407E: 'miè',
+    0x407F: 'mò',
+    0x4080: 'xī',
+    0x4081: 'chán',
+    0x4082: 'qú',
+    0x4083: 'jiào',
+    0x4084: 'huò',
+    0x4085: 'xiān',
+    0x4086: 'xù',
+    0x4087: 'niǔ',
+    0x4088: 'tóng',
+    0x4089: 'hóu',
+    0x408A: 'yù',
+    0x408C: 'chōng',
+    0x408D: 'bó',
+    0x408E: 'zuǎn,cuān',
+    0x408F: 'diāo',
+    0x4090: 'zhuō',
+    0x4091: 'jī',
+    0x4092: 'qià',
+    0x4094: 'xìng',
+    0x4095: 'huì',
+    0x4096: 'shí',
+    0x4097: 'kū',
+    0x4099: 'duī',
+    0x409A: 'yáo',
+    0x409B: 'yú',
+    0x409C: 'bàng',
+    0x409D: 'jié',
+    0x409E: 'zhè',
+    0x409F: 'jiā',
+    0x40A0: 'shǐ',
+    0x40A1: 'dǐ',
+    0x40A2: 'dǒng',
+    0x40A3: 'cí',
+    0x40A4: 'fù',
+    0x40A5: 'mín',
+    0x40A6: 'zhēn,zhěn',
+    0x40A7: 'zhěn',
+    0x40A9: 'yàn,qìng',
+    0x40AA: 'qiǎo,diào',
+    0x40AB: 'hāng,hóng',
+    0x40AC: 'gǒng',
+    0x40AD: 'qiāo',
+    0x40AE: 'lüè',
+    0x40AF: 'guài',
+    0x40B0: 'là',
+    0x40B1: 'ruì',
+    0x40B2: 'fǎ',
+    0x40B3: 'cuǒ,chǎ',
+    0x40B4: 'yán',
+    0x40B5: 'gōng',
+    0x40B6: 'jié',
+    0x40B7: 'guāi',
+    0x40B8: 'guó',
+    0x40B9: 'suǒ',
+    0x40BA: 'wǒ,kē',
+    0x40BB: 'zhèng',
+    0x40BC: 'niè',
+    0x40BD: 'diào',
+    0x40BE: 'lǎi',
+    0x40BF: 'tà',
+    0x40C0: 'cuì',
+    0x40C1: 'yā',
+    0x40C2: 'gǔn',
+    0x40C5: 'dī',
+    0x40C7: 'mián',
+    0x40C8: 'jiē',
+    0x40C9: 'mín',
+    0x40CA: 'jǔ',
+    0x40CB: 'yú',
+    0x40CC: 'zhēn,yīn',
+    0x40CD: 'zhào',
+    0x40CE: 'zhà,zhǎ',
+    0x40CF: 'xīng',
+    0x40D1: 'bān,pán',
+    0x40D2: 'hé',
+    0x40D3: 'gòu,gōu',
+    0x40D4: 'hóng,qióng',
+    0x40D5: 'láo,luò',
+    0x40D6: 'wù',
+    0x40D7: 'bō,zhuó',
+    0x40D8: 'kēng',
+    0x40D9: 'lù',
+    0x40DA: 'cù,zú',
+    0x40DB: 'lián',
+    0x40DC: 'yī',
+    0x40DD: 'qiào',
+    0x40DE: 'shú',
+    0x40E0: 'xuàn',
+    0x40E1: 'jīn,qín',
+    0x40E2: 'qīn',
+    0x40E3: 'huǐ',
+    0x40E4: 'sù',
+    0x40E5: 'chuáng',
+    0x40E6: 'dūn',
+    0x40E7: 'lóng',
+    0x40E9: 'náo',
+    0x40EA: 'tán',
+    0x40EB: 'dǎn',
+    0x40EC: 'wěi,kuǐ,lěi',
+    0x40ED: 'gǎn',
+    0x40EE: 'dá',
+    0x40EF: 'lì',
+    0x40F0: 'cā',
+    0x40F1: 'xiàn',
+    0x40F2: 'pán',
+    0x40F3: 'là,liè',
+    0x40F4: 'zhū',
+    0x40F5: 'niǎo',
+    0x40F6: 'huái,guī,guài',
+    0x40F7: 'yíng',
+    0x40F8: 'xiàn,jīn',
+    0x40F9: 'làn',
+    0x40FA: 'mó',
+    0x40FB: 'bà',
+    0x40FD: 'guǐ,zhī,fú',
+    0x40FE: 'bǐ',
+    0x40FF: 'fū',
+    0x4100: 'huò',
+    0x4101: 'yì',
+    0x4102: 'liù',
+    0x4104: 'yīn',
+    0x4105: 'juàn',
+    0x4106: 'huó,huàn',
+    0x4107: 'chéng',
+    0x4108: 'dòu,xiáng',
+    0x4109: 'é',
+    0x410B: 'yǎn,yàn',
+    0x410C: 'zhuì,chuò',
+    0x410D: 'zhà',
+    0x410E: 'qǐ',
+    0x410F: 'yú',
+    0x4110: 'quàn',
+    0x4111: 'huó',
+    0x4112: 'niè',
+    0x4113: 'huáng',
+    0x4114: 'jǔ',
+    0x4115: 'shè',
+    0x4118: 'péng',
+    0x4119: 'míng',
+    0x411A: 'cáo',
+    0x411B: 'lóu',
+    0x411C: 'lí,chī',
+    0x411D: 'chuāng',
+    0x411F: 'cuī',
+    0x4120: 'shàn',
+    0x4121: 'dān',
+    0x4122: 'qí',
+    0x4124: 'lài,lǎn',
+    0x4125: 'líng',
+    0x4126: 'liǎo',
+    0x4127: 'réng',
+    0x4128: 'yú',
+    0x4129: 'yì',
+    0x412A: 'diǎo',
+    0x412B: 'qǐ',
+    0x412C: 'yí',
+    0x412D: 'nián',
+    0x412E: 'fū',
+    0x412F: 'jiǎn',
+    0x4130: 'yá',
+    0x4131: 'fāng',
+    0x4132: 'ruì',
+    0x4133: 'xiān',
+    0x4136: 'bì,bó',
+    0x4137: 'shí',
+    0x4138: 'pò',
+    0x4139: 'nián',
+    0x413A: 'zhì,tí',
+    0x413B: 'táo,cháo,tiāo',
+    0x413C: 'tiǎn',
+    0x413D: 'tiǎn',
+    0x413E: 'rù,rǒng',
+    0x413F: 'yì',
+    0x4140: 'liè',
+    0x4141: 'àn',
+    0x4142: 'hé',
+    0x4143: 'qióng,jiòng',
+    0x4144: 'lì',
+    0x4145: 'guī,wā',
+    0x4146: 'zì',
+    0x4147: 'sù',
+    0x4148: 'yuàn',
+    0x4149: 'yà',
+    0x414A: 'chá',
+    0x414B: 'wǎn',
+    0x414C: 'juān',
+    0x414D: 'tǐng',
+    0x414E: 'yǒu',
+    0x414F: 'huì',
+    0x4150: 'jiǎn',
+    0x4151: 'ruí',
+    0x4152: 'máng',
+    0x4153: 'jǔ',
+    0x4154: 'zī',
+    0x4155: 'jū',
+    0x4156: 'ān,ǎn,yān,yǎn,yè',
+    0x4157: 'suì',
+    0x4158: 'lái',
+    0x4159: 'hùn',
+    0x415A: 'quǎn',
+    0x415B: 'chāng',
+    0x415C: 'duò,chuí,tuǒ',
+    0x415D: 'kōng',
+    0x415E: 'nè',
+    0x415F: 'cǎn',
+    0x4160: 'tí',
+    0x4161: 'xǔ',
+    0x4162: 'jiù',
+    0x4163: 'huáng',
+    0x4164: 'qì',
+    0x4165: 'jié,gé',
+    0x4166: 'máo',
+    0x4167: 'yān,yìn',
+    0x4169: 'zhǐ,qí',
+    0x416A: 'tuí',
+    0x416C: 'ài',
+    0x416D: 'páng',
+    0x416E: 'càng',
+    0x416F: 'táng',
+    0x4170: 'ěn',
+    0x4171: 'hùn',
+    0x4172: 'qí',
+    0x4173: 'chú,zōu',
+    0x4174: 'suǒ',
+    0x4175: 'zhuó',
+    0x4176: 'nòu',
+    0x4177: 'tú,chú',
+    0x4178: 'shēn,zú',
+    0x4179: 'lǒu',
+    0x417A: 'biāo,miǎo',
+    0x417B: 'lí',
+    0x417C: 'mán,màn',
+    0x417D: 'xīn,gǔ',
+    0x417E: 'cén,qián',
+    0x417F: 'huá,huáng',
+    0x4180: 'měi',
+    0x4181: 'gāo',
+    0x4182: 'lián',
+    0x4183: 'dào',
+    0x4184: 'zhǎn',
+    0x4185: 'zī',
+    0x4188: 'zhì',
+    0x4189: 'bà',
+    0x418A: 'cuì,mèi',
+    0x418B: 'qiū',
+    0x418D: 'lóng',
+    0x418E: 'xiān',
+    0x418F: 'fèi,fèn',
+    0x4190: 'guó',
+    0x4191: 'chéng',
+    0x4192: 'jiù',
+    0x4193: 'è,ruǎn',
+    0x4194: 'chōng',
+    0x4195: 'yuè',
+    0x4196: 'hóng',
+    0x4197: 'yǎo',
+    0x4198: 'yā,zā',
+    0x4199: 'yáo',
+    0x419A: 'tóng,dòng',
+    0x419B: 'zhà',
+    0x419C: 'yòu',
+    0x419D: 'xuè,zhú',
+    0x419E: 'yǎo',
+    0x419F: 'kè,āo',
+    0x41A0: 'huàn',
+    0x41A1: 'láng',
+    0x41A2: 'yuè',
+    0x41A3: 'chén',
+    0x41A6: 'shèn',
+    0x41A8: 'níng',
+    0x41A9: 'míng',
+    0x41AA: 'hōng',
+    0x41AB: 'chuāng',
+    0x41AC: 'yǔn',
+    0x41AD: 'xuān',
+    0x41AE: 'jìn',
+    0x41AF: 'zhuó',
+    0x41B0: 'yū',
+    0x41B1: 'tān',
+    0x41B2: 'kāng',
+    0x41B3: 'qióng',
+    0x41B5: 'chéng',
+    0x41B6: 'jiū',
+    0x41B7: 'xuè',
+    0x41B8: 'zhēng',
+    0x41B9: 'chōng,tǒng',
+    0x41BA: 'pān',
+    0x41BB: 'qiào',
+    0x41BD: 'qú',
+    0x41BE: 'lán,làn',
+    0x41BF: 'yì',
+    0x41C0: 'róng',
+    0x41C1: 'sī',
+    0x41C2: 'qiān',
+    0x41C3: 'sì',
+    0x41C5: 'fá',
+    0x41C7: 'méng',
+    0x41C8: 'huà',
+    0x41CB: 'hài',
+    0x41CC: 'qiào',
+    0x41CD: 'chù,qì',
+    0x41CE: 'què',
+    0x41CF: 'duì',
+    0x41D0: 'lì',
+    0x41D1: 'bà,pī',
+    0x41D2: 'jiè',
+    0x41D3: 'xū',
+    0x41D4: 'luò,nuò',
+    0x41D6: 'yǔn',
+    0x41D7: 'zhōng',
+    0x41D8: 'hù',
+    0x41D9: 'yǐn',
+    0x41DB: 'zhǐ',
+    0x41DC: 'qiǎn,qiàn',
+    0x41DE: 'gān,gǎn',
+    0x41DF: 'jiàn',
+    0x41E0: 'zhù',
+    0x41E1: 'zhù',
+    0x41E2: 'kǔ,gù',
+    0x41E3: 'niè',
+    0x41E4: 'ruì',
+    0x41E5: 'zé',
+    0x41E6: 'ǎng,yīng',
+    0x41E7: 'zhì,jī',
+    0x41E8: 'gòng,xiáng',
+    0x41E9: 'yì,yè',
+    0x41EA: 'chī',
+    0x41EB: 'jī',
+    0x41EC: 'zhū,shū,chuǎng',
+    0x41ED: 'lǎo',
+    0x41EE: 'rèn',
+    0x41EF: 'róng',
+    0x41F0: 'zhēng',
+    0x41F1: 'nà',
+    0x41F2: 'cè,jiā',
+    0x41F5: 'yí',
+    0x41F6: 'jué,wò',
+    0x41F7: 'bié',
+    0x41F8: 'chéng,tīng',
+    0x41F9: 'jùn',
+    0x41FA: 'dòu',
+    0x41FB: 'wěi',
+    0x41FC: 'yì',
+    0x41FD: 'zhé,zhì',
+    0x41FE: 'yán',
+    0x4200: 'sān',
+    0x4201: 'lún',
+    0x4202: 'píng',
+    0x4203: 'zhǎo',
+    0x4204: 'hán',
+    0x4205: 'yù',
+    0x4206: 'dài',
+    0x4207: 'zhào',
+    0x4208: 'féi,bā',
+    0x4209: 'shà,qiè',
+    0x420A: 'líng',
+    0x420B: 'tà',
+    0x420C: 'qū',
+    0x420D: 'máng,méng',
+    0x420E: 'yè',
+    0x420F: 'báo,fú',
+    0x4210: 'guì',
+    0x4211: 'guǎ',
+    0x4212: 'nǎn,lǎn',
+    0x4213: 'gé,qià',
+    0x4215: 'shí,tí,jī,yí',
+    0x4216: 'kē',
+    0x4217: 'suǒ',
+    0x4218: 'cí',
+    0x4219: 'zhòu',
+    0x421A: 'tái',
+    0x421B: 'kuài',
+    0x421C: 'qìn',
+    0x421D: 'xū',
+    0x421E: 'dǔ',
+    0x421F: 'cè,zhá',
+    0x4220: 'huǎn,yuàn',
+    0x4221: 'cōng,sōng',
+    0x4222: 'sǎi,xǐ',
+    0x4223: 'zhèng',
+    0x4224: 'qián',
+    0x4225: 'jīn',
+    0x4226: 'zōng',
+    0x4227: 'wěi',
+    0x422A: 'xì',
+    0x422B: 'nà',
+    0x422C: 'pú',
+    0x422D: 'sōu,huái',
+    0x422E: 'jù',
+    0x422F: 'zhēn',
+    0x4230: 'shāo',
+    0x4231: 'tāo',
+    0x4232: 'bān,pán',
+    0x4233: 'tà',
+    0x4234: 'qiàn',
+    0x4235: 'wēng',
+    0x4236: 'róng',
+    0x4237: 'luò',
+    0x4238: 'hú',
+    0x4239: 'sǒu',
+    0x423A: 'zhōng',
+    0x423B: 'pú',
+    0x423C: 'miè,mì',
+    0x423D: 'jīn',
+    0x423E: 'shāo,shuò',
+    0x423F: 'mì',
+    0x4240: 'shù',
+    0x4241: 'líng',
+    0x4242: 'lěi',
+    0x4243: 'jiǎng',
+    0x4244: 'léng',
+    0x4245: 'zhì',
+    0x4246: 'diǎo',
+    0x4248: 'sǎn',
+    0x4249: 'gū,hú',
+    0x424A: 'fàn',
+    0x424B: 'mèi',
+    0x424C: 'suì',
+    0x424D: 'jiǎn',
+    0x424E: 'táng',
+    0x424F: 'xiè',
+    0x4250: 'kū',
+    0x4251: 'wú',
+    0x4252: 'fán',
+    0x4253: 'luò',
+    0x4254: 'cān',
+    0x4255: 'céng',
+    0x4256: 'líng',
+    0x4257: 'yī',
+    0x4258: 'cóng',
+    0x4259: 'yún',
+    0x425A: 'méng',
+    0x425B: 'yù,ǎo',
+    0x425C: 'zhì',
+    0x425D: 'yǐ',
+    0x425E: 'dǎn',
+    0x425F: 'huò',
+    0x4260: 'wéi',
+    0x4261: 'tán',
+    0x4262: 'sè',
+    0x4263: 'xiè',
+    0x4264: 'sǒu',
+    0x4265: 'sǒng',
+    0x4266: 'qiān',
+    0x4267: 'liú,liǔ',
+    0x4268: 'yì',
+    0x426A: 'lèi',
+    0x426B: 'lí',
+    0x426C: 'fèi',
+    0x426D: 'liè',
+    0x426E: 'lìn',
+    0x426F: 'xiàn',
+    0x4270: 'xiào,jiǎo',
+    0x4271: 'ōu',
+    0x4272: 'mí',
+    0x4273: 'xiān,xiǎn',
+    0x4274: 'ráng',
+    0x4275: 'zhuàn,zuǎn',
+    0x4276: 'shuāng',
+    0x4277: 'yán',
+    0x4278: 'biàn',
+    0x4279: 'líng',
+    0x427A: 'hóng',
+    0x427B: 'qí',
+    0x427C: 'liào',
+    0x427D: 'bǎn',
+    0x427E: 'bì',
+    0x427F: 'hú',
+    0x4280: 'hú',
+    0x4282: 'cè,sè',
+    0x4283: 'pèi',
+    0x4284: 'qióng',
+    0x4285: 'míng',
+    0x4286: 'jiù,qiǔ',
+    0x4287: 'bù',
+    0x4288: 'méi',
+    0x4289: 'sǎn',
+    0x428A: 'wèi',
+    0x428D: 'lí',
+    0x428E: 'quǎn,qún',
+    0x4290: 'hún',
+    0x4291: 'xiǎng',
+    0x4293: 'shì',
+    0x4294: 'yíng',
+    0x4296: 'nǎn',
+    0x4297: 'huáng',
+    0x4298: 'jiù',
+    0x4299: 'yān',
+    0x429B: 'sà',
+    0x429C: 'tuán',
+    0x429D: 'xiè',
+    0x429E: 'zhé,chè',
+    0x429F: 'mén',
+    0x42A0: 'xì',
+    0x42A1: 'mán',
+    0x42A3: 'huáng',
+    0x42A4: 'tán,dàn',
+    0x42A5: 'xiào',
+    0x42A6: 'yè',
+    0x42A7: 'bì',
+    0x42A8: 'luó',
+    0x42A9: 'fán',
+    0x42AA: 'lì',
+    0x42AB: 'cuǐ',
+    0x42AC: 'chuā',
+    0x42AD: 'dào,chóu',
+    0x42AE: 'dí',
+    0x42AF: 'kuàng',
+    0x42B0: 'chú',
+    0x42B1: 'xiān',
+    0x42B2: 'chàn,chǎn',
+    0x42B3: 'mí,mó',
+    0x42B4: 'qiàn',
+    0x42B5: 'qiú',
+    0x42B6: 'zhèn',
+    0x42BA: 'hù',
+    0x42BB: 'gān',
+    0x42BC: 'chǐ',
+    0x42BD: 'guài,jué',
+    0x42BE: 'mù',
+    0x42BF: 'bó',
+    0x42C0: 'huà',
+    0x42C1: 'gěng',
+    0x42C2: 'yáo',
+    0x42C3: 'mào',
+    0x42C4: 'wǎng',
+    0x42C8: 'rú,nǎ',
+    0x42C9: 'xué',
+    0x42CA: 'zhēng',
+    0x42CB: 'mín',
+    0x42CC: 'jiǎng',
+    0x42CE: 'zhàn',
+    0x42CF: 'zuó,zhà',
+    0x42D0: 'yuè',
+    0x42D1: 'liè',
+    0x42D3: 'zhòu',
+    0x42D4: 'bì',
+    0x42D5: 'rèn',
+    0x42D6: 'yù',
+    0x42D8: 'chuò',
+    0x42D9: 'ěr',
+    0x42DA: 'yì',
+    0x42DB: 'mǐ',
+    0x42DC: 'qìng',
+    0x42DE: 'wǎng',
+    0x42DF: 'jì',
+    0x42E0: 'bǔ',
+    0x42E2: 'biē',
+    0x42E3: 'fán,pó',
+    0x42E4: 'yuè',
+    0x42E5: 'lí',
+    0x42E6: 'fán',
+    0x42E7: 'qú',
+    0x42E8: 'fǔ',
+    0x42E9: 'ér',
+    0x42EA: 'ē',
+    0x42EB: 'zhēng',
+    0x42EC: 'tiān',
+    0x42ED: 'yù',
+    0x42EE: 'jìn',
+    0x42EF: 'qǐ',
+    0x42F0: 'jú',
+    0x42F1: 'lái',
+    0x42F2: 'chě',
+    0x42F3: 'běi',
+    0x42F4: 'niù',
+    0x42F5: 'yì,yè',
+    0x42F6: 'xǔ,xié',
+    0x42F7: 'móu',
+    0x42F8: 'xún',
+    0x42F9: 'fú',
+    0x42FB: 'nín',
+    0x42FC: 'tīng,yíng',
+    0x42FD: 'běng',
+    0x42FE: 'zhǎ,nà',
+    0x42FF: 'wēi',
+    0x4300: 'kē',
+    0x4301: 'yāo',
+    0x4302: 'òu',
+    0x4303: 'xiāo,shuò',
+    0x4304: 'gěng',
+    0x4305: 'táng',
+    0x4306: 'guì',
+    0x4307: 'huì',
+    0x4308: 'tā,tà',
+    0x430A: 'yáo',
+    0x430B: 'dā',
+    0x430C: 'qì',
+    0x430D: 'jǐn',
+    0x430E: 'lüè',
+    0x430F: 'mì',
+    0x4310: 'mì',
+    0x4311: 'jiān',
+    0x4312: 'lù',
+    0x4313: 'fán',
+    0x4314: 'ōu',
+    0x4315: 'mí',
+    0x4316: 'jié',
+    0x4317: 'fǔ',
+    0x4318: 'biè,bì',
+    0x4319: 'huàng',
+    0x431A: 'sū',
+    0x431B: 'yáo',
+    0x431C: 'niè',
+    0x431D: 'jīn,jìn',
+    0x431E: 'liǎn',
+    0x431F: 'bó,bì',
+    0x4320: 'jiān',
+    0x4321: 'tǐ',
+    0x4322: 'líng',
+    0x4323: 'zuǎn',
+    0x4324: 'shī,zhǐ',
+    0x4325: 'yǐn',
+    0x4326: 'dào',
+    0x4327: 'chóu',
+    0x4328: 'cā,cài',
+    0x4329: 'miè',
+    0x432A: 'yǎn',
+    0x432B: 'lǎn',
+    0x432C: 'chóng',
+    0x432D: 'jiāo',
+    0x432E: 'shuāng',
+    0x432F: 'quān,quán,guàn',
+    0x4330: 'niè',
+    0x4331: 'luò',
+    0x4333: 'shī',
+    0x4334: 'luò',
+    0x4335: 'zhú',
+    0x4337: 'chōu,chóu',
+    0x4338: 'juàn',
+    0x4339: 'jiǒng',
+    0x433A: 'ěr',
+    0x433B: 'yì',
+    0x433C: 'ruì',
+    0x433D: 'cǎi',
+    0x433E: 'rén',
+    0x433F: 'fú',
+    0x4340: 'lán',
+    0x4341: 'suì',
+    0x4342: 'yú',
+    0x4343: 'yóu',
+    0x4344: 'diǎn',
+    0x4345: 'líng',
+    0x4346: 'zhù',
+    0x4347: 'tà',
+    0x4348: 'píng',
+    0x4349: 'zhǎi',
+    0x434A: 'jiāo',
+    0x434B: 'chuí',
+    0x434C: 'bù',
+    0x434D: 'kòu',
+    0x434E: 'cùn,xiǎn',
+    0x4350: 'hǎn',
+    0x4351: 'hǎn',
+    0x4352: 'mǒu',
+    0x4353: 'hù',
+    0x4354: 'gōng',
+    0x4355: 'dī,dǐ',
+    0x4356: 'fú',
+    0x4357: 'xuàn',
+    0x4358: 'mí',
+    0x4359: 'méi,mǒu',
+    0x435A: 'làng',
+    0x435B: 'gù',
+    0x435C: 'zhào',
+    0x435D: 'tà',
+    0x435E: 'yù',
+    0x435F: 'zòng',
+    0x4360: 'lí',
+    0x4361: 'lù',
+    0x4362: 'wú',
+    0x4363: 'léi',
+    0x4364: 'jǐ',
+    0x4365: 'lì',
+    0x4366: 'lí',
+    0x4368: 'pō,fèi',
+    0x4369: 'yǎng',
+    0x436A: 'wà',
+    0x436B: 'tuó',
+    0x436C: 'pēng',
+    0x436E: 'zhào',
+    0x436F: 'guǐ',
+    0x4371: 'xú',
+    0x4372: 'nái',
+    0x4373: 'què,jué,chuò',
+    0x4374: 'wěi',
+    0x4375: 'zhēng',
+    0x4376: 'dōng',
+    0x4377: 'wěi',
+    0x4378: 'bó',
+    0x437A: 'huàn',
+    0x437B: 'xuàn',
+    0x437C: 'zān,cán',
+    0x437D: 'lì',
+    0x437E: 'yǎn',
+    0x437F: 'huáng',
+    0x4380: 'xuè',
+    0x4381: 'hú',
+    0x4382: 'bǎo',
+    0x4383: 'rǎn',
+    0x4384: 'xiāo,tiáo',
+    0x4385: 'pò',
+    0x4386: 'liào',
+    0x4387: 'zhōu',
+    0x4388: 'yì',
+    0x4389: 'xù',
+    0x438A: 'luò,pò',
+    0x438B: 'kào',
+    0x438C: 'chù',
+    0x438E: 'nà',
+    0x438F: 'hán',
+    0x4390: 'chǎo',
+    0x4391: 'lù',
+    0x4392: 'zhǎn',
+    0x4393: 'tà',
+    0x4394: 'fū',
+    0x4395: 'hōng',
+    0x4396: 'zēng',
+    0x4397: 'qiáo',
+    0x4398: 'sù',
+    0x4399: 'pīn',
+    0x439A: 'guàn',
+    0x439C: 'hūn',
+    0x439D: 'chú',
+    0x439F: 'ér',
+    0x43A0: 'ér,nuò',
+    0x43A1: 'ruǎn',
+    0x43A2: 'qǐ',
+    0x43A3: 'sì',
+    0x43A4: 'jú',
+    0x43A6: 'yǎn',
+    0x43A7: 'bàng,póu',
+    0x43A8: 'yè,àn',
+    0x43A9: 'zī',
+    0x43AA: 'nè',
+    0x43AB: 'chuàng',
+    0x43AC: 'bà',
+    0x43AD: 'cāo',
+    0x43AE: 'tì',
+    0x43AF: 'hàn,hǎn',
+    0x43B0: 'zuó',
+    0x43B1: 'bà,bēi',
+    0x43B2: 'zhé',
+    0x43B3: 'wà',
+    0x43B4: 'gēng,shèng',
+    0x43B5: 'bì',
+    0x43B6: 'èr',
+    0x43B7: 'zhù',
+    0x43B8: 'wù',
+    0x43B9: 'wén',
+    0x43BA: 'zhì',
+    0x43BB: 'zhòu',
+    0x43BC: 'lù',
+    0x43BD: 'wén',
+    0x43BE: 'gǔn',
+    0x43BF: 'qiú',
+    0x43C0: 'là',
+    0x43C1: 'zǎi',
+    0x43C2: 'sǒu',
+    0x43C3: 'mián,míng',
+    0x43C4: 'dǐ,zhì',
+    0x43C5: 'qì',
+    0x43C6: 'cáo',
+    0x43C7: 'piào',
+    0x43C8: 'lián,luán',
+    0x43C9: 'shī',
+    0x43CA: 'lóng',
+    0x43CB: 'sù',
+    0x43CC: 'qì,yì',
+    0x43CD: 'yuàn,yuān',
+    0x43CE: 'féng',
+    0x43CF: 'xū',
+    0x43D0: 'jué',
+    0x43D1: 'dì',
+    0x43D2: 'piàn,pàn',
+    0x43D3: 'guǎn',
+    0x43D4: 'niǔ,zhǒu,ròu,nǜ',
+    0x43D5: 'rèn',
+    0x43D6: 'zhèn,yǐn',
+    0x43D7: 'gài',
+    0x43D8: 'pì',
+    0x43D9: 'tǎn,dàn,zhuàn',
+    0x43DA: 'chǎo,miǎo',
+    0x43DB: 'chǔn',
+    0x43DC: 'hē',
+    0x43DD: 'zhuān',
+    0x43DE: 'mò',
+    0x43DF: 'bié,bì',
+    0x43E0: 'qì,lā',
+    0x43E1: 'shì',
+    0x43E2: 'bǐ',
+    0x43E3: 'jué',
+    0x43E4: 'sì',
+    0x43E6: 'guā,tián',
+    0x43E7: 'nà,ná,chǐ',
+    0x43E8: 'huǐ,duī',
+    0x43E9: 'xī',
+    0x43EA: 'èr',
+    0x43EB: 'xiū',
+    0x43EC: 'móu',
+    0x43EE: 'xí',
+    0x43EF: 'zhì',
+    0x43F0: 'rùn',
+    0x43F1: 'jú',
+    0x43F2: 'dié,tī',
+    0x43F3: 'zhè',
+    0x43F4: 'shào',
+    0x43F5: 'měng,mǎng,máng',
+    0x43F6: 'bì',
+    0x43F7: 'hàn',
+    0x43F8: 'yú',
+    0x43F9: 'xiàn,chēn',
+    0x43FA: 'pāng',
+    0x43FB: 'néng',
+    0x43FC: 'cán,zhàn',
+    0x43FD: 'bù,péi',
+    0x43FF: 'qǐ',
+    0x4400: 'jì',
+    0x4401: 'zhuó,dū',
+    0x4402: 'lù',
+    0x4403: 'jùn,zhūn',
+    0x4404: 'xiàn,hàn',
+    0x4405: 'xī',
+    0x4406: 'cǎi',
+    0x4407: 'wěn,chún',
+    0x4408: 'zhí',
+    0x4409: 'zì,nǎo',
+    0x440A: 'kūn,hún,hùn',
+    0x440B: 'cōng',
+    0x440C: 'tiǎn',
+    0x440D: 'chù',
+    0x440E: 'dī',
+    0x440F: 'chǔn,shǔn',
+    0x4410: 'qiū',
+    0x4411: 'zhé',
+    0x4412: 'zhā',
+    0x4413: 'róu',
+    0x4414: 'bǐn,biàn',
+    0x4415: 'jí',
+    0x4416: 'xī',
+    0x4417: 'zhū,dǔ',
+    0x4418: 'jué',
+    0x4419: 'gé',
+    0x441A: 'jī',
+    0x441B: 'dā',
+    0x441C: 'chēn',
+    0x441D: 'suò',
+    0x441E: 'ruò',
+    0x441F: 'xiǎng,gōu',
+    0x4420: 'huǎng',
+    0x4421: 'qí',
+    0x4422: 'zhù,zhòu,chù',
+    0x4423: 'sǔn',
+    0x4424: 'chāi,cuó',
+    0x4425: 'wěng',
+    0x4426: 'kē',
+    0x4427: 'kào,hè',
+    0x4428: 'gǔ,què',
+    0x4429: 'gāi,guī,kǎi',
+    0x442A: 'fàn',
+    0x442B: 'cōng',
+    0x442C: 'cáo',
+    0x442D: 'zhì,dì',
+    0x442E: 'chǎn',
+    0x442F: 'léi,lěi',
+    0x4430: 'xiū',
+    0x4431: 'zhài',
+    0x4432: 'zhé',
+    0x4433: 'yú',
+    0x4434: 'guì',
+    0x4435: 'gōng,huáng',
+    0x4436: 'zān,jǐn,qián',
+    0x4437: 'dān',
+    0x4438: 'huò,guó',
+    0x4439: 'sōu,sào,xiào',
+    0x443A: 'tàn,tán',
+    0x443B: 'gū',
+    0x443C: 'xì',
+    0x443D: 'mán',
+    0x443E: 'duó',
+    0x443F: 'ào,ǎo',
+    0x4440: 'pì,pǐ',
+    0x4441: 'wù',
+    0x4442: 'ǎi',
+    0x4443: 'méng',
+    0x4444: 'pì,yì',
+    0x4445: 'méng',
+    0x4446: 'yǎng',
+    0x4447: 'zhì',
+    0x4448: 'bó',
+    0x4449: 'yíng',
+    0x444A: 'wéi,wèi',
+    0x444B: 'rǎng',
+    0x444C: 'lán,làn',
+    0x444D: 'yān,yàn,yǐng',
+    0x444E: 'chǎn',
+    0x444F: 'quán,huān',
+    0x4450: 'zhěn',
+    0x4451: 'pú',
+    0x4453: 'tái',
+    0x4454: 'fèi',
+    0x4455: 'shǔ',
+    0x4457: 'dàng',
+    0x4458: 'cuó',
+    0x4459: 'tān,rán,tiàn',
+    0x445A: 'tián',
+    0x445B: 'chǐ',
+    0x445C: 'tà,tiè',
+    0x445D: 'jiǎ',
+    0x445E: 'shùn',
+    0x445F: 'huáng',
+    0x4460: 'liǎo',
+    0x4463: 'chēn',
+    0x4464: 'jìn',
+    0x4465: 'è,sà',
+    0x4466: 'gōu',
+    0x4467: 'fú',
+    0x4468: 'duò',
+    0x446A: 'è',
+    0x446B: 'bēng',
+    0x446C: 'tāo,yào,tiāo',
+    0x446D: 'dì',
+    0x446F: 'dì',
+    0x4470: 'bù',
+    0x4471: 'wǎn',
+    0x4472: 'zhào',
+    0x4473: 'lún',
+    0x4474: 'qí',
+    0x4475: 'mù',
+    0x4476: 'qiàn',
+    0x4478: 'zōng',
+    0x4479: 'sōu,sāo',
+    0x447B: 'yóu',
+    0x447C: 'zhōu',
+    0x447D: 'tà',
+    0x447F: 'sù',
+    0x4480: 'bù',
+    0x4481: 'xí',
+    0x4482: 'jiǎng',
+    0x4483: 'cào',
+    0x4484: 'fù',
+    0x4485: 'téng',
+    0x4486: 'chè',
+    0x4487: 'fù',
+    0x4488: 'fèi',
+    0x4489: 'wǔ',
+    0x448A: 'xī',
+    0x448B: 'yǎng',
+    0x448C: 'mìng',
+    0x448D: 'pǎng',
+    0x448E: 'mǎng',
+    0x448F: 'sēng',
+    0x4490: 'méng,mèng',
+    0x4491: 'cǎo',
+    0x4492: 'tiáo',
+    0x4493: 'kǎi',
+    0x4494: 'bài',
+    0x4495: 'xiǎo',
+    0x4496: 'xìn',
+    0x4497: 'qì',
+    0x449A: 'shǎo',
+    0x449B: 'huàn',
+    0x449C: 'niú',
+    0x449D: 'xiáo',
+    0x449E: 'chén,yín',
+    0x449F: 'dān',
+    0x44A0: 'fēng,xiá',
+    0x44A1: 'yǐn',
+    0x44A2: 'áng',
+    0x44A3: 'rǎn',
+    0x44A4: 'rì',
+    0x44A5: 'mán',
+    0x44A6: 'fàn',
+    0x44A7: 'qū,qù',
+    0x44A8: 'shǐ,sì',
+    0x44A9: 'hé',
+    0x44AA: 'biàn',
+    0x44AB: 'dài',
+    0x44AC: 'mò',
+    0x44AD: 'děng',
+    0x44B0: 'kuāng',
+    0x44B2: 'chà',
+    0x44B3: 'duǒ',
+    0x44B4: 'yǒu',
+    0x44B5: 'hào',
+    0x44B7: 'guā',
+    0x44B8: 'xuè',
+    0x44B9: 'lèi',
+    0x44BA: 'jǐn',
+    0x44BB: 'qǐ',
+    0x44BC: 'qū',
+    0x44BD: 'wǎng',
+    0x44BE: 'yī',
+    0x44BF: 'liáo',
+    0x44C2: 'yán',
+    0x44C3: 'yì',
+    0x44C4: 'yín',
+    0x44C5: 'qí',
+    0x44C6: 'zhé',
+    0x44C7: 'xì,hè,kè',
+    0x44C8: 'yì',
+    0x44C9: 'yé,yē',
+    0x44CA: 'wú,yú',
+    0x44CB: 'zhī',
+    0x44CC: 'zhì',
+    0x44CD: 'hǎn',
+    0x44CE: 'chuò',
+    0x44CF: 'fū',
+    0x44D0: 'chún',
+    0x44D1: 'píng',
+    0x44D2: 'kuǎi',
+    0x44D3: 'chóu',
+    0x44D5: 'tuǒ',
+    0x44D6: 'qióng',
+    0x44D7: 'cōng',
+    0x44D8: 'gāo,jiù',
+    0x44D9: 'kuā,guāi',
+    0x44DA: 'qū,cú',
+    0x44DB: 'qū',
+    0x44DC: 'zhī',
+    0x44DD: 'mèng',
+    0x44DE: 'lì',
+    0x44DF: 'zhōu,liè',
+    0x44E0: 'tà',
+    0x44E1: 'zhī',
+    0x44E2: 'gù',
+    0x44E3: 'liǎng',
+    0x44E4: 'hū',
+    0x44E5: 'là',
+    0x44E6: 'diǎn',
+    0x44E7: 'cì',
+    0x44E8: 'yīng',
+    0x44EB: 'qí',
+    0x44EC: 'zhuó',
+    0x44ED: 'chà',
+    0x44EE: 'mào',
+    0x44EF: 'dú',
+    0x44F0: 'yīn',
+    0x44F1: 'chái,zuī',
+    0x44F2: 'ruì',
+    0x44F3: 'hěn,xié',
+    0x44F4: 'ruǎn',
+    0x44F5: 'fū',
+    0x44F6: 'lài',
+    0x44F7: 'xìng',
+    0x44F8: 'jiān',
+    0x44F9: 'yì',
+    0x44FA: 'měi',
+    0x44FC: 'máng,hè',
+    0x44FD: 'jì',
+    0x44FE: 'suō',
+    0x44FF: 'hàn',
+    0x4501: 'lì',
+    0x4502: 'zǐ,zǎi',
+    0x4503: 'zǔ',
+    0x4504: 'yáo,yào',
+    0x4505: 'gē',
+    0x4506: 'lí',
+    0x4507: 'qǐ,ái',
+    0x4508: 'gòng',
+    0x4509: 'lì,suàn',
+    0x450A: 'bīng',
+    0x450B: 'suō',
+    0x450E: 'sù',
+    0x450F: 'chòu',
+    0x4510: 'jiān',
+    0x4511: 'xié,yé,tú',
+    0x4512: 'bèi',
+    0x4513: 'xǔ',
+    0x4514: 'jìng',
+    0x4515: 'pú',
+    0x4516: 'líng',
+    0x4517: 'xiáng',
+    0x4518: 'zuò',
+    0x4519: 'diào',
+    0x451A: 'chún',
+    0x451B: 'qǐng',
+    0x451C: 'nán',
+    0x451D: 'zhāi',
+    0x451E: 'lǜ',
+    0x451F: 'yí',
+    0x4520: 'shǎo,shāo,shuò',
+    0x4521: 'yú',
+    0x4522: 'huá',
+    0x4523: 'lí',
+    0x4524: 'pā',
+    0x4527: 'lí',
+    0x452A: 'shuǎng',
+    0x452C: 'yì',
+    0x452D: 'nìng',
+    0x452E: 'sī',
+    0x452F: 'kù',
+    0x4530: 'fù',
+    0x4531: 'yī',
+    0x4532: 'dēng,chéng',
+    0x4533: 'rán',
+    0x4534: 'cè,cuì,chuà',
+    0x4536: 'tí,tái',
+    0x4537: 'qín',
+    0x4538: 'biǎo,biāo',
+    0x4539: 'suì',
+    0x453A: 'wéi,wěi',
+    0x453B: 'dūn,duī',
+    0x453C: 'sè,zé',
+    0x453D: 'ài',
+    0x453E: 'qì,è',
+    0x453F: 'zǔn',
+    0x4540: 'kuǎn',
+    0x4541: 'fěi',
+    0x4543: 'yìn',
+    0x4545: 'sǎo',
+    0x4546: 'dòu',
+    0x4547: 'huì',
+    0x4548: 'xiè',
+    0x4549: 'zé',
+    0x454A: 'tán',
+    0x454B: 'táng',
+    0x454C: 'zhì',
+    0x454D: 'yì',
+    0x454E: 'fú',
+    0x454F: 'é',
+    0x4551: 'jùn',
+    0x4552: 'jiā',
+    0x4553: 'chá,chuì',
+    0x4554: 'xián',
+    0x4555: 'màn',
+    0x4557: 'bì',
+    0x4558: 'líng,lǐng',
+    0x4559: 'jié',
+    0x455A: 'kuì',
+    0x455B: 'jiá',
+    0x455D: 'chēng',
+    0x455E: 'làng',
+    0x455F: 'xīng',
+    0x4560: 'fèi',
+    0x4561: 'lǘ',
+    0x4562: 'zhǎ',
+    0x4563: 'hé',
+    0x4564: 'jī',
+    0x4565: 'nǐ',
+    0x4566: 'yíng',
+    0x4567: 'xiào,jiǎo',
+    0x4568: 'téng',
+    0x4569: 'lǎo',
+    0x456A: 'zé',
+    0x456B: 'kuí',
+    0x456D: 'qián,xián',
+    0x456E: 'jú,qū',
+    0x456F: 'piáo',
+    0x4570: 'fán',
+    0x4571: 'tóu',
+    0x4572: 'lǐn',
+    0x4573: 'mí',
+    0x4574: 'zhuó',
+    0x4575: 'xié',
+    0x4576: 'hù',
+    0x4577: 'mí',
+    0x4578: 'jiē',
+    0x4579: 'zá',
+    0x457A: 'cóng',
+    0x457B: 'lì',
+    0x457C: 'rán',
+    0x457D: 'zhú',
+    0x457E: 'yín,yán',
+    0x457F: 'hàn',
+    0x4581: 'yì',
+    0x4582: 'luán',
+    0x4583: 'yuè,lǎ',
+    0x4584: 'rán',
+    0x4585: 'líng',
+    0x4586: 'niàng',
+    0x4587: 'yù',
+    0x4588: 'nüè',
+    0x458A: 'yì',
+    0x458B: 'nüè',
+    0x458C: 'yì',
+    0x458D: 'qián',
+    0x458E: 'xiá',
+    0x458F: 'chǔ,chù',
+    0x4590: 'yín',
+    0x4591: 'mì',
+    0x4592: 'xī',
+    0x4593: 'nà',
+    0x4594: 'kǎn,hàn',
+    0x4595: 'zǔ',
+    0x4596: 'xiá',
+    0x4597: 'yán',
+    0x4598: 'tú',
+    0x4599: 'tī',
+    0x459A: 'wū',
+    0x459B: 'suǒ',
+    0x459C: 'yín',
+    0x459D: 'chóng',
+    0x459E: 'zhǒu',
+    0x459F: 'mǎng',
+    0x45A0: 'yuán',
+    0x45A1: 'nǜ',
+    0x45A2: 'miáo',
+    0x45A3: 'zǎo',
+    0x45A4: 'wǎn',
+    0x45A5: 'lí',
+    0x45A6: 'qū,zhuō',
+    0x45A7: 'nà',
+    0x45A8: 'shí,zhì',
+    0x45A9: 'bì',
+    0x45AA: 'zī,cī',
+    0x45AB: 'bàng',
+    0x45AD: 'juàn,juān',
+    0x45AE: 'xiǎng',
+    0x45AF: 'kuí,wā',
+    0x45B0: 'pài',
+    0x45B1: 'kuāng',
+    0x45B2: 'xún,zōng',
+    0x45B3: 'zhà,zhé',
+    0x45B4: 'yáo',
+    0x45B5: 'kūn',
+    0x45B6: 'huī',
+    0x45B7: 'xī',
+    0x45B8: 'é',
+    0x45B9: 'yáng,mǐ',
+    0x45BA: 'tiáo',
+    0x45BB: 'yóu',
+    0x45BC: 'jué',
+    0x45BD: 'lí',
+    0x45BF: 'lí',
+    0x45C0: 'chēng',
+    0x45C1: 'jì,qī',
+    0x45C2: 'hǔ',
+    0x45C3: 'zhàn',
+    0x45C4: 'fǔ',
+    0x45C5: 'cháng',
+    0x45C6: 'guǎn,guān',
+    0x45C7: 'jú,qū',
+    0x45C8: 'méng',
+    0x45C9: 'chāng',
+    0x45CA: 'tàn',
+    0x45CB: 'móu',
+    0x45CC: 'xīng',
+    0x45CD: 'lǐ,luó',
+    0x45CE: 'yān',
+    0x45CF: 'sōu',
+    0x45D0: 'shī',
+    0x45D1: 'yì',
+    0x45D2: 'bìng',
+    0x45D3: 'cōng',
+    0x45D4: 'hóu,hòu',
+    0x45D5: 'wǎn',
+    0x45D6: 'dì',
+    0x45D7: 'jī',
+    0x45D8: 'gé',
+    0x45D9: 'hán',
+    0x45DA: 'bó',
+    0x45DB: 'xiū',
+    0x45DC: 'liú',
+    0x45DD: 'cán',
+    0x45DE: 'cán',
+    0x45DF: 'yì',
+    0x45E0: 'xuán',
+    0x45E1: 'yán,yān',
+    0x45E2: 'zǎo',
+    0x45E3: 'hàn',
+    0x45E4: 'yóng',
+    0x45E5: 'zōng',
+    0x45E7: 'kāng',
+    0x45E8: 'yú',
+    0x45E9: 'qī',
+    0x45EA: 'zhè',
+    0x45EB: 'má',
+    0x45EE: 'shuǎng',
+    0x45EF: 'jìn',
+    0x45F0: 'guàn',
+    0x45F1: 'pú,pù,pǔ',
+    0x45F2: 'lìn',
+    0x45F4: 'tíng',
+    0x45F5: 'jiāng',
+    0x45F6: 'là',
+    0x45F7: 'yì',
+    0x45F8: 'yōng',
+    0x45F9: 'cì',
+    0x45FA: 'yǎn,dàn',
+    0x45FB: 'jié',
+    0x45FC: 'xūn',
+    0x45FD: 'wèi',
+    0x45FE: 'xiǎn',
+    0x45FF: 'níng,nǐng',
+    0x4600: 'fù',
+    0x4601: 'gé',
+    0x4603: 'mò',
+    0x4604: 'zhù',
+    0x4605: 'nái',
+    0x4606: 'xiǎn',
+    0x4607: 'wén',
+    0x4608: 'lì',
+    0x4609: 'cán',
+    0x460A: 'miè',
+    0x460B: 'jiān',
+    0x460C: 'nì',
+    0x460D: 'chài',
+    0x460E: 'wān',
+    0x460F: 'xù',
+    0x4610: 'nǜ',
+    0x4611: 'mài',
+    0x4612: 'zuī',
+    0x4613: 'kàn',
+    0x4614: 'kā',
+    0x4615: 'háng',
+    0x4618: 'yù,sù',
+    0x4619: 'wèi',
+    0x461A: 'zhú',
+    0x461D: 'yì',
+    0x461F: 'diāo',
+    0x4620: 'fú',
+    0x4621: 'bǐ',
+    0x4622: 'zhǔ',
+    0x4623: 'zǐ,zhì',
+    0x4624: 'shù',
+    0x4625: 'xiá,jiá',
+    0x4626: 'ní,nǐ',
+    0x4628: 'jiǎo',
+    0x4629: 'xún,xuàn',
+    0x462A: 'chōng',
+    0x462B: 'nòu',
+    0x462C: 'róng',
+    0x462D: 'zhì',
+    0x462E: 'sāng,sàng',
+    0x4630: 'shān',
+    0x4631: 'yù',
+    0x4633: 'jīn',
+    0x4635: 'lù',
+    0x4636: 'hān,hàn',
+    0x4637: 'biē',
+    0x4638: 'yì',
+    0x4639: 'zuì,cuì',
+    0x463A: 'zhàn',
+    0x463B: 'yù',
+    0x463C: 'wǎn',
+    0x463D: 'ní',
+    0x463E: 'guǎn,guàn',
+    0x463F: 'jué',
+    0x4640: 'běng',
+    0x4641: 'cán',
+    0x4643: 'duò',
+    0x4644: 'qì,zhǎ',
+    0x4645: 'yāo,yào',
+    0x4646: 'kuì',
+    0x4647: 'ruán,nuǎn',
+    0x4648: 'hóu',
+    0x4649: 'xún',
+    0x464A: 'xiè',
+    0x464C: 'kuì',
+    0x464E: 'xié,xì',
+    0x464F: 'bó',
+    0x4650: 'kè',
+    0x4651: 'cuī',
+    0x4652: 'xù',
+    0x4653: 'bǎi',
+    0x4654: 'ōu',
+    0x4655: 'zǒng',
+    0x4657: 'tì',
+    0x4658: 'chǔ,zú',
+    0x4659: 'chí',
+    0x465A: 'niǎo',
+    0x465B: 'guàn',
+    0x465C: 'féng',
+    0x465D: 'xiè',
+    0x465E: 'dēng',
+    0x465F: 'wéi',
+    0x4660: 'jué',
+    0x4661: 'kuì,huì',
+    0x4662: 'zèng',
+    0x4663: 'sà',
+    0x4664: 'duǒ',
+    0x4665: 'líng',
+    0x4666: 'méng',
+    0x4668: 'guǒ',
+    0x4669: 'méng',
+    0x466A: 'lóng',
+    0x466C: 'yìng',
+    0x466E: 'guàn',
+    0x466F: 'cù',
+    0x4670: 'lí',
+    0x4671: 'dú',
+    0x4673: 'biāo,è',
+    0x4675: 'xī',
+    0x4677: 'dé',
+    0x4678: 'dé',
+    0x4679: 'xiàn',
+    0x467A: 'lián',
+    0x467C: 'shào,jiāo',
+    0x467D: 'xié',
+    0x467E: 'shī',
+    0x467F: 'wèi',
+    0x4682: 'hè',
+    0x4683: 'yóu',
+    0x4684: 'lù',
+    0x4685: 'lài,lái',
+    0x4686: 'yǐng',
+    0x4687: 'shěng',
+    0x4688: 'juàn',
+    0x4689: 'qì',
+    0x468A: 'jiǎn',
+    0x468B: 'yùn',
+    0x468D: 'qì',
+    0x468F: 'lìn',
+    0x4690: 'jí',
+    0x4691: 'mái',
+    0x4692: 'chuáng,zhuàng',
+    0x4693: 'niǎn',
+    0x4694: 'bīn',
+    0x4695: 'lì',
+    0x4696: 'líng',
+    0x4697: 'gāng',
+    0x4698: 'chéng',
+    0x4699: 'xuān,xī',
+    0x469A: 'xiǎn',
+    0x469B: 'hú',
+    0x469C: 'bī,bēi',
+    0x469D: 'zú',
+    0x469E: 'dǎi',
+    0x469F: 'dǎi',
+    0x46A0: 'hùn,hún',
+    0x46A1: 'sāi',
+    0x46A2: 'chè',
+    0x46A3: 'tí',
+    0x46A5: 'nuò,ruò',
+    0x46A6: 'zhì',
+    0x46A7: 'liú',
+    0x46A8: 'fèi',
+    0x46A9: 'jiǎo,jiào,qiáo',
+    0x46AA: 'guān',
+    0x46AB: 'xí,áo',
+    0x46AC: 'lín',
+    0x46AD: 'xuān',
+    0x46AE: 'réng',
+    0x46AF: 'tǎo,xuān',
+    0x46B0: 'pǐ,é',
+    0x46B1: 'xìn',
+    0x46B2: 'shàn',
+    0x46B3: 'zhì',
+    0x46B4: 'wà',
+    0x46B5: 'tǒu',
+    0x46B6: 'tiān',
+    0x46B7: 'yī,yǐ,xì',
+    0x46B8: 'xiè',
+    0x46B9: 'pǐ',
+    0x46BA: 'yáo',
+    0x46BB: 'yáo,yóu',
+    0x46BC: 'nǜ',
+    0x46BD: 'hào',
+    0x46BE: 'rén,nín',
+    0x46BF: 'yìn,xī',
+    0x46C0: 'fǎn,fàn,bàn',
+    0x46C1: 'nán',
+    0x46C2: 'yāo',
+    0x46C3: 'wàn',
+    0x46C4: 'yuǎn',
+    0x46C5: 'xiá',
+    0x46C6: 'zhòu',
+    0x46C7: 'yuǎn',
+    0x46C8: 'shì',
+    0x46C9: 'miàn',
+    0x46CA: 'xī,zhī',
+    0x46CB: 'jì',
+    0x46CC: 'táo,páo',
+    0x46CD: 'fèi',
+    0x46CE: 'xuè',
+    0x46CF: 'ní,nǐ,nì',
+    0x46D0: 'cí',
+    0x46D1: 'mì',
+    0x46D2: 'biàn',
+    0x46D4: 'ná',
+    0x46D5: 'yù',
+    0x46D6: 'è',
+    0x46D7: 'zhǐ',
+    0x46D8: 'rén,nín',
+    0x46D9: 'xù',
+    0x46DA: 'lüè',
+    0x46DB: 'huì',
+    0x46DC: 'xùn',
+    0x46DD: 'náo',
+    0x46DE: 'hàn',
+    0x46DF: 'jiá',
+    0x46E0: 'dòu',
+    0x46E1: 'huà',
+    0x46E2: 'tū',
+    0x46E3: 'pīng,chōu',
+    0x46E4: 'cù',
+    0x46E5: 'xī,xì,xīn',
+    0x46E6: 'sòng',
+    0x46E7: 'mí',
+    0x46E8: 'xìn',
+    0x46E9: 'wù,qià,è',
+    0x46EA: 'qióng',
+    0x46EB: 'zhāng,zhèng',
+    0x46EC: 'táo',
+    0x46ED: 'xìng',
+    0x46EE: 'jiù',
+    0x46EF: 'jù',
+    0x46F0: 'hùn',
+    0x46F1: 'tí',
+    0x46F2: 'mán',
+    0x46F3: 'yàn,yān',
+    0x46F4: 'jī,qǐ',
+    0x46F5: 'shòu',
+    0x46F6: 'lěi',
+    0x46F7: 'wǎn',
+    0x46F8: 'chè',
+    0x46F9: 'càn,xuàn',
+    0x46FA: 'jiè',
+    0x46FB: 'yòu',
+    0x46FC: 'huǐ',
+    0x46FD: 'zhǎ,chā,sà',
+    0x46FE: 'sù',
+    0x46FF: 'gé',
+    0x4700: 'nǎo',
+    0x4701: 'xì',
+    0x4703: 'duī',
+    0x4704: 'chí',
+    0x4705: 'wéi,chuī',
+    0x4706: 'zhé,niè,mò',
+    0x4707: 'gǔn,gùn',
+    0x4708: 'chāo,zhāo',
+    0x4709: 'chī',
+    0x470A: 'zāo,zào',
+    0x470B: 'huì',
+    0x470C: 'luán',
+    0x470D: 'liáo',
+    0x470E: 'láo,lào',
+    0x470F: 'tuō',
+    0x4710: 'huī',
+    0x4711: 'wù',
+    0x4712: 'ào',
+    0x4713: 'shè',
+    0x4714: 'suí',
+    0x4715: 'mài,hài',
+    0x4716: 'tàn',
+    0x4717: 'xìn,hàn',
+    0x4718: 'jǐng',
+    0x4719: 'án,è',
+    0x471A: 'tà',
+    0x471B: 'chán',
+    0x471C: 'wèi',
+    0x471D: 'tuǎn',
+    0x471E: 'jì',
+    0x471F: 'chén',
+    0x4720: 'chè',
+    0x4721: 'yù',
+    0x4722: 'xiǎn',
+    0x4723: 'xīn',
+    0x4727: 'nǎo',
+    0x4729: 'yàn',
+    0x472A: 'qiú',
+    0x472B: 'jiāng,hóng',
+    0x472C: 'sǒng',
+    0x472D: 'jùn,ruì',
+    0x472E: 'liáo,láo',
+    0x472F: 'jú',
+    0x4731: 'mǎn',
+    0x4732: 'liè',
+    0x4734: 'chù,shì',
+    0x4735: 'chǐ',
+    0x4736: 'xiáng',
+    0x4737: 'qīn',
+    0x4738: 'měi,méi',
+    0x4739: 'shù',
+    0x473A: 'chǎi,cè',
+    0x473B: 'chǐ',
+    0x473C: 'gú,móu',
+    0x473D: 'yú',
+    0x473E: 'yīn',
+    0x4740: 'liú,liáo',
+    0x4741: 'láo',
+    0x4742: 'shù',
+    0x4743: 'zhé',
+    0x4744: 'shuāng',
+    0x4745: 'huī',
+    0x4748: 'è',
+    0x474A: 'shà',
+    0x474B: 'zòng',
+    0x474C: 'jué',
+    0x474D: 'jùn,jūn',
+    0x474E: 'tuān',
+    0x474F: 'lóu',
+    0x4750: 'wéi,duò',
+    0x4751: 'chōng',
+    0x4752: 'zhù',
+    0x4753: 'liè',
+    0x4755: 'zhé',
+    0x4756: 'zhǎo',
+    0x4758: 'yì',
+    0x4759: 'chū',
+    0x475A: 'ní',
+    0x475B: 'bō',
+    0x475C: 'suān',
+    0x475D: 'yǐ',
+    0x475E: 'hào',
+    0x475F: 'yà',
+    0x4760: 'huán',
+    0x4761: 'màn',
+    0x4762: 'màn',
+    0x4763: 'qú',
+    0x4764: 'lǎo,liáo',
+    0x4765: 'háo',
+    0x4766: 'zhōng',
+    0x4767: 'mín',
+    0x4768: 'xián',
+    0x4769: 'zhèn',
+    0x476A: 'shǔ',
+    0x476B: 'zuó',
+    0x476C: 'zhù',
+    0x476D: 'gòu',
+    0x476E: 'xuàn',
+    0x476F: 'yì',
+    0x4770: 'zhì',
+    0x4771: 'xié',
+    0x4772: 'jìn',
+    0x4773: 'cán,hài',
+    0x4775: 'bù',
+    0x4776: 'liáng',
+    0x4777: 'zhī,zhì',
+    0x4778: 'jì',
+    0x4779: 'wǎn',
+    0x477A: 'guàn',
+    0x477B: 'jū',
+    0x477C: 'jìng,qíng',
+    0x477D: 'ài',
+    0x477E: 'fù',
+    0x477F: 'guì',
+    0x4780: 'hòu',
+    0x4781: 'yàn',
+    0x4782: 'ruǎn',
+    0x4783: 'zhì',
+    0x4784: 'biào',
+    0x4785: 'yí',
+    0x4786: 'suǒ',
+    0x4787: 'dié',
+    0x4788: 'guì',
+    0x4789: 'shèng',
+    0x478A: 'xùn',
+    0x478B: 'chèn',
+    0x478C: 'shé',
+    0x478D: 'qíng',
+    0x4790: 'chǔn',
+    0x4791: 'hóng',
+    0x4792: 'dòng',
+    0x4793: 'chēng',
+    0x4794: 'wěi',
+    0x4795: 'rú,yú',
+    0x4796: 'shǔ',
+    0x4797: 'cāi,chāi',
+    0x4798: 'jí',
+    0x4799: 'zá',
+    0x479A: 'qí,kuí',
+    0x479B: 'yān',
+    0x479C: 'fù',
+    0x479D: 'yù',
+    0x479E: 'fú',
+    0x479F: 'pò',
+    0x47A0: 'zhī',
+    0x47A1: 'tǎn',
+    0x47A2: 'zuó',
+    0x47A3: 'chě,chè,qiè',
+    0x47A4: 'qú,fǔ,qǔ',
+    0x47A5: 'yòu',
+    0x47A6: 'hé',
+    0x47A7: 'hòu',
+    0x47A8: 'guǐ',
+    0x47A9: 'è,xiá',
+    0x47AA: 'jiàng',
+    0x47AB: 'yǔn',
+    0x47AC: 'tòu',
+    0x47AD: 'cūn,qiǔ',
+    0x47AE: 'tū',
+    0x47AF: 'fù,fú',
+    0x47B0: 'zuó',
+    0x47B1: 'hú',
+    0x47B3: 'bó',
+    0x47B4: 'zhāo',
+    0x47B5: 'juě,zhuò',
+    0x47B6: 'tāng,tàng',
+    0x47B7: 'jué',
+    0x47B8: 'fù',
+    0x47B9: 'huáng',
+    0x47BA: 'chūn',
+    0x47BB: 'yǒng',
+    0x47BC: 'chuǐ',
+    0x47BD: 'suǒ',
+    0x47BE: 'chí,dì',
+    0x47BF: 'qiān',
+    0x47C0: 'cāi',
+    0x47C1: 'xiāo,chāo',
+    0x47C2: 'mán',
+    0x47C3: 'cān,cà',
+    0x47C4: 'qì,zuó,zè',
+    0x47C5: 'jiàn,zàn',
+    0x47C6: 'bì',
+    0x47C7: 'jī,xī',
+    0x47C8: 'zhí',
+    0x47C9: 'zhú,shǔ',
+    0x47CA: 'qú',
+    0x47CB: 'zhǎn',
+    0x47CC: 'jí',
+    0x47CD: 'biān,dián',
+    0x47CF: 'lì',
+    0x47D0: 'lì',
+    0x47D1: 'yuè',
+    0x47D2: 'quán',
+    0x47D3: 'chēng,zhēng,dīng',
+    0x47D4: 'fù,bó',
+    0x47D5: 'chà',
+    0x47D6: 'tàng',
+    0x47D7: 'shì',
+    0x47D8: 'hàng',
+    0x47D9: 'qiè',
+    0x47DA: 'qí',
+    0x47DB: 'bó,fèi,bèi',
+    0x47DC: 'nà',
+    0x47DD: 'tòu',
+    0x47DE: 'chú',
+    0x47DF: 'cù',
+    0x47E0: 'yuè',
+    0x47E1: 'zhī,dì',
+    0x47E2: 'chén',
+    0x47E3: 'chù',
+    0x47E4: 'bì,bié',
+    0x47E5: 'méng',
+    0x47E6: 'bá',
+    0x47E7: 'tián',
+    0x47E8: 'mín,mǐn',
+    0x47E9: 'liě,què',
+    0x47EA: 'fěng,fǎn',
+    0x47EB: 'chēng,shàng',
+    0x47EC: 'qiù',
+    0x47ED: 'tiáo,zuò',
+    0x47EE: 'fú,bó',
+    0x47EF: 'kuò',
+    0x47F0: 'jiǎn',
+    0x47F4: 'zhèn',
+    0x47F5: 'qiú',
+    0x47F6: 'zuò,cuò',
+    0x47F7: 'chì,qì',
+    0x47F8: 'kuí,guī',
+    0x47F9: 'liè',
+    0x47FA: 'bèi,pèi',
+    0x47FB: 'dù,zhà',
+    0x47FC: 'wǔ',
+    0x47FE: 'zhuó,juě',
+    0x47FF: 'lù',
+    0x4800: 'tāng,chǎng,tàng',
+    0x4802: 'chú',
+    0x4803: 'liǎng',
+    0x4804: 'tiǎn',
+    0x4805: 'kǔn',
+    0x4806: 'cháng',
+    0x4807: 'jué',
+    0x4808: 'tú',
+    0x4809: 'huàn',
+    0x480A: 'fèi',
+    0x480B: 'bì,bǐ,bāi',
+    0x480D: 'xiā,qiá,qié',
+    0x480E: 'wò',
+    0x480F: 'jì,kuí',
+    0x4810: 'qù',
+    0x4811: 'kuǐ,kuí,wěi',
+    0x4812: 'hú',
+    0x4813: 'qiū,cù',
+    0x4814: 'suì',
+    0x4815: 'cāi',
+    0x4817: 'qiù,xiòng',
+    0x4818: 'pì',
+    0x4819: 'páng',
+    0x481A: 'wà,wǎ',
+    0x481B: 'yáo',
+    0x481C: 'róng,rǒng',
+    0x481D: 'xūn',
+    0x481E: 'cù',
+    0x481F: 'dié',
+    0x4820: 'chì,dài',
+    0x4821: 'cuó,chá',
+    0x4822: 'mèng',
+    0x4823: 'xuǎn',
+    0x4824: 'duǒ,duò',
+    0x4825: 'bié',
+    0x4826: 'zhè',
+    0x4827: 'chú',
+    0x4828: 'chàn',
+    0x4829: 'guì',
+    0x482A: 'duàn',
+    0x482B: 'zòu',
+    0x482C: 'dèng',
+    0x482D: 'lái',
+    0x482E: 'téng',
+    0x482F: 'yuè',
+    0x4830: 'quán',
+    0x4831: 'zhú',
+    0x4832: 'líng',
+    0x4833: 'chēn',
+    0x4834: 'zhěn',
+    0x4835: 'fù',
+    0x4836: 'shè',
+    0x4837: 'tiǎo',
+    0x4838: 'kuā',
+    0x4839: 'ái',
+    0x483B: 'qióng',
+    0x483C: 'shù',
+    0x483D: 'hái,kǎi',
+    0x483E: 'shǎn',
+    0x483F: 'wài,kuì',
+    0x4840: 'zhǎn,zhàn',
+    0x4841: 'lǒng',
+    0x4842: 'jiū,jiù',
+    0x4843: 'lì',
+    0x4845: 'chūn,xún',
+    0x4846: 'róng',
+    0x4847: 'yuè',
+    0x4848: 'jué,jiào',
+    0x4849: 'kǎng',
+    0x484A: 'fǎn',
+    0x484B: 'qí',
+    0x484C: 'hóng',
+    0x484D: 'fú',
+    0x484E: 'lú',
+    0x484F: 'hóng',
+    0x4850: 'tuó',
+    0x4851: 'mín',
+    0x4852: 'tián',
+    0x4853: 'juàn,xuān',
+    0x4854: 'qǐ',
+    0x4855: 'zhěng',
+    0x4856: 'qìng',
+    0x4857: 'gǒng,gòng',
+    0x4858: 'tián',
+    0x4859: 'láng',
+    0x485A: 'mào',
+    0x485B: 'yìn',
+    0x485C: 'lù',
+    0x485D: 'yuān,yǔn',
+    0x485E: 'jú',
+    0x485F: 'pì',
+    0x4861: 'xié',
+    0x4862: 'biàn',
+    0x4863: 'hūn,xuān',
+    0x4864: 'zhū',
+    0x4865: 'róng',
+    0x4866: 'sǎng',
+    0x4867: 'wū,wǔ',
+    0x4868: 'chà',
+    0x4869: 'kēng,zhěn',
+    0x486A: 'shàn',
+    0x486B: 'péng',
+    0x486C: 'màn',
+    0x486D: 'xiū',
+    0x486F: 'cōng,zǒng',
+    0x4870: 'kēng,kěng,gǔ',
+    0x4871: 'zhuǎn',
+    0x4872: 'chán,dān',
+    0x4873: 'sī',
+    0x4874: 'chōng',
+    0x4875: 'suì',
+    0x4876: 'bèi',
+    0x4877: 'kài,kě',
+    0x4879: 'zhì',
+    0x487A: 'wèi',
+    0x487B: 'mín',
+    0x487C: 'líng',
+    0x487D: 'zuān',
+    0x487E: 'niè,yè,yǐ',
+    0x487F: 'líng',
+    0x4880: 'qì',
+    0x4881: 'yuè',
+    0x4883: 'yì',
+    0x4884: 'xǐ',
+    0x4885: 'chén',
+    0x4887: 'rǒng',
+    0x4888: 'chén,huì',
+    0x4889: 'nóng',
+    0x488A: 'yóu',
+    0x488B: 'jì',
+    0x488C: 'bó',
+    0x488D: 'fǎng',
+    0x4890: 'cú',
+    0x4891: 'dǐ,dì',
+    0x4892: 'jiāo',
+    0x4893: 'yú',
+    0x4894: 'hé',
+    0x4895: 'xù',
+    0x4896: 'yù,lǜ',
+    0x4897: 'qū',
+    0x4899: 'bài',
+    0x489A: 'gēng,háng',
+    0x489B: 'jiǒng',
+    0x489D: 'yà',
+    0x489E: 'shù',
+    0x489F: 'yóu',
+    0x48A0: 'sòng',
+    0x48A1: 'yè,xiè,zhuì',
+    0x48A2: 'càng',
+    0x48A3: 'yáo',
+    0x48A4: 'shù',
+    0x48A5: 'yán',
+    0x48A6: 'shuài',
+    0x48A7: 'liào',
+    0x48A8: 'cōng,zōng',
+    0x48A9: 'yù',
+    0x48AA: 'bó',
+    0x48AB: 'suí',
+    0x48AD: 'yàn,xiàn',
+    0x48AE: 'lèi',
+    0x48AF: 'lín',
+    0x48B0: 'tī',
+    0x48B1: 'dú',
+    0x48B2: 'yuè',
+    0x48B3: 'jǐ',
+    0x48B5: 'yún',
+    0x48B8: 'jū',
+    0x48B9: 'jǔ,qú',
+    0x48BA: 'chū',
+    0x48BB: 'chén',
+    0x48BC: 'gōng',
+    0x48BD: 'xiàng',
+    0x48BE: 'xiǎn',
+    0x48BF: 'ān',
+    0x48C0: 'guǐ,qī,wéi',
+    0x48C1: 'yǔ',
+    0x48C2: 'lěi',
+    0x48C4: 'tú',
+    0x48C5: 'chén',
+    0x48C6: 'xíng',
+    0x48C7: 'qiú',
+    0x48C8: 'hàng',
+    0x48CA: 'dǎng',
+    0x48CB: 'cǎi',
+    0x48CC: 'dǐ',
+    0x48CD: 'yǎn,yān',
+    0x48CE: 'zī',
+    0x48D0: 'yīng',
+    0x48D1: 'chán',
+    0x48D3: 'lí,lì',
+    0x48D4: 'suǒ',
+    0x48D5: 'mǎ',
+    0x48D6: 'mǎ',
+    0x48D8: 'táng',
+    0x48D9: 'péi,pěng,bēi',
+    0x48DA: 'lóu',
+    0x48DB: 'qī,xī',
+    0x48DC: 'cuó',
+    0x48DD: 'tú',
+    0x48DE: 'è',
+    0x48DF: 'cán,cǎn,tì',
+    0x48E0: 'jié,tì,zá',
+    0x48E1: 'yí',
+    0x48E2: 'jí',
+    0x48E3: 'dǎng',
+    0x48E4: 'jué',
+    0x48E5: 'bǐ',
+    0x48E6: 'lèi',
+    0x48E7: 'yì',
+    0x48E8: 'chún',
+    0x48E9: 'chún',
+    0x48EA: 'pò',
+    0x48EB: 'lí',
+    0x48EC: 'zǎi,gē',
+    0x48ED: 'tài',
+    0x48EE: 'pò',
+    0x48EF: 'cú,tiǎn',
+    0x48F0: 'jù',
+    0x48F1: 'xù',
+    0x48F2: 'fàn',
+    0x48F4: 'xù',
+    0x48F5: 'èr',
+    0x48F6: 'huó,tián',
+    0x48F7: 'zhū',
+    0x48F8: 'rǎn,nǎn,nàn',
+    0x48F9: 'fá',
+    0x48FA: 'juān',
+    0x48FB: 'hān',
+    0x48FC: 'liáng',
+    0x48FD: 'zhī,tǐ',
+    0x48FE: 'mì',
+    0x48FF: 'yū',
+    0x4901: 'cén',
+    0x4902: 'méi',
+    0x4903: 'yīn,ān,yìn',
+    0x4904: 'miǎn',
+    0x4905: 'tú',
+    0x4906: 'kuí,guì',
+    0x4909: 'mì',
+    0x490A: 'róng',
+    0x490B: 'yù,guó',
+    0x490C: 'qiāng',
+    0x490D: 'mí',
+    0x490E: 'jú,jué',
+    0x490F: 'pǐ',
+    0x4910: 'jǐn',
+    0x4911: 'wàng',
+    0x4912: 'jì,jǐ',
+    0x4913: 'méng',
+    0x4914: 'jiàn',
+    0x4915: 'xuè,hù',
+    0x4916: 'bào',
+    0x4917: 'gǎn',
+    0x4918: 'chǎn,qiǎn',
+    0x4919: 'lì',
+    0x491A: 'lǐ',
+    0x491B: 'qiú',
+    0x491C: 'dùn',
+    0x491D: 'yìng',
+    0x491E: 'yǔn',
+    0x491F: 'chén',
+    0x4920: 'zhǐ',
+    0x4921: 'rǎn',
+    0x4923: 'lüè',
+    0x4924: 'kāi',
+    0x4925: 'guǐ,wěi',
+    0x4926: 'yuè',
+    0x4927: 'huì',
+    0x4928: 'pì',
+    0x4929: 'chá',
+    0x492A: 'duǒ',
+    0x492B: 'chán',
+    0x492C: 'shā',
+    0x492D: 'shì',
+    0x492E: 'shè',
+    0x492F: 'xíng',
+    0x4930: 'yíng',
+    0x4931: 'shì',
+    0x4932: 'chì',
+    0x4933: 'yè',
+    0x4934: 'hán',
+    0x4935: 'fèi,pī,fēi',
+    0x4936: 'yè,ān',
+    0x4937: 'yǎn',
+    0x4938: 'zuàn',
+    0x4939: 'sōu',
+    0x493A: 'jīn,yǐn',
+    0x493B: 'duò',
+    0x493C: 'xiàn',
+    0x493D: 'guān',
+    0x493E: 'tāo',
+    0x493F: 'qiè',
+    0x4940: 'chǎn',
+    0x4941: 'hán',
+    0x4942: 'mèng',
+    0x4943: 'yuè',
+    0x4944: 'cù',
+    0x4945: 'qiàn',
+    0x4946: 'jǐn',
+    0x4947: 'shàn',
+    0x4948: 'mǔ',
+    0x4949: 'yuān',
+    0x494B: 'pēng',
+    0x494C: 'zhèng',
+    0x494D: 'zhì',
+    0x494E: 'chún',
+    0x494F: 'yǔ',
+    0x4950: 'móu',
+    0x4951: 'wàn',
+    0x4952: 'jiàng',
+    0x4953: 'qī',
+    0x4954: 'sù',
+    0x4955: 'piě',
+    0x4956: 'tián',
+    0x4957: 'kuǎn',
+    0x4958: 'cù',
+    0x4959: 'suì',
+    0x495B: 'jiē,jié,qì',
+    0x495C: 'jiàn',
+    0x495D: 'áo',
+    0x495E: 'jiǎo',
+    0x495F: 'yè',
+    0x4961: 'yè',
+    0x4962: 'lóng,qī',
+    0x4963: 'záo',
+    0x4964: 'báo',
+    0x4965: 'lián',
+    0x4967: 'huán',
+    0x4968: 'lǜ,lú',
+    0x4969: 'wéi',
+    0x496A: 'xiǎn',
+    0x496B: 'tiě',
+    0x496C: 'bó',
+    0x496D: 'zhèng',
+    0x496E: 'zhú',
+    0x496F: 'bēi,bà',
+    0x4970: 'méng',
+    0x4971: 'xiě',
+    0x4972: 'ōu',
+    0x4973: 'yōu',
+    0x4975: 'xiǎo',
+    0x4976: 'lì',
+    0x4977: 'zhá',
+    0x4978: 'mí',
+    0x497A: 'yé',
+    0x497D: 'pō',
+    0x497E: 'xiě',
+    0x4982: 'shàn',
+    0x4983: 'zhuō',
+    0x4985: 'shàn',
+    0x4986: 'jué',
+    0x4987: 'jì',
+    0x4988: 'jiē,zuǒ',
+    0x498A: 'niǎo',
+    0x498B: 'áo',
+    0x498C: 'chù',
+    0x498D: 'wù',
+    0x498E: 'guǎn,kàng',
+    0x498F: 'xiè',
+    0x4990: 'tǐng',
+    0x4991: 'xuè',
+    0x4992: 'dàng,qiāo',
+    0x4993: 'zhān,chān',
+    0x4994: 'tǎn,dǎn',
+    0x4995: 'pēng',
+    0x4996: 'xié,xiá',
+    0x4997: 'xù',
+    0x4998: 'xiàn',
+    0x4999: 'sì,shì',
+    0x499A: 'kuà',
+    0x499B: 'zhèng',
+    0x499C: 'wú',
+    0x499D: 'huō',
+    0x499E: 'rùn',
+    0x499F: 'wěn,chuài',
+    0x49A0: 'dū',
+    0x49A1: 'huán',
+    0x49A2: 'kuò',
+    0x49A3: 'fù',
+    0x49A4: 'chuài',
+    0x49A5: 'xián',
+    0x49A6: 'qín',
+    0x49A7: 'qié',
+    0x49A8: 'lán',
+    0x49AA: 'yà',
+    0x49AB: 'yīng',
+    0x49AC: 'què',
+    0x49AD: 'hāng',
+    0x49AE: 'chǔn',
+    0x49AF: 'zhì',
+    0x49B1: 'wěi,kuā',
+    0x49B2: 'yán,qiàn,chàn',
+    0x49B3: 'xiàng',
+    0x49B4: 'yì',
+    0x49B5: 'nǐ',
+    0x49B6: 'zhèng',
+    0x49B7: 'chuài',
+    0x49B9: 'shí',
+    0x49BA: 'dīng',
+    0x49BB: 'zǐ',
+    0x49BC: 'jué,pì',
+    0x49BD: 'xù',
+    0x49BE: 'yuán',
+    0x49C1: 'xǔ',
+    0x49C2: 'dào',
+    0x49C3: 'tián',
+    0x49C4: 'gè',
+    0x49C5: 'yí',
+    0x49C6: 'hóng',
+    0x49C7: 'yī,yǐ',
+    0x49C9: 'lǐ',
+    0x49CA: 'kū',
+    0x49CB: 'xiǎn,xiàn',
+    0x49CC: 'suī',
+    0x49CD: 'xì',
+    0x49CE: 'xuàn',
+    0x49D1: 'dī',
+    0x49D2: 'lái',
+    0x49D3: 'zhōu',
+    0x49D4: 'niàn',
+    0x49D5: 'chéng',
+    0x49D6: 'jiàn',
+    0x49D7: 'bì',
+    0x49D8: 'zhuàn',
+    0x49D9: 'líng',
+    0x49DA: 'hào',
+    0x49DB: 'bàng,péng',
+    0x49DC: 'táng',
+    0x49DD: 'chī,zhì',
+    0x49DE: 'mà,fù',
+    0x49DF: 'xiàn',
+    0x49E0: 'shuàn',
+    0x49E1: 'yōng',
+    0x49E2: 'qū,ōu',
+    0x49E4: 'pú',
+    0x49E5: 'huì',
+    0x49E6: 'wéi',
+    0x49E7: 'yǐ',
+    0x49E8: 'yè',
+    0x49EA: 'chè',
+    0x49EB: 'háo',
+    0x49EC: 'bīn',
+    0x49EE: 'xiàn,xiǎn',
+    0x49EF: 'chán,zhàn',
+    0x49F0: 'hùn',
+    0x49F2: 'hàn',
+    0x49F3: 'cí,zhuī',
+    0x49F4: 'zhī',
+    0x49F5: 'qí',
+    0x49F6: 'kuí',
+    0x49F7: 'róu',
+    0x49F9: 'yīng',
+    0x49FA: 'xióng',
+    0x49FC: 'hú',
+    0x49FD: 'cuǐ',
+    0x49FF: 'què,xī',
+    0x4A00: 'dí',
+    0x4A01: 'wù',
+    0x4A02: 'qiū',
+    0x4A04: 'yàn',
+    0x4A05: 'liáo',
+    0x4A06: 'bí',
+    0x4A08: 'bīn',
+    0x4A0A: 'yuān',
+    0x4A0B: 'nüè',
+    0x4A0C: 'báo',
+    0x4A0D: 'yǐng',
+    0x4A0E: 'hóng',
+    0x4A0F: 'cí',
+    0x4A10: 'qià',
+    0x4A11: 'tí',
+    0x4A12: 'yù',
+    0x4A13: 'léi',
+    0x4A14: 'báo',
+    0x4A16: 'jì',
+    0x4A17: 'fú',
+    0x4A18: 'xiàn',
+    0x4A19: 'cén',
+    0x4A1A: 'hū',
+    0x4A1B: 'sè,xī',
+    0x4A1C: 'bēng',
+    0x4A1D: 'qīng',
+    0x4A1E: 'yǔ,yù',
+    0x4A1F: 'wā',
+    0x4A20: 'ǎi',
+    0x4A21: 'hán',
+    0x4A22: 'dàn',
+    0x4A23: 'gé',
+    0x4A24: 'dí',
+    0x4A25: 'huò,shuāng',
+    0x4A26: 'pāng',
+    0x4A28: 'zhuī',
+    0x4A29: 'líng',
+    0x4A2A: 'mái',
+    0x4A2B: 'mài',
+    0x4A2C: 'lián',
+    0x4A2D: 'xiāo',
+    0x4A2E: 'xuě',
+    0x4A2F: 'zhèn',
+    0x4A30: 'pò',
+    0x4A31: 'fù',
+    0x4A32: 'nóu,wàn',
+    0x4A33: 'xì,xī',
+    0x4A34: 'duì',
+    0x4A35: 'dàn',
+    0x4A36: 'yǔn',
+    0x4A37: 'xiàn',
+    0x4A38: 'yǐn',
+    0x4A39: 'shū',
+    0x4A3A: 'duì',
+    0x4A3B: 'bèng',
+    0x4A3C: 'hù',
+    0x4A3D: 'fěi',
+    0x4A3E: 'fèi',
+    0x4A3F: 'zá',
+    0x4A40: 'bèi',
+    0x4A41: 'fēi',
+    0x4A42: 'xiān',
+    0x4A43: 'shì',
+    0x4A44: 'miǎn,tiǎn',
+    0x4A45: 'zhǎn,nǎn',
+    0x4A46: 'zhǎn',
+    0x4A47: 'zhān,diān',
+    0x4A48: 'huì',
+    0x4A49: 'fǔ',
+    0x4A4A: 'wǎn,wò',
+    0x4A4B: 'mǒ',
+    0x4A4C: 'qiáo',
+    0x4A4D: 'liǎo',
+    0x4A4F: 'miè',
+    0x4A50: 'hū,jí,gé',
+    0x4A51: 'hóng',
+    0x4A52: 'yú',
+    0x4A53: 'qí',
+    0x4A54: 'duò,shān,pán',
+    0x4A55: 'áng,yìng',
+    0x4A57: 'bà',
+    0x4A58: 'dì',
+    0x4A59: 'xuàn,xiǎn',
+    0x4A5A: 'dì,dī',
+    0x4A5B: 'bì,pèi',
+    0x4A5C: 'zhòu',
+    0x4A5D: 'páo',
+    0x4A5E: 'tié,diē',
+    0x4A5F: 'yí,tì',
+    0x4A61: 'jiá,gé',
+    0x4A62: 'zhì,dá',
+    0x4A63: 'tú',
+    0x4A64: 'xié',
+    0x4A65: 'dàn,chān',
+    0x4A66: 'tiáo',
+    0x4A67: 'xiè',
+    0x4A68: 'chàng,zhāng',
+    0x4A69: 'yuǎn',
+    0x4A6A: 'guǎn',
+    0x4A6B: 'liǎng',
+    0x4A6C: 'běng,fěng',
+    0x4A6E: 'lù',
+    0x4A6F: 'jí,qì',
+    0x4A70: 'xuàn',
+    0x4A71: 'shù,yú,shū',
+    0x4A72: 'dū',
+    0x4A73: 'sōu',
+    0x4A74: 'hú',
+    0x4A75: 'yùn',
+    0x4A76: 'chǎn',
+    0x4A77: 'bāng',
+    0x4A78: 'róng,rǒng',
+    0x4A79: 'é,kuò',
+    0x4A7A: 'wēng',
+    0x4A7B: 'bà',
+    0x4A7C: 'féng',
+    0x4A7D: 'yū',
+    0x4A7E: 'zhè',
+    0x4A7F: 'fén',
+    0x4A80: 'guǎn',
+    0x4A81: 'bǔ',
+    0x4A82: 'gé',
+    0x4A83: 'dūn',
+    0x4A84: 'huáng',
+    0x4A85: 'dú',
+    0x4A86: 'tǐ',
+    0x4A87: 'bó',
+    0x4A88: 'qiàn',
+    0x4A89: 'liè',
+    0x4A8A: 'lóng',
+    0x4A8B: 'wèi',
+    0x4A8C: 'zhàn,shān',
+    0x4A8D: 'lán',
+    0x4A8E: 'suī',
+    0x4A8F: 'nà,dā',
+    0x4A90: 'bì',
+    0x4A91: 'tuó',
+    0x4A92: 'zhù',
+    0x4A93: 'diē',
+    0x4A94: 'bǔ,fù',
+    0x4A95: 'jú',
+    0x4A96: 'pò',
+    0x4A97: 'xiá',
+    0x4A98: 'wěi,dī',
+    0x4A99: 'pò,fú,fù',
+    0x4A9A: 'dā,tà',
+    0x4A9B: 'fān,fán',
+    0x4A9C: 'chān,chàn,yán',
+    0x4A9D: 'hù',
+    0x4A9E: 'zá',
+    0x4AA4: 'fán',
+    0x4AA5: 'xiè',
+    0x4AA6: 'hóng',
+    0x4AA7: 'chí',
+    0x4AA8: 'báo',
+    0x4AA9: 'yín',
+    0x4AAB: 'jīng',
+    0x4AAC: 'bó',
+    0x4AAD: 'ruǎn',
+    0x4AAE: 'chǒu',
+    0x4AAF: 'yīng',
+    0x4AB0: 'yī',
+    0x4AB1: 'gǎi,hái',
+    0x4AB2: 'kūn',
+    0x4AB3: 'yǔn',
+    0x4AB4: 'zhěn,dǎn,dàn',
+    0x4AB5: 'yǎ',
+    0x4AB6: 'jū',
+    0x4AB7: 'hòu,gòu',
+    0x4AB8: 'mín,mén',
+    0x4AB9: 'bāi,pī,péi',
+    0x4ABA: 'gé',
+    0x4ABB: 'biàn,fàn',
+    0x4ABC: 'zhuō',
+    0x4ABD: 'hào',
+    0x4ABE: 'zhěn',
+    0x4ABF: 'shěng',
+    0x4AC0: 'gěn',
+    0x4AC1: 'bì',
+    0x4AC2: 'duǒ',
+    0x4AC3: 'chún,zhèn',
+    0x4AC4: 'chuà',
+    0x4AC5: 'sàn',
+    0x4AC6: 'chéng',
+    0x4AC7: 'rán',
+    0x4AC8: 'chěn,zèn,cén',
+    0x4AC9: 'mào',
+    0x4ACA: 'péi',
+    0x4ACB: 'wēi,tuí',
+    0x4ACC: 'pǐ',
+    0x4ACD: 'fǔ',
+    0x4ACE: 'zhuō',
+    0x4ACF: 'qī',
+    0x4AD0: 'lín',
+    0x4AD1: 'yī,qī',
+    0x4AD2: 'mén',
+    0x4AD3: 'wú',
+    0x4AD4: 'qì,qiè,yà,kuí',
+    0x4AD5: 'dié',
+    0x4AD6: 'chěn,shèn',
+    0x4AD7: 'xiá',
+    0x4AD8: 'hé,jié,kě',
+    0x4AD9: 'sǎng',
+    0x4ADA: 'guā',
+    0x4ADB: 'hóu',
+    0x4ADC: 'āo',
+    0x4ADD: 'fǔ',
+    0x4ADE: 'qiāo,fén',
+    0x4ADF: 'hùn',
+    0x4AE0: 'pī',
+    0x4AE1: 'yán,qiàn,qiān,jiàn',
+    0x4AE2: 'sī',
+    0x4AE3: 'xí',
+    0x4AE4: 'míng',
+    0x4AE5: 'kuǐ',
+    0x4AE6: 'gé,kài',
+    0x4AE8: 'ào',
+    0x4AE9: 'sǎn',
+    0x4AEA: 'shuǎng',
+    0x4AEB: 'lóu',
+    0x4AEC: 'zhěn,qǐn',
+    0x4AED: 'huì',
+    0x4AEE: 'chán',
+    0x4AF0: 'lìn',
+    0x4AF1: 'ná',
+    0x4AF2: 'hàn,kǎn',
+    0x4AF3: 'dú',
+    0x4AF4: 'jìn',
+    0x4AF5: 'mián',
+    0x4AF6: 'fán',
+    0x4AF7: 'è',
+    0x4AF8: 'chāo',
+    0x4AF9: 'hóng',
+    0x4AFA: 'hóng',
+    0x4AFB: 'yù',
+    0x4AFC: 'xuè',
+    0x4AFD: 'pāo',
+    0x4AFE: 'bī,bì',
+    0x4AFF: 'chāo',
+    0x4B00: 'yǒu',
+    0x4B01: 'yí',
+    0x4B02: 'xuè',
+    0x4B03: 'sà',
+    0x4B04: 'xù',
+    0x4B05: 'lì,liè,xié',
+    0x4B06: 'lì',
+    0x4B07: 'yuàn',
+    0x4B08: 'duì',
+    0x4B09: 'huò',
+    0x4B0A: 'shà',
+    0x4B0B: 'léng',
+    0x4B0C: 'pōu',
+    0x4B0D: 'hū',
+    0x4B0E: 'guó,xù',
+    0x4B0F: 'bù,fǒu',
+    0x4B10: 'ruí',
+    0x4B11: 'wèi,yù',
+    0x4B12: 'sōu,xiāo',
+    0x4B13: 'àn',
+    0x4B14: 'yú',
+    0x4B15: 'xiāng,shǎng',
+    0x4B16: 'héng',
+    0x4B17: 'yáng',
+    0x4B18: 'xiāo',
+    0x4B19: 'yáo',
+    0x4B1B: 'bì',
+    0x4B1D: 'héng',
+    0x4B1E: 'táo',
+    0x4B1F: 'liú,liǔ',
+    0x4B21: 'zhù',
+    0x4B23: 'xì,qì,gē',
+    0x4B24: 'zàn,zhān',
+    0x4B25: 'yì',
+    0x4B26: 'dòu,shè',
+    0x4B27: 'yuán',
+    0x4B28: 'jiù',
+    0x4B2A: 'bó',
+    0x4B2B: 'tí',
+    0x4B2C: 'yǐng',
+    0x4B2E: 'yí',
+    0x4B2F: 'nián,tiǎn',
+    0x4B30: 'shào',
+    0x4B31: 'bèn',
+    0x4B32: 'gōu',
+    0x4B33: 'bǎn',
+    0x4B34: 'mò',
+    0x4B35: 'gāi,ài',
+    0x4B36: 'èn',
+    0x4B37: 'shě',
+    0x4B39: 'zhì',
+    0x4B3A: 'yàng',
+    0x4B3B: 'jiàn',
+    0x4B3C: 'yuàn',
+    0x4B3D: 'shuì,duì',
+    0x4B3E: 'tí',
+    0x4B3F: 'wěi,wèi',
+    0x4B40: 'xùn',
+    0x4B41: 'zhì',
+    0x4B42: 'yì',
+    0x4B43: 'rěn,niè',
+    0x4B44: 'shì',
+    0x4B45: 'hú',
+    0x4B46: 'nè',
+    0x4B47: 'yē,yì',
+    0x4B48: 'jiàn',
+    0x4B49: 'suǐ',
+    0x4B4A: 'yǐng',
+    0x4B4B: 'bǎo',
+    0x4B4C: 'hú',
+    0x4B4D: 'hú',
+    0x4B4E: 'yè',
+    0x4B50: 'yàng',
+    0x4B51: 'lián,qiàn,xiàn',
+    0x4B52: 'xī',
+    0x4B53: 'èn',
+    0x4B54: 'duī',
+    0x4B55: 'zǎn,jiǎn',
+    0x4B56: 'zhù',
+    0x4B57: 'yǐng',
+    0x4B58: 'yǐng',
+    0x4B59: 'jǐn,jiàn',
+    0x4B5A: 'chuáng',
+    0x4B5B: 'dàn',
+    0x4B5D: 'kuài',
+    0x4B5E: 'yì',
+    0x4B5F: 'yè',
+    0x4B60: 'jiǎn',
+    0x4B61: 'èn',
+    0x4B62: 'níng',
+    0x4B63: 'cí',
+    0x4B64: 'qiǎn',
+    0x4B65: 'xuè',
+    0x4B66: 'bō',
+    0x4B67: 'mǐ',
+    0x4B68: 'shuì',
+    0x4B69: 'mó',
+    0x4B6A: 'liáng',
+    0x4B6B: 'qǐ',
+    0x4B6C: 'qǐ',
+    0x4B6D: 'shǒu',
+    0x4B6E: 'fú',
+    0x4B6F: 'bó',
+    0x4B70: 'bèng',
+    0x4B71: 'bié',
+    0x4B72: 'yǐ',
+    0x4B73: 'wèi',
+    0x4B74: 'huán',
+    0x4B75: 'fán',
+    0x4B76: 'qí',
+    0x4B77: 'máo',
+    0x4B78: 'fù',
+    0x4B79: 'áng',
+    0x4B7A: 'ǎng',
+    0x4B7B: 'fēn,fù',
+    0x4B7C: 'qí',
+    0x4B7D: 'qún',
+    0x4B7E: 'tuó',
+    0x4B7F: 'yì',
+    0x4B80: 'bó',
+    0x4B81: 'pián',
+    0x4B82: 'bá',
+    0x4B84: 'xuán',
+    0x4B87: 'yù',
+    0x4B88: 'chí',
+    0x4B89: 'lú',
+    0x4B8A: 'yí',
+    0x4B8B: 'lì',
+    0x4B8D: 'niǎo',
+    0x4B8E: 'xì',
+    0x4B8F: 'wú',
+    0x4B91: 'lèi,luò',
+    0x4B92: 'pū',
+    0x4B93: 'zhuō,chào',
+    0x4B94: 'zuī',
+    0x4B95: 'zhuó',
+    0x4B96: 'chāng',
+    0x4B97: 'àn,yàn',
+    0x4B98: 'ér',
+    0x4B99: 'yù',
+    0x4B9A: 'lèng,líng',
+    0x4B9B: 'fù',
+    0x4B9C: 'zhá,yè',
+    0x4B9D: 'hún',
+    0x4B9E: 'chǔn',
+    0x4B9F: 'sōu,sǒu',
+    0x4BA0: 'bī',
+    0x4BA1: 'bì,bó',
+    0x4BA2: 'zhá',
+    0x4BA4: 'hé',
+    0x4BA5: 'lì',
+    0x4BA7: 'hàn,hán',
+    0x4BA8: 'zǎi',
+    0x4BA9: 'gú',
+    0x4BAA: 'chéng',
+    0x4BAB: 'lóu,lǘ',
+    0x4BAC: 'mò',
+    0x4BAD: 'mì',
+    0x4BAE: 'mài',
+    0x4BAF: 'ào',
+    0x4BB0: 'zhé',
+    0x4BB1: 'zhú',
+    0x4BB2: 'huáng',
+    0x4BB3: 'fán',
+    0x4BB4: 'dèng,tēng',
+    0x4BB5: 'tóng',
+    0x4BB7: 'dú',
+    0x4BB8: 'wò',
+    0x4BB9: 'wèi,guì',
+    0x4BBA: 'jì',
+    0x4BBB: 'chì',
+    0x4BBC: 'lín',
+    0x4BBD: 'biāo',
+    0x4BBE: 'lóng,lòng',
+    0x4BBF: 'jiǎn',
+    0x4BC0: 'niè',
+    0x4BC1: 'luó',
+    0x4BC2: 'shēn,jí',
+    0x4BC4: 'guā',
+    0x4BC5: 'niè',
+    0x4BC6: 'yì',
+    0x4BC7: 'kū',
+    0x4BC8: 'wán',
+    0x4BC9: 'wā',
+    0x4BCA: 'qià,kē',
+    0x4BCB: 'bó,fèi',
+    0x4BCC: 'kāo',
+    0x4BCD: 'líng',
+    0x4BCE: 'gàn',
+    0x4BCF: 'guā,huá',
+    0x4BD0: 'hái',
+    0x4BD1: 'kuāng',
+    0x4BD2: 'héng',
+    0x4BD3: 'kuī',
+    0x4BD4: 'zé',
+    0x4BD5: 'tīng',
+    0x4BD6: 'láng',
+    0x4BD7: 'bì',
+    0x4BD8: 'huàn',
+    0x4BD9: 'pò',
+    0x4BDA: 'yǎo',
+    0x4BDB: 'wàn',
+    0x4BDC: 'tì,xī',
+    0x4BDD: 'suǐ',
+    0x4BDE: 'kuā',
+    0x4BDF: 'duì,xiá',
+    0x4BE0: 'ǎo',
+    0x4BE1: 'jiàn',
+    0x4BE2: 'mó,mǒ',
+    0x4BE3: 'kuì,guì',
+    0x4BE4: 'kuài',
+    0x4BE5: 'àn,qì',
+    0x4BE6: 'mà',
+    0x4BE7: 'qǐng,qìng',
+    0x4BE8: 'qiāo,hè',
+    0x4BEA: 'kǎo,kào',
+    0x4BEB: 'hào',
+    0x4BEC: 'duǒ',
+    0x4BED: 'xiān',
+    0x4BEE: 'nái',
+    0x4BEF: 'suō',
+    0x4BF0: 'jiè',
+    0x4BF1: 'pī,pēi,fù',
+    0x4BF2: 'pā,bà',
+    0x4BF3: 'sōng',
+    0x4BF4: 'cháng',
+    0x4BF5: 'niè',
+    0x4BF6: 'mán,mián',
+    0x4BF7: 'sōng',
+    0x4BF8: 'cì',
+    0x4BF9: 'xiān',
+    0x4BFA: 'kuò',
+    0x4BFC: 'dí',
+    0x4BFD: 'póu,pǒu,bǎo',
+    0x4BFE: 'tiáo,diāo',
+    0x4BFF: 'zú,suì,zuì',
+    0x4C00: 'wǒ',
+    0x4C01: 'fèi',
+    0x4C02: 'cài',
+    0x4C03: 'péng,pèng,fǎng',
+    0x4C04: 'sāi,shì',
+    0x4C06: 'róu',
+    0x4C07: 'qí',
+    0x4C08: 'cuó',
+    0x4C09: 'pán,bān',
+    0x4C0A: 'bó',
+    0x4C0B: 'mán',
+    0x4C0C: 'zǒng,cōng',
+    0x4C0D: 'cì',
+    0x4C0E: 'kuì',
+    0x4C0F: 'jì',
+    0x4C10: 'lán',
+    0x4C12: 'méng',
+    0x4C13: 'mián',
+    0x4C14: 'pán',
+    0x4C15: 'lú',
+    0x4C16: 'zuǎn',
+    0x4C18: 'liú,jiǎo',
+    0x4C19: 'yǐ',
+    0x4C1A: 'wén',
+    0x4C1B: 'lì,gé',
+    0x4C1C: 'lì',
+    0x4C1D: 'zèng',
+    0x4C1E: 'zhǔ',
+    0x4C1F: 'hún',
+    0x4C20: 'shén',
+    0x4C21: 'chì',
+    0x4C22: 'xìng',
+    0x4C23: 'wǎng',
+    0x4C24: 'dōng',
+    0x4C25: 'huò,yù',
+    0x4C26: 'pǐ',
+    0x4C27: 'hū',
+    0x4C28: 'mèi',
+    0x4C29: 'chě,dū',
+    0x4C2A: 'mèi',
+    0x4C2B: 'chāo,cháo,zhào',
+    0x4C2C: 'jú',
+    0x4C2D: 'nòu',
+    0x4C2F: 'yì',
+    0x4C30: 'rú',
+    0x4C31: 'líng,lóng',
+    0x4C32: 'yà',
+    0x4C34: 'qì',
+    0x4C35: 'zī',
+    0x4C37: 'bàng',
+    0x4C38: 'gōng',
+    0x4C39: 'zé',
+    0x4C3A: 'jiè',
+    0x4C3B: 'yú',
+    0x4C3C: 'qín,yín,shèn',
+    0x4C3D: 'bèi',
+    0x4C3E: 'bā,bà',
+    0x4C3F: 'tuó',
+    0x4C40: 'yāng',
+    0x4C41: 'qiáo',
+    0x4C42: 'yǒu',
+    0x4C43: 'zhì',
+    0x4C44: 'jiè',
+    0x4C45: 'mò',
+    0x4C46: 'shéng',
+    0x4C47: 'shàn',
+    0x4C48: 'qí',
+    0x4C49: 'shàn',
+    0x4C4A: 'mǐ',
+    0x4C4B: 'gǒng',
+    0x4C4C: 'yí',
+    0x4C4D: 'gèng',
+    0x4C4E: 'gèng',
+    0x4C4F: 'tǒu',
+    0x4C50: 'fū',
+    0x4C51: 'xué',
+    0x4C52: 'yè',
+    0x4C53: 'tíng,tǐng',
+    0x4C54: 'tiáo,chóu',
+    0x4C55: 'móu,méi',
+    0x4C56: 'liú',
+    0x4C57: 'cān',
+    0x4C58: 'lí',
+    0x4C59: 'shū',
+    0x4C5A: 'lù',
+    0x4C5B: 'huò,xù,yì',
+    0x4C5C: 'cuò',
+    0x4C5D: 'pái,bēi',
+    0x4C5E: 'liú',
+    0x4C5F: 'jù,jū',
+    0x4C60: 'zhàn',
+    0x4C61: 'jú',
+    0x4C62: 'zhēng',
+    0x4C63: 'zú',
+    0x4C64: 'xiàn',
+    0x4C65: 'zhì,jì',
+    0x4C68: 'là',
+    0x4C6B: 'là',
+    0x4C6C: 'xū',
+    0x4C6D: 'gèng',
+    0x4C6E: 'é',
+    0x4C6F: 'mú',
+    0x4C70: 'zhòng',
+    0x4C71: 'tí,dì',
+    0x4C72: 'yuán',
+    0x4C73: 'zhān',
+    0x4C74: 'gèng',
+    0x4C75: 'wēng',
+    0x4C76: 'láng',
+    0x4C77: 'yú',
+    0x4C78: 'sōu,qiū',
+    0x4C79: 'zhǎ',
+    0x4C7A: 'hái',
+    0x4C7B: 'huá',
+    0x4C7C: 'zhǎn',
+    0x4C7E: 'lóu',
+    0x4C7F: 'chàn',
+    0x4C80: 'zhì',
+    0x4C81: 'wèi',
+    0x4C82: 'xuán',
+    0x4C83: 'zǎo,suǒ,cháo',
+    0x4C84: 'mín',
+    0x4C85: 'guī',
+    0x4C86: 'sū',
+    0x4C89: 'sī',
+    0x4C8A: 'duò,wěi,tuò',
+    0x4C8B: 'cén',
+    0x4C8C: 'kuǎn',
+    0x4C8D: 'téng',
+    0x4C8E: 'něi',
+    0x4C8F: 'láo',
+    0x4C90: 'lǔ',
+    0x4C91: 'yí',
+    0x4C92: 'xiè',
+    0x4C93: 'yǎn,yán',
+    0x4C94: 'qíng',
+    0x4C95: 'pū',
+    0x4C96: 'chóu',
+    0x4C97: 'xián',
+    0x4C98: 'guǎn',
+    0x4C99: 'jié',
+    0x4C9A: 'lài',
+    0x4C9B: 'méng',
+    0x4C9C: 'yè',
+    0x4C9E: 'lì',
+    0x4C9F: 'yìn',
+    0x4CA0: 'chūn',
+    0x4CA1: 'qiū',
+    0x4CA2: 'téng',
+    0x4CA3: 'yú',
+    0x4CA6: 'dài',
+    0x4CA7: 'dù',
+    0x4CA8: 'hóng',
+    0x4CAA: 'xì',
+    0x4CAC: 'qí',
+    0x4CAE: 'yuán',
+    0x4CAF: 'jí',
+    0x4CB0: 'yùn',
+    0x4CB1: 'fǎng',
+    0x4CB2: 'gōng,sōng',
+    0x4CB3: 'háng',
+    0x4CB4: 'zhèn',
+    0x4CB5: 'què',
+    0x4CB8: 'jiè',
+    0x4CB9: 'pí',
+    0x4CBA: 'gàn',
+    0x4CBB: 'xuán,yuān',
+    0x4CBC: 'shēng',
+    0x4CBD: 'shí,diǎo',
+    0x4CBE: 'qiǎo',
+    0x4CBF: 'cí',
+    0x4CC0: 'dié,yì',
+    0x4CC1: 'bó',
+    0x4CC2: 'diāo,chāo,tiáo,xiāo',
+    0x4CC3: 'wǎn',
+    0x4CC4: 'cí',
+    0x4CC5: 'zhǐ,zhì',
+    0x4CC6: 'bái',
+    0x4CC7: 'wǔ',
+    0x4CC8: 'bǎo',
+    0x4CC9: 'dōng,dàn',
+    0x4CCA: 'bá',
+    0x4CCB: 'tóng,tōng,xiāo',
+    0x4CCD: 'gōng',
+    0x4CCE: 'jiù',
+    0x4CCF: 'guì,jué',
+    0x4CD0: 'cì',
+    0x4CD1: 'yǒu',
+    0x4CD2: 'yuán',
+    0x4CD3: 'lǎo',
+    0x4CD4: 'jú,jiù',
+    0x4CD5: 'fú',
+    0x4CD6: 'niè',
+    0x4CD7: 'é',
+    0x4CD8: 'é',
+    0x4CD9: 'xǐng',
+    0x4CDA: 'kàn,hé',
+    0x4CDB: 'yàn',
+    0x4CDC: 'tú',
+    0x4CDD: 'pǒu,bù',
+    0x4CDE: 'běng',
+    0x4CDF: 'míng',
+    0x4CE0: 'shuì,zhù',
+    0x4CE1: 'yàn,zhuī',
+    0x4CE2: 'qí',
+    0x4CE3: 'yuán',
+    0x4CE4: 'biē',
+    0x4CE6: 'xuān',
+    0x4CE7: 'hóu',
+    0x4CE8: 'huáng',
+    0x4CE9: 'yāo',
+    0x4CEA: 'juàn',
+    0x4CEB: 'kuí',
+    0x4CEC: 'è',
+    0x4CED: 'jí',
+    0x4CEE: 'mò',
+    0x4CEF: 'chóng,chǒng',
+    0x4CF0: 'bǎo',
+    0x4CF1: 'wù',
+    0x4CF2: 'zhèn',
+    0x4CF3: 'xù',
+    0x4CF4: 'tà,dá',
+    0x4CF5: 'chì',
+    0x4CF6: 'xī,qī,jī',
+    0x4CF7: 'cóng',
+    0x4CF8: 'má',
+    0x4CF9: 'kòu',
+    0x4CFA: 'yàn',
+    0x4CFB: 'cán,zhàn',
+    0x4CFD: 'hè',
+    0x4CFE: 'dēng',
+    0x4CFF: 'rán',
+    0x4D00: 'tóng',
+    0x4D01: 'yù,yú',
+    0x4D02: 'xiàng',
+    0x4D03: 'náo',
+    0x4D04: 'shùn',
+    0x4D05: 'fén',
+    0x4D06: 'pú,pū',
+    0x4D07: 'líng',
+    0x4D08: 'ǎo',
+    0x4D09: 'huán,xuán',
+    0x4D0A: 'yí',
+    0x4D0B: 'huán,xuán',
+    0x4D0C: 'méng',
+    0x4D0D: 'yīng',
+    0x4D0E: 'lěi',
+    0x4D0F: 'yàn',
+    0x4D10: 'bǎo',
+    0x4D11: 'dié',
+    0x4D12: 'líng',
+    0x4D13: 'shī',
+    0x4D14: 'jiāo',
+    0x4D15: 'liè',
+    0x4D16: 'jīng',
+    0x4D17: 'jú',
+    0x4D18: 'tī',
+    0x4D19: 'pì',
+    0x4D1A: 'gǎng',
+    0x4D1B: 'xiāo',
+    0x4D1C: 'wāi',
+    0x4D1D: 'chuài',
+    0x4D1E: 'dí',
+    0x4D1F: 'huán',
+    0x4D20: 'yǎo',
+    0x4D21: 'lì',
+    0x4D22: 'mí',
+    0x4D23: 'hū',
+    0x4D24: 'shēng',
+    0x4D25: 'jiā',
+    0x4D26: 'yín',
+    0x4D27: 'wēi',
+    0x4D29: 'piáo',
+    0x4D2A: 'lù',
+    0x4D2B: 'líng',
+    0x4D2C: 'yì',
+    0x4D2D: 'cái',
+    0x4D2E: 'shàn',
+    0x4D2F: 'hū',
+    0x4D30: 'shú,yì',
+    0x4D31: 'tuō',
+    0x4D32: 'mò',
+    0x4D33: 'huá',
+    0x4D34: 'tiè,nián',
+    0x4D35: 'bǐng',
+    0x4D36: 'péng',
+    0x4D37: 'hún,huàn',
+    0x4D38: 'fū',
+    0x4D39: 'guǒ,luǒ,hún',
+    0x4D3A: 'bù',
+    0x4D3B: 'lí',
+    0x4D3C: 'chàn',
+    0x4D3D: 'pí',
+    0x4D3E: 'cuó',
+    0x4D3F: 'méng',
+    0x4D40: 'suǒ,suò',
+    0x4D41: 'qiàng',
+    0x4D42: 'zhí',
+    0x4D43: 'kuàng,huáng',
+    0x4D44: 'bí',
+    0x4D45: 'áo',
+    0x4D46: 'méng',
+    0x4D47: 'xiàn',
+    0x4D48: 'kù',
+    0x4D49: 'tóu',
+    0x4D4A: 'tuān',
+    0x4D4B: 'wěi',
+    0x4D4C: 'xiān',
+    0x4D4E: 'tuān',
+    0x4D4F: 'lǎo',
+    0x4D50: 'chǎn',
+    0x4D51: 'nì',
+    0x4D52: 'nì',
+    0x4D53: 'lí',
+    0x4D54: 'dǒng',
+    0x4D55: 'jù',
+    0x4D56: 'qiàn,qīn',
+    0x4D57: 'bó,bí',
+    0x4D58: 'shài',
+    0x4D59: 'zhā,zhǎ',
+    0x4D5A: 'tǎo',
+    0x4D5B: 'qiàn',
+    0x4D5C: 'nǒng',
+    0x4D5D: 'yì,yà',
+    0x4D5E: 'jìng',
+    0x4D5F: 'gǎn',
+    0x4D60: 'dí,zhuó',
+    0x4D61: 'jiǎn',
+    0x4D62: 'mèi',
+    0x4D63: 'dá',
+    0x4D64: 'jiǎn,xiàn',
+    0x4D65: 'yù',
+    0x4D66: 'xiè,wū',
+    0x4D67: 'zài',
+    0x4D68: 'máng',
+    0x4D69: 'lí',
+    0x4D6A: 'gùn,hùn',
+    0x4D6B: 'xūn,yù',
+    0x4D6C: 'tà',
+    0x4D6D: 'zhè',
+    0x4D6E: 'yàng',
+    0x4D6F: 'tuǎn',
+    0x4D70: 'shāng',
+    0x4D71: 'xì,xī',
+    0x4D72: 'qiāo',
+    0x4D73: 'wèi',
+    0x4D74: 'yìng,zèng,yùn',
+    0x4D75: 'chuā,zhuó',
+    0x4D76: 'qú,gōu',
+    0x4D77: 'wā',
+    0x4D79: 'zhī',
+    0x4D7A: 'tǐng,dǐng,tiǎn',
+    0x4D7B: 'huì,gǔ',
+    0x4D7C: 'shāng',
+    0x4D7D: 'cà',
+    0x4D7E: 'fú,fǔ',
+    0x4D7F: 'tiè',
+    0x4D80: 'tà',
+    0x4D81: 'tà',
+    0x4D82: 'zhuó,jué',
+    0x4D83: 'hán',
+    0x4D84: 'píng',
+    0x4D85: 'hé',
+    0x4D86: 'zhuī',
+    0x4D87: 'zhòu',
+    0x4D88: 'bó',
+    0x4D89: 'liú',
+    0x4D8A: 'nǜ',
+    0x4D8B: 'xī',
+    0x4D8C: 'pào',
+    0x4D8D: 'dì',
+    0x4D8E: 'hē',
+    0x4D8F: 'tì,tǐ',
+    0x4D90: 'wài,huì',
+    0x4D91: 'tì',
+    0x4D92: 'qí',
+    0x4D93: 'jì',
+    0x4D94: 'chí',
+    0x4D95: 'bà,bā',
+    0x4D96: 'jìn',
+    0x4D97: 'kè,qiā,qiǎ',
+    0x4D98: 'lì',
+    0x4D99: 'jù',
+    0x4D9A: 'qǔ',
+    0x4D9B: 'là',
+    0x4D9C: 'gǔ',
+    0x4D9D: 'qià',
+    0x4D9E: 'qí',
+    0x4D9F: 'xiàn',
+    0x4DA0: 'jiǎn',
+    0x4DA1: 'shí,zé',
+    0x4DA2: 'jiān,xián',
+    0x4DA3: 'ái,gāi',
+    0x4DA4: 'huá',
+    0x4DA5: 'zhā,jǔ,chǔ',
+    0x4DA6: 'zé',
+    0x4DA7: 'yǎo',
+    0x4DA8: 'zhān',
+    0x4DA9: 'jì',
+    0x4DAA: 'chà',
+    0x4DAB: 'yàn,yán',
+    0x4DAC: 'jiān',
+    0x4DAE: 'yǎn',
+    0x4DB0: 'jiāo',
+    0x4DB1: 'tóng',
+    0x4DB2: 'nán',
+    0x4DB3: 'yuè',
+    0x4DB5: 'chí',
+}
@@ -0,0 +1,14519 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+pinyin_dict = {
+    0x20000: 'hē',
+    0x20001: 'qī',
+    0x20003: 'qiě,jī',
+    0x20005: 'hài',
+    0x20009: 'qiū',
+    0x2000A: 'cāo',
+    0x2000D: 'shì',
+    0x20013: 'sī',
+    0x20014: 'jué',
+    0x2001B: 'yù',
+    0x2001D: 'kōng',
+    0x20022: 'zī',
+    0x20026: 'xíng',
+    0x20031: 'mǒu',
+    0x20037: 'jī',
+    0x20038: 'yè',
+    0x20039: 'jūn',
+    0x2003C: 'qián,xià',
+    0x2003D: 'lù',
+    0x20049: 'chū',
+    0x20057: 'shì,hè',
+    0x20060: 'qiè',
+    0x20065: 'gǎ',
+    0x2006D: 'qí',
+    0x20077: 'chǎn',
+    0x20084: 'huān',
+    0x20086: 'yì',
+    0x20087: 'zuǒ',
+    0x20088: 'jié,tiǎn',
+    0x20091: 'zōu',
+    0x20094: 'zǐ',
+    0x2009F: 'jīn',
+    0x200A2: 'pài',
+    0x200A4: 'duī',
+    0x200A5: 'cóng',
+    0x200A7: 'shèn',
+    0x200B8: 'huáng',
+    0x200CA: 'yǐn',
+    0x200CC: 'gǔn',
+    0x200D6: 'jiū',
+    0x200EB: 'shēn',
+    0x200FA: 'jiù',
+    0x20105: 'yè',
+    0x20109: 'dòng',
+    0x2010C: 'jué,zhuì',
+    0x2010D: 'jié',
+    0x2010F: 'diǎo',
+    0x20111: 'jué',
+    0x20112: 'chuí,shā',
+    0x20116: 'líng',
+    0x2011A: 'tīng',
+    0x20123: 'gèn',
+    0x2012E: 'yà,mǒ',
+    0x20131: 'yí',
+    0x2013F: 'wéi',
+    0x20142: 'jié',
+    0x2014C: 'yí',
+    0x20157: 'diè',
+    0x2015A: 'qí',
+    0x20164: 'xí',
+    0x2016C: 'bāo',
+    0x20171: 'xiè',
+    0x20179: 'zhàng',
+    0x2018C: 'yōng',
+    0x20190: 'xù',
+    0x20199: 'diè',
+    0x2019B: 'dān',
+    0x2019F: 'wěi',
+    0x201A3: 'guǎ,zhuǎ',
+    0x201A9: 'fàn',
+    0x201AE: 'mò',
+    0x201B1: 'xī',
+    0x201B2: 'yǎn',
+    0x201B5: 'ní',
+    0x201B6: 'dàn',
+    0x201CB: 'dǎn',
+    0x201CF: 'tāo',
+    0x201D2: 'gōng',
+    0x201D7: 'kuā',
+    0x201D8: 'chù',
+    0x201EF: 'qù',
+    0x201F1: 'mò',
+    0x201F3: 'shī',
+    0x201F5: 'gǎn',
+    0x201F7: 'shēng',
+    0x20201: 'tuō',
+    0x20205: 'shōu',
+    0x2020A: 'niě',
+    0x20224: 'yùn',
+    0x20225: 'guǎ',
+    0x2022C: 'xiāo',
+    0x2022D: 'láo',
+    0x20230: 'dàn',
+    0x20231: 'suō',
+    0x20235: 'mǎng',
+    0x20236: 'yí',
+    0x20238: 'tè',
+    0x2023A: 'bì',
+    0x20242: 'tà',
+    0x20257: 'luò',
+    0x20262: 'xǐ',
+    0x20263: 'hūn,hùn',
+    0x20264: 'dá',
+    0x20267: 'jù',
+    0x20269: 'dú',
+    0x2026C: 'ǎn,yǎn',
+    0x20289: 'mèi',
+    0x2028C: 'rán',
+    0x2028E: 'ái',
+    0x2028F: 'yù,xián',
+    0x20292: 'jiàn',
+    0x20294: 'qì',
+    0x2029F: 'mǐn',
+    0x202A3: 'zhòu',
+    0x202A4: 'zhì',
+    0x202A5: 'zhǒng',
+    0x202A6: 'nǎo',
+    0x202A7: 'bìng',
+    0x202A9: 'zhuàn',
+    0x202AA: 'shù',
+    0x202AB: 'xùn,qióng',
+    0x202AC: 'jué',
+    0x202AD: 'qiǎn',
+    0x202B0: 'guǎ',
+    0x202B2: 'tū',
+    0x202B6: 'yìng',
+    0x202B7: 'zhì',
+    0x202BE: 'kuí',
+    0x202C6: 'chèn',
+    0x202D6: 'liàn',
+    0x202D7: 'yā',
+    0x202DC: 'guò',
+    0x202DD: 'miǎo',
+    0x202DE: 'shé',
+    0x202DF: 'yǔ',
+    0x202E1: 'sì',
+    0x202E2: 'sǒu,zhòu',
+    0x202E4: 'zhì',
+    0x202E7: 'qiē',
+    0x202E9: 'fù',
+    0x202EC: 'jú',
+    0x202ED: 'bèi',
+    0x202EF: 'bì',
+    0x202F2: 'suǒ',
+    0x202F5: 'qiǎn',
+    0x202F6: 'mǐng',
+    0x202F7: 'chǎn',
+    0x202FA: 'sāo',
+    0x202FB: 'jī',
+    0x20315: 'gòng',
+    0x20316: 'qióng',
+    0x2031A: 'nòng,ròng',
+    0x2031E: 'sǒu',
+    0x2031F: 'sǒu',
+    0x20320: 'yáo',
+    0x2032A: 'chōu,tāo',
+    0x2032D: 'shuài',
+    0x2032E: 'zhē',
+    0x2032F: 'lì,lí',
+    0x20330: 'gài',
+    0x20331: 'suī',
+    0x20332: 'zhān',
+    0x20334: 'zhuàng',
+    0x2033D: 'fù',
+    0x20343: 'jī',
+    0x20344: 'dōu',
+    0x20357: 'huì',
+    0x2035A: 'jiǎn',
+    0x2035B: 'yǎn',
+    0x2035C: 'zhì',
+    0x20368: 'měi',
+    0x20369: 'yào',
+    0x2036A: 'dī',
+    0x2036B: 'yí',
+    0x2036F: 'bié',
+    0x20372: 'qú',
+    0x20373: 'yì',
+    0x20375: 'yàng',
+    0x20379: 'zhá',
+    0x2037D: 'shà',
+    0x20399: 'lái',
+    0x203AE: 'jué',
+    0x203B0: 'qī',
+    0x203B3: 'yú',
+    0x203B6: 'zǎi',
+    0x203B7: 'sà',
+    0x203B8: 'sè',
+    0x203BB: 'dùn',
+    0x203BF: 'jiě',
+    0x203C0: 'kē',
+    0x203C3: 'yuē',
+    0x203C7: 'jiǎn',
+    0x203C8: 'yáo',
+    0x203D3: 'xiān',
+    0x203D5: 'xiào',
+    0x203D6: 'qiāo',
+    0x203DA: 'yù',
+    0x203DB: 'qú',
+    0x203E1: 'xiān,líng',
+    0x203E2: 'luò',
+    0x203E4: 'guǎng',
+    0x203E7: 'chēng',
+    0x203E8: 'chuǎng',
+    0x203E9: 'yí',
+    0x203EB: 'zhěng',
+    0x203ED: 'zòng',
+    0x203EE: 'duì',
+    0x203F0: 'zhǎi',
+    0x203FF: 'fěi',
+    0x20400: 'yí',
+    0x20401: 'méng',
+    0x20408: 'biān,pián',
+    0x20409: 'jié',
+    0x2040A: 'shù',
+    0x2040B: 'liáo',
+    0x2040C: 'bǐ,bà',
+    0x2040D: 'sú',
+    0x20411: 'dì',
+    0x20421: 'bèi',
+    0x20422: 'wèn',
+    0x20427: 'méng',
+    0x20429: 'chǎn',
+    0x20435: 'dǎo',
+    0x2043A: 'pín',
+    0x2043B: 'jiǎn',
+    0x2043C: 'lìn',
+    0x2043D: 'guì,guī',
+    0x2043E: 'qī',
+    0x2043F: 'hōng',
+    0x20443: 'jí',
+    0x20444: 'xiè',
+    0x20445: 'zhēng',
+    0x20446: 'chǎn',
+    0x20450: 'yáo',
+    0x20451: 'chǎn',
+    0x20458: 'diān',
+    0x20459: 'chòng',
+    0x2045A: 'néi',
+    0x2045B: 'néi',
+    0x2045E: 'zhài',
+    0x2045F: 'biān,pián',
+    0x20461: 'chǎn',
+    0x2046A: 'xiāo',
+    0x2046F: 'cù',
+    0x20470: 'xīn',
+    0x20471: 'jǐng',
+    0x20472: 'qiān',
+    0x20474: 'qīng',
+    0x20479: 'gǔ',
+    0x20484: 'wù',
+    0x2049C: 'yuǎn',
+    0x2049D: 'bǐng',
+    0x204A2: 'wán',
+    0x204B0: 'niǎo,ní',
+    0x204B5: 'liàn',
+    0x204B8: 'rǎo',
+    0x204BE: 'fàn',
+    0x204BF: 'dí',
+    0x204CA: 'huī,dān',
+    0x204CB: 'yì',
+    0x204CC: 'xián',
+    0x204D6: 'lán',
+    0x204D7: 'fù',
+    0x204D9: 'xiòng',
+    0x204DC: 'liǎng',
+    0x204DD: 'tāo',
+    0x204DE: 'jí',
+    0x204E2: 'jiè',
+    0x204E3: 'zhá',
+    0x204E4: 'shī',
+    0x204EA: 'qí',
+    0x204EB: 'biǎn',
+    0x204ED: 'lǎn',
+    0x204EE: 'lǐn',
+    0x204F6: 'zhì',
+    0x204F7: 'bì,chéng',
+    0x204F8: 'shèng',
+    0x204FD: 'shèng',
+    0x204FF: 'qín',
+    0x20502: 'biāo',
+    0x20503: 'xī',
+    0x20509: 'juàn',
+    0x2050B: 'jī,xìn',
+    0x2050D: 'xī',
+    0x2050E: 'qǐn',
+    0x20511: 'hài',
+    0x20515: 'lún',
+    0x20520: 'yuè',
+    0x20528: 'lián',
+    0x2052F: 'bān',
+    0x20532: 'héng',
+    0x20536: 'qī',
+    0x2053A: 'qiān',
+    0x2053B: 'zhèng',
+    0x2053C: 'mǎo',
+    0x20541: 'cóng',
+    0x20544: 'nà',
+    0x2054A: 'tǐng',
+    0x2054C: 'zōng',
+    0x20555: 'jiōng',
+    0x20556: 'zhǎo',
+    0x2055F: 'niǎn',
+    0x20560: 'chéng',
+    0x20563: 'qià',
+    0x20566: 'yù',
+    0x20567: 'jiǎo',
+    0x2056D: 'zhào',
+    0x20573: 'dí',
+    0x20574: 'jiū',
+    0x20578: 'suǐ',
+    0x2057B: 'yāo',
+    0x2057F: 'wāng',
+    0x20582: 'liáo',
+    0x20584: 'tóng',
+    0x20586: 'mèng',
+    0x2058B: 'yǒu',
+    0x20593: 'sī',
+    0x2059B: 'lòu',
+    0x2059F: 'yīn',
+    0x205A5: 'chǒng',
+    0x205AB: 'gǎn',
+    0x205AC: 'jiū',
+    0x205B6: 'qìn',
+    0x205B7: 'jiǒng',
+    0x205B9: 'xié,xiá',
+    0x205C2: 'hè',
+    0x205C6: 'tāo',
+    0x205C8: 'qiú',
+    0x205C9: 'xié',
+    0x205CA: 'jìng',
+    0x205CB: 'niǎn',
+    0x205CC: 'jìng',
+    0x205CF: 'jí',
+    0x205D8: 'tiǎn',
+    0x205DA: 'cuì',
+    0x205DB: 'dié',
+    0x205DD: 'qǐng',
+    0x205E5: 'pìng',
+    0x205E6: 'píng',
+    0x205E8: 'dié',
+    0x205E9: 'lòu',
+    0x205F3: 'liǎn',
+    0x205F4: 'hán',
+    0x205F5: 'pāng',
+    0x205F6: 'táng',
+    0x205FA: 'yí',
+    0x205FB: 'xuán',
+    0x205FC: 'suò',
+    0x205FD: 'liú',
+    0x205FE: 'shuǎng',
+    0x205FF: 'shèn',
+    0x20601: 'bù',
+    0x20602: 'sōu',
+    0x20605: 'qín',
+    0x20606: 'shěn',
+    0x2060A: 'nòng',
+    0x2060B: 'tǐng',
+    0x2060C: 'jiāng',
+    0x20615: 'xī',
+    0x20616: 'zhì',
+    0x2061D: 'lài',
+    0x2061E: 'lì',
+    0x2061F: 'lì',
+    0x20622: 'hé',
+    0x20623: 'jiào',
+    0x20625: 'yán',
+    0x20627: 'shū',
+    0x2062A: 'shǐ',
+    0x20631: 'zhěn',
+    0x20633: 'yōu',
+    0x2063A: 'suò',
+    0x2063B: 'wú',
+    0x20641: 'cháng',
+    0x20642: 'cóng',
+    0x20646: 'jù',
+    0x2064E: 'shū',
+    0x20654: 'jiù',
+    0x20655: 'wéi',
+    0x2065E: 'huò',
+    0x20664: 'jiē',
+    0x2066C: 'zǎo',
+    0x20676: 'ǒu',
+    0x2067C: 'guǎ',
+    0x20683: 'háo',
+    0x20684: 'lǐ',
+    0x20685: 'zhì',
+    0x20686: 'xiàn',
+    0x20689: 'bū',
+    0x2068A: 'chàng',
+    0x20693: 'yūn',
+    0x20694: 'hé',
+    0x2069C: 'tāo',
+    0x206A0: 'biāo',
+    0x206A5: 'diāo',
+    0x206A7: 'èr',
+    0x206A8: 'jiū',
+    0x206AD: 'dì',
+    0x206AE: 'yì',
+    0x206AF: 'kūn',
+    0x206B1: 'zhé',
+    0x206B3: 'kuò',
+    0x206B4: 'zhōu',
+    0x206B5: 'jù',
+    0x206B9: 'shàn',
+    0x206BA: 'shà',
+    0x206BB: 'diāo',
+    0x206BC: 'bān',
+    0x206BD: 'jī',
+    0x206C0: 'zhōng',
+    0x206C3: 'yí',
+    0x206C5: 'kōu',
+    0x206C6: 'wū',
+    0x206CA: 'gē',
+    0x206CB: 'bā',
+    0x206CE: 'gōu',
+    0x206D1: 'xián',
+    0x206D2: 'guā',
+    0x206D3: 'liǔ',
+    0x206D4: 'chǐ',
+    0x206D5: 'guāi',
+    0x206D6: 'chuān',
+    0x206D8: 'lí',
+    0x206D9: 'cù',
+    0x206DA: 'shuā',
+    0x206E1: 'bǐ',
+    0x206E5: 'bǐng',
+    0x206E6: 'lì',
+    0x206E9: 'jiǔ',
+    0x206EA: 'tiāo,diāo',
+    0x206EB: 'duǒ',
+    0x206ED: 'yān,yuān',
+    0x206EE: 'quān',
+    0x206F1: 'liè,zā',
+    0x206F3: 'kè,hé',
+    0x206F5: 'gēn',
+    0x206F6: 'zhēn',
+    0x206F8: 'fén',
+    0x20701: 'yí',
+    0x20703: 'jiù',
+    0x20704: 'xù',
+    0x20705: 'jiǎo',
+    0x20708: 'lǜ',
+    0x20709: 'jiǔ',
+    0x2070B: 'chǒu',
+    0x2070E: 'xiàn',
+    0x20710: 'kuài',
+    0x20711: 'duì',
+    0x20716: 'luō',
+    0x20717: 'xī,xì',
+    0x20718: 'qìn',
+    0x20719: 'bù',
+    0x20724: 'qià',
+    0x20731: 'pī',
+    0x20732: 'yā',
+    0x20733: 'bēng',
+    0x20734: 'guǒ',
+    0x20735: 'guā',
+    0x20739: 'jú',
+    0x2073C: 'qiā',
+    0x2073E: 'jué,guì',
+    0x20744: 'lì',
+    0x20750: 'huā',
+    0x20751: 'jiāo',
+    0x20758: 'qià',
+    0x2075A: 'zhá,zhé',
+    0x2075B: 'qiā',
+    0x2075D: 'zhé,zhá',
+    0x2075E: 'chā',
+    0x2075F: 'yǐng',
+    0x20762: 'yān',
+    0x20764: 'chōng',
+    0x20768: 'chǐ',
+    0x2076A: 'wān',
+    0x2076C: 'sōu',
+    0x20772: 'kǎn',
+    0x20773: 'yuán',
+    0x2077D: 'chóu',
+    0x2077F: 'suǒ',
+    0x20780: 'tū',
+    0x20783: 'zhé',
+    0x20784: 'tī,chǐ',
+    0x20786: 'wū',
+    0x20788: 'dā',
+    0x20789: 'lì',
+    0x2078A: 'chā,chāi,chá',
+    0x20795: 'róng',
+    0x20796: 'gòng',
+    0x20797: 'què',
+    0x20799: 'lí',
+    0x2079E: 'tāo',
+    0x207A4: 'lì',
+    0x207A7: 'mí',
+    0x207A9: 'chì,shuài',
+    0x207AC: 'gùn',
+    0x207AD: 'lóu,lòu',
+    0x207AE: 'chuǎng',
+    0x207AF: 'suǒ',
+    0x207B0: 'jiǎo',
+    0x207B1: 'jìn',
+    0x207B5: 'fá',
+    0x207B6: 'zhāi',
+    0x207BE: 'jìn',
+    0x207BF: 'cuì',
+    0x207C2: 'cèng',
+    0x207C3: 'zǔn',
+    0x207C5: 'zhào,rì,zhì',
+    0x207C8: 'piē',
+    0x207C9: 'zhǎn,chàn',
+    0x207CA: 'xī',
+    0x207CB: 'yào',
+    0x207CC: 'fǔ,pǒu',
+    0x207CD: 'chōng',
+    0x207D3: 'cuì',
+    0x207D7: 'guā',
+    0x207E3: 'jī',
+    0x207E6: 'sè',
+    0x207E7: 'zhān',
+    0x207E8: 'lìng,líng',
+    0x207E9: 'sè',
+    0x207EA: 'yè',
+    0x207F0: 'jū',
+    0x207F6: 'tū',
+    0x207FA: 'rú,ruǎn',
+    0x207FB: 'zé,bài',
+    0x207FC: 'huán',
+    0x20801: 'xiǎn',
+    0x20803: 'qiān',
+    0x20804: 'zhào',
+    0x2080B: 'cán',
+    0x2080E: 'kuò',
+    0x2080F: 'lì',
+    0x20810: 'róu',
+    0x20814: 'dú',
+    0x20817: 'liè',
+    0x2081C: 'yīng',
+    0x2081D: 'lì',
+    0x20820: 'dú',
+    0x20822: 'líng',
+    0x2082A: 'wān',
+    0x2082F: 'dié',
+    0x20833: 'jiū',
+    0x20835: 'lì',
+    0x20836: 'kū',
+    0x20837: 'kēng',
+    0x20839: 'zhěn',
+    0x20840: 'hè',
+    0x20842: 'bì,fú',
+    0x20844: 'pī',
+    0x2084A: 'hāng',
+    0x20851: 'zhuó',
+    0x20852: 'duǐ',
+    0x20854: 'yì',
+    0x2085C: 'kè',
+    0x2085D: 'yì',
+    0x2085E: 'mò',
+    0x20861: 'cán',
+    0x20863: 'gěng',
+    0x20864: 'kè',
+    0x20865: 'shì',
+    0x2086D: 'líng,lìng',
+    0x2086E: 'bēng,kēng',
+    0x20871: 'duàn',
+    0x20876: 'juān',
+    0x20877: 'nǎo',
+    0x20878: 'zǐ',
+    0x2087B: 'zòng',
+    0x20883: 'táng',
+    0x20886: 'xiá',
+    0x20887: 'hàn',
+    0x2088C: 'lüè',
+    0x2088D: 'qián',
+    0x20893: 'mò',
+    0x20894: 'ōu',
+    0x20895: 'háo',
+    0x20899: 'zhá',
+    0x2089A: 'juàn',
+    0x2089B: 'cóng',
+    0x208A0: 'lì,jí',
+    0x208A1: 'zhá',
+    0x208A2: 'yǒu',
+    0x208A3: 'diàn',
+    0x208A4: 'jué',
+    0x208A5: 'bèi',
+    0x208A9: 'yǎo',
+    0x208AA: 'piē',
+    0x208B1: 'jìn',
+    0x208B2: 'kǎi,xiè',
+    0x208B3: 'sè',
+    0x208B4: 'yǎng',
+    0x208B5: 'jìn',
+    0x208B9: 'kè',
+    0x208C4: 'chān',
+    0x208C7: 'niǎn',
+    0x208C9: 'wàn',
+    0x208CA: 'lǜ',
+    0x208D0: 'yún',
+    0x208D1: 'yāo',
+    0x208D2: 'bāo',
+    0x208D5: 'jūn',
+    0x208D6: 'xuán',
+    0x208D8: 'zhōu',
+    0x208E0: 'kuì',
+    0x208E1: 'fèng',
+    0x208EA: 'qú',
+    0x208EB: 'shào',
+    0x208EC: 'sǔn',
+    0x208F0: 'dū',
+    0x208F2: 'kuǎi',
+    0x208F3: 'pào',
+    0x208FA: 'bào',
+    0x208FE: 'fù',
+    0x208FF: 'jiù',
+    0x20900: 'rán',
+    0x20904: 'jū',
+    0x2090A: 'qióng',
+    0x2090D: 'zhōu',
+    0x2090E: 'huà',
+    0x2090F: 'bǎo',
+    0x20915: 'yí,xián',
+    0x20917: 'yí',
+    0x20918: 'yí,yǐ',
+    0x2091D: 'mào',
+    0x20926: 'ruǎn,rú',
+    0x2092B: 'cí',
+    0x2092E: 'hán',
+    0x20930: 'cóng,xuán',
+    0x20934: 'xì',
+    0x20939: 'quán',
+    0x2093A: 'tiáo',
+    0x2093C: 'diào',
+    0x2093E: 'hán',
+    0x20947: 'yě',
+    0x2094D: 'ē',
+    0x2094E: 'wéi',
+    0x20950: 'cāng',
+    0x20951: 'diào',
+    0x20955: 'è',
+    0x20956: 'dì',
+    0x20958: 'suǎn',
+    0x20959: 'quán',
+    0x2095C: 'è',
+    0x2095D: 'ōu,ǒu',
+    0x2095E: 'xuán',
+    0x20962: 'wǔ',
+    0x20966: 'yì',
+    0x20968: 'móu',
+    0x20970: 'hū',
+    0x20974: 'hán,gān',
+    0x2097F: 'shí',
+    0x20983: 'sà',
+    0x20988: 'bì',
+    0x2098A: 'hán',
+    0x2098B: 'jìng',
+    0x2098C: 'xì',
+    0x2098E: 'qìn',
+    0x2098F: 'cuó',
+    0x20990: 'cì',
+    0x20992: 'bān',
+    0x20997: 'duī',
+    0x2099C: 'xì,shù',
+    0x209A7: 'zhī',
+    0x209A8: 'luàn',
+    0x209AA: 'hū',
+    0x209AB: 'jí',
+    0x209AC: 'guāi',
+    0x209B2: 'pāng',
+    0x209C0: 'zhū',
+    0x209C5: 'bǐ',
+    0x209C7: 'yú',
+    0x209D2: 'qǐ',
+    0x209D5: 'hé',
+    0x209D6: 'chǔ',
+    0x209D9: 'shào',
+    0x209DA: 'chì',
+    0x209DB: 'bó',
+    0x209DF: 'réng,nǎi',
+    0x209E0: 'yóu',
+    0x209E4: 'nǎi',
+    0x209E9: 'huì,huǐ',
+    0x209EA: 'tiáo,yǒu',
+    0x209EB: 'bǎn',
+    0x209F0: 'xū',
+    0x209F4: 'yóu,yòu',
+    0x209F5: 'chì',
+    0x209FF: 'héng',
+    0x20A03: 'wài',
+    0x20A06: 'xiè',
+    0x20A0A: 'jué',
+    0x20A0C: 'suī',
+    0x20A0D: 'qīng',
+    0x20A0E: 'zhuàn',
+    0x20A15: 'jì',
+    0x20A18: 'bì',
+    0x20A1A: 'xī',
+    0x20A20: 'jí',
+    0x20A22: 'jùn',
+    0x20A25: 'liáo',
+    0x20A26: 'yōu',
+    0x20A2D: 'jú',
+    0x20A32: 'yuè',
+    0x20A35: 'bàng',
+    0x20A38: 'pí',
+    0x20A3B: 'zè',
+    0x20A3E: 'yì',
+    0x20A3F: 'dǐ',
+    0x20A42: 'qiè',
+    0x20A44: 'suǒ',
+    0x20A46: 'cì',
+    0x20A48: 'zhù',
+    0x20A49: 'yuè,jú',
+    0x20A4F: 'jiāo',
+    0x20A54: 'shí',
+    0x20A57: 'yí',
+    0x20A58: 'xiá',
+    0x20A60: 'yuán',
+    0x20A65: 'guó',
+    0x20A67: 'kè',
+    0x20A6A: 'cuì',
+    0x20A6B: 'yì',
+    0x20A75: 'lì',
+    0x20A77: 'diǎn',
+    0x20A7A: 'xī,chí',
+    0x20A7F: 'bì',
+    0x20A82: 'biǎn',
+    0x20A83: 'méi',
+    0x20A84: 'lì',
+    0x20A87: 'sǒu',
+    0x20A90: 'liú',
+    0x20A91: 'guì',
+    0x20A92: 'kè',
+    0x20A97: 'yí',
+    0x20A99: 'xǐ',
+    0x20A9A: 'yín,ǎn,kǎn',
+    0x20A9F: 'kè',
+    0x20AA3: 'shè',
+    0x20AA7: 'wǒ',
+    0x20AAE: 'pì',
+    0x20AB6: 'yuè',
+    0x20AB7: 'hóng',
+    0x20ABA: 'lì',
+    0x20ABB: 'fù',
+    0x20AC3: 'jué',
+    0x20AC4: 'xiān',
+    0x20AC9: 'diān',
+    0x20ACC: 'lì',
+    0x20AD3: 'tū',
+    0x20AD8: 'jiān',
+    0x20ADB: 'bǎi',
+    0x20ADC: 'dì',
+    0x20ADD: 'zhǎng',
+    0x20AE3: 'yù',
+    0x20AE8: 'duì',
+    0x20AED: 'cān',
+    0x20AEE: 'tú',
+    0x20AF6: 'tān',
+    0x20AF7: 'jí',
+    0x20AF8: 'qí,zhāi',
+    0x20AF9: 'shàn',
+    0x20AFA: 'nián,shì',
+    0x20B06: 'guàn',
+    0x20B08: 'bǐ',
+    0x20B0B: 'xīng,nián',
+    0x20B13: 'zhěn',
+    0x20B19: 'sā',
+    0x20B1B: 'mò',
+    0x20B1D: 'fú',
+    0x20B22: 'tāo',
+    0x20B23: 'bàng',
+    0x20B2A: 'biào',
+    0x20B2C: 'xī',
+    0x20B2E: 'jié',
+    0x20B36: 'jìn',
+    0x20B3E: 'qiān',
+    0x20B48: 'sì',
+    0x20B49: 'jǐng',
+    0x20B4B: 'chǐ',
+    0x20B57: 'jǐng',
+    0x20B65: 'suì',
+    0x20B6F: 'zhā',
+    0x20B70: 'lí',
+    0x20B74: 'zhuō',
+    0x20B79: 'biàn',
+    0x20B7F: 'tún',
+    0x20B83: 'bì',
+    0x20B86: 'fèi',
+    0x20B8A: 'dé',
+    0x20B8C: 'zhú',
+    0x20B91: 'jū',
+    0x20B99: 'yǐ',
+    0x20B9C: 'yà,yīn',
+    0x20B9F: 'chì',
+    0x20BA0: 'guǎ,bǎi',
+    0x20BA1: 'zhǐ',
+    0x20BA8: 'réng',
+    0x20BAB: 'yōu',
+    0x20BAD: 'bó',
+    0x20BAF: 'jǐ',
+    0x20BB0: 'pǐn',
+    0x20BB3: 'yīng',
+    0x20BB4: 'yāng',
+    0x20BB5: 'màng',
+    0x20BBD: 'lòng',
+    0x20BBE: 'ǹ,ǹg',
+    0x20BBF: 'sa,san',
+    0x20BC0: 'chuān',
+    0x20BC2: 'cí',
+    0x20BC3: 'wǔ',
+    0x20BC4: 'rèn',
+    0x20BC8: 'dài',
+    0x20BC9: 'jí',
+    0x20BCB: 'yǐ',
+    0x20BCD: 'rán',
+    0x20BD0: 'huò',
+    0x20BD1: 'guā',
+    0x20BD3: 'zhé',
+    0x20BD4: 'pì',
+    0x20BD7: 'zā',
+    0x20BD8: 'bàn',
+    0x20BD9: 'jié',
+    0x20BDC: 'hōu,xǔ',
+    0x20BDF: 'xiàn',
+    0x20BE0: 'huī',
+    0x20BE9: 'zhā',
+    0x20BEA: 'dāi,dǎi,è',
+    0x20BEB: 'gē',
+    0x20BED: 'pì',
+    0x20BEF: 'piàn',
+    0x20BF0: 'shí',
+    0x20BF1: 'liǎng',
+    0x20BF2: 'yuè',
+    0x20BF3: 'hù,wěn',
+    0x20BF4: 'biàn',
+    0x20BF7: 'réng',
+    0x20BF9: 'réng',
+    0x20C04: 'yī',
+    0x20C05: 'zhī',
+    0x20C07: 'jīn',
+    0x20C08: 'wēng',
+    0x20C09: 'chāo',
+    0x20C0B: 'qiū',
+    0x20C0D: 'zhǔ,zhù',
+    0x20C0F: 'zhá',
+    0x20C10: 'pǒ',
+    0x20C11: 'àn',
+    0x20C13: 'hé',
+    0x20C15: 'chū',
+    0x20C16: 'yán',
+    0x20C1A: 'shì',
+    0x20C1B: 'hù,gào',
+    0x20C1C: 'è',
+    0x20C34: 'shí',
+    0x20C39: 'tuō',
+    0x20C3A: 'dài',
+    0x20C3B: 'wài,wai',
+    0x20C3C: 'pō',
+    0x20C3D: 'rǒng',
+    0x20C3E: 'jū',
+    0x20C40: 'bō',
+    0x20C50: 'yǔ',
+    0x20C51: 'dōu',
+    0x20C53: 'guǐ',
+    0x20C54: 'shòu',
+    0x20C57: 'suō',
+    0x20C58: 'nì',
+    0x20C59: 'zhōu,yù,jì,cù',
+    0x20C5A: 'lòng',
+    0x20C5B: 'bǐng',
+    0x20C5C: 'zùn',
+    0x20C5D: 'yè',
+    0x20C5E: 'rǎn',
+    0x20C60: 'líng',
+    0x20C61: 'sà,shài',
+    0x20C64: 'lěi',
+    0x20C65: 'è,huì,zá',
+    0x20C67: 'zhòng',
+    0x20C68: 'jǐ',
+    0x20C6B: 'è',
+    0x20C6F: 'zuò',
+    0x20C72: 'nà',
+    0x20C73: 'yǔn',
+    0x20C8A: 'xiè',
+    0x20C8B: 'zuǐ',
+    0x20C8C: 'shù',
+    0x20C8D: 'diū',
+    0x20C8E: 'fa,fèi,fá,wa',
+    0x20C8F: 'rěn',
+    0x20C91: 'bāng',
+    0x20C92: 'hán',
+    0x20C93: 'hóng',
+    0x20C94: 'yī',
+    0x20C96: 'yī',
+    0x20C99: 'kē',
+    0x20C9A: 'yì',
+    0x20C9B: 'huí',
+    0x20C9C: 'zhēng',
+    0x20CAE: 'jìng',
+    0x20CB1: 'gé',
+    0x20CB4: 'nóu',
+    0x20CB5: 'qiè,jié',
+    0x20CB7: 'dié',
+    0x20CB9: 'jì',
+    0x20CBA: 'yì',
+    0x20CBB: 'yí',
+    0x20CBD: 'fú',
+    0x20CBE: 'shuò',
+    0x20CBF: 'shuò',
+    0x20CC0: 'yǒng',
+    0x20CC1: 'kěn',
+    0x20CC2: 'huá',
+    0x20CC3: 'hòng',
+    0x20CC7: 'hé',
+    0x20CCA: 'hē',
+    0x20CCB: 'qiǎn',
+    0x20CCC: 'qià',
+    0x20CCE: 'sì',
+    0x20CD0: 'bāng',
+    0x20CEC: 'jīng',
+    0x20CED: 'kè',
+    0x20CF3: 'āi',
+    0x20CF4: 'lóu',
+    0x20CF6: 'tū',
+    0x20CF9: 'chuáng',
+    0x20CFC: 'sòng',
+    0x20CFD: 'chéng',
+    0x20CFF: 'wēi',
+    0x20D02: 'nǔ',
+    0x20D04: 'jiǔ',
+    0x20D07: 'bīn',
+    0x20D21: 'xiào',
+    0x20D22: 'shēng',
+    0x20D23: 'hǒu',
+    0x20D26: 'zhù',
+    0x20D28: 'guān',
+    0x20D29: 'jī,qǐ',
+    0x20D2B: 'jì,cù,yù,zhù',
+    0x20D2D: 'xī',
+    0x20D2F: 'shè',
+    0x20D30: 'ǒu',
+    0x20D31: 'hú',
+    0x20D32: 'tà',
+    0x20D33: 'xiáo',
+    0x20D35: 'zào',
+    0x20D38: 'bò',
+    0x20D39: 'qì',
+    0x20D3A: 'wā',
+    0x20D3B: 'tuō',
+    0x20D3C: 'dào',
+    0x20D3E: 'nà',
+    0x20D60: 'zhāi',
+    0x20D63: 'yà',
+    0x20D66: 'wǔ',
+    0x20D67: 'zhén,chún',
+    0x20D68: 'de',
+    0x20D69: 'hē',
+    0x20D6B: 'āng',
+    0x20D6C: 'pí',
+    0x20D6D: 'sè',
+    0x20D6E: 'fěn',
+    0x20D6F: 'guā',
+    0x20D73: 'pǒ',
+    0x20D77: 'xuàn',
+    0x20D78: 'hān,mí',
+    0x20D79: 'gāng',
+    0x20D7A: 'bā',
+    0x20D7B: 'zōng',
+    0x20D7C: 'mèng',
+    0x20D7E: 'huò',
+    0x20DA7: 'diān',
+    0x20DA8: 'xī',
+    0x20DAB: 'dà',
+    0x20DAC: 'nàng',
+    0x20DB0: 'diāo',
+    0x20DB1: 'luò',
+    0x20DB2: 'kè',
+    0x20DB7: 'yì',
+    0x20DB8: 'jué',
+    0x20DB9: 'hé',
+    0x20DBB: 'jí',
+    0x20DBE: 'hè',
+    0x20DBF: 'niè,zá',
+    0x20DC0: 'rǔn',
+    0x20DC1: 'qián,jiān',
+    0x20DC2: 'dài',
+    0x20DC3: 'shāo,sù,shòu',
+    0x20DC4: 'kè',
+    0x20DC5: 'zhú',
+    0x20DC7: 'shī',
+    0x20DC8: 'lǜ,liè',
+    0x20DC9: 'jiā',
+    0x20DCA: 'pián',
+    0x20DCB: 'hòu',
+    0x20DCC: 'jī,zé',
+    0x20DCD: 'tà',
+    0x20DCE: 'chóu,shòu',
+    0x20DCF: 'wō',
+    0x20DD0: 'jìng,jiàng',
+    0x20DD1: 'pō',
+    0x20DD2: 'zhāi',
+    0x20DD3: 'xīn',
+    0x20DD6: 'biàn',
+    0x20DD9: 'xù',
+    0x20DDE: 'gū',
+    0x20DDF: 'jiè',
+    0x20DE2: 'xián',
+    0x20DF8: 'é,yóng',
+    0x20DFA: 'bó',
+    0x20DFB: 'piāo',
+    0x20DFF: 'zǎ',
+    0x20E01: 'pài',
+    0x20E02: 'tū',
+    0x20E04: 'yīng',
+    0x20E2E: 'xiǎng',
+    0x20E31: 'nuò',
+    0x20E32: 'gē',
+    0x20E33: 'bó',
+    0x20E34: 'xiè',
+    0x20E38: 'zhēn,chún',
+    0x20E39: 'yú',
+    0x20E3A: 'nì',
+    0x20E40: 'xùn',
+    0x20E41: 'wà',
+    0x20E43: 'àng',
+    0x20E44: 'hàn',
+    0x20E45: 'hōng',
+    0x20E46: 'dān',
+    0x20E48: 'nuó',
+    0x20E4A: 'cǎo',
+    0x20E4B: 'jí',
+    0x20E4C: 'něng',
+    0x20E4D: 'yǒng,róng',
+    0x20E4E: 'xiāo',
+    0x20E50: 'chuǎ',
+    0x20E51: 'yào',
+    0x20E53: 'gé',
+    0x20E54: 'táng',
+    0x20E55: 'bào',
+    0x20E56: 'chǎn',
+    0x20E58: 'xù',
+    0x20E5B: 'hái',
+    0x20E5D: 'chóu',
+    0x20E5F: 'jiǎn',
+    0x20E60: 'zuō',
+    0x20E64: 'wèi',
+    0x20E65: 'dā',
+    0x20E66: 'pī',
+    0x20E90: 'huàn',
+    0x20E92: 'xī',
+    0x20E94: 'pèn',
+    0x20E95: 'liū,liáo',
+    0x20E96: 'mǔ,yīng',
+    0x20E97: 'miē',
+    0x20E98: 'làng',
+    0x20E99: 'tuì',
+    0x20E9A: 'bān',
+    0x20E9D: 'gē',
+    0x20E9F: 'kù',
+    0x20EA2: 'jiā',
+    0x20EA3: 'bō',
+    0x20ECD: 'huàn',
+    0x20ECF: 'zú',
+    0x20ED0: 'luò',
+    0x20ED7: 'lí',
+    0x20ED9: 'hé',
+    0x20EDA: 'mó',
+    0x20EDC: 'shuì,lǜ,sū',
+    0x20EDD: 'shēn',
+    0x20EDE: 'kǎng',
+    0x20EDF: 'chì',
+    0x20EE0: 'líng',
+    0x20EE1: 'luǒ',
+    0x20EE4: 'yǎn',
+    0x20EE5: 'zhào',
+    0x20EE6: 'chuǎ',
+    0x20EE7: 'gǔ',
+    0x20EE8: 'qǐn',
+    0x20EEA: 'tán',
+    0x20EEB: 'fèn',
+    0x20EEC: 'tú',
+    0x20EF1: 'líng',
+    0x20EF4: 'lǎng',
+    0x20F16: 'lán',
+    0x20F17: 'zàn',
+    0x20F18: 'wù',
+    0x20F1D: 'lí',
+    0x20F1E: 'ā',
+    0x20F1F: 'lüè',
+    0x20F20: 'zhǐ',
+    0x20F21: 'chóu',
+    0x20F22: 'jiàng,qiàng',
+    0x20F24: 'jiān',
+    0x20F29: 'lún',
+    0x20F2A: 'yí',
+    0x20F2C: 'shāng',
+    0x20F3B: 'jī',
+    0x20F5C: 'yì',
+    0x20F5D: 'nín',
+    0x20F61: 'huì',
+    0x20F63: 'zhā',
+    0x20F66: 'hǎn',
+    0x20F68: 'yǐn',
+    0x20F69: 'bì',
+    0x20F6A: 'ān',
+    0x20F6B: 'xiā,xiǎ',
+    0x20F6C: 'ní',
+    0x20F70: 'dī',
+    0x20F71: 'jiǎn',
+    0x20F72: 'pán',
+    0x20F75: 'yù',
+    0x20F76: 'chuài,cuì,chuò',
+    0x20F77: 'zā',
+    0x20F79: 'chá',
+    0x20F7B: 'zhé',
+    0x20F7C: 'sè',
+    0x20F7E: 'pēn,pǔ',
+    0x20F7F: 'gū',
+    0x20F80: 'zhé',
+    0x20F86: 'lí',
+    0x20F87: 'dōu',
+    0x20F89: 'chóu',
+    0x20F8B: 'zuǐ',
+    0x20F8C: 'pò',
+    0x20F8F: 'shē',
+    0x20F90: 'lóng',
+    0x20FA2: 'shù',
+    0x20FA4: 'jìn',
+    0x20FA5: 'líng',
+    0x20FA8: 'kāng',
+    0x20FA9: 'là',
+    0x20FAB: 'xū',
+    0x20FAC: 'jìn',
+    0x20FAE: 'chuān',
+    0x20FB2: 'yuè',
+    0x20FC6: 'mǎi',
+    0x20FC7: 'xiè',
+    0x20FC8: 'jiū',
+    0x20FC9: 'jì',
+    0x20FCB: 'yuè',
+    0x20FCF: 'jiān',
+    0x20FD1: 'hán,gǎn,ǎn,hǎn',
+    0x20FD3: 'sà',
+    0x20FD4: 'huì',
+    0x20FD5: 'qiào',
+    0x20FD7: 'sè',
+    0x20FD8: 'zuǐ',
+    0x20FDB: 'lǔ',
+    0x20FDC: 'huà',
+    0x20FDD: 'chū',
+    0x20FDE: 'shǎn',
+    0x20FDF: 'wò',
+    0x20FE0: 'jí',
+    0x20FE1: 'zhuó',
+    0x20FE2: 'xián,xiàn',
+    0x20FE3: 'yī',
+    0x20FE4: 'guó',
+    0x20FE5: 'kuì,guì',
+    0x21011: 'zhōu',
+    0x21014: 'lù,lou',
+    0x21016: 'bō',
+    0x21017: 'shí',
+    0x21018: 'yìng',
+    0x21019: 'kū',
+    0x21039: 'zhì',
+    0x2103A: 'xié',
+    0x2103D: 'yè,hè',
+    0x2103E: 'è',
+    0x2103F: 'lǜ',
+    0x21040: 'hàn',
+    0x21041: 'yè,kài',
+    0x21046: 'luò',
+    0x21047: 'chuò',
+    0x21048: 'fàn',
+    0x21049: 'zhí',
+    0x2104A: 'yìng',
+    0x2104B: 'wěn',
+    0x2104C: 'wā',
+    0x2104D: 'ài',
+    0x2104E: 'yú',
+    0x21051: 'huā',
+    0x21053: 'liè',
+    0x21054: 'jīng',
+    0x21055: 'zá',
+    0x21067: 'zāng',
+    0x21068: 'duì',
+    0x2106A: 'jì',
+    0x2106E: 'wō',
+    0x21070: 'jí',
+    0x21071: 'xī',
+    0x21073: 'zhàn',
+    0x21074: 'tuán',
+    0x2108A: 'yú',
+    0x2108F: 'liè',
+    0x21092: 'zhì',
+    0x21093: 'shī',
+    0x21095: 'lǎo',
+    0x21096: 'lài,tà',
+    0x21097: 'wěi',
+    0x21098: 'páo',
+    0x21099: 'chí',
+    0x2109A: 'yǐng',
+    0x2109B: 'dòu',
+    0x2109D: 'dòu',
+    0x2109F: 'bào',
+    0x210A0: 'qiè',
+    0x210A1: 'shù',
+    0x210A3: 'zhí',
+    0x210A9: 'liè',
+    0x210AB: 'péng',
+    0x210AD: 'zhē',
+    0x210BF: 'ōu,ou',
+    0x210C2: 'xiè',
+    0x210C3: 'jí',
+    0x210C4: 'lài',
+    0x210C5: 'yíng',
+    0x210C6: 'cēng',
+    0x210D6: 'lē',
+    0x210DD: 'lùn',
+    0x210E1: 'lóng',
+    0x210E2: 'xì',
+    0x210E6: 'lìn',
+    0x210E9: 'guī',
+    0x210F3: 'xīng',
+    0x210F7: 'lí',
+    0x210F8: 'cī',
+    0x21107: 'qǐng',
+    0x21111: 'jiān',
+    0x21112: 'dào',
+    0x21113: 'jiǎn',
+    0x21114: 'qìng',
+    0x21115: 'xiè',
+    0x21116: 'yìng',
+    0x2111F: 'há',
+    0x21121: 'zhe',
+    0x21122: 'shē',
+    0x21123: 'mí',
+    0x21124: 'huán',
+    0x21131: 'cù',
+    0x21132: 'rú',
+    0x21133: 'sǎ',
+    0x21134: 'huò',
+    0x21135: 'yī',
+    0x21137: 'dī',
+    0x21139: 'luàn',
+    0x2113B: 'yì',
+    0x21142: 'bò',
+    0x21143: 'páng',
+    0x21144: 'tán',
+    0x21145: 'é,éi',
+    0x21146: 'zāng',
+    0x21147: 'cóng',
+    0x21153: 'zhāi',
+    0x21155: 'xǐ',
+    0x21156: 'mǎng',
+    0x21158: 'là',
+    0x21159: 'yùn',
+    0x21161: 'è',
+    0x21165: 'dié',
+    0x2116D: 'guān',
+    0x21171: 'huàn',
+    0x21175: 'shì',
+    0x21176: 'jiǎn',
+    0x21179: 'zhān',
+    0x2117A: 'jí',
+    0x2117B: 'huàn',
+    0x21185: 'wàn',
+    0x21186: 'luǒ',
+    0x2118F: 'dòu',
+    0x21195: 'liàn',
+    0x211A3: 'niè,dí',
+    0x211A4: 'nǎn',
+    0x211A5: 'jiù',
+    0x211A6: 'yuè',
+    0x211A9: 'yāo,jiǒng',
+    0x211AA: 'chuāng',
+    0x211AE: 'cǎn',
+    0x211AF: 'lǐ',
+    0x211B0: 'dùn',
+    0x211B1: 'nǎn',
+    0x211B2: 'nǎn',
+    0x211B8: 'rì,guó',
+    0x211BD: 'yuè',
+    0x211C0: 'yóu',
+    0x211C2: 'yīn',
+    0x211C4: 'guó,niè',
+    0x211C8: 'dàng,tuó',
+    0x211D1: 'zhēn',
+    0x211D2: 'mí',
+    0x211D3: 'dié',
+    0x211D6: 'zhēn',
+    0x211DA: 'kuā',
+    0x211DC: 'hán',
+    0x211DD: 'sòng',
+    0x211DE: 'hé',
+    0x211DF: 'jī',
+    0x211E0: 'zhé',
+    0x211E4: 'bǐng',
+    0x211E6: 'wéi',
+    0x211E7: 'tōu',
+    0x211E9: 'tú',
+    0x211EC: 'gāng',
+    0x211ED: 'lóu',
+    0x211EE: 'quán',
+    0x211EF: 'hùn',
+    0x211F0: 'zhuǎn',
+    0x211F1: 'què',
+    0x211F3: 'hóng',
+    0x211F5: 'dàng',
+    0x211F6: 'hé',
+    0x211F7: 'tài',
+    0x211F8: 'guāi',
+    0x211FA: 'yù',
+    0x211FC: 'yà',
+    0x211FF: 'wān',
+    0x21200: 'qūn',
+    0x21205: 'jué',
+    0x21206: 'ōu',
+    0x21209: 'quān',
+    0x2120A: 'zhí',
+    0x2120D: 'líng',
+    0x2120E: 'wū,rì',
+    0x2120F: 'xìn',
+    0x21210: 'dá',
+    0x21212: 'yuān',
+    0x21213: 'yuàn',
+    0x21217: 'mò',
+    0x21219: 'yóu',
+    0x2121E: 'wǔ',
+    0x21220: 'zhāng',
+    0x21223: 'xuān',
+    0x21226: 'rǎo',
+    0x21227: 'gǔn',
+    0x21228: 'yù',
+    0x2122E: 'xiá',
+    0x2122F: 'biǎn',
+    0x21230: 'yóu',
+    0x21232: 'yīn',
+    0x21234: 'xuán,rǔ',
+    0x21235: 'yóu',
+    0x21236: 'léi',
+    0x2123C: 'tǐng,tíng,zhēng,zhǐ',
+    0x2123F: 'zhēn',
+    0x21244: 'zài,kū',
+    0x21245: 'gā',
+    0x21246: 'lá',
+    0x21249: 'què',
+    0x2124E: 'jú',
+    0x21250: 'chūn',
+    0x21251: 'dā',
+    0x21252: 'tún',
+    0x21253: 'āi',
+    0x21257: 'zǐ',
+    0x2125A: 'huáng,fēng',
+    0x2125B: 'yì',
+    0x21269: 'bào',
+    0x2126A: 'chí',
+    0x2126D: 'rì',
+    0x21274: 'lú,hù',
+    0x21277: 'jié',
+    0x21278: 'shì',
+    0x2127A: 'zuān',
+    0x21281: 'yì',
+    0x21284: 'fèn',
+    0x21285: 'fèn,biàn',
+    0x21289: 'mò',
+    0x2128D: 'shù',
+    0x2129B: 'áo',
+    0x2129D: 'pǐ',
+    0x2129E: 'píng,pìng',
+    0x2129F: 'pō',
+    0x212A0: 'jiá',
+    0x212A1: 'zhóu',
+    0x212A3: 'qiū',
+    0x212A7: 'yǒu',
+    0x212A8: 'tán',
+    0x212AB: 'rǒng',
+    0x212AD: 'mì',
+    0x212B6: 'yì',
+    0x212B8: 'rǒng',
+    0x212BB: 'liè',
+    0x212BC: 'qióng',
+    0x212D9: 'huí',
+    0x212DA: 'jì',
+    0x212DF: 'gào',
+    0x212E7: 'yóu',
+    0x212E8: 'chā',
+    0x212E9: 'dé',
+    0x212EA: 'yīn',
+    0x212EC: 'yù',
+    0x212ED: 'bèi',
+    0x212EF: 'bó',
+    0x21314: 'qiāo',
+    0x2131A: 'chǎ',
+    0x2131C: 'xīn',
+    0x2131E: 'chí',
+    0x21323: 'zào',
+    0x21324: 'kuí',
+    0x21326: 'fèi',
+    0x21329: 'tā,dá',
+    0x2132A: 'guài',
+    0x2132D: 'duō',
+    0x21332: 'guī',
+    0x21334: 'zhí',
+    0x2134C: 'chǎn',
+    0x2134D: 'nǎo',
+    0x21350: 'hú',
+    0x21352: 'táo',
+    0x21361: 'yì',
+    0x21364: 'niè',
+    0x21365: 'zhài',
+    0x21366: 'huán',
+    0x21368: 'dù',
+    0x2136A: 'qì',
+    0x2136B: 'cè',
+    0x2136E: 'chuí',
+    0x21372: 'dā',
+    0x21376: 'zhì',
+    0x21377: 'gèng',
+    0x2137B: 'wèng',
+    0x21389: 'dù',
+    0x2138D: 'chí',
+    0x21391: 'àn',
+    0x21392: 'kuò',
+    0x21394: 'wò',
+    0x21398: 'yīng',
+    0x2139A: 'piǎn',
+    0x213AB: 'zhá,qì',
+    0x213AC: 'zhuǎ',
+    0x213AE: 'sù',
+    0x213B3: 'nì',
+    0x213BA: 'zhú',
+    0x213BB: 'chán',
+    0x213BE: 'bèng',
+    0x213BF: 'ní',
+    0x213C0: 'zhí',
+    0x213C1: 'huì',
+    0x213D8: 'xià',
+    0x213DA: 'zhì',
+    0x213DB: 'xī',
+    0x213DE: 'jiǎng',
+    0x213E9: 'duī',
+    0x213EA: 'fū',
+    0x213ED: 'jiāo',
+    0x213EE: 'cháo',
+    0x213EF: 'bài',
+    0x213F5: 'liè',
+    0x213FC: 'áo',
+    0x2140B: 'zāo',
+    0x2140C: 'chù',
+    0x2140F: 'tuǒ',
+    0x21412: 'háo,hào',
+    0x21413: 'kāng',
+    0x21414: 'yín',
+    0x21416: 'xiàn',
+    0x2141D: 'fú,fù',
+    0x2141E: 'biē',
+    0x21420: 'kuī',
+    0x21424: 'qiè',
+    0x21425: 'sà',
+    0x2143F: 'dā,da',
+    0x21440: 'yě,shù',
+    0x21444: 'zhǎng',
+    0x21446: 'liáng',
+    0x21448: 'duǐ',
+    0x2144D: 'láo',
+    0x2144E: 'xūn',
+    0x21458: 'zhì',
+    0x2145A: 'kū',
+    0x2145E: 'suì',
+    0x2145F: 'wō',
+    0x21463: 'kū',
+    0x2146F: 'jiǎn',
+    0x21476: 'jiǎng',
+    0x2147B: 'zhuì',
+    0x2147D: 'shuǎng',
+    0x2147E: 'yú',
+    0x21481: 'sà',
+    0x21483: 'yù,ào',
+    0x21484: 'lǎn',
+    0x2148A: 'yù',
+    0x2148C: 'qiǎn',
+    0x2148D: 'jù',
+    0x2148F: 'liè',
+    0x21492: 'shú',
+    0x21493: 'xiàn',
+    0x21496: 'gài',
+    0x214A2: 'tái',
+    0x214A7: 'tiǎn',
+    0x214AF: 'mèng',
+    0x214B1: 'dí',
+    0x214B3: 'mián',
+    0x214BE: 'huī,kuì',
+    0x214C9: 'duò',
+    0x214CD: 'liè',
+    0x214D2: 'lài',
+    0x214D3: 'yín,yīn',
+    0x214D4: 'lǎn',
+    0x214D6: 'jiāo',
+    0x214D8: 'huò',
+    0x214E3: 'guō',
+    0x214E6: 'zhàn',
+    0x214ED: 'mǐ',
+    0x214F0: 'kuī',
+    0x214F7: 'duò',
+    0x214FF: 'yín',
+    0x21507: 'lèi',
+    0x21515: 'gòng',
+    0x2151B: 'tǐng',
+    0x2151C: 'yáo',
+    0x2151E: 'wǎng',
+    0x21523: 'jié,qiè',
+    0x21528: 'xiū',
+    0x2152A: 'shù',
+    0x21531: 'wèi',
+    0x21534: 'yù',
+    0x21541: 'zhān',
+    0x21549: 'āng',
+    0x2154F: 'sǎng',
+    0x21550: 'chóu',
+    0x21552: 'kuà',
+    0x21556: 'jǔ,féng',
+    0x21557: 'hài',
+    0x21562: 'miǎn,mǎn',
+    0x21567: 'hàng',
+    0x2156A: 'chóu',
+    0x2156E: 'líng',
+    0x21570: 'zōng',
+    0x21589: 'kūn',
+    0x2158C: 'zhōng',
+    0x2158E: 'zhāo',
+    0x21590: 'diě',
+    0x21591: 'gǒu',
+    0x21592: 'yún',
+    0x21593: 'dān',
+    0x21594: 'nuó,nuǒ',
+    0x2159B: 'bǐng',
+    0x2159D: 'rán',
+    0x2159E: 'chān',
+    0x215A2: 'rǒng',
+    0x215A3: 'yīn',
+    0x215A4: 'chān',
+    0x215A7: 'zhì',
+    0x215AA: 'guài',
+    0x215AB: 'nuó',
+    0x215AC: 'shēn',
+    0x215AF: 'sù',
+    0x215B2: 'wǒ',
+    0x215B3: 'chǐ',
+    0x215BA: 'miè',
+    0x215BB: 'zhí',
+    0x215BE: 'qī',
+    0x215C1: 'gōu',
+    0x215C6: 'lǒu',
+    0x215C8: 'zī',
+    0x215CD: 'dǎng',
+    0x215CF: 'xiǎn',
+    0x215D1: 'rǒu',
+    0x215D7: 'pěng',
+    0x215DE: 'xī',
+    0x215E2: 'kuā,běn',
+    0x215E4: 'guì',
+    0x215E5: 'chún',
+    0x215E6: 'jiè',
+    0x215F2: 'jiè,bēn',
+    0x215F3: 'xī',
+    0x215F5: 'kū',
+    0x215F7: 'gū',
+    0x215F8: 'zhà,kuā',
+    0x215F9: 'fàn',
+    0x215FC: 'xiè',
+    0x2160D: 'huán,qié',
+    0x2160F: 'niǎo',
+    0x21610: 'xì',
+    0x2161B: 'cū',
+    0x2161D: 'gǔn',
+    0x21621: 'xī',
+    0x21627: 'qiá',
+    0x2162A: 'māng',
+    0x2162D: 'zhé',
+    0x21630: 'juàn',
+    0x21634: 'biē',
+    0x21640: 'biē',
+    0x21645: 'quán',
+    0x2164B: 'xì',
+    0x2164E: 'jiǎo,miǎo',
+    0x21650: 'quán',
+    0x21651: 'zhǐ',
+    0x21652: 'tiān',
+    0x21653: 'kāi',
+    0x21658: 'sǎn,yì',
+    0x2165B: 'zī',
+    0x21663: 'jié',
+    0x2166A: 'bié',
+    0x2166C: 'dòu',
+    0x2166D: 'zuī',
+    0x21676: 'yǎn',
+    0x21681: 'bì',
+    0x21685: 'kuǎi',
+    0x21687: 'yàn',
+    0x21688: 'wéi',
+    0x2168A: 'huān',
+    0x2168C: 'hào',
+    0x21691: 'gōng',
+    0x21694: 'méng',
+    0x21697: 'lěi',
+    0x21699: 'dì',
+    0x2169B: 'bǐng',
+    0x2169C: 'huān,kàn',
+    0x2169F: 'wā',
+    0x216A0: 'jué',
+    0x216A8: 'chì',
+    0x216AD: 'bā',
+    0x216AE: 'jiǔ',
+    0x216B7: 'dì',
+    0x216B9: 'zhàng',
+    0x216BB: 'dà',
+    0x216BC: 'shí',
+    0x216BD: 'hào',
+    0x216CC: 'yè',
+    0x216D7: 'bì',
+    0x216D8: 'pǐ',
+    0x216D9: 'yǎo,yāo',
+    0x216DC: 'dī',
+    0x216DD: 'càn',
+    0x216DE: 'pín',
+    0x216DF: 'yuè',
+    0x216E0: 'qiē',
+    0x216E1: 'pī',
+    0x216F5: 'tuǒ',
+    0x216F6: 'xiè',
+    0x216FD: 'yè',
+    0x21700: 'fàn',
+    0x21701: 'guā',
+    0x21702: 'hù',
+    0x21703: 'rǔ',
+    0x21709: 'rǎn,ràn',
+    0x2170A: 'fǒu',
+    0x2170B: 'huāng',
+    0x2171A: 'rú',
+    0x21722: 'mǎo',
+    0x21725: 'duī',
+    0x21726: 'huì',
+    0x21727: 'xì',
+    0x21728: 'xiū',
+    0x2172B: 'rǎn',
+    0x2172C: 'yī',
+    0x2172F: 'zhé',
+    0x21731: 'jì',
+    0x21732: 'gào',
+    0x21733: 'yòu',
+    0x21735: 'pū',
+    0x21748: 'chù',
+    0x21749: 'cū',
+    0x2174A: 'zhé',
+    0x2174B: 'niǎo',
+    0x2174D: 'qiè',
+    0x21750: 'chá',
+    0x21752: 'niǎo',
+    0x21753: 'suī',
+    0x21759: 'chá',
+    0x2175A: 'chéng',
+    0x2175B: 'yáo',
+    0x2175C: 'dù',
+    0x2175D: 'wāng',
+    0x2175F: 'niàn',
+    0x21760: 'mí',
+    0x21766: 'nǒu',
+    0x21767: 'xì',
+    0x21769: 'yāo',
+    0x2176B: 'chān',
+    0x21798: 'xiè',
+    0x21799: 'miè',
+    0x2179A: 'kěng',
+    0x2179C: 'cù',
+    0x2179E: 'shěng',
+    0x2179F: 'pàn',
+    0x217A0: 'hù',
+    0x217A2: 'kè',
+    0x217A3: 'xiàn',
+    0x217A5: 'hóu',
+    0x217A6: 'qióng',
+    0x217A7: 'zōng',
+    0x217AA: 'fú',
+    0x217AB: 'nài',
+    0x217AD: 'nì',
+    0x217AF: 'kǔ',
+    0x217BE: 'nèn',
+    0x217CD: 'gē',
+    0x217D1: 'hóu',
+    0x217D3: 'āi',
+    0x217D5: 'shī',
+    0x217DE: 'xiū',
+    0x217DF: 'cōng',
+    0x217E0: 'jiāo',
+    0x217E2: 'zhá',
+    0x217E3: 'xiāo',
+    0x217E4: 'liàn',
+    0x217E5: 'qǔ',
+    0x217E8: 'shǎn',
+    0x217E9: 'xiè',
+    0x217EB: 'gòng',
+    0x217EC: 'miè',
+    0x217ED: 'chái',
+    0x217EF: 'ēn',
+    0x217F3: 'dòu',
+    0x21806: 'kòu',
+    0x2180A: 'tiáo',
+    0x2180B: 'shī',
+    0x2180F: 'sāng',
+    0x21812: 'guān',
+    0x21816: 'hào',
+    0x21817: 'zhì',
+    0x21818: 'yàng',
+    0x21819: 'tōng',
+    0x2181A: 'bì',
+    0x2181C: 'mó,mò',
+    0x2181E: 'fú',
+    0x21825: 'qiáng',
+    0x21839: 'zhì',
+    0x2183C: 'sōu',
+    0x2183F: 'niǎo',
+    0x21840: 'juàn',
+    0x21842: 'yàng',
+    0x21844: 'huāng',
+    0x21848: 'bēng',
+    0x21849: 'mó',
+    0x2184A: 'cháo',
+    0x2184E: 'lǚ,lóu',
+    0x2184F: 'shāo',
+    0x21850: 'bǔ',
+    0x21851: 'zēng',
+    0x21852: 'sī,xī',
+    0x21854: 'zuì',
+    0x21855: 'yuē',
+    0x21856: 'zān,cān',
+    0x21857: 'luǎn,luàn',
+    0x21865: 'qú',
+    0x2187A: 'miǎo',
+    0x21880: 'zhuàn',
+    0x21888: 'dàng',
+    0x2188A: 'yuān',
+    0x21892: 'jǔ',
+    0x21895: 'huǐ',
+    0x21896: 'qì',
+    0x21898: 'yùn,yíng',
+    0x2189A: 'màn',
+    0x2189C: 'mǒ',
+    0x218B1: 'piāo',
+    0x218B3: 'jìn',
+    0x218B9: 'yāo',
+    0x218C0: 'chì',
+    0x218C1: 'nì',
+    0x218C2: 'sōu',
+    0x218C8: 'shù',
+    0x218CB: 'piāo',
+    0x218D4: 'hàn',
+    0x218E0: 'yāo',
+    0x218E2: 'néi',
+    0x218EA: 'shì',
+    0x218EC: 'yuān',
+    0x218EE: 'cài',
+    0x218EF: 'jié',
+    0x218F9: 'xiè',
+    0x218FD: 'yán',
+    0x218FE: 'xiāo',
+    0x2190B: 'xiè',
+    0x2190C: 'lì',
+    0x2190E: 'fàn',
+    0x21917: 'zhù',
+    0x21919: 'nà',
+    0x2191B: 'zhuǎn',
+    0x2191E: 'kuī',
+    0x21922: 'luó',
+    0x2192B: 'qiā',
+    0x21936: 'wān',
+    0x2193D: 'shǔ',
+    0x2193F: 'chèng,kǒng',
+    0x21941: 'yì',
+    0x21946: 'hǎo,hào',
+    0x21948: 'jiào',
+    0x2194B: 'huì',
+    0x2194D: 'xiào',
+    0x2194E: 'cí,zǐ',
+    0x2195E: 'jì,bèi',
+    0x21966: 'nǐ,jìn',
+    0x21968: 'nǐ,jìn',
+    0x21969: 'tǐ',
+    0x21976: 'jù,rú',
+    0x21978: 'mìng',
+    0x2197D: 'lí',
+    0x2197F: 'zhòng',
+    0x21981: 'xù',
+    0x21983: 'qióng',
+    0x21984: 'fú',
+    0x21986: 'bìn',
+    0x2198A: 'jì',
+    0x2198D: 'qí',
+    0x2198E: 'xì',
+    0x21994: 'dèng',
+    0x21995: 'ér',
+    0x2199B: 'shú',
+    0x2199C: 'tóng',
+    0x2199D: 'xiāo,xiáo',
+    0x2199F: 'pí',
+    0x219A8: 'dǎn',
+    0x219AA: 'jí',
+    0x219B3: 'xiào',
+    0x219B7: 'cóng',
+    0x219BB: 'bīn',
+    0x219BC: 'rǒng',
+    0x219CD: 'miàn,bīn',
+    0x219D2: 'miàn',
+    0x219D4: 'shū',
+    0x219D5: 'xiáo,shǒu',
+    0x219D6: 'bǎo',
+    0x219D7: 'wà',
+    0x219D9: 'pào',
+    0x219E3: 'gǎi',
+    0x219E5: 'hū',
+    0x219E6: 'héng',
+    0x219E8: 'zhú',
+    0x219E9: 'guāi',
+    0x219ED: 'guì,guǐ',
+    0x219F9: 'dài',
+    0x219FC: 'bīn',
+    0x219FD: 'huǎng,huāng',
+    0x21A00: 'chá',
+    0x21A04: 'xià,sāi',
+    0x21A05: 'jú',
+    0x21A07: 'yǎo,xiǎng',
+    0x21A16: 'fěn',
+    0x21A17: 'zào',
+    0x21A1B: 'fēng',
+    0x21A22: 'jū',
+    0x21A23: 'yù',
+    0x21A29: 'hūn',
+    0x21A32: 'jié',
+    0x21A33: 'xiòng,hùn',
+    0x21A35: 'nài',
+    0x21A3B: 'nǒu',
+    0x21A3D: 'shěng',
+    0x21A3F: 'yù',
+    0x21A42: 'huán',
+    0x21A43: 'gěng',
+    0x21A44: 'wǎn',
+    0x21A46: 'tuó',
+    0x21A47: 'qiāo',
+    0x21A58: 'yìn',
+    0x21A5A: 'jiā,zhuàn',
+    0x21A61: 'suǒ',
+    0x21A63: 'jié',
+    0x21A64: 'xī',
+    0x21A65: 'wěng',
+    0x21A69: 'máng',
+    0x21A76: 'yáng',
+    0x21A78: 'yáo',
+    0x21A7D: 'máng',
+    0x21A7E: 'ōu',
+    0x21A81: 'án',
+    0x21A85: 'lòu',
+    0x21A91: 'è',
+    0x21A92: 'zǐ',
+    0x21A97: 'è',
+    0x21A99: 'àn',
+    0x21A9E: 'huò',
+    0x21AA0: 'céng',
+    0x21AB0: 'xiòng',
+    0x21AB1: 'jì',
+    0x21AB3: 'zuó',
+    0x21AB5: 'qí',
+    0x21ABA: 'zhēng',
+    0x21AC0: 'jī',
+    0x21AC1: 'qī,chèn',
+    0x21AC2: 'juǎn',
+    0x21AC3: 'níng',
+    0x21ADF: 'sè',
+    0x21AE5: 'hè',
+    0x21AE6: 'rǒng',
+    0x21AE7: 'qǐn',
+    0x21AEC: 'jū',
+    0x21AEF: 'lì',
+    0x21AF5: 'shí',
+    0x21AF8: 'nì',
+    0x21AF9: 'xián',
+    0x21AFA: 'fū',
+    0x21AFD: 'rǔ,yù',
+    0x21B01: 'xiòng',
+    0x21B02: 'guì',
+    0x21B04: 'jì',
+    0x21B06: 'měng,mèng',
+    0x21B07: 'fū',
+    0x21B09: 'sài',
+    0x21B0A: 'yù',
+    0x21B0B: 'jiào',
+    0x21B0C: 'mèng',
+    0x21B0D: 'mí,lóng,mǐ',
+    0x21B0E: 'qiāng',
+    0x21B10: 'yí,mí',
+    0x21B13: 'yí',
+    0x21B15: 'lóng',
+    0x21B16: 'hān',
+    0x21B17: 'nì',
+    0x21B18: 'lào',
+    0x21B19: 'sèng',
+    0x21B1C: 'lǐn',
+    0x21B1E: 'yù',
+    0x21B25: 'nuó',
+    0x21B2B: 'wù',
+    0x21B2F: 'biǎn',
+    0x21B32: 'biǎn',
+    0x21B33: 'xuān,shòu',
+    0x21B35: 'jiān',
+    0x21B38: 'biǎn',
+    0x21B42: 'dé',
+    0x21B47: 'zhuān',
+    0x21B4B: 'rǒng',
+    0x21B50: 'shuàn',
+    0x21B58: 'jiā',
+    0x21B5B: 'huǐ',
+    0x21B5E: 'zhān',
+    0x21B62: 'bài',
+    0x21B63: 'liè',
+    0x21B65: 'xiē',
+    0x21B6D: 'jiǎn',
+    0x21B6E: 'shǒu',
+    0x21B73: 'kào',
+    0x21B77: 'guān',
+    0x21B78: 'luàn',
+    0x21B7E: 'nǒu',
+    0x21B7F: 'chǎng',
+    0x21B8E: 'liáng',
+    0x21B99: 'nài',
+    0x21B9A: 'rǔ',
+    0x21B9E: 'zhì',
+    0x21BA6: 'cáo',
+    0x21BB0: 'lì',
+    0x21BBB: 'lán',
+    0x21BBF: 'chān',
+    0x21BC1: 'wāng',
+    0x21BC4: 'lì',
+    0x21BC7: 'wù',
+    0x21BC8: 'páo',
+    0x21BC9: 'yòu',
+    0x21BCB: 'gān',
+    0x21BCF: 'ān',
+    0x21BD0: 'xiū',
+    0x21BD1: 'shuǐ,zhuǐ',
+    0x21BD2: 'ruǐ',
+    0x21BD8: 'bǎn',
+    0x21BD9: 'yóu',
+    0x21BE2: 'huó',
+    0x21BE5: 'huī',
+    0x21BE8: 'zuò',
+    0x21BE9: 'xiāo',
+    0x21BEB: 'mián',
+    0x21BF0: 'gà',
+    0x21BF1: 'yuǎn',
+    0x21BF3: 'bò',
+    0x21BF4: 'chào',
+    0x21BF5: 'tuǐ,kuì',
+    0x21BF7: 'bò,kòu',
+    0x21BFD: 'gà',
+    0x21BFF: 'tiāo',
+    0x21C00: 'ná',
+    0x21C05: 'hú',
+    0x21C06: 'niè',
+    0x21C0B: 'huí',
+    0x21C0C: 'lǒu',
+    0x21C0E: 'tí',
+    0x21C10: 'qiào',
+    0x21C11: 'qiáo',
+    0x21C12: 'zhǒng',
+    0x21C16: 'dī',
+    0x21C1A: 'lín',
+    0x21C1D: 'quán',
+    0x21C1E: 'zhuān',
+    0x21C20: 'léi,luán',
+    0x21C22: 'xié',
+    0x21C25: 'rén,yí',
+    0x21C28: 'dāng',
+    0x21C2A: 'dū',
+    0x21C2B: 'niǎn',
+    0x21C2F: 'shǐ,diǎo,běi',
+    0x21C32: 'xián',
+    0x21C39: 'zhí',
+    0x21C3D: 'ài',
+    0x21C3E: 'cī',
+    0x21C3F: 'pú',
+    0x21C41: 'shǐ',
+    0x21C45: 'qū',
+    0x21C46: 'shǔ',
+    0x21C47: 'diān',
+    0x21C49: 'xiǎo',
+    0x21C4A: 'shuǐ',
+    0x21C4C: 'huán',
+    0x21C50: 'yí',
+    0x21C51: 'juān',
+    0x21C54: 'zhǐ,qì',
+    0x21C5C: 'zhào',
+    0x21C63: 'xù',
+    0x21C6F: 'lòng',
+    0x21C71: 'zhù',
+    0x21C73: 'suǒ',
+    0x21C77: 'dié',
+    0x21C7A: 'qú',
+    0x21C7C: 'kè,kuà',
+    0x21C7D: 'hū',
+    0x21C7E: 'jū',
+    0x21C80: 'qǐng',
+    0x21C8D: 'bīng',
+    0x21C95: 'tì',
+    0x21C97: 'jué',
+    0x21C9A: 'qiú',
+    0x21CA3: 'jiàng',
+    0x21CAA: 'yùn',
+    0x21CAD: 'mèi',
+    0x21CAE: 'pī',
+    0x21CB0: 'qú',
+    0x21CBC: 'mì',
+    0x21CBF: 'tì',
+    0x21CC2: 'kài',
+    0x21CC4: 'bǐ',
+    0x21CC6: 'qū,qù',
+    0x21CCF: 'tiāo',
+    0x21CD1: 'chù',
+    0x21CD8: 'jú',
+    0x21CDA: 'xī',
+    0x21CDE: 'lìn',
+    0x21CED: 'chǐ',
+    0x21CEE: 'jī',
+    0x21CF4: 'lú',
+    0x21CF8: 'lì',
+    0x21CFE: 'jué',
+    0x21D05: 'zhū',
+    0x21D06: 'lù',
+    0x21D0E: 'niè',
+    0x21D14: 'quán',
+    0x21D2D: 'yà',
+    0x21D2F: 'è',
+    0x21D31: 'hù,jié',
+    0x21D40: 'máng',
+    0x21D49: 'wù',
+    0x21D4C: 'chā',
+    0x21D51: 'qīn',
+    0x21D52: 'jié,qǐ',
+    0x21D53: 'hóng',
+    0x21D55: 'dān',
+    0x21D56: 'ěn',
+    0x21D57: 'zè',
+    0x21D58: 'hù',
+    0x21D59: 'àng',
+    0x21D5A: 'jiè',
+    0x21D5B: 'fù',
+    0x21D5C: 'yòng',
+    0x21D5E: 'fēng',
+    0x21D6C: 'mù',
+    0x21D76: 'sè',
+    0x21D77: 'cóng',
+    0x21D7B: 'kāng',
+    0x21D82: 'yào',
+    0x21D83: 'ài',
+    0x21D84: 'bāo',
+    0x21D86: 'pǒ',
+    0x21D88: 'shǐ',
+    0x21D89: 'fàn',
+    0x21D8B: 'jú',
+    0x21D8C: 'pí',
+    0x21D8E: 'wèi',
+    0x21D8F: 'kū',
+    0x21D90: 'qié',
+    0x21D91: 'gān',
+    0x21DA2: 'kuàng',
+    0x21DA3: 'suì',
+    0x21DA4: 'bēng,yòng',
+    0x21DA5: 'jiā',
+    0x21DA6: 'yà',
+    0x21DAA: 'kàn',
+    0x21DAB: 'niè',
+    0x21DAD: 'xíng',
+    0x21DAF: 'xì',
+    0x21DB1: 'lìn',
+    0x21DB2: 'duǒ',
+    0x21DB4: 'chǎn',
+    0x21DC8: 'shì',
+    0x21DCB: 'duì',
+    0x21DCD: 'jiāng',
+    0x21DCE: 'yǔ',
+    0x21DCF: 'lù',
+    0x21DD0: 'ěn',
+    0x21DD3: 'gǔ',
+    0x21DD5: 'wěi',
+    0x21DD6: 'chē',
+    0x21DD7: 'huàn,huán',
+    0x21DD8: 'bié',
+    0x21DDB: 'hàn',
+    0x21DDC: 'tuí',
+    0x21DDD: 'nà',
+    0x21DDE: 'qǐ',
+    0x21DE0: 'tóu',
+    0x21DE1: 'yuān',
+    0x21DE2: 'wáng',
+    0x21DE4: 'wú',
+    0x21DE5: 'gào',
+    0x21DE8: 'kēng,xíng',
+    0x21DEA: 'yí,níng',
+    0x21DF8: 'xiāo',
+    0x21DFA: 'guǐ',
+    0x21DFB: 'yà',
+    0x21DFC: 'suì',
+    0x21DFD: 'sǒng',
+    0x21DFF: 'zhuó',
+    0x21E02: 'tū,tú',
+    0x21E03: 'xiǎn,jiǎn',
+    0x21E08: 'zè',
+    0x21E09: 'lì',
+    0x21E0C: 'zhù',
+    0x21E0E: 'jié',
+    0x21E11: 'tì',
+    0x21E14: 'xié',
+    0x21E15: 'qióng',
+    0x21E17: 'yà',
+    0x21E18: 'jū',
+    0x21E1B: 'yín',
+    0x21E1C: 'zhí',
+    0x21E1E: 'kǎn',
+    0x21E1F: 'zī',
+    0x21E21: 'kē',
+    0x21E23: 'niè',
+    0x21E24: 'qiáng',
+    0x21E25: 'wǎn',
+    0x21E26: 'zé',
+    0x21E28: 'jū',
+    0x21E2A: 'zì',
+    0x21E44: 'yà',
+    0x21E47: 'lín',
+    0x21E49: 'qí',
+    0x21E4E: 'huí',
+    0x21E53: 'qì',
+    0x21E55: 'yáng',
+    0x21E56: 'suì',
+    0x21E58: 'qǐ',
+    0x21E59: 'guī',
+    0x21E62: 'qìn',
+    0x21E63: 'ē',
+    0x21E65: 'zuò',
+    0x21E68: 'zè',
+    0x21E69: 'qì',
+    0x21E6A: 'jí',
+    0x21E6C: 'tuó',
+    0x21E6D: 'dié',
+    0x21E6F: 'huì',
+    0x21E70: 'máo',
+    0x21E72: 'xǔ',
+    0x21E75: 'hóu',
+    0x21E76: 'yǎn',
+    0x21E77: 'xiáng',
+    0x21E78: 'cōng',
+    0x21E79: 'hú',
+    0x21E7C: 'àn,yǎn',
+    0x21E7E: 'bǐng',
+    0x21E87: 'duǒ',
+    0x21E90: 'zhǔ',
+    0x21E91: 'dié',
+    0x21E92: 'yōu',
+    0x21E93: 'qǐ',
+    0x21E94: 'shí',
+    0x21E95: 'xūn',
+    0x21E96: 'yōu',
+    0x21E97: 'kān',
+    0x21E98: 'qiǎo',
+    0x21E9B: 'qiāng,huà',
+    0x21E9C: 'pén',
+    0x21E9F: 'quán',
+    0x21EA1: 'yíng',
+    0x21EA7: 'shā',
+    0x21EAB: 'tāo',
+    0x21EAD: 'hòng',
+    0x21EAE: 'pǐ',
+    0x21EAF: 'yáo',
+    0x21EB4: 'tú',
+    0x21EB5: 'chái',
+    0x21EB7: 'xià',
+    0x21EB8: 'qí',
+    0x21EBA: 'qióng',
+    0x21EBD: 'jìn',
+    0x21EC8: 'zhēn',
+    0x21ECC: 'zhū',
+    0x21ECE: 'xī',
+    0x21ED0: 'wēng',
+    0x21ED1: 'zhǒng',
+    0x21ED5: 'suì',
+    0x21ED8: 'kē',
+    0x21ED9: 'kuò',
+    0x21EDA: 'kǎng',
+    0x21EDD: 'cháo',
+    0x21EDE: 'bì',
+    0x21EDF: 'mò',
+    0x21EE0: 'zhù',
+    0x21EE1: 'hàn,yán',
+    0x21EE2: 'yǔ',
+    0x21EE3: 'yí',
+    0x21EE4: 'má',
+    0x21EE7: 'qì',
+    0x21EE8: 'gùn',
+    0x21EE9: 'màn',
+    0x21EEA: 'liáo,liù',
+    0x21EEB: 'lín',
+    0x21EEC: 'zú',
+    0x21EED: 'lěi',
+    0x21EEE: 'hù',
+    0x21EEF: 'chuǎng',
+    0x21EF0: 'qì',
+    0x21EF1: 'léi',
+    0x21F01: 'chī',
+    0x21F03: 'pó',
+    0x21F04: 'dié',
+    0x21F0A: 'lěi',
+    0x21F0E: 'yǐ',
+    0x21F13: 'diàn',
+    0x21F16: 'dūn',
+    0x21F17: 'gāo',
+    0x21F18: 'hū',
+    0x21F1A: 'xiāo',
+    0x21F1B: 'gá',
+    0x21F1C: 'pēng',
+    0x21F2C: 'shěn',
+    0x21F31: 'wéi',
+    0x21F3B: 'duì',
+    0x21F3C: 'cháo',
+    0x21F3D: 'yǐn',
+    0x21F3E: 'kuài',
+    0x21F3F: 'kū',
+    0x21F41: 'zuì',
+    0x21F42: 'gǔ',
+    0x21F45: 'yùn',
+    0x21F46: 'zhì',
+    0x21F49: 'jì',
+    0x21F4A: 'chēng',
+    0x21F56: 'xiè',
+    0x21F5B: 'zuǐ',
+    0x21F5C: 'án',
+    0x21F5D: 'hāo',
+    0x21F60: 'pǒ',
+    0x21F62: 'dí',
+    0x21F63: 'yè',
+    0x21F67: 'náo',
+    0x21F71: 'jié',
+    0x21F72: 'bàng',
+    0x21F73: 'lǎn',
+    0x21F74: 'cáng',
+    0x21F76: 'bì',
+    0x21F7B: 'zhǎn',
+    0x21F7C: 'qì',
+    0x21F82: 'náo',
+    0x21F85: 'lǜ',
+    0x21F87: 'kuàng',
+    0x21F89: 'mó',
+    0x21F8B: 'lěi,léi',
+    0x21F8C: 'páo',
+    0x21F92: 'lì',
+    0x21F93: 'céng',
+    0x21F95: 'dàng',
+    0x21F96: 'lěi',
+    0x21F99: 'è',
+    0x21F9B: 'bèng',
+    0x21F9C: 'jué,huò',
+    0x21FA5: 'xuán',
+    0x21FA6: 'niè',
+    0x21FA8: 'hài',
+    0x21FAE: 'xiǎn',
+    0x21FB0: 'jiǎn',
+    0x21FB1: 'mí',
+    0x21FB2: 'niè',
+    0x21FBB: 'cáng',
+    0x21FBC: 'sǒng',
+    0x21FBD: 'zēng',
+    0x21FBE: 'yì',
+    0x21FC2: 'chóng',
+    0x21FC4: 'cáng',
+    0x21FC9: 'lěi',
+    0x21FCA: 'nuó',
+    0x21FCB: 'lì',
+    0x21FCE: 'lí',
+    0x21FCF: 'luó',
+    0x21FD3: 'tǎng',
+    0x21FD6: 'niè,yà',
+    0x21FD7: 'niè',
+    0x21FD9: 'jī',
+    0x21FDB: 'lěi',
+    0x21FDD: 'nàng',
+    0x21FE0: 'lín',
+    0x21FE1: 'líng',
+    0x21FE4: 'xián',
+    0x21FE5: 'yù',
+    0x21FE7: 'zāi',
+    0x21FE8: 'quǎn',
+    0x21FE9: 'liè',
+    0x21FEF: 'yù',
+    0x21FF0: 'huāng',
+    0x21FFA: 'nǎo',
+    0x21FFC: 'xùn',
+    0x21FFE: 'jú',
+    0x21FFF: 'huò',
+    0x22001: 'yì',
+    0x2200A: 'xī',
+    0x2200B: 'sè',
+    0x2200C: 'jiǎo',
+    0x2200D: 'yōng',
+    0x22015: 'shī',
+    0x22016: 'jīng',
+    0x22017: 'wàn',
+    0x22018: 'yě',
+    0x22019: 'jiū',
+    0x2201C: 'gǒng',
+    0x22021: 'huī,zuǒ',
+    0x2202A: 'ěr',
+    0x22035: 'hàn',
+    0x2203C: 'fú',
+    0x22040: 'fú',
+    0x22041: 'zhuó',
+    0x22042: 'jī,jì',
+    0x2204F: 'bāng',
+    0x22052: 'qí',
+    0x22053: 'shǐ,hài',
+    0x22055: 'diǎo',
+    0x22056: 'pèi',
+    0x22057: 'xiǎn,gàn',
+    0x22058: 'sān',
+    0x2205D: 'cháng',
+    0x2205E: 'yuē',
+    0x22060: 'gōng',
+    0x22062: 'wū',
+    0x22064: 'fēn',
+    0x22067: 'chǎn',
+    0x22069: 'nèi',
+    0x2206A: 'jué',
+    0x2206C: 'zhǎo',
+    0x2206E: 'qián',
+    0x22071: 'ǎo',
+    0x22076: 'wǎng',
+    0x22077: 'zhōng',
+    0x22079: 'huāng',
+    0x2207B: 'bù',
+    0x2207C: 'zhǔ',
+    0x2207D: 'bì',
+    0x2207E: 'chāo',
+    0x2207F: 'zhēng',
+    0x22080: 'fú',
+    0x22081: 'kōu,qú',
+    0x22083: 'zuó',
+    0x22084: 'xuàn',
+    0x22086: 'fù',
+    0x2208A: 'yǎo',
+    0x2208D: 'bō',
+    0x2208F: 'bèi',
+    0x22090: 'xié',
+    0x22091: 'shì',
+    0x22092: 'yí',
+    0x22094: 'hóng',
+    0x22095: 'cuì',
+    0x22097: 'yì',
+    0x22098: 'zhuān',
+    0x2209D: 'chì',
+    0x220A4: 'pō,lù',
+    0x220A8: 'yín',
+    0x220B1: 'yuàn',
+    0x220B6: 'jiōng',
+    0x220B9: 'mào',
+    0x220BA: 'qiàn',
+    0x220BC: 'yì',
+    0x220C0: 'wú',
+    0x220CD: 'bēi',
+    0x220CE: 'huò',
+    0x220CF: 'cóng',
+    0x220D0: 'kōng',
+    0x220D5: 'tà',
+    0x220D7: 'hàn',
+    0x220D8: 'qiàn',
+    0x220DC: 'zhí',
+    0x220E2: 'sè',
+    0x220E5: 'qiān',
+    0x220E6: 'guǒ',
+    0x220E9: 'gǔn,juǎn',
+    0x220EC: 'jiān',
+    0x220ED: 'zhōng',
+    0x220EE: 'miǎn',
+    0x220EF: 'guǐ',
+    0x220F0: 'shì',
+    0x220F1: 'móu',
+    0x220F2: 'è',
+    0x220F3: 'bǎ',
+    0x220F4: 'là',
+    0x220F8: 'zhòu',
+    0x220FA: 'jí',
+    0x22100: 'zǎo',
+    0x22104: 'zhā',
+    0x22105: 'yì',
+    0x22107: 'gǒu',
+    0x2210A: 'guī',
+    0x2210B: 'yīng',
+    0x2210C: 'shǎi',
+    0x2210D: 'hé,gé',
+    0x2210E: 'bàng',
+    0x2210F: 'mò',
+    0x22110: 'méng',
+    0x22113: 'wù',
+    0x22114: 'dài',
+    0x22117: 'jiǒng',
+    0x2211C: 'hàn',
+    0x2211F: 'tōng',
+    0x22120: 'kōu',
+    0x22121: 'lí',
+    0x22122: 'zhì',
+    0x22123: 'huì',
+    0x22124: 'zǎn',
+    0x22126: 'diǎo',
+    0x22127: 'cù',
+    0x22131: 'zhì',
+    0x22133: 'kuǎ',
+    0x22135: 'xiàng',
+    0x22136: 'huà',
+    0x22137: 'liáo',
+    0x22138: 'cuì',
+    0x22139: 'qiāo',
+    0x2213A: 'jiǎo',
+    0x2213C: 'xū',
+    0x2213D: 'èr',
+    0x2213F: 'tuō',
+    0x22140: 'tán',
+    0x22141: 'zhì',
+    0x22148: 'nǎo',
+    0x22149: 'mào',
+    0x2214A: 'dì',
+    0x2214B: 'céng',
+    0x2214E: 'jiǎo',
+    0x2214F: 'lián',
+    0x22151: 'shā',
+    0x22152: 'dàn',
+    0x22155: 'suì',
+    0x22156: 'lián',
+    0x22157: 'guò',
+    0x2215A: 'biǎo,biāo',
+    0x2215C: 'cì',
+    0x2215D: 'diàn',
+    0x2215E: 'lǜ',
+    0x2215F: 'nǐ',
+    0x22160: 'yǎn',
+    0x22161: 'lán',
+    0x22164: 'gài',
+    0x22165: 'chú',
+    0x22169: 'bì',
+    0x2216A: 'zú',
+    0x2216B: 'huì',
+    0x2216D: 'lǎi',
+    0x2216E: 'xián',
+    0x2216F: 'fèn',
+    0x22170: 'hè',
+    0x22179: 'yào',
+    0x2217A: 'zhǎn',
+    0x2217C: 'néi',
+    0x2217E: 'luǒ',
+    0x22180: 'yuán',
+    0x22182: 'néng',
+    0x22189: 'rěn',
+    0x2219C: 'gé',
+    0x2219E: 'jiǎn',
+    0x2219F: 'píng',
+    0x221A3: 'biè',
+    0x221A6: 'jiàn',
+    0x221A9: 'bìng',
+    0x221AF: 'mì,xuán',
+    0x221B0: 'hù',
+    0x221B4: 'diǎo',
+    0x221B6: 'yōu,zī',
+    0x221B7: 'yāo,miào',
+    0x221B8: 'bēng',
+    0x221BA: 'chén',
+    0x221BB: 'jī,duì',
+    0x221BD: 'yāo',
+    0x221C7: 'guān',
+    0x221C8: 'yàn',
+    0x221D5: 'chǐ',
+    0x221D7: 'shà',
+    0x221D8: 'yǎn',
+    0x221D9: 'yì',
+    0x221DA: 'yì',
+    0x221DB: 'chè,chǐ',
+    0x221DE: 'hàn',
+    0x221DF: 'huāng',
+    0x221E4: 'shuì',
+    0x221E5: 'suì',
+    0x221E6: 'rén',
+    0x221E7: 'tán',
+    0x221E8: 'zhǐ',
+    0x221EA: 'fàn',
+    0x221EB: 'fěng',
+    0x221F0: 'tán',
+    0x221F2: 'mí',
+    0x221F3: 'pí',
+    0x221F4: 'bù',
+    0x221F5: 'nà',
+    0x221F6: 'tián',
+    0x221F7: 'bá',
+    0x221F8: 'yì',
+    0x22202: 'yǎn',
+    0x22204: 'tiāo',
+    0x22206: 'yáo',
+    0x22207: 'shěn',
+    0x22208: 'kē,wā',
+    0x22209: 'tóng',
+    0x2220B: 'xuǎn',
+    0x22213: 'yòu',
+    0x22215: 'bài',
+    0x22219: 'xiá',
+    0x2221A: 'lǚ',
+    0x2221B: 'kùn',
+    0x2221C: 'zāng',
+    0x2221D: 'qiú',
+    0x22220: 'cù,là',
+    0x22221: 'zuī',
+    0x22222: 'lǒu',
+    0x22224: 'xiá',
+    0x2222F: 'shēn',
+    0x22232: 'pú',
+    0x22234: 'jīng',
+    0x22235: 'qiāng',
+    0x22236: 'yì,sī',
+    0x22238: 'niè',
+    0x22239: 'duī,tuí',
+    0x2223B: 'jié',
+    0x2223C: 'suì',
+    0x2223D: 'zhàn',
+    0x2223E: 'cōu',
+    0x22241: 'bēng',
+    0x22242: 'guān',
+    0x22243: 'shě',
+    0x22245: 'jìn',
+    0x22246: 'dì',
+    0x22251: 'dān',
+    0x22253: 'nǎi',
+    0x22255: 'nóu',
+    0x22257: 'jí',
+    0x22258: 'yán',
+    0x2225A: 'nòu',
+    0x2225C: 'dù,tú',
+    0x2225D: 'wèi',
+    0x2225E: 'piān',
+    0x22262: 'hú',
+    0x22264: 'jià',
+    0x22265: 'yè',
+    0x22266: 'jǔn',
+    0x22267: 'lán,lián',
+    0x22268: 'là',
+    0x22269: 'yīn',
+    0x2226D: 'tuí',
+    0x22275: 'nǎo',
+    0x2227A: 'zǔ',
+    0x2227F: 'mà',
+    0x22280: 'sī,mà',
+    0x22281: 'zhì',
+    0x22284: 'huī',
+    0x22285: 'zhuì',
+    0x22287: 'huì',
+    0x2228D: 'chú',
+    0x2228F: 'chè',
+    0x22292: 'xiū',
+    0x22293: 'lán',
+    0x22295: 'cōng',
+    0x22296: 'shèn',
+    0x22297: 'mò',
+    0x22298: 'yī',
+    0x22299: 'yáo',
+    0x2229A: 'xǐ',
+    0x2229B: 'zuǐ',
+    0x2229C: 'bìng',
+    0x222A7: 'yú',
+    0x222A9: 'lù',
+    0x222AE: 'tuí',
+    0x222AF: 'wěi',
+    0x222B1: 'fén',
+    0x222B2: 'shěn',
+    0x222BB: 'liáo',
+    0x222C2: 'shǔ',
+    0x222C3: 'dǎn',
+    0x222C4: 'juǎn',
+    0x222C5: 'yú',
+    0x222C6: 'xìn',
+    0x222C7: 'yáo',
+    0x222C8: 'sū',
+    0x222D2: 'huó',
+    0x222D4: 'qiān',
+    0x222DA: 'má',
+    0x222DD: 'kǎi',
+    0x222E1: 'lǔ',
+    0x222E3: 'yōu',
+    0x222EE: 'xiàn',
+    0x222F9: 'wú',
+    0x222FB: 'yǐn',
+    0x222FC: 'xī',
+    0x222FF: 'zhāi',
+    0x22300: 'xiè',
+    0x22304: 'qú',
+    0x22308: 'lí',
+    0x2230D: 'qiān',
+    0x22314: 'líng',
+    0x22315: 'luán',
+    0x2231A: 'chān',
+    0x22326: 'zhèng',
+    0x22328: 'yán',
+    0x22332: 'yìn',
+    0x22333: 'kuí',
+    0x22337: 'qū',
+    0x22339: 'fú',
+    0x2233B: 'yù',
+    0x22341: 'qí,bì',
+    0x22346: 'qì,qiè',
+    0x22347: 'jì',
+    0x22348: 'yuān,zàng',
+    0x2234E: 'gào',
+    0x2234F: 'juàn',
+    0x22351: 'qí',
+    0x22353: 'gǎi',
+    0x22355: 'quàn',
+    0x2235A: 'wèi',
+    0x22367: 'zhì',
+    0x2236B: 'jiǎn',
+    0x2236D: 'sì',
+    0x22370: 'yì,zé',
+    0x22371: 'qiān',
+    0x2237C: 'lì',
+    0x2237F: 'zāng',
+    0x22380: 'yì',
+    0x22382: 'cái',
+    0x22383: 'yì',
+    0x22384: 'gē',
+    0x22386: 'dié',
+    0x22388: 'zhī',
+    0x22389: 'yì',
+    0x2238B: 'zāi',
+    0x2238C: 'dài',
+    0x2238E: 'sù',
+    0x22394: 'jié',
+    0x22395: 'chèn',
+    0x22396: 'qú',
+    0x22398: 'hàn',
+    0x22399: 'xián',
+    0x223A0: 'quán,juàn',
+    0x223A1: 'jié',
+    0x223A5: 'juàn',
+    0x223AA: 'dàn',
+    0x223AD: 'jīn',
+    0x223B4: 'bīng',
+    0x223B5: 'hú',
+    0x223B9: 'jué',
+    0x223BB: 'yú',
+    0x223C3: 'lǐ',
+    0x223C4: 'qiáng',
+    0x223C5: 'shuǐ',
+    0x223C6: 'kū',
+    0x223C8: 'zhěn',
+    0x223CD: 'fú',
+    0x223CE: 'shēn',
+    0x223D2: 'chuí',
+    0x223D5: 'tóng',
+    0x223D7: 'yì',
+    0x223D9: 'yáng',
+    0x223DC: 'tuó',
+    0x223DD: 'zhōu',
+    0x223DE: 'jí',
+    0x223E4: 'xùn',
+    0x223E6: 'shěn',
+    0x223E7: 'xuān',
+    0x223ED: 'liú',
+    0x223EE: 'yuān',
+    0x223EF: 'hú,shǐ',
+    0x223F0: 'zhèng',
+    0x223F3: 'pēng,bēng',
+    0x223F7: 'jué',
+    0x22402: 'zhì',
+    0x22403: 'piān',
+    0x22404: 'yuàn',
+    0x22406: 'jiān',
+    0x2240A: 'páng',
+    0x2240E: 'zhuàn',
+    0x22410: 'xián',
+    0x22412: 'bēng',
+    0x22414: 'cōng',
+    0x22416: 'mò',
+    0x2241A: 'guó',
+    0x2241E: 'chéng',
+    0x2241F: 'qiāo',
+    0x22426: 'bì',
+    0x22429: 'qiǎng',
+    0x2242B: 'zhōu',
+    0x22432: 'fán',
+    0x22433: 'biē',
+    0x2243E: 'bó',
+    0x2243F: 'rǎng,rǒng',
+    0x22445: 'dǐng',
+    0x22446: 'quán',
+    0x22447: 'jiù',
+    0x22448: 'yáo',
+    0x22453: 'xiá',
+    0x22456: 'zǎo',
+    0x2245D: 'dān',
+    0x2245F: 'wǔ',
+    0x22460: 'tuó',
+    0x22462: 'hū',
+    0x22467: 'xī',
+    0x2246C: 'lái',
+    0x2246E: 'fēi',
+    0x22479: 'hú',
+    0x22486: 'xiān',
+    0x22489: 'shǎn',
+    0x2248D: 'fèi',
+    0x22490: 'cuò',
+    0x22492: 'fú',
+    0x22494: 'chù',
+    0x2249D: 'diū',
+    0x2249E: 'làn',
+    0x224A9: 'xǐ',
+    0x224AF: 'biāo',
+    0x224B0: 'yù',
+    0x224B1: 'suì',
+    0x224B2: 'xǐ',
+    0x224B7: 'póu',
+    0x224B9: 'shǎn',
+    0x224BE: 'jiào',
+    0x224C0: 'yì',
+    0x224C3: 'wán',
+    0x224C4: 'jǐ',
+    0x224C6: 'wán',
+    0x224C7: 'tuì,nà',
+    0x224CB: 'àng',
+    0x224CD: 'tiān',
+    0x224CE: 'chí',
+    0x224D2: 'rán',
+    0x224D4: 'sà',
+    0x224D5: 'yín',
+    0x224D6: 'pī',
+    0x224D7: 'cǐ',
+    0x224D8: 'tóng,tāo',
+    0x224D9: 'yǐn',
+    0x224DC: 'gé',
+    0x224DD: 'tiāo',
+    0x224DE: 'zhēng',
+    0x224DF: 'zhòu',
+    0x224E1: 'yí,tí',
+    0x224E2: 'kuà',
+    0x224E3: 'sōng',
+    0x224E7: 'dì',
+    0x224EC: 'xié',
+    0x224EE: 'xiāo',
+    0x224EF: 'guàng,wǎng',
+    0x224F0: 'tuǒ',
+    0x224F1: 'fēng,fèng',
+    0x224F2: 'wú,hú',
+    0x224F5: 'xiù',
+    0x224FF: 'yóu',
+    0x22501: 'líng',
+    0x22502: 'yàn',
+    0x22505: 'dōng',
+    0x22506: 'qì',
+    0x22507: 'táo',
+    0x22508: 'hán',
+    0x2250A: 'chí',
+    0x2250B: 'sōng',
+    0x22511: 'quǎn',
+    0x22514: 'hàn,jí',
+    0x2251F: 'rǒu,niǔ',
+    0x22520: 'qì',
+    0x22521: 'kāi',
+    0x22522: 'yú',
+    0x22523: 'chā,shà',
+    0x22524: 'chèng',
+    0x22525: 'yù',
+    0x22527: 'bìng',
+    0x22529: 'cōng,sǒng',
+    0x2252A: 'zhū',
+    0x2252C: 'yù',
+    0x22531: 'jué,què',
+    0x22532: 'liù',
+    0x22533: 'sāo',
+    0x22534: 'yù',
+    0x22545: 'shuài',
+    0x2254B: 'yuàn',
+    0x2254E: 'zhāng',
+    0x22551: 'shuài',
+    0x22553: 'chǔ',
+    0x22554: 'zhāng,zhàng',
+    0x22555: 'sǎn,sàn',
+    0x22556: 'xiān',
+    0x22558: 'cuī',
+    0x22559: 'měng',
+    0x2255A: 'dí',
+    0x2255E: 'zhì',
+    0x2255F: 'ào',
+    0x22566: 'xiū',
+    0x22568: 'pián',
+    0x2256A: 'jiào',
+    0x2256B: 'kuǎn',
+    0x2256C: 'sà',
+    0x2256D: 'xiàn',
+    0x2256E: 'zhà',
+    0x2256F: 'diàn',
+    0x22577: 'yí',
+    0x2257A: 'huì',
+    0x2257B: 'shàn',
+    0x22584: 'chóng',
+    0x22585: 'yí',
+    0x22586: 'xiè',
+    0x22587: 'zhì',
+    0x22588: 'tiào',
+    0x2258A: 'pīng',
+    0x2258B: 'xián',
+    0x2258E: 'xiān',
+    0x2258F: 'sù',
+    0x22591: 'cuán',
+    0x22597: 'sǒng',
+    0x2259B: 'hēi',
+    0x2259D: 'xiàn',
+    0x2259F: 'yóu',
+    0x225A1: 'yù',
+    0x225A4: 'tái',
+    0x225A6: 'jué',
+    0x225A7: 'nàng',
+    0x225A9: 'diān',
+    0x225AB: 'yì',
+    0x225AC: 'bì',
+    0x225B3: 'xū',
+    0x225B4: 'yì',
+    0x225B5: 'rù',
+    0x225B7: 'gōng',
+    0x225BA: 'yì',
+    0x225BF: 'zhì',
+    0x225C0: 'xīn',
+    0x225C2: 'jì',
+    0x225C4: 'xià',
+    0x225C8: 'zhāo',
+    0x225C9: 'nè',
+    0x225CA: 'xiè,jiá',
+    0x225CE: 'yì',
+    0x225EB: 'fǔ',
+    0x225ED: 'shè',
+    0x225EF: 'yuán',
+    0x225F0: 'fǎn',
+    0x225F2: 'fū',
+    0x225F3: 'wù',
+    0x225F4: 'xī',
+    0x225F5: 'hǒng',
+    0x225F9: 'jì',
+    0x225FA: 'chàng',
+    0x225FF: 'mò',
+    0x22600: 'pèi',
+    0x22603: 'mú,wǔ',
+    0x22604: 'qiú',
+    0x22605: 'mào,róu',
+    0x22607: 'dá,dàn',
+    0x22609: 'xiá',
+    0x2260A: 'shēn',
+    0x2260B: 'tè',
+    0x2260C: 'hóng',
+    0x2260D: 'bì,fú',
+    0x2261D: 'nǐ',
+    0x2261F: 'qiáo',
+    0x22627: 'ruǎn',
+    0x22638: 'jiàng',
+    0x22639: 'chā',
+    0x2263A: 'mǐ,mí',
+    0x2263D: 'yì',
+    0x2263F: 'suō',
+    0x22641: 'wù',
+    0x22642: 'xuān',
+    0x22645: 'xí',
+    0x22647: 'yǐ',
+    0x22650: 'náo',
+    0x22653: 'wèi',
+    0x2266E: 'kàn',
+    0x22671: 'lòng',
+    0x22672: 'lǚ',
+    0x22673: 'zhuǎng',
+    0x2267A: 'zhì',
+    0x2267C: 'xìng',
+    0x2267E: 'gěng',
+    0x2267F: 'jìn',
+    0x22680: 'xiàn',
+    0x22681: 'jì',
+    0x22682: 'cuò',
+    0x22684: 'láo',
+    0x22685: 'fěn',
+    0x22686: 'jù',
+    0x2268B: 'miào',
+    0x2268C: 'xiá',
+    0x22691: 'sù',
+    0x226A8: 'zhì',
+    0x226AA: 'hù',
+    0x226AB: 'kòu',
+    0x226AD: 'suǒ',
+    0x226AE: 'nì',
+    0x226BA: 'tēng',
+    0x226BB: 'zhù',
+    0x226C1: 'dá,chè',
+    0x226C3: 'qiú',
+    0x226C4: 'yà',
+    0x226C6: 'xián',
+    0x226C9: 'nèi',
+    0x226CD: 'zhǐ',
+    0x226CE: 'bié',
+    0x226D2: 'chǒng',
+    0x226D3: 'lán',
+    0x226D4: 'dōng',
+    0x226D5: 'qūn',
+    0x226D6: 'xiàng',
+    0x226D8: 'xiáo',
+    0x226D9: 'wǎn',
+    0x226DA: 'rù',
+    0x226DB: 'wàng',
+    0x226DC: 'nì',
+    0x226DE: 'bāi',
+    0x226DF: 'yà',
+    0x226E5: 'sī',
+    0x226E6: 'yǐn',
+    0x226E8: 'yù',
+    0x226EE: 'lí',
+    0x226EF: 'huò',
+    0x22717: 'bàng',
+    0x22723: 'xī',
+    0x22725: 'jiū',
+    0x22728: 'xiè,dié',
+    0x22729: 'qiān',
+    0x2272A: 'nuò,ruò',
+    0x2272B: 'xǐng',
+    0x2272C: 'duó',
+    0x2272D: 'jǐ',
+    0x2272E: 'wǔ',
+    0x2272F: 'mú,móu,mǔ',
+    0x22730: 'yàn,yǎn',
+    0x22731: 'qì',
+    0x22732: 'ná',
+    0x22733: 'chì',
+    0x22734: 'hóu',
+    0x22736: 'sào',
+    0x22738: 'náo',
+    0x2273B: 'chěng',
+    0x2273C: 'chěng',
+    0x2273D: 'kuí,kuǐ',
+    0x2273F: 'jià',
+    0x22740: 'tú',
+    0x22741: 'hōng',
+    0x22742: 'dú',
+    0x22745: 'xiá',
+    0x22746: 'zhòng',
+    0x22747: 'huò',
+    0x22748: 'chóng',
+    0x22749: 'dá',
+    0x2274C: 'mào',
+    0x2274D: 'yào',
+    0x22753: 'juān',
+    0x2276C: 'shì',
+    0x2276F: 'yín',
+    0x22773: 'gǔ',
+    0x22774: 'wù',
+    0x22778: 'guò',
+    0x22779: 'tì',
+    0x2277B: 'hōng',
+    0x22787: 'rě',
+    0x22789: 'yí',
+    0x2278B: 'tǔn',
+    0x2278F: 'qióng',
+    0x22790: 'hài',
+    0x22792: 'qì',
+    0x22795: 'huò',
+    0x22796: 'tì',
+    0x22797: 'pī,bī',
+    0x2279A: 'gěng',
+    0x2279C: 'xiè',
+    0x2279E: 'mì,mí',
+    0x2279F: 'gào',
+    0x227A0: 'tā',
+    0x227A1: 'xiǎng',
+    0x227A3: 'shū',
+    0x227A6: 'fú',
+    0x227AC: 'zhuān',
+    0x227AD: 'liù',
+    0x227C5: 'yóu',
+    0x227CA: 'chěng',
+    0x227CB: 'duī',
+    0x227E2: 'lí',
+    0x227E3: 'yàng',
+    0x227E4: 'lí',
+    0x227E7: 'lǔ',
+    0x227E8: 'mǔ',
+    0x227E9: 'suì',
+    0x227EA: 'ài,xì',
+    0x227ED: 'kòu',
+    0x227EF: 'zhé,shì',
+    0x227F0: 'ài',
+    0x227F1: 'téng',
+    0x227F3: 'lǜ',
+    0x227F4: 'tuí',
+    0x227F5: 'bī',
+    0x227FE: 'huì',
+    0x227FF: 'huán',
+    0x2281B: 'kuò',
+    0x2281D: 'xīn',
+    0x22821: 'sào',
+    0x2282B: 'shù',
+    0x2282C: 'què',
+    0x2282D: 'bā',
+    0x2282E: 'tuì',
+    0x22832: 'fù',
+    0x22833: 'biē',
+    0x22835: 'tǎng',
+    0x22837: 'xiàng',
+    0x22839: 'sī,xī',
+    0x2283A: 'bó',
+    0x2283C: 'mái',
+    0x2283D: 'dàng',
+    0x2283F: 'guì',
+    0x22840: 'hēi',
+    0x22841: 'xī',
+    0x22842: 'dàng',
+    0x22843: 'yì',
+    0x22845: 'bī',
+    0x22847: 'gū',
+    0x22848: 'cuì',
+    0x22849: 'sè',
+    0x2284D: 'gé',
+    0x2284E: 'yù',
+    0x2284F: 'nǎ',
+    0x22851: 'lì',
+    0x22852: 'zhì',
+    0x22870: 'zhào',
+    0x22874: 'jī',
+    0x22875: 'ruǎn',
+    0x22879: 'chòng',
+    0x22882: 'jié',
+    0x2288C: 'chàng',
+    0x2288D: 'zhé',
+    0x22892: 'sū,sù',
+    0x22893: 'yōng',
+    0x22896: 'qì',
+    0x22897: 'zhuó',
+    0x2289A: 'kài',
+    0x2289C: 'yè',
+    0x2289E: 'qì,jì,kuài',
+    0x228B9: 'xiòng',
+    0x228C9: 'yī',
+    0x228CA: 'chǒu',
+    0x228CE: 'tuǎn',
+    0x228CF: 'ài',
+    0x228D0: 'pīn',
+    0x228D3: 'liè',
+    0x228D4: 'mián',
+    0x228D5: 'ài,chī',
+    0x228D7: 'mǒ',
+    0x228D8: 'wèi',
+    0x228D9: 'yìng',
+    0x228DA: 'nǐ',
+    0x228DE: 'bó',
+    0x228E0: 'liù',
+    0x228F3: 'ruì',
+    0x228F5: 'chú',
+    0x228FB: 'lǘ',
+    0x228FC: 'chá',
+    0x228FF: 'chù',
+    0x22901: 'sào',
+    0x22902: 'lí',
+    0x22904: 'sōng',
+    0x22906: 'lì,là',
+    0x2290B: 'xì',
+    0x2290D: 'yān',
+    0x2290E: 'cuō,zuǒ',
+    0x22910: 'liú',
+    0x22918: 'méng',
+    0x2291A: 'zhàn',
+    0x22924: 'zhuàng',
+    0x22927: 'miǎo',
+    0x22929: 'lì',
+    0x2292B: 'jǔ',
+    0x2292F: 'xiè',
+    0x22930: 'xiè',
+    0x22931: 'lǒng',
+    0x22932: 'lóng',
+    0x22942: 'téng',
+    0x22943: 'zhù',
+    0x2294B: 'chán',
+    0x2294C: 'xiǎn',
+    0x2294F: 'yíng',
+    0x22950: 'pèi',
+    0x22958: 'xié',
+    0x2295A: 'jiào',
+    0x2295E: 'chōng',
+    0x22973: 'hē',
+    0x2297D: 'tǔn',
+    0x22985: 'hǒng,zhuàng',
+    0x22988: 'mán',
+    0x2298A: 'jīn',
+    0x2298C: 'qú',
+    0x2298D: 'dǒu',
+    0x2298E: 'qiú',
+    0x2298F: 'zāi',
+    0x22991: 'shēng',
+    0x22992: 'zāi',
+    0x22995: 'yǐ,zhí',
+    0x2299A: 'huà',
+    0x2299F: 'kān',
+    0x229B0: 'yuè',
+    0x229B1: 'nì',
+    0x229B2: 'sī',
+    0x229B4: 'wǒ',
+    0x229B8: 'cán',
+    0x229BA: 'jiān',
+    0x229BC: 'miè',
+    0x229BD: 'sháo,qī',
+    0x229BF: 'rǒng',
+    0x229C0: 'gān',
+    0x229C5: 'qiáng',
+    0x229C7: 'shú',
+    0x229C8: 'zhuó',
+    0x229CF: 'shī',
+    0x229D1: 'tì',
+    0x229D6: 'zhá',
+    0x229D7: 'zhān',
+    0x229DD: 'fèn',
+    0x229DE: 'miè',
+    0x229E0: 'zè',
+    0x229E4: 'zhì',
+    0x229E5: 'qiān',
+    0x229E6: 'hàn',
+    0x229E7: 'gé',
+    0x229EE: 'cán',
+    0x229F0: 'guó',
+    0x229F1: 'jiāo',
+    0x229F3: 'yōng',
+    0x229F4: 'áo',
+    0x229FB: 'zhá',
+    0x229FD: 'xì',
+    0x22A01: 'xū',
+    0x22A02: 'wǔ',
+    0x22A0F: 'jué',
+    0x22A10: 'jí,jī',
+    0x22A12: 'chì',
+    0x22A14: 'wǎn',
+    0x22A16: 'miè',
+    0x22A17: 'zéi',
+    0x22A1C: 'jié',
+    0x22A1D: 'shí',
+    0x22A1F: 'xī,xì',
+    0x22A21: 'è',
+    0x22A25: 'hù',
+    0x22A26: 'hù',
+    0x22A28: 'lì',
+    0x22A2B: 'chù',
+    0x22A2E: 'yī',
+    0x22A2F: 'mǎo',
+    0x22A30: 'xū',
+    0x22A31: 'zhōng',
+    0x22A33: 'yì',
+    0x22A3A: 'liáo',
+    0x22A3F: 'jiān',
+    0x22A40: 'jiǎn',
+    0x22A41: 'jú',
+    0x22A44: 'zhù',
+    0x22A48: 'wǔ',
+    0x22A4F: 'kè',
+    0x22A50: 'kě',
+    0x22A51: 'lì',
+    0x22A52: 'bǐ',
+    0x22A53: 'gé',
+    0x22A55: 'xū',
+    0x22A56: 'shā',
+    0x22A57: 'líng',
+    0x22A58: 'kē',
+    0x22A5E: 'bó',
+    0x22A5F: 'biān',
+    0x22A60: 'shuān',
+    0x22A61: 'qí',
+    0x22A62: 'shàn',
+    0x22A66: 'jī',
+    0x22A68: 'qiǎo,xiǔ',
+    0x22A6E: 'yì',
+    0x22A6F: 'jué',
+    0x22A70: 'zhǎng',
+    0x22A72: 'xìn',
+    0x22A77: 'tuō',
+    0x22A78: 'hài',
+    0x22A79: 'xià',
+    0x22A7B: 'tuó',
+    0x22A7C: 'yí',
+    0x22A83: 'cù',
+    0x22A87: 'jiāng',
+    0x22A88: 'nán',
+    0x22A8B: 'pěng,féng,bàng',
+    0x22A8D: 'jié,jiā',
+    0x22A8E: 'xuē',
+    0x22A8F: 'hú,gǔ',
+    0x22AA5: 'yǒu',
+    0x22AA6: 'nǔ',
+    0x22AA7: 'yè',
+    0x22AAA: 'yìn',
+    0x22AAC: 'kǒng',
+    0x22AB6: 'xiāo',
+    0x22AB7: 'xiāng',
+    0x22ABC: 'náo',
+    0x22ABE: 'zhàng',
+    0x22AD0: 'jié',
+    0x22AD3: 'nǔ',
+    0x22AD4: 'shàn,quán',
+    0x22AE2: 'jiá',
+    0x22AE7: 'zhǒu',
+    0x22AE8: 'rǒng,rēng',
+    0x22AEB: 'lù',
+    0x22AEC: 'sà,cuō,shā',
+    0x22AED: 'nù',
+    0x22AEF: 'bó',
+    0x22AF0: 'zhé',
+    0x22AF2: 'qǐn',
+    0x22AF4: 'cī',
+    0x22AF5: 'zú',
+    0x22AF7: 'wǒ',
+    0x22AF8: 'wǔ,wū',
+    0x22AFB: 'nié',
+    0x22AFF: 'xiān',
+    0x22B00: 'hóng',
+    0x22B2B: 'tìng',
+    0x22B2C: 'jǐn',
+    0x22B31: 'jié',
+    0x22B32: 'hè',
+    0x22B33: 'tū',
+    0x22B34: 'zhé,niè,dié',
+    0x22B35: 'pīn,pān,biàn,fān',
+    0x22B36: 'jìn',
+    0x22B37: 'nàn',
+    0x22B3C: 'dùn',
+    0x22B3E: 'xī',
+    0x22B3F: 'xiè',
+    0x22B41: 'xì',
+    0x22B42: 'láo',
+    0x22B43: 'duǎn,dòu',
+    0x22B44: 'jì',
+    0x22B45: 'chā',
+    0x22B46: 'chōu',
+    0x22B48: 'gāng',
+    0x22B4E: 'xiáng',
+    0x22B4F: 'dǎo',
+    0x22B65: 'biàn',
+    0x22B66: 'xiāo',
+    0x22B67: 'xīn',
+    0x22B81: 'yǔ',
+    0x22B82: 'xián',
+    0x22B83: 'lí',
+    0x22B84: 'qiǎn',
+    0x22B87: 'měi',
+    0x22B89: 'qiāo',
+    0x22B8A: 'yà',
+    0x22B8C: 'qiā,jié',
+    0x22B8D: 'qiòng',
+    0x22B8F: 'bàng',
+    0x22B90: 'zhēng',
+    0x22B9A: 'zè',
+    0x22B9B: 'shuàn,tuán',
+    0x22B9E: 'sào',
+    0x22BC5: 'lù,jué',
+    0x22BC9: 'xié',
+    0x22BCB: 'fǔ',
+    0x22BCC: 'zhài',
+    0x22BE9: 'zè',
+    0x22BEB: 'duàn,wǎn',
+    0x22BED: 'dèng',
+    0x22BEE: 'yù',
+    0x22BF0: 'lǜ',
+    0x22BF2: 'wàn',
+    0x22BF3: 'xué',
+    0x22BF4: 'jiǎo',
+    0x22BF5: 'yuě',
+    0x22BF6: 'zhì',
+    0x22BF7: 'wěi,huī',
+    0x22BF9: 'gé',
+    0x22BFA: 'jǔ',
+    0x22BFC: 'yǎn',
+    0x22BFD: 'cuò',
+    0x22BFE: 'mào',
+    0x22C06: 'fú',
+    0x22C07: 'āi',
+    0x22C0A: 'xuān',
+    0x22C0C: 'gāng',
+    0x22C0D: 'ān',
+    0x22C12: 'jí',
+    0x22C18: 'pí',
+    0x22C19: 'zhǐ',
+    0x22C1C: 'nuó',
+    0x22C3F: 'pàn',
+    0x22C41: 'yí',
+    0x22C44: 'jié',
+    0x22C46: 'zī',
+    0x22C48: 'jià',
+    0x22C49: 'wǎi',
+    0x22C4C: 'jià',
+    0x22C5F: 'chǎn,chī',
+    0x22C61: 'suǒ',
+    0x22C62: 'suǒ,sè',
+    0x22C63: 'jí',
+    0x22C64: 'sǒng',
+    0x22C66: 'tī',
+    0x22C67: 'pī',
+    0x22C68: 'pó',
+    0x22C6E: 'mì',
+    0x22C74: 'yè',
+    0x22C76: 'qìn',
+    0x22C77: 'jìn',
+    0x22C7A: 'juē',
+    0x22C7D: 'yuān',
+    0x22C7E: 'ruán',
+    0x22C94: 'bàn,bān,pān',
+    0x22CB0: 'bīn',
+    0x22CB4: 'wèi',
+    0x22CB5: 'zào',
+    0x22CB6: 'qiè',
+    0x22CB7: 'sōu',
+    0x22CB8: 'lǔ',
+    0x22CBC: 'dié',
+    0x22CBD: 'chuāi',
+    0x22CBE: 'bì',
+    0x22CBF: 'zhú',
+    0x22CC0: 'mā,mó',
+    0x22CC1: 'fèi',
+    0x22CC2: 'piē',
+    0x22CC3: 'yìn',
+    0x22CC4: 'xuàn,xuán',
+    0x22CC6: 'ào,áo',
+    0x22CC7: 'zhuó,zú',
+    0x22CC8: 'zú',
+    0x22CCB: 'bǐ',
+    0x22CD1: 'làng',
+    0x22CD3: 'tì',
+    0x22CD9: 'tiǎo',
+    0x22CDA: 'jiān',
+    0x22CDF: 'tǒng',
+    0x22CFD: 'duō',
+    0x22CFE: 'dòng',
+    0x22D02: 'biǎn',
+    0x22D20: 'zhì',
+    0x22D22: 'fén',
+    0x22D26: 'káng',
+    0x22D27: 'zhì',
+    0x22D28: 'zhāi,zhì,chì',
+    0x22D29: 'bì',
+    0x22D2A: 'kuǎn',
+    0x22D2C: 'bàn',
+    0x22D2D: 'juē',
+    0x22D2E: 'qū',
+    0x22D30: 'qī',
+    0x22D31: 'léi',
+    0x22D32: 'xié,jié',
+    0x22D33: 'tāng',
+    0x22D3C: 'sōu',
+    0x22D3E: 'bèi',
+    0x22D47: 'yàng',
+    0x22D48: 'jiǎn,zhǎn',
+    0x22D65: 'zào',
+    0x22D80: 'zhuài,chuái',
+    0x22D83: 'fán',
+    0x22D85: 'shé',
+    0x22D87: 'qióng',
+    0x22D89: 'pò',
+    0x22D8B: 'tiě',
+    0x22D8C: 'shā',
+    0x22D8D: 'zá,sà',
+    0x22D91: 'niǎo',
+    0x22D92: 'guài',
+    0x22D93: 'cuǐ',
+    0x22DA1: 'qiào,jiǎo',
+    0x22DA3: 'dié',
+    0x22DB3: 'pīn',
+    0x22DB4: 'cí',
+    0x22DB6: 'bàng',
+    0x22DCD: 'yìn',
+    0x22DD1: 'xiǎn',
+    0x22DD4: 'yǐ',
+    0x22DD5: 'miǎo',
+    0x22DD6: 'duǎn',
+    0x22DD7: 'zhòu',
+    0x22DD9: 'kōng',
+    0x22DE2: 'zhāng',
+    0x22DF6: 'liú',
+    0x22DF8: 'zhǐ',
+    0x22DF9: 'chǎn',
+    0x22DFA: 'dú',
+    0x22DFB: 'yuán',
+    0x22DFE: 'suò,cè',
+    0x22DFF: 'jié',
+    0x22E00: 'lì',
+    0x22E01: 'gǒng',
+    0x22E0C: 'bāng',
+    0x22E17: 'guó',
+    0x22E18: 'liáo',
+    0x22E19: 'shěn',
+    0x22E23: 'niǎo',
+    0x22E25: 'cuàn',
+    0x22E26: 'wěi',
+    0x22E28: 'tuō',
+    0x22E2B: 'sū',
+    0x22E2D: 'lóng',
+    0x22E33: 'xiāo',
+    0x22E34: 'yǎn,yán',
+    0x22E43: 'qǐng',
+    0x22E4D: 'xī',
+    0x22E4F: 'yú',
+    0x22E51: 'zhèng,zhēng',
+    0x22E52: 'xiè',
+    0x22E53: 'chāi',
+    0x22E54: 'fèn',
+    0x22E56: 'guó',
+    0x22E58: 'jǐng',
+    0x22E59: 'làn',
+    0x22E5A: 'xiān',
+    0x22E5D: 'líng',
+    0x22E6E: 'lěi',
+    0x22E72: 'jùn',
+    0x22E73: 'xiào',
+    0x22E7C: 'zá',
+    0x22E84: 'guān',
+    0x22E85: 'qiè',
+    0x22E86: 'luò',
+    0x22E87: 'yào',
+    0x22E88: 'luán',
+    0x22E89: 'tà',
+    0x22E91: 'luò',
+    0x22E9E: 'bǎ',
+    0x22E9F: 'chàn',
+    0x22EA1: 'zhuó',
+    0x22EAB: 'tiǎo',
+    0x22EAF: 'wān',
+    0x22EB0: 'líng,lìng',
+    0x22EB4: 'yù',
+    0x22EB5: 'qì,qǐ',
+    0x22EB7: 'qí',
+    0x22EBC: 'jì',
+    0x22EBD: 'bó,jiào',
+    0x22EBF: 'shī',
+    0x22EC0: 'fǔ',
+    0x22EC2: 'guī',
+    0x22EC5: 'diǎn',
+    0x22EC7: 'hāo',
+    0x22EC9: 'gǎi',
+    0x22ECB: 'qí',
+    0x22ED3: 'chéng',
+    0x22ED4: 'huì',
+    0x22ED7: 'xiá,guī',
+    0x22ED8: 'shí',
+    0x22ED9: 'zhì',
+    0x22EDA: 'qí',
+    0x22EDC: 'hài',
+    0x22EDF: 'jiǎo',
+    0x22EE0: 'lì',
+    0x22EE2: 'liǎo',
+    0x22EE4: 'qiāo,qiáo',
+    0x22EE8: 'sà',
+    0x22EEA: 'qī',
+    0x22EEB: 'shī',
+    0x22EEE: 'jié,fú',
+    0x22EF5: 'bèi,lù',
+    0x22EF6: 'biān',
+    0x22EF7: 'bā',
+    0x22EF8: 'jūn',
+    0x22EF9: 'pī',
+    0x22EFC: 'dǎn',
+    0x22EFF: 'táng',
+    0x22F00: 'kuǐ',
+    0x22F01: 'kū',
+    0x22F03: 'kǒu',
+    0x22F09: 'shī',
+    0x22F0A: 'shī,tuó',
+    0x22F0B: 'jī',
+    0x22F0C: 'bào',
+    0x22F10: 'kě',
+    0x22F11: 'kuāng',
+    0x22F16: 'mǐn',
+    0x22F19: 'liáo',
+    0x22F1A: 'è',
+    0x22F1B: 'gé,guó,è',
+    0x22F1F: 'wǎng',
+    0x22F20: 'duó',
+    0x22F23: 'qià',
+    0x22F24: 'huá',
+    0x22F26: 'hǒng',
+    0x22F29: 'pēng',
+    0x22F2B: 'jiào',
+    0x22F30: 'qū',
+    0x22F31: 'zì',
+    0x22F32: 'zhòu',
+    0x22F33: 'kuāng',
+    0x22F35: 'shā',
+    0x22F37: 'jì',
+    0x22F38: 'wēi,wéi',
+    0x22F39: 'pū,bǔ',
+    0x22F3A: 'xué',
+    0x22F3C: 'shāo',
+    0x22F42: 'láng',
+    0x22F43: 'zhǐ',
+    0x22F44: 'tǐng',
+    0x22F47: 'dà',
+    0x22F55: 'yáng',
+    0x22F56: 'jìn',
+    0x22F57: 'zhǐ',
+    0x22F5A: 'zhuó,dū',
+    0x22F5C: 'zá',
+    0x22F5D: 'chán',
+    0x22F62: 'mào',
+    0x22F66: 'kōng',
+    0x22F67: 'zhōu',
+    0x22F68: 'hū',
+    0x22F69: 'pēng',
+    0x22F6D: 'jiù',
+    0x22F78: 'chuò',
+    0x22F79: 'mǐn',
+    0x22F7E: 'xiào',
+    0x22F80: 'dǔ',
+    0x22F81: 'wéi',
+    0x22F83: 'cán',
+    0x22F84: 'yú',
+    0x22F85: 'dù',
+    0x22F86: 'kāi',
+    0x22F87: 'pì',
+    0x22F8A: 'chéng',
+    0x22F8E: 'chǔn',
+    0x22F90: 'shǎo',
+    0x22F91: 'yǎn',
+    0x22F92: 'kuài',
+    0x22F94: 'yuē',
+    0x22FA6: 'qí',
+    0x22FA7: 'zhēng',
+    0x22FA9: 'kè',
+    0x22FAA: 'qí',
+    0x22FAB: 'zhǐ',
+    0x22FAC: 'lù',
+    0x22FB1: 'pī',
+    0x22FB2: 'nuò',
+    0x22FB3: 'pǎo',
+    0x22FBA: 'fěi',
+    0x22FBF: 'wén',
+    0x22FC2: 'méng',
+    0x22FC8: 'shǎn',
+    0x22FCC: 'xiòng,xuàn',
+    0x22FCE: 'duò',
+    0x22FCF: 'biào,pāo',
+    0x22FDA: 'yōu',
+    0x22FDC: 'màn',
+    0x22FDE: 'liǎo',
+    0x22FE1: 'xié',
+    0x22FE2: 'luàn',
+    0x22FE3: 'qiāo',
+    0x22FE4: 'dèng',
+    0x22FE6: 'chéng',
+    0x22FE7: 'chéng',
+    0x22FED: 'chuò',
+    0x22FF8: 'cè',
+    0x23000: 'léi',
+    0x23001: 'zhǎn',
+    0x23002: 'lǐ',
+    0x23003: 'lián',
+    0x23004: 'qún',
+    0x2300D: 'chén',
+    0x2300F: 'chéng',
+    0x23010: 'gū',
+    0x23012: 'zòng',
+    0x23013: 'chóu,dǎo',
+    0x23014: 'chuàn,chuò',
+    0x2301C: 'lèi',
+    0x2301D: 'shuò',
+    0x2301E: 'lǜ',
+    0x23023: 'fú',
+    0x23025: 'lì',
+    0x23027: 'sàn',
+    0x2302B: 'sān',
+    0x2302F: 'sà',
+    0x23033: 'niè',
+    0x23036: 'zuān',
+    0x23037: 'lǐ,lí',
+    0x2303B: 'shǔ,zhǔ',
+    0x2303E: 'fú',
+    0x23049: 'bì',
+    0x2304D: 'dào',
+    0x23052: 'shī',
+    0x23056: 'gàn',
+    0x23057: 'tàn',
+    0x2305C: 'màn',
+    0x2305F: 'lí',
+    0x23062: 'bì',
+    0x23066: 'pán',
+    0x23068: 'yōu',
+    0x2306D: 'jiū',
+    0x2306F: 'guō',
+    0x23070: 'liáo',
+    0x23073: 'wò',
+    0x23074: 'qià',
+    0x23075: 'dǒu',
+    0x23077: 'liè',
+    0x23079: 'jiǎo',
+    0x2307B: 'liè,luō',
+    0x23081: 'tiāo,qiāo',
+    0x23084: 'guō',
+    0x23086: 'pāng',
+    0x23087: 'qiāo',
+    0x23089: 'dí',
+    0x2308A: 'yùn',
+    0x23092: 'lè',
+    0x23096: 'sī',
+    0x23097: 'xīn',
+    0x2309C: 'xīn',
+    0x2309D: 'xiàng',
+    0x2309E: 'luǒ',
+    0x230A4: 'bēng',
+    0x230A5: 'tiāo,qiāo',
+    0x230AC: 'xiào',
+    0x230AE: 'dōu,tóu',
+    0x230B3: 'dàng',
+    0x230B4: 'tíng',
+    0x230B5: 'zhuàn',
+    0x230BB: 'ōu,kōu',
+    0x230BD: 'wò',
+    0x230C4: 'xīn',
+    0x230C5: 'ruǎn',
+    0x230C8: 'zhuó',
+    0x230C9: 'dàng',
+    0x230CD: 'cuì,chà',
+    0x230D1: 'zhuó',
+    0x230D7: 'cóng',
+    0x230D8: 'chǎn,chuáng',
+    0x230DD: 'yǎng',
+    0x230E7: 'yǎn',
+    0x230F3: 'yǎn,yè',
+    0x230F5: 'zhèn,shēn',
+    0x230FD: 'nuǒ',
+    0x230FE: 'yàn',
+    0x23105: 'fǎng',
+    0x23109: 'yǎn',
+    0x2310A: 'yú',
+    0x2310D: 'tí',
+    0x2310E: 'fù',
+    0x2310F: 'běn',
+    0x23111: 'yǎn',
+    0x23113: 'huī',
+    0x23119: 'huǎng',
+    0x2311C: 'guì',
+    0x2311D: 'yàn',
+    0x2311F: 'hú',
+    0x23120: 'biāo',
+    0x23127: 'suì,wéi',
+    0x2312E: 'zì',
+    0x2312F: 'jì',
+    0x23130: 'ě',
+    0x23131: 'jì',
+    0x23132: 'kuǐ',
+    0x23134: 'liàng',
+    0x23138: 'huò',
+    0x2313A: 'wéi',
+    0x2313B: 'zhuō',
+    0x2313F: 'tǐng',
+    0x23143: 'zǎi',
+    0x23144: 'yòu',
+    0x23149: 'rèn',
+    0x2314D: 'miàn,bīng',
+    0x2315A: 'nà,niǔ',
+    0x2315D: 'tū',
+    0x2315F: 'dān',
+    0x23161: 'jué',
+    0x23164: 'xū',
+    0x23165: 'dī',
+    0x23170: 'xiàng',
+    0x23177: 'xiòng',
+    0x2317A: 'yǒu',
+    0x2317B: 'guǎ,jiōng',
+    0x2317E: 'xī',
+    0x23188: 'hè',
+    0x2318D: 'dǐng',
+    0x23190: 'lú',
+    0x23192: 'xú',
+    0x23194: 'zhòu',
+    0x23195: 'xiàn',
+    0x23196: 'huāng',
+    0x23197: 'chā',
+    0x23198: 'shǐ',
+    0x23199: 'gàn',
+    0x2319A: 'nuǒ,chǐ',
+    0x2319B: 'àn,wǎn',
+    0x2319F: 'xiē,jiē',
+    0x231A7: 'hào',
+    0x231B2: 'qīn',
+    0x231B3: 'gěng',
+    0x231B4: 'shān',
+    0x231B5: 'fú',
+    0x231BD: 'zè',
+    0x231C7: 'dàn',
+    0x231D6: 'diǎn',
+    0x231D7: 'shēn',
+    0x231D9: 'zǔ',
+    0x231E2: 'biē',
+    0x231E6: 'chuí',
+    0x231E7: 'zhè',
+    0x231E8: 'dài',
+    0x231EB: 'wǒ',
+    0x231EC: 'qióng',
+    0x231F0: 'lín',
+    0x231F2: 'hūn',
+    0x231F3: 'jī',
+    0x23205: 'cáo',
+    0x2320A: 'mù',
+    0x2320D: 'dié',
+    0x2320E: 'wèi',
+    0x23220: 'biàn',
+    0x23221: 'tǐ',
+    0x23225: 'tú',
+    0x23236: 'gèng',
+    0x23244: 'chí',
+    0x23245: 'còu',
+    0x23246: 'tǐ',
+    0x23252: 'huò',
+    0x23253: 'qī',
+    0x23254: 'sāo',
+    0x23255: 'sàng',
+    0x23256: 'xuǎn',
+    0x23257: 'àng',
+    0x23258: 'nài',
+    0x2325A: 'yáng',
+    0x2325B: 'shū',
+    0x2325C: 'shā',
+    0x23261: 'tǐng',
+    0x23269: 'yà',
+    0x2326A: 'huǎng',
+    0x2326E: 'bīn',
+    0x2327E: 'òu',
+    0x2327F: 'cáo',
+    0x23281: 'áo',
+    0x23283: 'mào',
+    0x23294: 'méng',
+    0x23296: 'tiān',
+    0x2329D: 'sàng',
+    0x2329E: 'xù',
+    0x2329F: 'kàn',
+    0x232A7: 'lǎng,zhào',
+    0x232B6: 'biē',
+    0x232B7: 'cóng',
+    0x232BA: 'xián',
+    0x232C4: 'tūn',
+    0x232C9: 'yù',
+    0x232CA: 'dàn',
+    0x232CB: 'yìng',
+    0x232CD: 'zhāo',
+    0x232CF: 'pù',
+    0x232D8: 'huì',
+    0x232DE: 'ài',
+    0x232DF: 'mǒ',
+    0x232E2: 'jīng',
+    0x232E3: 'lán',
+    0x232F2: 'liè',
+    0x232F3: 'piǎo,bào',
+    0x232F5: 'bó',
+    0x232F6: 'qióng',
+    0x232F9: 'bì',
+    0x232FF: 'yōng',
+    0x23305: 'lì',
+    0x2330D: 'niè',
+    0x2330F: 'dé',
+    0x23313: 'huān',
+    0x23317: 'yuè',
+    0x2331A: 'chūn',
+    0x2331C: 'lì',
+    0x2331E: 'zhāng',
+    0x2331F: 'líng',
+    0x23320: 'chún',
+    0x23327: 'cè',
+    0x23328: 'xún',
+    0x2332C: 'jǔ',
+    0x2332D: 'hui,dá',
+    0x2333E: 'tōng',
+    0x23346: 'níng',
+    0x23347: 'jù',
+    0x2334F: 'chà',
+    0x23356: 'zāo',
+    0x2335B: 'yù',
+    0x2335F: 'kěn,wěi',
+    0x23366: 'kuàng',
+    0x23367: 'fěi',
+    0x2336F: 'yùn',
+    0x23370: 'qiǎn',
+    0x23374: 'quán',
+    0x23378: 'pò',
+    0x2337A: 'pěi',
+    0x23384: 'gèng',
+    0x23385: 'yì,huān',
+    0x23386: 'luò',
+    0x23391: 'kuān',
+    0x23393: 'xuǎn',
+    0x23394: 'niàn',
+    0x2339A: 'hú',
+    0x2339B: 'jú,xuè',
+    0x233A9: 'yè',
+    0x233AE: 'xī',
+    0x233B1: 'yuè',
+    0x233B2: 'tǎng',
+    0x233B3: 'pìn',
+    0x233B4: 'dǔn,è,ài',
+    0x233B5: 'bèi,pō',
+    0x233B8: 'liǎo',
+    0x233C0: 'yǒng',
+    0x233CE: 'yā',
+    0x233D1: 'jiǎo',
+    0x233D4: 'kùn,kǔn',
+    0x233D6: 'zhèn',
+    0x233D7: 'shù',
+    0x233DA: 'shí',
+    0x233DE: 'yóu',
+    0x233DF: 'pài',
+    0x233E0: 'xiáo',
+    0x233E1: 'jí',
+    0x233F6: 'qī',
+    0x233F7: 'hé',
+    0x233FA: 'kǒng',
+    0x23402: 'yè',
+    0x23403: 'chì',
+    0x2340A: 'kǎo,jú',
+    0x2340B: 'yuè',
+    0x2340E: 'wǎ',
+    0x2340F: 'niǎn',
+    0x23411: 'cí',
+    0x23413: 'yí',
+    0x23424: 'jiu',
+    0x2342B: 'yāng',
+    0x2342C: 'lí',
+    0x2342E: 'dāi',
+    0x2342F: 'chóng',
+    0x23435: 'yí',
+    0x2343A: 'hàn',
+    0x2343F: 'yī',
+    0x23441: 'chòng',
+    0x23442: 'hù',
+    0x23443: 'zhuǎ',
+    0x23466: 'qióng',
+    0x23467: 'duò',
+    0x23478: 'tóng',
+    0x23479: 'xiān',
+    0x2347F: 'fú',
+    0x23482: 'diàn',
+    0x23483: 'xí',
+    0x23484: 'xiē',
+    0x23485: 'zhèn',
+    0x23486: 'qiào',
+    0x23487: 'tū',
+    0x234B7: 'hàn',
+    0x234B8: 'kuàng',
+    0x234B9: 'suō',
+    0x234BB: 'shòu',
+    0x234BC: 'tiáo',
+    0x234C0: 'zhēn,zhěn',
+    0x234C3: 'nèi',
+    0x234C5: 'qiǎn',
+    0x234C6: 'yín',
+    0x234C8: 'liǎng',
+    0x234C9: 'shà,jié',
+    0x234CA: 'zì',
+    0x234CB: 'pí',
+    0x234CC: 'gāo,jú',
+    0x234CF: 'jìn',
+    0x234D0: 'yóu',
+    0x234D2: 'shàn',
+    0x234D4: 'mì',
+    0x234D5: 'òu',
+    0x234D7: 'hū',
+    0x234DB: 'yòu',
+    0x234DD: 'měng',
+    0x23510: 'zhǐ',
+    0x23513: 'bǐ',
+    0x23517: 'shēn',
+    0x23518: 'qì',
+    0x23519: 'xiān',
+    0x2351A: 'pán',
+    0x2351B: 'kǎng',
+    0x2352B: 'shuān',
+    0x2352C: 'pí',
+    0x2352E: 'zāi',
+    0x2352F: 'zhǔ',
+    0x23531: 'sōu,sāo',
+    0x23532: 'jiǒng',
+    0x23535: 'chán',
+    0x23536: 'fán,fàn',
+    0x23537: 'xiáo',
+    0x23538: 'yǐn',
+    0x23539: 'hóu',
+    0x2353A: 'mào',
+    0x2353B: 'tú,chán',
+    0x2353D: 'jì',
+    0x23541: 'yí',
+    0x23543: 'yù',
+    0x23544: 'jiōng',
+    0x23545: 'pào',
+    0x23547: 'xiāo',
+    0x23549: 'gǒu',
+    0x2354C: 'gōu',
+    0x2354D: 'sǔn',
+    0x2354E: 'xiǎn',
+    0x2354F: 'zhuǎn',
+    0x2357E: 'chóu,bì',
+    0x23584: 'qiāo',
+    0x23585: 'tí',
+    0x23586: 'yún',
+    0x23589: 'shān',
+    0x2358A: 'liè,lì',
+    0x2358C: 'zhǐ',
+    0x23590: 'pāi',
+    0x235A3: 'jú',
+    0x235A4: 'lái',
+    0x235A8: 'zǐ',
+    0x235AA: 'qú',
+    0x235AB: 'gǔ,què',
+    0x235AC: 'jué',
+    0x235AD: 'zhí',
+    0x235AE: 'àng',
+    0x235AF: 'qìn',
+    0x235B0: 'pí',
+    0x235B1: 'zuī',
+    0x235B3: 'qián',
+    0x235B5: 'cuó',
+    0x235B7: 'jí',
+    0x235B8: 'tí',
+    0x235B9: 'rú',
+    0x235BB: 'hǎi',
+    0x235BC: 'xún',
+    0x235BE: 'bèi',
+    0x235BF: 'zhí',
+    0x235C1: 'dùn,zā',
+    0x235CB: 'dǎng',
+    0x235D0: 'réng',
+    0x235F2: 'gān',
+    0x235F5: 'gàng,gāng',
+    0x235F6: 'tà',
+    0x235F8: 'tuò',
+    0x235F9: 'yàng',
+    0x235FA: 'kū',
+    0x235FB: 'zhì',
+    0x23616: 'jiān',
+    0x23617: 'nì',
+    0x23618: 'shēn,zhēn',
+    0x23619: 'bàng',
+    0x2361A: 'shuài',
+    0x2361B: 'dōu',
+    0x2361D: 'qiān',
+    0x2361E: 'hán',
+    0x2361F: 'qiā',
+    0x23620: 'gǎn',
+    0x23623: 'chún',
+    0x23624: 'chá,sà',
+    0x23625: 'bì',
+    0x23626: 'yī',
+    0x23627: 'fū',
+    0x23628: 'ě,ē',
+    0x2362A: 'láo',
+    0x2362B: 'háo',
+    0x2362C: 'lí',
+    0x23631: 'tè',
+    0x23632: 'shēn',
+    0x23634: 'yín',
+    0x23637: 'jiān',
+    0x2363B: 'chá,tú',
+    0x23657: 'niè',
+    0x23658: 'còu',
+    0x2365B: 'yí',
+    0x2365F: 'táng',
+    0x23662: 'juàn',
+    0x23670: 'chì',
+    0x23671: 'gǒu',
+    0x23674: 'jié',
+    0x23675: 'zhé',
+    0x23676: 'hú',
+    0x23677: 'máng',
+    0x2367B: 'zōu',
+    0x2367C: 'sì,cí',
+    0x2367F: 'fèi',
+    0x23680: 'zī',
+    0x23681: 'zī',
+    0x23683: 'jié',
+    0x23684: 'sī',
+    0x23686: 'chūn',
+    0x23687: 'pào',
+    0x2368B: 'yé',
+    0x2368C: 'dī,shì',
+    0x2368E: 'léi',
+    0x2368F: 'xū',
+    0x23690: 'rú',
+    0x23692: 'pá',
+    0x23693: 'juàn',
+    0x23694: 'xì',
+    0x23695: 'yè,yǎn',
+    0x23696: 'ān',
+    0x23698: 'yì',
+    0x23699: 'jiān,jiàn',
+    0x2369C: 'sōng',
+    0x2369D: 'wǒ',
+    0x2369F: 'sè',
+    0x236A0: 'zhǐ',
+    0x236A1: 'bī',
+    0x236A2: 'zhuàn',
+    0x236A6: 'jiàng',
+    0x236A7: 'hào',
+    0x236A9: 'chì',
+    0x236AA: 'dùn',
+    0x236D3: 'bó',
+    0x236D4: 'jí',
+    0x236D5: 'chuǎ',
+    0x236D7: 'luò',
+    0x236DA: 'ruǐ',
+    0x236EB: 'hú',
+    0x236F1: 'dàn,lǎn',
+    0x236F4: 'hǎn',
+    0x236F5: 'què',
+    0x236F6: 'shā',
+    0x236F7: 'zhǎn',
+    0x236F8: 'zé',
+    0x236F9: 'chuán,chuǎi',
+    0x236FA: 'qī',
+    0x236FB: 'dié',
+    0x236FD: 'zhà',
+    0x236FE: 'tòu',
+    0x23701: 'cī',
+    0x23702: 'sà',
+    0x23704: 'luó',
+    0x23707: 'jí',
+    0x23722: 'luǒ',
+    0x23723: 'qín',
+    0x23727: 'qióng',
+    0x23728: 'juàn',
+    0x2372C: 'ài',
+    0x2372D: 'jiǎn',
+    0x23739: 'tì',
+    0x2373A: 'wén',
+    0x2373D: 'qiāo',
+    0x23741: 'pái,bēi',
+    0x23742: 'hún',
+    0x23745: 'ài',
+    0x23747: 'shuò',
+    0x23748: 'lián',
+    0x23749: 'duì',
+    0x2374B: 'tà',
+    0x2374C: 'jǐn',
+    0x2374D: 'bì',
+    0x2374E: 'yǎn',
+    0x2374F: 'gào',
+    0x23750: 'piáo',
+    0x23751: 'yù,yú',
+    0x23752: 'shè',
+    0x23755: 'jiān',
+    0x23757: 'hú',
+    0x2375A: 'liè',
+    0x2375C: 'biàn',
+    0x2375D: 'sù',
+    0x2375E: 'jiāo',
+    0x23778: 'zhuì',
+    0x2377D: 'hān',
+    0x23787: 'dùn',
+    0x23790: 'xiě',
+    0x23791: 'méng',
+    0x23792: 'fū',
+    0x23793: 'lù',
+    0x23794: 'tàn',
+    0x23797: 'liú',
+    0x23798: 'xiān',
+    0x23799: 'sǎng',
+    0x2379C: 'còu',
+    0x2379D: 'zhuāng',
+    0x2379F: 'chēn',
+    0x237B0: 'liàn',
+    0x237B4: 'lí',
+    0x237C0: 'pèng',
+    0x237C1: 'tuǒ',
+    0x237C4: 'tuò',
+    0x237C6: 'liáo',
+    0x237C7: 'xiào',
+    0x237C8: 'chuì',
+    0x237C9: 'huài',
+    0x237CA: 'niǎo',
+    0x237CB: 'qiān',
+    0x237CC: 'lì',
+    0x237CF: 'pāo',
+    0x237D0: 'tiáo',
+    0x237D1: 'liú',
+    0x237D2: 'wú',
+    0x237E4: 'yǐng',
+    0x237E6: 'zhá',
+    0x237F0: 'yú',
+    0x237F2: 'xiǎn',
+    0x237F3: 'xuán',
+    0x237F4: 'shuān',
+    0x237F5: 'xī',
+    0x237F8: 'méi',
+    0x237F9: 'sēn',
+    0x237FA: 'liàn',
+    0x237FC: 'jiū,qiāo',
+    0x237FD: 'lào',
+    0x2380E: 'xiāo',
+    0x2380F: 'zōu',
+    0x2381A: 'liú',
+    0x2381C: 'zhào',
+    0x2381E: 'zhé,shè',
+    0x23820: 'lěi',
+    0x2382D: 'duǎn',
+    0x23837: 'jiǎn',
+    0x23838: 'shuān',
+    0x23839: 'zuó',
+    0x2383A: 'qiè',
+    0x2383C: 'lǎo',
+    0x23849: 'yù',
+    0x2384A: 'yì',
+    0x2384B: 'nǐ',
+    0x2384E: 'cén',
+    0x23855: 'yàn',
+    0x23857: 'ruǎn',
+    0x2385E: 'yán',
+    0x2385F: 'dié',
+    0x23860: 'mián',
+    0x23867: 'léi',
+    0x23869: 'wān',
+    0x23870: 'nǎ',
+    0x23876: 'yán',
+    0x2387A: 'lěi',
+    0x2387D: 'shā',
+    0x2387E: 'hū',
+    0x23881: 'xī',
+    0x23882: 'xī',
+    0x23884: 'yǒu,yōu',
+    0x23885: 'hān',
+    0x23887: 'hāi,xī',
+    0x23889: 'wā',
+    0x2388A: 'xù',
+    0x2388B: 'pī',
+    0x2388C: 'tān',
+    0x2388D: 'xī',
+    0x2388E: 'xī',
+    0x2388F: 'bīn',
+    0x23890: 'qīn,kēng',
+    0x23891: 'xī',
+    0x23892: 'yú',
+    0x23893: 'xì',
+    0x23895: 'cì',
+    0x23896: 'qiàn',
+    0x23897: 'xiā',
+    0x2389A: 'wá',
+    0x2389B: 'è',
+    0x2389C: 'yǒu,yōu',
+    0x2389D: 'xìng',
+    0x2389E: 'ní',
+    0x2389F: 'hán,xián',
+    0x238A0: 'bì',
+    0x238A1: 'shēng',
+    0x238A4: 'zhān',
+    0x238A5: 'diàn',
+    0x238A6: 'yǔ',
+    0x238A8: 'ǒu',
+    0x238AA: 'guǐ',
+    0x238AB: 'wǎng,wāng',
+    0x238AC: 'qiān',
+    0x238AD: 'yí',
+    0x238B0: 'zú',
+    0x238B2: 'qiān',
+    0x238B3: 'dìng',
+    0x238B4: 'kēng',
+    0x238B6: 'chù',
+    0x238B7: 'yī',
+    0x238BA: 'hān',
+    0x238BB: 'kuǎn',
+    0x238C8: 'diàn',
+    0x238C9: 'xì',
+    0x238CA: 'zī',
+    0x238CB: 'líng',
+    0x238CC: 'zì,sì',
+    0x238CE: 'yù',
+    0x238CF: 'hūn',
+    0x238D1: 'sǐ',
+    0x238D2: 'kǎn',
+    0x238DA: 'àn',
+    0x238DC: 'yǒu',
+    0x238DD: 'jí',
+    0x238DE: 'hùn',
+    0x238DF: 'qiā',
+    0x238E0: 'hóu',
+    0x238E1: 'hóu',
+    0x238E3: 'diàn',
+    0x238E9: 'xiē',
+    0x238ED: 'shè',
+    0x238EE: 'shà',
+    0x238F2: 'xié',
+    0x238F3: 'yáo,yǎo',
+    0x238F4: 'dà',
+    0x238F6: 'xiè',
+    0x238F7: 'chī',
+    0x238F8: 'yǒu',
+    0x238F9: 'hē',
+    0x238FA: 'shà',
+    0x238FF: 'tái',
+    0x23901: 'zhú',
+    0x23903: 'ǎi',
+    0x23907: 'què',
+    0x23908: 'zé',
+    0x2390A: 'lā',
+    0x2390B: 'lòu',
+    0x2390C: 'chuài,chǐ,chuò',
+    0x2390E: 'yǒu',
+    0x23916: 'tì',
+    0x23918: 'shī',
+    0x23921: 'xiào,yǒu',
+    0x23922: 'xì',
+    0x23928: 'huò',
+    0x23929: 'chì',
+    0x2392A: 'yì',
+    0x2392F: 'shú',
+    0x23930: 'yuè',
+    0x23931: 'chán',
+    0x23932: 'è',
+    0x23933: 'xī',
+    0x23934: 'xī',
+    0x23935: 'yǐng',
+    0x23936: 'zú,zā,zǎn',
+    0x23937: 'zā',
+    0x2393A: 'zā',
+    0x23942: 'tà',
+    0x23943: 'wàn',
+    0x23947: 'xìn',
+    0x2394A: 'wàng',
+    0x2394B: 'fǔ',
+    0x23950: 'lǔ,lǚ',
+    0x2395E: 'jiǎn',
+    0x23961: 'yán',
+    0x23963: 'bì',
+    0x23964: 'kěn',
+    0x23965: 'guàn',
+    0x23968: 'zī',
+    0x2396E: 'kuǐ',
+    0x2396F: 'zhǒu',
+    0x23970: 'zhì',
+    0x23973: 'tú',
+    0x23977: 'tà',
+    0x23979: 'chù',
+    0x2397A: 'chēng',
+    0x2397B: 'chěng',
+    0x2397C: 'zhù',
+    0x2397E: 'dà',
+    0x23987: 'bì',
+    0x23989: 'jiǎ',
+    0x2398C: 'yì',
+    0x2398F: 'yuè',
+    0x23990: 'gāng',
+    0x23996: 'gān',
+    0x2399C: 'qiāo',
+    0x239A0: 'chú',
+    0x239A1: 'chú',
+    0x239A2: 'bì',
+    0x239A6: 'guì',
+    0x239A9: 'gǔ',
+    0x239AA: 'bǐng',
+    0x239AB: 'yìn',
+    0x239AC: 'zhuì',
+    0x239AD: 'gǔ',
+    0x239AF: 'lì',
+    0x239B5: 'è,zhēn',
+    0x239B6: 'dǎi',
+    0x239BC: 'cán',
+    0x239C2: 'tì',
+    0x239C3: 'dù',
+    0x239C4: 'yì',
+    0x239C8: 'dié',
+    0x239CA: 'niǔ',
+    0x239CC: 'xuè',
+    0x239CD: 'nè',
+    0x239CE: 'guì',
+    0x239CF: 'kǎo',
+    0x239D2: 'chuǎn,mò',
+    0x239D6: 'zhá',
+    0x239D7: 'yóu',
+    0x239D9: 'bài',
+    0x239DA: 'shí',
+    0x239DB: 'diàn',
+    0x239DC: 'pā',
+    0x239DD: 'qiú',
+    0x239E1: 'xuè',
+    0x239E3: 'mò',
+    0x239E4: 'kē',
+    0x239E5: 'yǒu',
+    0x239E6: 'jiǎo',
+    0x239E7: 'bó',
+    0x239EC: 'xiǔ',
+    0x239F2: 'mǐ',
+    0x239F3: 'luò',
+    0x239F5: 'xuè,xù',
+    0x239F7: 'duò',
+    0x239F9: 'èr',
+    0x239FA: 'shān',
+    0x239FC: 'kuì',
+    0x239FD: 'nào',
+    0x239FE: 'miǎn',
+    0x239FF: 'lì',
+    0x23A00: 'luàn',
+    0x23A02: 'dié',
+    0x23A04: 'qià',
+    0x23A05: 'lèi',
+    0x23A07: 'mào',
+    0x23A09: 'hēng',
+    0x23A0A: 'chè',
+    0x23A0B: 'zhì',
+    0x23A0D: 'gǔ',
+    0x23A0E: 'cuō',
+    0x23A13: 'wù',
+    0x23A14: 'tào',
+    0x23A17: 'xī',
+    0x23A18: 'yāo',
+    0x23A19: 'wěi,wèi',
+    0x23A1B: 'zú',
+    0x23A1C: 'mà',
+    0x23A1D: 'yǔ',
+    0x23A1E: 'pěng',
+    0x23A1F: 'yì',
+    0x23A20: 'qìn,qīn',
+    0x23A21: 'yuè',
+    0x23A22: 'juè',
+    0x23A23: 'jiàng',
+    0x23A24: 'xù',
+    0x23A25: 'bēng',
+    0x23A2A: 'luǒ',
+    0x23A2B: 'zhuī',
+    0x23A32: 'dù',
+    0x23A33: 'xiàng',
+    0x23A36: 'huì',
+    0x23A3A: 'gǔ',
+    0x23A3B: 'kǎo',
+    0x23A3E: 'xīng',
+    0x23A3F: 'hún',
+    0x23A40: 'biān',
+    0x23A44: 'kè,ài',
+    0x23A45: 'kǎo',
+    0x23A48: 'cuó,zuō',
+    0x23A4F: 'lù',
+    0x23A51: 'zuì',
+    0x23A52: 'zāo',
+    0x23A53: 'jiǎo',
+    0x23A54: 'guàn',
+    0x23A59: 'yān',
+    0x23A5A: 'ér',
+    0x23A5C: 'qíng',
+    0x23A5F: 'dèng',
+    0x23A60: 'sì',
+    0x23A61: 'suì',
+    0x23A62: 'liào',
+    0x23A67: 'shàn',
+    0x23A69: 'bì',
+    0x23A6A: 'wèi',
+    0x23A6B: 'yè',
+    0x23A6D: 'zhài',
+    0x23A6F: 'yé',
+    0x23A70: 'diào',
+    0x23A71: 'ài,kē',
+    0x23A74: 'jiàng',
+    0x23A77: 'sū',
+    0x23A79: 'huài',
+    0x23A7A: 'yù',
+    0x23A7D: 'rǎng',
+    0x23A80: 'diān',
+    0x23A81: 'zuān',
+    0x23A82: 'bān',
+    0x23A84: 'qín',
+    0x23A87: 'jiā',
+    0x23A89: 'pí',
+    0x23A8C: 'tóu,duì',
+    0x23A90: 'chóu',
+    0x23A95: 'guǐ',
+    0x23AA0: 'jī,jì,qì',
+    0x23AA8: 'xuè',
+    0x23AAA: 'diàn',
+    0x23AAD: 'biàn',
+    0x23AAE: 'zǎi',
+    0x23AAF: 'tóng',
+    0x23AB6: 'shǎn',
+    0x23AB8: 'gù',
+    0x23AB9: 'què',
+    0x23AC0: 'gǔ',
+    0x23AC8: 'hú',
+    0x23AC9: 'kuǎi',
+    0x23ACC: 'gòu',
+    0x23ACE: 'sù',
+    0x23AD0: 'chóu',
+    0x23AD2: 'kēng',
+    0x23AD4: 'dū',
+    0x23AD9: 'yì',
+    0x23ADC: 'dào',
+    0x23ADD: 'qiāng',
+    0x23AE3: 'lóng',
+    0x23AE5: 'lí',
+    0x23AE7: 'lì',
+    0x23AE8: 'qīng',
+    0x23AEA: 'wēi',
+    0x23AEC: 'móu',
+    0x23AF1: 'qì',
+    0x23AF3: 'jiǎng',
+    0x23AF4: 'xié',
+    0x23AF9: 'dài',
+    0x23AFB: 'lóu',
+    0x23B02: 'guàn',
+    0x23B06: 'péi',
+    0x23B09: 'pí',
+    0x23B0B: 'juàn,chuò',
+    0x23B0D: 'bēi',
+    0x23B0E: 'jué',
+    0x23B0F: 'juàn',
+    0x23B10: 'shì',
+    0x23B15: 'xiě',
+    0x23B18: 'ruí',
+    0x23B19: 'jìng',
+    0x23B1A: 'pò',
+    0x23B1B: 'sān,shān',
+    0x23B20: 'jī',
+    0x23B29: 'fēn',
+    0x23B2A: 'bèi',
+    0x23B2B: 'jiè,gà',
+    0x23B2C: 'sā',
+    0x23B2E: 'pī',
+    0x23B34: 'dì',
+    0x23B35: 'máo,mào',
+    0x23B36: 'ba',
+    0x23B37: 'ba',
+    0x23B38: 'tiáo',
+    0x23B39: 'líng',
+    0x23B3A: 'shēng',
+    0x23B3B: 'zhěn',
+    0x23B3C: 'pī',
+    0x23B3D: 'wù',
+    0x23B3F: 'zè',
+    0x23B40: 'bào',
+    0x23B47: 'lǚ',
+    0x23B56: 'hāo',
+    0x23B57: 'dǒu',
+    0x23B58: 'fú',
+    0x23B59: 'ní',
+    0x23B5D: 'gé',
+    0x23B60: 'rú',
+    0x23B61: 'xiǎn',
+    0x23B64: 'bì',
+    0x23B6E: 'máo',
+    0x23B72: 'rǒng',
+    0x23B73: 'qiú,qú',
+    0x23B77: 'bó',
+    0x23B79: 'hāo',
+    0x23B7A: 'nǎo',
+    0x23B7B: 'yán',
+    0x23B83: 'páo',
+    0x23B84: 'suī',
+    0x23B86: 'tuò',
+    0x23B88: 'qū',
+    0x23B89: 'lí',
+    0x23B8A: 'dé',
+    0x23B8C: 'jié',
+    0x23B8D: 'jié',
+    0x23B8E: 'gǔn',
+    0x23B8F: 'jiān',
+    0x23B90: 'bì',
+    0x23BA0: 'sàn',
+    0x23BA1: 'bāng',
+    0x23BA2: 'chún',
+    0x23BA6: 'nài',
+    0x23BA7: 'bǎng',
+    0x23BAA: 'róng',
+    0x23BAB: 'jiā',
+    0x23BAC: 'sōu',
+    0x23BB0: 'dé',
+    0x23BBE: 'xiān',
+    0x23BBF: 'zhān',
+    0x23BC0: 'mào',
+    0x23BC3: 'zī',
+    0x23BC5: 'jì',
+    0x23BC6: 'qí',
+    0x23BCB: 'rù',
+    0x23BCC: 'suō',
+    0x23BCD: 'rǒng',
+    0x23BCE: 'wù',
+    0x23BCF: 'róng,rǒng',
+    0x23BD0: 'róng',
+    0x23BDA: 'tà',
+    0x23BDC: 'sōu',
+    0x23BE4: 'lí',
+    0x23BE7: 'cuǐ,suī',
+    0x23BE8: 'zōng',
+    0x23BE9: 'mén',
+    0x23BEA: 'xǐ',
+    0x23BEC: 'mǎng',
+    0x23BED: 'niè',
+    0x23BEF: 'suī',
+    0x23BF1: 'péi',
+    0x23BF4: 'bì',
+    0x23BF5: 'dì',
+    0x23BF8: 'qú',
+    0x23BF9: 'qiáo',
+    0x23BFB: 'fēn',
+    0x23BFC: 'sù',
+    0x23C03: 'xū',
+    0x23C07: 'rǒng',
+    0x23C08: 'jī',
+    0x23C0B: 'qú',
+    0x23C0C: 'liè,hé',
+    0x23C15: 'sào',
+    0x23C18: 'kùn',
+    0x23C1A: 'cuì',
+    0x23C1B: 'yè',
+    0x23C1C: 'bìng',
+    0x23C1E: 'jié',
+    0x23C20: 'qú',
+    0x23C21: 'qú',
+    0x23C25: 'méng',
+    0x23C26: 'rán,gān',
+    0x23C28: 'bīn',
+    0x23C29: 'cháo',
+    0x23C2C: 'dú',
+    0x23C36: 'ráng,nǎng',
+    0x23C37: 'xiān',
+    0x23C3A: 'táo',
+    0x23C3B: 'qú',
+    0x23C3C: 'niè',
+    0x23C3F: 'shū',
+    0x23C40: 'lǔ',
+    0x23C42: 'kùn',
+    0x23C48: 'mín',
+    0x23C49: 'mǐn',
+    0x23C4D: 'dàn',
+    0x23C50: 'yìn,zhì',
+    0x23C53: 'xiào,hào',
+    0x23C57: 'jì',
+    0x23C5C: 'yīn',
+    0x23C66: 'fēn',
+    0x23C67: 'zhòng',
+    0x23C6B: 'gǔ',
+    0x23C71: 'chá',
+    0x23C73: 'liú',
+    0x23C76: 'bǔ',
+    0x23C7A: 'pā',
+    0x23C7B: 'sì',
+    0x23C7C: 'dāo',
+    0x23C7D: 'zhěn',
+    0x23C80: 'shān',
+    0x23C82: 'chuǎi',
+    0x23C84: 'jiǔ',
+    0x23C8A: 'kè',
+    0x23C8B: 'chí',
+    0x23C91: 'hù,chí,hé,hú',
+    0x23C92: 'lì,lè',
+    0x23C93: 'shā',
+    0x23C96: 'pài,liú,gū',
+    0x23C97: 'wéi',
+    0x23C98: 'wǔ',
+    0x23C9C: 'yíng',
+    0x23CA1: 'shā,jí,jié',
+    0x23CA2: 'dī',
+    0x23CA5: 'dān',
+    0x23CB1: 'tū',
+    0x23CB2: 'hé',
+    0x23CB3: 'pǒ',
+    0x23CB5: 'zhǐ',
+    0x23CB6: 'niǔ',
+    0x23CB7: 'nì',
+    0x23CBD: 'rǒng',
+    0x23CBE: 'guài',
+    0x23CC0: 'zhí',
+    0x23CC3: 'jí',
+    0x23CDC: 'fàn',
+    0x23CDF: 'jié',
+    0x23CE0: 'hǎi,mǔ',
+    0x23CE4: 'zhàn',
+    0x23CE6: 'xì,náo',
+    0x23CE9: 'zī',
+    0x23CEC: 'xí',
+    0x23CED: 'piào',
+    0x23CF0: 'bēn',
+    0x23CF2: 'jiǎn',
+    0x23D13: 'jiàn',
+    0x23D16: 'zá',
+    0x23D1E: 'bèn',
+    0x23D1F: 'mào,huǎn',
+    0x23D22: 'zào',
+    0x23D23: 'zhuàng',
+    0x23D25: 'kuáng',
+    0x23D28: 'bí',
+    0x23D2A: 'pài,pì',
+    0x23D3C: 'mào',
+    0x23D3D: 'tàn',
+    0x23D5E: 'tǔn',
+    0x23D5F: 'luǒ',
+    0x23D62: 'tān',
+    0x23D71: 'án',
+    0x23D77: 'hán,gàn',
+    0x23D78: 'zhú',
+    0x23D7A: 'duò,tuó',
+    0x23D7B: 'duò,tuó',
+    0x23D7C: 'gàn',
+    0x23D86: 'qiòng',
+    0x23D88: 'wǎng,mǎng',
+    0x23D8A: 'mò',
+    0x23D8B: 'zhè',
+    0x23D8C: 'wěn',
+    0x23D8D: 'zhuàng',
+    0x23D8F: 'jiē,diē',
+    0x23D90: 'pào',
+    0x23D98: 'sù',
+    0x23D9D: 'jù',
+    0x23DA0: 'qī',
+    0x23DA1: 'càn',
+    0x23DA3: 'tuán',
+    0x23DA4: 'shā',
+    0x23DA6: 'tuó',
+    0x23DA9: 'huà',
+    0x23DAB: 'yì',
+    0x23DE0: 'mín',
+    0x23DE1: 'zhōng',
+    0x23DE5: 'shuò',
+    0x23DE9: 'yì',
+    0x23DEA: 'wǎng',
+    0x23DEB: 'áo',
+    0x23DF6: 'sǔ',
+    0x23DFE: 'guǐ',
+    0x23DFF: 'tuǒ',
+    0x23E00: 'huǐ',
+    0x23E03: 'xù',
+    0x23E04: 'zǎn',
+    0x23E06: 'zǐ',
+    0x23E07: 'biàn',
+    0x23E09: 'dá',
+    0x23E0A: 'yīn',
+    0x23E0B: 'quǎn',
+    0x23E0E: 'huài',
+    0x23E0F: 'ná',
+    0x23E10: 'zá',
+    0x23E12: 'tí',
+    0x23E18: 'yí',
+    0x23E19: 'tān',
+    0x23E1A: 'shé',
+    0x23E1B: 'shuò',
+    0x23E1D: 'xíng',
+    0x23E20: 'yǒu',
+    0x23E23: 'fén',
+    0x23E47: 'kè',
+    0x23E4B: 'fú',
+    0x23E52: 'mǐn',
+    0x23E5A: 'pì',
+    0x23E5C: 'jí',
+    0x23E5D: 'qiào,xiào',
+    0x23E5E: 'zhǒng',
+    0x23E5F: 'gàn',
+    0x23E60: 'yuān',
+    0x23E61: 'chí',
+    0x23E65: 'qiàn',
+    0x23E67: 'zuó,zhà',
+    0x23E69: 'xié',
+    0x23E6A: 'máo',
+    0x23E6C: 'hú',
+    0x23E6E: 'pì',
+    0x23E6F: 'xùn',
+    0x23E71: 'xiá',
+    0x23E72: 'tí',
+    0x23E75: 'nà',
+    0x23E76: 'chuǎ',
+    0x23E80: 'wǔ',
+    0x23EAC: 'huāng',
+    0x23EAD: 'xuè',
+    0x23EAE: 'tào',
+    0x23EB0: 'qiào',
+    0x23EB3: 'jiāo',
+    0x23EBC: 'dǎng',
+    0x23EBD: 'bài',
+    0x23ECD: 'dàng,xiàng',
+    0x23ECE: 'kòu',
+    0x23ED0: 'jū',
+    0x23ED1: 'shā,shài',
+    0x23ED2: 'jīng',
+    0x23ED5: 'mó',
+    0x23ED6: 'nóu',
+    0x23ED8: 'shuò',
+    0x23EDA: 'shù',
+    0x23EDB: 'zhuāng',
+    0x23EDC: 'fú',
+    0x23EDF: 'zāng',
+    0x23EE0: 'xié',
+    0x23EE1: 'làng',
+    0x23EE2: 'tōng',
+    0x23EE9: 'zhé',
+    0x23EEC: 'càn',
+    0x23EEE: 'yuè',
+    0x23EF1: 'zhòu',
+    0x23F1A: 'tān',
+    0x23F1E: 'yán',
+    0x23F1F: 'lù',
+    0x23F20: 'yǎn',
+    0x23F26: 'zé',
+    0x23F27: 'shuài',
+    0x23F45: 'guō',
+    0x23F46: 'zhú',
+    0x23F48: 'rú,ruán',
+    0x23F49: 'rú',
+    0x23F4C: 'kǎn',
+    0x23F4D: 'jì',
+    0x23F4E: 'gāo,zé,háo',
+    0x23F52: 'xiè',
+    0x23F55: 'òu',
+    0x23F56: 'jiān',
+    0x23F5A: 'zhí',
+    0x23F5B: 'zhá',
+    0x23F5D: 'hǒng',
+    0x23F5F: 'kuǎn',
+    0x23F61: 'bó',
+    0x23F64: 'sè',
+    0x23F65: 'àn',
+    0x23F66: 'jiàn',
+    0x23F68: 'téng',
+    0x23F6B: 'sōng',
+    0x23F6D: 'mèng',
+    0x23F6E: 'yín',
+    0x23F6F: 'tān',
+    0x23F70: 'guō',
+    0x23F73: 'ruán',
+    0x23F74: 'wèi',
+    0x23F77: 'sì',
+    0x23FA4: 'qì',
+    0x23FA6: 'zhǎng',
+    0x23FC5: 'dǒng',
+    0x23FC6: 'fú',
+    0x23FC7: 'shěn',
+    0x23FC8: 'sù',
+    0x23FC9: 'yì',
+    0x23FCA: 'liàn',
+    0x23FCC: 'hé',
+    0x23FCE: 'zhēn',
+    0x23FD0: 'zé',
+    0x23FD2: 'cuǐ',
+    0x23FD3: 'cuǐ',
+    0x23FDD: 'fèng',
+    0x23FDE: 'lǐ',
+    0x23FDF: 'kòu',
+    0x23FE3: 'xiào',
+    0x23FE4: 'yǒu',
+    0x24003: 'háo',
+    0x24009: 'hàn',
+    0x2400A: 'kěn',
+    0x2401D: 'yù',
+    0x24023: 'huǎn',
+    0x24024: 'suō,shàn,shuài',
+    0x24026: 'là',
+    0x24028: 'dòu',
+    0x24029: 'jiàn',
+    0x2402A: 'pō',
+    0x2402B: 'biǎn',
+    0x24030: 'xuè',
+    0x24032: 'biàn',
+    0x24037: 'wèi',
+    0x24061: 'dàn',
+    0x24062: 'jié',
+    0x24063: 'bài',
+    0x24065: 'niǎn',
+    0x24066: 'xiàn',
+    0x24067: 'sè',
+    0x2406A: 'huá',
+    0x2406B: 'chuā',
+    0x2406E: 'òu',
+    0x2406F: 'liè',
+    0x24070: 'dí',
+    0x24071: 'cài',
+    0x24073: 'zhá',
+    0x24075: 'lǘ',
+    0x24079: 'huò',
+    0x2407C: 'lì',
+    0x2407D: 'yǐng',
+    0x2407F: 'wěi',
+    0x24080: 'bì',
+    0x24081: 'guó',
+    0x24083: 'pì',
+    0x24086: 'biāo',
+    0x240A0: 'yǎn',
+    0x240A4: 'zhuàn',
+    0x240B2: 'hóng',
+    0x240B6: 'lìn',
+    0x240B7: 'è',
+    0x240B9: 'yǐn',
+    0x240BA: 'làn',
+    0x240BC: 'yào',
+    0x240BF: 'xuàn',
+    0x240C0: 'lì',
+    0x240E8: 'làn',
+    0x240E9: 'líng',
+    0x240EA: 'xī',
+    0x240EB: 'hōng',
+    0x240ED: 'jiǎo',
+    0x240EE: 'zhuó',
+    0x240F2: 'zhí',
+    0x240F5: 'bó',
+    0x240F6: 'tēng',
+    0x240F7: 'ǎn',
+    0x240FA: 'xún',
+    0x240FB: 'lěi',
+    0x240FC: 'zāng',
+    0x240FD: 'huǐ',
+    0x2410E: 'xì',
+    0x2410F: 'hóng',
+    0x24111: 'fàn',
+    0x24112: 'jiǎn',
+    0x24113: 'cóng',
+    0x24114: 'zá',
+    0x24116: 'cā,zá',
+    0x24118: 'yōu',
+    0x2411B: 'duì',
+    0x2411C: 'pān',
+    0x24125: 'tà',
+    0x24127: 'pàn',
+    0x2412B: 'fān',
+    0x2412C: 'xī',
+    0x24136: 'yào,shuò',
+    0x24137: 'luó',
+    0x2413A: 'biān',
+    0x2413C: 'jìn',
+    0x2413D: 'lì',
+    0x2414A: 'yàn',
+    0x2414B: 'dòu',
+    0x2414E: 'màn',
+    0x24150: 'gōng',
+    0x24151: 'rǎng',
+    0x24152: 'càn',
+    0x24163: 'mén',
+    0x24171: 'gǔ',
+    0x24172: 'shuàn',
+    0x24178: 'yán,yàn',
+    0x24179: 'bì',
+    0x24180: 'biāo',
+    0x24181: 'chéng',
+    0x24182: 'kuì',
+    0x24184: 'huǒ,zāi',
+    0x2418D: 'chì',
+    0x2418F: 'wò',
+    0x24191: 'còu',
+    0x24192: 'zhì',
+    0x24199: 'shuǐ',
+    0x2419C: 'guà',
+    0x2419D: 'pū',
+    0x2419E: 'xù',
+    0x2419F: 'sī',
+    0x241A1: 'wǔ',
+    0x241AE: 'fū',
+    0x241B0: 'shì',
+    0x241B3: 'huì',
+    0x241B4: 'huāng',
+    0x241B5: 'pā',
+    0x241BC: 'zhǔ',
+    0x241BE: 'yí',
+    0x241C3: 'lì',
+    0x241C4: 'shǎn',
+    0x241DC: 'mín',
+    0x241DE: 'gē',
+    0x241E0: 'hū',
+    0x241EF: 'ēn,āo',
+    0x241F0: 'fá',
+    0x241F3: 'xù,xuè',
+    0x241F4: 'yí,xī',
+    0x241FE: 'yíng',
+    0x24214: 'chí',
+    0x24219: 'yí',
+    0x24225: 'dí',
+    0x24226: 'huǐ,méi',
+    0x24227: 'hé',
+    0x24229: 'zhǎ',
+    0x24236: 'yún',
+    0x24237: 'xiān',
+    0x2424C: 'xián',
+    0x2424D: 'lào',
+    0x2424E: 'shào',
+    0x2424F: 'shì',
+    0x24250: 'zhuó',
+    0x24264: 'biē',
+    0x24265: 'jiǔ',
+    0x24266: 'wō',
+    0x24267: 'jiǎo',
+    0x24268: 'fú',
+    0x2426A: 'xiāng',
+    0x2426B: 'kài',
+    0x242B2: 'nǎo',
+    0x242B4: 'huò',
+    0x242B5: 'jí',
+    0x242B6: 'là',
+    0x242BB: 'fōu',
+    0x242BC: 'shǎn',
+    0x242BD: 'liào,liǎo',
+    0x242BE: 'miè',
+    0x242BF: 'chè',
+    0x242C2: 'mó',
+    0x242CF: 'lóu',
+    0x242E8: 'duò',
+    0x242EB: 'nǎo',
+    0x242ED: 'jī',
+    0x242F0: 'zhù',
+    0x24302: 'sù',
+    0x24303: 'duò',
+    0x24307: 'jiǒng',
+    0x2430A: 'zǎi',
+    0x2430B: 'huǐ',
+    0x2430C: 'yǐng',
+    0x2430D: 'hú',
+    0x2430E: 'lìn,lǐn',
+    0x2430F: 'wěng',
+    0x24310: 'hàn',
+    0x24314: 'nán',
+    0x24337: 'xì',
+    0x24339: 'gàn',
+    0x2433E: 'hè',
+    0x2433F: 'jī',
+    0x24340: 'xiǎng',
+    0x24341: 'shā',
+    0x24350: 'tuì',
+    0x24352: 'zhāo',
+    0x24353: 'shù',
+    0x24355: 'yǒu',
+    0x24356: 'jiān',
+    0x2435C: 'zào',
+    0x24364: 'zhāng',
+    0x2437D: 'ruò',
+    0x24384: 'yān',
+    0x2438B: 'cuì',
+    0x24397: 'jí',
+    0x24398: 'shāng',
+    0x243A3: 'è',
+    0x243A4: 'láo',
+    0x243A5: 'tǎn,chān',
+    0x243A7: 'zhù',
+    0x243AD: 'lǐn,yǐn',
+    0x243AF: 'zēng',
+    0x243B1: 'juǎn',
+    0x243B2: 'hū',
+    0x243D7: 'shěn',
+    0x243D8: 'huò',
+    0x243DC: 'kuì',
+    0x243F1: 'chù',
+    0x243F2: 'zhòu',
+    0x243F6: 'āo',
+    0x243F8: 'zhuó',
+    0x243FD: 'xīng',
+    0x243FF: 'miè',
+    0x24400: 'hū',
+    0x24414: 'tán',
+    0x24419: 'bì',
+    0x24423: 'dǐng',
+    0x24429: 'kài',
+    0x2442B: 'biāo',
+    0x24430: 'huò',
+    0x24431: 'liè',
+    0x24432: 'cuàn',
+    0x24443: 'xiàn',
+    0x24444: 'rè',
+    0x24453: 'yuè',
+    0x24455: 'xūn',
+    0x24457: 'liǎo,zhāo',
+    0x24463: 'shā',
+    0x24466: 'shì',
+    0x2446A: 'xiè',
+    0x24473: 'xiāo',
+    0x24477: 'yé',
+    0x24478: 'lǎn',
+    0x24479: 'yì',
+    0x2447F: 'liǎn',
+    0x24494: 'bó',
+    0x24495: 'cāo',
+    0x2449D: 'yào',
+    0x244A6: 'liàn,yàn',
+    0x244BB: 'tà',
+    0x244D1: 'jì',
+    0x244D4: 'xī',
+    0x244D5: 'zhì',
+    0x244DA: 'xī',
+    0x244DD: 'yuè',
+    0x244E4: 'xiǎn',
+    0x244E6: 'zhuò',
+    0x244EF: 'zhǎng,jú',
+    0x244F5: 'zǔ',
+    0x244F7: 'ná',
+    0x244FE: 'dào',
+    0x244FF: 'liè',
+    0x24500: 'ná',
+    0x24509: 'páo',
+    0x2450B: 'jù',
+    0x24516: 'luǒ',
+    0x24519: 'shuǎ',
+    0x2451A: 'shàng',
+    0x2451D: 'luǒ',
+    0x2451F: 'fēn',
+    0x24523: 'bào',
+    0x24528: 'lì',
+    0x2452B: 'xiòng',
+    0x24536: 'dāng',
+    0x24540: 'chèng',
+    0x24544: 'zhǎng',
+    0x24547: 'sǒu',
+    0x2454A: 'shén',
+    0x24552: 'gě',
+    0x24558: 'yū,wù',
+    0x2455A: 'huī',
+    0x2455B: 'chè',
+    0x2455D: 'jiào,bó',
+    0x2455E: 'zhù',
+    0x2455F: 'shū',
+    0x24562: 'xiáo',
+    0x24566: 'níng',
+    0x2456D: 'jiāng',
+    0x2456F: 'jiāng,zhuàng',
+    0x24577: 'diào',
+    0x2457D: 'qiáng',
+    0x2457E: 'qiú,fǔ',
+    0x24580: 'fēng',
+    0x24586: 'zhàn',
+    0x24587: 'kē',
+    0x24592: 'dié',
+    0x24593: 'zé',
+    0x24596: 'guāng',
+    0x24597: 'sè',
+    0x24598: 'fèn,fén',
+    0x2459B: 'jiǎng',
+    0x2459D: 'yán',
+    0x2459E: 'zhì',
+    0x245A2: 'lì',
+    0x245A6: 'líng',
+    0x245AA: 'yí',
+    0x245AC: 'qǔ',
+    0x245AD: 'pán',
+    0x245AE: 'gōu',
+    0x245B0: 'jiǎ',
+    0x245B1: 'hé',
+    0x245B3: 'pèng',
+    0x245B5: 'jù',
+    0x245B7: 'chè',
+    0x245BA: 'liè',
+    0x245BB: 'shì',
+    0x245BC: 'pò',
+    0x245BD: 'xiàng',
+    0x245BF: 'pì',
+    0x245C0: 'luǒ',
+    0x245C1: 'cù',
+    0x245C3: 'yǔ',
+    0x245C7: 'kòng',
+    0x245C8: 'xiè',
+    0x245CD: 'wǎn',
+    0x245CE: 'yǎn',
+    0x245CF: 'péi',
+    0x245D3: 'chéng',
+    0x245D8: 'tí',
+    0x245D9: 'chè,tuò',
+    0x245DA: 'bì',
+    0x245DB: 'liàn',
+    0x245DC: 'jiǎ',
+    0x245DE: 'tíng',
+    0x245E2: 'tī',
+    0x245E8: 'dié',
+    0x245EA: 'shù',
+    0x245EB: 'lí',
+    0x245EC: 'lǘ',
+    0x245ED: 'xià,xiā',
+    0x245EF: 'cuī',
+    0x245F3: 'bō',
+    0x245F4: 'tuí',
+    0x245F5: 'pú',
+    0x245F7: 'lìn',
+    0x245F8: 'fèn,fén',
+    0x245FA: 'bó',
+    0x245FB: 'chàn',
+    0x245FE: 'dāng',
+    0x245FF: 'tǎi',
+    0x24600: 'dào',
+    0x24603: 'lì',
+    0x24605: 'yá',
+    0x24606: 'yá',
+    0x24607: 'zhān',
+    0x2460A: 'yí',
+    0x2460C: 'qī',
+    0x24614: 'hù',
+    0x24616: 'tīng',
+    0x24618: 'kǒu',
+    0x2461B: 'chún',
+    0x2461C: 'yóu',
+    0x2461D: 'fèn',
+    0x2461F: 'nuó',
+    0x24620: 'tiàn',
+    0x24621: 'jìn',
+    0x24622: 'pí',
+    0x24623: 'chén',
+    0x24624: 'pì',
+    0x24626: 'jiè',
+    0x24627: 'guǐ',
+    0x24632: 'zhuàng',
+    0x24635: 'hú',
+    0x24636: 'chǒu',
+    0x24637: 'shù',
+    0x24638: 'tāo',
+    0x24639: 'pí',
+    0x2463A: 'rǒng',
+    0x2463B: 'rǒng',
+    0x2463D: 'hǒu',
+    0x2463E: 'pēng',
+    0x24645: 'bài',
+    0x24647: 'xiá',
+    0x2464B: 'qǐn',
+    0x2464C: 'nǐ',
+    0x2464E: 'tāo',
+    0x2464F: 'qù',
+    0x24652: 'xié',
+    0x24654: 'zhào',
+    0x24655: 'huā',
+    0x24656: 'xīn',
+    0x24658: 'shōu',
+    0x2465B: 'tú',
+    0x2465D: 'liáng',
+    0x2465E: 'bì',
+    0x2465F: 'chū',
+    0x24661: 'xīng',
+    0x24663: 'xīn',
+    0x24664: 'fū',
+    0x24669: 'jiè',
+    0x2466D: 'fǔ',
+    0x24670: 'tè',
+    0x24671: 'shè',
+    0x24674: 'chāo',
+    0x24675: 'chuī',
+    0x2467C: 'rán',
+    0x2467D: 'hǒu',
+    0x2467E: 'bēng',
+    0x24680: 'cǎi',
+    0x24685: 'mú',
+    0x24689: 'xū',
+    0x2468A: 'dié',
+    0x2468D: 'chǎn',
+    0x2468E: 'yú',
+    0x2468F: 'zhòng',
+    0x24693: 'lí',
+    0x24694: 'shōu',
+    0x2469A: 'dú',
+    0x2469C: 'māo',
+    0x2469D: 'huáng',
+    0x2469F: 'táo',
+    0x246A1: 'dù',
+    0x246A2: 'tí',
+    0x246A3: 'shēng',
+    0x246A4: 'méi',
+    0x246A8: 'zhēn',
+    0x246A9: 'qín',
+    0x246AA: 'pì',
+    0x246AB: 'táng',
+    0x246AC: 'cāng',
+    0x246AD: 'yáo',
+    0x246AF: 'xiù',
+    0x246B0: 'bāng',
+    0x246B1: 'gǔ',
+    0x246B5: 'bù',
+    0x246BC: 'gòu',
+    0x246BD: 'bó',
+    0x246C1: 'wèn',
+    0x246C4: 'jì',
+    0x246CA: 'lā',
+    0x246CD: 'cuī',
+    0x246CE: 'mǐn',
+    0x246CF: 'cǔ',
+    0x246D0: 'ōu',
+    0x246D1: 'yōng',
+    0x246D6: 'máo',
+    0x246D7: 'kè',
+    0x246D8: 'māng',
+    0x246D9: 'dǐng',
+    0x246DA: 'huān',
+    0x246DB: 'duǒ',
+    0x246DC: 'jiāng',
+    0x246DD: 'sù',
+    0x246E2: 'céng',
+    0x246E3: 'tà',
+    0x246E5: 'huáng',
+    0x246E6: 'jué',
+    0x246E7: 'xún',
+    0x246EA: 'xiòng',
+    0x246EC: 'mì',
+    0x246ED: 'qún',
+    0x246EE: 'láo',
+    0x246F1: 'zhì',
+    0x246F2: 'wěi,wéi',
+    0x246F7: 'sè',
+    0x246FB: 'zāng',
+    0x24701: 'ǎn',
+    0x24702: 'wèi,guì',
+    0x24704: 'huái,huài',
+    0x24707: 'zhàn',
+    0x24709: 'yīng',
+    0x2470A: 'gē',
+    0x2470B: 'huì',
+    0x2470D: 'quán',
+    0x24713: 'liè',
+    0x24714: 'jú',
+    0x24715: 'bà',
+    0x24716: 'léi',
+    0x24718: 'mán',
+    0x24719: 'líng',
+    0x2471C: 'lì',
+    0x2471D: 'jǐ',
+    0x24721: 'huí',
+    0x24722: 'xìn',
+    0x24723: 'shì,shé',
+    0x24724: 'zhé',
+    0x24727: 'bō',
+    0x2472B: 'chā',
+    0x2472F: 'chā',
+    0x24730: 'jīng',
+    0x24731: 'bā',
+    0x24732: 'bèi,pèi',
+    0x24735: 'yàn',
+    0x24737: 'hù',
+    0x24739: 'yú',
+    0x2473B: 'bì,pí',
+    0x2473C: 'chuán',
+    0x2473E: 'jǐ',
+    0x24742: 'mù',
+    0x24744: 'máo',
+    0x24745: 'zhōng',
+    0x24747: 'yè',
+    0x24748: 'dōu',
+    0x24749: 'yě',
+    0x2474D: 'rì',
+    0x2474E: 'yīn',
+    0x24750: 'hào',
+    0x24752: 'nà',
+    0x24753: 'tiè',
+    0x24754: 'fù,chái',
+    0x24755: 'mǔ',
+    0x24756: 'zǎi',
+    0x24758: 'hú',
+    0x2475A: 'chēn',
+    0x2475B: 'tuó',
+    0x2475E: 'chù',
+    0x2475F: 'fú,fèi',
+    0x24767: 'bào',
+    0x2476C: 'dǐ',
+    0x2476D: 'cǎi',
+    0x2476E: 'lù',
+    0x2476F: 'pǒ',
+    0x24770: 'dá',
+    0x24771: 'yè',
+    0x24773: 'yǐ',
+    0x24777: 'xiáng',
+    0x24778: 'bī',
+    0x24779: 'zhū',
+    0x2477B: 'yí',
+    0x2477D: 'lǜ',
+    0x2477F: 'kuāng',
+    0x24782: 'zhì',
+    0x24787: 'wá,kuáng',
+    0x24788: 'dī',
+    0x24789: 'shù',
+    0x2478A: 'liè',
+    0x2478B: 'zǎo',
+    0x2478C: 'zhì',
+    0x2478D: 'náo',
+    0x24797: 'chái',
+    0x2479A: 'xiāo',
+    0x2479B: 'zàng',
+    0x2479E: 'yù',
+    0x2479F: 'dòu',
+    0x247A0: 'chà',
+    0x247A1: 'xié',
+    0x247A2: 'yáng',
+    0x247A4: 'xiǎn',
+    0x247A5: 'bǎo',
+    0x247AE: 'zhài,zhāi',
+    0x247B0: 'qiú',
+    0x247B2: 'hú',
+    0x247B3: 'zài',
+    0x247B4: 'jué',
+    0x247B6: 'hān,hàn',
+    0x247BF: 'àn',
+    0x247C0: 'zào',
+    0x247C3: 'shà',
+    0x247C5: 'xiàn',
+    0x247C6: 'chǐ',
+    0x247C7: 'yǎn',
+    0x247C9: 'àn',
+    0x247CD: 'zhé',
+    0x247CE: 'jué',
+    0x247D1: 'lì',
+    0x247D3: 'lè',
+    0x247D6: 'cǎi',
+    0x247D8: 'lù',
+    0x247DA: 'jiā',
+    0x247DD: 'xià',
+    0x247DE: 'xiào',
+    0x247DF: 'yān',
+    0x247E0: 'xū',
+    0x247E2: 'dùn',
+    0x247E3: 'yíng',
+    0x247E4: 'huī,xūn',
+    0x247E5: 'tí',
+    0x247E6: 'nóu',
+    0x247E7: 'xǐ',
+    0x247EA: 'tú',
+    0x247F7: 'wāi',
+    0x247F8: 'chēn',
+    0x247FC: 'hōng',
+    0x247FE: 'tí',
+    0x247FF: 'xuān',
+    0x24800: 'zá',
+    0x24807: 'gé',
+    0x2480B: 'lóu',
+    0x2480C: 'chái',
+    0x2480D: 'pán',
+    0x2480E: 'jí',
+    0x24810: 'tà',
+    0x24813: 'xī',
+    0x24816: 'xiāo',
+    0x24818: 'sāo',
+    0x24819: 'jiā',
+    0x2481A: 'sù',
+    0x2481B: 'huāng',
+    0x2481D: 'cuō',
+    0x2481F: 'tà',
+    0x24820: 'shuāi',
+    0x2482A: 'fú',
+    0x2482B: 'lì',
+    0x2482D: 'shè',
+    0x2482F: 'táng',
+    0x24836: 'diān',
+    0x2483A: 'bì',
+    0x2483C: 'gòu',
+    0x2483D: 'cù',
+    0x2483F: 'qiān',
+    0x24842: 'léi,lěi',
+    0x24843: 'sù',
+    0x24846: 'zòng,zōng',
+    0x24847: 'hāo',
+    0x2484F: 'chì',
+    0x24850: 'cáo',
+    0x24853: 'wò',
+    0x24854: 'xiāo',
+    0x24855: 'liè,wěn',
+    0x24856: 'yán,yān',
+    0x2485D: 'bì',
+    0x2485F: 'huàn',
+    0x24861: 'xī',
+    0x24862: 'chī',
+    0x24863: 'xū',
+    0x24864: 'náo,nà,rú',
+    0x24865: 'yán,xiàn',
+    0x24867: 'xiè',
+    0x24868: 'zhá',
+    0x2486A: 'suì,wěi',
+    0x2486C: 'xì',
+    0x2486D: 'bēng,péng',
+    0x2486E: 'rán',
+    0x2486F: 'shuò,xī,què',
+    0x24870: 'bān',
+    0x24871: 'guì',
+    0x24872: 'kāi',
+    0x24873: 'chēn',
+    0x24876: 'xù',
+    0x2487E: 'è',
+    0x2487F: 'lì',
+    0x24880: 'xī',
+    0x24881: 'huàn',
+    0x24882: 'sù',
+    0x24884: 'chǎng',
+    0x2488A: 'lù',
+    0x2488B: 'yán',
+    0x2488E: 'dāng',
+    0x2488F: 'dǎn',
+    0x24890: 'yāng',
+    0x24892: 'zhǎi',
+    0x24893: 'jù,qú',
+    0x24895: 'duó',
+    0x24896: 'sāo,shān',
+    0x24897: 'lái',
+    0x24898: 'sù',
+    0x2489F: 'zé',
+    0x248A3: 'bì',
+    0x248A6: 'yìn',
+    0x248A8: 'hāo',
+    0x248AA: 'liè',
+    0x248AD: 'háo',
+    0x248AE: 'yáng',
+    0x248B4: 'shuò,lì',
+    0x248B5: 'lài,ài',
+    0x248B6: 'qióng',
+    0x248B9: 'lěi',
+    0x248BA: 'xié',
+    0x248BC: 'shì',
+    0x248C3: 'lǔ',
+    0x248C5: 'què',
+    0x248C6: 'lián',
+    0x248CC: 'xiào',
+    0x248CE: 'yīng',
+    0x248D1: 'xié',
+    0x248D8: 'líng',
+    0x248D9: 'yōu',
+    0x248DE: 'dǎng',
+    0x248DF: 'lǎn',
+    0x248E0: 'xiāo',
+    0x248E8: 'yì',
+    0x248EC: 'wū',
+    0x248EE: 'yì',
+    0x248EF: 'tuō',
+    0x248F0: 'bǔ',
+    0x248F2: 'xìn',
+    0x248F5: 'sī',
+    0x248F6: 'jīn',
+    0x248F8: 'bā',
+    0x248F9: 'fǎ',
+    0x248FB: 'mò',
+    0x248FC: 'ruò',
+    0x2490A: 'dà',
+    0x2490B: 'jì',
+    0x24910: 'sù',
+    0x24911: 'qióng',
+    0x24912: 'bā',
+    0x24926: 'tián',
+    0x24927: 'yóu',
+    0x24929: 'tuó',
+    0x2492B: 'wài',
+    0x2492C: 'yòu',
+    0x2492E: 'dōng',
+    0x24931: 'xǐ',
+    0x24932: 'kǒng',
+    0x24936: 'qióng',
+    0x24937: 'duī',
+    0x24938: 'duò',
+    0x2493A: 'yì',
+    0x24952: 'xī',
+    0x24953: 'qīn',
+    0x24954: 'sù',
+    0x24957: 'liú',
+    0x24959: 'wán',
+    0x2496D: 'chē',
+    0x2496E: 'zhū',
+    0x24970: 'mào',
+    0x24977: 'quán',
+    0x2497D: 'yū',
+    0x2497F: 'yì',
+    0x24980: 'mí',
+    0x24983: 'lái',
+    0x24984: 'zhì',
+    0x249A4: 'ní',
+    0x249A6: 'bān',
+    0x249AA: 'dōng',
+    0x249AE: 'zhì',
+    0x249D5: 'yì',
+    0x249D8: 'líng',
+    0x249D9: 'yú',
+    0x249DA: 'cōng',
+    0x249DB: 'dì',
+    0x249DC: 'zhì',
+    0x249E0: 'ruǎn',
+    0x249E3: 'jiàn',
+    0x249E9: 'wàn',
+    0x249EB: 'jīn,jìn,duī',
+    0x249ED: 'páng',
+    0x24A0D: 'lù',
+    0x24A0E: 'qú',
+    0x24A10: 'xǐ,tāo',
+    0x24A11: 'dá',
+    0x24A16: 'hù',
+    0x24A17: 'luǒ',
+    0x24A19: 'lè',
+    0x24A36: 'gǒng',
+    0x24A3B: 'lìng',
+    0x24A42: 'láo',
+    0x24A44: 'zhuàn',
+    0x24A68: 'zǎo',
+    0x24A69: 'hào',
+    0x24A6A: 'xiàng',
+    0x24A6D: 'hào',
+    0x24A6E: 'lì',
+    0x24A71: 'diàn,tiàn',
+    0x24A72: 'gé',
+    0x24A7D: 'huán',
+    0x24A84: 'è',
+    0x24A86: 'xiá',
+    0x24A8B: 'jiān',
+    0x24A8C: 'qí',
+    0x24A8D: 'xiá',
+    0x24A8E: 'yǒu',
+    0x24AA1: 'zhēng',
+    0x24AAA: 'zhuàn,chūn',
+    0x24AAE: 'chàn',
+    0x24AC9: 'xiè',
+    0x24AD5: 'náo',
+    0x24ADD: 'jì',
+    0x24ADE: 'tián',
+    0x24AE3: 'yǎn',
+    0x24AE7: 'hǎo',
+    0x24AE8: 'xín',
+    0x24AE9: 'líng',
+    0x24AEB: 'bān',
+    0x24AEC: 'běng',
+    0x24AF1: 'gōu',
+    0x24AF2: 'líng',
+    0x24AF5: 'kuò,guó',
+    0x24AF6: 'qià',
+    0x24AF7: 'jiào',
+    0x24AF9: 'ēn',
+    0x24AFA: 'yáo',
+    0x24AFB: 'dū',
+    0x24B01: 'huǒ,guǒ,luǒ',
+    0x24B02: 'dǔ',
+    0x24B03: 'pēi',
+    0x24B0C: 'yuán',
+    0x24B0F: 'lóu',
+    0x24B10: 'xíng',
+    0x24B13: 'lián,liǎn',
+    0x24B14: 'yáo',
+    0x24B15: 'xī',
+    0x24B16: 'yáo',
+    0x24B18: 'xī',
+    0x24B1B: 'lú',
+    0x24B1D: 'yàn',
+    0x24B20: 'quán',
+    0x24B25: 'ráng',
+    0x24B26: 'wà',
+    0x24B27: 'zú',
+    0x24B28: 'fàn',
+    0x24B29: 'yì',
+    0x24B2A: 'dù,kān',
+    0x24B2B: 'suì',
+    0x24B2D: 'pī',
+    0x24B2F: 'hán,qiàn',
+    0x24B31: 'xù',
+    0x24B33: 'gǒng',
+    0x24B35: 'dì',
+    0x24B37: 'nà',
+    0x24B3E: 'duò,tuó',
+    0x24B3F: 'wā',
+    0x24B42: 'niè',
+    0x24B48: 'diào',
+    0x24B49: 'huāng',
+    0x24B4C: 'tí',
+    0x24B4D: 'fàn',
+    0x24B51: 'wú',
+    0x24B52: 'áng',
+    0x24B54: 'píng',
+    0x24B59: 'hán,gān',
+    0x24B5B: 'gāng',
+    0x24B5C: 'lí',
+    0x24B5E: 'dūn',
+    0x24B5F: 'fù',
+    0x24B60: 'nà',
+    0x24B62: 'cèi,suì',
+    0x24B67: 'jiē',
+    0x24B69: 'qìng',
+    0x24B6B: 'yīng',
+    0x24B6C: 'xiáng',
+    0x24B71: 'hú',
+    0x24B74: 'sù',
+    0x24B7B: 'gē',
+    0x24B7C: 'è',
+    0x24B7D: 'xù',
+    0x24B86: 'xī',
+    0x24B8A: 'kāng',
+    0x24B8B: 'guó',
+    0x24B8C: 'jiē',
+    0x24B8D: 'chuán',
+    0x24B8E: 'léi',
+    0x24B8F: 'héng',
+    0x24B90: 'zūn',
+    0x24B95: 'piè',
+    0x24B98: 'dēng',
+    0x24B99: 'xī',
+    0x24B9A: 'léi',
+    0x24B9C: 'shàn',
+    0x24BA7: 'lú',
+    0x24BA9: 'duì',
+    0x24BAA: 'jùn',
+    0x24BAD: 'chàn',
+    0x24BAF: 'xié',
+    0x24BB0: 'wā',
+    0x24BB1: 'zhé',
+    0x24BB3: 'zhuān,guàn',
+    0x24BB7: 'liù',
+    0x24BB8: 'léi',
+    0x24BBC: 'dài',
+    0x24BBD: 'gān',
+    0x24BC4: 'shì',
+    0x24BC7: 'yǎn',
+    0x24BCC: 'gān',
+    0x24BD0: 'yán',
+    0x24BD6: 'suī',
+    0x24BDA: 'zhōng',
+    0x24BDC: 'shì',
+    0x24BE1: 'shèng',
+    0x24BE5: 'chǎn',
+    0x24BF7: 'huáng',
+    0x24BF8: 'yìn',
+    0x24BFB: 'měng',
+    0x24C02: 'ráng',
+    0x24C05: 'xiáng',
+    0x24C08: 'bèi,fú',
+    0x24C0C: 'chuán',
+    0x24C11: 'pú',
+    0x24C19: 'kē,gé',
+    0x24C1A: 'lā,lá',
+    0x24C1D: 'quǎn',
+    0x24C1F: 'hàng',
+    0x24C20: 'chì',
+    0x24C21: 'máng',
+    0x24C26: 'zhà',
+    0x24C2A: 'fèn',
+    0x24C2C: 'chào',
+    0x24C33: 'jǐng',
+    0x24C43: 'liè',
+    0x24C45: 'nà',
+    0x24C46: 'nà',
+    0x24C47: 'tóng',
+    0x24C4B: 'rán',
+    0x24C4C: 'zǔ',
+    0x24C4D: 'pī,pǒ',
+    0x24C4E: 'yǒu',
+    0x24C50: 'shū',
+    0x24C5B: 'liè',
+    0x24C5C: 'shōu',
+    0x24C5D: 'tuǎn',
+    0x24C5F: 'gǎo',
+    0x24C60: 'sháo',
+    0x24C61: 'tuó',
+    0x24C63: 'nán',
+    0x24C67: 'tuǒ',
+    0x24C68: 'gōng',
+    0x24C69: 'diào',
+    0x24C74: 'měng',
+    0x24C75: 'bāng',
+    0x24C77: 'xié',
+    0x24C78: 'sì',
+    0x24C79: 'tǐng',
+    0x24C7A: 'guì',
+    0x24C7D: 'fú',
+    0x24C7E: 'guì',
+    0x24C89: 'guì',
+    0x24C91: 'zhǔ',
+    0x24C93: 'lái',
+    0x24C95: 'lǔn',
+    0x24C96: 'tiǎn',
+    0x24C97: 'rǎn',
+    0x24C9A: 'dōng',
+    0x24CA8: 'juàn',
+    0x24CA9: 'yán',
+    0x24CAC: 'ruán',
+    0x24CAD: 'dǎn',
+    0x24CB0: 'mào',
+    0x24CB6: 'luán,niǎo',
+    0x24CB8: 'xù,zī',
+    0x24CBA: 'xī',
+    0x24CC2: 'má',
+    0x24CC3: 'qī',
+    0x24CC5: 'chà',
+    0x24CC8: 'shāng',
+    0x24CC9: 'hàn',
+    0x24CCA: 'píng',
+    0x24CCE: 'jī',
+    0x24CD3: 'lì',
+    0x24CD5: 'yù',
+    0x24CD6: 'bān,fān',
+    0x24CD8: 'tēng',
+    0x24CDD: 'chóu',
+    0x24CE0: 'chóu',
+    0x24CE4: 'qī',
+    0x24CE5: 'xī',
+    0x24CE6: 'bèi',
+    0x24CEA: 'yè',
+    0x24CED: 'guǎng',
+    0x24CEF: 'zhù',
+    0x24CF3: 'léi,huǐ',
+    0x24CF4: 'léi',
+    0x24CF5: 'chā',
+    0x24D00: 'guǎng,qiāo',
+    0x24D0D: 'dié',
+    0x24D13: 'yǎ',
+    0x24D18: 'niè',
+    0x24D19: 'shū,xū',
+    0x24D1B: 'zhì',
+    0x24D1F: 'zhì',
+    0x24D22: 'zhì',
+    0x24D23: 'pǐ',
+    0x24D25: 'jiū',
+    0x24D26: 'jiū',
+    0x24D27: 'yì',
+    0x24D28: 'yòu,yǒu',
+    0x24D2A: 'jiū',
+    0x24D2F: 'huàn',
+    0x24D31: 'dù',
+    0x24D3B: 'táo',
+    0x24D3C: 'qiè,cí',
+    0x24D3D: 'qín',
+    0x24D3E: 'xìn',
+    0x24D3F: 'chān',
+    0x24D40: 'jì',
+    0x24D42: 'qìn',
+    0x24D4A: 'dù',
+    0x24D4B: 'zhī',
+    0x24D4E: 'ǒu',
+    0x24D50: 'wù',
+    0x24D52: 'wén',
+    0x24D58: 'bì',
+    0x24D5B: 'bēi',
+    0x24D5D: 'mǔ',
+    0x24D5E: 'jìn',
+    0x24D5F: 'táo',
+    0x24D60: 'liáo',
+    0x24D65: 'cáo,zhǒu',
+    0x24D66: 'zhá',
+    0x24D6C: 'chǐ',
+    0x24D6D: 'yā',
+    0x24D6E: 'kuí',
+    0x24D6F: 'yìn',
+    0x24D78: 'lóng,pāng',
+    0x24D79: 'qià',
+    0x24D7B: 'hāng',
+    0x24D7C: 'shàng,shāng',
+    0x24D7D: 'hài',
+    0x24D7E: 'chā',
+    0x24D80: 'jiǎo',
+    0x24D81: 'lǎo',
+    0x24D88: 'xī',
+    0x24D8B: 'bó',
+    0x24D93: 'zhǐ',
+    0x24D95: 'tùn',
+    0x24D96: 'fú',
+    0x24D98: 'hū',
+    0x24D9A: 'niè',
+    0x24D9B: 'yì',
+    0x24D9C: 'zhuàng',
+    0x24DA0: 'chá',
+    0x24DA4: 'suān',
+    0x24DA7: 'yùn',
+    0x24DAE: 'dù',
+    0x24DB0: 'xī',
+    0x24DB1: 'chuàn',
+    0x24DB2: 'xíng',
+    0x24DB3: 'jiǎo',
+    0x24DB4: 'shēn',
+    0x24DC0: 'wāng',
+    0x24DC1: 'bēi',
+    0x24DC2: 'féi',
+    0x24DC3: 'jiàn',
+    0x24DC4: 'quán',
+    0x24DC5: 'yì,yá',
+    0x24DC6: 'dōng',
+    0x24DC7: 'xù',
+    0x24DC8: 'nà,niè',
+    0x24DC9: 'jí',
+    0x24DCC: 'zhěn',
+    0x24DCD: 'qí',
+    0x24DCE: 'duī',
+    0x24DCF: 'yín',
+    0x24DD1: 'jiù',
+    0x24DD2: 'pí,bì,bēi',
+    0x24DD3: 'xìn',
+    0x24DD4: 'lún',
+    0x24DD5: 'cǎi',
+    0x24DD6: 'lìng',
+    0x24DD7: 'biē',
+    0x24DD8: 'dào',
+    0x24DD9: 'dé',
+    0x24DDF: 'la',
+    0x24DE1: 'xī,nüè',
+    0x24DE2: 'jù',
+    0x24DE4: 'xiáo',
+    0x24DE6: 'jīng',
+    0x24DF9: 'wài',
+    0x24DFB: 'nǎo',
+    0x24DFC: 'xiāng',
+    0x24DFD: 'què',
+    0x24DFE: 'qiè',
+    0x24DFF: 'tū',
+    0x24E00: 'xǔ',
+    0x24E01: 'huì',
+    0x24E05: 'mín',
+    0x24E06: 'wěi',
+    0x24E08: 'yóu',
+    0x24E09: 'tuí',
+    0x24E0A: 'dài',
+    0x24E0E: 'kě,hài',
+    0x24E0F: 'nà,niè',
+    0x24E11: 'fù',
+    0x24E12: 'yù',
+    0x24E13: 'zhǐ',
+    0x24E15: 'hān',
+    0x24E16: 'āi',
+    0x24E17: 'fù',
+    0x24E21: 'yāng',
+    0x24E24: 'shí',
+    0x24E26: 'chán',
+    0x24E2A: 'chì',
+    0x24E2B: 'yùn',
+    0x24E2C: 'shuāi',
+    0x24E2E: 'sù',
+    0x24E2F: 'sǎng',
+    0x24E31: 'è,kè,kài,yà',
+    0x24E32: 'zhěng',
+    0x24E33: 'ái',
+    0x24E34: 'suǒ',
+    0x24E35: 'bù',
+    0x24E37: 'qún',
+    0x24E38: 'yì',
+    0x24E39: 'yǎn',
+    0x24E3B: 'nà',
+    0x24E3C: 'wǔ',
+    0x24E47: 'lì',
+    0x24E48: 'lì',
+    0x24E4A: 'xī',
+    0x24E4B: 'jué',
+    0x24E4C: 'shī',
+    0x24E4E: 'yǎ',
+    0x24E5B: 'chén',
+    0x24E5C: 'yíng',
+    0x24E5D: 'bì',
+    0x24E5E: 'chè',
+    0x24E61: 'zhā',
+    0x24E62: 'tuǒ',
+    0x24E63: 'hù',
+    0x24E64: 'téng',
+    0x24E65: 'yìng',
+    0x24E66: 'bǐ',
+    0x24E67: 'níng',
+    0x24E68: 'liàn',
+    0x24E69: 'xìn',
+    0x24E6A: 'yǔ',
+    0x24E72: 'bèi',
+    0x24E74: 'mó',
+    0x24E75: 'duī',
+    0x24E77: 'dǎo',
+    0x24E78: 'qí',
+    0x24E80: 'shuāi',
+    0x24E83: 'xiāo,jiāo,yāo',
+    0x24E84: 'zhǒng,tóng',
+    0x24E85: 'zhuì',
+    0x24E87: 'biàn',
+    0x24E89: 'wěi',
+    0x24E8A: 'xī,sī',
+    0x24E8C: 'dēng',
+    0x24E8E: 'xiē',
+    0x24E8F: 'pān',
+    0x24E90: 'niè',
+    0x24E93: 'bié',
+    0x24E94: 'shè',
+    0x24E95: 'fèi',
+    0x24E96: 'mǐn',
+    0x24E97: 'qì,jì',
+    0x24EAA: 'shàn',
+    0x24EAB: 'suǒ',
+    0x24EB7: 'jí',
+    0x24EBA: 'dǎn,dàn,tán',
+    0x24EBB: 'juàn',
+    0x24EBC: 'lù',
+    0x24EBE: 'ào',
+    0x24EC2: 'yì',
+    0x24EC3: 'shǔ',
+    0x24EC4: 'suì',
+    0x24EC5: 'wèi',
+    0x24EC6: 'wán',
+    0x24EC7: 'chǔ',
+    0x24ECC: 'wò',
+    0x24ED6: 'bì',
+    0x24ED8: 'yǐn',
+    0x24ED9: 'huó',
+    0x24EDC: 'kài,è',
+    0x24EDD: 'níng',
+    0x24EE2: 'ài',
+    0x24EE4: 'lì',
+    0x24EE6: 'zhāi',
+    0x24EF1: 'lù',
+    0x24EF6: 'biàn',
+    0x24EF7: 'pán',
+    0x24EFF: 'guì',
+    0x24F00: 'sū',
+    0x24F01: 'méng',
+    0x24F02: 'xiǎn',
+    0x24F03: 'lòng,lóng',
+    0x24F05: 'qì',
+    0x24F0B: 'chàn',
+    0x24F0C: 'yì',
+    0x24F0D: 'háng',
+    0x24F0F: 'liǎn',
+    0x24F10: 'guàn,huàn',
+    0x24F12: 'wěi,huà',
+    0x24F17: 'jué',
+    0x24F18: 'léi',
+    0x24F19: 'luán',
+    0x24F1A: 'lì',
+    0x24F1C: 'pí',
+    0x24F22: 'huǎn',
+    0x24F2E: 'guī',
+    0x24F33: 'jú',
+    0x24F36: 'dēng',
+    0x24F3A: 'fèi',
+    0x24F41: 'zhī',
+    0x24F43: 'mèi',
+    0x24F45: 'huàn',
+    0x24F49: 'pā',
+    0x24F4A: 'bǐ',
+    0x24F4C: 'pō',
+    0x24F53: 'ér',
+    0x24F55: 'huàn',
+    0x24F63: 'chàng',
+    0x24F65: 'luò',
+    0x24F66: 'fǒu',
+    0x24F6F: 'chóu',
+    0x24F71: 'zú',
+    0x24F72: 'nán',
+    0x24F73: 'xiǎo',
+    0x24F79: 'bài',
+    0x24F7A: 'lù',
+    0x24F7C: 'luò',
+    0x24F7F: 'niàn',
+    0x24F80: 'zé',
+    0x24F84: 'zhù',
+    0x24F85: 'hú',
+    0x24F88: 'huī',
+    0x24F89: 'tǎng',
+    0x24F8A: 'chóu',
+    0x24F91: 'huáng',
+    0x24F92: 'dōu',
+    0x24F9B: 'miào',
+    0x24F9D: 'bó',
+    0x24FA0: 'dì',
+    0x24FA2: 'děng',
+    0x24FA3: 'pū',
+    0x24FA5: 'sōng',
+    0x24FA6: 'chóu',
+    0x24FAB: 'yào',
+    0x24FAC: 'měng',
+    0x24FAD: 'lóng',
+    0x24FB2: 'lián',
+    0x24FB5: 'bié',
+    0x24FBA: 'lǚ',
+    0x24FBF: 'sè',
+    0x24FC0: 'zuó',
+    0x24FC4: 'cún',
+    0x24FC5: 'líng',
+    0x24FC6: 'zhěng',
+    0x24FC7: 'pǐ',
+    0x24FC8: 'báo',
+    0x24FCB: 'què',
+    0x24FCE: 'pī',
+    0x24FCF: 'nàn',
+    0x24FD0: 'pī',
+    0x24FD1: 'bǒ',
+    0x24FD2: 'bèi',
+    0x24FD3: 'fā',
+    0x24FD5: 'mǐn',
+    0x24FD6: 'mò',
+    0x24FD7: 'wà',
+    0x24FD8: 'zhāo',
+    0x24FD9: 'zhì,pí',
+    0x24FDA: 'cū',
+    0x24FDF: 'xún',
+    0x24FE0: 'jí',
+    0x24FE1: 'guì,qí',
+    0x24FE3: 'chéng',
+    0x24FE7: 'hàn',
+    0x24FE8: 'xiào',
+    0x24FE9: 'què',
+    0x24FEB: 'chuò',
+    0x24FED: 'fǔ',
+    0x24FF3: 'qǐn',
+    0x24FF4: 'lù',
+    0x24FF5: 'què',
+    0x24FF6: 'diǎn',
+    0x24FF7: 'qiān',
+    0x24FFC: 'chǎng',
+    0x24FFD: 'tà',
+    0x24FFE: 'bēi',
+    0x25001: 'dù',
+    0x25002: 'běng,bāng',
+    0x25003: 'hòu',
+    0x25008: 'zhǎ',
+    0x25009: 'zhǎ',
+    0x2500E: 'què',
+    0x2500F: 'má',
+    0x25010: 'hán',
+    0x25013: 'liú',
+    0x25014: 'lù',
+    0x25016: 'zī',
+    0x25018: 'pǐ',
+    0x25019: 'zhòu',
+    0x2501B: 'zāo',
+    0x2501D: 'niǔ',
+    0x25020: 'huì',
+    0x25023: 'xué,qiào',
+    0x25025: 'là',
+    0x2502B: 'nóu,rǎn',
+    0x2502C: 'yǎn,yè',
+    0x2502D: 'rǎn',
+    0x2502E: 'nǎo',
+    0x25030: 'là',
+    0x25031: 'guǎng',
+    0x25032: 'dú',
+    0x25035: 'lú',
+    0x25039: 'jiǎn',
+    0x2503A: 'xiè',
+    0x2503B: 'qì',
+    0x2503E: 'xiàng',
+    0x25041: 'guǒ',
+    0x25042: 'jié',
+    0x25043: 'màng',
+    0x25046: 'xiā',
+    0x25047: 'kuī',
+    0x2504E: 'yòng',
+    0x25050: 'hǎi',
+    0x25051: 'mì',
+    0x25052: 'yào',
+    0x25055: 'wēn',
+    0x2505F: 'lì',
+    0x25060: 'juàn,quán,quān',
+    0x25061: 'wū',
+    0x25062: 'qiáo',
+    0x2506E: 'diào',
+    0x2506F: 'chù,chuò',
+    0x25072: 'suō',
+    0x25075: 'chōng',
+    0x25078: 'quān',
+    0x25079: 'shè',
+    0x25082: 'měng',
+    0x25083: 'jù',
+    0x2508B: 'tú',
+    0x25092: 'nóng',
+    0x25093: 'mó',
+    0x25099: 'fèn',
+    0x250A2: 'áo',
+    0x250A3: 'guō',
+    0x250A4: 'hú',
+    0x250A5: 'cán',
+    0x250A6: 'dūn',
+    0x250A7: 'hǎi',
+    0x250A8: 'jiǎo',
+    0x250B0: 'gū',
+    0x250B5: 'jīn',
+    0x250B8: 'yáng',
+    0x250C0: 'chà',
+    0x250CC: 'huī',
+    0x250D4: 'qú',
+    0x250D5: 'kē',
+    0x250DF: 'qīng',
+    0x250E0: 'yì',
+    0x250E3: 'kǎi',
+    0x250E4: 'jiǎo',
+    0x250E7: 'chōu,jiǎo,yǎo',
+    0x250E8: 'bǔ',
+    0x250E9: 'gèn,yǎn',
+    0x250EA: 'jiāo',
+    0x250EB: 'zhī',
+    0x250EE: 'wèn',
+    0x250F0: 'bīn',
+    0x250F4: 'xiòng',
+    0x250F5: 'fàn',
+    0x250F8: 'yí',
+    0x250F9: 'chuàn',
+    0x250FA: 'yào',
+    0x250FD: 'yāng',
+    0x250FE: 'dù',
+    0x250FF: 'yǎn',
+    0x25101: 'méng',
+    0x25107: 'chī,hūn',
+    0x25108: 'mù',
+    0x25109: 'jiāo',
+    0x2510B: 'nǜ',
+    0x2510D: 'guó',
+    0x2510E: 'xuè',
+    0x25111: 'fú',
+    0x25112: 'xuē',
+    0x25113: 'fū',
+    0x25114: 'pèi,pò',
+    0x25115: 'mò',
+    0x25116: 'xī',
+    0x25117: 'wò,nài',
+    0x25118: 'shǎn',
+    0x2511B: 'xī',
+    0x2511C: 'qì',
+    0x2511D: 'miàn',
+    0x25126: 'dǎn',
+    0x25128: 'chǒu',
+    0x25131: 'fèi',
+    0x25132: 'mié',
+    0x25134: 'xuè,jué',
+    0x25135: 'xù,yù',
+    0x25136: 'sī',
+    0x25137: 'jǔ',
+    0x25138: 'mǎo',
+    0x25139: 'bào',
+    0x2513B: 'yí',
+    0x2513C: 'guā',
+    0x2513D: 'nì',
+    0x2513F: 'yí,dì',
+    0x25141: 'zuò',
+    0x25144: 'nǔ',
+    0x25151: 'diàn',
+    0x25152: 'fàn',
+    0x25153: 'yì',
+    0x25154: 'shì',
+    0x25157: 'cū',
+    0x25158: 'zhěn,mí',
+    0x2515E: 'shì',
+    0x2515F: 'jiǎo',
+    0x25160: 'hòu',
+    0x25161: 'ér',
+    0x25166: 'lèi',
+    0x25167: 'xuè',
+    0x25168: 'gèng',
+    0x2516A: 'shōu',
+    0x2516C: 'juān',
+    0x25174: 'jié',
+    0x25175: 'wéi',
+    0x25177: 'shǒu',
+    0x25178: 'jìng',
+    0x2517A: 'xú',
+    0x2517B: 'chòng',
+    0x25185: 'jiāng',
+    0x25186: 'mòu',
+    0x25189: 'yù',
+    0x2518C: 'jué',
+    0x25191: 'tìng',
+    0x25194: 'xiāo',
+    0x25196: 'dōu',
+    0x25198: 'guó',
+    0x25199: 'máng',
+    0x2519A: 'wāng',
+    0x2519B: 'xù',
+    0x2519C: 'wàng',
+    0x2519D: 'suō',
+    0x2519E: 'juàn',
+    0x2519F: 'yuè',
+    0x251A1: 'hán',
+    0x251A3: 'shēn',
+    0x251A5: 'xié',
+    0x251A6: 'liú',
+    0x251A7: 'rún',
+    0x251AF: 'bì',
+    0x251B2: 'nào',
+    0x251B6: 'wàn',
+    0x251B7: 'jiù',
+    0x251B8: 'quē',
+    0x251C4: 'nì',
+    0x251C6: 'mí',
+    0x251C7: 'suō',
+    0x251C9: 'qiǎng',
+    0x251CC: 'hàn,qià',
+    0x251CD: 'zhuó',
+    0x251CE: 'mí',
+    0x251CF: 'xù',
+    0x251D1: 'lǎng',
+    0x251D2: 'jié',
+    0x251D3: 'dìng',
+    0x251D4: 'chàng,zhāng',
+    0x251D5: 'zhì',
+    0x251D6: 'fēi',
+    0x251D7: 'jiá',
+    0x251D8: 'jùn',
+    0x251D9: 'huò',
+    0x251DA: 'qī',
+    0x251DB: 'jū,jù,xì',
+    0x251DC: 'zhūn,guō',
+    0x251DE: 'diàn',
+    0x251DF: 'jiǎo',
+    0x251E0: 'yā',
+    0x251E2: 'zhǎn',
+    0x251ED: 'zhī',
+    0x251EF: 'mài',
+    0x251F0: 'hū',
+    0x251F1: 'xiè',
+    0x251F2: 'shí',
+    0x251F3: 'guī',
+    0x251FF: 'xù',
+    0x25202: 'jí',
+    0x25204: 'chuàng',
+    0x25206: 'mào',
+    0x25207: 'ruán',
+    0x25208: 'xū',
+    0x25209: 'huàn',
+    0x2520A: 'shà',
+    0x2520B: 'jǔ',
+    0x2520F: 'kuàng',
+    0x25211: 'hóu',
+    0x25212: 'guān',
+    0x25213: 'guā',
+    0x25215: 'mí',
+    0x25216: 'dié',
+    0x25217: 'bì',
+    0x25218: 'liǎng',
+    0x25219: 'là',
+    0x2521A: 'shǎn',
+    0x2521B: 'lù',
+    0x2521C: 'xì',
+    0x2521F: 'sǒu',
+    0x2522C: 'ōu',
+    0x2522E: 'léng',
+    0x25237: 'kū',
+    0x25238: 'guī',
+    0x2523B: 'xī',
+    0x2523C: 'pán,pān',
+    0x2523D: 'sè',
+    0x2523E: 'juè',
+    0x2523F: 'hòng',
+    0x25240: 'guàn',
+    0x25241: 'jù',
+    0x25243: 'nài',
+    0x25244: 'huá',
+    0x25245: 'gé',
+    0x25246: 'lì',
+    0x25247: 'gòu',
+    0x25248: 'tì',
+    0x2524A: 'mà',
+    0x2524B: 'téng',
+    0x2524C: 'dá',
+    0x25250: 'qī',
+    0x25251: 'yù,hè',
+    0x25252: 'jiǎo',
+    0x25253: 'miè',
+    0x25254: 'gěng',
+    0x25255: 'mèng,méng',
+    0x25256: 'wèi',
+    0x25258: 'tí',
+    0x25259: 'qí',
+    0x2525C: 'chén',
+    0x2525D: 'dōu',
+    0x2525F: 'pán',
+    0x25270: 'hàn,qià',
+    0x25274: 'mì',
+    0x25275: 'má',
+    0x25276: 'lù',
+    0x25277: 'qī',
+    0x25278: 'kēng',
+    0x2527A: 'dié',
+    0x2527B: 'qì',
+    0x2527C: 'jiāo',
+    0x2527D: 'kāng',
+    0x2527E: 'qiāo',
+    0x2527F: 'mì',
+    0x25280: 'shān,sǎn',
+    0x25287: 'jiān',
+    0x25288: 'lí',
+    0x25289: 'kè',
+    0x2528A: 'xù',
+    0x25291: 'mán,màn',
+    0x25292: 'fèng',
+    0x25293: 'chàn',
+    0x25294: 'huǐ',
+    0x252A7: 'kòu',
+    0x252AA: 'wěi',
+    0x252AB: 'guàn',
+    0x252AC: 'jí',
+    0x252AD: 'zùn',
+    0x252AE: 'huò',
+    0x252AF: 'xié',
+    0x252B4: 'suì',
+    0x252B6: 'ruǎn',
+    0x252B8: 'tè',
+    0x252BC: 'zhèng',
+    0x252BD: 'kūn',
+    0x252BE: 'xiǎng',
+    0x252BF: 'mián',
+    0x252C1: 'xì',
+    0x252CC: 'sā',
+    0x252D9: 'è',
+    0x252DA: 'miè',
+    0x252DB: 'zhǔ',
+    0x252DC: 'zōu',
+    0x252DD: 'měng',
+    0x252DF: 'xī',
+    0x252E1: 'táng',
+    0x252E3: 'jià',
+    0x252E4: 'cháng',
+    0x252E5: 'jí',
+    0x252EE: 'zhuó',
+    0x252FF: 'hè',
+    0x25300: 'chá',
+    0x25301: 'qì',
+    0x25302: 'mián',
+    0x25303: 'zhěn',
+    0x25304: 'kū',
+    0x25305: 'yè',
+    0x25306: 'zhōu',
+    0x25308: 'jiān',
+    0x2530A: 'pàn',
+    0x2530D: 'huī',
+    0x2530F: 'míng',
+    0x25310: 'liù',
+    0x25318: 'shuì',
+    0x2531A: 'mài,yá,shù',
+    0x2531B: 'lí',
+    0x2531E: 'shuò',
+    0x2531F: 'yí',
+    0x25324: 'lì',
+    0x25328: 'xiē,miè',
+    0x25329: 'tè',
+    0x2532A: 'xiū',
+    0x2532D: 'xuàn',
+    0x2532E: 'lì',
+    0x2532F: 'méng',
+    0x25330: 'wéi',
+    0x25331: 'méng',
+    0x2533A: 'yào',
+    0x2533B: 'lán',
+    0x2533C: 'líng',
+    0x2533D: 'yīng',
+    0x2533E: 'yīng',
+    0x2533F: 'lì',
+    0x25340: 'jiǎn',
+    0x25341: 'guī,guì',
+    0x25345: 'guān',
+    0x25346: 'xiè',
+    0x25349: 'shè',
+    0x2534B: 'zuī,xiē,huǐ',
+    0x25353: 'kàn,yǎn',
+    0x25354: 'léi',
+    0x2535A: 'biàn',
+    0x2535D: 'shǔ',
+    0x2535E: 'nǜ',
+    0x2535F: 'xù,yì',
+    0x25363: 'hào',
+    0x25368: 'guǐ',
+    0x2536A: 'zhài',
+    0x2536B: 'láng',
+    0x2536C: 'cuān',
+    0x2536D: 'zhì',
+    0x2536E: 'féng,fēng',
+    0x2536F: 'qīn',
+    0x25371: 'zé',
+    0x25372: 'nà',
+    0x25373: 'niǔ',
+    0x25374: 'yì',
+    0x25377: 'cōng',
+    0x25378: 'shī',
+    0x25379: 'jiǎn',
+    0x2537A: 'zōng',
+    0x2537B: 'yǎn',
+    0x2537C: 'yīng',
+    0x25380: 'ruǎn',
+    0x25382: 'róng',
+    0x25383: 'xì',
+    0x25385: 'guān',
+    0x25386: 'kài',
+    0x25388: 'wù',
+    0x2538A: 'qín',
+    0x2538B: 'cōng',
+    0x2538D: 'zé',
+    0x2538E: 'xiè',
+    0x25390: 'yù',
+    0x25391: 'zàn',
+    0x25392: 'chuāng',
+    0x25393: 'lǐ',
+    0x25394: 'lǐ',
+    0x25395: 'xù',
+    0x25396: 'mí',
+    0x25397: 'xù',
+    0x25398: 'ruǎn',
+    0x2539B: 'guì',
+    0x2539C: 'rǒng',
+    0x2539F: 'máo',
+    0x253A1: 'qín',
+    0x253A2: 'cuàn',
+    0x253A3: 'cuàn',
+    0x253A4: 'cuàn',
+    0x253AE: 'wū',
+    0x253B0: 'fǎ',
+    0x253B1: 'bá',
+    0x253B8: 'qià',
+    0x253B9: 'zhì',
+    0x253BA: 'tiào',
+    0x253C4: 'zhì',
+    0x253C5: 'zhí',
+    0x253C7: 'huàn',
+    0x253C8: 'chóu',
+    0x253CA: 'zhì',
+    0x253CE: 'yǐng',
+    0x253D2: 'wù',
+    0x253D3: 'bēi',
+    0x253D5: 'hóng',
+    0x253D6: 'shěn',
+    0x253D8: 'jué',
+    0x253D9: 'kuì',
+    0x253DC: 'yǐ',
+    0x253DD: 'yà',
+    0x253E0: 'bī',
+    0x253E4: 'kuà',
+    0x253E5: 'qiān',
+    0x253E8: 'zhāo',
+    0x253EA: 'kǎi',
+    0x253EB: 'shāng',
+    0x253EE: 'àn',
+    0x253EF: 'zhé',
+    0x253F0: 'zhì',
+    0x253F7: 'zhì',
+    0x253F9: 'jiǎo',
+    0x25400: 'sī',
+    0x25401: 'pú',
+    0x25402: 'ǒu',
+    0x2540A: 'zhuó',
+    0x25411: 'yīng',
+    0x25413: 'huān',
+    0x25415: 'yà',
+    0x25418: 'shí',
+    0x25419: 'pā,bā',
+    0x2541A: 'pǔ',
+    0x2541E: 'máng',
+    0x2541F: 'chāi',
+    0x25429: 'yún',
+    0x2542C: 'gǔ',
+    0x25439: 'dǎn',
+    0x2543B: 'náo',
+    0x2543D: 'zhé',
+    0x2543F: 'hú',
+    0x25445: 'kēng',
+    0x25447: 'dié',
+    0x25448: 'tīng',
+    0x2544B: 'guài',
+    0x2544E: 'qiōng',
+    0x2544F: 'shǐ',
+    0x25450: 'jiǎ',
+    0x25451: 'ào',
+    0x25452: 'nǎ,kēng',
+    0x25453: 'pǐn',
+    0x25454: 'jiá',
+    0x25461: 'zhè',
+    0x25462: 'bù',
+    0x25463: 'wǒ',
+    0x25465: 'chǎ',
+    0x2546A: 'náo',
+    0x2546B: 'kān,kǎn',
+    0x2546F: 'dú',
+    0x25470: 'guài',
+    0x25471: 'qióng',
+    0x25473: 'róng',
+    0x25474: 'yǐ',
+    0x25475: 'duī',
+    0x25476: 'lěi',
+    0x25478: 'zhōu',
+    0x25479: 'kuā',
+    0x2547A: 'ē',
+    0x2547B: 'xiān',
+    0x2547C: 'diàn',
+    0x2547D: 'nuò',
+    0x2547E: 'è',
+    0x2547F: 'yōng',
+    0x25480: 'wù',
+    0x25481: 'kēng',
+    0x25493: 'zhì',
+    0x25497: 'zhǐ',
+    0x25498: 'xún',
+    0x2549B: 'zhèng',
+    0x2549E: 'yáng',
+    0x254A0: 'huò',
+    0x254A1: 'jí',
+    0x254A2: 'nǎo,lì',
+    0x254A7: 'yà',
+    0x254A8: 'lù',
+    0x254AB: 'fū',
+    0x254AC: 'sǎn',
+    0x254AD: 'chù',
+    0x254AE: 'wěi',
+    0x254B0: 'fǔ',
+    0x254B1: 'kēng',
+    0x254B2: 'sì',
+    0x254B3: 'kàng',
+    0x254B5: 'yì',
+    0x254B6: 'huà',
+    0x254BE: 'yǔ',
+    0x254C3: 'lì',
+    0x254C6: 'lǐn',
+    0x254C7: 'dǔ',
+    0x254C8: 'è',
+    0x254CC: 'qiǎng',
+    0x254CD: 'dú',
+    0x254D0: 'jié',
+    0x254D1: 'chuò',
+    0x254D2: 'xiàn,kàn',
+    0x254D6: 'gǎo',
+    0x254EC: 'dào',
+    0x254F0: 'hōng',
+    0x254FB: 'zōng',
+    0x254FE: 'qì',
+    0x254FF: 'tuó',
+    0x25500: 'hōng',
+    0x25501: 'pǐ',
+    0x25502: 'gèng',
+    0x25504: 'niè',
+    0x25507: 'kōng',
+    0x2550A: 'zhǐ',
+    0x25511: 'xiǎo',
+    0x25521: 'shè',
+    0x25522: 'yú',
+    0x25523: 'jiāng',
+    0x25529: 'qǐ',
+    0x2552A: 'chěn',
+    0x2552B: 'sǎng',
+    0x2552D: 'suǒ',
+    0x2552E: 'qián',
+    0x2552F: 'huì',
+    0x25531: 'shàn',
+    0x25532: 'è',
+    0x2553B: 'qiū',
+    0x2553D: 'kè',
+    0x25540: 'wēng',
+    0x25541: 'zī',
+    0x25542: 'jí',
+    0x25547: 'dǎ',
+    0x25549: 'cuò',
+    0x2554D: 'lǒu',
+    0x2554E: 'kāng',
+    0x2554F: 'kuò',
+    0x25550: 'dí',
+    0x25551: 'qiē,jū',
+    0x25553: 'mò',
+    0x25556: 'guǒ',
+    0x25557: 'hōng',
+    0x25558: 'cháo,suǒ',
+    0x25559: 'hēi',
+    0x25562: 'cáo',
+    0x25563: 'zhé',
+    0x25566: 'gǔn',
+    0x25570: 'xū',
+    0x25571: 'péng,pēng',
+    0x25572: 'jué',
+    0x25575: 'gǎn',
+    0x25576: 'sī',
+    0x25578: 'suì',
+    0x25579: 'què',
+    0x2557B: 'wú,wǔ',
+    0x2557C: 'yán',
+    0x2557D: 'pèng',
+    0x2557E: 'xiǎo',
+    0x2557F: 'pān',
+    0x2558D: 'là',
+    0x25597: 'bèng',
+    0x25598: 'zhěn',
+    0x25599: 'jí',
+    0x2559C: 'jǐn',
+    0x2559D: 'lián',
+    0x2559E: 'kěn',
+    0x255A0: 'zhóu,dú',
+    0x255A8: 'zào',
+    0x255AA: 'lè',
+    0x255AB: 'qī',
+    0x255AC: 'bìng',
+    0x255B5: 'yǐn',
+    0x255B6: 'pīn',
+    0x255BB: 'sǒu',
+    0x255BC: 'lǜ',
+    0x255BE: 'dí',
+    0x255BF: 'dú',
+    0x255C0: 'liǎo',
+    0x255C1: 'zhuó',
+    0x255CA: 'chǎng',
+    0x255D2: 'chèn',
+    0x255D3: 'tà',
+    0x255D9: 'què',
+    0x255DA: 'dào',
+    0x255DD: 'rǎng',
+    0x255DF: 'pò',
+    0x255E6: 'zhōng',
+    0x255E7: 'xiē',
+    0x255EA: 'jiāng',
+    0x255EB: 'qú',
+    0x255EC: 'lěi',
+    0x255ED: 'cà',
+    0x255EE: 'quē',
+    0x255F5: 'xiàng',
+    0x255F6: 'lèi',
+    0x255FA: 'làn',
+    0x255FF: 'lǎ',
+    0x25601: 'lǎ',
+    0x25604: 'yù',
+    0x2560A: 'jiào',
+    0x2560B: 'qín',
+    0x2560C: 'jī',
+    0x2560F: 'gǎn',
+    0x25612: 'yì',
+    0x25620: 'yì',
+    0x25621: 'zhī',
+    0x25624: 'biǎo',
+    0x25625: 'shēng',
+    0x25626: 'jiù,shè',
+    0x2562B: 'hē',
+    0x2562C: 'fú',
+    0x2562E: 'jū',
+    0x25640: 'zuǒ',
+    0x25641: 'yí',
+    0x25646: 'xiàn,zhī',
+    0x25647: 'yí',
+    0x25649: 'sì,tái',
+    0x2564B: 'chuì',
+    0x2564E: 'mò',
+    0x25661: 'zhān',
+    0x25663: 'xún',
+    0x25666: 'rú',
+    0x25668: 'huò',
+    0x2566C: 'shāo',
+    0x25670: 'shòu',
+    0x2567E: 'yòu',
+    0x2567F: 'yù',
+    0x25682: 'jùn',
+    0x25689: 'zī',
+    0x2568A: 'lù',
+    0x2569A: 'chǐ',
+    0x2569B: 'kūn',
+    0x256A0: 'zhùn',
+    0x256A6: 'hóu',
+    0x256A9: 'xǔ',
+    0x256BE: 'zōng',
+    0x256BF: 'yìng',
+    0x256C2: 'zhū',
+    0x256C5: 'liù',
+    0x256D1: 'nù',
+    0x256D8: 'bì',
+    0x256DA: 'chì',
+    0x256DC: 'zǔ',
+    0x256DD: 'féng',
+    0x256DE: 'lù',
+    0x256DF: 'pǔ',
+    0x256E5: 'zhuàn',
+    0x256E7: 'zhé',
+    0x256E8: 'shī',
+    0x256E9: 'yǔ',
+    0x256EA: 'lù',
+    0x256EB: 'liáng',
+    0x256EF: 'jué',
+    0x256F0: 'liào',
+    0x256F1: 'bēng',
+    0x25703: 'yì',
+    0x25704: 'guān',
+    0x2570C: 'ǎo',
+    0x2570F: 'guì',
+    0x25710: 'mǐn',
+    0x25712: 'yǎn',
+    0x25713: 'lán',
+    0x25716: 'bó',
+    0x25719: 'zàn',
+    0x2571A: 'yǒu',
+    0x25725: 'yì',
+    0x25726: 'nǐ,xiǎn',
+    0x2572C: 'nǐ,xiǎn',
+    0x2572D: 'guǒ',
+    0x2572E: 'jùn',
+    0x25730: 'shī',
+    0x25732: 'xiǎn,jiǎn',
+    0x25734: 'qiān',
+    0x25735: 'què',
+    0x25736: 'kuí',
+    0x25740: 'shé',
+    0x25742: 'huò',
+    0x25744: 'wàn',
+    0x2574A: 'fèi',
+    0x2574B: 'fèi',
+    0x2574C: 'jī',
+    0x2574D: 'yù,wáng',
+    0x25751: 'zhī',
+    0x25752: 'guà',
+    0x25754: 'jié',
+    0x25755: 'máng',
+    0x25756: 'hé,xié',
+    0x25758: 'yǒu',
+    0x2575F: 'dù',
+    0x25760: 'sī,xiù',
+    0x25762: 'lì',
+    0x25765: 'jié',
+    0x25766: 'niǔ',
+    0x25767: 'bà',
+    0x25768: 'yú',
+    0x2576E: 'zhī',
+    0x25778: 'hé',
+    0x25779: 'kē',
+    0x2577E: 'dù,zhà',
+    0x2577F: 'jiā',
+    0x25781: 'chēn',
+    0x25783: 'chuì,shù',
+    0x25784: 'hé',
+    0x25785: 'zhǎi',
+    0x2578A: 'mèi',
+    0x2578D: 'hé',
+    0x2578E: 'zǐ',
+    0x2578F: 'zhú',
+    0x25792: 'tuó',
+    0x25798: 'zùn',
+    0x2579A: 'rú',
+    0x2579B: 'duò',
+    0x2579C: 'jiàng',
+    0x257A7: 'héng',
+    0x257A9: 'bēng,hé',
+    0x257AA: 'mò,mǐ',
+    0x257AF: 'zú',
+    0x257B2: 'biē',
+    0x257B4: 'kù',
+    0x257B5: 'jiá',
+    0x257BA: 'zhuō',
+    0x257BC: 'xiū',
+    0x257C3: 'hé',
+    0x257C5: 'qiāo',
+    0x257CD: 'fěi',
+    0x257CE: 'shēng',
+    0x257D2: 'zhuì',
+    0x257D3: 'kuǎn',
+    0x257D4: 'zè',
+    0x257D5: 'xiān',
+    0x257D7: 'bì',
+    0x257D8: 'yì',
+    0x257DA: 'chàng',
+    0x257EA: 'mào',
+    0x257F6: 'wǎn',
+    0x257FD: 'wū',
+    0x257FE: 'kū',
+    0x257FF: 'wǒ',
+    0x25800: 'xīng',
+    0x25801: 'kē',
+    0x25803: 'jiū',
+    0x25804: 'duān',
+    0x25805: 'huàn',
+    0x25808: 'zhì,jì',
+    0x25809: 'cè',
+    0x2580A: 'róu',
+    0x2580B: 'jí',
+    0x2580D: 'yè',
+    0x2581B: 'jīng',
+    0x2581C: 'yàng',
+    0x25821: 'zǒng',
+    0x25829: 'cǎn',
+    0x25831: 'sī',
+    0x25832: 'lì',
+    0x25833: 'gǔ',
+    0x25834: 'chàng',
+    0x25836: 'fěi',
+    0x25837: 'liú',
+    0x25839: 'jié',
+    0x2583A: 'yūn',
+    0x2583D: 'zhì',
+    0x25840: 'chóu',
+    0x25841: 'biē',
+    0x25852: 'jī',
+    0x2585C: 'luó,suì',
+    0x2585D: 'jiān,qiān',
+    0x2585F: 'chuāng',
+    0x25860: 'shuǎng',
+    0x25862: 'lǜ',
+    0x25863: 'jùn',
+    0x25864: 'jiào',
+    0x25866: 'tì,dì',
+    0x25867: 'zhā',
+    0x2586A: 'yì',
+    0x2586C: 'cōng',
+    0x2586D: 'něi',
+    0x2586E: 'jiā',
+    0x25874: 'jì',
+    0x2587D: 'ài',
+    0x25887: 'jiǎn',
+    0x2588A: 'bèn',
+    0x2588C: 'fán',
+    0x2588D: 'hù,suì',
+    0x2588E: 'zùn',
+    0x2588F: 'diàn',
+    0x25890: 'gāo',
+    0x25891: 'gǎo,hào',
+    0x25892: 'láo,lào',
+    0x25894: 'zhuó,zhào',
+    0x2589F: 'hù',
+    0x258A2: 'tuí',
+    0x258A6: 'bì',
+    0x258A7: 'jú,yì',
+    0x258AE: 'huá',
+    0x258B2: 'chéng',
+    0x258B6: 'kuài',
+    0x258B7: 'dāng',
+    0x258B8: 'gé',
+    0x258B9: 'xié',
+    0x258BB: 'jié',
+    0x258BD: 'cān',
+    0x258C6: 'zú',
+    0x258C8: 'pú',
+    0x258CB: 'shǔ',
+    0x258CC: 'bǔ',
+    0x258D7: 'níng',
+    0x258D8: 'yǎn',
+    0x258D9: 'zhòu,còng',
+    0x258DB: 'méng',
+    0x258DD: 'biǎn',
+    0x258DF: 'xiàng',
+    0x258E4: 'lù',
+    0x258E5: 'lí',
+    0x258E9: 'jì',
+    0x258EB: 'miè',
+    0x258EC: 'lèi',
+    0x258EE: 'zhì',
+    0x258EF: 'yōu',
+    0x258F0: 'biǎn',
+    0x258F8: 'mù',
+    0x258F9: 'ràn',
+    0x258FA: 'ràn',
+    0x25902: 'niǎo',
+    0x2590A: 'quán',
+    0x2590B: 'zhé',
+    0x25910: 'lèi,léi',
+    0x25917: 'dǎng',
+    0x25918: 'jué',
+    0x2591C: 'líng',
+    0x2591E: 'líng',
+    0x2591F: 'yán',
+    0x25923: 'yǎo',
+    0x25924: 'zhèn',
+    0x25925: 'qī',
+    0x25926: 'ài',
+    0x25928: 'nú',
+    0x25929: 'mǎng',
+    0x25931: 'kǎn,hān',
+    0x25933: 'jiū,cuàn',
+    0x25934: 'yǎn',
+    0x25935: 'miàn',
+    0x25937: 'yín',
+    0x25938: 'wán',
+    0x25939: 'yào,yǎo',
+    0x2593A: 'wā',
+    0x2593B: 'pí',
+    0x2593C: 'suì',
+    0x25945: 'kǒng',
+    0x25948: 'hóng,wòng',
+    0x2594A: 'mǐng',
+    0x2594B: 'líng',
+    0x2594C: 'yì,dié',
+    0x2594D: 'shēn,shèn',
+    0x2594F: 'zuò',
+    0x2595B: 'tū,bá',
+    0x2595D: 'yòng',
+    0x2595F: 'wà',
+    0x25960: 'guǐ',
+    0x25961: 'hòng',
+    0x25965: 'shì',
+    0x25967: 'xiòng',
+    0x25969: 'ā,xiàng',
+    0x25971: 'chéng',
+    0x25973: 'kēng',
+    0x25974: 'yì',
+    0x25975: 'yàng',
+    0x25976: 'tíng',
+    0x25977: 'dòu',
+    0x25978: 'chá',
+    0x25979: 'liù',
+    0x2597D: 'qiú',
+    0x2597E: 'xuǎn',
+    0x2597F: 'shēn',
+    0x25980: 'kuān,mì',
+    0x25981: 'tòng',
+    0x25983: 'qiǎn',
+    0x25985: 'chòu',
+    0x2598A: 'wěn',
+    0x2598C: 'lòng',
+    0x2598D: 'ǎn,yǎn',
+    0x25994: 'kǎn',
+    0x25996: 'yǎo',
+    0x25998: 'fú',
+    0x2599C: 'bèng',
+    0x2599D: 'lǎn',
+    0x2599E: 'qià',
+    0x2599F: 'diàn',
+    0x259A2: 'jiào',
+    0x259A3: 'guī',
+    0x259A5: 'xiòng',
+    0x259A8: 'kè',
+    0x259B6: 'xiàn',
+    0x259B7: 'wòng',
+    0x259C2: 'gǒng',
+    0x259C6: 'ǒu',
+    0x259C7: 'kē,cháo',
+    0x259CB: 'kū',
+    0x259D1: 'tián,diān,yǎn,chǎn',
+    0x259D2: 'gòu',
+    0x259D3: 'mǎ',
+    0x259D5: 'liù',
+    0x259D9: 'wèi',
+    0x259DA: 'wěn',
+    0x259E1: 'gòng',
+    0x259E3: 'tú',
+    0x259E4: 'níng',
+    0x259E7: 'mì',
+    0x259EB: 'láng',
+    0x259EC: 'qiǎn',
+    0x259ED: 'mán',
+    0x259EE: 'zhé',
+    0x259F0: 'huà',
+    0x259F1: 'yōng',
+    0x259F2: 'jìn,jǐn',
+    0x259F4: 'mèi',
+    0x259F7: 'fú',
+    0x259FB: 'qú',
+    0x25A0C: 'liù',
+    0x25A0D: 'fù',
+    0x25A0E: 'dàn',
+    0x25A10: 'gǒng',
+    0x25A12: 'cuì,cuàn',
+    0x25A15: 'xǐng',
+    0x25A1C: 'tū',
+    0x25A1D: 'shòu',
+    0x25A2A: 'qióng',
+    0x25A33: 'róng',
+    0x25A3B: 'lì',
+    0x25A3F: 'jī',
+    0x25A40: 'tuò',
+    0x25A4C: 'tóng',
+    0x25A52: 'tán',
+    0x25A54: 'líng',
+    0x25A56: 'yì',
+    0x25A57: 'ruǎn',
+    0x25A59: 'pǎ',
+    0x25A5D: 'cà',
+    0x25A61: 'yuè',
+    0x25A62: 'què',
+    0x25A63: 'zhù',
+    0x25A64: 'hài',
+    0x25A71: 'fá',
+    0x25A72: 'hài',
+    0x25A80: 'bū',
+    0x25A81: 'pīng',
+    0x25A82: 'liè',
+    0x25A8A: 'kuǐ,jué',
+    0x25A8B: 'fú',
+    0x25A8C: 'tiǎn',
+    0x25A8D: 'wò',
+    0x25A8F: 'jū',
+    0x25A98: 'zhēn',
+    0x25A9A: 'fú',
+    0x25AA2: 'lóng',
+    0x25AA6: 'xì',
+    0x25AA7: 'tián',
+    0x25AAB: 'jì',
+    0x25AAF: 'yào,qiáo',
+    0x25AB1: 'cù',
+    0x25AB4: 'pàng',
+    0x25AB5: 'qiè',
+    0x25ABB: 'lóng',
+    0x25ABC: 'jǐ',
+    0x25AC2: 'tóng',
+    0x25AC3: 'yí',
+    0x25AC5: 'chāng',
+    0x25ACB: 'gōng',
+    0x25ACE: 'dòng',
+    0x25AD6: 'xiāng',
+    0x25AD9: 'tǐng',
+    0x25ADB: 'zhuān',
+    0x25ADC: 'yǐ',
+    0x25ADD: 'yì',
+    0x25ADE: 'zǐ',
+    0x25ADF: 'qǐ',
+    0x25AE2: 'chǎ',
+    0x25AEC: 'dùn',
+    0x25AEF: 'chōng',
+    0x25AF0: 'lù',
+    0x25AF1: 'dùn',
+    0x25AF3: 'fāng',
+    0x25AF4: 'shì',
+    0x25AF5: 'tì',
+    0x25AF6: 'jī',
+    0x25AF7: 'qiū',
+    0x25AF8: 'shuǐ',
+    0x25AF9: 'chén',
+    0x25AFC: 'huàng',
+    0x25AFD: 'shi',
+    0x25B00: 'yún',
+    0x25B06: 'lóng',
+    0x25B08: 'mǎn',
+    0x25B09: 'gōu',
+    0x25B0D: 'xiān',
+    0x25B0E: 'mò',
+    0x25B10: 'shěn',
+    0x25B12: 'pō',
+    0x25B13: 'yào',
+    0x25B14: 'qū',
+    0x25B15: 'rǎn',
+    0x25B19: 'jù',
+    0x25B1C: 'yǐn',
+    0x25B1D: 'bái',
+    0x25B1E: 'niè',
+    0x25B20: 'chōu',
+    0x25B2A: 'róng',
+    0x25B2B: 'chuǎn',
+    0x25B2C: 'niè',
+    0x25B2D: 'lì,liè',
+    0x25B2E: 'jiāng',
+    0x25B2F: 'kǎo',
+    0x25B30: 'cè,zhà',
+    0x25B31: 'chòng',
+    0x25B32: 'zhuā,duò',
+    0x25B33: 'zǐ',
+    0x25B34: 'yáng',
+    0x25B3C: 'wěn',
+    0x25B4B: 'jì',
+    0x25B4C: 'jì',
+    0x25B50: 'lǜ',
+    0x25B51: 'qiú',
+    0x25B52: 'dùn',
+    0x25B53: 'báo',
+    0x25B54: 'chān',
+    0x25B56: 'bó',
+    0x25B58: 'chī',
+    0x25B59: 'zhè,niè',
+    0x25B5A: 'màng',
+    0x25B5C: 'jì',
+    0x25B5D: 'miào',
+    0x25B5E: 'yuàn',
+    0x25B60: 'wú',
+    0x25B61: 'zhì',
+    0x25B62: 'pīng',
+    0x25B65: 'chōng',
+    0x25B6B: 'mí',
+    0x25B6C: 'féi',
+    0x25B6D: 'cuō',
+    0x25B6E: 'méng',
+    0x25B8D: 'yín',
+    0x25B8E: 'mǎng',
+    0x25B8F: 'diǎn',
+    0x25B90: 'diāo',
+    0x25B92: 'qián,zhān',
+    0x25B95: 'hàng',
+    0x25B96: 'zhí',
+    0x25B97: 'jú',
+    0x25B98: 'niàn',
+    0x25B9C: 'mí',
+    0x25B9D: 'gǔ',
+    0x25BA3: 'zhuā',
+    0x25BA4: 'niè',
+    0x25BA5: 'zhuó',
+    0x25BA7: 'yè',
+    0x25BA8: 'còng',
+    0x25BAA: 'xū,jí',
+    0x25BAC: 'xì',
+    0x25BAF: 'bō',
+    0x25BBE: 'cǎn,zān',
+    0x25BC3: 'yǎn',
+    0x25BD1: 'jǐn',
+    0x25BD4: 'jǔ',
+    0x25BD5: 'dàng',
+    0x25BD6: 'dù',
+    0x25BD8: 'yé',
+    0x25BD9: 'jìng',
+    0x25BDA: 'kè',
+    0x25BDB: 'luò',
+    0x25BDC: 'wěi',
+    0x25BDD: 'tū',
+    0x25BDE: 'yóu',
+    0x25BDF: 'pài',
+    0x25BE1: 'pí',
+    0x25BE2: 'dìng',
+    0x25BE4: 'wěi',
+    0x25BE5: 'chè',
+    0x25BE6: 'jiàn,shà',
+    0x25BE8: 'sī',
+    0x25BE9: 'zhuó',
+    0x25BEA: 'sòu',
+    0x25BEC: 'ruǎn',
+    0x25BEE: 'yú',
+    0x25BF3: 'è',
+    0x25BF6: 'kǔ',
+    0x25BF8: 'zhù',
+    0x25BFE: 'xiá',
+    0x25C1B: 'fú',
+    0x25C1C: 'táo',
+    0x25C1D: 'xī',
+    0x25C1E: 'chōu,sǒu',
+    0x25C1F: 'yuán',
+    0x25C20: 'lǘ',
+    0x25C21: 'cè',
+    0x25C22: 'shàn',
+    0x25C23: 'liú',
+    0x25C25: 'xì',
+    0x25C26: 'jī',
+    0x25C27: 'yǐ',
+    0x25C28: 'tán',
+    0x25C2A: 'hú',
+    0x25C2D: 'cuō,zhǎ,cī',
+    0x25C2E: 'gě',
+    0x25C30: 'shì,shé',
+    0x25C31: 'sāo',
+    0x25C32: 'hòng',
+    0x25C33: 'xiàn',
+    0x25C36: 'xiá',
+    0x25C3B: 'mù',
+    0x25C3C: 'suǒ',
+    0x25C3E: 'zhài',
+    0x25C40: 'fū',
+    0x25C41: 'sè',
+    0x25C42: 'nú',
+    0x25C43: 'yì',
+    0x25C67: 'qín',
+    0x25C68: 'qìng',
+    0x25C75: 'huì,suì,xí',
+    0x25C76: 'shuǎng',
+    0x25C77: 'dǎn',
+    0x25C78: 'ōu',
+    0x25C79: 'mò',
+    0x25C7A: 'qiān',
+    0x25C7B: 'chì,tú',
+    0x25C7C: 'pái,pì',
+    0x25C7D: 'juàn',
+    0x25C80: 'cháo',
+    0x25C81: 'liè',
+    0x25C82: 'bīng',
+    0x25C83: 'kòu',
+    0x25C84: 'dàn',
+    0x25C85: 'chóu',
+    0x25C86: 'tōng',
+    0x25C87: 'dàn',
+    0x25C88: 'mǎn',
+    0x25C89: 'hù',
+    0x25C8A: 'liáo',
+    0x25C8B: 'xián',
+    0x25C8D: 'cáo',
+    0x25C8E: 'lù',
+    0x25C8F: 'chuàn',
+    0x25C90: 'wú',
+    0x25C91: 'mán',
+    0x25C95: 'zǐ',
+    0x25C97: 'dù',
+    0x25C9A: 'shuàng',
+    0x25C9B: 'fù',
+    0x25C9C: 'jù',
+    0x25C9D: 'zhòu',
+    0x25C9F: 'diào',
+    0x25CA0: 'wàng',
+    0x25CA1: 'chuāng',
+    0x25CA2: 'qiān',
+    0x25CA3: 'tuì',
+    0x25CA5: 'lián',
+    0x25CA6: 'biāo',
+    0x25CA7: 'lí',
+    0x25CAA: 'lí',
+    0x25CC6: 'bì',
+    0x25CC7: 'fù',
+    0x25CC8: 'cuì',
+    0x25CC9: 'dū',
+    0x25CCB: 'zàn,zān',
+    0x25CCC: 'lóng',
+    0x25CCD: 'xún',
+    0x25CCE: 'qióng',
+    0x25CCF: 'jī',
+    0x25CD0: 'qiǎn',
+    0x25CD2: 'jiǎn',
+    0x25CD3: 'shāo',
+    0x25CD4: 'duò',
+    0x25CD5: 'shū',
+    0x25CD6: 'bù',
+    0x25CD7: 'xū',
+    0x25CD8: 'dǒng',
+    0x25CDA: 'rán',
+    0x25CDC: 'yáng',
+    0x25CDD: 'ruǐ',
+    0x25CDE: 'lìn',
+    0x25CDF: 'jiǎn',
+    0x25CE0: 'dì',
+    0x25CE1: 'fén',
+    0x25CE2: 'diàn',
+    0x25CE3: 'zuì',
+    0x25CE5: 'nǐng',
+    0x25CEA: 'suàn',
+    0x25CEB: 'tiǎn',
+    0x25CEC: 'àn',
+    0x25CEF: 'cè',
+    0x25CF0: 'dìng',
+    0x25CF1: 'shēn',
+    0x25CF2: 'dù',
+    0x25CF3: 'tí',
+    0x25CF4: 'jiǎo',
+    0x25CF5: 'zuì',
+    0x25CF6: 'zhǎng',
+    0x25CF7: 'jiǎn',
+    0x25CF8: 'dàn',
+    0x25CF9: 'dǎn',
+    0x25CFA: 'sǒng',
+    0x25D10: 'zhǎn',
+    0x25D11: 'tíng',
+    0x25D12: 'zhì',
+    0x25D15: 'yóu',
+    0x25D16: 'pái',
+    0x25D21: 'lǐ',
+    0x25D24: 'qián',
+    0x25D26: 'suì,dí',
+    0x25D27: 'jǔ',
+    0x25D28: 'ài',
+    0x25D29: 'gé',
+    0x25D2A: 'jù',
+    0x25D2B: 'tún,diàn',
+    0x25D2C: 'bì',
+    0x25D2D: 'qià',
+    0x25D2E: 'bó',
+    0x25D2F: 'huì',
+    0x25D31: 'jiàn',
+    0x25D34: 'gōu',
+    0x25D35: 'suàn',
+    0x25D3A: 'cí',
+    0x25D3B: 'qiàng',
+    0x25D3F: 'yán',
+    0x25D4F: 'diàn',
+    0x25D52: 'miè',
+    0x25D5C: 'pò',
+    0x25D5D: 'lǐng',
+    0x25D5E: 'jié',
+    0x25D5F: 'zhù',
+    0x25D60: 'gǔ',
+    0x25D63: 'duān',
+    0x25D64: 'zhào',
+    0x25D66: 'shǎo',
+    0x25D67: 'qǐn',
+    0x25D68: 'mí',
+    0x25D6A: 'píng',
+    0x25D6B: 'cóng',
+    0x25D6C: 'chōu',
+    0x25D6F: 'sà',
+    0x25D76: 'tiǎn',
+    0x25D85: 'liú',
+    0x25D86: 'lǘ',
+    0x25D87: 'lǔ',
+    0x25D88: 'zōu',
+    0x25D8C: 'lǜ',
+    0x25D8D: 'huǎn',
+    0x25D8F: 'tiáo',
+    0x25D90: 'tuí',
+    0x25D91: 'qiǎng',
+    0x25D92: 'lìn',
+    0x25D93: 'bēi',
+    0x25D94: 'páo',
+    0x25D95: 'zhān',
+    0x25D97: 'lì',
+    0x25D9B: 'tí',
+    0x25D9C: 'hú',
+    0x25DA2: 'liè',
+    0x25DB5: 'huǐ',
+    0x25DB6: 'qū',
+    0x25DB7: 'xuǎn',
+    0x25DB9: 'jìng',
+    0x25DBA: 'dié',
+    0x25DBB: 'suí',
+    0x25DBD: 'wèi',
+    0x25DBF: 'yán',
+    0x25DC0: 'yān',
+    0x25DC1: 'bàn',
+    0x25DC3: 'jiǎng',
+    0x25DC4: 'nǐ',
+    0x25DC5: 'lì',
+    0x25DC6: 'hú',
+    0x25DC7: 'qì',
+    0x25DC8: 'zhōng',
+    0x25DD1: 'bì',
+    0x25DD4: 'yú',
+    0x25DD5: 'dié',
+    0x25DD6: 'lìn',
+    0x25DD7: 'lì',
+    0x25DD8: 'zhuó',
+    0x25DD9: 'jì',
+    0x25DDA: 'jū',
+    0x25DDC: 'fēng',
+    0x25DDE: 'yù',
+    0x25DE8: 'liè',
+    0x25DE9: 'zá',
+    0x25DEA: 'qián',
+    0x25DEB: 'jiē',
+    0x25DEC: 'guān',
+    0x25DEE: 'zhuó,zhāo',
+    0x25DF1: 'fù',
+    0x25DF9: 'sè',
+    0x25DFC: 'cù',
+    0x25E03: 'huǐ',
+    0x25E08: 'dàng',
+    0x25E09: 'lóng',
+    0x25E0A: 'yì',
+    0x25E17: 'sǎ',
+    0x25E18: 'yuè',
+    0x25E1A: 'dí',
+    0x25E21: 'gǎn',
+    0x25E22: 'zān',
+    0x25E23: 'shàn',
+    0x25E24: 'yù',
+    0x25E25: 'bǒ',
+    0x25E27: 'dìng',
+    0x25E28: 'fán,bǒ,bǔ',
+    0x25E2A: 'yù',
+    0x25E2C: 'shēn',
+    0x25E32: 'gōng',
+    0x25E34: 'miè',
+    0x25E35: 'tún',
+    0x25E38: 'liè',
+    0x25E41: 'zhā,zuò',
+    0x25E42: 'pēi',
+    0x25E44: 'mí',
+    0x25E46: 'míng',
+    0x25E47: 'fàn',
+    0x25E49: 'nà',
+    0x25E4A: 'sì',
+    0x25E4B: 'yí',
+    0x25E4C: 'jiā',
+    0x25E4D: 'zhù',
+    0x25E53: 'bān',
+    0x25E54: 'yù',
+    0x25E56: 'pǒ',
+    0x25E5A: 'huān',
+    0x25E5B: 'càn',
+    0x25E5C: 'jiāo',
+    0x25E60: 'tán',
+    0x25E69: 'zhì',
+    0x25E6B: 'mǐ',
+    0x25E6C: 'kǎo',
+    0x25E71: 'yāo',
+    0x25E72: 'duì',
+    0x25E73: 'quǎn,huán',
+    0x25E74: 'bù',
+    0x25E75: 'chù',
+    0x25E76: 'qiǎo',
+    0x25E77: 'liú',
+    0x25E78: 'bó',
+    0x25E7A: 'kāng',
+    0x25E7B: 'fèn',
+    0x25E85: 'dào',
+    0x25E89: 'dòu',
+    0x25E8A: 'gé',
+    0x25E99: 'líng',
+    0x25E9A: 'xí',
+    0x25E9C: 'nì',
+    0x25E9D: 'zhōu',
+    0x25E9E: 'zhōu,yù',
+    0x25EA3: 'chōu',
+    0x25EB4: 'niān',
+    0x25EB5: 'jī',
+    0x25EB7: 'qū',
+    0x25EC4: 'kāi',
+    0x25EC7: 'xiàn',
+    0x25EC9: 'hé',
+    0x25ECB: 'lín',
+    0x25ECD: 'zī',
+    0x25ED1: 'ǒu,lì',
+    0x25ED2: 'cù,mì',
+    0x25ED7: 'chá',
+    0x25EDD: 'zhòng',
+    0x25EDE: 'bú',
+    0x25EE4: 'chōu',
+    0x25EE5: 'xì',
+    0x25EE6: 'sà',
+    0x25EE7: 'xián,jiān',
+    0x25EE8: 'sè',
+    0x25EE9: 'miàn',
+    0x25EEB: 'fán',
+    0x25EEC: 'zhī',
+    0x25EEE: 'cuì',
+    0x25EF4: 'xià',
+    0x25EFE: 'nuò',
+    0x25EFF: 'lí',
+    0x25F00: 'zú',
+    0x25F02: 'cuī',
+    0x25F03: 'zé',
+    0x25F05: 'lí',
+    0x25F18: 'qí',
+    0x25F1A: 'zhuō',
+    0x25F1B: 'cuì',
+    0x25F1C: 'pū',
+    0x25F1E: 'fán',
+    0x25F1F: 'tán',
+    0x25F29: 'zī',
+    0x25F2A: 'zǔ',
+    0x25F2B: 'zhōu',
+    0x25F2C: 'róng',
+    0x25F2D: 'lín',
+    0x25F2E: 'tán',
+    0x25F36: 'shì',
+    0x25F3A: 'cuǐ',
+    0x25F3B: 'zī',
+    0x25F3C: 'fū',
+    0x25F41: 'xiào',
+    0x25F48: 'fēng,lǐ',
+    0x25F4F: 'xiàn',
+    0x25F50: 'jiàn',
+    0x25F52: 'fèn',
+    0x25F57: 'lì',
+    0x25F58: 'mò,miè',
+    0x25F5F: 'yōu',
+    0x25F65: 'huò',
+    0x25F67: 'qū',
+    0x25F6C: 'niàng',
+    0x25F70: 'mí',
+    0x25F73: 'qì',
+    0x25F76: 'hé',
+    0x25F78: 'liàn',
+    0x25F7F: 'zuò',
+    0x25F82: 'líng',
+    0x25F85: 'zhú',
+    0x25F87: 'niǎo',
+    0x25F8A: 'jǐ',
+    0x25F8B: 'réng',
+    0x25F8C: 'jié',
+    0x25F8D: 'gǎn',
+    0x25F90: 'yì',
+    0x25F93: 'zhóu',
+    0x25F95: 'wù',
+    0x25F9A: 'gěng,dǎn',
+    0x25F9B: 'cù',
+    0x25F9D: 'miè,miǎn',
+    0x25FA1: 'xún,jī',
+    0x25FA3: 'zhī',
+    0x25FA4: 'xiáo',
+    0x25FA7: 'fú',
+    0x25FA8: 'hú',
+    0x25FAC: 'dī',
+    0x25FAE: 'jué',
+    0x25FAF: 'diào',
+    0x25FB9: 'shǒu',
+    0x25FBC: 'wǎng',
+    0x25FC3: 'nà',
+    0x25FC4: 'dī',
+    0x25FC5: 'shì',
+    0x25FC6: 'cí',
+    0x25FC7: 'shū',
+    0x25FC9: 'wà,mò',
+    0x25FCA: 'chè',
+    0x25FCB: 'fán,biàn',
+    0x25FCD: 'gū',
+    0x25FCE: 'yuān,wǎn',
+    0x25FD1: 'guān,lún',
+    0x25FDA: 'qiè',
+    0x25FDC: 'zhǎn,zhěn',
+    0x25FDD: 'dài',
+    0x25FDE: 'shē',
+    0x25FE6: 'zhōu',
+    0x25FE7: 'xiǎng',
+    0x25FE8: 'míng',
+    0x25FE9: 'zì',
+    0x25FEA: 'huāng',
+    0x25FEB: 'mí,yì,wèi',
+    0x25FED: 'xì',
+    0x25FEE: 'zhì,shì',
+    0x25FEF: 'pài',
+    0x25FF0: 'duǒ',
+    0x25FF4: 'cì',
+    0x25FF5: 'móu',
+    0x25FF7: 'chào',
+    0x25FF9: 'yì',
+    0x25FFA: 'gōu',
+    0x26007: 'jīng',
+    0x26013: 'zēng,jiē',
+    0x26014: 'pīng',
+    0x26015: 'yè',
+    0x26016: 'jié',
+    0x26018: 'pī,bī',
+    0x2601B: 'shā',
+    0x2601C: 'zhuàng',
+    0x2601D: 'jiǒng',
+    0x26020: 'liú',
+    0x26021: 'yǔ',
+    0x26023: 'jū',
+    0x26028: 'nuò',
+    0x26038: 'mào',
+    0x26044: 'chēn',
+    0x26046: 'zhuàn,juàn,shuàn',
+    0x26047: 'niàn',
+    0x26048: 'kòng',
+    0x26049: 'jiē',
+    0x2604A: 'huà',
+    0x2604D: 'xīn',
+    0x2604E: 'zuó',
+    0x2604F: 'yàn',
+    0x26050: 'jué',
+    0x26055: 'hū',
+    0x26056: 'zhòu',
+    0x26057: 'shè',
+    0x26059: 'yǎn',
+    0x2605B: 'xiè,dié',
+    0x2605C: 'dié',
+    0x2605F: 'chēn,chén,zhěn',
+    0x26072: 'jiǎn',
+    0x26073: 'jì',
+    0x26076: 'chuò',
+    0x26077: 'hóng',
+    0x26080: 'dá',
+    0x26084: 'kāi',
+    0x26085: 'xīng,xǐ',
+    0x26086: 'huì',
+    0x26087: 'jiǎn',
+    0x26088: 'zhòu',
+    0x26089: 'zhǎ',
+    0x2608A: 'fù',
+    0x2608B: 'chì',
+    0x2608C: 'běng',
+    0x2608D: 'nuò',
+    0x26091: 'jì',
+    0x26092: 'qián',
+    0x26094: 'wàn',
+    0x26095: 'óu',
+    0x26096: 'bì',
+    0x26097: 'shuò',
+    0x260A0: 'jīng',
+    0x260A1: 'yè',
+    0x260C4: 'fěi',
+    0x260C7: 'lí',
+    0x260CA: 'lì',
+    0x260CB: 'pí',
+    0x260D2: 'suì',
+    0x260D3: 'liú',
+    0x260D4: 'hé',
+    0x260D5: 'hǔn',
+    0x260D6: 'tǎn',
+    0x260D7: 'shuò',
+    0x260D8: 'zhì',
+    0x260D9: 'bó',
+    0x260DD: 'xì',
+    0x260E1: 'pó,tāo',
+    0x260E2: 'qǔn',
+    0x260E4: 'mù',
+    0x260FD: 'yōng',
+    0x26102: 'dài',
+    0x2610A: 'qǐ',
+    0x2610B: 'diǎo',
+    0x2610C: 'niè',
+    0x2610D: 'shuǎng',
+    0x2610F: 'shāo',
+    0x26110: 'kǔn,mí',
+    0x26111: 'suì',
+    0x26113: 'dōu',
+    0x26114: 'dié',
+    0x2611C: 'gōng',
+    0x2612F: 'zhuǎn',
+    0x26130: 'guó',
+    0x2613C: 'xū',
+    0x2613D: 'qú',
+    0x26140: 'xún',
+    0x26143: 'jiāo,qiāo',
+    0x26144: 'zhé',
+    0x26146: 'diàn',
+    0x26147: 'sāng',
+    0x26148: 'bēng',
+    0x2614A: 'suǒ',
+    0x2614B: 'qiǎn',
+    0x2614F: 'xū',
+    0x26151: 'xún',
+    0x26154: 'mò',
+    0x26175: 'suì',
+    0x26176: 'là,liè',
+    0x26177: 'zhǔ,zhù',
+    0x26178: 'zhòu',
+    0x2617A: 'lì',
+    0x2617C: 'dān',
+    0x2617D: 'jú',
+    0x2617F: 'yùn',
+    0x26180: 'chǎn',
+    0x26181: 'luó',
+    0x26184: 'sè',
+    0x26186: 'lián',
+    0x26188: 'zuǎn,zuí',
+    0x2618B: 'lài',
+    0x2618C: 'shuǎng',
+    0x2618D: 'qiè',
+    0x26198: 'dōu',
+    0x2619E: 'wù',
+    0x2619F: 'méng',
+    0x261A1: 'jì',
+    0x261A4: 'chī',
+    0x261A6: 'nǐ',
+    0x261B8: 'yáo',
+    0x261BB: 'là',
+    0x261BE: 'lǜ',
+    0x261C0: 'suì',
+    0x261C1: 'fū',
+    0x261C4: 'lěi',
+    0x261C5: 'wěi',
+    0x261CE: 'cōng',
+    0x261D4: 'lì',
+    0x261D6: 'pín',
+    0x261D8: 'jūn',
+    0x261D9: 'jǔ',
+    0x261DB: 'là',
+    0x261E7: 'jì',
+    0x261EA: 'miè',
+    0x261EC: 'yào',
+    0x261ED: 'biān',
+    0x261F1: 'cóng',
+    0x261F2: 'sī,chī',
+    0x261F5: 'sī',
+    0x261F8: 'hé',
+    0x26203: 'nàng',
+    0x26205: 'dié',
+    0x26208: 'chè',
+    0x26209: 'yùn',
+    0x2620B: 'xiǔ',
+    0x2620C: 'shū',
+    0x2620E: 'chǎn',
+    0x2620F: 'mín',
+    0x26210: 'lián',
+    0x26211: 'yīn',
+    0x26212: 'xīng',
+    0x26213: 'wēi',
+    0x26214: 'gǔ',
+    0x26215: 'tóu',
+    0x26216: 'tā',
+    0x26217: 'fěi',
+    0x26218: 'dā',
+    0x26219: 'niè',
+    0x2621A: 'cù',
+    0x2621B: 'zuǒ',
+    0x2621C: 'jié',
+    0x2621D: 'xuàn',
+    0x2621E: 'bó',
+    0x2621F: 'jīn',
+    0x26220: 'yǐn',
+    0x26221: 'xū',
+    0x26223: 'yú',
+    0x26224: 'xiòng',
+    0x26226: 'qì',
+    0x26227: 'bēi',
+    0x26228: 'xíng',
+    0x26229: 'gǒng',
+    0x2622C: 'zuǐ',
+    0x26230: 'jiē',
+    0x26232: 'kāi,gǔ',
+    0x26235: 'xíng',
+    0x26236: 'bēi',
+    0x26237: 'shū',
+    0x26238: 'yù',
+    0x2623A: 'zhǒu',
+    0x2623B: 'zhǎn',
+    0x26242: 'zhōng',
+    0x26246: 'chá',
+    0x26248: 'chuí',
+    0x26249: 'liù',
+    0x2624E: 'suī',
+    0x26250: 'zhǔ',
+    0x26259: 'biàn',
+    0x2625D: 'xìn',
+    0x2625F: 'yà',
+    0x26262: 'líng',
+    0x26267: 'yà',
+    0x2626C: 'tīng',
+    0x26279: 'dí',
+    0x26281: 'pí',
+    0x26282: 'hù',
+    0x26283: 'cén',
+    0x2628A: 'tiān',
+    0x2628B: 'mǒu',
+    0x2628C: 'juǎn',
+    0x2628E: 'mǒu',
+    0x26290: 'jù',
+    0x26291: 'liǔ',
+    0x26293: 'lǐng',
+    0x26297: 'liǔ',
+    0x26298: 'hù',
+    0x262A6: 'fú',
+    0x262A7: 'hú',
+    0x262AA: 'è',
+    0x262AB: 'gōng',
+    0x262AC: 'gū',
+    0x262B1: 'guà',
+    0x262B9: 'lüè',
+    0x262BB: 'fán',
+    0x262BC: 'lǜ',
+    0x262BD: 'méng',
+    0x262BE: 'fú',
+    0x262BF: 'liú',
+    0x262C5: 'xié',
+    0x262C6: 'gū',
+    0x262C8: 'xiàn',
+    0x262C9: 'bó',
+    0x262CB: 'jì',
+    0x262D3: 'quān',
+    0x262D4: 'lù',
+    0x262DE: 'shuò',
+    0x262E1: 'mǒu',
+    0x262E2: 'yù',
+    0x262E3: 'hàn',
+    0x262E9: 'yuè',
+    0x262EA: 'dàn',
+    0x262EF: 'yú',
+    0x262F0: 'jiān',
+    0x262F3: 'gāng',
+    0x262FF: 'cáo',
+    0x26300: 'shèn',
+    0x26301: 'liǔ,lóu',
+    0x26306: 'jiāo',
+    0x26309: 'sù',
+    0x2630A: 'sù',
+    0x2630B: 'zhòng',
+    0x26312: 'liào',
+    0x26314: 'xuǎn',
+    0x26315: 'lù',
+    0x26317: 'jì',
+    0x2631A: 'yán',
+    0x2631F: 'lù',
+    0x26321: 'mǐn',
+    0x26322: 'tí',
+    0x26326: 'huàn',
+    0x26329: 'yì',
+    0x2632A: 'tǎn',
+    0x2632C: 'wǔ,wú',
+    0x26330: 'jī',
+    0x26337: 'dú',
+    0x26338: 'kūn',
+    0x2633A: 'jūn',
+    0x2633F: 'shī',
+    0x26340: 'nàn',
+    0x26341: 'pò',
+    0x26344: 'shū',
+    0x26345: 'quàn',
+    0x2634C: 'rèn',
+    0x2634F: 'fén',
+    0x26352: 'tà',
+    0x26353: 'tún',
+    0x26355: 'yáng',
+    0x26366: 'duō',
+    0x26367: 'cī',
+    0x26369: 'gǔ',
+    0x2636A: 'fén',
+    0x2636D: 'róu',
+    0x26371: 'gāo',
+    0x26372: 'xiáng,yàng',
+    0x26374: 'xiáng',
+    0x26375: 'hǒu',
+    0x26377: 'tāo',
+    0x26378: 'shàn',
+    0x26379: 'yáng',
+    0x2637A: 'zì',
+    0x2637C: 'yuán',
+    0x26384: 'sú',
+    0x26387: 'chuàn',
+    0x26388: 'xiáng,xiè',
+    0x2638A: 'bān',
+    0x2638C: 'mǎn',
+    0x2638E: 'fǔ',
+    0x2638F: 'lǎ',
+    0x26390: 'lǐ',
+    0x26392: 'jié',
+    0x26393: 'yōu',
+    0x26398: 'yù',
+    0x2639A: 'chì',
+    0x2639C: 'chuàn',
+    0x2639D: 'yì',
+    0x2639E: 'shān',
+    0x263A2: 'jí',
+    0x263A3: 'yān',
+    0x263A6: 'wù',
+    0x263A7: 'chún,dūn,dùn',
+    0x263A8: 'máng',
+    0x263AD: 'fú',
+    0x263AE: 'jiā',
+    0x263AF: 'gòu',
+    0x263B0: 'gú',
+    0x263B1: 'jiá',
+    0x263B5: 'xián',
+    0x263B7: 'jìn',
+    0x263B8: 'zì',
+    0x263B9: 'lóu',
+    0x263BC: 'gòu',
+    0x263C0: 'rén',
+    0x263C2: 'shān',
+    0x263C5: 'jué',
+    0x263C6: 'tóng',
+    0x263C7: 'yǒu',
+    0x263D4: 'jiān',
+    0x263D5: 'dú',
+    0x263D7: 'hú',
+    0x263DB: 'sāo',
+    0x263DC: 'yù',
+    0x263E2: 'mài',
+    0x263E4: 'zhī',
+    0x263E5: 'yān',
+    0x263E6: 'gāo',
+    0x263E8: 'huài',
+    0x263EE: 'quán',
+    0x263F1: 'yǎng,chài',
+    0x263F3: 'zuǐ',
+    0x263F7: 'xiāo',
+    0x263F8: 'yì,chí',
+    0x263F9: 'yǎn',
+    0x263FA: 'hóng,gòng',
+    0x263FB: 'yú,yù',
+    0x263FF: 'chì',
+    0x26401: 'chí',
+    0x26404: 'háng',
+    0x26405: 'sè',
+    0x26406: 'pā',
+    0x26407: 'tà',
+    0x26408: 'fēn',
+    0x26409: 'chī',
+    0x2640C: 'hóng',
+    0x2640D: 'xuè',
+    0x26416: 'zhǐ',
+    0x2641B: 'qú,yù',
+    0x26420: 'xī',
+    0x26421: 'fú',
+    0x26423: 'shū',
+    0x26424: 'hài',
+    0x26426: 'pò',
+    0x26428: 'cǐ',
+    0x26430: 'chài',
+    0x26433: 'hōng',
+    0x26438: 'pǎo',
+    0x26439: 'shēn',
+    0x2643A: 'xiāo',
+    0x2643D: 'xuān,líng',
+    0x2643E: 'cǐ',
+    0x2643F: 'tíng',
+    0x26440: 'pò',
+    0x26447: 'tà',
+    0x26448: 'chā',
+    0x2644B: 'zú',
+    0x2644C: 'huò',
+    0x2644D: 'xù',
+    0x2644E: 'yàn',
+    0x2644F: 'chài',
+    0x26451: 'tuó',
+    0x26458: 'xián',
+    0x26459: 'xuān',
+    0x2645A: 'hóu',
+    0x2645B: 'huǎn',
+    0x2645C: 'gé',
+    0x2645D: 'chǒng',
+    0x2645E: 'bì',
+    0x2645F: 'hōng',
+    0x26460: 'hōng',
+    0x26461: 'chí,chī',
+    0x26463: 'chá',
+    0x2646F: 'zhǎ',
+    0x26471: 'zhái,huò',
+    0x26472: 'tà',
+    0x26475: 'pò',
+    0x26476: 'tà',
+    0x26478: 'yóu',
+    0x26479: 'fú',
+    0x2647A: 'cī',
+    0x2647B: 'dá',
+    0x2647C: 'tǎ',
+    0x2647E: 'liú',
+    0x26481: 'cī',
+    0x26483: 'hōng',
+    0x26485: 'hàn',
+    0x26486: 'lā',
+    0x26488: 'shī',
+    0x2648D: 'tóng',
+    0x2648E: 'huì',
+    0x2648F: 'hé',
+    0x26490: 'piē',
+    0x26491: 'yù',
+    0x2649C: 'xiān',
+    0x2649D: 'hǎn',
+    0x2649F: 'pò',
+    0x264A6: 'là',
+    0x264A7: 'huò',
+    0x264B0: 'tài',
+    0x264B4: 'lǎo',
+    0x264B6: 'shù',
+    0x264BA: 'dào',
+    0x264BB: 'diǎn',
+    0x264C8: 'xiòng',
+    0x264CB: 'wàng',
+    0x264CD: 'chě',
+    0x264CE: 'nài',
+    0x264D0: 'jué',
+    0x264D3: 'ér,liè',
+    0x264D4: 'ér,xū',
+    0x264D5: 'nǘ',
+    0x264D6: 'nǜ',
+    0x264DD: 'zhuǎn',
+    0x264E2: 'nuò',
+    0x264E4: 'liè',
+    0x264E5: 'lěi',
+    0x264E7: 'bā',
+    0x264EC: 'chēng',
+    0x264EF: 'guī',
+    0x264F0: 'quán',
+    0x264F1: 'gè',
+    0x264F3: 'gǒng',
+    0x264F4: 'shào,shāo',
+    0x264F9: 'lái',
+    0x264FA: 'zhēng',
+    0x264FB: 'yì',
+    0x264FC: 'gǔn',
+    0x264FD: 'wēi',
+    0x264FE: 'lǔn,kǔn',
+    0x26502: 'shí',
+    0x26503: 'yīng',
+    0x26504: 'shěng',
+    0x26505: 'tú',
+    0x26506: 'bì',
+    0x26508: 'zé',
+    0x26509: 'zhòng',
+    0x2650B: 'rǒng',
+    0x2650C: 'qí,sí',
+    0x2650D: 'fù',
+    0x2650E: 'cè',
+    0x26513: 'lí',
+    0x26514: 'mán,màn',
+    0x26516: 'lián',
+    0x26517: 'biāo',
+    0x2651B: 'chuáng',
+    0x2651C: 'yì',
+    0x26520: 'pài',
+    0x26525: 'yì,shì',
+    0x26526: 'kuài',
+    0x26529: 'biāo,pāo',
+    0x2652B: 'chì,yì',
+    0x2652C: 'qú',
+    0x2652D: 'mò',
+    0x2652E: 'zhé',
+    0x2652F: 'shà',
+    0x26530: 'shà,xū',
+    0x26537: 'yāo',
+    0x26538: 'gōng',
+    0x26539: 'nài',
+    0x2653C: 'xiè',
+    0x2653F: 'tiàn',
+    0x26546: 'yé',
+    0x26549: 'shā',
+    0x2654F: 'sào',
+    0x26552: 'diān',
+    0x26553: 'xù',
+    0x26559: 'qú',
+    0x26560: 'hōng',
+    0x26561: 'shèng',
+    0x26562: 'tìng',
+    0x26570: 'duo',
+    0x26575: 'liáo',
+    0x26577: 'hòng',
+    0x26578: 'lǐ',
+    0x2657A: 'xiǎng,gāo',
+    0x2657D: 'shèn',
+    0x26580: 'fū',
+    0x26588: 'yǎn',
+    0x26589: 'wǎng',
+    0x2658A: 'qī',
+    0x2658B: 'duǒ',
+    0x2658D: 'huà',
+    0x2658E: 'qiān',
+    0x26590: 'xiè',
+    0x2659D: 'cì',
+    0x2659E: 'shēng,wén',
+    0x265A2: 'èr',
+    0x265A4: 'xīng',
+    0x265A6: 'tuì',
+    0x265A7: 'yàn',
+    0x265A9: 'liè',
+    0x265AC: 'mí',
+    0x265B8: 'zòng',
+    0x265BA: 'zī',
+    0x265BC: 'hú',
+    0x265BD: 'yíng',
+    0x265BE: 'lián',
+    0x265BF: 'dā',
+    0x265C0: 'tián',
+    0x265C1: 'tiàn',
+    0x265CB: 'róng',
+    0x265CD: 'ài',
+    0x265D0: 'ài',
+    0x265D1: 'zhé',
+    0x265D2: 'guō',
+    0x265D3: 'lù',
+    0x265D4: 'zhāo',
+    0x265D5: 'mí',
+    0x265D6: 'liáo',
+    0x265D7: 'zhé',
+    0x265DB: 'qǔ',
+    0x265DC: 'cōng',
+    0x265DF: 'tīng,tè',
+    0x265E1: 'tán',
+    0x265E2: 'zhǎn',
+    0x265E3: 'hú',
+    0x265E5: 'piē',
+    0x265E7: 'dā',
+    0x265E8: 'róng',
+    0x265EE: 'nǎo',
+    0x265F3: 'náng',
+    0x265F4: 'dāng',
+    0x265F5: 'jiǎo',
+    0x265FB: 'jù',
+    0x265FC: 'ěr',
+    0x2660A: 'lì',
+    0x2660C: 'guō',
+    0x2660D: 'wài,wà',
+    0x26612: 'niè',
+    0x26614: 'jīn',
+    0x26629: 'pǐ',
+    0x2662A: 'chì',
+    0x26632: 'pǐ',
+    0x26633: 'yì',
+    0x26634: 'dū',
+    0x26635: 'wǎ',
+    0x26636: 'xūn',
+    0x26638: 'qì',
+    0x26639: 'shàn,yuè',
+    0x2663C: 'xū',
+    0x2663F: 'hē',
+    0x26640: 'pàn',
+    0x26642: 'pēi',
+    0x26644: 'xiōng',
+    0x26646: 'chǐ',
+    0x26647: 'tān',
+    0x26648: 'zuì,cuì',
+    0x26649: 'zuǎn',
+    0x2664A: 'qì',
+    0x2664B: 'dū',
+    0x26659: 'shuǐ',
+    0x2665C: 'nǎ',
+    0x2665D: 'xī',
+    0x26667: 'chǎo',
+    0x26668: 'yì',
+    0x2666B: 'zhēng',
+    0x2666E: 'jú',
+    0x2666F: 'dài',
+    0x26671: 'sān',
+    0x26674: 'zhù',
+    0x26675: 'wàn',
+    0x26676: 'gǔ',
+    0x26678: 'sān',
+    0x26679: 'bàn',
+    0x2667A: 'jià,jiā',
+    0x2667B: 'mài',
+    0x26688: 'tuò,dù',
+    0x2668A: 'qì',
+    0x2668F: 'zhuāng',
+    0x26690: 'tuó',
+    0x26693: 'píng',
+    0x2669D: 'pēng',
+    0x2669E: 'kuāng,kuàng',
+    0x2669F: 'yí',
+    0x266A1: 'xiè,mài',
+    0x266A2: 'yuē',
+    0x266A3: 'hén',
+    0x266A5: 'hóu,yóu',
+    0x266A6: 'zhēng',
+    0x266A7: 'chǔn',
+    0x266A8: 'shì',
+    0x266A9: 'wǎ',
+    0x266AB: 'xié',
+    0x266B8: 'gèng',
+    0x266C5: 'è',
+    0x266CF: 'kú',
+    0x266D0: 'nà',
+    0x266D3: 'jū',
+    0x266D4: 'xuàn',
+    0x266D5: 'qū',
+    0x266D6: 'chè',
+    0x266D7: 'lǚ',
+    0x266D8: 'hé',
+    0x266D9: 'shèng',
+    0x266DA: 'nàn',
+    0x266DC: 'hé,hán',
+    0x266DD: 'chá',
+    0x266DE: 'yān',
+    0x266DF: 'gěng',
+    0x266E0: 'niè',
+    0x266E2: 'guó',
+    0x266E3: 'yán',
+    0x266E4: 'guǎn',
+    0x266E7: 'zhì',
+    0x266E8: 'lao',
+    0x266EF: 'dǔ',
+    0x266F0: 'qì',
+    0x266F1: 'qū',
+    0x266F2: 'jué',
+    0x26701: 'fēng',
+    0x26703: 'xù',
+    0x26704: 'tuì',
+    0x26706: 'hán',
+    0x26707: 'kū',
+    0x2670A: 'shēn',
+    0x2670B: 'zhì',
+    0x2670D: 'pàng',
+    0x2670E: 'zhēng',
+    0x2670F: 'lì',
+    0x26710: 'wǎn',
+    0x26712: 'fǎn',
+    0x26713: 'xìn',
+    0x26716: 'yà',
+    0x2671B: 'jū',
+    0x2671C: 'shèn',
+    0x2672D: 'mǎng',
+    0x2672F: 'tǔn',
+    0x26730: 'zhuó',
+    0x26731: 'xī',
+    0x26732: 'yìn',
+    0x26733: 'jīng',
+    0x26734: 'tún',
+    0x26737: 'gèng',
+    0x26738: 'jì',
+    0x2674F: 'zhuǎn,shuàn',
+    0x26752: 'tiē',
+    0x26754: 'zhī',
+    0x26756: 'jí',
+    0x2675A: 'yíng',
+    0x2675B: 'wèi',
+    0x2675D: 'huàn',
+    0x2675E: 'tíng',
+    0x2675F: 'chán',
+    0x26762: 'kuí',
+    0x26763: 'qià,kē',
+    0x26764: 'bàn',
+    0x26765: 'chā,zhá',
+    0x26766: 'tuǒ',
+    0x26767: 'nǎn',
+    0x26768: 'jiē',
+    0x2676A: 'yān',
+    0x2676C: 'tú',
+    0x2676E: 'wěn',
+    0x26770: 'cōng',
+    0x26773: 'xù',
+    0x26774: 'yìn',
+    0x26777: 'bèng',
+    0x2677C: 'lǘ,lóu',
+    0x26781: 'zāi',
+    0x26782: 'dā,da',
+    0x26786: 'niè',
+    0x26787: 'jǔ',
+    0x26788: 'hóu',
+    0x2678C: 'gèng',
+    0x26795: 'hóu',
+    0x26796: 'kān',
+    0x26797: 'gōng',
+    0x26799: 'huǐ',
+    0x2679A: 'xiè',
+    0x2679D: 'xì',
+    0x2679E: 'hán',
+    0x2679F: 'mí',
+    0x267A1: 'wěng',
+    0x267A2: 'hùn',
+    0x267A3: 'sāo',
+    0x267A4: 'xìn,zǐ',
+    0x267A5: 'zhé',
+    0x267A6: 'huò,hè',
+    0x267A8: 'gōng',
+    0x267AB: 'sài',
+    0x267AC: 'jīn,jiàn',
+    0x267AD: 'wā',
+    0x267B1: 'duǐ',
+    0x267B2: 'chī',
+    0x267BD: 'xī,wèi,jí',
+    0x267C2: 'mí',
+    0x267C3: 'zāng',
+    0x267C4: 'sǎng,sào',
+    0x267D3: 'tún',
+    0x267D4: 'zhì',
+    0x267D5: 'wěn',
+    0x267D8: 'yín',
+    0x267D9: 'tǔn',
+    0x267DB: 'chōng',
+    0x267DC: 'zé',
+    0x267DE: 'xiāo',
+    0x267DF: 'mó',
+    0x267E0: 'cù',
+    0x267E3: 'biǎn',
+    0x267E4: 'xiū',
+    0x267E7: 'yí',
+    0x267EE: 'huǎng',
+    0x267F0: 'zhā',
+    0x267F1: 'suō',
+    0x267F2: 'hún',
+    0x267F3: 'jù',
+    0x26801: 'cù',
+    0x26804: 'jī',
+    0x26805: 'xún',
+    0x26806: 'sǔn,zhuàn',
+    0x26807: 'céng',
+    0x26809: 'yì',
+    0x2680E: 'biāo',
+    0x26812: 'jué',
+    0x26813: 'lì',
+    0x26816: 'pào',
+    0x2681B: 'zā',
+    0x2681C: 'yè',
+    0x2681E: 'bì',
+    0x2681F: 'zhè',
+    0x26820: 'zhè',
+    0x26822: 'jiù',
+    0x26823: 'zhé',
+    0x26826: 'shù',
+    0x2682A: 'xī',
+    0x26837: 'xǔ',
+    0x26838: 'nǎi',
+    0x26839: 'xián',
+    0x2683A: 'gǔn',
+    0x2683B: 'wèi',
+    0x2683E: 'jí',
+    0x2683F: 'sà',
+    0x26842: 'dǒng',
+    0x26843: 'nuó,nié',
+    0x26844: 'dù',
+    0x26845: 'zhēng',
+    0x26846: 'kū',
+    0x26849: 'míng',
+    0x26855: 'báo',
+    0x26856: 'huì',
+    0x26859: 'zōng',
+    0x26868: 'sàn',
+    0x2686A: 'tēng',
+    0x2686B: 'yí',
+    0x2686D: 'yù',
+    0x26871: 'yào,shào',
+    0x26872: 'nǐng',
+    0x26874: 'chóu,zhǒu',
+    0x26875: 'hùn',
+    0x26877: 'duì',
+    0x26879: 'qì',
+    0x2687A: 'yǐng',
+    0x2687B: 'bìng',
+    0x2687C: 'níng',
+    0x2687D: 'huáng',
+    0x26886: 'yǐng',
+    0x2688A: 'báo,bó',
+    0x2688E: 'guàng',
+    0x2688F: 'lěi',
+    0x26890: 'zǔn',
+    0x26899: 'chǎn,qiān,xiān',
+    0x268A3: 'jiǎn',
+    0x268A7: 'méng',
+    0x268A9: 'xiào,sōu',
+    0x268AF: 'xìn,xìng',
+    0x268B1: 'lí',
+    0x268BA: 'qiǎo',
+    0x268BF: 'wěi,juǎn',
+    0x268C0: 'nà,niè,zhé',
+    0x268C2: 'pāng',
+    0x268C4: 'léi',
+    0x268C7: 'luó',
+    0x268CB: 'luán',
+    0x268CD: 'gēng',
+    0x268CF: 'luán',
+    0x268D2: 'qú',
+    0x268D6: 'luó',
+    0x268D8: 'náng',
+    0x268DB: 'luó',
+    0x268DC: 'yuè',
+    0x268E2: 'shuì',
+    0x268E5: 'mì',
+    0x268E6: 'wáng',
+    0x268E7: 'cè',
+    0x268E8: 'jiān',
+    0x268E9: 'wǎng',
+    0x268EF: 'jiā',
+    0x268F4: 'huán',
+    0x268F8: 'liàn',
+    0x268F9: 'zì',
+    0x268FA: 'bái',
+    0x268FB: 'shǒu,bǎi',
+    0x268FE: 'wǎn',
+    0x26902: 'shū',
+    0x26907: 'guī',
+    0x26908: 'xī',
+    0x2690A: 'rú',
+    0x2690B: 'yào',
+    0x2690E: 'gāo',
+    0x26915: 'yuè',
+    0x26918: 'yōng',
+    0x26919: 'wà',
+    0x2691A: 'bó',
+    0x2691F: 'xìn',
+    0x26922: 'pì',
+    0x26923: 'bó',
+    0x26926: 'hài,hè,ài',
+    0x26927: 'zhài',
+    0x26928: 'wò',
+    0x2692A: 'yè',
+    0x2692B: 'bì,bí',
+    0x2692C: 'hài',
+    0x26938: 'chì',
+    0x2693B: 'zhì',
+    0x2693D: 'ní',
+    0x26941: 'wú',
+    0x26942: 'ǎi',
+    0x26948: 'ǎi',
+    0x26949: 'yǔ',
+    0x2694A: 'chì',
+    0x2694D: 'jìng',
+    0x2694E: 'zhì',
+    0x2694F: 'zhì',
+    0x26950: 'zhì',
+    0x26951: 'jú,jǔ,póu',
+    0x26956: 'hán,xián',
+    0x2695A: 'pīng',
+    0x2695D: 'yǎo',
+    0x26963: 'yóu',
+    0x26964: 'pīng',
+    0x26966: 'mò',
+    0x2696C: 'zuò',
+    0x2696D: 'pò',
+    0x2696F: 'xué',
+    0x26970: 'kuáng',
+    0x26971: 'yì',
+    0x26972: 'pò',
+    0x2697B: 'zhuì',
+    0x26983: 'ní',
+    0x26984: 'qiǔ',
+    0x26985: 'còu',
+    0x2698C: 'yǎo',
+    0x26991: 'fén',
+    0x26995: 'xiá',
+    0x26997: 'jiāng',
+    0x26998: 'chā',
+    0x2699B: 'xiào',
+    0x2699C: 'chā',
+    0x269A2: 'chéng',
+    0x269A3: 'cuì',
+    0x269A7: 'qióng,gǒng',
+    0x269A9: 'yù',
+    0x269AB: 'yú',
+    0x269AF: 'wèn',
+    0x269B1: 'chā',
+    0x269B2: 'yǔ,yù',
+    0x269B9: 'zuó',
+    0x269BA: 'dǎo',
+    0x269BD: 'juàn,fàn',
+    0x269BE: 'dǎo',
+    0x269BF: 'yīng',
+    0x269C1: 'fěng',
+    0x269C5: 'wèng',
+    0x269C8: 'jìn',
+    0x269C9: 'qì',
+    0x269CB: 'qìn',
+    0x269CD: 'kuò',
+    0x269CF: 'tān',
+    0x269D0: 'xiān',
+    0x269D2: 'tiān',
+    0x269D4: 'kuò',
+    0x269D6: 'tiàn',
+    0x269D8: 'hú',
+    0x269D9: 'zhū',
+    0x269DA: 'zhān',
+    0x269DB: 'tà',
+    0x269DD: 'tiān',
+    0x269DE: 'tà',
+    0x269DF: 'tà',
+    0x269E0: 'huá',
+    0x269E1: 'yǎn,tiàn',
+    0x269E2: 'tiè',
+    0x269E4: 'tiè',
+    0x269E5: 'tà',
+    0x269EC: 'huài',
+    0x269EE: 'jiá',
+    0x269EF: 'qì',
+    0x269F1: 'tà',
+    0x269F4: 'tān',
+    0x269F5: 'huà',
+    0x269F8: 'zhuàn',
+    0x269F9: 'huā',
+    0x269FC: 'lán',
+    0x26A06: 'zūn',
+    0x26A07: 'yì',
+    0x26A08: 'fú',
+    0x26A09: 'wù',
+    0x26A0B: 'fú',
+    0x26A0D: 'dīng',
+    0x26A0E: 'tà',
+    0x26A16: 'chào',
+    0x26A19: 'rì',
+    0x26A1A: 'quǎn',
+    0x26A1C: 'gē',
+    0x26A21: 'fú',
+    0x26A22: 'dì',
+    0x26A23: 'diāo',
+    0x26A24: 'yǒng',
+    0x26A26: 'jià',
+    0x26A29: 'lóng',
+    0x26A2C: 'yǒng',
+    0x26A2D: 'pí',
+    0x26A2F: 'huó',
+    0x26A30: 'qióng',
+    0x26A32: 'fán',
+    0x26A33: 'wú',
+    0x26A34: 'tóng',
+    0x26A35: 'háng',
+    0x26A38: 'tān',
+    0x26A3E: 'hēng',
+    0x26A44: 'tiāo',
+    0x26A48: 'zhōu',
+    0x26A4B: 'bài',
+    0x26A4C: 'xiè',
+    0x26A4D: 'dāo,diāo',
+    0x26A4F: 'jīn,wéi',
+    0x26A55: 'hū',
+    0x26A56: 'bēi',
+    0x26A58: 'dìng',
+    0x26A5C: 'nuó',
+    0x26A5D: 'wèi',
+    0x26A5E: 'yú',
+    0x26A60: 'xīng',
+    0x26A61: 'fú',
+    0x26A62: 'xiàn',
+    0x26A63: 'qì',
+    0x26A64: 'tū',
+    0x26A67: 'jí',
+    0x26A69: 'yìng',
+    0x26A6B: 'dèng,téng',
+    0x26A6C: 'wēi',
+    0x26A6D: 'xī',
+    0x26A6F: 'pái',
+    0x26A71: 'shéng',
+    0x26A72: 'yǒu',
+    0x26A74: 'ái',
+    0x26A75: 'jiàn',
+    0x26A77: 'gōu',
+    0x26A78: 'ruò',
+    0x26A7C: 'gòng',
+    0x26A7F: 'shà',
+    0x26A80: 'táng',
+    0x26A87: 'lù',
+    0x26A88: 'áo',
+    0x26A8A: 'qì',
+    0x26A8B: 'xiū',
+    0x26A8D: 'dāi',
+    0x26A91: 'fá',
+    0x26A92: 'wèi',
+    0x26A94: 'dùn',
+    0x26A95: 'liáo',
+    0x26A96: 'fān',
+    0x26A97: 'huáng,héng',
+    0x26A98: 'jué',
+    0x26A99: 'tà',
+    0x26A9A: 'zùn',
+    0x26A9B: 'ráo',
+    0x26A9C: 'cān',
+    0x26A9D: 'téng',
+    0x26AA0: 'huà',
+    0x26AA1: 'xū',
+    0x26AA3: 'zhān',
+    0x26AA7: 'gǎn',
+    0x26AAA: 'péng',
+    0x26AAB: 'cān',
+    0x26AAC: 'xiē',
+    0x26AAD: 'dá',
+    0x26AB1: 'jì',
+    0x26AB6: 'lǐ',
+    0x26AB9: 'pán',
+    0x26ABD: 'lóng,lǒng',
+    0x26ABE: 'lì',
+    0x26ABF: 'xí',
+    0x26AC0: 'téng',
+    0x26AC3: 'líng',
+    0x26AC8: 'lǐ',
+    0x26AC9: 'rán',
+    0x26ACA: 'líng',
+    0x26ACE: 'gǔn',
+    0x26AD4: 'pō',
+    0x26AD5: 'mò',
+    0x26AD6: 'pāi',
+    0x26AD9: 'bà',
+    0x26AE1: 'qí',
+    0x26AE4: 'yán',
+    0x26AEA: 'wà',
+    0x26AEB: 'ǎng',
+    0x26AED: 'mìng',
+    0x26AEE: 'mǐn',
+    0x26AEF: 'xùn',
+    0x26AF0: 'méng',
+    0x26AF3: 'guǎi',
+    0x26AF6: 'jiāo',
+    0x26AFB: 'gǎi',
+    0x26B01: 'cái',
+    0x26B02: 'wù',
+    0x26B03: 'zhé',
+    0x26B04: 'rěn',
+    0x26B05: 'kōu',
+    0x26B14: 'zhǎo',
+    0x26B15: 'zhōng',
+    0x26B16: 'qiú',
+    0x26B17: 'guō',
+    0x26B18: 'gōng,sōng',
+    0x26B19: 'pū',
+    0x26B1A: 'hù',
+    0x26B1B: 'miǎn',
+    0x26B1E: 'tiān',
+    0x26B23: 'wǎng',
+    0x26B38: 'zhú',
+    0x26B39: 'dá,dàn',
+    0x26B3A: 'xiòng,huǎng',
+    0x26B3B: 'ná',
+    0x26B3E: 'juān',
+    0x26B41: 'niǎn',
+    0x26B48: 'hù',
+    0x26B49: 'shā',
+    0x26B5C: 'zhī',
+    0x26B5F: 'tā',
+    0x26B61: 'sī',
+    0x26B65: 'yì',
+    0x26B6D: 'qióng',
+    0x26B6E: 'zhì',
+    0x26B6F: 'lǚ,lóu',
+    0x26B70: 'rú',
+    0x26B72: 'qí',
+    0x26B73: 'yǔ',
+    0x26B74: 'zhōu',
+    0x26B75: 'yáng',
+    0x26B76: 'xiǎn',
+    0x26B77: 'móu',
+    0x26B78: 'chóu',
+    0x26B79: 'huī',
+    0x26B7A: 'jiū',
+    0x26B7B: 'jiù',
+    0x26B7C: 'piǎo,bì',
+    0x26B81: 'jiào',
+    0x26B83: 'guāi,kuā',
+    0x26B85: 'mò',
+    0x26B90: 'xī',
+    0x26B91: 'pú',
+    0x26BAF: 'jì',
+    0x26BB6: 'wěn',
+    0x26BB7: 'bèi',
+    0x26BB8: 'yǐ',
+    0x26BB9: 'fú',
+    0x26BBA: 'sī',
+    0x26BBB: 'juān',
+    0x26BBC: 'jì,qí',
+    0x26BBE: 'nì',
+    0x26BC0: 'bèn',
+    0x26BC5: 'xù',
+    0x26BC8: 'qǐn',
+    0x26BC9: 'bó',
+    0x26BCC: 'wáng',
+    0x26BCD: 'zhè',
+    0x26BCF: 'wò',
+    0x26BD0: 'sháo',
+    0x26BD1: 'zào',
+    0x26BD2: 'yǎng',
+    0x26BD5: 'sòng',
+    0x26BD6: 'niè',
+    0x26BDB: 'bì',
+    0x26BE3: 'cú',
+    0x26BE4: 'qiāng',
+    0x26BEA: 'xiào',
+    0x26BEB: 'zhī',
+    0x26BEC: 'shé',
+    0x26BEF: 'zhì',
+    0x26BF0: 'pēng',
+    0x26C0F: 'diào',
+    0x26C16: 'wò',
+    0x26C18: 'zhǐ',
+    0x26C19: 'bì',
+    0x26C1B: 'fén',
+    0x26C21: 'nà,nuó',
+    0x26C25: 'bāng',
+    0x26C2A: 'qiú',
+    0x26C2B: 'nǐ',
+    0x26C2C: 'bó',
+    0x26C2D: 'dùn',
+    0x26C2F: 'shǐ',
+    0x26C30: 'xū',
+    0x26C31: 'cháng',
+    0x26C32: 'xū',
+    0x26C33: 'yé',
+    0x26C34: 'mí',
+    0x26C38: 'xīn',
+    0x26C39: 'zhuó',
+    0x26C3A: 'fù',
+    0x26C3D: 'pǐ',
+    0x26C3E: 'xuè',
+    0x26C40: 'yù',
+    0x26C41: 'xián',
+    0x26C42: 'yù',
+    0x26C43: 'yú',
+    0x26C45: 'jū',
+    0x26C46: 'tā',
+    0x26C47: 'kōng',
+    0x26C4A: 'zhēng',
+    0x26C4B: 'méng',
+    0x26C4C: 'gāng',
+    0x26C52: 'mù',
+    0x26C53: 'xǐ',
+    0x26C54: 'bì',
+    0x26C56: 'fù',
+    0x26C5C: 'xiào',
+    0x26C60: 'jiū',
+    0x26C63: 'gǒu',
+    0x26C70: 'chí',
+    0x26C71: 'jiū',
+    0x26C72: 'jiū',
+    0x26C75: 'shā',
+    0x26C77: 'fēi',
+    0x26CAB: 'fú',
+    0x26CAF: 'wàn',
+    0x26CB0: 'xū',
+    0x26CB1: 'bō',
+    0x26CC1: 'hào,mào',
+    0x26CC3: 'xié',
+    0x26CC4: 'pián',
+    0x26CC5: 'yǔ',
+    0x26CC7: 'tián',
+    0x26CC8: 'pí,bì',
+    0x26CCA: 'shǐ',
+    0x26CCB: 'kuǎi',
+    0x26CCC: 'jī',
+    0x26CCF: 'zhā',
+    0x26CD0: 'nài,nà',
+    0x26CD1: 'mǒu',
+    0x26CD3: 'fú',
+    0x26CD4: 'dù',
+    0x26CD7: 'shěng',
+    0x26CD8: 'chá',
+    0x26CDA: 'chí',
+    0x26CDB: 'guǐ',
+    0x26CDC: 'mín',
+    0x26CDD: 'tāng,dàng',
+    0x26CDE: 'bài',
+    0x26CDF: 'qiāng',
+    0x26CE1: 'zhuó',
+    0x26CE2: 'wèi',
+    0x26CE3: 'xún',
+    0x26CE5: 'miǎo',
+    0x26CE6: 'zāi',
+    0x26CE7: 'yóu',
+    0x26CE9: 'yòu',
+    0x26CEB: 'shān',
+    0x26CEC: 'hé',
+    0x26CED: 'lǚ',
+    0x26CEE: 'zhí',
+    0x26CF2: 'jìng',
+    0x26CF3: 'zhēn',
+    0x26CF6: 'méng',
+    0x26CF7: 'yóu',
+    0x26CF9: 'wò',
+    0x26CFA: 'bá',
+    0x26CFD: 'juàn',
+    0x26CFE: 'rú',
+    0x26CFF: 'còu',
+    0x26D00: 'zhī',
+    0x26D09: 'hú',
+    0x26D0A: 'yāng',
+    0x26D0C: 'jùn',
+    0x26D0D: 'shé',
+    0x26D0E: 'kòu',
+    0x26D11: 'qián',
+    0x26D14: 'méng',
+    0x26D1A: 'tiáo',
+    0x26D50: 'niè',
+    0x26D5F: 'chí',
+    0x26D61: 'xiōng,gōng',
+    0x26D63: 'hùn',
+    0x26D66: 'dí',
+    0x26D67: 'láng',
+    0x26D69: 'zāo,qiú',
+    0x26D6A: 'cè',
+    0x26D6B: 'suǒ',
+    0x26D6C: 'zù',
+    0x26D6D: 'suī',
+    0x26D6F: 'xiá',
+    0x26D71: 'xiè',
+    0x26D74: 'jié',
+    0x26D75: 'yóu',
+    0x26D77: 'gòu',
+    0x26D78: 'gěng',
+    0x26D7C: 'jùn',
+    0x26D7D: 'huǎng',
+    0x26D7E: 'jí',
+    0x26D7F: 'pōu',
+    0x26D80: 'wū',
+    0x26D82: 'yì',
+    0x26D85: 'nǎi',
+    0x26D87: 'rǒng,ruǎn',
+    0x26D88: 'nán',
+    0x26D8A: 'píng',
+    0x26D8B: 'shàn',
+    0x26D8C: 'diāo',
+    0x26D8D: 'jí',
+    0x26D8E: 'huā',
+    0x26D8F: 'duì',
+    0x26D90: 'kǒng',
+    0x26D91: 'tà',
+    0x26D93: 'hòng',
+    0x26D95: 'shū',
+    0x26D99: 'héng',
+    0x26D9A: 'fěn',
+    0x26DB2: 'kòu',
+    0x26DD9: 'nián',
+    0x26DDD: 'chú',
+    0x26DE6: 'qiàng',
+    0x26DF2: 'xì',
+    0x26DF3: 'hú',
+    0x26DF4: 'sòng',
+    0x26DF5: 'wò',
+    0x26DF7: 'hài',
+    0x26DF8: 'rú',
+    0x26DF9: 'méng',
+    0x26DFB: 'sǎn',
+    0x26DFD: 'wú',
+    0x26DFF: 'yóu',
+    0x26E01: 'tān',
+    0x26E02: 'shēn',
+    0x26E06: 'qǐ',
+    0x26E08: 'guó',
+    0x26E09: 'qià',
+    0x26E0A: 'xiān',
+    0x26E0F: 'suī',
+    0x26E10: 'lù',
+    0x26E13: 'qī',
+    0x26E14: 'diāo',
+    0x26E17: 'qí',
+    0x26E18: 'jiá',
+    0x26E19: 'yóu',
+    0x26E1A: 'xí',
+    0x26E1B: 'cháo',
+    0x26E21: 'mì',
+    0x26E22: 'lòu',
+    0x26E23: 'bǐ',
+    0x26E2A: 'péi',
+    0x26E2E: 'zhēn',
+    0x26E2F: 'shēn',
+    0x26E30: 'chǎn',
+    0x26E31: 'fù',
+    0x26E36: 'qū',
+    0x26E37: 'sī',
+    0x26E3A: 'zuī',
+    0x26E6B: 'zhào',
+    0x26E7D: 'pí',
+    0x26E80: 'còu',
+    0x26E86: 'gāo',
+    0x26E87: 'dú',
+    0x26E89: 'fū',
+    0x26E8A: 'guān',
+    0x26E8B: 'sǎo',
+    0x26E8C: 'sǒu',
+    0x26E8D: 'jiǎn',
+    0x26E8E: 'póu',
+    0x26E90: 'cán',
+    0x26E91: 'bèng',
+    0x26E92: 'mòu',
+    0x26E93: 'zhāo',
+    0x26E94: 'xiáo',
+    0x26E96: 'jú',
+    0x26E97: 'shū',
+    0x26E98: 'jiǎn',
+    0x26E99: 'lí',
+    0x26E9B: 'chuàn',
+    0x26E9C: 'lào,láo',
+    0x26E9E: 'hè',
+    0x26E9F: 'hú',
+    0x26EA0: 'gū',
+    0x26EA1: 'zhǎng',
+    0x26EA2: 'jié',
+    0x26EA3: 'xiàng',
+    0x26EA5: 'dū',
+    0x26EA6: 'hán',
+    0x26EA7: 'jiá',
+    0x26EA8: 'xiàng',
+    0x26EA9: 'jí',
+    0x26EAA: 'shǔ',
+    0x26EAB: 'làng',
+    0x26EAC: 'jī',
+    0x26EAD: 'shān',
+    0x26EB0: 'tāo,tiáo',
+    0x26EB1: 'zī',
+    0x26EB2: 'shuàn',
+    0x26EB4: 'jí',
+    0x26EB5: 'chù',
+    0x26EB6: 'jì',
+    0x26EB7: 'shēn',
+    0x26EB8: 'lìn,lín',
+    0x26EB9: 'liáo',
+    0x26EBB: 'sǎn',
+    0x26EBD: 'ǎn',
+    0x26EBE: 'ruǎn',
+    0x26EC0: 'tí,tái',
+    0x26EC1: 'dàn',
+    0x26EC3: 'huán',
+    0x26EC5: 'sà',
+    0x26F06: 'ruí',
+    0x26F07: 'wū',
+    0x26F08: 'jù',
+    0x26F09: 'huán',
+    0x26F0A: 'léng',
+    0x26F0B: 'lù',
+    0x26F0E: 'tān',
+    0x26F0F: 'zēng',
+    0x26F13: 'qián',
+    0x26F17: 'xī',
+    0x26F21: 'cǐ',
+    0x26F22: 'shé',
+    0x26F27: 'sà',
+    0x26F2A: 'mào',
+    0x26F2B: 'qú',
+    0x26F2D: 'bó',
+    0x26F2E: 'gǎn,gàn',
+    0x26F30: 'qiè,hé',
+    0x26F31: 'juàn',
+    0x26F32: 'dāng',
+    0x26F33: 'cháng',
+    0x26F34: 'yáng',
+    0x26F35: 'hé',
+    0x26F37: 'jī',
+    0x26F39: 'bǐng',
+    0x26F3B: 'méi',
+    0x26F3F: 'dūn',
+    0x26F40: 'ǎo',
+    0x26F41: 'jīng',
+    0x26F42: 'lù',
+    0x26F43: 'miàn',
+    0x26F44: 'diàn',
+    0x26F45: 'hè',
+    0x26F47: 'jiān',
+    0x26F4A: 'huá',
+    0x26F4B: 'gōu',
+    0x26F4E: 'lù',
+    0x26F4F: 'fú',
+    0x26F50: 'huǐ',
+    0x26F52: 'zéi',
+    0x26F54: 'jìn',
+    0x26F55: 'sī',
+    0x26F56: 'qūn',
+    0x26F5C: 'dàn',
+    0x26F5E: 'wàn',
+    0x26F5F: 'biǎn',
+    0x26F64: 'jiá',
+    0x26F6B: 'dǎn',
+    0x26F6C: 'jiū',
+    0x26F6D: 'xián',
+    0x26F6E: 'bó',
+    0x26F8F: 'xiá',
+    0x26F91: 'biāo',
+    0x26F95: 'pò',
+    0x26F98: 'sǎo',
+    0x26F99: 'bèi',
+    0x26F9A: 'shà',
+    0x26F9B: 'wěi',
+    0x26F9D: 'cāng',
+    0x26F9E: 'lù',
+    0x26FA9: 'dàn',
+    0x26FAB: 'gǔ',
+    0x26FAC: 'zā',
+    0x26FAD: 'bǎng',
+    0x26FAE: 'gàn,gǎn',
+    0x26FB1: 'chāo',
+    0x26FB2: 'jì',
+    0x26FB3: 'liē',
+    0x26FB5: 'qióng',
+    0x26FB6: 'jiàn',
+    0x26FB7: 'lù',
+    0x26FB8: 'duān',
+    0x26FB9: 'suān',
+    0x26FBA: 'yáo',
+    0x26FBB: 'yǐn',
+    0x26FBD: 'tà',
+    0x26FBE: 'yáo',
+    0x26FBF: 'jīng',
+    0x26FC0: 'chú',
+    0x26FC1: 'fú',
+    0x26FC2: 'yuán',
+    0x26FC3: 'shǎo',
+    0x26FC5: 'bìng',
+    0x26FC6: 'dàng',
+    0x26FC7: 'shì',
+    0x26FCA: 'lú',
+    0x26FCB: 'qiè',
+    0x26FCC: 'luó',
+    0x26FCD: 'pò',
+    0x26FCF: 'méng,mèng',
+    0x26FD0: 'jié',
+    0x26FD3: 'jī',
+    0x26FD6: 'lù',
+    0x27004: 'chàng',
+    0x27005: 'miè,mò',
+    0x27006: 'méng',
+    0x27007: 'jiǎn',
+    0x2700A: 'cǎi',
+    0x2700C: 'sù',
+    0x27014: 'hè',
+    0x27015: 'sà',
+    0x27017: 'zī',
+    0x27018: 'kēng',
+    0x27019: 'gěng',
+    0x2701A: 'sī',
+    0x27020: 'tí',
+    0x27021: 'zhàn',
+    0x27022: 'xiè',
+    0x27023: 'shuí',
+    0x27024: 'chǐ',
+    0x27025: 'yōu',
+    0x27026: 'lǔ',
+    0x27027: 'mèng',
+    0x27028: 'liè',
+    0x27029: 'sì',
+    0x2702C: 'xī',
+    0x2702D: 'fán',
+    0x2702E: 'fū',
+    0x2702F: 'shěn',
+    0x27030: 'tí',
+    0x27031: 'chài',
+    0x27032: 'yuè',
+    0x27034: 'fū',
+    0x27035: 'jiàn,shǎn',
+    0x27036: 'dì',
+    0x2703A: 'xié',
+    0x2703B: 'dān',
+    0x2703F: 'zhí',
+    0x27043: 'xù',
+    0x27048: 'niè',
+    0x27049: 'fàn',
+    0x2704A: 'méng',
+    0x2704B: 'mǐn',
+    0x2707E: 'lóu',
+    0x2707F: 'dú,shǔ',
+    0x27081: 'zhàn',
+    0x27082: 'jiàn',
+    0x27083: 'hàn',
+    0x27084: 'dàn',
+    0x27085: 'sēn',
+    0x27086: 'jiàn',
+    0x27087: 'tán,xún',
+    0x27088: 'jiǎo',
+    0x27089: 'pó',
+    0x2708B: 'píng',
+    0x2708D: 'zhuàn,sūn',
+    0x2708F: 'liáo',
+    0x27090: 'zì',
+    0x27092: 'zhuó',
+    0x27094: 'hù',
+    0x27099: 'xì',
+    0x2709B: 'méng',
+    0x2709C: 'jù',
+    0x2709D: 'miè',
+    0x2709E: 'xián',
+    0x270A0: 'kuì',
+    0x270A1: 'méng',
+    0x270A2: 'jiān',
+    0x270A6: 'nóu',
+    0x270A8: 'dì',
+    0x270A9: 'sāo',
+    0x270CF: 'chù',
+    0x270D0: 'zhí',
+    0x270D1: 'qián',
+    0x270D2: 'lǚ',
+    0x270D4: 'zhuó',
+    0x270D8: 'zuò',
+    0x270D9: 'hán',
+    0x270DA: 'suǐ',
+    0x270DB: 'gòu',
+    0x270DD: 'chǒu',
+    0x270DE: 'jì',
+    0x270DF: 'yì',
+    0x270E0: 'yú',
+    0x270E8: 'nóu',
+    0x270E9: 'nǐ',
+    0x270EA: 'ruò',
+    0x270EE: 'lín',
+    0x270F1: 'níng',
+    0x2710D: 'qiáo',
+    0x2710E: 'yáo',
+    0x2710F: 'fù',
+    0x27110: 'shuāng',
+    0x27111: 'kuì',
+    0x27112: 'qú',
+    0x27113: 'dǒng',
+    0x27114: 'shǔ',
+    0x2711A: 'lí',
+    0x2711B: 'jú',
+    0x2711C: 'ruǐ',
+    0x27120: 'zhá',
+    0x27124: 'xiāo',
+    0x27138: 'mén,wěi',
+    0x27139: 'shí',
+    0x2713A: 'diān',
+    0x2713B: 'lì',
+    0x2713C: 'dèng,téng',
+    0x2713D: 'zàn,zā',
+    0x2713F: 'luó',
+    0x27140: 'cán',
+    0x27143: 'āo',
+    0x27146: 'jiǎn',
+    0x27148: 'diào',
+    0x2714B: 'yíng',
+    0x27156: 'yì',
+    0x27157: 'dǎng',
+    0x27158: 'nóu',
+    0x2715A: 'yuè',
+    0x2716E: 'lǐ',
+    0x2716F: 'lí',
+    0x27170: 'hù',
+    0x27172: 'yòu',
+    0x2717A: 'nàng',
+    0x27182: 'chèn',
+    0x27189: 'fēng',
+    0x2718A: 'biē',
+    0x2718F: 'mǎn',
+    0x27190: 'gàn',
+    0x27191: 'huò,suǐ',
+    0x27193: 'cū',
+    0x27195: 'yǒu',
+    0x27198: 'yòu',
+    0x2719C: 'xū',
+    0x271A1: 'xù',
+    0x271A2: 'hǔ',
+    0x271A3: 'lú',
+    0x271A5: 'xiá',
+    0x271A6: 'yì',
+    0x271AE: 'hǔ',
+    0x271AF: 'hù',
+    0x271B0: 'zǐ',
+    0x271B7: 'gōng',
+    0x271B8: 'tuī',
+    0x271B9: 'wū',
+    0x271BA: 'líng',
+    0x271BB: 'gū',
+    0x271BC: 'zhōng,dōng',
+    0x271C4: 'lú',
+    0x271C8: 'zù',
+    0x271CC: 'tóng',
+    0x271CD: 'xiā',
+    0x271CE: 'hé',
+    0x271D3: 'yuè',
+    0x271D9: 'nán',
+    0x271DA: 'bó',
+    0x271DB: 'hū',
+    0x271DC: 'qì',
+    0x271DD: 'shú',
+    0x271DE: 'qiāng',
+    0x271DF: 'zhōu',
+    0x271E0: 'yào',
+    0x271E1: 'gū',
+    0x271E5: 'bān',
+    0x271E6: 'kǎn',
+    0x271EE: 'hé',
+    0x271EF: 'jì',
+    0x271F0: 'hú',
+    0x271F1: 'yán',
+    0x271F6: 'chūn',
+    0x271F7: 'dǐng',
+    0x271F8: 'qiū',
+    0x271F9: 'hóu',
+    0x271FC: 'hào',
+    0x271FF: 'zù',
+    0x27201: 'xián',
+    0x27204: 'xià',
+    0x27205: 'xì',
+    0x27208: 'sè,xì',
+    0x2720C: 'gé',
+    0x2720D: 'xì',
+    0x27211: 'gé',
+    0x27214: 'lǚ',
+    0x27216: 'gé',
+    0x27217: 'kè',
+    0x27219: 'shòu',
+    0x2721A: 'zhù',
+    0x2721C: 'téng',
+    0x2721D: 'yà',
+    0x2721E: 'nì',
+    0x27226: 'luò',
+    0x27227: 'suī,méng',
+    0x2722A: 'chǎn',
+    0x2722D: 'wù',
+    0x2722F: 'yū',
+    0x27239: 'zǎo',
+    0x2723B: 'yì',
+    0x2723C: 'xī,jí',
+    0x2723D: 'hóng',
+    0x2723E: 'quán',
+    0x2723F: 'wǎng',
+    0x27240: 'chǐ',
+    0x27241: 'xì',
+    0x27242: 'tiǎn',
+    0x27243: 'yǔn',
+    0x27245: 'yī',
+    0x27246: 'jí',
+    0x27247: 'huī',
+    0x27248: 'fóu,fú',
+    0x2724A: 'fǔ',
+    0x2724D: 'jí',
+    0x2724E: 'xuán',
+    0x27251: 'tài',
+    0x27253: 'dù',
+    0x27257: 'yuán',
+    0x2725B: 'dì',
+    0x2725E: 'zhǔ',
+    0x2725F: 'tāi',
+    0x27261: 'rǒng',
+    0x27262: 'xué',
+    0x27263: 'yù',
+    0x27264: 'fàn',
+    0x27265: 'běi',
+    0x27267: 'qǔ,jié',
+    0x27269: 'bù',
+    0x2726A: 'jiā',
+    0x2726B: 'zhá',
+    0x2726D: 'nǔ',
+    0x2726E: 'shé,yán,yí',
+    0x27272: 'lì',
+    0x27284: 'guǐ',
+    0x27285: 'guǎi',
+    0x27287: 'dài,dé',
+    0x2728F: 'gāi',
+    0x27292: 'cì',
+    0x27294: 'yǎn',
+    0x27295: 'sōng',
+    0x27296: 'shì',
+    0x27298: 'kù',
+    0x27299: 'zhǐ',
+    0x2729A: 'tóng',
+    0x2729B: 'qú',
+    0x2729C: 'è',
+    0x2729E: 'xíng',
+    0x2729F: 'rú',
+    0x272A0: 'yú,shū',
+    0x272A3: 'yì',
+    0x272A4: 'yì',
+    0x272A5: 'xù',
+    0x272A6: 'fǒu',
+    0x272A7: 'gé,è',
+    0x272AC: 'hé',
+    0x272AD: 'yīn',
+    0x272AF: 'hòng',
+    0x272B1: 'duǒ',
+    0x272BD: 'xíng',
+    0x272BE: 'fán',
+    0x272C9: 'qī',
+    0x272CA: 'shā,shuō',
+    0x272CC: 'dù',
+    0x272CD: 'dì,xué',
+    0x272CE: 'lí',
+    0x272CF: 'yì',
+    0x272D0: 'xí',
+    0x272D1: 'gěng',
+    0x272D2: 'tóng,shì',
+    0x272D3: 'kào',
+    0x272D4: 'hòng',
+    0x272D5: 'kùn',
+    0x272D6: 'niè',
+    0x272D7: 'chí',
+    0x272D8: 'tí',
+    0x272DA: 'tóng',
+    0x272E0: 'lí,lǐ',
+    0x272E1: 'nà',
+    0x272F1: 'zhān',
+    0x272F2: 'běi',
+    0x27301: 'tiáo',
+    0x27303: 'zā',
+    0x27304: 'è,yè',
+    0x27305: 'shòu',
+    0x27306: 'kōng',
+    0x27307: 'péng',
+    0x27308: 'fù',
+    0x27309: 'lù',
+    0x2730A: 'xiè',
+    0x2730B: 'xiè',
+    0x2730C: 'xiū',
+    0x2730D: 'lù',
+    0x2730E: 'tiǎn',
+    0x2730F: 'tà',
+    0x27310: 'cì',
+    0x27311: 'qū',
+    0x27313: 'fù',
+    0x27314: 'zhī',
+    0x27316: 'xiè,shè',
+    0x27317: 'zǒu',
+    0x27318: 'fèi',
+    0x27319: 'mín',
+    0x2731A: 'xīng',
+    0x2731D: 'tóng',
+    0x2731E: 'qí',
+    0x27320: 'piāo',
+    0x27322: 'suì',
+    0x27323: 'ěr',
+    0x27327: 'hǔ',
+    0x2733B: 'sōng',
+    0x2733D: 'biē',
+    0x2733E: 'dīng',
+    0x2733F: 'bǎn',
+    0x27340: 'shī,lǐ',
+    0x27341: 'xiè',
+    0x27342: 'xiáo',
+    0x27343: 'fěi',
+    0x27352: 'chuǎn,chuǎi',
+    0x27353: 'shuài',
+    0x27354: 'yāo',
+    0x27355: 'jué',
+    0x27356: 'shěng,nìng',
+    0x27358: 'yōu',
+    0x27359: 'fàn',
+    0x2735C: 'kuí',
+    0x2735D: 'dì',
+    0x2735F: 'máo',
+    0x27360: 'jié',
+    0x27362: 'yán,yǐn',
+    0x27365: 'wēi',
+    0x27368: 'sāng',
+    0x27369: 'jié',
+    0x2736A: 'yú',
+    0x2736B: 'wèi',
+    0x2736C: 'è',
+    0x2736D: 'quán',
+    0x2736E: 'jiǒng',
+    0x2736F: 'féng',
+    0x27370: 'lóng',
+    0x27371: 'dié',
+    0x27372: 'pián',
+    0x27374: 'liàn',
+    0x27375: 'hú',
+    0x27376: 'lǜ',
+    0x2737F: 'diàn',
+    0x27383: 'cuì',
+    0x27384: 'móu,wù',
+    0x27395: 'wáng',
+    0x27396: 'juān',
+    0x27397: 'kē',
+    0x27398: 'yán',
+    0x27399: 'jiǎo',
+    0x273A1: 'gōng',
+    0x273A3: 'róng',
+    0x273A4: 'sūn',
+    0x273A5: 'shàn',
+    0x273A8: 'chí',
+    0x273AA: 'qí',
+    0x273AB: 'suǒ',
+    0x273AD: 'yè',
+    0x273AE: 'zǎo',
+    0x273AF: 'quē',
+    0x273B0: 'zhǎn',
+    0x273B1: 'bā',
+    0x273B2: 'zú',
+    0x273B3: 'suǒ',
+    0x273B4: 'zhé',
+    0x273B5: 'xì',
+    0x273B7: 'chǔ',
+    0x273B8: 'jiǎo',
+    0x273B9: 'zuì',
+    0x273BA: 'gē',
+    0x273BB: 'wù,móu',
+    0x273BE: 'lüè',
+    0x273BF: 'jí',
+    0x273C2: 'xié',
+    0x273C3: 'xié',
+    0x273C6: 'dǒu',
+    0x273CB: 'qiū',
+    0x273D1: 'píng',
+    0x273D3: 'liú',
+    0x273E5: 'jié',
+    0x273E7: 'huì',
+    0x273EB: 'shà',
+    0x273F8: 'zhí',
+    0x273F9: 'ài',
+    0x273FA: 'xù,òu',
+    0x273FB: 'bì',
+    0x273FD: 'yē',
+    0x273FE: 'nì',
+    0x273FF: 'zhú',
+    0x27401: 'sù',
+    0x27403: 'xié',
+    0x27404: 'yù,yú',
+    0x27405: 'qū',
+    0x27408: 'zú',
+    0x27409: 'zhī',
+    0x2740A: 'zhāng',
+    0x2740B: 'lüè',
+    0x2740C: 'wěi',
+    0x2740D: 'chōng',
+    0x2740E: 'mì',
+    0x27410: 'jī',
+    0x27412: 'sù',
+    0x27413: 'yě',
+    0x27414: 'xí,yì',
+    0x27415: 'tuán',
+    0x27416: 'lián,liàn',
+    0x27417: 'xuán',
+    0x27419: 'wù',
+    0x2741F: 'máo',
+    0x2742C: 'hóng',
+    0x2742F: 'lüè',
+    0x27430: 'dú',
+    0x27431: 'cóng',
+    0x27432: 'chán',
+    0x27433: 'lù',
+    0x27434: 'sù',
+    0x27440: 'lüè',
+    0x27446: 'zhōng',
+    0x27447: 'lí',
+    0x27448: 'fèi',
+    0x2744A: 'jǐng',
+    0x2744B: 'kuì',
+    0x2744C: 'yì',
+    0x2744D: 'huá',
+    0x2744E: 'cuì',
+    0x27450: 'yù',
+    0x27451: 'běng',
+    0x27452: 'tūn',
+    0x27453: 'shǔ',
+    0x27454: 'dài',
+    0x27455: 'wū',
+    0x27456: 'cì',
+    0x27457: 'nìng',
+    0x27458: 'dàng',
+    0x27459: 'zú',
+    0x2745A: 'hán',
+    0x2745C: 'pí',
+    0x2745D: 'chuàn',
+    0x27460: 'dù',
+    0x27461: 'pá',
+    0x27464: 'zhū',
+    0x27466: 'xié',
+    0x27467: 'zhé',
+    0x27468: 'qiè',
+    0x27469: 'xuān',
+    0x2746B: 'sào',
+    0x27480: 'bì',
+    0x27482: 'fù',
+    0x27488: 'lì',
+    0x2748E: 'é',
+    0x27490: 'yē',
+    0x27491: 'shǔ',
+    0x27493: 'sè',
+    0x27495: 'qī',
+    0x27496: 'guò',
+    0x27497: 'sè',
+    0x27499: 'fù',
+    0x2749A: 'máo',
+    0x2749C: 'léi',
+    0x2749D: 'zhān',
+    0x274A8: 'chài',
+    0x274AD: 'wèi',
+    0x274BD: 'léi',
+    0x274BF: 'zéi',
+    0x274C0: 'yīng',
+    0x274C1: 'ài',
+    0x274C2: 'xiē',
+    0x274C4: 'bì',
+    0x274CB: 'chán',
+    0x274CE: 'pí,bī',
+    0x274CF: 'cóng',
+    0x274D0: 'liè',
+    0x274D1: 'qí',
+    0x274D3: 'jì',
+    0x274D4: 'jīng',
+    0x274D5: 'dōng',
+    0x274D6: 'féi',
+    0x274D7: 'yí',
+    0x274D8: 'tuán',
+    0x274E8: 'měng',
+    0x274E9: 'cán',
+    0x274EA: 'yá',
+    0x274F2: 'yǎng',
+    0x274F4: 'tíng',
+    0x274F8: 'zhí',
+    0x274FA: 'xiè',
+    0x274FB: 'lǜ',
+    0x274FD: 'lì,chài',
+    0x274FF: 'máo',
+    0x27502: 'xiá',
+    0x27505: 'sòu',
+    0x27516: 'sū',
+    0x27517: 'xuè',
+    0x2751D: 'lì',
+    0x2751E: 'yuán',
+    0x27521: 'zhǎn',
+    0x27523: 'tà',
+    0x27524: 'xuán',
+    0x27525: 'wèi',
+    0x27526: 'yè',
+    0x27527: 'páng',
+    0x27528: 'máo',
+    0x27529: 'tí',
+    0x2752A: 'pín',
+    0x2752C: 'dù',
+    0x2752D: 'qiú',
+    0x2752E: 'yǐ',
+    0x27533: 'tuó',
+    0x27534: 'chài',
+    0x27537: 'jìn',
+    0x2753C: 'é',
+    0x27543: 'chán',
+    0x27544: 'yīng',
+    0x27545: 'líng',
+    0x27547: 'xiǎn',
+    0x27549: 'qī',
+    0x2754B: 'yuè',
+    0x2754C: 'lüè',
+    0x2754D: 'yíng',
+    0x2754E: 'qú',
+    0x27552: 'fěi',
+    0x27553: 'zī',
+    0x27559: 'qīng',
+    0x2755D: 'níng',
+    0x2755E: 'wèi',
+    0x2755F: 'shuāng',
+    0x27561: 'fù',
+    0x27564: 'mò',
+    0x27565: 'mò',
+    0x27566: 'tuó',
+    0x27567: 'chài',
+    0x27568: 'zàng',
+    0x2756E: 'lí',
+    0x2756F: 'lí,shī',
+    0x27571: 'xiá',
+    0x27572: 'juǎn',
+    0x27574: 'nán',
+    0x27575: 'mì',
+    0x27578: 'huáng',
+    0x2757A: 'shuāng',
+    0x2757C: 'xǔ',
+    0x2757F: 'fěi',
+    0x27581: 'xiè,wén',
+    0x27586: 'tà',
+    0x27587: 'yǒng',
+    0x27589: 'zhǎn',
+    0x27591: 'qiáng',
+    0x27592: 'náng',
+    0x27594: 'lìn',
+    0x27598: 'luán',
+    0x27599: 'xiǎn',
+    0x2759A: 'fú',
+    0x2759C: 'líng',
+    0x275A0: 'sāo',
+    0x275A2: 'huì',
+    0x275A8: 'tíng',
+    0x275AA: 'qíng',
+    0x275AC: 'huāng',
+    0x275AE: 'àn',
+    0x275B5: 'mǎn',
+    0x275B7: 'nì,nǜ',
+    0x275BB: 'guó',
+    0x275BC: 'ǒu',
+    0x275BF: 'xiàng',
+    0x275C1: 'jīn',
+    0x275C6: 'zhēng',
+    0x275C8: 'nú',
+    0x275CB: 'sàn',
+    0x275CC: 'hù',
+    0x275CE: 'zú',
+    0x275CF: 'huǐ',
+    0x275D2: 'jī',
+    0x275D6: 'yè',
+    0x275E6: 'xíng',
+    0x275E9: 'là',
+    0x275EA: 'yù,qú',
+    0x275EB: 'jué',
+    0x275F1: 'shù,yù',
+    0x275F2: 'zhēng',
+    0x275F4: 'yǒng',
+    0x275F6: 'gē',
+    0x275F8: 'jiàn',
+    0x275F9: 'xìn,xiān',
+    0x275FC: 'huī',
+    0x275FF: 'shuài',
+    0x27602: 'chōng',
+    0x27603: 'háng',
+    0x27608: 'liǎo',
+    0x2760D: 'jiāng',
+    0x2760F: 'gōng',
+    0x27611: 'zhuó,bào',
+    0x27617: 'qǐ',
+    0x2761C: 'qiān',
+    0x2761E: 'dǒu',
+    0x2761F: 'pō,bō',
+    0x27622: 'hù',
+    0x27625: 'niǔ',
+    0x27627: 'qì',
+    0x27628: 'diāo',
+    0x27629: 'diāo',
+    0x2762B: 'lì',
+    0x2762E: 'xiōng',
+    0x2763D: 'ná',
+    0x2763F: 'zhēng',
+    0x27640: 'là',
+    0x27641: 'zhì,zī,jì,pī',
+    0x27643: 'ě',
+    0x27644: 'bō',
+    0x27645: 'pō',
+    0x27646: 'xū',
+    0x27647: 'yòng,dǎn',
+    0x27648: 'cí',
+    0x27649: 'lì',
+    0x2764C: 'páo',
+    0x2764F: 'xiù,yǒu',
+    0x2765B: 'pù',
+    0x2765D: 'ché',
+    0x2765E: 'qì',
+    0x27661: 'yì',
+    0x27663: 'tí',
+    0x27664: 'duǒ',
+    0x27665: 'lóng,tǒng',
+    0x27667: 'jiàn',
+    0x2766D: 'zhàn',
+    0x2766E: 'yuàn',
+    0x27676: 'yú',
+    0x27678: 'gēng',
+    0x2767A: 'hòu',
+    0x2767E: 'qǐ',
+    0x27680: 'mù',
+    0x27681: 'huàn',
+    0x27682: 'lòng',
+    0x27683: 'xì',
+    0x27684: 'é',
+    0x27685: 'lǎng',
+    0x27686: 'fèi',
+    0x27687: 'wǎn,wèn',
+    0x27689: 'cūn',
+    0x2768B: 'péng',
+    0x2768F: 'cuò',
+    0x27690: 'wēng',
+    0x276A1: 'gǎo',
+    0x276A5: 'cuì',
+    0x276A8: 'qì,shà,qiè',
+    0x276A9: 'lí',
+    0x276AA: 'qiè',
+    0x276AB: 'qiàn,jīng',
+    0x276AC: 'kōng',
+    0x276AD: 'běng',
+    0x276AF: 'shòu',
+    0x276B7: 'wēi',
+    0x276C4: 'shān',
+    0x276CF: 'zī',
+    0x276D2: 'tì',
+    0x276D3: 'qiān',
+    0x276D4: 'dú',
+    0x276D7: 'tú',
+    0x276DA: 'wēi',
+    0x276DE: 'hú',
+    0x276DF: 'xīng',
+    0x276E1: 'shān',
+    0x276E2: 'zhǐ',
+    0x276E7: 'chǐ',
+    0x276F8: 'zhòu',
+    0x276F9: 'wēng',
+    0x276FA: 'chí',
+    0x276FB: 'suǒ',
+    0x276FC: 'xiè',
+    0x276FE: 'kè',
+    0x27701: 'shài,shā,shǎi',
+    0x27702: 'shī',
+    0x27703: 'shòu',
+    0x27705: 'jiè',
+    0x27709: 'gǎo',
+    0x2770A: 'lǚ',
+    0x27714: 'xiè',
+    0x2771A: 'zhǐ',
+    0x2771E: 'mán,màn',
+    0x27720: 'shuài',
+    0x27721: 'kè',
+    0x27723: 'diǎo',
+    0x27724: 'yī',
+    0x27726: 'sù',
+    0x27727: 'chuāng',
+    0x27731: 'cuì',
+    0x27732: 'tuò',
+    0x27735: 'xiè',
+    0x2773D: 'xuán',
+    0x27742: 'hè',
+    0x27743: 'jué',
+    0x27746: 'tì',
+    0x27747: 'fèi',
+    0x27749: 'zhǐ',
+    0x2774A: 'shì',
+    0x2774B: 'tuí',
+    0x2774E: 'chōng,chuáng,chóng',
+    0x27750: 'tì',
+    0x27751: 'zhàn',
+    0x27752: 'héng',
+    0x27754: 'qú',
+    0x27755: 'wéi',
+    0x27757: 'dūn',
+    0x27758: 'bào',
+    0x2775C: 'liáo',
+    0x27764: 'sī',
+    0x2776A: 'biǎo',
+    0x2776B: 'xiè',
+    0x2776C: 'bié,bì',
+    0x2776E: 'cǒng',
+    0x27772: 'jù',
+    0x27773: 'hé',
+    0x27777: 'kuì',
+    0x27778: 'yōng',
+    0x27780: 'shù',
+    0x2778D: 'niè',
+    0x2778F: 'yú',
+    0x27790: 'zhuó',
+    0x27791: 'méng',
+    0x27792: 'hú',
+    0x27795: 'liè',
+    0x2779D: 'jiē',
+    0x2779E: 'xióng',
+    0x277A3: 'yǎn',
+    0x277A9: 'jié',
+    0x277AA: 'là,lié',
+    0x277AB: 'shù',
+    0x277AC: 'jié',
+    0x277AD: 'léi',
+    0x277B0: 'zú',
+    0x277B2: 'shì',
+    0x277B8: 'wéi,suì',
+    0x277B9: 'dū',
+    0x277BA: 'sù',
+    0x277C3: 'xié',
+    0x277C4: 'ráng',
+    0x277CC: 'luò',
+    0x277D1: 'qiān',
+    0x277D8: 'nàng',
+    0x277D9: 'líng',
+    0x277DC: 'jì',
+    0x277E0: 'mìng',
+    0x277E3: 'gǔ',
+    0x277E8: 'xuán',
+    0x277EC: 'xū',
+    0x277F1: 'bó',
+    0x277FC: 'wēi',
+    0x27802: 'kū',
+    0x27806: 'wǎn',
+    0x27808: 'chà',
+    0x2780A: 'mào',
+    0x2780B: 'kè',
+    0x2780E: 'cì',
+    0x27812: 'xiàn',
+    0x27813: 'mò',
+    0x2781A: 'hūn',
+    0x2781B: 'chàn',
+    0x2781C: 'shī',
+    0x2781D: 'zhěn',
+    0x2781E: 'è',
+    0x2781F: 'mí',
+    0x27821: 'shī',
+    0x27822: 'qū',
+    0x27823: 'shū',
+    0x27825: 'cī',
+    0x27826: 'yǎn',
+    0x27829: 'hū',
+    0x2782A: 'qī',
+    0x2782B: 'zhì,dí,chì',
+    0x2782C: 'huāng',
+    0x27834: 'zhǐ',
+    0x27836: 'yǒu',
+    0x2783C: 'gào',
+    0x2783D: 'yǎo',
+    0x2783E: 'pōu',
+    0x27847: 'yí',
+    0x27848: 'chèng',
+    0x27849: 'jì',
+    0x2784B: 'ǎi,yá',
+    0x2784D: 'dòng',
+    0x2784F: 'suì',
+    0x27851: 'jiù',
+    0x27858: 'qì,qīn',
+    0x27859: 'lián',
+    0x2785A: 'xuǎn',
+    0x2785C: 'liǎo',
+    0x27861: 'yùn',
+    0x27862: 'xuǎn',
+    0x27863: 'cóu',
+    0x27864: 'piān',
+    0x27866: 'kuí',
+    0x27868: 'tí',
+    0x27869: 'huǎn',
+    0x2786A: 'dān,dàn',
+    0x2786B: 'guì,kuì',
+    0x2786C: 'chēn',
+    0x2786E: 'shǎng',
+    0x2786F: 'jì',
+    0x27874: 'liàn',
+    0x27875: 'kān',
+    0x27876: 'shèng',
+    0x27878: 'dōu',
+    0x27879: 'yóu',
+    0x2787A: 'qí',
+    0x2787C: 'xiǎo',
+    0x27882: 'yì',
+    0x27883: 'lóu',
+    0x27886: 'chuāng',
+    0x2788B: 'lào',
+    0x2788C: 'gāo',
+    0x27890: 'zēng',
+    0x27892: 'wéi,wěi',
+    0x27896: 'jiān',
+    0x2789B: 'yīng',
+    0x2789C: 'fán',
+    0x2789D: 'lì',
+    0x2789E: 'qiān',
+    0x278A2: 'yào',
+    0x278A6: 'kuī,kuí,guì',
+    0x278A7: 'wéi',
+    0x278A9: 'què',
+    0x278AC: 'xiǎo',
+    0x278AD: 'què',
+    0x278B0: 'hū',
+    0x278B5: 'duō',
+    0x278B6: 'chù',
+    0x278B9: 'shēn,jīn',
+    0x278BC: 'zhuó',
+    0x278BD: 'é',
+    0x278BE: 'jì',
+    0x278C1: 'tán',
+    0x278C3: 'pā',
+    0x278CB: 'jiè',
+    0x278CC: 'qiào',
+    0x278D1: 'qián',
+    0x278D2: 'jù',
+    0x278D5: 'qiú',
+    0x278D6: 'tuó',
+    0x278DA: 'nuò',
+    0x278DB: 'sì',
+    0x278DF: 'yí',
+    0x278E1: 'gǔ',
+    0x278E2: 'hùn',
+    0x278E3: 'pá',
+    0x278E4: 'zī',
+    0x278E6: 'jiāo',
+    0x278E9: 'xǐ',
+    0x278EA: 'shǎo,shào',
+    0x278EC: 'yí',
+    0x278ED: 'zhì',
+    0x278F5: 'lùn',
+    0x278F7: 'zhōu',
+    0x278F8: 'jué',
+    0x278F9: 'tán',
+    0x278FA: 'nuò,chuò',
+    0x278FB: 'jù',
+    0x278FC: 'hú',
+    0x278FE: 'zhì',
+    0x27903: 'bī',
+    0x2790D: 'chì,tì',
+    0x2790E: 'xuān',
+    0x2790F: 'jí',
+    0x27910: 'guǎ',
+    0x27911: 'jú',
+    0x27912: 'wò',
+    0x27913: 'tuó',
+    0x27915: 'qiú',
+    0x27916: 'wēi',
+    0x27917: 'duān',
+    0x27919: 'shòu',
+    0x2791B: 'zhěn',
+    0x2791C: 'nè,lì',
+    0x2791F: 'xì',
+    0x27920: 'zhé',
+    0x27921: 'zhì',
+    0x27923: 'ná',
+    0x27928: 'jiān',
+    0x2792E: 'yáo',
+    0x2792F: 'guó,yuè',
+    0x27932: 'dǐ',
+    0x27934: 'huò',
+    0x27935: 'jīng',
+    0x2793C: 'jué',
+    0x2793D: 'yuè,jiàn',
+    0x27944: 'jí',
+    0x27946: 'sù',
+    0x27948: 'jiān',
+    0x2794A: 'kūn',
+    0x2794B: 'wò',
+    0x2794C: 'kuàng',
+    0x2794D: 'biāo',
+    0x2794E: 'jué',
+    0x27951: 'bì',
+    0x27953: 'chán',
+    0x27955: 'zī',
+    0x27956: 'lí,shǐ',
+    0x2795A: 'fó',
+    0x2795B: 'qiǎn',
+    0x2795C: 'yǎn',
+    0x2795E: 'tàn',
+    0x2795F: 'mò',
+    0x27963: 'kòu',
+    0x27964: 'xī,xiē',
+    0x2796E: 'hù,dǐ',
+    0x2796F: 'hù',
+    0x27971: 'fú',
+    0x27974: 'yàng',
+    0x27975: 'guò',
+    0x27977: 'rén',
+    0x27978: 'yìn',
+    0x27979: 'fēng',
+    0x2797A: 'jùn,yùn',
+    0x2797C: 'yún',
+    0x2797F: 'xùn',
+    0x27981: 'xì',
+    0x2798E: 'xiā',
+    0x27991: 'háng',
+    0x2799A: 'hù,dǐ',
+    0x2799D: 'hū,hào',
+    0x2799E: 'pù',
+    0x2799F: 'fān',
+    0x279A4: 'jiā',
+    0x279A7: 'yí,tuō',
+    0x279AD: 'tuō,xī',
+    0x279AE: 'ná',
+    0x279B8: 'yín',
+    0x279B9: 'yìn',
+    0x279C3: 'jì',
+    0x279C4: 'wàng',
+    0x279C5: 'shì,jiàn',
+    0x279C6: 'duī',
+    0x279C7: 'duò',
+    0x279C9: 'tuó',
+    0x279CA: 'wā',
+    0x279CB: 'lì',
+    0x279CF: 'rè,rě',
+    0x279D2: 'cì',
+    0x279D3: 'xù',
+    0x279D4: 'zhōu',
+    0x279D5: 'zì',
+    0x279DC: 'wǎng',
+    0x279DD: 'yǎ',
+    0x279DF: 'jì',
+    0x279E0: 'chǎo',
+    0x279E9: 'jí',
+    0x279F5: 'shǎn',
+    0x279F6: 'tú',
+    0x279F8: 'bié',
+    0x279F9: 'xì',
+    0x279FA: 'pī',
+    0x279FB: 'zhà',
+    0x279FE: 'huì',
+    0x27A00: 'suō,zuò',
+    0x27A02: 'hè',
+    0x27A04: 'yuē',
+    0x27A06: 'wū,huǎng',
+    0x27A08: 'líng,wū',
+    0x27A0A: 'zhà',
+    0x27A0B: 'huá',
+    0x27A17: 'chán',
+    0x27A1F: 'è',
+    0x27A21: 'chén',
+    0x27A27: 'suì',
+    0x27A29: 'tiǎn',
+    0x27A30: 'zhì',
+    0x27A31: 'tì',
+    0x27A32: 'āo',
+    0x27A33: 'zhuó',
+    0x27A34: 'zì',
+    0x27A35: 'kē',
+    0x27A37: 'sè',
+    0x27A38: 'tián',
+    0x27A39: 'lù',
+    0x27A3E: 'shán',
+    0x27A3F: 'zhǎ',
+    0x27A43: 'chōng',
+    0x27A45: 'yàn',
+    0x27A52: 'mǔ',
+    0x27A53: 'hū',
+    0x27A5A: 'chī',
+    0x27A5D: 'sù',
+    0x27A63: 'nǎo',
+    0x27A66: 'jí',
+    0x27A67: 'duó',
+    0x27A68: 'hòu',
+    0x27A6A: 'còng',
+    0x27A6B: 'zhā,chà',
+    0x27A6C: 'yín',
+    0x27A6E: 'xiǎo,sǒu,sòu',
+    0x27A70: 'biàn',
+    0x27A71: 'bèng',
+    0x27A72: 'là',
+    0x27A74: 'chī,chì',
+    0x27A76: 'qià',
+    0x27A78: 'ān',
+    0x27A79: 'shī,yǐ',
+    0x27A7C: 'chì,zhǐ',
+    0x27A85: 'nù',
+    0x27A87: 'jì',
+    0x27A93: 'ǒu',
+    0x27A95: 'xiā',
+    0x27A98: 'chài,cuǒ,jiē',
+    0x27A9A: 'ái',
+    0x27A9D: 'shèng',
+    0x27A9E: 'hé,gé',
+    0x27AA0: 'jí',
+    0x27AA1: 'chī',
+    0x27AA2: 'xì',
+    0x27AA3: 'zhēng',
+    0x27AA6: 'tā',
+    0x27AA8: 'mà',
+    0x27AAB: 'pī',
+    0x27AAE: 'xū,huá',
+    0x27AAF: 'qiǎn',
+    0x27AB9: 'xià',
+    0x27ACA: 'yù',
+    0x27AD1: 'jié',
+    0x27AD2: 'xià',
+    0x27AD3: 'lǔ',
+    0x27AD5: 'qiè',
+    0x27AD7: 'chà',
+    0x27ADB: 'yàng',
+    0x27ADC: 'jì',
+    0x27ADD: 'shǎ',
+    0x27ADE: 'lòu',
+    0x27AE0: 'jī',
+    0x27AE1: 'zhì',
+    0x27AE2: 'wàng',
+    0x27AE4: 'bì',
+    0x27AE5: 'ān',
+    0x27AE6: 'yī',
+    0x27AE7: 'ān,àn',
+    0x27AEC: 'lí',
+    0x27AF9: 'xiān',
+    0x27AFE: 'jiù',
+    0x27AFF: 'tǎn',
+    0x27B01: 'hào',
+    0x27B02: 'hè',
+    0x27B05: 'zhā',
+    0x27B06: 'zhǎn',
+    0x27B07: 'yì',
+    0x27B08: 'xì',
+    0x27B0A: 'xì,sí',
+    0x27B0B: 'fà',
+    0x27B0C: 'yán',
+    0x27B0F: 'mǔ',
+    0x27B15: 'gū',
+    0x27B1E: 'yún',
+    0x27B24: 'zhòng',
+    0x27B26: 'chǎn',
+    0x27B27: 'chuáng',
+    0x27B28: 'huì',
+    0x27B29: 'zá',
+    0x27B2A: 'gùn',
+    0x27B2B: 'jiǎn',
+    0x27B2C: 'yá',
+    0x27B30: 'xiàng,xiǎng',
+    0x27B31: 'hè',
+    0x27B43: 'dàn',
+    0x27B47: 'mián',
+    0x27B48: 'níng,nìng',
+    0x27B4A: 'méng',
+    0x27B4C: 'liè',
+    0x27B4D: 'zhòu',
+    0x27B4E: 'pū',
+    0x27B4F: 'tāi',
+    0x27B53: 'yíng',
+    0x27B54: 'téng',
+    0x27B55: 'guó',
+    0x27B5A: 'qiáng',
+    0x27B5C: 'lǜ',
+    0x27B5D: 'sà',
+    0x27B5E: 'liè',
+    0x27B5F: 'chí',
+    0x27B60: 'xiě',
+    0x27B63: 'guó',
+    0x27B64: 'bào,báo',
+    0x27B65: 'luò',
+    0x27B66: 'juàn,xuān',
+    0x27B6A: 'è',
+    0x27B73: 'hé',
+    0x27B75: 'mèi',
+    0x27B78: 'xiè',
+    0x27B79: 'pín',
+    0x27B7B: 'hān',
+    0x27B7C: 'chèn',
+    0x27B7D: 'shàn',
+    0x27B7E: 'huì',
+    0x27B86: 'yīng',
+    0x27B88: 'jiǎn',
+    0x27B8D: 'ān',
+    0x27B91: 'tà',
+    0x27B92: 'yī',
+    0x27B93: 'tuí',
+    0x27B97: 'liú',
+    0x27B99: 'zuó',
+    0x27B9B: 'lí',
+    0x27B9D: 'pín',
+    0x27B9E: 'xuè',
+    0x27BA0: 'nèn',
+    0x27BA1: 'dòu',
+    0x27BA4: 'lǎn',
+    0x27BAA: 'zhān',
+    0x27BAB: 'jué',
+    0x27BAC: 'zhēn,jué',
+    0x27BAD: 'jí',
+    0x27BAE: 'qiān',
+    0x27BB0: 'hān',
+    0x27BB1: 'fén',
+    0x27BB3: 'hān',
+    0x27BB4: 'hóng',
+    0x27BB5: 'hé',
+    0x27BB6: 'hóu',
+    0x27BBA: 'zhàn',
+    0x27BBB: 'chóu,xiāo',
+    0x27BBC: 'tài',
+    0x27BBD: 'qiàn',
+    0x27BBF: 'shè',
+    0x27BC0: 'yīng',
+    0x27BC3: 'qīn',
+    0x27BC6: 'huò',
+    0x27BC8: 'xì',
+    0x27BC9: 'hè',
+    0x27BCA: 'xì',
+    0x27BCB: 'xiā',
+    0x27BCC: 'hāo',
+    0x27BCD: 'lào',
+    0x27BCF: 'lì',
+    0x27BD2: 'chēng',
+    0x27BD6: 'jùn',
+    0x27BD7: 'xī',
+    0x27BD8: 'hǎn',
+    0x27BDE: 'dòu,dōu',
+    0x27BE0: 'dōu',
+    0x27BE1: 'wān,yuè',
+    0x27BE4: 'dōu',
+    0x27BE5: 'zài',
+    0x27BE6: 'juàn',
+    0x27BE8: 'lǒu',
+    0x27BE9: 'chù',
+    0x27BEB: 'zhēng',
+    0x27BEF: 'qí',
+    0x27BF0: 'kàn',
+    0x27BF1: 'huò,yù',
+    0x27BF2: 'lái',
+    0x27BFA: 'gāi',
+    0x27BFC: 'shòu',
+    0x27BFE: 'dōng',
+    0x27C03: 'lóu',
+    0x27C04: 'tuān',
+    0x27C07: 'yú',
+    0x27C08: 'wù',
+    0x27C0A: 'tián',
+    0x27C12: 'guó',
+    0x27C18: 'tán',
+    0x27C19: 'qí',
+    0x27C20: 'liè',
+    0x27C21: 'lì',
+    0x27C23: 'xūn',
+    0x27C28: 'gèng',
+    0x27C29: 'tīng',
+    0x27C2A: 'hàn',
+    0x27C2B: 'chù',
+    0x27C2D: 'tún',
+    0x27C2F: 'xióng',
+    0x27C30: 'yóu',
+    0x27C31: 'mò',
+    0x27C32: 'chǐ',
+    0x27C34: 'hǔ',
+    0x27C35: 'dū,dú,zhuó',
+    0x27C37: 'mǔ',
+    0x27C39: 'nà',
+    0x27C3B: 'líng',
+    0x27C3F: 'ài',
+    0x27C40: 'xiān',
+    0x27C44: 'kǎn',
+    0x27C45: 'sì',
+    0x27C46: 'sān',
+    0x27C4A: 'yì',
+    0x27C4F: 'yì',
+    0x27C50: 'xiào,xiāo',
+    0x27C52: 'zhī,zhuō',
+    0x27C53: 'dòu',
+    0x27C58: 'mài',
+    0x27C5C: 'lún',
+    0x27C5D: 'jué,jùn',
+    0x27C61: 'qiāng',
+    0x27C62: 'líng',
+    0x27C69: 'pián',
+    0x27C6A: 'còu',
+    0x27C6B: 'duò',
+    0x27C6C: 'yǔ',
+    0x27C70: 'zhuō',
+    0x27C72: 'xì',
+    0x27C73: 'huài',
+    0x27C74: 'míng',
+    0x27C75: 'táng',
+    0x27C79: 'pū',
+    0x27C7B: 'mì',
+    0x27C7C: 'mán',
+    0x27C7E: 'guāi',
+    0x27C80: 'qiān',
+    0x27C82: 'lín',
+    0x27C83: 'mǐn',
+    0x27C84: 'wěi',
+    0x27C85: 'céng',
+    0x27C87: 'hù',
+    0x27C88: 'suí',
+    0x27C8B: 'jù',
+    0x27C8C: 'shà',
+    0x27C8D: 'méng',
+    0x27C97: 'wéi',
+    0x27C98: 'xī',
+    0x27C99: 'lìng',
+    0x27C9C: 'bì',
+    0x27C9D: 'wèi',
+    0x27CA1: 'lì',
+    0x27CA2: 'zhé',
+    0x27CA4: 'yóng',
+    0x27CA5: 'hú',
+    0x27CA6: 'wán,hé',
+    0x27CA7: 'bā',
+    0x27CA8: 'jiān',
+    0x27CAD: 'zuǒ',
+    0x27CAE: 'zhǎn',
+    0x27CAF: 'bō',
+    0x27CB0: 'qiū,chū',
+    0x27CB1: 'yāng',
+    0x27CB4: 'dōng',
+    0x27CB5: 'qú',
+    0x27CBA: 'pí',
+    0x27CBB: 'zhǎi',
+    0x27CBE: 'shān',
+    0x27CBF: 'gòu',
+    0x27CC0: 'biào,nǎo',
+    0x27CC1: 'yí',
+    0x27CC2: 'fú',
+    0x27CC4: 'xìn',
+    0x27CC5: 'shì,shǐ',
+    0x27CC6: 'tōng,tóng',
+    0x27CC9: 'dīng',
+    0x27CCC: 'tū',
+    0x27CCD: 'xiāo',
+    0x27CCE: 'wú',
+    0x27CCF: 'péi',
+    0x27CD0: 'huī,xī',
+    0x27CD5: 'lái',
+    0x27CD9: 'sì',
+    0x27CDA: 'cuǐ',
+    0x27CDB: 'shà',
+    0x27CDC: 'zhǒu',
+    0x27CDD: 'zhào',
+    0x27CDE: 'wéi',
+    0x27CDF: 'lái',
+    0x27CE0: 'bì,bǐ',
+    0x27CE3: 'dǒng',
+    0x27CE6: 'nǎo',
+    0x27CE7: 'xiē',
+    0x27CE8: 'rǎo',
+    0x27CE9: 'tuàn',
+    0x27CEA: 'wèi',
+    0x27CEB: 'yóu,jiū,qiú,yòu',
+    0x27CEC: 'méi',
+    0x27CED: 'yuán',
+    0x27CEE: 'zhòng',
+    0x27CF6: 'sōu',
+    0x27CF8: 'gú',
+    0x27CF9: 'shào',
+    0x27CFB: 'zhǎo',
+    0x27CFC: 'pí',
+    0x27CFF: 'tōng',
+    0x27D01: 'chī',
+    0x27D02: 'péng',
+    0x27D03: 'chán',
+    0x27D04: 'yōng',
+    0x27D05: 'shuǎng',
+    0x27D07: 'wǔ',
+    0x27D09: 'pí',
+    0x27D0A: 'huàn',
+    0x27D0C: 'fú',
+    0x27D0E: 'biào',
+    0x27D13: 'náo',
+    0x27D15: 'biào',
+    0x27D16: 'wèi',
+    0x27D17: 'yōng',
+    0x27D19: 'nǎo',
+    0x27D1A: 'guài',
+    0x27D20: 'lì',
+    0x27D22: 'xìn',
+    0x27D23: 'yán',
+    0x27D24: 'pò',
+    0x27D25: 'péi',
+    0x27D2A: 'suǒ',
+    0x27D2C: 'rèn',
+    0x27D2D: 'shǎn',
+    0x27D32: 'suǒ',
+    0x27D38: 'dān',
+    0x27D3A: 'mèn',
+    0x27D43: 'shǒu',
+    0x27D48: 'gòu',
+    0x27D4A: 'hān,hàn,tàn',
+    0x27D4B: 'shì',
+    0x27D4C: 'yǎng',
+    0x27D4E: 'gǔ',
+    0x27D5B: 'kē',
+    0x27D5E: 'jū',
+    0x27D60: 'pài',
+    0x27D61: 'cè',
+    0x27D62: 'bāo',
+    0x27D63: 'xiōng,mín',
+    0x27D64: 'cái,zhù',
+    0x27D67: 'lǐn',
+    0x27D68: 'ài',
+    0x27D6C: 'mì,shèn',
+    0x27D6D: 'lǎi',
+    0x27D71: 'xiāo',
+    0x27D73: 'shé',
+    0x27D7B: 'huó',
+    0x27D7C: 'nì',
+    0x27D84: 'zhèng',
+    0x27D86: 'lìn',
+    0x27D87: 'zhá',
+    0x27D8A: 'yún',
+    0x27D8D: 'xù',
+    0x27D94: 'chéng',
+    0x27D95: 'wǒ',
+    0x27D96: 'xī',
+    0x27D99: 'bèi',
+    0x27D9C: 'shāng,shǎng',
+    0x27DA0: 'yù',
+    0x27DA1: 'mì',
+    0x27DB2: 'duǎn,zhuàn',
+    0x27DB5: 'chà',
+    0x27DB7: 'zé',
+    0x27DB8: 'chèng',
+    0x27DBA: 'tíng',
+    0x27DC5: 'yí',
+    0x27DCB: 'yāo',
+    0x27DCE: 'kū',
+    0x27DD0: 'fén',
+    0x27DD1: 'xié',
+    0x27DD2: 'chèng',
+    0x27DDB: 'kuì',
+    0x27DDF: 'bīn',
+    0x27DE1: 'lóu,lòu',
+    0x27DE5: 'yì',
+    0x27DE6: 'mì',
+    0x27DE7: 'xiè',
+    0x27DF1: 'guī',
+    0x27DF3: 'luó',
+    0x27DF6: 'shàn',
+    0x27DFE: 'jú',
+    0x27DFF: 'dū',
+    0x27E02: 'xiān',
+    0x27E05: 'zhǐ',
+    0x27E08: 'bìn',
+    0x27E15: 'zhǐ',
+    0x27E16: 'zhuàn,lián',
+    0x27E17: 'xué',
+    0x27E18: 'liàn,biǎn,jiǎn',
+    0x27E19: 'suì',
+    0x27E26: 'làn',
+    0x27E27: 'jù',
+    0x27E28: 'mián',
+    0x27E29: 'xùn',
+    0x27E2A: 'zhàn',
+    0x27E2B: 'gùn',
+    0x27E32: 'zhì',
+    0x27E3D: 'wèi',
+    0x27E3E: 'quǎn,xuàn',
+    0x27E3F: 'chài',
+    0x27E48: 'réng',
+    0x27E4A: 'yuè',
+    0x27E4C: 'zī',
+    0x27E50: 'luò',
+    0x27E51: 'guì',
+    0x27E53: 'chéng',
+    0x27E55: 'jū',
+    0x27E56: 'tiǎn',
+    0x27E57: 'wàn',
+    0x27E5B: 'zhī',
+    0x27E5E: 'nǎn,niǎn',
+    0x27E63: 'hān',
+    0x27E68: 'xī',
+    0x27E69: 'lín',
+    0x27E6C: 'yān',
+    0x27E6D: 'xù',
+    0x27E72: 'hù',
+    0x27E73: 'gàn',
+    0x27E74: 'xù,huò',
+    0x27E76: 'xì',
+    0x27E7A: 'cuì',
+    0x27E7D: 'xì',
+    0x27E7E: 'hú',
+    0x27E85: 'yān',
+    0x27E8E: 'yì',
+    0x27E8F: 'chí',
+    0x27E90: 'jué',
+    0x27E92: 'zú',
+    0x27E9C: 'jiào',
+    0x27E9D: 'yì',
+    0x27E9F: 'tǎn',
+    0x27EA0: 'chì',
+    0x27EA1: 'bá',
+    0x27EA2: 'tòu,yì',
+    0x27EA3: 'zōng',
+    0x27EA4: 'qiú,jū',
+    0x27EA7: 'chì',
+    0x27EA8: 'xǐ',
+    0x27EB0: 'nì',
+    0x27EB2: 'cū',
+    0x27EB4: 'wǔ',
+    0x27EB6: 'chù',
+    0x27EB7: 'sū',
+    0x27EB8: 'yóng',
+    0x27EB9: 'jǔ',
+    0x27EBA: 'bá',
+    0x27EBC: 'cǐ',
+    0x27EBD: 'dì',
+    0x27EBE: 'pǎn',
+    0x27EBF: 'chì,yì',
+    0x27EC1: 'qiǔ',
+    0x27EC3: 'yán,qù',
+    0x27ECD: 'zhǎi',
+    0x27ED2: 'xiàn',
+    0x27ED3: 'bèng',
+    0x27ED4: 'kuāng',
+    0x27ED5: 'qì',
+    0x27ED6: 'zhōu',
+    0x27ED7: 'jú',
+    0x27ED8: 'qiè',
+    0x27ED9: 'mò,pò',
+    0x27EDA: 'yuán',
+    0x27EDC: 'guì,kuǐ',
+    0x27EDD: 'zuī',
+    0x27EE7: 'qiè',
+    0x27EF0: 'hú,zào',
+    0x27EF1: 'qiú',
+    0x27EF2: 'hái,kuī',
+    0x27EF3: 'fù',
+    0x27EF4: 'làng',
+    0x27EF5: 'shà',
+    0x27EF6: 'xī',
+    0x27EF7: 'bū',
+    0x27EF8: 'shì',
+    0x27EF9: 'yǒng',
+    0x27EFA: 'guāng,kuāng',
+    0x27EFC: 'niè',
+    0x27EFF: 'hǒu',
+    0x27F0A: 'mì',
+    0x27F0E: 'è',
+    0x27F0F: 'xián',
+    0x27F10: 'yǔn,qūn',
+    0x27F11: 'xù',
+    0x27F12: 'qǐn',
+    0x27F13: 'dōng',
+    0x27F14: 'léng',
+    0x27F15: 'qì',
+    0x27F16: 'lán',
+    0x27F17: 'fú',
+    0x27F18: 'qǐ',
+    0x27F19: 'chǒng',
+    0x27F1C: 'cù',
+    0x27F1F: 'mò',
+    0x27F20: 'bēi',
+    0x27F24: 'dào',
+    0x27F28: 'jié,jué',
+    0x27F29: 'chòng,dòng',
+    0x27F2A: 'chì',
+    0x27F2B: 'yù',
+    0x27F2C: 'cuī',
+    0x27F2D: 'sù,sōu,sǒu,qiù',
+    0x27F2E: 'tì',
+    0x27F2F: 'shù,yú',
+    0x27F30: 'zhá',
+    0x27F31: 'fú,bí',
+    0x27F33: 'chè',
+    0x27F34: 'fó,zhì',
+    0x27F35: 'hóu',
+    0x27F36: 'zhá',
+    0x27F44: 'jié',
+    0x27F45: 'zhá',
+    0x27F46: 'zhān',
+    0x27F49: 'yǎn',
+    0x27F4A: 'hái',
+    0x27F4B: 'wǔ',
+    0x27F4C: 'huá',
+    0x27F4D: 'diān,diàn',
+    0x27F4E: 'yáo',
+    0x27F4F: 'sōu',
+    0x27F50: 'qiān',
+    0x27F51: 'jí',
+    0x27F52: 'xiòng',
+    0x27F53: 'qì',
+    0x27F54: 'jūn',
+    0x27F56: 'hái',
+    0x27F5E: 'yǎn',
+    0x27F5F: 'jié',
+    0x27F60: 'cuī',
+    0x27F62: 'tuán',
+    0x27F63: 'zhāng',
+    0x27F64: 'piāo',
+    0x27F65: 'lù',
+    0x27F66: 'zhī',
+    0x27F67: 'chù',
+    0x27F68: 'mì',
+    0x27F69: 'qiāng',
+    0x27F6B: 'liàn',
+    0x27F72: 'lì',
+    0x27F76: 'é',
+    0x27F77: 'sù',
+    0x27F78: 'jué,guì',
+    0x27F7B: 'jú',
+    0x27F7C: 'tán',
+    0x27F7D: 'liáo',
+    0x27F7E: 'sān,cún',
+    0x27F7F: 'dòng',
+    0x27F81: 'zá',
+    0x27F82: 'zhí',
+    0x27F86: 'xuàn',
+    0x27F87: 'líng',
+    0x27F8A: 'dēng',
+    0x27F8D: 'zhān,zhàn,chán',
+    0x27F8E: 'xuān',
+    0x27F8F: 'qǐn',
+    0x27F90: 'jiào',
+    0x27F91: 'pì',
+    0x27F94: 'hǎn',
+    0x27F9A: 'yú',
+    0x27F9B: 'guó',
+    0x27F9D: 'xún',
+    0x27FA0: 'xún',
+    0x27FA1: 'chán',
+    0x27FA2: 'jié,jí',
+    0x27FA3: 'jú',
+    0x27FA4: 'yǎn',
+    0x27FA5: 'dú',
+    0x27FA7: 'hòng',
+    0x27FA8: 'xiàn,xiǎn',
+    0x27FA9: 'xún,xuàn',
+    0x27FAE: 'líng',
+    0x27FAF: 'jié',
+    0x27FB0: 'yì',
+    0x27FB1: 'qú',
+    0x27FB2: 'gān',
+    0x27FB3: 'fēng',
+    0x27FB5: 'jué',
+    0x27FB6: 'qū',
+    0x27FBB: 'jiù',
+    0x27FBD: 'jì',
+    0x27FBE: 'jǐ',
+    0x27FC5: 'xí',
+    0x27FC6: 'pāng',
+    0x27FC8: 'kuàng',
+    0x27FC9: 'kù,wù',
+    0x27FCB: 'kù',
+    0x27FCC: 'zhà',
+    0x27FCF: 'bà',
+    0x27FD2: 'chěn',
+    0x27FD3: 'hù',
+    0x27FD4: 'nù',
+    0x27FD5: 'é',
+    0x27FD6: 'xiōng',
+    0x27FD7: 'dǔn',
+    0x27FD8: 'shēng',
+    0x27FD9: 'wán',
+    0x27FDA: 'fēn',
+    0x27FDD: 'xī',
+    0x27FDE: 'zī',
+    0x27FE0: 'hù,dì',
+    0x27FE5: 'bié',
+    0x27FE7: 'tuò',
+    0x27FE8: 'bǎn',
+    0x27FE9: 'gé',
+    0x27FEB: 'kē',
+    0x27FF2: 'zhuì,bó',
+    0x27FF3: 'fú,fèi',
+    0x27FF4: 'mò',
+    0x27FF5: 'jiá',
+    0x27FF6: 'tuó',
+    0x27FF7: 'yù',
+    0x27FF9: 'mǔ',
+    0x27FFA: 'jué',
+    0x27FFB: 'jú',
+    0x27FFC: 'guā',
+    0x27FFD: 'pǒ',
+    0x28000: 'nǐ,niǎn',
+    0x28004: 'wǎ',
+    0x28005: 'yǎn',
+    0x28014: 'chǒu',
+    0x28015: 'kuāng',
+    0x28016: 'hài',
+    0x28018: 'xiáng',
+    0x28019: 'xī',
+    0x2801B: 'cún',
+    0x2801C: 'tōng',
+    0x2801D: 'ruò',
+    0x2801F: 'duó',
+    0x28020: 'chè',
+    0x28024: 'lèi',
+    0x28025: 'zī',
+    0x28027: 'zhěng',
+    0x28028: 'zuǒ',
+    0x2802B: 'kāng',
+    0x2802C: 'zài',
+    0x2802E: 'yuān,xuān',
+    0x2802F: 'qióng',
+    0x28033: 'fá',
+    0x28034: 'xún',
+    0x28036: 'jì',
+    0x28038: 'chā',
+    0x28040: 'shū,chōu',
+    0x28041: 'xuàn',
+    0x28042: 'xié',
+    0x28043: 'tī',
+    0x28044: 'hàn',
+    0x28045: 'xiān',
+    0x28046: 'shān',
+    0x28047: 'tùn',
+    0x28048: 'háng,gēng',
+    0x28049: 'kǔn',
+    0x2804A: 'cén',
+    0x2804B: 'dōu',
+    0x2804C: 'nuó',
+    0x2804D: 'yàn',
+    0x2804E: 'chéng,jìng',
+    0x2804F: 'pū',
+    0x28050: 'qì',
+    0x28051: 'yuè',
+    0x28052: 'fū',
+    0x28057: 'tǐng',
+    0x2805F: 'wǒ',
+    0x28060: 'shēng',
+    0x28061: 'tuǒ',
+    0x28074: 'tǎn',
+    0x28076: 'yǎ,yā',
+    0x28077: 'zhì',
+    0x28078: 'lù,lì',
+    0x28079: 'yǎn',
+    0x2807A: 'jū',
+    0x2807D: 'dé',
+    0x2807F: 'chù,zhuó',
+    0x28080: 'zǔ',
+    0x28081: 'è',
+    0x28082: 'zhí,xuě',
+    0x28083: 'péng',
+    0x28085: 'biē',
+    0x28087: 'dǐ',
+    0x28090: 'lái',
+    0x28092: 'yè',
+    0x2809C: 'háo',
+    0x2809D: 'pán',
+    0x2809E: 'tàn',
+    0x2809F: 'kāng',
+    0x280A0: 'xū,lǚ',
+    0x280A1: 'zòu',
+    0x280A2: 'jí',
+    0x280A3: 'wù',
+    0x280A6: 'chuàn',
+    0x280A9: 'pò',
+    0x280AA: 'yǎn',
+    0x280AB: 'tuò',
+    0x280AD: 'dú',
+    0x280AF: 'pián',
+    0x280B0: 'chì',
+    0x280B1: 'hùn',
+    0x280B2: 'pīng',
+    0x280B4: 'cōng',
+    0x280B5: 'zhǎ',
+    0x280BA: 'wān',
+    0x280BF: 'wǎi',
+    0x280C3: 'è',
+    0x280C4: 'wèi',
+    0x280C5: 'bāi',
+    0x280C7: 'jiāng',
+    0x280D3: 'chá',
+    0x280D5: 'chù',
+    0x280D6: 'kuà',
+    0x280D7: 'téng',
+    0x280D8: 'zōu,qū',
+    0x280D9: 'lì',
+    0x280DA: 'tà',
+    0x280DB: 'sà',
+    0x280DE: 'pán',
+    0x280DF: 'pán',
+    0x280E3: 'sào',
+    0x280E4: 'qiāo,kào',
+    0x280ED: 'zú',
+    0x280EF: 'zhì',
+    0x280F0: 'yǎn',
+    0x280F2: 'jié',
+    0x280F3: 'néng',
+    0x28104: 'luán',
+    0x28105: 'qū',
+    0x28107: 'dèng,téng',
+    0x28108: 'liáng',
+    0x28109: 'chǎn',
+    0x2810A: 'qiè',
+    0x2810B: 'lòu',
+    0x2810C: 'dié,xiè',
+    0x2810D: 'cuī',
+    0x28110: 'jǐ',
+    0x28113: 'cháo',
+    0x28114: 'shuàn',
+    0x28115: 'zú',
+    0x28117: 'kāng',
+    0x2811A: 'qiāng',
+    0x2811B: 'lí',
+    0x2812E: 'shuāi',
+    0x2812F: 'yù',
+    0x28130: 'zhāng',
+    0x28131: 'lěi',
+    0x28145: 'pó',
+    0x2814A: 'zhé,chè',
+    0x2814B: 'xiào',
+    0x2814D: 'tǎn',
+    0x2814E: 'cuì',
+    0x2814F: 'lán',
+    0x28151: 'xū',
+    0x28152: 'shù,chú',
+    0x28153: 'zhǎ,dá',
+    0x28154: 'cán',
+    0x28157: 'bǐ',
+    0x28158: 'pèng',
+    0x2815D: 'chéng',
+    0x28163: 'qiáo',
+    0x28164: 'jī',
+    0x2816A: 'zhāi',
+    0x2816C: 'lán',
+    0x28181: 'tiǎn,yǎn',
+    0x28182: 'sà',
+    0x28183: 'jīn',
+    0x28184: 'zhù',
+    0x28185: 'duò',
+    0x28187: 'chà',
+    0x28188: 'juàn',
+    0x28189: 'táng',
+    0x2818A: 'bèng',
+    0x2818C: 'fán',
+    0x2818D: 'liè',
+    0x2818E: 'zéi',
+    0x2818F: 'suì',
+    0x28199: 'sè',
+    0x281A7: 'zhì',
+    0x281A8: 'tuí',
+    0x281AA: 'qīng',
+    0x281AC: 'chuò',
+    0x281B0: 'tà,dà',
+    0x281B1: 'bìng',
+    0x281B2: 'wěn',
+    0x281B5: 'pǒ',
+    0x281BD: 'mó',
+    0x281BE: 'cā',
+    0x281C1: 'kuàng',
+    0x281C3: 'cuó,zuān',
+    0x281C4: 'rǎo',
+    0x281C5: 'bào',
+    0x281C6: 'lài',
+    0x281CD: 'niǎn',
+    0x281CE: 'lí',
+    0x281D5: 'jiǎo',
+    0x281D6: 'lú',
+    0x281D7: 'lì',
+    0x281D8: 'lóng',
+    0x281D9: 'guì',
+    0x281DD: 'chǎn',
+    0x281E4: 'xiān',
+    0x281E6: 'chàn',
+    0x281E8: 'xiè',
+    0x281E9: 'zhàn',
+    0x281EF: 'shuāng',
+    0x281FB: 'mǐ',
+    0x281FC: 'luán',
+    0x281FD: 'luò',
+    0x28200: 'diān',
+    0x28208: 'dié',
+    0x2820A: 'wān',
+    0x2820B: 'yuè',
+    0x2820C: 'luán',
+    0x2820E: 'luán',
+    0x28213: 'léng',
+    0x28215: 'wǎi',
+    0x28216: 'dìn',
+    0x28217: 'nèn',
+    0x28218: 'shǎo',
+    0x28219: 'xiè,zhī',
+    0x2821A: 'pí',
+    0x28225: 'máo',
+    0x28227: 'yǐn',
+    0x28229: 'bó',
+    0x2822B: 'zhù',
+    0x2822E: 'chōng',
+    0x28236: 'mǔ',
+    0x28237: 'tuó',
+    0x28239: 'tǒng',
+    0x2823A: 'yé',
+    0x28241: 'huàng',
+    0x28243: 'rèn',
+    0x28245: 'yè',
+    0x2824B: 'tuō',
+    0x28256: 'zuān',
+    0x28257: 'yù',
+    0x2825A: 'ā',
+    0x2825C: 'zhōu',
+    0x2825D: 'wān',
+    0x28261: 'duǒ',
+    0x28262: 'zhòng',
+    0x28263: 'hā',
+    0x28264: 'huáng',
+    0x28265: 'miàn,tǐ',
+    0x28269: 'chūn',
+    0x2826A: 'qiè',
+    0x2826B: 'gōng,qiōng',
+    0x2826C: 'tíng',
+    0x2826D: 'méi',
+    0x28271: 'tàng',
+    0x28274: 'róng',
+    0x28277: 'róng',
+    0x28278: 'qí',
+    0x28279: 'guó',
+    0x2827D: 'xiàng',
+    0x2827E: 'tián',
+    0x28285: 'xiāo',
+    0x28288: 'zhān',
+    0x28289: 'cuì',
+    0x28294: 'lán',
+    0x28298: 'shēn,qū',
+    0x2829A: 'lěi',
+    0x2829B: 'lì',
+    0x2829D: 'chān',
+    0x2829E: 'niè',
+    0x2829F: 'luán',
+    0x282A1: 'tīng',
+    0x282A2: 'huì,sháo',
+    0x282A7: 'gōng',
+    0x282B0: 'qì',
+    0x282B1: 'yú',
+    0x282B3: 'xīn',
+    0x282B8: 'yuè',
+    0x282B9: 'bā',
+    0x282BA: 'dài',
+    0x282BB: 'jī',
+    0x282BC: 'xuàn',
+    0x282BF: 'jué',
+    0x282C0: 'niǔ',
+    0x282C8: 'dù',
+    0x282C9: 'jí',
+    0x282D0: 'pā',
+    0x282D1: 'gǒng',
+    0x282D2: 'bèn',
+    0x282D4: 'kēng,jú',
+    0x282D5: 'yàng,ǎng',
+    0x282D6: 'liǔ',
+    0x282D7: 'ní',
+    0x282D8: 'zhà',
+    0x282D9: 'yìn',
+    0x282DA: 'niǎn,ruǎn',
+    0x282DB: 'pào',
+    0x282DD: 'gōng',
+    0x282DE: 'bù',
+    0x282DF: 'hé',
+    0x282E0: 'rǒng',
+    0x282E1: 'guì',
+    0x282E5: 'bì',
+    0x282E6: 'xī',
+    0x282E7: 'jú',
+    0x282E8: 'hún',
+    0x282E9: 'bì,fú',
+    0x282EB: 'tiāo',
+    0x282EC: 'zhěng,chèng',
+    0x282EE: 'hōng,chūn',
+    0x282EF: 'yì',
+    0x282F0: 'cì',
+    0x282F2: 'bìng',
+    0x282F7: 'gōng',
+    0x282FA: 'fá',
+    0x282FD: 'yáng',
+    0x282FE: 'xǔ',
+    0x28301: 'hōng',
+    0x28304: 'zàng',
+    0x28305: 'chái',
+    0x28306: 'hóng',
+    0x28308: 'tián',
+    0x2830C: 'zhī',
+    0x2830D: 'xīng',
+    0x2830E: 'xú',
+    0x28311: 'zhèn',
+    0x28314: 'wǎn,wàn',
+    0x28318: 'jùn',
+    0x2831D: 'wò,huò',
+    0x28320: 'lù',
+    0x28322: 'zhēng',
+    0x28323: 'rǒng',
+    0x28324: 'chéng,chèng',
+    0x28325: 'fú',
+    0x28327: 'è',
+    0x28328: 'tāo',
+    0x28329: 'táng',
+    0x2832B: 'juān',
+    0x2832C: 'chào',
+    0x2832D: 'tà',
+    0x2832E: 'dǐ',
+    0x28330: 'zōng',
+    0x28333: 'kēng',
+    0x28334: 'tuī',
+    0x28336: 'kēng',
+    0x28345: 'rǒng',
+    0x28346: 'yūn',
+    0x28347: 'hé',
+    0x28348: 'zǒng',
+    0x28349: 'cōng,zǒng',
+    0x2834A: 'qiū',
+    0x2834E: 'mù',
+    0x2834F: 'duó',
+    0x28350: 'xǔ',
+    0x28351: 'kēng',
+    0x28352: 'xiàn,jiàn',
+    0x2835B: 'dú',
+    0x2835C: 'kǎn',
+    0x2835E: 'yīng',
+    0x28362: 'zī',
+    0x28367: 'huáng',
+    0x28369: 'péng',
+    0x2836B: 'lì',
+    0x2836D: 'bó,pò',
+    0x2836E: 'gé,lì',
+    0x2836F: 'jú',
+    0x28370: 'kē',
+    0x28372: 'hú,gǔn',
+    0x28373: 'yáo',
+    0x28374: 'táng',
+    0x28376: 'qióng',
+    0x28377: 'rǒng',
+    0x28378: 'liǔ',
+    0x28379: 'huì',
+    0x2837A: 'jī',
+    0x28389: 'zhì',
+    0x2838B: 'táng,chēng',
+    0x2838C: 'zhǐ',
+    0x2838D: 'kāng,liáng',
+    0x28394: 'yàng',
+    0x28396: 'tǎng,chǎng',
+    0x28397: 'hōng',
+    0x2839B: 'liáng',
+    0x2839D: 'cáo',
+    0x283A1: 'nǎi',
+    0x283A2: 'zǒng',
+    0x283A4: 'dèng',
+    0x283A6: 'jiāo',
+    0x283A7: 'péng',
+    0x283A9: 'guāng',
+    0x283AA: 'ér',
+    0x283AB: 'jiàn',
+    0x283AC: 'jiào',
+    0x283AD: 'nuó',
+    0x283AE: 'zǎo',
+    0x283B3: 'péng',
+    0x283B4: 'dāng',
+    0x283B6: 'qú',
+    0x283B7: 'lián',
+    0x283B8: 'mù',
+    0x283B9: 'lǎn',
+    0x283BE: 'fén',
+    0x283C2: 'hún,xuān',
+    0x283C6: 'kuāng',
+    0x283C8: 'yǐn',
+    0x283C9: 'shuàn',
+    0x283CA: 'jiàn',
+    0x283D2: 'luò,léi',
+    0x283D4: 'lù,dú',
+    0x283DA: 'gé',
+    0x283DB: 'rǎng,niǎn',
+    0x283DE: 'pín',
+    0x283E0: 'lóng',
+    0x283E4: 'zhěn',
+    0x283E5: 'xiàn',
+    0x283E8: 'lìn',
+    0x283E9: 'lián',
+    0x283EA: 'shān',
+    0x283EB: 'bó',
+    0x283EC: 'lì',
+    0x283F3: 'xié',
+    0x283F4: 'gé',
+    0x283F5: 'mǐn',
+    0x283F6: 'lián',
+    0x283F9: 'jué',
+    0x283FA: 'zhōu',
+    0x283FF: 'kē',
+    0x28401: 'dié',
+    0x28403: 'zhé',
+    0x28405: 'shū',
+    0x28406: 'jī',
+    0x28407: 'lóng',
+    0x28408: 'guāng',
+    0x28409: 'zǎo',
+    0x2840A: 'xiàn',
+    0x2840B: 'qiān',
+    0x2840D: 'shēn',
+    0x28410: 'yǐn',
+    0x28411: 'jiè',
+    0x28414: 'shēn',
+    0x28415: 'shēn,cí',
+    0x28416: 'sǎ',
+    0x2841B: 'xì',
+    0x28421: 'kù',
+    0x28423: 'qú',
+    0x28425: 'gé',
+    0x28426: 'bàn',
+    0x28428: 'bì',
+    0x28429: 'qiān',
+    0x28430: 'bīn',
+    0x28431: 'bàn',
+    0x28433: 'zuò',
+    0x28434: 'pì',
+    0x28436: 'huò',
+    0x2843E: 'bàn,biàn',
+    0x2844A: 'nóng',
+    0x2844C: 'chén',
+    0x2844E: 'pēng',
+    0x28451: 'fǔ',
+    0x28452: 'tú',
+    0x2845C: 'pǐ',
+    0x2845D: 'pò',
+    0x28460: 'chǐ',
+    0x28463: 'xuè',
+    0x28464: 'qì',
+    0x28465: 'wù',
+    0x28468: 'zhì',
+    0x28469: 'dì',
+    0x2846A: 'cōng',
+    0x2846B: 'yóu',
+    0x28479: 'cōng',
+    0x2847C: 'dì',
+    0x2847D: 'zhuó',
+    0x2847F: 'zǒu',
+    0x28480: 'cóng',
+    0x28483: 'pàn',
+    0x28484: 'yǎn',
+    0x28485: 'qì',
+    0x28486: 'rǒng',
+    0x28487: 'jiá',
+    0x28489: 'zhì,zhuì,suì',
+    0x2848A: 'qiú',
+    0x2848B: 'yuè',
+    0x2848D: 'shì',
+    0x28491: 'háo',
+    0x28499: 'tuō,hòu',
+    0x2849C: 'bié',
+    0x2849E: 'kàn',
+    0x284A2: 'chuò',
+    0x284A4: 'cǐ',
+    0x284A6: 'yǐn',
+    0x284A7: 'shì',
+    0x284A8: 'hài',
+    0x284A9: 'ruǎn',
+    0x284AB: 'yáng,nì',
+    0x284AC: 'chī',
+    0x284AE: 'cī',
+    0x284B1: 'gōng',
+    0x284B2: 'mí,xuè',
+    0x284B4: 'jǐ',
+    0x284BC: 'gèn',
+    0x284BD: 'zào,suō',
+    0x284C1: 'běng',
+    0x284C7: 'xǐn',
+    0x284C8: 'kuò',
+    0x284CA: 'dié',
+    0x284CD: 'tíng',
+    0x284DA: 'shuì',
+    0x284DE: 'dài',
+    0x284E6: 'lǐ',
+    0x284E8: 'yǒng',
+    0x284E9: 'jiāo',
+    0x284EC: 'tá',
+    0x284ED: 'qǔ,còu',
+    0x284EE: 'yín',
+    0x284EF: 'yuān',
+    0x284F0: 'jié',
+    0x284F2: 'qiān',
+    0x284F3: 'yāo',
+    0x284F4: 'yà',
+    0x284F7: 'qīng',
+    0x284FF: 'péi',
+    0x28517: 'jiā',
+    0x28519: 'tòu',
+    0x2851B: 'tī',
+    0x28521: 'dùn,tún,chuàn,chuán',
+    0x28522: 'chǎn',
+    0x28523: 'jiā,jià',
+    0x28524: 'chì',
+    0x28525: 'jiān,jīn',
+    0x28526: 'shù',
+    0x2852F: 'tà',
+    0x28555: 'zhī',
+    0x28557: 'yuán',
+    0x2855A: 'hū',
+    0x2855C: 'liè',
+    0x28560: 'zé',
+    0x28562: 'chù',
+    0x28566: 'qiù',
+    0x28567: 'bēng',
+    0x28579: 'huán',
+    0x2857A: 'kuā',
+    0x2857B: 'shēng',
+    0x2857D: 'jié',
+    0x2857F: 'wǎng',
+    0x28583: 'hū',
+    0x2858A: 'zé,jī',
+    0x2858B: 'zǎn,zhì',
+    0x2858C: 'yàng',
+    0x2858E: 'chǐ',
+    0x2858F: 'jiù',
+    0x2859A: 'liáo',
+    0x2859B: 'yū',
+    0x285A0: 'biǎn,biàn',
+    0x285A2: 'kuáng',
+    0x285AC: 'chòu',
+    0x285AD: 'yá',
+    0x285AE: 'zhuó',
+    0x285B0: 'qiè',
+    0x285B1: 'xiàn',
+    0x285B3: 'yuān',
+    0x285B4: 'wǔ',
+    0x285B5: 'jiǎo',
+    0x285B6: 'xiàng',
+    0x285B7: 'shà',
+    0x285B9: 'zhì',
+    0x285BC: 'chòng',
+    0x285BE: 'biān',
+    0x285BF: 'wēi',
+    0x285D3: 'dào',
+    0x285DD: 'yù,jú',
+    0x285DE: 'tuí',
+    0x285E1: 'chào',
+    0x285E5: 'huì',
+    0x285E6: 'qiǎn',
+    0x285E8: 'wěi',
+    0x285F0: 'yóu',
+    0x285FC: 'dì,dài',
+    0x285FE: 'dà',
+    0x28601: 'yóu',
+    0x28602: 'jiù',
+    0x28603: 'tuí',
+    0x28604: 'zǎn',
+    0x28607: 'huì',
+    0x28609: 'shà',
+    0x2860C: 'huò',
+    0x28614: 'yáo',
+    0x28619: 'xiàn',
+    0x2861E: 'xiàn',
+    0x2862C: 'dì',
+    0x2862E: 'jiù',
+    0x28632: 'huì',
+    0x28634: 'kào',
+    0x28635: 'yóu',
+    0x28638: 'lì',
+    0x2863C: 'chuán',
+    0x2863E: 'chí',
+    0x28640: 'huò',
+    0x28642: 'yóu',
+    0x28644: 'yuè',
+    0x2864E: 'tà',
+    0x2864F: 'zàn',
+    0x28653: 'niè',
+    0x28654: 'zhù',
+    0x28661: 'xiǎn',
+    0x28669: 'shí',
+    0x2866B: 'kǒu',
+    0x2866C: 'qǐ',
+    0x2866D: 'tǔ',
+    0x2866E: 'fán',
+    0x2866F: 'cūn',
+    0x28672: 'tún,cūn',
+    0x28673: 'chā',
+    0x28674: 'cái,zài',
+    0x28675: 'xiàng',
+    0x28676: 'pèi',
+    0x28677: 'jǐng',
+    0x28678: 'qí,zhī',
+    0x28679: 'shǎo',
+    0x2867A: 'niǔ',
+    0x2867B: 'nà',
+    0x2867D: 'qín',
+    0x2868D: 'bì,bèi',
+    0x28693: 'bì,fèi,fú',
+    0x28694: 'bāo',
+    0x28695: 'biàn',
+    0x28696: 'zī',
+    0x28697: 'nà',
+    0x28698: 'wèi',
+    0x28699: 'háo',
+    0x286A1: 'jǐn',
+    0x286A3: 'zhèng',
+    0x286A7: 'qié',
+    0x286AE: 'hào',
+    0x286AF: 'tóng',
+    0x286B0: 'zǎo',
+    0x286B1: 'shèng',
+    0x286B2: 'cún',
+    0x286B3: 'huāng',
+    0x286B4: 'rú',
+    0x286B5: 'zài',
+    0x286B6: 'nián',
+    0x286BE: 'xiān',
+    0x286C8: 'quán',
+    0x286C9: 'jì',
+    0x286CA: 'yín',
+    0x286CB: 'lǐ',
+    0x286CC: 'máng',
+    0x286CD: 'shào',
+    0x286CE: 'hàn',
+    0x286CF: 'cuò',
+    0x286D0: 'jùn',
+    0x286D1: 'jì',
+    0x286D2: 'bù',
+    0x286D3: 'lòng',
+    0x286D4: 'fǒu',
+    0x286D5: 'yóu',
+    0x286D6: 'kuài',
+    0x286DC: 'xiàng',
+    0x286E1: 'yún',
+    0x286E3: 'qín',
+    0x286E4: 'huí',
+    0x286E5: 'pú',
+    0x286EB: 'lí',
+    0x286EC: 'péi',
+    0x286ED: 'shū,shè',
+    0x286EE: 'jū',
+    0x286EF: 'yí',
+    0x286F0: 'zhēng',
+    0x286F1: 'chóng',
+    0x286F3: 'xí,jí',
+    0x286F5: 'hǔ',
+    0x286F6: 'róu,shòu',
+    0x2870C: 'huàn',
+    0x2870D: 'qiào',
+    0x2870E: 'zhī',
+    0x2870F: 'yíng',
+    0x28710: 'xǐ',
+    0x28711: 'qiāo',
+    0x28712: 'jì',
+    0x28713: 'zhēng',
+    0x28714: 'huáng',
+    0x28716: 'yú',
+    0x28717: 'zōu',
+    0x28718: 'méi',
+    0x2871C: 'shěng',
+    0x28729: 'quán',
+    0x28730: 'jiāng',
+    0x28731: 'hé',
+    0x28733: 'tóng',
+    0x28734: 'hé',
+    0x28735: 'wēn',
+    0x28736: 'yì',
+    0x28737: 'páng',
+    0x2873A: 'wēng',
+    0x2873B: 'qián',
+    0x2873C: 'lì',
+    0x2873D: 'yí',
+    0x2873E: 'chuàng',
+    0x2873F: 'xù',
+    0x28740: 'wěi',
+    0x28746: 'gē',
+    0x28748: 'yǔ',
+    0x2874B: 'zhài',
+    0x2874C: 'gān',
+    0x2874D: 'qiān',
+    0x2874E: 'kāng',
+    0x2874F: 'lí',
+    0x28750: 'shēn',
+    0x28751: 'guàn',
+    0x28753: 'piáo',
+    0x28756: 'lí',
+    0x28758: 'hǔ',
+    0x2875B: 'tú',
+    0x2875C: 'shùn',
+    0x2875E: 'hù',
+    0x2875F: 'lí',
+    0x28762: 'lòu',
+    0x28766: 'dàng',
+    0x28768: 'zuò',
+    0x28769: 'shān',
+    0x2876B: 'shè,xì',
+    0x2876D: 'féng',
+    0x2876E: 'jù,zōu',
+    0x2876F: 'tóng',
+    0x28770: 'jiǎo',
+    0x28771: 'qiáo',
+    0x28772: 'gāo,hào',
+    0x28773: 'zī',
+    0x28774: 'huáng',
+    0x28775: 'shān',
+    0x28778: 'tán',
+    0x2878C: 'tuō',
+    0x2878E: 'lìng',
+    0x28790: 'chéng',
+    0x28791: 'wèng',
+    0x28792: 'zuó',
+    0x28793: 'yù',
+    0x28795: 'zhú,chù',
+    0x28797: 'qún',
+    0x28798: 'xǐ',
+    0x28799: 'qú',
+    0x2879B: 'gé',
+    0x287A2: 'qī',
+    0x287A3: 'xū',
+    0x287A8: 'gài',
+    0x287A9: 'què',
+    0x287AA: 'chóu,shòu',
+    0x287AB: 'méng',
+    0x287B2: 'shēn',
+    0x287B3: 'qú',
+    0x287B6: 'qiāo',
+    0x287B7: 'cán',
+    0x287BA: 'lì',
+    0x287BC: 'wàn',
+    0x287BD: 'léi',
+    0x287BE: 'xīng',
+    0x287BF: 'láng',
+    0x287C2: 'shì',
+    0x287C3: 'zhēng',
+    0x287C4: 'fán',
+    0x287CA: 'zhì',
+    0x287CF: 'yín',
+    0x287D1: 'lì',
+    0x287D6: 'mó',
+    0x287D7: 'wěi',
+    0x287D9: 'yīng',
+    0x287DA: 'ráng',
+    0x287E0: 'quān,què,jué',
+    0x287E5: 'luǒ',
+    0x287F2: 'dài',
+    0x287F4: 'yìn',
+    0x287F5: 'bǐ',
+    0x287F6: 'gē',
+    0x287F8: 'wèn',
+    0x287F9: 'yǎn',
+    0x287FA: 'miǎn',
+    0x287FC: 'gǎng',
+    0x287FD: 'qiú',
+    0x287FE: 'zhī',
+    0x2880B: 'gū',
+    0x2880C: 'tóng',
+    0x2880E: 'líng',
+    0x2880F: 'tí',
+    0x28810: 'cí',
+    0x28811: 'yí,tuó',
+    0x28812: 'fàn',
+    0x28813: 'pō',
+    0x28814: 'bì',
+    0x28816: 'bào',
+    0x2881F: 'pēng',
+    0x28821: 'suān',
+    0x28824: 'sōng,nóng',
+    0x28825: 'wéi',
+    0x28826: 'xiáo',
+    0x2882C: 'hào',
+    0x2882D: 'yǎn',
+    0x28836: 'yí',
+    0x28837: 'zāo',
+    0x28838: 'yǐng',
+    0x28839: 'nǎn',
+    0x2883F: 'zā',
+    0x28841: 'tiǎn',
+    0x28842: 'xī',
+    0x28843: 'jiào',
+    0x28844: 'yán',
+    0x2884C: 'néi',
+    0x2884D: 'tǎn',
+    0x2884E: 'yàn',
+    0x2884F: 'tiǎn',
+    0x28850: 'zhì',
+    0x28851: 'chōu,chóu',
+    0x28852: 'táo',
+    0x28857: 'zhà',
+    0x2885E: 'miǎn',
+    0x28861: 'wǔ',
+    0x28862: 'yǐn',
+    0x28863: 'yàn',
+    0x28864: 'lǎo',
+    0x28869: 'pō',
+    0x2886B: 'hùn',
+    0x2886C: 'hǎi',
+    0x2886D: 'mú',
+    0x2886E: 'cōng',
+    0x28871: 'kù,dǐng',
+    0x28872: 'chōu',
+    0x28874: 'yǒu',
+    0x28878: 'zhuó',
+    0x2887B: 'sōu',
+    0x28882: 'yìn',
+    0x28885: 'zuì',
+    0x28886: 'sāng',
+    0x28887: 'liù',
+    0x28888: 'hàn',
+    0x28889: 'wèi',
+    0x2888A: 'méng',
+    0x2888B: 'hú',
+    0x2888C: 'lì',
+    0x2888E: 'mì,yīn',
+    0x28890: 'bāng',
+    0x28891: 'jiǎn',
+    0x2889C: 'què',
+    0x288A0: 'méng',
+    0x288A2: 'mú',
+    0x288A3: 'hǒng',
+    0x288A4: 'hù',
+    0x288A5: 'mí',
+    0x288A6: 'shài,zhà',
+    0x288A9: 'shāng',
+    0x288AA: 'chào',
+    0x288AC: 'zhuó,tú',
+    0x288AE: 'zhī',
+    0x288AF: 'niàn',
+    0x288B5: 'jì',
+    0x288B8: 'kē',
+    0x288B9: 'zhēng',
+    0x288BF: 'dān',
+    0x288C0: 'liǎo',
+    0x288C1: 'zhǎn',
+    0x288C2: 'gǒng',
+    0x288C3: 'láo,lào',
+    0x288C4: 'huā',
+    0x288C5: 'chuài',
+    0x288C7: 'jiǎn',
+    0x288C8: 'kuì',
+    0x288CD: 'shē',
+    0x288D4: 'chěn',
+    0x288D5: 'tǎn',
+    0x288D7: 'hú',
+    0x288D8: 'méng',
+    0x288D9: 'pào',
+    0x288DA: 'zhǎn',
+    0x288DB: 'cháng',
+    0x288DD: 'gǎn,jiǎn',
+    0x288E0: 'yì',
+    0x288E2: 'suì',
+    0x288E6: 'xù',
+    0x288E7: 'jì',
+    0x288E8: 'làn',
+    0x288EC: 'yí',
+    0x288EF: 'mì',
+    0x288F1: 'miè',
+    0x288F5: 'cuán',
+    0x288F8: 'lǎn',
+    0x288FB: 'yān,yǎn',
+    0x288FE: 'mí',
+    0x28902: 'yǒng',
+    0x28903: 'cáng,zā',
+    0x28904: 'jiǎn',
+    0x28907: 'sōu,zāo',
+    0x2890E: 'yán',
+    0x28911: 'juàn',
+    0x28915: 'è',
+    0x28918: 'fèn',
+    0x2891A: 'fèn',
+    0x28921: 'guàng',
+    0x28922: 'mái',
+    0x28924: 'liě',
+    0x28929: 'chōng',
+    0x2892B: 'lí',
+    0x28931: 'zhí',
+    0x28934: 'xiè',
+    0x28937: 'chóu',
+    0x28939: 'jí',
+    0x2893D: 'pī',
+    0x28942: 'jié',
+    0x28947: 'zhǒu,zhù',
+    0x2894D: 'xiōng',
+    0x28951: 'kuàng,gǒng',
+    0x28959: 'jǐng',
+    0x2895B: 'hù',
+    0x2895E: 'qián',
+    0x28963: 'cén',
+    0x28966: 'qí',
+    0x28967: 'wǎn,fàn,biān',
+    0x28968: 'máo',
+    0x2896A: 'dǒu',
+    0x28974: 'kǒu',
+    0x28976: 'dài',
+    0x28978: 'náo',
+    0x2897A: 'hóng',
+    0x28982: 'lǎi',
+    0x28983: 'duǒ,duò',
+    0x28984: 'qiān',
+    0x28986: 'yín',
+    0x28996: 'lòu',
+    0x28997: 'huī',
+    0x2899B: 'fù',
+    0x2899C: 'máo',
+    0x2899E: 'zhōu',
+    0x289A1: 'yóng,yáng',
+    0x289AD: 'láo',
+    0x289AE: 'jí',
+    0x289AF: 'yì',
+    0x289B0: 'liú',
+    0x289B1: 'cōng',
+    0x289B3: 'nǎn',
+    0x289D0: 'tūn',
+    0x289D1: 'xiàng',
+    0x289D5: 'biàn',
+    0x289D6: 'chuáng',
+    0x289D7: 'wù',
+    0x289D9: 'jū',
+    0x289E5: 'xiē',
+    0x289E6: 'pī',
+    0x289E7: 'zhuó',
+    0x289E8: 'ruì,zhuì',
+    0x289EA: 'sào',
+    0x289EB: 'zì',
+    0x289ED: 'zhèng',
+    0x289F0: 'zú',
+    0x289F1: 'qū',
+    0x289F3: 'chì',
+    0x289F5: 'zhì',
+    0x28A17: 'quàn',
+    0x28A18: 'qiān',
+    0x28A19: 'yā',
+    0x28A1A: 'chào',
+    0x28A1B: 'hé',
+    0x28A1C: 'rǔ',
+    0x28A20: 'jū',
+    0x28A21: 'wù',
+    0x28A2C: 'chì',
+    0x28A2D: 'kuàng,gǒng',
+    0x28A2F: 'còu,zhòu',
+    0x28A30: 'ruàn',
+    0x28A31: 'kuò',
+    0x28A32: 'chí',
+    0x28A33: 'zú',
+    0x28A34: 'jiāo',
+    0x28A36: 'yú',
+    0x28A37: 'tú',
+    0x28A38: 'méng',
+    0x28A39: 'dā',
+    0x28A3A: 'shuò,xuē',
+    0x28A65: 'fēng',
+    0x28A66: 'gǒu',
+    0x28A67: 'dōng',
+    0x28A68: 'chǎ',
+    0x28A69: 'mào',
+    0x28A6A: 'chǎn',
+    0x28A6B: 'biān',
+    0x28A6C: 'yù',
+    0x28A6F: 'wán',
+    0x28A70: 'zú',
+    0x28A72: 'zī',
+    0x28A74: 'chuān',
+    0x28A75: 'wǎn',
+    0x28A76: 'wā',
+    0x28A78: 'quān,juān',
+    0x28A7B: 'wǎn',
+    0x28A7D: 'xià',
+    0x28A84: 'yìng',
+    0x28A85: 'jiàn',
+    0x28A88: 'wěi',
+    0x28A89: 'tí',
+    0x28A8A: 'sāo',
+    0x28A8C: 'qí',
+    0x28A8D: 'shā',
+    0x28A8E: 'yù',
+    0x28A8F: 'jí',
+    0x28A90: 'dòu,tōu',
+    0x28A91: 'chǎn',
+    0x28A92: 'tuán',
+    0x28A95: 'liú',
+    0x28A97: 'zhuì',
+    0x28AB3: 'ruàn',
+    0x28AB6: 'yàn',
+    0x28AB7: 'gǔ',
+    0x28AB9: 'lì',
+    0x28ABA: 'chā',
+    0x28ABE: 'dì',
+    0x28ABF: 'liú',
+    0x28AC0: 'zhǎn',
+    0x28AC1: 'pō',
+    0x28AD2: 'lòu',
+    0x28AD4: 'zhì,xiè',
+    0x28B01: 'lián',
+    0x28B05: 'luǒ',
+    0x28B0D: 'duò,duì',
+    0x28B10: 'jué',
+    0x28B11: 'lì',
+    0x28B12: 'lán',
+    0x28B14: 'ruàn',
+    0x28B15: 'gū',
+    0x28B16: 'chán',
+    0x28B17: 'xū',
+    0x28B1A: 'zhǐ',
+    0x28B41: 'xuè',
+    0x28B42: 'bō',
+    0x28B43: 'chēng',
+    0x28B45: 'zhù',
+    0x28B46: 'hēi',
+    0x28B49: 'bān',
+    0x28B53: 'dié',
+    0x28B56: 'zhǎn',
+    0x28B57: 'guó',
+    0x28B5A: 'biāo',
+    0x28B5B: 'là,gě',
+    0x28B7A: 'jīn',
+    0x28B82: 'gǎi',
+    0x28B92: 'mèng',
+    0x28B94: 'yù',
+    0x28BAA: 'xǐ',
+    0x28BAC: 'piāo',
+    0x28BAD: 'sī',
+    0x28BB4: 'dèng',
+    0x28BB8: 'chuō',
+    0x28BB9: 'dí',
+    0x28BBA: 'jī',
+    0x28BBB: 'chán',
+    0x28BBF: 'zhuó',
+    0x28BD3: 'cài',
+    0x28BDE: 'jiàng',
+    0x28BF2: 'tóu',
+    0x28BFD: 'lí',
+    0x28C02: 'qiàn',
+    0x28C06: 'chuō',
+    0x28C0F: 'tà',
+    0x28C11: 'diào',
+    0x28C13: 'jiǎn',
+    0x28C1B: 'zhǐ',
+    0x28C1C: 'jué',
+    0x28C1E: 'mó',
+    0x28C20: 'luó',
+    0x28C26: 'bǎo',
+    0x28C2D: 'zuǎn',
+    0x28C35: 'zhē',
+    0x28C38: 'yú',
+    0x28C3B: 'bǎo',
+    0x28C3E: 'mǎ',
+    0x28C3F: 'xì',
+    0x28C40: 'hù',
+    0x28C41: 'yì',
+    0x28C42: 'é',
+    0x28C43: 'gū',
+    0x28C44: 'tú',
+    0x28C45: 'zhēn',
+    0x28C47: 'qiú',
+    0x28C48: 'sù',
+    0x28C49: 'liàng',
+    0x28C4A: 'qū',
+    0x28C4B: 'líng',
+    0x28C4C: 'guàn',
+    0x28C4D: 'láng',
+    0x28C4E: 'tōu',
+    0x28C4F: 'dā',
+    0x28C50: 'lòu',
+    0x28C51: 'huáng',
+    0x28C52: 'shòu',
+    0x28C53: 'jiāo',
+    0x28C54: 'zūn',
+    0x28C55: 'gǎi',
+    0x28C56: 'wéi',
+    0x28C59: 'kūn',
+    0x28C5A: 'duàn',
+    0x28C5B: 'sōng',
+    0x28C5C: 'qí',
+    0x28C5D: 'yǎng',
+    0x28C61: 'shì',
+    0x28C63: 'gǎi',
+    0x28C66: 'dào',
+    0x28C67: 'yǎo,ǎo',
+    0x28C6B: 'qián',
+    0x28C6D: 'shāo',
+    0x28C6E: 'cháng',
+    0x28C6F: 'miǔ',
+    0x28C71: 'mó',
+    0x28C75: 'nǎo',
+    0x28C78: 'cōng',
+    0x28C7A: 'niè',
+    0x28C7B: 'zhāo',
+    0x28C7C: 'cén',
+    0x28C7F: 'sōng',
+    0x28C80: 'niè',
+    0x28C81: 'cì',
+    0x28C84: 'jùn',
+    0x28C86: 'shāo',
+    0x28C88: 'zhú',
+    0x28C89: 'duǒ,tuǒ,shèng',
+    0x28C8A: 'àn',
+    0x28C8B: 'bī',
+    0x28C8E: 'tì',
+    0x28C90: 'pǐ',
+    0x28C91: 'xiá',
+    0x28C92: 'qiú',
+    0x28C93: 'shěng',
+    0x28C97: 'tāng',
+    0x28C9B: 'mán,mián',
+    0x28C9C: 'piān',
+    0x28C9E: 'tì',
+    0x28C9F: 'róng',
+    0x28CA7: 'cōng',
+    0x28CAA: 'jī',
+    0x28CAB: 'féng',
+    0x28CAC: 'wù',
+    0x28CAD: 'jiào',
+    0x28CAE: 'láo',
+    0x28CAF: 'zēng',
+    0x28CB0: 'péng',
+    0x28CB1: 'cǎn',
+    0x28CB3: 'nóng',
+    0x28CB5: 'chǎn',
+    0x28CBE: 'mán,mián',
+    0x28CBF: 'guì',
+    0x28CC0: 'niào',
+    0x28CC1: 'chōng',
+    0x28CC2: 'chàn',
+    0x28CC6: 'nàng',
+    0x28CC9: 'xiā',
+    0x28CCA: 'jiū',
+    0x28CCB: 'jǐ',
+    0x28CCC: 'zhèn',
+    0x28CD1: 'tǐng',
+    0x28CD4: 'mén',
+    0x28CD5: 'yuè',
+    0x28CD7: 'zhōng',
+    0x28CD8: 'tún',
+    0x28CD9: 'ruì',
+    0x28CDA: 'xiè,fēn',
+    0x28CDB: 'xī',
+    0x28CDD: 'tǐng,rùn',
+    0x28CDE: 'niǔ',
+    0x28CE0: 'wǎng',
+    0x28CE1: 'jiān,guān',
+    0x28CE3: 'fēn',
+    0x28CF2: 'biàn,bì',
+    0x28CF7: 'yí',
+    0x28CFA: 'dié',
+    0x28CFB: 'jī',
+    0x28CFC: 'gǎn',
+    0x28CFF: 'jiān,xì,mǎ',
+    0x28D00: 'jiōng',
+    0x28D06: 'kāi',
+    0x28D0A: 'què,guān',
+    0x28D0C: 'nán',
+    0x28D0D: 'móu',
+    0x28D0E: 'xù',
+    0x28D0F: 'sǒng',
+    0x28D10: 'shèn',
+    0x28D11: 'kuāng',
+    0x28D12: 'què',
+    0x28D13: 'wéi',
+    0x28D17: 'dié',
+    0x28D18: 'nán',
+    0x28D1A: 'ruò',
+    0x28D1B: 'gōng',
+    0x28D1C: 'dòu,yòu',
+    0x28D1E: 'niǎn',
+    0x28D21: 'chāo',
+    0x28D22: 'hé',
+    0x28D23: 'yàn',
+    0x28D29: 'tú',
+    0x28D2A: 'bǔ',
+    0x28D2C: 'hú',
+    0x28D2D: 'yǒng',
+    0x28D2F: 'shǐ',
+    0x28D30: 'chù',
+    0x28D39: 'xiāo',
+    0x28D3A: 'mén',
+    0x28D3B: 'lǐ',
+    0x28D3C: 'tí',
+    0x28D3E: 'jiān',
+    0x28D42: 'zhǐ',
+    0x28D43: 'guā,fǔ,yuè',
+    0x28D44: 'guǎn',
+    0x28D46: 'qì',
+    0x28D48: 'fēi',
+    0x28D49: 'yǔ',
+    0x28D4A: 'zhé',
+    0x28D4B: 'wěi',
+    0x28D4C: 'ě',
+    0x28D4D: 'chān',
+    0x28D4E: 'xī,qí',
+    0x28D50: 'gǔ',
+    0x28D57: 'què',
+    0x28D58: 'huì',
+    0x28D5A: 'xié',
+    0x28D5B: 'yīng',
+    0x28D5D: 'tà',
+    0x28D5E: 'wāi',
+    0x28D5F: 'fú',
+    0x28D60: 'jiè',
+    0x28D61: 'pì',
+    0x28D65: 'shěng',
+    0x28D66: 'yú',
+    0x28D67: 'kuā',
+    0x28D69: 'pì',
+    0x28D6A: 'xié',
+    0x28D6B: 'nüè',
+    0x28D6C: 'xiàn',
+    0x28D6D: 'jiàn',
+    0x28D6E: 'xù',
+    0x28D70: 'bì',
+    0x28D74: 'nán',
+    0x28D76: 'liáng',
+    0x28D78: 'pián',
+    0x28D7C: 'jìng',
+    0x28D80: 'tǎ',
+    0x28D81: 'yàn',
+    0x28D82: 'ài',
+    0x28D85: 'xiāo',
+    0x28D86: 'qiāng',
+    0x28D87: 'wǔ',
+    0x28D88: 'táng',
+    0x28D8A: 'jùn',
+    0x28D90: 'kuò',
+    0x28D97: 'làng',
+    0x28D99: 'něng',
+    0x28D9C: 'dòu,dǒu',
+    0x28D9D: 'shú',
+    0x28D9F: 'jiǎo',
+    0x28DA0: 'niè',
+    0x28DA2: 'yú',
+    0x28DA8: 'cè',
+    0x28DAA: 'jiǎo,liú',
+    0x28DAC: 'huà',
+    0x28DAD: 'wén',
+    0x28DAE: 'yē',
+    0x28DAF: 'é',
+    0x28DB0: 'guāng',
+    0x28DB1: 'huā',
+    0x28DB2: 'jiāo',
+    0x28DBA: 'lèi',
+    0x28DBC: 'shāng',
+    0x28DBD: 'yòng',
+    0x28DBF: 'dēng',
+    0x28DC0: 'guān',
+    0x28DC1: 'niú',
+    0x28DC3: 'suì',
+    0x28DC4: 'xiàng',
+    0x28DC6: 'sà',
+    0x28DC7: 'chāng',
+    0x28DCE: 'rùn',
+    0x28DD0: 'yūn',
+    0x28DD2: 'fēn',
+    0x28DD3: 'jiàn',
+    0x28DD4: 'xù',
+    0x28DD8: 'xì',
+    0x28DD9: 'shú',
+    0x28DE5: 'xié',
+    0x28DE6: 'lì',
+    0x28DE9: 'tóu',
+    0x28DEC: 'mǐ',
+    0x28DED: 'chán',
+    0x28DEE: 'huō',
+    0x28DF1: 'zhuǎn',
+    0x28DF2: 'yuè',
+    0x28DFB: 'lán',
+    0x28DFD: 'yán',
+    0x28DFE: 'dàng',
+    0x28DFF: 'xiàng',
+    0x28E00: 'yuè',
+    0x28E01: 'tǐng',
+    0x28E02: 'bēng',
+    0x28E03: 'sàn',
+    0x28E04: 'xiàn',
+    0x28E05: 'dié',
+    0x28E06: 'pì',
+    0x28E07: 'pián',
+    0x28E09: 'tǎ',
+    0x28E0B: 'jiāo',
+    0x28E0C: 'yē',
+    0x28E0E: 'yuè',
+    0x28E10: 'réng',
+    0x28E11: 'qiǎo',
+    0x28E12: 'qí',
+    0x28E13: 'diāo',
+    0x28E14: 'qí,wéi',
+    0x28E17: 'hàn',
+    0x28E18: 'yuán',
+    0x28E19: 'yóu',
+    0x28E1A: 'jí',
+    0x28E1B: 'gài',
+    0x28E1C: 'hāi',
+    0x28E1D: 'shì',
+    0x28E1F: 'qū',
+    0x28E29: 'wèn',
+    0x28E2C: 'zhèn',
+    0x28E2D: 'pō',
+    0x28E2E: 'yán,yǔn',
+    0x28E2F: 'gū',
+    0x28E30: 'jú',
+    0x28E31: 'tiàn,niǎn',
+    0x28E37: 'è',
+    0x28E3A: 'yā',
+    0x28E3B: 'lìn',
+    0x28E3C: 'bì',
+    0x28E40: 'zǐ',
+    0x28E41: 'hóng',
+    0x28E43: 'duǒ,duò',
+    0x28E45: 'duì',
+    0x28E46: 'xuàn',
+    0x28E48: 'shǎn,yáng',
+    0x28E4A: 'shǎn',
+    0x28E4B: 'yáo',
+    0x28E4C: 'rǎn',
+    0x28E54: 'tuó',
+    0x28E57: 'bīng',
+    0x28E58: 'xù',
+    0x28E59: 'tūn',
+    0x28E5A: 'chéng',
+    0x28E5C: 'dòu',
+    0x28E5D: 'yì,yà',
+    0x28E61: 'chè',
+    0x28E75: 'juǎn',
+    0x28E76: 'jī',
+    0x28E78: 'zhào',
+    0x28E79: 'bēng,bèng',
+    0x28E7B: 'tiǎn',
+    0x28E80: 'pēng',
+    0x28E85: 'fù',
+    0x28E96: 'tuǒ',
+    0x28E98: 'xián',
+    0x28E99: 'nì',
+    0x28E9A: 'lóng',
+    0x28E9D: 'zhuó',
+    0x28E9F: 'zhēng',
+    0x28EA0: 'shǔn',
+    0x28EA1: 'zōng',
+    0x28EA2: 'fēng',
+    0x28EA3: 'duàn',
+    0x28EA4: 'pì',
+    0x28EA5: 'yǎn',
+    0x28EA6: 'sǒu',
+    0x28EA7: 'qiú',
+    0x28EA8: 'è',
+    0x28EA9: 'qián',
+    0x28EAB: 'qiǎn',
+    0x28EAD: 'cā',
+    0x28EAE: 'xùn',
+    0x28EB5: 'zhuì',
+    0x28EB8: 'mǎo',
+    0x28EB9: 'jiǎo',
+    0x28EBF: 'zhǎn',
+    0x28EC0: 'pí,bī',
+    0x28EC1: 'xī',
+    0x28EC2: 'yàn',
+    0x28EC3: 'fèi',
+    0x28EC4: 'niè',
+    0x28EC6: 'zhì',
+    0x28EC8: 'suǒ',
+    0x28ECA: 'yì',
+    0x28ECC: 'lěi',
+    0x28ECD: 'xù',
+    0x28ECF: 'yì',
+    0x28ED2: 'wēi',
+    0x28ED5: 'jī',
+    0x28ED6: 'chēn',
+    0x28ED7: 'dié',
+    0x28EE3: 'yuán',
+    0x28EE5: 'xí',
+    0x28EE7: 'liú',
+    0x28EE8: 'suǒ',
+    0x28EF1: 'bēng',
+    0x28EF2: 'xià',
+    0x28EF3: 'yàn,yān',
+    0x28EF5: 'cuī,zuī,duì',
+    0x28EF7: 'kāng',
+    0x28EFA: 'qīng',
+    0x28EFB: 'lóu',
+    0x28EFC: 'bī',
+    0x28F08: 'zhàn',
+    0x28F09: 'cuàn',
+    0x28F0A: 'wú',
+    0x28F0B: 'xū',
+    0x28F0C: 'chēn',
+    0x28F0D: 'háo',
+    0x28F0E: 'jué',
+    0x28F10: 'chèn',
+    0x28F11: 'chá',
+    0x28F12: 'chǎn',
+    0x28F13: 'zhí',
+    0x28F14: 'xún',
+    0x28F23: 'gé',
+    0x28F24: 'chén',
+    0x28F25: 'yè,gé',
+    0x28F2A: 'chǔ',
+    0x28F2B: 'qú',
+    0x28F2C: 'xiè',
+    0x28F2E: 'zhàn',
+    0x28F2F: 'kěn',
+    0x28F31: 'jué',
+    0x28F3D: 'qú',
+    0x28F3F: 'méng',
+    0x28F40: 'yè',
+    0x28F41: 'zōu,cóng',
+    0x28F42: 'pú',
+    0x28F44: 'shì',
+    0x28F49: 'shǔ',
+    0x28F4A: 'chán',
+    0x28F4D: 'dú',
+    0x28F4F: 'guō',
+    0x28F50: 'lù,yáng',
+    0x28F51: 'yān',
+    0x28F56: 'niǎo',
+    0x28F57: 'bīn,pín',
+    0x28F5F: 'tuí',
+    0x28F66: 'nì',
+    0x28F67: 'huān',
+    0x28F68: 'qián',
+    0x28F6F: 'xià',
+    0x28F72: 'líng',
+    0x28F77: 'lián',
+    0x28F79: 'yì,lì',
+    0x28F7B: 'lì',
+    0x28F7C: 'sì',
+    0x28F7F: 'dài',
+    0x28F82: 'wèi',
+    0x28F85: 'cì',
+    0x28F89: 'jiǔ',
+    0x28F8A: 'hóng',
+    0x28F8C: 'yú',
+    0x28F8E: 'kuí',
+    0x28F92: 'háng',
+    0x28F93: 'gē,yì',
+    0x28F94: 'fàng',
+    0x28F97: 'kuí,xié',
+    0x28F9A: 'guī,fū',
+    0x28F9B: 'chǐ,qí',
+    0x28F9E: 'jiǔ',
+    0x28FA1: 'suī,huǎng',
+    0x28FA4: 'dié',
+    0x28FAC: 'suǐ',
+    0x28FB0: 'qín',
+    0x28FB4: 'guī',
+    0x28FBB: 'zhuī',
+    0x28FBE: 'tiào',
+    0x28FC1: 'yuè',
+    0x28FC7: 'zuǐ',
+    0x28FCF: 'wú',
+    0x28FD0: 'cuǐ',
+    0x28FDB: 'zhì,xī',
+    0x28FE0: 'shuì',
+    0x28FE2: 'dōng',
+    0x28FED: 'wéi',
+    0x28FFF: 'chǒng',
+    0x2900B: 'rún',
+    0x29016: 'jí',
+    0x2901C: 'diāo',
+    0x2901E: 'cāng',
+    0x29020: 'kòu,gǔ',
+    0x29023: 'wéi',
+    0x29027: 'cán',
+    0x2902A: 'má',
+    0x2902B: 'òu',
+    0x29032: 'sǎn',
+    0x29036: 'wéi,huī,mí',
+    0x2903C: 'sǎn',
+    0x2903F: 'jīn',
+    0x2904C: 'wéi',
+    0x2905E: 'cài',
+    0x2905F: 'lí',
+    0x2906F: 'yuè',
+    0x29074: 'yūn',
+    0x29077: 'chēng',
+    0x2907A: 'shān',
+    0x29082: 'hū',
+    0x29083: 'shài',
+    0x29084: 'tún',
+    0x29086: 'fǒu,fù',
+    0x29088: 'qìn',
+    0x29089: 'xū,chēn',
+    0x2908D: 'chuān',
+    0x2908E: 'fù',
+    0x29092: 'yì,ài',
+    0x29093: 'dōng',
+    0x29094: 'fú',
+    0x29095: 'fú',
+    0x29096: 'zé',
+    0x29097: 'pù',
+    0x29099: 'líng',
+    0x2909D: 'shài,yīng',
+    0x2909E: 'pào',
+    0x290A2: 'yín,ái',
+    0x290A3: 'luò',
+    0x290A4: 'huà',
+    0x290A5: 'yìn',
+    0x290A6: 'bèng',
+    0x290A7: 'yū',
+    0x290A8: 'shè',
+    0x290AA: 'xiè',
+    0x290AB: 'chǔ',
+    0x290B4: 'shè',
+    0x290B5: 'diàn',
+    0x290B9: 'yì',
+    0x290BB: 'chè',
+    0x290BC: 'gěng',
+    0x290BD: 'lóng',
+    0x290BE: 'píng',
+    0x290BF: 'yǔn',
+    0x290C0: 'yàn',
+    0x290C1: 'mò',
+    0x290C3: 'suī',
+    0x290CB: 'jìng',
+    0x290CD: 'sòng',
+    0x290CE: 'páng',
+    0x290D0: 'yá',
+    0x290D1: 'sè',
+    0x290D2: 'duǒ',
+    0x290D5: 'chuáng',
+    0x290D6: 'xiè',
+    0x290D8: 'tuán',
+    0x290D9: 'gōng',
+    0x290DA: 'xuàn',
+    0x290DC: 'lā',
+    0x290DE: 'líng',
+    0x290E0: 'dài',
+    0x290E1: 'zhá',
+    0x290EC: 'yīn',
+    0x290ED: 'sōng',
+    0x290EF: 'yǔ',
+    0x290F0: 'tuó',
+    0x290F1: 'tuó',
+    0x290F4: 'bà',
+    0x290F5: 'rǎn',
+    0x290F6: 'bó',
+    0x290F7: 'dài',
+    0x290F9: 'zhá,zhǎ',
+    0x290FA: 'hóu',
+    0x290FE: 'huǐ',
+    0x29105: 'lú',
+    0x2910A: 'lìng',
+    0x2910B: 'rú',
+    0x29115: 'dàn',
+    0x29116: 'méng',
+    0x29117: 'xià',
+    0x29118: 'wěng',
+    0x29119: 'hán',
+    0x2911A: 'zī',
+    0x2911B: 'zhèn',
+    0x2911C: 'sè',
+    0x2911D: 'cuó',
+    0x2911E: 'lì',
+    0x29120: 'diān',
+    0x29121: 'lián',
+    0x29122: 'gòu',
+    0x29126: 'péng',
+    0x2912A: 'yīng',
+    0x2912C: 'hòu',
+    0x2912E: 'duì',
+    0x2912F: 'wù',
+    0x29137: 'piào',
+    0x29138: 'hè',
+    0x2913A: 'lóng',
+    0x2913B: 'mò',
+    0x2913C: 'fěi',
+    0x2913D: 'lǚ',
+    0x2913E: 'zé',
+    0x2913F: 'bó',
+    0x29140: 'diàn,zhí',
+    0x29141: 'mǎng',
+    0x29143: 'zhuàng,chóng',
+    0x29144: 'lù',
+    0x29145: 'pāng',
+    0x29146: 'duì',
+    0x29147: 'bù',
+    0x2914C: 'chēn',
+    0x2914D: 'màn',
+    0x29156: 'xī',
+    0x2915D: 'ǎn',
+    0x2915E: 'zhōng,chòng',
+    0x29160: 'nàn',
+    0x29161: 'tuò',
+    0x29162: 'hé',
+    0x29165: 'duì',
+    0x29166: 'wān,dān',
+    0x29167: 'zhōng',
+    0x29168: 'cén,shèn',
+    0x29169: 'lì',
+    0x2916A: 'shuāng',
+    0x2916E: 'cén',
+    0x29170: 'sī',
+    0x29172: 'duì',
+    0x29174: 'hūn',
+    0x2917C: 'jiān,jiàn',
+    0x2917D: 'nóng',
+    0x2917E: 'dàn',
+    0x2917F: 'fù',
+    0x29180: 'huò',
+    0x29181: 'huì,wèi',
+    0x29182: 'cí',
+    0x29184: 'yǒng',
+    0x29185: 'sà',
+    0x29186: 'tíng',
+    0x2918E: 'liù',
+    0x29191: 'suān',
+    0x29192: 'líng',
+    0x29193: 'mán,màn',
+    0x29194: 'diàn',
+    0x29198: 'pāo',
+    0x2919A: 'líng',
+    0x2919D: 'lì',
+    0x2919F: 'nóu',
+    0x291A3: 'liè',
+    0x291A4: 'shǎn',
+    0x291A6: 'fèi',
+    0x291AB: 'shǎn',
+    0x291AE: 'líng',
+    0x291AF: 'zhàn,jiān',
+    0x291B1: 'bīn',
+    0x291B2: 'lí',
+    0x291B5: 'sī,xiàn',
+    0x291B6: 'ráng',
+    0x291B7: 'jiān',
+    0x291B8: 'zhuó',
+    0x291BB: 'líng',
+    0x291BC: 'líng',
+    0x291BD: 'mèng',
+    0x291BF: 'shuāng',
+    0x291C4: 'líng',
+    0x291C7: 'hùn',
+    0x291CE: 'líng',
+    0x291CF: 'jiān',
+    0x291D0: 'qú',
+    0x291D4: 'nóng',
+    0x291D5: 'jìng',
+    0x291D6: 'chēn',
+    0x291DC: 'zhēn,chèng,chēng',
+    0x291DD: 'qìng',
+    0x291DF: 'qìng',
+    0x291E0: 'è,yǎn',
+    0x291E3: 'sè',
+    0x291E9: 'bèi',
+    0x291EB: 'fēi',
+    0x291EE: 'fèi',
+    0x291EF: 'féi',
+    0x291F4: 'fāng',
+    0x291F5: 'kǔ',
+    0x291FA: 'zá',
+    0x291FB: 'huì',
+    0x291FD: 'féi',
+    0x29201: 'duì',
+    0x29206: 'pā',
+    0x29207: 'niǔ',
+    0x29208: 'pàng',
+    0x29209: 'dàn',
+    0x2920A: 'dān,dàn',
+    0x2920B: 'ài',
+    0x2920D: 'tiǎn',
+    0x2920E: 'chǎo',
+    0x2920F: 'ǎo,yǒu',
+    0x29210: 'mèi',
+    0x29211: 'nǎn',
+    0x29214: 'bò',
+    0x29215: 'yù,chì',
+    0x29216: 'xiān,hān',
+    0x29217: 'mài',
+    0x2921A: 'pīng',
+    0x2921C: 'duī',
+    0x2921E: 'dào',
+    0x29221: 'xìng',
+    0x29222: 'nì,nǜ',
+    0x29223: 'hān',
+    0x29224: 'chù',
+    0x29225: 'shuǎ',
+    0x29226: 'mǎn',
+    0x2922C: 'wàn',
+    0x2922D: 'yì',
+    0x2922E: 'diào',
+    0x2922F: 'yān',
+    0x29231: 'wò',
+    0x29232: 'suàn',
+    0x29234: 'ǎn',
+    0x29235: 'lán',
+    0x29236: 'nǎn',
+    0x29238: 'qiǔ',
+    0x29239: 'miàn',
+    0x2923A: 'nuǒ',
+    0x2923B: 'cán',
+    0x2923C: 'cǎn',
+    0x29240: 'làn',
+    0x29241: 'tiǎn',
+    0x29242: 'yè',
+    0x29244: 'niǎn',
+    0x29246: 'shuǎ',
+    0x2924B: 'cí',
+    0x2924D: 'jiǎn',
+    0x29250: 'gàn',
+    0x29254: 'jiàn',
+    0x29255: 'guó',
+    0x29257: 'zhān',
+    0x29259: 'luǒ',
+    0x2925C: 'jī,hàng',
+    0x2925D: 'guì',
+    0x29261: 'jiá',
+    0x29262: 'jǐ',
+    0x29265: 'xuàn',
+    0x29267: 'fēng',
+    0x2926B: 'bì',
+    0x2926C: 'qí,chí',
+    0x2926F: 'yuán',
+    0x29270: 'àng',
+    0x29271: 'dī',
+    0x29274: 'è',
+    0x29275: 'fén',
+    0x29278: 'jù',
+    0x29279: 'nǐ',
+    0x2927A: 'tuó',
+    0x2927C: 'shēn',
+    0x2927D: 'fú',
+    0x2927E: 'xiá',
+    0x2927F: 'qú',
+    0x29280: 'pò',
+    0x29281: 'wǎn',
+    0x29282: 'líng',
+    0x29283: 'mà',
+    0x29284: 'zhòu',
+    0x29285: 'bào',
+    0x29287: 'yù',
+    0x2928C: 'běng',
+    0x2928D: 'mài',
+    0x2928F: 'jiā',
+    0x29291: 'yǎng',
+    0x29293: 'kuǎ,kù',
+    0x29294: 'jiào',
+    0x29296: 'bǐng',
+    0x2929A: 'luò',
+    0x2929B: 'guǐ',
+    0x2929C: 'duò',
+    0x2929D: 'zhì',
+    0x292A1: 'zhèn',
+    0x292A2: 'è',
+    0x292A3: 'zhū',
+    0x292A4: 'bá',
+    0x292A8: 'zhèn',
+    0x292A9: 'fēng,féng',
+    0x292AA: 'dòu',
+    0x292AB: 'niǎn',
+    0x292AC: 'bù',
+    0x292AD: 'duì',
+    0x292AE: 'shā,suō',
+    0x292AF: 'sè',
+    0x292B0: 'bì',
+    0x292B4: 'zhì',
+    0x292B5: 'zhé',
+    0x292B6: 'bù',
+    0x292BA: 'jué',
+    0x292BB: 'xùn',
+    0x292BF: 'xì',
+    0x292C1: 'zhuó',
+    0x292C2: 'bài',
+    0x292C3: 'yáo,táo',
+    0x292C4: 'chǒu',
+    0x292C5: 'tà',
+    0x292C6: 'qiān',
+    0x292C8: 'nào',
+    0x292C9: 'yù',
+    0x292CA: 'è',
+    0x292CB: 'jiān',
+    0x292CC: 'yì',
+    0x292CD: 'xiāo',
+    0x292CF: 'niè',
+    0x292D2: 'bīng',
+    0x292D7: 'guǒ',
+    0x292D8: 'xié',
+    0x292D9: 'diào',
+    0x292DC: 'jū',
+    0x292DD: 'suǒ',
+    0x292DE: 'dié',
+    0x292DF: 'fú,fù',
+    0x292E0: 'miǎn',
+    0x292E1: 'shì',
+    0x292E2: 'xuàn,yùn',
+    0x292E3: 'tí',
+    0x292E4: 'yù',
+    0x292E7: 'xié,kài',
+    0x292E8: 'fú',
+    0x292E9: 'zhì',
+    0x292EA: 'nǐ',
+    0x292EB: 'xuàn',
+    0x292EC: 'yáng',
+    0x292EE: 'fěng,bāng',
+    0x292EF: 'zòng',
+    0x292F0: 'zhòu',
+    0x292F1: 'xuān',
+    0x292F5: 'zhū',
+    0x292F7: 'la',
+    0x292F9: 'yìng',
+    0x292FA: 'gào',
+    0x292FB: 'kuò',
+    0x292FD: 'é',
+    0x292FE: 'wéi,wěi,xuē',
+    0x292FF: 'méi',
+    0x29303: 'huái,guì',
+    0x29304: 'chǒu,zhōu',
+    0x29306: 'suǒ',
+    0x29307: 'tà',
+    0x29308: 'suǒ',
+    0x29309: 'tà',
+    0x2930A: 'xuè',
+    0x2930C: 'gǒng',
+    0x2930D: 'jiǎ',
+    0x2930F: 'bó,fú,bù,fù',
+    0x29310: 'tà',
+    0x29311: 'yuǎn',
+    0x29318: 'tà',
+    0x2931D: 'chuí',
+    0x29320: 'xiōng',
+    0x29321: 'hé,juē',
+    0x29322: 'suō',
+    0x29327: 'mò',
+    0x29328: 'chóng',
+    0x29329: 'suī',
+    0x2932A: 'zé',
+    0x2932B: 'lù',
+    0x2932C: 'zhāng',
+    0x2932D: 'luò',
+    0x2932E: 'xù',
+    0x2932F: 'jiān',
+    0x29330: 'shān',
+    0x29332: 'xù',
+    0x2933E: 'jiǎng',
+    0x29342: 'bào',
+    0x29343: 'mái',
+    0x29345: 'tóng',
+    0x29346: 'xì',
+    0x29349: 'róng',
+    0x2934B: 'shéng',
+    0x2934C: 'zhòu',
+    0x2934E: 'jiān',
+    0x2934F: 'fù',
+    0x29350: 'dèng',
+    0x29353: 'yōng',
+    0x29354: 'jū,qū',
+    0x29356: 'yì',
+    0x29357: 'bāng',
+    0x29359: 'sè',
+    0x2935A: 'suì',
+    0x2935C: 'duó',
+    0x2935D: 'xiè',
+    0x29361: 'huán',
+    0x29365: 'rǔ',
+    0x29366: 'nǐ',
+    0x29367: 'zhòu',
+    0x29368: 'guì',
+    0x2936A: 'luò',
+    0x29372: 'zhī,chàn',
+    0x29373: 'xù',
+    0x29375: 'zhī',
+    0x29377: 'jué',
+    0x29378: 'jū',
+    0x2937B: 'yuán',
+    0x2937C: 'lú',
+    0x2937F: 'bó,fù',
+    0x29382: 'róng',
+    0x29383: 'xiè',
+    0x29389: 'xǐ',
+    0x2938A: 'luó',
+    0x2938E: 'gé',
+    0x29391: 'zuān',
+    0x29392: 'hàn,jiān',
+    0x29394: 'jiāo',
+    0x29395: 'sǎ',
+    0x29396: 'qín,qián',
+    0x29397: 'qūn',
+    0x29398: 'páo',
+    0x29399: 'yuè',
+    0x2939A: 'chè',
+    0x2939B: 'fú',
+    0x2939C: 'pēi',
+    0x2939F: 'mèi,mò,wà',
+    0x293A2: 'tāo',
+    0x293A4: 'kēn',
+    0x293A5: 'xì',
+    0x293AB: 'duò',
+    0x293AD: 'yì',
+    0x293B0: 'suì',
+    0x293B2: 'xiá',
+    0x293B3: 'juān',
+    0x293B5: 'wéi',
+    0x293B7: 'yì',
+    0x293B9: 'yù',
+    0x293BB: 'bài',
+    0x293BC: 'tuó',
+    0x293BD: 'tà',
+    0x293BE: 'páo',
+    0x293C2: 'bǐng,bì',
+    0x293C5: 'yùn',
+    0x293C6: 'yùn',
+    0x293C7: 'duàn',
+    0x293C8: 'ruǎn',
+    0x293C9: 'wéi',
+    0x293CF: 'wéi',
+    0x293D0: 'guì,wěi',
+    0x293D2: 'dá',
+    0x293D3: 'xiá',
+    0x293D6: 'hùn',
+    0x293D7: 'juǎn',
+    0x293D8: 'suī',
+    0x293DA: 'suì',
+    0x293DD: 'lóu',
+    0x293DE: 'bài',
+    0x293DF: 'yù',
+    0x293E0: 'zhèng',
+    0x293E1: 'guì',
+    0x293E3: 'kuī',
+    0x293E4: 'gāo',
+    0x293E5: 'dān',
+    0x293E9: 'xiǎn',
+    0x293EA: 'zhái',
+    0x293EB: 'sè',
+    0x293ED: 'kē',
+    0x293EE: 'bǔ',
+    0x293EF: 'bó',
+    0x293F2: 'suì',
+    0x293F4: 'yù',
+    0x293F5: 'bǔ,bù',
+    0x293F6: 'jiū',
+    0x293F7: 'jiū,jiào',
+    0x293F9: 'juàn',
+    0x293FA: 'jué',
+    0x293FC: 'nà',
+    0x293FD: 'zhái',
+    0x293FE: 'tāo',
+    0x293FF: 'wěi',
+    0x29400: 'xiá',
+    0x29401: 'xiè',
+    0x29405: 'sà',
+    0x29406: 'jī',
+    0x29409: 'xiè',
+    0x2940C: 'duì',
+    0x2940D: 'zǐ',
+    0x29418: 'yuǎn',
+    0x29419: 'qìn',
+    0x2941A: 'fú',
+    0x2941B: 'péng',
+    0x2941C: 'páo',
+    0x2941E: 'yìn',
+    0x29420: 'hōng',
+    0x29421: 'zú',
+    0x29423: 'gōng',
+    0x29424: 'dòng',
+    0x29425: 'hē',
+    0x29426: 'wò',
+    0x29428: 'pāng',
+    0x2942B: 'sù',
+    0x2942C: 'kǎn',
+    0x2942D: 'niè',
+    0x2942E: 'háo',
+    0x2942F: 'fèng',
+    0x29430: 'è',
+    0x29431: 'yè',
+    0x29434: 'tíng',
+    0x29435: 'dòng',
+    0x29436: 'zhé',
+    0x29437: 'sāng',
+    0x2943B: 'mò',
+    0x2943C: 'sù',
+    0x2943E: 'lè',
+    0x29440: 'pǔ',
+    0x29441: 'é',
+    0x29442: 'zhuó',
+    0x29443: 'yè',
+    0x29447: 'xiāng',
+    0x29448: 'guàng',
+    0x29449: 'rěn',
+    0x2944A: 'líng',
+    0x2944D: 'ào',
+    0x29450: 'chāi',
+    0x29452: 'duó',
+    0x29453: 'qióng',
+    0x29454: 'kū,yà',
+    0x29455: 'xū',
+    0x29456: 'huán',
+    0x29457: 'yāo',
+    0x29458: 'zhèn',
+    0x29459: 'tǐng',
+    0x2945A: 'běng,lèi',
+    0x2945D: 'áng',
+    0x2945F: 'kān,qiān',
+    0x29461: 'kū,gěn',
+    0x29462: 'péi,bāi',
+    0x29463: 'yòu',
+    0x29464: 'ǎo',
+    0x29465: 'mén',
+    0x29466: 'mò',
+    0x2946C: 'fǔ,guī',
+    0x2946D: 'qīng',
+    0x2946E: 'là',
+    0x2946F: 'dǒu',
+    0x29470: 'tǎn',
+    0x29473: 'qiǎn',
+    0x29474: 'yào',
+    0x29475: 'wèi',
+    0x29476: 'hú,kū',
+    0x29477: 'mò',
+    0x29478: 'hē',
+    0x29479: 'xuàn',
+    0x2947B: 'bì,pó',
+    0x2947C: 'pō',
+    0x2947E: 'dī',
+    0x29480: 'zhěn',
+    0x29482: 'shī',
+    0x29483: 'kǎn',
+    0x29484: 'cè',
+    0x29487: 'xū',
+    0x29488: 'zhěn',
+    0x2948A: 'zhǔ',
+    0x2948F: 'huì',
+    0x29490: 'chǐ',
+    0x29493: 'hǒng',
+    0x29494: 'nóu',
+    0x29495: 'niè,pò,è',
+    0x29496: 'yàn',
+    0x29498: 'chǒng',
+    0x29499: 'fǔ,guì',
+    0x2949A: 'guāng',
+    0x2949B: 'qī',
+    0x2949D: 'gěn',
+    0x2949E: 'tǐng',
+    0x294A2: 'tǎn',
+    0x294A3: 'qiǎn',
+    0x294A6: 'jiù,xìn',
+    0x294A7: 'xū',
+    0x294A8: 'qǐ',
+    0x294AA: 'zhèn',
+    0x294AE: 'qiú',
+    0x294B0: 'ě',
+    0x294B3: 'huì',
+    0x294B4: 'hòng',
+    0x294B5: 'qǐng',
+    0x294B7: 'chē,rǒng',
+    0x294BA: 'fù',
+    0x294BC: 'hōng',
+    0x294BD: 'xī',
+    0x294BE: 'wú',
+    0x294BF: 'máng',
+    0x294C2: 'tī',
+    0x294C5: 'hōng',
+    0x294D0: 'bó',
+    0x294D2: 'qǐn',
+    0x294D3: 'gěn',
+    0x294D6: 'fú',
+    0x294D7: 'kuǐ',
+    0x294DD: 'bié',
+    0x294DE: 'jìng',
+    0x294DF: 'kǎn',
+    0x294E0: 'guī',
+    0x294E2: 'gǎo',
+    0x294E3: 'xū',
+    0x294E4: 'àn',
+    0x294E5: 'yuè',
+    0x294E6: 'wù',
+    0x294E7: 'yí',
+    0x294E8: 'jīng',
+    0x294EA: 'lù',
+    0x294EB: 'quán',
+    0x294EC: 'tuí',
+    0x294EE: 'jì',
+    0x294FA: 'jiǒng',
+    0x294FB: 'jué',
+    0x294FC: 'piē',
+    0x294FD: 'kūn',
+    0x29500: 'wài',
+    0x29501: 'huì',
+    0x29502: 'dùn',
+    0x29503: 'yuǎn',
+    0x29504: 'jié',
+    0x29506: 'guì',
+    0x29507: 'gǎo',
+    0x29508: 'pò',
+    0x29509: 'mén,mín,hūn',
+    0x2950A: 'zhuàn',
+    0x2950B: 'hàng',
+    0x29514: 'yóng',
+    0x29515: 'qiú',
+    0x29517: 'lèi',
+    0x29518: 'áng',
+    0x29519: 'pǐ,xìn',
+    0x2951A: 'wēng,wěng',
+    0x2951D: 'qìn',
+    0x2951F: 'qǐn',
+    0x29520: 'miè',
+    0x29521: 'dōu',
+    0x29522: 'mí',
+    0x29523: 'zhān',
+    0x29525: 'qǐng',
+    0x29526: 'yí',
+    0x2952E: 'bān',
+    0x29531: 'juān',
+    0x29533: 'zé',
+    0x29534: 'xù',
+    0x29535: 'lán',
+    0x29536: 'má',
+    0x29537: 'má',
+    0x29538: 'ōu',
+    0x29539: 'bēi',
+    0x2953B: 'póu',
+    0x2953C: 'xù',
+    0x29540: 'ào',
+    0x29546: 'hǒng',
+    0x29549: 'hǒng',
+    0x2954A: 'zhǎn',
+    0x2954C: 'sěn',
+    0x2954D: 'gǎo,háo',
+    0x2954F: 'pó,fán',
+    0x29550: 'liào',
+    0x29555: 'wài',
+    0x29556: 'xuān',
+    0x2955C: 'kuí',
+    0x2955F: 'è',
+    0x29560: 'hàn',
+    0x29561: 'sè',
+    0x29564: 'dàn',
+    0x2956A: 'xuān',
+    0x2956C: 'è',
+    0x2956D: 'gài',
+    0x2956F: 'dāo',
+    0x29571: 'měng',
+    0x29572: 'yī',
+    0x29573: 'nǐng',
+    0x29575: 'pín',
+    0x29579: 'cāng',
+    0x2957E: 'yuàn',
+    0x29580: 'è',
+    0x29581: 'niè,yá',
+    0x29584: 'yǐn',
+    0x29587: 'qiāo',
+    0x29589: 'hōng',
+    0x2958A: 'líng',
+    0x2958C: 'chān',
+    0x2958D: 'yǐng',
+    0x29592: 'guān',
+    0x29594: 'niǎo',
+    0x29595: 'xū',
+    0x29596: 'tán',
+    0x29597: 'jìn',
+    0x2959B: 'péng',
+    0x2959D: 'liáo',
+    0x295A0: 'bèi',
+    0x295A3: 'xín,bá',
+    0x295A4: 'tún',
+    0x295A5: 'chāo',
+    0x295A6: 'gān',
+    0x295A8: 'hū',
+    0x295A9: 'wǎng',
+    0x295AC: 'fú',
+    0x295AD: 'pèi',
+    0x295AF: 'náo',
+    0x295B0: 'xún,xín',
+    0x295B1: 'xuè',
+    0x295B4: 'liǔ',
+    0x295B5: 'líng',
+    0x295B6: 'xuè',
+    0x295B7: 'qū',
+    0x295B8: 'háo',
+    0x295B9: 'yí',
+    0x295BA: 'hàn',
+    0x295BC: 'fú',
+    0x295BD: 'bá',
+    0x295BE: 'yí',
+    0x295C0: 'bó',
+    0x295C4: 'hōng',
+    0x295C5: 'lì',
+    0x295C9: 'sà',
+    0x295CA: 'xī',
+    0x295CE: 'shì',
+    0x295CF: 'piāo',
+    0x295D0: 'huà',
+    0x295D1: 'yí',
+    0x295D2: 'bó',
+    0x295D3: 'bó',
+    0x295D4: 'něi',
+    0x295D5: 'qiú',
+    0x295D8: 'wěi',
+    0x295D9: 'chè',
+    0x295DA: 'yóu',
+    0x295DC: 'wèi',
+    0x295DD: 'huǐ',
+    0x295DE: 'sà',
+    0x295E2: 'hòng',
+    0x295E3: 'sōu',
+    0x295E4: 'hàn',
+    0x295E5: 'páo',
+    0x295E7: 'fáng',
+    0x295E9: 'liú',
+    0x295EA: 'zhòu',
+    0x295EB: 'pí',
+    0x295ED: 'lì',
+    0x295F0: 'chuí',
+    0x295F1: 'xī',
+    0x295F2: 'zhēng',
+    0x295F4: 'bèng',
+    0x295F5: 'zhēng',
+    0x295F6: 'suì',
+    0x295F7: 'yǎn',
+    0x295FC: 'qīng',
+    0x295FD: 'wù',
+    0x295FE: 'liǎng',
+    0x29600: 'zhào',
+    0x29601: 'liáng',
+    0x29605: 'jiē',
+    0x29607: 'hōng',
+    0x29608: 'yōu',
+    0x2960A: 'là',
+    0x2960B: 'hòu',
+    0x2960D: 'yuàn',
+    0x2960E: 'hóng',
+    0x2960F: 'yè',
+    0x29611: 'yǐng,yīng',
+    0x29612: 'xuǎn,juān',
+    0x29613: 'yóu',
+    0x29618: 'quán',
+    0x2961C: 'táng',
+    0x2961D: 'suǒ',
+    0x2961F: 'lì',
+    0x29620: 'sōu',
+    0x29621: 'lì',
+    0x29624: 'yù',
+    0x29627: 'yì',
+    0x2962D: 'xiū',
+    0x2962E: 'áo',
+    0x2962F: 'tuán',
+    0x29630: 'sù',
+    0x29631: 'shuài',
+    0x29633: 'yù',
+    0x29635: 'fēng',
+    0x29639: 'sù',
+    0x2963A: 'tuí',
+    0x2963B: 'yù',
+    0x2963C: 'zhēng',
+    0x2963D: 'zhēng',
+    0x2963F: 'táo',
+    0x29644: 'liú',
+    0x29646: 'chéng',
+    0x29647: 'suí',
+    0x29648: 'sāo',
+    0x2964F: 'gǔ',
+    0x29650: 'fēng',
+    0x29651: 'liè',
+    0x29652: 'piāo,piào',
+    0x29656: 'lì',
+    0x29658: 'lóng',
+    0x29659: 'chū',
+    0x2965A: 'xiāo',
+    0x2965B: 'hōng',
+    0x2965C: 'xiè',
+    0x2965D: 'shè',
+    0x29660: 'lóng',
+    0x29661: 'hōu',
+    0x29662: 'xuán,shī',
+    0x29663: 'fēng',
+    0x29665: 'bá',
+    0x29666: 'bó',
+    0x29667: 'táo',
+    0x29668: 'sù',
+    0x29669: 'zhào',
+    0x2966A: 'biāo',
+    0x2966B: 'sōu',
+    0x2966C: 'tuí',
+    0x2966D: 'suǒ',
+    0x2966E: 'xiāo',
+    0x2966F: 'héng',
+    0x29670: 'sāo',
+    0x29672: 'fēi',
+    0x29677: 'niù',
+    0x29678: 'mǎng',
+    0x2967D: 'huán,xuān',
+    0x2967E: 'zhī',
+    0x29682: 'yì',
+    0x29684: 'yù',
+    0x29687: 'yí',
+    0x29688: 'yuē',
+    0x29689: 'chí',
+    0x29695: 'yǐn,qiāng',
+    0x29696: 'niù',
+    0x29697: 'rǒng',
+    0x2969B: 'nà',
+    0x296A3: 'tián',
+    0x296A5: 'bā',
+    0x296AA: 'ěr',
+    0x296AB: 'zhēng',
+    0x296AC: 'è',
+    0x296AD: 'póu',
+    0x296AE: 'jī,nì',
+    0x296AF: 'ní',
+    0x296B1: 'jiǒng',
+    0x296B2: 'jiá',
+    0x296B5: 'gān',
+    0x296B9: 'líng',
+    0x296BB: 'zuì',
+    0x296BE: 'bèi',
+    0x296C5: 'shū',
+    0x296C6: 'yǐ',
+    0x296C7: 'pāi',
+    0x296CB: 'nǎo',
+    0x296CC: 'shì',
+    0x296CE: 'mǎn',
+    0x296CF: 'shì',
+    0x296D1: 'tí',
+    0x296D8: 'gōng',
+    0x296DD: 'lèi',
+    0x296DE: 'bǎo,něi,piǎo',
+    0x296DF: 'yuān,mán',
+    0x296E0: 'zuō',
+    0x296E1: 'láng,náng',
+    0x296E2: 'xiū',
+    0x296E5: 'zài',
+    0x296E6: 'chèng',
+    0x296E7: 'jiān',
+    0x296E8: 'mào',
+    0x296E9: 'jiá',
+    0x296EA: 'yù',
+    0x296ED: 'yù',
+    0x296EE: 'yí',
+    0x296F2: 'māng',
+    0x296F3: 'zài,cān',
+    0x296F5: 'zhuì',
+    0x296F6: 'tí',
+    0x296F9: 'xì',
+    0x296FA: 'jú',
+    0x296FB: 'zàn,zuǎn,zhān',
+    0x296FC: 'lù',
+    0x296FD: 'táo',
+    0x29700: 'zhuì,duī',
+    0x29701: 'líng',
+    0x29703: 'jù',
+    0x29706: 'jī',
+    0x29707: 'juǎn,juàn',
+    0x2970A: 'zī',
+    0x2970C: 'yuē',
+    0x2970D: 'dōng',
+    0x29712: 'nǎng',
+    0x29716: 'chóng',
+    0x2971F: 'àng',
+    0x29723: 'gēng',
+    0x29725: 'bō',
+    0x29726: 'dìng',
+    0x29727: 'wěi',
+    0x2972C: 'quán',
+    0x2972D: 'kē',
+    0x29730: 'pì',
+    0x29731: 'kǎn,sǎn',
+    0x29732: 'fú',
+    0x29733: 'yǒng',
+    0x29735: 'tuán',
+    0x29736: 'tǒu',
+    0x29737: 'yòu,niù',
+    0x29738: 'yāo',
+    0x2973A: 'yē',
+    0x2973D: 'yàn',
+    0x29748: 'xián',
+    0x2974A: 'tí',
+    0x2974C: 'suì',
+    0x29750: 'cí',
+    0x29754: 'xǔ',
+    0x29755: 'wù',
+    0x29756: 'cān',
+    0x29757: 'yù',
+    0x2975A: 'chǎn',
+    0x2975B: 'xiá',
+    0x2975D: 'kào,gāo',
+    0x2975E: 'cāng',
+    0x2975F: 'chā',
+    0x29760: 'qiǔ',
+    0x29763: 'dā',
+    0x29765: 'sù',
+    0x29768: 'huā',
+    0x29777: 'wū',
+    0x29778: 'yuān',
+    0x2977D: 'jiàng',
+    0x2977E: 'xiǎng',
+    0x2977F: 'zhāi',
+    0x29780: 'sǎn,chěn,càn',
+    0x29781: 'mó,mí',
+    0x29783: 'shǎng,xiǎng',
+    0x29784: 'cáo',
+    0x29785: 'suī',
+    0x29786: 'chuáng',
+    0x29787: 'mí',
+    0x29788: 'zhú',
+    0x29789: 'chóng',
+    0x2978A: 'jì',
+    0x2978B: 'chóng',
+    0x29799: 'lián',
+    0x2979E: 'hài',
+    0x297A4: 'dūn',
+    0x297A5: 'xiǎng',
+    0x297A6: 'chēng',
+    0x297A7: 'shǎng',
+    0x297A8: 'lì',
+    0x297A9: 'huáng',
+    0x297AC: 'dèng',
+    0x297AF: 'liáng',
+    0x297B6: 'zā',
+    0x297BA: 'huò',
+    0x297BB: 'lín',
+    0x297BE: 'dú,yì',
+    0x297BF: 'hàn',
+    0x297C0: 'yōng,yǒng',
+    0x297C1: 'yuàn,xuàn',
+    0x297C2: 'guò',
+    0x297C3: 'líng',
+    0x297C5: 'liǎn',
+    0x297C7: 'ào',
+    0x297C8: 'dāng',
+    0x297C9: 'yì',
+    0x297CA: 'nóng',
+    0x297CB: 'shàn',
+    0x297CD: 'xìn',
+    0x297D0: 'dá',
+    0x297D1: 'yù',
+    0x297D2: 'cān',
+    0x297D3: 'wò',
+    0x297D4: 'chá',
+    0x297D5: 'bó',
+    0x297D7: 'jiǎn',
+    0x297DE: 'méng',
+    0x297DF: 'wěi',
+    0x297E0: 'mó',
+    0x297E5: 'shuì,juǎn',
+    0x297E6: 'jié',
+    0x297E7: 'shuò',
+    0x297E8: 'huò',
+    0x297EB: 'chuò',
+    0x297ED: 'lóng',
+    0x297EE: 'huài',
+    0x297F0: 'tuō',
+    0x297F3: 'yú',
+    0x297F6: 'chàn,jié',
+    0x297F7: 'yōng',
+    0x297F8: 'huò',
+    0x297FA: 'lǎn',
+    0x297FF: 'nà',
+    0x29800: 'bā',
+    0x29801: 'gān',
+    0x29802: 'yǐ',
+    0x29803: 'jiá',
+    0x29805: 'dá',
+    0x29806: 'dìng',
+    0x29807: 'xùn',
+    0x29808: 'rěn',
+    0x29809: 'juǎn',
+    0x2980A: 'tuán',
+    0x2980B: 'xǔ',
+    0x2980C: 'sòng',
+    0x2980E: 'cáo',
+    0x2980F: 'chēng',
+    0x29811: 'dǐng',
+    0x2981A: 'hái',
+    0x2981F: 'wǔ',
+    0x29826: 'qǐ,shǒu',
+    0x29828: 'jī,qǐ',
+    0x2982E: 'kuí',
+    0x2982F: 'wéi',
+    0x29836: 'shǒu',
+    0x29837: 'fú',
+    0x29839: 'tuán',
+    0x2983B: 'bié,hān',
+    0x2983D: 'tán',
+    0x2983E: 'hāng',
+    0x2983F: 'piē',
+    0x29843: 'yú',
+    0x29844: 'tán,xiāng',
+    0x2984C: 'xiāng',
+    0x2984E: 'xiū',
+    0x29853: 'wěng',
+    0x29854: 'hài',
+    0x29855: 'péng',
+    0x2985D: 'tán',
+    0x2985F: 'bié',
+    0x29860: 'xiāng',
+    0x29863: 'yǐ',
+    0x29866: 'piáo',
+    0x29867: 'huán',
+    0x29868: 'mǔ',
+    0x29869: 'bā',
+    0x2986B: 'fàn',
+    0x2986F: 'dīng',
+    0x29877: 'fēn,fèi',
+    0x2987A: 'jiè',
+    0x2987E: 'suó',
+    0x29884: 'wàn',
+    0x29885: 'gē',
+    0x29888: 'fēn',
+    0x2988A: 'tuó',
+    0x2988C: 'wén',
+    0x2988D: 'guā',
+    0x2988E: 'duō',
+    0x29890: 'zhé',
+    0x29891: 'cǐ',
+    0x29892: 'yǎo',
+    0x29894: 'bàn',
+    0x29895: 'bù',
+    0x29896: 'mò',
+    0x29898: 'pǒ',
+    0x2989B: 'gé',
+    0x2989E: 'liú',
+    0x298A1: 'rǎn',
+    0x298A8: 'gān',
+    0x298AA: 'hú',
+    0x298AB: 'móu',
+    0x298AE: 'xiū',
+    0x298AF: 'huāng',
+    0x298B0: 'fú',
+    0x298B1: 'huí',
+    0x298B3: 'qú',
+    0x298B4: 'jié,jí',
+    0x298B5: 'tuō',
+    0x298B6: 'yú',
+    0x298B7: 'mò',
+    0x298B8: 'zhōu',
+    0x298B9: 'jiù',
+    0x298BB: 'shú',
+    0x298BC: 'kuāng',
+    0x298BD: 'qióng',
+    0x298BE: 'liè',
+    0x298BF: 'fù',
+    0x298CA: 'xù',
+    0x298D6: 'lìn',
+    0x298D8: 'niè',
+    0x298DA: 'pī,bǐ',
+    0x298DC: 'fù',
+    0x298DD: 'bù',
+    0x298DE: 'yì,sà',
+    0x298E1: 'bó',
+    0x298E3: 'é,ě',
+    0x298E9: 'zhé',
+    0x298EB: 'lì',
+    0x298EE: 'tù',
+    0x298EF: 'dá',
+    0x298F1: 'lù',
+    0x298F2: 'yān',
+    0x298F3: 'dōng',
+    0x298F4: 'qiè',
+    0x298F5: 'wǎn,wò',
+    0x298F6: 'mǐng',
+    0x298F7: 'zuī,zhù',
+    0x298F8: 'fù',
+    0x298F9: 'qū',
+    0x298FA: 'bēn',
+    0x298FB: 'ǎo',
+    0x298FC: 'qiāng',
+    0x29901: 'qūn',
+    0x29908: 'què',
+    0x29909: 'huá,táo',
+    0x2990A: 'xiàn,jiàn',
+    0x2990B: 'kùn',
+    0x2990F: 'cuì',
+    0x29912: 'yí',
+    0x29916: 'chī,ér',
+    0x29917: 'zòng',
+    0x29918: 'nǎo',
+    0x29919: 'chéng',
+    0x2991A: 'duān',
+    0x2991B: 'yóng',
+    0x2991C: 'zhě',
+    0x2991E: 'tàn',
+    0x2991F: 'yáng',
+    0x29920: 'xié',
+    0x29921: 'xuān',
+    0x29923: 'duàn',
+    0x29924: 'shuǎ',
+    0x29925: 'xián',
+    0x29926: 'xián',
+    0x29929: 'é',
+    0x29932: 'lā',
+    0x29938: 'wèi',
+    0x29939: 'yōu',
+    0x2993A: 'yú',
+    0x2993D: 'tī',
+    0x2993F: 'jīn',
+    0x29941: 'táng',
+    0x29942: 'qí',
+    0x29944: 'diān',
+    0x29945: 'tāo',
+    0x29946: 'lǜ',
+    0x29947: 'zhàn',
+    0x29948: 'wēn',
+    0x29949: 'jì',
+    0x2994A: 'āo,jiāo',
+    0x2994B: 'òu,dú',
+    0x2994C: 'qià',
+    0x29950: 'shī',
+    0x29951: 'tǎ',
+    0x29954: 'mò',
+    0x29958: 'yóu',
+    0x29960: 'zhá',
+    0x29963: 'yáo',
+    0x2996B: 'chōng',
+    0x2996C: 'lí',
+    0x2996D: 'yú',
+    0x2996E: 'chǎn',
+    0x2996F: 'yī',
+    0x29972: 'chì',
+    0x29974: 'lí',
+    0x2997D: 'tú',
+    0x2997F: 'zú',
+    0x29982: 'xián',
+    0x29987: 'xì',
+    0x29989: 'bié',
+    0x2998A: 'hán,qiān',
+    0x2998B: 'qí',
+    0x2998C: 'sāng,shuāng',
+    0x2998E: 'fēi,fěi',
+    0x29990: 'shàn,huō',
+    0x29998: 'huān',
+    0x299A0: 'bàng',
+    0x299A1: 'yú',
+    0x299A2: 'yú',
+    0x299A4: 'jí',
+    0x299B1: 'kuǎi',
+    0x299B2: 'zōng',
+    0x299B9: 'xiàn',
+    0x299BA: 'méng',
+    0x299C3: 'lì',
+    0x299C4: 'zhì',
+    0x299C5: 'fán',
+    0x299C6: 'liè,là',
+    0x299C7: 'cài',
+    0x299C8: 'dú',
+    0x299C9: 'guāng',
+    0x299CA: 'xiòng',
+    0x299CB: 'lí',
+    0x299CC: 'qì',
+    0x299CF: 'jué',
+    0x299D0: 'tuō',
+    0x299D2: 'jù',
+    0x299D3: 'xiāo',
+    0x299D8: 'qú',
+    0x299DC: 'zhuǎn',
+    0x299E1: 'jué',
+    0x299E6: 'jiè',
+    0x299E8: 'zhòu',
+    0x299E9: 'xiàn',
+    0x299EA: 'lóng',
+    0x299EB: 'yǎng',
+    0x299EC: 'rǎn',
+    0x299ED: 'yì',
+    0x299EE: 'liè',
+    0x299EF: 'bō',
+    0x299F0: 'hún',
+    0x299F1: 'jì',
+    0x299F2: 'dòng',
+    0x299F3: 'zhōu',
+    0x299F4: 'quān',
+    0x299F5: 'jié',
+    0x299FA: 'jú',
+    0x299FC: 'bēn',
+    0x299FF: 'bī',
+    0x29A00: 'gé',
+    0x29A01: 'chǔn',
+    0x29A03: 'qián',
+    0x29A04: 'sōu',
+    0x29A05: 'wèi',
+    0x29A06: 'chéng',
+    0x29A07: 'lóu',
+    0x29A08: 'yú',
+    0x29A09: 'lā',
+    0x29A0A: 'qián',
+    0x29A0B: 'diān',
+    0x29A0C: 'tǎ',
+    0x29A0D: 'zhàn',
+    0x29A0F: 'fán',
+    0x29A10: 'liè',
+    0x29A11: 'tīng',
+    0x29A12: 'jī',
+    0x29A13: 'qiān',
+    0x29A14: 'hú,huá',
+    0x29A17: 'yú',
+    0x29A18: 'qì,gē',
+    0x29A19: 'yú',
+    0x29A1A: 'wā',
+    0x29A1C: 'bà',
+    0x29A1D: 'qí',
+    0x29A1E: 'sǎ',
+    0x29A1F: 'qiāo',
+    0x29A20: 'yà',
+    0x29A21: 'xiǎn,sǎn',
+    0x29A28: 'cī',
+    0x29A29: 'fàn',
+    0x29A2B: 'kǔn',
+    0x29A2C: 'gǔn',
+    0x29A2D: 'quē',
+    0x29A2E: 'è',
+    0x29A2F: 'qióng',
+    0x29A32: 'mà',
+    0x29A33: 'kū,dū',
+    0x29A34: 'yǎo',
+    0x29A37: 'quē',
+    0x29A38: 'chū',
+    0x29A39: 'jiǎ',
+    0x29A3B: 'zhǔ',
+    0x29A3D: 'duī',
+    0x29A3E: 'wá',
+    0x29A40: 'nǎo',
+    0x29A44: 'yán',
+    0x29A45: 'tóng',
+    0x29A4B: 'xíng,jìng',
+    0x29A4C: 'gǔn',
+    0x29A4D: 'pīng',
+    0x29A51: 'yǔ',
+    0x29A52: 'hè',
+    0x29A54: 'zhuó',
+    0x29A57: 'shē',
+    0x29A58: 'yǔ',
+    0x29A5B: 'jì',
+    0x29A5D: 'qiāng',
+    0x29A5E: 'shuì',
+    0x29A5F: 'chuò',
+    0x29A60: 'zú',
+    0x29A61: 'léng',
+    0x29A62: 'ní',
+    0x29A64: 'wā',
+    0x29A65: 'zhá',
+    0x29A67: 'dàn',
+    0x29A6E: 'dù',
+    0x29A6F: 'biàn',
+    0x29A70: 'jiē,hái',
+    0x29A71: 'qià',
+    0x29A72: 'hé',
+    0x29A73: 'chòng',
+    0x29A74: 'yán',
+    0x29A76: 'yàn',
+    0x29A7A: 'sóng',
+    0x29A7B: 'téng',
+    0x29A7C: 'yǎo',
+    0x29A7E: 'kāo',
+    0x29A80: 'zhuī',
+    0x29A81: 'guì',
+    0x29A82: 'ái',
+    0x29A83: 'hài',
+    0x29A88: 'suǒ',
+    0x29A89: 'xù',
+    0x29A8A: 'biāo',
+    0x29A8C: 'fèng',
+    0x29A8D: 'qū,shū',
+    0x29A8E: 'mǎng',
+    0x29A90: 'guó',
+    0x29A96: 'bì',
+    0x29A97: 'jué',
+    0x29A98: 'chuáng',
+    0x29A9B: 'pú',
+    0x29A9F: 'yì',
+    0x29AA2: 'qiān',
+    0x29AA3: 'yì',
+    0x29AA4: 'è',
+    0x29AA5: 'líng',
+    0x29AA7: 'bì',
+    0x29AAD: 'huò',
+    0x29AAE: 'mǒ,mó',
+    0x29AB1: 'xūn',
+    0x29AB4: 'yàn',
+    0x29AB8: 'lì',
+    0x29ABA: 'tán',
+    0x29ABE: 'luán',
+    0x29AC0: 'kài',
+    0x29AC1: 'mào',
+    0x29AC2: 'xiāo',
+    0x29AC7: 'ǎi',
+    0x29ACA: 'tǎ',
+    0x29ACD: 'mèi',
+    0x29ACF: 'guō,yōng',
+    0x29AD3: 'gǎo',
+    0x29AD4: 'náo',
+    0x29AD5: 'háo',
+    0x29AE0: 'quē',
+    0x29AE5: 'cáo',
+    0x29AE6: 'sào',
+    0x29AEB: 'pí',
+    0x29AF2: 'xiē',
+    0x29AF3: 'xiāo',
+    0x29AF4: 'jú',
+    0x29AF9: 'chéng',
+    0x29AFA: 'nǎo',
+    0x29B00: 'nèi',
+    0x29B0D: 'mǔ',
+    0x29B0F: 'shāo',
+    0x29B11: 'diān,chān',
+    0x29B14: 'líng',
+    0x29B16: 'zhěn',
+    0x29B17: 'yǎo',
+    0x29B19: 'fù,fū',
+    0x29B1A: 'qián,gàn',
+    0x29B1B: 'qióng',
+    0x29B1C: 'jú',
+    0x29B1D: 'bìng,fǎng',
+    0x29B1E: 'máo,mán,mián',
+    0x29B1F: 'zhà',
+    0x29B20: 'tāi',
+    0x29B24: 'chōng',
+    0x29B2B: 'zhǎi',
+    0x29B2D: 'shī',
+    0x29B2E: 'yòng',
+    0x29B30: 'qióng',
+    0x29B31: 'dào',
+    0x29B32: 'tì',
+    0x29B33: 'zhuǐ',
+    0x29B35: 'yìn',
+    0x29B37: 'nǎo',
+    0x29B38: 'bō',
+    0x29B39: 'kuāng',
+    0x29B3A: 'zhǐ',
+    0x29B3B: 'duǒ',
+    0x29B3C: 'cōng',
+    0x29B3D: 'bǎo',
+    0x29B47: 'lí',
+    0x29B4A: 'jú',
+    0x29B4B: 'wén,kūn',
+    0x29B4C: 'liè',
+    0x29B4F: 'wǒ',
+    0x29B50: 'shǐ',
+    0x29B51: 'niǎo',
+    0x29B52: 'máng',
+    0x29B53: 'jiū',
+    0x29B58: 'xiū',
+    0x29B5D: 'wǒ',
+    0x29B5F: 'dào',
+    0x29B61: 'xī',
+    0x29B62: 'àn',
+    0x29B63: 'dá',
+    0x29B64: 'zǒng,zōng',
+    0x29B65: 'hàn',
+    0x29B66: 'chuí',
+    0x29B67: 'bī,bān',
+    0x29B69: 'dòng',
+    0x29B6B: 'zhǎng',
+    0x29B6F: 'yā',
+    0x29B72: 'dí',
+    0x29B73: 'huō',
+    0x29B77: 'mín',
+    0x29B7A: 'fù',
+    0x29B7C: 'bǎo',
+    0x29B7D: 'kè',
+    0x29B7E: 'máo',
+    0x29B7F: 'rè',
+    0x29B80: 'zōng,zǒng,sōng',
+    0x29B81: 'qià',
+    0x29B82: 'xiā',
+    0x29B83: 'sōu',
+    0x29B84: 'xiū',
+    0x29B85: 'nà',
+    0x29B89: 'mán,mián',
+    0x29B8E: 'zhā',
+    0x29B8F: 'chán',
+    0x29B90: 'shè',
+    0x29B91: 'wǒ',
+    0x29B96: 'ái',
+    0x29B97: 'bàng,péng,fǎng',
+    0x29B98: 'hāo',
+    0x29B9A: 'sāo',
+    0x29B9B: 'suǒ',
+    0x29B9C: 'tì',
+    0x29B9D: 'yà',
+    0x29B9F: 'bìng',
+    0x29BA0: 'róng',
+    0x29BAB: 'shā',
+    0x29BAC: 'wěng',
+    0x29BAF: 'áo',
+    0x29BB1: 'zhuāng',
+    0x29BB3: 'piào,piǎo,piē',
+    0x29BB4: 'suī,cuǐ',
+    0x29BB5: 'yī',
+    0x29BB6: 'sōu',
+    0x29BB7: 'dōu',
+    0x29BB8: 'sōu,nà',
+    0x29BB9: 'luó',
+    0x29BC3: 'fèi,bì',
+    0x29BC4: 'zùn',
+    0x29BC6: 'nào',
+    0x29BC7: 'dēng',
+    0x29BC8: 'zhí',
+    0x29BC9: 'cuō',
+    0x29BCA: 'liáo',
+    0x29BCB: 'jǐ',
+    0x29BCC: 'bō',
+    0x29BCD: 'cóng',
+    0x29BCE: 'chéng',
+    0x29BCF: 'bǔ',
+    0x29BD1: 'sān',
+    0x29BD2: 'zàn',
+    0x29BD8: 'jiào',
+    0x29BDB: 'yào',
+    0x29BDC: 'lǔ',
+    0x29BDE: 'càn',
+    0x29BE8: 'nǐ',
+    0x29BF0: 'jié,jì',
+    0x29BF1: 'pú',
+    0x29BF2: 'zhuàng',
+    0x29BF3: 'zàn,zuǎn,zā',
+    0x29BFA: 'lì',
+    0x29BFD: 'là',
+    0x29C00: 'chōng',
+    0x29C03: 'zhàn',
+    0x29C0D: 'biàn',
+    0x29C0E: 'wēng',
+    0x29C13: 'hòng',
+    0x29C17: 'pīn',
+    0x29C19: 'sè',
+    0x29C1E: 'nǐ',
+    0x29C1F: 'fēn',
+    0x29C20: 'xǔ',
+    0x29C22: 'shǐ',
+    0x29C24: 'jù',
+    0x29C28: 'jué',
+    0x29C2A: 'yù',
+    0x29C2C: 'guō,wāi',
+    0x29C2D: 'guō',
+    0x29C2F: 'hú',
+    0x29C32: 'lì,fèi',
+    0x29C33: 'xié',
+    0x29C34: 'ér',
+    0x29C35: 'yuán',
+    0x29C36: 'hái,bèn',
+    0x29C39: 'jìng',
+    0x29C3B: 'kè',
+    0x29C3D: 'zōng',
+    0x29C3E: 'fèi',
+    0x29C40: 'pēng',
+    0x29C41: 'gēng',
+    0x29C43: 'jiān',
+    0x29C44: 'ní',
+    0x29C46: 'xián',
+    0x29C47: 'lì',
+    0x29C48: 'chǎo',
+    0x29C4A: 'ér,xiàn',
+    0x29C4B: 'gēng,pēng',
+    0x29C4C: 'yù',
+    0x29C4D: 'hú',
+    0x29C4E: 'fèi',
+    0x29C4F: 'áo',
+    0x29C53: 'ěr',
+    0x29C58: 'kè',
+    0x29C59: 'kù',
+    0x29C5A: 'bó',
+    0x29C5D: 'yè',
+    0x29C5E: 'jiào',
+    0x29C66: 'chǎo',
+    0x29C67: 'gēng',
+    0x29C68: 'rù',
+    0x29C6A: 'yuè',
+    0x29C6C: 'lín',
+    0x29C71: 'yù',
+    0x29C72: 'yuè',
+    0x29C73: 'zhāi',
+    0x29C74: 'xiāo',
+    0x29C77: 'miè',
+    0x29C7B: 'guǐ',
+    0x29C7C: 'jiū',
+    0x29C7E: 'tuò',
+    0x29C81: 'xí',
+    0x29C82: 'wěi',
+    0x29C83: 'zhuó',
+    0x29C84: 'wèi',
+    0x29C85: 'kuí',
+    0x29C88: 'mèi,wéi',
+    0x29C8A: 'hào',
+    0x29C8B: 'hāng',
+    0x29C8C: 'fāng',
+    0x29C8D: 'niú',
+    0x29C8E: 'yòu',
+    0x29C8F: 'huà',
+    0x29C92: 'làng',
+    0x29CA0: 'zhú',
+    0x29CA1: 'guǐ',
+    0x29CA2: 'bì,mèi',
+    0x29CA3: 'jiǎ',
+    0x29CA4: 'tiáo',
+    0x29CA6: 'lǜ',
+    0x29CA7: 'kǒng',
+    0x29CA8: 'zuǐ',
+    0x29CA9: 'líng',
+    0x29CAA: 'qí',
+    0x29CAC: 'zhú',
+    0x29CB1: 'gǔ',
+    0x29CB2: 'zù',
+    0x29CB4: 'yāng',
+    0x29CB5: 'sū',
+    0x29CB7: 'kuí',
+    0x29CB9: 'chāng',
+    0x29CBB: 'yáo',
+    0x29CBE: 'yù',
+    0x29CC5: 'shū',
+    0x29CC6: 'lài',
+    0x29CC7: 'yì',
+    0x29CC8: 'dōu',
+    0x29CCC: 'wú',
+    0x29CCD: 'yǐng',
+    0x29CCE: 'fú',
+    0x29CCF: 'zhuàn',
+    0x29CD0: 'fǔ',
+    0x29CD2: 'sù',
+    0x29CD3: 'lǐ',
+    0x29CD4: 'yào',
+    0x29CD5: 'tuì,tì',
+    0x29CDD: 'guì',
+    0x29CE1: 'lǜ',
+    0x29CE2: 'yàn',
+    0x29CE3: 'qí',
+    0x29CE4: 'làng,chāng',
+    0x29CE5: 'zhú',
+    0x29CE7: 'guǐ',
+    0x29CE8: 'hū',
+    0x29CEF: 'jīng',
+    0x29CF2: 'chǐ',
+    0x29CF5: 'jú',
+    0x29CF6: 'zhá',
+    0x29CF8: 'miáo',
+    0x29D00: 'zhū',
+    0x29D01: 'gān',
+    0x29D02: 'xiōng',
+    0x29D03: 'jí',
+    0x29D07: 'shài',
+    0x29D08: 'mèi',
+    0x29D09: 'yùn',
+    0x29D0D: 'shòu',
+    0x29D10: 'lǜ',
+    0x29D11: 'yòu',
+    0x29D12: 'jiàng',
+    0x29D13: 'nuó',
+    0x29D18: 'jù',
+    0x29D19: 'yòu',
+    0x29D1C: 'yì',
+    0x29D1D: 'téng',
+    0x29D1E: 'wéi',
+    0x29D1F: 'chě',
+    0x29D20: 'lìn',
+    0x29D21: 'gù',
+    0x29D23: 'lì',
+    0x29D24: 'liào',
+    0x29D27: 'jiāo',
+    0x29D28: 'yáng',
+    0x29D29: 'biāo',
+    0x29D2A: 'qí',
+    0x29D2E: 'yì',
+    0x29D31: 'bīn',
+    0x29D32: 'méng',
+    0x29D33: 'chà',
+    0x29D35: 'gān',
+    0x29D39: 'qú',
+    0x29D3A: 'dí',
+    0x29D3B: 'léi',
+    0x29D40: 'líng',
+    0x29D44: 'huān',
+    0x29D45: 'qú',
+    0x29D47: 'luó',
+    0x29D49: 'kuí',
+    0x29D4D: 'qiú',
+    0x29D4E: 'yǔ,yú',
+    0x29D4F: 'huà',
+    0x29D53: 'lèi',
+    0x29D55: 'rèn,dāo',
+    0x29D56: 'xiǎo',
+    0x29D57: 'sì',
+    0x29D5A: 'dù',
+    0x29D5B: 'biē',
+    0x29D60: 'niú,wěi',
+    0x29D62: 'hè,zā',
+    0x29D63: 'pēi',
+    0x29D65: 'fèi',
+    0x29D66: 'mù',
+    0x29D69: 'fū',
+    0x29D6C: 'hú',
+    0x29D6D: 'wáng',
+    0x29D6E: 'shā,xiǎo',
+    0x29D70: 'jiāo,qiū',
+    0x29D71: 'wǔ',
+    0x29D79: 'fù',
+    0x29D81: 'bǐng',
+    0x29D82: 'zhù',
+    0x29D84: 'zhú',
+    0x29D85: 'chī',
+    0x29D87: 'shěn',
+    0x29D88: 'hū',
+    0x29D89: 'bū',
+    0x29D8E: 'rǎn',
+    0x29D96: 'mù',
+    0x29D98: 'lì',
+    0x29D9B: 'jiā',
+    0x29D9E: 'mà,háng',
+    0x29DA1: 'méng',
+    0x29DA2: 'móu',
+    0x29DA3: 'zhōu',
+    0x29DA4: 'xiǎn',
+    0x29DA5: 'huǐ,hóng',
+    0x29DA6: 'guài',
+    0x29DA7: 'jiù',
+    0x29DA9: 'mù',
+    0x29DAB: 'rù,xuè',
+    0x29DAD: 'wú',
+    0x29DAF: 'rú',
+    0x29DB1: 'zhà',
+    0x29DC1: 'nuǒ',
+    0x29DC2: 'xié',
+    0x29DC4: 'jiàng',
+    0x29DCB: 'lǐ',
+    0x29DCC: 'shū',
+    0x29DCD: 'yì',
+    0x29DCE: 'dí',
+    0x29DCF: 'qíng',
+    0x29DD0: 'jú',
+    0x29DD3: 'zhì',
+    0x29DD5: 'láng',
+    0x29DD6: 'bù',
+    0x29DD7: 'kuáng',
+    0x29DD8: 'yì',
+    0x29DDA: 'bó',
+    0x29DE7: 'chì',
+    0x29DED: 'jiàng',
+    0x29DEF: 'wò',
+    0x29DF0: 'xùn',
+    0x29DF5: 'tūn',
+    0x29DF6: 'máng',
+    0x29DF8: 'fáng',
+    0x29DF9: 'zhuó',
+    0x29DFB: 'qià',
+    0x29DFD: 'tǎ',
+    0x29DFE: 'qí',
+    0x29E00: 'pèng',
+    0x29E01: 'biē',
+    0x29E02: 'fèn,pèn',
+    0x29E03: 'tù',
+    0x29E04: 'huà',
+    0x29E07: 'è',
+    0x29E0B: 'è,yā',
+    0x29E0E: 'dìng',
+    0x29E10: 'rú',
+    0x29E16: 'è',
+    0x29E1E: 'yàn,qí',
+    0x29E1F: 'sì',
+    0x29E25: 'yíng',
+    0x29E26: 'ní',
+    0x29E27: 'ní',
+    0x29E28: 'yí',
+    0x29E39: 'mí',
+    0x29E3E: 'yé',
+    0x29E3F: 'pō',
+    0x29E40: 'còu',
+    0x29E42: 'wèi',
+    0x29E44: 'hài',
+    0x29E45: 'yīng',
+    0x29E47: 'tíng',
+    0x29E48: 'zhì',
+    0x29E49: 'fēi',
+    0x29E4A: 'yóu',
+    0x29E4D: 'kuí',
+    0x29E4E: 'àn',
+    0x29E4F: 'bà',
+    0x29E51: 'hàn',
+    0x29E5E: 'nán',
+    0x29E5F: 'nài',
+    0x29E62: 'jīng',
+    0x29E65: 'wēi',
+    0x29E71: 'chù',
+    0x29E73: 'suǒ',
+    0x29E74: 'tāo',
+    0x29E75: 'qí',
+    0x29E76: 'táng',
+    0x29E77: 'wěi',
+    0x29E78: 'gǎn',
+    0x29E7A: 'gé',
+    0x29E7C: 'hàn',
+    0x29E7E: 'nà',
+    0x29E7F: 'gé',
+    0x29E84: 'zhēng',
+    0x29E97: 'tǎ,dá',
+    0x29E9B: 'sī',
+    0x29E9D: 'nì',
+    0x29E9E: 'sǎng',
+    0x29EAB: 'xié',
+    0x29EAF: 'zú',
+    0x29EB0: 'yú,wú',
+    0x29EB1: 'nì',
+    0x29EB2: 'qī',
+    0x29EB5: 'shēn',
+    0x29EBC: 'bū',
+    0x29ECB: 'kūn',
+    0x29ECC: 'lí',
+    0x29ECE: 'guā',
+    0x29ED6: 'yǎn',
+    0x29ED7: 'bù',
+    0x29ED8: 'jiàn',
+    0x29EDA: 'wú',
+    0x29EDB: 'cén,jīn',
+    0x29EDC: 'lín',
+    0x29EDD: 'zhuàn',
+    0x29EDF: 'huī',
+    0x29EE1: 'tóng',
+    0x29EE2: 'zhǎ',
+    0x29EE4: 'hēi',
+    0x29EE7: 'guǒ',
+    0x29EF1: 'jǐng',
+    0x29EF5: 'dié',
+    0x29EF7: 'yíng',
+    0x29EFC: 'zhì',
+    0x29F02: 'wěi',
+    0x29F04: 'jì',
+    0x29F05: 'rǒng',
+    0x29F08: 'ào,yǒu',
+    0x29F09: 'dāng,hān',
+    0x29F0A: 'luó',
+    0x29F0B: 'yè',
+    0x29F0C: 'wēi',
+    0x29F12: 'qiáng',
+    0x29F19: 'gé',
+    0x29F1A: 'jì',
+    0x29F26: 'zòu',
+    0x29F28: 'yí',
+    0x29F2B: 'zhǎ',
+    0x29F2D: 'liè',
+    0x29F34: 'yè',
+    0x29F3C: 'zhān',
+    0x29F40: 'chóu',
+    0x29F41: 'biāo',
+    0x29F46: 'xù',
+    0x29F47: 'yōu',
+    0x29F4D: 'xiè',
+    0x29F4E: 'wéi',
+    0x29F4F: 'lì',
+    0x29F5B: 'bó',
+    0x29F5C: 'jiǎn',
+    0x29F5D: 'chán',
+    0x29F5E: 'kūn',
+    0x29F61: 'qíng',
+    0x29F67: 'shuāng',
+    0x29F68: 'xī',
+    0x29F69: 'qú',
+    0x29F70: 'luó',
+    0x29F73: 'dǎng',
+    0x29F74: 'nián',
+    0x29F75: 'lǐ',
+    0x29F77: 'bà',
+    0x29F79: 'è',
+    0x29F7A: 'fū',
+    0x29F7B: 'fù',
+    0x29F7C: 'hǔn',
+    0x29F7D: 'zhà',
+    0x29F7E: 'ān',
+    0x29F81: 'qiú',
+    0x29F82: 'chóu',
+    0x29F83: 'miǎn',
+    0x29F84: 'xùn',
+    0x29F85: 'tù',
+    0x29F86: 'ní',
+    0x29F87: 'hu',
+    0x29F88: 'shū',
+    0x29F8A: 'xū',
+    0x29F8B: 'zhòng',
+    0x29F8C: 'kāng',
+    0x29F92: 'xiāo',
+    0x29F93: 'xiāo',
+    0x29F94: 'cì',
+    0x29F95: 'chì',
+    0x29F97: 'diāo,jiāo',
+    0x29F98: 'yì',
+    0x29F9A: 'dīng',
+    0x29F9D: 'hàn,yàn',
+    0x29F9E: 'wán',
+    0x29FA0: 'yǐ',
+    0x29FA1: 'bào',
+    0x29FA2: 'yì,yuān',
+    0x29FA7: 'xùn',
+    0x29FAC: 'xiáng',
+    0x29FB3: 'bí',
+    0x29FB6: 'jié',
+    0x29FB7: 'gē',
+    0x29FB8: 'zè,yàn',
+    0x29FBA: 'zhèn',
+    0x29FBB: 'hú',
+    0x29FBC: 'xī',
+    0x29FBD: 'xīn',
+    0x29FBE: 'xiāo,jiāo',
+    0x29FBF: 'fù',
+    0x29FC0: 'zhòng',
+    0x29FC2: 'mào',
+    0x29FC3: 'xīn',
+    0x29FC4: 'qiāng',
+    0x29FC8: 'fén,fēn',
+    0x29FC9: 'bān',
+    0x29FCA: 'huān',
+    0x29FD1: 'jiāo',
+    0x29FD3: 'bào',
+    0x29FD4: 'yā',
+    0x29FD5: 'yáo',
+    0x29FDB: 'xì',
+    0x29FDD: 'jù',
+    0x29FDF: 'qù',
+    0x29FE0: 'yuè',
+    0x29FE1: 'tái',
+    0x29FE2: 'tǒu',
+    0x29FE3: 'mò',
+    0x29FE4: 'zhá',
+    0x29FE5: 'qú',
+    0x29FE7: 'fū',
+    0x29FE9: 'qú,duó',
+    0x29FEA: 'chì',
+    0x29FEC: 'yóu',
+    0x29FF7: 'tí',
+    0x29FFA: 'wā',
+    0x29FFD: 'tuó',
+    0x29FFF: 'chú',
+    0x2A001: 'gē',
+    0x2A008: 'yuān',
+    0x2A009: 'gē,kě',
+    0x2A00A: 'qú',
+    0x2A00F: 'jù,jiū',
+    0x2A012: 'dié',
+    0x2A013: 'yí',
+    0x2A014: 'shī',
+    0x2A015: 'yì',
+    0x2A017: 'guǐ',
+    0x2A018: 'jiàng',
+    0x2A01A: 'sōng',
+    0x2A01B: 'qióng',
+    0x2A01D: 'è,yuān',
+    0x2A01E: 'huāng',
+    0x2A01F: 'huí',
+    0x2A020: 'xún',
+    0x2A023: 'jú',
+    0x2A025: 'zhái',
+    0x2A026: 'chì',
+    0x2A027: 'lǎo',
+    0x2A029: 'qí,dàn,chú',
+    0x2A02A: 'xiū',
+    0x2A02C: 'huī',
+    0x2A02D: 'tóng',
+    0x2A03A: 'fù',
+    0x2A03D: 'xún,xīn',
+    0x2A03E: 'jié',
+    0x2A03F: 'mǐ',
+    0x2A040: 'yù',
+    0x2A048: 'zhuāng,zhuàng',
+    0x2A049: 'jiāo',
+    0x2A04A: 'zhì,zhé',
+    0x2A04B: 'chéng',
+    0x2A04D: 'jié',
+    0x2A04E: 'xiāo',
+    0x2A04F: 'chén',
+    0x2A050: 'lí',
+    0x2A051: 'yuè',
+    0x2A053: 'zhì',
+    0x2A054: 'láo',
+    0x2A055: 'wò',
+    0x2A056: 'qú',
+    0x2A058: 'wāng',
+    0x2A05A: 'yī',
+    0x2A05B: 'yì',
+    0x2A05C: 'láng',
+    0x2A05E: 'tóu',
+    0x2A05F: 'ān,hàn',
+    0x2A060: 'jué',
+    0x2A061: 'yàn',
+    0x2A065: 'jù',
+    0x2A067: 'zhèn,chén',
+    0x2A069: 'zhì,tí',
+    0x2A06A: 'mǎng',
+    0x2A06E: 'xiù',
+    0x2A071: 'chuáng',
+    0x2A072: 'chū',
+    0x2A078: 'qiāng',
+    0x2A079: 'fēi',
+    0x2A07A: 'cháng,chǎng',
+    0x2A07C: 'mián',
+    0x2A07D: 'sù',
+    0x2A07E: 'ǎo,wò',
+    0x2A080: 'fǔ',
+    0x2A084: 'wèi',
+    0x2A085: 'zhī',
+    0x2A086: 'mín',
+    0x2A087: 'chāng',
+    0x2A088: 'yán',
+    0x2A089: 'yù',
+    0x2A08B: 'fù',
+    0x2A08C: 'tà',
+    0x2A08D: 'jǐ',
+    0x2A08F: 'fèi',
+    0x2A092: 'hú',
+    0x2A093: 'jū',
+    0x2A095: 'yǔ',
+    0x2A09B: 'qí',
+    0x2A09C: 'méi',
+    0x2A09F: 'biē',
+    0x2A0A0: 'guǒ',
+    0x2A0A4: 'mìng',
+    0x2A0A6: 'wǎn,yuān',
+    0x2A0A7: 'wǎn',
+    0x2A0B4: 'jīng',
+    0x2A0B5: 'yù',
+    0x2A0B6: 'xián',
+    0x2A0B9: 'chūn',
+    0x2A0BA: 'jí',
+    0x2A0BC: 'xiāng',
+    0x2A0BD: 'pén',
+    0x2A0BE: 'fù',
+    0x2A0C2: 'liú',
+    0x2A0C4: 'sāi',
+    0x2A0C5: 'xuē',
+    0x2A0C6: 'zòu',
+    0x2A0C8: 'jié',
+    0x2A0CB: 'zhān,jiān',
+    0x2A0CD: 'yú',
+    0x2A0CE: 'yú',
+    0x2A0CF: 'méi',
+    0x2A0D0: 'miǎo',
+    0x2A0D1: 'mào',
+    0x2A0D2: 'duó',
+    0x2A0D3: 'fù',
+    0x2A0DB: 'jiàn',
+    0x2A0E6: 'miáo',
+    0x2A0E8: 'āo',
+    0x2A0ED: 'kè',
+    0x2A0F6: 'hóu',
+    0x2A0FA: 'gòu',
+    0x2A0FC: 'xī',
+    0x2A0FE: 'róng',
+    0x2A0FF: 'gē',
+    0x2A100: 'pán',
+    0x2A101: 'yuán',
+    0x2A102: 'xià',
+    0x2A105: 'shā',
+    0x2A106: 'pī,pí',
+    0x2A108: 'qíng',
+    0x2A109: 'yōng',
+    0x2A10A: 'qú',
+    0x2A10C: 'gòng',
+    0x2A10E: 'gé',
+    0x2A10F: 'xiān',
+    0x2A111: 'sù',
+    0x2A115: 'bān',
+    0x2A116: 'qí',
+    0x2A117: 'hòu',
+    0x2A11B: 'xī',
+    0x2A11D: 'wū',
+    0x2A12D: 'qī',
+    0x2A12E: 'hù,gù',
+    0x2A12F: 'guī',
+    0x2A131: 'dí',
+    0x2A132: 'shāng',
+    0x2A133: 'mài',
+    0x2A134: 'mǐn',
+    0x2A135: 'jì',
+    0x2A136: 'xí',
+    0x2A137: 'xiān',
+    0x2A138: 'jí',
+    0x2A139: 'cháng',
+    0x2A13A: 'kòu',
+    0x2A13B: 'chōng,zhuāng',
+    0x2A142: 'zhāng',
+    0x2A143: 'piǎo,piāo',
+    0x2A144: 'sù',
+    0x2A145: 'lüè',
+    0x2A146: 'lí',
+    0x2A147: 'mèng',
+    0x2A148: 'chōng',
+    0x2A149: 'tiān',
+    0x2A14B: 'líng',
+    0x2A14D: 'chì',
+    0x2A156: 'chōng,zhuāng',
+    0x2A159: 'chì',
+    0x2A15D: 'niǎo',
+    0x2A15F: 'yóng',
+    0x2A16E: 'mì',
+    0x2A170: 'shū',
+    0x2A172: 'xì',
+    0x2A174: 'è',
+    0x2A175: 'zī',
+    0x2A178: 'jié',
+    0x2A179: 'jī',
+    0x2A17A: 'hōu',
+    0x2A17B: 'shèng',
+    0x2A17C: 'lì',
+    0x2A17E: 'qī',
+    0x2A180: 'zhōu',
+    0x2A181: 'sī',
+    0x2A182: 'qú',
+    0x2A18B: 'xié',
+    0x2A197: 'sī',
+    0x2A19B: 'xū',
+    0x2A1A0: 'fù',
+    0x2A1AF: 'nóng',
+    0x2A1B0: 'yà',
+    0x2A1B1: 'liú',
+    0x2A1B2: 'jiǎ,zhān',
+    0x2A1B3: 'guī',
+    0x2A1B4: 'kuí',
+    0x2A1B5: 'chì',
+    0x2A1B6: 'càn',
+    0x2A1B7: 'chú',
+    0x2A1B9: 'guō',
+    0x2A1BB: 'dǎn',
+    0x2A1BF: 'jiàn',
+    0x2A1C1: 'dāng',
+    0x2A1C2: 'hòu',
+    0x2A1C4: 'kòu,kū',
+    0x2A1C6: 'chù,dú',
+    0x2A1C7: 'qiān',
+    0x2A1C8: 'ài',
+    0x2A1CA: 'pì',
+    0x2A1D1: 'xùn',
+    0x2A1D2: 'jīng',
+    0x2A1D3: 'mèng',
+    0x2A1D5: 'bīn',
+    0x2A1D6: 'lán',
+    0x2A1D7: 'gǔ',
+    0x2A1D8: 'chóu,táo',
+    0x2A1DB: 'yōng',
+    0x2A1DC: 'guá',
+    0x2A1DD: 'yú',
+    0x2A1DE: 'zhòu',
+    0x2A1ED: 'cài',
+    0x2A1EF: 'liú',
+    0x2A1F0: 'bǔ',
+    0x2A1F1: 'luò',
+    0x2A1F2: 'jié',
+    0x2A1F3: 'zhēn',
+    0x2A1F4: 'miè',
+    0x2A1F5: 'guǎng',
+    0x2A1F7: 'jiá',
+    0x2A1F9: 'là',
+    0x2A200: 'shòu',
+    0x2A203: 'guō',
+    0x2A206: 'mèng',
+    0x2A207: 'qián',
+    0x2A208: 'lài',
+    0x2A20A: 'hé',
+    0x2A20B: 'tuán',
+    0x2A211: 'huī',
+    0x2A218: 'hōng',
+    0x2A21C: 'lǚ',
+    0x2A21F: 'jiá',
+    0x2A225: 'guī',
+    0x2A228: 'yī',
+    0x2A229: 'huān',
+    0x2A230: 'luó',
+    0x2A234: 'jué',
+    0x2A238: 'guàn',
+    0x2A23B: 'quán',
+    0x2A23C: 'niǎo',
+    0x2A23F: 'mán',
+    0x2A242: 'yùn',
+    0x2A243: 'wén',
+    0x2A244: 'chì',
+    0x2A245: 'chì',
+    0x2A246: 'zhī',
+    0x2A248: 'cí',
+    0x2A249: 'zhuàng',
+    0x2A24A: 'huá',
+    0x2A24B: 'jié',
+    0x2A24C: 'qú',
+    0x2A24D: 'tū',
+    0x2A24E: 'mín',
+    0x2A24F: 'méi',
+    0x2A250: 'yú',
+    0x2A251: 'áo',
+    0x2A252: 'bān',
+    0x2A254: 'pī',
+    0x2A255: 'zhēn',
+    0x2A256: 'lǔ',
+    0x2A257: 'chì',
+    0x2A258: 'tóu',
+    0x2A25A: 'jiē',
+    0x2A25C: 'zhān',
+    0x2A262: 'jīn',
+    0x2A263: 'lǔ',
+    0x2A266: 'jiàn,jiǎn,gàn',
+    0x2A267: 'tàn',
+    0x2A268: 'chāng',
+    0x2A26A: 'cì',
+    0x2A26D: 'wāi',
+    0x2A26E: 'còu',
+    0x2A26F: 'kàn',
+    0x2A271: 'biàn',
+    0x2A278: 'wēn',
+    0x2A27B: 'qiān',
+    0x2A27F: 'gàn',
+    0x2A282: 'huì',
+    0x2A284: 'gǎn,gàn',
+    0x2A286: 'jì',
+    0x2A287: 'gàn,tàn',
+    0x2A289: 'huái',
+    0x2A28D: 'sì',
+    0x2A290: 'fū',
+    0x2A295: 'pí',
+    0x2A297: 'cā',
+    0x2A29C: 'bèn',
+    0x2A2A2: 'shí,shǐ',
+    0x2A2A5: 'huán',
+    0x2A2A7: 'guī',
+    0x2A2AA: 'ǒu',
+    0x2A2B3: 'páo',
+    0x2A2B5: 'yǐng',
+    0x2A2B6: 'tǐng',
+    0x2A2B7: 'xiào',
+    0x2A2B9: 'zhù',
+    0x2A2BB: 'yú',
+    0x2A2C1: 'jiàn',
+    0x2A2C4: 'qǔ',
+    0x2A2C5: 'wǎn',
+    0x2A2C6: 'kūn',
+    0x2A2C7: 'zhuī',
+    0x2A2C9: 'yù',
+    0x2A2CA: 'guǒ',
+    0x2A2CB: 'píng',
+    0x2A2CC: 'zuǐ',
+    0x2A2CD: 'zú',
+    0x2A2CF: 'zhū',
+    0x2A2D0: 'nuàn',
+    0x2A2D1: 'zhū',
+    0x2A2D6: 'piāo',
+    0x2A2D7: 'mí',
+    0x2A2DC: 'bì',
+    0x2A2DD: 'sù',
+    0x2A2E1: 'pú',
+    0x2A2E2: 'mí',
+    0x2A2EB: 'yè',
+    0x2A2EC: 'yǔ',
+    0x2A2EE: 'yù',
+    0x2A2F0: 'zhǔ',
+    0x2A2F3: 'líng',
+    0x2A2FA: 'nòu',
+    0x2A2FE: 'líng',
+    0x2A300: 'liǎo',
+    0x2A302: 'tuō',
+    0x2A304: 'bǐ',
+    0x2A305: 'nà',
+    0x2A306: 'qú',
+    0x2A308: 'pí',
+    0x2A309: 'dǒu',
+    0x2A30A: 'niè',
+    0x2A30B: 'tún',
+    0x2A30D: 'jī',
+    0x2A30F: 'líng',
+    0x2A313: 'kù',
+    0x2A314: 'sù',
+    0x2A318: 'tǒu',
+    0x2A31E: 'nái',
+    0x2A31F: 'zé',
+    0x2A322: 'tǒng',
+    0x2A323: 'gé',
+    0x2A324: 'duī',
+    0x2A327: 'jié',
+    0x2A329: 'tián',
+    0x2A32A: 'tiào',
+    0x2A32B: 'chí',
+    0x2A32C: 'qū,chǎo',
+    0x2A32E: 'shā,suō',
+    0x2A330: 'bó',
+    0x2A331: 'lí',
+    0x2A333: 'luò',
+    0x2A335: 'liáo',
+    0x2A336: 'shù',
+    0x2A337: 'děng',
+    0x2A339: 'chī',
+    0x2A33A: 'miè',
+    0x2A33C: 'táo',
+    0x2A33D: 'hún',
+    0x2A33F: 'nié',
+    0x2A341: 'jùn',
+    0x2A342: 'hù',
+    0x2A344: 'lù',
+    0x2A345: 'yè',
+    0x2A347: 'mò,chǎo,mài',
+    0x2A348: 'chào',
+    0x2A34C: 'suò',
+    0x2A34E: 'kē',
+    0x2A34F: 'fù',
+    0x2A351: 'chǎo',
+    0x2A354: 'suǒ',
+    0x2A357: 'qiū',
+    0x2A35B: 'sù,xiè',
+    0x2A35D: 'yùn',
+    0x2A35F: 'suǒ',
+    0x2A360: 'kū',
+    0x2A361: 'bó',
+    0x2A363: 'lǒu',
+    0x2A364: 'mò',
+    0x2A366: 'liǎn',
+    0x2A367: 'xuàn',
+    0x2A368: 'suǒ',
+    0x2A369: 'mán',
+    0x2A36A: 'bì',
+    0x2A372: 'tì',
+    0x2A374: 'lián',
+    0x2A375: 'tán',
+    0x2A376: 'shàn',
+    0x2A378: 'qú',
+    0x2A379: 'dú',
+    0x2A37A: 'huán,huàn',
+    0x2A37B: 'sào',
+    0x2A37F: 'kuàng',
+    0x2A383: 'niè',
+    0x2A385: 'niè',
+    0x2A386: 'luó',
+    0x2A387: 'zuó',
+    0x2A388: 'yì',
+    0x2A389: 'xiàn',
+    0x2A38A: 'chǎo',
+    0x2A38B: 'tiè',
+    0x2A392: 'shuò',
+    0x2A394: 'mǐ',
+    0x2A397: 'mí',
+    0x2A39B: 'wǎn',
+    0x2A39D: 'bèn',
+    0x2A39E: 'qiāng',
+    0x2A3A0: 'mǒ',
+    0x2A3A3: 'liú',
+    0x2A3A4: 'wò',
+    0x2A3A6: 'měi',
+    0x2A3A8: 'tóu',
+    0x2A3AB: 'mǔ',
+    0x2A3AD: 'méi',
+    0x2A3B2: 'zuò',
+    0x2A3B4: 'tún',
+    0x2A3B5: 'kàng',
+    0x2A3B6: 'tún',
+    0x2A3BA: 'chè',
+    0x2A3BB: 'zhèng',
+    0x2A3BD: 'chōng',
+    0x2A3BE: 'tiān',
+    0x2A3C0: 'zhì',
+    0x2A3C1: 'chán',
+    0x2A3C2: 'chán',
+    0x2A3C5: 'qīng',
+    0x2A3C6: 'tūn',
+    0x2A3C7: 'huǐ',
+    0x2A3C8: 'què',
+    0x2A3C9: 'zhān',
+    0x2A3CA: 'jiān,miǎn',
+    0x2A3CB: 'chán',
+    0x2A3CD: 'huáng',
+    0x2A3CF: 'huī',
+    0x2A3D0: 'chí',
+    0x2A3D2: 'huáng',
+    0x2A3D3: 'héng',
+    0x2A3D4: 'yǔn',
+    0x2A3D6: 'tuān',
+    0x2A3D7: 'biān',
+    0x2A3D9: 'huáng',
+    0x2A3DA: 'yǔn',
+    0x2A3DF: 'mò',
+    0x2A3E0: 'gōng',
+    0x2A3E2: 'gōng',
+    0x2A3E4: 'guì',
+    0x2A3E6: 'chán',
+    0x2A3E8: 'què',
+    0x2A3E9: 'ruì',
+    0x2A3EA: 'kuàng',
+    0x2A3EB: 'piào',
+    0x2A3EE: 'rǔ',
+    0x2A3F2: 'niǔ',
+    0x2A3F3: 'hù',
+    0x2A3F4: 'jǐn',
+    0x2A3F5: 'nì,lí',
+    0x2A3F6: 'bào',
+    0x2A3F8: 'nǐ,chī',
+    0x2A3FA: 'bì',
+    0x2A3FB: 'hú',
+    0x2A3FC: 'lí',
+    0x2A3FF: 'zhū',
+    0x2A400: 'nǎ',
+    0x2A402: 'quǎn',
+    0x2A403: 'fěng',
+    0x2A404: 'bǐ',
+    0x2A405: 'lí',
+    0x2A406: 'bié',
+    0x2A407: 'nián',
+    0x2A408: 'dǒng',
+    0x2A40B: 'lián',
+    0x2A40C: 'nì',
+    0x2A40D: 'lián',
+    0x2A40E: 'má',
+    0x2A40F: 'zhé,zhí',
+    0x2A413: 'jiā',
+    0x2A414: 'yí',
+    0x2A416: 'lǒng',
+    0x2A418: 'yì,yān',
+    0x2A41D: 'dài,tài',
+    0x2A41E: 'dù',
+    0x2A423: 'yǐ',
+    0x2A425: 'tài',
+    0x2A426: 'hāng',
+    0x2A427: 'shù',
+    0x2A42C: 'wán',
+    0x2A42E: 'sù',
+    0x2A42F: 'yǎo',
+    0x2A430: 'èr',
+    0x2A432: 'zhèn',
+    0x2A43A: 'dòu',
+    0x2A43B: 'jiān',
+    0x2A43F: 'pāng',
+    0x2A440: 'huī',
+    0x2A442: 'chà',
+    0x2A443: 'shān',
+    0x2A444: 'lú',
+    0x2A446: 'yù',
+    0x2A448: 'yàn',
+    0x2A449: 'wǎn',
+    0x2A44A: 'qiào',
+    0x2A44B: 'luō',
+    0x2A44C: 'yù',
+    0x2A44F: 'tú',
+    0x2A450: 'wèi',
+    0x2A452: 'tùn',
+    0x2A455: 'hǔn',
+    0x2A456: 'bēn',
+    0x2A457: 'qiè',
+    0x2A459: 'jīn,qián',
+    0x2A45A: 'lái,lí',
+    0x2A45C: 'zhǐ',
+    0x2A45D: 'yú',
+    0x2A45F: 'cì',
+    0x2A466: 'yè',
+    0x2A467: 'dié',
+    0x2A468: 'chà',
+    0x2A469: 'diàn',
+    0x2A46A: 'mán',
+    0x2A46C: 'dèng',
+    0x2A46D: 'wēi',
+    0x2A46E: 'niǎn',
+    0x2A46F: 'lèi',
+    0x2A470: 'bīng',
+    0x2A471: 'wū,wò',
+    0x2A473: 'zhěn',
+    0x2A476: 'róu',
+    0x2A477: 'wài',
+    0x2A478: 'mì,yān',
+    0x2A479: 'jiè',
+    0x2A47B: 'hóu',
+    0x2A47D: 'zhài',
+    0x2A47E: 'rǔ',
+    0x2A47F: 'zī',
+    0x2A480: 'pán',
+    0x2A482: 'mò',
+    0x2A484: 'mì',
+    0x2A486: 'qī',
+    0x2A487: 'mò',
+    0x2A48A: 'zhī',
+    0x2A48B: 'bān,pán',
+    0x2A48D: 'miè',
+    0x2A48F: 'lù',
+    0x2A491: 'qī',
+    0x2A492: 'chōng',
+    0x2A494: 'lí',
+    0x2A495: 'yì',
+    0x2A498: 'dèng',
+    0x2A499: 'cuō',
+    0x2A49B: 'duì',
+    0x2A49C: 'mà',
+    0x2A49D: 'yǎn',
+    0x2A49F: 'zèng',
+    0x2A4A0: 'yǎn,ǎn,àn',
+    0x2A4A1: 'duì,dài',
+    0x2A4A2: 'pū',
+    0x2A4A5: 'yuè',
+    0x2A4A9: 'huò',
+    0x2A4AA: 'mài',
+    0x2A4AB: 'jiǎn',
+    0x2A4AC: 'nóng',
+    0x2A4AD: 'qín',
+    0x2A4AF: 'qín',
+    0x2A4B2: 'yè',
+    0x2A4B4: 'tái',
+    0x2A4B9: 'jiān',
+    0x2A4BC: 'chá',
+    0x2A4BE: 'dàn',
+    0x2A4BF: 'téng',
+    0x2A4C0: 'lì',
+    0x2A4C3: 'niǎng',
+    0x2A4C4: 'chán',
+    0x2A4C5: 'zāng',
+    0x2A4CA: 'yù',
+    0x2A4CC: 'zuì',
+    0x2A4CD: 'biān',
+    0x2A4D0: 'chǔ',
+    0x2A4D8: 'rán',
+    0x2A4DA: 'rán',
+    0x2A4DB: 'yāng',
+    0x2A4DC: 'bǒ',
+    0x2A4E1: 'cù',
+    0x2A4EC: 'mí',
+    0x2A4EE: 'kě',
+    0x2A4F0: 'cù',
+    0x2A4F7: 'xí',
+    0x2A4F9: 'má',
+    0x2A4FB: 'shī',
+    0x2A4FC: 'diān',
+    0x2A4FF: 'shī',
+    0x2A502: 'dǐng',
+    0x2A503: 'jiōng',
+    0x2A505: 'yuán',
+    0x2A506: 'gān',
+    0x2A50A: 'huì',
+    0x2A50B: 'jī',
+    0x2A50D: 'péng',
+    0x2A50F: 'dēng',
+    0x2A511: 'bèng',
+    0x2A514: 'pāng,péng',
+    0x2A515: 'tà,lóng',
+    0x2A517: 'yuān',
+    0x2A518: 'gāo',
+    0x2A519: 'yuān',
+    0x2A51F: 'jiā',
+    0x2A523: 'kōng',
+    0x2A526: 'dòng',
+    0x2A529: 'xián',
+    0x2A52A: 'qì',
+    0x2A52C: 'sāng',
+    0x2A530: 'yìn',
+    0x2A533: 'lóng',
+    0x2A536: 'tēng',
+    0x2A537: 'lóng',
+    0x2A53A: 'rèn',
+    0x2A53D: 'yìn',
+    0x2A53E: 'píng',
+    0x2A53F: 'pū',
+    0x2A540: 'yuán',
+    0x2A541: 'rǒng,chén',
+    0x2A543: 'fāng',
+    0x2A547: 'hāng',
+    0x2A548: 'mí',
+    0x2A549: 'hú',
+    0x2A54A: 'zī',
+    0x2A54C: 'líng',
+    0x2A54D: 'jiōng',
+    0x2A54E: 'rǒng',
+    0x2A552: 'píng',
+    0x2A553: 'guāng',
+    0x2A554: 'ěr',
+    0x2A55D: 'cù',
+    0x2A55E: 'jùn',
+    0x2A566: 'xiǔ',
+    0x2A568: 'ér',
+    0x2A569: 'tì',
+    0x2A56B: 'yáng',
+    0x2A56D: 'ài',
+    0x2A56E: 'hú',
+    0x2A56F: 'xí,xié',
+    0x2A571: 'hú',
+    0x2A573: 'sī',
+    0x2A574: 'lǐ',
+    0x2A576: 'yì',
+    0x2A577: 'gǔ',
+    0x2A579: 'táng',
+    0x2A580: 'què',
+    0x2A581: 'zōng',
+    0x2A582: 'lí',
+    0x2A584: 'jiào',
+    0x2A587: 'fán',
+    0x2A588: 'pú',
+    0x2A589: 'sī',
+    0x2A58B: 'jié',
+    0x2A58C: 'lú',
+    0x2A58D: 'lì',
+    0x2A58E: 'chán',
+    0x2A590: 'yào,yà',
+    0x2A595: 'huī',
+    0x2A599: 'hōu',
+    0x2A59A: 'diān',
+    0x2A59B: 'qiù',
+    0x2A59C: 'jué',
+    0x2A59E: 'pì',
+    0x2A5A2: 'kuī',
+    0x2A5A5: 'xǐ',
+    0x2A5A6: 'tī',
+    0x2A5A9: 'xù',
+    0x2A5AF: 'biǎn',
+    0x2A5B2: 'hē',
+    0x2A5B3: 'lián',
+    0x2A5B6: 'sù',
+    0x2A5B7: 'liào',
+    0x2A5BC: 'jīn',
+    0x2A5C1: 'lì',
+    0x2A5C2: 'chán',
+    0x2A5C5: 'qí',
+    0x2A5C6: 'qí',
+    0x2A5C9: 'zī',
+    0x2A5CB: 'zī',
+    0x2A5CD: 'qí',
+    0x2A5CF: 'qí',
+    0x2A5D0: 'zī',
+    0x2A5D2: 'zhāi',
+    0x2A5D3: 'zhāi',
+    0x2A5D4: 'pà',
+    0x2A5D6: 'jū',
+    0x2A5D9: 'yǎn',
+    0x2A5DC: 'háng',
+    0x2A5DD: 'nà',
+    0x2A5E4: 'yǎn',
+    0x2A5E6: 'zhàn',
+    0x2A5E7: 'shǐ',
+    0x2A5E8: 'zhí',
+    0x2A5ED: 'zhā',
+    0x2A5F4: 'rǒng',
+    0x2A5F5: 'zhā',
+    0x2A5F7: 'yì',
+    0x2A5F8: 'míng',
+    0x2A5F9: 'yá',
+    0x2A5FB: 'zhì',
+    0x2A5FD: 'kuò,huá',
+    0x2A5FE: 'xiá',
+    0x2A600: 'pián',
+    0x2A601: 'tà,xiá',
+    0x2A603: 'yǐ',
+    0x2A606: 'xiū',
+    0x2A607: 'zhāi',
+    0x2A609: 'duǒ',
+    0x2A60A: 'è',
+    0x2A60E: 'yín,niè',
+    0x2A610: 'è',
+    0x2A611: 'suān',
+    0x2A612: 'ān',
+    0x2A613: 'cuó',
+    0x2A615: 'tuó',
+    0x2A617: 'tuó',
+    0x2A618: 'xiá',
+    0x2A61B: 'chuò',
+    0x2A61D: 'suān',
+    0x2A625: 'jì',
+    0x2A626: 'qiǎn',
+    0x2A627: 'zú',
+    0x2A628: 'zhāi',
+    0x2A629: 'yǔn,kǔn',
+    0x2A62A: 'zhàn',
+    0x2A62C: 'yí,yà,yá',
+    0x2A632: 'yá,yí,yà,cī',
+    0x2A633: 'yuē',
+    0x2A639: 'hé',
+    0x2A63A: 'qià',
+    0x2A63E: 'chā',
+    0x2A643: 'óu',
+    0x2A648: 'hú',
+    0x2A64A: 'yàn',
+    0x2A64C: 'qiè',
+    0x2A64D: 'bó',
+    0x2A64E: 'qiāng',
+    0x2A64F: 'jiè,jiá',
+    0x2A65B: 'nì',
+    0x2A65E: 'chǎn',
+    0x2A65F: 'qǐn',
+    0x2A661: 'zāo',
+    0x2A664: 'yǐn',
+    0x2A665: 'xiè',
+    0x2A667: 'qí',
+    0x2A668: 'jiàn,jiān',
+    0x2A66B: 'xū',
+    0x2A66D: 'zèng',
+    0x2A66F: 'è',
+    0x2A673: 'zū',
+    0x2A674: 'yǐ',
+    0x2A679: 'zhí',
+    0x2A67A: 'lì',
+    0x2A67D: 'lì',
+    0x2A67E: 'yín',
+    0x2A681: 'lián',
+    0x2A683: 'chán',
+    0x2A685: 'jué',
+    0x2A687: 'zá',
+    0x2A68E: 'zhāi',
+    0x2A68F: 'pián',
+    0x2A691: 'lóng',
+    0x2A693: 'lóng',
+    0x2A698: 'lóng',
+    0x2A69D: 'lóng',
+    0x2A6A0: 'lóng',
+    0x2A6A2: 'mǎng',
+    0x2A6A5: 'zhé',
+    0x2A6AC: 'gàn',
+    0x2A6AD: 'gōu',
+    0x2A6AE: 'rán',
+    0x2A6AF: 'cù',
+    0x2A6B0: 'jiāo',
+    0x2A6B7: 'bǒ',
+    0x2A6B9: 'zhù',
+    0x2A6BA: 'qiū',
+    0x2A6BB: 'yāng',
+    0x2A6C0: 'xiào',
+    0x2A6C2: 'huí',
+    0x2A6C3: 'qū',
+    0x2A6C8: 'líng',
+    0x2A6CA: 'yín',
+    0x2A6CE: 'pì',
+    0x2A6D2: 'lián',
+}
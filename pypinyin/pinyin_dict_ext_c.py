@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+pinyin_dict = {
+    0x2A79D: 'duó',
+    0x2A7DD: 'jì,jī',
+    0x2A848: 'bái',
+    0x2A84F: 'zhān',
+    0x2A8AE: 'luán',
+    0x2A8FB: 'lóu',
+    0x2A917: 'liào',
+    0x2AA0A: 'sóng',
+    0x2AA17: 'juē',
+    0x2AA30: 'qū',
+    0x2AA36: 'shē',
+    0x2AA58: 'yǎn',
+    0x2AA9D: 'yōng',
+    0x2AEB9: 'nǔ',
+    0x2AED0: 'cōng',
+    0x2AFA2: 'xiàn',
+    0x2B061: 'lì',
+    0x2B088: 'fèi',
+    0x2B099: 'sù',
+    0x2B0DC: 'kòu',
+    0x2B127: 'yán',
+    0x2B128: 'chī',
+    0x2B137: 'yì',
+    0x2B138: 'xūn',
+    0x2B1ED: 'wěi',
+    0x2B230: 'qià',
+    0x2B2D0: 'gǒng',
+    0x2B300: 'jī',
+    0x2B328: 'luó',
+    0x2B359: 'yì',
+    0x2B35F: 'yí',
+    0x2B362: 'náo',
+    0x2B363: 'tóng',
+    0x2B36F: 'xián',
+    0x2B370: 'xǐ',
+    0x2B372: 'xiǎo',
+    0x2B37D: 'xuān',
+    0x2B3CB: 'juē,qiāo',
+    0x2B404: 'yuè',
+    0x2B406: 'kuài',
+    0x2B409: 'líng',
+    0x2B410: 'ní',
+    0x2B413: 'bù,róu',
+    0x2B461: 'méng',
+    0x2B4B6: 'hán',
+    0x2B4E7: 'fū',
+    0x2B4E9: 'cōng',
+    0x2B4EF: 'jī',
+    0x2B4F6: 'xuān',
+    0x2B4F9: 'jī',
+    0x2B50D: 'fán',
+    0x2B50E: 'jué',
+    0x2B536: 'niè',
+    0x2B5AE: 'yǐ',
+    0x2B5AF: 'fǔ',
+    0x2B5B3: 'yūn',
+    0x2B5E0: 'zhāng',
+    0x2B5E6: 'bù',
+    0x2B5E7: 'sù',
+    0x2B5EE: 'huáng',
+    0x2B5F4: 'zhān',
+    0x2B61C: 'wén',
+    0x2B61D: 'jué',
+    0x2B623: 'hàn',
+    0x2B624: 'ái',
+    0x2B626: 'táo',
+    0x2B627: 'lù',
+    0x2B628: 'tí',
+    0x2B62A: 'yuán',
+    0x2B62C: 'xí',
+    0x2B688: 'xù',
+    0x2B689: 'hóng',
+    0x2B692: 'fú',
+    0x2B694: 'huí',
+    0x2B695: 'shī',
+    0x2B696: 'cǐ',
+    0x2B699: 'pū',
+    0x2B6AD: 'liè',
+    0x2B6DB: 'zhī',
+    0x2B6DE: 'jué',
+    0x2B6E2: 'níng',
+    0x2B6ED: 'kuáng',
+    0x2B6F6: 'chì',
+    0x2B6F8: 'tí',
+}
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+pinyin_dict = {
+    0x2B7A9: 'mén',
+    0x2B7C5: 'liáng',
+    0x2B7E6: 'suì',
+    0x2B7F7: 'lì',
+    0x2B7F9: 'hóng',
+    0x2B7FC: 'dá',
+    0x2B806: 'kuǐ',
+    0x2B80A: 'xuán',
+    0x2B81C: 'ní',
+}
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+# Warning: Auto-generated file, don't edit.
+pinyin_dict = {
+    0x2B851: 'yīn',
+    0x2B8B8: 'dàn',
+    0x2BAC7: 'ě,è',
+    0x2BB5F: 'ōu,qū',
+    0x2BB62: 'lǔn',
+    0x2BB7C: 'láo',
+    0x2BB83: 'shàn',
+    0x2BC1B: 'xíng',
+    0x2BD77: 'lì',
+    0x2BD87: 'dié',
+    0x2BDF7: 'xīn',
+    0x2BE29: 'kōu',
+    0x2C029: 'wěi',
+    0x2C02A: 'xiàn',
+    0x2C0A9: 'jiā',
+    0x2C0CA: 'zhì',
+    0x2C1D5: 'wàn',
+    0x2C1D9: 'pèi,bèi',
+    0x2C1F9: 'guó',
+    0x2C27C: 'ōu,ǒu',
+    0x2C288: 'xún',
+    0x2C2A4: 'chǎn',
+    0x2C317: 'hé',
+    0x2C35B: 'lì',
+    0x2C361: 'dàng',
+    0x2C364: 'xún',
+    0x2C488: 'què',
+    0x2C494: 'gěng',
+    0x2C497: 'lán',
+    0x2C4FC: 'tuí',
+    0x2C542: 'gōng,lǒng',
+    0x2C613: 'xún',
+    0x2C618: 'dǎn',
+    0x2C621: 'yīn',
+    0x2C629: 'tīng',
+    0x2C62B: 'huán',
+    0x2C62C: 'qiàn',
+    0x2C62D: 'lín,chēn',
+    0x2C62F: 'zhǔn',
+    0x2C642: 'yǎn',
+    0x2C64A: 'mò',
+    0x2C64B: 'xiāng',
+    0x2C72C: 'màn',
+    0x2C72F: 'liǎng',
+    0x2C79F: 'pín',
+    0x2C7C1: 'yì',
+    0x2C7FD: 'dōng',
+    0x2C8D9: 'xū',
+    0x2C8DE: 'zhǔ',
+    0x2C8E1: 'jiàn',
+    0x2C8F3: 'hěn',
+    0x2C907: 'yīn',
+    0x2C90A: 'shì',
+    0x2C91D: 'huì',
+    0x2C925: 'zhuàn',
+    0x2CA02: 'qí',
+    0x2CA0E: 'yóu',
+    0x2CA7D: 'xún',
+    0x2CAA9: 'nóng',
+    0x2CB29: 'yì',
+    0x2CB2D: 'lún',
+    0x2CB2E: 'chǎng',
+    0x2CB31: 'jīn',
+    0x2CB38: 'shù',
+    0x2CB39: 'shén',
+    0x2CB3B: 'lú',
+    0x2CB3F: 'zhāo',
+    0x2CB41: 'mǔ',
+    0x2CB4A: 'dù',
+    0x2CB4E: 'hóng',
+    0x2CB5A: 'chún',
+    0x2CB5B: 'bō',
+    0x2CB64: 'hóu',
+    0x2CB69: 'wēng',
+    0x2CB6C: 'wèi,huì',
+    0x2CB6F: 'piě',
+    0x2CB73: 'xǐ',
+    0x2CB76: 'hēi',
+    0x2CB78: 'lín',
+    0x2CB7C: 'suì',
+    0x2CBB1: 'yīn',
+    0x2CBBF: 'qí,gài',
+    0x2CBC0: 'jī',
+    0x2CBCE: 'tuí',
+    0x2CC56: 'dí',
+    0x2CC5F: 'wěi',
+    0x2CCF5: 'pī',
+    0x2CCF6: 'jiōng',
+    0x2CCFD: 'shēn',
+    0x2CCFF: 'tú',
+    0x2CD02: 'fēi',
+    0x2CD03: 'huō',
+    0x2CD0A: 'lín',
+    0x2CD8B: 'jū',
+    0x2CD8D: 'tuó',
+    0x2CD8F: 'wéi',
+    0x2CD90: 'zhào',
+    0x2CD9F: 'là',
+    0x2CDA0: 'liàn',
+    0x2CDA8: 'jì',
+    0x2CDAD: 'jì',
+    0x2CDAE: 'xǐ',
+    0x2CDD5: 'bū,bǔ',
+    0x2CE18: 'yǎn',
+    0x2CE1A: 'yuè',
+    0x2CE23: 'xiān',
+    0x2CE26: 'zhuó',
+    0x2CE2A: 'fán',
+    0x2CE7C: 'xiè',
+    0x2CE88: 'yǐ',
+    0x2CE93: 'chǔ',
+    0x30EDD: 'biáng',
+    0x30EDE: 'biáng',
+}
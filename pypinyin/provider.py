@@ -0,0 +1,315 @@
+# -*- coding: utf-8 -*-
+"""每个转换器实例独立的拼音库。
+
+:py:func:`~pypinyin.load_single_dict` 和
+:py:func:`~pypinyin.load_phrases_dict` 修改的是整个进程共享的拼音库和分词器。
+如果同一个进程中的不同用户需要不同的自定义拼音，可以为每个用户创建一个
+:py:class:`DictProvider` ：
+
+* 内置（共享）的拼音库只读，不会被复制，所有 provider 共享同一份数据
+* 每个 provider 自定义的拼音保存在自己的覆盖层中，互不影响
+* 每个 provider 有自己的分词器，载入自定义词语时只需要训练新增的词语
+
+需要在其他线程正在转换时更新拼音库的话，可以使用
+:py:class:`SnapshotProvider` ，在一个副本中完成修改后再一次性替换为新的快照。
+
+.. code-block:: python
+
+    >>> from pypinyin.core import Pinyin
+    >>> from pypinyin.provider import DictProvider
+    >>> provider = DictProvider()
+    >>> provider.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+    >>> Pinyin(provider=provider).pinyin('朝阳')
+    [['cháo'], ['yáng']]
+"""
+from __future__ import unicode_literals
+
+from contextlib import contextmanager
+import threading
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
+
+from pypinyin.constants import PHRASES_DICT, PINYIN_DICT
+from pypinyin.seg import mmseg
+from pypinyin.seg.simpleseg import _cut_tokens, simple_seg_tokens
+from pypinyin.syllables import syllable_table
+from pypinyin.utils import _replace_tone2_style_dict_to_default
+
+
+def _update_single_dict(target, pinyin_dict, style):
+    """把用户自定义的单字拼音库写入 ``target``"""
+    if style == 'tone2':
+        for k, v in pinyin_dict.items():
+            target[k] = _replace_tone2_style_dict_to_default(v)
+    else:
+        target.update(pinyin_dict)
+
+
+def _update_phrases_dict(target, phrases_dict, style):
+    """把用户自定义的词语拼音库写入 ``target``"""
+    for k, value in phrases_dict.items():
+        if style == 'tone2':
+            value = [
+                list(map(_replace_tone2_style_dict_to_default, pys))
+                for pys in value
+            ]
+        target[k] = syllable_table.phrase(value)
+
+
+class OverlayDict(MutableMapping):
+    """在只读的 ``base`` 上叠加一层覆盖层的 dict。
+
+    写入和删除只会修改覆盖层，不会修改也不会复制 ``base`` 。
+
+    :param base: 只读的基础 dict
+    """
+
+    def __init__(self, base):
+        self._base = base
+        self._overlay = {}
+        # 被删除的 base 中的 key
+        self._deleted = set()
+
+    @property
+    def loaded(self):
+        """覆盖层不为空或者 ``base`` 已经加载了数据"""
+        return bool(self._overlay) or getattr(self._base, 'loaded', True)
+
+    def __getitem__(self, key):
+        if key in self._overlay:
+            return self._overlay[key]
+        if key not in self._deleted:
+            return self._base[key]
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        value = self._overlay.get(key)
+        if value is not None:
+            return value
+        if key in self._deleted or key in self._overlay:
+            return default
+        return self._base.get(key, default)
+
+    def __contains__(self, key):
+        if key in self._overlay:
+            return True
+        return key not in self._deleted and key in self._base
+
+    def __setitem__(self, key, value):
+        self._overlay[key] = value
+        self._deleted.discard(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._overlay.pop(key, None)
+        if key in self._base:
+            self._deleted.add(key)
+
+    def revert(self, key):
+        """撤销对 ``key`` 的修改和删除，恢复为 ``base`` 中的值"""
+        self._overlay.pop(key, None)
+        self._deleted.discard(key)
+
+    def __iter__(self):
+        for key in self._overlay:
+            yield key
+        for key in self._base:
+            if key not in self._overlay and key not in self._deleted:
+                yield key
+
+    def __bool__(self):
+        if self._overlay:
+            return True
+        return len(self._base) > len(self._deleted)
+
+    __nonzero__ = __bool__
+
+    def __len__(self):
+        # _deleted 中的 key 都在 base 中并且不在覆盖层中
+        added = sum(1 for key in self._overlay if key not in self._base)
+        return len(self._base) - len(self._deleted) + added
+
+    def copy(self):
+        """复制覆盖层，新的 dict 与当前 dict 共享同一个 ``base``"""
+        new = self.__class__(self._base)
+        new._overlay = self._overlay.copy()
+        new._deleted = self._deleted.copy()
+        return new
+
+    def __repr__(self):
+        return '<{0} ({1} overlay items)>'.format(
+            self.__class__.__name__, len(self._overlay))
+
+
+class DictProvider(object):
+    """提供转换时使用的单字拼音库、词语拼音库和分词器。
+
+    可以传给 :py:class:`~pypinyin.core.Pinyin` 或
+    :py:class:`~pypinyin.converter.DefaultConverter` 的 ``provider`` 参数。
+
+    :param pinyin_dict: 只读的基础单字拼音库，默认为内置的单字拼音库
+    :param phrases_dict: 只读的基础词语拼音库，默认为内置的词语拼音库
+    :param seg: 使用 ``phrases_dict`` 训练过的分词器，
+                默认为内置的分词器 :py:data:`pypinyin.seg.mmseg.seg`
+    :type seg: pypinyin.seg.mmseg.Seg
+
+    :py:class:`DictProvider` 的方法会直接修改数据，其他线程正在使用这个
+    provider 转换时请使用 :py:class:`SnapshotProvider` 。
+    """
+
+    #: 快照的版本号，详见 :py:class:`SnapshotProvider`
+    version = 0
+    #: 每次修改拼音库后加一，只让使用这个 provider 的转换结果缓存失效
+    generation = 0
+
+    def __init__(self, pinyin_dict=None, phrases_dict=None, seg=None):
+        #: 单字拼音库
+        self.pinyin_dict = OverlayDict(
+            PINYIN_DICT if pinyin_dict is None else pinyin_dict)
+        #: 词语拼音库
+        self.phrases_dict = OverlayDict(
+            PHRASES_DICT if phrases_dict is None else phrases_dict)
+        #: 分词器
+        self.segmenter = mmseg.OverlaySeg(seg or mmseg.seg)
+
+    def snapshot(self):
+        """返回转换时使用的 provider ，也就是自己"""
+        return self
+
+    def copy(self):
+        """返回一个副本，副本与当前 provider 共享基础拼音库和分词器，
+        只会复制自定义的拼音和词语
+        """
+        new = self.__class__.__new__(self.__class__)
+        new.pinyin_dict = self.pinyin_dict.copy()
+        new.phrases_dict = self.phrases_dict.copy()
+        new.segmenter = self.segmenter.copy()
+        new.version = self.version
+        new.generation = self.generation
+        return new
+
+    def load_single_dict(self, pinyin_dict, style='default'):
+        """载入自定义的单字拼音库，只对当前 provider 生效。
+
+        参数详见 :py:func:`~pypinyin.load_single_dict`
+        """
+        _update_single_dict(self.pinyin_dict, pinyin_dict, style)
+        self.generation += 1
+
+    def load_phrases_dict(self, phrases_dict, style='default'):
+        """载入自定义的词语拼音库，只对当前 provider 生效。
+
+        参数详见 :py:func:`~pypinyin.load_phrases_dict`
+        """
+        _update_phrases_dict(self.phrases_dict, phrases_dict, style)
+        self.segmenter.train(phrases_dict.keys())
+        self.generation += 1
+
+    def remove_phrases(self, phrases):
+        """删除当前 provider 载入的自定义词语，同时从分词器中删除这些词语。
+
+        基础词语库中的词语也会被隐藏，转换时按单字处理。
+
+        :param phrases: 词语列表
+        """
+        phrases = list(phrases)
+        for phrase in phrases:
+            if phrase in self.phrases_dict:
+                del self.phrases_dict[phrase]
+        self.segmenter.remove(phrases)
+        self.generation += 1
+
+    def seg_tokens(self, hans):
+        """使用当前 provider 的分词器分词，
+        返回值详见 :py:func:`~pypinyin.seg.simpleseg.seg_tokens`
+        """
+        return _cut_tokens(simple_seg_tokens(hans), self.segmenter,
+                           self.phrases_dict)
+
+    def seg(self, hans):
+        """使用当前 provider 的分词器分词，返回词语列表"""
+        return [word for word, _ in self.seg_tokens(hans)]
+
+
+class SnapshotProvider(object):
+    """使用带版本号的快照保存拼音库的 provider 。
+
+    转换使用的快照（一个 :py:class:`DictProvider` ）发布后不会再被修改。
+    更新拼音库时先在快照的副本中完成所有修改，
+    然后通过一次引用赋值发布为新的快照：
+
+    * 转换时不需要加锁，开始转换时获取一次快照，整个转换过程都使用这个快照，
+      不会看到只完成了一半的修改（比如分词器中有这个词语，
+      但是词语拼音库中还没有）
+    * 多个更新会按顺序执行，每次更新的版本号加一
+    * 更新过程中出现异常时不会发布新的快照
+
+    :param provider: 初始的快照，默认为新的 :py:class:`DictProvider`
+    :type provider: DictProvider
+
+    Usage::
+
+      >>> from pypinyin.core import Pinyin
+      >>> from pypinyin.provider import SnapshotProvider
+      >>> provider = SnapshotProvider()
+      >>> pinyin = Pinyin(provider=provider)
+      >>> with provider.update() as draft:
+      ...     draft.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+      >>> provider.version
+      1
+      >>> pinyin.pinyin('朝阳')
+      [['cháo'], ['yáng']]
+    """
+
+    def __init__(self, provider=None):
+        self._current = provider if provider is not None else DictProvider()
+        # 只用于让更新按顺序执行，转换时不需要加锁
+        self._lock = threading.Lock()
+
+    def snapshot(self):
+        """返回当前的快照，调用方不能修改返回的快照
+
+        :rtype: DictProvider
+        """
+        return self._current
+
+    @property
+    def version(self):
+        """当前快照的版本号"""
+        return self._current.version
+
+    @property
+    def pinyin_dict(self):
+        """当前快照的单字拼音库"""
+        return self._current.pinyin_dict
+
+    @property
+    def phrases_dict(self):
+        """当前快照的词语拼音库"""
+        return self._current.phrases_dict
+
+    @contextmanager
+    def update(self):
+        """更新拼音库的事务，返回当前快照的副本。
+
+        在副本上的修改会在 ``with`` 语句结束时发布为新的快照，
+        出现异常时会丢弃这些修改。
+        """
+        with self._lock:
+            draft = self._current.copy()
+            draft.version = self._current.version + 1
+            yield draft
+            # 一次引用赋值，正在转换的线程仍然使用旧的快照
+            self._current = draft
+
+    def seg_tokens(self, hans):
+        """使用当前快照分词，返回值详见 :py:meth:`DictProvider.seg_tokens`"""
+        return self._current.seg_tokens(hans)
+
+    def seg(self, hans):
+        """使用当前快照分词，返回词语列表"""
+        return self._current.seg(hans)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import threading
+from typing import Any
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import MutableMapping
+from typing import Optional
+from typing import Set
+from typing import Text
+from typing import Union
+
+from pypinyin.seg.mmseg import OverlaySeg, Seg
+from pypinyin.seg.simpleseg import TToken
+
+THans = Union[List[Text], Text]
+
+
+def _update_single_dict(target: MutableMapping[int, Text],
+                        pinyin_dict: Dict[int, Text],
+                        style: str) -> None: ...
+
+
+def _update_phrases_dict(target: MutableMapping[Text, Any],
+                         phrases_dict: Dict[Text, List[List[Text]]],
+                         style: str) -> None: ...
+
+
+class OverlayDict(MutableMapping[Any, Any]):
+    def __init__(self, base: Mapping[Any, Any]) -> None:
+        self._base = ...  # type: Mapping[Any, Any]
+        self._overlay = ...  # type: Dict[Any, Any]
+        self._deleted = ...  # type: Set[Any]
+        ...
+
+    @property
+    def loaded(self) -> bool: ...
+
+    def __getitem__(self, key: Any) -> Any: ...
+
+    def get(self, key: Any, default: Any = ...) -> Any: ...
+
+    def __contains__(self, key: object) -> bool: ...
+
+    def __setitem__(self, key: Any, value: Any) -> None: ...
+
+    def __delitem__(self, key: Any) -> None: ...
+
+    def revert(self, key: Any) -> None: ...
+
+    def __iter__(self) -> Iterator[Any]: ...
+
+    def __bool__(self) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+    def copy(self) -> OverlayDict: ...
+
+
+class DictProvider(object):
+    version = ...  # type: int
+    generation = ...  # type: int
+
+    def __init__(self, pinyin_dict: Optional[Mapping[int, Text]] = ...,
+                 phrases_dict: Optional[Mapping[Text, Any]] = ...,
+                 seg: Optional[Seg] = ...) -> None:
+        self.pinyin_dict = ...  # type: OverlayDict
+        self.phrases_dict = ...  # type: OverlayDict
+        self.segmenter = ...  # type: OverlaySeg
+        ...
+
+    def snapshot(self) -> DictProvider: ...
+
+    def copy(self) -> DictProvider: ...
+
+    def load_single_dict(self, pinyin_dict: Dict[int, Text],
+                         style: str = ...) -> None: ...
+
+    def load_phrases_dict(self, phrases_dict: Dict[Text, List[List[Text]]],
+                          style: str = ...) -> None: ...
+
+    def remove_phrases(self, phrases: Iterable[Text]) -> None: ...
+
+    def seg_tokens(self, hans: THans) -> List[TToken]: ...
+
+    def seg(self, hans: THans) -> List[Text]: ...
+
+
+class SnapshotProvider(object):
+    def __init__(self, provider: Optional[DictProvider] = ...) -> None:
+        self._current = ...  # type: DictProvider
+        self._lock = ...  # type: threading.Lock
+        ...
+
+    def snapshot(self) -> DictProvider: ...
+
+    @property
+    def version(self) -> int: ...
+
+    @property
+    def pinyin_dict(self) -> OverlayDict: ...
+
+    @property
+    def phrases_dict(self) -> OverlayDict: ...
+
+    def update(self) -> ContextManager[DictProvider]: ...
+
+    def seg_tokens(self, hans: THans) -> List[TToken]: ...
+
+    def seg(self, hans: THans) -> List[Text]: ...
@@ -3,6 +3,8 @@
 
 from __future__ import unicode_literals
 from argparse import ArgumentParser
+import codecs
+from itertools import chain
 import logging
 import sys
 
@@ -48,6 +50,30 @@ class NullWriter(object):
         pass
 
 
+class StripReader(object):
+    """去掉开头和结尾空白字符的只读文件对象，用于逐块读取标准输入。"""
+    def __init__(self, fp):
+        self._fp = fp
+        self._started = False
+        self._pending = ''  # 暂存的空白字符，后面还有内容时才返回
+
+    def read(self, size):
+        while True:
+            chunk = self._fp.read(size)
+            if not chunk:
+                return ''
+            if not self._started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                self._started = True
+            chunk = self._pending + chunk
+            data = chunk.rstrip()
+            self._pending = chunk[len(data):]
+            if data:
+                return data
+
+
 def get_parser():
     parser = ArgumentParser(description='convert chinese to pinyin.')
     parser.add_argument('-V', '--version', action='version',
@@ -77,27 +103,49 @@ def get_parser():
     parser.add_argument('-m', '--heteronym', help='enable heteronym',
                         action='store_true')
     # 要查询的汉字
-    parser.add_argument('hans', help='chinese string')
+    parser.add_argument('hans', nargs='?',
+                        help='chinese string (default: read from stdin)')
     return parser
 
 
+def stream_stdin(func, style, kwargs, out):
+    """逐块读取标准输入并输出转换结果，不需要把所有输入读到内存中"""
+    if PY2:
+        stdin = codecs.getreader(sys.stdin.encoding or 'utf-8')(sys.stdin)
+    else:
+        stdin = sys.stdin
+    heteronym = kwargs['heteronym']
+    errors = kwargs['errors']
+    result = pypinyin.iter_pinyin(StripReader(stdin), style=style,
+                                  heteronym=heteronym, errors=errors)
+
+    if func == 'slug':
+        items = chain.from_iterable(result)
+        separator = kwargs['separator']
+    else:
+        items = (','.join(s) for s in result)
+        separator = ' '
+    for index, item in enumerate(items):
+        if index:
+            out.write(separator)
+        out.write(item)
+    out.write('\n')
+
+
 def main():
     # 禁用除 CRITICAL 外的日志消息
     logging.disable(logging.CRITICAL)
 
-    # read hans from stdin
-    if not sys.stdin.isatty():
-        pipe_data = sys.stdin.read().strip()
-    else:
-        pipe_data = ''
-    args = sys.argv[1:]
-    if pipe_data:
-        args.append(pipe_data)
-
     # 获取命令行选项和参数
     parser = get_parser()
-    options = parser.parse_args(args)
-    if PY2:
+    options = parser.parse_args(sys.argv[1:])
+    # 没有指定要查询的汉字时从标准输入中读取
+    read_stdin = options.hans is None
+    if read_stdin and sys.stdin.isatty():
+        parser.error('the following arguments are required: hans')
+    if read_stdin:
+        hans = None
+    elif PY2:
         hans = options.hans.decode(sys.stdin.encoding or 'utf-8')
     else:
         hans = options.hans
@@ -120,7 +168,16 @@ def main():
     # 重设标准输出流和标准错误流
     # 不输出任何字符，防止污染命令行命令的输出结果
     # 其实主要是为了干掉 jieba 内的 print 语句 ;)
+    out = sys.stdout
     sys.stdout = sys.stderr = NullWriter()
+    if read_stdin:
+        try:
+            stream_stdin(options.func, style, kwargs, out)
+        finally:
+            sys.stdout = sys.__stdout__
+            sys.stderr = sys.__stderr__
+        return
+
     result = func(hans, style=style, **kwargs)
     # 恢复默认
     sys.stdout = sys.__stdout__
@@ -1,12 +1,22 @@
 from argparse import ArgumentParser
-from typing import Union, Text, ByteString
+from typing import Any, Dict, IO, Union, Text, ByteString
 
 
 class NullWriter(object):
     def write(self, string: Union[Text, ByteString]) -> None: ...
 
 
+class StripReader(object):
+    def __init__(self, fp: IO[Text]) -> None: ...
+
+    def read(self, size: int) -> Text: ...
+
+
 def get_parser() -> ArgumentParser: ...
 
 
+def stream_stdin(func: str, style: Any, kwargs: Dict[str, Any],
+                 out: IO[Text]) -> None: ...
+
+
 def main() -> None: ...
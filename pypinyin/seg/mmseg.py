@@ -1,5 +1,10 @@
 # -*- coding: utf-8 -*-
 """最大正向匹配分词"""
+from array import array
+from bisect import bisect_left
+import threading
+
+from pypinyin import state
 from pypinyin.constants import PHRASES_DICT
 
 
@@ -18,52 +23,44 @@ class Seg(object):
     def cut(self, text):
         """分词
 
+        使用下标扫描文本，不会复制剩余的文本。每一步调用一次
+        :py:meth:`PrefixSet.match` （最多检查 ``max_len`` 个字符，
+        ``max_len`` 为最长词语的长度）并且至少前进一个字符，
+        所以总的时间复杂度是 ``O(len(text) * max_len)`` 。
+
         :param text: 待分词的文本
         :yield: 单个词语
         """
-        remain = text
-        while remain:
-            matched = ''
-            # 一次加一个字的匹配
-            for index in range(len(remain)):
-                word = remain[:index + 1]
-                if word in self._prefix_set:
-                    matched = word
-                else:
-                    # 前面的字符串是个词语
-                    if (matched and (
-                        (not self._no_non_phrases) or
-                        matched in PHRASES_DICT
-                    )
-                    ):
-                        yield matched
-                        matched = ''
-                        remain = remain[index:]
-                    else:  # 前面为空或不是真正的词语
-                        # 严格按照词语分词的情况下，不是词语的词拆分为单个汉字
-                        # 先返回第一个字，后面的重新参与分词，
-                        # 处理前缀匹配导致无法识别输入尾部的词语，
-                        # 支持简单的逆向匹配分词:
-                        #   已有词语：金融寡头 行业
-                        #   输入：金融行业
-                        #   输出：金 融 行业
-                        if self._no_non_phrases:
-                            yield word[0]
-                            remain = remain[index + 2 - len(word):]
-                        else:
-                            yield word
-                            remain = remain[index + 1:]
-                    # 有结果了，剩余的重新开始匹配
-                    matched = ''
-                    break
-            else:  # 整个文本就是一个词语，或者不包含任何词语
-                if self._no_non_phrases and remain not in PHRASES_DICT:
-                    for x in remain:
+        match = _matcher(self._prefix_set, text)
+        no_non_phrases = self._no_non_phrases
+        pos = 0
+        end = len(text)
+        while pos < end:
+            # 一次加一个字的匹配，找到最长的前缀
+            length, is_word = match(text, pos)
+            if pos + length == end:  # 剩下的文本就是一个词语，或者不包含任何词语
+                if no_non_phrases and not is_word:
+                    for x in text[pos:]:
                         yield x
                 else:
-                    yield remain
+                    yield text[pos:]
                 break
 
+            # 前面的字符串是个词语
+            if length and ((not no_non_phrases) or is_word):
+                yield text[pos:pos + length]
+                pos += length
+            else:  # 前面为空或不是真正的词语
+                # 严格按照词语分词的情况下，不是词语的词拆分为单个汉字
+                # 先返回第一个字，后面的重新参与分词，
+                # 处理前缀匹配导致无法识别输入尾部的词语，
+                # 支持简单的逆向匹配分词:
+                #   已有词语：金融寡头 行业
+                #   输入：金融行业
+                #   输出：金 融 行业
+                yield text[pos]
+                pos += 1
+
     def train(self, words):
         """训练分词器
 
@@ -71,10 +68,110 @@ class Seg(object):
         """
         self._prefix_set.train(words)
 
+    def remove(self, words):
+        """删除词语，不存在的词语会被忽略
+
+        :param words: 词语列表
+        """
+        self._prefix_set.remove(words)
+
+    def replace(self, old_words, new_words):
+        """把 ``old_words`` 中的词语替换为 ``new_words`` 中的词语
+
+        :param old_words: 要删除的词语列表
+        :param new_words: 要增加的词语列表
+        """
+        self.remove(old_words)
+        self.train(new_words)
+
+    @property
+    def size(self):
+        """词语的个数，可以用于监控自定义词语的增长"""
+        return len(self._prefix_set)
+
+    @property
+    def max_len(self):
+        """最长词语的长度。
+
+        分词时在位置 ``pos`` 的切分结果只跟 ``text[pos:pos + max_len]``
+        有关（到达文本末尾时除外）。
+        """
+        return self._prefix_set.max_len
+
+
+def _matcher(prefix_set, text):
+    """返回用于在 ``text`` 中匹配的 ``match(text, start)`` 函数，
+    没有 ``matcher`` 方法的前缀树直接使用 ``match`` 方法
+    """
+    matcher = getattr(prefix_set, 'matcher', None)
+    if matcher is None:
+        return prefix_set.match
+    return matcher(text)
+
+
+_ARRAYS = ('first', 'count', 'cap', 'refs', 'labels', 'children', 'free')
+
+
+def _to_bytes(data):
+    if hasattr(data, 'tobytes'):
+        return data.tobytes()
+    return data.tostring()  # pragma: no cover (Python 2)
+
+
+def _from_bytes(data):
+    result = array('I')
+    if hasattr(result, 'frombytes'):
+        result.frombytes(data)
+    else:  # pragma: no cover (Python 2)
+        result.fromstring(data)
+    return result
+
 
 class PrefixSet(object):
+    """保存词语及其所有前缀的前缀树（trie）。
+
+    所有节点保存在几个紧凑的数组中，而不是每个前缀一个字符串对象：
+
+    * 节点 ``n`` 的子节点连续保存在 ``_labels`` 和 ``_children`` 的
+      ``[_first[n], _first[n] + _count[n])`` 区间内，按字符的码位排序，
+      查找子节点时使用二分查找
+    * ``_words[n]`` 标识从根节点到节点 ``n`` 的路径是否是一个训练过的词语
+    * ``_refs[n]`` 是经过节点 ``n`` （包括在节点 ``n`` 结束）的词语个数，
+      删除词语后引用数为 0 的节点会被删除，节点编号放入 ``_free`` 中供以后复用
+
+    根节点的编号是 0，它不会是任何节点的子节点，所以 0 也用来表示找不到子节点。
+    根节点的子节点非常多而且每次匹配都会用到，所以单独用一个 dict 保存。
+
+    增加和删除一个词语的时间复杂度只与这个词语的长度有关。
+    """
+
     def __init__(self):
-        self._set = set()
+        self._root = {}
+        self._first = array('I', [0])
+        self._count = array('I', [0])
+        self._cap = array('I', [0])
+        self._words = bytearray(1)
+        self._refs = array('I', [0])
+        self._labels = array('I')
+        self._children = array('I')
+        # 被删除的节点的编号
+        self._free = array('I')
+        # 因扩容或删除节点而被废弃的子节点区间的总长度
+        self._garbage = 0
+        # 每种长度的词语的个数，用于删除词语后更新 max_len
+        self._lengths = {}
+        self._size = 0
+        #: 最长词语的长度
+        self.max_len = 0
+
+    def __len__(self):
+        """词语的个数"""
+        return self._size
+
+    @property
+    def nodes(self):
+        """前缀树中的节点数（不包括根节点），即不同前缀的个数"""
+        return len(self._words) - 1 - len(self._free)
 
     def train(self, word_s):
         """更新 prefix set
@@ -84,16 +181,431 @@ class PrefixSet(object):
         :return: None
         """
         for word in word_s:
-            # 把词语的每个前缀更新到 prefix_set 中
-            for index in range(len(word)):
-                self._set.add(word[:index + 1])
+            if word and self._add(word):
+                n = len(word)
+                self._lengths[n] = self._lengths.get(n, 0) + 1
+                if n > self.max_len:
+                    self.max_len = n
+        self._maybe_compact()
+
+    def remove(self, word_s):
+        """删除词语，不再被任何词语使用的前缀也会被删除。
+        不存在的词语会被忽略。
+
+        :param word_s: 词语列表
+        :type word_s: iterable
+        :return: None
+        """
+        for word in word_s:
+            if word and self._remove(word):
+                n = len(word)
+                self._lengths[n] -= 1
+                if not self._lengths[n]:
+                    del self._lengths[n]
+                    if n == self.max_len:
+                        self.max_len = max(self._lengths or [0])
+        self._maybe_compact()
+
+    def clear(self):
+        """删除所有词语"""
+        self.__init__()
+
+    def copy(self):
+        """返回一个副本，修改副本不会影响当前前缀树"""
+        new = self.__class__.__new__(self.__class__)
+        new.__dict__.update(self.__dict__)
+        new._root = self._root.copy()
+        for name in ('_first', '_count', '_cap', '_words', '_refs',
+                     '_labels', '_children', '_free'):
+            setattr(new, name, getattr(self, name)[:])
+        new._lengths = self._lengths.copy()
+        return new
+
+    def _dump_state(self):
+        """返回可以被 ``marshal`` 保存的数据，用于 :mod:`pypinyin.state`"""
+        prefix_set = self.copy()
+        prefix_set._compact()
+        data = {
+            'root': prefix_set._root,
+            'lengths': prefix_set._lengths,
+            'size': prefix_set._size,
+            'max_len': prefix_set.max_len,
+            'words': bytes(prefix_set._words),
+        }
+        for name in _ARRAYS:
+            data[name] = _to_bytes(getattr(prefix_set, '_' + name))
+        return data
+
+    def _load_state(self, data):
+        """使用 :py:meth:`_dump_state` 返回的数据原地替换当前前缀树"""
+        for name in _ARRAYS:
+            setattr(self, '_' + name, _from_bytes(data[name]))
+        self._root = data['root']
+        self._words = bytearray(data['words'])
+        self._lengths = data['lengths']
+        self._size = data['size']
+        self._garbage = 0
+        self.max_len = data['max_len']
+
+    def _maybe_compact(self):
+        if self._garbage > len(self._words) // 4:
+            self._compact()
+
+    def match(self, text, start=0):
+        """找到 ``text[start:]`` 在前缀树中最长的前缀。
+
+        :param text: 待匹配的文本
+        :param start: 开始匹配的位置
+        :return: ``(length, is_word)`` ， ``length`` 为最长前缀的长度，
+                 ``is_word`` 表示这个前缀是否是一个训练过的词语
+        :rtype: tuple
+        """
+        end = len(text)
+        if start >= end:
+            return 0, False
+        node = self._root.get(text[start])
+        if not node:
+            return 0, False
+
+        first = self._first
+        count = self._count
+        labels = self._labels
+        children = self._children
+        pos = start + 1
+        while pos < end:
+            code = ord(text[pos])
+            lo = first[node]
+            hi = lo + count[node]
+            index = bisect_left(labels, code, lo, hi)
+            if index == hi or labels[index] != code:
+                break
+            node = children[index]
+            pos += 1
+        return pos - start, self._words[node] == 1
+
+    def matcher(self, text):
+        """返回在 ``text`` 中匹配使用的函数，参数和返回值与 :py:meth:`match` 相同。
+
+        :py:class:`Seg` 每次分词前调用一次，需要查询外部存储的前缀树
+        （比如 :py:class:`~pypinyin.sqlite_dict.SqlitePrefixSet` ）
+        可以在这里一次查询 ``text`` 中所有可能用到的前缀。
+        """
+        return self.match
 
     def __contains__(self, key):
-        return key in self._set
+        return bool(key) and self.match(key)[0] == len(key)
+
+    def _child(self, node, code):
+        lo = self._first[node]
+        hi = lo + self._count[node]
+        index = bisect_left(self._labels, code, lo, hi)
+        if index < hi and self._labels[index] == code:
+            return self._children[index], index
+        return 0, index
+
+    def _path(self, word):
+        """返回 ``word`` 经过的节点列表，不存在时返回 ``None``"""
+        node = self._root.get(word[0])
+        if not node:
+            return None
+        path = [node]
+        for char in word[1:]:
+            node, _ = self._child(node, ord(char))
+            if not node:
+                return None
+            path.append(node)
+        return path
+
+    def _add(self, word):
+        """增加词语，返回是否是新的词语"""
+        refs = self._refs
+        node = self._root.get(word[0])
+        if not node:
+            node = self._root[word[0]] = self._new_node()
+        refs[node] += 1
+        for char in word[1:]:
+            code = ord(char)
+            child, index = self._child(node, code)
+            if not child:
+                child = self._new_node()
+                self._insert_child(node, index, code, child)
+            node = child
+            refs[node] += 1
+        if self._words[node]:
+            # 已经存在的词语，恢复引用数
+            for node in self._path(word):
+                refs[node] -= 1
+            return False
+        self._words[node] = 1
+        self._size += 1
+        return True
+
+    def _remove(self, word):
+        """删除词语，返回词语是否存在"""
+        path = self._path(word)
+        if path is None or not self._words[path[-1]]:
+            return False
+        self._words[path[-1]] = 0
+        refs = self._refs
+        for node in path:
+            refs[node] -= 1
+        self._size -= 1
+
+        # 引用数从根节点向下递减，第一个引用数为 0 的节点及其后面的节点都要删除
+        for depth, node in enumerate(path):
+            if not refs[node]:
+                break
+        else:
+            return True
+        if depth == 0:
+            del self._root[word[0]]
+        else:
+            self._delete_child(path[depth - 1], ord(word[depth]))
+        for node in path[depth:]:
+            self._free_node(node)
+        return True
+
+    def _new_node(self):
+        if self._free:
+            return self._free.pop()
+        self._first.append(0)
+        self._count.append(0)
+        self._cap.append(0)
+        self._words.append(0)
+        self._refs.append(0)
+        return len(self._words) - 1
+
+    def _free_node(self, node):
+        self._garbage += self._cap[node]
+        self._first[node] = 0
+        self._count[node] = 0
+        self._cap[node] = 0
+        self._free.append(node)
+
+    def _delete_child(self, node, code):
+        labels = self._labels
+        children = self._children
+        lo = self._first[node]
+        hi = lo + self._count[node]
+        index = bisect_left(labels, code, lo, hi)
+        labels[index:hi - 1] = labels[index + 1:hi]
+        children[index:hi - 1] = children[index + 1:hi]
+        self._count[node] -= 1
+
+    def _insert_child(self, node, index, code, child):
+        labels = self._labels
+        children = self._children
+        lo = self._first[node]
+        count = self._count[node]
+        hi = lo + count
+        if count < self._cap[node]:
+            # 还有空间，原地后移
+            labels[index + 1:hi + 1] = labels[index:hi]
+            children[index + 1:hi + 1] = children[index:hi]
+            labels[index] = code
+            children[index] = child
+        else:
+            # 没有空间了，把子节点区间搬到数组末尾并扩容
+            cap = max(2, count * 2)
+            padding = array('I', [0]) * (cap - count - 1)
+            new_first = len(labels)
+            new_labels = (labels[lo:index] + array('I', [code]) +
+                          labels[index:hi] + padding)
+            new_children = (children[lo:index] + array('I', [child]) +
+                            children[index:hi] + padding)
+            labels.extend(new_labels)
+            children.extend(new_children)
+            self._garbage += self._cap[node]
+            self._first[node] = new_first
+            self._cap[node] = cap
+        self._count[node] = count + 1
+
+    def _compact(self):
+        """去掉扩容产生的空闲空间"""
+        labels = array('I')
+        children = array('I')
+        first = self._first
+        count = self._count
+        for node in range(len(first)):
+            lo = first[node]
+            hi = lo + count[node]
+            first[node] = len(labels)
+            labels.extend(self._labels[lo:hi])
+            children.extend(self._children[lo:hi])
+        self._labels = labels
+        self._children = children
+        self._cap = array('I', count)
+        self._garbage = 0
+
+
+class _LazySeg(Seg):
+    """第一次分词时才使用内置词库训练的分词器。
+
+    训练过程是线程安全的，只会训练一次。
+    """
+
+    def __init__(self, prefix_set, no_non_phrases=False):
+        super(_LazySeg, self).__init__(prefix_set,
+                                       no_non_phrases=no_non_phrases)
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        """是否已经使用内置词库训练过"""
+        return self._loaded
+
+    def load(self):
+        """使用内置词库训练分词器（如果还没有训练过的话）"""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self._prefix_set.train(PHRASES_DICT.keys())
+                self._loaded = True
+
+    def reset(self):
+        """删除所有词语，下一次分词时重新使用内置词库训练"""
+        with self._lock:
+            self._prefix_set.clear()
+            self._loaded = False
+
+    def _load_state(self, data):
+        """使用 :py:meth:`PrefixSet._dump_state` 返回的数据替换前缀树，
+        之后不会再使用内置词库训练
+        """
+        with self._lock:
+            self._prefix_set._load_state(data)
+            self._loaded = True
+
+    def cut(self, text):
+        self.load()
+        return super(_LazySeg, self).cut(text)
+
+    def train(self, words):
+        self.load()
+        super(_LazySeg, self).train(words)
+
+    def remove(self, words):
+        self.load()
+        super(_LazySeg, self).remove(words)
+
+    @property
+    def size(self):
+        self.load()
+        return len(self._prefix_set)
+
+    @property
+    def max_len(self):
+        self.load()
+        return self._prefix_set.max_len
+
+
+def _merge(base_result, own_result):
+    """合并两个前缀树的匹配结果"""
+    length, is_word = base_result
+    own_length, own_is_word = own_result
+    # 合并后的最长前缀是两个前缀中较长的那个，长度相同时是同一个前缀
+    if own_length > length:
+        return own_result
+    if own_length == length:
+        return length, is_word or own_is_word
+    return base_result
+
+
+class OverlayPrefixSet(object):
+    """在只读的前缀树 ``base`` 上叠加自己的前缀树。
+
+    训练时只修改自己的前缀树，匹配结果与把两个前缀树中的词语
+    训练到同一个前缀树中时一致。
+
+    :type base: PrefixSet
+    """
+
+    def __init__(self, base):
+        self._base = base
+        self._own = PrefixSet()
+
+    @property
+    def max_len(self):
+        """最长词语的长度"""
+        return max(self._base.max_len, self._own.max_len)
+
+    def __len__(self):
+        """自己训练的词语的个数"""
+        return len(self._own)
+
+    @property
+    def nodes(self):
+        """自己的前缀树中的节点数"""
+        return self._own.nodes
+
+    def train(self, word_s):
+        """只更新自己的前缀树，参数详见 :py:meth:`PrefixSet.train`"""
+        self._own.train(word_s)
+
+    def remove(self, word_s):
+        """只从自己的前缀树中删除词语，参数详见 :py:meth:`PrefixSet.remove`"""
+        self._own.remove(word_s)
+
+    def match(self, text, start=0):
+        """参数和返回值详见 :py:meth:`PrefixSet.match`"""
+        return _merge(self._base.match(text, start),
+                      self._own.match(text, start))
+
+    def matcher(self, text):
+        """参数和返回值详见 :py:meth:`PrefixSet.matcher`"""
+        base_match = _matcher(self._base, text)
+        own_match = _matcher(self._own, text)
+
+        def match(text, start=0):
+            return _merge(base_match(text, start), own_match(text, start))
+        return match
+
+    def __contains__(self, key):
+        return key in self._own or key in self._base
+
+
+class OverlaySeg(Seg):
+    """在共享的分词器 ``base`` 上叠加自己的词语的分词器。
+
+    训练时只把词语加入自己的前缀树（训练只需要处理新增的词语），
+    不会修改 ``base`` ，也不会复制 ``base`` 的数据。
+
+    :type base: Seg
+    :param no_non_phrases: 是否严格按照词语分词，不允许把非词语的词当做词语进行分词
+    :type no_non_phrases: bool
+    """
+
+    def __init__(self, base, no_non_phrases=True):
+        super(OverlaySeg, self).__init__(
+            OverlayPrefixSet(base._prefix_set),
+            no_non_phrases=no_non_phrases)
+        self._base = base
+
+    def copy(self):
+        """返回一个副本，副本与当前分词器共享 ``base`` ，
+        只会复制自己训练的词语
+        """
+        new = self.__class__(self._base, no_non_phrases=self._no_non_phrases)
+        new._prefix_set._own = self._prefix_set._own.copy()
+        return new
+
+    def _load_base(self):
+        if isinstance(self._base, _LazySeg):
+            self._base.load()
+
+    def cut(self, text):
+        self._load_base()
+        return super(OverlaySeg, self).cut(text)
+
+    @property
+    def max_len(self):
+        self._load_base()
+        return self._prefix_set.max_len
 
 
 p_set = PrefixSet()
-p_set.train(PHRASES_DICT.keys())
 
 #: 基于内置词库的最大正向匹配分词器。使用:
 #:
@@ -111,7 +623,13 @@ p_set.train(PHRASES_DICT.keys())
 #:     ['你好', '，', '我是', '中国人', '，', '我', '爱',
 #:      '我的', '祖国']
 #:     >>>
-seg = Seg(p_set, no_non_phrases=True)
+seg = _LazySeg(p_set, no_non_phrases=True)
+
+# 通过环境变量 PYPINYIN_STATE_FILE 启动时直接使用保存的前缀树
+_boot_prefix_set = state._take_boot_prefix_set()
+if _boot_prefix_set is not None:
+    seg._load_state(_boot_prefix_set)
+del _boot_prefix_set
 
 
 def retrain(seg_instance):
@@ -121,4 +639,34 @@ def retrain(seg_instance):
 
     :type seg_instance: Seg
     """
+    # 还没训练过的话，第一次分词时会使用最新的词库进行训练
+    if isinstance(seg_instance, _LazySeg) and not seg_instance.loaded:
+        return
     seg_instance.train(PHRASES_DICT.keys())
+
+
+def train_words(seg_instance, words):
+    """只使用新增的词语训练 seg_instance。
+
+    与 :py:func:`retrain` 不同，不会重新训练内置词典中的所有词语，
+    适合在增加少量自定义词语后调用。
+
+    :type seg_instance: Seg
+    :param words: 新增的词语列表
+    """
+    # 还没训练过的话，第一次分词时会使用最新的词库进行训练
+    if isinstance(seg_instance, _LazySeg) and not seg_instance.loaded:
+        return
+    seg_instance.train(words)
+
+
+def remove_words(seg_instance, words):
+    """从 seg_instance 中删除词语，与 :py:func:`train_words` 对应。
+
+    :type seg_instance: Seg
+    :param words: 要删除的词语列表
+    """
+    # 还没训练过的话，第一次分词时会使用最新的词库进行训练
+    if isinstance(seg_instance, _LazySeg) and not seg_instance.loaded:
+        return
+    seg_instance.remove(words)
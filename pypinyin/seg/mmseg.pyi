@@ -1,6 +1,28 @@
+from array import array
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
 from typing import Iterator
+from typing import List
+from typing import Optional
 from typing import Text
-from typing import Set
+from typing import Tuple
+
+
+MatchFunc = Callable[[Text, int], Tuple[int, bool]]
+
+
+def _matcher(prefix_set: Any, text: Text) -> MatchFunc: ...
+
+
+_ARRAYS = ...  # type: Tuple[Text, ...]
+
+
+def _to_bytes(data: array[int]) -> bytes: ...
+
+
+def _from_bytes(data: bytes) -> array[int]: ...
 
 
 class Seg(object):
@@ -16,21 +38,142 @@ class Seg(object):
 
     def cut(self, text: Text) -> Iterator[Text]: ...
 
-    def train(self, words: Iterator[Text]) -> None: ...
+    def train(self, words: Iterable[Text]) -> None: ...
+
+    def remove(self, words: Iterable[Text]) -> None: ...
+
+    def replace(self, old_words: Iterable[Text],
+                new_words: Iterable[Text]) -> None: ...
+
+    @property
+    def size(self) -> int: ...
+
+    @property
+    def max_len(self) -> int: ...
 
 
 class PrefixSet(object):
     def __init__(self) -> None:
-        self._set = ...  # type: Set[Text]
+        self._root = ...  # type: Dict[Text, int]
+        self._first = ...  # type: array[int]
+        self._count = ...  # type: array[int]
+        self._cap = ...  # type: array[int]
+        self._words = ...  # type: bytearray
+        self._refs = ...  # type: array[int]
+        self._labels = ...  # type: array[int]
+        self._children = ...  # type: array[int]
+        self._free = ...  # type: array[int]
+        self._garbage = ...  # type: int
+        self._lengths = ...  # type: Dict[int, int]
+        self._size = ...  # type: int
+        self.max_len = ...  # type: int
+        ...
+
+    def __len__(self) -> int: ...
+
+    @property
+    def nodes(self) -> int: ...
+
+    def train(self, word_s: Iterable[Text]) -> None: ...
+
+    def remove(self, word_s: Iterable[Text]) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def copy(self) -> PrefixSet: ...
+
+    def _dump_state(self) -> Dict[Text, Any]: ...
+
+    def _load_state(self, data: Dict[Text, Any]) -> None: ...
+
+    def _maybe_compact(self) -> None: ...
+
+    def match(self, text: Text, start: int = ...) -> Tuple[int, bool]: ...
+
+    def matcher(self, text: Text) -> MatchFunc: ...
+
+    def __contains__(self, key: Text) -> bool: ...
+
+    def _child(self, node: int, code: int) -> Tuple[int, int]: ...
+
+    def _path(self, word: Text) -> Optional[List[int]]: ...
+
+    def _add(self, word: Text) -> bool: ...
+
+    def _remove(self, word: Text) -> bool: ...
+
+    def _new_node(self) -> int: ...
+
+    def _free_node(self, node: int) -> None: ...
+
+    def _delete_child(self, node: int, code: int) -> None: ...
+
+    def _insert_child(self, node: int, index: int, code: int,
+                      child: int) -> None: ...
+
+    def _compact(self) -> None: ...
+
+
+class _LazySeg(Seg):
+    _loaded = ...  # type: bool
+
+    @property
+    def loaded(self) -> bool: ...
+
+    def load(self) -> None: ...
+
+    def reset(self) -> None: ...
+
+    def _load_state(self, data: Dict[Text, Any]) -> None: ...
+
+
+def _merge(base_result: Tuple[int, bool],
+           own_result: Tuple[int, bool]) -> Tuple[int, bool]: ...
+
+
+class OverlayPrefixSet(object):
+    def __init__(self, base: PrefixSet) -> None:
+        self._base = ...  # type: PrefixSet
+        self._own = ...  # type: PrefixSet
         ...
 
-    def train(self, word_s: Iterator[Text]) -> None: ...
+    @property
+    def max_len(self) -> int: ...
+
+    def __len__(self) -> int: ...
+
+    @property
+    def nodes(self) -> int: ...
+
+    def train(self, word_s: Iterable[Text]) -> None: ...
+
+    def remove(self, word_s: Iterable[Text]) -> None: ...
+
+    def match(self, text: Text, start: int = ...) -> Tuple[int, bool]: ...
+
+    def matcher(self, text: Text) -> MatchFunc: ...
 
     def __contains__(self, key: Text) -> bool: ...
 
 
+class OverlaySeg(Seg):
+    def __init__(self, base: Seg, no_non_phrases: bool = ...) -> None:
+        self._base = ...  # type: Seg
+        ...
+
+    def copy(self) -> OverlaySeg: ...
+
+    def _load_base(self) -> None: ...
+
+
 p_set = ...  # type: PrefixSet
-seg = ...  # type: Seg
+seg = ...  # type: _LazySeg
 
 
 def retrain(seg_instance: Seg) -> None: ...
+
+
+def train_words(seg_instance: Seg, words: Iterable[Text]) -> None: ...
+
+
+def remove_words(seg_instance: Seg, words: Iterable[Text]) -> None: ...
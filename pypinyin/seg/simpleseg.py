@@ -4,65 +4,64 @@ from __future__ import unicode_literals
 from itertools import chain
 
 from pypinyin.compat import text_type, bytes_type
-from pypinyin.constants import RE_HANS, PHRASES_DICT
+from pypinyin.constants import RE_HANS_TOKEN, PHRASES_DICT
 from pypinyin.seg import mmseg
 
 
 def seg(hans):
-    hans = simple_seg(hans)
+    return [word for word, _ in seg_tokens(hans)]
+
+
+def seg_tokens(hans):
+    """分词，返回 ``(词语, 是否是汉字)`` 组成的列表，
+    后面的处理可以直接使用分词时得到的分类，不需要再次判断是否是汉字。
+    """
+    return _cut_tokens(simple_seg_tokens(hans), mmseg.seg, PHRASES_DICT)
+
+
+def _cut_tokens(tokens, seg_instance, phrases_dict):
+    """使用 ``seg_instance`` 对 ``tokens`` 中的汉字进行二次分词"""
     ret = []
-    for x in hans:
-        if not RE_HANS.match(x):   # 没有拼音的字符，不再参与二次分词
-            ret.append(x)
-        elif PHRASES_DICT:
-            ret.extend(list(mmseg.seg.cut(x)))
+    for token in tokens:
+        x, is_hans = token
+        if not is_hans:   # 没有拼音的字符，不再参与二次分词
+            ret.append(token)
+        elif len(x) == 1:   # 单个汉字无需分词
+            ret.append(token)
+        elif phrases_dict:
+            ret.extend((word, True) for word in seg_instance.cut(x))
         else:   # 禁用了词语库，不分词
-            ret.append(x)
+            ret.append(token)
     return ret
 
 
 def simple_seg(hans):
     """将传入的字符串按是否是汉字来分割"""
+    return [x for x, _ in simple_seg_tokens(hans)]
+
+
+def simple_seg_tokens(hans):
+    """将传入的字符串按是否是汉字来分割，返回 ``(字符串, 是否是汉字)`` 组成的列表"""
     assert not isinstance(hans, bytes_type), \
         'must be unicode string or [unicode, ...] list'
 
     if isinstance(hans, text_type):
-        return _seg(hans)
+        return _seg_tokens(hans)
     else:
         hans = list(hans)
         if len(hans) == 1:
-            return simple_seg(hans[0])
-        return list(chain(*[simple_seg(x) for x in hans]))
+            return simple_seg_tokens(hans[0])
+        return list(chain(*[simple_seg_tokens(x) for x in hans]))
 
 
 def _seg(chars):
     """按是否是汉字进行分词"""
-    s = ''  # 保存一个词
-    ret = []  # 分词结果
-    flag = 0  # 上一个字符是什么? 0: 汉字, 1: 不是汉字
-
-    for n, c in enumerate(chars):
-        if RE_HANS.match(c):  # 汉字, 确定 flag 的初始值
-            if n == 0:  # 第一个字符
-                flag = 0
-
-            if flag == 0:
-                s += c
-            else:  # 上一个字符不是汉字, 分词
-                ret.append(s)
-                flag = 0
-                s = c
-
-        else:  # 不是汉字
-            if n == 0:  # 第一个字符, 确定 flag 的初始值
-                flag = 1
-
-            if flag == 1:
-                s += c
-            else:  # 上一个字符是汉字, 分词
-                ret.append(s)
-                flag = 1
-                s = c
-
-    ret.append(s)  # 最后的词
-    return ret
+    return [x for x, _ in _seg_tokens(chars)]
+
+
+def _seg_tokens(chars):
+    """按是否是汉字进行分词，只需要扫描一遍字符串"""
+    if not chars:
+        return [('', False)]
+    return [(m.group(), m.group(1) is not None)
+            for m in RE_HANS_TOKEN.finditer(chars)]
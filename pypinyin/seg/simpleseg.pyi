@@ -1,11 +1,28 @@
 # -*- coding: utf-8 -*-
-from typing import List, Text
+from typing import Any, List, Mapping, Text, Tuple, Union
 
+from pypinyin.seg.mmseg import Seg
 
-def seg(hans: Text) -> List[Text]: ...
+TToken = Tuple[Text, bool]
 
 
-def simple_seg(hans: Text) -> List[Text]: ...
+def seg(hans: Union[List[Text], Text]) -> List[Text]: ...
+
+
+def seg_tokens(hans: Union[List[Text], Text]) -> List[TToken]: ...
+
+
+def _cut_tokens(tokens: List[TToken], seg_instance: Seg,
+                phrases_dict: Mapping[Text, Any]) -> List[TToken]: ...
+
+
+def simple_seg(hans: Union[List[Text], Text]) -> List[Text]: ...
+
+
+def simple_seg_tokens(hans: Union[List[Text], Text]) -> List[TToken]: ...
 
 
 def _seg(chars: Text) -> List[Text]: ...
+
+
+def _seg_tokens(chars: Text) -> List[TToken]: ...
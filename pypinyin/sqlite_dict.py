@@ -0,0 +1,407 @@
+# -*- coding: utf-8 -*-
+"""保存在 SQLite 数据库中的词语拼音库，用于非常大的自定义词库。
+
+几百万个词语的自定义词库如果通过 :py:func:`~pypinyin.load_phrases_dict`
+载入到内存中，词语拼音库和分词器的前缀树会占用几个 GB 的内存。
+:py:class:`SqlitePhrasesDict` 把词语及其所有前缀保存在数据库文件中，
+内存中只保留一个大小固定的 LRU 缓存：
+
+.. code-block:: python
+
+    >>> from pypinyin.constants import PHRASES_DICT
+    >>> from pypinyin.core import Pinyin
+    >>> from pypinyin.sqlite_dict import SqlitePhrasesDict, create_provider
+    >>> store = SqlitePhrasesDict('/path/to/phrases.db')
+    >>> store.load_phrases_dict(PHRASES_DICT)   # 需要同时使用内置的词语
+    >>> store.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+    >>> Pinyin(provider=create_provider(store)).pinyin('朝阳')
+    [['cháo'], ['yáng']]
+
+分词时每段连续的汉字按前缀的长度逐层通过 :py:meth:`SqlitePhrasesDict.probe`
+批量查询：先查询所有的单字，之后每一层只查询在已经找到的前缀后面再加一个字，
+所以每段汉字最多查询 ``max_len`` 次（每次最多 :py:data:`MAX_VARIABLES` 个 key ），
+而不是每个字查询一次，转换时查询词语的拼音会直接命中这些查询填充的缓存。
+
+数据库表结构::
+
+    entries(key TEXT PRIMARY KEY, pinyin TEXT, refs INTEGER) WITHOUT ROWID
+    meta(name TEXT PRIMARY KEY, value INTEGER)
+
+``entries`` 中保存所有词语及其所有前缀，不是词语的前缀的 ``pinyin`` 为 ``NULL`` ，
+``refs`` 为以这个前缀开头的词语个数，用于删除词语时删除不再被使用的前缀。
+拼音保存为 ``'zhōng,zhòng guó'`` 这样的字符串：字之间用空格分隔，
+一个字的多个读音用逗号分隔。
+"""
+from __future__ import unicode_literals
+
+from collections import Counter
+from contextlib import contextmanager
+from itertools import islice
+import os
+import sqlite3
+import threading
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:  # pragma: no cover
+    from collections import MutableMapping
+
+from pypinyin import cache
+from pypinyin.provider import DictProvider
+from pypinyin.seg.mmseg import Seg
+from pypinyin.syllables import syllable_table
+from pypinyin.utils import _replace_tone2_style_dict_to_default
+
+VERSION = 1
+
+#: 一次查询中最多使用的参数个数，低于旧版本 SQLite 的默认上限 999
+MAX_VARIABLES = 900
+
+# 批量写入时每次处理的词语个数
+_CHUNK_SIZE = 5000
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS entries ('
+    ' key TEXT PRIMARY KEY, pinyin TEXT, refs INTEGER NOT NULL'
+    ') WITHOUT ROWID',
+    'CREATE TABLE IF NOT EXISTS meta ('
+    ' name TEXT PRIMARY KEY, value INTEGER NOT NULL)',
+)
+
+_missing = object()
+
+
+def _encode(pinyins, style):
+    """把词语拼音库的值编码为保存在数据库中的字符串"""
+    if style == 'tone2':
+        pinyins = [map(_replace_tone2_style_dict_to_default, item)
+                   for item in pinyins]
+    return ' '.join(','.join(item) for item in pinyins)
+
+
+def _decode(value):
+    """把数据库中的字符串解码为共享读音列表组成的 tuple"""
+    return tuple(syllable_table.split(x) for x in value.split(' '))
+
+
+def _prefixes(word):
+    return (word[:i] for i in range(1, len(word) + 1))
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class SqlitePhrasesDict(MutableMapping):
+    """保存在 SQLite 数据库中的词语拼音库，可以作为
+    :py:class:`~pypinyin.provider.DictProvider` 的 ``phrases_dict`` 使用。
+
+    查询到的词语和前缀保存在一个 LRU 缓存中，数据库中没有的 key
+    保存在另一个同样大小的 LRU 缓存中，分词时查询的大量不存在的子串
+    不会把缓存中的词语挤出去。
+    修改数据后会调用 :py:func:`pypinyin.cache.invalidate_all` ，
+    缓存随之失效。可以被多个线程使用，fork 之后会在子进程中重新打开数据库。
+
+    :param path: 数据库文件路径，不存在时会创建一个新的数据库
+    :param cache_size: 每个 LRU 缓存最多保存多少个查询结果
+    :raises ValueError: 数据库不是由这个版本的 :py:class:`SqlitePhrasesDict` 创建的
+    """
+
+    #: 数据保存在数据库中，不需要加载
+    loaded = True
+
+    def __init__(self, path, cache_size=100000):
+        self.path = path
+        self._lock = threading.RLock()
+        self._cache = cache.LRUCache(cache_size)
+        # 数据库中没有的 key
+        self._absent = cache.LRUCache(cache_size)
+        self._conn = None
+        self._pid = None
+        meta = self._read_meta()
+        if meta.get('version', VERSION) != VERSION:
+            self.close()
+            raise ValueError(
+                '{0!r} is not a phrases database (version {1})'.format(
+                    path, VERSION))
+        self._size = meta.get('size', 0)
+        #: 最长词语的长度
+        self.max_len = meta.get('max_len', 0)
+
+    def _connection(self):
+        pid = os.getpid()
+        if self._pid != pid:
+            # 不能使用 fork 之前打开的连接
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._pid = pid
+        return self._conn
+
+    def _read_meta(self):
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                for statement in _SCHEMA:
+                    conn.execute(statement)
+                conn.execute(
+                    'INSERT OR IGNORE INTO meta (name, value) VALUES (?, ?)',
+                    ('version', VERSION))
+            return dict(conn.execute('SELECT name, value FROM meta'))
+
+    def _save_meta(self, conn):
+        conn.executemany(
+            'INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)',
+            [('size', self._size), ('max_len', self.max_len)])
+
+    @contextmanager
+    def _transaction(self):
+        """写入数据的事务，出现异常时回滚并恢复内存中的统计信息"""
+        with self._lock:
+            conn = self._connection()
+            size, max_len = self._size, self.max_len
+            try:
+                with conn:
+                    yield conn
+                    self._save_meta(conn)
+            except Exception:
+                self._size, self.max_len = size, max_len
+                raise
+        cache.invalidate_all()
+
+    def close(self):
+        """关闭数据库连接，之后再使用时会重新打开"""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._pid = None
+
+    def _select(self, conn, keys):
+        """返回 ``keys`` 中在数据库中的 key 及其 ``pinyin`` 列"""
+        rows = {}
+        for chunk in _chunks(keys, MAX_VARIABLES):
+            rows.update(conn.execute(
+                'SELECT key, pinyin FROM entries WHERE key IN ({0})'.format(
+                    ', '.join('?' * len(chunk))), chunk))
+        return rows
+
+    def probe(self, keys):
+        """批量查询多个词语或前缀，缓存中没有的 key 只需要一次查询
+        （每 :py:data:`MAX_VARIABLES` 个 key 一次查询）。
+
+        :param keys: 词语或前缀列表
+        :return: 在数据库中的 key 组成的 dict ，词语的值为拼音，
+                 只是前缀的值为 ``None``
+        :rtype: dict
+        """
+        result = {}
+        missing = []
+        for key in set(keys):
+            value = self._cache.get(key, _missing)
+            if value is not _missing:
+                result[key] = value
+            elif not self._absent.get(key, False):
+                missing.append(key)
+        if not missing:
+            return result
+
+        with self._lock:
+            rows = self._select(self._connection(), missing)
+        for key in missing:
+            value = rows.get(key, _missing)
+            if value is _missing:
+                self._absent.set(key, True)
+                continue
+            if value is not None:
+                value = _decode(value)
+            self._cache.set(key, value)
+            result[key] = value
+        return result
+
+    def cache_info(self):
+        """返回保存词语和前缀的 LRU 缓存的统计信息
+
+        :rtype: pypinyin.cache.CacheInfo
+        """
+        return self._cache.info()
+
+    def load_phrases_dict(self, phrases_dict, style='default'):
+        """把词语写入数据库，已经存在的词语会被替换。
+
+        所有词语在一个事务中写入，数据库中已有的词语不会被读入内存。
+
+        :param phrases_dict: 词语拼音库，比如 ``{'朝阳': [['cháo'], ['yáng']]}`` ，
+                             也可以是 ``(词语, 拼音)`` 组成的可迭代对象
+        :param style: 拼音库风格，详见 :py:func:`~pypinyin.load_phrases_dict`
+        """
+        items = getattr(phrases_dict, 'items', None)
+        if items is not None:
+            phrases_dict = items()
+        with self._transaction() as conn:
+            for chunk in _chunks(phrases_dict, _CHUNK_SIZE):
+                self._write(conn, chunk, style)
+
+    def _write(self, conn, chunk, style):
+        values = dict((k, _encode(v, style)) for k, v in chunk if k)
+        rows = self._select(conn, list(values))
+        # 数据库中没有或者只是前缀的词语是新增的词语
+        new_words = [k for k in values if rows.get(k) is None]
+        refs = Counter(p for word in new_words for p in _prefixes(word))
+        conn.executemany(
+            'INSERT OR IGNORE INTO entries (key, pinyin, refs) '
+            'VALUES (?, NULL, 0)', ((key,) for key in refs))
+        conn.executemany(
+            'UPDATE entries SET refs = refs + ? WHERE key = ?',
+            ((n, key) for key, n in refs.items()))
+        conn.executemany(
+            'UPDATE entries SET pinyin = ? WHERE key = ?',
+            ((v, k) for k, v in values.items()))
+        self._size += len(new_words)
+        self.max_len = max([self.max_len] + [len(k) for k in new_words])
+
+    def remove_phrases(self, phrases):
+        """从数据库中删除词语，不再被使用的前缀也会被删除。
+        不存在的词语会被忽略。
+
+        :param phrases: 词语列表
+        """
+        with self._transaction() as conn:
+            for chunk in _chunks(phrases, _CHUNK_SIZE):
+                self._delete(conn, chunk)
+
+    def _delete(self, conn, chunk):
+        rows = self._select(conn, list(set(chunk)))
+        words = [k for k, v in rows.items() if v is not None]
+        refs = Counter(p for word in words for p in _prefixes(word))
+        conn.executemany('UPDATE entries SET pinyin = NULL WHERE key = ?',
+                         ((key,) for key in words))
+        conn.executemany(
+            'UPDATE entries SET refs = refs - ? WHERE key = ?',
+            ((n, key) for key, n in refs.items()))
+        conn.executemany('DELETE FROM entries WHERE key = ? AND refs <= 0',
+                         ((key,) for key in refs))
+        self._size -= len(words)
+        if any(len(word) == self.max_len for word in words):
+            # 剩下的 key 都是某个词语的前缀，最长的 key 就是最长的词语
+            self.max_len = conn.execute(
+                'SELECT MAX(LENGTH(key)) FROM entries').fetchone()[0] or 0
+
+    def __getitem__(self, key):
+        value = self.probe([key]).get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        value = self.probe([key]).get(key)
+        if value is None:
+            return default
+        return value
+
+    def __contains__(self, key):
+        return self.probe([key]).get(key) is not None
+
+    def __setitem__(self, key, value):
+        self.load_phrases_dict({key: value})
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self.remove_phrases([key])
+
+    def __iter__(self):
+        with self._lock:
+            keys = [row[0] for row in self._connection().execute(
+                'SELECT key FROM entries WHERE pinyin IS NOT NULL')]
+        return iter(keys)
+
+    def __len__(self):
+        return self._size
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, self.path)
+
+
+class SqlitePrefixSet(object):
+    """使用 :py:class:`SqlitePhrasesDict` 中的词语的只读前缀树，
+    可以传给 :py:class:`~pypinyin.seg.mmseg.Seg` 。
+    匹配结果与使用这些词语训练的 :py:class:`~pypinyin.seg.mmseg.PrefixSet` 一致。
+
+    修改词语请使用 :py:class:`SqlitePhrasesDict` 的方法。
+
+    :type store: SqlitePhrasesDict
+    """
+
+    def __init__(self, store):
+        self._store = store
+
+    @property
+    def max_len(self):
+        """最长词语的长度"""
+        return self._store.max_len
+
+    def __len__(self):
+        """词语的个数"""
+        return len(self._store)
+
+    def match(self, text, start=0):
+        """参数和返回值详见 :py:meth:`~pypinyin.seg.mmseg.PrefixSet.match` ，
+        只查询一次 ``text[start:]`` 可能匹配的前缀
+        """
+        limit = min(len(text) - start, self._store.max_len)
+        known = self._store.probe(
+            [text[start:start + n] for n in range(1, limit + 1)])
+        return self._match(known, text, start)
+
+    def matcher(self, text):
+        """参数和返回值详见 :py:meth:`~pypinyin.seg.mmseg.PrefixSet.matcher` ，
+        按长度逐层查询 ``text`` 中可能匹配的前缀：
+        第 n 层只查询第 n - 1 层找到的前缀后面再加一个字，最多查询 :py:attr:`max_len` 层
+        """
+        max_len = self._store.max_len
+        end = len(text)
+        known = {}
+        starts = range(end)
+        length = 1
+        while starts and length <= max_len:
+            found = self._store.probe(
+                [text[i:i + length] for i in starts])
+            known.update(found)
+            length += 1
+            starts = [i for i in starts if i + length <= end and
+                      text[i:i + length - 1] in found]
+
+        def match(text, start=0):
+            return self._match(known, text, start)
+        return match
+
+    def _match(self, known, text, start):
+        limit = min(len(text) - start, self._store.max_len)
+        length = 0
+        while length < limit and text[start:start + length + 1] in known:
+            length += 1
+        if not length:
+            return 0, False
+        return length, known[text[start:start + length]] is not None
+
+    def __contains__(self, key):
+        return bool(key) and key in self._store.probe([key])
+
+
+def create_provider(store, pinyin_dict=None):
+    """返回使用 ``store`` 中的词语的 :py:class:`~pypinyin.provider.DictProvider` 。
+
+    :py:meth:`~pypinyin.provider.DictProvider.load_phrases_dict` 载入的词语
+    保存在 provider 的内存覆盖层中，大量的词语请使用
+    :py:meth:`SqlitePhrasesDict.load_phrases_dict` 直接写入数据库。
+
+    :type store: SqlitePhrasesDict
+    :param pinyin_dict: 单字拼音库，默认为内置的单字拼音库
+    :rtype: pypinyin.provider.DictProvider
+    """
+    seg = Seg(SqlitePrefixSet(store), no_non_phrases=True)
+    return DictProvider(pinyin_dict=pinyin_dict, phrases_dict=store, seg=seg)
@@ -0,0 +1,130 @@
+import sqlite3
+import threading
+from typing import Any
+from typing import ContextManager
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import MutableMapping
+from typing import Optional
+from typing import Sequence
+from typing import Text
+from typing import Tuple
+from typing import TypeVar
+from typing import Union
+
+from pypinyin.cache import CacheInfo
+from pypinyin.cache import LRUCache
+from pypinyin.provider import DictProvider
+from pypinyin.seg.mmseg import MatchFunc
+
+VERSION = ...  # type: int
+MAX_VARIABLES = ...  # type: int
+_CHUNK_SIZE = ...  # type: int
+_SCHEMA = ...  # type: Tuple[Text, ...]
+
+_missing = ...  # type: object
+
+T = TypeVar('T')
+
+PhraseValue = Tuple[Tuple[Text, ...], ...]
+PhrasesInput = Union[Mapping[Text, Sequence[Sequence[Text]]],
+                     Iterable[Tuple[Text, Sequence[Sequence[Text]]]]]
+
+
+def _encode(pinyins: Sequence[Sequence[Text]], style: Text) -> Text: ...
+
+
+def _decode(value: Text) -> PhraseValue: ...
+
+
+def _prefixes(word: Text) -> Iterator[Text]: ...
+
+
+def _chunks(iterable: Iterable[T], size: int) -> Iterator[List[T]]: ...
+
+
+class SqlitePhrasesDict(MutableMapping[Text, PhraseValue]):
+    loaded = ...  # type: bool
+    path = ...  # type: Text
+    max_len = ...  # type: int
+    _lock = ...  # type: threading.RLock
+    _cache = ...  # type: LRUCache
+    _absent = ...  # type: LRUCache
+    _conn = ...  # type: Optional[sqlite3.Connection]
+    _pid = ...  # type: Optional[int]
+    _size = ...  # type: int
+
+    def __init__(self, path: Text, cache_size: int = ...) -> None: ...
+
+    def _connection(self) -> sqlite3.Connection: ...
+
+    def _read_meta(self) -> Dict[Text, int]: ...
+
+    def _save_meta(self, conn: sqlite3.Connection) -> None: ...
+
+    def _transaction(self) -> ContextManager[sqlite3.Connection]: ...
+
+    def close(self) -> None: ...
+
+    def _select(self, conn: sqlite3.Connection,
+                keys: Sequence[Text]) -> Dict[Text, Optional[Text]]: ...
+
+    def probe(self,
+              keys: Iterable[Text]) -> Dict[Text, Optional[PhraseValue]]: ...
+
+    def cache_info(self) -> CacheInfo: ...
+
+    def load_phrases_dict(self, phrases_dict: PhrasesInput,
+                          style: Text = ...) -> None: ...
+
+    def _write(self, conn: sqlite3.Connection,
+               chunk: List[Tuple[Text, Sequence[Sequence[Text]]]],
+               style: Text) -> None: ...
+
+    def remove_phrases(self, phrases: Iterable[Text]) -> None: ...
+
+    def _delete(self, conn: sqlite3.Connection,
+                chunk: List[Text]) -> None: ...
+
+    def __getitem__(self, key: Text) -> PhraseValue: ...
+
+    def get(self, key: Text, default: Any = ...) -> Any: ...
+
+    def __contains__(self, key: object) -> bool: ...
+
+    def __setitem__(self, key: Text,
+                    value: Sequence[Sequence[Text]]) -> None: ...
+
+    def __delitem__(self, key: Text) -> None: ...
+
+    def __iter__(self) -> Iterator[Text]: ...
+
+    def __len__(self) -> int: ...
+
+
+class SqlitePrefixSet(object):
+    _store = ...  # type: SqlitePhrasesDict
+
+    def __init__(self, store: SqlitePhrasesDict) -> None: ...
+
+    @property
+    def max_len(self) -> int: ...
+
+    def __len__(self) -> int: ...
+
+    def match(self, text: Text, start: int = ...) -> Tuple[int, bool]: ...
+
+    def matcher(self, text: Text) -> MatchFunc: ...
+
+    def _match(self, known: Dict[Text, Optional[PhraseValue]], text: Text,
+               start: int) -> Tuple[int, bool]: ...
+
+    def __contains__(self, key: Text) -> bool: ...
+
+
+def create_provider(store: SqlitePhrasesDict,
+                    pinyin_dict: Optional[Mapping[int, Text]] = ...
+                    ) -> DictProvider: ...
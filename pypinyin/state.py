@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""把完成初始化后的拼音库和分词器保存为状态文件，启动时直接载入。
+
+正常启动时需要执行 ``pinyin_dict.py`` / ``phrases_dict.py`` ，
+再使用所有词语训练内置分词器，载入自定义拼音库时还需要解析这些文件。
+:py:func:`dump` 把当前进程中的这些数据（包括通过
+:py:func:`~pypinyin.load_single_dict` / :py:func:`~pypinyin.load_phrases_dict`
+载入的自定义拼音和训练好的分词器）保存为一个文件：
+
+.. code-block:: python
+
+    >>> import pypinyin
+    >>> from pypinyin import state
+    >>> pypinyin.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+    >>> state.dump('/path/to/pypinyin.state')
+
+然后设置环境变量 ``PYPINYIN_STATE_FILE=/path/to/pypinyin.state`` ，
+导入 pypinyin 时就会直接从这个文件载入，不再执行这两个模块也不再训练分词器。
+也可以在运行时调用 :py:func:`load` 载入。
+
+文件格式::
+
+    magic(8 bytes)
+    header: 一行 JSON ，包括文件格式版本、 pypinyin 版本、Python 版本、
+            内置拼音库文件（单字拼音库和当前档位的词语拼音库）的 hash 等信息
+    body:   marshal 格式的 ``(单字拼音库, 词语拼音库, 分词器的前缀树)``
+
+header 中的任何一项与当前环境不一致时（比如升级了 pypinyin 或者内置拼音库，
+或者使用了不同档位的词语拼音库），都会拒绝载入这个文件。
+"""
+from __future__ import unicode_literals
+
+from array import array
+import hashlib
+import json
+import marshal
+import os
+import sys
+import warnings
+
+from pypinyin.block_dict import BLOCK_NAMES
+
+MAGIC = b'PYPYSTAT'
+VERSION = 1
+
+# 通过环境变量启动时载入的前缀树数据，导入 mmseg 时取出
+_boot_prefix_set = None
+# {词语拼音库文件名: 内置拼音库文件的 hash}
+_dict_hashes = {}
+
+
+def _library_version():
+    # 通过环境变量启动时 pypinyin/__init__.py 还没有执行完
+    return sys.modules['pypinyin'].__version__
+
+
+def _phrases_file():
+    """当前档位的词语拼音库的文件名"""
+    # 通过环境变量启动时 pypinyin/constants.py 也还没有执行完
+    constants = sys.modules['pypinyin.constants']
+    name = constants._phrases_module(constants._PHRASES_PROFILE)
+    return name.rsplit('.', 1)[1] + '.py'
+
+
+def _builtin_dict_hash():
+    """单字拼音库和当前档位的词语拼音库文件的 hash ，不需要导入这些模块"""
+    phrases_file = _phrases_file()
+    if phrases_file not in _dict_hashes:
+        sha = hashlib.sha1()
+        base = os.path.dirname(os.path.abspath(__file__))
+        names = ['pinyin_dict_{0}.py'.format(block) for block in BLOCK_NAMES]
+        for name in names + [phrases_file]:
+            with open(os.path.join(base, name), 'rb') as fp:
+                sha.update(fp.read())
+        _dict_hashes[phrases_file] = sha.hexdigest()
+    return _dict_hashes[phrases_file]
+
+
+def _header():
+    return {
+        'format': VERSION,
+        'pypinyin': _library_version(),
+        'python': '{0}.{1}'.format(*sys.version_info[:2]),
+        'dict_hash': _builtin_dict_hash(),
+        # 前缀树的数组直接保存为字节
+        'byteorder': sys.byteorder,
+        'itemsize': array('I').itemsize,
+    }
+
+
+def dump(path):
+    """把当前进程中的单字拼音库、词语拼音库和内置分词器保存为状态文件。
+
+    会先加载词语拼音库并训练内置分词器。
+    先写入临时文件再替换 ``path`` ，正在读取这个文件的进程不会读到不完整的数据。
+
+    :param path: 保存的文件路径
+    """
+    from pypinyin.constants import PHRASES_DICT, PINYIN_DICT
+    from pypinyin.seg import mmseg
+
+    mmseg.seg.load()
+    body = (dict(PINYIN_DICT.items()), PHRASES_DICT.copy(),
+            mmseg.seg._prefix_set._dump_state())
+    header = json.dumps(_header(), sort_keys=True).encode('utf-8')
+
+    tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+    try:
+        with open(tmp_path, 'wb') as fp:
+            fp.write(MAGIC)
+            fp.write(header + b'\n')
+            marshal.dump(body, fp)
+        _replace_file(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _replace_file(src, dst):
+    replace = getattr(os, 'replace', None)
+    if replace is not None:
+        replace(src, dst)
+    else:  # pragma: no cover
+        if os.path.exists(dst):
+            os.remove(dst)
+        os.rename(src, dst)
+
+
+def _read(path):
+    """读取并校验状态文件
+
+    :return: ``(单字拼音库, 词语拼音库, 前缀树数据)``
+    :raises ValueError: 文件格式有误或者与当前环境不一致
+    """
+    with open(path, 'rb') as fp:
+        if fp.read(len(MAGIC)) != MAGIC:
+            raise ValueError('{0!r} is not a pypinyin state file'.format(path))
+        try:
+            header = json.loads(fp.readline().decode('utf-8'))
+        except ValueError:
+            raise ValueError('{0!r}: invalid header'.format(path))
+        expected = _header()
+        for key in sorted(expected):
+            if header.get(key) != expected[key]:
+                raise ValueError(
+                    '{0!r} is stale: {1} is {2!r}, expected {3!r}'.format(
+                        path, key, header.get(key), expected[key]))
+        try:
+            pinyin_dict, phrases_dict, prefix_set = marshal.load(fp)
+        except (EOFError, TypeError, ValueError):
+            raise ValueError('{0!r}: invalid data'.format(path))
+    return pinyin_dict, phrases_dict, prefix_set
+
+
+def load(path):
+    """从状态文件中载入单字拼音库、词语拼音库和内置分词器，
+    替换当前进程中的数据。
+
+    已经创建的 :py:class:`~pypinyin.provider.DictProvider` 也会使用新的数据。
+    导入 pypinyin 时就载入的话请使用环境变量 ``PYPINYIN_STATE_FILE`` ，
+    可以省去导入内置单字拼音库的耗时。
+
+    :param path: :py:func:`dump` 保存的文件路径
+    :raises ValueError: 文件格式有误，或者文件不是由当前版本的 pypinyin
+                        和内置拼音库生成的
+    """
+    from pypinyin import cache
+    from pypinyin.constants import PHRASES_DICT, PINYIN_DICT
+    from pypinyin.seg import mmseg
+
+    pinyin_dict, phrases_dict, prefix_set = _read(path)
+    if isinstance(PINYIN_DICT, dict):
+        PINYIN_DICT.clear()
+    PINYIN_DICT.update(pinyin_dict)
+    PHRASES_DICT.replace(phrases_dict)
+    mmseg.seg._load_state(prefix_set)
+    cache.invalidate_all()
+
+
+def _boot(path):
+    """通过环境变量指定状态文件时，导入 :mod:`pypinyin.constants` 时调用。
+
+    文件无法使用时给出警告并按正常方式启动。
+
+    :return: ``(单字拼音库, 词语拼音库)`` 或者 ``None``
+    """
+    global _boot_prefix_set
+    try:
+        pinyin_dict, phrases_dict, prefix_set = _read(path)
+    except (IOError, OSError, ValueError) as e:
+        warnings.warn('ignored pypinyin state file: {0}'.format(e))
+        return None
+    _boot_prefix_set = prefix_set
+    return pinyin_dict, phrases_dict
+
+
+def _take_boot_prefix_set():
+    """返回通过环境变量载入的前缀树数据（只会返回一次）"""
+    global _boot_prefix_set
+    prefix_set, _boot_prefix_set = _boot_prefix_set, None
+    return prefix_set
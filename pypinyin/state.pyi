@@ -0,0 +1,45 @@
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Sequence
+from typing import Text
+from typing import Tuple
+
+MAGIC = ...  # type: bytes
+VERSION = ...  # type: int
+
+_boot_prefix_set = ...  # type: Optional[Dict[Text, Any]]
+_dict_hashes = ...  # type: Dict[Text, Text]
+
+
+def _library_version() -> Text: ...
+
+
+def _phrases_file() -> Text: ...
+
+
+def _builtin_dict_hash() -> Text: ...
+
+
+def _header() -> Dict[Text, Any]: ...
+
+
+def dump(path: Text) -> None: ...
+
+
+def _replace_file(src: Text, dst: Text) -> None: ...
+
+
+def _read(path: Text) -> Tuple[Dict[int, Text],
+                               Dict[Text, Sequence[Sequence[Text]]],
+                               Dict[Text, Any]]: ...
+
+
+def load(path: Text) -> None: ...
+
+
+def _boot(path: Text) -> Optional[Tuple[Dict[int, Text],
+                                        Dict[Text, Sequence[Sequence[Text]]]]]: ...
+
+
+def _take_boot_prefix_set() -> Optional[Dict[Text, Any]]: ...
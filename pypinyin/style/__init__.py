@@ -1,13 +1,23 @@
 # -*- coding: utf-8 -*-
 from functools import wraps
 
+from pypinyin.block_dict import _loaded_values
+from pypinyin.cache import invalidate_all
+from pypinyin.constants import PINYIN_DICT, Style
+
 # 存储各拼音风格对应的实现
 _registry = {}
+# 内置拼音风格的转换表: {(style, strict): {原始拼音: 转换后的拼音}}
+_tables = {}
+_BUILTIN_STYLES = frozenset(Style)
 
 
 def convert(pinyin, style, strict, default=None, **kwargs):
     """根据拼音风格把原始拼音转换为不同的格式
 
+    内置的拼音风格会在第一次使用时为单字拼音库中的所有拼音预先生成转换表，
+    之后直接查表，不在表中的拼音（比如自定义的拼音）再调用风格实现进行转换。
+
     :param pinyin: 原始有声调的单个拼音
     :type pinyin: unicode
     :param style: 拼音风格
@@ -17,11 +27,38 @@ def convert(pinyin, style, strict, default=None, **kwargs):
     :return: 按照拼音风格进行处理过后的拼音字符串
     :rtype: unicode
     """
+    if not kwargs:
+        table = _tables.get((style, bool(strict)))
+        if table is None:
+            table = _build_table(style, strict)
+        if table:
+            value = table.get(pinyin)
+            if value is not None:
+                return value
+
     if style in _registry:
         return _registry[style](pinyin, strict=strict, **kwargs)
     return default
 
 
+def _build_table(style, strict):
+    """生成内置拼音风格的转换表，非内置风格返回空 dict"""
+    strict = bool(strict)
+    func = _registry.get(style)
+    if func is None or style not in _BUILTIN_STYLES:
+        table = {}
+    else:
+        syllables = set()
+        # 只使用已加载的区块，其他区块中的拼音不在表中时直接调用风格实现
+        for value in _loaded_values(PINYIN_DICT):
+            syllables.update(value.split(','))
+        table = dict(
+            (x, func(x, strict=strict)) for x in syllables
+        )
+    _tables[(style, strict)] = table
+    return table
+
+
 def register(style, func=None):
     """注册一个拼音风格实现
 
@@ -36,10 +73,15 @@ def register(style, func=None):
     """
     if func is not None:
         _registry[style] = func
+        # 风格实现变化后，之前缓存的转换结果都不再可用
+        _clear_tables(style)
+        invalidate_all()
         return
 
     def decorator(func):
         _registry[style] = func
+        _clear_tables(style)
+        invalidate_all()
 
         @wraps(func)
         def wrapper(pinyin, **kwargs):
@@ -49,6 +91,11 @@ def register(style, func=None):
     return decorator
 
 
+def _clear_tables(style):
+    for strict in (True, False):
+        _tables.pop((style, strict), None)
+
+
 def auto_discover():
     """自动注册内置的拼音风格实现"""
     from pypinyin.style import (  # noqa
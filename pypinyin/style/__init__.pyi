@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
-from typing import Any, Optional, Callable, Dict, Text, Union
+from typing import (
+    Any, Optional, Callable, Dict, FrozenSet, Text, Tuple, Union
+)
 
 from pypinyin.constants import Style
 
@@ -8,6 +10,8 @@ TRegisterFunc = Optional[Callable[[Text, Dict[Any, Any]], Text]]
 TWrapperFunc = Optional[Callable[[Text, Dict[Any, Any]], Text]]
 
 _registry = {}  # type: Dict[Union[TStyle, int, str, Any], TRegisterFunc]
+_tables = {}  # type: Dict[Tuple[Any, bool], Dict[Text, Text]]
+_BUILTIN_STYLES = ...  # type: FrozenSet[TStyle]
 
 
 def convert(pinyin: Text, style: TStyle, strict: bool,
@@ -17,4 +21,11 @@ def convert(pinyin: Text, style: TStyle, strict: bool,
 def register(style: Union[TStyle, int, str, Any],
              func: TRegisterFunc = ...) -> TWrapperFunc: ...
 
+
+def _build_table(style: Any, strict: bool) -> Dict[Text, Text]: ...
+
+
+def _clear_tables(style: Any) -> None: ...
+
+
 def auto_discover() -> None: ...
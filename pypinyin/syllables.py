@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""拼音音节表
+
+拼音库中不同的拼音只有一千多个，但是单字拼音库和词语拼音库中有几十万个拼音。
+音节表为每个不同的拼音分配一个整数 ID，并让相同的拼音、相同的读音列表
+共享同一个（不可变的）对象：
+
+* 单字拼音库的值 ``'zhōng,zhòng'`` 对应共享的 ``('zhōng', 'zhòng')``
+* 词语拼音库的值 ``[['zhōng'], ['guó']]`` 对应 ``(('zhōng',), ('guó',))`` ，
+  其中的 ``('zhōng',)`` 被所有词语共享
+"""
+from __future__ import unicode_literals
+
+import threading
+
+
+class SyllableTable(object):
+    """拼音音节表，可以在多个线程中使用"""
+
+    def __init__(self):
+        #: ID 到拼音的映射
+        self.syllables = []
+        self._ids = {}
+        self._readings = {}
+        self._splits = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.syllables)
+
+    def intern(self, syllable):
+        """返回共享的拼音字符串，第一次出现的拼音会被分配一个新的 ID"""
+        syllable_id = self._ids.get(syllable)
+        if syllable_id is None:
+            with self._lock:
+                syllable_id = self._ids.get(syllable)
+                if syllable_id is None:
+                    # 先加入列表再分配 ID ，其他线程查到 ID 时列表中已经有这个拼音
+                    self.syllables.append(syllable)
+                    syllable_id = len(self.syllables) - 1
+                    self._ids[syllable] = syllable_id
+        return self.syllables[syllable_id]
+
+    def id(self, syllable):
+        """返回拼音的 ID"""
+        self.intern(syllable)
+        return self._ids[syllable]
+
+    def reading(self, pinyins):
+        """返回共享的读音列表 tuple
+
+        :param pinyins: 一个字的所有拼音，比如 ``['zhōng', 'zhòng']``
+        :rtype: tuple
+        """
+        key = tuple(pinyins)
+        value = self._readings.get(key)
+        if value is None:
+            # 多个线程同时生成时都使用第一个写入的 tuple
+            value = self._readings.setdefault(
+                key, tuple(self.intern(x) for x in key))
+        return value
+
+    def split(self, value):
+        """把单字拼音库的值拆分为共享的读音列表，相同的值只会拆分一次
+
+        :param value: 单字拼音库的值，比如 ``'zhōng,zhòng'``
+        :rtype: tuple
+        """
+        result = self._splits.get(value)
+        if result is None:
+            result = self._splits.setdefault(
+                value, self.reading(value.split(',')))
+        return result
+
+    def phrase(self, pinyins):
+        """把词语拼音库的值转换为共享读音列表组成的 tuple
+
+        :param pinyins: 词语拼音库的值，比如 ``[['zhōng'], ['guó']]``
+        :rtype: tuple
+        """
+        return tuple(self.reading(x) for x in pinyins)
+
+
+#: 拼音库使用的音节表
+syllable_table = SyllableTable()
@@ -0,0 +1,28 @@
+import threading
+from typing import Dict, List, Sequence, Text, Tuple
+
+
+class SyllableTable(object):
+    syllables = ...  # type: List[Text]
+    _ids = ...  # type: Dict[Text, int]
+    _readings = ...  # type: Dict[Tuple[Text, ...], Tuple[Text, ...]]
+    _splits = ...  # type: Dict[Text, Tuple[Text, ...]]
+    _lock = ...  # type: threading.Lock
+
+    def __init__(self) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def intern(self, syllable: Text) -> Text: ...
+
+    def id(self, syllable: Text) -> int: ...
+
+    def reading(self, pinyins: Sequence[Text]) -> Tuple[Text, ...]: ...
+
+    def split(self, value: Text) -> Tuple[Text, ...]: ...
+
+    def phrase(self, pinyins: Sequence[Sequence[Text]]
+               ) -> Tuple[Tuple[Text, ...], ...]: ...
+
+
+syllable_table = ...  # type: SyllableTable
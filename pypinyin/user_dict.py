@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+"""从 `pinyin-data`_ / `phrase-pinyin-data`_ 格式的文件中载入自定义拼音库。
+
+文件格式与 ``gen_pinyin_dict.py`` / ``gen_phrases_dict.py`` 处理的格式一致，
+单字和词语可以放在同一个文件中::
+
+    # 注释
+    U+4E2D: zhōng,zhòng  # 中
+    中国: zhōng guó
+
+文件会被逐行解析后直接写入拼音库，不需要先生成 ``.py`` 模块。
+:py:class:`DictWatcher` 可以在文件修改后重新载入，只会把变化的部分应用到拼音库中：
+
+.. code-block:: python
+
+    >>> from pypinyin import user_dict
+    >>> watcher = user_dict.watch(['my_pinyin.txt'], interval=5)
+    >>> # 或者在需要时手动检查
+    >>> watcher.check()
+    []
+
+.. _pinyin-data: https://github.com/mozillazg/pinyin-data
+.. _phrase-pinyin-data: https://github.com/mozillazg/phrase-pinyin-data
+"""
+from __future__ import unicode_literals
+
+import io
+import logging
+import os
+import threading
+
+from pypinyin import core
+from pypinyin.constants import PHRASES_DICT, PINYIN_DICT
+from pypinyin.provider import SnapshotProvider
+from pypinyin.seg import mmseg
+from pypinyin.utils import _remove_dup_items
+
+logger = logging.getLogger(__name__)
+
+
+def parse(fp):
+    """逐行解析拼音库文件。
+
+    同一个字或词语出现多次时会合并所有的读音。
+
+    :param fp: 文本模式的文件对象或者字符串组成的可迭代对象
+    :return: ``(单字拼音库, 词语拼音库)`` ，比如
+             ``({0x4E2D: 'zhōng,zhòng'}, {'中国': [['zhōng'], ['guó']]})``
+    :rtype: tuple
+    :raises ValueError: 文件格式有误
+    """
+    pinyin_dict, phrases_dict = _parse(fp)
+    return pinyin_dict, dict(
+        (k, _phrase_pinyins(v)) for k, v in phrases_dict.items())
+
+
+def _parse(fp):
+    """与 :py:func:`parse` 相同，但是词语的读音保存为
+    ``'zhōng guó'`` 这样的字符串（合并了多个读音时为 list），
+    比较和保存都比 list 快得多
+    """
+    pinyin_dict = {}
+    phrases_dict = {}
+    for lineno, line in enumerate(fp, 1):
+        # U+4E2D: zhōng,zhòng  # 中
+        data = line.split('#', 1)[0].strip()
+        if not data:
+            continue
+        key, _, value = data.partition(':')
+        key = key.strip()
+        pinyins = value.replace(',', ' ').split()
+        if not key or not pinyins:
+            raise ValueError(
+                'line {0}: invalid line {1!r}'.format(lineno, line))
+
+        if key.startswith('U+'):
+            try:
+                code = int(key[2:], 16)
+            except ValueError:
+                raise ValueError(
+                    'line {0}: invalid code point {1!r}'.format(lineno, key))
+            old = pinyin_dict.get(code)
+            if old is not None:
+                pinyins = _remove_dup_items(old.split(',') + pinyins)
+            pinyin_dict[code] = ','.join(pinyins)
+            continue
+
+        if len(pinyins) != len(key):
+            raise ValueError(
+                'line {0}: {1} has {2} characters but {3} pinyins'.format(
+                    lineno, key, len(key), len(pinyins)))
+        old = phrases_dict.get(key)
+        if old is None:
+            phrases_dict[key] = ' '.join(pinyins)
+            continue
+        # 合并多音字的读音
+        old = _phrase_pinyins(old)
+        for item, py in zip(old, pinyins):
+            if py not in item:
+                item.append(py)
+        phrases_dict[key] = old
+    return pinyin_dict, phrases_dict
+
+
+def _phrase_pinyins(value):
+    """把 :py:func:`_parse` 中保存的词语读音转换为词语拼音库的格式"""
+    if isinstance(value, list):
+        return value
+    return [[x] for x in value.split()]
+
+
+def _diff(old, new):
+    """返回 ``(新增或修改的数据, 删除的 key 列表)``"""
+    changed = dict((k, v) for k, v in new.items() if old.get(k) != v)
+    removed = [k for k in old if k not in new]
+    return changed, removed
+
+
+def _stamp(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size
+
+
+class DictWatcher(object):
+    """载入拼音库文件，并在文件修改后只把变化的部分应用到拼音库中。
+
+    多个文件中有相同的字或词语时，后面的文件中的读音优先。
+    从文件中删除的字或词语会恢复为载入文件前的读音。
+
+    :param paths: 拼音库文件路径列表
+    :param provider: 把拼音库载入到这个 provider 中，
+                     默认载入到全局共享的拼音库中
+    :type provider: pypinyin.provider.DictProvider or
+                    pypinyin.provider.SnapshotProvider
+    """
+
+    def __init__(self, paths, provider=None):
+        self.paths = list(paths)
+        self._provider = provider
+        # path -> (文件的修改时间和大小, 单字拼音库, 词语拼音库)
+        self._files = {}
+        # 已经应用到拼音库中的数据
+        self._pinyin_dict = {}
+        self._phrases_dict = {}
+        # 被覆盖前的全局拼音库中的值
+        self._orig_pinyin = {}
+        self._orig_phrases = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self):
+        """检查文件是否有修改，重新载入有修改的文件并应用变化的部分。
+
+        文件格式有误时会抛出异常，拼音库保持不变。
+
+        :return: 重新载入了的文件列表
+        :rtype: list
+        """
+        with self._lock:
+            files = {}
+            for path in self.paths:
+                stamp = _stamp(path)
+                entry = self._files.get(path)
+                if entry is not None and entry[0] == stamp:
+                    continue
+                if stamp is None:   # 文件被删除了
+                    files[path] = (None, {}, {})
+                    continue
+                with io.open(path, encoding='utf-8') as fp:
+                    files[path] = (stamp,) + _parse(fp)
+
+            if files:
+                self._files.update(files)
+                self._apply()
+            return [path for path in self.paths if path in files]
+
+    def _apply(self):
+        pinyin_dict = {}
+        phrases_dict = {}
+        for path in self.paths:
+            _, single, phrases = self._files[path]
+            pinyin_dict.update(single)
+            phrases_dict.update(phrases)
+
+        set_pinyin, del_pinyin = _diff(self._pinyin_dict, pinyin_dict)
+        set_phrases, del_phrases = _diff(self._phrases_dict, phrases_dict)
+        set_phrases = dict(
+            (k, _phrase_pinyins(v)) for k, v in set_phrases.items())
+        provider = self._provider
+        if provider is None:
+            self._apply_global(set_pinyin, del_pinyin,
+                               set_phrases, del_phrases)
+        elif isinstance(provider, SnapshotProvider):
+            with provider.update() as draft:
+                _apply_provider(draft, set_pinyin, del_pinyin,
+                                set_phrases, del_phrases)
+        else:
+            _apply_provider(provider, set_pinyin, del_pinyin,
+                            set_phrases, del_phrases)
+        self._pinyin_dict = pinyin_dict
+        self._phrases_dict = phrases_dict
+
+    def _apply_global(self, set_pinyin, del_pinyin, set_phrases, del_phrases):
+        for key in set_pinyin:
+            if key not in self._orig_pinyin:
+                self._orig_pinyin[key] = PINYIN_DICT.get(key)
+        for key in set_phrases:
+            if key not in self._orig_phrases:
+                self._orig_phrases[key] = PHRASES_DICT.get(key)
+
+        with core.dict_update():
+            for key in del_pinyin:
+                _restore(PINYIN_DICT, key, self._orig_pinyin.pop(key))
+            removed = []
+            for key in del_phrases:
+                value = self._orig_phrases.pop(key)
+                _restore(PHRASES_DICT, key, value)
+                if value is None:
+                    removed.append(key)
+            mmseg.remove_words(mmseg.seg, removed)
+
+            core.load_single_dict(set_pinyin)
+            core.load_phrases_dict(set_phrases)
+
+    def start(self, interval):
+        """启动一个后台线程，每隔 ``interval`` 秒检查一次文件是否有修改
+
+        :param interval: 检查的时间间隔（秒）
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, args=(interval,))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """停止后台线程"""
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def _run(self, interval):
+        while not self._stop.wait(interval):
+            try:
+                self.check()
+            except Exception:
+                logger.exception('failed to reload pinyin dict files')
+
+
+def _restore(target, key, value):
+    if value is None:
+        target.pop(key, None)
+    else:
+        target[key] = value
+
+
+def _apply_provider(provider, set_pinyin, del_pinyin,
+                    set_phrases, del_phrases):
+    for key in del_pinyin:
+        provider.pinyin_dict.revert(key)
+    for key in del_phrases:
+        provider.phrases_dict.revert(key)
+    # 只会从 provider 自己的分词器中删除，基础分词器中的词语不受影响
+    provider.segmenter.remove(del_phrases)
+    provider.load_single_dict(set_pinyin)
+    provider.load_phrases_dict(set_phrases)
+
+
+def load(paths, provider=None):
+    """载入拼音库文件
+
+    :param paths: 拼音库文件路径列表
+    :param provider: 把拼音库载入到这个 provider 中，
+                     默认载入到全局共享的拼音库中
+    :return: 可以用于之后重新载入有修改的文件的 :py:class:`DictWatcher`
+    :rtype: DictWatcher
+    """
+    watcher = DictWatcher(paths, provider=provider)
+    watcher.check()
+    return watcher
+
+
+def watch(paths, provider=None, interval=None):
+    """载入拼音库文件并在文件修改后自动重新载入
+
+    :param paths: 拼音库文件路径列表
+    :param provider: 把拼音库载入到这个 provider 中，
+                     默认载入到全局共享的拼音库中
+    :param interval: 大于 0 时启动后台线程，每隔 ``interval`` 秒检查一次，
+                     否则需要自己调用 :py:meth:`DictWatcher.check`
+    :rtype: DictWatcher
+    """
+    watcher = load(paths, provider=provider)
+    if interval:
+        watcher.start(interval)
+    return watcher
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+import logging
+import threading
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Text
+from typing import Tuple
+from typing import Union
+
+from pypinyin.provider import DictProvider, SnapshotProvider
+
+TProvider = Union[DictProvider, SnapshotProvider]
+TPinyinDict = Dict[int, Text]
+TPhrasesDict = Dict[Text, List[List[Text]]]
+TRawPhrases = Dict[Text, Union[Text, List[List[Text]]]]
+
+logger = ...  # type: logging.Logger
+
+
+def parse(fp: Iterable[Text]) -> Tuple[TPinyinDict, TPhrasesDict]: ...
+
+
+def _parse(fp: Iterable[Text]) -> Tuple[TPinyinDict, TRawPhrases]: ...
+
+
+def _phrase_pinyins(
+        value: Union[Text, List[List[Text]]]) -> List[List[Text]]: ...
+
+
+def _diff(old: Dict[Any, Any],
+          new: Dict[Any, Any]) -> Tuple[Dict[Any, Any], List[Any]]: ...
+
+
+def _stamp(path: Text) -> Optional[Tuple[Any, int]]: ...
+
+
+class DictWatcher(object):
+    def __init__(self, paths: Iterable[Text],
+                 provider: Optional[TProvider] = ...) -> None:
+        self.paths = ...  # type: List[Text]
+        self._provider = ...  # type: Optional[TProvider]
+        self._files = ...  # type: Dict[Text, Tuple[Any, TPinyinDict, TRawPhrases]]
+        self._pinyin_dict = ...  # type: TPinyinDict
+        self._phrases_dict = ...  # type: TRawPhrases
+        self._orig_pinyin = ...  # type: Dict[int, Optional[Text]]
+        self._orig_phrases = ...  # type: Dict[Text, Any]
+        self._lock = ...  # type: threading.Lock
+        self._stop = ...  # type: threading.Event
+        self._thread = ...  # type: Optional[threading.Thread]
+        ...
+
+    def check(self) -> List[Text]: ...
+
+    def _apply(self) -> None: ...
+
+    def _apply_global(self, set_pinyin: TPinyinDict, del_pinyin: List[int],
+                      set_phrases: TPhrasesDict,
+                      del_phrases: List[Text]) -> None: ...
+
+    def start(self, interval: float) -> None: ...
+
+    def stop(self) -> None: ...
+
+    def _run(self, interval: float) -> None: ...
+
+
+def _restore(target: Any, key: Any, value: Any) -> None: ...
+
+
+def _apply_provider(provider: DictProvider, set_pinyin: TPinyinDict,
+                    del_pinyin: List[int], set_phrases: TPhrasesDict,
+                    del_phrases: List[Text]) -> None: ...
+
+
+def load(paths: Iterable[Text],
+         provider: Optional[TProvider] = ...) -> DictWatcher: ...
+
+
+def watch(paths: Iterable[Text], provider: Optional[TProvider] = ...,
+          interval: Optional[float] = ...) -> DictWatcher: ...
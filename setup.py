@@ -7,8 +7,10 @@ import sys
 
 try:
     from setuptools import setup
+    from setuptools.command.build_py import build_py
 except ImportError:
     from distutils.core import setup
+    from distutils.command.build_py import build_py
 
 current_dir = os.path.dirname(os.path.realpath(__file__))
 
@@ -20,19 +22,26 @@ packages = [
 ]
 
 requirements = []
-if sys.version_info[:2] < (2, 7):
-    requirements.append('argparse')
 if sys.version_info[:2] < (3, 4):
     requirements.append('enum34')
 if sys.version_info[:2] < (3, 5):
     requirements.append('typing')
 extras_require = {
-    ':python_version<"2.7"': ['argparse'],
     ':python_version<"3.4"': ['enum34'],
     ':python_version<"3.5"': ['typing'],
 }
 
 
+class BuildPy(build_py):
+    def find_package_modules(self, package, package_dir):
+        modules = build_py.find_package_modules(self, package, package_dir)
+        if sys.version_info[:2] < (3, 6):
+            # pypinyin.aio 使用了 Python 3.6+ 的语法，
+            # 旧版本的 Python 字节编译这个模块时会报 SyntaxError
+            modules = [m for m in modules if m[:2] != ('pypinyin', 'aio')]
+        return modules
+
+
 def get_meta():
     meta_re = re.compile(r"(?P<name>__\w+__) = '(?P<value>[^']+)'")
     meta_d = {}
@@ -70,8 +79,9 @@ setup(
     include_package_data=True,
     install_requires=requirements,
     extras_require=extras_require,
-    python_requires='>=2.6, !=3.0.*, !=3.1.*, !=3.2.*, <4',
+    python_requires='>=2.7, !=3.0.*, !=3.1.*, !=3.2.*, <4',
     zip_safe=False,
+    cmdclass={'build_py': BuildPy},
     entry_points={
         'console_scripts': [
             'pypinyin = pypinyin.__main__:main',
@@ -1,8 +1,19 @@
 # -*- coding: utf-8 -*-
 import os
+import sys
 
 import pytest
 
+from tests.utils import clean_modules
+
+# 导入 pypinyin 时读取的环境变量
+_IMPORT_ENV = ('PYPINYIN_PINYIN_DICT_MMAP', 'PYPINYIN_STATE_FILE')
+
+collect_ignore = []
+if sys.version_info < (3, 6):
+    # 使用了 async/await 语法
+    collect_ignore.append('test_aio.py')
+
 
 @pytest.fixture(autouse=True, scope='function')
 def setup():
@@ -13,3 +24,15 @@ def setup():
     finally:
         os.environ.pop('PYPINYIN_NO_PHRASES', None)
         os.environ.pop('PYPINYIN_NO_DICT_COPY', None)
+
+
+@pytest.fixture(scope='function')
+def cleanup():
+    """测试前后删除所有已导入的 pypinyin 模块，测试中可以重新导入 pypinyin"""
+    clean_modules()
+    try:
+        yield
+    finally:
+        for name in _IMPORT_ENV:
+            os.environ.pop(name, None)
+        clean_modules()
@@ -4,6 +4,7 @@ from __future__ import unicode_literals
 import pytest
 
 from pypinyin import pinyin, load_phrases_dict
+from pypinyin.compat import text_type, unichr
 from pypinyin.contrib import mmseg
 
 seg_test = mmseg.Seg(mmseg.PrefixSet())
@@ -103,6 +104,127 @@ def test_mmseg_and_jieba_for_pinyin(input, jieba_ret, mmseg_ret):
     assert pinyin(mmseg.seg.cut(input)) == mmseg_ret
 
 
+def test_prefix_set():
+    prefix_set = mmseg.PrefixSet()
+    prefix_set.train(['中国', '中国人民', '北京', ''])
+
+    assert '中' in prefix_set
+    assert '中国人' in prefix_set
+    assert '中国人民' in prefix_set
+    assert '国' not in prefix_set
+    assert '中国人民银行' not in prefix_set
+    assert '' not in prefix_set
+
+    assert prefix_set.match('中国人民银行') == (4, True)
+    assert prefix_set.match('中国人') == (3, False)
+    assert prefix_set.match('我爱北京', 2) == (2, True)
+    assert prefix_set.match('我爱北京', 4) == (0, False)
+    assert prefix_set.match('') == (0, False)
+    assert prefix_set.max_len == 4
+    assert mmseg.Seg(prefix_set).max_len == 4
+
+
+def test_prefix_set_many_words():
+    words = ['%c%c%c' % (0x4e00 + i % 97, 0x4e00 + i, 0x4e00 + i * 7 % 1000)
+             for i in range(3000)]
+    prefix_set = mmseg.PrefixSet()
+    prefix_set.train(words[:1500])
+    prefix_set.train(words[1500:])
+
+    for word in words:
+        assert prefix_set.match(word) == (3, True)
+        assert prefix_set.match(word[:2]) == (2, False)
+
+
+class CountingText(text_type):
+    """记录切片复制了多少个字符的字符串"""
+
+    def __getitem__(self, key):
+        value = super(CountingText, self).__getitem__(key)
+        if isinstance(key, slice):
+            self.stats['copied'] += len(value)
+            value = CountingText(value)
+            value.stats = self.stats
+        else:
+            self.stats['probes'] += 1
+        return value
+
+
+def _adversarial_seg():
+    # 输入由一直能匹配前缀但是永远组不成词语的字符组成
+    prefix_set = mmseg.PrefixSet()
+    prefix_set.train(['金融寡头', '融寡头目', '寡头政治'])
+    return mmseg.Seg(prefix_set, no_non_phrases=True)
+
+
+@pytest.mark.parametrize('no_non_phrases', [True, False])
+def test_cut_adversarial_input_work_is_linear(no_non_phrases):
+    seg = _adversarial_seg()
+    seg._no_non_phrases = no_non_phrases
+    size = 3000
+    text = CountingText('金融寡' * size)
+    text.stats = {'copied': 0, 'probes': 0}
+
+    result = list(seg.cut(text))
+
+    assert ''.join(result) == '金融寡' * size
+    n = len(text)
+    max_len = 4
+    # 切片复制的字符总数和 n 成正比，而不是 n * n
+    assert text.stats['copied'] <= 2 * n
+    assert text.stats['probes'] <= n * (max_len + 1)
+
+
+def _reference_cut(prefix_set, words, no_non_phrases, text):
+    # 原来基于切片剩余文本的实现
+    remain = text
+    while remain:
+        matched = ''
+        for index in range(len(remain)):
+            word = remain[:index + 1]
+            if word in prefix_set:
+                matched = word
+            else:
+                if matched and (not no_non_phrases or matched in words):
+                    yield matched
+                    remain = remain[index:]
+                elif no_non_phrases:
+                    yield word[0]
+                    remain = remain[index + 2 - len(word):]
+                else:
+                    yield word
+                    remain = remain[index + 1:]
+                break
+        else:
+            if no_non_phrases and remain not in words:
+                for x in remain:
+                    yield x
+            else:
+                yield remain
+            break
+
+
+@pytest.mark.parametrize('no_non_phrases', [True, False])
+def test_cut_same_as_reference(no_non_phrases):
+    import random
+
+    rand = random.Random(1)
+    alphabet = 'abcd'
+    words = set(
+        ''.join(rand.choice(alphabet) for _ in range(rand.randint(1, 5)))
+        for _ in range(30)
+    )
+    prefix_set = mmseg.PrefixSet()
+    prefix_set.train(words)
+    seg = mmseg.Seg(prefix_set, no_non_phrases=no_non_phrases)
+
+    for _ in range(500):
+        text = ''.join(
+            rand.choice(alphabet) for _ in range(rand.randint(0, 20)))
+        assert list(seg.cut(text)) == list(
+            _reference_cut(prefix_set, words, no_non_phrases, text))
+
+
 def test_retrain():
     seg = mmseg.seg
     assert list(seg.cut('啊啊啊')) == ['啊', '啊', '啊']
@@ -114,6 +236,90 @@ def test_retrain():
     assert list(seg.cut('男孩儿')) == ['男孩儿']
 
 
+def test_prefix_set_remove():
+    prefix_set = mmseg.PrefixSet()
+    prefix_set.train(['中国', '中国人', '中华', '人民'])
+    assert len(prefix_set) == 4
+    assert prefix_set.nodes == 6
+    assert prefix_set.max_len == 3
+
+    # 重复训练不会增加引用数
+    prefix_set.train(['中国'])
+    prefix_set.remove(['中国人', '不存在', ''])
+    assert len(prefix_set) == 3
+    assert prefix_set.nodes == 5
+    assert prefix_set.max_len == 2
+    assert '中国人' not in prefix_set
+    assert prefix_set.match('中国人') == (2, True)
+
+    # 前缀仍然被 '中国' 使用
+    prefix_set.remove(['中华'])
+    assert '中' in prefix_set
+    assert '中华' not in prefix_set
+    prefix_set.remove(['中国'])
+    assert '中' not in prefix_set
+    assert prefix_set.match('中国') == (0, False)
+    assert len(prefix_set) == 1
+    assert prefix_set.nodes == 2
+
+    # 删除的节点会被复用
+    words = len(prefix_set._words)
+    prefix_set.train(['中国人'])
+    assert len(prefix_set._words) == words
+    assert prefix_set.nodes == 5
+    assert prefix_set.match('中国人') == (3, True)
+
+
+def test_prefix_set_remove_compact():
+    prefix_set = mmseg.PrefixSet()
+    words = ['啊' + unichr(0x4e00 + i) + unichr(0x4e00 + j)
+             for i in range(30) for j in range(10)]
+    prefix_set.train(words)
+    for n in range(0, len(words), 7):
+        prefix_set.remove(words[n:n + 3])
+        prefix_set.train(words[n:n + 1])
+    expected = set(words[n] for n in range(0, len(words), 7))
+    expected.update(w for n, w in enumerate(words) if n % 7 >= 3)
+    assert len(prefix_set) == len(expected)
+    for word in words:
+        assert (prefix_set.match(word) == (3, True)) == (word in expected)
+    prefix_set._compact()
+    for word in words:
+        assert (prefix_set.match(word) == (3, True)) == (word in expected)
+
+
+def test_seg_replace():
+    seg = mmseg.Seg(mmseg.PrefixSet(), no_non_phrases=True)
+    seg.train(['金融寡头', '行业'])
+    assert list(seg.cut('金融行业')) == ['金', '融', '行业']
+    assert seg.size == 2
+
+    seg.replace(['金融寡头'], ['金融'])
+    assert list(seg.cut('金融行业')) == ['金融', '行业']
+    assert list(seg.cut('金融寡头')) == ['金融', '寡', '头']
+    assert seg.size == 2
+    assert seg.max_len == 2
+
+    seg.remove(['金融', '行业'])
+    assert list(seg.cut('金融行业')) == ['金', '融', '行', '业']
+    assert seg.size == 0
+    assert seg.max_len == 0
+
+
+def test_train_words():
+    from pypinyin.seg.mmseg import _LazySeg, train_words
+
+    seg = mmseg.Seg(mmseg.PrefixSet(), no_non_phrases=True)
+    train_words(seg, ['啊啊'])
+    assert list(seg.cut('啊啊啊')) == ['啊啊', '啊']
+
+    lazy = _LazySeg(mmseg.PrefixSet(), no_non_phrases=True)
+    train_words(lazy, ['啊啊'])
+    # 还没训练过的分词器第一次分词时才会训练
+    assert not lazy.loaded
+    assert '啊啊' not in lazy._prefix_set
+
+
 def test_phrases():
     seg = mmseg.seg
     assert list(seg.cut('你要重新考虑这条建议')) == \
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pypinyin import aio, core, lazy_pinyin, pinyin, slug, Style
+
+TEXT = '你好，我是中国人，我爱我的祖国。abc 重庆银行' * 30
+
+
+def run(coro):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def collect(agen):
+    async def consume():
+        return [x async for x in agen]
+    return consume()
+
+
+@pytest.mark.parametrize('executor', [None, aio.INLINE])
+@pytest.mark.parametrize('chunk_size', [1, 7, aio.CHUNK_SIZE])
+def test_same_as_sync(executor, chunk_size):
+    kwargs = dict(executor=executor, chunk_size=chunk_size, threshold=10)
+    assert run(aio.pinyin(TEXT, heteronym=True, **kwargs)) == \
+        pinyin(TEXT, heteronym=True)
+    assert run(aio.lazy_pinyin(TEXT, style=Style.TONE3, v_to_u=True,
+                               **kwargs)) == \
+        lazy_pinyin(TEXT, style=Style.TONE3, v_to_u=True)
+    assert run(aio.slug(TEXT, separator=' ', **kwargs)) == \
+        slug(TEXT, separator=' ')
+    assert run(collect(aio.iter_pinyin(TEXT, **kwargs))) == pinyin(TEXT)
+
+
+def test_list_input():
+    hans = ['你好', '中国', 'abc'] * 10
+    assert run(aio.pinyin(hans, threshold=1, chunk_size=4)) == pinyin(hans)
+    assert run(aio.pinyin(iter(hans), threshold=1)) == pinyin(hans)
+
+
+def test_async_iterable_input():
+    async def chunks():
+        for start in range(0, len(TEXT), 3):
+            yield TEXT[start:start + 3]
+
+    assert run(collect(aio.iter_pinyin(chunks()))) == pinyin(TEXT)
+    assert run(aio.lazy_pinyin(chunks(), executor=aio.INLINE)) == \
+        lazy_pinyin(TEXT)
+
+
+def test_custom_executor():
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        assert run(aio.lazy_pinyin(TEXT, executor=executor, threshold=1)) == \
+            lazy_pinyin(TEXT)
+
+
+def test_small_input_is_inline(monkeypatch):
+    async def fail(*args, **kwargs):
+        raise AssertionError('should not be called')
+
+    monkeypatch.setattr(aio, '_run', fail)
+    assert run(aio.lazy_pinyin('中心')) == ['zhong', 'xin']
+
+
+def test_does_not_block_loop():
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(1)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        result = await aio.lazy_pinyin(TEXT, executor=aio.INLINE,
+                                       threshold=1, chunk_size=20)
+        task.cancel()
+        return result
+
+    assert run(main()) == lazy_pinyin(TEXT)
+    assert len(ticks) > 10
+
+
+def test_cancel(monkeypatch):
+    calls = []
+    convert = aio._convert
+
+    def counting_convert(*args):
+        calls.append(1)
+        return convert(*args)
+
+    monkeypatch.setattr(aio, '_convert', counting_convert)
+
+    async def main():
+        task = asyncio.ensure_future(aio.pinyin(
+            TEXT, executor=aio.INLINE, threshold=1, chunk_size=5))
+        for _ in range(3):
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run(main())
+    assert 0 < len(calls) < len(TEXT) // 5
+
+
+def test_feed_runs_in_executor(monkeypatch):
+    threads = []
+    feed = core._SegmentBuffer.feed
+
+    def recording_feed(self, chunk):
+        threads.append(threading.current_thread())
+        return feed(self, chunk)
+
+    monkeypatch.setattr(core._SegmentBuffer, 'feed', recording_feed)
+
+    async def chunks():
+        for start in range(0, len(TEXT), 50):
+            yield TEXT[start:start + 50]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for kwargs in (dict(executor=None), dict(executor=executor)):
+            kwargs.update(threshold=1, chunk_size=50)
+            assert run(aio.lazy_pinyin(TEXT, **kwargs)) == lazy_pinyin(TEXT)
+            assert run(collect(aio.iter_pinyin(chunks(), **kwargs))) == \
+                pinyin(TEXT)
+    assert threads
+    assert threading.current_thread() not in threads
+
+    del threads[:]
+    assert run(aio.lazy_pinyin(TEXT, executor=aio.INLINE, threshold=1,
+                               chunk_size=50)) == lazy_pinyin(TEXT)
+    assert set(threads) == set([threading.current_thread()])
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from pypinyin import (
+    lazy_pinyin, lazy_pinyin_batch, pinyin, pinyin_batch, slug, slug_batch,
+    Style
+)
+from pypinyin.core import _mix_pinyins
+
+DATA = ['中心', '重心', '张三', '中心', 'abc', '', ['你好', '中国'],
+        '战略', '衣裳', '中心']
+
+
+def test_pinyin_batch():
+    assert list(pinyin_batch(DATA)) == [pinyin(x) for x in DATA]
+    assert list(pinyin_batch(DATA, style=Style.TONE3, heteronym=True)) == [
+        pinyin(x, style=Style.TONE3, heteronym=True) for x in DATA]
+    assert list(pinyin_batch(
+        DATA, style=Style.TONE3, v_to_u=True, neutral_tone_with_five=True
+    )) == [
+        pinyin(x, style=Style.TONE3, v_to_u=True,
+               neutral_tone_with_five=True)
+        for x in DATA
+    ]
+
+
+def test_lazy_pinyin_batch():
+    assert list(lazy_pinyin_batch(DATA)) == [lazy_pinyin(x) for x in DATA]
+    assert list(lazy_pinyin_batch(
+        DATA, style=Style.TONE2, errors='ignore', v_to_u=True)) == [
+        lazy_pinyin(x, style=Style.TONE2, errors='ignore', v_to_u=True)
+        for x in DATA
+    ]
+
+
+def test_slug_batch():
+    assert list(slug_batch(DATA)) == [slug(x) for x in DATA]
+    assert list(slug_batch(DATA, separator=' ', style=Style.FIRST_LETTER)) == [
+        slug(x, separator=' ', style=Style.FIRST_LETTER) for x in DATA]
+
+
+def test_batch_accepts_generator():
+    def gen():
+        for x in DATA:
+            yield x
+
+    result = lazy_pinyin_batch(gen())
+    assert next(result) == ['zhong', 'xin']
+    assert list(result) == [lazy_pinyin(x) for x in DATA[1:]]
+
+
+def test_batch_dedup(monkeypatch):
+    converter = _mix_pinyins[False, False]._converter
+    calls = []
+    orig_convert = converter._convert_token
+
+    def convert(words, *args, **kwargs):
+        calls.append(words)
+        return orig_convert(words, *args, **kwargs)
+
+    monkeypatch.setattr(converter, '_convert_token', convert)
+
+    list(pinyin_batch(['中心', '重心']))
+    expected_calls = calls[:]
+    del calls[:]
+
+    result = list(pinyin_batch(['中心', '中心', '重心', '中心']))
+    assert result == [[['zhōng'], ['xīn']], [['zhōng'], ['xīn']],
+                      [['zhòng'], ['xīn']], [['zhōng'], ['xīn']]]
+    assert calls == expected_calls
+
+    # 返回的结果互不影响
+    result[0][0][0] = 'x'
+    assert result[1] == [['zhōng'], ['xīn']]
+
+    del calls[:]
+    assert list(lazy_pinyin_batch(['中心', '重心', '中心'], dedup_size=1)) == [
+        ['zhong', 'xin'], ['zhong', 'xin'], ['zhong', 'xin']]
+    assert len(calls) > len(expected_calls)
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import sys
+
+import pytest
+
+from pypinyin.block_dict import BLOCK_NAMES, BlockPinyinDict, block_of
+
+BLOCKS = {
+    'basic': {0x4E2D: 'zhōng,zhòng', 0x56FD: 'guó'},
+    'ext_a': {0x3400: 'qiū'},
+    'ext_b': {0x20000: 'hē'},
+}
+
+
+def _loader(block):
+    return BLOCKS.get(block, {})
+
+
+def test_block_of():
+    assert block_of(0x4E2D) == 'basic'
+    assert block_of(0x3007) == 'basic'
+    assert block_of(0x41) == 'basic'
+    assert block_of(0x3400) == 'ext_a'
+    assert block_of(0x4DBF) == 'ext_a'
+    assert block_of(0xF900) == 'compat'
+    assert block_of(0x2F800) == 'compat'
+    assert block_of(0x20000) == 'ext_b'
+    assert block_of(0x2A700) == 'ext_c'
+    assert block_of(0x2B740) == 'ext_d'
+    assert block_of(0x30EDD) == 'ext_efg'
+
+
+def test_load_on_demand():
+    d = BlockPinyinDict(_loader)
+    assert d.loaded_blocks == ['basic']
+    assert d[0x4E2D] == 'zhōng,zhòng'
+    assert d.get(0x41) is None
+    assert d.loaded_blocks == ['basic']
+
+    assert d.get(0x3400) == 'qiū'
+    assert d.loaded_blocks == ['basic', 'ext_a']
+    assert 0x20001 not in d
+    assert d.loaded_blocks == ['basic', 'ext_a', 'ext_b']
+    assert d[0x20000] == 'hē'
+    with pytest.raises(KeyError):
+        d[0x20001]
+    assert d.get('a', 'x') == 'x'
+
+
+def test_write_loads_block():
+    d = BlockPinyinDict(_loader)
+    d[0x3401] = 'tiàn'
+    assert d.loaded_blocks == ['basic', 'ext_a']
+    assert d[0x3400] == 'qiū'
+    assert d[0x3401] == 'tiàn'
+
+    del d[0x20000]
+    assert 0x20000 not in d
+    assert d.get(0x20000) is None
+    d.update({0x2A700: 'a'})
+    assert d.loaded_blocks == ['basic', 'ext_a', 'ext_b', 'ext_c']
+    # 区块中的数据是复制过来的
+    assert BLOCKS['ext_b'] == {0x20000: 'hē'}
+
+
+def test_full_operations():
+    d = BlockPinyinDict(_loader)
+    assert len(d) == 4
+    assert d.loaded_blocks == list(BLOCK_NAMES)
+    assert dict(d) == {0x4E2D: 'zhōng,zhòng', 0x56FD: 'guó',
+                       0x3400: 'qiū', 0x20000: 'hē'}
+    assert BlockPinyinDict(_loader) == d
+    assert sorted(BlockPinyinDict(_loader).keys()) == sorted(d)
+
+
+def test_loaded_values():
+    d = BlockPinyinDict(_loader)
+    assert sorted(d.loaded_values()) == ['guó', 'zhōng,zhòng']
+    assert d.loaded_blocks == ['basic']
+
+
+def test_copy_and_clear():
+    d = BlockPinyinDict(_loader)
+    new = d.copy()
+    new[0x3400] = 'qiu'
+    assert d.loaded_blocks == ['basic']
+    assert d[0x3400] == 'qiū'
+    assert new[0x3400] == 'qiu'
+
+    d.clear()
+    assert d.get(0x20000) is None
+    assert len(d) == 0
+    d.update({0x20000: 'hē'})
+    assert dict(d) == {0x20000: 'hē'}
+
+
+def test_builtin_blocks(cleanup):
+    from pypinyin.block_dict import BlockPinyinDict
+    from pypinyin.constants import PINYIN_DICT
+    from pypinyin.pinyin_dict import pinyin_dict
+
+    assert isinstance(PINYIN_DICT, BlockPinyinDict)
+    assert PINYIN_DICT == pinyin_dict
+
+
+def test_convert_does_not_load_blocks(cleanup):
+    import pypinyin
+    from pypinyin.constants import PINYIN_DICT
+
+    assert 'pypinyin.pinyin_dict' not in sys.modules
+    assert pypinyin.lazy_pinyin('中国', style=pypinyin.TONE3) == [
+        'zhong1', 'guo2']
+    pypinyin.warmup(freeze=False)
+    assert PINYIN_DICT.loaded_blocks == ['basic']
+
+    assert pypinyin.lazy_pinyin('㐀', style=pypinyin.TONE3) == ['qiu1']
+    assert PINYIN_DICT.loaded_blocks == ['basic', 'ext_a']
+
+
+def test_converter_lookup(monkeypatch):
+    from pypinyin.block_dict import BlockPinyinDict
+    from pypinyin.constants import Style
+    from pypinyin.converter import DefaultConverter
+
+    calls = []
+    get = BlockPinyinDict.get
+
+    def spy_get(self, key, default=None):
+        calls.append(key)
+        return get(self, key, default)
+
+    monkeypatch.setattr(BlockPinyinDict, 'get', spy_get)
+    converter = DefaultConverter()
+    converter._pinyin_dict = BlockPinyinDict(_loader)
+    # 已加载的字直接通过 dict.get 查询
+    assert converter.convert('中', Style.TONE, False, 'default', True) == \
+        [['zhōng']]
+    assert calls == []
+    # 没有找到时才会加载区块
+    assert converter.convert('㐀', Style.TONE, False, 'default', True) == \
+        [['qiū']]
+    assert calls == [0x3400]
+    assert converter._pinyin_dict.loaded_blocks == ['basic', 'ext_a']
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import pytest
+
+from pypinyin import Style, load_phrases_dict, load_single_dict
+from pypinyin.cache import LRUCache, make_key
+from pypinyin.constants import PINYIN_DICT
+from pypinyin.core import (
+    Pinyin, cache_info, disable_cache, enable_cache, lazy_pinyin, pinyin,
+    slug
+)
+
+
+@pytest.fixture
+def module_cache():
+    enable_cache(maxsize=8)
+    try:
+        yield
+    finally:
+        disable_cache()
+
+
+def test_lru_cache():
+    cache = LRUCache(2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)   # 淘汰最久没有使用的 b
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+
+    info = cache.info()
+    assert (info.hits, info.misses, info.evictions) == (2, 1, 1)
+    assert (info.maxsize, info.currsize) == (2, 2)
+
+    cache.clear()
+    assert cache.info() == (0, 0, 0, 2, 0)
+
+
+def test_make_key():
+    assert make_key('中国', 1) == ('中国', 1)
+    assert make_key(['中国', '人'], 1) == (('中国', '人'), 1)
+    assert make_key(x for x in ['中国']) is None
+
+
+def test_pinyin_cls_cache():
+    my_pinyin = Pinyin(cache_size=2)
+    assert my_pinyin.pinyin('中心') == [['zhōng'], ['xīn']]
+
+    result = my_pinyin.pinyin('中心')
+    assert result == [['zhōng'], ['xīn']]
+    result[0].append('xxx')
+    assert my_pinyin.pinyin('中心') == [['zhōng'], ['xīn']]
+    assert my_pinyin.lazy_pinyin('中心') == ['zhong', 'xin']
+    assert my_pinyin.pinyin('中心', heteronym=True) == [
+        ['zhōng', 'zhòng'], ['xīn']]
+
+    info = my_pinyin.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (2, 3, 1)
+    assert info.currsize == 2
+
+    my_pinyin.cache_clear()
+    assert my_pinyin.cache_info().currsize == 0
+    assert Pinyin().cache_info() is None
+
+
+def test_module_cache(module_cache):
+    assert pinyin('中心') == [['zhōng'], ['xīn']]
+    pinyin('中心')[0][0] = 'x'
+    assert pinyin('中心') == [['zhōng'], ['xīn']]
+    assert pinyin('战略', v_to_u=True, style=Style.NORMAL) == [
+        ['zhan'], ['lüe']]
+    assert pinyin('战略', style=Style.NORMAL) == [['zhan'], ['lve']]
+
+    assert lazy_pinyin('中心') == ['zhong', 'xin']
+    lazy_pinyin('中心').append('x')
+    assert lazy_pinyin('中心') == ['zhong', 'xin']
+
+    assert slug('中心') == 'zhong-xin'
+    assert slug('中心', separator=' ') == 'zhong xin'
+    assert slug(['中心']) == 'zhong-xin'
+
+    info = cache_info()
+    assert info.hits == 4
+    assert info.misses == 7
+
+
+def test_module_cache_not_cache_generator(module_cache):
+    assert lazy_pinyin(x for x in ['中心']) == ['zhong', 'xin']
+    assert cache_info().currsize == 0
+
+
+def test_cache_invalidate_after_load_dict(module_cache):
+    my_pinyin = Pinyin(cache_size=10)
+    assert my_pinyin.lazy_pinyin('雪碧') == ['xue', 'bi']
+    assert lazy_pinyin('雪碧') == ['xue', 'bi']
+
+    load_phrases_dict({'雪碧': [['xuě'], ['bì']]})
+    assert my_pinyin.cache_info().currsize == 0
+    assert cache_info().currsize == 0
+
+    orig = PINYIN_DICT[ord('碧')]
+    try:
+        load_single_dict({ord('碧'): 'bǐ'})
+        assert my_pinyin.pinyin('碧') == [['bǐ']]
+        assert pinyin('碧') == [['bǐ']]
+    finally:
+        load_single_dict({ord('碧'): orig})
+
+
+def test_cache_disabled_by_default():
+    assert cache_info() is None
@@ -3,7 +3,12 @@
 
 from __future__ import unicode_literals
 
-from pypinyin.runner import get_parser
+import io
+import sys
+
+from pypinyin import runner
+from pypinyin.compat import PY2
+from pypinyin.runner import get_parser, StripReader
 
 
 def test_default():
@@ -30,6 +35,49 @@ def test_custom():
     assert options.hans == '你好啊'
 
 
+def test_strip_reader():
+    fp = StripReader(io.StringIO('  \n 你好 \n 中国 \n\n'))
+    data = []
+    while True:
+        chunk = fp.read(3)
+        if not chunk:
+            break
+        data.append(chunk)
+    assert ''.join(data) == '你好 \n 中国'
+
+
+class FakeStdin(io.BytesIO if PY2 else io.StringIO):
+    encoding = 'utf-8'
+
+    def isatty(self):
+        return False
+
+
+def fake_stdin(text):
+    # Python 2 中 stream_stdin 会用 codecs 解码标准输入，需要传入 bytes
+    if PY2:
+        text = text.encode('utf-8')
+    return FakeStdin(text)
+
+
+def test_main_stream_stdin(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr(sys, 'stdin', fake_stdin('  你好abc重庆\n'))
+    monkeypatch.setattr(sys, 'stdout', out)
+    monkeypatch.setattr(sys, '__stdout__', out)
+    monkeypatch.setattr(sys, 'argv', ['pypinyin', '-s', 'zhao'])
+    runner.main()
+    assert out.getvalue() == 'ni hao abc chong qing\n'
+
+    out.truncate(0)
+    out.seek(0)
+    monkeypatch.setattr(sys, 'stdin', fake_stdin('你好abc重庆'))
+    monkeypatch.setattr(sys, 'argv',
+                        ['pypinyin', '-f', 'slug', '-p', '_', '-s', 'zhao'])
+    runner.main()
+    assert out.getvalue() == 'ni_hao_abc_chong_qing\n'
+
+
 if __name__ == '__main__':
     import pytest
     pytest.cmdline.main()
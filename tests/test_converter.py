@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-from pypinyin.constants import Style
+from pypinyin.constants import PHRASES_DICT, Style
 from pypinyin.converter import DefaultConverter
 
 
@@ -86,3 +86,106 @@ def test_post_pinyin_return_value_phrase_pinyin():
         han, Style.TONE3, False, 'ignore', True) == [['bei3'], ['jing1']]
     assert A().convert(
         han, Style.TONE3, False, 'ignore', True) == [['zhao1'], ['yang2']]
+
+
+def test_post_pinyin_can_modify_pinyin_data():
+    class A(DefaultConverter):
+        def post_pinyin(self, han, heteronym, pinyin, **kwargs):
+            pinyin[0][0] = 'zhāo'
+            pinyin[0].append('yáng')
+
+    orig = PHRASES_DICT['银行']
+    assert A().convert(
+        '银行', Style.TONE3, True, 'ignore', True) == [
+        ['zhao1', 'yang2'], ['hang2']]
+    assert A().convert(
+        '银', Style.TONE3, True, 'ignore', True) == [['zhao1', 'yang2']]
+    assert PHRASES_DICT['银行'] == orig
+    assert DefaultConverter().convert(
+        '银行', Style.TONE3, True, 'ignore', True) == [['yin2'], ['hang2']]
+    assert DefaultConverter().convert(
+        '银', Style.TONE3, False, 'ignore', True) == [['yin2']]
+
+
+def test_post_pinyin_only_called_when_overridden(monkeypatch):
+    class A(DefaultConverter):
+        pass
+
+    class B(DefaultConverter):
+        def __init__(self):
+            # 没有调用父类的 __init__
+            self.calls = []
+
+        def post_pinyin(self, han, heteronym, pinyin, **kwargs):
+            self.calls.append(han)
+
+    def post_pinyin(*args, **kwargs):
+        raise AssertionError('should not be called')
+
+    a = A()
+    monkeypatch.setattr(A, 'post_pinyin', post_pinyin)
+    assert a.convert(
+        '银行', Style.TONE3, False, 'ignore', True) == [['yin2'], ['hang2']]
+    assert a.convert(
+        '银', Style.TONE3, False, 'ignore', True) == [['yin2']]
+
+    b = B()
+    assert b.convert(
+        '银行', Style.TONE3, False, 'ignore', True) == [['yin2'], ['hang2']]
+    assert b.convert(
+        '银', Style.TONE3, False, 'ignore', True) == [['yin2']]
+    assert b.calls == ['银行', '银']
+
+
+def test_bind_hooks():
+    class Pre(DefaultConverter):
+        def pre_convert_style(self, han, orig_pinyin, style, strict,
+                              **kwargs):
+            return 'a'
+
+    class Post(DefaultConverter):
+        def post_convert_style(self, han, orig_pinyin, converted_pinyin,
+                               style, strict, **kwargs):
+            return converted_pinyin + 'b'
+
+    class NoPinyin(DefaultConverter):
+        def post_handle_nopinyin(self, chars, style, heteronym, errors,
+                                 strict, pinyin, **kwargs):
+            return 'c'
+
+    default = DefaultConverter()
+    assert default._convert == default._convert_without_hooks
+    assert default._handle_nopinyin == default._handle_nopinyin_without_hooks
+    post = Post()
+    assert post._convert == post._convert_with_post_hook
+    pre = Pre()
+    assert pre._convert == pre.__class__._convert.__get__(pre)
+    nopinyin = NoPinyin()
+    assert '_handle_nopinyin' not in nopinyin.__dict__
+
+    args = (Style.TONE3, False, 'default', True)
+    assert default.convert('中', *args) == [['zhong1']]
+    assert default.convert('a', *args) == [['a']]
+    assert pre.convert('中', *args) == [['a']]
+    assert post.convert('中', *args) == [['zhong1b']]
+    assert nopinyin.convert('a', *args) == [['c']]
+    assert nopinyin.convert('中', *args) == [['zhong1']]
+
+
+def test_hooks_without_init():
+    class A(DefaultConverter):
+        def __init__(self):
+            pass
+
+        def pre_convert_style(self, han, orig_pinyin, style, strict,
+                              **kwargs):
+            return 'a'
+
+        def pre_handle_nopinyin(self, chars, style, heteronym, errors,
+                                strict, **kwargs):
+            return 'b'
+
+    args = (Style.TONE3, True, 'default', True)
+    assert A().convert('中国', *args) == [['a'], ['a']]
+    assert A().convert('中', *args) == [['a']]
+    assert A().convert('abc', *args) == [['b']]
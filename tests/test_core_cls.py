@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 from pypinyin.constants import Style
+from pypinyin.converter import DefaultConverter
 from pypinyin.core import (
     Pinyin, to_fixed, handle_nopinyin, single_pinyin, phrase_pinyin)
 
@@ -42,6 +43,22 @@ def test_use_seg_function_change_seg_func():
     assert mypinyin.pinyin('测试') == [['a'], ['b'], ['c']]
 
 
+def test_use_tokens_only_without_custom_seg_and_convert():
+    class A(Pinyin):
+        def get_seg(self, **kwargs):
+            return lambda hans: [hans]
+
+    class B(DefaultConverter):
+        def convert(self, words, style, heteronym, errors, strict, **kwargs):
+            return [[words]]
+
+    assert Pinyin()._use_tokens
+    assert not A()._use_tokens
+    assert not Pinyin(B())._use_tokens
+    assert A().pinyin('测试abc', style=Style.TONE3) == [['测试abc']]
+    assert Pinyin(B()).pinyin('测试abc') == [['测'], ['试'], ['abc']]
+
+
 def test_to_fixed_for_compatibly():
     assert to_fixed('cè', Style.INITIALS) == 'c'
 
@@ -56,3 +73,27 @@ def test_single_pinyin_for_compatibly():
 
 def test_phrase_pinyin_for_compatibly():
     assert phrase_pinyin('测试', Style.TONE, False) == [['cè'], ['shì']]
+
+
+def test_module_functions_reuse_converter(monkeypatch):
+    from pypinyin import core, lazy_pinyin, pinyin
+    from pypinyin.converter import DefaultConverter
+
+    created = []
+    orig_init = DefaultConverter.__init__
+
+    def init(self, **kwargs):
+        created.append(self)
+        orig_init(self, **kwargs)
+
+    monkeypatch.setattr(DefaultConverter, '__init__', init)
+
+    for v_to_u in (False, True):
+        for neutral_tone_with_five in (False, True):
+            pinyin('战略', v_to_u=v_to_u,
+                   neutral_tone_with_five=neutral_tone_with_five)
+            lazy_pinyin('战略', v_to_u=v_to_u,
+                        neutral_tone_with_five=neutral_tone_with_five)
+
+    assert created == []
+    assert core._mix_pinyins[True, True] is core._mix_pinyins[1, 1]
@@ -2,7 +2,6 @@
 # -*- coding: utf-8 -*-
 from __future__ import unicode_literals
 
-import copy
 try:
     from importlib import reload
 except ImportError:
@@ -13,21 +12,6 @@ import sys
 import pytest
 
 
-@pytest.fixture(scope='function')
-def cleanup():
-    _clean()
-    try:
-        yield
-    finally:
-        _clean()
-
-
-def _clean():
-    for module in copy.copy(sys.modules):
-        if module.startswith('pypinyin'):
-            sys.modules.pop(module, None)
-
-
 def test_env(cleanup):
     os.environ['PYPINYIN_NO_PHRASES'] = 'true'
     import pypinyin.core  # noqa
@@ -39,9 +23,77 @@ def test_env(cleanup):
 def test_no_copy(cleanup):
     """ 禁用copy操作的测试 """
     import pypinyin.core  # noqa
+    import pypinyin.pinyin_dict  # noqa
 
     assert pypinyin.core.PINYIN_DICT is not pypinyin.pinyin_dict.pinyin_dict
 
     os.environ['PYPINYIN_NO_DICT_COPY'] = 'true'
     reload(pypinyin.constants)
     assert pypinyin.constants.PINYIN_DICT is pypinyin.pinyin_dict.pinyin_dict
+
+
+def test_lazy_load_phrases_dict(cleanup):
+    import pypinyin
+    from pypinyin.seg import mmseg
+
+    assert 'pypinyin.phrases_dict' not in sys.modules
+    assert not pypinyin.constants.PHRASES_DICT.loaded
+    assert pypinyin.lazy_pinyin('中', style=pypinyin.FIRST_LETTER) == ['z']
+    assert 'pypinyin.phrases_dict' not in sys.modules
+    assert not mmseg.seg.loaded
+
+    assert pypinyin.pinyin('一语中的') == [['yī'], ['yǔ'], ['zhòng'], ['dì']]
+    assert pypinyin.constants.PHRASES_DICT.loaded
+    assert mmseg.seg.loaded
+
+
+def test_preload(cleanup):
+    import pypinyin
+    from pypinyin.seg import mmseg
+
+    pypinyin.preload()
+    assert pypinyin.constants.PHRASES_DICT.loaded
+    assert mmseg.seg.loaded
+
+
+def test_load_phrases_dict_before_seg_loaded(cleanup):
+    import pypinyin
+    from pypinyin.seg import mmseg
+
+    pypinyin.load_phrases_dict({'啊啊啊': [['a'], ['a'], ['a']]})
+    assert not mmseg.seg.loaded
+    assert list(mmseg.seg.cut('啊啊啊')) == ['啊啊啊']
+
+
+def test_phrases_profile(cleanup, monkeypatch):
+    monkeypatch.setenv('PYPINYIN_PHRASES_PROFILE', 'small')
+    import pypinyin
+    from pypinyin.constants import PHRASES_DICT
+
+    assert pypinyin.pinyin('银行') == [['yín'], ['háng']]
+    assert 'pypinyin.phrases_dict' not in sys.modules
+    assert max(len(k) for k in PHRASES_DICT) == 2
+    assert '一丁不识' not in PHRASES_DICT
+
+
+def test_unknown_phrases_profile(cleanup, monkeypatch):
+    monkeypatch.setenv('PYPINYIN_PHRASES_PROFILE', 'tiny')
+    with pytest.warns(UserWarning):
+        import pypinyin.constants
+    assert pypinyin.constants._PHRASES_PROFILE == 'full'
+
+
+def test_set_phrases_profile(cleanup):
+    import pypinyin
+    from pypinyin.constants import PHRASES_DICT
+    from pypinyin.seg import mmseg
+
+    assert list(mmseg.seg.cut('一丁不识')) == ['一丁不识']
+    pypinyin.set_phrases_profile('medium')
+    assert max(len(k) for k in PHRASES_DICT) == 3
+    assert not mmseg.seg.loaded
+    assert list(mmseg.seg.cut('一丁不识')) == ['一', '丁', '不', '识']
+    assert pypinyin.pinyin('银行') == [['yín'], ['háng']]
+
+    with pytest.raises(ValueError):
+        pypinyin.set_phrases_profile('tiny')
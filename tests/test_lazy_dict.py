@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import threading
+import time
+
+from pypinyin.lazy_dict import LazyDict
+
+
+def test_lazy_dict():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {'a': 1}
+
+    d = LazyDict(loader)
+    assert not d.loaded
+    assert calls == []
+
+    assert d['a'] == 1
+    assert d.loaded
+    assert 'b' not in d
+    d.update({'b': 2})
+    assert d == {'a': 1, 'b': 2}
+    assert sorted(d.keys()) == ['a', 'b']
+    del d['a']
+    assert len(d) == 1
+    assert calls == [1]
+
+
+def test_lazy_dict_load_once_in_threads():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'a': 1}
+
+    d = LazyDict(loader)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(d.get('a')))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert results == [1] * 8
+    assert calls == [1]
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import os
+import sys
+
+import pytest
+
+from pypinyin.mmap_dict import MmapPinyinDict, dump
+from tests.utils import clean_modules
+
+
+def test_dump_and_load(tmpdir):
+    from pypinyin.pinyin_dict import pinyin_dict
+
+    path = str(tmpdir.join('pinyin_dict.dat'))
+    dump(path)
+    d = MmapPinyinDict(path)
+
+    assert len(d) == len(pinyin_dict)
+    assert dict(d.items()) == pinyin_dict
+    assert d[0x4E2D] == 'zhōng,zhòng'
+    assert 0x41 not in d
+    assert d.get(0x41) is None
+    assert d.get(0x10FFFF, 'x') == 'x'
+    with pytest.raises(KeyError):
+        d[0x41]
+
+
+def test_overlay(tmpdir):
+    path = str(tmpdir.join('pinyin_dict.dat'))
+    dump(path, {0x4E2D: 'zhōng,zhòng', 0x56FD: 'guó'})
+    d = MmapPinyinDict(path)
+
+    d[0x4E2D] = 'zhòng'
+    d[0x41] = 'a'
+    assert d[0x4E2D] == 'zhòng'
+    assert d[0x41] == 'a'
+    assert len(d) == 3
+
+    new = d.copy()
+    new[0x56FD] = 'guo'
+    assert d[0x56FD] == 'guó'
+
+    del d[0x4E2D]
+    assert 0x4E2D not in d
+    assert len(d) == 2
+    assert sorted(d) == [0x41, 0x56FD]
+    with pytest.raises(KeyError):
+        del d[0x4E2D]
+
+    assert MmapPinyinDict(path)[0x4E2D] == 'zhōng,zhòng'
+
+
+def test_non_int_keys(tmpdir):
+    path = str(tmpdir.join('pinyin_dict.dat'))
+    dump(path, {0x4E2D: 'zhōng,zhòng'})
+    d = MmapPinyinDict(path)
+
+    # 跟 dict 一样当作不存在的 key
+    assert 'a' not in d
+    assert None not in d
+    assert d.get('a') is None
+    assert d.get('a', 'x') == 'x'
+    with pytest.raises(KeyError):
+        d['a']
+    with pytest.raises(KeyError):
+        del d['a']
+    d['a'] = 'ā'
+    assert d['a'] == 'ā'
+    assert len(d) == 2
+
+
+def test_invalid_file(tmpdir):
+    path = tmpdir.join('invalid.dat')
+    path.write_binary(b'x' * 64)
+
+    with pytest.raises(ValueError):
+        MmapPinyinDict(str(path))
+
+
+def test_env(tmpdir, cleanup):
+    path = str(tmpdir.join('pinyin_dict.dat'))
+    dump(path)
+    clean_modules()
+    os.environ['PYPINYIN_PINYIN_DICT_MMAP'] = path
+
+    import pypinyin.constants
+    from pypinyin import lazy_pinyin, load_single_dict
+    from pypinyin.mmap_dict import MmapPinyinDict
+
+    assert isinstance(pypinyin.constants.PINYIN_DICT, MmapPinyinDict)
+    assert 'pypinyin.pinyin_dict' not in sys.modules
+    assert lazy_pinyin('中心') == ['zhong', 'xin']
+
+    load_single_dict({ord('桔'): 'jú,jié'})
+    assert lazy_pinyin('桔') == ['ju']
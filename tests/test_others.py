@@ -3,7 +3,7 @@
 from __future__ import unicode_literals
 
 from pypinyin import pinyin, Style, lazy_pinyin, slug
-from pypinyin.seg.simpleseg import simple_seg
+from pypinyin.seg.simpleseg import simple_seg, simple_seg_tokens, seg_tokens
 
 
 def test_import_all():
@@ -29,6 +29,22 @@ def test_simple_seg():
     assert simple_seg('啊 -- 你好那 ') == ['啊', ' -- ', '你好那', ' ']
     assert simple_seg('a 你好啊 -- 那 ') == ['a ', '你好啊', ' -- ', '那', ' ']
     assert simple_seg('a啊 -- 你好那 ') == ['a', '啊', ' -- ', '你好那', ' ']
+    assert simple_seg('') == ['']
+    assert simple_seg('a\n') == ['a\n']
+
+
+def test_simple_seg_tokens():
+    assert simple_seg_tokens('a啊 -- 你好那 ') == [
+        ('a', False), ('啊', True), (' -- ', False), ('你好那', True),
+        (' ', False)]
+    assert simple_seg_tokens(['啦啦', 'abc']) == [
+        ('啦啦', True), ('abc', False)]
+    assert simple_seg_tokens('') == [('', False)]
+
+
+def test_seg_tokens():
+    assert seg_tokens('我是中国人abc') == [
+        ('我', True), ('是', True), ('中国人', True), ('abc', False)]
 
 
 def test_issue_205():
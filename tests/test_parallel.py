@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from importlib import import_module
+
+import pytest
+
+from pypinyin import Style, lazy_pinyin, pinyin, slug
+
+
+@pytest.fixture
+def parallel():
+    # Python 2 中需要安装 futures
+    pytest.importorskip('concurrent.futures')
+    # 任务函数需要通过 pickle 发送给 worker，不能使用已被重新导入的旧模块
+    return import_module('pypinyin.parallel')
+
+
+DATA = ['中心', '重心', '张三', 'abc', '', ['你好', '中国'], '战略',
+        '衣裳'] * 20
+
+
+def gen():
+    for x in DATA:
+        yield x
+
+
+def test_pinyin_batch(parallel):
+    style = parallel.core.Style.TONE3
+    assert list(parallel.pinyin_batch(
+        DATA, max_workers=2, style=style, heteronym=True)) == [
+        pinyin(x, style=Style.TONE3, heteronym=True) for x in DATA]
+
+
+def test_lazy_pinyin_batch(parallel):
+    assert list(parallel.lazy_pinyin_batch(
+        gen(), max_workers=2, chunk_size=7, v_to_u=True)) == [
+        lazy_pinyin(x, v_to_u=True) for x in DATA]
+
+
+def test_slug_batch(parallel):
+    assert list(parallel.slug_batch(DATA, max_workers=1, separator=' ')) == [
+        slug(x, separator=' ') for x in DATA]
+
+
+def test_empty_input(parallel):
+    assert list(parallel.lazy_pinyin_batch([], max_workers=2)) == []
+
+
+def test_tune_chunk_size(parallel):
+    tune = parallel._tune_chunk_size
+    target = parallel.TARGET_CHUNK_SECONDS
+    assert tune(100, target) == 100
+    assert tune(100, target / 10) == 200
+    assert tune(100, 0) == 200
+    assert tune(100, target * 10) == 50
+    assert tune(parallel.MIN_CHUNK_SIZE, 100) == parallel.MIN_CHUNK_SIZE
+    assert tune(parallel.MAX_CHUNK_SIZE, 0) == parallel.MAX_CHUNK_SIZE
@@ -3,11 +3,13 @@
 
 from __future__ import unicode_literals
 
+import threading
+
 import pytest
 
 from pypinyin import (
     pinyin, slug, lazy_pinyin, load_single_dict,
-    load_phrases_dict, NORMAL, TONE, TONE2, TONE3, INITIALS,
+    load_phrases_dict, dict_update, NORMAL, TONE, TONE2, TONE3, INITIALS,
     FIRST_LETTER, FINALS, FINALS_TONE, FINALS_TONE2, FINALS_TONE3,
     BOPOMOFO, BOPOMOFO_FIRST, CYRILLIC, CYRILLIC_FIRST, Style
 )
@@ -190,6 +192,86 @@ def test_custom_pinyin_dict2_tone2():
     assert pinyin('同行') == [['tòng'], ['kū']]
 
 
+def test_dict_update(monkeypatch):
+    from pypinyin import core
+
+    trained = []
+    invalidated = []
+    train_words = core.mmseg.train_words
+    invalidate_all = core.cache.invalidate_all
+
+    def spy_train(seg_instance, words):
+        trained.append(sorted(words))
+        train_words(seg_instance, words)
+
+    def spy_invalidate():
+        invalidated.append(True)
+        invalidate_all()
+
+    monkeypatch.setattr(core.mmseg, 'train_words', spy_train)
+    monkeypatch.setattr(core.cache, 'invalidate_all', spy_invalidate)
+    with core.dict_update():
+        core.load_single_dict({ord('渣'): 'zhà'})
+        core.load_phrases_dict({'渣渣辉': [['zhā'], ['zhā'], ['huī']]})
+        with core.dict_update():
+            core.load_phrases_dict({'古天乐': [['gǔ'], ['tiān'], ['lè']]})
+        assert trained == []
+        assert invalidated == []
+        # 拼音库已经修改了
+        assert core.lazy_pinyin('渣') == ['zha']
+    assert trained == [['古天乐', '渣渣辉']]
+    assert len(invalidated) == 1
+    assert core.seg('渣渣辉古天乐') == ['渣渣辉', '古天乐']
+    assert core.pinyin('古天乐') == [['gǔ'], ['tiān'], ['lè']]
+
+
+def test_dict_update_error():
+    with pytest.raises(ValueError):
+        with dict_update():
+            load_phrases_dict({'扎克伯': [['zā'], ['kè'], ['bó']]})
+            raise ValueError
+    assert seg('扎克伯') == ['扎克伯']
+    # 事务已经结束
+    load_phrases_dict({'扎克伯格': [['zā'], ['kè'], ['bó'], ['gé']]})
+    assert seg('扎克伯格') == ['扎克伯格']
+
+
+def test_dict_update_is_thread_local():
+    entered = threading.Event()
+    done = threading.Event()
+    result = []
+
+    def update():
+        with dict_update():
+            load_phrases_dict({'马化腾讯': [['mǎ'], ['huà'], ['téng'], ['xùn']]})
+            entered.set()
+            done.wait(10)
+        result.append(seg('马化腾讯'))
+
+    # 先让分词器完成训练，之后的词语只能通过增量训练加入
+    assert seg('中国') == ['中国']
+    thread = threading.Thread(target=update)
+    thread.start()
+    try:
+        assert entered.wait(10)
+        # 其他线程的事务不会推迟当前线程的修改
+        load_phrases_dict({'刘强东西': [['liú'], ['qiáng'], ['dōng'], ['xī']]})
+        assert seg('刘强东西') == ['刘强东西']
+    finally:
+        done.set()
+        thread.join()
+    assert result == [['马化腾讯']]
+
+
+def test_load_single_dict_no_retrain(monkeypatch):
+    from pypinyin import core
+
+    trained = []
+    monkeypatch.setattr(core.mmseg.seg, 'train', trained.append)
+    core.load_single_dict({ord('渣'): 'zhā'})
+    assert trained == []
+
+
 def test_errors():
     hans = (
         ('啊', {'style': TONE2}, [['a']]),
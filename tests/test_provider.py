@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import threading
+
+import pytest
+
+from pypinyin import lazy_pinyin, load_phrases_dict, pinyin
+from pypinyin.constants import PHRASES_DICT, PINYIN_DICT, Style
+from pypinyin.converter import DefaultConverter
+from pypinyin.core import Pinyin
+from pypinyin.provider import DictProvider, OverlayDict, SnapshotProvider
+from pypinyin.seg import mmseg
+
+
+def test_overlay_dict():
+    base = {'a': 1, 'b': 2}
+    d = OverlayDict(base)
+    d['c'] = 3
+    d['a'] = 10
+    del d['b']
+    assert dict(d) == {'a': 10, 'c': 3}
+    assert len(d) == 2
+    assert 'b' not in d
+    assert d.get('b') is None
+    with pytest.raises(KeyError):
+        d['b']
+    with pytest.raises(KeyError):
+        del d['b']
+    # base 不会被修改
+    assert base == {'a': 1, 'b': 2}
+
+    d['b'] = 20
+    assert d['b'] == 20
+    copied = d.copy()
+    copied['d'] = 4
+    assert 'd' not in d
+    assert copied._base is base
+
+
+def test_overlay_dict_bool():
+    d = OverlayDict({})
+    assert not d
+    d['a'] = 1
+    assert d
+    d = OverlayDict({'a': 1})
+    del d['a']
+    assert not d
+
+
+def test_overlay_seg():
+    seg = mmseg.Seg(mmseg.PrefixSet(), no_non_phrases=True)
+    seg.train(['中国', '中国人民'])
+    overlay = mmseg.OverlaySeg(seg)
+    overlay.train(['人民银行', '中国人'])
+    assert list(overlay.cut('中国人民银行')) == ['中国人民', '银', '行']
+    assert list(overlay.cut('中国人')) == ['中国人']
+    assert list(overlay.cut('人民银行')) == ['人民银行']
+    assert list(seg.cut('人民银行')) == ['人', '民', '银', '行']
+    assert overlay.max_len == 4
+    assert '人民银' in overlay._prefix_set
+    assert '人民银' not in seg._prefix_set
+    assert overlay.size == 2
+
+    # 只会删除自己训练的词语
+    overlay.remove(['人民银行', '中国'])
+    assert list(overlay.cut('人民银行')) == ['人', '民', '银', '行']
+    assert list(seg.cut('中国')) == ['中国']
+    assert overlay.size == 1
+
+
+def test_provider_isolated():
+    tenant_a = DictProvider()
+    tenant_b = DictProvider()
+    tenant_a.load_single_dict({ord('好'): 'hào'})
+    tenant_a.load_phrases_dict({
+        '酷狗音乐': [['kù'], ['gǒu'], ['yīn'], ['yuè']]})
+    tenant_b.load_phrases_dict({'酷狗': [['kū'], ['gǒu']]}, style='tone2')
+
+    pinyin_a = Pinyin(provider=tenant_a)
+    pinyin_b = Pinyin(provider=tenant_b)
+    assert pinyin_a.lazy_pinyin('好') == ['hao']
+    assert pinyin_a.pinyin('好') == [['hào']]
+    assert pinyin_b.pinyin('好') == [['hǎo']]
+    assert pinyin('好') == [['hǎo']]
+
+    assert pinyin_a.seg('酷狗音乐') == ['酷狗音乐']
+    assert pinyin_b.seg('酷狗音乐') == ['酷狗', '音乐']
+    assert pinyin_b.pinyin('酷狗') == [['kū'], ['gǒu']]
+    assert pinyin_a.pinyin('酷狗') == [['kù'], ['gǒu']]
+
+    # 全局拼音库和分词器不受影响
+    assert ord('好') not in tenant_b.pinyin_dict._overlay
+    assert PINYIN_DICT[ord('好')] != 'hào'
+    assert '酷狗' not in PHRASES_DICT
+    assert '酷狗' not in mmseg.seg._prefix_set
+
+
+def test_provider_shares_base():
+    provider = DictProvider()
+    assert provider.pinyin_dict._base is PINYIN_DICT
+    assert provider.phrases_dict._base is PHRASES_DICT
+    assert provider.segmenter._base is mmseg.seg
+    provider.load_phrases_dict({'银行': [['yín'], ['xíng']]})
+    assert len(provider.phrases_dict._overlay) == 1
+    assert provider.phrases_dict['银行'] == (('yín',), ('xíng',))
+    assert PHRASES_DICT['银行'] == (('yín',), ('háng',))
+
+
+def test_provider_delete_phrase():
+    provider = DictProvider()
+    del provider.phrases_dict['银行']
+    assert Pinyin(provider=provider).pinyin('银行') == [['yín'], ['xíng']]
+    assert pinyin('银行') == [['yín'], ['háng']]
+
+
+def test_provider_sees_global_dict():
+    provider = DictProvider()
+    load_phrases_dict({'蚂蚁金服': [['mǎ'], ['yǐ'], ['jīn'], ['fú']]})
+    assert provider.seg('蚂蚁金服') == ['蚂蚁金服']
+    assert Pinyin(provider=provider).lazy_pinyin('蚂蚁金服') == \
+        lazy_pinyin('蚂蚁金服')
+
+
+def test_default_converter_provider():
+    provider = DictProvider()
+    provider.load_single_dict({ord('好'): 'hào'})
+    converter = DefaultConverter(provider=provider)
+    assert converter.convert('好', 1, False, 'default', True) == [['hào']]
+    assert DefaultConverter().convert(
+        '好', 1, False, 'default', True) == [['hǎo']]
+    assert Pinyin(converter, provider=provider).pinyin('好你') == \
+        [['hào'], ['nǐ']]
+
+
+def test_provider_with_cache():
+    provider = DictProvider()
+    pinyin_obj = Pinyin(cache_size=10, provider=provider)
+    assert pinyin_obj.pinyin('好') == [['hǎo']]
+    provider.load_single_dict({ord('好'): 'hào'})
+    assert pinyin_obj.pinyin('好') == [['hào']]
+
+
+def test_provider_only_invalidates_own_cache():
+    provider = DictProvider()
+    other = DictProvider()
+    pinyin_obj = Pinyin(cache_size=10, provider=provider)
+    other_obj = Pinyin(cache_size=10, provider=other)
+    global_obj = Pinyin(cache_size=10)
+    for obj in (pinyin_obj, other_obj, global_obj):
+        assert obj.pinyin('朝阳') == [['zhāo'], ['yáng']]
+
+    provider.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+    assert pinyin_obj.pinyin('朝阳') == [['cháo'], ['yáng']]
+    # 其他 provider 和全局拼音库的缓存不受影响
+    for obj in (other_obj, global_obj):
+        assert obj.pinyin('朝阳') == [['zhāo'], ['yáng']]
+        assert obj.cache_info().hits == 1
+
+    provider.remove_phrases(['朝阳'])
+    assert pinyin_obj.pinyin('朝阳') == pinyin(['朝', '阳'])
+    assert pinyin_obj.cache_info().hits == 0
+
+
+def test_provider_remove_phrases():
+    provider = DictProvider()
+    provider.load_phrases_dict({
+        '酷狗音乐': [['kù'], ['gǒu'], ['yīn'], ['yuè']]})
+    assert provider.seg('酷狗音乐') == ['酷狗音乐']
+    assert provider.segmenter.size == 1
+    provider.remove_phrases(['酷狗音乐', '银行'])
+    assert provider.seg('酷狗音乐') == ['酷', '狗', '音乐']
+    assert provider.segmenter.size == 0
+    assert Pinyin(provider=provider).pinyin('银行') == [['yín'], ['xíng']]
+
+
+def test_provider_copy():
+    provider = DictProvider()
+    provider.load_phrases_dict({'酷狗': [['kù'], ['gǒu']]})
+    copied = provider.copy()
+    copied.load_phrases_dict({'音乐台': [['yīn'], ['yuè'], ['tái']]})
+    copied.remove_phrases(['酷狗'])
+    assert provider.seg('酷狗音乐台') == ['酷狗', '音乐', '台']
+    assert copied.seg('酷狗音乐台') == ['酷', '狗', '音乐台']
+    assert '音乐台' not in provider.phrases_dict
+    assert copied.segmenter._base is provider.segmenter._base
+
+
+def test_snapshot_provider_update():
+    provider = SnapshotProvider()
+    first = provider.snapshot()
+    assert provider.version == 0
+    with provider.update() as draft:
+        draft.load_phrases_dict({'酷狗': [['kù'], ['gǒu']]})
+        # 发布前不可见
+        assert provider.snapshot() is first
+        assert '酷狗' not in provider.phrases_dict
+    assert provider.version == 1
+    assert provider.snapshot() is draft
+    assert '酷狗' in provider.phrases_dict
+    assert '酷狗' not in first.phrases_dict
+    assert provider.seg('酷狗') == ['酷狗']
+
+    with pytest.raises(ValueError):
+        with provider.update() as draft:
+            draft.remove_phrases(['酷狗'])
+            raise ValueError
+    assert provider.version == 1
+    assert '酷狗' in provider.phrases_dict
+
+
+def test_snapshot_provider_in_flight():
+    provider = SnapshotProvider()
+    with provider.update() as draft:
+        draft.load_phrases_dict({'酷狗': [['kù'], ['gǒu']]})
+    pinyin_obj = Pinyin(cache_size=10, provider=provider)
+    assert pinyin_obj.pinyin('酷狗') == [['kù'], ['gǒu']]
+
+    # 模拟正在进行的转换：已经获取了快照
+    split, convert_token = pinyin_obj._bind_snapshot()
+    with provider.update() as draft:
+        draft.load_phrases_dict({'酷狗': [['kū'], ['gǒu']]})
+    tokens = split('酷狗')
+    assert [convert_token(w, h, Style.TONE, False, 'default', True)
+            for w, h in tokens] == [[['kù'], ['gǒu']]]
+    # 新的转换使用新的快照，缓存的旧结果不会被使用
+    assert pinyin_obj.pinyin('酷狗') == [['kū'], ['gǒu']]
+    assert pinyin_obj.cache_info().misses == 2
+
+
+def test_snapshot_provider_threads():
+    provider = SnapshotProvider()
+    pinyin_obj = Pinyin(provider=provider)
+    versions = [
+        {'酷狗音乐': [['kù'], ['gǒu'], ['yīn'], ['yuè']]},
+        {'酷狗音乐': [['kū'], ['gǒu'], ['yìn'], ['lè']]},
+    ]
+    expected = [
+        [['kù'], ['gǒu'], ['yīn'], ['yuè']],
+        [['kū'], ['gǒu'], ['yìn'], ['lè']],
+    ]
+    with provider.update() as draft:
+        draft.load_phrases_dict(versions[0])
+
+    errors = []
+    done = threading.Event()
+
+    def convert():
+        while not done.is_set():
+            result = pinyin_obj.pinyin('酷狗音乐')
+            if result not in expected:
+                errors.append(result)
+
+    threads = [threading.Thread(target=convert) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for n in range(50):
+        with provider.update() as draft:
+            draft.remove_phrases(['酷狗音乐'])
+            draft.load_phrases_dict(versions[n % 2])
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert provider.version == 51
+
+
+def test_snapshot_provider_with_hooks():
+    class MyPinyin(Pinyin):
+        def pre_seg(self, hans, **kwargs):
+            return None
+
+    provider = SnapshotProvider()
+    pinyin_obj = MyPinyin(provider=provider)
+    assert not pinyin_obj._use_tokens
+    assert pinyin_obj.pinyin('朝阳') == [['zhāo'], ['yáng']]
+    with provider.update() as draft:
+        draft.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+        draft.load_single_dict({ord('阳'): 'yàng'})
+    # 分词和转换都使用新的快照
+    assert pinyin_obj.pinyin('朝阳') == [['cháo'], ['yáng']]
+    assert pinyin_obj.pinyin('阳') == [['yàng']]
+    assert pinyin_obj.pinyin(['朝阳', '阳']) == \
+        [['cháo'], ['yáng'], ['yàng']]
+
+
+def test_snapshot_provider_with_hooks_in_flight():
+    provider = SnapshotProvider()
+    updated = []
+
+    class MyPinyin(Pinyin):
+        def pre_seg(self, hans, **kwargs):
+            # 转换开始后发布新的快照，这次转换仍然使用旧的快照
+            if not updated:
+                updated.append(True)
+                with provider.update() as draft:
+                    draft.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+
+    pinyin_obj = MyPinyin(provider=provider)
+    assert pinyin_obj.pinyin('朝阳') == [['zhāo'], ['yáng']]
+    assert pinyin_obj.pinyin('朝阳') == [['cháo'], ['yáng']]
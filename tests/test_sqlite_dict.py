@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import sqlite3
+
+import pytest
+
+from pypinyin import lazy_pinyin
+from pypinyin.constants import PHRASES_DICT, Style
+from pypinyin.core import Pinyin
+from pypinyin.seg.mmseg import PrefixSet, Seg
+from pypinyin.sqlite_dict import (
+    SqlitePhrasesDict, SqlitePrefixSet, create_provider
+)
+
+PHRASES = {
+    '朝阳': [['cháo'], ['yáng']],
+    '朝阳区': [['cháo'], ['yáng'], ['qū']],
+    '金融寡头': [['jīn'], ['róng'], ['guǎ'], ['tóu']],
+    '行业': [['háng'], ['yè']],
+}
+
+
+@pytest.fixture
+def store(tmpdir):
+    store = SqlitePhrasesDict(str(tmpdir.join('phrases.db')))
+    store.load_phrases_dict(PHRASES)
+    yield store
+    store.close()
+
+
+class TracedConnection(object):
+    """记录执行过的 SELECT 语句（Python 2 的 sqlite3 没有
+    ``set_trace_callback``）"""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.queries = []
+
+    def execute(self, sql, *args):
+        if sql.startswith('SELECT'):
+            self.queries.append(sql)
+        return self._conn.execute(sql, *args)
+
+    def __enter__(self):
+        return self._conn.__enter__()
+
+    def __exit__(self, *exc_info):
+        return self._conn.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def _selects(store):
+    conn = TracedConnection(store._connection())
+    store._conn = conn
+    return conn.queries
+
+
+def test_mapping(store, tmpdir):
+    assert len(store) == 4
+    assert store.max_len == 4
+    assert store['朝阳'] == (('cháo',), ('yáng',))
+    assert store.get('金融') is None
+    assert '金融' not in store
+    assert '行业' in store
+    assert sorted(store) == sorted(PHRASES)
+    with pytest.raises(KeyError):
+        store['朝']
+
+    store['中国'] = [['zhōng', 'zhòng'], ['guó']]
+    assert store['中国'] == (('zhōng', 'zhòng'), ('guó',))
+    store.close()
+
+    reopened = SqlitePhrasesDict(store.path)
+    assert len(reopened) == 5
+    assert reopened.max_len == 4
+    assert reopened['中国'] == (('zhōng', 'zhòng'), ('guó',))
+
+
+def test_tone2_style(store):
+    store.load_phrases_dict({'中国': [['zho1ng'], ['guo2']]}, style='tone2')
+    assert store['中国'] == (('zhōng',), ('guó',))
+
+
+def test_remove(store):
+    del store['金融寡头']
+    assert len(store) == 3
+    assert store.max_len == 3
+    assert store.probe(['金', '金融']) == {}
+    with pytest.raises(KeyError):
+        del store['金融寡头']
+
+    store.remove_phrases(['朝阳', '不存在'])
+    assert store.probe(['朝', '朝阳', '朝阳区']) == {
+        '朝': None, '朝阳': None, '朝阳区': (('cháo',), ('yáng',), ('qū',))}
+    count = store._connection().execute(
+        'SELECT COUNT(*) FROM entries').fetchone()[0]
+    assert count == 5   # 朝 朝阳 朝阳区 行 行业
+
+
+def test_failed_write_is_rolled_back(store):
+    def items():
+        for i in range(6000):
+            yield '甲{0}'.format(i), [['jiǎ']]
+        raise RuntimeError('boom')
+
+    with pytest.raises(RuntimeError):
+        store.load_phrases_dict(items())
+    assert len(store) == 4
+    assert store.max_len == 4
+    assert '甲1' not in store
+
+
+def test_invalid_version(tmpdir):
+    path = str(tmpdir.join('phrases.db'))
+    SqlitePhrasesDict(path).close()
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute("UPDATE meta SET value = 0 WHERE name = 'version'")
+    conn.close()
+    with pytest.raises(ValueError):
+        SqlitePhrasesDict(path)
+
+
+@pytest.mark.parametrize('text', [
+    '朝阳区行业', '金融行业', '金融寡头行业', '朝阳朝阳区', '朝', '金融寡',
+])
+def test_same_as_prefix_set(store, text):
+    prefix_set = PrefixSet()
+    prefix_set.train(PHRASES)
+    expected = list(Seg(prefix_set, no_non_phrases=True).cut(text))
+    seg = Seg(SqlitePrefixSet(store), no_non_phrases=True)
+    assert list(seg.cut(text)) == expected
+    assert SqlitePrefixSet(store).match(text) == prefix_set.match(text)
+
+
+def test_batched_probe(store):
+    queries = _selects(store)
+    seg = Seg(SqlitePrefixSet(store), no_non_phrases=True)
+    assert list(seg.cut('朝阳区的金融行业')) == [
+        '朝阳区', '的', '金', '融', '行业']
+    # 每种长度的前缀查询一次
+    assert len(queries) == store.max_len
+
+    # 结果已经缓存
+    count = len(queries)
+    assert list(seg.cut('金融行业')) == ['金', '融', '行业']
+    assert store['行业'] == (('háng',), ('yè',))
+    assert len(queries) == count
+    assert store.cache_info().hits > 0
+
+
+def test_provider(store):
+    store.load_phrases_dict(PHRASES_DICT)
+    queries = _selects(store)
+    pinyin = Pinyin(provider=create_provider(store))
+    text = '朝阳区的金融行业，一语中的'
+    assert pinyin.lazy_pinyin(text, style=Style.TONE3) == [
+        'chao2', 'yang2', 'qu1', 'de', 'jin1', 'rong2', 'hang2', 'ye4',
+        '，', 'yi1', 'yu3', 'zhong4', 'di4']
+    # 每段汉字最多查询 max_len 次
+    assert 2 <= len(queries) <= 2 * store.max_len
+    count = len(queries)
+    pinyin.lazy_pinyin(text)
+    assert len(queries) == count
+
+    text = '你好，我是中国人，我爱我的祖国'
+    assert pinyin.lazy_pinyin(text) == lazy_pinyin(text)
+
+
+def test_long_run_does_not_flood_cache(tmpdir):
+    cache_size = 20
+    store = SqlitePhrasesDict(str(tmpdir.join('phrases.db')),
+                              cache_size=cache_size)
+    store.load_phrases_dict(PHRASES)
+    assert store['行业'] == (('háng',), ('yè',))
+
+    queries = _selects(store)
+    text = '的一是不了人我在有他这为之大来以个中上们到说国和地也子时道出而要于就下' * 5
+    text += '朝阳区'
+    # 一段很长的汉字，可能匹配的子串远多于缓存的大小
+    assert len(text) > cache_size // store.max_len * 10
+    seg = Seg(SqlitePrefixSet(store), no_non_phrases=True)
+    assert list(seg.cut(text))[-1] == '朝阳区'
+    assert len(queries) <= store.max_len
+    # 不存在的子串没有把缓存中的词语挤出去
+    count = len(queries)
+    assert store['行业'] == (('háng',), ('yè',))
+    assert len(queries) == count
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import os
+import sys
+
+import pytest
+
+from tests.utils import clean_modules
+
+
+def _dump(path):
+    import pypinyin
+    from pypinyin import state
+
+    pypinyin.load_single_dict({0x4E2D: 'zhòng'})
+    pypinyin.load_phrases_dict({'朝阳': [['cháo'], ['yáng']]})
+    state.dump(path)
+    clean_modules()
+
+
+def test_dump_and_load(tmpdir, cleanup):
+    path = str(tmpdir.join('pypinyin.state'))
+    _dump(path)
+
+    import pypinyin
+    from pypinyin import state
+    from pypinyin.provider import DictProvider
+    from pypinyin.seg import mmseg
+
+    provider = DictProvider()
+    assert pypinyin.lazy_pinyin('朝阳中') == ['zhao', 'yang', 'zhong']
+    state.load(path)
+    assert pypinyin.pinyin('朝阳中') == [['cháo'], ['yáng'], ['zhòng']]
+    assert list(mmseg.seg.cut('朝阳中国')) == ['朝阳', '中国']
+    # 已经创建的 provider 也使用新的数据
+    assert provider.seg('朝阳中国') == ['朝阳', '中国']
+
+    mmseg.seg.train(['朝阳中'])
+    assert list(mmseg.seg.cut('朝阳中国')) == ['朝阳中', '国']
+
+
+def test_boot_from_env(tmpdir, cleanup):
+    path = str(tmpdir.join('pypinyin.state'))
+    _dump(path)
+    os.environ['PYPINYIN_STATE_FILE'] = path
+
+    import pypinyin
+    from pypinyin.seg import mmseg
+
+    assert 'pypinyin.pinyin_dict_basic' not in sys.modules
+    assert pypinyin.constants.PHRASES_DICT.loaded
+    assert mmseg.seg.loaded
+    assert pypinyin.pinyin('朝阳中') == [['cháo'], ['yáng'], ['zhòng']]
+    assert pypinyin.lazy_pinyin('一语中的') == ['yi', 'yu', 'zhong', 'di']
+    assert 'pypinyin.phrases_dict' not in sys.modules
+
+
+def test_reject_stale_file(tmpdir, cleanup):
+    path = str(tmpdir.join('pypinyin.state'))
+    _dump(path)
+    with open(path, 'rb') as fp:
+        data = fp.read()
+    with open(path, 'wb') as fp:
+        fp.write(data.replace(b'"pypinyin": "', b'"pypinyin": "0.0.1-', 1))
+
+    from pypinyin import state
+    with pytest.raises(ValueError) as exc_info:
+        state.load(path)
+    assert 'stale' in str(exc_info.value)
+
+    clean_modules()
+    os.environ['PYPINYIN_STATE_FILE'] = path
+    with pytest.warns(UserWarning):
+        import pypinyin
+    assert 'pypinyin.pinyin_dict_basic' in sys.modules
+    assert pypinyin.lazy_pinyin('朝阳') == ['zhao', 'yang']
+
+
+def test_phrases_profile(tmpdir, cleanup, monkeypatch):
+    path = str(tmpdir.join('pypinyin.state'))
+    import pypinyin
+    from pypinyin import state
+
+    # 运行时切换档位后保存的状态文件
+    pypinyin.set_phrases_profile('small')
+    state.dump(path)
+    state.load(path)
+    clean_modules()
+
+    # 只能在相同档位的词语拼音库下载入
+    monkeypatch.setenv('PYPINYIN_STATE_FILE', path)
+    with pytest.warns(UserWarning) as record:
+        import pypinyin
+    assert 'dict_hash' in '%s' % record[0].message
+    assert not pypinyin.constants.PHRASES_DICT.loaded
+
+    clean_modules()
+    monkeypatch.setenv('PYPINYIN_PHRASES_PROFILE', 'small')
+    import pypinyin
+    assert pypinyin.constants.PHRASES_DICT.loaded
+    assert max(len(k) for k in pypinyin.constants.PHRASES_DICT) == 2
+
+
+def test_invalid_file(tmpdir):
+    from pypinyin import state
+
+    path = tmpdir.join('pypinyin.state')
+    path.write_binary(b'not a state file')
+    with pytest.raises(ValueError):
+        state.load(str(path))
+
+    path.write_binary(state.MAGIC + b'{}\n')
+    with pytest.raises(ValueError):
+        state.load(str(path))
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import random
+
+import pytest
+
+from pypinyin import iter_pinyin, pinyin, Style
+from pypinyin.constants import PHRASES_DICT
+from pypinyin.core import _SegmentBuffer
+
+
+class CountingReader(object):
+    """记录读取了多少次的文件对象"""
+
+    def __init__(self, text):
+        self._fp = io.StringIO(text)
+        self.reads = 0
+
+    def read(self, size):
+        self.reads += 1
+        return self._fp.read(size)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 8192])
+@pytest.mark.parametrize('text', [
+    '',
+    '中心',
+    '中国人民银行',
+    '你好，我是中国人，我爱我的祖国。abc 123 重庆',
+    'abc中国def',
+    '  \n朝阳区长大\n',
+])
+def test_iter_pinyin(text, chunk_size):
+    fp = io.StringIO(text)
+    assert list(iter_pinyin(fp, chunk_size=chunk_size)) == pinyin(text)
+
+
+def test_iter_pinyin_options():
+    text = '战略，衣裳，abc 中国人'
+    kwargs = dict(style=Style.TONE3, heteronym=True, errors='ignore',
+                  v_to_u=True, neutral_tone_with_five=True)
+    assert list(iter_pinyin(io.StringIO(text), chunk_size=2, **kwargs)) == \
+        pinyin(text, **kwargs)
+
+
+def test_iter_pinyin_random_text():
+    random.seed(2021)
+    words = sorted(PHRASES_DICT.keys())[:2000] + [
+        '中', '国', '人', 'a', 'b ', '，', '\n']
+    for _ in range(100):
+        text = ''.join(random.choice(words)
+                       for _ in range(random.randint(0, 50)))
+        for chunk_size in (1, 4, 16):
+            fp = io.StringIO(text)
+            assert list(iter_pinyin(fp, chunk_size=chunk_size)) == \
+                pinyin(text), (text, chunk_size)
+
+
+def test_iter_pinyin_is_incremental():
+    text = '中国人民银行' * 10000
+    fp = CountingReader(text)
+    result = iter_pinyin(fp, chunk_size=10)
+    assert next(result) == ['zhōng']
+    # 只读取了开头的一小部分文本
+    assert fp.reads < 5
+
+
+def test_long_non_hans_stream_is_bounded():
+    buf = _SegmentBuffer()
+    fed = returned = 0
+    for _ in range(2000):
+        segments = buf.feed('abc def ' * 8)
+        fed += 64
+        returned += sum(len(x) for x in segments)
+        assert buf._pending_size <= buf.max_pending
+        assert fed - returned == buf._pending_size
+    returned += sum(len(x) for x in buf.flush())
+    assert returned == fed
+
+
+def test_non_hans_run_across_chunks():
+    text = '中国' + 'abc ' * 100 + '中国'
+    buf = _SegmentBuffer()
+    segments = []
+    for start in range(0, len(text), 3):
+        segments.extend(buf.feed(text[start:start + 3]))
+    segments.extend(buf.flush())
+    assert segments == ['中国', 'abc ' * 100, '中国']
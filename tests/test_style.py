@@ -3,7 +3,8 @@ from __future__ import unicode_literals
 from copy import deepcopy
 
 from pypinyin import pinyin, Style
-from pypinyin.style import register, convert
+from pypinyin.style import register, convert, _registry, _tables
+from pypinyin.style._utils import replace_symbol_to_number
 
 
 def test_custom_style_with_decorator():
@@ -45,6 +46,38 @@ def test_finals_tone3_no_final():
     assert convert('ń', Style.FINALS_TONE3, True, None) == 'n2'
 
 
+def test_convert_use_table():
+    _tables.pop((Style.TONE2, True), None)
+    assert convert('zhōng', Style.TONE2, True) == 'zho1ng'
+    table = _tables[(Style.TONE2, True)]
+    assert table['zhōng'] == 'zho1ng'
+    assert len(table) > 1000
+    assert all(replace_symbol_to_number(k) == v for k, v in table.items())
+
+    # 不在转换表中的拼音
+    assert 'zhōngg' not in table
+    assert convert('zhōngg', Style.TONE2, True) == 'zho1ngg'
+
+
+def test_convert_table_strict():
+    assert convert('yū', Style.FINALS_TONE, True) == 'ǖ'
+    assert convert('yū', Style.FINALS_TONE, False) == 'ū'
+    assert convert('yū', Style.FINALS_TONE, 1) == 'ǖ'
+
+
+def test_register_builtin_style_clear_table():
+    orig = _registry[Style.TONE3]
+    assert convert('zhōng', Style.TONE3, True) == 'zhong1'
+    try:
+        register(Style.TONE3, func=lambda pinyin, **kwargs: 'x')
+        assert convert('zhōng', Style.TONE3, True) == 'x'
+        assert pinyin('中', style=Style.TONE3) == [['x']]
+    finally:
+        register(Style.TONE3, func=orig)
+    assert convert('zhōng', Style.TONE3, True) == 'zhong1'
+    assert pinyin('中', style=Style.TONE3) == [['zhong1']]
+
+
 if __name__ == '__main__':
     import pytest
     pytest.cmdline.main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import threading
+
+from pypinyin import lazy_pinyin, load_phrases_dict, pinyin
+from pypinyin.constants import PHRASES_DICT, _load_phrases_dict
+from pypinyin.syllables import SyllableTable, syllable_table
+
+
+def test_syllable_table():
+    table = SyllableTable()
+    assert table.id('zhōng') == 0
+    assert table.id('guó') == 1
+    assert table.id('zhōng') == 0
+    assert len(table) == 2
+    assert table.syllables == ['zhōng', 'guó']
+
+    a = table.reading(['zhōng', 'zhòng'])
+    assert a == ('zhōng', 'zhòng')
+    assert table.reading(('zhōng', 'zhòng')) is a
+    assert table.split('zhōng,zhòng') is a
+
+    phrase = table.phrase([['zhōng'], ['guó']])
+    assert phrase == (('zhōng',), ('guó',))
+    assert table.phrase([['zhōng'], ['xīn']])[0] is phrase[0]
+
+
+def test_phrases_dict_is_interned():
+    value = PHRASES_DICT['中国']
+    assert isinstance(value, tuple)
+    assert all(isinstance(x, tuple) for x in value)
+    assert value[0] is syllable_table.reading(['zhōng'])
+
+
+def test_module_data_is_not_modified():
+    from pypinyin import phrases_dict
+
+    data = _load_phrases_dict('full')
+    assert data is not phrases_dict.phrases_dict
+    assert data['中国'] == (('zhōng',), ('guó',))
+    # 模块中的数据仍然是嵌套的 list
+    assert phrases_dict.phrases_dict['中国'] == [['zhōng'], ['guó']]
+
+
+def test_intern_in_threads():
+    table = SyllableTable()
+    syllables = ['py{0}'.format(i) for i in range(2000)]
+    start = threading.Event()
+
+    def worker():
+        start.wait()
+        for syllable in syllables:
+            table.intern(syllable)
+            table.reading([syllable])
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    start.set()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(table.syllables) == sorted(syllables)
+    assert all(table.syllables[table.id(x)] == x for x in syllables)
+
+
+def test_load_phrases_dict_is_interned():
+    load_phrases_dict({'测试音节表': [['cè'], ['shì'], ['yīn'], ['jié'],
+                                 ['biǎo']]})
+    value = PHRASES_DICT['测试音节表']
+    assert value[0] is syllable_table.reading(['cè'])
+    assert lazy_pinyin('测试音节表') == ['ce', 'shi', 'yin', 'jie', 'biao']
+
+
+def test_result_is_not_shared():
+    result = pinyin('中国', heteronym=True)
+    result[0].append('x')
+    result[1][0] = 'y'
+    assert pinyin('中国', heteronym=True) == [['zhōng'], ['guó']]
+
+    result = pinyin('中', heteronym=True)
+    result[0].append('x')
+    assert pinyin('中', heteronym=True) == [['zhōng', 'zhòng']]
@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import io
+import os
+import time
+
+import pytest
+
+from pypinyin import lazy_pinyin, pinyin, user_dict
+from pypinyin.core import Pinyin, seg
+from pypinyin.provider import DictProvider, SnapshotProvider
+
+
+def write(path, text, mtime=None):
+    with io.open(str(path), 'w', encoding='utf-8') as fp:
+        fp.write(text)
+    if mtime is not None:
+        os.utime(str(path), (mtime, mtime))
+
+
+def test_parse():
+    lines = [
+        '# comment\n',
+        '\n',
+        'U+4E2D: zhōng,zhòng  # 中\n',
+        'U+4E2D: zhōng,zhǒng\n',
+        '中国: zhōng guó\n',
+        '中国: zhòng guó  # 多音\n',
+    ]
+    assert user_dict.parse(lines) == (
+        {0x4E2D: 'zhōng,zhòng,zhǒng'},
+        {'中国': [['zhōng', 'zhòng'], ['guó']]},
+    )
+
+
+@pytest.mark.parametrize('line', [
+    'U+4E2D',
+    'U+4E2D: ',
+    'U+XYZ: zhōng',
+    '中国: zhōng',
+])
+def test_parse_error(line):
+    with pytest.raises(ValueError) as exc_info:
+        user_dict.parse(['# comment\n', line])
+    assert 'line 2' in '%s' % exc_info.value
+
+
+def test_load_global(tmpdir):
+    path = tmpdir.join('user.txt')
+    write(path, 'U+4E2D: zhòng\n喵喵喵: miāo miāo miāo\n', 1000)
+    orig = lazy_pinyin('中')
+    watcher = user_dict.load([str(path)])
+    assert pinyin('中') == [['zhòng']]
+    assert seg('喵喵喵') == ['喵喵喵']
+    assert watcher.check() == []
+
+    # 修改和删除
+    write(path, 'U+4E2D: zhǒng\n银行: yín xíng\n', 2000)
+    assert watcher.check() == [str(path)]
+    assert pinyin('中') == [['zhǒng']]
+    assert pinyin('银行') == [['yín'], ['xíng']]
+    assert seg('喵喵喵') == ['喵', '喵', '喵']
+
+    # 删除文件后恢复为原来的读音
+    path.remove()
+    assert watcher.check() == [str(path)]
+    assert lazy_pinyin('中') == orig
+    assert pinyin('银行') == [['yín'], ['háng']]
+
+
+def test_load_multi_files(tmpdir):
+    first = tmpdir.join('first.txt')
+    second = tmpdir.join('second.txt')
+    write(first, '喵星: miāo xīng\n', 1000)
+    write(second, '喵星: miáo xíng\n', 1000)
+    provider = DictProvider()
+    watcher = user_dict.load([str(first), str(second)], provider=provider)
+    pinyin_obj = Pinyin(provider=provider)
+    assert pinyin_obj.pinyin('喵星') == [['miáo'], ['xíng']]
+
+    write(second, '# empty\n', 2000)
+    assert watcher.check() == [str(second)]
+    assert pinyin_obj.pinyin('喵星') == [['miāo'], ['xīng']]
+    write(first, '# empty\n', 2000)
+    watcher.check()
+    assert pinyin_obj.seg('喵星') == ['喵', '星']
+    assert pinyin_obj.pinyin('银行') == [['yín'], ['háng']]
+    assert provider.segmenter.size == 0
+
+
+def test_load_provider(tmpdir):
+    path = tmpdir.join('user.txt')
+    write(path, 'U+4E2D: zhòng\n银行: yín xíng\n', 1000)
+    provider = DictProvider()
+    watcher = user_dict.load([str(path)], provider=provider)
+    pinyin_obj = Pinyin(provider=provider)
+    assert pinyin_obj.pinyin('中银行') == [['zhòng'], ['yín'], ['xíng']]
+    assert pinyin('中银行') == [['zhōng'], ['yín'], ['háng']]
+
+    write(path, '', 2000)
+    watcher.check()
+    assert pinyin_obj.pinyin('中银行') == [['zhōng'], ['yín'], ['háng']]
+    assert not provider.pinyin_dict._overlay
+    assert not provider.phrases_dict._overlay
+
+
+def test_load_snapshot_provider(tmpdir):
+    path = tmpdir.join('user.txt')
+    write(path, '银行: yín xíng\n', 1000)
+    provider = SnapshotProvider()
+    watcher = user_dict.load([str(path)], provider=provider)
+    assert provider.version == 1
+    assert Pinyin(provider=provider).pinyin('银行') == [['yín'], ['xíng']]
+
+    # 格式有误时不会修改拼音库
+    write(path, '银行: yín\n', 2000)
+    with pytest.raises(ValueError):
+        watcher.check()
+    assert provider.version == 1
+    write(path, '银行: yín hàng\n', 3000)
+    watcher.check()
+    assert provider.version == 2
+    assert Pinyin(provider=provider).pinyin('银行') == [['yín'], ['hàng']]
+
+
+def test_watch(tmpdir):
+    path = tmpdir.join('user.txt')
+    write(path, '银行: yín xíng\n', 1000)
+    provider = DictProvider()
+    watcher = user_dict.watch([str(path)], provider=provider, interval=0.01)
+    try:
+        write(path, '银行: yín hàng\n', 2000)
+        for _ in range(500):
+            if provider.phrases_dict['银行'] == (('yín',), ('hàng',)):
+                break
+            time.sleep(0.01)
+        assert provider.phrases_dict['银行'] == (('yín',), ('hàng',))
+    finally:
+        watcher.stop()
+    assert watcher._thread is None
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import gc
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+# 在子进程中 fork ，比较 worker 转换前后私有内存的增长
+FORK_SCRIPT = '''# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import os
+import sys
+
+import pypinyin
+from pypinyin import Style, lazy_pinyin
+from pypinyin.compat import unichr
+
+TEXT = ('我们一起去银行办理业务，然后在中心广场看见了重庆的朋友。' * 50 +
+        ''.join(unichr(c) for c in range(0x4e00, 0x4e00 + 3000)))
+
+
+def private_kb():
+    total = 0
+    with open('/proc/self/smaps_rollup') as fp:
+        for line in fp:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                total += int(line.split()[1])
+    return total
+
+
+if sys.argv[1] == 'warmup':
+    pypinyin.warmup()
+r, w = os.pipe()
+pid = os.fork()
+if pid == 0:
+    before = private_kb()
+    for style in (Style.NORMAL, Style.TONE, Style.TONE3, Style.INITIALS):
+        lazy_pinyin(TEXT, style=style)
+    os.write(w, str(private_kb() - before).encode())
+    os._exit(0)
+os.waitpid(pid, 0)
+print(os.read(r, 100).decode())
+'''
+
+
+def test_warmup(monkeypatch):
+    from pypinyin import core, style
+    from pypinyin.constants import PHRASES_DICT, Style
+    from pypinyin.seg import mmseg
+
+    frozen = []
+    monkeypatch.setattr(gc, 'freeze', lambda: frozen.append(True),
+                        raising=False)
+    core.warmup(styles=[Style.TONE3, Style.BOPOMOFO])
+    assert frozen == [True]
+    assert PHRASES_DICT.loaded
+    assert mmseg.seg.loaded
+    for strict in (True, False):
+        assert (Style.TONE3, strict) in style._tables
+        assert (Style.BOPOMOFO, strict) in style._tables
+    assert core.syllable_table._splits
+
+    core.warmup(styles=[], freeze=False)
+    assert frozen == [True]
+
+
+def _child_private_kb(tmpdir, mode):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    # 写入文件而不是使用 -c ，Python 2 中命令行参数不能包含非 ASCII 字符
+    script = str(tmpdir.join('fork_script.py'))
+    with io.open(script, 'w', encoding='utf-8') as fp:
+        fp.write(FORK_SCRIPT)
+    output = subprocess.check_output(
+        [sys.executable, script, mode], env=env)
+    return int(output.decode().strip())
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork') or
+                    not os.path.exists('/proc/self/smaps_rollup'),
+                    reason='need fork and /proc/self/smaps_rollup')
+def test_warmup_fork_private_memory(tmpdir):
+    cold = _child_private_kb(tmpdir, 'cold')
+    warm = _child_private_kb(tmpdir, 'warmup')
+    # 没有预先加载时 worker 需要自己加载词语拼音库、训练分词器、生成转换表，
+    # 这些内存都是 worker 私有的
+    assert warm < cold / 3, (cold, warm)
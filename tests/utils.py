@@ -2,6 +2,9 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, print_function, unicode_literals
 
+import copy
+import sys
+
 
 def has_module(module):
     try:
@@ -9,3 +12,10 @@ def has_module(module):
         return True
     except ImportError:
         pass
+
+
+def clean_modules():
+    """删除所有已导入的 pypinyin 模块，之后可以重新导入 pypinyin"""
+    for module in copy.copy(sys.modules):
+        if module.startswith('pypinyin'):
+            sys.modules.pop(module, None)
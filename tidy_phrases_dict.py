@@ -55,6 +55,18 @@ def tidy():
     return new_dict
 
 
+def save_profiles(new_dict):
+    """按 PHRASES_PROFILES 生成较小档位的词语拼音库"""
+    from pypinyin.constants import PHRASES_PROFILES, _phrases_module
+
+    for profile, max_len in PHRASES_PROFILES.items():
+        if max_len is None:
+            continue
+        output = _phrases_module(profile).replace('.', '/') + '.py'
+        save(dict((k, v) for k, v in new_dict.items() if len(k) <= max_len),
+             output)
+
+
 def main():
     output = 'pypinyin/phrases_dict.py'
     new_dict = tidy()
@@ -63,6 +75,7 @@ def main():
     missing_dict = double_check()
     new_dict.update(missing_dict)
     save(new_dict, output)
+    save_profiles(new_dict)
 
 
 if __name__ == '__main__':